@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# Fetches files from a running test-server.py with many concurrent clients,
+# each keeping its connection alive, and reports the throughput and latencies.
+# Slow clients, which connect and then never finish sending their request, can
+# be added to check that they do not hold the other clients up.
+#
+#   ./test-server.py --no-tls &
+#   ./load-test.py http://127.0.0.1:3001/ index.html --clients 32 --slow-clients 4
+from typing import List
+from urllib.parse import urlsplit
+import argparse
+import http.client
+import socket
+import ssl
+import threading
+import time
+
+def connect(url: str, timeout: float):
+    parts = urlsplit(url)
+    if parts.scheme == "https":
+        # test-server.py uses a self-signed certificate.
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        return http.client.HTTPSConnection(parts.hostname, parts.port, timeout=timeout, context=context)
+    return http.client.HTTPConnection(parts.hostname, parts.port, timeout=timeout)
+
+def run_client(url: str, paths: List[str], n_requests: int, timeout: float, latencies: List[float], errors: List[str], n_bytes: List[int]):
+    base_path = urlsplit(url).path.rstrip("/")
+    connection = connect(url, timeout)
+    for i in range(n_requests):
+        path = f"{base_path}/{paths[i % len(paths)].lstrip('/')}"
+        start = time.perf_counter()
+        try:
+            connection.request("GET", path, headers={"Accept-Encoding": "br, gzip"})
+            response = connection.getresponse()
+            body = response.read()
+            if response.status != 200:
+                errors.append(f"{path}: {response.status}")
+        except (OSError, http.client.HTTPException) as e:
+            errors.append(f"{path}: {e}")
+            connection.close()
+            connection = connect(url, timeout)
+            continue
+        latencies.append(time.perf_counter() - start)
+        n_bytes.append(len(body))
+    connection.close()
+
+# Sends part of a request line and stalls, as a client on a bad network would.
+def open_slow_client(url: str):
+    parts = urlsplit(url)
+    sock = socket.create_connection((parts.hostname, parts.port))
+    if parts.scheme == "https":
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        sock = context.wrap_socket(sock, server_hostname=parts.hostname)
+    sock.sendall(b"GET / HT")
+    return sock
+
+def percentile(sorted_values: List[float], fraction: float):
+    return sorted_values[min(int(fraction * len(sorted_values)), len(sorted_values) - 1)]
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+                    prog='load-test',
+                    description='Fetches files from a running server with concurrent clients and reports throughput and latencies.')
+    parser.add_argument('url', help="The base URL of the server, for example https://127.0.0.1:3001/.")
+    parser.add_argument('paths', nargs='+', help="The paths to fetch, relative to the base URL, in turn.")
+    parser.add_argument('-c', '--clients', type=int, default=16, help="The number of concurrent clients.")
+    parser.add_argument('-n', '--requests', type=int, default=50, help="The number of requests every client makes.")
+    parser.add_argument('-s', '--slow-clients', type=int, default=0, help="The number of clients that connect and stall for the whole test.")
+    parser.add_argument('-t', '--timeout', type=float, default=10.0, help="The timeout of every request, in seconds.")
+    args = parser.parse_args()
+
+    slow_clients = [open_slow_client(args.url) for _ in range(args.slow_clients)]
+    latencies: List[float] = []
+    errors: List[str] = []
+    n_bytes: List[int] = []
+    threads = [threading.Thread(target=run_client, args=(args.url, args.paths, args.requests, args.timeout, latencies, errors, n_bytes)) for _ in range(args.clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    for sock in slow_clients:
+        sock.close()
+
+    latencies.sort()
+    print(f"{len(latencies)} requests from {args.clients} clients ({args.slow_clients} slow ones stalled) in {elapsed:.2f}s: {len(latencies) / elapsed:.0f} requests/s, {sum(n_bytes) / elapsed / 1e6:.1f} MB/s.")
+    if latencies:
+        print(f"Latency p50 {percentile(latencies, 0.5) * 1e3:.1f}ms, p90 {percentile(latencies, 0.9) * 1e3:.1f}ms, p99 {percentile(latencies, 0.99) * 1e3:.1f}ms, max {latencies[-1] * 1e3:.1f}ms.")
+    if errors:
+        print(f"{len(errors)} errors, for example: {', '.join(errors[:5])}")
+        raise SystemExit(1)
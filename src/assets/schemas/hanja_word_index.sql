@@ -0,0 +1,9 @@
+CREATE TABLE `hanja_word_index` (
+  `hanja_char` text NOT NULL,
+  `word_hanja` text NOT NULL,
+  `word_hangul` text NOT NULL,
+  `position` integer NOT NULL,
+  PRIMARY KEY (hanja_char, word_hanja, word_hangul, position),
+  CONSTRAINT CHK_HanjaChar CHECK (LENGTH(hanja_char) = 1)
+);
+CREATE INDEX `idx_hanja_word_index_word` ON `hanja_word_index` (word_hanja, word_hangul);
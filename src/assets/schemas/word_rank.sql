@@ -0,0 +1,10 @@
+CREATE TABLE `word_rank` (
+  `hanja` text,
+  `hangul` text NOT NULL,
+  `rank` integer NOT NULL,
+  `definitions` integer NOT NULL,
+  `siblings` integer NOT NULL,
+  `sources` integer NOT NULL,
+  CONSTRAINT UC_HanjaHangul UNIQUE (hanja,hangul)
+);
+CREATE INDEX `idx_word_rank_rank` ON `word_rank` (rank);
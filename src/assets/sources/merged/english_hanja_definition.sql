@@ -0,0 +1,26201 @@
+INSERT INTO `english_hanja_definition` VALUES
+('㐀', 'hill'),
+('㐀', 'small'),
+('㐁', 'bamboo'),
+('㐁', 'lick'),
+('㐁', 'sheath'),
+('㐁', 'thin'),
+('㐁', 'tongue'),
+('㐃', 'hammer'),
+('㐇', 'dried'),
+('㐇', 'fish'),
+('㐇', 'name'),
+('㐇', 'personal'),
+('㐉', 'maid'),
+('㐉', 'slave'),
+('㐘', 'rice'),
+('㣴', 'first'),
+('㣴', 'musical scale'),
+('㣴', 'note'),
+('㣴', '황종'),
+('㭐', 'daenama'),
+('㭐', '大奈麻'),
+('㭐', '대나마'),
+('㭗', 'stuffy'),
+('㭗', 'suffocating'),
+('㳓', '대동강'),
+('㳲', 'higher'),
+('㳲', 'musical scale'),
+('㳲', 'note'),
+('㳲', 'octave'),
+('㳲', 'third'),
+('㳲', 'two'),
+('㳲', '태주'),
+('㵜', 'higher'),
+('㵜', 'musical scale'),
+('㵜', 'note'),
+('㵜', 'octave'),
+('㵜', 'tenth'),
+('㵜', 'two'),
+('㵜', '남려'),
+('㶂', 'first'),
+('㶂', 'higher'),
+('㶂', 'musical scale'),
+('㶂', 'note'),
+('㶂', 'octave'),
+('㶂', 'two'),
+('㶂', '황종'),
+('㶃', 'eleventh'),
+('㶃', 'higher'),
+('㶃', 'musical scale'),
+('㶃', 'note'),
+('㶃', 'octave'),
+('㶃', 'two'),
+('㶃', '무역'),
+('㸴', 'surname'),
+('䃼', 'good fortune'),
+('䃼', 'happiness'),
+('䆆', 'dry'),
+('䆆', 'rice'),
+('䍃', 'earthenware'),
+('䍃', '질그릇'),
+('䔁', 'water caltrop'),
+('䔁', 'water chestnut'),
+('䔁', '마름'),
+('䖵', 'insect'),
+('䢖', 'build'),
+('䢖', 'establish'),
+('䢘', 'gatekeeper'),
+('䢘', 'guard'),
+('䦞', 'intercalary'),
+('一', 'a'),
+('一', 'alone'),
+('一', 'an'),
+('一', 'one'),
+('丁', '4th heavenly stem'),
+('丁', 'D'),
+('丁', 'adult'),
+('丁', 'fourth'),
+('丁', 'heavenly stem'),
+('丁', 'male'),
+('丁', 'male adult'),
+('丁', 'man'),
+('丁', 'robust'),
+('丁', 'ten'),
+('丁', 'vigorous'),
+('丂', 'obstruction of breath(qi) as it seeks release'),
+('丂', 'variant of other characters'),
+('七', 'seven'),
+('丄', 'above'),
+('丅', 'below'),
+('丅', 'bring down'),
+('丅', 'down'),
+('丅', 'inferior'),
+('丅', 'under'),
+('丅', 'underneath'),
+('丅', 'used to transliterate the Latin letter T'),
+('丆', 'Kwukyel'),
+('丆', '면'),
+('万', 'innumerable'),
+('万', 'ten thousand'),
+('丈', 'gentleman'),
+('丈', 'husband'),
+('丈', 'man'),
+('丈', 'unit of length equal 3.3 meters'),
+('三', 'three'),
+('上', 'best'),
+('上', 'first'),
+('上', 'go up'),
+('上', 'highest'),
+('上', 'send up'),
+('上', 'superior'),
+('上', 'top'),
+('上', 'up'),
+('下', 'below'),
+('下', 'bottom'),
+('下', 'bring down'),
+('下', 'down'),
+('下', 'inferior'),
+('下', 'lower'),
+('下', 'under'),
+('下', 'underneath'),
+('丌', 'table'),
+('不', 'negative prefix'),
+('不', 'no'),
+('不', 'not'),
+('不', 'un-'),
+('与', 'and'),
+('与', 'for'),
+('与', 'give'),
+('与', 'grant'),
+('与', 'participate'),
+('与', 'to'),
+('与', 'with'),
+('丏', 'invisible'),
+('丏', 'parapet'),
+('丐', 'beg'),
+('丐', 'beggar'),
+('丐', 'give'),
+('丑', '2nd terrestrial branch'),
+('丑', 'clown'),
+('丑', 'comedian'),
+('丑', 'earthly branch'),
+('丑', 'ox'),
+('丑', 'second'),
+('且', 'about to'),
+('且', 'also'),
+('且', 'also(post-subject)'),
+('且', 'altar'),
+('且', 'chopping board'),
+('且', 'cutting board'),
+('且', 'moreover'),
+('且', 'respect'),
+('且', 'sacrificial'),
+('且', 'will soon(pre-verb)'),
+('丕', 'distinguished'),
+('丕', 'glorious'),
+('丕', 'grand'),
+('丕', 'great'),
+('丕', 'large'),
+('世', 'era'),
+('世', 'generation'),
+('世', 'lineage'),
+('世', 'world'),
+('丗', 'society'),
+('丗', 'thirtieth'),
+('丗', 'thirty'),
+('丗', 'world'),
+('丘', 'a name'),
+('丘', 'elder'),
+('丘', 'empty'),
+('丘', 'hill'),
+('丘', 'small'),
+('丙', '3rd heavenly stem'),
+('丙', 'heavenly stem'),
+('丙', 'south'),
+('丙', 'southern'),
+('丙', 'third'),
+('业', 'escape'),
+('业', 'flee'),
+('业', 'north'),
+('业', 'work'),
+('丞', 'aid'),
+('丞', 'assist'),
+('丞', 'rescue'),
+('丟', 'discard'),
+('丟', 'lose'),
+('丟', 'reject'),
+('丠', 'a name'),
+('丠', 'elder'),
+('丠', 'empty'),
+('丠', 'hill'),
+('両', 'a tael'),
+('両', 'both'),
+('両', 'couple'),
+('両', 'ounce'),
+('両', 'pair'),
+('両', 'two'),
+('丢', 'discard'),
+('丣', 'ancient form of the tenth of the twelve Terrestrial Branches'),
+('丣', '酉'),
+('两', 'both'),
+('两', 'couple'),
+('两', 'ounce'),
+('两', 'pair'),
+('两', 'two'),
+('並', 'also'),
+('並', 'annex'),
+('並', 'both'),
+('並', 'combine'),
+('並', 'equal to'),
+('並', 'in order'),
+('並', 'side'),
+('並', 'side by side'),
+('並', 'together'),
+('並', 'vicinity'),
+('並', 'what is more'),
+('丨', 'KangXi radical 2'),
+('丨', 'line'),
+('丨', 'number one'),
+('丨', 'pierce'),
+('丩', 'to join or connect the vine'),
+('个', 'numerary adjunct'),
+('个', 'piece'),
+('个', 'single'),
+('丫', 'bifurcation'),
+('丫', 'forked'),
+('中', 'China'),
+('中', 'amongst'),
+('中', 'attain'),
+('中', 'average'),
+('中', 'center'),
+('中', 'central'),
+('中', 'course'),
+('中', 'during'),
+('中', 'hit(target)'),
+('中', 'in the midst of'),
+('中', 'medium'),
+('中', 'middle'),
+('丮', 'catch'),
+('丰', 'abundant'),
+('丰', 'bountiful'),
+('丰', 'lush'),
+('丰', 'plenty'),
+('丱', 'childs hairstyle bound in two tufts'),
+('丱', 'ore'),
+('串', 'chain'),
+('串', 'conspire'),
+('串', 'habituate'),
+('串', 'receipt'),
+('串', 'relatives'),
+('串', 'skewer'),
+('串', 'something'),
+('串', 'string'),
+('丳', 'a skewer'),
+('丳', 'grill'),
+('丳', 'spit'),
+('丵', 'thick'),
+('丵', 'thick(grass)'),
+('丶', 'KangXi radical 3'),
+('丶', 'comma'),
+('丶', 'dot'),
+('丷', 'kwukyel'),
+('丸', 'pellet'),
+('丸', 'pill'),
+('丸', 'small round object'),
+('丹', 'cinnabar(native HgS)'),
+('丹', 'devotion'),
+('丹', 'red'),
+('丹', 'vermilion(artificial HgS used as pigment)'),
+('主', 'chief owner'),
+('主', 'host'),
+('主', 'king'),
+('主', 'lord'),
+('主', 'main'),
+('主', 'master'),
+('主', 'the main, the principle thing, the important thing'),
+('丼', 'bowl of food'),
+('丼', 'well'),
+('丿', 'KangXi radical 4'),
+('丿', 'line'),
+('乀', 'stretch'),
+('乂', 'control'),
+('乂', 'discipline'),
+('乂', 'govern'),
+('乂', 'manage'),
+('乂', 'mow'),
+('乂', 'nurture'),
+('乂', 'punish'),
+('乂', 'weed'),
+('乃', 'after all'),
+('乃', 'as'),
+('乃', 'as it turned out'),
+('乃', 'indeed'),
+('乃', 'it'),
+('乃', 'namely'),
+('乃', 'out'),
+('乃', 'really'),
+('乃', 'then'),
+('乃', 'turned'),
+('久', 'grow late'),
+('久', 'long time(ago)'),
+('久', 'time passage'),
+('乆', 'grow late'),
+('乆', 'long time(ago)'),
+('乆', 'time passage'),
+('乇', 'leaf'),
+('乇', 'request'),
+('乇', 'to depend on'),
+('乇', 'to entrust with'),
+('么', 'interrogative particle'),
+('么', 'repetition of a tune small'),
+('么', 'tender'),
+('乊', 'Kwukyel'),
+('乊', '호'),
+('之', 'go to'),
+('之', 'him her'),
+('之', 'it'),
+('之', 's(marks preceding phrase as modifier of following phrase)'),
+('之', 'them'),
+('乍', 'first time'),
+('乍', 'for the first time'),
+('乎', 'interrogative or exclamatory final particle'),
+('乏', 'lack'),
+('乏', 'poor'),
+('乑', 'stand side by side'),
+('乖', 'crafty'),
+('乖', 'rebel'),
+('乖', 'shrewd'),
+('乗', 'ascend'),
+('乗', 'avail oneself of'),
+('乗', 'numerary adjunct for vehicles'),
+('乗', 'ride'),
+('乘', 'arithmetic'),
+('乘', 'ascend'),
+('乘', 'avail oneself of'),
+('乘', 'exponent'),
+('乘', 'mount'),
+('乘', 'numerary adjunct for vehicles'),
+('乘', 'ride'),
+('乘', 'take'),
+('乙', '2nd heavenly stem'),
+('乙', 'bird'),
+('乙', 'second'),
+('乜', 'to squint'),
+('乜', 'what? huh?(Cant.)'),
+('九', 'collect'),
+('九', 'gather'),
+('九', 'nine'),
+('乞', 'beg'),
+('乞', 'request'),
+('也', 'also'),
+('也', 'classical final particle of strong affirmation or identity'),
+('乤', 'first character of Korean place name Halpho'),
+('乥', 'Kwukyel'),
+('乥', '홀'),
+('乨', 'the beginning'),
+('乨', 'to be the first'),
+('乨', 'to begin'),
+('乨', 'to start'),
+('乩', 'to divine'),
+('乫', 'used in Korean place names'),
+('乬', 'to hang'),
+('乭', 'rock'),
+('乭', 'used in Korean names'),
+('乱', 'confusion'),
+('乱', 'revolt'),
+('乱', 'state of chaos'),
+('乳', 'breast'),
+('乳', 'milk'),
+('乳', 'nipples'),
+('乳', 'suckle'),
+('乶', 'Korean place name Pholha'),
+('乺', 'painting'),
+('乺', 'painting tool place name'),
+('乺', 'tool'),
+('乼', 'rope'),
+('乽', 'clan'),
+('乽', 'honorific'),
+('乽', 'imperial'),
+('乽', 'member'),
+('乽', 'title'),
+('乾', 'arid'),
+('乾', 'bagua'),
+('乾', 'dry'),
+('乾', 'first'),
+('乾', 'first hexagram'),
+('乾', 'heavenly generative principle(male)'),
+('乾', 'in vain'),
+('乾', 'king'),
+('乾', 'moistureless'),
+('乾', 'nothing'),
+('乾', 'penetrating and fertilizing'),
+('乾', 'sky'),
+('乾', 'superficially'),
+('乾', 'trigram'),
+('乾', 'warming principle of the sun'),
+('乾', 'waterless'),
+('乾', '팔괘'),
+('亀', 'cuckold'),
+('亀', 'turtle or tortoise'),
+('亁', 'as opposed to fresh'),
+('亁', 'dried'),
+('亁', 'dry'),
+('亂', 'chaos'),
+('亂', 'confusion'),
+('亂', 'create'),
+('亂', 'create chaos'),
+('亂', 'revolt'),
+('亂', 'state'),
+('亂', 'state of chaos'),
+('亄', 'greedy'),
+('亄', 'stingy'),
+('亅', 'KangXi radical 6'),
+('亅', 'hook'),
+('了', 'complete'),
+('了', 'finish'),
+('了', 'particle of completed action'),
+('了', 'to finish'),
+('亇', 'hammer'),
+('亇', 'kwukyel hammer'),
+('予', 'I'),
+('予', 'me'),
+('予', 'to give'),
+('亊', 'accident'),
+('亊', 'affair'),
+('亊', 'business'),
+('亊', 'incident'),
+('亊', 'matter'),
+('亊', 'to serve'),
+('事', 'accident'),
+('事', 'affair'),
+('事', 'business'),
+('事', 'incident'),
+('事', 'matter'),
+('事', 'to serve'),
+('二', 'twice'),
+('二', 'two'),
+('亍', 'Korean place name'),
+('亍', 'to take small steps'),
+('于', 'at'),
+('于', 'go to'),
+('于', 'in'),
+('于', 'on'),
+('于', 'surname'),
+('亏', 'damage'),
+('亏', 'deficient'),
+('亏', 'fail'),
+('亏', 'lose'),
+('云', 'clouds'),
+('云', 'say'),
+('云', 'speak'),
+('互', 'mutually'),
+('互', 'reciprocally'),
+('亓', '(archaic form) his'),
+('亓', 'her'),
+('亓', 'its'),
+('亓', 'that'),
+('亓', 'their'),
+('五', 'five'),
+('五', 'surname'),
+('井', 'mine shaft'),
+('井', 'pit'),
+('井', 'well'),
+('亘', 'affirmation'),
+('亘', 'extend across'),
+('亘', 'from'),
+('亘', 'through'),
+('亙', 'extend across'),
+('亙', 'from'),
+('亙', 'through'),
+('些', 'few'),
+('些', 'little'),
+('些', 'rather'),
+('些', 'somewhat'),
+('亜', 'Asia'),
+('亜', 'second'),
+('亝', 'even'),
+('亝', 'regular'),
+('亝', 'to arrange'),
+('亝', 'uniform all alike'),
+('亞', 'Asia'),
+('亞', 'after'),
+('亞', 'coming'),
+('亞', 'next'),
+('亞', 'rank'),
+('亞', 'second'),
+('亞', 'used as a prefix to names'),
+('亟', 'extremely'),
+('亟', 'immediately'),
+('亟', 'urgently'),
+('亠', 'KangXi radical 8'),
+('亠', 'head'),
+('亡', 'collapse'),
+('亡', 'death'),
+('亡', 'destroy'),
+('亡', 'destroyed'),
+('亡', 'lose'),
+('亡', 'not'),
+('亡', 'perish'),
+('亢', 'excessive'),
+('亢', 'high'),
+('亢', 'name'),
+('亢', 'proud'),
+('亢', 'skilled'),
+('亢', 'violent'),
+('交', 'communicate'),
+('交', 'deliver'),
+('交', 'exchange'),
+('交', 'intersect'),
+('交', 'mix'),
+('亥', '12th terrestrial branch'),
+('亦', 'also'),
+('亦', 'likewise'),
+('亦', 'too'),
+('亨', 'no trouble'),
+('亨', 'progressing'),
+('亨', 'smoothly'),
+('亪', 'Kwukyel'),
+('亪', '난'),
+('亪', '란'),
+('亪', '역'),
+('享', 'enjoy'),
+('京', 'billion'),
+('京', 'capital'),
+('京', 'capital city'),
+('京', 'quadrillion'),
+('亭', 'erect'),
+('亭', 'pavilion'),
+('亮', 'bright'),
+('亮', 'brilliant'),
+('亮', 'light'),
+('亮', 'radiant'),
+('亰', 'capital city'),
+('亱', 'by night'),
+('亱', 'dark'),
+('亱', 'in night'),
+('亱', 'night'),
+('亳', 'capital of Yin'),
+('亳', 'name of district in Anhui'),
+('亶', 'real'),
+('亶', 'sincere'),
+('亶', 'true'),
+('亶', 'truth'),
+('亷', 'honest'),
+('亷', 'honorable'),
+('亷', 'upright'),
+('亹', 'busy'),
+('亹', 'exert'),
+('亹', 'progress'),
+('亹', 'untiring'),
+('人', 'human'),
+('人', 'man'),
+('人', 'mankind'),
+('人', 'people'),
+('人', 'person'),
+('人', 'someone else'),
+('亽', 'kwukyel'),
+('亾', 'death'),
+('亾', 'destroyed'),
+('亾', 'lose'),
+('亾', 'perish'),
+('什', 'file of ten soldiers'),
+('什', 'miscellaneous'),
+('什', 'mixed'),
+('仁', 'benevolence'),
+('仁', 'humaneness'),
+('仁', 'kindness'),
+('仂', 'remainder'),
+('仂', 'surplus or excess'),
+('仄', 'oblique'),
+('仄', 'oblique tones'),
+('仄', 'slanting'),
+('仆', 'fall forward'),
+('仆', 'lie prostrate'),
+('仆', 'prone'),
+('仆', 'servant'),
+('仇', 'enemy'),
+('仇', 'enmity'),
+('仇', 'hate'),
+('仇', 'hatred'),
+('今', 'at present'),
+('今', 'modern era'),
+('今', 'now'),
+('今', 'this'),
+('今', 'today'),
+('介', 'forerunner'),
+('介', 'harbinger'),
+('介', 'herald'),
+('介', 'sea shell'),
+('介', 'to lie between'),
+('介', 'to wear armor'),
+('仍', 'again'),
+('仍', 'as ever'),
+('仍', 'continuing'),
+('仍', 'keep -ing'),
+('仍', 'still'),
+('仍', 'yet'),
+('从', 'by'),
+('从', 'from'),
+('从', 'since'),
+('从', 'through'),
+('从', 'whence'),
+('仏', 'Buddha'),
+('仒', 'Kwukyel'),
+('仒', 'kwukyel'),
+('仔', 'child'),
+('仔', 'small thing'),
+('仔', 'young animal'),
+('仕', 'official'),
+('仕', 'serve'),
+('仕', 'serve government'),
+('他', 'another'),
+('他', 'he'),
+('他', 'it'),
+('他', 'other'),
+('他', 'others,other people'),
+('他', 'she'),
+('仗', 'fight'),
+('仗', 'protector'),
+('仗', 'rely upon'),
+('仗', 'war'),
+('仗', 'weaponry'),
+('付', 'deliver'),
+('付', 'entrust'),
+('付', 'give'),
+('付', 'hand over'),
+('付', 'pay'),
+('仙', 'Taoist super-being'),
+('仙', 'ageless'),
+('仙', 'enlightened'),
+('仙', 'hermit'),
+('仙', 'immortal'),
+('仙', 'sage'),
+('仙', 'transcendent'),
+('仚', 'ageless'),
+('仚', 'enlightened'),
+('仚', 'fly'),
+('仚', 'hermit'),
+('仚', 'immortal'),
+('仚', 'sage'),
+('仚', 'to fly'),
+('仛', 'different'),
+('仛', 'strange'),
+('仛', 'young girl'),
+('仝', 'same'),
+('仝', 'surname'),
+('仝', 'together'),
+('仞', 'ancient unit of measure(8 feet)'),
+('仞', 'fathom'),
+('仟', 'leader of one thousand men'),
+('仟', 'one thousand'),
+('仡', 'high'),
+('仡', 'quick'),
+('仡', 'shake'),
+('仡', 'strong'),
+('仡', 'valiant'),
+('代', 'a generation'),
+('代', 'an era, generation, reign of a king, Greater, being absolutely huge,'),
+('代', 'era'),
+('代', 'era, period'),
+('代', 'generation'),
+('代', 'replace'),
+('代', 'replacement(of person or generation >)'),
+('令', 'allow'),
+('令', 'cause'),
+('令', 'command'),
+('令', 'commandant'),
+('令', 'magistrate'),
+('令', 'order'),
+('以', 'because'),
+('以', 'by'),
+('以', 'by means of'),
+('以', 'compared'),
+('以', 'consider as'),
+('以', 'in'),
+('以', 'in order to'),
+('以', 'means'),
+('以', 'of'),
+('以', 'than'),
+('以', 'thereby'),
+('以', 'therefore'),
+('以', 'to'),
+('以', 'view'),
+('以', 'with'),
+('仭', 'ancient unit of measure(8 feet)'),
+('仭', 'fathom'),
+('仮', 'deception'),
+('仮', 'falsehood'),
+('仮', 'vacation'),
+('仰', 'admire'),
+('仰', 'head'),
+('仰', 'look'),
+('仰', 'look up'),
+('仰', 'look up to'),
+('仰', 'raise'),
+('仰', 'raise the head to look'),
+('仰', 'rely on'),
+('仲', 'go between'),
+('仲', 'mediator'),
+('仲', 'middle brother'),
+('仲', 'surname'),
+('仳', 'part company'),
+('仳', 'separate'),
+('仵', 'similar'),
+('件', 'case'),
+('件', 'example'),
+('件', 'matter'),
+('件', 'numerary adjunct for article'),
+('件', 'precedent'),
+('件', 'sth presented as a problem'),
+('件', 'subject'),
+('价', 'price'),
+('价', 'value'),
+('任', 'allow'),
+('任', 'appoint'),
+('任', 'duty'),
+('任', 'office'),
+('任', 'rely on'),
+('任', 'responsibility'),
+('任', 'to bear'),
+('任', 'trust to'),
+('份', 'duty'),
+('份', 'part'),
+('份', 'portion'),
+('仿', 'as if'),
+('仿', 'copy'),
+('仿', 'imitate'),
+('仿', 'similar'),
+('仿', 'to'),
+('伀', 'excited'),
+('企', 'plan'),
+('企', 'plan a project'),
+('企', 'stand on tiptoe'),
+('伃', 'beautiful'),
+('伃', 'handsome'),
+('伈', 'fearful'),
+('伈', 'nervous'),
+('伉', 'compare'),
+('伉', 'match'),
+('伉', 'pair'),
+('伉', 'spouse'),
+('伊', 'he'),
+('伊', 'she'),
+('伊', 'that'),
+('伊', 'third person pronoun'),
+('伊', 'this'),
+('伋', 'deceptive'),
+('伍', 'company of five'),
+('伍', 'five'),
+('伍', 'troops'),
+('伎', 'ability'),
+('伎', 'skill'),
+('伎', 'talent'),
+('伏', 'arms'),
+('伏', 'conceal'),
+('伏', 'crawl'),
+('伏', 'crouch'),
+('伏', 'embrace'),
+('伏', 'hidden'),
+('伏', 'hold'),
+('伏', 'lie'),
+('伏', 'lie hidden'),
+('伏', 'something'),
+('伐', 'attack'),
+('伐', 'cut'),
+('伐', 'cut down'),
+('伐', 'strike'),
+('伐', 'subjugate'),
+('休', 'do not!'),
+('休', 'relax'),
+('休', 'rest'),
+('休', 'retire'),
+('休', 'stop'),
+('伙', 'colleague'),
+('伙', 'companion'),
+('伙', 'utensils'),
+('会', 'assemble'),
+('会', 'meet together'),
+('会', 'meeting'),
+('伜', 'deputy'),
+('伜', 'vice-'),
+('伝', 'propagate'),
+('伝', 'summon'),
+('伝', 'transmit'),
+('伣', 'like'),
+('伩', '(Cant.) small'),
+('伩', 'believe'),
+('伩', 'letter'),
+('伩', 'trust'),
+('伯', 'brother'),
+('伯', 'chief'),
+('伯', 'chieftain'),
+('伯', 'count'),
+('伯', 'earl'),
+('伯', 'elder brother'),
+('伯', 'eldest'),
+('伯', 'father'),
+('伯', 'fathers elder brother'),
+('伯', 'feudal'),
+('伯', 'feudal rank count'),
+('伯', 'older brother'),
+('伯', 'rank'),
+('伯', 'senior male sire'),
+('估', 'estimate'),
+('估', 'guess'),
+('估', 'merchant'),
+('估', 'presume'),
+('伴', 'accompany'),
+('伴', 'companion'),
+('伴', 'comrade'),
+('伴', 'partner'),
+('伶', 'actor'),
+('伶', 'lonely'),
+('伶', 'solitary'),
+('伸', 'extend'),
+('伸', 'open up'),
+('伸', 'stretch out'),
+('伸', 'trust'),
+('伺', 'attend'),
+('伺', 'examine'),
+('伺', 'serve'),
+('伺', 'wait upon'),
+('伻', 'emissary'),
+('伻', 'messenger'),
+('伻', 'send emissary'),
+('似', 'as if'),
+('似', 'resemble'),
+('似', 'seem'),
+('似', 'similar to'),
+('伽', '(nursing'),
+('伽', 'attending'),
+('伽', 'entertainer)(Jap.)'),
+('伽', 'etc.)'),
+('伽', 'in Chinese this character is not used alone'),
+('伽', 'tample'),
+('伽', 'transcription of sanskrit gha in buddhist texts(samgha'),
+('伾', 'mighty'),
+('佀', 'resemble'),
+('佃', 'be a tenant farmer'),
+('佃', 'tenant farmer'),
+('但', 'but'),
+('但', 'however'),
+('但', 'only'),
+('但', 'still'),
+('但', 'yet'),
+('佇', 'accumulate'),
+('佇', 'look towards'),
+('佇', 'stand'),
+('佇', 'stay'),
+('佇', 'store'),
+('佇', 'turn ones back on'),
+('佇', 'wait'),
+('佈', 'announce'),
+('佈', 'publicize'),
+('佈', 'spread'),
+('佉', 'name of a divine being'),
+('佉', 'surname'),
+('佉', 'transliteration of Sanskrit kh'),
+('佋', 'carry on'),
+('佋', 'continue'),
+('佋', 'hand down'),
+('佋', 'to join'),
+('位', 'place'),
+('位', 'position'),
+('位', 'post'),
+('位', 'rank'),
+('位', 'seat'),
+('位', 'status'),
+('位', 'throne'),
+('低', 'bend'),
+('低', 'bow'),
+('低', 'cheap'),
+('低', 'hang'),
+('低', 'low'),
+('低', 'to lower'),
+('住', 'dwell'),
+('住', 'house'),
+('住', 'live at'),
+('住', 'lodge'),
+('住', 'pick up'),
+('住', 'raise'),
+('住', 'reside'),
+('住', 'resident'),
+('住', 'stay'),
+('住', 'stop'),
+('住', 'whereabouts'),
+('佐', 'aid'),
+('佐', 'assist'),
+('佐', 'commander'),
+('佐', 'field grade'),
+('佐', 'officer'),
+('佐', 'second'),
+('佐', 'subordinate'),
+('佑', 'bless'),
+('佑', 'help'),
+('佑', 'protect'),
+('体', 'body'),
+('体', 'class'),
+('体', 'group'),
+('体', 'inferior'),
+('体', 'mediocre'),
+('体', 'rough'),
+('体', 'unit'),
+('佔', 'occupy'),
+('佔', 'occupy by force'),
+('佔', 'possess'),
+('佔', 'seize'),
+('佔', 'take'),
+('佔', 'usurp'),
+('何', 'how'),
+('何', 'what'),
+('何', 'where'),
+('何', 'which'),
+('何', 'why'),
+('佗', 'a load'),
+('佗', 'he'),
+('佗', 'other'),
+('佗', 'surname'),
+('佘', 'surname'),
+('余', 'I'),
+('余', 'me'),
+('余', 'my'),
+('余', 'surname'),
+('余', 'surplus'),
+('佚', 'flee'),
+('佚', 'indulge in pleasures'),
+('佛', 'Buddha'),
+('佛', 'Buddhist image'),
+('佛', 'France'),
+('佛', 'merciful percon'),
+('佛', 'of Buddhism'),
+('佛', 'the dead(Jap.)'),
+('作', 'act'),
+('作', 'compose'),
+('作', 'composition'),
+('作', 'curse'),
+('作', 'invenit, an opus'),
+('作', 'make'),
+('作', 'perform'),
+('作', 'work'),
+('作', 'write'),
+('佝', 'rickets'),
+('佞', 'flattery'),
+('佞', 'glib'),
+('佟', 'a name'),
+('你', 'second person pronoun'),
+('你', 'you'),
+('佢', 'he'),
+('佢', 'him'),
+('佩', 'belt ornament'),
+('佩', 'pendant'),
+('佩', 'respect'),
+('佩', 'tie to the belt'),
+('佩', 'wear at waist'),
+('佪', 'hesitate'),
+('佯', 'deceitful'),
+('佯', 'false'),
+('佯', 'feign'),
+('佯', 'pretend'),
+('佰', 'centurion'),
+('佰', 'hundred'),
+('佰', '백'),
+('佰', '사람'),
+('佰', '어른'),
+('佰', '일'),
+('佳', 'auspicious'),
+('佳', 'beautiful'),
+('佳', 'delightful'),
+('佳', 'good'),
+('佴', 'a second'),
+('佴', 'an assistant'),
+('併', 'annex'),
+('併', 'combine'),
+('佶', 'correct'),
+('佶', 'exact'),
+('佶', 'robust'),
+('佶', 'strong'),
+('佷', 'to act contrary to'),
+('佸', 'a bow (for shooting arrows)'),
+('佸', 'meet'),
+('佹', '(variant deceive)'),
+('佹', 'deceive'),
+('佹', 'depend upon'),
+('佹', 'go against'),
+('佹', 'strange'),
+('佹', 'support'),
+('佺', 'fairy'),
+('佻', 'delay'),
+('佻', 'frivolous'),
+('佻', 'unsteady'),
+('佼', 'beautiful'),
+('佼', 'good-looking'),
+('佼', 'handsome'),
+('佽', 'aid'),
+('佽', 'help'),
+('佾', 'a row or file of dancers'),
+('使', 'ambassador'),
+('使', 'cause'),
+('使', 'do'),
+('使', 'employ'),
+('使', 'envoy'),
+('使', 'messenger'),
+('使', 'order'),
+('使', 'send on a mission'),
+('使', 'use'),
+('侀', 'form'),
+('侁', 'crowd'),
+('侂', 'to ask'),
+('侂', 'to commission'),
+('侂', 'to depute'),
+('侂', 'to entrust to'),
+('侂', 'to request'),
+('侃', 'amiable'),
+('侃', 'upright and strong'),
+('侄', 'nephew'),
+('侅', 'embraced in'),
+('侅', 'prepared for included in'),
+('侅', 'to give'),
+('來', 'arrive'),
+('來', 'come'),
+('來', 'coming'),
+('來', 'return'),
+('來', 'returning'),
+('侇', 'a category a corpse'),
+('侇', 'a class'),
+('侈', 'extravagant'),
+('侈', 'luxurious'),
+('侊', 'big'),
+('例', 'example'),
+('例', 'formalities'),
+('例', 'precedent'),
+('例', 'process'),
+('例', 'regulation'),
+('例', 'rule'),
+('侌', 'shade'),
+('侌', 'shadow'),
+('侌', '그늘'),
+('侍', 'attend upon'),
+('侍', 'attendant'),
+('侍', 'samurai'),
+('侍', 'servant'),
+('侍', 'serve'),
+('侎', 'to establish'),
+('侎', 'to pacify'),
+('侎', 'to settle'),
+('侎', 'to soothe'),
+('侏', 'dwarf'),
+('侏', 'little'),
+('侏', 'small'),
+('侏', 'tiny'),
+('侐', 'quiet'),
+('侑', 'assist'),
+('侑', 'help'),
+('侑', 'repay kindness'),
+('侔', 'equal'),
+('侖', 'logical order'),
+('侖', 'logical reasons'),
+('侗', 'big'),
+('侗', 'ignorant'),
+('侗', 'rude'),
+('侗', 'rustic'),
+('侘', 'disappointed'),
+('侘', 'forlorn'),
+('侚', 'fast'),
+('供', 'contribute'),
+('供', 'offer in worship'),
+('供', 'provide'),
+('供', 'provide for'),
+('供', 'supply'),
+('侜', 'lies'),
+('依', 'be set in'),
+('依', 'consent'),
+('依', 'obey a wish'),
+('依', 'rely on'),
+('侠', 'chivalrous person'),
+('侠', 'knight-errant'),
+('価', 'price'),
+('価', 'value'),
+('侣', 'associate with'),
+('侣', 'companion'),
+('侮', 'disgrace'),
+('侮', 'insult'),
+('侮', 'ridicule'),
+('侯', 'lord'),
+('侯', 'marquis'),
+('侯', 'target in archery'),
+('侵', 'encroach upon'),
+('侵', 'invade'),
+('侵', 'raid'),
+('侶', 'associate with'),
+('侶', 'companion'),
+('侷', 'confined'),
+('侷', 'cramped'),
+('侷', 'narrow'),
+('便', 'comfortability'),
+('便', 'convenience'),
+('便', 'ease'),
+('便', 'expedient'),
+('便', 'feces'),
+('便', 'urine'),
+('俁', 'big'),
+('係', 'bind'),
+('係', 'connection'),
+('係', 'involve'),
+('係', 'relation'),
+('係', 'tie up'),
+('促', 'close'),
+('促', 'hurry'),
+('促', 'press'),
+('促', 'urge'),
+('俄', 'Russian'),
+('俄', 'soon'),
+('俄', 'sudden(ly)'),
+('俅', 'ornamental cap'),
+('俅', 'polite'),
+('俅', 'respectful'),
+('俊', 'beautiful'),
+('俊', 'capable'),
+('俊', 'handsome'),
+('俊', 'outstanding'),
+('俊', 'person'),
+('俊', 'surname'),
+('俊', 'talent'),
+('俊', 'talented'),
+('俎', 'chopping board or block'),
+('俎', 'painted'),
+('俏', 'like'),
+('俏', 'pretty'),
+('俏', 'resemble'),
+('俏', 'similar'),
+('俐', 'active'),
+('俐', 'clever'),
+('俐', 'sharp'),
+('俐', 'smooth'),
+('俑', 'wooden figure buried with dead'),
+('俓', 'pass'),
+('俓', 'straight'),
+('俔', 'like'),
+('俗', 'common'),
+('俗', 'popular'),
+('俗', 'social customs'),
+('俗', 'unrefined'),
+('俗', 'vernacular'),
+('俗', 'vulgar'),
+('俘', 'captive'),
+('俘', 'prisoner of war'),
+('俘', 'take as prisoner'),
+('俙', 'appear as if'),
+('俙', 'to pretend'),
+('俚', 'mean'),
+('俚', 'rustic'),
+('俚', 'unpolished'),
+('俚', 'vulgar'),
+('俛', 'endeavor'),
+('俛', 'make effort'),
+('俛', 'to lower the head'),
+('俜', 'send a message'),
+('俜', 'to trust to'),
+('保', 'care'),
+('保', 'defend'),
+('保', 'guarantee'),
+('保', 'protect'),
+('保', 'protection'),
+('保', 'safeguard'),
+('俞', 'approve'),
+('俞', 'consent'),
+('俞', 'surname'),
+('俟', 'as soon as'),
+('俟', 'wait for'),
+('俟', 'wait until'),
+('俠', 'chivalrous person'),
+('俠', 'knight-errant'),
+('信', 'believe'),
+('信', 'letter'),
+('信', 'trust'),
+('俣', 'big'),
+('俤', '(J) same as 面影'),
+('俤', 'face'),
+('俤', 'memory'),
+('俤', 'shadow'),
+('俤', 'trace'),
+('俤', 'visage'),
+('俥', 'cart'),
+('俥', 'name of piece in Chinese chess'),
+('俥', 'rickshaw'),
+('俥', 'vehicle'),
+('修', 'cultivate'),
+('修', 'discipline'),
+('修', 'repair'),
+('修', 'study'),
+('俯', 'bow down'),
+('俯', 'face down'),
+('俯', 'look down'),
+('俱', 'accompany'),
+('俱', 'all'),
+('俱', 'together'),
+('俲', 'imitate'),
+('俲', 'mimic'),
+('俲', 'same as 傚'),
+('俳', 'actor'),
+('俳', 'insincere'),
+('俳', 'vaudeville show'),
+('俴', 'thin'),
+('俵', 'distribute'),
+('俵', 'divide'),
+('俶', 'arrange'),
+('俶', 'begin'),
+('俶', 'beginning'),
+('俶', 'start'),
+('俸', 'official emolument'),
+('俸', 'salary'),
+('俸', 'wages'),
+('俺', 'I'),
+('俺', 'personal pronoun'),
+('俻', 'completeness'),
+('俻', 'to complete perfection'),
+('俻', 'to prepare'),
+('俻', 'to provide'),
+('俻', 'to put in order'),
+('俾', 'cause'),
+('俾', 'in order that'),
+('俾', 'so that'),
+('倀', 'bewildered'),
+('倀', 'rash'),
+('倀', 'wildly'),
+('倂', 'combine'),
+('倃', 'damage'),
+('倃', 'destroy'),
+('倅', 'deputy'),
+('倅', 'vice-'),
+('倆', 'clever'),
+('倆', 'pair'),
+('倆', 'skilled'),
+('倆', 'two'),
+('倉', 'berth'),
+('倉', 'granary'),
+('倉', 'sea'),
+('倉', 'storage'),
+('倉', 'warehouse'),
+('個', 'item'),
+('個', 'numerary adjunct'),
+('個', 'piece'),
+('個', 'single'),
+('個', 'unit'),
+('倌', 'assistant in wine shop'),
+('倌', 'groom'),
+('倍', 'double'),
+('倍', 'fold'),
+('倍', 'multiple times'),
+('倍', 'times'),
+('倍', 'twice'),
+('倏', 'abruptly'),
+('倏', 'hastily'),
+('倏', 'suddenly'),
+('倐', 'hastily'),
+('倐', 'suddenly'),
+('們', 'adjunct pronoun indicate plural'),
+('倒', 'fall over'),
+('倒', 'lie down'),
+('倒', 'take turns'),
+('倔', 'firm'),
+('倔', 'intransigent'),
+('倔', 'obstinate'),
+('倔', 'stubborn'),
+('倖', 'dote on'),
+('倖', 'fortunate'),
+('倖', 'lucky'),
+('倖', 'spoil'),
+('倘', 'if'),
+('倘', 'in event of'),
+('倘', 'supposing'),
+('候', 'climate'),
+('候', 'expect'),
+('候', 'forecast'),
+('候', 'greet'),
+('候', 'season'),
+('候', 'visit'),
+('候', 'wait'),
+('倚', 'depend on'),
+('倚', 'lean heavily'),
+('倚', 'rely on'),
+('倜', 'raise high'),
+('倜', 'unrestrained'),
+('倝', 'dawn'),
+('倝', 'sunrise'),
+('倞', 'far'),
+('借', 'borrow'),
+('借', 'lend'),
+('借', 'make pretext of'),
+('倡', 'guide'),
+('倡', 'introduce'),
+('倡', 'lead'),
+('倡', 'leader'),
+('倢', 'beautiful'),
+('倢', 'handsome'),
+('倢', 'woman'),
+('倣', 'imitate'),
+('値', 'cost'),
+('値', 'price'),
+('値', 'worth'),
+('倥', 'boorish'),
+('倥', 'ignorant'),
+('倥', 'pressing'),
+('倥', 'urgent'),
+('倦', 'be tired of'),
+('倦', 'languor'),
+('倦', 'weary'),
+('倨', 'arrogant'),
+('倨', 'haughty'),
+('倨', 'rude'),
+('倩', 'beautiful'),
+('倩', 'lovely'),
+('倩', 'son-in-law'),
+('倪', 'feeble'),
+('倪', 'tiny'),
+('倪', 'young and weak'),
+('倫', 'duty'),
+('倫', 'ethics'),
+('倫', 'humanity'),
+('倫', 'morality'),
+('倫', 'normal human relationships'),
+('倬', 'clear'),
+('倬', 'distinct'),
+('倬', 'large'),
+('倬', 'noticeable'),
+('倭', 'Japan'),
+('倭', 'Yamato'),
+('倭', 'ancient'),
+('倭', 'docile'),
+('倭', 'dwarf'),
+('倭', 'dwarfish'),
+('倭', 'obedient'),
+('倭', 'short'),
+('倮', 'bare'),
+('倮', 'naked'),
+('倮', 'uncovered'),
+('倶', 'all'),
+('倹', 'economical'),
+('倹', 'frugal'),
+('倹', 'temperate'),
+('倻', 'phonetic used in Korean place names'),
+('值', 'price'),
+('偁', 'state'),
+('偃', 'cease'),
+('偃', 'lay down'),
+('偃', 'lay off'),
+('偄', 'weak'),
+('假', 'afar'),
+('假', 'arrive'),
+('假', 'come'),
+('假', 'deception'),
+('假', 'distant'),
+('假', 'fake'),
+('假', 'false'),
+('假', 'falsehood'),
+('假', 'go'),
+('假', 'vacation'),
+('偈', 'brave'),
+('偈', 'hasty'),
+('偈', 'martial'),
+('偈', 'scudding'),
+('偉', 'extraordinary'),
+('偉', 'great'),
+('偉', 'robust'),
+('偊', 'self-reliant'),
+('偊', 'to walk alone'),
+('偌', 'like'),
+('偌', 'so'),
+('偌', 'such'),
+('偌', 'thus'),
+('偎', 'approach'),
+('偎', 'cling to'),
+('偎', 'close'),
+('偎', 'come'),
+('偎', 'cuddle'),
+('偎', 'embrace'),
+('偎', 'faint'),
+('偎', 'fondle'),
+('偎', 'vague'),
+('偏', 'inclined one side'),
+('偏', 'slanting'),
+('偐', 'counterfeit'),
+('偐', 'false'),
+('偐', 'spurious'),
+('偓', 'to fuss'),
+('偕', 'be in order'),
+('偕', 'together'),
+('偖', 'haul'),
+('偖', 'raise'),
+('偖', 'rip up'),
+('偖', 'tear down'),
+('偘', 'ancient family name'),
+('做', 'act'),
+('做', 'make'),
+('做', 'work'),
+('停', 'delay'),
+('停', 'stop'),
+('停', 'suitable'),
+('停', 'suspend'),
+('偝', 'desert'),
+('偝', 'not facing'),
+('偟', 'agitated'),
+('偟', 'alarmed'),
+('偟', 'fearful'),
+('偟', 'leisure'),
+('偟', 'wander'),
+('偢', 'to stare at'),
+('健', 'firm'),
+('健', 'healthy'),
+('健', 'robust'),
+('健', 'strength'),
+('健', 'strong'),
+('偨', 'uneven'),
+('偩', 'follow'),
+('偪', 'bother'),
+('偪', 'compel'),
+('偪', 'force'),
+('偪', 'narrow'),
+('偪', 'pressure'),
+('偫', 'lay in'),
+('偫', 'wait for'),
+('偬', 'urgent'),
+('偭', 'face'),
+('偭', 'to'),
+('偭', 'transgress'),
+('偯', 'sob'),
+('偰', 'clear'),
+('偲', 'talented'),
+('偲', 'urgent'),
+('側', 'incline'),
+('側', 'lean'),
+('側', 'side'),
+('側', 'slant'),
+('偵', 'detective'),
+('偵', 'investigation'),
+('偵', 'reconnoiter'),
+('偵', 'spy'),
+('偶', 'accidentally'),
+('偶', 'an idol'),
+('偶', 'by chance'),
+('偶', 'coincidentally'),
+('偶', 'coincidently'),
+('偶', 'even'),
+('偶', 'idol'),
+('偶', 'pair'),
+('偷', 'burglar'),
+('偷', 'thief'),
+('偷', 'to steal'),
+('偸', 'to steal'),
+('偹', 'perfect'),
+('偹', 'prepare'),
+('偹', 'ready'),
+('偽', 'bogus'),
+('偽', 'counterfeit'),
+('偽', 'false'),
+('傀', 'gigantic'),
+('傀', 'great'),
+('傀', 'large'),
+('傀', 'puppet'),
+('傅', 'assist'),
+('傅', 'surname'),
+('傅', 'teacher'),
+('傅', 'tutor'),
+('傌', 'to abuse'),
+('傌', 'to curse'),
+('傌', 'to revile'),
+('傌', 'to scold'),
+('傍', 'beside'),
+('傍', 'by'),
+('傍', 'by side of'),
+('傍', 'close'),
+('傍', 'compel'),
+('傍', 'depend'),
+('傍', 'near'),
+('傍', 'rely'),
+('傍', 'side'),
+('傎', 'topple'),
+('傑', 'hero'),
+('傑', 'outstanding'),
+('傑', 'remarkable'),
+('傒', 'personal name'),
+('傒', 'servant'),
+('傔', 'servant'),
+('傖', 'country man'),
+('傖', 'vulgar person'),
+('傘', 'parachute'),
+('傘', 'parasol'),
+('傘', 'umbrella'),
+('備', 'equip'),
+('備', 'perfect'),
+('備', 'prepare'),
+('備', 'provision'),
+('備', 'ready'),
+('傚', 'imitate'),
+('傚', 'mimic'),
+('傜', 'a minority tribe'),
+('傞', 'unsteady'),
+('傢', 'intransigent'),
+('傢', 'obstinate'),
+('傢', 'stubborn'),
+('催', 'press'),
+('催', 'urge'),
+('傭', 'charter'),
+('傭', 'employ'),
+('傭', 'even'),
+('傭', 'fair'),
+('傭', 'hire'),
+('傭', 'servant'),
+('傮', 'finish'),
+('傮', 'to go around'),
+('傯', 'urgent'),
+('傲', 'haughty'),
+('傲', 'overbearing'),
+('傲', 'proud'),
+('傳', 'propagate'),
+('傳', 'summon'),
+('傳', 'transfer'),
+('傳', 'transmit'),
+('傴', 'humpback'),
+('傴', 'stoop'),
+('債', 'debt'),
+('債', 'liabilities'),
+('債', 'loan'),
+('傷', 'fall ill from'),
+('傷', 'injury'),
+('傷', 'wound'),
+('傺', 'to detain'),
+('傺', 'to hinder'),
+('傻', 'an imbecile'),
+('傻', 'foolish'),
+('傻', 'silly'),
+('傻', 'stupid'),
+('傽', 'terror-stricken'),
+('傾', 'incline'),
+('傾', 'overflow'),
+('傾', 'pour out'),
+('傾', 'tilt'),
+('傾', 'upset'),
+('僂', 'humpback'),
+('僂', 'surname'),
+('僄', 'airy'),
+('僄', 'light'),
+('僅', 'just'),
+('僅', 'merely'),
+('僅', 'only'),
+('僅', 'solely'),
+('僇', 'humiliate'),
+('僇', 'kill'),
+('僇', 'slow'),
+('僇', 'treat with contempt'),
+('僈', 'negligent'),
+('僈', 'remiss'),
+('僉', 'all'),
+('僉', 'together'),
+('僉', 'unanimous'),
+('僊', 'Taoist super-being'),
+('僊', 'immortal'),
+('僊', 'transcendent'),
+('働', 'labor'),
+('働', 'work'),
+('僎', 'collect'),
+('像', 'a picture'),
+('像', 'figure'),
+('像', 'image'),
+('像', 'to resemble'),
+('僑', 'lodge'),
+('僑', 'sojourn'),
+('僕', 'I'),
+('僕', 'servant'),
+('僕', 'slave'),
+('僖', 'delight'),
+('僖', 'gladness'),
+('僖', 'joy'),
+('僖', 'surname'),
+('僚', 'a pretty face'),
+('僚', 'bureaucracy'),
+('僚', 'colleague'),
+('僚', 'companion'),
+('僚', 'officials'),
+('僝', 'to abuse'),
+('僝', 'to revile'),
+('僞', 'bogus'),
+('僞', 'counterfeit'),
+('僞', 'false'),
+('僣', 'assume'),
+('僣', 'usurp'),
+('僤', 'sincere'),
+('僥', 'be lucky'),
+('僥', 'by chance'),
+('僥', 'by luck'),
+('僦', 'to heir'),
+('僦', 'to rent'),
+('僧', 'Buddhist priest'),
+('僧', 'monk'),
+('僧', 'san of Sanskrit sangha'),
+('僨', 'cause fail'),
+('僨', 'overthrown'),
+('僨', 'ruin'),
+('僩', 'courageous'),
+('僩', 'dignified'),
+('僩', 'martial'),
+('僬', 'alert in mind pigmies'),
+('僬', 'clever'),
+('僭', 'assume'),
+('僭', 'usurp'),
+('僮', 'boy servant'),
+('僮', 'page'),
+('僰', 'ancient aboriginal tribe'),
+('僵', 'stiff and motionless'),
+('僵', 'stock still'),
+('價', 'price'),
+('價', 'value'),
+('僻', 'out of the way'),
+('僻', 'out-of-the-way'),
+('僻', 'rare'),
+('僻', 'remote'),
+('僻', 'uncommon'),
+('僻', 'unorthodox'),
+('僾', 'like'),
+('僿', 'lacking sincerity'),
+('僿', 'minute'),
+('僿', 'small'),
+('儀', 'admire'),
+('儀', 'ceremony'),
+('儀', 'model'),
+('儀', 'rites gifts'),
+('儁', 'capable'),
+('儁', 'fine'),
+('儁', 'handsome'),
+('儁', 'outstanding'),
+('儁', 'superior'),
+('儁', 'talented'),
+('儂', 'I'),
+('儂', 'family name'),
+('儂', 'you'),
+('億', 'hundred'),
+('億', 'hundred million'),
+('億', 'many'),
+('億', 'million'),
+('儆', 'guard'),
+('儆', 'outpost'),
+('儆', 'warn'),
+('儆', 'warning'),
+('儇', 'clever'),
+('儇', 'nimble'),
+('儈', 'broker'),
+('儈', 'go-between'),
+('儈', 'proxy'),
+('儉', 'economical'),
+('儉', 'frugal'),
+('儉', 'temperate'),
+('儋', 'a load of two'),
+('儋', 'a small jar'),
+('儋', 'to bear a burden'),
+('儌', 'fortunate'),
+('儌', 'lucky'),
+('儐', 'entertain guests'),
+('儒', 'Confucian scholar'),
+('儒', 'Confucianism'),
+('儒', 'scholar'),
+('儓', 'servant'),
+('儔', 'colleague'),
+('儔', 'companion'),
+('儔', 'mate'),
+('儕', 'a company'),
+('儕', 'companion'),
+('儕', 'together'),
+('儗', 'compare with'),
+('儗', 'draw analogy with'),
+('儘', 'utmost'),
+('儚', '(J) equivalent to 果敢'),
+('儚', 'empty'),
+('儚', 'ephemeral'),
+('儚', 'fickle'),
+('儚', 'fleeting'),
+('儚', 'momentary'),
+('儚', 'vain'),
+('儛', 'to dance for joy'),
+('儛', 'to skip about'),
+('儜', 'in distress'),
+('儜', 'suffer'),
+('儜', 'weak'),
+('儜', 'wearied'),
+('償', 'recompense'),
+('償', 'repay'),
+('償', 'restitution'),
+('儡', 'dummy'),
+('儡', 'puppet'),
+('儤', 'cannonry, ordinance, package'),
+('儤', 'on duty'),
+('儦', 'milling'),
+('儩', 'complete'),
+('優', 'actor'),
+('優', 'excellent'),
+('優', 'superior'),
+('儭', 'to assist'),
+('儭', 'to give alms'),
+('儱', 'barbarous'),
+('儱', 'rude'),
+('儲', 'an heir'),
+('儲', 'reserve'),
+('儲', 'store'),
+('儲', 'to save money'),
+('儳', 'mix'),
+('儳', 'obstinate'),
+('儳', 'stupid'),
+('儳', 'uneven'),
+('儶', 'brave'),
+('儶', 'eminent'),
+('儶', 'valiant'),
+('儷', 'couple'),
+('儷', 'pair'),
+('儷', 'spouse'),
+('儸', 'bandit'),
+('儸', 'daredevil'),
+('儹', 'to accumulate'),
+('儹', 'to hoard'),
+('儹', 'to store up'),
+('儺', 'rich'),
+('儻', 'if'),
+('儼', 'grave'),
+('儼', 'majestic'),
+('儼', 'respectful'),
+('儽', 'lazy'),
+('儽', 'tired out'),
+('儽', 'worn fatigued'),
+('儿', 'child'),
+('儿', 'person'),
+('儿', 'radical 10'),
+('儿', 'son'),
+('兀', 'to cut off the feet'),
+('允', 'to allow'),
+('允', 'to consent'),
+('允', 'to grant'),
+('兂', 'clasp'),
+('兂', 'hairpin'),
+('兂', 'wear in hair'),
+('元', 'chief'),
+('元', 'dollar'),
+('元', 'first'),
+('元', 'head'),
+('元', 'origin'),
+('兄', 'brother'),
+('兄', 'elder brother'),
+('兄', 'male'),
+('兄', 'older'),
+('充', 'be full'),
+('充', 'fill'),
+('充', 'supply'),
+('兆', 'also trillion. China'),
+('兆', 'mega'),
+('兆', 'million'),
+('兆', 'omen'),
+('兇', 'atrocious'),
+('兇', 'brutal'),
+('兇', 'ferocious'),
+('先', 'first'),
+('先', 'foremost'),
+('先', 'former'),
+('先', 'guide'),
+('先', 'lead'),
+('先', 'previous'),
+('光', 'brilliant'),
+('光', 'light'),
+('光', 'lustre'),
+('光', 'only'),
+('光', 'shine'),
+('克', 'able'),
+('克', 'beat'),
+('克', 'competent'),
+('克', 'gram'),
+('克', 'overcome'),
+('克', 'transliteration'),
+('克', 'win'),
+('兌', 'barter'),
+('兌', 'cash'),
+('兌', 'exchange'),
+('兌', 'weight'),
+('免', 'disband'),
+('免', 'discharge'),
+('免', 'dismiss'),
+('免', 'evade'),
+('免', 'excuse'),
+('免', 'excuse from'),
+('免', 'spare'),
+('兎', 'hare'),
+('兎', 'moon'),
+('兎', 'rabbit'),
+('兎', '달'),
+('兎', '토끼'),
+('児', 'child'),
+('児', 'final part'),
+('児', 'oneself'),
+('児', 'son'),
+('兑', 'cash'),
+('兑', 'exchange'),
+('兒', 'child'),
+('兒', 'final part'),
+('兒', 'oneself'),
+('兒', 'son'),
+('兔', 'hare'),
+('兔', 'rabbit'),
+('兕', 'a female rhinoceros'),
+('兖', 'establish'),
+('兖', 'one of nine empire divisions'),
+('兗', 'establish'),
+('兗', 'one of nine empire divisions'),
+('兙', 'decagram'),
+('党', 'faction'),
+('党', 'gang'),
+('党', 'political party'),
+('兛', 'kilogram'),
+('兜', 'helmet'),
+('兜', 'iron'),
+('兜', 'pouch'),
+('兜', '투구'),
+('兟', 'to advance'),
+('兡', 'mercury(chemical element)'),
+('兢', 'cautious'),
+('兢', 'fearful'),
+('兢', 'wary'),
+('入', 'come in'),
+('入', 'come in(to)'),
+('入', 'enter'),
+('入', 'join'),
+('兦', 'destruction'),
+('內', 'domestic'),
+('內', 'inside'),
+('內', 'interior'),
+('內', 'within'),
+('全', 'intact'),
+('全', 'keep whole or intact'),
+('全', 'maintain'),
+('兩', 'about'),
+('兩', 'both'),
+('兩', 'couple'),
+('兩', 'equivalent'),
+('兩', 'g'),
+('兩', 'liang'),
+('兩', 'ounce'),
+('兩', 'pair'),
+('兩', 'tael'),
+('兩', 'two'),
+('兩', 'unit'),
+('兩', 'weight'),
+('兪', 'consent'),
+('兪', 'surname'),
+('八', 'all around'),
+('八', 'all sides'),
+('八', 'eight'),
+('公', 'duke'),
+('公', 'equitable'),
+('公', 'fair'),
+('公', 'official'),
+('公', 'public'),
+('六', 'number six'),
+('六', 'six'),
+('兮', 'exclamatory particle'),
+('兯', 'Kwukyel'),
+('兯', '한'),
+('共', 'all'),
+('共', 'common'),
+('共', 'to share'),
+('共', 'together'),
+('共', 'together with'),
+('共', 'total'),
+('兵', 'soldier'),
+('兵', 'troops'),
+('其', 'her'),
+('其', 'his'),
+('其', 'its'),
+('其', 'that'),
+('其', 'their'),
+('其', 'therein'),
+('其', 'those'),
+('具', 'draw up'),
+('具', 'implement'),
+('具', 'tool'),
+('具', 'write'),
+('典', 'canon'),
+('典', 'classic'),
+('典', 'documentation'),
+('典', 'law'),
+('典', 'rule'),
+('典', 'scripture'),
+('兹', 'here'),
+('兹', 'now'),
+('兹', 'this'),
+('兹', 'time'),
+('兹', 'year'),
+('兼', 'and'),
+('兼', 'combine'),
+('兼', 'connect'),
+('兼', 'unite'),
+('冀', 'Hebei province'),
+('冀', 'hope for'),
+('冀', 'wish'),
+('冂', 'KangXi radical 13'),
+('冂', 'remote'),
+('冂', 'wide'),
+('冄', 'gradually alterrrrating'),
+('冄', 'tender'),
+('冄', 'weak'),
+('内', 'inside'),
+('円', 'yen'),
+('冉', 'proceed gradually'),
+('冉', 'tender'),
+('冉', 'weak'),
+('冊', 'book'),
+('冊', 'volume'),
+('册', 'book'),
+('册', 'list'),
+('册', 'register'),
+('册', 'volume'),
+('再', 'again'),
+('再', 're-'),
+('再', 'twice'),
+('冏', 'bright'),
+('冏', 'shine'),
+('冐', 'brave'),
+('冐', 'dare'),
+('冐', 'risk'),
+('冑', 'helmet'),
+('冑', 'iron'),
+('冑', '투구'),
+('冒', 'brave'),
+('冒', 'conceal'),
+('冒', 'cover'),
+('冒', 'dare'),
+('冒', 'hide'),
+('冒', 'risk'),
+('冒', 'veil'),
+('冓', 'a secluded place'),
+('冓', 'secret cabinet'),
+('冔', 'cap worn during the Yin dynasty'),
+('冕', 'ceremonial cap'),
+('冕', 'crown'),
+('冖', 'KangXi radical 14'),
+('冖', 'cover'),
+('冗', 'excessive'),
+('冗', 'superfluous'),
+('冘', 'coubtful'),
+('冘', 'to move on'),
+('写', 'compose'),
+('写', 'draw'),
+('写', 'sketch'),
+('写', 'write'),
+('冝', 'fitting'),
+('冝', 'proper'),
+('冝', 'right'),
+('冝', 'suitable'),
+('冞', 'far'),
+('冠', 'cap'),
+('冠', 'corona, king`s crown'),
+('冠', 'crown'),
+('冠', 'hat'),
+('冠', 'headgear'),
+('冢', 'burial mound'),
+('冢', 'grand'),
+('冢', 'mausoleum'),
+('冤', 'grievance'),
+('冤', 'injustice'),
+('冤', 'wrong'),
+('冥', 'dark'),
+('冥', 'deep'),
+('冥', 'gloomy'),
+('冥', 'night'),
+('冨', 'abundant'),
+('冨', 'ample'),
+('冨', 'rich'),
+('冨', 'wealthy'),
+('冩', 'compose'),
+('冩', 'draw'),
+('冩', 'sketch'),
+('冩', 'write'),
+('冪', 'cover with cloth'),
+('冪', 'cover-cloth'),
+('冫', 'KangXi radical 15'),
+('冫', 'ice'),
+('冬', '11th lunar month'),
+('冬', 'winter'),
+('冰', 'ice'),
+('冰', 'ice-cold'),
+('冱', 'closed off'),
+('冱', 'freezing'),
+('冱', 'stopped up'),
+('冲', 'pour boiling water over'),
+('冲', 'soar'),
+('决', 'decide'),
+('决', 'determine'),
+('决', 'judge'),
+('冴', 'closed off'),
+('冴', 'freezing'),
+('冴', 'stopped up'),
+('况', 'condition'),
+('况', 'furthermore'),
+('况', 'situation'),
+('冶', 'NSFW'),
+('冶', 'cast'),
+('冶', 'erotic'),
+('冶', 'found'),
+('冶', 'fuse metals'),
+('冶', 'lewd'),
+('冶', 'sexy'),
+('冶', 'smelt'),
+('冶', 'smelter'),
+('冷', 'cold'),
+('冷', 'cool'),
+('冷', 'lonely'),
+('冸', 'melt'),
+('冽', 'clear'),
+('冽', 'cold and raw'),
+('冽', 'pure'),
+('凄', 'bitter cold'),
+('凄', 'dreary'),
+('凄', 'miserable'),
+('凅', 'dried up'),
+('凅', 'dry'),
+('凅', 'exhausted'),
+('凅', 'tired'),
+('准', 'allow'),
+('准', 'approve'),
+('准', 'in accord'),
+('准', 'permit'),
+('凇', 'dewdrop'),
+('凇', 'icicle'),
+('凈', 'clean'),
+('凈', 'cleanse'),
+('凈', 'pure'),
+('凉', 'cold'),
+('凉', 'cool'),
+('凉', 'disheartened'),
+('凊', 'surname'),
+('凋', 'be withered'),
+('凋', 'exhausted'),
+('凋', 'fallen'),
+('凌', 'above'),
+('凌', 'insult'),
+('凌', 'maltreat'),
+('凌', 'override'),
+('凌', 'place'),
+('凌', 'pure'),
+('凌', 'virtuous'),
+('凍', 'cold'),
+('凍', 'congeal'),
+('凍', 'freeze'),
+('凍', 'jelly'),
+('减', 'decrease'),
+('减', 'diminish'),
+('减', 'subtract'),
+('凑', 'assemble'),
+('凑', 'piece together'),
+('凓', 'severe cold'),
+('凓', 'shiver'),
+('凔', 'cold'),
+('凖', 'guideline'),
+('凖', 'rule'),
+('凖', 'standard'),
+('凚', 'chilly'),
+('凚', 'cold'),
+('凛', 'to shiver with cold or fear'),
+('凜', 'fearful'),
+('凜', 'shiver with cold or fear'),
+('凝', 'coagulate'),
+('凝', 'congeal'),
+('凝', 'freeze'),
+('凞', 'bright'),
+('凞', 'glorious'),
+('凞', 'splendid'),
+('几', 'back'),
+('几', 'desk'),
+('几', 'rest'),
+('几', 'small table'),
+('凡', 'all'),
+('凡', 'any'),
+('凡', 'common'),
+('凡', 'every'),
+('凡', 'ordinary'),
+('凢', 'all'),
+('凢', 'any'),
+('凢', 'common'),
+('凢', 'every'),
+('凢', 'ordinary'),
+('凣', 'all'),
+('凣', 'common'),
+('凣', 'every'),
+('凣', 'general'),
+('凣', 'generally'),
+('凣', 'whenever'),
+('凥', 'to dwell'),
+('処', 'department'),
+('処', 'locale'),
+('処', 'place'),
+('凨', 'air'),
+('凨', 'atmosphere'),
+('凨', 'manners'),
+('凨', 'wind'),
+('凩', 'wintry wind'),
+('凪', 'calm'),
+('凪', 'lull'),
+('凭', 'depend on'),
+('凭', 'lean on'),
+('凭', 'rely on'),
+('凮', 'wind'),
+('凰', 'female phoenix'),
+('凱', 'triumph'),
+('凱', 'triumphant'),
+('凱', 'victory'),
+('凳', 'bench'),
+('凳', 'stool'),
+('凴', 'depend on'),
+('凴', 'evidence'),
+('凴', 'proof'),
+('凴', 'to rely on'),
+('凵', 'KangXi radical 17'),
+('凵', 'mouth'),
+('凵', 'open'),
+('凵', 'receptacle'),
+('凶', 'bad'),
+('凶', 'culprit'),
+('凶', 'murder'),
+('凶', 'ominous'),
+('凶', 'sad'),
+('凶', 'terrible'),
+('凷', 'dirt clod'),
+('凷', 'piece'),
+('凸', 'bulge out'),
+('凸', 'convex'),
+('凸', 'protrude'),
+('凹', 'a pass'),
+('凹', 'concave'),
+('凹', 'depressed'),
+('凹', 'hollow'),
+('凹', 'valley'),
+('出', 'act'),
+('出', 'come out'),
+('出', 'go out'),
+('出', 'movie'),
+('出', 'play'),
+('出', 'produce'),
+('出', 'scene'),
+('出', 'send out'),
+('出', 'stand'),
+('函', 'a box'),
+('函', 'a box for clothes or stuff'),
+('函', 'a case'),
+('函', 'box'),
+('函', 'correspondence'),
+('凾', 'a box'),
+('凾', 'a case'),
+('凾', 'correspondence'),
+('刀', 'knife'),
+('刀', 'measure'),
+('刀', 'old coin'),
+('刀', 'sword'),
+('刁', 'crafty'),
+('刁', 'cunning'),
+('刁', 'sly'),
+('刁', 'tricky'),
+('刂', 'knife'),
+('刂', 'radical number 18'),
+('刃', 'cutlery'),
+('刃', 'edged tool'),
+('刃', 'knife edge'),
+('刄', 'cutlery'),
+('刄', 'edged tool'),
+('刄', 'knife edge'),
+('刅', 'to begin'),
+('刅', 'to create'),
+('刅', 'to make to invent'),
+('分', 'affection'),
+('分', 'component'),
+('分', 'distinguish'),
+('分', 'distribute'),
+('分', 'divide'),
+('分', 'duty'),
+('分', 'fraction'),
+('分', 'minute'),
+('分', 'mutual'),
+('分', 'part'),
+('分', 'portion'),
+('分', 'responsibility'),
+('分', 'small unit of time etc.'),
+('分', 'standing'),
+('分', 'status'),
+('切', 'all'),
+('切', 'carve'),
+('切', 'cut'),
+('切', 'everything'),
+('切', 'mince'),
+('切', 'slice'),
+('切', 'whole'),
+('刈', 'cut off'),
+('刈', 'mow'),
+('刈', 'reap'),
+('刈', 'sickle'),
+('刊', 'periodical'),
+('刊', 'publication'),
+('刊', 'publish'),
+('刋', 'periodical'),
+('刋', 'publication'),
+('刋', 'publish'),
+('刎', 'behead'),
+('刎', 'cut throat'),
+('刑', 'law'),
+('刑', 'penalty'),
+('刑', 'punishment'),
+('划', 'to row or paddle boat'),
+('划', 'to scratch'),
+('刓', 'trim'),
+('刔', 'gouge'),
+('刔', 'scoop out'),
+('刖', 'cutting off feet as form of punishment'),
+('列', 'a line'),
+('列', 'classify'),
+('列', 'line'),
+('列', 'row'),
+('列', 'to arrange in order'),
+('刘', 'destroy'),
+('刘', 'kill'),
+('刘', 'surname'),
+('刜', 'chop'),
+('初', 'beginning'),
+('初', 'initial'),
+('初', 'primary'),
+('初', 'start'),
+('删', 'delete'),
+('删', 'to cut'),
+('判', 'conclude'),
+('判', 'discriminate'),
+('判', 'judge'),
+('別', 'difference'),
+('別', 'do not'),
+('別', 'other'),
+('別', 'separate'),
+('刦', 'coerce'),
+('刦', 'disaster'),
+('刦', 'take by force'),
+('刧', 'coerce'),
+('刧', 'disaster'),
+('刧', 'misfortune'),
+('刨', 'carpenters plane'),
+('刨', 'level'),
+('刨', 'plane'),
+('利', 'advantage'),
+('利', 'benefit'),
+('利', 'gains'),
+('利', 'merit'),
+('利', 'profit'),
+('刪', 'delete'),
+('刪', 'erase'),
+('刪', 'to cut'),
+('刪', 'to geld'),
+('别', 'do not'),
+('别', 'other'),
+('别', 'separate'),
+('刮', 'cut'),
+('刮', 'pare off'),
+('刮', 'peel'),
+('刮', 'scrape'),
+('刮', 'shave'),
+('到', 'arrival'),
+('到', 'arrive'),
+('到', 'been to'),
+('到', 'go to'),
+('刱', 'create'),
+('刱', 'establish'),
+('刱', 'knife cut'),
+('刲', 'cut'),
+('刲', 'slice off'),
+('刳', 'cut out'),
+('刳', 'dig'),
+('刳', 'rip up'),
+('刳', 'scoop out'),
+('刴', 'chop by pounding'),
+('刴', 'hash'),
+('刴', 'mince'),
+('刵', 'punishment by cutting off ears'),
+('制', 'establish'),
+('制', 'overpower'),
+('制', 'plan'),
+('制', 'regulate'),
+('制', 'system'),
+('刷', 'brush'),
+('刷', 'clean with brush'),
+('刷', 'scrub'),
+('券', 'certificate'),
+('券', 'ticket'),
+('券', 'title deeds'),
+('刹', 'Buddhist'),
+('刹', 'monastary'),
+('刹', 'pagoda'),
+('刹', 'shrine'),
+('刹', 'temple'),
+('刺', 'irritate'),
+('刺', 'prick'),
+('刺', 'prod'),
+('刺', 'scold'),
+('刺', 'spike'),
+('刺', 'stab'),
+('刺', 'thorn'),
+('刻', 'carve'),
+('刻', 'engrave'),
+('刻', 'quarter hour'),
+('剃', 'shave'),
+('剄', 'cut throat'),
+('則', 'grades'),
+('則', 'law'),
+('則', 'regulation'),
+('則', 'rule'),
+('剉', 'cut'),
+('剉', 'file'),
+('剉', 'trim'),
+('削', 'cut'),
+('削', 'pare'),
+('削', 'scrape off'),
+('削', 'trim'),
+('剋', 'cut down'),
+('剋', 'overcome'),
+('剋', 'subdue'),
+('剌', 'contradict'),
+('剌', 'cut in two'),
+('剌', 'slash'),
+('前', 'before'),
+('前', 'forward'),
+('前', 'front'),
+('前', 'in front'),
+('前', 'preceding'),
+('前', 'previous'),
+('剎', 'temple'),
+('剏', 'create'),
+('剏', 'establish'),
+('剏', 'knife cut'),
+('剔', 'pick out'),
+('剔', 'scrape meat'),
+('剔', 'scrape off'),
+('剖', 'bureau, department, ministry'),
+('剖', 'dissect'),
+('剖', 'part, a section'),
+('剖', 'slice'),
+('剖', 'split in two'),
+('剗', 'to level off'),
+('剗', 'to pare down'),
+('剗', 'to trim'),
+('剙', 'create'),
+('剙', 'establish'),
+('剙', 'knife cut'),
+('剚', 'stab'),
+('剛', 'hard'),
+('剛', 'rigid'),
+('剛', 'strong'),
+('剛', 'tough'),
+('剜', 'cut'),
+('剜', 'cut out'),
+('剜', 'pick out'),
+('剜', 'scoop out'),
+('剝', 'cut'),
+('剝', 'injure'),
+('剝', 'peel'),
+('剝', 'peel off'),
+('剝', 'strip'),
+('剝', 'to shell'),
+('剝', 'trim'),
+('剝', 'undress'),
+('剞', 'carving or engraving knife'),
+('剞', 'grave'),
+('剟', 'to cut blocks'),
+('剟', 'to engrave'),
+('剟', 'to prick'),
+('剠', 'brand'),
+('剡', 'sharp'),
+('剡', 'sharp-pointed'),
+('剡', 'sharpen'),
+('剣', 'dagger'),
+('剣', 'saber'),
+('剣', 'sword'),
+('剥', 'peel'),
+('剦', 'to castrate'),
+('剨', 'sound of something being smashed'),
+('剩', 'leftover'),
+('剩', 'leftovers'),
+('剩', 'remainder'),
+('剩', 'remains'),
+('剩', 'residue'),
+('剪', 'cut'),
+('剪', 'divide'),
+('剪', 'scissors'),
+('剪', 'separate'),
+('剮', 'cut'),
+('剮', 'cut flesh from bones'),
+('副', 'assist'),
+('副', 'assistant'),
+('副', 'auxiliary'),
+('副', 'lucre, opulent, riches, wealth'),
+('副', 'secondary'),
+('副', 'supplement'),
+('割', 'cede'),
+('割', 'cut'),
+('割', 'divide'),
+('割', 'partition'),
+('剳', 'brief note'),
+('剳', 'official communique'),
+('剴', 'carefully'),
+('剴', 'sharpen'),
+('剴', 'thorough'),
+('創', 'create'),
+('創', 'creative'),
+('創', 'damage'),
+('創', 'establish'),
+('創', 'knife cut'),
+('創', 'originate'),
+('創', 'special'),
+('創', 'start'),
+('創', 'unique'),
+('創', 'wound'),
+('剷', 'cut off'),
+('剷', 'pare down'),
+('剷', 'raze'),
+('剷', 'to level off'),
+('剸', 'cut'),
+('剺', 'mark'),
+('剽', 'fast'),
+('剽', 'plunder'),
+('剽', 'rob'),
+('剽', 'slice off'),
+('剿', 'annihilate'),
+('剿', 'destroy'),
+('剿', 'exterminate'),
+('劂', 'chisel for engraving'),
+('劂', 'engrave'),
+('劃', 'carve'),
+('劃', 'divide'),
+('劃', 'draw'),
+('劃', 'lay boundary'),
+('劃', 'line'),
+('劃', 'mark off'),
+('劃', 'plan'),
+('劃', 'set in stone'),
+('劄', 'brief note'),
+('劄', 'official communique'),
+('劇', 'drama'),
+('劇', 'excessive'),
+('劇', 'extreme'),
+('劇', 'opera'),
+('劇', 'plays'),
+('劇', 'theatrical'),
+('劇', 'theatrical plays'),
+('劈', 'chop'),
+('劈', 'cut apart'),
+('劈', 'split'),
+('劉', 'destroy'),
+('劉', 'kill'),
+('劉', 'surname'),
+('劊', 'amputate'),
+('劊', 'cut off'),
+('劌', 'injure'),
+('劌', 'stab'),
+('劌', 'stick on'),
+('劌', 'to cut'),
+('劍', 'dagger'),
+('劍', 'knife'),
+('劍', 'saber'),
+('劍', 'sword'),
+('劎', 'dagger'),
+('劎', 'sword'),
+('劐', 'destroy'),
+('劑', 'medicinal preparation'),
+('劒', 'dagger'),
+('劒', 'knife'),
+('劒', 'saber'),
+('劒', 'sword'),
+('劓', 'cut off nose'),
+('劔', 'dagger'),
+('劔', 'saber'),
+('劔', 'sword'),
+('劖', 'cut'),
+('劖', 'make into mince'),
+('劘', 'make into mince'),
+('劙', 'a divide'),
+('劙', 'to partition'),
+('劚', 'cut'),
+('力', 'capability'),
+('力', 'force'),
+('力', 'influence'),
+('力', 'power'),
+('功', 'achievement'),
+('功', 'credit'),
+('功', 'deed'),
+('功', 'effort'),
+('功', 'elaboration'),
+('功', 'good result'),
+('功', 'labor'),
+('功', 'merit'),
+('功', 'meritorious'),
+('功', 'meritorious labors, good labors, good efforts'),
+('功', 'service'),
+('加', 'add'),
+('加', 'add to'),
+('加', 'augment'),
+('加', 'increase'),
+('劣', 'bad'),
+('劣', 'inferior'),
+('劣', 'poor'),
+('劣', 'slightly'),
+('劤', 'strong'),
+('助', 'aid'),
+('助', 'assist'),
+('助', 'help'),
+('努', 'exertion'),
+('努', 'make an effort'),
+('努', 'making an effort'),
+('努', 'strive'),
+('努', 'striving'),
+('努', 'to exert'),
+('努', 'to pout'),
+('劫', 'coerce'),
+('劫', 'disaster'),
+('劫', 'kalpa'),
+('劫', 'take by force'),
+('劫', 'threaten'),
+('劬', 'be diligent'),
+('劬', 'endeavor'),
+('劬', 'toil'),
+('劭', 'encourage'),
+('劭', 'excellent'),
+('劭', 'to excel'),
+('励', 'encourage'),
+('励', 'strive'),
+('労', 'do manual work'),
+('労', 'labor'),
+('労', 'toil'),
+('劵', 'certificate'),
+('劵', 'ticket'),
+('劵', 'title deeds'),
+('効', 'effectiveness'),
+('効', 'efficacious'),
+('効', 'to serve in the army'),
+('効', 'to toil'),
+('劻', 'be in flurry'),
+('劻', 'flurried'),
+('劻', 'zealous'),
+('劼', 'be discreet'),
+('劼', 'cautious'),
+('劼', 'prudent'),
+('劾', 'charge'),
+('劾', 'examine into'),
+('劾', 'impeach'),
+('劾', 'inquire'),
+('劾', 'scold'),
+('勁', 'powerful'),
+('勁', 'strong'),
+('勁', 'tough'),
+('勁', 'unyielding'),
+('勃', 'quick'),
+('勃', 'rise'),
+('勃', 'sudden'),
+('勃', 'suddenly'),
+('勅', 'daoist magic'),
+('勅', 'edict'),
+('勅', 'imperial'),
+('勅', 'imperial degree'),
+('勇', 'brave'),
+('勇', 'bravery'),
+('勇', 'courage'),
+('勇', 'courageous'),
+('勇', 'fierce'),
+('勉', 'effort'),
+('勉', 'endeavor'),
+('勉', 'make'),
+('勉', 'make effort'),
+('勉', 'strive'),
+('勉', 'urge'),
+('勌', 'tired'),
+('勌', 'to labor'),
+('勍', 'mighty'),
+('勍', 'powerful'),
+('勍', 'strong'),
+('勍', 'violent'),
+('勑', 'reward'),
+('勑', 'sincere'),
+('勒', 'strangle'),
+('勒', 'tighten'),
+('勔', 'endeavor'),
+('勔', 'make effort'),
+('勔', 'urge'),
+('動', 'action'),
+('動', 'happen'),
+('動', 'move'),
+('動', 'movement'),
+('勖', 'advise'),
+('勖', 'enjoin'),
+('勖', 'preach to'),
+('勗', 'advise'),
+('勗', 'enjoin'),
+('勗', 'excite'),
+('勘', 'collate'),
+('勘', 'compare'),
+('勘', 'consideration'),
+('勘', 'investigate'),
+('務', 'affairs'),
+('務', 'business'),
+('務', 'devoted'),
+('務', 'engaged'),
+('務', 'must'),
+('務', 'should'),
+('勛', 'meritorious deed'),
+('勛', 'merits'),
+('勛', 'rank'),
+('勝', 'be better than'),
+('勝', 'beat'),
+('勝', 'excel'),
+('勝', 'victory'),
+('勝', 'win'),
+('勞', 'do manual work'),
+('勞', 'labor'),
+('勞', 'toil'),
+('勞', 'work'),
+('募', 'levy'),
+('募', 'raise'),
+('募', 'recruit'),
+('募', 'summon'),
+('勠', 'join forces'),
+('勠', 'unite'),
+('勢', 'force'),
+('勢', 'power'),
+('勢', 'tendency'),
+('勣', 'achievements'),
+('勣', 'conduct deserving'),
+('勤', 'attentive'),
+('勤', 'diligent'),
+('勤', 'industrious'),
+('勦', 'annihilate'),
+('勦', 'destroy'),
+('勦', 'exterminate'),
+('勧', 'advise'),
+('勧', 'recommend'),
+('勧', 'urge'),
+('勩', 'belabored'),
+('勩', 'toil'),
+('勩', 'work hard'),
+('勯', 'exhausted'),
+('勰', 'harmonious'),
+('勰', 'peaceful'),
+('勱', 'put forth effort'),
+('勱', 'strive forward'),
+('勲', 'meritorious deed'),
+('勲', 'merits'),
+('勲', 'rank'),
+('勳', 'meritorious deed'),
+('勳', 'merits'),
+('勳', 'rank'),
+('勵', 'encourage'),
+('勵', 'strive'),
+('勷', 'help'),
+('勷', 'hurriedly'),
+('勷', 'in haste'),
+('勷', 'urgent'),
+('勸', 'advise'),
+('勸', 'recommend'),
+('勸', 'urge'),
+('勹', 'KangXi radical 20'),
+('勹', 'wrap'),
+('勺', 'ladle'),
+('勺', 'spoon'),
+('勺', 'unit of measure'),
+('勺', 'unit of volume'),
+('勻', 'equal'),
+('勻', 'even'),
+('勻', 'impartially'),
+('勻', 'uniform'),
+('勽', 'to brood'),
+('勽', 'to hatch'),
+('勽', 'to incubate'),
+('勾', 'connect'),
+('勾', 'entice'),
+('勾', 'hook'),
+('勾', 'join'),
+('勿', 'do'),
+('勿', 'do not'),
+('勿', 'lacking'),
+('勿', 'must not'),
+('勿', 'never'),
+('勿', 'not'),
+('勿', 'without'),
+('匀', 'equal'),
+('匁', 'Japanese unit of weight(1/1000 of a kan)'),
+('匂', 'fragrance'),
+('匂', 'smell'),
+('匃', 'beg'),
+('匃', 'beggar'),
+('匃', 'give'),
+('匄', 'a beggar'),
+('匄', 'to beg for alms'),
+('包', 'bundle'),
+('包', 'pack'),
+('包', 'package'),
+('包', 'wrap'),
+('匆', 'hastily'),
+('匆', 'hurriedly'),
+('匆', 'in haste'),
+('匈', 'barbarian'),
+('匈', 'breast'),
+('匈', 'chest'),
+('匈', 'clamor'),
+('匈', 'foreigner'),
+('匈', 'malignancy'),
+('匈', 'savage'),
+('匈', 'the Hsiung Nu Huns'),
+('匈', 'thorax'),
+('匉', 'noise of waters'),
+('匊', 'clasp'),
+('匊', 'grab'),
+('匊', 'handful'),
+('匋', 'pottery'),
+('匍', 'crawl'),
+('匍', 'lie prostrate'),
+('匏', 'gourd'),
+('匏', 'musical instrument'),
+('匐', 'crawl'),
+('匐', 'fall prostrate'),
+('匕', 'dagger'),
+('匕', 'dirk'),
+('匕', 'knife'),
+('匕', 'ladle'),
+('匕', 'spoon'),
+('化', '-ize'),
+('化', 'be'),
+('化', 'become'),
+('化', 'change'),
+('化', 'convert'),
+('化', 'reform'),
+('北', 'escape'),
+('北', 'flee'),
+('北', 'north'),
+('北', 'northern'),
+('北', 'northward'),
+('匘', 'the brain'),
+('匙', 'spoon'),
+('匙', 'surname'),
+('匚', 'KangXi radical 22'),
+('匚', 'box'),
+('匜', 'basin'),
+('匜', 'container for wine'),
+('匝', 'encircle'),
+('匝', 'full circle'),
+('匟', 'divan for two persons'),
+('匠', 'artisan'),
+('匠', 'craftsman'),
+('匠', 'workman'),
+('匡', 'correct'),
+('匡', 'restore'),
+('匡', 'revise'),
+('匣', 'case'),
+('匣', 'coffer'),
+('匣', 'small box'),
+('匧', 'a portfolio'),
+('匧', 'a trunk'),
+('匧', 'portfolio'),
+('匧', 'trunk'),
+('匪', 'bandits'),
+('匪', 'gangsters'),
+('匪', 'robbers'),
+('匭', 'casket'),
+('匭', 'chest'),
+('匭', 'small box'),
+('匯', '(same as  滙) to remit money'),
+('匯', 'a concourse'),
+('匯', 'gather together'),
+('匯', 'to flow together'),
+('匱', 'to lack'),
+('匳', 'ladies toilet case with mirror'),
+('匵', 'case'),
+('匵', 'casket'),
+('匸', 'KangXi radical 23'),
+('匸', 'box'),
+('匸', 'hide'),
+('匹', 'bolt of cloth'),
+('匹', 'counter for horses'),
+('区', 'area'),
+('区', 'district'),
+('区', 'region'),
+('区', 'ward'),
+('医', 'bow'),
+('医', 'crossbow'),
+('医', 'cure'),
+('医', 'doctor'),
+('医', 'heal'),
+('医', 'medical'),
+('医', 'quiver'),
+('医', 'storing'),
+('医', 'tool'),
+('匽', 'fall down'),
+('匽', 'latrine'),
+('匽', 'lay down'),
+('匽', 'rest'),
+('匽', 'to bend'),
+('匽', 'to hide'),
+('匽', 'to repress'),
+('匽', 'to secrete'),
+('匾', 'flat'),
+('匾', 'round split-bamboo contain'),
+('匿', 'go into hiding'),
+('匿', 'hide'),
+('區', 'area'),
+('區', 'district'),
+('區', 'region'),
+('區', 'surname'),
+('區', 'ward'),
+('十', 'complete'),
+('十', 'perfect'),
+('十', 'ten'),
+('十', 'tenth'),
+('十', 'whole'),
+('卂', 'to fly rapidly'),
+('千', '(Cant.) a cheater'),
+('千', 'many'),
+('千', 'numerous'),
+('千', 'swindler'),
+('千', 'thousand'),
+('千', 'very'),
+('卄', 'twentieth'),
+('卄', 'twenty'),
+('卅', 'thirtieth'),
+('卅', 'thirty'),
+('卆', 'at last'),
+('卆', 'finally'),
+('卆', 'servant'),
+('卆', 'soldier'),
+('升', 'L'),
+('升', 'about'),
+('升', 'advance'),
+('升', 'arise'),
+('升', 'equivalent'),
+('升', 'go up'),
+('升', 'hoist'),
+('升', 'unit'),
+('升', 'volume'),
+('升', '되'),
+('午', '7th terrestrial branch'),
+('午', 'daytime'),
+('午', 'noon'),
+('卉', 'general term for plants'),
+('卉', 'myriads'),
+('半', 'half'),
+('卋', 'era'),
+('卋', 'generation'),
+('卋', 'same as 世'),
+('卋', 'world'),
+('卌', '40'),
+('卌', 'fortieth'),
+('卌', 'forty'),
+('卍', 'swastika fourth of auspicious'),
+('卐', 'swastika'),
+('卐', 'swastika fourth of auspicious'),
+('卑', 'despise'),
+('卑', 'humble'),
+('卑', 'inferior'),
+('卑', 'low'),
+('卒', 'at last'),
+('卒', 'die'),
+('卒', 'finally'),
+('卒', 'finish'),
+('卒', 'pass away'),
+('卒', 'servant'),
+('卒', 'soldier'),
+('卓', 'brilliant'),
+('卓', 'desk'),
+('卓', 'high'),
+('卓', 'lofty'),
+('卓', 'profound'),
+('卓', 'table'),
+('協', 'be united'),
+('協', 'cooperate'),
+('单', 'individual'),
+('单', 'lone'),
+('单', 'only'),
+('单', 'single'),
+('南', 'South'),
+('南', 'Southern part'),
+('南', 'Southward'),
+('南', 'south'),
+('南', 'southern'),
+('南', '나무'),
+('単', 'individual'),
+('単', 'lone'),
+('単', 'only'),
+('単', 'same as 單'),
+('単', 'single'),
+('博', 'broad'),
+('博', 'gamble'),
+('博', 'play games'),
+('博', 'wide'),
+('卜', 'divine'),
+('卜', 'fortune telling'),
+('卜', 'prophesy'),
+('卝', 'hair style'),
+('卝', 'ore'),
+('卞', 'excitable'),
+('卞', 'in a hurry'),
+('卞', 'to be impatient'),
+('卟', 'a chemical compound'),
+('卟', 'divination'),
+('卟', 'to consider'),
+('占', 'divine'),
+('占', 'hold'),
+('占', 'observe'),
+('占', 'occupy'),
+('占', 'versify'),
+('卡', 'calorie'),
+('卡', 'card'),
+('卡', 'punch card'),
+('卣', 'China'),
+('卣', 'ancient'),
+('卣', 'vessel'),
+('卣', 'wine'),
+('卣', 'wine pot'),
+('卦', 'fortune telling'),
+('卦', 'tell fortunes'),
+('卩', 'KangXi radical 26'),
+('卩', 'authorization'),
+('卩', 'military'),
+('卩', 'seal'),
+('卩', 'seals'),
+('卬', 'I'),
+('卬', 'high'),
+('卬', 'high-priced'),
+('卬', 'lofty'),
+('卬', 'oneself'),
+('卬', 'raise'),
+('卭', 'high. to raise'),
+('卮', 'measuring cup'),
+('卮', 'wine container'),
+('卯', '4th terrestrial branch'),
+('卯', 'Earthly Branch'),
+('卯', 'fourth'),
+('卯', 'period from 5-7 a.m.'),
+('卯', 'rabbit'),
+('印', 'chop'),
+('印', 'mark'),
+('印', 'print'),
+('印', 'seal'),
+('印', 'stamp'),
+('危', 'dangerous'),
+('危', 'high'),
+('危', 'precarious'),
+('卲', 'beautiful'),
+('卲', 'eminent'),
+('卲', 'lofty'),
+('卲', 'surname'),
+('即', 'immediately'),
+('即', 'in other words'),
+('即', 'promptly'),
+('即', 'quickly'),
+('却', 'but'),
+('却', 'decline'),
+('却', 'retreat'),
+('却', 'still'),
+('卵', 'egg'),
+('卵', 'ovum'),
+('卵', 'roe'),
+('卵', 'spawn'),
+('卷', 'curl'),
+('卷', 'make a comeback'),
+('卷', 'scroll'),
+('卸', 'lay down'),
+('卸', 'retire from office'),
+('卹', 'comfort'),
+('卹', 'pity'),
+('卹', 'sympathy'),
+('卺', '(nuptial) winecups'),
+('卻', 'but'),
+('卻', 'decline'),
+('卻', 'retreat'),
+('卻', 'still'),
+('卼', 'dangerous'),
+('卼', 'unsteady'),
+('卽', 'ascend'),
+('卽', 'immediate'),
+('卽', 'in other words'),
+('卽', 'promptly'),
+('卿', 'high officer'),
+('卿', 'noble'),
+('厁', 'placename'),
+('厂', 'factory'),
+('厂', 'radical 27'),
+('厂', 'workshop'),
+('厃', 'to look upward'),
+('厄', 'adversity'),
+('厄', 'difficulty'),
+('厄', 'distress'),
+('厉', 'grind'),
+('厉', 'sharpen'),
+('厉', 'whet'),
+('厉', 'whetstone'),
+('压', 'crush'),
+('压', 'oppress'),
+('压', 'press'),
+('压', 'pressure'),
+('厎', 'settle'),
+('厎', 'whetstone'),
+('厓', 'bank'),
+('厓', 'boundary'),
+('厓', 'cliff'),
+('厓', 'edge'),
+('厓', 'hill'),
+('厓', 'precipice'),
+('厓', 'shore'),
+('厓', 'surname'),
+('厔', 'hinder'),
+('厔', 'place near water'),
+('厔', 'stop'),
+('厖', 'bulky'),
+('厖', 'confused'),
+('厖', 'thick and large'),
+('厘', 'thousandth part of tael'),
+('厚', 'greatly'),
+('厚', 'substantial'),
+('厚', 'thick'),
+('厝', 'a grave or tombstone'),
+('厝', 'cut or engrave'),
+('原', 'beginning'),
+('原', 'meadow'),
+('原', 'origin'),
+('原', 'source'),
+('厠', 'lavatory'),
+('厠', 'mingle with'),
+('厠', 'toilet'),
+('厤', 'calculation'),
+('厤', 'the calendar'),
+('厤', 'to calculate'),
+('厥', 'barbarian'),
+('厥', 'country'),
+('厥', 'he'),
+('厥', 'it'),
+('厥', 'names'),
+('厥', 'personal pronoun he'),
+('厥', 'place'),
+('厥', 'she'),
+('厥', 'they'),
+('厥', 'tribe'),
+('厥', '國'),
+('厥', '突'),
+('厥', '蕃'),
+('厥', '藩'),
+('厥', '돌굴'),
+('厥', '돌궐'),
+('厥', '번국'),
+('厦', 'big building'),
+('厦', 'mansion'),
+('厨', 'closet'),
+('厨', 'cupboard'),
+('厨', 'kitchen'),
+('厩', 'barnyard'),
+('厩', 'stable'),
+('厪', 'a hut'),
+('厪', 'careful'),
+('厭', 'detest'),
+('厭', 'dislike'),
+('厭', 'reject'),
+('厭', 'satiate'),
+('厮', 'servant'),
+('厮', 'to make a disturbance'),
+('厲', 'grind'),
+('厲', 'sharpen'),
+('厲', 'whet'),
+('厲', 'whetstone'),
+('厳', 'rigid'),
+('厳', 'rigorous'),
+('厳', 'stern'),
+('厳', 'strict'),
+('厴', 'shells'),
+('厵', 'a spring'),
+('厵', 'source'),
+('厶', 'KangXi radical 28'),
+('厶', 'private'),
+('厶', 'secret'),
+('厷', 'most Chinese-English dictionaries give the upper-arm'),
+('厷', 'round'),
+('厷', 'the fore-arm'),
+('厹', 'spear'),
+('厹', 'tribe'),
+('厺', 'depart'),
+('厺', 'to go'),
+('去', 'depart'),
+('去', 'go away'),
+('去', 'leave'),
+('厼', 'Kwukyel'),
+('厼', 'kwukyel'),
+('厼', '너'),
+('厼', '며'),
+('厼', '이'),
+('叀', 'only'),
+('叀', 'wholly'),
+('叁', 'bank form of numeral three'),
+('参', 'ginseng'),
+('参', 'intervene'),
+('参', 'take part in'),
+('參', 'Chinese'),
+('參', 'astronomy'),
+('參', 'ginseng'),
+('參', 'intervene'),
+('參', 'jagged'),
+('參', 'join'),
+('參', 'participate'),
+('參', 'take part in'),
+('參', 'three'),
+('參', 'uneven'),
+('叄', 'ginseng'),
+('叄', 'intervene'),
+('叄', 'take part in'),
+('叄', 'three'),
+('叅', 'participate'),
+('叅', 'to consult together'),
+('叅', 'to counel'),
+('叅', 'to intervene'),
+('叅', 'to take part in'),
+('又', 'again'),
+('又', 'also'),
+('又', 'and'),
+('又', 'in addition'),
+('叉', 'cross'),
+('叉', 'crotch'),
+('叉', 'fork'),
+('叉', 'intersect'),
+('叉', 'prong'),
+('及', 'and'),
+('及', 'come up to'),
+('及', 'extend'),
+('及', 'reach'),
+('友', 'companion'),
+('友', 'fraternity'),
+('友', 'friend'),
+('双', 'both'),
+('双', 'couple'),
+('双', 'pair'),
+('双', 'set of two'),
+('反', 'anti'),
+('反', 'contrary'),
+('反', 'flip over'),
+('反', 'opposite'),
+('反', 'reverse'),
+('反', 'sell'),
+('叒', 'obedient'),
+('叒', 'united'),
+('叓', 'affair'),
+('叓', 'matter'),
+('叓', 'work'),
+('叔', 'fathers younger brother'),
+('叔', 'uncle'),
+('叕', 'file'),
+('叕', 'put together'),
+('取', 'obtain'),
+('取', 'receive'),
+('取', 'select'),
+('取', 'take'),
+('受', 'accept'),
+('受', 'bear'),
+('受', 'get'),
+('受', 'receive'),
+('受', 'stand'),
+('变', 'alter'),
+('变', 'change'),
+('变', 'rebel'),
+('变', 'transform'),
+('叙', 'express'),
+('叙', 'narrate'),
+('叙', 'relate'),
+('叙', 'state'),
+('叚', 'false'),
+('叛', 'rebel'),
+('叛', 'rebellion'),
+('叛', 'rebellious'),
+('叟', 'elder'),
+('叟', 'old man'),
+('叡', 'astute'),
+('叡', 'profound'),
+('叡', 'shrewd'),
+('叢', 'bush'),
+('叢', 'collection'),
+('叢', 'shrub'),
+('叢', 'thicket'),
+('口', 'entrance'),
+('口', 'gate'),
+('口', 'hole'),
+('口', 'mouth'),
+('口', 'open end'),
+('口', 'opening'),
+('古', 'ancient'),
+('古', 'classic'),
+('古', 'old'),
+('句', 'phrase'),
+('句', 'sentence'),
+('另', 'another'),
+('另', 'other'),
+('另', 'separate'),
+('叨', 'quarrelous'),
+('叨', 'talkative'),
+('叩', 'ask'),
+('叩', 'bow'),
+('叩', 'knock'),
+('叩', 'kowtow'),
+('只', 'just'),
+('只', 'only'),
+('只', 'simply'),
+('叫', 'call'),
+('叫', 'cry'),
+('叫', 'greet'),
+('叫', 'hail'),
+('叫', 'shout'),
+('召', 'imperial decree'),
+('召', 'summon'),
+('叭', 'trumpet'),
+('叮', 'exhort or enjoin repeatedly'),
+('可', '-able'),
+('可', 'allowed'),
+('可', 'barbarian'),
+('可', 'can'),
+('可', 'may'),
+('可', 'possible'),
+('可', 'possibly'),
+('台', 'platform'),
+('台', 'term of address'),
+('台', 'unit'),
+('叱', 'bawl out'),
+('叱', 'scold'),
+('叱', 'shout at'),
+('史', 'annals'),
+('史', 'chronicle'),
+('史', 'history'),
+('右', 'aid'),
+('右', 'assist'),
+('右', 'direction'),
+('右', 'hand'),
+('右', 'help'),
+('右', 'right'),
+('右', 'right-wing'),
+('右', 'west'),
+('叴', 'a three-edged spear'),
+('叵', 'be unable do'),
+('叵', 'cannot'),
+('叵', 'improbable'),
+('叵', 'thereupon'),
+('叶', '(borrowed for) leaf'),
+('叶', 'to harmonize'),
+('叶', 'to rhyme'),
+('叶', 'to unite'),
+('号', 'mark'),
+('号', 'name'),
+('号', 'number'),
+('号', 'sign'),
+('号', 'symbol'),
+('司', 'control'),
+('司', 'manage'),
+('司', 'officer'),
+('司', 'take charge of'),
+('叺', 'a straw bag'),
+('叺', 'a tobacco pouch'),
+('叺', 'bag'),
+('叺', 'pouch'),
+('叺', 'straw'),
+('叺', 'tobacco'),
+('吁', 'interjection Alas!'),
+('吁', 'to sigh'),
+('吃', 'bear'),
+('吃', 'drink'),
+('吃', 'eat'),
+('吃', 'endure'),
+('吃', 'suffer'),
+('各', 'all'),
+('各', 'each'),
+('各', 'every'),
+('各', 'individually'),
+('吆', 'bawl'),
+('吆', 'cry out'),
+('吆', 'shout'),
+('吆', 'yell'),
+('合', 'combine'),
+('合', 'conjunction, synthesis ; combined'),
+('合', 'gather'),
+('合', 'join'),
+('合', 'unite'),
+('吉', 'good'),
+('吉', 'luck'),
+('吉', 'lucky'),
+('吉', 'propitious'),
+('吊', 'condole'),
+('吊', 'hang'),
+('吊', 'mourn'),
+('吊', 'pity'),
+('吋', 'inch'),
+('同', 'identical'),
+('同', 'same'),
+('同', 'similar'),
+('同', 'the same'),
+('同', 'together with'),
+('名', 'famous'),
+('名', 'great'),
+('名', 'name'),
+('名', 'noted'),
+('名', 'position'),
+('名', 'rank'),
+('名', 'title'),
+('后', 'empress'),
+('后', 'monarch'),
+('后', 'queen'),
+('后', 'ruler'),
+('后', 'sovereign'),
+('吏', 'government'),
+('吏', 'government official'),
+('吏', 'magistrate'),
+('吏', 'official'),
+('吐', 'Kwukyel'),
+('吐', 'cough up'),
+('吐', 'spew out'),
+('吐', 'vomit'),
+('吐', '토'),
+('向', 'direction'),
+('向', 'facing'),
+('向', 'surname'),
+('向', 'toward'),
+('向', 'trend'),
+('吒', 'bellow'),
+('吒', 'roar'),
+('吒', 'scold'),
+('吒', 'shout'),
+('吕', 'a musical note'),
+('吕', 'surname'),
+('吚', 'used to represent sound'),
+('君', 'chief'),
+('君', 'monarch'),
+('君', 'prince'),
+('君', 'ruler'),
+('君', 'sir'),
+('君', 'sovereign'),
+('君', 'young'),
+('君', 'young man'),
+('吝', 'miserly'),
+('吝', 'parsimonious'),
+('吝', 'stingy'),
+('吞', 'absorb'),
+('吞', 'annex'),
+('吞', 'engulf'),
+('吞', 'swallow'),
+('吟', 'hum'),
+('吟', 'recite'),
+('吟', 'sing'),
+('吟', 'type of poetry'),
+('吠', 'bark'),
+('吡', 'blame'),
+('吢', 'vomiting of a dog'),
+('否', 'block'),
+('否', 'final particle'),
+('否', 'negative'),
+('否', 'no'),
+('否', 'not'),
+('否', 'obstruct'),
+('吧', 'emphatic final particle'),
+('吨', '(Cant.) to babble'),
+('吨', 'gibberish'),
+('吨', 'metric ton'),
+('吩', 'command'),
+('吩', 'instruct'),
+('吩', 'order'),
+('吪', 'move'),
+('含', 'cherish'),
+('含', 'contain'),
+('含', 'hold in mouth'),
+('听', 'comply'),
+('听', 'hear'),
+('听', 'obey'),
+('听', 'understand'),
+('吭', 'throat'),
+('吮', 'lick'),
+('吮', 'sip'),
+('吮', 'suck with mouth'),
+('启', 'begin'),
+('启', 'commence'),
+('启', 'explain'),
+('启', 'open'),
+('吱', 'chirping'),
+('吱', 'hissing'),
+('吱', 'squeaking'),
+('吲', 'smile at'),
+('吲', 'sneer at'),
+('吳', 'one of warring states'),
+('吳', 'surname'),
+('吴', 'name of warring state'),
+('吴', 'surname'),
+('吵', 'annoy'),
+('吵', 'argue'),
+('吵', 'dispute'),
+('吵', 'disturb'),
+('吶', 'raise voice'),
+('吶', 'shout'),
+('吶', 'stammer'),
+('吶', 'yell out loud'),
+('吸', 'absorb'),
+('吸', 'attract'),
+('吸', 'drink'),
+('吸', 'in'),
+('吸', 'inhale'),
+('吸', 'suck'),
+('吸', 'suck in'),
+('吹', 'blow'),
+('吹', 'boast'),
+('吹', 'brag'),
+('吹', 'puff'),
+('吻', 'coinciding'),
+('吻', 'kiss'),
+('吻', 'the lips'),
+('吼', 'bark'),
+('吼', 'howl'),
+('吼', 'roar'),
+('吼', 'shout'),
+('吽', '(Cant.) dull'),
+('吽', 'OM'),
+('吽', 'bellow'),
+('吽', 'stupid'),
+('吾', 'i'),
+('吾', 'impede'),
+('吾', 'my'),
+('吾', 'our'),
+('吾', 'resist'),
+('吿', 'accuse'),
+('吿', 'announce'),
+('吿', 'inform'),
+('吿', 'tell'),
+('呀', '(Cant.) slurred form of the number ten'),
+('呀', 'particle used to express surprise or mild emphasis'),
+('呂', 'a musical note'),
+('呂', 'surname'),
+('呃', 'belch'),
+('呃', 'hiccup'),
+('呅', '(Cant.) a dollar'),
+('呆', 'dull'),
+('呆', 'dull-minded'),
+('呆', 'simple'),
+('呆', 'stupid'),
+('呈', 'appear'),
+('呈', 'petition'),
+('呈', 'show'),
+('呈', 'submit'),
+('呉', 'one of warring states'),
+('呉', 'surname'),
+('告', 'accuse'),
+('告', 'announce'),
+('告', 'asking'),
+('告', 'inform'),
+('告', 'report'),
+('告', 'tell'),
+('呌', 'to call'),
+('呌', 'to summon'),
+('呎', 'foot'),
+('呏', 'gallon'),
+('呏', 'quart'),
+('呐', 'raise voice'),
+('呐', 'shout'),
+('呐', 'stammer'),
+('呐', 'yell out loud'),
+('呑', 'absorb'),
+('呑', 'swallow'),
+('呟', 'grumble'),
+('呟', 'murmur'),
+('呟', 'to mutter'),
+('呢', '(Cant.) this'),
+('呢', 'interrogative or emphatic final'),
+('呦', 'the bleating of the deer'),
+('呧', 'slander'),
+('呧', 'to rebuke'),
+('呧', 'to scold'),
+('周', 'Zhou dynasty'),
+('周', 'circumference'),
+('呪', 'charm'),
+('呪', 'curse'),
+('呪', 'damn'),
+('呪', 'incantation'),
+('呫', 'chatter'),
+('呫', 'lick'),
+('呫', 'murmur'),
+('呫', 'petty'),
+('呫', 'taste'),
+('呫', 'whisper'),
+('呬', 'to rest'),
+('呭', 'final particle expressing consent'),
+('呭', 'talkative'),
+('呮', '(Cant.) only'),
+('呮', 'merely'),
+('呮', 'to sit'),
+('呱', 'crying of child'),
+('呱', 'swear at'),
+('呱', 'wail'),
+('味', 'delicacy'),
+('味', 'odor'),
+('味', 'smell'),
+('味', 'taste'),
+('呴', 'breathe on'),
+('呴', 'breathe out'),
+('呴', 'roar'),
+('呴', 'yawn'),
+('呵', 'laughing sound'),
+('呵', 'scold'),
+('呵', 'yawn'),
+('呶', 'clamour'),
+('呶', 'hubbub'),
+('呶', 'talkative'),
+('呷', 'drink'),
+('呷', 'suck'),
+('呷', 'swallow'),
+('呸', 'expression of reprimand'),
+('呹', '(of animals) to eat grass'),
+('呺', 'spacious'),
+('呺', 'voice of anger vast'),
+('呻', 'groan'),
+('呻', 'moan'),
+('呻', 'recite with intonation'),
+('呼', 'breathe'),
+('呼', 'breathe sigh'),
+('呼', 'call'),
+('呼', 'exhale'),
+('呼', 'out'),
+('呼', 'shout'),
+('命', 'an order'),
+('命', 'destiny'),
+('命', 'fate'),
+('命', 'instruction'),
+('命', 'life'),
+('命', 'luck'),
+('呿', 'to yawn'),
+('咀', 'chew'),
+('咀', 'masticate'),
+('咀', 'suck'),
+('咂', 'to smack the lips'),
+('咂', 'to suck'),
+('咄', 'cry out in anger'),
+('咄', 'noise of rage'),
+('咆', 'roar'),
+('咇', '(Cant.) to eject'),
+('咇', 'fragrant'),
+('咈', 'oppose'),
+('咉', 'a sound to vomit'),
+('咉', 'an echo'),
+('咉', 'as an infant'),
+('咊', 'conciliation'),
+('咊', 'harmony'),
+('咊', 'kindly'),
+('咊', 'mild'),
+('咊', 'peace'),
+('咊', 'to be on good terms with'),
+('咋', 'loud'),
+('咋', 'question-forming particle'),
+('咋', 'to bite'),
+('咋', 'why? how? what?'),
+('和', 'calm'),
+('和', 'harmony'),
+('和', 'peace'),
+('和', 'peaceful'),
+('咍', 'laugh'),
+('咎', 'defect'),
+('咎', 'error'),
+('咎', 'fault'),
+('咎', 'mistake'),
+('咏', 'chant'),
+('咏', 'hum'),
+('咏', 'sing song or poem'),
+('咐', 'instruct'),
+('咐', 'order'),
+('咒', 'curse'),
+('咒', 'damn'),
+('咒', 'incantation'),
+('咕', 'mumble'),
+('咕', 'murmur'),
+('咕', 'mutter'),
+('咕', 'rumble'),
+('咖', 'a phonetic'),
+('咖', 'coffee'),
+('咜', 'to scold'),
+('咠', 'to whisper. to blame to slander'),
+('咡', 'side of mouth'),
+('咢', 'drumming'),
+('咢', 'sound'),
+('咤', 'bellow'),
+('咤', 'roar'),
+('咤', 'scold'),
+('咤', 'shout at'),
+('咥', 'bite'),
+('咥', 'laugh'),
+('咥', 'sound of cat'),
+('咦', 'expression of surprise'),
+('咧', 'grimace'),
+('咧', 'grin'),
+('咧', 'stretch mouth'),
+('咨', 'consult'),
+('咨', 'discuss'),
+('咨', 'inquire'),
+('咨', 'plan'),
+('咩', '(Cant.) an interrogative particle'),
+('咩', 'the bleating of sheep'),
+('咪', '(Cant.) dont!'),
+('咪', 'cats meow'),
+('咪', 'meter'),
+('咪', 'sound of cat'),
+('咫', 'foot measure of Zhou dynasty'),
+('咬', 'bite'),
+('咬', 'gnaw'),
+('咭', '(Cant.) to guard(from Engl. guard)'),
+('咭', 'a card(from Engl. card)'),
+('咭', 'young and pretty(from Engl. kid)'),
+('咮', 'a beak'),
+('咮', 'to peck'),
+('咯', 'final particle'),
+('咱', 'us'),
+('咲', 'giggle'),
+('咲', 'laugh'),
+('咲', 'smile'),
+('咲', 'snicker'),
+('咳', 'cough'),
+('咷', 'cry loudly'),
+('咷', 'howl'),
+('咸', 'all'),
+('咸', 'completely'),
+('咸', 'together'),
+('咸', 'united'),
+('咺', 'majestic'),
+('咻', 'shout'),
+('咼', 'chat'),
+('咼', 'gossip'),
+('咼', 'jaw'),
+('咼', 'mouth'),
+('咼', 'talk'),
+('咽', 'choked'),
+('咽', 'pharynx'),
+('咽', 'smothered'),
+('咽', 'throat'),
+('咿', 'descriptive of creaking'),
+('咿', 'laugh'),
+('哀', 'grief'),
+('哀', 'mournful'),
+('哀', 'pitiful'),
+('哀', 'pity'),
+('哀', 'sad'),
+('哀', 'sorrow'),
+('品', 'article'),
+('品', 'character'),
+('品', 'commodity'),
+('品', 'goods'),
+('品', 'personality'),
+('品', 'product'),
+('品', 'quality'),
+('哂', '(Cant.) a final particle indicating doing something to the full extent possible'),
+('哂', 'laugh at'),
+('哂', 'smile'),
+('哂', 'sneer at'),
+('哄', 'beguile'),
+('哄', 'cheat'),
+('哄', 'coax'),
+('哄', 'deceive'),
+('哆', 'quiver'),
+('哆', 'shiver'),
+('哆', 'shudder'),
+('哆', 'tremble'),
+('哇', 'cry of an infant'),
+('哇', 'vomit'),
+('哈', 'sound of laughter'),
+('哉', 'final exclamatory particle'),
+('响', 'make noise'),
+('响', 'make sound'),
+('响', 'sound'),
+('哎', 'interjection of surprise'),
+('員', 'employee'),
+('員', 'member'),
+('員', 'person'),
+('員', 'personnel'),
+('員', 'staff member'),
+('哢', 'syllable'),
+('哤', 'jargon'),
+('哥', 'elder brother'),
+('哦', 'oh? really? is that so?'),
+('哨', 'blow whistle'),
+('哨', 'chirp'),
+('哨', 'whistle'),
+('哩', 'mile'),
+('哪', 'which? where? how?'),
+('哫', 'to cajole'),
+('哭', 'cry'),
+('哭', 'wail'),
+('哭', 'weep'),
+('哮', 'cough'),
+('哮', 'pant'),
+('哮', 'roar'),
+('哰', 'incoherent chatter'),
+('哲', 'sagacious'),
+('哲', 'sage'),
+('哲', 'wise'),
+('哲', 'wise man'),
+('哶', 'bleat'),
+('哺', 'chew food'),
+('哺', 'feed'),
+('哼', 'groan'),
+('哼', 'hum'),
+('哼', 'moan'),
+('哼', 'sing softly'),
+('哽', 'choke(with grief)'),
+('哿', 'excellent'),
+('哿', 'to commend to be able to'),
+('唁', 'express condolence'),
+('唄', 'Buddhism'),
+('唄', 'final particle of assertion pathaka'),
+('唄', 'scriptures'),
+('唅', '(Cant.) to grunt'),
+('唅', 'a sound'),
+('唅', 'grumble'),
+('唅', 'to put in the mouth'),
+('唆', 'incite'),
+('唆', 'instigate'),
+('唆', 'make mischief'),
+('唇', 'lips'),
+('唈', 'to sob'),
+('唉', 'alas'),
+('唉', 'answer'),
+('唉', 'ask'),
+('唉', 'exclamation of surprise or pain'),
+('唊', '(Cant.) to hold fast'),
+('唊', 'press'),
+('唎', 'final particle'),
+('唎', 'noise'),
+('唎', 'sound'),
+('唏', 'grieve'),
+('唏', 'weep or sob'),
+('唐', 'Chinese'),
+('唐', 'Tang dynasty'),
+('唔', 'bite'),
+('唔', 'hold in mouth'),
+('唖', 'become hoarse'),
+('唖', 'dumb'),
+('唖', 'mute'),
+('唚', 'to use bad language'),
+('唚', 'vomiting of animals'),
+('唟', 'place name'),
+('唤', 'call'),
+('唪', 'to intone or chant'),
+('唪', 'to recite'),
+('唫', 'etc. to close'),
+('唫', 'to hum'),
+('唫', 'to intone'),
+('唫', 'to shut'),
+('唬', 'to intimidate'),
+('唬', 'to scare'),
+('售', 'sell'),
+('唯', 'only'),
+('唯', 'yes'),
+('唱', 'call'),
+('唱', 'chant'),
+('唱', 'ditty'),
+('唱', 'sing'),
+('唱', 'song'),
+('唲', 'forced laughter'),
+('唳', 'cry'),
+('唳', 'cry of bird'),
+('唵', 'to eat with the hand'),
+('唵', 'used in Buddhist texts to transliterate non-Chinese sounds'),
+('唶', 'groan'),
+('唶', 'loud laughter'),
+('唶', 'sigh'),
+('唷', 'final particle'),
+('唸', 'chant'),
+('唸', 'read'),
+('唸', 'recite'),
+('唹', 'to smile at'),
+('唼', 'speaking evil. gobbling sound made by ducks'),
+('唾', 'saliva'),
+('唾', 'spit'),
+('唾', 'spit on'),
+('唿', '(Cant.) a bit'),
+('唿', 'part'),
+('唿', 'sad'),
+('啀', '(Cant.) to shout'),
+('啀', 'gnaw'),
+('啀', 'scold'),
+('啀', 'yell'),
+('啁', 'chirp'),
+('啁', 'twitter'),
+('啁', 'twittering'),
+('啂', 'sack'),
+('啃', 'bite'),
+('啃', 'chew'),
+('啃', 'gnaw'),
+('啄', '(Cant.) to slander'),
+('啄', 'to peck'),
+('商', 'business'),
+('商', 'commerce'),
+('商', 'trade'),
+('啇', 'base'),
+('啇', 'root'),
+('啇', 'the base'),
+('啇', 'the foot'),
+('啇', 'the stem'),
+('啇', 'to stalk'),
+('啉', 'slow'),
+('啉', 'stupid'),
+('啊', 'exclamatory particle'),
+('啊', 'love'),
+('啋', '(Cant.) an interjection used to berate someone'),
+('啍', '(Cant.) to babble'),
+('啍', 'creak'),
+('啍', 'gibberish'),
+('啎', 'disobedient'),
+('啎', 'intractable'),
+('啎', 'obstinate'),
+('問', 'ask'),
+('問', 'ask(about)'),
+('問', 'inquire after'),
+('問', 'question'),
+('啐', 'the sound of sipping'),
+('啐', 'to sip'),
+('啐', 'to spit'),
+('啐', 'to surprise'),
+('啐', 'to taste'),
+('啓', 'begin'),
+('啓', 'commence'),
+('啓', 'explain'),
+('啓', 'open'),
+('啕', 'wail'),
+('啖', 'bite'),
+('啖', 'chew'),
+('啖', 'eat'),
+('啖', 'entice'),
+('啖', 'feed'),
+('啗', 'bite'),
+('啗', 'chew'),
+('啗', 'eat'),
+('啗', 'entice'),
+('啗', 'lure'),
+('啙', 'poor'),
+('啚', 'cheap'),
+('啚', 'low'),
+('啚', 'mean'),
+('啜', 'sip'),
+('啜', 'sob'),
+('啜', 'suck up'),
+('啜', 'weep'),
+('啝', '(Cant.) final partical expressing surprise'),
+('啞', 'become hoarse'),
+('啞', 'dumb'),
+('啞', 'mute'),
+('啟', 'begin'),
+('啟', 'open'),
+('啡', 'coffee'),
+('啡', 'morphine'),
+('啣', 'cherish'),
+('啣', 'harbor'),
+('啣', 'hold in mouth'),
+('啻', 'just like'),
+('啻', 'merely'),
+('啻', 'only'),
+('啻', 'stop at'),
+('啼', 'howl'),
+('啼', 'twitter'),
+('啼', 'weep'),
+('啼', 'whimper'),
+('啽', '(Cant.) to speak'),
+('啾', 'chirp'),
+('啾', 'wailing of child'),
+('喀', 'used in transliterations'),
+('喀', 'vomit'),
+('喁', 'crouch'),
+('喁', 'gasping for breath'),
+('喁', 'quiver'),
+('喁', 'the mouth of a fish at the surface of the water'),
+('喃', 'chattering'),
+('喃', 'keep talking'),
+('喃', 'mumble'),
+('善', 'charitable'),
+('善', 'good'),
+('善', 'kind'),
+('善', 'nice'),
+('善', 'virtuous'),
+('喆', 'a sage'),
+('喆', 'sagacious'),
+('喆', 'wise'),
+('喇', 'bugle'),
+('喇', 'final particle'),
+('喇', 'horn'),
+('喇', 'lama'),
+('喈', 'melody'),
+('喈', 'music'),
+('喉', 'gullet'),
+('喉', 'guttural'),
+('喉', 'larynx'),
+('喉', 'throat'),
+('喊', 'call out'),
+('喊', 'cry'),
+('喊', 'howl'),
+('喊', 'shout'),
+('喊', 'yell'),
+('喋', 'babble'),
+('喋', 'chatter'),
+('喋', 'nag'),
+('喋', 'twitter'),
+('喌', 'syllable'),
+('喏', 'respectful reply of assent to superiors'),
+('喑', 'the sobbing of infants'),
+('喑', 'to be dumb'),
+('喒', 'I'),
+('喒', 'a dual pronoun'),
+('喒', 'we two'),
+('喒', 'you and me'),
+('喓', '(Cant.) to call out'),
+('喓', 'buzzing'),
+('喓', 'chirping'),
+('喔', 'descriptive of crying or of crowing'),
+('喘', 'breathe heavily'),
+('喘', 'gasp'),
+('喘', 'pant'),
+('喙', 'beak'),
+('喙', 'bill'),
+('喙', 'pant'),
+('喙', 'snout'),
+('喚', 'be called'),
+('喚', 'call'),
+('喚', 'invite'),
+('喚', 'summon'),
+('喜', 'enjoy'),
+('喜', 'enjoyment'),
+('喜', 'happiness'),
+('喜', 'joyful thing'),
+('喜', 'like'),
+('喜', 'love'),
+('喝', 'call out'),
+('喝', 'drink'),
+('喝', 'shout'),
+('喞', 'chirping of insects'),
+('喞', 'pump'),
+('喟', 'heave sigh'),
+('喟', 'sigh'),
+('喣', 'to breathe upon'),
+('喤', 'ah'),
+('喤', 'harmony'),
+('喦', 'talkative'),
+('喧', 'clamor'),
+('喧', 'lively'),
+('喧', 'noisy'),
+('喧', 'talk loudly'),
+('喨', 'cry'),
+('喨', 'neigh'),
+('喨', 'wail'),
+('喨', 'yell'),
+('喩', 'metaphor'),
+('喪', 'funeral'),
+('喪', 'mourn'),
+('喪', 'mourning'),
+('喫', 'bear'),
+('喫', 'drink'),
+('喫', 'eat'),
+('喫', 'endure'),
+('喫', 'suffer'),
+('喬', 'lofty'),
+('喬', 'proud'),
+('喬', 'stately'),
+('喬', 'tall'),
+('喭', 'coarse'),
+('喭', 'condole with'),
+('單', 'barbarian'),
+('單', 'individual'),
+('單', 'lone'),
+('單', 'only'),
+('單', 'single'),
+('單', 'solitary'),
+('喰', 'drink'),
+('喰', 'to eat'),
+('喲', 'ah'),
+('喲', 'final particle'),
+('喳', 'whispering'),
+('営', 'barracks'),
+('営', 'encampment'),
+('営', 'manage'),
+('喸', 'place name'),
+('喻', 'analogy'),
+('喻', 'example'),
+('喻', 'like'),
+('喻', 'metaphor'),
+('喿', 'chirping of birds'),
+('嗁', 'give forth sound'),
+('嗁', 'make noise'),
+('嗃', 'to flute'),
+('嗄', 'hoarse of voice'),
+('嗅', 'olfactive'),
+('嗅', 'scent'),
+('嗅', 'smell'),
+('嗅', 'sniff'),
+('嗆', 'choke by smoke'),
+('嗆', 'irritates nose'),
+('嗇', 'constipated'),
+('嗇', 'miserly'),
+('嗇', 'stingy'),
+('嗇', 'stopped'),
+('嗇', 'stopped up'),
+('嗇', 'thrifty'),
+('嗇', 'up'),
+('嗈', 'oh'),
+('嗉', 'birds crop'),
+('嗉', 'wine pot'),
+('嗌', 'choke'),
+('嗌', 'the throat'),
+('嗌', 'to quarrel'),
+('嗎', 'final interrogative particle'),
+('嗐', 'alas!'),
+('嗑', 'eat seeds'),
+('嗑', 'loquacious'),
+('嗑', 'reproach'),
+('嗓', 'throat'),
+('嗓', 'voice'),
+('嗔', 'be angry at'),
+('嗔', 'rebuke'),
+('嗔', 'scold'),
+('嗙', 'boast'),
+('嗚', 'sobbing'),
+('嗚', 'sound of crying'),
+('嗛', 'content'),
+('嗛', 'hold'),
+('嗛', 'humility'),
+('嗛', 'insufficient'),
+('嗛', 'pouch'),
+('嗛', 'regret'),
+('嗜', 'be fond of'),
+('嗜', 'have weakness for'),
+('嗝', 'cackling of fowls to gag'),
+('嗝', 'to vomit'),
+('嗞', 'a despatch'),
+('嗞', 'to consult about'),
+('嗞', 'to plan'),
+('嗞', 'to report in writing to an equal'),
+('嗟', 'alas'),
+('嗟', 'sigh'),
+('嗡', 'airplanes'),
+('嗡', 'sound of flying bees'),
+('嗣', 'descendants'),
+('嗣', 'heirs'),
+('嗣', 'inherit'),
+('嗣', 'to connect'),
+('嗤', 'laugh at'),
+('嗤', 'ridicule'),
+('嗤', 'sneer'),
+('嗤', 'snort'),
+('嗩', 'flute-like musical instrument'),
+('嗭', 'place name'),
+('嗶', 'used in transliterations'),
+('嗷', 'loud clamor'),
+('嗷', 'sound of wailing'),
+('嗸', 'noisy'),
+('嗸', 'same as 嗷'),
+('嗹', 'chatter'),
+('嗻', 'to screen. loquacious'),
+('嗽', 'clear throat'),
+('嗽', 'cough'),
+('嗽', 'gargle'),
+('嗾', 'incite'),
+('嗾', 'instigate'),
+('嗾', 'to set a dog on'),
+('嗿', 'gobble'),
+('嘁', 'ashamed'),
+('嘁', 'to be grieved'),
+('嘁', 'used to imitate sounds'),
+('嘂', 'cry loudly'),
+('嘂', 'scream'),
+('嘂', 'yell'),
+('嘅', '(Cant.) possessive'),
+('嘅', 'sound of sighing'),
+('嘆', 'admire'),
+('嘆', 'sigh'),
+('嘈', 'make'),
+('嘈', 'noise'),
+('嘈', 'noisy'),
+('嘈', 'talk'),
+('嘈', 'voice'),
+('嘉', 'auspicious'),
+('嘉', 'excellent'),
+('嘉', 'joyful'),
+('嘍', 'used in onomatopoetic expressions'),
+('嘎', 'bad'),
+('嘎', 'malevolent'),
+('嘎', 'sound of laughter'),
+('嘏', 'felicity'),
+('嘏', 'large and strong'),
+('嘏', 'prosperity'),
+('嘐', 'final exclamatory particle'),
+('嘑', '(Cant.) final particle'),
+('嘑', 'bawl'),
+('嘑', 'howl'),
+('嘑', 'menace'),
+('嘑', 'to bawl'),
+('嘑', 'to howl at'),
+('嘑', 'to menace'),
+('嘒', 'sharp'),
+('嘓', 'chattering'),
+('嘓', 'gurgling sound'),
+('嘔', 'annoy'),
+('嘔', 'enrage'),
+('嘔', 'to vomit'),
+('嘖', 'interjection of approval or admiration'),
+('嘗', 'experience'),
+('嘗', 'experiment'),
+('嘗', 'taste'),
+('嘘', 'blow out'),
+('嘘', 'deep sigh'),
+('嘘', 'exhale'),
+('嘘', 'hiss'),
+('嘘', 'praise'),
+('嘛', 'final exclamatory particle'),
+('嘞', '(Cant.) final particle used for polite refusal'),
+('嘟', 'sound of horn tooting'),
+('嘠', 'the chirping of birds loud laughter'),
+('嘨', 'howl'),
+('嘨', 'roar'),
+('嘨', 'scream'),
+('嘨', 'whistle'),
+('嘩', 'gush forward'),
+('嘩', 'rushing sound'),
+('嘪', 'goat'),
+('嘪', 'sound'),
+('嘬', 'lap'),
+('嘬', 'suck'),
+('嘬', 'to lap'),
+('嘬', 'to suck'),
+('嘮', 'chat'),
+('嘮', 'gossip'),
+('嘮', 'jaw'),
+('嘮', 'talk'),
+('嘯', 'howl'),
+('嘯', 'roar'),
+('嘯', 'scream'),
+('嘯', 'whistle'),
+('嘰', 'sigh in disapproval'),
+('嘰', 'take small'),
+('嘱', 'instruct'),
+('嘱', 'leave word'),
+('嘱', 'order'),
+('嘱', 'tell'),
+('嘲', 'deride'),
+('嘲', 'jeer at'),
+('嘲', 'ridicule'),
+('嘲', 'scorn'),
+('嘴', 'lips'),
+('嘴', 'mouth'),
+('嘵', 'argue'),
+('嘵', 'dispute'),
+('嘵', 'disturbed'),
+('嘵', 'fear'),
+('嘵', 'garrulous'),
+('嘵', 'noisy'),
+('嘵', 'restless'),
+('嘶', 'gravel voiced'),
+('嘶', 'husky throated'),
+('嘶', 'neighing of a horse'),
+('嘷', 'the roaring of wild beasts'),
+('嘷', 'to bawl'),
+('嘷', 'to howl'),
+('嘷', 'to wail'),
+('嘸', 'an expletive'),
+('嘸', 'unclear'),
+('嘹', 'resonant'),
+('嘹', 'used describe clarity of voice'),
+('嘺', '(Cant.) coincidental'),
+('嘻', 'happy'),
+('嘻', 'harmony'),
+('嘻', 'interjection'),
+('嘻', 'laugh'),
+('嘻', 'mirthful'),
+('嘽', 'many'),
+('嘽', 'pant'),
+('嘿', 'be quiet'),
+('嘿', 'be silent'),
+('噀', 'spirt out of the mouth'),
+('噁', 'nastiness'),
+('噁', 'nauseate: sickening'),
+('噂', 'meet'),
+('噃', '(Cant.) emphatic final particle'),
+('噅', 'to speak falsely or wrongly'),
+('噅', 'ugly'),
+('噉', '(Cant.) like this'),
+('噉', 'bite'),
+('噉', 'chew'),
+('噉', 'eat'),
+('噉', 'feed'),
+('噉', 'in this way'),
+('噋', 'to gobble up'),
+('噋', 'to swallow hastily'),
+('噌', 'scold'),
+('噌', 'shout at'),
+('噍', 'chew'),
+('噍', 'eat'),
+('噍', 'munch'),
+('噎', 'choke'),
+('噎', 'hiccup'),
+('噏', '(Cant.) to talk'),
+('噏', 'absorb'),
+('噏', 'compress'),
+('噏', 'imbibe'),
+('噏', 'inhale'),
+('噏', 'say'),
+('噏', 'tell'),
+('噐', 'instrument'),
+('噐', 'receptacle'),
+('噐', 'vessel'),
+('噓', 'blow out'),
+('噓', 'deep sigh'),
+('噓', 'exhale'),
+('噓', 'flatter'),
+('噓', 'hiss'),
+('噓', 'lie'),
+('噓', 'praise'),
+('噕', 'to speak falsely or wrongly'),
+('噕', 'ugly'),
+('噞', 'the movement of a fishs mouth at the surface of the water'),
+('噠', 'sound made to get a horse to move forward'),
+('噢', 'interjection for pain'),
+('噢', 'moan'),
+('噢', 'sad'),
+('噣', 'a beak'),
+('噣', 'enjoin upon'),
+('噣', 'to order'),
+('噣', 'to peck'),
+('噤', 'be silent'),
+('噤', 'be unable speak'),
+('噤', 'close'),
+('噥', 'whisper'),
+('噦', 'belch'),
+('噦', 'vomit'),
+('器', 'container'),
+('器', 'device'),
+('器', 'instrument'),
+('器', 'receptacle'),
+('器', 'vessel'),
+('噩', 'bad'),
+('噩', 'ill-omened'),
+('噩', 'unlucky'),
+('噪', 'be noisy'),
+('噪', 'chirp loudly'),
+('噫', 'alas'),
+('噫', 'belch'),
+('噫', 'burp'),
+('噫', 'groan'),
+('噫', 'sigh'),
+('噬', 'bite'),
+('噬', 'gnaw'),
+('噬', 'snap at'),
+('噭', 'shout'),
+('噯', 'exclamation'),
+('噯', 'interjection'),
+('噱', 'laugh aloud'),
+('噱', 'laugh heartily'),
+('噲', 'greedy'),
+('噲', 'gulp down'),
+('噲', 'refreshing'),
+('噲', 'swallow'),
+('噲', 'throat'),
+('噳', 'many'),
+('噴', 'blow out'),
+('噴', 'puff out'),
+('噴', 'spurt'),
+('噶', 'used in transliterations'),
+('噸', 'metric ton'),
+('噺', 'story'),
+('噺', 'talk'),
+('嚀', 'charge'),
+('嚀', 'enjoin'),
+('嚀', 'instruct'),
+('嚃', 'gobble'),
+('嚄', 'roar'),
+('嚅', 'talk indistinctly and falteringly'),
+('嚆', 'give forth sound'),
+('嚆', 'make noise'),
+('嚇', 'frighten'),
+('嚇', 'intimidate'),
+('嚇', 'scare'),
+('嚊', '(Cant.) particle indicating doubt'),
+('嚊', 'to pant'),
+('嚊', 'wife'),
+('嚌', '(Cant.) aspect marker of excessive extent'),
+('嚌', 'to sip'),
+('嚎', 'cry loudly'),
+('嚎', 'scream'),
+('嚎', 'yell'),
+('嚏', 'sneeze'),
+('嚔', 'sneeze'),
+('嚕', 'mumbling'),
+('嚕', 'talkative'),
+('嚕', 'verbose'),
+('嚙', 'bite'),
+('嚙', 'gnaw'),
+('嚚', 'argumentative'),
+('嚚', 'talkative'),
+('嚜', 'be silent'),
+('嚜', 'final particle'),
+('嚠', 'a clear sound'),
+('嚢', 'bag'),
+('嚢', 'purse'),
+('嚢', 'put in bag'),
+('嚢', 'sack'),
+('嚥', 'gulp'),
+('嚥', 'swallow'),
+('嚦', 'used in onomatopoetic expressions'),
+('嚨', 'throat'),
+('嚫', '(Cant.) aspect marker of injury'),
+('嚬', 'frown'),
+('嚭', 'lump'),
+('嚭', 'mound'),
+('嚭', 'stealthily'),
+('嚮', 'direct'),
+('嚮', 'favor'),
+('嚮', 'guide'),
+('嚮', 'incline to'),
+('嚱', 'a shrill noise'),
+('嚱', 'alas!'),
+('嚲', 'chant'),
+('嚲', 'droop'),
+('嚲', 'read aloud'),
+('嚲', 'recite'),
+('嚳', 'an urgent communication'),
+('嚳', 'mythical emperor'),
+('嚳', 'to inform quickly'),
+('嚴', 'rigid'),
+('嚴', 'rigorous'),
+('嚴', 'stern'),
+('嚴', 'strict'),
+('嚶', 'also used in names'),
+('嚶', 'seek friends'),
+('嚶', 'the call of a bird'),
+('嚷', 'brawl'),
+('嚷', 'cry'),
+('嚷', 'make uproar'),
+('嚷', 'shout'),
+('嚻', 'be noisy'),
+('嚻', 'treat with contempt'),
+('嚼', 'be glib'),
+('嚼', 'prattle'),
+('囀', 'chirp'),
+('囀', 'sing'),
+('囀', 'twitter'),
+('囀', 'warble'),
+('囁', 'hesitation'),
+('囁', 'move lips as when speaking'),
+('囂', 'be noisy'),
+('囂', 'treat with contempt'),
+('囃', 'jeer'),
+('囃', 'to accompany'),
+('囃', 'to banter'),
+('囃', 'to play(on an instrument)'),
+('囅', 'smile'),
+('囈', 'somniloquy'),
+('囈', 'talk in ones sleep'),
+('囉', 'exclamatory final particle'),
+('囉', 'nag'),
+('囊', 'bag'),
+('囊', 'bursa, sac'),
+('囊', 'pocket'),
+('囊', 'purse'),
+('囊', 'put in bag'),
+('囊', 'sack'),
+('囍', 'double happiness'),
+('囑', 'instruct'),
+('囑', 'leave word'),
+('囑', 'order'),
+('囑', 'tell'),
+('囒', 'confused talk'),
+('囓', 'gnaw'),
+('囗', 'bald'),
+('囗', 'erect'),
+('囗', 'proud'),
+('囗', 'upright'),
+('囚', 'confine'),
+('囚', 'convict'),
+('囚', 'prisoner'),
+('四', 'four'),
+('囝', 'baby'),
+('囝', 'infant'),
+('回', 'a time'),
+('回', 'occasion'),
+('回', 'occurrence'),
+('回', 'return'),
+('回', 'time'),
+('回', 'to'),
+('回', 'turn around'),
+('囟', 'skull'),
+('囟', 'top of the head'),
+('因', 'because(of)'),
+('因', 'by'),
+('因', 'cause'),
+('因', 'reason'),
+('団', 'ball'),
+('団', 'circle'),
+('団', 'lump'),
+('団', 'mass'),
+('団', 'sphere'),
+('囤', 'bin for grain'),
+('囤', 'grain basket'),
+('囧', 'bright'),
+('囧', 'shine'),
+('囪', 'chimney'),
+('囪', 'funnel'),
+('囫', 'entire'),
+('囫', 'whole'),
+('囬', 'to return to or from'),
+('园', 'garden'),
+('园', 'orchard'),
+('园', 'park'),
+('囮', 'cheat'),
+('囮', 'decoy'),
+('囮', 'inveigle'),
+('困', 'beseige'),
+('困', 'besiege'),
+('困', 'difficult'),
+('困', 'suffer'),
+('困', 'surround'),
+('困', 'to be surrounded'),
+('困', 'to surround'),
+('囱', 'chimney'),
+('囲', 'corral'),
+('囲', 'encircle'),
+('囲', 'surround'),
+('囲', 'whip'),
+('図', 'chart'),
+('図', 'diagram'),
+('図', 'map'),
+('図', 'picture'),
+('囷', 'round-shaped storage bin for grain'),
+('囹', 'enclosure'),
+('囹', 'prison'),
+('固', 'solid'),
+('固', 'solidify'),
+('固', 'strength'),
+('固', 'to become solid'),
+('国', 'country'),
+('国', 'land'),
+('国', 'nation'),
+('国', 'nation-state'),
+('国', 'state'),
+('囿', 'constrain'),
+('囿', 'limit'),
+('囿', 'pen up'),
+('圀', 'country'),
+('圀', 'nation'),
+('圀', 'nation-state'),
+('圂', 'pig-sty'),
+('圂', 'privy'),
+('圃', 'cultivated field'),
+('圃', 'garden'),
+('圄', 'jail'),
+('圄', 'prison'),
+('圅', 'a box'),
+('圅', 'a case'),
+('圅', 'correspondence'),
+('圇', 'all'),
+('圇', 'complete'),
+('圇', 'entire'),
+('圈', 'a circle'),
+('圈', 'area'),
+('圈', 'circle'),
+('圈', 'corral'),
+('圈', 'region'),
+('圈', 'sphere'),
+('圈', 'to circle'),
+('圉', 'border'),
+('圉', 'corral'),
+('圉', 'enclosure'),
+('圉', 'frontier'),
+('圉', 'stable'),
+('圊', 'rest room'),
+('國', 'country'),
+('國', 'nation'),
+('國', 'nation-state'),
+('國', 'state'),
+('圌', 'fence'),
+('圍', 'corral'),
+('圍', 'encircle'),
+('圍', 'surround'),
+('圎', 'circle'),
+('圎', 'circular'),
+('圎', 'complete'),
+('圎', 'round'),
+('圏', 'a circle'),
+('圏', 'corral'),
+('圏', 'to circle'),
+('園', 'garden'),
+('園', 'orchard'),
+('園', 'park'),
+('圓', 'circle'),
+('圓', 'circular'),
+('圓', 'complete'),
+('圓', 'round'),
+('圓', 'won'),
+('圕', 'library'),
+('圖', 'a picture, diagram'),
+('圖', 'book'),
+('圖', 'chart'),
+('圖', 'diagram'),
+('圖', 'map'),
+('圖', 'painting'),
+('圖', 'picture'),
+('圖', 'seal'),
+('圖', 'stamp'),
+('圗', 'chart'),
+('圗', 'diagram'),
+('圗', 'map'),
+('圗', 'picture'),
+('團', 'ball'),
+('團', 'circle'),
+('團', 'group'),
+('團', 'lump'),
+('團', 'mass'),
+('團', 'sphere'),
+('圛', 'stratus'),
+('圛', 'used in place names'),
+('圜', 'circle'),
+('圜', 'encircle'),
+('圜', 'surround'),
+('圝', 'entire'),
+('土', 'Saturday'),
+('土', 'earth'),
+('土', 'items made of earth'),
+('土', 'soil'),
+('圥', 'mushroom'),
+('圧', 'pressure'),
+('圧', 'same as 壓'),
+('圧', 'to crush'),
+('圧', 'to oppress'),
+('圧', 'to press'),
+('在', 'be at'),
+('在', 'consist in'),
+('在', 'exist'),
+('在', 'in'),
+('在', 'on'),
+('在', 'rest'),
+('圩', 'concave'),
+('圩', 'dike'),
+('圬', 'plaster over with layer of mud'),
+('圬', 'trowel'),
+('圭', 'jade pointed at top'),
+('圮', 'destroyed'),
+('圮', 'ruined'),
+('圮', 'to subvert to injure'),
+('地', 'earth'),
+('地', 'ground'),
+('地', 'land'),
+('地', 'region'),
+('地', 'soil'),
+('圻', 'border'),
+('圻', 'boundary'),
+('圾', 'danger'),
+('圾', 'garbage'),
+('圾', 'rubbish'),
+('圾', 'shaking'),
+('址', 'land for house'),
+('址', 'location'),
+('址', 'site'),
+('坂', 'hillside'),
+('坂', 'inconvenient places'),
+('均', 'all'),
+('均', 'also'),
+('均', 'equal'),
+('均', 'even'),
+('均', 'fair'),
+('坊', 'neighborhood'),
+('坊', 'urban subdivision'),
+('坌', 'a bank of earth'),
+('坌', 'dig'),
+('坌', 'dust'),
+('坌', 'earth'),
+('坌', 'to bring together'),
+('坌', 'to dig'),
+('坍', 'collapse'),
+('坍', 'landslide'),
+('坎', 'crisis'),
+('坎', 'hole'),
+('坎', 'pit'),
+('坎', 'snare'),
+('坎', 'trap'),
+('坏', 'bad'),
+('坏', 'broken down'),
+('坏', 'rotten'),
+('坏', 'spoilt'),
+('坐', 'ride'),
+('坐', 'seat'),
+('坐', 'sit'),
+('坐', 'travel by'),
+('坑', 'bury'),
+('坑', 'harry'),
+('坑', 'hole'),
+('坑', 'pit'),
+('坑', 'trap'),
+('坡', 'bank'),
+('坡', 'hillside'),
+('坡', 'slope'),
+('坤', 'Eight Trigrams'),
+('坤', 'earth'),
+('坤', 'female'),
+('坤', 'feminine'),
+('坤', 'queen'),
+('坤', '곤괘'),
+('坤', '팔괘'),
+('坤', '황후'),
+('坦', 'flat'),
+('坦', 'self-possessed'),
+('坦', 'smooth'),
+('坩', 'earthenware'),
+('坩', 'earthenware vessel'),
+('坪', 'Japanese measure'),
+('坪', 'flatland'),
+('坪', 'ground'),
+('坪', 'level'),
+('坪', 'level ground'),
+('坪', 'plain'),
+('坪', 'terrace'),
+('坫', 'a stand on which to replace goblets after drinking'),
+('坫', 'boundary'),
+('坫', 'limit'),
+('坮', 'platform'),
+('坮', 'term of address'),
+('坮', 'unit'),
+('坯', 'dam'),
+('坯', 'embankment'),
+('坯', 'weir'),
+('坰', 'borderland'),
+('坰', 'field'),
+('坰', 'vicinity'),
+('坰', 'wilds'),
+('坱', 'dust'),
+('坳', 'a cavity'),
+('坳', 'a hollow in the ground'),
+('坳', 'depressed'),
+('坳', 'depression'),
+('坳', 'undulating'),
+('坵', 'earthenware'),
+('坵', 'earthenware vessel'),
+('坷', 'clod of earth'),
+('坷', 'lump of soil'),
+('坻', 'a rock in a river'),
+('坻', 'an embankment'),
+('坻', 'an islet'),
+('坻', 'to stop'),
+('坼', 'open'),
+('坼', 'split'),
+('坼', 'tear'),
+('垂', 'down'),
+('垂', 'hand'),
+('垂', 'let down'),
+('垂', 'suspend'),
+('垈', 'house'),
+('垈', 'lot'),
+('垈', '집터'),
+('型', 'law'),
+('型', 'model'),
+('型', 'mold'),
+('型', 'pattern'),
+('型', 'type'),
+('垌', 'crock'),
+('垌', 'jar'),
+('垌', 'pot'),
+('垌', '동막이'),
+('垓', 'border'),
+('垓', 'boundary'),
+('垓', 'frontier'),
+('垔', 'block'),
+('垔', 'bury'),
+('垔', 'close'),
+('垔', 'ladder'),
+('垔', 'stop up'),
+('垕', 'used in place names'),
+('垖', 'hill'),
+('垞', 'hillock'),
+('垞', 'place name'),
+('垞', 'small mound'),
+('垠', 'bank'),
+('垠', 'bank of stream or river'),
+('垠', 'boundary'),
+('垠', 'river'),
+('垠', 'stream'),
+('垢', 'dirt'),
+('垢', 'dirty'),
+('垢', 'filth'),
+('垢', 'stains'),
+('垣', 'low wall'),
+('垤', 'ant-hill'),
+('垤', 'hill'),
+('垤', 'small mound'),
+('垩', 'daub with white mud'),
+('垩', 'holy'),
+('垩', 'sacred'),
+('垩', 'sage'),
+('垩', 'simplification of Ü white earth'),
+('垸', '환: 바르다, 칠하다'),
+('垽', '(Cant.) sediment'),
+('垽', 'precipitate'),
+('埃', 'dirt'),
+('埃', 'dust'),
+('埃', 'fine'),
+('埃', 'fine dust'),
+('埆', 'stony'),
+('埇', 'name of bridge'),
+('埈', 'high'),
+('埈', 'steep'),
+('埈', 'stern'),
+('埈', 'towering'),
+('埋', 'bury'),
+('埋', 'conceal'),
+('埋', 'secrete'),
+('城', 'castle'),
+('城', 'city'),
+('城', 'municipality'),
+('城', 'town'),
+('埏', 'a boundary'),
+('埏', 'a limit'),
+('埏', 'boundary'),
+('埒', 'dike'),
+('埒', 'embankment'),
+('埒', 'enclosure'),
+('埜', 'field'),
+('埜', 'open country'),
+('埜', 'wilderness'),
+('域', 'boundary'),
+('域', 'district'),
+('域', 'land'),
+('域', 'region'),
+('埠', 'port city'),
+('埤', 'add'),
+('埤', 'attach'),
+('埤', 'increase'),
+('埤', 'low fence'),
+('埭', 'a dam'),
+('埭', 'a jock'),
+('埭', 'inclined plane on a canal'),
+('埭', 'where boats can be hauled up or down'),
+('埰', 'fief'),
+('埳', 'a crisis'),
+('埳', 'a danger'),
+('埳', 'a hole'),
+('埳', 'a mortar'),
+('埳', 'a pit'),
+('埳', 'a snare'),
+('埴', 'soil with large clay content'),
+('埶', 'art'),
+('埶', 'grains'),
+('埶', 'plant'),
+('埶', 'skill'),
+('執', 'carry out'),
+('執', 'hold in hand'),
+('執', 'keep'),
+('培', 'bank up'),
+('培', 'bank up with dirt'),
+('培', 'cultivate'),
+('培', 'dirt'),
+('培', 'hill'),
+('培', 'mound'),
+('培', 'raise'),
+('基', 'base'),
+('基', 'basis'),
+('基', 'foundation'),
+('基', 'radical'),
+('埼', 'headland'),
+('埽', 'broom'),
+('埽', 'clear away'),
+('埽', 'to sweep'),
+('堀', 'cave'),
+('堀', 'hole'),
+('堂', 'government office'),
+('堂', 'hall'),
+('堂', 'main'),
+('堂', 'purpose'),
+('堂', 'room'),
+('堂', 'specific'),
+('堃', 'compliance'),
+('堃', 'female'),
+('堃', 'obedience'),
+('堅', 'firm'),
+('堅', 'hard'),
+('堅', 'resolute'),
+('堅', 'stiff'),
+('堅', 'strong'),
+('堆', 'crowd'),
+('堆', 'heap'),
+('堆', 'pile'),
+('堆', 'pile up'),
+('堇', 'clay'),
+('堇', 'few'),
+('堇', 'season'),
+('堇', 'yellow loam'),
+('堈', 'cistern'),
+('堈', 'crock'),
+('堈', 'earthen jug'),
+('堉', 'fertile land'),
+('堉', 'ground'),
+('堊', 'to daub with white mud'),
+('堊', 'white earth'),
+('堋', 'bury'),
+('堕', 'degenerate'),
+('堕', 'fall'),
+('堕', 'let fall'),
+('堕', 'sink'),
+('堗', 'chimney'),
+('堗', 'gudeul'),
+('堙', 'block up'),
+('堙', 'bury'),
+('堙', 'dam'),
+('堝', 'crucible'),
+('堞', 'plate'),
+('堠', 'battlemented walls'),
+('堠', 'battlements'),
+('堠', 'heights'),
+('堠', 'high ground'),
+('堠', 'watchtower'),
+('堡', 'fort'),
+('堡', 'fortress'),
+('堡', 'town'),
+('堡', 'village'),
+('堤', 'dike'),
+('堤', 'dyke'),
+('堤', 'embankment'),
+('堦', 'a class'),
+('堦', 'a degree'),
+('堦', 'a flight of steps'),
+('堦', 'a rank or step'),
+('堦', 'stairs'),
+('堧', 'adjoin'),
+('堪', 'adequately capable of'),
+('堪', 'bear'),
+('堪', 'capable'),
+('堪', 'endure'),
+('堪', 'worthy of'),
+('堯', 'a legendary ancient emperor-sage'),
+('堰', 'bank'),
+('堰', 'dam'),
+('堰', 'dike'),
+('堰', 'embankment'),
+('報', 'announce'),
+('報', 'inform'),
+('報', 'recompense'),
+('報', 'repay'),
+('報', 'report'),
+('報', 'requite'),
+('報', 'tell'),
+('場', 'a place, any place'),
+('場', 'field'),
+('場', 'grist'),
+('場', 'market'),
+('場', 'open space'),
+('場', 'place'),
+('場', 'yard'),
+('堵', 'prevent'),
+('堵', 'stop'),
+('堵', 'stop up'),
+('堵', 'wall'),
+('堺', 'persons name'),
+('塀', 'fence'),
+('塀', 'wall'),
+('塊', 'chunk'),
+('塊', 'dollar'),
+('塊', 'lump'),
+('塊', 'piece'),
+('塋', 'cemetery'),
+('塋', 'grave'),
+('塋', 'tomb'),
+('塌', 'break'),
+('塌', 'collapse'),
+('塌', 'down'),
+('塌', 'drop'),
+('塌', 'fall in ruins'),
+('塌', 'field'),
+('塌', 'first'),
+('塌', 'grind'),
+('塌', 'hang'),
+('塌', 'ploughing'),
+('塌', 'rice'),
+('塍', 'a dike'),
+('塍', 'a raised path between fields'),
+('塍', 'dyke'),
+('塍', 'fields'),
+('塍', 'path'),
+('塍', 'raised'),
+('塍', '밭두둑 승'),
+('塏', 'high and dry place'),
+('塏', 'highland'),
+('塐', 'model in clay'),
+('塐', 'plastics'),
+('塐', 'sculpt'),
+('塑', 'model in clay'),
+('塑', 'plastics'),
+('塑', 'sculpt'),
+('塒', 'roost'),
+('塔', 'spire'),
+('塔', 'tall building'),
+('塔', 'tower'),
+('塗', 'apply'),
+('塗', 'daub'),
+('塗', 'paint'),
+('塗', 'smear'),
+('塗', 'spread'),
+('塘', 'dike'),
+('塘', 'embankment'),
+('塘', 'pond'),
+('塘', 'tank'),
+('塙', 'truly'),
+('塚', 'burial mound'),
+('塚', 'cemetery'),
+('塚', 'tomb'),
+('塜', 'dirt'),
+('塜', 'dusty'),
+('塞', 'block'),
+('塞', 'border'),
+('塞', 'cork'),
+('塞', 'fortress'),
+('塞', 'frontier'),
+('塞', 'pass'),
+('塞', 'seal'),
+('塞', 'stop up'),
+('塡', 'fill in'),
+('塡', 'fill up'),
+('塡', 'make good'),
+('塡', 'quell'),
+('塢', 'bank'),
+('塢', 'entrenchment'),
+('塢', 'low wall'),
+('塤', 'instrument'),
+('塩', 'salt'),
+('填', 'fill in'),
+('填', 'fill up'),
+('填', 'make good'),
+('塵', 'ashes'),
+('塵', 'cinders'),
+('塵', 'dirt'),
+('塵', 'dust'),
+('塹', 'cavity'),
+('塹', 'moat'),
+('塹', 'pit'),
+('塹', 'trench'),
+('塼', 'brick'),
+('塽', 'plateau'),
+('塾', 'private'),
+('塾', 'private tutorage'),
+('塾', 'school'),
+('塾', 'village school'),
+('墀', 'courtyard'),
+('墀', 'porch'),
+('墀', 'steps leading'),
+('墁', 'coat'),
+('墁', 'to pave'),
+('墁', 'to plaster'),
+('墁', 'trowel'),
+('境', 'area'),
+('境', 'border'),
+('境', 'boundary'),
+('境', 'condition'),
+('境', 'frontier'),
+('境', 'place'),
+('境', 'region'),
+('境', 'situation'),
+('墅', 'country house'),
+('墅', 'villa'),
+('墉', 'fortified wall'),
+('墉', 'small wall'),
+('墉', 'wall'),
+('墊', 'advance money'),
+('墊', 'pay for another'),
+('墍', 'decorate'),
+('墍', 'paint'),
+('墐', 'plaster over with mud'),
+('墐', 'to build with soil'),
+('墓', 'a tomb'),
+('墓', 'grave'),
+('墓', 'tomb'),
+('増', 'increase'),
+('墜', 'drop'),
+('墜', 'fall'),
+('墜', 'fall down'),
+('墜', 'go to ruin'),
+('墜', 'sink'),
+('墝', 'stony'),
+('增', 'add to'),
+('增', 'augment'),
+('增', 'increase'),
+('墟', 'high mound'),
+('墟', 'hilly countryside'),
+('墟', 'wasteland'),
+('墦', 'tomb'),
+('墨', 'cunning'),
+('墨', 'ink'),
+('墨', 'sly'),
+('墨', 'writing'),
+('墩', 'block of stone'),
+('墩', 'heap'),
+('墩', 'mound'),
+('墫', 'cup'),
+('墮', 'degenerate'),
+('墮', 'fall'),
+('墮', 'let fall'),
+('墮', 'sink'),
+('墰', 'a jug'),
+('墰', 'an earthenware jar'),
+('墳', 'bulge'),
+('墳', 'bulging'),
+('墳', 'grave'),
+('墳', 'mound'),
+('墺', 'four walls'),
+('墻', 'wall'),
+('墾', 'cultivate'),
+('墾', 'reclaim'),
+('墾', 'to farm land'),
+('壁', 'partition wall'),
+('壁', 'wall'),
+('壁', 'walls of a house'),
+('壅', 'block'),
+('壅', 'obstruct'),
+('壅', 'to obstruct'),
+('壇', 'altar'),
+('壇', 'arena'),
+('壇', 'examination hall'),
+('壌', 'earth'),
+('壌', 'loam'),
+('壌', 'rich'),
+('壌', 'soil'),
+('壎', 'instrument'),
+('壑', 'bed of torrent'),
+('壑', 'narrow ravine'),
+('壓', 'crush'),
+('壓', 'oppress'),
+('壓', 'press'),
+('壓', 'pressure'),
+('壔', 'a mound'),
+('壔', 'a tumulus'),
+('壔', 'fort'),
+('壔', 'mound'),
+('壕', 'channel'),
+('壕', 'ditch'),
+('壕', 'moat'),
+('壕', 'trench'),
+('壘', 'base'),
+('壘', 'baseball'),
+('壘', 'military wall'),
+('壘', 'rampart'),
+('壙', 'grave: prairie'),
+('壙', 'open wilderness'),
+('壙', 'tomb'),
+('壚', 'black clods of earth'),
+('壚', 'hut'),
+('壚', 'shop'),
+('壜', 'earthen jar or jug'),
+('壝', 'a mound'),
+('壝', 'an embankment the earthen altar to the god of the soil'),
+('壞', 'bad'),
+('壞', 'break'),
+('壞', 'collapse'),
+('壞', 'destroy'),
+('壞', 'ruin'),
+('壞', 'spoil(ed)'),
+('壟', 'grave'),
+('壟', 'mound'),
+('壟', 'ridge in field'),
+('壤', 'earth'),
+('壤', 'loam'),
+('壤', 'rich'),
+('壤', 'soil'),
+('壩', 'dam'),
+('壩', 'embankment'),
+('士', 'gentleman'),
+('士', 'scholar'),
+('士', 'soldier'),
+('壬', '9th heavenly stem'),
+('壭', 'Kwukyel'),
+('壭', '산'),
+('壮', 'big'),
+('壮', 'large'),
+('壮', 'name of tribe'),
+('壮', 'robust'),
+('壯', 'big'),
+('壯', 'large'),
+('壯', 'name of tribe'),
+('壯', 'robust'),
+('声', 'music'),
+('声', 'noise'),
+('声', 'sound'),
+('声', 'tone'),
+('声', 'voice'),
+('壱', 'number one'),
+('売', '[NOT casing'),
+('売', 'husk]'),
+('売', 'sell'),
+('売', 'shell'),
+('壹', 'number one'),
+('壺', 'jar'),
+('壺', 'jug'),
+('壺', 'pot'),
+('壺', 'surname'),
+('壺', 'vase'),
+('壻', 'husband'),
+('壻', 'son-in-law'),
+('壼', 'palace corridor or passageway'),
+('壽', 'lifespan'),
+('壽', 'long life'),
+('壽', 'old age'),
+('夆', 'chisel'),
+('夆', 'guide'),
+('夆', 'lead'),
+('夆', 'pull'),
+('夆', 'resist'),
+('変', 'alter'),
+('変', 'change'),
+('変', 'rebel'),
+('変', 'transform'),
+('复', 'repeat'),
+('复', 'repeatedly'),
+('复', 'return'),
+('夏', 'big'),
+('夏', 'grand'),
+('夏', 'great'),
+('夏', 'summer'),
+('夐', 'faraway'),
+('夐', 'long'),
+('夐', 'pre-eminent'),
+('夔', 'one-legged monster'),
+('夔', 'walrus'),
+('夕', 'dusk'),
+('夕', 'evening'),
+('夕', 'night'),
+('夕', 'slanted'),
+('外', 'external'),
+('外', 'foreign'),
+('外', 'out'),
+('外', 'outside'),
+('外', 'surface'),
+('夙', 'dawn'),
+('夙', 'early in morning'),
+('夙', 'previous'),
+('多', 'a lot of'),
+('多', 'many'),
+('多', 'more than'),
+('多', 'much'),
+('多', 'over'),
+('夜', 'by night'),
+('夜', 'dark'),
+('夜', 'in night'),
+('夜', 'night'),
+('夢', 'dream'),
+('夢', 'visionary'),
+('夢', 'wishful'),
+('夤', 'deep'),
+('夤', 'distant place'),
+('夤', 'remote'),
+('夥', 'assistant'),
+('夥', 'companion'),
+('夥', 'partner'),
+('大', 'big'),
+('大', 'great'),
+('大', 'high'),
+('大', 'large'),
+('大', 'main'),
+('大', 'major'),
+('大', 'vast'),
+('天', 'celestial'),
+('天', 'god'),
+('天', 'heaven'),
+('天', 'sky'),
+('太', 'big'),
+('太', 'extreme'),
+('太', 'much'),
+('太', 'too'),
+('太', 'very'),
+('夫', 'husband'),
+('夫', 'male adult'),
+('夫', 'man'),
+('夫', 'those'),
+('夬', 'certain'),
+('夬', 'fork'),
+('夬', 'parted'),
+('夭', 'die young'),
+('夭', 'fresh-looking'),
+('夭', 'young'),
+('央', 'beg'),
+('央', 'center'),
+('央', 'conclude'),
+('央', 'run out'),
+('夯', 'burden'),
+('夯', 'heavy load'),
+('夯', 'lift up'),
+('失', 'lose'),
+('失', 'loss'),
+('失', 'make mistake'),
+('失', 'neglect'),
+('夷', 'ancient barbarian tribes'),
+('夷', 'barbarian'),
+('夷', 'flat'),
+('夷', 'level'),
+('夷', 'smooth'),
+('夸', 'extravagant'),
+('夸', 'handsome'),
+('夸', 'luxurious'),
+('夻', 'cod'),
+('夻', 'fish name'),
+('夾', 'be wedged or inserted between'),
+('奄', 'ere long'),
+('奄', 'feeble'),
+('奄', 'remain'),
+('奄', 'tarry'),
+('奇', 'occult'),
+('奇', 'strange'),
+('奇', 'uncanny'),
+('奇', 'unusual'),
+('奈', 'bear'),
+('奈', 'but'),
+('奈', 'endure'),
+('奈', 'how'),
+('奈', 'stand'),
+('奉', 'offer'),
+('奉', 'present'),
+('奉', 'receive'),
+('奉', 'respect'),
+('奉', 'serve'),
+('奌', 'degree'),
+('奌', 'dot'),
+('奌', 'point'),
+('奌', 'speck'),
+('奌', 'spot'),
+('奎', 'one of the twenty-eight lunar mansions'),
+('奎', 'star'),
+('奎', 'stride of man'),
+('奏', 'memorialize emperor'),
+('奏', 'report'),
+('奐', 'be numerous'),
+('奐', 'brilliant'),
+('契', 'assiduous'),
+('契', 'bond'),
+('契', 'contract'),
+('契', 'deed'),
+('契', 'engrave'),
+('契', 'hard'),
+('契', 'name'),
+('契', 'toil'),
+('契', 'tribe'),
+('契', 'work'),
+('奓', 'extravagant'),
+('奓', 'open'),
+('奔', 'about'),
+('奔', 'fast'),
+('奔', 'flee'),
+('奔', 'run'),
+('奔', 'run fast'),
+('奔', 'rush'),
+('奔', 'rush about'),
+('奕', 'abundant'),
+('奕', 'in sequence'),
+('奕', 'orderly'),
+('套', 'case'),
+('套', 'cover'),
+('套', 'envelope'),
+('套', 'wrapper'),
+('奘', 'large'),
+('奘', 'powerful'),
+('奘', 'stout'),
+('奘', 'thick'),
+('奚', 'servant'),
+('奚', 'where? what? how? why?'),
+('奠', 'pay respect'),
+('奠', 'settle'),
+('奢', 'exaggerate'),
+('奢', 'extravagant'),
+('奢', 'wasteful'),
+('奥', 'deep'),
+('奥', 'mysterious'),
+('奥', 'obscure'),
+('奥', 'profound'),
+('奧', 'deep'),
+('奧', 'mysterious'),
+('奧', 'obscure'),
+('奧', 'profound'),
+('奧', 'warmth'),
+('奨', 'give award to'),
+('奨', 'prize'),
+('奨', 'reward'),
+('奩', 'ladys vanity case'),
+('奩', 'trousseau'),
+('奪', 'rob'),
+('奪', 'snatch'),
+('奪', 'take by force'),
+('奬', 'give award to'),
+('奬', 'prize'),
+('奬', 'reward'),
+('奭', 'anger'),
+('奭', 'ire'),
+('奭', 'red'),
+('奭', 'surname'),
+('奮', 'arouse'),
+('奮', 'effort'),
+('奮', 'exert'),
+('奮', 'exert effort'),
+('奮', 'strive'),
+('女', 'female'),
+('女', 'feminine'),
+('女', 'girl'),
+('女', 'rad. 38'),
+('女', 'woman'),
+('女', 'you'),
+('奴', 'servant'),
+('奴', 'slave'),
+('奶', 'milk'),
+('奶', 'nurse'),
+('奶', 'womans breasts'),
+('奸', 'crafty'),
+('奸', 'evil'),
+('奸', 'false'),
+('奸', 'villainous'),
+('奸', 'wicked'),
+('好', 'excellent'),
+('好', 'fine'),
+('好', 'good'),
+('好', 'like'),
+('好', 'well'),
+('妁', 'act as go-between'),
+('如', 'as'),
+('如', 'as if'),
+('如', 'as though'),
+('如', 'if'),
+('如', 'like'),
+('如', 'supposing'),
+('妃', 'concubine'),
+('妃', 'imperial'),
+('妃', 'imperial concubine'),
+('妃', 'marry'),
+('妃', 'spouse'),
+('妃', 'wife'),
+('妄', 'absurd'),
+('妄', 'false'),
+('妄', 'foolish'),
+('妄', 'reckless'),
+('妊', 'be pregnant'),
+('妊', 'conceive'),
+('妊', 'pregnancy'),
+('妍', 'beautiful'),
+('妍', 'handsome'),
+('妍', 'seductive'),
+('妒', 'envious'),
+('妒', 'envy'),
+('妒', 'jealous'),
+('妓', 'prostitute'),
+('妖', 'strange'),
+('妖', 'supernatural'),
+('妖', 'weird'),
+('妗', 'wife of mothers brother'),
+('妙', 'a mysterious power'),
+('妙', 'exquisite'),
+('妙', 'mysterious'),
+('妙', 'subtle'),
+('妝', 'dress up'),
+('妝', 'to adorn oneself'),
+('妝', 'use make-up'),
+('妣', 'ones deceased mother'),
+('妤', '伃'),
+('妤', '아름답다'),
+('妥', 'appropriate'),
+('妥', 'satisfactory'),
+('妨', 'impede'),
+('妨', 'interfere'),
+('妨', 'interfere with'),
+('妨', 'obstruct'),
+('妬', 'envious'),
+('妬', 'envy'),
+('妬', 'jealous'),
+('妯', 'sister-i'),
+('妯', 'wives of ones brothers'),
+('妲', 'concubine of last ruler of the Shang dynasty'),
+('妹', 'sister'),
+('妹', 'younger'),
+('妹', 'younger sister'),
+('妻', 'wife'),
+('妾', 'concubine'),
+('姁', 'beautiful'),
+('姁', 'grandmother'),
+('姆', 'childs governess'),
+('姆', 'matron'),
+('姉', 'elder sister'),
+('始', 'begin'),
+('始', 'beginning'),
+('始', 'first'),
+('始', 'initial'),
+('始', 'only then'),
+('始', 'start'),
+('始', 'then'),
+('姍', 'proceed slowly'),
+('姍', 'ridicule'),
+('姍', 'slander'),
+('姐', 'elder sister'),
+('姐', 'young lady'),
+('姑', 'fathers sister'),
+('姑', 'husbands mother'),
+('姒', 'wife of elder brother'),
+('姓', 'clan'),
+('姓', 'family name'),
+('姓', 'ones family name'),
+('姓', 'people'),
+('委', 'appoint'),
+('委', 'commission'),
+('委', 'entrust'),
+('委', 'send'),
+('姗', 'proceed slowly'),
+('姗', 'ridicule'),
+('姗', 'slander'),
+('姙', 'be pregnant'),
+('姙', 'conceive'),
+('姙', 'pregnancy'),
+('姚', 'elegant'),
+('姚', 'handsome'),
+('姚', 'surname'),
+('姜', 'ginger'),
+('姜', 'surname'),
+('姝', 'a beautiful girl'),
+('姞', 'concubine'),
+('姢', 'beautiful'),
+('姢', 'graceful'),
+('姣', 'beautiful'),
+('姣', 'charming'),
+('姣', 'handsome'),
+('姣', 'lewdness'),
+('姣', 'lovely'),
+('姣', 'pretty'),
+('姤', 'copulate'),
+('姤', 'good'),
+('姤', 'mate'),
+('姥', 'maternal grandmother'),
+('姥', 'midwife'),
+('姦', 'adultery'),
+('姦', 'debauch'),
+('姦', 'debauchery'),
+('姦', 'evil'),
+('姦', 'fornicate'),
+('姦', 'rape'),
+('姦', 'treacherous'),
+('姦', 'wicked'),
+('姨', 'concubine'),
+('姨', 'mother/wifes sister'),
+('姪', 'niece'),
+('姫', 'beauty'),
+('姫', 'imperial concubine'),
+('姬', 'beauty'),
+('姬', 'imperial concubine'),
+('姬', 'woman'),
+('姮', 'lady'),
+('姱', '아름다울'),
+('姸', 'beautiful'),
+('姺', 'name of an ancient state'),
+('姻', 'relatives by marriage'),
+('姿', 'bearing'),
+('姿', 'carriage'),
+('姿', 'ones manner'),
+('威', 'dignity'),
+('威', 'dominate'),
+('威', 'pomp'),
+('威', 'power'),
+('威', 'powerful'),
+('娃', 'baby'),
+('娃', 'doll'),
+('娃', 'pretty girl'),
+('娉', 'attractive'),
+('娉', 'beautiful'),
+('娉', 'charming'),
+('娉', 'graceful'),
+('娑', 'dance'),
+('娑', 'frolic'),
+('娑', 'lounge'),
+('娑', 'saunter'),
+('娓', 'agreeable'),
+('娓', 'comply'),
+('娓', 'complying'),
+('娘', 'mother'),
+('娘', 'wife'),
+('娘', 'woman'),
+('娘', 'young girl'),
+('娛', 'amusement'),
+('娛', 'enjoyment'),
+('娛', 'pleasure'),
+('娜', 'delicate'),
+('娜', 'elegant'),
+('娜', 'graceful'),
+('娟', 'beautiful'),
+('娟', 'graceful'),
+('娠', 'pregnant'),
+('娣', 'sister-in-law'),
+('娣', 'younger sister'),
+('娥', 'be beautiful'),
+('娥', 'good'),
+('娥', 'surname'),
+('娩', 'complaisant'),
+('娩', 'give birth child'),
+('娯', 'amusement'),
+('娯', 'enjoyment'),
+('娯', 'pleasure'),
+('娵', 'star'),
+('娶', 'marry'),
+('娶', 'take wife'),
+('娼', 'harlot'),
+('娼', 'prostitute'),
+('婀', 'be beautiful'),
+('婀', 'be graceful'),
+('婁', 'a constellation'),
+('婁', 'surname'),
+('婁', 'to wear'),
+('婆', 'grandmother'),
+('婆', 'old woman'),
+('婉', 'amiable'),
+('婉', 'congenial'),
+('婉', 'restrained'),
+('婐', 'maid'),
+('婕', 'beautiful'),
+('婚', 'get married'),
+('婚', 'marriage'),
+('婚', 'wedding'),
+('婢', 'servant girl'),
+('婢', 'your servant'),
+('婣', 'a bride'),
+('婣', 'marriage connections'),
+('婦', 'lady'),
+('婦', 'married women'),
+('婦', 'wife'),
+('婦', 'woman'),
+('婧', 'modest'),
+('婧', 'supple'),
+('婪', 'avaricious'),
+('婪', 'covet'),
+('婪', 'covetous'),
+('婬', 'lewd'),
+('婬', 'licentious'),
+('婬', 'obscene'),
+('婷', 'attractive'),
+('婷', 'graceful'),
+('婷', 'pretty'),
+('婾', 'enjoy'),
+('婾', 'steal'),
+('婿', 'husband'),
+('婿', 'son-in-law'),
+('媒', 'go-between'),
+('媒', 'matchmaker'),
+('媒', 'medium'),
+('媕', 'undecided'),
+('媚', 'attractive'),
+('媚', 'charming'),
+('媚', 'flatter'),
+('媛', 'beautiful woman'),
+('媛', 'beauty'),
+('媟', 'act indecently'),
+('媟', 'lewd'),
+('媟', 'lust after'),
+('媢', 'be envious'),
+('媢', 'be jealous of'),
+('媤', 'family'),
+('媤', 'girl'),
+('媤', 'husband'),
+('媤', 'husbands family'),
+('媤', 'name'),
+('媧', 'mythological snail goddess'),
+('媪', 'lower-class woman'),
+('媪', 'old woman'),
+('媳', 'daughter-in-law'),
+('媵', 'a concubine'),
+('媵', 'a maid who accompanies bride to her new home'),
+('媵', 'give'),
+('媵', 'present'),
+('媵', 'to escort'),
+('媺', 'beautiful'),
+('媻', 'to move'),
+('媼', 'lower-class woman'),
+('媼', 'old woman'),
+('媽', 'grandmother'),
+('媽', 'mama'),
+('媽', 'mother'),
+('媾', 'be on friendly terms with'),
+('媾', 'marry'),
+('媿', 'ashamed'),
+('媿', 'conscience-stricken'),
+('嫁', 'daughter'),
+('嫁', 'give'),
+('嫁', 'give a daughter in marriage'),
+('嫁', 'marriage'),
+('嫁', 'marry'),
+('嫁', 'to marry'),
+('嫂', 'brother'),
+('嫂', 'elder'),
+('嫂', 'elder brothers wife'),
+('嫂', 'sister-in-law'),
+('嫂', 'wife'),
+('嫄', 'Qiang Yuan'),
+('嫄', 'an ancient emperors mothers name'),
+('嫄', 'consort to Gu'),
+('嫈', 'lady'),
+('嫉', 'be jealous of'),
+('嫉', 'jealousy'),
+('嫋', 'slender and delicate'),
+('嫌', 'criticize'),
+('嫌', 'detest'),
+('嫌', 'hate'),
+('嫌', 'suspect'),
+('嫖', 'frequent'),
+('嫖', 'patronize prostitutes'),
+('嫗', 'hag'),
+('嫗', 'old woman'),
+('嫚', 'affront'),
+('嫚', 'be rude'),
+('嫚', 'beautiful'),
+('嫚', 'belittle'),
+('嫚', 'despise'),
+('嫚', 'scorn'),
+('嫚', '원'),
+('嫛', 'compliant'),
+('嫛', 'easy-going a newborn child'),
+('嫛', 'yielding'),
+('嫠', 'a widow'),
+('嫠', 'widow'),
+('嫡', 'child of legal wife'),
+('嫡', 'legal wife'),
+('嫡', 'legitimate'),
+('嫡', 'wife'),
+('嫣', 'beautiful'),
+('嫣', 'beauty'),
+('嫣', 'charming'),
+('嫣', 'fascinating'),
+('嫣', 'gay'),
+('嫦', 'name of a moon goddess'),
+('嫩', 'delicate'),
+('嫩', 'soft'),
+('嫩', 'tender'),
+('嫩', 'young'),
+('嫵', 'charming'),
+('嫵', 'gentle'),
+('嫵', 'pretty'),
+('嫺', 'elegant'),
+('嫺', 'gracious'),
+('嫺', 'refined'),
+('嫻', 'elegant'),
+('嫻', 'refined'),
+('嫻', 'skillful'),
+('嫽', '(Cant.) to provoke'),
+('嫽', 'play with'),
+('嬀', 'crafty'),
+('嬀', 'name of a river in Shanxi'),
+('嬈', 'agony'),
+('嬈', 'charming'),
+('嬈', 'disarrange'),
+('嬈', 'dizzy'),
+('嬈', 'fascinating'),
+('嬈', 'graceful'),
+('嬈', 'ridiculing'),
+('嬈', 'suffer'),
+('嬈', 'troublesome'),
+('嬈', 'weak'),
+('嬉', 'amuse oneself'),
+('嬉', 'enjoy'),
+('嬉', 'play'),
+('嬋', 'beautiful'),
+('嬋', 'graceful'),
+('嬋', 'lovely'),
+('嬋', 'pretty'),
+('嬌', 'seductive and loveable'),
+('嬌', 'tender'),
+('嬖', 'a minion'),
+('嬖', 'favorite'),
+('嬙', 'lady'),
+('嬛', 'apt'),
+('嬛', 'clever'),
+('嬛', 'flatterer'),
+('嬛', 'sycophant'),
+('嬢', 'fat'),
+('嬢', 'mother'),
+('嬢', 'oppressed'),
+('嬢', 'troubled'),
+('嬪', 'court'),
+('嬪', 'court lady'),
+('嬪', 'lady'),
+('嬪', 'palace maid'),
+('嬭', 'breasts'),
+('嬭', 'milk'),
+('嬭', 'suckle'),
+('嬰', 'baby'),
+('嬰', 'bother'),
+('嬰', 'infant'),
+('嬲', '(Cant.) angry'),
+('嬲', 'flirt with'),
+('嬲', 'frolic'),
+('嬲', 'mess up'),
+('嬲', 'play with'),
+('嬲', 'taunt'),
+('嬴', 'be full of'),
+('嬴', 'surname'),
+('嬴', 'to have a surplus'),
+('嬴', 'to win'),
+('嬾', 'languid'),
+('嬾', 'lazy'),
+('嬾', 'listless'),
+('嬿', 'lovely'),
+('孀', 'widow'),
+('孃', 'fat'),
+('孃', 'mother'),
+('孃', 'oppressed'),
+('孃', 'troubled'),
+('孅', 'sharp-pointed'),
+('孅', 'slender'),
+('孅', 'thin'),
+('孌', 'beautiful'),
+('孌', 'docile'),
+('孌', 'lovely'),
+('孌', 'obedient'),
+('子', '1st terrestrial branch'),
+('子', 'child'),
+('子', 'fruit'),
+('子', 'man'),
+('子', 'offspring'),
+('子', 'seed of'),
+('子', 'son'),
+('孑', 'left-over'),
+('孑', 'lonely'),
+('孑', 'remaining'),
+('孔', 'great'),
+('孔', 'hole'),
+('孔', 'opening'),
+('孔', 'orifice'),
+('孕', 'be pregnant'),
+('孕', 'pregnancy'),
+('孖', 'twins'),
+('字', 'character'),
+('字', 'letter'),
+('字', 'word'),
+('存', 'be'),
+('存', 'exist'),
+('存', 'have'),
+('存', 'live'),
+('存', 'living'),
+('存', 'remain'),
+('存', 'survive'),
+('孚', 'brood over eggs'),
+('孚', 'have confidence'),
+('孛', 'comet'),
+('孜', 'be as diligent as possible'),
+('孝', 'filial piety'),
+('孝', 'mourning'),
+('孝', 'obedience'),
+('孟', 'difficult'),
+('孟', 'eminent'),
+('孟', 'first'),
+('孟', 'first in series'),
+('孟', 'great'),
+('孟', 'impudent'),
+('孟', 'series'),
+('孟', 'shrewd'),
+('季', 'end'),
+('季', 'final'),
+('季', 'quarter of year'),
+('季', 'season'),
+('季', 'surname'),
+('孤', 'fatherless'),
+('孤', 'orphan'),
+('孤', 'solitary'),
+('孤', 'solitude'),
+('孥', 'ones children'),
+('学', 'knowledge'),
+('学', 'learn'),
+('学', 'learning'),
+('学', 'school'),
+('孩', 'baby'),
+('孩', 'child'),
+('孩', 'children'),
+('孫', 'descendent'),
+('孫', 'grandchild'),
+('孫', 'surname'),
+('孰', 'who? which? what? which one?'),
+('孱', 'feeble'),
+('孱', 'frail'),
+('孱', 'unfit'),
+('孱', 'weak'),
+('孳', 'breed in large numbers'),
+('孵', 'hatch'),
+('孵', 'sit on eggs'),
+('孶', 'to breed in large numbers'),
+('孶', 'variant of 孳'),
+('學', 'knowledge'),
+('學', 'learn'),
+('學', 'learning'),
+('學', 'school'),
+('學', 'study'),
+('學', 'taught'),
+('孺', 'affection'),
+('孺', 'blood relation'),
+('孺', 'child'),
+('孼', 'concubine'),
+('孼', 'evil'),
+('孼', 'misfortune'),
+('孼', 'sin'),
+('孼', 'son'),
+('孽', 'concubine'),
+('孽', 'evil'),
+('孽', 'ghost'),
+('孽', 'son'),
+('孽', 'son of concubine'),
+('孿', 'twin'),
+('孿', 'twins'),
+('宁', 'calm'),
+('宁', 'garden'),
+('宁', 'healthy'),
+('宁', 'peace'),
+('宁', 'peaceful'),
+('宁', 'serene'),
+('宂', 'duties'),
+('宂', 'mixed affairs'),
+('宂', 'occupation business'),
+('宂', 'scattered'),
+('宅', 'dwelling'),
+('宅', 'grave'),
+('宅', 'home'),
+('宅', 'house'),
+('宅', 'residence'),
+('宇', 'building'),
+('宇', 'eaves'),
+('宇', 'house'),
+('宇', 'structure'),
+('宇', 'universe'),
+('宇', 'whole'),
+('宇', 'world'),
+('守', 'conserve'),
+('守', 'defend'),
+('守', 'guard'),
+('守', 'protect'),
+('守', 'protection'),
+('安', 'peace'),
+('安', 'peaceful'),
+('安', 'peacefulness'),
+('安', 'quiet'),
+('安', 'tranquil'),
+('宊', 'rock, stone (宊 [ 집 가,부딪칠 돌 ])'),
+('宋', 'Song dynasty'),
+('宋', 'surname'),
+('宋', '宋朝'),
+('完', 'complete'),
+('完', 'finish'),
+('完', 'settle'),
+('完', 'whole'),
+('宏', 'great'),
+('宏', 'large'),
+('宏', 'spacious'),
+('宏', 'vast'),
+('宏', 'wide'),
+('宓', 'comfortable'),
+('宓', 'in good health'),
+('宓', 'quiet'),
+('宓', 'secret'),
+('宓', 'silent'),
+('宕', 'cave dwelling'),
+('宕', 'stone quarry'),
+('宗', 'ancestor'),
+('宗', 'ancestry'),
+('宗', 'clan'),
+('宗', 'lineage'),
+('宗', 'religion'),
+('宗', 'root'),
+('官', 'government'),
+('官', 'office'),
+('官', 'official'),
+('官', 'public servant'),
+('官', 'sth to do with the government'),
+('宙', 'house'),
+('宙', 'infinite'),
+('宙', 'infinite time'),
+('宙', 'pillar'),
+('宙', 'ridgepole'),
+('宙', 'time'),
+('宙', 'time as concept'),
+('宙', '우주'),
+('定', 'decide'),
+('定', 'fix'),
+('定', 'settle'),
+('宛', 'as if'),
+('宛', 'crooked'),
+('宛', 'seem'),
+('宜', 'fitting'),
+('宜', 'proper'),
+('宜', 'right'),
+('宜', 'suitable'),
+('宝', 'jewel'),
+('宝', 'precious'),
+('宝', 'rare'),
+('宝', 'treasure'),
+('実', 'honest'),
+('実', 'real'),
+('実', 'sincere'),
+('実', 'true'),
+('客', 'customer'),
+('客', 'guest'),
+('客', 'traveller'),
+('宣', 'announce'),
+('宣', 'declare'),
+('宣', 'proclaim'),
+('室', 'a room'),
+('室', 'chamber'),
+('室', 'home'),
+('室', 'house'),
+('室', 'room'),
+('宥', 'forgive'),
+('宥', 'indulge'),
+('宥', 'pardon'),
+('宦', 'eunuch'),
+('宦', 'government official'),
+('宦', 'officialdom'),
+('宫', 'palace'),
+('宬', 'archives'),
+('宬', 'surname'),
+('宮', 'dwelling'),
+('宮', 'enclose'),
+('宮', 'house'),
+('宮', 'palace'),
+('宮', 'temple'),
+('宰', 'official'),
+('宰', 'to rule'),
+('宰', 'to slaughter'),
+('害', 'destroy'),
+('害', 'harm'),
+('害', 'injure'),
+('害', 'kill'),
+('宴', 'a feast'),
+('宴', 'banquet'),
+('宴', 'feast'),
+('宴', 'to entertain'),
+('宵', 'dark'),
+('宵', 'evening'),
+('宵', 'night'),
+('家', 'a dwelling'),
+('家', 'family'),
+('家', 'home'),
+('家', 'house'),
+('家', 'household'),
+('家', 'residence'),
+('家', 'woman'),
+('宸', 'imperial'),
+('宸', 'imperial palace'),
+('容', 'appearance'),
+('容', 'contain'),
+('容', 'face'),
+('容', 'figure'),
+('容', 'form'),
+('容', 'looks'),
+('宻', 'close'),
+('宻', 'dense'),
+('宻', 'intimate'),
+('宻', 'thick'),
+('宿', 'Chinese'),
+('宿', 'astronomy'),
+('宿', 'constellation'),
+('宿', 'lodge'),
+('宿', 'lodging'),
+('宿', 'rest'),
+('宿', 'sleep'),
+('宿', 'stay overnight'),
+('宿', 'stop'),
+('宿', 'zodiac'),
+('寀', 'feudal estate'),
+('寂', 'desolate'),
+('寂', 'quiet'),
+('寂', 'silent'),
+('寂', 'still'),
+('寃', 'grievance'),
+('寃', 'injustice'),
+('寃', 'wrong'),
+('寄', 'mail'),
+('寄', 'rely on'),
+('寄', 'send'),
+('寄', 'transmit'),
+('寅', '3rd terrestrial branch'),
+('寅', 'respectfully'),
+('寅', 'reverence'),
+('寅', 'to respect'),
+('密', 'close'),
+('密', 'dense'),
+('密', 'intimate'),
+('密', 'thick'),
+('寇', 'bandit'),
+('寇', 'bandits'),
+('寇', 'enemy'),
+('寇', 'invade'),
+('寇', 'invader'),
+('寇', 'thief'),
+('寇', 'thieves'),
+('富', 'abundant'),
+('富', 'ample'),
+('富', 'rich'),
+('富', 'wealth'),
+('富', 'wealthy'),
+('寐', 'be asleep'),
+('寐', 'sleep'),
+('寒', 'chilly'),
+('寒', 'cold'),
+('寒', 'wintry'),
+('寓', 'dwell'),
+('寓', 'lodge'),
+('寓', 'residence'),
+('寔', 'honest'),
+('寔', 'real'),
+('寔', 'solid'),
+('寔', 'true'),
+('寕', 'peace'),
+('寕', 'peaceful'),
+('寕', 'repose'),
+('寕', 'serenity'),
+('寖', 'gradually'),
+('寖', 'little'),
+('寖', 'step by step'),
+('寗', 'a surname'),
+('寗', 'peaceful'),
+('寗', 'rather'),
+('寘', 'discard'),
+('寘', 'put aside'),
+('寘', 'put down'),
+('寛', 'broad'),
+('寜', 'peace'),
+('寜', 'peaceful'),
+('寜', 'repose'),
+('寜', 'serenity'),
+('寝', 'bed chamber'),
+('寝', 'rest'),
+('寝', 'sleep'),
+('寞', 'desolate'),
+('寞', 'lonely'),
+('寞', 'silent'),
+('寞', 'solitary'),
+('寞', 'still'),
+('察', 'examine'),
+('察', 'investigate'),
+('察', 'notice'),
+('寡', 'alone'),
+('寡', 'friendless'),
+('寡', 'widowed'),
+('寢', 'bed chamber'),
+('寢', 'rest'),
+('寢', 'sleep'),
+('寤', 'deserted'),
+('寤', 'empty'),
+('寤', 'few'),
+('寤', 'scarce'),
+('寥', 'deserted'),
+('寥', 'empty'),
+('寥', 'few'),
+('寥', 'scarce'),
+('實', 'fruit'),
+('實', 'honest'),
+('實', 'real'),
+('實', 'reality'),
+('實', 'solid'),
+('實', 'true'),
+('實', 'truth'),
+('寧', 'peace'),
+('寧', 'peaceful'),
+('寧', 'repose'),
+('寧', 'serenity'),
+('寨', 'brothel'),
+('寨', 'outpost'),
+('寨', 'stockade'),
+('寨', 'stronghold'),
+('審', 'examine'),
+('審', 'investigate'),
+('審', 'judge'),
+('寫', 'compose'),
+('寫', 'copy'),
+('寫', 'draw'),
+('寫', 'sketch'),
+('寫', 'write'),
+('寬', 'broad'),
+('寬', 'spacious'),
+('寬', 'vast'),
+('寬', 'wide'),
+('寮', 'hut'),
+('寮', 'shack'),
+('寮', 'shanty'),
+('寰', 'country'),
+('寰', 'great domain'),
+('寰', 'world'),
+('寳', 'jewel'),
+('寳', 'precious'),
+('寳', 'rare'),
+('寳', 'treasure'),
+('寵', 'concubine'),
+('寵', 'favor'),
+('寵', 'favorite'),
+('寶', 'jewel'),
+('寶', 'precious'),
+('寶', 'rare'),
+('寶', 'riches'),
+('寶', 'treasure'),
+('寶', 'valuable'),
+('寸', 'degree'),
+('寸', 'inch'),
+('寸', 'kinship'),
+('寸', 'rad. no. 41'),
+('寸', 'small'),
+('寸', 'tiny'),
+('对', 'correct'),
+('对', 'facing'),
+('对', 'opposed'),
+('对', 'right'),
+('寺', 'court'),
+('寺', 'monastery'),
+('寺', 'office'),
+('寺', 'temple'),
+('対', 'correct'),
+('対', 'facing'),
+('対', 'opposed'),
+('対', 'right'),
+('寿', 'lifespan'),
+('寿', 'long life'),
+('寿', 'old age'),
+('封', 'close'),
+('封', 'envelope'),
+('封', 'feudal'),
+('封', 'hide'),
+('封', 'letter'),
+('封', 'seal'),
+('専', 'monopolize'),
+('専', 'take sole possession'),
+('射', 'arrow'),
+('射', 'bow'),
+('射', 'eject'),
+('射', 'eleventh'),
+('射', 'emit'),
+('射', 'hit'),
+('射', 'issue forth'),
+('射', 'music'),
+('射', 'note'),
+('射', 'official'),
+('射', 'scale'),
+('射', 'shoot'),
+('射', 'title'),
+('尅', 'destroy'),
+('尅', 'overcome'),
+('尅', 'subdue'),
+('将', 'future'),
+('将', 'general'),
+('将', 'going to'),
+('将', 'will'),
+('將', 'commander'),
+('將', 'from now on'),
+('將', 'future'),
+('將', 'general'),
+('將', 'going to'),
+('將', 'hold'),
+('將', 'in the future'),
+('將', 'take'),
+('將', 'will'),
+('專', 'monopolize'),
+('專', 'take sole possession'),
+('尉', 'military rank'),
+('尉', 'officer'),
+('尊', 'honor'),
+('尊', 'respect'),
+('尊', 'revere'),
+('尊', 'venerate'),
+('尊', 'veneration'),
+('尋', 'ancient'),
+('尋', 'look for'),
+('尋', 'search'),
+('尋', 'seek'),
+('尌', 'standing(something) up'),
+('對', '1) Versus 2) a pair, counterpart'),
+('對', 'about'),
+('對', 'concern'),
+('對', 'confront'),
+('對', 'contrasting'),
+('對', 'correct'),
+('對', 'counterpart'),
+('對', 'facing'),
+('對', 'opponent'),
+('對', 'opposed'),
+('對', 'opposite'),
+('對', 'pair'),
+('對', 'right'),
+('對', 'versus'),
+('導', 'conduct'),
+('導', 'direct'),
+('導', 'guide'),
+('導', 'lead'),
+('小', 'insignificant'),
+('小', 'small'),
+('小', 'smallness'),
+('小', 'thing'),
+('小', 'tiny'),
+('少', 'few'),
+('少', 'inadequate'),
+('少', 'less'),
+('少', 'little'),
+('尓', 'that'),
+('尓', 'you'),
+('尔', 'final particle'),
+('尔', 'that'),
+('尔', 'those'),
+('尔', 'you'),
+('尖', 'acute'),
+('尖', 'keen'),
+('尖', 'pointed'),
+('尖', 'sharp'),
+('尙', 'even'),
+('尙', 'fairly'),
+('尙', 'rather'),
+('尙', 'still'),
+('尙', 'yet'),
+('尚', 'even'),
+('尚', 'fairly'),
+('尚', 'rather'),
+('尚', 'still'),
+('尚', 'yet'),
+('尟', 'fresh'),
+('尟', 'surname'),
+('尠', 'rarely'),
+('尠', 'seldom'),
+('尠', 'very few'),
+('尤', 'especially'),
+('尤', 'particularly'),
+('尨', 'dog'),
+('尨', 'hair'),
+('尨', 'shaggy'),
+('尨', 'shaggy haired dog'),
+('尨', 'untidy'),
+('尨', 'variegated'),
+('尫', 'lame'),
+('尭', 'a legendary ancient emperor-sage'),
+('就', 'go to'),
+('就', 'just'),
+('就', 'near'),
+('就', 'simply'),
+('就', 'to approach'),
+('就', 'to come'),
+('尸', 'corpse'),
+('尸', 'rad. no. 44'),
+('尸', 'to impersonate the dead'),
+('尸', 'to preside'),
+('尹', 'director'),
+('尹', 'govern'),
+('尹', 'oversee'),
+('尹', 'surname'),
+('尺', 'Chinese measure approx. foot'),
+('尺', 'Korean foot'),
+('尺', 'ruler'),
+('尺', 'straightedge'),
+('尻', 'buttocks'),
+('尻', 'end of spine'),
+('尻', 'sacrum'),
+('尼', 'Buddhist nun'),
+('尼', 'transliteration'),
+('尽', 'deplete'),
+('尽', 'exhaust'),
+('尽', 'use up'),
+('尾', 'end'),
+('尾', 'extremity'),
+('尾', 'stern'),
+('尾', 'tail'),
+('尿', 'urinate'),
+('尿', 'urine'),
+('局', 'bureau'),
+('局', 'circumstance'),
+('局', 'department'),
+('局', 'office'),
+('屁', 'break wind'),
+('屁', 'buttocks'),
+('屁', 'fart'),
+('居', 'dwell'),
+('居', 'live'),
+('居', 'reside'),
+('居', 'sit'),
+('屆', 'numerary adjunct for time'),
+('屆', 'term'),
+('屇', 'cave'),
+('屇', 'hole'),
+('屈', 'bend'),
+('屈', 'bent'),
+('屈', 'crooked'),
+('屈', 'crouch'),
+('屈', 'flex'),
+('屋', 'building'),
+('屋', 'house'),
+('屋', 'room'),
+('屋', 'shelter'),
+('屍', 'carcass'),
+('屍', 'corpse'),
+('屎', 'dung'),
+('屎', 'excrement'),
+('屎', 'feces'),
+('屏', 'folding screen'),
+('屏', 'shield'),
+('屐', 'clogs'),
+('屐', 'wooden shoes'),
+('屑', 'bits'),
+('屑', 'crumbs'),
+('屑', 'fragments'),
+('屑', 'scraps'),
+('展', 'extend'),
+('展', 'open'),
+('展', 'spread'),
+('展', 'stretch'),
+('展', 'unfold'),
+('屛', 'banish'),
+('屛', 'dismiss'),
+('屛', 'folding'),
+('屛', 'folding screen'),
+('屛', 'reject'),
+('屛', 'screen'),
+('屛', 'suppress'),
+('属', 'belong to'),
+('属', 'category'),
+('属', 'class'),
+('属', 'type'),
+('屠', 'butcher'),
+('屠', 'massacre'),
+('屠', 'slaughter'),
+('屢', 'again and again'),
+('屢', 'frequently'),
+('屢', 'many'),
+('屢', 'often'),
+('層', 'floor'),
+('層', 'layer'),
+('層', 'storey'),
+('層', 'stratum'),
+('履', 'footwear'),
+('履', 'shoes'),
+('履', 'tread'),
+('履', 'walk'),
+('履', 'walk on'),
+('屨', 'footwear'),
+('屨', 'frequently'),
+('屨', 'often'),
+('屨', 'sandal'),
+('屨', 'sandals'),
+('屨', 'straw'),
+('屨', 'straw sandals'),
+('屨', 'tread on'),
+('屨', 'wear'),
+('屬', 'a (biological) genus'),
+('屬', 'a tribe,clan,relation'),
+('屬', 'belong to, be affiliated with'),
+('屬', 'biology'),
+('屬', 'category'),
+('屬', 'class'),
+('屬', 'combine'),
+('屬', 'genus'),
+('屬', 'join'),
+('屬', 'taxonomy'),
+('屬', 'to belong to'),
+('屬', 'type'),
+('屮', 'hand'),
+('屮', 'left'),
+('屮', 'sprout'),
+('屯', 'camp'),
+('屯', 'challenging'),
+('屯', 'difficult'),
+('屯', 'hamlet'),
+('屯', 'quarter'),
+('屯', 'station'),
+('屯', 'troops'),
+('屯', 'village'),
+('屰', 'counteract'),
+('山', 'hill'),
+('山', 'mountain'),
+('山', 'peak'),
+('屹', 'to rise high'),
+('屹', 'to stand erect'),
+('屺', 'a hill with trees or grass-- some give the opposite meaning'),
+('岀', 'go out'),
+('岊', 'foothill'),
+('岌', 'hazardous'),
+('岌', 'high'),
+('岌', 'perilous'),
+('岌', 'steep'),
+('岐', 'fork in road'),
+('岐', 'high'),
+('岐', 'majestic'),
+('岑', 'peak'),
+('岑', 'precipitous'),
+('岑', 'steep'),
+('岒', 'sword, saber, dagger'),
+('岔', 'branch off'),
+('岔', 'diverge'),
+('岔', 'fork in road'),
+('岝', 'name of a mountain in Shandong'),
+('岡', 'hill'),
+('岡', 'ridge or crest of hill'),
+('岣', 'a hill in Hunan'),
+('岧', 'cliff'),
+('岧', 'peak'),
+('岧', 'precipice'),
+('岨', 'uneven'),
+('岩', 'cliff'),
+('岩', 'mountain'),
+('岩', 'rocks'),
+('岫', 'cave'),
+('岫', 'cavern'),
+('岫', 'mountain peak'),
+('岬', 'cape'),
+('岬', 'headland'),
+('岬', 'promontory'),
+('岭', 'mountain peak'),
+('岭', 'mountain ridge'),
+('岱', 'Daishan'),
+('岱', 'one of the Five Sacred Mountains in China'),
+('岳', 'mountain peak'),
+('岳', 'surname'),
+('岵', 'hill'),
+('岵', 'mountain'),
+('岵', 'vegetation'),
+('岷', 'min mountain'),
+('岷', 'min river'),
+('岸', 'bank'),
+('岸', 'beach'),
+('岸', 'coast'),
+('岸', 'shore'),
+('岺', 'mountain peak'),
+('岺', 'mountain ridge'),
+('岾', 'mountain pass'),
+('岾', 'mountain pass(Korean)'),
+('峀', 'cave'),
+('峀', 'cavern'),
+('峀', 'mountain peak'),
+('峋', 'ranges of hills stretching on beyond another irregular peaks'),
+('峒', 'mountain in Gansu province'),
+('峙', 'pile up'),
+('峙', 'stand erect'),
+('峙', 'stand up'),
+('峠', 'climax'),
+('峠', 'crisis'),
+('峠', 'mountain pass'),
+('峣', 'high or tall'),
+('峨', 'lofty'),
+('峩', 'lofty'),
+('峭', 'precipitous'),
+('峭', 'rugged'),
+('峭', 'steep'),
+('峯', 'hump of camel'),
+('峯', 'peak'),
+('峯', 'summit'),
+('峰', 'hump of camel'),
+('峰', 'peak'),
+('峰', 'summit'),
+('峱', 'name of a mountain'),
+('峴', 'mountain in Hubei'),
+('峴', 'steep hill'),
+('島', 'island'),
+('峻', 'high'),
+('峻', 'steep'),
+('峻', 'stern'),
+('峻', 'towering'),
+('峽', 'gorge'),
+('峽', 'isthmus'),
+('峽', 'ravine'),
+('峽', 'strait'),
+('崄', 'high'),
+('崄', 'precipitous'),
+('崄', 'steep'),
+('崆', 'Kongtong mountain'),
+('崇', 'esteem'),
+('崇', 'honor'),
+('崇', 'revere'),
+('崇', 'venerate'),
+('崍', 'mountain in Sichuan province'),
+('崎', 'jagged'),
+('崎', 'rough'),
+('崎', 'rugged'),
+('崎', 'uneven'),
+('崐', 'Kunlun mountains in Jiangsu'),
+('崑', 'Kunlun mountains in Jiang Su province.'),
+('崔', 'high'),
+('崔', 'lofty'),
+('崔', 'surname'),
+('崔', 'towering'),
+('崕', 'cliff'),
+('崕', 'precipice'),
+('崕', 'precipitous'),
+('崖', 'cliff'),
+('崖', 'precipice'),
+('崖', 'precipitous'),
+('崗', 'hill'),
+('崗', 'position'),
+('崗', 'post'),
+('崙', 'Kunlun mountains in Jiangsu'),
+('崛', 'eminent'),
+('崛', 'rise abruptly'),
+('崛', 'towering'),
+('崟', 'cliffs'),
+('崢', 'high'),
+('崢', 'lofty'),
+('崢', 'noble'),
+('崢', 'perilous'),
+('崢', 'steep'),
+('崤', 'mountain in Henan'),
+('崦', 'a mountain in Kansu'),
+('崦', 'where there is a cave into which the sun is said to sink at night'),
+('崧', 'eminent'),
+('崧', 'high mountain'),
+('崧', 'lofty'),
+('崩', 'collapse'),
+('崩', 'rupture'),
+('崩', 'split apart'),
+('崴', 'high'),
+('崴', 'lofty'),
+('崴', 'precipitous'),
+('崽', 'a child'),
+('崽', 'a diminutive'),
+('崽', 'a servant'),
+('嵁', 'rugged'),
+('嵂', 'lofty'),
+('嵋', 'Omei mountain in Sichuan'),
+('嵌', 'fall into'),
+('嵌', 'inlay'),
+('嵌', 'rugged'),
+('嵌', 'set in'),
+('嵎', 'canyon'),
+('嵎', 'mountain recess'),
+('嵐', 'mist'),
+('嵐', 'mountain'),
+('嵐', 'mountain haze'),
+('嵐', 'mountain mist'),
+('嵒', 'cliff'),
+('嵒', 'soar'),
+('嵚', 'lofty'),
+('嵚', 'towering'),
+('嵩', 'high'),
+('嵩', 'lofty'),
+('嵩', 'one of the 5 peaks'),
+('嵩', 'situated in Hunan'),
+('嵬', 'high'),
+('嵬', 'precipitous'),
+('嵬', 'rocky'),
+('嵬', 'rugged'),
+('嵯', 'high'),
+('嵯', 'irregular'),
+('嵯', 'rugged'),
+('嵯', 'towering'),
+('嵾', 'uneven'),
+('嶁', 'Goulou mountain peak in Hunan'),
+('嶂', 'cliff'),
+('嶂', 'mountain barrier'),
+('嶃', 'high'),
+('嶄', 'high'),
+('嶄', 'new'),
+('嶄', 'precipitous'),
+('嶄', 'steep'),
+('嶇', 'rough'),
+('嶇', 'rugged'),
+('嶇', 'sheer'),
+('嶇', 'steep'),
+('嶋', 'island'),
+('嶒', 'lofty'),
+('嶒', 'steep'),
+('嶒', 'towering'),
+('嶔', 'lofty'),
+('嶔', 'towering'),
+('嶙', 'deep'),
+('嶙', 'precipitous'),
+('嶙', 'soar'),
+('嶙', 'staunch'),
+('嶙', 'upright'),
+('嶝', 'path leading up a mountain'),
+('嶠', 'alp'),
+('嶠', 'ghat'),
+('嶠', 'high'),
+('嶠', 'high pointed mountain'),
+('嶢', 'high or tall'),
+('嶧', 'a range of peaks in Shandong and Jiangsu'),
+('嶧', 'the name of a mountain'),
+('嶮', 'high'),
+('嶮', 'precipitous'),
+('嶮', 'steep'),
+('嶰', 'gorge'),
+('嶷', 'a range of mountains in Hunan province'),
+('嶸', 'high'),
+('嶸', 'lofty'),
+('嶸', 'steep'),
+('嶸', 'towering'),
+('嶺', 'mountain'),
+('嶺', 'mountain peak'),
+('嶺', 'mountain ridge'),
+('嶺', 'ridge'),
+('嶼', 'island'),
+('嶽', 'mountain peak'),
+('嶽', 'summit'),
+('巉', 'jagged'),
+('巉', 'precipitous'),
+('巉', 'rugged'),
+('巉', 'steep'),
+('巋', 'grand'),
+('巋', 'lasting'),
+('巋', 'secure'),
+('巋', 'stately'),
+('巍', 'eminent'),
+('巍', 'high'),
+('巍', 'high and large'),
+('巍', 'lofty'),
+('巍', 'majestic'),
+('巒', 'mountain range'),
+('巒', 'pointed mountain'),
+('巓', 'summit of mountain'),
+('巔', 'mountain top'),
+('巔', 'summit of mountain'),
+('巖', 'cave'),
+('巖', 'cliff'),
+('巖', 'grotto'),
+('巖', 'precipice'),
+('川', 'boil'),
+('川', 'flow'),
+('川', 'river'),
+('川', 'stream'),
+('州', 'administrative division'),
+('州', 'commonwealth, county, province'),
+('州', 'province'),
+('州', 'state'),
+('巡', 'cruise'),
+('巡', 'go on circuit'),
+('巡', 'patrol'),
+('巢', 'living quarter in tree'),
+('巢', 'nest'),
+('巣', 'nest'),
+('工', 'artisan'),
+('工', 'craftsman'),
+('工', 'labor'),
+('工', 'laborer'),
+('工', 'work'),
+('工', 'worker'),
+('左', 'direction'),
+('左', 'east'),
+('左', 'improper'),
+('左', 'left'),
+('左', 'unorthodox'),
+('巧', 'clever'),
+('巧', 'ingenious'),
+('巧', 'skillful'),
+('巨', 'chief'),
+('巨', 'enormous'),
+('巨', 'great'),
+('巨', 'large'),
+('巪', 'persons name'),
+('巫', 'shaman'),
+('巫', 'shamanism'),
+('巫', 'sorcerer'),
+('巫', 'witch'),
+('巫', 'wizard'),
+('巭', 'study'),
+('巭', 'worker'),
+('差', 'almost'),
+('差', 'an officer'),
+('差', 'assign'),
+('差', 'difference'),
+('差', 'different'),
+('差', 'dispatch'),
+('差', 'distinguish'),
+('差', 'illness'),
+('差', 'irregular'),
+('差', 'nearly'),
+('差', 'recover'),
+('差', 'rough'),
+('差', 'select'),
+('差', 'to differ'),
+('差', 'uneven'),
+('差', 'wrong'),
+('己', '6th heavenly stem'),
+('己', 'oneself'),
+('己', 'personal'),
+('己', 'private'),
+('己', 'self'),
+('已', 'already'),
+('已', 'finished'),
+('已', 'stop'),
+('巳', '6th terrestrial branch'),
+('巳', 'the hours from 9 to 11'),
+('巴', 'anxiously hope'),
+('巴', 'greatly desire'),
+('巴', 'placename'),
+('巵', 'measuring cup'),
+('巵', 'wine container'),
+('巷', 'alley'),
+('巷', 'lane'),
+('巺', '5th of the 8 trigrams'),
+('巺', 'South-east'),
+('巺', 'mild'),
+('巺', 'modest'),
+('巺', 'obedient'),
+('巻', 'curl'),
+('巻', 'make a comeback'),
+('巻', 'scroll'),
+('巼', 'place name'),
+('巽', '5th of the 8 trigrams'),
+('巽', 'South-east'),
+('巽', 'mild'),
+('巽', 'modest'),
+('巽', 'obedient'),
+('巾', 'KangXi radical number 50'),
+('巾', 'fabric'),
+('巾', 'headscarf'),
+('巾', 'kerchief'),
+('巾', 'piece of cloth'),
+('巾', 'towel'),
+('巾', 'turban'),
+('市', 'city'),
+('市', 'fair'),
+('市', 'market'),
+('市', 'town'),
+('市', 'trade'),
+('布', 'cotton cloth'),
+('布', 'linen'),
+('布', 'textiles'),
+('帆', 'boat'),
+('帆', 'sail'),
+('希', 'expect'),
+('希', 'hope'),
+('希', 'rare'),
+('希', 'strive for'),
+('帑', 'a treasury'),
+('帑', 'public funds'),
+('帕', 'kerchief'),
+('帕', 'turban'),
+('帕', 'veil'),
+('帕', 'wrap'),
+('帖', 'invitation card'),
+('帖', 'notice'),
+('帘', 'flag-sign of a tavern'),
+('帙', 'book cover'),
+('帙', 'case'),
+('帙', 'folding'),
+('帙', 'satchel or bag'),
+('帙', 'volume'),
+('帙', 'wrapper'),
+('帚', 'broom'),
+('帚', 'broomstick'),
+('帛', 'fabrics'),
+('帛', 'property'),
+('帛', 'silk'),
+('帛', 'silks'),
+('帛', 'wealth'),
+('帝', 'emperor'),
+('帝', 'god'),
+('帝', 'supreme ruler'),
+('帥', 'commander'),
+('帥', 'commander-in-chief'),
+('带', 'band'),
+('带', 'belt'),
+('带', 'girdle'),
+('带', 'strap'),
+('带', 'zone'),
+('帨', 'handkerchief'),
+('帨', 'kerchief'),
+('帨', 'shawl'),
+('師', 'army'),
+('師', 'division'),
+('師', 'master'),
+('師', 'mentor'),
+('師', 'military'),
+('師', 'multitude'),
+('師', 'specialist'),
+('師', 'teacher'),
+('師', 'troops'),
+('席', 'banquet'),
+('席', 'mat'),
+('席', 'seat'),
+('席', 'take seat'),
+('帯', 'belt'),
+('帰', 'return'),
+('帰', 'return to'),
+('帰', 'revert to'),
+('帳', 'mosquito net'),
+('帳', 'screen'),
+('帳', 'tent'),
+('帶', 'band'),
+('帶', 'belt'),
+('帶', 'girdle'),
+('帶', 'ribbon'),
+('帶', 'strap'),
+('帶', 'tape'),
+('帶', 'zone'),
+('帷', 'curtain'),
+('帷', 'screen'),
+('帷', 'tent'),
+('常', 'common'),
+('常', 'constant'),
+('常', 'dignified'),
+('常', 'eternal'),
+('常', 'everlasting'),
+('常', 'frequent'),
+('常', 'honorable'),
+('常', 'normal'),
+('常', 'regular'),
+('常', 'righteous'),
+('常', 'upright'),
+('帽', 'cap'),
+('帽', 'cap-like tops'),
+('帽', 'hat'),
+('帿', 'lord'),
+('帿', 'marquis'),
+('帿', 'target in archery'),
+('幀', 'one of pair of'),
+('幀', 'picture'),
+('幀', 'scroll'),
+('幃', 'curtain that forms wall'),
+('幄', 'mosquito net'),
+('幄', 'tent'),
+('幅', 'breadth of'),
+('幅', 'hem'),
+('幅', 'piece'),
+('幅', 'strip'),
+('幇', 'assist'),
+('幇', 'defend'),
+('幇', 'help'),
+('幇', 'shoe upper'),
+('幌', 'cloth screen'),
+('幌', 'curtain'),
+('幎', 'cover with cloth'),
+('幎', 'cover-cloth'),
+('幔', 'curtain'),
+('幔', 'screen'),
+('幔', 'tent'),
+('幕', 'curtain'),
+('幕', 'curtain, screen, veil'),
+('幕', 'screen'),
+('幕', 'tent'),
+('幘', 'conical cap'),
+('幘', 'turban'),
+('幚', 'assist'),
+('幚', 'defend'),
+('幚', 'help'),
+('幚', 'shoe upper'),
+('幞', 'headcloth'),
+('幞', 'turban'),
+('幞', 'wimple'),
+('幟', 'fasten'),
+('幟', 'flag'),
+('幟', 'pennant'),
+('幟', 'sign'),
+('幡', 'banner'),
+('幡', 'flag'),
+('幡', 'pennant'),
+('幡', 'streamer'),
+('幢', 'carriage curtain'),
+('幢', 'sun screen'),
+('幣', 'coins'),
+('幣', 'currency'),
+('幣', 'legal tender'),
+('幨', 'curtain'),
+('幪', 'cover'),
+('幪', 'protect'),
+('幪', 'screen'),
+('幪', 'shelter'),
+('幫', 'assist'),
+('幫', 'help'),
+('幫', 'shoe upper'),
+('幫', 'to defend'),
+('幫', 'to help'),
+('幬', 'cover'),
+('幬', 'cover up'),
+('幬', 'curtain'),
+('幰', 'curtain at front of carriage'),
+('幱', 'official dress'),
+('干', 'dried'),
+('干', 'invade'),
+('干', 'offend'),
+('干', 'oppose'),
+('干', 'shield'),
+('平', 'even'),
+('平', 'flat'),
+('平', 'level'),
+('平', 'peaceful'),
+('平', 'plane'),
+('年', 'new-years'),
+('年', 'persons age'),
+('年', 'year'),
+('幵', 'even'),
+('幵', 'level'),
+('并', 'also'),
+('并', 'annex'),
+('并', 'combine'),
+('并', 'whats more'),
+('幸', 'favor'),
+('幸', 'fortunately'),
+('幸', 'fortune'),
+('幸', 'good'),
+('幸', 'luck'),
+('幸', 'luck(ily)'),
+('幹', 'trunk of tree or of human body'),
+('幺', 'one'),
+('幺', 'small'),
+('幺', 'tiny'),
+('幻', 'fantasy'),
+('幻', 'illusion'),
+('幻', 'mirage'),
+('幼', 'child'),
+('幼', 'childish'),
+('幼', 'immature'),
+('幼', 'infant'),
+('幼', 'young'),
+('幼', 'young child'),
+('幽', 'dark'),
+('幽', 'quiet'),
+('幽', 'secluded'),
+('幽', 'tranquil'),
+('幾', 'a few'),
+('幾', 'how many'),
+('幾', 'how many? how much?'),
+('幾', 'how much'),
+('幾', 'some'),
+('广', 'broad'),
+('广', 'extensive'),
+('广', 'rad. 53'),
+('广', 'wide'),
+('庁', 'central room'),
+('庁', 'hall'),
+('広', 'broad'),
+('広', 'extensive'),
+('広', 'vast'),
+('広', 'wide'),
+('庄', 'hamlet'),
+('庄', 'manor'),
+('庄', 'villa'),
+('庄', 'village'),
+('庇', 'cover'),
+('庇', 'protect'),
+('庇', 'shelter'),
+('庇', 'shield'),
+('床', 'bed'),
+('床', 'chassis'),
+('床', 'couch'),
+('床', 'framework'),
+('庋', 'a cupboard or pantry to store'),
+('序', 'order'),
+('序', 'preface'),
+('序', 'sequence'),
+('序', 'serial order'),
+('序', 'series'),
+('底', 'base'),
+('底', 'bottom'),
+('底', 'logarithm'),
+('底', 'mathematics'),
+('底', 'underneath'),
+('底', 'underside'),
+('庖', 'cooking'),
+('庖', 'cuisine'),
+('庖', 'kitchen'),
+('店', 'hotel'),
+('店', 'inn'),
+('店', 'shop'),
+('店', 'store'),
+('庚', '7th heavenly stem'),
+('庚', 'star'),
+('府', 'government'),
+('府', 'office'),
+('府', 'prefect'),
+('府', 'prefecture'),
+('府', 'warehouse'),
+('庠', 'teach'),
+('庠', 'village school'),
+('度', 'bound'),
+('度', 'degree'),
+('度', 'extent'),
+('度', 'limit'),
+('度', 'manner'),
+('度', 'measure'),
+('度', 'speculate'),
+('度', 'system'),
+('度', 'to consider'),
+('座', 'base'),
+('座', 'seat'),
+('座', 'stand'),
+('庫', 'armory'),
+('庫', 'storehouse'),
+('庫', 'treasury'),
+('庫', 'warehouse'),
+('庭', 'courtyard'),
+('庭', 'garden'),
+('庭', 'spacious hall or yard'),
+('庳', 'a low-built house'),
+('庵', 'Buddhist monastery or nunnery'),
+('庶', 'many'),
+('庶', 'multitude'),
+('庶', 'numerous'),
+('庶', 'various'),
+('康', 'happy'),
+('康', 'healthy'),
+('康', 'peaceful'),
+('康', 'quiet'),
+('庸', 'common'),
+('庸', 'mediocre'),
+('庸', 'ordinary'),
+('庸', 'usual'),
+('庻', 'multitude'),
+('庻', 'numerous'),
+('庻', 'various'),
+('庽', 'dispatch'),
+('庽', 'send'),
+('庾', 'granary'),
+('庾', 'storehouse'),
+('廁', 'lavatory'),
+('廁', 'mingle with'),
+('廁', 'toilet'),
+('廂', 'side-room'),
+('廂', 'theatre box'),
+('廂', 'wing'),
+('廃', 'abrogate'),
+('廃', 'discard'),
+('廃', 'terminate'),
+('廄', 'barnyard'),
+('廄', 'stable'),
+('廈', 'big building'),
+('廈', 'mansion'),
+('廉', 'honest'),
+('廉', 'honorable'),
+('廉', 'pure'),
+('廉', 'spy on'),
+('廉', 'upright'),
+('廊', 'corridor'),
+('廊', 'porch'),
+('廊', 'veranda'),
+('廋', 'conceal'),
+('廋', 'hide'),
+('廋', 'search for'),
+('廋', 'seek'),
+('廌', '해태'),
+('廏', 'barnyard'),
+('廏', 'stable'),
+('廐', 'barnyard'),
+('廐', 'stable'),
+('廑', 'a hut'),
+('廑', 'careful'),
+('廓', 'broad'),
+('廓', 'broaden'),
+('廓', 'circumference'),
+('廓', 'empty'),
+('廓', 'enclosure'),
+('廓', 'enlarge'),
+('廓', 'girdle'),
+('廓', 'large'),
+('廓', 'open'),
+('廓', 'outside'),
+('廓', 'to expand'),
+('廓', 'wall'),
+('廓', 'wide'),
+('廓', 'widen'),
+('廕', 'cover'),
+('廕', 'protect'),
+('廕', 'shade'),
+('廖', 'name of an ancient state'),
+('廖', 'surname'),
+('廚', 'closet'),
+('廚', 'cupboard'),
+('廚', 'kitchen'),
+('廛', 'a store'),
+('廛', 'ground alloted to a retainer'),
+('廛', 'shop'),
+('廝', 'servant'),
+('廞', 'to prepare horses and chariots for battle'),
+('廟', 'court'),
+('廟', 'imperial'),
+('廟', 'imperial court'),
+('廟', 'shrine'),
+('廟', 'temple'),
+('廠', 'factory'),
+('廠', 'mill'),
+('廠', 'plant'),
+('廠', 'workshop'),
+('廡', 'corridor'),
+('廡', 'hallway'),
+('廡', 'luxuriant'),
+('廢', 'abandon'),
+('廢', 'abrogate'),
+('廢', 'discard'),
+('廢', 'terminate'),
+('廣', 'broad'),
+('廣', 'extensive'),
+('廣', 'wide'),
+('廤', 'place'),
+('廤', 'premise'),
+('廤', 'to place'),
+('廧', 'wall'),
+('廨', 'government office'),
+('廨', 'public office'),
+('廩', 'granary'),
+('廩', 'stockpile'),
+('廩', 'store'),
+('廬', 'cottage'),
+('廬', 'hut'),
+('廬', 'name of a mountain'),
+('廱', 'hall'),
+('廱', 'harmonious'),
+('廱', 'pool'),
+('廳', 'an administrative office'),
+('廳', 'central room'),
+('廳', 'hall'),
+('延', 'defer'),
+('延', 'delay'),
+('延', 'extend'),
+('延', 'lengthen'),
+('延', 'postpone'),
+('延', 'stretch'),
+('延', 'the total, a cable(''s) length'),
+('廷', 'court'),
+('廷', '朝廷'),
+('廷', '마을'),
+('廷', '조정'),
+('建', 'build'),
+('建', 'erect'),
+('建', 'establish'),
+('建', 'found'),
+('廻', 'circle around'),
+('廻', 'curving'),
+('廻', 'return'),
+('廼', 'only then'),
+('廼', 'then'),
+('廼', 'thereupon'),
+('廽', 'a time'),
+('廽', 'return'),
+('廽', 'turn around'),
+('廾', 'support'),
+('廾', 'twenty'),
+('廿', 'twentieth'),
+('廿', 'twenty'),
+('弁', 'conical cap worn during Zhou dynasty'),
+('弃', 'abandon'),
+('弃', 'discard'),
+('弃', 'reject'),
+('弄', 'alley'),
+('弄', 'do'),
+('弄', 'fiddle'),
+('弄', 'joke'),
+('弄', 'naughty'),
+('弄', 'play'),
+('弄', 'play or fiddle with'),
+('弄', 'with'),
+('弇', 'cover over'),
+('弇', 'hide'),
+('弇', 'narrow-necked'),
+('弈', 'Chinese chess'),
+('弊', 'bad'),
+('弊', 'criminal'),
+('弊', 'evil'),
+('弊', 'wrong'),
+('弋', 'arrest'),
+('弋', 'catch'),
+('弋', 'shoot with bow'),
+('弍', 'number two'),
+('式', 'formula'),
+('式', 'rule'),
+('式', 'style'),
+('式', 'system'),
+('式', 'type'),
+('弑', 'to kill ones superior'),
+('弒', 'to kill ones superior'),
+('弓', 'KangXi radical number 57'),
+('弓', 'arched'),
+('弓', 'arrow'),
+('弓', 'bow'),
+('弓', 'curved'),
+('弔', 'condole'),
+('弔', 'hang'),
+('弔', 'mourn'),
+('弔', 'pity'),
+('引', 'attract'),
+('引', 'draw out'),
+('引', 'pull'),
+('引', 'to pull'),
+('引', 'to stretch'),
+('弗', 'dollar'),
+('弗', 'negative'),
+('弗', 'not'),
+('弘', 'big'),
+('弘', 'enlarge'),
+('弘', 'expand'),
+('弘', 'great'),
+('弘', 'liberal'),
+('弛', 'loosen'),
+('弛', 'relax'),
+('弛', 'unstring a bow'),
+('弟', 'i'),
+('弟', 'junior'),
+('弟', 'me'),
+('弟', 'young brother'),
+('弟', 'younger brother'),
+('弢', 'bow case'),
+('弢', 'scabbard'),
+('弢', 'sheathe'),
+('弥', 'complete'),
+('弥', 'extensive'),
+('弥', 'fill'),
+('弥', 'full'),
+('弦', 'crescent'),
+('弦', 'hypotenuse'),
+('弦', 'string'),
+('弧', 'arc'),
+('弧', 'crescent'),
+('弧', 'wooden bow'),
+('弩', 'bow'),
+('弩', 'cross-bow'),
+('弩', 'downward stroke'),
+('弭', 'desist'),
+('弭', 'end'),
+('弭', 'quell'),
+('弭', 'stop'),
+('弱', 'delicate'),
+('弱', 'fragile'),
+('弱', 'weak'),
+('弴', 'red lacquer bow'),
+('張', 'expand'),
+('張', 'extend'),
+('張', 'sheet'),
+('張', 'stretch'),
+('強', 'coerce'),
+('強', 'energetic'),
+('強', 'force'),
+('強', 'obstinate'),
+('強', 'powerful'),
+('強', 'strength'),
+('強', 'strong'),
+('強', 'stubborn'),
+('弹', 'bullet'),
+('弹', 'pellet'),
+('弹', 'shell'),
+('弹', 'shot'),
+('强', 'energetic'),
+('强', 'powerful'),
+('强', 'strong'),
+('弼', 'aid'),
+('弼', 'assist'),
+('弼', 'correct'),
+('弼', 'help'),
+('弾', 'a pellet'),
+('弾', 'bullet'),
+('弾', 'shell'),
+('弾', 'shot'),
+('弾', 'variant of 彈'),
+('彀', 'adequate fully'),
+('彀', 'enough'),
+('彀', 'quite'),
+('彂', 'dispatch'),
+('彂', 'emit'),
+('彂', 'issue'),
+('彂', 'send out'),
+('彆', 'awkward'),
+('彆', 'bow'),
+('彆', 'warp'),
+('彈', 'bullet'),
+('彈', 'pellet'),
+('彈', 'shell'),
+('彈', 'shot'),
+('彊', 'strong'),
+('彊', 'stubborn'),
+('彊', 'uncompromising'),
+('彌', 'complete'),
+('彌', 'extensive'),
+('彌', 'fill'),
+('彌', 'full'),
+('彎', 'bend'),
+('彎', 'curve'),
+('当', 'accept'),
+('当', 'bear'),
+('当', 'just'),
+('当', 'undertake'),
+('彔', 'to carve wood'),
+('彖', 'a hedgehog'),
+('彖', 'a hog'),
+('彖', 'a porcupine'),
+('彗', 'broomstick'),
+('彗', 'comet'),
+('彘', 'swine'),
+('彙', 'assemble'),
+('彙', 'collect'),
+('彙', 'collection'),
+('彙', 'compile'),
+('彙', 'hedgehog'),
+('彚', 'assemble'),
+('彚', 'collect'),
+('彚', 'compile'),
+('彚', 'hedgehog'),
+('彛', 'rule'),
+('彛', 'tripod'),
+('彛', 'wine vessel'),
+('彛', 'yi'),
+('彝', 'rule'),
+('彝', 'tripod'),
+('彝', 'wine vessel'),
+('彝', 'yi'),
+('彞', 'tripod'),
+('彞', 'yi'),
+('形', 'appearance'),
+('形', 'form'),
+('形', 'shape'),
+('彤', 'name of ancient'),
+('彤', 'red'),
+('彤', 'vermilion'),
+('彥', 'elegant'),
+('彥', 'handsome'),
+('彥', 'learned'),
+('彦', 'elegant'),
+('彧', 'cultured'),
+('彧', 'polished'),
+('彧', 'refined'),
+('彩', 'color'),
+('彩', 'hue'),
+('彩', 'variegated colors'),
+('彪', 'tiger'),
+('彪', 'tiger stripes'),
+('彪', 'tiger-like'),
+('彫', 'carve'),
+('彫', 'decorate'),
+('彫', 'emaciated'),
+('彬', 'bright'),
+('彬', 'cultivated'),
+('彬', 'well-bred'),
+('彭', 'name of ancient country'),
+('彭', 'surname'),
+('彰', 'clear'),
+('彰', 'manifest'),
+('彰', 'obvious'),
+('影', 'image'),
+('影', 'photograph'),
+('影', 'reflection'),
+('影', 'shadow'),
+('彳', 'slowly'),
+('彳', 'walk'),
+('彷', 'like'),
+('彷', 'resemble'),
+('彷', 'resembling'),
+('役', 'a servant'),
+('役', 'duty'),
+('役', 'laborer'),
+('役', 'role'),
+('役', 'service'),
+('役', 'to serve'),
+('彼', 'that'),
+('彼', 'there'),
+('彼', 'those'),
+('彽', 'wander'),
+('彽', 'waver'),
+('彿', 'as if'),
+('彿', 'like'),
+('彿', 'resembling'),
+('往', 'depart'),
+('往', 'formerly'),
+('往', 'go'),
+('往', 'past'),
+('征', 'attack'),
+('征', 'conquer'),
+('征', 'invade'),
+('徂', 'advance'),
+('徂', 'die'),
+('徂', 'go'),
+('徂', 'to'),
+('径', 'diameter'),
+('径', 'direct'),
+('径', 'narrow path'),
+('待', 'entertain'),
+('待', 'receive'),
+('待', 'treat'),
+('待', 'wait'),
+('徇', 'comply with'),
+('徇', 'display'),
+('徇', 'follow'),
+('很', 'much'),
+('很', 'quite'),
+('很', 'very'),
+('徉', 'hesitating'),
+('徉', 'rove'),
+('徉', 'stray'),
+('徉', 'wonder'),
+('徊', 'hesitain'),
+('徊', 'linger'),
+('徊', 'walk to and fro'),
+('律', 'law'),
+('律', 'principle'),
+('律', 'regulation'),
+('律', 'rule'),
+('律', 'statute'),
+('後', 'after'),
+('後', 'behind'),
+('後', 'descendents'),
+('後', 'rear'),
+('徐', 'calmly'),
+('徐', 'composed'),
+('徐', 'dignified'),
+('徐', 'quietly'),
+('徐', 'slow'),
+('徐', 'slowly'),
+('徐', 'surname'),
+('徑', 'diameter'),
+('徑', 'direct'),
+('徑', 'narrow path'),
+('徑', 'path'),
+('徑', 'shortcut'),
+('徒', 'disciple'),
+('徒', 'follower'),
+('徒', 'foot'),
+('徒', 'gang'),
+('徒', 'go on foot'),
+('徒', 'going'),
+('徒', 'group'),
+('徒', 'in vain'),
+('徒', 'party'),
+('徒', 'useless'),
+('従', 'by'),
+('従', 'from'),
+('従', 'since'),
+('従', 'through'),
+('従', 'whence'),
+('得', 'achieve'),
+('得', 'acquire'),
+('得', 'benefit'),
+('得', 'gain'),
+('得', 'get'),
+('得', 'obtain'),
+('得', 'satisfaction'),
+('徘', 'hesitate'),
+('徘', 'walk back and forth'),
+('徙', 'migrate'),
+('徙', 'move ones abode'),
+('徙', 'shift'),
+('徜', 'lingering'),
+('徜', 'walking and fro'),
+('從', 'by'),
+('從', 'comply'),
+('從', 'follow'),
+('從', 'from'),
+('從', 'obey'),
+('從', 'pursue'),
+('從', 'since'),
+('從', 'through'),
+('從', 'whence'),
+('徠', 'encourage to come'),
+('徠', 'induce'),
+('御', 'chariot'),
+('御', 'drive'),
+('御', 'manage'),
+('御', 'ride'),
+('徧', 'all around'),
+('徧', 'all over'),
+('徧', 'everywhere'),
+('徧', 'universal'),
+('徧', 'widespread'),
+('徨', 'doubtful'),
+('徨', 'irresolute'),
+('徨', 'vacillating'),
+('復', 'again'),
+('復', 'repeat'),
+('復', 'repeatedly'),
+('復', 'return'),
+('循', 'comply with'),
+('循', 'follow'),
+('循', 'obey'),
+('徬', 'to be next to'),
+('徬', 'to wander about'),
+('徬', 'walk along side of'),
+('徭', 'compulsory labor'),
+('徭', 'conscript labor'),
+('微', 'few'),
+('微', 'hidden'),
+('微', 'little'),
+('微', 'minor'),
+('微', 'prefix micro-'),
+('微', 'small'),
+('微', 'trifling'),
+('微', 'trivial'),
+('徯', 'await'),
+('徯', 'dangerous'),
+('徯', 'expect'),
+('徯', 'hope'),
+('徯', 'pathway'),
+('徯', 'wait for'),
+('徳', 'ethics'),
+('徳', 'virtue'),
+('徴', 'summon'),
+('徵', 'musical note'),
+('徵', 'recruit'),
+('徵', 'summon'),
+('德', 'benevolence'),
+('德', 'ethics'),
+('德', 'morality'),
+('德', 'virtue'),
+('徹', 'penetrate'),
+('徹', 'penetrating'),
+('徹', 'pervade'),
+('徼', 'border'),
+('徼', 'frontier'),
+('徼', 'inspect'),
+('徼', 'patrol'),
+('徽', 'a badge'),
+('徽', 'badge'),
+('徽', 'insignia'),
+('心', 'emotion'),
+('心', 'feeling'),
+('心', 'heart'),
+('心', 'intelligence'),
+('心', 'mind'),
+('心', 'soul'),
+('必', 'certainly'),
+('必', 'most certainly'),
+('必', 'must'),
+('必', 'surely'),
+('必', 'without fail'),
+('忉', 'distressed in mind'),
+('忉', 'grieved'),
+('忌', 'envious'),
+('忌', 'fear'),
+('忌', 'jealous'),
+('忍', 'bear'),
+('忍', 'endure'),
+('忍', 'forbear'),
+('忍', 'suffer'),
+('忐', 'nervous'),
+('忐', 'timorous'),
+('忒', 'changeable'),
+('忒', 'excessive'),
+('忒', 'to err'),
+('忒', 'to mistake'),
+('忒', 'too'),
+('忒', 'very-usually of objectionable things'),
+('忖', 'conjecture'),
+('忖', 'guess'),
+('忖', 'suppose'),
+('志', 'determination'),
+('志', 'intention'),
+('志', 'purpose'),
+('志', 'will'),
+('忘', 'forget'),
+('忘', 'miss'),
+('忘', 'neglect'),
+('忘', 'omit'),
+('忙', 'busy'),
+('忙', 'hustling'),
+('忙', 'pressed for time'),
+('応', 'must'),
+('応', 'ought to'),
+('応', 'should'),
+('忝', 'ashamed'),
+('忝', 'disgraced'),
+('忝', 'self-deprecating'),
+('忟', '(Cant.) impatient'),
+('忟', 'restless'),
+('忠', 'devotion'),
+('忠', 'fidelity'),
+('忠', 'loyalty'),
+('忡', 'a sad'),
+('忡', 'uneasy countenance'),
+('忤', 'insubordinate'),
+('忤', 'stubborn'),
+('忤', 'wrong'),
+('快', 'fast'),
+('快', 'quick'),
+('快', 'rapid'),
+('快', 'soon'),
+('快', 'speedy'),
+('忭', 'delighted'),
+('忭', 'pleased'),
+('忮', 'aggressive'),
+('忮', 'perverse'),
+('忮', 'stubborn'),
+('忱', 'sincere'),
+('忱', 'sincerity'),
+('忱', 'truth'),
+('念', 'recall'),
+('念', 'study'),
+('念', 'think of'),
+('念', 'thought'),
+('忷', 'nervous'),
+('忷', 'scared'),
+('忷', 'variant of 恟'),
+('忸', 'be ashamed'),
+('忸', 'be bashful'),
+('忸', 'blush'),
+('忻', 'delightful'),
+('忻', 'joyful'),
+('忻', 'pleasant'),
+('忽', 'abruptly'),
+('忽', 'neglect'),
+('忽', 'suddenly'),
+('忿', 'exasperation'),
+('忿', 'fury'),
+('忿', 'get angry'),
+('怍', 'to be ashamed'),
+('怏', 'discontented'),
+('怏', 'dispirited'),
+('怏', 'sad'),
+('怒', 'anger'),
+('怒', 'angry'),
+('怒', 'fury'),
+('怒', 'passion'),
+('怒', 'rage'),
+('怔', 'a disease resembling neurosis'),
+('怕', 'apprehensive'),
+('怕', 'be afraid of'),
+('怕', 'to fear'),
+('怖', 'fear'),
+('怖', 'frighten'),
+('怖', 'terrified'),
+('怖', 'terror'),
+('怗', 'observant'),
+('怗', 'peaceful'),
+('怗', 'quiet'),
+('怗', 'submissive'),
+('怙', 'persist in'),
+('怙', 'presume on'),
+('怙', 'rely on'),
+('怛', 'grieved'),
+('怛', 'saddened'),
+('怛', 'worried'),
+('怜', 'pity'),
+('怜', 'sympathize'),
+('思', 'bearded'),
+('思', 'consider'),
+('思', 'final particle'),
+('思', 'heavily'),
+('思', 'idea'),
+('思', 'miss'),
+('思', 'ponder'),
+('思', 'think'),
+('思', 'thinking'),
+('思', 'thought'),
+('思', 'yearn'),
+('怠', 'idle'),
+('怠', 'lazy'),
+('怠', 'neglect'),
+('怠', 'negligent'),
+('怠', 'remiss'),
+('怡', 'be glad'),
+('怡', 'harmony'),
+('怡', 'joy'),
+('怡', 'pleasure'),
+('急', 'pressing'),
+('急', 'quick'),
+('急', 'quickly'),
+('急', 'rapid'),
+('急', 'sudden'),
+('急', 'urgent'),
+('怦', 'anxious'),
+('怦', 'ardent'),
+('怦', 'eager'),
+('怦', 'impulsive'),
+('性', 'character'),
+('性', 'nature'),
+('性', 'sex'),
+('怨', 'enmity'),
+('怨', 'hatred'),
+('怨', 'resentment'),
+('怩', 'bashful'),
+('怩', 'look ashamed'),
+('怩', 'shy'),
+('怩', 'timid'),
+('怪', 'odd'),
+('怪', 'peculiar'),
+('怪', 'strange'),
+('怪', 'unusual'),
+('怯', 'afraid'),
+('怯', 'fear'),
+('怯', 'fright'),
+('怯', 'lacking in courage'),
+('怱', 'hastily'),
+('怱', 'hurriedly'),
+('怱', 'in haste'),
+('怳', 'flurried'),
+('怳', 'mad'),
+('怳', 'wild'),
+('怾', 'mountain name'),
+('恁', 'like this'),
+('恁', 'so'),
+('恁', 'such'),
+('恁', 'that'),
+('恁', 'thus'),
+('恂', 'careful'),
+('恂', 'honest'),
+('恂', 'sincere'),
+('恂', 'trust'),
+('恃', 'presume on'),
+('恃', 'rely on'),
+('恃', 'trust to'),
+('恆', 'constant'),
+('恆', 'persistent'),
+('恆', 'regular'),
+('恇', 'fear'),
+('恇', 'tender'),
+('恇', 'weak'),
+('恊', 'be united'),
+('恊', 'cooperate'),
+('恋', 'long for'),
+('恋', 'love'),
+('恋', 'yearn for'),
+('恍', 'absent-minded'),
+('恍', 'seemingly'),
+('恐', 'apprehensive'),
+('恐', 'be'),
+('恐', 'fear'),
+('恐', 'fearful'),
+('恐', 'scared'),
+('恒', 'constant'),
+('恒', 'persistent'),
+('恒', 'regular'),
+('恕', 'excuse'),
+('恕', 'forgive'),
+('恕', 'show mercy'),
+('恙', 'illness'),
+('恙', 'indisposition'),
+('恙', 'sickness'),
+('恚', 'anger'),
+('恚', 'rage'),
+('恝', 'carefree'),
+('恝', 'indifferent manner'),
+('恝', 'without sorrow'),
+('恟', 'nervous'),
+('恟', 'scared'),
+('恠', 'peculiar'),
+('恠', 'strange'),
+('恠', 'unusual'),
+('恢', 'big'),
+('恢', 'great'),
+('恢', 'immense'),
+('恢', 'restore'),
+('恢', 'vast'),
+('恣', 'indulge oneself'),
+('恣', 'unrestrained'),
+('恤', 'help'),
+('恤', 'relieve'),
+('恤', 'show pity'),
+('恥', 'ashamed'),
+('恥', 'humiliation'),
+('恥', 'shame'),
+('恨', 'dislike'),
+('恨', 'hate'),
+('恨', 'hatred'),
+('恨', 'resent'),
+('恨', 'resentment'),
+('恩', 'charity'),
+('恩', 'favor'),
+('恩', 'grace'),
+('恩', 'kindness'),
+('恩', 'mercy'),
+('恪', 'respectful'),
+('恪', 'reverent'),
+('恫', 'in pain'),
+('恫', 'sorrowful'),
+('恬', 'calm'),
+('恬', 'peaceful'),
+('恬', 'quiet'),
+('恬', 'tranquil'),
+('恭', 'polite'),
+('恭', 'respectful'),
+('恭', 'reverent'),
+('息', 'breath'),
+('息', 'cease'),
+('息', 'end'),
+('息', 'put stop to'),
+('息', 'rest'),
+('恰', 'exactly'),
+('恰', 'just'),
+('恰', 'precisely'),
+('恰', 'proper'),
+('恵', 'benefit'),
+('恵', 'confer kindness'),
+('恵', 'favor'),
+('悁', 'impatient'),
+('悁', 'irritable'),
+('悁', 'nervous'),
+('悃', 'genuine'),
+('悃', 'honest'),
+('悃', 'loyal'),
+('悃', 'sincere'),
+('悄', 'anxious'),
+('悄', 'quiet'),
+('悄', 'silent'),
+('悄', 'still'),
+('悅', 'pleased'),
+('悉', 'comprehend'),
+('悉', 'know'),
+('悉', 'learn about'),
+('悋', 'closefisted'),
+('悋', 'sparing of'),
+('悋', 'stingy'),
+('悌', 'brotherly'),
+('悌', 'respectful'),
+('悍', 'brave'),
+('悍', 'courageous'),
+('悍', 'violent'),
+('悒', 'depressed'),
+('悒', 'sorrowful'),
+('悒', 'unhappy'),
+('悔', 'regret'),
+('悔', 'repent'),
+('悔', 'show remorse'),
+('悖', 'against'),
+('悖', 'be contradictory to'),
+('悖', 'go counter'),
+('悚', 'afraid'),
+('悚', 'frightened'),
+('悚', 'scared'),
+('悛', 'reform'),
+('悛', 'repent'),
+('悟', 'become aware'),
+('悟', 'realize'),
+('悟', 'to apprehend'),
+('悠', 'distant'),
+('悠', 'far'),
+('悠', 'liesurely'),
+('悠', 'long'),
+('悠', 'remote'),
+('患', 'suffer'),
+('患', 'suffering'),
+('患', 'worry'),
+('患', 'worry about'),
+('悤', 'agitated'),
+('悤', 'busy'),
+('悤', 'hurried'),
+('悤', 'restless'),
+('悦', 'contented'),
+('悦', 'gratified'),
+('悦', 'pleased'),
+('悧', 'active'),
+('悧', 'clever'),
+('悧', 'sharp'),
+('悧', 'smooth'),
+('悩', 'angered'),
+('悩', 'filled with hate'),
+('悪', 'bad'),
+('悪', 'evil'),
+('悪', 'foul'),
+('悪', 'wicked'),
+('悰', 'amuse'),
+('悰', 'enjoy'),
+('悰', 'joy'),
+('悰', 'please'),
+('悱', 'to be desirous of speaking'),
+('悲', 'grief'),
+('悲', 'sad'),
+('悲', 'sorrow'),
+('悲', 'sorry'),
+('悳', 'ethics'),
+('悳', 'morality'),
+('悳', 'virtue'),
+('悴', 'become emaciated'),
+('悴', 'haggard'),
+('悴', 'suffer'),
+('悵', 'disappointed'),
+('悵', 'dissatisfied'),
+('悶', 'agony'),
+('悶', 'depressed'),
+('悶', 'gloomy'),
+('悶', 'melancholy'),
+('悸', 'apprehensive'),
+('悸', 'fearful'),
+('悸', 'perturbed'),
+('悻', 'anger'),
+('悻', 'angry'),
+('悻', 'indignant'),
+('悻', 'vexation'),
+('悼', 'grieve'),
+('悼', 'grieved'),
+('悼', 'lament'),
+('悼', 'mourn'),
+('悽', 'grieved'),
+('悽', 'melancholy'),
+('悽', 'sorrowful'),
+('悾', 'guileless'),
+('悾', 'naive'),
+('悾', 'simple-minded'),
+('惄', 'hungry'),
+('惄', 'long for'),
+('情', 'emotion'),
+('情', 'feeling'),
+('情', 'sentiment'),
+('惆', 'distressed'),
+('惆', 'regretful'),
+('惆', 'sad'),
+('惇', 'be kind'),
+('惇', 'cordial'),
+('惇', 'sincere'),
+('惋', 'alarmed'),
+('惋', 'be sorry'),
+('惋', 'regret'),
+('惏', 'avaricious'),
+('惏', 'greedy cold'),
+('惑', 'baffle'),
+('惑', 'beguile'),
+('惑', 'captivate'),
+('惑', 'confuse'),
+('惑', 'confusion'),
+('惑', 'doubt'),
+('惑', 'mislead'),
+('惓', 'candid'),
+('惓', 'careful'),
+('惓', 'sincere'),
+('惕', 'alert'),
+('惕', 'be cautious'),
+('惕', 'careful'),
+('惖', 'fear'),
+('惖', 'respect'),
+('惘', 'dejected'),
+('惘', 'disconcerted'),
+('惘', 'discouraged'),
+('惙', 'anxiety'),
+('惙', 'grieving'),
+('惙', 'melancholy'),
+('惙', 'mournful'),
+('惙', 'sad'),
+('惙', 'worry'),
+('惚', 'absent-minded'),
+('惚', 'confused'),
+('惛', 'confused'),
+('惛', 'dull'),
+('惛', 'senile'),
+('惛', 'stupid'),
+('惜', 'begrudge'),
+('惜', 'pity'),
+('惜', 'regret'),
+('惜', 'rue'),
+('惝', 'agitated'),
+('惝', 'alarmed'),
+('惟', 'but'),
+('惟', 'however'),
+('惟', 'nevertheless'),
+('惟', 'only'),
+('惠', 'beautiful'),
+('惠', 'benefit'),
+('惠', 'confer kindness'),
+('惠', 'favor'),
+('惠', 'fine'),
+('惠', 'gentle'),
+('惠', 'good'),
+('惠', 'grace'),
+('惠', 'intelligent'),
+('惠', 'love'),
+('惠', 'nice'),
+('惠', 'wise'),
+('惡', 'bad'),
+('惡', 'evil'),
+('惡', 'foul'),
+('惡', 'hate'),
+('惡', 'wicked'),
+('惡', 'wickedness'),
+('惣', 'overall [questionable variant]'),
+('惨', 'cruel'),
+('惨', 'pitiful'),
+('惨', 'sad'),
+('惨', 'wretched'),
+('惪', 'ethics'),
+('惰', 'careless'),
+('惰', 'idle'),
+('惰', 'indolent'),
+('惰', 'lazy'),
+('惱', 'angered'),
+('惱', 'filled'),
+('惱', 'filled with hate'),
+('惱', 'hate'),
+('惱', 'with'),
+('惲', 'consult'),
+('惲', 'deliberate'),
+('惲', 'devise'),
+('惲', 'plan'),
+('想', 'consider'),
+('想', 'idea'),
+('想', 'plan'),
+('想', 'speculate'),
+('想', 'think'),
+('想', 'thought'),
+('惴', 'afraid'),
+('惴', 'apprehensive'),
+('惴', 'nervous'),
+('惶', 'afraid'),
+('惶', 'anxious'),
+('惶', 'fearful'),
+('惶', 'nervous'),
+('惷', 'fat'),
+('惷', 'silly'),
+('惷', 'stupid'),
+('惷', 'wriggle'),
+('惸', 'distressed'),
+('惸', 'troubled'),
+('惸', 'worried'),
+('惹', 'incite'),
+('惹', 'irritate'),
+('惹', 'offend'),
+('惹', 'vex'),
+('惺', 'astute'),
+('惺', 'clever'),
+('惺', 'intelligent'),
+('惻', 'feel anguish'),
+('惻', 'feel compassion'),
+('惼', 'narrow-minded'),
+('愀', 'be anxious'),
+('愀', 'to blush'),
+('愀', 'to change ones countenance'),
+('愁', 'anxiety'),
+('愁', 'be anxious'),
+('愁', 'to worry about'),
+('愃', 'relax'),
+('愆', 'a fault'),
+('愆', 'error'),
+('愆', 'mistake'),
+('愆', 'transgression'),
+('愈', 'even more'),
+('愈', 'more and more'),
+('愉', 'delightful'),
+('愉', 'pleasant'),
+('愉', 'please'),
+('愍', 'pity'),
+('愍', 'sympathize with'),
+('愎', 'headstrong'),
+('愎', 'obstinate'),
+('愎', 'stubborn'),
+('意', 'idea'),
+('意', 'meaning'),
+('意', 'opinion'),
+('意', 'remember'),
+('意', 'sigh'),
+('意', 'think'),
+('意', 'thought'),
+('愓', 'fast'),
+('愔', 'comfortable'),
+('愔', 'contented'),
+('愔', 'peaceful'),
+('愕', 'alarmed'),
+('愕', 'astonished'),
+('愕', 'startled'),
+('愚', 'doltish'),
+('愚', 'foolish'),
+('愚', 'stupid'),
+('愛', 'be fond of'),
+('愛', 'like'),
+('愛', 'love'),
+('愜', 'be comfortable'),
+('愜', 'be satisfied'),
+('愜', 'comfortable'),
+('愜', 'satisfied'),
+('感', 'emotion'),
+('感', 'feel'),
+('感', 'feeling'),
+('感', 'perceive'),
+('愠', 'angry'),
+('愧', 'ashamed'),
+('愧', 'conscience'),
+('愧', 'conscience-stricken'),
+('愧', 'stricken'),
+('愬', 'accuse'),
+('愬', 'inform'),
+('愬', 'narrate'),
+('愬', 'sue'),
+('愰', 'clearness of mind'),
+('愰', 'doubtful'),
+('愰', 'uncertain'),
+('愴', 'broken-hearted'),
+('愴', 'disconsolate'),
+('愴', 'sad'),
+('愷', 'be contented'),
+('愷', 'ease up'),
+('愷', 'enjoy'),
+('愷', 'joyful'),
+('愷', 'peaceful'),
+('愼', 'act with care'),
+('愼', 'be cautious'),
+('愾', 'anger'),
+('愾', 'enmity'),
+('愾', 'hatred'),
+('愾', 'wrath'),
+('愿', 'honest'),
+('愿', 'sincere'),
+('愿', 'virtuous'),
+('慂', 'egg-on'),
+('慂', 'incite'),
+('慂', 'urge'),
+('慄', 'shiver'),
+('慄', 'shudder'),
+('慄', 'tremble'),
+('慆', 'delight'),
+('慆', 'delighted'),
+('慆', 'dissolute'),
+('慆', 'excessive'),
+('慇', 'anxious'),
+('慇', 'attentive'),
+('慇', 'careful'),
+('慈', 'benevolent'),
+('慈', 'charitable'),
+('慈', 'kind'),
+('慊', 'contended'),
+('慊', 'satisfied'),
+('慊', 'to resent'),
+('態', 'attitude'),
+('態', 'bearing'),
+('態', 'manner'),
+('慌', 'frantic'),
+('慌', 'nervous'),
+('慌', 'panicky'),
+('慍', 'angry'),
+('慍', 'indignant'),
+('慍', 'resentful'),
+('慕', 'admire'),
+('慕', 'desire'),
+('慕', 'long for'),
+('慘', 'cruel'),
+('慘', 'pitiful'),
+('慘', 'sad'),
+('慘', 'wretched'),
+('慙', 'ashamed'),
+('慙', 'humiliated'),
+('慙', 'shameful'),
+('慚', 'ashamed'),
+('慚', 'humiliated'),
+('慚', 'shameful'),
+('慝', 'do evil in secret'),
+('慝', 'evil'),
+('慝', 'vice'),
+('慟', 'be moved'),
+('慟', 'grief'),
+('慟', 'mourn'),
+('慟', 'sadness'),
+('慢', 'leisurely'),
+('慢', 'slow'),
+('慢', 'slow(ly)'),
+('慢', 'sluggish'),
+('慣', 'custom'),
+('慣', 'habit'),
+('慣', 'habitually'),
+('慣', 'usually'),
+('慤', 'honesty'),
+('慤', 'modest'),
+('慤', 'sincerity'),
+('慧', 'ability'),
+('慧', 'bright'),
+('慧', 'craft'),
+('慧', 'cunning'),
+('慧', 'intelligence'),
+('慧', 'intelligent'),
+('慧', 'wile'),
+('慧', 'wisdom'),
+('慧', 'wise'),
+('慨', 'generous'),
+('慨', 'regret'),
+('慨', 'sigh'),
+('慫', 'arouse'),
+('慫', 'incite'),
+('慫', 'to alarm'),
+('慫', 'to instigate'),
+('慮', 'about'),
+('慮', 'be'),
+('慮', 'be concerned'),
+('慮', 'concerned'),
+('慮', 'worry'),
+('慮', 'worry about'),
+('慰', 'calm'),
+('慰', 'comfort'),
+('慰', 'consolation'),
+('慰', 'console'),
+('慱', 'sad'),
+('慳', 'miserly'),
+('慳', 'parsimonious'),
+('慳', 'stingy'),
+('慴', 'fear'),
+('慴', 'fearful'),
+('慴', 'terrified'),
+('慵', 'easy-going'),
+('慵', 'indolent'),
+('慵', 'lazy'),
+('慶', 'celebrate'),
+('慶', 'celebration'),
+('慶', 'congratulate'),
+('慷', 'ardent'),
+('慷', 'generous'),
+('慷', 'magnanimous'),
+('慼', 'mournful'),
+('慼', 'sorrow'),
+('慼', 'sorrowful'),
+('慽', 'mournful'),
+('慽', 'sorrow'),
+('慽', 'sorrowful'),
+('慾', 'appetite'),
+('慾', 'desire'),
+('慾', 'lust'),
+('慾', 'passion'),
+('憂', 'grief'),
+('憂', 'grieved'),
+('憂', 'melancholy'),
+('憂', 'sad'),
+('憃', 'dull'),
+('憃', 'foolish'),
+('憃', 'silly'),
+('憃', 'stupid'),
+('憊', 'fatigued'),
+('憊', 'tired'),
+('憊', 'weary'),
+('憋', 'hasty'),
+('憋', 'to suppress inner feelings'),
+('憍', 'arrogant'),
+('憍', 'be haughty'),
+('憍', 'proud'),
+('憎', 'abhor'),
+('憎', 'detest'),
+('憎', 'hate'),
+('憎', 'hatred'),
+('憐', 'pity'),
+('憐', 'sympathize'),
+('憑', 'depend on'),
+('憑', 'lean'),
+('憑', 'lean on'),
+('憑', 'rely on'),
+('憒', 'confused'),
+('憒', 'foolish'),
+('憒', 'muddle-headed'),
+('憒', 'troubled'),
+('憔', 'be worn-out'),
+('憔', 'emaciated'),
+('憔', 'haggard'),
+('憖', 'but'),
+('憖', 'cautious'),
+('憖', 'moreover'),
+('憖', 'willing'),
+('憘', 'enjoy'),
+('憘', 'joyful thing'),
+('憘', 'like'),
+('憘', 'love'),
+('憙', 'enjoy'),
+('憙', 'joyful thing'),
+('憙', 'like'),
+('憙', 'love'),
+('憚', 'dread'),
+('憚', 'fear'),
+('憚', 'shirk'),
+('憚', 'shrink from'),
+('憝', 'hate'),
+('憝', 'reproach'),
+('憤', 'anger'),
+('憤', 'hate'),
+('憤', 'indignant'),
+('憤', 'resent'),
+('憧', 'indecisive'),
+('憧', 'irresolute'),
+('憧', 'longing'),
+('憧', 'yearn for'),
+('憧', 'yearning'),
+('憨', 'coquettish'),
+('憨', 'foolish'),
+('憨', 'silly'),
+('憨', 'stupid'),
+('憩', 'rest'),
+('憩', 'take rest'),
+('憫', 'for'),
+('憫', 'grieve'),
+('憫', 'grieve for'),
+('憫', 'pity'),
+('憫', 'sympathize'),
+('憫', 'sympathize with'),
+('憫', 'with'),
+('憬', 'awaken'),
+('憬', 'become conscious'),
+('憬', 'rouse'),
+('憮', 'disappointed'),
+('憮', 'regretful'),
+('憯', 'already'),
+('憯', 'nevertheless'),
+('憯', 'sad'),
+('憯', 'sorrowful'),
+('憲', 'constitution'),
+('憲', 'law'),
+('憲', 'statute'),
+('憶', 'memory'),
+('憶', 'reflect upon'),
+('憶', 'remember'),
+('憸', 'crafty'),
+('憸', 'having a specious tongue'),
+('憸', 'to flatter'),
+('憺', 'peace'),
+('憻', 'generous'),
+('憾', 'dissatisfied'),
+('憾', 'remorse'),
+('憾', 'to regret'),
+('懃', 'cordial'),
+('懃', 'courteous'),
+('懃', 'zealous'),
+('懆', 'anxious'),
+('懆', 'apprehensive'),
+('懇', 'cordial'),
+('懇', 'earnest'),
+('懇', 'sincere'),
+('懈', 'idle'),
+('懈', 'relaxed'),
+('懈', 'remiss'),
+('應', 'must'),
+('應', 'ought to'),
+('應', 'respond'),
+('應', 'should'),
+('懊', 'nervous'),
+('懊', 'regret'),
+('懊', 'vexed'),
+('懊', 'worried'),
+('懋', 'grand'),
+('懋', 'majestic'),
+('懋', 'splendid'),
+('懌', 'be glad'),
+('懌', 'be pleased'),
+('懌', 'enjoy'),
+('懕', 'contented'),
+('懕', 'enough'),
+('懕', 'peaceful'),
+('懕', 'satiated'),
+('懕', 'satisfied'),
+('懟', 'abhor'),
+('懟', 'hate'),
+('懟', 'hatred'),
+('懟', 'resentment'),
+('懣', 'be sick at heart'),
+('懣', 'sad'),
+('懣', 'sorrowful'),
+('懦', 'cowardly'),
+('懦', 'timid'),
+('懦', 'weak'),
+('懲', 'punish'),
+('懲', 'reprimand'),
+('懲', 'warn'),
+('懶', 'languid'),
+('懶', 'lazy'),
+('懶', 'listless'),
+('懷', 'bosom'),
+('懷', 'breast'),
+('懷', 'carry in bosom'),
+('懸', 'be hung'),
+('懸', 'hang'),
+('懸', 'hoist'),
+('懸', 'suspend'),
+('懺', 'confess sins'),
+('懺', 'regret'),
+('懺', 'repent'),
+('懼', 'afraid'),
+('懼', 'be afraid of'),
+('懼', 'dread'),
+('懼', 'fear'),
+('懽', 'glad'),
+('懽', 'happy'),
+('懽', 'joyous'),
+('懽', 'pleased'),
+('懾', 'afraid'),
+('懾', 'fearful'),
+('懾', 'scared'),
+('懿', 'admirable'),
+('懿', 'esteemed'),
+('懿', 'virtuous'),
+('戀', 'long for'),
+('戀', 'love'),
+('戀', 'yearn'),
+('戀', 'yearn for'),
+('戄', 'confusion'),
+('戇', 'simple'),
+('戇', 'simple-minded'),
+('戇', 'stupid'),
+('戈', 'halberd'),
+('戈', 'lance'),
+('戈', 'rad. 62'),
+('戈', 'spear'),
+('戊', '5th heavenly stem'),
+('戊', 'fifth'),
+('戊', 'heavenly stem'),
+('戌', '11th terrestrial branch'),
+('戍', 'defend borders'),
+('戍', 'guard frontiers'),
+('戎', 'armaments'),
+('戎', 'arms'),
+('戎', 'military affair'),
+('成', 'accomplishment'),
+('成', 'completed'),
+('成', 'finished'),
+('成', 'fixed'),
+('我', 'I'),
+('我', 'i'),
+('我', 'me'),
+('我', 'my'),
+('我', 'our'),
+('我', 'us'),
+('我', 'we'),
+('戒', 'admonish'),
+('戒', 'caution'),
+('戒', 'warn'),
+('戔', 'little'),
+('戔', 'narrow'),
+('戔', 'small'),
+('戔', 'tiny'),
+('戕', 'hurt'),
+('戕', 'injure'),
+('戕', 'kill'),
+('戕', 'slay'),
+('戕', 'wound'),
+('或', 'either'),
+('或', 'else'),
+('或', 'maybe'),
+('或', 'or'),
+('或', 'perhaps'),
+('戚', 'be related to'),
+('戚', 'grieve'),
+('戚', 'kin'),
+('戚', 'relative'),
+('戚', 'sad'),
+('戝', 'pirate'),
+('戝', 'thief'),
+('戞', 'lance'),
+('戞', 'tap or strike lightly'),
+('戟', 'halberd'),
+('戟', 'halberd with crescent blade'),
+('戠', 'clay'),
+('戡', 'kill'),
+('戡', 'quell'),
+('戡', 'subdue'),
+('戡', 'subjugate'),
+('戢', 'store up'),
+('戢', 'to cease'),
+('戢', 'to put away'),
+('戦', 'battle'),
+('戦', 'fighting'),
+('戦', 'war'),
+('戧', 'support'),
+('戩', 'blessing'),
+('戩', 'destroy'),
+('戩', 'exterminate'),
+('截', 'cut off'),
+('截', 'intersect'),
+('截', 'obstruct'),
+('截', 'sever'),
+('截', 'stop'),
+('戮', 'kill'),
+('戮', 'massacre'),
+('戮', 'oppress'),
+('戯', 'play'),
+('戯', 'show'),
+('戯', 'theatrical play'),
+('戰', 'battle'),
+('戰', 'fight'),
+('戰', 'fighting'),
+('戰', 'war'),
+('戱', 'play'),
+('戱', 'theatrical play'),
+('戲', 'banner'),
+('戲', 'play'),
+('戲', 'shout'),
+('戲', 'show'),
+('戲', 'sigh'),
+('戲', 'theatrical play'),
+('戳', 'chop'),
+('戳', 'prick'),
+('戳', 'seal'),
+('戳', 'stab'),
+('戳', 'stamp'),
+('戴', 'esteem'),
+('戴', 'support'),
+('戴', 'wear on top'),
+('戵', 'a halberd'),
+('戶', 'door'),
+('戶', 'family'),
+('戶', 'hole'),
+('戶', 'house'),
+('戶', 'household'),
+('户', 'door'),
+('户', 'family'),
+('戸', 'door'),
+('戸', 'family'),
+('戹', 'In difficulty'),
+('戹', 'distressed'),
+('戻', 'perverse'),
+('戾', 'perverse'),
+('戾', 'rebellious'),
+('戾', 'recalcitrant'),
+('房', 'building'),
+('房', 'house'),
+('房', 'room'),
+('所', 'location'),
+('所', 'numerary adjunct'),
+('所', 'place'),
+('扁', 'flat'),
+('扁', 'signboard'),
+('扁', 'small'),
+('扁', 'tablet'),
+('扂', 'door'),
+('扂', 'latch'),
+('扃', 'a door bar placed outside a door'),
+('扇', 'door panel'),
+('扇', 'fan'),
+('扈', 'escort'),
+('扈', 'insolent'),
+('扈', 'retinue'),
+('扉', 'door panel'),
+('扊', 'upright bar for fastening door'),
+('手', 'hand'),
+('才', 'ability'),
+('才', 'just'),
+('才', 'only'),
+('才', 'talent'),
+('扎', 'pierce'),
+('扎', 'pull up'),
+('扎', 'struggle free'),
+('扑', 'attack'),
+('扑', 'beat'),
+('扑', 'pound'),
+('扑', 'strike'),
+('扒', 'crawl'),
+('扒', 'crouch'),
+('扒', 'dig up'),
+('扒', 'scratch'),
+('打', 'attack'),
+('打', 'beat'),
+('打', 'fight'),
+('打', 'hit'),
+('打', 'strike'),
+('払', 'brush away'),
+('払', 'dust'),
+('払', 'shake off'),
+('托', 'rely on'),
+('托', 'to hold up with palm'),
+('托', 'to support'),
+('扛', 'carry on shoulders'),
+('扛', 'lift'),
+('扞', 'resist'),
+('扞', 'ward off'),
+('扞', 'withstand'),
+('扣', 'button'),
+('扣', 'knock'),
+('扣', 'rap'),
+('扣', 'strike'),
+('扣', 'tap'),
+('扨', 'pick up with fork or pincers'),
+('扮', 'dress up'),
+('扮', 'dress up as'),
+('扯', 'haul'),
+('扯', 'raise'),
+('扯', 'rip up'),
+('扯', 'tear down'),
+('扱', 'collect'),
+('扱', 'draw in'),
+('扱', 'gather'),
+('扱', 'handle'),
+('扱', 'receive'),
+('扳', 'drag'),
+('扳', 'pull'),
+('扳', 'right itself'),
+('扶', 'crawl'),
+('扶', 'creep'),
+('扶', 'help'),
+('扶', 'hold on'),
+('扶', 'protect'),
+('扶', 'support'),
+('批', 'comment'),
+('批', 'criticize'),
+('批', 'wholesale'),
+('扼', 'choke'),
+('扼', 'clutch'),
+('扼', 'grasp'),
+('扼', 'strangle'),
+('找', 'find'),
+('找', 'look for'),
+('找', 'search'),
+('找', 'seek'),
+('承', 'help'),
+('承', 'inherit'),
+('承', 'receive'),
+('承', 'succeed'),
+('技', 'ability'),
+('技', 'ingenuity'),
+('技', 'skill'),
+('技', 'talent'),
+('抃', 'cheer'),
+('抃', 'to cheer'),
+('抃', 'to clap hands'),
+('抄', 'confiscate'),
+('抄', 'copy'),
+('抄', 'seize'),
+('抆', 'rub off'),
+('抆', 'wipe'),
+('抉', 'choose'),
+('抉', 'gouge'),
+('抉', 'pluck out'),
+('抉', 'select'),
+('把', 'guard'),
+('把', 'hold'),
+('把', 'regard as'),
+('把', 'take'),
+('抑', 'curb'),
+('抑', 'hinder'),
+('抑', 'press down'),
+('抑', 'repress'),
+('抒', 'eliminate'),
+('抒', 'express'),
+('抒', 'relieve'),
+('抓', 'clutch'),
+('抓', 'grab'),
+('抓', 'scratch'),
+('抓', 'seize'),
+('抔', 'take or hold up in both hands'),
+('投', 'cast'),
+('投', 'fling'),
+('投', 'jump'),
+('投', 'pitch'),
+('投', 'throw'),
+('抖', 'give shake'),
+('抖', 'rouse'),
+('抖', 'shake'),
+('抖', 'tremble'),
+('抗', 'against'),
+('抗', 'defy'),
+('抗', 'fight'),
+('抗', 'oppose'),
+('抗', 'reject'),
+('抗', 'resist'),
+('折', 'bend'),
+('折', 'break off'),
+('折', 'snap'),
+('抛', 'throw'),
+('抛', 'throw(away)'),
+('抜', 'pull out'),
+('抜', 'uproot'),
+('択', 'choose'),
+('択', 'pick out'),
+('択', 'select'),
+('抨', 'attack'),
+('抨', 'censure'),
+('抨', 'impeach'),
+('披', 'crack'),
+('披', 'split'),
+('披', 'wear'),
+('抬', 'carry'),
+('抬', 'lift'),
+('抱', 'embrace'),
+('抱', 'enfold'),
+('抱', 'hold in arms'),
+('抵', 'deny'),
+('抵', 'off-set'),
+('抵', 'oppose'),
+('抵', 'resist'),
+('抹', 'apply'),
+('抹', 'erase'),
+('抹', 'smear'),
+('抹', 'wipe off'),
+('抻', 'stretch'),
+('抻', '늘이다'),
+('押', 'deposit'),
+('押', 'detain'),
+('押', 'guard'),
+('押', 'mortgage'),
+('押', 'pledge'),
+('押', 'to arrest'),
+('押', 'to pawn'),
+('抽', 'draw out'),
+('抽', 'pull out'),
+('抽', 'sprout'),
+('拂', 'aid'),
+('拂', 'assist'),
+('拂', 'brush away'),
+('拂', 'dust'),
+('拂', 'help'),
+('拂', 'shake off'),
+('拄', 'lean on'),
+('拄', 'post'),
+('拄', 'prod'),
+('拄', 'ridicule'),
+('担', 'bear'),
+('担', 'carry'),
+('担', 'undertake'),
+('拆', 'rip open'),
+('拆', 'split apart'),
+('拆', 'to break up'),
+('拆', 'to destroy'),
+('拇', 'big toe'),
+('拇', 'thumb'),
+('拈', 'draw lots'),
+('拈', 'pick up with fingers'),
+('拉', 'drag'),
+('拉', 'hold'),
+('拉', 'lengthen'),
+('拉', 'pull'),
+('拉', 'seize'),
+('拊', 'handle of a vessel'),
+('拊', 'pat'),
+('拊', 'slap'),
+('拊', 'tap'),
+('拋', 'abandon'),
+('拋', 'reject'),
+('拋', 'throw(away)'),
+('拌', 'mix'),
+('拍', 'beat'),
+('拍', 'beat or rhythm'),
+('拍', 'clap'),
+('拍', 'rhythm'),
+('拍', 'shoulder'),
+('拍', 'tap'),
+('拏', 'arrest'),
+('拏', 'bring'),
+('拏', 'grasp'),
+('拏', 'hold'),
+('拏', 'take'),
+('拐', 'abduct'),
+('拐', 'falsify'),
+('拐', 'kidnap'),
+('拐', 'turn'),
+('拑', 'tie down or pin down'),
+('拑', 'to clamp'),
+('拒', 'defend'),
+('拒', 'ward off with hand'),
+('拓', 'develop'),
+('拓', 'expand'),
+('拓', 'inscriptions'),
+('拓', 'open'),
+('拓', 'open up'),
+('拓', 'rubbings'),
+('拓', 'support or push'),
+('拔', 'overgrown'),
+('拔', 'pick'),
+('拔', 'pluck'),
+('拔', 'pull'),
+('拔', 'pull out'),
+('拔', 'thick'),
+('拔', 'uproot'),
+('拕', 'drag'),
+('拕', 'from which comes:to involve'),
+('拕', 'haul'),
+('拕', 'to delay'),
+('拕', 'to drag after'),
+('拕', 'to drag out'),
+('拕', 'to implicate'),
+('拖', 'delay'),
+('拖', 'drag'),
+('拖', 'haul'),
+('拖', 'prolong'),
+('拖', 'tow'),
+('拗', 'bent'),
+('拗', 'break off'),
+('拗', 'drag'),
+('拗', 'obstinate'),
+('拗', 'perverse'),
+('拗', 'to pluck(a flower)'),
+('拗', 'to pull'),
+('拗', 'warped'),
+('拘', 'detain'),
+('拘', 'restrain'),
+('拘', 'seize'),
+('拙', 'clumsy'),
+('拙', 'convention'),
+('拙', 'crude'),
+('拙', 'stupid'),
+('招', 'beckon'),
+('招', 'levy'),
+('招', 'recruit'),
+('招', 'summon'),
+('拜', 'bow'),
+('拜', 'do obeisance'),
+('拜', 'kowtow'),
+('拜', 'obeisance'),
+('拜', 'worship'),
+('拠', 'a base'),
+('拠', 'position'),
+('拠', 'take possession of'),
+('拠', 'to occupy'),
+('拡', 'enlarge'),
+('拡', 'expand'),
+('拡', 'stretch'),
+('拨', 'dispel'),
+('拨', 'distribute'),
+('拨', 'move'),
+('括', 'embrace'),
+('括', 'enclose'),
+('括', 'encompass'),
+('括', 'include'),
+('括', 'inclusion'),
+('拭', 'wipe'),
+('拭', 'wipe away stains with cloth'),
+('拮', 'laboring hard'),
+('拮', 'occupied'),
+('拮', 'pursue'),
+('拯', 'aid'),
+('拯', 'help'),
+('拯', 'lift'),
+('拯', 'raise'),
+('拯', 'save'),
+('拱', 'bow'),
+('拱', 'fold hands on breast'),
+('拱', 'salute'),
+('拳', 'fist'),
+('拳', 'various forms of boxing'),
+('拵', 'an arrangement'),
+('拵', 'manufacture'),
+('拵', 'prepare'),
+('拵', 'to make'),
+('拵', 'workmanship'),
+('拶', 'force'),
+('拶', 'press'),
+('拶', 'squeeze hard'),
+('拷', 'hit'),
+('拷', 'torture and interrogate'),
+('拼', 'incorporate'),
+('拼', 'join together'),
+('拼', 'link'),
+('拽', 'drag'),
+('拽', 'throw'),
+('拽', 'tow'),
+('拽', 'twist'),
+('拾', 'accounting form of the numeral ten'),
+('拾', 'climb up'),
+('拾', 'collect'),
+('拾', 'pick up'),
+('拾', 'ten'),
+('拾', 'tidy up'),
+('拿', 'bring'),
+('拿', 'grasp'),
+('拿', 'hold'),
+('拿', 'take'),
+('拿', 'with'),
+('持', 'grasp'),
+('持', 'hold'),
+('持', 'support'),
+('持', 'sustain'),
+('挂', 'hang'),
+('挂', 'suspend'),
+('挂', 'suspense'),
+('指', 'finger'),
+('指', 'indicate'),
+('指', 'point'),
+('指', 'toe'),
+('挈', 'assist'),
+('挈', 'help'),
+('挈', 'lead by hand'),
+('按', 'press down with hand'),
+('按', 'put hand on'),
+('挌', 'fight'),
+('挐', 'drag'),
+('挑', 'a load carried on the shoulders'),
+('挑', 'carried'),
+('挑', 'carry'),
+('挑', 'load'),
+('挑', 'shoulders'),
+('挑', 'to carry'),
+('挨', 'against'),
+('挨', 'close by'),
+('挨', 'near'),
+('挨', 'next to'),
+('挨', 'to lean on'),
+('挨', 'to wait'),
+('挨', 'towards'),
+('挪', 'move'),
+('挪', 'shift on one side'),
+('挫', 'bend'),
+('挫', 'chop down'),
+('挫', 'flex'),
+('挫', 'grind'),
+('挫', 'push down'),
+('振', 'arouse action'),
+('振', 'excite'),
+('振', 'raise'),
+('挹', 'to bale out'),
+('挹', 'to decant liquids'),
+('挺', 'rigid'),
+('挺', 'straighten'),
+('挺', 'to stand upright'),
+('挽', 'draw back'),
+('挽', 'pull'),
+('挽', 'pull back'),
+('挾', 'clasp under arm'),
+('挾', 'hold to bosom'),
+('捂', 'resist'),
+('捄', 'long and curved'),
+('捆', 'bind'),
+('捆', 'bundle'),
+('捆', 'tie up'),
+('捆', 'truss up'),
+('捉', 'catch'),
+('捉', 'clutch'),
+('捉', 'grasp'),
+('捉', 'seize'),
+('捌', 'an accounting version of the numeral eight'),
+('捌', 'break open'),
+('捌', 'split open'),
+('捍', 'defend'),
+('捍', 'guard against'),
+('捍', 'ward off'),
+('捎', 'to carry'),
+('捎', 'to select'),
+('捎', 'to take'),
+('捏', 'knead'),
+('捏', 'mold'),
+('捏', 'pick with fingers'),
+('捐', 'contribute'),
+('捐', 'give up'),
+('捐', 'renounce'),
+('捕', 'arrest'),
+('捕', 'catch'),
+('捕', 'seize'),
+('捗', 'make progress'),
+('换', 'change'),
+('捥', 'arm'),
+('捧', 'hold up in two hands'),
+('捨', 'discard'),
+('捨', 'give alms'),
+('捨', 'give up willingly'),
+('捩', 'snap'),
+('捩', 'tear'),
+('捩', 'twist with hands'),
+('捫', 'feel by hand'),
+('捫', 'grope'),
+('捫', 'pat'),
+('捫', 'stoke'),
+('据', 'a base'),
+('据', 'position'),
+('据', 'take possession of'),
+('据', 'to occupy'),
+('捱', 'endure'),
+('捱', 'procrastinate'),
+('捱', 'put off'),
+('捲', 'curl'),
+('捲', 'curly'),
+('捲', 'roll up'),
+('捲', 'rolled up'),
+('捶', 'beat'),
+('捶', 'lash'),
+('捶', 'strike with stick'),
+('捷', 'triumph'),
+('捷', 'victory'),
+('捷', 'win'),
+('捺', 'to press down heavily with the fingers'),
+('捻', 'to twist or nip with the fingers'),
+('捿', 'perch'),
+('捿', 'roost'),
+('捿', 'stay'),
+('掀', 'lift'),
+('掀', 'raise'),
+('掀', 'stir'),
+('掃', 'clear away'),
+('掃', 'exterminate'),
+('掃', 'sweep'),
+('掄', 'brandish'),
+('掄', 'flourish'),
+('掄', 'lawn'),
+('掄', 'swing'),
+('掇', 'collect'),
+('掇', 'gather up'),
+('掇', 'pick up'),
+('授', 'confer'),
+('授', 'give'),
+('授', 'give to'),
+('授', 'transmit'),
+('掉', 'drop down'),
+('掉', 'move'),
+('掉', 'shake'),
+('掉', 'turn'),
+('掉', 'wag'),
+('掊', 'apart'),
+('掊', 'collect'),
+('掊', 'deep'),
+('掊', 'exploit'),
+('掊', 'gather'),
+('掊', 'injure'),
+('掊', 'push'),
+('掊', 'to extract'),
+('掌', 'hand'),
+('掌', 'of'),
+('掌', 'palm'),
+('掌', 'palm of hand'),
+('掌', 'paw'),
+('掌', 'sole of foot'),
+('掌', 'the'),
+('掎', 'drag aside'),
+('掎', 'drag one foot'),
+('掎', 'pull'),
+('掏', 'clean out'),
+('掏', 'pull out'),
+('掏', 'take out'),
+('排', 'line'),
+('排', 'rank'),
+('排', 'row'),
+('掖', 'fold up'),
+('掖', 'stick in'),
+('掖', 'support with the arms'),
+('掖', 'tuck in'),
+('掘', 'dig'),
+('掘', 'excavate'),
+('掘', 'excavate cave'),
+('掛', 'divide'),
+('掛', 'hang'),
+('掛', 'suspend'),
+('掛', 'suspense'),
+('掟', '(Cant.) to throw'),
+('掟', 'commandments'),
+('掟', 'law'),
+('掟', 'regulations'),
+('掠', 'beat'),
+('掠', 'flog'),
+('掠', 'pass by'),
+('掠', 'plunder'),
+('掠', 'ransack'),
+('掠', 'rob'),
+('採', 'collect'),
+('採', 'gather'),
+('採', 'pick'),
+('採', 'select'),
+('探', 'find'),
+('探', 'grope for'),
+('探', 'locate'),
+('探', 'search'),
+('掣', 'drag'),
+('掣', 'hinder by pulling back'),
+('掣', 'pull'),
+('接', 'catch'),
+('接', 'connect'),
+('接', 'continue'),
+('接', 'receive'),
+('接', 'touch'),
+('控', 'accuse'),
+('控', 'charge'),
+('控', 'control'),
+('推', 'expel'),
+('推', 'push'),
+('推', 'push forward'),
+('掩', 'ambush'),
+('掩', 'conceal'),
+('掩', 'shut'),
+('掩', 'to cover(with the hand)'),
+('措', 'arrange'),
+('措', 'collect'),
+('措', 'employ'),
+('措', 'place'),
+('掬', 'to grasp or hold with both hands'),
+('掲', 'equip'),
+('掲', 'to install'),
+('掲', 'to lay(a foundation)'),
+('掲', 'to set(a table)'),
+('掻', 'scratch lightly'),
+('掾', 'a general designation of officials'),
+('揀', 'choose'),
+('揀', 'gather'),
+('揀', 'pick up'),
+('揀', 'select'),
+('揃', '(Cant.) to skin an animal'),
+('揃', 'shear'),
+('揄', 'flap'),
+('揄', 'hang'),
+('揄', 'lift'),
+('揄', 'praise'),
+('揄', 'raise'),
+('揆', 'estimate'),
+('揆', 'prime minister'),
+('揆', 'to guess'),
+('揉', 'crush by hand'),
+('揉', 'massage'),
+('揉', 'rub'),
+('描', 'copy'),
+('描', 'depict'),
+('描', 'sketch'),
+('描', 'trace'),
+('提', 'carry'),
+('提', 'fly'),
+('提', 'hold in hand'),
+('提', 'lift'),
+('提', 'lift in hand'),
+('插', 'insert'),
+('插', 'plant'),
+('插', 'stick into'),
+('揕', 'stab'),
+('揕', 'strike'),
+('揖', 'bow'),
+('揖', 'defer to'),
+('揖', 'salute'),
+('揖', 'yield'),
+('揚', 'praise'),
+('揚', 'scatter'),
+('揚', 'spread'),
+('換', 'a money exchange, changing currencies'),
+('換', 'change'),
+('換', 'exchange'),
+('換', 'substitute'),
+('揜', 'cover up'),
+('揜', 'shut'),
+('揜', 'take by force'),
+('揠', 'extract'),
+('揠', 'pull out'),
+('揠', 'to eradicate'),
+('揠', 'to pull up'),
+('握', 'fast'),
+('握', 'grasp'),
+('握', 'hand'),
+('握', 'hold'),
+('握', 'hold fast'),
+('握', 'take'),
+('握', 'take by hand'),
+('揣', 'put things under clothes'),
+('揩', 'clean'),
+('揩', 'dust'),
+('揩', 'rub and wipe'),
+('揫', 'grasp with hand'),
+('揫', 'pinch'),
+('揭', 'lift'),
+('揭', 'lift up'),
+('揭', 'raise'),
+('揭', 'surname'),
+('揮', 'direct'),
+('揮', 'squander'),
+('揮', 'wipe away'),
+('揲', 'fold'),
+('揲', 'to fold'),
+('揲', 'to sort out the stalks used in divination'),
+('援', 'aid'),
+('援', 'assist'),
+('援', 'cite'),
+('援', 'lead'),
+('揵', 'carry'),
+('揶', 'make fun of'),
+('揶', 'ridicule'),
+('揷', 'insert'),
+('搆', 'drag'),
+('搆', 'implicate'),
+('搆', 'pull'),
+('搆', 'reach'),
+('搉', 'knock'),
+('搉', 'pick out'),
+('搉', 'ridicule'),
+('損', 'diminish'),
+('損', 'impair'),
+('損', 'injure'),
+('搏', 'seize'),
+('搏', 'spring upon'),
+('搏', 'strike'),
+('搐', 'convulsion'),
+('搐', 'cramp'),
+('搐', 'spasm'),
+('搐', 'twitch'),
+('搒', 'beat'),
+('搒', 'pole'),
+('搓', 'to rub or roll between the hands'),
+('搔', 'to scratch'),
+('搖', 'scull'),
+('搖', 'shake'),
+('搖', 'swing'),
+('搖', 'wag'),
+('搖', 'wave'),
+('搗', 'attack'),
+('搗', 'beat'),
+('搗', 'hull'),
+('搗', 'thresh'),
+('搜', 'investigate'),
+('搜', 'search'),
+('搜', 'seek'),
+('搢', 'to shake'),
+('搢', 'to stick into'),
+('搤', 'defend'),
+('搤', 'grab'),
+('搤', 'hold'),
+('搤', 'obstruct'),
+('搤', 'seize'),
+('搤', 'tie up'),
+('搥', 'beat'),
+('搥', 'pound'),
+('搥', 'shampoo'),
+('搥', 'strike'),
+('搥', 'throw'),
+('搨', 'make rubbings of inscription'),
+('搨', 'rub'),
+('搪', 'block'),
+('搪', 'evade'),
+('搪', 'parry'),
+('搪', 'ward off'),
+('搬', 'move'),
+('搬', 'remove'),
+('搬', 'shift'),
+('搬', 'transfer'),
+('搭', 'add to'),
+('搭', 'attach to'),
+('搭', 'join together'),
+('搯', 'pull out'),
+('搯', 'take out'),
+('搰', '(Cant.) to shake'),
+('搰', 'dig'),
+('搰', 'exert'),
+('搰', 'tarnish'),
+('搰', 'turbid'),
+('搶', 'plunder'),
+('搶', 'rob'),
+('搶', 'take by force'),
+('携', 'carry'),
+('携', 'lead by hand'),
+('携', 'take with'),
+('搽', 'anoint'),
+('搽', 'rub'),
+('搽', 'smear'),
+('搽', 'wipe'),
+('搾', 'extract'),
+('搾', 'press'),
+('搾', 'squeeze'),
+('搾', 'to crush with the hand'),
+('摂', 'absorb'),
+('摂', 'act as deputy'),
+('摂', 'take in'),
+('摑', 'hit'),
+('摒', 'arrange'),
+('摒', 'cast off'),
+('摒', 'expel'),
+('摘', 'pick'),
+('摘', 'pluck'),
+('摘', 'select'),
+('摘', 'specify'),
+('摠', 'general'),
+('摧', 'break'),
+('摧', 'destroy'),
+('摧', 'injure'),
+('摩', 'chafe'),
+('摩', 'friction'),
+('摩', 'grind'),
+('摩', 'rub'),
+('摩', 'scour'),
+('摭', 'gather'),
+('摭', 'pick up'),
+('摯', 'cordial'),
+('摯', 'sincere'),
+('摯', 'surname'),
+('摯', 'warm'),
+('摳', 'lift up'),
+('摳', 'raise'),
+('摳', 'tight-fisted'),
+('摸', 'caress'),
+('摸', 'gently touch with hand'),
+('摹', 'copy'),
+('摹', 'duplicate'),
+('摹', 'pattern'),
+('摹', 'trace'),
+('摺', 'bend'),
+('摺', 'curved'),
+('摺', 'fold'),
+('摺', 'twisted'),
+('摻', 'a delicate hand'),
+('摻', 'adulterate'),
+('摻', 'blend'),
+('摻', 'mix'),
+('摽', 'push out'),
+('摽', 'strike'),
+('摽', 'throw out'),
+('撃', 'attack'),
+('撃', 'beat'),
+('撃', 'fight'),
+('撃', 'hit'),
+('撃', 'strike'),
+('撅', 'break'),
+('撅', 'dig'),
+('撅', 'protrude'),
+('撅', 'snap'),
+('撈', 'dredge'),
+('撈', 'fish'),
+('撈', 'scoop out of water'),
+('撐', 'brace'),
+('撐', 'prop up'),
+('撐', 'support'),
+('撐', 'to push off(with a pole)'),
+('撑', 'brace'),
+('撑', 'prop up'),
+('撑', 'support'),
+('撒', 'cast away'),
+('撒', 'disperse'),
+('撒', 'let go'),
+('撒', 'relax'),
+('撒', 'release'),
+('撒', 'scatter'),
+('撒', 'sprinkle'),
+('撒', 'strew'),
+('撓', 'bother'),
+('撓', 'disturb'),
+('撓', 'scratch'),
+('撓', 'submit'),
+('撕', 'buy cloth'),
+('撕', 'rip'),
+('撕', 'tear'),
+('撙', 'abide by'),
+('撙', 'comply with'),
+('撙', 'economize'),
+('撚', 'tease'),
+('撚', 'toy with'),
+('撚', 'twirl in fingers'),
+('撝', 'brandish'),
+('撝', 'humble'),
+('撝', 'modest'),
+('撝', 'wave'),
+('撞', 'bump into'),
+('撞', 'collide'),
+('撞', 'knock against'),
+('撟', 'correct'),
+('撟', 'hold'),
+('撟', 'massage'),
+('撟', 'to bend or twist'),
+('撟', 'to feign'),
+('撟', 'to raise(the hand)'),
+('撤', 'omit'),
+('撤', 'remove'),
+('撤', 'withdraw'),
+('撥', 'dispel'),
+('撥', 'distribute'),
+('撥', 'move'),
+('撥', 'play stringed instrument'),
+('撥', 'plectrum'),
+('撩', 'depart'),
+('撩', 'leave'),
+('撩', 'lift up'),
+('撩', 'raise'),
+('撫', 'comfort'),
+('撫', 'console'),
+('撫', 'pacify'),
+('撫', 'pat'),
+('播', 'broadcast'),
+('播', 'case away'),
+('播', 'reject'),
+('播', 'scatter'),
+('播', 'sow'),
+('播', 'spray'),
+('播', 'spread'),
+('撮', 'little bit'),
+('撮', 'photo'),
+('撮', 'pinch'),
+('撮', 'record'),
+('撮', 'small amount'),
+('撮', 'take'),
+('撮', 'video'),
+('撰', 'compile'),
+('撰', 'compose'),
+('撰', 'write'),
+('撲', 'attack'),
+('撲', 'beat'),
+('撲', 'pound'),
+('撲', 'strike'),
+('撹', 'agitate'),
+('撹', 'disturb'),
+('撹', 'stir up'),
+('撻', '(Cant.) classifier for places'),
+('撻', 'a tart(from the English tart)'),
+('撻', 'chastise'),
+('撻', 'flog'),
+('撻', 'whip'),
+('撼', '(Cant.) to fight'),
+('撼', 'move'),
+('撼', 'shake'),
+('撾', 'to beat'),
+('撾', 'to strike'),
+('撿', 'to pick up'),
+('擁', 'crowd'),
+('擁', 'embrace'),
+('擁', 'hug'),
+('擁', 'squeeze'),
+('擄', 'capture'),
+('擄', 'seize'),
+('擅', 'arbitrarily'),
+('擅', 'claim'),
+('擅', 'monopolize'),
+('擅', 'to dare'),
+('擇', 'choose'),
+('擇', 'pick out'),
+('擇', 'select'),
+('擇', 'selection'),
+('擉', 'to break through'),
+('擉', 'to pierce'),
+('擊', 'attack'),
+('擊', 'beat'),
+('擊', 'fight'),
+('擊', 'hit'),
+('擊', 'strike'),
+('操', 'behaviour'),
+('操', 'conduct'),
+('操', 'control'),
+('操', 'drill'),
+('操', 'manage'),
+('操', 'manipulate'),
+('操', 'operate'),
+('操', 'run'),
+('操', 'train'),
+('擎', 'hold'),
+('擎', 'hold up'),
+('擎', 'lift up'),
+('擎', 'support'),
+('擐', 'to put on'),
+('擒', 'arrest'),
+('擒', 'capture'),
+('擒', 'catch'),
+('擒', 'seize'),
+('擔', 'bear'),
+('擔', 'carry'),
+('擔', 'raise'),
+('擔', 'shouldering'),
+('擔', 'undertake'),
+('擗', 'to beat the breast'),
+('擘', 'break'),
+('擘', 'rip'),
+('擘', 'tear open'),
+('擘', 'thumb'),
+('據', 'a base'),
+('據', 'take possession of'),
+('據', 'to occupy'),
+('擠', 'crowd'),
+('擠', 'push against'),
+('擠', 'squeeze'),
+('擡', 'carry'),
+('擡', 'lift'),
+('擡', 'raise'),
+('擢', 'draw up'),
+('擢', 'pull up'),
+('擢', 'select'),
+('擣', 'attack'),
+('擣', 'beat'),
+('擣', 'hull'),
+('擣', 'thresh'),
+('擥', 'drive away'),
+('擥', 'expel'),
+('擥', 'oust'),
+('擦', 'brush'),
+('擦', 'rub'),
+('擦', 'scour'),
+('擦', 'scrub'),
+('擦', 'wipe'),
+('擧', 'lift up'),
+('擧', 'raise'),
+('擧', 'recommend'),
+('擬', 'compare'),
+('擬', 'draft'),
+('擬', 'emulate'),
+('擬', 'imitate'),
+('擬', 'intend'),
+('擬', 'plan'),
+('擬', 'propose'),
+('擭', 'seize'),
+('擭', 'snare'),
+('擭', 'trap catch animals'),
+('擯', 'exclude'),
+('擯', 'expel'),
+('擯', 'reject'),
+('擯', 'usher'),
+('擱', 'delay'),
+('擱', 'lay down'),
+('擱', 'place'),
+('擱', 'put'),
+('擲', 'cast'),
+('擲', 'fling'),
+('擲', 'hurl'),
+('擲', 'throw(down)'),
+('擴', 'enlarge'),
+('擴', 'expand'),
+('擴', 'stretch'),
+('擺', 'display'),
+('擺', 'place'),
+('擺', 'put'),
+('擺', 'sway'),
+('擺', 'swing'),
+('擾', 'agitate'),
+('擾', 'annoy'),
+('擾', 'disturb'),
+('攀', 'climb'),
+('攀', 'hang on to'),
+('攀', 'pull'),
+('攂', 'to beat a drum'),
+('攄', 'disperse'),
+('攄', 'set forth'),
+('攄', 'spread'),
+('攄', 'vent'),
+('攏', 'bring together'),
+('攏', 'collect'),
+('攔', 'bar'),
+('攔', 'hinder'),
+('攔', 'impede'),
+('攔', 'obstruct'),
+('攘', 'repel'),
+('攘', 'seize'),
+('攘', 'take by force'),
+('攙', 'hold up'),
+('攙', 'to give a helping hand'),
+('攙', 'to support'),
+('攝', 'absorb'),
+('攝', 'act as deputy'),
+('攝', 'administer'),
+('攝', 'assist'),
+('攝', 'take in'),
+('攢', 'hoard'),
+('攢', 'save'),
+('攣', 'crooked'),
+('攣', 'entwined'),
+('攣', 'tangled'),
+('攤', 'apportion'),
+('攤', 'open'),
+('攤', 'spread out'),
+('攪', 'agitate'),
+('攪', 'disturb'),
+('攪', 'stir up'),
+('攫', 'catch with'),
+('攫', 'seize'),
+('攫', 'snatch away'),
+('攬', 'grasp'),
+('攬', 'monopolize'),
+('攬', 'take hold of'),
+('支', 'branch'),
+('支', 'disperse'),
+('支', 'pay'),
+('支', 'support'),
+('攲', 'uneven'),
+('攲', 'up'),
+('攵', 'hit'),
+('攵', 'strike'),
+('收', 'collect'),
+('收', 'gather together'),
+('收', 'harvest'),
+('攷', 'examine'),
+('攷', 'investigate'),
+('攷', 'test'),
+('攸', 'adverbial prefix'),
+('攸', 'distant'),
+('攸', 'far'),
+('改', 'alter'),
+('改', 'change'),
+('改', 'fix'),
+('改', 'improve'),
+('改', 'reform'),
+('改', 'remodel'),
+('攻', 'assault'),
+('攻', 'attack'),
+('攻', 'criticize'),
+('攻', 'hit'),
+('放', 'banish'),
+('放', 'emit'),
+('放', 'exile'),
+('放', 'fire'),
+('放', 'free'),
+('放', 'let go'),
+('放', 'liberate'),
+('放', 'put'),
+('放', 'release'),
+('放', 'shoot'),
+('政', 'affair'),
+('政', 'government'),
+('政', 'hit'),
+('政', 'politic'),
+('政', 'political affairs'),
+('敀', 'persecute'),
+('敀', 'return'),
+('敃', 'robust'),
+('敃', 'strong'),
+('故', 'accident'),
+('故', 'ancient'),
+('故', 'because'),
+('故', 'cause'),
+('故', 'event'),
+('故', 'late'),
+('故', 'old'),
+('故', 'reason'),
+('故', 'unexpected'),
+('效', 'effect'),
+('效', 'effectiveness'),
+('效', 'result'),
+('敉', 'pacify'),
+('敉', 'soothe'),
+('敉', 'stabilize'),
+('敍', 'express'),
+('敍', 'narrate'),
+('敍', 'relate'),
+('敍', 'state'),
+('敎', 'faith'),
+('敎', 'religion'),
+('敎', 'teach'),
+('敏', 'agile'),
+('敏', 'clever'),
+('敏', 'fast'),
+('敏', 'hardworking'),
+('敏', 'humble'),
+('敏', 'nimble'),
+('敏', 'quick'),
+('敏', 'smart'),
+('敏', 'thorough'),
+('救', 'aid'),
+('救', 'help'),
+('救', 'relieve'),
+('救', 'rescue'),
+('救', 'save'),
+('敔', 'gavel'),
+('敕', 'an imperial order or decree'),
+('敖', 'leisurely'),
+('敖', 'play about'),
+('敖', 'ramble'),
+('敗', 'be defeated'),
+('敗', 'decline'),
+('敗', 'defeat'),
+('敗', 'fail'),
+('敗', 'loss'),
+('敘', 'express'),
+('敘', 'narrate'),
+('敘', 'relate'),
+('敘', 'state'),
+('教', 'class'),
+('教', 'teach'),
+('敝', 'break'),
+('敝', 'broken'),
+('敝', 'destroy'),
+('敝', 'tattered'),
+('敞', 'broad'),
+('敞', 'open'),
+('敞', 'roomy'),
+('敞', 'spacious'),
+('敡', 'belittle'),
+('敡', 'despise'),
+('敡', 'disdain'),
+('敡', 'look down on'),
+('敡', 'rebuke'),
+('敢', 'bold'),
+('敢', 'brave'),
+('敢', 'dare'),
+('敢', 'to dare'),
+('敢', 'venture'),
+('散', 'break up'),
+('散', 'disperse'),
+('散', 'scatter'),
+('敦', 'administer'),
+('敦', 'angry'),
+('敦', 'candid'),
+('敦', 'collect'),
+('敦', 'cut off'),
+('敦', 'esteem'),
+('敦', 'furious'),
+('敦', 'gather'),
+('敦', 'govern'),
+('敦', 'honest'),
+('敦', 'manage'),
+('敦', 'peck'),
+('敦', 'put down'),
+('敦', 'sever'),
+('敦', 'sincere'),
+('敬', 'honor'),
+('敬', 'respect'),
+('敬', 'respectfully'),
+('敭', 'praise'),
+('敭', 'raise'),
+('敭', 'scatter'),
+('敭', 'spread'),
+('数', 'count'),
+('数', 'fate'),
+('数', 'number'),
+('数', 'several'),
+('敲', 'beat'),
+('敲', 'hammer'),
+('敲', 'knock'),
+('敲', 'pound'),
+('敲', 'rap'),
+('敲', 'strike'),
+('整', 'neat'),
+('整', 'orderly'),
+('整', 'tidy'),
+('整', 'whole'),
+('敵', 'enemy'),
+('敵', 'foe'),
+('敵', 'resist'),
+('敵', 'rival'),
+('敷', 'apply'),
+('敷', 'diffuse'),
+('敷', 'paint'),
+('敷', 'spread'),
+('數', 'a bit'),
+('數', 'a few'),
+('數', 'a little'),
+('數', 'calculate'),
+('數', 'count'),
+('數', 'dense'),
+('數', 'destiny'),
+('數', 'duty'),
+('數', 'fate'),
+('數', 'figure'),
+('數', 'fixed'),
+('數', 'frequently'),
+('數', 'grade'),
+('數', 'manners'),
+('數', 'means'),
+('數', 'method'),
+('數', 'number'),
+('數', 'obligation'),
+('數', 'often'),
+('數', 'quantity'),
+('數', 'scheme'),
+('數', 'several'),
+('數', 'skill'),
+('數', 'technique'),
+('數', 'thick'),
+('數', 'trick'),
+('敾', 'to rule'),
+('斁', 'be weary of'),
+('斁', 'dislike'),
+('斁', 'explain'),
+('斂', 'collect'),
+('斂', 'draw back'),
+('斂', 'fold back'),
+('斃', 'die violent death'),
+('斃', 'kill'),
+('斅', 'awake'),
+('斅', 'be aroused'),
+('斅', 'instruct'),
+('斅', 'intelligent'),
+('斅', 'teach'),
+('斆', 'awake'),
+('斆', 'be aroused'),
+('斆', 'instruct'),
+('斆', 'intelligent'),
+('斆', 'teach'),
+('文', 'culture'),
+('文', 'literature'),
+('文', 'writing'),
+('斈', 'knowledge'),
+('斈', 'learning'),
+('斈', 'school'),
+('斌', 'having both appearance'),
+('斌', 'refined'),
+('斐', 'beautiful'),
+('斐', 'elegant'),
+('斐', 'graceful'),
+('斑', 'freckle'),
+('斑', 'mottled'),
+('斑', 'striped'),
+('斗', 'Big Dipper'),
+('斗', 'Chinese peck'),
+('斗', 'Little Dipper'),
+('斗', 'Polaris'),
+('斗', 'asterism'),
+('斗', 'cauldron'),
+('斗', 'cymbal'),
+('斗', 'dipper'),
+('斗', 'ladle'),
+('斗', 'liquid measure'),
+('斗', 'liter'),
+('斗', 'measure'),
+('料', 'anticipate'),
+('料', 'conjecture'),
+('料', 'consider'),
+('料', 'cost'),
+('料', 'count'),
+('料', 'fee'),
+('料', 'ingredient'),
+('料', 'ingredients'),
+('料', 'material'),
+('料', 'materials'),
+('料', 'predict'),
+('料', 'price'),
+('斛', 'dry measure equal to some five or ten dou( 舒)'),
+('斜', 'aslant'),
+('斜', 'inclined'),
+('斜', 'slanting'),
+('斜', 'sloping'),
+('斝', 'small jade wine cup'),
+('斟', 'to gauge'),
+('斟', 'to pour wine or tea into a cup'),
+('斡', 'revolve'),
+('斡', 'rotate'),
+('斡', 'spin'),
+('斡', 'turn'),
+('斤', 'KangXi radical number 69'),
+('斤', 'a catty(approximately 500 g)'),
+('斤', 'an axe'),
+('斤', 'axe'),
+('斤', 'catty'),
+('斤', 'keen'),
+('斤', 'shrewd'),
+('斥', 'accuse'),
+('斥', 'reproach'),
+('斥', 'to scold'),
+('斥', 'upbraid'),
+('斧', 'axe'),
+('斧', 'chop'),
+('斧', 'hatchet'),
+('斧', 'hew'),
+('斫', 'chop'),
+('斫', 'cut'),
+('斫', 'lop off'),
+('斬', 'behead'),
+('斬', 'chop'),
+('斬', 'cut'),
+('斬', 'sever'),
+('断', 'cut off'),
+('断', 'interrupt'),
+('断', 'sever'),
+('斯', 'emphatic particle'),
+('斯', 'such'),
+('斯', 'this'),
+('斯', 'thus'),
+('斯', 'to lop off'),
+('新', 'fresh'),
+('新', 'modern'),
+('新', 'new'),
+('新', 'recent'),
+('斲', 'chop'),
+('斲', 'cut'),
+('斲', 'hack'),
+('斷', 'cut off'),
+('斷', 'interrupt'),
+('斷', 'sever'),
+('方', 'a region'),
+('方', 'a square'),
+('方', 'direction'),
+('方', 'local'),
+('方', 'rectangle'),
+('於', 'at'),
+('於', 'in'),
+('於', 'interjection alas!'),
+('於', 'on'),
+('施', 'act'),
+('施', 'bestow'),
+('施', 'boast'),
+('施', 'breed'),
+('施', 'conduct'),
+('施', 'exaggerate'),
+('施', 'give'),
+('施', 'grant'),
+('施', 'name'),
+('施', 'reveal'),
+('施', 'widespread'),
+('斿', 'to move or rove freely'),
+('斿', 'to swim'),
+('旀', 'place name'),
+('旀', 'surname'),
+('旁', 'Chinese character'),
+('旁', 'by side'),
+('旁', 'close by'),
+('旁', 'component'),
+('旁', 'near'),
+('旁', 'side'),
+('旂', 'flag'),
+('旃', 'silk banner with bent pole'),
+('旄', 'a kind of ancient flag'),
+('旄', 'old'),
+('旅', 'journey'),
+('旅', 'travel'),
+('旅', 'traveler'),
+('旅', 'trip'),
+('旆', 'banners'),
+('旆', 'flag ornament'),
+('旆', 'flags'),
+('旋', 'move in orbit'),
+('旋', 'return'),
+('旋', 'revolve'),
+('旌', 'banner or flag adorned with feathers'),
+('旌', 'to signal'),
+('族', 'a family clan'),
+('族', 'clan'),
+('族', 'class'),
+('族', 'common'),
+('族', 'ethnic group'),
+('族', 'feature'),
+('族', 'group'),
+('族', 'music'),
+('族', 'perform'),
+('族', 'thing'),
+('族', 'tribe'),
+('旐', '기'),
+('旒', 'fringes of pearls on crowns'),
+('旕', 'place name'),
+('旗', 'banner'),
+('旗', 'banner, flag, a bunting, a gonfalon, standard'),
+('旗', 'flag'),
+('旗', 'streamer'),
+('无', 'KangXi radical 7'),
+('无', 'negative'),
+('无', 'no'),
+('无', 'not'),
+('既', 'already'),
+('既', 'de facto'),
+('既', 'since'),
+('既', 'then'),
+('旣', 'already'),
+('旣', 'de facto'),
+('旣', 'since'),
+('旣', 'then'),
+('日', 'Sunday'),
+('日', 'day'),
+('日', 'daytime'),
+('日', 'sun'),
+('旦', 'dawn'),
+('旦', 'day'),
+('旦', 'early'),
+('旦', 'morning'),
+('旧', 'ancient'),
+('旧', 'former'),
+('旧', 'old'),
+('旧', 'past'),
+('旨', 'aim'),
+('旨', 'definition'),
+('旨', 'delicious'),
+('旨', 'excellent'),
+('旨', 'meaning'),
+('旨', 'purpose'),
+('旨', 'tasty'),
+('早', 'early'),
+('早', 'morning'),
+('早', 'soon'),
+('旬', 'day'),
+('旬', 'period'),
+('旬', 'period of time'),
+('旬', 'ten'),
+('旬', 'ten-day period'),
+('旭', 'brilliance'),
+('旭', 'radiant'),
+('旭', 'rising sun'),
+('旰', 'dusk'),
+('旰', 'evening'),
+('旰', 'sunset'),
+('旱', 'drought'),
+('旱', 'dry'),
+('旱', 'dry land'),
+('旴', 'dawn'),
+('旺', 'increase'),
+('旺', 'prosper'),
+('旺', 'prosperous'),
+('旻', 'heaven'),
+('旼', 'affable'),
+('旼', 'gentle'),
+('旼', 'gentle and affable'),
+('旼', 'heaven'),
+('旼', '旻'),
+('旽', 'morning sun'),
+('旽', 'sunrise'),
+('昀', 'sun light'),
+('昀', 'used in personal names'),
+('昂', 'bold'),
+('昂', 'proud'),
+('昂', 'raise'),
+('昂', 'rise'),
+('昂', 'upright'),
+('昃', 'afternoon'),
+('昃', 'the sun in the afternoon sky'),
+('昃', 'to decline'),
+('昆', 'brother'),
+('昆', 'descendants'),
+('昆', 'elder brother'),
+('昆', 'swarm'),
+('昇', 'ascent'),
+('昇', 'peace'),
+('昇', 'peaceful'),
+('昇', 'rise'),
+('昉', 'appear'),
+('昉', 'begin'),
+('昉', 'bright'),
+('昉', 'bright dawn'),
+('昉', 'daybreak'),
+('昊', 'heaven'),
+('昊', 'sky'),
+('昊', 'summer time'),
+('昌', 'flourishing'),
+('昌', 'good'),
+('昌', 'light of sun'),
+('昌', 'proper'),
+('昌', 'prosperity'),
+('昌', 'thriving'),
+('明', 'bright'),
+('明', 'brilliant'),
+('明', 'clear'),
+('明', 'light'),
+('昏', 'dark'),
+('昏', 'dusk'),
+('昏', 'nightfall'),
+('昏', 'twilight'),
+('昑', 'bright'),
+('易', 'alteration'),
+('易', 'change'),
+('易', 'easy'),
+('易', 'modification'),
+('昔', 'ancient'),
+('昔', 'formerly'),
+('昔', 'in beginning'),
+('昕', 'dawn'),
+('昕', 'day'),
+('昕', 'early morning'),
+('昜', 'sun'),
+('昜', 'sunbeam'),
+('昜', 'sunlight'),
+('昜', 'sunshine'),
+('昞', 'bright'),
+('昞', 'glorious'),
+('昞', 'luminous'),
+('星', 'a star'),
+('星', 'a stellar constellation'),
+('星', 'any point of light'),
+('星', 'planet'),
+('星', 'star'),
+('映', 'flash'),
+('映', 'light'),
+('映', 'project'),
+('映', 'reflect'),
+('映', 'reflect light'),
+('映', 'shine'),
+('映', 'up'),
+('昡', 'extended'),
+('昡', 'long day'),
+('昡', 'relaxed'),
+('昤', 'sunshine'),
+('春', 'spring'),
+('春', 'wanton'),
+('昧', 'dark'),
+('昧', 'darken'),
+('昧', 'obscure'),
+('昨', 'in former times'),
+('昨', 'last'),
+('昨', 'past'),
+('昨', 'yesterday'),
+('昫', 'warm'),
+('昭', 'bright'),
+('昭', 'illustrious'),
+('昭', 'luminous'),
+('是', 'be'),
+('是', 'demonstrative pronoun'),
+('是', 'indeed'),
+('是', 'right'),
+('是', 'that'),
+('是', 'this'),
+('是', 'to be'),
+('是', 'yes'),
+('昰', 'name'),
+('昰', 'summer'),
+('昰', 'var of to be'),
+('昱', 'bright light'),
+('昱', 'dazzling'),
+('昱', 'sunlight'),
+('昴', 'one of the 28 constellations'),
+('昵', 'approach'),
+('昵', 'close'),
+('昵', 'intimate'),
+('昶', 'a long day. bright. extended. clear'),
+('昷', 'to feed a prisoner'),
+('昺', 'bright'),
+('昺', 'brilliant'),
+('昺', 'glorious'),
+('昻', 'rise'),
+('昼', 'daylight'),
+('昼', 'daytime'),
+('晁', 'dawn'),
+('晁', 'morning'),
+('晁', 'surname'),
+('時', 'age'),
+('時', 'beautiful'),
+('時', 'chance'),
+('時', 'correct'),
+('時', 'era'),
+('時', 'excellent'),
+('時', 'fine'),
+('時', 'good'),
+('時', 'great'),
+('時', 'hour'),
+('時', 'nice'),
+('時', 'opportunity'),
+('時', 'period'),
+('時', 'right'),
+('時', 'season'),
+('時', 'time'),
+('時', 'well'),
+('晃', 'bright'),
+('晃', 'dazzling'),
+('晃', 'shake'),
+('晃', 'to sway'),
+('晄', 'bright'),
+('晄', 'dazzling'),
+('晄', 'shake'),
+('晄', 'to sway'),
+('晉', 'advance'),
+('晉', 'increase'),
+('晉', 'promote'),
+('晋', 'advance'),
+('晋', 'increase'),
+('晋', 'promote'),
+('晌', 'midday'),
+('晌', 'moment'),
+('晌', 'noon'),
+('晌', 'or the area that can be sown in one day'),
+('晌', 'unit land measurement equal to seven mou( 畝)'),
+('晏', 'clear'),
+('晏', 'late in the day'),
+('晏', 'peaceful'),
+('晏', 'quiet'),
+('晚', 'evening'),
+('晚', 'late'),
+('晚', 'night'),
+('晛', 'sunlight'),
+('晝', 'daylight'),
+('晝', 'daytime'),
+('晞', 'dawn'),
+('晞', 'dry'),
+('晞', 'expose sun'),
+('晟', 'bright'),
+('晟', 'brightness'),
+('晟', 'clear'),
+('晟', 'splendor'),
+('晡', 'dusk'),
+('晡', 'late afternoon'),
+('晢', 'light of stars'),
+('晢', 'shine'),
+('晤', 'have interview with'),
+('晤', 'meet'),
+('晥', 'Anhui province'),
+('晦', 'dark'),
+('晦', 'night'),
+('晦', 'obscure'),
+('晦', 'unclear'),
+('晧', 'bright and brilliant'),
+('晧', 'daybreak'),
+('晨', 'dawn'),
+('晨', 'daybreak'),
+('晨', 'early morning'),
+('晩', 'night'),
+('晬', 'first birthday of a child'),
+('普', 'general'),
+('普', 'universal'),
+('普', 'widespread'),
+('景', 'conditions'),
+('景', 'scenery'),
+('景', 'shadow'),
+('景', 'view'),
+('景', 'vista'),
+('晰', 'clear'),
+('晰', 'clearly'),
+('晰', 'evident'),
+('晳', 'clear'),
+('晳', 'discriminate'),
+('晳', 'fair'),
+('晳', 'white'),
+('晴', 'clear'),
+('晴', 'clear weather'),
+('晴', 'fine weather'),
+('晴', 'up'),
+('晶', 'bright'),
+('晶', 'clear'),
+('晶', 'crystal'),
+('晶', 'radiant'),
+('晷', 'shadow'),
+('晷', 'shadows of sun'),
+('晷', 'sun'),
+('晷', 'sundial'),
+('晷', 'time'),
+('智', 'intelligence'),
+('智', 'knowledge'),
+('智', 'wisdom'),
+('暁', 'clear'),
+('暁', 'dawn'),
+('暁', 'daybreak'),
+('暁', 'explicit'),
+('暄', 'comfortable'),
+('暄', 'genial'),
+('暄', 'warm'),
+('暇', 'leisure'),
+('暇', 'relaxation'),
+('暇', 'spare time'),
+('暈', 'dizzy'),
+('暈', 'faint'),
+('暈', 'fog'),
+('暈', 'halo'),
+('暈', 'halo in sky'),
+('暉', 'bright'),
+('暉', 'light'),
+('暉', 'radiant'),
+('暉', 'sunshine'),
+('暋', 'robust'),
+('暋', 'strong'),
+('暋', 'tough'),
+('暌', 'distant from'),
+('暌', 'in opposition'),
+('暌', 'separated'),
+('暍', 'sunstroke'),
+('暎', 'reflect'),
+('暎', 'sun beginning decline'),
+('暐', 'sunlight'),
+('暐', 'sunshine'),
+('暐', 'the bright shining of the sun'),
+('暑', 'hot'),
+('暖', 'genial'),
+('暖', 'warm'),
+('暗', 'covert'),
+('暗', 'dark'),
+('暗', 'darkness'),
+('暗', 'in secret'),
+('暗', 'obscure'),
+('暘', 'rising sun'),
+('暘', 'sunshine'),
+('暝', 'dark'),
+('暝', 'obscure'),
+('暠', 'bright and brilliant'),
+('暠', 'daybreak'),
+('暢', 'freely'),
+('暢', 'smoothly'),
+('暢', 'unrestrained'),
+('暨', 'and'),
+('暨', 'attain'),
+('暨', 'confines'),
+('暨', 'reach'),
+('暫', 'temporary'),
+('暮', 'closing'),
+('暮', 'dusk'),
+('暮', 'ending'),
+('暮', 'evening'),
+('暮', 'sunset'),
+('暱', 'approach'),
+('暱', 'close'),
+('暱', 'intimate'),
+('暴', 'appear'),
+('暴', 'brutal'),
+('暴', 'fierce'),
+('暴', 'manifest'),
+('暴', 'show'),
+('暴', 'skinny'),
+('暴', 'sparse'),
+('暴', 'thin'),
+('暴', 'tyrannical'),
+('暴', 'violent'),
+('暵', 'dry by exposing sun'),
+('暸', 'bright'),
+('暸', 'clear'),
+('暹', 'advance'),
+('暹', 'go forward'),
+('暹', 'rise'),
+('暻', 'bright'),
+('暾', 'morning sun'),
+('暾', 'sunrise'),
+('曀', '(Cant.) sultry'),
+('曀', 'cloudy'),
+('曀', 'dim'),
+('曀', 'misty'),
+('曀', 'stormy'),
+('曁', 'and'),
+('曁', 'attain'),
+('曄', 'bright'),
+('曄', 'radiant'),
+('曄', 'thriving'),
+('曅', 'bright'),
+('曅', 'flourishing'),
+('曅', 'shine'),
+('曅', 'strike'),
+('曆', 'calendar'),
+('曆', 'era'),
+('曇', 'become cloudy'),
+('曇', 'overcast'),
+('曉', 'clear'),
+('曉', 'dawn'),
+('曉', 'daybreak'),
+('曉', 'explicit'),
+('曖', 'ambiguous'),
+('曖', 'dim'),
+('曖', 'obscure'),
+('曖', 'vague'),
+('曙', 'bright'),
+('曙', 'dawn'),
+('曙', 'light of rising sun'),
+('曚', 'twilight just before sun rises'),
+('曛', 'dusk'),
+('曛', 'sunset'),
+('曛', 'twilight'),
+('曜', 'as sun'),
+('曜', 'day'),
+('曜', 'daylight'),
+('曜', 'glorious'),
+('曜', 'shiny'),
+('曜', 'sunlight'),
+('曜', 'week'),
+('曝', 'air in sun'),
+('曝', 'expose or dry in the sun'),
+('曝', 'sun'),
+('曠', 'broad'),
+('曠', 'empty'),
+('曠', 'extensive'),
+('曠', 'wide'),
+('曡', 'duplicate'),
+('曡', 'repeat'),
+('曡', 'repeitious'),
+('曦', 'early dawn'),
+('曦', 'sunlight'),
+('曦', 'sunshine'),
+('曨', 'dim'),
+('曨', 'twilight'),
+('曨', 'vague'),
+('曩', 'former'),
+('曩', 'in ancient times'),
+('曩', 'of old'),
+('曬', 'bask'),
+('曬', 'dry'),
+('曬', 'dry in sun'),
+('曬', 'expose to sun'),
+('曰', 'KangXi radical 73'),
+('曰', 'say'),
+('曲', 'bent'),
+('曲', 'crooked'),
+('曲', 'curved'),
+('曲', 'false'),
+('曲', 'music'),
+('曲', 'tune'),
+('曲', 'twisted'),
+('曲', 'wrong'),
+('曳', 'drag'),
+('曳', 'pull'),
+('曳', 'tow'),
+('曳', 'trail'),
+('更', 'again'),
+('更', 'change'),
+('更', 'fix'),
+('更', 'more'),
+('更', 'much more'),
+('更', 'still further'),
+('曷', 'why? what? where?'),
+('書', 'book'),
+('書', 'document'),
+('書', 'letter'),
+('書', 'writings'),
+('曹', 'ministry officials'),
+('曹', 'surname'),
+('曺', 'Cao'),
+('曺', 'Cho'),
+('曺', 'Jo'),
+('曺', 'group'),
+('曺', 'litigant'),
+('曺', 'partner'),
+('曺', 'room'),
+('曺', 'surname'),
+('曺', 'village'),
+('曼', 'beautiful'),
+('曼', 'extended'),
+('曼', 'long'),
+('曼', 'vast'),
+('曾', 'already'),
+('曾', 'sign of past'),
+('替', 'change'),
+('替', 'replace'),
+('替', 'substitute for'),
+('替', 'switch'),
+('最', 'exceedingly'),
+('最', 'extremely'),
+('最', 'most'),
+('會', 'a meeting'),
+('會', 'a meeting, an assembly'),
+('會', 'an organization'),
+('會', 'assemble'),
+('會', 'gather'),
+('會', 'meet together'),
+('會', 'to assemble'),
+('朅', 'brave'),
+('月', 'KangXi radical 74'),
+('月', 'Monday'),
+('月', 'month'),
+('月', 'moon'),
+('有', 'exist'),
+('有', 'have'),
+('有', 'own'),
+('有', 'possess'),
+('朋', 'acquaintance'),
+('朋', 'friend'),
+('朋', 'pal'),
+('朌', 'distribute'),
+('朌', 'large head'),
+('服', 'clothes'),
+('服', 'clothing'),
+('服', 'dress'),
+('服', 'wear'),
+('朏', 'crescent'),
+('朔', 'day'),
+('朔', 'first'),
+('朔', 'first day of lunar month'),
+('朔', 'lunar month'),
+('朔', 'the north'),
+('朕', 'I'),
+('朕', 'me'),
+('朕', 'pronoun I'),
+('朗', 'bright'),
+('朗', 'clear'),
+('朗', 'distinct'),
+('望', 'admire'),
+('望', 'desire'),
+('望', 'expect'),
+('望', 'gaze'),
+('望', 'hope'),
+('望', 'look'),
+('望', 'look forward'),
+('望', 'peek'),
+('望', 'peep'),
+('望', 'respect'),
+('望', 'to hope'),
+('望', 'to look at'),
+('朝', 'Joseon'),
+('朝', 'court'),
+('朝', 'day'),
+('朝', 'dynasty'),
+('朝', 'imperial'),
+('朝', 'morning'),
+('朞', 'anniversary'),
+('朞', 'full year'),
+('期', 'an era, a time frame'),
+('期', 'date'),
+('期', 'expect'),
+('期', 'period'),
+('期', 'period of time'),
+('期', 'time'),
+('期', 'time limit'),
+('朣', 'the rising moon'),
+('朦', 'condition or appearance of moon'),
+('朧', 'condition or appearance of moon'),
+('木', 'Thursday'),
+('木', 'lumber'),
+('木', 'tree'),
+('木', 'wood'),
+('木', 'wooden'),
+('朩', 'Kwukyel'),
+('朩', 'equal'),
+('朩', 'etc.'),
+('朩', 'grade'),
+('朩', 'hemp'),
+('朩', 'kwukyel: rank'),
+('朩', 'rank'),
+('朩', 'skin'),
+('朩', 'stalk'),
+('朩', 'wait'),
+('未', '8th terrestrial branch'),
+('未', 'have'),
+('未', 'not'),
+('未', 'not yet'),
+('末', 'coarse'),
+('末', 'end'),
+('末', 'final'),
+('末', 'flour'),
+('末', 'improper'),
+('末', 'inferior'),
+('末', 'insignificant'),
+('末', 'last'),
+('末', 'low'),
+('末', 'powder'),
+('末', 'trivial'),
+('末', '가루'),
+('末', '끝'),
+('末', '허드레'),
+('本', 'ancestor'),
+('本', 'basis'),
+('本', 'book'),
+('本', 'counter'),
+('本', 'essence'),
+('本', 'fatherland'),
+('本', 'foundation'),
+('本', 'hometown'),
+('本', 'main'),
+('本', 'mind'),
+('本', 'model'),
+('本', 'nature'),
+('本', 'origin'),
+('本', 'primary'),
+('本', 'principal'),
+('本', 'publication'),
+('本', 'root'),
+('本', 'self'),
+('本', 'source'),
+('本', 'stem'),
+('本', 'this'),
+('本', 'this one, the one you are looking at'),
+('本', 'true'),
+('本', 'version'),
+('本', 'very'),
+('札', 'correspondence'),
+('札', 'letter'),
+('札', 'note'),
+('朮', 'art'),
+('朮', 'device'),
+('朮', 'method'),
+('朮', 'skill'),
+('朮', 'trick'),
+('术', 'art'),
+('术', 'method'),
+('术', 'skill'),
+('术', 'special feat'),
+('术', 'technique'),
+('朰', 'kwukyel'),
+('朱', 'cinnabar'),
+('朱', 'surname'),
+('朱', 'vermilion'),
+('朱', 'vermillion'),
+('朳', 'tree'),
+('朴', 'a tree'),
+('朴', 'naive'),
+('朴', 'simple'),
+('朴', 'sincere'),
+('朴', 'surname'),
+('朴', 'unadorned'),
+('朵', 'cluster of flowers'),
+('朵', 'earlobe'),
+('朶', 'cluster of flowers'),
+('朶', 'earlobe'),
+('机', 'desk'),
+('机', 'machine'),
+('机', 'moment'),
+('朽', 'decay'),
+('朽', 'decayed'),
+('朽', 'rot'),
+('朽', 'rotten'),
+('杅', 'bath tub'),
+('杅', 'bowl'),
+('杅', 'tub'),
+('杆', 'pole'),
+('杆', 'shaft of spear'),
+('杇', 'trowel'),
+('杈', '가지'),
+('杉', 'cedar'),
+('杉', 'various species of pine and fir'),
+('杌', '나무 그루터기'),
+('李', 'Lee'),
+('李', 'judge'),
+('李', 'plum'),
+('李', 'plum tree'),
+('李', 'surname'),
+('杏', 'almond'),
+('杏', 'apricot'),
+('材', 'material'),
+('材', 'stuff'),
+('材', 'talent'),
+('材', 'timber'),
+('村', 'hamlet'),
+('村', 'uncouth'),
+('村', 'village'),
+('村', 'vulgar'),
+('杓', 'handle of cup'),
+('杓', 'ladle'),
+('杓', 'name of a constellation'),
+('杓', 'spoon'),
+('杖', 'cane'),
+('杖', 'walking stick'),
+('杜', 'prevent'),
+('杜', 'restrict'),
+('杜', 'stop'),
+('杜', 'surname'),
+('杞', 'a small feudal state(Qi)'),
+('杞', 'medlar tree'),
+('杞', 'willow'),
+('束', 'bale'),
+('束', 'bind'),
+('束', 'bunch'),
+('束', 'control'),
+('束', 'restrain'),
+('杠', 'crowbar'),
+('杠', 'lever'),
+('杠', 'pole'),
+('杠', 'sharpen'),
+('条', 'clause'),
+('条', 'condition'),
+('条', 'string'),
+('条', 'stripe'),
+('杪', 'tip of twig'),
+('杪', 'top of tree'),
+('杪', 'twig'),
+('杭', 'cross stream'),
+('杭', 'navigate'),
+('杮', 'wood shavings'),
+('杯', 'cup'),
+('杯', 'glass'),
+('杰', 'hero'),
+('杰', 'heroic'),
+('杰', 'outstanding'),
+('東', 'East (one of the 4 directions)'),
+('東', 'east'),
+('東', 'eastern'),
+('東', 'eastward'),
+('杲', 'bright sun'),
+('杲', 'brilliant'),
+('杲', 'high'),
+('杳', 'dark'),
+('杳', 'deep'),
+('杳', 'mysterious'),
+('杳', 'obscure'),
+('杵', 'baton used beat clothes'),
+('杵', 'pestle'),
+('杷', 'loquat'),
+('杻', 'ligustrum sinenese'),
+('杻', 'tree'),
+('杼', 'a scrub oak'),
+('杼', 'long-headed'),
+('杼', 'narrow'),
+('杼', 'shuttle of loom'),
+('杼', 'thin'),
+('松', 'fir tree'),
+('松', 'pine'),
+('松', 'pine tree'),
+('板', 'board'),
+('板', 'iron or tin plate'),
+('板', 'plank'),
+('枇', 'loquat'),
+('枉', 'bent'),
+('枉', 'crooked'),
+('枉', 'in vain'),
+('枉', 'useless'),
+('枋', 'sandalwood'),
+('枋', 'tree used as timber'),
+('枌', 'variety of elm with small seeds'),
+('枏', 'a variety of evergreen tree'),
+('析', 'break apart'),
+('析', 'divide'),
+('析', 'split wood'),
+('枓', 'arch'),
+('枓', 'capital'),
+('枓', 'dipper'),
+('枓', 'ladle'),
+('枓', 'small'),
+('枕', 'pillow'),
+('林', 'forest'),
+('林', 'grove'),
+('林', 'surname'),
+('枘', 'the handle of tools'),
+('枚', 'stalk of shrub'),
+('枚', 'trunk of tree'),
+('果', 'fruit'),
+('果', 'result'),
+('枝', 'branch off'),
+('枝', 'branches'),
+('枝', 'limbs'),
+('枯', 'decayed'),
+('枯', 'dried out'),
+('枯', 'dry up'),
+('枯', 'thirst'),
+('枯', 'wither'),
+('枯', 'withered'),
+('枰', 'chess'),
+('枰', 'chessboard'),
+('枰', 'smooth board'),
+('枱', 'a table'),
+('枱', 'desk'),
+('枲', 'male nettle-hemp'),
+('枳', '(Cant.) a plug'),
+('枳', 'hedge thorn'),
+('枳', 'trifoliate orange'),
+('架', 'prop'),
+('架', 'prop up'),
+('架', 'rack'),
+('架', 'stand'),
+('枷', 'cangue scaffold'),
+('枸', 'kind of aspen found in Sichuan'),
+('枻', 'oar'),
+('枼', 'leaf'),
+('枼', 'slip'),
+('枼', 'table'),
+('枾', 'persimmon'),
+('柁', 'large tie-beams'),
+('柄', 'authority'),
+('柄', 'handle'),
+('柄', 'knob'),
+('柄', 'lever'),
+('柅', 'flourish'),
+('柊', 'holly'),
+('柏', 'cedar'),
+('柏', 'cypress'),
+('某', 'Prunus mume'),
+('某', 'certain'),
+('某', 'certain thing or person'),
+('某', 'person'),
+('某', 'thing'),
+('某', 'tree'),
+('柑', 'loose-skinned orange'),
+('柑', 'tangerine'),
+('柒', 'number seven'),
+('染', 'be contagious'),
+('染', 'dye'),
+('染', 'infect'),
+('柔', 'gentle'),
+('柔', 'pliant'),
+('柔', 'soft'),
+('柗', 'pine tree'),
+('柘', 'a thorny tree'),
+('柘', 'sugarcane'),
+('柙', 'cage'),
+('柙', 'pen for wild animals'),
+('柚', 'grapefruit'),
+('柚', 'pomelo'),
+('柝', 'watchmans rattle'),
+('柞', 'oak'),
+('柞', 'spinous evergreen tree'),
+('柞', 'to clear away trees'),
+('柟', 'Machilus nanmu'),
+('柟', 'variety of evergreen'),
+('柢', 'base'),
+('柢', 'bottom'),
+('柢', 'bottom of object'),
+('柢', 'root'),
+('查', 'examine'),
+('查', 'investigate'),
+('查', 'seek into'),
+('柩', 'coffin'),
+('柩', 'coffin which contains corpse'),
+('柬', 'choose'),
+('柬', 'invitation'),
+('柬', 'letter'),
+('柯', 'axe-handle'),
+('柯', 'bough'),
+('柯', 'stalk'),
+('柯', 'surname'),
+('柰', 'bear'),
+('柰', 'crab-apple tree'),
+('柰', 'endure'),
+('柱', 'lean on'),
+('柱', 'pillar'),
+('柱', 'post'),
+('柱', 'support'),
+('柳', 'pleasure'),
+('柳', 'willow tree'),
+('柴', 'faggots'),
+('柴', 'firewood'),
+('柴', 'fuel'),
+('柵', 'fence'),
+('柵', 'grid'),
+('柵', 'palisade'),
+('柶', 'ladle'),
+('柷', 'instrument'),
+('柹', 'persimmon'),
+('査', 'examine'),
+('査', 'inspect'),
+('査', 'investigate'),
+('査', 'seek into'),
+('柾', 'straight grain'),
+('柿', 'persimmon'),
+('栃', 'stable'),
+('栃', 'type of oak'),
+('栄', 'flourish'),
+('栄', 'glory'),
+('栄', 'honor'),
+('栄', 'prosper'),
+('栅', 'fence'),
+('栅', 'grid'),
+('栅', 'palisade'),
+('栍', 'a label'),
+('栍', 'a lot'),
+('栍', 'a slip of bamboo engraved with signs'),
+('栍', 'tag'),
+('栒', 'cross bar'),
+('栓', 'post or stick'),
+('栓', 'wooden peg'),
+('栖', 'perch'),
+('栖', 'roost'),
+('栖', 'stay'),
+('栗', 'chestnut'),
+('栗', 'chestnut tree'),
+('栗', 'chestnuts'),
+('栗', 'surname'),
+('栝', 'a builders frame for measuring'),
+('栝', 'firewood'),
+('栞', 'periodical'),
+('栞', 'publication'),
+('栞', 'publish'),
+('校', 'educational'),
+('校', 'establishment'),
+('校', 'military field officer'),
+('校', 'school'),
+('栢', 'cedar'),
+('栢', 'cypress'),
+('株', 'numerary adjunct for trees'),
+('株', 'root'),
+('株', 'stump'),
+('株', 'tree'),
+('栱', 'arch'),
+('栱', 'large peg'),
+('栱', 'peg'),
+('栱', 'pillar'),
+('栱', 'post'),
+('栱', 'stake'),
+('栲', 'mangrove'),
+('栴', 'sandalwood'),
+('核', 'Earth'),
+('核', 'atom'),
+('核', 'atomic nucleus'),
+('核', 'benzene'),
+('核', 'biology'),
+('核', 'cell nucleus'),
+('核', 'centre'),
+('核', 'chemistry'),
+('核', 'core'),
+('核', 'geology'),
+('核', 'kernel'),
+('核', 'nuclear weapon'),
+('核', 'nut'),
+('核', 'physics'),
+('核', 'ring'),
+('核', 'seed'),
+('根', 'base'),
+('根', 'base(d on)'),
+('根', 'foundation'),
+('根', 'root'),
+('根', 'stump'),
+('栻', 'tree'),
+('格', 'branch'),
+('格', 'form'),
+('格', 'pattern'),
+('格', 'standard'),
+('格', 'status'),
+('格', 'style'),
+('格', 'tree'),
+('栽', 'plant'),
+('栽', 'to care for plants'),
+('栽', 'to cultivate'),
+('桀', 'ancient emperor'),
+('桀', 'chicken roost'),
+('桁', 'cross-beams of roof'),
+('桂', 'cassia or cinnamon'),
+('桂', 'cinnamon'),
+('桃', 'marriage'),
+('桃', 'peach'),
+('桃', 'surname'),
+('桄', 'a coir-palm'),
+('框', 'door frame'),
+('框', 'frame'),
+('框', 'framework'),
+('案', 'bench'),
+('案', 'bill'),
+('案', 'desk'),
+('案', 'idea'),
+('案', 'legal case'),
+('案', 'opinion'),
+('案', 'plan'),
+('案', 'proposal'),
+('案', 'suggestion'),
+('案', 'table'),
+('案', 'thought'),
+('桎', 'fetters'),
+('桎', 'handcuffs'),
+('桎', 'shackles'),
+('桐', 'name applied various trees'),
+('桑', 'mulberry'),
+('桑', 'mulberry tree'),
+('桑', 'surname'),
+('桓', 'surname'),
+('桓', 'variety of tree'),
+('桔', 'Chinese bellflower'),
+('桔', 'the inner fibers of corn-stalks'),
+('桔', 'well-swept'),
+('桜', 'cherry'),
+('桜', 'cherry blossom'),
+('桯', 'table'),
+('桴', 'drum stick'),
+('桴', 'raft'),
+('桴', 'ridge pole'),
+('桶', 'barrel'),
+('桶', 'bucket'),
+('桶', 'cask'),
+('桶', 'keg'),
+('桶', 'pail'),
+('桶', 'tub'),
+('桶', 'vat'),
+('桷', 'malus toringo'),
+('桷', 'rafter'),
+('桿', 'club'),
+('桿', 'pole'),
+('桿', 'pole as unit'),
+('桿', 'stick'),
+('梁', 'beam'),
+('梁', 'bridge'),
+('梁', 'rafters'),
+('梁', 'surname'),
+('梃', 'a club'),
+('梃', 'a stalk'),
+('梃', 'straight'),
+('梅', 'Prunus mume'),
+('梅', 'blossom'),
+('梅', 'fruit tree'),
+('梅', 'plum blossom'),
+('梅', 'plums'),
+('梅', 'prunes'),
+('梅', 'surname'),
+('梆', 'watchmans rattle'),
+('梏', 'fetters'),
+('梏', 'handcuffs'),
+('梏', 'manacles'),
+('梓', 'catalpa ovata'),
+('梔', 'gardenia'),
+('梗', 'branch of plant'),
+('梗', 'stalk'),
+('梗', 'stem'),
+('梗', 'stem of flower'),
+('梘', '홈통'),
+('條', 'clause'),
+('條', 'condition'),
+('條', 'string'),
+('條', 'stripe'),
+('梟', 'owl thus'),
+('梟', 'something evil'),
+('梠', 'a small beam supporting the rafters at the eaves'),
+('梡', 'tray for carrying sacrificial meat'),
+('梢', 'pointed tip of something long like a branch'),
+('梢', 'rudder'),
+('梣', 'ash tree'),
+('梧', 'Sterculia platanifolia'),
+('梨', 'cut'),
+('梨', 'opera'),
+('梨', 'pear'),
+('梨', 'slash'),
+('梭', 'go to and fro'),
+('梭', 'weavers shuttle'),
+('梯', 'ladder'),
+('梯', 'lean'),
+('梯', 'stairs'),
+('梯', 'steps'),
+('械', 'implements'),
+('械', 'instruments'),
+('械', 'weapons'),
+('梱', 'doorjamb'),
+('梱', 'doorsill'),
+('梲', 'joist'),
+('梲', 'stick'),
+('梳', 'brush'),
+('梳', 'comb'),
+('梵', 'Buddhist'),
+('梵', 'Sanskrit'),
+('梶', 'oar'),
+('梶', 'shaft'),
+('棄', 'abandon'),
+('棄', 'discard'),
+('棄', 'reject'),
+('棅', 'authority'),
+('棅', 'handle'),
+('棅', 'knob'),
+('棅', 'lever'),
+('棉', 'cotton'),
+('棉', 'cotton padded'),
+('棊', 'any game similar to chess'),
+('棊', 'chess'),
+('棋', 'any game similar to chess'),
+('棋', 'chess'),
+('棍', 'cudgel'),
+('棍', 'scoundrel'),
+('棍', 'stick'),
+('棐', 'species of yew'),
+('棒', 'club'),
+('棒', 'hit'),
+('棒', 'stick'),
+('棒', 'truncheon'),
+('棕', 'hemp palm'),
+('棕', 'palm tree'),
+('棖', 'a prop'),
+('棖', 'door jam'),
+('棖', 'door stop'),
+('棖', 'post'),
+('棖', 'prop'),
+('棖', 'touch'),
+('棗', 'date tree'),
+('棗', 'dates'),
+('棗', 'jujubes'),
+('棗', 'surname'),
+('棘', 'brambles'),
+('棘', 'jujube tree'),
+('棘', 'thorns'),
+('棚', 'awning'),
+('棚', 'booth'),
+('棚', 'shed'),
+('棚', 'tent'),
+('棟', 'the main beams supporting a house'),
+('棠', 'crab apple tree'),
+('棠', 'wild plums'),
+('棣', 'appearance'),
+('棣', 'attain'),
+('棣', 'cherry'),
+('棣', 'courteous'),
+('棣', 'kerria japonica plant'),
+('棣', 'reach'),
+('棧', 'inn'),
+('棧', 'tavern'),
+('棧', 'warehouse'),
+('棨', 'tally or wooden pass'),
+('棬', 'bowl'),
+('森', 'forest'),
+('森', 'luxuriant vegetation'),
+('棲', 'perch'),
+('棲', 'roost'),
+('棲', 'stay'),
+('棹', 'boat'),
+('棹', 'oar'),
+('棺', 'coffin'),
+('棻', 'kind of wood from which perfume'),
+('棼', 'beams in the roof of a house confused'),
+('棼', 'disorder'),
+('棼', 'disordered'),
+('棼', 'ridgepole'),
+('椀', 'bowl'),
+('椀', 'cup'),
+('椀', 'dish'),
+('椁', 'outer-coffin'),
+('椁', 'vault'),
+('椄', 'to graft'),
+('椅', 'chair'),
+('椅', 'seat'),
+('椋', 'fruit'),
+('植', 'grow'),
+('植', 'plant'),
+('植', 'plants'),
+('植', 'put'),
+('植', 'trees'),
+('椎', 'anatomy'),
+('椎', 'hammer'),
+('椎', 'mallet'),
+('椎', 'spine'),
+('椎', 'vertebra'),
+('椑', 'oval'),
+('椒', 'pepper'),
+('椒', 'spices'),
+('椗', 'anchor'),
+('椗', '닻'),
+('検', 'check'),
+('検', 'examine'),
+('椧', 'gutter'),
+('椰', 'coconut palm'),
+('椰', 'palm tree'),
+('椴', 'aspen'),
+('椴', 'lime'),
+('椴', 'linden'),
+('椴', 'poplar'),
+('椴', 'tree'),
+('椶', 'palm tree'),
+('椹', 'a chopping board'),
+('椹', 'chopping block'),
+('椹', 'fruit'),
+('椹', 'mulberry'),
+('椹', '實'),
+('椹', '桑'),
+('椹', '모탕'),
+('椹', '오디'),
+('椺', 'beam of a house'),
+('椽', 'beams'),
+('椽', 'rafters'),
+('椽', 'supports'),
+('椿', 'a plant with white flowers'),
+('椿', 'father'),
+('楂', 'a raft'),
+('楂', 'to fell trees'),
+('楂', 'to hew'),
+('楊', 'aspen'),
+('楊', 'poplar'),
+('楊', 'surname'),
+('楊', 'willow'),
+('楊', '버들'),
+('楓', 'maple'),
+('楓', 'maple tree'),
+('楓', 'tree'),
+('楔', 'foreword'),
+('楔', 'gatepost'),
+('楔', 'wedge'),
+('楕', 'elliptical'),
+('楕', 'long'),
+('楕', 'oval-shaped'),
+('楕', 'round'),
+('楕', 'tubular'),
+('楗', 'bar of door'),
+('楗', 'bolt of lock'),
+('楙', 'lush'),
+('楙', 'name of plant'),
+('楚', 'clear'),
+('楚', 'name of feudal state'),
+('楝', 'melia japonica'),
+('楞', 'used for Ceylon in Buddhist texts'),
+('楠', 'machilus nanmu'),
+('楠', 'name of tree'),
+('楡', 'elm'),
+('楡', 'elm tree'),
+('楡', 'tree'),
+('楡', '느릅나무'),
+('楢', 'tinder'),
+('楣', 'crossbeam above or under gate'),
+('楥', 'a last for making shoes'),
+('楥', 'to turn on a lathe'),
+('楦', 'a last for making shoes'),
+('楦', 'to turn on a lathe'),
+('楨', 'hardwood'),
+('楨', 'posts'),
+('楨', 'privet'),
+('楨', 'supports'),
+('楪', 'small dish'),
+('楪', 'window'),
+('楫', 'oar'),
+('楫', 'paddle'),
+('楬', 'a signpost'),
+('楬', 'tablet'),
+('業', 'business'),
+('業', 'profession'),
+('業', 'trade'),
+('業', 'work'),
+('楮', 'money'),
+('楮', 'mulberry'),
+('楮', 'paper'),
+('楮', '꾸지나무'),
+('楮', '닥나무'),
+('楯', 'horizontal bar'),
+('楯', 'shield'),
+('楳', 'plums'),
+('楳', 'prunes'),
+('楳', 'surname'),
+('極', 'extreme'),
+('極', 'extremity'),
+('極', 'final'),
+('極', 'furthest'),
+('極', 'pole'),
+('極', 'utmost'),
+('楷', 'model style of Chinese writing'),
+('楸', 'deciduous tre'),
+('楸', 'mallotus japonicus'),
+('楹', 'column'),
+('楹', 'numerary adjunct'),
+('楹', 'pillar'),
+('楼', 'building of two or more stories'),
+('概', 'approximately'),
+('概', 'generally'),
+('榆', 'elm tree'),
+('榌', 'wooden ladder'),
+('榎', 'small evergreen shrub'),
+('榔', 'betel-nut tree'),
+('榕', 'banyan tree'),
+('榖', 'mulberry'),
+('榖', 'paper'),
+('榖', 'paper mulberry'),
+('榖', '꾸지나무'),
+('榖', '닥나무'),
+('榘', 'carpenters square'),
+('榘', 'rule'),
+('榘', 'ruler'),
+('榛', 'hazelnut'),
+('榛', 'thicket'),
+('榛', 'underbrush'),
+('榜', 'candidate'),
+('榜', 'list'),
+('榜', 'list of successful exam candidates'),
+('榜', 'notice'),
+('榜', 'placard'),
+('榜', 'successful'),
+('榤', 'perch for fowls roost on'),
+('榥', 'screen'),
+('榦', 'prop'),
+('榦', 'support'),
+('榦', 'tree trunk'),
+('榧', 'type of yew'),
+('榨', 'a press to extract juices'),
+('榨', 'a vegetable'),
+('榨', 'to press or extract juices'),
+('榭', 'kiosk'),
+('榭', 'pavilion'),
+('榮', 'flourish'),
+('榮', 'glory'),
+('榮', 'honor'),
+('榮', 'honour'),
+('榮', 'prosper'),
+('榱', 'rafter'),
+('榴', 'pomegranate'),
+('榷', 'footbridge'),
+('榷', 'levy'),
+('榷', 'monopoly'),
+('榷', 'toll'),
+('榻', 'bed'),
+('榻', 'cot'),
+('榻', 'couch'),
+('榼', 'wine glass'),
+('榾', 'pieces of wood'),
+('槀', 'draft'),
+('槀', 'manuscript'),
+('槁', 'dead'),
+('槁', 'rotten'),
+('槁', 'wither'),
+('槁', 'withered'),
+('槃', 'rotate'),
+('槃', 'search'),
+('槃', 'tray'),
+('槃', 'turn'),
+('槊', 'lance'),
+('槊', 'spear'),
+('構', 'build'),
+('構', 'building'),
+('構', 'construct'),
+('構', 'frame'),
+('構', 'mulberry'),
+('構', 'paper'),
+('構', 'structure'),
+('構', '꾸지나무'),
+('構', '닥나무'),
+('構', '얽다'),
+('槌', 'beat'),
+('槌', 'hammer'),
+('槌', 'mallet'),
+('槌', 'strike'),
+('槍', 'gun'),
+('槍', 'lance'),
+('槍', 'rifle'),
+('槍', 'spear'),
+('槎', 'occasion'),
+('槎', 'raft'),
+('槎', 'time'),
+('槎', 'to hew'),
+('槐', 'locust tree'),
+('槓', '(Cant.) a wardrobe'),
+('槓', 'crowbar'),
+('槓', 'lever'),
+('槓', 'pole'),
+('槓', 'sharpen'),
+('槓', 'trunk'),
+('槙', 'a twig'),
+('槙', 'an ornamental evergreen'),
+('槥', 'coffin'),
+('槧', 'edition'),
+('槧', 'wooden tablet'),
+('槨', 'outer-coffin'),
+('槩', 'approximately'),
+('槩', 'generally'),
+('槪', 'generally'),
+('槭', 'maple'),
+('槲', 'type of oak'),
+('槹', 'spar'),
+('槹', 'well-sweep'),
+('槻', 'zelkova tree'),
+('槽', 'a distillery'),
+('槽', 'groove'),
+('槽', 'manger'),
+('槽', 'tank'),
+('槽', 'trough'),
+('槽', 'vat'),
+('槿', 'hibiscus'),
+('樂', 'enjoy'),
+('樂', 'enjoyable'),
+('樂', 'fond'),
+('樂', 'glad'),
+('樂', 'happiness'),
+('樂', 'happy'),
+('樂', 'like'),
+('樂', 'melody'),
+('樂', 'music'),
+('樂', 'pleasure'),
+('樂', 'song'),
+('樂', 'tune'),
+('樅', 'fir tree'),
+('樊', 'a fence an enclosed place'),
+('樊', 'a railing'),
+('樋', 'tree name'),
+('樑', 'beam'),
+('樑', 'bridge'),
+('樒', 'a tree whose branches are placed on Buddhist graves'),
+('樓', 'building'),
+('樓', 'building of two or more stories'),
+('樓', 'more'),
+('樓', 'stories'),
+('樓', 'two'),
+('樗', 'Ailanthus glandulosa'),
+('樗', 'a kind of tree useless as timber'),
+('標', 'a mark'),
+('標', 'label'),
+('標', 'mark'),
+('標', 'sign'),
+('標', 'standard'),
+('標', 'symbol'),
+('樛', 'bending branches'),
+('樛', 'bent limbs'),
+('樞', 'center of power'),
+('樞', 'door hinge'),
+('樞', 'pivot'),
+('樟', 'camphor tree'),
+('模', 'copy'),
+('模', 'imitate'),
+('模', 'model'),
+('模', 'pattern'),
+('模', 'standard'),
+('樣', 'form'),
+('樣', 'pattern'),
+('樣', 'shape'),
+('樣', 'style'),
+('権', 'authority'),
+('権', 'power'),
+('権', 'right'),
+('横', 'across'),
+('樫', 'evergreen oak'),
+('樵', 'firewood'),
+('樵', 'gather wood'),
+('樵', 'woodcutter'),
+('樸', 'honest'),
+('樸', 'plain'),
+('樸', 'rough'),
+('樸', 'simple'),
+('樹', 'establish'),
+('樹', 'plant'),
+('樹', 'set up'),
+('樹', 'tree'),
+('樺', 'birch'),
+('樺', 'type of birch'),
+('樽', 'goblet'),
+('樽', 'jar'),
+('樽', 'jug'),
+('樽', 'lush'),
+('樿', 'coffin'),
+('橄', 'olive'),
+('橇', 'a sledge for transportation'),
+('橈', 'a paddle'),
+('橈', 'bent or twisted piece of wood'),
+('橊', 'pomegranate'),
+('橊', 'variant of 榴'),
+('橋', 'beam'),
+('橋', 'bridge'),
+('橋', 'crosspiece'),
+('橐', 'a bag opening at both ends'),
+('橐', 'a sack'),
+('橒', 'wood streaks'),
+('橘', 'orange'),
+('橘', 'tangerine'),
+('橙', 'orange'),
+('橚', 'tall tree'),
+('橛', 'stake'),
+('機', 'chance'),
+('機', 'machine'),
+('機', 'moment'),
+('機', 'opportunity'),
+('橡', 'chestnut oak'),
+('橡', 'rubber'),
+('橡', 'rubber tree'),
+('橢', 'elliptical'),
+('橢', 'oval-shaped'),
+('橢', 'tubular'),
+('橦', 'a counter for paper or other thin objects'),
+('橦', 'business'),
+('橦', 'tree'),
+('橧', '집'),
+('橫', 'across'),
+('橫', 'horizontal'),
+('橫', 'lateral'),
+('橴', 'place name'),
+('橵', 'wood placed under roof tiles'),
+('橽', 'birch'),
+('橽', '박달나무'),
+('橿', 'a kind of oak'),
+('檀', 'birch'),
+('檀', 'dana'),
+('檀', 'hardwood'),
+('檀', 'sandalwood'),
+('檀', 'surname'),
+('檄', 'call arms'),
+('檄', 'urgency'),
+('檉', 'tamarisk'),
+('檉', 'type of willow'),
+('檍', 'ilex'),
+('檎', 'small red apple'),
+('檐', 'brim'),
+('檐', 'eaves of house'),
+('檐', 'rim'),
+('檔', 'crosspiece'),
+('檔', 'frame'),
+('檔', 'shelf'),
+('檗', 'tree'),
+('檜', 'Chinese cypress'),
+('檜', 'Chinese juniper'),
+('檝', 'oar'),
+('檟', 'small evergreen shrub'),
+('檠', 'frame for bow'),
+('檠', 'stand for lamp'),
+('檢', 'check'),
+('檢', 'examination'),
+('檢', 'examine'),
+('檢', 'inspection'),
+('檣', 'boom'),
+('檣', 'mast'),
+('檣', 'yard-arm'),
+('檬', 'lemon'),
+('檮', 'block of wood'),
+('檮', 'blockhead'),
+('檮', 'stupid'),
+('檯', 'table'),
+('檳', 'areca nut'),
+('檳', 'betelnut'),
+('檸', 'lemon'),
+('檻', 'door-sill'),
+('檻', 'threshold'),
+('檼', 'ridge pole'),
+('檼', 'shape wood by use of heat'),
+('檼', 'tool for shaping bent wood'),
+('檿', 'mulberry'),
+('櫂', 'oar'),
+('櫂', 'paddle'),
+('櫂', 'row'),
+('櫂', 'scull'),
+('櫃', 'counter'),
+('櫃', 'cupboard'),
+('櫃', 'wardrobe'),
+('櫓', 'oar'),
+('櫓', 'row'),
+('櫓', 'scull'),
+('櫚', 'palm'),
+('櫛', 'comb out'),
+('櫛', 'eliminate'),
+('櫛', 'weed out'),
+('櫜', 'quiver(case for arrows)'),
+('櫝', 'box'),
+('櫝', 'cabinet'),
+('櫝', 'closet'),
+('櫝', 'coffin'),
+('櫝', 'wardrobe'),
+('櫞', 'citrus'),
+('櫟', 'chestnut-leaved oak'),
+('櫟', 'oak'),
+('櫪', 'stable'),
+('櫪', 'type of oak'),
+('櫬', 'coffin'),
+('櫬', 'tung tree'),
+('櫻', 'cherry'),
+('櫻', 'cherry blossom'),
+('欃', 'comet'),
+('欃', 'sandalwood'),
+('欄', 'animal'),
+('欄', 'animal pan'),
+('欄', 'balustrade'),
+('欄', 'pan'),
+('欄', 'railing'),
+('權', 'authority'),
+('權', 'power'),
+('權', 'right'),
+('欌', 'cabinet'),
+('欌', 'wardrobe'),
+('欑', 'gather'),
+('欒', 'a part of cornice'),
+('欒', 'name of tree'),
+('欕', 'castor oil'),
+('欕', 'prickly'),
+('欕', 'tree'),
+('欕', 'tree name'),
+('欖', 'olive'),
+('欞', 'a lintel'),
+('欞', 'the lattice of a window a sill'),
+('欠', 'KangXi radical number 76'),
+('欠', 'be deficient'),
+('欠', 'lack'),
+('欠', 'owe'),
+('欠', 'yawn'),
+('次', 'next'),
+('次', 'order'),
+('次', 'second'),
+('次', 'sequence'),
+('欣', 'delighted'),
+('欣', 'happy'),
+('欣', 'joyous'),
+('欬', 'cough'),
+('欬', 'sound of laughter'),
+('欲', 'desire'),
+('欲', 'intend'),
+('欲', 'long for'),
+('欲', 'want'),
+('欵', 'sincerity'),
+('欵', '정성'),
+('欷', 'sigh'),
+('欷', 'sob'),
+('欸', 'an exclamatory sound'),
+('欸', 'sighs'),
+('欹', '(Cant.) strange'),
+('欹', 'fierce dog'),
+('欹', 'interjection of pleas'),
+('欺', 'cheat'),
+('欺', 'deceive'),
+('欺', 'doublecross'),
+('欻', 'abrupt'),
+('欻', 'quick'),
+('欻', 'sudden'),
+('欽', 'admire'),
+('欽', 'respect'),
+('欽', 'respectful'),
+('款', 'an article/conditions of the law'),
+('款', 'article'),
+('款', 'clause'),
+('款', 'fund'),
+('款', 'item'),
+('欿', 'discontented'),
+('欿', 'gloomy'),
+('欿', 'sad'),
+('欿', 'sorrowful'),
+('歃', 'smear ones mouth with blood of a victim when taking an oath'),
+('歆', 'admire'),
+('歆', 'after'),
+('歆', 'be'),
+('歆', 'envy'),
+('歆', 'gladly'),
+('歆', 'jealous'),
+('歆', 'like'),
+('歆', 'seek'),
+('歆', 'to quicken'),
+('歆', 'want'),
+('歆', 'willingly'),
+('歇', 'lodge'),
+('歇', 'rest'),
+('歇', 'stop'),
+('歉', 'deficient'),
+('歉', 'insufficient'),
+('歉', 'lacking'),
+('歌', 'chant'),
+('歌', 'lyrics'),
+('歌', 'praise'),
+('歌', 'sing'),
+('歌', 'song'),
+('歎', 'admire'),
+('歎', 'sigh'),
+('歐', 'Europe'),
+('歐', 'ohm'),
+('歐', 'surname'),
+('歐', 'used in transliterating non-Chinese words such as Europe'),
+('歓', 'enjoy'),
+('歓', 'glad'),
+('歓', 'happy'),
+('歓', 'joy'),
+('歓', 'pleased'),
+('歔', 'blow through nose'),
+('歔', 'snort'),
+('歙', 'a countys name in anhui'),
+('歙', 'suck'),
+('歙', 'to suck'),
+('歚', 'used in name of famous Korean painter Ceng Sen'),
+('歚', '鄭敾'),
+('歛', 'collect'),
+('歛', 'draw back'),
+('歛', 'fold back'),
+('歟', 'a final particle used to express admiration'),
+('歟', 'doubt'),
+('歟', 'or to mark a question'),
+('歟', 'surprise'),
+('歠', 'drink'),
+('歠', 'sip'),
+('歠', 'suck'),
+('歡', 'glad'),
+('歡', 'happy'),
+('歡', 'joy'),
+('歡', 'pleased'),
+('歡', 'to enjoy'),
+('止', 'desist'),
+('止', 'detain'),
+('止', 'halt'),
+('止', 'stop'),
+('正', 'correct'),
+('正', 'erect'),
+('正', 'first'),
+('正', 'lunar'),
+('正', 'month'),
+('正', 'proper'),
+('正', 'right'),
+('正', 'straight'),
+('正', 'target'),
+('正', 'upright'),
+('正', 'year'),
+('此', 'here'),
+('此', 'in this case'),
+('此', 'then'),
+('此', 'these'),
+('此', 'this'),
+('步', 'pace'),
+('步', 'step'),
+('步', 'stroll'),
+('步', 'walk'),
+('武', 'courage'),
+('武', 'demonstrate'),
+('武', 'force'),
+('武', 'honor'),
+('武', 'martial'),
+('武', 'martial art'),
+('武', 'martial arts'),
+('武', 'military'),
+('武', 'nobility'),
+('武', 'soldier'),
+('武', 'strategy'),
+('武', 'tactics'),
+('武', 'warlike'),
+('武', 'warrior'),
+('武', 'weapons'),
+('武', 'wushu'),
+('歧', 'branching off'),
+('歧', 'fork of road'),
+('歩', 'step'),
+('歩', '步'),
+('歪', 'askewd'),
+('歪', 'awry'),
+('歪', 'inclined'),
+('歪', 'slant'),
+('歯', 'a form of KangXi radical 211'),
+('歯', 'age'),
+('歯', 'cogs'),
+('歯', 'gears'),
+('歯', 'teeth'),
+('歲', 'age'),
+('歲', 'harvest'),
+('歲', 'year'),
+('歳', 'age'),
+('歳', 'harvest'),
+('歳', 'year'),
+('歷', 'exhaust'),
+('歷', 'experience'),
+('歷', 'go through'),
+('歷', 'history'),
+('歷', 'past'),
+('歷', 'take place'),
+('歷', 'undergo'),
+('歷', 'use up'),
+('歸', 'return'),
+('歸', 'return to'),
+('歸', 'revert to'),
+('歹', 'bad'),
+('歹', 'depraved'),
+('歹', 'vicious'),
+('歹', 'wicked'),
+('死', 'dead'),
+('死', 'death'),
+('死', 'die'),
+('歿', 'dead'),
+('歿', 'death'),
+('歿', 'die'),
+('殀', 'die prematurely'),
+('殀', 'die young'),
+('殁', 'dead'),
+('殁', 'death'),
+('殁', 'die'),
+('殂', 'to die'),
+('殃', 'calamity'),
+('殃', 'disaster'),
+('殃', 'misfortune'),
+('殄', 'to end'),
+('殄', 'to exterminate'),
+('殆', 'dangerous'),
+('殆', 'endanger'),
+('殆', 'perilous'),
+('殉', 'be martyr for'),
+('殉', 'die for cause'),
+('殊', 'different'),
+('殊', 'special'),
+('殊', 'unusual'),
+('残', 'broken'),
+('残', 'injure'),
+('残', 'oppress'),
+('残', 'spoil'),
+('殍', 'to starve to death'),
+('殑', 'swoon'),
+('殖', 'breed'),
+('殖', 'increase'),
+('殖', 'prosper'),
+('殖', 'spawn'),
+('殘', 'broken'),
+('殘', 'injure'),
+('殘', 'oppress'),
+('殘', 'spoil'),
+('殞', 'die'),
+('殞', 'fall'),
+('殞', 'perish'),
+('殞', 'vanish'),
+('殢', 'be in great difficulty'),
+('殢', 'greatly'),
+('殤', 'die young'),
+('殤', 'national mourning'),
+('殫', 'entirely'),
+('殫', 'quite'),
+('殫', 'use up'),
+('殫', 'utmost'),
+('殭', 'a stiff corpse'),
+('殮', 'dress corpse for burial'),
+('殯', 'embalm'),
+('殯', 'encoffin'),
+('殯', 'funeral'),
+('殲', 'annihilate'),
+('殲', 'annihilation'),
+('殲', 'kill off'),
+('殲', 'wipe out'),
+('殳', 'kill'),
+('殳', 'long'),
+('殳', 'name of old weapon'),
+('殳', 'pole'),
+('殳', 'rad. 79'),
+('段', 'division'),
+('段', 'piece'),
+('段', 'section'),
+('段', 'step'),
+('殷', 'abundant'),
+('殷', 'flourishing'),
+('殷', 'great'),
+('殷', 'many'),
+('殸', 'elegance'),
+('殸', 'honor'),
+('殸', 'song'),
+('殸', 'voice'),
+('殺', 'clip'),
+('殺', 'diminish'),
+('殺', 'hurt'),
+('殺', 'kill'),
+('殺', 'murder'),
+('殺', 'pare'),
+('殺', 'reduce'),
+('殺', 'slaughter'),
+('殺', 'to pare off'),
+('殻', 'casing'),
+('殻', 'hull'),
+('殻', 'husk'),
+('殻', 'shell'),
+('殻', 'skin'),
+('殼', 'casing'),
+('殼', 'hull'),
+('殼', 'husk'),
+('殼', 'shell'),
+('殼', 'skin'),
+('殽', 'confused'),
+('殽', 'cooked'),
+('殽', 'mixed up'),
+('殿', 'hall'),
+('殿', 'palace'),
+('殿', 'temple'),
+('毀', 'destroy'),
+('毀', 'injure'),
+('毀', 'ruin'),
+('毀', 'slander'),
+('毁', 'destroy'),
+('毅', 'decisive'),
+('毅', 'firm'),
+('毅', 'persist'),
+('毅', 'resolute'),
+('毆', 'beat'),
+('毆', 'brawl'),
+('毆', 'fight with fists'),
+('毆', 'hit'),
+('毆', 'to strike'),
+('毋', 'do not'),
+('毋', 'not'),
+('毋', 'rad. 80'),
+('毋', 'surname'),
+('毌', 'pierce'),
+('母', 'female'),
+('母', 'female elders'),
+('母', 'mother'),
+('毎', 'every'),
+('每', 'always'),
+('每', 'each'),
+('每', 'every'),
+('毒', 'poison'),
+('毒', 'poisonous'),
+('毒', 'turtle'),
+('毒', 'venom'),
+('毓', 'bring up'),
+('毓', 'educate'),
+('毓', 'give birth to'),
+('比', 'comparison'),
+('比', 'liken'),
+('比', 'than'),
+('比', 'to compare'),
+('毖', 'caution'),
+('毖', 'guard against'),
+('毖', 'take care'),
+('毗', 'adjoin'),
+('毗', 'assist'),
+('毗', 'connect'),
+('毗', 'help'),
+('毘', 'adjoin'),
+('毘', 'assist'),
+('毘', 'connect'),
+('毘', 'help'),
+('毚', 'crafty'),
+('毚', 'cunning'),
+('毚', 'greedy'),
+('毛', 'a piece of hair, a toothbrush bristle'),
+('毛', 'coarse'),
+('毛', 'feathers'),
+('毛', 'fur'),
+('毛', 'hair'),
+('毫', 'fine hair'),
+('毫', 'measure of length'),
+('毬', 'anything round'),
+('毬', 'ball'),
+('毬', 'sphere'),
+('毯', 'blanket'),
+('毯', 'carpet'),
+('毯', 'rug'),
+('毳', 'fine hair or fur on animals'),
+('毿', 'long feathers'),
+('毿', 'scraggy'),
+('氅', 'down feathers'),
+('氅', 'overcoat'),
+('氈', 'carpet'),
+('氈', 'felt'),
+('氈', 'rug'),
+('氏', 'clan'),
+('氏', 'family'),
+('氏', 'lineage'),
+('氏', 'mister'),
+('氏', 'surname'),
+('氏', '월지'),
+('氐', 'basis'),
+('氐', 'foundation'),
+('氐', 'name of an ancient tribe'),
+('氐', 'origin'),
+('民', 'citizens'),
+('民', 'nation'),
+('民', 'people'),
+('民', 'populace'),
+('民', 'subjects'),
+('氓', 'people'),
+('氓', 'subjects'),
+('氓', 'vassals'),
+('気', 'air'),
+('気', 'gas'),
+('気', 'spirit'),
+('気', 'steam'),
+('気', 'vapor'),
+('氛', 'air'),
+('氛', 'gas'),
+('氛', 'vapor'),
+('氣', 'air'),
+('氣', 'aura'),
+('氣', 'energy'),
+('氣', 'gas'),
+('氣', 'spirit'),
+('氣', 'steam'),
+('氣', 'tinge, tint; mist; energy'),
+('氣', 'vapor'),
+('氣', 'vigour'),
+('氣', 'vitality'),
+('氤', 'hanging fog'),
+('氤', 'misty'),
+('氦', 'helium'),
+('氮', 'nitrogen'),
+('氲', 'life giving influences of nature'),
+('氲', 'prosperity'),
+('氲', 'spirit of harmony'),
+('氳', 'aura'),
+('氳', 'life giving influences of nature'),
+('氳', 'prosperity'),
+('氳', 'spirit of harmony'),
+('氳', 'swarm'),
+('水', 'Wednesday'),
+('水', 'juice'),
+('水', 'liquid'),
+('水', 'lot5on'),
+('水', 'water'),
+('氷', 'cold'),
+('氷', 'frost'),
+('氷', 'ice'),
+('氷', 'icicles'),
+('永', 'deep'),
+('永', 'eternal'),
+('永', 'forever'),
+('永', 'long'),
+('永', 'perpetual'),
+('氽', '(Cant.) to turn inside-out'),
+('氽', 'to deep fry'),
+('氽', 'to float'),
+('氾', 'flood'),
+('氾', 'inundate'),
+('氾', 'overflow'),
+('氿', 'spring'),
+('汀', 'bank'),
+('汀', 'beach'),
+('汀', 'sandbar'),
+('汀', 'shore'),
+('汁', 'fluid'),
+('汁', 'gravy'),
+('汁', 'juice'),
+('汁', 'liquor'),
+('汁', 'sap'),
+('汁', 'sauce'),
+('求', 'beseech'),
+('求', 'demand'),
+('求', 'request'),
+('求', 'seek'),
+('求', 'wish'),
+('汊', 'water'),
+('汋', 'to pour'),
+('汎', 'afloat'),
+('汎', 'careless'),
+('汎', 'drift'),
+('汎', 'float'),
+('汐', 'evening ebb tide'),
+('汐', 'night'),
+('汐', 'night tides'),
+('汐', 'tide'),
+('汕', 'Swatow(Shantou)'),
+('汕', 'bamboo'),
+('汕', 'basket for catching fish'),
+('汗', 'flood'),
+('汗', 'khan'),
+('汗', 'perspiration'),
+('汗', 'sweat'),
+('汗', '되'),
+('汗', '땀'),
+('汗', '물'),
+('汗', '임금'),
+('汗', '질펀할'),
+('汙', 'dirty'),
+('汙', 'filthy'),
+('汙', 'impure'),
+('汙', 'polluted'),
+('汚', 'dirty'),
+('汚', 'filthy'),
+('汚', 'impure'),
+('汚', 'polluted'),
+('汛', 'flood tides'),
+('汛', 'high water'),
+('汜', 'a stream which leaves the main branch then later returns'),
+('汜', 'branch'),
+('汜', 'leave'),
+('汜', 'main'),
+('汜', 'return'),
+('汜', 'stream'),
+('汝', 'river'),
+('汝', 'water'),
+('汝', 'you'),
+('汞', 'element mercury'),
+('江', 'large river'),
+('江', 'river'),
+('江', 'surname'),
+('江', 'yangzi'),
+('池', 'cistern'),
+('池', 'moat'),
+('池', 'pond'),
+('池', 'pool'),
+('池', 'surname'),
+('污', 'dirty'),
+('污', 'filthy'),
+('污', 'impure'),
+('污', 'polluted'),
+('汨', 'Mi(luo) river in Hunan province where Qu Yuan drowned himself'),
+('汨', 'to sink'),
+('汨', 'used(erroneously) for  汩'),
+('汩', 'run swiftly'),
+('汪', 'deep'),
+('汪', 'extensive'),
+('汪', 'surname'),
+('汪', 'vast'),
+('汭', 'bend'),
+('汭', 'bends'),
+('汭', 'confluence of two streams'),
+('汭', 'river'),
+('汰', 'excessive'),
+('汰', 'scour'),
+('汰', 'wash out'),
+('汲', 'draw water from well'),
+('汲', 'imbibe'),
+('汲', 'water'),
+('汴', 'Henan'),
+('汴', 'name of a river in Henan'),
+('汴', '기뻐할 변 .  ㉠기뻐하다 ㉡좋아하다 ㉢기뻐하고 즐거워하는 모양'),
+('汶', 'a river in Shandong province'),
+('決', 'decide'),
+('決', 'determine'),
+('決', 'judge'),
+('汽', 'gas'),
+('汽', 'nearly'),
+('汽', 'steam'),
+('汽', 'vapor'),
+('汽', 'vapour'),
+('汾', 'river in Shanxi province'),
+('沁', 'percolate'),
+('沁', 'seep in'),
+('沁', 'soak into'),
+('沂', 'river in Southeast Shandong'),
+('沃', 'fertile'),
+('沃', 'irrigate'),
+('沃', 'rich'),
+('沃', 'water'),
+('沄', 'billows'),
+('沅', 'name of a river in western Hunan that flows into Dongting lake'),
+('沆', 'a ferry'),
+('沆', 'flow'),
+('沆', 'flowing'),
+('沆', 'fog'),
+('沆', 'vast'),
+('沇', 'brimming'),
+('沇', 'flowing and engulfing'),
+('沈', 'addicted to'),
+('沈', 'dark'),
+('沈', 'gloomy'),
+('沈', 'indulge'),
+('沈', 'name'),
+('沈', 'sink'),
+('沈', 'submerge'),
+('沈', 'surname'),
+('沉', 'addicted to'),
+('沉', 'sink'),
+('沉', 'submerge'),
+('沌', 'chaotic'),
+('沌', 'confused'),
+('沌', 'disorderly'),
+('沌', 'murky'),
+('沌', 'turbid'),
+('沍', 'closed off'),
+('沍', 'freezing'),
+('沍', 'stopped up'),
+('沐', 'bathe'),
+('沐', 'cleanse'),
+('沐', 'shampoo'),
+('沐', 'wash'),
+('沒', 'drown'),
+('沒', 'have not'),
+('沒', 'none'),
+('沒', 'not'),
+('沒', 'sink'),
+('沒', 'to drown'),
+('沓', 'connected'),
+('沓', 'joined'),
+('沓', 'repeated'),
+('沔', 'flood'),
+('沔', 'overflowing'),
+('沕', '(Cant.) to dive'),
+('沕', 'deep'),
+('沖', 'infuse'),
+('沖', 'pour'),
+('沖', 'steep'),
+('沖', 'wash away'),
+('沘', 'name of a river'),
+('沙', 'granulated'),
+('沙', 'gravel'),
+('沙', 'pebbles'),
+('沙', 'sand'),
+('沚', 'islet in stream'),
+('沚', 'small sandbar'),
+('沛', 'abundant'),
+('沛', 'copious'),
+('沛', 'full'),
+('沛', 'sudden'),
+('沢', 'brilliance'),
+('沢', 'grace'),
+('沢', 'marsh'),
+('沢', 'swamp'),
+('沫', 'bubbles'),
+('沫', 'foam'),
+('沫', 'froth'),
+('沫', 'suds'),
+('沬', '(Cant.) to go underwater'),
+('沬', 'Mei river'),
+('沬', 'Zhou dynasty place-name'),
+('沬', 'dusk'),
+('沬', 'to dive'),
+('沮', 'defeated'),
+('沮', 'dejected'),
+('沮', 'prevent'),
+('沮', 'stop'),
+('沰', 'to let drop'),
+('沱', 'flow'),
+('沱', 'rivers'),
+('沱', 'streams'),
+('沱', 'waterways'),
+('河', 'river'),
+('河', 'stream'),
+('河', 'yellow river'),
+('沸', 'boil'),
+('沸', 'bubble up'),
+('沸', 'gush'),
+('油', 'fat'),
+('油', 'grease'),
+('油', 'lard'),
+('油', 'oil'),
+('油', 'paints'),
+('治', 'administer'),
+('治', 'govern'),
+('治', 'regulate'),
+('沼', 'fishpond'),
+('沼', 'lake'),
+('沼', 'pond'),
+('沼', 'swamp'),
+('沼', 'swamps'),
+('沽', 'buy and sell'),
+('沽', 'inferior in quality'),
+('沾', 'append'),
+('沾', 'discourteous'),
+('沾', 'frivolous'),
+('沾', 'increase'),
+('沾', 'moisten'),
+('沾', 'smug'),
+('沾', 'soak'),
+('沾', 'touch'),
+('沾', 'wet'),
+('沿', 'continue'),
+('沿', 'follow'),
+('沿', 'follow course'),
+('沿', 'go along'),
+('況', 'condition'),
+('況', 'furthermore'),
+('況', 'situation'),
+('泂', 'clear and deep(of water)'),
+('泂', 'deep'),
+('泂', 'distant'),
+('泂', 'far'),
+('泂', 'profound'),
+('泂', 'wide'),
+('泄', 'flow'),
+('泄', 'leak'),
+('泄', 'reveal'),
+('泄', 'vent'),
+('泅', 'float'),
+('泅', 'swim'),
+('泅', 'wade'),
+('泆', 'dissipated'),
+('泆', 'libertine'),
+('泆', 'licentious'),
+('泉', 'fountain'),
+('泉', 'money'),
+('泉', 'spring'),
+('泉', 'wealth'),
+('泊', 'anchor vessel'),
+('泊', 'lie at anchor'),
+('泊', 'stay'),
+('泊', 'visit'),
+('泌', 'excrete'),
+('泌', 'excretion'),
+('泌', 'to seep out'),
+('泐', 'to indite'),
+('泐', 'to write'),
+('泐', 'veins in minerals'),
+('泑', 'etc.'),
+('泑', 'porcelain'),
+('泑', 'the vitreous glaze on china'),
+('泓', 'clear'),
+('泓', 'deep pool of water'),
+('泔', 'as gruel'),
+('泔', 'water from washing rice to boil thick'),
+('法', 'France'),
+('法', 'French'),
+('法', 'law'),
+('法', 'regulation'),
+('法', 'rule'),
+('法', 'statute'),
+('泗', 'mucous'),
+('泗', 'nasal flow'),
+('泗', 'river in Shandong'),
+('泗', 'sniffle'),
+('泙', 'roar'),
+('泚', 'bright and brilliant'),
+('泚', 'clear'),
+('泚', 'swea'),
+('泛', 'careless'),
+('泛', 'float'),
+('泛', 'reckless'),
+('泛', 'to drift'),
+('泜', 'a river in Hebei province'),
+('泝', 'formerly'),
+('泝', 'go upstream'),
+('泝', 'trace source'),
+('泠', 'mild and comfortable'),
+('泠', 'nice and cool'),
+('泡', 'blister'),
+('泡', 'bubble'),
+('泡', 'bubbles'),
+('泡', 'soak'),
+('泡', 'suds'),
+('波', 'breakers'),
+('波', 'undulation'),
+('波', 'undulations'),
+('波', 'wave'),
+('波', 'waves'),
+('泣', 'cry'),
+('泣', 'sob'),
+('泣', 'weep'),
+('泥', 'clay'),
+('泥', 'dirt'),
+('泥', 'earth'),
+('泥', 'mire'),
+('泥', 'mud'),
+('泥', 'plaster'),
+('注', 'concentrate'),
+('注', 'direct'),
+('注', 'focus'),
+('注', 'pour'),
+('泫', 'cry'),
+('泫', 'glisten'),
+('泫', 'shine'),
+('泫', 'weep'),
+('泮', 'Zhou dynasty school'),
+('泮', 'disperse'),
+('泮', 'fall apart'),
+('泮', 'melt'),
+('泯', 'destroy'),
+('泯', 'eliminate'),
+('泯', 'perish'),
+('泰', 'Tai'),
+('泰', 'Thai'),
+('泰', 'big'),
+('泰', 'exalted'),
+('泰', 'great'),
+('泰', 'superior'),
+('泱', 'agitated'),
+('泱', 'expansive'),
+('泱', 'great'),
+('泳', 'dive'),
+('泳', 'swim'),
+('洄', 'a back-water'),
+('洄', 'an eddy a whirlpool'),
+('洄', 'foolish'),
+('洊', 'flowing water'),
+('洋', 'foreign'),
+('洋', 'ocean'),
+('洋', 'sea'),
+('洋', 'western'),
+('洌', 'clear'),
+('洑', 'undercurrent'),
+('洑', 'whirlpool'),
+('洒', 'pour'),
+('洒', 'scatter'),
+('洒', 'sprinkle'),
+('洒', 'to shiver'),
+('洒', 'to wipe away'),
+('洗', 'clean'),
+('洗', 'purify'),
+('洗', 'rinse'),
+('洗', 'wash'),
+('洙', 'Shandong'),
+('洙', 'name'),
+('洙', 'name of a river in Shandong'),
+('洙', 'province'),
+('洙', 'river'),
+('洛', 'Luoyang'),
+('洛', 'city'),
+('洛', 'river in Shanxi province'),
+('洞', 'North'),
+('洞', 'South Korea'),
+('洞', 'a Dong, which is smaller than a Ku, which is smaller than a city'),
+('洞', 'administrative'),
+('洞', 'bright'),
+('洞', 'cave'),
+('洞', 'cavity'),
+('洞', 'division'),
+('洞', 'grotto'),
+('洞', 'hole'),
+('洞', 'penetrating'),
+('洞', 'ravine'),
+('洞', 'submunicipal'),
+('洞', 'thorough'),
+('洟', 'mucus from nose'),
+('洟', 'snivel'),
+('津', 'ferry'),
+('津', 'ford'),
+('津', 'resin'),
+('津', 'resin, sap'),
+('津', 'saliva'),
+('津', 'sap'),
+('洧', 'name of a river in honan'),
+('洩', 'drip'),
+('洩', 'leak'),
+('洩', 'vent or release'),
+('洪', 'deluge'),
+('洪', 'flood'),
+('洪', 'immense'),
+('洪', 'vast'),
+('洫', 'a moat'),
+('洫', 'to ditch'),
+('洮', 'cleanse'),
+('洮', 'river in Gansu province'),
+('洲', 'continent'),
+('洲', 'island'),
+('洲', 'islet'),
+('洵', 'real'),
+('洵', 'really'),
+('洵', 'true'),
+('洵', 'truly'),
+('洶', 'noisy'),
+('洶', 'restless'),
+('洶', 'the rush of water'),
+('洶', 'turbulent'),
+('洸', 'glitter'),
+('洸', 'sparkle'),
+('洹', 'river in Henan province'),
+('洺', 'river in Hebei province'),
+('活', 'activity'),
+('活', 'exist'),
+('活', 'live'),
+('活', 'lively'),
+('活', 'survive'),
+('洼', 'depression'),
+('洼', 'hollow'),
+('洼', 'pit'),
+('洼', 'pool'),
+('洼', 'swamp'),
+('洽', 'a river in Shenxi'),
+('洽', 'be in harmony'),
+('洽', 'to blend with'),
+('洽', 'to cover'),
+('洽', 'to penetrate'),
+('派', 'branch'),
+('派', 'faction'),
+('派', 'school of thought'),
+('派', 'sect'),
+('洿', 'mud'),
+('洿', 'pool'),
+('流', 'circulate'),
+('流', 'class'),
+('流', 'drift'),
+('流', 'flow'),
+('浅', 'not deep'),
+('浅', 'shallow'),
+('浅', 'superficial'),
+('浌', 'mudflat'),
+('浌', 'tidal flat'),
+('浙', 'Zhejiang province'),
+('浙', 'river'),
+('浚', 'dredge'),
+('浜', 'GI, grade of soldier'),
+('浜', 'beach'),
+('浜', 'creek'),
+('浜', 'sea coast'),
+('浜', 'stream'),
+('浡', 'burst forth'),
+('浡', 'rise'),
+('浡', 'vigorous'),
+('浣', 'rinse'),
+('浣', 'to rinse'),
+('浣', 'to wash'),
+('浣', 'wash'),
+('浤', 'beating of ocean'),
+('浤', 'surging of wate'),
+('浥', 'dampen'),
+('浥', 'moist'),
+('浥', 'wet'),
+('浦', 'bank of river'),
+('浦', 'estuary'),
+('浦', 'riverbank'),
+('浦', 'shore'),
+('浦', 'surname'),
+('浩', 'abundant'),
+('浩', 'great'),
+('浩', 'numerous'),
+('浩', 'vast'),
+('浪', 'reckless'),
+('浪', 'wasteful'),
+('浪', 'wave'),
+('浬', 'nautical mile'),
+('浮', 'drift'),
+('浮', 'float'),
+('浮', 'superfluous'),
+('浮', 'to exceed'),
+('浮', 'to float'),
+('浮', 'waft'),
+('浴', 'bath'),
+('浴', 'bathe'),
+('浴', 'bathing'),
+('浴', 'wash'),
+('海', 'maritime'),
+('海', 'ocean'),
+('海', 'sea'),
+('浸', 'dip'),
+('浸', 'immerse'),
+('浸', 'percolate'),
+('浸', 'soak'),
+('浹', 'damp'),
+('浹', 'drench'),
+('浹', 'saturate'),
+('浹', 'wet'),
+('浼', 'besmirch'),
+('涂', 'name of certain rivers'),
+('涂', 'surname'),
+('涅', 'black'),
+('涅', 'black mud'),
+('涅', 'blacken'),
+('涅', 'slime'),
+('涅', 'soil'),
+('涅', 'tatto'),
+('涇', 'name of a river'),
+('消', 'die out'),
+('消', 'disappear'),
+('消', 'extinguish'),
+('消', 'melt away'),
+('消', 'vanish'),
+('涉', 'ford stream'),
+('涉', 'wade across'),
+('涌', 'bubble up'),
+('涌', 'gush forth'),
+('涌', 'surge up'),
+('涎', 'saliva'),
+('涑', 'river in Shansi province'),
+('涓', 'brook'),
+('涓', 'pure'),
+('涓', 'select'),
+('涓', 'stream'),
+('涔', 'murky torrent'),
+('涔', 'river in Shaanxi'),
+('涕', 'nasal mucus'),
+('涕', 'snivel'),
+('涕', 'tear'),
+('涖', 'creek'),
+('涖', 'river in Hebei province'),
+('涙', 'tears'),
+('涙', 'weep'),
+('涜', 'ditch'),
+('涜', 'drain'),
+('涜', 'gutter'),
+('涜', 'sluice'),
+('涣', 'scatter'),
+('涣', 'scattered'),
+('涪', 'river in Sichuan province'),
+('涯', 'bank'),
+('涯', 'shore'),
+('涯', 'waters edge'),
+('液', 'fluid'),
+('液', 'juice'),
+('液', 'juice, in  liquor'),
+('液', 'liquid'),
+('液', 'sap'),
+('涴', 'daub'),
+('涵', 'be lenient'),
+('涵', 'soak'),
+('涵', 'tolerate'),
+('涵', 'wet'),
+('涷', 'rainstorm'),
+('涸', 'dried up'),
+('涸', 'dry'),
+('涸', 'exhausted'),
+('涸', 'tired'),
+('涼', 'cold'),
+('涼', 'cool'),
+('涼', 'disheartened'),
+('涿', 'dribble'),
+('涿', 'drip'),
+('涿', 'trickle'),
+('淀', 'shallow water'),
+('淀', 'swamp'),
+('淀', 'swampy'),
+('淄', 'river in Shandong province'),
+('淅', 'to wash ric'),
+('淅', 'water used wash rice'),
+('淆', 'confused'),
+('淆', 'in disarray'),
+('淆', 'mixed up'),
+('淇', 'river in Henan province'),
+('淋', 'drench'),
+('淋', 'drip'),
+('淋', 'perfectly'),
+('淋', 'soak'),
+('淑', 'charming'),
+('淑', 'good'),
+('淑', 'pure'),
+('淑', 'virtuous'),
+('淒', 'bitter cold'),
+('淒', 'dreary'),
+('淒', 'miserable'),
+('淖', 'mud'),
+('淖', 'slush'),
+('淘', 'wash in sieve'),
+('淘', 'weed out'),
+('淙', 'gurgling sound of water'),
+('淚', 'cry'),
+('淚', 'tear'),
+('淚', 'tears'),
+('淚', 'weep'),
+('淝', 'name of an affluent of the Poyang Lake'),
+('淞', 'name of a river in Jiangsu'),
+('淡', 'clean'),
+('淡', 'clear'),
+('淡', 'insipid'),
+('淡', 'pure'),
+('淡', 'tasteless'),
+('淡', 'watery'),
+('淡', 'weak'),
+('淢', 'ditch'),
+('淤', 'clog up'),
+('淤', 'mud'),
+('淤', 'sediment'),
+('淤', 'silt up'),
+('淥', '(Cant.) to scald'),
+('淥', 'strain'),
+('淦', 'river in Jiangxi province'),
+('淦', 'water leaking into a boat'),
+('淨', 'clean'),
+('淨', 'pure'),
+('淨', 'unspoiled'),
+('淪', 'be lost'),
+('淪', 'be submerged'),
+('淪', 'sink'),
+('淫', 'lewd'),
+('淫', 'licentious'),
+('淫', 'obscene'),
+('淬', 'alter'),
+('淬', 'change'),
+('淬', 'dye'),
+('淬', 'soak'),
+('淬', 'temper'),
+('淮', 'river in Anhui province'),
+('深', 'deep'),
+('深', 'depth'),
+('深', 'extreme'),
+('深', 'far'),
+('深', 'very'),
+('淳', 'cyanogen'),
+('淳', 'ethane dinitrile'),
+('淳', 'honest'),
+('淳', 'simple'),
+('淳', 'unsophisticated'),
+('淵', 'abyss'),
+('淵', 'deep'),
+('淵', 'gulf'),
+('淶', 'creek'),
+('淶', 'river in Hebei province'),
+('混', 'barbarian'),
+('混', 'blend'),
+('混', 'confuse'),
+('混', 'mingle'),
+('混', 'mix'),
+('混', 'to bumble along'),
+('混', 'to mix'),
+('混', 'turbid'),
+('混', 'unclear'),
+('淸', 'Qing dynasty'),
+('淸', 'clean'),
+('淸', 'clear'),
+('淹', 'cover with liquid'),
+('淹', 'drown'),
+('淹', 'steep'),
+('淺', 'not deep'),
+('淺', 'shallow'),
+('淺', 'superficial'),
+('添', 'add'),
+('添', 'add to'),
+('添', 'append'),
+('添', 'increase'),
+('淼', 'a wide expanse of water'),
+('清', 'clean'),
+('清', 'clear'),
+('清', 'peaceful'),
+('清', 'pure'),
+('渇', 'thirsty'),
+('済', 'aid'),
+('済', 'cross'),
+('済', 'ferry'),
+('済', 'help'),
+('済', 'relieve'),
+('渉', 'ford stream'),
+('渌', 'strain'),
+('渗', 'infiltrate'),
+('渗', 'soak through'),
+('渙', 'dispersed'),
+('渙', 'scatter'),
+('渙', 'scattered'),
+('渚', 'islet'),
+('渚', 'shore'),
+('渚', 'small sand bank'),
+('減', 'decrease'),
+('減', 'diminish'),
+('減', 'reduction'),
+('減', 'subtract'),
+('渝', 'change'),
+('渝', 'chongqing'),
+('渟', '(of water) not flowing'),
+('渟', 'clear'),
+('渠', 'canal'),
+('渠', 'channel'),
+('渠', 'ditch'),
+('渠', 'gutter'),
+('渡', 'cross'),
+('渡', 'ferry'),
+('渡', 'ferry over'),
+('渡', 'over'),
+('渣', 'dregs'),
+('渣', 'lees'),
+('渣', 'refuse'),
+('渣', 'sediment'),
+('渤', 'name of a sea gulf'),
+('渤', 'swelling'),
+('渥', 'deep'),
+('渥', 'dye'),
+('渥', 'great'),
+('渥', 'moisten'),
+('渥', 'soak'),
+('渥', 'to enrich'),
+('渦', 'eddy'),
+('渦', 'name'),
+('渦', 'river'),
+('渦', 'swirl'),
+('渦', 'vortex'),
+('渦', 'whirlpool'),
+('渨', 'a bay'),
+('渨', 'a bend or nook in the hills'),
+('渨', 'a cove'),
+('渨', 'the curve of a bow'),
+('温', 'lukewarm'),
+('渫', 'beating of ocean'),
+('渫', 'surging of wate'),
+('測', 'conjecture'),
+('測', 'estimate'),
+('測', 'measure'),
+('渭', 'name of a river in Shanxi'),
+('港', 'bay'),
+('港', 'harbor'),
+('港', 'harbour'),
+('港', 'port'),
+('港', 'small stream'),
+('渲', 'add repeated washes of color'),
+('渴', 'parched'),
+('渴', 'pine'),
+('渴', 'thirsty'),
+('渴', 'yearn'),
+('游', 'drift'),
+('游', 'float'),
+('游', 'roam'),
+('游', 'to swim'),
+('游', 'wander'),
+('渺', 'boundless'),
+('渺', 'endlessly long'),
+('渺', 'vast'),
+('渼', 'ripples'),
+('渽', 'clear'),
+('渽', 'waterbodies'),
+('渾', 'blend'),
+('渾', 'merge'),
+('渾', 'mix'),
+('渾', 'muddy'),
+('渾', 'turbid'),
+('湃', 'sound of waves'),
+('湃', 'turbulent'),
+('湄', 'bank'),
+('湄', 'shore'),
+('湄', 'waters edge'),
+('湅', 'boil silk'),
+('湊', 'assemble'),
+('湊', 'piece together'),
+('湍', 'rapid water current'),
+('湍', 'rapids'),
+('湎', 'drunk'),
+('湎', 'flushed with drink'),
+('湑', 'abundant'),
+('湑', 'bright'),
+('湑', 'river in Guangxi'),
+('湑', 'to strain spirits'),
+('湓', 'an affluent of the River Yangtze near Kiukiang'),
+('湔', 'cleanse'),
+('湔', 'purge'),
+('湔', 'wash'),
+('湖', 'Hubei'),
+('湖', 'Hunan'),
+('湖', 'a lake'),
+('湖', 'bluish-green'),
+('湖', 'lake'),
+('湘', 'Hunan province'),
+('湛', 'clear'),
+('湛', 'deep'),
+('湛', 'placid'),
+('湛', 'profound'),
+('湛', 'tranquil'),
+('湜', 'clear'),
+('湜', 'transparent'),
+('湞', 'river in Guangdong province'),
+('湟', 'river in qinghai province'),
+('湣', 'confused'),
+('湣', 'mixed'),
+('湣', 'pity'),
+('湧', 'gush forth'),
+('湧', 'rise'),
+('湧', 'well up'),
+('湫', 'a damp and narrow place'),
+('湫', 'a small pond'),
+('湮', 'block up'),
+('湮', 'bury'),
+('湮', 'sink'),
+('湮', 'stain'),
+('湯', 'broth'),
+('湯', 'gravy'),
+('湯', 'hot water'),
+('湯', 'soup'),
+('湲', 'flow'),
+('湽', 'black'),
+('湿', 'damp'),
+('湿', 'humid'),
+('湿', 'illness'),
+('湿', 'moist'),
+('湿', 'wet'),
+('溉', 'flood'),
+('溉', 'irrigate'),
+('溉', 'wash'),
+('溉', 'water'),
+('溌', 'pour'),
+('溌', 'splash'),
+('溌', 'sprinkle'),
+('溌', 'water'),
+('溏', 'not hardened'),
+('溏', 'pool'),
+('溏', 'semi-soft'),
+('源', 'head'),
+('源', 'source'),
+('源', 'spring'),
+('源', 'surname'),
+('準', 'guideline'),
+('準', 'nose bridge'),
+('準', 'rule'),
+('準', 'standard'),
+('溘', 'abruptly'),
+('溘', 'suddenly'),
+('溘', 'unexpectedly'),
+('溜', 'glide'),
+('溜', 'slide'),
+('溜', 'slip'),
+('溜', 'slippery'),
+('溝', 'ditch'),
+('溝', 'drain'),
+('溝', 'narrow waterway'),
+('溟', 'dark'),
+('溟', 'drizzling rain'),
+('溟', 'obscure'),
+('溢', 'brim over'),
+('溢', 'flood'),
+('溢', 'full'),
+('溢', 'overflow'),
+('溥', 'big'),
+('溥', 'great'),
+('溥', 'vast'),
+('溥', 'wide'),
+('溥', 'widespread'),
+('溧', 'river in Anhui and Jiangsu provinces'),
+('溪', 'creek'),
+('溪', 'mountain stream'),
+('溪', 'stream'),
+('溫', 'heat up'),
+('溫', 'lukewarm'),
+('溫', 'mild'),
+('溫', 'tepid'),
+('溫', 'warm'),
+('溯', 'formerly'),
+('溯', 'go against current'),
+('溯', 'go upstream'),
+('溱', 'river in Henan'),
+('溲', 'drench'),
+('溲', 'soak'),
+('溲', 'urinate'),
+('溶', 'dissolve'),
+('溶', 'overflowing with'),
+('溶', 'to melt'),
+('溷', 'dirty'),
+('溷', 'latrine'),
+('溷', 'privy'),
+('溷', 'turbid'),
+('溺', 'drown'),
+('溺', 'indulge'),
+('溺', 'submerge in water'),
+('溺', 'urine'),
+('溽', 'humid'),
+('溽', 'moist'),
+('溽', 'muggy'),
+('滁', 'district in Anhui province'),
+('滂', 'torrential'),
+('滂', 'voluminous'),
+('滃', 'dispersing'),
+('滃', 'rising'),
+('滃', 'swelling'),
+('滄', 'blue'),
+('滄', 'cold'),
+('滄', 'dark green'),
+('滅', 'destroy'),
+('滅', 'exterminate'),
+('滅', 'extinguish'),
+('滅', 'wipe out'),
+('滉', 'deep'),
+('滋', 'grow'),
+('滋', 'increase'),
+('滋', 'multiply'),
+('滋', 'thrive'),
+('滌', 'cleanse'),
+('滌', 'purify'),
+('滌', 'sweep'),
+('滌', 'wash'),
+('滎', 'county in Henan'),
+('滎', 'rising and dashing of waves'),
+('滑', 'comical'),
+('滑', 'polished'),
+('滑', 'slide'),
+('滑', 'slip'),
+('滑', 'slippery'),
+('滓', 'dregs'),
+('滓', 'lees'),
+('滓', 'sediment'),
+('滔', 'a torrent'),
+('滔', 'overflow'),
+('滔', 'rushing water'),
+('滕', 'an ancient state in Shandong province'),
+('滕', 'water bursting forth'),
+('滙', 'to remit money'),
+('滙', 'waters converging to one spot'),
+('滙', 'whirling waters'),
+('滚', 'turn'),
+('滬', 'Shanghai'),
+('滬', 'river near Shanghai'),
+('滯', 'block up'),
+('滯', 'obstruct'),
+('滯', 'stagnant'),
+('滲', 'infiltrate'),
+('滲', 'soak through'),
+('滴', 'drip'),
+('滴', 'drop of water'),
+('滷', 'brine'),
+('滷', 'broth'),
+('滷', 'sauce'),
+('滷', 'thick gravy'),
+('滸', 'riverbank'),
+('滸', 'shore'),
+('滾', 'boil'),
+('滾', 'roll'),
+('滾', 'rotate'),
+('滾', 'turn'),
+('滿', 'fill'),
+('滿', 'full'),
+('滿', 'satisfied'),
+('漁', 'fish'),
+('漁', 'pursue'),
+('漁', 'seize'),
+('漁', 'surname'),
+('漁', 'to fish'),
+('漂', 'drift'),
+('漂', 'float'),
+('漂', 'tossed about'),
+('漆', 'lacquer'),
+('漆', 'paint'),
+('漆', 'varnish'),
+('漉', 'dripping'),
+('漉', 'filter'),
+('漉', 'strain'),
+('漉', 'wet'),
+('漏', 'drip'),
+('漏', 'funnel'),
+('漏', 'hour glass'),
+('漏', 'leak'),
+('漑', 'water'),
+('漓', 'river in Guangxi province'),
+('演', 'exercise'),
+('演', 'perform'),
+('演', 'performance'),
+('演', 'put on'),
+('漕', 'canal transportation'),
+('漕', 'transport by water'),
+('漙', 'dewy'),
+('漚', 'bubble'),
+('漚', 'foam'),
+('漚', 'fragrance'),
+('漚', 'froth'),
+('漚', 'rotten'),
+('漚', 'soak'),
+('漚', 'soaked'),
+('漚', 'sodden'),
+('漚', 'steep'),
+('漠', 'aloof'),
+('漠', 'cool'),
+('漠', 'desert'),
+('漠', 'indifferent'),
+('漢', 'China'),
+('漢', 'Chinese language'),
+('漢', 'Han'),
+('漢', 'dynasty'),
+('漢', 'man'),
+('漢', 'person'),
+('漢', 'the Chinese people'),
+('漣', 'flowing water'),
+('漣', 'ripples'),
+('漣', 'weeping'),
+('漪', 'ripples on water'),
+('漪', 'swirling'),
+('漫', 'overflow'),
+('漫', 'overflow of water'),
+('漫', 'spreading'),
+('漫', 'water'),
+('漬', 'dye'),
+('漬', 'soak'),
+('漬', 'sodden'),
+('漬', 'stains'),
+('漬', 'steep'),
+('漭', 'expansive'),
+('漭', 'vast'),
+('漰', 'roar'),
+('漱', 'gargle'),
+('漱', 'rinse'),
+('漱', 'scour'),
+('漱', 'wash'),
+('漲', 'rise in price'),
+('漳', 'name of a river in Henan'),
+('漸', 'gradually'),
+('漼', 'having the appearance of depth'),
+('漾', 'overflow'),
+('漾', 'ripple'),
+('漾', 'swirl'),
+('漾', 'to be tosssed by waves'),
+('漿', 'any thick fluid'),
+('漿', 'broth'),
+('漿', 'starch'),
+('潁', 'river in Anhui'),
+('潏', 'fareshare reclaimed from river'),
+('潏', 'sandbank'),
+('潑', 'fierce'),
+('潑', 'malignant'),
+('潑', 'pour'),
+('潑', 'splash'),
+('潑', 'sprinkle'),
+('潑', 'violent'),
+('潑', 'water'),
+('潔', 'clean'),
+('潔', 'pure'),
+('潔', 'purify'),
+('潘', 'a river that flows into the Han'),
+('潘', 'surname'),
+('潘', 'water in which rice has been rinsed'),
+('潙', 'river in Shanxi'),
+('潚', 'deep'),
+('潚', 'gay'),
+('潛', 'hidden'),
+('潛', 'hide'),
+('潛', 'latent'),
+('潛', 'secret'),
+('潜', 'hidden'),
+('潜', 'hide'),
+('潜', 'latent'),
+('潜', 'secret'),
+('潝', 'agree'),
+('潞', 'river in northern china'),
+('潟', 'land impregnated with salt from the tide'),
+('潢', 'deep'),
+('潢', 'expanse of water'),
+('潢', 'lake'),
+('潢', 'pond'),
+('潢', 'pool'),
+('潤', 'burnish, gloss, sheen'),
+('潤', 'freshen'),
+('潤', 'moist'),
+('潤', 'sleek'),
+('潤', 'soft'),
+('潦', 'a puddle'),
+('潦', 'to flood'),
+('潦', 'without care'),
+('潭', 'deep'),
+('潭', 'deep pool'),
+('潭', 'lake'),
+('潭', 'profound'),
+('潮', 'damp'),
+('潮', 'flow'),
+('潮', 'moist'),
+('潮', 'tide'),
+('潮', 'wet'),
+('潯', 'jiujiang'),
+('潯', 'steep bank by stream'),
+('潰', 'flooding river'),
+('潰', 'militarily defeat'),
+('潴', 'a pool'),
+('潴', 'pond'),
+('潸', 'tears flowing'),
+('潸', 'weep'),
+('潺', 'sound of flowing water'),
+('潼', 'damp'),
+('潼', 'high'),
+('潼', 'lofty'),
+('潾', 'clear water'),
+('澁', 'astringent'),
+('澁', 'harsh'),
+('澁', 'rough'),
+('澁', 'uneven'),
+('澂', 'clear and still water'),
+('澄', 'clear'),
+('澄', 'pure'),
+('澄', 'purify water by allowing sediment to settle'),
+('澆', 'spray'),
+('澆', 'sprinkle'),
+('澆', 'water'),
+('澈', 'completely'),
+('澈', 'thoroughly'),
+('澉', 'to wash name of a place'),
+('澌', 'to drain dry'),
+('澌', 'to exhaust'),
+('澍', 'life-giving rain'),
+('澍', 'timely rain'),
+('澎', 'splatter'),
+('澐', 'billows'),
+('澒', 'vast'),
+('澔', 'radiance of gems'),
+('澗', 'brook'),
+('澗', 'mountain'),
+('澗', 'mountain stream'),
+('澗', 'stream'),
+('澡', 'bathe'),
+('澡', 'wash'),
+('澣', 'cleanse'),
+('澣', 'wash'),
+('澤', 'brilliance'),
+('澤', 'damp'),
+('澤', 'fertile'),
+('澤', 'grace'),
+('澤', 'marsh'),
+('澤', 'moist'),
+('澤', 'swamp'),
+('澧', 'river in northern Hunan province'),
+('澨', 'river in Hubei'),
+('澨', 'shore'),
+('澮', 'irrigation ditch'),
+('澮', 'river'),
+('澮', 'trench'),
+('澱', 'dregs'),
+('澱', 'precipitate'),
+('澱', 'sediment'),
+('澳', 'bank'),
+('澳', 'bay'),
+('澳', 'dock'),
+('澳', 'inlet'),
+('澶', 'placid'),
+('澶', 'still water'),
+('澶', 'tranquil'),
+('澹', 'calm'),
+('澹', 'quiet'),
+('澹', 'tranquil'),
+('澾', 'slippery'),
+('澾', 'smooth'),
+('激', 'arouse'),
+('激', 'excite'),
+('激', 'incite'),
+('激', 'quickly'),
+('激', 'tide'),
+('激', 'wave'),
+('濁', 'cloudy'),
+('濁', 'dirty'),
+('濁', 'filthy'),
+('濁', 'muddy'),
+('濁', 'turbid'),
+('濂', 'a river in Hunan'),
+('濂', 'a waterfall'),
+('濃', 'concentrated'),
+('濃', 'strong'),
+('濃', 'thick'),
+('濆', 'gush'),
+('濆', 'river bank'),
+('濆', 'river in Henan province'),
+('濇', 'astringent'),
+('濇', 'harsh'),
+('濇', 'rough'),
+('濇', 'uneven'),
+('濊', 'Buyeo'),
+('濊', 'Dongye'),
+('濊', 'Okjeo'),
+('濊', 'Yemaek'),
+('濊', 'deep'),
+('濊', 'dirty'),
+('濊', 'expansive'),
+('濊', 'vast'),
+('濕', 'an illness'),
+('濕', 'damp'),
+('濕', 'humid'),
+('濕', 'moist'),
+('濕', 'wet'),
+('濘', 'miry'),
+('濘', 'mud'),
+('濘', 'muddy'),
+('濘', 'stagnant'),
+('濛', 'drizzling'),
+('濛', 'misty'),
+('濛', 'raining'),
+('濟', 'aid'),
+('濟', 'cross'),
+('濟', 'many'),
+('濟', 'relieve'),
+('濟', 'river'),
+('濟', 'to ferry'),
+('濟', 'to help'),
+('濠', 'ditch'),
+('濠', 'moat'),
+('濠', 'trench'),
+('濡', 'damp'),
+('濡', 'immerse'),
+('濡', 'moisten'),
+('濡', 'wet'),
+('濤', 'large waves'),
+('濤', 'waves'),
+('濩', 'cascade down'),
+('濩', 'look'),
+('濩', 'pour down'),
+('濩', 'spread out'),
+('濫', 'excessive'),
+('濫', 'flood'),
+('濫', 'overflow'),
+('濫', 'superfluous'),
+('濬', 'deep'),
+('濬', 'dig'),
+('濬', 'dredge'),
+('濬', 'profound'),
+('濮', 'county in Henan province'),
+('濯', 'cleanse'),
+('濯', 'rinse'),
+('濯', 'wash out'),
+('濱', 'beach'),
+('濱', 'river bank'),
+('濱', 'sea coast'),
+('濳', 'conceal'),
+('濳', 'hidden'),
+('濳', 'hide'),
+('濳', 'secrete'),
+('濺', 'spill'),
+('濺', 'splash'),
+('濺', 'spray'),
+('濺', 'sprinkle'),
+('濾', 'filter'),
+('濾', 'strain out'),
+('瀁', 'overflow'),
+('瀁', 'rapids'),
+('瀁', 'ripples'),
+('瀁', 'waves'),
+('瀅', 'clear'),
+('瀅', 'glossy'),
+('瀅', 'lucid'),
+('瀅', 'pure water'),
+('瀆', 'ditch'),
+('瀆', 'drain'),
+('瀆', 'gutter'),
+('瀆', 'pollute'),
+('瀆', 'sluice'),
+('瀉', 'drain off'),
+('瀉', 'flow'),
+('瀉', 'leak'),
+('瀉', 'pour down'),
+('瀋', 'juice'),
+('瀋', 'leak'),
+('瀋', 'liquid'),
+('瀋', 'pour'),
+('瀋', 'water'),
+('瀏', 'bright'),
+('瀏', 'clear'),
+('瀏', 'whistling'),
+('瀑', 'cascade'),
+('瀑', 'heavy rain'),
+('瀑', 'waterfall'),
+('瀒', 'astringent'),
+('瀒', 'coarse'),
+('瀒', 'rough'),
+('瀕', 'approach'),
+('瀕', 'be on verge of'),
+('瀕', 'near'),
+('瀘', 'river in Jiangxi province'),
+('瀚', 'extensive'),
+('瀚', 'vast'),
+('瀚', 'wide'),
+('瀛', 'ocean'),
+('瀛', 'sea'),
+('瀝', 'dregs'),
+('瀝', 'drip'),
+('瀝', 'strain'),
+('瀝', 'trickle'),
+('瀞', 'pool in a river'),
+('瀟', 'ethereal'),
+('瀟', 'light'),
+('瀟', 'sound of beating wind and rain'),
+('瀣', 'sea mist'),
+('瀣', 'vapor'),
+('瀦', 'a pool'),
+('瀦', 'pond'),
+('瀧', 'a river in Guangdong'),
+('瀧', 'raining'),
+('瀧', 'soaked'),
+('瀧', 'wet'),
+('瀨', 'rapids'),
+('瀨', 'swift current'),
+('瀬', 'rapids'),
+('瀬', 'swift current'),
+('瀰', 'overflow'),
+('瀲', 'overflow'),
+('瀲', 'ripples'),
+('瀲', 'waves'),
+('瀹', 'boil'),
+('瀹', 'soak'),
+('瀹', 'wash'),
+('瀼', 'flowing'),
+('瀼', 'river in Henan province'),
+('瀾', 'overflowing'),
+('瀾', 'ripples'),
+('瀾', 'wave'),
+('瀾', 'waves'),
+('灄', 'river in Hubei province'),
+('灌', 'flood'),
+('灌', 'irrigate'),
+('灌', 'pour'),
+('灌', 'water'),
+('灎', 'billowing'),
+('灎', 'movement of water'),
+('灎', 'overflowing'),
+('灎', 'wavy'),
+('灑', 'scatter'),
+('灑', 'splash'),
+('灑', 'sprinkle'),
+('灑', 'throw'),
+('灘', 'a sandbar'),
+('灘', 'bank'),
+('灘', 'rapids'),
+('灘', 'shoal'),
+('灝', 'expansive'),
+('灝', 'grand'),
+('灝', 'large'),
+('灝', 'vast'),
+('灞', 'river in Shanxi province'),
+('灣', 'a bay'),
+('灣', 'bay'),
+('灣', 'bend of stream'),
+('灣', 'cove'),
+('灣', 'geography'),
+('灣', 'gulf'),
+('灣', 'inlet'),
+('灧', 'billowing'),
+('灧', 'overflowing'),
+('灧', 'wavy'),
+('灩', 'billowing'),
+('灩', 'overflowing'),
+('灩', 'wavy'),
+('火', 'Mars'),
+('火', 'Tuesday'),
+('火', 'anger'),
+('火', 'burn'),
+('火', 'fire'),
+('火', 'flame'),
+('火', 'heat'),
+('火', 'rage'),
+('灯', 'lamp'),
+('灯', 'lantern'),
+('灰', 'ashes'),
+('灰', 'dust'),
+('灰', 'lime'),
+('灰', 'mortar'),
+('灵', 'soul'),
+('灵', 'spirit'),
+('灵', 'spiritual world'),
+('灸', 'cauterize with moxa'),
+('灸', 'moxibustion'),
+('灸', '뜸'),
+('灼', 'bright'),
+('灼', 'broil'),
+('灼', 'burn'),
+('灼', 'cauterize'),
+('災', 'calamity'),
+('災', 'catastrophe'),
+('災', 'disaster'),
+('灾', 'calamity'),
+('灾', 'catastrophe'),
+('灾', 'disaster'),
+('炁', 'air'),
+('炁', 'breath'),
+('炁', 'gas. weather. used in Taoist charms'),
+('炁', 'steam'),
+('炅', 'brilliance'),
+('炅', '계'),
+('炆', '(Cant.) to simmer'),
+('炆', 'cook over a slow fire'),
+('炉', 'fireplace'),
+('炉', 'furnace'),
+('炉', 'oven'),
+('炉', 'stove'),
+('炊', 'cook'),
+('炊', 'meal'),
+('炎', 'blaze'),
+('炎', 'flame'),
+('炎', 'hot'),
+('炎', 'inflammation'),
+('炎', 'medicine'),
+('炒', 'boil'),
+('炒', 'cook'),
+('炒', 'fry'),
+('炒', 'roast'),
+('炒', 'saute'),
+('炕', 'floor'),
+('炕', 'hypocaust'),
+('炕', 'the brick-bed in northern China'),
+('炘', 'bright'),
+('炘', 'brilliant'),
+('炘', 'shining'),
+('炙', 'broil'),
+('炙', 'cauterize'),
+('炙', 'roast'),
+('炙', 'toast'),
+('炚', 'light'),
+('炛', 'light'),
+('炤', 'illumine'),
+('炤', 'light up'),
+('炤', 'reflect'),
+('炫', 'flaunt'),
+('炫', 'glitter'),
+('炫', 'shine'),
+('炫', 'show off'),
+('炬', 'torch'),
+('炭', 'carbon'),
+('炭', 'charcoal'),
+('炭', 'coal'),
+('炮', 'artillery'),
+('炮', 'cannon'),
+('炮', 'large gun'),
+('炯', 'bright'),
+('炯', 'brilliant'),
+('炯', 'clear'),
+('炯', 'hot'),
+('炰', 'bake'),
+('炰', 'broil'),
+('炰', 'roast'),
+('炳', 'bright'),
+('炳', 'glorious'),
+('炳', 'luminous'),
+('炷', 'candle wick'),
+('炷', 'lamp wick'),
+('炷', 'stick of incense'),
+('炸', 'to explode'),
+('炸', 'to fry in oil'),
+('炸', 'to scald'),
+('点', 'degree'),
+('点', 'dot'),
+('点', 'point'),
+('点', 'speck'),
+('点', 'spot'),
+('為', 'act'),
+('為', 'be'),
+('為', 'do'),
+('為', 'govern'),
+('為', 'handle'),
+('烈', 'ardent'),
+('烈', 'fiery'),
+('烈', 'vehement'),
+('烈', 'violent'),
+('烉', 'brilliant'),
+('烉', 'lustrous'),
+('烉', 'shining'),
+('烊', 'to melt'),
+('烊', 'to smelt'),
+('烋', 'boast'),
+('烏', 'black'),
+('烏', 'crow'),
+('烏', 'dark'),
+('烏', 'raven'),
+('烏', 'rook'),
+('烓', 'stove'),
+('烘', 'bake'),
+('烘', 'dry by fire'),
+('烘', 'roast'),
+('烙', 'brand'),
+('烙', 'branding iron'),
+('烙', 'burn'),
+('烜', 'light of the sun'),
+('烜', 'to dry in the sun'),
+('烝', 'many'),
+('烝', 'numerous'),
+('烝', 'rise'),
+('烝', 'steam'),
+('烟', 'cigarettes'),
+('烟', 'opium'),
+('烟', 'smoke'),
+('烟', 'soot'),
+('烟', 'tobacco'),
+('烱', 'bright'),
+('烱', 'brilliant'),
+('烱', 'clear'),
+('烱', 'form, format, mold, size'),
+('烱', 'hot'),
+('烱', 'punishment, a criminal sentence'),
+('烹', 'boil'),
+('烹', 'cook'),
+('烹', 'quick fry'),
+('烹', 'stir fry'),
+('烽', 'signal fire'),
+('烽', 'tower where signal'),
+('焄', 'aroma'),
+('焄', 'menace'),
+('焄', 'rising flames or fumes'),
+('焄', 'smoke'),
+('焄', 'steam up'),
+('焉', 'how? why? where?'),
+('焉', 'then'),
+('焉', 'thereupon'),
+('焌', 'to light'),
+('焔', 'blaze'),
+('焔', 'blazing'),
+('焔', 'flame'),
+('焔', 'glowing'),
+('焕', 'shining'),
+('焙', 'bake'),
+('焙', 'dry over slow fire'),
+('焙', 'roast'),
+('焚', 'burn'),
+('焜', 'bright'),
+('焜', 'fire'),
+('焜', 'flames'),
+('焜', 'shining'),
+('焞', 'dim'),
+('焠', 'burn'),
+('焠', 'temper'),
+('無', 'have no'),
+('無', 'koan'),
+('無', 'lack'),
+('無', 'negative'),
+('無', 'no'),
+('無', 'non'),
+('無', 'not'),
+('無', 'nothing'),
+('無', 'null set'),
+('焦', 'anxious'),
+('焦', 'burned'),
+('焦', 'scorched'),
+('焦', 'vexed'),
+('焭', 'alone'),
+('焭', 'desolate'),
+('焭', 'orphan'),
+('焮', 'broil'),
+('焮', 'cauterize'),
+('焮', 'heat'),
+('焮', 'radiate heat'),
+('焰', 'blaze'),
+('焰', 'blazing'),
+('焰', 'flame'),
+('焰', 'glowing'),
+('焱', 'flames'),
+('然', 'certainly'),
+('然', 'pledge'),
+('然', 'promise'),
+('然', 'yes'),
+('焼', 'bake'),
+('焼', 'burn'),
+('焼', 'heat'),
+('焼', 'roast'),
+('煆', 'raging fire'),
+('煇', 'solder'),
+('煇', 'weld'),
+('煉', 'condense'),
+('煉', 'distill'),
+('煉', 'refine'),
+('煉', 'smelt'),
+('煊', 'warm'),
+('煌', 'bright'),
+('煌', 'luminous'),
+('煌', 'shining'),
+('煎', 'boil in water'),
+('煎', 'fry in fat or oil'),
+('煑', 'cook'),
+('煒', 'brilliant red'),
+('煒', 'crimson'),
+('煒', 'glowing'),
+('煕', 'bright'),
+('煕', 'glorious'),
+('煕', 'splendid'),
+('煖', 'genial'),
+('煖', 'warm'),
+('煙', 'cigarettes'),
+('煙', 'opium'),
+('煙', 'smoke'),
+('煙', 'soot'),
+('煙', 'tobacco'),
+('煜', 'bright'),
+('煜', 'brilliant'),
+('煜', 'shining'),
+('煞', 'baleful'),
+('煞', 'malignant deity'),
+('煞', 'noxious'),
+('煞', 'strike dead'),
+('煠', 'boil'),
+('煠', 'fry'),
+('煢', 'alone'),
+('煢', 'no friends or relatives'),
+('煤', 'carbon'),
+('煤', 'charcoal'),
+('煤', 'coal'),
+('煤', 'coke'),
+('煤', 'soot'),
+('煥', 'brilliant'),
+('煥', 'lustrous'),
+('煥', 'shining'),
+('煦', 'genial'),
+('煦', 'gentle'),
+('煦', 'gracious'),
+('煦', 'kind'),
+('照', 'compare'),
+('照', 'contrast'),
+('照', 'illuminate'),
+('照', 'illumine'),
+('照', 'reflect'),
+('照', 'shine'),
+('煨', 'ashes'),
+('煨', 'bake'),
+('煨', 'embers'),
+('煨', 'flame'),
+('煨', 'ripen'),
+('煨', 'roast'),
+('煨', 'simmer'),
+('煨', 'to stew'),
+('煩', 'bother'),
+('煩', 'trouble'),
+('煩', 'troublesome'),
+('煩', 'vex'),
+('煬', 'flame'),
+('煬', 'melt'),
+('煬', 'roast'),
+('煬', 'scorch'),
+('煮', 'cook'),
+('煽', 'agitate'),
+('煽', 'fan'),
+('煽', 'incite'),
+('煽', 'provoke'),
+('煽', 'stir up'),
+('熀', 'dazzling'),
+('熀', 'the blaze of fire'),
+('熄', 'extinguish'),
+('熄', 'put out'),
+('熄', 'quash'),
+('熅', 'charcoal'),
+('熅', 'dimness'),
+('熅', 'iron'),
+('熅', 'iron out'),
+('熅', 'smooth out'),
+('熅', 'warm'),
+('熇', 'bake'),
+('熇', 'crane'),
+('熇', 'nomy'),
+('熈', 'bright'),
+('熈', 'glorious'),
+('熈', 'splendid'),
+('熊', 'a bear'),
+('熊', 'bear'),
+('熊', 'bright'),
+('熊', 'brilliant'),
+('熊', 'surname'),
+('熏', 'cure'),
+('熏', 'fog'),
+('熏', 'smoke'),
+('熏', 'vapor'),
+('熒', 'dazzling'),
+('熒', 'lamplight'),
+('熒', 'shimmer'),
+('熒', 'shine'),
+('熒', 'shining'),
+('熔', 'fuse'),
+('熔', 'melt'),
+('熔', 'mold'),
+('熔', 'smelt'),
+('熙', 'bright'),
+('熙', 'glorious'),
+('熙', 'splendid'),
+('熛', 'blaze'),
+('熟', 'familiar with'),
+('熟', 'ripe'),
+('熟', 'well-cooked'),
+('熠', 'bright and sparkling'),
+('熨', 'cincture, enclosure (a ring fence)'),
+('熨', 'iron'),
+('熨', 'press'),
+('熬', 'cook down'),
+('熬', 'endure'),
+('熬', 'to boil'),
+('熯', 'by fire'),
+('熱', 'fever'),
+('熱', 'heat'),
+('熱', 'hot'),
+('熱', 'restless'),
+('熱', 'zeal'),
+('熲', 'bright'),
+('熹', 'bright'),
+('熹', 'dim light'),
+('熹', 'glimmer'),
+('熹', 'warm'),
+('熺', 'dim light'),
+('熺', 'glimmer'),
+('熺', 'warm'),
+('熾', 'blaze'),
+('熾', 'burning-hot'),
+('熾', 'illustrious'),
+('熾', 'intense'),
+('熾', 'splendid'),
+('熾', 'to burn'),
+('燁', 'bright'),
+('燁', 'flame'),
+('燁', 'glorious'),
+('燁', 'shine'),
+('燁', 'splendid'),
+('燃', 'burn'),
+('燃', 'ignite'),
+('燃', 'light fire'),
+('燈', 'lamp'),
+('燈', 'lantern'),
+('燈', 'light'),
+('燉', 'heat with fire'),
+('燉', 'stew'),
+('燋', 'burn'),
+('燋', 'scald'),
+('燋', 'scorch'),
+('燋', 'torch'),
+('燎', 'a signal lamp'),
+('燎', 'set afire'),
+('燎', 'to burn'),
+('燎', 'to illuminate'),
+('燐', 'phosphorus'),
+('燒', 'bake'),
+('燒', 'burn'),
+('燒', 'fire'),
+('燒', 'heat'),
+('燒', 'roast'),
+('燔', 'to burn'),
+('燔', 'to roast'),
+('燕', 'comfort'),
+('燕', 'enjoy'),
+('燕', 'swallow(bird)'),
+('燖', 'reheat food'),
+('燙', 'heat'),
+('燙', 'iron clothes'),
+('燙', 'scald'),
+('燙', 'wash'),
+('營', 'barracks'),
+('營', 'build'),
+('營', 'construct'),
+('營', 'encampment'),
+('營', 'manage'),
+('營', 'operate'),
+('燠', 'warm'),
+('燠', 'warmth'),
+('燥', 'arid'),
+('燥', 'dry'),
+('燥', 'parched'),
+('燥', 'quick-tempered'),
+('燥', '마를'),
+('燦', 'bright'),
+('燦', 'illuminating'),
+('燦', 'vivid'),
+('燧', 'beacon'),
+('燧', 'flintstone'),
+('燧', 'signal fire'),
+('燧', 'torch'),
+('燬', 'blaze'),
+('燬', 'burn down'),
+('燬', 'fire'),
+('燭', 'candle'),
+('燭', 'illuminate'),
+('燭', 'taper'),
+('燭', 'to shine'),
+('燮', 'adjust'),
+('燮', 'blend'),
+('燮', 'harmonize'),
+('燹', 'fire'),
+('燹', 'wild fires'),
+('燻', 'cure'),
+('燻', 'fog'),
+('燻', 'smoke'),
+('燻', 'vapor'),
+('燼', 'ashes'),
+('燼', 'cinders'),
+('燼', 'embers'),
+('燼', 'remnants'),
+('燾', 'cover'),
+('燾', 'envelope'),
+('燾', 'illuminate'),
+('燾', 'shine'),
+('燿', 'brilliant'),
+('燿', 'dazzle'),
+('燿', 'radiant'),
+('燿', 'shine'),
+('爆', 'burst'),
+('爆', 'crackle'),
+('爆', 'explode'),
+('爆', 'pop'),
+('爆', 'scorch'),
+('爆', 'sear'),
+('爇', 'burn'),
+('爍', 'glitter'),
+('爍', 'shine'),
+('爍', 'sparkle'),
+('爐', 'fireplace'),
+('爐', 'furnace'),
+('爐', 'oven'),
+('爐', 'stove'),
+('爚', 'bright'),
+('爚', 'fiery'),
+('爛', 'decayed'),
+('爛', 'rotten'),
+('爛', 'spoiled'),
+('爟', 'fire'),
+('爥', 'cook over slow fire'),
+('爥', 'simmer'),
+('爨', 'cook'),
+('爨', 'cooking stove'),
+('爨', 'oven'),
+('爪', 'animal feet'),
+('爪', 'claw'),
+('爪', 'nail'),
+('爪', 'talon'),
+('爬', 'climb'),
+('爬', 'crawl'),
+('爬', 'creep'),
+('爬', 'scramble'),
+('爭', 'contend'),
+('爭', 'dispute'),
+('爭', 'fight'),
+('爭', 'strive'),
+('爭', 'to dispute'),
+('爰', 'lead on to'),
+('爰', 'then'),
+('爰', 'therefore'),
+('爲', 'act'),
+('爲', 'be'),
+('爲', 'do'),
+('爲', 'govern'),
+('爲', 'handle'),
+('爵', 'feudal title or rank'),
+('父', 'KangXi radical 88'),
+('父', 'elderly'),
+('父', 'father'),
+('父', 'male'),
+('父', 'man'),
+('父', 'relative'),
+('父', 'respectful'),
+('父', 'term'),
+('爸', 'father'),
+('爸', 'papa'),
+('爹', 'daddy'),
+('爹', 'father'),
+('爺', 'father'),
+('爺', 'grandfather'),
+('爻', 'diagrams for divination'),
+('爽', 'cheerful'),
+('爽', 'happy'),
+('爽', 'invigorating'),
+('爽', 'pleasurable'),
+('爽', 'refreshing'),
+('爾', 'final particle'),
+('爾', 'that'),
+('爾', 'those'),
+('爾', 'you'),
+('牀', 'bed'),
+('牀', 'bench'),
+('牀', 'chassis'),
+('牀', 'couch'),
+('牂', 'ewe'),
+('牂', 'female sheep'),
+('牆', 'wall'),
+('片', 'rad. 91'),
+('片', 'slice'),
+('片', 'splinter'),
+('片', 'strip'),
+('版', 'edition'),
+('版', 'printing blocks'),
+('牋', 'memorandum'),
+('牋', 'official note'),
+('牌', 'placard'),
+('牌', 'signboard'),
+('牌', 'tablet'),
+('牒', 'dispatch'),
+('牒', 'documents'),
+('牒', 'records'),
+('牓', 'notice'),
+('牓', 'public'),
+('牓', 'public notice'),
+('牓', 'register'),
+('牓', 'tablet'),
+('牔', 'gable'),
+('牖', 'lead enlightenment'),
+('牖', 'window'),
+('牘', 'books'),
+('牘', 'documents'),
+('牘', 'writing tablet'),
+('牙', 'cheek tooth'),
+('牙', 'molar'),
+('牙', 'molars'),
+('牙', 'serrated'),
+('牙', 'teeth'),
+('牙', 'tooth'),
+('牚', 'brace'),
+('牚', 'prop up'),
+('牚', 'support'),
+('牛', 'KangXi radical93'),
+('牛', 'bull'),
+('牛', 'cow'),
+('牛', 'ox'),
+('牝', 'deep gorge'),
+('牝', 'female of species'),
+('牟', 'barley'),
+('牟', 'get'),
+('牟', 'low'),
+('牟', 'make'),
+('牟', 'seek'),
+('牡', 'bolt of door'),
+('牡', 'male of animals'),
+('牢', 'pen'),
+('牢', 'prison'),
+('牢', 'secure'),
+('牢', 'stable'),
+('牣', 'teem'),
+('牧', 'herd'),
+('牧', 'shepherd'),
+('牧', 'tend cattle'),
+('物', 'creature'),
+('物', 'stuff'),
+('物', 'substance'),
+('物', 'thing'),
+('牯', 'bull'),
+('牯', 'cow'),
+('牯', 'ox'),
+('牲', 'animal'),
+('牲', 'sacrificial animal'),
+('牴', 'butt'),
+('牴', 'gore'),
+('牴', 'resist'),
+('牸', 'the female of certain animals'),
+('牸', 'to bring forth young of animals'),
+('特', 'animal'),
+('特', 'distinguished'),
+('特', 'exceptional'),
+('特', 'male'),
+('特', 'special'),
+('特', 'unique'),
+('牽', 'attract'),
+('牽', 'drag'),
+('牽', 'draw'),
+('牽', 'lead by hand'),
+('牽', 'pull'),
+('犀', 'rhinoceros'),
+('犀', 'sharp'),
+('犀', 'well-tempered'),
+('犁', 'plow'),
+('犂', 'cow'),
+('犂', 'elderly'),
+('犂', 'fear'),
+('犂', 'person'),
+('犂', 'plough'),
+('犂', 'skin'),
+('犂', 'speckle'),
+('犂', 'spotted'),
+('犂', 'tremble'),
+('犇', 'flee'),
+('犇', 'run'),
+('犇', 'run fast'),
+('犇', 'rush about'),
+('犍', 'a bullock'),
+('犍', 'a fabulous monster'),
+('犒', 'deceased'),
+('犒', 'entertain victorious soldiers'),
+('犒', 'late'),
+('犖', 'brindled in color'),
+('犖', 'brindled ox'),
+('犢', 'calf'),
+('犢', 'victim of sacrifice'),
+('犧', 'give up'),
+('犧', 'sacrifice'),
+('犧', 'sacrificial'),
+('犬', 'dog'),
+('犬', 'radical number 94'),
+('犮', 'discard'),
+('犮', 'dog'),
+('犮', 'of'),
+('犮', 'pull out'),
+('犮', 'remove'),
+('犮', 'run'),
+('犮', 'shape'),
+('犯', 'a transgression, a violation'),
+('犯', 'commit'),
+('犯', 'commit crime'),
+('犯', 'count'),
+('犯', 'crime'),
+('犯', 'criminal'),
+('犯', 'violate'),
+('犴', 'a not very large lock-up'),
+('犴', 'a wild dog'),
+('犵', 'resolute'),
+('状', 'appearance'),
+('状', 'form'),
+('状', 'official'),
+('状', 'shape'),
+('狀', 'appearance'),
+('狀', 'certificate'),
+('狀', 'document'),
+('狀', 'form'),
+('狀', 'official'),
+('狀', 'shape'),
+('狀', 'state'),
+('狂', 'insane'),
+('狂', 'mad'),
+('狂', 'violent'),
+('狂', 'wild'),
+('狄', 'surnam'),
+('狄', 'tribe from northern china'),
+('狉', 'fox-cub'),
+('狌', 'lynx'),
+('狌', 'wildcat'),
+('狌', '살쾡이'),
+('狎', 'be familiar with'),
+('狎', 'disrespect'),
+('狐', 'fox'),
+('狐', 'species of fox'),
+('狒', 'baboon'),
+('狗', 'canis familiaris'),
+('狗', 'dog'),
+('狙', 'an ape'),
+('狙', 'monkey'),
+('狙', 'peek'),
+('狙', 'to lie'),
+('狙', 'to spy'),
+('狙', 'watch for'),
+('狡', 'cunning'),
+('狡', 'deceitful'),
+('狡', 'treacherous'),
+('狢', 'animal name'),
+('狢', 'badger'),
+('狢', '오소리'),
+('狥', 'follow'),
+('狩', 'imperial tour'),
+('狩', 'winter hunting'),
+('独', 'alone'),
+('独', 'only'),
+('独', 'single'),
+('独', 'solitary'),
+('狴', 'a fierce beast depicted on the door of prisons'),
+('狴', 'a kind of tapir'),
+('狷', 'impetuous'),
+('狷', 'impulsive'),
+('狷', 'rash'),
+('狸', 'fox'),
+('狹', 'limited'),
+('狹', 'narrow'),
+('狹', 'narrow-minded'),
+('狹', 'to pinch'),
+('狺', 'the snarling of dogs'),
+('狻', 'a fabulous beast'),
+('狼', 'wolf'),
+('狽', 'a legendary animal with short forelegs which rode a wolf'),
+('猊', 'lion'),
+('猊', 'wild beast'),
+('猊', 'wild horse'),
+('猋', 'whirlwind'),
+('猋', '회오리바람'),
+('猑', 'dog'),
+('猑', '개'),
+('猑', '큰'),
+('猓', 'monkey'),
+('猖', 'mad'),
+('猖', 'reckless'),
+('猖', 'unruly'),
+('猖', 'wild'),
+('猗', 'exclamation of admiration'),
+('猘', 'fierce dog'),
+('猘', 'frenzied'),
+('猘', 'furious'),
+('猙', 'ferocious'),
+('猙', 'fierce-looking'),
+('猛', 'bold'),
+('猛', 'cruel'),
+('猛', 'savage'),
+('猛', 'violent'),
+('猜', 'conjecture'),
+('猜', 'feel'),
+('猜', 'guess'),
+('猜', 'jealousy'),
+('猜', 'suppose'),
+('猝', 'abrupt'),
+('猝', 'abruptly'),
+('猝', 'suddenly'),
+('猢', 'a kind of monkey found in W.China'),
+('猥', 'cheap'),
+('猥', 'low'),
+('猥', 'obscene'),
+('猥', 'vulgar'),
+('猥', 'wanton'),
+('猨', 'ape'),
+('猩', 'species of orangutan'),
+('猪', 'hog'),
+('猪', 'pig'),
+('猪', 'wild boar'),
+('猫', 'cat'),
+('献', 'display'),
+('献', 'offer'),
+('献', 'present'),
+('献', 'show'),
+('猱', 'a monkey with yellow hair'),
+('猱', 'monkey'),
+('猴', 'ape'),
+('猴', 'macaque'),
+('猴', 'monkey'),
+('猴', 'monkey-like'),
+('猶', 'as'),
+('猶', 'just like'),
+('猶', 'like'),
+('猶', 'similar to'),
+('猷', 'plan'),
+('猷', 'plot'),
+('猷', 'scheme'),
+('猷', 'way'),
+('猾', 'crafty'),
+('猾', 'cunning'),
+('猾', 'deceitful'),
+('猾', 'shrewd'),
+('猿', 'ape'),
+('獃', 'dull'),
+('獃', 'dull-minded'),
+('獃', 'simple'),
+('獃', 'stupid'),
+('獄', 'case'),
+('獄', 'jail'),
+('獄', 'lawsuit'),
+('獄', 'prison'),
+('獅', 'lion'),
+('獐', 'hornless river deer'),
+('獐', 'roe deer'),
+('獐', 'roebuck'),
+('獒', 'large fierce dog'),
+('獒', 'mastiff'),
+('獗', 'lawless'),
+('獗', 'unruly'),
+('獗', 'violent'),
+('獗', 'wild'),
+('獘', 'collapse'),
+('獠', 'to hunt at night by torches'),
+('獣', 'animal'),
+('獣', 'beast'),
+('獣', 'bestial'),
+('獤', 'hide'),
+('獤', 'marten'),
+('獧', 'obstinacy'),
+('獧', 'stubbornness'),
+('獨', 'alone'),
+('獨', 'only'),
+('獨', 'single'),
+('獨', 'solitary'),
+('獪', 'crafty'),
+('獪', 'cunning'),
+('獪', 'sly'),
+('獫', 'dog'),
+('獬', 'a fabulous monster'),
+('獯', 'a tribe of Scythians which invaded China during the Hsia dynasty'),
+('獰', 'ferocious'),
+('獰', 'ferocious appearance'),
+('獰', 'hideous'),
+('獱', '수달'),
+('獲', 'get'),
+('獲', 'obtain'),
+('獲', 'receive'),
+('獲', 'seize'),
+('獵', 'field sports'),
+('獵', 'hunt'),
+('獷', 'fierce'),
+('獷', 'rude'),
+('獷', 'uncivilized'),
+('獸', 'animal'),
+('獸', 'beast'),
+('獸', 'bestial'),
+('獺', 'otter'),
+('獻', 'display'),
+('獻', 'offer'),
+('獻', 'present'),
+('獻', 'show'),
+('獼', 'macacus monkey'),
+('獼', 'macaque'),
+('獼', 'monkey'),
+('玁', 'a dog with a long snout or muzzle'),
+('玃', '원숭이'),
+('玄', 'abstruse'),
+('玄', 'deep'),
+('玄', 'profound'),
+('玆', 'here'),
+('玆', 'now'),
+('玆', 'this'),
+('玆', 'time'),
+('玆', 'year'),
+('率', 'commander'),
+('率', 'frank'),
+('率', 'lead'),
+('率', 'limit'),
+('率', 'rate'),
+('率', 'ratio'),
+('率', 'straightforward'),
+('率', 'to lead'),
+('玈', 'black'),
+('玉', 'gem'),
+('玉', 'jade'),
+('玉', 'precious stone'),
+('王', 'king'),
+('王', 'monarch'),
+('王', 'royal'),
+('王', 'ruler'),
+('王', 'surname'),
+('玎', 'jingling'),
+('玎', 'tinkling'),
+('玔', 'green jade'),
+('玕', 'inferior variety of gem'),
+('玖', 'black-colored jade'),
+('玗', '1/2 pr stone'),
+('玗', 'jade'),
+('玘', 'court-dress jewels'),
+('玙', 'jade'),
+('玞', 'an inferior agate'),
+('玟', 'gem'),
+('玟', 'streaks in jade'),
+('玠', 'large jade tablet used by officials at court to indicate their ranks'),
+('玦', 'broken piece of jade'),
+('玧', 'reddish'),
+('玨', 'two pieces of jade joined together'),
+('玩', 'enjoy'),
+('玩', 'joke'),
+('玩', 'play'),
+('玩', 'play with'),
+('玫', 'rose'),
+('玲', 'tinkling of jade'),
+('玳', 'tortoise shell'),
+('玷', 'flaw in character'),
+('玷', 'flaw in gem'),
+('玻', 'glass'),
+('珀', 'amber'),
+('珂', 'inferior kind of jade'),
+('珈', 'an ornament attached to a womans hairpin'),
+('珉', 'stone resembling jade'),
+('珊', 'coral'),
+('珌', 'ornament'),
+('珍', 'precious'),
+('珍', 'rare'),
+('珍', 'valuable'),
+('珏', 'two pieces of jade joined together'),
+('珖', 'carat'),
+('珙', 'precious stone'),
+('珙', 'xian in Sichuan'),
+('珞', 'kind of necklace'),
+('珠', 'bead'),
+('珠', 'gem'),
+('珠', 'jewel'),
+('珠', 'pearl'),
+('珠', 'precious stone'),
+('珢', 'precious stone'),
+('珣', 'name of a kind of jade'),
+('珤', 'jewel'),
+('珤', 'precious'),
+('珤', 'rare'),
+('珤', 'treasure'),
+('珥', 'ear ornament'),
+('珥', 'earring'),
+('珥', 'insert'),
+('珥', 'stick'),
+('珥', '귀엣골'),
+('珦', 'a kind of jade'),
+('珩', 'ornaments'),
+('珩', 'the top gem of the pendants'),
+('珪', 'a jade table conferred upon feudal princes by the emperor as a symbol of dignity and authority'),
+('珫', 'a gun'),
+('班', 'class'),
+('班', 'grade'),
+('班', 'group'),
+('班', 'job'),
+('班', 'squad'),
+('珮', 'jade ornament'),
+('珷', 'an inferior gem'),
+('珹', 'pearl'),
+('珹', 'type of jade'),
+('珽', 'jade tablet'),
+('現', 'appear'),
+('現', 'become visible'),
+('現', 'current'),
+('現', 'existing'),
+('現', 'manifest'),
+('現', 'present'),
+('琁', 'beautiful jade'),
+('琁', 'star'),
+('球', 'ball'),
+('球', 'globe'),
+('球', 'round'),
+('球', 'sphere'),
+('琅', 'a variety of white carnelian'),
+('琅', 'pure'),
+('理', 'logic'),
+('理', 'manage'),
+('理', 'reason'),
+('琇', 'coarse variety of jasper or jade'),
+('琉', 'glass'),
+('琉', 'glazed'),
+('琉', 'opaque'),
+('琉', 'sparkling stone'),
+('琛', 'treasure'),
+('琛', 'valuables'),
+('琠', 'a gem used as ear plug'),
+('琠', 'a jade earring'),
+('琢', 'cut jade'),
+('琢', 'polish jade'),
+('琤', 'jade of jade being'),
+('琤', 'tinkle'),
+('琥', 'amber'),
+('琥', 'jewel in shape of tiger'),
+('琦', 'gem'),
+('琦', 'jade'),
+('琦', 'odd'),
+('琦', 'precious stone'),
+('琦', 'rare'),
+('琦', 'strange'),
+('琨', 'beautiful jade'),
+('琨', 'gem'),
+('琨', 'precious stones'),
+('琪', 'type of jade'),
+('琫', 'ornament'),
+('琬', 'jade'),
+('琬', 'the virtue of a gentleman'),
+('琮', 'octagonal piece of jade with hole in middle'),
+('琯', 'a jade tube used as an instrument'),
+('琰', 'gem'),
+('琰', 'glitter of gems'),
+('琰', 'jewel'),
+('琲', 'necklace'),
+('琳', 'beautiful jade'),
+('琳', 'gem'),
+('琴', 'Chinese lute or guitar'),
+('琴', 'Korean'),
+('琴', 'geomungo'),
+('琴', 'six'),
+('琴', 'stringed'),
+('琴', 'zither'),
+('琵', 'guitar-like instrument'),
+('琶', 'guitar-like instrument'),
+('琺', 'cloissoné'),
+('琺', 'enamel'),
+('琿', 'beautiful'),
+('琿', 'bright'),
+('琿', 'gem'),
+('琿', 'glorious'),
+('琿', 'jade'),
+('琿', 'splendid'),
+('瑀', 'agate'),
+('瑀', 'stone resembling jade'),
+('瑁', 'fine piece of jade'),
+('瑄', 'a ornamental piece of jade several inches across with a hole in the center'),
+('瑋', 'rare'),
+('瑋', 'type of jade'),
+('瑋', 'valuable'),
+('瑕', 'defect'),
+('瑕', 'fault'),
+('瑕', 'flaw in gem'),
+('瑗', 'gem'),
+('瑗', 'jade'),
+('瑗', 'large ring of fine jade'),
+('瑙', 'agate'),
+('瑙', 'cornelian'),
+('瑚', 'coral'),
+('瑚', 'person of virtue'),
+('瑛', 'crystal'),
+('瑛', 'luster of gem'),
+('瑜', 'beautiful'),
+('瑜', 'flawless gem or jewel'),
+('瑜', 'jade'),
+('瑞', 'auspicious'),
+('瑞', 'felicitous omen'),
+('瑞', 'lucky'),
+('瑟', 'dignified'),
+('瑟', 'large stringed musical instrument'),
+('瑟', 'massive'),
+('瑟', 'sound of wind'),
+('瑠', 'precious stone'),
+('瑣', 'fragments'),
+('瑣', 'petty'),
+('瑣', 'trifling'),
+('瑣', 'troublesome'),
+('瑤', 'precious jade'),
+('瑨', 'jade look alike stone'),
+('瑩', 'bright'),
+('瑩', 'lustre of gems'),
+('瑩', 'lustrous'),
+('瑪', 'agate'),
+('瑪', 'cornelian'),
+('瑭', 'a kind of jade'),
+('瑯', 'kind of white cornelian'),
+('瑰', 'extraordinary'),
+('瑰', 'fabulous'),
+('瑰', 'rose'),
+('瑱', 'a gem used as ear plug'),
+('瑱', 'a jade earring'),
+('瑱', 'earmuffs'),
+('瑲', 'tinkling sound tinkling of pendant gems'),
+('瑳', 'bright'),
+('瑳', 'luster of gem'),
+('瑳', 'lustrous'),
+('瑶', 'precious jade'),
+('瑽', 'tinkling of jade pendants'),
+('瑾', 'brilliance of gems'),
+('瑾', 'fine jade'),
+('璀', 'glitter'),
+('璀', 'lustre of gems'),
+('璀', 'shine'),
+('璂', 'jade ornament'),
+('璃', 'glass'),
+('璃', 'glassy'),
+('璆', 'beautiful jade'),
+('璆', 'jade'),
+('璆', 'tinkle'),
+('璇', 'beautiful jade'),
+('璇', 'star'),
+('璉', 'a vessel used hold grain offerings'),
+('璊', 'reddish'),
+('璋', 'jade ornament'),
+('璋', 'jade plaything'),
+('璘', 'emerald'),
+('璘', 'gloss'),
+('璘', 'luster of jade'),
+('璜', 'a semicircular jade ornament used as a pendant'),
+('璞', 'uncarved gem'),
+('璞', 'unpolished gem'),
+('璟', 'luster of gem'),
+('璡', 'jade look alike stone'),
+('璣', 'pearl that is not quite round'),
+('璥', 'a kind of jade'),
+('璧', 'jade'),
+('璧', 'piece of jade with hole in it'),
+('璨', 'gems'),
+('璨', 'luster of gems'),
+('璨', 'lustrous'),
+('璪', 'pearl pendants on coronet'),
+('璫', 'earrings'),
+('璫', 'pendant ornaments'),
+('環', 'jade ring or bracelet'),
+('環', 'ring'),
+('璲', 'pendant girdle ornament'),
+('璵', 'beautiful jade'),
+('璵', 'jade'),
+('璽', 'imperial signet'),
+('璽', 'royal'),
+('璽', 'royal signet'),
+('璽', 'seal'),
+('璿', 'fine jade'),
+('瓊', 'elegant'),
+('瓊', 'jade'),
+('瓊', 'precious'),
+('瓊', 'rare'),
+('瓏', 'a gem cut like dragon'),
+('瓔', 'a necklace made of precious stones'),
+('瓘', 'jade'),
+('瓚', 'ceremonial libation cup'),
+('瓛', 'scaptre'),
+('瓜', 'cucumber'),
+('瓜', 'gourd'),
+('瓜', 'melon'),
+('瓜', 'rad. 97'),
+('瓠', 'bottle gourd'),
+('瓠', 'calabash'),
+('瓠', 'pot'),
+('瓢', 'ladle made from dried gourd'),
+('瓣', 'petal'),
+('瓣', 'segment'),
+('瓣', 'valves'),
+('瓦', 'earthenware pottery'),
+('瓦', 'girl'),
+('瓦', 'roof tile'),
+('瓦', 'tile'),
+('瓩', 'kilogram'),
+('瓩', 'kilowatt'),
+('瓮', 'earthen jar'),
+('瓮', 'jar for ashes'),
+('瓶', 'bottle'),
+('瓶', 'jar'),
+('瓶', 'jug'),
+('瓶', 'pitcher'),
+('瓶', 'vase'),
+('瓷', 'chinaware'),
+('瓷', 'crockery'),
+('瓷', 'porcelain'),
+('瓿', 'jar'),
+('瓿', 'pot'),
+('瓿', '단지'),
+('甁', 'bottle'),
+('甁', 'jar'),
+('甁', 'jug'),
+('甃', 'brick wall of a well'),
+('甄', 'a surname'),
+('甄', 'discern'),
+('甄', 'to examine'),
+('甄', 'to grade'),
+('甌', 'bowl'),
+('甌', 'cup'),
+('甌', 'small tray'),
+('甍', 'rafters supporting roof tiles'),
+('甎', 'brick'),
+('甎', 'slab'),
+('甎', 'square tile'),
+('甑', 'boiler for steaming rice'),
+('甑', 'pot'),
+('甓', 'bricks'),
+('甓', 'glazed tiles'),
+('甕', 'earthen jar'),
+('甕', 'jar for ashes'),
+('甘', 'sweet'),
+('甘', 'sweetness'),
+('甘', 'tasty'),
+('甚', 'considerably'),
+('甚', 'great extent'),
+('甛', 'sweet'),
+('甛', 'sweetness'),
+('甜', 'sweet'),
+('甜', 'sweetness'),
+('甞', 'experience'),
+('甞', 'experiment'),
+('甞', 'taste'),
+('生', 'birth'),
+('生', 'born'),
+('生', 'life'),
+('生', 'lifetime'),
+('生', 'living'),
+('生', 'produce'),
+('生', 'raw'),
+('生', 'uncooked'),
+('產', 'born'),
+('產', 'bring forth'),
+('產', 'give birth'),
+('產', 'produce'),
+('産', 'birth'),
+('産', 'born'),
+('産', 'give birth'),
+('産', 'product'),
+('産', 'property'),
+('甥', 'sisters child'),
+('甦', 'be reborn'),
+('甦', 'resuscitate'),
+('甦', 'revive'),
+('用', 'apply'),
+('用', 'employ'),
+('用', 'operate'),
+('用', 'use'),
+('甫', 'begin'),
+('甫', 'father'),
+('甫', 'great'),
+('甫', 'man'),
+('甬', 'Ningbo'),
+('甬', 'path'),
+('甬', 'river in Ningbo'),
+('甯', 'peaceful'),
+('田', 'arable land'),
+('田', 'cultivated'),
+('田', 'field'),
+('田', 'land'),
+('田', 'patch'),
+('田', 'surname'),
+('由', 'cause'),
+('由', 'from'),
+('由', 'reason'),
+('甲', '1st heavenly stem'),
+('甲', 'A'),
+('甲', 'armor'),
+('甲', 'fingernails'),
+('甲', 'first'),
+('甲', 'heavenly stem'),
+('甲', 'shell'),
+('申', '9th terrestrial branch'),
+('申', 'extend'),
+('申', 'report'),
+('申', 'stretch'),
+('申', 'to state to a superior'),
+('男', 'baron'),
+('男', 'male'),
+('男', 'man'),
+('男', 'son'),
+('男', 'surname'),
+('甸', 'crops'),
+('甸', 'govern'),
+('甸', 'suburbs of capital'),
+('町', 'boundary'),
+('町', 'field'),
+('町', 'raised path between fields'),
+('町', 'ridge'),
+('画', 'a painting'),
+('画', 'drawing'),
+('画', 'picture'),
+('画', 'to draw'),
+('甼', 'raised path between fields'),
+('甽', 'drain between fields'),
+('甽', 'irrigation'),
+('甾', 'calamity'),
+('甾', 'pheasant'),
+('甿', 'farming population'),
+('畀', 'give'),
+('畀', 'to give'),
+('畇', 'land'),
+('畊', 'cultivate'),
+('畊', 'plow'),
+('畋', 'cultivate'),
+('畋', 'hunt'),
+('畋', 'till land'),
+('界', 'boundary'),
+('界', 'domain'),
+('界', 'limit'),
+('界', 'society'),
+('界', 'the world'),
+('畎', 'a drain between fields'),
+('畎', 'irrigation'),
+('畎', 'to flow'),
+('畏', 'awe'),
+('畏', 'dread'),
+('畏', 'fear'),
+('畏', 'reverence'),
+('畑', 'dry(as opposed to rice) field'),
+('畑', 'used in Japanese names'),
+('畓', 'paddy'),
+('畓', 'rice'),
+('畓', 'rice field'),
+('畔', 'boundary path dividing fields'),
+('留', 'detain'),
+('留', 'halt'),
+('留', 'keep'),
+('留', 'stay'),
+('留', 'stop'),
+('畚', 'hamper'),
+('畚', 'straw basket'),
+('畛', 'border'),
+('畛', 'boundary'),
+('畛', 'raised path'),
+('畜', 'domestic animals'),
+('畜', 'livestock'),
+('畝', 'Chinese land measure'),
+('畝', 'fields'),
+('畝', 'mu'),
+('畠', 'farm'),
+('畠', 'field'),
+('畠', 'garden'),
+('畠', 'plantation'),
+('畢', 'completed'),
+('畢', 'conclude'),
+('畢', 'end'),
+('畢', 'finish'),
+('畤', 'place for worshipping the haven'),
+('略', 'approximately'),
+('略', 'brief'),
+('略', 'concise'),
+('略', 'outline'),
+('略', 'roughly'),
+('畦', 'sections in vegetable farm'),
+('畧', 'approximately'),
+('畧', 'outline'),
+('畧', 'roughly'),
+('番', 'a time'),
+('番', 'a turn'),
+('番', 'to repeat'),
+('番', 'to take turns'),
+('番', 'turn'),
+('番', 'valiant'),
+('畫', 'delineate'),
+('畫', 'draw'),
+('畫', 'drawing'),
+('畫', 'line'),
+('畫', 'painting'),
+('畫', 'picture'),
+('畯', 'crude'),
+('畯', 'farmer'),
+('畯', 'rustic'),
+('異', 'different'),
+('異', 'strange'),
+('異', 'unusual'),
+('畵', 'delineate'),
+('畵', 'draw'),
+('畵', 'drawing'),
+('畵', 'episode'),
+('畵', 'line'),
+('畵', 'painting'),
+('畵', 'picture'),
+('當', 'accept'),
+('當', 'appropriate'),
+('當', 'bear'),
+('當', 'just'),
+('當', 'undertake'),
+('畸', 'fractional'),
+('畸', 'odd'),
+('畸', 'odds'),
+('畸', 'remainder'),
+('畺', 'border'),
+('畺', 'boundary'),
+('畺', 'country'),
+('畺', 'territory'),
+('畿', 'area'),
+('畿', 'area near capita'),
+('畿', 'capital'),
+('畿', 'imperial domain'),
+('疆', 'border'),
+('疆', 'boundary'),
+('疆', 'frontier'),
+('疇', 'arable land'),
+('疇', 'category'),
+('疇', 'farmland'),
+('疇', 'furrow'),
+('疊', 'duplicate'),
+('疊', 'repeat'),
+('疊', 'repetitious'),
+('疋', 'bolt of cloth'),
+('疋', 'foot'),
+('疋', 'roll'),
+('疎', 'careless'),
+('疎', 'lax'),
+('疎', 'neglect'),
+('疏', 'careless'),
+('疏', 'lax'),
+('疏', 'neglect'),
+('疑', 'doubt'),
+('疑', 'question'),
+('疑', 'suspect'),
+('疒', 'Kangxi radical'),
+('疒', 'sickness'),
+('疔', 'boil'),
+('疔', 'carbuncle'),
+('疔', 'ulcer'),
+('疙', 'boil'),
+('疙', 'pimple'),
+('疙', 'pustule'),
+('疙', 'sore'),
+('疙', 'wart'),
+('疚', 'chronic disease'),
+('疚', 'chronic illness'),
+('疚', 'sorrow'),
+('疝', 'hernia'),
+('疝', 'rupture'),
+('疣', 'goiter'),
+('疣', 'papule'),
+('疣', 'tumor'),
+('疣', 'wart'),
+('疤', 'birthmark'),
+('疤', 'cicatrix'),
+('疤', 'scar'),
+('疥', 'itch'),
+('疥', 'scabies'),
+('疫', 'epidemic'),
+('疫', 'pestilence'),
+('疫', 'plague'),
+('疱', 'acne'),
+('疲', 'be exhausted'),
+('疲', 'feel tired'),
+('疲', 'weak'),
+('疳', 'childhood'),
+('疳', 'childhood diseases'),
+('疳', 'disease'),
+('疴', 'disease'),
+('疴', 'illness'),
+('疴', 'pain'),
+('疴', 'sickness'),
+('疵', 'defect'),
+('疵', 'disease'),
+('疵', 'fault'),
+('疵', 'flaw'),
+('疸', 'disorders of stomach'),
+('疸', 'jaundice'),
+('疹', 'fever'),
+('疹', 'measles'),
+('疹', 'rash'),
+('疼', 'aches'),
+('疼', 'be fond of'),
+('疼', 'love'),
+('疼', 'pains'),
+('疽', 'abscess'),
+('疽', 'carbuncle'),
+('疽', 'ulcer'),
+('疾', 'disease'),
+('疾', 'hate'),
+('疾', 'illness'),
+('疾', 'sickness'),
+('疾', 'to hate'),
+('痀', 'a hunchback'),
+('痀', 'humpback'),
+('痀', 'to crouch'),
+('痂', 'scab'),
+('痃', 'buboes'),
+('痃', 'indigestion'),
+('痃', 'lymphatic inflammation'),
+('病', 'disease'),
+('病', 'illness'),
+('病', 'sickness'),
+('症', 'ailment'),
+('症', 'disease'),
+('症', 'illness'),
+('症', 'symptoms, signs of an illness'),
+('痊', 'be cured'),
+('痊', 'be healed'),
+('痊', 'recover'),
+('痍', 'bruise'),
+('痍', 'sore'),
+('痍', 'wound'),
+('痒', 'itch'),
+('痔', 'hemorrhoids'),
+('痔', 'piles'),
+('痕', 'mark'),
+('痕', 'scar'),
+('痕', 'trace'),
+('痘', 'smallpox'),
+('痙', 'convulsions'),
+('痙', 'fits'),
+('痛', 'ache'),
+('痛', 'bitter'),
+('痛', 'pain'),
+('痛', 'sad'),
+('痛', 'sorry'),
+('痞', 'dyspepsia'),
+('痞', 'spleen infection'),
+('痡', '앓다'),
+('痢', 'dysentery'),
+('痣', 'birthmark'),
+('痣', 'moles'),
+('痣', 'spots'),
+('痤', 'a swelling of the lymph nodes'),
+('痧', 'cholera'),
+('痧', 'colic'),
+('痩', 'emaciated'),
+('痩', 'lean'),
+('痩', 'meager'),
+('痩', 'thin'),
+('痰', 'mucus'),
+('痰', 'phlegm'),
+('痰', 'spittle'),
+('痲', 'leprosy'),
+('痲', 'measles'),
+('痲', 'pock-marked'),
+('痳', 'leprosy'),
+('痳', 'measles'),
+('痳', 'pock-marked'),
+('痴', 'dumb'),
+('痴', 'foolish'),
+('痴', 'silly'),
+('痴', 'stupid'),
+('痹', 'numbness'),
+('痹', 'paralysis'),
+('痺', 'numbness'),
+('痺', 'paralysis'),
+('痼', 'chronic'),
+('痼', 'chronic disease'),
+('痿', 'impotence'),
+('痿', 'paralysis'),
+('瘀', 'a hematoma'),
+('瘀', 'contusion'),
+('瘀', 'extravasted blood'),
+('瘁', 'be weary'),
+('瘁', 'be worn out'),
+('瘁', 'feel tired'),
+('瘇', 'dropsy of the leg'),
+('瘈', 'chronic malaria'),
+('瘈', 'prolonged fever'),
+('瘉', 'get well'),
+('瘉', 'recover'),
+('瘋', 'crazy'),
+('瘋', 'insane'),
+('瘋', 'mentally ill'),
+('瘍', 'infection'),
+('瘍', 'sores'),
+('瘍', 'ulcers'),
+('瘏', '앓을'),
+('瘐', 'to die in prison from cold and hunger'),
+('瘐', 'to treat with cruelty'),
+('瘕', 'asthma'),
+('瘕', 'disese of the bowels'),
+('瘙', 'itch'),
+('瘟', 'epidemic'),
+('瘟', 'pestilence'),
+('瘟', 'plague'),
+('瘠', 'barren'),
+('瘠', 'emaciated'),
+('瘠', 'thin'),
+('瘡', 'boil'),
+('瘡', 'sore'),
+('瘡', 'tumor'),
+('瘡', 'wound'),
+('瘢', 'mole'),
+('瘢', 'scar'),
+('瘤', 'goiter'),
+('瘤', 'lump'),
+('瘤', 'tumor'),
+('瘦', 'emaciated'),
+('瘦', 'lean'),
+('瘦', 'meager'),
+('瘦', 'thin'),
+('瘧', 'intermittent fever'),
+('瘧', 'malaria'),
+('瘭', 'whitlow'),
+('瘭', '생인손'),
+('瘯', 'itch'),
+('瘰', 'scrofula'),
+('瘰', 'swellings'),
+('瘳', 'recover'),
+('瘳', 'to be healed'),
+('瘳', 'to reform'),
+('瘴', 'malaria pestilential vapors'),
+('瘻', 'fistula'),
+('瘻', 'goiter'),
+('瘻', 'sore'),
+('瘻', 'ulcer'),
+('療', 'be healed'),
+('療', 'cure'),
+('療', 'cured'),
+('療', 'heal'),
+('療', 'recover'),
+('癃', 'infirmity retention of urine'),
+('癃', 'weakness'),
+('癆', 'consumption'),
+('癆', 'tuberculosis'),
+('癈', 'abrogate'),
+('癈', 'discard'),
+('癈', 'terminate'),
+('癉', 'drought'),
+('癉', 'dry'),
+('癉', 'to hate bitterly'),
+('癌', 'cancer'),
+('癌', 'marmoset'),
+('癎', 'convulsions'),
+('癎', 'epilepsy'),
+('癒', 'get well'),
+('癒', 'recover'),
+('癕', 'loss of the sense of smell'),
+('癖', 'craving'),
+('癖', 'habit'),
+('癖', 'indigestion'),
+('癖', 'weakness for'),
+('癘', 'a sore'),
+('癘', 'pestilence'),
+('癘', 'ulcer'),
+('癜', 'erythema'),
+('癡', 'foolish'),
+('癡', 'idiotic'),
+('癡', 'silly'),
+('癢', 'itch'),
+('癤', 'boil'),
+('癤', 'pimple'),
+('癤', 'sore'),
+('癥', 'obstruction of bowels'),
+('癧', 'scrofulous lumps or swellings'),
+('癨', 'quickly'),
+('癨', 'suddenly'),
+('癨', 'surname'),
+('癩', 'leprosy'),
+('癩', 'mange'),
+('癩', 'scabies'),
+('癩', 'shoddy'),
+('癬', 'ringworms'),
+('癭', 'goiter'),
+('癭', 'superfluous'),
+('癭', 'swelling'),
+('癮', 'addiction'),
+('癮', 'craving'),
+('癮', 'habit'),
+('癮', 'rash'),
+('癯', 'emaciated'),
+('癯', 'thin'),
+('癯', 'tired'),
+('癯', 'worn'),
+('癰', 'abscess'),
+('癰', 'carbuncle'),
+('癰', 'sore'),
+('癰', 'ulcer'),
+('癱', 'numbness'),
+('癱', 'palsy'),
+('癱', 'paralysis'),
+('癲', 'crazy'),
+('癲', 'insanity'),
+('癲', 'mad'),
+('癲', 'madness'),
+('癲', 'mania'),
+('癸', '10th heavenly stem'),
+('癸', 'heavenly stem'),
+('癸', 'tenth'),
+('発', 'dispatch'),
+('発', 'emit'),
+('発', 'issue'),
+('発', 'send out'),
+('登', 'board'),
+('登', 'climb'),
+('登', 'go up'),
+('登', 'mount'),
+('登', 'rise'),
+('發', 'departing'),
+('發', 'discharge'),
+('發', 'dispatch'),
+('發', 'emit'),
+('發', 'issue'),
+('發', 'originating'),
+('發', 'send out'),
+('發', 'shoot'),
+('白', 'bright'),
+('白', 'inform'),
+('白', 'pure'),
+('白', 'tell'),
+('白', 'unblemished'),
+('白', 'white'),
+('百', 'hundred'),
+('百', 'many'),
+('百', 'numerous'),
+('百', 'one hundred'),
+('皀', 'enjoy'),
+('皀', 'feast [?]'),
+('皀', 'kernel'),
+('皀', 'seed'),
+('皁', 'black'),
+('皁', 'from the black clothes formerly worn by them'),
+('皁', 'police runners'),
+('皃', 'appearance'),
+('皃', 'countenance'),
+('的', 'adjectival suffix'),
+('的', 'kind of'),
+('的', 'possessive'),
+('的', 'sort of'),
+('的', 'target'),
+('皅', 'flowers'),
+('皆', 'all'),
+('皆', 'every'),
+('皆', 'everybody'),
+('皇', 'imperial'),
+('皇', 'king'),
+('皇', 'monarch'),
+('皇', 'royal'),
+('皇', 'ruler'),
+('皇', 'solemn'),
+('皇', 'superior'),
+('皋', 'highland'),
+('皋', 'the high land along a river'),
+('皎', 'bright'),
+('皎', 'brilliant'),
+('皎', 'clear'),
+('皎', 'white'),
+('皐', 'highland'),
+('皐', 'the high land along a river'),
+('皓', 'bright'),
+('皓', 'clear'),
+('皓', 'hoary'),
+('皓', 'luminous'),
+('皕', 'two hundred'),
+('皖', 'Anhui province'),
+('皚', 'brilliant white'),
+('皜', 'bright'),
+('皜', 'clean'),
+('皜', 'clear'),
+('皜', 'illuminate'),
+('皜', 'pure'),
+('皜', 'white'),
+('皞', 'bright'),
+('皞', 'brilliant'),
+('皤', 'corpulent'),
+('皤', 'grey'),
+('皤', 'white'),
+('皮', 'feather'),
+('皮', 'fur'),
+('皮', 'hide'),
+('皮', 'outer'),
+('皮', 'skin'),
+('皴', 'chapped'),
+('皴', 'cracked'),
+('皸', 'chap'),
+('皸', 'crack'),
+('皺', 'creases'),
+('皺', 'folds'),
+('皺', 'wrinkles'),
+('皿', 'dish'),
+('皿', 'rad. no. 108'),
+('皿', 'shallow container'),
+('盂', 'basin'),
+('盂', 'cup'),
+('盃', 'cup'),
+('盃', 'glass'),
+('盅', 'bowl'),
+('盅', 'cup'),
+('盅', 'small'),
+('盆', 'basin'),
+('盆', 'bowl'),
+('盆', 'pot'),
+('盆', 'tub'),
+('盈', 'fill'),
+('盈', 'full'),
+('盈', 'overflowing'),
+('盈', 'surplus'),
+('益', 'advantage'),
+('益', 'benefit'),
+('益', 'gain'),
+('益', 'profit'),
+('盌', 'basin'),
+('盌', 'bowl'),
+('盌', 'cup'),
+('盍', 'what? why not?'),
+('盎', 'abundant'),
+('盎', 'bowl'),
+('盎', 'cup'),
+('盎', 'pot'),
+('盎', '동이'),
+('盒', 'casket'),
+('盒', 'small box or case'),
+('盔', 'basin'),
+('盔', 'bowl'),
+('盔', 'helmet'),
+('盖', 'cover'),
+('盖', 'hide'),
+('盖', 'protect'),
+('盙', 'a basket'),
+('盙', 'square outside and round inside'),
+('盙', 'used to hold boiled grain in State worship'),
+('盛', 'abundant'),
+('盛', 'contain'),
+('盛', 'fill'),
+('盛', 'flourishing'),
+('盛', 'prosper'),
+('盜', 'bandit'),
+('盜', 'rob'),
+('盜', 'steal'),
+('盜', 'thief'),
+('盞', 'classifier for lamps'),
+('盞', 'etc.'),
+('盞', 'small cup or container'),
+('盟', 'alliance'),
+('盟', 'covenant'),
+('盟', 'oath'),
+('盟', 'swear'),
+('盡', 'deplete'),
+('盡', 'exhaust'),
+('盡', 'use up'),
+('監', 'control'),
+('監', 'direct'),
+('監', 'overseeing'),
+('監', 'supervise'),
+('監', 'supervision'),
+('盤', 'disc'),
+('盤', 'dish'),
+('盤', 'examine'),
+('盤', 'game'),
+('盤', 'match'),
+('盤', 'plate'),
+('盤', 'plot'),
+('盤', 'territory'),
+('盤', 'tray'),
+('盥', 'wash'),
+('盧', 'black'),
+('盧', 'cottage'),
+('盧', 'hut'),
+('盧', 'surname'),
+('盪', 'to rock'),
+('盪', 'to swing'),
+('盪', 'to toss about'),
+('盬', 'drink'),
+('盬', 'leisure'),
+('盬', 'pot'),
+('盬', 'salt'),
+('盬', 'salt pit'),
+('目', 'class'),
+('目', 'division'),
+('目', 'eye'),
+('目', 'look'),
+('目', 'see'),
+('目', 'taxonomy'),
+('目', 'topic'),
+('盱', 'look up'),
+('盱', 'stare'),
+('盱', 'to gaze in astonishment'),
+('盱', 'wide open eyes'),
+('盲', 'blind'),
+('盲', 'shortsighted'),
+('盲', 'unperceptive'),
+('直', 'erect'),
+('直', 'straight'),
+('直', 'vertical'),
+('相', 'appearance'),
+('相', 'each other'),
+('相', 'looks'),
+('相', 'minister'),
+('相', 'mutual'),
+('相', 'reciprocal'),
+('相', 'state'),
+('相', 'together'),
+('盹', 'to doze'),
+('盹', 'to nap'),
+('盹', 'to nod'),
+('盻', 'glare'),
+('盻', 'stare'),
+('盼', 'expect'),
+('盼', 'for'),
+('盼', 'gaze'),
+('盼', 'hope'),
+('盼', 'hope for'),
+('盼', 'look'),
+('盾', 'Indonesia'),
+('盾', 'dutch guilder'),
+('盾', 'shield'),
+('省', 'Chinese'),
+('省', 'conservation'),
+('省', 'department'),
+('省', 'economize'),
+('省', 'examine'),
+('省', 'inspect'),
+('省', 'ministry'),
+('省', 'omit'),
+('省', 'province'),
+('省', 'reduce'),
+('省', 'save'),
+('省', 'saving'),
+('眄', 'looking dull'),
+('眄', 'to look askance'),
+('眇', 'blind in one eye'),
+('眇', 'minuscule'),
+('眇', 'minute'),
+('眈', 'gloat'),
+('眈', 'stare'),
+('眈', 'stare at'),
+('眈', 'to delay'),
+('眈', 'to hinder'),
+('眈', 'to loiter'),
+('眉', 'eyebrow'),
+('眉', 'eyebrows'),
+('眉', 'upper margin of book'),
+('眊', 'bewildered'),
+('眊', 'dim-sighted'),
+('眊', 'dull'),
+('看', 'examine'),
+('看', 'look'),
+('看', 'scrutinize'),
+('看', 'see'),
+('県', 'county'),
+('県', 'district'),
+('県', 'subdivision'),
+('眚', 'crime'),
+('眚', 'disease of the eyes'),
+('眚', 'fault'),
+('眛', 'blind'),
+('眛', 'dark'),
+('眛', 'dim'),
+('眛', 'obscure'),
+('眞', 'actual'),
+('眞', 'genuine'),
+('眞', 'real'),
+('眞', 'surname'),
+('眞', 'true'),
+('眞', 'truth'),
+('眠', 'close'),
+('眠', 'close eyes'),
+('眠', 'eyes'),
+('眠', 'hibernate'),
+('眠', 'sleep'),
+('眥', 'corner of the eyes'),
+('眥', 'eye sockets'),
+('眦', 'corner of the eyes'),
+('眦', 'eyesockets'),
+('眨', 'wink'),
+('眩', 'dazed'),
+('眩', 'disoriented'),
+('眩', 'dizzy'),
+('眩', 'to confuse'),
+('眴', 'dazzle'),
+('眴', 'dazzled'),
+('眴', 'see'),
+('眴', 'wink'),
+('眷', 'care for'),
+('眷', 'take interest in'),
+('眸', 'eye'),
+('眸', 'pupil of eye'),
+('眺', 'gaze'),
+('眺', 'gaze at'),
+('眺', 'look at'),
+('眺', 'scan'),
+('眺', 'survey'),
+('眼', 'eye'),
+('眼', 'eyelet'),
+('眼', 'hole'),
+('眼', 'opening'),
+('眾', 'crowd'),
+('眾', 'masses'),
+('眾', 'multitude'),
+('眾', 'people'),
+('着', 'arriving'),
+('着', 'make move'),
+('着', 'take action'),
+('着', 'wearing'),
+('睆', 'beautiful'),
+('睆', 'bright'),
+('睆', 'eyeball'),
+('睆', 'protruding'),
+('睇', 'glance at'),
+('睇', 'look at'),
+('睇', 'stare at'),
+('睊', 'leer'),
+('睍', 'overly cautious'),
+('睍', 'to look at fearfully'),
+('睎', 'glimpse'),
+('睎', 'long for'),
+('睎', 'look at'),
+('睒', 'glittering'),
+('睒', 'to glance at'),
+('睒', 'to peep'),
+('睒', 'to shine'),
+('睚', 'corner of eye'),
+('睚', 'stare'),
+('睛', 'eyeball'),
+('睛', 'pupil'),
+('睛', 'pupil of eye'),
+('睜', 'pupil'),
+('睟', 'clear-eyed'),
+('睠', 'love'),
+('睠', 'to care for'),
+('睡', 'doze'),
+('睡', 'sleep'),
+('睡', 'sleeping'),
+('睢', 'at'),
+('睢', 'gaze'),
+('睢', 'gaze at'),
+('睢', 'stare'),
+('睢', 'stare at'),
+('睢', 'uninhibited'),
+('督', 'direct'),
+('督', 'oversee'),
+('督', 'supervise'),
+('睥', 'glare at'),
+('睥', 'look askance at'),
+('睦', 'amiable'),
+('睦', 'friendly'),
+('睦', 'peaceful'),
+('睨', 'glare at'),
+('睨', 'look askance at'),
+('睨', 'squint'),
+('睫', 'eyelashes'),
+('睬', 'notice'),
+('睬', 'pay attention to'),
+('睹', 'gaze at'),
+('睹', 'look at'),
+('睹', 'observe'),
+('睽', 'squint'),
+('睽', 'stare'),
+('睽', 'staring'),
+('睽', 'strabismus'),
+('睾', 'testicle'),
+('睿', 'astute'),
+('睿', 'clever'),
+('睿', 'keen'),
+('睿', 'shrewd'),
+('瞀', 'cloudy'),
+('瞀', 'dim'),
+('瞀', 'ignorant'),
+('瞋', 'glare with anger'),
+('瞍', 'blind'),
+('瞍', 'no pupil in the eye'),
+('瞎', 'blind'),
+('瞎', 'rash'),
+('瞎', 'reckless'),
+('瞏', 'blink'),
+('瞏', 'lonely'),
+('瞑', 'close eyes'),
+('瞖', 'a cataract or film over the eye'),
+('瞞', 'deceive'),
+('瞞', 'eyes half-closed'),
+('瞞', 'lie'),
+('瞠', 'gaze at'),
+('瞠', 'look at'),
+('瞠', 'stare at'),
+('瞢', 'eyesight obscured'),
+('瞢', 'to feel ashamed'),
+('瞥', 'take fleeting glance at'),
+('瞪', 'stare at'),
+('瞬', 'a flash'),
+('瞬', 'blink'),
+('瞬', 'flash'),
+('瞬', 'in a wink'),
+('瞬', 'wink'),
+('瞭', 'bright'),
+('瞭', 'clear'),
+('瞭', 'clear-sighted'),
+('瞯', 'peep'),
+('瞯', 'see'),
+('瞯', 'watch'),
+('瞰', 'look down'),
+('瞰', 'overlook'),
+('瞰', 'spy'),
+('瞰', 'watch'),
+('瞳', 'pupil'),
+('瞳', 'pupil of eye'),
+('瞹', 'clouded'),
+('瞹', 'obscure'),
+('瞻', 'look'),
+('瞻', 'look out for'),
+('瞻', 'respect'),
+('瞼', 'anatomy'),
+('瞼', 'eyelid'),
+('瞽', 'blind'),
+('瞽', 'blind musician'),
+('瞽', 'stupid'),
+('瞿', 'surname'),
+('矇', 'blind'),
+('矇', 'ignorant'),
+('矇', 'stupid'),
+('矉', 'an angry glare'),
+('矉', 'frown'),
+('矉', 'to open the eyes with anger'),
+('矍', 'look about in fright or alarm'),
+('矗', 'erect'),
+('矗', 'lofty'),
+('矗', 'straight'),
+('矗', 'upright'),
+('矙', 'view'),
+('矚', 'focus on'),
+('矚', 'stare at'),
+('矚', 'watch carefully'),
+('矛', 'KangXi radical 110'),
+('矛', 'lance'),
+('矛', 'spear'),
+('矜', 'feel sorry for'),
+('矜', 'pity'),
+('矜', 'show sympat'),
+('矞', 'bore with awl'),
+('矞', 'bright'),
+('矞', 'charming'),
+('矠', 'spear'),
+('矢', 'arrow'),
+('矢', 'dart'),
+('矢', 'swear'),
+('矢', 'vow'),
+('矣', 'particle of completed action'),
+('知', 'comprehend'),
+('知', 'know'),
+('知', 'perceive'),
+('矦', 'king'),
+('矦', '임금'),
+('矧', 'much more'),
+('矧', 'still more'),
+('矧', 'the gums'),
+('矩', 'carpenters square'),
+('矩', 'rule'),
+('矩', 'ruler'),
+('短', 'brief'),
+('短', 'deficient'),
+('短', 'lacking'),
+('短', 'short'),
+('矮', 'dwarf'),
+('矮', 'low'),
+('矮', 'short'),
+('矯', 'correct'),
+('矯', 'out'),
+('矯', 'rectify'),
+('矯', 'straighten'),
+('矯', 'straighten out'),
+('矰', 'arrow with attached silk cord'),
+('石', 'mineral'),
+('石', 'rad. 112'),
+('石', 'rock'),
+('石', 'stone'),
+('矺', '(Cant.) to press steadily'),
+('矻', 'busy'),
+('矻', 'cave'),
+('矻', 'oyster'),
+('矻', 'slave away'),
+('矻', 'stone'),
+('矻', 'toil'),
+('矼', 'stepping stones'),
+('矼', 'stone bridge'),
+('矽', 'silicon'),
+('砂', 'gravel'),
+('砂', 'gritty'),
+('砂', 'pebbles'),
+('砂', 'sand'),
+('砌', 'brick walk'),
+('砌', 'stone steps'),
+('砑', 'to calender'),
+('砑', 'to grind'),
+('砑', 'to polish'),
+('砑', 'to roll with a stone roller'),
+('砒', 'arsenic'),
+('研', 'grind'),
+('研', 'grinding'),
+('研', 'research'),
+('研', 'rub'),
+('研', 'study'),
+('砕', 'break'),
+('砕', 'broken'),
+('砕', 'busted'),
+('砕', 'smash'),
+('砢', 'pile of stones'),
+('砥', 'a whetstone'),
+('砥', 'to polish'),
+('砦', 'brothel'),
+('砦', 'fort'),
+('砦', 'military outpost'),
+('砦', 'stockade'),
+('砧', 'anvil'),
+('砧', 'exe'),
+('砧', 'flat stone'),
+('砬', 'big stone'),
+('砭', 'counsel'),
+('砭', 'pierce'),
+('砭', 'stone probe'),
+('砰', 'bang!'),
+('砰', 'sound of crashing stones'),
+('砲', 'cannon'),
+('砲', 'gun'),
+('破', 'break'),
+('破', 'destroy'),
+('破', 'rout'),
+('破', 'ruin'),
+('砺', 'sharpen'),
+('砺', 'whetstone'),
+('硃', 'a red mole'),
+('硃', 'cinnabar'),
+('硅', 'silicon'),
+('硇', 'ammonium chloride'),
+('硏', 'grind'),
+('硏', 'grinding'),
+('硜', 'the sound of stones knocking together'),
+('硝', '> to tan'),
+('硝', 'niter'),
+('硝', 'saltpeter'),
+('硨', 'giant clam'),
+('硨', 'tridacna gigas'),
+('硫', 'sulfur'),
+('硬', 'firm'),
+('硬', 'hard'),
+('硬', 'harden'),
+('硬', 'obstinate'),
+('硬', 'stiffen'),
+('硬', 'strong'),
+('确', 'barren'),
+('确', 'certain'),
+('确', 'hard'),
+('确', 'real'),
+('确', 'scarce'),
+('确', 'solid'),
+('确', 'sure'),
+('确', 'true'),
+('硯', 'inkstone'),
+('硼', 'borax'),
+('硼', 'boron'),
+('碁', 'any game similar to chess'),
+('碁', 'chess'),
+('碇', 'anchor'),
+('碇', '닻'),
+('碌', 'mediocre'),
+('碌', 'rocky'),
+('碌', 'rough'),
+('碌', 'uneven'),
+('碍', 'block'),
+('碍', 'deter'),
+('碍', 'hinder'),
+('碍', 'obstruct'),
+('碎', 'break'),
+('碎', 'broken'),
+('碎', 'busted'),
+('碎', 'shred'),
+('碎', 'smash'),
+('碏', 'coloured'),
+('碑', 'gravestone'),
+('碑', 'stone tablet'),
+('碓', 'pestle'),
+('碗', 'bowl'),
+('碗', 'small dish'),
+('碟', 'plate'),
+('碟', 'small dish'),
+('碣', 'stone tablet'),
+('碧', 'blue'),
+('碧', 'green'),
+('碧', 'jade'),
+('碩', 'big'),
+('碩', 'eminent'),
+('碩', 'great'),
+('碩', 'large'),
+('碭', 'brilliantly colored stone with veined patterns in it'),
+('確', 'certain'),
+('確', 'real'),
+('確', 'sure'),
+('確', 'true'),
+('碻', 'solid'),
+('碼', 'number'),
+('碼', 'numerals'),
+('碼', 'symbol'),
+('碼', 'yard'),
+('碾', 'crush'),
+('碾', 'roll'),
+('碾', 'roller'),
+('磁', 'magnetic'),
+('磁', 'magnetism'),
+('磁', 'porcelain'),
+('磅', 'pound'),
+('磅', 'weigh'),
+('磊', 'great'),
+('磊', 'pile of rocks or stones'),
+('磋', 'buff'),
+('磋', 'polish'),
+('磋', 'scrutinize'),
+('磎', 'creek'),
+('磎', 'mountain stream'),
+('磐', 'boulder'),
+('磐', 'firm'),
+('磐', 'large rock'),
+('磑', 'break apart'),
+('磑', 'grind'),
+('磑', 'stone mill'),
+('磔', 'downward stroke slanting right'),
+('磕', 'bump'),
+('磕', 'collide'),
+('磕', 'drumbeat'),
+('磕', 'hit'),
+('磕', 'knock into'),
+('磕', 'sound'),
+('磚', 'brick'),
+('磚', 'tile'),
+('磠', 'ammonium'),
+('磠', 'pebble'),
+('磠', 'sal ammoniac'),
+('磠', 'sand'),
+('磧', 'pebble'),
+('磧', 'rocks exposed at low tide'),
+('磧', 'sand and gravel'),
+('磧', 'to crush'),
+('磨', 'a millstone'),
+('磨', 'grind'),
+('磨', 'millstone'),
+('磨', 'polish'),
+('磨', 'rub'),
+('磨', 'wear out'),
+('磪', 'a high mountain'),
+('磪', 'precipitous'),
+('磬', 'musical instrument'),
+('磬', 'musical stone'),
+('磯', 'eddy'),
+('磯', 'jetty'),
+('磯', 'submerged rock'),
+('磴', 'cliff'),
+('磴', 'or hill'),
+('磴', 'steps on ledge'),
+('磵', 'brook'),
+('磵', 'mountain stream'),
+('磷', 'phosphorus'),
+('磷', 'water rushing between'),
+('磺', 'brimstone'),
+('磺', 'sulphur'),
+('磻', 'a tributary of the Wei river in Shanxi'),
+('磽', 'barren land'),
+('磽', 'sandy soil'),
+('礁', 'jetty'),
+('礁', 'reef'),
+('礁', 'submerged rocks'),
+('礎', 'cornerstone'),
+('礎', 'foundation stone'),
+('礎', 'plinth'),
+('礙', 'block'),
+('礙', 'deter'),
+('礙', 'hinder'),
+('礙', 'obstruct'),
+('礦', 'mine'),
+('礦', 'mineral'),
+('礦', 'ore'),
+('礧', 'roll'),
+('礪', 'sharpen'),
+('礪', 'whetstone'),
+('礫', 'gravel'),
+('礫', 'pebble'),
+('礫', 'pebbles'),
+('礫', 'potsherds'),
+('礬', 'alum'),
+('礱', 'grind'),
+('礱', 'mill'),
+('礱', 'sharpen'),
+('示', 'demonstrate'),
+('示', 'display'),
+('示', 'exhibit'),
+('示', 'manifest'),
+('示', 'show'),
+('礼', 'courtesy'),
+('礼', 'manners'),
+('礼', 'social custom'),
+('社', 'company'),
+('社', 'god of the soil and altars to him'),
+('社', 'group of families'),
+('社', 'social'),
+('社', 'society'),
+('祀', 'to sacrifice'),
+('祀', 'worship'),
+('祁', 'abundant'),
+('祁', 'ample'),
+('祁', 'numerous'),
+('祁', 'pray'),
+('祅', 'calamities'),
+('祅', 'disasters'),
+('祅', 'ormazda'),
+('祆', 'Ormazda'),
+('祆', 'extended to god of the Manicheans'),
+('祆', 'god of the Zoroastrians'),
+('祇', 'but'),
+('祇', 'merely'),
+('祇', 'only'),
+('祈', 'beseech'),
+('祈', 'entreat'),
+('祈', 'pray'),
+('祉', 'blessings'),
+('祉', 'good luck'),
+('祉', 'happiness'),
+('祊', 'river in Shandong'),
+('祊', 'space inside'),
+('祐', 'divine intervention'),
+('祐', 'protection'),
+('祓', 'clean'),
+('祓', 'exorcise'),
+('祓', 'remove evil'),
+('祔', 'entomb'),
+('祔', 'worship ones ancestors'),
+('祕', 'abstruse'),
+('祕', 'mysterious'),
+('祕', 'secret'),
+('祖', 'ancestor'),
+('祖', 'forefather'),
+('祖', 'grandfather'),
+('祗', 'look up to'),
+('祗', 'respect'),
+('祗', 'revere'),
+('祚', 'bless'),
+('祚', 'blessing'),
+('祚', 'happiness'),
+('祚', 'throne'),
+('祛', 'disperse'),
+('祛', 'exorcise'),
+('祛', 'expel'),
+('祛', 'shiver'),
+('祜', 'blessing'),
+('祜', 'happiness'),
+('祜', 'prosperity'),
+('祝', 'celebrating'),
+('祝', 'pray for happiness or blessings'),
+('祝', 'wish'),
+('神', 'ghost'),
+('神', 'god'),
+('神', 'phantom'),
+('神', 'spirit'),
+('神', 'supernatural being'),
+('祟', 'evil influence'),
+('祟', 'evil spirit'),
+('祠', 'ancestral temple'),
+('祠', 'offer sacrifice'),
+('祢', 'ones deceased father'),
+('祥', 'good luck'),
+('祥', 'good omen'),
+('祥', 'happiness'),
+('祧', 'an ancestral hall'),
+('票', 'slip of paper or bamboo'),
+('票', 'ticket'),
+('祭', 'sacrifice to'),
+('祭', 'worship'),
+('祷', 'beg'),
+('祷', 'entreat'),
+('祷', 'plead'),
+('祷', 'pray'),
+('祷', 'prayer'),
+('祺', 'good fortune'),
+('祺', 'good luck'),
+('祼', 'libation'),
+('祿', 'bless'),
+('祿', 'blessing'),
+('祿', 'fortune'),
+('祿', 'green'),
+('祿', 'happiness'),
+('祿', 'meat'),
+('祿', 'official'),
+('祿', 'pay'),
+('祿', 'prosperity'),
+('祿', 'sacrificial'),
+('祿', 'salary'),
+('禀', 'petition'),
+('禀', 'report to'),
+('禁', 'forbid'),
+('禁', 'prohibit'),
+('禁', 'prohibition'),
+('禁', 'restrict'),
+('禅', 'Zen'),
+('禅', 'contemplation(DKW: 24787)'),
+('禅', 'meditation'),
+('禊', 'semi-annual ceremony of purification'),
+('禋', 'offer sacrifice'),
+('禋', 'sacrifice'),
+('禍', 'calamity'),
+('禍', 'disaster'),
+('禍', 'misfortune'),
+('禎', 'auspicious'),
+('禎', 'good omen'),
+('禎', 'lucky'),
+('福', 'blessing'),
+('福', 'fortune'),
+('福', 'good fortune'),
+('福', 'happiness'),
+('禔', 'good fortune'),
+('禔', 'happiness'),
+('禔', 'peace'),
+('禖', 'Chinese'),
+('禖', 'ancient'),
+('禖', 'sacrifice'),
+('禖', 'son'),
+('禦', 'defend'),
+('禦', 'hold out against'),
+('禦', 'resist'),
+('禧', 'congratulations'),
+('禧', 'happiness'),
+('禨', 'pray for good fortune'),
+('禪', 'Zen'),
+('禪', 'abdicate'),
+('禪', 'contemplation(dhyana)'),
+('禪', 'meditation'),
+('禪', 'to level ground for altar'),
+('禫', 'sacrifice offered at the end of the three years mourning the death of a parent'),
+('禮', 'courtesy'),
+('禮', 'etiquette'),
+('禮', 'manners'),
+('禮', 'rites'),
+('禮', 'social custom'),
+('禰', 'ones deceased father'),
+('禱', 'beg'),
+('禱', 'entreat'),
+('禱', 'plead'),
+('禱', 'pray'),
+('禱', 'prayer'),
+('禳', 'exorcise'),
+('禳', 'pray or sacrifice'),
+('禴', 'sacrifice'),
+('禹', 'king'),
+('禹', 'legendary hsia dynasty founder'),
+('禹', 'steel square'),
+('禹', 'surname'),
+('禹', 'worm'),
+('禹', '곡척'),
+('禹', '벌레'),
+('禹', '성씨'),
+('禹', '임금'),
+('禺', 'district'),
+('禺', 'mountain in Zhejiang'),
+('离', 'elegant'),
+('离', 'rare beast'),
+('离', 'strange'),
+('禽', 'animals'),
+('禽', 'birds'),
+('禽', 'capture'),
+('禽', 'fowl'),
+('禽', 'surname'),
+('禽', 'winged'),
+('禾', 'grain still on stalk'),
+('禾', 'horse'),
+('禾', 'number'),
+('禾', 'rice'),
+('禾', 'rice plant'),
+('禾', 'teeth'),
+('禿', 'Bald'),
+('禿', 'bald'),
+('禿', 'bare'),
+('禿', 'stripped'),
+('秀', 'ear of grain'),
+('秀', 'elegant'),
+('秀', 'excellent'),
+('秀', 'flowering'),
+('秀', 'graceful'),
+('秀', 'luxuriant'),
+('秀', 'outstanding'),
+('秀', 'refined'),
+('秀', 'remark'),
+('私', 'personal'),
+('私', 'private'),
+('私', 'secret'),
+('秃', 'bald'),
+('秆', 'stalk of grain'),
+('秆', 'straw'),
+('秉', 'authority'),
+('秉', 'bundle'),
+('秉', 'grasp'),
+('秉', 'hold'),
+('秊', 'new-years'),
+('秊', 'persons age'),
+('秊', 'year'),
+('秋', 'autumn'),
+('秋', 'fall'),
+('秋', 'year'),
+('种', 'breed'),
+('种', 'race'),
+('种', 'seed'),
+('种', 'to plant'),
+('科', 'class'),
+('科', 'department'),
+('科', 'science'),
+('科', 'section'),
+('科', 'sort'),
+('秒', 'SI'),
+('秒', 'a second'),
+('秒', 'beard of grain or corn'),
+('秒', 'geometry'),
+('秒', 'second of arc'),
+('秕', 'chaff'),
+('秕', 'empty grain or rice husk'),
+('秘', 'abstruse'),
+('秘', 'mysterious'),
+('秘', 'secret'),
+('租', 'lease'),
+('租', 'rent'),
+('租', 'rental'),
+('租', 'tax'),
+('秣', 'feed horse'),
+('秣', 'fodder'),
+('秣', 'horse feed'),
+('秤', 'balance'),
+('秤', 'scale'),
+('秤', 'steelyard'),
+('秤', '저울'),
+('秦', 'Qin'),
+('秦', 'feudal state of Qin'),
+('秦', 'the Qin dynasty(from which the name China comes)'),
+('秧', 'rice seedlings'),
+('秧', 'young rice plants'),
+('秩', 'decade'),
+('秩', 'order'),
+('秩', 'orderly'),
+('秩', 'salary'),
+('秪', 'merely'),
+('秪', 'only'),
+('秫', 'glutinous variety of millet'),
+('秬', 'black millet'),
+('称', 'address'),
+('称', 'brand'),
+('称', 'call'),
+('称', 'name'),
+('称', 'say'),
+('秸', 'corn'),
+('秸', 'stalks of millet'),
+('秸', 'straw'),
+('移', 'change'),
+('移', 'change place'),
+('移', 'move about'),
+('移', 'place'),
+('移', 'shift'),
+('稀', 'rare'),
+('稀', 'scarce'),
+('稀', 'sparse'),
+('稀', 'unusual'),
+('稂', 'grass'),
+('稂', 'weeds'),
+('稅', 'duty'),
+('稅', 'revenue'),
+('稅', 'tax'),
+('稅', 'taxes'),
+('稈', 'stalk of grain'),
+('稈', 'straw'),
+('稊', 'darnels'),
+('稊', 'tares'),
+('程', 'agenda'),
+('程', 'journey'),
+('程', 'schedule'),
+('程', 'trip'),
+('稌', 'glutinous rice'),
+('稍', 'little'),
+('稍', 'rather'),
+('稍', 'slightly'),
+('税', 'taxes'),
+('稔', 'be familiar with'),
+('稔', 'harvest'),
+('稔', 'ripe grain'),
+('稔', 'to know'),
+('稗', 'darnels'),
+('稗', 'tares small'),
+('稗', 'weeds'),
+('稙', 'grain ready for grinding'),
+('稚', 'childhood'),
+('稚', 'immature'),
+('稚', 'infantile'),
+('稚', 'young'),
+('稜', 'angle'),
+('稜', 'corner'),
+('稜', 'edge'),
+('稜', 'square block'),
+('稞', 'grain'),
+('稞', 'grain ready for grinding'),
+('稟', 'petition'),
+('稟', 'report to'),
+('稠', 'crowded'),
+('稠', 'dense'),
+('稠', 'packed'),
+('稠', 'soupy'),
+('稭', '짚고갱이'),
+('種', 'cultivate'),
+('種', 'inoculate'),
+('種', 'kernel'),
+('種', 'kind'),
+('種', 'offspring'),
+('種', 'plant'),
+('種', 'race'),
+('種', 'seed'),
+('種', 'sort'),
+('種', 'species'),
+('種', 'taxonomy'),
+('種', 'to plant'),
+('種', 'transplant'),
+('種', 'type'),
+('稱', 'address'),
+('稱', 'brand'),
+('稱', 'call'),
+('稱', 'name'),
+('稱', 'say'),
+('稲', 'rice growing in field'),
+('稲', 'rice plant'),
+('稳', 'firm'),
+('稳', 'solid'),
+('稳', 'stable'),
+('稳', 'steady'),
+('稷', 'god of cereals'),
+('稷', 'minister of agriculture'),
+('稻', 'plant'),
+('稻', 'rice'),
+('稻', 'rice growing in field'),
+('稻', 'rice plant'),
+('稼', 'sheaves of grain'),
+('稼', 'sow grain'),
+('稼', 'work'),
+('稽', 'delay'),
+('稽', 'examine'),
+('稽', 'investigate'),
+('稿', 'draft'),
+('稿', 'manuscript'),
+('稿', 'rough copy'),
+('穀', 'cereal'),
+('穀', 'corn'),
+('穀', 'grain'),
+('穀', 'lucky'),
+('穅', 'bran'),
+('穅', 'chaff'),
+('穅', 'from which comes: --poor'),
+('穅', 'husks of grain'),
+('穅', 'remiss'),
+('穆', 'calm'),
+('穆', 'majestic'),
+('穆', 'reverent'),
+('穆', 'solemn'),
+('穉', 'infantile'),
+('穉', 'tender'),
+('穉', 'young'),
+('穉', 'young grain'),
+('穌', 'collect'),
+('穌', 'revive'),
+('穌', 'to rise again'),
+('積', 'accumulate'),
+('積', 'amass'),
+('積', 'arithmetic'),
+('積', 'product'),
+('積', 'store up'),
+('穎', 'clever'),
+('穎', 'rice tassel'),
+('穎', 'sharp point'),
+('穏', 'calm'),
+('穏', 'moderation'),
+('穏', 'peace'),
+('穏', 'quiet'),
+('穐', 'autumn'),
+('穐', 'fall'),
+('穗', 'Guangzhou'),
+('穗', 'ear of grain'),
+('穗', 'tassel'),
+('穜', '늦벼'),
+('穠', 'dense'),
+('穠', 'in clusters'),
+('穠', 'lush'),
+('穠', 'luxuriant'),
+('穠', 'profound'),
+('穠', 'thick'),
+('穡', 'farm'),
+('穡', 'grain'),
+('穡', 'harvest'),
+('穡', 'harvest grain'),
+('穡', 'stingy'),
+('穢', 'dirty'),
+('穢', 'immoral'),
+('穢', 'obscene'),
+('穢', 'unclean'),
+('穩', 'firm'),
+('穩', 'peaceful'),
+('穩', 'solid'),
+('穩', 'stable'),
+('穩', 'steady'),
+('穫', 'cut'),
+('穫', 'cut grain'),
+('穫', 'grain'),
+('穫', 'harvest'),
+('穫', 'reap'),
+('穰', 'abundant'),
+('穰', 'lush'),
+('穰', 'rice'),
+('穰', 'stalks of grain'),
+('穰', 'straw'),
+('穴', 'burrow'),
+('穴', 'cave'),
+('穴', 'cavern'),
+('穴', 'cavity'),
+('穴', 'den'),
+('穴', 'ditch'),
+('穴', 'dugout'),
+('穴', 'hole'),
+('穴', 'hollow'),
+('穴', 'pit'),
+('穴', 'rad. no. 116'),
+('穴', 'sett'),
+('穴', '구덩이'),
+('穴', '구멍'),
+('穴', '굴'),
+('穴', '움'),
+('穵', 'deep hollow'),
+('穵', 'dig out'),
+('穵', 'gouge'),
+('究', 'examine'),
+('究', 'investigate'),
+('穹', 'arched'),
+('穹', 'elevated'),
+('穹', 'heaven'),
+('穹', 'high and vast'),
+('穹', 'sky'),
+('空', 'air'),
+('空', 'bare'),
+('空', 'deserted'),
+('空', 'empty'),
+('空', 'hollow'),
+('空', 'sky'),
+('空', 'void'),
+('空', 'zero'),
+('穽', 'hole'),
+('穽', 'pitfall'),
+('穽', 'trap'),
+('穿', 'drill'),
+('穿', 'penetrate'),
+('穿', 'pierce'),
+('穿', 'put on'),
+('穿', 'wear'),
+('窀', 'to bury'),
+('突', 'abruptly'),
+('突', 'clash'),
+('突', 'dash'),
+('突', 'penetration'),
+('突', 'piercing'),
+('突', 'protrusion'),
+('突', 'sudden'),
+('突', 'suddenly'),
+('突', 'unexpectedly'),
+('窃', 'secretly'),
+('窃', 'steal'),
+('窃', 'stealthily'),
+('窃', 'thief'),
+('窄', 'narrow'),
+('窄', 'narrow-minded'),
+('窄', 'tight'),
+('窅', 'deep'),
+('窅', 'far'),
+('窅', 'sad'),
+('窅', 'sunken eyes'),
+('窆', 'to put a coffin in a grave'),
+('窈', 'obscure'),
+('窈', 'refined'),
+('窈', 'secluded'),
+('窊', '(Cant.) 手窊'),
+('窊', 'pit'),
+('窊', 'store in pit'),
+('窊', 'the arm'),
+('窊', 'vault'),
+('窒', 'obstruct'),
+('窒', 'stop up'),
+('窓', 'window'),
+('窕', 'charming'),
+('窕', 'quiet and modest'),
+('窕', 'slender'),
+('窗', 'window'),
+('窘', 'embarrassed'),
+('窘', 'hard-pressed'),
+('窟', 'cave'),
+('窟', 'cellar'),
+('窟', 'hole'),
+('窟', 'underground'),
+('窠', 'den'),
+('窠', 'hole'),
+('窠', 'indentation'),
+('窠', 'indention'),
+('窠', 'nest'),
+('窣', 'rustling'),
+('窣', 'to rush out of a den'),
+('窣', 'whispering'),
+('窩', 'cave'),
+('窩', 'den'),
+('窩', 'hiding place'),
+('窩', 'nest'),
+('窪', 'depression'),
+('窪', 'hollow'),
+('窪', 'pit'),
+('窪', 'swamp'),
+('窬', 'a hole in the wall to cut through a wall'),
+('窬', 'a small door or window'),
+('窬', 'penetrate'),
+('窬', 'wickets'),
+('窮', 'destitute'),
+('窮', 'impoverished'),
+('窮', 'poor'),
+('窯', 'coal mine pit'),
+('窯', 'kiln'),
+('窳', 'a flaw'),
+('窳', 'cracked'),
+('窳', 'dirty'),
+('窳', 'powerless'),
+('窳', 'useless'),
+('窳', 'weak'),
+('窶', 'impoverished'),
+('窶', 'poor'),
+('窺', 'peep'),
+('窺', 'pry'),
+('窺', 'spy on'),
+('窺', 'watch'),
+('窾', 'empty'),
+('窾', 'hallow'),
+('窾', 'hole'),
+('窿', 'cavity'),
+('窿', 'hole'),
+('窿', 'mine shaft'),
+('竄', 'edit'),
+('竄', 'expel'),
+('竄', 'revise'),
+('竄', 'run away'),
+('竅', 'aperture'),
+('竅', 'hole'),
+('竅', 'opening'),
+('竇', 'burrow'),
+('竇', 'corrupt'),
+('竇', 'hole'),
+('竇', 'surname'),
+('竈', 'furnace'),
+('竈', 'kitchen range'),
+('竊', 'secretly'),
+('竊', 'steal'),
+('竊', 'stealthily'),
+('竊', 'thief'),
+('立', 'erect'),
+('立', 'establish'),
+('立', 'let stand'),
+('立', 'set'),
+('立', 'stand'),
+('站', 'a stand'),
+('站', 'stand up'),
+('站', 'station'),
+('竜', 'dragon'),
+('竜', 'symbolic of emperor'),
+('竝', 'also'),
+('竝', 'annex'),
+('竝', 'combine'),
+('竝', 'in order'),
+('竝', 'side'),
+('竝', 'side by side'),
+('竝', 'to combine'),
+('竝', 'together'),
+('竝', 'vicinity'),
+('竝', 'whats more'),
+('竟', 'after all'),
+('竟', 'at last'),
+('竟', 'end'),
+('竟', 'exhaust'),
+('竟', 'finally'),
+('章', 'chapter'),
+('章', 'composition'),
+('章', 'section'),
+('竢', 'as soon as'),
+('竢', 'wait for'),
+('竢', 'wait until'),
+('竣', 'end'),
+('竣', 'finish'),
+('竣', 'quit'),
+('竣', 'terminate'),
+('童', 'boy'),
+('童', 'child'),
+('童', 'servant boy'),
+('童', 'virgin'),
+('竦', 'be in awe of'),
+('竦', 'respect'),
+('竦', 'revere'),
+('竪', 'erect'),
+('竪', 'perpendicular'),
+('竪', 'vertical'),
+('竭', 'exhaust'),
+('竭', 'put forth great effort'),
+('端', 'beginning'),
+('端', 'cape'),
+('端', 'clue'),
+('端', 'end'),
+('端', 'extreme'),
+('端', 'geography'),
+('端', 'head'),
+('競', 'compete'),
+('競', 'competition'),
+('競', 'contend'),
+('競', 'vie'),
+('竸', 'compete'),
+('竸', 'contend'),
+('竸', 'vie'),
+('竹', 'KangXi radical 118'),
+('竹', 'bamboo'),
+('竹', 'flute'),
+('竺', 'India'),
+('竺', 'bamboo'),
+('竺', 'surname'),
+('竽', 'ancient woodwind instrument'),
+('竽', 'chief'),
+('竽', 'flute'),
+('竿', 'bamboo pole'),
+('竿', 'penis'),
+('笆', 'bamboo fence'),
+('笈', 'bamboo box used carry books'),
+('笊', 'bamboo skimmer'),
+('笊', 'ladle'),
+('笋', 'bamboo shoots'),
+('笏', 'tablet'),
+('笏', 'tablet held by someone having authority'),
+('笑', 'giggle'),
+('笑', 'laugh'),
+('笑', 'smile'),
+('笑', 'snicker'),
+('笙', 'small gourd-shaped musical instrument'),
+('笛', 'bamboo flute'),
+('笛', 'whistle'),
+('笞', 'bamboo rod used for beatings'),
+('笠', 'bamboo covering'),
+('笠', 'bamboo hat'),
+('笥', 'a hamper'),
+('笥', 'wicker basket'),
+('符', 'ID'),
+('符', 'charm'),
+('符', 'i.d. tag'),
+('符', 'mark'),
+('符', 'symbol'),
+('符', 'tag'),
+('符', 'tally'),
+('笧', 'check(a current) with a weir'),
+('笧', 'current'),
+('笧', 'entwine'),
+('笧', 'to entwine around'),
+('笧', 'weir'),
+('笨', 'awkward'),
+('笨', 'dull'),
+('笨', 'foolish'),
+('笨', 'mediocre'),
+('笨', 'rough'),
+('笨', 'stupid'),
+('第', 'degree'),
+('第', 'grade'),
+('第', 'number'),
+('第', 'sequence'),
+('第', 'turn'),
+('笭', 'bamboo screen'),
+('笯', 'a bird-cage'),
+('笳', 'a reed leaf whistle'),
+('笵', 'a bamboo form'),
+('笵', 'a model'),
+('笹', 'small bamboo'),
+('筅', 'bamboo brush'),
+('筅', 'halberd'),
+('筆', 'stroke'),
+('筆', 'write'),
+('筆', 'writing brush'),
+('筈', 'arrow end'),
+('等', 'class'),
+('等', 'equal'),
+('等', 'et cetera'),
+('等', 'etc.'),
+('等', 'grade'),
+('等', 'order'),
+('等', 'rank'),
+('等', 'wait'),
+('筋', 'muscles'),
+('筋', 'tendons'),
+('筌', 'bamboo fish trap'),
+('筍', 'bamboo shoot'),
+('筍', 'joint'),
+('筍', 'shoot'),
+('筍', 'sprout'),
+('筍', 'tendon'),
+('筏', 'raft'),
+('筐', 'bamboo'),
+('筐', 'bamboo basket or chest'),
+('筐', 'basket'),
+('筐', '광주리'),
+('筑', 'ancient lute'),
+('筑', 'build'),
+('筒', 'pipe'),
+('筒', 'thick piece of bamboo'),
+('筓', 'a hairpin on which the hair is bound at the back of the head. 15 of age'),
+('答', 'answer'),
+('答', 'assent to'),
+('答', 'reply'),
+('答', 'return'),
+('策', 'plan'),
+('策', 'scheme'),
+('策', 'to whip'),
+('策', 'urge'),
+('筠', 'bamboo'),
+('筠', 'bamboo skin'),
+('筥', 'round-shaped bamboo basket for'),
+('筦', 'a key'),
+('筦', 'a pipe'),
+('筦', 'administer'),
+('筦', 'flute'),
+('筦', 'to be in charge'),
+('筧', 'bamboo water pipe'),
+('筩', 'bamboo pipe'),
+('筩', 'fish hook'),
+('筬', 'reed of a loom'),
+('筮', 'divination with stalks of plants'),
+('筮', 'divining rod'),
+('筱', 'diminutive in persons name'),
+('筱', 'dwarf bamboo'),
+('筳', 'feast'),
+('筵', 'bamboo mat'),
+('筵', 'banquet'),
+('筵', 'feast'),
+('筽', 'willow'),
+('箇', 'numerary adjunct'),
+('箇', 'piece'),
+('箇', 'single'),
+('箋', 'comments'),
+('箋', 'memo'),
+('箋', 'note'),
+('箋', 'record'),
+('箋', 'stationery'),
+('箍', 'bind'),
+('箍', 'hoop'),
+('箍', 'surround'),
+('箎', 'ancient woodwind instrument'),
+('箏', 'kite'),
+('箏', 'stringed musical instrument'),
+('箒', 'broom'),
+('箒', 'sweep'),
+('箒', '쓸다'),
+('箔', 'frame for growing silkworms'),
+('箔', 'reed screen'),
+('箕', 'dust pan'),
+('箕', 'garbage bag'),
+('箕', 'sieve'),
+('算', 'calculate'),
+('算', 'count'),
+('算', 'figure'),
+('算', 'plan'),
+('箙', 'quiver'),
+('箚', 'brief note'),
+('箚', 'official communique'),
+('箜', 'ancient string music instrument'),
+('箝', 'pincers'),
+('箝', 'pliers'),
+('箝', 'tongs'),
+('箝', 'tweezers'),
+('箠', 'flog'),
+('箠', 'horse whip'),
+('箠', 'rod'),
+('箠', 'whip'),
+('管', 'duct'),
+('管', 'duct, pipe, tube'),
+('管', 'instrument'),
+('管', 'pipe'),
+('管', 'tube'),
+('管', 'woodwind'),
+('管', 'woodwind music'),
+('箪', 'small bamboo basket for holding'),
+('箭', 'arrow'),
+('箭', 'type of bamboo'),
+('箱', 'box'),
+('箱', 'case'),
+('箱', 'chest'),
+('箱', 'trunk'),
+('箴', 'admon'),
+('箴', 'needle'),
+('箴', 'probe'),
+('箸', 'chopsticks'),
+('箾', 'a capsule'),
+('箾', 'bamboo flute'),
+('箾', 'musical instrument like pan-pipes'),
+('節', 'anniversary'),
+('節', 'beat'),
+('節', 'etiquette'),
+('節', 'incision'),
+('節', 'joint'),
+('節', 'knot'),
+('節', 'node'),
+('節', 'section'),
+('節', 'verse'),
+('篁', 'bamboo'),
+('篁', 'bamboo grove'),
+('篁', 'grove'),
+('範', 'law'),
+('範', 'model'),
+('範', 'pattern'),
+('範', 'rule'),
+('篆', 'official stamp'),
+('篆', 'seal'),
+('篆', 'seal script'),
+('篇', 'article'),
+('篇', 'chapter'),
+('篇', 'essay'),
+('篇', 'section'),
+('築', 'build'),
+('築', 'building'),
+('築', 'erect'),
+('篋', 'box'),
+('篋', 'case'),
+('篋', 'or case'),
+('篋', 'rattan'),
+('篋', 'ratton box'),
+('篋', 'suitcase'),
+('篌', 'ancient music instrument'),
+('篌', 'harp'),
+('篔', 'tall bamboo'),
+('篙', 'oar'),
+('篙', 'pole used punt boat'),
+('篛', 'cuticle of bamboo plant'),
+('篝', 'bamboo basket'),
+('篝', 'bamboo frame'),
+('篠', 'diminutive in persons name'),
+('篠', 'dwarf bamboo'),
+('篡', 'usurp'),
+('篤', 'deep'),
+('篤', 'genuine'),
+('篤', 'sincere'),
+('篤', 'true'),
+('篥', 'bulgle'),
+('篦', 'comb hair'),
+('篦', 'fine-toothed comb'),
+('篩', 'filter'),
+('篩', 'screen'),
+('篩', 'sieve'),
+('篩', 'sift'),
+('篪', 'a bamboo flute with seven holes'),
+('篭', 'cage'),
+('篭', 'cage-like basket'),
+('篳', 'bamboo'),
+('篳', 'wicker'),
+('篷', 'awning'),
+('篷', 'boat'),
+('篷', 'covering'),
+('篷', 'sail'),
+('篸', 'hairpin'),
+('篸', 'needle'),
+('篾', 'bamboo splints or slats'),
+('簀', 'bed mat'),
+('簀', 'mat'),
+('簇', 'cluster'),
+('簇', 'crowd together'),
+('簇', 'swarm'),
+('簉', 'concubine'),
+('簉', 'deputy'),
+('簉', 'subordinate'),
+('簋', 'a square basket of bamboo for holding grain used at sacrifices'),
+('簋', 'feast'),
+('簏', 'a basket'),
+('簏', 'a box'),
+('簑', 'a coat raincoat'),
+('簒', 'usurp'),
+('簔', 'a coat raincoat'),
+('簘', 'bamboo flute'),
+('簘', 'musical instrument like pan-pipes'),
+('簞', 'small bamboo basket for holding'),
+('簟', 'bamboo mat'),
+('簠', 'an ancient vessel used for holding boiled grain'),
+('簡', 'brief'),
+('簡', 'choose'),
+('簡', 'concise'),
+('簡', 'epistle'),
+('簡', 'letter'),
+('簡', 'pick'),
+('簡', 'select'),
+('簡', 'simple'),
+('簡', 'succinct'),
+('簡', 'terse'),
+('簡', 'uncomplicated'),
+('簧', 'reed of woodwind instrument'),
+('簪', 'clasp'),
+('簪', 'hairpin'),
+('簪', 'wear in hair'),
+('簫', 'bamboo flute'),
+('簫', 'musical instrument like pan-pipes'),
+('簷', 'brim'),
+('簷', 'eaves of house'),
+('簸', 'winnower'),
+('簽', 'endorse'),
+('簽', 'sign'),
+('簽', 'slip of paper'),
+('簾', 'a blind'),
+('簾', 'blind'),
+('簾', 'curtain'),
+('簾', 'screen'),
+('簿', 'account book'),
+('簿', 'basket'),
+('簿', 'frail'),
+('簿', 'light'),
+('簿', 'notebook'),
+('簿', 'raising'),
+('簿', 'register'),
+('簿', 'silkworm'),
+('簿', 'thin'),
+('籃', 'basket'),
+('籌', 'chip'),
+('籌', 'raise money'),
+('籌', 'tally'),
+('籌', 'token'),
+('籍', 'census'),
+('籍', 'list'),
+('籍', 'record'),
+('籍', 'register'),
+('籐', 'cane'),
+('籐', 'climbing plants'),
+('籐', 'vines'),
+('籔', 'bamboo basket'),
+('籛', 'surname'),
+('籜', 'bamboo sheath'),
+('籜', 'bamboo shoots'),
+('籟', 'bamboo flute'),
+('籟', 'pipe'),
+('籟', 'various sound'),
+('籠', 'basket'),
+('籠', 'cage'),
+('籠', 'cage-like basket'),
+('籤', 'lot'),
+('籤', 'lottery'),
+('籤', 'marker'),
+('籤', 'tally'),
+('籥', 'Confucian'),
+('籥', 'ancient'),
+('籥', 'bamboo'),
+('籥', 'dance'),
+('籥', 'fingerhole'),
+('籥', 'flute'),
+('籥', 'key'),
+('籥', 'music'),
+('籥', 'notched'),
+('籥', 'ritual'),
+('籥', 'vertical'),
+('籥', 'woodwind instrument'),
+('籧', 'crude bamboo mat'),
+('籩', 'bamboo container for food'),
+('籬', 'bamboo or wooden fence'),
+('籬', 'hedge'),
+('籲', 'appeal'),
+('籲', 'implore'),
+('籲', 'request'),
+('米', 'hulled or husked uncooked rice'),
+('米', 'rice'),
+('类', 'category'),
+('类', 'class'),
+('类', 'group'),
+('类', 'kind'),
+('籾', 'unhulled rice'),
+('粁', 'km'),
+('粃', 'empty husks of grain'),
+('粉', 'face powder'),
+('粉', 'plaster'),
+('粉', 'powder'),
+('粍', 'mm'),
+('粒', 'grain'),
+('粒', 'small particle'),
+('粕', 'dregs'),
+('粕', 'lees'),
+('粕', 'sediments left after distilling liquor'),
+('粗', 'course'),
+('粗', 'rough'),
+('粗', 'rude'),
+('粗', 'thick'),
+('粘', 'glutinous'),
+('粘', 'mucous'),
+('粘', 'sticky'),
+('粘', 'viscous'),
+('粟', 'grain'),
+('粟', 'unhusked millet'),
+('粢', 'grain offered in ritual sacrifice'),
+('粢', 'millet'),
+('粤', 'Guangdong and Guangxi provinces'),
+('粤', 'initial particle'),
+('粥', 'congee'),
+('粥', 'rice gruel'),
+('粦', 'phosphorus'),
+('粧', 'adorn'),
+('粧', 'dress up'),
+('粧', 'make-up'),
+('粧', 'toilet'),
+('粨', 'hm'),
+('粮', 'food'),
+('粮', 'grain'),
+('粮', 'provisions'),
+('粱', 'better varieties of millet'),
+('粲', 'bright'),
+('粲', 'polish'),
+('粲', 'radiant'),
+('粲', 'smiling'),
+('粳', 'non-glutinous rice'),
+('粵', 'Guangdong and Guangxi provinces'),
+('粵', 'initial particle'),
+('粹', 'pure'),
+('粹', 'select'),
+('粹', 'unadulterated'),
+('粽', 'dumpling made of glutinous rice'),
+('精', 'essence'),
+('精', 'semen'),
+('精', 'spirit'),
+('糅', 'blend'),
+('糅', 'mix'),
+('糅', 'mixed'),
+('糊', 'paste'),
+('糊', 'stick on with paste'),
+('糕', 'cakes'),
+('糕', 'pastry'),
+('糖', 'candy'),
+('糖', 'sugar'),
+('糖', 'sweets'),
+('糗', 'broken grain'),
+('糗', 'parched wheat or rice'),
+('糙', 'coarse'),
+('糙', 'harsh'),
+('糙', 'rough'),
+('糙', 'unpolished rice'),
+('糜', 'congee'),
+('糜', 'mashed'),
+('糜', 'rice gruel'),
+('糝', 'mixed'),
+('糝', 'scattered(grains of rice)'),
+('糞', 'dung'),
+('糞', 'manure'),
+('糞', 'night soil'),
+('糟', 'dregs'),
+('糟', 'pickle'),
+('糟', 'sediment'),
+('糠', 'bran'),
+('糠', 'chaff'),
+('糠', 'husks'),
+('糠', 'poor'),
+('糢', 'rice snacks'),
+('糤', 'fried round cakes of wheat flour'),
+('糧', 'food'),
+('糧', 'grain'),
+('糧', 'provisions'),
+('糯', 'glutinous'),
+('糯', 'glutinous rice'),
+('糯', 'sticky'),
+('糰', 'rice ball'),
+('糲', 'brown rice'),
+('糲', 'unpolished rice'),
+('糴', 'buy in'),
+('糴', 'purchase grains'),
+('糴', 'rice'),
+('糴', 'store grain'),
+('糴', 'surname'),
+('糶', 'rice'),
+('糶', 'sell'),
+('糶', 'sell grains'),
+('糶', 'surname'),
+('糸', 'KangXi radical 120'),
+('糸', 'silk'),
+('糺', 'to band together'),
+('糺', 'to collaborate'),
+('系', 'connect'),
+('系', 'connection'),
+('系', 'join'),
+('系', 'line'),
+('系', 'link'),
+('系', 'system'),
+('糾', 'inspect'),
+('糾', 'investigate'),
+('糾', 'twist'),
+('糾', 'writhe'),
+('紀', 'annal'),
+('紀', 'historical account'),
+('紀', 'record'),
+('紂', 'name of an emperor'),
+('紂', 'saddle part'),
+('紃', 'a cord'),
+('約', 'agreement'),
+('約', 'approximately'),
+('約', 'contract'),
+('約', 'covenant'),
+('約', 'promise'),
+('約', 'roughly'),
+('約', 'treaty'),
+('紅', 'blush'),
+('紅', 'flush'),
+('紅', 'red'),
+('紅', 'vermillion'),
+('紆', 'bend'),
+('紆', 'distort'),
+('紆', 'turn'),
+('紆', 'twist'),
+('紇', 'bind'),
+('紇', 'fringe'),
+('紇', 'inferior silk'),
+('紇', 'silk'),
+('紇', 'tassel'),
+('紇', 'tie'),
+('紈', 'fine silk'),
+('紈', 'gauze'),
+('紈', 'white silk'),
+('紊', 'confused'),
+('紊', 'disorder'),
+('紋', 'figure'),
+('紋', 'line'),
+('紋', 'streak'),
+('紋', 'stripe'),
+('紋', 'wrinkle'),
+('納', 'accept'),
+('納', 'admit'),
+('納', 'pay'),
+('納', 'receive'),
+('納', 'take'),
+('紐', 'button'),
+('紐', 'handle'),
+('紐', 'knob'),
+('紐', 'knot'),
+('紐', 'tie'),
+('紓', 'extricate'),
+('紓', 'loosen'),
+('紓', 'relax'),
+('紓', 'relieve'),
+('純', 'clean'),
+('純', 'innocence'),
+('純', 'pure'),
+('純', 'simple'),
+('紕', 'hem of dress'),
+('紕', 'mista'),
+('紕', 'spoiled silk'),
+('紗', 'gauze'),
+('紗', 'thin silk'),
+('紗', 'thread'),
+('紗', 'yarn'),
+('紘', 'expansive'),
+('紘', 'string'),
+('紘', 'vast'),
+('紙', 'paper'),
+('級', 'class'),
+('級', 'grade'),
+('級', 'level'),
+('級', 'rank'),
+('紛', 'disorderly'),
+('紛', 'in disorder'),
+('紛', 'scattered'),
+('紛', 'tangled'),
+('紜', 'confused'),
+('紜', 'in disorder'),
+('紜', 'numerous'),
+('素', 'basis'),
+('素', 'element'),
+('素', 'formerly'),
+('素', 'normally'),
+('素', 'plain'),
+('素', 'vegetarian'),
+('素', 'white'),
+('素', 'white(silk)'),
+('紡', 'reel'),
+('紡', 'reeled pongee'),
+('紡', 'spin'),
+('紡', 'weave'),
+('索', 'cable'),
+('索', 'demand'),
+('索', 'inquire'),
+('索', 'isolated'),
+('索', 'large rope'),
+('索', 'laws'),
+('索', 'request'),
+('索', 'rope'),
+('索', 'rules'),
+('索', 'search'),
+('索', 'to demand'),
+('索', 'to exact'),
+('索', 'to search'),
+('紫', 'amethyst'),
+('紫', 'purple'),
+('紫', 'surname'),
+('紫', 'violet'),
+('紬', 'kind of thin silk'),
+('紮', 'bind'),
+('紮', 'fasten'),
+('紮', 'tie'),
+('累', 'bother'),
+('累', 'implicate'),
+('累', 'involve'),
+('累', 'tired'),
+('細', 'fine'),
+('細', 'slender'),
+('細', 'thin'),
+('細', 'tiny'),
+('紱', 'ribbon or cord used attach ornaments'),
+('紲', 'bridle'),
+('紲', 'halter'),
+('紳', 'bind'),
+('紳', 'gentry'),
+('紳', 'girdle'),
+('紳', 'tie'),
+('紵', 'ramie'),
+('紵', 'sack cloth'),
+('紹', 'carry on'),
+('紹', 'continue'),
+('紹', 'hand down'),
+('紹', 'to join'),
+('紺', 'blue'),
+('紺', 'dark'),
+('紺', 'dark blue or reddish color'),
+('紺', 'navy'),
+('紼', '동아줄'),
+('絀', 'decline'),
+('絀', 'refuse'),
+('絀', 'sew'),
+('終', 'end'),
+('終', 'finally'),
+('終', 'finish'),
+('終', 'in the end'),
+('絃', 'string on musical instrument'),
+('組', 'class'),
+('組', 'department'),
+('組', 'section'),
+('絅', 'dust coat'),
+('絅', 'unlined garment'),
+('絆', 'bond'),
+('絆', 'catch'),
+('絆', 'fetter'),
+('絆', 'loop'),
+('絆', 'shackle'),
+('絉', 'skill, talent'),
+('経', 'classic works'),
+('経', 'pass through'),
+('絍', 'to lay the warp'),
+('絍', 'to weave'),
+('結', 'connect'),
+('結', 'join'),
+('結', 'knot'),
+('結', 'result'),
+('結', 'tie'),
+('絓', '걸리다'),
+('絕', 'break off'),
+('絕', 'cut'),
+('絕', 'sever'),
+('絕', 'terminate'),
+('絖', 'fine silks'),
+('絖', 'floss'),
+('絛', 'sash'),
+('絛', 'silk braid'),
+('絜', 'a marking line'),
+('絜', 'ascertain'),
+('絜', 'assess'),
+('絜', 'measure'),
+('絞', 'intertwine'),
+('絞', 'twist'),
+('絞', 'winch'),
+('絞', 'wring'),
+('絡', 'around'),
+('絡', 'enmesh'),
+('絡', 'net'),
+('絡', 'web'),
+('絡', 'wrap'),
+('絡', 'wrap around'),
+('絢', 'adorned'),
+('絢', 'brilliant'),
+('絢', 'variegated'),
+('絣', 'to baste for sewing'),
+('絣', 'to connect'),
+('給', 'by'),
+('給', 'for'),
+('給', 'give'),
+('絨', 'cotton'),
+('絨', 'or woolen fabric'),
+('絨', 'silk'),
+('絪', 'aura'),
+('絪', 'cloudy'),
+('絪', 'coverlet'),
+('絪', 'matting'),
+('絮', 'raw silk or cotton'),
+('絮', 'waste cotton'),
+('絰', 'white hempen cloth worn by mourners'),
+('統', 'command'),
+('統', 'control'),
+('統', 'govern'),
+('統', 'unite'),
+('絲', 'fine thread'),
+('絲', 'silk'),
+('絲', 'strings'),
+('絲', 'thread'),
+('絲', 'wire'),
+('絲', '명주'),
+('絲', '실'),
+('絳', 'deep red'),
+('絳', 'river in Shanxi provinc'),
+('絶', 'cut'),
+('絶', 'end'),
+('絹', 'kind of thick stiff silk'),
+('絹', 'silk'),
+('絺', 'fine hemp fiber'),
+('絺', 'fine linen'),
+('絿', 'urgent'),
+('綃', 'raw silk fabric'),
+('綆', 'well rope'),
+('綈', '깁'),
+('綏', 'appease'),
+('綏', 'carriage harness'),
+('綏', 'pacify'),
+('綏', 'soothe'),
+('經', 'classic works'),
+('經', 'pass'),
+('經', 'pass through'),
+('經', 'sutra, a religious text'),
+('継', 'carry on'),
+('継', 'continue'),
+('継', 'maintain'),
+('続', 'carry on'),
+('続', 'continue'),
+('続', 'succeed'),
+('綜', 'arrange threads for weaving'),
+('綠', 'blue'),
+('綠', 'chlorine'),
+('綠', 'green'),
+('綢', 'satin damask'),
+('綢', 'silk cloth'),
+('綣', 'affectionate'),
+('綣', 'solicitous'),
+('綦', 'dark grey. variegated. superlative'),
+('綫', 'clue'),
+('綫', 'line'),
+('綫', 'thread'),
+('綫', 'wire'),
+('綬', 'silk ribbon attached as a seal'),
+('維', 'maintain'),
+('維', 'preserve'),
+('維', 'safeguard'),
+('綮', 'embroidered banner'),
+('綰', 'to bind up'),
+('綰', 'to string together'),
+('綱', 'hawser'),
+('綱', 'heavy rope'),
+('綱', 'main points'),
+('網', 'net'),
+('網', 'network'),
+('網', 'web'),
+('綳', 'a cloth to carry an infant on the back'),
+('綳', 'to bind'),
+('綳', 'to tie'),
+('綴', 'binding, a file'),
+('綴', 'connect'),
+('綴', 'join'),
+('綴', 'link'),
+('綴', 'patch together'),
+('綴', 'spell'),
+('綵', 'varicolored silk'),
+('綵', 'variegated'),
+('綸', 'green silk thread or tassel'),
+('綺', 'beautifu'),
+('綺', 'elegant'),
+('綺', 'fine thin silk'),
+('綻', 'burst'),
+('綻', 'crack'),
+('綻', 'rend'),
+('綻', 'ripped seam'),
+('綻', 'split'),
+('綽', 'delicate'),
+('綽', 'graceful'),
+('綽', 'spacious'),
+('綾', 'damask silk'),
+('綾', 'thin silk'),
+('綿', 'cotton'),
+('綿', 'cotton wad'),
+('綿', 'downy'),
+('綿', 'soft'),
+('綿', 'wad'),
+('綿', 'wool'),
+('緄', 'cord'),
+('緄', 'hem'),
+('緄', 'hemming'),
+('緄', 'woven belt'),
+('緇', 'black silk'),
+('緊', 'firm'),
+('緊', 'secure'),
+('緊', 'taut'),
+('緊', 'tense'),
+('緊', 'tight'),
+('緋', 'crimson'),
+('緋', 'dark red'),
+('緋', 'purpl'),
+('緋', 'red'),
+('緋', 'scarlet'),
+('緍', 'a fishing-line'),
+('緍', 'a paper or straw string'),
+('緍', 'cord'),
+('緍', 'string of coins'),
+('緍', 'variant of 緡'),
+('総', 'altogether'),
+('総', 'collect'),
+('総', 'overall'),
+('緑', 'chlorine'),
+('緑', 'green'),
+('緒', 'end of thread'),
+('緒', 'thread'),
+('緖', 'clue'),
+('緖', 'end of thread'),
+('緖', 'thread'),
+('緗', 'light-yellow color'),
+('緘', 'bind'),
+('緘', 'close'),
+('緘', 'letter'),
+('緘', 'seal'),
+('線', 'clue'),
+('線', 'line'),
+('線', 'thread'),
+('線', 'wire'),
+('緜', 'cotton wad'),
+('緜', 'downy'),
+('緜', 'soft'),
+('緜', 'wool'),
+('緝', 'to sew in close stitches'),
+('緞', 'satin'),
+('締', 'connect'),
+('締', 'connection'),
+('締', 'join'),
+('締', 'tie'),
+('緡', 'a fishing-line'),
+('緡', 'a paper or straw string'),
+('緡', 'cord'),
+('緡', 'string of coins'),
+('緣', 'cause'),
+('緣', 'fate'),
+('緣', 'hem'),
+('緣', 'karma'),
+('緣', 'margin'),
+('緣', 'reason'),
+('緦', 'coarse cotton cloth used for mourning'),
+('編', 'arrange'),
+('編', 'compile'),
+('編', 'knit'),
+('編', 'weave'),
+('緩', 'delay'),
+('緩', 'leisurely'),
+('緩', 'postpone'),
+('緩', 'slow'),
+('緩', 'to postpone'),
+('緬', 'distant'),
+('緬', 'remote'),
+('緬', 'think of'),
+('緯', 'parallels of latitude'),
+('緯', 'woof'),
+('緲', 'dim'),
+('緲', 'distant'),
+('緲', 'indistinct'),
+('緲', 'minute'),
+('練', 'drill'),
+('練', 'exercise'),
+('練', 'practice'),
+('練', 'train'),
+('緶', 'braid'),
+('緶', 'hem'),
+('緶', 'plait'),
+('緶', 'queue'),
+('緹', 'brown'),
+('緹', 'red'),
+('緹', 'reddish color'),
+('緻', 'delicate'),
+('緻', 'dense'),
+('緻', 'fine'),
+('緼', 'confused'),
+('緼', 'raveled silk'),
+('緼', 'tangled hemp'),
+('緼', 'vague'),
+('緼', 'variant of 縕'),
+('縁', 'hem'),
+('縂', 'altogether'),
+('縂', 'collect'),
+('縂', 'overall'),
+('縇', 'decoration'),
+('縈', 'coil'),
+('縈', 'entangle'),
+('縈', 'entwine'),
+('縉', 'red silk'),
+('縊', 'hang'),
+('縊', 'strangle'),
+('縋', 'climb down rope'),
+('縋', 'hang by rope'),
+('縐', 'crape'),
+('縐', 'creases'),
+('縐', 'crepe'),
+('縐', 'wrinkles'),
+('縑', 'fine silk'),
+('縕', 'confused'),
+('縕', 'raveled silk'),
+('縕', 'tangled hemp'),
+('縕', 'vague'),
+('縗', 'sackcloth worn on breast during'),
+('縛', 'tie'),
+('縛', 'to tie'),
+('縝', 'closely woven'),
+('縝', 'detailed'),
+('縝', 'fine'),
+('縞', 'white raw silk'),
+('縟', 'adorned'),
+('縟', 'decorative'),
+('縟', 'elegant'),
+('縠', 'crepe'),
+('縠', 'silk'),
+('縡', 'affair'),
+('縡', 'matter'),
+('縢', 'bind'),
+('縢', 'cord'),
+('縢', 'restrain'),
+('縢', 'tie up'),
+('縣', 'county'),
+('縣', 'district'),
+('縣', 'subdivision'),
+('縦', 'give free reign to'),
+('縦', 'indulge in'),
+('縫', 'mend'),
+('縫', 'sew'),
+('縫', 'something bad, some trouble'),
+('縮', 'contract'),
+('縮', 'draw in'),
+('縮', 'reduce'),
+('縯', 'long'),
+('縱', 'give free reign to'),
+('縱', 'indulge in'),
+('縲', 'a chain or rope used bind criminals'),
+('縳', 'wrap'),
+('縴', 'tow line'),
+('縵', 'plain'),
+('縵', 'plain silk'),
+('縵', 'simple'),
+('縶', 'bind'),
+('縶', 'tie'),
+('縶', '매다'),
+('縷', 'detailed'),
+('縷', 'precise'),
+('縷', 'thread'),
+('縹', 'dim'),
+('縹', 'light blue silk'),
+('縹', 'misty'),
+('縻', 'halter for ox'),
+('縻', 'harness'),
+('縻', 'tie up'),
+('總', 'altogether'),
+('總', 'collect'),
+('總', 'overall'),
+('績', 'achievements'),
+('績', 'spin'),
+('繁', 'cinch'),
+('繁', 'complex'),
+('繁', 'complicated'),
+('繁', 'difficult'),
+('繁', 'flourishing'),
+('繁', 'foliage'),
+('繁', 'girth'),
+('繁', 'lush'),
+('繁', 'luxurious'),
+('繁', 'saddle'),
+('繁', 'sash'),
+('繁', 'thicket'),
+('繁', 'white'),
+('繃', 'bind'),
+('繃', 'draw firmly'),
+('繃', 'strap'),
+('繄', 'alas'),
+('繄', 'be'),
+('繄', 'particle'),
+('繄', 'sigh'),
+('繅', 'compositions'),
+('繅', 'draw'),
+('繅', 'elegant'),
+('繅', 'elegant compositions'),
+('繅', 'reel silk from cocoons'),
+('繆', 'bind'),
+('繆', 'prepare'),
+('繆', 'wind around'),
+('繇', 'cause'),
+('繇', 'reason'),
+('繈', 'string of copper coins'),
+('繈', 'swaddling clothes'),
+('繊', 'delicate'),
+('繊', 'fine'),
+('繊', 'graceful'),
+('繊', 'minute'),
+('繋', 'attach'),
+('繋', 'connect'),
+('繋', 'fasten'),
+('繋', 'unite'),
+('繍', 'embroider'),
+('繍', 'embroidery'),
+('繍', 'ornament'),
+('繐', 'fine cloth'),
+('繒', 'silk fabrics'),
+('繒', 'surname'),
+('織', 'knit'),
+('織', 'organize'),
+('織', 'unite'),
+('織', 'weave'),
+('繕', 'mend'),
+('繕', 'repair'),
+('繕', 'rewrite'),
+('繕', 'transcribe'),
+('繖', 'parachute'),
+('繖', 'parasol'),
+('繖', 'umbrella'),
+('繙', 'flutter in the wind'),
+('繙', 'to flap'),
+('繙', 'to interpret'),
+('繚', 'bind'),
+('繚', 'rap around'),
+('繚', 'wind round'),
+('繞', 'entwine'),
+('繞', 'surround'),
+('繞', 'wind around'),
+('繡', 'embroider'),
+('繡', 'embroidery'),
+('繡', 'gorgeous'),
+('繡', 'ornament'),
+('繢', 'color'),
+('繢', 'draw'),
+('繢', 'embroider'),
+('繢', 'paint'),
+('繢', 'sketch'),
+('繤', 'edit'),
+('繦', 'string of copper coins'),
+('繦', 'swaddling'),
+('繩', 'cord'),
+('繩', 'measure'),
+('繩', 'restrain'),
+('繩', 'rope'),
+('繩', 'string'),
+('繪', 'draw'),
+('繪', 'drawing'),
+('繪', 'image'),
+('繪', 'paint'),
+('繪', 'painting'),
+('繪', 'picture'),
+('繪', 'sketch'),
+('繫', 'attach'),
+('繫', 'bind'),
+('繫', 'connect'),
+('繫', 'fasten'),
+('繫', 'unite'),
+('繭', 'blister'),
+('繭', 'callus'),
+('繭', 'cocoon'),
+('繯', 'bind'),
+('繯', 'hang death'),
+('繯', 'noose'),
+('繯', 'ring'),
+('繯', 'tie'),
+('繰', 'to reel silk from cocoons'),
+('繹', 'explain'),
+('繹', 'to interpret'),
+('繹', 'to unravel or unreel silk'),
+('繼', 'carry on'),
+('繼', 'continue'),
+('繼', 'inherit'),
+('繼', 'maintain'),
+('繼', 'persist'),
+('繽', 'abundant'),
+('繽', 'flourishing'),
+('繽', 'thriving'),
+('繾', 'attached to'),
+('繾', 'entangled'),
+('繾', 'inseparable'),
+('纁', 'afterglow'),
+('纁', 'light red'),
+('纁', 'pink'),
+('纁', 'shade of red'),
+('纁', '曛'),
+('纂', 'chignon'),
+('纂', 'compile'),
+('纂', 'edit'),
+('纂', 'topknot'),
+('纇', 'blemish'),
+('纇', 'flaw'),
+('纇', 'knot'),
+('纇', 'wicked'),
+('纈', 'patterned silk'),
+('纈', 'tie knot'),
+('纊', 'broad'),
+('纊', 'clothes'),
+('纊', 'cotton'),
+('纊', 'padded'),
+('纊', 'silk'),
+('纊', 'wide'),
+('纊', '曠'),
+('續', 'carry on'),
+('續', 'continuation'),
+('續', 'continue'),
+('續', 'succeed'),
+('纍', 'bind'),
+('纍', 'join'),
+('纍', 'link'),
+('纍', 'wind about'),
+('纏', 'bind'),
+('纏', 'tie'),
+('纏', 'wind around'),
+('纏', 'wrap'),
+('纓', 'a chin strap'),
+('纓', 'bother'),
+('纓', 'tassel'),
+('纓', 'to annoy'),
+('纔', 'ability'),
+('纔', 'just'),
+('纔', 'only'),
+('纔', 'talent'),
+('纖', 'delicate'),
+('纖', 'fine'),
+('纖', 'graceful'),
+('纖', 'minute'),
+('纘', 'carry on'),
+('纘', 'continue'),
+('纘', 'succeed'),
+('纚', 'tie'),
+('纚', 'twine'),
+('纚', 'twist'),
+('纛', 'a banner'),
+('纛', 'a streamer'),
+('纜', 'cable'),
+('纜', 'hawser'),
+('纜', 'heavy-duty rope'),
+('纮', 'expansive'),
+('纮', 'string'),
+('纮', 'vast'),
+('纻', 'ramie'),
+('纻', 'sack cloth'),
+('缊', 'confused'),
+('缊', 'raveled silk'),
+('缊', 'tangled hemp'),
+('缊', 'vague'),
+('缶', 'earthen crock or jar'),
+('缶', 'rad. 121'),
+('缷', 'lay down'),
+('缷', 'retire from office'),
+('缸', 'cistern'),
+('缸', 'crock'),
+('缸', 'earthen jug'),
+('缺', 'be short of'),
+('缺', 'deficit'),
+('缺', 'gap'),
+('缺', 'lack'),
+('缾', 'bottle'),
+('缾', 'jar'),
+('罃', 'long necked jar or bottle'),
+('罄', 'empty'),
+('罄', 'exhaust'),
+('罄', 'run out'),
+('罄', 'use up'),
+('罅', 'crack'),
+('罅', 'fissure'),
+('罅', 'split'),
+('罇', 'a bottle'),
+('罇', 'a goblet'),
+('罇', 'a wine-jar'),
+('罋', 'earthen jar'),
+('罋', 'jar for ashes'),
+('罌', 'long necked jar or bottle'),
+('罍', 'large earthenware wine jar'),
+('罎', 'a jug'),
+('罎', 'an earthenware jar'),
+('罐', 'jar'),
+('罐', 'jug'),
+('罐', 'pitcher'),
+('罐', 'pot'),
+('罔', 'deceive'),
+('罔', 'libel'),
+('罔', 'negative'),
+('罔', 'net'),
+('罕', 'rare'),
+('罕', 'scarce'),
+('罕', 'surname'),
+('罖', 'Kwukyel'),
+('罖', '라'),
+('罘', 'screen used in ancient times'),
+('罝', 'net for catching rabbits'),
+('罟', 'net'),
+('罟', 'pressure come or go'),
+('罟', 'snare'),
+('罠', 'animal trap'),
+('罡', 'the god who is supposed to live in them'),
+('罡', 'the name of a certain stars'),
+('罣', 'disturb'),
+('罣', 'hang'),
+('罣', 'hinder'),
+('罣', 'obstruct'),
+('罣', 'suspend'),
+('罦', 'net'),
+('罨', 'fish net'),
+('罨', 'medical compress'),
+('罪', 'crime'),
+('罪', 'evil'),
+('罪', 'fault'),
+('罪', 'hardship'),
+('罪', 'sin'),
+('罪', 'vice'),
+('罫', 'hinder'),
+('罫', 'roost'),
+('置', 'lay out'),
+('置', 'place'),
+('置', 'set aside'),
+('罰', 'fine'),
+('罰', 'penalize'),
+('罰', 'penalty'),
+('罰', 'punish'),
+('罰', 'punishment'),
+('署', 'public office'),
+('罵', 'accuse'),
+('罵', 'blame'),
+('罵', 'curse'),
+('罵', 'scold'),
+('罷', 'cease'),
+('罷', 'finish'),
+('罷', 'give up'),
+('罷', 'stop'),
+('罸', 'fine'),
+('罸', 'penalize'),
+('罸', 'penalty'),
+('罸', 'punish'),
+('罹', 'experience'),
+('罹', 'grief'),
+('罹', 'hit'),
+('罹', 'incur'),
+('罹', 'meet with'),
+('罹', 'sorrow'),
+('罹', 'suffer'),
+('罽', 'a kind of woolen fabric'),
+('罾', 'a large square net'),
+('罾', 'lowered and raised from the bank of the river'),
+('羂', 'snare'),
+('羂', 'to trap'),
+('羅', 'fabric'),
+('羅', 'gauze'),
+('羅', 'net'),
+('羅', 'net for catching birds'),
+('羆', 'brown bear'),
+('羆', 'ursus arctos'),
+('羆', '말곰'),
+('羇', 'inn'),
+('羇', 'lodge'),
+('羇', 'travel'),
+('羈', 'control'),
+('羈', 'halter'),
+('羈', 'hold'),
+('羈', 'restrain'),
+('羊', 'KangXi radical 123'),
+('羊', 'goat'),
+('羊', 'sheep'),
+('羋', 'bleat of sheep'),
+('羋', 'surname'),
+('羌', 'Qiang nationality'),
+('羌', 'surname'),
+('美', 'America'),
+('美', 'USA'),
+('美', 'beautiful'),
+('美', 'beauty'),
+('美', 'pleasing'),
+('美', 'pretty'),
+('羔', 'kid'),
+('羔', 'lamb'),
+('羖', 'a black ram'),
+('羗', 'a particle'),
+('羗', 'educated'),
+('羗', 'obstinate'),
+('羗', 'strong'),
+('羗', 'tribes in West China'),
+('羘', 'ram'),
+('羚', 'species of antelope'),
+('羜', 'lamb'),
+('羜', 'lambkin'),
+('羜', '새끼 양'),
+('羝', 'he-goat'),
+('羝', 'ram'),
+('羞', 'ashamed'),
+('羞', 'disgrace'),
+('羞', 'shame'),
+('羞', 'shy'),
+('羡', 'admire'),
+('羡', 'covet'),
+('羡', 'envy'),
+('羡', 'praise'),
+('羣', 'crowd'),
+('羣', 'group'),
+('羣', 'mob'),
+('羣', 'multitude'),
+('群', '(same as  羣) group'),
+('群', 'assemble'),
+('群', 'crowd'),
+('群', 'flock'),
+('群', 'folk'),
+('群', 'gather'),
+('群', 'group'),
+('群', 'herd'),
+('群', 'horde'),
+('群', 'mob'),
+('群', 'multitude'),
+('群', 'people'),
+('群', 'むれ'),
+('群', 'むれる'),
+('群', '群れ'),
+('群', '群れる'),
+('群', '많을'),
+('群', '무리'),
+('群', '질'),
+('羨', 'admire'),
+('羨', 'covet'),
+('羨', 'envious'),
+('羨', 'envy'),
+('羨', 'grave'),
+('羨', 'praise'),
+('羨', 'road'),
+('義', 'conduct'),
+('義', 'justice'),
+('義', 'morality'),
+('義', 'right'),
+('義', 'right conduct'),
+('義', 'righteousness'),
+('羫', 'the skeleton of a sheep'),
+('羯', 'castrated ram'),
+('羯', 'deer skin'),
+('羯', 'wether'),
+('羲', 'ancient emperor'),
+('羲', 'breath'),
+('羲', 'vapor'),
+('羶', 'rank odor'),
+('羸', 'emaciated'),
+('羸', 'exhausted'),
+('羸', 'lean'),
+('羸', 'weak'),
+('羹', 'broth'),
+('羹', 'soup'),
+('羽', 'feather'),
+('羽', 'plume'),
+('羽', 'rad. 124'),
+('羽', 'wings'),
+('羿', 'Chinese'),
+('羿', 'archer'),
+('羿', 'mythology'),
+('翁', 'father'),
+('翁', 'father-in-law'),
+('翁', 'old man'),
+('翅', 'fin'),
+('翅', 'wings'),
+('翊', 'assist'),
+('翊', 'flying'),
+('翊', 'help'),
+('翊', 'respect'),
+('翌', 'bright'),
+('翌', 'dawn'),
+('翌', 'day'),
+('翌', 'daybreak'),
+('翌', 'next'),
+('翌', 'the next day'),
+('翎', 'feather'),
+('翎', 'plume'),
+('翎', 'wing'),
+('習', 'flapping wings'),
+('習', 'practice'),
+('翔', 'detailed'),
+('翔', 'glide'),
+('翔', 'hover'),
+('翔', 'soar'),
+('翕', 'agree'),
+('翖', 'ksc extension 3108'),
+('翛', 'bedraggled'),
+('翛', 'hasty'),
+('翛', 'look of rumpled feathers'),
+('翛', 'rapid flight'),
+('翛', 'swift'),
+('翟', 'a kind of pheasant'),
+('翟', 'plumes'),
+('翟', 'surname'),
+('翠', 'color green'),
+('翠', 'kingfisher'),
+('翡', 'emerald'),
+('翡', 'jade'),
+('翡', 'kingfisher'),
+('翣', 'feathers used decorate coffin'),
+('翣', 'large wooden fan'),
+('翦', 'annhilate'),
+('翦', 'clip'),
+('翦', 'cut'),
+('翦', 'scissors'),
+('翩', 'flutter'),
+('翩', 'fly'),
+('翫', 'a legendary archer'),
+('翫', 'careless'),
+('翫', 'play'),
+('翬', 'pheasant'),
+('翬', 'to fly'),
+('翬', 'variegated'),
+('翮', 'quill'),
+('翮', 'stem of feather'),
+('翰', 'pen'),
+('翰', 'pencil'),
+('翰', 'writing brush'),
+('翱', 'roam'),
+('翱', 'soar'),
+('翳', 'screen'),
+('翳', 'shade'),
+('翳', 'to hide'),
+('翹', 'elevate'),
+('翹', 'lift'),
+('翹', 'raise'),
+('翹', 'turn up'),
+('翺', 'roam'),
+('翺', 'soar'),
+('翻', 'capsize'),
+('翻', 'flip over'),
+('翻', 'flutter'),
+('翻', 'fly'),
+('翻', 'upset'),
+('翼', 'fin'),
+('翼', 'fins on fish'),
+('翼', 'shelter'),
+('翼', 'wings'),
+('翾', 'fly'),
+('翾', 'to flit'),
+('耀', 'dazzle'),
+('耀', 'glory'),
+('耀', 'shine'),
+('耀', 'sparkle'),
+('老', 'aged'),
+('老', 'experienced'),
+('老', 'old'),
+('考', 'assess'),
+('考', 'consider'),
+('考', 'examine'),
+('考', 'investigate'),
+('考', 'study'),
+('考', 'test'),
+('考', 'think'),
+('耄', 'elderly person'),
+('耄', 'senile'),
+('耄', 'very old'),
+('者', 'he who'),
+('者', 'person'),
+('者', 'that which'),
+('者', 'those who'),
+('耆', 'aged'),
+('耆', 'man of sixty'),
+('耆', 'old'),
+('耇', 'wrinkled face of the elderly'),
+('耈', 'old age'),
+('耉', 'old age'),
+('而', 'and'),
+('而', 'and then'),
+('而', 'and yet'),
+('而', 'but'),
+('耐', 'bear'),
+('耐', 'endure'),
+('耐', 'patient'),
+('耐', 'resist'),
+('耑', 'concentrated'),
+('耑', 'end'),
+('耑', 'limit'),
+('耑', 'specialized'),
+('耒', 'handle of plow'),
+('耒', 'plow'),
+('耒', 'rad. 127'),
+('耔', 'to hoe up the earth around plants'),
+('耕', 'cultivate'),
+('耕', 'plow'),
+('耗', 'consume'),
+('耗', 'decrease'),
+('耗', 'squander'),
+('耗', 'use up'),
+('耗', 'waste'),
+('耘', 'weed'),
+('耙', 'harrow'),
+('耙', 'rake'),
+('耞', 'flail'),
+('耡', 'hoe'),
+('耦', 'plow side by side'),
+('耦', 'team of two'),
+('耨', 'hoe'),
+('耨', 'rake'),
+('耨', 'weed'),
+('耬', 'drill for sowing grain'),
+('耭', 'cultivate'),
+('耭', 'plow'),
+('耰', 'toothless rake for drawing earth over newly sown grain'),
+('耳', 'ear'),
+('耳', 'handle'),
+('耳', 'merely'),
+('耳', 'only'),
+('耶', 'used in transliteration'),
+('耻', 'ashamed'),
+('耻', 'humiliation'),
+('耻', 'shame'),
+('耽', 'be negligent'),
+('耽', 'indulge in'),
+('耿', 'bright'),
+('耿', 'have guts'),
+('耿', 'shining'),
+('聀', '職'),
+('聃', 'a personal name'),
+('聃', 'ears without rims'),
+('聆', 'hear'),
+('聆', 'listen'),
+('聊', 'at least'),
+('聊', 'slightly'),
+('聊', 'somewhat'),
+('聒', 'clamor'),
+('聒', 'din'),
+('聒', 'hubbub'),
+('聖', 'holy'),
+('聖', 'sacred'),
+('聖', 'sage'),
+('聖', 'saint'),
+('聘', 'betroth'),
+('聘', 'employ'),
+('聘', 'engage'),
+('聚', 'assemble'),
+('聚', 'collect'),
+('聚', 'meet together'),
+('聞', 'hear'),
+('聞', 'make known'),
+('聞', 'news'),
+('聞', 'smell'),
+('聫', 'ally'),
+('聫', 'associate'),
+('聫', 'connect'),
+('聫', 'join'),
+('聮', 'ally'),
+('聮', 'associate'),
+('聮', 'connect'),
+('聮', 'join'),
+('聯', 'ally'),
+('聯', 'associate'),
+('聯', 'connect'),
+('聯', 'join'),
+('聰', 'bright'),
+('聰', 'clever'),
+('聰', 'intelligent'),
+('聱', 'bent and twisted'),
+('聱', 'too complicated'),
+('聲', 'music'),
+('聲', 'noise'),
+('聲', 'sound'),
+('聲', 'tone'),
+('聲', 'voice'),
+('聳', 'excite'),
+('聳', 'lofty'),
+('聳', 'rise up'),
+('聳', 'stir'),
+('聳', 'to raise up'),
+('聳', 'urge on'),
+('聴', 'hear'),
+('聴', 'listen'),
+('聴', 'obey'),
+('聴', 'understand'),
+('聵', 'deaf'),
+('聶', 'surname'),
+('聶', 'whisper'),
+('職', 'duty'),
+('職', 'office'),
+('職', 'post'),
+('職', 'profession'),
+('聼', 'hear'),
+('聼', 'listen'),
+('聼', 'obey'),
+('聼', 'understand'),
+('聽', 'hear'),
+('聽', 'listen'),
+('聽', 'obey'),
+('聽', 'understand'),
+('聾', 'deaf'),
+('聿', 'brush'),
+('聿', 'paint'),
+('聿', 'pencil'),
+('聿', 'thereupon'),
+('聿', 'writing'),
+('聿', 'writing brush'),
+('肄', 'learn'),
+('肄', 'practice'),
+('肄', 'study'),
+('肄', 'toil'),
+('肅', 'pay respects'),
+('肅', 'reverently'),
+('肆', 'excess'),
+('肆', 'indulge'),
+('肆', 'numeral four'),
+('肆', 'particle meaning now'),
+('肆', 'shop'),
+('肆', 'therefore'),
+('肇', 'begin'),
+('肇', 'commence'),
+('肇', 'originate'),
+('肉', 'KangXi radical 130'),
+('肉', 'flesh'),
+('肉', 'meat'),
+('肋', 'chest'),
+('肋', 'rib'),
+('肋', 'ribs'),
+('肌', 'meat on bones'),
+('肌', 'muscle tissue'),
+('肓', 'region between heart and diaphragm'),
+('肖', 'be like'),
+('肖', 'look like'),
+('肖', 'resemble'),
+('肘', 'elbow'),
+('肘', 'help a person shoulder a load'),
+('肘', 'the elbow'),
+('肚', 'abdomen'),
+('肚', 'belly'),
+('肚', 'bowels'),
+('肛', 'anus'),
+('肝', 'liver'),
+('股', 'haunches'),
+('股', 'rump'),
+('股', 'share'),
+('股', 'thigh'),
+('股', 'thighs'),
+('肢', 'animal feet'),
+('肢', 'human limbs'),
+('肢', 'limb'),
+('肥', 'fat'),
+('肥', 'fertile'),
+('肥', 'obese'),
+('肥', 'plump'),
+('肦', 'high'),
+('肦', 'large head'),
+('肦', 'many'),
+('肦', 'to distribute'),
+('肦', 'to divide'),
+('肩', 'bear'),
+('肩', 'shoulder'),
+('肩', 'shoulders'),
+('肩', 'to shoulder'),
+('肪', 'animal fat'),
+('肫', 'fowl'),
+('肫', 'gizzard'),
+('肫', 'honest'),
+('肫', 'sincere'),
+('肫', 'the gizzard of a fowl'),
+('肭', 'fat'),
+('肭', 'seal(moon radical DKW: 14342 is different)'),
+('肯', 'consent'),
+('肯', 'consent to'),
+('肯', 'permit'),
+('肯', 'willing'),
+('肱', 'forearm'),
+('育', 'educate'),
+('育', 'give birth to'),
+('育', 'produce'),
+('育', 'raise'),
+('肴', 'cooked or prepared meat'),
+('肵', 'table'),
+('肺', 'lung'),
+('肺', 'lungs'),
+('肺', 'lungs (animal anatomy, bellows (things like lungs)'),
+('胃', 'gizzard of fowl'),
+('胃', 'stomach'),
+('胄', 'descendant'),
+('胄', 'headpiece'),
+('胄', 'helmet'),
+('胆', 'bravery'),
+('胆', 'courage'),
+('胆', 'gall bladder'),
+('胊', 'yoke'),
+('背', 'back'),
+('背', 'back side'),
+('背', 'behind'),
+('背', 'betray'),
+('背', 'betrayal'),
+('胎', 'embryo'),
+('胎', 'fetus'),
+('胎', 'unborn child'),
+('胎', 'uterus'),
+('胖', 'fat'),
+('胖', 'fatty'),
+('胖', 'obese'),
+('胙', 'meat offered in sacrifice to ones ancestors'),
+('胚', 'embryo'),
+('胚', 'unfinished things'),
+('胛', 'shoulder blade'),
+('胛', 'the shoulder'),
+('胞', 'cell'),
+('胞', 'fetal membrane'),
+('胞', 'placenta'),
+('胞', 'womb'),
+('胠', 'armpit'),
+('胠', 'open'),
+('胠', 'throw away'),
+('胡', 'foolishly'),
+('胡', 'recklessly'),
+('胡', 'wildly'),
+('胤', 'heir'),
+('胤', 'posterity'),
+('胤', 'progeny'),
+('胤', 'successor'),
+('胥', 'all'),
+('胥', 'mutually'),
+('胥', 'together'),
+('胯', 'groin'),
+('胯', 'pelvis'),
+('胯', 'thighs'),
+('胱', 'bladder'),
+('胴', 'the body'),
+('胴', 'the large intestine'),
+('胷', 'breast'),
+('胷', 'chest'),
+('胷', 'clamor'),
+('胷', 'thorax'),
+('胸', 'bosom'),
+('胸', 'box'),
+('胸', 'breast'),
+('胸', 'chest'),
+('胸', 'thorax'),
+('胼', 'callus'),
+('胼', 'calluses'),
+('能', 'ability'),
+('能', 'can'),
+('能', 'endure'),
+('能', 'permitted to'),
+('能', 'to be able'),
+('能', 'withstand'),
+('胾', 'minced meat'),
+('胾', 'to cut meat into pieces'),
+('脂', 'fat'),
+('脂', 'grease'),
+('脂', 'lard'),
+('脅', 'armpits'),
+('脅', 'flank'),
+('脅', 'ribs'),
+('脅', 'threaten'),
+('脆', 'brittle'),
+('脆', 'crisp'),
+('脆', 'fragile'),
+('脆', 'frail'),
+('脇', 'armpits'),
+('脇', 'flank'),
+('脇', 'ribs'),
+('脇', 'threaten'),
+('脈', 'arteries'),
+('脈', 'blood vessels'),
+('脈', 'power or strength'),
+('脈', 'pulse'),
+('脈', 'vein'),
+('脈', 'veins'),
+('脉', 'arteries'),
+('脉', 'blood vessels'),
+('脉', 'veins'),
+('脊', 'backbone'),
+('脊', 'ridge'),
+('脊', 'spine'),
+('脖', 'neck'),
+('脘', 'internal cavity of stomach'),
+('脚', 'base'),
+('脚', 'foot'),
+('脚', 'foundation'),
+('脚', 'leg'),
+('脛', 'calf of leg'),
+('脛', 'shinbone'),
+('脣', 'lip'),
+('脣', 'lips'),
+('脤', 'raw meat for sacrifice'),
+('脧', 'contract > exploit'),
+('脧', 'reduce'),
+('脧', 'reproductive organ of infant'),
+('脩', 'dried meat(used as teachers payment in ancient times)'),
+('脫', 'peel off'),
+('脫', 'strip'),
+('脫', 'take off'),
+('脯', 'dried'),
+('脯', 'dried meat'),
+('脯', 'meat'),
+('脯', 'preserved fruits'),
+('脰', 'the neck'),
+('脱', 'take off'),
+('脳', 'brain'),
+('脵', 'haunches'),
+('脵', 'rump'),
+('脵', 'share'),
+('脵', 'thighs'),
+('脹', 'expand'),
+('脹', 'inflate'),
+('脹', 'swell'),
+('脾', 'disposition'),
+('脾', 'pancreas'),
+('脾', 'spleen'),
+('腁', 'callus'),
+('腆', 'good'),
+('腆', 'prosperous'),
+('腆', 'protruding'),
+('腊', 'dried meat'),
+('腊', 'year end sacrifice'),
+('腋', 'armpit'),
+('腎', 'gizzard'),
+('腎', 'kidney'),
+('腎', 'kidneys'),
+('腎', 'testes'),
+('腐', 'decay'),
+('腐', 'rot'),
+('腐', 'rotten'),
+('腐', 'spoil'),
+('腑', 'bowel'),
+('腑', 'bowels'),
+('腑', 'entrails'),
+('腑', 'internal organs'),
+('腑', 'six'),
+('腑', 'viscera'),
+('腒', 'game'),
+('腓', 'avoid'),
+('腓', 'be ill'),
+('腓', 'calf'),
+('腓', 'wither'),
+('腔', 'atrium, cavity'),
+('腔', 'body'),
+('腔', 'cavity'),
+('腔', 'chest cavity'),
+('腔', 'hollow'),
+('腔', 'hollow in body'),
+('腕', 'arm'),
+('腕', 'wrist'),
+('腟', 'vagina'),
+('腠', 'between the skin and the flesh'),
+('腥', 'rank'),
+('腥', 'raw meat'),
+('腥', 'strong-smelling'),
+('腦', 'brain'),
+('腫', 'swell'),
+('腫', 'swelling'),
+('腫', 'swollen'),
+('腫', 'tumour'),
+('腭', 'palate'),
+('腭', 'roof of mouth'),
+('腰', 'hip'),
+('腰', 'kidney'),
+('腰', 'waist'),
+('腱', 'tendons'),
+('腴', 'fat'),
+('腴', 'fertile'),
+('腴', 'plump'),
+('腴', 'rich'),
+('腴', 'soft'),
+('腶', 'meat'),
+('腷', 'melancholy'),
+('腷', 'stuffy'),
+('腷', 'suffocating'),
+('腸', 'emotions'),
+('腸', 'intestine'),
+('腸', 'intestines'),
+('腸', 'sausage'),
+('腹', 'abdomen'),
+('腹', 'belly'),
+('腹', 'inside'),
+('腹', 'stomach'),
+('腺', 'anatomy'),
+('腺', 'gland'),
+('腾', 'fly'),
+('腾', 'gallop'),
+('腾', 'prance'),
+('腾', 'rise'),
+('腾', 'run'),
+('腿', 'legs'),
+('腿', 'thigh'),
+('腿', 'thighs'),
+('膀', 'bladder'),
+('膀', 'shoulder'),
+('膀', 'upper arm'),
+('膀', 'wing'),
+('膂', 'backbone'),
+('膂', 'spinal column'),
+('膃', 'fat'),
+('膄', 'to become emaciated'),
+('膆', 'fat'),
+('膆', 'the corp of a bird or fowl'),
+('膈', 'diaphragm'),
+('膊', 'shoulders'),
+('膊', 'upper arms'),
+('膋', 'fat'),
+('膏', 'fat'),
+('膏', 'grease'),
+('膏', 'ointment'),
+('膏', 'paste'),
+('膕', 'bow'),
+('膕', 'corner'),
+('膕', 'elbow'),
+('膕', 'hollow'),
+('膕', 'knee'),
+('膘', 'fat'),
+('膘', 'rump'),
+('膚', 'shallow'),
+('膚', 'skin'),
+('膚', 'superficial'),
+('膜', 'film'),
+('膜', 'membrane'),
+('膜', 'to kneel and worship'),
+('膝', 'knee'),
+('膠', 'glue'),
+('膠', 'gum'),
+('膠', 'resin'),
+('膠', 'rubber'),
+('膣', 'vagina'),
+('膨', 'bloated'),
+('膨', 'inflated'),
+('膨', 'swollen'),
+('膨', 'to swell'),
+('膩', 'dirty'),
+('膩', 'greasy'),
+('膩', 'oily'),
+('膩', 'smooth'),
+('膰', 'to cook meat for a sacrifice or offering'),
+('膳', 'board'),
+('膳', 'gift'),
+('膳', 'meal'),
+('膳', 'meals'),
+('膳', 'present'),
+('膳', 'provisions'),
+('膴', 'fine'),
+('膵', 'pancreas'),
+('膺', 'bear'),
+('膺', 'breast'),
+('膺', 'breasts'),
+('膺', 'chest'),
+('膺', 'undertake'),
+('膽', 'bravery'),
+('膽', 'courage'),
+('膽', 'gall bladder'),
+('膽', 'nerve'),
+('膾', 'fish'),
+('膾', 'meat'),
+('膾', 'minced meat or fish'),
+('膾', 'sliced, raw fish (sushi)'),
+('膿', 'pus'),
+('臀', 'buttock'),
+('臀', 'buttocks'),
+('臂', 'arm'),
+('臆', 'bosom'),
+('臆', 'breast'),
+('臆', 'chest'),
+('臆', 'thought'),
+('臉', 'cheek'),
+('臉', 'face'),
+('臊', 'bashful'),
+('臊', 'fetid'),
+('臊', 'frowzy'),
+('臊', 'rancid'),
+('臊', 'rank'),
+('臍', 'abdominal area of crab'),
+('臍', 'navel'),
+('臏', 'kneecap'),
+('臏', 'the kneecap'),
+('臑', 'soft'),
+('臓', 'internal organs'),
+('臓', 'viscera'),
+('臘', 'dried meat'),
+('臘', 'year end sacrifice'),
+('臙', 'cosmetics'),
+('臙', 'rouge'),
+('臚', 'arrange in order'),
+('臚', 'display'),
+('臝', 'be bare'),
+('臝', 'nude'),
+('臟', 'internal organs'),
+('臟', 'viscera'),
+('臠', 'sliced meat'),
+('臠', 'small lump of meat'),
+('臣', 'minister'),
+('臣', 'official'),
+('臣', 'serves'),
+('臣', 'statesman'),
+('臤', 'hard'),
+('臤', 'wise'),
+('臥', 'crouch'),
+('臥', 'lie down'),
+('臧', 'command'),
+('臧', 'generous'),
+('臧', 'good'),
+('臧', 'right'),
+('臨', 'approach'),
+('臨', 'descend'),
+('臨', 'draw near'),
+('自', 'from'),
+('自', 'personal'),
+('自', 'private'),
+('自', 'self'),
+('臬', 'door post'),
+('臬', 'law'),
+('臬', 'rule'),
+('臭', 'emit foul odor'),
+('臭', 'smell'),
+('臭', 'stink'),
+('至', 'arrive'),
+('至', 'extremely'),
+('至', 'reach'),
+('至', 'very'),
+('致', 'cause'),
+('致', 'deliver'),
+('致', 'in'),
+('致', 'present'),
+('致', 'reach'),
+('致', 'result'),
+('致', 'send'),
+('臺', 'lookout'),
+('臺', 'platform'),
+('臺', 's'),
+('臺', 'stage'),
+('臺', 'tower'),
+('臻', 'arrive'),
+('臻', 'reach'),
+('臻', 'superior'),
+('臻', 'utmost'),
+('臼', 'bone joint socket'),
+('臼', 'mortar'),
+('臽', 'hole'),
+('臽', 'hollow'),
+('臽', 'pit'),
+('臾', 'instant'),
+('臾', 'moment'),
+('臾', 'short while'),
+('舁', 'carry on ones shoulder'),
+('舂', 'grind in mortar'),
+('舃', 'a shoe'),
+('舃', 'magpie'),
+('舃', 'the sole of a shoe'),
+('舄', 'a shoe'),
+('舄', 'magpie'),
+('舄', 'the sole of a shoe'),
+('舅', 'mothers brother'),
+('舅', 'uncle'),
+('與', 'and'),
+('與', 'for'),
+('與', 'give'),
+('與', 'grant'),
+('與', 'participate'),
+('與', 'to'),
+('與', 'with'),
+('興', 'excitement'),
+('興', 'flourish'),
+('興', 'fun'),
+('興', 'get up'),
+('興', 'interest'),
+('興', 'joy'),
+('興', 'pleasure'),
+('興', 'prosper'),
+('興', 'rise'),
+('興', 'thrive'),
+('舊', 'ancient'),
+('舊', 'former'),
+('舊', 'old'),
+('舊', 'past'),
+('舌', 'KangXi radical 135'),
+('舌', 'clapper of bell'),
+('舌', 'tongue'),
+('舍', 'dwell'),
+('舍', 'dwelling'),
+('舍', 'house'),
+('舍', 'reside'),
+('舍', 'residence'),
+('舐', 'lick with tongue'),
+('舒', 'comfortable'),
+('舒', 'easy'),
+('舒', 'open up'),
+('舒', 'stretch out'),
+('舒', 'unfold'),
+('舖', 'shop'),
+('舖', 'store'),
+('舘', 'a building'),
+('舘', 'a mansion'),
+('舛', 'be contrary to'),
+('舛', 'deviate'),
+('舛', 'oppose'),
+('舜', 'legendary ruler'),
+('舞', 'brandish'),
+('舞', 'dance'),
+('舞', 'posture'),
+('舞', 'prance'),
+('舟', 'KangXi radical 137'),
+('舟', 'boat'),
+('舟', 'ship'),
+('舡', 'boat'),
+('舡', 'ship'),
+('航', 'boat'),
+('航', 'navigate'),
+('航', 'sail'),
+('航', 'ship'),
+('舫', 'fancy boat'),
+('舫', 'yacht'),
+('般', 'category'),
+('般', 'general'),
+('般', 'kind'),
+('般', 'manner'),
+('般', 'similar'),
+('般', 'sort'),
+('舳', 'stern of ship'),
+('舵', 'helm'),
+('舵', 'rudder'),
+('舵', 'tiller'),
+('舶', 'large'),
+('舶', 'ocean-going vessel'),
+('舷', 'a gunwale'),
+('舷', 'boat'),
+('舷', 'bulwarks'),
+('舷', 'side'),
+('舷', 'the sides of a boat'),
+('舸', 'barge'),
+('舸', 'large boat'),
+('船', 'boat'),
+('船', 'ship'),
+('船', 'vessel'),
+('艀', 'a sampan'),
+('艀', 'barge'),
+('艀', 'lighter'),
+('艅', 'a despatch boat'),
+('艇', 'dugout'),
+('艇', 'punt'),
+('艇', 'small boat'),
+('艑', 'small boat'),
+('艘', 'counter for ships'),
+('艘', 'vessels'),
+('艙', 'cabin'),
+('艙', 'hold of ship'),
+('艚', 'ship'),
+('艟', 'ancient warship'),
+('艤', 'to moor a boat to the bank'),
+('艦', 'warship'),
+('艨', 'long and narrow war-boat'),
+('艪', 'oar'),
+('艪', 'row'),
+('艪', 'scull'),
+('艫', 'bow or prow of boat'),
+('艮', 'cease'),
+('艮', 'drag'),
+('艮', 'draw'),
+('艮', 'pull'),
+('艮', 'seventh of eight diagrams'),
+('艮', 'silver'),
+('艮', 'stop'),
+('良', 'good'),
+('良', 'respectable'),
+('良', 'virtuous'),
+('艱', 'difficult'),
+('艱', 'distressing'),
+('艱', 'hard'),
+('色', 'beauty'),
+('色', 'body'),
+('色', 'color'),
+('色', 'colour'),
+('色', 'desire for beauty'),
+('色', 'form'),
+('色', 'hue'),
+('色', 'shade'),
+('色', 'tint'),
+('艴', 'the countenance changing'),
+('艶', 'beautiful'),
+('艶', 'charming'),
+('艶', 'gloss'),
+('艶', 'love affair'),
+('艶', 'luster'),
+('艶', 'romance'),
+('艶', 'sexy'),
+('艶', 'voluptuous'),
+('艷', 'beautiful'),
+('艷', 'sexy'),
+('艷', 'voluptuous'),
+('艸', 'KangXi radical 140'),
+('艸', 'grass'),
+('艾', 'artemisia'),
+('艾', 'moxa'),
+('艾', 'mugwort'),
+('艾', 'translit.'),
+('芈', 'bleat of sheep'),
+('芈', 'surname'),
+('芊', 'exuberant and vigorous foliage'),
+('芋', 'great'),
+('芋', 'large'),
+('芋', 'taro'),
+('芍', 'peony'),
+('芍', 'water chestnuts'),
+('芎', 'a kind of herb'),
+('芒', 'Miscanthus sinensis'),
+('芔', 'a general term for plants'),
+('芙', 'hibiscus'),
+('芚', 'foolish'),
+('芚', 'green sprout'),
+('芝', 'a divine and relicitous plant(Karlgren)'),
+('芝', 'a purplish or brown mushroom thought to have miraculous powers'),
+('芝', 'sesame'),
+('芟', 'cut'),
+('芟', 'mow'),
+('芟', 'scythe'),
+('芟', 'weed out'),
+('芡', 'plant allied to the waterlily'),
+('芣', 'medicinal'),
+('芣', 'medicinal plantago'),
+('芣', 'plantain'),
+('芥', 'mustard'),
+('芥', 'mustard plant'),
+('芥', 'tiny'),
+('芦', 'reeds'),
+('芦', 'rushes'),
+('芧', 'chestnut oak'),
+('芨', 'name of a plant'),
+('芨', 'the roots are used for various purposes'),
+('芩', 'salt marsh plant'),
+('芪', 'celery'),
+('芫', 'daphne genkwa'),
+('芫', 'poisonous plant'),
+('芬', 'aroma'),
+('芬', 'fragrance'),
+('芬', 'perfume'),
+('芭', 'fragrant'),
+('芭', 'plantain or banana palm'),
+('芮', 'shield'),
+('芮', 'small'),
+('芮', 'string'),
+('芮', 'tiny'),
+('芮', 'waters edge'),
+('芮', 'waterside'),
+('芯', 'pith from rush(juncus effusus)'),
+('芰', 'water caltrop'),
+('芰', 'water chestnut'),
+('芰', '마름'),
+('花', 'blossoms'),
+('花', 'flower'),
+('芳', 'beautiful'),
+('芳', 'fragrant'),
+('芳', 'virtuous'),
+('芷', 'angelica'),
+('芷', 'type of iris'),
+('芸', 'ability'),
+('芸', 'acting'),
+('芸', 'art'),
+('芸', 'craft'),
+('芸', 'herb used to keep insects away'),
+('芸', 'performance'),
+('芸', 'rue'),
+('芸', 'stunt'),
+('芸', 'talent'),
+('芸', 'technique'),
+('芸', 'to cut grass or weeds'),
+('芸', 'trick'),
+('芹', 'celery'),
+('芻', 'cut grass'),
+('芻', 'fodder'),
+('芻', 'hay'),
+('芻', 'mow'),
+('芼', 'greens'),
+('芼', 'to choose'),
+('芼', 'to select'),
+('芽', 'bud'),
+('芽', 'shoot'),
+('芽', 'sprout'),
+('芾', 'flower'),
+('芾', 'little'),
+('芾', 'lush'),
+('芾', 'small'),
+('芿', 'grass which has been cut and regrown'),
+('芿', 'wild grass'),
+('苅', 'cut off'),
+('苅', 'mow'),
+('苅', 'reap'),
+('苅', 'sickle'),
+('苑', 'garden'),
+('苑', 'mansion'),
+('苑', 'park'),
+('苑', 'pasture'),
+('苒', 'in order'),
+('苒', 'lush'),
+('苒', 'successively'),
+('苓', 'fungus'),
+('苓', 'licorice'),
+('苓', 'tuber'),
+('苔', 'lichen'),
+('苔', 'moss'),
+('苕', 'rush plant'),
+('苗', 'Miao'),
+('苗', 'Miao nationality'),
+('苗', 'people'),
+('苗', 'sprouts'),
+('苛', 'harsh'),
+('苛', 'petty'),
+('苛', 'rigorous'),
+('苛', 'small'),
+('苜', 'clover'),
+('苞', 'a variety of rush'),
+('苞', 'enduring'),
+('苞', 'firm'),
+('苞', 'to burst forth'),
+('苟', 'but'),
+('苟', 'careless'),
+('苟', 'distinguish DKW 30853(ji4)'),
+('苟', 'frivolous'),
+('苟', 'grammatical particle: if'),
+('苟', 'grass name'),
+('苟', 'if'),
+('苟', 'if only'),
+('苟', 'illicit'),
+('苟', 'surname'),
+('苡', 'barley'),
+('苣', 'kind of lettuce'),
+('若', 'as if'),
+('若', 'assuming'),
+('若', 'if'),
+('若', 'like'),
+('若', 'similar'),
+('若', 'supposing'),
+('苦', 'bitter'),
+('苦', 'hardship'),
+('苦', 'pain'),
+('苦', 'suffering'),
+('苧', 'china grass'),
+('苧', 'ramie'),
+('苫', 'rush or straw matting'),
+('苯', 'benzene'),
+('苯', 'luxuriant'),
+('英', 'England'),
+('英', 'English'),
+('英', 'Great Britain'),
+('英', 'UK'),
+('英', 'a hero'),
+('英', 'brave'),
+('英', 'flower'),
+('英', 'leaf'),
+('英', 'petal'),
+('苴', 'female hemp plant'),
+('苴', 'sackcloth'),
+('苹', 'apple'),
+('苹', 'artemisia'),
+('苹', 'duckweed'),
+('苺', 'berries'),
+('苺', 'strawberry'),
+('苻', 'kind of herb'),
+('苻', 'type of grass'),
+('苽', 'Zizania latifolia'),
+('苽', 'bulrush'),
+('苾', 'aroma'),
+('苾', 'fecit'),
+('苾', 'fragrance'),
+('苾', 'smell'),
+('茀', 'overgrown with grass'),
+('茀', 'weedy'),
+('茁', 'bud'),
+('茁', 'flourish'),
+('茁', 'sprout'),
+('茁', 'sprouts appearing above-ground'),
+('茁', 'to sprout'),
+('茁', 'vigorous'),
+('茂', 'dense'),
+('茂', 'lush'),
+('茂', 'talented'),
+('茂', 'thick'),
+('范', 'bee-like insect'),
+('范', 'surname'),
+('茄', 'eggplant'),
+('茅', 'grass'),
+('茅', 'reeds'),
+('茅', 'rushes'),
+('茅', 'surname'),
+('茈', 'a plant yielding a red dye'),
+('茉', 'white jasmine'),
+('茗', 'tea'),
+('茗', 'tea plant'),
+('茣', 'mat'),
+('茣', 'matting'),
+('茨', 'caltrop'),
+('茨', 'tribulus terrestris'),
+('茫', 'boundless'),
+('茫', 'vast'),
+('茫', 'widespread'),
+('茬', 'harvest'),
+('茯', 'china root'),
+('茯', 'medicinal fungus'),
+('茱', 'dogwood'),
+('茲', 'here'),
+('茲', 'now'),
+('茲', 'this'),
+('茲', 'time'),
+('茲', 'year'),
+('茴', 'aniseed'),
+('茴', 'fennel'),
+('茵', 'Skimmia japon'),
+('茵', 'a cushion'),
+('茵', 'cushion'),
+('茵', 'mat'),
+('茵', 'mattress'),
+('茵', 'wormwood'),
+('茶', 'brown'),
+('茶', 'tea'),
+('茸', 'buds'),
+('茸', 'downy'),
+('茸', 'soft'),
+('茸', 'sprouts'),
+('茹', 'bear'),
+('茹', 'eat'),
+('茹', 'roots'),
+('茹', 'vegetables'),
+('荀', 'ancient state'),
+('荀', 'plant'),
+('荀', 'surname'),
+('荃', 'aromatic herb'),
+('荃', 'fine cloth'),
+('荆', 'brambles'),
+('荆', 'cane'),
+('荆', 'my wife'),
+('荆', 'thorns'),
+('荇', 'Nymphoides peltalum'),
+('荇', 'a water plant'),
+('草', 'grass'),
+('草', 'herbs'),
+('草', 'straw'),
+('草', 'thatch'),
+('荊', 'brambles'),
+('荊', 'cane'),
+('荊', 'my'),
+('荊', 'my wife'),
+('荊', 'thorns'),
+('荊', 'wife'),
+('荏', 'beans'),
+('荏', 'herb'),
+('荏', 'pliable'),
+('荏', 'soft'),
+('荐', 'recommend'),
+('荐', 'reoccur'),
+('荐', 'repeat'),
+('荑', 'sprouts'),
+('荑', 'tares'),
+('荒', 'blank'),
+('荒', 'desert'),
+('荒', 'empty'),
+('荒', 'rough'),
+('荒', 'sparse'),
+('荒', 'uncultivated'),
+('荒', 'wasteland'),
+('荒', 'wild'),
+('荘', 'hamlet'),
+('荘', 'surname'),
+('荘', 'villa'),
+('荘', 'village'),
+('荳', 'bean-shaped'),
+('荳', 'beans'),
+('荳', 'peas'),
+('荷', 'bear'),
+('荷', 'burden'),
+('荷', 'cargo'),
+('荷', 'freight'),
+('荷', 'holland'),
+('荷', 'load'),
+('荷', 'lotus'),
+('荷', 'owe'),
+('荷', 'take charge'),
+('荷', 'undertake'),
+('荷', 'water lily'),
+('荻', 'miscanthus sacchariflorus'),
+('荻', 'reed'),
+('莅', 'arrive at'),
+('莅', 'attend'),
+('莅', 'be present'),
+('莉', 'white jasmine'),
+('莊', 'hamlet'),
+('莊', 'surname'),
+('莊', 'villa'),
+('莊', 'village'),
+('莎', 'kind of sedge grass'),
+('莎', 'used anciently for raincoats'),
+('莒', 'hemp-like plant'),
+('莒', 'herb'),
+('莒', 'taro'),
+('莓', 'edible berries'),
+('莓', 'moss'),
+('莖', 'stalk'),
+('莖', 'stem'),
+('莘', 'a marsh plant whose root is used for medicine'),
+('莘', 'long'),
+('莘', 'numerous'),
+('莚', 'bamboo mat'),
+('莚', 'banquet'),
+('莚', 'feast'),
+('莛', 'etc.'),
+('莛', 'stalks of grasses'),
+('莝', 'to chop straw fine for animals'),
+('莞', 'a kind of aquatic herb'),
+('莞', 'smiling'),
+('莟', 'a bud'),
+('莠', 'evil'),
+('莠', 'tares'),
+('莠', 'undesirable'),
+('莠', 'weeds'),
+('莢', 'pod'),
+('莢', 'pods'),
+('莢', 'pods of leguminous plants'),
+('莢', 'soybean'),
+('莧', 'amaranth'),
+('莧', 'amaranthus'),
+('莧', '비름'),
+('莨', 'Scopolia japonica'),
+('莨', 'herb'),
+('莩', 'membrane'),
+('莩', 'membrane lining inside of reed'),
+('莩', 'reed'),
+('莪', 'artemisia'),
+('莫', 'can not'),
+('莫', 'cannot'),
+('莫', 'do'),
+('莫', 'do not'),
+('莫', 'is'),
+('莫', 'is not'),
+('莫', 'negative'),
+('莫', 'not'),
+('莱', 'fallow field'),
+('莱', 'goosefoot'),
+('莱', 'weed'),
+('莻', 'late'),
+('莽', 'poisonous'),
+('莽', 'thicket'),
+('莽', 'underbrush'),
+('莿', 'thorn'),
+('菁', 'flower of leek family'),
+('菁', 'turnip'),
+('菅', 'coarse grass'),
+('菅', 'themedia forskali'),
+('菉', 'greenish bamboo'),
+('菉', 'the green bamboo'),
+('菊', 'chrysanthemum'),
+('菌', 'germ'),
+('菌', 'microbe'),
+('菌', 'mushroom'),
+('菑', 'land which has been under cultivation for one year'),
+('菑', 'to weed grass'),
+('菓', 'berries'),
+('菓', 'fruits'),
+('菓', 'nuts'),
+('菔', 'radish'),
+('菔', 'turnip'),
+('菖', 'calamus'),
+('菖', 'iris'),
+('菖', 'sweet flag'),
+('菘', 'cabbage'),
+('菘', 'celery'),
+('菜', 'dish'),
+('菜', 'food'),
+('菜', 'order'),
+('菜', 'vegetables'),
+('菟', 'creeper'),
+('菟', 'dodder'),
+('菠', 'spinach and similar greens'),
+('菡', 'buds'),
+('菡', 'lotus buds'),
+('菩', 'aromatic plant'),
+('菩', 'herb'),
+('菫', 'aconite'),
+('菫', 'celery'),
+('華', 'Chinese'),
+('華', 'bright'),
+('華', 'colorful'),
+('華', 'flowery'),
+('華', 'illustrious'),
+('菰', 'wild rice'),
+('菰', 'zizania latifolia'),
+('菱', 'water caltrop'),
+('菱', 'water-chestnut'),
+('菲', 'fragrant'),
+('菲', 'luxuriant'),
+('菲', 'the Philippines'),
+('菴', 'small Buddhist monastery'),
+('菶', 'flower'),
+('菶', 'species of water plant'),
+('菹', 'salted or pickled vegetables'),
+('菽', 'beans and peas'),
+('菽', 'collectively'),
+('萃', 'close-set'),
+('萃', 'dense'),
+('萃', 'thick'),
+('萃', 'to collect together'),
+('萄', 'grapes'),
+('萅', 'spring'),
+('萅', 'wanton'),
+('萆', 'the castor-oil plant also used for other plants'),
+('萇', 'averrhora carambola'),
+('萇', 'surname'),
+('萊', 'fallow field'),
+('萊', 'goosefoot'),
+('萊', 'weed'),
+('萋', 'crowded'),
+('萋', 'luxuriant foliage'),
+('萌', 'bud'),
+('萌', 'sprout'),
+('萍', 'duckweed'),
+('萍', 'traveling'),
+('萍', 'wandering'),
+('萎', 'wilt'),
+('萎', 'wither'),
+('萠', 'bud'),
+('萠', 'sprout'),
+('萩', 'scandent hop'),
+('萩', 'tree'),
+('萬', 'innumerable'),
+('萬', 'myriad'),
+('萬', 'ten thousand'),
+('萱', 'day-lily'),
+('萱', 'hemerocallisflava'),
+('萵', 'lettuce'),
+('萸', 'dogwood'),
+('萹', 'grass'),
+('萼', 'a younger brother'),
+('萼', 'the stem and calyx of a flower'),
+('落', 'drop'),
+('落', 'fall'),
+('落', 'net income'),
+('落', 'surplus'),
+('葆', 'conceal'),
+('葆', 'preserve'),
+('葆', 'reserve'),
+('葉', 'leaf'),
+('葉', 'page of book'),
+('葉', 'period'),
+('葉', 'petal'),
+('葉', 'surname'),
+('葊', 'cottage'),
+('葑', 'the rape-turnip'),
+('著', '(Cant.) to wear'),
+('著', 'by'),
+('著', 'manifest'),
+('著', 'written'),
+('葚', 'fruit'),
+('葚', 'mulberry'),
+('葚', 'mulberry fruit'),
+('葚', '實'),
+('葚', '桑'),
+('葚', '오디'),
+('葛', 'arrowroot'),
+('葛', 'edible bean'),
+('葛', 'kudzu'),
+('葛', 'surname'),
+('葡', 'grapes'),
+('董', 'direct'),
+('董', 'supervise'),
+('董', 'surname'),
+('葦', 'reed'),
+('葩', 'flowers'),
+('葫', 'bottle-gourd'),
+('葬', 'bury'),
+('葬', 'inter'),
+('葭', 'bulrush'),
+('葭', 'flute'),
+('葭', 'reed'),
+('葭', 'whistle'),
+('葯', 'leaf of the iris'),
+('葯', 'medicine'),
+('葯', 'orris root'),
+('葱', 'green onions'),
+('葱', 'leeks'),
+('葱', 'scallions'),
+('葳', 'flourishing'),
+('葳', 'luxuriant'),
+('葳', 'used for various plants'),
+('葵', 'measure'),
+('葵', 'sunflower'),
+('葷', 'meat diet'),
+('葷', 'strong smelling'),
+('葺', 'fix'),
+('葺', 'pile up'),
+('葺', 'repair'),
+('葺', 'thatch'),
+('蒂', 'peduncle or stem of plants'),
+('蒋', 'hydropyrum latifalium'),
+('蒋', 'surname'),
+('蒐', 'assemble'),
+('蒐', 'assemble for war'),
+('蒐', 'collect'),
+('蒐', 'gather'),
+('蒐', 'seek'),
+('蒐', 'spring hunt'),
+('蒔', 'Anethum graveolens'),
+('蒔', 'dill'),
+('蒔', 'plant'),
+('蒔', 'transplant'),
+('蒙', 'Mongolia'),
+('蒙', 'cover'),
+('蒙', 'ignorant'),
+('蒙', 'mongolia'),
+('蒙', 'suffer'),
+('蒜', 'garlic'),
+('蒞', 'arrive'),
+('蒞', 'manage'),
+('蒞', 'reach'),
+('蒟', 'Amorphaphalus konjac'),
+('蒟', 'betel pepper'),
+('蒡', 'burdock'),
+('蒡', 'herb'),
+('蒨', 'lush vegetation'),
+('蒨', 'luxuriant growth'),
+('蒭', 'fodder'),
+('蒭', 'hay'),
+('蒭', 'to cut grass'),
+('蒯', 'a rush'),
+('蒯', 'of which various things are made'),
+('蒲', 'type of rush'),
+('蒲', 'vine'),
+('蒴', 'seed(capsule)'),
+('蒸', 'evaporate'),
+('蒸', 'steam'),
+('蒹', 'phragmites communis'),
+('蒹', 'reed'),
+('蒺', 'furze'),
+('蒺', 'gorse'),
+('蒻', 'rushes'),
+('蒼', 'blue'),
+('蒼', 'green'),
+('蒿', 'artemisia'),
+('蒿', 'give off'),
+('蒿', 'mugwort'),
+('蓀', 'aromatic grass'),
+('蓀', 'flower'),
+('蓀', 'iris'),
+('蓁', 'abundant'),
+('蓁', 'luxuriant vegetation'),
+('蓂', 'lucky place'),
+('蓄', 'gather'),
+('蓄', 'hoard'),
+('蓄', 'save'),
+('蓄', 'store'),
+('蓆', 'mat'),
+('蓆', 'straw mat'),
+('蓉', 'Chengdu'),
+('蓉', 'Sichuan'),
+('蓉', 'hibiscus'),
+('蓊', 'lush'),
+('蓊', 'luxuriant vegetation'),
+('蓋', 'cover'),
+('蓋', 'hide'),
+('蓋', 'protect'),
+('蓍', 'milfoil'),
+('蓍', 'plant used in divination'),
+('蓐', 'rushes'),
+('蓐', 'straw bed mat'),
+('蓑', 'coir'),
+('蓑', 'etc.'),
+('蓑', 'rain coat made of straw'),
+('蓓', 'bud'),
+('蓖', 'Ricinus commumis'),
+('蓖', 'castor-oil plant'),
+('蓚', 'oxalic(used in compounds)'),
+('蓬', 'fairyland'),
+('蓬', 'moxa'),
+('蓬', 'mugwort'),
+('蓬', 'type of raspberry'),
+('蓬', 'wormwood'),
+('蓮', 'lotus'),
+('蓮', 'paradise'),
+('蓮', 'water lily'),
+('蓯', 'medicinal herb'),
+('蓴', 'bracenia'),
+('蓴', 'edible water plant'),
+('蓺', 'conclude'),
+('蓺', 'fulfill'),
+('蓺', 'plant'),
+('蓺', 'target'),
+('蓼', 'polygonum'),
+('蓼', 'smartweed'),
+('蓽', 'piper longtum'),
+('蓽', 'species of bean'),
+('蓿', 'clover'),
+('蓿', 'lucerne'),
+('蔀', 'screen'),
+('蔆', 'water caltrop'),
+('蔆', 'water-chestnut'),
+('蔑', 'belittle'),
+('蔑', 'despise'),
+('蔑', 'disdain'),
+('蔑', 'disregard'),
+('蔑', 'slight'),
+('蔓', 'creeping plants'),
+('蔓', 'tendrils'),
+('蔓', 'vines'),
+('蔔', 'radish'),
+('蔕', 'peduncle or stem of plants'),
+('蔗', 'sugar cane'),
+('蔘', 'ginseng'),
+('蔘', 'hemp, flax'),
+('蔘', 'huge'),
+('蔚', 'luxuriant'),
+('蔚', 'ornamental'),
+('蔚', 'thick'),
+('蔞', 'Artemisia stelleriana'),
+('蔟', 'a bunch of similar things, grouped together'),
+('蔟', 'frame on which silkworms spin'),
+('蔟', 'tribe'),
+('蔡', 'species of tortoise'),
+('蔡', 'surname'),
+('蔣', 'Hydropyrum latifolium'),
+('蔣', 'Manchurian wild rice'),
+('蔣', 'Zizania latifolia'),
+('蔣', 'hydropyrum latifalium'),
+('蔣', 'surname'),
+('蔥', 'leeks'),
+('蔥', 'onions'),
+('蔥', 'scallions'),
+('蔦', 'Ribes ambiguum'),
+('蔦', 'parasitic plants such as mistletoe'),
+('蔦', 'the convovulvus'),
+('蔬', 'greens'),
+('蔬', 'vegetables'),
+('蔭', 'protect'),
+('蔭', 'shade'),
+('蔭', 'shelter'),
+('蔯', 'a variety of artemisia'),
+('蔵', 'conceal'),
+('蔵', 'hide'),
+('蔵', 'hoard'),
+('蔵', 'store up'),
+('蔽', 'conceal'),
+('蔽', 'cover'),
+('蔽', 'hide'),
+('蔽', 'shelter'),
+('蔿', 'place name'),
+('蔿', 'surname'),
+('蕁', 'nettle'),
+('蕂', 'sesame'),
+('蕃', 'foreign things'),
+('蕆', 'complete'),
+('蕆', 'finish'),
+('蕆', 'solve'),
+('蕉', 'banana'),
+('蕉', 'plantain'),
+('蕊', 'flower buds'),
+('蕊', 'unopened flowers'),
+('蕋', 'flower buds'),
+('蕋', 'unopened flowers'),
+('蕎', 'buckwheat'),
+('蕓', 'an herb used keep insects away'),
+('蕓', 'rue'),
+('蕕', 'caryopteris divaricata'),
+('蕘', 'firewood'),
+('蕘', 'fuel'),
+('蕘', 'stubble'),
+('蕙', 'species of fragrant orchid'),
+('蕞', 'little'),
+('蕞', 'petty'),
+('蕞', 'small'),
+('蕞', 'tiny'),
+('蕡', 'hemp seeds'),
+('蕡', 'plant with abundant'),
+('蕣', 'hibiscus'),
+('蕤', 'delicate'),
+('蕤', 'drooping leaves'),
+('蕤', 'fringe soft'),
+('蕨', 'common bracken'),
+('蕨', 'pteris aquilina'),
+('蕩', 'cleanse'),
+('蕩', 'pond'),
+('蕩', 'pool'),
+('蕩', 'wander'),
+('蕩', 'wash away'),
+('蕪', 'luxurious growth of weeds'),
+('蕭', 'common artemisia'),
+('蕭', 'dejected'),
+('蕭', 'soughing of wind > mournful'),
+('蕰', 'the hippuris or mares tail plant'),
+('蕾', 'buds'),
+('蕾', 'unopened flowers'),
+('薀', 'the hippuris or mares tail plant'),
+('薄', 'poor'),
+('薄', 'slight'),
+('薄', 'stingy'),
+('薄', 'thin'),
+('薄', 'weak'),
+('薆', 'to conceal'),
+('薆', 'to cover'),
+('薆', 'to hide'),
+('薇', 'Osmunda regalis'),
+('薇', 'a species of fern'),
+('薇', 'rose'),
+('薉', 'dirty'),
+('薉', 'immoral'),
+('薉', 'obscene'),
+('薉', 'unclean'),
+('薊', 'circium'),
+('薊', 'surname'),
+('薊', 'thistles'),
+('薌', 'aromatic'),
+('薌', 'fragrant smell of grain'),
+('薏', 'lotus seed'),
+('薏', 'seed of jobs tears'),
+('薑', 'ginger'),
+('薔', 'hydropiper'),
+('薔', 'rose'),
+('薗', 'garden'),
+('薗', 'orchard'),
+('薗', 'park'),
+('薙', 'shave'),
+('薙', 'weed'),
+('薛', 'feudal state'),
+('薛', 'kind of marsh grass'),
+('薜', 'angelica'),
+('薜', 'evergreen shrubs'),
+('薜', 'ligusticum'),
+('薤', 'allium bakeri'),
+('薤', 'scallion'),
+('薤', 'shallots'),
+('薥', 'hollyhock'),
+('薥', '접시꽃'),
+('薦', 'offer'),
+('薦', 'present'),
+('薦', 'recommend'),
+('薨', 'death of prince'),
+('薨', 'die'),
+('薨', 'flocking'),
+('薨', 'noisy'),
+('薨', 'onomatopoeia'),
+('薨', 'pass away'),
+('薨', 'swarming'),
+('薩', 'etc.'),
+('薩', 'transliteration of sat in bodhisattva'),
+('薪', 'firewood'),
+('薪', 'fuel'),
+('薪', 'salary'),
+('薫', 'a medicinal herb'),
+('薫', 'to cauterize'),
+('薬', 'drugs'),
+('薬', 'medicine'),
+('薬', 'pharmaceuticals'),
+('薯', 'potato'),
+('薯', 'tuber'),
+('薯', 'yam'),
+('薰', 'a medicinal herb'),
+('薰', 'to cauterize'),
+('薺', 'caltrop'),
+('薺', 'water-chestnuts'),
+('藁', 'dry'),
+('藁', 'hay'),
+('藁', 'straw'),
+('藁', 'withered'),
+('藉', 'mat'),
+('藉', 'pad'),
+('藉', 'pretext'),
+('藉', 'rely on'),
+('藍', 'blue'),
+('藍', 'indigo plant'),
+('藍', 'surname'),
+('藎', 'a kind of weed'),
+('藎', 'faithfulness'),
+('藏', 'conceal'),
+('藏', 'hide'),
+('藏', 'hoard'),
+('藏', 'store up'),
+('藐', 'booth, temporary shelter'),
+('藐', 'disdain'),
+('藐', 'disregard'),
+('藐', 'slight'),
+('藕', 'lotus root'),
+('藜', 'chenopodium album'),
+('藜', 'pigweed'),
+('藝', 'ability'),
+('藝', 'art'),
+('藝', 'craft'),
+('藝', 'performance'),
+('藝', 'talent'),
+('藝', 'technique'),
+('藤', 'cane'),
+('藤', 'creeper plant'),
+('藤', 'rattan'),
+('藤', 'wisteria'),
+('藥', 'drug'),
+('藥', 'drugs'),
+('藥', 'medicine'),
+('藥', 'pharmaceuticals'),
+('藩', 'border'),
+('藩', 'boundary'),
+('藩', 'defence'),
+('藩', 'fence'),
+('藩', 'hedge'),
+('藩', 'margin'),
+('藩', 'marquis'),
+('藩', 'outlying border'),
+('藪', 'clump of trees or bushes'),
+('藪', 'marsh'),
+('藪', 'swamp'),
+('藪', 'wild country'),
+('藴', 'collect'),
+('藷', 'potato'),
+('藷', 'tuber'),
+('藷', 'yam'),
+('藹', 'affable'),
+('藹', 'friendly'),
+('藹', 'lush'),
+('藺', 'rush used in making mats'),
+('藺', 'surname'),
+('藻', 'algae'),
+('藻', 'magnificent'),
+('藻', 'splendid'),
+('藿', 'betony'),
+('藿', 'lophanthus rugosus'),
+('蘀', 'falling leaves and barks'),
+('蘂', 'stamen or pistil'),
+('蘄', 'variety of artemisia seek'),
+('蘆', 'reeds'),
+('蘆', 'rushes'),
+('蘇', 'a species of thyme'),
+('蘇', 'resurrect'),
+('蘇', 'revive'),
+('蘇', 'transliteration of Soviet'),
+('蘊', '(Budd.) skandha'),
+('蘊', 'collect'),
+('蘊', 'gather'),
+('蘊', 'profound'),
+('蘊', 'store'),
+('蘋', 'apple'),
+('蘖', 'sprout'),
+('蘖', 'stump'),
+('蘗', 'sprout'),
+('蘗', 'stump'),
+('蘘', 'a kind of wild ginger'),
+('蘚', 'lichen'),
+('蘚', 'moss'),
+('蘢', 'tall grass'),
+('蘢', 'water-weeds'),
+('蘧', 'a plant which resembles wheat but has no edible grain'),
+('蘭', 'elegant'),
+('蘭', 'graceful'),
+('蘭', 'orchid'),
+('蘯', 'to rock'),
+('蘯', 'to swing'),
+('蘯', 'to toss about'),
+('蘿', 'turnip'),
+('蘿', 'type of creeping plant'),
+('虎', 'brave'),
+('虎', 'fierce'),
+('虎', 'surname'),
+('虎', 'tiger'),
+('虐', 'cruel'),
+('虐', 'harsh'),
+('虐', 'oppressive'),
+('虓', 'roar'),
+('虔', 'act with reverence'),
+('虔', 'reverent'),
+('處', 'department'),
+('處', 'locale'),
+('處', 'locate'),
+('處', 'place'),
+('處', 'stop'),
+('虚', 'false'),
+('虛', 'empty'),
+('虛', 'false'),
+('虛', 'hollow'),
+('虛', 'worthless'),
+('虜', 'a prison'),
+('虜', 'capture'),
+('虜', 'imprison'),
+('虜', 'seize'),
+('虜', 'to capture'),
+('虞', 'anxious'),
+('虞', 'concerned about'),
+('虞', 'worried'),
+('虞', 'worry'),
+('號', 'alias'),
+('號', 'art name'),
+('號', 'command'),
+('號', 'cry'),
+('號', 'mark'),
+('號', 'name'),
+('號', 'number'),
+('號', 'order'),
+('號', 'shout'),
+('號', 'sign'),
+('號', 'symbol'),
+('虧', 'damage'),
+('虧', 'deficient'),
+('虧', 'fail'),
+('虧', 'lose'),
+('虫', 'KangXi radical 142'),
+('虫', 'bug'),
+('虫', 'insect'),
+('虫', 'insects'),
+('虫', 'poisonous'),
+('虫', 'snake'),
+('虫', 'worms'),
+('虬', 'young dragon'),
+('虯', 'young dragon'),
+('虱', 'bug'),
+('虱', 'louse'),
+('虱', 'parasite'),
+('虹', 'placename'),
+('虹', 'rainbow'),
+('虺', 'big'),
+('虺', 'large poisonous snake'),
+('虺', 'snake'),
+('虺', 'viper'),
+('虻', 'gadfly'),
+('虻', 'horsefly'),
+('虽', 'although'),
+('蚇', 'geometrid'),
+('蚇', 'inchworm'),
+('蚇', 'measuring worm'),
+('蚇', '자벌레'),
+('蚊', 'gnat'),
+('蚊', 'mosquito'),
+('蚋', 'gnat'),
+('蚋', 'mosquito'),
+('蚌', 'mother-of-pearl'),
+('蚌', 'mussels'),
+('蚌', 'oysters'),
+('蚍', 'ant'),
+('蚍', 'king'),
+('蚍', 'mallow'),
+('蚍', 'mussels'),
+('蚍', 'various shellfish'),
+('蚓', 'earthworm'),
+('蚓', 'rainworm'),
+('蚓', '지렁이'),
+('蚕', 'silkworms'),
+('蚝', 'caterpillar'),
+('蚣', 'centipede'),
+('蚤', 'flea'),
+('蚤', 'louse'),
+('蚨', 'a kind of water-beetle cash'),
+('蚨', 'then dollars and money generally'),
+('蚩', 'ignorant'),
+('蚩', 'laugh'),
+('蚩', 'rustic'),
+('蚩', 'worm'),
+('蚪', 'tadpole'),
+('蚯', 'earthworm'),
+('蚯', 'rainworm'),
+('蚯', '지렁이'),
+('蚰', 'millipede'),
+('蚱', '(edible) locust'),
+('蚱', 'cicada'),
+('蚱', 'grasshopper'),
+('蛀', 'clothes'),
+('蛀', 'insects that eat books'),
+('蛅', 'a caterpillar'),
+('蛅', 'caterpillar'),
+('蛅', '쐐기'),
+('蛆', 'maggots'),
+('蛇', 'long'),
+('蛇', 'meandering'),
+('蛇', 'snake'),
+('蛇', 'winding'),
+('蛉', 'dragonfly'),
+('蛉', 'libellulidae'),
+('蛋', 'eggs'),
+('蛋', 'term of abuse'),
+('蛍', 'glow-worm'),
+('蛍', 'luminous insect'),
+('蛐', 'earthworm'),
+('蛐', 'rainworm'),
+('蛐', '지렁이'),
+('蛔', 'tapeworm'),
+('蛙', 'frog'),
+('蛛', 'spider'),
+('蛞', 'mole cricket'),
+('蛞', 'slug'),
+('蛞', 'snail'),
+('蛟', 'scaly dragon with four legs'),
+('蛣', '(dung) beetle'),
+('蛤', 'clam'),
+('蛩', 'anxious'),
+('蛩', 'cricket'),
+('蛩', 'locust'),
+('蛭', 'leech'),
+('蛭', '거머리'),
+('蛮', 'barbarians'),
+('蛮', 'barbarous'),
+('蛮', 'savage'),
+('蛸', 'chrysalis of mantis'),
+('蛸', 'long legged spider'),
+('蛸', 'octopus'),
+('蛹', 'chrysalis'),
+('蛹', 'larva'),
+('蛹', 'pupa'),
+('蛹', '번데기'),
+('蛻', 'exuviate'),
+('蛻', 'molt'),
+('蛻', 'shed'),
+('蛾', 'moth'),
+('蜀', 'name of an ancient state'),
+('蜂', 'bee'),
+('蜂', 'hornet'),
+('蜂', 'wasp'),
+('蜃', 'clams'),
+('蜃', 'marine monster which can change its shape'),
+('蜃', 'water spouts'),
+('蜆', 'a variety of bivalves'),
+('蜈', 'centipede'),
+('蜉', 'kind of large insect'),
+('蜉', 'mayfly'),
+('蜊', 'clam'),
+('蜋', 'dung beetle'),
+('蜋', 'insect'),
+('蜋', 'mantis'),
+('蜑', 'egg'),
+('蜕', 'molt'),
+('蜖', 'tapeworm'),
+('蜘', 'spider'),
+('蜚', 'cockroach'),
+('蜜', 'beeswax'),
+('蜜', 'honey'),
+('蜜', 'nectar'),
+('蜜', 'sweet'),
+('蜡', 'as a non-simplified form sometimes used as an equivalent to (䄍)'),
+('蜡', 'candle'),
+('蜡', 'glazed'),
+('蜡', 'maggot'),
+('蜡', 'meaning imperial harvest'),
+('蜡', 'wax'),
+('蜡', 'waxy'),
+('蜥', 'lizard'),
+('蜨', 'butterfly'),
+('蜩', 'broad locust'),
+('蜩', 'cicada'),
+('蜴', 'lizard'),
+('蜷', 'creep like worm'),
+('蜷', 'curl ones body'),
+('蜺', 'cicada'),
+('蜺', 'reflection of rainbow'),
+('蜻', 'dragonfly'),
+('蜿', 'crawl'),
+('蜿', 'creep'),
+('蝀', 'rainbow'),
+('蝉', 'cicada'),
+('蝉', 'continuous'),
+('蝋', 'candle'),
+('蝋', 'glazed'),
+('蝋', 'wax'),
+('蝋', 'waxy'),
+('蝌', 'tadpole'),
+('蝎', 'scorpion'),
+('蝕', 'eclipse'),
+('蝕', 'erode'),
+('蝕', 'nibble away'),
+('蝗', 'kind of locust'),
+('蝘', 'gecko'),
+('蝙', 'bat'),
+('蝟', 'hedgehog'),
+('蝠', 'kind of bat'),
+('蝥', 'a fly which is used similarly to cantharides'),
+('蝥', 'cantharides'),
+('蝦', 'prawn'),
+('蝦', 'shrimp'),
+('蝨', 'bed bug'),
+('蝨', 'louse'),
+('蝮', 'venomous snake'),
+('蝮', 'viper'),
+('蝴', 'butterfly'),
+('蝶', 'butterfly'),
+('蝸', 'Eulota callizoma'),
+('蝸', 'a snail'),
+('螂', 'dung beetle'),
+('螂', 'mantis'),
+('螃', 'crab'),
+('螈', 'newt'),
+('螌', 'a striped'),
+('螌', 'poisonous fly'),
+('融', 'blend'),
+('融', 'fuse'),
+('融', 'harmonize'),
+('融', 'melt'),
+('螘', 'ant'),
+('螞', 'ant'),
+('螞', 'leech'),
+('螞', '거머리'),
+('螞', '말'),
+('螟', 'kind of caterpillar'),
+('螟', 'larva'),
+('螢', 'glow-worm'),
+('螢', 'insect'),
+('螢', 'luminous'),
+('螢', 'luminous insect'),
+('螣', 'mythological wingless dragon of'),
+('螭', 'a dragon whose horns have not grown'),
+('螭', 'a korean measurement of distance, similar to feet'),
+('螭', 'cruel'),
+('螳', 'mantis'),
+('螺', 'aquatic'),
+('螺', 'conch'),
+('螺', 'snail'),
+('螺', 'spiral'),
+('螺', 'spiral shell'),
+('螻', 'Gryllotalpa africana'),
+('螻', 'a mole cricket'),
+('螽', 'katydid'),
+('螾', 'earthworm'),
+('螾', 'rainworm'),
+('螾', '지렁이'),
+('蟀', 'cricket'),
+('蟄', 'to hibernate'),
+('蟇', 'frog'),
+('蟇', 'toad'),
+('蟊', 'a fly which is used similarly to cantharides'),
+('蟋', 'cricket'),
+('蟒', 'boa constrictor'),
+('蟒', 'python'),
+('蟖', 'caterpillar'),
+('蟖', '쐐기'),
+('蟚', 'a small land crab'),
+('蟛', 'a land-crab'),
+('蟠', 'coil'),
+('蟠', 'coiling'),
+('蟠', 'curling'),
+('蟠', 'occupy'),
+('蟣', 'leech'),
+('蟣', 'louse eggs'),
+('蟣', 'nits'),
+('蟥', '거머리'),
+('蟥', '말'),
+('蟬', 'cicada'),
+('蟬', 'continuous'),
+('蟯', 'worms'),
+('蟲', 'bug'),
+('蟲', 'insect'),
+('蟲', 'insects'),
+('蟲', 'worms'),
+('蟷', 'mantis'),
+('蟹', 'brachyura'),
+('蟹', 'crab'),
+('蟻', 'ant'),
+('蟻', 'ants'),
+('蟾', 'toad'),
+('蠁', 'chrysalis'),
+('蠁', '번데기'),
+('蠃', 'the solitary wasp'),
+('蠅', 'flies'),
+('蠍', 'scorpion'),
+('蠑', 'lizard'),
+('蠑', 'newt'),
+('蠖', 'geometrid'),
+('蠖', 'inchworm'),
+('蠖', 'measuring worm'),
+('蠖', '자벌레'),
+('蠟', 'candle'),
+('蠟', 'glazed'),
+('蠟', 'wax'),
+('蠟', 'waxy'),
+('蠡', 'bore into wood'),
+('蠡', 'wood-boring insect'),
+('蠢', 'fat'),
+('蠢', 'silly'),
+('蠢', 'stupid'),
+('蠢', 'wriggle'),
+('蠣', 'oyster'),
+('蠱', 'bewitch'),
+('蠱', 'harm'),
+('蠱', 'poison'),
+('蠱', 'venom'),
+('蠲', 'bright'),
+('蠲', 'clear'),
+('蠲', 'the millipede sometimes confounded with the grow-worm'),
+('蠶', 'silkworm'),
+('蠶', 'silkworms'),
+('蠹', 'insects which eat into clot'),
+('蠹', 'moth'),
+('蠻', 'barbarian'),
+('蠻', 'barbarians'),
+('蠻', 'barbarous'),
+('蠻', 'savage'),
+('血', 'blood'),
+('血', 'radical number 143'),
+('衄', 'epistaxis'),
+('衄', 'nosebleed'),
+('衄', 'to be defeated'),
+('衅', 'consecrate sacrificial vessels by smearing blood'),
+('衅', 'rift'),
+('衆', 'crowd'),
+('衆', 'masses'),
+('衆', 'multitude'),
+('衆', 'public'),
+('衊', 'defile'),
+('衊', 'slander'),
+('衊', 'smear'),
+('行', 'behaviour'),
+('行', 'bound'),
+('行', 'circulate'),
+('行', 'conduct'),
+('行', 'degree'),
+('行', 'familial'),
+('行', 'for'),
+('行', 'go'),
+('行', 'going'),
+('行', 'line'),
+('行', 'move'),
+('行', 'movement'),
+('行', 'place'),
+('行', 'relation'),
+('行', 'row'),
+('行', 'soldier'),
+('行', 'transaction'),
+('行', 'transport'),
+('行', 'travel'),
+('行', 'walk'),
+('衍', 'overflow'),
+('衍', 'spill over'),
+('衍', 'spread out'),
+('衎', 'happy'),
+('衎', 'pleased'),
+('衎', 'to give pleasure'),
+('衒', 'brag'),
+('衒', 'promote oneself'),
+('衒', 'show off'),
+('術', 'art'),
+('術', 'artifice'),
+('術', 'brains'),
+('術', 'gift'),
+('術', 'head'),
+('術', 'knack'),
+('術', 'method'),
+('術', 'ruse'),
+('術', 'skill'),
+('術', 'special feat'),
+('術', 'talent'),
+('術', 'technique'),
+('術', 'trap'),
+('術', 'trick'),
+('術', 'wits'),
+('街', 'road'),
+('街', 'street'),
+('街', 'thoroughfare'),
+('衙', 'official residence'),
+('衙', 'public office'),
+('衛', 'defend'),
+('衛', 'guard'),
+('衛', 'protect'),
+('衛', 'protection'),
+('衝', 'charge ahead'),
+('衝', 'collide'),
+('衝', 'rush against'),
+('衞', 'defend'),
+('衞', 'guard'),
+('衞', 'protect'),
+('衡', 'consider'),
+('衡', 'judge'),
+('衡', 'measure'),
+('衡', 'weigh'),
+('衢', 'highway'),
+('衢', 'intersection'),
+('衢', 'thoroughfare'),
+('衣', 'clothes'),
+('衣', 'clothing'),
+('衣', 'cover'),
+('衣', 'skin'),
+('表', 'diagram'),
+('表', 'display'),
+('表', 'express'),
+('表', 'graph'),
+('表', 'manifest'),
+('表', 'show'),
+('表', 'table'),
+('衫', 'gown'),
+('衫', 'jacket'),
+('衫', 'robe'),
+('衫', 'shirt'),
+('衮', 'ceremonial dress worn by the emperor'),
+('衮', 'robe'),
+('衮', 'royal'),
+('衰', 'decline'),
+('衰', 'decrease'),
+('衰', 'falter'),
+('衰', 'weaken'),
+('衲', 'line'),
+('衲', 'mend'),
+('衲', 'patch'),
+('衲', 'quilt'),
+('衲', 'sew'),
+('衷', 'from bottom of ones heart'),
+('衷', 'heart'),
+('衽', 'hidden lapel of coat'),
+('衽', 'lapel'),
+('衾', 'coverlet'),
+('衾', 'quilt'),
+('衿', 'collar or lapel of garment'),
+('袁', 'robe'),
+('袁', 'surname'),
+('袂', 'sleeves'),
+('袆', 'ceremonial gowns of a queen'),
+('袈', 'Buddhist cassock'),
+('袋', 'bag'),
+('袋', 'pocket'),
+('袋', 'pouch'),
+('袋', 'sack'),
+('袍', 'cloak'),
+('袍', 'long gown'),
+('袍', 'robe'),
+('袒', 'bared'),
+('袒', 'lay bare'),
+('袒', 'naked'),
+('袒', 'strip'),
+('袖', 'put something in sleeve'),
+('袖', 'sleeve'),
+('袗', 'hem of garment'),
+('袗', 'unlined garments'),
+('袞', 'ceremonial dress worn by the emperor'),
+('袟', '책갑'),
+('袢', 'robe'),
+('袤', 'length'),
+('袤', 'lengthwise'),
+('袤', 'longitude'),
+('袪', 'cuff'),
+('袪', 'sleeve'),
+('袪', 'sleeves'),
+('被', 'bedding'),
+('被', 'passive indicator by'),
+('袱', 'a piece of cloth used wrap bundles'),
+('袳', 'spread ones clothes'),
+('袴', 'crotch'),
+('袴', 'groin'),
+('袴', 'panties'),
+('袴', 'pants'),
+('袴', 'trousers'),
+('袷', 'collar'),
+('袷', 'garment'),
+('袷', 'left'),
+('袷', 'meet'),
+('袷', 'place'),
+('袷', 'right'),
+('裀', 'coverlet'),
+('裀', 'mat'),
+('裀', 'underwear'),
+('裁', 'cut out'),
+('裁', 'decrease'),
+('裂', 'break open'),
+('裂', 'crack'),
+('裂', 'rend'),
+('裂', 'split'),
+('装', 'attire'),
+('装', 'clothes'),
+('装', 'dress'),
+('装', 'fill'),
+('裊', 'curling upwards'),
+('裊', 'wavering gently'),
+('裍', 'a border or band on the edge of a dress'),
+('裎', '벌거숭이'),
+('裏', 'inside'),
+('裏', 'interior'),
+('裏', 'within'),
+('裒', 'assemble'),
+('裒', 'collect'),
+('裒', 'gather'),
+('裒', 'praise'),
+('裔', 'descendants'),
+('裔', 'posterity'),
+('裔', 'progeny'),
+('裕', 'abundant'),
+('裕', 'plentiful'),
+('裕', 'rich'),
+('裘', 'fur garments'),
+('裘', 'surname'),
+('裙', 'apron'),
+('裙', 'petticoat'),
+('裙', 'skirt'),
+('補', 'fix'),
+('補', 'mend'),
+('補', 'patch'),
+('補', 'repair'),
+('補', 'restore'),
+('裝', 'clothes'),
+('裝', 'decorate'),
+('裝', 'dress'),
+('裝', 'fill'),
+('裟', 'a cassock or robe of a monk'),
+('裡', 'inside'),
+('裡', 'interior'),
+('裡', 'within'),
+('裨', 'aid'),
+('裨', 'benefit'),
+('裨', 'help'),
+('裨', 'supplement'),
+('裯', 'bedspread'),
+('裯', 'coverlet'),
+('裯', 'quilt'),
+('裯', 'thin'),
+('裯', 'underwear'),
+('裱', 'to mount maps or scrolls to paste'),
+('裳', 'beautiful'),
+('裳', 'clothes'),
+('裳', 'skirt'),
+('裴', 'look of a flowing gown'),
+('裴', 'surname'),
+('裵', 'clothing'),
+('裵', 'long'),
+('裵', 'look of a flowing gown'),
+('裵', 'placename'),
+('裵', 'surname'),
+('裸', 'bare'),
+('裸', 'nude'),
+('裸', 'strip'),
+('裸', 'undress'),
+('裹', 'bind'),
+('裹', 'confine'),
+('裹', 'encircle'),
+('裹', 'wrap'),
+('製', 'build'),
+('製', 'make'),
+('製', 'manufacture'),
+('製', 'produce'),
+('裾', 'border of garment'),
+('裾', 'lapel'),
+('裾', 'skirt'),
+('褄', 'a skirt'),
+('複', 'double'),
+('複', 'overlap'),
+('複', 'repeat'),
+('褊', 'cramped'),
+('褊', 'crowded'),
+('褊', 'mean'),
+('褊', 'narrow'),
+('褌', 'drawers'),
+('褌', 'pants'),
+('褌', 'shorts'),
+('褌', 'trousers'),
+('褐', 'brown'),
+('褐', 'coarse woolen cloth'),
+('褐', 'dark'),
+('褐', 'dull'),
+('褒', 'cite'),
+('褒', 'commend'),
+('褒', 'honor'),
+('褒', 'praise'),
+('褓', 'infancy'),
+('褓', 'swaddling cloth'),
+('褕', 'shirt'),
+('褘', 'beautiful'),
+('褘', 'ceremonial gowns of a queen'),
+('褘', 'handkerchief'),
+('褙', 'paper or cloth pasted together'),
+('褚', 'bag'),
+('褚', 'pad'),
+('褚', 'stuff'),
+('褚', 'surname'),
+('褚', 'valise'),
+('褚', 'vest'),
+('褥', 'bedding'),
+('褥', 'cushion'),
+('褥', 'mattress'),
+('褧', 'light overcoat'),
+('褧', 'unlined clothes'),
+('褪', 'fade'),
+('褪', 'fall off'),
+('褪', 'strip'),
+('褪', 'undress'),
+('褫', 'strip'),
+('褫', 'tear off'),
+('褫', 'undress'),
+('褰', 'open up'),
+('褰', 'outspread'),
+('褰', 'roll up'),
+('褰', 'to pick up ones skirts'),
+('褰', 'underclothing'),
+('褲', 'anatomy'),
+('褲', 'crotch'),
+('褲', 'groin'),
+('褲', 'pants'),
+('褲', 'trousers'),
+('褶', 'crease'),
+('褶', 'pleat'),
+('褶', 'wrinkles'),
+('褸', 'collar'),
+('褸', 'lapel'),
+('褸', 'tattered'),
+('褸', 'threadbare'),
+('褺', 'dirty'),
+('褺', 'ragged'),
+('褺', 'to treat with irreverence'),
+('褺', 'undress'),
+('褻', 'dirty'),
+('褻', 'insult'),
+('褻', 'ragged'),
+('褻', 'slight'),
+('褻', 'treat with disrespect'),
+('襁', 'swaddling clothes'),
+('襄', 'aid'),
+('襄', 'assist'),
+('襄', 'help'),
+('襄', 'undress'),
+('襍', 'blended'),
+('襍', 'mingle'),
+('襍', 'mix'),
+('襍', 'mixed'),
+('襖', 'coat'),
+('襖', 'jacket'),
+('襖', 'outer garments'),
+('襜', 'apron'),
+('襜', 'flutter'),
+('襜', 'shaking or vibrating'),
+('襞', 'crease'),
+('襞', 'fold'),
+('襞', 'pleat'),
+('襟', 'collar'),
+('襟', 'lapel'),
+('襠', 'crotch or seat of pants'),
+('襠', 'pants'),
+('襢', 'bare'),
+('襢', 'strip'),
+('襤', 'ragged'),
+('襤', 'tattered'),
+('襤', 'threadbare'),
+('襦', 'fine silk fab'),
+('襦', 'jacket'),
+('襦', 'short coat'),
+('襪', 'footmuff'),
+('襪', 'sock'),
+('襪', 'socks'),
+('襪', 'stockings'),
+('襪', '버선'),
+('襭', 'tuck up hem of garment and wrap'),
+('襯', 'inner garments'),
+('襯', 'underwear'),
+('襲', 'attack'),
+('襲', 'inherit'),
+('襲', 'raid'),
+('襴', 'a one piece garment'),
+('襻', 'band'),
+('襻', 'belt'),
+('西', 'occident'),
+('西', 'west'),
+('西', 'west(ern)'),
+('西', 'western'),
+('西', 'westward'),
+('要', 'essential'),
+('要', 'importance'),
+('要', 'necessary'),
+('要', 'necessity'),
+('覃', 'extensive'),
+('覃', 'reach to'),
+('覃', 'spread to'),
+('覆', 'again'),
+('覆', 'cover'),
+('覆', 'reply'),
+('覆', 'return'),
+('覆', 'tip over'),
+('覇', 'domination'),
+('覇', 'rule by might rather than right'),
+('覈', 'consider'),
+('覈', 'examine'),
+('覈', 'investigate'),
+('覉', 'inn'),
+('覉', 'to lodge'),
+('覉', 'to travel'),
+('覉', 'variant of 羇'),
+('見', 'behold'),
+('見', 'humbly'),
+('見', 'observe'),
+('見', 'opinion'),
+('見', 'perceive'),
+('見', 'perspective'),
+('見', 'see'),
+('見', 'view'),
+('覌', 'appearance'),
+('覌', 'observe'),
+('覌', 'see'),
+('覌', 'view'),
+('規', 'customs'),
+('規', 'law'),
+('規', 'regulations'),
+('規', 'rule'),
+('規', 'rules'),
+('覓', 'search'),
+('覓', 'seek'),
+('視', 'inspect'),
+('視', 'look at'),
+('視', 'observe'),
+('視', 'see'),
+('覗', 'peek'),
+('覘', 'investigate'),
+('覘', 'peek'),
+('覘', 'spy on'),
+('覘', 'watch'),
+('覚', 'conscious'),
+('覚', 'to wake up from sleep'),
+('覡', 'wizard'),
+('覧', 'inspect'),
+('覧', 'look at'),
+('覧', 'perceive'),
+('覩', 'gaze at'),
+('覩', 'see'),
+('覩', 'witness'),
+('親', 'intimate'),
+('親', 'parent'),
+('親', 'parents'),
+('親', 'relative'),
+('親', 'relatives'),
+('覬', 'covet'),
+('覬', 'desire'),
+('覬', 'long for'),
+('覯', 'meet or see unexpectedly'),
+('覲', 'have imperial audience'),
+('観', 'appearance'),
+('観', 'observe'),
+('観', 'see'),
+('観', 'view'),
+('覷', 'peep at'),
+('覷', 'spy on'),
+('覷', 'watch'),
+('覺', 'conscious'),
+('覺', 'to wake up from sleep'),
+('覽', 'inspect'),
+('覽', 'look at'),
+('覽', 'perceive'),
+('覿', 'be admitted to audience'),
+('覿', 'interview'),
+('覿', 'see'),
+('觀', 'Taoist'),
+('觀', 'appearance'),
+('觀', 'looks'),
+('觀', 'observe'),
+('觀', 'outlook, point of view'),
+('觀', 'perspective'),
+('觀', 'see'),
+('觀', 'sight'),
+('觀', 'temple'),
+('觀', 'view'),
+('角', 'angle'),
+('角', 'corner'),
+('角', 'horn'),
+('角', 'point'),
+('觔', 'catty'),
+('觖', 'dissatisfied'),
+('觖', 'dissatisfied to criticize'),
+('觖', 'to long for'),
+('觚', 'goblet'),
+('觚', 'jug'),
+('觚', 'square'),
+('觚', 'winecup'),
+('觜', 'beak'),
+('觝', 'butt'),
+('觝', 'gore'),
+('觝', 'push'),
+('觝', 'resist'),
+('解', 'explain'),
+('解', 'loosen'),
+('解', 'mathematics'),
+('解', 'the value of x'),
+('解', 'unfasten'),
+('解', 'untie'),
+('觥', 'a cup made of horn obstinate'),
+('触', 'butt'),
+('触', 'gore'),
+('触', 'ram'),
+('触', 'touch'),
+('觫', 'to start'),
+('觫', 'tremble with fear'),
+('觱', 'chilly wind'),
+('觱', 'tartar horn'),
+('觳', 'a goblet'),
+('觳', 'an ancient measure'),
+('觳', 'arrowhead'),
+('觳', 'compare'),
+('觳', 'exhaust'),
+('觳', 'frightened'),
+('觳', 'horse'),
+('觳', 'mean'),
+('觳', 'measure'),
+('觴', 'feast'),
+('觴', 'propose toast'),
+('觴', 'wine vessel'),
+('觶', 'wine goblet made from horn'),
+('觶', '盞'),
+('觸', 'butt'),
+('觸', 'gore'),
+('觸', 'ram'),
+('觸', 'touch'),
+('言', 'demeanor'),
+('言', 'peaceful'),
+('言', 'say'),
+('言', 'speak'),
+('言', 'speech'),
+('言', 'word'),
+('言', 'words'),
+('訂', 'arrange'),
+('訂', 'draw up agreement'),
+('訃', 'give notice of death'),
+('訃', 'obituary'),
+('訇', 'the sound of a crash'),
+('計', 'calculation'),
+('計', 'count'),
+('計', 'plan'),
+('計', 'plot'),
+('計', 'scheme'),
+('計', 'strategem'),
+('計', 'total'),
+('訊', 'ask'),
+('訊', 'examine'),
+('訊', 'inquire'),
+('訊', 'reproach'),
+('訌', 'confusion'),
+('訌', 'internal strife'),
+('討', 'ask for'),
+('討', 'attack'),
+('討', 'beg'),
+('討', 'debate'),
+('討', 'demand'),
+('討', 'destroy'),
+('討', 'discuss'),
+('討', 'dun'),
+('討', 'marry'),
+('討', 'subdue'),
+('討', 'subjugate'),
+('討', 'to discuss'),
+('訏', 'big'),
+('訏', 'boast'),
+('訏', 'deceive'),
+('訏', 'exaggerate'),
+('訐', 'expose others secrets'),
+('訐', 'pry'),
+('訑', 'arrogant'),
+('訑', 'cheat'),
+('訑', 'deceive'),
+('訒', 'stammer'),
+('訓', 'exegesis'),
+('訓', 'instruct'),
+('訓', 'teach'),
+('訓', 'teaching'),
+('訕', 'abuse'),
+('訕', 'ridicule'),
+('訕', 'slander'),
+('訕', 'vilify'),
+('訖', 'conclude'),
+('訖', 'exhaust'),
+('訖', 'finish'),
+('訖', 'stop'),
+('託', 'commission'),
+('託', 'entrust'),
+('託', 'rely on'),
+('記', 'keep in mind'),
+('記', 'record'),
+('記', 'remember'),
+('訛', 'cheat'),
+('訛', 'erroneous'),
+('訛', 'mistaken'),
+('訛', 'swindle'),
+('訛', 'wrong'),
+('訝', 'be surprised'),
+('訝', 'express surprise'),
+('訟', 'accuse'),
+('訟', 'argue'),
+('訟', 'dispute'),
+('訟', 'litigate'),
+('訢', 'delighted'),
+('訢', 'happy'),
+('訢', 'pleased'),
+('訣', 'bid farewell'),
+('訣', 'take leave of'),
+('訥', 'mumble'),
+('訥', 'slow of speech'),
+('訥', 'stammer'),
+('訪', 'ask'),
+('訪', 'inquire'),
+('訪', 'visit'),
+('設', 'build'),
+('設', 'display'),
+('設', 'establish'),
+('設', 'particle of hypothesis'),
+('設', 'supposing'),
+('許', 'allow'),
+('許', 'approve'),
+('許', 'betroth'),
+('許', 'permit'),
+('許', 'promise'),
+('訳', 'decode'),
+('訳', 'encode'),
+('訳', 'translate'),
+('訴', 'accuse'),
+('訴', 'inform'),
+('訴', 'narrate'),
+('訴', 'sue'),
+('訶', 'abuse'),
+('訶', 'curse'),
+('訶', 'scold loudly'),
+('診', 'diagnose'),
+('診', 'examine patient'),
+('註', 'annotate'),
+('註', 'explain'),
+('註', 'make entry'),
+('証', 'confirm'),
+('証', 'proof'),
+('証', 'prove'),
+('証', 'verify'),
+('訾', 'bad-mouth'),
+('訾', 'criticize'),
+('訾', 'defects'),
+('詁', 'exegesis'),
+('詁', 'explain'),
+('詁', 'explanation'),
+('詆', 'condemn'),
+('詆', 'reproach'),
+('詆', 'slander'),
+('詋', 'to curse'),
+('詋', 'to swear an oath incantations'),
+('詎', 'at least'),
+('詎', 'few'),
+('詎', 'how'),
+('詎', 'interjection used to express surprise'),
+('詎', 'what'),
+('詐', 'cheat'),
+('詐', 'defraud'),
+('詐', 'swindle'),
+('詐', 'to feign'),
+('詐', 'trick'),
+('詑', 'cheat'),
+('詒', 'bequeath'),
+('詒', 'pass on to future generations'),
+('詔', 'decree'),
+('詔', 'imperial decree'),
+('詔', 'proclaim'),
+('評', 'appraise'),
+('評', 'criticize'),
+('評', 'evaluate'),
+('詖', 'argue'),
+('詖', 'biased'),
+('詖', 'crafty'),
+('詖', 'debate'),
+('詖', 'flatter'),
+('詖', 'one-sided'),
+('詗', 'shrewd'),
+('詗', 'to give information'),
+('詗', 'to spy'),
+('詘', 'bend'),
+('詘', 'crouch'),
+('詘', 'stoop'),
+('詘', 'to yield'),
+('詛', 'curse'),
+('詛', 'pledge'),
+('詛', 'swear'),
+('詞', 'expression'),
+('詞', 'phrase'),
+('詞', 'word'),
+('詞', 'words'),
+('詠', 'chant'),
+('詠', 'hum'),
+('詠', 'sing'),
+('詡', 'boast'),
+('詡', 'brag'),
+('詡', 'now'),
+('詡', 'popular'),
+('詡', 'to flatter'),
+('詡', 'well known'),
+('詢', 'ask about'),
+('詢', 'consult'),
+('詢', 'inquire into'),
+('詣', 'accomplishment'),
+('詣', 'achievement'),
+('詣', 'reach'),
+('試', 'examination'),
+('試', 'experiment'),
+('試', 'test'),
+('試', 'trial'),
+('試', 'try'),
+('詩', 'ode'),
+('詩', 'poem'),
+('詩', 'poetry'),
+('詩', 'verse'),
+('詫', 'exaggerated'),
+('詫', 'to brag'),
+('詫', 'to wonder at'),
+('詬', 'abuse'),
+('詬', 'berate'),
+('詬', 'insult'),
+('詬', 'scold'),
+('詭', 'cheat'),
+('詭', 'deceive'),
+('詭', 'defraud'),
+('詭', 'sly'),
+('詮', 'comment on'),
+('詮', 'explain'),
+('詮', 'expound'),
+('詰', 'interrogate'),
+('詰', 'question'),
+('話', 'dialect'),
+('話', 'language'),
+('話', 'speak'),
+('話', 'speech'),
+('話', 'talk'),
+('該', 'need to'),
+('該', 'ought to'),
+('該', 'should'),
+('詳', 'complete'),
+('詳', 'detailed'),
+('詳', 'thorough'),
+('詵', 'inquire'),
+('詵', 'numerous'),
+('詵', 'question'),
+('詹', 'arrive'),
+('詹', 'surname'),
+('詹', 'talk too much'),
+('詹', 'verbose'),
+('詻', 'quarrel'),
+('詼', 'joke with'),
+('詼', 'mock'),
+('詼', 'ridicule'),
+('詼', 'tease'),
+('詿', 'deceive'),
+('詿', 'error'),
+('詿', 'mislead'),
+('詿', 'mistake'),
+('誂', 'tempt'),
+('誂', '꾀다'),
+('誄', 'eulogize'),
+('誄', 'praise the dead'),
+('誅', 'execute'),
+('誅', 'kill'),
+('誅', 'punish'),
+('誅', 'put to death'),
+('誆', 'cheat'),
+('誆', 'lie'),
+('誆', 'swindle'),
+('誇', 'boast'),
+('誇', 'brag'),
+('誇', 'exaggerate'),
+('誇', 'flaunt'),
+('誉', 'fame'),
+('誉', 'praise'),
+('誉', 'reputation'),
+('誌', 'magazine'),
+('誌', 'record'),
+('誌', 'write down'),
+('認', 'approval'),
+('認', 'authorization'),
+('認', 'know'),
+('認', 'recognition'),
+('認', 'recognize'),
+('認', 'understand'),
+('誑', 'cheat'),
+('誑', 'deceive'),
+('誑', 'delude'),
+('誑', 'lie'),
+('誒', 'an exclamation of confirmation'),
+('誒', 'sigh'),
+('誓', 'oath'),
+('誓', 'pledge'),
+('誓', 'swear'),
+('誕', 'birth'),
+('誕', 'give birth'),
+('誕', 'to bear children'),
+('誘', 'entice'),
+('誘', 'guide'),
+('誘', 'induce'),
+('誘', 'persuade'),
+('誚', 'blame'),
+('誚', 'criticize'),
+('誚', 'ridicule'),
+('誚', 'scold'),
+('語', 'expression'),
+('語', 'language'),
+('語', 'saying'),
+('語', 'words'),
+('誠', 'honest'),
+('誠', 'real'),
+('誠', 'sincere'),
+('誠', 'sincerity'),
+('誠', 'true'),
+('誡', 'admonish'),
+('誡', 'warn'),
+('誡', 'warning'),
+('誣', 'defame'),
+('誣', 'make false accusation'),
+('誤', 'blunder'),
+('誤', 'doubt'),
+('誤', 'err'),
+('誤', 'error'),
+('誤', 'interfere'),
+('誤', 'make mistake'),
+('誤', 'suspicion'),
+('誥', 'admonish'),
+('誥', 'inform'),
+('誥', 'notify'),
+('誥', 'order'),
+('誦', 'aloud'),
+('誦', 'chant'),
+('誦', 'read'),
+('誦', 'recite'),
+('誦', 'repeat'),
+('誧', 'huge'),
+('誧', 'to admonish'),
+('誨', 'encourage'),
+('誨', 'instruct'),
+('誨', 'teach'),
+('誨', 'urge'),
+('說', 'explain'),
+('說', 'happy'),
+('說', 'opinion'),
+('說', 'persuade'),
+('說', 'rumour'),
+('說', 'say'),
+('說', 'scold'),
+('說', 'speak'),
+('說', 'talk'),
+('說', 'theory'),
+('說', 'upbraid'),
+('說', 'view'),
+('説', 'speak'),
+('読', 'pronounce'),
+('読', 'read'),
+('読', 'study'),
+('誰', 'who? whom? whose? anyone?'),
+('課', 'classwork'),
+('課', 'course'),
+('課', 'lesson'),
+('誶', 'berate'),
+('誶', 'interrogate'),
+('誶', 'speak ill of'),
+('誶', 'vilify'),
+('誹', 'condemn'),
+('誹', 'slander'),
+('誹', 'vilify'),
+('誼', 'appropriate'),
+('誼', 'friendship'),
+('誼', 'suitable'),
+('誾', 'gentle'),
+('誾', 'harmonious'),
+('誾', 'peaceful'),
+('誾', 'respectful'),
+('誾', 'speak gently'),
+('調', 'change'),
+('調', 'move'),
+('調', 'transfer'),
+('調', 'tune'),
+('諂', 'flatter'),
+('諂', 'toady'),
+('諂', 'truckle'),
+('諄', 'earnest'),
+('諄', 'earnestly'),
+('諄', 'patient'),
+('談', 'conversation'),
+('談', 'surname'),
+('談', 'talk'),
+('諉', 'lay blame on others'),
+('諉', 'pass buck'),
+('請', 'ask'),
+('請', 'invite'),
+('請', 'please'),
+('請', 'request'),
+('諍', 'to expostulate'),
+('諍', 'to remonstrate'),
+('諏', 'choose'),
+('諏', 'confer'),
+('諏', 'consult'),
+('諏', 'select'),
+('諑', 'gossip'),
+('諑', 'rumors'),
+('諑', 'slander'),
+('諒', 'excuse'),
+('諒', 'forgive'),
+('諒', 'guess'),
+('諒', 'presume'),
+('論', 'argument'),
+('論', 'debate'),
+('論', 'discourse'),
+('論', 'discuss'),
+('論', 'discussion'),
+('諗', 'consult carefully with'),
+('諗', 'counsel'),
+('諛', 'flatter'),
+('諛', 'truckle'),
+('諜', 'an intelligence report'),
+('諜', 'spying'),
+('諜', 'to spy'),
+('諝', 'discrimination'),
+('諝', 'knowledge'),
+('諝', 'treachery'),
+('諞', 'boast'),
+('諞', 'brag'),
+('諞', 'quibble'),
+('諟', 'honest'),
+('諟', 'to consider'),
+('諟', 'to examine'),
+('諠', 'forget'),
+('諠', 'noisy'),
+('諠', 'uproarious'),
+('諡', 'posthumous name'),
+('諡', 'posthumous title'),
+('諢', 'joke'),
+('諢', 'jokes'),
+('諢', 'obscene jests'),
+('諤', 'honest speech'),
+('諤', 'straightforward'),
+('諦', 'attentive'),
+('諦', 'careful'),
+('諧', 'agree'),
+('諧', 'harmonize'),
+('諧', 'jest'),
+('諧', 'joke'),
+('諫', 'admonish'),
+('諫', 'remonstrate'),
+('諭', 'edict'),
+('諭', 'instruct'),
+('諭', 'proclaim'),
+('諮', 'communicate in'),
+('諮', 'confer'),
+('諮', 'consult'),
+('諱', 'conceal'),
+('諱', 'regard as taboo'),
+('諱', 'shun'),
+('諳', 'fully acquainted with'),
+('諳', 'versed in'),
+('諴', 'in agreement'),
+('諴', 'in harmony'),
+('諴', 'incere'),
+('諶', 'believe'),
+('諶', 'faithful'),
+('諶', 'sincere'),
+('諶', 'surname'),
+('諶', 'truth'),
+('諷', 'incant'),
+('諷', 'recite'),
+('諷', 'satirize'),
+('諸', 'several'),
+('諸', 'various'),
+('諺', 'maxim'),
+('諺', 'proverb'),
+('諼', 'cheat'),
+('諼', 'deceive'),
+('諼', 'forget'),
+('諼', 'lie'),
+('諾', 'approve'),
+('諾', 'assent'),
+('諾', 'promise'),
+('謀', 'plan'),
+('謀', 'scheme'),
+('謀', 'stratagem'),
+('謀', 'strategem'),
+('謁', 'pay respects to'),
+('謁', 'visit'),
+('謂', 'be called'),
+('謂', 'call'),
+('謂', 'name'),
+('謂', 'say'),
+('謂', 'tell'),
+('謄', 'copy'),
+('謄', 'mimeograph'),
+('謄', 'transcribe'),
+('謇', 'speak out boldly'),
+('謇', 'stutter'),
+('謊', 'lie'),
+('謌', 'defame'),
+('謌', 'slander'),
+('謎', 'conundrum'),
+('謎', 'puzzle'),
+('謎', 'riddle'),
+('謐', 'calm'),
+('謐', 'cautious'),
+('謐', 'quiet'),
+('謐', 'still'),
+('謑', 'disgrace'),
+('謑', 'shame'),
+('謔', 'jeer'),
+('謖', 'raise up'),
+('謖', 'rise up'),
+('謗', 'libel'),
+('謗', 'slander'),
+('謗', 'slandering'),
+('謙', 'decline'),
+('謙', 'humble'),
+('謙', 'modest'),
+('謙', 'refuse'),
+('謚', 'to confer posthumous titles'),
+('講', 'a recitation or recital'),
+('講', 'discuss'),
+('講', 'explain'),
+('講', 'lecture'),
+('講', 'reading'),
+('講', 'talk'),
+('謝', 'apologize'),
+('謝', 'decline'),
+('謝', 'thank'),
+('謠', 'ballad'),
+('謠', 'folksong'),
+('謠', 'rumor'),
+('謠', 'sing'),
+('謠', 'song'),
+('謦', 't speak softly'),
+('謨', 'be without'),
+('謨', 'plan'),
+('謨', 'scheme'),
+('謫', 'blame'),
+('謫', 'charge'),
+('謫', 'demote'),
+('謫', 'disgrace'),
+('謫', 'punish'),
+('謬', 'erroneous'),
+('謬', 'error'),
+('謬', 'exaggeration'),
+('謬', 'false'),
+('謬', 'wrong'),
+('謭', 'shallow'),
+('謭', 'stupid'),
+('謳', 'songs'),
+('謳', 'to sing'),
+('謷', 'arrogant'),
+('謷', 'big'),
+('謷', 'huge'),
+('謷', 'slander'),
+('謷', 'to revile'),
+('謹', 'attentive'),
+('謹', 'cautious'),
+('謹', 'prudent'),
+('謾', 'deceive'),
+('謾', 'insult'),
+('譁', 'clamor'),
+('譁', 'hubbub'),
+('譁', 'noise'),
+('譁', 'uproar'),
+('譈', 'hate'),
+('譈', 'resent'),
+('證', 'evidence'),
+('證', 'proof'),
+('證', 'proof, evidence'),
+('證', 'testify'),
+('證', 'verify'),
+('譌', 'erronious'),
+('譌', 'false'),
+('譎', 'crafty'),
+('譎', 'cunning'),
+('譎', 'sly'),
+('譎', 'wily'),
+('譏', 'inspect'),
+('譏', 'jeer'),
+('譏', 'mock'),
+('譏', 'ridicule'),
+('譔', 'compose'),
+('譔', 'eulogize'),
+('譔', 'write'),
+('譖', 'to slander'),
+('識', 'know'),
+('識', 'knowing'),
+('識', 'mark'),
+('識', 'recognize'),
+('識', 'understand'),
+('識', 'writing'),
+('譙', 'surname'),
+('譙', 'tower'),
+('譚', 'surname'),
+('譚', 'to talk'),
+('譜', 'list'),
+('譜', 'musical'),
+('譜', 'musical score'),
+('譜', 'register'),
+('譜', 'score'),
+('譜', 'table'),
+('譟', 'clamor'),
+('譟', 'din'),
+('譟', 'noise'),
+('譟', 'slander'),
+('警', 'alarm'),
+('警', 'alert'),
+('警', 'guard'),
+('警', 'watch'),
+('譫', 'incoherent talk'),
+('譫', 'talkative'),
+('譬', 'example'),
+('譬', 'metaphor'),
+('譬', 'simile'),
+('譯', 'decode'),
+('譯', 'encode'),
+('譯', 'translate'),
+('議', 'consult'),
+('議', 'discuss'),
+('議', 'talk over'),
+('譴', 'abuse'),
+('譴', 'reprimand'),
+('譴', 'scold'),
+('護', 'defend'),
+('護', 'guard'),
+('護', 'protect'),
+('護', 'shelter'),
+('譽', 'fame'),
+('譽', 'praise'),
+('譽', 'reputation'),
+('讀', 'clause'),
+('讀', 'pause'),
+('讀', 'pronounce'),
+('讀', 'read'),
+('讀', 'short'),
+('讀', 'study'),
+('讃', 'commend'),
+('讃', 'eulogize'),
+('讃', 'praise'),
+('變', 'alter'),
+('變', 'change'),
+('變', 'rebel'),
+('變', 'transform'),
+('讌', 'a feast'),
+('讌', 'banquet'),
+('讌', 'feast'),
+('讌', 'to entertain'),
+('讎', 'enemy'),
+('讎', 'opponent'),
+('讎', 'rival'),
+('讐', 'enemy'),
+('讐', 'opponent'),
+('讐', 'rival'),
+('讒', 'defame'),
+('讒', 'misrepresent'),
+('讒', 'slander'),
+('讓', 'allow'),
+('讓', 'concede'),
+('讓', 'permit'),
+('讓', 'yield'),
+('讖', 'hint'),
+('讖', 'omen'),
+('讖', 'prophecy'),
+('讙', 'cheer'),
+('讙', 'noise'),
+('讙', 'noisy'),
+('讚', 'commend'),
+('讚', 'eulogize'),
+('讚', 'laud'),
+('讚', 'praise'),
+('讜', 'advice'),
+('讜', 'counsel'),
+('讜', 'speak out'),
+('讞', 'a verdict'),
+('讞', 'decision'),
+('讞', 'judge'),
+('讞', 'to decide'),
+('讬', 'commission'),
+('讬', 'entrust'),
+('讬', 'rely on'),
+('谞', 'discrimination'),
+('谞', 'knowledge'),
+('谞', 'treachery'),
+('谷', 'China'),
+('谷', 'Tuyuhun'),
+('谷', 'Xiongnu'),
+('谷', 'ancient'),
+('谷', 'gorge'),
+('谷', 'name'),
+('谷', 'nomadic'),
+('谷', 'northwestern'),
+('谷', 'official'),
+('谷', 'people'),
+('谷', 'ravine'),
+('谷', 'title'),
+('谷', 'valley'),
+('谷', '녹려'),
+('谷', '토욕혼'),
+('谿', 'gorge'),
+('谿', 'mountain stream'),
+('谿', 'valley'),
+('豁', 'clear'),
+('豁', 'exempt'),
+('豁', 'open'),
+('豁', 'open up'),
+('豁', 'wide'),
+('豆', 'bean'),
+('豆', 'bean-shaped'),
+('豆', 'beans'),
+('豆', 'peas'),
+('豇', 'a small kidney bean'),
+('豇', 'cowpea'),
+('豈', 'how'),
+('豈', 'how? what?'),
+('豈', 'what'),
+('豉', 'fermented beans'),
+('豊', 'abundant'),
+('豊', 'bountiful'),
+('豊', 'lush'),
+('豊', 'plenty'),
+('豌', 'peas'),
+('豎', 'perpendicular'),
+('豎', 'upright'),
+('豎', 'vertical'),
+('豐', 'abundant'),
+('豐', 'bountiful'),
+('豐', 'hexagram'),
+('豐', 'lush'),
+('豐', 'plenty'),
+('豕', 'KangXi radical 152'),
+('豕', 'a pig'),
+('豕', 'boar'),
+('豖', 'a shackled pig'),
+('豚', 'pig'),
+('豚', 'small pig'),
+('豚', 'suckling pig'),
+('豚', 'suffle'),
+('象', 'appearance'),
+('象', 'elephant'),
+('象', 'figure'),
+('象', 'image'),
+('象', 'ivory'),
+('象', 'shape'),
+('豢', 'domestic animals'),
+('豢', 'feed'),
+('豢', 'raise'),
+('豣', 'pig of 3 years'),
+('豨', 'hog'),
+('豨', 'pig'),
+('豪', 'brave'),
+('豪', 'chivalrous'),
+('豪', 'heroic'),
+('豫', 'beforehand'),
+('豬', 'hog'),
+('豬', 'pig'),
+('豳', 'a Zhou-dynasty state'),
+('豸', 'a legendary beast'),
+('豸', 'legless insects'),
+('豸', 'radical 153'),
+('豹', 'leopard'),
+('豹', 'panther'),
+('豹', 'surname'),
+('豺', 'cruel'),
+('豺', 'dhole'),
+('豺', 'mean'),
+('豺', 'wicked'),
+('豺', 'wolf'),
+('貂', 'marten'),
+('貂', 'mink'),
+('貂', 'sable'),
+('貂', '담비'),
+('貅', 'brave'),
+('貅', 'courageous'),
+('貅', 'fierce'),
+('貊', 'ancient tribe in northeastern China'),
+('貊', 'leopard'),
+('貌', 'appearance'),
+('貌', 'countenance'),
+('貍', 'a fox-like animal'),
+('貒', 'badger'),
+('貒', '오소리'),
+('貓', 'cat'),
+('貔', 'fox'),
+('貔', 'leopard'),
+('貔', 'panther'),
+('貘', 'tapir (a wild boar of  south America)'),
+('貘', 'the panther'),
+('貘', 'the tapir'),
+('貙', 'bobcat'),
+('貙', 'lynx'),
+('貙', '스라소니'),
+('貝', 'clam'),
+('貝', 'currency'),
+('貝', 'money'),
+('貝', 'sea shell'),
+('貝', 'shellfish'),
+('貞', 'chaste'),
+('貞', 'loyal'),
+('貞', 'pure'),
+('貞', 'virtuous'),
+('負', 'bear'),
+('負', 'burden'),
+('負', 'carry'),
+('負', 'load'),
+('財', 'property'),
+('財', 'riches'),
+('財', 'valuables'),
+('財', 'wealth'),
+('貢', 'dedicate'),
+('貢', 'devote'),
+('貢', 'gifts'),
+('貢', 'give'),
+('貢', 'offer'),
+('貢', 'offer tribute'),
+('貢', 'present'),
+('貢', 'tribute'),
+('貧', 'impoverished'),
+('貧', 'needy'),
+('貧', 'poor'),
+('貧', 'poverty'),
+('貨', 'commodities'),
+('貨', 'goods'),
+('貨', 'products'),
+('販', 'hawker'),
+('販', 'peddler'),
+('販', 'street merchant'),
+('貪', 'avarice'),
+('貪', 'covet'),
+('貪', 'covetous'),
+('貪', 'covetousness'),
+('貪', 'greed'),
+('貪', 'greedy'),
+('貫', 'a string of 1000 coins'),
+('貫', 'string'),
+('貫', 'thread'),
+('貫', 'to go through'),
+('責', 'debt'),
+('責', 'duty'),
+('責', 'ones responsibility'),
+('責', 'reproach'),
+('貭', '質'),
+('貯', 'hoard'),
+('貯', 'stack up'),
+('貯', 'stockpile'),
+('貯', 'store'),
+('貰', 'borrow'),
+('貰', 'loan'),
+('貰', 'pardon'),
+('貰', 'rent'),
+('貲', 'property'),
+('貲', 'to count'),
+('貲', 'wealth'),
+('貳', 'number two'),
+('貴', 'costly'),
+('貴', 'expensive'),
+('貴', 'precious'),
+('貴', 'valuable'),
+('貶', 'censure'),
+('貶', 'criticize'),
+('貶', 'decrease'),
+('貶', 'lower'),
+('買', 'bribe'),
+('買', 'buy'),
+('買', 'persuade'),
+('買', 'purchase'),
+('買', 'river'),
+('買', 'water'),
+('貸', 'borrow'),
+('貸', 'lend'),
+('貸', 'pardon'),
+('貺', 'bestow'),
+('貺', 'give'),
+('貺', 'grant'),
+('貺', 'surname'),
+('費', 'cost'),
+('費', 'expenditures'),
+('費', 'expenses'),
+('費', 'fee'),
+('費', 'spend'),
+('貼', 'adhere'),
+('貼', 'attached to'),
+('貼', 'paste to'),
+('貼', 'stick'),
+('貼', 'stick on'),
+('貽', 'bequeath'),
+('貽', 'give to'),
+('貽', 'hand down'),
+('貿', 'barter'),
+('貿', 'mixed'),
+('貿', 'rashly'),
+('貿', 'trade'),
+('賀', 'congratulate'),
+('賀', 'send present'),
+('賁', 'energetic'),
+('賁', 'forge ahead'),
+('賁', 'surname'),
+('賂', 'bribe'),
+('賂', 'bribery'),
+('賂', 'give present'),
+('賃', 'hire'),
+('賃', 'hired person'),
+('賃', 'rent'),
+('賄', 'belongings'),
+('賄', 'bribe'),
+('賄', 'bribery'),
+('賄', 'bribes'),
+('賄', 'property'),
+('賄', 'riches'),
+('賄', 'wealth'),
+('資', 'capital'),
+('資', 'foundation'),
+('資', 'property'),
+('資', 'wealth'),
+('賈', 'buy'),
+('賈', 'merchant'),
+('賈', 'surname'),
+('賈', 'trade'),
+('賊', 'thief'),
+('賊', 'traitor'),
+('賑', 'aid distressed'),
+('賑', 'relieve'),
+('賑', 'rich'),
+('賓', 'guest'),
+('賓', 'submit'),
+('賓', 'surname'),
+('賓', 'visitor'),
+('賔', 'guest'),
+('賔', 'submit'),
+('賔', 'surname'),
+('賔', 'visitor'),
+('賙', 'give for charity'),
+('賚', 'confer'),
+('賚', 'give'),
+('賚', 'present'),
+('賚', 'surname'),
+('賛', 'aid'),
+('賛', 'assist'),
+('賛', 'help'),
+('賛', 'support'),
+('賜', 'appoint'),
+('賜', 'bestow favors'),
+('賜', 'give'),
+('賞', 'appreciate'),
+('賞', 'bestow'),
+('賞', 'grant'),
+('賞', 'prize'),
+('賞', 'reward'),
+('賠', 'indemnify'),
+('賠', 'suffer loss'),
+('賡', 'continue'),
+('賢', 'able'),
+('賢', 'good'),
+('賢', 'virtuous'),
+('賢', 'worthy'),
+('賣', 'betray'),
+('賣', 'sell'),
+('賣', 'show off'),
+('賤', 'cheap'),
+('賤', 'low'),
+('賤', 'mean'),
+('賤', 'worthless'),
+('賦', 'army'),
+('賦', 'bestow'),
+('賦', 'diffuse'),
+('賦', 'endow'),
+('賦', 'give'),
+('賦', 'tax'),
+('質', 'disposition'),
+('質', 'gift'),
+('質', 'hostage'),
+('質', 'material'),
+('質', 'matter'),
+('質', 'nature'),
+('質', 'quality'),
+('質', 'substance'),
+('賬', 'accounts'),
+('賬', 'bill'),
+('賬', 'credit'),
+('賬', 'debt'),
+('賭', 'bet'),
+('賭', 'compete'),
+('賭', 'gamble'),
+('賭', 'wager'),
+('賴', 'accuse'),
+('賴', 'accuse falsely'),
+('賴', 'depend'),
+('賴', 'depend on'),
+('賴', 'falsely'),
+('賴', 'rely'),
+('賻', 'gift of money help pay funeral'),
+('購', 'buy'),
+('購', 'hire'),
+('購', 'purchase'),
+('賽', 'compete'),
+('賽', 'contend'),
+('賽', 'contest'),
+('賽', 'race'),
+('賾', 'abstruse'),
+('賾', 'deep'),
+('賾', 'profound'),
+('贄', 'gift given'),
+('贄', 'gift superior'),
+('贅', 'superfluous'),
+('贅', 'unnecessary'),
+('贇', 'affable'),
+('贇', 'agreeable'),
+('贇', 'pleasant'),
+('贈', 'bestow'),
+('贈', 'confer'),
+('贈', 'give present'),
+('贊', 'aid'),
+('贊', 'assist'),
+('贊', 'help'),
+('贊', 'support'),
+('贋', 'bogus'),
+('贋', 'counterfeit'),
+('贋', 'false'),
+('贋', 'sham'),
+('贍', 'aid'),
+('贍', 'elegant'),
+('贍', 'rich'),
+('贍', 'support'),
+('贍', 'to be sufficient'),
+('贏', 'gain'),
+('贏', 'profit'),
+('贏', 'surplus'),
+('贏', 'win'),
+('贐', 'farewell present'),
+('贓', 'booty'),
+('贓', 'bribe'),
+('贓', 'good'),
+('贓', 'loot'),
+('贓', 'stolen'),
+('贓', 'stolen goods'),
+('贔', 'strong'),
+('贖', 'atone for'),
+('贖', 'buy'),
+('贖', 'ransome'),
+('贖', 'redeem'),
+('贛', 'Jiangxi province'),
+('贛', 'places therein'),
+('贜', 'booty'),
+('贜', 'bribe'),
+('贜', 'loot'),
+('贜', 'stolen goods'),
+('赒', 'give for charity'),
+('赟', 'affable'),
+('赟', 'agreeable'),
+('赟', 'pleasant'),
+('赤', 'bare'),
+('赤', 'communist'),
+('赤', 'red'),
+('赦', 'forgive'),
+('赦', 'pardon'),
+('赦', 'remit'),
+('赧', 'blush'),
+('赧', 'turn red'),
+('赫', 'bright'),
+('赫', 'glowing'),
+('赫', 'radiant'),
+('赭', 'hematite'),
+('赭', 'ochre'),
+('赭', 'reddish brown'),
+('走', 'go on foot'),
+('走', 'leave'),
+('走', 'run'),
+('走', 'walk'),
+('赳', 'grand'),
+('赳', 'valiant'),
+('赴', 'attend'),
+('赴', 'be'),
+('赴', 'be present'),
+('赴', 'go to'),
+('赴', 'present'),
+('赶', 'drive away'),
+('赶', 'expel'),
+('赶', 'follow'),
+('赶', 'pursue'),
+('起', 'begin'),
+('起', 'go up'),
+('起', 'rise'),
+('起', 'stand up'),
+('起', 'wake up'),
+('趁', 'avail oneself'),
+('趁', 'take advantage of'),
+('超', 'jump over'),
+('超', 'leap over'),
+('超', 'surpass'),
+('越', 'bottom'),
+('越', 'exceed'),
+('越', 'go beyond'),
+('越', 'hole'),
+('越', 'musical instrument'),
+('越', 'pass over'),
+('越', 'se'),
+('越', 'small'),
+('越', 'the more ...'),
+('趑', 'cant move'),
+('趑', 'to falter'),
+('趙', 'ancient state'),
+('趙', 'surname'),
+('趣', 'what attracts ones attention'),
+('趨', 'be attracted to'),
+('趨', 'hasten'),
+('趨', 'hurry'),
+('趫', 'brave'),
+('趫', 'nimble'),
+('趫', 'robust'),
+('趲', 'go in hurry'),
+('趲', 'hasten'),
+('趲', 'urge'),
+('足', 'attain'),
+('足', 'enough'),
+('足', 'foot'),
+('足', 'satisfy'),
+('趵', 'noise of tramping feet'),
+('趺', 'back of the foo'),
+('趺', 'sit cross-legged'),
+('趼', 'callous skin on hands or feet. blisters'),
+('趾', 'footprints'),
+('趾', 'toe'),
+('趾', 'tracks'),
+('趿', 'slipshod'),
+('趿', 'to tread on'),
+('跂', 'crawling'),
+('跂', 'creeping'),
+('跅', 'lax'),
+('跅', 'reject'),
+('跆', 'kick'),
+('跆', 'trample'),
+('跋', 'colophon'),
+('跋', 'epilogue'),
+('跋', 'go by foot'),
+('跌', 'fall down'),
+('跌', 'slip'),
+('跌', 'stamp'),
+('跌', 'stumble'),
+('跎', 'falter'),
+('跎', 'slip'),
+('跎', 'stumble'),
+('跎', 'vacillate'),
+('跏', 'sit cross-legged'),
+('跏', 'squat'),
+('跕', 'shuffle'),
+('跖', 'sole(of the foot)'),
+('跗', 'the instep'),
+('跚', 'limp'),
+('跚', 'stagger'),
+('跛', 'lame'),
+('距', 'birds spur'),
+('距', 'distance'),
+('跟', 'accompany'),
+('跟', 'heel'),
+('跟', 'to follow'),
+('跟', 'with'),
+('跡', 'search'),
+('跡', 'trace'),
+('跡', 'track'),
+('跣', 'bare footed'),
+('跤', 'fall down'),
+('跤', 'stumble'),
+('跤', 'wrestle'),
+('跨', 'bestride'),
+('跨', 'carry'),
+('跨', 'ride'),
+('跨', 'straddle'),
+('跪', 'kneel'),
+('跫', 'sound of footsteps'),
+('跬', 'a stride equal to half a pace'),
+('跬', 'few'),
+('跬', 'near'),
+('跬', 'to step'),
+('路', 'avenue'),
+('路', 'journey'),
+('路', 'path'),
+('路', 'road'),
+('路', 'route'),
+('路', 'street'),
+('跱', 'stop'),
+('跳', 'bounce'),
+('跳', 'dance'),
+('跳', 'jump'),
+('跳', 'leap'),
+('跳', 'vault'),
+('践', 'trample'),
+('践', 'tread upon'),
+('践', 'walk on'),
+('跼', 'bent'),
+('跼', 'contract'),
+('跼', 'crouched'),
+('跼', 'stooped'),
+('跽', 'to go down on hands and knees'),
+('跽', 'to kneel for a long time'),
+('踆', 'squat'),
+('踈', 'careless'),
+('踈', 'lax'),
+('踈', 'neglect'),
+('踉', 'hop'),
+('踉', 'hurriedly'),
+('踉', 'jump'),
+('踉', 'urgently'),
+('踏', 'step on'),
+('踏', 'trample'),
+('踏', 'tread'),
+('踏', 'tread on'),
+('踏', 'walk'),
+('踐', 'trample'),
+('踐', 'tread upon'),
+('踐', 'walk on'),
+('踔', 'to excel'),
+('踔', 'to get ahead'),
+('踔', 'to stride'),
+('踖', 'step'),
+('踖', 'tread'),
+('踖', '밟다'),
+('踝', 'ankle'),
+('踞', 'crouch'),
+('踞', 'occupy'),
+('踞', 'sit'),
+('踞', 'squat'),
+('踟', 'embarrassed'),
+('踟', 'hesitate'),
+('踟', 'undecided'),
+('踡', 'bend'),
+('踡', 'heel'),
+('踡', '구부리다'),
+('踡', '굽다'),
+('踣', 'to stumble and fall prone stiff in death'),
+('踦', 'foot'),
+('踦', '발'),
+('踧', 'flat'),
+('踧', 'level'),
+('踩', 'step on'),
+('踪', 'footprint'),
+('踪', 'footprints'),
+('踪', 'trace'),
+('踪', 'traces'),
+('踪', 'track'),
+('踪', 'tracks'),
+('踰', 'cross over'),
+('踰', 'exceed'),
+('踰', 'transgress'),
+('踱', 'pace'),
+('踱', 'stroll'),
+('踱', 'walk slowly'),
+('踴', 'jump'),
+('踴', 'leap'),
+('踵', 'call on'),
+('踵', 'follow'),
+('踵', 'heel'),
+('踵', 'visit'),
+('踶', 'paw'),
+('踹', 'kick'),
+('踹', 'to crush'),
+('踹', 'trample'),
+('踹', 'tread on'),
+('踽', 'self-reliant'),
+('踽', 'to walk alone'),
+('蹀', 'to dance'),
+('蹀', 'to put the foot down'),
+('蹀', 'to skip'),
+('蹁', 'knee'),
+('蹁', 'to walk with a limp'),
+('蹁', 'totter'),
+('蹂', 'trample under foot'),
+('蹂', 'tread on'),
+('蹄', 'hoof'),
+('蹄', 'leg of pork'),
+('蹄', 'little witch'),
+('蹇', 'crippled'),
+('蹇', 'lame'),
+('蹇', 'unlucky'),
+('蹈', 'dance'),
+('蹈', 'stamp feet'),
+('蹉', 'error'),
+('蹉', 'failure'),
+('蹉', 'mistake'),
+('蹉', 'slip'),
+('蹊', 'footpath'),
+('蹊', 'track'),
+('蹊', 'trail'),
+('蹋', 'on'),
+('蹋', 'step'),
+('蹋', 'tread'),
+('蹌', 'walk rapidly'),
+('蹏', 'hoof'),
+('蹏', 'leg of pork'),
+('蹏', 'little witch a horse'),
+('蹕', 'clear way'),
+('蹕', 'emp'),
+('蹕', 'make room for'),
+('蹙', 'grieve'),
+('蹙', 'lament'),
+('蹙', 'suddenly'),
+('蹙', 'urgent'),
+('蹜', 'walk carefully'),
+('蹟', 'footprints'),
+('蹟', 'trace'),
+('蹟', 'tracks'),
+('蹠', 'sole'),
+('蹠', 'step on'),
+('蹠', 'tread'),
+('蹠', 'tread on'),
+('蹢', 'hesitate'),
+('蹢', 'hoof'),
+('蹣', 'to jump over'),
+('蹣', 'to limp'),
+('蹤', 'footprints'),
+('蹤', 'traces'),
+('蹤', 'tracks'),
+('蹩', 'to limp'),
+('蹭', 'dilly-dally'),
+('蹭', 'procrastinate'),
+('蹭', 'to shuffle'),
+('蹯', 'an animals paws'),
+('蹰', 'falter'),
+('蹰', 'hesitate'),
+('蹰', 'waver'),
+('蹲', 'crouch'),
+('蹲', 'idle about'),
+('蹲', 'squat'),
+('蹴', 'kick'),
+('蹴', 'leap'),
+('蹴', 'solemn'),
+('蹴', 'tread on'),
+('蹶', 'fall down'),
+('蹶', 'move'),
+('蹶', 'stumble'),
+('蹶', 'trample'),
+('蹺', 'raise ones foot'),
+('蹻', 'arrogant'),
+('蹼', 'webbed feet of waterfowl'),
+('躁', 'excited'),
+('躁', 'irritable'),
+('躁', 'tense'),
+('躅', 'falter'),
+('躅', 'hesitate'),
+('躅', 'walk carefully'),
+('躇', 'be undecided'),
+('躇', 'falter'),
+('躇', 'hesitate'),
+('躉', 'sell or buy wholesale'),
+('躉', 'store'),
+('躊', 'falter'),
+('躊', 'hesitate'),
+('躊', 'self-satisfied'),
+('躊', 'smug'),
+('躋', 'ascend'),
+('躋', 'go up'),
+('躋', 'rise'),
+('躍', 'frolic'),
+('躍', 'jump'),
+('躍', 'leap'),
+('躍', 'skip'),
+('躐', 'to step across'),
+('躐', 'to stride over'),
+('躑', 'be irresolute'),
+('躑', 'hesitate'),
+('躑', 'waver'),
+('躒', 'move'),
+('躒', 'walk'),
+('躓', 'be frustrated'),
+('躓', 'fail'),
+('躓', 'stumble'),
+('躓', 'totter'),
+('躔', 'follow in'),
+('躔', 'imitate'),
+('躔', 'path'),
+('躔', 'rut'),
+('躙', 'oppress'),
+('躙', 'overrun'),
+('躙', 'trample down'),
+('躚', 'revolve'),
+('躚', 'walk around'),
+('躚', 'wander about'),
+('躞', 'to walk'),
+('躡', 'follow'),
+('躡', 'step on'),
+('躡', 'track'),
+('躡', 'tread'),
+('躧', 'sandals'),
+('躧', 'tread'),
+('躩', 'jump'),
+('躩', 'scuttle'),
+('躩', 'short steps'),
+('躩', 'sky'),
+('躩', 'take quick'),
+('躪', 'oppress'),
+('躪', 'overrun'),
+('躪', 'trample'),
+('躪', 'trample down'),
+('身', 'body'),
+('身', 'hull'),
+('身', 'rad. no. 158'),
+('身', 'trunk'),
+('躬', 'body'),
+('躬', 'in person'),
+('躬', 'personally'),
+('躱', 'hide'),
+('躳', 'body'),
+('躳', 'self'),
+('軀', 'body'),
+('軆', 'body'),
+('軆', 'class'),
+('軆', 'group'),
+('軆', 'unit'),
+('車', 'automobile'),
+('車', 'car'),
+('車', 'carry in cart'),
+('車', 'cart'),
+('車', 'machinery'),
+('車', 'vehicle'),
+('車', 'wheel'),
+('軋', 'crush by weight'),
+('軋', 'grind'),
+('軌', 'path'),
+('軌', 'rut'),
+('軌', 'track'),
+('軍', 'army'),
+('軍', 'military'),
+('軍', 'soldier'),
+('軍', 'soldiers'),
+('軍', 'troops'),
+('軒', 'China'),
+('軒', 'balcony'),
+('軒', 'carriage'),
+('軒', 'eaves'),
+('軒', 'high'),
+('軒', 'large'),
+('軒', 'meat'),
+('軒', 'portion'),
+('軒', 'surname of the Yellow Emperor'),
+('軒', 'wide'),
+('軟', 'flexible'),
+('軟', 'pliable'),
+('軟', 'soft'),
+('軟', 'weak'),
+('転', 'move'),
+('転', 'shift'),
+('転', 'turn'),
+('軨', 'lattice work on front and sides'),
+('軫', 'cross board at rear of carriage'),
+('軸', 'axis'),
+('軸', 'axle'),
+('軸', 'axletree'),
+('軸', 'pivot'),
+('軹', 'divergent'),
+('軹', 'end of axle'),
+('軺', 'small light carriage'),
+('軻', 'axle'),
+('軻', 'personal name of mencius'),
+('軼', 'excel'),
+('軼', 'rush forth'),
+('軼', 'surpass'),
+('軽', 'easy'),
+('軽', 'gentle'),
+('軽', 'light'),
+('軽', 'simple'),
+('軾', 'horizontal wooden bar in front of a sedan chair'),
+('軿', 'curtained carriage used by women'),
+('較', 'comparatively'),
+('較', 'compare'),
+('較', 'more'),
+('輅', 'a carriage pull-bar'),
+('輅', 'a chariot'),
+('輅', 'carriage'),
+('輇', 'cart wheel with no spokes'),
+('輈', 'shaft'),
+('載', 'carry'),
+('載', 'convey'),
+('載', 'load'),
+('載', 'transport'),
+('輒', 'sides of chariot where weapons'),
+('輓', 'draw'),
+('輓', 'mourn'),
+('輓', 'pull'),
+('輔', 'assist'),
+('輔', 'cheek bone'),
+('輔', 'protective'),
+('輕', 'easy'),
+('輕', 'gentle'),
+('輕', 'light'),
+('輕', 'simple'),
+('輛', 'numerary adjunct for vehicles'),
+('輜', 'a supply cart'),
+('輜', 'covered wagon'),
+('輜', 'dray'),
+('輝', 'brightness'),
+('輝', 'brilliance'),
+('輝', 'luster'),
+('輝', 'shine'),
+('輞', 'exterior rim of wheel'),
+('輞', 'felly'),
+('輟', 'halt'),
+('輟', 'stop'),
+('輟', 'suspend'),
+('輦', 'a hand-cart'),
+('輦', 'to transport by carriage'),
+('輧', 'curtained carriage used by women'),
+('輩', 'class'),
+('輩', 'generation'),
+('輩', 'lifetime'),
+('輪', 'recur'),
+('輪', 'revolve'),
+('輪', 'turn'),
+('輪', 'wheel'),
+('輮', 'get bent'),
+('輮', 'rims'),
+('輯', 'collect'),
+('輯', 'compile'),
+('輯', 'edit'),
+('輯', 'gather up'),
+('輯', 'juice'),
+('輳', 'converge around'),
+('輳', 'hubs of wheel'),
+('輸', 'carry'),
+('輸', 'haul'),
+('輸', 'send'),
+('輸', 'transport'),
+('輹', 'two pieces of wood underneath a cart'),
+('輻', 'spokes of wheel'),
+('輾', 'roll'),
+('輾', 'turn over'),
+('輿', 'cart'),
+('輿', 'palanquin'),
+('輿', 'public opinion'),
+('轀', 'hearse'),
+('轂', 'hub of wheel'),
+('轄', 'control'),
+('轄', 'linchpin'),
+('轄', 'linchpin of wheel'),
+('轅', 'axle'),
+('轅', 'magistrates office'),
+('轅', 'surname'),
+('轆', 'capstan'),
+('轆', 'pulley'),
+('轆', 'wheel'),
+('轆', 'windlass'),
+('轉', 'move'),
+('轉', 'shift'),
+('轉', 'turn'),
+('轍', 'wagon ruts'),
+('轍', 'wheel tracks'),
+('轎', 'palanquin'),
+('轎', 'sedan chair'),
+('轎', 'sedan-chair'),
+('轒', 'chariot'),
+('轔', 'rumbling of vehicles'),
+('轔', 'threshold'),
+('轗', 'fail'),
+('轘', 'tear asunder between chariots'),
+('轝', 'dislike'),
+('轝', 'envy'),
+('轝', 'hate'),
+('轝', 'resentment'),
+('轞', 'a vehicle for transporting prisoners'),
+('轟', 'blast'),
+('轟', 'boom'),
+('轟', 'explosion'),
+('轟', 'roar'),
+('轟', 'rumble'),
+('轟', 'thunder'),
+('轡', 'bridle of horse'),
+('轡', 'reins'),
+('轢', 'run over'),
+('轢', 'run over something with vehicle'),
+('轢', 'vehicle'),
+('轤', 'capstan'),
+('轤', 'pulley'),
+('轤', 'windlass'),
+('辛', '8th heavenly stem'),
+('辛', 'bitter'),
+('辛', 'laborious'),
+('辛', 'toilsome'),
+('辜', 'crime'),
+('辜', 'criminal offense'),
+('辜', 'sin'),
+('辜', 'wrong'),
+('辞', 'expression'),
+('辞', 'phrase'),
+('辞', 'speech'),
+('辞', 'words'),
+('辟', 'develop'),
+('辟', 'law'),
+('辟', 'open up'),
+('辟', 'rule'),
+('辢', 'acrid'),
+('辢', 'bitter'),
+('辢', 'pungent'),
+('辣', 'cruel'),
+('辣', 'hot'),
+('辣', 'peppery'),
+('辣', 'pungent'),
+('辦', 'deal with'),
+('辦', 'do'),
+('辦', 'handle'),
+('辦', 'manage'),
+('辨', 'differentiate'),
+('辨', 'discern'),
+('辨', 'discriminate'),
+('辨', 'distinguish'),
+('辨', 'equip'),
+('辨', 'exception'),
+('辨', 'prepare'),
+('辨', 'without'),
+('辭', 'expression'),
+('辭', 'phrase'),
+('辭', 'speech'),
+('辭', 'words'),
+('辮', 'braid'),
+('辮', 'pigtail'),
+('辮', 'plait'),
+('辮', 'queue'),
+('辮', 'verbal defense.'),
+('辯', 'argue'),
+('辯', 'debate'),
+('辯', 'discuss'),
+('辯', 'dispute'),
+('辰', '5th terrestrial branch'),
+('辰', 'early morning'),
+('辰', 'star'),
+('辰', 'time'),
+('辱', 'abuse'),
+('辱', 'humiliate'),
+('辱', 'insult'),
+('農', 'agriculture'),
+('農', 'farmer'),
+('農', 'farming'),
+('边', 'border'),
+('边', 'edge'),
+('边', 'margin'),
+('边', 'side'),
+('辺', 'border'),
+('辺', 'edge'),
+('辺', 'margin'),
+('辺', 'side'),
+('辻', 'crossroads'),
+('辻', 'street'),
+('辻', 'surname'),
+('込', 'crowd into'),
+('込', 'go into'),
+('辿', 'follow'),
+('辿', 'pursue'),
+('迂', 'abstruse'),
+('迂', 'doctrinaire'),
+('迂', 'unrealistic'),
+('迄', 'extend'),
+('迄', 'reach'),
+('迄', 'till'),
+('迄', 'until'),
+('迅', 'hasty'),
+('迅', 'quick'),
+('迅', 'rapid'),
+('迅', 'sudden'),
+('迋', 'deceive'),
+('迋', 'go to'),
+('迋', 'scare'),
+('迋', 'travel'),
+('迍', 'falter'),
+('迍', 'hesitate'),
+('迎', 'greet'),
+('迎', 'meet'),
+('迎', 'receive'),
+('迎', 'welcome'),
+('近', 'approach'),
+('近', 'close'),
+('近', 'intimate'),
+('近', 'near'),
+('迓', 'as a guest'),
+('迓', 'to go to meet'),
+('迓', 'to receive'),
+('返', 'restore'),
+('返', 'return'),
+('返', 'revert'),
+('返', 'revert to'),
+('返', 'to'),
+('迕', 'obstinate'),
+('迕', 'perverse'),
+('迢', 'distant'),
+('迢', 'far'),
+('迤', 'walk out of straight path'),
+('迤', 'wind'),
+('迥', 'different'),
+('迥', 'distant'),
+('迥', 'far'),
+('迥', 'separated'),
+('迦', 'character for transliteration'),
+('迨', 'arrest'),
+('迨', 'arrive'),
+('迨', 'reach'),
+('迨', 'seize'),
+('迨', 'until'),
+('迨', 'when'),
+('迩', 'be close'),
+('迩', 'be near'),
+('迩', 'recently'),
+('迪', 'advance'),
+('迪', 'enlighten'),
+('迪', 'progress'),
+('迫', 'coerce'),
+('迫', 'compel'),
+('迫', 'force'),
+('迫', 'urgent'),
+('迬', 'go'),
+('迭', 'frequently'),
+('迭', 'repeatedly'),
+('迮', 'approach'),
+('迮', '닥치다'),
+('述', 'express'),
+('述', 'narrate'),
+('述', 'state'),
+('迴', 'curving'),
+('迴', 'revolve'),
+('迴', 'rotate'),
+('迴', 'zigzag'),
+('迷', 'bewitch'),
+('迷', 'charm'),
+('迷', 'confusion'),
+('迷', 'get lost'),
+('迷', 'infatuate'),
+('迸', 'burst forth'),
+('迸', 'gush out'),
+('迸', 'split'),
+('迹', 'footprints'),
+('迹', 'impressions'),
+('迹', 'traces'),
+('迺', 'only then'),
+('迺', 'then'),
+('迺', 'thereupon'),
+('追', 'carve'),
+('追', 'chase'),
+('追', 'chase after'),
+('追', 'expel'),
+('追', 'follow'),
+('追', 'pursue'),
+('退', 'retreat'),
+('退', 'step back'),
+('退', 'withdraw'),
+('送', 'dispatch'),
+('送', 'give'),
+('送', 'see off'),
+('送', 'send'),
+('送', 'send off'),
+('适', 'appropriate'),
+('适', 'go'),
+('适', 'reach'),
+('适', 'suitable'),
+('逃', 'abscond'),
+('逃', 'dodge'),
+('逃', 'escape'),
+('逃', 'flee'),
+('逅', 'meet unexpectedly'),
+('逆', 'contrary'),
+('逆', 'disobey'),
+('逆', 'opposite'),
+('逆', 'rebel'),
+('逆', 'reverse'),
+('逆', 'traitor'),
+('逈', 'different'),
+('逈', 'distant'),
+('逈', 'far'),
+('逈', 'separated'),
+('逋', 'flee'),
+('逋', 'leave debt unsettled'),
+('逋', 'run away'),
+('逌', 'complacent'),
+('逌', 'please'),
+('逌', 'smiling'),
+('逍', 'jaunt'),
+('逍', 'loiter'),
+('逍', 'ramble'),
+('逍', 'stroll'),
+('逍', 'wander'),
+('透', 'pass through'),
+('透', 'penetrate'),
+('透', 'permeable'),
+('透', 'transparent'),
+('逐', 'chase'),
+('逐', 'expel'),
+('逐', 'one by one'),
+('逑', 'collect'),
+('逑', 'match'),
+('逑', 'pair'),
+('逑', 'unite'),
+('途', 'course'),
+('途', 'journey'),
+('途', 'path'),
+('途', 'road'),
+('途', 'way'),
+('逕', 'approach'),
+('逕', 'direct'),
+('逕', 'pass by'),
+('逖', 'distant'),
+('逖', 'far'),
+('逖', 'keep at distance'),
+('逗', 'allure'),
+('逗', 'arouse'),
+('逗', 'stir'),
+('逗', 'tempt'),
+('這', 'greet'),
+('這', 'here'),
+('這', 'that'),
+('這', 'the'),
+('這', 'this'),
+('通', 'common'),
+('通', 'communicate'),
+('通', 'pass through'),
+('逝', 'die'),
+('逝', 'pass away'),
+('逞', 'brag'),
+('逞', 'indulge oneself'),
+('逞', 'show off'),
+('速', 'fast'),
+('速', 'prompt'),
+('速', 'quick'),
+('速', 'speedy'),
+('造', 'achieve'),
+('造', 'begin'),
+('造', 'build'),
+('造', 'construct'),
+('造', 'create'),
+('造', 'make'),
+('造', 'physique'),
+('造', 'prepare'),
+('造', 'structure'),
+('逡', 'fall back'),
+('逡', 'retreat'),
+('逡', 'withdraw'),
+('逢', 'come upon'),
+('逢', 'flatter'),
+('逢', 'happen'),
+('逢', 'happen meet'),
+('逢', 'meet'),
+('連', 'connect'),
+('連', 'continuous'),
+('連', 'even'),
+('連', 'join'),
+('連', 'lead'),
+('逥', 'a time'),
+('逥', 'return'),
+('逥', 'turn around'),
+('逬', 'scatter'),
+('逬', '흩어져 달아날'),
+('逭', 'escape'),
+('逭', 'run away'),
+('逮', 'arrive'),
+('逮', 'catch'),
+('逮', 'reach'),
+('逮', 'seize'),
+('逰', 'roam'),
+('逰', 'travel'),
+('逰', 'wander'),
+('週', 'a week, 7 days'),
+('週', 'anniversary'),
+('週', 'cycle'),
+('週', 'turn'),
+('週', 'week'),
+('進', 'advance'),
+('進', 'enter'),
+('進', 'make progress'),
+('逴', 'argue'),
+('逴', 'far'),
+('逴', 'quarrel'),
+('逴', 'squabble'),
+('逵', 'crossroads'),
+('逵', 'thoroughfare'),
+('逶', 'curving'),
+('逶', 'swagger'),
+('逶', 'winding'),
+('逸', 'break loose'),
+('逸', 'escape'),
+('逸', 'flee'),
+('逺', 'distant'),
+('逺', 'far'),
+('逺', 'profound'),
+('逺', 'remote'),
+('逼', 'bother'),
+('逼', 'compel'),
+('逼', 'force'),
+('逼', 'pressure'),
+('逾', 'exceed'),
+('逾', 'go over'),
+('逾', 'pass over'),
+('遁', 'conceal oneself'),
+('遁', 'escape'),
+('遁', 'hide'),
+('遂', 'comply with'),
+('遂', 'follow along'),
+('遂', 'thereupon'),
+('遄', 'fast'),
+('遄', 'quick'),
+('遅', 'delay'),
+('遅', 'late'),
+('遅', 'slow'),
+('遅', 'tardy'),
+('遇', 'come across'),
+('遇', 'encounter'),
+('遇', 'meet'),
+('遉', 'detective'),
+('遉', 'reconnoiter'),
+('遉', 'spy'),
+('遊', 'roam'),
+('遊', 'travel'),
+('遊', 'wander'),
+('運', 'fortune'),
+('運', 'luck'),
+('運', 'move'),
+('運', 'shift'),
+('運', 'ship'),
+('運', 'transfer'),
+('運', 'transport'),
+('遍', 'all over'),
+('遍', 'everywhere'),
+('遍', 'throughout'),
+('過', 'been'),
+('過', 'go across'),
+('過', 'have'),
+('過', 'in time'),
+('過', 'last'),
+('過', 'later'),
+('過', 'pass'),
+('過', 'pass through'),
+('過', 'past'),
+('遏', 'a bar'),
+('遏', 'check'),
+('遏', 'curb'),
+('遏', 'stop'),
+('遏', 'suppress'),
+('遐', 'advanced in'),
+('遐', 'afar'),
+('遐', 'distant'),
+('遐', 'old'),
+('遑', 'hurry about'),
+('遑', 'leisure'),
+('遑', 'leisurely'),
+('遒', 'forceful'),
+('遒', 'strong'),
+('遒', 'unyielding'),
+('道', 'method'),
+('道', 'moral'),
+('道', 'path'),
+('道', 'principle'),
+('道', 'province'),
+('道', 'reason'),
+('道', 'road'),
+('道', 'street'),
+('道', 'way'),
+('達', 'achieve'),
+('達', 'arrive at'),
+('達', 'attain'),
+('達', 'intelligent'),
+('達', 'reach'),
+('違', 'be apart from'),
+('違', 'defy'),
+('違', 'disobey'),
+('違', 'violate'),
+('遘', 'to come across'),
+('遘', 'to meet'),
+('遙', 'distant'),
+('遙', 'far away'),
+('遙', 'remote'),
+('遛', 'stroll'),
+('遛', 'take walk'),
+('遜', 'humble'),
+('遜', 'modest'),
+('遜', 'modesty'),
+('遜', 'yield'),
+('遝', 'abundant'),
+('遝', 'assorted'),
+('遝', 'mixed'),
+('遞', 'deliver'),
+('遞', 'hand over'),
+('遞', 'substitute'),
+('遟', 'delay'),
+('遟', 'late'),
+('遟', 'slow'),
+('遟', 'tardy'),
+('遠', 'distant'),
+('遠', 'far'),
+('遠', 'profound'),
+('遠', 'remote'),
+('遡', 'formerly'),
+('遡', 'go upstream'),
+('遡', 'trace source'),
+('遣', 'dispatch'),
+('遣', 'exile'),
+('遣', 'send'),
+('遣', 'send off'),
+('遨', 'ramble'),
+('遨', 'roam'),
+('遨', 'travel for pleasure'),
+('適', 'comfortable'),
+('適', 'just'),
+('適', 'match'),
+('遭', 'come across'),
+('遭', 'encounter'),
+('遭', 'meet'),
+('遭', 'meet with'),
+('遮', 'cover'),
+('遮', 'protect'),
+('遮', 'shield'),
+('遯', 'conceal'),
+('遯', 'deceive'),
+('遯', 'flee'),
+('遯', 'hide'),
+('遲', 'delay'),
+('遲', 'late'),
+('遲', 'slow'),
+('遲', 'tardy'),
+('遵', 'comply with'),
+('遵', 'follow'),
+('遵', 'honor'),
+('遵', 'obey'),
+('遶', 'entwine'),
+('遶', 'surround'),
+('遶', 'wind around'),
+('遷', 'change'),
+('遷', 'move'),
+('遷', 'shift'),
+('遷', 'transfer'),
+('選', 'choice'),
+('選', 'choose'),
+('選', 'distinguish'),
+('選', 'elect'),
+('選', 'election'),
+('選', 'select'),
+('選', 'selection'),
+('遹', 'avoid'),
+('遹', 'follow'),
+('遺', 'articles lost'),
+('遺', 'lose'),
+('遺', 'omit'),
+('遼', 'Khitan'),
+('遼', 'Liao'),
+('遼', 'distant'),
+('遼', 'empire'),
+('遼', 'far'),
+('遼', 'medieval'),
+('遽', 'at once'),
+('遽', 'suddenly'),
+('遽', 'unexpectedly'),
+('避', 'avoid'),
+('避', 'escape'),
+('避', 'hide'),
+('避', 'turn aside'),
+('邀', 'intercept'),
+('邀', 'invite'),
+('邀', 'meet'),
+('邀', 'welcome'),
+('邁', 'pass by'),
+('邁', 'take a big stride'),
+('邂', 'encounter by'),
+('邂', 'unexpected meeting'),
+('邃', 'deep'),
+('邃', 'detailed'),
+('邃', 'profound'),
+('還', 'also'),
+('還', 'besides'),
+('還', 'still'),
+('還', 'yet'),
+('邅', 'faltering'),
+('邅', 'hesitant'),
+('邅', 'hesitate'),
+('邇', 'be close'),
+('邇', 'be near'),
+('邇', 'recently'),
+('邈', 'distant'),
+('邈', 'far'),
+('邈', 'remote'),
+('邈', 'slight'),
+('邊', 'border'),
+('邊', 'edge'),
+('邊', 'margin'),
+('邊', 'side'),
+('邌', 'to parade'),
+('邌', 'to walk slowly'),
+('邏', 'inspect'),
+('邏', 'patrol'),
+('邏', 'watch'),
+('邐', 'meandering'),
+('邐', 'winding'),
+('邑', 'Town'),
+('邑', 'administrative'),
+('邑', 'area'),
+('邑', 'but'),
+('邑', 'city'),
+('邑', 'county'),
+('邑', 'district'),
+('邑', 'division'),
+('邑', 'eup'),
+('邑', 'geography'),
+('邑', 'larger'),
+('邑', 'less'),
+('邑', 'more'),
+('邑', 'populous'),
+('邑', 'smaller'),
+('邑', 'state'),
+('邑', 'village'),
+('邑', '군'),
+('邑', '리'),
+('邑', '시'),
+('邕', 'former or literary name for Nanning(in Guangxi)'),
+('邗', 'an ancient place in the state of Wu'),
+('邙', 'mountain in Henan province'),
+('邛', 'a mound'),
+('邛', 'in distress'),
+('邠', 'county in Shaanxi province'),
+('邢', 'state in todays Hebei'),
+('邢', 'surname'),
+('那', 'that'),
+('那', 'that one'),
+('那', 'those'),
+('邦', 'country'),
+('邦', 'nation'),
+('邦', 'state'),
+('邨', 'hamlet'),
+('邨', 'rustic'),
+('邨', 'village'),
+('邪', 'depraved'),
+('邪', 'evil'),
+('邪', 'heterodox'),
+('邪', 'perverse'),
+('邪', 'vicious'),
+('邪', 'wrong'),
+('邯', 'city in Hebei province'),
+('邯', 'various'),
+('邰', 'state in modern Shanxi'),
+('邰', 'surname'),
+('邱', 'grave'),
+('邱', 'hill'),
+('邱', 'mound'),
+('邱', 'surname'),
+('邳', 'a department in the State of Lu'),
+('邳', 'in what is now Shantung or N. China'),
+('邴', 'in what is now Shandong'),
+('邴', 'name of a city in the ancient state of Song'),
+('邴', 'pleased'),
+('邵', 'surname'),
+('邵', 'various place names'),
+('邶', 'place in todays Henan province'),
+('邸', 'government'),
+('邸', 'house'),
+('邸', 'office'),
+('邸', 'official residence'),
+('邸', 'residence of'),
+('邽', 'name of a county in Han dynasty'),
+('邾', 'a feudal state which existed B.C.700-469'),
+('邾', 'now in Shandong'),
+('郁', '(Cant.) to move'),
+('郁', 'hit'),
+('郁', 'rich in aroma'),
+('郁', 'sweet smelling'),
+('郃', 'county in Shanxi province'),
+('郄', 'surname'),
+('郅', 'to go up to. flourishing a superlative'),
+('郊', 'open spaces'),
+('郊', 'outskirts'),
+('郊', 'suburbs'),
+('郊', 'waste land'),
+('郎', 'gentleman'),
+('郎', 'husband'),
+('郎', 'man'),
+('郎', 'young man'),
+('郜', 'name of fief in Shantong bestowed on the eldest son of Wen Wang'),
+('郝', 'place in modern Shanxi'),
+('郝', 'surname'),
+('郞', 'gentleman'),
+('郞', 'knight'),
+('郞', 'male'),
+('郞', 'man'),
+('郟', 'county in Henan province'),
+('郟', 'surname'),
+('郡', 'administrative division'),
+('郡', 'county'),
+('郡', 'district'),
+('郢', 'state in todays Hubei province'),
+('郤', 'crack'),
+('郤', 'opening'),
+('郤', 'surname'),
+('部', 'command'),
+('部', 'division'),
+('部', 'group'),
+('部', 'lead'),
+('部', 'part'),
+('部', 'section'),
+('部', 'team'),
+('郪', 'name of a stream in Sichuan province'),
+('郭', 'city'),
+('郭', 'girdle'),
+('郭', 'outer'),
+('郭', 'outer part(of a city)'),
+('郭', 'surname'),
+('郭', 'wall'),
+('郯', 'name of a small ancient principality which was situated in what is now part of Shantung and Kiangsu'),
+('郴', 'county in Hunan province'),
+('郴', 'surname'),
+('郵', 'mail'),
+('郵', 'post office'),
+('郵', 'postal'),
+('郷', 'country'),
+('郷', 'rural'),
+('郷', 'village'),
+('都', 'all'),
+('都', 'capital'),
+('都', 'capital city'),
+('都', 'elegant'),
+('都', 'metropolis'),
+('都', 'refined'),
+('都', 'the whole'),
+('都', 'whole'),
+('鄂', 'China'),
+('鄂', 'Henan'),
+('鄂', 'Hubei province'),
+('鄂', 'Nanyang'),
+('鄂', 'ancient'),
+('鄂', 'province'),
+('鄂', 'startled'),
+('鄉', 'country'),
+('鄉', 'rural'),
+('鄉', 'village'),
+('鄒', 'name of an ancient state'),
+('鄒', 'surname'),
+('鄔', 'surname'),
+('鄔', 'transliteration of Sanskrit u'),
+('鄔', 'various place names'),
+('鄕', 'country'),
+('鄕', 'rural'),
+('鄕', 'village'),
+('鄙', 'low'),
+('鄙', 'mean'),
+('鄞', 'county in Zhejiang province'),
+('鄢', 'name of a district in Honan'),
+('鄣', 'name of an ancient city in N. Jiangsu'),
+('鄣', 'near Shandong'),
+('鄧', 'surname'),
+('鄭', 'state in todays Henan'),
+('鄭', 'surname'),
+('鄰', 'neighbor'),
+('鄰', 'neighborhood'),
+('鄱', 'county and lake in Jiangxi'),
+('鄲', 'county in Hebei province'),
+('鄴', 'place in todays honan province'),
+('鄶', 'state in todays Henan province'),
+('鄺', 'surname'),
+('酈', 'place in todays Henan province'),
+('酉', '10th terrestrial branch'),
+('酉', 'a wine vessel'),
+('酉', 'ancient'),
+('酉', 'full'),
+('酉', 'hen'),
+('酉', 'irrigate'),
+('酉', 'old'),
+('酊', 'drunk'),
+('酊', 'intoxicated'),
+('酋', 'chief of tribe'),
+('酋', 'chieftain'),
+('酌', 'alcoholic'),
+('酌', 'beverage'),
+('酌', 'deliberate'),
+('酌', 'feast'),
+('酌', 'pour'),
+('酌', 'serve wine'),
+('配', 'allocate'),
+('配', 'blend'),
+('配', 'equal'),
+('配', 'match'),
+('配', 'pair'),
+('酎', 'double-fermented wine'),
+('酎', 'vintage wine'),
+('酒', 'alcoholic'),
+('酒', 'alcoholic beverage'),
+('酒', 'beverage'),
+('酒', 'liquor'),
+('酒', 'spirits'),
+('酒', 'wine'),
+('酖', 'wine with bird poison added'),
+('酗', 'drunk'),
+('酗', 'to become violent under the influence of alcohol'),
+('酢', 'to express juice by pressing'),
+('酢', 'toast ones host with wine'),
+('酣', 'enjoy intoxicants'),
+('酤', 'to deal in spirits'),
+('酥', 'butter'),
+('酥', 'crispy'),
+('酥', 'flaky'),
+('酥', 'fluffy'),
+('酥', 'light'),
+('酦', 'brewing'),
+('酦', 'fermentation'),
+('酩', 'drunk'),
+('酩', 'intoxicated'),
+('酩', 'tipsy'),
+('酪', 'cheese'),
+('酪', 'cream'),
+('酪', 'koumiss'),
+('酬', 'recompense'),
+('酬', 'reward'),
+('酬', 'toast'),
+('酱', 'any jam-like or paste-like food'),
+('酲', 'hangover'),
+('酲', 'uncomfortable'),
+('酴', 'leaven'),
+('酴', 'wine'),
+('酴', 'yeast'),
+('酵', 'leaven'),
+('酵', 'yeast'),
+('酶', 'enzymes'),
+('酷', 'cruel'),
+('酷', 'stimulating'),
+('酷', 'strong'),
+('酷', 'very'),
+('酸', 'acid'),
+('酸', 'an acid'),
+('酸', 'sour'),
+('酸', 'spoiled'),
+('酸', 'stiff'),
+('酸', 'tart'),
+('酹', 'to pour out a libation'),
+('酹', 'to sprinkle'),
+('醃', 'marinate'),
+('醃', 'pickle'),
+('醃', 'salt'),
+('醇', 'good as wine'),
+('醇', 'pure'),
+('醇', 'rich'),
+('醇', 'unmixed'),
+('醉', 'addicted to'),
+('醉', 'drunk'),
+('醉', 'intoxicated'),
+('醋', 'envy'),
+('醋', 'jealousy'),
+('醋', 'vinegar'),
+('醍', 'essential oil of butter'),
+('醐', 'purest cream'),
+('醒', 'sober'),
+('醒', 'sober up'),
+('醒', 'startle'),
+('醒', 'wake up'),
+('醒', 'waking up'),
+('醖', 'liquor'),
+('醗', 'to brew for the second time'),
+('醜', 'disgraceful'),
+('醜', 'homely'),
+('醜', 'ugly looking'),
+('醞', 'brew'),
+('醞', 'ferment'),
+('醞', 'harmony'),
+('醞', 'liquor'),
+('醞', 'spirits'),
+('醞', 'wine'),
+('醢', 'mince'),
+('醢', 'minced pickled meat'),
+('醤', 'any jam-like or paste-like food'),
+('醪', 'unclear wine'),
+('醪', 'wine with dregs'),
+('醫', 'cure'),
+('醫', 'doctor'),
+('醫', 'heal'),
+('醫', 'medical'),
+('醫', 'medicine'),
+('醬', 'any jam-like or paste-like food'),
+('醮', 'Daoist or Buddhist ceremony'),
+('醮', 'religious service'),
+('醯', 'acid'),
+('醯', 'pickle'),
+('醯', 'vinegar'),
+('醱', 'ferment'),
+('醱', 'to brew for the second time'),
+('醲', 'dense'),
+('醲', 'strong wine'),
+('醲', 'thick'),
+('醴', 'sweet spring'),
+('醴', 'sweet wine'),
+('醵', 'chip in'),
+('醵', 'contribute'),
+('醵', 'contribute for drinks'),
+('醵', 'donate'),
+('醵', 'pool money'),
+('釀', 'brew'),
+('釀', 'ferment'),
+('釁', 'quarrel'),
+('釁', 'rift'),
+('釁', 'smear with blood in sacrifice'),
+('釃', 'filter'),
+('釃', 'split'),
+('釃', 'strain'),
+('釅', 'strong(beverage)'),
+('釅', 'thick'),
+('釆', 'KangXi radical 165'),
+('釆', 'distinguish'),
+('采', 'collect'),
+('采', 'gather'),
+('采', 'pick'),
+('采', 'pluck'),
+('釈', 'elucidate'),
+('釈', 'interprete'),
+('釈', 'release'),
+('釉', 'glaze'),
+('釋', 'elucidate'),
+('釋', 'interprete'),
+('釋', 'release'),
+('里', 'Korean'),
+('里', 'about'),
+('里', 'lane'),
+('里', 'li'),
+('里', 'm'),
+('里', 'mile'),
+('里', 'unit of distance'),
+('里', 'village'),
+('重', 'child'),
+('重', 'double'),
+('重', 'heavy'),
+('重', 'weighty'),
+('野', 'area'),
+('野', 'field'),
+('野', 'open country'),
+('野', 'savage'),
+('野', 'untamed'),
+('野', 'wild'),
+('野', 'wilderness'),
+('量', 'amount'),
+('量', 'capacity'),
+('量', 'measure'),
+('量', 'quantity'),
+('量', 'volume'),
+('釐', '1/1000 of a foot'),
+('釐', 'control'),
+('釐', 'manage'),
+('金', 'Friday'),
+('金', 'gold'),
+('金', 'metals in general'),
+('金', 'money'),
+('金', 'surname'),
+('釗', 'cut'),
+('釗', 'encourage'),
+('釗', 'endeavor'),
+('釗', 'strive'),
+('釘', 'nail'),
+('釘', 'pursue closely'),
+('釘', 'spike'),
+('釜', 'cauldron'),
+('釜', 'kettle'),
+('釜', 'pot'),
+('針', 'acupuncture'),
+('針', 'needle'),
+('針', 'needlework'),
+('針', 'pin'),
+('針', 'sew'),
+('針', 'tack'),
+('釣', 'fish'),
+('釣', 'fishhook'),
+('釣', 'lure'),
+('釣', 'tempt'),
+('釤', 'samarium'),
+('釦', 'buckle'),
+('釦', 'button'),
+('釦', 'clasp'),
+('釦', 'engrave'),
+('釧', 'armlet'),
+('釧', 'bracelet'),
+('釪', 'a small bell'),
+('釪', 'an alms bowl'),
+('釭', 'band'),
+('釭', 'tire of wheel'),
+('釰', 'blunt'),
+('釰', 'dull'),
+('釵', 'ornamental hairpin'),
+('釼', 'blunt'),
+('釼', 'dull'),
+('釼', 'knife'),
+('鈀', 'chariot'),
+('鈀', 'rake'),
+('鈀', 'wagon'),
+('鈀', 'war'),
+('鈀', '병거'),
+('鈀', '쇠스랑'),
+('鈇', 'a hatchet'),
+('鈇', 'an ax'),
+('鈍', 'blunt'),
+('鈍', 'dull'),
+('鈍', 'dull-witted'),
+('鈍', 'flat'),
+('鈍', 'obtuse'),
+('鈐', 'aurum, yellow metal, gold'),
+('鈐', 'latch'),
+('鈐', 'lock'),
+('鈐', 'seal'),
+('鈐', 'stamp'),
+('鈑', 'plate'),
+('鈒', '(Cant.) to cut'),
+('鈒', 'grass-shears'),
+('鈒', 'slice'),
+('鈒', 'spear'),
+('鈔', 'bank notes'),
+('鈔', 'copy'),
+('鈔', 'paper money'),
+('鈞', 'unit of measure equivalent to thirty catties'),
+('鈴', 'bell'),
+('鈷', 'cobalt'),
+('鈷', 'household iron cobaltum'),
+('鈸', 'cymbal'),
+('鈸', 'cymbals'),
+('鈸', '동발'),
+('鈺', 'rare treasure'),
+('鈿', 'filigree'),
+('鈿', 'gold inlaid work'),
+('鈿', 'hairpin'),
+('鉀', 'potassium kalium'),
+('鉄', 'firm'),
+('鉄', 'iron'),
+('鉄', 'solid'),
+('鉄', 'strong'),
+('鉅', 'great'),
+('鉅', 'iron'),
+('鉅', 'steel'),
+('鉉', 'device for carrying a tripod'),
+('鉋', 'carpenters plane'),
+('鉎', '(Cant.) to rust'),
+('鉏', 'chop'),
+('鉏', 'eliminate'),
+('鉏', 'eradicate'),
+('鉏', 'hew'),
+('鉏', 'hoe'),
+('鉏', 'mow'),
+('鉏', 'weed'),
+('鉏', '김맬'),
+('鉏', '벨'),
+('鉏', '호미'),
+('鉑', 'gold'),
+('鉑', 'leaf'),
+('鉑', 'platinum'),
+('鉑', 'thin sheet of metal'),
+('鉗', 'pincers'),
+('鉗', 'pliers'),
+('鉗', 'tongs'),
+('鉛', 'lead plumbum'),
+('鉞', 'a battle axe'),
+('鉞', 'broad-axe'),
+('鉞', 'halberd'),
+('鉢', 'alms'),
+('鉢', 'alms bowl(Sanskrit paatra)'),
+('鉢', 'bowl'),
+('鉢', 'earthenware basin'),
+('鉢', '바리때'),
+('鉤', 'barb'),
+('鉤', 'hook'),
+('鉤', 'sickle'),
+('鉤', 'stroke with'),
+('鉥', 'needle'),
+('鉦', 'kind of gong used in ancient times by troops on the march'),
+('鉱', 'mine'),
+('鉱', 'mineral'),
+('鉱', 'ore'),
+('鉷', 'trigger'),
+('鉼', '(Cant.) a penny'),
+('鉼', 'plate'),
+('鉾', 'spear'),
+('銀', 'cash'),
+('銀', 'money'),
+('銀', 'silver'),
+('銀', 'wealth'),
+('銃', 'ancient weapon'),
+('銃', 'blunderbuss'),
+('銃', 'firearm'),
+('銃', 'gun'),
+('銃', 'rifle'),
+('銅', 'Vietnamese'),
+('銅', 'brass'),
+('銅', 'bronze cuprum'),
+('銅', 'copper'),
+('銅', 'dong'),
+('銍', 'sickle'),
+('銍', '낫'),
+('銑', 'mill'),
+('銓', 'measure'),
+('銓', 'select officials'),
+('銓', 'weigh'),
+('銕', 'firm'),
+('銕', 'iron'),
+('銕', 'solid'),
+('銕', 'strong'),
+('銖', 'one twenty-fourth of a Chinese ounce(liang)'),
+('銖', 'unit of weight'),
+('銘', 'engrave'),
+('銘', 'inscribe'),
+('銘', 'unforgettably'),
+('銚', 'a spear brevium'),
+('銚', 'large hoe'),
+('銚', 'surname'),
+('銛', 'a kind of hoe'),
+('銛', 'keen-edged'),
+('銛', 'sharp'),
+('銜', 'bit'),
+('銜', 'bite'),
+('銜', 'gag'),
+('銜', 'hold in mouth'),
+('銭', 'coins'),
+('銭', 'currency'),
+('銭', 'money'),
+('銳', 'acute'),
+('銳', 'keen'),
+('銳', 'pointed'),
+('銳', 'sharp'),
+('銶', 'chisel'),
+('銷', 'cancel'),
+('銷', 'finish'),
+('銷', 'fuse'),
+('銷', 'market'),
+('銷', 'melt'),
+('銷', 'sell'),
+('銷', 'to pass time'),
+('銹', 'corrode'),
+('銹', 'rust'),
+('鋆', 'character used in personal name'),
+('鋆', 'gold'),
+('鋈', 'silver plating'),
+('鋌', 'bars of metal'),
+('鋌', 'hurry'),
+('鋌', 'ingots'),
+('鋏', 'dagger'),
+('鋏', 'pincers'),
+('鋏', 'sword'),
+('鋏', 'tongs'),
+('鋑', 'as a block for printing'),
+('鋑', 'to engrave or carve'),
+('鋒', 'point of spear'),
+('鋒', 'sharp point'),
+('鋗', 'a small basin'),
+('鋗', 'rings on a cart of carriage'),
+('鋟', 'carve'),
+('鋤', 'eliminate'),
+('鋤', 'eradicate'),
+('鋤', 'hew'),
+('鋤', 'hoe'),
+('鋤', 'mow'),
+('鋤', 'remove'),
+('鋤', 'weed'),
+('鋤', '김맬'),
+('鋤', '없앨'),
+('鋤', '호미'),
+('鋪', 'arrange'),
+('鋪', 'bed'),
+('鋪', 'place to sleep'),
+('鋪', 'shop'),
+('鋪', 'spread out'),
+('鋪', 'store'),
+('鋭', 'sharp'),
+('鋰', 'lithium'),
+('鋲', 'rivet'),
+('鋸', 'a saw'),
+('鋸', 'amputate'),
+('鋸', 'to saw'),
+('鋹', 'a keen edge'),
+('鋹', 'sharp'),
+('鋹', 'sharp point'),
+('鋺', 'a metal bowl'),
+('鋼', 'hard'),
+('鋼', 'steel'),
+('鋼', 'strong'),
+('鋼', 'tough'),
+('錄', 'copy'),
+('錄', 'record'),
+('錄', 'write down'),
+('錆', 'the color of a mineral'),
+('錏', 'ammonium'),
+('錏', 'soft steel'),
+('錐', 'auger'),
+('錐', 'awl'),
+('錐', 'bore'),
+('錐', 'drill'),
+('錐', 'gimlet'),
+('錕', 'ancient treasured sword'),
+('錘', 'balance weight on scale'),
+('錘', 'hammer'),
+('錙', '8 oz'),
+('錙', 'an ancient unit of weight'),
+('錚', 'clanging sound'),
+('錚', 'folk'),
+('錚', 'gong'),
+('錚', 'instrument'),
+('錚', 'metallic'),
+('錚', 'music'),
+('錚', 'percussion'),
+('錚', 'small gong'),
+('錚', 'sound'),
+('錞', 'instrument'),
+('錟', 'long spear'),
+('錠', 'cake'),
+('錠', 'slab'),
+('錠', 'spindle'),
+('錠', 'tablet'),
+('錡', 'a kind of chisel'),
+('錡', 'a kind of pen'),
+('錢', 'coins'),
+('錢', 'currency'),
+('錢', 'money'),
+('錣', 'armor neckplates'),
+('錤', 'hoe'),
+('錦', 'brocade'),
+('錦', 'embroidered'),
+('錦', 'tapestry'),
+('錨', 'anchor'),
+('錨', '닻'),
+('錫', 'bestow'),
+('錫', 'confer'),
+('錫', 'stannum'),
+('錫', 'tin'),
+('錬', 'smelt metals'),
+('錮', 'confine'),
+('錮', 'run metal into cracks'),
+('錯', 'blunder'),
+('錯', 'error'),
+('錯', 'mistake'),
+('錯', 'wrong'),
+('録', 'copy'),
+('鍉', 'key'),
+('鍉', 'spoon'),
+('鍊', 'forge'),
+('鍊', 'metals'),
+('鍊', 'refine'),
+('鍊', 'smelt'),
+('鍊', 'smelt metals'),
+('鍋', 'cooking-pot'),
+('鍋', 'saucepan'),
+('鍍', 'coat'),
+('鍍', 'gild'),
+('鍍', 'plate'),
+('鍔', 'edge of knife'),
+('鍔', 'high'),
+('鍔', 'lofty'),
+('鍛', 'forge metal'),
+('鍛', 'refine'),
+('鍛', 'temper'),
+('鍠', 'weapon'),
+('鍤', 'marking pin'),
+('鍤', 'shovel'),
+('鍤', 'spade'),
+('鍤', '가래'),
+('鍪', 'a metal cap'),
+('鍪', 'an iron pan'),
+('鍫', 'shovel'),
+('鍬', 'ploughshare'),
+('鍬', 'shovel'),
+('鍬', 'spade'),
+('鍬', '가래'),
+('鍮', 'brass'),
+('鍮', 'way, habit, style'),
+('鍰', 'coins'),
+('鍰', 'measure'),
+('鍰', 'money'),
+('鍵', 'door bolt'),
+('鍵', 'key'),
+('鍵', 'lock bolt'),
+('鍼', 'inject'),
+('鍼', 'needle'),
+('鍼', 'pin'),
+('鍼', 'prick'),
+('鍼', 'tack'),
+('鍾', 'cup'),
+('鍾', 'glass'),
+('鍾', 'goblet'),
+('鍾', 'surname'),
+('鎊', 'pound sterling'),
+('鎌', 'sickle'),
+('鎏', 'pure gold'),
+('鎒', 'hoe'),
+('鎒', 'weed'),
+('鎒', '김맬'),
+('鎒', '호미'),
+('鎔', 'fuse'),
+('鎔', 'melt'),
+('鎔', 'mold'),
+('鎔', 'smelt'),
+('鎖', 'chains'),
+('鎖', 'lock'),
+('鎖', 'padlock'),
+('鎖', 'shackles'),
+('鎗', 'hand gun'),
+('鎗', 'rifle'),
+('鎗', 'small arms'),
+('鎚', 'club'),
+('鎚', 'hammer'),
+('鎚', 'mallet'),
+('鎛', 'hoe'),
+('鎛', 'large bell'),
+('鎛', 'spade'),
+('鎠', 'steel'),
+('鎡', 'hoe'),
+('鎡', 'mattock'),
+('鎣', 'polish'),
+('鎤', 'small bell'),
+('鎤', 'sound of a bell'),
+('鎧', 'armor'),
+('鎧', 'chain mail'),
+('鎬', 'bright'),
+('鎬', 'stove'),
+('鎭', 'market place'),
+('鎭', 'suppress'),
+('鎭', 'town'),
+('鎮', 'market place'),
+('鎮', 'suppress'),
+('鎮', 'town'),
+('鎰', 'measure of weight for gold'),
+('鏁', 'a lock'),
+('鏁', 'chains'),
+('鏁', 'padlock'),
+('鏁', 'shackles'),
+('鏁', 'variant of 鎖'),
+('鏃', 'arrowhead'),
+('鏃', 'barb'),
+('鏃', 'quick'),
+('鏃', 'swift'),
+('鏃', 'the end, the tip, the point'),
+('鏇', 'lathe'),
+('鏈', 'cable'),
+('鏈', 'chain'),
+('鏈', 'shack'),
+('鏈', 'wire'),
+('鏊', 'a flat'),
+('鏊', 'iron cooking-plate for cakes'),
+('鏌', 'name'),
+('鏌', 'sword'),
+('鏑', 'dysprosium'),
+('鏑', 'the barb of an arrow'),
+('鏑', 'the head of a javelin'),
+('鏖', 'engage in a fierce battle'),
+('鏖', 'to fight to the end'),
+('鏗', 'beat'),
+('鏗', 'jingling'),
+('鏗', 'strike'),
+('鏗', 'stroke'),
+('鏘', 'clang'),
+('鏘', 'jingle'),
+('鏘', 'tinkle'),
+('鏜', 'boring tool'),
+('鏝', 'trowel'),
+('鏞', 'a large bell used as a musical instrument'),
+('鏟', 'scoop'),
+('鏟', 'shovel'),
+('鏟', 'spade'),
+('鏟', 'trowel'),
+('鏡', 'glass'),
+('鏡', 'glasses'),
+('鏡', 'lens'),
+('鏡', 'mirror'),
+('鏢', 'dart'),
+('鏢', 'escort'),
+('鏢', 'harpoon'),
+('鏢', 'spear'),
+('鏤', 'carve'),
+('鏤', 'engrave'),
+('鏤', 'inlay'),
+('鏤', 'tattoo'),
+('鏦', 'spear'),
+('鏨', 'chisel'),
+('鏨', 'engraving tool'),
+('鏻', 'phosphonium'),
+('鏽', 'corrode'),
+('鏽', 'rust'),
+('鐃', 'cymbals'),
+('鐃', 'disturb'),
+('鐃', 'hand bell'),
+('鐄', 'bell'),
+('鐏', 'cap'),
+('鐐', 'fetters'),
+('鐓', 'castrate'),
+('鐓', 'ferrule'),
+('鐔', 'dagger'),
+('鐔', 'small sword'),
+('鐘', 'bell'),
+('鐘', 'clock'),
+('鐙', 'a kind of cooking vessel'),
+('鐙', 'lamp'),
+('鐥', 'Samarium'),
+('鐥', 'blank'),
+('鐥', 'sickle'),
+('鐫', 'carve'),
+('鐫', 'engrave'),
+('鐫', 'engraving tool'),
+('鐵', 'firm'),
+('鐵', 'iron'),
+('鐵', 'solid'),
+('鐵', 'strong'),
+('鐶', 'measure of currency'),
+('鐶', 'metal ring'),
+('鐸', 'bell'),
+('鐸', 'surname'),
+('鐺', 'frying pan'),
+('鐺', 'warming vessel'),
+('鑄', 'cast'),
+('鑄', 'coin'),
+('鑄', 'melt'),
+('鑄', 'mint'),
+('鑊', 'a wok'),
+('鑊', 'caldron'),
+('鑊', 'cauldron'),
+('鑊', 'large iron pot'),
+('鑌', 'high quality iron'),
+('鑑', 'inspection'),
+('鑑', 'looking glass'),
+('鑑', 'mirror'),
+('鑑', 'reflect'),
+('鑒', 'inspection'),
+('鑒', 'looking glass'),
+('鑒', 'mirror'),
+('鑒', 'reflect'),
+('鑕', 'tungsten'),
+('鑕', 'wolfram'),
+('鑛', 'mine'),
+('鑛', 'mineral'),
+('鑛', 'ore'),
+('鑞', 'solder'),
+('鑞', 'tin'),
+('鑠', 'melt'),
+('鑠', 'shine'),
+('鑠', 'smelt'),
+('鑢', '(Cant.) to cut'),
+('鑢', 'file'),
+('鑢', 'polish'),
+('鑢', 'rasp'),
+('鑣', 'bit'),
+('鑣', 'bridle'),
+('鑣', 'ride'),
+('鑪', 'fireplace'),
+('鑪', 'furnace'),
+('鑪', 'oven'),
+('鑪', 'stove'),
+('鑰', 'key'),
+('鑰', 'lock'),
+('鑱', 'spade'),
+('鑱', 'trowel'),
+('鑲', 'fill'),
+('鑲', 'inlay'),
+('鑲', 'insert'),
+('鑲', 'mount'),
+('鑲', 'set'),
+('鑵', 'can'),
+('鑵', 'jar'),
+('鑷', 'forceps'),
+('鑷', 'pincers'),
+('鑷', 'tweezers'),
+('鑼', 'gong'),
+('鑽', 'bore'),
+('鑽', 'diamond'),
+('鑽', 'drill'),
+('鑽', 'pierce'),
+('鑾', 'bells hung'),
+('鑾', 'bells hung on horse'),
+('鑿', 'bore'),
+('鑿', 'chisel'),
+('鑿', 'hole'),
+('鑿', 'pierce'),
+('钁', 'hoe'),
+('钁', '괭이'),
+('钃', 'hoe'),
+('钃', '괭이'),
+('钃', '호미'),
+('钑', 'spear'),
+('锜', 'a kind of chisel'),
+('锜', 'a kind of pen'),
+('锺', 'cup'),
+('锺', 'glass'),
+('锺', 'goblet'),
+('锺', 'surname'),
+('锽', 'weapon'),
+('長', 'chief'),
+('長', 'develop'),
+('長', 'excel in'),
+('長', 'grow'),
+('長', 'head'),
+('長', 'leader'),
+('長', 'length'),
+('長', 'lengthy'),
+('長', 'long'),
+('長', 'manager'),
+('門', 'door'),
+('門', 'entrance'),
+('門', 'gate'),
+('門', 'gateway'),
+('門', 'opening'),
+('門', 'portal'),
+('閃', 'avoid'),
+('閃', 'dodge'),
+('閃', 'evade'),
+('閃', 'flash'),
+('閈', 'village'),
+('閉', 'block up'),
+('閉', 'close'),
+('閉', 'obstruct'),
+('閉', 'shut'),
+('閉', 'to close, closing'),
+('閊', 'blocked'),
+('閊', 'to be obstructed'),
+('閊', 'to break down'),
+('開', 'begin'),
+('開', 'initiate'),
+('開', 'open'),
+('開', 'start'),
+('開', 'to open'),
+('閎', 'barrier'),
+('閎', 'expand'),
+('閎', 'gate'),
+('閎', 'vast'),
+('閎', 'wide'),
+('閏', 'extra'),
+('閏', 'intercalary'),
+('閏', 'surplus'),
+('閑', 'barrier'),
+('閑', 'defend'),
+('閑', 'fence'),
+('閑', 'idle time'),
+('閒', 'calm'),
+('閒', 'peaceful'),
+('閒', 'tranquil'),
+('間', 'between'),
+('間', 'interval'),
+('間', 'place'),
+('間', 'space'),
+('閔', 'grieve'),
+('閔', 'incite'),
+('閔', 'mourn'),
+('閔', 'urge on'),
+('閗', '鬪'),
+('閘', 'canal lock'),
+('閘', 'flood gate'),
+('閘', 'sluice'),
+('閟', 'close'),
+('閟', 'door'),
+('閟', 'hide'),
+('閟', 'hideaway'),
+('閟', 'keep secret'),
+('閟', 'shut'),
+('閟', 'the'),
+('閠', 'intercalary'),
+('関', 'close'),
+('関', 'frontier pass'),
+('関', 'relation'),
+('閣', 'cabinet'),
+('閣', 'chamber'),
+('閣', 'pavilion'),
+('閤', 'chamber'),
+('閤', 'small side door'),
+('閥', 'powerful and influential group'),
+('閦', 'crowd'),
+('閦', 'e.g. aksobhya'),
+('閦', 'transliteration of Sanskrit kso'),
+('閧', 'boisterous'),
+('閧', 'clamor'),
+('閧', 'noise'),
+('閨', 'small entrance'),
+('閨', 'womens quarters'),
+('閩', 'a river'),
+('閩', 'a tribe'),
+('閩', 'fujian province'),
+('閪', '(Cant.) vagina(vulg.)'),
+('閪', 'lost'),
+('閪', 'to lose lost item'),
+('閫', 'threshold'),
+('閫', 'womens quarters'),
+('閬', 'high'),
+('閬', 'high door'),
+('閬', 'high gate'),
+('閬', 'lofty'),
+('閭', 'village of twenty-five families'),
+('閱', 'examine'),
+('閱', 'inspect'),
+('閱', 'read'),
+('閱', 'review'),
+('閲', 'examine'),
+('閲', 'inspect'),
+('閶', 'gate of heaven'),
+('閶', 'main gate of palace'),
+('閶', 'zephyr'),
+('閹', 'castrate'),
+('閹', 'eunuch'),
+('閻', 'surname'),
+('閻', 'village gate'),
+('閼', 'block'),
+('閼', 'conceal'),
+('閼', 'obstruct'),
+('閼', 'stop up'),
+('閽', 'door'),
+('閽', 'gate'),
+('閽', 'gatekeeper'),
+('閾', 'confined'),
+('閾', 'separated'),
+('閾', 'threshold'),
+('闃', 'alone'),
+('闃', 'quiet'),
+('闃', 'still'),
+('闆', 'adult'),
+('闆', 'landlord'),
+('闆', 'plank'),
+('闇', 'close'),
+('闇', 'dark'),
+('闇', 'dismal'),
+('闇', 'shut'),
+('闈', 'door'),
+('闈', 'gate'),
+('闈', 'inner'),
+('闈', 'living quarters'),
+('闈', 'palace'),
+('闈', 'room'),
+('闈', 'royal'),
+('闊', 'ample'),
+('闊', 'be apart'),
+('闊', 'broad'),
+('闊', 'wide'),
+('闋', 'close'),
+('闋', 'shut'),
+('闋', 'watch tower'),
+('闌', 'door screen'),
+('闌', 'railing fence'),
+('闍', 'tower over city gate'),
+('闏', 'door'),
+('闏', 'enter'),
+('闏', 'gap'),
+('闏', 'wind'),
+('闒', 'attic'),
+('闒', 'door'),
+('闓', 'open'),
+('闓', 'peaceful'),
+('闔', 'all'),
+('闔', 'close'),
+('闔', 'entire'),
+('闔', 'leaf'),
+('闔', 'shut'),
+('闔', 'whole'),
+('闕', 'palace'),
+('闕', 'watch tower'),
+('闖', 'burst in'),
+('闖', 'charge in'),
+('闖', 'rush in'),
+('闗', 'a custom-house'),
+('闗', 'a frontier pass or gate to shut or close'),
+('闗', 'suburbs of a city'),
+('闚', 'flash'),
+('闚', 'flashing'),
+('闚', 'steal look'),
+('關', 'barrier'),
+('關', 'bow'),
+('關', 'close'),
+('關', 'draw'),
+('關', 'frontier pass'),
+('關', 'relation'),
+('關', 'stretching'),
+('闞', 'glance'),
+('闞', 'growl'),
+('闞', 'peep'),
+('闞', 'roar'),
+('闠', 'gate of a market'),
+('闡', 'clarify'),
+('闡', 'elucidate'),
+('闡', 'explain'),
+('闢', 'develop'),
+('闢', 'open'),
+('闢', 'open up'),
+('闢', 'settle'),
+('闤', 'market place'),
+('闥', 'door'),
+('闥', 'gate'),
+('阜', 'abundant'),
+('阜', 'ample'),
+('阜', 'hill'),
+('阜', 'mound'),
+('阜', 'numerous'),
+('阝', 'KangXi radical 170'),
+('阝', 'place'),
+('阡', 'footpaths between fields'),
+('阡', 'paths'),
+('阤', 'hill'),
+('阤', 'slope'),
+('阨', '(Cant.) to swindle'),
+('阨', 'adverse'),
+('阨', 'in distress'),
+('阨', 'strategic'),
+('阪', 'hill'),
+('阪', 'hillside farmland'),
+('阪', 'slope'),
+('阬', '구덩이'),
+('阮', 'ancient musical instrument: surname'),
+('阯', 'address'),
+('阯', 'foundation'),
+('阯', 'site'),
+('阱', 'pitfall'),
+('阱', 'snare'),
+('阱', 'trap'),
+('防', 'dam'),
+('防', 'defend'),
+('防', 'embankment'),
+('防', 'prevent'),
+('阻', 'hinder'),
+('阻', 'impede'),
+('阻', 'obstruct'),
+('阻', 'oppose'),
+('阼', 'the steps leading to the eastern door'),
+('阿', 'prefix for peoples names'),
+('阿', 'used in transliteration'),
+('陀', 'rough terrain'),
+('陀', 'steep bank'),
+('陂', 'dam'),
+('陂', 'embankment'),
+('陂', 'reservoir'),
+('附', 'adhere'),
+('附', 'adhere to'),
+('附', 'append'),
+('附', 'rely on near to'),
+('陋', 'coarse'),
+('陋', 'crude'),
+('陋', 'narrow'),
+('陋', 'ugly'),
+('陌', 'foot path between rice fields'),
+('降', 'come down'),
+('降', 'descend'),
+('降', 'down'),
+('降', 'drop'),
+('降', 'fall'),
+('降', 'lower'),
+('降', 'surrender'),
+('限', 'boundary'),
+('限', 'limit'),
+('限', 'line'),
+('陔', 'a grade a ledge'),
+('陔', 'a step'),
+('陔', 'a terrace'),
+('陘', 'defile'),
+('陘', 'gorge'),
+('陘', 'mountain pass'),
+('陘', 'oven'),
+('陘', 'slope'),
+('陛', 'steps leading throne'),
+('陛', 'throne'),
+('陜', 'mountain pass'),
+('陜', 'narrow'),
+('陝', 'Shaanxi province'),
+('陝', 'mountain pass'),
+('陞', 'ascend'),
+('陞', 'promote'),
+('陞', 'rise'),
+('陟', 'ascend'),
+('陟', 'climb'),
+('陟', 'proceed'),
+('陟', 'scale'),
+('陡', 'abruptly'),
+('陡', 'sloping'),
+('陡', 'steep'),
+('陡', 'sudden'),
+('院', 'court'),
+('院', 'courtyard'),
+('院', 'institution'),
+('院', 'school'),
+('院', 'yard'),
+('陣', 'column'),
+('陣', 'row or file of troops'),
+('除', 'eliminate'),
+('除', 'except'),
+('除', 'remove'),
+('陥', 'plunge'),
+('陥', 'sink'),
+('陥', 'submerge'),
+('陥', 'trap'),
+('陪', 'accompany'),
+('陪', 'be with'),
+('陪', 'keep company'),
+('陬', 'corner'),
+('陬', 'cranny'),
+('陬', 'niche'),
+('陬', 'nook'),
+('陰', 'dark'),
+('陰', 'female principle'),
+('陰', 'secret'),
+('陰', 'shady'),
+('陰', 'silent'),
+('陲', 'border'),
+('陲', 'frontier'),
+('陳', 'display'),
+('陳', 'exhibit'),
+('陳', 'lay out'),
+('陳', 'plead'),
+('陳', 'spread'),
+('陳', 'surname'),
+('陳', 'unfold'),
+('陴', 'a parapet on a city wall'),
+('陵', 'hill'),
+('陵', 'imperial'),
+('陵', 'mausoleum'),
+('陵', 'mound'),
+('陵', 'small hill'),
+('陵', 'tomb'),
+('陶', 'ceramics'),
+('陶', 'earthenware'),
+('陶', 'happy'),
+('陶', 'harmonious'),
+('陶', 'peaceful'),
+('陶', 'pottery'),
+('陷', 'fall into'),
+('陷', 'plunge'),
+('陷', 'sink'),
+('陷', 'submerge'),
+('陷', 'trap'),
+('陸', 'an accounting form of  六(six)'),
+('陸', 'army'),
+('陸', 'continental'),
+('陸', 'land'),
+('陸', 'six'),
+('険', 'narrow pass'),
+('険', 'strategic point'),
+('陼', 'islet'),
+('陽', 'light'),
+('陽', 'male'),
+('陽', 'male principle'),
+('陽', 'morning'),
+('陽', 'sky'),
+('陽', 'sun'),
+('陽', 'yang'),
+('陽', 'yin'),
+('隄', 'dike'),
+('隄', 'embankment'),
+('隅', 'corner'),
+('隅', 'nook'),
+('隅', 'remote place'),
+('隆', 'abundant'),
+('隆', 'plentiful'),
+('隆', 'prosperous'),
+('隈', 'bay'),
+('隈', 'cove'),
+('隈', 'inlet'),
+('隉', 'a dangerous condition of the State'),
+('隉', 'in disorder'),
+('隊', 'army unit'),
+('隊', 'group'),
+('隊', 'team'),
+('隋', 'Sui dynasty'),
+('隋', 'surname'),
+('隍', 'dry ditch'),
+('隍', 'dry moat'),
+('階', 'degree'),
+('階', 'rank'),
+('階', 'stairs'),
+('階', 'steps'),
+('随', 'follow'),
+('随', 'listen to'),
+('随', 'submit to'),
+('隐', 'conceal'),
+('隐', 'hidden'),
+('隐', 'hide'),
+('隐', 'secret'),
+('隔', 'block'),
+('隔', 'enclose'),
+('隔', 'partition'),
+('隔', 'separate'),
+('隕', 'die'),
+('隕', 'fall'),
+('隕', 'let fall'),
+('隕', 'slip'),
+('隗', 'high'),
+('隗', 'lofty'),
+('隗', 'surname'),
+('隘', 'a strategic pass'),
+('隘', 'confined'),
+('隘', 'narrow'),
+('隙', 'crack'),
+('隙', 'crevice'),
+('隙', 'fissure'),
+('隙', 'gap'),
+('隙', 'grudge'),
+('隙', 'split'),
+('際', 'border'),
+('際', 'boundary'),
+('際', 'juncture'),
+('際', 'occasion'),
+('障', 'barricade'),
+('障', 'block'),
+('障', 'separate'),
+('障', 'shield'),
+('隠', 'an open secret'),
+('隠', 'conceal'),
+('隠', 'cover'),
+('隠', 'lurk'),
+('隠', 'to disappear'),
+('隠', 'to hide'),
+('隣', 'adjacent'),
+('隣', 'neighbor'),
+('隣', 'neighboring'),
+('隤', 'to collapse'),
+('隤', 'to fall in ruins'),
+('隧', 'path to a tomb'),
+('隧', 'tunnel'),
+('隧', 'underground passageway'),
+('隨', 'follow'),
+('隨', 'listen to'),
+('隨', 'submit'),
+('隨', 'subsequently'),
+('隨', 'then'),
+('隨', 'to accompany'),
+('隩', 'conceal'),
+('隩', 'hide'),
+('隩', 'inhabited'),
+('隩', 'profound'),
+('隩', 'subtle'),
+('隩', 'warm'),
+('險', 'dangerous'),
+('險', 'narrow pass'),
+('險', 'strategic point'),
+('隮', 'climb'),
+('隮', 'go up'),
+('隮', 'rainbow'),
+('隮', '무지개'),
+('隮', '오르다'),
+('隰', 'damp land'),
+('隰', 'low'),
+('隰', 'marsh'),
+('隰', 'swamp'),
+('隱', 'conceal'),
+('隱', 'hidden'),
+('隱', 'hide'),
+('隱', 'secret'),
+('隳', 'to destroy'),
+('隳', 'to overthrow'),
+('隴', 'mountain located between Shanxi'),
+('隶', 'rad. 171'),
+('隶', 'servant'),
+('隶', 'subservient'),
+('隷', 'be subservient to'),
+('隷', 'servant'),
+('隸', 'be subservient to'),
+('隸', 'servant'),
+('隸', 'subserviant'),
+('隹', 'KangXi radical 172'),
+('隹', 'bird'),
+('隻', 'lone'),
+('隻', 'one of pair'),
+('隻', 'single'),
+('隼', 'a falcon'),
+('隼', 'aquiline(nose)'),
+('雀', 'sparrow'),
+('雁', 'cuneiform'),
+('雁', 'skein'),
+('雁', 'wedge'),
+('雁', 'wild goose'),
+('雁', '鵝'),
+('雁', '거위'),
+('雄', 'hero'),
+('雄', 'male'),
+('雄', 'male of species'),
+('雄', 'manly'),
+('雅', 'elegant'),
+('雅', 'graceful'),
+('雅', 'neat'),
+('雅', 'refined'),
+('雅', 'tidy'),
+('集', 'assemble'),
+('集', 'collect together'),
+('集', 'collection'),
+('雇', 'employ'),
+('雇', 'employment'),
+('雇', 'to hire'),
+('雉', 'crenellated wall'),
+('雉', 'pheasant'),
+('雋', 'outstanding'),
+('雋', 'superior'),
+('雋', 'talented'),
+('雌', 'female'),
+('雌', 'feminine'),
+('雌', 'gentle'),
+('雌', 'soft'),
+('雍', 'harmonious'),
+('雍', 'harmony'),
+('雍', 'union'),
+('雎', 'fishhawk'),
+('雎', 'hold back'),
+('雎', 'osprey'),
+('雑', 'blended'),
+('雑', 'mingle'),
+('雑', 'mix'),
+('雑', 'mixed'),
+('雒', 'black horse with white mane'),
+('雕', 'carve'),
+('雕', 'engrave'),
+('雕', 'exhaust'),
+('雕', 'inlay'),
+('雕', 'used for  鵰 an eagle'),
+('雕', 'vulture'),
+('雖', 'although'),
+('雖', 'even if'),
+('雙', 'both'),
+('雙', 'couple'),
+('雙', 'pair'),
+('雙', 'set of two'),
+('雚', 'a heron'),
+('雚', 'heron'),
+('雚', 'small cup'),
+('雛', 'chick'),
+('雛', 'fledging'),
+('雛', 'infant'),
+('雛', 'toddler'),
+('雜', 'blended'),
+('雜', 'mingle'),
+('雜', 'mix'),
+('雜', 'mixed'),
+('雝', 'harmonious'),
+('雝', 'marsh'),
+('雝', 'pool'),
+('雞', 'chicken'),
+('雞', 'chickens'),
+('雞', 'domestic fowl'),
+('離', 'adhere'),
+('離', 'depart'),
+('離', 'departure'),
+('離', 'division'),
+('離', 'go away'),
+('離', 'leave'),
+('離', 'pair'),
+('離', 'separate'),
+('離', 'separation'),
+('難', 'arduous'),
+('難', 'difficult'),
+('難', 'difficulty'),
+('難', 'hard'),
+('難', 'unable'),
+('雨', 'KangXi radical 173'),
+('雨', 'rain'),
+('雨', 'rainy'),
+('雩', 'offer sacrifice for rain'),
+('雪', 'avenge'),
+('雪', 'snow'),
+('雪', 'wipe away shame'),
+('雯', 'cloud patterns'),
+('雯', 'coloring of cloud'),
+('雰', 'atmosphere'),
+('雰', 'fog'),
+('雰', 'mist'),
+('雲', 'Yunnan province'),
+('雲', 'cloud'),
+('雲', 'clouds'),
+('零', 'fraction'),
+('零', 'fragment'),
+('零', 'zero'),
+('雷', 'lightning bolt'),
+('雷', 'thunder'),
+('雹', 'hail'),
+('電', 'electric'),
+('電', 'electricity'),
+('電', 'lightning'),
+('需', 'must'),
+('需', 'need'),
+('需', 'require'),
+('霄', 'clouds'),
+('霄', 'mist'),
+('霄', 'night'),
+('霄', 'sky'),
+('霅', 'thunder'),
+('霆', 'a sudden peal of thunder'),
+('震', 'excite'),
+('震', 'quake'),
+('震', 'shake'),
+('震', 'tremor'),
+('霈', 'flow of water'),
+('霈', 'torrential rains'),
+('霉', 'mildew'),
+('霉', 'mildewed'),
+('霉', 'mold'),
+('霉', 'moldy'),
+('霍', 'quickly'),
+('霍', 'suddenly'),
+('霍', 'surname'),
+('霎', 'an instant'),
+('霎', 'drizzle'),
+('霎', 'instant'),
+('霎', 'light rain'),
+('霎', 'passing'),
+('霏', 'falling of snow and rain'),
+('霑', 'be moistened'),
+('霑', 'moisten'),
+('霑', 'soaked'),
+('霓', 'colored'),
+('霓', 'rainbow'),
+('霓', 'variegated'),
+('霖', 'copious rain'),
+('霖', 'long spell of rain'),
+('霙', 'sleet'),
+('霜', 'candied'),
+('霜', 'crystallized'),
+('霜', 'frost'),
+('霝', 'drop'),
+('霝', 'fall'),
+('霞', 'cloud'),
+('霞', 'clouds'),
+('霞', 'light'),
+('霞', 'mist'),
+('霞', 'rosy'),
+('霞', 'rosy clouds'),
+('霞', 'sunrise'),
+('霞', 'sunset'),
+('霣', 'fall'),
+('霧', 'fine spray'),
+('霧', 'fog'),
+('霧', 'mist'),
+('霧', 'vapor'),
+('霪', 'long and heavy rain'),
+('霰', 'hail'),
+('霰', 'sleet'),
+('露', 'Russia'),
+('露', 'appear'),
+('露', 'bare'),
+('露', 'dew'),
+('露', 'exposed'),
+('露', 'open'),
+('露', 'reveal'),
+('霸', 'best'),
+('霸', 'head'),
+('霸', 'rule by might rather than right'),
+('霸', 'top'),
+('霹', 'crashing thunder'),
+('霹', 'thunder'),
+('霽', 'to cease be angry'),
+('霽', 'to clear up after rain'),
+('霾', 'dust storm'),
+('霾', 'foggy'),
+('霾', 'misty'),
+('靂', 'crashing thunder'),
+('靂', 'thunder'),
+('靂', 'thunderclap'),
+('靄', 'calm'),
+('靄', 'cloudy sky'),
+('靄', 'haze'),
+('靄', 'peaceful'),
+('靆', 'cloudy sky'),
+('靆', 'dark'),
+('靆', 'not clear'),
+('靈', 'deity'),
+('靈', 'soul'),
+('靈', 'spirit'),
+('靈', 'spiritual world'),
+('靉', 'cloudy sky'),
+('靉', 'dark'),
+('靉', 'obscure'),
+('靏', 'crane'),
+('靏', '두루미'),
+('靏', '학'),
+('靑', 'azure'),
+('靑', 'blue'),
+('靑', 'green'),
+('青', 'black'),
+('青', 'blue'),
+('青', 'green'),
+('青', 'young'),
+('靖', 'appease'),
+('靖', 'calm'),
+('靖', 'pacify'),
+('靖', 'peaceful'),
+('靚', '(Cant.) pretty'),
+('靚', 'make up face'),
+('靚', 'ornament'),
+('靚', 'quiet'),
+('靛', 'any blue dye'),
+('靛', 'indigo'),
+('靜', 'gentle'),
+('靜', 'motionless'),
+('靜', 'quiet'),
+('靜', 'still'),
+('靝', '(in taoism) the heaven'),
+('非', 'negative'),
+('非', 'non-'),
+('非', 'not'),
+('非', 'not, negative (negates the following noun)'),
+('非', 'oppose'),
+('靠', 'depend on'),
+('靠', 'lean on'),
+('靠', 'near'),
+('靠', 'trust'),
+('靡', 'disperse'),
+('靡', 'divide'),
+('靡', 'scatter'),
+('面', 'aspect'),
+('面', 'dimension'),
+('面', 'face'),
+('面', 'government'),
+('面', 'plane'),
+('面', 'side'),
+('面', 'surface'),
+('面', 'township'),
+('靦', 'bashful'),
+('靦', 'shy'),
+('靦', 'timid'),
+('靨', 'dimples'),
+('靨', 'salt (table salt, ionic salt)'),
+('革', 'animal hides'),
+('革', 'leather'),
+('革', 'rad. 177'),
+('靭', 'resilient'),
+('靭', 'strong and pliable'),
+('靳', 'martingale'),
+('靳', 'strap on a horses breast'),
+('靴', 'boots'),
+('靴', 'footwear'),
+('靴', '가죽'),
+('靴', '신'),
+('靶', 'reins'),
+('靶', 'splashboard on chariot'),
+('靶', 'target'),
+('靷', 'the leather belt that connects a horse with a cart'),
+('靺', 'stocking'),
+('靺', 'the Tungusic tribe'),
+('靼', 'tartars'),
+('鞀', 'drum'),
+('鞄', 'leather bag'),
+('鞄', 'to work hides'),
+('鞅', 'leather strap over horses neck'),
+('鞋', 'footwear in general'),
+('鞋', 'shoes'),
+('鞍', 'any saddle-shaped object'),
+('鞍', 'saddle'),
+('鞏', 'bind'),
+('鞏', 'firm'),
+('鞏', 'secure'),
+('鞏', 'strong'),
+('鞔', '(Cant.) to cover'),
+('鞔', 'sides or uppers of shoes to stretch a skin on a frame for a drum'),
+('鞘', 'scabbard'),
+('鞘', 'sheath'),
+('鞚', '재갈'),
+('鞞', 'sheath'),
+('鞞', '칼집'),
+('鞠', 'bend'),
+('鞠', 'bow'),
+('鞠', 'nourish'),
+('鞠', 'raise'),
+('鞠', 'rear'),
+('鞣', 'soften'),
+('鞣', 'tan'),
+('鞦', 'leather stap'),
+('鞦', 'swing'),
+('鞨', 'tribe'),
+('鞫', 'department'),
+('鞫', 'interrogate'),
+('鞫', 'question'),
+('鞬', 'a quiver on a horse'),
+('鞬', 'a store'),
+('鞬', 'bundle'),
+('鞭', 'string of firecrackers'),
+('鞭', 'whip'),
+('鞮', 'leather shoes'),
+('鞲', 'leather arm guard'),
+('鞴', 'bellows'),
+('鞴', 'drive horse'),
+('鞴', 'saddle up horse'),
+('鞶', '큰 띠'),
+('鞸', 'leather arm guard'),
+('鞹', 'skin'),
+('鞾', 'boots'),
+('鞾', 'footgear'),
+('鞾', 'footwear'),
+('鞾', 'shoes'),
+('韁', 'bridle'),
+('韁', 'halter'),
+('韁', 'reins'),
+('韃', 'tatars'),
+('韆', 'swing'),
+('韉', 'saddle blanket'),
+('韋', 'KangXi radical number 178'),
+('韋', 'surname'),
+('韋', 'tanned leather'),
+('韍', 'a leather knee-pad worn during sacrifices'),
+('韎', 'leather'),
+('韎', 'red'),
+('韐', 'knee-pad made of red-dyed leather'),
+('韓', 'Han'),
+('韓', 'Korea'),
+('韓', 'Republic of Korea'),
+('韓', 'fence'),
+('韓', 'surname'),
+('韙', 'correct'),
+('韙', 'perpriety'),
+('韙', 'proper'),
+('韙', 'right'),
+('韜', 'bow case'),
+('韜', 'scabbard'),
+('韜', 'sheath'),
+('韝', 'leather arm band'),
+('韞', 'an orange color'),
+('韞', 'box'),
+('韞', 'conceal'),
+('韞', 'cover'),
+('韞', 'hide'),
+('韞', 'orange'),
+('韠', 'knee-pad'),
+('韡', 'gorgeous'),
+('韭', 'leek'),
+('韭', 'radical 179'),
+('韭', 'scallion'),
+('韮', 'leek'),
+('韮', 'scallion'),
+('韱', 'wild onions or leeks'),
+('韲', 'break or smash into pieces'),
+('韲', 'pulverize'),
+('音', 'news'),
+('音', 'pitch'),
+('音', 'pronunciation'),
+('音', 'sound'),
+('音', 'speech'),
+('音', 'tone'),
+('韵', 'rhyme'),
+('韵', 'vowel'),
+('韶', 'beautiful'),
+('韶', 'music of the emperor Shun'),
+('韺', 'music'),
+('韻', 'rhyme'),
+('韻', 'vowel'),
+('響', 'make noise'),
+('響', 'make sound'),
+('響', 'sound'),
+('頀', 'music'),
+('頁', 'leaf'),
+('頁', 'page'),
+('頁', 'rad. no. 181'),
+('頁', 'sheet'),
+('頂', 'carry on head'),
+('頂', 'crown'),
+('頂', 'head'),
+('頂', 'peak'),
+('頂', 'point'),
+('頂', 'top'),
+('頂', 'topmost'),
+('頂', 'very'),
+('頃', 'a measure of area equal to 100 mu or 6.7 hectares'),
+('頃', 'a moment'),
+('頃', 'area'),
+('頃', 'equal'),
+('頃', 'half'),
+('頃', 'hectares'),
+('頃', 'measurement'),
+('頃', 'moment'),
+('頃', 'mu'),
+('頃', 'step'),
+('頃', 'to lean'),
+('頃', 'width'),
+('項', 'a mathematical term (e.g. a term in a series, etc.)'),
+('項', 'clause'),
+('項', 'funds'),
+('項', 'item'),
+('項', 'mathematics'),
+('項', 'nape of neck'),
+('項', 'neck'),
+('項', 'section'),
+('項', 'sum'),
+('項', 'term'),
+('順', 'go along with'),
+('順', 'obedience'),
+('順', 'obey'),
+('順', 'submit to'),
+('須', 'have to'),
+('須', 'moment'),
+('須', 'must'),
+('須', 'necessary'),
+('須', 'whiskers'),
+('頉', 'accident'),
+('頉', 'cheeks'),
+('頉', 'chin'),
+('頉', 'jaw'),
+('頉', 'nourish'),
+('頉', 'rear'),
+('頊', 'anxious'),
+('頊', 'grieved'),
+('頌', 'acclaim'),
+('頌', 'hymn'),
+('頌', 'laud'),
+('頌', 'ode'),
+('頍', 'to raise ones head'),
+('頎', 'tall and slim'),
+('頏', 'fly down or downward'),
+('預', 'arrange'),
+('預', 'in advance'),
+('預', 'prepare'),
+('頑', 'obstinate'),
+('頑', 'recalcitrant'),
+('頑', 'stubborn'),
+('頒', 'bestow'),
+('頒', 'confer'),
+('頒', 'promulgate'),
+('頒', 'publish'),
+('頓', 'arrange'),
+('頓', 'bow'),
+('頓', 'kowtow'),
+('頓', 'pause'),
+('頓', 'stop'),
+('頖', 'Zhou dynasty school'),
+('頖', 'disperse'),
+('頖', 'fall apart'),
+('頗', 'lean one side'),
+('頗', 'rather'),
+('頗', 'very'),
+('領', 'collar'),
+('領', 'dominion'),
+('領', 'guide'),
+('領', 'jurisdiction'),
+('領', 'lead'),
+('領', 'leading'),
+('領', 'neck'),
+('頚', 'neck'),
+('頚', 'throat'),
+('頞', '(nose) bridge'),
+('頡', 'contest'),
+('頡', 'fly upward'),
+('頡', 'soar'),
+('頡', 'to rob'),
+('頣', 'to view others with raised eyes'),
+('頤', 'cheeks'),
+('頤', 'chin'),
+('頤', 'jaw'),
+('頤', 'nourish'),
+('頤', 'rear'),
+('頤', 'to nourish'),
+('頦', 'chin'),
+('頫', 'bend'),
+('頫', 'bow'),
+('頫', 'condescend'),
+('頫', 'nod'),
+('頬', 'cheeks'),
+('頬', 'jaw'),
+('頭', 'boss'),
+('頭', 'chief'),
+('頭', 'first'),
+('頭', 'head'),
+('頭', 'top'),
+('頮', 'wash'),
+('頰', 'amenity'),
+('頰', 'cheeks'),
+('頰', 'jaw'),
+('頲', 'straight'),
+('頲', '곧다'),
+('頷', 'chin'),
+('頷', 'give nod'),
+('頷', 'jowl'),
+('頸', 'neck'),
+('頸', 'throat'),
+('頹', 'decayed'),
+('頹', 'disintegrate'),
+('頹', 'ruined'),
+('頻', 'again and again'),
+('頻', 'frequently'),
+('頼', 'accuse falsely'),
+('頼', 'depend on'),
+('頼', 'rely'),
+('頽', 'ruined'),
+('顆', 'grain'),
+('顆', 'kernel'),
+('顇', 'be haggard'),
+('顇', 'be worn out'),
+('顋', 'branchia'),
+('顋', 'cheek'),
+('顋', 'gill'),
+('顋', 'gills of a fish'),
+('顋', 'jaw'),
+('顋', 'lower part of face'),
+('題', 'forehead'),
+('題', 'headline'),
+('題', 'theme'),
+('題', 'title'),
+('額', 'amount'),
+('額', 'fixed'),
+('額', 'forehead'),
+('額', 'plaque'),
+('額', 'tablet'),
+('額', 'the amount of'),
+('顎', 'jaw'),
+('顏', 'face'),
+('顏', 'facial appearance'),
+('顒', 'grand'),
+('顒', 'large'),
+('顒', 'majestic'),
+('顒', 'solemn'),
+('顓', 'good'),
+('顓', 'honest'),
+('顓', 'respectful'),
+('顓', 'simple'),
+('顓', 'stupid'),
+('顔', 'face'),
+('顔', 'facial appearance'),
+('顕', 'clear'),
+('顕', 'display'),
+('顕', 'evident'),
+('顕', 'manifest'),
+('顖', 'skull'),
+('顖', 'top of the head'),
+('願', 'ambition'),
+('願', 'desire'),
+('願', 'want'),
+('願', 'wish'),
+('顙', 'the forehead'),
+('顙', 'to kowtow'),
+('顚', 'fall'),
+('顚', 'peak'),
+('顚', 'summit'),
+('顚', 'top'),
+('顚', 'upset'),
+('顛', 'peak'),
+('顛', 'summit'),
+('顛', 'top'),
+('顛', 'upset'),
+('類', 'category'),
+('類', 'class'),
+('類', 'family'),
+('類', 'genus'),
+('類', 'group'),
+('類', 'kind'),
+('類', 'order'),
+('類', 'parallel'),
+('類', 'sort'),
+('類', 'type'),
+('顥', 'hoary'),
+('顥', 'luminous'),
+('顥', 'white'),
+('顦', 'be worn-out'),
+('顦', 'emaciated'),
+('顦', 'haggard'),
+('顧', 'after'),
+('顧', 'back'),
+('顧', 'look'),
+('顧', 'look after'),
+('顧', 'look at'),
+('顧', 'look back'),
+('顧', 'on'),
+('顧', 'reflect'),
+('顫', 'shiver'),
+('顫', 'tremble'),
+('顫', 'trembling'),
+('顬', 'head'),
+('顬', 'temple'),
+('顯', 'clear'),
+('顯', 'display'),
+('顯', 'evident'),
+('顯', 'manifest'),
+('顰', 'frown'),
+('顰', 'knit brows'),
+('顰', 'with knitted'),
+('顱', 'skull'),
+('顳', 'the temporal bone'),
+('顴', 'cheek bones'),
+('風', 'a stroke'),
+('風', 'air'),
+('風', 'atmosphere'),
+('風', 'look'),
+('風', 'manners'),
+('風', 'style'),
+('風', 'wind'),
+('颭', 'sway in wind'),
+('颯', 'bleak'),
+('颯', 'melancholy'),
+('颯', 'the sound of the wind'),
+('颱', 'taiphoon'),
+('颱', 'typhoon'),
+('颳', 'to blow'),
+('颶', 'cyclone'),
+('颶', 'gale'),
+('颶', 'typhoon'),
+('颺', 'float'),
+('颺', 'fly'),
+('颺', 'scatter'),
+('颺', 'soar'),
+('颻', 'gale'),
+('颻', 'wind'),
+('颼', 'blow chilly'),
+('颼', 'sound of wind'),
+('颿', 'sail'),
+('飂', 'wind in high places'),
+('飃', 'flutter'),
+('飃', 'whirlwind'),
+('飄', 'cyclone'),
+('飄', 'floating'),
+('飄', 'whirlwind'),
+('飆', 'stormy gale'),
+('飆', 'whirlwind'),
+('飇', 'stormy gale'),
+('飇', 'whirlwind'),
+('飛', 'dart'),
+('飛', 'fly'),
+('飛', 'go quickly'),
+('飛', 'high'),
+('飜', 'air'),
+('飜', 'capsize'),
+('飜', 'circle'),
+('飜', 'flip over'),
+('飜', 'fly'),
+('飜', 'soar'),
+('飜', 'translate'),
+('飜', 'upset'),
+('食', 'KangXi radical number 184'),
+('食', 'eat'),
+('食', 'food'),
+('食', 'meal'),
+('食', 'personal name'),
+('飡', 'eat'),
+('飡', 'meal'),
+('飢', 'a famine'),
+('飢', 'famine'),
+('飢', 'hunger'),
+('飢', 'hungry'),
+('飢', 'starving'),
+('飣', 'display food for show only'),
+('飣', 'sacrifice'),
+('飦', 'rich'),
+('飦', 'thick'),
+('飦', 'well-boiled congee or gruel'),
+('飧', 'cooked food'),
+('飧', 'evening meal'),
+('飧', 'supper'),
+('飪', 'cook until well done'),
+('飪', 'cooked food'),
+('飫', 'confer'),
+('飫', 'satiated'),
+('飫', 'surfeited'),
+('飭', 'command'),
+('飭', 'give command'),
+('飭', 'order'),
+('飮', 'drink'),
+('飮', 'kind of drink'),
+('飮', 'swallow'),
+('飯', 'cooked rice'),
+('飯', 'food'),
+('飯', 'meal'),
+('飯', 'rice'),
+('飱', 'evening meal'),
+('飲', 'drink'),
+('飲', 'inhale'),
+('飲', 'kind of drink'),
+('飲', 'swallow'),
+('飴', 'sweet-cakes'),
+('飴', 'sweet-meats'),
+('飴', 'syrup'),
+('飼', 'feed'),
+('飼', 'nourish'),
+('飼', 'raise'),
+('飼', 'raise animals'),
+('飽', 'eat heartily'),
+('飽', 'eat ones fill'),
+('飽', 'full'),
+('飾', 'adorn'),
+('飾', 'decorate'),
+('飾', 'ornament'),
+('飾', 'to deceive'),
+('餁', 'cook until well done'),
+('餁', 'cooked food'),
+('餃', 'stuffed dumplings'),
+('餅', 'biscuits'),
+('餅', 'rice cake'),
+('餅', 'rice-cakes'),
+('餉', 'rations and pay for soldiers'),
+('養', 'bring up'),
+('養', 'raise'),
+('養', 'rear'),
+('養', 'support'),
+('餌', 'bait'),
+('餌', 'dumplings'),
+('餌', 'entice'),
+('餐', 'dine'),
+('餐', 'eat'),
+('餐', 'food'),
+('餐', 'meal'),
+('餒', 'famished'),
+('餒', 'hungry'),
+('餒', 'starving'),
+('餓', 'greedy'),
+('餓', 'greedy for'),
+('餓', 'hunger'),
+('餓', 'hungry'),
+('餔', 'dinner time'),
+('餔', 'eat'),
+('餔', 'sunset'),
+('餕', 'leftovers'),
+('餘', 'excess'),
+('餘', 'remainder'),
+('餘', 'surplus'),
+('餚', 'food'),
+('餚', 'prepared meat'),
+('餞', 'farewell party'),
+('餞', 'see off'),
+('餞', 'send off'),
+('餠', 'biscuits'),
+('餠', 'rice cake'),
+('餠', 'rice-cakes'),
+('餦', 'candy'),
+('餦', 'pastry'),
+('餧', 'feed'),
+('餧', 'food'),
+('餧', 'steamed bread'),
+('餧', 'to feed'),
+('館', 'a large hall'),
+('館', 'building'),
+('館', 'hotel'),
+('館', 'inn'),
+('館', 'public'),
+('館', 'public building'),
+('餪', 'feast'),
+('餬', 'congee'),
+('餬', 'gruel'),
+('餬', 'paste'),
+('餬', 'porridge'),
+('餮', 'a greedy pers'),
+('餮', 'a legendary animal'),
+('餱', 'dry goods'),
+('餱', 'dry provisions'),
+('餲', 'spoiled'),
+('餳', 'malt sugar'),
+('餳', 'sticky'),
+('餳', 'sugar'),
+('餳', 'syrup'),
+('餹', 'candy'),
+('餹', 'crystallized sweetmeats'),
+('餹', 'sugar'),
+('餹', 'sugared'),
+('餼', 'gift'),
+('餼', 'grain'),
+('餼', 'sacrificial victim'),
+('餽', 'gift'),
+('餽', 'make present of food'),
+('饂', 'Japanese noodles'),
+('饅', 'steamed bread'),
+('饅', 'steamed dumplings'),
+('饈', 'eat'),
+('饈', 'food'),
+('饈', 'meal'),
+('饈', 'offer'),
+('饉', 'time of famine or crop failure'),
+('饊', 'fried round cakes of wheat flour'),
+('饋', 'offer food superior'),
+('饋', 'send gift'),
+('饌', 'delicacies'),
+('饌', 'feed'),
+('饌', 'fine meats'),
+('饌', 'food'),
+('饌', 'provide for'),
+('饌', 'side dish'),
+('饌', 'support'),
+('饍', 'board'),
+('饍', 'meals'),
+('饍', 'provisions'),
+('饐', 'rotten'),
+('饐', 'sour'),
+('饐', 'spoiled'),
+('饑', 'be hungry'),
+('饑', 'famine'),
+('饑', 'starve'),
+('饒', 'abundant'),
+('饒', 'bountiful'),
+('饒', 'plentiful'),
+('饔', 'breakfast'),
+('饔', 'cook'),
+('饔', 'eat prepared food'),
+('饔', 'food'),
+('饔', 'sacrifice'),
+('饕', 'covetous'),
+('饕', 'gluttonous'),
+('饕', 'greedy'),
+('饗', 'banquet'),
+('饗', 'host banquet'),
+('饜', 'be satiated'),
+('饜', 'eat ones full'),
+('饞', 'gluttonous'),
+('饞', 'greedy'),
+('饞', 'lecherous'),
+('饞', 'lewd'),
+('饟', 'dry'),
+('饟', 'food'),
+('饟', 'provisions'),
+('饤', 'display food for show only'),
+('饤', 'sacrifice'),
+('馓', 'fried round cakes of wheat flour'),
+('首', 'a poem'),
+('首', 'chief'),
+('首', 'first'),
+('首', 'head'),
+('首', 'leader'),
+('馗', 'cheekbone'),
+('馗', 'intersection'),
+('馗', 'path'),
+('馗', 'road'),
+('馘', 'cut off left ear'),
+('馘', 'tally dead enemy'),
+('香', 'fragrance'),
+('香', 'fragrant'),
+('香', 'incense'),
+('香', 'perfume'),
+('香', 'sweet smelling'),
+('馝', 'fragrance'),
+('馥', 'aroma'),
+('馥', 'fragrance'),
+('馥', 'scent'),
+('馨', 'aromatic'),
+('馨', 'distant fragrance'),
+('馨', 'fragrant'),
+('馬', 'KangXi radical 187'),
+('馬', 'horse'),
+('馬', 'surname'),
+('馭', 'control'),
+('馭', 'drive'),
+('馭', 'manage'),
+('馭', 'ride'),
+('馮', 'by dint of'),
+('馮', 'gallop'),
+('馮', 'surname'),
+('馱', 'carry on back'),
+('馳', 'go quickly or swiftly'),
+('馳', 'hurry'),
+('馴', 'docile'),
+('馴', 'obedient'),
+('馴', 'tame'),
+('馹', 'post horse'),
+('馹', 'relay horse'),
+('駁', 'argue'),
+('駁', 'contradict'),
+('駁', 'mixed'),
+('駁', 'rebut'),
+('駁', 'refute'),
+('駁', 'suddenly'),
+('駁', 'varicolored'),
+('駁', 'variegated'),
+('駄', 'a horse load'),
+('駄', 'a pack-horse'),
+('駅', 'relay station'),
+('駆', 'drive away'),
+('駆', 'expel'),
+('駆', 'spur a horse on'),
+('駈', 'drive away'),
+('駈', 'expel'),
+('駈', 'spur a horse on'),
+('駉', 'big'),
+('駏', 'offspring of a stallion and a she-mule'),
+('駐', 'posted'),
+('駐', 'reside at'),
+('駐', 'stationed'),
+('駐', 'to be stationed at'),
+('駐', 'to stop'),
+('駑', 'old'),
+('駑', 'old horse'),
+('駑', 'tired'),
+('駑', 'weak'),
+('駒', 'colt'),
+('駒', 'fleet'),
+('駒', 'sun'),
+('駒', 'surname'),
+('駒', 'swift'),
+('駕', 'a cart'),
+('駕', 'carriage'),
+('駕', 'cart'),
+('駕', 'fly'),
+('駕', 'sail'),
+('駕', 'to drive'),
+('駘', 'a jade'),
+('駘', 'an old'),
+('駘', 'exhausted'),
+('駘', 'tired'),
+('駘', 'tired horse'),
+('駙', 'close'),
+('駙', 'extra horse'),
+('駙', 'fast'),
+('駙', 'imperial son-in-law'),
+('駛', 'drive'),
+('駛', 'fast'),
+('駛', 'pilot'),
+('駛', 'quick'),
+('駛', 'sail'),
+('駜', 'strong horse'),
+('駝', 'a camel'),
+('駝', 'camel'),
+('駝', 'humpbacked'),
+('駝', 'to carry on the back'),
+('駞', 'camel'),
+('駟', 'team of four horses'),
+('駢', 'associate'),
+('駢', 'join'),
+('駢', 'team of horses'),
+('駪', 'crowd'),
+('駭', 'frighten'),
+('駭', 'scare'),
+('駭', 'shock'),
+('駭', 'terrify'),
+('駮', 'a kind of fierce animal'),
+('駮', 'argue'),
+('駮', 'join'),
+('駮', 'piebald horse'),
+('駮', 'transfer'),
+('駮', 'variegated'),
+('駱', 'a camel'),
+('駱', 'a white horse with black mane'),
+('駸', 'galloping'),
+('駸', 'speeding'),
+('駻', 'run wild'),
+('駻', 'to rage'),
+('駽', 'grey'),
+('駿', 'excellent horse'),
+('駿', 'noble steed'),
+('騁', 'gallop horse'),
+('騁', 'hasten'),
+('騁', 'hurry'),
+('騂', 'bay'),
+('騂', 'brown'),
+('騂', 'harmonious'),
+('騂', 'neat'),
+('騂', 'red'),
+('騃', 'foolish'),
+('騃', 'stupid'),
+('騄', 'name of a legendary swift horse'),
+('騅', 'piebald horse'),
+('騈', 'associate'),
+('騈', 'team of horses'),
+('騋', 'tall(7 chi) horse'),
+('騍', 'mother horse'),
+('騎', 'cavalry'),
+('騎', 'mount'),
+('騎', 'ride'),
+('騎', 'ride horseback'),
+('騏', 'excellent horse'),
+('騏', 'piebald horse'),
+('騑', 'horse'),
+('騑', 'run'),
+('騒', 'annoy'),
+('騒', 'bother'),
+('騒', 'disturb'),
+('騒', 'harass'),
+('験', 'examine'),
+('験', 'inspect'),
+('験', 'test'),
+('験', 'verify'),
+('騖', 'gallop'),
+('騖', 'pursue'),
+('騖', 'run'),
+('騖', 'rush about'),
+('騖', 'sprint'),
+('騘', 'a piebald horse'),
+('騙', 'cheat out of'),
+('騙', 'defraud'),
+('騙', 'swindle'),
+('騫', 'fly'),
+('騫', 'hold high'),
+('騫', 'raise'),
+('騫', 'soar'),
+('騭', 'promote'),
+('騭', 'stallion'),
+('騰', 'fly'),
+('騰', 'gallop'),
+('騰', 'prance'),
+('騰', 'rise'),
+('騰', 'run'),
+('騳', 'run'),
+('騳', '달리다'),
+('騵', 'bay'),
+('騶', 'groom'),
+('騶', 'mounted escort'),
+('騷', 'agitate'),
+('騷', 'annoy'),
+('騷', 'bother'),
+('騷', 'disturb'),
+('騷', 'grieved'),
+('騷', 'harass'),
+('騷', 'sad'),
+('騸', 'castrate'),
+('騸', 'geld'),
+('騾', 'mule'),
+('驀', 'abruptly'),
+('驀', 'quickly'),
+('驀', 'suddenly'),
+('驁', 'arrogant'),
+('驁', 'be'),
+('驁', 'despise'),
+('驁', 'mustang'),
+('驁', 'noble'),
+('驁', 'steed'),
+('驁', 'wild'),
+('驁', 'wild horse'),
+('驂', 'two outside ones in three horse'),
+('驃', 'charger'),
+('驃', 'steed'),
+('驃', 'swift'),
+('驃', 'valiant'),
+('驄', 'horse with a bluish white color'),
+('驅', 'drive away'),
+('驅', 'expel'),
+('驅', 'horse'),
+('驅', 'spur'),
+('驅', 'spur a horse on'),
+('驊', 'an excellent horse'),
+('驌', 'name of a famous horse'),
+('驍', 'brave'),
+('驍', 'excellent horse'),
+('驍', 'valiant'),
+('驏', 'horse without saddle'),
+('驒', 'dappled'),
+('驕', 'haughty'),
+('驕', 'spirited horse'),
+('驗', 'examine'),
+('驗', 'inspect'),
+('驗', 'test'),
+('驗', 'verify'),
+('驘', 'mule'),
+('驚', 'frighten'),
+('驚', 'startle'),
+('驚', 'startled'),
+('驚', 'surprise'),
+('驚', 'surprised'),
+('驛', 'relay station'),
+('驟', 'gallop'),
+('驟', 'procedure'),
+('驟', 'sudden(ly)'),
+('驢', 'ass'),
+('驢', 'donkey'),
+('驤', 'gallop about with head uplifted'),
+('驥', 'refined and'),
+('驥', 'thoroughbred horse'),
+('驩', 'glad'),
+('驩', 'happy'),
+('驩', 'joy'),
+('驩', 'pleased'),
+('驩', 'to enjoy'),
+('驪', 'a pair of horses'),
+('驪', 'a pure black horse'),
+('驲', 'post horse'),
+('驲', 'relay horse'),
+('骕', 'name of a famous horse'),
+('骨', 'bone'),
+('骨', 'frame'),
+('骨', 'framework'),
+('骨', 'skeleton'),
+('骨', 'the marrow (of bones)'),
+('骪', 'crooked bones'),
+('骯', 'dirty'),
+('骰', 'dice'),
+('骰', 'die'),
+('骶', 'coccyx'),
+('骶', 'hips'),
+('骷', 'skeleton'),
+('骸', 'body'),
+('骸', 'bone'),
+('骸', 'corpse'),
+('骸', 'leg bone'),
+('骸', 'skeleton'),
+('骼', 'bone'),
+('骼', 'corpse'),
+('骼', 'skeleton'),
+('骾', 'bony'),
+('髀', 'buttocks'),
+('髀', 'thigh'),
+('髀', 'thigh bone'),
+('髁', 'hipbone'),
+('髁', 'kneecap'),
+('髁', 'thigh bone'),
+('髂', 'the pelvis'),
+('髆', 'shoulder blade'),
+('髏', 'skeleton'),
+('髏', 'skull'),
+('髑', 'skull'),
+('髒', 'dirty'),
+('髒', 'fat'),
+('髒', 'firm'),
+('髓', 'bone'),
+('髓', 'bone marrow'),
+('髓', 'essences'),
+('髓', 'marrow'),
+('髓', 'substances'),
+('體', 'body'),
+('體', 'class'),
+('體', 'form'),
+('體', 'group'),
+('體', 'handwriting'),
+('體', 'matter'),
+('體', 'object'),
+('體', 'shape'),
+('體', 'style'),
+('體', 'unit'),
+('髕', 'kneecap'),
+('髖', 'hip'),
+('髖', 'hipbone'),
+('髗', 'the forehead'),
+('髗', 'the skull'),
+('高', 'elevated'),
+('高', 'high'),
+('高', 'lofty'),
+('高', 'tall'),
+('髙', 'elevated'),
+('髙', 'high'),
+('髙', 'lofty'),
+('髙', 'tall'),
+('髙', 'variant of 高'),
+('髟', 'KangXi radical 190'),
+('髟', 'hair'),
+('髡', 'ancient punishment'),
+('髡', 'to shear tree'),
+('髢', 'wig'),
+('髣', 'like'),
+('髣', 'similar to'),
+('髥', 'beard'),
+('髥', 'mustache'),
+('髦', 'flowing hair of young child'),
+('髫', 'a youngster'),
+('髫', 'childrens hair style'),
+('髭', 'mustache'),
+('髮', 'hair'),
+('髯', 'beard'),
+('髯', 'mustache'),
+('髲', 'a wig'),
+('髴', 'disheveled hair'),
+('髴', 'similar to'),
+('髺', 'as in mourning'),
+('髺', 'the hair dishevelled'),
+('髻', 'hair rolled up in a bun'),
+('髻', 'topknot'),
+('髽', 'to dress the hair'),
+('鬂', 'the hair on the temples'),
+('鬅', '(Cant.) 鬅鬠'),
+('鬅', 'flowing hair'),
+('鬅', 'loose'),
+('鬅', 'to be slovenly dressed'),
+('鬅', 'unkempt hair'),
+('鬆', 'lax'),
+('鬆', 'loose'),
+('鬆', 'loosen'),
+('鬆', 'relax'),
+('鬈', 'beautiful'),
+('鬈', 'curly'),
+('鬈', 'fine growth of hair curly hair'),
+('鬈', 'hair'),
+('鬋', 'bangs'),
+('鬋', 'forelock'),
+('鬍', 'beard'),
+('鬍', 'mustache'),
+('鬍', 'whiskers'),
+('鬐', 'fins'),
+('鬐', 'horses mane'),
+('鬒', 'black'),
+('鬒', 'glossy hair'),
+('鬖', 'wild hair'),
+('鬘', 'beautiful hair'),
+('鬙', 'matted hair'),
+('鬚', 'beard'),
+('鬚', 'whisker-like'),
+('鬚', 'whiskers'),
+('鬟', 'dress hair in coiled knot'),
+('鬟', 'maid'),
+('鬠', '(Cant.) 鬅鬠'),
+('鬠', 'bind'),
+('鬠', 'hair'),
+('鬠', 'to be slovenly dressed'),
+('鬠', 'to make a top knot'),
+('鬢', 'hair on temples'),
+('鬣', 'fin'),
+('鬣', 'horses mane'),
+('鬣', 'human whiskers'),
+('鬥', 'fight'),
+('鬧', 'dispute hotly'),
+('鬧', 'quarrel'),
+('鬨', 'boisterous'),
+('鬨', 'clamor'),
+('鬨', 'noise'),
+('鬩', 'feud'),
+('鬩', 'fight'),
+('鬩', 'quarrel'),
+('鬪', 'compete'),
+('鬪', 'contend'),
+('鬪', 'fight'),
+('鬪', 'struggle'),
+('鬮', 'draw lots'),
+('鬮', 'lots(to be drawn)'),
+('鬯', 'sacrificial wine'),
+('鬯', 'unhindered'),
+('鬰', 'dense'),
+('鬰', 'luxuriant'),
+('鬰', 'moody'),
+('鬰', 'thick'),
+('鬱', 'dense'),
+('鬱', 'luxuriant'),
+('鬱', 'moody'),
+('鬱', 'stifling'),
+('鬱', 'stuffy'),
+('鬱', 'suffocating'),
+('鬱', 'thick'),
+('鬲', 'KangXi radical number 193'),
+('鬲', 'name of a state'),
+('鬲', 'type of caldron with three hollow legs'),
+('鬴', 'cauldron'),
+('鬼', 'devil'),
+('鬼', 'ghost'),
+('鬼', 'spirit'),
+('鬼', 'spirit of dead'),
+('魁', 'best'),
+('魁', 'chief'),
+('魁', 'leader'),
+('魁', 'monstrous'),
+('魂', 'soul'),
+('魂', 'spirit'),
+('魃', 'drought demon'),
+('魄', 'body'),
+('魄', 'dark part of moon'),
+('魄', 'fall'),
+('魄', 'soul'),
+('魄', 'spirit'),
+('魄', 'vigor'),
+('魄', 'wither'),
+('魅', 'charm'),
+('魅', 'elf'),
+('魅', 'kind of forest demon'),
+('魈', 'mischevious'),
+('魈', 'one footed spirit that dwells in the mountains'),
+('魋', 'bear'),
+('魋', 'brown'),
+('魍', 'demons'),
+('魍', 'mountain spirits'),
+('魎', 'a kind of monster'),
+('魏', 'Wei'),
+('魏', 'kingdom of Wei'),
+('魏', 'surname'),
+('魑', 'a mountain demon resembling a tiger'),
+('魔', 'demon'),
+('魔', 'evil spirits'),
+('魔', 'magic power'),
+('魘', 'bad dreams'),
+('魘', 'nightmare'),
+('魚', 'KangXi radical 195'),
+('魚', 'fish'),
+('魚', 'surname'),
+('魛', 'anchovy'),
+('魜', 'manatee'),
+('魜', 'mermaid'),
+('魦', 'including some rays and skates'),
+('魦', 'shark family'),
+('魯', 'foolish'),
+('魯', 'rash'),
+('魯', 'stupid'),
+('魯', 'vulgar'),
+('魴', 'bream'),
+('鮀', 'snakefish'),
+('鮃', 'a flatfish'),
+('鮃', 'flounder'),
+('鮆', 'cutlassfish'),
+('鮎', 'catfish'),
+('鮎', 'parasilurus asotus'),
+('鮎', 'sheatfish'),
+('鮎', '메기'),
+('鮐', 'blowfish'),
+('鮐', 'globefish'),
+('鮐', 'tetraodon'),
+('鮑', 'abalone'),
+('鮑', 'dried fish'),
+('鮑', 'surname'),
+('鮒', 'carassicus auratus'),
+('鮒', 'carp'),
+('鮓', 'minced and salted fish'),
+('鮓', 'to preserve'),
+('鮚', 'clam'),
+('鮚', 'oyster'),
+('鮝', 'dried fish'),
+('鮞', 'mudfish'),
+('鮞', 'roe'),
+('鮟', 'anglerfish'),
+('鮟', 'monkfish'),
+('鮟', '아귀'),
+('鮠', 'catfish'),
+('鮠', 'small'),
+('鮧', 'the sheat fish'),
+('鮨', 'seasoned rice mixed with fish or vegetables'),
+('鮪', 'kind of sturgeon'),
+('鮪', 'tuna'),
+('鮪', 'tunny'),
+('鮪', '다랑어'),
+('鮫', 'shark'),
+('鮭', 'salmon'),
+('鮭', 'spheroides vermicularis'),
+('鮮', 'delicious'),
+('鮮', 'few'),
+('鮮', 'fish'),
+('鮮', 'fresh'),
+('鮮', 'new'),
+('鮮', 'rare'),
+('鮮', 'smooth'),
+('鮹', 'an octopus'),
+('鮹', 'devilfish'),
+('鯀', 'father of the emperor Yu'),
+('鯀', 'giant fish'),
+('鯁', 'disaster'),
+('鯁', 'fish bones'),
+('鯁', 'honest'),
+('鯁', 'upright'),
+('鯆', 'the skate or ray'),
+('鯇', 'carp'),
+('鯈', 'minnow'),
+('鯉', 'carp'),
+('鯊', 'shark'),
+('鯋', 'shark'),
+('鯔', 'mullet'),
+('鯖', 'mackerel'),
+('鯛', 'pagrosomus major'),
+('鯛', 'porgy'),
+('鯛', 'sea bream'),
+('鯛', '도미'),
+('鯝', 'fish guts'),
+('鯡', 'herring'),
+('鯢', 'Cryptobranchus japonicus'),
+('鯢', 'a salamander'),
+('鯢', 'salamander'),
+('鯢', '도롱뇽'),
+('鯤', 'fish'),
+('鯤', 'fy'),
+('鯤', 'mythical'),
+('鯤', 'roe'),
+('鯤', 'spawn'),
+('鯤', '곤어'),
+('鯤', '곤이'),
+('鯧', 'Stromateoides argenteus'),
+('鯧', 'the silvery pomfret'),
+('鯨', 'whale'),
+('鯪', 'carp'),
+('鯫', 'minnow'),
+('鯫', 'small'),
+('鯫', 'small fish'),
+('鯷', 'anchovy'),
+('鯽', 'Carassius auratus'),
+('鯽', 'carassius auratus'),
+('鯽', 'crucian carp'),
+('鯽', 'cuttlefish'),
+('鯽', 'squid'),
+('鯿', 'bream'),
+('鰈', 'concubine, demimondaine'),
+('鰈', 'flatfish'),
+('鰈', 'flounder'),
+('鰈', 'sole'),
+('鰉', 'sturgeon'),
+('鰊', 'a herring'),
+('鰋', 'catfish'),
+('鰋', 'sheatfish'),
+('鰋', '메기'),
+('鰌', 'eel'),
+('鰌', 'lizard'),
+('鰌', 'loach'),
+('鰌', 'squid'),
+('鰍', 'loach'),
+('鰐', 'alligator'),
+('鰐', 'crocodile'),
+('鰐', '악어'),
+('鰒', 'abalone'),
+('鰓', 'fish gills'),
+('鰓', 'gill'),
+('鰕', 'prawn'),
+('鰕', 'shrimp'),
+('鰕', '蝦'),
+('鰣', 'hilsa herring'),
+('鰣', 'reeves shad'),
+('鰤', 'a yellowtail(fish)'),
+('鰥', 'bachelor'),
+('鰥', 'huge fish'),
+('鰥', 'widower'),
+('鰨', 'sole'),
+('鰩', 'the nautilus'),
+('鰩', 'the ray'),
+('鰭', 'fin'),
+('鰮', 'sardine'),
+('鰯', 'a sardine'),
+('鰱', 'hypophthalmiathys'),
+('鰱', 'salmon'),
+('鰱', 'silver carp'),
+('鰲', 'huge sea turtle'),
+('鰳', 'Chinese herring'),
+('鰳', 'shad'),
+('鰵', 'codfish'),
+('鰷', 'minnow'),
+('鰹', 'bonito'),
+('鰹', 'skipjack'),
+('鰺', 'a horse mackerel'),
+('鰻', 'eel'),
+('鰾', 'swimming bladder of fish'),
+('鱅', 'a kind of tench'),
+('鱇', 'anglerfish'),
+('鱈', 'codfish'),
+('鱉', 'turtle'),
+('鱏', 'a ray'),
+('鱏', 'skate'),
+('鱏', 'sturgeon'),
+('鱒', 'barbel'),
+('鱓', 'eel'),
+('鱔', 'eel'),
+('鱖', 'mandarin fish'),
+('鱗', 'fish scales'),
+('鱗', 'scale'),
+('鱘', 'sturgeon'),
+('鱟', 'king crab'),
+('鱠', 'hash'),
+('鱠', 'minced fish'),
+('鱣', 'carp'),
+('鱣', 'sturgeon'),
+('鱧', 'snakehead'),
+('鱭', 'anchovy'),
+('鱸', 'sea bass'),
+('鱸', 'sea perch'),
+('鱸', '농어'),
+('鱺', 'eel'),
+('鱻', 'delicious'),
+('鱻', 'few'),
+('鱻', 'fresh'),
+('鱻', 'new'),
+('鱻', 'rare'),
+('鳥', 'KangXi radical 196'),
+('鳥', 'bird'),
+('鳦', 'swallow'),
+('鳧', 'duck'),
+('鳧', 'swim'),
+('鳧', 'teal'),
+('鳧', 'wild duck'),
+('鳩', 'assemble'),
+('鳩', 'collect'),
+('鳩', 'dove'),
+('鳩', 'pigeon'),
+('鳬', 'swim'),
+('鳬', 'teal'),
+('鳬', 'wild duck'),
+('鳮', 'chickens'),
+('鳮', 'domestic fowl'),
+('鳯', 'male phoenix'),
+('鳯', 'symbol of joy'),
+('鳳', 'male'),
+('鳳', 'male phoenix'),
+('鳳', 'phoenix'),
+('鳳', 'symbol of joy'),
+('鳴', 'animal'),
+('鳴', 'bird'),
+('鳴', 'cry'),
+('鳴', 'cry of bird or animal'),
+('鳴', 'make'),
+('鳴', 'make sound'),
+('鳴', 'sound'),
+('鳶', 'Milvus species(various)'),
+('鳶', 'a kite'),
+('鳶', 'kite'),
+('鴃', 'butcherbird'),
+('鴃', 'shrike'),
+('鴆', 'a bird resembling the secretary falcon'),
+('鴇', 'Otis species(various)'),
+('鴇', 'bustard'),
+('鴇', 'procuress'),
+('鴈', 'wild goose'),
+('鴉', 'Corvus species(various)'),
+('鴉', 'crow'),
+('鴉', 'raven'),
+('鴒', 'Motacilla species(various)'),
+('鴒', 'species of lark'),
+('鴒', 'wagtail'),
+('鴕', 'Struthio camelus'),
+('鴕', 'ostrich'),
+('鴛', 'male mandarin duck(Aix galericulata)'),
+('鴟', 'horned owl'),
+('鴟', 'kite'),
+('鴟', 'wine cups'),
+('鴣', 'species of Taiwan pigeon'),
+('鴦', 'female mandarin duck(Aix galericulata)'),
+('鴨', 'Anas species(various)'),
+('鴨', 'duck'),
+('鴰', 'the crow'),
+('鴰', '재두루미'),
+('鴳', 'quail'),
+('鴴', 'sparrow'),
+('鴴', '참새'),
+('鴻', 'species of wild swan'),
+('鴻', 'vast'),
+('鵁', 'Ardea cinerea'),
+('鵁', 'grey heron'),
+('鵂', 'bird of ill omen'),
+('鵂', 'horned owl'),
+('鵂', 'scops chinensis'),
+('鵄', 'horned owl'),
+('鵄', 'kite'),
+('鵄', 'variant of 鴟'),
+('鵄', 'wine cups'),
+('鵑', 'cuckoo'),
+('鵓', 'species of pigeon'),
+('鵜', 'pelican'),
+('鵝', 'cuneiform'),
+('鵝', 'goose'),
+('鵝', 'skein'),
+('鵝', 'wedge'),
+('鵝', 'wild goose'),
+('鵝', '雁'),
+('鵝', '거위'),
+('鵝', '기러기'),
+('鵞', 'goose'),
+('鵠', 'target'),
+('鵡', 'parrot'),
+('鵡', 'species of parrot'),
+('鵩', 'Otus scops'),
+('鵩', 'buzzard'),
+('鵩', 'owl-like bird'),
+('鵬', 'fabulous bird of enormous size'),
+('鵯', 'Pycnonotus species(various)'),
+('鵰', 'Aquila species(various)'),
+('鵰', 'eagle'),
+('鵰', 'vulture'),
+('鵲', 'Pica species(various)'),
+('鵲', 'magpie'),
+('鵷', 'co-worker'),
+('鵷', 'phoenix'),
+('鵻', 'a hawk'),
+('鵻', 'pigeon'),
+('鵻', 'turtle-dove'),
+('鵾', 'a bird resembling the crane'),
+('鵾', 'swan'),
+('鶄', 'Ardea cinerea'),
+('鶄', 'grey heron'),
+('鶄', '백로'),
+('鶄', '푸른'),
+('鶉', 'Turnix species(various)'),
+('鶉', 'quail'),
+('鶖', 'Garrulus glandarius'),
+('鶖', 'large waterfowl with naked head'),
+('鶚', 'Pandion haliaetus'),
+('鶚', 'fishhawk'),
+('鶚', 'osprey'),
+('鶡', 'crossbill'),
+('鶡', 'species of nightingale'),
+('鶤', 'swan'),
+('鶩', 'duck'),
+('鶬', 'oriole'),
+('鶯', 'Chinese'),
+('鶯', 'Sylvia species(various)'),
+('鶯', 'bush'),
+('鶯', 'green finch'),
+('鶯', 'oriole'),
+('鶯', 'warbler'),
+('鶴', 'Grus species(various)'),
+('鶴', 'crane'),
+('鶵', 'chick'),
+('鶵', 'fledging'),
+('鶵', 'infant'),
+('鶵', 'toddler'),
+('鶸', 'light yellowish-green'),
+('鶹', 'the owl'),
+('鶻', 'a kind of pigeon'),
+('鶻', 'falcon'),
+('鶿', 'cormorant'),
+('鷁', 'fishhawk bow or prow'),
+('鷁', 'prow'),
+('鷂', 'Circus species(various)'),
+('鷂', 'sparrow hawk'),
+('鷄', 'chicken'),
+('鷇', 'chicks'),
+('鷇', 'eyas'),
+('鷇', 'fledglings'),
+('鷇', 'foster'),
+('鷇', 'nestling'),
+('鷓', 'partridge'),
+('鷖', 'seagull'),
+('鷗', 'Larus species(various)'),
+('鷗', 'seagull'),
+('鷗', 'tern'),
+('鷙', 'hawk'),
+('鷙', 'vulture'),
+('鷦', 'wren'),
+('鷩', 'pheasant'),
+('鷪', 'bush'),
+('鷪', 'nightingale'),
+('鷪', 'warbler'),
+('鷫', 'turquoise kingfisher'),
+('鷲', 'condor'),
+('鷲', 'vulture'),
+('鷳', 'Lophura nycthemera'),
+('鷳', 'the silver pheasant'),
+('鷸', 'Tringa species(various)'),
+('鷸', 'kingfisher'),
+('鷸', 'snipe'),
+('鷹', 'Accipiter species(various)'),
+('鷹', 'eagle'),
+('鷹', 'falcon'),
+('鷹', 'gyrfalcon'),
+('鷹', 'hawk'),
+('鷹', 'peregrine'),
+('鷺', 'Ardea species(various)'),
+('鷺', 'egret'),
+('鷺', 'heron'),
+('鷽', 'Pyrrhula species(various)'),
+('鷽', 'oriental bullfinch'),
+('鷽', 'weaver bird'),
+('鸇', 'Butastur indicus'),
+('鸇', 'hawk'),
+('鸇', 'peregrine falcon'),
+('鸎', 'bush'),
+('鸎', 'nightingale'),
+('鸎', 'warbler'),
+('鸕', 'cormorant'),
+('鸚', 'parrot'),
+('鸛', 'Ciconia species(various)'),
+('鸛', 'Grus japonensis'),
+('鸛', 'crane'),
+('鸛', 'stork'),
+('鸜', 'a species of mynah'),
+('鸞', 'fabulous bird'),
+('鹙', 'Garrulus glandarius'),
+('鹙', 'large waterfowl with naked head'),
+('鹵', 'natural salt'),
+('鹵', 'rock'),
+('鹵', 'saline soil'),
+('鹵', 'salt'),
+('鹶', 'pitiful'),
+('鹶', 'salty and bitter'),
+('鹹', 'briny'),
+('鹹', 'pickled'),
+('鹹', 'salted'),
+('鹹', 'salty'),
+('鹻', 'impure carbonate of sodium of natron'),
+('鹽', 'salt'),
+('鹽', 'variant of 塩'),
+('鹿', 'KangXi radical 198'),
+('鹿', 'deer'),
+('鹿', 'surname'),
+('麀', 'doe'),
+('麀', 'female deer'),
+('麂', 'species of deer'),
+('麄', 'coarse'),
+('麄', 'rough'),
+('麄', 'rude'),
+('麇', 'general name for the hornless deer'),
+('麇', 'to collect to band together'),
+('麈', 'species of deer'),
+('麋', 'elk'),
+('麋', 'surname'),
+('麌', 'herd'),
+('麌', 'stag'),
+('麑', 'fawn'),
+('麑', 'young deer'),
+('麒', 'giraffe'),
+('麒', 'legendary auspicious animal'),
+('麒', 'qilin'),
+('麓', 'foot of hill'),
+('麓', 'foothill'),
+('麗', 'beautiful'),
+('麗', 'elegant'),
+('麗', 'fair'),
+('麗', 'lovely'),
+('麗', 'magnificent'),
+('麗', 'pretty'),
+('麝', 'musk deer'),
+('麞', 'Moschus chinloo'),
+('麞', 'roe deer'),
+('麞', 'roebuck'),
+('麟', 'female of Chinese unicorn'),
+('麟', 'giraffe'),
+('麟', 'qilin'),
+('麤', 'big'),
+('麤', 'coarse'),
+('麤', 'rough'),
+('麥', 'KangXi radical number 199'),
+('麥', 'barley'),
+('麥', 'oats'),
+('麥', 'wheat'),
+('麦', 'barley'),
+('麦', 'oats'),
+('麦', 'simplified form of KangXi radical number 199'),
+('麦', 'wheat'),
+('麩', 'bran'),
+('麪', 'dough'),
+('麪', 'flour'),
+('麪', 'noodles'),
+('麯', 'leaven'),
+('麯', 'yeast'),
+('麰', 'barley'),
+('麲', 'barley'),
+('麴', 'leaven'),
+('麴', 'surname'),
+('麴', 'yeast'),
+('麵', 'dough'),
+('麵', 'flour'),
+('麵', 'noodles'),
+('麵', 'wheat flour'),
+('麹', 'leaven'),
+('麹', 'surname'),
+('麹', 'yeast'),
+('麺', 'dough'),
+('麺', 'flour'),
+('麺', 'noodles'),
+('麻', 'flax'),
+('麻', 'hemp'),
+('麻', 'jute'),
+('麻', 'sesame'),
+('麼', 'insignificant'),
+('麼', 'interrogative final particle'),
+('麼', 'small'),
+('麼', 'thin'),
+('麼', 'tiny'),
+('麽', 'insignificant'),
+('麽', 'interrogative final particle'),
+('麽', 'small'),
+('麽', 'tiny'),
+('麾', 'a pennant'),
+('麾', 'banner'),
+('麾', 'flag'),
+('麾', 'to signal to'),
+('麿', 'I'),
+('麿', 'personal name marker'),
+('黃', 'surname'),
+('黃', 'yellow'),
+('黄', 'surname'),
+('黄', 'yellow'),
+('黄', '黃'),
+('黈', 'yellowy'),
+('黈', '누른빛'),
+('黌', 'school'),
+('黍', 'KangXi radical number 202'),
+('黍', 'glutinous millet'),
+('黎', 'black'),
+('黎', 'many'),
+('黎', 'numerous'),
+('黎', 'surname'),
+('黏', 'glue'),
+('黏', 'glutinous'),
+('黏', 'stick to'),
+('黏', 'sticky'),
+('黐', 'sticky'),
+('黐', 'to stick'),
+('黑', 'black'),
+('黑', 'dark'),
+('黑', 'evil'),
+('黑', 'sinister'),
+('黒', 'black'),
+('黒', 'dark'),
+('黒', 'evil'),
+('黔', 'Guizhou'),
+('黔', 'black'),
+('黕', 'dirt'),
+('黕', 'dirty'),
+('黕', 'get'),
+('黖', 'a white color'),
+('默', 'dark'),
+('默', 'quiet'),
+('默', 'silent'),
+('默', 'still'),
+('黛', 'black'),
+('黛', 'blacken eyebrows'),
+('黜', 'demote'),
+('黜', 'dismiss'),
+('黜', 'downgrade'),
+('黝', 'black'),
+('點', 'degree'),
+('點', 'dot'),
+('點', 'point'),
+('點', 'speck'),
+('點', 'spot'),
+('黟', 'black'),
+('黟', 'black and shining'),
+('黟', 'ebony'),
+('黠', 'artful'),
+('黠', 'cunning'),
+('黠', 'shrewd'),
+('黠', 'sly'),
+('黤', 'all of a sudden'),
+('黤', 'dimness'),
+('黤', 'suddenly'),
+('黥', 'tattooing face'),
+('黧', 'a dark'),
+('黧', 'sallow colour'),
+('黨', 'faction'),
+('黨', 'gang'),
+('黨', 'party'),
+('黨', 'political party'),
+('黮', 'black'),
+('黮', 'dark'),
+('黮', 'private'),
+('黮', 'unclear'),
+('黯', 'black'),
+('黯', 'dark'),
+('黯', 'dreary'),
+('黯', 'sullen'),
+('黲', 'grey black'),
+('黴', 'bacteria'),
+('黴', 'fungi'),
+('黴', 'mildew'),
+('黴', 'mold'),
+('黶', 'blemish'),
+('黶', 'mole'),
+('黶', 'scar'),
+('黷', 'corrupt'),
+('黷', 'defile'),
+('黷', 'soiled'),
+('黷', 'to dishonor'),
+('黻', 'special pattern of embroidery'),
+('黼', 'embroidered official or sacrificial robe'),
+('黽', 'ancient'),
+('黽', 'endeavor'),
+('黽', 'frog'),
+('黽', 'placename'),
+('黽', 'strive'),
+('黽', 'to endeavor'),
+('黽', 'to strive'),
+('黿', 'large turtle'),
+('黿', 'sea turtle'),
+('鼂', 'a kind of sea turtle'),
+('鼂', 'surname'),
+('鼄', 'the spider'),
+('鼇', 'huge sea turtle'),
+('鼈', 'Trionyx sinensis'),
+('鼈', 'a fresh-water turtle'),
+('鼉', 'large reptile'),
+('鼉', 'water lizard'),
+('鼎', 'large'),
+('鼎', 'three-legged bronze caldron'),
+('鼐', 'incense tripod'),
+('鼓', 'beat'),
+('鼓', 'drum'),
+('鼓', 'strike'),
+('鼓', 'top'),
+('鼕', 'rattle of drums'),
+('鼗', 'small revolving drum with knobs'),
+('鼙', 'drum carried on horseback'),
+('鼠', 'KangXi radical 208'),
+('鼠', 'mouse'),
+('鼠', 'rat'),
+('鼢', 'a variety of mole'),
+('鼢', 'mole'),
+('鼪', 'squirrel'),
+('鼪', 'weasel'),
+('鼫', 'marmot'),
+('鼫', 'squirrel'),
+('鼬', 'mustela itatis'),
+('鼬', 'weasel'),
+('鼯', 'flying'),
+('鼯', 'flying squirrel'),
+('鼯', 'squirrel'),
+('鼯', '날다람쥐'),
+('鼴', 'a kind of insectivorous rodent'),
+('鼴', 'mole'),
+('鼷', 'a mouse'),
+('鼷', 'mouse'),
+('鼹', 'a kind of insectivorous rodent'),
+('鼹', 'mole'),
+('鼻', 'KangXi radical 209'),
+('鼻', 'first'),
+('鼻', 'nasal'),
+('鼻', 'nose'),
+('鼽', 'clogged nose'),
+('鼾', 'snore loudly'),
+('齄', 'red sores on nose'),
+('齊', 'even'),
+('齊', 'of equal length'),
+('齊', 'uniform'),
+('齋', 'abstain'),
+('齋', 'study'),
+('齋', 'to fast'),
+('齋', 'vegetarian diet'),
+('齎', 'stannous'),
+('齎', 'take in both hands and offer to'),
+('齏', 'break or smash into pieces'),
+('齏', 'hash'),
+('齏', 'pulverize'),
+('齒', 'KangXi radical 211'),
+('齒', 'age'),
+('齒', 'cogs'),
+('齒', 'gears'),
+('齒', 'teeth'),
+('齒', 'tooth'),
+('齔', 'lose baby teeth and get adult teeth'),
+('齕', 'bite'),
+('齕', 'chew'),
+('齕', 'gnaw'),
+('齕', 'nibble'),
+('齗', 'gums(of the teeth)'),
+('齗', 'to dispute'),
+('齙', 'projecting teeth'),
+('齜', 'crooked teeth'),
+('齜', 'to show the teeth'),
+('齟', 'discord'),
+('齟', 'irregular teeth'),
+('齠', 'lose baby teeth and get adult teeth'),
+('齡', 'age'),
+('齡', 'years'),
+('齣', 'act'),
+('齣', 'occasion'),
+('齣', 'stanza'),
+('齣', 'time'),
+('齦', 'bite'),
+('齦', 'gum'),
+('齦', 'gums'),
+('齧', 'bite'),
+('齧', 'erode'),
+('齧', 'gnaw'),
+('齧', 'wear down'),
+('齩', '깨물다'),
+('齪', 'dirty'),
+('齪', 'narrow'),
+('齪', 'small'),
+('齬', 'to disagree'),
+('齬', 'uneven teeth'),
+('齮', '깨물다'),
+('齰', '깨물다'),
+('齰', '물다'),
+('齲', 'tooth decay'),
+('齶', 'palate'),
+('齶', 'roof of mouth'),
+('齷', 'dirty'),
+('齷', 'narrow'),
+('齷', 'small'),
+('龍', 'dragon'),
+('龍', 'symbolic of emperor'),
+('龐', 'big'),
+('龐', 'disorderly'),
+('龐', 'huge'),
+('龐', 'messy'),
+('龔', 'give'),
+('龔', 'polite'),
+('龔', 'present'),
+('龔', 'respect'),
+('龔', 'reverent'),
+('龔', 'reverential'),
+('龔', 'supply'),
+('龕', 'niche'),
+('龕', 'shrine'),
+('龜', 'crack'),
+('龜', 'cuckold'),
+('龜', 'tortoise'),
+('龜', 'turtle'),
+('龜', 'turtle or tortoise'),
+('龝', 'autumn'),
+('龝', 'fall'),
+('龝', 'year'),
+('龞', 'turtle'),
+('龠', 'ancient measure'),
+('龠', 'flute'),
+('龠', 'pipe'),
+('龡', 'exhale'),
+('龡', 'to blow'),
+('龢', 'calm'),
+('龢', 'in harmony'),
+('龢', 'peaceful'),
+('龤', 'to accord with'),
+('龤', 'to agree'),
+('龤', 'to harmonize'),
+('龥', 'appeal for help'),
+('龥', 'beg'),
+('豈', 'how? what?'),
+('更', 'more'),
+('更', 'much more'),
+('更', 'still further'),
+('車', 'carry in cart'),
+('車', 'cart'),
+('車', 'vehicle'),
+('賈', 'buy'),
+('賈', 'merchant'),
+('賈', 'surname'),
+('賈', 'trade'),
+('滑', 'polished'),
+('滑', 'slide'),
+('滑', 'slip'),
+('滑', 'slippery'),
+('串', 'conspire'),
+('串', 'relatives'),
+('串', 'string'),
+('句', 'sentence'),
+('龜', 'cuckold'),
+('龜', 'turtle or tortoise'),
+('龜', 'cuckold'),
+('龜', 'turtle or tortoise'),
+('契', 'bond'),
+('契', 'contract'),
+('契', 'deed'),
+('契', 'engrave'),
+('金', 'gold'),
+('金', 'metals in general'),
+('金', 'money'),
+('喇', 'bugle'),
+('喇', 'final particle'),
+('喇', 'horn'),
+('喇', 'lama'),
+('奈', 'bear'),
+('奈', 'but'),
+('奈', 'endure'),
+('奈', 'how'),
+('奈', 'stand'),
+('懶', 'languid'),
+('懶', 'lazy'),
+('懶', 'listless'),
+('癩', 'leprosy'),
+('癩', 'mange'),
+('癩', 'scabies'),
+('癩', 'shoddy'),
+('羅', 'gauze'),
+('羅', 'net for catching birds'),
+('蘿', 'turnip'),
+('蘿', 'type of creeping plant'),
+('螺', 'conch'),
+('螺', 'spiral'),
+('螺', 'spiral shell'),
+('裸', 'bare'),
+('裸', 'nude'),
+('裸', 'strip'),
+('裸', 'undress'),
+('邏', 'inspect'),
+('邏', 'patrol'),
+('邏', 'watch'),
+('樂', 'enjoyable'),
+('樂', 'glad'),
+('樂', 'happy'),
+('樂', 'music'),
+('洛', 'city'),
+('洛', 'river in Shanxi province'),
+('烙', 'brand'),
+('烙', 'branding iron'),
+('烙', 'burn'),
+('珞', 'kind of necklace'),
+('落', 'drop'),
+('落', 'fall'),
+('落', 'net income'),
+('落', 'surplus'),
+('酪', 'cheese'),
+('酪', 'cream'),
+('酪', 'koumiss'),
+('駱', 'camel'),
+('駱', 'white horse with black mane'),
+('亂', 'confusion'),
+('亂', 'create chaos'),
+('亂', 'revolt'),
+('亂', 'state of chaos'),
+('卵', 'egg'),
+('卵', 'ovum'),
+('卵', 'roe'),
+('卵', 'spawn'),
+('欄', 'animal pan'),
+('欄', 'balustrade'),
+('欄', 'railing'),
+('爛', 'decayed'),
+('爛', 'rotten'),
+('爛', 'spoiled'),
+('蘭', 'elegant'),
+('蘭', 'graceful'),
+('蘭', 'orchid'),
+('鸞', 'fabulous bird'),
+('嵐', 'mountain haze'),
+('嵐', 'mountain mist'),
+('濫', 'excessive'),
+('濫', 'flood'),
+('濫', 'overflow'),
+('藍', 'blue'),
+('藍', 'indigo plant'),
+('藍', 'surname'),
+('襤', 'ragged'),
+('襤', 'tattered'),
+('襤', 'threadbare'),
+('拉', 'drag'),
+('拉', 'hold'),
+('拉', 'lengthen'),
+('拉', 'pull'),
+('拉', 'seize'),
+('臘', 'dried meat'),
+('臘', 'year end sacrifice'),
+('蠟', 'candle'),
+('蠟', 'glazed'),
+('蠟', 'wax'),
+('蠟', 'waxy'),
+('廊', 'corridor'),
+('廊', 'porch'),
+('廊', 'veranda'),
+('朗', 'bright'),
+('朗', 'clear'),
+('朗', 'distinct'),
+('浪', 'reckless'),
+('浪', 'wasteful'),
+('浪', 'wave'),
+('狼', 'wolf'),
+('郎', 'gentleman'),
+('郎', 'husband'),
+('郎', 'young man'),
+('來', 'come'),
+('來', 'coming'),
+('來', 'return'),
+('來', 'returning'),
+('冷', 'cold'),
+('冷', 'cool'),
+('冷', 'lonely'),
+('勞', 'do manual work'),
+('勞', 'labor'),
+('勞', 'toil'),
+('擄', 'capture'),
+('擄', 'seize'),
+('櫓', 'oar'),
+('櫓', 'row'),
+('櫓', 'scull'),
+('爐', 'fireplace'),
+('爐', 'furnace'),
+('爐', 'oven'),
+('爐', 'stove'),
+('盧', 'black'),
+('盧', 'cottage'),
+('盧', 'hut'),
+('盧', 'surname'),
+('老', 'aged'),
+('老', 'experienced'),
+('老', 'old'),
+('蘆', 'reeds'),
+('蘆', 'rushes'),
+('虜', 'capture'),
+('虜', 'imprison'),
+('虜', 'prison'),
+('虜', 'seize'),
+('路', 'journey'),
+('路', 'path'),
+('路', 'road'),
+('路', 'street'),
+('露', 'bare'),
+('露', 'dew'),
+('露', 'exposed'),
+('露', 'open'),
+('魯', 'foolish'),
+('魯', 'rash'),
+('魯', 'stupid'),
+('魯', 'vulgar'),
+('鷺', 'egret'),
+('鷺', 'heron'),
+('碌', 'mediocre'),
+('碌', 'rocky'),
+('碌', 'rough'),
+('碌', 'uneven'),
+('祿', 'a stipend'),
+('祿', 'blessing'),
+('祿', 'happiness'),
+('祿', 'prosperity'),
+('綠', 'chlorine'),
+('綠', 'green'),
+('綠', 'rust, patina, tarnish'),
+('菉', 'greenish bamboo'),
+('菉', 'the green bamboo'),
+('錄', 'copy'),
+('錄', 'record'),
+('錄', 'write down'),
+('鹿', 'KangXi radical 198'),
+('鹿', 'deer'),
+('鹿', 'surname'),
+('論', 'debate'),
+('論', 'discourse'),
+('論', 'discuss'),
+('壟', 'grave'),
+('壟', 'mound'),
+('壟', 'ridge in field'),
+('弄', 'alley'),
+('弄', 'do'),
+('弄', 'play or fiddle with'),
+('籠', 'cage'),
+('籠', 'cage-like basket'),
+('聾', 'deaf'),
+('牢', 'pen'),
+('牢', 'prison'),
+('牢', 'secure'),
+('牢', 'stable'),
+('磊', 'great'),
+('磊', 'pile of rocks or stones'),
+('賂', 'bribe'),
+('賂', 'give present'),
+('雷', 'thunder'),
+('壘', 'military wall'),
+('壘', 'rampart'),
+('屢', 'again and again'),
+('屢', 'frequently'),
+('屢', 'often'),
+('樓', 'building of two or more stories'),
+('淚', 'cry'),
+('淚', 'tears'),
+('淚', 'weep'),
+('漏', 'drip'),
+('漏', 'funnel'),
+('漏', 'hour glass'),
+('漏', 'leak'),
+('累', 'bother'),
+('累', 'implicate'),
+('累', 'involve'),
+('累', 'tired'),
+('縷', 'detailed'),
+('縷', 'precise'),
+('縷', 'thread'),
+('陋', 'coarse'),
+('陋', 'crude'),
+('陋', 'narrow'),
+('陋', 'ugly'),
+('勒', 'strangle'),
+('勒', 'tighten'),
+('肋', 'chest'),
+('肋', 'ribs'),
+('凜', 'fearful'),
+('凜', 'shiver with cold or fear'),
+('凌', 'insult'),
+('凌', 'maltreat'),
+('凌', 'pure'),
+('凌', 'virtuous'),
+('稜', 'angle'),
+('稜', 'corner'),
+('稜', 'edge'),
+('稜', 'square block'),
+('綾', 'damask silk'),
+('綾', 'thin silk'),
+('菱', 'water caltrop'),
+('菱', 'water-chestnut'),
+('陵', 'hill'),
+('陵', 'mausoleum'),
+('陵', 'mound'),
+('讀', 'pronounce'),
+('讀', 'read'),
+('讀', 'study'),
+('拏', 'arrest'),
+('拏', 'bring'),
+('拏', 'grasp'),
+('拏', 'hold'),
+('拏', 'take'),
+('樂', 'enjoyable'),
+('樂', 'glad'),
+('樂', 'happy'),
+('樂', 'music'),
+('諾', 'approve'),
+('諾', 'assent'),
+('諾', 'promise'),
+('丹', 'cinnabar(native HgS)'),
+('丹', 'vermilion(artificial HgS used as pigment)'),
+('寧', 'peace'),
+('寧', 'peaceful'),
+('寧', 'repose'),
+('寧', 'serenity'),
+('怒', 'anger'),
+('怒', 'angry'),
+('怒', 'passion'),
+('怒', 'rage'),
+('率', 'limit'),
+('率', 'rate'),
+('率', 'ratio'),
+('率', 'to lead'),
+('異', 'different'),
+('異', 'strange'),
+('異', 'unusual'),
+('北', 'north'),
+('北', 'northern'),
+('北', 'northward'),
+('磻', 'a tributary of the Wei river in Shanxi'),
+('便', 'convenience'),
+('便', 'ease'),
+('便', 'expedient'),
+('便', 'feces, stool'),
+('復', 'repeat'),
+('復', 'repeatedly'),
+('復', 'return'),
+('不', 'negative prefix'),
+('不', 'no'),
+('不', 'not'),
+('不', 'un-'),
+('泌', 'excrete'),
+('泌', 'to seep out'),
+('數', 'count'),
+('數', 'fate'),
+('數', 'number'),
+('數', 'several'),
+('索', 'cable'),
+('索', 'large rope'),
+('索', 'laws'),
+('索', 'rules'),
+('參', 'intervene'),
+('參', 'take part in'),
+('塞', 'block. seal'),
+('塞', 'cork'),
+('塞', 'stop up'),
+('省', 'economize'),
+('省', 'province'),
+('省', 'save'),
+('葉', 'leaf'),
+('葉', 'page of book'),
+('葉', 'period'),
+('葉', 'petal'),
+('說', 'say'),
+('說', 'scold'),
+('說', 'speak'),
+('說', 'talk'),
+('說', 'upbraid'),
+('殺', 'hurt'),
+('殺', 'kill'),
+('殺', 'murder'),
+('殺', 'slaughter'),
+('辰', 'early morning'),
+('沈', 'addicted to'),
+('沈', 'name'),
+('沈', 'sink'),
+('沈', 'submerge'),
+('拾', 'collect'),
+('拾', 'pick up'),
+('拾', 'ten'),
+('拾', 'tidy up'),
+('若', 'assuming'),
+('若', 'if'),
+('若', 'similar'),
+('若', 'supposing'),
+('掠', 'pass by'),
+('掠', 'plunder'),
+('掠', 'ransack'),
+('掠', 'rob'),
+('略', 'approximately'),
+('略', 'outline'),
+('略', 'roughly'),
+('亮', 'bright'),
+('亮', 'brilliant'),
+('亮', 'light'),
+('亮', 'radiant'),
+('兩', 'both'),
+('兩', 'couple'),
+('兩', 'ounce'),
+('兩', 'pair'),
+('兩', 'two'),
+('凉', 'cold'),
+('凉', 'cool'),
+('凉', 'disheartened'),
+('梁', 'beam'),
+('梁', 'bridge'),
+('梁', 'rafters'),
+('梁', 'surname'),
+('糧', 'food'),
+('糧', 'grain'),
+('糧', 'provisions'),
+('良', 'good'),
+('良', 'respectable'),
+('良', 'virtuous'),
+('諒', 'excuse'),
+('諒', 'forgive'),
+('諒', 'guess'),
+('諒', 'presume'),
+('量', 'capacity'),
+('量', 'measure'),
+('量', 'quantity'),
+('勵', 'encourage'),
+('勵', 'strive'),
+('呂', 'a musical note'),
+('呂', 'surname'),
+('女', 'feminine'),
+('女', 'girl'),
+('女', 'rad. 38'),
+('女', 'woman'),
+('廬', 'cottage'),
+('廬', 'hut'),
+('廬', 'name of a mountain'),
+('旅', 'journey'),
+('旅', 'travel'),
+('旅', 'traveler'),
+('旅', 'trip'),
+('濾', 'filter'),
+('濾', 'strain out'),
+('礪', 'sharpen'),
+('礪', 'whetstone'),
+('閭', 'village of twenty-five families'),
+('驪', 'a pair of horses'),
+('驪', 'a pure black horse'),
+('麗', 'beautiful'),
+('麗', 'elegant'),
+('麗', 'magnificent'),
+('黎', 'black'),
+('黎', 'many'),
+('黎', 'numerous'),
+('黎', 'surname'),
+('力', 'capability'),
+('力', 'influence'),
+('力', 'power'),
+('曆', 'calendar'),
+('曆', 'era'),
+('歷', 'history'),
+('歷', 'past'),
+('歷', 'take place'),
+('轢', 'run over something with vehicle'),
+('年', 'a year'),
+('年', 'new-years'),
+('年', 'persons age'),
+('年', 'year'),
+('憐', 'pity'),
+('憐', 'sympathize'),
+('戀', 'long for'),
+('戀', 'love'),
+('戀', 'yearn for'),
+('撚', 'tease'),
+('撚', 'toy with'),
+('撚', 'twirl in fingers'),
+('漣', 'flowing water'),
+('漣', 'ripples'),
+('漣', 'weeping'),
+('煉', 'condense'),
+('煉', 'distill'),
+('煉', 'refine'),
+('煉', 'smelt'),
+('璉', 'vessel used to hold grain offerings'),
+('秊', 'new-years'),
+('秊', 'persons age'),
+('秊', 'year'),
+('練', 'drill'),
+('練', 'exercise'),
+('練', 'practice'),
+('練', 'train'),
+('聯', 'ally'),
+('聯', 'associate'),
+('聯', 'connect'),
+('聯', 'join'),
+('輦', 'a hand-cart'),
+('輦', 'to transport by carriage'),
+('蓮', 'lotus'),
+('蓮', 'paradise'),
+('蓮', 'water lily'),
+('連', 'connect'),
+('連', 'continuous'),
+('連', 'even'),
+('連', 'join'),
+('鍊', 'forge'),
+('鍊', 'refine'),
+('鍊', 'smelt metals'),
+('列', 'a line'),
+('列', 'classify'),
+('列', 'to arrange in order'),
+('劣', 'bad'),
+('劣', 'inferior'),
+('劣', 'slightly'),
+('咽', 'pharynx'),
+('咽', 'throat'),
+('烈', 'ardent'),
+('烈', 'fiery'),
+('烈', 'vehement'),
+('烈', 'violent'),
+('裂', 'break open'),
+('裂', 'crack'),
+('裂', 'rend'),
+('裂', 'split'),
+('說', 'say'),
+('說', 'scold'),
+('說', 'speak'),
+('說', 'talk'),
+('說', 'upbraid'),
+('廉', 'honest'),
+('廉', 'honorable'),
+('廉', 'upright'),
+('念', 'recall'),
+('念', 'study'),
+('念', 'think of'),
+('捻', 'nip with the fingers'),
+('捻', 'to twist'),
+('殮', 'dress corpse for burial'),
+('簾', 'a blind'),
+('簾', 'curtain'),
+('簾', 'screen'),
+('獵', 'field sports'),
+('獵', 'hunt'),
+('令', 'allow'),
+('令', 'cause'),
+('令', 'command'),
+('令', 'commandant'),
+('令', 'magistrate'),
+('令', 'order'),
+('囹', 'enclosure'),
+('囹', 'prison'),
+('寧', 'peace'),
+('寧', 'peaceful'),
+('寧', 'repose'),
+('寧', 'serenity'),
+('嶺', 'mountain peak'),
+('嶺', 'mountain ridge'),
+('怜', 'pity'),
+('怜', 'sympathize'),
+('玲', 'tinkling of jade'),
+('瑩', 'bright'),
+('瑩', 'lustre of gems'),
+('瑩', 'lustrous'),
+('羚', 'species of antelope'),
+('聆', 'hear'),
+('聆', 'listen'),
+('鈴', 'bell'),
+('零', 'fraction'),
+('零', 'fragment'),
+('零', 'zero'),
+('靈', 'soul'),
+('靈', 'spirit'),
+('靈', 'spiritual world'),
+('領', 'collar'),
+('領', 'guide'),
+('領', 'lead'),
+('領', 'neck'),
+('例', 'example'),
+('例', 'precedent'),
+('例', 'regulation'),
+('禮', 'courtesy'),
+('禮', 'manners'),
+('禮', 'rites'),
+('禮', 'social custom'),
+('醴', 'sweet spring'),
+('醴', 'sweet wine'),
+('隸', 'be subservient to'),
+('隸', 'servant'),
+('惡', 'bad'),
+('惡', 'evil'),
+('惡', 'foul'),
+('惡', 'wicked'),
+('了', 'particle of completed action'),
+('了', 'to finish'),
+('僚', 'bureaucracy'),
+('僚', 'officials'),
+('寮', 'hut'),
+('寮', 'shack'),
+('寮', 'shanty'),
+('尿', 'urinate'),
+('尿', 'urine'),
+('料', 'conjecture'),
+('料', 'consider'),
+('料', 'material'),
+('樂', 'enjoyable'),
+('樂', 'glad'),
+('樂', 'happy'),
+('樂', 'music'),
+('燎', 'a signal lamp'),
+('燎', 'set afire'),
+('燎', 'to burn'),
+('燎', 'to illuminate'),
+('療', 'be healed'),
+('療', 'cured'),
+('療', 'recover'),
+('蓼', 'polygonum'),
+('蓼', 'smartweed'),
+('遼', 'distant'),
+('遼', 'far'),
+('龍', 'dragon'),
+('龍', 'symbolic of emperor'),
+('暈', 'dizzy'),
+('暈', 'faint'),
+('暈', 'fog'),
+('暈', 'halo in sky'),
+('阮', 'ancient musical instrument'),
+('阮', 'surname'),
+('劉', 'destroy'),
+('劉', 'kill'),
+('劉', 'surname'),
+('杻', 'ligustrum sinenese'),
+('杻', 'tree'),
+('柳', 'pleasure'),
+('柳', 'willow tree'),
+('流', 'circulate'),
+('流', 'class'),
+('流', 'drift'),
+('流', 'flow'),
+('溜', 'glide'),
+('溜', 'slide'),
+('溜', 'slip'),
+('溜', 'slippery'),
+('琉', 'glazed'),
+('琉', 'opaque'),
+('琉', 'sparkling stone'),
+('留', 'detain'),
+('留', 'halt'),
+('留', 'keep'),
+('留', 'stay'),
+('留', 'stop'),
+('硫', 'sulfur'),
+('紐', 'button'),
+('紐', 'handle'),
+('紐', 'knob'),
+('紐', 'knot'),
+('紐', 'tie'),
+('類', 'category'),
+('類', 'class'),
+('類', 'group'),
+('類', 'kind'),
+('六', 'number six'),
+('戮', 'kill'),
+('戮', 'massacre'),
+('戮', 'oppress'),
+('陸', 'army'),
+('陸', 'continental'),
+('陸', 'land'),
+('倫', 'normal human relationships'),
+('崙', 'Kunlun mountains in Jiangsu'),
+('淪', 'be lost'),
+('淪', 'be submerged'),
+('淪', 'sink'),
+('輪', 'recur'),
+('輪', 'revolve'),
+('輪', 'turn'),
+('輪', 'wheel'),
+('律', 'principle'),
+('律', 'regulation'),
+('律', 'statute'),
+('慄', 'shiver'),
+('慄', 'shudder'),
+('慄', 'tremble'),
+('栗', 'chestnut tree'),
+('栗', 'chestnuts'),
+('栗', 'surname'),
+('率', 'limit'),
+('率', 'rate'),
+('率', 'ratio'),
+('率', 'to lead'),
+('隆', 'abundant'),
+('隆', 'plentiful'),
+('隆', 'prosperous'),
+('利', 'advantage'),
+('利', 'gains'),
+('利', 'merit'),
+('利', 'profit'),
+('吏', 'government official'),
+('吏', 'magistrate'),
+('履', 'footwear'),
+('履', 'shoes'),
+('履', 'tread'),
+('履', 'walk on'),
+('易', 'change'),
+('易', 'easy'),
+('李', 'judge'),
+('李', 'plum'),
+('李', 'surname'),
+('梨', 'cut'),
+('梨', 'opera'),
+('梨', 'pear'),
+('梨', 'slash'),
+('泥', 'clay'),
+('泥', 'earth'),
+('泥', 'mire'),
+('泥', 'mud'),
+('泥', 'plaster'),
+('理', 'logic'),
+('理', 'manage'),
+('理', 'reason'),
+('痢', 'dysentery'),
+('罹', 'grief'),
+('罹', 'incur'),
+('罹', 'meet with'),
+('罹', 'sorrow'),
+('裏', 'inside'),
+('裏', 'interior'),
+('裏', 'within'),
+('裡', 'inside'),
+('裡', 'interior'),
+('裡', 'within'),
+('里', 'lane'),
+('里', 'unit of distance'),
+('里', 'village'),
+('離', 'depart'),
+('離', 'go away'),
+('離', 'leave'),
+('離', 'separate'),
+('匿', 'go into hiding'),
+('匿', 'hide'),
+('溺', 'drown'),
+('溺', 'indulge'),
+('溺', 'submerge in water'),
+('吝', 'miserly'),
+('吝', 'parsimonious'),
+('吝', 'stingy'),
+('燐', 'phosphorus'),
+('璘', 'luster of jade'),
+('藺', 'rush used in making mats'),
+('藺', 'surname'),
+('隣', 'adjacent'),
+('隣', 'neighbor'),
+('隣', 'neighboring'),
+('鱗', 'fish scales'),
+('麟', 'female of Chinese unicorn'),
+('林', 'forest'),
+('林', 'grove'),
+('林', 'surname'),
+('淋', 'drench'),
+('淋', 'drip'),
+('淋', 'perfectly'),
+('淋', 'soak'),
+('臨', 'approach'),
+('臨', 'descend'),
+('臨', 'draw near'),
+('立', 'establish'),
+('立', 'let stand'),
+('立', 'set'),
+('立', 'stand'),
+('笠', 'bamboo covering'),
+('笠', 'bamboo hat'),
+('粒', 'grain'),
+('粒', 'small particle'),
+('狀', 'appearance'),
+('狀', 'form'),
+('狀', 'official'),
+('狀', 'shape'),
+('炙', 'broil'),
+('炙', 'cauterize'),
+('炙', 'roast'),
+('炙', 'toast'),
+('識', 'know'),
+('識', 'recognize'),
+('識', 'understand'),
+('什', 'file of ten soldiers'),
+('茶', 'tea'),
+('刺', 'irritate'),
+('刺', 'prick'),
+('刺', 'prod'),
+('刺', 'stab'),
+('切', 'carve'),
+('切', 'cut'),
+('切', 'mince'),
+('切', 'slice'),
+('度', 'degree'),
+('度', 'manner'),
+('度', 'system'),
+('度', 'to consider'),
+('拓', 'expand'),
+('拓', 'open up'),
+('拓', 'support or push'),
+('糖', 'candy'),
+('糖', 'crack'),
+('糖', 'sugar'),
+('糖', 'sweets'),
+('糖', 'tongue'),
+('宅', 'dwelling'),
+('宅', 'grave'),
+('宅', 'home'),
+('宅', 'residence'),
+('洞', 'cave'),
+('洞', 'grotto'),
+('洞', 'hole'),
+('洞', 'ravine'),
+('暴', 'brutal'),
+('暴', 'tyrannical'),
+('暴', 'violent'),
+('輻', 'spokes of wheel'),
+('行', 'circulate'),
+('行', 'go'),
+('行', 'move'),
+('行', 'travel'),
+('行', 'walk'),
+('降', 'descend'),
+('降', 'down'),
+('降', 'drop'),
+('降', 'fall'),
+('降', 'lower'),
+('見', 'behold'),
+('見', 'observe'),
+('見', 'perceive'),
+('見', 'see'),
+('廓', 'broad'),
+('廓', 'empty'),
+('廓', 'expand'),
+('廓', 'open'),
+('廓', 'wide'),
+('兀', 'duplicate of Big Five A461'),
+('塚', 'cemetery'),
+('塚', 'tomb'),
+('晴', 'clear weather'),
+('凞', 'bright'),
+('猪', 'pig'),
+('益', 'profit'),
+('礼', 'courtesy'),
+('礼', 'manners'),
+('礼', 'social custom'),
+('神', 'spirit'),
+('祥', 'good luck'),
+('福', 'happiness'),
+('靖', 'appease'),
+('靖', 'calm'),
+('靖', 'pacify'),
+('精', 'essence'),
+('精', 'semen'),
+('精', 'spirit'),
+('羽', 'feather'),
+('諸', 'several'),
+('逸', 'flee'),
+('都', 'metropolis'),
+('飯', 'cooked rice'),
+('飯', 'food'),
+('飯', 'meal'),
+('飼', 'feed'),
+('飼', 'nourish'),
+('飼', 'raise animals'),
+('館', 'public building'),
+('鶴', 'crane'),
+('𣴘', 'higher'),
+('𣴘', 'musical scale'),
+('𣴘', 'note'),
+('𣴘', 'octave'),
+('𣴘', 'second'),
+('𣴘', 'two'),
+('𣴘', '대려'),
+('𨳈', 'surname'),
+('𪚥', 'talkative'),
+('𪚥', 'verbose')
+ON CONFLICT DO NOTHING;
\ No newline at end of file
@@ -0,0 +1,41039 @@
+INSERT INTO `hanja_word_index` VALUES
+('-', '---桶', '쓰레기통', 0),
+('-', '---桶', '쓰레기통', 1),
+('-', '---桶', '쓰레기통', 2),
+('桶', '---桶', '쓰레기통', 3),
+('-', '--中', '한밤중', 0),
+('-', '--中', '한밤중', 1),
+('中', '--中', '한밤중', 2),
+('-', '--便', '건너편', 0),
+('-', '--便', '건너편', 1),
+('便', '--便', '건너편', 2),
+('-', '--便', '맞은편', 0),
+('-', '--便', '맞은편', 1),
+('便', '--便', '맞은편', 2),
+('-', '--前', '오래전', 0),
+('-', '--前', '오래전', 1),
+('前', '--前', '오래전', 2),
+('-', '--場', '골프장', 0),
+('-', '--場', '골프장', 1),
+('場', '--場', '골프장', 2),
+('-', '--場', '스키장', 0),
+('-', '--場', '스키장', 1),
+('場', '--場', '스키장', 2),
+('-', '--封紙', '비닐봉지', 0),
+('-', '--封紙', '비닐봉지', 1),
+('封', '--封紙', '비닐봉지', 2),
+('紙', '--封紙', '비닐봉지', 3),
+('-', '--層', '아래층', 0),
+('-', '--層', '아래층', 1),
+('層', '--層', '아래층', 2),
+('-', '--房', '건넌방', 0),
+('-', '--房', '건넌방', 1),
+('房', '--房', '건넌방', 2),
+('-', '--房', '노래방', 0),
+('-', '--房', '노래방', 1),
+('房', '--房', '노래방', 2),
+('-', '--湯', '갈비탕', 0),
+('-', '--湯', '갈비탕', 1),
+('湯', '--湯', '갈비탕', 2),
+('-', '--湯', '설렁탕', 0),
+('-', '--湯', '설렁탕', 1),
+('湯', '--湯', '설렁탕', 2),
+('-', '--番', '지난번', 0),
+('-', '--番', '지난번', 1),
+('番', '--番', '지난번', 2),
+('-', '--色', '검은색', 0),
+('-', '--色', '검은색', 1),
+('色', '--色', '검은색', 2),
+('-', '--色', '검정색', 0),
+('-', '--色', '검정색', 1),
+('色', '--色', '검정색', 2),
+('-', '--色', '까만색', 0),
+('-', '--色', '까만색', 1),
+('色', '--色', '까만색', 2),
+('-', '--色', '노란색', 0),
+('-', '--色', '노란색', 1),
+('色', '--色', '노란색', 2),
+('-', '--色', '보라색', 0),
+('-', '--色', '보라색', 1),
+('色', '--色', '보라색', 2),
+('-', '--色', '빨간색', 0),
+('-', '--色', '빨간색', 1),
+('色', '--色', '빨간색', 2),
+('-', '--色', '파란색', 0),
+('-', '--色', '파란색', 1),
+('色', '--色', '파란색', 2),
+('-', '--色', '하얀색', 0),
+('-', '--色', '하얀색', 1),
+('色', '--色', '하얀색', 2),
+('-', '--週', '지난주', 0),
+('-', '--週', '지난주', 1),
+('週', '--週', '지난주', 2),
+('-', '--醬', '고추장', 0),
+('-', '--醬', '고추장', 1),
+('醬', '--醬', '고추장', 2),
+('-', '--間', '얼마간', 0),
+('-', '--間', '얼마간', 1),
+('間', '--間', '얼마간', 2),
+('-', '-中', '그중', 0),
+('中', '-中', '그중', 1),
+('-', '-中', '밤중', 0),
+('中', '-中', '밤중', 1),
+('-', '-便', '저편', 0),
+('便', '-便', '저편', 1),
+('-', '-便', '한편', 0),
+('便', '-便', '한편', 1),
+('-', '-傷', '속상', 0),
+('傷', '-傷', '속상', 1),
+('-', '-初', '애초', 0),
+('初', '-初', '애초', 1),
+('-', '-前', '그전', 0),
+('前', '-前', '그전', 1),
+('-', '-套', '말투', 0),
+('套', '-套', '말투', 1),
+('-', '-女', '그녀', 0),
+('女', '-女', '그녀', 1),
+('-', '-字', '글자', 0),
+('字', '-字', '글자', 1),
+('-', '-層', '위층', 0),
+('層', '-層', '위층', 1),
+('-', '-層', '한층', 0),
+('層', '-層', '한층', 1),
+('-', '-山', '뒷산', 0),
+('山', '-山', '뒷산', 1),
+('-', '-平生', '한평생', 0),
+('平', '-平生', '한평생', 1),
+('生', '-平生', '한평생', 2),
+('-', '-床', '밥상', 0),
+('床', '-床', '밥상', 1),
+('-', '-房', '안방', 0),
+('房', '-房', '안방', 1),
+('-', '-房', '옆방', 0),
+('房', '-房', '옆방', 1),
+('-', '-手巾', '손수건', 0),
+('手', '-手巾', '손수건', 1),
+('巾', '-手巾', '손수건', 2),
+('-', '-曆', '달력', 0),
+('曆', '-曆', '달력', 1),
+('-', '-機', '헬기', 0),
+('機', '-機', '헬기', 1),
+('-', '-氣', '물기', 0),
+('氣', '-氣', '물기', 1),
+('-', '-牌', '깡패', 0),
+('牌', '-牌', '깡패', 1),
+('-', '-甁', '술병', 0),
+('甁', '-甁', '술병', 1),
+('-', '-番', '이번', 0),
+('番', '-番', '이번', 1),
+('-', '-番', '한번', 0),
+('番', '-番', '한번', 1),
+('-', '-病', '눈병', 0),
+('病', '-病', '눈병', 1),
+('-', '-盞', '술잔', 0),
+('盞', '-盞', '술잔', 1),
+('-', '-盞', '한잔', 0),
+('盞', '-盞', '한잔', 1),
+('-', '-瞳子', '눈동자', 0),
+('瞳', '-瞳子', '눈동자', 1),
+('子', '-瞳子', '눈동자', 2),
+('-', '-終日', '온종일', 0),
+('終', '-終日', '온종일', 1),
+('日', '-終日', '온종일', 2),
+('-', '-色', '밤색', 0),
+('色', '-色', '밤색', 1),
+('-', '-色', '흰색', 0),
+('色', '-色', '흰색', 1),
+('-', '-醬', '간장', 0),
+('醬', '-醬', '간장', 1),
+('-', '-門', '앞문', 0),
+('門', '-門', '앞문', 1),
+('-', '-間', '그간', 0),
+('間', '-間', '그간', 1),
+('0', '0個  國', '0개 국어', 0),
+('個', '0個  國', '0개 국어', 1),
+('國', '0個  國', '0개 국어', 4),
+('1', '10', '시월', 0),
+('0', '10', '시월', 1),
+('1', '10', '천사', 0),
+('0', '10', '천사', 1),
+('1', '10月', '10월', 0),
+('0', '10月', '10월', 1),
+('月', '10月', '10월', 2),
+('1', '11月', '11월', 0),
+('1', '11月', '11월', 1),
+('月', '11月', '11월', 2),
+('1', '11月', '십일월', 0),
+('1', '11月', '십일월', 1),
+('月', '11月', '십일월', 2),
+('1', '12月', '12월', 0),
+('2', '12月', '12월', 1),
+('月', '12月', '12월', 2),
+('1', '12月', '십이월', 0),
+('2', '12月', '십이월', 1),
+('月', '12月', '십이월', 2),
+('1', '1月', '1월', 0),
+('月', '1月', '1월', 1),
+('1', '1月', '일월', 0),
+('月', '1月', '일월', 1),
+('2', '2月', '2월', 0),
+('月', '2月', '2월', 1),
+('2', '2月', '이월', 0),
+('月', '2月', '이월', 1),
+('3', '3月', '3월', 0),
+('月', '3月', '3월', 1),
+('3', '3月', '삼월', 0),
+('月', '3月', '삼월', 1),
+('4', '4月', '4월', 0),
+('月', '4月', '4월', 1),
+('4', '4月', '사월', 0),
+('月', '4月', '사월', 1),
+('5', '5月', '5월', 0),
+('月', '5月', '5월', 1),
+('5', '5月', '오월', 0),
+('月', '5月', '오월', 1),
+('6', '6月', '6월', 0),
+('月', '6月', '6월', 1),
+('6', '6月', '류월', 0),
+('月', '6月', '류월', 1),
+('6', '6月', '유월', 0),
+('月', '6月', '유월', 1),
+('7', '7月', '7월', 0),
+('月', '7月', '7월', 1),
+('7', '7月', '칠월', 0),
+('月', '7月', '칠월', 1),
+('8', '8月', '8월', 0),
+('月', '8月', '8월', 1),
+('8', '8月', '팔월', 0),
+('月', '8月', '팔월', 1),
+('9', '9月', '9월', 0),
+('月', '9月', '9월', 1),
+('9', '9月', '구월', 0),
+('月', '9月', '구월', 1),
+('P', 'PC房', 'PC방', 0),
+('C', 'PC房', 'PC방', 1),
+('房', 'PC房', 'PC방', 2),
+('P', 'PC房', '피시방', 0),
+('C', 'PC房', '피시방', 1),
+('房', 'PC房', '피시방', 2),
+('P', 'PC通信', 'PC통신', 0),
+('C', 'PC通信', 'PC통신', 1),
+('通', 'PC通信', 'PC통신', 2),
+('信', 'PC通信', 'PC통신', 3),
+('­', '­盞', '한잔', 0),
+('盞', '­盞', '한잔', 1),
+('—', '—地 區 ', '가자 지구', 0),
+('地', '—地 區 ', '가자 지구', 1),
+('區', '—地 區 ', '가자 지구', 3),
+('—', '—宮合', '속궁합', 0),
+('宮', '—宮合', '속궁합', 1),
+('合', '—宮合', '속궁합', 2),
+('—', '—掌匣   ', '벙어리 장갑', 0),
+('掌', '—掌匣   ', '벙어리 장갑', 1),
+('匣', '—掌匣   ', '벙어리 장갑', 2),
+('—', '—放', '먹방', 0),
+('放', '—放', '먹방', 1),
+('—', '—時計 ', '손목시계', 0),
+('時', '—時計 ', '손목시계', 1),
+('計', '—時計 ', '손목시계', 2),
+('—', '—時計 ', '팔뚝시계', 0),
+('時', '—時計 ', '팔뚝시계', 1),
+('計', '—時計 ', '팔뚝시계', 2),
+('—', '—時計 ', '팔목시계', 0),
+('時', '—時計 ', '팔목시계', 1),
+('計', '—時計 ', '팔목시계', 2),
+('—', '—時計  ', '뻐꾸기시계', 0),
+('時', '—時計  ', '뻐꾸기시계', 1),
+('計', '—時計  ', '뻐꾸기시계', 2),
+('—', '—桶', '밥통', 0),
+('桶', '—桶', '밥통', 1),
+('—', '—桶 ', '기름통', 0),
+('桶', '—桶 ', '기름통', 1),
+('—', '—桶 ', '연장통', 0),
+('桶', '—桶 ', '연장통', 1),
+('—', '—湯 ', '설렁탕', 0),
+('湯', '—湯 ', '설렁탕', 1),
+('—', '—燈 ', '호박등', 0),
+('燈', '—燈 ', '호박등', 1),
+('—', '—瞳子', '눈동자', 0),
+('瞳', '—瞳子', '눈동자', 1),
+('子', '—瞳子', '눈동자', 2),
+('—', '—腸子', '큰창자', 0),
+('腸', '—腸子', '큰창자', 1),
+('子', '—腸子', '큰창자', 2),
+('—', '—腸子 ', '작은창자', 0),
+('腸', '—腸子 ', '작은창자', 1),
+('子', '—腸子 ', '작은창자', 2),
+('—', '—色 ', '수박색', 0),
+('色', '—色 ', '수박색', 1),
+('—', '—菓子 ', '밥풀과자', 0),
+('菓', '—菓子 ', '밥풀과자', 1),
+('子', '—菓子 ', '밥풀과자', 2),
+('—', '—車', '똥차', 0),
+('車', '—車', '똥차', 1),
+('—', '—車  ', '발바리차', 0),
+('車', '—車  ', '발바리차', 1),
+('—', '—農事', '벼농사', 0),
+('農', '—農事', '벼농사', 1),
+('事', '—農事', '벼농사', 2),
+('—', '—醬', '김장', 0),
+('醬', '—醬', '김장', 1),
+('―', '―脈', '잎맥', 0),
+('脈', '―脈', '잎맥', 1),
+('䓀', '䓀莄', '길경', 0),
+('莄', '䓀莄', '길경', 1),
+('䘔', '䘔血', '객혈', 0),
+('血', '䘔血', '객혈', 1),
+('䱋', '䱋魚', '홍어', 0),
+('魚', '䱋魚', '홍어', 1),
+('一', '一', '일', 0),
+('一', '一二', '일이', 0),
+('二', '一二', '일이', 1),
+('一', '一人', '일인', 0),
+('人', '一人', '일인', 1),
+('一', '一人稱', '일인칭', 0),
+('人', '一人稱', '일인칭', 1),
+('稱', '一人稱', '일인칭', 2),
+('一', '一件書類', '일건서류', 0),
+('件', '一件書類', '일건서류', 1),
+('書', '一件書類', '일건서류', 2),
+('類', '一件書類', '일건서류', 3),
+('一', '一元論', '일원론', 0),
+('元', '一元論', '일원론', 1),
+('論', '一元論', '일원론', 2),
+('一', '一切', '일체', 0),
+('切', '一切', '일체', 1),
+('一', '一口二言', '일구이언', 0),
+('口', '一口二言', '일구이언', 1),
+('二', '一口二言', '일구이언', 2),
+('言', '一口二言', '일구이언', 3),
+('一', '一同', '일동', 0),
+('同', '一同', '일동', 1),
+('一', '一名', '일명', 0),
+('名', '一名', '일명', 1),
+('一', '一周', '일주', 0),
+('周', '一周', '일주', 1),
+('一', '一命', '일명', 0),
+('命', '一命', '일명', 1),
+('一', '一品', '일품', 0),
+('品', '一品', '일품', 1),
+('一', '一品料理', '일품요리', 0),
+('品', '一品料理', '일품요리', 1),
+('料', '一品料理', '일품요리', 2),
+('理', '一品料理', '일품요리', 3),
+('一', '一員', '일원', 0),
+('員', '一員', '일원', 1),
+('一', '一回用', '일회용', 0),
+('回', '一回用', '일회용', 1),
+('用', '一回用', '일회용', 2),
+('一', '一回用品', '일회용품', 0),
+('回', '一回用品', '일회용품', 1),
+('用', '一回用品', '일회용품', 2),
+('品', '一回用品', '일회용품', 3),
+('一', '一因', '일인', 0),
+('因', '一因', '일인', 1),
+('一', '一國', '일국', 0),
+('國', '一國', '일국', 1),
+('一', '一壘', '1루', 0),
+('壘', '一壘', '1루', 1),
+('一', '一壘', '일루', 0),
+('壘', '一壘', '일루', 1),
+('一', '一壘手', '1루수', 0),
+('壘', '一壘手', '1루수', 1),
+('手', '一壘手', '1루수', 2),
+('一', '一壘手', '일루수', 0),
+('壘', '一壘手', '일루수', 1),
+('手', '一壘手', '일루수', 2),
+('一', '一大', '일대', 0),
+('大', '一大', '일대', 1),
+('一', '一夫多妻', '일부다처', 0),
+('夫', '一夫多妻', '일부다처', 1),
+('多', '一夫多妻', '일부다처', 2),
+('妻', '一夫多妻', '일부다처', 3),
+('一', '一定', '일정', 0),
+('定', '一定', '일정', 1),
+('一', '一對一', '일대일', 0),
+('對', '一對一', '일대일', 1),
+('一', '一對一', '일대일', 2),
+('一', '一層', '일층', 0),
+('層', '一層', '일층', 1),
+('一', '一年', '일년', 0),
+('年', '一年', '일년', 1),
+('一', '一律', '일률', 0),
+('律', '一律', '일률', 1),
+('一', '一心團結', '일심단결', 0),
+('心', '一心團結', '일심단결', 1),
+('團', '一心團結', '일심단결', 2),
+('結', '一心團結', '일심단결', 3),
+('一', '一擧一動', '일거일동', 0),
+('擧', '一擧一動', '일거일동', 1),
+('一', '一擧一動', '일거일동', 2),
+('動', '一擧一動', '일거일동', 3),
+('一', '一擧兩得', '일거양득', 0),
+('擧', '一擧兩得', '일거양득', 1),
+('兩', '一擧兩得', '일거양득', 2),
+('得', '一擧兩得', '일거양득', 3),
+('一', '一擧手一投足', '일거수일투족', 0),
+('擧', '一擧手一投足', '일거수일투족', 1),
+('手', '一擧手一投足', '일거수일투족', 2),
+('一', '一擧手一投足', '일거수일투족', 3),
+('投', '一擧手一投足', '일거수일투족', 4),
+('足', '一擧手一投足', '일거수일투족', 5),
+('一', '一攫千金', '일확천금', 0),
+('攫', '一攫千金', '일확천금', 1),
+('千', '一攫千金', '일확천금', 2),
+('金', '一攫千金', '일확천금', 3),
+('一', '一新', '일신', 0),
+('新', '一新', '일신', 1),
+('一', '一方', '일방', 0),
+('方', '一方', '일방', 1),
+('一', '一方的', '일방적', 0),
+('方', '一方的', '일방적', 1),
+('的', '一方的', '일방적', 2),
+('一', '一方通行', '일방통행', 0),
+('方', '一方通行', '일방통행', 1),
+('通', '一方通行', '일방통행', 2),
+('行', '一方通行', '일방통행', 3),
+('一', '一方通行路', '일방통행로', 0),
+('方', '一方通行路', '일방통행로', 1),
+('通', '一方通行路', '일방통행로', 2),
+('行', '一方通行路', '일방통행로', 3),
+('路', '一方通行路', '일방통행로', 4),
+('一', '一日', '일일', 0),
+('日', '一日', '일일', 1),
+('一', '一日三秋', '일일삼추', 0),
+('日', '一日三秋', '일일삼추', 1),
+('三', '一日三秋', '일일삼추', 2),
+('秋', '一日三秋', '일일삼추', 3),
+('一', '一旦', '일단', 0),
+('旦', '一旦', '일단', 1),
+('一', '一時', '일시', 0),
+('時', '一時', '일시', 1),
+('一', '一時的', '일시적', 0),
+('時', '一時的', '일시적', 1),
+('的', '一時的', '일시적', 2),
+('一', '一月', '1월', 0),
+('月', '一月', '1월', 1),
+('一', '一月', '일월', 0),
+('月', '一月', '일월', 1),
+('一', '一流', '일류', 0),
+('流', '一流', '일류', 1),
+('一', '一瀉千里', '일사천리', 0),
+('瀉', '一瀉千里', '일사천리', 1),
+('千', '一瀉千里', '일사천리', 2),
+('里', '一瀉千里', '일사천리', 3),
+('一', '一無', '일무', 0),
+('無', '一無', '일무', 1),
+('一', '一片', '일편', 0),
+('片', '一片', '일편', 1),
+('一', '一片丹心', '일편단심', 0),
+('片', '一片丹心', '일편단심', 1),
+('丹', '一片丹心', '일편단심', 2),
+('心', '一片丹心', '일편단심', 3),
+('一', '一理', '일리', 0),
+('理', '一理', '일리', 1),
+('一', '一生', '일생', 0),
+('生', '一生', '일생', 1),
+('一', '一石二鳥', '일석이조', 0),
+('石', '一石二鳥', '일석이조', 1),
+('二', '一石二鳥', '일석이조', 2),
+('鳥', '一石二鳥', '일석이조', 3),
+('一', '一神敎', '일신교', 0),
+('神', '一神敎', '일신교', 1),
+('敎', '一神敎', '일신교', 2),
+('一', '一神論', '일신론', 0),
+('神', '一神論', '일신론', 1),
+('論', '一神論', '일신론', 2),
+('一', '一種', '일종', 0),
+('種', '一種', '일종', 1),
+('一', '一等', '일등', 0),
+('等', '一等', '일등', 1),
+('一', '一等席', '일등석', 0),
+('等', '一等席', '일등석', 1),
+('席', '一等席', '일등석', 2),
+('一', '一等級', '일등급', 0),
+('等', '一等級', '일등급', 1),
+('級', '一等級', '일등급', 2),
+('一', '一縷', '일루', 0),
+('縷', '一縷', '일루', 1),
+('一', '一脈相通', '일맥상통', 0),
+('脈', '一脈相通', '일맥상통', 1),
+('相', '一脈相通', '일맥상통', 2),
+('通', '一脈相通', '일맥상통', 3),
+('一', '一致', '일치', 0),
+('致', '一致', '일치', 1),
+('一', '一舉兩得', '일거양득', 0),
+('舉', '一舉兩得', '일거양득', 1),
+('兩', '一舉兩得', '일거양득', 2),
+('得', '一舉兩得', '일거양득', 3),
+('一', '一般', '일반', 0),
+('般', '一般', '일반', 1),
+('一', '一般人', '일반인', 0),
+('般', '一般人', '일반인', 1),
+('人', '一般人', '일반인', 2),
+('一', '一般席', '일반석', 0),
+('般', '一般席', '일반석', 1),
+('席', '一般席', '일반석', 2),
+('一', '一般的', '일반적', 0),
+('般', '一般的', '일반적', 1),
+('的', '一般的', '일반적', 2),
+('一', '一般醫', '일반의', 0),
+('般', '一般醫', '일반의', 1),
+('醫', '一般醫', '일반의', 2),
+('一', '一行', '일행', 0),
+('行', '一行', '일행', 1),
+('一', '一見', '일견', 0),
+('見', '一見', '일견', 1),
+('一', '一角獸', '일각수', 0),
+('角', '一角獸', '일각수', 1),
+('獸', '一角獸', '일각수', 2),
+('一', '一蹴', '일축', 0),
+('蹴', '一蹴', '일축', 1),
+('一', '一輪車', '일륜차', 0),
+('輪', '一輪車', '일륜차', 1),
+('車', '一輪車', '일륜차', 2),
+('一', '一週日', '일주일', 0),
+('週', '一週日', '일주일', 1),
+('日', '一週日', '일주일', 2),
+('一', '一進一退', '일진일퇴', 0),
+('進', '一進一退', '일진일퇴', 1),
+('一', '一進一退', '일진일퇴', 2),
+('退', '一進一退', '일진일퇴', 3),
+('一', '一部', '일부', 0),
+('部', '一部', '일부', 1),
+('一', '一酸化炭素', '일산화탄소', 0),
+('酸', '一酸化炭素', '일산화탄소', 1),
+('化', '一酸化炭素', '일산화탄소', 2),
+('炭', '一酸化炭素', '일산화탄소', 3),
+('素', '一酸化炭素', '일산화탄소', 4),
+('一', '一門', '일문', 0),
+('門', '一門', '일문', 1),
+('一', '一面識', '일면식', 0),
+('面', '一面識', '일면식', 1),
+('識', '一面識', '일면식', 2),
+('一', '一齊', '일제', 0),
+('齊', '一齊', '일제', 1),
+('一', '一切', '일체', 0),
+('切', '一切', '일체', 1),
+('丁', '丁', '정', 0),
+('丁', '丁丑', '정축', 0),
+('丑', '丁丑', '정축', 1),
+('丁', '丁亥', '정해', 0),
+('亥', '丁亥', '정해', 1),
+('丁', '丁力', '정력', 0),
+('力', '丁力', '정력', 1),
+('丁', '丁卯', '정묘', 0),
+('卯', '丁卯', '정묘', 1),
+('丁', '丁巳', '정사', 0),
+('巳', '丁巳', '정사', 1),
+('丁', '丁年', '정년', 0),
+('年', '丁年', '정년', 1),
+('丁', '丁未', '정미', 0),
+('未', '丁未', '정미', 1),
+('丁', '丁酉', '정유', 0),
+('酉', '丁酉', '정유', 1),
+('七', '七', '칠', 0),
+('七', '七十', '칠십', 0),
+('十', '七十', '칠십', 1),
+('七', '七十代', '칠십대', 0),
+('十', '七十代', '칠십대', 1),
+('代', '七十代', '칠십대', 2),
+('七', '七十年代', '칠십년대', 0),
+('十', '七十年代', '칠십년대', 1),
+('年', '七十年代', '칠십년대', 2),
+('代', '七十年代', '칠십년대', 3),
+('七', '七十歲', '칠십세', 0),
+('十', '七十歲', '칠십세', 1),
+('歲', '七十歲', '칠십세', 2),
+('七', '七夕', '칠석', 0),
+('夕', '七夕', '칠석', 1),
+('七', '七寸', '칠촌', 0),
+('寸', '七寸', '칠촌', 1),
+('七', '七星', '칠성', 0),
+('星', '七星', '칠성', 1),
+('七', '七星長漁', '칠성장어', 0),
+('星', '七星長漁', '칠성장어', 1),
+('長', '七星長漁', '칠성장어', 2),
+('漁', '七星長漁', '칠성장어', 3),
+('七', '七星상魚', '칠성상어', 0),
+('星', '七星상魚', '칠성상어', 1),
+('상', '七星상魚', '칠성상어', 2),
+('魚', '七星상魚', '칠성상어', 3),
+('七', '七月', '7월', 0),
+('月', '七月', '7월', 1),
+('七', '七月', '칠월', 0),
+('月', '七月', '칠월', 1),
+('七', '七葉樹', '칠엽수', 0),
+('葉', '七葉樹', '칠엽수', 1),
+('樹', '七葉樹', '칠엽수', 2),
+('七', '七角形', '칠각형', 0),
+('角', '七角形', '칠각형', 1),
+('形', '七角形', '칠각형', 2),
+('七', '七轉八起', '칠전팔기', 0),
+('轉', '七轉八起', '칠전팔기', 1),
+('八', '七轉八起', '칠전팔기', 2),
+('起', '七轉八起', '칠전팔기', 3),
+('七', '七面鳥', '칠면조', 0),
+('面', '七面鳥', '칠면조', 1),
+('鳥', '七面鳥', '칠면조', 2),
+('七', '七顚八起', '칠전팔기', 0),
+('顚', '七顚八起', '칠전팔기', 1),
+('八', '七顚八起', '칠전팔기', 2),
+('起', '七顚八起', '칠전팔기', 3),
+('丈', '丈人', '장인', 0),
+('人', '丈人', '장인', 1),
+('丈', '丈夫', '장부', 0),
+('夫', '丈夫', '장부', 1),
+('丈', '丈家', '장가', 0),
+('家', '丈家', '장가', 1),
+('丈', '丈母', '장모', 0),
+('母', '丈母', '장모', 1),
+('丈', '丈母-', '장모님', 0),
+('母', '丈母-', '장모님', 1),
+('-', '丈母-', '장모님', 2),
+('三', '三', '삼', 0),
+('三', '三人稱', '삼인칭', 0),
+('人', '三人稱', '삼인칭', 1),
+('稱', '三人稱', '삼인칭', 2),
+('三', '三代', '삼대', 0),
+('代', '三代', '삼대', 1),
+('三', '三位一體', '삼위일체', 0),
+('位', '三位一體', '삼위일체', 1),
+('一', '三位一體', '삼위일체', 2),
+('體', '三位一體', '삼위일체', 3),
+('三', '三修', '삼수', 0),
+('修', '三修', '삼수', 1),
+('三', '三光', '삼광', 0),
+('光', '三光', '삼광', 1),
+('三', '三公', '삼공', 0),
+('公', '三公', '삼공', 1),
+('三', '三冬', '삼동', 0),
+('冬', '三冬', '삼동', 1),
+('三', '三十', '삼십', 0),
+('十', '三十', '삼십', 1),
+('三', '三十六計', '삼십육계', 0),
+('十', '三十六計', '삼십육계', 1),
+('六', '三十六計', '삼십육계', 2),
+('計', '三十六計', '삼십육계', 3),
+('三', '三司', '삼사', 0),
+('司', '三司', '삼사', 1),
+('三', '三國', '삼국', 0),
+('國', '三國', '삼국', 1),
+('三', '三國志', '삼국지', 0),
+('國', '三國志', '삼국지', 1),
+('志', '三國志', '삼국지', 2),
+('三', '三壘', '3루', 0),
+('壘', '三壘', '3루', 1),
+('三', '三壘', '삼루', 0),
+('壘', '三壘', '삼루', 1),
+('三', '三壘手', '3루수', 0),
+('壘', '三壘手', '3루수', 1),
+('手', '三壘手', '3루수', 2),
+('三', '三壘手', '삼루수', 0),
+('壘', '三壘手', '삼루수', 1),
+('手', '三壘手', '삼루수', 2),
+('三', '三大', '삼대', 0),
+('大', '三大', '삼대', 1),
+('三', '三大體腔', '삼대체강', 0),
+('大', '三大體腔', '삼대체강', 1),
+('體', '三大體腔', '삼대체강', 2),
+('腔', '三大體腔', '삼대체강', 3),
+('三', '三寸', '삼촌', 0),
+('寸', '三寸', '삼촌', 1),
+('三', '三振', '삼진', 0),
+('振', '三振', '삼진', 1),
+('三', '三族', '삼족', 0),
+('族', '三族', '삼족', 1),
+('三', '三星', '삼성', 0),
+('星', '三星', '삼성', 1),
+('三', '三昧', '삼매', 0),
+('昧', '三昧', '삼매', 1),
+('三', '三月', '3월', 0),
+('月', '三月', '3월', 1),
+('三', '三月', '삼월', 0),
+('月', '三月', '삼월', 1),
+('三', '三枝槍', '삼지창', 0),
+('枝', '三枝槍', '삼지창', 1),
+('槍', '三枝槍', '삼지창', 2),
+('三', '三樂', '삼락', 0),
+('樂', '三樂', '삼락', 1),
+('三', '三次元', '삼차원', 0),
+('次', '三次元', '삼차원', 1),
+('元', '三次元', '삼차원', 2),
+('三', '三段論法', '삼단논법', 0),
+('段', '三段論法', '삼단논법', 1),
+('論', '三段論法', '삼단논법', 2),
+('法', '三段論法', '삼단논법', 3),
+('三', '三毒', '삼독', 0),
+('毒', '三毒', '삼독', 1),
+('三', '三清教育隊', '삼청교육대', 0),
+('清', '三清教育隊', '삼청교육대', 1),
+('教', '三清教育隊', '삼청교육대', 2),
+('育', '三清教育隊', '삼청교육대', 3),
+('隊', '三清教育隊', '삼청교육대', 4),
+('三', '三焦', '삼초', 0),
+('焦', '三焦', '삼초', 1),
+('三', '三省', '삼성', 0),
+('省', '三省', '삼성', 1),
+('三', '三神', '삼신', 0),
+('神', '三神', '삼신', 1),
+('三', '三脚', '삼각', 0),
+('脚', '三脚', '삼각', 1),
+('三', '三脚臺', '삼각대', 0),
+('脚', '三脚臺', '삼각대', 1),
+('臺', '三脚臺', '삼각대', 2),
+('三', '三色', '삼색', 0),
+('色', '三色', '삼색', 1),
+('三', '三色旗', '삼색기', 0),
+('色', '三色旗', '삼색기', 1),
+('旗', '三色旗', '삼색기', 2),
+('三', '三葉機', '삼엽기', 0),
+('葉', '三葉機', '삼엽기', 1),
+('機', '三葉機', '삼엽기', 2),
+('三', '三葉蟲', '삼엽충', 0),
+('葉', '三葉蟲', '삼엽충', 1),
+('蟲', '三葉蟲', '삼엽충', 2),
+('三', '三藏', '삼장', 0),
+('藏', '三藏', '삼장', 1),
+('三', '三角', '삼각', 0),
+('角', '三角', '삼각', 1),
+('三', '三角形', '삼각형', 0),
+('角', '三角形', '삼각형', 1),
+('形', '三角形', '삼각형', 2),
+('三', '三角法', '삼각법', 0),
+('角', '三角法', '삼각법', 1),
+('法', '三角法', '삼각법', 2),
+('三', '三角關係', '삼각관계', 0),
+('角', '三角關係', '삼각관계', 1),
+('關', '三角關係', '삼각관계', 2),
+('係', '三角關係', '삼각관계', 3),
+('三', '三諦', '삼제', 0),
+('諦', '三諦', '삼제', 1),
+('三', '三諦', '삼체', 0),
+('諦', '三諦', '삼체', 1),
+('三', '三足烏', '삼족오', 0),
+('足', '三足烏', '삼족오', 1),
+('烏', '三足烏', '삼족오', 2),
+('三', '三輪車', '삼륜차', 0),
+('輪', '三輪車', '삼륜차', 1),
+('車', '三輪車', '삼륜차', 2),
+('三', '三重殺', '삼중살', 0),
+('重', '三重殺', '삼중살', 1),
+('殺', '三重殺', '삼중살', 2),
+('三', '三陟', '삼척', 0),
+('陟', '三陟', '삼척', 1),
+('三', '三韓', '삼한', 0),
+('韓', '三韓', '삼한', 1),
+('三', '三頭政治', '삼두정치', 0),
+('頭', '三頭政治', '삼두정치', 1),
+('政', '三頭政治', '삼두정치', 2),
+('治', '三頭政治', '삼두정치', 3),
+('三', '三頭筋', '삼두근', 0),
+('頭', '三頭筋', '삼두근', 1),
+('筋', '三頭筋', '삼두근', 2),
+('三', '三體', '삼체', 0),
+('體', '三體', '삼체', 1),
+('三', '三鮮', '삼선', 0),
+('鮮', '三鮮', '삼선', 1),
+('三', '三체', '삼체', 0),
+('체', '三체', '삼체', 1),
+('上', '上', '상', 0),
+('上', '上世', '상세', 0),
+('世', '上世', '상세', 1),
+('上', '上位語', '상위어', 0),
+('位', '上位語', '상위어', 1),
+('語', '上位語', '상위어', 2),
+('上', '上例', '상례', 0),
+('例', '上例', '상례', 1),
+('上', '上半期', '상반기', 0),
+('半', '上半期', '상반기', 1),
+('期', '上半期', '상반기', 2),
+('上', '上半身', '상반신', 0),
+('半', '上半身', '상반신', 1),
+('身', '上半身', '상반신', 2),
+('上', '上卷', '상권', 0),
+('卷', '上卷', '상권', 1),
+('上', '上古', '상고', 0),
+('古', '上古', '상고', 1),
+('上', '上古 漢語', '상고 한어', 0),
+('古', '上古 漢語', '상고 한어', 1),
+('漢', '上古 漢語', '상고 한어', 3),
+('語', '上古 漢語', '상고 한어', 4),
+('上', '上司', '상사', 0),
+('司', '上司', '상사', 1),
+('上', '上士', '상사', 0),
+('士', '上士', '상사', 1),
+('上', '上天', '상천', 0),
+('天', '上天', '상천', 1),
+('上', '上官', '상관', 0),
+('官', '上官', '상관', 1),
+('上', '上客', '상객', 0),
+('客', '上客', '상객', 1),
+('上', '上席', '상석', 0),
+('席', '上席', '상석', 1),
+('上', '上投', '상투', 0),
+('投', '上投', '상투', 1),
+('上', '上昇', '상승', 0),
+('昇', '上昇', '상승', 1),
+('上', '上洛', '상락', 0),
+('洛', '上洛', '상락', 1),
+('上', '上流', '상류', 0),
+('流', '上流', '상류', 1),
+('上', '上流社會', '상류사회', 0),
+('流', '上流社會', '상류사회', 1),
+('社', '上流社會', '상류사회', 2),
+('會', '上流社會', '상류사회', 3),
+('上', '上海', '상해', 0),
+('海', '上海', '상해', 1),
+('上', '上程', '상정', 0),
+('程', '上程', '상정', 1),
+('上', '上級', '상급', 0),
+('級', '上級', '상급', 1),
+('上', '上聲', '상성', 0),
+('聲', '上聲', '상성', 1),
+('上', '上腕三頭筋', '상완삼두근', 0),
+('腕', '上腕三頭筋', '상완삼두근', 1),
+('三', '上腕三頭筋', '상완삼두근', 2),
+('頭', '上腕三頭筋', '상완삼두근', 3),
+('筋', '上腕三頭筋', '상완삼두근', 4),
+('上', '上腕二頭筋', '상완이두근', 0),
+('腕', '上腕二頭筋', '상완이두근', 1),
+('二', '上腕二頭筋', '상완이두근', 2),
+('頭', '上腕二頭筋', '상완이두근', 3),
+('筋', '上腕二頭筋', '상완이두근', 4),
+('上', '上製', '상제', 0),
+('製', '上製', '상제', 1),
+('上', '上記', '상기', 0),
+('記', '上記', '상기', 1),
+('上', '上述', '상술', 0),
+('述', '上述', '상술', 1),
+('上', '上部', '상부', 0),
+('部', '上部', '상부', 1),
+('上', '上院', '상원', 0),
+('院', '上院', '상원', 1),
+('上', '上院議員', '상원의원', 0),
+('院', '上院議員', '상원의원', 1),
+('議', '上院議員', '상원의원', 2),
+('員', '上院議員', '상원의원', 3),
+('上', '上陸', '상륙', 0),
+('陸', '上陸', '상륙', 1),
+('上', '上面', '상면', 0),
+('面', '上面', '상면', 1),
+('上', '上頭', '상두', 0),
+('頭', '上頭', '상두', 1),
+('上', '上體', '상체', 0),
+('體', '上體', '상체', 1),
+('下', '下', '하', 0),
+('下', '下人', '하인', 0),
+('人', '下人', '하인', 1),
+('下', '下位', '하위', 0),
+('位', '下位', '하위', 1),
+('下', '下剋上', '하극상', 0),
+('剋', '下剋上', '하극상', 1),
+('上', '下剋上', '하극상', 2),
+('下', '下半期', '하반기', 0),
+('半', '下半期', '하반기', 1),
+('期', '下半期', '하반기', 2),
+('下', '下半身', '하반신', 0),
+('半', '下半身', '하반신', 1),
+('身', '下半身', '하반신', 2),
+('下', '下士官', '하사관', 0),
+('士', '下士官', '하사관', 1),
+('官', '下士官', '하사관', 2),
+('下', '下女', '하녀', 0),
+('女', '下女', '하녀', 1),
+('下', '下宿', '하숙', 0),
+('宿', '下宿', '하숙', 1),
+('下', '下宿屋', '하숙옥', 0),
+('宿', '下宿屋', '하숙옥', 1),
+('屋', '下宿屋', '하숙옥', 2),
+('下', '下宿房', '하숙방', 0),
+('宿', '下宿房', '하숙방', 1),
+('房', '下宿房', '하숙방', 2),
+('下', '下宿生', '하숙생', 0),
+('宿', '下宿生', '하숙생', 1),
+('生', '下宿生', '하숙생', 2),
+('下', '下宿費', '하숙비', 0),
+('宿', '下宿費', '하숙비', 1),
+('費', '下宿費', '하숙비', 2),
+('下', '下旬', '하순', 0),
+('旬', '下旬', '하순', 1),
+('下', '下水', '하수', 0),
+('水', '下水', '하수', 1),
+('下', '下水溝', '하수구', 0),
+('水', '下水溝', '하수구', 1),
+('溝', '下水溝', '하수구', 2),
+('下', '下水道', '하수도', 0),
+('水', '下水道', '하수도', 1),
+('道', '下水道', '하수도', 2),
+('下', '下流', '하류', 0),
+('流', '下流', '하류', 1),
+('下', '下界', '하계', 0),
+('界', '下界', '하계', 1),
+('下', '下直', '하직', 0),
+('直', '下直', '하직', 1),
+('下', '下級', '하급', 0),
+('級', '下級', '하급', 1),
+('下', '下肢帶', '하지대', 0),
+('肢', '下肢帶', '하지대', 1),
+('帶', '下肢帶', '하지대', 2),
+('下', '下腿三頭筋', '하퇴삼두근', 0),
+('腿', '下腿三頭筋', '하퇴삼두근', 1),
+('三', '下腿三頭筋', '하퇴삼두근', 2),
+('頭', '下腿三頭筋', '하퇴삼두근', 3),
+('筋', '下腿三頭筋', '하퇴삼두근', 4),
+('下', '下記', '하기', 0),
+('記', '下記', '하기', 1),
+('下', '下請', '하청', 0),
+('請', '下請', '하청', 1),
+('下', '下部', '하부', 0),
+('部', '下部', '하부', 1),
+('下', '下野', '하야', 0),
+('野', '下野', '하야', 1),
+('下', '下降', '하강', 0),
+('降', '下降', '하강', 1),
+('下', '下院', '하원', 0),
+('院', '下院', '하원', 1),
+('下', '下面', '하면', 0),
+('面', '下面', '하면', 1),
+('下', '下體', '하체', 0),
+('體', '下體', '하체', 1),
+('不', '不一致', '불일치', 0),
+('一', '不一致', '불일치', 1),
+('致', '不一致', '불일치', 2),
+('不', '不便', '불편', 0),
+('便', '不便', '불편', 1),
+('不', '不信', '불신', 0),
+('信', '不信', '불신', 1),
+('不', '不信任', '불신임', 0),
+('信', '不信任', '불신임', 1),
+('任', '不信任', '불신임', 2),
+('不', '不倫', '불륜', 0),
+('倫', '不倫', '불륜', 1),
+('不', '不充分', '불충분', 0),
+('充', '不充分', '불충분', 1),
+('分', '不充分', '불충분', 2),
+('不', '不入虎穴 不得虎子', '불입호혈 부득호자', 0),
+('入', '不入虎穴 不得虎子', '불입호혈 부득호자', 1),
+('虎', '不入虎穴 不得虎子', '불입호혈 부득호자', 2),
+('穴', '不入虎穴 不得虎子', '불입호혈 부득호자', 3),
+('不', '不入虎穴 不得虎子', '불입호혈 부득호자', 5),
+('得', '不入虎穴 不得虎子', '불입호혈 부득호자', 6),
+('虎', '不入虎穴 不得虎子', '불입호혈 부득호자', 7),
+('子', '不入虎穴 不得虎子', '불입호혈 부득호자', 8),
+('不', '不公平', '불공평', 0),
+('公', '不公平', '불공평', 1),
+('平', '不公平', '불공평', 2),
+('不', '不具', '불구', 0),
+('具', '不具', '불구', 1),
+('不', '不凍液', '부동액', 0),
+('凍', '不凍液', '부동액', 1),
+('液', '不凍液', '부동액', 2),
+('不', '不利', '불리', 0),
+('利', '不利', '불리', 1),
+('不', '不動', '부동', 0),
+('動', '不動', '부동', 1),
+('不', '不動産', '부동산', 0),
+('動', '不動産', '부동산', 1),
+('産', '不動産', '부동산', 2),
+('不', '不協和音', '불협화음', 0),
+('協', '不協和音', '불협화음', 1),
+('和', '不協和音', '불협화음', 2),
+('音', '不協和音', '불협화음', 3),
+('不', '不可侵', '불가침', 0),
+('可', '不可侵', '불가침', 1),
+('侵', '不可侵', '불가침', 2),
+('不', '不可思議', '불가사의', 0),
+('可', '不可思議', '불가사의', 1),
+('思', '不可思議', '불가사의', 2),
+('議', '不可思議', '불가사의', 3),
+('不', '不可知論', '불가지론', 0),
+('可', '不可知論', '불가지론', 1),
+('知', '不可知論', '불가지론', 2),
+('論', '不可知論', '불가지론', 3),
+('不', '不可缺', '불가결', 0),
+('可', '不可缺', '불가결', 1),
+('缺', '不可缺', '불가결', 2),
+('不', '不可缺 脂肪酸', '불가결 지방산', 0),
+('可', '不可缺 脂肪酸', '불가결 지방산', 1),
+('缺', '不可缺 脂肪酸', '불가결 지방산', 2),
+('脂', '不可缺 脂肪酸', '불가결 지방산', 4),
+('肪', '不可缺 脂肪酸', '불가결 지방산', 5),
+('酸', '不可缺 脂肪酸', '불가결 지방산', 6),
+('不', '不可能', '불가능', 0),
+('可', '不可能', '불가능', 1),
+('能', '不可能', '불가능', 2),
+('不', '不合格', '불합격', 0),
+('合', '不合格', '불합격', 1),
+('格', '不合格', '불합격', 2),
+('不', '不吉', '불길', 0),
+('吉', '不吉', '불길', 1),
+('不', '不名譽', '불명예', 0),
+('名', '不名譽', '불명예', 1),
+('譽', '不名譽', '불명예', 2),
+('不', '不和', '불화', 0),
+('和', '不和', '불화', 1),
+('不', '不在', '부재', 0),
+('在', '不在', '부재', 1),
+('不', '不均衡', '불균형', 0),
+('均', '不均衡', '불균형', 1),
+('衡', '不均衡', '불균형', 2),
+('不', '不夜城', '불야성', 0),
+('夜', '不夜城', '불야성', 1),
+('城', '不夜城', '불야성', 2),
+('不', '不妊', '불임', 0),
+('妊', '不妊', '불임', 1),
+('不', '不孝', '불효', 0),
+('孝', '不孝', '불효', 1),
+('不', '不孝子息', '불효자식', 0),
+('孝', '不孝子息', '불효자식', 1),
+('子', '不孝子息', '불효자식', 2),
+('息', '不孝子息', '불효자식', 3),
+('不', '不安', '불안', 0),
+('安', '不安', '불안', 1),
+('不', '不安定', '불안정', 0),
+('安', '不安定', '불안정', 1),
+('定', '不安定', '불안정', 2),
+('不', '不完全', '불완전', 0),
+('完', '不完全', '불완전', 1),
+('全', '不完全', '불완전', 2),
+('不', '不定', '부정', 0),
+('定', '不定', '부정', 1),
+('不', '不定冠詞', '부정관사', 0),
+('定', '不定冠詞', '부정관사', 1),
+('冠', '不定冠詞', '부정관사', 2),
+('詞', '不定冠詞', '부정관사', 3),
+('不', '不定積分', '부정적분', 0),
+('定', '不定積分', '부정적분', 1),
+('積', '不定積分', '부정적분', 2),
+('分', '不定積分', '부정적분', 3),
+('不', '不定詞', '부정사', 0),
+('定', '不定詞', '부정사', 1),
+('詞', '不定詞', '부정사', 2),
+('不', '不屈', '불굴', 0),
+('屈', '不屈', '불굴', 1),
+('不', '不平', '불평', 0),
+('平', '不平', '불평', 1),
+('不', '不平等', '불평등', 0),
+('平', '不平等', '불평등', 1),
+('等', '不平等', '불평등', 2),
+('不', '不幸', '불행', 0),
+('幸', '不幸', '불행', 1),
+('不', '不德義', '부덕의', 0),
+('德', '不德義', '부덕의', 1),
+('義', '不德義', '부덕의', 2),
+('不', '不忠', '불충', 0),
+('忠', '不忠', '불충', 1),
+('不', '不快', '불쾌', 0),
+('快', '不快', '불쾌', 1),
+('不', '不應', '불응', 0),
+('應', '不應', '불응', 1),
+('不', '不戰勝', '부전승', 0),
+('戰', '不戰勝', '부전승', 1),
+('勝', '不戰勝', '부전승', 2),
+('不', '不拘束', '불구속', 0),
+('拘', '不拘束', '불구속', 1),
+('束', '不拘束', '불구속', 2),
+('不', '不振', '부진', 0),
+('振', '不振', '부진', 1),
+('不', '不撤晝夜', '불철주야', 0),
+('撤', '不撤晝夜', '불철주야', 1),
+('晝', '不撤晝夜', '불철주야', 2),
+('夜', '不撤晝夜', '불철주야', 3),
+('不', '不敗', '불패', 0),
+('敗', '不敗', '불패', 1),
+('不', '不敢請 固所願', '불감청 고소원', 0),
+('敢', '不敢請 固所願', '불감청 고소원', 1),
+('請', '不敢請 固所願', '불감청 고소원', 2),
+('固', '不敢請 固所願', '불감청 고소원', 4),
+('所', '不敢請 固所願', '불감청 고소원', 5),
+('願', '不敢請 固所願', '불감청 고소원', 6),
+('不', '不敬', '불경', 0),
+('敬', '不敬', '불경', 1),
+('不', '不文律', '불문율', 0),
+('文', '不文律', '불문율', 1),
+('律', '不文律', '불문율', 2),
+('不', '不斷', '부단', 0),
+('斷', '不斷', '부단', 1),
+('不', '不明', '불명', 0),
+('明', '不明', '불명', 1),
+('不', '不明瞭', '불명료', 0),
+('明', '不明瞭', '불명료', 1),
+('瞭', '不明瞭', '불명료', 2),
+('不', '不時着', '불시착', 0),
+('時', '不時着', '불시착', 1),
+('着', '不時着', '불시착', 2),
+('不', '不服', '불복', 0),
+('服', '不服', '불복', 1),
+('不', '不條理', '부조리', 0),
+('條', '不條理', '부조리', 1),
+('理', '不條理', '부조리', 2),
+('不', '不正', '부정', 0),
+('正', '不正', '부정', 1),
+('不', '不正確', '부정확', 0),
+('正', '不正確', '부정확', 1),
+('確', '不正確', '부정확', 2),
+('不', '不死', '불사', 0),
+('死', '不死', '불사', 1),
+('不', '不死鳥', '불사조', 0),
+('死', '不死鳥', '불사조', 1),
+('鳥', '不死鳥', '불사조', 2),
+('不', '不汗黨', '불한당', 0),
+('汗', '不汗黨', '불한당', 1),
+('黨', '不汗黨', '불한당', 2),
+('不', '不治', '불치', 0),
+('治', '不治', '불치', 1),
+('不', '不治病', '불치병', 0),
+('治', '不治病', '불치병', 1),
+('病', '不治病', '불치병', 2),
+('不', '不況', '불황', 0),
+('況', '不況', '불황', 1),
+('不', '不法', '불법', 0),
+('法', '不法', '불법', 1),
+('不', '不注意', '부주의', 0),
+('注', '不注意', '부주의', 1),
+('意', '不注意', '부주의', 2),
+('不', '不淨腐敗', '부정부패', 0),
+('淨', '不淨腐敗', '부정부패', 1),
+('腐', '不淨腐敗', '부정부패', 2),
+('敗', '不淨腐敗', '부정부패', 3),
+('不', '不淸不濁', '불청불탁', 0),
+('淸', '不淸不濁', '불청불탁', 1),
+('不', '不淸不濁', '불청불탁', 2),
+('濁', '不淸不濁', '불청불탁', 3),
+('不', '不渡', '부도', 0),
+('渡', '不渡', '부도', 1),
+('不', '不滅', '불멸', 0),
+('滅', '不滅', '불멸', 1),
+('不', '不滿', '불만', 0),
+('滿', '不滿', '불만', 1),
+('不', '不滿足', '불만족', 0),
+('滿', '不滿足', '불만족', 1),
+('足', '不滿足', '불만족', 2),
+('不', '不眠', '불면', 0),
+('眠', '不眠', '불면', 1),
+('不', '不眠症', '불면증', 0),
+('眠', '不眠症', '불면증', 1),
+('症', '不眠症', '불면증', 2),
+('不', '不知不識間', '부지불식간', 0),
+('知', '不知不識間', '부지불식간', 1),
+('不', '不知不識間', '부지불식간', 2),
+('識', '不知不識間', '부지불식간', 3),
+('間', '不知不識間', '부지불식간', 4),
+('不', '不知其數', '부지기수', 0),
+('知', '不知其數', '부지기수', 1),
+('其', '不知其數', '부지기수', 2),
+('數', '不知其數', '부지기수', 3),
+('不', '不確實', '불확실', 0),
+('確', '不確實', '불확실', 1),
+('實', '不確實', '불확실', 2),
+('不', '不祥', '불상', 0),
+('祥', '不祥', '불상', 1),
+('不', '不祥事', '불상사', 0),
+('祥', '不祥事', '불상사', 1),
+('事', '不祥事', '불상사', 2),
+('不', '不等式', '부등식', 0),
+('等', '不等式', '부등식', 1),
+('式', '不等式', '부등식', 2),
+('不', '不純', '불순', 0),
+('純', '不純', '불순', 1),
+('不', '不老不死', '불로불사', 0),
+('老', '不老不死', '불로불사', 1),
+('不', '不老不死', '불로불사', 2),
+('死', '不老不死', '불로불사', 3),
+('不', '不能', '불능', 0),
+('能', '不能', '불능', 1),
+('不', '不自然', '부자연', 0),
+('自', '不自然', '부자연', 1),
+('然', '不自然', '부자연', 2),
+('不', '不自由', '부자유', 0),
+('自', '不自由', '부자유', 1),
+('由', '不自由', '부자유', 2),
+('不', '不良', '불량', 0),
+('良', '不良', '불량', 1),
+('不', '不良 國家', '불량 국가', 0),
+('良', '不良 國家', '불량 국가', 1),
+('國', '不良 國家', '불량 국가', 3),
+('家', '不良 國家', '불량 국가', 4),
+('不', '不良者', '불량자', 0),
+('良', '不良者', '불량자', 1),
+('者', '不良者', '불량자', 2),
+('不', '不良輩', '불량배', 0),
+('良', '不良輩', '불량배', 1),
+('輩', '不良輩', '불량배', 2),
+('不', '不規則', '불규칙', 0),
+('規', '不規則', '불규칙', 1),
+('則', '不規則', '불규칙', 2),
+('不', '不規則銀河', '불규칙은하', 0),
+('規', '不規則銀河', '불규칙은하', 1),
+('則', '不規則銀河', '불규칙은하', 2),
+('銀', '不規則銀河', '불규칙은하', 3),
+('河', '不規則銀河', '불규칙은하', 4),
+('不', '不親切', '불친절', 0),
+('親', '不親切', '불친절', 1),
+('切', '不親切', '불친절', 2),
+('不', '不許', '불허', 0),
+('許', '不許', '불허', 1),
+('不', '不詳', '불상', 0),
+('詳', '不詳', '불상', 1),
+('不', '不調和', '부조화', 0),
+('調', '不調和', '부조화', 1),
+('和', '不調和', '부조화', 2),
+('不', '不變', '불변', 0),
+('變', '不變', '불변', 1),
+('不', '不貞', '부정', 0),
+('貞', '不貞', '부정', 1),
+('不', '不買運動', '불매운동', 0),
+('買', '不買運動', '불매운동', 1),
+('運', '不買運動', '불매운동', 2),
+('動', '不買運動', '불매운동', 3),
+('不', '不足', '부족', 0),
+('足', '不足', '부족', 1),
+('不', '不通', '불통', 0),
+('通', '不通', '불통', 1),
+('不', '不運', '불운', 0),
+('運', '不運', '불운', 1),
+('不', '不過', '불과', 0),
+('過', '不過', '불과', 1),
+('不', '不道德', '부도덕', 0),
+('道', '不道德', '부도덕', 1),
+('德', '不道德', '부도덕', 2),
+('不', '不適切', '부적절', 0),
+('適', '不適切', '부적절', 1),
+('切', '不適切', '부적절', 2),
+('不', '不適合', '부적합', 0),
+('適', '不適合', '부적합', 1),
+('合', '不適合', '부적합', 2),
+('不', '不適應', '부적응', 0),
+('適', '不適應', '부적응', 1),
+('應', '不適應', '부적응', 2),
+('不', '不適格', '부적격', 0),
+('適', '不適格', '부적격', 1),
+('格', '不適格', '부적격', 2),
+('不', '不飽和', '불포화', 0),
+('飽', '不飽和', '불포화', 1),
+('和', '不飽和', '불포화', 2),
+('不', '不飽和 脂肪酸', '불포화 지방산', 0),
+('飽', '不飽和 脂肪酸', '불포화 지방산', 1),
+('和', '不飽和 脂肪酸', '불포화 지방산', 2),
+('脂', '不飽和 脂肪酸', '불포화 지방산', 4),
+('肪', '不飽和 脂肪酸', '불포화 지방산', 5),
+('酸', '不飽和 脂肪酸', '불포화 지방산', 6),
+('丐', '丐乞', '개걸', 0),
+('乞', '丐乞', '개걸', 1),
+('世', '世', '세', 0),
+('世', '世上', '세상', 0),
+('上', '世上', '세상', 1),
+('世', '世上에', '세상에', 0),
+('上', '世上에', '세상에', 1),
+('에', '世上에', '세상에', 2),
+('世', '世事', '세사', 0),
+('事', '世事', '세사', 1),
+('世', '世代', '세대', 0),
+('代', '世代', '세대', 1),
+('世', '世俗', '세속', 0),
+('俗', '世俗', '세속', 1),
+('世', '世俗的', '세속적', 0),
+('俗', '世俗的', '세속적', 1),
+('的', '世俗的', '세속적', 2),
+('世', '世子', '세자', 0),
+('子', '世子', '세자', 1),
+('世', '世宗', '세종', 0),
+('宗', '世宗', '세종', 1),
+('世', '世宗大王', '세종대왕', 0),
+('宗', '世宗大王', '세종대왕', 1),
+('大', '世宗大王', '세종대왕', 2),
+('王', '世宗大王', '세종대왕', 3),
+('世', '世尊', '세존', 0),
+('尊', '世尊', '세존', 1),
+('世', '世帶', '세대', 0),
+('帶', '世帶', '세대', 1),
+('世', '世界', '세계', 0),
+('界', '世界', '세계', 1),
+('世', '世界 總大主敎', '세계 총대주교', 0),
+('界', '世界 總大主敎', '세계 총대주교', 1),
+('總', '世界 總大主敎', '세계 총대주교', 3),
+('大', '世界 總大主敎', '세계 총대주교', 4),
+('主', '世界 總大主敎', '세계 총대주교', 5),
+('敎', '世界 總大主敎', '세계 총대주교', 6),
+('世', '世界化', '세계화', 0),
+('界', '世界化', '세계화', 1),
+('化', '世界化', '세계화', 2),
+('世', '世界平和', '세계평화', 0),
+('界', '世界平和', '세계평화', 1),
+('平', '世界平和', '세계평화', 2),
+('和', '世界平和', '세계평화', 3),
+('世', '世界的', '세계적', 0),
+('界', '世界的', '세계적', 1),
+('的', '世界的', '세계적', 2),
+('世', '世界觀', '세계관', 0),
+('界', '世界觀', '세계관', 1),
+('觀', '世界觀', '세계관', 2),
+('世', '世界記錄', '세계기록', 0),
+('界', '世界記錄', '세계기록', 1),
+('記', '世界記錄', '세계기록', 2),
+('錄', '世界記錄', '세계기록', 3),
+('世', '世界語', '세계어', 0),
+('界', '世界語', '세계어', 1),
+('語', '世界語', '세계어', 2),
+('世', '世相', '세상', 0),
+('相', '世相', '세상', 1),
+('世', '世紀', '세기', 0),
+('紀', '世紀', '세기', 1),
+('世', '世襲', '세습', 0),
+('襲', '世襲', '세습', 1),
+('世', '世襲巫', '세습무', 0),
+('襲', '世襲巫', '세습무', 1),
+('巫', '世襲巫', '세습무', 2),
+('世', '世評', '세평', 0),
+('評', '世評', '세평', 1),
+('世', '世變', '세변', 0),
+('變', '世變', '세변', 1),
+('世', '世間', '세간', 0),
+('間', '世間', '세간', 1),
+('丘', '丘陵', '구릉', 0),
+('陵', '丘陵', '구릉', 1),
+('丙', '丙', '병', 0),
+('丙', '丙午', '병오', 0),
+('午', '丙午', '병오', 1),
+('丙', '丙子', '병자', 0),
+('子', '丙子', '병자', 1),
+('丙', '丙寅', '병인', 0),
+('寅', '丙寅', '병인', 1),
+('丙', '丙戌', '병술', 0),
+('戌', '丙戌', '병술', 1),
+('丙', '丙申', '병신', 0),
+('申', '丙申', '병신', 1),
+('丙', '丙辰', '병진', 0),
+('辰', '丙辰', '병진', 1),
+('丞', '丞相', '승상', 0),
+('相', '丞相', '승상', 1),
+('中', '中', '중', 0),
+('中', '中世', '중세', 0),
+('世', '中世', '중세', 1),
+('中', '中世 韓國語', '중세 한국어', 0),
+('世', '中世 韓國語', '중세 한국어', 1),
+('韓', '中世 韓國語', '중세 한국어', 3),
+('國', '中世 韓國語', '중세 한국어', 4),
+('語', '中世 韓國語', '중세 한국어', 5),
+('中', '中世國語', '중세국어', 0),
+('世', '中世國語', '중세국어', 1),
+('國', '中世國語', '중세국어', 2),
+('語', '中世國語', '중세국어', 3),
+('中', '中人', '중인', 0),
+('人', '中人', '중인', 1),
+('中', '中傷', '중상', 0),
+('傷', '中傷', '중상', 1),
+('中', '中共', '중공', 0),
+('共', '中共', '중공', 1),
+('中', '中古', '중고', 0),
+('古', '中古', '중고', 1),
+('中', '中古 漢語', '중고 한어', 0),
+('古', '中古 漢語', '중고 한어', 1),
+('漢', '中古 漢語', '중고 한어', 3),
+('語', '中古 漢語', '중고 한어', 4),
+('中', '中古品', '중고품', 0),
+('古', '中古品', '중고품', 1),
+('品', '中古品', '중고품', 2),
+('中', '中古車', '중고차', 0),
+('古', '中古車', '중고차', 1),
+('車', '中古車', '중고차', 2),
+('中', '中和', '중화', 0),
+('和', '中和', '중화', 1),
+('中', '中國', '중국', 0),
+('國', '中國', '중국', 1),
+('中', '中國', '즁국', 0),
+('國', '中國', '즁국', 1),
+('中', '中國人', '중국인', 0),
+('國', '中國人', '중국인', 1),
+('人', '中國人', '중국인', 2),
+('中', '中國共産黨', '중국공산당', 0),
+('國', '中國共産黨', '중국공산당', 1),
+('共', '中國共産黨', '중국공산당', 2),
+('産', '中國共産黨', '중국공산당', 3),
+('黨', '中國共産黨', '중국공산당', 4),
+('中', '中國化', '중국화', 0),
+('國', '中國化', '중국화', 1),
+('化', '中國化', '중국화', 2),
+('中', '中國學', '중국학', 0),
+('國', '中國學', '중국학', 1),
+('學', '中國學', '중국학', 2),
+('中', '中國語', '중국어', 0),
+('國', '中國語', '중국어', 1),
+('語', '中國語', '중국어', 2),
+('中', '中國말', '중국말', 0),
+('國', '中國말', '중국말', 1),
+('말', '中國말', '중국말', 2),
+('中', '中國사람', '즁국사람', 0),
+('國', '中國사람', '즁국사람', 1),
+('사', '中國사람', '즁국사람', 2),
+('람', '中國사람', '즁국사람', 3),
+('中', '中堅', '중견', 0),
+('堅', '中堅', '중견', 1),
+('中', '中堅手', '중견수', 0),
+('堅', '中堅手', '중견수', 1),
+('手', '中堅手', '중견수', 2),
+('中', '中士', '중사', 0),
+('士', '中士', '중사', 1),
+('中', '中大白鷺', '중대백로', 0),
+('大', '中大白鷺', '중대백로', 1),
+('白', '中大白鷺', '중대백로', 2),
+('鷺', '中大白鷺', '중대백로', 3),
+('中', '中天', '중천', 0),
+('天', '中天', '중천', 1),
+('中', '中央', '중앙', 0),
+('央', '中央', '중앙', 1),
+('中', '中媒', '중매', 0),
+('媒', '中媒', '중매', 1),
+('中', '中子', '중자', 0),
+('子', '中子', '중자', 1),
+('中', '中字', '중자', 0),
+('字', '中字', '중자', 1),
+('中', '中學', '중학', 0),
+('學', '中學', '중학', 1),
+('中', '中學校', '중학교', 0),
+('學', '中學校', '중학교', 1),
+('校', '中學校', '중학교', 2),
+('中', '中學生', '중학생', 0),
+('學', '中學生', '중학생', 1),
+('生', '中學生', '중학생', 2),
+('中', '中宮', '중궁', 0),
+('宮', '中宮', '중궁', 1),
+('中', '中將', '중장', 0),
+('將', '中將', '중장', 1),
+('中', '中尉', '중위', 0),
+('尉', '中尉', '중위', 1),
+('中', '中小企業', '중소기업', 0),
+('小', '中小企業', '중소기업', 1),
+('企', '中小企業', '중소기업', 2),
+('業', '中小企業', '중소기업', 3),
+('中', '中年', '중년', 0),
+('年', '中年', '중년', 1),
+('中', '中庭', '중정', 0),
+('庭', '中庭', '중정', 1),
+('中', '中庸', '중용', 0),
+('庸', '中庸', '중용', 1),
+('中', '中心', '중심', 0),
+('心', '中心', '중심', 1),
+('中', '中心地', '중심지', 0),
+('心', '中心地', '중심지', 1),
+('地', '中心地', '중심지', 2),
+('中', '中性', '중성', 0),
+('性', '中性', '중성', 1),
+('中', '中性子', '중성자', 0),
+('性', '中性子', '중성자', 1),
+('子', '中性子', '중성자', 2),
+('中', '中情', '중정', 0),
+('情', '中情', '중정', 1),
+('中', '中指', '중지', 0),
+('指', '中指', '중지', 1),
+('中', '中文', '중문', 0),
+('文', '中文', '중문', 1),
+('中', '中斷', '중단', 0),
+('斷', '中斷', '중단', 1),
+('中', '中旬', '중순', 0),
+('旬', '中旬', '중순', 1),
+('中', '中有', '중유', 0),
+('有', '中有', '중유', 1),
+('中', '中期', '중기', 0),
+('期', '中期', '중기', 1),
+('中', '中東呼吸器症候群', '중동호흡기증후군', 0),
+('東', '中東呼吸器症候群', '중동호흡기증후군', 1),
+('呼', '中東呼吸器症候群', '중동호흡기증후군', 2),
+('吸', '中東呼吸器症候群', '중동호흡기증후군', 3),
+('器', '中東呼吸器症候群', '중동호흡기증후군', 4),
+('症', '中東呼吸器症候群', '중동호흡기증후군', 5),
+('候', '中東呼吸器症候群', '중동호흡기증후군', 6),
+('群', '中東呼吸器症候群', '중동호흡기증후군', 7),
+('中', '中止', '중지', 0),
+('止', '中止', '중지', 1),
+('中', '中正', '중정', 0),
+('正', '中正', '중정', 1),
+('中', '中毒', '중독', 0),
+('毒', '中毒', '중독', 1),
+('中', '中毒者', '중독자', 0),
+('毒', '中毒者', '중독자', 1),
+('者', '中毒者', '중독자', 2),
+('中', '中波', '중파', 0),
+('波', '中波', '중파', 1),
+('中', '中溫動物', '중온동물', 0),
+('溫', '中溫動物', '중온동물', 1),
+('動', '中溫動物', '중온동물', 2),
+('物', '中溫動物', '중온동물', 3),
+('中', '中生代', '중생대', 0),
+('生', '中生代', '중생대', 1),
+('代', '中生代', '중생대', 2),
+('中', '中産層', '중산층', 0),
+('産', '中産層', '중산층', 1),
+('層', '中産層', '중산층', 2),
+('中', '中白鷺', '중백로', 0),
+('白', '中白鷺', '중백로', 1),
+('鷺', '中白鷺', '중백로', 2),
+('中', '中盤', '중반', 0),
+('盤', '中盤', '중반', 1),
+('中', '中秋', '중추', 0),
+('秋', '中秋', '중추', 1),
+('中', '中秋節', '중추절', 0),
+('秋', '中秋節', '중추절', 1),
+('節', '中秋節', '중추절', 2),
+('中', '中立', '중립', 0),
+('立', '中立', '중립', 1),
+('中', '中等', '중등', 0),
+('等', '中等', '중등', 1),
+('中', '中等敎育', '중등교육', 0),
+('等', '中等敎育', '중등교육', 1),
+('敎', '中等敎育', '중등교육', 2),
+('育', '中等敎育', '중등교육', 3),
+('中', '中篇', '중편', 0),
+('篇', '中篇', '중편', 1),
+('中', '中篇小說', '중편소설', 0),
+('篇', '中篇小說', '중편소설', 1),
+('小', '中篇小說', '중편소설', 2),
+('說', '中篇小說', '중편소설', 3),
+('中', '中米', '중미', 0),
+('米', '中米', '중미', 1),
+('中', '中絶', '중절', 0),
+('絶', '中絶', '중절', 1),
+('中', '中繼', '중계', 0),
+('繼', '中繼', '중계', 1),
+('中', '中繼放送', '중계방송', 0),
+('繼', '中繼放送', '중계방송', 1),
+('放', '中繼放送', '중계방송', 2),
+('送', '中繼放送', '중계방송', 3),
+('中', '中耳', '중이', 0),
+('耳', '中耳', '중이', 1),
+('中', '中聲', '중성', 0),
+('聲', '中聲', '중성', 1),
+('中', '中肢', '중지', 0),
+('肢', '中肢', '중지', 1),
+('中', '中腦', '중뇌', 0),
+('腦', '中腦', '중뇌', 1),
+('中', '中興', '중흥', 0),
+('興', '中興', '중흥', 1),
+('中', '中華', '중화', 0),
+('華', '中華', '중화', 1),
+('中', '中華民國', '중화민국', 0),
+('華', '中華民國', '중화민국', 1),
+('民', '中華民國', '중화민국', 2),
+('國', '中華民國', '중화민국', 3),
+('中', '中退', '중퇴', 0),
+('退', '中退', '중퇴', 1),
+('中', '中途', '중도', 0),
+('途', '中途', '중도', 1),
+('中', '中道', '중도', 0),
+('道', '中道', '중도', 1),
+('中', '中道主義', '중도주의', 0),
+('道', '中道主義', '중도주의', 1),
+('主', '中道主義', '중도주의', 2),
+('義', '中道主義', '중도주의', 3),
+('中', '中部', '중부', 0),
+('部', '中部', '중부', 1),
+('中', '中醫學', '중의학', 0),
+('醫', '中醫學', '중의학', 1),
+('學', '中醫學', '중의학', 2),
+('中', '中間', '중간', 0),
+('間', '中間', '중간', 1),
+('中', '中間子', '중간자', 0),
+('間', '中間子', '중간자', 1),
+('子', '中間子', '중간자', 2),
+('中', '中隊', '중대', 0),
+('隊', '中隊', '중대', 1),
+('中', '中領', '중령', 0),
+('領', '中領', '중령', 1),
+('中', '中風', '중풍', 0),
+('風', '中風', '중풍', 1),
+('中', '中食', '중식', 0),
+('食', '中食', '중식', 1),
+('中', '中點', '중점', 0),
+('點', '中點', '중점', 1),
+('串', '串', '곶', 0),
+('丸', '丸木弓', '환목궁', 0),
+('木', '丸木弓', '환목궁', 1),
+('弓', '丸木弓', '환목궁', 2),
+('丸', '丸藥', '환약', 0),
+('藥', '丸藥', '환약', 1),
+('丸', '丸都', '환도', 0),
+('都', '丸都', '환도', 1),
+('丹', '丹楓', '단풍', 0),
+('楓', '丹楓', '단풍', 1),
+('丹', '丹楓國', '단풍국', 0),
+('楓', '丹楓國', '단풍국', 1),
+('國', '丹楓國', '단풍국', 2),
+('丹', '丹毒', '단독', 0),
+('毒', '丹毒', '단독', 1),
+('丹', '丹脣', '단순', 0),
+('脣', '丹脣', '단순', 1),
+('丹', '丹靑', '단청', 0),
+('靑', '丹靑', '단청', 1),
+('丹', '丹青', '단청', 0),
+('青', '丹青', '단청', 1),
+('主', '主', '주', 0),
+('主', '主-', '주로', 0),
+('-', '主-', '주로', 1),
+('主', '主人', '주인', 0),
+('人', '主人', '주인', 1),
+('主', '主人公', '주인공', 0),
+('人', '主人公', '주인공', 1),
+('公', '主人公', '주인공', 2),
+('主', '主刑', '주형', 0),
+('刑', '主刑', '주형', 1),
+('主', '主力', '주력', 0),
+('力', '主力', '주력', 1),
+('主', '主唱', '주창', 0),
+('唱', '主唱', '주창', 1),
+('主', '主婦', '주부', 0),
+('婦', '主婦', '주부', 1),
+('主', '主客', '주객', 0),
+('客', '主客', '주객', 1),
+('主', '主將', '주장', 0),
+('將', '主將', '주장', 1),
+('主', '主導', '주도', 0),
+('導', '主導', '주도', 1),
+('主', '主席', '주석', 0),
+('席', '主席', '주석', 1),
+('主', '主張', '주장', 0),
+('張', '主張', '주장', 1),
+('主', '主役', '주역', 0),
+('役', '主役', '주역', 1),
+('主', '主意', '주의', 0),
+('意', '主意', '주의', 1),
+('主', '主掌', '주장', 0),
+('掌', '主掌', '주장', 1),
+('主', '主敎', '주교', 0),
+('敎', '主敎', '주교', 1),
+('主', '主敎冠', '주교관', 0),
+('敎', '主敎冠', '주교관', 1),
+('冠', '主敎冠', '주교관', 2),
+('主', '主日', '주일', 0),
+('日', '主日', '주일', 1),
+('主', '主旨', '주지', 0),
+('旨', '主旨', '주지', 1),
+('主', '主格', '주격', 0),
+('格', '主格', '주격', 1),
+('主', '主權', '주권', 0),
+('權', '主權', '주권', 1),
+('主', '主權在民', '주권재민', 0),
+('權', '主權在民', '주권재민', 1),
+('在', '主權在民', '주권재민', 2),
+('民', '主權在民', '주권재민', 3),
+('主', '主演', '주연', 0),
+('演', '主演', '주연', 1),
+('主', '主父', '주부', 0),
+('父', '主父', '주부', 1),
+('主', '主犯', '주범', 0),
+('犯', '主犯', '주범', 1),
+('主', '主節', '주절', 0),
+('節', '主節', '주절', 1),
+('主', '主義', '주의', 0),
+('義', '主義', '주의', 1),
+('主', '主色', '주색', 0),
+('色', '主色', '주색', 1),
+('主', '主要', '주요', 0),
+('要', '主要', '주요', 1),
+('主', '主觀', '주관', 0),
+('觀', '主觀', '주관', 1),
+('主', '主觀的', '주관적', 0),
+('觀', '主觀的', '주관적', 1),
+('的', '主觀的', '주관적', 2),
+('主', '主語', '주어', 0),
+('語', '主語', '주어', 1),
+('主', '主謀者', '주모자', 0),
+('謀', '主謀者', '주모자', 1),
+('者', '主謀者', '주모자', 2),
+('主', '主部', '주부', 0),
+('部', '主部', '주부', 1),
+('主', '主題', '주제', 0),
+('題', '主題', '주제', 1),
+('主', '主題曲', '주제곡', 0),
+('題', '主題曲', '주제곡', 1),
+('曲', '主題曲', '주제곡', 2),
+('主', '主題歌', '주제가', 0),
+('題', '主題歌', '주제가', 1),
+('歌', '主題歌', '주제가', 2),
+('主', '主食', '주식', 0),
+('食', '主食', '주식', 1),
+('主', '主體', '주체', 0),
+('體', '主體', '주체', 1),
+('主', '主體思想', '주체사상', 0),
+('體', '主體思想', '주체사상', 1),
+('思', '主體思想', '주체사상', 2),
+('想', '主體思想', '주체사상', 3),
+('乃', '乃至', '내지', 0),
+('至', '乃至', '내지', 1),
+('乖', '乖離', '괴리', 0),
+('離', '乖離', '괴리', 1),
+('乘', '乘務員', '승무원', 0),
+('務', '乘務員', '승무원', 1),
+('員', '乘務員', '승무원', 2),
+('乘', '乘合車', '승합차', 0),
+('合', '乘合車', '승합차', 1),
+('車', '乘合車', '승합차', 2),
+('乘', '乘客', '승객', 0),
+('客', '乘客', '승객', 1),
+('乘', '乘數', '승수', 0),
+('數', '乘數', '승수', 1),
+('乘', '乘法', '승법', 0),
+('法', '乘法', '승법', 1),
+('乘', '乘用車', '승용차', 0),
+('用', '乘用車', '승용차', 1),
+('車', '乘用車', '승용차', 2),
+('乘', '乘車券', '승차권', 0),
+('車', '乘車券', '승차권', 1),
+('券', '乘車券', '승차권', 2),
+('乘', '乘隙', '승극', 0),
+('隙', '乘隙', '승극', 1),
+('乘', '乘馬', '승마', 0),
+('馬', '乘馬', '승마', 1),
+('乙', '乙', '을', 0),
+('乙', '乙丑', '을축', 0),
+('丑', '乙丑', '을축', 1),
+('乙', '乙亥', '을해', 0),
+('亥', '乙亥', '을해', 1),
+('乙', '乙亥字', '을해자', 0),
+('亥', '乙亥字', '을해자', 1),
+('字', '乙亥字', '을해자', 2),
+('乙', '乙卯', '을묘', 0),
+('卯', '乙卯', '을묘', 1),
+('乙', '乙巳', '을사', 0),
+('巳', '乙巳', '을사', 1),
+('乙', '乙未', '을미', 0),
+('未', '乙未', '을미', 1),
+('乙', '乙酉', '을유', 0),
+('酉', '乙酉', '을유', 1),
+('九', '九', '구', 0),
+('九', '九十', '구십', 0),
+('十', '九十', '구십', 1),
+('九', '九宮', '구궁', 0),
+('宮', '九宮', '구궁', 1),
+('九', '九尾狐', '구미호', 0),
+('尾', '九尾狐', '구미호', 1),
+('狐', '九尾狐', '구미호', 2),
+('九', '九山八海', '구산팔해', 0),
+('山', '九山八海', '구산팔해', 1),
+('八', '九山八海', '구산팔해', 2),
+('海', '九山八海', '구산팔해', 3),
+('九', '九月', '9월', 0),
+('月', '九月', '9월', 1),
+('九', '九月', '구월', 0),
+('月', '九月', '구월', 1),
+('九', '九節坂', '구절판', 0),
+('節', '九節坂', '구절판', 1),
+('坂', '九節坂', '구절판', 2),
+('九', '九角形', '구각형', 0),
+('角', '九角形', '구각형', 1),
+('形', '九角形', '구각형', 2),
+('九', '九雲夢', '구운몽', 0),
+('雲', '九雲夢', '구운몽', 1),
+('夢', '九雲夢', '구운몽', 2),
+('乞', '乞丐', '걸개', 0),
+('丐', '乞丐', '걸개', 1),
+('乞', '乞人', '걸인', 0),
+('人', '乞人', '걸인', 1),
+('乞', '乞神', '걸신', 0),
+('神', '乞神', '걸신', 1),
+('乞', '乞食', '걸식', 0),
+('食', '乞食', '걸식', 1),
+('乳', '乳兒', '유아', 0),
+('兒', '乳兒', '유아', 1),
+('乳', '乳劑', '유제', 0),
+('劑', '乳劑', '유제', 1),
+('乳', '乳名', '유명', 0),
+('名', '乳名', '유명', 1),
+('乳', '乳房', '유방', 0),
+('房', '乳房', '유방', 1),
+('乳', '乳房成形', '유방성형', 0),
+('房', '乳房成形', '유방성형', 1),
+('成', '乳房成形', '유방성형', 2),
+('形', '乳房成形', '유방성형', 3),
+('乳', '乳房癌', '유방암', 0),
+('房', '乳房癌', '유방암', 1),
+('癌', '乳房癌', '유방암', 2),
+('乳', '乳母', '유모', 0),
+('母', '乳母', '유모', 1),
+('乳', '乳母車', '유모차', 0),
+('母', '乳母車', '유모차', 1),
+('車', '乳母車', '유모차', 2),
+('乳', '乳汁', '유즙', 0),
+('汁', '乳汁', '유즙', 1),
+('乳', '乳淸', '유청', 0),
+('淸', '乳淸', '유청', 1),
+('乳', '乳癌', '유암', 0),
+('癌', '乳癌', '유암', 1),
+('乳', '乳白色', '유백색', 0),
+('白', '乳白色', '유백색', 1),
+('色', '乳白色', '유백색', 2),
+('乳', '乳糖', '유당', 0),
+('糖', '乳糖', '유당', 1),
+('乳', '乳腺', '유선', 0),
+('腺', '乳腺', '유선', 1),
+('乳', '乳蓄器', '유축기', 0),
+('蓄', '乳蓄器', '유축기', 1),
+('器', '乳蓄器', '유축기', 2),
+('乳', '乳製品', '유제품', 0),
+('製', '乳製品', '유제품', 1),
+('品', '乳製品', '유제품', 2),
+('乳', '乳輪', '유륜', 0),
+('輪', '乳輪', '유륜', 1),
+('乳', '乳酸', '유산', 0),
+('酸', '乳酸', '유산', 1),
+('乳', '乳酸菌', '유산균', 0),
+('酸', '乳酸菌', '유산균', 1),
+('菌', '乳酸菌', '유산균', 2),
+('乳', '乳頭', '유두', 0),
+('頭', '乳頭', '유두', 1),
+('乳', '乳香', '유향', 0),
+('香', '乳香', '유향', 1),
+('乳', '乳齒', '유치', 0),
+('齒', '乳齒', '유치', 1),
+('乾', '乾坤', '건곤', 0),
+('坤', '乾坤', '건곤', 1),
+('乾', '乾季', '건계', 0),
+('季', '乾季', '건계', 1),
+('乾', '乾杯', '건배', 0),
+('杯', '乾杯', '건배', 1),
+('乾', '乾板', '건판', 0),
+('板', '乾板', '건판', 1),
+('乾', '乾果', '건과', 0),
+('果', '乾果', '건과', 1),
+('乾', '乾溜', '건류', 0),
+('溜', '乾溜', '건류', 1),
+('乾', '乾燥', '건조', 0),
+('燥', '乾燥', '건조', 1),
+('乾', '乾燥機', '건조기', 0),
+('燥', '乾燥機', '건조기', 1),
+('機', '乾燥機', '건조기', 2),
+('乾', '乾田', '건전', 0),
+('田', '乾田', '건전', 1),
+('乾', '乾畓', '건답', 0),
+('畓', '乾畓', '건답', 1),
+('乾', '乾癬', '건선', 0),
+('癬', '乾癬', '건선', 1),
+('乾', '乾船渠', '건선거', 0),
+('船', '乾船渠', '건선거', 1),
+('渠', '乾船渠', '건선거', 2),
+('乾', '乾草', '건초', 0),
+('草', '乾草', '건초', 1),
+('乾', '乾葡萄', '건포도', 0),
+('葡', '乾葡萄', '건포도', 1),
+('萄', '乾葡萄', '건포도', 2),
+('乾', '乾薑', '건강', 0),
+('薑', '乾薑', '건강', 1),
+('乾', '乾道', '건도', 0),
+('道', '乾道', '건도', 1),
+('乾', '乾達', '건달', 0),
+('達', '乾達', '건달', 1),
+('乾', '乾酪', '간락', 0),
+('酪', '乾酪', '간락', 1),
+('乾', '乾酪', '건락', 0),
+('酪', '乾酪', '건락', 1),
+('乾', '乾酪素', '건락소', 0),
+('酪', '乾酪素', '건락소', 1),
+('素', '乾酪素', '건락소', 2),
+('乾', '乾電池', '건전지', 0),
+('電', '乾電池', '건전지', 1),
+('池', '乾電池', '건전지', 2),
+('乾', '乾髮機', '건발기', 0),
+('髮', '乾髮機', '건발기', 1),
+('機', '乾髮機', '건발기', 2),
+('亂', '亂交', '난교', 0),
+('交', '亂交', '난교', 1),
+('亂', '亂入者', '난입자', 0),
+('入', '亂入者', '난입자', 1),
+('者', '亂入者', '난입자', 2),
+('亂', '亂數', '난수', 0),
+('數', '亂數', '난수', 1),
+('亂', '亂暴者', '난폭자', 0),
+('暴', '亂暴者', '난폭자', 1),
+('者', '亂暴者', '난폭자', 2),
+('亂', '亂氣流', '난기류', 0),
+('氣', '亂氣流', '난기류', 1),
+('流', '亂氣流', '난기류', 2),
+('亂', '亂理', '난리', 0),
+('理', '亂理', '난리', 1),
+('亂', '亂舞', '난무', 0),
+('舞', '亂舞', '난무', 1),
+('亂', '亂視', '난시', 0),
+('視', '亂視', '난시', 1),
+('亂', '亂視', '란시', 0),
+('視', '亂視', '란시', 1),
+('亂', '亂雜', '난잡', 0),
+('雜', '亂雜', '난잡', 1),
+('亂', '亂離', '난리', 0),
+('離', '亂離', '난리', 1),
+('了', '了義', '요의', 0),
+('義', '了義', '요의', 1),
+('了', '了解', '요해', 0),
+('解', '了解', '요해', 1),
+('事', '事件', '사건', 0),
+('件', '事件', '사건', 1),
+('事', '事件의  地平', '사건의 지평선', 0),
+('件', '事件의  地平', '사건의 지평선', 1),
+('의', '事件의  地平', '사건의 지평선', 2),
+('地', '事件의  地平', '사건의 지평선', 5),
+('平', '事件의  地平', '사건의 지평선', 6),
+('事', '事例', '사례', 0),
+('例', '事例', '사례', 1),
+('事', '事典', '사전', 0),
+('典', '事典', '사전', 1),
+('事', '事前', '사전', 0),
+('前', '事前', '사전', 1),
+('事', '事務', '사무', 0),
+('務', '事務', '사무', 1),
+('事', '事務員', '사무원', 0),
+('務', '事務員', '사무원', 1),
+('員', '事務員', '사무원', 2),
+('事', '事務室', '사무실', 0),
+('務', '事務室', '사무실', 1),
+('室', '事務室', '사무실', 2),
+('事', '事務所', '사무소', 0),
+('務', '事務所', '사무소', 1),
+('所', '事務所', '사무소', 2),
+('事', '事務職', '사무직', 0),
+('務', '事務職', '사무직', 1),
+('職', '事務職', '사무직', 2),
+('事', '事務職員', '사무직원', 0),
+('務', '事務職員', '사무직원', 1),
+('職', '事務職員', '사무직원', 2),
+('員', '事務職員', '사무직원', 3),
+('事', '事大', '사대', 0),
+('大', '事大', '사대', 1),
+('事', '事大主義', '사대주의', 0),
+('大', '事大主義', '사대주의', 1),
+('主', '事大主義', '사대주의', 2),
+('義', '事大主義', '사대주의', 3),
+('事', '事實', '사실', 0),
+('實', '事實', '사실', 1),
+('事', '事實上', '사실상', 0),
+('實', '事實上', '사실상', 1),
+('上', '事實上', '사실상', 2),
+('事', '事實無根', '사실무근', 0),
+('實', '事實無根', '사실무근', 1),
+('無', '事實無根', '사실무근', 2),
+('根', '事實無根', '사실무근', 3),
+('事', '事後', '사후', 0),
+('後', '事後', '사후', 1),
+('事', '事必歸正', '사필귀정', 0),
+('必', '事必歸正', '사필귀정', 1),
+('歸', '事必歸正', '사필귀정', 2),
+('正', '事必歸正', '사필귀정', 3),
+('事', '事情', '사정', 0),
+('情', '事情', '사정', 1),
+('事', '事態', '사태', 0),
+('態', '事態', '사태', 1),
+('事', '事故', '사고', 0),
+('故', '事故', '사고', 1),
+('事', '事案', '사안', 0),
+('案', '事案', '사안', 1),
+('事', '事業', '사업', 0),
+('業', '事業', '사업', 1),
+('事', '事業主', '사업주', 0),
+('業', '事業主', '사업주', 1),
+('主', '事業主', '사업주', 2),
+('事', '事業家', '사업가', 0),
+('業', '事業家', '사업가', 1),
+('家', '事業家', '사업가', 2),
+('事', '事業者', '사업자', 0),
+('業', '事業者', '사업자', 1),
+('者', '事業者', '사업자', 2),
+('事', '事物', '사물', 0),
+('物', '事物', '사물', 1),
+('事', '事理', '사리', 0),
+('理', '事理', '사리', 1),
+('事', '事由', '사유', 0),
+('由', '事由', '사유', 1),
+('事', '事績', '사적', 0),
+('績', '事績', '사적', 1),
+('事', '事項', '사항', 0),
+('項', '事項', '사항', 1),
+('二', '二', '이', 0),
+('二', '二三', '이삼', 0),
+('三', '二三', '이삼', 1),
+('二', '二人稱', '이인칭', 0),
+('人', '二人稱', '이인칭', 1),
+('稱', '二人稱', '이인칭', 2),
+('二', '二代男', '이대남', 0),
+('代', '二代男', '이대남', 1),
+('男', '二代男', '이대남', 2),
+('二', '二元論', '이원론', 0),
+('元', '二元論', '이원론', 1),
+('論', '二元論', '이원론', 2),
+('二', '二八', '이팔', 0),
+('八', '二八', '이팔', 1),
+('二', '二八靑春', '이팔청춘', 0),
+('八', '二八靑春', '이팔청춘', 1),
+('靑', '二八靑春', '이팔청춘', 2),
+('春', '二八靑春', '이팔청춘', 3),
+('二', '二十', '이십', 0),
+('十', '二十', '이십', 1),
+('二', '二壘', '2루', 0),
+('壘', '二壘', '2루', 1),
+('二', '二壘', '이루', 0),
+('壘', '二壘', '이루', 1),
+('二', '二壘手', '2루수', 0),
+('壘', '二壘手', '2루수', 1),
+('手', '二壘手', '2루수', 2),
+('二', '二壘手', '이루수', 0),
+('壘', '二壘手', '이루수', 1),
+('手', '二壘手', '이루수', 2),
+('二', '二心', '이심', 0),
+('心', '二心', '이심', 1),
+('二', '二月', '2월', 0),
+('月', '二月', '2월', 1),
+('二', '二月', '이월', 0),
+('月', '二月', '이월', 1),
+('二', '二望', '이망', 0),
+('望', '二望', '이망', 1),
+('二', '二次元', '이차원', 0),
+('次', '二次元', '이차원', 1),
+('元', '二次元', '이차원', 2),
+('二', '二次方程式', '이차방정식', 0),
+('次', '二次方程式', '이차방정식', 1),
+('方', '二次方程式', '이차방정식', 2),
+('程', '二次方程式', '이차방정식', 3),
+('式', '二次方程式', '이차방정식', 4),
+('二', '二祖', '이조', 0),
+('祖', '二祖', '이조', 1),
+('二', '二等兵', '이등병', 0),
+('等', '二等兵', '이등병', 1),
+('兵', '二等兵', '이등병', 2),
+('二', '二衆', '이중', 0),
+('衆', '二衆', '이중', 1),
+('二', '二進數', '이진수', 0),
+('進', '二進數', '이진수', 1),
+('數', '二進數', '이진수', 2),
+('二', '二進法', '이진법', 0),
+('進', '二進法', '이진법', 1),
+('法', '二進法', '이진법', 2),
+('二', '二酸化炭素', '이산화탄소', 0),
+('酸', '二酸化炭素', '이산화탄소', 1),
+('化', '二酸化炭素', '이산화탄소', 2),
+('炭', '二酸化炭素', '이산화탄소', 3),
+('素', '二酸化炭素', '이산화탄소', 4),
+('二', '二酸化物', '이산화물', 0),
+('酸', '二酸化物', '이산화물', 1),
+('化', '二酸化物', '이산화물', 2),
+('物', '二酸化物', '이산화물', 3),
+('二', '二重', '이중', 0),
+('重', '二重', '이중', 1),
+('二', '二重母音', '이중모음', 0),
+('重', '二重母音', '이중모음', 1),
+('母', '二重母音', '이중모음', 2),
+('音', '二重母音', '이중모음', 3),
+('二', '二頭筋', '이두근', 0),
+('頭', '二頭筋', '이두근', 1),
+('筋', '二頭筋', '이두근', 2),
+('于', '于先', '우선', 0),
+('先', '于先', '우선', 1),
+('互', '互換性', '호환성', 0),
+('換', '互換性', '호환성', 1),
+('性', '互換性', '호환성', 2),
+('互', '互角', '호각', 0),
+('角', '互角', '호각', 1),
+('五', '五', '오', 0),
+('五', '五倫', '오륜', 0),
+('倫', '五倫', '오륜', 1),
+('五', '五六月', '오뉴월', 0),
+('六', '五六月', '오뉴월', 1),
+('月', '五六月', '오뉴월', 2),
+('五', '五列', '오열', 0),
+('列', '五列', '오열', 1),
+('五', '五十', '오십', 0),
+('十', '五十', '오십', 1),
+('五', '五味子', '오미자', 0),
+('味', '五味子', '오미자', 1),
+('子', '五味子', '오미자', 2),
+('五', '五大洋', '오대양', 0),
+('大', '五大洋', '오대양', 1),
+('洋', '五大洋', '오대양', 2),
+('五', '五大湖', '오대호', 0),
+('大', '五大湖', '오대호', 1),
+('湖', '五大湖', '오대호', 2),
+('五', '五寸', '오촌', 0),
+('寸', '五寸', '오촌', 1),
+('五', '五感', '오감', 0),
+('感', '五感', '오감', 1),
+('五', '五戒', '오계', 0),
+('戒', '五戒', '오계', 1),
+('五', '五方', '오방', 0),
+('方', '五方', '오방', 1),
+('五', '五月', '5월', 0),
+('月', '五月', '5월', 1),
+('五', '五月', '오월', 0),
+('月', '五月', '오월', 1),
+('五', '五樂', '오락', 0),
+('樂', '五樂', '오락', 1),
+('五', '五欲', '오욕', 0),
+('欲', '五欲', '오욕', 1),
+('五', '五爵', '오작', 0),
+('爵', '五爵', '오작', 1),
+('五', '五種樂', '오종락', 0),
+('種', '五種樂', '오종락', 1),
+('樂', '五種樂', '오종락', 2),
+('五', '五穀', '오곡', 0),
+('穀', '五穀', '오곡', 1),
+('五', '五穀밥', '오곡밥', 0),
+('穀', '五穀밥', '오곡밥', 1),
+('밥', '五穀밥', '오곡밥', 2),
+('五', '五胡', '오호', 0),
+('胡', '五胡', '오호', 1),
+('五', '五臟六腑', '오장육부', 0),
+('臟', '五臟六腑', '오장육부', 1),
+('六', '五臟六腑', '오장육부', 2),
+('腑', '五臟六腑', '오장육부', 3),
+('五', '五色', '오색', 0),
+('色', '五色', '오색', 1),
+('五', '五色雜‒', '오색잡놈', 0),
+('色', '五色雜‒', '오색잡놈', 1),
+('雜', '五色雜‒', '오색잡놈', 2),
+('‒', '五色雜‒', '오색잡놈', 3),
+('五', '五蘊', '오온', 0),
+('蘊', '五蘊', '오온', 1),
+('五', '五行', '오행', 0),
+('行', '五行', '오행', 1),
+('五', '五角形', '오각형', 0),
+('角', '五角形', '오각형', 1),
+('形', '五角形', '오각형', 2),
+('五', '五輪', '오륜', 0),
+('輪', '五輪', '오륜', 1),
+('五', '五里霧中', '오리무중', 0),
+('里', '五里霧中', '오리무중', 1),
+('霧', '五里霧中', '오리무중', 2),
+('中', '五里霧中', '오리무중', 3),
+('五', '五音', '오음', 0),
+('音', '五音', '오음', 1),
+('井', '井宿', '정수', 0),
+('宿', '井宿', '정수', 1),
+('井', '井陘', '정형', 0),
+('陘', '井陘', '정형', 1),
+('些', '些少', '사소', 0),
+('少', '些少', '사소', 1),
+('亞', '亞大陸', '아대륙', 0),
+('大', '亞大陸', '아대륙', 1),
+('陸', '亞大陸', '아대륙', 2),
+('亞', '亞寒帶', '아한대', 0),
+('寒', '亞寒帶', '아한대', 1),
+('帶', '亞寒帶', '아한대', 2),
+('亞', '亞流', '아류', 0),
+('流', '亞流', '아류', 1),
+('亞', '亞熱帶林', '아열대림', 0),
+('熱', '亞熱帶林', '아열대림', 1),
+('帶', '亞熱帶林', '아열대림', 2),
+('林', '亞熱帶林', '아열대림', 3),
+('亞', '亞燐酸', '아인산', 0),
+('燐', '亞燐酸', '아인산', 1),
+('酸', '亞燐酸', '아인산', 2),
+('亞', '亞界', '아계', 0),
+('界', '亞界', '아계', 1),
+('亞', '亞科', '아과', 0),
+('科', '亞科', '아과', 1),
+('亞', '亞種', '아종', 0),
+('種', '亞種', '아종', 1),
+('亞', '亞細亞', '아세아', 0),
+('細', '亞細亞', '아세아', 1),
+('亞', '亞細亞', '아세아', 2),
+('亞', '亞綱', '아강', 0),
+('綱', '亞綱', '아강', 1),
+('亞', '亞鉛', '아연', 0),
+('鉛', '亞鉛', '아연', 1),
+('亞', '亞鉛鐵', '아연철', 0),
+('鉛', '亞鉛鐵', '아연철', 1),
+('鐵', '亞鉛鐵', '아연철', 2),
+('亞', '亞音速', '아음속', 0),
+('音', '亞音速', '아음속', 1),
+('速', '亞音速', '아음속', 2),
+('亞', '亞麻', '아마', 0),
+('麻', '亞麻', '아마', 1),
+('亡', '亡', '망', 0),
+('亡', '亡命', '망명', 0),
+('命', '亡命', '망명', 1),
+('亡', '亡命者', '망명자', 0),
+('命', '亡命者', '망명자', 1),
+('者', '亡命者', '망명자', 2),
+('亡', '亡國', '망국', 0),
+('國', '亡國', '망국', 1),
+('亡', '亡身', '망신', 0),
+('身', '亡身', '망신', 1),
+('亡', '亡靈', '망령', 0),
+('靈', '亡靈', '망령', 1),
+('交', '交互', '교호', 0),
+('互', '交互', '교호', 1),
+('交', '交付', '교부', 0),
+('付', '交付', '교부', 1),
+('交', '交付者', '교부자', 0),
+('付', '交付者', '교부자', 1),
+('者', '交付者', '교부자', 2),
+('交', '交代', '교대', 0),
+('代', '交代', '교대', 1),
+('交', '交叉', '교차', 0),
+('叉', '交叉', '교차', 1),
+('交', '交叉路', '교차로', 0),
+('叉', '交叉路', '교차로', 1),
+('路', '交叉路', '교차로', 2),
+('交', '交叉點', '교차점', 0),
+('叉', '交叉點', '교차점', 1),
+('點', '交叉點', '교차점', 2),
+('交', '交友', '교우', 0),
+('友', '交友', '교우', 1),
+('交', '交尾', '교미', 0),
+('尾', '交尾', '교미', 1),
+('交', '交差位', '교차위', 0),
+('差', '交差位', '교차위', 1),
+('位', '交差位', '교차위', 2),
+('交', '交戰', '교전', 0),
+('戰', '交戰', '교전', 1),
+('交', '交接', '교접', 0),
+('接', '交接', '교접', 1),
+('交', '交換', '교환', 0),
+('換', '交換', '교환', 1),
+('交', '交換臺', '교환대', 0),
+('換', '交換臺', '교환대', 1),
+('臺', '交換臺', '교환대', 2),
+('交', '交易', '교역', 0),
+('易', '交易', '교역', 1),
+('交', '交替', '교체', 0),
+('替', '交替', '교체', 1),
+('交', '交椅', '교의', 0),
+('椅', '交椅', '교의', 1),
+('交', '交款', '교관', 0),
+('款', '交款', '교관', 1),
+('交', '交歡', '교환', 0),
+('歡', '交歡', '교환', 1),
+('交', '交流', '교류', 0),
+('流', '交流', '교류', 1),
+('交', '交涉', '교섭', 0),
+('涉', '交涉', '교섭', 1),
+('交', '交通', '교통', 0),
+('通', '交通', '교통', 1),
+('交', '交通事故', '교통사고', 0),
+('通', '交通事故', '교통사고', 1),
+('事', '交通事故', '교통사고', 2),
+('故', '交通事故', '교통사고', 3),
+('交', '交通料金', '교통요금', 0),
+('通', '交通料金', '교통요금', 1),
+('料', '交通料金', '교통요금', 2),
+('金', '交通料金', '교통요금', 3),
+('交', '交通標識', '교통표지', 0),
+('通', '交通標識', '교통표지', 1),
+('標', '交通標識', '교통표지', 2),
+('識', '交通標識', '교통표지', 3),
+('交', '交配', '교배', 0),
+('配', '交配', '교배', 1),
+('交', '交錯', '교착', 0),
+('錯', '交錯', '교착', 1),
+('交', '交際', '교제', 0),
+('際', '交際', '교제', 1),
+('交', '交響曲', '교향곡', 0),
+('響', '交響曲', '교향곡', 1),
+('曲', '交響曲', '교향곡', 2),
+('交', '交驩', '교환', 0),
+('驩', '交驩', '교환', 1),
+('交', '交點', '교점', 0),
+('點', '交點', '교점', 1),
+('亦', '亦是', '역시', 0),
+('是', '亦是', '역시', 1),
+('享', '享年', '향년', 0),
+('年', '享年', '향년', 1),
+('享', '享樂', '향락', 0),
+('樂', '享樂', '향락', 1),
+('享', '享樂業所', '향락업소', 0),
+('樂', '享樂業所', '향락업소', 1),
+('業', '享樂業所', '향락업소', 2),
+('所', '享樂業所', '향락업소', 3),
+('享', '享樂産業', '향락산업', 0),
+('樂', '享樂産業', '향락산업', 1),
+('産', '享樂産業', '향락산업', 2),
+('業', '享樂産業', '향락산업', 3),
+('京', '京城', '경성', 0),
+('城', '京城', '경성', 1),
+('京', '京畿', '경기', 0),
+('畿', '京畿', '경기', 1),
+('京', '京畿忠清道方言', '경기충청도방언', 0),
+('畿', '京畿忠清道方言', '경기충청도방언', 1),
+('忠', '京畿忠清道方言', '경기충청도방언', 2),
+('清', '京畿忠清道方言', '경기충청도방언', 3),
+('道', '京畿忠清道方言', '경기충청도방언', 4),
+('方', '京畿忠清道方言', '경기충청도방언', 5),
+('言', '京畿忠清道方言', '경기충청도방언', 6),
+('京', '京畿道', '경기도', 0),
+('畿', '京畿道', '경기도', 1),
+('道', '京畿道', '경기도', 2),
+('京', '京華', '경화', 0),
+('華', '京華', '경화', 1),
+('人', '人', '인', 0),
+('人', '人世', '인세', 0),
+('世', '人世', '인세', 1),
+('人', '人中', '인중', 0),
+('中', '人中', '인중', 1),
+('人', '人之常情', '인지상정', 0),
+('之', '人之常情', '인지상정', 1),
+('常', '人之常情', '인지상정', 2),
+('情', '人之常情', '인지상정', 3),
+('人', '人事', '인사', 0),
+('事', '人事', '인사', 1),
+('人', '人事-', '인사말', 0),
+('事', '人事-', '인사말', 1),
+('-', '人事-', '인사말', 2),
+('人', '人事課', '인사과', 0),
+('事', '人事課', '인사과', 1),
+('課', '人事課', '인사과', 2),
+('人', '人件費', '인건비', 0),
+('件', '人件費', '인건비', 1),
+('費', '人件費', '인건비', 2),
+('人', '人倫', '인륜', 0),
+('倫', '人倫', '인륜', 1),
+('人', '人分', '인분', 0),
+('分', '人分', '인분', 1),
+('人', '人力', '인력', 0),
+('力', '人力', '인력', 1),
+('人', '人力車', '인력거', 0),
+('力', '人力車', '인력거', 1),
+('車', '人力車', '인력거', 2),
+('人', '人參', '인삼', 0),
+('參', '人參', '인삼', 1),
+('人', '人口', '인구', 0),
+('口', '人口', '인구', 1),
+('人', '人口學', '인구학', 0),
+('口', '人口學', '인구학', 1),
+('學', '人口學', '인구학', 2),
+('人', '人口調査', '인구조사', 0),
+('口', '人口調査', '인구조사', 1),
+('調', '人口調査', '인구조사', 2),
+('査', '人口調査', '인구조사', 3),
+('人', '人名', '인명', 0),
+('名', '人名', '인명', 1),
+('人', '人命', '인명', 0),
+('命', '人命', '인명', 1),
+('人', '人和', '인화', 0),
+('和', '人和', '인화', 1),
+('人', '人員', '인원', 0),
+('員', '人員', '인원', 1),
+('人', '人士', '인사', 0),
+('士', '人士', '인사', 1),
+('人', '人夫', '인부', 0),
+('夫', '人夫', '인부', 1),
+('人', '人家', '인가', 0),
+('家', '人家', '인가', 1),
+('人', '人山人海', '인산인해', 0),
+('山', '人山人海', '인산인해', 1),
+('人', '人山人海', '인산인해', 2),
+('海', '人山人海', '인산인해', 3),
+('人', '人工', '인공', 0),
+('工', '人工', '인공', 1),
+('人', '人工呼吸器', '인공호흡기', 0),
+('工', '人工呼吸器', '인공호흡기', 1),
+('呼', '人工呼吸器', '인공호흡기', 2),
+('吸', '人工呼吸器', '인공호흡기', 3),
+('器', '人工呼吸器', '인공호흡기', 4),
+('人', '人工知能', '인공지능', 0),
+('工', '人工知能', '인공지능', 1),
+('知', '人工知能', '인공지능', 2),
+('能', '人工知能', '인공지능', 3),
+('人', '人工衛星', '인공위성', 0),
+('工', '人工衛星', '인공위성', 1),
+('衛', '人工衛星', '인공위성', 2),
+('星', '人工衛星', '인공위성', 3),
+('人', '人工降雨', '인공강우', 0),
+('工', '人工降雨', '인공강우', 1),
+('降', '人工降雨', '인공강우', 2),
+('雨', '人工降雨', '인공강우', 3),
+('人', '人形', '인형', 0),
+('形', '人形', '인형', 1),
+('人', '人形劇', '인형극', 0),
+('形', '人形劇', '인형극', 1),
+('劇', '人形劇', '인형극', 2),
+('人', '人影', '인영', 0),
+('影', '人影', '인영', 1),
+('人', '人心', '인심', 0),
+('心', '人心', '인심', 1),
+('人', '人性', '인성', 0),
+('性', '人性', '인성', 1),
+('人', '人情', '인정', 0),
+('情', '人情', '인정', 1),
+('人', '人文', '인문', 0),
+('文', '人文', '인문', 1),
+('人', '人文學', '인문학', 0),
+('文', '人文學', '인문학', 1),
+('學', '人文學', '인문학', 2),
+('人', '人望', '인망', 0),
+('望', '人望', '인망', 1),
+('人', '人本主義', '인본주의', 0),
+('本', '人本主義', '인본주의', 1),
+('主', '人本主義', '인본주의', 2),
+('義', '人本主義', '인본주의', 3),
+('人', '人材', '인재', 0),
+('材', '人材', '인재', 1),
+('人', '人格', '인격', 0),
+('格', '人格', '인격', 1),
+('人', '人權', '인권', 0),
+('權', '人權', '인권', 1),
+('人', '人民', '인민', 0),
+('民', '人民', '인민', 1),
+('人', '人民學校', '인민학교', 0),
+('民', '人民學校', '인민학교', 1),
+('學', '人民學校', '인민학교', 2),
+('校', '人民學校', '인민학교', 3),
+('人', '人民幣', '인민폐', 0),
+('民', '人民幣', '인민폐', 1),
+('幣', '人民幣', '인민폐', 2),
+('人', '人氣', '인기', 0),
+('氣', '人氣', '인기', 1),
+('人', '人海戰術', '인해전술', 0),
+('海', '人海戰術', '인해전술', 1),
+('戰', '人海戰術', '인해전술', 2),
+('術', '人海戰術', '인해전술', 3),
+('人', '人物', '인물', 0),
+('物', '人物', '인물', 1),
+('人', '人物事典', '인물사전', 0),
+('物', '人物事典', '인물사전', 1),
+('事', '人物事典', '인물사전', 2),
+('典', '人物事典', '인물사전', 3),
+('人', '人生', '인생', 0),
+('生', '人生', '인생', 1),
+('人', '人生觀', '인생관', 0),
+('生', '人生觀', '인생관', 1),
+('觀', '人生觀', '인생관', 2),
+('人', '人的', '인적', 0),
+('的', '人的', '인적', 1),
+('人', '人相', '인상', 0),
+('相', '人相', '인상', 1),
+('人', '人種', '인종', 0),
+('種', '人種', '인종', 1),
+('人', '人種 差別', '인종 차별', 0),
+('種', '人種 差別', '인종 차별', 1),
+('差', '人種 差別', '인종 차별', 3),
+('別', '人種 差別', '인종 차별', 4),
+('人', '人種差別', '인종차별', 0),
+('種', '人種差別', '인종차별', 1),
+('差', '人種差別', '인종차별', 2),
+('別', '人種差別', '인종차별', 3),
+('人', '人種差別主義', '인종차별주의', 0),
+('種', '人種差別主義', '인종차별주의', 1),
+('差', '人種差別主義', '인종차별주의', 2),
+('別', '人種差別主義', '인종차별주의', 3),
+('主', '人種差別主義', '인종차별주의', 4),
+('義', '人種差別主義', '인종차별주의', 5),
+('人', '人種差別主義者', '인종차별주의자', 0),
+('種', '人種差別主義者', '인종차별주의자', 1),
+('差', '人種差別主義者', '인종차별주의자', 2),
+('別', '人種差別主義者', '인종차별주의자', 3),
+('主', '人種差別主義者', '인종차별주의자', 4),
+('義', '人種差別主義者', '인종차별주의자', 5),
+('者', '人種差別主義者', '인종차별주의자', 6),
+('人', '人稱', '인칭', 0),
+('稱', '人稱', '인칭', 1),
+('人', '人稱代名詞', '인칭대명사', 0),
+('稱', '人稱代名詞', '인칭대명사', 1),
+('代', '人稱代名詞', '인칭대명사', 2),
+('名', '人稱代名詞', '인칭대명사', 3),
+('詞', '人稱代名詞', '인칭대명사', 4),
+('人', '人蔘', '인삼', 0),
+('蔘', '人蔘', '인삼', 1),
+('人', '人蔘茶', '인삼차', 0),
+('蔘', '人蔘茶', '인삼차', 1),
+('茶', '人蔘茶', '인삼차', 2),
+('人', '人蔘茶', '인삼차', 0),
+('蔘', '人蔘茶', '인삼차', 1),
+('茶', '人蔘茶', '인삼차', 2),
+('人', '人質', '인질', 0),
+('質', '人質', '인질', 1),
+('人', '人質劇', '인질극', 0),
+('質', '人質劇', '인질극', 1),
+('劇', '人質劇', '인질극', 2),
+('人', '人跡', '인적', 0),
+('跡', '人跡', '인적', 1),
+('人', '人造', '인조', 0),
+('造', '人造', '인조', 1),
+('人', '人造人間', '인조인간', 0),
+('造', '人造人間', '인조인간', 1),
+('人', '人造人間', '인조인간', 2),
+('間', '人造人間', '인조인간', 3),
+('人', '人造毛皮', '인조모피', 0),
+('造', '人造毛皮', '인조모피', 1),
+('毛', '人造毛皮', '인조모피', 2),
+('皮', '人造毛皮', '인조모피', 3),
+('人', '人道', '인도', 0),
+('道', '人道', '인도', 1),
+('人', '人道主義', '인도주의', 0),
+('道', '人道主義', '인도주의', 1),
+('主', '人道主義', '인도주의', 2),
+('義', '人道主義', '인도주의', 3),
+('人', '人道的', '인도적', 0),
+('道', '人道的', '인도적', 1),
+('的', '人道的', '인도적', 2),
+('人', '人間', '인간', 0),
+('間', '人間', '인간', 1),
+('人', '人間  末', '인간 말종', 0),
+('間', '人間  末', '인간 말종', 1),
+('末', '人間  末', '인간 말종', 4),
+('人', '人間嫌惡', '인간혐오', 0),
+('間', '人間嫌惡', '인간혐오', 1),
+('嫌', '人間嫌惡', '인간혐오', 2),
+('惡', '人間嫌惡', '인간혐오', 3),
+('人', '人間性', '인간성', 0),
+('間', '人間性', '인간성', 1),
+('性', '人間性', '인간성', 2),
+('人', '人間關係', '인간관계', 0),
+('間', '人間關係', '인간관계', 1),
+('關', '人間關係', '인간관계', 2),
+('係', '人間關係', '인간관계', 3),
+('人', '人類', '인류', 0),
+('類', '人類', '인류', 1),
+('人', '人類學', '인류학', 0),
+('類', '人類學', '인류학', 1),
+('學', '人類學', '인류학', 2),
+('人', '人體', '인체', 0),
+('體', '人體', '인체', 1),
+('人', '人魚', '인어', 0),
+('魚', '人魚', '인어', 1),
+('人', '人의  帳', '인의 장막', 0),
+('의', '人의  帳', '인의 장막', 1),
+('帳', '人의  帳', '인의 장막', 4),
+('人', '人의  障', '인의 장벽', 0),
+('의', '人의  障', '인의 장벽', 1),
+('障', '人의  障', '인의 장벽', 4),
+('仁', '仁', '인', 0),
+('仁', '仁宗', '인종', 0),
+('宗', '仁宗', '인종', 1),
+('仁', '仁川', '인천', 0),
+('川', '仁川', '인천', 1),
+('仁', '仁川空港', '인천공항', 0),
+('川', '仁川空港', '인천공항', 1),
+('空', '仁川空港', '인천공항', 2),
+('港', '仁川空港', '인천공항', 3),
+('仁', '仁慈', '인자', 0),
+('慈', '仁慈', '인자', 1),
+('仁', '仁政', '인정', 0),
+('政', '仁政', '인정', 1),
+('仇', '仇敵', '구적', 0),
+('敵', '仇敵', '구적', 1),
+('今', '今世', '금세', 0),
+('世', '今世', '금세', 1),
+('今', '今始初聞', '금시초문', 0),
+('始', '今始初聞', '금시초문', 1),
+('初', '今始初聞', '금시초문', 2),
+('聞', '今始初聞', '금시초문', 3),
+('今', '今年', '금년', 0),
+('年', '今年', '금년', 1),
+('今', '今後', '금후', 0),
+('後', '今後', '금후', 1),
+('今', '今方', '금방', 0),
+('方', '今方', '금방', 1),
+('今', '今日', '금일', 0),
+('日', '今日', '금일', 1),
+('今', '今月', '금월', 0),
+('月', '今月', '금월', 1),
+('今', '今朝', '금조', 0),
+('朝', '今朝', '금조', 1),
+('今', '今歲', '금세', 0),
+('歲', '今歲', '금세', 1),
+('今', '今番', '금번', 0),
+('番', '今番', '금번', 1),
+('今', '今週', '금주', 0),
+('週', '今週', '금주', 1),
+('介', '介入', '개입', 0),
+('入', '介入', '개입', 1),
+('介', '介冑', '개주', 0),
+('冑', '介冑', '개주', 1),
+('仔', '仔細', '자세', 0),
+('細', '仔細', '자세', 1),
+('仔', '仔詳', '자상', 0),
+('詳', '仔詳', '자상', 1),
+('仕', '仕樣', '사양', 0),
+('樣', '仕樣', '사양', 1),
+('他', '他', '타', 0),
+('他', '他人', '타인', 0),
+('人', '他人', '타인', 1),
+('他', '他來', '타래', 0),
+('來', '他來', '타래', 1),
+('他', '他力本願', '타력본원', 0),
+('力', '他力本願', '타력본원', 1),
+('本', '他力本願', '타력본원', 2),
+('願', '他力本願', '타력본원', 3),
+('他', '他動詞', '타동사', 0),
+('動', '他動詞', '타동사', 1),
+('詞', '他動詞', '타동사', 2),
+('他', '他山之石', '타산지석', 0),
+('山', '他山之石', '타산지석', 1),
+('之', '他山之石', '타산지석', 2),
+('石', '他山之石', '타산지석', 3),
+('他', '他律', '타율', 0),
+('律', '他律', '타율', 1),
+('他', '他殺', '타살', 0),
+('殺', '他殺', '타살', 1),
+('他', '他者', '타자', 0),
+('者', '他者', '타자', 1),
+('他', '他黨', '타당', 0),
+('黨', '他黨', '타당', 1),
+('付', '付託', '부탁', 0),
+('託', '付託', '부탁', 1),
+('仙', '仙人掌', '선인장', 0),
+('人', '仙人掌', '선인장', 1),
+('掌', '仙人掌', '선인장', 2),
+('仙', '仙境', '선경', 0),
+('境', '仙境', '선경', 1),
+('仙', '仙女', '선녀', 0),
+('女', '仙女', '선녀', 1),
+('仙', '仙寰', '선환', 0),
+('寰', '仙寰', '선환', 1),
+('仙', '仙男', '선남', 0),
+('男', '仙男', '선남', 1),
+('代', '代', '대', 0),
+('代', '代代', '대대', 0),
+('代', '代代', '대대', 1),
+('代', '代作者', '대작자', 0),
+('作', '代作者', '대작자', 1),
+('者', '代作者', '대작자', 2),
+('代', '代價', '대가', 0),
+('價', '代價', '대가', 1),
+('代', '代入', '대입', 0),
+('入', '代入', '대입', 1),
+('代', '代名詞', '대명사', 0),
+('名', '代名詞', '대명사', 1),
+('詞', '代名詞', '대명사', 2),
+('代', '代打', '대타', 0),
+('打', '代打', '대타', 1),
+('代', '代打者', '대타자', 0),
+('打', '代打者', '대타자', 1),
+('者', '代打者', '대타자', 2),
+('代', '代數', '대수', 0),
+('數', '代數', '대수', 1),
+('代', '代數學', '대수학', 0),
+('數', '代數學', '대수학', 1),
+('學', '代數學', '대수학', 2),
+('代', '代替', '대체', 0),
+('替', '代替', '대체', 1),
+('代', '代替乳', '대체유', 0),
+('替', '代替乳', '대체유', 1),
+('乳', '代替乳', '대체유', 2),
+('代', '代替肉', '대체육', 0),
+('替', '代替肉', '대체육', 1),
+('肉', '代替肉', '대체육', 2),
+('代', '代替醫學', '대체의학', 0),
+('替', '代替醫學', '대체의학', 1),
+('醫', '代替醫學', '대체의학', 2),
+('學', '代替醫學', '대체의학', 3),
+('代', '代案右派', '대안우파', 0),
+('案', '代案右派', '대안우파', 1),
+('右', '代案右派', '대안우파', 2),
+('派', '代案右派', '대안우파', 3),
+('代', '代母', '대모', 0),
+('母', '代母', '대모', 1),
+('代', '代父', '대부', 0),
+('父', '代父', '대부', 1),
+('代', '代理', '대리', 0),
+('理', '代理', '대리', 1),
+('代', '代理人', '대리인', 0),
+('理', '代理人', '대리인', 1),
+('人', '代理人', '대리인', 2),
+('代', '代理店', '대리점', 0),
+('理', '代理店', '대리점', 1),
+('店', '代理店', '대리점', 2),
+('代', '代理者', '대리자', 0),
+('理', '代理者', '대리자', 1),
+('者', '代理者', '대리자', 2),
+('代', '代用', '대용', 0),
+('用', '代用', '대용', 1),
+('代', '代表', '대표', 0),
+('表', '代表', '대표', 1),
+('代', '代表團', '대표단', 0),
+('表', '代表團', '대표단', 1),
+('團', '代表團', '대표단', 2),
+('代', '代表的', '대표적', 0),
+('表', '代表的', '대표적', 1),
+('的', '代表的', '대표적', 2),
+('代', '代表者', '대표자', 0),
+('表', '代表者', '대표자', 1),
+('者', '代表者', '대표자', 2),
+('代', '代表訓', '대표훈', 0),
+('表', '代表訓', '대표훈', 1),
+('訓', '代表訓', '대표훈', 2),
+('代', '代謝', '대사', 0),
+('謝', '代謝', '대사', 1),
+('代', '代走者', '대주자', 0),
+('走', '代走者', '대주자', 1),
+('者', '代走者', '대주자', 2),
+('代', '代身', '대신', 0),
+('身', '代身', '대신', 1),
+('代', '代辯', '대변', 0),
+('辯', '代辯', '대변', 1),
+('代', '代辯者', '대변자', 0),
+('辯', '代辯者', '대변자', 1),
+('者', '代辯者', '대변자', 2),
+('代', '代金', '대금', 0),
+('金', '代金', '대금', 1),
+('令', '令夫人', '영부인', 0),
+('夫', '令夫人', '영부인', 1),
+('人', '令夫人', '영부인', 2),
+('令', '令愛', '영애', 0),
+('愛', '令愛', '영애', 1),
+('令', '令狀', '영장', 0),
+('狀', '令狀', '영장', 1),
+('令', '令監', '영감', 0),
+('監', '令監', '영감', 1),
+('令', '令閨', '령규', 0),
+('閨', '令閨', '령규', 1),
+('令', '令閨', '영규', 0),
+('閨', '令閨', '영규', 1),
+('以', '以上', '이상', 0),
+('上', '以上', '이상', 1),
+('以', '以下', '이하', 0),
+('下', '以下', '이하', 1),
+('以', '以來', '이래', 0),
+('來', '以來', '이래', 1),
+('以', '以內', '이내', 0),
+('內', '以內', '이내', 1),
+('以', '以前', '이전', 0),
+('前', '以前', '이전', 1),
+('以', '以北', '이북', 0),
+('北', '以北', '이북', 1),
+('以', '以北五道', '이북5도', 0),
+('北', '以北五道', '이북5도', 1),
+('五', '以北五道', '이북5도', 2),
+('道', '以北五道', '이북5도', 3),
+('以', '以北五道', '이북오도', 0),
+('北', '以北五道', '이북오도', 1),
+('五', '以北五道', '이북오도', 2),
+('道', '以北五道', '이북오도', 3),
+('以', '以外', '이외', 0),
+('外', '以外', '이외', 1),
+('以', '以影補來', '이영보래', 0),
+('影', '以影補來', '이영보래', 1),
+('補', '以影補來', '이영보래', 2),
+('來', '以影補來', '이영보래', 3),
+('以', '以後', '이후', 0),
+('後', '以後', '이후', 1),
+('以', '以心傳心', '이심전심', 0),
+('心', '以心傳心', '이심전심', 1),
+('傳', '以心傳心', '이심전심', 2),
+('心', '以心傳心', '이심전심', 3),
+('以', '以民爲天', '이민위천', 0),
+('民', '以民爲天', '이민위천', 1),
+('爲', '以民爲天', '이민위천', 2),
+('天', '以民爲天', '이민위천', 3),
+('以', '以西', '이서', 0),
+('西', '以西', '이서', 1),
+('以', '以降', '이강', 0),
+('降', '以降', '이강', 1),
+('仲', '仲介', '중개', 0),
+('介', '仲介', '중개', 1),
+('仲', '仲介人', '중개인', 0),
+('介', '仲介人', '중개인', 1),
+('人', '仲介人', '중개인', 2),
+('仲', '仲媒', '중매', 0),
+('媒', '仲媒', '중매', 1),
+('仲', '仲媒人', '중매인', 0),
+('媒', '仲媒人', '중매인', 1),
+('人', '仲媒人', '중매인', 2),
+('仲', '仲裁', '중재', 0),
+('裁', '仲裁', '중재', 1),
+('仲', '仲裁人', '중재인', 0),
+('裁', '仲裁人', '중재인', 1),
+('人', '仲裁人', '중재인', 2),
+('仲', '仲裁者', '중재자', 0),
+('裁', '仲裁者', '중재자', 1),
+('者', '仲裁者', '중재자', 2),
+('仲', '仲買人', '중매인', 0),
+('買', '仲買人', '중매인', 1),
+('人', '仲買人', '중매인', 2),
+('件', '件', '건', 0),
+('价', '价川', '개천', 0),
+('川', '价川', '개천', 1),
+('任', '任', '임', 0),
+('任', '任務', '임무', 0),
+('務', '任務', '임무', 1),
+('任', '任命', '임명', 0),
+('命', '任命', '임명', 1),
+('任', '任官', '임관', 0),
+('官', '任官', '임관', 1),
+('任', '任期', '임기', 0),
+('期', '任期', '임기', 1),
+('企', '企劃', '기획', 0),
+('劃', '企劃', '기획', 1),
+('企', '企圖', '기도', 0),
+('圖', '企圖', '기도', 1),
+('企', '企業', '기업', 0),
+('業', '企業', '기업', 1),
+('企', '企業人', '기업인', 0),
+('業', '企業人', '기업인', 1),
+('人', '企業人', '기업인', 2),
+('企', '企業家', '기업가', 0),
+('業', '企業家', '기업가', 1),
+('家', '企業家', '기업가', 2),
+('伊', '伊', '이', 0),
+('伊', '伊太利', '이태리', 0),
+('太', '伊太利', '이태리', 1),
+('利', '伊太利', '이태리', 2),
+('伍', '伍', '오', 0),
+('伍', '伍와  ', '오와 열', 0),
+('와', '伍와  ', '오와 열', 1),
+('伏', '伏兵', '복병', 0),
+('兵', '伏兵', '복병', 1),
+('伏', '伏線', '복선', 0),
+('線', '伏線', '복선', 1),
+('伏', '伏羲', '복희', 0),
+('羲', '伏羲', '복희', 1),
+('伏', '伏魔殿', '복마전', 0),
+('魔', '伏魔殿', '복마전', 1),
+('殿', '伏魔殿', '복마전', 2),
+('伏', '伏날', '복날', 0),
+('날', '伏날', '복날', 1),
+('伐', '伐期', '벌기', 0),
+('期', '伐期', '벌기', 1),
+('伐', '伐草', '벌초', 0),
+('草', '伐草', '벌초', 1),
+('休', '休學', '휴학', 0),
+('學', '休學', '휴학', 1),
+('休', '休息', '휴식', 0),
+('息', '休息', '휴식', 1),
+('休', '休憩', '휴게', 0),
+('憩', '休憩', '휴게', 1),
+('休', '休憩室', '휴게실', 0),
+('憩', '休憩室', '휴게실', 1),
+('室', '休憩室', '휴게실', 2),
+('休', '休憩所', '휴게소', 0),
+('憩', '休憩所', '휴게소', 1),
+('所', '休憩所', '휴게소', 2),
+('休', '休戚', '휴척', 0),
+('戚', '休戚', '휴척', 1),
+('休', '休戰', '휴전', 0),
+('戰', '休戰', '휴전', 1),
+('休', '休日', '휴일', 0),
+('日', '休日', '휴일', 1),
+('休', '休暇', '휘가', 0),
+('暇', '休暇', '휘가', 1),
+('休', '休暇', '휴가', 0),
+('暇', '休暇', '휴가', 1),
+('休', '休會', '휴회', 0),
+('會', '休會', '휴회', 1),
+('休', '休業', '휴업', 0),
+('業', '休業', '휴업', 1),
+('休', '休止', '휴지', 0),
+('止', '休止', '휴지', 1),
+('休', '休眠', '휴면', 0),
+('眠', '休眠', '휴면', 1),
+('休', '休紙', '휴지', 0),
+('紙', '休紙', '휴지', 1),
+('休', '休紙桶', '휴지통', 0),
+('紙', '休紙桶', '휴지통', 1),
+('桶', '休紙桶', '휴지통', 2),
+('休', '休養', '휴양', 0),
+('養', '休養', '휴양', 1),
+('休', '休養地', '휴양지', 0),
+('養', '休養地', '휴양지', 1),
+('地', '休養地', '휴양지', 2),
+('伯', '伯母', '백모', 0),
+('母', '伯母', '백모', 1),
+('伯', '伯爵', '백작', 0),
+('爵', '伯爵', '백작', 1),
+('伯', '伯父', '백부', 0),
+('父', '伯父', '백부', 1),
+('伯', '伯理璽天德', '백리새천덕', 0),
+('理', '伯理璽天德', '백리새천덕', 1),
+('璽', '伯理璽天德', '백리새천덕', 2),
+('天', '伯理璽天德', '백리새천덕', 3),
+('德', '伯理璽天德', '백리새천덕', 4),
+('伴', '伴侶', '반려', 0),
+('侶', '伴侶', '반려', 1),
+('伴', '伴侶動物', '반려동물', 0),
+('侶', '伴侶動物', '반려동물', 1),
+('動', '伴侶動物', '반려동물', 2),
+('物', '伴侶動物', '반려동물', 3),
+('伴', '伴侶犬', '반려견', 0),
+('侶', '伴侶犬', '반려견', 1),
+('犬', '伴侶犬', '반려견', 2),
+('伴', '伴侶猫', '반려묘', 0),
+('侶', '伴侶猫', '반려묘', 1),
+('猫', '伴侶猫', '반려묘', 2),
+('伴', '伴侶者', '반려자', 0),
+('侶', '伴侶者', '반려자', 1),
+('者', '伴侶者', '반려자', 2),
+('伴', '伴侶鳥', '반려조', 0),
+('侶', '伴侶鳥', '반려조', 1),
+('鳥', '伴侶鳥', '반려조', 2),
+('伴', '伴奏', '반주', 0),
+('奏', '伴奏', '반주', 1),
+('伸', '伸張', '신장', 0),
+('張', '伸張', '신장', 1),
+('伸', '伸縮', '신축', 0),
+('縮', '伸縮', '신축', 1),
+('伸', '伸縮性', '신축성', 0),
+('縮', '伸縮性', '신축성', 1),
+('性', '伸縮性', '신축성', 2),
+('伸', '伸長位', '신장위', 0),
+('長', '伸長位', '신장위', 1),
+('位', '伸長位', '신장위', 2),
+('伺', '伺候', '사후', 0),
+('候', '伺候', '사후', 1),
+('似', '似而非', '사이비', 0),
+('而', '似而非', '사이비', 1),
+('非', '似而非', '사이비', 2),
+('伽', '伽倻琴', '가야금', 0),
+('倻', '伽倻琴', '가야금', 1),
+('琴', '伽倻琴', '가야금', 2),
+('伽', '伽倻고', '가얏고', 0),
+('倻', '伽倻고', '가얏고', 1),
+('고', '伽倻고', '가얏고', 2),
+('伽', '伽藍', '가람', 0),
+('藍', '伽藍', '가람', 1),
+('但', '但只', '단지', 0),
+('只', '但只', '단지', 1),
+('但', '但書', '단서', 0),
+('書', '但書', '단서', 1),
+('佇', '佇立', '저립', 0),
+('立', '佇立', '저립', 1),
+('位', '位', '위', 0),
+('位', '位格', '위격', 0),
+('格', '位格', '위격', 1),
+('位', '位相數學', '위상수학', 0),
+('相', '位相數學', '위상수학', 1),
+('數', '位相數學', '위상수학', 2),
+('學', '位相數學', '위상수학', 3),
+('位', '位相空間', '위상공간', 0),
+('相', '位相空間', '위상공간', 1),
+('空', '位相空間', '위상공간', 2),
+('間', '位相空間', '위상공간', 3),
+('位', '位置', '위치', 0),
+('置', '位置', '위치', 1),
+('低', '低下', '저하', 0),
+('下', '低下', '저하', 1),
+('低', '低俗', '저속', 0),
+('俗', '低俗', '저속', 1),
+('低', '低價', '저가', 0),
+('價', '低價', '저가', 1),
+('低', '低出産', '저출산', 0),
+('出', '低出産', '저출산', 1),
+('産', '低出産', '저출산', 2),
+('低', '低利', '저리', 0),
+('利', '低利', '저리', 1),
+('低', '低地', '저지', 0),
+('地', '低地', '저지', 1),
+('低', '低廉', '저렴', 0),
+('廉', '低廉', '저렴', 1),
+('低', '低所得', '저소득', 0),
+('所', '低所得', '저소득', 1),
+('得', '低所得', '저소득', 2),
+('低', '低減', '저감', 0),
+('減', '低減', '저감', 1),
+('低', '低級', '저급', 0),
+('級', '低級', '저급', 1),
+('低', '低級 脂肪酸', '저급 지방산', 0),
+('級', '低級 脂肪酸', '저급 지방산', 1),
+('脂', '低級 脂肪酸', '저급 지방산', 3),
+('肪', '低級 脂肪酸', '저급 지방산', 4),
+('酸', '低級 脂肪酸', '저급 지방산', 5),
+('低', '低能', '저능', 0),
+('能', '低能', '저능', 1),
+('低', '低速', '저속', 0),
+('速', '低速', '저속', 1),
+('低', '低體溫', '저체온', 0),
+('體', '低體溫', '저체온', 1),
+('溫', '低體溫', '저체온', 2),
+('低', '低體溫症', '저체온증', 0),
+('體', '低體溫症', '저체온증', 1),
+('溫', '低體溫症', '저체온증', 2),
+('症', '低體溫症', '저체온증', 3),
+('住', '住宅', '주택', 0),
+('宅', '住宅', '주택', 1),
+('住', '住居', '주거', 0),
+('居', '住居', '주거', 1),
+('住', '住所', '주소', 0),
+('所', '住所', '주소', 1),
+('住', '住所窓', '주소창', 0),
+('所', '住所窓', '주소창', 1),
+('窓', '住所窓', '주소창', 2),
+('住', '住所錄', '주소록', 0),
+('所', '住所錄', '주소록', 1),
+('錄', '住所錄', '주소록', 2),
+('住', '住持', '주지', 0),
+('持', '住持', '주지', 1),
+('住', '住持', '지주', 0),
+('持', '住持', '지주', 1),
+('住', '住民', '주민', 0),
+('民', '住民', '주민', 1),
+('住', '住民登錄證', '주민등록증', 0),
+('民', '住民登錄證', '주민등록증', 1),
+('登', '住民登錄證', '주민등록증', 2),
+('錄', '住民登錄證', '주민등록증', 3),
+('證', '住民登錄證', '주민등록증', 4),
+('住', '住職', '주직', 0),
+('職', '住職', '주직', 1),
+('住', '住宅', '주택', 0),
+('宅', '住宅', '주택', 1),
+('何', '何如-', '하여튼', 0),
+('如', '何如-', '하여튼', 1),
+('-', '何如-', '하여튼', 2),
+('何', '何如間', '하여간', 0),
+('如', '何如間', '하여간', 1),
+('間', '何如間', '하여간', 2),
+('何', '何必', '하필', 0),
+('必', '何必', '하필', 1),
+('佛', '佛', '불', 0),
+('佛', '佛像', '불상', 0),
+('像', '佛像', '불상', 1),
+('佛', '佛性', '불성', 0),
+('性', '佛性', '불성', 1),
+('佛', '佛恩', '불은', 0),
+('恩', '佛恩', '불은', 1),
+('佛', '佛敎', '불교', 0),
+('敎', '佛敎', '불교', 1),
+('佛', '佛敎徒', '불교도', 0),
+('敎', '佛敎徒', '불교도', 1),
+('徒', '佛敎徒', '불교도', 2),
+('佛', '佛教', '불교', 0),
+('教', '佛教', '불교', 1),
+('佛', '佛法', '불법', 0),
+('法', '佛法', '불법', 1),
+('佛', '佛相', '불상', 0),
+('相', '佛相', '불상', 1),
+('佛', '佛經', '불경', 0),
+('經', '佛經', '불경', 1),
+('佛', '佛聖', '불성', 0),
+('聖', '佛聖', '불성', 1),
+('佛', '佛蘭西', '불란서', 0),
+('蘭', '佛蘭西', '불란서', 1),
+('西', '佛蘭西', '불란서', 2),
+('佛', '佛蘭西語', '불란서어', 0),
+('蘭', '佛蘭西語', '불란서어', 1),
+('西', '佛蘭西語', '불란서어', 2),
+('語', '佛蘭西語', '불란서어', 3),
+('佛', '佛語', '불어', 0),
+('語', '佛語', '불어', 1),
+('佛', '佛道', '불도', 0),
+('道', '佛道', '불도', 1),
+('佛', '佛陀', '불타', 0),
+('陀', '佛陀', '불타', 1),
+('作', '作中人物', '작중인물', 0),
+('中', '作中人物', '작중인물', 1),
+('人', '作中人物', '작중인물', 2),
+('物', '作中人物', '작중인물', 3),
+('作', '作別', '작별', 0),
+('別', '作別', '작별', 1),
+('作', '作動', '작동', 0),
+('動', '作動', '작동', 1),
+('作', '作品', '작품', 0),
+('品', '作品', '작품', 1),
+('作', '作品集', '작품집', 0),
+('品', '作品集', '작품집', 1),
+('集', '作品集', '작품집', 2),
+('作', '作家', '작가', 0),
+('家', '作家', '작가', 1),
+('作', '作心三日', '작심삼일', 0),
+('心', '作心三日', '작심삼일', 1),
+('三', '作心三日', '작심삼일', 2),
+('日', '作心三日', '작심삼일', 3),
+('作', '作成', '작성', 0),
+('成', '作成', '작성', 1),
+('作', '作戰', '작전', 0),
+('戰', '作戰', '작전', 1),
+('作', '作曲', '작곡', 0),
+('曲', '作曲', '작곡', 1),
+('作', '作曲家', '작곡가', 0),
+('曲', '作曲家', '작곡가', 1),
+('家', '作曲家', '작곡가', 2),
+('作', '作曲者', '작곡자', 0),
+('曲', '作曲者', '작곡자', 1),
+('者', '作曲者', '작곡자', 2),
+('作', '作業', '작업', 0),
+('業', '作業', '작업', 1),
+('作', '作業場', '작업장', 0),
+('業', '作業場', '작업장', 1),
+('場', '作業場', '작업장', 2),
+('作', '作業室', '작업실', 0),
+('業', '作業室', '작업실', 1),
+('室', '作業室', '작업실', 2),
+('作', '作業服', '작업복', 0),
+('業', '作業服', '작업복', 1),
+('服', '作業服', '작업복', 2),
+('作', '作業臺', '작업대', 0),
+('業', '作業臺', '작업대', 1),
+('臺', '作業臺', '작업대', 2),
+('作', '作物', '작물', 0),
+('物', '作物', '작물', 1),
+('作', '作用', '작용', 0),
+('用', '作用', '작용', 1),
+('作', '作者', '작자', 0),
+('者', '作者', '작자', 1),
+('作', '作詞', '작사', 0),
+('詞', '作詞', '작사', 1),
+('作', '作詞家', '작사가', 0),
+('詞', '作詞家', '작사가', 1),
+('家', '作詞家', '작사가', 2),
+('作', '作風', '작풍', 0),
+('風', '作風', '작풍', 1),
+('佾', '佾舞', '일무', 0),
+('舞', '佾舞', '일무', 1),
+('使', '使動詞', '사동사', 0),
+('動', '使動詞', '사동사', 1),
+('詞', '使動詞', '사동사', 2),
+('使', '使命', '사명', 0),
+('命', '使命', '사명', 1),
+('使', '使徒', '사도', 0),
+('徒', '使徒', '사도', 1),
+('使', '使徒行傳', '사도행전', 0),
+('徒', '使徒行傳', '사도행전', 1),
+('行', '使徒行傳', '사도행전', 2),
+('傳', '使徒行傳', '사도행전', 3),
+('使', '使用', '사용', 0),
+('用', '使用', '사용', 1),
+('使', '使用人', '사용인', 0),
+('用', '使用人', '사용인', 1),
+('人', '使用人', '사용인', 2),
+('使', '使用者', '사용자', 0),
+('用', '使用者', '사용자', 1),
+('者', '使用者', '사용자', 2),
+('使', '使節', '사절', 0),
+('節', '使節', '사절', 1),
+('使', '使者', '사자', 0),
+('者', '使者', '사자', 1),
+('來', '來世', '내세', 0),
+('世', '來世', '내세', 1),
+('來', '來年', '내년', 0),
+('年', '來年', '내년', 1),
+('來', '來後年', '내후년', 0),
+('後', '來後年', '내후년', 1),
+('年', '來後年', '내후년', 2),
+('來', '來日', '내일', 0),
+('日', '來日', '내일', 1),
+('來', '來日', '래일', 0),
+('日', '來日', '래일', 1),
+('來', '來月', '내월', 0),
+('月', '來月', '내월', 1),
+('來', '來襲', '내습', 0),
+('襲', '來襲', '내습', 1),
+('來', '來賓', '내빈', 0),
+('賓', '來賓', '내빈', 1),
+('來', '來賓', '래빈', 0),
+('賓', '來賓', '래빈', 1),
+('來', '來週', '내주', 0),
+('週', '來週', '내주', 1),
+('來', '來韓', '내한', 0),
+('韓', '來韓', '내한', 1),
+('來', '來駕', '내가', 0),
+('駕', '來駕', '내가', 1),
+('來', '來달', '내달', 0),
+('달', '來달', '내달', 1),
+('例', '例', '예', 0),
+('例', '例句', '예구', 0),
+('句', '例句', '예구', 1),
+('例', '例外', '예외', 0),
+('外', '例外', '예외', 1),
+('例', '例文', '예문', 0),
+('文', '例文', '예문', 1),
+('例', '例示', '예시', 0),
+('示', '例示', '예시', 1),
+('例', '例證', '예증', 0),
+('證', '例證', '예증', 1),
+('例', '例題', '예제', 0),
+('題', '例題', '예제', 1),
+('侍', '侍中', '시중', 0),
+('中', '侍中', '시중', 1),
+('侍', '侍從', '시종', 0),
+('從', '侍從', '시종', 1),
+('侍', '侍衛', '시위', 0),
+('衛', '侍衛', '시위', 1),
+('侏', '侏儒', '주유', 0),
+('儒', '侏儒', '주유', 1),
+('供', '供物', '공물', 0),
+('物', '供物', '공물', 1),
+('供', '供給', '공급', 0),
+('給', '供給', '공급', 1),
+('供', '供給者', '공급자', 0),
+('給', '供給者', '공급자', 1),
+('者', '供給者', '공급자', 2),
+('供', '供託者', '공탁자', 0),
+('託', '供託者', '공탁자', 1),
+('者', '供託者', '공탁자', 2),
+('供', '供養', '공양', 0),
+('養', '供養', '공양', 1),
+('依', '依', '의', 0),
+('依', '依存', '의존', 0),
+('存', '依存', '의존', 1),
+('依', '依存症', '의존증', 0),
+('存', '依存症', '의존증', 1),
+('症', '依存症', '의존증', 2),
+('依', '依據', '의거', 0),
+('據', '依據', '의거', 1),
+('依', '依支', '의지', 0),
+('支', '依支', '의지', 1),
+('依', '依託', '의탁', 0),
+('託', '依託', '의탁', 1),
+('依', '依賴', '의뢰', 0),
+('賴', '依賴', '의뢰', 1),
+('侮', '侮蔑', '모멸', 0),
+('蔑', '侮蔑', '모멸', 1),
+('侮', '侮視', '모시', 0),
+('視', '侮視', '모시', 1),
+('侮', '侮辱', '모욕', 0),
+('辱', '侮辱', '모욕', 1),
+('侯', '侯爵', '후작', 0),
+('爵', '侯爵', '후작', 1),
+('侵', '侵入', '침입', 0),
+('入', '侵入', '침입', 1),
+('侵', '侵入者', '침입자', 0),
+('入', '侵入者', '침입자', 1),
+('者', '侵入者', '침입자', 2),
+('侵', '侵害', '침해', 0),
+('害', '侵害', '침해', 1),
+('侵', '侵掠', '침략', 0),
+('掠', '侵掠', '침략', 1),
+('侵', '侵攻', '침공', 0),
+('攻', '侵攻', '침공', 1),
+('侵', '侵犯', '침범', 0),
+('犯', '侵犯', '침범', 1),
+('侵', '侵略', '침략', 0),
+('略', '侵略', '침략', 1),
+('侵', '侵略的', '침략적', 0),
+('略', '侵略的', '침략적', 1),
+('的', '侵略的', '침략적', 2),
+('侵', '侵略者', '침략자', 0),
+('略', '侵略者', '침략자', 1),
+('者', '侵略者', '침략자', 2),
+('便', '便', '편', 0),
+('便', '便乘', '편승', 0),
+('乘', '便乘', '편승', 1),
+('便', '便利', '편리', 0),
+('利', '便利', '편리', 1),
+('便', '便器', '변기', 0),
+('器', '便器', '변기', 1),
+('便', '便安', '편안', 0),
+('安', '便安', '편안', 1),
+('便', '便宜', '편의', 0),
+('宜', '便宜', '편의', 1),
+('便', '便宜店', '편의점', 0),
+('宜', '便宜店', '편의점', 1),
+('店', '便宜店', '편의점', 2),
+('便', '便所', '벤소', 0),
+('所', '便所', '벤소', 1),
+('便', '便所', '변소', 0),
+('所', '便所', '변소', 1),
+('便', '便法', '편법', 0),
+('法', '便法', '편법', 1),
+('便', '便益', '편익', 0),
+('益', '便益', '편익', 1),
+('便', '便祕', '변비', 0),
+('祕', '便祕', '변비', 1),
+('便', '便秘', '변비', 0),
+('秘', '便秘', '변비', 1),
+('便', '便紙', '편지', 0),
+('紙', '便紙', '편지', 1),
+('便', '便覽', '편람', 0),
+('覽', '便覽', '편람', 1),
+('係', '係數', '계수', 0),
+('數', '係數', '계수', 1),
+('促', '促進', '촉진', 0),
+('進', '促進', '촉진', 1),
+('俄', '俄羅斯', '아라사', 0),
+('羅', '俄羅斯', '아라사', 1),
+('斯', '俄羅斯', '아라사', 2),
+('俊', '俊秀', '준수', 0),
+('秀', '俊秀', '준수', 1),
+('俊', '俊逸', '준일', 0),
+('逸', '俊逸', '준일', 1),
+('俗', '俗', '속', 0),
+('俗', '俗世', '속세', 0),
+('世', '俗世', '속세', 1),
+('俗', '俗人', '속인', 0),
+('人', '俗人', '속인', 1),
+('俗', '俗名', '속명', 0),
+('名', '俗名', '속명', 1),
+('俗', '俗字', '속자', 0),
+('字', '俗字', '속자', 1),
+('俗', '俗惡', '속악', 0),
+('惡', '俗惡', '속악', 1),
+('俗', '俗稱', '속칭', 0),
+('稱', '俗稱', '속칭', 1),
+('俗', '俗見', '속견', 0),
+('見', '俗見', '속견', 1),
+('俗', '俗語', '속어', 0),
+('語', '俗語', '속어', 1),
+('俗', '俗談', '속담', 0),
+('談', '俗談', '속담', 1),
+('俗', '俗音', '속음', 0),
+('音', '俗音', '속음', 1),
+('保', '保健', '보건', 0),
+('健', '保健', '보건', 1),
+('保', '保健所', '보건소', 0),
+('健', '保健所', '보건소', 1),
+('所', '保健所', '보건소', 2),
+('保', '保全', '보전', 0),
+('全', '保全', '보전', 1),
+('保', '保姆', '보모', 0),
+('姆', '保姆', '보모', 1),
+('保', '保存', '보존', 0),
+('存', '保存', '보존', 1),
+('保', '保守', '보수', 0),
+('守', '保守', '보수', 1),
+('保', '保守主義', '보수주의', 0),
+('守', '保守主義', '보수주의', 1),
+('主', '保守主義', '보수주의', 2),
+('義', '保守主義', '보수주의', 3),
+('保', '保安', '보안', 0),
+('安', '保安', '보안', 1),
+('保', '保安司', '보안사', 0),
+('安', '保安司', '보안사', 1),
+('司', '保安司', '보안사', 2),
+('保', '保安官', '보안관', 0),
+('安', '保安官', '보안관', 1),
+('官', '保安官', '보안관', 2),
+('保', '保持', '보지', 0),
+('持', '保持', '보지', 1),
+('保', '保有', '보유', 0),
+('有', '保有', '보유', 1),
+('保', '保溫', '보온', 0),
+('溫', '保溫', '보온', 1),
+('保', '保溫甁', '보온병', 0),
+('溫', '保溫甁', '보온병', 1),
+('甁', '保溫甁', '보온병', 2),
+('保', '保溫裝置', '보온장치', 0),
+('溫', '保溫裝置', '보온장치', 1),
+('裝', '保溫裝置', '보온장치', 2),
+('置', '保溫裝置', '보온장치', 3),
+('保', '保溫밥桶', '보온밥통', 0),
+('溫', '保溫밥桶', '보온밥통', 1),
+('밥', '保溫밥桶', '보온밥통', 2),
+('桶', '保溫밥桶', '보온밥통', 3),
+('保', '保留', '보류', 0),
+('留', '保留', '보류', 1),
+('保', '保管', '보관', 0),
+('管', '保管', '보관', 1),
+('保', '保管人', '보관인', 0),
+('管', '保管人', '보관인', 1),
+('人', '保管人', '보관인', 2),
+('保', '保管所', '보관소', 0),
+('管', '保管所', '보관소', 1),
+('所', '保管所', '보관소', 2),
+('保', '保育', '보육', 0),
+('育', '保育', '보육', 1),
+('保', '保菌者', '보균자', 0),
+('菌', '保菌者', '보균자', 1),
+('者', '保菌者', '보균자', 2),
+('保', '保證', '보증', 0),
+('證', '保證', '보증', 1),
+('保', '保證人', '보증인', 0),
+('證', '保證人', '보증인', 1),
+('人', '保證人', '보증인', 2),
+('保', '保證書', '보증서', 0),
+('證', '保證書', '보증서', 1),
+('書', '保證書', '보증서', 2),
+('保', '保證金', '보증금', 0),
+('證', '保證金', '보증금', 1),
+('金', '保證金', '보증금', 2),
+('保', '保護', '보호', 0),
+('護', '保護', '보호', 1),
+('保', '保護主義', '보호주의', 0),
+('護', '保護主義', '보호주의', 1),
+('主', '保護主義', '보호주의', 2),
+('義', '保護主義', '보호주의', 3),
+('保', '保護司', '보호사', 0),
+('護', '保護司', '보호사', 1),
+('司', '保護司', '보호사', 2),
+('保', '保護者', '보호자', 0),
+('護', '保護者', '보호자', 1),
+('者', '保護者', '보호자', 2),
+('保', '保護貿易', '보호무역', 0),
+('護', '保護貿易', '보호무역', 1),
+('貿', '保護貿易', '보호무역', 2),
+('易', '保護貿易', '보호무역', 3),
+('保', '保釋', '보석', 0),
+('釋', '保釋', '보석', 1),
+('保', '保障', '보장', 0),
+('障', '保障', '보장', 1),
+('保', '保險', '보험', 0),
+('險', '保險', '보험', 1),
+('保', '保養湯', '보양탕', 0),
+('養', '保養湯', '보양탕', 1),
+('湯', '保養湯', '보양탕', 2),
+('信', '信', '신', 0),
+('信', '信仰', '신앙', 0),
+('仰', '信仰', '신앙', 1),
+('信', '信任', '신임', 0),
+('任', '信任', '신임', 1),
+('信', '信天翁', '신천옹', 0),
+('天', '信天翁', '신천옹', 1),
+('翁', '信天翁', '신천옹', 2),
+('信', '信徒', '신도', 0),
+('徒', '信徒', '신도', 1),
+('信', '信念', '신념', 0),
+('念', '信念', '신념', 1),
+('信', '信憑性', '신빙성', 0),
+('憑', '信憑性', '신빙성', 1),
+('性', '信憑性', '신빙성', 2),
+('信', '信條', '신조', 0),
+('條', '信條', '신조', 1),
+('信', '信用', '신용', 0),
+('用', '信用', '신용', 1),
+('信', '信用等級', '신용등급', 0),
+('用', '信用等級', '신용등급', 1),
+('等', '信用等級', '신용등급', 2),
+('級', '信用等級', '신용등급', 3),
+('信', '信管', '신관', 0),
+('管', '信管', '신관', 1),
+('信', '信義', '신의', 0),
+('義', '信義', '신의', 1),
+('信', '信者', '신자', 0),
+('者', '信者', '신자', 1),
+('信', '信號', '신호', 0),
+('號', '信號', '신호', 1),
+('信', '信號燈', '신호등', 0),
+('號', '信號燈', '신호등', 1),
+('燈', '信號燈', '신호등', 2),
+('信', '信號銃', '신호총', 0),
+('號', '信號銃', '신호총', 1),
+('銃', '信號銃', '신호총', 2),
+('信', '信託', '신탁', 0),
+('託', '信託', '신탁', 1),
+('信', '信託統治', '신탁통치', 0),
+('託', '信託統治', '신탁통치', 1),
+('統', '信託統治', '신탁통치', 2),
+('治', '信託統治', '신탁통치', 3),
+('信', '信賴', '신뢰', 0),
+('賴', '信賴', '신뢰', 1),
+('修', '修史', '수사', 0),
+('史', '修史', '수사', 1),
+('修', '修士', '수사', 0),
+('士', '修士', '수사', 1),
+('修', '修女', '수녀', 0),
+('女', '修女', '수녀', 1),
+('修', '修學', '수학', 0),
+('學', '修學', '수학', 1),
+('修', '修學旅行', '수학여행', 0),
+('學', '修學旅行', '수학여행', 1),
+('旅', '修學旅行', '수학여행', 2),
+('行', '修學旅行', '수학여행', 3),
+('修', '修整', '수정', 0),
+('整', '修整', '수정', 1),
+('修', '修業', '수업', 0),
+('業', '修業', '수업', 1),
+('修', '修正主義', '수정주의', 0),
+('正', '修正主義', '수정주의', 1),
+('主', '修正主義', '수정주의', 2),
+('義', '修正主義', '수정주의', 3),
+('修', '修正案', '수정안', 0),
+('正', '修正案', '수정안', 1),
+('案', '修正案', '수정안', 2),
+('修', '修理', '수리', 0),
+('理', '修理', '수리', 1),
+('修', '修理人', '수리인', 0),
+('理', '修理人', '수리인', 1),
+('人', '修理人', '수리인', 2),
+('修', '修理工', '수리공', 0),
+('理', '修理工', '수리공', 1),
+('工', '修理工', '수리공', 2),
+('修', '修繕', '수선', 0),
+('繕', '修繕', '수선', 1),
+('修', '修繕工', '수선공', 0),
+('繕', '修繕工', '수선공', 1),
+('工', '修繕工', '수선공', 2),
+('修', '修習', '수습', 0),
+('習', '修習', '수습', 1),
+('修', '修能', '수능', 0),
+('能', '修能', '수능', 1),
+('修', '修行', '수행', 0),
+('行', '修行', '수행', 1),
+('修', '修身', '수신', 0),
+('身', '修身', '수신', 1),
+('修', '修辭', '수사', 0),
+('辭', '修辭', '수사', 1),
+('修', '修辭學', '수사학', 0),
+('辭', '修辭學', '수사학', 1),
+('學', '修辭學', '수사학', 2),
+('修', '修辭法', '수사법', 0),
+('辭', '修辭法', '수사법', 1),
+('法', '修辭法', '수사법', 2),
+('修', '修道', '수도', 0),
+('道', '修道', '수도', 1),
+('修', '修道士', '수도사', 0),
+('道', '修道士', '수도사', 1),
+('士', '修道士', '수도사', 2),
+('修', '修道者', '수도자', 0),
+('道', '修道者', '수도자', 1),
+('者', '修道者', '수도자', 2),
+('修', '修道院', '수도원', 0),
+('道', '修道院', '수도원', 1),
+('院', '修道院', '수도원', 2),
+('修', '修鍊', '수련', 0),
+('鍊', '修鍊', '수련', 1),
+('修', '修飾', '수식', 0),
+('飾', '修飾', '수식', 1),
+('修', '修飾語', '수식어', 0),
+('飾', '修飾語', '수식어', 1),
+('語', '修飾語', '수식어', 2),
+('修', '修養', '수양', 0),
+('養', '修養', '수양', 1),
+('俯', '俯伏', '부복', 0),
+('伏', '俯伏', '부복', 1),
+('俱', '俱樂部', '구락부', 0),
+('樂', '俱樂部', '구락부', 1),
+('部', '俱樂部', '구락부', 2),
+('俳', '俳優', '배우', 0),
+('優', '俳優', '배우', 1),
+('俸', '俸給', '봉급', 0),
+('給', '俸給', '봉급', 1),
+('倂', '倂合', '병합', 0),
+('合', '倂合', '병합', 1),
+('倂', '倂殺', '병살', 0),
+('殺', '倂殺', '병살', 1),
+('倂', '倂殺打', '병살타', 0),
+('殺', '倂殺打', '병살타', 1),
+('打', '倂殺打', '병살타', 2),
+('倉', '倉庫', '창고', 0),
+('庫', '倉庫', '창고', 1),
+('倉', '倉皇', '창황', 0),
+('皇', '倉皇', '창황', 1),
+('個', '個', '개', 0),
+('個', '個人', '개인', 0),
+('人', '個人', '개인', 1),
+('個', '個人— ', '개인택시', 0),
+('人', '個人— ', '개인택시', 1),
+('—', '個人— ', '개인택시', 2),
+('個', '個人主義', '개인주의', 0),
+('人', '個人主義', '개인주의', 1),
+('主', '個人主義', '개인주의', 2),
+('義', '個人主義', '개인주의', 3),
+('個', '個人主義者', '개인주의자', 0),
+('人', '個人主義者', '개인주의자', 1),
+('主', '個人主義者', '개인주의자', 2),
+('義', '個人主義者', '개인주의자', 3),
+('者', '個人主義者', '개인주의자', 4),
+('個', '個人崇拜', '개인숭배', 0),
+('人', '個人崇拜', '개인숭배', 1),
+('崇', '個人崇拜', '개인숭배', 2),
+('拜', '個人崇拜', '개인숭배', 3),
+('個', '個人技', '개인기', 0),
+('人', '個人技', '개인기', 1),
+('技', '個人技', '개인기', 2),
+('個', '個人指導', '개인지도', 0),
+('人', '個人指導', '개인지도', 1),
+('指', '個人指導', '개인지도', 2),
+('導', '個人指導', '개인지도', 3),
+('個', '個人的', '개인적', 0),
+('人', '個人的', '개인적', 1),
+('的', '個人的', '개인적', 2),
+('個', '個個人', '개개인', 0),
+('個', '個個人', '개개인', 1),
+('人', '個個人', '개개인', 2),
+('個', '個別', '개별', 0),
+('別', '個別', '개별', 1),
+('個', '個別者', '개별자', 0),
+('別', '個別者', '개별자', 1),
+('者', '個別者', '개별자', 2),
+('個', '個國', '개국', 0),
+('國', '個國', '개국', 1),
+('個', '個性', '개성', 0),
+('性', '個性', '개성', 1),
+('個', '個數', '개수', 0),
+('數', '個數', '개수', 1),
+('個', '個月', '개월', 0),
+('月', '個月', '개월', 1),
+('個', '個體', '개체', 0),
+('體', '個體', '개체', 1),
+('倍', '倍', '배', 0),
+('倍', '倍加', '배가', 0),
+('加', '倍加', '배가', 1),
+('倍', '倍數', '배수', 0),
+('數', '倍數', '배수', 1),
+('倍', '倍率', '배율', 0),
+('率', '倍率', '배율', 1),
+('倍', '倍音', '배음', 0),
+('音', '倍音', '배음', 1),
+('倒', '倒錯', '도착', 0),
+('錯', '倒錯', '도착', 1),
+('候', '候補', '후보', 0),
+('補', '候補', '후보', 1),
+('候', '候補者', '후보자', 0),
+('補', '候補者', '후보자', 1),
+('者', '候補者', '후보자', 2),
+('候', '候鳥', '후조', 0),
+('鳥', '候鳥', '후조', 1),
+('借', '借款', '차관', 0),
+('款', '借款', '차관', 1),
+('借', '借狀', '차장', 0),
+('狀', '借狀', '차장', 1),
+('借', '借用', '차용', 0),
+('用', '借用', '차용', 1),
+('借', '借用語', '차용어', 0),
+('用', '借用語', '차용어', 1),
+('語', '借用語', '차용어', 2),
+('借', '借賃', '차임', 0),
+('賃', '借賃', '차임', 1),
+('借', '借邊', '차변', 0),
+('邊', '借邊', '차변', 1),
+('借', '借金', '차금', 0),
+('金', '借金', '차금', 1),
+('値', '値', '치', 0),
+('倦', '倦怠', '권태', 0),
+('怠', '倦怠', '권태', 1),
+('倦', '倦怠感', '권태감', 0),
+('怠', '倦怠感', '권태감', 1),
+('感', '倦怠感', '권태감', 2),
+('倦', '倦怠期', '권태기', 0),
+('怠', '倦怠期', '권태기', 1),
+('期', '倦怠期', '권태기', 2),
+('倦', '倦怠롭다', '권태롭다', 0),
+('怠', '倦怠롭다', '권태롭다', 1),
+('롭', '倦怠롭다', '권태롭다', 2),
+('다', '倦怠롭다', '권태롭다', 3),
+('倨', '倨慢', '거만', 0),
+('慢', '倨慢', '거만', 1),
+('倫', '倫理', '륜리', 0),
+('理', '倫理', '륜리', 1),
+('倫', '倫理', '윤리', 0),
+('理', '倫理', '윤리', 1),
+('倫', '倫理學', '륜리학', 0),
+('理', '倫理學', '륜리학', 1),
+('學', '倫理學', '륜리학', 2),
+('倫', '倫理學', '윤리학', 0),
+('理', '倫理學', '윤리학', 1),
+('學', '倫理學', '윤리학', 2),
+('倭', '倭—', '왜년', 0),
+('—', '倭—', '왜년', 1),
+('倭', '倭—', '왜놈', 0),
+('—', '倭—', '왜놈', 1),
+('倭', '倭人', '왜인', 0),
+('人', '倭人', '왜인', 1),
+('倭', '倭國', '왜국', 0),
+('國', '倭國', '왜국', 1),
+('倭', '倭寇', '왜구', 0),
+('寇', '倭寇', '왜구', 1),
+('倭', '倭語', '왜어', 0),
+('語', '倭語', '왜어', 1),
+('倭', '倭기름', '왜기름', 0),
+('기', '倭기름', '왜기름', 1),
+('름', '倭기름', '왜기름', 2),
+('假', '假-', '가짜', 0),
+('-', '假-', '가짜', 1),
+('假', '假令', '가령', 0),
+('令', '假令', '가령', 1),
+('假', '假借', '가차', 0),
+('借', '假借', '가차', 1),
+('假', '假名', '가명', 0),
+('名', '假名', '가명', 1),
+('假', '假定', '가정', 0),
+('定', '假定', '가정', 1),
+('假', '假定法', '가정법', 0),
+('定', '假定法', '가정법', 1),
+('法', '假定法', '가정법', 2),
+('假', '假家', '가가', 0),
+('家', '假家', '가가', 1),
+('假', '假想', '가상', 0),
+('想', '假想', '가상', 1),
+('假', '假想敵', '가상적', 0),
+('想', '假想敵', '가상적', 1),
+('敵', '假想敵', '가상적', 2),
+('假', '假想的', '가상적', 0),
+('想', '假想的', '가상적', 1),
+('的', '假想的', '가상적', 2),
+('假', '假拂', '가불', 0),
+('拂', '假拂', '가불', 1),
+('假', '假數', '가수', 0),
+('數', '假數', '가수', 1),
+('假', '假死', '가사', 0),
+('死', '假死', '가사', 1),
+('假', '假綴', '가철', 0),
+('綴', '假綴', '가철', 1),
+('假', '假聲', '가성', 0),
+('聲', '假聲', '가성', 1),
+('假', '假葬', '가장', 0),
+('葬', '假葬', '가장', 1),
+('假', '假裝', '가장', 0),
+('裝', '假裝', '가장', 1),
+('假', '假言的', '가언적', 0),
+('言', '假言的', '가언적', 1),
+('的', '假言的', '가언적', 2),
+('假', '假設', '가설', 0),
+('設', '假設', '가설', 1),
+('假', '假說', '가설', 0),
+('說', '假說', '가설', 1),
+('假', '假說法', '가설법', 0),
+('說', '假說法', '가설법', 1),
+('法', '假說法', '가설법', 2),
+('假', '假面', '가면', 0),
+('面', '假面', '가면', 1),
+('假', '假面劇', '가면극', 0),
+('面', '假面劇', '가면극', 1),
+('劇', '假面劇', '가면극', 2),
+('假', '假題', '가제', 0),
+('題', '假題', '가제', 1),
+('假', '假飾', '가식', 0),
+('飾', '假飾', '가식', 1),
+('假', '假髮', '가발', 0),
+('髮', '假髮', '가발', 1),
+('假', '假짜', '가짜', 0),
+('짜', '假짜', '가짜', 1),
+('偉', '偉人', '위인', 0),
+('人', '偉人', '위인', 1),
+('偉', '偉力', '위력', 0),
+('力', '偉力', '위력', 1),
+('偉', '偉勳', '위훈', 0),
+('勳', '偉勳', '위훈', 1),
+('偉', '偉大', '위대', 0),
+('大', '偉大', '위대', 1),
+('偉', '偉業', '위업', 0),
+('業', '偉業', '위업', 1),
+('偏', '偏光', '편광', 0),
+('光', '偏光', '편광', 1),
+('偏', '偏向', '편향', 0),
+('向', '偏向', '편향', 1),
+('偏', '偏在', '편재', 0),
+('在', '偏在', '편재', 1),
+('偏', '偏執病', '편집병', 0),
+('執', '偏執病', '편집병', 1),
+('病', '偏執病', '편집병', 2),
+('偏', '偏執症', '편집증', 0),
+('執', '偏執症', '편집증', 1),
+('症', '偏執症', '편집증', 2),
+('偏', '偏差', '편차', 0),
+('差', '偏差', '편차', 1),
+('偏', '偏愛', '편애', 0),
+('愛', '偏愛', '편애', 1),
+('偏', '偏狹', '편협', 0),
+('狹', '偏狹', '편협', 1),
+('偏', '偏見', '편견', 0),
+('見', '偏見', '편견', 1),
+('偏', '偏重', '편중', 0),
+('重', '偏重', '편중', 1),
+('偏', '偏頭痛', '편두통', 0),
+('頭', '偏頭痛', '편두통', 1),
+('痛', '偏頭痛', '편두통', 2),
+('偏', '偏食', '편식', 0),
+('食', '偏食', '편식', 1),
+('做', '做作', '주작', 0),
+('作', '做作', '주작', 1),
+('停', '停戰', '정전', 0),
+('戰', '停戰', '정전', 1),
+('停', '停止', '정지', 0),
+('止', '停止', '정지', 1),
+('停', '停滯', '정체', 0),
+('滯', '停滯', '정체', 1),
+('停', '停留', '정류', 0),
+('留', '停留', '정류', 1),
+('停', '停留場', '정류장', 0),
+('留', '停留場', '정류장', 1),
+('場', '停留場', '정류장', 2),
+('停', '停車', '정거', 0),
+('車', '停車', '정거', 1),
+('停', '停車', '정차', 0),
+('車', '停車', '정차', 1),
+('停', '停車場', '정거장', 0),
+('車', '停車場', '정거장', 1),
+('場', '停車場', '정거장', 2),
+('停', '停電', '정전', 0),
+('電', '停電', '정전', 1),
+('停', '停頓', '정돈', 0),
+('頓', '停頓', '정돈', 1),
+('健', '健全', '건전', 0),
+('全', '健全', '건전', 1),
+('健', '健康', '건강', 0),
+('康', '健康', '건강', 1),
+('健', '健康念慮症', '건강염려증', 0),
+('康', '健康念慮症', '건강염려증', 1),
+('念', '健康念慮症', '건강염려증', 2),
+('慮', '健康念慮症', '건강염려증', 3),
+('症', '健康念慮症', '건강염려증', 4),
+('健', '健忘症', '건망증', 0),
+('忘', '健忘症', '건망증', 1),
+('症', '健忘症', '건망증', 2),
+('健', '健筆', '건필', 0),
+('筆', '健筆', '건필', 1),
+('側', '側位', '측위', 0),
+('位', '側位', '측위', 1),
+('側', '側線', '측선', 0),
+('線', '側線', '측선', 1),
+('側', '側面', '측면', 0),
+('面', '側面', '측면', 1),
+('偵', '偵察', '정찰', 0),
+('察', '偵察', '정찰', 1),
+('偵', '偵察兵', '정찰병', 0),
+('察', '偵察兵', '정찰병', 1),
+('兵', '偵察兵', '정찰병', 2),
+('偶', '偶人', '우인', 0),
+('人', '偶人', '우인', 1),
+('偶', '偶像', '우상', 0),
+('像', '偶像', '우상', 1),
+('偶', '偶像崇拜', '우상숭배', 0),
+('像', '偶像崇拜', '우상숭배', 1),
+('崇', '偶像崇拜', '우상숭배', 2),
+('拜', '偶像崇拜', '우상숭배', 3),
+('偶', '偶然', '우연', 0),
+('然', '偶然', '우연', 1),
+('傀', '傀儡', '괴뢰', 0),
+('儡', '傀儡', '괴뢰', 1),
+('傀', '傀儡 政權', '괴뢰 정권', 0),
+('儡', '傀儡 政權', '괴뢰 정권', 1),
+('政', '傀儡 政權', '괴뢰 정권', 3),
+('權', '傀儡 政權', '괴뢰 정권', 4),
+('傍', '傍心', '방심', 0),
+('心', '傍心', '방심', 1),
+('傍', '傍接圓', '방접원', 0),
+('接', '傍接圓', '방접원', 1),
+('圓', '傍接圓', '방접원', 2),
+('傍', '傍觀者', '방관자', 0),
+('觀', '傍觀者', '방관자', 1),
+('者', '傍觀者', '방관자', 2),
+('傍', '傍點', '방점', 0),
+('點', '傍點', '방점', 1),
+('傑', '傑作', '걸작', 0),
+('作', '傑作', '걸작', 1),
+('傑', '傑出', '걸출', 0),
+('出', '傑出', '걸출', 1),
+('備', '備品', '비품', 0),
+('品', '備品', '비품', 1),
+('備', '備忘記', '비망기', 0),
+('忘', '備忘記', '비망기', 1),
+('記', '備忘記', '비망기', 2),
+('備', '備忘錄', '비망록', 0),
+('忘', '備忘錄', '비망록', 1),
+('錄', '備忘錄', '비망록', 2),
+('備', '備考', '비고', 0),
+('考', '備考', '비고', 1),
+('備', '備蓄', '비축', 0),
+('蓄', '備蓄', '비축', 1),
+('催', '催告', '최고', 0),
+('告', '催告', '최고', 1),
+('催', '催淚', '최루', 0),
+('淚', '催淚', '최루', 1),
+('催', '催淚劑', '최루제', 0),
+('淚', '催淚劑', '최루제', 1),
+('劑', '催淚劑', '최루제', 2),
+('催', '催淚彈', '최루탄', 0),
+('淚', '催淚彈', '최루탄', 1),
+('彈', '催淚彈', '최루탄', 2),
+('催', '催淫劑', '최음제', 0),
+('淫', '催淫劑', '최음제', 1),
+('劑', '催淫劑', '최음제', 2),
+('催', '催眠', '최면', 0),
+('眠', '催眠', '최면', 1),
+('催', '催眠治療', '최면치료', 0),
+('眠', '催眠治療', '최면치료', 1),
+('治', '催眠治療', '최면치료', 2),
+('療', '催眠治療', '최면치료', 3),
+('催', '催眠術', '최면술', 0),
+('眠', '催眠術', '최면술', 1),
+('術', '催眠術', '최면술', 2),
+('催', '催眠術士', '최면술사', 0),
+('眠', '催眠術士', '최면술사', 1),
+('術', '催眠術士', '최면술사', 2),
+('士', '催眠術士', '최면술사', 3),
+('傭', '傭兵', '용병', 0),
+('兵', '傭兵', '용병', 1),
+('傭', '傭書', '용서', 0),
+('書', '傭書', '용서', 1),
+('傲', '傲慢', '오만', 0),
+('慢', '傲慢', '오만', 1),
+('傳', '傳', '전', 0),
+('傳', '傳令', '전령', 0),
+('令', '傳令', '전령', 1),
+('傳', '傳來', '전래', 0),
+('來', '傳來', '전래', 1),
+('傳', '傳動', '전동', 0),
+('動', '傳動', '전동', 1),
+('傳', '傳單', '전단', 0),
+('單', '傳單', '전단', 1),
+('傳', '傳導', '전도', 0),
+('導', '傳導', '전도', 1),
+('傳', '傳承', '전승', 0),
+('承', '傳承', '전승', 1),
+('傳', '傳授', '전수', 0),
+('授', '傳授', '전수', 1),
+('傳', '傳書鳩', '전서구', 0),
+('書', '傳書鳩', '전서구', 1),
+('鳩', '傳書鳩', '전서구', 2),
+('傳', '傳染', '전염', 0),
+('染', '傳染', '전염', 1),
+('傳', '傳染病', '전염병', 0),
+('染', '傳染病', '전염병', 1),
+('病', '傳染病', '전염병', 2),
+('傳', '傳統', '전통', 0),
+('統', '傳統', '전통', 1),
+('傳', '傳統文化', '전통문화', 0),
+('統', '傳統文化', '전통문화', 1),
+('文', '傳統文化', '전통문화', 2),
+('化', '傳統文化', '전통문화', 3),
+('傳', '傳統的', '전통적', 0),
+('統', '傳統的', '전통적', 1),
+('的', '傳統的', '전통적', 2),
+('傳', '傳聞', '전문', 0),
+('聞', '傳聞', '전문', 1),
+('傳', '傳言', '전언', 0),
+('言', '傳言', '전언', 1),
+('傳', '傳言板', '전언판', 0),
+('言', '傳言板', '전언판', 1),
+('板', '傳言板', '전언판', 2),
+('傳', '傳記', '전기', 0),
+('記', '傳記', '전기', 1),
+('傳', '傳說', '전설', 0),
+('說', '傳說', '전설', 1),
+('傳', '傳貰', '전세', 0),
+('貰', '傳貰', '전세', 1),
+('傳', '傳送', '전송', 0),
+('送', '傳送', '전송', 1),
+('傳', '傳道', '전도', 0),
+('道', '傳道', '전도', 1),
+('傳', '傳道師', '전도사', 0),
+('道', '傳道師', '전도사', 1),
+('師', '傳道師', '전도사', 2),
+('傳', '傳道書', '전도서', 0),
+('道', '傳道書', '전도서', 1),
+('書', '傳道書', '전도서', 2),
+('傳', '傳達', '전달', 0),
+('達', '傳達', '전달', 1),
+('傳', '傳音器', '전음기', 0),
+('音', '傳音器', '전음기', 1),
+('器', '傳音器', '전음기', 2),
+('債', '債務', '채무', 0),
+('務', '債務', '채무', 1),
+('債', '債務者', '채무자', 0),
+('務', '債務者', '채무자', 1),
+('者', '債務者', '채무자', 2),
+('債', '債權者', '채권자', 0),
+('權', '債權者', '채권자', 1),
+('者', '債權者', '채권자', 2),
+('傷', '傷', '상', 0),
+('傷', '傷害', '상해', 0),
+('害', '傷害', '상해', 1),
+('傷', '傷處', '상처', 0),
+('處', '傷處', '상처', 1),
+('傾', '傾向', '경향', 0),
+('向', '傾向', '경향', 1),
+('傾', '傾斜', '경사', 0),
+('斜', '傾斜', '경사', 1),
+('傾', '傾聽', '경청', 0),
+('聽', '傾聽', '경청', 1),
+('傾', '傾聽者', '경청자', 0),
+('聽', '傾聽者', '경청자', 1),
+('者', '傾聽者', '경청자', 2),
+('像', '像', '상', 0),
+('僑', '僑居', '교거', 0),
+('居', '僑居', '교거', 1),
+('僑', '僑胞', '교포', 0),
+('胞', '僑胞', '교포', 1),
+('僞', '僞善', '위선', 0),
+('善', '僞善', '위선', 1),
+('僞', '僞善者', '위선자', 0),
+('善', '僞善者', '위선자', 1),
+('者', '僞善者', '위선자', 2),
+('僞', '僞裝', '위장', 0),
+('裝', '僞裝', '위장', 1),
+('僞', '僞證', '위증', 0),
+('證', '僞證', '위증', 1),
+('僞', '僞造', '위조', 0),
+('造', '僞造', '위조', 1),
+('僞', '僞造紙幣', '위조지폐', 0),
+('造', '僞造紙幣', '위조지폐', 1),
+('紙', '僞造紙幣', '위조지폐', 2),
+('幣', '僞造紙幣', '위조지폐', 3),
+('僞', '僞造者', '위조자', 0),
+('造', '僞造者', '위조자', 1),
+('者', '僞造者', '위조자', 2),
+('僞', '僞陰性', '위음성', 0),
+('陰', '僞陰性', '위음성', 1),
+('性', '僞陰性', '위음성', 2),
+('僥', '僥倖', '요행', 0),
+('倖', '僥倖', '요행', 1),
+('僥', '僥幸', '요행', 0),
+('幸', '僥幸', '요행', 1),
+('僧', '僧侶', '승려', 0),
+('侶', '僧侶', '승려', 1),
+('僧', '僧園', '승원', 0),
+('園', '僧園', '승원', 1),
+('僧', '僧坊', '승방', 0),
+('坊', '僧坊', '승방', 1),
+('僧', '僧塔', '승탑', 0),
+('塔', '僧塔', '승탑', 1),
+('僧', '僧房', '승방', 0),
+('房', '僧房', '승방', 1),
+('僧', '僧服', '승복', 0),
+('服', '僧服', '승복', 1),
+('僧', '僧院', '승원', 0),
+('院', '僧院', '승원', 1),
+('僭', '僭主', '참주', 0),
+('主', '僭主', '참주', 1),
+('價', '價値', '가치', 0),
+('値', '價値', '가치', 1),
+('價', '價値觀', '가치관', 0),
+('値', '價値觀', '가치관', 1),
+('觀', '價値觀', '가치관', 2),
+('價', '價性比', '가성비', 0),
+('性', '價性比', '가성비', 1),
+('比', '價性比', '가성비', 2),
+('價', '價格', '가격', 0),
+('格', '價格', '가격', 1),
+('價', '價格帶', '가격대', 0),
+('格', '價格帶', '가격대', 1),
+('帶', '價格帶', '가격대', 2),
+('僻', '僻', '벽', 0),
+('僻', '僻地', '벽지', 0),
+('地', '僻地', '벽지', 1),
+('僻', '僻字', '벽자', 0),
+('字', '僻字', '벽자', 1),
+('儀', '儀式', '의식', 0),
+('式', '儀式', '의식', 1),
+('儀', '儀法', '의법', 0),
+('法', '儀法', '의법', 1),
+('儀', '儀禮', '의례', 0),
+('禮', '儀禮', '의례', 1),
+('儀', '儀禮的', '의례적', 0),
+('禮', '儀禮的', '의례적', 1),
+('的', '儀禮的', '의례적', 2),
+('億', '億', '억', 0),
+('儉', '儉約', '검약', 0),
+('約', '儉約', '검약', 1),
+('儉', '儉素', '검소', 0),
+('素', '儉素', '검소', 1),
+('儒', '儒學', '유학', 0),
+('學', '儒學', '유학', 1),
+('儒', '儒家', '유가', 0),
+('家', '儒家', '유가', 1),
+('儒', '儒敎', '유교', 0),
+('敎', '儒敎', '유교', 1),
+('儒', '儒教', '유교', 0),
+('教', '儒教', '유교', 1),
+('償', '償還', '상환', 0),
+('還', '償還', '상환', 1),
+('優', '優', '우', 0),
+('優', '優人', '우인', 0),
+('人', '優人', '우인', 1),
+('優', '優先', '우선', 0),
+('先', '優先', '우선', 1),
+('優', '優劣', '우열', 0),
+('劣', '優劣', '우열', 1),
+('優', '優勝', '우승', 0),
+('勝', '優勝', '우승', 1),
+('優', '優勢', '우세', 0),
+('勢', '優勢', '우세', 1),
+('優', '優待', '우대', 0),
+('待', '優待', '우대', 1),
+('優', '優待席', '우대석', 0),
+('待', '優待席', '우대석', 1),
+('席', '優待席', '우대석', 2),
+('優', '優性', '우성', 0),
+('性', '優性', '우성', 1),
+('優', '優柔不斷', '우유부단', 0),
+('柔', '優柔不斷', '우유부단', 1),
+('不', '優柔不斷', '우유부단', 2),
+('斷', '優柔不斷', '우유부단', 3),
+('優', '優生學', '우생학', 0),
+('生', '優生學', '우생학', 1),
+('學', '優生學', '우생학', 2),
+('優', '優秀', '우수', 0),
+('秀', '優秀', '우수', 1),
+('優', '優等', '우등', 0),
+('等', '優等', '우등', 1),
+('優', '優等生', '우등생', 0),
+('等', '優等生', '우등생', 1),
+('生', '優等生', '우등생', 2),
+('優', '優美', '우미', 0),
+('美', '優美', '우미', 1),
+('優', '優越', '우월', 0),
+('越', '優越', '우월', 1),
+('優', '優遇', '우우', 0),
+('遇', '優遇', '우우', 1),
+('優', '優雅', '우아', 0),
+('雅', '優雅', '우아', 1),
+('儺', '儺儀', '나의', 0),
+('儀', '儺儀', '나의', 1),
+('元', '元來', '원래', 0),
+('來', '元來', '원래', 1),
+('元', '元山', '원산', 0),
+('山', '元山', '원산', 1),
+('元', '元帥', '원수', 0),
+('帥', '元帥', '원수', 1),
+('元', '元帳', '원장', 0),
+('帳', '元帳', '원장', 1),
+('元', '元氣', '원기', 0),
+('氣', '元氣', '원기', 1),
+('元', '元素', '원소', 0),
+('素', '元素', '원소', 1),
+('元', '元金', '원금', 0),
+('金', '元金', '원금', 1),
+('元', '元首', '원수', 0),
+('首', '元首', '원수', 1),
+('元', '元體', '원체', 0),
+('體', '元體', '원체', 1),
+('兄', '兄', '형', 0),
+('兄', '兄-', '형님', 0),
+('-', '兄-', '형님', 1),
+('兄', '兄夫', '형부', 0),
+('夫', '兄夫', '형부', 1),
+('兄', '兄嫂', '형수', 0),
+('嫂', '兄嫂', '형수', 1),
+('兄', '兄弟', '형데', 0),
+('弟', '兄弟', '형데', 1),
+('兄', '兄弟', '형제', 0),
+('弟', '兄弟', '형제', 1),
+('兄', '兄弟姉妹', '형제자매', 0),
+('弟', '兄弟姉妹', '형제자매', 1),
+('姉', '兄弟姉妹', '형제자매', 2),
+('妹', '兄弟姉妹', '형제자매', 3),
+('兄', '兄님', '형님', 0),
+('님', '兄님', '형님', 1),
+('充', '充分', '충분', 0),
+('分', '充分', '충분', 1),
+('充', '充實', '충실', 0),
+('實', '充實', '충실', 1),
+('充', '充溢', '충일', 0),
+('溢', '充溢', '충일', 1),
+('充', '充滿', '충만', 0),
+('滿', '充滿', '충만', 1),
+('充', '充滿症', '충만증', 0),
+('滿', '充滿症', '충만증', 1),
+('症', '充滿症', '충만증', 2),
+('充', '充當', '충당', 0),
+('當', '充當', '충당', 1),
+('充', '充電器', '충전기', 0),
+('電', '充電器', '충전기', 1),
+('器', '充電器', '충전기', 2),
+('兆', '兆候', '조후', 0),
+('候', '兆候', '조후', 1),
+('兆', '兆朕', '조짐', 0),
+('朕', '兆朕', '조짐', 1),
+('兆', '兆祥', '조상', 0),
+('祥', '兆祥', '조상', 1),
+('兇', '兇徒', '흉도', 0),
+('徒', '兇徒', '흉도', 1),
+('先', '先住民', '선주민', 0),
+('住', '先住民', '선주민', 1),
+('民', '先住民', '선주민', 2),
+('先', '先例', '선례', 0),
+('例', '先例', '선례', 1),
+('先', '先入先出', '선입선출', 0),
+('入', '先入先出', '선입선출', 1),
+('先', '先入先出', '선입선출', 2),
+('出', '先入先出', '선입선출', 3),
+('先', '先入見', '선입견', 0),
+('入', '先入見', '선입견', 1),
+('見', '先入見', '선입견', 2),
+('先', '先入觀', '선입관', 0),
+('入', '先入觀', '선입관', 1),
+('觀', '先入觀', '선입관', 2),
+('先', '先取', '선취', 0),
+('取', '先取', '선취', 1),
+('先', '先史', '선사', 0),
+('史', '先史', '선사', 1),
+('先', '先史 時代', '선사 시대', 0),
+('史', '先史 時代', '선사 시대', 1),
+('時', '先史 時代', '선사 시대', 3),
+('代', '先史 時代', '선사 시대', 4),
+('先', '先唱', '선창', 0),
+('唱', '先唱', '선창', 1),
+('先', '先天的', '선천적', 0),
+('天', '先天的', '선천적', 1),
+('的', '先天的', '선천적', 2),
+('先', '先烈', '선렬', 0),
+('烈', '先烈', '선렬', 1),
+('先', '先物', '선물', 0),
+('物', '先物', '선물', 1),
+('先', '先生', '선생', 0),
+('生', '先生', '선생', 1),
+('先', '先生님', '선생님', 0),
+('生', '先生님', '선생님', 1),
+('님', '先生님', '선생님', 2),
+('先', '先發投手', '선발투수', 0),
+('發', '先發投手', '선발투수', 1),
+('投', '先發投手', '선발투수', 2),
+('手', '先發投手', '선발투수', 3),
+('先', '先知者', '선지자', 0),
+('知', '先知者', '선지자', 1),
+('者', '先知者', '선지자', 2),
+('先', '先祖', '선조', 0),
+('祖', '先祖', '선조', 1),
+('先', '先端', '선단', 0),
+('端', '先端', '선단', 1),
+('先', '先約', '선약', 0),
+('約', '先約', '선약', 1),
+('先', '先行', '선행', 0),
+('行', '先行', '선행', 1),
+('先', '先語末 語尾', '선어말 어미', 0),
+('語', '先語末 語尾', '선어말 어미', 1),
+('末', '先語末 語尾', '선어말 어미', 2),
+('語', '先語末 語尾', '선어말 어미', 4),
+('尾', '先語末 語尾', '선어말 어미', 5),
+('先', '先軍', '선군', 0),
+('軍', '先軍', '선군', 1),
+('先', '先輩', '선배', 0),
+('輩', '先輩', '선배', 1),
+('先', '先農湯', '설렁탕', 0),
+('農', '先農湯', '설렁탕', 1),
+('湯', '先農湯', '설렁탕', 2),
+('先', '先進', '선진', 0),
+('進', '先進', '선진', 1),
+('先', '先進國', '선진국', 0),
+('進', '先進國', '선진국', 1),
+('國', '先進國', '선진국', 2),
+('先', '先驅', '선구', 0),
+('驅', '先驅', '선구', 1),
+('先', '先驅者', '선구자', 0),
+('驅', '先驅者', '선구자', 1),
+('者', '先驅者', '선구자', 2),
+('光', '光劍', '광검', 0),
+('劍', '光劍', '광검', 1),
+('光', '光化學', '광화학', 0),
+('化', '光化學', '광화학', 1),
+('學', '光化學', '광화학', 2),
+('光', '光化門', '광화문', 0),
+('化', '光化門', '광화문', 1),
+('門', '光化門', '광화문', 2),
+('光', '光合成', '광합성', 0),
+('合', '光合成', '광합성', 1),
+('成', '光合成', '광합성', 2),
+('光', '光呼吸', '광호흡', 0),
+('呼', '光呼吸', '광호흡', 1),
+('吸', '光呼吸', '광호흡', 2),
+('光', '光子', '광자', 0),
+('子', '光子', '광자', 1),
+('光', '光子學', '광자학', 0),
+('子', '光子學', '광자학', 1),
+('學', '光子學', '광자학', 2),
+('光', '光學', '광학', 0),
+('學', '光學', '광학', 1),
+('光', '光州', '광주', 0),
+('州', '光州', '광주', 1),
+('光', '光年', '광년', 0),
+('年', '光年', '광년', 1),
+('光', '光彩', '광채', 0),
+('彩', '光彩', '광채', 1),
+('光', '光復節', '광복절', 0),
+('復', '光復節', '광복절', 1),
+('節', '光復節', '광복절', 2),
+('光', '光明', '광명', 0),
+('明', '光明', '광명', 1),
+('光', '光明星節', '광명성절', 0),
+('明', '光明星節', '광명성절', 1),
+('星', '光明星節', '광명성절', 2),
+('節', '光明星節', '광명성절', 3),
+('光', '光景', '광경', 0),
+('景', '光景', '광경', 1),
+('光', '光榮', '광영', 0),
+('榮', '光榮', '광영', 1),
+('光', '光波', '광파', 0),
+('波', '光波', '광파', 1),
+('光', '光源', '광원', 0),
+('源', '光源', '광원', 1),
+('光', '光澤', '광택', 0),
+('澤', '光澤', '광택', 1),
+('光', '光照', '광조', 0),
+('照', '光照', '광조', 1),
+('光', '光球', '광구', 0),
+('球', '光球', '광구', 1),
+('光', '光秒', '광초', 0),
+('秒', '光秒', '광초', 1),
+('光', '光線', '광선', 0),
+('線', '光線', '광선', 1),
+('克', '克己', '극기', 0),
+('己', '克己', '극기', 1),
+('克', '克服', '극복', 0),
+('服', '克服', '극복', 1),
+('免', '免', '면', 0),
+('免', '免疫', '면역', 0),
+('疫', '免疫', '면역', 1),
+('免', '免疫學', '면역학', 0),
+('疫', '免疫學', '면역학', 1),
+('學', '免疫學', '면역학', 2),
+('免', '免稅', '면세', 0),
+('稅', '免稅', '면세', 1),
+('免', '免稅店', '면세점', 0),
+('稅', '免稅店', '면세점', 1),
+('店', '免稅店', '면세점', 2),
+('免', '免許', '면허', 0),
+('許', '免許', '면허', 1),
+('免', '免許證', '면허증', 0),
+('許', '免許證', '면허증', 1),
+('證', '免許證', '면허증', 2),
+('免', '免責條項', '면책조항', 0),
+('責', '免責條項', '면책조항', 1),
+('條', '免責條項', '면책조항', 2),
+('項', '免責條項', '면책조항', 3),
+('免', '免除', '면제', 0),
+('除', '免除', '면제', 1),
+('兒', '兒孩', '아해', 0),
+('孩', '兒孩', '아해', 1),
+('兒', '兒童', '아동', 0),
+('童', '兒童', '아동', 1),
+('兒', '兒童  포르', '아동 포르노', 0),
+('童', '兒童  포르', '아동 포르노', 1),
+('포', '兒童  포르', '아동 포르노', 4),
+('르', '兒童  포르', '아동 포르노', 5),
+('兔', '兔', '토', 0),
+('入', '入內', '입내', 0),
+('內', '入內', '입내', 1),
+('入', '入力', '입력', 0),
+('力', '入力', '입력', 1),
+('入', '入力 方法', '입력 방법', 0),
+('力', '入力 方法', '입력 방법', 1),
+('方', '入力 方法', '입력 방법', 3),
+('法', '入力 方法', '입력 방법', 4),
+('入', '入口', '입구', 0),
+('口', '入口', '입구', 1),
+('入', '入國', '입국', 0),
+('國', '入國', '입국', 1),
+('入', '入團', '입단', 0),
+('團', '入團', '입단', 1),
+('入', '入場', '입장', 0),
+('場', '入場', '입장', 1),
+('入', '入場券', '입장권', 0),
+('場', '入場券', '입장권', 1),
+('券', '入場券', '입장권', 2),
+('入', '入場料', '입장료', 0),
+('場', '入場料', '입장료', 1),
+('料', '入場料', '입장료', 2),
+('入', '入境', '입경', 0),
+('境', '入境', '입경', 1),
+('入', '入學', '입학', 0),
+('學', '入學', '입학', 1),
+('入', '入寂', '입적', 0),
+('寂', '入寂', '입적', 1),
+('入', '入寇', '입구', 0),
+('寇', '入寇', '입구', 1),
+('入', '入射', '입사', 0),
+('射', '入射', '입사', 1),
+('入', '入札', '입찰', 0),
+('札', '入札', '입찰', 1),
+('入', '入棺', '입관', 0),
+('棺', '入棺', '입관', 1),
+('入', '入港', '입항', 0),
+('港', '入港', '입항', 1),
+('入', '入監', '입감', 0),
+('監', '入監', '입감', 1),
+('入', '入社', '입사', 0),
+('社', '入社', '입사', 1),
+('入', '入線', '입선', 0),
+('線', '入線', '입선', 1),
+('入', '入聲', '입성', 0),
+('聲', '入聲', '입성', 1),
+('入', '入試', '입시', 0),
+('試', '入試', '입시', 1),
+('入', '入貢', '입공', 0),
+('貢', '入貢', '입공', 1),
+('入', '入郷循俗', '입향순속', 0),
+('郷', '入郷循俗', '입향순속', 1),
+('循', '入郷循俗', '입향순속', 2),
+('俗', '入郷循俗', '입향순속', 3),
+('入', '入鄉循俗', '입향순속', 0),
+('鄉', '入鄉循俗', '입향순속', 1),
+('循', '入鄉循俗', '입향순속', 2),
+('俗', '入鄉循俗', '입향순속', 3),
+('入', '入金', '입금', 0),
+('金', '入金', '입금', 1),
+('入', '入院', '입원', 0),
+('院', '入院', '입원', 1),
+('入', '入隊', '입대', 0),
+('隊', '入隊', '입대', 1),
+('入', '入養', '입양', 0),
+('養', '入養', '입양', 1),
+('入', '入館', '입관', 0),
+('館', '入館', '입관', 1),
+('入', '入黨', '입당', 0),
+('黨', '入黨', '입당', 1),
+('內', '內', '내', 0),
+('內', '內亂', '내란', 0),
+('亂', '內亂', '내란', 1),
+('內', '內人', '나인', 0),
+('人', '內人', '나인', 1),
+('內', '內側廣筋', '내측광근', 0),
+('側', '內側廣筋', '내측광근', 1),
+('廣', '內側廣筋', '내측광근', 2),
+('筋', '內側廣筋', '내측광근', 3),
+('內', '內則', '내칙', 0),
+('則', '內則', '내칙', 1),
+('內', '內務', '내무', 0),
+('務', '內務', '내무', 1),
+('內', '內包', '내포', 0),
+('包', '內包', '내포', 1),
+('內', '內國人', '내국인', 0),
+('國', '內國人', '내국인', 1),
+('人', '內國人', '내국인', 2),
+('內', '內在', '내재', 0),
+('在', '內在', '내재', 1),
+('內', '內外', '내외', 0),
+('外', '內外', '내외', 1),
+('內', '內容', '내용', 0),
+('容', '內容', '내용', 1),
+('內', '內容物', '내용물', 0),
+('容', '內容物', '내용물', 1),
+('物', '內容物', '내용물', 2),
+('內', '內心', '내심', 0),
+('心', '內心', '내심', 1),
+('內', '內應', '내응', 0),
+('應', '內應', '내응', 1),
+('內', '內戰', '내전', 0),
+('戰', '內戰', '내전', 1),
+('內', '內接圓', '내접원', 0),
+('接', '內接圓', '내접원', 1),
+('圓', '內接圓', '내접원', 2),
+('內', '內核', '내핵', 0),
+('核', '內核', '내핵', 1),
+('內', '內毒素', '내독소', 0),
+('毒', '內毒素', '내독소', 1),
+('素', '內毒素', '내독소', 2),
+('內', '內海', '내해', 0),
+('海', '內海', '내해', 1),
+('內', '內用', '내용', 0),
+('用', '內用', '내용', 1),
+('內', '內界', '내계', 0),
+('界', '內界', '내계', 1),
+('內', '內的', '내적', 0),
+('的', '內的', '내적', 1),
+('內', '內科', '내과', 0),
+('科', '內科', '내과', 1),
+('內', '內耳', '내이', 0),
+('耳', '內耳', '내이', 1),
+('內', '內職', '내직', 0),
+('職', '內職', '내직', 1),
+('內', '內腔', '내강', 0),
+('腔', '內腔', '내강', 1),
+('內', '內腹斜筋', '내복사근', 0),
+('腹', '內腹斜筋', '내복사근', 1),
+('斜', '內腹斜筋', '내복사근', 2),
+('筋', '內腹斜筋', '내복사근', 3),
+('內', '內臟', '내장', 0),
+('臟', '內臟', '내장', 1),
+('內', '內蒙古', '내몽고', 0),
+('蒙', '內蒙古', '내몽고', 1),
+('古', '內蒙古', '내몽고', 2),
+('內', '內裏', '내리', 0),
+('裏', '內裏', '내리', 1),
+('內', '內角', '내각', 0),
+('角', '內角', '내각', 1),
+('內', '內部', '내부', 0),
+('部', '內部', '내부', 1),
+('內', '內野', '내야', 0),
+('野', '內野', '내야', 1),
+('內', '內野手', '내야수', 0),
+('野', '內野手', '내야수', 1),
+('手', '內野手', '내야수', 2),
+('內', '內閣', '내각', 0),
+('閣', '內閣', '내각', 1),
+('內', '內陸', '내륙', 0),
+('陸', '內陸', '내륙', 1),
+('內', '內需', '내수', 0),
+('需', '內需', '내수', 1),
+('內', '內面', '내면', 0),
+('面', '內面', '내면', 1),
+('內', '內面的', '내면적', 0),
+('面', '內面的', '내면적', 1),
+('的', '內面的', '내면적', 2),
+('全', '全', '전', 0),
+('全', '全-', '전혀', 0),
+('-', '全-', '전혀', 1),
+('全', '全世界', '전세계', 0),
+('世', '全世界', '전세계', 1),
+('界', '全世界', '전세계', 2),
+('全', '全力', '전력', 0),
+('力', '全力', '전력', 1),
+('全', '全北', '전북', 0),
+('北', '全北', '전북', 1),
+('全', '全南', '전남', 0),
+('南', '全南', '전남', 1),
+('全', '全員', '전원', 0),
+('員', '全員', '전원', 1),
+('全', '全國', '전국', 0),
+('國', '全國', '전국', 1),
+('全', '全國的', '전국적', 0),
+('國', '全國的', '전국적', 1),
+('的', '全國的', '전국적', 2),
+('全', '全局', '전국', 0),
+('局', '全局', '전국', 1),
+('全', '全州', '전주', 0),
+('州', '全州', '전주', 1),
+('全', '全市', '전시', 0),
+('市', '全市', '전시', 1),
+('全', '全心', '전심', 0),
+('心', '全心', '전심', 1),
+('全', '全文', '전문', 0),
+('文', '全文', '전문', 1),
+('全', '全段', '전단', 0),
+('段', '全段', '전단', 1),
+('全', '全滅', '전멸', 0),
+('滅', '全滅', '전멸', 1),
+('全', '全盛', '전성', 0),
+('盛', '全盛', '전성', 1),
+('全', '全盛期', '전성기', 0),
+('盛', '全盛期', '전성기', 1),
+('期', '全盛期', '전성기', 2),
+('全', '全知', '전지', 0),
+('知', '全知', '전지', 1),
+('全', '全知全能', '전지전능', 0),
+('知', '全知全能', '전지전능', 1),
+('全', '全知全能', '전지전능', 2),
+('能', '全知全能', '전지전능', 3),
+('全', '全線', '전선', 0),
+('線', '全線', '전선', 1),
+('全', '全羅北道', '전라북도', 0),
+('羅', '全羅北道', '전라북도', 1),
+('北', '全羅北道', '전라북도', 2),
+('道', '全羅北道', '전라북도', 3),
+('全', '全羅南北道', '전라남북도', 0),
+('羅', '全羅南北道', '전라남북도', 1),
+('南', '全羅南北道', '전라남북도', 2),
+('北', '全羅南北道', '전라남북도', 3),
+('道', '全羅南北道', '전라남북도', 4),
+('全', '全羅南道', '전라남도', 0),
+('羅', '全羅南道', '전라남도', 1),
+('南', '全羅南道', '전라남도', 2),
+('道', '全羅南道', '전라남도', 3),
+('全', '全羅道', '전라도', 0),
+('羅', '全羅道', '전라도', 1),
+('道', '全羅道', '전라도', 2),
+('全', '全般', '전반', 0),
+('般', '全般', '전반', 1),
+('全', '全般的', '전반적', 0),
+('般', '全般的', '전반적', 1),
+('的', '全般的', '전반적', 2),
+('全', '全蠍', '전갈', 0),
+('蠍', '全蠍', '전갈', 1),
+('全', '全裸', '전라', 0),
+('裸', '全裸', '전라', 1),
+('全', '全貌', '전모', 0),
+('貌', '全貌', '전모', 1),
+('全', '全身', '전신', 0),
+('身', '全身', '전신', 1),
+('全', '全速 前進', '전속 전진', 0),
+('速', '全速 前進', '전속 전진', 1),
+('前', '全速 前進', '전속 전진', 3),
+('進', '全速 前進', '전속 전진', 4),
+('全', '全速力', '전속력', 0),
+('速', '全速力', '전속력', 1),
+('力', '全速力', '전속력', 2),
+('全', '全部', '전부', 0),
+('部', '全部', '전부', 1),
+('全', '全長', '전장', 0),
+('長', '全長', '전장', 1),
+('全', '全集', '전집', 0),
+('集', '全集', '전집', 1),
+('全', '全面', '전면', 0),
+('面', '全面', '전면', 1),
+('全', '全體', '전체', 0),
+('體', '全體', '전체', 1),
+('全', '全體主義', '전체주의', 0),
+('體', '全體主義', '전체주의', 1),
+('主', '全體主義', '전체주의', 2),
+('義', '全體主義', '전체주의', 3),
+('全', '全體的', '전체적', 0),
+('體', '全體的', '전체적', 1),
+('的', '全體的', '전체적', 2),
+('全', '全體論', '전체론', 0),
+('體', '全體論', '전체론', 1),
+('論', '全體論', '전체론', 2),
+('全', '全鰒', '전복', 0),
+('鰒', '全鰒', '전복', 1),
+('全', '全黨', '전당', 0),
+('黨', '全黨', '전당', 1),
+('全', '全혀', '전혀', 0),
+('혀', '全혀', '전혀', 1),
+('兩', '兩', '냥', 0),
+('兩', '兩國', '양국', 0),
+('國', '兩國', '양국', 1),
+('兩', '兩性', '양성', 0),
+('性', '兩性', '양성', 1),
+('兩', '兩性愛', '양성애', 0),
+('性', '兩性愛', '양성애', 1),
+('愛', '兩性愛', '양성애', 2),
+('兩', '兩性愛者', '양성애자', 0),
+('性', '兩性愛者', '양성애자', 1),
+('愛', '兩性愛者', '양성애자', 2),
+('者', '兩性愛者', '양성애자', 3),
+('兩', '兩棲類', '량서류', 0),
+('棲', '兩棲類', '량서류', 1),
+('類', '兩棲類', '량서류', 2),
+('兩', '兩棲類', '양서류', 0),
+('棲', '兩棲類', '양서류', 1),
+('類', '兩棲類', '양서류', 2),
+('兩', '兩江道', '량강도', 0),
+('江', '兩江道', '량강도', 1),
+('道', '兩江道', '량강도', 2),
+('兩', '兩班', '냥반', 0),
+('班', '兩班', '냥반', 1),
+('兩', '兩班', '량반', 0),
+('班', '兩班', '량반', 1),
+('兩', '兩班', '양반', 0),
+('班', '兩班', '양반', 1),
+('兩', '兩脚', '양각', 0),
+('脚', '兩脚', '양각', 1),
+('兩', '兩脚規', '양각규', 0),
+('脚', '兩脚規', '양각규', 1),
+('規', '兩脚規', '양각규', 2),
+('兩', '兩面', '양면', 0),
+('面', '兩面', '양면', 1),
+('兩', '兩팔', '양팔', 0),
+('팔', '兩팔', '양팔', 1),
+('八', '八', '팔', 0),
+('八', '八不用', '팔불용', 0),
+('不', '八不用', '팔불용', 1),
+('用', '八不用', '팔불용', 2),
+('八', '八分儀', '팔분의', 0),
+('分', '八分儀', '팔분의', 1),
+('儀', '八分儀', '팔분의', 2),
+('八', '八十', '팔십', 0),
+('十', '八十', '팔십', 1),
+('八', '八卦', '팔괘', 0),
+('卦', '八卦', '팔괘', 1),
+('八', '八卦掌', '팔괘장', 0),
+('卦', '八卦掌', '팔괘장', 1),
+('掌', '八卦掌', '팔괘장', 2),
+('八', '八字', '팔자', 0),
+('字', '八字', '팔자', 1),
+('八', '八寸', '팔촌', 0),
+('寸', '八寸', '팔촌', 1),
+('八', '八方', '팔방', 0),
+('方', '八方', '팔방', 1),
+('八', '八方美人', '팔방미인', 0),
+('方', '八方美人', '팔방미인', 1),
+('美', '八方美人', '팔방미인', 2),
+('人', '八方美人', '팔방미인', 3),
+('八', '八旬', '팔순', 0),
+('旬', '八旬', '팔순', 1),
+('八', '八旬老人', '팔순노인', 0),
+('旬', '八旬老人', '팔순노인', 1),
+('老', '八旬老人', '팔순노인', 2),
+('人', '八旬老人', '팔순노인', 3),
+('八', '八月', '8월', 0),
+('月', '八月', '8월', 1),
+('八', '八月', '팔월', 0),
+('月', '八月', '팔월', 1),
+('八', '八極拳', '팔극권', 0),
+('極', '八極拳', '팔극권', 1),
+('拳', '八極拳', '팔극권', 2),
+('八', '八紘一宇', '팔굉일우', 0),
+('紘', '八紘一宇', '팔굉일우', 1),
+('一', '八紘一宇', '팔굉일우', 2),
+('宇', '八紘一宇', '팔굉일우', 3),
+('八', '八色鳥', '팔색조', 0),
+('色', '八色鳥', '팔색조', 1),
+('鳥', '八色鳥', '팔색조', 2),
+('八', '八苦', '팔고', 0),
+('苦', '八苦', '팔고', 1),
+('八', '八表', '팔표', 0),
+('表', '八表', '팔표', 1),
+('八', '八角', '팔각', 0),
+('角', '八角', '팔각', 1),
+('八', '八角形', '팔각형', 0),
+('角', '八角形', '팔각형', 1),
+('形', '八角形', '팔각형', 2),
+('八', '八識', '팔식', 0),
+('識', '八識', '팔식', 1),
+('八', '八道', '팔도', 0),
+('道', '八道', '팔도', 1),
+('八', '八邊形', '팔변형', 0),
+('邊', '八邊形', '팔변형', 1),
+('形', '八邊形', '팔변형', 2),
+('八', '八面六臂', '팔면육비', 0),
+('面', '八面六臂', '팔면육비', 1),
+('六', '八面六臂', '팔면육비', 2),
+('臂', '八面六臂', '팔면육비', 3),
+('公', '公主', '공주', 0),
+('主', '公主', '공주', 1),
+('公', '公主病', '공주병', 0),
+('主', '公主病', '공주병', 1),
+('病', '公主病', '공주병', 2),
+('公', '公事', '공사', 0),
+('事', '公事', '공사', 1),
+('公', '公人', '공인', 0),
+('人', '公人', '공인', 1),
+('公', '公休', '공휴', 0),
+('休', '公休', '공휴', 1),
+('公', '公休日', '공휴일', 0),
+('休', '公休日', '공휴일', 1),
+('日', '公休日', '공휴일', 2),
+('公', '公倍數', '공배수', 0),
+('倍', '公倍數', '공배수', 1),
+('數', '公倍數', '공배수', 2),
+('公', '公債', '공채', 0),
+('債', '公債', '공채', 1),
+('公', '公共', '공공', 0),
+('共', '公共', '공공', 1),
+('公', '公分母', '공분모', 0),
+('分', '公分母', '공분모', 1),
+('母', '公分母', '공분모', 2),
+('公', '公判', '공판', 0),
+('判', '公判', '공판', 1),
+('公', '公務', '공무', 0),
+('務', '公務', '공무', 1),
+('公', '公務員', '공무원', 0),
+('務', '公務員', '공무원', 1),
+('員', '公務員', '공무원', 2),
+('公', '公卿', '공경', 0),
+('卿', '公卿', '공경', 1),
+('公', '公告', '공고', 0),
+('告', '公告', '공고', 1),
+('公', '公國', '공국', 0),
+('國', '公國', '공국', 1),
+('公', '公園', '공원', 0),
+('園', '公園', '공원', 1),
+('公', '公團', '공단', 0),
+('團', '公團', '공단', 1),
+('公', '公報', '공보', 0),
+('報', '公報', '공보', 1),
+('公', '公報院', '공보원', 0),
+('報', '公報院', '공보원', 1),
+('院', '公報院', '공보원', 2),
+('公', '公娼街', '공창가', 0),
+('娼', '公娼街', '공창가', 1),
+('街', '公娼街', '공창가', 2),
+('公', '公安', '공안', 0),
+('安', '公安', '공안', 1),
+('公', '公定', '공정', 0),
+('定', '公定', '공정', 1),
+('公', '公害', '공해', 0),
+('害', '公害', '공해', 1),
+('公', '公差', '공차', 0),
+('差', '公差', '공차', 1),
+('公', '公布', '공포', 0),
+('布', '公布', '공포', 1),
+('公', '公平', '공평', 0),
+('平', '公平', '공평', 1),
+('公', '公式', '공식', 0),
+('式', '公式', '공식', 1),
+('公', '公式的', '공식적', 0),
+('式', '公式的', '공식적', 1),
+('的', '公式的', '공식적', 2),
+('公', '公式語', '공식어', 0),
+('式', '公式語', '공식어', 1),
+('語', '公式語', '공식어', 2),
+('公', '公德', '공덕', 0),
+('德', '公德', '공덕', 1),
+('公', '公憤', '공분', 0),
+('憤', '公憤', '공분', 1),
+('公', '公敵', '공적', 0),
+('敵', '公敵', '공적', 1),
+('公', '公文書', '공문서', 0),
+('文', '公文書', '공문서', 1),
+('書', '公文書', '공문서', 2),
+('公', '公有', '공유', 0),
+('有', '公有', '공유', 1),
+('公', '公案', '공안', 0),
+('案', '公案', '공안', 1),
+('公', '公權', '공권', 0),
+('權', '公權', '공권', 1),
+('公', '公正', '공정', 0),
+('正', '公正', '공정', 1),
+('公', '公正價', '공정가', 0),
+('正', '公正價', '공정가', 1),
+('價', '公正價', '공정가', 2),
+('公', '公正去來', '공정거래', 0),
+('正', '公正去來', '공정거래', 1),
+('去', '公正去來', '공정거래', 2),
+('來', '公正去來', '공정거래', 3),
+('公', '公民', '공민', 0),
+('民', '公民', '공민', 1),
+('公', '公民權', '공민권', 0),
+('民', '公民權', '공민권', 1),
+('權', '公民權', '공민권', 2),
+('公', '公民證', '공민증', 0),
+('民', '公民證', '공민증', 1),
+('證', '公民證', '공민증', 2),
+('公', '公法', '공법', 0),
+('法', '公法', '공법', 1),
+('公', '公海', '공해', 0),
+('海', '公海', '공해', 1),
+('公', '公演', '공연', 0),
+('演', '公演', '공연', 1),
+('公', '公演場', '공연장', 0),
+('演', '公演場', '공연장', 1),
+('場', '公演場', '공연장', 2),
+('公', '公營', '공영', 0),
+('營', '公營', '공영', 1),
+('公', '公爵', '공작', 0),
+('爵', '公爵', '공작', 1),
+('公', '公物', '공물', 0),
+('物', '公物', '공물', 1),
+('公', '公理', '공리', 0),
+('理', '公理', '공리', 1),
+('公', '公用語', '공용어', 0),
+('用', '公用語', '공용어', 1),
+('語', '公用語', '공용어', 2),
+('公', '公的', '공적', 0),
+('的', '公的', '공적', 1),
+('公', '公益', '공익', 0),
+('益', '公益', '공익', 1),
+('公', '公知', '공지', 0),
+('知', '公知', '공지', 1),
+('公', '公社', '공사', 0),
+('社', '公社', '공사', 1),
+('公', '公私', '공사', 0),
+('私', '公私', '공사', 1),
+('公', '公立', '공립', 0),
+('立', '公立', '공립', 1),
+('公', '公約', '공약', 0),
+('約', '公約', '공약', 1),
+('公', '公職', '공직', 0),
+('職', '公職', '공직', 1),
+('公', '公職者', '공직자', 0),
+('職', '公職者', '공직자', 1),
+('者', '公職者', '공직자', 2),
+('公', '公聽會', '공청회', 0),
+('聽', '公聽會', '공청회', 1),
+('會', '公聽會', '공청회', 2),
+('公', '公薦', '공천', 0),
+('薦', '公薦', '공천', 1),
+('公', '公衆', '공중', 0),
+('衆', '公衆', '공중', 1),
+('公', '公衆電話', '공중전화', 0),
+('衆', '公衆電話', '공중전화', 1),
+('電', '公衆電話', '공중전화', 2),
+('話', '公衆電話', '공중전화', 3),
+('公', '公表', '공표', 0),
+('表', '公表', '공표', 1),
+('公', '公言', '공언', 0),
+('言', '公言', '공언', 1),
+('公', '公訴', '공소', 0),
+('訴', '公訴', '공소', 1),
+('公', '公認', '공인', 0),
+('認', '公認', '공인', 1),
+('公', '公證人', '공증인', 0),
+('證', '公證人', '공증인', 1),
+('人', '公證人', '공증인', 2),
+('公', '公賣', '공매', 0),
+('賣', '公賣', '공매', 1),
+('公', '公路', '공로', 0),
+('路', '公路', '공로', 1),
+('公', '公金', '공금', 0),
+('金', '公金', '공금', 1),
+('公', '公開', '공개', 0),
+('開', '公開', '공개', 1),
+('六', '六', '륙', 0),
+('六', '六九', '육구', 0),
+('九', '六九', '육구', 1),
+('六', '六二五戰爭', '육이오전쟁', 0),
+('二', '六二五戰爭', '육이오전쟁', 1),
+('五', '六二五戰爭', '육이오전쟁', 2),
+('戰', '六二五戰爭', '육이오전쟁', 3),
+('爭', '六二五戰爭', '육이오전쟁', 4),
+('六', '六分儀', '육분의', 0),
+('分', '六分儀', '육분의', 1),
+('儀', '六分儀', '육분의', 2),
+('六', '六十', '륙십', 0),
+('十', '六十', '륙십', 1),
+('六', '六大州', '륙대륙', 0),
+('大', '六大州', '륙대륙', 1),
+('州', '六大州', '륙대륙', 2),
+('六', '六大州', '육대륙', 0),
+('大', '六大州', '육대륙', 1),
+('州', '六大州', '육대륙', 2),
+('六', '六大洲', '육대주', 0),
+('大', '六大洲', '육대주', 1),
+('洲', '六大洲', '육대주', 2),
+('六', '六字大明王眞言', '육자대명왕진언', 0),
+('字', '六字大明王眞言', '육자대명왕진언', 1),
+('大', '六字大明王眞言', '육자대명왕진언', 2),
+('明', '六字大明王眞言', '육자대명왕진언', 3),
+('王', '六字大明王眞言', '육자대명왕진언', 4),
+('眞', '六字大明王眞言', '육자대명왕진언', 5),
+('言', '六字大明王眞言', '육자대명왕진언', 6),
+('六', '六字眞言', '육자진언', 0),
+('字', '六字眞言', '육자진언', 1),
+('眞', '六字眞言', '육자진언', 2),
+('言', '六字眞言', '육자진언', 3),
+('六', '六寸', '육촌', 0),
+('寸', '六寸', '육촌', 1),
+('六', '六德', '육덕', 0),
+('德', '六德', '육덕', 1),
+('六', '六書', '육서', 0),
+('書', '六書', '육서', 1),
+('六', '六月', '6월', 0),
+('月', '六月', '6월', 1),
+('六', '六月', '류월', 0),
+('月', '六月', '류월', 1),
+('六', '六月', '유월', 0),
+('月', '六月', '유월', 1),
+('六', '六穴砲', '육혈포', 0),
+('穴', '六穴砲', '육혈포', 1),
+('砲', '六穴砲', '육혈포', 2),
+('六', '六角形', '륙각형', 0),
+('角', '六角形', '륙각형', 1),
+('形', '六角形', '륙각형', 2),
+('六', '六角形', '육각형', 0),
+('角', '六角形', '육각형', 1),
+('形', '六角形', '육각형', 2),
+('六', '六角水', '육각수', 0),
+('角', '六角水', '육각수', 1),
+('水', '六角水', '육각수', 2),
+('六', '六鎭方言', '륙진방언', 0),
+('鎭', '六鎭方言', '륙진방언', 1),
+('方', '六鎭方言', '륙진방언', 2),
+('言', '六鎭方言', '륙진방언', 3),
+('六', '六鎭方言', '육진방언', 0),
+('鎭', '六鎭方言', '육진방언', 1),
+('方', '六鎭方言', '육진방언', 2),
+('言', '六鎭方言', '육진방언', 3),
+('共', '共同', '공동', 0),
+('同', '共同', '공동', 1),
+('共', '共同 親權', '공동 친권', 0),
+('同', '共同 親權', '공동 친권', 1),
+('親', '共同 親權', '공동 친권', 3),
+('權', '共同 親權', '공동 친권', 4),
+('共', '共同 養育權', '공동 양육권', 0),
+('同', '共同 養育權', '공동 양육권', 1),
+('養', '共同 養育權', '공동 양육권', 3),
+('育', '共同 養育權', '공동 양육권', 4),
+('權', '共同 養育權', '공동 양육권', 5),
+('共', '共同體', '공동체', 0),
+('同', '共同體', '공동체', 1),
+('體', '共同體', '공동체', 2),
+('共', '共和', '공화', 0),
+('和', '共和', '공화', 1),
+('共', '共和國', '공화국', 0),
+('和', '共和國', '공화국', 1),
+('國', '共和國', '공화국', 2),
+('共', '共存', '공존', 0),
+('存', '共存', '공존', 1),
+('共', '共感', '공감', 0),
+('感', '共感', '공감', 1),
+('共', '共振', '공진', 0),
+('振', '共振', '공진', 1),
+('共', '共有', '공유', 0),
+('有', '共有', '공유', 1),
+('共', '共犯', '공범', 0),
+('犯', '共犯', '공범', 1),
+('共', '共犯者', '공범자', 0),
+('犯', '共犯者', '공범자', 1),
+('者', '共犯者', '공범자', 2),
+('共', '共生', '공생', 0),
+('生', '共生', '공생', 1),
+('共', '共産', '공산', 0),
+('産', '共産', '공산', 1),
+('共', '共産主義', '공산주의', 0),
+('産', '共産主義', '공산주의', 1),
+('主', '共産主義', '공산주의', 2),
+('義', '共産主義', '공산주의', 3),
+('共', '共産主義者', '공산주의자', 0),
+('産', '共産主義者', '공산주의자', 1),
+('主', '共産主義者', '공산주의자', 2),
+('義', '共産主義者', '공산주의자', 3),
+('者', '共産主義者', '공산주의자', 4),
+('共', '共産黨', '공산당', 0),
+('産', '共産黨', '공산당', 1),
+('黨', '共産黨', '공산당', 2),
+('共', '共用', '공용', 0),
+('用', '共用', '공용', 1),
+('共', '共編者', '공편자', 0),
+('編', '共編者', '공편자', 1),
+('者', '共編者', '공편자', 2),
+('共', '共著', '공저', 0),
+('著', '共著', '공저', 1),
+('共', '共謀', '공모', 0),
+('謀', '共謀', '공모', 1),
+('共', '共謀者', '공모자', 0),
+('謀', '共謀者', '공모자', 1),
+('者', '共謀者', '공모자', 2),
+('共', '共變', '공변', 0),
+('變', '共變', '공변', 1),
+('共', '共通', '공통', 0),
+('通', '共通', '공통', 1),
+('共', '共通點', '공통점', 0),
+('通', '共通點', '공통점', 1),
+('點', '共通點', '공통점', 2),
+('共', '共鳴', '공명', 0),
+('鳴', '共鳴', '공명', 1),
+('兵', '兵', '병', 0),
+('兵', '兵丁', '병정', 0),
+('丁', '兵丁', '병정', 1),
+('兵', '兵卒', '병졸', 0),
+('卒', '兵卒', '병졸', 1),
+('兵', '兵員', '병원', 0),
+('員', '兵員', '병원', 1),
+('兵', '兵器', '병기', 0),
+('器', '兵器', '병기', 1),
+('兵', '兵器庫', '병기고', 0),
+('器', '兵器庫', '병기고', 1),
+('庫', '兵器庫', '병기고', 2),
+('兵', '兵器廠', '병기창', 0),
+('器', '兵器廠', '병기창', 1),
+('廠', '兵器廠', '병기창', 2),
+('兵', '兵士', '병사', 0),
+('士', '兵士', '병사', 1),
+('兵', '兵役', '병역', 0),
+('役', '兵役', '병역', 1),
+('兵', '兵法', '병법', 0),
+('法', '兵法', '병법', 1),
+('兵', '兵營', '병영', 0),
+('營', '兵營', '병영', 1),
+('兵', '兵長', '병장', 0),
+('長', '兵長', '병장', 1),
+('兵', '兵隊', '병대', 0),
+('隊', '兵隊', '병대', 1),
+('其', '其他', '기타', 0),
+('他', '其他', '기타', 1),
+('其', '其實', '기실', 0),
+('實', '其實', '기실', 1),
+('具', '具格', '구격', 0),
+('格', '具格', '구격', 1),
+('具', '具現', '구현', 0),
+('現', '具現', '구현', 1),
+('具', '具申', '구신', 0),
+('申', '具申', '구신', 1),
+('具', '具體的', '구체적', 0),
+('體', '具體的', '구체적', 1),
+('的', '具體的', '구체적', 2),
+('典', '典型', '전형', 0),
+('型', '典型', '전형', 1),
+('典', '典型的', '전형적', 0),
+('型', '典型的', '전형적', 1),
+('的', '典型的', '전형적', 2),
+('典', '典當鋪', '전당포', 0),
+('當', '典當鋪', '전당포', 1),
+('鋪', '典當鋪', '전당포', 2),
+('典', '典禮', '전례', 0),
+('禮', '典禮', '전례', 1),
+('兼', '兼', '겸', 0),
+('兼', '兼勤', '겸근', 0),
+('勤', '兼勤', '겸근', 1),
+('兼', '兼用', '겸용', 0),
+('用', '兼用', '겸용', 1),
+('内', '内部者 去來', '내부자 거래', 0),
+('部', '内部者 去來', '내부자 거래', 1),
+('者', '内部者 去來', '내부자 거래', 2),
+('去', '内部者 去來', '내부자 거래', 4),
+('來', '内部者 去來', '내부자 거래', 5),
+('冊', '冊', '책', 0),
+('冊', '冊--', '책가방', 0),
+('-', '冊--', '책가방', 1),
+('-', '冊--', '책가방', 2),
+('冊', '冊子', '책자', 0),
+('子', '冊子', '책자', 1),
+('冊', '冊床', '책상', 0),
+('床', '冊床', '책상', 1),
+('冊', '冊房', '책방', 0),
+('房', '冊房', '책방', 1),
+('冊', '冊欌', '책장', 0),
+('欌', '冊欌', '책장', 1),
+('再', '再交付', '재교부', 0),
+('交', '再交付', '재교부', 1),
+('付', '再交付', '재교부', 2),
+('再', '再出發', '재출발', 0),
+('出', '再出發', '재출발', 1),
+('發', '再出發', '재출발', 2),
+('再', '再割引', '재할인', 0),
+('割', '再割引', '재할인', 1),
+('引', '再割引', '재할인', 2),
+('再', '再吟味', '재음미', 0),
+('吟', '再吟味', '재음미', 1),
+('味', '再吟味', '재음미', 2),
+('再', '再審', '재심', 0),
+('審', '再審', '재심', 1),
+('再', '再建', '재건', 0),
+('建', '再建', '재건', 1),
+('再', '再投資', '재투자', 0),
+('投', '再投資', '재투자', 1),
+('資', '再投資', '재투자', 2),
+('再', '再拜', '재배', 0),
+('拜', '再拜', '재배', 1),
+('再', '再搜査', '재수사', 0),
+('搜', '再搜査', '재수사', 1),
+('査', '再搜査', '재수사', 2),
+('再', '再放', '재방', 0),
+('放', '再放', '재방', 1),
+('再', '再昨年', '재작년', 0),
+('昨', '再昨年', '재작년', 1),
+('年', '再昨年', '재작년', 2),
+('再', '再會', '재회', 0),
+('會', '再會', '재회', 1),
+('再', '再構', '재구', 0),
+('構', '再構', '재구', 1),
+('再', '再檢討', '재검토', 0),
+('檢', '再檢討', '재검토', 1),
+('討', '再檢討', '재검토', 2),
+('再', '再武裝', '재무장', 0),
+('武', '再武裝', '재무장', 1),
+('裝', '再武裝', '재무장', 2),
+('再', '再歸', '재귀', 0),
+('歸', '再歸', '재귀', 1),
+('再', '再活用', '재활용', 0),
+('活', '再活用', '재활용', 1),
+('用', '再活用', '재활용', 2),
+('再', '再活用品', '재활용품', 0),
+('活', '再活用品', '재활용품', 1),
+('用', '再活用品', '재활용품', 2),
+('品', '再活用品', '재활용품', 3),
+('再', '再現', '재현', 0),
+('現', '再現', '재현', 1),
+('再', '再生', '재생', 0),
+('生', '再生', '재생', 1),
+('再', '再生産', '재생산', 0),
+('生', '再生産', '재생산', 1),
+('産', '再生産', '재생산', 2),
+('再', '再發', '재발', 0),
+('發', '再發', '재발', 1),
+('再', '再確認', '재확인', 0),
+('確', '再確認', '재확인', 1),
+('認', '再確認', '재확인', 2),
+('再', '再考', '재고', 0),
+('考', '再考', '재고', 1),
+('再', '再評價', '재평가', 0),
+('評', '再評價', '재평가', 1),
+('價', '再評價', '재평가', 2),
+('再', '再軍備', '재군비', 0),
+('軍', '再軍備', '재군비', 1),
+('備', '再軍備', '재군비', 2),
+('冒', '冒瀆', '모독', 0),
+('瀆', '冒瀆', '모독', 1),
+('冒', '冒用', '모용', 0),
+('用', '冒用', '모용', 1),
+('冒', '冒險', '모험', 0),
+('險', '冒險', '모험', 1),
+('冒', '冒險家', '모험가', 0),
+('險', '冒險家', '모험가', 1),
+('家', '冒險家', '모험가', 2),
+('冒', '冒險者', '모험자', 0),
+('險', '冒險者', '모험자', 1),
+('者', '冒險者', '모험자', 2),
+('冒', '冒頭', '모두', 0),
+('頭', '冒頭', '모두', 1),
+('冠', '冠岳山', '관악산', 0),
+('岳', '冠岳山', '관악산', 1),
+('山', '冠岳山', '관악산', 2),
+('冠', '冠形詞', '관형사', 0),
+('形', '冠形詞', '관형사', 1),
+('詞', '冠形詞', '관형사', 2),
+('冠', '冠水', '관수', 0),
+('水', '冠水', '관수', 1),
+('冠', '冠狀動脈', '관상동맥', 0),
+('狀', '冠狀動脈', '관상동맥', 1),
+('動', '冠狀動脈', '관상동맥', 2),
+('脈', '冠狀動脈', '관상동맥', 3),
+('冠', '冠狀動脈疾患', '관상동맥질환', 0),
+('狀', '冠狀動脈疾患', '관상동맥질환', 1),
+('動', '冠狀動脈疾患', '관상동맥질환', 2),
+('脈', '冠狀動脈疾患', '관상동맥질환', 3),
+('疾', '冠狀動脈疾患', '관상동맥질환', 4),
+('患', '冠狀動脈疾患', '관상동맥질환', 5),
+('冠', '冠者', '관자', 0),
+('者', '冠者', '관자', 1),
+('冠', '冠詞', '관사', 0),
+('詞', '冠詞', '관사', 1),
+('冠', '冠수리', '관수리', 0),
+('수', '冠수리', '관수리', 1),
+('리', '冠수리', '관수리', 2),
+('冥', '冥想', '명상', 0),
+('想', '冥想', '명상', 1),
+('冥', '冥王星', '명왕성', 0),
+('王', '冥王星', '명왕성', 1),
+('星', '冥王星', '명왕성', 2),
+('冥', '冥界', '명계', 0),
+('界', '冥界', '명계', 1),
+('冬', '冬', '동', 0),
+('冬', '冬季', '동계', 0),
+('季', '冬季', '동계', 1),
+('冬', '冬宮', '동궁', 0),
+('宮', '冬宮', '동궁', 1),
+('冬', '冬服', '동복', 0),
+('服', '冬服', '동복', 1),
+('冬', '冬柏', '동백', 0),
+('柏', '冬柏', '동백', 1),
+('冬', '冬眠', '동면', 0),
+('眠', '冬眠', '동면', 1),
+('冬', '冬至', '동지', 0),
+('至', '冬至', '동지', 1),
+('冬', '冬菊', '동국', 0),
+('菊', '冬菊', '동국', 1),
+('冰', '冰上館', '빙상관', 0),
+('上', '冰上館', '빙상관', 1),
+('館', '冰上館', '빙상관', 2),
+('冶', '冶', '야', 0),
+('冶', '冶動', '야동', 0),
+('動', '冶動', '야동', 1),
+('冶', '冶說', '야설', 0),
+('說', '冶說', '야설', 1),
+('冷', '冷', '냉', 0),
+('冷', '冷凍', '냉동', 0),
+('凍', '冷凍', '냉동', 1),
+('冷', '冷凍庫', '냉동고', 0),
+('凍', '冷凍庫', '냉동고', 1),
+('庫', '冷凍庫', '냉동고', 2),
+('冷', '冷凍機', '랭동기', 0),
+('凍', '冷凍機', '랭동기', 1),
+('機', '冷凍機', '랭동기', 2),
+('冷', '冷凍食品', '냉동식품', 0),
+('凍', '冷凍食品', '냉동식품', 1),
+('食', '冷凍食品', '냉동식품', 2),
+('品', '冷凍食品', '냉동식품', 3),
+('冷', '冷却', '냉각', 0),
+('却', '冷却', '냉각', 1),
+('冷', '冷却器', '냉각기', 0),
+('却', '冷却器', '냉각기', 1),
+('器', '冷却器', '냉각기', 2),
+('冷', '冷却塔', '냉각탑', 0),
+('却', '冷却塔', '냉각탑', 1),
+('塔', '冷却塔', '냉각탑', 2),
+('冷', '冷戰', '냉전', 0),
+('戰', '冷戰', '냉전', 1),
+('冷', '冷房', '냉방', 0),
+('房', '冷房', '냉방', 1),
+('冷', '冷氣', '냉기', 0),
+('氣', '冷氣', '냉기', 1),
+('冷', '冷水', '냉수', 0),
+('水', '冷水', '냉수', 1),
+('冷', '冷淡', '냉담', 0),
+('淡', '冷淡', '냉담', 1),
+('冷', '冷然', '냉연', 0),
+('然', '冷然', '냉연', 1),
+('冷', '冷笑', '냉소', 0),
+('笑', '冷笑', '냉소', 1),
+('冷', '冷藏庫', '냉장고', 0),
+('藏', '冷藏庫', '냉장고', 1),
+('庫', '冷藏庫', '냉장고', 2),
+('冷', '冷藏庫', '랭장고', 0),
+('藏', '冷藏庫', '랭장고', 1),
+('庫', '冷藏庫', '랭장고', 2),
+('冷', '冷血', '냉혈', 0),
+('血', '冷血', '냉혈', 1),
+('冷', '冷血', '랭혈', 0),
+('血', '冷血', '랭혈', 1),
+('冷', '冷血動物', '냉혈동물', 0),
+('血', '冷血動物', '냉혈동물', 1),
+('動', '冷血動物', '냉혈동물', 2),
+('物', '冷血動物', '냉혈동물', 3),
+('冷', '冷酷', '냉혹', 0),
+('酷', '冷酷', '냉혹', 1),
+('冷', '冷靜', '냉정', 0),
+('靜', '冷靜', '냉정', 1),
+('冷', '冷麵', '냉면', 0),
+('麵', '冷麵', '냉면', 1),
+('冷', '冷麵', '랭면', 0),
+('麵', '冷麵', '랭면', 1),
+('凄', '凄切', '처절', 0),
+('切', '凄切', '처절', 1),
+('准', '准將', '준장', 0),
+('將', '准將', '준장', 1),
+('凌', '凌虐', '능학', 0),
+('虐', '凌虐', '능학', 1),
+('凌', '凌遲', '능지', 0),
+('遲', '凌遲', '능지', 1),
+('凌', '凌霄花', '능소화', 0),
+('霄', '凌霄花', '능소화', 1),
+('花', '凌霄花', '능소화', 2),
+('凌', '凌駕', '능가', 0),
+('駕', '凌駕', '능가', 1),
+('凍', '凍傷', '동상', 0),
+('傷', '凍傷', '동상', 1),
+('凍', '凍害', '동해', 0),
+('害', '凍害', '동해', 1),
+('凍', '凍死', '동사', 0),
+('死', '凍死', '동사', 1),
+('凍', '凍瘡', '동창', 0),
+('瘡', '凍瘡', '동창', 1),
+('凍', '凍石', '동석', 0),
+('石', '凍石', '동석', 1),
+('凍', '凍結', '동결', 0),
+('結', '凍結', '동결', 1),
+('凝', '凝灰岩', '응회암', 0),
+('灰', '凝灰岩', '응회암', 1),
+('岩', '凝灰岩', '응회암', 2),
+('凝', '凝然', '응연', 0),
+('然', '凝然', '응연', 1),
+('凝', '凝結', '응결', 0),
+('結', '凝結', '응결', 1),
+('凝', '凝縮', '응축', 0),
+('縮', '凝縮', '응축', 1),
+('凝', '凝視', '응시', 0),
+('視', '凝視', '응시', 1),
+('凝', '凝集力', '응집력', 0),
+('集', '凝集力', '응집력', 1),
+('力', '凝集力', '응집력', 2),
+('凡', '凡例', '범례', 0),
+('例', '凡例', '범례', 1),
+('凡', '凡夫', '범부', 0),
+('夫', '凡夫', '범부', 1),
+('凡', '凡性愛', '범성애', 0),
+('性', '凡性愛', '범성애', 1),
+('愛', '凡性愛', '범성애', 2),
+('凱', '凱旋', '개선', 0),
+('旋', '凱旋', '개선', 1),
+('凱', '凱旋門', '개선문', 0),
+('旋', '凱旋門', '개선문', 1),
+('門', '凱旋門', '개선문', 2),
+('凶', '凶', '흉', 0),
+('凶', '凶事', '흉사', 0),
+('事', '凶事', '흉사', 1),
+('凶', '凶器', '흉기', 0),
+('器', '凶器', '흉기', 1),
+('凶', '凶年', '흉년', 0),
+('年', '凶年', '흉년', 1),
+('凹', '凹面', '요면', 0),
+('面', '凹面', '요면', 1),
+('出', '出世', '출세', 0),
+('世', '出世', '출세', 1),
+('出', '出入', '출입', 0),
+('入', '出入', '출입', 1),
+('出', '出入口', '출입구', 0),
+('入', '出入口', '출입구', 1),
+('口', '出入口', '출입구', 2),
+('出', '出入國', '출입국', 0),
+('入', '出入國', '출입국', 1),
+('國', '出入國', '출입국', 2),
+('出', '出入門', '출입문', 0),
+('入', '出入門', '출입문', 1),
+('門', '出入門', '출입문', 2),
+('出', '出典', '출전', 0),
+('典', '出典', '출전', 1),
+('出', '出力', '출력', 0),
+('力', '出力', '출력', 1),
+('出', '出動', '출동', 0),
+('動', '出動', '출동', 1),
+('出', '出勤', '출근', 0),
+('勤', '出勤', '출근', 1),
+('出', '出口', '출구', 0),
+('口', '出口', '출구', 1),
+('出', '出品', '출품', 0),
+('品', '出品', '출품', 1),
+('出', '出品者', '출품자', 0),
+('品', '出品者', '출품자', 1),
+('者', '出品者', '출품자', 2),
+('出', '出國', '출국', 0),
+('國', '出國', '출국', 1),
+('出', '出土', '출토', 0),
+('土', '出土', '출토', 1),
+('出', '出埃及記', '출애굽기', 0),
+('埃', '出埃及記', '출애굽기', 1),
+('及', '出埃及記', '출애굽기', 2),
+('記', '出埃及記', '출애굽기', 3),
+('出', '出場', '출장', 0),
+('場', '出場', '출장', 1),
+('出', '出壘', '출루', 0),
+('壘', '出壘', '출루', 1),
+('出', '出壘率', '출루율', 0),
+('壘', '出壘率', '출루율', 1),
+('率', '出壘率', '출루율', 2),
+('出', '出嫁', '출가', 0),
+('嫁', '出嫁', '출가', 1),
+('出', '出家', '출가', 0),
+('家', '出家', '출가', 1),
+('出', '出帆', '출범', 0),
+('帆', '出帆', '출범', 1),
+('出', '出席', '출석', 0),
+('席', '出席', '출석', 1),
+('出', '出張', '출장', 0),
+('張', '出張', '출장', 1),
+('出', '出張所', '출장소', 0),
+('張', '出張所', '출장소', 1),
+('所', '出張所', '출장소', 2),
+('出', '出捐', '출연', 0),
+('捐', '出捐', '출연', 1),
+('出', '出港', '출항', 0),
+('港', '出港', '출항', 1),
+('出', '出演', '출연', 0),
+('演', '出演', '출연', 1),
+('出', '出版', '출판', 0),
+('版', '出版', '출판', 1),
+('出', '出版物', '출판물', 0),
+('版', '出版物', '출판물', 1),
+('物', '出版物', '출판물', 2),
+('出', '出版社', '출판사', 0),
+('版', '出版社', '출판사', 1),
+('社', '出版社', '출판사', 2),
+('出', '出現', '출현', 0),
+('現', '出現', '출현', 1),
+('出', '出生', '출생', 0),
+('生', '出生', '출생', 1),
+('出', '出生地', '출생지', 0),
+('生', '出生地', '출생지', 1),
+('地', '出生地', '출생지', 2),
+('出', '出生日', '출생일', 0),
+('生', '出生日', '출생일', 1),
+('日', '出生日', '출생일', 2),
+('出', '出産', '출산', 0),
+('産', '出産', '출산', 1),
+('出', '出産率', '출산율', 0),
+('産', '出産率', '출산율', 1),
+('率', '出産率', '출산율', 2),
+('出', '出發', '출발', 0),
+('發', '出發', '출발', 1),
+('出', '出發地', '출발지', 0),
+('發', '出發地', '출발지', 1),
+('地', '出發地', '출발지', 2),
+('出', '出發點', '출발점', 0),
+('發', '出發點', '출발점', 1),
+('點', '出發點', '출발점', 2),
+('出', '出納', '출납', 0),
+('納', '出納', '출납', 1),
+('出', '出納係', '출납계', 0),
+('納', '出納係', '출납계', 1),
+('係', '出納係', '출납계', 2),
+('出', '出荷', '출하', 0),
+('荷', '出荷', '출하', 1),
+('出', '出處', '출처', 0),
+('處', '出處', '출처', 1),
+('出', '出血', '출혈', 0),
+('血', '出血', '출혈', 1),
+('出', '出費', '출비', 0),
+('費', '出費', '출비', 1),
+('出', '出資', '출자', 0),
+('資', '出資', '출자', 1),
+('出', '出身', '출신', 0),
+('身', '出身', '출신', 1),
+('出', '出身成分', '출신성분', 0),
+('身', '出身成分', '출신성분', 1),
+('成', '出身成分', '출신성분', 2),
+('分', '出身成分', '출신성분', 3),
+('出', '出退勤', '출퇴근', 0),
+('退', '出退勤', '출퇴근', 1),
+('勤', '出退勤', '출퇴근', 2),
+('出', '出金', '출금', 0),
+('金', '出金', '출금', 1),
+('出', '出頭', '출두', 0),
+('頭', '出頭', '출두', 1),
+('出', '出願者', '출원자', 0),
+('願', '出願者', '출원자', 1),
+('者', '出願者', '출원자', 2),
+('函', '函', '함', 0),
+('函', '函數', '함수', 0),
+('數', '函數', '함수', 1),
+('刀', '刀劍', '도검', 0),
+('劍', '刀劍', '도검', 1),
+('刀', '刀子', '도자', 0),
+('子', '刀子', '도자', 1),
+('分', '分', '분', 0),
+('分', '分', '푼', 0),
+('分', '分光', '분광', 0),
+('光', '分光', '분광', 1),
+('分', '分光器', '분광기', 0),
+('光', '分光器', '분광기', 1),
+('器', '分光器', '분광기', 2),
+('分', '分光學', '분광학', 0),
+('光', '分光學', '분광학', 1),
+('學', '分光學', '분광학', 2),
+('分', '分冊', '분책', 0),
+('冊', '分冊', '분책', 1),
+('分', '分別', '분별', 0),
+('別', '分別', '분별', 1),
+('分', '分割', '분할', 0),
+('割', '分割', '분할', 1),
+('分', '分娩', '분만', 0),
+('娩', '分娩', '분만', 1),
+('分', '分子', '분자', 0),
+('子', '分子', '분자', 1),
+('分', '分子動力學', '분자동역학', 0),
+('子', '分子動力學', '분자동역학', 1),
+('動', '分子動力學', '분자동역학', 2),
+('力', '分子動力學', '분자동역학', 3),
+('學', '分子動力學', '분자동역학', 4),
+('分', '分子生物學', '분자생물학', 0),
+('子', '分子生物學', '분자생물학', 1),
+('生', '分子生物學', '분자생물학', 2),
+('物', '分子生物學', '분자생물학', 3),
+('學', '分子生物學', '분자생물학', 4),
+('分', '分子體', '분자체', 0),
+('子', '分子體', '분자체', 1),
+('體', '分子體', '분자체', 2),
+('分', '分岐', '분기', 0),
+('岐', '分岐', '분기', 1),
+('分', '分布', '분포', 0),
+('布', '分布', '분포', 1),
+('分', '分揀', '분간', 0),
+('揀', '分揀', '분간', 1),
+('分', '分散', '분산', 0),
+('散', '分散', '분산', 1),
+('分', '分數', '분수', 0),
+('數', '分數', '분수', 1),
+('分', '分斷', '분단', 0),
+('斷', '分斷', '분단', 1),
+('分', '分明', '분명', 0),
+('明', '分明', '분명', 1),
+('分', '分會', '분회', 0),
+('會', '分會', '분회', 1),
+('分', '分期', '분기', 0),
+('期', '分期', '분기', 1),
+('分', '分析', '분석', 0),
+('析', '分析', '분석', 1),
+('分', '分析家', '분석자', 0),
+('析', '分析家', '분석자', 1),
+('家', '分析家', '분석자', 2),
+('分', '分析語', '분석어', 0),
+('析', '分析語', '분석어', 1),
+('語', '分析語', '분석어', 2),
+('分', '分枝', '분기', 0),
+('枝', '分枝', '분기', 1),
+('分', '分枝', '분지', 0),
+('枝', '分枝', '분지', 1),
+('分', '分枝化', '분지화', 0),
+('枝', '分枝化', '분지화', 1),
+('化', '分枝化', '분지화', 2),
+('分', '分校', '분교', 0),
+('校', '分校', '분교', 1),
+('分', '分權', '분권', 0),
+('權', '分權', '분권', 1),
+('分', '分段', '분단', 0),
+('段', '分段', '분단', 1),
+('分', '分母', '분모', 0),
+('母', '分母', '분모', 1),
+('分', '分水嶺', '분수령', 0),
+('水', '分水嶺', '분수령', 1),
+('嶺', '分水嶺', '분수령', 2),
+('分', '分泌物', '분비물', 0),
+('泌', '分泌物', '분비물', 1),
+('物', '分泌物', '분비물', 2),
+('分', '分派', '분파', 0),
+('派', '分派', '분파', 1),
+('分', '分溜', '분류', 0),
+('溜', '分溜', '분류', 1),
+('分', '分納', '분납', 0),
+('納', '分納', '분납', 1),
+('分', '分裂', '분열', 0),
+('裂', '分裂', '분열', 1),
+('分', '分解', '분해', 0),
+('解', '分解', '분해', 1),
+('分', '分詞', '분사', 0),
+('詞', '分詞', '분사', 1),
+('分', '分配', '분배', 0),
+('配', '分配', '분배', 1),
+('分', '分配者', '분배자', 0),
+('配', '分配者', '분배자', 1),
+('者', '分配者', '분배자', 2),
+('分', '分野', '분야', 0),
+('野', '分野', '분야', 1),
+('分', '分量', '분량', 0),
+('量', '分量', '분량', 1),
+('分', '分針', '분침', 0),
+('針', '分針', '분침', 1),
+('分', '分銅', '분동', 0),
+('銅', '分銅', '분동', 1),
+('分', '分隊', '분대', 0),
+('隊', '分隊', '분대', 1),
+('分', '分離', '분리', 0),
+('離', '分離', '분리', 1),
+('分', '分離', '불리', 0),
+('離', '分離', '불리', 1),
+('分', '分離主義', '분리주의', 0),
+('離', '分離主義', '분리주의', 1),
+('主', '分離主義', '분리주의', 2),
+('義', '分離主義', '분리주의', 3),
+('分', '分類', '분류', 0),
+('類', '分類', '분류', 1),
+('分', '分類學', '분류학', 0),
+('類', '分類學', '분류학', 1),
+('學', '分類學', '분류학', 2),
+('分', '分館', '분관', 0),
+('館', '分館', '분관', 1),
+('分', '分點', '분점', 0),
+('點', '分點', '분점', 1),
+('切', '切感', '절감', 0),
+('感', '切感', '절감', 1),
+('切', '切斷', '절단', 0),
+('斷', '切斷', '절단', 1),
+('切', '切斷魔功', '절단마공', 0),
+('斷', '切斷魔功', '절단마공', 1),
+('魔', '切斷魔功', '절단마공', 2),
+('功', '切斷魔功', '절단마공', 3),
+('切', '切望', '절망', 0),
+('望', '切望', '절망', 1),
+('切', '切片', '절편', 0),
+('片', '切片', '절편', 1),
+('切', '切迫', '절박', 0),
+('迫', '切迫', '절박', 1),
+('切', '切除', '절제', 0),
+('除', '切除', '절제', 1),
+('切', '切點', '절점', 0),
+('點', '切點', '절점', 1),
+('刈', '刈取機', '예취기', 0),
+('取', '刈取機', '예취기', 1),
+('機', '刈取機', '예취기', 2),
+('刊', '刊行', '간행', 0),
+('行', '刊行', '간행', 1),
+('刊', '刊行物', '간행물', 0),
+('行', '刊行物', '간행물', 1),
+('物', '刊行物', '간행물', 2),
+('刎', '刎頸', '문경', 0),
+('頸', '刎頸', '문경', 1),
+('刑', '刑', '형', 0),
+('刑', '刑事', '형사', 0),
+('事', '刑事', '형사', 1),
+('刑', '刑務所', '형무소', 0),
+('務', '刑務所', '형무소', 1),
+('所', '刑務所', '형무소', 2),
+('刑', '刑法', '형법', 0),
+('法', '刑法', '형법', 1),
+('刑', '刑法典', '형법전', 0),
+('法', '刑法典', '형법전', 1),
+('典', '刑法典', '형법전', 2),
+('刑', '刑罰', '형벌', 0),
+('罰', '刑罰', '형벌', 1),
+('刑', '刑部', '형부', 0),
+('部', '刑部', '형부', 1),
+('列', '列', '열', 0),
+('列', '列島', '렬도', 0),
+('島', '列島', '렬도', 1),
+('列', '列島', '열도', 0),
+('島', '列島', '열도', 1),
+('列', '列席', '열석', 0),
+('席', '列席', '열석', 1),
+('列', '列擧', '열거', 0),
+('擧', '列擧', '열거', 1),
+('列', '列氏', '렬씨', 0),
+('氏', '列氏', '렬씨', 1),
+('列', '列氏', '열씨', 0),
+('氏', '列氏', '열씨', 1),
+('列', '列車', '렬차', 0),
+('車', '列車', '렬차', 1),
+('列', '列車', '열차', 0),
+('車', '列車', '열차', 1),
+('列', '列邦', '열방', 0),
+('邦', '列邦', '열방', 1),
+('初', '初', '초', 0),
+('初', '初乳', '초유', 0),
+('乳', '初乳', '초유', 1),
+('初', '初代', '초대', 0),
+('代', '初代', '초대', 1),
+('初', '初夜', '초야', 0),
+('夜', '初夜', '초야', 1),
+('初', '初婚', '초혼', 0),
+('婚', '初婚', '초혼', 1),
+('初', '初心者', '초심자', 0),
+('心', '初心者', '초심자', 1),
+('者', '初心者', '초심자', 2),
+('初', '初旬', '초순', 0),
+('旬', '初旬', '초순', 1),
+('初', '初春', '초춘', 0),
+('春', '初春', '초춘', 1),
+('初', '初期', '초기', 0),
+('期', '初期', '초기', 1),
+('初', '初步', '초보', 0),
+('步', '初步', '초보', 1),
+('初', '初步者', '초보자', 0),
+('步', '初步者', '초보자', 1),
+('者', '初步者', '초보자', 2),
+('初', '初版', '초판', 0),
+('版', '初版', '초판', 1),
+('初', '初犯者', '초범자', 0),
+('犯', '初犯者', '초범자', 1),
+('者', '初犯者', '초범자', 2),
+('初', '初球', '초구', 0),
+('球', '初球', '초구', 1),
+('初', '初盤', '초반', 0),
+('盤', '初盤', '초반', 1),
+('初', '初秋', '초추', 0),
+('秋', '初秋', '초추', 1),
+('初', '初等', '초등', 0),
+('等', '初等', '초등', 1),
+('初', '初等學校', '초등학교', 0),
+('等', '初等學校', '초등학교', 1),
+('學', '初等學校', '초등학교', 2),
+('校', '初等學校', '초등학교', 3),
+('初', '初等學生', '초등학생', 0),
+('等', '初等學生', '초등학생', 1),
+('學', '初等學生', '초등학생', 2),
+('生', '初等學生', '초등학생', 3),
+('初', '初等敎育', '초등교육', 0),
+('等', '初等敎育', '초등교육', 1),
+('敎', '初等敎育', '초등교육', 2),
+('育', '初等敎育', '초등교육', 3),
+('初', '初級學校', '초급학교', 0),
+('級', '初級學校', '초급학교', 1),
+('學', '初級學校', '초급학교', 2),
+('校', '初級學校', '초급학교', 3),
+('初', '初老', '초로', 0),
+('老', '初老', '초로', 1),
+('初', '初聲', '초성', 0),
+('聲', '初聲', '초성', 1),
+('初', '初試', '초시', 0),
+('試', '初試', '초시', 1),
+('初', '初面', '초면', 0),
+('面', '初面', '초면', 1),
+('初', '初面人', '초면인', 0),
+('面', '初面人', '초면인', 1),
+('人', '初面人', '초면인', 2),
+('判', '判事', '판사', 0),
+('事', '判事', '판사', 1),
+('判', '判例', '판례', 0),
+('例', '判例', '판례', 1),
+('判', '判定', '판정', 0),
+('定', '判定', '판정', 1),
+('判', '判斷', '판단', 0),
+('斷', '判斷', '판단', 1),
+('判', '判斷力', '판단력', 0),
+('斷', '判斷力', '판단력', 1),
+('力', '判斷力', '판단력', 2),
+('判', '判決', '판결', 0),
+('決', '判決', '판결', 1),
+('別', '別', '별', 0),
+('別', '別-', '별로', 0),
+('-', '別-', '별로', 1),
+('別', '別-', '별일', 0),
+('-', '別-', '별일', 1),
+('別', '別---', '별다르다', 0),
+('-', '別---', '별다르다', 1),
+('-', '別---', '별다르다', 2),
+('-', '別---', '별다르다', 3),
+('別', '別世', '별세', 0),
+('世', '別世', '별세', 1),
+('別', '別別', '별별', 0),
+('別', '別別', '별별', 1),
+('別', '別名', '별명', 0),
+('名', '別名', '별명', 1),
+('別', '別室', '별실', 0),
+('室', '別室', '별실', 1),
+('別', '別居', '별거', 0),
+('居', '別居', '별거', 1),
+('別', '別有天地', '별유천지', 0),
+('有', '別有天地', '별유천지', 1),
+('天', '別有天地', '별유천지', 2),
+('地', '別有天地', '별유천지', 3),
+('別', '別稱', '별칭', 0),
+('稱', '別稱', '별칭', 1),
+('別', '別般', '별반', 0),
+('般', '別般', '별반', 1),
+('別', '別莊', '별장', 0),
+('莊', '別莊', '별장', 1),
+('別', '別途', '별도', 0),
+('途', '別途', '별도', 1),
+('別', '別館', '별관', 0),
+('館', '別館', '별관', 1),
+('別', '別로', '별로', 0),
+('로', '別로', '별로', 1),
+('別', '別일', '별일', 0),
+('일', '別일', '별일', 1),
+('利', '利', '이', 0),
+('利', '利原', '리원', 0),
+('原', '利原', '리원', 1),
+('利', '利原', '이원', 0),
+('原', '利原', '이원', 1),
+('利', '利子', '이자', 0),
+('子', '利子', '이자', 1),
+('利', '利害', '이해', 0),
+('害', '利害', '이해', 1),
+('利', '利害關係', '이해관계', 0),
+('害', '利害關係', '이해관계', 1),
+('關', '利害關係', '이해관계', 2),
+('係', '利害關係', '이해관계', 3),
+('利', '利尿劑', '이뇨제', 0),
+('尿', '利尿劑', '이뇨제', 1),
+('劑', '利尿劑', '이뇨제', 2),
+('利', '利己主義', '이기주의', 0),
+('己', '利己主義', '이기주의', 1),
+('主', '利己主義', '이기주의', 2),
+('義', '利己主義', '이기주의', 3),
+('利', '利己的', '리기적', 0),
+('己', '利己的', '리기적', 1),
+('的', '利己的', '리기적', 2),
+('利', '利己的', '이기적', 0),
+('己', '利己的', '이기적', 1),
+('的', '利己的', '이기적', 2),
+('利', '利得', '이득', 0),
+('得', '利得', '이득', 1),
+('利', '利息', '이식', 0),
+('息', '利息', '이식', 1),
+('利', '利文', '이문', 0),
+('文', '利文', '이문', 1),
+('利', '利條', '이조', 0),
+('條', '利條', '이조', 1),
+('利', '利權', '이권', 0),
+('權', '利權', '이권', 1),
+('利', '利潤', '이윤', 0),
+('潤', '利潤', '이윤', 1),
+('利', '利率', '이율', 0),
+('率', '利率', '이율', 1),
+('利', '利用', '이용', 0),
+('用', '利用', '이용', 1),
+('利', '利用約款', '이용약관', 0),
+('用', '利用約款', '이용약관', 1),
+('約', '利用約款', '이용약관', 2),
+('款', '利用約款', '이용약관', 3),
+('利', '利用者', '리용자', 0),
+('用', '利用者', '리용자', 1),
+('者', '利用者', '리용자', 2),
+('利', '利用者', '이용자', 0),
+('用', '利用者', '이용자', 1),
+('者', '利用者', '이용자', 2),
+('利', '利益', '이익', 0),
+('益', '利益', '이익', 1),
+('利', '利達', '이달', 0),
+('達', '利達', '이달', 1),
+('利', '利點', '이점', 0),
+('點', '利點', '이점', 1),
+('到', '到底', '도저', 0),
+('底', '到底', '도저', 1),
+('到', '到着', '도착', 0),
+('着', '到着', '도착', 1),
+('到', '到達', '도달', 0),
+('達', '到達', '도달', 1),
+('制', '制動', '제동', 0),
+('動', '制動', '제동', 1),
+('制', '制動機', '제동기', 0),
+('動', '制動機', '제동기', 1),
+('機', '制動機', '제동기', 2),
+('制', '制壓', '제압', 0),
+('壓', '制壓', '제압', 1),
+('制', '制定', '제정', 0),
+('定', '制定', '제정', 1),
+('制', '制度', '제도', 0),
+('度', '制度', '제도', 1),
+('制', '制御', '제어', 0),
+('御', '制御', '제어', 1),
+('制', '制服', '제복', 0),
+('服', '制服', '제복', 1),
+('制', '制止', '제지', 0),
+('止', '制止', '제지', 1),
+('制', '制球力', '제구력', 0),
+('球', '制球力', '제구력', 1),
+('力', '制球力', '제구력', 2),
+('制', '制約', '제약', 0),
+('約', '制約', '제약', 1),
+('制', '制裁', '제재', 0),
+('裁', '制裁', '제재', 1),
+('制', '制限', '제한', 0),
+('限', '制限', '제한', 1),
+('制', '制馭', '제어', 0),
+('馭', '制馭', '제어', 1),
+('刷', '刷新', '쇄신', 0),
+('新', '刷新', '쇄신', 1),
+('刹', '刹那', '찰나', 0),
+('那', '刹那', '찰나', 1),
+('刺', '刺傷', '자상', 0),
+('傷', '刺傷', '자상', 1),
+('刺', '刺客', '자객', 0),
+('客', '刺客', '자객', 1),
+('刺', '刺戟', '자극', 0),
+('戟', '刺戟', '자극', 1),
+('刺', '刺繡', '자수', 0),
+('繡', '刺繡', '자수', 1),
+('刺', '刺胞', '자포', 0),
+('胞', '刺胞', '자포', 1),
+('刺', '刺胞動物', '자포동물', 0),
+('胞', '刺胞動物', '자포동물', 1),
+('動', '刺胞動物', '자포동물', 2),
+('物', '刺胞動物', '자포동물', 3),
+('刺', '刺蜜', '자밀', 0),
+('蜜', '刺蜜', '자밀', 1),
+('刻', '刻舟求劍', '각주구검', 0),
+('舟', '刻舟求劍', '각주구검', 1),
+('求', '刻舟求劍', '각주구검', 2),
+('劍', '刻舟求劍', '각주구검', 3),
+('刻', '刻骨難忘', '각골난망', 0),
+('骨', '刻骨難忘', '각골난망', 1),
+('難', '刻骨難忘', '각골난망', 2),
+('忘', '刻骨難忘', '각골난망', 3),
+('削', '削除', '삭제', 0),
+('除', '削除', '삭제', 1),
+('前', '前', '전', 0),
+('前', '前-', '전날', 0),
+('-', '前-', '전날', 1),
+('前', '前上腸骨棘', '전상장골극', 0),
+('上', '前上腸骨棘', '전상장골극', 1),
+('腸', '前上腸骨棘', '전상장골극', 2),
+('骨', '前上腸骨棘', '전상장골극', 3),
+('棘', '前上腸骨棘', '전상장골극', 4),
+('前', '前世', '전세', 0),
+('世', '前世', '전세', 1),
+('前', '前代', '전대', 0),
+('代', '前代', '전대', 1),
+('前', '前任者', '전임자', 0),
+('任', '前任者', '전임자', 1),
+('者', '前任者', '전임자', 2),
+('前', '前例', '전례', 0),
+('例', '前例', '전례', 1),
+('前', '前兆', '전조', 0),
+('兆', '前兆', '전조', 1),
+('前', '前半', '전반', 0),
+('半', '前半', '전반', 1),
+('前', '前哨', '전초', 0),
+('哨', '前哨', '전초', 1),
+('前', '前夜祭', '전야제', 0),
+('夜', '前夜祭', '전야제', 1),
+('祭', '前夜祭', '전야제', 2),
+('前', '前官禮遇', '전관예우', 0),
+('官', '前官禮遇', '전관예우', 1),
+('禮', '前官禮遇', '전관예우', 2),
+('遇', '前官禮遇', '전관예우', 3),
+('前', '前後', '전후', 0),
+('後', '前後', '전후', 1),
+('前', '前提', '전제', 0),
+('提', '前提', '전제', 1),
+('前', '前文', '전문', 0),
+('文', '前文', '전문', 1),
+('前', '前方', '전방', 0),
+('方', '前方', '전방', 1),
+('前', '前景', '전경', 0),
+('景', '前景', '전경', 1),
+('前', '前期', '전기', 0),
+('期', '前期', '전기', 1),
+('前', '前歷', '전력', 0),
+('歷', '前歷', '전력', 1),
+('前', '前漢', '전한', 0),
+('漢', '前漢', '전한', 1),
+('前', '前生', '전생', 0),
+('生', '前生', '전생', 1),
+('前', '前略', '전략', 0),
+('略', '前略', '전략', 1),
+('前', '前科', '전과', 0),
+('科', '前科', '전과', 1),
+('前', '前立腺', '전립선', 0),
+('立', '前立腺', '전립선', 1),
+('腺', '前立腺', '전립선', 2),
+('前', '前線', '전선', 0),
+('線', '前線', '전선', 1),
+('前', '前置詞', '전치사', 0),
+('置', '前置詞', '전치사', 1),
+('詞', '前置詞', '전치사', 2),
+('前', '前者', '전자', 0),
+('者', '前者', '전자', 1),
+('前', '前職', '전직', 0),
+('職', '前職', '전직', 1),
+('前', '前腦', '전뇌', 0),
+('腦', '前腦', '전뇌', 1),
+('前', '前菜', '전채', 0),
+('菜', '前菜', '전채', 1),
+('前', '前衛', '전위', 0),
+('衛', '前衛', '전위', 1),
+('前', '前身', '전신', 0),
+('身', '前身', '전신', 1),
+('前', '前途', '전도', 0),
+('途', '前途', '전도', 1),
+('前', '前途洋洋', '전도양양', 0),
+('途', '前途洋洋', '전도양양', 1),
+('洋', '前途洋洋', '전도양양', 2),
+('洋', '前途洋洋', '전도양양', 3),
+('前', '前週', '전주', 0),
+('週', '前週', '전주', 1),
+('前', '前進', '전진', 0),
+('進', '前進', '전진', 1),
+('前', '前門', '전문', 0),
+('門', '前門', '전문', 1),
+('前', '前面', '전면', 0),
+('面', '前面', '전면', 1),
+('剔', '剔抉', '척결', 0),
+('抉', '剔抉', '척결', 1),
+('剖', '剖檢', '부검', 0),
+('檢', '剖檢', '부검', 1),
+('剛', '剛愎', '강퍅', 0),
+('愎', '剛愎', '강퍅', 1),
+('剛', '剛斷', '강단', 0),
+('斷', '剛斷', '강단', 1),
+('剛', '剛毛', '강모', 0),
+('毛', '剛毛', '강모', 1),
+('剛', '剛直', '강직', 0),
+('直', '剛直', '강직', 1),
+('剝', '剝奪', '박탈', 0),
+('奪', '剝奪', '박탈', 1),
+('剝', '剝製', '박제', 0),
+('製', '剝製', '박제', 1),
+('剩', '剩餘', '잉여', 0),
+('餘', '剩餘', '잉여', 1),
+('剪', '剪定', '전정', 0),
+('定', '剪定', '전정', 1),
+('剪', '剪斷', '전단', 0),
+('斷', '剪斷', '전단', 1),
+('副', '副作用', '부작용', 0),
+('作', '副作用', '부작용', 1),
+('用', '副作用', '부작용', 2),
+('副', '副司令官', '부사령관', 0),
+('司', '副司令官', '부사령관', 1),
+('令', '副司令官', '부사령관', 2),
+('官', '副司令官', '부사령관', 3),
+('副', '副士官', '부사관', 0),
+('士', '副士官', '부사관', 1),
+('官', '副士官', '부사관', 2),
+('副', '副官', '부관', 0),
+('官', '副官', '부관', 1),
+('副', '副應', '부응', 0),
+('應', '副應', '부응', 1),
+('副', '副會長', '부회장', 0),
+('會', '副會長', '부회장', 1),
+('長', '副會長', '부회장', 2),
+('副', '副本', '부본', 0),
+('本', '副本', '부본', 1),
+('副', '副業', '부업', 0),
+('業', '副業', '부업', 1),
+('副', '副産物', '부산물', 0),
+('産', '副産物', '부산물', 1),
+('物', '副産物', '부산물', 2),
+('副', '副知事', '부지사', 0),
+('知', '副知事', '부지사', 1),
+('事', '副知事', '부지사', 2),
+('副', '副祭', '부제', 0),
+('祭', '副祭', '부제', 1),
+('副', '副統領', '부통령', 0),
+('統', '副統領', '부통령', 1),
+('領', '副統領', '부통령', 2),
+('副', '副總理', '부총리', 0),
+('總', '副總理', '부총리', 1),
+('理', '副總理', '부총리', 2),
+('副', '副署', '부서', 0),
+('署', '副署', '부서', 1),
+('副', '副腎', '부신', 0),
+('腎', '副腎', '부신', 1),
+('副', '副腎皮質', '부신피질', 0),
+('腎', '副腎皮質', '부신피질', 1),
+('皮', '副腎皮質', '부신피질', 2),
+('質', '副腎皮質', '부신피질', 3),
+('副', '副詞', '부사', 0),
+('詞', '副詞', '부사', 1),
+('副', '副賞', '부상', 0),
+('賞', '副賞', '부상', 1),
+('副', '副鼻腔', '부비강', 0),
+('鼻', '副鼻腔', '부비강', 1),
+('腔', '副鼻腔', '부비강', 2),
+('割', '割增', '할증', 0),
+('增', '割增', '할증', 1),
+('割', '割引', '할인', 0),
+('引', '割引', '할인', 1),
+('割', '割引價', '할인가', 0),
+('引', '割引價', '할인가', 1),
+('價', '割引價', '할인가', 2),
+('割', '割愛', '할애', 0),
+('愛', '割愛', '할애', 1),
+('割', '割烹', '할팽', 0),
+('烹', '割烹', '할팽', 1),
+('割', '割當', '할당', 0),
+('當', '割當', '할당', 1),
+('割', '割禮', '할례', 0),
+('禮', '割禮', '할례', 1),
+('割', '割讓', '할양', 0),
+('讓', '割讓', '할양', 1),
+('割', '割賦', '할부', 0),
+('賦', '割賦', '할부', 1),
+('創', '創世記', '창세기', 0),
+('世', '創世記', '창세기', 1),
+('記', '創世記', '창세기', 2),
+('創', '創作', '창작', 0),
+('作', '創作', '창작', 1),
+('創', '創作物', '창작물', 0),
+('作', '創作物', '창작물', 1),
+('物', '創作物', '창작물', 2),
+('創', '創傷', '창상', 0),
+('傷', '創傷', '창상', 1),
+('創', '創始者', '창시자', 0),
+('始', '創始者', '창시자', 1),
+('者', '創始者', '창시자', 2),
+('創', '創意', '창의', 0),
+('意', '創意', '창의', 1),
+('創', '創案', '창안', 0),
+('案', '創案', '창안', 1),
+('創', '創業', '창업', 0),
+('業', '創業', '창업', 1),
+('創', '創氏改名', '창씨개명', 0),
+('氏', '創氏改名', '창씨개명', 1),
+('改', '創氏改名', '창씨개명', 2),
+('名', '創氏改名', '창씨개명', 3),
+('創', '創立', '창립', 0),
+('立', '創立', '창립', 1),
+('創', '創立者', '창립자', 0),
+('立', '創立者', '창립자', 1),
+('者', '創立者', '창립자', 2),
+('創', '創製', '창제', 0),
+('製', '創製', '창제', 1),
+('創', '創設', '창설', 0),
+('設', '創設', '창설', 1),
+('創', '創設者', '창설자', 0),
+('設', '創設者', '창설자', 1),
+('者', '創設者', '창설자', 2),
+('創', '創造', '창조', 0),
+('造', '創造', '창조', 1),
+('創', '創造的', '창조적', 0),
+('造', '創造的', '창조적', 1),
+('的', '創造的', '창조적', 2),
+('創', '創造者', '창조자', 0),
+('造', '創造者', '창조자', 1),
+('者', '創造者', '창조자', 2),
+('剽', '剽竊', '표절', 0),
+('竊', '剽竊', '표절', 1),
+('劃', '劃一', '획일', 0),
+('一', '劃一', '획일', 1),
+('劃', '劃數', '획수', 0),
+('數', '劃數', '획수', 1),
+('劃', '劃策', '획책', 0),
+('策', '劃策', '획책', 1),
+('劃', '劃順', '획순', 0),
+('順', '劃順', '획순', 1),
+('劇', '劇', '극', 0),
+('劇', '劇中', '극중', 0),
+('中', '劇中', '극중', 1),
+('劇', '劇作家', '극작가', 0),
+('作', '劇作家', '극작가', 1),
+('家', '劇作家', '극작가', 2),
+('劇', '劇團', '극단', 0),
+('團', '劇團', '극단', 1),
+('劇', '劇場', '극장', 0),
+('場', '劇場', '극장', 1),
+('劇', '劇的', '극적', 0),
+('的', '劇的', '극적', 1),
+('劇', '劇詩', '극시', 0),
+('詩', '劇詩', '극시', 1),
+('劍', '劍', '검', 0),
+('劍', '劍舞', '검무', 0),
+('舞', '劍舞', '검무', 1),
+('劍', '劍術', '검술', 0),
+('術', '劍術', '검술', 1),
+('劍', '劍道', '검도', 0),
+('道', '劍道', '검도', 1),
+('劍', '劍鬪士', '검투사', 0),
+('鬪', '劍鬪士', '검투사', 1),
+('士', '劍鬪士', '검투사', 2),
+('力', '力學', '역학', 0),
+('學', '力學', '역학', 1),
+('力', '力道', '역도', 0),
+('道', '力道', '역도', 1),
+('力', '力量', '역량', 0),
+('量', '力量', '역량', 1),
+('功', '功七過三', '공칠과삼', 0),
+('七', '功七過三', '공칠과삼', 1),
+('過', '功七過三', '공칠과삼', 2),
+('三', '功七過三', '공칠과삼', 3),
+('功', '功利主義', '공리주의', 0),
+('利', '功利主義', '공리주의', 1),
+('主', '功利主義', '공리주의', 2),
+('義', '功利主義', '공리주의', 3),
+('功', '功勳', '공훈', 0),
+('勳', '功勳', '공훈', 1),
+('功', '功德', '공덕', 0),
+('德', '功德', '공덕', 1),
+('功', '功績', '공적', 0),
+('績', '功績', '공적', 1),
+('加', '加', '가', 0),
+('加', '加入', '가입', 0),
+('入', '加入', '가입', 1),
+('加', '加入者', '가입자', 0),
+('入', '加入者', '가입자', 1),
+('者', '加入者', '가입자', 2),
+('加', '加勢', '가세', 0),
+('勢', '加勢', '가세', 1),
+('加', '加害者', '가해자', 0),
+('害', '加害者', '가해자', 1),
+('者', '加害者', '가해자', 2),
+('加', '加州', '가주', 0),
+('州', '加州', '가주', 1),
+('加', '加工', '가공', 0),
+('工', '加工', '가공', 1),
+('加', '加工品', '가공품', 0),
+('工', '加工品', '가공품', 1),
+('品', '加工品', '가공품', 2),
+('加', '加數', '가수', 0),
+('數', '加數', '가수', 1),
+('加', '加水分解', '가수분해', 0),
+('水', '加水分解', '가수분해', 1),
+('分', '加水分解', '가수분해', 2),
+('解', '加水分解', '가수분해', 3),
+('加', '加減', '가감', 0),
+('減', '加減', '가감', 1),
+('加', '加減乘除', '가감승제', 0),
+('減', '加減乘除', '가감승제', 1),
+('乘', '加減乘除', '가감승제', 2),
+('除', '加減乘除', '가감승제', 3),
+('加', '加濕器', '가습기', 0),
+('濕', '加濕器', '가습기', 1),
+('器', '加濕器', '가습기', 2),
+('加', '加熱器', '가열기', 0),
+('熱', '加熱器', '가열기', 1),
+('器', '加熱器', '가열기', 2),
+('加', '加算', '가산', 0),
+('算', '加算', '가산', 1),
+('加', '加耶', '가야', 0),
+('耶', '加耶', '가야', 1),
+('加', '加虐', '가학', 0),
+('虐', '加虐', '가학', 1),
+('加', '加速', '가속', 0),
+('速', '加速', '가속', 1),
+('加', '加速度', '가속도', 0),
+('速', '加速度', '가속도', 1),
+('度', '加速度', '가속도', 2),
+('加', '加髢', '가체', 0),
+('髢', '加髢', '가체', 1),
+('劣', '劣等', '렬등', 0),
+('等', '劣等', '렬등', 1),
+('劣', '劣等', '열등', 0),
+('等', '劣等', '열등', 1),
+('劣', '劣等感', '열등감', 0),
+('等', '劣等感', '열등감', 1),
+('感', '劣等感', '열등감', 2),
+('助', '助劑', '조제', 0),
+('劑', '助劑', '조제', 1),
+('助', '助力', '조력', 0),
+('力', '助力', '조력', 1),
+('助', '助動詞', '조동사', 0),
+('動', '助動詞', '조동사', 1),
+('詞', '助動詞', '조동사', 2),
+('助', '助手', '조수', 0),
+('手', '助手', '조수', 1),
+('助', '助敎', '조교', 0),
+('敎', '助敎', '조교', 1),
+('助', '助產婦', '조산부', 0),
+('產', '助產婦', '조산부', 1),
+('婦', '助產婦', '조산부', 2),
+('助', '助產師', '조산사', 0),
+('產', '助產師', '조산사', 1),
+('師', '助產師', '조산사', 2),
+('助', '助言', '조언', 0),
+('言', '助言', '조언', 1),
+('助', '助言者', '조언자', 0),
+('言', '助言者', '조언자', 1),
+('者', '助言者', '조언자', 2),
+('助', '助詞', '조사', 0),
+('詞', '助詞', '조사', 1),
+('助', '助辭', '조사', 0),
+('辭', '助辭', '조사', 1),
+('助', '助長', '조장', 0),
+('長', '助長', '조장', 1),
+('努', '努力', '노력', 0),
+('力', '努力', '노력', 1),
+('劫', '劫', '겁', 0),
+('劫', '劫迫', '겁박', 0),
+('迫', '劫迫', '겁박', 1),
+('勃', '勃發', '발발', 0),
+('發', '勃發', '발발', 1),
+('勃', '勃起', '발기', 0),
+('起', '勃起', '발기', 1),
+('勃', '勃起不全', '발기부전', 0),
+('起', '勃起不全', '발기부전', 1),
+('不', '勃起不全', '발기부전', 2),
+('全', '勃起不全', '발기부전', 3),
+('勅', '勅令', '칙령', 0),
+('令', '勅令', '칙령', 1),
+('勇', '勇士', '용사', 0),
+('士', '勇士', '용사', 1),
+('勇', '勇敢', '용감', 0),
+('敢', '勇敢', '용감', 1),
+('勇', '勇氣', '용기', 0),
+('氣', '勇氣', '용기', 1),
+('勇', '勇猛', '용맹', 0),
+('猛', '勇猛', '용맹', 1),
+('動', '動亂', '동란', 0),
+('亂', '動亂', '동란', 1),
+('動', '動作', '동작', 0),
+('作', '動作', '동작', 1),
+('動', '動力', '동력', 0),
+('力', '動力', '동력', 1),
+('動', '動力學', '동역학', 0),
+('力', '動力學', '동역학', 1),
+('學', '動力學', '동역학', 2),
+('動', '動名詞', '동명사', 0),
+('名', '動名詞', '동명사', 1),
+('詞', '動名詞', '동명사', 2),
+('動', '動向', '동향', 0),
+('向', '動向', '동향', 1),
+('動', '動員', '동원', 0),
+('員', '動員', '동원', 1),
+('動', '動員令', '동원령', 0),
+('員', '動員令', '동원령', 1),
+('令', '動員令', '동원령', 2),
+('動', '動因', '동인', 0),
+('因', '動因', '동인', 1),
+('動', '動悸', '동계', 0),
+('悸', '動悸', '동계', 1),
+('動', '動態', '동태', 0),
+('態', '動態', '동태', 1),
+('動', '動搖', '동요', 0),
+('搖', '動搖', '동요', 1),
+('動', '動映像', '동영상', 0),
+('映', '動映像', '동영상', 1),
+('像', '動映像', '동영상', 2),
+('動', '動機', '동기', 0),
+('機', '動機', '동기', 1),
+('動', '動物', '동물', 0),
+('物', '動物', '동물', 1),
+('動', '動物園', '동물원', 0),
+('物', '動物園', '동물원', 1),
+('園', '動物園', '동물원', 2),
+('動', '動物學', '동물학', 0),
+('物', '動物學', '동물학', 1),
+('學', '動物學', '동물학', 2),
+('動', '動物崇拜', '동물숭배', 0),
+('物', '動物崇拜', '동물숭배', 1),
+('崇', '動物崇拜', '동물숭배', 2),
+('拜', '動物崇拜', '동물숭배', 3),
+('動', '動物界', '동물계', 0),
+('物', '動物界', '동물계', 1),
+('界', '動物界', '동물계', 2),
+('動', '動脈', '동맥', 0),
+('脈', '動脈', '동맥', 1),
+('動', '動詞', '동사', 0),
+('詞', '動詞', '동사', 1),
+('動', '動詞', '취재', 0),
+('詞', '動詞', '취재', 1),
+('勘', '勘案', '감안', 0),
+('案', '勘案', '감안', 1),
+('務', '務停', '무정', 0),
+('停', '務停', '무정', 1),
+('勝', '勝', '승', 0),
+('勝', '勝利', '승리', 0),
+('利', '勝利', '승리', 1),
+('勝', '勝利者', '승리자', 0),
+('利', '勝利者', '승리자', 1),
+('者', '勝利者', '승리자', 2),
+('勝', '勝因', '승인', 0),
+('因', '勝因', '승인', 1),
+('勝', '勝戰', '승전', 0),
+('戰', '勝戰', '승전', 1),
+('勝', '勝果', '승과', 0),
+('果', '勝果', '승과', 1),
+('勝', '勝機', '승기', 0),
+('機', '勝機', '승기', 1),
+('勝', '勝率', '승률', 0),
+('率', '勝率', '승률', 1),
+('勝', '勝算', '승산', 0),
+('算', '勝算', '승산', 1),
+('勝', '勝負', '승부', 0),
+('負', '勝負', '승부', 1),
+('勝', '勝負造作', '승부조작', 0),
+('負', '勝負造作', '승부조작', 1),
+('造', '勝負造作', '승부조작', 2),
+('作', '勝負造作', '승부조작', 3),
+('勞', '勞使', '노사', 0),
+('使', '勞使', '노사', 1),
+('勞', '勞力', '노력', 0),
+('力', '勞力', '노력', 1),
+('勞', '勞動', '노동', 0),
+('動', '勞動', '노동', 1),
+('勞', '勞動', '로동', 0),
+('動', '勞動', '로동', 1),
+('勞', '勞動法', '노동법', 0),
+('動', '勞動法', '노동법', 1),
+('法', '勞動法', '노동법', 2),
+('勞', '勞動組合', '노동조합', 0),
+('動', '勞動組合', '노동조합', 1),
+('組', '勞動組合', '노동조합', 2),
+('合', '勞動組合', '노동조합', 3),
+('勞', '勞動組合員', '노동조합원', 0),
+('動', '勞動組合員', '노동조합원', 1),
+('組', '勞動組合員', '노동조합원', 2),
+('合', '勞動組合員', '노동조합원', 3),
+('員', '勞動組合員', '노동조합원', 4),
+('勞', '勞動組合費', '노동조합비', 0),
+('動', '勞動組合費', '노동조합비', 1),
+('組', '勞動組合費', '노동조합비', 2),
+('合', '勞動組合費', '노동조합비', 3),
+('費', '勞動組合費', '노동조합비', 4),
+('勞', '勞動者', '노동자', 0),
+('動', '勞動者', '노동자', 1),
+('者', '勞動者', '노동자', 2),
+('勞', '勞動者區', '로동자구', 0),
+('動', '勞動者區', '로동자구', 1),
+('者', '勞動者區', '로동자구', 2),
+('區', '勞動者區', '로동자구', 3),
+('勞', '勞動階級', '노동계급', 0),
+('動', '勞動階級', '노동계급', 1),
+('階', '勞動階級', '노동계급', 2),
+('級', '勞動階級', '노동계급', 3),
+('勞', '勞動階級', '로동계급', 0),
+('動', '勞動階級', '로동계급', 1),
+('階', '勞動階級', '로동계급', 2),
+('級', '勞動階級', '로동계급', 3),
+('勞', '勞動階級化', '노동계급화', 0),
+('動', '勞動階級化', '노동계급화', 1),
+('階', '勞動階級化', '노동계급화', 2),
+('級', '勞動階級化', '노동계급화', 3),
+('化', '勞動階級化', '노동계급화', 4),
+('勞', '勞動階級化', '로동계급화', 0),
+('動', '勞動階級化', '로동계급화', 1),
+('階', '勞動階級化', '로동계급화', 2),
+('級', '勞動階級化', '로동계급화', 3),
+('化', '勞動階級化', '로동계급화', 4),
+('勞', '勞組', '노조', 0),
+('組', '勞組', '노조', 1),
+('勞', '勞組員', '노조원', 0),
+('組', '勞組員', '노조원', 1),
+('員', '勞組員', '노조원', 2),
+('勞', '勞組費', '노조비', 0),
+('組', '勞組費', '노조비', 1),
+('費', '勞組費', '노조비', 2),
+('勞', '勞賃', '노임', 0),
+('賃', '勞賃', '노임', 1),
+('募', '募金', '모금', 0),
+('金', '募金', '모금', 1),
+('募', '募集', '모집', 0),
+('集', '募集', '모집', 1),
+('勢', '勢力', '세력', 0),
+('力', '勢力', '세력', 1),
+('勤', '勤仕', '근사', 0),
+('仕', '勤仕', '근사', 1),
+('勤', '勤勉', '근면', 0),
+('勉', '勤勉', '근면', 1),
+('勤', '勤務', '근무', 0),
+('務', '勤務', '근무', 1),
+('勤', '勤務員', '근무원', 0),
+('務', '勤務員', '근무원', 1),
+('員', '勤務員', '근무원', 2),
+('勤', '勤勞', '근로', 0),
+('勞', '勤勞', '근로', 1),
+('勤', '勤勞者', '근로자', 0),
+('勞', '勤勞者', '근로자', 1),
+('者', '勤勞者', '근로자', 2),
+('勳', '勳章', '훈장', 0),
+('章', '勳章', '훈장', 1),
+('勳', '勳記', '훈기', 0),
+('記', '勳記', '훈기', 1),
+('勸', '勸', '권', 0),
+('勸', '勸告', '권고', 0),
+('告', '勸告', '권고', 1),
+('勸', '勸善懲惡', '권선징악', 0),
+('善', '勸善懲惡', '권선징악', 1),
+('懲', '勸善懲惡', '권선징악', 2),
+('惡', '勸善懲惡', '권선징악', 3),
+('勸', '勸誘', '권유', 0),
+('誘', '勸誘', '권유', 1),
+('勿', '勿忘草', '물망초', 0),
+('忘', '勿忘草', '물망초', 1),
+('草', '勿忘草', '물망초', 2),
+('勿', '勿論', '물론', 0),
+('論', '勿論', '물론', 1),
+('包', '包含', '포함', 0),
+('含', '包含', '포함', 1),
+('包', '包圍', '포위', 0),
+('圍', '包圍', '포위', 1),
+('包', '包括', '포괄', 0),
+('括', '包括', '포괄', 1),
+('包', '包皮', '포피', 0),
+('皮', '包皮', '포피', 1),
+('包', '包莖', '포경', 0),
+('莖', '包莖', '포경', 1),
+('包', '包莖手術', '포경수술', 0),
+('莖', '包莖手術', '포경수술', 1),
+('手', '包莖手術', '포경수술', 2),
+('術', '包莖手術', '포경수술', 3),
+('包', '包袋', '포대', 0),
+('袋', '包袋', '포대', 1),
+('包', '包裝', '포장', 0),
+('裝', '包裝', '포장', 1),
+('包', '包裝紙', '포장지', 0),
+('裝', '包裝紙', '포장지', 1),
+('紙', '包裝紙', '포장지', 2),
+('匍', '匍匐', '포복', 0),
+('匐', '匍匐', '포복', 1),
+('匕', '匕首', '비수', 0),
+('首', '匕首', '비수', 1),
+('化', '化合物', '화합물', 0),
+('合', '化合物', '화합물', 1),
+('物', '化合物', '화합물', 2),
+('化', '化學', '화학', 0),
+('學', '化學', '화학', 1),
+('化', '化學 平衡', '화학 평형', 0),
+('學', '化學 平衡', '화학 평형', 1),
+('平', '化學 平衡', '화학 평형', 3),
+('衡', '化學 平衡', '화학 평형', 4),
+('化', '化學傳導物質', '화학전달물질', 0),
+('學', '化學傳導物質', '화학전달물질', 1),
+('傳', '化學傳導物質', '화학전달물질', 2),
+('導', '化學傳導物質', '화학전달물질', 3),
+('物', '化學傳導物質', '화학전달물질', 4),
+('質', '化學傳導物質', '화학전달물질', 5),
+('化', '化學式', '화학식', 0),
+('學', '化學式', '화학식', 1),
+('式', '化學式', '화학식', 2),
+('化', '化學者', '화학자', 0),
+('學', '化學者', '화학자', 1),
+('者', '化學者', '화학자', 2),
+('化', '化石', '화석', 0),
+('石', '化石', '화석', 1),
+('化', '化石 燃料', '화석 연료', 0),
+('石', '化石 燃料', '화석 연료', 1),
+('燃', '化石 燃料', '화석 연료', 3),
+('料', '化石 燃料', '화석 연료', 4),
+('化', '化粧', '화장', 0),
+('粧', '化粧', '화장', 1),
+('化', '化粧品', '화장품', 0),
+('粧', '化粧品', '화장품', 1),
+('品', '化粧品', '화장품', 2),
+('化', '化粧室', '화장실', 0),
+('粧', '化粧室', '화장실', 1),
+('室', '化粧室', '화장실', 2),
+('化', '化粧紙', '화장지', 0),
+('粧', '化粧紙', '화장지', 1),
+('紙', '化粧紙', '화장지', 2),
+('化', '化粧臺', '화장대', 0),
+('粧', '化粧臺', '화장대', 1),
+('臺', '化粧臺', '화장대', 2),
+('化', '化膿', '화농', 0),
+('膿', '化膿', '화농', 1),
+('化', '化身', '화신', 0),
+('身', '化身', '화신', 1),
+('北', '北', '북', 0),
+('北', '北-', '북쪽', 0),
+('-', '北-', '북쪽', 1),
+('北', '北京', '북경', 0),
+('京', '北京', '북경', 1),
+('北', '北伐', '북벌', 0),
+('伐', '北伐', '북벌', 1),
+('北', '北側', '북측', 0),
+('側', '北側', '북측', 1),
+('北', '北傀', '북괴', 0),
+('傀', '北傀', '북괴', 1),
+('北', '北加州', '북가주', 0),
+('加', '北加州', '북가주', 1),
+('州', '北加州', '북가주', 2),
+('北', '北半球', '북반구', 0),
+('半', '北半球', '북반구', 1),
+('球', '北半球', '북반구', 2),
+('北', '北宋', '북송', 0),
+('宋', '北宋', '북송', 1),
+('北', '北斗七星', '북두칠성', 0),
+('斗', '北斗七星', '북두칠성', 1),
+('七', '北斗七星', '북두칠성', 2),
+('星', '北斗七星', '북두칠성', 3),
+('北', '北方', '북방', 0),
+('方', '北方', '북방', 1),
+('北', '北東', '북동', 0),
+('東', '北東', '북동', 1),
+('北', '北極', '북극', 0),
+('極', '北極', '북극', 1),
+('北', '北氷洋', '북빙양', 0),
+('氷', '北氷洋', '북빙양', 1),
+('洋', '北氷洋', '북빙양', 2),
+('北', '北海', '북해', 0),
+('海', '北海', '북해', 1),
+('北', '北海道', '북해도', 0),
+('海', '北海道', '북해도', 1),
+('道', '北海道', '북해도', 2),
+('北', '北緯', '북위', 0),
+('緯', '北緯', '북위', 1),
+('北', '北美', '북미', 0),
+('美', '北美', '북미', 1),
+('北', '北西', '북서', 0),
+('西', '北西', '북서', 1),
+('北', '北送', '북송', 0),
+('送', '北送', '북송', 1),
+('北', '北部', '북부', 0),
+('部', '北部', '북부', 1),
+('北', '北醬', '북장', 0),
+('醬', '北醬', '북장', 1),
+('北', '北韓', '북한', 0),
+('韓', '北韓', '북한', 1),
+('北', '北韓語', '북한어', 0),
+('韓', '北韓語', '북한어', 1),
+('語', '北韓語', '북한어', 2),
+('北', '北風', '북풍', 0),
+('風', '北風', '북풍', 1),
+('北', '北魏', '북위', 0),
+('魏', '北魏', '북위', 1),
+('北', '北아메리카', '북아메리카', 0),
+('아', '北아메리카', '북아메리카', 1),
+('메', '北아메리카', '북아메리카', 2),
+('리', '北아메리카', '북아메리카', 3),
+('카', '北아메리카', '북아메리카', 4),
+('匠', '匠人', '장인', 0),
+('人', '匠人', '장인', 1),
+('匠', '匠戶', '장호', 0),
+('戶', '匠戶', '장호', 1),
+('匡', '匡救', '광구', 0),
+('救', '匡救', '광구', 1),
+('匣', '匣', '갑', 0),
+('匪', '匪徒', '비도', 0),
+('徒', '匪徒', '비도', 1),
+('匪', '匪賊', '비적', 0),
+('賊', '匪賊', '비적', 1),
+('匹', '匹敵', '필적', 0),
+('敵', '匹敵', '필적', 1),
+('匿', '匿名', '익명', 0),
+('名', '匿名', '익명', 1),
+('匿', '匿名-', '익명자', 0),
+('名', '匿名-', '익명자', 1),
+('-', '匿名-', '익명자', 2),
+('區', '區', '구', 0),
+('區', '區分', '구분', 0),
+('分', '區分', '구분', 1),
+('區', '區分字', '구분자', 0),
+('分', '區分字', '구분자', 1),
+('字', '區分字', '구분자', 2),
+('區', '區別', '구별', 0),
+('別', '區別', '구별', 1),
+('區', '區劃', '구획', 0),
+('劃', '區劃', '구획', 1),
+('區', '區域', '구역', 0),
+('域', '區域', '구역', 1),
+('區', '區廳', '구청', 0),
+('廳', '區廳', '구청', 1),
+('區', '區畫', '구획', 0),
+('畫', '區畫', '구획', 1),
+('區', '區間', '구간', 0),
+('間', '區間', '구간', 1),
+('十', '十', '십', 0),
+('十', '十一月', '11월', 0),
+('一', '十一月', '11월', 1),
+('月', '十一月', '11월', 2),
+('十', '十一月', '십일월', 0),
+('一', '十一月', '십일월', 1),
+('月', '十一月', '십일월', 2),
+('十', '十中八九', '십중팔구', 0),
+('中', '十中八九', '십중팔구', 1),
+('八', '十中八九', '십중팔구', 2),
+('九', '十中八九', '십중팔구', 3),
+('十', '十二指腸', '십이지장', 0),
+('二', '十二指腸', '십이지장', 1),
+('指', '十二指腸', '십이지장', 2),
+('腸', '十二指腸', '십이지장', 3),
+('十', '十二月', '12월', 0),
+('二', '十二月', '12월', 1),
+('月', '十二月', '12월', 2),
+('十', '十二月', '십이월', 0),
+('二', '十二月', '십이월', 1),
+('月', '十二月', '십이월', 2),
+('十', '十代', '십대', 0),
+('代', '十代', '십대', 1),
+('十', '十億', '십억', 0),
+('億', '十億', '십억', 1),
+('十', '十六', '십륙', 0),
+('六', '十六', '십륙', 1),
+('十', '十分', '십분', 0),
+('分', '十分', '십분', 1),
+('十', '十善', '십선', 0),
+('善', '十善', '십선', 1),
+('十', '十字', '십자', 0),
+('字', '十字', '십자', 1),
+('十', '十字架', '십자가', 0),
+('字', '十字架', '십자가', 1),
+('架', '十字架', '십자가', 2),
+('十', '十字線', '십자선', 0),
+('字', '十字線', '십자선', 1),
+('線', '十字線', '십자선', 2),
+('十', '十字苦像', '십자고상', 0),
+('字', '十字苦像', '십자고상', 1),
+('苦', '十字苦像', '십자고상', 2),
+('像', '十字苦像', '십자고상', 3),
+('十', '十字軍', '십자군', 0),
+('字', '十字軍', '십자군', 1),
+('軍', '十字軍', '십자군', 2),
+('十', '十常八九', '십상팔구', 0),
+('常', '十常八九', '십상팔구', 1),
+('八', '十常八九', '십상팔구', 2),
+('九', '十常八九', '십상팔구', 3),
+('十', '十惡', '십악', 0),
+('惡', '十惡', '십악', 1),
+('十', '十月', '시월', 0),
+('月', '十月', '시월', 1),
+('十', '十月 ', '10월', 0),
+('月', '十月 ', '10월', 1),
+('十', '十王', '시왕', 0),
+('王', '十王', '시왕', 1),
+('十', '十角形', '십각형', 0),
+('角', '十角形', '십각형', 1),
+('形', '十角形', '십각형', 2),
+('十', '十進法', '십진법', 0),
+('進', '十進法', '십진법', 1),
+('法', '十進法', '십진법', 2),
+('千', '千', '천', 0),
+('千', '千世  ', '천세 후', 0),
+('世', '千世  ', '천세 후', 1),
+('千', '千仞', '천인', 0),
+('仞', '千仞', '천인', 1),
+('千', '千兆國', '천조국', 0),
+('兆', '千兆國', '천조국', 1),
+('國', '千兆國', '천조국', 2),
+('千', '千壽菊', '천수국', 0),
+('壽', '千壽菊', '천수국', 1),
+('菊', '千壽菊', '천수국', 2),
+('千', '千字文', '천자문', 0),
+('字', '千字文', '천자문', 1),
+('文', '千字文', '천자문', 2),
+('千', '千年', '천년', 0),
+('年', '千年', '천년', 1),
+('千', '千年紀', '천년기', 0),
+('年', '千年紀', '천년기', 1),
+('紀', '千年紀', '천년기', 2),
+('千', '千歲', '천세', 0),
+('歲', '千歲', '천세', 1),
+('千', '千秋', '천추', 0),
+('秋', '千秋', '천추', 1),
+('千', '千軍萬馬', '천군만마', 0),
+('軍', '千軍萬馬', '천군만마', 1),
+('萬', '千軍萬馬', '천군만마', 2),
+('馬', '千軍萬馬', '천군만마', 3),
+('千', '千里眼', '천리안', 0),
+('里', '千里眼', '천리안', 1),
+('眼', '千里眼', '천리안', 2),
+('千', '千里馬', '천리마', 0),
+('里', '千里馬', '천리마', 1),
+('馬', '千里馬', '천리마', 2),
+('千', '千길萬길', '천길만길', 0),
+('길', '千길萬길', '천길만길', 1),
+('萬', '千길萬길', '천길만길', 2),
+('길', '千길萬길', '천길만길', 3),
+('升', '升學宴', '승학연', 0),
+('學', '升學宴', '승학연', 1),
+('宴', '升學宴', '승학연', 2),
+('升', '升進', '승진', 0),
+('進', '升進', '승진', 1),
+('午', '午前', '오전', 0),
+('前', '午前', '오전', 1),
+('午', '午年', '오년', 0),
+('年', '午年', '오년', 1),
+('午', '午後', '오후', 0),
+('後', '午後', '오후', 1),
+('午', '午睡', '오수', 0),
+('睡', '午睡', '오수', 1),
+('午', '午飯', '오반', 0),
+('飯', '午飯', '오반', 1),
+('午', '午餐', '오찬', 0),
+('餐', '午餐', '오찬', 1),
+('午', '午餐會', '오찬회', 0),
+('餐', '午餐會', '오찬회', 1),
+('會', '午餐會', '오찬회', 2),
+('半', '半', '반', 0),
+('半', '半-', '반말', 0),
+('-', '半-', '반말', 1),
+('半', '半世紀', '반세기', 0),
+('世', '半世紀', '반세기', 1),
+('紀', '半世紀', '반세기', 2),
+('半', '半信半疑', '반신반의', 0),
+('信', '半信半疑', '반신반의', 1),
+('半', '半信半疑', '반신반의', 2),
+('疑', '半信半疑', '반신반의', 3),
+('半', '半價', '반가', 0),
+('價', '半價', '반가', 1),
+('半', '半分', '반분', 0),
+('分', '半分', '반분', 1),
+('半', '半化石', '반화석', 0),
+('化', '半化石', '반화석', 1),
+('石', '半化石', '반화석', 2),
+('半', '半半', '반반', 0),
+('半', '半半', '반반', 1),
+('半', '半圓', '반원', 0),
+('圓', '半圓', '반원', 1),
+('半', '半地下', '반지하', 0),
+('地', '半地下', '반지하', 1),
+('下', '半地下', '반지하', 2),
+('半', '半寢', '반침', 0),
+('寢', '半寢', '반침', 1),
+('半', '半導體', '반도체', 0),
+('導', '半導體', '반도체', 1),
+('體', '半導體', '반도체', 2),
+('半', '半島', '반도', 0),
+('島', '半島', '반도', 1),
+('半', '半年', '반년', 0),
+('年', '半年', '반년', 1),
+('半', '半影', '본영', 0),
+('影', '半影', '본영', 1),
+('半', '半徑', '반경', 0),
+('徑', '半徑', '반경', 1),
+('半', '半指', '반지', 0),
+('指', '半指', '반지', 1),
+('半', '半旗', '반기', 0),
+('旗', '半旗', '반기', 1),
+('半', '半時間', '반시간', 0),
+('時', '半時間', '반시간', 1),
+('間', '半時間', '반시간', 2),
+('半', '半期', '반기', 0),
+('期', '半期', '반기', 1),
+('半', '半母音', '반모음', 0),
+('母', '半母音', '반모음', 1),
+('音', '半母音', '반모음', 2),
+('半', '半減', '반감', 0),
+('減', '半減', '반감', 1),
+('半', '半熟', '반숙', 0),
+('熟', '半熟', '반숙', 1),
+('半', '半球', '반구', 0),
+('球', '半球', '반구', 1),
+('半', '半生', '반생', 0),
+('生', '半生', '반생', 1),
+('半', '半神', '반신', 0),
+('神', '半神', '반신', 1),
+('半', '半神半人', '반신반인', 0),
+('神', '半神半人', '반신반인', 1),
+('半', '半神半人', '반신반인', 2),
+('人', '半神半人', '반신반인', 3),
+('半', '半自動', '반자동', 0),
+('自', '半自動', '반자동', 1),
+('動', '半自動', '반자동', 2),
+('半', '半角', '반각', 0),
+('角', '半角', '반각', 1),
+('半', '半透明', '반투명', 0),
+('透', '半透明', '반투명', 1),
+('明', '半透明', '반투명', 2),
+('半', '半途', '반도', 0),
+('途', '半途', '반도', 1),
+('半', '半音', '반음', 0),
+('音', '半音', '반음', 1),
+('半', '半額', '반액', 0),
+('額', '半額', '반액', 1),
+('半', '半齒音', '반치음', 0),
+('齒', '半齒音', '반치음', 1),
+('音', '半齒音', '반치음', 2),
+('半', '半값', '반값', 0),
+('값', '半값', '반값', 1),
+('半', '半달', '반달', 0),
+('달', '半달', '반달', 1),
+('半', '半시옷', '반시옷', 0),
+('시', '半시옷', '반시옷', 1),
+('옷', '半시옷', '반시옷', 2),
+('卍', '卍字', '만자', 0),
+('字', '卍字', '만자', 1),
+('卑', '卑俗語', '비속어', 0),
+('俗', '卑俗語', '비속어', 1),
+('語', '卑俗語', '비속어', 2),
+('卑', '卑怯', '비겁', 0),
+('怯', '卑怯', '비겁', 1),
+('卑', '卑怯者', '비겁자', 0),
+('怯', '卑怯者', '비겁자', 1),
+('者', '卑怯者', '비겁자', 2),
+('卑', '卑語', '비어', 0),
+('語', '卑語', '비어', 1),
+('卒', '卒', '졸', 0),
+('卒', '卒作', '졸작', 0),
+('作', '卒作', '졸작', 1),
+('卒', '卒倒', '졸도', 0),
+('倒', '卒倒', '졸도', 1),
+('卒', '卒婚', '졸혼', 0),
+('婚', '卒婚', '졸혼', 1),
+('卒', '卒業', '졸업', 0),
+('業', '卒業', '졸업', 1),
+('卒', '卒業式', '졸업식', 0),
+('業', '卒業式', '졸업식', 1),
+('式', '卒業式', '졸업식', 2),
+('卒', '卒業狀', '졸업장', 0),
+('業', '卒業狀', '졸업장', 1),
+('狀', '卒業狀', '졸업장', 2),
+('卒', '卒業生', '졸업생', 0),
+('業', '卒業生', '졸업생', 1),
+('生', '卒業生', '졸업생', 2),
+('卓', '卓上空論', '탁상공론', 0),
+('上', '卓上空論', '탁상공론', 1),
+('空', '卓上空論', '탁상공론', 2),
+('論', '卓上空論', '탁상공론', 3),
+('卓', '卓子', '탁자', 0),
+('子', '卓子', '탁자', 1),
+('卓', '卓球', '탁구', 0),
+('球', '卓球', '탁구', 1),
+('卓', '卓越', '탁월', 0),
+('越', '卓越', '탁월', 1),
+('協', '協力', '협력', 0),
+('力', '協力', '협력', 1),
+('協', '協助', '협조', 0),
+('助', '協助', '협조', 1),
+('協', '協同', '협동', 0),
+('同', '協同', '협동', 1),
+('協', '協商', '협상', 0),
+('商', '協商', '협상', 1),
+('協', '協奏曲', '협주곡', 0),
+('奏', '協奏曲', '협주곡', 1),
+('曲', '協奏曲', '협주곡', 2),
+('協', '協定', '협정', 0),
+('定', '協定', '협정', 1),
+('協', '協會', '협회', 0),
+('會', '協會', '협회', 1),
+('協', '協業', '협업', 0),
+('業', '協業', '협업', 1),
+('協', '協約', '협약', 0),
+('約', '協約', '협약', 1),
+('協', '協議', '협의', 0),
+('議', '協議', '협의', 1),
+('協', '協贊', '협찬', 0),
+('贊', '協贊', '협찬', 1),
+('南', '南', '남', 0),
+('南', '南-', '남쪽', 0),
+('-', '南-', '남쪽', 1),
+('南', '南中國海', '남중국해', 0),
+('中', '南中國海', '남중국해', 1),
+('國', '南中國海', '남중국해', 2),
+('海', '南中國海', '남중국해', 3),
+('南', '南側', '남측', 0),
+('側', '南側', '남측', 1),
+('南', '南加州', '남가주', 0),
+('加', '南加州', '남가주', 1),
+('州', '南加州', '남가주', 2),
+('南', '南北', '남북', 0),
+('北', '南北', '남북', 1),
+('南', '南北問題', '남북문제', 0),
+('北', '南北問題', '남북문제', 1),
+('問', '南北問題', '남북문제', 2),
+('題', '南北問題', '남북문제', 3),
+('南', '南北戰爭', '남북전쟁', 0),
+('北', '南北戰爭', '남북전쟁', 1),
+('戰', '南北戰爭', '남북전쟁', 2),
+('爭', '南北戰爭', '남북전쟁', 3),
+('南', '南半球', '남반구', 0),
+('半', '南半球', '남반구', 1),
+('球', '南半球', '남반구', 2),
+('南', '南向', '남향', 0),
+('向', '南向', '남향', 1),
+('南', '南大門', '남대문', 0),
+('大', '南大門', '남대문', 1),
+('門', '南大門', '남대문', 2),
+('南', '南大門市場', '남대문시장', 0),
+('大', '南大門市場', '남대문시장', 1),
+('門', '南大門市場', '남대문시장', 2),
+('市', '南大門市場', '남대문시장', 3),
+('場', '南大門市場', '남대문시장', 4),
+('南', '南宮', '남궁', 0),
+('宮', '南宮', '남궁', 1),
+('南', '南山', '남산', 0),
+('山', '南山', '남산', 1),
+('南', '南支那海', '남지나해', 0),
+('支', '南支那海', '남지나해', 1),
+('那', '南支那海', '남지나해', 2),
+('海', '南支那海', '남지나해', 3),
+('南', '南方', '남방', 0),
+('方', '南方', '남방', 1),
+('南', '南朝鮮', '남조선', 0),
+('朝', '南朝鮮', '남조선', 1),
+('鮮', '南朝鮮', '남조선', 2),
+('南', '南東', '남동', 0),
+('東', '南東', '남동', 1),
+('南', '南柯一夢', '남가일몽', 0),
+('柯', '南柯一夢', '남가일몽', 1),
+('一', '南柯一夢', '남가일몽', 2),
+('夢', '南柯一夢', '남가일몽', 3),
+('南', '南極', '남극', 0),
+('極', '南極', '남극', 1),
+('南', '南極大陸', '남극대륙', 0),
+('極', '南極大陸', '남극대륙', 1),
+('大', '南極大陸', '남극대륙', 2),
+('陸', '南極大陸', '남극대륙', 3),
+('南', '南浦', '남포', 0),
+('浦', '南浦', '남포', 1),
+('南', '南瓜', '남과', 0),
+('瓜', '南瓜', '남과', 1),
+('南', '南男北女', '남남북녀', 0),
+('男', '南男北女', '남남북녀', 1),
+('北', '南男北女', '남남북녀', 2),
+('女', '南男北女', '남남북녀', 3),
+('南', '南美', '남미', 0),
+('美', '南美', '남미', 1),
+('南', '南蠻', '남만', 0),
+('蠻', '南蠻', '남만', 1),
+('南', '南行', '남행', 0),
+('行', '南行', '남행', 1),
+('南', '南西', '남서', 0),
+('西', '南西', '남서', 1),
+('南', '南西部', '남서부', 0),
+('西', '南西部', '남서부', 1),
+('部', '南西部', '남서부', 2),
+('南', '南越', '남월', 0),
+('越', '南越', '남월', 1),
+('南', '南部', '남부', 0),
+('部', '南部', '남부', 1),
+('南', '南阿共', '남아공', 0),
+('阿', '南阿共', '남아공', 1),
+('共', '南阿共', '남아공', 2),
+('南', '南韓', '남한', 0),
+('韓', '南韓', '남한', 1),
+('南', '南아메리카', '남아메리카', 0),
+('아', '南아메리카', '남아메리카', 1),
+('메', '南아메리카', '남아메리카', 2),
+('리', '南아메리카', '남아메리카', 3),
+('카', '南아메리카', '남아메리카', 4),
+('博', '博士', '박사', 0),
+('士', '博士', '박사', 1),
+('博', '博學', '박학', 0),
+('學', '博學', '박학', 1),
+('博', '博學多識', '박학다식', 0),
+('學', '博學多識', '박학다식', 1),
+('多', '博學多識', '박학다식', 2),
+('識', '博學多識', '박학다식', 3),
+('博', '博愛', '박애', 0),
+('愛', '博愛', '박애', 1),
+('博', '博物', '박물', 0),
+('物', '博物', '박물', 1),
+('博', '博物學', '박물학', 0),
+('物', '博物學', '박물학', 1),
+('學', '博物學', '박물학', 2),
+('博', '博物館', '박물관', 0),
+('物', '博物館', '박물관', 1),
+('館', '博物館', '박물관', 2),
+('博', '博覽會', '박람회', 0),
+('覽', '博覽會', '박람회', 1),
+('會', '博覽會', '박람회', 2),
+('占', '占星學', '점성학', 0),
+('星', '占星學', '점성학', 1),
+('學', '占星學', '점성학', 2),
+('占', '占星術', '점성술', 0),
+('星', '占星術', '점성술', 1),
+('術', '占星術', '점성술', 2),
+('占', '占領', '점령', 0),
+('領', '占領', '점령', 1),
+('占', '占領軍', '점령군', 0),
+('領', '占領軍', '점령군', 1),
+('軍', '占領軍', '점령군', 2),
+('卦', '卦', '괘', 0),
+('印', '印', '인', 0),
+('印', '印刷', '인쇄', 0),
+('刷', '印刷', '인쇄', 1),
+('印', '印刷所', '인쇄소', 0),
+('刷', '印刷所', '인쇄소', 1),
+('所', '印刷所', '인쇄소', 2),
+('印', '印刷機', '인쇄기', 0),
+('刷', '印刷機', '인쇄기', 1),
+('機', '印刷機', '인쇄기', 2),
+('印', '印刷者', '인쇄자', 0),
+('刷', '印刷者', '인쇄자', 1),
+('者', '印刷者', '인쇄자', 2),
+('印', '印尼', '인니', 0),
+('尼', '印尼', '인니', 1),
+('印', '印影', '인영', 0),
+('影', '印影', '인영', 1),
+('印', '印歐語族', '인구어족', 0),
+('歐', '印歐語族', '인구어족', 1),
+('語', '印歐語族', '인구어족', 2),
+('族', '印歐語族', '인구어족', 3),
+('印', '印歐語系', '인구어계', 0),
+('歐', '印歐語系', '인구어계', 1),
+('語', '印歐語系', '인구어계', 2),
+('系', '印歐語系', '인구어계', 3),
+('印', '印畫紙', '인화지', 0),
+('畫', '印畫紙', '인화지', 1),
+('紙', '印畫紙', '인화지', 2),
+('印', '印稅', '인세', 0),
+('稅', '印稅', '인세', 1),
+('印', '印章', '인장', 0),
+('章', '印章', '인장', 1),
+('印', '印象', '인상', 0),
+('象', '印象', '인상', 1),
+('印', '印象的', '인상적', 0),
+('象', '印象的', '인상적', 1),
+('的', '印象的', '인상적', 2),
+('印', '印鑑', '인감', 0),
+('鑑', '印鑑', '인감', 1),
+('危', '危害', '위해', 0),
+('害', '危害', '위해', 1),
+('危', '危急存亡之秋', '위급존망지추', 0),
+('急', '危急存亡之秋', '위급존망지추', 1),
+('存', '危急存亡之秋', '위급존망지추', 2),
+('亡', '危急存亡之秋', '위급존망지추', 3),
+('之', '危急存亡之秋', '위급존망지추', 4),
+('秋', '危急存亡之秋', '위급존망지추', 5),
+('危', '危機', '위기', 0),
+('機', '危機', '위기', 1),
+('危', '危篤', '위독', 0),
+('篤', '危篤', '위독', 1),
+('危', '危險', '위험', 0),
+('險', '危險', '위험', 1),
+('危', '危險性', '위험성', 0),
+('險', '危險性', '위험성', 1),
+('性', '危險性', '위험성', 2),
+('却', '却下', '각하', 0),
+('下', '却下', '각하', 1),
+('却', '却說', '각설', 0),
+('說', '却說', '각설', 1),
+('卵', '卵', '란', 0),
+('卵', '卵子', '난자', 0),
+('子', '卵子', '난자', 1),
+('卵', '卵子', '란자', 0),
+('子', '卵子', '란자', 1),
+('卵', '卵巢', '난소', 0),
+('巢', '卵巢', '난소', 1),
+('卵', '卵巢', '란소', 0),
+('巢', '卵巢', '란소', 1),
+('卵', '卵殼', '난각', 0),
+('殼', '卵殼', '난각', 1),
+('卵', '卵白', '난백', 0),
+('白', '卵白', '난백', 1),
+('卵', '卵管', '난관', 0),
+('管', '卵管', '난관', 1),
+('卵', '卵胎生', '난태생', 0),
+('胎', '卵胎生', '난태생', 1),
+('生', '卵胎生', '난태생', 2),
+('卵', '卵黃', '난황', 0),
+('黃', '卵黃', '난황', 1),
+('卷', '卷', '권', 0),
+('卷', '卷末', '권말', 0),
+('末', '卷末', '권말', 1),
+('卷', '卷煙', '궐련', 0),
+('煙', '卷煙', '궐련', 1),
+('卷', '卷積雲', '권적운', 0),
+('積', '卷積雲', '권적운', 1),
+('雲', '卷積雲', '권적운', 2),
+('卽', '卽', '즉', 0),
+('卽', '卽位', '즉위', 0),
+('位', '卽位', '즉위', 1),
+('卽', '卽位式', '즉위식', 0),
+('位', '卽位式', '즉위식', 1),
+('式', '卽位式', '즉위식', 2),
+('卽', '卽刻', '즉각', 0),
+('刻', '卽刻', '즉각', 1),
+('卽', '卽席', '즉석', 0),
+('席', '卽席', '즉석', 1),
+('卽', '卽日', '즉일', 0),
+('日', '卽日', '즉일', 1),
+('卽', '卽時', '즉시', 0),
+('時', '卽時', '즉시', 1),
+('卽', '卽死', '즉사', 0),
+('死', '卽死', '즉사', 1),
+('卽', '卽決', '즉결', 0),
+('決', '卽決', '즉결', 1),
+('卽', '卽答', '즉답', 0),
+('答', '卽答', '즉답', 1),
+('卽', '卽興', '즉흥', 0),
+('興', '卽興', '즉흥', 1),
+('卿', '卿', '경', 0),
+('厄', '厄', '액', 0),
+('厄', '厄運', '액운', 0),
+('運', '厄運', '액운', 1),
+('厖', '厖大', '방대', 0),
+('大', '厖大', '방대', 1),
+('原', '原人', '원인', 0),
+('人', '原人', '원인', 1),
+('原', '原住民', '원주민', 0),
+('住', '原住民', '원주민', 1),
+('民', '原住民', '원주민', 2),
+('原', '原作', '원작', 0),
+('作', '原作', '원작', 1),
+('原', '原來', '원래', 0),
+('來', '原來', '원래', 1),
+('原', '原價', '원가', 0),
+('價', '原價', '원가', 1),
+('原', '原則', '원칙', 0),
+('則', '原則', '원칙', 1),
+('原', '原動力', '원동력', 0),
+('動', '原動力', '원동력', 1),
+('力', '原動力', '원동력', 2),
+('原', '原動機', '원동기', 0),
+('動', '原動機', '원동기', 1),
+('機', '原動機', '원동기', 2),
+('原', '原告', '원고', 0),
+('告', '原告', '원고', 1),
+('原', '原因', '원인', 0),
+('因', '原因', '원인', 1),
+('原', '原型', '원형', 0),
+('型', '原型', '원형', 1),
+('原', '原始', '원시', 0),
+('始', '原始', '원시', 1),
+('原', '原始林', '원시림', 0),
+('始', '原始林', '원시림', 1),
+('林', '原始林', '원시림', 2),
+('原', '原子', '원자', 0),
+('子', '原子', '원자', 1),
+('原', '原子力', '원자력', 0),
+('子', '原子力', '원자력', 1),
+('力', '原子力', '원자력', 2),
+('原', '原子力發電所', '원자력발전소', 0),
+('子', '原子力發電所', '원자력발전소', 1),
+('力', '原子力發電所', '원자력발전소', 2),
+('發', '原子力發電所', '원자력발전소', 3),
+('電', '原子力發電所', '원자력발전소', 4),
+('所', '原子力發電所', '원자력발전소', 5),
+('原', '原子核', '원자핵', 0),
+('子', '原子核', '원자핵', 1),
+('核', '原子核', '원자핵', 2),
+('原', '原子爆彈', '원자폭탄', 0),
+('子', '原子爆彈', '원자폭탄', 1),
+('爆', '原子爆彈', '원자폭탄', 2),
+('彈', '原子爆彈', '원자폭탄', 3),
+('原', '原子爐', '원자로', 0),
+('子', '原子爐', '원자로', 1),
+('爐', '原子爐', '원자로', 2),
+('原', '原子筆', '원자필', 0),
+('子', '原子筆', '원자필', 1),
+('筆', '原子筆', '원자필', 2),
+('原', '原審', '원심', 0),
+('審', '原審', '원심', 1),
+('原', '原州', '원주', 0),
+('州', '原州', '원주', 1),
+('原', '原形', '원형', 0),
+('形', '原形', '원형', 1),
+('原', '原形質', '원형질', 0),
+('形', '原形質', '원형질', 1),
+('質', '原形質', '원형질', 2),
+('原', '原文', '원문', 0),
+('文', '原文', '원문', 1),
+('原', '原料', '원료', 0),
+('料', '原料', '원료', 1),
+('原', '原曲', '원곡', 0),
+('曲', '原曲', '원곡', 1),
+('原', '原本', '원본', 0),
+('本', '原本', '원본', 1),
+('原', '原材料', '원재료', 0),
+('材', '原材料', '원재료', 1),
+('料', '原材料', '원재료', 2),
+('原', '原爆', '원폭', 0),
+('爆', '原爆', '원폭', 1),
+('原', '原物', '원물', 0),
+('物', '原物', '원물', 1),
+('原', '原狀', '원상', 0),
+('狀', '原狀', '원상', 1),
+('原', '原理', '원리', 0),
+('理', '原理', '원리', 1),
+('原', '原理主義', '원리주의', 0),
+('理', '原理主義', '원리주의', 1),
+('主', '原理主義', '원리주의', 2),
+('義', '原理主義', '원리주의', 3),
+('原', '原産地', '원산지', 0),
+('産', '原産地', '원산지', 1),
+('地', '原産地', '원산지', 2),
+('原', '原畫', '원화', 0),
+('畫', '原畫', '원화', 1),
+('原', '原石', '원석', 0),
+('石', '原石', '원석', 1),
+('原', '原禽', '원금', 0),
+('禽', '原禽', '원금', 1),
+('原', '原種', '원종', 0),
+('種', '原種', '원종', 1),
+('原', '原稿', '원고', 0),
+('稿', '原稿', '원고', 1),
+('原', '原語', '원어', 0),
+('語', '原語', '원어', 1),
+('原', '原語民', '원어민', 0),
+('語', '原語民', '원어민', 1),
+('民', '原語民', '원어민', 2),
+('原', '原豆', '원두', 0),
+('豆', '原豆', '원두', 1),
+('原', '原酒', '원주', 0),
+('酒', '原酒', '원주', 1),
+('原', '原鑛', '원광', 0),
+('鑛', '原鑛', '원광', 1),
+('原', '原電', '원전', 0),
+('電', '原電', '원전', 1),
+('原', '原音', '원음', 0),
+('音', '原音', '원음', 1),
+('厥', '厥', '궐', 0),
+('厭', '厭世', '염세', 0),
+('世', '厭世', '염세', 1),
+('厭', '厭世主義', '염세주의', 0),
+('世', '厭世主義', '염세주의', 1),
+('主', '厭世主義', '염세주의', 2),
+('義', '厭世主義', '염세주의', 3),
+('厭', '厭世家', '염세가', 0),
+('世', '厭世家', '염세가', 1),
+('家', '厭世家', '염세가', 2),
+('厭', '厭世觀', '염세관', 0),
+('世', '厭世觀', '염세관', 1),
+('觀', '厭世觀', '염세관', 2),
+('厭', '厭惡', '염오', 0),
+('惡', '厭惡', '염오', 1),
+('去', '去來', '거래', 0),
+('來', '去來', '거래', 1),
+('去', '去來所', '거래소', 0),
+('來', '去來所', '거래소', 1),
+('所', '去來所', '거래소', 2),
+('去', '去來處', '거래처', 0),
+('來', '去來處', '거래처', 1),
+('處', '去來處', '거래처', 2),
+('去', '去勢', '거세', 0),
+('勢', '去勢', '거세', 1),
+('去', '去夜', '거야', 0),
+('夜', '去夜', '거야', 1),
+('去', '去年', '거년', 0),
+('年', '去年', '거년', 1),
+('去', '去痰劑', '거담제', 0),
+('痰', '去痰劑', '거담제', 1),
+('劑', '去痰劑', '거담제', 2),
+('去', '去聲', '거성', 0),
+('聲', '去聲', '거성', 1),
+('去', '去聲不連三', '거성불연삼', 0),
+('聲', '去聲不連三', '거성불연삼', 1),
+('不', '去聲不連三', '거성불연삼', 2),
+('連', '去聲不連三', '거성불연삼', 3),
+('三', '去聲不連三', '거성불연삼', 4),
+('去', '去頭截尾', '거두절미', 0),
+('頭', '去頭截尾', '거두절미', 1),
+('截', '去頭截尾', '거두절미', 2),
+('尾', '去頭截尾', '거두절미', 3),
+('參', '參加', '참가', 0),
+('加', '參加', '참가', 1),
+('參', '參加者', '참가자', 0),
+('加', '參加者', '참가자', 1),
+('者', '參加者', '참가자', 2),
+('參', '參席', '참석', 0),
+('席', '參席', '참석', 1),
+('參', '參席者', '참석자', 0),
+('席', '參席者', '참석자', 1),
+('者', '參席者', '참석자', 2),
+('參', '參戰', '참전', 0),
+('戰', '參戰', '참전', 1),
+('參', '參拜', '참배', 0),
+('拜', '參拜', '참배', 1),
+('參', '參照', '참조', 0),
+('照', '參照', '참조', 1),
+('參', '參考', '참고', 0),
+('考', '參考', '참고', 1),
+('參', '參考書', '참고서', 0),
+('考', '參考書', '참고서', 1),
+('書', '參考書', '참고서', 2),
+('參', '參與', '참여', 0),
+('與', '參與', '참여', 1),
+('參', '參謀', '참모', 0),
+('謀', '參謀', '참모', 1),
+('參', '參謀長', '참모장', 0),
+('謀', '參謀長', '참모장', 1),
+('長', '參謀長', '참모장', 2),
+('又', '又', '우', 0),
+('叉', '叉手', '차수', 0),
+('手', '叉手', '차수', 1),
+('及', '及其也', '급기야', 0),
+('其', '及其也', '급기야', 1),
+('也', '及其也', '급기야', 2),
+('友', '友人', '우인', 0),
+('人', '友人', '우인', 1),
+('友', '友好的', '우호적', 0),
+('好', '友好的', '우호적', 1),
+('的', '友好的', '우호적', 2),
+('友', '友情', '우정', 0),
+('情', '友情', '우정', 1),
+('友', '友誼', '우의', 0),
+('誼', '友誼', '우의', 1),
+('友', '友邦', '우방', 0),
+('邦', '友邦', '우방', 1),
+('反', '反', '반', 0),
+('反', '反亂', '반란', 0),
+('亂', '反亂', '반란', 1),
+('反', '反亂者', '반란자', 0),
+('亂', '反亂者', '반란자', 1),
+('者', '反亂者', '반란자', 2),
+('反', '反作用', '반작용', 0),
+('作', '反作用', '반작용', 1),
+('用', '反作用', '반작용', 2),
+('反', '反側', '반측', 0),
+('側', '反側', '반측', 1),
+('反', '反共', '반공', 0),
+('共', '反共', '반공', 1),
+('反', '反切', '반절', 0),
+('切', '反切', '반절', 1),
+('反', '反則', '반칙', 0),
+('則', '反則', '반칙', 1),
+('反', '反動', '반동', 0),
+('動', '反動', '반동', 1),
+('反', '反動分子', '반동분자', 0),
+('動', '反動分子', '반동분자', 1),
+('分', '反動分子', '반동분자', 2),
+('子', '反動分子', '반동분자', 3),
+('反', '反射', '반사', 0),
+('射', '反射', '반사', 1),
+('反', '反射鏡', '반사경', 0),
+('射', '反射鏡', '반사경', 1),
+('鏡', '反射鏡', '반사경', 2),
+('反', '反對', '반대', 0),
+('對', '反對', '반대', 1),
+('反', '反對—', '반대말', 0),
+('對', '反對—', '반대말', 1),
+('—', '反對—', '반대말', 2),
+('反', '反對便', '반대편', 0),
+('對', '反對便', '반대편', 1),
+('便', '反對便', '반대편', 2),
+('反', '反對者', '반대자', 0),
+('對', '反對者', '반대자', 1),
+('者', '反對者', '반대자', 2),
+('反', '反對語', '반대어', 0),
+('對', '反對語', '반대어', 1),
+('語', '反對語', '반대어', 2),
+('反', '反復', '반복', 0),
+('復', '反復', '반복', 1),
+('反', '反意語', '반의어', 0),
+('意', '反意語', '반의어', 1),
+('語', '反意語', '반의어', 2),
+('反', '反感', '반감', 0),
+('感', '反感', '반감', 1),
+('反', '反應', '반응', 0),
+('應', '反應', '반응', 1),
+('反', '反戰', '반전', 0),
+('戰', '反戰', '반전', 1),
+('反', '反抗', '반항', 0),
+('抗', '反抗', '반항', 1),
+('反', '反撥', '반발', 0),
+('撥', '反撥', '반발', 1),
+('反', '反擊', '반격', 0),
+('擊', '反擊', '반격', 1),
+('反', '反攻', '반공', 0),
+('攻', '反攻', '반공', 1),
+('反', '反政府', '반정부', 0),
+('政', '反政府', '반정부', 1),
+('府', '反政府', '반정부', 2),
+('反', '反旗', '반기', 0),
+('旗', '反旗', '반기', 1),
+('反', '反映', '반영', 0),
+('映', '反映', '반영', 1),
+('反', '反映論', '반영론', 0),
+('映', '反映論', '반영론', 1),
+('論', '反映論', '반영론', 2),
+('反', '反曲弓', '반곡궁', 0),
+('曲', '反曲弓', '반곡궁', 1),
+('弓', '反曲弓', '반곡궁', 2),
+('反', '反核', '반핵', 0),
+('核', '反核', '반핵', 1),
+('反', '反比例', '반비례', 0),
+('比', '反比例', '반비례', 1),
+('例', '反比例', '반비례', 2),
+('反', '反物質', '반물질', 0),
+('物', '反物質', '반물질', 1),
+('質', '反物質', '반물질', 2),
+('反', '反省', '반성', 0),
+('省', '反省', '반성', 1),
+('反', '反知性主義', '반지성주의', 0),
+('知', '反知性主義', '반지성주의', 1),
+('性', '反知性主義', '반지성주의', 2),
+('主', '反知性主義', '반지성주의', 3),
+('義', '反知性主義', '반지성주의', 4),
+('反', '反粒子', '반립자', 0),
+('粒', '反粒子', '반립자', 1),
+('子', '反粒子', '반립자', 2),
+('反', '反粒子', '반입자', 0),
+('粒', '反粒子', '반입자', 1),
+('子', '反粒子', '반입자', 2),
+('反', '反美', '반미', 0),
+('美', '反美', '반미', 1),
+('反', '反芻', '반추', 0),
+('芻', '反芻', '반추', 1),
+('反', '反芻 動物', '반추 동물', 0),
+('芻', '反芻 動物', '반추 동물', 1),
+('動', '反芻 動物', '반추 동물', 3),
+('物', '反芻 動物', '반추 동물', 4),
+('反', '反英雄', '반영웅', 0),
+('英', '反英雄', '반영웅', 1),
+('雄', '反英雄', '반영웅', 2),
+('反', '反語', '반어', 0),
+('語', '反語', '반어', 1),
+('反', '反證', '반증', 0),
+('證', '反證', '반증', 1),
+('反', '反轉', '반전', 0),
+('轉', '反轉', '반전', 1),
+('反', '反逆', '반역', 0),
+('逆', '反逆', '반역', 1),
+('反', '反逆罪', '반역죄', 0),
+('逆', '反逆罪', '반역죄', 1),
+('罪', '反逆罪', '반역죄', 2),
+('反', '反逆者', '반역자', 0),
+('逆', '反逆者', '반역자', 1),
+('者', '反逆者', '반역자', 2),
+('反', '反面', '반면', 0),
+('面', '反面', '반면', 1),
+('反', '反革命', '반혁명', 0),
+('革', '反革命', '반혁명', 1),
+('命', '反革命', '반혁명', 2),
+('反', '反響', '반향', 0),
+('響', '反響', '반향', 1),
+('反', '反駁', '반박', 0),
+('駁', '反駁', '반박', 1),
+('反', '反騰', '반등', 0),
+('騰', '反騰', '반등', 1),
+('反', '反骨', '반골', 0),
+('骨', '反骨', '반골', 1),
+('反', '反體制', '반체제', 0),
+('體', '反體制', '반체제', 1),
+('制', '反體制', '반체제', 2),
+('叔', '叔父', '숙부', 0),
+('父', '叔父', '숙부', 1),
+('取', '取', '취', 0),
+('取', '取得', '취득', 0),
+('得', '取得', '취득', 1),
+('取', '取扱', '취급', 0),
+('扱', '取扱', '취급', 1),
+('取', '取材', '취재', 0),
+('材', '取材', '취재', 1),
+('取', '取消', '취소', 0),
+('消', '取消', '취소', 1),
+('取', '取締', '취체', 0),
+('締', '取締', '취체', 1),
+('取', '取調', '취조', 0),
+('調', '取調', '취조', 1),
+('受', '受', '수', 0),
+('受', '受付', '수부', 0),
+('付', '受付', '수부', 1),
+('受', '受信人', '수신인', 0),
+('信', '受信人', '수신인', 1),
+('人', '受信人', '수신인', 2),
+('受', '受信機', '수신기', 0),
+('信', '受信機', '수신기', 1),
+('機', '受信機', '수신기', 2),
+('受', '受動態', '수동태', 0),
+('動', '受動態', '수동태', 1),
+('態', '受動態', '수동태', 2),
+('受', '受動的', '수동적', 0),
+('動', '受動的', '수동적', 1),
+('的', '受動的', '수동적', 2),
+('受', '受取', '수취', 0),
+('取', '受取', '수취', 1),
+('受', '受取人', '수취인', 0),
+('取', '受取人', '수취인', 1),
+('人', '受取人', '수취인', 2),
+('受', '受持', '수지', 0),
+('持', '受持', '수지', 1),
+('受', '受注', '수주', 0),
+('注', '受注', '수주', 1),
+('受', '受精', '수정', 0),
+('精', '受精', '수정', 1),
+('受', '受精卵', '수정란', 0),
+('精', '受精卵', '수정란', 1),
+('卵', '受精卵', '수정란', 2),
+('受', '受胎', '수태', 0),
+('胎', '受胎', '수태', 1),
+('受', '受苦', '수고', 0),
+('苦', '受苦', '수고', 1),
+('受', '受話器', '수화기', 0),
+('話', '受話器', '수화기', 1),
+('器', '受話器', '수화기', 2),
+('受', '受諾', '수락', 0),
+('諾', '受諾', '수락', 1),
+('受', '受賞', '수상', 0),
+('賞', '受賞', '수상', 1),
+('受', '受賞者', '수상자', 0),
+('賞', '受賞者', '수상자', 1),
+('者', '受賞者', '수상자', 2),
+('受', '受難', '수난', 0),
+('難', '受難', '수난', 1),
+('受', '受難曲', '수난곡', 0),
+('難', '受難曲', '수난곡', 1),
+('曲', '受難曲', '수난곡', 2),
+('受', '受驗生', '수험생', 0),
+('驗', '受驗生', '수험생', 1),
+('生', '受驗生', '수험생', 2),
+('受', '受驗者', '수험자', 0),
+('驗', '受驗者', '수험자', 1),
+('者', '受驗者', '수험자', 2),
+('叙', '叙述', '서술', 0),
+('述', '叙述', '서술', 1),
+('叛', '叛亂', '반란', 0),
+('亂', '叛亂', '반란', 1),
+('叛', '叛徒', '반도', 0),
+('徒', '叛徒', '반도', 1),
+('叛', '叛心', '반심', 0),
+('心', '叛心', '반심', 1),
+('叛', '叛旗', '반기', 0),
+('旗', '叛旗', '반기', 1),
+('叛', '叛臣', '반신', 0),
+('臣', '叛臣', '반신', 1),
+('叛', '叛賊', '반적', 0),
+('賊', '叛賊', '반적', 1),
+('叛', '叛軍', '반군', 0),
+('軍', '叛軍', '반군', 1),
+('叛', '叛逆', '반역', 0),
+('逆', '叛逆', '반역', 1),
+('叛', '叛骨', '반골', 0),
+('骨', '叛骨', '반골', 1),
+('叡', '叡智', '예지', 0),
+('智', '叡智', '예지', 1),
+('叢', '叢書', '총서', 0),
+('書', '叢書', '총서', 1),
+('叢', '叢林', '총림', 0),
+('林', '叢林', '총림', 1),
+('口', '口傳', '구전', 0),
+('傳', '口傳', '구전', 1),
+('口', '口味', '구미', 0),
+('味', '口味', '구미', 1),
+('口', '口外', '구외', 0),
+('外', '口外', '구외', 1),
+('口', '口實', '구실', 0),
+('實', '口實', '구실', 1),
+('口', '口峽炎', '구협염', 0),
+('峽', '口峽炎', '구협염', 1),
+('炎', '口峽炎', '구협염', 2),
+('口', '口徑', '구경', 0),
+('徑', '口徑', '구경', 1),
+('口', '口承', '구승', 0),
+('承', '口承', '구승', 1),
+('口', '口授', '구수', 0),
+('授', '口授', '구수', 1),
+('口', '口習', '구습', 0),
+('習', '口習', '구습', 1),
+('口', '口腔', '구강', 0),
+('腔', '口腔', '구강', 1),
+('口', '口腔 淸潔劑', '구강 청결제', 0),
+('腔', '口腔 淸潔劑', '구강 청결제', 1),
+('淸', '口腔 淸潔劑', '구강 청결제', 3),
+('潔', '口腔 淸潔劑', '구강 청결제', 4),
+('劑', '口腔 淸潔劑', '구강 청결제', 5),
+('口', '口臭', '구취', 0),
+('臭', '口臭', '구취', 1),
+('口', '口蓋', '구개', 0),
+('蓋', '口蓋', '구개', 1),
+('口', '口蓋垂', '구개수', 0),
+('蓋', '口蓋垂', '구개수', 1),
+('垂', '口蓋垂', '구개수', 2),
+('口', '口蓋帆', '구개범', 0),
+('蓋', '口蓋帆', '구개범', 1),
+('帆', '口蓋帆', '구개범', 2),
+('口', '口蓋音化', '구개음화', 0),
+('蓋', '口蓋音化', '구개음화', 1),
+('音', '口蓋音化', '구개음화', 2),
+('化', '口蓋音化', '구개음화', 3),
+('口', '口蓋骨', '구개골', 0),
+('蓋', '口蓋骨', '구개골', 1),
+('骨', '口蓋骨', '구개골', 2),
+('口', '口訣', '구결', 0),
+('訣', '口訣', '구결', 1),
+('口', '口訣字', '구결자', 0),
+('訣', '口訣字', '구결자', 1),
+('字', '口訣字', '구결자', 2),
+('口', '口語', '구어', 0),
+('語', '口語', '구어', 1),
+('口', '口語體', '구어체', 0),
+('語', '口語體', '구어체', 1),
+('體', '口語體', '구어체', 2),
+('口', '口錢', '구전', 0),
+('錢', '口錢', '구전', 1),
+('口', '口頭', '구두', 0),
+('頭', '口頭', '구두', 1),
+('古', '古事記', '고사기', 0),
+('事', '古事記', '고사기', 1),
+('記', '古事記', '고사기', 2),
+('古', '古人', '고인', 0),
+('人', '古人', '고인', 1),
+('古', '古人類學', '고인류학', 0),
+('人', '古人類學', '고인류학', 1),
+('類', '古人類學', '고인류학', 2),
+('學', '古人類學', '고인류학', 3),
+('古', '古今', '고금', 0),
+('今', '古今', '고금', 1),
+('古', '古今東西', '고금동서', 0),
+('今', '古今東西', '고금동서', 1),
+('東', '古今東西', '고금동서', 2),
+('西', '古今東西', '고금동서', 3),
+('古', '古代', '고대', 0),
+('代', '古代', '고대', 1),
+('古', '古代 韓國語', '고대 한국어', 0),
+('代', '古代 韓國語', '고대 한국어', 1),
+('韓', '古代 韓國語', '고대 한국어', 3),
+('國', '古代 韓國語', '고대 한국어', 4),
+('語', '古代 韓國語', '고대 한국어', 5),
+('古', '古代國語', '고대국어', 0),
+('代', '古代國語', '고대국어', 1),
+('國', '古代國語', '고대국어', 2),
+('語', '古代國語', '고대국어', 3),
+('古', '古典', '고전', 0),
+('典', '古典', '고전', 1),
+('古', '古典的', '고전적', 0),
+('典', '古典的', '고전적', 1),
+('的', '古典的', '고전적', 2),
+('古', '古初', '고초', 0),
+('初', '古初', '고초', 1),
+('古', '古動物學', '고동물학', 0),
+('動', '古動物學', '고동물학', 1),
+('物', '古動物學', '고동물학', 2),
+('學', '古動物學', '고동물학', 3),
+('古', '古參', '고참', 0),
+('參', '古參', '고참', 1),
+('古', '古參兵', '고참병', 0),
+('參', '古參兵', '고참병', 1),
+('兵', '古參兵', '고참병', 2),
+('古', '古名', '고명', 0),
+('名', '古名', '고명', 1),
+('古', '古地理學', '고지리학', 0),
+('地', '古地理學', '고지리학', 1),
+('理', '古地理學', '고지리학', 2),
+('學', '古地理學', '고지리학', 3),
+('古', '古宮', '고궁', 0),
+('宮', '古宮', '고궁', 1),
+('古', '古家', '고가', 0),
+('家', '古家', '고가', 1),
+('古', '古文體', '고문체', 0),
+('文', '古文體', '고문체', 1),
+('體', '古文體', '고문체', 2),
+('古', '古書', '고서', 0),
+('書', '古書', '고서', 1),
+('古', '古植物學', '고식물학', 0),
+('植', '古植物學', '고식물학', 1),
+('物', '古植物學', '고식물학', 2),
+('學', '古植物學', '고식물학', 3),
+('古', '古氣候學', '고기후학', 0),
+('氣', '古氣候學', '고기후학', 1),
+('候', '古氣候學', '고기후학', 2),
+('學', '古氣候學', '고기후학', 3),
+('古', '古物', '고물', 0),
+('物', '古物', '고물', 1),
+('古', '古物商', '고물상', 0),
+('物', '古物商', '고물상', 1),
+('商', '古物商', '고물상', 2),
+('古', '古琴', '고금', 0),
+('琴', '古琴', '고금', 1),
+('古', '古生態學', '고생태학', 0),
+('生', '古生態學', '고생태학', 1),
+('態', '古生態學', '고생태학', 2),
+('學', '古生態學', '고생태학', 3),
+('古', '古生物學', '고생물학', 0),
+('生', '古生物學', '고생물학', 1),
+('物', '古生物學', '고생물학', 2),
+('學', '古生物學', '고생물학', 3),
+('古', '古碑', '고비', 0),
+('碑', '古碑', '고비', 1),
+('古', '古稀', '고희', 0),
+('稀', '古稀', '고희', 1),
+('古', '古董', '고동', 0),
+('董', '古董', '고동', 1),
+('古', '古記', '고기', 0),
+('記', '古記', '고기', 1),
+('古', '古語', '고어', 0),
+('語', '古語', '고어', 1),
+('古', '古都', '고도', 0),
+('都', '古都', '고도', 1),
+('古', '古風', '고풍', 0),
+('風', '古風', '고풍', 1),
+('句', '句節', '구절', 0),
+('節', '句節', '구절', 1),
+('句', '句讀點', '구두점', 0),
+('讀', '句讀點', '구두점', 1),
+('點', '句讀點', '구두점', 2),
+('叩', '叩扉', '고비', 0),
+('扉', '叩扉', '고비', 1),
+('叩', '叩頭', '고두', 0),
+('頭', '叩頭', '고두', 1),
+('叩', '叩首', '고수', 0),
+('首', '叩首', '고수', 1),
+('只', '只今', '지금', 0),
+('今', '只今', '지금', 1),
+('只', '只今-', '지금껏', 0),
+('今', '只今-', '지금껏', 1),
+('-', '只今-', '지금껏', 2),
+('召', '召喚', '소환', 0),
+('喚', '召喚', '소환', 1),
+('召', '召喚狀', '소환장', 0),
+('喚', '召喚狀', '소환장', 1),
+('狀', '召喚狀', '소환장', 2),
+('召', '召還', '소환', 0),
+('還', '召還', '소환', 1),
+('召', '召集', '소집', 0),
+('集', '召集', '소집', 1),
+('叮', '叮嚀', '정녕', 0),
+('嚀', '叮嚀', '정녕', 1),
+('可', '可', '가', 0),
+('可', '可動', '가동', 0),
+('動', '可動', '가동', 1),
+('可', '可及的', '가급적', 0),
+('及', '可及的', '가급적', 1),
+('的', '可及的', '가급적', 2),
+('可', '可塑劑', '가소제', 0),
+('塑', '可塑劑', '가소제', 1),
+('劑', '可塑劑', '가소제', 2),
+('可', '可憐', '가련', 0),
+('憐', '可憐', '가련', 1),
+('可', '可燃性', '가연성', 0),
+('燃', '可燃性', '가연성', 1),
+('性', '可燃性', '가연성', 2),
+('可', '可燃物', '가연물', 0),
+('燃', '可燃物', '가연물', 1),
+('物', '可燃物', '가연물', 2),
+('可', '可知', '가지', 0),
+('知', '可知', '가지', 1),
+('可', '可能', '가능', 0),
+('能', '可能', '가능', 1),
+('可', '可能性', '가능성', 0),
+('能', '可能性', '가능성', 1),
+('性', '可能性', '가능성', 2),
+('可', '可視光線', '가시광선', 0),
+('視', '可視光線', '가시광선', 1),
+('光', '可視光線', '가시광선', 2),
+('線', '可視光線', '가시광선', 3),
+('可', '可視化', '가시화', 0),
+('視', '可視化', '가시화', 1),
+('化', '可視化', '가시화', 2),
+('可', '可觀', '가관', 0),
+('觀', '可觀', '가관', 1),
+('可', '可謂', '가위', 0),
+('謂', '可謂', '가위', 1),
+('可', '可讀性', '가독성', 0),
+('讀', '可讀性', '가독성', 1),
+('性', '可讀性', '가독성', 2),
+('可', '可變', '가변', 0),
+('變', '可變', '가변', 1),
+('可', '可逆', '가역', 0),
+('逆', '可逆', '가역', 1),
+('可', '可降水量', '가강수량', 0),
+('降', '可降水量', '가강수량', 1),
+('水', '可降水量', '가강수량', 2),
+('量', '可降水量', '가강수량', 3),
+('台', '台風', '태풍', 0),
+('風', '台風', '태풍', 1),
+('叱', '叱咤', '질타', 0),
+('咤', '叱咤', '질타', 1),
+('叱', '叱責', '질책', 0),
+('責', '叱責', '질책', 1),
+('史', '史', '사', 0),
+('史', '史上', '사상', 0),
+('上', '史上', '사상', 1),
+('史', '史劇', '사극', 0),
+('劇', '史劇', '사극', 1),
+('史', '史學', '사학', 0),
+('學', '史學', '사학', 1),
+('史', '史學者', '사학자', 0),
+('學', '史學者', '사학자', 1),
+('者', '史學者', '사학자', 2),
+('史', '史書', '사서', 0),
+('書', '史書', '사서', 1),
+('史', '史畫', '사화', 0),
+('畫', '史畫', '사화', 1),
+('史', '史畵', '사화', 0),
+('畵', '史畵', '사화', 1),
+('史', '史的', '사적', 0),
+('的', '史的', '사적', 1),
+('史', '史禍', '사화', 0),
+('禍', '史禍', '사화', 1),
+('史', '史籍', '사적', 0),
+('籍', '史籍', '사적', 1),
+('史', '史記', '사기', 0),
+('記', '史記', '사기', 1),
+('史', '史話', '사화', 0),
+('話', '史話', '사화', 1),
+('史', '史跡', '사적', 0),
+('跡', '史跡', '사적', 1),
+('史', '史蹟', '사적', 0),
+('蹟', '史蹟', '사적', 1),
+('右', '右岸', '우안', 0),
+('岸', '右岸', '우안', 1),
+('右', '右拇印', '우무인', 0),
+('拇', '右拇印', '우무인', 1),
+('印', '右拇印', '우무인', 2),
+('右', '右派', '우파', 0),
+('派', '右派', '우파', 1),
+('右', '右翼手', '우익수', 0),
+('翼', '右翼手', '우익수', 1),
+('手', '右翼手', '우익수', 2),
+('右', '右舷', '우현', 0),
+('舷', '右舷', '우현', 1),
+('右', '右좀', '우좀', 0),
+('좀', '右좀', '우좀', 1),
+('司', '司令', '사령', 0),
+('令', '司令', '사령', 1),
+('司', '司令官', '사령관', 0),
+('令', '司令官', '사령관', 1),
+('官', '司令官', '사령관', 2),
+('司', '司令部', '사령부', 0),
+('令', '司令部', '사령부', 1),
+('部', '司令部', '사령부', 2),
+('司', '司倉', '사창', 0),
+('倉', '司倉', '사창', 1),
+('司', '司書', '사서', 0),
+('書', '司書', '사서', 1),
+('司', '司會', '사회', 0),
+('會', '司會', '사회', 1),
+('司', '司會者', '사회자', 0),
+('會', '司會者', '사회자', 1),
+('者', '司會者', '사회자', 2),
+('司', '司法', '사법', 0),
+('法', '司法', '사법', 1),
+('司', '司祭', '사제', 0),
+('祭', '司祭', '사제', 1),
+('司', '司試', '사시', 0),
+('試', '司試', '사시', 1),
+('司', '司譯院', '사역원', 0),
+('譯', '司譯院', '사역원', 1),
+('院', '司譯院', '사역원', 2),
+('司', '司馬', '사마', 0),
+('馬', '司馬', '사마', 1),
+('各', '各', '각', 0),
+('各', '各個', '각개', 0),
+('個', '各個', '각개', 1),
+('各', '各其', '각기', 0),
+('其', '各其', '각기', 1),
+('各', '各各', '각각', 0),
+('各', '各各', '각각', 1),
+('各', '各國', '각국', 0),
+('國', '各國', '각국', 1),
+('各', '各種', '각종', 0),
+('種', '各種', '각종', 1),
+('各', '各自', '각자', 0),
+('自', '各自', '각자', 1),
+('合', '合', '합', 0),
+('合', '合--', '합치다', 0),
+('-', '合--', '합치다', 1),
+('-', '合--', '합치다', 2),
+('合', '合作', '합작', 0),
+('作', '合作', '합작', 1),
+('合', '合倂', '합병', 0),
+('倂', '合倂', '합병', 1),
+('合', '合力', '합력', 0),
+('力', '合力', '합력', 1),
+('合', '合同', '합동', 0),
+('同', '合同', '합동', 1),
+('合', '合唱', '합창', 0),
+('唱', '合唱', '합창', 1),
+('合', '合唱團', '합창단', 0),
+('唱', '合唱團', '합창단', 1),
+('團', '合唱團', '합창단', 2),
+('合', '合奏', '합주', 0),
+('奏', '合奏', '합주', 1),
+('合', '合字', '합자', 0),
+('字', '合字', '합자', 1),
+('合', '合意', '합의', 0),
+('意', '合意', '합의', 1),
+('合', '合成', '합성', 0),
+('成', '合成', '합성', 1),
+('合', '合成語', '합성어', 0),
+('成', '合成語', '합성어', 1),
+('語', '合成語', '합성어', 2),
+('合', '合成錄音', '합성록음', 0),
+('成', '合成錄音', '합성록음', 1),
+('錄', '合成錄音', '합성록음', 2),
+('音', '合成錄音', '합성록음', 3),
+('合', '合房', '합방', 0),
+('房', '合房', '합방', 1),
+('合', '合板', '합판', 0),
+('板', '合板', '합판', 1),
+('合', '合格', '합격', 0),
+('格', '合格', '합격', 1),
+('合', '合氣道', '합기도', 0),
+('氣', '合氣道', '합기도', 1),
+('道', '合氣道', '합기도', 2),
+('合', '合法', '합법', 0),
+('法', '合法', '합법', 1),
+('合', '合法化', '합법화', 0),
+('法', '合法化', '합법화', 1),
+('化', '合法化', '합법화', 2),
+('合', '合法的', '합법적', 0),
+('法', '合法的', '합법적', 1),
+('的', '合法的', '합법적', 2),
+('合', '合理主義', '합리주의', 0),
+('理', '合理主義', '합리주의', 1),
+('主', '合理主義', '합리주의', 2),
+('義', '合理主義', '합리주의', 3),
+('合', '合理的', '합리적', 0),
+('理', '合理的', '합리적', 1),
+('的', '合理的', '합리적', 2),
+('合', '合理論', '합리론', 0),
+('理', '合理論', '합리론', 1),
+('論', '合理論', '합리론', 2),
+('合', '合當', '합당', 0),
+('當', '合當', '합당', 1),
+('合', '合線', '합선', 0),
+('線', '合線', '합선', 1),
+('合', '合緣奇緣', '합연기연', 0),
+('緣', '合緣奇緣', '합연기연', 1),
+('奇', '合緣奇緣', '합연기연', 2),
+('緣', '合緣奇緣', '합연기연', 3),
+('合', '合衆國', '합중국', 0),
+('衆', '合衆國', '합중국', 1),
+('國', '合衆國', '합중국', 2),
+('合', '合計', '합계', 0),
+('計', '合計', '합계', 1),
+('合', '合議', '합의', 0),
+('議', '合議', '합의', 1),
+('合', '合邦', '합방', 0),
+('邦', '合邦', '합방', 1),
+('合', '合金', '합금', 0),
+('金', '合金', '합금', 1),
+('合', '合體', '합체', 0),
+('體', '合體', '합체', 1),
+('合', '合黨', '합당', 0),
+('黨', '合黨', '합당', 1),
+('吉', '吉', '길', 0),
+('吉', '吉夢', '길몽', 0),
+('夢', '吉夢', '길몽', 1),
+('吉', '吉慶', '길경', 0),
+('慶', '吉慶', '길경', 1),
+('吉', '吉更', '길경', 0),
+('更', '吉更', '길경', 1),
+('吉', '吉林', '길림', 0),
+('林', '吉林', '길림', 1),
+('吉', '吉運', '길운', 0),
+('運', '吉運', '길운', 1),
+('吊', '吊橋', '적교', 0),
+('橋', '吊橋', '적교', 1),
+('同', '同', '동', 0),
+('同', '同一', '동일', 0),
+('一', '同一', '동일', 1),
+('同', '同上', '동상', 0),
+('上', '同上', '동상', 1),
+('同', '同人', '동인', 0),
+('人', '同人', '동인', 1),
+('同', '同仁', '동인', 0),
+('仁', '同仁', '동인', 1),
+('同', '同伴', '동반', 0),
+('伴', '同伴', '동반', 1),
+('同', '同伴者', '동반자', 0),
+('伴', '同伴者', '동반자', 1),
+('者', '同伴者', '동반자', 2),
+('同', '同僚', '동료', 0),
+('僚', '同僚', '동료', 1),
+('同', '同化', '동화', 0),
+('化', '同化', '동화', 1),
+('同', '同化作用', '동화작용', 0),
+('化', '同化作用', '동화작용', 1),
+('作', '同化作用', '동화작용', 2),
+('用', '同化作用', '동화작용', 3),
+('同', '同名人', '동명인', 0),
+('名', '同名人', '동명인', 1),
+('人', '同名人', '동명인', 2),
+('同', '同君聯合', '동군연합', 0),
+('君', '同君聯合', '동군연합', 1),
+('聯', '同君聯合', '동군연합', 2),
+('合', '同君聯合', '동군연합', 3),
+('同', '同型', '동형', 0),
+('型', '同型', '동형', 1),
+('同', '同好會', '동호회', 0),
+('好', '同好會', '동호회', 1),
+('會', '同好會', '동호회', 2),
+('同', '同姓婚', '동성혼', 0),
+('姓', '同姓婚', '동성혼', 1),
+('婚', '同姓婚', '동성혼', 2),
+('同', '同寅', '동인', 0),
+('寅', '同寅', '동인', 1),
+('同', '同居', '동거', 0),
+('居', '同居', '동거', 1),
+('同', '同居人', '동거인', 0),
+('居', '同居人', '동거인', 1),
+('人', '同居人', '동거인', 2),
+('同', '同年', '동년', 0),
+('年', '同年', '동년', 1),
+('同', '同床異夢', '동상이몽', 0),
+('床', '同床異夢', '동상이몽', 1),
+('異', '同床異夢', '동상이몽', 2),
+('夢', '同床異夢', '동상이몽', 3),
+('同', '同心', '동심', 0),
+('心', '同心', '동심', 1),
+('同', '同志', '동지', 0),
+('志', '同志', '동지', 1),
+('同', '同性', '동성', 0),
+('性', '同性', '동성', 1),
+('同', '同性婚', '동성혼', 0),
+('性', '同性婚', '동성혼', 1),
+('婚', '同性婚', '동성혼', 2),
+('同', '同性愛', '동성애', 0),
+('性', '同性愛', '동성애', 1),
+('愛', '同性愛', '동성애', 2),
+('同', '同性愛者', '동성애자', 0),
+('性', '同性愛者', '동성애자', 1),
+('愛', '同性愛者', '동성애자', 2),
+('者', '同性愛者', '동성애자', 3),
+('同', '同情', '동정', 0),
+('情', '同情', '동정', 1),
+('同', '同情心', '동정심', 0),
+('情', '同情心', '동정심', 1),
+('心', '同情心', '동정심', 2),
+('同', '同意', '동의', 0),
+('意', '同意', '동의', 1),
+('同', '同意語', '동의어', 0),
+('意', '同意語', '동의어', 1),
+('語', '同意語', '동의어', 2),
+('同', '同感', '동감', 0),
+('感', '同感', '동감', 1),
+('同', '同文', '동문', 0),
+('文', '同文', '동문', 1),
+('同', '同文同種', '동문동종', 0),
+('文', '同文同種', '동문동종', 1),
+('同', '同文同種', '동문동종', 2),
+('種', '同文同種', '동문동종', 3),
+('同', '同時', '동시', 0),
+('時', '同時', '동시', 1),
+('同', '同期', '동기', 0),
+('期', '同期', '동기', 1),
+('同', '同棲', '동서', 0),
+('棲', '同棲', '동서', 1),
+('同', '同業者', '동업자', 0),
+('業', '同業者', '동업자', 1),
+('者', '同業者', '동업자', 2),
+('同', '同歸於盡', '동귀어진', 0),
+('歸', '同歸於盡', '동귀어진', 1),
+('於', '同歸於盡', '동귀어진', 2),
+('盡', '同歸於盡', '동귀어진', 3),
+('同', '同生', '동생', 0),
+('生', '同生', '동생', 1),
+('同', '同甲', '동갑', 0),
+('甲', '同甲', '동갑', 1),
+('同', '同盟', '동맹', 0),
+('盟', '同盟', '동맹', 1),
+('同', '同盟國', '동맹국', 0),
+('盟', '同盟國', '동맹국', 1),
+('國', '同盟國', '동맹국', 2),
+('同', '同社', '동사', 0),
+('社', '同社', '동사', 1),
+('同', '同種', '동종', 0),
+('種', '同種', '동종', 1),
+('同', '同種療法', '동종요법', 0),
+('種', '同種療法', '동종요법', 1),
+('療', '同種療法', '동종요법', 2),
+('法', '同種療法', '동종요법', 3),
+('同', '同窓', '동창', 0),
+('窓', '同窓', '동창', 1),
+('同', '同等', '동등', 0),
+('等', '同等', '동등', 1),
+('同', '同系', '동계', 0),
+('系', '同系', '동계', 1),
+('同', '同級生', '동급생', 0),
+('級', '同級生', '동급생', 1),
+('生', '同級生', '동급생', 2),
+('同', '同義語', '동의어', 0),
+('義', '同義語', '동의어', 1),
+('語', '同義語', '동의어', 2),
+('同', '同胞', '동포', 0),
+('胞', '同胞', '동포', 1),
+('同', '同行', '동행', 0),
+('行', '同行', '동행', 1),
+('同', '同調', '동조', 0),
+('調', '同調', '동조', 1),
+('同', '同調者', '동조자', 0),
+('調', '同調者', '동조자', 1),
+('者', '同調者', '동조자', 2),
+('同', '同質', '동질', 0),
+('質', '同質', '동질', 1),
+('同', '同輩', '동배', 0),
+('輩', '同輩', '동배', 1),
+('同', '同門', '동문', 0),
+('門', '同門', '동문', 1),
+('同', '同音異義語', '동음이의어', 0),
+('音', '同音異義語', '동음이의어', 1),
+('異', '同音異義語', '동음이의어', 2),
+('義', '同音異義語', '동음이의어', 3),
+('語', '同音異義語', '동음이의어', 4),
+('同', '同類', '동류', 0),
+('類', '同類', '동류', 1),
+('名', '名', '명', 0),
+('名', '名不虛傳', '명불허전', 0),
+('不', '名不虛傳', '명불허전', 1),
+('虛', '名不虛傳', '명불허전', 2),
+('傳', '名不虛傳', '명불허전', 3),
+('名', '名人', '명인', 0),
+('人', '名人', '명인', 1),
+('名', '名作', '명작', 0),
+('作', '名作', '명작', 1),
+('名', '名分', '명분', 0),
+('分', '名分', '명분', 1),
+('名', '名勝', '명승', 0),
+('勝', '名勝', '명승', 1),
+('名', '名勝古跡', '명승고적', 0),
+('勝', '名勝古跡', '명승고적', 1),
+('古', '名勝古跡', '명승고적', 2),
+('跡', '名勝古跡', '명승고적', 3),
+('名', '名匠', '명장', 0),
+('匠', '名匠', '명장', 1),
+('名', '名唱', '명창', 0),
+('唱', '名唱', '명창', 1),
+('名', '名單', '명단', 0),
+('單', '名單', '명단', 1),
+('名', '名士', '명사', 0),
+('士', '名士', '명사', 1),
+('名', '名字', '명자', 0),
+('字', '名字', '명자', 1),
+('名', '名家', '명가', 0),
+('家', '名家', '명가', 1),
+('名', '名實相符', '명실상부', 0),
+('實', '名實相符', '명실상부', 1),
+('相', '名實相符', '명실상부', 2),
+('符', '名實相符', '명실상부', 3),
+('名', '名將', '명장', 0),
+('將', '名將', '명장', 1),
+('名', '名工', '명공', 0),
+('工', '名工', '명공', 1),
+('名', '名所', '명소', 0),
+('所', '名所', '명소', 1),
+('名', '名手', '명수', 0),
+('手', '名手', '명수', 1),
+('名', '名文', '명문', 0),
+('文', '名文', '명문', 1),
+('名', '名文集', '명문집', 0),
+('文', '名文集', '명문집', 1),
+('集', '名文集', '명문집', 2),
+('名', '名曲', '명곡', 0),
+('曲', '名曲', '명곡', 1),
+('名', '名望', '명망', 0),
+('望', '名望', '명망', 1),
+('名', '名狀', '명상', 0),
+('狀', '名狀', '명상', 1),
+('名', '名盤', '명반', 0),
+('盤', '名盤', '명반', 1),
+('名', '名目', '명목', 0),
+('目', '名目', '명목', 1),
+('名', '名祖', '명조', 0),
+('祖', '名祖', '명조', 1),
+('名', '名稱', '명칭', 0),
+('稱', '名稱', '명칭', 1),
+('名', '名節', '명절', 0),
+('節', '名節', '명절', 1),
+('名', '名簿', '명부', 0),
+('簿', '名簿', '명부', 1),
+('名', '名義', '명의', 0),
+('義', '名義', '명의', 1),
+('名', '名聞', '명문', 0),
+('聞', '名聞', '명문', 1),
+('名', '名聲', '명성', 0),
+('聲', '名聲', '명성', 1),
+('名', '名言', '명언', 0),
+('言', '名言', '명언', 1),
+('名', '名詞', '명사', 0),
+('詞', '名詞', '명사', 1),
+('名', '名詞化', '명사화', 0),
+('詞', '名詞化', '명사화', 1),
+('化', '名詞化', '명사화', 2),
+('名', '名詞句', '명사구', 0),
+('詞', '名詞句', '명사구', 1),
+('句', '名詞句', '명사구', 2),
+('名', '名詩', '명시', 0),
+('詩', '名詩', '명시', 1),
+('名', '名詩 選集', '명시 선집', 0),
+('詩', '名詩 選集', '명시 선집', 1),
+('選', '名詩 選集', '명시 선집', 3),
+('集', '名詩 選集', '명시 선집', 4),
+('名', '名譽', '명예', 0),
+('譽', '名譽', '명예', 1),
+('名', '名辭', '명사', 0),
+('辭', '名辭', '명사', 1),
+('名', '名銜', '명함', 0),
+('銜', '名銜', '명함', 1),
+('名', '名門', '명문', 0),
+('門', '名門', '명문', 1),
+('吏', '吏曹', '이조', 0),
+('曹', '吏曹', '이조', 1),
+('吏', '吏治', '리치', 0),
+('治', '吏治', '리치', 1),
+('吏', '吏讀', '리두', 0),
+('讀', '吏讀', '리두', 1),
+('吏', '吏讀', '이두', 0),
+('讀', '吏讀', '이두', 1),
+('吐', '吐', '토', 0),
+('吐', '吐器', '토기', 0),
+('器', '吐器', '토기', 1),
+('吐', '吐氣', '토기', 0),
+('氣', '吐氣', '토기', 1),
+('吐', '吐血', '토혈', 0),
+('血', '吐血', '토혈', 1),
+('吐', '吐谷渾', '토욕혼', 0),
+('谷', '吐谷渾', '토욕혼', 1),
+('渾', '吐谷渾', '토욕혼', 2),
+('吐', '吐露', '토로', 0),
+('露', '吐露', '토로', 1),
+('向', '向', '향', 0),
+('向', '向上', '향상', 0),
+('上', '向上', '향상', 1),
+('向', '向路', '향로', 0),
+('路', '向路', '향로', 1),
+('君', '君', '군', 0),
+('君', '君主', '군주', 0),
+('主', '君主', '군주', 1),
+('君', '君主制', '군주제', 0),
+('主', '君主制', '군주제', 1),
+('制', '君主制', '군주제', 2),
+('君', '君主國', '군주국', 0),
+('主', '君主國', '군주국', 1),
+('國', '君主國', '군주국', 2),
+('君', '君子', '군자', 0),
+('子', '君子', '군자', 1),
+('君', '君子之國', '군자지국', 0),
+('子', '君子之國', '군자지국', 1),
+('之', '君子之國', '군자지국', 2),
+('國', '君子之國', '군자지국', 3),
+('君', '君民', '군민', 0),
+('民', '君民', '군민', 1),
+('君', '君王', '군왕', 0),
+('王', '君王', '군왕', 1),
+('君', '君臨', '군림', 0),
+('臨', '君臨', '군림', 1),
+('吝', '吝嗇', '인색', 0),
+('嗇', '吝嗇', '인색', 1),
+('吟', '吟味', '음미', 0),
+('味', '吟味', '음미', 1),
+('吟', '吟詠', '음영', 0),
+('詠', '吟詠', '음영', 1),
+('吟', '吟遊詩人', '음유시인', 0),
+('遊', '吟遊詩人', '음유시인', 1),
+('詩', '吟遊詩人', '음유시인', 2),
+('人', '吟遊詩人', '음유시인', 3),
+('否', '否定', '부정', 0),
+('定', '否定', '부정', 1),
+('否', '否定的', '부정적', 0),
+('定', '否定的', '부정적', 1),
+('的', '否定的', '부정적', 2),
+('否', '否定語', '부정어', 0),
+('定', '否定語', '부정어', 1),
+('語', '否定語', '부정어', 2),
+('否', '否決', '부결', 0),
+('決', '否決', '부결', 1),
+('否', '否認', '부인', 0),
+('認', '否認', '부인', 1),
+('否', '否運', '비운', 0),
+('運', '否運', '비운', 1),
+('含', '含有', '함유', 0),
+('有', '含有', '함유', 1),
+('含', '含蓄', '함축', 0),
+('蓄', '含蓄', '함축', 1),
+('含', '含量', '함량', 0),
+('量', '含量', '함량', 1),
+('吳', '吳', '오', 0),
+('吸', '吸入', '흡입', 0),
+('入', '吸入', '흡입', 1),
+('吸', '吸引力', '흡인력', 0),
+('引', '吸引力', '흡인력', 1),
+('力', '吸引力', '흡인력', 2),
+('吸', '吸收', '흡수', 0),
+('收', '吸收', '흡수', 1),
+('吸', '吸收紙', '흡수지', 0),
+('收', '吸收紙', '흡수지', 1),
+('紙', '吸收紙', '흡수지', 2),
+('吸', '吸氣', '흡기', 0),
+('氣', '吸氣', '흡기', 1),
+('吸', '吸煙', '흡연', 0),
+('煙', '吸煙', '흡연', 1),
+('吸', '吸煙者', '흡연자', 0),
+('煙', '吸煙者', '흡연자', 1),
+('者', '吸煙者', '흡연자', 2),
+('吸', '吸盤', '흡반', 0),
+('盤', '吸盤', '흡반', 1),
+('吸', '吸蟲', '흡충', 0),
+('蟲', '吸蟲', '흡충', 1),
+('吸', '吸血', '흡혈', 0),
+('血', '吸血', '흡혈', 1),
+('吸', '吸血動物', '흡혈동물', 0),
+('血', '吸血動物', '흡혈동물', 1),
+('動', '吸血動物', '흡혈동물', 2),
+('物', '吸血動物', '흡혈동물', 3),
+('吸', '吸血鬼', '흡혈귀', 0),
+('血', '吸血鬼', '흡혈귀', 1),
+('鬼', '吸血鬼', '흡혈귀', 2),
+('吹', '吹管', '취관', 0),
+('管', '吹管', '취관', 1),
+('吹', '吹𠼱', '주라', 0),
+('𠼱', '吹𠼱', '주라', 1),
+('吾', '吾黨', '오당', 0),
+('黨', '吾黨', '오당', 1),
+('呂', '呂宋煙', '여송연', 0),
+('宋', '呂宋煙', '여송연', 1),
+('煙', '呂宋煙', '여송연', 2),
+('呂', '呂布', '여포', 0),
+('布', '呂布', '여포', 1),
+('呈', '呈才', '정재', 0),
+('才', '呈才', '정재', 1),
+('告', '告別', '고별', 0),
+('別', '告別', '고별', 1),
+('告', '告發', '고발', 0),
+('發', '告發', '고발', 1),
+('告', '告白', '고백', 0),
+('白', '告白', '고백', 1),
+('告', '告知', '고지', 0),
+('知', '告知', '고지', 1),
+('告', '告示', '고시', 0),
+('示', '告示', '고시', 1),
+('告', '告解', '고해', 0),
+('解', '告解', '고해', 1),
+('告', '告訴', '고소', 0),
+('訴', '告訴', '고소', 1),
+('告', '告訴人', '고소인', 0),
+('訴', '告訴人', '고소인', 1),
+('人', '告訴人', '고소인', 2),
+('周', '周圍', '주위', 0),
+('圍', '周圍', '주위', 1),
+('周', '周年', '주년', 0),
+('年', '周年', '주년', 1),
+('周', '周旋', '주선', 0),
+('旋', '周旋', '주선', 1),
+('周', '周波', '주파', 0),
+('波', '周波', '주파', 1),
+('周', '周知', '주지', 0),
+('知', '周知', '주지', 1),
+('周', '周邊', '주변', 0),
+('邊', '周邊', '주변', 1),
+('周', '周鉢', '주발', 0),
+('鉢', '周鉢', '주발', 1),
+('呪', '呪文', '주문', 0),
+('文', '呪文', '주문', 1),
+('味', '味蕾', '미뢰', 0),
+('蕾', '味蕾', '미뢰', 1),
+('味', '味覺', '미각', 0),
+('覺', '味覺', '미각', 1),
+('呵', '呵責', '가책', 0),
+('責', '呵責', '가책', 1),
+('呻', '呻吟', '신음', 0),
+('吟', '呻吟', '신음', 1),
+('呼', '呼出', '호출', 0),
+('出', '呼出', '호출', 1),
+('呼', '呼出 符號', '호출 부호', 0),
+('出', '呼出 符號', '호출 부호', 1),
+('符', '呼出 符號', '호출 부호', 3),
+('號', '呼出 符號', '호출 부호', 4),
+('呼', '呼出機', '호출기', 0),
+('出', '呼出機', '호출기', 1),
+('機', '呼出機', '호출기', 2),
+('呼', '呼名', '호명', 0),
+('名', '呼名', '호명', 1),
+('呼', '呼名点呼', '호명점호', 0),
+('名', '呼名点呼', '호명점호', 1),
+('点', '呼名点呼', '호명점호', 2),
+('呼', '呼名点呼', '호명점호', 3),
+('呼', '呼名點呼', '호명점호', 0),
+('名', '呼名點呼', '호명점호', 1),
+('點', '呼名點呼', '호명점호', 2),
+('呼', '呼名點呼', '호명점호', 3),
+('呼', '呼吸', '호흡', 0),
+('吸', '呼吸', '호흡', 1),
+('呼', '呼吸器', '호흡기', 0),
+('吸', '呼吸器', '호흡기', 1),
+('器', '呼吸器', '호흡기', 2),
+('呼', '呼吸困難', '호흡곤란', 0),
+('吸', '呼吸困難', '호흡곤란', 1),
+('困', '呼吸困難', '호흡곤란', 2),
+('難', '呼吸困難', '호흡곤란', 3),
+('呼', '呼吸系統', '호흡계통', 0),
+('吸', '呼吸系統', '호흡계통', 1),
+('系', '呼吸系統', '호흡계통', 2),
+('統', '呼吸系統', '호흡계통', 3),
+('呼', '呼應', '호응', 0),
+('應', '呼應', '호응', 1),
+('呼', '呼格', '호격', 0),
+('格', '呼格', '호격', 1),
+('呼', '呼氣', '호기', 0),
+('氣', '呼氣', '호기', 1),
+('呼', '呼稱', '호칭', 0),
+('稱', '呼稱', '호칭', 1),
+('呼', '呼號', '호호', 0),
+('號', '呼號', '호호', 1),
+('呼', '呼訴', '호소', 0),
+('訴', '呼訴', '호소', 1),
+('命', '命', '명', 0),
+('命', '命中', '명중', 0),
+('中', '命中', '명중', 1),
+('命', '命令', '명령', 0),
+('令', '命令', '명령', 1),
+('命', '命令法', '명령법', 0),
+('令', '命令法', '명령법', 1),
+('法', '命令法', '명령법', 2),
+('命', '命令語', '명령어', 0),
+('令', '命令語', '명령어', 1),
+('語', '命令語', '명령어', 2),
+('命', '命名', '명명', 0),
+('名', '命名', '명명', 1),
+('命', '命名法', '명명법', 0),
+('名', '命名法', '명명법', 1),
+('法', '命名法', '명명법', 2),
+('命', '命運', '명운', 0),
+('運', '命運', '명운', 1),
+('命', '命門', '명문', 0),
+('門', '命門', '명문', 1),
+('命', '命題', '명제', 0),
+('題', '命題', '명제', 1),
+('咀', '咀嚼', '저작', 0),
+('嚼', '咀嚼', '저작', 1),
+('咆', '咆哮', '포효', 0),
+('哮', '咆哮', '포효', 1),
+('和', '和', '화', 0),
+('和', '和合', '화합', 0),
+('合', '和合', '화합', 1),
+('和', '和尙', '화상', 0),
+('尙', '和尙', '화상', 1),
+('和', '和平', '화평', 0),
+('平', '和平', '화평', 1),
+('和', '和睦', '화목', 0),
+('睦', '和睦', '화목', 1),
+('和', '和紙', '화지', 0),
+('紙', '和紙', '화지', 1),
+('和', '和聲', '화성', 0),
+('聲', '和聲', '화성', 1),
+('和', '和蘭', '화란', 0),
+('蘭', '和蘭', '화란', 1),
+('和', '和製漢語', '화제한어', 0),
+('製', '和製漢語', '화제한어', 1),
+('漢', '和製漢語', '화제한어', 2),
+('語', '和製漢語', '화제한어', 3),
+('和', '和解', '화해', 0),
+('解', '和解', '화해', 1),
+('和', '和集合', '합집합', 0),
+('集', '和集合', '합집합', 1),
+('合', '和集合', '합집합', 2),
+('和', '和音', '화음', 0),
+('音', '和音', '화음', 1),
+('咒', '咒文', '주문', 0),
+('文', '咒文', '주문', 1),
+('咖', '咖啡', '가배', 0),
+('啡', '咖啡', '가배', 1),
+('咫', '咫尺', '지척', 0),
+('尺', '咫尺', '지척', 1),
+('咯', '咯血', '각혈', 0),
+('血', '咯血', '각혈', 1),
+('咳', '咳嗽', '해수', 0),
+('嗽', '咳嗽', '해수', 1),
+('咸', '咸興', '함흥', 0),
+('興', '咸興', '함흥', 1),
+('咸', '咸興差使', '함흥차사', 0),
+('興', '咸興差使', '함흥차사', 1),
+('差', '咸興差使', '함흥차사', 2),
+('使', '咸興差使', '함흥차사', 3),
+('咸', '咸鏡', '함경', 0),
+('鏡', '咸鏡', '함경', 1),
+('咸', '咸鏡北道', '함경북도', 0),
+('鏡', '咸鏡北道', '함경북도', 1),
+('北', '咸鏡北道', '함경북도', 2),
+('道', '咸鏡北道', '함경북도', 3),
+('咸', '咸鏡南道', '함경남도', 0),
+('鏡', '咸鏡南道', '함경남도', 1),
+('南', '咸鏡南道', '함경남도', 2),
+('道', '咸鏡南道', '함경남도', 3),
+('咸', '咸鏡道', '함경도', 0),
+('鏡', '咸鏡道', '함경도', 1),
+('道', '咸鏡道', '함경도', 2),
+('咽', '咽喉', '인후', 0),
+('喉', '咽喉', '인후', 1),
+('咽', '咽喉炎', '인후염', 0),
+('喉', '咽喉炎', '인후염', 1),
+('炎', '咽喉炎', '인후염', 2),
+('咽', '咽頭', '인두', 0),
+('頭', '咽頭', '인두', 1),
+('哀', '哀叫', '애규', 0),
+('叫', '哀叫', '애규', 1),
+('哀', '哀哭', '애곡', 0),
+('哭', '哀哭', '애곡', 1),
+('哀', '哀嘆', '애탄', 0),
+('嘆', '哀嘆', '애탄', 1),
+('哀', '哀悼', '애도', 0),
+('悼', '哀悼', '애도', 1),
+('哀', '哀愁', '애수', 0),
+('愁', '哀愁', '애수', 1),
+('哀', '哀歌', '애가', 0),
+('歌', '哀歌', '애가', 1),
+('哀', '哀歡', '애환', 0),
+('歡', '哀歡', '애환', 1),
+('哀', '哀痛', '애통', 0),
+('痛', '哀痛', '애통', 1),
+('哀', '哀調', '애조', 0),
+('調', '哀調', '애조', 1),
+('哀', '哀願', '애원', 0),
+('願', '哀願', '애원', 1),
+('品', '品位', '품위', 0),
+('位', '品位', '품위', 1),
+('品', '品切', '품절', 0),
+('切', '品切', '품절', 1),
+('品', '品性', '품성', 0),
+('性', '品性', '품성', 1),
+('品', '品格', '품격', 0),
+('格', '品格', '품격', 1),
+('品', '品目', '품목', 0),
+('目', '品目', '품목', 1),
+('品', '品種', '품종', 0),
+('種', '品種', '품종', 1),
+('品', '品行', '품행', 0),
+('行', '品行', '품행', 1),
+('品', '品評會', '품평회', 0),
+('評', '品評會', '품평회', 1),
+('會', '品評會', '품평회', 2),
+('品', '品詞', '품사', 0),
+('詞', '品詞', '품사', 1),
+('品', '品質', '품질', 0),
+('質', '品質', '품질', 1),
+('員', '員數', '원수', 0),
+('數', '員數', '원수', 1),
+('哱', '哱囉', '바라', 0),
+('囉', '哱囉', '바라', 1),
+('哲', '哲人', '철인', 0),
+('人', '哲人', '철인', 1),
+('哲', '哲學', '철학', 0),
+('學', '哲學', '철학', 1),
+('哲', '哲學者', '철학자', 0),
+('學', '哲學者', '철학자', 1),
+('者', '哲學者', '철학자', 2),
+('哲', '哲理', '철리', 0),
+('理', '哲理', '철리', 1),
+('哺', '哺乳類', '포유류', 0),
+('乳', '哺乳類', '포유류', 1),
+('類', '哺乳類', '포유류', 2),
+('唐', '唐', '당', 0),
+('唐', '唐—  軍隊', '당나라 군대', 0),
+('—', '唐—  軍隊', '당나라 군대', 1),
+('軍', '唐—  軍隊', '당나라 군대', 4),
+('隊', '唐—  軍隊', '당나라 군대', 5),
+('唐', '唐慌', '당황', 0),
+('慌', '唐慌', '당황', 1),
+('唐', '唐樂', '당악', 0),
+('樂', '唐樂', '당악', 1),
+('唐', '唐紙', '당지', 0),
+('紙', '唐紙', '당지', 1),
+('唐', '唐詩', '당시', 0),
+('詩', '唐詩', '당시', 1),
+('唐', '唐麵', '당면', 0),
+('麵', '唐麵', '당면', 1),
+('唯', '唯一', '유일', 0),
+('一', '唯一', '유일', 1),
+('唯', '唯一無二', '유일무이', 0),
+('一', '唯一無二', '유일무이', 1),
+('無', '唯一無二', '유일무이', 2),
+('二', '唯一無二', '유일무이', 3),
+('唯', '唯心', '유심', 0),
+('心', '唯心', '유심', 1),
+('唯', '唯心論', '유심론', 0),
+('心', '唯心論', '유심론', 1),
+('論', '唯心論', '유심론', 2),
+('唯', '唯我論', '유아론', 0),
+('我', '唯我論', '유아론', 1),
+('論', '唯我論', '유아론', 2),
+('唱', '唱', '창', 0),
+('唱', '唱劇', '창극', 0),
+('劇', '唱劇', '창극', 1),
+('唱', '唱歌', '창가', 0),
+('歌', '唱歌', '창가', 1),
+('唱', '唱詞', '창사', 0),
+('詞', '唱詞', '창사', 1),
+('唾', '唾液', '타액', 0),
+('液', '唾液', '타액', 1),
+('商', '商事', '상사', 0),
+('事', '商事', '상사', 1),
+('商', '商人', '상인', 0),
+('人', '商人', '상인', 1),
+('商', '商務', '상무', 0),
+('務', '商務', '상무', 1),
+('商', '商品', '상품', 0),
+('品', '商品', '상품', 1),
+('商', '商圈', '상권', 0),
+('圈', '商圈', '상권', 1),
+('商', '商店', '상점', 0),
+('店', '商店', '상점', 1),
+('商', '商會', '상회', 0),
+('會', '商會', '상회', 1),
+('商', '商業', '상업', 0),
+('業', '商業', '상업', 1),
+('商', '商標', '상표', 0),
+('標', '商標', '상표', 1),
+('商', '商權', '상권', 0),
+('權', '商權', '상권', 1),
+('商', '商法', '상법', 0),
+('法', '商法', '상법', 1),
+('商', '商港', '상항', 0),
+('港', '商港', '상항', 1),
+('商', '商社', '상사', 0),
+('社', '商社', '상사', 1),
+('商', '商船', '상선', 0),
+('船', '商船', '상선', 1),
+('商', '商號', '상호', 0),
+('號', '商號', '상호', 1),
+('商', '商街', '상가', 0),
+('街', '商街', '상가', 1),
+('商', '商議', '상의', 0),
+('議', '商議', '상의', 1),
+('問', '問名', '문명', 0),
+('名', '問名', '문명', 1),
+('問', '問病', '문병', 0),
+('病', '問病', '문병', 1),
+('問', '問答', '문답', 0),
+('答', '問答', '문답', 1),
+('問', '問語', '문어', 0),
+('語', '問語', '문어', 1),
+('問', '問議', '문의', 0),
+('議', '問議', '문의', 1),
+('問', '問題', '문데', 0),
+('題', '問題', '문데', 1),
+('問', '問題', '문제', 0),
+('題', '問題', '문제', 1),
+('問', '問題兒', '문제아', 0),
+('題', '問題兒', '문제아', 1),
+('兒', '問題兒', '문제아', 2),
+('問', '問題視', '문제시', 0),
+('題', '問題視', '문제시', 1),
+('視', '問題視', '문제시', 2),
+('問', '問題點', '문제점', 0),
+('題', '問題點', '문제점', 1),
+('點', '問題點', '문제점', 2),
+('啓', '啓示', '계시', 0),
+('示', '啓示', '계시', 1),
+('啓', '啓蒙', '계몽', 0),
+('蒙', '啓蒙', '계몽', 1),
+('啓', '啓蒙主義', '계몽주의', 0),
+('蒙', '啓蒙主義', '계몽주의', 1),
+('主', '啓蒙主義', '계몽주의', 2),
+('義', '啓蒙主義', '계몽주의', 3),
+('啓', '啓蒙時代', '계몽시대', 0),
+('蒙', '啓蒙時代', '계몽시대', 1),
+('時', '啓蒙時代', '계몽시대', 2),
+('代', '啓蒙時代', '계몽시대', 3),
+('啞', '啞啞', '아아', 0),
+('啞', '啞啞', '아아', 1),
+('啞', '啞鈴', '아령', 0),
+('鈴', '啞鈴', '아령', 1),
+('善', '善事', '선사', 0),
+('事', '善事', '선사', 1),
+('善', '善女', '선녀', 0),
+('女', '善女', '선녀', 1),
+('善', '善心', '선심', 0),
+('心', '善心', '선심', 1),
+('善', '善惡', '선악', 0),
+('惡', '善惡', '선악', 1),
+('善', '善意', '선의', 0),
+('意', '善意', '선의', 1),
+('善', '善戰', '선전', 0),
+('戰', '善戰', '선전', 1),
+('善', '善男', '선남', 0),
+('男', '善男', '선남', 1),
+('善', '善男善女', '선남선녀', 0),
+('男', '善男善女', '선남선녀', 1),
+('善', '善男善女', '선남선녀', 2),
+('女', '善男善女', '선남선녀', 3),
+('善', '善良', '선량', 0),
+('良', '善良', '선량', 1),
+('喇', '喇叭', '나발', 0),
+('叭', '喇叭', '나발', 1),
+('喉', '喉頭', '후두', 0),
+('頭', '喉頭', '후두', 1),
+('喊', '喊聲', '함성', 0),
+('聲', '喊聲', '함성', 1),
+('喘', '喘息', '천식', 0),
+('息', '喘息', '천식', 1),
+('喘', '喘氣', '천기', 0),
+('氣', '喘氣', '천기', 1),
+('喜', '喜劇', '희극', 0),
+('劇', '喜劇', '희극', 1),
+('喜', '喜怒哀樂', '희로애락', 0),
+('怒', '喜怒哀樂', '희로애락', 1),
+('哀', '喜怒哀樂', '희로애락', 2),
+('樂', '喜怒哀樂', '희로애락', 3),
+('喜', '喜消息', '희소식', 0),
+('消', '喜消息', '희소식', 1),
+('息', '喜消息', '희소식', 2),
+('喝', '喝采', '갈채', 0),
+('采', '喝采', '갈채', 1),
+('喪', '喪', '상', 0),
+('喪', '喪事', '상사', 0),
+('事', '喪事', '상사', 1),
+('喪', '喪失', '상실', 0),
+('失', '喪失', '상실', 1),
+('喪', '喪妻', '상처', 0),
+('妻', '喪妻', '상처', 1),
+('喪', '喪家', '상가', 0),
+('家', '喪家', '상가', 1),
+('喪', '喪輿', '상여', 0),
+('輿', '喪輿', '상여', 1),
+('喫', '喫煙', '끽연', 0),
+('煙', '喫煙', '끽연', 1),
+('喫', '喫煙室', '끽연실', 0),
+('煙', '喫煙室', '끽연실', 1),
+('室', '喫煙室', '끽연실', 2),
+('喫', '喫茶', '끽다', 0),
+('茶', '喫茶', '끽다', 1),
+('喫', '喫茶店', '끽다점', 0),
+('茶', '喫茶店', '끽다점', 1),
+('店', '喫茶店', '끽다점', 2),
+('喬', '喬木', '교목', 0),
+('木', '喬木', '교목', 1),
+('單', '單', '단', 0),
+('單', '單一', '단일', 0),
+('一', '單一', '단일', 1),
+('單', '單于', '선우', 0),
+('于', '單于', '선우', 1),
+('單', '單位', '단위', 0),
+('位', '單位', '단위', 1),
+('單', '單利', '단리', 0),
+('利', '單利', '단리', 1),
+('單', '單層', '단층', 0),
+('層', '單層', '단층', 1),
+('單', '單峰駱駝', '단봉낙타', 0),
+('峰', '單峰駱駝', '단봉낙타', 1),
+('駱', '單峰駱駝', '단봉낙타', 2),
+('駝', '單峰駱駝', '단봉낙타', 3),
+('單', '單數', '단수', 0),
+('數', '單數', '단수', 1),
+('單', '單文', '단문', 0),
+('文', '單文', '단문', 1),
+('單', '單母音', '단모음', 0),
+('母', '單母音', '단모음', 1),
+('音', '單母音', '단모음', 2),
+('單', '單獨', '단독', 0),
+('獨', '單獨', '단독', 1),
+('單', '單發', '단발', 0),
+('發', '單發', '단발', 1),
+('單', '單眼鏡', '단안경', 0),
+('眼', '單眼鏡', '단안경', 1),
+('鏡', '單眼鏡', '단안경', 2),
+('單', '單純', '단순', 0),
+('純', '單純', '단순', 1),
+('單', '單純語', '단순어', 0),
+('純', '單純語', '단순어', 1),
+('語', '單純語', '단순어', 2),
+('單', '單細胞', '단세포', 0),
+('細', '單細胞', '단세포', 1),
+('胞', '單細胞', '단세포', 2),
+('單', '單葉機', '단엽기', 0),
+('葉', '單葉機', '단엽기', 1),
+('機', '單葉機', '단엽기', 2),
+('單', '單行本', '단행본', 0),
+('行', '單行本', '단행본', 1),
+('本', '單行本', '단행본', 2),
+('單', '單語', '단어', 0),
+('語', '單語', '단어', 1),
+('單', '單調', '단조', 0),
+('調', '單調', '단조', 1),
+('單', '單音', '단음', 0),
+('音', '單音', '단음', 1),
+('嗅', '嗅腦', '후뇌', 0),
+('腦', '嗅腦', '후뇌', 1),
+('嗅', '嗅覺', '후각', 0),
+('覺', '嗅覺', '후각', 1),
+('嗚', '嗚咽', '오열', 0),
+('咽', '嗚咽', '오열', 1),
+('嗜', '嗜好', '기호', 0),
+('好', '嗜好', '기호', 1),
+('嗣', '嗣子', '사자', 0),
+('子', '嗣子', '사자', 1),
+('嗤', '嗤笑', '치소', 0),
+('笑', '嗤笑', '치소', 1),
+('嘆', '嘆願', '탄원', 0),
+('願', '嘆願', '탄원', 1),
+('嘈', '嘈嘈', '조조', 0),
+('嘈', '嘈嘈', '조조', 1),
+('嘔', '嘔吐', '구토', 0),
+('吐', '嘔吐', '구토', 1),
+('嘲', '嘲弄', '조롱', 0),
+('弄', '嘲弄', '조롱', 1),
+('嘲', '嘲笑', '조소', 0),
+('笑', '嘲笑', '조소', 1),
+('器', '器具', '기구', 0),
+('具', '器具', '기구', 1),
+('器', '器官', '기관', 0),
+('官', '器官', '기관', 1),
+('器', '器械', '기계', 0),
+('械', '器械', '기계', 1),
+('器', '器機', '기기', 0),
+('機', '器機', '기기', 1),
+('器', '器物', '기물', 0),
+('物', '器物', '기물', 1),
+('噴', '噴出', '분출', 0),
+('出', '噴出', '분출', 1),
+('噴', '噴氣', '분기', 0),
+('氣', '噴氣', '분기', 1),
+('噴', '噴水', '분수', 0),
+('水', '噴水', '분수', 1),
+('噴', '噴火', '분화', 0),
+('火', '噴火', '분화', 1),
+('噴', '噴火口', '분화구', 0),
+('火', '噴火口', '분화구', 1),
+('口', '噴火口', '분화구', 2),
+('噴', '噴霧器', '분무기', 0),
+('霧', '噴霧器', '분무기', 1),
+('器', '噴霧器', '분무기', 2),
+('嚮', '嚮導', '향도', 0),
+('導', '嚮導', '향도', 1),
+('嚴', '嚴冬', '엄동', 0),
+('冬', '嚴冬', '엄동', 1),
+('嚴', '嚴守', '엄수', 0),
+('守', '嚴守', '엄수', 1),
+('嚴', '嚴格', '엄격', 0),
+('格', '嚴格', '엄격', 1),
+('嚴', '嚴禁', '엄금', 0),
+('禁', '嚴禁', '엄금', 1),
+('嚴', '嚴肅', '엄숙', 0),
+('肅', '嚴肅', '엄숙', 1),
+('嚴', '嚴選', '엄선', 0),
+('選', '嚴選', '엄선', 1),
+('囍', '囍', '희', 0),
+('囚', '囚徒', '수도', 0),
+('徒', '囚徒', '수도', 1),
+('四', '四', '사', 0),
+('四', '四不像', '사불상', 0),
+('不', '四不像', '사불상', 1),
+('像', '四不像', '사불상', 2),
+('四', '四十', '사십', 0),
+('十', '四十', '사십', 1),
+('四', '四季', '사계', 0),
+('季', '四季', '사계', 1),
+('四', '四季節', '사계절', 0),
+('季', '四季節', '사계절', 1),
+('節', '四季節', '사계절', 2),
+('四', '四寸', '사촌', 0),
+('寸', '四寸', '사촌', 1),
+('四', '四川', '사천', 0),
+('川', '四川', '사천', 1),
+('四', '四捨五入', '사사오입', 0),
+('捨', '四捨五入', '사사오입', 1),
+('五', '四捨五入', '사사오입', 2),
+('入', '四捨五入', '사사오입', 3),
+('四', '四散', '사산', 0),
+('散', '四散', '사산', 1),
+('四', '四方', '사방', 0),
+('方', '四方', '사방', 1),
+('四', '四方八方', '사방팔방', 0),
+('方', '四方八方', '사방팔방', 1),
+('八', '四方八方', '사방팔방', 2),
+('方', '四方八方', '사방팔방', 3),
+('四', '四時', '사시', 0),
+('時', '四時', '사시', 1),
+('四', '四書五經', '사서오경', 0),
+('書', '四書五經', '사서오경', 1),
+('五', '四書五經', '사서오경', 2),
+('經', '四書五經', '사서오경', 3),
+('四', '四月', '4월', 0),
+('月', '四月', '4월', 1),
+('四', '四月', '사월', 0),
+('月', '四月', '사월', 1),
+('四', '四柱', '사주', 0),
+('柱', '四柱', '사주', 1),
+('四', '四柱八字', '사주팔자', 0),
+('柱', '四柱八字', '사주팔자', 1),
+('八', '四柱八字', '사주팔자', 2),
+('字', '四柱八字', '사주팔자', 3),
+('四', '四死球', '사사구', 0),
+('死', '四死球', '사사구', 1),
+('球', '四死球', '사사구', 2),
+('四', '四物놀이', '사물놀이', 0),
+('物', '四物놀이', '사물놀이', 1),
+('놀', '四物놀이', '사물놀이', 2),
+('이', '四物놀이', '사물놀이', 3),
+('四', '四球', '사구', 0),
+('球', '四球', '사구', 1),
+('四', '四端', '사단', 0),
+('端', '四端', '사단', 1),
+('四', '四聖諦', '사성제', 0),
+('聖', '四聖諦', '사성제', 1),
+('諦', '四聖諦', '사성제', 2),
+('四', '四聲音', '사성음', 0),
+('聲', '四聲音', '사성음', 1),
+('音', '四聲音', '사성음', 2),
+('四', '四肢', '사지', 0),
+('肢', '四肢', '사지', 1),
+('四', '四苦八苦', '사고팔고', 0),
+('苦', '四苦八苦', '사고팔고', 1),
+('八', '四苦八苦', '사고팔고', 2),
+('苦', '四苦八苦', '사고팔고', 3),
+('四', '四華', '사화', 0),
+('華', '四華', '사화', 1),
+('四', '四角八方', '사각팔방', 0),
+('角', '四角八方', '사각팔방', 1),
+('八', '四角八方', '사각팔방', 2),
+('方', '四角八方', '사각팔방', 3),
+('四', '四角形', '사각형', 0),
+('角', '四角形', '사각형', 1),
+('形', '四角形', '사각형', 2),
+('四', '四足', '사족', 0),
+('足', '四足', '사족', 1),
+('四', '四輪車', '사륜차', 0),
+('輪', '四輪車', '사륜차', 1),
+('車', '四輪車', '사륜차', 2),
+('四', '四通八達', '사통팔달', 0),
+('通', '四通八達', '사통팔달', 1),
+('八', '四通八達', '사통팔달', 2),
+('達', '四通八達', '사통팔달', 3),
+('四', '四邊形', '사변형', 0),
+('邊', '四邊形', '사변형', 1),
+('形', '四邊形', '사변형', 2),
+('四', '四骨', '사골', 0),
+('骨', '四骨', '사골', 1),
+('四', '四철湯', '사철탕', 0),
+('철', '四철湯', '사철탕', 1),
+('湯', '四철湯', '사철탕', 2),
+('回', '回', '회', 0),
+('回', '回信', '회신', 0),
+('信', '回信', '회신', 1),
+('回', '回報', '회보', 0),
+('報', '回報', '회보', 1),
+('回', '回廊', '회랑', 0),
+('廊', '回廊', '회랑', 1),
+('回', '回復', '회복', 0),
+('復', '回復', '회복', 1),
+('回', '回想', '회상', 0),
+('想', '回想', '회상', 1),
+('回', '回想錄', '회상록', 0),
+('想', '回想錄', '회상록', 1),
+('錄', '回想錄', '회상록', 2),
+('回', '回收', '회수', 0),
+('收', '回收', '회수', 1),
+('回', '回敎', '회교', 0),
+('敎', '回敎', '회교', 1),
+('回', '回敎徒', '회교도', 0),
+('敎', '回敎徒', '회교도', 1),
+('徒', '回敎徒', '회교도', 2),
+('回', '回數', '횟수', 0),
+('數', '回數', '횟수', 1),
+('回', '回數券', '회수권', 0),
+('數', '回數券', '회수권', 1),
+('券', '回數券', '회수권', 2),
+('回', '回旋', '회선', 0),
+('旋', '回旋', '회선', 1),
+('回', '回族', '회족', 0),
+('族', '回族', '회족', 1),
+('回', '回春', '회춘', 0),
+('春', '回春', '회춘', 1),
+('回', '回歸', '회귀', 0),
+('歸', '回歸', '회귀', 1),
+('回', '回生', '회생', 0),
+('生', '回生', '회생', 1),
+('回', '回答', '회답', 0),
+('答', '回答', '회답', 1),
+('回', '回線', '회선', 0),
+('線', '回線', '회선', 1),
+('回', '回腸', '회장', 0),
+('腸', '回腸', '회장', 1),
+('回', '回轉', '회전', 0),
+('轉', '回轉', '회전', 1),
+('回', '回轉木馬', '회전목마', 0),
+('轉', '回轉木馬', '회전목마', 1),
+('木', '回轉木馬', '회전목마', 2),
+('馬', '回轉木馬', '회전목마', 3),
+('回', '回轉門', '회전문', 0),
+('轉', '回轉門', '회전문', 1),
+('門', '回轉門', '회전문', 2),
+('回', '回送', '회송', 0),
+('送', '回送', '회송', 1),
+('回', '回避', '회피', 0),
+('避', '回避', '회피', 1),
+('回', '回顧', '회고', 0),
+('顧', '回顧', '회고', 1),
+('回', '回顧錄', '회고록', 0),
+('顧', '回顧錄', '회고록', 1),
+('錄', '回顧錄', '회고록', 2),
+('因', '因', '인', 0),
+('因', '因子', '인자', 0),
+('子', '因子', '인자', 1),
+('因', '因數', '인수', 0),
+('數', '因數', '인수', 1),
+('因', '因數分解', '인수분해', 0),
+('數', '因數分解', '인수분해', 1),
+('分', '因數分解', '인수분해', 2),
+('解', '因數分解', '인수분해', 3),
+('因', '因素', '인소', 0),
+('素', '因素', '인소', 1),
+('因', '因緣', '인연', 0),
+('緣', '因緣', '인연', 1),
+('因', '因習', '인습', 0),
+('習', '因習', '인습', 1),
+('因', '因陀羅網', '인다라망', 0),
+('陀', '因陀羅網', '인다라망', 1),
+('羅', '因陀羅網', '인다라망', 2),
+('網', '因陀羅網', '인다라망', 3),
+('囫', '囫圇', '홀륜', 0),
+('圇', '囫圇', '홀륜', 1),
+('困', '困境', '곤경', 0),
+('境', '困境', '곤경', 1),
+('困', '困難', '곤난', 0),
+('難', '困難', '곤난', 1),
+('困', '困難', '곤란', 0),
+('難', '困難', '곤란', 1),
+('囹', '囹圄', '영어', 0),
+('圄', '囹圄', '영어', 1),
+('固', '固執', '고집', 0),
+('執', '固執', '고집', 1),
+('固', '固執不通', '고집불통', 0),
+('執', '固執不通', '고집불통', 1),
+('不', '固執不通', '고집불통', 2),
+('通', '固執不通', '고집불통', 3),
+('固', '固守', '고수', 0),
+('守', '固守', '고수', 1),
+('固', '固定', '고정', 0),
+('定', '固定', '고정', 1),
+('固', '固有', '고유', 0),
+('有', '固有', '고유', 1),
+('固', '固有名詞', '고유명사', 0),
+('有', '固有名詞', '고유명사', 1),
+('名', '固有名詞', '고유명사', 2),
+('詞', '固有名詞', '고유명사', 3),
+('固', '固有語', '고유어', 0),
+('有', '固有語', '고유어', 1),
+('語', '固有語', '고유어', 2),
+('固', '固體', '고체', 0),
+('體', '固體', '고체', 1),
+('國', '國', '국', 0),
+('國', '國亂', '국란', 0),
+('亂', '國亂', '국란', 1),
+('國', '國交', '국교', 0),
+('交', '國交', '국교', 1),
+('國', '國仙', '국선', 0),
+('仙', '國仙', '국선', 1),
+('國', '國債', '국채', 0),
+('債', '國債', '국채', 1),
+('國', '國內', '국내', 0),
+('內', '國內', '국내', 1),
+('國', '國內外', '국내외', 0),
+('內', '國內外', '국내외', 1),
+('外', '國內外', '국내외', 2),
+('國', '國內線', '국내선', 0),
+('內', '國內線', '국내선', 1),
+('線', '國內線', '국내선', 2),
+('國', '國公', '국공', 0),
+('公', '國公', '국공', 1),
+('國', '國務總理', '국무총리', 0),
+('務', '國務總理', '국무총리', 1),
+('總', '國務總理', '국무총리', 2),
+('理', '國務總理', '국무총리', 3),
+('國', '國史', '국사', 0),
+('史', '國史', '국사', 1),
+('國', '國名', '국명', 0),
+('名', '國名', '국명', 1),
+('國', '國土', '국토', 0),
+('土', '國土', '국토', 1),
+('國', '國境', '국경', 0),
+('境', '國境', '국경', 1),
+('國', '國境警備隊', '국경경비대', 0),
+('境', '國境警備隊', '국경경비대', 1),
+('警', '國境警備隊', '국경경비대', 2),
+('備', '國境警備隊', '국경경비대', 3),
+('隊', '國境警備隊', '국경경비대', 4),
+('國', '國外', '국외', 0),
+('外', '國外', '국외', 1),
+('國', '國字', '국자', 0),
+('字', '國字', '국자', 1),
+('國', '國學', '국학', 0),
+('學', '國學', '국학', 1),
+('國', '國家', '국가', 0),
+('家', '國家', '국가', 1),
+('國', '國家 憲兵', '국가 헌병', 0),
+('家', '國家 憲兵', '국가 헌병', 1),
+('憲', '國家 憲兵', '국가 헌병', 3),
+('兵', '國家 憲兵', '국가 헌병', 4),
+('國', '國家保安法', '국가보안법', 0),
+('家', '國家保安法', '국가보안법', 1),
+('保', '國家保安法', '국가보안법', 2),
+('安', '國家保安法', '국가보안법', 3),
+('法', '國家保安法', '국가보안법', 4),
+('國', '國家元首', '국가원수', 0),
+('家', '國家元首', '국가원수', 1),
+('元', '國家元首', '국가원수', 2),
+('首', '國家元首', '국가원수', 3),
+('國', '國家社會主義', '국가사회주의', 0),
+('家', '國家社會主義', '국가사회주의', 1),
+('社', '國家社會主義', '국가사회주의', 2),
+('會', '國家社會主義', '국가사회주의', 3),
+('主', '國家社會主義', '국가사회주의', 4),
+('義', '國家社會主義', '국가사회주의', 5),
+('國', '國寶', '국보', 0),
+('寶', '國寶', '국보', 1),
+('國', '國庫', '국고', 0),
+('庫', '國庫', '국고', 1),
+('國', '國弓', '국궁', 0),
+('弓', '國弓', '국궁', 1),
+('國', '國恥', '국치', 0),
+('恥', '國恥', '국치', 1),
+('國', '國慶日', '국경일', 0),
+('慶', '國慶日', '국경일', 1),
+('日', '國慶日', '국경일', 2),
+('國', '國技', '국기', 0),
+('技', '國技', '국기', 1),
+('國', '國敎', '국교', 0),
+('敎', '國敎', '국교', 1),
+('國', '國文', '국문', 0),
+('文', '國文', '국문', 1),
+('國', '國旗', '국기', 0),
+('旗', '國旗', '국기', 1),
+('國', '國是', '국시', 0),
+('是', '國是', '국시', 1),
+('國', '國會', '국회', 0),
+('會', '國會', '국회', 1),
+('國', '國會議員', '국회의원', 0),
+('會', '國會議員', '국회의원', 1),
+('議', '國會議員', '국회의원', 2),
+('員', '國會議員', '국회의원', 3),
+('國', '國有化', '국유화', 0),
+('有', '國有化', '국유화', 1),
+('化', '國有化', '국유화', 2),
+('國', '國朝', '국조', 0),
+('朝', '國朝', '국조', 1),
+('國', '國樂', '국악', 0),
+('樂', '國樂', '국악', 1),
+('國', '國權', '국권', 0),
+('權', '國權', '국권', 1),
+('國', '國歌', '국가', 0),
+('歌', '國歌', '국가', 1),
+('國', '國民', '국민', 0),
+('民', '國民', '국민', 1),
+('國', '國民學校', '국민학교', 0),
+('民', '國民學校', '국민학교', 1),
+('學', '國民學校', '국민학교', 2),
+('校', '國民學校', '국민학교', 3),
+('國', '國民投票', '국민투표', 0),
+('民', '國民投票', '국민투표', 1),
+('投', '國民投票', '국민투표', 2),
+('票', '國民投票', '국민투표', 3),
+('國', '國民社會主義', '국민사회주의', 0),
+('民', '國民社會主義', '국민사회주의', 1),
+('社', '國民社會主義', '국민사회주의', 2),
+('會', '國民社會主義', '국민사회주의', 3),
+('主', '國民社會主義', '국민사회주의', 4),
+('義', '國民社會主義', '국민사회주의', 5),
+('國', '國民黨', '국민당', 0),
+('民', '國民黨', '국민당', 1),
+('黨', '國民黨', '국민당', 2),
+('國', '國法', '국법', 0),
+('法', '國法', '국법', 1),
+('國', '國漢文', '국한문', 0),
+('漢', '國漢文', '국한문', 1),
+('文', '國漢文', '국한문', 2),
+('國', '國營', '국영', 0),
+('營', '國營', '국영', 1),
+('國', '國王', '국왕', 0),
+('王', '國王', '국왕', 1),
+('國', '國璽', '국새', 0),
+('璽', '國璽', '국새', 1),
+('國', '國産', '국산', 0),
+('産', '國産', '국산', 1),
+('國', '國界', '국계', 0),
+('界', '國界', '국계', 1),
+('國', '國立', '국립', 0),
+('立', '國立', '국립', 1),
+('國', '國立公園', '국립공원', 0),
+('立', '國立公園', '국립공원', 1),
+('公', '國立公園', '국립공원', 2),
+('園', '國立公園', '국립공원', 3),
+('國', '國章', '국장', 0),
+('章', '國章', '국장', 1),
+('國', '國籍', '국적', 0),
+('籍', '國籍', '국적', 1),
+('國', '國粹主義', '국수주의', 0),
+('粹', '國粹主義', '국수주의', 1),
+('主', '國粹主義', '국수주의', 2),
+('義', '國粹主義', '국수주의', 3),
+('國', '國聯', '국련', 0),
+('聯', '國聯', '국련', 1),
+('國', '國聯 總會', '국련 총회', 0),
+('聯', '國聯 總會', '국련 총회', 1),
+('總', '國聯 總會', '국련 총회', 3),
+('會', '國聯 總會', '국련 총회', 4),
+('國', '國花', '국화', 0),
+('花', '國花', '국화', 1),
+('國', '國號', '국호', 0),
+('號', '國號', '국호', 1),
+('國', '國語', '국어', 0),
+('語', '國語', '국어', 1),
+('國', '國語學', '국어학', 0),
+('語', '國語學', '국어학', 1),
+('學', '國語學', '국어학', 2),
+('國', '國語羅馬字', '국어라마자', 0),
+('語', '國語羅馬字', '국어라마자', 1),
+('羅', '國語羅馬字', '국어라마자', 2),
+('馬', '國語羅馬字', '국어라마자', 3),
+('字', '國語羅馬字', '국어라마자', 4),
+('國', '國費', '국비', 0),
+('費', '國費', '국비', 1),
+('國', '國軍', '국군', 0),
+('軍', '國軍', '국군', 1),
+('國', '國道', '국도', 0),
+('道', '國道', '국도', 1),
+('國', '國選', '국선', 0),
+('選', '國選', '국선', 1),
+('國', '國防', '국방', 0),
+('防', '國防', '국방', 1),
+('國', '國際', '국제', 0),
+('際', '國際', '국제', 1),
+('國', '國際 音聲 記號', '국제 음성 기호', 0),
+('際', '國際 音聲 記號', '국제 음성 기호', 1),
+('音', '國際 音聲 記號', '국제 음성 기호', 3),
+('聲', '國際 音聲 記號', '국제 음성 기호', 4),
+('記', '國際 音聲 記號', '국제 음성 기호', 6),
+('號', '國際 音聲 記號', '국제 음성 기호', 7),
+('國', '國際主義', '국제주의', 0),
+('際', '國際主義', '국제주의', 1),
+('主', '國際主義', '국제주의', 2),
+('義', '國際主義', '국제주의', 3),
+('國', '國際化', '국제화', 0),
+('際', '國際化', '국제화', 1),
+('化', '國際化', '국제화', 2),
+('國', '國際法', '국제법', 0),
+('際', '國際法', '국제법', 1),
+('法', '國際法', '국제법', 2),
+('國', '國際的', '국제적', 0),
+('際', '國際的', '국제적', 1),
+('的', '國際的', '국제적', 2),
+('國', '國際線', '국제선', 0),
+('際', '國際線', '국제선', 1),
+('線', '國際線', '국제선', 2),
+('國', '國際補助語', '국제보조어', 0),
+('際', '國際補助語', '국제보조어', 1),
+('補', '國際補助語', '국제보조어', 2),
+('助', '國際補助語', '국제보조어', 3),
+('語', '國際補助語', '국제보조어', 4),
+('國', '國際語', '국제어', 0),
+('際', '國際語', '국제어', 1),
+('語', '國際語', '국제어', 2),
+('園', '園藝', '원예', 0),
+('藝', '園藝', '원예', 1),
+('園', '園藝師', '원예사', 0),
+('藝', '園藝師', '원예사', 1),
+('師', '園藝師', '원예사', 2),
+('園', '園長', '원장', 0),
+('長', '園長', '원장', 1),
+('圓', '圓', '원', 0),
+('圓', '圓-', '원주', 0),
+('-', '圓-', '원주', 1),
+('圓', '圓卓', '원탁', 0),
+('卓', '圓卓', '원탁', 1),
+('圓', '圓周', '원주', 0),
+('周', '圓周', '원주', 1),
+('圓', '圓周率', '원주률', 0),
+('周', '圓周率', '원주률', 1),
+('率', '圓周率', '원주률', 2),
+('圓', '圓周率', '원주율', 0),
+('周', '圓周率', '원주율', 1),
+('率', '圓周率', '원주율', 2),
+('圓', '圓形', '원형', 0),
+('形', '圓形', '원형', 1),
+('圓', '圓心', '원심', 0),
+('心', '圓心', '원심', 1),
+('圓', '圓柱', '원주', 0),
+('柱', '圓柱', '원주', 1),
+('圓', '圓滑', '원활', 0),
+('滑', '圓滑', '원활', 1),
+('圓', '圓熟', '원숙', 0),
+('熟', '圓熟', '원숙', 1),
+('圓', '圓珠筆', '원주필', 0),
+('珠', '圓珠筆', '원주필', 1),
+('筆', '圓珠筆', '원주필', 2),
+('圓', '圓盤', '원반', 0),
+('盤', '圓盤', '원반', 1),
+('圓', '圓筒', '원통', 0),
+('筒', '圓筒', '원통', 1),
+('圓', '圓貨', '원화', 0),
+('貨', '圓貨', '원화', 1),
+('圓', '圓錐角膜', '원추각막', 0),
+('錐', '圓錐角膜', '원추각막', 1),
+('角', '圓錐角膜', '원추각막', 2),
+('膜', '圓錐角膜', '원추각막', 3),
+('圓', '圓陣', '원진', 0),
+('陣', '圓陣', '원진', 1),
+('圖', '圖們', '도문', 0),
+('們', '圖們', '도문', 1),
+('圖', '圖形', '도형', 0),
+('形', '圖形', '도형', 1),
+('圖', '圖書', '도서', 0),
+('書', '圖書', '도서', 1),
+('圖', '圖書館', '도서관', 0),
+('書', '圖書館', '도서관', 1),
+('館', '圖書館', '도서관', 2),
+('圖', '圖書館員', '도서관원', 0),
+('書', '圖書館員', '도서관원', 1),
+('館', '圖書館員', '도서관원', 2),
+('員', '圖書館員', '도서관원', 3),
+('圖', '圖案', '도안', 0),
+('案', '圖案', '도안', 1),
+('圖', '圖畫', '도화', 0),
+('畫', '圖畫', '도화', 1),
+('圖', '圖章', '대장', 0),
+('章', '圖章', '대장', 1),
+('圖', '圖章', '도장', 0),
+('章', '圖章', '도장', 1),
+('圖', '圖表', '도표', 0),
+('表', '圖表', '도표', 1),
+('圖', '圖解', '도해', 0),
+('解', '圖解', '도해', 1),
+('圖', '圖謀', '도모', 0),
+('謀', '圖謀', '도모', 1),
+('圖', '圖錄', '도록', 0),
+('錄', '圖錄', '도록', 1),
+('圖', '圖鑑', '도감', 0),
+('鑑', '圖鑑', '도감', 1),
+('圖', '圖面', '도면', 0),
+('面', '圖面', '도면', 1),
+('團', '團地', '단지', 0),
+('地', '團地', '단지', 1),
+('團', '團束', '단속', 0),
+('束', '團束', '단속', 1),
+('團', '團欒酒店', '단란주점', 0),
+('欒', '團欒酒店', '단란주점', 1),
+('酒', '團欒酒店', '단란주점', 2),
+('店', '團欒酒店', '단란주점', 3),
+('團', '團結', '단결', 0),
+('結', '團結', '단결', 1),
+('團', '團長', '단장', 0),
+('長', '團長', '단장', 1),
+('團', '團體', '단체', 0),
+('體', '團體', '단체', 1),
+('土', '土', '토', 0),
+('土', '土人', '토인', 0),
+('人', '土人', '토인', 1),
+('土', '土侯國', '토후국', 0),
+('侯', '土侯國', '토후국', 1),
+('國', '土侯國', '토후국', 2),
+('土', '土匪', '토비', 0),
+('匪', '土匪', '토비', 1),
+('土', '土卵', '토란', 0),
+('卵', '土卵', '토란', 1),
+('土', '土卵대', '토란대', 0),
+('卵', '土卵대', '토란대', 1),
+('대', '土卵대', '토란대', 2),
+('土', '土器', '토기', 0),
+('器', '土器', '토기', 1),
+('土', '土地', '토지', 0),
+('地', '土地', '토지', 1),
+('土', '土壤', '토양', 0),
+('壤', '土壤', '토양', 1),
+('土', '土幕', '토막', 0),
+('幕', '土幕', '토막', 1),
+('土', '土曜日', '토요일', 0),
+('曜', '土曜日', '토요일', 1),
+('日', '土曜日', '토요일', 2),
+('土', '土樓', '토루', 0),
+('樓', '土樓', '토루', 1),
+('土', '土氣', '토기', 0),
+('氣', '土氣', '토기', 1),
+('土', '土炭', '토탄', 0),
+('炭', '土炭', '토탄', 1),
+('土', '土炭 濕地', '토탄 습지', 0),
+('炭', '土炭 濕地', '토탄 습지', 1),
+('濕', '土炭 濕地', '토탄 습지', 3),
+('地', '土炭 濕地', '토탄 습지', 4),
+('土', '土炭地', '토탄지', 0),
+('炭', '土炭地', '토탄지', 1),
+('地', '土炭地', '토탄지', 2),
+('土', '土炭層', '토탄층', 0),
+('炭', '土炭層', '토탄층', 1),
+('層', '土炭層', '토탄층', 2),
+('土', '土産', '토산', 0),
+('産', '土産', '토산', 1),
+('土', '土着', '토착', 0),
+('着', '土着', '토착', 1),
+('土', '土着語', '토착어', 0),
+('着', '土着語', '토착어', 1),
+('語', '土着語', '토착어', 2),
+('土', '土石流', '토석류', 0),
+('石', '土石流', '토석류', 1),
+('流', '土石流', '토석류', 2),
+('土', '土砂', '토사', 0),
+('砂', '土砂', '토사', 1),
+('土', '土耳其', '토이기', 0),
+('耳', '土耳其', '토이기', 1),
+('其', '土耳其', '토이기', 2),
+('土', '土耳其語', '토이기어', 0),
+('耳', '土耳其語', '토이기어', 1),
+('其', '土耳其語', '토이기어', 2),
+('語', '土耳其語', '토이기어', 3),
+('土', '土臺', '토대', 0),
+('臺', '土臺', '토대', 1),
+('土', '土葬', '토장', 0),
+('葬', '土葬', '토장', 1),
+('土', '土語', '토어', 0),
+('語', '土語', '토어', 1),
+('土', '土雨', '토우', 0),
+('雨', '土雨', '토우', 1),
+('在', '在住', '재주', 0),
+('住', '在住', '재주', 1),
+('在', '在來', '재래', 0),
+('來', '在來', '재래', 1),
+('在', '在學', '재학', 0),
+('學', '在學', '재학', 1),
+('在', '在宅勤務', '재택근무', 0),
+('宅', '在宅勤務', '재택근무', 1),
+('勤', '在宅勤務', '재택근무', 2),
+('務', '在宅勤務', '재택근무', 3),
+('在', '在家僧', '재가승', 0),
+('家', '在家僧', '재가승', 1),
+('僧', '在家僧', '재가승', 2),
+('在', '在庫', '재고', 0),
+('庫', '在庫', '재고', 1),
+('在', '在所者', '재소자', 0),
+('所', '在所者', '재소자', 1),
+('者', '在所者', '재소자', 2),
+('在', '在日朝鮮語', '재일조선어', 0),
+('日', '在日朝鮮語', '재일조선어', 1),
+('朝', '在日朝鮮語', '재일조선어', 2),
+('鮮', '在日朝鮮語', '재일조선어', 3),
+('語', '在日朝鮮語', '재일조선어', 4),
+('在', '在日韓國語', '재일한국어', 0),
+('日', '在日韓國語', '재일한국어', 1),
+('韓', '在日韓國語', '재일한국어', 2),
+('國', '在日韓國語', '재일한국어', 3),
+('語', '在日韓國語', '재일한국어', 4),
+('在', '在職', '재직', 0),
+('職', '在職', '재직', 1),
+('在', '在野', '재야', 0),
+('野', '在野', '재야', 1),
+('在', '在野黨', '재야당', 0),
+('野', '在野黨', '재야당', 1),
+('黨', '在野黨', '재야당', 2),
+('地', '地下', '지하', 0),
+('下', '地下', '지하', 1),
+('地', '地下室', '지하실', 0),
+('下', '地下室', '지하실', 1),
+('室', '地下室', '지하실', 2),
+('地', '地下道', '지하도', 0),
+('下', '地下道', '지하도', 1),
+('道', '地下道', '지하도', 2),
+('地', '地下鐵', '지하철', 0),
+('下', '地下鐵', '지하철', 1),
+('鐵', '地下鐵', '지하철', 2),
+('地', '地下鐵驛', '지하철역', 0),
+('下', '地下鐵驛', '지하철역', 1),
+('鐵', '地下鐵驛', '지하철역', 2),
+('驛', '地下鐵驛', '지하철역', 3),
+('地', '地中海', '지중해', 0),
+('中', '地中海', '지중해', 1),
+('海', '地中海', '지중해', 2),
+('地', '地主', '지주', 0),
+('主', '地主', '지주', 1),
+('地', '地代', '지대', 0),
+('代', '地代', '지대', 1),
+('地', '地位', '지위', 0),
+('位', '地位', '지위', 1),
+('地', '地動說', '지동설', 0),
+('動', '地動說', '지동설', 1),
+('說', '地動說', '지동설', 2),
+('地', '地勢', '지세', 0),
+('勢', '地勢', '지세', 1),
+('地', '地區', '지구', 0),
+('區', '地區', '지구', 1),
+('地', '地區隊', '지구대', 0),
+('區', '地區隊', '지구대', 1),
+('隊', '地區隊', '지구대', 2),
+('地', '地名', '지명', 0),
+('名', '地名', '지명', 1),
+('地', '地名學', '지명학', 0),
+('名', '地名學', '지명학', 1),
+('學', '地名學', '지명학', 2),
+('地', '地圈', '지권', 0),
+('圈', '地圈', '지권', 1),
+('地', '地圖', '지도', 0),
+('圖', '地圖', '지도', 1),
+('地', '地圖冊', '지도책', 0),
+('圖', '地圖冊', '지도책', 1),
+('冊', '地圖冊', '지도책', 2),
+('地', '地圖學', '지도학', 0),
+('圖', '地圖學', '지도학', 1),
+('學', '地圖學', '지도학', 2),
+('地', '地域', '지역', 0),
+('域', '地域', '지역', 1),
+('地', '地域番號', '지역번호', 0),
+('域', '地域番號', '지역번호', 1),
+('番', '地域番號', '지역번호', 2),
+('號', '地域番號', '지역번호', 3),
+('地', '地域社會', '지역사회', 0),
+('域', '地域社會', '지역사회', 1),
+('社', '地域社會', '지역사회', 2),
+('會', '地域社會', '지역사회', 3),
+('地', '地境', '지경', 0),
+('境', '地境', '지경', 1),
+('地', '地大', '지대', 0),
+('大', '地大', '지대', 1),
+('地', '地大物博', '지대물박', 0),
+('大', '地大物博', '지대물박', 1),
+('物', '地大物博', '지대물박', 2),
+('博', '地大物博', '지대물박', 3),
+('地', '地層', '지층', 0),
+('層', '地層', '지층', 1),
+('地', '地峽', '지협', 0),
+('峽', '地峽', '지협', 1),
+('地', '地帶', '지대', 0),
+('帶', '地帶', '지대', 1),
+('地', '地平線', '지평선', 0),
+('平', '地平線', '지평선', 1),
+('線', '地平線', '지평선', 2),
+('地', '地形', '지형', 0),
+('形', '地形', '지형', 1),
+('地', '地形學', '지형학', 0),
+('形', '地形學', '지형학', 1),
+('學', '地形學', '지형학', 2),
+('地', '地支', '지지', 0),
+('支', '地支', '지지', 1),
+('地', '地政學', '지정학', 0),
+('政', '地政學', '지정학', 1),
+('學', '地政學', '지정학', 2),
+('地', '地文學', '지문학', 0),
+('文', '地文學', '지문학', 1),
+('學', '地文學', '지문학', 2),
+('地', '地方', '지방', 0),
+('方', '地方', '지방', 1),
+('地', '地方自治', '지방자치', 0),
+('方', '地方自治', '지방자치', 1),
+('自', '地方自治', '지방자치', 2),
+('治', '地方自治', '지방자치', 3),
+('地', '地殼', '지각', 0),
+('殼', '地殼', '지각', 1),
+('地', '地溫', '지온', 0),
+('溫', '地溫', '지온', 1),
+('地', '地獄', '지옥', 0),
+('獄', '地獄', '지옥', 1),
+('地', '地獄鐵', '지옥철', 0),
+('獄', '地獄鐵', '지옥철', 1),
+('鐵', '地獄鐵', '지옥철', 2),
+('地', '地球', '지구', 0),
+('球', '地球', '지구', 1),
+('地', '地球人', '지구인', 0),
+('球', '地球人', '지구인', 1),
+('人', '地球人', '지구인', 2),
+('地', '地球儀', '지구의', 0),
+('球', '地球儀', '지구의', 1),
+('儀', '地球儀', '지구의', 2),
+('地', '地球本', '지구본', 0),
+('球', '地球本', '지구본', 1),
+('本', '地球本', '지구본', 2),
+('地', '地球科學', '지구과학', 0),
+('球', '地球科學', '지구과학', 1),
+('科', '地球科學', '지구과학', 2),
+('學', '地球科學', '지구과학', 3),
+('地', '地理', '지리', 0),
+('理', '地理', '지리', 1),
+('地', '地理學', '지리학', 0),
+('理', '地理學', '지리학', 1),
+('學', '地理學', '지리학', 2),
+('地', '地理學者', '지리학자', 0),
+('理', '地理學者', '지리학자', 1),
+('學', '地理學者', '지리학자', 2),
+('者', '地理學者', '지리학자', 3),
+('地', '地盤', '지반', 0),
+('盤', '地盤', '지반', 1),
+('地', '地磁氣', '지자기', 0),
+('磁', '地磁氣', '지자기', 1),
+('氣', '地磁氣', '지자기', 2),
+('地', '地租', '지조', 0),
+('租', '地租', '지조', 1),
+('地', '地級市', '지급시', 0),
+('級', '地級市', '지급시', 1),
+('市', '地級市', '지급시', 2),
+('地', '地緣', '지연', 0),
+('緣', '地緣', '지연', 1),
+('地', '地羊湯', '지양탕', 0),
+('羊', '地羊湯', '지양탕', 1),
+('湯', '地羊湯', '지양탕', 2),
+('地', '地衣類', '지의류', 0),
+('衣', '地衣類', '지의류', 1),
+('類', '地衣類', '지의류', 2),
+('地', '地誌', '지지', 0),
+('誌', '地誌', '지지', 1),
+('地', '地貸', '지대', 0),
+('貸', '地貸', '지대', 1),
+('地', '地質學', '지질학', 0),
+('質', '地質學', '지질학', 1),
+('學', '地質學', '지질학', 2),
+('地', '地質學者', '지질학자', 0),
+('質', '地質學者', '지질학자', 1),
+('學', '地質學者', '지질학자', 2),
+('者', '地質學者', '지질학자', 3),
+('地', '地金', '지금', 0),
+('金', '地金', '지금', 1),
+('地', '地階', '지계', 0),
+('階', '地階', '지계', 1),
+('地', '地雷', '지뢰', 0),
+('雷', '地雷', '지뢰', 1),
+('地', '地震', '지진', 0),
+('震', '地震', '지진', 1),
+('地', '地震學', '지진학', 0),
+('震', '地震學', '지진학', 1),
+('學', '地震學', '지진학', 2),
+('地', '地震海溢', '지진해일', 0),
+('震', '地震海溢', '지진해일', 1),
+('海', '地震海溢', '지진해일', 2),
+('溢', '地震海溢', '지진해일', 3),
+('地', '地面', '지면', 0),
+('面', '地面', '지면', 1),
+('地', '地點', '지점', 0),
+('點', '地點', '지점', 1),
+('址', '址臺', '지대', 0),
+('臺', '址臺', '지대', 1),
+('均', '均衡', '균형', 0),
+('衡', '均衡', '균형', 1),
+('坊', '坊間', '방간', 0),
+('間', '坊間', '방간', 1),
+('坐', '坐位', '좌위', 0),
+('位', '坐位', '좌위', 1),
+('坐', '坐像', '좌상', 0),
+('像', '坐像', '좌상', 1),
+('坐', '坐席', '좌석', 0),
+('席', '坐席', '좌석', 1),
+('坐', '坐禪', '좌선', 0),
+('禪', '坐禪', '좌선', 1),
+('坐', '坐職', '좌직', 0),
+('職', '坐職', '좌직', 1),
+('坐', '坐食', '좌식', 0),
+('食', '坐食', '좌식', 1),
+('坐', '坐骨', '좌골', 0),
+('骨', '坐骨', '좌골', 1),
+('坑', '坑', '갱', 0),
+('坑', '坑口', '갱구', 0),
+('口', '坑口', '갱구', 1),
+('坑', '坑夫', '갱부', 0),
+('夫', '坑夫', '갱부', 1),
+('坑', '坑道', '갱도', 0),
+('道', '坑道', '갱도', 1),
+('坩', '坩堝', '감과', 0),
+('堝', '坩堝', '감과', 1),
+('坪', '坪', '평', 0),
+('坪', '坪數', '평수', 0),
+('數', '坪數', '평수', 1),
+('垂', '垂心', '수심', 0),
+('心', '垂心', '수심', 1),
+('垂', '垂範', '수범', 0),
+('範', '垂範', '수범', 1),
+('型', '型', '형', 0),
+('垓', '垓子', '해자', 0),
+('子', '垓子', '해자', 1),
+('埃', '埃及', '애굽', 0),
+('及', '埃及', '애굽', 1),
+('埋', '埋伏', '매복', 0),
+('伏', '埋伏', '매복', 1),
+('埋', '埋葬', '매장', 0),
+('葬', '埋葬', '매장', 1),
+('埋', '埋藏', '매장', 0),
+('藏', '埋藏', '매장', 1),
+('埋', '埋設', '매설', 0),
+('設', '埋設', '매설', 1),
+('城', '城', '성', 0),
+('城', '城南', '성남', 0),
+('南', '城南', '성남', 1),
+('城', '城壁', '성벽', 0),
+('壁', '城壁', '성벽', 1),
+('城', '城將', '성장', 0),
+('將', '城將', '성장', 1),
+('城', '城市', '성시', 0),
+('市', '城市', '성시', 1),
+('城', '城廓', '성곽', 0),
+('廓', '城廓', '성곽', 1),
+('城', '城砦', '성채', 0),
+('砦', '城砦', '성채', 1),
+('城', '城郭', '성곽', 0),
+('郭', '城郭', '성곽', 1),
+('域', '域外', '역외', 0),
+('外', '域外', '역외', 1),
+('埠', '埠頭', '부두', 0),
+('頭', '埠頭', '부두', 1),
+('執', '執事', '집사', 0),
+('事', '執事', '집사', 1),
+('執', '執權黨', '집권당', 0),
+('權', '執權黨', '집권당', 1),
+('黨', '執權黨', '집권당', 2),
+('執', '執着', '집착', 0),
+('着', '執着', '집착', 1),
+('執', '執筆', '집필', 0),
+('筆', '執筆', '집필', 1),
+('執', '執行', '집행', 0),
+('行', '執行', '집행', 1),
+('執', '執行官', '집행관', 0),
+('行', '執行官', '집행관', 1),
+('官', '執行官', '집행관', 2),
+('培', '培養', '배양', 0),
+('養', '培養', '배양', 1),
+('培', '培養液', '배양액', 0),
+('養', '培養液', '배양액', 1),
+('液', '培養液', '배양액', 2),
+('基', '基', '기', 0),
+('基', '基地', '기지', 0),
+('地', '基地', '기지', 1),
+('基', '基地村', '기지촌', 0),
+('地', '基地村', '기지촌', 1),
+('村', '基地村', '기지촌', 2),
+('基', '基底', '기저', 0),
+('底', '基底', '기저', 1),
+('基', '基底細胞', '기저세포', 0),
+('底', '基底細胞', '기저세포', 1),
+('細', '基底細胞', '기저세포', 2),
+('胞', '基底細胞', '기저세포', 3),
+('基', '基底細胞癌', '기저세포암', 0),
+('底', '基底細胞癌', '기저세포암', 1),
+('細', '基底細胞癌', '기저세포암', 2),
+('胞', '基底細胞癌', '기저세포암', 3),
+('癌', '基底細胞癌', '기저세포암', 4),
+('基', '基數詞', '기수사', 0),
+('數', '基數詞', '기수사', 1),
+('詞', '基數詞', '기수사', 2),
+('基', '基本', '기본', 0),
+('本', '基本', '기본', 1),
+('基', '基本的', '기본적', 0),
+('本', '基本的', '기본적', 1),
+('的', '基本的', '기본적', 2),
+('基', '基板', '기판', 0),
+('板', '基板', '기판', 1),
+('基', '基準', '기준', 0),
+('準', '基準', '기준', 1),
+('基', '基盤', '기반', 0),
+('盤', '基盤', '기반', 1),
+('基', '基盤施設', '기반시설', 0),
+('盤', '基盤施設', '기반시설', 1),
+('施', '基盤施設', '기반시설', 2),
+('設', '基盤施設', '기반시설', 3),
+('基', '基督', '기독', 0),
+('督', '基督', '기독', 1),
+('基', '基督敎', '기독교', 0),
+('督', '基督敎', '기독교', 1),
+('敎', '基督敎', '기독교', 2),
+('基', '基督敎徒', '기독교도', 0),
+('督', '基督敎徒', '기독교도', 1),
+('敎', '基督敎徒', '기독교도', 2),
+('徒', '基督敎徒', '기독교도', 3),
+('基', '基督教', '기독교', 0),
+('督', '基督教', '기독교', 1),
+('教', '基督教', '기독교', 2),
+('基', '基礎', '기초', 0),
+('礎', '基礎', '기초', 1),
+('基', '基金', '기금', 0),
+('金', '基金', '기금', 1),
+('基', '基點', '기점', 0),
+('點', '基點', '기점', 1),
+('堂', '堂堂', '당당', 0),
+('堂', '堂堂', '당당', 1),
+('堂', '堂長', '당장', 0),
+('長', '堂長', '당장', 1),
+('堅', '堅信', '견신', 0),
+('信', '堅信', '견신', 1),
+('堅', '堅固', '견고', 0),
+('固', '堅固', '견고', 1),
+('堅', '堅城', '견성', 0),
+('城', '堅城', '견성', 1),
+('堅', '堅實', '견실', 0),
+('實', '堅實', '견실', 1),
+('堅', '堅性', '견성', 0),
+('性', '堅性', '견성', 1),
+('堅', '堅果', '견과', 0),
+('果', '堅果', '견과', 1),
+('堆', '堆積', '퇴적', 0),
+('積', '堆積', '퇴적', 1),
+('堆', '堆積物', '퇴적물', 0),
+('積', '堆積物', '퇴적물', 1),
+('物', '堆積物', '퇴적물', 2),
+('堆', '堆肥', '퇴비', 0),
+('肥', '堆肥', '퇴비', 1),
+('堡', '堡壘', '보루', 0),
+('壘', '堡壘', '보루', 1),
+('堤', '堤防', '제방', 0),
+('防', '堤防', '제방', 1),
+('堪', '堪當', '감당', 0),
+('當', '堪當', '감당', 1),
+('堯', '堯', '요', 0),
+('報', '報償', '보상', 0),
+('償', '報償', '보상', 1),
+('報', '報告', '보고', 0),
+('告', '報告', '보고', 1),
+('報', '報告書', '보고서', 0),
+('告', '報告書', '보고서', 1),
+('書', '報告書', '보고서', 2),
+('報', '報告者', '보고자', 0),
+('告', '報告者', '보고자', 1),
+('者', '報告者', '보고자', 2),
+('報', '報復', '보복', 0),
+('復', '報復', '보복', 1),
+('報', '報復球', '보복구', 0),
+('復', '報復球', '보복구', 1),
+('球', '報復球', '보복구', 2),
+('報', '報應', '보응', 0),
+('應', '報應', '보응', 1),
+('報', '報知', '보지', 0),
+('知', '報知', '보지', 1),
+('報', '報道', '보도', 0),
+('道', '報道', '보도', 1),
+('報', '報道資料', '보도자료', 0),
+('道', '報道資料', '보도자료', 1),
+('資', '報道資料', '보도자료', 2),
+('料', '報道資料', '보도자료', 3),
+('報', '報酬', '보수', 0),
+('酬', '報酬', '보수', 1),
+('場', '場', '장', 0),
+('場', '場所', '장소', 0),
+('所', '場所', '장소', 1),
+('場', '場面', '장면', 0),
+('面', '場面', '장면', 1),
+('塊', '塊莖', '괴경', 0),
+('莖', '塊莖', '괴경', 1),
+('塔', '塔', '탑', 0),
+('塔', '塔婆', '탑파', 0),
+('婆', '塔婆', '탑파', 1),
+('塗', '塗料', '도료', 0),
+('料', '塗料', '도료', 1),
+('塞', '塞翁之馬', '새옹지마', 0),
+('翁', '塞翁之馬', '새옹지마', 1),
+('之', '塞翁之馬', '새옹지마', 2),
+('馬', '塞翁之馬', '새옹지마', 3),
+('塵', '塵喧', '진훤', 0),
+('喧', '塵喧', '진훤', 1),
+('塵', '塵想', '진상', 0),
+('想', '塵想', '진상', 1),
+('塹', '塹壕', '참호', 0),
+('壕', '塹壕', '참호', 1),
+('塹', '塹濠', '참호', 0),
+('濠', '塹濠', '참호', 1),
+('塼', '塼돌', '전돌', 0),
+('돌', '塼돌', '전돌', 1),
+('境', '境地', '경지', 0),
+('地', '境地', '경지', 1),
+('境', '境界', '경계', 0),
+('界', '境界', '경계', 1),
+('境', '境遇', '경우', 0),
+('遇', '境遇', '경우', 1),
+('墓', '墓', '모', 0),
+('墓', '墓', '묘', 0),
+('墓', '墓前', '묘전', 0),
+('前', '墓前', '묘전', 1),
+('墓', '墓園', '묘원', 0),
+('園', '墓園', '묘원', 1),
+('墓', '墓地', '묘지', 0),
+('地', '墓地', '묘지', 1),
+('墓', '墓石', '묘석', 0),
+('石', '墓石', '묘석', 1),
+('墓', '墓碑', '묘비', 0),
+('碑', '墓碑', '묘비', 1),
+('増', '増殖', '증식', 0),
+('殖', '増殖', '증식', 1),
+('墜', '墜落', '추락', 0),
+('落', '墜落', '추락', 1),
+('增', '增便', '증편', 0),
+('便', '增便', '증편', 1),
+('增', '增刷', '증쇄', 0),
+('刷', '增刷', '증쇄', 1),
+('增', '增加', '증가', 0),
+('加', '增加', '증가', 1),
+('增', '增稅', '증세', 0),
+('稅', '增稅', '증세', 1),
+('增', '增設', '증설', 0),
+('設', '增設', '증설', 1),
+('增', '增進', '증진', 0),
+('進', '增進', '증진', 1),
+('墨', '墨家', '묵가', 0),
+('家', '墨家', '묵가', 1),
+('墮', '墮落', '타락', 0),
+('落', '墮落', '타락', 1),
+('墳', '墳墓', '분묘', 0),
+('墓', '墳墓', '분묘', 1),
+('墺', '墺地利', '오지리', 0),
+('地', '墺地利', '오지리', 1),
+('利', '墺地利', '오지리', 2),
+('壁', '壁', '벽', 0),
+('壁', '壁報', '벽보', 0),
+('報', '壁報', '벽보', 1),
+('壁', '壁新聞', '벽신문', 0),
+('新', '壁新聞', '벽신문', 1),
+('聞', '壁新聞', '벽신문', 2),
+('壁', '壁時計', '벽시계', 0),
+('時', '壁時計', '벽시계', 1),
+('計', '壁時計', '벽시계', 2),
+('壁', '壁暖爐', '벽난로', 0),
+('暖', '壁暖爐', '벽난로', 1),
+('爐', '壁暖爐', '벽난로', 2),
+('壁', '壁欌', '벽장', 0),
+('欌', '壁欌', '벽장', 1),
+('壁', '壁爛爐', '벽난로', 0),
+('爛', '壁爛爐', '벽난로', 1),
+('爐', '壁爛爐', '벽난로', 2),
+('壁', '壁畫', '벽화', 0),
+('畫', '壁畫', '벽화', 1),
+('壁', '壁畵', '벽화', 0),
+('畵', '壁畵', '벽화', 1),
+('壁', '壁紙', '벽지', 0),
+('紙', '壁紙', '벽지', 1),
+('壁', '壁걸이', '벽걸이', 0),
+('걸', '壁걸이', '벽걸이', 1),
+('이', '壁걸이', '벽걸이', 2),
+('壅', '壅拙', '옹졸', 0),
+('拙', '壅拙', '옹졸', 1),
+('壓', '壓倒', '압도', 0),
+('倒', '壓倒', '압도', 1),
+('壓', '壓倒的', '압도적', 0),
+('倒', '壓倒的', '압도적', 1),
+('的', '壓倒的', '압도적', 2),
+('壓', '壓制', '압제', 0),
+('制', '壓制', '압제', 1),
+('壓', '壓制者', '압제자', 0),
+('制', '壓制者', '압제자', 1),
+('者', '壓制者', '압제자', 2),
+('壓', '壓力', '압력', 0),
+('力', '壓力', '압력', 1),
+('壓', '壓力計', '압력계', 0),
+('力', '壓力計', '압력계', 1),
+('計', '壓力計', '압력계', 2),
+('壓', '壓卷', '압권', 0),
+('卷', '壓卷', '압권', 1),
+('壓', '壓政', '압정', 0),
+('政', '壓政', '압정', 1),
+('壓', '壓死', '압사', 0),
+('死', '壓死', '압사', 1),
+('壓', '壓迫', '압박', 0),
+('迫', '壓迫', '압박', 1),
+('壕', '壕', '호', 0),
+('壘', '壘', '루', 0),
+('壘', '壘手', '누수', 0),
+('手', '壘手', '누수', 1),
+('壞', '壞疽', '회저', 0),
+('疽', '壞疽', '회저', 1),
+('壞', '壞血病', '괴혈병', 0),
+('血', '壞血病', '괴혈병', 1),
+('病', '壞血病', '괴혈병', 2),
+('士', '士族', '사족', 0),
+('族', '士族', '사족', 1),
+('士', '士氣', '사기', 0),
+('氣', '士氣', '사기', 1),
+('士', '士禍', '사화', 0),
+('禍', '士禍', '사화', 1),
+('壬', '壬', '임', 0),
+('壬', '壬午', '임오', 0),
+('午', '壬午', '임오', 1),
+('壬', '壬子', '임자', 0),
+('子', '壬子', '임자', 1),
+('壬', '壬寅', '임인', 0),
+('寅', '壬寅', '임인', 1),
+('壬', '壬戌', '임술', 0),
+('戌', '壬戌', '임술', 1),
+('壬', '壬申', '임신', 0),
+('申', '壬申', '임신', 1),
+('壬', '壬辰', '임진', 0),
+('辰', '壬辰', '임진', 1),
+('壬', '壬辰倭亂', '임진왜란', 0),
+('辰', '壬辰倭亂', '임진왜란', 1),
+('倭', '壬辰倭亂', '임진왜란', 2),
+('亂', '壬辰倭亂', '임진왜란', 3),
+('壯', '壯丁', '장정', 0),
+('丁', '壯丁', '장정', 1),
+('壯', '壯美', '장미', 0),
+('美', '壯美', '장미', 1),
+('壯', '壯觀', '장관', 0),
+('觀', '壯觀', '장관', 1),
+('壯', '壯談', '장담', 0),
+('談', '壯談', '장담', 1),
+('壽', '壽命', '수명', 0),
+('命', '壽命', '수명', 1),
+('壽', '壽堂', '수당', 0),
+('堂', '壽堂', '수당', 1),
+('夏', '夏季', '하계', 0),
+('季', '夏季', '하계', 1),
+('夏', '夏服', '하복', 0),
+('服', '夏服', '하복', 1),
+('夏', '夏期', '하기', 0),
+('期', '夏期', '하기', 1),
+('夏', '夏至', '하지', 0),
+('至', '夏至', '하지', 1),
+('夕', '夕刊', '석간', 0),
+('刊', '夕刊', '석간', 1),
+('外', '外', '외', 0),
+('外', '外---', '외할머니', 0),
+('-', '外---', '외할머니', 1),
+('-', '外---', '외할머니', 2),
+('-', '外---', '외할머니', 3),
+('外', '外----', '외할아버지', 0),
+('-', '外----', '외할아버지', 1),
+('-', '外----', '외할아버지', 2),
+('-', '外----', '외할아버지', 3),
+('-', '外----', '외할아버지', 4),
+('外', '外三寸', '외삼촌', 0),
+('三', '外三寸', '외삼촌', 1),
+('寸', '外三寸', '외삼촌', 2),
+('外', '外交', '외교', 0),
+('交', '外交', '외교', 1),
+('外', '外交官', '외교관', 0),
+('交', '外交官', '외교관', 1),
+('官', '外交官', '외교관', 2),
+('外', '外交部', '외교부', 0),
+('交', '外交部', '외교부', 1),
+('部', '外交部', '외교부', 2),
+('外', '外人', '외인', 0),
+('人', '外人', '외인', 1),
+('外', '外人部隊', '외인부대', 0),
+('人', '外人部隊', '외인부대', 1),
+('部', '外人部隊', '외인부대', 2),
+('隊', '外人部隊', '외인부대', 3),
+('外', '外來', '외래', 0),
+('來', '外來', '외래', 1),
+('外', '外來語', '외래어', 0),
+('來', '外來語', '외래어', 1),
+('語', '外來語', '외래어', 2),
+('外', '外傳', '외전', 0),
+('傳', '外傳', '외전', 1),
+('外', '外債', '외채', 0),
+('債', '外債', '외채', 1),
+('外', '外傷', '외상', 0),
+('傷', '外傷', '외상', 1),
+('外', '外出', '외출', 0),
+('出', '外出', '외출', 1),
+('外', '外力', '외력', 0),
+('力', '外力', '외력', 1),
+('外', '外務', '외무', 0),
+('務', '外務', '외무', 1),
+('外', '外務省', '외무성', 0),
+('務', '外務省', '외무성', 1),
+('省', '外務省', '외무성', 2),
+('外', '外務部', '외무부', 0),
+('務', '外務部', '외무부', 1),
+('部', '外務部', '외무부', 2),
+('外', '外叔母', '외숙모', 0),
+('叔', '外叔母', '외숙모', 1),
+('母', '外叔母', '외숙모', 2),
+('外', '外向性', '외향성', 0),
+('向', '外向性', '외향성', 1),
+('性', '外向性', '외향성', 2),
+('外', '外商', '외상', 0),
+('商', '外商', '외상', 1),
+('外', '外國', '외국', 0),
+('國', '外國', '외국', 1),
+('外', '外國人', '외국인', 0),
+('國', '外國人', '외국인', 1),
+('人', '外國人', '외국인', 2),
+('外', '外國人嫌惡症', '외국인혐오증', 0),
+('國', '外國人嫌惡症', '외국인혐오증', 1),
+('人', '外國人嫌惡症', '외국인혐오증', 2),
+('嫌', '外國人嫌惡症', '외국인혐오증', 3),
+('惡', '外國人嫌惡症', '외국인혐오증', 4),
+('症', '外國人嫌惡症', '외국인혐오증', 5),
+('外', '外國人登錄', '외국인등록', 0),
+('國', '外國人登錄', '외국인등록', 1),
+('人', '外國人登錄', '외국인등록', 2),
+('登', '外國人登錄', '외국인등록', 3),
+('錄', '外國人登錄', '외국인등록', 4),
+('外', '外國語', '외국어', 0),
+('國', '外國語', '외국어', 1),
+('語', '外國語', '외국어', 2),
+('外', '外城', '외성', 0),
+('城', '外城', '외성', 1),
+('外', '外套', '외투', 0),
+('套', '外套', '외투', 1),
+('外', '外字', '외자', 0),
+('字', '外字', '외자', 1),
+('外', '外孫女', '외손녀', 0),
+('孫', '外孫女', '외손녀', 1),
+('女', '外孫女', '외손녀', 2),
+('外', '外孫子', '외손자', 0),
+('孫', '外孫子', '외손자', 1),
+('子', '外孫子', '외손자', 2),
+('外', '外家-', '외갓집', 0),
+('家', '外家-', '외갓집', 1),
+('-', '外家-', '외갓집', 2),
+('外', '外延', '외연', 0),
+('延', '外延', '외연', 1),
+('外', '外心', '외심', 0),
+('心', '外心', '외심', 1),
+('外', '外患', '외환', 0),
+('患', '外患', '외환', 1),
+('外', '外接圓', '외접원', 0),
+('接', '外接圓', '외접원', 1),
+('圓', '外接圓', '외접원', 2),
+('外', '外換', '외환', 0),
+('換', '外換', '외환', 1),
+('外', '外敵', '외적', 0),
+('敵', '外敵', '외적', 1),
+('外', '外核', '외핵', 0),
+('核', '外核', '외핵', 1),
+('外', '外毒素', '외독소', 0),
+('毒', '外毒素', '외독소', 1),
+('素', '外毒素', '외독소', 2),
+('外', '外氣', '외기', 0),
+('氣', '外氣', '외기', 1),
+('外', '外氣圈', '외기권', 0),
+('氣', '外氣圈', '외기권', 1),
+('圈', '外氣圈', '외기권', 2),
+('外', '外注', '외주', 0),
+('注', '外注', '외주', 1),
+('外', '外溫動物', '외온동물', 0),
+('溫', '外溫動物', '외온동물', 1),
+('動', '外溫動物', '외온동물', 2),
+('物', '外溫動物', '외온동물', 3),
+('外', '外王內帝', '외왕내제', 0),
+('王', '外王內帝', '외왕내제', 1),
+('內', '外王內帝', '외왕내제', 2),
+('帝', '外王內帝', '외왕내제', 3),
+('外', '外界', '외계', 0),
+('界', '外界', '외계', 1),
+('外', '外界人', '외계인', 0),
+('界', '外界人', '외계인', 1),
+('人', '外界人', '외계인', 2),
+('外', '外界語', '외계어', 0),
+('界', '外界語', '외계어', 1),
+('語', '外界語', '외계어', 2),
+('外', '外的', '외적', 0),
+('的', '外的', '외적', 1),
+('外', '外皮', '외피', 0),
+('皮', '外皮', '외피', 1),
+('外', '外相', '외상', 0),
+('相', '外相', '외상', 1),
+('外', '外科', '외과', 0),
+('科', '外科', '외과', 1),
+('外', '外紙', '외지', 0),
+('紙', '外紙', '외지', 1),
+('外', '外耳', '외이', 0),
+('耳', '外耳', '외이', 1),
+('外', '外腹斜筋', '외복사근', 0),
+('腹', '外腹斜筋', '외복사근', 1),
+('斜', '外腹斜筋', '외복사근', 2),
+('筋', '外腹斜筋', '외복사근', 3),
+('外', '外蒙古', '외몽고', 0),
+('蒙', '外蒙古', '외몽고', 1),
+('古', '外蒙古', '외몽고', 2),
+('外', '外衣', '외의', 0),
+('衣', '外衣', '외의', 1),
+('外', '外製', '외제', 0),
+('製', '外製', '외제', 1),
+('外', '外觀', '외관', 0),
+('觀', '外觀', '외관', 1),
+('外', '外語', '외어', 0),
+('語', '外語', '외어', 1),
+('外', '外貌', '외모', 0),
+('貌', '外貌', '외모', 1),
+('外', '外貨', '외화', 0),
+('貨', '外貨', '외화', 1),
+('外', '外販員', '외판원', 0),
+('販', '外販員', '외판원', 1),
+('員', '外販員', '외판원', 2),
+('外', '外資', '외자', 0),
+('資', '外資', '외자', 1),
+('外', '外邦', '외방', 0),
+('邦', '外邦', '외방', 1),
+('外', '外部', '외부', 0),
+('部', '外部', '외부', 1),
+('外', '外部人', '외부인', 0),
+('部', '外部人', '외부인', 1),
+('人', '外部人', '외부인', 2),
+('外', '外野', '외야', 0),
+('野', '外野', '외야', 1),
+('外', '外野手', '외야수', 0),
+('野', '外野手', '외야수', 1),
+('手', '外野手', '외야수', 2),
+('外', '外防', '외방', 0),
+('防', '外防', '외방', 1),
+('外', '外面', '외면', 0),
+('面', '外面', '외면', 1),
+('外', '外食', '외식', 0),
+('食', '外食', '외식', 1),
+('多', '多價', '다가', 0),
+('價', '多價', '다가', 1),
+('多', '多元化', '다원화', 0),
+('元', '多元化', '다원화', 1),
+('化', '多元化', '다원화', 2),
+('多', '多分', '다분', 0),
+('分', '多分', '다분', 1),
+('多', '多多益善', '다다익선', 0),
+('多', '多多益善', '다다익선', 1),
+('益', '多多益善', '다다익선', 2),
+('善', '多多益善', '다다익선', 3),
+('多', '多孔性', '다공성', 0),
+('孔', '多孔性', '다공성', 1),
+('性', '多孔性', '다공성', 2),
+('多', '多小', '다소', 0),
+('小', '多小', '다소', 1),
+('多', '多少', '다소', 0),
+('少', '多少', '다소', 1),
+('多', '多島海', '다도해', 0),
+('島', '多島海', '다도해', 1),
+('海', '多島海', '다도해', 2),
+('多', '多幸', '다행', 0),
+('幸', '多幸', '다행', 1),
+('多', '多幸感', '다행감', 0),
+('幸', '多幸感', '다행감', 1),
+('感', '多幸感', '다행감', 2),
+('多', '多幸症', '다행증', 0),
+('幸', '多幸症', '다행증', 1),
+('症', '多幸症', '다행증', 2),
+('多', '多情', '다정', 0),
+('情', '多情', '다정', 1),
+('多', '多才', '다재', 0),
+('才', '多才', '다재', 1),
+('多', '多數', '다수', 0),
+('數', '多數', '다수', 1),
+('多', '多文化', '다문화', 0),
+('文', '多文化', '다문화', 1),
+('化', '多文化', '다문화', 2),
+('多', '多樣', '다양', 0),
+('樣', '多樣', '다양', 1),
+('多', '多樣化', '다양화', 0),
+('樣', '多樣化', '다양화', 1),
+('化', '多樣化', '다양화', 2),
+('多', '多樣性', '다양성', 0),
+('樣', '多樣性', '다양성', 1),
+('性', '多樣性', '다양성', 2),
+('多', '多毛作', '다모작', 0),
+('毛', '多毛作', '다모작', 1),
+('作', '多毛作', '다모작', 2),
+('多', '多發', '다발', 0),
+('發', '多發', '다발', 1),
+('多', '多神論', '다신론', 0),
+('神', '多神論', '다신론', 1),
+('論', '多神論', '다신론', 2),
+('多', '多種多樣', '다종다양', 0),
+('種', '多種多樣', '다종다양', 1),
+('多', '多種多樣', '다종다양', 2),
+('樣', '多種多樣', '다종다양', 3),
+('多', '多細胞', '다세포', 0),
+('細', '多細胞', '다세포', 1),
+('胞', '多細胞', '다세포', 2),
+('多', '多能', '다능', 0),
+('能', '多能', '다능', 1),
+('多', '多角形', '다각형', 0),
+('角', '多角形', '다각형', 1),
+('形', '多角形', '다각형', 2),
+('多', '多角的', '다각적', 0),
+('角', '多角的', '다각적', 1),
+('的', '多角的', '다각적', 2),
+('多', '多讀', '다독', 0),
+('讀', '多讀', '다독', 1),
+('多', '多讀家', '다독가', 0),
+('讀', '多讀家', '다독가', 1),
+('家', '多讀家', '다독가', 2),
+('多', '多辯', '다변', 0),
+('辯', '多辯', '다변', 1),
+('多', '多重', '다중', 0),
+('重', '多重', '다중', 1),
+('夜', '夜來香', '야래향', 0),
+('來', '夜來香', '야래향', 1),
+('香', '夜來香', '야래향', 2),
+('夜', '夜勤', '야근', 0),
+('勤', '夜勤', '야근', 1),
+('夜', '夜叉', '야차', 0),
+('叉', '夜叉', '야차', 1),
+('夜', '夜叉', '야채', 0),
+('叉', '夜叉', '야채', 1),
+('夜', '夜寒', '야한', 0),
+('寒', '夜寒', '야한', 1),
+('夜', '夜市', '야시', 0),
+('市', '夜市', '야시', 1),
+('夜', '夜想曲', '야상곡', 0),
+('想', '夜想曲', '야상곡', 1),
+('曲', '夜想曲', '야상곡', 2),
+('夜', '夜景', '야경', 0),
+('景', '夜景', '야경', 1),
+('夜', '夜會', '야회', 0),
+('會', '夜會', '야회', 1),
+('夜', '夜盲症', '야맹증', 0),
+('盲', '夜盲症', '야맹증', 1),
+('症', '夜盲症', '야맹증', 2),
+('夜', '夜行', '야행', 0),
+('行', '夜行', '야행', 1),
+('夜', '夜行性', '야행성', 0),
+('行', '夜行性', '야행성', 1),
+('性', '夜行性', '야행성', 2),
+('夜', '夜行車', '야행차', 0),
+('行', '夜行車', '야행차', 1),
+('車', '夜行車', '야행차', 2),
+('夜', '夜間', '야간', 0),
+('間', '夜間', '야간', 1),
+('夜', '夜雪', '야설', 0),
+('雪', '夜雪', '야설', 1),
+('夜', '夜食', '야식', 0),
+('食', '夜食', '야식', 1),
+('夜', '夜驚症', '야경증', 0),
+('驚', '夜驚症', '야경증', 1),
+('症', '夜驚症', '야경증', 2),
+('夢', '夢想', '몽상', 0),
+('想', '夢想', '몽상', 1),
+('夢', '夢想家', '몽상가', 0),
+('想', '夢想家', '몽상가', 1),
+('家', '夢想家', '몽상가', 2),
+('夢', '夢精', '몽정', 0),
+('精', '夢精', '몽정', 1),
+('夢', '夢遊病', '몽유병', 0),
+('遊', '夢遊病', '몽유병', 1),
+('病', '夢遊病', '몽유병', 2),
+('夢', '夢遊病者', '몽유병자', 0),
+('遊', '夢遊病者', '몽유병자', 1),
+('病', '夢遊病者', '몽유병자', 2),
+('者', '夢遊病者', '몽유병자', 3),
+('夢', '夢魂', '몽혼', 0),
+('魂', '夢魂', '몽혼', 1),
+('大', '大', '대', 0),
+('大', '大丈夫', '대장부', 0),
+('丈', '大丈夫', '대장부', 1),
+('夫', '大丈夫', '대장부', 2),
+('大', '大主敎', '대주교', 0),
+('主', '大主敎', '대주교', 1),
+('敎', '大主敎', '대주교', 2),
+('大', '大乘', '대승', 0),
+('乘', '大乘', '대승', 1),
+('大', '大事', '대사', 0),
+('事', '大事', '대사', 1),
+('大', '大亡', '대망', 0),
+('亡', '大亡', '대망', 1),
+('大', '大人', '대인', 0),
+('人', '大人', '대인', 1),
+('大', '大企業', '대기업', 0),
+('企', '大企業', '대기업', 1),
+('業', '大企業', '대기업', 2),
+('大', '大使', '대사', 0),
+('使', '大使', '대사', 1),
+('大', '大使館', '대사관', 0),
+('使', '大使館', '대사관', 1),
+('館', '大使館', '대사관', 2),
+('大', '大便', '대변', 0),
+('便', '大便', '대변', 1),
+('大', '大元帥', '대원수', 0),
+('元', '大元帥', '대원수', 1),
+('帥', '大元帥', '대원수', 2),
+('大', '大公國', '대공국', 0),
+('公', '大公國', '대공국', 1),
+('國', '大公國', '대공국', 2),
+('大', '大前提', '대전제', 0),
+('前', '大前提', '대전제', 1),
+('提', '大前提', '대전제', 2),
+('大', '大動脈', '대동맥', 0),
+('動', '大動脈', '대동맥', 1),
+('脈', '大動脈', '대동맥', 2),
+('大', '大口', '대구', 0),
+('口', '大口', '대구', 1),
+('大', '大同小異', '대동소이', 0),
+('同', '大同小異', '대동소이', 1),
+('小', '大同小異', '대동소이', 2),
+('異', '大同小異', '대동소이', 3),
+('大', '大君', '대군', 0),
+('君', '大君', '대군', 1),
+('大', '大吹打', '대취타', 0),
+('吹', '大吹打', '대취타', 1),
+('打', '大吹打', '대취타', 2),
+('大', '大器晩成', '대기만성', 0),
+('器', '大器晩成', '대기만성', 1),
+('晩', '大器晩成', '대기만성', 2),
+('成', '大器晩成', '대기만성', 3),
+('大', '大國', '대국', 0),
+('國', '大國', '대국', 1),
+('大', '大團圓', '대단원', 0),
+('團', '大團圓', '대단원', 1),
+('圓', '大團圓', '대단원', 2),
+('大', '大地', '대지', 0),
+('地', '大地', '대지', 1),
+('大', '大型', '대형', 0),
+('型', '大型', '대형', 1),
+('大', '大多數', '대다수', 0),
+('多', '大多數', '대다수', 1),
+('數', '大多數', '대다수', 2),
+('大', '大天使', '대천사', 0),
+('天', '大天使', '대천사', 1),
+('使', '大天使', '대천사', 2),
+('大', '大字', '대자', 0),
+('字', '大字', '대자', 1),
+('大', '大字報', '대자보', 0),
+('字', '大字報', '대자보', 1),
+('報', '大字報', '대자보', 2),
+('大', '大學', '대학', 0),
+('學', '大學', '대학', 1),
+('大', '大學修學能力試驗', '대학수학능력시험', 0),
+('學', '大學修學能力試驗', '대학수학능력시험', 1),
+('修', '大學修學能力試驗', '대학수학능력시험', 2),
+('學', '大學修學能力試驗', '대학수학능력시험', 3),
+('能', '大學修學能力試驗', '대학수학능력시험', 4),
+('力', '大學修學能力試驗', '대학수학능력시험', 5),
+('試', '大學修學能力試驗', '대학수학능력시험', 6),
+('驗', '大學修學能力試驗', '대학수학능력시험', 7),
+('大', '大學敎授', '대학교수', 0),
+('學', '大學敎授', '대학교수', 1),
+('敎', '大學敎授', '대학교수', 2),
+('授', '大學敎授', '대학교수', 3),
+('大', '大學校', '대학교', 0),
+('學', '大學校', '대학교', 1),
+('校', '大學校', '대학교', 2),
+('大', '大學生', '대학생', 0),
+('學', '大學生', '대학생', 1),
+('生', '大學生', '대학생', 2),
+('大', '大學院', '대학원', 0),
+('學', '大學院', '대학원', 1),
+('院', '大學院', '대학원', 2),
+('大', '大學院生', '대학원생', 0),
+('學', '大學院生', '대학원생', 1),
+('院', '大學院生', '대학원생', 2),
+('生', '大學院生', '대학원생', 3),
+('大', '大宗家', '대종가', 0),
+('宗', '大宗家', '대종가', 1),
+('家', '大宗家', '대종가', 2),
+('大', '大家', '대가', 0),
+('家', '大家', '대가', 1),
+('大', '大將', '대장', 0),
+('將', '大將', '대장', 1),
+('大', '大尉', '대위', 0),
+('尉', '大尉', '대위', 1),
+('大', '大嶺', '대령', 0),
+('嶺', '大嶺', '대령', 1),
+('大', '大帝', '대제', 0),
+('帝', '大帝', '대제', 1),
+('大', '大帶', '대대', 0),
+('帶', '大帶', '대대', 1),
+('大', '大幅的', '대폭적', 0),
+('幅', '大幅的', '대폭적', 1),
+('的', '大幅的', '대폭적', 2),
+('大', '大形', '대형', 0),
+('形', '大形', '대형', 1),
+('大', '大抵', '대저', 0),
+('抵', '大抵', '대저', 1),
+('大', '大捷', '대첩', 0),
+('捷', '大捷', '대첩', 1),
+('大', '大敎區', '대교구', 0),
+('敎', '大敎區', '대교구', 1),
+('區', '大敎區', '대교구', 2),
+('大', '大數', '대수', 0),
+('數', '大數', '대수', 1),
+('大', '大文字', '대문자', 0),
+('文', '大文字', '대문자', 1),
+('字', '大文字', '대문자', 2),
+('大', '大日', '대일', 0),
+('日', '大日', '대일', 1),
+('大', '大日本帝國', '대일본제국', 0),
+('日', '大日本帝國', '대일본제국', 1),
+('本', '大日本帝國', '대일본제국', 2),
+('帝', '大日本帝國', '대일본제국', 3),
+('國', '大日本帝國', '대일본제국', 4),
+('大', '大旱', '대한', 0),
+('旱', '大旱', '대한', 1),
+('大', '大會', '대회', 0),
+('會', '大會', '대회', 1),
+('大', '大望', '대망', 0),
+('望', '大望', '대망', 1),
+('大', '大東', '대동', 0),
+('東', '大東', '대동', 1),
+('大', '大東亞共榮圈', '대동아공영권', 0),
+('東', '大東亞共榮圈', '대동아공영권', 1),
+('亞', '大東亞共榮圈', '대동아공영권', 2),
+('共', '大東亞共榮圈', '대동아공영권', 3),
+('榮', '大東亞共榮圈', '대동아공영권', 4),
+('圈', '大東亞共榮圈', '대동아공영권', 5),
+('大', '大槪', '대개', 0),
+('槪', '大槪', '대개', 1),
+('大', '大氣', '대기', 0),
+('氣', '大氣', '대기', 1),
+('大', '大氣圈', '대기권', 0),
+('氣', '大氣圈', '대기권', 1),
+('圈', '大氣圈', '대기권', 2),
+('大', '大氣現象', '대기현상', 0),
+('氣', '大氣現象', '대기현상', 1),
+('現', '大氣現象', '대기현상', 2),
+('象', '大氣現象', '대기현상', 3),
+('大', '大水', '대수', 0),
+('水', '大水', '대수', 1),
+('大', '大河小說', '대하소설', 0),
+('河', '大河小說', '대하소설', 1),
+('小', '大河小說', '대하소설', 2),
+('說', '大河小說', '대하소설', 3),
+('大', '大洋', '대양', 0),
+('洋', '大洋', '대양', 1),
+('大', '大洞', '대동', 0),
+('洞', '大洞', '대동', 1),
+('大', '大洪水', '대홍수', 0),
+('洪', '大洪水', '대홍수', 1),
+('水', '大洪水', '대홍수', 2),
+('大', '大漢國', '대한국', 0),
+('漢', '大漢國', '대한국', 1),
+('國', '大漢國', '대한국', 2),
+('大', '大王', '대왕', 0),
+('王', '大王', '대왕', 1),
+('大', '大理石', '대리석', 0),
+('理', '大理石', '대리석', 1),
+('石', '大理石', '대리석', 2),
+('大', '大田', '대전', 0),
+('田', '大田', '대전', 1),
+('大', '大略', '대략', 0),
+('略', '大略', '대략', 1),
+('大', '大砲', '대포', 0),
+('砲', '大砲', '대포', 1),
+('大', '大笒', '대금', 0),
+('笒', '大笒', '대금', 1),
+('大', '大統領', '대통령', 0),
+('統', '大統領', '대통령', 1),
+('領', '大統領', '대통령', 2),
+('大', '大統領令', '대통령령', 0),
+('統', '大統領令', '대통령령', 1),
+('領', '大統領令', '대통령령', 2),
+('令', '大統領令', '대통령령', 3),
+('大', '大綱', '대강', 0),
+('綱', '大綱', '대강', 1),
+('大', '大綱大綱', '대강대강', 0),
+('綱', '大綱大綱', '대강대강', 1),
+('大', '大綱大綱', '대강대강', 2),
+('綱', '大綱大綱', '대강대강', 3),
+('大', '大網', '대망', 0),
+('網', '大網', '대망', 1),
+('大', '大總', '대충', 0),
+('總', '大總', '대충', 1),
+('大', '大聖堂', '대성당', 0),
+('聖', '大聖堂', '대성당', 1),
+('堂', '大聖堂', '대성당', 2),
+('大', '大胞子', '대포자', 0),
+('胞', '大胞子', '대포자', 1),
+('子', '大胞子', '대포자', 2),
+('大', '大腦', '대뇌', 0),
+('腦', '大腦', '대뇌', 1),
+('大', '大腸', '대장', 0),
+('腸', '大腸', '대장', 1),
+('大', '大腿', '대퇴', 0),
+('腿', '大腿', '대퇴', 1),
+('大', '大腿二頭筋', '대퇴이두근', 0),
+('腿', '大腿二頭筋', '대퇴이두근', 1),
+('二', '大腿二頭筋', '대퇴이두근', 2),
+('頭', '大腿二頭筋', '대퇴이두근', 3),
+('筋', '大腿二頭筋', '대퇴이두근', 4),
+('大', '大腿四頭筋', '대퇴사두근', 0),
+('腿', '大腿四頭筋', '대퇴사두근', 1),
+('四', '大腿四頭筋', '대퇴사두근', 2),
+('頭', '大腿四頭筋', '대퇴사두근', 3),
+('筋', '大腿四頭筋', '대퇴사두근', 4),
+('大', '大臀筋', '대둔근', 0),
+('臀', '大臀筋', '대둔근', 1),
+('筋', '大臀筋', '대둔근', 2),
+('大', '大英帝國', '대영제국', 0),
+('英', '大英帝國', '대영제국', 1),
+('帝', '大英帝國', '대영제국', 2),
+('國', '大英帝國', '대영제국', 3),
+('大', '大著', '대저', 0),
+('著', '大著', '대저', 1),
+('大', '大蒜', '대산', 0),
+('蒜', '大蒜', '대산', 1),
+('大', '大虐殺', '대학살', 0),
+('虐', '大虐殺', '대학살', 1),
+('殺', '大虐殺', '대학살', 2),
+('大', '大蛇', '대사', 0),
+('蛇', '大蛇', '대사', 1),
+('大', '大蟒', '대망', 0),
+('蟒', '大蟒', '대망', 1),
+('大', '大衆', '대중', 0),
+('衆', '大衆', '대중', 1),
+('大', '大衆交通', '대중교통', 0),
+('衆', '大衆交通', '대중교통', 1),
+('交', '大衆交通', '대중교통', 2),
+('通', '大衆交通', '대중교통', 3),
+('大', '大衆媒體', '대중매체', 0),
+('衆', '大衆媒體', '대중매체', 1),
+('媒', '大衆媒體', '대중매체', 2),
+('體', '大衆媒體', '대중매체', 3),
+('大', '大衆文化', '대중문화', 0),
+('衆', '大衆文化', '대중문화', 1),
+('文', '大衆文化', '대중문화', 2),
+('化', '大衆文化', '대중문화', 3),
+('大', '大衆歌謠', '대중가요', 0),
+('衆', '大衆歌謠', '대중가요', 1),
+('歌', '大衆歌謠', '대중가요', 2),
+('謠', '大衆歌謠', '대중가요', 3),
+('大', '大衆音樂', '대중음악', 0),
+('衆', '大衆音樂', '대중음악', 1),
+('音', '大衆音樂', '대중음악', 2),
+('樂', '大衆音樂', '대중음악', 3),
+('大', '大西洋大口', '대서양대구', 0),
+('西', '大西洋大口', '대서양대구', 1),
+('洋', '大西洋大口', '대서양대구', 2),
+('大', '大西洋大口', '대서양대구', 3),
+('口', '大西洋大口', '대서양대구', 4),
+('大', '大西洋靑魚', '대서양청어', 0),
+('西', '大西洋靑魚', '대서양청어', 1),
+('洋', '大西洋靑魚', '대서양청어', 2),
+('靑', '大西洋靑魚', '대서양청어', 3),
+('魚', '大西洋靑魚', '대서양청어', 4),
+('大', '大西洋鰱魚', '대서양연어', 0),
+('西', '大西洋鰱魚', '대서양연어', 1),
+('洋', '大西洋鰱魚', '대서양연어', 2),
+('鰱', '大西洋鰱魚', '대서양연어', 3),
+('魚', '大西洋鰱魚', '대서양연어', 4),
+('大', '大要', '대요', 0),
+('要', '大要', '대요', 1),
+('大', '大規模', '대규모', 0),
+('規', '大規模', '대규모', 1),
+('模', '大規模', '대규모', 2),
+('大', '大豆', '대두', 0),
+('豆', '大豆', '대두', 1),
+('大', '大赦', '대사', 0),
+('赦', '大赦', '대사', 1),
+('大', '大路', '대로', 0),
+('路', '大路', '대로', 1),
+('大', '大逆', '대역', 0),
+('逆', '大逆', '대역', 1),
+('大', '大逆罪', '대역죄', 0),
+('逆', '大逆罪', '대역죄', 1),
+('罪', '大逆罪', '대역죄', 2),
+('大', '大過去', '대과거', 0),
+('過', '大過去', '대과거', 1),
+('去', '大過去', '대과거', 2),
+('大', '大選', '대선', 0),
+('選', '大選', '대선', 1),
+('大', '大邱', '대구', 0),
+('邱', '大邱', '대구', 1),
+('大', '大邸宅', '대저택', 0),
+('邸', '大邸宅', '대저택', 1),
+('宅', '大邸宅', '대저택', 2),
+('大', '大部分', '대부분', 0),
+('部', '大部分', '대부분', 1),
+('分', '大部分', '대부분', 2),
+('大', '大都市', '대도시', 0),
+('都', '大都市', '대도시', 1),
+('市', '大都市', '대도시', 2),
+('大', '大量', '대량', 0),
+('量', '大量', '대량', 1),
+('大', '大量虐殺', '대량학살', 0),
+('量', '大量虐殺', '대량학살', 1),
+('虐', '大量虐殺', '대량학살', 2),
+('殺', '大量虐殺', '대량학살', 3),
+('大', '大門', '대문', 0),
+('門', '大門', '대문', 1),
+('大', '大闕', '대궐', 0),
+('闕', '大闕', '대궐', 1),
+('大', '大關嶺', '대관령', 0),
+('關', '大關嶺', '대관령', 1),
+('嶺', '大關嶺', '대관령', 2),
+('大', '大限', '대한', 0),
+('限', '大限', '대한', 1),
+('大', '大院君', '대원군', 0),
+('院', '大院君', '대원군', 1),
+('君', '大院君', '대원군', 2),
+('大', '大陰脣', '대음순', 0),
+('陰', '大陰脣', '대음순', 1),
+('脣', '大陰脣', '대음순', 2),
+('大', '大陸', '대륙', 0),
+('陸', '大陸', '대륙', 1),
+('大', '大陸 間 彈道 미사일', '대륙 간 탄도 미사일', 0),
+('陸', '大陸 間 彈道 미사일', '대륙 간 탄도 미사일', 1),
+('間', '大陸 間 彈道 미사일', '대륙 간 탄도 미사일', 3),
+('彈', '大陸 間 彈道 미사일', '대륙 간 탄도 미사일', 5),
+('道', '大陸 間 彈道 미사일', '대륙 간 탄도 미사일', 6),
+('미', '大陸 間 彈道 미사일', '대륙 간 탄도 미사일', 8),
+('사', '大陸 間 彈道 미사일', '대륙 간 탄도 미사일', 9),
+('일', '大陸 間 彈道 미사일', '대륙 간 탄도 미사일', 10),
+('大', '大陸棚', '대륙붕', 0),
+('陸', '大陸棚', '대륙붕', 1),
+('棚', '大陸棚', '대륙붕', 2),
+('大', '大陸의  氣', '대륙의 기상', 0),
+('陸', '大陸의  氣', '대륙의 기상', 1),
+('의', '大陸의  氣', '대륙의 기상', 2),
+('氣', '大陸의  氣', '대륙의 기상', 5),
+('大', '大隊', '대대', 0),
+('隊', '大隊', '대대', 1),
+('大', '大靈', '대령', 0),
+('靈', '大靈', '대령', 1),
+('大', '大韓帝國', '대한제국', 0),
+('韓', '大韓帝國', '대한제국', 1),
+('帝', '大韓帝國', '대한제국', 2),
+('國', '大韓帝國', '대한제국', 3),
+('大', '大韓民國', '대한민국', 0),
+('韓', '大韓民國', '대한민국', 1),
+('民', '大韓民國', '대한민국', 2),
+('國', '大韓民國', '대한민국', 3),
+('大', '大領', '대령', 0),
+('領', '大領', '대령', 1),
+('大', '大頭魚', '대두어', 0),
+('頭', '大頭魚', '대두어', 1),
+('魚', '大頭魚', '대두어', 2),
+('大', '大饑', '대기', 0),
+('饑', '大饑', '대기', 1),
+('大', '大體', '대체', 0),
+('體', '大體', '대체', 1),
+('大', '大體-', '대체로', 0),
+('體', '大體-', '대체로', 1),
+('-', '大體-', '대체로', 2),
+('大', '大鵬', '대붕', 0),
+('鵬', '大鵬', '대붕', 1),
+('大', '大麻', '대마', 0),
+('麻', '大麻', '대마', 1),
+('大', '大黃', '대황', 0),
+('黃', '大黃', '대황', 1),
+('大', '大黃魚', '대황어', 0),
+('黃', '大黃魚', '대황어', 1),
+('魚', '大黃魚', '대황어', 2),
+('大', '大박', '대박', 0),
+('박', '大박', '대박', 1),
+('天', '天', '천', 0),
+('天', '天上', '천상', 0),
+('上', '天上', '천상', 1),
+('天', '天下', '천하', 0),
+('下', '天下', '천하', 1),
+('天', '天下之大本', '천하지대본', 0),
+('下', '天下之大本', '천하지대본', 1),
+('之', '天下之大本', '천하지대본', 2),
+('大', '天下之大本', '천하지대본', 3),
+('本', '天下之大本', '천하지대본', 4),
+('天', '天主', '천주', 0),
+('主', '天主', '천주', 1),
+('天', '天主敎', '천주교', 0),
+('主', '天主敎', '천주교', 1),
+('敎', '天主敎', '천주교', 2),
+('天', '天主教', '천주교', 0),
+('主', '天主教', '천주교', 1),
+('教', '天主教', '천주교', 2),
+('天', '天井', '천정', 0),
+('井', '天井', '천정', 1),
+('天', '天人', '천인', 0),
+('人', '天人', '천인', 1),
+('天', '天使', '천사', 0),
+('使', '天使', '천사', 1),
+('天', '天使菜', '천사채', 0),
+('使', '天使菜', '천사채', 1),
+('菜', '天使菜', '천사채', 2),
+('天', '天分', '천분', 0),
+('分', '天分', '천분', 1),
+('天', '天動說', '천동설', 0),
+('動', '天動說', '천동설', 1),
+('說', '天動說', '천동설', 2),
+('天', '天命', '천명', 0),
+('命', '天命', '천명', 1),
+('天', '天啓', '천계', 0),
+('啓', '天啓', '천계', 1),
+('天', '天國', '천국', 0),
+('國', '天國', '천국', 1),
+('天', '天地', '천지', 0),
+('地', '天地', '천지', 1),
+('天', '天地人', '천지인', 0),
+('地', '天地人', '천지인', 1),
+('人', '天地人', '천지인', 2),
+('天', '天地神明', '천지신명', 0),
+('地', '天地神明', '천지신명', 1),
+('神', '天地神明', '천지신명', 2),
+('明', '天地神明', '천지신명', 3),
+('天', '天基', '천기', 0),
+('基', '天基', '천기', 1),
+('天', '天堂', '천당', 0),
+('堂', '天堂', '천당', 1),
+('天', '天子', '천자', 0),
+('子', '天子', '천자', 1),
+('天', '天安', '천안', 0),
+('安', '天安', '천안', 1),
+('天', '天安門', '천안문', 0),
+('安', '天安門', '천안문', 1),
+('門', '天安門', '천안문', 2),
+('天', '天干', '천간', 0),
+('干', '天干', '천간', 1),
+('天', '天底', '천저', 0),
+('底', '天底', '천저', 1),
+('天', '天性', '천성', 0),
+('性', '天性', '천성', 1),
+('天', '天才', '천재', 0),
+('才', '天才', '천재', 1),
+('天', '天敵', '천적', 0),
+('敵', '天敵', '천적', 1),
+('天', '天文', '천문', 0),
+('文', '天文', '천문', 1),
+('天', '天文單位', '천문단위', 0),
+('文', '天文單位', '천문단위', 1),
+('單', '天文單位', '천문단위', 2),
+('位', '天文單位', '천문단위', 3),
+('天', '天文學', '천문학', 0),
+('文', '天文學', '천문학', 1),
+('學', '天文學', '천문학', 2),
+('天', '天文臺', '천문대', 0),
+('文', '天文臺', '천문대', 1),
+('臺', '天文臺', '천문대', 2),
+('天', '天文館', '천문관', 0),
+('文', '天文館', '천문관', 1),
+('館', '天文館', '천문관', 2),
+('天', '天旗', '천기', 0),
+('旗', '天旗', '천기', 1),
+('天', '天旨', '천지', 0),
+('旨', '天旨', '천지', 1),
+('天', '天明', '천명', 0),
+('明', '天明', '천명', 1),
+('天', '天極', '천극', 0),
+('極', '天極', '천극', 1),
+('天', '天機', '천기', 0),
+('機', '天機', '천기', 1),
+('天', '天氣', '천기', 0),
+('氣', '天氣', '천기', 1),
+('天', '天氣預報', '청기예보', 0),
+('氣', '天氣預報', '청기예보', 1),
+('預', '天氣預報', '청기예보', 2),
+('報', '天氣預報', '청기예보', 3),
+('天', '天池', '천지', 0),
+('池', '天池', '천지', 1),
+('天', '天津', '천진', 0),
+('津', '天津', '천진', 1),
+('天', '天災', '천재', 0),
+('災', '天災', '천재', 1),
+('天', '天然', '천연', 0),
+('然', '天然', '천연', 1),
+('天', '天然痘', '천연두', 0),
+('然', '天然痘', '천연두', 1),
+('痘', '天然痘', '천연두', 2),
+('天', '天然調味料', '천연조미료', 0),
+('然', '天然調味料', '천연조미료', 1),
+('調', '天然調味料', '천연조미료', 2),
+('味', '天然調味料', '천연조미료', 3),
+('料', '天然調味料', '천연조미료', 4),
+('天', '天父', '천부', 0),
+('父', '天父', '천부', 1),
+('天', '天狼星', '천랑성', 0),
+('狼', '天狼星', '천랑성', 1),
+('星', '天狼星', '천랑성', 2),
+('天', '天球', '천구', 0),
+('球', '天球', '천구', 1),
+('天', '天理', '천리', 0),
+('理', '天理', '천리', 1),
+('天', '天痴', '천치', 0),
+('痴', '天痴', '천치', 1),
+('天', '天癡', '천치', 0),
+('癡', '天癡', '천치', 1),
+('天', '天皇', '천황', 0),
+('皇', '天皇', '천황', 1),
+('天', '天目', '천목', 0),
+('目', '天目', '천목', 1),
+('天', '天眞', '천진', 0),
+('眞', '天眞', '천진', 1),
+('天', '天神', '천신', 0),
+('神', '天神', '천신', 1),
+('天', '天秤', '천칭', 0),
+('秤', '天秤', '천칭', 1),
+('天', '天穹', '천궁', 0),
+('穹', '天穹', '천궁', 1),
+('天', '天空', '천공', 0),
+('空', '天空', '천공', 1),
+('天', '天紀', '천기', 0),
+('紀', '天紀', '천기', 1),
+('天', '天罰', '천벌', 0),
+('罰', '天罰', '천벌', 1),
+('天', '天職', '천직', 0),
+('職', '天職', '천직', 1),
+('天', '天菊', '천국', 0),
+('菊', '天菊', '천국', 1),
+('天', '天蓋', '천개', 0),
+('蓋', '天蓋', '천개', 1),
+('天', '天蠍宮', '천갈궁', 0),
+('蠍', '天蠍宮', '천갈궁', 1),
+('宮', '天蠍宮', '천갈궁', 2),
+('天', '天象儀', '천상의', 0),
+('象', '天象儀', '천상의', 1),
+('儀', '天象儀', '천상의', 2),
+('天', '天賦', '천부', 0),
+('賦', '天賦', '천부', 1),
+('天', '天賦的', '천부적', 0),
+('賦', '天賦的', '천부적', 1),
+('的', '天賦的', '천부적', 2),
+('天', '天路歷程', '천로역정', 0),
+('路', '天路歷程', '천로역정', 1),
+('歷', '天路歷程', '천로역정', 2),
+('程', '天路歷程', '천로역정', 3),
+('天', '天道', '천도', 0),
+('道', '天道', '천도', 1),
+('天', '天道敎', '천도교', 0),
+('道', '天道敎', '천도교', 1),
+('敎', '天道敎', '천도교', 2),
+('天', '天障', '천장', 0),
+('障', '天障', '천장', 1),
+('天', '天頂', '천정', 0),
+('頂', '天頂', '천정', 1),
+('天', '天馬', '천마', 0),
+('馬', '天馬', '천마', 1),
+('天', '天體', '천체', 0),
+('體', '天體', '천체', 1),
+('天', '天體物理學', '천체물리학', 0),
+('體', '天體物理學', '천체물리학', 1),
+('物', '天體物理學', '천체물리학', 2),
+('理', '天體物理學', '천체물리학', 3),
+('學', '天體物理學', '천체물리학', 4),
+('天', '天魔', '천마', 0),
+('魔', '天魔', '천마', 1),
+('天', '天鵝', '천아', 0),
+('鵝', '天鵝', '천아', 1),
+('太', '太保', '태보', 0),
+('保', '太保', '태보', 1),
+('太', '太傅', '태부', 0),
+('傅', '太傅', '태부', 1),
+('太', '太初', '태초', 0),
+('初', '太初', '태초', 1),
+('太', '太古', '태곳', 0),
+('古', '太古', '태곳', 1),
+('太', '太后', '태후', 0),
+('后', '太后', '태후', 1),
+('太', '太子', '태자', 0),
+('子', '太子', '태자', 1),
+('太', '太守', '태수', 0),
+('守', '太守', '태수', 1),
+('太', '太宗', '태종', 0),
+('宗', '太宗', '태종', 1),
+('太', '太尉', '태위', 0),
+('尉', '太尉', '태위', 1),
+('太', '太師', '태사', 0),
+('師', '太師', '태사', 1),
+('太', '太平', '태평', 0),
+('平', '太平', '태평', 1),
+('太', '太極', '태극', 0),
+('極', '太極', '태극', 1),
+('太', '太極拳', '태극권', 0),
+('極', '太極拳', '태극권', 1),
+('拳', '太極拳', '태극권', 2),
+('太', '太極旗', '태극기', 0),
+('極', '太極旗', '태극기', 1),
+('旗', '太極旗', '태극기', 2),
+('太', '太白星', '태백성', 0),
+('白', '太白星', '태백성', 1),
+('星', '太白星', '태백성', 2),
+('太', '太皇太后', '태황태후', 0),
+('皇', '太皇太后', '태황태후', 1),
+('太', '太皇太后', '태황태후', 2),
+('后', '太皇太后', '태황태후', 3),
+('太', '太祖', '태조', 0),
+('祖', '太祖', '태조', 1),
+('太', '太陰', '태음', 0),
+('陰', '太陰', '태음', 1),
+('太', '太陰曆', '태음력', 0),
+('陰', '太陰曆', '태음력', 1),
+('曆', '太陰曆', '태음력', 2),
+('太', '太陽', '태양', 0),
+('陽', '太陽', '태양', 1),
+('太', '太陽 플레어', '태양 플레어', 0),
+('陽', '太陽 플레어', '태양 플레어', 1),
+('플', '太陽 플레어', '태양 플레어', 3),
+('레', '太陽 플레어', '태양 플레어', 4),
+('어', '太陽 플레어', '태양 플레어', 5),
+('太', '太陽女神', '태양여신', 0),
+('陽', '太陽女神', '태양여신', 1),
+('女', '太陽女神', '태양여신', 2),
+('神', '太陽女神', '태양여신', 3),
+('太', '太陽崇拜', '태양숭배', 0),
+('陽', '太陽崇拜', '태양숭배', 1),
+('崇', '太陽崇拜', '태양숭배', 2),
+('拜', '太陽崇拜', '태양숭배', 3),
+('太', '太陽曆', '태양력', 0),
+('陽', '太陽曆', '태양력', 1),
+('曆', '太陽曆', '태양력', 2),
+('太', '太陽椒', '태양초', 0),
+('陽', '太陽椒', '태양초', 1),
+('椒', '太陽椒', '태양초', 2),
+('太', '太陽神', '태양신', 0),
+('陽', '太陽神', '태양신', 1),
+('神', '太陽神', '태양신', 2),
+('太', '太陽節', '태양절', 0),
+('陽', '太陽節', '태양절', 1),
+('節', '太陽節', '태양절', 2),
+('太', '太陽系儀', '태양계의', 0),
+('陽', '太陽系儀', '태양계의', 1),
+('系', '太陽系儀', '태양계의', 2),
+('儀', '太陽系儀', '태양계의', 3),
+('太', '太陽電池', '태양전지', 0),
+('陽', '太陽電池', '태양전지', 1),
+('電', '太陽電池', '태양전지', 2),
+('池', '太陽電池', '태양전지', 3),
+('太', '太陽黑點', '태양흑점', 0),
+('陽', '太陽黑點', '태양흑점', 1),
+('黑', '太陽黑點', '태양흑점', 2),
+('點', '太陽黑點', '태양흑점', 3),
+('夫', '夫人', '부인', 0),
+('人', '夫人', '부인', 1),
+('夫', '夫妻', '부처', 0),
+('妻', '夫妻', '부처', 1),
+('夫', '夫婦', '부부', 0),
+('婦', '夫婦', '부부', 1),
+('夫', '夫婦 生活', '부부 생활', 0),
+('婦', '夫婦 生活', '부부 생활', 1),
+('生', '夫婦 生活', '부부 생활', 3),
+('活', '夫婦 生活', '부부 생활', 4),
+('夫', '夫餘', '부여', 0),
+('餘', '夫餘', '부여', 1),
+('夭', '夭折', '요절', 0),
+('折', '夭折', '요절', 1),
+('夭', '夭死', '요사', 0),
+('死', '夭死', '요사', 1),
+('夭', '夭逝', '요서', 0),
+('逝', '夭逝', '요서', 1),
+('失', '失', '실', 0),
+('失', '失心', '실심', 0),
+('心', '失心', '실심', 1),
+('失', '失戀', '실연', 0),
+('戀', '失戀', '실연', 1),
+('失', '失手', '실수', 0),
+('手', '失手', '실수', 1),
+('失', '失政', '실정', 0),
+('政', '失政', '실정', 1),
+('失', '失效', '실효', 0),
+('效', '失效', '실효', 1),
+('失', '失敗', '실패', 0),
+('敗', '失敗', '실패', 1),
+('失', '失敗者', '실패자', 0),
+('敗', '失敗者', '실패자', 1),
+('者', '失敗者', '실패자', 2),
+('失', '失明', '실명', 0),
+('明', '失明', '실명', 1),
+('失', '失望', '실망', 0),
+('望', '失望', '실망', 1),
+('失', '失格', '실격', 0),
+('格', '失格', '실격', 1),
+('失', '失業', '실업', 0),
+('業', '失業', '실업', 1),
+('失', '失業率', '실업률', 0),
+('業', '失業率', '실업률', 1),
+('率', '失業率', '실업률', 2),
+('失', '失業者', '실업자', 0),
+('業', '失業者', '실업자', 1),
+('者', '失業者', '실업자', 2),
+('失', '失神', '실신', 0),
+('神', '失神', '실신', 1),
+('失', '失禮', '실례', 0),
+('禮', '失禮', '실례', 1),
+('失', '失策', '실책', 0),
+('策', '失策', '실책', 1),
+('失', '失職', '실직', 0),
+('職', '失職', '실직', 1),
+('失', '失語症', '실어증', 0),
+('語', '失語症', '실어증', 1),
+('症', '失語症', '실어증', 2),
+('失', '失踪', '실종', 0),
+('踪', '失踪', '실종', 1),
+('失', '失速', '실속', 0),
+('速', '失速', '실속', 1),
+('失', '失鄕民', '실향민', 0),
+('鄕', '失鄕民', '실향민', 1),
+('民', '失鄕民', '실향민', 2),
+('失', '失陷', '실함', 0),
+('陷', '失陷', '실함', 1),
+('夾', '夾竹桃', '협죽도', 0),
+('竹', '夾竹桃', '협죽도', 1),
+('桃', '夾竹桃', '협죽도', 2),
+('奇', '奇別', '기별', 0),
+('別', '奇別', '기별', 1),
+('奇', '奇形', '기형', 0),
+('形', '奇形', '기형', 1),
+('奇', '奇異', '기이', 0),
+('異', '奇異', '기이', 1),
+('奇', '奇石', '기석', 0),
+('石', '奇石', '기석', 1),
+('奇', '奇術', '기술', 0),
+('術', '奇術', '기술', 1),
+('奇', '奇襲', '기습', 0),
+('襲', '奇襲', '기습', 1),
+('奇', '奇計', '기계', 0),
+('計', '奇計', '기계', 1),
+('奇', '奇跡', '기적', 0),
+('跡', '奇跡', '기적', 1),
+('奇', '奇蹟', '기적', 0),
+('蹟', '奇蹟', '기적', 1),
+('奇', '奇遇', '기우', 0),
+('遇', '奇遇', '기우', 1),
+('奉', '奉仕', '봉사', 0),
+('仕', '奉仕', '봉사', 1),
+('奉', '奉仕機', '봉사기', 0),
+('仕', '奉仕機', '봉사기', 1),
+('機', '奉仕機', '봉사기', 2),
+('奉', '奉獻', '봉헌', 0),
+('獻', '奉獻', '봉헌', 1),
+('契', '契', '계', 0),
+('契', '契丹', '거란', 0),
+('丹', '契丹', '거란', 1),
+('契', '契機', '계기', 0),
+('機', '契機', '계기', 1),
+('契', '契約', '계약', 0),
+('約', '契約', '계약', 1),
+('契', '契約書', '계약서', 0),
+('約', '契約書', '계약서', 1),
+('書', '契約書', '계약서', 2),
+('奔', '奔放', '분방', 0),
+('放', '奔放', '분방', 1),
+('奔', '奔走', '분주', 0),
+('走', '奔走', '분주', 1),
+('奔', '奔騰', '분등', 0),
+('騰', '奔騰', '분등', 1),
+('套', '套書', '투서', 0),
+('書', '套書', '투서', 1),
+('套', '套署', '투서', 0),
+('署', '套署', '투서', 1),
+('奚', '奚琴', '해금', 0),
+('琴', '奚琴', '해금', 1),
+('奠', '奠都', '전도', 0),
+('都', '奠都', '전도', 1),
+('奢', '奢侈', '사치', 0),
+('侈', '奢侈', '사치', 1),
+('奢', '奢侈品', '사치품', 0),
+('侈', '奢侈品', '사치품', 1),
+('品', '奢侈品', '사치품', 2),
+('奧', '奧地', '오지', 0),
+('地', '奧地', '오지', 1),
+('奪', '奪取', '탈취', 0),
+('取', '奪取', '탈취', 1),
+('奪', '奪還', '탈환', 0),
+('還', '奪還', '탈환', 1),
+('奬', '奬勵', '장려', 0),
+('勵', '奬勵', '장려', 1),
+('奬', '奬勵金', '장려금', 0),
+('勵', '奬勵金', '장려금', 1),
+('金', '奬勵金', '장려금', 2),
+('奬', '奬學', '장학', 0),
+('學', '奬學', '장학', 1),
+('奬', '奬學金', '장학금', 0),
+('學', '奬學金', '장학금', 1),
+('金', '奬學金', '장학금', 2),
+('奬', '奬學金', '장학금', 0),
+('學', '奬學金', '장학금', 1),
+('金', '奬學金', '장학금', 2),
+('奮', '奮鬪', '분투', 0),
+('鬪', '奮鬪', '분투', 1),
+('女', '女', '녀', 0),
+('女', '女', '여', 0),
+('女', '女中生', '여중생', 0),
+('中', '女中生', '여중생', 1),
+('生', '女中生', '여중생', 2),
+('女', '女人', '녀인', 0),
+('人', '女人', '녀인', 1),
+('女', '女人', '여인', 0),
+('人', '女人', '여인', 1),
+('女', '女俳優', '여배우', 0),
+('俳', '女俳優', '여배우', 1),
+('優', '女俳優', '여배우', 2),
+('女', '女傑', '여걸', 0),
+('傑', '女傑', '여걸', 1),
+('女', '女優', '여우', 0),
+('優', '女優', '여우', 1),
+('女', '女同生', '녀동생', 0),
+('同', '女同生', '녀동생', 1),
+('生', '女同生', '녀동생', 2),
+('女', '女同生', '여동생', 0),
+('同', '女同生', '여동생', 1),
+('生', '女同生', '여동생', 2),
+('女', '女大生', '여대생', 0),
+('大', '女大生', '여대생', 1),
+('生', '女大生', '여대생', 2),
+('女', '女媧', '여와', 0),
+('媧', '女媧', '여와', 1),
+('女', '女子', '녀자', 0),
+('子', '女子', '녀자', 1),
+('女', '女子', '여자', 0),
+('子', '女子', '여자', 1),
+('女', '女子親舊', '여자친구', 0),
+('子', '女子親舊', '여자친구', 1),
+('親', '女子親舊', '여자친구', 2),
+('舊', '女子親舊', '여자친구', 3),
+('女', '女學生', '녀학생', 0),
+('學', '女學生', '녀학생', 1),
+('生', '女學生', '녀학생', 2),
+('女', '女學生', '여학생', 0),
+('學', '女學生', '여학생', 1),
+('生', '女學生', '여학생', 2),
+('女', '女尊男卑', '여존남비', 0),
+('尊', '女尊男卑', '여존남비', 1),
+('男', '女尊男卑', '여존남비', 2),
+('卑', '女尊男卑', '여존남비', 3),
+('女', '女帝', '여제', 0),
+('帝', '女帝', '여제', 1),
+('女', '女店員', '여점원', 0),
+('店', '女店員', '여점원', 1),
+('員', '女店員', '여점원', 2),
+('女', '女性', '녀성', 0),
+('性', '女性', '녀성', 1),
+('女', '女性', '여성', 0),
+('性', '女性', '여성', 1),
+('女', '女性主義', '여성주의', 0),
+('性', '女性主義', '여성주의', 1),
+('主', '女性主義', '여성주의', 2),
+('義', '女性主義', '여성주의', 3),
+('女', '女性主義者', '여성주의자', 0),
+('性', '女性主義者', '여성주의자', 1),
+('主', '女性主義者', '여성주의자', 2),
+('義', '女性主義者', '여성주의자', 3),
+('者', '女性主義者', '여성주의자', 4),
+('女', '女性嫌惡', '여성혐오', 0),
+('性', '女性嫌惡', '여성혐오', 1),
+('嫌', '女性嫌惡', '여성혐오', 2),
+('惡', '女性嫌惡', '여성혐오', 3),
+('女', '女性的', '여성적', 0),
+('性', '女性的', '여성적', 1),
+('的', '女性的', '여성적', 2),
+('女', '女性語', '여성어', 0),
+('性', '女性語', '여성어', 1),
+('語', '女性語', '여성어', 2),
+('女', '女性運動家', '여성운동가', 0),
+('性', '女性運動家', '여성운동가', 1),
+('運', '女性運動家', '여성운동가', 2),
+('動', '女性運動家', '여성운동가', 3),
+('家', '女性運動家', '여성운동가', 4),
+('女', '女敎皇', '여교황', 0),
+('敎', '女敎皇', '여교황', 1),
+('皇', '女敎皇', '여교황', 2),
+('女', '女王', '녀왕', 0),
+('王', '女王', '녀왕', 1),
+('女', '女王', '여왕', 0),
+('王', '女王', '여왕', 1),
+('女', '女皇', '녀황', 0),
+('皇', '女皇', '녀황', 1),
+('女', '女皇', '여황', 0),
+('皇', '女皇', '여황', 1),
+('女', '女眞', '여진', 0),
+('眞', '女眞', '여진', 1),
+('女', '女神', '녀신', 0),
+('神', '女神', '녀신', 1),
+('女', '女神', '여신', 0),
+('神', '女神', '여신', 1),
+('女', '女給', '여급', 0),
+('給', '女給', '여급', 1),
+('女', '女聲中音', '녀성중음', 0),
+('聲', '女聲中音', '녀성중음', 1),
+('中', '女聲中音', '녀성중음', 2),
+('音', '女聲中音', '녀성중음', 3),
+('女', '女聲低音', '녀성저음', 0),
+('聲', '女聲低音', '녀성저음', 1),
+('低', '女聲低音', '녀성저음', 2),
+('音', '女聲低音', '녀성저음', 3),
+('女', '女聲高音', '녀성고음', 0),
+('聲', '女聲高音', '녀성고음', 1),
+('高', '女聲高音', '녀성고음', 2),
+('音', '女聲高音', '녀성고음', 3),
+('女', '女色', '여색', 0),
+('色', '女色', '여색', 1),
+('女', '女裝', '여장', 0),
+('裝', '女裝', '여장', 1),
+('女', '女親', '여친', 0),
+('親', '女親', '여친', 1),
+('女', '女超', '여초', 0),
+('超', '女超', '여초', 1),
+('女', '女軍', '여군', 0),
+('軍', '女軍', '여군', 1),
+('女', '女體', '여체', 0),
+('體', '女體', '여체', 1),
+('女', '女高生', '여고생', 0),
+('高', '女高生', '여고생', 1),
+('生', '女高生', '여고생', 2),
+('女', '女캐', '여캐', 0),
+('캐', '女캐', '여캐', 1),
+('奴', '奴婢', '노비', 0),
+('婢', '奴婢', '노비', 1),
+('奴', '奴輩', '노배', 0),
+('輩', '奴輩', '노배', 1),
+('奴', '奴隸', '노례', 0),
+('隸', '奴隸', '노례', 1),
+('奴', '奴隸', '노예', 0),
+('隸', '奴隸', '노예', 1),
+('奸', '奸惡', '간악', 0),
+('惡', '奸惡', '간악', 1),
+('奸', '奸臣', '간신', 0),
+('臣', '奸臣', '간신', 1),
+('奸', '奸計', '간계', 0),
+('計', '奸計', '간계', 1),
+('奸', '奸詐', '간사', 0),
+('詐', '奸詐', '간사', 1),
+('奸', '奸謀', '간모', 0),
+('謀', '奸謀', '간모', 1),
+('好', '好不好', '호불호', 0),
+('不', '好不好', '호불호', 1),
+('好', '好不好', '호불호', 2),
+('好', '好奇心', '호기심', 0),
+('奇', '好奇心', '호기심', 1),
+('心', '好奇心', '호기심', 2),
+('好', '好守備', '호수비', 0),
+('守', '好守備', '호수비', 1),
+('備', '好守備', '호수비', 2),
+('好', '好意', '호의', 0),
+('意', '好意', '호의', 1),
+('好', '好感', '호감', 0),
+('感', '好感', '호감', 1),
+('好', '好戰', '호전', 0),
+('戰', '好戰', '호전', 1),
+('好', '好戰的', '호전적', 0),
+('戰', '好戰的', '호전적', 1),
+('的', '好戰的', '호전적', 2),
+('好', '好投', '호투', 0),
+('投', '好投', '호투', 1),
+('好', '好機', '호기', 0),
+('機', '好機', '호기', 1),
+('好', '好色', '호색', 0),
+('色', '好色', '호색', 1),
+('好', '好色漢', '호색한', 0),
+('色', '好色漢', '호색한', 1),
+('漢', '好色漢', '호색한', 2),
+('好', '好評', '호평', 0),
+('評', '好評', '호평', 1),
+('好', '好轉', '호전', 0),
+('轉', '好轉', '호전', 1),
+('如', '如何', '여하', 0),
+('何', '如何', '여하', 1),
+('如', '如來', '여래', 0),
+('來', '如來', '여래', 1),
+('如', '如前', '여전', 0),
+('前', '如前', '여전', 1),
+('如', '如如', '여여', 0),
+('如', '如如', '여여', 1),
+('如', '如干', '여간', 0),
+('干', '如干', '여간', 1),
+('妄', '妄想', '망상', 0),
+('想', '妄想', '망상', 1),
+('妄', '妄靈', '망령', 0),
+('靈', '妄靈', '망령', 1),
+('妊', '妊娠', '임신', 0),
+('娠', '妊娠', '임신', 1),
+('妊', '妊娠婦', '임신부', 0),
+('娠', '妊娠婦', '임신부', 1),
+('婦', '妊娠婦', '임신부', 2),
+('妊', '妊婦', '임부', 0),
+('婦', '妊婦', '임부', 1),
+('妊', '妊産婦', '임산부', 0),
+('産', '妊産婦', '임산부', 1),
+('婦', '妊産婦', '임산부', 2),
+('妓', '妓女', '기녀', 0),
+('女', '妓女', '기녀', 1),
+('妓', '妓生', '기생', 0),
+('生', '妓生', '기생', 1),
+('妖', '妖人', '요인', 0),
+('人', '妖人', '요인', 1),
+('妖', '妖婦', '요부', 0),
+('婦', '妖婦', '요부', 1),
+('妖', '妖怪', '요괴', 0),
+('怪', '妖怪', '요괴', 1),
+('妖', '妖精', '요정', 0),
+('精', '妖精', '요정', 1),
+('妖', '妖術', '요술', 0),
+('術', '妖術', '요술', 1),
+('妖', '妖邪', '요사', 0),
+('邪', '妖邪', '요사', 1),
+('妙', '妙味', '묘미', 0),
+('味', '妙味', '묘미', 1),
+('妙', '妙藥', '묘약', 0),
+('藥', '妙藥', '묘약', 1),
+('妥', '妥協', '타협', 0),
+('協', '妥協', '타협', 1),
+('妥', '妥當', '타당', 0),
+('當', '妥當', '타당', 1),
+('妥', '妥結', '타결', 0),
+('結', '妥結', '타결', 1),
+('妨', '妨害', '방해', 0),
+('害', '妨害', '방해', 1),
+('妨', '妨害物', '방해물', 0),
+('害', '妨害物', '방해물', 1),
+('物', '妨害物', '방해물', 2),
+('妹', '妹氏', '매씨', 0),
+('氏', '妹氏', '매씨', 1),
+('妻', '妻', '처', 0),
+('妻', '妻子', '처자', 0),
+('子', '妻子', '처자', 1),
+('妻', '妻家', '처가', 0),
+('家', '妻家', '처가', 1),
+('妻', '妻父母', '처부모', 0),
+('父', '妻父母', '처부모', 1),
+('母', '妻父母', '처부모', 2),
+('妻', '妻男', '처남', 0),
+('男', '妻男', '처남', 1),
+('妾', '妾', '첩', 0),
+('姉', '姉妹', '자매', 0),
+('妹', '姉妹', '자매', 1),
+('姊', '姊妹', '자매', 0),
+('妹', '姊妹', '자매', 1),
+('始', '始作', '시작', 0),
+('作', '始作', '시작', 1),
+('始', '始動', '시동', 0),
+('動', '始動', '시동', 1),
+('始', '始期', '시기', 0),
+('期', '始期', '시기', 1),
+('始', '始發', '시발', 0),
+('發', '始發', '시발', 1),
+('始', '始祖', '시조', 0),
+('祖', '始祖', '시조', 1),
+('始', '始祖—', '시조새', 0),
+('祖', '始祖—', '시조새', 1),
+('—', '始祖—', '시조새', 2),
+('始', '始祖鳥', '시조조', 0),
+('祖', '始祖鳥', '시조조', 1),
+('鳥', '始祖鳥', '시조조', 2),
+('姑', '姑母', '고모', 0),
+('母', '姑母', '고모', 1),
+('姑', '姑母夫', '고모부', 0),
+('母', '姑母夫', '고모부', 1),
+('夫', '姑母夫', '고모부', 2),
+('姓', '姓', '성', 0),
+('姓', '姓名', '성명', 0),
+('名', '姓名', '성명', 1),
+('姓', '姓氏', '성씨', 0),
+('氏', '姓氏', '성씨', 1),
+('姓', '姓銜', '성함', 0),
+('銜', '姓銜', '성함', 1),
+('委', '委任', '위임', 0),
+('任', '委任', '위임', 1),
+('委', '委員', '위원', 0),
+('員', '委員', '위원', 1),
+('委', '委員會', '위원회', 0),
+('員', '委員會', '위원회', 1),
+('會', '委員會', '위원회', 2),
+('委', '委員長', '위원장', 0),
+('員', '委員長', '위원장', 1),
+('長', '委員長', '위원장', 2),
+('委', '委託', '위탁', 0),
+('託', '委託', '위탁', 1),
+('姙', '姙娠', '임신', 0),
+('娠', '姙娠', '임신', 1),
+('姙', '姙婦', '임부', 0),
+('婦', '姙婦', '임부', 1),
+('姜', '姜', '강', 0),
+('姦', '姦夫', '간부', 0),
+('夫', '姦夫', '간부', 1),
+('姦', '姦淫', '간음', 0),
+('淫', '姦淫', '간음', 1),
+('姦', '姦通', '간통', 0),
+('通', '姦通', '간통', 1),
+('姨', '姨姪', '이질', 0),
+('姪', '姨姪', '이질', 1),
+('姨', '姨母', '이모', 0),
+('母', '姨母', '이모', 1),
+('姨', '姨母夫', '이모부', 0),
+('母', '姨母夫', '이모부', 1),
+('夫', '姨母夫', '이모부', 2),
+('姪', '姪女', '질녀', 0),
+('女', '姪女', '질녀', 1),
+('姿', '姿勢', '자세', 0),
+('勢', '姿勢', '자세', 1),
+('姿', '姿態', '자태', 0),
+('態', '姿態', '자태', 1),
+('威', '威信', '위신', 0),
+('信', '威信', '위신', 1),
+('威', '威力', '위력', 0),
+('力', '威力', '위력', 1),
+('威', '威名', '위명', 0),
+('名', '威名', '위명', 1),
+('威', '威嚴', '위엄', 0),
+('嚴', '威嚴', '위엄', 1),
+('威', '威權', '위권', 0),
+('權', '威權', '위권', 1),
+('威', '威脅', '위협', 0),
+('脅', '威脅', '위협', 1),
+('威', '威風堂堂', '위풍당당', 0),
+('風', '威風堂堂', '위풍당당', 1),
+('堂', '威風堂堂', '위풍당당', 2),
+('堂', '威風堂堂', '위풍당당', 3),
+('娑', '娑婆', '사바', 0),
+('婆', '娑婆', '사바', 1),
+('娛', '娛樂', '오락', 0),
+('樂', '娛樂', '오락', 1),
+('娛', '娛樂室', '오락실', 0),
+('樂', '娛樂室', '오락실', 1),
+('室', '娛樂室', '오락실', 2),
+('娛', '娛樂', '오락', 0),
+('樂', '娛樂', '오락', 1),
+('娼', '娼女', '창녀', 0),
+('女', '娼女', '창녀', 1),
+('婉', '婉曲語法', '완곡어법', 0),
+('曲', '婉曲語法', '완곡어법', 1),
+('語', '婉曲語法', '완곡어법', 2),
+('法', '婉曲語法', '완곡어법', 3),
+('婚', '婚事', '혼사', 0),
+('事', '婚事', '혼사', 1),
+('婚', '婚外', '혼외', 0),
+('外', '婚外', '혼외', 1),
+('婚', '婚姻', '혼인', 0),
+('姻', '婚姻', '혼인', 1),
+('婚', '婚禮', '혼례', 0),
+('禮', '婚禮', '혼례', 1),
+('婚', '婚禮式', '혼례식', 0),
+('禮', '婚禮式', '혼례식', 1),
+('式', '婚禮式', '혼례식', 2),
+('婚', '婚約', '혼약', 0),
+('約', '婚約', '혼약', 1),
+('婚', '婚齡', '혼령', 0),
+('齡', '婚齡', '혼령', 1),
+('婢', '婢妾', '비첩', 0),
+('妾', '婢妾', '비첩', 1),
+('婦', '婦人', '부인', 0),
+('人', '婦人', '부인', 1),
+('婦', '婦人科', '부인과', 0),
+('人', '婦人科', '부인과', 1),
+('科', '婦人科', '부인과', 2),
+('媒', '媒介', '매개', 0),
+('介', '媒介', '매개', 1),
+('媒', '媒質', '매질', 0),
+('質', '媒質', '매질', 1),
+('媒', '媒體', '매체', 0),
+('體', '媒體', '매체', 1),
+('媚', '媚藥', '미약', 0),
+('藥', '媚藥', '미약', 1),
+('媤', '媤-', '시집', 0),
+('-', '媤-', '시집', 1),
+('媤', '媤---', '시아버지', 0),
+('-', '媤---', '시아버지', 1),
+('-', '媤---', '시아버지', 2),
+('-', '媤---', '시아버지', 3),
+('媤', '媤---', '시어머니', 0),
+('-', '媤---', '시어머니', 1),
+('-', '媤---', '시어머니', 2),
+('-', '媤---', '시어머니', 3),
+('媤', '媤叔', '시숙', 0),
+('叔', '媤叔', '시숙', 1),
+('媤', '媤同生', '시동생', 0),
+('同', '媤同生', '시동생', 1),
+('生', '媤同生', '시동생', 2),
+('媤', '媤宅', '새댁', 0),
+('宅', '媤宅', '새댁', 1),
+('媤', '媤宅', '시댁', 0),
+('宅', '媤宅', '시댁', 1),
+('媤', '媤父母', '시부모', 0),
+('父', '媤父母', '시부모', 1),
+('母', '媤父母', '시부모', 2),
+('媽', '媽媽', '마마', 0),
+('媽', '媽媽', '마마', 1),
+('嫉', '嫉妬', '질투', 0),
+('妬', '嫉妬', '질투', 1),
+('嫌', '嫌惡', '혐오', 0),
+('惡', '嫌惡', '혐오', 1),
+('嫌', '嫌疑', '혐의', 0),
+('疑', '嫌疑', '혐의', 1),
+('嫡', '嫡出', '적출', 0),
+('出', '嫡出', '적출', 1),
+('嫡', '嫡子', '적자', 0),
+('子', '嫡子', '적자', 1),
+('嬌', '嬌態', '교태', 0),
+('態', '嬌態', '교태', 1),
+('嬌', '嬌聲', '교성', 0),
+('聲', '嬌聲', '교성', 1),
+('嬖', '嬖人', '폐인', 0),
+('人', '嬖人', '폐인', 1),
+('孃', '孃', '양', 0),
+('子', '子午線', '자오선', 0),
+('午', '子午線', '자오선', 1),
+('線', '子午線', '자오선', 2),
+('子', '子女', '자녀', 0),
+('女', '子女', '자녀', 1),
+('子', '子孫', '자손', 0),
+('孫', '子孫', '자손', 1),
+('子', '子宮', '자궁', 0),
+('宮', '子宮', '자궁', 1),
+('子', '子宮 內 裝置', '자궁 내 장치', 0),
+('宮', '子宮 內 裝置', '자궁 내 장치', 1),
+('內', '子宮 內 裝置', '자궁 내 장치', 3),
+('裝', '子宮 內 裝置', '자궁 내 장치', 5),
+('置', '子宮 內 裝置', '자궁 내 장치', 6),
+('子', '子息', '자식', 0),
+('息', '子息', '자식', 1),
+('子', '子會社', '자회사', 0),
+('會', '子會社', '자회사', 1),
+('社', '子會社', '자회사', 2),
+('子', '子正', '자정', 0),
+('正', '子正', '자정', 1),
+('子', '子爵', '자작', 0),
+('爵', '子爵', '자작', 1),
+('子', '子癇', '자간', 0),
+('癇', '子癇', '자간', 1),
+('子', '子葉', '자엽', 0),
+('葉', '子葉', '자엽', 1),
+('子', '子音', '자음', 0),
+('音', '子音', '자음', 1),
+('子', '子音-', '자음자', 0),
+('音', '子音-', '자음자', 1),
+('-', '子音-', '자음자', 2),
+('孔', '孔夫子', '공부자', 0),
+('夫', '孔夫子', '공부자', 1),
+('子', '孔夫子', '공부자', 2),
+('孔', '孔敎', '공교', 0),
+('敎', '孔敎', '공교', 1),
+('孔', '孔教', '공교', 0),
+('教', '孔教', '공교', 1),
+('孔', '孔雀', '공작', 0),
+('雀', '孔雀', '공작', 1),
+('孕', '孕婦', '잉부', 0),
+('婦', '孕婦', '잉부', 1),
+('孕', '孕胎', '잉태', 0),
+('胎', '孕胎', '잉태', 1),
+('字', '字', '자', 0),
+('字', '字典', '자전', 0),
+('典', '字典', '자전', 1),
+('字', '字幕', '자막', 0),
+('幕', '字幕', '자막', 1),
+('字', '字形', '자형', 0),
+('形', '字形', '자형', 1),
+('字', '字板', '자판', 0),
+('板', '字板', '자판', 1),
+('字', '字母', '자모', 0),
+('母', '字母', '자모', 1),
+('字', '字源', '자원', 0),
+('源', '字源', '자원', 1),
+('字', '字素', '자소', 0),
+('素', '字素', '자소', 1),
+('字', '字音', '자음', 0),
+('音', '字音', '자음', 1),
+('字', '字體', '자체', 0),
+('體', '字體', '자체', 1),
+('存', '存亡', '존망', 0),
+('亡', '存亡', '존망', 1),
+('存', '存在', '존재', 0),
+('在', '存在', '존재', 1),
+('存', '存續', '존속', 0),
+('續', '存續', '존속', 1),
+('孝', '孝', '효', 0),
+('孝', '孝子', '효자', 0),
+('子', '孝子', '효자', 1),
+('孝', '孝子—', '효자손', 0),
+('子', '孝子—', '효자손', 1),
+('—', '孝子—', '효자손', 2),
+('孝', '孝心', '효심', 0),
+('心', '孝心', '효심', 1),
+('孝', '孝經', '효경', 0),
+('經', '孝經', '효경', 1),
+('孝', '孝行', '효행', 0),
+('行', '孝行', '효행', 1),
+('孝', '孝道', '효도', 0),
+('道', '孝道', '효도', 1),
+('孝', '孝順', '효순', 0),
+('順', '孝順', '효순', 1),
+('孟', '孟子', '맹자', 0),
+('子', '孟子', '맹자', 1),
+('季', '季刊', '계간', 0),
+('刊', '季刊', '계간', 1),
+('季', '季節', '계절', 0),
+('節', '季節', '계절', 1),
+('季', '季節的', '계절적', 0),
+('節', '季節的', '계절적', 1),
+('的', '季節的', '계절적', 2),
+('孤', '孤兒', '고아', 0),
+('兒', '孤兒', '고아', 1),
+('孤', '孤兒院', '고아원', 0),
+('兒', '孤兒院', '고아원', 1),
+('院', '孤兒院', '고아원', 2),
+('孤', '孤島', '고도', 0),
+('島', '孤島', '고도', 1),
+('孤', '孤独死', '고독사', 0),
+('独', '孤独死', '고독사', 1),
+('死', '孤独死', '고독사', 2),
+('孤', '孤獨', '고독', 0),
+('獨', '孤獨', '고독', 1),
+('孤', '孤獨感', '고독감', 0),
+('獨', '孤獨感', '고독감', 1),
+('感', '孤獨感', '고독감', 2),
+('孤', '孤獨死', '고독사', 0),
+('獨', '孤獨死', '고독사', 1),
+('死', '孤獨死', '고독사', 2),
+('孤', '孤立', '고립', 0),
+('立', '孤立', '고립', 1),
+('孤', '孤立地', '고립지', 0),
+('立', '孤立地', '고립지', 1),
+('地', '孤立地', '고립지', 2),
+('孤', '孤立語', '고립어', 0),
+('立', '孤立語', '고립어', 1),
+('語', '孤立語', '고립어', 2),
+('孤', '孤食', '고식', 0),
+('食', '孤食', '고식', 1),
+('孫', '孫女', '손녀', 0),
+('女', '孫女', '손녀', 1),
+('孫', '孫子', '손자', 0),
+('子', '孫子', '손자', 1),
+('孫', '孫胄', '손주', 0),
+('胄', '孫胄', '손주', 1),
+('孵', '孵化', '부화', 0),
+('化', '孵化', '부화', 1),
+('學', '學位', '학위', 0),
+('位', '學位', '학위', 1),
+('學', '學力', '학력', 0),
+('力', '學力', '학력', 1),
+('學', '學區', '학구', 0),
+('區', '學區', '학구', 1),
+('學', '學名', '학명', 0),
+('名', '學名', '학명', 1),
+('學', '學問', '학문', 0),
+('問', '學問', '학문', 1),
+('學', '學園', '학원', 0),
+('園', '學園', '학원', 1),
+('學', '學士', '학사', 0),
+('士', '學士', '학사', 1),
+('學', '學年', '학년', 0),
+('年', '學年', '학년', 1),
+('學', '學會', '학회', 0),
+('會', '學會', '학회', 1),
+('學', '學期', '학기', 0),
+('期', '學期', '학기', 1),
+('學', '學校', '학괴', 0),
+('校', '學校', '학괴', 1),
+('學', '學校', '학교', 0),
+('校', '學校', '학교', 1),
+('學', '學校生活', '학교생활', 0),
+('校', '學校生活', '학교생활', 1),
+('生', '學校生活', '학교생활', 2),
+('活', '學校生活', '학교생활', 3),
+('學', '學校生活記錄簿', '학교생활기록부', 0),
+('校', '學校生活記錄簿', '학교생활기록부', 1),
+('生', '學校生活記錄簿', '학교생활기록부', 2),
+('活', '學校生活記錄簿', '학교생활기록부', 3),
+('記', '學校生活記錄簿', '학교생활기록부', 4),
+('錄', '學校生活記錄簿', '학교생활기록부', 5),
+('簿', '學校生活記錄簿', '학교생활기록부', 6),
+('學', '學歷', '학력', 0),
+('歷', '學歷', '학력', 1),
+('學', '學父母', '학부모', 0),
+('父', '學父母', '학부모', 1),
+('母', '學父母', '학부모', 2),
+('學', '學生', '학생', 0),
+('生', '學生', '학생', 1),
+('學', '學生少年宮殿', '학생소년궁전', 0),
+('生', '學生少年宮殿', '학생소년궁전', 1),
+('少', '學生少年宮殿', '학생소년궁전', 2),
+('年', '學生少年宮殿', '학생소년궁전', 3),
+('宮', '學生少年宮殿', '학생소년궁전', 4),
+('殿', '學生少年宮殿', '학생소년궁전', 5),
+('學', '學生會', '학생회', 0),
+('生', '學生會', '학생회', 1),
+('會', '學生會', '학생회', 2),
+('學', '學生會館', '학생회관', 0),
+('生', '學生會館', '학생회관', 1),
+('會', '學生會館', '학생회관', 2),
+('館', '學生會館', '학생회관', 3),
+('學', '學生服', '학생복', 0),
+('生', '學生服', '학생복', 1),
+('服', '學生服', '학생복', 2),
+('學', '學生證', '학생증', 0),
+('生', '學生證', '학생증', 1),
+('證', '學生證', '학생증', 2),
+('學', '學用品', '학용품', 0),
+('用', '學用品', '학용품', 1),
+('品', '學用品', '학용품', 2),
+('學', '學番', '학번', 0),
+('番', '學番', '학번', 1),
+('學', '學科', '학과', 0),
+('科', '學科', '학과', 1),
+('學', '學究的', '학구적', 0),
+('究', '學究的', '학구적', 1),
+('的', '學究的', '학구적', 2),
+('學', '學童', '학동', 0),
+('童', '學童', '학동', 1),
+('學', '學級', '학급', 0),
+('級', '學級', '학급', 1),
+('學', '學習', '학습', 0),
+('習', '學習', '학습', 1),
+('學', '學習帳', '학습장', 0),
+('習', '學習帳', '학습장', 1),
+('帳', '學習帳', '학습장', 2),
+('學', '學者', '학자', 0),
+('者', '學者', '학자', 1),
+('學', '學術', '학술', 0),
+('術', '學術', '학술', 1),
+('學', '學說', '학설', 0),
+('說', '學說', '학설', 1),
+('學', '學課', '학과', 0),
+('課', '學課', '학과', 1),
+('學', '學識', '학식', 0),
+('識', '學識', '학식', 1),
+('學', '學費', '학비', 0),
+('費', '學費', '학비', 1),
+('學', '學部', '학부', 0),
+('部', '學部', '학부', 1),
+('學', '學閥', '학벌', 0),
+('閥', '學閥', '학벌', 1),
+('學', '學院', '학원', 0),
+('院', '學院', '학원', 1),
+('學', '學點', '학점', 0),
+('點', '學點', '학점', 1),
+('學', '學齡', '학령', 0),
+('齡', '學齡', '학령', 1),
+('宅', '宅', '댁', 0),
+('宅', '宅', '택', 0),
+('宅', '宅配', '택배', 0),
+('配', '宅配', '택배', 1),
+('宇', '宇宙', '우주', 0),
+('宙', '宇宙', '우주', 1),
+('宇', '宇宙 停車場', '우주 정거장', 0),
+('宙', '宇宙 停車場', '우주 정거장', 1),
+('停', '宇宙 停車場', '우주 정거장', 3),
+('車', '宇宙 停車場', '우주 정거장', 4),
+('場', '宇宙 停車場', '우주 정거장', 5),
+('宇', '宇宙人', '우주인', 0),
+('宙', '宇宙人', '우주인', 1),
+('人', '宇宙人', '우주인', 2),
+('宇', '宇宙塵', '우주진', 0),
+('宙', '宇宙塵', '우주진', 1),
+('塵', '宇宙塵', '우주진', 2),
+('宇', '宇宙船', '우주선', 0),
+('宙', '宇宙船', '우주선', 1),
+('船', '宇宙船', '우주선', 2),
+('宇', '宇宙論', '우주론', 0),
+('宙', '宇宙論', '우주론', 1),
+('論', '宇宙論', '우주론', 2),
+('宇', '宇宙飛行士', '우주비행사', 0),
+('宙', '宇宙飛行士', '우주비행사', 1),
+('飛', '宇宙飛行士', '우주비행사', 2),
+('行', '宇宙飛行士', '우주비행사', 3),
+('士', '宇宙飛行士', '우주비행사', 4),
+('守', '守', '수', 0),
+('守', '守備', '수비', 0),
+('備', '守備', '수비', 1),
+('守', '守則', '수칙', 0),
+('則', '守則', '수칙', 1),
+('守', '守勢', '수세', 0),
+('勢', '守勢', '수세', 1),
+('守', '守口如甁', '수구여병', 0),
+('口', '守口如甁', '수구여병', 1),
+('如', '守口如甁', '수구여병', 2),
+('甁', '守口如甁', '수구여병', 3),
+('守', '守志', '수지', 0),
+('志', '守志', '수지', 1),
+('守', '守戰', '수전', 0),
+('戰', '守戰', '수전', 1),
+('守', '守護', '수호', 0),
+('護', '守護', '수호', 1),
+('守', '守護天使', '수호천사', 0),
+('護', '守護天使', '수호천사', 1),
+('天', '守護天使', '수호천사', 2),
+('使', '守護天使', '수호천사', 3),
+('守', '守護神', '수호신', 0),
+('護', '守護神', '수호신', 1),
+('神', '守護神', '수호신', 2),
+('守', '守錢奴', '수전노', 0),
+('錢', '守錢奴', '수전노', 1),
+('奴', '守錢奴', '수전노', 2),
+('安', '安住', '안주', 0),
+('住', '安住', '안주', 1),
+('安', '安全', '안전', 0),
+('全', '安全', '안전', 1),
+('安', '安全家屋', '안전가옥', 0),
+('全', '安全家屋', '안전가옥', 1),
+('家', '安全家屋', '안전가옥', 2),
+('屋', '安全家屋', '안전가옥', 3),
+('安', '安全帽', '안전모', 0),
+('全', '安全帽', '안전모', 1),
+('帽', '安全帽', '안전모', 2),
+('安', '安全性', '안전성', 0),
+('全', '安全性', '안전성', 1),
+('性', '安全性', '안전성', 2),
+('安', '安全第一', '안전제일', 0),
+('全', '安全第一', '안전제일', 1),
+('第', '安全第一', '안전제일', 2),
+('一', '安全第一', '안전제일', 3),
+('安', '安南', '안남', 0),
+('南', '安南', '안남', 1),
+('安', '安否', '안부', 0),
+('否', '安否', '안부', 1),
+('安', '安定', '안정', 0),
+('定', '安定', '안정', 1),
+('安', '安定性', '안정성', 0),
+('定', '安定性', '안정성', 1),
+('性', '安定性', '안정성', 2),
+('安', '安家', '안가', 0),
+('家', '安家', '안가', 1),
+('安', '安寧', '안녕', 0),
+('寧', '安寧', '안녕', 1),
+('安', '安州', '안주', 0),
+('州', '安州', '안주', 1),
+('安', '安康', '안강', 0),
+('康', '安康', '안강', 1),
+('安', '安徽', '안휘', 0),
+('徽', '安徽', '안휘', 1),
+('安', '安心', '안심', 0),
+('心', '安心', '안심', 1),
+('安', '安息日', '안식일', 0),
+('息', '安息日', '안식일', 1),
+('日', '安息日', '안식일', 2),
+('安', '安息香', '안식향', 0),
+('息', '安息香', '안식향', 1),
+('香', '安息香', '안식향', 2),
+('安', '安打', '안타', 0),
+('打', '安打', '안타', 1),
+('安', '安排', '안배', 0),
+('排', '安排', '안배', 1),
+('安', '安東', '안동', 0),
+('東', '安東', '안동', 1),
+('安', '安樂', '안락', 0),
+('樂', '安樂', '안락', 1),
+('安', '安樂椅子', '안락의자', 0),
+('樂', '安樂椅子', '안락의자', 1),
+('椅', '安樂椅子', '안락의자', 2),
+('子', '安樂椅子', '안락의자', 3),
+('安', '安樂死', '안락사', 0),
+('樂', '安樂死', '안락사', 1),
+('死', '安樂死', '안락사', 2),
+('安', '安眠', '안면', 0),
+('眠', '安眠', '안면', 1),
+('安', '安般', '안반', 0),
+('般', '安般', '안반', 1),
+('安', '安逸', '안일', 0),
+('逸', '安逸', '안일', 1),
+('安', '安那般那', '안나반나', 0),
+('那', '安那般那', '안나반나', 1),
+('般', '安那般那', '안나반나', 2),
+('那', '安那般那', '안나반나', 3),
+('安', '安靜', '안정', 0),
+('靜', '安靜', '안정', 1),
+('宋', '宋瓷', '송자', 0),
+('瓷', '宋瓷', '송자', 1),
+('完', '完了', '완료', 0),
+('了', '完了', '완료', 1),
+('完', '完備', '완비', 0),
+('備', '完備', '완비', 1),
+('完', '完全', '완전', 0),
+('全', '完全', '완전', 1),
+('完', '完封', '완봉', 0),
+('封', '完封', '완봉', 1),
+('完', '完快', '완쾌', 0),
+('快', '完快', '완쾌', 1),
+('完', '完成', '완성', 0),
+('成', '完成', '완성', 1),
+('完', '完成型', '완성형', 0),
+('成', '完成型', '완성형', 1),
+('型', '完成型', '완성형', 2),
+('完', '完投', '완투', 0),
+('投', '完投', '완투', 1),
+('完', '完璧', '완벽', 0),
+('璧', '完璧', '완벽', 1),
+('完', '完璧主義', '완벽주의', 0),
+('璧', '完璧主義', '완벽주의', 1),
+('主', '完璧主義', '완벽주의', 2),
+('義', '完璧主義', '완벽주의', 3),
+('完', '完走', '완주', 0),
+('走', '完走', '완주', 1),
+('完', '完遂', '완수', 0),
+('遂', '完遂', '완수', 1),
+('宏', '宏壯', '굉장', 0),
+('壯', '宏壯', '굉장', 1),
+('宏', '宏大', '굉대', 0),
+('大', '宏大', '굉대', 1),
+('宗', '宗主', '종주', 0),
+('主', '宗主', '종주', 1),
+('宗', '宗主國', '종주국', 0),
+('主', '宗主國', '종주국', 1),
+('國', '宗主國', '종주국', 2),
+('宗', '宗敎', '종교', 0),
+('敎', '宗敎', '종교', 1),
+('宗', '宗敎的', '종교적', 0),
+('敎', '宗敎的', '종교적', 1),
+('的', '宗敎的', '종교적', 2),
+('宗', '宗教', '종교', 0),
+('教', '宗教', '종교', 1),
+('宗', '宗派', '종파', 0),
+('派', '宗派', '종파', 1),
+('宗', '宗漁', '종어', 0),
+('漁', '宗漁', '종어', 1),
+('官', '官', '관', 0),
+('官', '官僚', '관료', 0),
+('僚', '官僚', '관료', 1),
+('官', '官僚制', '관료제', 0),
+('僚', '官僚制', '관료제', 1),
+('制', '官僚制', '관료제', 2),
+('官', '官兵', '관병', 0),
+('兵', '官兵', '관병', 1),
+('官', '官吏', '관리', 0),
+('吏', '官吏', '관리', 1),
+('官', '官員', '관원', 0),
+('員', '官員', '관원', 1),
+('官', '官廳', '관청', 0),
+('廳', '官廳', '관청', 1),
+('官', '官房學', '관방학', 0),
+('房', '官房學', '관방학', 1),
+('學', '官房學', '관방학', 2),
+('官', '官服', '관복', 0),
+('服', '官服', '관복', 1),
+('官', '官界', '관계', 0),
+('界', '官界', '관계', 1),
+('官', '官能', '관능', 0),
+('能', '官能', '관능', 1),
+('官', '官能美', '관능미', 0),
+('能', '官能美', '관능미', 1),
+('美', '官能美', '관능미', 2),
+('官', '官舍', '관사', 0),
+('舍', '官舍', '관사', 1),
+('官', '官衙', '관아', 0),
+('衙', '官衙', '관아', 1),
+('官', '官話', '관화', 0),
+('話', '官話', '관화', 1),
+('官', '官軍', '관군', 0),
+('軍', '官軍', '관군', 1),
+('定', '定', '정', 0),
+('定', '定住', '정주', 0),
+('住', '定住', '정주', 1),
+('定', '定例', '정례', 0),
+('例', '定例', '정례', 1),
+('定', '定價', '정가', 0),
+('價', '定價', '정가', 1),
+('定', '定冠詞', '정관사', 0),
+('冠', '定冠詞', '정관사', 1),
+('詞', '定冠詞', '정관사', 2),
+('定', '定力', '정력', 0),
+('力', '定力', '정력', 1),
+('定', '定員', '정원', 0),
+('員', '定員', '정원', 1),
+('定', '定在', '정재', 0),
+('在', '定在', '정재', 1),
+('定', '定州', '정주', 0),
+('州', '定州', '정주', 1),
+('定', '定常的', '정상적', 0),
+('常', '定常的', '정상적', 1),
+('的', '定常的', '정상적', 2),
+('定', '定年', '정년', 0),
+('年', '定年', '정년', 1),
+('定', '定式', '정식', 0),
+('式', '定式', '정식', 1),
+('定', '定期', '정기', 0),
+('期', '定期', '정기', 1),
+('定', '定期乘車券', '정기승차권', 0),
+('期', '定期乘車券', '정기승차권', 1),
+('乘', '定期乘車券', '정기승차권', 2),
+('車', '定期乘車券', '정기승차권', 3),
+('券', '定期乘車券', '정기승차권', 4),
+('定', '定期券', '정기권', 0),
+('期', '定期券', '정기권', 1),
+('券', '定期券', '정기권', 2),
+('定', '定期市', '정기시', 0),
+('期', '定期市', '정기시', 1),
+('市', '定期市', '정기시', 2),
+('定', '定植', '정식', 0),
+('植', '定植', '정식', 1),
+('定', '定理', '정리', 0),
+('理', '定理', '정리', 1),
+('定', '定石', '정석', 0),
+('石', '定石', '정석', 1),
+('定', '定積分', '정적분', 0),
+('積', '定積分', '정적분', 1),
+('分', '定積分', '정적분', 2),
+('定', '定立', '정립', 0),
+('立', '定立', '정립', 1),
+('定', '定義', '정의', 0),
+('義', '定義', '정의', 1),
+('定', '定足數', '정족수', 0),
+('足', '定足數', '정족수', 1),
+('數', '定足數', '정족수', 2),
+('定', '定量', '정량', 0),
+('量', '定量', '정량', 1),
+('定', '定額', '정액', 0),
+('額', '定額', '정액', 1),
+('定', '定食', '정식', 0),
+('食', '定食', '정식', 1),
+('宜', '宜昌枳', '의창지', 0),
+('昌', '宜昌枳', '의창지', 1),
+('枳', '宜昌枳', '의창지', 2),
+('客', '客', '객', 0),
+('客', '客人', '객인', 0),
+('人', '客人', '객인', 1),
+('客', '客地', '객지', 0),
+('地', '客地', '객지', 1),
+('客', '客室', '객실', 0),
+('室', '客室', '객실', 1),
+('客', '客家', '객가', 0),
+('家', '客家', '객가', 1),
+('客', '客死', '객사', 0),
+('死', '客死', '객사', 1),
+('客', '客氣', '객기', 0),
+('氣', '客氣', '객기', 1),
+('客', '客舍', '객사', 0),
+('舍', '客舍', '객사', 1),
+('客', '客船', '객선', 0),
+('船', '客船', '객선', 1),
+('客', '客觀', '객관', 0),
+('觀', '客觀', '객관', 1),
+('客', '客觀的', '객관적', 0),
+('觀', '客觀的', '객관적', 1),
+('的', '客觀的', '객관적', 2),
+('客', '客車', '객차', 0),
+('車', '客車', '객차', 1),
+('客', '客體', '객체', 0),
+('體', '客體', '객체', 1),
+('宣', '宣傳', '선전', 0),
+('傳', '宣傳', '선전', 1),
+('宣', '宣告', '선고', 0),
+('告', '宣告', '선고', 1),
+('宣', '宣布', '선포', 0),
+('布', '宣布', '선포', 1),
+('宣', '宣戰', '선전', 0),
+('戰', '宣戰', '선전', 1),
+('宣', '宣揚', '선양', 0),
+('揚', '宣揚', '선양', 1),
+('宣', '宣敎', '선교', 0),
+('敎', '宣敎', '선교', 1),
+('宣', '宣敎師', '선교사', 0),
+('敎', '宣敎師', '선교사', 1),
+('師', '宣敎師', '선교사', 2),
+('宣', '宣暢', '선창', 0),
+('暢', '宣暢', '선창', 1),
+('宣', '宣紙', '선지', 0),
+('紙', '宣紙', '선지', 1),
+('宣', '宣言', '선언', 0),
+('言', '宣言', '선언', 1),
+('宣', '宣誓', '선서', 0),
+('誓', '宣誓', '선서', 1),
+('室', '室內', '실내', 0),
+('內', '室內', '실내', 1),
+('室', '室內服', '실내복', 0),
+('內', '室內服', '실내복', 1),
+('服', '室內服', '실내복', 2),
+('室', '室內樂', '실내악', 0),
+('內', '室內樂', '실내악', 1),
+('樂', '室內樂', '실내악', 2),
+('室', '室內運動', '실내운동', 0),
+('內', '室內運動', '실내운동', 1),
+('運', '室內運動', '실내운동', 2),
+('動', '室內運動', '실내운동', 3),
+('室', '室長', '실장', 0),
+('長', '室長', '실장', 1),
+('宥', '宥和政策', '유화정책', 0),
+('和', '宥和政策', '유화정책', 1),
+('政', '宥和政策', '유화정책', 2),
+('策', '宥和政策', '유화정책', 3),
+('宦', '宦官', '환관', 0),
+('官', '宦官', '환관', 1),
+('宮', '宮', '궁', 0),
+('宮', '宮中', '궁중', 0),
+('中', '宮中', '궁중', 1),
+('宮', '宮人', '궁인', 0),
+('人', '宮人', '궁인', 1),
+('宮', '宮刑', '궁형', 0),
+('刑', '宮刑', '궁형', 1),
+('宮', '宮合', '궁합', 0),
+('合', '宮合', '궁합', 1),
+('宮', '宮城', '궁성', 0),
+('城', '宮城', '궁성', 1),
+('宮', '宮女', '궁녀', 0),
+('女', '宮女', '궁녀', 1),
+('宮', '宮廷', '궁정', 0),
+('廷', '宮廷', '궁정', 1),
+('宮', '宮殿', '궁전', 0),
+('殿', '宮殿', '궁전', 1),
+('宮', '宮闕', '궁궐', 0),
+('闕', '宮闕', '궁궐', 1),
+('宰', '宰相', '재상', 0),
+('相', '宰相', '재상', 1),
+('害', '害', '해', 0),
+('害', '害--', '해롭다', 0),
+('-', '害--', '해롭다', 1),
+('-', '害--', '해롭다', 2),
+('害', '害毒', '해독', 0),
+('毒', '害毒', '해독', 1),
+('害', '害蟲', '해충', 0),
+('蟲', '害蟲', '해충', 1),
+('宴', '宴席', '연석', 0),
+('席', '宴席', '연석', 1),
+('宴', '宴會', '연회', 0),
+('會', '宴會', '연회', 1),
+('家', '家', '가', 0),
+('家', '家事', '가사', 0),
+('事', '家事', '가사', 1),
+('家', '家內工業', '가내공업', 0),
+('內', '家內工業', '가내공업', 1),
+('工', '家內工業', '가내공업', 2),
+('業', '家內工業', '가내공업', 3),
+('家', '家具', '가구', 0),
+('具', '家具', '가구', 1),
+('家', '家出', '가출', 0),
+('出', '家出', '가출', 1),
+('家', '家刻本', '가각본', 0),
+('刻', '家刻本', '가각본', 1),
+('本', '家刻本', '가각본', 2),
+('家', '家勢', '가세', 0),
+('勢', '家勢', '가세', 1),
+('家', '家口', '가구', 0),
+('口', '家口', '가구', 1),
+('家', '家宅  軟', '가택 연금', 0),
+('宅', '家宅  軟', '가택 연금', 1),
+('軟', '家宅  軟', '가택 연금', 4),
+('家', '家寶', '가보', 0),
+('寶', '家寶', '가보', 1),
+('家', '家屋', '가옥', 0),
+('屋', '家屋', '가옥', 1),
+('家', '家庭', '가정', 0),
+('庭', '家庭', '가정', 1),
+('家', '家庭敎師', '가정교사', 0),
+('庭', '家庭敎師', '가정교사', 1),
+('敎', '家庭敎師', '가정교사', 2),
+('師', '家庭敎師', '가정교사', 3),
+('家', '家庭敎育', '가정교육', 0),
+('庭', '家庭敎育', '가정교육', 1),
+('敎', '家庭敎育', '가정교육', 2),
+('育', '家庭敎育', '가정교육', 3),
+('家', '家政', '가정', 0),
+('政', '家政', '가정', 1),
+('家', '家政婦', '가정부', 0),
+('政', '家政婦', '가정부', 1),
+('婦', '家政婦', '가정부', 2),
+('家', '家族', '가족', 0),
+('族', '家族', '가족', 1),
+('家', '家業', '가업', 0),
+('業', '家業', '가업', 1),
+('家', '家畜', '가축', 0),
+('畜', '家畜', '가축', 1),
+('家', '家禽', '가금', 0),
+('禽', '家禽', '가금', 1),
+('家', '家系', '가계', 0),
+('系', '家系', '가계', 1),
+('家', '家臣', '가신', 0),
+('臣', '家臣', '가신', 1),
+('家', '家計', '가계', 0),
+('計', '家計', '가계', 1),
+('家', '家譜', '가보', 0),
+('譜', '家譜', '가보', 1),
+('家', '家財', '가재', 0),
+('財', '家財', '가재', 1),
+('家', '家長', '가장', 0),
+('長', '家長', '가장', 1),
+('家', '家門', '가문', 0),
+('門', '家門', '가문', 1),
+('家', '家閥', '가벌', 0),
+('閥', '家閥', '가벌', 1),
+('宸', '宸翰', '신한', 0),
+('翰', '宸翰', '신한', 1),
+('容', '容器', '용기', 0),
+('器', '容器', '용기', 1),
+('容', '容恕', '용서', 0),
+('恕', '容恕', '용서', 1),
+('容', '容易', '용이', 0),
+('易', '容易', '용이', 1),
+('容', '容疑者', '용의자', 0),
+('疑', '容疑者', '용의자', 1),
+('者', '容疑者', '용의자', 2),
+('容', '容積', '용적', 0),
+('積', '容積', '용적', 1),
+('容', '容貌', '용모', 0),
+('貌', '容貌', '용모', 1),
+('容', '容量', '용량', 0),
+('量', '容量', '용량', 1),
+('宿', '宿命', '숙명', 0),
+('命', '宿命', '숙명', 1),
+('宿', '宿命論', '숙명론', 0),
+('命', '宿命論', '숙명론', 1),
+('論', '宿命論', '숙명론', 2),
+('宿', '宿所', '숙소', 0),
+('所', '宿所', '숙소', 1),
+('宿', '宿泊', '숙박', 0),
+('泊', '宿泊', '숙박', 1),
+('宿', '宿醉', '숙취', 0),
+('醉', '宿醉', '숙취', 1),
+('宿', '宿題', '숙제', 0),
+('題', '宿題', '숙제', 1),
+('宿', '宿食', '숙식', 0),
+('食', '宿食', '숙식', 1),
+('寂', '寂寞', '적막', 0),
+('寞', '寂寞', '적막', 1),
+('寂', '寂然', '적연', 0),
+('然', '寂然', '적연', 1),
+('寂', '寂靜', '적정', 0),
+('靜', '寂靜', '적정', 1),
+('寄', '寄宿舍', '기숙사', 0),
+('宿', '寄宿舍', '기숙사', 1),
+('舍', '寄宿舍', '기숙사', 2),
+('寄', '寄宿舍', '지숙사', 0),
+('宿', '寄宿舍', '지숙사', 1),
+('舍', '寄宿舍', '지숙사', 2),
+('寄', '寄生', '기생', 0),
+('生', '寄生', '기생', 1),
+('寄', '寄生物', '기생물', 0),
+('生', '寄生物', '기생물', 1),
+('物', '寄生物', '기생물', 2),
+('寄', '寄生蟲', '기생충', 0),
+('生', '寄生蟲', '기생충', 1),
+('蟲', '寄生蟲', '기생충', 2),
+('寄', '寄生蟲學', '기생충학', 0),
+('生', '寄生蟲學', '기생충학', 1),
+('蟲', '寄生蟲學', '기생충학', 2),
+('學', '寄生蟲學', '기생충학', 3),
+('寄', '寄與', '기여', 0),
+('與', '寄與', '기여', 1),
+('寄', '寄贈', '기증', 0),
+('贈', '寄贈', '기증', 1),
+('寄', '寄贈者', '기증자', 0),
+('贈', '寄贈者', '기증자', 1),
+('者', '寄贈者', '기증자', 2),
+('寄', '寄附', '기부', 0),
+('附', '寄附', '기부', 1),
+('寄', '寄附金', '기부금', 0),
+('附', '寄附金', '기부금', 1),
+('金', '寄附金', '기부금', 2),
+('密', '密告者', '밀고자', 0),
+('告', '密告者', '밀고자', 1),
+('者', '密告者', '밀고자', 2),
+('密', '密室', '밀실', 0),
+('室', '密室', '밀실', 1),
+('密', '密度', '밀도', 0),
+('度', '密度', '밀도', 1),
+('密', '密接', '밀접', 0),
+('接', '密接', '밀접', 1),
+('密', '密會', '밀회', 0),
+('會', '密會', '밀회', 1),
+('密', '密林', '밀림', 0),
+('林', '密林', '밀림', 1),
+('密', '密獵', '밀렵', 0),
+('獵', '密獵', '밀렵', 1),
+('密', '密獵者', '밀렵자', 0),
+('獵', '密獵者', '밀렵자', 1),
+('者', '密獵者', '밀렵자', 2),
+('密', '密輸', '밀수', 0),
+('輸', '密輸', '밀수', 1),
+('密', '密輸業者', '밀수업자', 0),
+('輸', '密輸業者', '밀수업자', 1),
+('業', '密輸業者', '밀수업자', 2),
+('者', '密輸業者', '밀수업자', 3),
+('密', '密通', '밀통', 0),
+('通', '密通', '밀통', 1),
+('密', '密陀僧', '밀타승', 0),
+('陀', '密陀僧', '밀타승', 1),
+('僧', '密陀僧', '밀타승', 2),
+('密', '密魚', '밀어', 0),
+('魚', '密魚', '밀어', 1),
+('富', '富', '부', 0),
+('富', '富商', '부상', 0),
+('商', '富商', '부상', 1),
+('富', '富者', '부자', 0),
+('者', '富者', '부자', 1),
+('富', '富者', '부재', 0),
+('者', '富者', '부재', 1),
+('富', '富者-', '부잣집', 0),
+('者', '富者-', '부잣집', 1),
+('-', '富者-', '부잣집', 2),
+('富', '富裕', '부유', 0),
+('裕', '富裕', '부유', 1),
+('富', '富貴', '부귀', 0),
+('貴', '富貴', '부귀', 1),
+('富', '富貴榮華', '부귀영화', 0),
+('貴', '富貴榮華', '부귀영화', 1),
+('榮', '富貴榮華', '부귀영화', 2),
+('華', '富貴榮華', '부귀영화', 3),
+('富', '富農', '부농', 0),
+('農', '富農', '부농', 1),
+('寒', '寒心', '한심', 0),
+('心', '寒心', '한심', 1),
+('寒', '寒氣', '한기', 0),
+('氣', '寒氣', '한기', 1),
+('寒', '寒波', '한파', 0),
+('波', '寒波', '한파', 1),
+('寒', '寒流', '한류', 0),
+('流', '寒流', '한류', 1),
+('寒', '寒熱', '한열', 0),
+('熱', '寒熱', '한열', 1),
+('寓', '寓言', '우언', 0),
+('言', '寓言', '우언', 1),
+('寓', '寓話', '우화', 0),
+('話', '寓話', '우화', 1),
+('寡', '寡婦', '과부', 0),
+('婦', '寡婦', '과부', 1),
+('寡', '寡居', '과거', 0),
+('居', '寡居', '과거', 1),
+('寡', '寡言', '과언', 0),
+('言', '寡言', '과언', 1),
+('寡', '寡頭', '과두', 0),
+('頭', '寡頭', '과두', 1),
+('寡', '寡頭制', '과두제', 0),
+('頭', '寡頭制', '과두제', 1),
+('制', '寡頭制', '과두제', 2),
+('寢', '寢具', '침구', 0),
+('具', '寢具', '침구', 1),
+('寢', '寢囊', '침낭', 0),
+('囊', '寢囊', '침낭', 1),
+('寢', '寢室', '침실', 0),
+('室', '寢室', '침실', 1),
+('寢', '寢臺', '침대', 0),
+('臺', '寢臺', '침대', 1),
+('寢', '寢臺房', '침대방', 0),
+('臺', '寢臺房', '침대방', 1),
+('房', '寢臺房', '침대방', 2),
+('實', '實-', '실로', 0),
+('-', '實-', '실로', 1),
+('實', '實-', '실은', 0),
+('-', '實-', '실은', 1),
+('實', '實例', '실례', 0),
+('例', '實例', '실례', 1),
+('實', '實像', '실상', 0),
+('像', '實像', '실상', 1),
+('實', '實力', '실력', 0),
+('力', '實力', '실력', 1),
+('實', '實名', '실명', 0),
+('名', '實名', '실명', 1),
+('實', '實在', '실재', 0),
+('在', '實在', '실재', 1),
+('實', '實存主義', '실존주의', 0),
+('存', '實存主義', '실존주의', 1),
+('主', '實存主義', '실존주의', 2),
+('義', '實存主義', '실존주의', 3),
+('實', '實彈', '실탄', 0),
+('彈', '實彈', '실탄', 1),
+('實', '實情', '실정', 0),
+('情', '實情', '실정', 1),
+('實', '實感', '실감', 0),
+('感', '實感', '실감', 1),
+('實', '實態', '실태', 0),
+('態', '實態', '실태', 1),
+('實', '實數', '실수', 0),
+('數', '實數', '실수', 1),
+('實', '實施', '실시', 0),
+('施', '實施', '실시', 1),
+('實', '實業', '실업', 0),
+('業', '實業', '실업', 1),
+('實', '實業家', '실업가', 0),
+('業', '實業家', '실업가', 1),
+('家', '實業家', '실업가', 2),
+('實', '實況', '실황', 0),
+('況', '實況', '실황', 1),
+('實', '實現', '실현', 0),
+('現', '實現', '실현', 1),
+('實', '實用', '실용', 0),
+('用', '實用', '실용', 1),
+('實', '實社會', '실사회', 0),
+('社', '實社會', '실사회', 1),
+('會', '實社會', '실사회', 2),
+('實', '實績', '실적', 0),
+('績', '實績', '실적', 1),
+('實', '實習', '실습', 0),
+('習', '實習', '실습', 1),
+('實', '實習生', '실습생', 0),
+('習', '實習生', '실습생', 1),
+('生', '實習生', '실습생', 2),
+('實', '實行', '실행', 0),
+('行', '實行', '실행', 1),
+('實', '實裝', '실장', 0),
+('裝', '實裝', '실장', 1),
+('實', '實話', '실화', 0),
+('話', '實話', '실화', 1),
+('實', '實質', '실질', 0),
+('質', '實質', '실질', 1),
+('實', '實質的', '실질적', 0),
+('質', '實質的', '실질적', 1),
+('的', '實質的', '실질적', 2),
+('實', '實踐', '실천', 0),
+('踐', '實踐', '실천', 1),
+('實', '實錄', '실록', 0),
+('錄', '實錄', '실록', 1),
+('實', '實際', '실제', 0),
+('際', '實際', '실제', 1),
+('實', '實際-', '실제로', 0),
+('際', '實際-', '실제로', 1),
+('-', '實際-', '실제로', 2),
+('實', '實驗', '실험', 0),
+('驗', '實驗', '실험', 1),
+('實', '實驗室', '실험실', 0),
+('驗', '實驗室', '실험실', 1),
+('室', '實驗室', '실험실', 2),
+('實', '實體', '실재', 0),
+('體', '實體', '실재', 1),
+('實', '實體', '실체', 0),
+('體', '實體', '실체', 1),
+('寧', '寧', '녕', 0),
+('寧', '寧夏', '영하', 0),
+('夏', '寧夏', '영하', 1),
+('審', '審判', '심판', 0),
+('判', '審判', '심판', 1),
+('審', '審問', '심문', 0),
+('問', '審問', '심문', 1),
+('審', '審査', '심사', 0),
+('査', '審査', '심사', 1),
+('審', '審理', '심리', 0),
+('理', '審理', '심리', 1),
+('審', '審美的', '심미적', 0),
+('美', '審美的', '심미적', 1),
+('的', '審美的', '심미적', 2),
+('審', '審美眼', '심미안', 0),
+('美', '審美眼', '심미안', 1),
+('眼', '審美眼', '심미안', 2),
+('審', '審議', '심의', 0),
+('議', '審議', '심의', 1),
+('寫', '寫本', '사본', 0),
+('本', '寫本', '사본', 1),
+('寫', '寫生', '사생', 0),
+('生', '寫生', '사생', 1),
+('寫', '寫眞', '사진', 0),
+('眞', '寫眞', '사진', 1),
+('寫', '寫眞帖', '사진첩', 0),
+('眞', '寫眞帖', '사진첩', 1),
+('帖', '寫眞帖', '사진첩', 2),
+('寫', '寫眞師', '사진사', 0),
+('眞', '寫眞師', '사진사', 1),
+('師', '寫眞師', '사진사', 2),
+('寫', '寫眞機', '사진기', 0),
+('眞', '寫眞機', '사진기', 1),
+('機', '寫眞機', '사진기', 2),
+('寫', '寫眞術', '사진술', 0),
+('眞', '寫眞術', '사진술', 1),
+('術', '寫眞術', '사진술', 2),
+('寬', '寬容', '관용', 0),
+('容', '寬容', '관용', 1),
+('寬', '寬解', '관해', 0),
+('解', '寬解', '관해', 1),
+('寵', '寵臣', '총신', 0),
+('臣', '寵臣', '총신', 1),
+('寶', '寶劍仙人掌', '보검선인장', 0),
+('劍', '寶劍仙人掌', '보검선인장', 1),
+('仙', '寶劍仙人掌', '보검선인장', 2),
+('人', '寶劍仙人掌', '보검선인장', 3),
+('掌', '寶劍仙人掌', '보검선인장', 4),
+('寶', '寶塔', '보탑', 0),
+('塔', '寶塔', '보탑', 1),
+('寶', '寶庫', '보고', 0),
+('庫', '寶庫', '보고', 1),
+('寶', '寶物', '보물', 0),
+('物', '寶物', '보물', 1),
+('寶', '寶石', '보석', 0),
+('石', '寶石', '보석', 1),
+('寶', '寶石商', '보석상', 0),
+('石', '寶石商', '보석상', 1),
+('商', '寶石商', '보석상', 2),
+('寸', '寸', '촌', 0),
+('寸', '寸劇', '촌극', 0),
+('劇', '寸劇', '촌극', 1),
+('寺', '寺內', '사내', 0),
+('內', '寺內', '사내', 1),
+('寺', '寺刹', '사찰', 0),
+('刹', '寺刹', '사찰', 1),
+('寺', '寺院', '사원', 0),
+('院', '寺院', '사원', 1),
+('封', '封土', '봉토', 0),
+('土', '封土', '봉토', 1),
+('封', '封墳', '봉분', 0),
+('墳', '封墳', '봉분', 1),
+('封', '封套', '봉투', 0),
+('套', '封套', '봉투', 1),
+('封', '封建', '봉건', 0),
+('建', '封建', '봉건', 1),
+('封', '封建制度', '봉건제도', 0),
+('建', '封建制度', '봉건제도', 1),
+('制', '封建制度', '봉건제도', 2),
+('度', '封建制度', '봉건제도', 3),
+('封', '封紙', '봉지', 0),
+('紙', '封紙', '봉지', 1),
+('封', '封蠟', '봉랍', 0),
+('蠟', '封蠟', '봉랍', 1),
+('封', '封鎖', '봉쇄', 0),
+('鎖', '封鎖', '봉쇄', 1),
+('射', '射侯', '사후', 0),
+('侯', '射侯', '사후', 1),
+('射', '射倖', '사행', 0),
+('倖', '射倖', '사행', 1),
+('射', '射倖産業', '사행산업', 0),
+('倖', '射倖産業', '사행산업', 1),
+('産', '射倖産業', '사행산업', 2),
+('業', '射倖産業', '사행산업', 3),
+('射', '射出', '사출', 0),
+('出', '射出', '사출', 1),
+('射', '射創', '사창', 0),
+('創', '射創', '사창', 1),
+('射', '射席', '사석', 0),
+('席', '射席', '사석', 1),
+('射', '射手', '사수', 0),
+('手', '射手', '사수', 1),
+('射', '射擊', '사격', 0),
+('擊', '射擊', '사격', 1),
+('射', '射擊場', '사격장', 0),
+('擊', '射擊場', '사격장', 1),
+('場', '射擊場', '사격장', 2),
+('射', '射的', '사적', 0),
+('的', '射的', '사적', 1),
+('射', '射精', '사정', 0),
+('精', '射精', '사정', 1),
+('將', '將來', '장래', 0),
+('來', '將來', '장래', 1),
+('將', '將兵', '장병', 0),
+('兵', '將兵', '장병', 1),
+('將', '將帥', '장수', 0),
+('帥', '將帥', '장수', 1),
+('將', '將校', '장교', 0),
+('校', '將校', '장교', 1),
+('將', '將棋', '장기', 0),
+('棋', '將棋', '장기', 1),
+('將', '將次', '장차', 0),
+('次', '將次', '장차', 1),
+('將', '將軍', '장군', 0),
+('軍', '將軍', '장군', 1),
+('將', '將軍石', '장군석', 0),
+('軍', '將軍石', '장군석', 1),
+('石', '將軍石', '장군석', 2),
+('專', '專制', '전제', 0),
+('制', '專制', '전제', 1),
+('專', '專務理事', '전무이사', 0),
+('務', '專務理事', '전무이사', 1),
+('理', '專務理事', '전무이사', 2),
+('事', '專務理事', '전무이사', 3),
+('專', '專攻', '전공', 0),
+('攻', '專攻', '전공', 1),
+('專', '專斷', '전단', 0),
+('斷', '專斷', '전단', 1),
+('專', '專業', '전업', 0),
+('業', '專業', '전업', 1),
+('專', '專用', '전용', 0),
+('用', '專用', '전용', 1),
+('專', '專賣', '전매', 0),
+('賣', '專賣', '전매', 1),
+('專', '專門', '전문', 0),
+('門', '專門', '전문', 1),
+('專', '專門化', '전문화', 0),
+('門', '專門化', '전문화', 1),
+('化', '專門化', '전문화', 2),
+('專', '專門家', '전문가', 0),
+('門', '專門家', '전문가', 1),
+('家', '專門家', '전문가', 2),
+('專', '專門店', '전문점', 0),
+('門', '專門店', '전문점', 1),
+('店', '專門店', '전문점', 2),
+('專', '專門職', '전문직', 0),
+('門', '專門職', '전문직', 1),
+('職', '專門職', '전문직', 2),
+('尉', '尉官', '위관', 0),
+('官', '尉官', '위관', 1),
+('尊', '尊卑', '존비', 0),
+('卑', '尊卑', '존비', 1),
+('尊', '尊嚴', '존엄', 0),
+('嚴', '尊嚴', '존엄', 1),
+('尊', '尊嚴死', '존엄사', 0),
+('嚴', '尊嚴死', '존엄사', 1),
+('死', '尊嚴死', '존엄사', 2),
+('尊', '尊待-', '존댓말', 0),
+('待', '尊待-', '존댓말', 1),
+('-', '尊待-', '존댓말', 2),
+('尊', '尊敬', '존경', 0),
+('敬', '尊敬', '존경', 1),
+('尊', '尊號', '존호', 0),
+('號', '尊號', '존호', 1),
+('尊', '尊重', '존중', 0),
+('重', '尊重', '존중', 1),
+('尋', '尋常', '심상', 0),
+('常', '尋常', '심상', 1),
+('尋', '尋常小學校', '심상소학교', 0),
+('常', '尋常小學校', '심상소학교', 1),
+('小', '尋常小學校', '심상소학교', 2),
+('學', '尋常小學校', '심상소학교', 3),
+('校', '尋常小學校', '심상소학교', 4),
+('對', '對', '대', 0),
+('對', '對位法', '대위법', 0),
+('位', '對位法', '대위법', 1),
+('法', '對位法', '대위법', 2),
+('對', '對偶', '대우', 0),
+('偶', '對偶', '대우', 1),
+('對', '對備', '대비', 0),
+('備', '對備', '대비', 1),
+('對', '對價', '대가', 0),
+('價', '對價', '대가', 1),
+('對', '對外秘', '대외비', 0),
+('外', '對外秘', '대외비', 1),
+('秘', '對外秘', '대외비', 2),
+('對', '對外貿易', '대외무역', 0),
+('外', '對外貿易', '대외무역', 1),
+('貿', '對外貿易', '대외무역', 2),
+('易', '對外貿易', '대외무역', 3),
+('對', '對客', '대객', 0),
+('客', '對客', '대객', 1),
+('對', '對岸', '대안', 0),
+('岸', '對岸', '대안', 1),
+('對', '對峙', '대치', 0),
+('峙', '對峙', '대치', 1),
+('對', '對應', '대응', 0),
+('應', '對應', '대응', 1),
+('對', '對戰車砲', '대전차포', 0),
+('戰', '對戰車砲', '대전차포', 1),
+('車', '對戰車砲', '대전차포', 2),
+('砲', '對戰車砲', '대전차포', 3),
+('對', '對抗', '대항', 0),
+('抗', '對抗', '대항', 1),
+('對', '對數', '대수', 0),
+('數', '對數', '대수', 1),
+('對', '對格', '대격', 0),
+('格', '對格', '대격', 1),
+('對', '對決', '대결', 0),
+('決', '對決', '대결', 1),
+('對', '對流', '대류', 0),
+('流', '對流', '대류', 1),
+('對', '對照', '대조', 0),
+('照', '對照', '대조', 1),
+('對', '對症', '대증', 0),
+('症', '對症', '대증', 1),
+('對', '對症 藥劑', '대증 약제', 0),
+('症', '對症 藥劑', '대증 약제', 1),
+('藥', '對症 藥劑', '대증 약제', 3),
+('劑', '對症 藥劑', '대증 약제', 4),
+('對', '對稱軸', '대칭축', 0),
+('稱', '對稱軸', '대칭축', 1),
+('軸', '對稱軸', '대칭축', 2),
+('對', '對立', '대립', 0),
+('立', '對立', '대립', 1),
+('對', '對答', '대답', 0),
+('答', '對答', '대답', 1),
+('對', '對策', '대책', 0),
+('策', '對策', '대책', 1),
+('對', '對聯', '대련', 0),
+('聯', '對聯', '대련', 1),
+('對', '對處', '대처', 0),
+('處', '對處', '대처', 1),
+('對', '對角', '대각', 0),
+('角', '對角', '대각', 1),
+('對', '對話', '대화', 0),
+('話', '對話', '대화', 1),
+('對', '對話房', '대화방', 0),
+('話', '對話房', '대화방', 1),
+('房', '對話房', '대화방', 2),
+('對', '對話者', '대화자', 0),
+('話', '對話者', '대화자', 1),
+('者', '對話者', '대화자', 2),
+('對', '對談', '대담', 0),
+('談', '對談', '대담', 1),
+('對', '對譯本', '대역본', 0),
+('譯', '對譯本', '대역본', 1),
+('本', '對譯本', '대역본', 2),
+('對', '對象', '대상', 0),
+('象', '對象', '대상', 1),
+('對', '對象者', '대상자', 0),
+('象', '對象者', '대상자', 1),
+('者', '對象者', '대상자', 2),
+('對', '對蹠的', '대척적', 0),
+('蹠', '對蹠的', '대척적', 1),
+('的', '對蹠的', '대척적', 2),
+('對', '對靈', '대령', 0),
+('靈', '對靈', '대령', 1),
+('導', '導入', '도입', 0),
+('入', '導入', '도입', 1),
+('導', '導入部', '도입부', 0),
+('入', '導入部', '도입부', 1),
+('部', '導入部', '도입부', 2),
+('導', '導師', '도사', 0),
+('師', '導師', '도사', 1),
+('導', '導火線', '도화선', 0),
+('火', '導火線', '도화선', 1),
+('線', '導火線', '도화선', 2),
+('導', '導管', '도관', 0),
+('管', '導管', '도관', 1),
+('導', '導體', '도체', 0),
+('體', '導體', '도체', 1),
+('小', '小', '소', 0),
+('小', '小中華', '소중화', 0),
+('中', '小中華', '소중화', 1),
+('華', '小中華', '소중화', 2),
+('小', '小人', '소인', 0),
+('人', '小人', '소인', 1),
+('小', '小便', '소변', 0),
+('便', '小便', '소변', 1),
+('小', '小便檢査', '소변검사', 0),
+('便', '小便檢査', '소변검사', 1),
+('檢', '小便檢査', '소변검사', 2),
+('査', '小便檢査', '소변검사', 3),
+('小', '小兒', '소아', 0),
+('兒', '小兒', '소아', 1),
+('小', '小兒科', '소아과', 0),
+('兒', '小兒科', '소아과', 1),
+('科', '小兒科', '소아과', 2),
+('小', '小冊子', '소책자', 0),
+('冊', '小冊子', '소책자', 1),
+('子', '小冊子', '소책자', 2),
+('小', '小包', '소포', 0),
+('包', '小包', '소포', 1),
+('小', '小品', '소품', 0),
+('品', '小品', '소품', 1),
+('小', '小園', '소원', 0),
+('園', '小園', '소원', 1),
+('小', '小型', '소형', 0),
+('型', '小型', '소형', 1),
+('小', '小字', '소자', 0),
+('字', '小字', '소자', 1),
+('小', '小學校', '소학교', 0),
+('學', '小學校', '소학교', 1),
+('校', '小學校', '소학교', 2),
+('小', '小學生', '소학생', 0),
+('學', '小學生', '소학생', 1),
+('生', '小學生', '소학생', 2),
+('小', '小宇宙', '소우주', 0),
+('宇', '小宇宙', '소우주', 1),
+('宙', '小宇宙', '소우주', 2),
+('小', '小屋', '소옥', 0),
+('屋', '小屋', '소옥', 1),
+('小', '小帶', '소대', 0),
+('帶', '小帶', '소대', 1),
+('小', '小房', '소방', 0),
+('房', '小房', '소방', 1),
+('小', '小數', '소수', 0),
+('數', '小數', '소수', 1),
+('小', '小文字', '소문자', 0),
+('文', '小文字', '소문자', 1),
+('字', '小文字', '소문자', 2),
+('小', '小曲', '소곡', 0),
+('曲', '小曲', '소곡', 1),
+('小', '小潮', '소조', 0),
+('潮', '小潮', '소조', 1),
+('小', '小盤', '소반', 0),
+('盤', '小盤', '소반', 1),
+('小', '小確幸', '소확행', 0),
+('確', '小確幸', '소확행', 1),
+('幸', '小確幸', '소확행', 2),
+('小', '小腦', '소뇌', 0),
+('腦', '小腦', '소뇌', 1),
+('小', '小腸', '소장', 0),
+('腸', '小腸', '소장', 1),
+('小', '小螺', '소라', 0),
+('螺', '小螺', '소라', 1),
+('小', '小行星', '소행성', 0),
+('行', '小行星', '소행성', 1),
+('星', '小行星', '소행성', 2),
+('小', '小規模', '소규모', 0),
+('規', '小規模', '소규모', 1),
+('模', '小規模', '소규모', 2),
+('小', '小計', '소계', 0),
+('計', '小計', '소계', 1),
+('小', '小說', '소설', 0),
+('說', '小說', '소설', 1),
+('小', '小說册', '소설책', 0),
+('說', '小說册', '소설책', 1),
+('册', '小說册', '소설책', 2),
+('小', '小說家', '소설가', 0),
+('說', '小說家', '소설가', 1),
+('家', '小說家', '소설가', 2),
+('小', '小豆', '소두', 0),
+('豆', '小豆', '소두', 1),
+('小', '小賣', '소매', 0),
+('賣', '小賣', '소매', 1),
+('小', '小賣店', '소매점', 0),
+('賣', '小賣店', '소매점', 1),
+('店', '小賣店', '소매점', 2),
+('小', '小農', '소농', 0),
+('農', '小農', '소농', 1),
+('小', '小道具', '소도구', 0),
+('道', '小道具', '소도구', 1),
+('具', '小道具', '소도구', 2),
+('小', '小針', '소침', 0),
+('針', '小針', '소침', 1),
+('小', '小銃', '소총', 0),
+('銃', '小銃', '소총', 1),
+('小', '小陰脣', '소음순', 0),
+('陰', '小陰脣', '소음순', 1),
+('脣', '小陰脣', '소음순', 2),
+('小', '小隊', '소대', 0),
+('隊', '小隊', '소대', 1),
+('小', '小雪', '소설', 0),
+('雪', '小雪', '소설', 1),
+('小', '小麥', '소맥', 0),
+('麥', '小麥', '소맥', 1),
+('少', '少佐', '소좌', 0),
+('佐', '少佐', '소좌', 1),
+('少', '少女', '소녀', 0),
+('女', '少女', '소녀', 1),
+('少', '少將', '소장', 0),
+('將', '少將', '소장', 1),
+('少', '少尉', '소위', 0),
+('尉', '少尉', '소위', 1),
+('少', '少年', '소년', 0),
+('年', '少年', '소년', 1),
+('少', '少年宮殿', '소년궁전', 0),
+('年', '少年宮殿', '소년궁전', 1),
+('宮', '少年宮殿', '소년궁전', 2),
+('殿', '少年宮殿', '소년궁전', 3),
+('少', '少數', '소수', 0),
+('數', '少數', '소수', 1),
+('少', '少數民族', '소수민족', 0),
+('數', '少數民族', '소수민족', 1),
+('民', '少數民族', '소수민족', 2),
+('族', '少數民族', '소수민족', 3),
+('少', '少領', '소령', 0),
+('領', '少領', '소령', 1),
+('尖', '尖端', '첨단', 0),
+('端', '尖端', '첨단', 1),
+('尖', '尖銳化', '첨예화', 0),
+('銳', '尖銳化', '첨예화', 1),
+('化', '尖銳化', '첨예화', 2),
+('尖', '尖鼠', '첨서', 0),
+('鼠', '尖鼠', '첨서', 1),
+('尤', '尤度', '우도', 0),
+('度', '尤度', '우도', 1),
+('就', '就任', '취임', 0),
+('任', '就任', '취임', 1),
+('就', '就業', '취업', 0),
+('業', '就業', '취업', 1),
+('就', '就職', '취직', 0),
+('職', '就職', '취직', 1),
+('尹', '尹', '윤', 0),
+('尺', '尺度', '척도', 0),
+('度', '尺度', '척도', 1),
+('尼', '尼僧', '이승', 0),
+('僧', '尼僧', '이승', 1),
+('尾', '尾宿', '미수', 0),
+('宿', '尾宿', '미수', 1),
+('尾', '尾羽', '미우', 0),
+('羽', '尾羽', '미우', 1),
+('尾', '尾聯', '미련', 0),
+('聯', '尾聯', '미련', 1),
+('尾', '尾行', '미행', 0),
+('行', '尾行', '미행', 1),
+('尾', '尾行者', '미행자', 0),
+('行', '尾行者', '미행자', 1),
+('者', '尾行者', '미행자', 2),
+('尿', '尿', '뇨', 0),
+('尿', '尿', '요', 0),
+('尿', '尿意', '요의', 0),
+('意', '尿意', '요의', 1),
+('尿', '尿砂', '요사', 0),
+('砂', '尿砂', '요사', 1),
+('尿', '尿管', '요관', 0),
+('管', '尿管', '요관', 1),
+('尿', '尿素', '뇨소', 0),
+('素', '尿素', '뇨소', 1),
+('尿', '尿素', '요소', 0),
+('素', '尿素', '요소', 1),
+('尿', '尿道', '뇨도', 0),
+('道', '尿道', '뇨도', 1),
+('尿', '尿道', '요도', 0),
+('道', '尿道', '요도', 1),
+('局', '局外者', '국외자', 0),
+('外', '局外者', '국외자', 1),
+('者', '局外者', '국외자', 2),
+('局', '局番', '국번', 0),
+('番', '局番', '국번', 1),
+('局', '局限', '국한', 0),
+('限', '局限', '국한', 1),
+('局', '局面', '국면', 0),
+('面', '局面', '국면', 1),
+('居', '居住', '거주', 0),
+('住', '居住', '거주', 1),
+('居', '居住地', '거주지', 0),
+('住', '居住地', '거주지', 1),
+('地', '居住地', '거주지', 2),
+('居', '居住性', '거주성', 0),
+('住', '居住性', '거주성', 1),
+('性', '居住性', '거주성', 2),
+('居', '居住者', '거주자', 0),
+('住', '居住者', '거주자', 1),
+('者', '居住者', '거주자', 2),
+('居', '居室', '거실', 0),
+('室', '居室', '거실', 1),
+('居', '居留', '거류', 0),
+('留', '居留', '거류', 1),
+('居', '居西干', '거서간', 0),
+('西', '居西干', '거서간', 1),
+('干', '居西干', '거서간', 2),
+('居', '居間', '거간', 0),
+('間', '居間', '거간', 1),
+('屈', '屈光性', '굴광성', 0),
+('光', '屈光性', '굴광성', 1),
+('性', '屈光性', '굴광성', 2),
+('屈', '屈地性', '굴지성', 0),
+('地', '屈地性', '굴지성', 1),
+('性', '屈地性', '굴지성', 2),
+('屈', '屈從', '굴종', 0),
+('從', '屈從', '굴종', 1),
+('屈', '屈折', '굴절', 0),
+('折', '屈折', '굴절', 1),
+('屈', '屈曲位', '굴곡위', 0),
+('曲', '屈曲位', '굴곡위', 1),
+('位', '屈曲位', '굴곡위', 2),
+('屈', '屈辱', '굴욕', 0),
+('辱', '屈辱', '굴욕', 1),
+('屈', '屈辱感', '굴욕감', 0),
+('辱', '屈辱感', '굴욕감', 1),
+('感', '屈辱感', '굴욕감', 2),
+('屋', '屋上', '옥상', 0),
+('上', '屋上', '옥상', 1),
+('屋', '屋內', '옥내', 0),
+('內', '屋內', '옥내', 1),
+('屋', '屋塔', '옥탑', 0),
+('塔', '屋塔', '옥탑', 1),
+('屍', '屍姦', '시간', 0),
+('姦', '屍姦', '시간', 1),
+('屍', '屍諫', '시간', 0),
+('諫', '屍諫', '시간', 1),
+('屍', '屍身', '시신', 0),
+('身', '屍身', '시신', 1),
+('屍', '屍體', '시체', 0),
+('體', '屍體', '시체', 1),
+('屍', '屍體公示所', '시체공시소', 0),
+('體', '屍體公示所', '시체공시소', 1),
+('公', '屍體公示所', '시체공시소', 2),
+('示', '屍體公示所', '시체공시소', 3),
+('所', '屍體公示所', '시체공시소', 4),
+('展', '展性', '전성', 0),
+('性', '展性', '전성', 1),
+('展', '展望', '전망', 0),
+('望', '展望', '전망', 1),
+('展', '展示', '전시', 0),
+('示', '展示', '전시', 1),
+('展', '展示場', '전시장', 0),
+('示', '展示場', '전시장', 1),
+('場', '展示場', '전시장', 2),
+('展', '展示會', '전시회', 0),
+('示', '展示會', '전시회', 1),
+('會', '展示會', '전시회', 2),
+('展', '展覽會', '전람회', 0),
+('覽', '展覽會', '전람회', 1),
+('會', '展覽會', '전람회', 2),
+('展', '展開', '전개', 0),
+('開', '展開', '전개', 1),
+('屛', '屛風', '병풍', 0),
+('風', '屛風', '병풍', 1),
+('屠', '屠宰', '도재', 0),
+('宰', '屠宰', '도재', 1),
+('屠', '屠戮', '도륙', 0),
+('戮', '屠戮', '도륙', 1),
+('屠', '屠殺', '도살', 0),
+('殺', '屠殺', '도살', 1),
+('屠', '屠殺場', '도살장', 0),
+('殺', '屠殺場', '도살장', 1),
+('場', '屠殺場', '도살장', 2),
+('層', '層', '층', 0),
+('層', '層積雲', '층적운', 0),
+('積', '層積雲', '층적운', 1),
+('雲', '層積雲', '층적운', 2),
+('層', '層階', '층계', 0),
+('階', '層階', '층계', 1),
+('層', '層階站', '층계참', 0),
+('階', '層階站', '층계참', 1),
+('站', '層階站', '층계참', 2),
+('層', '層雲', '층운', 0),
+('雲', '層雲', '층운', 1),
+('履', '履歷書', '이력서', 0),
+('歷', '履歷書', '이력서', 1),
+('書', '履歷書', '이력서', 2),
+('履', '履祚', '이조', 0),
+('祚', '履祚', '이조', 1),
+('履', '履行', '이행', 0),
+('行', '履行', '이행', 1),
+('屬', '屬', '속', 0),
+('屬', '屬國', '속국', 0),
+('國', '屬國', '속국', 1),
+('屬', '屬性', '속성', 0),
+('性', '屬性', '속성', 1),
+('屬', '屬領', '속령', 0),
+('領', '屬領', '속령', 1),
+('山', '山', '산', 0),
+('山', '山-', '산길', 0),
+('-', '山-', '산길', 1),
+('山', '山-', '산속', 0),
+('-', '山-', '산속', 1),
+('山', '山主人', '산주인', 0),
+('主', '山主人', '산주인', 1),
+('人', '山主人', '산주인', 2),
+('山', '山城', '산성', 0),
+('城', '山城', '산성', 1),
+('山', '山峽', '산협', 0),
+('峽', '山峽', '산협', 1),
+('山', '山川', '산천', 0),
+('川', '山川', '산천', 1),
+('山', '山所', '산소', 0),
+('所', '山所', '산소', 1),
+('山', '山有花', '산유화', 0),
+('有', '山有花', '산유화', 1),
+('花', '山有花', '산유화', 2),
+('山', '山東', '산동', 0),
+('東', '山東', '산동', 1),
+('山', '山棠花', '산당화', 0),
+('棠', '山棠花', '산당화', 1),
+('花', '山棠花', '산당화', 2),
+('山', '山椒', '산초', 0),
+('椒', '山椒', '산초', 1),
+('山', '山椒‒ ', '산초나무', 0),
+('椒', '山椒‒ ', '산초나무', 1),
+('‒', '山椒‒ ', '산초나무', 2),
+('山', '山水', '산수', 0),
+('水', '山水', '산수', 1),
+('山', '山沙汰', '산사태', 0),
+('沙', '山沙汰', '산사태', 1),
+('汰', '山沙汰', '산사태', 2),
+('山', '山海關', '산해관', 0),
+('海', '山海關', '산해관', 1),
+('關', '山海關', '산해관', 2),
+('山', '山火', '산화', 0),
+('火', '山火', '산화', 1),
+('山', '山田', '산전', 0),
+('田', '山田', '산전', 1),
+('山', '山神', '산신', 0),
+('神', '山神', '산신', 1),
+('山', '山神閣', '산신각', 0),
+('神', '山神閣', '산신각', 1),
+('閣', '山神閣', '산신각', 2),
+('山', '山神靈', '산신령', 0),
+('神', '山神靈', '산신령', 1),
+('靈', '山神靈', '산신령', 2),
+('山', '山積', '산적', 0),
+('積', '山積', '산적', 1),
+('山', '山系', '산계', 0),
+('系', '山系', '산계', 1),
+('山', '山羊', '산양', 0),
+('羊', '山羊', '산양', 1),
+('山', '山脈', '산맥', 0),
+('脈', '山脈', '산맥', 1),
+('山', '山花', '산화', 0),
+('花', '山花', '산화', 1),
+('山', '山莊', '산장', 0),
+('莊', '山莊', '산장', 1),
+('山', '山菜', '산채', 0),
+('菜', '山菜', '산채', 1),
+('山', '山西', '산서', 0),
+('西', '山西', '산서', 1),
+('山', '山谷', '산곡', 0),
+('谷', '山谷', '산곡', 1),
+('山', '山賊', '산적', 0),
+('賊', '山賊', '산적', 1),
+('山', '山門', '산문', 0),
+('門', '山門', '산문', 1),
+('山', '山頂', '산정', 0),
+('頂', '山頂', '산정', 1),
+('山', '山불', '산불', 0),
+('불', '山불', '산불', 1),
+('山', '山토끼', '산토끼', 0),
+('토', '山토끼', '산토끼', 1),
+('끼', '山토끼', '산토끼', 2),
+('岩', '岩床', '암상', 0),
+('床', '岩床', '암상', 1),
+('岩', '岩石', '암석', 0),
+('石', '岩石', '암석', 1),
+('岸', '岸畔', '안반', 0),
+('畔', '岸畔', '안반', 1),
+('峨', '峨峨', '아아', 0),
+('峨', '峨峨', '아아', 1),
+('島', '島司', '도사', 0),
+('司', '島司', '도사', 1),
+('島', '島國', '도국', 0),
+('國', '島國', '도국', 1),
+('島', '島夷', '도이', 0),
+('夷', '島夷', '도이', 1),
+('島', '島嶼', '도서', 0),
+('嶼', '島嶼', '도서', 1),
+('島', '島配', '도배', 0),
+('配', '島配', '도배', 1),
+('峽', '峽灣', '협만', 0),
+('灣', '峽灣', '협만', 1),
+('峽', '峽谷', '협곡', 0),
+('谷', '峽谷', '협곡', 1),
+('峽', '峽部', '협부', 0),
+('部', '峽部', '협부', 1),
+('崇', '崇慶', '숭경', 0),
+('慶', '崇慶', '숭경', 1),
+('崇', '崇拜', '숭배', 0),
+('拜', '崇拜', '숭배', 1),
+('崇', '崇拜者', '숭배자', 0),
+('拜', '崇拜者', '숭배자', 1),
+('者', '崇拜者', '숭배자', 2),
+('崇', '崇敬', '숭경', 0),
+('敬', '崇敬', '숭경', 1),
+('崇', '崇高', '숭고', 0),
+('高', '崇高', '숭고', 1),
+('崩', '崩壞', '붕괴', 0),
+('壞', '崩壞', '붕괴', 1),
+('嶺', '嶺南', '영남', 0),
+('南', '嶺南', '영남', 1),
+('巖', '巖壁', '암벽', 0),
+('壁', '巖壁', '암벽', 1),
+('巖', '巖石', '암석', 0),
+('石', '巖石', '암석', 1),
+('川', '川', '천', 0),
+('川', '川獵', '천렵', 0),
+('獵', '川獵', '천렵', 1),
+('川', '川邊', '천변', 0),
+('邊', '川邊', '천변', 1),
+('州', '州', '주', 0),
+('州', '州知事', '주지사', 0),
+('知', '州知事', '주지사', 1),
+('事', '州知事', '주지사', 2),
+('巡', '巡廻審判所', '순회심판소', 0),
+('廻', '巡廻審判所', '순회심판소', 1),
+('審', '巡廻審判所', '순회심판소', 2),
+('判', '巡廻審判所', '순회심판소', 3),
+('所', '巡廻審判所', '순회심판소', 4),
+('巡', '巡洋艦', '순양함', 0),
+('洋', '巡洋艦', '순양함', 1),
+('艦', '巡洋艦', '순양함', 2),
+('巡', '巡禮', '순례', 0),
+('禮', '巡禮', '순례', 1),
+('巡', '巡禮者', '순례자', 0),
+('禮', '巡禮者', '순례자', 1),
+('者', '巡禮者', '순례자', 2),
+('巡', '巡航', '순항', 0),
+('航', '巡航', '순항', 1),
+('巡', '巡航 誘導彈', '순항 유도탄', 0),
+('航', '巡航 誘導彈', '순항 유도탄', 1),
+('誘', '巡航 誘導彈', '순항 유도탄', 3),
+('導', '巡航 誘導彈', '순항 유도탄', 4),
+('彈', '巡航 誘導彈', '순항 유도탄', 5),
+('巢', '巢窟', '소굴', 0),
+('窟', '巢窟', '소굴', 1),
+('工', '工事', '공사', 0),
+('事', '工事', '공사', 1),
+('工', '工人', '공인', 0),
+('人', '工人', '공인', 1),
+('工', '工作', '공작', 0),
+('作', '工作', '공작', 1),
+('工', '工作員', '공작원', 0),
+('作', '工作員', '공작원', 1),
+('員', '工作員', '공작원', 2),
+('工', '工兵', '공병', 0),
+('兵', '工兵', '공병', 1),
+('工', '工具', '공구', 0),
+('具', '工具', '공구', 1),
+('工', '工匠', '공장', 0),
+('匠', '工匠', '공장', 1),
+('工', '工匠', '공창', 0),
+('匠', '工匠', '공창', 1),
+('工', '工場', '공장', 0),
+('場', '工場', '공장', 1),
+('工', '工場主', '공장주', 0),
+('場', '工場主', '공장주', 1),
+('主', '工場主', '공장주', 2),
+('工', '工場長', '공장장', 0),
+('場', '工場長', '공장장', 1),
+('長', '工場長', '공장장', 2),
+('工', '工夫', '공부', 0),
+('夫', '工夫', '공부', 1),
+('工', '工夫房', '공부방', 0),
+('夫', '工夫房', '공부방', 1),
+('房', '工夫房', '공부방', 2),
+('工', '工學', '공학', 0),
+('學', '工學', '공학', 1),
+('工', '工學者', '공학자', 0),
+('學', '工學者', '공학자', 1),
+('者', '工學者', '공학자', 2),
+('工', '工巧', '공교', 0),
+('巧', '工巧', '공교', 1),
+('工', '工廠', '공창', 0),
+('廠', '工廠', '공창', 1),
+('工', '工房', '공방', 0),
+('房', '工房', '공방', 1),
+('工', '工業', '공업', 0),
+('業', '工業', '공업', 1),
+('工', '工業化', '공업화', 0),
+('業', '工業化', '공업화', 1),
+('化', '工業化', '공업화', 2),
+('工', '工業團地', '공업단지', 0),
+('業', '工業團地', '공업단지', 1),
+('團', '工業團地', '공업단지', 2),
+('地', '工業團地', '공업단지', 3),
+('工', '工法', '공법', 0),
+('法', '工法', '공법', 1),
+('工', '工率', '공률', 0),
+('率', '工率', '공률', 1),
+('工', '工程', '공정', 0),
+('程', '工程', '공정', 1),
+('工', '工藝', '공예', 0),
+('藝', '工藝', '공예', 1),
+('工', '工藝品', '공예품', 0),
+('藝', '工藝品', '공예품', 1),
+('品', '工藝品', '공예품', 2),
+('工', '工資', '공자', 0),
+('資', '工資', '공자', 1),
+('工', '工部', '공부', 0),
+('部', '工部', '공부', 1),
+('左', '左之右之', '좌지우지', 0),
+('之', '左之右之', '좌지우지', 1),
+('右', '左之右之', '좌지우지', 2),
+('之', '左之右之', '좌지우지', 3),
+('左', '左右', '좌우', 0),
+('右', '左右', '좌우', 1),
+('左', '左岸', '좌안', 0),
+('岸', '左岸', '좌안', 1),
+('左', '左派', '좌파', 0),
+('派', '左派', '좌파', 1),
+('左', '左翼手', '좌익수', 0),
+('翼', '左翼手', '좌익수', 1),
+('手', '左翼手', '좌익수', 2),
+('左', '左舷', '좌현', 0),
+('舷', '左舷', '좌현', 1),
+('左', '左遷', '좌천', 0),
+('遷', '左遷', '좌천', 1),
+('左', '左빨', '좌빨', 0),
+('빨', '左빨', '좌빨', 1),
+('左', '左좀', '좌좀', 0),
+('좀', '左좀', '좌좀', 1),
+('巧', '巧言', '교언', 0),
+('言', '巧言', '교언', 1),
+('巨', '巨乳', '거유', 0),
+('乳', '巨乳', '거유', 1),
+('巨', '巨人', '거인', 0),
+('人', '巨人', '거인', 1),
+('巨', '巨儒', '거유', 0),
+('儒', '巨儒', '거유', 1),
+('巨', '巨匠', '거장', 0),
+('匠', '巨匠', '거장', 1),
+('巨', '巨大', '거대', 0),
+('大', '巨大', '거대', 1),
+('巨', '巨役', '거역', 0),
+('役', '巨役', '거역', 1),
+('巨', '巨擘', '거벽', 0),
+('擘', '巨擘', '거벽', 1),
+('巨', '巨文島', '거문도', 0),
+('文', '巨文島', '거문도', 1),
+('島', '巨文島', '거문도', 2),
+('巨', '巨物', '거물', 0),
+('物', '巨物', '거물', 1),
+('巨', '巨賊', '거적', 0),
+('賊', '巨賊', '거적', 1),
+('巨', '巨軀', '거구', 0),
+('軀', '巨軀', '거구', 1),
+('巨', '巨額', '거액', 0),
+('額', '巨額', '거액', 1),
+('巫', '巫', '무', 0),
+('巫', '巫俗', '무속', 0),
+('俗', '巫俗', '무속', 1),
+('巫', '巫俗人', '무속인', 0),
+('俗', '巫俗人', '무속인', 1),
+('人', '巫俗人', '무속인', 2),
+('巫', '巫堂', '무당', 0),
+('堂', '巫堂', '무당', 1),
+('巫', '巫女', '무녀', 0),
+('女', '巫女', '무녀', 1),
+('巫', '巫樂', '무악', 0),
+('樂', '巫樂', '무악', 1),
+('巫', '巫知唻', '무지내', 0),
+('知', '巫知唻', '무지내', 1),
+('唻', '巫知唻', '무지내', 2),
+('差', '差', '차', 0),
+('差', '差分', '차분', 0),
+('分', '差分', '차분', 1),
+('差', '差分法', '차분법', 0),
+('分', '差分法', '차분법', 1),
+('法', '差分法', '차분법', 2),
+('差', '差別', '차별', 0),
+('別', '差別', '차별', 1),
+('差', '差數', '차수', 0),
+('數', '差數', '차수', 1),
+('差', '差減', '차감', 0),
+('減', '差減', '차감', 1),
+('差', '差異', '차이', 0),
+('異', '差異', '차이', 1),
+('差', '差異點', '차이점', 0),
+('異', '差異點', '차이점', 1),
+('點', '差異點', '차이점', 2),
+('差', '差金', '차금', 0),
+('金', '差金', '차금', 1),
+('己', '己', '기', 0),
+('己', '己丑', '기축', 0),
+('丑', '己丑', '기축', 1),
+('己', '己亥', '기해', 0),
+('亥', '己亥', '기해', 1),
+('己', '己卯', '기묘', 0),
+('卯', '己卯', '기묘', 1),
+('己', '己巳', '기사', 0),
+('巳', '己巳', '기사', 1),
+('己', '己未', '기미', 0),
+('未', '己未', '기미', 1),
+('己', '己酉', '기유', 0),
+('酉', '己酉', '기유', 1),
+('市', '市', '시', 0),
+('市', '市中', '시중', 0),
+('中', '市中', '시중', 1),
+('市', '市價', '시가', 0),
+('價', '市價', '시가', 1),
+('市', '市內', '시내', 0),
+('內', '市內', '시내', 1),
+('市', '市內--', '시내버스', 0),
+('內', '市內--', '시내버스', 1),
+('-', '市內--', '시내버스', 2),
+('-', '市內--', '시내버스', 3),
+('市', '市制', '시제', 0),
+('制', '市制', '시제', 1),
+('市', '市場', '시장', 0),
+('場', '市場', '시장', 1),
+('市', '市外', '시외', 0),
+('外', '市外', '시외', 1),
+('市', '市外--', '시외버스', 0),
+('外', '市外--', '시외버스', 1),
+('-', '市外--', '시외버스', 2),
+('-', '市外--', '시외버스', 3),
+('市', '市廳', '시청', 0),
+('廳', '市廳', '시청', 1),
+('市', '市民', '시민', 0),
+('民', '市民', '시민', 1),
+('市', '市民權', '시민권', 0),
+('民', '市民權', '시민권', 1),
+('權', '市民權', '시민권', 2),
+('市', '市立', '시립', 0),
+('立', '市立', '시립', 1),
+('市', '市街電車', '시가전차', 0),
+('街', '市街電車', '시가전차', 1),
+('電', '市街電車', '시가전차', 2),
+('車', '市街電車', '시가전차', 3),
+('市', '市議員', '시의원', 0),
+('議', '市議員', '시의원', 1),
+('員', '市議員', '시의원', 2),
+('市', '市議會', '시의회', 0),
+('議', '市議會', '시의회', 1),
+('會', '市議會', '시의회', 2),
+('市', '市道', '시도', 0),
+('道', '市道', '시도', 1),
+('市', '市長', '시장', 0),
+('長', '市長', '시장', 1),
+('布', '布', '포', 0),
+('布', '布告', '포고', 0),
+('告', '布告', '포고', 1),
+('布', '布巾', '포건', 0),
+('巾', '布巾', '포건', 1),
+('布', '布帳馬車', '포장마차', 0),
+('帳', '布帳馬車', '포장마차', 1),
+('馬', '布帳馬車', '포장마차', 2),
+('車', '布帳馬車', '포장마차', 3),
+('布', '布帶', '포대', 0),
+('帶', '布帶', '포대', 1),
+('布', '布敎', '포교', 0),
+('敎', '布敎', '포교', 1),
+('布', '布施', '보시', 0),
+('施', '布施', '보시', 1),
+('布', '布袋', '포대', 0),
+('袋', '布袋', '포대', 1),
+('布', '布車', '포차', 0),
+('車', '布車', '포차', 1),
+('帆', '帆布', '범포', 0),
+('布', '帆布', '범포', 1),
+('帆', '帆走', '범주', 0),
+('走', '帆走', '범주', 1),
+('希', '希望', '희망', 0),
+('望', '希望', '희망', 1),
+('希', '希望拷問', '희망고문', 0),
+('望', '希望拷問', '희망고문', 1),
+('拷', '希望拷問', '희망고문', 2),
+('問', '希望拷問', '희망고문', 3),
+('希', '希臘', '희랍', 0),
+('臘', '希臘', '희랍', 1),
+('帖', '帖', '첩', 0),
+('帙', '帙', '질', 0),
+('帛', '帛書', '백서', 0),
+('書', '帛書', '백서', 1),
+('帝', '帝國', '제국', 0),
+('國', '帝國', '제국', 1),
+('帝', '帝國主義', '제국주의', 0),
+('國', '帝國主義', '제국주의', 1),
+('主', '帝國主義', '제국주의', 2),
+('義', '帝國主義', '제국주의', 3),
+('帝', '帝座', '제좌', 0),
+('座', '帝座', '제좌', 1),
+('帝', '帝政', '제정', 0),
+('政', '帝政', '제정', 1),
+('帝', '帝王', '제왕', 0),
+('王', '帝王', '제왕', 1),
+('帝', '帝王 切開', '제왕 절개', 0),
+('王', '帝王 切開', '제왕 절개', 1),
+('切', '帝王 切開', '제왕 절개', 3),
+('開', '帝王 切開', '제왕 절개', 4),
+('帥', '帥先', '수선', 0),
+('先', '帥先', '수선', 1),
+('師', '師匠', '사장', 0),
+('匠', '師匠', '사장', 1),
+('師', '師團', '사단', 0),
+('團', '師團', '사단', 1),
+('師', '師母', '사모', 0),
+('母', '師母', '사모', 1),
+('師', '師母-', '사모님', 0),
+('母', '師母-', '사모님', 1),
+('-', '師母-', '사모님', 2),
+('師', '師父', '사부', 0),
+('父', '師父', '사부', 1),
+('席', '席', '석', 0),
+('帳', '帳幕', '장막', 0),
+('幕', '帳幕', '장막', 1),
+('帳', '帳本人', '장본인', 0),
+('本', '帳本人', '장본인', 1),
+('人', '帳本人', '장본인', 2),
+('帶', '帶域幅', '대역폭', 0),
+('域', '帶域幅', '대역폭', 1),
+('幅', '帶域幅', '대역폭', 2),
+('帶', '帶電', '대전', 0),
+('電', '帶電', '대전', 1),
+('常', '常任', '상임', 0),
+('任', '常任', '상임', 1),
+('常', '常例', '상례', 0),
+('例', '常例', '상례', 1),
+('常', '常務', '상무', 0),
+('務', '常務', '상무', 1),
+('常', '常情', '상정', 0),
+('情', '常情', '상정', 1),
+('常', '常數', '상수', 0),
+('數', '常數', '상수', 1),
+('常', '常染色體', '상염색체', 0),
+('染', '常染色體', '상염색체', 1),
+('色', '常染色體', '상염색체', 2),
+('體', '常染色體', '상염색체', 3),
+('常', '常樂', '상락', 0),
+('樂', '常樂', '상락', 1),
+('常', '常民', '상민', 0),
+('民', '常民', '상민', 1),
+('常', '常綠樹', '상록수', 0),
+('綠', '常綠樹', '상록수', 1),
+('樹', '常綠樹', '상록수', 2),
+('常', '常識', '상식', 0),
+('識', '常識', '상식', 1),
+('常', '常駐', '상주', 0),
+('駐', '常駐', '상주', 1),
+('帽', '帽子', '모자', 0),
+('子', '帽子', '모자', 1),
+('幀', '幀畵', '탱화', 0),
+('畵', '幀畵', '탱화', 1),
+('幅', '幅', '폭', 0),
+('幅', '幅--', '폭넓다', 0),
+('-', '幅--', '폭넓다', 1),
+('-', '幅--', '폭넓다', 2),
+('幅', '幅巾', '복건', 0),
+('巾', '幅巾', '복건', 1),
+('幇', '幇助', '방조', 0),
+('助', '幇助', '방조', 1),
+('幕', '幕', '막', 0),
+('幕', '幕府', '막부', 0),
+('府', '幕府', '막부', 1),
+('幕', '幕後', '막후', 0),
+('後', '幕後', '막후', 1),
+('幕', '幕舍', '막사', 0),
+('舍', '幕舍', '막사', 1),
+('幕', '幕間', '막간', 0),
+('間', '幕間', '막간', 1),
+('幣', '幣帛', '폐백', 0),
+('帛', '幣帛', '폐백', 1),
+('幣', '幣貢', '폐공', 0),
+('貢', '幣貢', '폐공', 1),
+('干', '干城', '간성', 0),
+('城', '干城', '간성', 1),
+('干', '干戈', '간과', 0),
+('戈', '干戈', '간과', 1),
+('干', '干支', '간지', 0),
+('支', '干支', '간지', 1),
+('干', '干涉', '간섭', 0),
+('涉', '干涉', '간섭', 1),
+('干', '干潮', '간조', 0),
+('潮', '干潮', '간조', 1),
+('干', '干證', '간증', 0),
+('證', '干證', '간증', 1),
+('平', '平價', '평가', 0),
+('價', '平價', '평가', 1),
+('平', '平凡', '평범', 0),
+('凡', '平凡', '평범', 1),
+('平', '平原', '평원', 0),
+('原', '平原', '평원', 1),
+('平', '平和', '평화', 0),
+('和', '平和', '평화', 1),
+('平', '平和主義', '평화주의', 0),
+('和', '平和主義', '평화주의', 1),
+('主', '平和主義', '평화주의', 2),
+('義', '平和主義', '평화주의', 3),
+('平', '平和的', '평화적', 0),
+('和', '平和的', '평화적', 1),
+('的', '平和的', '평화적', 2),
+('平', '平和維持', '평화유지', 0),
+('和', '平和維持', '평화유지', 1),
+('維', '平和維持', '평화유지', 2),
+('持', '平和維持', '평화유지', 3),
+('平', '平地', '평지', 0),
+('地', '平地', '평지', 1),
+('平', '平均', '평균', 0),
+('均', '平均', '평균', 1),
+('平', '平均自責點', '평균자책점', 0),
+('均', '平均自責點', '평균자책점', 1),
+('自', '平均自責點', '평균자책점', 2),
+('責', '平均自責點', '평균자책점', 3),
+('點', '平均自責點', '평균자책점', 4),
+('平', '平城', '평성', 0),
+('城', '平城', '평성', 1),
+('平', '平壤', '평양', 0),
+('壤', '平壤', '평양', 1),
+('平', '平安', '평안', 0),
+('安', '平安', '평안', 1),
+('平', '平安北道', '평안북도', 0),
+('安', '平安北道', '평안북도', 1),
+('北', '平安北道', '평안북도', 2),
+('道', '平安北道', '평안북도', 3),
+('平', '平安南道', '평안남도', 0),
+('安', '平安南道', '평안남도', 1),
+('南', '平安南道', '평안남도', 2),
+('道', '平安南道', '평안남도', 3),
+('平', '平定', '평정', 0),
+('定', '平定', '평정', 1),
+('平', '平常時', '평상시', 0),
+('常', '平常時', '평상시', 1),
+('時', '平常時', '평상시', 2),
+('平', '平年', '평년', 0),
+('年', '平年', '평년', 1),
+('平', '平床', '평상', 0),
+('床', '平床', '평상', 1),
+('平', '平敍文', '평서문', 0),
+('敍', '平敍文', '평서문', 1),
+('文', '平敍文', '평서문', 2),
+('平', '平方', '평방', 0),
+('方', '平方', '평방', 1),
+('平', '平日', '평일', 0),
+('日', '平日', '평일', 1),
+('平', '平昌', '평창', 0),
+('昌', '平昌', '평창', 1),
+('平', '平易', '평이', 0),
+('易', '平易', '평이', 1),
+('平', '平時', '평시', 0),
+('時', '平時', '평시', 1),
+('平', '平服', '평복', 0),
+('服', '平服', '평복', 1),
+('平', '平民', '평민', 0),
+('民', '平民', '평민', 1),
+('平', '平海', '평해', 0),
+('海', '平海', '평해', 1),
+('平', '平澤', '평택', 0),
+('澤', '平澤', '평택', 1),
+('平', '平牀', '평상', 0),
+('牀', '平牀', '평상', 1),
+('平', '平生', '평생', 0),
+('生', '平生', '평생', 1),
+('平', '平穩', '평온', 0),
+('穩', '平穩', '평온', 1),
+('平', '平等', '평등', 0),
+('等', '平等', '평등', 1),
+('平', '平素', '평소', 0),
+('素', '平素', '평소', 1),
+('平', '平聲', '평성', 0),
+('聲', '平聲', '평성', 1),
+('平', '平行', '평행', 0),
+('行', '平行', '평행', 1),
+('平', '平行線', '평행선', 0),
+('行', '平行線', '평행선', 1),
+('線', '平行線', '평행선', 2),
+('平', '平衡', '평형', 0),
+('衡', '平衡', '평형', 1),
+('平', '平野', '평야', 0),
+('野', '平野', '평야', 1),
+('平', '平靜', '평정', 0),
+('靜', '平靜', '평정', 1),
+('平', '平靜心', '평정심', 0),
+('靜', '平靜心', '평정심', 1),
+('心', '平靜心', '평정심', 2),
+('平', '平面', '평면', 0),
+('面', '平面', '평면', 1),
+('年', '年', '년', 0),
+('年', '年', '연', 0),
+('年', '年上', '연상', 0),
+('上', '年上', '연상', 1),
+('年', '年中無休', '연중무휴', 0),
+('中', '年中無休', '연중무휴', 1),
+('無', '年中無休', '연중무휴', 2),
+('休', '年中無休', '연중무휴', 3),
+('年', '年代', '년대', 0),
+('代', '年代', '년대', 1),
+('年', '年代', '연대', 0),
+('代', '年代', '연대', 1),
+('年', '年代學', '연대학', 0),
+('代', '年代學', '연대학', 1),
+('學', '年代學', '연대학', 2),
+('年', '年代記', '연대기', 0),
+('代', '年代記', '연대기', 1),
+('記', '年代記', '연대기', 2),
+('年', '年俸', '연봉', 0),
+('俸', '年俸', '연봉', 1),
+('年', '年刊', '연간', 0),
+('刊', '年刊', '연간', 1),
+('年', '年少', '년소', 0),
+('少', '年少', '년소', 1),
+('年', '年少', '연소', 0),
+('少', '年少', '연소', 1),
+('年', '年度', '년도', 0),
+('度', '年度', '년도', 1),
+('年', '年度', '연도', 0),
+('度', '年度', '연도', 1),
+('年', '年數', '연수', 0),
+('數', '年數', '연수', 1),
+('年', '年月日', '연월일', 0),
+('月', '年月日', '연월일', 1),
+('日', '年月日', '연월일', 2),
+('年', '年期', '연기', 0),
+('期', '年期', '연기', 1),
+('年', '年末', '연말', 0),
+('末', '年末', '연말', 1),
+('年', '年歲', '년세', 0),
+('歲', '年歲', '년세', 1),
+('年', '年歲', '연세', 0),
+('歲', '年歲', '연세', 1),
+('年', '年生', '년생', 0),
+('生', '年生', '년생', 1),
+('年', '年稅', '년세', 0),
+('稅', '年稅', '년세', 1),
+('年', '年稅', '연세', 0),
+('稅', '年稅', '연세', 1),
+('年', '年號', '연호', 0),
+('號', '年號', '연호', 1),
+('年', '年表', '연표', 0),
+('表', '年表', '연표', 1),
+('年', '年記', '연기', 0),
+('記', '年記', '연기', 1),
+('年', '年貢', '연공', 0),
+('貢', '年貢', '연공', 1),
+('年', '年金', '년금', 0),
+('金', '年金', '년금', 1),
+('年', '年金', '연금', 0),
+('金', '年金', '연금', 1),
+('年', '年鑑', '연감', 0),
+('鑑', '年鑑', '연감', 1),
+('年', '年長', '연장', 0),
+('長', '年長', '연장', 1),
+('年', '年間', '연간', 0),
+('間', '年間', '연간', 1),
+('年', '年限', '연한', 0),
+('限', '年限', '연한', 1),
+('年', '年頭', '연두', 0),
+('頭', '年頭', '연두', 1),
+('年', '年齡', '년령', 0),
+('齡', '年齡', '년령', 1),
+('年', '年齡', '연령', 0),
+('齡', '年齡', '연령', 1),
+('年', '年齡帶', '연령대', 0),
+('齡', '年齡帶', '연령대', 1),
+('帶', '年齡帶', '연령대', 2),
+('幸', '幸福', '행복', 0),
+('福', '幸福', '행복', 1),
+('幸', '幸福感', '행복감', 0),
+('福', '幸福感', '행복감', 1),
+('感', '幸福感', '행복감', 2),
+('幸', '幸運', '행운', 0),
+('運', '幸運', '행운', 1),
+('幸', '幸運兒', '행운아', 0),
+('運', '幸運兒', '행운아', 1),
+('兒', '幸運兒', '행운아', 2),
+('幸', '幸여', '행여', 0),
+('여', '幸여', '행여', 1),
+('幹', '幹線', '간선', 0),
+('線', '幹線', '간선', 1),
+('幹', '幹線道路', '간선도로', 0),
+('線', '幹線道路', '간선도로', 1),
+('道', '幹線道路', '간선도로', 2),
+('路', '幹線道路', '간선도로', 3),
+('幹', '幹部', '간부', 0),
+('部', '幹部', '간부', 1),
+('幹', '幹部會', '간부회', 0),
+('部', '幹部會', '간부회', 1),
+('會', '幹部會', '간부회', 2),
+('幻', '幻像', '환상', 0),
+('像', '幻像', '환상', 1),
+('幻', '幻影', '환영', 0),
+('影', '幻影', '환영', 1),
+('幻', '幻想', '환상', 0),
+('想', '幻想', '환상', 1),
+('幻', '幻想 痛症', '환상 통증', 0),
+('想', '幻想 痛症', '환상 통증', 1),
+('痛', '幻想 痛症', '환상 통증', 3),
+('症', '幻想 痛症', '환상 통증', 4),
+('幻', '幻想曲', '환상곡', 0),
+('想', '幻想曲', '환상곡', 1),
+('曲', '幻想曲', '환상곡', 2),
+('幻', '幻想的', '환상적', 0),
+('想', '幻想的', '환상적', 1),
+('的', '幻想的', '환상적', 2),
+('幻', '幻月', '환월', 0),
+('月', '幻月', '환월', 1),
+('幻', '幻滅', '환멸', 0),
+('滅', '幻滅', '환멸', 1),
+('幻', '幻燈', '환등', 0),
+('燈', '幻燈', '환등', 1),
+('幻', '幻肢痛', '환지통', 0),
+('肢', '幻肢痛', '환지통', 1),
+('痛', '幻肢痛', '환지통', 2),
+('幻', '幻術', '환술', 0),
+('術', '幻術', '환술', 1),
+('幻', '幻視', '환시', 0),
+('視', '幻視', '환시', 1),
+('幻', '幻覺', '환각', 0),
+('覺', '幻覺', '환각', 1),
+('幼', '幼主', '유주', 0),
+('主', '幼主', '유주', 1),
+('幼', '幼兒', '유아', 0),
+('兒', '幼兒', '유아', 1),
+('幼', '幼兒園', '유아원', 0),
+('兒', '幼兒園', '유아원', 1),
+('園', '幼兒園', '유아원', 2),
+('幼', '幼兒期', '유아기', 0),
+('兒', '幼兒期', '유아기', 1),
+('期', '幼兒期', '유아기', 2),
+('幼', '幼少', '유소', 0),
+('少', '幼少', '유소', 1),
+('幼', '幼年', '유년', 0),
+('年', '幼年', '유년', 1),
+('幼', '幼生', '유생', 0),
+('生', '幼生', '유생', 1),
+('幼', '幼稚園', '유치원', 0),
+('稚', '幼稚園', '유치원', 1),
+('園', '幼稚園', '유치원', 2),
+('幼', '幼蟲', '유충', 0),
+('蟲', '幼蟲', '유충', 1),
+('幽', '幽冥', '유명', 0),
+('冥', '幽冥', '유명', 1),
+('幽', '幽明', '유명', 0),
+('明', '幽明', '유명', 1),
+('幽', '幽門', '유문', 0),
+('門', '幽門', '유문', 1),
+('幽', '幽閉', '유폐', 0),
+('閉', '幽閉', '유폐', 1),
+('幽', '幽靈', '유령', 0),
+('靈', '幽靈', '유령', 1),
+('幾', '幾何學', '기하학', 0),
+('何', '幾何學', '기하학', 1),
+('學', '幾何學', '기하학', 2),
+('庇', '庇護', '비호', 0),
+('護', '庇護', '비호', 1),
+('床', '床', '상', 0),
+('序', '序文', '서문', 0),
+('文', '序文', '서문', 1),
+('序', '序曲', '서곡', 0),
+('曲', '序曲', '서곡', 1),
+('序', '序論', '서론', 0),
+('論', '序論', '서론', 1),
+('序', '序跋', '서발', 0),
+('跋', '序跋', '서발', 1),
+('底', '底', '저', 0),
+('底', '底力', '저력', 0),
+('力', '底力', '저력', 1),
+('底', '底意', '저의', 0),
+('意', '底意', '저의', 1),
+('底', '底本', '저본', 0),
+('本', '底本', '저본', 1),
+('店', '店主', '점주', 0),
+('主', '店主', '점주', 1),
+('店', '店員', '점원', 0),
+('員', '店員', '점원', 1),
+('店', '店鋪', '점포', 0),
+('鋪', '店鋪', '점포', 1),
+('店', '店長', '점장', 0),
+('長', '店長', '점장', 1),
+('庚', '庚', '경', 0),
+('庚', '庚午', '경오', 0),
+('午', '庚午', '경오', 1),
+('庚', '庚子', '경자', 0),
+('子', '庚子', '경자', 1),
+('庚', '庚寅', '경인', 0),
+('寅', '庚寅', '경인', 1),
+('庚', '庚戌', '경술', 0),
+('戌', '庚戌', '경술', 1),
+('庚', '庚申', '경신', 0),
+('申', '庚申', '경신', 1),
+('庚', '庚辰', '경진', 0),
+('辰', '庚辰', '경진', 1),
+('度', '度', '도', 0),
+('座', '座位', '좌위', 0),
+('位', '座位', '좌위', 1),
+('座', '座右銘', '좌우명', 0),
+('右', '座右銘', '좌우명', 1),
+('銘', '座右銘', '좌우명', 2),
+('座', '座席', '좌석', 0),
+('席', '座席', '좌석', 1),
+('座', '座標', '좌표', 0),
+('標', '座標', '좌표', 1),
+('庫', '庫房', '고방', 0),
+('房', '庫房', '고방', 1),
+('庫', '庫間', '곳간', 0),
+('間', '庫間', '곳간', 1),
+('庭', '庭園', '정원', 0),
+('園', '庭園', '정원', 1),
+('庭', '庭園師', '정원사', 0),
+('園', '庭園師', '정원사', 1),
+('師', '庭園師', '정원사', 2),
+('庭', '庭球', '정구', 0),
+('球', '庭球', '정구', 1),
+('庵', '庵子', '암자', 0),
+('子', '庵子', '암자', 1),
+('庶', '庶人', '서인', 0),
+('人', '庶人', '서인', 1),
+('庶', '庶務', '서무', 0),
+('務', '庶務', '서무', 1),
+('庶', '庶子', '서자', 0),
+('子', '庶子', '서자', 1),
+('庶', '庶民', '서민', 0),
+('民', '庶民', '서민', 1),
+('康', '康寧', '강녕', 0),
+('寧', '康寧', '강녕', 1),
+('康', '康熙字典', '강희자전', 0),
+('熙', '康熙字典', '강희자전', 1),
+('字', '康熙字典', '강희자전', 2),
+('典', '康熙字典', '강희자전', 3),
+('廉', '廉', '염', 0),
+('廉', '廉價', '염가', 0),
+('價', '廉價', '염가', 1),
+('廉', '廉恥', '염치', 0),
+('恥', '廉恥', '염치', 1),
+('廉', '廉探', '염탐', 0),
+('探', '廉探', '염탐', 1),
+('廉', '廉賣', '염매', 0),
+('賣', '廉賣', '염매', 1),
+('廊', '廊下', '낭하', 0),
+('下', '廊下', '낭하', 1),
+('廊', '廊下', '랑하', 0),
+('下', '廊下', '랑하', 1),
+('廚', '廚房', '주방', 0),
+('房', '廚房', '주방', 1),
+('廚', '廚房長', '주방장', 0),
+('房', '廚房長', '주방장', 1),
+('長', '廚房長', '주방장', 2),
+('廛', '廛房', '전방', 0),
+('房', '廛房', '전방', 1),
+('廟', '廟號', '묘호', 0),
+('號', '廟號', '묘호', 1),
+('廢', '廢人', '폐인', 0),
+('人', '廢人', '폐인', 1),
+('廢', '廢位', '폐위', 0),
+('位', '廢位', '폐위', 1),
+('廢', '廢品', '폐품', 0),
+('品', '廢品', '폐품', 1),
+('廢', '廢墟', '폐허', 0),
+('墟', '廢墟', '폐허', 1),
+('廢', '廢工', '폐공', 0),
+('工', '廢工', '폐공', 1),
+('廢', '廢棄', '폐기', 0),
+('棄', '廢棄', '폐기', 1),
+('廢', '廢止', '페지', 0),
+('止', '廢止', '페지', 1),
+('廢', '廢止', '폐지', 0),
+('止', '廢止', '폐지', 1),
+('廢', '廢水', '폐수', 0),
+('水', '廢水', '폐수', 1),
+('廢', '廢物', '폐물', 0),
+('物', '廢物', '폐물', 1),
+('廢', '廢級', '폐급', 0),
+('級', '廢級', '폐급', 1),
+('廢', '廢絕', '폐절', 0),
+('絕', '廢絕', '폐절', 1),
+('廣', '廣告', '광고', 0),
+('告', '廣告', '광고', 1),
+('廣', '廣域', '광역', 0),
+('域', '廣域', '광역', 1),
+('廣', '廣域市', '광역시', 0),
+('域', '廣域市', '광역시', 1),
+('市', '廣域市', '광역시', 2),
+('廣', '廣場', '광장', 0),
+('場', '廣場', '광장', 1),
+('廣', '廣大', '광대', 0),
+('大', '廣大', '광대', 1),
+('廣', '廣幅', '광폭', 0),
+('幅', '廣幅', '광폭', 1),
+('廣', '廣東', '광동', 0),
+('東', '廣東', '광동', 1),
+('廣', '廣東語', '광동어', 0),
+('東', '廣東語', '광동어', 1),
+('語', '廣東語', '광동어', 2),
+('廣', '廣西', '광서', 0),
+('西', '廣西', '광서', 1),
+('廳', '廳', '청', 0),
+('廳', '廳舍', '청사', 0),
+('舍', '廳舍', '청사', 1),
+('延', '延世大學校', '연세대학교', 0),
+('世', '延世大學校', '연세대학교', 1),
+('大', '延世大學校', '연세대학교', 2),
+('學', '延世大學校', '연세대학교', 3),
+('校', '延世大學校', '연세대학교', 4),
+('延', '延伸', '연신', 0),
+('伸', '延伸', '연신', 1),
+('延', '延吉', '연길', 0),
+('吉', '延吉', '연길', 1),
+('延', '延命', '연명', 0),
+('命', '延命', '연명', 1),
+('延', '延坪島', '연평도', 0),
+('坪', '延坪島', '연평도', 1),
+('島', '延坪島', '연평도', 2),
+('延', '延期', '연기', 0),
+('期', '延期', '연기', 1),
+('延', '延燒', '연소', 0),
+('燒', '延燒', '연소', 1),
+('延', '延着', '연착', 0),
+('着', '延着', '연착', 1),
+('延', '延邊', '연변', 0),
+('邊', '延邊', '연변', 1),
+('延', '延長', '연장', 0),
+('長', '延長', '연장', 1),
+('延', '延長戰', '연장전', 0),
+('長', '延長戰', '연장전', 1),
+('戰', '延長戰', '연장전', 2),
+('延', '延長線', '연장선', 0),
+('長', '延長線', '연장선', 1),
+('線', '延長線', '연장선', 2),
+('延', '延髓', '연수', 0),
+('髓', '延髓', '연수', 1),
+('廷', '廷臣', '정신', 0),
+('臣', '廷臣', '정신', 1),
+('建', '建國', '건국', 0),
+('國', '建國', '건국', 1),
+('建', '建坪', '건평', 0),
+('坪', '建坪', '건평', 1),
+('建', '建物', '건물', 0),
+('物', '建物', '건물', 1),
+('建', '建立', '건립', 0),
+('立', '建立', '건립', 1),
+('建', '建築', '건축', 0),
+('築', '建築', '건축', 1),
+('建', '建築學', '건축학', 0),
+('築', '建築學', '건축학', 1),
+('學', '建築學', '건축학', 2),
+('建', '建築家', '건축가', 0),
+('築', '建築家', '건축가', 1),
+('家', '建築家', '건축가', 2),
+('建', '建築物', '건축물', 0),
+('築', '建築物', '건축물', 1),
+('物', '建築物', '건축물', 2),
+('建', '建設', '건설', 0),
+('設', '建設', '건설', 1),
+('建', '建設業', '건설업', 0),
+('設', '建設業', '건설업', 1),
+('業', '建設業', '건설업', 2),
+('建', '建議', '건의', 0),
+('議', '建議', '건의', 1),
+('建', '建造', '건조', 0),
+('造', '建造', '건조', 1),
+('廻', '廻轉', '회전', 0),
+('轉', '廻轉', '회전', 1),
+('弁', '弁韓', '변한', 0),
+('韓', '弁韓', '변한', 1),
+('弄', '弄談', '농담', 0),
+('談', '弄談', '농담', 1),
+('弄', '弄談', '롱담', 0),
+('談', '弄談', '롱담', 1),
+('弊', '弊端', '폐단', 0),
+('端', '弊端', '폐단', 1),
+('式', '式', '식', 0),
+('式', '式典', '식전', 0),
+('典', '式典', '식전', 1),
+('式', '式場', '식장', 0),
+('場', '式場', '식장', 1),
+('式', '式辭', '식사', 0),
+('辭', '式辭', '식사', 1),
+('式', '式順', '식순', 0),
+('順', '式順', '식순', 1),
+('弑', '弑害', '시해', 0),
+('害', '弑害', '시해', 1),
+('弑', '弑逆', '시역', 0),
+('逆', '弑逆', '시역', 1),
+('弓', '弓', '궁', 0),
+('弓', '弓弦', '궁현', 0),
+('弦', '弓弦', '궁현', 1),
+('弓', '弓手', '궁수', 0),
+('手', '弓手', '궁수', 1),
+('弓', '弓矢', '궁시', 0),
+('矢', '弓矢', '궁시', 1),
+('弓', '弓術', '궁술', 0),
+('術', '弓術', '궁술', 1),
+('弓', '弓裔', '궁예', 0),
+('裔', '弓裔', '궁예', 1),
+('弓', '弓道', '궁도', 0),
+('道', '弓道', '궁도', 1),
+('弔', '弔意', '조의', 0),
+('意', '弔意', '조의', 1),
+('弔', '弔慰', '조위', 0),
+('慰', '弔慰', '조위', 1),
+('弔', '弔慰金', '조위금', 0),
+('慰', '弔慰金', '조위금', 1),
+('金', '弔慰金', '조위금', 2),
+('弔', '弔旗', '조기', 0),
+('旗', '弔旗', '조기', 1),
+('弔', '弔橋', '조교', 0),
+('橋', '弔橋', '조교', 1),
+('弔', '弔砲', '조포', 0),
+('砲', '弔砲', '조포', 1),
+('弔', '弔祭', '조제', 0),
+('祭', '弔祭', '조제', 1),
+('弔', '弔詞', '조사', 0),
+('詞', '弔詞', '조사', 1),
+('弔', '弔鐘', '조종', 0),
+('鐘', '弔鐘', '조종', 1),
+('引', '引上', '인상', 0),
+('上', '引上', '인상', 1),
+('引', '引下', '인하', 0),
+('下', '引下', '인하', 1),
+('引', '引出', '인출', 0),
+('出', '引出', '인출', 1),
+('引', '引力', '인력', 0),
+('力', '引力', '인력', 1),
+('引', '引受', '인수', 0),
+('受', '引受', '인수', 1),
+('引', '引導', '인도', 0),
+('導', '引導', '인도', 1),
+('引', '引渡', '인도', 0),
+('渡', '引渡', '인도', 1),
+('引', '引率', '인솔', 0),
+('率', '引率', '인솔', 1),
+('引', '引用', '인용', 0),
+('用', '引用', '인용', 1),
+('引', '引用符', '인용부', 0),
+('用', '引用符', '인용부', 1),
+('符', '引用符', '인용부', 2),
+('引', '引退', '인퇴', 0),
+('退', '引退', '인퇴', 1),
+('弗', '弗化水素', '불화수소', 0),
+('化', '弗化水素', '불화수소', 1),
+('水', '弗化水素', '불화수소', 2),
+('素', '弗化水素', '불화수소', 3),
+('弘', '弘報', '홍보', 0),
+('報', '弘報', '홍보', 1),
+('弘', '弘大', '홍대', 0),
+('大', '弘大', '홍대', 1),
+('弘', '弘益人間', '홍익인간', 0),
+('益', '弘益人間', '홍익인간', 1),
+('人', '弘益人間', '홍익인간', 2),
+('間', '弘益人間', '홍익인간', 3),
+('弟', '弟子', '데자', 0),
+('子', '弟子', '데자', 1),
+('弟', '弟子', '제자', 0),
+('子', '弟子', '제자', 1),
+('弦', '弦', '현', 0),
+('弦', '弦月', '현월', 0),
+('月', '弦月', '현월', 1),
+('弧', '弧', '호', 0),
+('弩', '弩', '노', 0),
+('弱', '弱', '약', 0),
+('弱', '弱冠', '약관', 0),
+('冠', '弱冠', '약관', 1),
+('弱', '弱小', '약소', 0),
+('小', '弱小', '약소', 1),
+('弱', '弱年', '약년', 0),
+('年', '弱年', '약년', 1),
+('弱', '弱拍', '약박', 0),
+('拍', '弱拍', '약박', 1),
+('弱', '弱者', '약자', 0),
+('者', '弱者', '약자', 1),
+('弱', '弱肉強食', '약육강식', 0),
+('肉', '弱肉強食', '약육강식', 1),
+('強', '弱肉強食', '약육강식', 2),
+('食', '弱肉強食', '약육강식', 3),
+('弱', '弱肉强食', '약육강식', 0),
+('肉', '弱肉强食', '약육강식', 1),
+('强', '弱肉强食', '약육강식', 2),
+('食', '弱肉强食', '약육강식', 3),
+('弱', '弱視', '약시', 0),
+('視', '弱視', '약시', 1),
+('弱', '弱酸', '약산', 0),
+('酸', '弱酸', '약산', 1),
+('弱', '弱震', '약진', 0),
+('震', '弱震', '약진', 1),
+('弱', '弱音', '약음', 0),
+('音', '弱音', '약음', 1),
+('弱', '弱音器', '약음기', 0),
+('音', '弱音器', '약음기', 1),
+('器', '弱音器', '약음기', 2),
+('弱', '弱點', '약점', 0),
+('點', '弱點', '약점', 1),
+('張', '張', '장', 0),
+('張', '張力', '장력', 0),
+('力', '張力', '장력', 1),
+('張', '張數', '장수', 0),
+('數', '張數', '장수', 1),
+('強', '強', '강', 0),
+('強', '強制', '강제', 0),
+('制', '強制', '강제', 1),
+('強', '強制收容所', '강제수용소', 0),
+('制', '強制收容所', '강제수용소', 1),
+('收', '強制收容所', '강제수용소', 2),
+('容', '強制收容所', '강제수용소', 3),
+('所', '強制收容所', '강제수용소', 4),
+('強', '強制的', '강제적', 0),
+('制', '強制的', '강제적', 1),
+('的', '強制的', '강제적', 2),
+('強', '強力', '강력', 0),
+('力', '強力', '강력', 1),
+('強', '強勢', '강세', 0),
+('勢', '強勢', '강세', 1),
+('強', '強勸', '강권', 0),
+('勸', '強勸', '강권', 1),
+('強', '強化', '강화', 0),
+('化', '強化', '강화', 1),
+('強', '強占', '강점', 0),
+('占', '強占', '강점', 1),
+('強', '強占期', '강점기', 0),
+('占', '強占期', '강점기', 1),
+('期', '強占期', '강점기', 2),
+('強', '強國', '강국', 0),
+('國', '強國', '강국', 1),
+('強', '強壓', '강압', 0),
+('壓', '強壓', '강압', 1),
+('強', '強大', '강대', 0),
+('大', '強大', '강대', 1),
+('強', '強大國', '강대국', 0),
+('大', '強大國', '강대국', 1),
+('國', '強大國', '강대국', 2),
+('強', '強奪', '강탈', 0),
+('奪', '強奪', '강탈', 1),
+('強', '強姦', '강간', 0),
+('姦', '強姦', '강간', 1),
+('強', '強度', '강도', 0),
+('度', '強度', '강도', 1),
+('強', '強情', '강정', 0),
+('情', '強情', '강정', 1),
+('強', '強打', '강타', 0),
+('打', '強打', '강타', 1),
+('強', '強推', '강추', 0),
+('推', '強推', '강추', 1),
+('強', '強權', '강권', 0),
+('權', '強權', '강권', 1),
+('強', '強盜', '강도', 0),
+('盜', '強盜', '강도', 1),
+('強', '強硬', '강경', 0),
+('硬', '強硬', '강경', 1),
+('強', '強行', '강행', 0),
+('行', '強行', '강행', 1),
+('強', '強襲', '강습', 0),
+('襲', '強襲', '강습', 1),
+('強', '強要', '강요', 0),
+('要', '強要', '강요', 1),
+('強', '強調', '강조', 0),
+('調', '強調', '강조', 1),
+('強', '強請', '강청', 0),
+('請', '強請', '강청', 1),
+('強', '強退', '강퇴', 0),
+('退', '強退', '강퇴', 1),
+('強', '強酸', '강산', 0),
+('酸', '強酸', '강산', 1),
+('強', '強風', '강풍', 0),
+('風', '強風', '강풍', 1),
+('強', '強點', '강점', 0),
+('點', '強點', '강점', 1),
+('强', '强', '강', 0),
+('强', '强制', '강제', 0),
+('制', '强制', '강제', 1),
+('强', '强力', '강력', 0),
+('力', '强力', '강력', 1),
+('强', '强化', '강화', 0),
+('化', '强化', '강화', 1),
+('强', '强度', '강도', 0),
+('度', '强度', '강도', 1),
+('强', '强烈', '강렬', 0),
+('烈', '强烈', '강렬', 1),
+('强', '强盜', '강도', 0),
+('盜', '强盜', '강도', 1),
+('强', '强要', '강요', 0),
+('要', '强要', '강요', 1),
+('强', '强調', '강조', 0),
+('調', '强調', '강조', 1),
+('强', '强速球', '강속구', 0),
+('速', '强速球', '강속구', 1),
+('球', '强速球', '강속구', 2),
+('彈', '彈', '탄', 0),
+('彈', '彈丸', '탄환', 0),
+('丸', '彈丸', '탄환', 1),
+('彈', '彈丸列車', '탄환열차', 0),
+('丸', '彈丸列車', '탄환열차', 1),
+('列', '彈丸列車', '탄환열차', 2),
+('車', '彈丸列車', '탄환열차', 3),
+('彈', '彈倉', '탄창', 0),
+('倉', '彈倉', '탄창', 1),
+('彈', '彈力', '탄력', 0),
+('力', '彈力', '탄력', 1),
+('彈', '彈劾', '탄핵', 0),
+('劾', '彈劾', '탄핵', 1),
+('彈', '彈壓', '탄압', 0),
+('壓', '彈壓', '탄압', 1),
+('彈', '彈幕', '탄막', 0),
+('幕', '彈幕', '탄막', 1),
+('彈', '彈性', '탄성', 0),
+('性', '彈性', '탄성', 1),
+('彈', '彈藥', '탄약', 0),
+('藥', '彈藥', '탄약', 1),
+('彈', '彈藥庫', '탄약고', 0),
+('藥', '彈藥庫', '탄약고', 1),
+('庫', '彈藥庫', '탄약고', 2),
+('彈', '彈藥桶', '탄약통', 0),
+('藥', '彈藥桶', '탄약통', 1),
+('桶', '彈藥桶', '탄약통', 2),
+('彈', '彈道', '탄도', 0),
+('道', '彈道', '탄도', 1),
+('彈', '彈道學', '탄도학', 0),
+('道', '彈道學', '탄도학', 1),
+('學', '彈道學', '탄도학', 2),
+('彈', '彈雨', '탄우', 0),
+('雨', '彈雨', '탄우', 1),
+('彈', '彈頭', '탄두', 0),
+('頭', '彈頭', '탄두', 1),
+('彌', '彌利堅', '미리견', 0),
+('利', '彌利堅', '미리견', 1),
+('堅', '彌利堅', '미리견', 2),
+('彌', '彌留', '미류', 0),
+('留', '彌留', '미류', 1),
+('彎', '彎曲', '만곡', 0),
+('曲', '彎曲', '만곡', 1),
+('彗', '彗星', '혜성', 0),
+('星', '彗星', '혜성', 1),
+('形', '形', '형', 0),
+('形', '形便', '형편', 0),
+('便', '形便', '형편', 1),
+('形', '形勢', '형세', 0),
+('勢', '形勢', '형세', 1),
+('形', '形容動詞', '형용동사', 0),
+('容', '形容動詞', '형용동사', 1),
+('動', '形容動詞', '형용동사', 2),
+('詞', '形容動詞', '형용동사', 3),
+('形', '形容詞', '형용사', 0),
+('容', '形容詞', '형용사', 1),
+('詞', '形容詞', '형용사', 2),
+('形', '形式', '형식', 0),
+('式', '形式', '형식', 1),
+('形', '形影', '형영', 0),
+('影', '形影', '형영', 1),
+('形', '形態', '형태', 0),
+('態', '形態', '형태', 1),
+('形', '形態學', '형태학', 0),
+('態', '形態學', '형태학', 1),
+('學', '形態學', '형태학', 2),
+('形', '形態素', '형태소', 0),
+('態', '形態素', '형태소', 1),
+('素', '形態素', '형태소', 2),
+('形', '形成', '형성', 0),
+('成', '形成', '형성', 1),
+('形', '形而上學', '형이상학', 0),
+('而', '形而上學', '형이상학', 1),
+('上', '形而上學', '형이상학', 2),
+('學', '形而上學', '형이상학', 3),
+('形', '形聲', '형성', 0),
+('聲', '形聲', '형성', 1),
+('形', '形象', '형상', 0),
+('象', '形象', '형상', 1),
+('形', '形跡', '형적', 0),
+('跡', '形跡', '형적', 1),
+('形', '形迹', '형적', 0),
+('迹', '形迹', '형적', 1),
+('彩', '彩度', '채도', 0),
+('度', '彩度', '채도', 1),
+('彫', '彫像', '조상', 0),
+('像', '彫像', '조상', 1),
+('彫', '彫刻', '조각', 0),
+('刻', '彫刻', '조각', 1),
+('彫', '彫刻像', '조각상', 0),
+('刻', '彫刻像', '조각상', 1),
+('像', '彫刻像', '조각상', 2),
+('彫', '彫刻家', '조각가', 0),
+('刻', '彫刻家', '조각가', 1),
+('家', '彫刻家', '조각가', 2),
+('彫', '彫工', '조공', 0),
+('工', '彫工', '조공', 1),
+('影', '影響', '영향', 0),
+('響', '影響', '영향', 1),
+('影', '影響力', '영향력', 0),
+('響', '影響力', '영향력', 1),
+('力', '影響力', '영향력', 2),
+('彷', '彷徨', '방황', 0),
+('徨', '彷徨', '방황', 1),
+('役', '役', '역', 0),
+('役', '役割', '역할', 0),
+('割', '役割', '역할', 1),
+('役', '役員', '역원', 0),
+('員', '役員', '역원', 1),
+('彼', '彼岸', '피안', 0),
+('岸', '彼岸', '피안', 1),
+('彼', '彼此', '피차', 0),
+('此', '彼此', '피차', 1),
+('往', '往復', '왕복', 0),
+('復', '往復', '왕복', 1),
+('往', '往診', '왕진', 0),
+('診', '往診', '왕진', 1),
+('征', '征服', '정복', 0),
+('服', '征服', '정복', 1),
+('徂', '徂往', '조왕', 0),
+('往', '徂往', '조왕', 1),
+('待', '待令', '대령', 0),
+('令', '待令', '대령', 1),
+('待', '待合室', '대합실', 0),
+('合', '待合室', '대합실', 1),
+('室', '待合室', '대합실', 2),
+('待', '待接', '대접', 0),
+('接', '待接', '대접', 1),
+('待', '待望', '대망', 0),
+('望', '待望', '대망', 1),
+('待', '待期', '대기', 0),
+('期', '待期', '대기', 1),
+('待', '待機', '대기', 0),
+('機', '待機', '대기', 1),
+('待', '待機室', '대기실', 0),
+('機', '待機室', '대기실', 1),
+('室', '待機室', '대기실', 2),
+('待', '待遇', '대우', 0),
+('遇', '待遇', '대우', 1),
+('待', '待避', '대피', 0),
+('避', '待避', '대피', 1),
+('律', '律', '률', 0),
+('律', '律', '율', 0),
+('律', '律動', '율동', 0),
+('動', '律動', '율동', 1),
+('律', '律詩', '률시', 0),
+('詩', '律詩', '률시', 1),
+('律', '律詩', '율시', 0),
+('詩', '律詩', '율시', 1),
+('後', '後', '후', 0),
+('後', '後―', '훗달', 0),
+('―', '後―', '훗달', 1),
+('後', '後世', '후세', 0),
+('世', '後世', '후세', 1),
+('後', '後事', '후사', 0),
+('事', '後事', '후사', 1),
+('後', '後任', '후임', 0),
+('任', '後任', '후임', 1),
+('後', '後任者', '후임자', 0),
+('任', '後任者', '후임자', 1),
+('者', '後任者', '후임자', 2),
+('後', '後半', '후반', 0),
+('半', '後半', '후반', 1),
+('後', '後嗣', '후사', 0),
+('嗣', '後嗣', '후사', 1),
+('後', '後天性免疫缺乏症', '후천성면역결핍증', 0),
+('天', '後天性免疫缺乏症', '후천성면역결핍증', 1),
+('性', '後天性免疫缺乏症', '후천성면역결핍증', 2),
+('免', '後天性免疫缺乏症', '후천성면역결핍증', 3),
+('疫', '後天性免疫缺乏症', '후천성면역결핍증', 4),
+('缺', '後天性免疫缺乏症', '후천성면역결핍증', 5),
+('乏', '後天性免疫缺乏症', '후천성면역결핍증', 6),
+('症', '後天性免疫缺乏症', '후천성면역결핍증', 7),
+('後', '後孫', '후손', 0),
+('孫', '後孫', '후손', 1),
+('後', '後宮', '후궁', 0),
+('宮', '後宮', '후궁', 1),
+('後', '後尾', '후미', 0),
+('尾', '後尾', '후미', 1),
+('後', '後悔', '후회', 0),
+('悔', '後悔', '후회', 1),
+('後', '後援', '후원', 0),
+('援', '後援', '후원', 1),
+('後', '後斂', '후렴', 0),
+('斂', '後斂', '후렴', 1),
+('後', '後斂句', '후렴구', 0),
+('斂', '後斂句', '후렴구', 1),
+('句', '後斂句', '후렴구', 2),
+('後', '後日', '후일', 0),
+('日', '後日', '후일', 1),
+('後', '後期', '후기', 0),
+('期', '後期', '후기', 1),
+('後', '後果', '후과', 0),
+('果', '後果', '후과', 1),
+('後', '後燕', '후연', 0),
+('燕', '後燕', '후연', 1),
+('後', '後産', '후산', 0),
+('産', '後産', '후산', 1),
+('後', '後甲板', '후갑판', 0),
+('甲', '後甲板', '후갑판', 1),
+('板', '後甲板', '후갑판', 2),
+('後', '後略', '후략', 0),
+('略', '後略', '후략', 1),
+('後', '後繼者', '후계자', 0),
+('繼', '後繼者', '후계자', 1),
+('者', '後繼者', '후계자', 2),
+('後', '後者', '후자', 0),
+('者', '後者', '후자', 1),
+('後', '後背位', '후배위', 0),
+('背', '後背位', '후배위', 1),
+('位', '後背位', '후배위', 2),
+('後', '後胤', '후윤', 0),
+('胤', '後胤', '후윤', 1),
+('後', '後腦', '후뇌', 0),
+('腦', '後腦', '후뇌', 1),
+('後', '後衛', '후위', 0),
+('衛', '後衛', '후위', 1),
+('後', '後裔', '후예', 0),
+('裔', '後裔', '후예', 1),
+('後', '後見人', '후견인', 0),
+('見', '後見人', '후견인', 1),
+('人', '後見人', '후견인', 2),
+('後', '後輩', '후배', 0),
+('輩', '後輩', '후배', 1),
+('後', '後退', '후퇴', 0),
+('退', '後退', '후퇴', 1),
+('後', '後進國', '후진국', 0),
+('進', '後進國', '후진국', 1),
+('國', '後進國', '후진국', 2),
+('後', '後遺症', '후유증', 0),
+('遺', '後遺症', '후유증', 1),
+('症', '後遺症', '후유증', 2),
+('後', '後遺證', '후유증', 0),
+('遺', '後遺證', '후유증', 1),
+('證', '後遺證', '후유증', 2),
+('後', '後門', '후문', 0),
+('門', '後門', '후문', 1),
+('後', '後食', '후식', 0),
+('食', '後食', '후식', 1),
+('徐', '徐徐', '서서', 0),
+('徐', '徐徐', '서서', 1),
+('徐', '徐羅伐', '서라벌', 0),
+('羅', '徐羅伐', '서라벌', 1),
+('伐', '徐羅伐', '서라벌', 2),
+('徐', '徐行', '서행', 0),
+('行', '徐行', '서행', 1),
+('徒', '徒弟', '도제', 0),
+('弟', '徒弟', '도제', 1),
+('徒', '徒步', '도보', 0),
+('步', '徒步', '도보', 1),
+('徒', '徒死', '도사', 0),
+('死', '徒死', '도사', 1),
+('徒', '徒黨', '도당', 0),
+('黨', '徒黨', '도당', 1),
+('得', '得', '득', 0),
+('得', '得女', '득녀', 0),
+('女', '得女', '득녀', 1),
+('得', '得意', '득의', 0),
+('意', '得意', '득의', 1),
+('得', '得意揚揚', '득의양양', 0),
+('意', '得意揚揚', '득의양양', 1),
+('揚', '得意揚揚', '득의양양', 2),
+('揚', '得意揚揚', '득의양양', 3),
+('得', '得男', '득남', 0),
+('男', '得男', '득남', 1),
+('得', '得票', '득표', 0),
+('票', '得票', '득표', 1),
+('得', '得道', '득도', 0),
+('道', '得道', '득도', 1),
+('得', '得點', '득점', 0),
+('點', '得點', '득점', 1),
+('得', '得點板', '득점판', 0),
+('點', '得點板', '득점판', 1),
+('板', '得點板', '득점판', 2),
+('徘', '徘徊', '배회', 0),
+('徊', '徘徊', '배회', 1),
+('從', '從北', '종북', 0),
+('北', '從北', '종북', 1),
+('從', '從容', '종용', 0),
+('容', '從容', '종용', 1),
+('從', '從屬', '종속', 0),
+('屬', '從屬', '종속', 1),
+('從', '從屬節', '종속절', 0),
+('屬', '從屬節', '종속절', 1),
+('節', '從屬節', '종속절', 2),
+('從', '從業員', '종업원', 0),
+('業', '從業員', '종업원', 1),
+('員', '從業員', '종업원', 2),
+('從', '從物', '종물', 0),
+('物', '從物', '종물', 1),
+('從', '從者', '종자', 0),
+('者', '從者', '종자', 1),
+('從', '從軍', '종군', 0),
+('軍', '從軍', '종군', 1),
+('御', '御刀', '어도', 0),
+('刀', '御刀', '어도', 1),
+('御', '御史', '어사', 0),
+('史', '御史', '어사', 1),
+('御', '御射', '어사', 0),
+('射', '御射', '어사', 1),
+('御', '御璽', '어새', 0),
+('璽', '御璽', '어새', 1),
+('御', '御者', '어자', 0),
+('者', '御者', '어자', 1),
+('御', '御道', '어도', 0),
+('道', '御道', '어도', 1),
+('復', '復位', '복위', 0),
+('位', '復位', '복위', 1),
+('復', '復古', '복고', 0),
+('古', '復古', '복고', 1),
+('復', '復古主義', '복고주의', 0),
+('古', '復古主義', '복고주의', 1),
+('主', '復古主義', '복고주의', 2),
+('義', '復古主義', '복고주의', 3),
+('復', '復唱', '복창', 0),
+('唱', '復唱', '복창', 1),
+('復', '復權', '복권', 0),
+('權', '復權', '복권', 1),
+('復', '復歸', '복귀', 0),
+('歸', '復歸', '복귀', 1),
+('復', '復活', '부활', 0),
+('活', '復活', '부활', 1),
+('復', '復活主日', '부활주일', 0),
+('活', '復活主日', '부활주일', 1),
+('主', '復活主日', '부활주일', 2),
+('日', '復活主日', '부활주일', 3),
+('復', '復活節', '부활절', 0),
+('活', '復活節', '부활절', 1),
+('節', '復活節', '부활절', 2),
+('復', '復習', '복습', 0),
+('習', '復習', '복습', 1),
+('復', '復興', '부흥', 0),
+('興', '復興', '부흥', 1),
+('復', '復舊', '복구', 0),
+('舊', '復舊', '복구', 1),
+('復', '復號', '복호', 0),
+('號', '復號', '복호', 1),
+('復', '復讐', '복수', 0),
+('讐', '復讐', '복수', 1),
+('復', '復讐戰', '복수전', 0),
+('讐', '復讐戰', '복수전', 1),
+('戰', '復讐戰', '복수전', 2),
+('循', '循環', '순환', 0),
+('環', '循環', '순환', 1),
+('微', '微分', '미분', 0),
+('分', '微分', '미분', 1),
+('微', '微分學', '미분학', 0),
+('分', '微分學', '미분학', 1),
+('學', '微分學', '미분학', 2),
+('微', '微分法', '미분법', 0),
+('分', '微分法', '미분법', 1),
+('法', '微分法', '미분법', 2),
+('微', '微動', '미동', 0),
+('動', '微動', '미동', 1),
+('微', '微塵', '미진', 0),
+('塵', '微塵', '미진', 1),
+('微', '微小', '미소', 0),
+('小', '微小', '미소', 1),
+('微', '微少', '미소', 0),
+('少', '微少', '미소', 1),
+('微', '微弱', '미약', 0),
+('弱', '微弱', '미약', 1),
+('微', '微微', '미미', 0),
+('微', '微微', '미미', 1),
+('微', '微恙', '미양', 0),
+('恙', '微恙', '미양', 1),
+('微', '微氣候', '미기후', 0),
+('氣', '微氣候', '미기후', 1),
+('候', '微氣候', '미기후', 2),
+('微', '微生物', '미생물', 0),
+('生', '微生物', '미생물', 1),
+('物', '微生物', '미생물', 2),
+('微', '微生物學', '미생물학', 0),
+('生', '微生物學', '미생물학', 1),
+('物', '微生物學', '미생물학', 2),
+('學', '微生物學', '미생물학', 3),
+('微', '微積', '미적', 0),
+('積', '微積', '미적', 1),
+('微', '微積分', '미적분', 0),
+('積', '微積分', '미적분', 1),
+('分', '微積分', '미적분', 2),
+('微', '微笑', '미소', 0),
+('笑', '微笑', '미소', 1),
+('微', '微粒子', '미립자', 0),
+('粒', '微粒子', '미립자', 1),
+('子', '微粒子', '미립자', 2),
+('微', '微細', '미세', 0),
+('細', '微細', '미세', 1),
+('微', '微絨毛', '미융모', 0),
+('絨', '微絨毛', '미융모', 1),
+('毛', '微絨毛', '미융모', 2),
+('微', '微聲', '미성', 0),
+('聲', '微聲', '미성', 1),
+('微', '微誠', '미성', 0),
+('誠', '微誠', '미성', 1),
+('微', '微賤', '미천', 0),
+('賤', '微賤', '미천', 1),
+('微', '微運', '미운', 0),
+('運', '微運', '미운', 1),
+('微', '微雨', '미우', 0),
+('雨', '微雨', '미우', 1),
+('微', '微雲', '미운', 0),
+('雲', '微雲', '미운', 1),
+('微', '微風', '미풍', 0),
+('風', '微風', '미풍', 1),
+('徵', '徵候', '징후', 0),
+('候', '徵候', '징후', 1),
+('徵', '徵兆', '징조', 0),
+('兆', '徵兆', '징조', 1),
+('徵', '徵兵', '징병', 0),
+('兵', '徵兵', '징병', 1),
+('徵', '徵募', '징모', 0),
+('募', '徵募', '징모', 1),
+('徵', '徵發', '징발', 0),
+('發', '徵發', '징발', 1),
+('徵', '徵集', '징집', 0),
+('集', '徵集', '징집', 1),
+('徵', '徵集兵', '징집병', 0),
+('集', '徵集兵', '징집병', 1),
+('兵', '徵集兵', '징집병', 2),
+('德', '德', '덕', 0),
+('德', '德分', '덕분', 0),
+('分', '德分', '덕분', 1),
+('德', '德川', '덕천', 0),
+('川', '德川', '덕천', 1),
+('德', '德澤', '덕택', 0),
+('澤', '德澤', '덕택', 1),
+('徹', '徹底', '철저', 0),
+('底', '徹底', '철저', 1),
+('徽', '徽章', '휘장', 0),
+('章', '徽章', '휘장', 1),
+('心', '心', '심', 0),
+('心', '心不全', '심부전', 0),
+('不', '心不全', '심부전', 1),
+('全', '心不全', '심부전', 2),
+('心', '心像', '심상', 0),
+('像', '心像', '심상', 1),
+('心', '心因性', '심인성', 0),
+('因', '心因性', '심인성', 1),
+('性', '心因性', '심인성', 2),
+('心', '心室', '심실', 0),
+('室', '心室', '심실', 1),
+('心', '心底', '심저', 0),
+('底', '心底', '심저', 1),
+('心', '心性', '심성', 0),
+('性', '心性', '심성', 1),
+('心', '心情', '심정', 0),
+('情', '心情', '심정', 1),
+('心', '心意', '심의', 0),
+('意', '心意', '심의', 1),
+('心', '心慮', '심려', 0),
+('慮', '心慮', '심려', 1),
+('心', '心房', '심방', 0),
+('房', '心房', '심방', 1),
+('心', '心搏', '심박', 0),
+('搏', '心搏', '심박', 1),
+('心', '心搏數', '심박수', 0),
+('搏', '心搏數', '심박수', 1),
+('數', '心搏數', '심박수', 2),
+('心', '心材', '심재', 0),
+('材', '心材', '심재', 1),
+('心', '心理', '심리', 0),
+('理', '心理', '심리', 1),
+('心', '心理學', '심리학', 0),
+('理', '心理學', '심리학', 1),
+('學', '心理學', '심리학', 2),
+('心', '心理學者', '심리학자', 0),
+('理', '心理學者', '심리학자', 1),
+('學', '心理學者', '심리학자', 2),
+('者', '心理學者', '심리학자', 3),
+('心', '心眼', '심안', 0),
+('眼', '心眼', '심안', 1),
+('心', '心筋梗塞', '심근경색', 0),
+('筋', '心筋梗塞', '심근경색', 1),
+('梗', '心筋梗塞', '심근경색', 2),
+('塞', '心筋梗塞', '심근경색', 3),
+('心', '心緒', '심서', 0),
+('緒', '心緒', '심서', 1),
+('心', '心肺蘇生術', '심폐소생술', 0),
+('肺', '心肺蘇生術', '심폐소생술', 1),
+('蘇', '心肺蘇生術', '심폐소생술', 2),
+('生', '心肺蘇生術', '심폐소생술', 3),
+('術', '心肺蘇生術', '심폐소생술', 4),
+('心', '心臟', '심장', 0),
+('臟', '心臟', '심장', 1),
+('心', '心血', '심혈', 0),
+('血', '心血', '심혈', 1),
+('心', '心裏', '심리', 0),
+('裏', '心裏', '심리', 1),
+('心', '心象', '심상', 0),
+('象', '心象', '심상', 1),
+('心', '心電計', '심전계', 0),
+('電', '心電計', '심전계', 1),
+('計', '心電計', '심전계', 2),
+('心', '心願', '심원', 0),
+('願', '心願', '심원', 1),
+('心', '心魂', '심혼', 0),
+('魂', '心魂', '심혼', 1),
+('必', '必勝', '필승', 0),
+('勝', '必勝', '필승', 1),
+('必', '必死', '필사', 0),
+('死', '必死', '필사', 1),
+('必', '必死的', '필사적', 0),
+('死', '必死的', '필사적', 1),
+('的', '必死的', '필사적', 2),
+('必', '必殺技', '필살기', 0),
+('殺', '必殺技', '필살기', 1),
+('技', '必殺技', '필살기', 2),
+('必', '必然', '필연', 0),
+('然', '必然', '필연', 1),
+('必', '必然的', '필연적', 0),
+('然', '必然的', '필연적', 1),
+('的', '必然的', '필연적', 2),
+('必', '必要', '필요', 0),
+('要', '必要', '필요', 1),
+('必', '必要性', '필요성', 0),
+('要', '必要性', '필요성', 1),
+('性', '必要性', '필요성', 2),
+('必', '必要惡', '필요악', 0),
+('要', '必要惡', '필요악', 1),
+('惡', '必要惡', '필요악', 2),
+('必', '必需品', '필수품', 0),
+('需', '必需品', '필수품', 1),
+('品', '必需品', '필수품', 2),
+('必', '必須', '필수', 0),
+('須', '必須', '필수', 1),
+('必', '必須 脂肪酸', '필수 지방산', 0),
+('須', '必須 脂肪酸', '필수 지방산', 1),
+('脂', '必須 脂肪酸', '필수 지방산', 3),
+('肪', '必須 脂肪酸', '필수 지방산', 4),
+('酸', '必須 脂肪酸', '필수 지방산', 5),
+('必', '必須的', '필수적', 0),
+('須', '必須的', '필수적', 1),
+('的', '必須的', '필수적', 2),
+('忌', '忌日', '기일', 0),
+('日', '忌日', '기일', 1),
+('忌', '忌避', '기피', 0),
+('避', '忌避', '기피', 1),
+('忍', '忍從', '인종', 0),
+('從', '忍從', '인종', 1),
+('忍', '忍笑', '인소', 0),
+('笑', '忍笑', '인소', 1),
+('忍', '忍耐', '인내', 0),
+('耐', '忍耐', '인내', 1),
+('忍', '忍耐心', '인내심', 0),
+('耐', '忍耐心', '인내심', 1),
+('心', '忍耐心', '인내심', 2),
+('忍', '忍苦', '인고', 0),
+('苦', '忍苦', '인고', 1),
+('志', '志向', '지향', 0),
+('向', '志向', '지향', 1),
+('志', '志願', '지원', 0),
+('願', '志願', '지원', 1),
+('志', '志願兵', '지원병', 0),
+('願', '志願兵', '지원병', 1),
+('兵', '志願兵', '지원병', 2),
+('志', '志願者', '지원자', 0),
+('願', '志願者', '지원자', 1),
+('者', '志願者', '지원자', 2),
+('志', '志願軍', '지원군', 0),
+('願', '志願軍', '지원군', 1),
+('軍', '志願軍', '지원군', 2),
+('忘', '忘却', '망각', 0),
+('却', '忘却', '망각', 1),
+('忘', '忘恩', '망은', 0),
+('恩', '忘恩', '망은', 1),
+('忘', '忘我', '망아', 0),
+('我', '忘我', '망아', 1),
+('忘', '忘棄', '망기', 0),
+('棄', '忘棄', '망기', 1),
+('忘', '忘機', '망기', 0),
+('機', '忘機', '망기', 1),
+('忠', '忠', '충', 0),
+('忠', '忠北', '충북', 0),
+('北', '忠北', '충북', 1),
+('忠', '忠南', '충남', 0),
+('南', '忠南', '충남', 1),
+('忠', '忠告', '충고', 0),
+('告', '忠告', '충고', 1),
+('忠', '忠實', '충실', 0),
+('實', '忠實', '충실', 1),
+('忠', '忠淸北道', '충청북도', 0),
+('淸', '忠淸北道', '충청북도', 1),
+('北', '忠淸北道', '충청북도', 2),
+('道', '忠淸北道', '충청북도', 3),
+('忠', '忠淸南道', '충청남도', 0),
+('淸', '忠淸南道', '충청남도', 1),
+('南', '忠淸南道', '충청남도', 2),
+('道', '忠淸南道', '충청남도', 3),
+('忠', '忠淸道', '충청도', 0),
+('淸', '忠淸道', '충청도', 1),
+('道', '忠淸道', '충청도', 2),
+('忠', '忠節', '충절', 0),
+('節', '忠節', '충절', 1),
+('忠', '忠義', '충의', 0),
+('義', '忠義', '충의', 1),
+('忠', '忠誠', '충성', 0),
+('誠', '忠誠', '충성', 1),
+('忠', '忠誠心', '충성심', 0),
+('誠', '忠誠心', '충성심', 1),
+('心', '忠誠心', '충성심', 2),
+('快', '快便', '쾌변', 0),
+('便', '快便', '쾌변', 1),
+('快', '快感', '쾌감', 0),
+('感', '快感', '쾌감', 1),
+('快', '快樂', '쾌락', 0),
+('樂', '快樂', '쾌락', 1),
+('快', '快活', '쾌활', 0),
+('活', '快活', '쾌활', 1),
+('快', '快美', '쾌미', 0),
+('美', '快美', '쾌미', 1),
+('快', '快適', '쾌적', 0),
+('適', '快適', '쾌적', 1),
+('念', '念', '념', 0),
+('念', '念佛', '염불', 0),
+('佛', '念佛', '염불', 1),
+('念', '念力', '염력', 0),
+('力', '念力', '염력', 1),
+('念', '念慮', '염려', 0),
+('慮', '念慮', '염려', 1),
+('念', '念珠', '염주', 0),
+('珠', '念珠', '염주', 1),
+('忿', '忿怒', '분노', 0),
+('怒', '忿怒', '분노', 1),
+('怏', '怏宿', '앙숙', 0),
+('宿', '怏宿', '앙숙', 1),
+('怏', '怏心', '앙심', 0),
+('心', '怏心', '앙심', 1),
+('怒', '怒濤', '노도', 0),
+('濤', '怒濤', '노도', 1),
+('怒', '怒號', '노호', 0),
+('號', '怒號', '노호', 1),
+('思', '思惟', '사유', 0),
+('惟', '思惟', '사유', 1),
+('思', '思想', '사상', 0),
+('想', '思想', '사상', 1),
+('思', '思想家', '사상가', 0),
+('想', '思想家', '사상가', 1),
+('家', '思想家', '사상가', 2),
+('思', '思慕', '사모', 0),
+('慕', '思慕', '사모', 1),
+('思', '思慮', '사려', 0),
+('慮', '思慮', '사려', 1),
+('思', '思料', '사료', 0),
+('料', '思料', '사료', 1),
+('思', '思春期', '사춘기', 0),
+('春', '思春期', '사춘기', 1),
+('期', '思春期', '사춘기', 2),
+('思', '思潮', '사조', 0),
+('潮', '思潮', '사조', 1),
+('思', '思索', '사색', 0),
+('索', '思索', '사색', 1),
+('思', '思考', '사고', 0),
+('考', '思考', '사고', 1),
+('怠', '怠惰', '태타', 0),
+('惰', '怠惰', '태타', 1),
+('怠', '怠慢', '태만', 0),
+('慢', '怠慢', '태만', 1),
+('急', '急', '급', 0),
+('急', '急-', '급히', 0),
+('-', '急-', '급히', 1),
+('急', '急傾斜', '급경사', 0),
+('傾', '急傾斜', '급경사', 1),
+('斜', '急傾斜', '급경사', 2),
+('急', '急增', '급증', 0),
+('增', '急增', '급증', 1),
+('急', '急所', '급소', 0),
+('所', '急所', '급소', 1),
+('急', '急派', '급파', 0),
+('派', '急派', '급파', 1),
+('急', '急流', '급류', 0),
+('流', '急流', '급류', 1),
+('急', '急激', '급격', 0),
+('激', '急激', '급격', 1),
+('急', '急病', '급병', 0),
+('病', '急病', '급병', 1),
+('急', '急落', '급락', 0),
+('落', '急落', '급락', 1),
+('急', '急行', '급행', 0),
+('行', '急行', '급행', 1),
+('急', '急襲', '급습', 0),
+('襲', '急襲', '급습', 1),
+('急', '急迫', '급박', 0),
+('迫', '急迫', '급박', 1),
+('急', '急送', '급송', 0),
+('送', '急送', '급송', 1),
+('急', '急速', '급속', 0),
+('速', '急速', '급속', 1),
+('急', '急造', '급조', 0),
+('造', '急造', '급조', 1),
+('急', '急造爆發物', '급조폭발물', 0),
+('造', '急造爆發物', '급조폭발물', 1),
+('爆', '急造爆發物', '급조폭발물', 2),
+('發', '急造爆發物', '급조폭발물', 3),
+('物', '急造爆發物', '급조폭발물', 4),
+('急', '急進主義', '급진주의', 0),
+('進', '急進主義', '급진주의', 1),
+('主', '急進主義', '급진주의', 2),
+('義', '急進主義', '급진주의', 3),
+('急', '急降下', '급강하', 0),
+('降', '急降下', '급강하', 1),
+('下', '急降下', '급강하', 2),
+('急', '急降下爆擊機', '급강하폭격기', 0),
+('降', '急降下爆擊機', '급강하폭격기', 1),
+('下', '急降下爆擊機', '급강하폭격기', 2),
+('爆', '急降下爆擊機', '급강하폭격기', 3),
+('擊', '急降下爆擊機', '급강하폭격기', 4),
+('機', '急降下爆擊機', '급강하폭격기', 5),
+('急', '急騰', '급등', 0),
+('騰', '急騰', '급등', 1),
+('性', '性', '성', 0),
+('性', '性交', '성교', 0),
+('交', '性交', '성교', 1),
+('性', '性交 體位', '성교 체위', 0),
+('交', '性交 體位', '성교 체위', 1),
+('體', '性交 體位', '성교 체위', 3),
+('位', '性交 體位', '성교 체위', 4),
+('性', '性交體位', '성교체위', 0),
+('交', '性交體位', '성교체위', 1),
+('體', '性交體位', '성교체위', 2),
+('位', '性交體位', '성교체위', 3),
+('性', '性別', '성별', 0),
+('別', '性別', '성별', 1),
+('性', '性向', '성향', 0),
+('向', '性向', '성향', 1),
+('性', '性器', '성기', 0),
+('器', '性器', '성기', 1),
+('性', '性差別', '성차별', 0),
+('差', '性差別', '성차별', 1),
+('別', '性差別', '성차별', 2),
+('性', '性德', '성덕', 0),
+('德', '性德', '성덕', 1),
+('性', '性愛物', '성애물', 0),
+('愛', '性愛物', '성애물', 1),
+('物', '性愛物', '성애물', 2),
+('性', '性感', '성감', 0),
+('感', '性感', '성감', 1),
+('性', '性感帶', '성감대', 0),
+('感', '性感帶', '성감대', 1),
+('帶', '性感帶', '성감대', 2),
+('性', '性慾', '성욕', 0),
+('慾', '性慾', '성욕', 1),
+('性', '性暴行', '성폭행', 0),
+('暴', '性暴行', '성폭행', 1),
+('行', '性暴行', '성폭행', 2),
+('性', '性染色體', '성염색체', 0),
+('染', '性染色體', '성염색체', 1),
+('色', '性染色體', '성염색체', 2),
+('體', '性染色體', '성염색체', 3),
+('性', '性格', '성격', 0),
+('格', '性格', '성격', 1),
+('性', '性生活', '성생활', 0),
+('生', '性生活', '성생활', 1),
+('活', '性生活', '성생활', 2),
+('性', '性病', '성병', 0),
+('病', '性病', '성병', 1),
+('性', '性癖', '성벽', 0),
+('癖', '性癖', '성벽', 1),
+('性', '性的', '성적', 0),
+('的', '性的', '성적', 1),
+('性', '性的虐待', '성적학대', 0),
+('的', '性的虐待', '성적학대', 1),
+('虐', '性的虐待', '성적학대', 2),
+('待', '性的虐待', '성적학대', 3),
+('性', '性能', '성능', 0),
+('能', '性能', '성능', 1),
+('性', '性行爲', '성행위', 0),
+('行', '性行爲', '성행위', 1),
+('爲', '性行爲', '성행위', 2),
+('性', '性賣買', '성매매', 0),
+('賣', '性賣買', '성매매', 1),
+('買', '性賣買', '성매매', 2),
+('性', '性質', '성질', 0),
+('質', '性質', '성질', 1),
+('性', '性轉換', '성전환', 0),
+('轉', '性轉換', '성전환', 1),
+('換', '性轉換', '성전환', 2),
+('性', '性進國', '성진국', 0),
+('進', '性進國', '성진국', 1),
+('國', '性進國', '성진국', 2),
+('性', '性關係', '성관계', 0),
+('關', '性關係', '성관계', 1),
+('係', '性關係', '성관계', 2),
+('怨', '怨念', '원념', 0),
+('念', '怨念', '원념', 1),
+('怨', '怨恨', '원한', 0),
+('恨', '怨恨', '원한', 1),
+('怨', '怨望', '원망', 0),
+('望', '怨望', '원망', 1),
+('怨', '怨讐', '원수', 0),
+('讐', '怨讐', '원수', 1),
+('怪', '怪死', '괴사', 0),
+('死', '怪死', '괴사', 1),
+('怪', '怪漢', '괴한', 0),
+('漢', '怪漢', '괴한', 1),
+('怪', '怪物', '괴물', 0),
+('物', '怪物', '괴물', 1),
+('怪', '怪獸', '괴수', 0),
+('獸', '怪獸', '괴수', 1),
+('怪', '怪異', '괴이', 0),
+('異', '怪異', '괴이', 1),
+('怪', '怪談', '괴담', 0),
+('談', '怪談', '괴담', 1),
+('怯', '怯', '겁', 0),
+('怯', '怯--', '겁나다', 0),
+('-', '怯--', '겁나다', 1),
+('-', '怯--', '겁나다', 2),
+('怯', '怯弱', '겁약', 0),
+('弱', '怯弱', '겁약', 1),
+('恍', '恍惚', '황홀', 0),
+('惚', '恍惚', '황홀', 1),
+('恐', '恐喝', '공갈', 0),
+('喝', '恐喝', '공갈', 1),
+('恐', '恐怖', '공포', 0),
+('怖', '恐怖', '공포', 1),
+('恐', '恐怖 映畫', '공포 영화', 0),
+('怖', '恐怖 映畫', '공포 영화', 1),
+('映', '恐怖 映畫', '공포 영화', 3),
+('畫', '恐怖 映畫', '공포 영화', 4),
+('恐', '恐怖主義', '공포주의', 0),
+('怖', '恐怖主義', '공포주의', 1),
+('主', '恐怖主義', '공포주의', 2),
+('義', '恐怖主義', '공포주의', 3),
+('恐', '恐怖症', '공포증', 0),
+('怖', '恐怖症', '공포증', 1),
+('症', '恐怖症', '공포증', 2),
+('恐', '恐慌', '공황', 0),
+('慌', '恐慌', '공황', 1),
+('恐', '恐水病', '공수병', 0),
+('水', '恐水病', '공수병', 1),
+('病', '恐水病', '공수병', 2),
+('恐', '恐龍', '공룡', 0),
+('龍', '恐龍', '공룡', 1),
+('恒', '恒常', '항상', 0),
+('常', '恒常', '항상', 1),
+('恒', '恒星', '항성', 0),
+('星', '恒星', '항성', 1),
+('恒', '恒星年', '항성년', 0),
+('星', '恒星年', '항성년', 1),
+('年', '恒星年', '항성년', 2),
+('恒', '恒星系', '항성계', 0),
+('星', '恒星系', '항성계', 1),
+('系', '恒星系', '항성계', 2),
+('恒', '恒河沙', '항하사', 0),
+('河', '恒河沙', '항하사', 1),
+('沙', '恒河沙', '항하사', 2),
+('恒', '恒溫動物', '항온동물', 0),
+('溫', '恒溫動物', '항온동물', 1),
+('動', '恒溫動物', '항온동물', 2),
+('物', '恒溫動物', '항온동물', 3),
+('恝', '恝視', '괄시', 0),
+('視', '恝視', '괄시', 1),
+('恥', '恥垢', '치구', 0),
+('垢', '恥垢', '치구', 1),
+('恥', '恥辱', '치욕', 0),
+('辱', '恥辱', '치욕', 1),
+('恨', '恨', '한', 0),
+('恩', '恩人', '은인', 0),
+('人', '恩人', '은인', 1),
+('恩', '恩典', '은전', 0),
+('典', '恩典', '은전', 1),
+('恩', '恩惠', '은혜', 0),
+('惠', '恩惠', '은혜', 1),
+('恩', '恩義', '은의', 0),
+('義', '恩義', '은의', 1),
+('恩', '恩赦', '은사', 0),
+('赦', '恩赦', '은사', 1),
+('恭', '恭敬', '공경', 0),
+('敬', '恭敬', '공경', 1),
+('恭', '恭遜', '공손', 0),
+('遜', '恭遜', '공손', 1),
+('恭', '恭順', '공순', 0),
+('順', '恭順', '공순', 1),
+('恰', '恰似', '흡사', 0),
+('似', '恰似', '흡사', 1),
+('悅', '悅口子湯', '열구자탕', 0),
+('口', '悅口子湯', '열구자탕', 1),
+('子', '悅口子湯', '열구자탕', 2),
+('湯', '悅口子湯', '열구자탕', 3),
+('悔', '悔恨', '회한', 0),
+('恨', '悔恨', '회한', 1),
+('悔', '悔悟', '회오', 0),
+('悟', '悔悟', '회오', 1),
+('悔', '悔改', '회개', 0),
+('改', '悔改', '회개', 1),
+('悖', '悖習', '패습', 0),
+('習', '悖習', '패습', 1),
+('患', '患者', '환자', 0),
+('者', '患者', '환자', 1),
+('患', '患部', '환부', 0),
+('部', '患部', '환부', 1),
+('悤', '悤悤', '총총', 0),
+('悤', '悤悤', '총총', 1),
+('悲', '悲傷', '비상', 0),
+('傷', '悲傷', '비상', 1),
+('悲', '悲劇', '비극', 0),
+('劇', '悲劇', '비극', 1),
+('悲', '悲哀', '비애', 0),
+('哀', '悲哀', '비애', 1),
+('悲', '悲慘', '비참', 0),
+('慘', '悲慘', '비참', 1),
+('悲', '悲號', '비호', 0),
+('號', '悲號', '비호', 1),
+('悲', '悲觀', '비관', 0),
+('觀', '悲觀', '비관', 1),
+('悲', '悲運', '비운', 0),
+('運', '悲運', '비운', 1),
+('悲', '悲鳴', '비명', 0),
+('鳴', '悲鳴', '비명', 1),
+('悼', '悼詞', '도사', 0),
+('詞', '悼詞', '도사', 1),
+('悽', '悽慘', '처참', 0),
+('慘', '悽慘', '처참', 1),
+('情', '情', '정', 0),
+('情', '情事', '정사', 0),
+('事', '情事', '정사', 1),
+('情', '情勢', '정세', 0),
+('勢', '情勢', '정세', 1),
+('情', '情報', '정보', 0),
+('報', '情報', '정보', 1),
+('情', '情報化', '정보화', 0),
+('報', '情報化', '정보화', 1),
+('化', '情報化', '정보화', 2),
+('情', '情報檢索', '정보검색', 0),
+('報', '情報檢索', '정보검색', 1),
+('檢', '情報檢索', '정보검색', 2),
+('索', '情報檢索', '정보검색', 3),
+('情', '情婦', '정부', 0),
+('婦', '情婦', '정부', 1),
+('情', '情弱', '정약', 0),
+('弱', '情弱', '정약', 1),
+('情', '情念', '정념', 0),
+('念', '情念', '정념', 1),
+('情', '情慾', '정욕', 0),
+('慾', '情慾', '정욕', 1),
+('情', '情歌', '정가', 0),
+('歌', '情歌', '정가', 1),
+('情', '情況', '정황', 0),
+('況', '情況', '정황', 1),
+('情', '情熱', '정열', 0),
+('熱', '情熱', '정열', 1),
+('情', '情狀酌量', '정상작량', 0),
+('狀', '情狀酌量', '정상작량', 1),
+('酌', '情狀酌量', '정상작량', 2),
+('量', '情狀酌量', '정상작량', 3),
+('情', '情緖', '정서', 0),
+('緖', '情緖', '정서', 1),
+('情', '情色', '정색', 0),
+('色', '情色', '정색', 1),
+('情', '情識', '정식', 0),
+('識', '情識', '정식', 1),
+('情', '情趣', '정취', 0),
+('趣', '情趣', '정취', 1),
+('惑', '惑星', '혹성', 0),
+('星', '惑星', '혹성', 1),
+('惠', '惠山', '혜산', 0),
+('山', '惠山', '혜산', 1),
+('惠', '惠澤', '혜택', 0),
+('澤', '惠澤', '혜택', 1),
+('惡', '惡', '악', 0),
+('惡', '惡人', '악인', 0),
+('人', '惡人', '악인', 1),
+('惡', '惡化', '악화', 0),
+('化', '惡化', '악화', 1),
+('惡', '惡名', '악명', 0),
+('名', '惡名', '악명', 1),
+('惡', '惡地', '악지', 0),
+('地', '惡地', '악지', 1),
+('惡', '惡夢', '악몽', 0),
+('夢', '惡夢', '악몽', 1),
+('惡', '惡天候', '악천후', 0),
+('天', '惡天候', '악천후', 1),
+('候', '惡天候', '악천후', 2),
+('惡', '惡寒', '오한', 0),
+('寒', '惡寒', '오한', 1),
+('惡', '惡影響', '악영향', 0),
+('影', '惡影響', '악영향', 1),
+('響', '惡影響', '악영향', 2),
+('惡', '惡役', '악역', 0),
+('役', '惡役', '악역', 1),
+('惡', '惡循環', '악순환', 0),
+('循', '惡循環', '악순환', 1),
+('環', '惡循環', '악순환', 2),
+('惡', '惡德', '악덕', 0),
+('德', '惡德', '악덕', 1),
+('惡', '惡性', '악성', 0),
+('性', '惡性', '악성', 1),
+('惡', '惡性腫瘍', '악성종양', 0),
+('性', '惡性腫瘍', '악성종양', 1),
+('腫', '惡性腫瘍', '악성종양', 2),
+('瘍', '惡性腫瘍', '악성종양', 3),
+('惡', '惡意', '악의', 0),
+('意', '惡意', '악의', 1),
+('惡', '惡感', '악감', 0),
+('感', '惡感', '악감', 1),
+('惡', '惡感情', '악감정', 0),
+('感', '惡感情', '악감정', 1),
+('情', '惡感情', '악감정', 2),
+('惡', '惡政', '악정', 0),
+('政', '惡政', '악정', 1),
+('惡', '惡書', '악서', 0),
+('書', '惡書', '악서', 1),
+('惡', '惡漢', '악한', 0),
+('漢', '惡漢', '악한', 1),
+('惡', '惡熱', '오열', 0),
+('熱', '惡熱', '오열', 1),
+('惡', '惡用', '악용', 0),
+('用', '惡用', '악용', 1),
+('惡', '惡童', '악동', 0),
+('童', '惡童', '악동', 1),
+('惡', '惡筆', '악필', 0),
+('筆', '惡筆', '악필', 1),
+('惡', '惡習', '악습', 0),
+('習', '惡習', '악습', 1),
+('惡', '惡臭', '악취', 0),
+('臭', '惡臭', '악취', 1),
+('惡', '惡行', '악행', 0),
+('行', '惡行', '악행', 1),
+('惡', '惡評', '악평', 0),
+('評', '惡評', '악평', 1),
+('惡', '惡談', '악담', 0),
+('談', '惡談', '악담', 1),
+('惡', '惡辣', '악랄', 0),
+('辣', '惡辣', '악랄', 1),
+('惡', '惡靈', '악령', 0),
+('靈', '惡靈', '악령', 1),
+('惡', '惡鬼', '악귀', 0),
+('鬼', '惡鬼', '악귀', 1),
+('惡', '惡魔', '악마', 0),
+('魔', '惡魔', '악마', 1),
+('惡', '惡黨', '악당', 0),
+('黨', '惡黨', '악당', 1),
+('惰', '惰力', '타력', 0),
+('力', '惰力', '타력', 1),
+('惰', '惰性', '타성', 0),
+('性', '惰性', '타성', 1),
+('惱', '惱', '뇌', 0),
+('想', '想像', '상상', 0),
+('像', '想像', '상상', 1),
+('想', '想像力', '상상력', 0),
+('像', '想像力', '상상력', 1),
+('力', '想像力', '상상력', 2),
+('想', '想定', '상정', 0),
+('定', '想定', '상정', 1),
+('想', '想念', '상념', 0),
+('念', '想念', '상념', 1),
+('想', '想起', '상기', 0),
+('起', '想起', '상기', 1),
+('惹', '惹端', '야단', 0),
+('端', '惹端', '야단', 1),
+('惹', '惹起', '야기', 0),
+('起', '惹起', '야기', 1),
+('惻', '惻隱', '측은', 0),
+('隱', '惻隱', '측은', 1),
+('惻', '惻隱之心', '측은지심', 0),
+('隱', '惻隱之心', '측은지심', 1),
+('之', '惻隱之心', '측은지심', 2),
+('心', '惻隱之心', '측은지심', 3),
+('愉', '愉快', '유쾌', 0),
+('快', '愉快', '유쾌', 1),
+('意', '意中', '의중', 0),
+('中', '意中', '의중', 1),
+('意', '意向', '의향', 0),
+('向', '意向', '의향', 1),
+('意', '意味', '의미', 0),
+('味', '意味', '의미', 1),
+('意', '意味論', '의미론', 0),
+('味', '意味論', '의미론', 1),
+('論', '意味論', '의미론', 2),
+('意', '意圖', '의도', 0),
+('圖', '意圖', '의도', 1),
+('意', '意外', '의외', 0),
+('外', '意外', '의외', 1),
+('意', '意外-', '의외로', 0),
+('外', '意外-', '의외로', 1),
+('-', '意外-', '의외로', 2),
+('意', '意志', '의지', 0),
+('志', '意志', '의지', 1),
+('意', '意志力', '의지력', 0),
+('志', '意志力', '의지력', 1),
+('力', '意志力', '의지력', 2),
+('意', '意思', '의사', 0),
+('思', '意思', '의사', 1),
+('意', '意思疏通', '의사소통', 0),
+('思', '意思疏通', '의사소통', 1),
+('疏', '意思疏通', '의사소통', 2),
+('通', '意思疏通', '의사소통', 3),
+('意', '意慾', '의욕', 0),
+('慾', '意慾', '의욕', 1),
+('意', '意欲', '의욕', 0),
+('欲', '意欲', '의욕', 1),
+('意', '意義', '의의', 0),
+('義', '意義', '의의', 1),
+('意', '意見', '의견', 0),
+('見', '意見', '의견', 1),
+('意', '意見書', '의견서', 0),
+('見', '意見書', '의견서', 1),
+('書', '意見書', '의견서', 2),
+('意', '意見欄', '의견란', 0),
+('見', '意見欄', '의견란', 1),
+('欄', '意見欄', '의견란', 2),
+('意', '意識', '의식', 0),
+('識', '意識', '의식', 1),
+('愚', '愚', '우', 0),
+('愚', '愚事', '우사', 0),
+('事', '愚事', '우사', 1),
+('愚', '愚人', '우인', 0),
+('人', '愚人', '우인', 1),
+('愚', '愚民', '우민', 0),
+('民', '愚民', '우민', 1),
+('愚', '愚民 政策', '우민 정책', 0),
+('民', '愚民 政策', '우민 정책', 1),
+('政', '愚民 政策', '우민 정책', 3),
+('策', '愚民 政策', '우민 정책', 4),
+('愚', '愚民化 政策', '우민화 정책', 0),
+('民', '愚民化 政策', '우민화 정책', 1),
+('化', '愚民化 政策', '우민화 정책', 2),
+('政', '愚民化 政策', '우민화 정책', 4),
+('策', '愚民化 政策', '우민화 정책', 5),
+('愚', '愚臣', '우신', 0),
+('臣', '愚臣', '우신', 1),
+('愚', '愚鈍', '우둔', 0),
+('鈍', '愚鈍', '우둔', 1),
+('愛', '愛', '애', 0),
+('愛', '愛人', '애인', 0),
+('人', '愛人', '애인', 1),
+('愛', '愛國', '애국', 0),
+('國', '愛國', '애국', 1),
+('愛', '愛國主義', '애국주의', 0),
+('國', '愛國主義', '애국주의', 1),
+('主', '愛國主義', '애국주의', 2),
+('義', '愛國主義', '애국주의', 3),
+('愛', '愛國心', '애국심', 0),
+('國', '愛國心', '애국심', 1),
+('心', '愛國心', '애국심', 2),
+('愛', '愛國歌', '애국가', 0),
+('國', '愛國歌', '애국가', 1),
+('歌', '愛國歌', '애국가', 2),
+('愛', '愛國的', '애국적', 0),
+('國', '愛國的', '애국적', 1),
+('的', '愛國的', '애국적', 2),
+('愛', '愛國者', '애국자', 0),
+('國', '愛國者', '애국자', 1),
+('者', '愛國者', '애국자', 2),
+('愛', '愛好', '애호', 0),
+('好', '愛好', '애호', 1),
+('愛', '愛好家', '애호가', 0),
+('好', '愛好家', '애호가', 1),
+('家', '愛好家', '애호가', 2),
+('愛', '愛好者', '애호자', 0),
+('好', '愛好者', '애호자', 1),
+('者', '愛好者', '애호자', 2),
+('愛', '愛妻', '애처', 0),
+('妻', '愛妻', '애처', 1),
+('愛', '愛嬌', '애교', 0),
+('嬌', '愛嬌', '애교', 1),
+('愛', '愛子', '애자', 0),
+('子', '愛子', '애자', 1),
+('愛', '愛息', '애식', 0),
+('息', '愛息', '애식', 1),
+('愛', '愛情', '애정', 0),
+('情', '愛情', '애정', 1),
+('愛', '愛慕', '애모', 0),
+('慕', '愛慕', '애모', 1),
+('愛', '愛憎', '애증', 0),
+('憎', '愛憎', '애증', 1),
+('愛', '愛撫', '애무', 0),
+('撫', '愛撫', '애무', 1),
+('愛', '愛新覺羅', '애신각라', 0),
+('新', '愛新覺羅', '애신각라', 1),
+('覺', '愛新覺羅', '애신각라', 2),
+('羅', '愛新覺羅', '애신각라', 3),
+('愛', '愛月', '애월', 0),
+('月', '愛月', '애월', 1),
+('愛', '愛林', '애림', 0),
+('林', '愛林', '애림', 1),
+('愛', '愛液', '애액', 0),
+('液', '愛液', '애액', 1),
+('愛', '愛犬', '애견', 0),
+('犬', '愛犬', '애견', 1),
+('愛', '愛猫', '애묘', 0),
+('猫', '愛猫', '애묘', 1),
+('愛', '愛玩', '애완', 0),
+('玩', '愛玩', '애완', 1),
+('愛', '愛玩動物', '애완동물', 0),
+('玩', '愛玩動物', '애완동물', 1),
+('動', '愛玩動物', '애완동물', 2),
+('物', '愛玩動物', '애완동물', 3),
+('愛', '愛玩犬', '애완견', 0),
+('玩', '愛玩犬', '애완견', 1),
+('犬', '愛玩犬', '애완견', 2),
+('愛', '愛玩猫', '애완묘', 0),
+('玩', '愛玩猫', '애완묘', 1),
+('猫', '愛玩猫', '애완묘', 2),
+('愛', '愛玩鳥', '애완조', 0),
+('玩', '愛玩鳥', '애완조', 1),
+('鳥', '愛玩鳥', '애완조', 2),
+('愛', '愛着', '애착', 0),
+('着', '愛着', '애착', 1),
+('愛', '愛社心', '애사심', 0),
+('社', '愛社心', '애사심', 1),
+('心', '愛社心', '애사심', 2),
+('愛', '愛稱', '애칭', 0),
+('稱', '愛稱', '애칭', 1),
+('愛', '愛藏版', '애장판', 0),
+('藏', '愛藏版', '애장판', 1),
+('版', '愛藏版', '애장판', 2),
+('愛', '愛蘭', '애란', 0),
+('蘭', '愛蘭', '애란', 1),
+('愛', '愛護', '애호', 0),
+('護', '愛護', '애호', 1),
+('愛', '愛讀', '애독', 0),
+('讀', '愛讀', '애독', 1),
+('愛', '愛車', '애차', 0),
+('車', '愛車', '애차', 1),
+('愛', '愛酒', '애주', 0),
+('酒', '愛酒', '애주', 1),
+('愛', '愛顧', '애고', 0),
+('顧', '愛顧', '애고', 1),
+('愛', '愛馬', '애마', 0),
+('馬', '愛馬', '애마', 1),
+('愛', '愛鳥', '애조', 0),
+('鳥', '愛鳥', '애조', 1),
+('感', '感', '감', 0),
+('感', '感傷', '감상', 0),
+('傷', '感傷', '감상', 1),
+('感', '感傷主義', '감상주의', 0),
+('傷', '感傷主義', '감상주의', 1),
+('主', '感傷主義', '감상주의', 2),
+('義', '感傷主義', '감상주의', 3),
+('感', '感動', '감동', 0),
+('動', '感動', '감동', 1),
+('感', '感動的', '감동적', 0),
+('動', '感動的', '감동적', 1),
+('的', '感動的', '감동적', 2),
+('感', '感動詞', '감동사', 0),
+('動', '感動詞', '감동사', 1),
+('詞', '感動詞', '감동사', 2),
+('感', '感化', '감화', 0),
+('化', '感化', '감화', 1),
+('感', '感受', '감수', 0),
+('受', '感受', '감수', 1),
+('感', '感受性', '감수성', 0),
+('受', '感受性', '감수성', 1),
+('性', '感受性', '감수성', 2),
+('感', '感嘆', '감탄', 0),
+('嘆', '感嘆', '감탄', 1),
+('感', '感恩', '감은', 0),
+('恩', '感恩', '감은', 1),
+('感', '感情', '감정', 0),
+('情', '感情', '감정', 1),
+('感', '感情家', '감정가', 0),
+('情', '感情家', '감정가', 1),
+('家', '感情家', '감정가', 2),
+('感', '感想', '감상', 0),
+('想', '感想', '감상', 1),
+('感', '感應', '감응', 0),
+('應', '感應', '감응', 1),
+('感', '感染', '감염', 0),
+('染', '感染', '감염', 1),
+('感', '感染症', '감염증', 0),
+('染', '感染症', '감염증', 1),
+('症', '感染症', '감염증', 2),
+('感', '感歎', '감탄', 0),
+('歎', '感歎', '감탄', 1),
+('感', '感歎詞', '감탄사', 0),
+('歎', '感歎詞', '감탄사', 1),
+('詞', '感歎詞', '감탄사', 2),
+('感', '感氣', '감긔', 0),
+('氣', '感氣', '감긔', 1),
+('感', '感氣', '감기', 0),
+('氣', '感氣', '감기', 1),
+('感', '感激', '감격', 0),
+('激', '感激', '감격', 1),
+('感', '感知', '감지', 0),
+('知', '感知', '감지', 1),
+('感', '感知機', '감지기', 0),
+('知', '感知機', '감지기', 1),
+('機', '感知機', '감지기', 2),
+('感', '感興', '감흥', 0),
+('興', '感興', '감흥', 1),
+('感', '感覺', '감각', 0),
+('覺', '感覺', '감각', 1),
+('感', '感覺器', '감각기', 0),
+('覺', '感覺器', '감각기', 1),
+('器', '感覺器', '감각기', 2),
+('感', '感覺的', '감각적', 0),
+('覺', '感覺的', '감각적', 1),
+('的', '感覺的', '감각적', 2),
+('感', '感謝', '감사', 0),
+('謝', '感謝', '감사', 1),
+('感', '感銘', '감명', 0),
+('銘', '感銘', '감명', 1),
+('感', '感電', '감전', 0),
+('電', '感電', '감전', 1),
+('感', '感電死', '감전사', 0),
+('電', '感電死', '감전사', 1),
+('死', '感電死', '감전사', 2),
+('感', '感頌', '감송', 0),
+('頌', '感頌', '감송', 1),
+('愼', '愼重', '신중', 0),
+('重', '愼重', '신중', 1),
+('慇', '慇懃', '은근', 0),
+('懃', '慇懃', '은근', 1),
+('慈', '慈主', '자주', 0),
+('主', '慈主', '자주', 1),
+('慈', '慈善', '자선', 0),
+('善', '慈善', '자선', 1),
+('慈', '慈悲', '자비', 0),
+('悲', '慈悲', '자비', 1),
+('慈', '慈愛', '자애', 0),
+('愛', '慈愛', '자애', 1),
+('慈', '慈江道', '자강도', 0),
+('江', '慈江道', '자강도', 1),
+('道', '慈江道', '자강도', 2),
+('態', '態度', '태도', 0),
+('度', '態度', '태도', 1),
+('態', '態樣', '태양', 0),
+('樣', '態樣', '태양', 1),
+('慘', '慘事', '참사', 0),
+('事', '慘事', '참사', 1),
+('慘', '慘慽', '참척', 0),
+('慽', '慘慽', '참척', 1),
+('慘', '慘敗', '참패', 0),
+('敗', '慘敗', '참패', 1),
+('慘', '慘酷', '참혹', 0),
+('酷', '慘酷', '참혹', 1),
+('慢', '慢性', '만성', 0),
+('性', '慢性', '만성', 1),
+('慢', '慢性的', '만성적', 0),
+('性', '慢性的', '만성적', 1),
+('的', '慢性的', '만성적', 2),
+('慣', '慣例', '관례', 0),
+('例', '慣例', '관례', 1),
+('慣', '慣性', '관성', 0),
+('性', '慣性', '관성', 1),
+('慣', '慣用', '관용', 0),
+('用', '慣用', '관용', 1),
+('慣', '慣用句', '관용구', 0),
+('用', '慣用句', '관용구', 1),
+('句', '慣用句', '관용구', 2),
+('慣', '慣習', '관습', 0),
+('習', '慣習', '관습', 1),
+('慣', '慣行', '관행', 0),
+('行', '慣行', '관행', 1),
+('慫', '慫慂', '종용', 0),
+('慂', '慫慂', '종용', 1),
+('慰', '慰勞', '위로', 0),
+('勞', '慰勞', '위로', 1),
+('慰', '慰安', '위안', 0),
+('安', '慰安', '위안', 1),
+('慰', '慰安婦', '위안부', 0),
+('安', '慰安婦', '위안부', 1),
+('婦', '慰安婦', '위안부', 2),
+('慰', '慰安者', '위안자', 0),
+('安', '慰安者', '위안자', 1),
+('者', '慰安者', '위안자', 2),
+('慰', '慰樂', '위락', 0),
+('樂', '慰樂', '위락', 1),
+('慰', '慰樂施設', '위락시설', 0),
+('樂', '慰樂施設', '위락시설', 1),
+('施', '慰樂施設', '위락시설', 2),
+('設', '慰樂施設', '위락시설', 3),
+('慰', '慰藉', '위자', 0),
+('藉', '慰藉', '위자', 1),
+('慰', '慰藉料', '위자료', 0),
+('藉', '慰藉料', '위자료', 1),
+('料', '慰藉料', '위자료', 2),
+('慰', '慰靈祭', '위령제', 0),
+('靈', '慰靈祭', '위령제', 1),
+('祭', '慰靈祭', '위령제', 2),
+('慶', '慶事', '경사', 0),
+('事', '慶事', '경사', 1),
+('慶', '慶北', '경북', 0),
+('北', '慶北', '경북', 1),
+('慶', '慶南', '경남', 0),
+('南', '慶南', '경남', 1),
+('慶', '慶尙北道', '경상북도', 0),
+('尙', '慶尙北道', '경상북도', 1),
+('北', '慶尙北道', '경상북도', 2),
+('道', '慶尙北道', '경상북도', 3),
+('慶', '慶尙南道', '경상남도', 0),
+('尙', '慶尙南道', '경상남도', 1),
+('南', '慶尙南道', '경상남도', 2),
+('道', '慶尙南道', '경상남도', 3),
+('慶', '慶尙道', '경상도', 0),
+('尙', '慶尙道', '경상도', 1),
+('道', '慶尙道', '경상도', 2),
+('慶', '慶州', '경주', 0),
+('州', '慶州', '경주', 1),
+('慶', '慶祝', '경축', 0),
+('祝', '慶祝', '경축', 1),
+('慶', '慶賀', '경하', 0),
+('賀', '慶賀', '경하', 1),
+('慾', '慾心', '욕심', 0),
+('心', '慾心', '욕심', 1),
+('慾', '慾望', '욕망', 0),
+('望', '慾望', '욕망', 1),
+('慾', '慾求', '욕구', 0),
+('求', '慾求', '욕구', 1),
+('憂', '憂國', '우국', 0),
+('國', '憂國', '우국', 1),
+('憂', '憂慮', '우려', 0),
+('慮', '憂慮', '우려', 1),
+('憂', '憂鬱', '우울', 0),
+('鬱', '憂鬱', '우울', 1),
+('憂', '憂鬱症', '우울증', 0),
+('鬱', '憂鬱症', '우울증', 1),
+('症', '憂鬱症', '우울증', 2),
+('憂', '憂鬱證', '우울증', 0),
+('鬱', '憂鬱證', '우울증', 1),
+('證', '憂鬱證', '우울증', 2),
+('憎', '憎惡', '증오', 0),
+('惡', '憎惡', '증오', 1),
+('憎', '憎惡心', '증오심', 0),
+('惡', '憎惡心', '증오심', 1),
+('心', '憎惡心', '증오심', 2),
+('憐', '憐愍', '연민', 0),
+('愍', '憐愍', '연민', 1),
+('憐', '憐憫', '연민', 0),
+('憫', '憐憫', '연민', 1),
+('憤', '憤怒', '분노', 0),
+('怒', '憤怒', '분노', 1),
+('憤', '憤愾', '분개', 0),
+('愾', '憤愾', '분개', 1),
+('憤', '憤慨', '분개', 0),
+('慨', '憤慨', '분개', 1),
+('憤', '憤懣', '분만', 0),
+('懣', '憤懣', '분만', 1),
+('憧', '憧憬', '동경', 0),
+('憬', '憧憬', '동경', 1),
+('憲', '憲兵', '헌병', 0),
+('兵', '憲兵', '헌병', 1),
+('憲', '憲法', '헌법', 0),
+('法', '憲法', '헌법', 1),
+('憲', '憲章', '헌장', 0),
+('章', '憲章', '헌장', 1),
+('懇', '懇請', '간청', 0),
+('請', '懇請', '간청', 1),
+('應', '應分', '응분', 0),
+('分', '應分', '응분', 1),
+('應', '應募', '응모', 0),
+('募', '應募', '응모', 1),
+('應', '應募者', '응모자', 0),
+('募', '應募者', '응모자', 1),
+('者', '應募者', '응모자', 2),
+('應', '應召', '응소', 0),
+('召', '應召', '응소', 1),
+('應', '應召兵', '응소병', 0),
+('召', '應召兵', '응소병', 1),
+('兵', '應召兵', '응소병', 2),
+('應', '應報', '응보', 0),
+('報', '應報', '응보', 1),
+('應', '應對', '응대', 0),
+('對', '應對', '응대', 1),
+('應', '應急', '응급', 0),
+('急', '應急', '응급', 1),
+('應', '應急室', '응급실', 0),
+('急', '應急室', '응급실', 1),
+('室', '應急室', '응급실', 2),
+('應', '應接', '응접', 0),
+('接', '應接', '응접', 1),
+('應', '應接室', '응접실', 0),
+('接', '應接室', '응접실', 1),
+('室', '應接室', '응접실', 2),
+('應', '應援', '응원', 0),
+('援', '應援', '응원', 1),
+('應', '應然', '응연', 0),
+('然', '應然', '응연', 1),
+('應', '應用', '응용', 0),
+('用', '應用', '응용', 1),
+('應', '應當', '응당', 0),
+('當', '應當', '응당', 1),
+('應', '應答', '응답', 0),
+('答', '應答', '응답', 1),
+('應', '應答機', '응답기', 0),
+('答', '應答機', '응답기', 1),
+('機', '應答機', '응답기', 2),
+('應', '應訴', '응소', 0),
+('訴', '應訴', '응소', 1),
+('應', '應試', '응시', 0),
+('試', '應試', '응시', 1),
+('應', '應酬', '응수', 0),
+('酬', '應酬', '응수', 1),
+('懲', '懲役', '징역', 0),
+('役', '懲役', '징역', 1),
+('懲', '懲戒', '징계', 0),
+('戒', '懲戒', '징계', 1),
+('懲', '懲罰', '징벌', 0),
+('罰', '懲罰', '징벌', 1),
+('懷', '懷中', '회중', 0),
+('中', '懷中', '회중', 1),
+('懷', '懷中日記', '회중일기', 0),
+('中', '懷中日記', '회중일기', 1),
+('日', '懷中日記', '회중일기', 2),
+('記', '懷中日記', '회중일기', 3),
+('懷', '懷中時計', '회중시계', 0),
+('中', '懷中時計', '회중시계', 1),
+('時', '懷中時計', '회중시계', 2),
+('計', '懷中時計', '회중시계', 3),
+('懷', '懷中鏡', '회중경', 0),
+('中', '懷中鏡', '회중경', 1),
+('鏡', '懷中鏡', '회중경', 2),
+('懷', '懷劍', '회검', 0),
+('劍', '懷劍', '회검', 1),
+('懷', '懷抱', '회포', 0),
+('抱', '懷抱', '회포', 1),
+('懷', '懷柔', '회유', 0),
+('柔', '懷柔', '회유', 1),
+('懷', '懷疑', '회의', 0),
+('疑', '懷疑', '회의', 1),
+('懸', '懸崖', '현애', 0),
+('崖', '懸崖', '현애', 1),
+('懸', '懸念', '현념', 0),
+('念', '懸念', '현념', 1),
+('懸', '懸賞', '현상', 0),
+('賞', '懸賞', '현상', 1),
+('懺', '懺悔', '참회', 0),
+('悔', '懺悔', '참회', 1),
+('懿', '懿旨', '의지', 0),
+('旨', '懿旨', '의지', 1),
+('戀', '戀人', '연인', 0),
+('人', '戀人', '연인', 1),
+('戀', '戀情', '연정', 0),
+('情', '戀情', '연정', 1),
+('戀', '戀愛', '련애', 0),
+('愛', '戀愛', '련애', 1),
+('戀', '戀愛', '연애', 0),
+('愛', '戀愛', '연애', 1),
+('戀', '戀愛便紙', '연애편지', 0),
+('愛', '戀愛便紙', '연애편지', 1),
+('便', '戀愛便紙', '연애편지', 2),
+('紙', '戀愛便紙', '연애편지', 3),
+('戀', '戀戀', '연연', 0),
+('戀', '戀戀', '연연', 1),
+('戀', '戀敵', '연적', 0),
+('敵', '戀敵', '연적', 1),
+('戀', '戀歌', '연가', 0),
+('歌', '戀歌', '연가', 1),
+('戊', '戊', '무', 0),
+('戊', '戊午', '무오', 0),
+('午', '戊午', '무오', 1),
+('戊', '戊子', '무자', 0),
+('子', '戊子', '무자', 1),
+('戊', '戊寅', '무인', 0),
+('寅', '戊寅', '무인', 1),
+('戊', '戊戌', '무술', 0),
+('戌', '戊戌', '무술', 1),
+('戊', '戊申', '무신', 0),
+('申', '戊申', '무신', 1),
+('戊', '戊辰', '무진', 0),
+('辰', '戊辰', '무진', 1),
+('成', '成人', '성인', 0),
+('人', '成人', '성인', 1),
+('成', '成分', '성분', 0),
+('分', '成分', '성분', 1),
+('成', '成功', '성공', 0),
+('功', '成功', '성공', 1),
+('成', '成功的', '성공적', 0),
+('功', '成功的', '성공적', 1),
+('的', '成功的', '성공적', 2),
+('成', '成句', '성구', 0),
+('句', '成句', '성구', 1),
+('成', '成均館', '성균관', 0),
+('均', '成均館', '성균관', 1),
+('館', '成均館', '성균관', 2),
+('成', '成就', '성취', 0),
+('就', '成就', '성취', 1),
+('成', '成層圈', '성층권', 0),
+('層', '成層圈', '성층권', 1),
+('圈', '成層圈', '성층권', 2),
+('成', '成年', '성년', 0),
+('年', '成年', '성년', 1),
+('成', '成形', '성형', 0),
+('形', '成形', '성형', 1),
+('成', '成德', '성덕', 0),
+('德', '成德', '성덕', 1),
+('成', '成文', '성문', 0),
+('文', '成文', '성문', 1),
+('成', '成文化', '성문화', 0),
+('文', '成文化', '성문화', 1),
+('化', '成文化', '성문화', 2),
+('成', '成果', '성과', 0),
+('果', '成果', '성과', 1),
+('成', '成熟', '성숙', 0),
+('熟', '成熟', '성숙', 1),
+('成', '成立', '성립', 0),
+('立', '成立', '성립', 1),
+('成', '成績', '성적', 0),
+('績', '成績', '성적', 1),
+('成', '成績表', '성적표', 0),
+('績', '成績表', '성적표', 1),
+('表', '成績表', '성적표', 2),
+('成', '成語', '성어', 0),
+('語', '成語', '성어', 1),
+('成', '成長', '성장', 0),
+('長', '成長', '성장', 1),
+('成', '成덕', '성덕', 0),
+('덕', '成덕', '성덕', 1),
+('我', '我', '아', 0),
+('我', '我國', '아국', 0),
+('國', '我國', '아국', 1),
+('我', '我執', '아집', 0),
+('執', '我執', '아집', 1),
+('我', '我是他非', '아시타비', 0),
+('是', '我是他非', '아시타비', 1),
+('他', '我是他非', '아시타비', 2),
+('非', '我是他非', '아시타비', 3),
+('我', '我朝', '아조', 0),
+('朝', '我朝', '아조', 1),
+('我', '我田引水', '아전인수', 0),
+('田', '我田引水', '아전인수', 1),
+('引', '我田引水', '아전인수', 2),
+('水', '我田引水', '아전인수', 3),
+('我', '我軍', '아군', 0),
+('軍', '我軍', '아군', 1),
+('我', '我軍  射', '아군 사격', 0),
+('軍', '我軍  射', '아군 사격', 1),
+('射', '我軍  射', '아군 사격', 4),
+('戒', '戒名', '계명', 0),
+('名', '戒名', '계명', 1),
+('戒', '戒嚴', '계엄', 0),
+('嚴', '戒嚴', '계엄', 1),
+('戒', '戒嚴令', '계엄령', 0),
+('嚴', '戒嚴令', '계엄령', 1),
+('令', '戒嚴令', '계엄령', 2),
+('或', '或-', '혹은', 0),
+('-', '或-', '혹은', 1),
+('或', '或如', '혹여', 0),
+('如', '或如', '혹여', 1),
+('或', '或是', '혹시', 0),
+('是', '或是', '혹시', 1),
+('或', '或者', '혹자', 0),
+('者', '或者', '혹자', 1),
+('截', '截拳道', '절권도', 0),
+('拳', '截拳道', '절권도', 1),
+('道', '截拳道', '절권도', 2),
+('截', '截斷', '절단', 0),
+('斷', '截斷', '절단', 1),
+('截', '截臍', '절제', 0),
+('臍', '截臍', '절제', 1),
+('戰', '戰亂', '전란', 0),
+('亂', '戰亂', '전란', 1),
+('戰', '戰利品', '전리품', 0),
+('利', '戰利品', '전리품', 1),
+('品', '戰利品', '전리품', 2),
+('戰', '戰力', '전력', 0),
+('力', '戰力', '전력', 1),
+('戰', '戰勢', '전세', 0),
+('勢', '戰勢', '전세', 1),
+('戰', '戰友', '전우', 0),
+('友', '戰友', '전우', 1),
+('戰', '戰國', '전국', 0),
+('國', '戰國', '전국', 1),
+('戰', '戰團', '전단', 0),
+('團', '戰團', '전단', 1),
+('戰', '戰場', '전장', 0),
+('場', '戰場', '전장', 1),
+('戰', '戰士', '전사', 0),
+('士', '戰士', '전사', 1),
+('戰', '戰局', '전국', 0),
+('局', '戰局', '전국', 1),
+('戰', '戰役', '전역', 0),
+('役', '戰役', '전역', 1),
+('戰', '戰後', '전후', 0),
+('後', '戰後', '전후', 1),
+('戰', '戰慄', '전율', 0),
+('慄', '戰慄', '전율', 1),
+('戰', '戰時', '전시', 0),
+('時', '戰時', '전시', 1),
+('戰', '戰死', '전사', 0),
+('死', '戰死', '전사', 1),
+('戰', '戰況', '전황', 0),
+('況', '戰況', '전황', 1),
+('戰', '戰法', '전법', 0),
+('法', '戰法', '전법', 1),
+('戰', '戰火', '전화', 0),
+('火', '戰火', '전화', 1),
+('戰', '戰爭', '전쟁', 0),
+('爭', '戰爭', '전쟁', 1),
+('戰', '戰爭', '졘쟝', 0),
+('爭', '戰爭', '졘쟝', 1),
+('戰', '戰爭狂', '전쟁광', 0),
+('爭', '戰爭狂', '전쟁광', 1),
+('狂', '戰爭狂', '전쟁광', 2),
+('戰', '戰犯', '전범', 0),
+('犯', '戰犯', '전범', 1),
+('戰', '戰略', '전략', 0),
+('略', '戰略', '전략', 1),
+('戰', '戰略家', '전략가', 0),
+('略', '戰略家', '전략가', 1),
+('家', '戰略家', '전략가', 2),
+('戰', '戰禍', '전화', 0),
+('禍', '戰禍', '전화', 1),
+('戰', '戰端', '전단', 0),
+('端', '戰端', '전단', 1),
+('戰', '戰線', '전선', 0),
+('線', '戰線', '전선', 1),
+('戰', '戰船', '전선', 0),
+('船', '戰船', '전선', 1),
+('戰', '戰艦', '전함', 0),
+('艦', '戰艦', '전함', 1),
+('戰', '戰術', '전술', 0),
+('術', '戰術', '전술', 1),
+('戰', '戰車', '전차', 0),
+('車', '戰車', '전차', 1),
+('戰', '戰隊', '전대', 0),
+('隊', '戰隊', '전대', 1),
+('戰', '戰雲', '전운', 0),
+('雲', '戰雲', '전운', 1),
+('戰', '戰鬪', '전투', 0),
+('鬪', '戰鬪', '전투', 1),
+('戰', '戰鬪員', '전투원', 0),
+('鬪', '戰鬪員', '전투원', 1),
+('員', '戰鬪員', '전투원', 2),
+('戰', '戰鬪機', '전투기', 0),
+('鬪', '戰鬪機', '전투기', 1),
+('機', '戰鬪機', '전투기', 2),
+('戱', '戱曲', '희곡', 0),
+('曲', '戱曲', '희곡', 1),
+('戱', '戱曲集', '희곡집', 0),
+('曲', '戱曲集', '희곡집', 1),
+('集', '戱曲集', '희곡집', 2),
+('戴', '戴冠式', '대관식', 0),
+('冠', '戴冠式', '대관식', 1),
+('式', '戴冠式', '대관식', 2),
+('戶', '戶', '호', 0),
+('戶', '戶口', '호구', 0),
+('口', '戶口', '호구', 1),
+('戶', '戶外', '호외', 0),
+('外', '戶外', '호외', 1),
+('戶', '戶戶', '호호', 0),
+('戶', '戶戶', '호호', 1),
+('戶', '戶籍', '호적', 0),
+('籍', '戶籍', '호적', 1),
+('房', '房', '방', 0),
+('房', '房--', '방바닥', 0),
+('-', '房--', '방바닥', 1),
+('-', '房--', '방바닥', 2),
+('房', '房事', '방사', 0),
+('事', '房事', '방사', 1),
+('房', '房門', '방문', 0),
+('門', '房門', '방문', 1),
+('所', '所員', '소원', 0),
+('員', '所員', '소원', 1),
+('所', '所在', '소재', 0),
+('在', '所在', '소재', 1),
+('所', '所在地', '소재지', 0),
+('在', '所在地', '소재지', 1),
+('地', '所在地', '소재지', 2),
+('所', '所屬', '소속', 0),
+('屬', '所屬', '소속', 1),
+('所', '所得', '소득', 0),
+('得', '所得', '소득', 1),
+('所', '所持人', '소지인', 0),
+('持', '所持人', '소지인', 1),
+('人', '所持人', '소지인', 2),
+('所', '所持品', '소지품', 0),
+('持', '所持品', '소지품', 1),
+('品', '所持品', '소지품', 2),
+('所', '所有', '소유', 0),
+('有', '所有', '소유', 1),
+('所', '所有物', '소유물', 0),
+('有', '所有物', '소유물', 1),
+('物', '所有物', '소유물', 2),
+('所', '所有者', '소유자', 0),
+('有', '所有者', '소유자', 1),
+('者', '所有者', '소유자', 2),
+('所', '所望', '소망', 0),
+('望', '所望', '소망', 1),
+('所', '所用', '소용', 0),
+('用', '所用', '소용', 1),
+('所', '所用--', '소용없다', 0),
+('用', '所用--', '소용없다', 1),
+('-', '所用--', '소용없다', 2),
+('-', '所用--', '소용없다', 3),
+('所', '所聞', '소문', 0),
+('聞', '所聞', '소문', 1),
+('所', '所致', '소치', 0),
+('致', '所致', '소치', 1),
+('所', '所要', '소요', 0),
+('要', '所要', '소요', 1),
+('所', '所謂', '소위', 0),
+('謂', '所謂', '소위', 1),
+('所', '所重', '소중', 0),
+('重', '所重', '소중', 1),
+('所', '所願', '소원', 0),
+('願', '所願', '소원', 1),
+('扁', '扁桃', '편도', 0),
+('桃', '扁桃', '편도', 1),
+('扁', '扁桃炎', '편도염', 0),
+('桃', '扁桃炎', '편도염', 1),
+('炎', '扁桃炎', '편도염', 2),
+('扁', '扁桃腺', '편도선', 0),
+('桃', '扁桃腺', '편도선', 1),
+('腺', '扁桃腺', '편도선', 2),
+('扁', '扁鵲', '편작', 0),
+('鵲', '扁鵲', '편작', 1),
+('扇', '扇風機', '선풍기', 0),
+('風', '扇風機', '선풍기', 1),
+('機', '扇風機', '선풍기', 2),
+('手', '手', '수', 0),
+('手', '手入', '수입', 0),
+('入', '手入', '수입', 1),
+('手', '手匣', '수갑', 0),
+('匣', '手匣', '수갑', 1),
+('手', '手寫', '수사', 0),
+('寫', '手寫', '수사', 1),
+('手', '手工業', '수공업', 0),
+('工', '手工業', '수공업', 1),
+('業', '手工業', '수공업', 2),
+('手', '手巾', '수건', 0),
+('巾', '手巾', '수건', 1),
+('手', '手帖', '수첩', 0),
+('帖', '手帖', '수첩', 1),
+('手', '手數料', '수수료', 0),
+('數', '手數料', '수수료', 1),
+('料', '手數料', '수수료', 2),
+('手', '手榴彈', '수류탄', 0),
+('榴', '手榴彈', '수류탄', 1),
+('彈', '手榴彈', '수류탄', 2),
+('手', '手榴彈', '수유탄', 0),
+('榴', '手榴彈', '수유탄', 1),
+('彈', '手榴彈', '수유탄', 2),
+('手', '手段', '수단', 0),
+('段', '手段', '수단', 1),
+('手', '手法', '수법', 0),
+('法', '手法', '수법', 1),
+('手', '手淫', '수음', 0),
+('淫', '手淫', '수음', 1),
+('手', '手當', '수당', 0),
+('當', '手當', '수당', 1),
+('手', '手票', '수표', 0),
+('票', '手票', '수표', 1),
+('手', '手筋', '수근', 0),
+('筋', '手筋', '수근', 1),
+('手', '手細工', '수세공', 0),
+('細', '手細工', '수세공', 1),
+('工', '手細工', '수세공', 2),
+('手', '手續', '수속', 0),
+('續', '手續', '수속', 1),
+('手', '手荷物', '수하물', 0),
+('荷', '手荷物', '수하물', 1),
+('物', '手荷物', '수하물', 2),
+('手', '手藝', '수예', 0),
+('藝', '手藝', '수예', 1),
+('手', '手術', '수술', 0),
+('術', '手術', '수술', 1),
+('手', '手裏劍', '수리검', 0),
+('裏', '手裏劍', '수리검', 1),
+('劍', '手裏劍', '수리검', 2),
+('手', '手記', '수기', 0),
+('記', '手記', '수기', 1),
+('手', '手話', '수화', 0),
+('話', '手話', '수화', 1),
+('手', '手語', '수어', 0),
+('語', '手語', '수어', 1),
+('手', '手足', '수족', 0),
+('足', '手足', '수족', 1),
+('手', '手風琴', '수풍금', 0),
+('風', '手風琴', '수풍금', 1),
+('琴', '手風琴', '수풍금', 2),
+('才', '才勝德薄', '재승덕박', 0),
+('勝', '才勝德薄', '재승덕박', 1),
+('德', '才勝德薄', '재승덕박', 2),
+('薄', '才勝德薄', '재승덕박', 3),
+('才', '才媛', '재원', 0),
+('媛', '才媛', '재원', 1),
+('才', '才能', '재능', 0),
+('能', '才能', '재능', 1),
+('打', '打', '타', 0),
+('打', '打倒', '타도', 0),
+('倒', '打倒', '타도', 1),
+('打', '打字', '타자', 0),
+('字', '打字', '타자', 1),
+('打', '打字機', '타자기', 0),
+('字', '打字機', '타자기', 1),
+('機', '打字機', '타자기', 2),
+('打', '打席', '타석', 0),
+('席', '打席', '타석', 1),
+('打', '打撲', '타박', 0),
+('撲', '打撲', '타박', 1),
+('打', '打撲傷', '타박상', 0),
+('撲', '打撲傷', '타박상', 1),
+('傷', '打撲傷', '타박상', 2),
+('打', '打擊', '타격', 0),
+('擊', '打擊', '타격', 1),
+('打', '打擊數', '타격수', 0),
+('擊', '打擊數', '타격수', 1),
+('數', '打擊數', '타격수', 2),
+('打', '打數', '타수', 0),
+('數', '打數', '타수', 1),
+('打', '打樂器', '타악기', 0),
+('樂', '打樂器', '타악기', 1),
+('器', '打樂器', '타악기', 2),
+('打', '打率', '타율', 0),
+('率', '打率', '타율', 1),
+('打', '打破', '타파', 0),
+('破', '打破', '타파', 1),
+('打', '打算', '타산', 0),
+('算', '打算', '타산', 1),
+('打', '打者', '타자', 0),
+('者', '打者', '타자', 1),
+('打', '打電', '타전', 0),
+('電', '打電', '타전', 1),
+('打', '打點', '타점', 0),
+('點', '打點', '타점', 1),
+('托', '托肩', '태껸', 0),
+('肩', '托肩', '태껸', 1),
+('扶', '扶南', '부남', 0),
+('南', '扶南', '부남', 1),
+('扶', '扶桑', '부상', 0),
+('桑', '扶桑', '부상', 1),
+('扶', '扶養', '부양', 0),
+('養', '扶養', '부양', 1),
+('批', '批准', '비준', 0),
+('准', '批准', '비준', 1),
+('批', '批判', '비판', 0),
+('判', '批判', '비판', 1),
+('批', '批判的', '비판적', 0),
+('判', '批判的', '비판적', 1),
+('的', '批判的', '비판적', 2),
+('批', '批評', '비평', 0),
+('評', '批評', '비평', 1),
+('批', '批評家', '비평가', 0),
+('評', '批評家', '비평가', 1),
+('家', '批評家', '비평가', 2),
+('承', '承服', '승복', 0),
+('服', '承服', '승복', 1),
+('承', '承繼', '승계', 0),
+('繼', '承繼', '승계', 1),
+('承', '承認', '승인', 0),
+('認', '承認', '승인', 1),
+('承', '承諾', '승낙', 0),
+('諾', '承諾', '승낙', 1),
+('技', '技士', '기사', 0),
+('士', '技士', '기사', 1),
+('技', '技巧', '기교', 0),
+('巧', '技巧', '기교', 1),
+('技', '技師', '기사', 0),
+('師', '技師', '기사', 1),
+('技', '技法', '기법', 0),
+('法', '技法', '기법', 1),
+('技', '技能', '기능', 0),
+('能', '技能', '기능', 1),
+('技', '技術', '기술', 0),
+('術', '技術', '기술', 1),
+('技', '技術者', '기술자', 0),
+('術', '技術者', '기술자', 1),
+('者', '技術者', '기술자', 2),
+('抄', '抄錄', '초록', 0),
+('錄', '抄錄', '초록', 1),
+('把', '把握', '파악', 0),
+('握', '把握', '파악', 1),
+('抑', '抑制', '억제', 0),
+('制', '抑制', '억제', 1),
+('抑', '抑壓', '억압', 0),
+('壓', '抑壓', '억압', 1),
+('抑', '抑強扶弱', '억강부약', 0),
+('強', '抑強扶弱', '억강부약', 1),
+('扶', '抑強扶弱', '억강부약', 2),
+('弱', '抑強扶弱', '억강부약', 3),
+('抑', '抑强扶弱', '억강부약', 0),
+('强', '抑强扶弱', '억강부약', 1),
+('扶', '抑强扶弱', '억강부약', 2),
+('弱', '抑强扶弱', '억강부약', 3),
+('抑', '抑揚', '억양', 0),
+('揚', '抑揚', '억양', 1),
+('抑', '抑止', '억지', 0),
+('止', '抑止', '억지', 1),
+('抑', '抑止力', '억지력', 0),
+('止', '抑止力', '억지력', 1),
+('力', '抑止力', '억지력', 2),
+('抑', '抑留', '억류', 0),
+('留', '抑留', '억류', 1),
+('抑', '抑留者', '억류자', 0),
+('留', '抑留者', '억류자', 1),
+('者', '抑留者', '억류자', 2),
+('抑', '抑音  符', '억음 부호', 0),
+('音', '抑音  符', '억음 부호', 1),
+('符', '抑音  符', '억음 부호', 4),
+('抑', '抑鬱', '억울', 0),
+('鬱', '抑鬱', '억울', 1),
+('抒', '抒情', '서정', 0),
+('情', '抒情', '서정', 1),
+('抒', '抒情詩', '서정시', 0),
+('情', '抒情詩', '서정시', 1),
+('詩', '抒情詩', '서정시', 2),
+('投', '投下', '투하', 0),
+('下', '投下', '투하', 1),
+('投', '投光器', '투광기', 0),
+('光', '投光器', '투광기', 1),
+('器', '投光器', '투광기', 2),
+('投', '投入', '투입', 0),
+('入', '投入', '투입', 1),
+('投', '投函', '투함', 0),
+('函', '投函', '투함', 1),
+('投', '投宿', '투숙', 0),
+('宿', '投宿', '투숙', 1),
+('投', '投射', '투사', 0),
+('射', '投射', '투사', 1),
+('投', '投影機', '투영기', 0),
+('影', '投影機', '투영기', 1),
+('機', '投影機', '투영기', 2),
+('投', '投手', '투수', 0),
+('手', '投手', '투수', 1),
+('投', '投擲', '투척', 0),
+('擲', '投擲', '투척', 1),
+('投', '投書', '투서', 0),
+('書', '投書', '투서', 1),
+('投', '投槍', '투창', 0),
+('槍', '投槍', '투창', 1),
+('投', '投機', '투기', 0),
+('機', '投機', '투기', 1),
+('投', '投機場', '투기장', 0),
+('機', '投機場', '투기장', 1),
+('場', '投機場', '투기장', 2),
+('投', '投獄', '투옥', 0),
+('獄', '投獄', '투옥', 1),
+('投', '投球', '투구', 0),
+('球', '投球', '투구', 1),
+('投', '投球數', '투구수', 0),
+('球', '投球數', '투구수', 1),
+('數', '投球數', '투구수', 2),
+('投', '投砲丸', '투포환', 0),
+('砲', '投砲丸', '투포환', 1),
+('丸', '投砲丸', '투포환', 2),
+('投', '投票', '투표', 0),
+('票', '投票', '투표', 1),
+('投', '投票函', '투표함', 0),
+('票', '投票函', '투표함', 1),
+('函', '投票函', '투표함', 2),
+('投', '投票率', '투표율', 0),
+('票', '投票率', '투표율', 1),
+('率', '投票率', '투표율', 2),
+('投', '投票用紙', '투표용지', 0),
+('票', '投票用紙', '투표용지', 1),
+('用', '投票用紙', '투표용지', 2),
+('紙', '投票用紙', '투표용지', 3),
+('投', '投票者', '투표자', 0),
+('票', '投票者', '투표자', 1),
+('者', '投票者', '투표자', 2),
+('投', '投稿', '투고', 0),
+('稿', '投稿', '투고', 1),
+('投', '投藥', '투약', 0),
+('藥', '投藥', '투약', 1),
+('投', '投資', '투자', 0),
+('資', '投資', '투자', 1),
+('投', '投資者', '투자자', 0),
+('資', '投資者', '투자자', 1),
+('者', '投資者', '투자자', 2),
+('投', '投降', '투항', 0),
+('降', '投降', '투항', 1),
+('抗', '抗原', '항원', 0),
+('原', '抗原', '항원', 1),
+('抗', '抗告', '항고', 0),
+('告', '抗告', '항고', 1),
+('抗', '抗戰', '항전', 0),
+('戰', '抗戰', '항전', 1),
+('抗', '抗日', '항일', 0),
+('日', '抗日', '항일', 1),
+('抗', '抗毒素', '항독소', 0),
+('毒', '抗毒素', '항독소', 1),
+('素', '抗毒素', '항독소', 2),
+('抗', '抗爭', '항쟁', 0),
+('爭', '抗爭', '항쟁', 1),
+('抗', '抗生劑', '항생제', 0),
+('生', '抗生劑', '항생제', 1),
+('劑', '抗生劑', '항생제', 2),
+('抗', '抗生物質', '항생물질', 0),
+('生', '抗生物質', '항생물질', 1),
+('物', '抗生物質', '항생물질', 2),
+('質', '抗生物質', '항생물질', 3),
+('抗', '抗疫', '항역', 0),
+('疫', '抗疫', '항역', 1),
+('抗', '抗癌', '항암', 0),
+('癌', '抗癌', '항암', 1),
+('抗', '抗癌劑', '항암제', 0),
+('癌', '抗癌劑', '항암제', 1),
+('劑', '抗癌劑', '항암제', 2),
+('抗', '抗訴', '항소', 0),
+('訴', '抗訴', '항소', 1),
+('抗', '抗議', '항의', 0),
+('議', '抗議', '항의', 1),
+('抗', '抗體', '항체', 0),
+('體', '抗體', '항체', 1),
+('折', '折半', '절반', 0),
+('半', '折半', '절반', 1),
+('折', '折衷', '절충', 0),
+('衷', '折衷', '절충', 1),
+('抛', '抛棄', '포기', 0),
+('棄', '抛棄', '포기', 1),
+('抛', '抛物線', '포물선', 0),
+('物', '抛物線', '포물선', 1),
+('線', '抛物線', '포물선', 2),
+('抱', '抱擁', '포옹', 0),
+('擁', '抱擁', '포옹', 1),
+('抱', '抱負', '포부', 0),
+('負', '抱負', '포부', 1),
+('抵', '抵抗', '저항', 0),
+('抗', '抵抗', '저항', 1),
+('抵', '抵抗器', '저항기', 0),
+('抗', '抵抗器', '저항기', 1),
+('器', '抵抗器', '저항기', 2),
+('抵', '抵當', '저당', 0),
+('當', '抵當', '저당', 1),
+('抵', '抵當權', '저당권', 0),
+('當', '抵當權', '저당권', 1),
+('權', '抵當權', '저당권', 2),
+('抹', '抹殺', '말살', 0),
+('殺', '抹殺', '말살', 1),
+('抹', '抹消', '말소', 0),
+('消', '抹消', '말소', 1),
+('抹', '抹茶', '말차', 0),
+('茶', '抹茶', '말차', 1),
+('押', '押收', '압수', 0),
+('收', '押收', '압수', 1),
+('押', '押釘', '압정', 0),
+('釘', '押釘', '압정', 1),
+('押', '押韻', '압운', 0),
+('韻', '押韻', '압운', 1),
+('抽', '抽出', '추출', 0),
+('出', '抽出', '추출', 1),
+('抽', '抽出物', '추출물', 0),
+('出', '抽出物', '추출물', 1),
+('物', '抽出物', '추출물', 2),
+('抽', '抽象', '추상', 0),
+('象', '抽象', '추상', 1),
+('抽', '抽象名詞', '추상명사', 0),
+('象', '抽象名詞', '추상명사', 1),
+('名', '抽象名詞', '추상명사', 2),
+('詞', '抽象名詞', '추상명사', 3),
+('抽', '抽象的', '추상적', 0),
+('象', '抽象的', '추상적', 1),
+('的', '抽象的', '추상적', 2),
+('拉', '拉北', '납북', 0),
+('北', '拉北', '납북', 1),
+('拉', '拉致', '납치', 0),
+('致', '拉致', '납치', 1),
+('拉', '拉致', '랍치', 0),
+('致', '拉致', '랍치', 1),
+('拉', '拉麵', '납면', 0),
+('麵', '拉麵', '납면', 1),
+('拉', '拉麵', '라맨', 0),
+('麵', '拉麵', '라맨', 1),
+('拍', '拍', '박', 0),
+('拍', '拍子', '박자', 0),
+('子', '拍子', '박자', 1),
+('拍', '拍手', '박수', 0),
+('手', '拍手', '박수', 1),
+('拍', '拍手喝采', '박수갈채', 0),
+('手', '拍手喝采', '박수갈채', 1),
+('喝', '拍手喝采', '박수갈채', 2),
+('采', '拍手喝采', '박수갈채', 3),
+('拍', '拍板', '박판', 0),
+('板', '拍板', '박판', 1),
+('拍', '拍車', '박차', 0),
+('車', '拍車', '박차', 1),
+('拒', '拒否', '거부', 0),
+('否', '拒否', '거부', 1),
+('拒', '拒否反應', '거부반응', 0),
+('否', '拒否反應', '거부반응', 1),
+('反', '拒否反應', '거부반응', 2),
+('應', '拒否反應', '거부반응', 3),
+('拒', '拒否感', '거부감', 0),
+('否', '拒否感', '거부감', 1),
+('感', '拒否感', '거부감', 2),
+('拒', '拒否權', '거부권', 0),
+('否', '拒否權', '거부권', 1),
+('權', '拒否權', '거부권', 2),
+('拒', '拒絕反應', '거절반응', 0),
+('絕', '拒絕反應', '거절반응', 1),
+('反', '拒絕反應', '거절반응', 2),
+('應', '拒絕反應', '거절반응', 3),
+('拒', '拒絶', '거절', 0),
+('絶', '拒絶', '거절', 1),
+('拒', '拒絶反應', '거절반응', 0),
+('絶', '拒絶反應', '거절반응', 1),
+('反', '拒絶反應', '거절반응', 2),
+('應', '拒絶反應', '거절반응', 3),
+('拒', '拒逆', '거역', 0),
+('逆', '拒逆', '거역', 1),
+('拒', '拒食症', '거식증', 0),
+('食', '拒食症', '거식증', 1),
+('症', '拒食症', '거식증', 2),
+('拔', '拔擢', '발탁', 0),
+('擢', '拔擢', '발탁', 1),
+('拔', '拔萃', '발췌', 0),
+('萃', '拔萃', '발췌', 1),
+('拔', '拔齒', '발치', 0),
+('齒', '拔齒', '발치', 1),
+('拘', '拘引', '구인', 0),
+('引', '拘引', '구인', 1),
+('拘', '拘拿', '구나', 0),
+('拿', '拘拿', '구나', 1),
+('拘', '拘束', '구속', 0),
+('束', '拘束', '구속', 1),
+('拘', '拘泥', '구니', 0),
+('泥', '拘泥', '구니', 1),
+('拘', '拘留', '구류', 0),
+('留', '拘留', '구류', 1),
+('拘', '拘置所', '구치소', 0),
+('置', '拘置所', '구치소', 1),
+('所', '拘置所', '구치소', 2),
+('拙', '拙作', '졸작', 0),
+('作', '拙作', '졸작', 1),
+('拙', '拙吟', '졸음', 0),
+('吟', '拙吟', '졸음', 1),
+('招', '招人鐘', '초인종', 0),
+('人', '招人鐘', '초인종', 1),
+('鐘', '招人鐘', '초인종', 2),
+('招', '招來', '초래', 0),
+('來', '招來', '초래', 1),
+('招', '招募', '초모', 0),
+('募', '招募', '초모', 1),
+('招', '招待', '초대', 0),
+('待', '招待', '초대', 1),
+('招', '招聘', '초빙', 0),
+('聘', '招聘', '초빙', 1),
+('招', '招請', '초청', 0),
+('請', '招請', '초청', 1),
+('招', '招請狀', '초청장', 0),
+('請', '招請狀', '초청장', 1),
+('狀', '招請狀', '초청장', 2),
+('招', '招魂', '초혼', 0),
+('魂', '招魂', '초혼', 1),
+('括', '括弧', '괄호', 0),
+('弧', '括弧', '괄호', 1),
+('括', '括約筋', '괄약근', 0),
+('約', '括約筋', '괄약근', 1),
+('筋', '括約筋', '괄약근', 2),
+('拳', '拳固', '권고', 0),
+('固', '拳固', '권고', 1),
+('拳', '拳法', '권법', 0),
+('法', '拳法', '권법', 1),
+('拳', '拳銃', '권총', 0),
+('銃', '拳銃', '권총', 1),
+('拳', '拳骨', '권골', 0),
+('骨', '拳骨', '권골', 1),
+('拳', '拳鬪', '권투', 0),
+('鬪', '拳鬪', '권투', 1),
+('拷', '拷問', '고문', 0),
+('問', '拷問', '고문', 1),
+('拼', '拼音', '병음', 0),
+('音', '拼音', '병음', 1),
+('拾', '拾得', '습득', 0),
+('得', '拾得', '습득', 1),
+('拾', '拾得物', '습득물', 0),
+('得', '拾得物', '습득물', 1),
+('物', '拾得物', '습득물', 2),
+('拿', '拿捕', '나포', 0),
+('捕', '拿捕', '나포', 1),
+('持', '持分', '지분', 0),
+('分', '持分', '지분', 1),
+('持', '持參', '지참', 0),
+('參', '持參', '지참', 1),
+('持', '持帶', '지대', 0),
+('帶', '持帶', '지대', 1),
+('持', '持株', '지주', 0),
+('株', '持株', '지주', 1),
+('持', '持病', '지병', 0),
+('病', '持病', '지병', 1),
+('持', '持續', '지속', 0),
+('續', '持續', '지속', 1),
+('持', '持續的', '지속적', 0),
+('續', '持續的', '지속적', 1),
+('的', '持續的', '지속적', 2),
+('指', '指事', '지사', 0),
+('事', '指事', '지사', 1),
+('指', '指令', '지령', 0),
+('令', '指令', '지령', 1),
+('指', '指南石', '지남석', 0),
+('南', '指南石', '지남석', 1),
+('石', '指南石', '지남석', 2),
+('指', '指名', '지명', 0),
+('名', '指名', '지명', 1),
+('指', '指名手配', '지명수배', 0),
+('名', '指名手配', '지명수배', 1),
+('手', '指名手配', '지명수배', 2),
+('配', '指名手配', '지명수배', 3),
+('指', '指名打者', '지명타자', 0),
+('名', '指名打者', '지명타자', 1),
+('打', '指名打者', '지명타자', 2),
+('者', '指名打者', '지명타자', 3),
+('指', '指壓', '지압', 0),
+('壓', '指壓', '지압', 1),
+('指', '指定', '지정', 0),
+('定', '指定', '지정', 1),
+('指', '指導', '지도', 0),
+('導', '指導', '지도', 1),
+('指', '指導力', '지도력', 0),
+('導', '指導力', '지도력', 1),
+('力', '指導力', '지도력', 2),
+('指', '指導者', '지도자', 0),
+('導', '指導者', '지도자', 1),
+('者', '指導者', '지도자', 2),
+('指', '指揮', '지휘', 0),
+('揮', '指揮', '지휘', 1),
+('指', '指揮官', '지휘관', 0),
+('揮', '指揮官', '지휘관', 1),
+('官', '指揮官', '지휘관', 2),
+('指', '指揮所', '지휘소', 0),
+('揮', '指揮所', '지휘소', 1),
+('所', '指揮所', '지휘소', 2),
+('指', '指揮者', '지휘자', 0),
+('揮', '指揮者', '지휘자', 1),
+('者', '指揮者', '지휘자', 2),
+('指', '指摘', '지적', 0),
+('摘', '指摘', '지적', 1),
+('指', '指數', '지수', 0),
+('數', '指數', '지수', 1),
+('指', '指標', '지표', 0),
+('標', '指標', '지표', 1),
+('指', '指目', '지목', 0),
+('目', '指目', '지목', 1),
+('指', '指示', '지시', 0),
+('示', '指示', '지시', 1),
+('指', '指示棒', '지시봉', 0),
+('示', '指示棒', '지시봉', 1),
+('棒', '指示棒', '지시봉', 2),
+('指', '指章', '지장', 0),
+('章', '指章', '지장', 1),
+('指', '指紋', '지문', 0),
+('紋', '指紋', '지문', 1),
+('指', '指針', '지침', 0),
+('針', '指針', '지침', 1),
+('按', '按摩', '안마', 0),
+('摩', '按摩', '안마', 1),
+('按', '按舞', '안무', 0),
+('舞', '按舞', '안무', 1),
+('按', '按酒', '안주', 0),
+('酒', '按酒', '안주', 1),
+('挑', '挑戰', '도전', 0),
+('戰', '挑戰', '도전', 1),
+('挑', '挑戰者', '도전자', 0),
+('戰', '挑戰者', '도전자', 1),
+('者', '挑戰者', '도전자', 2),
+('挑', '挑撥', '도발', 0),
+('撥', '挑撥', '도발', 1),
+('挫', '挫創', '좌창', 0),
+('創', '挫創', '좌창', 1),
+('挫', '挫折', '좌절', 0),
+('折', '挫折', '좌절', 1),
+('振', '振動', '진동', 0),
+('動', '振動', '진동', 1),
+('振', '振動數', '진동수', 0),
+('動', '振動數', '진동수', 1),
+('數', '振動數', '진동수', 2),
+('振', '振子', '진자', 0),
+('子', '振子', '진자', 1),
+('挽', '挽回', '만회', 0),
+('回', '挽回', '만회', 1),
+('挽', '挽歌', '만가', 0),
+('歌', '挽歌', '만가', 1),
+('挾', '挾擊', '협격', 0),
+('擊', '挾擊', '협격', 1),
+('挾', '挾攻', '협공', 0),
+('攻', '挾攻', '협공', 1),
+('挾', '挾殺', '협살', 0),
+('殺', '挾殺', '협살', 1),
+('捏', '捏造', '날조', 0),
+('造', '捏造', '날조', 1),
+('捕', '捕手', '포수', 0),
+('手', '捕手', '포수', 1),
+('捕', '捕捉', '포착', 0),
+('捉', '捕捉', '포착', 1),
+('捕', '捕獲', '포획', 0),
+('獲', '捕獲', '포획', 1),
+('捕', '捕球', '포구', 0),
+('球', '捕球', '포구', 1),
+('捕', '捕縛', '포박', 0),
+('縛', '捕縛', '포박', 1),
+('捕', '捕虜', '포로', 0),
+('虜', '捕虜', '포로', 1),
+('捕', '捕食', '포식', 0),
+('食', '捕食', '포식', 1),
+('捕', '捕鯨', '포경', 0),
+('鯨', '捕鯨', '포경', 1),
+('捨', '捨石', '사석', 0),
+('石', '捨石', '사석', 1),
+('据', '据置臺', '거치대', 0),
+('置', '据置臺', '거치대', 1),
+('臺', '据置臺', '거치대', 2),
+('捻', '捻出', '염출', 0),
+('出', '捻出', '염출', 1),
+('捻', '捻挫', '염좌', 0),
+('挫', '捻挫', '염좌', 1),
+('掃', '掃除', '소제', 0),
+('除', '掃除', '소제', 1),
+('掃', '掃除婦', '소제부', 0),
+('除', '掃除婦', '소제부', 1),
+('婦', '掃除婦', '소제부', 2),
+('授', '授業', '수업', 0),
+('業', '授業', '수업', 1),
+('授', '授與', '수여', 0),
+('與', '授與', '수여', 1),
+('掌', '掌匣', '장갑', 0),
+('匣', '掌匣', '장갑', 1),
+('掌', '掌固', '장고', 0),
+('固', '掌固', '장고', 1),
+('掌', '掌握', '장악', 0),
+('握', '掌握', '장악', 1),
+('掌', '掌故', '장고', 0),
+('故', '掌故', '장고', 1),
+('掌', '掌甲', '장갑', 0),
+('甲', '掌甲', '장갑', 1),
+('掌', '掌紋', '장문', 0),
+('紋', '掌紋', '장문', 1),
+('排', '排他', '배타', 0),
+('他', '排他', '배타', 1),
+('排', '排他的', '배타적', 0),
+('他', '排他的', '배타적', 1),
+('的', '排他的', '배타적', 2),
+('排', '排他的經濟水域', '배타적경제수역', 0),
+('他', '排他的經濟水域', '배타적경제수역', 1),
+('的', '排他的經濟水域', '배타적경제수역', 2),
+('經', '排他的經濟水域', '배타적경제수역', 3),
+('濟', '排他的經濟水域', '배타적경제수역', 4),
+('水', '排他的經濟水域', '배타적경제수역', 5),
+('域', '排他的經濟水域', '배타적경제수역', 6),
+('排', '排便', '배변', 0),
+('便', '排便', '배변', 1),
+('排', '排出', '배출', 0),
+('出', '排出', '배출', 1),
+('排', '排出口', '배출구', 0),
+('出', '排出口', '배출구', 1),
+('口', '排出口', '배출구', 2),
+('排', '排列', '배열', 0),
+('列', '排列', '배열', 1),
+('排', '排卵', '배란', 0),
+('卵', '排卵', '배란', 1),
+('排', '排尿', '배뇨', 0),
+('尿', '排尿', '배뇨', 1),
+('排', '排律', '배율', 0),
+('律', '排律', '배율', 1),
+('排', '排擠', '배제', 0),
+('擠', '排擠', '배제', 1),
+('排', '排斥', '배척', 0),
+('斥', '排斥', '배척', 1),
+('排', '排氣', '배기', 0),
+('氣', '排氣', '배기', 1),
+('排', '排氣管', '배기관', 0),
+('氣', '排氣管', '배기관', 1),
+('管', '排氣管', '배기관', 2),
+('排', '排水', '배수', 0),
+('水', '排水', '배수', 1),
+('排', '排水溝', '배수구', 0),
+('水', '排水溝', '배수구', 1),
+('溝', '排水溝', '배수구', 2),
+('排', '排水管', '배수관', 0),
+('水', '排水管', '배수관', 1),
+('管', '排水管', '배수관', 2),
+('排', '排泄', '배설', 0),
+('泄', '排泄', '배설', 1),
+('排', '排球', '배구', 0),
+('球', '排球', '배구', 1),
+('排', '排簫', '배소', 0),
+('簫', '排簫', '배소', 1),
+('排', '排除', '배제', 0),
+('除', '排除', '배제', 1),
+('掘', '掘鑿機', '굴착기', 0),
+('鑿', '掘鑿機', '굴착기', 1),
+('機', '掘鑿機', '굴착기', 2),
+('掛', '掛鐘時計', '괘종시계', 0),
+('鐘', '掛鐘時計', '괘종시계', 1),
+('時', '掛鐘時計', '괘종시계', 2),
+('計', '掛鐘時計', '괘종시계', 3),
+('掠', '掠奪', '약탈', 0),
+('奪', '掠奪', '약탈', 1),
+('掠', '掠奪者', '략탈자', 0),
+('奪', '掠奪者', '략탈자', 1),
+('者', '掠奪者', '략탈자', 2),
+('掠', '掠奪者', '약탈자', 0),
+('奪', '掠奪者', '약탈자', 1),
+('者', '掠奪者', '약탈자', 2),
+('採', '採取', '채취', 0),
+('取', '採取', '채취', 1),
+('採', '採擇', '채택', 0),
+('擇', '採擇', '채택', 1),
+('採', '採炭', '채탄', 0),
+('炭', '採炭', '채탄', 1),
+('採', '採用', '채용', 0),
+('用', '採用', '채용', 1),
+('採', '採石場', '채석장', 0),
+('石', '採石場', '채석장', 1),
+('場', '採石場', '채석장', 2),
+('採', '採綿器', '채면기', 0),
+('綿', '採綿器', '채면기', 1),
+('器', '採綿器', '채면기', 2),
+('採', '採鑛', '채광', 0),
+('鑛', '採鑛', '채광', 1),
+('採', '採集', '채집', 0),
+('集', '採集', '채집', 1),
+('採', '採點', '채점', 0),
+('點', '採點', '채점', 1),
+('探', '探偵', '탐정', 0),
+('偵', '探偵', '탐정', 1),
+('探', '探査', '탐사', 0),
+('査', '探査', '탐사', 1),
+('探', '探求', '탐구', 0),
+('求', '探求', '탐구', 1),
+('探', '探知', '탐지', 0),
+('知', '探知', '탐지', 1),
+('探', '探知機', '탐지기', 0),
+('知', '探知機', '탐지기', 1),
+('機', '探知機', '탐지기', 2),
+('探', '探究', '탐구', 0),
+('究', '探究', '탐구', 1),
+('探', '探索', '탐색', 0),
+('索', '探索', '탐색', 1),
+('探', '探險', '탐험', 0),
+('險', '探險', '탐험', 1),
+('探', '探險家', '탐험가', 0),
+('險', '探險家', '탐험가', 1),
+('家', '探險家', '탐험가', 2),
+('探', '探鳥', '탐조', 0),
+('鳥', '探鳥', '탐조', 1),
+('接', '接', '접', 0),
+('接', '接受人', '접수인', 0),
+('受', '接受人', '접수인', 1),
+('人', '接受人', '접수인', 2),
+('接', '接受處', '접수처', 0),
+('受', '接受處', '접수처', 1),
+('處', '接受處', '접수처', 2),
+('接', '接吻', '접문', 0),
+('吻', '接吻', '접문', 1),
+('接', '接境', '접경', 0),
+('境', '接境', '접경', 1),
+('接', '接境地帶', '접경지대', 0),
+('境', '接境地帶', '접경지대', 1),
+('地', '接境地帶', '접경지대', 2),
+('帶', '接境地帶', '접경지대', 3),
+('接', '接尾語', '접미어', 0),
+('尾', '接尾語', '접미어', 1),
+('語', '接尾語', '접미어', 2),
+('接', '接尾辭', '접미사', 0),
+('尾', '接尾辭', '접미사', 1),
+('辭', '接尾辭', '접미사', 2),
+('接', '接待', '접대', 0),
+('待', '接待', '접대', 1),
+('接', '接戰', '접전', 0),
+('戰', '接戰', '접전', 1),
+('接', '接着', '접착', 0),
+('着', '接着', '접착', 1),
+('接', '接着劑', '접착제', 0),
+('着', '接着劑', '접착제', 1),
+('劑', '接着劑', '접착제', 2),
+('接', '接神', '접신', 0),
+('神', '接神', '접신', 1),
+('接', '接種', '접종', 0),
+('種', '接種', '접종', 1),
+('接', '接線', '접선', 0),
+('線', '接線', '접선', 1),
+('接', '接續', '접속', 0),
+('續', '接續', '접속', 1),
+('接', '接續詞', '접속사', 0),
+('續', '接續詞', '접속사', 1),
+('詞', '接續詞', '접속사', 2),
+('接', '接觸', '접촉', 0),
+('觸', '接觸', '접촉', 1),
+('接', '接辭', '접사', 0),
+('辭', '接辭', '접사', 1),
+('接', '接近', '접근', 0),
+('近', '接近', '접근', 1),
+('接', '接頭語', '접두어', 0),
+('頭', '接頭語', '접두어', 1),
+('語', '接頭語', '접두어', 2),
+('接', '接頭辭', '접두사', 0),
+('頭', '接頭辭', '접두사', 1),
+('辭', '接頭辭', '접두사', 2),
+('接', '接骨', '접골', 0),
+('骨', '接骨', '접골', 1),
+('控', '控除', '공제', 0),
+('除', '控除', '공제', 1),
+('推', '推奬', '추장', 0),
+('奬', '推奬', '추장', 1),
+('推', '推定', '추정', 0),
+('定', '推定', '추정', 1),
+('推', '推敲', '퇴고', 0),
+('敲', '推敲', '퇴고', 1),
+('推', '推測', '추측', 0),
+('測', '推測', '추측', 1),
+('推', '推理', '추리', 0),
+('理', '推理', '추리', 1),
+('推', '推算', '추산', 0),
+('算', '推算', '추산', 1),
+('推', '推薦', '추천', 0),
+('薦', '推薦', '추천', 1),
+('推', '推薦狀', '추천서', 0),
+('薦', '推薦狀', '추천서', 1),
+('狀', '推薦狀', '추천서', 2),
+('推', '推薦狀', '추천장', 0),
+('薦', '推薦狀', '추천장', 1),
+('狀', '推薦狀', '추천장', 2),
+('推', '推進', '추진', 0),
+('進', '推進', '추진', 1),
+('掩', '掩蔽', '엄폐', 0),
+('蔽', '掩蔽', '엄폐', 1),
+('掩', '掩襲', '엄습', 0),
+('襲', '掩襲', '엄습', 1),
+('掩', '掩護', '엄호', 0),
+('護', '掩護', '엄호', 1),
+('措', '措置', '조치', 0),
+('置', '措置', '조치', 1),
+('措', '措辭', '조사', 0),
+('辭', '措辭', '조사', 1),
+('描', '描寫', '묘사', 0),
+('寫', '描寫', '묘사', 1),
+('提', '提供', '제공', 0),
+('供', '提供', '제공', 1),
+('提', '提出', '제출', 0),
+('出', '提出', '제출', 1),
+('提', '提出者', '제출자', 0),
+('出', '提出者', '제출자', 1),
+('者', '提出者', '제출자', 2),
+('提', '提唱', '제창', 0),
+('唱', '提唱', '제창', 1),
+('提', '提喩', '제유', 0),
+('喩', '提喩', '제유', 1),
+('提', '提喩法', '제유법', 0),
+('喩', '提喩法', '제유법', 1),
+('法', '提喩法', '제유법', 2),
+('提', '提報', '제보', 0),
+('報', '提報', '제보', 1),
+('提', '提携', '제휴', 0),
+('携', '提携', '제휴', 1),
+('提', '提案', '제안', 0),
+('案', '提案', '제안', 1),
+('提', '提案者', '제안자', 0),
+('案', '提案者', '제안자', 1),
+('者', '提案者', '제안자', 2),
+('提', '提督', '제독', 0),
+('督', '提督', '제독', 1),
+('提', '提示', '제시', 0),
+('示', '提示', '제시', 1),
+('提', '提言', '제언', 0),
+('言', '提言', '제언', 1),
+('提', '提議', '제의', 0),
+('議', '提議', '제의', 1),
+('揚', '揚琴', '양금', 0),
+('琴', '揚琴', '양금', 1),
+('揚', '揚音  符', '양음 부호', 0),
+('音', '揚音  符', '양음 부호', 1),
+('符', '揚音  符', '양음 부호', 4),
+('換', '換乘', '환승', 0),
+('乘', '換乘', '환승', 1),
+('換', '換喩', '환유', 0),
+('喩', '換喩', '환유', 1),
+('換', '換氣', '환기', 0),
+('氣', '換氣', '환기', 1),
+('換', '換率', '환율', 0),
+('率', '換率', '환율', 1),
+('換', '換節期', '환절기', 0),
+('節', '換節期', '환절기', 1),
+('期', '換節期', '환절기', 2),
+('換', '換錢', '환전', 0),
+('錢', '換錢', '환전', 1),
+('換', '換率', '환율', 0),
+('率', '換率', '환율', 1),
+('握', '握力', '악력', 0),
+('力', '握力', '악력', 1),
+('握', '握力計', '악력계', 0),
+('力', '握力計', '악력계', 1),
+('計', '握力計', '악력계', 2),
+('握', '握手', '악수', 0),
+('手', '握手', '악수', 1),
+('揭', '揭揚', '게양', 0),
+('揚', '揭揚', '게양', 1),
+('揭', '揭示', '게시', 0),
+('示', '揭示', '게시', 1),
+('揭', '揭示板', '게시판', 0),
+('示', '揭示板', '게시판', 1),
+('板', '揭示板', '게시판', 2),
+('揭', '揭載', '게재', 0),
+('載', '揭載', '게재', 1),
+('揮', '揮帳', '휘장', 0),
+('帳', '揮帳', '휘장', 1),
+('揮', '揮發油', '휘발유', 0),
+('發', '揮發油', '휘발유', 1),
+('油', '揮發油', '휘발유', 2),
+('援', '援助', '원조', 0),
+('助', '援助', '원조', 1),
+('援', '援助交際', '원조교제', 0),
+('助', '援助交際', '원조교제', 1),
+('交', '援助交際', '원조교제', 2),
+('際', '援助交際', '원조교제', 3),
+('揶', '揶揄', '야유', 0),
+('揄', '揶揄', '야유', 1),
+('揷', '揷入', '삽입', 0),
+('入', '揷入', '삽입', 1),
+('揷', '揷入曲', '삽입곡', 0),
+('入', '揷入曲', '삽입곡', 1),
+('曲', '揷入曲', '삽입곡', 2),
+('揷', '揷畫', '삽화', 0),
+('畫', '揷畫', '삽화', 1),
+('揷', '揷腎', '삽신', 0),
+('腎', '揷腎', '삽신', 1),
+('揷', '揷話', '삽화', 0),
+('話', '揷話', '삽화', 1),
+('揷', '揷身', '삽신', 0),
+('身', '揷身', '삽신', 1),
+('損', '損', '손', 0),
+('損', '損傷', '손상', 0),
+('傷', '損傷', '손상', 1),
+('損', '損失', '손실', 0),
+('失', '損失', '손실', 1),
+('損', '損害', '손해', 0),
+('害', '損害', '손해', 1),
+('搏', '搏動', '박동', 0),
+('動', '搏動', '박동', 1),
+('搔', '搔痒', '소양', 0),
+('痒', '搔痒', '소양', 1),
+('搔', '搔頭', '소두', 0),
+('頭', '搔頭', '소두', 1),
+('搖', '搖籃', '요람', 0),
+('籃', '搖籃', '요람', 1),
+('搖', '搖籃本', '요람본', 0),
+('籃', '搖籃本', '요람본', 1),
+('本', '搖籃本', '요람본', 2),
+('搜', '搜査', '수사', 0),
+('査', '搜査', '수사', 1),
+('搜', '搜査官', '수사관', 0),
+('査', '搜査官', '수사관', 1),
+('官', '搜査官', '수사관', 2),
+('搜', '搜索', '수색', 0),
+('索', '搜索', '수색', 1),
+('搭', '搭乘', '탑승', 0),
+('乘', '搭乘', '탑승', 1),
+('搭', '搭乘券', '탑승권', 0),
+('乘', '搭乘券', '탑승권', 1),
+('券', '搭乘券', '탑승권', 2),
+('搭', '搭乘口', '탑승구', 0),
+('乘', '搭乘口', '탑승구', 1),
+('口', '搭乘口', '탑승구', 2),
+('搭', '搭載', '탑재', 0),
+('載', '搭載', '탑재', 1),
+('携', '携帶', '휴대', 0),
+('帶', '携帶', '휴대', 1),
+('携', '携帶用', '휴대용', 0),
+('帶', '携帶用', '휴대용', 1),
+('用', '携帶用', '휴대용', 2),
+('携', '携帶用 風琴', '휴대용 풍금', 0),
+('帶', '携帶用 風琴', '휴대용 풍금', 1),
+('用', '携帶用 風琴', '휴대용 풍금', 2),
+('風', '携帶用 風琴', '휴대용 풍금', 4),
+('琴', '携帶用 風琴', '휴대용 풍금', 5),
+('携', '携帶電話', '휴대전화', 0),
+('帶', '携帶電話', '휴대전화', 1),
+('電', '携帶電話', '휴대전화', 2),
+('話', '携帶電話', '휴대전화', 3),
+('搾', '搾取', '착취', 0),
+('取', '搾取', '착취', 1),
+('摘', '摘出', '적출', 0),
+('出', '摘出', '적출', 1),
+('摘', '摘要', '적요', 0),
+('要', '摘要', '적요', 1),
+('摩', '摩天樓', '마천루', 0),
+('天', '摩天樓', '마천루', 1),
+('樓', '摩天樓', '마천루', 2),
+('摩', '摩尼', '마니', 0),
+('尼', '摩尼', '마니', 1),
+('摩', '摩尼敎', '마니교', 0),
+('尼', '摩尼敎', '마니교', 1),
+('敎', '摩尼敎', '마니교', 2),
+('摩', '摩擦', '마찰', 0),
+('擦', '摩擦', '마찰', 1),
+('摩', '摩訶', '마하', 0),
+('訶', '摩訶', '마하', 1),
+('摸', '摸索', '모색', 0),
+('索', '摸索', '모색', 1),
+('撒', '撒布', '살포', 0),
+('布', '撒布', '살포', 1),
+('撒', '撒水器', '살수기', 0),
+('水', '撒水器', '살수기', 1),
+('器', '撒水器', '살수기', 2),
+('撞', '撞球', '당구', 0),
+('球', '撞球', '당구', 1),
+('撞', '撞着', '당착', 0),
+('着', '撞着', '당착', 1),
+('撞', '撞破', '당파', 0),
+('破', '撞破', '당파', 1),
+('撤', '撤去', '철거', 0),
+('去', '撤去', '철거', 1),
+('撤', '撤回', '철회', 0),
+('回', '撤回', '철회', 1),
+('撤', '撤廢', '철폐', 0),
+('廢', '撤廢', '철폐', 1),
+('撤', '撤收', '철수', 0),
+('收', '撤收', '철수', 1),
+('撤', '撤退', '철퇴', 0),
+('退', '撤退', '철퇴', 1),
+('撫', '撫摩', '무마', 0),
+('摩', '撫摩', '무마', 1),
+('撫', '撫綏', '무수', 0),
+('綏', '撫綏', '무수', 1),
+('播', '播種', '파종', 0),
+('種', '播種', '파종', 1),
+('撮', '撮影', '촬영', 0),
+('影', '撮影', '촬영', 1),
+('撮', '撮影室', '촬영실', 0),
+('影', '撮影室', '촬영실', 1),
+('室', '撮影室', '촬영실', 2),
+('撮', '撮影監督', '촬영감독', 0),
+('影', '撮影監督', '촬영감독', 1),
+('監', '撮影監督', '촬영감독', 2),
+('督', '撮影監督', '촬영감독', 3),
+('撮', '撮影臺本', '촬영대본', 0),
+('影', '撮影臺本', '촬영대본', 1),
+('臺', '撮影臺本', '촬영대본', 2),
+('本', '撮影臺本', '촬영대본', 3),
+('撲', '撲滅', '박멸', 0),
+('滅', '撲滅', '박멸', 1),
+('擁', '擁壁', '옹벽', 0),
+('壁', '擁壁', '옹벽', 1),
+('擁', '擁立', '옹립', 0),
+('立', '擁立', '옹립', 1),
+('擁', '擁護', '옹호', 0),
+('護', '擁護', '옹호', 1),
+('擇', '擇', '택', 0),
+('擊', '擊刺', '격자', 0),
+('刺', '擊刺', '격자', 1),
+('操', '操作', '조작', 0),
+('作', '操作', '조작', 1),
+('操', '操作體系', '조작체계', 0),
+('作', '操作體系', '조작체계', 1),
+('體', '操作體系', '조작체계', 2),
+('系', '操作體系', '조작체계', 3),
+('操', '操制', '조제', 0),
+('制', '操制', '조제', 1),
+('操', '操心', '조심', 0),
+('心', '操心', '조심', 1),
+('操', '操縱', '조종', 0),
+('縱', '操縱', '조종', 1),
+('操', '操縱士', '조종사', 0),
+('縱', '操縱士', '조종사', 1),
+('士', '操縱士', '조종사', 2),
+('操', '操舵', '조타', 0),
+('舵', '操舵', '조타', 1),
+('操', '操舵手', '조타수', 0),
+('舵', '操舵手', '조타수', 1),
+('手', '操舵手', '조타수', 2),
+('擔', '擔任', '담임', 0),
+('任', '擔任', '담임', 1),
+('擔', '擔保', '담보', 0),
+('保', '擔保', '담보', 1),
+('擔', '擔保物', '담보물', 0),
+('保', '擔保物', '담보물', 1),
+('物', '擔保物', '담보물', 2),
+('擔', '擔當', '담당', 0),
+('當', '擔當', '담당', 1),
+('擔', '擔當者', '담당자', 0),
+('當', '擔當者', '담당자', 1),
+('者', '擔當者', '담당자', 2),
+('擦', '擦過傷', '찰과상', 0),
+('過', '擦過傷', '찰과상', 1),
+('傷', '擦過傷', '찰과상', 2),
+('擧', '擧動', '거동', 0),
+('動', '擧動', '거동', 1),
+('擬', '擬人化', '의인화', 0),
+('人', '擬人化', '의인화', 1),
+('化', '擬人化', '의인화', 2),
+('擬', '擬人法', '의인법', 0),
+('人', '擬人法', '의인법', 1),
+('法', '擬人法', '의인법', 2),
+('擬', '擬古體', '의고체', 0),
+('古', '擬古體', '의고체', 1),
+('體', '擬古體', '의고체', 2),
+('擬', '擬態語', '의태어', 0),
+('態', '擬態語', '의태어', 1),
+('語', '擬態語', '의태어', 2),
+('擬', '擬聲語', '의성어', 0),
+('聲', '擬聲語', '의성어', 1),
+('語', '擬聲語', '의성어', 2),
+('擴', '擴大', '확대', 0),
+('大', '擴大', '확대', 1),
+('擴', '擴大鏡', '확대경', 0),
+('大', '擴大鏡', '확대경', 1),
+('鏡', '擴大鏡', '확대경', 2),
+('擴', '擴張', '확장', 0),
+('張', '擴張', '확장', 1),
+('擴', '擴張子', '확장자', 0),
+('張', '擴張子', '확장자', 1),
+('子', '擴張子', '확장자', 2),
+('擴', '擴散', '확산', 0),
+('散', '擴散', '확산', 1),
+('擴', '擴聲器', '확성기', 0),
+('聲', '擴聲器', '확성기', 1),
+('器', '擴聲器', '확성기', 2),
+('擾', '擾亂', '요란', 0),
+('亂', '擾亂', '요란', 1),
+('攄', '攄得', '터득', 0),
+('得', '攄得', '터득', 1),
+('攘', '攘夷', '양이', 0),
+('夷', '攘夷', '양이', 1),
+('攝', '攝取', '섭취', 0),
+('取', '攝取', '섭취', 1),
+('攝', '攝政', '섭정', 0),
+('政', '攝政', '섭정', 1),
+('攝', '攝氏', '섭씨', 0),
+('氏', '攝氏', '섭씨', 1),
+('攝', '攝理', '섭리', 0),
+('理', '攝理', '섭리', 1),
+('攪', '攪亂', '교란', 0),
+('亂', '攪亂', '교란', 1),
+('攪', '攪拌', '교반', 0),
+('拌', '攪拌', '교반', 1),
+('攪', '攪飯', '교반', 0),
+('飯', '攪飯', '교반', 1),
+('支', '支出', '지출', 0),
+('出', '支出', '지출', 1),
+('支', '支局', '지국', 0),
+('局', '支局', '지국', 1),
+('支', '支店', '지점', 0),
+('店', '支店', '지점', 1),
+('支', '支拂', '지불', 0),
+('拂', '支拂', '지불', 1),
+('支', '支拂 不能', '지불 불능', 0),
+('拂', '支拂 不能', '지불 불능', 1),
+('不', '支拂 不能', '지불 불능', 3),
+('能', '支拂 不能', '지불 불능', 4),
+('支', '支拂 不能者', '지불 불능자', 0),
+('拂', '支拂 不能者', '지불 불능자', 1),
+('不', '支拂 不能者', '지불 불능자', 3),
+('能', '支拂 不能者', '지불 불능자', 4),
+('者', '支拂 不能者', '지불 불능자', 5),
+('支', '支拂不能', '지불불능', 0),
+('拂', '支拂不能', '지불불능', 1),
+('不', '支拂不能', '지불불능', 2),
+('能', '支拂不能', '지불불능', 3),
+('支', '支拂不能債券', '지불불능채권', 0),
+('拂', '支拂不能債券', '지불불능채권', 1),
+('不', '支拂不能債券', '지불불능채권', 2),
+('能', '支拂不能債券', '지불불능채권', 3),
+('債', '支拂不能債券', '지불불능채권', 4),
+('券', '支拂不能債券', '지불불능채권', 5),
+('支', '支拂人', '지불인', 0),
+('拂', '支拂人', '지불인', 1),
+('人', '支拂人', '지불인', 2),
+('支', '支持', '지지', 0),
+('持', '支持', '지지', 1),
+('支', '支持者', '지지자', 0),
+('持', '支持者', '지지자', 1),
+('者', '支持者', '지지자', 2),
+('支', '支援', '지원', 0),
+('援', '支援', '지원', 1),
+('支', '支援者', '지원자', 0),
+('援', '支援者', '지원자', 1),
+('者', '支援者', '지원자', 2),
+('支', '支援軍', '지원군', 0),
+('援', '支援軍', '지원군', 1),
+('軍', '支援軍', '지원군', 2),
+('支', '支撐', '지탱', 0),
+('撐', '支撐', '지탱', 1),
+('支', '支柱', '지주', 0),
+('柱', '支柱', '지주', 1),
+('支', '支流', '지류', 0),
+('流', '支流', '지류', 1),
+('支', '支給', '지급', 0),
+('給', '支給', '지급', 1),
+('支', '支署', '지서', 0),
+('署', '支署', '지서', 1),
+('支', '支脈', '지맥', 0),
+('脈', '支脈', '지맥', 1),
+('支', '支臺', '지대', 0),
+('臺', '支臺', '지대', 1),
+('支', '支那', '지나', 0),
+('那', '支那', '지나', 1),
+('支', '支配', '지배', 0),
+('配', '支配', '지배', 1),
+('支', '支配人', '지배인', 0),
+('配', '支配人', '지배인', 1),
+('人', '支配人', '지배인', 2),
+('支', '支配者', '지배자', 0),
+('配', '支配者', '지배자', 1),
+('者', '支配者', '지배자', 2),
+('支', '支隊', '지대', 0),
+('隊', '支隊', '지대', 1),
+('支', '支障', '지장', 0),
+('障', '支障', '지장', 1),
+('收', '收入', '수입', 0),
+('入', '收入', '수입', 1),
+('收', '收容所', '수용소', 0),
+('容', '收容所', '수용소', 1),
+('所', '收容所', '수용소', 2),
+('收', '收拾', '수습', 0),
+('拾', '收拾', '수습', 1),
+('收', '收支', '수지', 0),
+('支', '收支', '수지', 1),
+('收', '收斂', '수렴', 0),
+('斂', '收斂', '수렴', 1),
+('收', '收益', '수익', 0),
+('益', '收益', '수익', 1),
+('收', '收監者', '수감자', 0),
+('監', '收監者', '수감자', 1),
+('者', '收監者', '수감자', 2),
+('收', '收穫', '수확', 0),
+('穫', '收穫', '수확', 1),
+('收', '收縮', '수축', 0),
+('縮', '收縮', '수축', 1),
+('收', '收錄', '수록', 0),
+('錄', '收錄', '수록', 1),
+('收', '收集', '수집', 0),
+('集', '收集', '수집', 1),
+('改', '改備', '개비', 0),
+('備', '改備', '개비', 1),
+('改', '改名', '개명', 0),
+('名', '改名', '개명', 1),
+('改', '改善', '개선', 0),
+('善', '改善', '개선', 1),
+('改', '改嫁', '개가', 0),
+('嫁', '改嫁', '개가', 1),
+('改', '改宗', '개종', 0),
+('宗', '改宗', '개종', 1),
+('改', '改定', '개정', 0),
+('定', '改定', '개정', 1),
+('改', '改寤', '개오', 0),
+('寤', '改寤', '개오', 1),
+('改', '改心', '개심', 0),
+('心', '改心', '개심', 1),
+('改', '改成', '개성', 0),
+('成', '改成', '개성', 1),
+('改', '改新敎', '개신교', 0),
+('新', '改新敎', '개신교', 1),
+('敎', '改新敎', '개신교', 2),
+('改', '改正', '개정', 0),
+('正', '改正', '개정', 1),
+('改', '改組', '개조', 0),
+('組', '改組', '개조', 1),
+('改', '改編', '개편', 0),
+('編', '改編', '개편', 1),
+('改', '改良', '개량', 0),
+('良', '改良', '개량', 1),
+('改', '改訂', '개정', 0),
+('訂', '改訂', '개정', 1),
+('改', '改訂版', '개정판', 0),
+('訂', '改訂版', '개정판', 1),
+('版', '改訂版', '개정판', 2),
+('改', '改詞', '개사', 0),
+('詞', '改詞', '개사', 1),
+('改', '改詞曲', '개사곡', 0),
+('詞', '改詞曲', '개사곡', 1),
+('曲', '改詞曲', '개사곡', 2),
+('改', '改譯', '개역', 0),
+('譯', '改譯', '개역', 1),
+('改', '改造', '개조', 0),
+('造', '改造', '개조', 1),
+('改', '改量', '개량', 0),
+('量', '改量', '개량', 1),
+('改', '改鑄', '개주', 0),
+('鑄', '改鑄', '개주', 1),
+('改', '改革', '개혁', 0),
+('革', '改革', '개혁', 1),
+('改', '改題', '개제', 0),
+('題', '改題', '개제', 1),
+('攻', '攻勢', '공세', 0),
+('勢', '攻勢', '공세', 1),
+('攻', '攻城', '공성', 0),
+('城', '攻城', '공성', 1),
+('攻', '攻城戰', '공성전', 0),
+('城', '攻城戰', '공성전', 1),
+('戰', '攻城戰', '공성전', 2),
+('攻', '攻擊', '공격', 0),
+('擊', '攻擊', '공격', 1),
+('攻', '攻擊戰', '공격전', 0),
+('擊', '攻擊戰', '공격전', 1),
+('戰', '攻擊戰', '공격전', 2),
+('攻', '攻略', '공략', 0),
+('略', '攻略', '공략', 1),
+('攻', '攻襲', '공습', 0),
+('襲', '攻襲', '공습', 1),
+('放', '放免', '방면', 0),
+('免', '放免', '방면', 1),
+('放', '放出', '방출', 0),
+('出', '放出', '방출', 1),
+('放', '放學', '방학', 0),
+('學', '放學', '방학', 1),
+('放', '放射', '방사', 0),
+('射', '放射', '방사', 1),
+('放', '放射性', '방사성', 0),
+('射', '放射性', '방사성', 1),
+('性', '放射性', '방사성', 2),
+('放', '放射性  崩', '방사성 붕괴', 0),
+('射', '放射性  崩', '방사성 붕괴', 1),
+('性', '放射性  崩', '방사성 붕괴', 2),
+('崩', '放射性  崩', '방사성 붕괴', 5),
+('放', '放射線', '방사선', 0),
+('射', '放射線', '방사선', 1),
+('線', '放射線', '방사선', 2),
+('放', '放射線學', '방사선학', 0),
+('射', '放射線學', '방사선학', 1),
+('線', '放射線學', '방사선학', 2),
+('學', '放射線學', '방사선학', 3),
+('放', '放射線撮影', '방사선촬영', 0),
+('射', '放射線撮影', '방사선촬영', 1),
+('線', '放射線撮影', '방사선촬영', 2),
+('撮', '放射線撮影', '방사선촬영', 3),
+('影', '放射線撮影', '방사선촬영', 4),
+('放', '放射能', '방사능', 0),
+('射', '放射能', '방사능', 1),
+('能', '放射能', '방사능', 2),
+('放', '放尿', '방뇨', 0),
+('尿', '放尿', '방뇨', 1),
+('放', '放心', '방심', 0),
+('心', '放心', '방심', 1),
+('放', '放映', '방영', 0),
+('映', '放映', '방영', 1),
+('放', '放水', '방수', 0),
+('水', '放水', '방수', 1),
+('放', '放浪', '방랑', 0),
+('浪', '放浪', '방랑', 1),
+('放', '放浪者', '방랑자', 0),
+('浪', '放浪者', '방랑자', 1),
+('者', '放浪者', '방랑자', 2),
+('放', '放火', '방화', 0),
+('火', '放火', '방화', 1),
+('放', '放熱', '방열', 0),
+('熱', '放熱', '방열', 1),
+('放', '放牧', '방목', 0),
+('牧', '放牧', '방목', 1),
+('放', '放生', '방생', 0),
+('生', '放生', '방생', 1),
+('放', '放縱', '방종', 0),
+('縱', '放縱', '방종', 1),
+('放', '放蕩', '방탕', 0),
+('蕩', '放蕩', '방탕', 1),
+('放', '放課後', '방과후', 0),
+('課', '放課後', '방과후', 1),
+('後', '放課後', '방과후', 2),
+('放', '放送', '방송', 0),
+('送', '放送', '방송', 1),
+('放', '放送事故', '방송사고', 0),
+('送', '放送事故', '방송사고', 1),
+('事', '放送事故', '방송사고', 2),
+('故', '放送事故', '방송사고', 3),
+('放', '放送員', '방송원', 0),
+('送', '放送員', '방송원', 1),
+('員', '放送員', '방송원', 2),
+('放', '放送局', '방송국', 0),
+('送', '放送局', '방송국', 1),
+('局', '放送局', '방송국', 2),
+('放', '放送干涉', '방송간섭', 0),
+('送', '放送干涉', '방송간섭', 1),
+('干', '放送干涉', '방송간섭', 2),
+('涉', '放送干涉', '방송간섭', 3),
+('放', '放送社', '방송사', 0),
+('送', '放送社', '방송사', 1),
+('社', '放送社', '방송사', 2),
+('放', '放電', '방전', 0),
+('電', '放電', '방전', 1),
+('放', '放題', '방제', 0),
+('題', '放題', '방제', 1),
+('放', '放黜', '방출', 0),
+('黜', '放黜', '방출', 1),
+('政', '政令', '정령', 0),
+('令', '政令', '정령', 1),
+('政', '政府', '정부', 0),
+('府', '政府', '정부', 1),
+('政', '政府軍', '정부군', 0),
+('府', '政府軍', '정부군', 1),
+('軍', '政府軍', '정부군', 2),
+('政', '政敎', '정교', 0),
+('敎', '政敎', '정교', 1),
+('政', '政敎分離', '정교분리', 0),
+('敎', '政敎分離', '정교분리', 1),
+('分', '政敎分離', '정교분리', 2),
+('離', '政敎分離', '정교분리', 3),
+('政', '政權', '정권', 0),
+('權', '政權', '정권', 1),
+('政', '政治', '정치', 0),
+('治', '政治', '정치', 1),
+('政', '政治人', '정치인', 0),
+('治', '政治人', '정치인', 1),
+('人', '政治人', '정치인', 2),
+('政', '政治圈', '정치권', 0),
+('治', '政治圈', '정치권', 1),
+('圈', '政治圈', '정치권', 2),
+('政', '政治學', '정치학', 0),
+('治', '政治學', '정치학', 1),
+('學', '政治學', '정치학', 2),
+('政', '政治學者', '정치학자', 0),
+('治', '政治學者', '정치학자', 1),
+('學', '政治學者', '정치학자', 2),
+('者', '政治學者', '정치학자', 3),
+('政', '政治家', '정치가', 0),
+('治', '政治家', '정치가', 1),
+('家', '政治家', '정치가', 2),
+('政', '政治權', '정치권', 0),
+('治', '政治權', '정치권', 1),
+('權', '政治權', '정치권', 2),
+('政', '政治犯', '정치범', 0),
+('治', '政治犯', '정치범', 1),
+('犯', '政治犯', '정치범', 2),
+('政', '政治的', '정치적', 0),
+('治', '政治的', '정치적', 1),
+('的', '政治的', '정치적', 2),
+('政', '政治질', '정치질', 0),
+('治', '政治질', '정치질', 1),
+('질', '政治질', '정치질', 2),
+('政', '政界', '정계', 0),
+('界', '政界', '정계', 1),
+('政', '政略', '정략', 0),
+('略', '政略', '정략', 1),
+('政', '政策', '정책', 0),
+('策', '政策', '정책', 1),
+('政', '政變', '정변', 0),
+('變', '政變', '정변', 1),
+('政', '政體', '정체', 0),
+('體', '政體', '정체', 1),
+('政', '政黨', '정당', 0),
+('黨', '政黨', '정당', 1),
+('故', '故', '고', 0),
+('故', '故事成語', '고사성어', 0),
+('事', '故事成語', '고사성어', 1),
+('成', '故事成語', '고사성어', 2),
+('語', '故事成語', '고사성어', 3),
+('故', '故人', '고인', 0),
+('人', '故人', '고인', 1),
+('故', '故國', '고국', 0),
+('國', '故國', '고국', 1),
+('故', '故意', '고의', 0),
+('意', '故意', '고의', 1),
+('故', '故意四球', '고의사구', 0),
+('意', '故意四球', '고의사구', 1),
+('四', '故意四球', '고의사구', 2),
+('球', '故意四球', '고의사구', 3),
+('故', '故殺', '고살', 0),
+('殺', '故殺', '고살', 1),
+('故', '故鄕', '고향', 0),
+('鄕', '故鄕', '고향', 1),
+('故', '故鄕—', '고향집', 0),
+('鄕', '故鄕—', '고향집', 1),
+('—', '故鄕—', '고향집', 2),
+('故', '故障', '고장', 0),
+('障', '故障', '고장', 1),
+('效', '效力', '효력', 0),
+('力', '效力', '효력', 1),
+('效', '效果', '효과', 0),
+('果', '效果', '효과', 1),
+('效', '效果的', '효과적', 0),
+('果', '效果的', '효과적', 1),
+('的', '效果的', '효과적', 2),
+('效', '效率', '효율', 0),
+('率', '效率', '효율', 1),
+('效', '效率化', '효율화', 0),
+('率', '效率化', '효율화', 1),
+('化', '效率化', '효율화', 2),
+('效', '效用', '효용', 0),
+('用', '效用', '효용', 1),
+('效', '效能', '효능', 0),
+('能', '效能', '효능', 1),
+('效', '效率的', '효율적', 0),
+('率', '效率的', '효율적', 1),
+('的', '效率的', '효율적', 2),
+('敍', '敍事詩', '서사시', 0),
+('事', '敍事詩', '서사시', 1),
+('詩', '敍事詩', '서사시', 2),
+('敍', '敍情詩', '서정시', 0),
+('情', '敍情詩', '서정시', 1),
+('詩', '敍情詩', '서정시', 2),
+('敍', '敍述', '서술', 0),
+('述', '敍述', '서술', 1),
+('敍', '敍述者', '서술자', 0),
+('述', '敍述者', '서술자', 1),
+('者', '敍述者', '서술자', 2),
+('敎', '敎', '교', 0),
+('敎', '敎人', '교인', 0),
+('人', '敎人', '교인', 1),
+('敎', '敎化', '교화', 0),
+('化', '敎化', '교화', 1),
+('敎', '敎化所', '교화소', 0),
+('化', '敎化所', '교화소', 1),
+('所', '敎化所', '교화소', 2),
+('敎', '敎區', '교구', 0),
+('區', '敎區', '교구', 1),
+('敎', '敎卓', '교탁', 0),
+('卓', '敎卓', '교탁', 1),
+('敎', '敎員', '교원', 0),
+('員', '敎員', '교원', 1),
+('敎', '敎唆', '교사', 0),
+('唆', '敎唆', '교사', 1),
+('敎', '敎室', '교실', 0),
+('室', '敎室', '교실', 1),
+('敎', '敎師', '교사', 0),
+('師', '敎師', '교사', 1),
+('敎', '敎徒', '교도', 0),
+('徒', '敎徒', '교도', 1),
+('敎', '敎授', '교수', 0),
+('授', '敎授', '교수', 1),
+('敎', '敎會', '교회', 0),
+('會', '敎會', '교회', 1),
+('敎', '敎會論', '교회론', 0),
+('會', '敎會論', '교회론', 1),
+('論', '敎會論', '교회론', 2),
+('敎', '敎材', '교재', 0),
+('材', '敎材', '교재', 1),
+('敎', '敎條', '교조', 0),
+('條', '敎條', '교조', 1),
+('敎', '敎條主義', '교조주의', 0),
+('條', '敎條主義', '교조주의', 1),
+('主', '敎條主義', '교조주의', 2),
+('義', '敎條主義', '교조주의', 3),
+('敎', '敎派', '교파', 0),
+('派', '敎派', '교파', 1),
+('敎', '敎父', '교부', 0),
+('父', '敎父', '교부', 1),
+('敎', '敎理', '교리', 0),
+('理', '敎理', '교리', 1),
+('敎', '敎皇', '교황', 0),
+('皇', '敎皇', '교황', 1),
+('敎', '敎科書', '교과서', 0),
+('科', '敎科書', '교과서', 1),
+('書', '敎科書', '교과서', 2),
+('敎', '敎義', '교의', 0),
+('義', '敎義', '교의', 1),
+('敎', '敎職', '교직', 0),
+('職', '敎職', '교직', 1),
+('敎', '敎育', '교육', 0),
+('育', '敎育', '교육', 1),
+('敎', '敎育學', '교육학', 0),
+('育', '敎育學', '교육학', 1),
+('學', '敎育學', '교육학', 2),
+('敎', '敎育者', '교육자', 0),
+('育', '敎育者', '교육자', 1),
+('者', '敎育者', '교육자', 2),
+('敎', '敎育費', '교육비', 0),
+('育', '敎育費', '교육비', 1),
+('費', '敎育費', '교육비', 2),
+('敎', '敎訓', '교훈', 0),
+('訓', '敎訓', '교훈', 1),
+('敎', '敎鞭', '교편', 0),
+('鞭', '敎鞭', '교편', 1),
+('敎', '敎養', '교양', 0),
+('養', '敎養', '교양', 1),
+('敏', '敏感', '민감', 0),
+('感', '敏感', '민감', 1),
+('敏', '敏捷性', '민첩성', 0),
+('捷', '敏捷性', '민첩성', 1),
+('性', '敏捷性', '민첩성', 2),
+('敏', '敏智', '민지', 0),
+('智', '敏智', '민지', 1),
+('敏', '敏活', '민활', 0),
+('活', '敏活', '민활', 1),
+('救', '救', '구', 0),
+('救', '救世主', '구세주', 0),
+('世', '救世主', '구세주', 1),
+('主', '救世主', '구세주', 2),
+('救', '救出', '구출', 0),
+('出', '救出', '구출', 1),
+('救', '救助', '구조', 0),
+('助', '救助', '구조', 1),
+('救', '救命', '구명', 0),
+('命', '救命', '구명', 1),
+('救', '救命胴衣', '구명동의', 0),
+('命', '救命胴衣', '구명동의', 1),
+('胴', '救命胴衣', '구명동의', 2),
+('衣', '救命胴衣', '구명동의', 3),
+('救', '救國', '구국', 0),
+('國', '救國', '구국', 1),
+('救', '救急衛生車', '구급위생차', 0),
+('急', '救急衛生車', '구급위생차', 1),
+('衛', '救急衛生車', '구급위생차', 2),
+('生', '救急衛生車', '구급위생차', 3),
+('車', '救急衛生車', '구급위생차', 4),
+('救', '救急車', '구급차', 0),
+('急', '救急車', '구급차', 1),
+('車', '救急車', '구급차', 2),
+('救', '救恤', '구휼', 0),
+('恤', '救恤', '구휼', 1),
+('救', '救援', '구원', 0),
+('援', '救援', '구원', 1),
+('救', '救援投手', '구원투수', 0),
+('援', '救援投手', '구원투수', 1),
+('投', '救援投手', '구원투수', 2),
+('手', '救援投手', '구원투수', 3),
+('救', '救濟', '구제', 0),
+('濟', '救濟', '구제', 1),
+('救', '救護', '구호', 0),
+('護', '救護', '구호', 1),
+('救', '救護金', '구호금', 0),
+('護', '救護金', '구호금', 1),
+('金', '救護金', '구호금', 2),
+('救', '救贖', '구속', 0),
+('贖', '救贖', '구속', 1),
+('救', '救難', '구난', 0),
+('難', '救難', '구난', 1),
+('敔', '敔', '어', 0),
+('敗', '敗', '패', 0),
+('敗', '敗北', '패배', 0),
+('北', '敗北', '패배', 1),
+('敗', '敗北者', '패배자', 0),
+('北', '敗北者', '패배자', 1),
+('者', '敗北者', '패배자', 2),
+('敗', '敗戰', '패전', 0),
+('戰', '敗戰', '패전', 1),
+('敗', '敗者', '패자', 0),
+('者', '敗者', '패자', 1),
+('敗', '敗血症', '패혈증', 0),
+('血', '敗血症', '패혈증', 1),
+('症', '敗血症', '패혈증', 2),
+('敘', '敘事', '서사', 0),
+('事', '敘事', '서사', 1),
+('敘', '敘述', '서술', 0),
+('述', '敘述', '서술', 1),
+('教', '教員', '교원', 0),
+('員', '教員', '교원', 1),
+('教', '教室', '교실', 0),
+('室', '教室', '교실', 1),
+('教', '教師', '교사', 0),
+('師', '教師', '교사', 1),
+('教', '教授', '교수', 0),
+('授', '教授', '교수', 1),
+('教', '教會', '교회', 0),
+('會', '教會', '교회', 1),
+('教', '教理', '교리', 0),
+('理', '教理', '교리', 1),
+('教', '教皇', '교황', 0),
+('皇', '教皇', '교황', 1),
+('教', '教育', '교육', 0),
+('育', '教育', '교육', 1),
+('教', '教育學', '교육학', 0),
+('育', '教育學', '교육학', 1),
+('學', '教育學', '교육학', 2),
+('教', '教養', '교양', 0),
+('養', '教養', '교양', 1),
+('敢', '敢', '감', 0),
+('散', '散亂', '산란', 0),
+('亂', '散亂', '산란', 1),
+('散', '散佚', '산일', 0),
+('佚', '散佚', '산일', 1),
+('散', '散兵', '산병', 0),
+('兵', '散兵', '산병', 1),
+('散', '散在', '산재', 0),
+('在', '散在', '산재', 1),
+('散', '散布', '산포', 0),
+('布', '散布', '산포', 1),
+('散', '散文', '산문', 0),
+('文', '散文', '산문', 1),
+('散', '散步', '산보', 0),
+('步', '散步', '산보', 1),
+('散', '散炙', '산적', 0),
+('炙', '散炙', '산적', 1),
+('散', '散發', '산발', 0),
+('發', '散發', '산발', 1),
+('散', '散發的', '산발적', 0),
+('發', '散發的', '산발적', 1),
+('的', '散發的', '산발적', 2),
+('散', '散策', '산책', 0),
+('策', '散策', '산책', 1),
+('散', '散聲', '산성', 0),
+('聲', '散聲', '산성', 1),
+('散', '散花', '산화', 0),
+('花', '散花', '산화', 1),
+('散', '散調', '산조', 0),
+('調', '散調', '산조', 1),
+('散', '散軼', '산일', 0),
+('軼', '散軼', '산일', 1),
+('散', '散逸', '산일', 0),
+('逸', '散逸', '산일', 1),
+('敬', '敬意', '경의', 0),
+('意', '敬意', '경의', 1),
+('敬', '敬愛', '경애', 0),
+('愛', '敬愛', '경애', 1),
+('敬', '敬畏', '경외', 0),
+('畏', '敬畏', '경외', 1),
+('敬', '敬禮', '경례', 0),
+('禮', '敬禮', '경례', 1),
+('敬', '敬稱', '경칭', 0),
+('稱', '敬稱', '경칭', 1),
+('敬', '敬而遠之', '경이원지', 0),
+('而', '敬而遠之', '경이원지', 1),
+('遠', '敬而遠之', '경이원지', 2),
+('之', '敬而遠之', '경이원지', 3),
+('敬', '敬虔', '경건', 0),
+('虔', '敬虔', '경건', 1),
+('敬', '敬語', '경어', 0),
+('語', '敬語', '경어', 1),
+('整', '整備', '정비', 0),
+('備', '整備', '정비', 1),
+('整', '整備員', '정비원', 0),
+('備', '整備員', '정비원', 1),
+('員', '整備員', '정비원', 2),
+('整', '整備工', '정비공', 0),
+('備', '整備工', '정비공', 1),
+('工', '整備工', '정비공', 2),
+('整', '整地', '정지', 0),
+('地', '整地', '정지', 1),
+('整', '整式', '정식', 0),
+('式', '整式', '정식', 1),
+('整', '整形', '정형', 0),
+('形', '整形', '정형', 1),
+('整', '整數', '정수', 0),
+('數', '整數', '정수', 1),
+('整', '整流', '정류', 0),
+('流', '整流', '정류', 1),
+('整', '整理', '정리', 0),
+('理', '整理', '정리', 1),
+('整', '整頓', '정돈', 0),
+('頓', '整頓', '정돈', 1),
+('整', '整飾', '정식', 0),
+('飾', '整飾', '정식', 1),
+('敵', '敵', '적', 0),
+('敵', '敵國', '적국', 0),
+('國', '敵國', '적국', 1),
+('敵', '敵地', '적지', 0),
+('地', '敵地', '적지', 1),
+('敵', '敵對', '적대', 0),
+('對', '敵對', '적대', 1),
+('敵', '敵對的', '적대적', 0),
+('對', '敵對的', '적대적', 1),
+('的', '敵對的', '적대적', 2),
+('敵', '敵對者', '적대자', 0),
+('對', '敵對者', '적대자', 1),
+('者', '敵對者', '적대자', 2),
+('敵', '敵意', '적의', 0),
+('意', '敵意', '적의', 1),
+('敵', '敵手', '적수', 0),
+('手', '敵手', '적수', 1),
+('敵', '敵艦', '적함', 0),
+('艦', '敵艦', '적함', 1),
+('敵', '敵軍', '적군', 0),
+('軍', '敵軍', '적군', 1),
+('敷', '敷地', '부지', 0),
+('地', '敷地', '부지', 1),
+('敷', '敷衍', '부연', 0),
+('衍', '敷衍', '부연', 1),
+('數', '數', '수', 0),
+('數', '數--', '수많다', 0),
+('-', '數--', '수많다', 1),
+('-', '數--', '수많다', 2),
+('數', '數--', '수없이', 0),
+('-', '數--', '수없이', 1),
+('-', '數--', '수없이', 2),
+('數', '數値', '수치', 0),
+('値', '數値', '수치', 1),
+('數', '數分類詞', '수분류사', 0),
+('分', '數分類詞', '수분류사', 1),
+('類', '數分類詞', '수분류사', 2),
+('詞', '數分類詞', '수분류사', 3),
+('數', '數列', '수열', 0),
+('列', '數列', '수열', 1),
+('數', '數十', '수십', 0),
+('十', '數十', '수십', 1),
+('數', '數千', '수천', 0),
+('千', '數千', '수천', 1),
+('數', '數字', '숫자', 0),
+('字', '數字', '숫자', 1),
+('數', '數學', '수학', 0),
+('學', '數學', '수학', 1),
+('數', '數學者', '수학자', 0),
+('學', '數學者', '수학자', 1),
+('者', '數學者', '수학자', 2),
+('數', '數年', '수년', 0),
+('年', '數年', '수년', 1),
+('數', '數式', '수식', 0),
+('式', '數式', '수식', 1),
+('數', '數抛者', '수포자', 0),
+('抛', '數抛者', '수포자', 1),
+('者', '數抛者', '수포자', 2),
+('數', '數板', '수판', 0),
+('板', '數板', '수판', 1),
+('數', '數爻', '수효', 0),
+('爻', '數爻', '수효', 1),
+('數', '數理', '수리', 0),
+('理', '數理', '수리', 1),
+('數', '數理的', '수리적', 0),
+('理', '數理的', '수리적', 1),
+('的', '數理的', '수리적', 2),
+('數', '數百', '수백', 0),
+('百', '數百', '수백', 1),
+('數', '數的', '수적', 0),
+('的', '數的', '수적', 1),
+('數', '數算機', '수산기', 0),
+('算', '數算機', '수산기', 1),
+('機', '數算機', '수산기', 2),
+('數', '數萬', '수만', 0),
+('萬', '數萬', '수만', 1),
+('數', '數詞', '수사', 0),
+('詞', '數詞', '수사', 1),
+('數', '數量', '수량', 0),
+('量', '數量', '수량', 1),
+('數', '數量形容詞', '수량형용사', 0),
+('量', '數量形容詞', '수량형용사', 1),
+('形', '數量形容詞', '수량형용사', 2),
+('容', '數量形容詞', '수량형용사', 3),
+('詞', '數量形容詞', '수량형용사', 4),
+('文', '文', '문', 0),
+('文', '文具', '문구', 0),
+('具', '文具', '문구', 1),
+('文', '文具店', '문구점', 0),
+('具', '文具店', '문구점', 1),
+('店', '文具店', '문구점', 2),
+('文', '文典', '문전', 0),
+('典', '文典', '문전', 1),
+('文', '文化', '문화', 0),
+('化', '文化', '문화', 1),
+('文', '文化住宅', '문화주택', 0),
+('化', '文化住宅', '문화주택', 1),
+('住', '文化住宅', '문화주택', 2),
+('宅', '文化住宅', '문화주택', 3),
+('文', '文化大革命', '문화대혁명', 0),
+('化', '文化大革命', '문화대혁명', 1),
+('大', '文化大革命', '문화대혁명', 2),
+('革', '文化大革命', '문화대혁명', 3),
+('命', '文化大革命', '문화대혁명', 4),
+('文', '文化的', '문화적', 0),
+('化', '文化的', '문화적', 1),
+('的', '文化的', '문화적', 2),
+('文', '文化語', '문화어', 0),
+('化', '文化語', '문화어', 1),
+('語', '文化語', '문화어', 2),
+('文', '文化財', '문화재', 0),
+('化', '文化財', '문화재', 1),
+('財', '文化財', '문화재', 2),
+('文', '文化院', '문화원', 0),
+('化', '文化院', '문화원', 1),
+('院', '文化院', '문화원', 2),
+('文', '文匣', '문갑', 0),
+('匣', '文匣', '문갑', 1),
+('文', '文句', '문구', 0),
+('句', '文句', '문구', 1),
+('文', '文名', '문명', 0),
+('名', '文名', '문명', 1),
+('文', '文型', '문형', 0),
+('型', '文型', '문형', 1),
+('文', '文壇', '문단', 0),
+('壇', '文壇', '문단', 1),
+('文', '文士', '문사', 0),
+('士', '文士', '문사', 1),
+('文', '文字', '문자', 0),
+('字', '文字', '문자', 1),
+('文', '文字盤', '문자반', 0),
+('字', '文字盤', '문자반', 1),
+('盤', '文字盤', '문자반', 2),
+('文', '文學', '문학', 0),
+('學', '文學', '문학', 1),
+('文', '文川', '문천', 0),
+('川', '文川', '문천', 1),
+('文', '文廟', '문묘', 0),
+('廟', '文廟', '문묘', 1),
+('文', '文房', '문방', 0),
+('房', '文房', '문방', 1),
+('文', '文房四寶', '문방사보', 0),
+('房', '文房四寶', '문방사보', 1),
+('四', '文房四寶', '문방사보', 2),
+('寶', '文房四寶', '문방사보', 3),
+('文', '文明', '문명', 0),
+('明', '文明', '문명', 1),
+('文', '文書', '문서', 0),
+('書', '文書', '문서', 1),
+('文', '文段', '문단', 0),
+('段', '文段', '문단', 1),
+('文', '文法', '문법', 0),
+('法', '文法', '문법', 1),
+('文', '文物', '문물', 0),
+('物', '文物', '문물', 1),
+('文', '文獻', '문헌', 0),
+('獻', '文獻', '문헌', 1),
+('文', '文獻學', '문헌학', 0),
+('獻', '文獻學', '문헌학', 1),
+('學', '文獻學', '문헌학', 2),
+('文', '文盲', '문맹', 0),
+('盲', '文盲', '문맹', 1),
+('文', '文科', '문과', 0),
+('科', '文科', '문과', 1),
+('文', '文章', '문장', 0),
+('章', '文章', '문장', 1),
+('文', '文翰', '문한', 0),
+('翰', '文翰', '문한', 1),
+('文', '文脈', '문맥', 0),
+('脈', '文脈', '문맥', 1),
+('文', '文藝', '문예', 0),
+('藝', '文藝', '문예', 1),
+('文', '文解', '문해', 0),
+('解', '文解', '문해', 1),
+('文', '文解敎育', '문해교육', 0),
+('解', '文解敎育', '문해교육', 1),
+('敎', '文解敎育', '문해교육', 2),
+('育', '文解敎育', '문해교육', 3),
+('文', '文言', '문언', 0),
+('言', '文言', '문언', 1),
+('文', '文語', '문어', 0),
+('語', '文語', '문어', 1),
+('文', '文質彬彬', '문질빈빈', 0),
+('質', '文質彬彬', '문질빈빈', 1),
+('彬', '文質彬彬', '문질빈빈', 2),
+('彬', '文質彬彬', '문질빈빈', 3),
+('文', '文身', '문신', 0),
+('身', '文身', '문신', 1),
+('文', '文選', '문선', 0),
+('選', '文選', '문선', 1),
+('文', '文鎭', '문진', 0),
+('鎭', '文鎭', '문진', 1),
+('文', '文集', '문집', 0),
+('集', '文集', '문집', 1),
+('文', '文革', '문혁', 0),
+('革', '文革', '문혁', 1),
+('文', '文體', '문체', 0),
+('體', '文體', '문체', 1),
+('文', '文魚', '문어', 0),
+('魚', '文魚', '문어', 1),
+('斑', '斑指', '반지', 0),
+('指', '斑指', '반지', 1),
+('斑', '斑點', '반점', 0),
+('點', '斑點', '반점', 1),
+('料', '料理', '료리', 0),
+('理', '料理', '료리', 1),
+('料', '料理', '요리', 0),
+('理', '料理', '요리', 1),
+('料', '料理 ', '료리사', 0),
+('理', '料理 ', '료리사', 1),
+('料', '料理師', '요리사', 0),
+('理', '料理師', '요리사', 1),
+('師', '料理師', '요리사', 2),
+('料', '料金', '료금', 0),
+('金', '料金', '료금', 1),
+('料', '料金', '요금', 0),
+('金', '料金', '요금', 1),
+('料', '料金所', '요금소', 0),
+('金', '料金所', '요금소', 1),
+('所', '料金所', '요금소', 2),
+('斜', '斜行', '사행', 0),
+('行', '斜行', '사행', 1),
+('斜', '斜視', '사시', 0),
+('視', '斜視', '사시', 1),
+('斜', '斜陽', '사양', 0),
+('陽', '斜陽', '사양', 1),
+('斟', '斟酌', '짐작', 0),
+('酌', '斟酌', '짐작', 1),
+('斡', '斡旋', '알선', 0),
+('旋', '斡旋', '알선', 1),
+('斤', '斤', '근', 0),
+('斥', '斥候', '척후', 0),
+('候', '斥候', '척후', 1),
+('斬', '斬新', '참신', 0),
+('新', '斬新', '참신', 1),
+('斬', '斬首', '참수', 0),
+('首', '斬首', '참수', 1),
+('新', '新世代', '신세대', 0),
+('世', '新世代', '신세대', 1),
+('代', '新世代', '신세대', 2),
+('新', '新世界', '신세계', 0),
+('世', '新世界', '신세계', 1),
+('界', '新世界', '신세계', 2),
+('新', '新人', '신인', 0),
+('人', '新人', '신인', 1),
+('新', '新令', '신령', 0),
+('令', '新令', '신령', 1),
+('新', '新入生', '신입생', 0),
+('入', '新入生', '신입생', 1),
+('生', '新入生', '신입생', 2),
+('新', '新兵', '신병', 0),
+('兵', '新兵', '신병', 1),
+('新', '新加坡', '신가파', 0),
+('加', '新加坡', '신가파', 1),
+('坡', '新加坡', '신가파', 2),
+('新', '新參', '신참', 0),
+('參', '新參', '신참', 1),
+('新', '新參者', '신참자', 0),
+('參', '新參者', '신참자', 1),
+('者', '新參者', '신참자', 2),
+('新', '新品', '신품', 0),
+('品', '新品', '신품', 1),
+('新', '新型', '신형', 0),
+('型', '新型', '신형', 1),
+('新', '新天地', '신천지', 0),
+('天', '新天地', '신천지', 1),
+('地', '新天地', '신천지', 2),
+('新', '新奇', '신기', 0),
+('奇', '新奇', '신기', 1),
+('新', '新婚', '신혼', 0),
+('婚', '新婚', '신혼', 1),
+('新', '新婚夫婦', '신혼부부', 0),
+('婚', '新婚夫婦', '신혼부부', 1),
+('夫', '新婚夫婦', '신혼부부', 2),
+('婦', '新婚夫婦', '신혼부부', 3),
+('新', '新婚旅行', '신혼여행', 0),
+('婚', '新婚旅行', '신혼여행', 1),
+('旅', '新婚旅行', '신혼여행', 2),
+('行', '新婚旅行', '신혼여행', 3),
+('新', '新婚旅行', '신혼여행', 0),
+('婚', '新婚旅行', '신혼여행', 1),
+('旅', '新婚旅行', '신혼여행', 2),
+('行', '新婚旅行', '신혼여행', 3),
+('新', '新婦', '신부', 0),
+('婦', '新婦', '신부', 1),
+('新', '新字體', '신자체', 0),
+('字', '新字體', '신자체', 1),
+('體', '新字體', '신자체', 2),
+('新', '新年', '신년', 0),
+('年', '新年', '신년', 1),
+('新', '新年辭', '신년사', 0),
+('年', '新年辭', '신년사', 1),
+('辭', '新年辭', '신년사', 2),
+('新', '新患', '신환', 0),
+('患', '新患', '신환', 1),
+('新', '新敎徒', '신교도', 0),
+('敎', '新敎徒', '신교도', 1),
+('徒', '新敎徒', '신교도', 2),
+('新', '新教徒', '신교도', 0),
+('教', '新教徒', '신교도', 1),
+('徒', '新教徒', '신교도', 2),
+('新', '新星', '신성', 0),
+('星', '新星', '신성', 1),
+('新', '新時代', '신시대', 0),
+('時', '新時代', '신시대', 1),
+('代', '新時代', '신시대', 2),
+('新', '新曆', '신력', 0),
+('曆', '新曆', '신력', 1),
+('新', '新曲', '신곡', 0),
+('曲', '新曲', '신곡', 1),
+('新', '新書', '신서', 0),
+('書', '新書', '신서', 1),
+('新', '新機軸', '신기축', 0),
+('機', '新機軸', '신기축', 1),
+('軸', '新機軸', '신기축', 2),
+('新', '新正', '신정', 0),
+('正', '新正', '신정', 1),
+('新', '新民謠', '신민요', 0),
+('民', '新民謠', '신민요', 1),
+('謠', '新民謠', '신민요', 2),
+('新', '新浦', '신포', 0),
+('浦', '新浦', '신포', 1),
+('新', '新生', '신생', 0),
+('生', '新生', '신생', 1),
+('新', '新生兒', '신생아', 0),
+('生', '新生兒', '신생아', 1),
+('兒', '新生兒', '신생아', 2),
+('新', '新疆', '신강', 0),
+('疆', '新疆', '신강', 1),
+('新', '新病', '신병', 0),
+('病', '新病', '신병', 1),
+('新', '新種', '신종', 0),
+('種', '新種', '신종', 1),
+('新', '新築', '신축', 0),
+('築', '新築', '신축', 1),
+('新', '新羅', '신라', 0),
+('羅', '新羅', '신라', 1),
+('新', '新義州', '신의주', 0),
+('義', '新義州', '신의주', 1),
+('州', '新義州', '신의주', 2),
+('新', '新聞', '신문', 0),
+('聞', '新聞', '신문', 1),
+('新', '新聞用紙', '신문용지', 0),
+('聞', '新聞用紙', '신문용지', 1),
+('用', '新聞用紙', '신문용지', 2),
+('紙', '新聞用紙', '신문용지', 3),
+('新', '新聞社', '신문사', 0),
+('聞', '新聞社', '신문사', 1),
+('社', '新聞社', '신문사', 2),
+('新', '新聞紙', '신문지', 0),
+('聞', '新聞紙', '신문지', 1),
+('紙', '新聞紙', '신문지', 2),
+('新', '新製品', '신제품', 0),
+('製', '新製品', '신제품', 1),
+('品', '新製品', '신제품', 2),
+('新', '新規', '신규', 0),
+('規', '新規', '신규', 1),
+('新', '新設', '신설', 0),
+('設', '新設', '신설', 1),
+('新', '新語', '신어', 0),
+('語', '新語', '신어', 1),
+('新', '新軍部', '신군부', 0),
+('軍', '新軍部', '신군부', 1),
+('部', '新軍部', '신군부', 2),
+('新', '新造語', '신조어', 0),
+('造', '新造語', '신조어', 1),
+('語', '新造語', '신조어', 2),
+('新', '新郎', '신랑', 0),
+('郎', '新郎', '신랑', 1),
+('新', '新郞', '신랑', 0),
+('郞', '新郞', '신랑', 1),
+('新', '新陳代謝', '신진대사', 0),
+('陳', '新陳代謝', '신진대사', 1),
+('代', '新陳代謝', '신진대사', 2),
+('謝', '新陳代謝', '신진대사', 3),
+('新', '新館', '신관', 0),
+('館', '新館', '신관', 1),
+('新', '新體制', '신체제', 0),
+('體', '新體制', '신체제', 1),
+('制', '新體制', '신체제', 2),
+('新', '新鮮', '신선', 0),
+('鮮', '新鮮', '신선', 1),
+('新', '新黨', '신당', 0),
+('黨', '新黨', '신당', 1),
+('斷', '斷層', '단층', 0),
+('層', '斷層', '단층', 1),
+('斷', '斷層撮影', '단층촬영', 0),
+('層', '斷層撮影', '단층촬영', 1),
+('撮', '斷層撮影', '단층촬영', 2),
+('影', '斷層撮影', '단층촬영', 3),
+('斷', '斷念', '단념', 0),
+('念', '斷念', '단념', 1),
+('斷', '斷熱', '단열', 0),
+('熱', '斷熱', '단열', 1),
+('斷', '斷片', '단편', 0),
+('片', '斷片', '단편', 1),
+('斷', '斷種', '단종', 0),
+('種', '斷種', '단종', 1),
+('斷', '斷絶', '단절', 0),
+('絶', '斷絶', '단절', 1),
+('斷', '斷續', '단속', 0),
+('續', '斷續', '단속', 1),
+('斷', '斷言', '단언', 0),
+('言', '斷言', '단언', 1),
+('斷', '斷面', '단면', 0),
+('面', '斷面', '단면', 1),
+('斷', '斷頭臺', '단두대', 0),
+('頭', '斷頭臺', '단두대', 1),
+('臺', '斷頭臺', '단두대', 2),
+('斷', '斷食', '단식', 0),
+('食', '斷食', '단식', 1),
+('斷', '斷髮', '단발', 0),
+('髮', '斷髮', '단발', 1),
+('方', '方丈', '방장', 0),
+('丈', '方丈', '방장', 1),
+('方', '方今', '방금', 0),
+('今', '方今', '방금', 1),
+('方', '方位', '방위', 0),
+('位', '方位', '방위', 1),
+('方', '方位角', '방위각', 0),
+('位', '方位角', '방위각', 1),
+('角', '方位角', '방위각', 2),
+('方', '方便', '방편', 0),
+('便', '方便', '방편', 1),
+('方', '方向', '방향', 0),
+('向', '方向', '방향', 1),
+('方', '方士', '방사', 0),
+('士', '方士', '방사', 1),
+('方', '方式', '방식', 0),
+('式', '方式', '방식', 1),
+('方', '方案', '방안', 0),
+('案', '方案', '방안', 1),
+('方', '方法', '방법', 0),
+('法', '方法', '방법', 1),
+('方', '方法論', '방법론', 0),
+('法', '方法論', '방법론', 1),
+('論', '方法論', '방법론', 2),
+('方', '方眼紙', '방안지', 0),
+('眼', '方眼紙', '방안지', 1),
+('紙', '方眼紙', '방안지', 2),
+('方', '方程式', '방정식', 0),
+('程', '方程式', '방정식', 1),
+('式', '方程式', '방정식', 2),
+('方', '方策', '방책', 0),
+('策', '方策', '방책', 1),
+('方', '方舟', '방주', 0),
+('舟', '方舟', '방주', 1),
+('方', '方解石', '방해석', 0),
+('解', '方解石', '방해석', 1),
+('石', '方解石', '방해석', 2),
+('方', '方言', '방언', 0),
+('言', '方言', '방언', 1),
+('方', '方針', '방침', 0),
+('針', '方針', '방침', 1),
+('方', '方面', '방면', 0),
+('面', '方面', '방면', 1),
+('方', '方響', '방향', 0),
+('響', '方響', '방향', 1),
+('於', '於此彼', '어차피', 0),
+('此', '於此彼', '어차피', 1),
+('彼', '於此彼', '어차피', 2),
+('施', '施主', '시주', 0),
+('主', '施主', '시주', 1),
+('施', '施惠', '시혜', 0),
+('惠', '施惠', '시혜', 1),
+('施', '施行', '시행', 0),
+('行', '施行', '시행', 1),
+('施', '施設', '시설', 0),
+('設', '施設', '시설', 1),
+('施', '施賞', '시상', 0),
+('賞', '施賞', '시상', 1),
+('施', '施釉', '시유', 0),
+('釉', '施釉', '시유', 1),
+('旁', '旁', '방', 0),
+('旁', '旁牌', '방패', 0),
+('牌', '旁牌', '방패', 1),
+('旅', '旅人宿', '여인숙', 0),
+('人', '旅人宿', '여인숙', 1),
+('宿', '旅人宿', '여인숙', 2),
+('旅', '旅券', '려권', 0),
+('券', '旅券', '려권', 1),
+('旅', '旅券', '여권', 0),
+('券', '旅券', '여권', 1),
+('旅', '旅團', '려단', 0),
+('團', '旅團', '려단', 1),
+('旅', '旅團', '여단', 0),
+('團', '旅團', '여단', 1),
+('旅', '旅客', '여객', 0),
+('客', '旅客', '여객', 1),
+('旅', '旅客機', '여객기', 0),
+('客', '旅客機', '여객기', 1),
+('機', '旅客機', '여객기', 2),
+('旅', '旅程', '여정', 0),
+('程', '旅程', '여정', 1),
+('旅', '旅行', '려행', 0),
+('行', '旅行', '려행', 1),
+('旅', '旅行', '여행', 0),
+('行', '旅行', '여행', 1),
+('旅', '旅行社', '여행사', 0),
+('行', '旅行社', '여행사', 1),
+('社', '旅行社', '여행사', 2),
+('旅', '旅行者', '여행자', 0),
+('行', '旅行者', '여행자', 1),
+('者', '旅行者', '여행자', 2),
+('旅', '旅館', '려관', 0),
+('館', '旅館', '려관', 1),
+('旅', '旅館', '여관', 0),
+('館', '旅館', '여관', 1),
+('旋', '旋回', '선회', 0),
+('回', '旋回', '선회', 1),
+('旋', '旋律', '선율', 0),
+('律', '旋律', '선율', 1),
+('旋', '旋盤', '선반', 0),
+('盤', '旋盤', '선반', 1),
+('旋', '旋盤工', '선반공', 0),
+('盤', '旋盤工', '선반공', 1),
+('工', '旋盤工', '선반공', 2),
+('旋', '旋風', '선풍', 0),
+('風', '旋風', '선풍', 1),
+('族', '族', '족', 0),
+('族', '族長', '족장', 0),
+('長', '族長', '족장', 1),
+('旗', '旗', '기', 0),
+('旗', '旗學', '기학', 0),
+('學', '旗學', '기학', 1),
+('旗', '旗幟', '기치', 0),
+('幟', '旗幟', '기치', 1),
+('旗', '旗幟鮮明', '기치선명', 0),
+('幟', '旗幟鮮明', '기치선명', 1),
+('鮮', '旗幟鮮明', '기치선명', 2),
+('明', '旗幟鮮明', '기치선명', 3),
+('旗', '旗手', '기수', 0),
+('手', '旗手', '기수', 1),
+('旗', '旗艦', '기함', 0),
+('艦', '旗艦', '기함', 1),
+('旗', '旗魚', '기어', 0),
+('魚', '旗魚', '기어', 1),
+('旗', '旗대', '깃대', 0),
+('대', '旗대', '깃대', 1),
+('旣', '旣婚', '기혼', 0),
+('婚', '旣婚', '기혼', 1),
+('旣', '旣存', '기존', 0),
+('存', '旣存', '기존', 1),
+('旣', '旣往症', '기왕증', 0),
+('往', '旣往症', '기왕증', 1),
+('症', '旣往症', '기왕증', 2),
+('旣', '旣成', '기성', 0),
+('成', '旣成', '기성', 1),
+('旣', '旣成世代', '기성세대', 0),
+('成', '旣成世代', '기성세대', 1),
+('世', '旣成世代', '기성세대', 2),
+('代', '旣成世代', '기성세대', 3),
+('旣', '旣決囚', '기결수', 0),
+('決', '旣決囚', '기결수', 1),
+('囚', '旣決囚', '기결수', 2),
+('旣', '旣視感', '기시감', 0),
+('視', '旣視感', '기시감', 1),
+('感', '旣視感', '기시감', 2),
+('日', '日', '일', 0),
+('日', '日人', '일인', 0),
+('人', '日人', '일인', 1),
+('日', '日傭職', '일용직', 0),
+('傭', '日傭職', '일용직', 1),
+('職', '日傭職', '일용직', 2),
+('日', '日光', '일광', 0),
+('光', '日光', '일광', 1),
+('日', '日光浴', '일광욕', 0),
+('光', '日光浴', '일광욕', 1),
+('浴', '日光浴', '일광욕', 2),
+('日', '日出', '일출', 0),
+('出', '日出', '일출', 1),
+('日', '日刊', '일간', 0),
+('刊', '日刊', '일간', 1),
+('日', '日刊新聞', '일간신문', 0),
+('刊', '日刊新聞', '일간신문', 1),
+('新', '日刊新聞', '일간신문', 2),
+('聞', '日刊新聞', '일간신문', 3),
+('日', '日刊紙', '일간지', 0),
+('刊', '日刊紙', '일간지', 1),
+('紙', '日刊紙', '일간지', 2),
+('日', '日報', '일보', 0),
+('報', '日報', '일보', 1),
+('日', '日子', '일자', 0),
+('子', '日子', '일자', 1),
+('日', '日射病', '일사병', 0),
+('射', '日射病', '일사병', 1),
+('病', '日射病', '일사병', 2),
+('日', '日就月將', '일취월장', 0),
+('就', '日就月將', '일취월장', 1),
+('月', '日就月將', '일취월장', 2),
+('將', '日就月將', '일취월장', 3),
+('日', '日帝', '일제', 0),
+('帝', '日帝', '일제', 1),
+('日', '日帝 強占期', '일제 강점기', 0),
+('帝', '日帝 強占期', '일제 강점기', 1),
+('強', '日帝 強占期', '일제 강점기', 3),
+('占', '日帝 強占期', '일제 강점기', 4),
+('期', '日帝 強占期', '일제 강점기', 5),
+('日', '日常', '일상', 0),
+('常', '日常', '일상', 1),
+('日', '日常生活', '일상생활', 0),
+('常', '日常生活', '일상생활', 1),
+('生', '日常生活', '일상생활', 2),
+('活', '日常生活', '일상생활', 3),
+('日', '日文', '일문', 0),
+('文', '日文', '일문', 1),
+('日', '日日', '일일', 0),
+('日', '日日', '일일', 1),
+('日', '日時', '일시', 0),
+('時', '日時', '일시', 1),
+('日', '日曆', '일력', 0),
+('曆', '日曆', '일력', 1),
+('日', '日曜日', '일요일', 0),
+('曜', '日曜日', '일요일', 1),
+('日', '日曜日', '일요일', 2),
+('日', '日月', '일월', 0),
+('月', '日月', '일월', 1),
+('日', '日本', '일본', 0),
+('本', '日本', '일본', 1),
+('日', '日本 帝國', '일본 제국', 0),
+('本', '日本 帝國', '일본 제국', 1),
+('帝', '日本 帝國', '일본 제국', 3),
+('國', '日本 帝國', '일본 제국', 4),
+('日', '日本人', '일본인', 0),
+('本', '日本人', '일본인', 1),
+('人', '日本人', '일본인', 2),
+('日', '日本化', '일본화', 0),
+('本', '日本化', '일본화', 1),
+('化', '日本化', '일본화', 2),
+('日', '日本史', '일본사', 0),
+('本', '日本史', '일본사', 1),
+('史', '日本史', '일본사', 2),
+('日', '日本國', '일본국', 0),
+('本', '日本國', '일본국', 1),
+('國', '日本國', '일본국', 2),
+('日', '日本學', '일본학', 0),
+('本', '日本學', '일본학', 1),
+('學', '日本學', '일본학', 2),
+('日', '日本海', '일본해', 0),
+('本', '日本海', '일본해', 1),
+('海', '日本海', '일본해', 2),
+('日', '日本語', '일본어', 0),
+('本', '日本語', '일본어', 1),
+('語', '日本語', '일본어', 2),
+('日', '日本酒', '일본주', 0),
+('本', '日本酒', '일본주', 1),
+('酒', '日本酒', '일본주', 2),
+('日', '日氣', '일기', 0),
+('氣', '日氣', '일기', 1),
+('日', '日氣 豫報', '일기 예보', 0),
+('氣', '日氣 豫報', '일기 예보', 1),
+('豫', '日氣 豫報', '일기 예보', 3),
+('報', '日氣 豫報', '일기 예보', 4),
+('日', '日沒', '일몰', 0),
+('沒', '日沒', '일몰', 1),
+('日', '日王', '일왕', 0),
+('王', '日王', '일왕', 1),
+('日', '日用品', '일용품', 0),
+('用', '日用品', '일용품', 1),
+('品', '日用品', '일용품', 2),
+('日', '日程', '일정', 0),
+('程', '日程', '일정', 1),
+('日', '日章旗', '일장기', 0),
+('章', '日章旗', '일장기', 1),
+('旗', '日章旗', '일장기', 2),
+('日', '日茂', '일무', 0),
+('茂', '日茂', '일무', 1),
+('日', '日落', '일락', 0),
+('落', '日落', '일락', 1),
+('日', '日蝕', '일식', 0),
+('蝕', '日蝕', '일식', 1),
+('日', '日製', '일제', 0),
+('製', '日製', '일제', 1),
+('日', '日記', '일기', 0),
+('記', '日記', '일기', 1),
+('日', '日記帳', '일기장', 0),
+('記', '日記帳', '일기장', 1),
+('帳', '日記帳', '일기장', 2),
+('日', '日語', '일어', 0),
+('語', '日語', '일어', 1),
+('日', '日課表', '일과표', 0),
+('課', '日課表', '일과표', 1),
+('表', '日課表', '일과표', 2),
+('日', '日間', '일간', 0),
+('間', '日間', '일간', 1),
+('日', '日韓', '일한', 0),
+('韓', '日韓', '일한', 1),
+('日', '日食', '일식', 0),
+('食', '日食', '일식', 1),
+('早', '早世', '조세', 0),
+('世', '早世', '조세', 1),
+('早', '早春', '조춘', 0),
+('春', '早春', '조춘', 1),
+('早', '早朝', '조조', 0),
+('朝', '早朝', '조조', 1),
+('早', '早期', '조기', 0),
+('期', '早期', '조기', 1),
+('早', '早死', '조사', 0),
+('死', '早死', '조사', 1),
+('早', '早漏', '조루', 0),
+('漏', '早漏', '조루', 1),
+('早', '早起', '조기', 0),
+('起', '早起', '조기', 1),
+('早', '早退', '조퇴', 0),
+('退', '早退', '조퇴', 1),
+('早', '早食', '조식', 0),
+('食', '早食', '조식', 1),
+('早', '早飯', '조반', 0),
+('飯', '早飯', '조반', 1),
+('旬', '旬', '순', 0),
+('旭', '旭日旗', '욱일기', 0),
+('日', '旭日旗', '욱일기', 1),
+('旗', '旭日旗', '욱일기', 2),
+('旱', '旱魃', '한발', 0),
+('魃', '旱魃', '한발', 1),
+('旺', '旺盛', '왕성', 0),
+('盛', '旺盛', '왕성', 1),
+('昂', '昂騰', '앙등', 0),
+('騰', '昂騰', '앙등', 1),
+('昆', '昆蟲', '곤충', 0),
+('蟲', '昆蟲', '곤충', 1),
+('昆', '昆蟲學', '곤충학', 0),
+('蟲', '昆蟲學', '곤충학', 1),
+('學', '昆蟲學', '곤충학', 2),
+('昇', '昇天', '승천', 0),
+('天', '昇天', '승천', 1),
+('昇', '昇汞', '승홍', 0),
+('汞', '昇汞', '승홍', 1),
+('昇', '昇級', '승급', 0),
+('級', '昇級', '승급', 1),
+('昇', '昇華', '승화', 0),
+('華', '昇華', '승화', 1),
+('昇', '昇進', '승진', 0),
+('進', '昇進', '승진', 1),
+('昇', '昇遐', '승하', 0),
+('遐', '昇遐', '승하', 1),
+('昇', '昇降機', '승강기', 0),
+('降', '昇降機', '승강기', 1),
+('機', '昇降機', '승강기', 2),
+('昌', '昌', '창', 0),
+('昌', '昌原', '창원', 0),
+('原', '昌原', '창원', 1),
+('明', '明卵', '명란', 0),
+('卵', '明卵', '명란', 1),
+('明', '明君', '명군', 0),
+('君', '明君', '명군', 1),
+('明', '明哲', '명철', 0),
+('哲', '明哲', '명철', 1),
+('明', '明堂', '명당', 0),
+('堂', '明堂', '명당', 1),
+('明', '明太', '명태', 0),
+('太', '明太', '명태', 1),
+('明', '明察', '명찰', 0),
+('察', '明察', '명찰', 1),
+('明', '明敏', '명민', 0),
+('敏', '明敏', '명민', 1),
+('明', '明文', '명문', 0),
+('文', '明文', '명문', 1),
+('明', '明日', '명일', 0),
+('日', '明日', '명일', 1),
+('明', '明暗', '명암', 0),
+('暗', '明暗', '명암', 1),
+('明', '明月', '명월', 0),
+('月', '明月', '명월', 1),
+('明', '明朝', '명조', 0),
+('朝', '明朝', '명조', 1),
+('明', '明朝體', '명조체', 0),
+('朝', '明朝體', '명조체', 1),
+('體', '明朝體', '명조체', 2),
+('明', '明末淸初', '명말청초', 0),
+('末', '明末淸初', '명말청초', 1),
+('淸', '明末淸初', '명말청초', 2),
+('初', '明末淸初', '명말청초', 3),
+('明', '明洞', '명동', 0),
+('洞', '明洞', '명동', 1),
+('明', '明滅', '명멸', 0),
+('滅', '明滅', '명멸', 1),
+('明', '明確', '명확', 0),
+('確', '明確', '명확', 1),
+('明', '明示', '명시', 0),
+('示', '明示', '명시', 1),
+('明', '明神', '명신', 0),
+('神', '明神', '명신', 1),
+('明', '明紬', '명주', 0),
+('紬', '明紬', '명주', 1),
+('明', '明細', '명세', 0),
+('細', '明細', '명세', 1),
+('明', '明若觀火', '명약관화', 0),
+('若', '明若觀火', '명약관화', 1),
+('觀', '明若觀火', '명약관화', 2),
+('火', '明若觀火', '명약관화', 3),
+('明', '明視', '명시', 0),
+('視', '明視', '명시', 1),
+('明', '明記', '명기', 0),
+('記', '明記', '명기', 1),
+('昏', '昏困', '혼곤', 0),
+('困', '昏困', '혼곤', 1),
+('昏', '昏睡', '혼수', 0),
+('睡', '昏睡', '혼수', 1),
+('昏', '昏絕', '혼절', 0),
+('絕', '昏絕', '혼절', 1),
+('昏', '昏迷', '혼미', 0),
+('迷', '昏迷', '혼미', 1),
+('易', '易地思之', '역지사지', 0),
+('地', '易地思之', '역지사지', 1),
+('思', '易地思之', '역지사지', 2),
+('之', '易地思之', '역지사지', 3),
+('易', '易經', '역경', 0),
+('經', '易經', '역경', 1),
+('星', '星座', '성좌', 0),
+('座', '星座', '성좌', 1),
+('星', '星形', '성형', 0),
+('形', '星形', '성형', 1),
+('星', '星群', '성군', 0),
+('群', '星群', '성군', 1),
+('星', '星雲', '성운', 0),
+('雲', '星雲', '성운', 1),
+('星', '星霜', '성상', 0),
+('霜', '星霜', '성상', 1),
+('映', '映像', '영상', 0),
+('像', '映像', '영상', 1),
+('映', '映寫', '영사', 0),
+('寫', '映寫', '영사', 1),
+('映', '映寫機', '영사기', 0),
+('寫', '映寫機', '영사기', 1),
+('機', '映寫機', '영사기', 2),
+('映', '映射', '영사', 0),
+('射', '映射', '영사', 1),
+('映', '映山紅', '영산홍', 0),
+('山', '映山紅', '영산홍', 1),
+('紅', '映山紅', '영산홍', 2),
+('映', '映畫', '영화', 0),
+('畫', '映畫', '영화', 1),
+('映', '映畵', '영화', 0),
+('畵', '映畵', '영화', 1),
+('映', '映畵俳優', '영화배우', 0),
+('畵', '映畵俳優', '영화배우', 1),
+('俳', '映畵俳優', '영화배우', 2),
+('優', '映畵俳優', '영화배우', 3),
+('映', '映畵祭', '영화제', 0),
+('畵', '映畵祭', '영화제', 1),
+('祭', '映畵祭', '영화제', 2),
+('映', '映畵館', '영화관', 0),
+('畵', '映畵館', '영화관', 1),
+('館', '映畵館', '영화관', 2),
+('春', '春夏秋冬', '춘하추동', 0),
+('夏', '春夏秋冬', '춘하추동', 1),
+('秋', '春夏秋冬', '춘하추동', 2),
+('冬', '春夏秋冬', '춘하추동', 3),
+('春', '春季', '춘계', 0),
+('季', '春季', '춘계', 1),
+('春', '春川', '춘천', 0),
+('川', '春川', '춘천', 1),
+('春', '春服', '춘복', 0),
+('服', '春服', '춘복', 1),
+('春', '春畵', '춘화', 0),
+('畵', '春畵', '춘화', 1),
+('春', '春節', '춘절', 0),
+('節', '春節', '춘절', 1),
+('春', '春色', '춘색', 0),
+('色', '春色', '춘색', 1),
+('春', '春醬', '춘장', 0),
+('醬', '春醬', '춘장', 1),
+('春', '春雨', '춘우', 0),
+('雨', '春雨', '춘우', 1),
+('春', '春風', '춘풍', 0),
+('風', '春風', '춘풍', 1),
+('昨', '昨年', '작년', 0),
+('年', '昨年', '작년', 1),
+('昨', '昨日', '작일', 0),
+('日', '昨日', '작일', 1),
+('昨', '昨月', '작월', 0),
+('月', '昨月', '작월', 1),
+('昭', '昭媛', '소원', 0),
+('媛', '昭媛', '소원', 1),
+('是', '是認', '시인', 0),
+('認', '是認', '시인', 1),
+('是', '是非', '시비', 0),
+('非', '是非', '시비', 1),
+('時', '時', '시', 0),
+('時', '時世', '시세', 0),
+('世', '時世', '시세', 1),
+('時', '時事', '시사', 0),
+('事', '時事', '시사', 1),
+('時', '時代', '시대', 0),
+('代', '時代', '시대', 1),
+('時', '時代精神', '시대정신', 0),
+('代', '時代精神', '시대정신', 1),
+('精', '時代精神', '시대정신', 2),
+('神', '時代精神', '시대정신', 3),
+('時', '時代錯誤', '시대착오', 0),
+('代', '時代錯誤', '시대착오', 1),
+('錯', '時代錯誤', '시대착오', 2),
+('誤', '時代錯誤', '시대착오', 3),
+('時', '時制', '시제', 0),
+('制', '時制', '시제', 1),
+('時', '時刻', '시각', 0),
+('刻', '時刻', '시각', 1),
+('時', '時報', '시보', 0),
+('報', '時報', '시보', 1),
+('時', '時差', '시차', 0),
+('差', '時差', '시차', 1),
+('時', '時日', '시일', 0),
+('日', '時日', '시일', 1),
+('時', '時期', '시기', 0),
+('期', '時期', '시기', 1),
+('時', '時機', '시기', 0),
+('機', '時機', '시기', 1),
+('時', '時節', '시절', 0),
+('節', '時節', '시절', 1),
+('時', '時艱', '시간', 0),
+('艱', '時艱', '시간', 1),
+('時', '時計', '시계', 0),
+('計', '時計', '시계', 1),
+('時', '時計— ', '시곗바늘', 0),
+('計', '時計— ', '시곗바늘', 1),
+('—', '時計— ', '시곗바늘', 2),
+('時', '時計塔', '시계탑', 0),
+('計', '時計塔', '시계탑', 1),
+('塔', '時計塔', '시계탑', 2),
+('時', '時計師', '시계사', 0),
+('計', '時計師', '시계사', 1),
+('師', '時計師', '시계사', 2),
+('時', '時調', '시조', 0),
+('調', '時調', '시조', 1),
+('時', '時針', '시침', 0),
+('針', '時針', '시침', 1),
+('時', '時間', '시간', 0),
+('間', '時間', '시간', 1),
+('時', '時間旅行', '시간여행', 0),
+('間', '時間旅行', '시간여행', 1),
+('旅', '時間旅行', '시간여행', 2),
+('行', '時間旅行', '시간여행', 3),
+('時', '時間表', '시간표', 0),
+('間', '時間表', '시간표', 1),
+('表', '時間表', '시간표', 2),
+('時', '時限爆彈', '시한폭탄', 0),
+('限', '時限爆彈', '시한폭탄', 1),
+('爆', '時限爆彈', '시한폭탄', 2),
+('彈', '時限爆彈', '시한폭탄', 3),
+('時', '時點', '시점', 0),
+('點', '時點', '시점', 1),
+('晚', '晚年', '만년', 0),
+('年', '晚年', '만년', 1),
+('晚', '晚期', '만기', 0),
+('期', '晚期', '만기', 1),
+('晚', '晚餉', '만향', 0),
+('餉', '晚餉', '만향', 1),
+('晝', '晝夜', '주야', 0),
+('夜', '晝夜', '주야', 1),
+('晝', '晝間', '주간', 0),
+('間', '晝間', '주간', 1),
+('晨', '晨星', '신성', 0),
+('星', '晨星', '신성', 1),
+('晩', '晩春', '만춘', 0),
+('春', '晩春', '만춘', 1),
+('晩', '晩秋', '만추', 0),
+('秋', '晩秋', '만추', 1),
+('晩', '晩餐', '만찬', 0),
+('餐', '晩餐', '만찬', 1),
+('普', '普及', '보급', 0),
+('及', '普及', '보급', 1),
+('普', '普洱茶', '보이차', 0),
+('洱', '普洱茶', '보이차', 1),
+('茶', '普洱茶', '보이차', 2),
+('普', '普通', '보통', 0),
+('通', '普通', '보통', 1),
+('普', '普通話', '보통화', 0),
+('通', '普通話', '보통화', 1),
+('話', '普通話', '보통화', 2),
+('普', '普遍的', '보편적', 0),
+('遍', '普遍的', '보편적', 1),
+('的', '普遍的', '보편적', 2),
+('景', '景氣', '경기', 0),
+('氣', '景氣', '경기', 1),
+('景', '景福宮', '경복궁', 0),
+('福', '景福宮', '경복궁', 1),
+('宮', '景福宮', '경복궁', 2),
+('景', '景致', '경치', 0),
+('致', '景致', '경치', 1),
+('景', '景觀', '경관', 0),
+('觀', '景觀', '경관', 1),
+('晴', '晴天', '청천', 0),
+('天', '晴天', '청천', 1),
+('晴', '晴空', '청공', 0),
+('空', '晴空', '청공', 1),
+('晴', '晴雨計', '청우계', 0),
+('雨', '晴雨計', '청우계', 1),
+('計', '晴雨計', '청우계', 2),
+('智', '智利', '지리', 0),
+('利', '智利', '지리', 1),
+('智', '智慧', '지혜', 0),
+('慧', '智慧', '지혜', 1),
+('智', '智慧書', '지혜서', 0),
+('慧', '智慧書', '지혜서', 1),
+('書', '智慧書', '지혜서', 2),
+('智', '智異山', '지리산', 0),
+('異', '智異山', '지리산', 1),
+('山', '智異山', '지리산', 2),
+('智', '智能', '지능', 0),
+('能', '智能', '지능', 1),
+('智', '智異山', '지리산', 0),
+('異', '智異山', '지리산', 1),
+('山', '智異山', '지리산', 2),
+('暈', '暈', '운', 0),
+('暑', '暑氣', '서기', 0),
+('氣', '暑氣', '서기', 1),
+('暖', '暖冬', '난동', 0),
+('冬', '暖冬', '난동', 1),
+('暖', '暖帶林', '난대림', 0),
+('帶', '暖帶林', '난대림', 1),
+('林', '暖帶林', '난대림', 2),
+('暖', '暖房', '난방', 0),
+('房', '暖房', '난방', 1),
+('暖', '暖房機', '난방기', 0),
+('房', '暖房機', '난방기', 1),
+('機', '暖房機', '난방기', 2),
+('暖', '暖爐', '난로', 0),
+('爐', '暖爐', '난로', 1),
+('暗', '暗喩', '암유', 0),
+('喩', '暗喩', '암유', 1),
+('暗', '暗室', '암실', 0),
+('室', '暗室', '암실', 1),
+('暗', '暗影', '암영', 0),
+('影', '暗影', '암영', 1),
+('暗', '暗殺', '암살', 0),
+('殺', '暗殺', '암살', 1),
+('暗', '暗殺者', '암살자', 0),
+('殺', '暗殺者', '암살자', 1),
+('者', '暗殺者', '암살자', 2),
+('暗', '暗流', '암류', 0),
+('流', '暗流', '암류', 1),
+('暗', '暗渠', '암거', 0),
+('渠', '暗渠', '암거', 1),
+('暗', '暗礁', '암초', 0),
+('礁', '暗礁', '암초', 1),
+('暗', '暗示', '암시', 0),
+('示', '暗示', '암시', 1),
+('暗', '暗票', '암표', 0),
+('票', '暗票', '암표', 1),
+('暗', '暗票商', '암표상', 0),
+('票', '暗票商', '암표상', 1),
+('商', '暗票商', '암표상', 2),
+('暗', '暗算', '암산', 0),
+('算', '暗算', '암산', 1),
+('暗', '暗號', '암호', 0),
+('號', '暗號', '암호', 1),
+('暗', '暗號貨幣', '암호화폐', 0),
+('號', '暗號貨幣', '암호화폐', 1),
+('貨', '暗號貨幣', '암호화폐', 2),
+('幣', '暗號貨幣', '암호화폐', 3),
+('暗', '暗記', '암기', 0),
+('記', '暗記', '암기', 1),
+('暗', '暗誦', '암송', 0),
+('誦', '暗誦', '암송', 1),
+('暗', '暗順應', '암순응', 0),
+('順', '暗順應', '암순응', 1),
+('應', '暗順應', '암순응', 2),
+('暗', '暗香', '암향', 0),
+('香', '暗香', '암향', 1),
+('暗', '暗黑', '암흑', 0),
+('黑', '暗黑', '암흑', 1),
+('暗', '暗黑街', '암흑가', 0),
+('黑', '暗黑街', '암흑가', 1),
+('街', '暗黑街', '암흑가', 2),
+('暗', '暗默', '암묵', 0),
+('默', '暗默', '암묵', 1),
+('暫', '暫時', '잠시', 0),
+('時', '暫時', '잠시', 1),
+('暫', '暫間', '잠간', 0),
+('間', '暫間', '잠간', 1),
+('暴', '暴力', '폭력', 0),
+('力', '暴力', '폭력', 1),
+('暴', '暴力團', '폭력단', 0),
+('力', '暴力團', '폭력단', 1),
+('團', '暴力團', '폭력단', 2),
+('暴', '暴力輩', '폭력배', 0),
+('力', '暴力輩', '폭력배', 1),
+('輩', '暴力輩', '폭력배', 2),
+('暴', '暴動', '폭동', 0),
+('動', '暴動', '폭동', 1),
+('暴', '暴君', '폭군', 0),
+('君', '暴君', '폭군', 1),
+('暴', '暴徒', '폭도', 0),
+('徒', '暴徒', '폭도', 1),
+('暴', '暴惡', '포악', 0),
+('惡', '暴惡', '포악', 1),
+('暴', '暴戾', '폭려', 0),
+('戾', '暴戾', '폭려', 1),
+('暴', '暴投', '폭투', 0),
+('投', '暴投', '폭투', 1),
+('暴', '暴政', '폭정', 0),
+('政', '暴政', '폭정', 1),
+('暴', '暴泄', '폭설', 0),
+('泄', '暴泄', '폭설', 1),
+('暴', '暴炎', '폭염', 0),
+('炎', '暴炎', '폭염', 1),
+('暴', '暴虐', '포학', 0),
+('虐', '暴虐', '포학', 1),
+('暴', '暴行', '폭행', 0),
+('行', '暴行', '폭행', 1),
+('暴', '暴說', '폭설', 0),
+('說', '暴說', '폭설', 1),
+('暴', '暴走', '폭주', 0),
+('走', '暴走', '폭주', 1),
+('暴', '暴雨', '폭우', 0),
+('雨', '暴雨', '폭우', 1),
+('暴', '暴雪', '폭설', 0),
+('雪', '暴雪', '폭설', 1),
+('暴', '暴露', '폭로', 0),
+('露', '暴露', '폭로', 1),
+('暴', '暴風', '폭풍', 0),
+('風', '暴風', '폭풍', 1),
+('暴', '暴風雨', '폭풍우', 0),
+('風', '暴風雨', '폭풍우', 1),
+('雨', '暴風雨', '폭풍우', 2),
+('暴', '暴食', '폭식', 0),
+('食', '暴食', '폭식', 1),
+('暴', '暴騰', '폭등', 0),
+('騰', '暴騰', '폭등', 1),
+('曖', '曖昧', '애매', 0),
+('昧', '曖昧', '애매', 1),
+('曖', '曖昧模糊', '애매모호', 0),
+('昧', '曖昧模糊', '애매모호', 1),
+('模', '曖昧模糊', '애매모호', 2),
+('糊', '曖昧模糊', '애매모호', 3),
+('曜', '曜日', '요일', 0),
+('日', '曜日', '요일', 1),
+('曠', '曠野', '광야', 0),
+('野', '曠野', '광야', 1),
+('曰', '曰', '왈', 0),
+('曰', '曰可曰否', '왈가왈부', 0),
+('可', '曰可曰否', '왈가왈부', 1),
+('曰', '曰可曰否', '왈가왈부', 2),
+('否', '曰可曰否', '왈가왈부', 3),
+('曲', '曲射砲', '곡사포', 0),
+('射', '曲射砲', '곡사포', 1),
+('砲', '曲射砲', '곡사포', 2),
+('曲', '曲尺', '곡척', 0),
+('尺', '曲尺', '곡척', 1),
+('曲', '曲折  符', '곡절 부호', 0),
+('折', '曲折  符', '곡절 부호', 1),
+('符', '曲折  符', '곡절 부호', 4),
+('曲', '曲用', '곡용', 0),
+('用', '曲用', '곡용', 1),
+('曲', '曲線', '곡선', 0),
+('線', '曲線', '곡선', 1),
+('曲', '曲藝', '곡예', 0),
+('藝', '曲藝', '곡예', 1),
+('曲', '曲藝師', '곡예사', 0),
+('藝', '曲藝師', '곡예사', 1),
+('師', '曲藝師', '곡예사', 2),
+('曲', '曲解', '곡해', 0),
+('解', '曲解', '곡해', 1),
+('曲', '曲調', '곡조', 0),
+('調', '曲調', '곡조', 1),
+('曳', '曳光彈', '예광탄', 0),
+('光', '曳光彈', '예광탄', 1),
+('彈', '曳光彈', '예광탄', 2),
+('曳', '曳引船', '예인선', 0),
+('引', '曳引船', '예인선', 1),
+('船', '曳引船', '예인선', 2),
+('曳', '曳船路', '예선로', 0),
+('船', '曳船路', '예선로', 1),
+('路', '曳船路', '예선로', 2),
+('更', '更地', '갱지', 0),
+('地', '更地', '갱지', 1),
+('更', '更年期', '갱년기', 0),
+('年', '更年期', '갱년기', 1),
+('期', '更年期', '갱년기', 2),
+('更', '更改', '갱개', 0),
+('改', '更改', '갱개', 1),
+('更', '更新', '갱신', 0),
+('新', '更新', '갱신', 1),
+('更', '更新', '경신', 0),
+('新', '更新', '경신', 1),
+('更', '更正', '경정', 0),
+('正', '更正', '경정', 1),
+('更', '更紙', '갱지', 0),
+('紙', '更紙', '갱지', 1),
+('更', '更衣室', '경의실', 0),
+('衣', '更衣室', '경의실', 1),
+('室', '更衣室', '경의실', 2),
+('更', '更迭', '경질', 0),
+('迭', '更迭', '경질', 1),
+('書', '書堂', '서당', 0),
+('堂', '書堂', '서당', 1),
+('書', '書寫', '서사', 0),
+('寫', '書寫', '서사', 1),
+('書', '書店', '서점', 0),
+('店', '書店', '서점', 1),
+('書', '書庫', '서고', 0),
+('庫', '書庫', '서고', 1),
+('書', '書式', '서식', 0),
+('式', '書式', '서식', 1),
+('書', '書房', '서방', 0),
+('房', '書房', '서방', 1),
+('書', '書架', '서가', 0),
+('架', '書架', '서가', 1),
+('書', '書案', '서안', 0),
+('案', '書案', '서안', 1),
+('書', '書標', '서표', 0),
+('標', '書標', '서표', 1),
+('書', '書法', '서법', 0),
+('法', '書法', '서법', 1),
+('書', '書簡', '서간', 0),
+('簡', '書簡', '서간', 1),
+('書', '書籍', '서적', 0),
+('籍', '書籍', '서적', 1),
+('書', '書經', '서경', 0),
+('經', '書經', '서경', 1),
+('書', '書藝', '서예', 0),
+('藝', '書藝', '서예', 1),
+('書', '書記', '서기', 0),
+('記', '書記', '서기', 1),
+('書', '書記素', '서기소', 0),
+('記', '書記素', '서기소', 1),
+('素', '書記素', '서기소', 2),
+('書', '書記長', '서기장', 0),
+('記', '書記長', '서기장', 1),
+('長', '書記長', '서기장', 2),
+('書', '書評', '서평', 0),
+('評', '書評', '서평', 1),
+('書', '書賈', '서고', 0),
+('賈', '書賈', '서고', 1),
+('書', '書道', '서도', 0),
+('道', '書道', '서도', 1),
+('書', '書院', '서원', 0),
+('院', '書院', '서원', 1),
+('書', '書類', '서류', 0),
+('類', '書類', '서류', 1),
+('書', '書類綴', '서류철', 0),
+('類', '書類綴', '서류철', 1),
+('綴', '書類綴', '서류철', 2),
+('書', '書體', '서체', 0),
+('體', '書體', '서체', 1),
+('書', '書齋', '서재', 0),
+('齋', '書齋', '서재', 1),
+('曾', '曾孫', '증손', 0),
+('孫', '曾孫', '증손', 1),
+('曾', '曾祖', '증조', 0),
+('祖', '曾祖', '증조', 1),
+('曾', '曾祖父', '증조부', 0),
+('祖', '曾祖父', '증조부', 1),
+('父', '曾祖父', '증조부', 2),
+('曾', '曾祖父母', '증조부모', 0),
+('祖', '曾祖父母', '증조부모', 1),
+('父', '曾祖父母', '증조부모', 2),
+('母', '曾祖父母', '증조부모', 3),
+('最', '最', '최', 0),
+('最', '最上', '최상', 0),
+('上', '最上', '최상', 1),
+('最', '最上級', '최상급', 0),
+('上', '最上級', '최상급', 1),
+('級', '最上級', '최상급', 2),
+('最', '最低', '최저', 0),
+('低', '最低', '최저', 1),
+('最', '最低賃金', '최저임금', 0),
+('低', '最低賃金', '최저임금', 1),
+('賃', '最低賃金', '최저임금', 2),
+('金', '最低賃金', '최저임금', 3),
+('最', '最優秀', '최우수', 0),
+('優', '最優秀', '최우수', 1),
+('秀', '最優秀', '최우수', 2),
+('最', '最初', '최초', 0),
+('初', '最初', '최초', 1),
+('最', '最前線', '최전선', 0),
+('前', '最前線', '최전선', 1),
+('線', '最前線', '최전선', 2),
+('最', '最古', '최고', 0),
+('古', '最古', '최고', 1),
+('最', '最善', '최선', 0),
+('善', '最善', '최선', 1),
+('最', '最善策', '최선책', 0),
+('善', '最善策', '최선책', 1),
+('策', '最善策', '최선책', 2),
+('最', '最多', '최다', 0),
+('多', '最多', '최다', 1),
+('最', '最大', '최대', 0),
+('大', '最大', '최대', 1),
+('最', '最大限', '최대한', 0),
+('大', '最大限', '최대한', 1),
+('限', '最大限', '최대한', 2),
+('最', '最大限度', '최대한도', 0),
+('大', '最大限度', '최대한도', 1),
+('限', '最大限度', '최대한도', 2),
+('度', '最大限度', '최대한도', 3),
+('最', '最小', '최소', 0),
+('小', '最小', '최소', 1),
+('最', '最小限', '최소한', 0),
+('小', '最小限', '최소한', 1),
+('限', '最小限', '최소한', 2),
+('最', '最少', '최소', 0),
+('少', '最少', '최소', 1),
+('最', '最強', '최강', 0),
+('強', '最強', '최강', 1),
+('最', '最後', '최후', 0),
+('後', '最後', '최후', 1),
+('最', '最後通牒', '최후통첩', 0),
+('後', '最後通牒', '최후통첩', 1),
+('通', '最後通牒', '최후통첩', 2),
+('牒', '最後通牒', '최후통첩', 3),
+('最', '最惠國', '최혜국', 0),
+('惠', '最惠國', '최혜국', 1),
+('國', '最惠國', '최혜국', 2),
+('最', '最惡', '최악', 0),
+('惡', '最惡', '최악', 1),
+('最', '最愛', '최애', 0),
+('愛', '最愛', '최애', 1),
+('最', '最新', '최신', 0),
+('新', '最新', '최신', 1),
+('最', '最短', '최단', 0),
+('短', '最短', '최단', 1),
+('最', '最終', '최종', 0),
+('終', '最終', '최종', 1),
+('最', '最近', '최근', 0),
+('近', '最近', '최근', 1),
+('最', '最適', '최적', 0),
+('適', '最適', '최적', 1),
+('最', '最適化', '최적화', 0),
+('適', '最適化', '최적화', 1),
+('化', '最適化', '최적화', 2),
+('最', '最長', '최장', 0),
+('長', '最長', '최장', 1),
+('最', '最高', '최고', 0),
+('高', '最高', '최고', 1),
+('最', '最高尊嚴', '최고존엄', 0),
+('高', '最高尊嚴', '최고존엄', 1),
+('尊', '最高尊嚴', '최고존엄', 2),
+('嚴', '最高尊嚴', '최고존엄', 3),
+('最', '最高級', '최고급', 0),
+('高', '最高級', '최고급', 1),
+('級', '最高級', '최고급', 2),
+('會', '會合', '회합', 0),
+('合', '會合', '회합', 1),
+('會', '會員', '회원', 0),
+('員', '會員', '회원', 1),
+('會', '會場', '회장', 0),
+('場', '會場', '회장', 1),
+('會', '會士', '회사', 0),
+('士', '會士', '회사', 1),
+('會', '會寧', '회령', 0),
+('寧', '會寧', '회령', 1),
+('會', '會意', '회의', 0),
+('意', '會意', '회의', 1),
+('會', '會期', '회기', 0),
+('期', '會期', '회기', 1),
+('會', '會社', '회사', 0),
+('社', '會社', '회사', 1),
+('會', '會社員', '회사원', 0),
+('社', '會社員', '회사원', 1),
+('員', '會社員', '회사원', 2),
+('會', '會衆', '회중', 0),
+('衆', '會衆', '회중', 1),
+('會', '會見', '회견', 0),
+('見', '會見', '회견', 1),
+('會', '會見者', '회견자', 0),
+('見', '會見者', '회견자', 1),
+('者', '會見者', '회견자', 2),
+('會', '會計', '회계', 0),
+('計', '會計', '회계', 1),
+('會', '會計員', '회계원', 0),
+('計', '會計員', '회계원', 1),
+('員', '會計員', '회계원', 2),
+('會', '會計士', '회계사', 0),
+('計', '會計士', '회계사', 1),
+('士', '會計士', '회계사', 2),
+('會', '會計學', '회계학', 0),
+('計', '會計學', '회계학', 1),
+('學', '會計學', '회계학', 2),
+('會', '會話', '회화', 0),
+('話', '會話', '회화', 1),
+('會', '會誌', '회지', 0),
+('誌', '會誌', '회지', 1),
+('會', '會談', '회담', 0),
+('談', '會談', '회담', 1),
+('會', '會議', '회의', 0),
+('議', '會議', '회의', 1),
+('會', '會議錄', '회의록', 0),
+('議', '會議錄', '회의록', 1),
+('錄', '會議錄', '회의록', 2),
+('會', '會費', '회비', 0),
+('費', '會費', '회비', 1),
+('會', '會長', '회장', 0),
+('長', '會長', '회장', 1),
+('會', '會陰', '회음', 0),
+('陰', '會陰', '회음', 1),
+('會', '會館', '회관', 0),
+('館', '會館', '회관', 1),
+('月', '月', '월', 0),
+('月', '月光', '월광', 0),
+('光', '月光', '월광', 1),
+('月', '月刊', '월간', 0),
+('刊', '月刊', '월간', 1),
+('月', '月別', '월별', 0),
+('別', '月別', '월별', 1),
+('月', '月影', '월영', 0),
+('影', '月影', '월영', 1),
+('月', '月日', '월일', 0),
+('日', '月日', '월일', 1),
+('月', '月曆', '월력', 0),
+('曆', '月曆', '월력', 1),
+('月', '月曜日', '월요일', 0),
+('曜', '月曜日', '월요일', 1),
+('日', '月曜日', '월요일', 2),
+('月', '月月山山', '월월산산', 0),
+('月', '月月山山', '월월산산', 1),
+('山', '月月山山', '월월산산', 2),
+('山', '月月山山', '월월산산', 3),
+('月', '月桂樹', '월계수', 0),
+('桂', '月桂樹', '월계수', 1),
+('樹', '月桂樹', '월계수', 2),
+('月', '月球', '월구', 0),
+('球', '月球', '월구', 1),
+('月', '月琴', '월금', 0),
+('琴', '月琴', '월금', 1),
+('月', '月給', '월급', 0),
+('給', '月給', '월급', 1),
+('月', '月經', '월경', 0),
+('經', '月經', '월경', 1),
+('月', '月蝕', '월식', 0),
+('蝕', '月蝕', '월식', 1),
+('月', '月貰', '월세', 0),
+('貰', '月貰', '월세', 1),
+('月', '月長石', '월장석', 0),
+('長', '月長石', '월장석', 1),
+('石', '月長石', '월장석', 2),
+('月', '月食', '월식', 0),
+('食', '月食', '월식', 1),
+('月', '月餠', '월병', 0),
+('餠', '月餠', '월병', 1),
+('有', '有', '유', 0),
+('有', '有人', '유인', 0),
+('人', '有人', '유인', 1),
+('有', '有人島', '유인도', 0),
+('人', '有人島', '유인도', 1),
+('島', '有人島', '유인도', 2),
+('有', '有備無患', '유비무환', 0),
+('備', '有備無患', '유비무환', 1),
+('無', '有備無患', '유비무환', 2),
+('患', '有備無患', '유비무환', 3),
+('有', '有價證券', '유가증권', 0),
+('價', '有價證券', '유가증권', 1),
+('證', '有價證券', '유가증권', 2),
+('券', '有價證券', '유가증권', 3),
+('有', '有利', '유리', 0),
+('利', '有利', '유리', 1),
+('有', '有力者', '유력자', 0),
+('力', '有力者', '유력자', 1),
+('者', '有力者', '유력자', 2),
+('有', '有名', '유명', 0),
+('名', '有名', '유명', 1),
+('有', '有名人', '유명인', 0),
+('名', '有名人', '유명인', 1),
+('人', '有名人', '유명인', 2),
+('有', '有夫女', '유부녀', 0),
+('夫', '有夫女', '유부녀', 1),
+('女', '有夫女', '유부녀', 2),
+('有', '有婦男', '유부남', 0),
+('婦', '有婦男', '유부남', 1),
+('男', '有婦男', '유부남', 2),
+('有', '有害', '유해', 0),
+('害', '有害', '유해', 1),
+('有', '有形', '유형', 0),
+('形', '有形', '유형', 1),
+('有', '有彩色', '무채색', 0),
+('彩', '有彩色', '무채색', 1),
+('色', '有彩色', '무채색', 2),
+('有', '有志', '유지', 0),
+('志', '有志', '유지', 1),
+('有', '有效', '유효', 0),
+('效', '有效', '유효', 1),
+('有', '有料', '유료', 0),
+('料', '有料', '유료', 1),
+('有', '有望', '유망', 0),
+('望', '有望', '유망', 1),
+('有', '有機', '유기', 0),
+('機', '有機', '유기', 1),
+('有', '有機體', '유기체', 0),
+('機', '有機體', '유기체', 1),
+('體', '有機體', '유기체', 2),
+('有', '有權者', '유권자', 0),
+('權', '有權者', '유권자', 1),
+('者', '有權者', '유권자', 2),
+('有', '有毒', '유독', 0),
+('毒', '有毒', '유독', 1),
+('有', '有無', '유무', 0),
+('無', '有無', '유무', 1),
+('有', '有爪動物', '유조동물', 0),
+('爪', '有爪動物', '유조동물', 1),
+('動', '有爪動物', '유조동물', 2),
+('物', '有爪動物', '유조동물', 3),
+('有', '有理式', '유리식', 0),
+('理', '有理式', '유리식', 1),
+('式', '有理式', '유리식', 2),
+('有', '有産', '유산', 0),
+('産', '有産', '유산', 1),
+('有', '有用', '유용', 0),
+('用', '有用', '유용', 1),
+('有', '有益', '유익', 0),
+('益', '有益', '유익', 1),
+('有', '有神論', '유신론', 0),
+('神', '有神論', '유신론', 1),
+('論', '有神論', '유신론', 2),
+('有', '有線', '유선', 0),
+('線', '有線', '유선', 1),
+('有', '有罪', '유죄', 0),
+('罪', '有罪', '유죄', 1),
+('有', '有能', '유능', 0),
+('能', '有能', '유능', 1),
+('有', '有色', '유색', 0),
+('色', '有色', '유색', 1),
+('有', '有色人種', '유색인종', 0),
+('色', '有色人種', '유색인종', 1),
+('人', '有色人種', '유색인종', 2),
+('種', '有色人種', '유색인종', 3),
+('有', '有象無象', '유상무상', 0),
+('象', '有象無象', '유상무상', 1),
+('無', '有象無象', '유상무상', 2),
+('象', '有象無象', '유상무상', 3),
+('有', '有錢無罪  無錢有', '유전무죄 무전유죄', 0),
+('錢', '有錢無罪  無錢有', '유전무죄 무전유죄', 1),
+('無', '有錢無罪  無錢有', '유전무죄 무전유죄', 2),
+('罪', '有錢無罪  無錢有', '유전무죄 무전유죄', 3),
+('無', '有錢無罪  無錢有', '유전무죄 무전유죄', 6),
+('錢', '有錢無罪  無錢有', '유전무죄 무전유죄', 7),
+('有', '有錢無罪  無錢有', '유전무죄 무전유죄', 8),
+('有', '有限', '유한', 0),
+('限', '有限', '유한', 1),
+('朋', '朋友', '붕우', 0),
+('友', '朋友', '붕우', 1),
+('服', '服務', '복무', 0),
+('務', '服務', '복무', 1),
+('服', '服從', '복종', 0),
+('從', '服從', '복종', 1),
+('服', '服用量', '복용량', 0),
+('用', '服用量', '복용량', 1),
+('量', '服用量', '복용량', 2),
+('服', '服裝', '복장', 0),
+('裝', '服裝', '복장', 1),
+('朗', '朗誦', '낭송', 0),
+('誦', '朗誦', '낭송', 1),
+('朗', '朗讀', '낭독', 0),
+('讀', '朗讀', '낭독', 1),
+('望', '望', '망', 0),
+('望', '望夫石', '망부석', 0),
+('夫', '望夫石', '망부석', 1),
+('石', '望夫石', '망부석', 2),
+('望', '望旗', '망기', 0),
+('旗', '望旗', '망기', 1),
+('望', '望樓', '망루', 0),
+('樓', '望樓', '망루', 1),
+('望', '望遠鏡', '망원경', 0),
+('遠', '望遠鏡', '망원경', 1),
+('鏡', '望遠鏡', '망원경', 2),
+('望', '望鄕', '망향', 0),
+('鄕', '望鄕', '망향', 1),
+('朝', '朝刊', '조간', 0),
+('刊', '朝刊', '조간', 1),
+('朝', '朝夕', '조석', 0),
+('夕', '朝夕', '조석', 1),
+('朝', '朝廷', '조정', 0),
+('廷', '朝廷', '조정', 1),
+('朝', '朝敵', '조적', 0),
+('敵', '朝敵', '조적', 1),
+('朝', '朝會', '조회', 0),
+('會', '朝會', '조회', 1),
+('朝', '朝漢', '조한', 0),
+('漢', '朝漢', '조한', 1),
+('朝', '朝貢', '조공', 0),
+('貢', '朝貢', '조공', 1),
+('朝', '朝食', '조식', 0),
+('食', '朝食', '조식', 1),
+('朝', '朝飯', '조반', 0),
+('飯', '朝飯', '조반', 1),
+('朝', '朝鮮', '조선', 0),
+('鮮', '朝鮮', '조선', 1),
+('朝', '朝鮮人', '조선인', 0),
+('鮮', '朝鮮人', '조선인', 1),
+('人', '朝鮮人', '조선인', 2),
+('朝', '朝鮮族', '조선족', 0),
+('鮮', '朝鮮族', '조선족', 1),
+('族', '朝鮮族', '조선족', 2),
+('朝', '朝鮮東海', '조선동해', 0),
+('鮮', '朝鮮東海', '조선동해', 1),
+('東', '朝鮮東海', '조선동해', 2),
+('海', '朝鮮東海', '조선동해', 3),
+('朝', '朝鮮民族', '조선민족', 0),
+('鮮', '朝鮮民族', '조선민족', 1),
+('民', '朝鮮民族', '조선민족', 2),
+('族', '朝鮮民族', '조선민족', 3),
+('朝', '朝鮮語', '조선어', 0),
+('鮮', '朝鮮語', '조선어', 1),
+('語', '朝鮮語', '조선어', 2),
+('朝', '朝鮮글', '조선글', 0),
+('鮮', '朝鮮글', '조선글', 1),
+('글', '朝鮮글', '조선글', 2),
+('朝', '朝鮮말', '조선말', 0),
+('鮮', '朝鮮말', '조선말', 1),
+('말', '朝鮮말', '조선말', 2),
+('朝', '朝鮮무', '조선무', 0),
+('鮮', '朝鮮무', '조선무', 1),
+('무', '朝鮮무', '조선무', 2),
+('期', '期待', '기대', 0),
+('待', '期待', '기대', 1),
+('期', '期數列外', '기수열외', 0),
+('數', '期數列外', '기수열외', 1),
+('列', '期數列外', '기수열외', 2),
+('外', '期數列外', '기수열외', 3),
+('期', '期約', '기약', 0),
+('約', '期約', '기약', 1),
+('期', '期間', '기간', 0),
+('間', '期間', '기간', 1),
+('期', '期限', '기한', 0),
+('限', '期限', '기한', 1),
+('木', '木', '목', 0),
+('木', '木刀', '목도', 0),
+('刀', '木刀', '목도', 1),
+('木', '木手', '목수', 0),
+('手', '木手', '목수', 1),
+('木', '木曜日', '목요일', 0),
+('曜', '木曜日', '목요일', 1),
+('日', '木曜日', '목요일', 2),
+('木', '木材', '목재', 0),
+('材', '木材', '목재', 1),
+('木', '木枕', '목침', 0),
+('枕', '木枕', '목침', 1),
+('木', '木桶', '목통', 0),
+('桶', '木桶', '목통', 1),
+('木', '木炭', '목탄', 0),
+('炭', '木炭', '목탄', 1),
+('木', '木琴', '목금', 0),
+('琴', '木琴', '목금', 1),
+('木', '木瓜', '모과', 0),
+('瓜', '木瓜', '모과', 1),
+('木', '木皮', '목피', 0),
+('皮', '木皮', '목피', 1),
+('木', '木石', '목석', 0),
+('石', '木石', '목석', 1),
+('木', '木綿', '목면', 0),
+('綿', '木綿', '목면', 1),
+('木', '木耳', '목이', 0),
+('耳', '木耳', '목이', 1),
+('木', '木花', '목화', 0),
+('花', '木花', '목화', 1),
+('木', '木葉', '목엽', 0),
+('葉', '木葉', '목엽', 1),
+('木', '木蓮', '목련', 0),
+('蓮', '木蓮', '목련', 1),
+('木', '木藍', '목람', 0),
+('藍', '木藍', '목람', 1),
+('木', '木蘭', '목란', 0),
+('蘭', '木蘭', '목란', 1),
+('木', '木通', '목통', 0),
+('通', '木通', '목통', 1),
+('木', '木造', '목조', 0),
+('造', '木造', '목조', 1),
+('木', '木馬', '목마', 0),
+('馬', '木馬', '목마', 1),
+('木', '木魚', '목어', 0),
+('魚', '木魚', '목어', 1),
+('未', '未亡人', '미망인', 0),
+('亡', '未亡人', '미망인', 1),
+('人', '未亡人', '미망인', 2),
+('未', '未來', '미래', 0),
+('來', '未來', '미래', 1),
+('未', '未來學', '미래학', 0),
+('來', '未來學', '미래학', 1),
+('學', '未來學', '미래학', 2),
+('未', '未來完了', '미래완료', 0),
+('來', '未來完了', '미래완료', 1),
+('完', '未來完了', '미래완료', 2),
+('了', '未來完了', '미래완료', 3),
+('未', '未來時制', '미래시제', 0),
+('來', '未來時制', '미래시제', 1),
+('時', '未來時制', '미래시제', 2),
+('制', '未來時制', '미래시제', 3),
+('未', '未備', '미비', 0),
+('備', '未備', '미비', 1),
+('未', '未備點', '미비점', 0),
+('備', '未備點', '미비점', 1),
+('點', '未備點', '미비점', 2),
+('未', '未婚', '미혼', 0),
+('婚', '未婚', '미혼', 1),
+('未', '未婚母', '미혼모', 0),
+('婚', '未婚母', '미혼모', 1),
+('母', '未婚母', '미혼모', 2),
+('未', '未安', '미안', 0),
+('安', '未安', '미안', 1),
+('未', '未完', '미완', 0),
+('完', '未完', '미완', 1),
+('未', '未完成', '미완성', 0),
+('完', '未完成', '미완성', 1),
+('成', '未完成', '미완성', 2),
+('未', '未成年', '미성년', 0),
+('成', '未成年', '미성년', 1),
+('年', '未成年', '미성년', 2),
+('未', '未成年者', '미성년자', 0),
+('成', '未成年者', '미성년자', 1),
+('年', '未成年者', '미성년자', 2),
+('者', '未成年者', '미성년자', 3),
+('未', '未成熟', '미성숙', 0),
+('成', '未成熟', '미성숙', 1),
+('熟', '未成熟', '미성숙', 2),
+('未', '未洽', '미흡', 0),
+('洽', '未洽', '미흡', 1),
+('未', '未滿', '미만', 0),
+('滿', '未滿', '미만', 1),
+('未', '未濟', '미제', 0),
+('濟', '未濟', '미제', 1),
+('未', '未濟 事件', '미제 사건', 0),
+('濟', '未濟 事件', '미제 사건', 1),
+('事', '未濟 事件', '미제 사건', 3),
+('件', '未濟 事件', '미제 사건', 4),
+('未', '未熟', '미숙', 0),
+('熟', '未熟', '미숙', 1),
+('未', '未知數', '미지수', 0),
+('知', '未知數', '미지수', 1),
+('數', '未知數', '미지수', 2),
+('未', '未確認', '미확인', 0),
+('確', '未確認', '미확인', 1),
+('認', '未確認', '미확인', 2),
+('未', '未確認飛行物體', '미확인비행물체', 0),
+('確', '未確認飛行物體', '미확인비행물체', 1),
+('認', '未確認飛行物體', '미확인비행물체', 2),
+('飛', '未確認飛行物體', '미확인비행물체', 3),
+('行', '未確認飛行物體', '미확인비행물체', 4),
+('物', '未確認飛行物體', '미확인비행물체', 5),
+('體', '未確認飛行物體', '미확인비행물체', 6),
+('未', '未練', '미련', 0),
+('練', '未練', '미련', 1),
+('未', '未解決', '미해결', 0),
+('解', '未解決', '미해결', 1),
+('決', '未解決', '미해결', 2),
+('未', '未詳', '미상', 0),
+('詳', '未詳', '미상', 1),
+('末', '末', '말', 0),
+('末', '末世', '말세', 0),
+('世', '末世', '말세', 1),
+('末', '末日', '말일', 0),
+('日', '末日', '말일', 1),
+('末', '末期', '말기', 0),
+('期', '末期', '말기', 1),
+('末', '末那識', '말나식', 0),
+('那', '末那識', '말나식', 1),
+('識', '末那識', '말나식', 2),
+('本', '本', '본', 0),
+('本', '本人', '본인', 0),
+('人', '本人', '본인', 1),
+('本', '本位', '본위', 0),
+('位', '本位', '본위', 1),
+('本', '本來', '본래', 0),
+('來', '本來', '본래', 1),
+('本', '本名', '본명', 0),
+('名', '本名', '본명', 1),
+('本', '本命', '본명', 0),
+('命', '本命', '본명', 1),
+('本', '本土', '본토', 0),
+('土', '本土', '본토', 1),
+('本', '本壘', '본루', 0),
+('壘', '本壘', '본루', 1),
+('本', '本官', '본관', 0),
+('官', '本官', '본관', 1),
+('本', '本店', '본점', 0),
+('店', '本店', '본점', 1),
+('本', '本座', '본좌', 0),
+('座', '本座', '본좌', 1),
+('本', '本性', '본성', 0),
+('性', '本性', '본성', 1),
+('本', '本文', '본문', 0),
+('文', '本文', '본문', 1),
+('本', '本朝', '본조', 0),
+('朝', '本朝', '본조', 1),
+('本', '本格的', '본격적', 0),
+('格', '本格的', '본격적', 1),
+('的', '本格的', '본격적', 2),
+('本', '本源', '본원', 0),
+('源', '本源', '본원', 1),
+('本', '本然', '본연', 0),
+('然', '本然', '본연', 1),
+('本', '本社', '본사', 0),
+('社', '本社', '본사', 1),
+('本', '本稿', '본고', 0),
+('稿', '本稿', '본고', 1),
+('本', '本線', '본선', 0),
+('線', '本線', '본선', 1),
+('本', '本能', '본능', 0),
+('能', '本能', '본능', 1),
+('本', '本色', '본색', 0),
+('色', '本色', '본색', 1),
+('本', '本調', '본조', 0),
+('調', '本調', '본조', 1),
+('本', '本貫', '본관', 0),
+('貫', '本貫', '본관', 1),
+('本', '本質', '본질', 0),
+('質', '本質', '본질', 1),
+('本', '本選', '본선', 0),
+('選', '本選', '본선', 1),
+('本', '本邦', '본방', 0),
+('邦', '本邦', '본방', 1),
+('本', '本部', '본부', 0),
+('部', '本部', '본부', 1),
+('本', '本錢', '본전', 0),
+('錢', '本錢', '본전', 1),
+('本', '本音', '본음', 0),
+('音', '本音', '본음', 1),
+('本', '本領', '봉령', 0),
+('領', '本領', '봉령', 1),
+('本', '本願', '본원', 0),
+('願', '本願', '본원', 1),
+('本', '本館', '본관', 0),
+('館', '本館', '본관', 1),
+('本', '本體', '본체', 0),
+('體', '本體', '본체', 1),
+('本', '本디', '본디', 0),
+('디', '本디', '본디', 1),
+('朱', '朱喇', '주라', 0),
+('喇', '朱喇', '주라', 1),
+('朱', '朱色', '주색', 0),
+('色', '朱色', '주색', 1),
+('朱', '朱螺', '주라', 0),
+('螺', '朱螺', '주라', 1),
+('朱', '朱錫', '주석', 0),
+('錫', '朱錫', '주석', 1),
+('朱', '朱雀', '주작', 0),
+('雀', '朱雀', '주작', 1),
+('朱', '朱鷺', '주로', 0),
+('鷺', '朱鷺', '주로', 1),
+('朱', '朱黃色', '주황색', 0),
+('黃', '朱黃色', '주황색', 1),
+('色', '朱黃色', '주황색', 2),
+('朴', '朴', '박', 0),
+('杆', '杆體', '간체', 0),
+('體', '杆體', '간체', 1),
+('李', '李', '리', 0),
+('李', '李', '이', 0),
+('李', '李朝', '이조', 0),
+('朝', '李朝', '이조', 1),
+('材', '材料', '재료', 0),
+('料', '材料', '재료', 1),
+('材', '材木', '재목', 0),
+('木', '材木', '재목', 1),
+('材', '材質', '재질', 0),
+('質', '材質', '재질', 1),
+('村', '村', '촌', 0),
+('村', '村落', '촌락', 0),
+('落', '村落', '촌락', 1),
+('村', '村長', '촌장', 0),
+('長', '村長', '촌장', 1),
+('村', '村것', '촌것', 0),
+('것', '村것', '촌것', 1),
+('村', '村길', '촌길', 0),
+('길', '村길', '촌길', 1),
+('村', '村년', '촌년', 0),
+('년', '村년', '촌년', 1),
+('村', '村사람', '촌사람', 0),
+('사', '村사람', '촌사람', 1),
+('람', '村사람', '촌사람', 2),
+('村', '村집', '촌집', 0),
+('집', '村집', '촌집', 1),
+('村', '村티', '촌티', 0),
+('티', '村티', '촌티', 1),
+('杖', '杖囚', '장수', 0),
+('囚', '杖囚', '장수', 1),
+('杖', '杖鼓', '장고', 0),
+('鼓', '杖鼓', '장고', 1),
+('杜', '杜絶', '두절', 0),
+('絶', '杜絶', '두절', 1),
+('杜', '杜詩', '두시', 0),
+('詩', '杜詩', '두시', 1),
+('杜', '杜鵑', '두견', 0),
+('鵑', '杜鵑', '두견', 1),
+('杜', '杜鵑새', '두견새', 0),
+('鵑', '杜鵑새', '두견새', 1),
+('새', '杜鵑새', '두견새', 2),
+('束', '束手無策', '속수무책', 0),
+('手', '束手無策', '속수무책', 1),
+('無', '束手無策', '속수무책', 2),
+('策', '束手無策', '속수무책', 3),
+('束', '束縛', '속박', 0),
+('縛', '束縛', '속박', 1),
+('束', '束草', '속초', 0),
+('草', '束草', '속초', 1),
+('東', '東', '동', 0),
+('東', '東中國海', '동중국해', 0),
+('中', '東中國海', '동중국해', 1),
+('國', '東中國海', '동중국해', 2),
+('海', '東中國海', '동중국해', 3),
+('東', '東北', '동북', 0),
+('北', '東北', '동북', 1),
+('東', '東北亞', '동북아', 0),
+('北', '東北亞', '동북아', 1),
+('亞', '東北亞', '동북아', 2),
+('東', '東南', '동남', 0),
+('南', '東南', '동남', 1),
+('東', '東印度', '동인도', 0),
+('印', '東印度', '동인도', 1),
+('度', '東印度', '동인도', 2),
+('東', '東司', '동사', 0),
+('司', '東司', '동사', 1),
+('東', '東問西答', '동문서답', 0),
+('問', '東問西答', '동문서답', 1),
+('西', '東問西答', '동문서답', 2),
+('答', '東問西答', '동문서답', 3),
+('東', '東國', '동국', 0),
+('國', '東國', '동국', 1),
+('東', '東奔西走', '동분서주', 0),
+('奔', '東奔西走', '동분서주', 1),
+('西', '東奔西走', '동분서주', 2),
+('走', '東奔西走', '동분서주', 3),
+('東', '東宮', '동궁', 0),
+('宮', '東宮', '동궁', 1),
+('東', '東峽', '동협', 0),
+('峽', '東峽', '동협', 1),
+('東', '東方', '동방', 0),
+('方', '東方', '동방', 1),
+('東', '東歐', '동구', 0),
+('歐', '東歐', '동구', 1),
+('東', '東歐圈', '동구권', 0),
+('歐', '東歐圈', '동구권', 1),
+('圈', '東歐圈', '동구권', 2),
+('東', '東洋', '동양', 0),
+('洋', '東洋', '동양', 1),
+('東', '東洋人', '동양인', 0),
+('洋', '東洋人', '동양인', 1),
+('人', '東洋人', '동양인', 2),
+('東', '東洋學', '동양학', 0),
+('洋', '東洋學', '동양학', 1),
+('學', '東洋學', '동양학', 2),
+('東', '東洋風', '동양풍', 0),
+('洋', '東洋風', '동양풍', 1),
+('風', '東洋風', '동양풍', 2),
+('東', '東獨', '동독', 0),
+('獨', '東獨', '동독', 1),
+('東', '東西古今', '동서고금', 0),
+('西', '東西古今', '동서고금', 1),
+('古', '東西古今', '동서고금', 2),
+('今', '東西古今', '동서고금', 3),
+('東', '東邦', '동방', 0),
+('邦', '東邦', '동방', 1),
+('東', '東部', '동부', 0),
+('部', '東部', '동부', 1),
+('東', '東門', '동문', 0),
+('門', '東門', '동문', 1),
+('東', '東雲', '동운', 0),
+('雲', '東雲', '동운', 1),
+('杳', '杳然', '묘연', 0),
+('然', '杳然', '묘연', 1),
+('松', '松-', '송편', 0),
+('-', '松-', '송편', 1),
+('松', '松子', '송자', 0),
+('子', '松子', '송자', 1),
+('松', '松島', '송도', 0),
+('島', '松島', '송도', 1),
+('松', '松林', '송림', 0),
+('林', '松林', '송림', 1),
+('松', '松果腺', '송과선', 0),
+('果', '松果腺', '송과선', 1),
+('腺', '松果腺', '송과선', 2),
+('松', '松耳', '송이', 0),
+('耳', '松耳', '송이', 1),
+('松', '松花蛋', '송화단', 0),
+('花', '松花蛋', '송화단', 1),
+('蛋', '松花蛋', '송화단', 2),
+('松', '松魚', '송어', 0),
+('魚', '松魚', '송어', 1),
+('松', '松鶻매', '송골매', 0),
+('鶻', '松鶻매', '송골매', 1),
+('매', '松鶻매', '송골매', 2),
+('板', '板', '판', 0),
+('板', '板子', '판자', 0),
+('子', '板子', '판자', 1),
+('板', '板屋船', '판옥선', 0),
+('屋', '板屋船', '판옥선', 1),
+('船', '板屋船', '판옥선', 2),
+('板', '板木', '판목', 0),
+('木', '板木', '판목', 1),
+('板', '板紙', '판지', 0),
+('紙', '板紙', '판지', 1),
+('板', '板金', '판금', 0),
+('金', '板金', '판금', 1),
+('板', '板門店', '판문점', 0),
+('門', '板門店', '판문점', 1),
+('店', '板門店', '판문점', 2),
+('枇', '枇杷', '비파', 0),
+('杷', '枇杷', '비파', 1),
+('枕', '枕木', '침목', 0),
+('木', '枕木', '침목', 1),
+('林', '林延壽魚', '임연수어', 0),
+('延', '林延壽魚', '임연수어', 1),
+('壽', '林延壽魚', '임연수어', 2),
+('魚', '林延壽魚', '임연수어', 3),
+('林', '林業', '임업', 0),
+('業', '林業', '임업', 1),
+('林', '林檎', '임금', 0),
+('檎', '林檎', '임금', 1),
+('果', '果 ', '과편', 0),
+('果', '果實', '과실', 0),
+('實', '果實', '과실', 1),
+('果', '果樹', '과수', 0),
+('樹', '果樹', '과수', 1),
+('果', '果樹園', '과수원', 0),
+('樹', '果樹園', '과수원', 1),
+('園', '果樹園', '과수원', 2),
+('果', '果汁', '과즙', 0),
+('汁', '果汁', '과즙', 1),
+('果', '果然', '과연', 0),
+('然', '果然', '과연', 1),
+('果', '果物', '과물', 0),
+('物', '果物', '과물', 1),
+('果', '果皮', '과피', 0),
+('皮', '果皮', '과피', 1),
+('果', '果糖', '과당', 0),
+('糖', '果糖', '과당', 1),
+('果', '果飣類', '과정류', 0),
+('飣', '果飣類', '과정류', 1),
+('類', '果飣類', '과정류', 2),
+('枯', '枯渴', '고갈', 0),
+('渴', '枯渴', '고갈', 1),
+('枯', '枯草', '고초', 0),
+('草', '枯草', '고초', 1),
+('枯', '枯葉劑', '고엽제', 0),
+('葉', '枯葉劑', '고엽제', 1),
+('劑', '枯葉劑', '고엽제', 2),
+('架', '架橋', '가교', 0),
+('橋', '架橋', '가교', 1),
+('架', '架空', '가공', 0),
+('空', '架空', '가공', 1),
+('架', '架設', '가설', 0),
+('設', '架設', '가설', 1),
+('枸', '枸杞', '구기', 0),
+('杞', '枸杞', '구기', 1),
+('枸', '枸杞子', '구기자', 0),
+('杞', '枸杞子', '구기자', 1),
+('子', '枸杞子', '구기자', 2),
+('枸', '枸杞茶', '구기차', 0),
+('杞', '枸杞茶', '구기차', 1),
+('茶', '枸杞茶', '구기차', 2),
+('某', '某', '모', 0),
+('某', '某時', '모시', 0),
+('時', '某時', '모시', 1),
+('某', '某種', '모종', 0),
+('種', '某種', '모종', 1),
+('柑', '柑果', '감과', 0),
+('果', '柑果', '감과', 1),
+('染', '染化', '염화', 0),
+('化', '染化', '염화', 1),
+('染', '染料', '염료', 0),
+('料', '染料', '염료', 1),
+('染', '染汚', '염오', 0),
+('汚', '染汚', '염오', 1),
+('染', '染畫', '염화', 0),
+('畫', '染畫', '염화', 1),
+('染', '染病', '염병', 0),
+('病', '染病', '염병', 1),
+('染', '染色', '염색', 0),
+('色', '染色', '염색', 1),
+('染', '染色體', '염색체', 0),
+('色', '染色體', '염색체', 1),
+('體', '染色體', '염색체', 2),
+('染', '染髮', '염발', 0),
+('髮', '染髮', '염발', 1),
+('柔', '柔', '유', 0),
+('柔', '柔和', '유화', 0),
+('和', '柔和', '유화', 1),
+('柔', '柔弱', '유약', 0),
+('弱', '柔弱', '유약', 1),
+('柔', '柔術', '유술', 0),
+('術', '柔術', '유술', 1),
+('柔', '柔道', '유도', 0),
+('道', '柔道', '유도', 1),
+('柘', '柘榴石', '자류석', 0),
+('榴', '柘榴石', '자류석', 1),
+('石', '柘榴石', '자류석', 2),
+('柚', '柚子', '유자', 0),
+('子', '柚子', '유자', 1),
+('柚', '柚子茶', '유자차', 0),
+('子', '柚子茶', '유자차', 1),
+('茶', '柚子茶', '유자차', 2),
+('柱', '柱頭', '주두', 0),
+('頭', '柱頭', '주두', 1),
+('柴', '柴薪', '시신', 0),
+('薪', '柴薪', '시신', 1),
+('査', '査察', '사찰', 0),
+('察', '査察', '사찰', 1),
+('査', '査證', '사증', 0),
+('證', '査證', '사증', 1),
+('査', '査頓', '사돈', 0),
+('頓', '査頓', '사돈', 1),
+('校', '校內', '교내', 0),
+('內', '校內', '교내', 1),
+('校', '校外', '교외', 0),
+('外', '校外', '교외', 1),
+('校', '校庭', '교정', 0),
+('庭', '校庭', '교정', 1),
+('校', '校庭暴力', '교정폭력', 0),
+('庭', '校庭暴力', '교정폭력', 1),
+('暴', '校庭暴力', '교정폭력', 2),
+('力', '校庭暴力', '교정폭력', 3),
+('校', '校時', '교시', 0),
+('時', '校時', '교시', 1),
+('校', '校服', '교복', 0),
+('服', '校服', '교복', 1),
+('校', '校歌', '교가', 0),
+('歌', '校歌', '교가', 1),
+('校', '校正', '교정', 0),
+('正', '校正', '교정', 1),
+('校', '校舍', '교사', 0),
+('舍', '校舍', '교사', 1),
+('校', '校訂', '교정', 0),
+('訂', '校訂', '교정', 1),
+('校', '校長', '교장', 0),
+('長', '校長', '교장', 1),
+('校', '校門', '교문', 0),
+('門', '校門', '교문', 1),
+('株', '株', '주', 0),
+('株', '株主', '주주', 0),
+('主', '株主', '주주', 1),
+('株', '株價', '주가', 0),
+('價', '株價', '주가', 1),
+('株', '株券', '주권', 0),
+('券', '株券', '주권', 1),
+('株', '株式', '주식', 0),
+('式', '株式', '주식', 1),
+('株', '株式會社', '주식회사', 0),
+('式', '株式會社', '주식회사', 1),
+('會', '株式會社', '주식회사', 2),
+('社', '株式會社', '주식회사', 3),
+('栴', '栴檀', '전단', 0),
+('檀', '栴檀', '전단', 1),
+('核', '核', '핵', 0),
+('核', '核分裂', '핵분열', 0),
+('分', '核分裂', '핵분열', 1),
+('裂', '核分裂', '핵분열', 2),
+('核', '核反應', '핵반응', 0),
+('反', '核反應', '핵반응', 1),
+('應', '核反應', '핵반응', 2),
+('核', '核家族', '핵가족', 0),
+('家', '核家族', '핵가족', 1),
+('族', '核家族', '핵가족', 2),
+('核', '核實驗', '핵실험', 0),
+('實', '核實驗', '핵실험', 1),
+('驗', '核實驗', '핵실험', 2),
+('核', '核廢水', '핵폐수', 0),
+('廢', '核廢水', '핵폐수', 1),
+('水', '核廢水', '핵폐수', 2),
+('核', '核心', '핵심', 0),
+('心', '核心', '핵심', 1),
+('核', '核心部', '핵심부', 0),
+('心', '核心部', '핵심부', 1),
+('部', '核心部', '핵심부', 2),
+('核', '核戰爭', '핵전쟁', 0),
+('戰', '核戰爭', '핵전쟁', 1),
+('爭', '核戰爭', '핵전쟁', 2),
+('核', '核果', '핵과', 0),
+('果', '核果', '핵과', 1),
+('核', '核武器', '핵무기', 0),
+('武', '核武器', '핵무기', 1),
+('器', '核武器', '핵무기', 2),
+('核', '核爆彈', '핵폭탄', 0),
+('爆', '核爆彈', '핵폭탄', 1),
+('彈', '核爆彈', '핵폭탄', 2),
+('核', '核爆發', '핵폭발', 0),
+('爆', '核爆發', '핵폭발', 1),
+('發', '核爆發', '핵폭발', 2),
+('核', '核融合', '핵융합', 0),
+('融', '核融合', '핵융합', 1),
+('合', '核融合', '핵융합', 2),
+('核', '核酸', '핵산', 0),
+('酸', '核酸', '핵산', 1),
+('根', '根底', '근저', 0),
+('底', '根底', '근저', 1),
+('根', '根性', '근성', 0),
+('性', '根性', '근성', 1),
+('根', '根據', '근거', 0),
+('據', '根據', '근거', 1),
+('根', '根本', '근본', 0),
+('本', '根本', '근본', 1),
+('根', '根本主義', '근본주의', 0),
+('本', '根本主義', '근본주의', 1),
+('主', '根本主義', '근본주의', 2),
+('義', '根本主義', '근본주의', 3),
+('根', '根本的', '근본적', 0),
+('本', '根本的', '근본적', 1),
+('的', '根本的', '근본적', 2),
+('根', '根毛', '근모', 0),
+('毛', '根毛', '근모', 1),
+('根', '根源', '근원', 0),
+('源', '根源', '근원', 1),
+('根', '根絶', '근절', 0),
+('絶', '根絶', '근절', 1),
+('根', '根莖', '근경', 0),
+('莖', '根莖', '근경', 1),
+('根', '根菜', '근채', 0),
+('菜', '根菜', '근채', 1),
+('根', '根菜類', '근채류', 0),
+('菜', '根菜類', '근채류', 1),
+('類', '根菜類', '근채류', 2),
+('格', '格', '격', 0),
+('格', '格子', '격자', 0),
+('子', '格子', '격자', 1),
+('格', '格差', '격차', 0),
+('差', '格差', '격차', 1),
+('格', '格率', '격률', 0),
+('率', '格率', '격률', 1),
+('格', '格納庫', '격납고', 0),
+('納', '格納庫', '격납고', 1),
+('庫', '格納庫', '격납고', 2),
+('格', '格言', '격언', 0),
+('言', '格言', '격언', 1),
+('格', '格變化', '격변화', 0),
+('變', '格變化', '격변화', 1),
+('化', '格變化', '격변화', 2),
+('格', '格鬪', '격투', 0),
+('鬪', '格鬪', '격투', 1),
+('栽', '栽培', '재배', 0),
+('培', '栽培', '재배', 1),
+('栽', '栽培地', '재배지', 0),
+('培', '栽培地', '재배지', 1),
+('地', '栽培地', '재배지', 2),
+('桂', '桂林', '계림', 0),
+('林', '桂林', '계림', 1),
+('桂', '桂皮', '계피', 0),
+('皮', '桂皮', '계피', 1),
+('桃', '桃園', '도원', 0),
+('園', '桃園', '도원', 1),
+('桃', '桃花', '도화', 0),
+('花', '桃花', '도화', 1),
+('案', '案', '안', 0),
+('案', '案內', '안내', 0),
+('內', '案內', '안내', 1),
+('案', '案內人', '안내인', 0),
+('內', '案內人', '안내인', 1),
+('人', '案內人', '안내인', 2),
+('案', '案內圖', '안내도', 0),
+('內', '案內圖', '안내도', 1),
+('圖', '案內圖', '안내도', 2),
+('案', '案內所', '안내소', 0),
+('內', '案內所', '안내소', 1),
+('所', '案內所', '안내소', 2),
+('案', '案內文', '안내문', 0),
+('內', '案內文', '안내문', 1),
+('文', '案內文', '안내문', 2),
+('案', '案內書', '안내서', 0),
+('內', '案內書', '안내서', 1),
+('書', '案內書', '안내서', 2),
+('案', '案內狀', '안내장', 0),
+('內', '案內狀', '안내장', 1),
+('狀', '案內狀', '안내장', 2),
+('桐', '桐油', '동유', 0),
+('油', '桐油', '동유', 1),
+('桑', '桑田碧海', '상전벽해', 0),
+('田', '桑田碧海', '상전벽해', 1),
+('碧', '桑田碧海', '상전벽해', 2),
+('海', '桑田碧海', '상전벽해', 3),
+('桔', '桔梗', '길경', 0),
+('梗', '桔梗', '길경', 1),
+('桶', '桶', '통', 0),
+('桶', '桶子', '통자', 0),
+('子', '桶子', '통자', 1),
+('桿', '桿菌', '간균', 0),
+('菌', '桿菌', '간균', 1),
+('梅', '梅實', '매실', 0),
+('實', '梅實', '매실', 1),
+('梅', '梅實酒', '매실주', 0),
+('實', '梅實酒', '매실주', 1),
+('酒', '梅實酒', '매실주', 2),
+('梅', '梅毒', '매독', 0),
+('毒', '梅毒', '매독', 1),
+('梅', '梅花', '매화', 0),
+('花', '梅花', '매화', 1),
+('梅', '梅雨', '매우', 0),
+('雨', '梅雨', '매우', 1),
+('梅', '梅香', '매향', 0),
+('香', '梅香', '매향', 1),
+('梗', '梗塞', '경색', 0),
+('塞', '梗塞', '경색', 1),
+('條', '條', '조', 0),
+('條', '條件', '조건', 0),
+('件', '條件', '조건', 1),
+('條', '條例', '조례', 0),
+('例', '條例', '조례', 1),
+('條', '條理', '조리', 0),
+('理', '條理', '조리', 1),
+('條', '條目', '조목', 0),
+('目', '條目', '조목', 1),
+('條', '條約', '조약', 0),
+('約', '條約', '조약', 1),
+('條', '條項', '조항', 0),
+('項', '條項', '조항', 1),
+('梧', '梧桐', '오동', 0),
+('桐', '梧桐', '오동', 1),
+('梨', '梨棗', '이조', 0),
+('棗', '梨棗', '이조', 1),
+('梨', '梨花雨', '이화우', 0),
+('花', '梨花雨', '이화우', 1),
+('雨', '梨花雨', '이화우', 2),
+('梵', '梵天', '범천', 0),
+('天', '梵天', '범천', 1),
+('梵', '梵語', '범어', 0),
+('語', '梵語', '범어', 1),
+('梵', '梵鐘', '범종', 0),
+('鐘', '梵鐘', '범종', 1),
+('棄', '棄世', '기세', 0),
+('世', '棄世', '기세', 1),
+('棄', '棄兒', '기아', 0),
+('兒', '棄兒', '기아', 1),
+('棄', '棄却', '기각', 0),
+('却', '棄却', '기각', 1),
+('棉', '棉花', '면화', 0),
+('花', '棉花', '면화', 1),
+('棊', '棊士', '기사', 0),
+('士', '棊士', '기사', 1),
+('棋', '棋石', '기석', 0),
+('石', '棋石', '기석', 1),
+('棍', '棍棒', '곤봉', 0),
+('棒', '棍棒', '곤봉', 1),
+('棗', '棗仁', '조인', 0),
+('仁', '棗仁', '조인', 1),
+('棘', '棘皮動物', '극피동물', 0),
+('皮', '棘皮動物', '극피동물', 1),
+('動', '棘皮動物', '극피동물', 2),
+('物', '棘皮動物', '극피동물', 3),
+('棧', '棧橋', '잔교', 0),
+('橋', '棧橋', '잔교', 1),
+('森', '森林', '삼림', 0),
+('林', '森林', '삼림', 1),
+('森', '森林浴', '삼림욕', 0),
+('林', '森林浴', '삼림욕', 1),
+('浴', '森林浴', '삼림욕', 2),
+('森', '森林限界線', '삼림한계선', 0),
+('林', '森林限界線', '삼림한계선', 1),
+('限', '森林限界線', '삼림한계선', 2),
+('界', '森林限界線', '삼림한계선', 3),
+('線', '森林限界線', '삼림한계선', 4),
+('森', '森羅萬象', '삼라만상', 0),
+('羅', '森羅萬象', '삼라만상', 1),
+('萬', '森羅萬象', '삼라만상', 2),
+('象', '森羅萬象', '삼라만상', 3),
+('棲', '棲息', '서식', 0),
+('息', '棲息', '서식', 1),
+('棲', '棲息地', '서식지', 0),
+('息', '棲息地', '서식지', 1),
+('地', '棲息地', '서식지', 2),
+('棺', '棺', '관', 0),
+('棺', '棺槨', '관곽', 0),
+('槨', '棺槨', '관곽', 1),
+('椄', '椄', '접', 0),
+('椅', '椅子', '의자', 0),
+('子', '椅子', '의자', 1),
+('植', '植民', '식민', 0),
+('民', '植民', '식민', 1),
+('植', '植民主義', '식민주의', 0),
+('民', '植民主義', '식민주의', 1),
+('主', '植民主義', '식민주의', 2),
+('義', '植民主義', '식민주의', 3),
+('植', '植民地', '식민지', 0),
+('民', '植民地', '식민지', 1),
+('地', '植民地', '식민지', 2),
+('植', '植民地化', '식민지화', 0),
+('民', '植民地化', '식민지화', 1),
+('地', '植民地化', '식민지화', 2),
+('化', '植民地化', '식민지화', 3),
+('植', '植物', '식물', 0),
+('物', '植物', '식물', 1),
+('植', '植物園', '식물원', 0),
+('物', '植物園', '식물원', 1),
+('園', '植物園', '식물원', 2),
+('植', '植物學', '식물학', 0),
+('物', '植物學', '식물학', 1),
+('學', '植物學', '식물학', 2),
+('植', '植物油', '식물유', 0),
+('物', '植物油', '식물유', 1),
+('油', '植物油', '식물유', 2),
+('植', '植生', '식생', 0),
+('生', '植生', '식생', 1),
+('椒', '椒目', '초목', 0),
+('目', '椒目', '초목', 1),
+('椰', '椰子', '야자', 0),
+('子', '椰子', '야자', 1),
+('椰', '椰子  ', '야자나무', 0),
+('子', '椰子  ', '야자나무', 1),
+('椰', '椰子樹', '야자수', 0),
+('子', '椰子樹', '야자수', 1),
+('樹', '椰子樹', '야자수', 2),
+('椰', '椰子油', '야자유', 0),
+('子', '椰子油', '야자유', 1),
+('油', '椰子油', '야자유', 2),
+('楊', '楊梅', '양매', 0),
+('梅', '楊梅', '양매', 1),
+('楊', '楊貴妃', '양귀비', 0),
+('貴', '楊貴妃', '양귀비', 1),
+('妃', '楊貴妃', '양귀비', 2),
+('楓', '楓', '풍', 0),
+('楕', '楕圓', '타원', 0),
+('圓', '楕圓', '타원', 1),
+('楡', '楡津', '유진', 0),
+('津', '楡津', '유진', 1),
+('業', '業', '업', 0),
+('業', '業主', '업주', 0),
+('主', '業主', '업주', 1),
+('業', '業務', '업무', 0),
+('務', '業務', '업무', 1),
+('業', '業所', '업소', 0),
+('所', '業所', '업소', 1),
+('業', '業王', '업왕', 0),
+('王', '業王', '업왕', 1),
+('業', '業種', '업종', 0),
+('種', '業種', '업종', 1),
+('業', '業績', '업적', 0),
+('績', '業績', '업적', 1),
+('業', '業者', '업자', 0),
+('者', '業者', '업자', 1),
+('業', '業體', '업체', 0),
+('體', '業體', '업체', 1),
+('極', '極', '극', 0),
+('極', '極-', '극히', 0),
+('-', '極-', '극히', 1),
+('極', '極光', '극광', 0),
+('光', '極光', '극광', 1),
+('極', '極刑', '극형', 0),
+('刑', '極刑', '극형', 1),
+('極', '極右', '극우', 0),
+('右', '極右', '극우', 1),
+('極', '極圈', '극권', 0),
+('圈', '極圈', '극권', 1),
+('極', '極好', '극호', 0),
+('好', '極好', '극호', 1),
+('極', '極嫌', '극혐', 0),
+('嫌', '極嫌', '극혐', 1),
+('極', '極左', '극좌', 0),
+('左', '極左', '극좌', 1),
+('極', '極度', '극도', 0),
+('度', '極度', '극도', 1),
+('極', '極性', '극성', 0),
+('性', '極性', '극성', 1),
+('極', '極惡', '극악', 0),
+('惡', '極惡', '극악', 1),
+('極', '極東', '극동', 0),
+('東', '極東', '극동', 1),
+('極', '極樂', '극락', 0),
+('樂', '極樂', '극락', 1),
+('極', '極甚', '극심', 0),
+('甚', '極甚', '극심', 1),
+('極', '極端', '극단', 0),
+('端', '極端', '극단', 1),
+('極', '極端 選擇', '극단 선택', 0),
+('端', '極端 選擇', '극단 선택', 1),
+('選', '極端 選擇', '극단 선택', 3),
+('擇', '極端 選擇', '극단 선택', 4),
+('極', '極端主義', '극단주의', 0),
+('端', '極端主義', '극단주의', 1),
+('主', '極端主義', '극단주의', 2),
+('義', '極端主義', '극단주의', 3),
+('極', '極端的 選擇', '극단적 선택', 0),
+('端', '極端的 選擇', '극단적 선택', 1),
+('的', '極端的 選擇', '극단적 선택', 2),
+('選', '極端的 選擇', '극단적 선택', 4),
+('擇', '極端的 選擇', '극단적 선택', 5),
+('極', '極致', '극치', 0),
+('致', '極致', '극치', 1),
+('極', '極超短波', '극초단파', 0),
+('超', '極超短波', '극초단파', 1),
+('短', '極超短波', '극초단파', 2),
+('波', '極超短波', '극초단파', 3),
+('極', '極限', '극한', 0),
+('限', '極限', '극한', 1),
+('極', '極點', '극점', 0),
+('點', '極點', '극점', 1),
+('概', '概念', '개념', 0),
+('念', '概念', '개념', 1),
+('榜', '榜', '방', 0),
+('榠', '榠樝', '명자', 0),
+('樝', '榠樝', '명자', 1),
+('榧', '榧子', '비자', 0),
+('子', '榧子', '비자', 1),
+('榮', '榮光', '영광', 0),
+('光', '榮光', '영광', 1),
+('榮', '榮華', '영화', 0),
+('華', '榮華', '영화', 1),
+('榮', '榮落', '영락', 0),
+('落', '榮落', '영락', 1),
+('榮', '榮譽', '영예', 0),
+('譽', '榮譽', '영예', 1),
+('榴', '榴彈', '류탄', 0),
+('彈', '榴彈', '류탄', 1),
+('榴', '榴彈', '유탄', 0),
+('彈', '榴彈', '유탄', 1),
+('榴', '榴散彈', '유산탄', 0),
+('散', '榴散彈', '유산탄', 1),
+('彈', '榴散彈', '유산탄', 2),
+('構', '構內', '구내', 0),
+('內', '構內', '구내', 1),
+('構', '構內食堂', '구내식당', 0),
+('內', '構內食堂', '구내식당', 1),
+('食', '構內食堂', '구내식당', 2),
+('堂', '構內食堂', '구내식당', 3),
+('構', '構圖', '구도', 0),
+('圖', '構圖', '구도', 1),
+('構', '構外', '구외', 0),
+('外', '構外', '구외', 1),
+('構', '構想', '구상', 0),
+('想', '構想', '구상', 1),
+('構', '構成', '구성', 0),
+('成', '構成', '구성', 1),
+('構', '構成員', '구성원', 0),
+('成', '構成員', '구성원', 1),
+('員', '構成員', '구성원', 2),
+('構', '構文論', '구문론', 0),
+('文', '構文論', '구문론', 1),
+('論', '構文論', '구문론', 2),
+('構', '構築', '구축', 0),
+('築', '構築', '구축', 1),
+('構', '構造', '구조', 0),
+('造', '構造', '구조', 1),
+('構', '構造主義', '구조주의', 0),
+('造', '構造主義', '구조주의', 1),
+('主', '構造主義', '구조주의', 2),
+('義', '構造主義', '구조주의', 3),
+('槍', '槍', '창', 0),
+('槍', '槍騎兵', '창기병', 0),
+('騎', '槍騎兵', '창기병', 1),
+('兵', '槍騎兵', '창기병', 2),
+('槪', '槪念', '개념', 0),
+('念', '槪念', '개념', 1),
+('槪', '槪括', '개괄', 0),
+('括', '槪括', '개괄', 1),
+('槪', '槪略', '개략', 0),
+('略', '槪略', '개략', 1),
+('槪', '槪要', '개요', 0),
+('要', '槪要', '개요', 1),
+('槪', '槪觀', '개관', 0),
+('觀', '槪觀', '개관', 1),
+('槿', '槿惠', '근혜', 0),
+('惠', '槿惠', '근혜', 1),
+('樂', '樂', '낙', 0),
+('樂', '樂受', '낙수', 0),
+('受', '樂受', '낙수', 1),
+('樂', '樂句', '악구', 0),
+('句', '樂句', '악구', 1),
+('樂', '樂器', '악기', 0),
+('器', '樂器', '악기', 1),
+('樂', '樂園', '낙원', 0),
+('園', '樂園', '낙원', 1),
+('樂', '樂團', '악단', 0),
+('團', '樂團', '악단', 1),
+('樂', '樂天', '낙천', 0),
+('天', '樂天', '낙천', 1),
+('樂', '樂天主義', '낙천주의', 0),
+('天', '樂天主義', '낙천주의', 1),
+('主', '樂天主義', '낙천주의', 2),
+('義', '樂天主義', '낙천주의', 3),
+('樂', '樂天主義者', '낙천주의자', 0),
+('天', '樂天主義者', '낙천주의자', 1),
+('主', '樂天主義者', '낙천주의자', 2),
+('義', '樂天主義者', '낙천주의자', 3),
+('者', '樂天主義者', '낙천주의자', 4),
+('樂', '樂山樂水', '요산요수', 0),
+('山', '樂山樂水', '요산요수', 1),
+('樂', '樂山樂水', '요산요수', 2),
+('水', '樂山樂水', '요산요수', 3),
+('樂', '樂曲', '악곡', 0),
+('曲', '樂曲', '악곡', 1),
+('樂', '樂書', '악서', 0),
+('書', '樂書', '악서', 1),
+('樂', '樂經', '악경', 0),
+('經', '樂經', '악경', 1),
+('樂', '樂觀', '낙관', 0),
+('觀', '樂觀', '낙관', 1),
+('樂', '樂譜', '악보', 0),
+('譜', '樂譜', '악보', 1),
+('樂', '樂隊', '악대', 0),
+('隊', '樂隊', '악대', 1),
+('樓', '樓船', '누선', 0),
+('船', '樓船', '누선', 1),
+('標', '標本', '표본', 0),
+('本', '標本', '표본', 1),
+('標', '標準', '표준', 0),
+('準', '標準', '표준', 1),
+('標', '標準化', '표준화', 0),
+('準', '標準化', '표준화', 1),
+('化', '標準化', '표준화', 2),
+('標', '標準語', '표준어', 0),
+('準', '標準語', '표준어', 1),
+('語', '標準語', '표준어', 2),
+('標', '標的', '표적', 0),
+('的', '標的', '표적', 1),
+('標', '標示', '표시', 0),
+('示', '標示', '표시', 1),
+('標', '標記', '표기', 0),
+('記', '標記', '표기', 1),
+('標', '標語', '표어', 0),
+('語', '標語', '표어', 1),
+('標', '標識', '표식', 0),
+('識', '標識', '표식', 1),
+('標', '標識', '표지', 0),
+('識', '標識', '표지', 1),
+('標', '標識板', '표지판', 0),
+('識', '標識板', '표지판', 1),
+('板', '標識板', '표지판', 2),
+('標', '標題', '표제', 0),
+('題', '標題', '표제', 1),
+('標', '標題語', '표제어', 0),
+('題', '標題語', '표제어', 1),
+('語', '標題語', '표제어', 2),
+('樞', '樞密院', '추밀원', 0),
+('密', '樞密院', '추밀원', 1),
+('院', '樞密院', '추밀원', 2),
+('樞', '樞機卿', '추기경', 0),
+('機', '樞機卿', '추기경', 1),
+('卿', '樞機卿', '추기경', 2),
+('樞', '樞軸國', '추축국', 0),
+('軸', '樞軸國', '추축국', 1),
+('國', '樞軸國', '추축국', 2),
+('樟', '樟樹', '장수', 0),
+('樹', '樟樹', '장수', 1),
+('樟', '樟腦', '장뇌', 0),
+('腦', '樟腦', '장뇌', 1),
+('模', '模倣', '모방', 0),
+('倣', '模倣', '모방', 1),
+('模', '模型', '모형', 0),
+('型', '模型', '모형', 1),
+('模', '模寫', '모사', 0),
+('寫', '模寫', '모사', 1),
+('模', '模寫說', '모사설', 0),
+('寫', '模寫說', '모사설', 1),
+('說', '模寫說', '모사설', 2),
+('模', '模式', '모식', 0),
+('式', '模式', '모식', 1),
+('模', '模形', '모형', 0),
+('形', '模形', '모형', 1),
+('模', '模樣', '모양', 0),
+('樣', '模樣', '모양', 1),
+('模', '模範', '모범', 0),
+('範', '模範', '모범', 1),
+('模', '模襲', '모습', 0),
+('襲', '模襲', '모습', 1),
+('模', '模造', '모조', 0),
+('造', '模造', '모조', 1),
+('樣', '樣姿', '양자', 0),
+('姿', '樣姿', '양자', 1),
+('樣', '樣子', '양자', 0),
+('子', '樣子', '양자', 1),
+('樣', '樣式', '양식', 0),
+('式', '樣式', '양식', 1),
+('樣', '樣相', '양상', 0),
+('相', '樣相', '양상', 1),
+('樹', '樹木', '수목', 0),
+('木', '樹木', '수목', 1),
+('樹', '樹液', '수액', 0),
+('液', '樹液', '수액', 1),
+('樹', '樹皮', '수피', 0),
+('皮', '樹皮', '수피', 1),
+('樹', '樹立', '수립', 0),
+('立', '樹立', '수립', 1),
+('樹', '樹脂', '수지', 0),
+('脂', '樹脂', '수지', 1),
+('樹', '樹葉', '수엽', 0),
+('葉', '樹葉', '수엽', 1),
+('樹', '樹黨', '수당', 0),
+('黨', '樹黨', '수당', 1),
+('樺', '樺木', '화목', 0),
+('木', '樺木', '화목', 1),
+('橄', '橄欖', '감람', 0),
+('欖', '橄欖', '감람', 1),
+('橄', '橄欖色', '감람색', 0),
+('欖', '橄欖色', '감람색', 1),
+('色', '橄欖色', '감람색', 2),
+('橋', '橋梁', '교량', 0),
+('梁', '橋梁', '교량', 1),
+('橋', '橋脚', '교각', 0),
+('脚', '橋脚', '교각', 1),
+('橋', '橋頭堡', '교두보', 0),
+('頭', '橋頭堡', '교두보', 1),
+('堡', '橋頭堡', '교두보', 2),
+('橘', '橘', '귤', 0),
+('橘', '橘', '줄', 0),
+('橙', '橙子', '등자', 0),
+('子', '橙子', '등자', 1),
+('機', '機制', '기제', 0),
+('制', '機制', '기제', 1),
+('機', '機動', '기동', 0),
+('動', '機動', '기동', 1),
+('機', '機務', '기무', 0),
+('務', '機務', '기무', 1),
+('機', '機器', '기기', 0),
+('器', '機器', '기기', 1),
+('機', '機密', '기밀', 0),
+('密', '機密', '기밀', 1),
+('機', '機會', '기회', 0),
+('會', '機會', '기회', 1),
+('機', '機會主義者', '기회주의자', 0),
+('會', '機會主義者', '기회주의자', 1),
+('主', '機會主義者', '기회주의자', 2),
+('義', '機會主義者', '기회주의자', 3),
+('者', '機會主義者', '기회주의자', 4),
+('機', '機械', '기계', 0),
+('械', '機械', '기계', 1),
+('機', '機械化', '기계화', 0),
+('械', '機械化', '기계화', 1),
+('化', '機械化', '기계화', 2),
+('機', '機械工', '기계공', 0),
+('械', '機械工', '기계공', 1),
+('工', '機械工', '기계공', 2),
+('機', '機械端艇', '기계단정', 0),
+('械', '機械端艇', '기계단정', 1),
+('端', '機械端艇', '기계단정', 2),
+('艇', '機械端艇', '기계단정', 3),
+('機', '機構', '기구', 0),
+('構', '機構', '기구', 1),
+('機', '機略', '기략', 0),
+('略', '機略', '기략', 1),
+('機', '機緣', '기연', 0),
+('緣', '機緣', '기연', 1),
+('機', '機能', '기능', 0),
+('能', '機能', '기능', 1),
+('機', '機轉', '기전', 0),
+('轉', '機轉', '기전', 1),
+('機', '機銃', '기총', 0),
+('銃', '機銃', '기총', 1),
+('機', '機長', '기장', 0),
+('長', '機長', '기장', 1),
+('機', '機關', '기관', 0),
+('關', '機關', '기관', 1),
+('機', '機關車', '기관차', 0),
+('關', '機關車', '기관차', 1),
+('車', '機關車', '기관차', 2),
+('機', '機關銃', '기관총', 0),
+('關', '機關銃', '기관총', 1),
+('銃', '機關銃', '기관총', 2),
+('機', '機體', '기체', 0),
+('體', '機體', '기체', 1),
+('橫', '橫城', '횡성', 0),
+('城', '橫城', '횡성', 1),
+('橫', '橫斷', '횡단', 0),
+('斷', '橫斷', '횡단', 1),
+('橫', '橫斷步道', '횡단보도', 0),
+('斷', '橫斷步道', '횡단보도', 1),
+('步', '橫斷步道', '횡단보도', 2),
+('道', '橫斷步道', '횡단보도', 3),
+('橫', '橫斷陸橋', '횡단육교', 0),
+('斷', '橫斷陸橋', '횡단육교', 1),
+('陸', '橫斷陸橋', '횡단육교', 2),
+('橋', '橫斷陸橋', '횡단육교', 3),
+('橫', '橫木', '횡목', 0),
+('木', '橫木', '횡목', 1),
+('橫', '橫波', '횡파', 0),
+('波', '橫波', '횡파', 1),
+('橫', '橫的', '횡적', 0),
+('的', '橫的', '횡적', 1),
+('橫', '橫目', '횡목', 0),
+('目', '橫目', '횡목', 1),
+('橫', '橫笛', '횡적', 0),
+('笛', '橫笛', '횡적', 1),
+('橫', '橫膈膜', '횡격막', 0),
+('膈', '橫膈膜', '횡격막', 1),
+('膜', '橫膈膜', '횡격막', 2),
+('橫', '橫說竪說', '횡설수설', 0),
+('說', '橫說竪說', '횡설수설', 1),
+('竪', '橫說竪說', '횡설수설', 2),
+('說', '橫說竪說', '횡설수설', 3),
+('橫', '橫領', '횡령', 0),
+('領', '橫領', '횡령', 1),
+('檀', '檀君', '단군', 0),
+('君', '檀君', '단군', 1),
+('檀', '檀國', '단국', 0),
+('國', '檀國', '단국', 1),
+('檀', '檀紀', '단기', 0),
+('紀', '檀紀', '단기', 1),
+('檢', '檢', '검', 0),
+('檢', '檢事', '검사', 0),
+('事', '檢事', '검사', 1),
+('檢', '檢出', '검출', 0),
+('出', '檢出', '검출', 1),
+('檢', '檢察', '검찰', 0),
+('察', '檢察', '검찰', 1),
+('檢', '檢察官', '검찰관', 0),
+('察', '檢察官', '검찰관', 1),
+('官', '檢察官', '검찰관', 2),
+('檢', '檢察廳', '검찰청', 0),
+('察', '檢察廳', '검찰청', 1),
+('廳', '檢察廳', '검찰청', 2),
+('檢', '檢尿', '검뇨', 0),
+('尿', '檢尿', '검뇨', 1),
+('檢', '檢屍', '검시', 0),
+('屍', '檢屍', '검시', 1),
+('檢', '檢擧', '검거', 0),
+('擧', '檢擧', '검거', 1),
+('檢', '檢札', '검찰', 0),
+('札', '檢札', '검찰', 1),
+('檢', '檢査', '검사', 0),
+('査', '檢査', '검사', 1),
+('檢', '檢流計', '검류계', 0),
+('流', '檢流計', '검류계', 1),
+('計', '檢流計', '검류계', 2),
+('檢', '檢溫', '검온', 0),
+('溫', '檢溫', '검온', 1),
+('檢', '檢溫器', '검온기', 0),
+('溫', '檢溫器', '검온기', 1),
+('器', '檢溫器', '검온기', 2),
+('檢', '檢疫', '검역', 0),
+('疫', '檢疫', '검역', 1),
+('檢', '檢索', '검색', 0),
+('索', '檢索', '검색', 1),
+('檢', '檢視', '검시', 0),
+('視', '檢視', '검시', 1),
+('檢', '檢討', '검토', 0),
+('討', '檢討', '검토', 1),
+('檢', '檢診', '검진', 0),
+('診', '檢診', '검진', 1),
+('檢', '檢證', '검증', 0),
+('證', '檢證', '검증', 1),
+('檢', '檢針', '검침', 0),
+('針', '檢針', '검침', 1),
+('檢', '檢閱', '검열', 0),
+('閱', '檢閱', '검열', 1),
+('檻', '檻穽', '함정', 0),
+('穽', '檻穽', '함정', 1),
+('櫃', '櫃', '궤', 0),
+('櫓', '櫓', '노', 0),
+('櫛', '櫛比', '즐비', 0),
+('比', '櫛比', '즐비', 1),
+('櫻', '櫻桃', '앵두', 0),
+('桃', '櫻桃', '앵두', 1),
+('櫻', '櫻草', '앵초', 0),
+('草', '櫻草', '앵초', 1),
+('欄', '欄外', '난외', 0),
+('外', '欄外', '난외', 1),
+('欄', '欄干', '난간', 0),
+('干', '欄干', '난간', 1),
+('欄', '欄杆', '난간', 0),
+('杆', '欄杆', '난간', 1),
+('權', '權利', '권리', 0),
+('利', '權利', '권리', 1),
+('權', '權力', '권력', 0),
+('力', '權力', '권력', 1),
+('權', '權力者', '권력자', 0),
+('力', '權力者', '권력자', 1),
+('者', '權力者', '권력자', 2),
+('權', '權勢', '권세', 0),
+('勢', '權勢', '권세', 1),
+('權', '權化', '권화', 0),
+('化', '權化', '권화', 1),
+('權', '權威', '권위', 0),
+('威', '權威', '권위', 1),
+('權', '權威主義', '권위주의', 0),
+('威', '權威主義', '권위주의', 1),
+('主', '權威主義', '권위주의', 2),
+('義', '權威主義', '권위주의', 3),
+('權', '權益', '권익', 0),
+('益', '權益', '권익', 1),
+('權', '權能', '권능', 0),
+('能', '權能', '권능', 1),
+('權', '權謀術數', '권모술수', 0),
+('謀', '權謀術數', '권모술수', 1),
+('術', '權謀術數', '권모술수', 2),
+('數', '權謀術數', '권모술수', 3),
+('權', '權限', '권한', 0),
+('限', '權限', '권한', 1),
+('欌', '欌籠', '장롱', 0),
+('籠', '欌籠', '장롱', 1),
+('欠', '欠', '흠', 0),
+('欠', '欠伸', '흠신', 0),
+('伸', '欠伸', '흠신', 1),
+('欠', '欠缺', '흠결', 0),
+('缺', '欠缺', '흠결', 1),
+('次', '次', '차', 0),
+('次', '次例', '차례', 0),
+('例', '次例', '차례', 1),
+('次', '次例次例', '차례차례', 0),
+('例', '次例次例', '차례차례', 1),
+('次', '次例次例', '차례차례', 2),
+('例', '次例次例', '차례차례', 3),
+('次', '次元', '차원', 0),
+('元', '次元', '차원', 1),
+('次', '次善策', '차선책', 0),
+('善', '次善策', '차선책', 1),
+('策', '次善策', '차선책', 2),
+('次', '次女', '차녀', 0),
+('女', '次女', '차녀', 1),
+('次', '次官', '차관', 0),
+('官', '次官', '차관', 1),
+('次', '次帥', '차수', 0),
+('帥', '次帥', '차수', 1),
+('次', '次惡', '차악', 0),
+('惡', '次惡', '차악', 1),
+('次', '次愛', '차애', 0),
+('愛', '次愛', '차애', 1),
+('次', '次數', '차수', 0),
+('數', '次數', '차수', 1),
+('次', '次次', '차차', 0),
+('次', '次次', '차차', 1),
+('次', '次次雄', '차차웅', 0),
+('次', '次次雄', '차차웅', 1),
+('雄', '次次雄', '차차웅', 2),
+('次', '次男', '차남', 0),
+('男', '次男', '차남', 1),
+('欣', '欣快', '흔쾌', 0),
+('快', '欣快', '흔쾌', 1),
+('欲', '欲心', '욕심', 0),
+('心', '欲心', '욕심', 1),
+('欲', '欲望', '욕망', 0),
+('望', '欲望', '욕망', 1),
+('欺', '欺瞞', '기만', 0),
+('瞞', '欺瞞', '기만', 1),
+('欺', '欺罔', '기망', 0),
+('罔', '欺罔', '기망', 1),
+('歇', '歇價', '헐가', 0),
+('價', '歇價', '헐가', 1),
+('歌', '歌劇', '가극', 0),
+('劇', '歌劇', '가극', 1),
+('歌', '歌唱', '가창', 0),
+('唱', '歌唱', '가창', 1),
+('歌', '歌手', '가수', 0),
+('手', '歌手', '가수', 1),
+('歌', '歌曲', '가곡', 0),
+('曲', '歌曲', '가곡', 1),
+('歌', '歌曲集', '가곡집', 0),
+('曲', '歌曲集', '가곡집', 1),
+('集', '歌曲集', '가곡집', 2),
+('歌', '歌舞', '가무', 0),
+('舞', '歌舞', '가무', 1),
+('歌', '歌詞', '가사', 0),
+('詞', '歌詞', '가사', 1),
+('歌', '歌謠', '가요', 0),
+('謠', '歌謠', '가요', 1),
+('歎', '歎息', '탄식', 0),
+('息', '歎息', '탄식', 1),
+('歎', '歎聲', '탄성', 0),
+('聲', '歎聲', '탄성', 1),
+('歎', '歎願', '탄원', 0),
+('願', '歎願', '탄원', 1),
+('歐', '歐洲', '구주', 0),
+('洲', '歐洲', '구주', 1),
+('歐', '歐羅巴', '구라파', 0),
+('羅', '歐羅巴', '구라파', 1),
+('巴', '歐羅巴', '구라파', 2),
+('歐', '歐美', '구미', 0),
+('美', '歐美', '구미', 1),
+('歐', '歐美人', '구미인', 0),
+('美', '歐美人', '구미인', 1),
+('人', '歐美人', '구미인', 2),
+('歐', '歐美化', '구미화', 0),
+('美', '歐美化', '구미화', 1),
+('化', '歐美化', '구미화', 2),
+('歐', '歐美圈', '구미권', 0),
+('美', '歐美圈', '구미권', 1),
+('圈', '歐美圈', '구미권', 2),
+('歡', '歡呼', '환호', 0),
+('呼', '歡呼', '환호', 1),
+('歡', '歡呼聲', '환호성', 0),
+('呼', '歡呼聲', '환호성', 1),
+('聲', '歡呼聲', '환호성', 2),
+('歡', '歡待', '환대', 0),
+('待', '歡待', '환대', 1),
+('歡', '歡樂', '환락', 0),
+('樂', '歡樂', '환락', 1),
+('歡', '歡語', '환어', 0),
+('語', '歡語', '환어', 1),
+('歡', '歡迎', '환영', 0),
+('迎', '歡迎', '환영', 1),
+('歡', '歡送', '환송', 0),
+('送', '歡送', '환송', 1),
+('止', '止血', '지혈', 0),
+('血', '止血', '지혈', 1),
+('正', '正', '정', 0),
+('正', '正-', '정말', 0),
+('-', '正-', '정말', 1),
+('正', '正--', '정말로', 0),
+('-', '正--', '정말로', 1),
+('-', '正--', '정말로', 2),
+('正', '正六面體', '정육면체', 0),
+('六', '正六面體', '정육면체', 1),
+('面', '正六面體', '정육면체', 2),
+('體', '正六面體', '정육면체', 3),
+('正', '正午', '정오', 0),
+('午', '正午', '정오', 1),
+('正', '正反對', '정반대', 0),
+('反', '正反對', '정반대', 1),
+('對', '正反對', '정반대', 2),
+('正', '正四角形', '정사각형', 0),
+('四', '正四角形', '정사각형', 1),
+('角', '正四角形', '정사각형', 2),
+('形', '正四角形', '정사각형', 3),
+('正', '正堂', '정당', 0),
+('堂', '正堂', '정당', 1),
+('正', '正字', '정자', 0),
+('字', '正字', '정자', 1),
+('正', '正常', '정상', 0),
+('常', '正常', '정상', 1),
+('正', '正常位', '정상위', 0),
+('常', '正常位', '정상위', 1),
+('位', '正常位', '정상위', 2),
+('正', '正常値', '정상치', 0),
+('常', '正常値', '정상치', 1),
+('値', '正常値', '정상치', 2),
+('正', '正常化', '정상화', 0),
+('常', '正常化', '정상화', 1),
+('化', '正常化', '정상화', 2),
+('正', '正座', '정좌', 0),
+('座', '正座', '정좌', 1),
+('正', '正式', '정식', 0),
+('式', '正式', '정식', 1),
+('正', '正弦', '정현', 0),
+('弦', '正弦', '정현', 1),
+('正', '正恩', '정은', 0),
+('恩', '正恩', '정은', 1),
+('正', '正敎', '정교', 0),
+('敎', '正敎', '정교', 1),
+('正', '正敎會', '정교회', 0),
+('敎', '正敎會', '정교회', 1),
+('會', '正敎會', '정교회', 2),
+('正', '正日峰', '정일봉', 0),
+('日', '正日峰', '정일봉', 1),
+('峰', '正日峰', '정일봉', 2),
+('正', '正書法', '정서법', 0),
+('書', '正書法', '정서법', 1),
+('法', '正書法', '정서법', 2),
+('正', '正月', '정월', 0),
+('月', '正月', '정월', 1),
+('正', '正殿', '정전', 0),
+('殿', '正殿', '정전', 1),
+('正', '正比例', '정비례', 0),
+('比', '正比例', '정비례', 1),
+('例', '正比例', '정비례', 2),
+('正', '正氣', '정기', 0),
+('氣', '正氣', '정기', 1),
+('正', '正犯者', '정범자', 0),
+('犯', '正犯者', '정범자', 1),
+('者', '正犯者', '정범자', 2),
+('正', '正當', '정당', 0),
+('當', '正當', '정당', 1),
+('正', '正直', '정직', 0),
+('直', '正直', '정직', 1),
+('正', '正矢', '정시', 0),
+('矢', '正矢', '정시', 1),
+('正', '正確', '정확', 0),
+('確', '正確', '정확', 1),
+('正', '正答', '정답', 0),
+('答', '正答', '정답', 1),
+('正', '正統', '정통', 0),
+('統', '正統', '정통', 1),
+('正', '正義', '정의', 0),
+('義', '正義', '정의', 1),
+('正', '正色', '정색', 0),
+('色', '正色', '정색', 1),
+('正', '正裝', '정장', 0),
+('裝', '正裝', '정장', 1),
+('正', '正規', '정규', 0),
+('規', '正規', '정규', 1),
+('正', '正誤', '정오', 0),
+('誤', '正誤', '정오', 1),
+('正', '正貨', '정화', 0),
+('貨', '正貨', '정화', 1),
+('正', '正走行', '정주행', 0),
+('走', '正走行', '정주행', 1),
+('行', '正走行', '정주행', 2),
+('正', '正門', '정문', 0),
+('門', '正門', '정문', 1),
+('正', '正面', '정면', 0),
+('面', '正面', '정면', 1),
+('正', '正音', '정음', 0),
+('音', '正音', '정음', 1),
+('正', '正音學', '정음학', 0),
+('音', '正音學', '정음학', 1),
+('學', '正音學', '정음학', 2),
+('正', '正食', '정식', 0),
+('食', '正食', '정식', 1),
+('正', '正體', '정체', 0),
+('體', '正體', '정체', 1),
+('正', '正말', '정말', 0),
+('말', '正말', '정말', 1),
+('此', '此後', '차후', 0),
+('後', '此後', '차후', 1),
+('此', '此邊', '차변', 0),
+('邊', '此邊', '차변', 1),
+('步', '步兵', '보병', 0),
+('兵', '步兵', '보병', 1),
+('步', '步數', '보수', 0),
+('數', '步數', '보수', 1),
+('步', '步行', '보행', 0),
+('行', '步行', '보행', 1),
+('步', '步行者', '보행자', 0),
+('行', '步行者', '보행자', 1),
+('者', '步行者', '보행자', 2),
+('步', '步道', '보도', 0),
+('道', '步道', '보도', 1),
+('武', '武', '무', 0),
+('武', '武人', '무인', 0),
+('人', '武人', '무인', 1),
+('武', '武俠', '무협', 0),
+('俠', '武俠', '무협', 1),
+('武', '武力', '무력', 0),
+('力', '武力', '무력', 1),
+('武', '武勇', '무용', 0),
+('勇', '武勇', '무용', 1),
+('武', '武名', '무명', 0),
+('名', '武名', '무명', 1),
+('武', '武器', '무기', 0),
+('器', '武器', '무기', 1),
+('武', '武器庫', '무기고', 0),
+('器', '武器庫', '무기고', 1),
+('庫', '武器庫', '무기고', 2),
+('武', '武士', '무사', 0),
+('士', '武士', '무사', 1),
+('武', '武士道', '무사도', 0),
+('士', '武士道', '무사도', 1),
+('道', '武士道', '무사도', 2),
+('武', '武定', '무정', 0),
+('定', '武定', '무정', 1),
+('武', '武將', '무장', 0),
+('將', '武將', '무장', 1),
+('武', '武淨', '무정', 0),
+('淨', '武淨', '무정', 1),
+('武', '武漢', '무한', 0),
+('漢', '武漢', '무한', 1),
+('武', '武臣', '무신', 0),
+('臣', '武臣', '무신', 1),
+('武', '武藝', '무예', 0),
+('藝', '武藝', '무예', 1),
+('武', '武術', '무술', 0),
+('術', '武術', '무술', 1),
+('武', '武裝', '무장', 0),
+('裝', '武裝', '무장', 1),
+('武', '武道', '무도', 0),
+('道', '武道', '무도', 1),
+('歪', '歪曲', '왜곡', 0),
+('曲', '歪曲', '왜곡', 1),
+('歲', '歲', '세', 0),
+('歲', '歲拜', '세배', 0),
+('拜', '歲拜', '세배', 1),
+('歲', '歲拜돈', '세뱃돈', 0),
+('拜', '歲拜돈', '세뱃돈', 1),
+('돈', '歲拜돈', '세뱃돈', 2),
+('歲', '歲暮', '세모', 0),
+('暮', '歲暮', '세모', 1),
+('歲', '歲月', '세월', 0),
+('月', '歲月', '세월', 1),
+('歲', '歲月不待人', '세월부대인', 0),
+('月', '歲月不待人', '세월부대인', 1),
+('不', '歲月不待人', '세월부대인', 2),
+('待', '歲月不待人', '세월부대인', 3),
+('人', '歲月不待人', '세월부대인', 4),
+('歷', '歷史', '력사', 0),
+('史', '歷史', '력사', 1),
+('歷', '歷史', '역사', 0),
+('史', '歷史', '역사', 1),
+('歷', '歷史家', '역사가', 0),
+('史', '歷史家', '역사가', 1),
+('家', '歷史家', '역사가', 2),
+('歷', '歷史畫', '역사화', 0),
+('史', '歷史畫', '역사화', 1),
+('畫', '歷史畫', '역사화', 2),
+('歷', '歷史的', '역사적', 0),
+('史', '歷史的', '역사적', 1),
+('的', '歷史的', '역사적', 2),
+('歷', '歷歷', '역력', 0),
+('歷', '歷歷', '역력', 1),
+('歷', '歷程', '력정', 0),
+('程', '歷程', '력정', 1),
+('歷', '歷程', '역정', 0),
+('程', '歷程', '역정', 1),
+('歸', '歸依', '귀의', 0),
+('依', '歸依', '귀의', 1),
+('歸', '歸化', '귀화', 0),
+('化', '歸化', '귀화', 1),
+('歸', '歸國', '귀국', 0),
+('國', '歸國', '귀국', 1),
+('歸', '歸家', '귀가', 0),
+('家', '歸家', '귀가', 1),
+('歸', '歸結', '귀결', 0),
+('結', '歸結', '귀결', 1),
+('歸', '歸責事由', '귀책사유', 0),
+('責', '歸責事由', '귀책사유', 1),
+('事', '歸責事由', '귀책사유', 2),
+('由', '歸責事由', '귀책사유', 3),
+('歸', '歸還', '귀환', 0),
+('還', '歸還', '귀환', 1),
+('歸', '歸還 不能 地點', '귀환 불능 지점', 0),
+('還', '歸還 不能 地點', '귀환 불능 지점', 1),
+('不', '歸還 不能 地點', '귀환 불능 지점', 3),
+('能', '歸還 不能 地點', '귀환 불능 지점', 4),
+('地', '歸還 不能 地點', '귀환 불능 지점', 6),
+('點', '歸還 不能 地點', '귀환 불능 지점', 7),
+('歸', '歸還者', '귀환자', 0),
+('還', '歸還者', '귀환자', 1),
+('者', '歸還者', '귀환자', 2),
+('歸', '歸還飛行', '귀환비행', 0),
+('還', '歸還飛行', '귀환비행', 1),
+('飛', '歸還飛行', '귀환비행', 2),
+('行', '歸還飛行', '귀환비행', 3),
+('歸', '歸順', '귀순', 0),
+('順', '歸順', '귀순', 1),
+('死', '死', '사', 0),
+('死', '死亡', '사망', 0),
+('亡', '死亡', '사망', 1),
+('死', '死亡者', '사망자', 0),
+('亡', '死亡者', '사망자', 1),
+('者', '死亡者', '사망자', 2),
+('死', '死人', '사인', 0),
+('人', '死人', '사인', 1),
+('死', '死刑', '사형', 0),
+('刑', '死刑', '사형', 1),
+('死', '死別', '사별', 0),
+('別', '死別', '사별', 1),
+('死', '死去', '사거', 0),
+('去', '死去', '사거', 1),
+('死', '死因', '사인', 0),
+('因', '死因', '사인', 1),
+('死', '死士', '사사', 0),
+('士', '死士', '사사', 1),
+('死', '死守', '사수', 0),
+('守', '死守', '사수', 1),
+('死', '死後', '사후', 0),
+('後', '死後', '사후', 1),
+('死', '死後世界', '사후세계', 0),
+('後', '死後世界', '사후세계', 1),
+('世', '死後世界', '사후세계', 2),
+('界', '死後世界', '사후세계', 3),
+('死', '死後硬直', '사후경직', 0),
+('後', '死後硬直', '사후경직', 1),
+('硬', '死後硬直', '사후경직', 2),
+('直', '死後硬直', '사후경직', 3),
+('死', '死期', '사기', 0),
+('期', '死期', '사기', 1),
+('死', '死海', '사해', 0),
+('海', '死海', '사해', 1),
+('死', '死滅', '사멸', 0),
+('滅', '死滅', '사멸', 1),
+('死', '死火', '사화', 0),
+('火', '死火', '사화', 1),
+('死', '死火山', '사화산', 0),
+('火', '死火山', '사화산', 1),
+('山', '死火山', '사화산', 2),
+('死', '死球', '사구', 0),
+('球', '死球', '사구', 1),
+('死', '死生', '사생', 0),
+('生', '死生', '사생', 1),
+('死', '死産', '사산', 0),
+('産', '死産', '사산', 1),
+('死', '死白魚', '사백어', 0),
+('白', '死白魚', '사백어', 1),
+('魚', '死白魚', '사백어', 2),
+('死', '死石', '사석', 0),
+('石', '死石', '사석', 1),
+('死', '死神', '사신', 0),
+('神', '死神', '사신', 1),
+('死', '死罪', '사죄', 0),
+('罪', '死罪', '사죄', 1),
+('死', '死藏', '사장', 0),
+('藏', '死藏', '사장', 1),
+('死', '死角地帶', '사각지대', 0),
+('角', '死角地帶', '사각지대', 1),
+('地', '死角地帶', '사각지대', 2),
+('帶', '死角地帶', '사각지대', 3),
+('死', '死貨', '사화', 0),
+('貨', '死貨', '사화', 1),
+('死', '死體', '사체', 0),
+('體', '死體', '사체', 1),
+('歿', '歿', '몰', 0),
+('殉', '殉敎', '순교', 0),
+('敎', '殉敎', '순교', 1),
+('殉', '殉敎者', '순교자', 0),
+('敎', '殉敎者', '순교자', 1),
+('者', '殉敎者', '순교자', 2),
+('殉', '殉教', '순교', 0),
+('教', '殉教', '순교', 1),
+('殉', '殉職', '순직', 0),
+('職', '殉職', '순직', 1),
+('殉', '殉難', '순난', 0),
+('難', '殉難', '순난', 1),
+('殖', '殖民', '식민', 0),
+('民', '殖民', '식민', 1),
+('殘', '殘像', '잔상', 0),
+('像', '殘像', '잔상', 1),
+('殘', '殘壘', '잔루', 0),
+('壘', '殘壘', '잔루', 1),
+('殘', '殘存', '잔존', 0),
+('存', '殘存', '잔존', 1),
+('殘', '殘忍', '잔인', 0),
+('忍', '殘忍', '잔인', 1),
+('殘', '殘月', '잔월', 0),
+('月', '殘月', '잔월', 1),
+('殘', '殘滓', '잔재', 0),
+('滓', '殘滓', '잔재', 1),
+('殘', '殘留', '잔류', 0),
+('留', '殘留', '잔류', 1),
+('殘', '殘虐', '잔학', 0),
+('虐', '殘虐', '잔학', 1),
+('殘', '殘酷', '잔혹', 0),
+('酷', '殘酷', '잔혹', 1),
+('殘', '殘額', '잔액', 0),
+('額', '殘額', '잔액', 1),
+('殘', '殘餘', '잔여', 0),
+('餘', '殘餘', '잔여', 1),
+('殘', '殘骸', '잔해', 0),
+('骸', '殘骸', '잔해', 1),
+('殭', '殭屍', '강시', 0),
+('屍', '殭屍', '강시', 1),
+('殲', '殲滅', '섬멸', 0),
+('滅', '殲滅', '섬멸', 1),
+('段', '段', '단', 0),
+('段', '段落', '단락', 0),
+('落', '段落', '단락', 1),
+('段', '段階', '단계', 0),
+('階', '段階', '단계', 1),
+('殷', '殷殷', '은은', 0),
+('殷', '殷殷', '은은', 1),
+('殺', '殺人', '살인', 0),
+('人', '殺人', '살인', 1),
+('殺', '殺人者', '살인자', 0),
+('人', '殺人者', '살인자', 1),
+('者', '殺人者', '살인자', 2),
+('殺', '殺到', '쇄도', 0),
+('到', '殺到', '쇄도', 1),
+('殺', '殺害', '살해', 0),
+('害', '殺害', '살해', 1),
+('殺', '殺戮', '살육', 0),
+('戮', '殺戮', '살육', 1),
+('殺', '殺母蛇', '살모사', 0),
+('母', '殺母蛇', '살모사', 1),
+('蛇', '殺母蛇', '살모사', 2),
+('殺', '殺菌', '살균', 0),
+('菌', '殺菌', '살균', 1),
+('殺', '殺藻劑', '살조제', 0),
+('藻', '殺藻劑', '살조제', 1),
+('劑', '殺藻劑', '살조제', 2),
+('殺', '殺處分', '살처분', 0),
+('處', '殺處分', '살처분', 1),
+('分', '殺處分', '살처분', 2),
+('殺', '殺風景', '살풍경', 0),
+('風', '殺風景', '살풍경', 1),
+('景', '殺風景', '살풍경', 2),
+('殿', '殿下', '전하', 0),
+('下', '殿下', '전하', 1),
+('毁', '毁損', '훼손', 0),
+('損', '毁損', '훼손', 1),
+('毁', '毁謗', '훼방', 0),
+('謗', '毁謗', '훼방', 1),
+('毆', '毆打', '구타', 0),
+('打', '毆打', '구타', 1),
+('母', '母國', '모국', 0),
+('國', '母國', '모국', 1),
+('母', '母國語', '모국어', 0),
+('國', '母國語', '모국어', 1),
+('語', '母國語', '모국어', 2),
+('母', '母女', '모녀', 0),
+('女', '母女', '모녀', 1),
+('母', '母子', '모자', 0),
+('子', '母子', '모자', 1),
+('母', '母斑', '모반', 0),
+('斑', '母斑', '모반', 1),
+('母', '母校', '모교', 0),
+('校', '母校', '모교', 1),
+('母', '母權', '모권', 0),
+('權', '母權', '모권', 1),
+('母', '母權制', '모권제', 0),
+('權', '母權制', '모권제', 1),
+('制', '母權制', '모권제', 2),
+('母', '母胎', '모태', 0),
+('胎', '母胎', '모태', 1),
+('母', '母艦', '모함', 0),
+('艦', '母艦', '모함', 1),
+('母', '母親', '모친', 0),
+('親', '母親', '모친', 1),
+('母', '母語', '모어', 0),
+('語', '母語', '모어', 1),
+('母', '母音', '모음', 0),
+('音', '母音', '모음', 1),
+('母', '母音調和', '모음조화', 0),
+('音', '母音調和', '모음조화', 1),
+('調', '母音調和', '모음조화', 2),
+('和', '母音調和', '모음조화', 3),
+('母', '母體', '모체', 0),
+('體', '母體', '모체', 1),
+('每', '每', '매', 0),
+('每', '每-', '매달', 0),
+('-', '每-', '매달', 1),
+('每', '每年', '매년', 0),
+('年', '每年', '매년', 1),
+('每', '每日', '매일', 0),
+('日', '每日', '매일', 1),
+('每', '每月', '매월', 0),
+('月', '每月', '매월', 1),
+('每', '每番', '매번', 0),
+('番', '每番', '매번', 1),
+('每', '每週', '매주', 0),
+('週', '每週', '매주', 1),
+('毒', '毒', '독', 0),
+('毒', '毒劇物', '독극물', 0),
+('劇', '毒劇物', '독극물', 1),
+('物', '毒劇物', '독극물', 2),
+('毒', '毒害', '독해', 0),
+('害', '毒害', '독해', 1),
+('毒', '毒性', '독성', 0),
+('性', '毒性', '독성', 1),
+('毒', '毒感', '독감', 0),
+('感', '毒感', '독감', 1),
+('毒', '毒死', '독사', 0),
+('死', '毒死', '독사', 1),
+('毒', '毒殺', '독살', 0),
+('殺', '毒殺', '독살', 1),
+('毒', '毒液', '독액', 0),
+('液', '毒液', '독액', 1),
+('毒', '毒物', '독물', 0),
+('物', '毒物', '독물', 1),
+('毒', '毒素', '독소', 0),
+('素', '毒素', '독소', 1),
+('毒', '毒舌', '독설', 0),
+('舌', '毒舌', '독설', 1),
+('毒', '毒藥', '독약', 0),
+('藥', '毒藥', '독약', 1),
+('毒', '毒蛇', '독사', 0),
+('蛇', '毒蛇', '독사', 1),
+('毒', '毒蟲', '독충', 0),
+('蟲', '毒蟲', '독충', 1),
+('比', '比', '비', 0),
+('比', '比丘', '비구', 0),
+('丘', '比丘', '비구', 1),
+('比', '比丘尼', '비구니', 0),
+('丘', '比丘尼', '비구니', 1),
+('尼', '比丘尼', '비구니', 2),
+('比', '比來', '비래', 0),
+('來', '比來', '비래', 1),
+('比', '比例', '비례', 0),
+('例', '比例', '비례', 1),
+('比', '比喩', '비유', 0),
+('喩', '比喩', '비유', 1),
+('比', '比喩的', '비유적', 0),
+('喩', '比喩的', '비유적', 1),
+('的', '比喩的', '비유적', 2),
+('比', '比熱', '비열', 0),
+('熱', '比熱', '비열', 1),
+('比', '比率', '비율', 0),
+('率', '比率', '비율', 1),
+('比', '比較', '비교', 0),
+('較', '比較', '비교', 1),
+('比', '比較的', '비교적', 0),
+('較', '比較的', '비교적', 1),
+('的', '比較的', '비교적', 2),
+('比', '比較級', '비교급', 0),
+('較', '比較級', '비교급', 1),
+('級', '比較級', '비교급', 2),
+('比', '比重', '비중', 0),
+('重', '比重', '비중', 1),
+('比', '比率', '비율', 0),
+('率', '比率', '비율', 1),
+('毛', '毛皮', '모피', 0),
+('皮', '毛皮', '모피', 1),
+('毛', '毛細管', '모세관', 0),
+('細', '毛細管', '모세관', 1),
+('管', '毛細管', '모세관', 2),
+('毛', '毛細血管', '모세혈관', 0),
+('細', '毛細血管', '모세혈관', 1),
+('血', '毛細血管', '모세혈관', 2),
+('管', '毛細血管', '모세혈관', 3),
+('毛', '毛織', '모직', 0),
+('織', '毛織', '모직', 1),
+('毛', '毛蟲', '모충', 0),
+('蟲', '毛蟲', '모충', 1),
+('毬', '毬果', '구과', 0),
+('果', '毬果', '구과', 1),
+('氏', '氏', '씨', 0),
+('氏', '氏族', '씨족', 0),
+('族', '氏族', '씨족', 1),
+('民', '民', '민', 0),
+('民', '民主', '민주', 0),
+('主', '民主', '민주', 1),
+('民', '民主主義', '민주주의', 0),
+('主', '民主主義', '민주주의', 1),
+('主', '民主主義', '민주주의', 2),
+('義', '民主主義', '민주주의', 3),
+('民', '民主主義者', '민주주의자', 0),
+('主', '民主主義者', '민주주의자', 1),
+('主', '民主主義者', '민주주의자', 2),
+('義', '民主主義者', '민주주의자', 3),
+('者', '民主主義者', '민주주의자', 4),
+('民', '民主化', '민주화', 0),
+('主', '民主化', '민주화', 1),
+('化', '民主化', '민주화', 2),
+('民', '民主的', '민주적', 0),
+('主', '民主的', '민주적', 1),
+('的', '民主的', '민주적', 2),
+('民', '民主社會主義', '민주사회주의', 0),
+('主', '民主社會主義', '민주사회주의', 1),
+('社', '民主社會主義', '민주사회주의', 2),
+('會', '民主社會主義', '민주사회주의', 3),
+('主', '民主社會主義', '민주사회주의', 4),
+('義', '民主社會主義', '민주사회주의', 5),
+('民', '民主黨', '민주당', 0),
+('主', '民主黨', '민주당', 1),
+('黨', '民主黨', '민주당', 2),
+('民', '民主黨人', '민주당원', 0),
+('主', '民主黨人', '민주당원', 1),
+('黨', '民主黨人', '민주당원', 2),
+('人', '民主黨人', '민주당원', 3),
+('民', '民事', '민사', 0),
+('事', '民事', '민사', 1),
+('民', '民俗', '민속', 0),
+('俗', '民俗', '민속', 1),
+('民', '民俗音樂', '민속음악', 0),
+('俗', '民俗音樂', '민속음악', 1),
+('音', '民俗音樂', '민속음악', 2),
+('樂', '民俗音樂', '민속음악', 3),
+('民', '民兵', '민병', 0),
+('兵', '民兵', '민병', 1),
+('民', '民兵隊', '민병대', 0),
+('兵', '民兵隊', '민병대', 1),
+('隊', '民兵隊', '민병대', 2),
+('民', '民國', '민국', 0),
+('國', '民國', '민국', 1),
+('民', '民家', '민가', 0),
+('家', '民家', '민가', 1),
+('民', '民弊', '민폐', 0),
+('弊', '民弊', '민폐', 1),
+('民', '民志', '민지', 0),
+('志', '民志', '민지', 1),
+('民', '民意', '민의', 0),
+('意', '民意', '민의', 1),
+('民', '民政', '민정', 0),
+('政', '民政', '민정', 1),
+('民', '民數記', '민수기', 0),
+('數', '民數記', '민수기', 1),
+('記', '民數記', '민수기', 2),
+('民', '民族', '민족', 0),
+('族', '民族', '민족', 1),
+('民', '民族主義', '민족주의', 0),
+('族', '民族主義', '민족주의', 1),
+('主', '民族主義', '민족주의', 2),
+('義', '民族主義', '민족주의', 3),
+('民', '民族學', '민족학', 0),
+('族', '民族學', '민족학', 1),
+('學', '民族學', '민족학', 2),
+('民', '民族社會主義', '민족사회주의', 0),
+('族', '民族社會主義', '민족사회주의', 1),
+('社', '民族社會主義', '민족사회주의', 2),
+('會', '民族社會主義', '민족사회주의', 3),
+('主', '民族社會主義', '민족사회주의', 4),
+('義', '民族社會主義', '민족사회주의', 5),
+('民', '民智', '민지', 0),
+('智', '民智', '민지', 1),
+('民', '民望', '민망', 0),
+('望', '民望', '민망', 1),
+('民', '民權', '민권', 0),
+('權', '民權', '민권', 1),
+('民', '民泊', '민박', 0),
+('泊', '民泊', '민박', 1),
+('民', '民法', '민법', 0),
+('法', '民法', '민법', 1),
+('民', '民法典', '민법전', 0),
+('法', '民法典', '민법전', 1),
+('典', '民法典', '민법전', 2),
+('民', '民營', '민영', 0),
+('營', '民營', '민영', 1),
+('民', '民營化', '민영화', 0),
+('營', '民營化', '민영화', 1),
+('化', '民營化', '민영화', 2),
+('民', '民生', '민생', 0),
+('生', '民生', '민생', 1),
+('民', '民衆', '민중', 0),
+('衆', '民衆', '민중', 1),
+('民', '民話', '민화', 0),
+('話', '民話', '민화', 1),
+('民', '民謠', '민요', 0),
+('謠', '民謠', '민요', 1),
+('民', '民間', '민간', 0),
+('間', '民間', '민간', 1),
+('民', '民間人', '민간인', 0),
+('間', '民間人', '민간인', 1),
+('人', '民間人', '민간인', 2),
+('民', '民願', '민원', 0),
+('願', '民願', '민원', 1),
+('民', '民魚', '민어', 0),
+('魚', '民魚', '민어', 1),
+('氣', '氣', '기', 0),
+('氣', '氣-', '기막', 0),
+('-', '氣-', '기막', 1),
+('氣', '氣候', '기후', 0),
+('候', '氣候', '기후', 1),
+('氣', '氣候學', '기후학', 0),
+('候', '氣候學', '기후학', 1),
+('學', '氣候學', '기후학', 2),
+('氣', '氣像', '기상', 0),
+('像', '氣像', '기상', 1),
+('氣', '氣分', '기분', 0),
+('分', '氣分', '기분', 1),
+('氣', '氣力', '기력', 0),
+('力', '氣力', '기력', 1),
+('氣', '氣功', '기공', 0),
+('功', '氣功', '기공', 1),
+('氣', '氣化', '기화', 0),
+('化', '氣化', '기화', 1),
+('氣', '氣合', '기합', 0),
+('合', '氣合', '기합', 1),
+('氣', '氣味尙宮', '기미상궁', 0),
+('味', '氣味尙宮', '기미상궁', 1),
+('尙', '氣味尙宮', '기미상궁', 2),
+('宮', '氣味尙宮', '기미상궁', 3),
+('氣', '氣品', '기품', 0),
+('品', '氣品', '기품', 1),
+('氣', '氣壓', '기압', 0),
+('壓', '氣壓', '기압', 1),
+('氣', '氣孔', '기공', 0),
+('孔', '氣孔', '기공', 1),
+('氣', '氣槪', '기개', 0),
+('槪', '氣槪', '기개', 1),
+('氣', '氣流', '기류', 0),
+('流', '氣流', '기류', 1),
+('氣', '氣溫', '기온', 0),
+('溫', '氣溫', '기온', 1),
+('氣', '氣焰', '기염', 0),
+('焰', '氣焰', '기염', 1),
+('氣', '氣球', '기구', 0),
+('球', '氣球', '기구', 1),
+('氣', '氣管', '기관', 0),
+('管', '氣管', '기관', 1),
+('氣', '氣管支炎', '기관지염', 0),
+('管', '氣管支炎', '기관지염', 1),
+('支', '氣管支炎', '기관지염', 2),
+('炎', '氣管支炎', '기관지염', 3),
+('氣', '氣絶', '기절', 0),
+('絶', '氣絶', '기절', 1),
+('氣', '氣胞', '기포', 0),
+('胞', '氣胞', '기포', 1),
+('氣', '氣色', '기색', 0),
+('色', '氣色', '기색', 1),
+('氣', '氣象', '기상', 0),
+('象', '氣象', '기상', 1),
+('氣', '氣象學', '기상학', 0),
+('象', '氣象學', '기상학', 1),
+('學', '氣象學', '기상학', 2),
+('氣', '氣象學者', '기상학자', 0),
+('象', '氣象學者', '기상학자', 1),
+('學', '氣象學者', '기상학자', 2),
+('者', '氣象學者', '기상학자', 3),
+('氣', '氣質', '기질', 0),
+('質', '氣質', '기질', 1),
+('氣', '氣道', '기도', 0),
+('道', '氣道', '기도', 1),
+('氣', '氣陷', '기함', 0),
+('陷', '氣陷', '기함', 1),
+('氣', '氣風', '기풍', 0),
+('風', '氣風', '기풍', 1),
+('氣', '氣骨', '기골', 0),
+('骨', '氣骨', '기골', 1),
+('氣', '氣體', '기체', 0),
+('體', '氣體', '기체', 1),
+('氣', '氣가 ', '기가 ', 0),
+('가', '氣가 ', '기가 ', 1),
+('水', '水', '수', 0),
+('水', '水上', '수상', 0),
+('上', '水上', '수상', 1),
+('水', '水位', '수위', 0),
+('位', '水位', '수위', 1),
+('水', '水兵', '수병', 0),
+('兵', '水兵', '수병', 1),
+('水', '水冷', '수랭', 0),
+('冷', '水冷', '수랭', 1),
+('水', '水分', '수분', 0),
+('分', '水分', '수분', 1),
+('水', '水剌', '수라', 0),
+('剌', '水剌', '수라', 1),
+('水', '水剌間', '수라간', 0),
+('剌', '水剌間', '수라간', 1),
+('間', '水剌間', '수라간', 2),
+('水', '水力', '수력', 0),
+('力', '水力', '수력', 1),
+('水', '水卵', '수란', 0),
+('卵', '水卵', '수란', 1),
+('水', '水原', '수원', 0),
+('原', '水原', '수원', 1),
+('水', '水圈', '수권', 0),
+('圈', '水圈', '수권', 1),
+('水', '水塘', '수당', 0),
+('塘', '水塘', '수당', 1),
+('水', '水墨畫', '수묵화', 0),
+('墨', '水墨畫', '수묵화', 1),
+('畫', '水墨畫', '수묵화', 2),
+('水', '水夫', '수부', 0),
+('夫', '水夫', '수부', 1),
+('水', '水平', '수평', 0),
+('平', '水平', '수평', 1),
+('水', '水平線', '수평선', 0),
+('平', '水平線', '수평선', 1),
+('線', '水平線', '수평선', 2),
+('水', '水彩', '수채', 0),
+('彩', '水彩', '수채', 1),
+('水', '水戰', '수전', 0),
+('戰', '水戰', '수전', 1),
+('水', '水文', '수문', 0),
+('文', '水文', '수문', 1),
+('水', '水文學', '수문학', 0),
+('文', '水文學', '수문학', 1),
+('學', '水文學', '수문학', 2),
+('水', '水族館', '수족관', 0),
+('族', '水族館', '수족관', 1),
+('館', '水族館', '수족관', 2),
+('水', '水晶', '수정', 0),
+('晶', '水晶', '수정', 1),
+('水', '水晶體', '수정체', 0),
+('晶', '水晶體', '수정체', 1),
+('體', '水晶體', '수정체', 2),
+('水', '水曜日', '수요일', 0),
+('曜', '水曜日', '수요일', 1),
+('日', '水曜日', '수요일', 2),
+('水', '水栓', '수전', 0),
+('栓', '水栓', '수전', 1),
+('水', '水桶', '수통', 0),
+('桶', '水桶', '수통', 1),
+('水', '水棲', '수서', 0),
+('棲', '水棲', '수서', 1),
+('水', '水槽', '수조', 0),
+('槽', '水槽', '수조', 1),
+('水', '水死', '수사', 0),
+('死', '水死', '수사', 1),
+('水', '水母', '수모', 0),
+('母', '水母', '수모', 1),
+('水', '水泡', '수포', 0),
+('泡', '水泡', '수포', 1),
+('水', '水泳', '수영', 0),
+('泳', '水泳', '수영', 1),
+('水', '水泳場', '수영장', 0),
+('泳', '水泳場', '수영장', 1),
+('場', '水泳場', '수영장', 2),
+('水', '水泳服', '수영복', 0),
+('泳', '水泳服', '수영복', 1),
+('服', '水泳服', '수영복', 2),
+('水', '水源', '수원', 0),
+('源', '水源', '수원', 1),
+('水', '水準', '수준', 0),
+('準', '水準', '수준', 1),
+('水', '水準器', '수준기', 0),
+('準', '水準器', '수준기', 1),
+('器', '水準器', '수준기', 2),
+('水', '水溫', '수온', 0),
+('溫', '水溫', '수온', 1),
+('水', '水烝氣', '수증기', 0),
+('烝', '水烝氣', '수증기', 1),
+('氣', '水烝氣', '수증기', 2),
+('水', '水煙筒', '수연통', 0),
+('煙', '水煙筒', '수연통', 1),
+('筒', '水煙筒', '수연통', 2),
+('水', '水獺', '수달', 0),
+('獺', '水獺', '수달', 1),
+('水', '水球', '수구', 0),
+('球', '水球', '수구', 1),
+('水', '水産', '수산', 0),
+('産', '水産', '수산', 1),
+('水', '水田', '수전', 0),
+('田', '水田', '수전', 1),
+('水', '水痘', '수두', 0),
+('痘', '水痘', '수두', 1),
+('水', '水石', '수석', 0),
+('石', '水石', '수석', 1),
+('水', '水稻', '수도', 0),
+('稻', '水稻', '수도', 1),
+('水', '水素', '수소', 0),
+('素', '水素', '수소', 1),
+('水', '水素彈', '수소탄', 0),
+('素', '水素彈', '수소탄', 1),
+('彈', '水素彈', '수소탄', 2),
+('水', '水素爆彈', '수소폭탄', 0),
+('素', '水素爆彈', '수소폭탄', 1),
+('爆', '水素爆彈', '수소폭탄', 2),
+('彈', '水素爆彈', '수소폭탄', 3),
+('水', '水腫', '수종', 0),
+('腫', '水腫', '수종', 1),
+('水', '水葬', '수장', 0),
+('葬', '水葬', '수장', 1),
+('水', '水蒸氣', '수증기', 0),
+('蒸', '水蒸氣', '수증기', 1),
+('氣', '水蒸氣', '수증기', 2),
+('水', '水藥', '수약', 0),
+('藥', '水藥', '수약', 1),
+('水', '水血症', '수혈증', 0),
+('血', '水血症', '수혈증', 1),
+('症', '水血症', '수혈증', 2),
+('水', '水豆腐', '수두부', 0),
+('豆', '水豆腐', '수두부', 1),
+('腐', '水豆腐', '수두부', 2),
+('水', '水質', '수질', 0),
+('質', '水質', '수질', 1),
+('水', '水路', '수로', 0),
+('路', '水路', '수로', 1),
+('水', '水道', '수도', 0),
+('道', '水道', '수도', 1),
+('水', '水道-', '수돗물', 0),
+('道', '水道-', '수돗물', 1),
+('-', '水道-', '수돗물', 2),
+('水', '水道--', '수도꼭지', 0),
+('道', '水道--', '수도꼭지', 1),
+('-', '水道--', '수도꼭지', 2),
+('-', '水道--', '수도꼭지', 3),
+('水', '水都', '수도', 0),
+('都', '水都', '수도', 1),
+('水', '水酸基', '수산기', 0),
+('酸', '水酸基', '수산기', 1),
+('基', '水酸基', '수산기', 2),
+('水', '水銀', '수은', 0),
+('銀', '水銀', '수은', 1),
+('水', '水門', '수문', 0),
+('門', '水門', '수문', 1),
+('水', '水電', '수전', 0),
+('電', '水電', '수전', 1),
+('水', '水靑木', '수청목', 0),
+('靑', '水靑木', '수청목', 1),
+('木', '水靑木', '수청목', 2),
+('水', '水面', '수면', 0),
+('面', '水面', '수면', 1),
+('氷', '氷上舞踊', '빙상무용', 0),
+('上', '氷上舞踊', '빙상무용', 1),
+('舞', '氷上舞踊', '빙상무용', 2),
+('踊', '氷上舞踊', '빙상무용', 3),
+('氷', '氷堆石', '빙퇴석', 0),
+('堆', '氷堆石', '빙퇴석', 1),
+('石', '氷堆石', '빙퇴석', 2),
+('氷', '氷山', '빙산', 0),
+('山', '氷山', '빙산', 1),
+('氷', '氷晶', '빙정', 0),
+('晶', '氷晶', '빙정', 1),
+('氷', '氷水', '빙수', 0),
+('水', '氷水', '빙수', 1),
+('氷', '氷河', '빙하', 0),
+('河', '氷河', '빙하', 1),
+('氷', '氷漁', '빙어', 0),
+('漁', '氷漁', '빙어', 1),
+('氷', '氷結', '빙결', 0),
+('結', '氷結', '빙결', 1),
+('氷', '氷菓', '빙과', 0),
+('菓', '氷菓', '빙과', 1),
+('氷', '氷醋酸', '빙초산', 0),
+('醋', '氷醋酸', '빙초산', 1),
+('酸', '氷醋酸', '빙초산', 2),
+('氷', '氷點', '빙점', 0),
+('點', '氷點', '빙점', 1),
+('永', '永久', '영구', 0),
+('久', '永久', '영구', 1),
+('永', '永久性', '영구성', 0),
+('久', '永久性', '영구성', 1),
+('性', '永久性', '영구성', 2),
+('永', '永住', '영주', 0),
+('住', '永住', '영주', 1),
+('永', '永字八法', '영자팔법', 0),
+('字', '永字八法', '영자팔법', 1),
+('八', '永字八法', '영자팔법', 2),
+('法', '永字八法', '영자팔법', 3),
+('永', '永存', '영존', 0),
+('存', '永存', '영존', 1),
+('永', '永生', '영생', 0),
+('生', '永生', '영생', 1),
+('永', '永眠', '영면', 0),
+('眠', '永眠', '영면', 1),
+('永', '永續', '영속', 0),
+('續', '永續', '영속', 1),
+('永', '永續性', '영속성', 0),
+('續', '永續性', '영속성', 1),
+('性', '永續性', '영속성', 2),
+('永', '永逝', '영서', 0),
+('逝', '永逝', '영서', 1),
+('永', '永遠', '영원', 0),
+('遠', '永遠', '영원', 1),
+('永', '永遠性', '영원성', 0),
+('遠', '永遠性', '영원성', 1),
+('性', '永遠性', '영원성', 2),
+('氾', '氾濫', '범람', 0),
+('濫', '氾濫', '범람', 1),
+('汁', '汁', '즙', 0),
+('求', '求', '구', 0),
+('求', '求人', '구인', 0),
+('人', '求人', '구인', 1),
+('求', '求婚', '구혼', 0),
+('婚', '求婚', '구혼', 1),
+('求', '求愛', '구애', 0),
+('愛', '求愛', '구애', 1),
+('求', '求愛者', '구애자', 0),
+('愛', '求愛者', '구애자', 1),
+('者', '求愛者', '구애자', 2),
+('求', '求積', '구적', 0),
+('積', '求積', '구적', 1),
+('汎', '汎化', '범화', 0),
+('化', '汎化', '범화', 1),
+('汎', '汎在神論', '범재신론', 0),
+('在', '汎在神論', '범재신론', 1),
+('神', '汎在神論', '범재신론', 2),
+('論', '汎在神論', '범재신론', 3),
+('汎', '汎心論', '범심론', 0),
+('心', '汎心論', '범심론', 1),
+('論', '汎心論', '범심론', 2),
+('汎', '汎流行', '범유행', 0),
+('流', '汎流行', '범유행', 1),
+('行', '汎流行', '범유행', 2),
+('汎', '汎濫', '범람', 0),
+('濫', '汎濫', '범람', 1),
+('汎', '汎理神論', '범이신론', 0),
+('理', '汎理神論', '범이신론', 1),
+('神', '汎理神論', '범이신론', 2),
+('論', '汎理神論', '범이신론', 3),
+('汎', '汎神論', '범신론', 0),
+('神', '汎神論', '범신론', 1),
+('論', '汎神論', '범신론', 2),
+('汗', '汗腺', '한선', 0),
+('腺', '汗腺', '한선', 1),
+('汚', '汚名', '오명', 0),
+('名', '汚名', '오명', 1),
+('汚', '汚染', '오염', 0),
+('染', '汚染', '오염', 1),
+('汚', '汚水', '오수', 0),
+('水', '汚水', '오수', 1),
+('汚', '汚物', '오물', 0),
+('物', '汚物', '오물', 1),
+('汚', '汚辱', '오욕', 0),
+('辱', '汚辱', '오욕', 1),
+('汚', '汚點', '오점', 0),
+('點', '汚點', '오점', 1),
+('江', '江', '강', 0),
+('江', '江', '갱', 0),
+('江', '江-', '강물', 0),
+('-', '江-', '강물', 1),
+('江', '江北', '강북', 0),
+('北', '江北', '강북', 1),
+('江', '江南', '강남', 0),
+('南', '江南', '강남', 1),
+('江', '江南天子國', '강남천자국', 0),
+('南', '江南天子國', '강남천자국', 1),
+('天', '江南天子國', '강남천자국', 2),
+('子', '江南天子國', '강남천자국', 3),
+('國', '江南天子國', '강남천자국', 4),
+('江', '江南左派', '강남좌파', 0),
+('南', '江南左派', '강남좌파', 1),
+('左', '江南左派', '강남좌파', 2),
+('派', '江南左派', '강남좌파', 3),
+('江', '江原 方言', '강원 방언', 0),
+('原', '江原 方言', '강원 방언', 1),
+('方', '江原 方言', '강원 방언', 3),
+('言', '江原 方言', '강원 방언', 4),
+('江', '江原道', '강원도', 0),
+('原', '江原道', '강원도', 1),
+('道', '江原道', '강원도', 2),
+('江', '江原道 砲手', '강원도 포수', 0),
+('原', '江原道 砲手', '강원도 포수', 1),
+('道', '江原道 砲手', '강원도 포수', 2),
+('砲', '江原道 砲手', '강원도 포수', 4),
+('手', '江原道 砲手', '강원도 포수', 5),
+('江', '江山', '강산', 0),
+('山', '江山', '강산', 1),
+('江', '江界', '강계', 0),
+('界', '江界', '강계', 1),
+('江', '江華島', '강화도', 0),
+('華', '江華島', '강화도', 1),
+('島', '江華島', '강화도', 2),
+('江', '江蘇', '강소', 0),
+('蘇', '江蘇', '강소', 1),
+('江', '江西', '강서', 0),
+('西', '江西', '강서', 1),
+('江', '江邊', '강변', 0),
+('邊', '江邊', '강변', 1),
+('江', '江가', '강가', 0),
+('가', '江가', '강가', 1),
+('汲', '汲汲', '급급', 0),
+('汲', '汲汲', '급급', 1),
+('決', '決-', '결코', 0),
+('-', '決-', '결코', 1),
+('決', '決勝', '결승', 0),
+('勝', '決勝', '결승', 1),
+('決', '決定', '결정', 0),
+('定', '決定', '결정', 1),
+('決', '決定論', '결정론', 0),
+('定', '決定論', '결정론', 1),
+('論', '決定論', '결정론', 2),
+('決', '決心', '결심', 0),
+('心', '決心', '결심', 1),
+('決', '決意', '결의', 0),
+('意', '決意', '결의', 1),
+('決', '決斷', '결단', 0),
+('斷', '決斷', '결단', 1),
+('決', '決死擁衛', '결사옹위', 0),
+('死', '決死擁衛', '결사옹위', 1),
+('擁', '決死擁衛', '결사옹위', 2),
+('衛', '決死擁衛', '결사옹위', 3),
+('決', '決然', '결연', 0),
+('然', '決然', '결연', 1),
+('決', '決裂', '결렬', 0),
+('裂', '決裂', '결렬', 1),
+('決', '決議', '결의', 0),
+('議', '決議', '결의', 1),
+('決', '決鬪', '결투', 0),
+('鬪', '決鬪', '결투', 1),
+('汽', '汽化器', '기화기', 0),
+('化', '汽化器', '기화기', 1),
+('器', '汽化器', '기화기', 2),
+('汽', '汽笛', '기적', 0),
+('笛', '汽笛', '기적', 1),
+('汽', '汽船', '기선', 0),
+('船', '汽船', '기선', 1),
+('汽', '汽艇', '기정', 0),
+('艇', '汽艇', '기정', 1),
+('汽', '汽車', '기차', 0),
+('車', '汽車', '기차', 1),
+('汽', '汽車驛', '기차역', 0),
+('車', '汽車驛', '기차역', 1),
+('驛', '汽車驛', '기차역', 2),
+('沃', '沃土', '옥토', 0),
+('土', '沃土', '옥토', 1),
+('沈', '沈沒', '침몰', 0),
+('沒', '沈沒', '침몰', 1),
+('沈', '沈滯', '침체', 0),
+('滯', '沈滯', '침체', 1),
+('沈', '沈澱', '침전', 0),
+('澱', '沈澱', '침전', 1),
+('沈', '沈着', '침착', 0),
+('着', '沈着', '침착', 1),
+('沈', '沈香', '침향', 0),
+('香', '沈香', '침향', 1),
+('沈', '沈鬱', '침울', 0),
+('鬱', '沈鬱', '침울', 1),
+('沈', '沈默', '침묵', 0),
+('默', '沈默', '침묵', 1),
+('沐', '沐浴', '목욕', 0),
+('浴', '沐浴', '목욕', 1),
+('沐', '沐浴室', '목욕실', 0),
+('浴', '沐浴室', '목욕실', 1),
+('室', '沐浴室', '목욕실', 2),
+('沐', '沐浴桶', '목욕통', 0),
+('浴', '沐浴桶', '목욕통', 1),
+('桶', '沐浴桶', '목욕통', 2),
+('沐', '沐浴湯', '목욕탕', 0),
+('浴', '沐浴湯', '목욕탕', 1),
+('湯', '沐浴湯', '목욕탕', 2),
+('沒', '沒常識', '몰상식', 0),
+('常', '沒常識', '몰상식', 1),
+('識', '沒常識', '몰상식', 2),
+('沒', '沒收', '몰수', 0),
+('收', '沒收', '몰수', 1),
+('沒', '沒落', '몰락', 0),
+('落', '沒落', '몰락', 1),
+('沒', '沒藥', '몰약', 0),
+('藥', '沒藥', '몰약', 1),
+('沒', '沒食子', '몰식자', 0),
+('食', '沒食子', '몰식자', 1),
+('子', '沒食子', '몰식자', 2),
+('沙', '沙下', '사하', 0),
+('下', '沙下', '사하', 1),
+('沙', '沙丘', '사구', 0),
+('丘', '沙丘', '사구', 1),
+('沙', '沙器', '사기', 0),
+('器', '沙器', '사기', 1),
+('沙', '沙場', '사장', 0),
+('場', '沙場', '사장', 1),
+('沙', '沙巖', '사암', 0),
+('巖', '沙巖', '사암', 1),
+('沙', '沙布', '사포', 0),
+('布', '沙布', '사포', 1),
+('沙', '沙彌', '사미', 0),
+('彌', '沙彌', '사미', 1),
+('沙', '沙時計', '사시계', 0),
+('時', '沙時計', '사시계', 1),
+('計', '沙時計', '사시계', 2),
+('沙', '沙果', '사과', 0),
+('果', '沙果', '사과', 1),
+('沙', '沙果酒', '사과주', 0),
+('果', '沙果酒', '사과주', 1),
+('酒', '沙果酒', '사과주', 2),
+('沙', '沙漏', '사루', 0),
+('漏', '沙漏', '사루', 1),
+('沙', '沙漠', '사막', 0),
+('漠', '沙漠', '사막', 1),
+('沙', '沙漠化', '사막화', 0),
+('漠', '沙漠化', '사막화', 1),
+('化', '沙漠化', '사막화', 2),
+('沙', '沙疥', '사개', 0),
+('疥', '沙疥', '사개', 1),
+('沙', '沙糖', '사탕', 0),
+('糖', '沙糖', '사탕', 1),
+('沙', '沙里院', '사리원', 0),
+('里', '沙里院', '사리원', 1),
+('院', '沙里院', '사리원', 2),
+('沙', '沙鉢', '사발', 0),
+('鉢', '沙鉢', '사발', 1),
+('沙', '沙錫', '사석', 0),
+('錫', '沙錫', '사석', 1),
+('沙', '沙魚', '사어', 0),
+('魚', '沙魚', '사어', 1),
+('沮', '沮害', '저해', 0),
+('害', '沮害', '저해', 1),
+('沮', '沮止', '저지', 0),
+('止', '沮止', '저지', 1),
+('河', '河北', '하북', 0),
+('北', '河北', '하북', 1),
+('河', '河南', '하남', 0),
+('南', '河南', '하남', 1),
+('河', '河口', '하구', 0),
+('口', '河口', '하구', 1),
+('河', '河川', '하천', 0),
+('川', '河川', '하천', 1),
+('河', '河床', '하상', 0),
+('床', '河床', '하상', 1),
+('河', '河道', '하도', 0),
+('道', '河道', '하도', 1),
+('河', '河馬', '하마', 0),
+('馬', '河馬', '하마', 1),
+('沸', '沸騰', '비등', 0),
+('騰', '沸騰', '비등', 1),
+('沸', '沸點', '비점', 0),
+('點', '沸點', '비점', 1),
+('油', '油價', '유가', 0),
+('價', '油價', '유가', 1),
+('油', '油布', '유포', 0),
+('布', '油布', '유포', 1),
+('油', '油彩', '유채', 0),
+('彩', '油彩', '유채', 1),
+('油', '油槽車', '유조차', 0),
+('槽', '油槽車', '유조차', 1),
+('車', '油槽車', '유조차', 2),
+('油', '油田', '유전', 0),
+('田', '油田', '유전', 1),
+('油', '油腐', '유부', 0),
+('腐', '油腐', '유부', 1),
+('油', '油菓', '유과', 0),
+('菓', '油菓', '유과', 1),
+('油', '油菜', '유채', 0),
+('菜', '油菜', '유채', 1),
+('油', '油蜜菓', '유밀과', 0),
+('蜜', '油蜜菓', '유밀과', 1),
+('菓', '油蜜菓', '유밀과', 2),
+('油', '油酸', '유산', 0),
+('酸', '油酸', '유산', 1),
+('治', '治世', '치세', 0),
+('世', '治世', '치세', 1),
+('治', '治外法權', '치외법권', 0),
+('外', '治外法權', '치외법권', 1),
+('法', '治外法權', '치외법권', 2),
+('權', '治外法權', '치외법권', 3),
+('治', '治安', '치안', 0),
+('安', '治安', '치안', 1),
+('治', '治水', '치수', 0),
+('水', '治水', '치수', 1),
+('治', '治熱', '치열', 0),
+('熱', '治熱', '치열', 1),
+('治', '治療', '치료', 0),
+('療', '治療', '치료', 1),
+('治', '治療劑', '치료제', 0),
+('療', '治療劑', '치료제', 1),
+('劑', '治療劑', '치료제', 2),
+('治', '治療法', '치료법', 0),
+('療', '治療法', '치료법', 1),
+('法', '治療法', '치료법', 2),
+('治', '治癒', '치유', 0),
+('癒', '治癒', '치유', 1),
+('沼', '沼澤', '소택', 0),
+('澤', '沼澤', '소택', 1),
+('沿', '沿岸', '연안', 0),
+('岸', '沿岸', '연안', 1),
+('沿', '沿道', '연도', 0),
+('道', '沿道', '연도', 1),
+('沿', '沿革', '연혁', 0),
+('革', '沿革', '연혁', 1),
+('泄', '泄瀉', '설사', 0),
+('瀉', '泄瀉', '설사', 1),
+('泉', '泉下', '천하', 0),
+('下', '泉下', '천하', 1),
+('泉', '泉地', '천지', 0),
+('地', '泉地', '천지', 1),
+('泉', '泉路', '천로', 0),
+('路', '泉路', '천로', 1),
+('泊', '泊', '박', 0),
+('泌', '泌尿器科', '비뇨기과', 0),
+('尿', '泌尿器科', '비뇨기과', 1),
+('器', '泌尿器科', '비뇨기과', 2),
+('科', '泌尿器科', '비뇨기과', 3),
+('法', '法', '법', 0),
+('法', '法事', '법사', 0),
+('事', '法事', '법사', 1),
+('法', '法人', '법인', 0),
+('人', '法人', '법인', 1),
+('法', '法令', '법령', 0),
+('令', '法令', '법령', 1),
+('法', '法典', '법전', 0),
+('典', '法典', '법전', 1),
+('法', '法制', '법제', 0),
+('制', '法制', '법제', 1),
+('法', '法則', '법칙', 0),
+('則', '法則', '법칙', 1),
+('法', '法務部', '법무부', 0),
+('務', '法務部', '법무부', 1),
+('部', '法務部', '법무부', 2),
+('法', '法司', '법사', 0),
+('司', '法司', '법사', 1),
+('法', '法嗣', '법사', 0),
+('嗣', '法嗣', '법사', 1),
+('法', '法執', '법집', 0),
+('執', '法執', '법집', 1),
+('法', '法學', '법학', 0),
+('學', '法學', '법학', 1),
+('法', '法官', '법관', 0),
+('官', '法官', '법관', 1),
+('法', '法定', '법정', 0),
+('定', '法定', '법정', 1),
+('法', '法家', '법가', 0),
+('家', '法家', '법가', 1),
+('法', '法師', '법사', 0),
+('師', '法師', '법사', 1),
+('法', '法度', '법도', 0),
+('度', '法度', '법도', 1),
+('法', '法庭', '법정', 0),
+('庭', '法庭', '법정', 1),
+('法', '法廷', '법정', 0),
+('廷', '法廷', '법정', 1),
+('法', '法律', '법률', 0),
+('律', '法律', '법률', 1),
+('法', '法律學', '법률학', 0),
+('律', '法律學', '법률학', 1),
+('學', '法律學', '법률학', 2),
+('法', '法案', '법안', 0),
+('案', '法案', '법안', 1),
+('法', '法樂', '법락', 0),
+('樂', '法樂', '법락', 1),
+('法', '法治國', '법치국', 0),
+('治', '法治國', '법치국', 1),
+('國', '法治國', '법치국', 2),
+('法', '法王', '법왕', 0),
+('王', '法王', '법왕', 1),
+('法', '法界', '법계', 0),
+('界', '法界', '법계', 1),
+('法', '法的', '법적', 0),
+('的', '法的', '법적', 1),
+('法', '法舟', '법주', 0),
+('舟', '法舟', '법주', 1),
+('法', '法術', '법술', 0),
+('術', '法術', '법술', 1),
+('法', '法衣', '법의', 0),
+('衣', '法衣', '법의', 1),
+('法', '法輪', '법륜', 0),
+('輪', '法輪', '법륜', 1),
+('法', '法院', '법원', 0),
+('院', '法院', '법원', 1),
+('泗', '泗川', '사천', 0),
+('川', '泗川', '사천', 1),
+('波', '波動', '파동', 0),
+('動', '波動', '파동', 1),
+('波', '波動函數', '파동함수', 0),
+('動', '波動函數', '파동함수', 1),
+('函', '波動函數', '파동함수', 2),
+('數', '波動函數', '파동함수', 3),
+('波', '波及', '파급', 0),
+('及', '波及', '파급', 1),
+('波', '波及 效果', '파급 효과', 0),
+('及', '波及 效果', '파급 효과', 1),
+('效', '波及 效果', '파급 효과', 3),
+('果', '波及 效果', '파급 효과', 4),
+('波', '波濤', '파도', 0),
+('濤', '波濤', '파도', 1),
+('波', '波紋', '파문', 0),
+('紋', '波紋', '파문', 1),
+('波', '波長', '파장', 0),
+('長', '波長', '파장', 1),
+('波', '波高', '파고', 0),
+('高', '波高', '파고', 1),
+('泥', '泥流', '이류', 0),
+('流', '泥流', '이류', 1),
+('泥', '泥濘', '이녕', 0),
+('濘', '泥濘', '이녕', 1),
+('泥', '泥炭', '이탄', 0),
+('炭', '泥炭', '이탄', 1),
+('注', '注入', '주입', 0),
+('入', '注入', '주입', 1),
+('注', '注射', '주사', 0),
+('射', '注射', '주사', 1),
+('注', '注射器', '주사기', 0),
+('射', '注射器', '주사기', 1),
+('器', '注射器', '주사기', 2),
+('注', '注意', '주의', 0),
+('意', '注意', '주의', 1),
+('注', '注文', '주문', 0),
+('文', '注文', '주문', 1),
+('注', '注油', '주유', 0),
+('油', '注油', '주유', 1),
+('注', '注油所', '주유소', 0),
+('油', '注油所', '주유소', 1),
+('所', '注油所', '주유소', 2),
+('注', '注目', '주목', 0),
+('目', '注目', '주목', 1),
+('注', '注視', '주시', 0),
+('視', '注視', '주시', 1),
+('注', '注解', '주해', 0),
+('解', '注解', '주해', 1),
+('注', '注記', '주기', 0),
+('記', '注記', '주기', 1),
+('注', '注音符號', '주음부호', 0),
+('音', '注音符號', '주음부호', 1),
+('符', '注音符號', '주음부호', 2),
+('號', '注音符號', '주음부호', 3),
+('泰', '泰國', '태국', 0),
+('國', '泰國', '태국', 1),
+('泰', '泰國語', '태국어', 0),
+('國', '泰國語', '태국어', 1),
+('語', '泰國語', '태국어', 2),
+('泰', '泰山', '태산', 0),
+('山', '泰山', '태산', 1),
+('泰', '泰平', '태평', 0),
+('平', '泰平', '태평', 1),
+('洋', '洋-', '양파', 0),
+('-', '洋-', '양파', 1),
+('洋', '洋--', '양배추', 0),
+('-', '洋--', '양배추', 1),
+('-', '洋--', '양배추', 2),
+('洋', '洋--', '양상추', 0),
+('-', '洋--', '양상추', 1),
+('-', '洋--', '양상추', 2),
+('洋', '洋—', '양놈', 0),
+('—', '洋—', '양놈', 1),
+('洋', '洋屋', '양옥', 0),
+('屋', '洋屋', '양옥', 1),
+('洋', '洋弓', '양궁', 0),
+('弓', '洋弓', '양궁', 1),
+('洋', '洋服', '양복', 0),
+('服', '洋服', '양복', 1),
+('洋', '洋服欌', '양복장', 0),
+('服', '洋服欌', '양복장', 1),
+('欌', '洋服欌', '양복장', 2),
+('洋', '洋洋', '양양', 0),
+('洋', '洋洋', '양양', 1),
+('洋', '洋琴', '양금', 0),
+('琴', '洋琴', '양금', 1),
+('洋', '洋菓', '양과', 0),
+('菓', '洋菓', '양과', 1),
+('洋', '洋襪', '양말', 0),
+('襪', '洋襪', '양말', 1),
+('洋', '洋酒', '양주', 0),
+('酒', '洋酒', '양주', 1),
+('洋', '洋銀', '양은', 0),
+('銀', '洋銀', '양은', 1),
+('洋', '洋鞋', '양혜', 0),
+('鞋', '洋鞋', '양혜', 1),
+('洋', '洋食', '양식', 0),
+('食', '洋食', '양식', 1),
+('洋', '洋食堂', '양식당', 0),
+('食', '洋食堂', '양식당', 1),
+('堂', '洋食堂', '양식당', 2),
+('洋', '洋鬼子', '양귀자', 0),
+('鬼', '洋鬼子', '양귀자', 1),
+('子', '洋鬼子', '양귀자', 2),
+('洋', '洋파', '양파', 0),
+('파', '洋파', '양파', 1),
+('洗', '洗劑', '세제', 0),
+('劑', '洗劑', '세제', 1),
+('洗', '洗手', '세수', 0),
+('手', '洗手', '세수', 1),
+('洗', '洗手', '쉐수', 0),
+('手', '洗手', '쉐수', 1),
+('洗', '洗毛', '세모', 0),
+('毛', '洗毛', '세모', 1),
+('洗', '洗滌', '세척', 0),
+('滌', '洗滌', '세척', 1),
+('洗', '洗濯', '세탁', 0),
+('濯', '洗濯', '세탁', 1),
+('洗', '洗濯室', '세탁실', 0),
+('濯', '洗濯室', '세탁실', 1),
+('室', '洗濯室', '세탁실', 2),
+('洗', '洗濯所', '세탁소', 0),
+('濯', '洗濯所', '세탁소', 1),
+('所', '洗濯所', '세탁소', 2),
+('洗', '洗濯機', '세탁기', 0),
+('濯', '洗濯機', '세탁기', 1),
+('機', '洗濯機', '세탁기', 2),
+('洗', '洗禮', '세례', 0),
+('禮', '洗禮', '세례', 1),
+('洗', '洗米', '세미', 0),
+('米', '洗米', '세미', 1),
+('洗', '洗練', '세련', 0),
+('練', '洗練', '세련', 1),
+('洗', '洗者', '세자', 0),
+('者', '洗者', '세자', 1),
+('洗', '洗腦', '세뇌', 0),
+('腦', '洗腦', '세뇌', 1),
+('洗', '洗車', '세차', 0),
+('車', '洗車', '세차', 1),
+('洗', '洗面', '세면', 0),
+('面', '洗面', '세면', 1),
+('洗', '洗面器', '세면기', 0),
+('面', '洗面器', '세면기', 1),
+('器', '洗面器', '세면기', 2),
+('洗', '洗髮', '세발', 0),
+('髮', '洗髮', '세발', 1),
+('洛', '洛', '낙', 0),
+('洛', '洛東江', '낙동강', 0),
+('東', '洛東江', '낙동강', 1),
+('江', '洛東江', '낙동강', 2),
+('洛', '洛陽', '낙양', 0),
+('陽', '洛陽', '낙양', 1),
+('洞', '洞', '동', 0),
+('洞', '洞內', '동내', 0),
+('內', '洞內', '동내', 1),
+('洞', '洞內坊內', '동내방내', 0),
+('內', '洞內坊內', '동내방내', 1),
+('坊', '洞內坊內', '동내방내', 2),
+('內', '洞內坊內', '동내방내', 3),
+('洞', '洞察', '통찰', 0),
+('察', '洞察', '통찰', 1),
+('洞', '洞察力', '통찰력', 0),
+('察', '洞察力', '통찰력', 1),
+('力', '洞察力', '통찰력', 2),
+('洞', '洞燭', '통촉', 0),
+('燭', '洞燭', '통촉', 1),
+('洞', '洞穴', '동혈', 0),
+('穴', '洞穴', '동혈', 1),
+('洞', '洞窟', '동굴', 0),
+('窟', '洞窟', '동굴', 1),
+('洞', '洞見', '통견', 0),
+('見', '洞見', '통견', 1),
+('洞', '洞里', '동리', 0),
+('里', '洞里', '동리', 1),
+('洞', '洞長', '동장', 0),
+('長', '洞長', '동장', 1),
+('洞', '洞門', '동문', 0),
+('門', '洞門', '동문', 1),
+('津', '津', '진', 0),
+('洪', '洪吉童', '홍길동', 0),
+('吉', '洪吉童', '홍길동', 1),
+('童', '洪吉童', '홍길동', 2),
+('洪', '洪水', '홍수', 0),
+('水', '洪水', '홍수', 1),
+('洪', '洪魚', '홍어', 0),
+('魚', '洪魚', '홍어', 1),
+('洪', '洪魚膾', '홍어회', 0),
+('魚', '洪魚膾', '홍어회', 1),
+('膾', '洪魚膾', '홍어회', 2),
+('洲', '洲', '주', 0),
+('活', '活力', '활력', 0),
+('力', '活力', '활력', 1),
+('活', '活動', '활동', 0),
+('動', '活動', '활동', 1),
+('活', '活動家', '활동가', 0),
+('動', '活動家', '활동가', 1),
+('家', '活動家', '활동가', 2),
+('活', '活動寫眞', '활동사진', 0),
+('動', '活動寫眞', '활동사진', 1),
+('寫', '活動寫眞', '활동사진', 2),
+('眞', '活動寫眞', '활동사진', 3),
+('活', '活動的', '활동적', 0),
+('動', '活動的', '활동적', 1),
+('的', '活動的', '활동적', 2),
+('活', '活字', '활자', 0),
+('字', '活字', '활자', 1),
+('活', '活性', '활성', 0),
+('性', '活性', '활성', 1),
+('活', '活性炭', '활성탄', 0),
+('性', '活性炭', '활성탄', 1),
+('炭', '活性炭', '활성탄', 2),
+('活', '活氣', '활기', 0),
+('氣', '活氣', '활기', 1),
+('活', '活況', '활황', 0),
+('況', '活況', '활황', 1),
+('活', '活法', '활법', 0),
+('法', '活法', '활법', 1),
+('活', '活潑', '활발', 0),
+('潑', '活潑', '활발', 1),
+('活', '活用', '활용', 0),
+('用', '活用', '활용', 1),
+('活', '活用形', '활용형', 0),
+('用', '活用形', '활용형', 1),
+('形', '活用形', '활용형', 2),
+('活', '活躍', '활약', 0),
+('躍', '活躍', '활약', 1),
+('派', '派出所', '파출소', 0),
+('出', '派出所', '파출소', 1),
+('所', '派出所', '파출소', 2),
+('派', '派生', '파생', 0),
+('生', '派生', '파생', 1),
+('派', '派生語', '파생어', 0),
+('生', '派生語', '파생어', 1),
+('語', '派生語', '파생어', 2),
+('派', '派遣', '파견', 0),
+('遣', '派遣', '파견', 1),
+('派', '派閥', '파벌', 0),
+('閥', '派閥', '파벌', 1),
+('流', '流下', '유하', 0),
+('下', '流下', '유하', 1),
+('流', '流丐', '유개', 0),
+('丐', '流丐', '유개', 1),
+('流', '流乞', '유걸', 0),
+('乞', '流乞', '유걸', 1),
+('流', '流入', '유입', 0),
+('入', '流入', '유입', 1),
+('流', '流出', '유출', 0),
+('出', '流出', '유출', 1),
+('流', '流動', '유동', 0),
+('動', '流動', '유동', 1),
+('流', '流動性', '유동성', 0),
+('動', '流動性', '유동성', 1),
+('性', '流動性', '유동성', 2),
+('流', '流動資本', '유동자본', 0),
+('動', '流動資本', '유동자본', 1),
+('資', '流動資本', '유동자본', 2),
+('本', '流動資本', '유동자본', 3),
+('流', '流動體', '유동체', 0),
+('動', '流動體', '유동체', 1),
+('體', '流動體', '유동체', 2),
+('流', '流域', '유역', 0),
+('域', '流域', '유역', 1),
+('流', '流寇', '유구', 0),
+('寇', '流寇', '유구', 1),
+('流', '流布', '유포', 0),
+('布', '流布', '유포', 1),
+('流', '流星', '유성', 0),
+('星', '流星', '유성', 1),
+('流', '流星 暴風', '유성 폭풍', 0),
+('星', '流星 暴風', '유성 폭풍', 1),
+('暴', '流星 暴風', '유성 폭풍', 3),
+('風', '流星 暴風', '유성 폭풍', 4),
+('流', '流星雨', '유성우', 0),
+('星', '流星雨', '유성우', 1),
+('雨', '流星雨', '유성우', 2),
+('流', '流暢', '유창', 0),
+('暢', '流暢', '유창', 1),
+('流', '流民', '유민', 0),
+('民', '流民', '유민', 1),
+('流', '流水', '유수', 0),
+('水', '流水', '유수', 1),
+('流', '流氷', '유빙', 0),
+('氷', '流氷', '유빙', 1),
+('流', '流汗', '유한', 0),
+('汗', '流汗', '유한', 1),
+('流', '流派', '유파', 0),
+('派', '流派', '유파', 1),
+('流', '流浪', '유랑', 0),
+('浪', '流浪', '유랑', 1),
+('流', '流産', '유산', 0),
+('産', '流産', '유산', 1),
+('流', '流砂', '유사', 0),
+('砂', '流砂', '유사', 1),
+('流', '流竄', '유찬', 0),
+('竄', '流竄', '유찬', 1),
+('流', '流罪', '유죄', 0),
+('罪', '流罪', '유죄', 1),
+('流', '流血', '류혈', 0),
+('血', '流血', '류혈', 1),
+('流', '流血', '유혈', 0),
+('血', '流血', '유혈', 1),
+('流', '流行', '류행', 0),
+('行', '流行', '류행', 1),
+('流', '流行', '유행', 0),
+('行', '流行', '유행', 1),
+('流', '流行性', '유행성', 0),
+('行', '流行性', '유행성', 1),
+('性', '流行性', '유행성', 2),
+('流', '流行性 耳下腺炎', '유행성 이하선염', 0),
+('行', '流行性 耳下腺炎', '유행성 이하선염', 1),
+('性', '流行性 耳下腺炎', '유행성 이하선염', 2),
+('耳', '流行性 耳下腺炎', '유행성 이하선염', 4),
+('下', '流行性 耳下腺炎', '유행성 이하선염', 5),
+('腺', '流行性 耳下腺炎', '유행성 이하선염', 6),
+('炎', '流行性 耳下腺炎', '유행성 이하선염', 7),
+('流', '流行歌', '유행가', 0),
+('行', '流行歌', '유행가', 1),
+('歌', '流行歌', '유행가', 2),
+('流', '流行病', '유행병', 0),
+('行', '流行病', '유행병', 1),
+('病', '流行病', '유행병', 2),
+('流', '流言', '유언', 0),
+('言', '流言', '유언', 1),
+('流', '流言蜚語', '유언비어', 0),
+('言', '流言蜚語', '유언비어', 1),
+('蜚', '流言蜚語', '유언비어', 2),
+('語', '流言蜚語', '유언비어', 3),
+('流', '流賊', '유적', 0),
+('賊', '流賊', '유적', 1),
+('流', '流通', '유통', 0),
+('通', '流通', '유통', 1),
+('流', '流速', '유속', 0),
+('速', '流速', '유속', 1),
+('流', '流量', '유량', 0),
+('量', '流量', '유량', 1),
+('流', '流量計', '유량계', 0),
+('量', '流量計', '유량계', 1),
+('計', '流量計', '유량계', 2),
+('流', '流離', '유리', 0),
+('離', '流離', '유리', 1),
+('流', '流音', '류음', 0),
+('音', '流音', '류음', 1),
+('流', '流音', '유음', 0),
+('音', '流音', '유음', 1),
+('流', '流頭', '유두', 0),
+('頭', '流頭', '유두', 1),
+('流', '流體', '유체', 0),
+('體', '流體', '유체', 1),
+('流', '流體動力學', '유체동역학', 0),
+('體', '流體動力學', '유체동역학', 1),
+('動', '流體動力學', '유체동역학', 2),
+('力', '流體動力學', '유체동역학', 3),
+('學', '流體動力學', '유체동역학', 4),
+('浙', '浙江', '절강', 0),
+('江', '浙江', '절강', 1),
+('浪', '浪人', '낭인', 0),
+('人', '浪人', '낭인', 1),
+('浪', '浪漫', '낭만', 0),
+('漫', '浪漫', '낭만', 1),
+('浪', '浪漫主義', '낭만주의', 0),
+('漫', '浪漫主義', '낭만주의', 1),
+('主', '浪漫主義', '낭만주의', 2),
+('義', '浪漫主義', '낭만주의', 3),
+('浪', '浪費', '낭비', 0),
+('費', '浪費', '낭비', 1),
+('浮', '浮上', '부상', 0),
+('上', '浮上', '부상', 1),
+('浮', '浮力', '부력', 0),
+('力', '浮力', '부력', 1),
+('浮', '浮動', '부동', 0),
+('動', '浮動', '부동', 1),
+('浮', '浮彫', '부조', 0),
+('彫', '浮彫', '부조', 1),
+('浮', '浮揚', '부양', 0),
+('揚', '浮揚', '부양', 1),
+('浮', '浮標', '부표', 0),
+('標', '浮標', '부표', 1),
+('浮', '浮氷', '부빙', 0),
+('氷', '浮氷', '부빙', 1),
+('浮', '浮浪', '부랑', 0),
+('浪', '浮浪', '부랑', 1),
+('浮', '浮游', '부유', 0),
+('游', '浮游', '부유', 1),
+('浮', '浮漂', '부표', 0),
+('漂', '浮漂', '부표', 1),
+('浮', '浮石', '부석', 0),
+('石', '浮石', '부석', 1),
+('浮', '浮腫', '부종', 0),
+('腫', '浮腫', '부종', 1),
+('浴', '浴室', '욕실', 0),
+('室', '浴室', '욕실', 1),
+('浴', '浴槽', '욕조', 0),
+('槽', '浴槽', '욕조', 1),
+('海', '海中', '해중', 0),
+('中', '海中', '해중', 1),
+('海', '海兵', '해병', 0),
+('兵', '海兵', '해병', 1),
+('海', '海兵隊', '해병대', 0),
+('兵', '海兵隊', '해병대', 1),
+('隊', '海兵隊', '해병대', 2),
+('海', '海南', '해남', 0),
+('南', '海南', '해남', 1),
+('海', '海員', '해원', 0),
+('員', '海員', '해원', 1),
+('海', '海圖', '해도', 0),
+('圖', '海圖', '해도', 1),
+('海', '海城', '해성', 0),
+('城', '海城', '해성', 1),
+('海', '海外', '해외', 0),
+('外', '海外', '해외', 1),
+('海', '海外購買', '해외구매', 0),
+('外', '海外購買', '해외구매', 1),
+('購', '海外購買', '해외구매', 2),
+('買', '海外購買', '해외구매', 3),
+('海', '海外旅行', '해외여행', 0),
+('外', '海外旅行', '해외여행', 1),
+('旅', '海外旅行', '해외여행', 2),
+('行', '海外旅行', '해외여행', 3),
+('海', '海女', '해녀', 0),
+('女', '海女', '해녀', 1),
+('海', '海山', '해산', 0),
+('山', '海山', '해산', 1),
+('海', '海岸', '해안', 0),
+('岸', '海岸', '해안', 1),
+('海', '海岸線', '해안선', 0),
+('岸', '海岸線', '해안선', 1),
+('線', '海岸線', '해안선', 2),
+('海', '海峽', '해협', 0),
+('峽', '海峽', '해협', 1),
+('海', '海嶺', '해령', 0),
+('嶺', '海嶺', '해령', 1),
+('海', '海州', '해주', 0),
+('州', '海州', '해주', 1),
+('海', '海底', '해저', 0),
+('底', '海底', '해저', 1),
+('海', '海戰', '해전', 0),
+('戰', '海戰', '해전', 1),
+('海', '海拔', '해발', 0),
+('拔', '海拔', '해발', 1),
+('海', '海星', '해성', 0),
+('星', '海星', '해성', 1),
+('海', '海月', '해월', 0),
+('月', '海月', '해월', 1),
+('海', '海水浴', '해수욕', 0),
+('水', '海水浴', '해수욕', 1),
+('浴', '海水浴', '해수욕', 2),
+('海', '海水浴場', '해수욕장', 0),
+('水', '海水浴場', '해수욕장', 1),
+('浴', '海水浴場', '해수욕장', 2),
+('場', '海水浴場', '해수욕장', 3),
+('海', '海洋', '해양', 0),
+('洋', '海洋', '해양', 1),
+('海', '海洋學', '해양학', 0),
+('洋', '海洋學', '해양학', 1),
+('學', '海洋學', '해양학', 2),
+('海', '海流', '해류', 0),
+('流', '海流', '해류', 1),
+('海', '海港', '해항', 0),
+('港', '海港', '해항', 1),
+('海', '海溝', '해구', 0),
+('溝', '海溝', '해구', 1),
+('海', '海溢', '해일', 0),
+('溢', '海溢', '해일', 1),
+('海', '海溢警報', '해일경보', 0),
+('溢', '海溢警報', '해일경보', 1),
+('警', '海溢警報', '해일경보', 2),
+('報', '海溢警報', '해일경보', 3),
+('海', '海溢防波堤', '해일방파제', 0),
+('溢', '海溢防波堤', '해일방파제', 1),
+('防', '海溢防波堤', '해일방파제', 2),
+('波', '海溢防波堤', '해일방파제', 3),
+('堤', '海溢防波堤', '해일방파제', 4),
+('海', '海牛', '해우', 0),
+('牛', '海牛', '해우', 1),
+('海', '海物', '해물', 0),
+('物', '海物', '해물', 1),
+('海', '海狗', '해구', 0),
+('狗', '海狗', '해구', 1),
+('海', '海狸', '해리', 0),
+('狸', '海狸', '해리', 1),
+('海', '海獺', '해달', 0),
+('獺', '海獺', '해달', 1),
+('海', '海産', '해산', 0),
+('産', '海産', '해산', 1),
+('海', '海産物', '해산물', 0),
+('産', '海産物', '해산물', 1),
+('物', '海産物', '해산물', 2),
+('海', '海綿', '해면', 0),
+('綿', '海綿', '해면', 1),
+('海', '海苔', '해태', 0),
+('苔', '海苔', '해태', 1),
+('海', '海草', '해초', 0),
+('草', '海草', '해초', 1),
+('海', '海蔘', '해삼', 0),
+('蔘', '海蔘', '해삼', 1),
+('海', '海象', '해상', 0),
+('象', '海象', '해상', 1),
+('海', '海賊', '해적', 0),
+('賊', '海賊', '해적', 1),
+('海', '海賊船', '해적선', 0),
+('賊', '海賊船', '해적선', 1),
+('船', '海賊船', '해적선', 2),
+('海', '海路', '해로', 0),
+('路', '海路', '해로', 1),
+('海', '海軍', '해군', 0),
+('軍', '海軍', '해군', 1),
+('海', '海邊', '해변', 0),
+('邊', '海邊', '해변', 1),
+('海', '海里', '해리', 0),
+('里', '海里', '해리', 1),
+('海', '海面', '해면', 0),
+('面', '海面', '해면', 1),
+('海', '海馬', '해마', 0),
+('馬', '海馬', '해마', 1),
+('海', '海鳥', '해조', 0),
+('鳥', '海鳥', '해조', 1),
+('浸', '浸水', '침수', 0),
+('水', '浸水', '침수', 1),
+('浸', '浸蝕', '침식', 0),
+('蝕', '浸蝕', '침식', 1),
+('浸', '浸透', '침투', 0),
+('透', '浸透', '침투', 1),
+('涅', '涅槃', '열반', 0),
+('槃', '涅槃', '열반', 1),
+('消', '消化', '소화', 0),
+('化', '消化', '소화', 1),
+('消', '消印', '소인', 0),
+('印', '消印', '소인', 1),
+('消', '消去', '소거', 0),
+('去', '消去', '소거', 1),
+('消', '消失', '소실', 0),
+('失', '消失', '소실', 1),
+('消', '消息', '소식', 0),
+('息', '消息', '소식', 1),
+('消', '消散', '소산', 0),
+('散', '消散', '소산', 1),
+('消', '消極的', '소극적', 0),
+('極', '消極的', '소극적', 1),
+('的', '消極的', '소극적', 2),
+('消', '消毒', '소독', 0),
+('毒', '消毒', '소독', 1),
+('消', '消毒劑', '소독제', 0),
+('毒', '消毒劑', '소독제', 1),
+('劑', '消毒劑', '소독제', 2),
+('消', '消沈', '소침', 0),
+('沈', '消沈', '소침', 1),
+('消', '消泡劑', '소포제', 0),
+('泡', '消泡劑', '소포제', 1),
+('劑', '消泡劑', '소포제', 2),
+('消', '消滅', '소멸', 0),
+('滅', '消滅', '소멸', 1),
+('消', '消火器', '소화기', 0),
+('火', '消火器', '소화기', 1),
+('器', '消火器', '소화기', 2),
+('消', '消火栓', '소화전', 0),
+('火', '消火栓', '소화전', 1),
+('栓', '消火栓', '소화전', 2),
+('消', '消石灰', '소석회', 0),
+('石', '消石灰', '소석회', 1),
+('灰', '消石灰', '소석회', 2),
+('消', '消耗', '소모', 0),
+('耗', '消耗', '소모', 1),
+('消', '消耗戰', '소모전', 0),
+('耗', '消耗戰', '소모전', 1),
+('戰', '消耗戰', '소모전', 2),
+('消', '消費', '소비', 0),
+('費', '消費', '소비', 1),
+('消', '消費者', '소비자', 0),
+('費', '消費者', '소비자', 1),
+('者', '消費者', '소비자', 2),
+('消', '消防', '소방', 0),
+('防', '消防', '소방', 1),
+('消', '消防官', '소방관', 0),
+('防', '消防官', '소방관', 1),
+('官', '消防官', '소방관', 2),
+('消', '消防手', '소방수', 0),
+('防', '消防手', '소방수', 1),
+('手', '消防手', '소방수', 2),
+('消', '消防署', '소방서', 0),
+('防', '消防署', '소방서', 1),
+('署', '消防署', '소방서', 2),
+('消', '消防車', '소방차', 0),
+('防', '消防車', '소방차', 1),
+('車', '消防車', '소방차', 2),
+('消', '消防隊', '소방대', 0),
+('防', '消防隊', '소방대', 1),
+('隊', '消防隊', '소방대', 2),
+('消', '消防隊長', '소방대장', 0),
+('防', '消防隊長', '소방대장', 1),
+('隊', '消防隊長', '소방대장', 2),
+('長', '消防隊長', '소방대장', 3),
+('涕', '涕泣', '체읍', 0),
+('泣', '涕泣', '체읍', 1),
+('液', '液', '액', 0),
+('液', '液化', '액화', 0),
+('化', '液化', '액화', 1),
+('液', '液化石油‒ ', '액화석유가스', 0),
+('化', '液化石油‒ ', '액화석유가스', 1),
+('石', '液化石油‒ ', '액화석유가스', 2),
+('油', '液化石油‒ ', '액화석유가스', 3),
+('‒', '液化石油‒ ', '액화석유가스', 4),
+('液', '液晶', '액정', 0),
+('晶', '液晶', '액정', 1),
+('液', '液滴', '액적', 0),
+('滴', '液滴', '액적', 1),
+('液', '液狀', '액상', 0),
+('狀', '液狀', '액상', 1),
+('液', '液相', '액상', 0),
+('相', '液相', '액상', 1),
+('液', '液量', '액량', 0),
+('量', '液量', '액량', 1),
+('液', '液面', '액면', 0),
+('面', '液面', '액면', 1),
+('液', '液體', '액체', 0),
+('體', '液體', '액체', 1),
+('淋', '淋疾', '임질', 0),
+('疾', '淋疾', '임질', 1),
+('淑', '淑女', '숙녀', 0),
+('女', '淑女', '숙녀', 1),
+('淘', '淘汰', '도태', 0),
+('汰', '淘汰', '도태', 1),
+('淚', '淚腺', '누선', 0),
+('腺', '淚腺', '누선', 1),
+('淡', '淡婆姑', '담파고', 0),
+('婆', '淡婆姑', '담파고', 1),
+('姑', '淡婆姑', '담파고', 2),
+('淡', '淡水', '담수', 0),
+('水', '淡水', '담수', 1),
+('淡', '淡泊', '담박', 0),
+('泊', '淡泊', '담박', 1),
+('淡', '淡白', '담백', 0),
+('白', '淡白', '담백', 1),
+('淡', '淡黃', '담황', 0),
+('黃', '淡黃', '담황', 1),
+('淨', '淨化', '정화', 0),
+('化', '淨化', '정화', 1),
+('淨', '淨水', '정수', 0),
+('水', '淨水', '정수', 1),
+('淨', '淨潔', '정결', 0),
+('潔', '淨潔', '정결', 1),
+('淨', '淨財', '정재', 0),
+('財', '淨財', '정재', 1),
+('淨', '淨食', '정식', 0),
+('食', '淨食', '정식', 1),
+('淨', '淨齋', '정재', 0),
+('齋', '淨齋', '정재', 1),
+('淫', '淫亂', '음란', 0),
+('亂', '淫亂', '음란', 1),
+('淫', '淫佚', '음일', 0),
+('佚', '淫佚', '음일', 1),
+('淫', '淫慾', '음욕', 0),
+('慾', '淫慾', '음욕', 1),
+('淫', '淫蕩', '음탕', 0),
+('蕩', '淫蕩', '음탕', 1),
+('淫', '淫靡', '음미', 0),
+('靡', '淫靡', '음미', 1),
+('淮', '淮南子', '회남자', 0),
+('南', '淮南子', '회남자', 1),
+('子', '淮南子', '회남자', 2),
+('深', '深刻', '심각', 0),
+('刻', '深刻', '심각', 1),
+('深', '深化', '심화', 0),
+('化', '深化', '심화', 1),
+('深', '深呼吸', '심호흡', 0),
+('呼', '深呼吸', '심호흡', 1),
+('吸', '深呼吸', '심호흡', 2),
+('深', '深夜', '심야', 0),
+('夜', '深夜', '심야', 1),
+('深', '深山幽谷', '심산유곡', 0),
+('山', '深山幽谷', '심산유곡', 1),
+('幽', '深山幽谷', '심산유곡', 2),
+('谷', '深山幽谷', '심산유곡', 3),
+('深', '深思熟考', '심사숙고', 0),
+('思', '深思熟考', '심사숙고', 1),
+('熟', '深思熟考', '심사숙고', 2),
+('考', '深思熟考', '심사숙고', 3),
+('深', '深海', '심해', 0),
+('海', '深海', '심해', 1),
+('深', '深淵', '심연', 0),
+('淵', '深淵', '심연', 1),
+('深', '深秋', '심추', 0),
+('秋', '深秋', '심추', 1),
+('混', '混亂', '혼란', 0),
+('亂', '混亂', '혼란', 1),
+('混', '混信', '혼신', 0),
+('信', '混信', '혼신', 1),
+('混', '混合', '혼합', 0),
+('合', '混合', '혼합', 1),
+('混', '混同', '혼동', 0),
+('同', '混同', '혼동', 1),
+('混', '混夷', '곤이', 0),
+('夷', '混夷', '곤이', 1),
+('混', '混沌', '혼돈', 0),
+('沌', '混沌', '혼돈', 1),
+('混', '混血', '혼혈', 0),
+('血', '混血', '혼혈', 1),
+('混', '混血兒', '혼혈아', 0),
+('血', '混血兒', '혼혈아', 1),
+('兒', '混血兒', '혼혈아', 2),
+('淸', '淸', '청', 0),
+('淸', '淸凉劑', '청량제', 0),
+('凉', '淸凉劑', '청량제', 1),
+('劑', '淸凉劑', '청량제', 2),
+('淸', '淸川江', '청천강', 0),
+('川', '淸川江', '청천강', 1),
+('江', '淸川江', '청천강', 2),
+('淸', '淸廉', '청렴', 0),
+('廉', '淸廉', '청렴', 1),
+('淸', '淸掃', '청소', 0),
+('掃', '淸掃', '청소', 1),
+('淸', '淸掃夫', '청소부', 0),
+('掃', '淸掃夫', '청소부', 1),
+('夫', '淸掃夫', '청소부', 2),
+('淸', '淸掃婦', '청소부', 0),
+('掃', '淸掃婦', '청소부', 1),
+('婦', '淸掃婦', '청소부', 2),
+('淸', '淸掃機', '청소기', 0),
+('掃', '淸掃機', '청소기', 1),
+('機', '淸掃機', '청소기', 2),
+('淸', '淸新', '청신', 0),
+('新', '淸新', '청신', 1),
+('淸', '淸津', '청진', 0),
+('津', '淸津', '청진', 1),
+('淸', '淸涼飮料', '청량음료', 0),
+('涼', '淸涼飮料', '청량음료', 1),
+('飮', '淸涼飮料', '청량음료', 2),
+('料', '淸涼飮料', '청량음료', 3),
+('淸', '淸淨', '청정', 0),
+('淨', '淸淨', '청정', 1),
+('淸', '淸潔', '청결', 0),
+('潔', '淸潔', '청결', 1),
+('淸', '淸濁', '청탁', 0),
+('濁', '淸濁', '청탁', 1),
+('淸', '淸白', '청백', 0),
+('白', '淸白', '청백', 1),
+('淸', '淸算', '청산', 0),
+('算', '淸算', '청산', 1),
+('淸', '淸純', '청순', 0),
+('純', '淸純', '청순', 1),
+('淸', '淸興', '청흥', 0),
+('興', '淸興', '청흥', 1),
+('淸', '淸酒', '청주', 0),
+('酒', '淸酒', '청주', 1),
+('淸', '淸陽', '청양', 0),
+('陽', '淸陽', '청양', 1),
+('淸', '淸麴醬', '청국장', 0),
+('麴', '淸麴醬', '청국장', 1),
+('醬', '淸麴醬', '청국장', 2),
+('淺', '淺智', '천지', 0),
+('智', '淺智', '천지', 1),
+('淺', '淺知', '천지', 0),
+('知', '淺知', '천지', 1),
+('淺', '淺薄', '천박', 0),
+('薄', '淺薄', '천박', 1),
+('添', '添削', '첨삭', 0),
+('削', '添削', '첨삭', 1),
+('添', '添加', '첨가', 0),
+('加', '添加', '첨가', 1),
+('添', '添加物', '첨가물', 0),
+('加', '添加物', '첨가물', 1),
+('物', '添加物', '첨가물', 2),
+('添', '添書', '첨서', 0),
+('書', '添書', '첨서', 1),
+('添', '添附', '첨부', 0),
+('附', '添附', '첨부', 1),
+('減', '減壓', '감압', 0),
+('壓', '減壓', '감압', 1),
+('減', '減壽', '감수', 0),
+('壽', '減壽', '감수', 1),
+('減', '減少', '감소', 0),
+('少', '減少', '감소', 1),
+('減', '減收', '감수', 0),
+('收', '減收', '감수', 1),
+('減', '減數', '감수', 0),
+('數', '減數', '감수', 1),
+('減', '減殺器', '감쇄기', 0),
+('殺', '減殺器', '감쇄기', 1),
+('器', '減殺器', '감쇄기', 2),
+('減', '減水', '감수', 0),
+('水', '減水', '감수', 1),
+('減', '減法', '감법', 0),
+('法', '減法', '감법', 1),
+('減', '減稅', '감세', 0),
+('稅', '減稅', '감세', 1),
+('減', '減算', '감산', 0),
+('算', '減算', '감산', 1),
+('減', '減衰器', '감쇠기', 0),
+('衰', '減衰器', '감쇠기', 1),
+('器', '減衰器', '감쇠기', 2),
+('減', '減退', '감퇴', 0),
+('退', '減退', '감퇴', 1),
+('減', '減速', '감속', 0),
+('速', '減速', '감속', 1),
+('渡', '渡江', '도강', 0),
+('江', '渡江', '도강', 1),
+('渦', '渦狀', '와상', 0),
+('狀', '渦狀', '와상', 1),
+('測', '測力計', '측력계', 0),
+('力', '測力計', '측력계', 1),
+('計', '測力計', '측력계', 2),
+('測', '測定', '측정', 0),
+('定', '測定', '측정', 1),
+('測', '測微計', '측미계', 0),
+('微', '測微計', '측미계', 1),
+('計', '測微計', '측미계', 2),
+('測', '測深', '측심', 0),
+('深', '測深', '측심', 1),
+('測', '測量', '측량', 0),
+('量', '測量', '측량', 1),
+('測', '測鉛', '측연', 0),
+('鉛', '測鉛', '측연', 1),
+('港', '港', '항', 0),
+('港', '港口', '항구', 0),
+('口', '港口', '항구', 1),
+('港', '港外', '항외', 0),
+('外', '港外', '항외', 1),
+('港', '港灣', '항만', 0),
+('灣', '港灣', '항만', 1),
+('渴', '渴愛', '갈애', 0),
+('愛', '渴愛', '갈애', 1),
+('渴', '渴望', '갈망', 0),
+('望', '渴望', '갈망', 1),
+('渴', '渴症', '갈증', 0),
+('症', '渴症', '갈증', 1),
+('湖', '湖', '호', 0),
+('湖', '湖北', '호북', 0),
+('北', '湖北', '호북', 1),
+('湖', '湖南', '호남', 0),
+('南', '湖南', '호남', 1),
+('湖', '湖水', '호수', 0),
+('水', '湖水', '호수', 1),
+('湖', '湖畔', '호반', 0),
+('畔', '湖畔', '호반', 1),
+('湖', '湖畔새', '호반새', 0),
+('畔', '湖畔새', '호반새', 1),
+('새', '湖畔새', '호반새', 2),
+('湯', '湯', '탕', 0),
+('湯', '湯水', '탕수', 0),
+('水', '湯水', '탕수', 1),
+('湯', '湯水桶', '탕수통', 0),
+('水', '湯水桶', '탕수통', 1),
+('桶', '湯水桶', '탕수통', 2),
+('湯', '湯種', '탕종', 0),
+('種', '湯種', '탕종', 1),
+('源', '源泉', '원천', 0),
+('泉', '源泉', '원천', 1),
+('準', '準備', '준비', 0),
+('備', '準備', '준비', 1),
+('準', '準備物', '준비물', 0),
+('備', '準備物', '준비물', 1),
+('物', '準備物', '준비물', 2),
+('準', '準州', '준주', 0),
+('州', '準州', '준주', 1),
+('準', '準星', '준성', 0),
+('星', '準星', '준성', 1),
+('溪', '溪谷', '계곡', 0),
+('谷', '溪谷', '계곡', 1),
+('溫', '溫和', '온화', 0),
+('和', '溫和', '온화', 1),
+('溫', '溫堗', '온돌', 0),
+('堗', '溫堗', '온돌', 1),
+('溫', '溫室', '온실', 0),
+('室', '溫室', '온실', 1),
+('溫', '溫州', '온주', 0),
+('州', '溫州', '온주', 1),
+('溫', '溫州蜜柑', '온주밀감', 0),
+('州', '溫州蜜柑', '온주밀감', 1),
+('蜜', '溫州蜜柑', '온주밀감', 2),
+('柑', '溫州蜜柑', '온주밀감', 3),
+('溫', '溫帶', '온대', 0),
+('帶', '溫帶', '온대', 1),
+('溫', '溫度', '온도', 0),
+('度', '溫度', '온도', 1),
+('溫', '溫度計', '온도계', 0),
+('度', '溫度計', '온도계', 1),
+('計', '溫度計', '온도계', 2),
+('溫', '溫水', '온수', 0),
+('水', '溫水', '온수', 1),
+('溫', '溫泉', '온천', 0),
+('泉', '溫泉', '온천', 1),
+('溫', '溫突', '온돌', 0),
+('突', '溫突', '온돌', 1),
+('溫', '溫突房', '온돌방', 0),
+('突', '溫突房', '온돌방', 1),
+('房', '溫突房', '온돌방', 2),
+('溫', '溫血動物', '온혈동물', 0),
+('血', '溫血動物', '온혈동물', 1),
+('動', '溫血動物', '온혈동물', 2),
+('物', '溫血動物', '온혈동물', 3),
+('溶', '溶劑', '용제', 0),
+('劑', '溶劑', '용제', 1),
+('溶', '溶媒', '용매', 0),
+('媒', '溶媒', '용매', 1),
+('溶', '溶液', '용액', 0),
+('液', '溶液', '용액', 1),
+('溶', '溶解', '용해', 0),
+('解', '溶解', '용해', 1),
+('溺', '溺死', '익사', 0),
+('死', '溺死', '익사', 1),
+('滄', '滄桑', '창상', 0),
+('桑', '滄桑', '창상', 1),
+('滄', '滄海', '창해', 0),
+('海', '滄海', '창해', 1),
+('滄', '滄海桑田', '창해상전', 0),
+('海', '滄海桑田', '창해상전', 1),
+('桑', '滄海桑田', '창해상전', 2),
+('田', '滄海桑田', '창해상전', 3),
+('滅', '滅亡', '멸망', 0),
+('亡', '滅亡', '멸망', 1),
+('滅', '滅種', '멸종', 0),
+('種', '滅種', '멸종', 1),
+('滅', '滅菌', '멸균', 0),
+('菌', '滅菌', '멸균', 1),
+('滑', '滑石', '활석', 0),
+('石', '滑石', '활석', 1),
+('滑', '滑走', '활주', 0),
+('走', '滑走', '활주', 1),
+('滑', '滑走路', '활주로', 0),
+('走', '滑走路', '활주로', 1),
+('路', '滑走路', '활주로', 2),
+('滑', '滑車', '활차', 0),
+('車', '滑車', '활차', 1),
+('滯', '滯在', '체재', 0),
+('在', '滯在', '체재', 1),
+('滯', '滯留', '체류', 0),
+('留', '滯留', '체류', 1),
+('滲', '滲透', '삼투', 0),
+('透', '滲透', '삼투', 1),
+('滿', '滿', '만', 0),
+('滿', '滿了', '만료', 0),
+('了', '滿了', '만료', 1),
+('滿', '滿場一致', '만장일치', 0),
+('場', '滿場一致', '만장일치', 1),
+('一', '滿場一致', '만장일치', 2),
+('致', '滿場一致', '만장일치', 3),
+('滿', '滿壘', '만루', 0),
+('壘', '滿壘', '만루', 1),
+('滿', '滿月', '만월', 0),
+('月', '滿月', '만월', 1),
+('滿', '滿洲', '만주', 0),
+('洲', '滿洲', '만주', 1),
+('滿', '滿洲國', '만주국', 0),
+('洲', '滿洲國', '만주국', 1),
+('國', '滿洲國', '만주국', 2),
+('滿', '滿洲語', '만주어', 0),
+('洲', '滿洲語', '만주어', 1),
+('語', '滿洲語', '만주어', 2),
+('滿', '滿浦', '만포', 0),
+('浦', '滿浦', '만포', 1),
+('滿', '滿潮', '만조', 0),
+('潮', '滿潮', '만조', 1),
+('滿', '滿發', '만발', 0),
+('發', '滿發', '만발', 1),
+('滿', '滿足', '만족', 0),
+('足', '滿足', '만족', 1),
+('滿', '滿身', '만신', 0),
+('身', '滿身', '만신', 1),
+('滿', '滿身瘡痍', '만신창이', 0),
+('身', '滿身瘡痍', '만신창이', 1),
+('瘡', '滿身瘡痍', '만신창이', 2),
+('痍', '滿身瘡痍', '만신창이', 3),
+('滿', '滿點', '만점', 0),
+('點', '滿點', '만점', 1),
+('漁', '漁場', '어장', 0),
+('場', '漁場', '어장', 1),
+('漁', '漁場管理', '어장관리', 0),
+('場', '漁場管理', '어장관리', 1),
+('管', '漁場管理', '어장관리', 2),
+('理', '漁場管理', '어장관리', 3),
+('漁', '漁夫', '어부', 0),
+('夫', '漁夫', '어부', 1),
+('漁', '漁師', '어사', 0),
+('師', '漁師', '어사', 1),
+('漁', '漁村', '어촌', 0),
+('村', '漁村', '어촌', 1),
+('漁', '漁業', '어업', 0),
+('業', '漁業', '어업', 1),
+('漁', '漁港', '어항', 0),
+('港', '漁港', '어항', 1),
+('漁', '漁父', '어부', 0),
+('父', '漁父', '어부', 1),
+('漁', '漁獲', '어획', 0),
+('獲', '漁獲', '어획', 1),
+('漁', '漁網', '어망', 0),
+('網', '漁網', '어망', 1),
+('漁', '漁船', '어선', 0),
+('船', '漁船', '어선', 1),
+('漂', '漂流', '표류', 0),
+('流', '漂流', '표류', 1),
+('漂', '漂白', '표백', 0),
+('白', '漂白', '표백', 1),
+('漂', '漂白劑', '표백제', 0),
+('白', '漂白劑', '표백제', 1),
+('劑', '漂白劑', '표백제', 2),
+('漆', '漆', '칠', 0),
+('漆', '漆器', '칠기', 0),
+('器', '漆器', '칠기', 1),
+('漆', '漆板', '칠판', 0),
+('板', '漆板', '칠판', 1),
+('漏', '漏斗', '누두', 0),
+('斗', '漏斗', '누두', 1),
+('漏', '漏水', '누수', 0),
+('水', '漏水', '누수', 1),
+('漏', '漏泄', '누설', 0),
+('泄', '漏泄', '누설', 1),
+('漏', '漏洩', '누설', 0),
+('洩', '漏洩', '누설', 1),
+('漏', '漏電', '누전', 0),
+('電', '漏電', '누전', 1),
+('演', '演出', '연출', 0),
+('出', '演出', '연출', 1),
+('演', '演劇', '연극', 0),
+('劇', '演劇', '연극', 1),
+('演', '演壇', '연단', 0),
+('壇', '演壇', '연단', 1),
+('演', '演奏', '연주', 0),
+('奏', '演奏', '연주', 1),
+('演', '演奏者', '연주자', 0),
+('奏', '演奏者', '연주자', 1),
+('者', '演奏者', '연주자', 2),
+('演', '演戲', '연희', 0),
+('戲', '演戲', '연희', 1),
+('演', '演技', '연기', 0),
+('技', '演技', '연기', 1),
+('演', '演技者', '연기자', 0),
+('技', '演技者', '연기자', 1),
+('者', '演技者', '연기자', 2),
+('演', '演義', '연의', 0),
+('義', '演義', '연의', 1),
+('演', '演習', '연습', 0),
+('習', '演習', '연습', 1),
+('演', '演習場', '연습장', 0),
+('習', '演習場', '연습장', 1),
+('場', '演習場', '연습장', 2),
+('演', '演藝', '연예', 0),
+('藝', '演藝', '연예', 1),
+('演', '演藝人', '연예인', 0),
+('藝', '演藝人', '연예인', 1),
+('人', '演藝人', '연예인', 2),
+('演', '演說', '연설', 0),
+('說', '演說', '연설', 1),
+('演', '演說者', '연설자', 0),
+('說', '演說者', '연설자', 1),
+('者', '演說者', '연설자', 2),
+('漕', '漕船', '조선', 0),
+('船', '漕船', '조선', 1),
+('漕', '漕艇', '조정', 0),
+('艇', '漕艇', '조정', 1),
+('漢', '漢', '한', 0),
+('漢', '漢人', '한인', 0),
+('人', '漢人', '한인', 1),
+('漢', '漢四郡', '한사군', 0),
+('四', '漢四郡', '한사군', 1),
+('郡', '漢四郡', '한사군', 2),
+('漢', '漢城', '한성', 0),
+('城', '漢城', '한성', 1),
+('漢', '漢字', '한자', 0),
+('字', '漢字', '한자', 1),
+('漢', '漢字語', '한자어', 0),
+('字', '漢字語', '한자어', 1),
+('語', '漢字語', '한자어', 2),
+('漢', '漢學', '한학', 0),
+('學', '漢學', '한학', 1),
+('漢', '漢拏山', '한라산', 0),
+('拏', '漢拏山', '한라산', 1),
+('山', '漢拏山', '한라산', 2),
+('漢', '漢文', '한문', 0),
+('文', '漢文', '한문', 1),
+('漢', '漢文套', '한문투', 0),
+('文', '漢文套', '한문투', 1),
+('套', '漢文套', '한문투', 2),
+('漢', '漢族', '한족', 0),
+('族', '漢族', '한족', 1),
+('漢', '漢族法', '한족법', 0),
+('族', '漢族法', '한족법', 1),
+('法', '漢族法', '한족법', 2),
+('漢', '漢服', '한복', 0),
+('服', '漢服', '한복', 1),
+('漢', '漢民族', '한민족', 0),
+('民', '漢民族', '한민족', 1),
+('族', '漢民族', '한민족', 2),
+('漢', '漢江', '한강', 0),
+('江', '漢江', '한강', 1),
+('漢', '漢藥', '한약', 0),
+('藥', '漢藥', '한약', 1),
+('漢', '漢詩', '한시', 0),
+('詩', '漢詩', '한시', 1),
+('漢', '漢語', '한어', 0),
+('語', '漢語', '한어', 1),
+('漢', '漢語 拼音', '한어 병음', 0),
+('語', '漢語 拼音', '한어 병음', 1),
+('拼', '漢語 拼音', '한어 병음', 3),
+('音', '漢語 拼音', '한어 병음', 4),
+('漢', '漢越語', '한월어', 0),
+('越', '漢越語', '한월어', 1),
+('語', '漢越語', '한월어', 2),
+('漢', '漢陽', '한양', 0),
+('陽', '漢陽', '한양', 1),
+('漢', '漢拏山', '한라산', 0),
+('拏', '漢拏山', '한라산', 1),
+('山', '漢拏山', '한라산', 2),
+('漣', '漣痕', '연흔', 0),
+('痕', '漣痕', '연흔', 1),
+('漫', '漫畫', '만화', 0),
+('畫', '漫畫', '만화', 1),
+('漫', '漫畫冊', '만화책', 0),
+('畫', '漫畫冊', '만화책', 1),
+('冊', '漫畫冊', '만화책', 2),
+('漫', '漫畫家', '만화가', 0),
+('畫', '漫畫家', '만화가', 1),
+('家', '漫畫家', '만화가', 2),
+('漫', '漫畫房', '만화방', 0),
+('畫', '漫畫房', '만화방', 1),
+('房', '漫畫房', '만화방', 2),
+('漫', '漫畵', '만화', 0),
+('畵', '漫畵', '만화', 1),
+('漫', '漫畵家', '만화가', 0),
+('畵', '漫畵家', '만화가', 1),
+('家', '漫畵家', '만화가', 2),
+('漫', '漫畵映畵', '만화영화', 0),
+('畵', '漫畵映畵', '만화영화', 1),
+('映', '漫畵映畵', '만화영화', 2),
+('畵', '漫畵映畵', '만화영화', 3),
+('漫', '漫談', '만담', 0),
+('談', '漫談', '만담', 1),
+('漫', '漫遊', '만유', 0),
+('遊', '漫遊', '만유', 1),
+('漸', '漸入佳境', '점입가경', 0),
+('入', '漸入佳境', '점입가경', 1),
+('佳', '漸入佳境', '점입가경', 2),
+('境', '漸入佳境', '점입가경', 3),
+('漸', '漸次', '점차', 0),
+('次', '漸次', '점차', 1),
+('漸', '漸漸', '점점', 0),
+('漸', '漸漸', '점점', 1),
+('漿', '漿果', '장과', 0),
+('果', '漿果', '장과', 1),
+('漿', '漿水', '장수', 0),
+('水', '漿水', '장수', 1),
+('潑', '潑剌', '발랄', 0),
+('剌', '潑剌', '발랄', 1),
+('潑', '潑皮', '발피', 0),
+('皮', '潑皮', '발피', 1),
+('潔', '潔白', '결백', 0),
+('白', '潔白', '결백', 1),
+('潛', '潛伏', '잠복', 0),
+('伏', '潛伏', '잠복', 1),
+('潛', '潛在', '잠재', 0),
+('在', '潛在', '잠재', 1),
+('潛', '潛在力', '잠재력', 0),
+('在', '潛在力', '잠재력', 1),
+('力', '潛在力', '잠재력', 2),
+('潛', '潛望鏡', '잠망경', 0),
+('望', '潛望鏡', '잠망경', 1),
+('鏡', '潛望鏡', '잠망경', 2),
+('潛', '潛水', '잠수', 0),
+('水', '潛水', '잠수', 1),
+('潛', '潛水服', '잠수복', 0),
+('水', '潛水服', '잠수복', 1),
+('服', '潛水服', '잠수복', 2),
+('潛', '潛水艇', '잠수정', 0),
+('水', '潛水艇', '잠수정', 1),
+('艇', '潛水艇', '잠수정', 2),
+('潛', '潛水艦', '잠수함', 0),
+('水', '潛水艦', '잠수함', 1),
+('艦', '潛水艦', '잠수함', 2),
+('潛', '潛水鐘', '잠수종', 0),
+('水', '潛水鐘', '잠수종', 1),
+('鐘', '潛水鐘', '잠수종', 2),
+('潛', '潛熱', '잠열', 0),
+('熱', '潛熱', '잠열', 1),
+('潤', '潤', '윤', 0),
+('潤', '潤滑劑', '윤활제', 0),
+('滑', '潤滑劑', '윤활제', 1),
+('劑', '潤滑劑', '윤활제', 2),
+('潤', '潤滑油', '윤활유', 0),
+('滑', '潤滑油', '윤활유', 1),
+('油', '潤滑油', '윤활유', 2),
+('潤', '潤澤', '윤택', 0),
+('澤', '潤澤', '윤택', 1),
+('潮', '潮流', '조류', 0),
+('流', '潮流', '조류', 1),
+('潰', '潰瘍', '궤양', 0),
+('瘍', '潰瘍', '궤양', 1),
+('潰', '潰走', '궤주', 0),
+('走', '潰走', '궤주', 1),
+('澤', '澤', '택', 0),
+('澱', '澱粉', '전분', 0),
+('粉', '澱粉', '전분', 1),
+('澹', '澹泊', '담박', 0),
+('泊', '澹泊', '담박', 1),
+('激', '激勵', '격려', 0),
+('勵', '激勵', '격려', 1),
+('激', '激怒', '격노', 0),
+('怒', '激怒', '격노', 1),
+('激', '激情', '격정', 0),
+('情', '激情', '격정', 1),
+('激', '激戰', '격전', 0),
+('戰', '激戰', '격전', 1),
+('濁', '濁酒', '탁주', 0),
+('酒', '濁酒', '탁주', 1),
+('濁', '濁點', '탁점', 0),
+('點', '濁點', '탁점', 1),
+('濃', '濃密', '농밀', 0),
+('密', '濃密', '농밀', 1),
+('濃', '濃淡', '농담', 0),
+('淡', '濃淡', '농담', 1),
+('濃', '濃霧', '농무', 0),
+('霧', '濃霧', '농무', 1),
+('濊', '濊', '예', 0),
+('濕', '濕', '습', 0),
+('濕', '濕地', '습지', 0),
+('地', '濕地', '습지', 1),
+('濕', '濕地帶', '습지대', 0),
+('地', '濕地帶', '습지대', 1),
+('帶', '濕地帶', '습지대', 2),
+('濕', '濕度', '습도', 0),
+('度', '濕度', '습도', 1),
+('濕', '濕式暖房', '습식난방', 0),
+('式', '濕式暖房', '습식난방', 1),
+('暖', '濕式暖房', '습식난방', 2),
+('房', '濕式暖房', '습식난방', 3),
+('濕', '濕式煖房', '습식난방', 0),
+('式', '濕式煖房', '습식난방', 1),
+('煖', '濕式煖房', '습식난방', 2),
+('房', '濕式煖房', '습식난방', 3),
+('濕', '濕性', '습성', 0),
+('性', '濕性', '습성', 1),
+('濕', '濕氣', '습기', 0),
+('氣', '濕氣', '습기', 1),
+('濕', '濕潤', '습윤', 0),
+('潤', '濕潤', '습윤', 1),
+('濕', '濕疹', '습진', 0),
+('疹', '濕疹', '습진', 1),
+('濕', '濕紙', '습지', 0),
+('紙', '濕紙', '습지', 1),
+('濟', '濟州', '제주', 0),
+('州', '濟州', '제주', 1),
+('濟', '濟州—', '제주말', 0),
+('州', '濟州—', '제주말', 1),
+('—', '濟州—', '제주말', 2),
+('濟', '濟州島', '제주도', 0),
+('州', '濟州島', '제주도', 1),
+('島', '濟州島', '제주도', 2),
+('濟', '濟州語', '제주어', 0),
+('州', '濟州語', '제주어', 1),
+('語', '濟州語', '제주어', 2),
+('濟', '濟州道', '제주도', 0),
+('州', '濟州道', '제주도', 1),
+('道', '濟州道', '제주도', 2),
+('濠', '濠', '호', 0),
+('濠', '濠斯太剌利亞', '호사태랄리아', 0),
+('斯', '濠斯太剌利亞', '호사태랄리아', 1),
+('太', '濠斯太剌利亞', '호사태랄리아', 2),
+('剌', '濠斯太剌利亞', '호사태랄리아', 3),
+('利', '濠斯太剌利亞', '호사태랄리아', 4),
+('亞', '濠斯太剌利亞', '호사태랄리아', 5),
+('濠', '濠洲', '호주', 0),
+('洲', '濠洲', '호주', 1),
+('濠', '濠洲人', '호주인', 0),
+('洲', '濠洲人', '호주인', 1),
+('人', '濠洲人', '호주인', 2),
+('濫', '濫伐', '남벌', 0),
+('伐', '濫伐', '남벌', 1),
+('濫', '濫用', '남용', 0),
+('用', '濫用', '남용', 1),
+('濾', '濾過', '여과', 0),
+('過', '濾過', '여과', 1),
+('濾', '濾過器', '여과기', 0),
+('過', '濾過器', '여과기', 1),
+('器', '濾過器', '여과기', 2),
+('瀉', '瀉下', '사하', 0),
+('下', '瀉下', '사하', 1),
+('瀉', '瀉血', '사혈', 0),
+('血', '瀉血', '사혈', 1),
+('瀑', '瀑布', '폭포', 0),
+('布', '瀑布', '폭포', 1),
+('灌', '灌木', '관목', 0),
+('木', '灌木', '관목', 1),
+('灌', '灌水', '관수', 0),
+('水', '灌水', '관수', 1),
+('灌', '灌漑', '관개', 0),
+('漑', '灌漑', '관개', 1),
+('灌', '灌腸', '관장', 0),
+('腸', '灌腸', '관장', 1),
+('灣', '灣', '만', 0),
+('灣', '灣流', '만류', 0),
+('流', '灣流', '만류', 1),
+('火', '火', '화', 0),
+('火', '火--', '화나다', 0),
+('-', '火--', '화나다', 1),
+('-', '火--', '화나다', 2),
+('火', '火傷', '화상', 0),
+('傷', '火傷', '화상', 1),
+('火', '火兵', '화병', 0),
+('兵', '火兵', '화병', 1),
+('火', '火刑', '화형', 0),
+('刑', '火刑', '화형', 1),
+('火', '火力', '화력', 0),
+('力', '火力', '화력', 1),
+('火', '火器', '화기', 0),
+('器', '火器', '화기', 1),
+('火', '火夫', '화부', 0),
+('夫', '火夫', '화부', 1),
+('火', '火山', '화산', 0),
+('山', '火山', '화산', 1),
+('火', '火山地帶', '화산지대', 0),
+('山', '火山地帶', '화산지대', 1),
+('地', '火山地帶', '화산지대', 2),
+('帶', '火山地帶', '화산지대', 3),
+('火', '火山學', '화산학', 0),
+('山', '火山學', '화산학', 1),
+('學', '火山學', '화산학', 2),
+('火', '火山島', '화산도', 0),
+('山', '火山島', '화산도', 1),
+('島', '火山島', '화산도', 2),
+('火', '火急', '화급', 0),
+('急', '火急', '화급', 1),
+('火', '火斗', '화두', 0),
+('斗', '火斗', '화두', 1),
+('火', '火曜日', '화요일', 0),
+('曜', '火曜日', '화요일', 1),
+('日', '火曜日', '화요일', 2),
+('火', '火木', '화목', 0),
+('木', '火木', '화목', 1),
+('火', '火災', '화재', 0),
+('災', '火災', '화재', 1),
+('火', '火炎', '화염', 0),
+('炎', '火炎', '화염', 1),
+('火', '火焰', '화염', 0),
+('焰', '火焰', '화염', 1),
+('火', '火焰放射器', '화염방사기', 0),
+('焰', '火焰放射器', '화염방사기', 1),
+('放', '火焰放射器', '화염방사기', 2),
+('射', '火焰放射器', '화염방사기', 3),
+('器', '火焰放射器', '화염방사기', 4),
+('火', '火焰甁', '화염병', 0),
+('焰', '火焰甁', '화염병', 1),
+('甁', '火焰甁', '화염병', 2),
+('火', '火爐', '화로', 0),
+('爐', '火爐', '화로', 1),
+('火', '火田', '화전', 0),
+('田', '火田', '화전', 1),
+('火', '火病', '화병', 0),
+('病', '火病', '화병', 1),
+('火', '火繩銃', '화승총', 0),
+('繩', '火繩銃', '화승총', 1),
+('銃', '火繩銃', '화승총', 2),
+('火', '火葬', '화장', 0),
+('葬', '火葬', '화장', 1),
+('火', '火葬場', '화장장', 0),
+('葬', '火葬場', '화장장', 1),
+('場', '火葬場', '화장장', 2),
+('火', '火藥', '화약', 0),
+('藥', '火藥', '화약', 1),
+('火', '火車', '화차', 0),
+('車', '火車', '화차', 1),
+('火', '火頭', '화두', 0),
+('頭', '火頭', '화두', 1),
+('火', '火食', '화식', 0),
+('食', '火食', '화식', 1),
+('火', '火餠', '화병', 0),
+('餠', '火餠', '화병', 1),
+('灰', '灰燼', '회신', 0),
+('燼', '灰燼', '회신', 1),
+('灰', '灰白質', '회백질', 0),
+('白', '灰白質', '회백질', 1),
+('質', '灰白質', '회백질', 2),
+('灰', '灰色', '회색', 0),
+('色', '灰色', '회색', 1),
+('灰', '灰色分子', '회색분자', 0),
+('色', '灰色分子', '회색분자', 1),
+('分', '灰色分子', '회색분자', 2),
+('子', '灰色分子', '회색분자', 3),
+('灰', '灰色기러기', '회색기러기', 0),
+('色', '灰色기러기', '회색기러기', 1),
+('기', '灰色기러기', '회색기러기', 2),
+('러', '灰色기러기', '회색기러기', 3),
+('기', '灰色기러기', '회색기러기', 4),
+('災', '災厄', '재액', 0),
+('厄', '災厄', '재액', 1),
+('災', '災害', '재해', 0),
+('害', '災害', '재해', 1),
+('災', '災殃', '재앙', 0),
+('殃', '災殃', '재앙', 1),
+('災', '災難', '재난', 0),
+('難', '災難', '재난', 1),
+('炎', '炎', '염', 0),
+('炎', '炎火', '염화', 0),
+('火', '炎火', '염화', 1),
+('炎', '炎症', '염증', 0),
+('症', '炎症', '염증', 1),
+('炕', '炕', '강', 0),
+('炙', '炙', '적', 0),
+('炭', '炭化', '탄화', 0),
+('化', '炭化', '탄화', 1),
+('炭', '炭化水素', '탄화수소', 0),
+('化', '炭化水素', '탄화수소', 1),
+('水', '炭化水素', '탄화수소', 2),
+('素', '炭化水素', '탄화수소', 3),
+('炭', '炭坑', '탄갱', 0),
+('坑', '炭坑', '탄갱', 1),
+('炭', '炭層', '탄층', 0),
+('層', '炭層', '탄층', 1),
+('炭', '炭水化物', '탄수화물', 0),
+('水', '炭水化物', '탄수화물', 1),
+('化', '炭水化物', '탄수화물', 2),
+('物', '炭水化物', '탄수화물', 3),
+('炭', '炭田', '탄전', 0),
+('田', '炭田', '탄전', 1),
+('炭', '炭素', '탄소', 0),
+('素', '炭素', '탄소', 1),
+('炭', '炭酸', '탄산', 0),
+('酸', '炭酸', '탄산', 1),
+('炭', '炭鑛', '탄광', 0),
+('鑛', '炭鑛', '탄광', 1),
+('炸', '炸裂', '작렬', 0),
+('裂', '炸裂', '작렬', 1),
+('為', '為國', '위국', 0),
+('國', '為國', '위국', 1),
+('烈', '烈士', '열사', 0),
+('士', '烈士', '열사', 1),
+('烈', '烈火', '열화', 0),
+('火', '烈火', '열화', 1),
+('烏', '烏桓', '오환', 0),
+('桓', '烏桓', '오환', 1),
+('烙', '烙印', '낙인', 0),
+('印', '烙印', '낙인', 1),
+('烽', '烽火', '봉화', 0),
+('火', '烽火', '봉화', 1),
+('焚', '焚書', '분서', 0),
+('書', '焚書', '분서', 1),
+('焚', '焚書坑儒', '분서갱유', 0),
+('書', '焚書坑儒', '분서갱유', 1),
+('坑', '焚書坑儒', '분서갱유', 2),
+('儒', '焚書坑儒', '분서갱유', 3),
+('焚', '焚蕩—', '분탕질', 0),
+('蕩', '焚蕩—', '분탕질', 1),
+('—', '焚蕩—', '분탕질', 2),
+('無', '無', '무', 0),
+('無', '無乳', '무유', 0),
+('乳', '無乳', '무유', 1),
+('無', '無事', '무사', 0),
+('事', '無事', '무사', 1),
+('無', '無人', '무인', 0),
+('人', '無人', '무인', 1),
+('無', '無人島', '무인도', 0),
+('人', '無人島', '무인도', 1),
+('島', '無人島', '무인도', 2),
+('無', '無人店鋪', '무인점포', 0),
+('人', '無人店鋪', '무인점포', 1),
+('店', '無人店鋪', '무인점포', 2),
+('鋪', '無人店鋪', '무인점포', 3),
+('無', '無人航空機', '무인항공기', 0),
+('人', '無人航空機', '무인항공기', 1),
+('航', '無人航空機', '무인항공기', 2),
+('空', '無人航空機', '무인항공기', 3),
+('機', '無人航空機', '무인항공기', 4),
+('無', '無作爲', '무작위', 0),
+('作', '無作爲', '무작위', 1),
+('爲', '無作爲', '무작위', 2),
+('無', '無分別', '무분별', 0),
+('分', '無分別', '무분별', 1),
+('別', '無分別', '무분별', 2),
+('無', '無力', '무력', 0),
+('力', '無力', '무력', 1),
+('無', '無勝負', '무승부', 0),
+('勝', '無勝負', '무승부', 1),
+('負', '無勝負', '무승부', 2),
+('無', '無名', '무명', 0),
+('名', '無名', '무명', 1),
+('無', '無國籍', '무국적', 0),
+('國', '無國籍', '무국적', 1),
+('籍', '無國籍', '무국적', 2),
+('無', '無始', '무시', 0),
+('始', '無始', '무시', 1),
+('無', '無差別', '무차별', 0),
+('差', '無差別', '무차별', 1),
+('別', '無差別', '무차별', 2),
+('無', '無彩色', '무채색', 0),
+('彩', '無彩色', '무채색', 1),
+('色', '無彩色', '무채색', 2),
+('無', '無心', '무심', 0),
+('心', '無心', '무심', 1),
+('無', '無性愛', '무성애', 0),
+('性', '無性愛', '무성애', 1),
+('愛', '無性愛', '무성애', 2),
+('無', '無情', '무정', 0),
+('情', '無情', '무정', 1),
+('無', '無意味', '무의미', 0),
+('意', '無意味', '무의미', 1),
+('味', '無意味', '무의미', 2),
+('無', '無慮', '무려', 0),
+('慮', '無慮', '무려', 1),
+('無', '無我', '무아', 0),
+('我', '無我', '무아', 1),
+('無', '無我夢中', '무아몽중', 0),
+('我', '無我夢中', '무아몽중', 1),
+('夢', '無我夢中', '무아몽중', 2),
+('中', '無我夢中', '무아몽중', 3),
+('無', '無所不知', '무소부지', 0),
+('所', '無所不知', '무소부지', 1),
+('不', '無所不知', '무소부지', 2),
+('知', '無所不知', '무소부지', 3),
+('無', '無所屬', '무소속', 0),
+('所', '無所屬', '무소속', 1),
+('屬', '無所屬', '무소속', 2),
+('無', '無所有', '무소유', 0),
+('所', '無所有', '무소유', 1),
+('有', '無所有', '무소유', 2),
+('無', '無政府', '무정부', 0),
+('政', '無政府', '무정부', 1),
+('府', '無政府', '무정부', 2),
+('無', '無政府 狀態', '무정부 상태', 0),
+('政', '無政府 狀態', '무정부 상태', 1),
+('府', '無政府 狀態', '무정부 상태', 2),
+('狀', '無政府 狀態', '무정부 상태', 4),
+('態', '無政府 狀態', '무정부 상태', 5),
+('無', '無政府主義', '무정부주의', 0),
+('政', '無政府主義', '무정부주의', 1),
+('府', '無政府主義', '무정부주의', 2),
+('主', '無政府主義', '무정부주의', 3),
+('義', '無政府主義', '무정부주의', 4),
+('無', '無故', '무고', 0),
+('故', '無故', '무고', 1),
+('無', '無數', '무수', 0),
+('數', '無數', '무수', 1),
+('無', '無料', '무료', 0),
+('料', '無料', '무료', 1),
+('無', '無斷', '무단', 0),
+('斷', '無斷', '무단', 1),
+('無', '無明', '무명', 0),
+('明', '無明', '무명', 1),
+('無', '無時', '무시', 0),
+('時', '無時', '무시', 1),
+('無', '無條件', '무조건', 0),
+('條', '無條件', '무조건', 1),
+('件', '無條件', '무조건', 2),
+('無', '無機', '무기', 0),
+('機', '無機', '무기', 1),
+('無', '無死', '무사', 0),
+('死', '無死', '무사', 1),
+('無', '無氣力', '무기력', 0),
+('氣', '無氣力', '무기력', 1),
+('力', '無氣力', '무기력', 2),
+('無', '無水', '무수', 0),
+('水', '無水', '무수', 1),
+('無', '無法', '무법', 0),
+('法', '無法', '무법', 1),
+('無', '無法者', '무법자', 0),
+('法', '無法者', '무법자', 1),
+('者', '無法者', '무법자', 2),
+('無', '無爲', '무위', 0),
+('爲', '無爲', '무위', 1),
+('無', '無理', '무리', 0),
+('理', '無理', '무리', 1),
+('無', '無産階級', '무산계급', 0),
+('産', '無産階級', '무산계급', 1),
+('階', '無産階級', '무산계급', 2),
+('級', '無産階級', '무산계급', 3),
+('無', '無用', '무용', 0),
+('用', '無用', '무용', 1),
+('無', '無盡', '무진', 0),
+('盡', '無盡', '무진', 1),
+('無', '無盡藏', '무진장', 0),
+('盡', '無盡藏', '무진장', 1),
+('藏', '無盡藏', '무진장', 2),
+('無', '無知', '무지', 0),
+('知', '無知', '무지', 1),
+('無', '無神經', '무신경', 0),
+('神', '無神經', '무신경', 1),
+('經', '無神經', '무신경', 2),
+('無', '無神論', '무신론', 0),
+('神', '無神論', '무신론', 1),
+('論', '無神論', '무신론', 2),
+('無', '無神論者', '무신론자', 0),
+('神', '無神論者', '무신론자', 1),
+('論', '無神論者', '무신론자', 2),
+('者', '無神論者', '무신론자', 3),
+('無', '無禮', '무례', 0),
+('禮', '無禮', '무례', 1),
+('無', '無秩序', '무질서', 0),
+('秩', '無秩序', '무질서', 1),
+('序', '無秩序', '무질서', 2),
+('無', '無窮', '무궁', 0),
+('窮', '無窮', '무궁', 1),
+('無', '無窮花', '무궁화', 0),
+('窮', '無窮花', '무궁화', 1),
+('花', '無窮花', '무궁화', 2),
+('無', '無終', '무종', 0),
+('終', '無終', '무종', 1),
+('無', '無線', '무선', 0),
+('線', '無線', '무선', 1),
+('無', '無線呼出機', '무선호출기', 0),
+('線', '無線呼出機', '무선호출기', 1),
+('呼', '無線呼出機', '무선호출기', 2),
+('出', '無線呼出機', '무선호출기', 3),
+('機', '無線呼出機', '무선호출기', 4),
+('無', '無線局', '무선국', 0),
+('線', '無線局', '무선국', 1),
+('局', '無線局', '무선국', 2),
+('無', '無線電話', '무선전화', 0),
+('線', '無線電話', '무선전화', 1),
+('電', '無線電話', '무선전화', 2),
+('話', '無線電話', '무선전화', 3),
+('無', '無罪', '무죄', 0),
+('罪', '無罪', '무죄', 1),
+('無', '無聊', '무료', 0),
+('聊', '無聊', '무료', 1),
+('無', '無能', '무능', 0),
+('能', '無能', '무능', 1),
+('無', '無能力', '무능력', 0),
+('能', '無能力', '무능력', 1),
+('力', '無能力', '무능력', 2),
+('無', '無能力者', '무능력자', 0),
+('能', '無能力者', '무능력자', 1),
+('力', '無能力者', '무능력자', 2),
+('者', '無能力者', '무능력자', 3),
+('無', '無脊椎', '무척추', 0),
+('脊', '無脊椎', '무척추', 1),
+('椎', '無脊椎', '무척추', 2),
+('無', '無脊椎動物', '무척추동물', 0),
+('脊', '無脊椎動物', '무척추동물', 1),
+('椎', '無脊椎動物', '무척추동물', 2),
+('動', '無脊椎動物', '무척추동물', 3),
+('物', '無脊椎動物', '무척추동물', 4),
+('無', '無臭', '무취', 0),
+('臭', '無臭', '무취', 1),
+('無', '無色', '무색', 0),
+('色', '無色', '무색', 1),
+('無', '無花果', '무화과', 0),
+('花', '無花果', '무화과', 1),
+('果', '無花果', '무화과', 2),
+('無', '無視', '무시', 0),
+('視', '無視', '무시', 1),
+('無', '無言劇', '무언극', 0),
+('言', '無言劇', '무언극', 1),
+('劇', '無言劇', '무언극', 2),
+('無', '無言歌', '무언가', 0),
+('言', '無言歌', '무언가', 1),
+('歌', '無言歌', '무언가', 2),
+('無', '無言症', '무언증', 0),
+('言', '無言症', '무언증', 1),
+('症', '無言症', '무언증', 2),
+('無', '無責任', '무책임', 0),
+('責', '無責任', '무책임', 1),
+('任', '無責任', '무책임', 2),
+('無', '無酵餠', '무교병', 0),
+('酵', '無酵餠', '무교병', 1),
+('餠', '無酵餠', '무교병', 2),
+('無', '無重力', '무중력', 0),
+('重', '無重力', '무중력', 1),
+('力', '無重力', '무중력', 2),
+('無', '無重量', '무중량', 0),
+('重', '無重量', '무중량', 1),
+('量', '無重量', '무중량', 2),
+('無', '無間地獄', '무간지옥', 0),
+('間', '無間地獄', '무간지옥', 1),
+('地', '無間地獄', '무간지옥', 2),
+('獄', '無間地獄', '무간지옥', 3),
+('無', '無關心', '무관심', 0),
+('關', '無關心', '무관심', 1),
+('心', '無關心', '무관심', 2),
+('無', '無限', '무한', 0),
+('限', '無限', '무한', 1),
+('無', '無雙', '무쌍', 0),
+('雙', '無雙', '무쌍', 1),
+('無', '無風', '무풍', 0),
+('風', '無風', '무풍', 1),
+('焦', '焦燥', '초조', 0),
+('燥', '焦燥', '초조', 1),
+('焦', '焦穫', '초호', 0),
+('穫', '焦穫', '초호', 1),
+('焦', '焦點', '초점', 0),
+('點', '焦點', '초점', 1),
+('煉', '煉乳', '연유', 0),
+('乳', '煉乳', '연유', 1),
+('煉', '煉炭', '연탄', 0),
+('炭', '煉炭', '연탄', 1),
+('煉', '煉獄', '연옥', 0),
+('獄', '煉獄', '연옥', 1),
+('煎', '煎', '전', 0),
+('煖', '煖房', '난방', 0),
+('房', '煖房', '난방', 1),
+('煖', '煖爐', '난로', 0),
+('爐', '煖爐', '난로', 1),
+('煙', '煙幕', '연막', 0),
+('幕', '煙幕', '연막', 1),
+('煙', '煙樹', '연수', 0),
+('樹', '煙樹', '연수', 1),
+('煙', '煙氣', '연기', 0),
+('氣', '煙氣', '연기', 1),
+('煙', '煙草', '연초', 0),
+('草', '煙草', '연초', 1),
+('煙', '煙道', '연도', 0),
+('道', '煙道', '연도', 1),
+('煙', '煙霧', '연무', 0),
+('霧', '煙霧', '연무', 1),
+('煙', '煙霧質', '연무질', 0),
+('霧', '煙霧質', '연무질', 1),
+('質', '煙霧質', '연무질', 2),
+('煞', '煞', '살', 0),
+('煤', '煤炭', '매탄', 0),
+('炭', '煤炭', '매탄', 1),
+('照', '照射', '조사', 0),
+('射', '照射', '조사', 1),
+('照', '照度', '조도', 0),
+('度', '照度', '조도', 1),
+('照', '照明', '조명', 0),
+('明', '照明', '조명', 1),
+('照', '照會', '조회', 0),
+('會', '照會', '조회', 1),
+('照', '照會數', '조회수', 0),
+('會', '照會數', '조회수', 1),
+('數', '照會數', '조회수', 2),
+('照', '照査', '조사', 0),
+('査', '照査', '조사', 1),
+('照', '照校', '조교', 0),
+('校', '照校', '조교', 1),
+('煩', '煩忙', '번망', 0),
+('忙', '煩忙', '번망', 1),
+('煩', '煩惱', '번뇌', 0),
+('惱', '煩惱', '번뇌', 1),
+('煩', '煩文', '번문', 0),
+('文', '煩文', '번문', 1),
+('煩', '煩雜', '번잡', 0),
+('雜', '煩雜', '번잡', 1),
+('煽', '煽動', '선동', 0),
+('動', '煽動', '선동', 1),
+('煽', '煽動者', '선동자', 0),
+('動', '煽動者', '선동자', 1),
+('者', '煽動者', '선동자', 2),
+('熔', '熔化', '용화', 0),
+('化', '熔化', '용화', 1),
+('熔', '熔岩', '용암', 0),
+('岩', '熔岩', '용암', 1),
+('熔', '熔着', '용착', 0),
+('着', '熔着', '용착', 1),
+('熔', '熔融', '용융', 0),
+('融', '熔融', '용융', 1),
+('熔', '熔解', '용해', 0),
+('解', '熔解', '용해', 1),
+('熙', '熙川', '희천', 0),
+('川', '熙川', '희천', 1),
+('熟', '熟成', '숙성', 0),
+('成', '熟成', '숙성', 1),
+('熟', '熟手', '숙수', 0),
+('手', '熟手', '숙수', 1),
+('熟', '熟水', '숙수', 0),
+('水', '熟水', '숙수', 1),
+('熟', '熟畓', '숙답', 0),
+('畓', '熟畓', '숙답', 1),
+('熟', '熟睡', '숙수', 0),
+('睡', '熟睡', '숙수', 1),
+('熟', '熟練者', '숙련자', 0),
+('練', '熟練者', '숙련자', 1),
+('者', '熟練者', '숙련자', 2),
+('熟', '熟考', '숙고', 0),
+('考', '熟考', '숙고', 1),
+('熟', '熟語', '숙어', 0),
+('語', '熟語', '숙어', 1),
+('熟', '熟語集', '숙어집', 0),
+('語', '熟語集', '숙어집', 1),
+('集', '熟語集', '숙어집', 2),
+('熟', '熟讀', '숙독', 0),
+('讀', '熟讀', '숙독', 1),
+('熟', '熟達', '숙달', 0),
+('達', '熟達', '숙달', 1),
+('熟', '熟鍊', '숙련', 0),
+('鍊', '熟鍊', '숙련', 1),
+('熱', '熱', '열', 0),
+('熱', '熱中', '열중', 0),
+('中', '熱中', '열중', 1),
+('熱', '熱中症', '열중증', 0),
+('中', '熱中症', '열중증', 1),
+('症', '熱中症', '열중증', 2),
+('熱', '熱傷', '열상', 0),
+('傷', '熱傷', '열상', 1),
+('熱', '熱力學', '열역학', 0),
+('力', '熱力學', '열역학', 1),
+('學', '熱力學', '열역학', 2),
+('熱', '熱化學', '열화학', 0),
+('化', '熱化學', '열화학', 1),
+('學', '熱化學', '열화학', 2),
+('熱', '熱學', '열학', 0),
+('學', '熱學', '열학', 1),
+('熱', '熱容量', '열용량', 0),
+('容', '熱容量', '열용량', 1),
+('量', '熱容量', '열용량', 2),
+('熱', '熱射病', '열사병', 0),
+('射', '熱射病', '열사병', 1),
+('病', '熱射病', '열사병', 2),
+('熱', '熱帶', '열대', 0),
+('帶', '熱帶', '열대', 1),
+('熱', '熱帶林', '열대림', 0),
+('帶', '熱帶林', '열대림', 1),
+('林', '熱帶林', '열대림', 2),
+('熱', '熱帶雨林', '열대우림', 0),
+('帶', '熱帶雨林', '열대우림', 1),
+('雨', '熱帶雨林', '열대우림', 2),
+('林', '熱帶雨林', '열대우림', 3),
+('熱', '熱度', '열도', 0),
+('度', '熱度', '열도', 1),
+('熱', '熱心', '열심', 0),
+('心', '熱心', '열심', 1),
+('熱', '熱情', '열정', 0),
+('情', '熱情', '열정', 1),
+('熱', '熱意', '열의', 0),
+('意', '熱意', '열의', 1),
+('熱', '熱愛', '열애', 0),
+('愛', '熱愛', '열애', 1),
+('熱', '熱核', '열핵', 0),
+('核', '熱核', '열핵', 1),
+('熱', '熱氣', '열기', 0),
+('氣', '熱氣', '열기', 1),
+('熱', '熱氣球', '열기구', 0),
+('氣', '熱氣球', '열기구', 1),
+('球', '熱氣球', '열기구', 2),
+('熱', '熱波', '열파', 0),
+('波', '熱波', '열파', 1),
+('熱', '熱湯', '열탕', 0),
+('湯', '熱湯', '열탕', 1),
+('熱', '熱源', '열원', 0),
+('源', '熱源', '열원', 1),
+('熱', '熱演', '열연', 0),
+('演', '熱演', '열연', 1),
+('熱', '熱火', '열화', 0),
+('火', '熱火', '열화', 1),
+('熱', '熱狂', '열광', 0),
+('狂', '熱狂', '열광', 1),
+('熱', '熱狂者', '열광자', 0),
+('狂', '熱狂者', '열광자', 1),
+('者', '熱狂者', '열광자', 2),
+('熱', '熱病', '열병', 0),
+('病', '熱病', '열병', 1),
+('熱', '熱目魚', '열목어', 0),
+('目', '熱目魚', '열목어', 1),
+('魚', '熱目魚', '열목어', 2),
+('熱', '熱砂', '열사', 0),
+('砂', '熱砂', '열사', 1),
+('熱', '熱禱', '열도', 0),
+('禱', '熱禱', '열도', 1),
+('熱', '熱線', '열선', 0),
+('線', '熱線', '열선', 1),
+('熱', '熱處理', '열처리', 0),
+('處', '熱處理', '열처리', 1),
+('理', '熱處理', '열처리', 2),
+('熱', '熱血', '열혈', 0),
+('血', '熱血', '열혈', 1),
+('熱', '熱辯', '열변', 0),
+('辯', '熱辯', '열변', 1),
+('熱', '熱量', '열량', 0),
+('量', '熱量', '열량', 1),
+('熱', '熱量計', '열량계', 0),
+('量', '熱量計', '열량계', 1),
+('計', '熱量計', '열량계', 2),
+('熱', '熱雲', '열운', 0),
+('雲', '熱雲', '열운', 1),
+('熱', '熱願', '열원', 0),
+('願', '熱願', '열원', 1),
+('熱', '熱鬧', '열뇨', 0),
+('鬧', '熱鬧', '열뇨', 1),
+('熾', '熾烈', '치열', 0),
+('烈', '熾烈', '치열', 1),
+('熾', '熾熱', '치열', 0),
+('熱', '熾熱', '치열', 1),
+('燃', '燃料', '연료', 0),
+('料', '燃料', '연료', 1),
+('燃', '燃燒', '연소', 0),
+('燒', '燃燒', '연소', 1),
+('燈', '燈', '등', 0),
+('燈', '燈—', '등불', 0),
+('—', '燈—', '등불', 1),
+('燈', '燈光', '등광', 0),
+('光', '燈光', '등광', 1),
+('燈', '燈心', '등심', 0),
+('心', '燈心', '등심', 1),
+('燈', '燈油', '등유', 0),
+('油', '燈油', '등유', 1),
+('燈', '燈皮', '등피', 0),
+('皮', '燈皮', '등피', 1),
+('燈', '燈盞', '등잔', 0),
+('盞', '燈盞', '등잔', 1),
+('燈', '燈籠', '등롱', 0),
+('籠', '燈籠', '등롱', 1),
+('燈', '燈臺', '등대', 0),
+('臺', '燈臺', '등대', 1),
+('燐', '燐', '린', 0),
+('燐', '燐', '인', 0),
+('燐', '燐光', '인광', 0),
+('光', '燐光', '인광', 1),
+('燐', '燐灰石', '인회석', 0),
+('灰', '燐灰石', '인회석', 1),
+('石', '燐灰石', '인회석', 2),
+('燐', '燐素', '인소', 0),
+('素', '燐素', '인소', 1),
+('燒', '燒却', '소각', 0),
+('却', '燒却', '소각', 1),
+('燒', '燒夷彈', '소이탄', 0),
+('夷', '燒夷彈', '소이탄', 1),
+('彈', '燒夷彈', '소이탄', 2),
+('燒', '燒酒', '소주', 0),
+('酒', '燒酒', '소주', 1),
+('燒', '燒麥', '소맥', 0),
+('麥', '燒麥', '소맥', 1),
+('燕', '燕岐', '연기', 0),
+('岐', '燕岐', '연기', 1),
+('燕', '燕窩', '연와', 0),
+('窩', '燕窩', '연와', 1),
+('燕', '燕窩湯', '연와탕', 0),
+('窩', '燕窩湯', '연와탕', 1),
+('湯', '燕窩湯', '연와탕', 2),
+('燕', '燕趙悲歌士', '연조비가사', 0),
+('趙', '燕趙悲歌士', '연조비가사', 1),
+('悲', '燕趙悲歌士', '연조비가사', 2),
+('歌', '燕趙悲歌士', '연조비가사', 3),
+('士', '燕趙悲歌士', '연조비가사', 4),
+('營', '營倉', '영창', 0),
+('倉', '營倉', '영창', 1),
+('營', '營利', '영리', 0),
+('利', '營利', '영리', 1),
+('營', '營利團體', '영리단체', 0),
+('利', '營利團體', '영리단체', 1),
+('團', '營利團體', '영리단체', 2),
+('體', '營利團體', '영리단체', 3),
+('營', '營利的', '영리적', 0),
+('利', '營利的', '영리적', 1),
+('的', '營利的', '영리적', 2),
+('營', '營業', '영업', 0),
+('業', '營業', '영업', 1),
+('營', '營舍', '영사', 0),
+('舍', '營舍', '영사', 1),
+('營', '營養', '영양', 0),
+('養', '營養', '영양', 1),
+('營', '營養劑', '영양제', 0),
+('養', '營養劑', '영양제', 1),
+('劑', '營養劑', '영양제', 2),
+('營', '營養失調', '영양실조', 0),
+('養', '營養失調', '영양실조', 1),
+('失', '營養失調', '영양실조', 2),
+('調', '營養失調', '영양실조', 3),
+('營', '營養物', '영양물', 0),
+('養', '營養物', '영양물', 1),
+('物', '營養物', '영양물', 2),
+('燥', '燥劑', '조제', 0),
+('劑', '燥劑', '조제', 1),
+('燭', '燭光', '촉광', 0),
+('光', '燭光', '촉광', 1),
+('燭', '燭臺', '촉대', 0),
+('臺', '燭臺', '촉대', 1),
+('燻', '燻煙', '훈연', 0),
+('煙', '燻煙', '훈연', 1),
+('燻', '燻製', '훈제', 0),
+('製', '燻製', '훈제', 1),
+('爆', '爆彈', '폭탄', 0),
+('彈', '爆彈', '폭탄', 1),
+('爆', '爆彈酒', '폭탄주', 0),
+('彈', '爆彈酒', '폭탄주', 1),
+('酒', '爆彈酒', '폭탄주', 2),
+('爆', '爆擊', '폭격', 0),
+('擊', '爆擊', '폭격', 1),
+('爆', '爆擊機', '폭격기', 0),
+('擊', '爆擊機', '폭격기', 1),
+('機', '爆擊機', '폭격기', 2),
+('爆', '爆發', '폭발', 0),
+('發', '爆發', '폭발', 1),
+('爆', '爆發物', '폭발물', 0),
+('發', '爆發物', '폭발물', 1),
+('物', '爆發物', '폭발물', 2),
+('爆', '爆破', '폭파', 0),
+('破', '爆破', '폭파', 1),
+('爆', '爆竹', '폭죽', 0),
+('竹', '爆竹', '폭죽', 1),
+('爆', '爆笑', '폭소', 0),
+('笑', '爆笑', '폭소', 1),
+('爆', '爆藥', '폭약', 0),
+('藥', '爆藥', '폭약', 1),
+('爆', '爆雷', '폭뢰', 0),
+('雷', '爆雷', '폭뢰', 1),
+('爆', '爆風', '폭풍', 0),
+('風', '爆風', '폭풍', 1),
+('爐', '爐', '노', 0),
+('爐', '爐', '로', 0),
+('爬', '爬蟲', '파충', 0),
+('蟲', '爬蟲', '파충', 1),
+('爬', '爬蟲類', '파충류', 0),
+('蟲', '爬蟲類', '파충류', 1),
+('類', '爬蟲類', '파충류', 2),
+('爬', '爬行', '파행', 0),
+('行', '爬行', '파행', 1),
+('爲', '爲', '위', 0),
+('爲', '爲主', '위주', 0),
+('主', '爲主', '위주', 1),
+('爲', '爲國', '위국', 0),
+('國', '爲國', '위국', 1),
+('爵', '爵位', '작위', 0),
+('位', '爵位', '작위', 1),
+('父', '父', '부', 0),
+('父', '父傳子傳', '부전자전', 0),
+('傳', '父傳子傳', '부전자전', 1),
+('子', '父傳子傳', '부전자전', 2),
+('傳', '父傳子傳', '부전자전', 3),
+('父', '父喪', '부상', 0),
+('喪', '父喪', '부상', 1),
+('父', '父女', '부녀', 0),
+('女', '父女', '부녀', 1),
+('父', '父子', '부자', 0),
+('子', '父子', '부자', 1),
+('父', '父權', '부권', 0),
+('權', '父權', '부권', 1),
+('父', '父權制', '부권제', 0),
+('權', '父權制', '부권제', 1),
+('制', '父權制', '부권제', 2),
+('父', '父母', '부모', 0),
+('母', '父母', '부모', 1),
+('父', '父母-', '부모님', 0),
+('母', '父母-', '부모님', 1),
+('-', '父母-', '부모님', 2),
+('父', '父親', '부친', 0),
+('親', '父親', '부친', 1),
+('父', '父親喪', '부친상', 0),
+('親', '父親喪', '부친상', 1),
+('喪', '父親喪', '부친상', 2),
+('父', '父音', '부음', 0),
+('音', '父音', '부음', 1),
+('爽', '爽快', '상쾌', 0),
+('快', '爽快', '상쾌', 1),
+('爾', '爾時', '이시', 0),
+('時', '爾時', '이시', 1),
+('爾', '爾雅', '이아', 0),
+('雅', '爾雅', '이아', 1),
+('片', '片岩', '편암', 0),
+('岩', '片岩', '편암', 1),
+('片', '片手', '편수', 0),
+('手', '片手', '편수', 1),
+('片', '片紙', '편지', 0),
+('紙', '片紙', '편지', 1),
+('片', '片肉', '편육', 0),
+('肉', '片肉', '편육', 1),
+('片', '片道', '편도', 0),
+('道', '片道', '편도', 1),
+('片', '片鱗', '편린', 0),
+('鱗', '片鱗', '편린', 1),
+('版', '版', '판', 0),
+('版', '版圖', '판도', 0),
+('圖', '版圖', '판도', 1),
+('版', '版木', '판목', 0),
+('木', '版木', '판목', 1),
+('版', '版權', '판권', 0),
+('權', '版權', '판권', 1),
+('版', '版畫', '판화', 0),
+('畫', '版畫', '판화', 1),
+('牙', '牙山', '아산', 0),
+('山', '牙山', '아산', 1),
+('牙', '牙箏', '아쟁', 0),
+('箏', '牙箏', '아쟁', 1),
+('牛', '牛乳', '우유', 0),
+('乳', '牛乳', '우유', 1),
+('牛', '牛痘', '우두', 0),
+('痘', '牛痘', '우두', 1),
+('牛', '牛肉', '우육', 0),
+('肉', '牛肉', '우육', 1),
+('牛', '牛舍', '우사', 0),
+('舍', '牛舍', '우사', 1),
+('牛', '牛車', '우차', 0),
+('車', '牛車', '우차', 1),
+('牛', '牛馬', '우마', 0),
+('馬', '牛馬', '우마', 1),
+('牡', '牡丹', '모란', 0),
+('丹', '牡丹', '모란', 1),
+('牡', '牡丹峰', '모란봉', 0),
+('丹', '牡丹峰', '모란봉', 1),
+('峰', '牡丹峰', '모란봉', 2),
+('牧', '牧丹', '목단', 0),
+('丹', '牧丹', '목단', 1),
+('牧', '牧人', '목인', 0),
+('人', '牧人', '목인', 1),
+('牧', '牧場', '목장', 0),
+('場', '牧場', '목장', 1),
+('牧', '牧師', '목사', 0),
+('師', '牧師', '목사', 1),
+('牧', '牧歌的', '목가적', 0),
+('歌', '牧歌的', '목가적', 1),
+('的', '牧歌的', '목가적', 2),
+('牧', '牧畜', '목축', 0),
+('畜', '牧畜', '목축', 1),
+('牧', '牧童', '목동', 0),
+('童', '牧童', '목동', 1),
+('牧', '牧笛', '목적', 0),
+('笛', '牧笛', '목적', 1),
+('牧', '牧羊犬', '목양견', 0),
+('羊', '牧羊犬', '목양견', 1),
+('犬', '牧羊犬', '목양견', 2),
+('牧', '牧者', '목자', 0),
+('者', '牧者', '목자', 1),
+('牧', '牧草', '목초', 0),
+('草', '牧草', '목초', 1),
+('牧', '牧草地', '목초지', 0),
+('草', '牧草地', '목초지', 1),
+('地', '牧草地', '목초지', 2),
+('物', '物件', '물건', 0),
+('件', '物件', '물건', 1),
+('物', '物價', '물가', 0),
+('價', '物價', '물가', 1),
+('物', '物品', '물품', 0),
+('品', '物品', '물품', 1),
+('物', '物權', '물권', 0),
+('權', '物權', '물권', 1),
+('物', '物流', '물류', 0),
+('流', '物流', '물류', 1),
+('物', '物理', '물리', 0),
+('理', '物理', '물리', 1),
+('物', '物理化學', '물리화학', 0),
+('理', '物理化學', '물리화학', 1),
+('化', '物理化學', '물리화학', 2),
+('學', '物理化學', '물리화학', 3),
+('物', '物理學', '물리학', 0),
+('理', '物理學', '물리학', 1),
+('學', '物理學', '물리학', 2),
+('物', '物理學者', '물리학자', 0),
+('理', '物理學者', '물리학자', 1),
+('學', '物理學者', '물리학자', 2),
+('者', '物理學者', '물리학자', 3),
+('物', '物理治療', '물리치료', 0),
+('理', '物理治療', '물리치료', 1),
+('治', '物理治療', '물리치료', 2),
+('療', '物理治療', '물리치료', 3),
+('物', '物自體', '물자체', 0),
+('自', '物自體', '물자체', 1),
+('體', '物自體', '물자체', 2),
+('物', '物證', '물증', 0),
+('證', '物證', '물증', 1),
+('物', '物質', '물질', 0),
+('質', '物質', '물질', 1),
+('物', '物體', '물체', 0),
+('體', '物體', '물체', 1),
+('特', '特', '특', 0),
+('特', '特使', '특사', 0),
+('使', '特使', '특사', 1),
+('特', '特例', '특례', 0),
+('例', '特例', '특례', 1),
+('特', '特典', '특전', 0),
+('典', '特典', '특전', 1),
+('特', '特別', '특별', 0),
+('別', '特別', '특별', 1),
+('特', '特別市', '특별시', 0),
+('別', '特別市', '특별시', 1),
+('市', '特別市', '특별시', 2),
+('特', '特報', '특보', 0),
+('報', '特報', '특보', 1),
+('特', '特定', '특정', 0),
+('定', '特定', '특정', 1),
+('特', '特徵', '특징', 0),
+('徵', '特徵', '특징', 1),
+('特', '特性', '특성', 0),
+('性', '特性', '특성', 1),
+('特', '特惠', '특혜', 0),
+('惠', '特惠', '특혜', 1),
+('特', '特技', '특기', 0),
+('技', '特技', '특기', 1),
+('特', '特有', '특유', 0),
+('有', '特有', '특유', 1),
+('特', '特權', '특권', 0),
+('權', '特權', '특권', 1),
+('特', '特殊', '특수', 0),
+('殊', '特殊', '특수', 1),
+('特', '特殊性', '특수성', 0),
+('殊', '特殊性', '특수성', 1),
+('性', '特殊性', '특수성', 2),
+('特', '特殊部隊', '특수부대', 0),
+('殊', '特殊部隊', '특수부대', 1),
+('部', '特殊部隊', '특수부대', 2),
+('隊', '特殊部隊', '특수부대', 3),
+('特', '特派員', '특파원', 0),
+('派', '特派員', '특파원', 1),
+('員', '特派員', '특파원', 2),
+('特', '特産', '특산', 0),
+('産', '特産', '특산', 1),
+('特', '特産物', '특산물', 0),
+('産', '特産物', '특산물', 1),
+('物', '特産物', '특산물', 2),
+('特', '特異', '특이', 0),
+('異', '特異', '특이', 1),
+('特', '特種', '특종', 0),
+('種', '特種', '특종', 1),
+('特', '特筆', '특필', 0),
+('筆', '特筆', '특필', 1),
+('特', '特級', '특급', 0),
+('級', '特級', '특급', 1),
+('特', '特級市', '특급시', 0),
+('級', '特級市', '특급시', 1),
+('市', '特級市', '특급시', 2),
+('特', '特色', '특색', 0),
+('色', '特色', '특색', 1),
+('特', '特製', '특제', 0),
+('製', '特製', '특제', 1),
+('特', '特記', '특기', 0),
+('記', '特記', '특기', 1),
+('特', '特許', '특허', 0),
+('許', '特許', '특허', 1),
+('特', '特質', '특질', 0),
+('質', '特質', '특질', 1),
+('特', '特赦', '특사', 0),
+('赦', '特赦', '특사', 1),
+('特', '特進', '특진', 0),
+('進', '特進', '특진', 1),
+('特', '特點', '특점', 0),
+('點', '特點', '특점', 1),
+('牽', '牽制', '견제', 0),
+('制', '牽制', '견제', 1),
+('牽', '牽牛星', '견우성', 0),
+('牛', '牽牛星', '견우성', 1),
+('星', '牽牛星', '견우성', 2),
+('犧', '犧牲', '희생', 0),
+('牲', '犧牲', '희생', 1),
+('犧', '犧牲打', '희생타', 0),
+('牲', '犧牲打', '희생타', 1),
+('打', '犧牲打', '희생타', 2),
+('犧', '犧牲物', '희생물', 0),
+('牲', '犧牲物', '희생물', 1),
+('物', '犧牲物', '희생물', 2),
+('犧', '犧牲羊', '희생양', 0),
+('牲', '犧牲羊', '희생양', 1),
+('羊', '犧牲羊', '희생양', 2),
+('犧', '犧牲者', '희생자', 0),
+('牲', '犧牲者', '희생자', 1),
+('者', '犧牲者', '희생자', 2),
+('犬', '犬', '견', 0),
+('犬', '犬儒', '견유', 0),
+('儒', '犬儒', '견유', 1),
+('犬', '犬儒主義', '견유주의', 0),
+('儒', '犬儒主義', '견유주의', 1),
+('主', '犬儒主義', '견유주의', 2),
+('義', '犬儒主義', '견유주의', 3),
+('犬', '犬齒', '견치', 0),
+('齒', '犬齒', '견치', 1),
+('犯', '犯人', '범인', 0),
+('人', '犯人', '범인', 1),
+('犯', '犯則', '범칙', 0),
+('則', '犯則', '범칙', 1),
+('犯', '犯則金', '범칙금', 0),
+('則', '犯則金', '범칙금', 1),
+('金', '犯則金', '범칙금', 2),
+('犯', '犯罪', '범죄', 0),
+('罪', '犯罪', '범죄', 1),
+('犯', '犯罪學', '범죄학', 0),
+('罪', '犯罪學', '범죄학', 1),
+('學', '犯罪學', '범죄학', 2),
+('犯', '犯罪的', '범죄적', 0),
+('罪', '犯罪的', '범죄적', 1),
+('的', '犯罪的', '범죄적', 2),
+('犯', '犯罪者', '범죄자', 0),
+('罪', '犯罪者', '범죄자', 1),
+('者', '犯罪者', '범죄자', 2),
+('犯', '犯行', '범행', 0),
+('行', '犯行', '범행', 1),
+('狀', '狀態', '상태', 0),
+('態', '狀態', '상태', 1),
+('狀', '狀況', '상황', 0),
+('況', '狀況', '상황', 1),
+('狂', '狂亂', '광란', 0),
+('亂', '狂亂', '광란', 1),
+('狂', '狂人', '광인', 0),
+('人', '狂人', '광인', 1),
+('狂', '狂信徒', '광신도', 0),
+('信', '狂信徒', '광신도', 1),
+('徒', '狂信徒', '광신도', 2),
+('狂', '狂信者', '광신자', 0),
+('信', '狂信者', '광신자', 1),
+('者', '狂信者', '광신자', 2),
+('狂', '狂想曲', '광상곡', 0),
+('想', '狂想曲', '광상곡', 1),
+('曲', '狂想曲', '광상곡', 2),
+('狂', '狂暴', '광폭', 0),
+('暴', '狂暴', '광폭', 1),
+('狂', '狂氣', '광기', 0),
+('氣', '狂氣', '광기', 1),
+('狂', '狂牛病', '광우병', 0),
+('牛', '狂牛病', '광우병', 1),
+('病', '狂牛病', '광우병', 2),
+('狂', '狂犬病', '광견병', 0),
+('犬', '狂犬病', '광견병', 1),
+('病', '狂犬病', '광견병', 2),
+('狂', '狂蝶', '광접', 0),
+('蝶', '狂蝶', '광접', 1),
+('狂', '狂風', '광풍', 0),
+('風', '狂風', '광풍', 1),
+('狐', '狐狸', '호리', 0),
+('狸', '狐狸', '호리', 1),
+('狐', '狐疑', '호의', 0),
+('疑', '狐疑', '호의', 1),
+('狐', '狐貍', '호리', 0),
+('貍', '狐貍', '호리', 1),
+('狗', '狗醬', '구장', 0),
+('醬', '狗醬', '구장', 1),
+('狙', '狙害', '저해', 0),
+('害', '狙害', '저해', 1),
+('狙', '狙擊', '저격', 0),
+('擊', '狙擊', '저격', 1),
+('狡', '狡猾', '교활', 0),
+('猾', '狡猾', '교활', 1),
+('狹', '狹小', '협소', 0),
+('小', '狹小', '협소', 1),
+('狹', '狹心症', '협심증', 0),
+('心', '狹心症', '협심증', 1),
+('症', '狹心症', '협심증', 2),
+('狹', '狹窄', '협착', 0),
+('窄', '狹窄', '협착', 1),
+('狹', '狹義', '협의', 0),
+('義', '狹義', '협의', 1),
+('狼', '狼狽', '낭패', 0),
+('狽', '狼狽', '낭패', 1),
+('狼', '狼狽', '랑패', 0),
+('狽', '狼狽', '랑패', 1),
+('猖', '猖披', '창피', 0),
+('披', '猖披', '창피', 1),
+('猖', '猖獗', '창궐', 0),
+('獗', '猖獗', '창궐', 1),
+('猛', '猛禽類', '맹금류', 0),
+('禽', '猛禽類', '맹금류', 1),
+('類', '猛禽類', '맹금류', 2),
+('猛', '猛虎', '맹호', 0),
+('虎', '猛虎', '맹호', 1),
+('猜', '猜忌', '시기', 0),
+('忌', '猜忌', '시기', 1),
+('猥', '猥褻', '외설', 0),
+('褻', '猥褻', '외설', 1),
+('猩', '猩紅熱', '성홍열', 0),
+('紅', '猩紅熱', '성홍열', 1),
+('熱', '猩紅熱', '성홍열', 2),
+('猪', '猪突', '저돌', 0),
+('突', '猪突', '저돌', 1),
+('猶', '猶太人', '유태인', 0),
+('太', '猶太人', '유태인', 1),
+('人', '猶太人', '유태인', 2),
+('猿', '猿人', '원인', 0),
+('人', '猿人', '원인', 1),
+('獄', '獄中', '옥중', 0),
+('中', '獄中', '옥중', 1),
+('獄', '獄死', '옥사', 0),
+('死', '獄死', '옥사', 1),
+('獄', '獄苦', '옥고', 0),
+('苦', '獄苦', '옥고', 1),
+('獄', '獄門', '옥문', 0),
+('門', '獄門', '옥문', 1),
+('獅', '獅子', '사자', 0),
+('子', '獅子', '사자', 1),
+('獎', '獎學金', '장학금', 0),
+('學', '獎學金', '장학금', 1),
+('金', '獎學金', '장학금', 2),
+('獨', '獨', '독', 0),
+('獨', '獨不將軍', '독불장군', 0),
+('不', '獨不將軍', '독불장군', 1),
+('將', '獨不將軍', '독불장군', 2),
+('軍', '獨不將軍', '독불장군', 3),
+('獨', '獨創的', '독창적', 0),
+('創', '獨創的', '독창적', 1),
+('的', '獨創的', '독창적', 2),
+('獨', '獨占', '독점', 0),
+('占', '獨占', '독점', 1),
+('獨', '獨占的', '독점적', 0),
+('占', '獨占的', '독점적', 1),
+('的', '獨占的', '독점적', 2),
+('獨', '獨奏', '독주', 0),
+('奏', '獨奏', '독주', 1),
+('獨', '獨居', '독거', 0),
+('居', '獨居', '독거', 1),
+('獨', '獨島', '독도', 0),
+('島', '獨島', '독도', 1),
+('獨', '獨房', '독방', 0),
+('房', '獨房', '독방', 1),
+('獨', '獨特', '독특', 0),
+('特', '獨特', '독특', 1),
+('獨', '獨白', '독백', 0),
+('白', '獨白', '독백', 1),
+('獨', '獨立', '독립', 0),
+('立', '獨立', '독립', 1),
+('獨', '獨立國家協同體', '독립국가협동체', 0),
+('立', '獨立國家協同體', '독립국가협동체', 1),
+('國', '獨立國家協同體', '독립국가협동체', 2),
+('家', '獨立國家協同體', '독립국가협동체', 3),
+('協', '獨立國家協同體', '독립국가협동체', 4),
+('同', '獨立國家協同體', '독립국가협동체', 5),
+('體', '獨立國家協同體', '독립국가협동체', 6),
+('獨', '獨立國家聯合', '독립국가연합', 0),
+('立', '獨立國家聯合', '독립국가연합', 1),
+('國', '獨立國家聯合', '독립국가연합', 2),
+('家', '獨立國家聯合', '독립국가연합', 3),
+('聯', '獨立國家聯合', '독립국가연합', 4),
+('合', '獨立國家聯合', '독립국가연합', 5),
+('獨', '獨立性', '독립성', 0),
+('立', '獨立性', '독립성', 1),
+('性', '獨立性', '독립성', 2),
+('獨', '獨裁', '독재', 0),
+('裁', '獨裁', '독재', 1),
+('獨', '獨裁的', '독재적', 0),
+('裁', '獨裁的', '독재적', 1),
+('的', '獨裁的', '독재적', 2),
+('獨', '獨裁者', '독재자', 0),
+('裁', '獨裁者', '독재자', 1),
+('者', '獨裁者', '독재자', 2),
+('獨', '獨語', '독어', 0),
+('語', '獨語', '독어', 1),
+('獨', '獨身', '독신', 0),
+('身', '獨身', '독신', 1),
+('獨', '獨身者', '독신자', 0),
+('身', '獨身者', '독신자', 1),
+('者', '獨身者', '독신자', 2),
+('獨', '獨逸', '독일', 0),
+('逸', '獨逸', '독일', 1),
+('獨', '獨逸語', '독일어', 0),
+('逸', '獨逸語', '독일어', 1),
+('語', '獨逸語', '독일어', 2),
+('獬', '獬豸', '해치', 0),
+('豸', '獬豸', '해치', 1),
+('獬', '獬豸', '해태', 0),
+('豸', '獬豸', '해태', 1),
+('獲', '獲得', '획득', 0),
+('得', '獲得', '획득', 1),
+('獵', '獵奇', '엽기', 0),
+('奇', '獵奇', '엽기', 1),
+('獸', '獸姦', '수간', 0),
+('姦', '獸姦', '수간', 1),
+('獸', '獸脂', '수지', 0),
+('脂', '獸脂', '수지', 1),
+('獸', '獸醫', '수의', 0),
+('醫', '獸醫', '수의', 1),
+('獸', '獸醫師', '수의사', 0),
+('醫', '獸醫師', '수의사', 1),
+('師', '獸醫師', '수의사', 2),
+('獻', '獻上', '헌상', 0),
+('上', '獻上', '헌상', 1),
+('獻', '獻呈', '헌정', 0),
+('呈', '獻呈', '헌정', 1),
+('獻', '獻策', '헌책', 0),
+('策', '獻策', '헌책', 1),
+('獻', '獻納', '헌납', 0),
+('納', '獻納', '헌납', 1),
+('獻', '獻花', '헌화', 0),
+('花', '獻花', '헌화', 1),
+('獻', '獻血', '헌혈', 0),
+('血', '獻血', '헌혈', 1),
+('獻', '獻詞', '헌사', 0),
+('詞', '獻詞', '헌사', 1),
+('獻', '獻身', '헌신', 0),
+('身', '獻身', '헌신', 1),
+('獻', '獻身的', '헌신적', 0),
+('身', '獻身的', '헌신적', 1),
+('的', '獻身的', '헌신적', 2),
+('獻', '獻辭', '헌사', 0),
+('辭', '獻辭', '헌사', 1),
+('獻', '獻金', '헌금', 0),
+('金', '獻金', '헌금', 1),
+('獻', '獻題', '헌제', 0),
+('題', '獻題', '헌제', 1),
+('玄', '玄孫', '현손', 0),
+('孫', '玄孫', '현손', 1),
+('玄', '玄學', '현학', 0),
+('學', '玄學', '현학', 1),
+('玄', '玄武岩', '현무암', 0),
+('武', '玄武岩', '현무암', 1),
+('岩', '玄武岩', '현무암', 2),
+('玄', '玄武巖', '현무암', 0),
+('武', '玄武巖', '현무암', 1),
+('巖', '玄武巖', '현무암', 2),
+('玄', '玄琴', '현금', 0),
+('琴', '玄琴', '현금', 1),
+('玄', '玄米', '현미', 0),
+('米', '玄米', '현미', 1),
+('玄', '玄米綠茶', '현미녹차', 0),
+('米', '玄米綠茶', '현미녹차', 1),
+('綠', '玄米綠茶', '현미녹차', 2),
+('茶', '玄米綠茶', '현미녹차', 3),
+('玄', '玄米茶', '현미차', 0),
+('米', '玄米茶', '현미차', 1),
+('茶', '玄米茶', '현미차', 2),
+('玄', '玄關', '현관', 0),
+('關', '玄關', '현관', 1),
+('玄', '玄關門', '현관문', 0),
+('關', '玄關門', '현관문', 1),
+('門', '玄關門', '현관문', 2),
+('玄', '玄鶴', '현학', 0),
+('鶴', '玄鶴', '현학', 1),
+('玄', '玄鶴琴', '현학금', 0),
+('鶴', '玄鶴琴', '현학금', 1),
+('琴', '玄鶴琴', '현학금', 2),
+('率', '率先', '솔선', 0),
+('先', '率先', '솔선', 1),
+('率', '率先垂範', '솔선수범', 0),
+('先', '率先垂範', '솔선수범', 1),
+('垂', '率先垂範', '솔선수범', 2),
+('範', '率先垂範', '솔선수범', 3),
+('率', '率先躬行', '솔선궁행', 0),
+('先', '率先躬行', '솔선궁행', 1),
+('躬', '率先躬行', '솔선궁행', 2),
+('行', '率先躬行', '솔선궁행', 3),
+('率', '率直', '솔직', 0),
+('直', '率直', '솔직', 1),
+('玉', '玉', '옥', 0),
+('玉', '玉座', '옥좌', 0),
+('座', '玉座', '옥좌', 1),
+('玉', '玉榻', '옥탑', 0),
+('榻', '玉榻', '옥탑', 1),
+('玉', '玉璽', '옥새', 0),
+('璽', '玉璽', '옥새', 1),
+('玉', '玉石', '옥석', 0),
+('石', '玉石', '옥석', 1),
+('玉', '玉篇', '옥편', 0),
+('篇', '玉篇', '옥편', 1),
+('玉', '玉簪花', '옥잠화', 0),
+('簪', '玉簪花', '옥잠화', 1),
+('花', '玉簪花', '옥잠화', 2),
+('玉', '玉胚油', '옥배유', 0),
+('胚', '玉胚油', '옥배유', 1),
+('油', '玉胚油', '옥배유', 2),
+('玉', '玉色', '옥색', 0),
+('色', '玉色', '옥색', 1),
+('王', '王', '왕', 0),
+('王', '王位', '왕위', 0),
+('位', '王位', '왕위', 1),
+('王', '王冠', '왕관', 0),
+('冠', '王冠', '왕관', 1),
+('王', '王后', '왕후', 0),
+('后', '王后', '왕후', 1),
+('王', '王國', '왕국', 0),
+('國', '王國', '왕국', 1),
+('王', '王大妃', '왕대비', 0),
+('大', '王大妃', '왕대비', 1),
+('妃', '王大妃', '왕대비', 2),
+('王', '王太子', '왕태자', 0),
+('太', '王太子', '왕태자', 1),
+('子', '王太子', '왕태자', 2),
+('王', '王女', '왕녀', 0),
+('女', '王女', '왕녀', 1),
+('王', '王妃', '왕비', 0),
+('妃', '王妃', '왕비', 1),
+('王', '王子', '왕자', 0),
+('子', '王子', '왕자', 1),
+('王', '王子病', '왕자병', 0),
+('子', '王子病', '왕자병', 1),
+('病', '王子病', '왕자병', 2),
+('王', '王室', '왕실', 0),
+('室', '王室', '왕실', 1),
+('王', '王家', '왕가', 0),
+('家', '王家', '왕가', 1),
+('王', '王座', '왕좌', 0),
+('座', '王座', '왕좌', 1),
+('王', '王政', '왕정', 0),
+('政', '王政', '왕정', 1),
+('王', '王政主義者', '왕정주의자', 0),
+('政', '王政主義者', '왕정주의자', 1),
+('主', '王政主義者', '왕정주의자', 2),
+('義', '王政主義者', '왕정주의자', 3),
+('者', '王政主義者', '왕정주의자', 4),
+('王', '王政復古', '왕정복고', 0),
+('政', '王政復古', '왕정복고', 1),
+('復', '王政復古', '왕정복고', 2),
+('古', '王政復古', '왕정복고', 3),
+('王', '王書房', '왕서방', 0),
+('書', '王書房', '왕서방', 1),
+('房', '王書房', '왕서방', 2),
+('王', '王朝', '왕조', 0),
+('朝', '王朝', '왕조', 1),
+('王', '王權', '왕권', 0),
+('權', '王權', '왕권', 1),
+('王', '王權神授說', '왕권신수설', 0),
+('權', '王權神授說', '왕권신수설', 1),
+('神', '王權神授說', '왕권신수설', 2),
+('授', '王權神授說', '왕권신수설', 3),
+('說', '王權神授說', '왕권신수설', 4),
+('王', '王水', '왕수', 0),
+('水', '王水', '왕수', 1),
+('王', '王笏', '왕홀', 0),
+('笏', '王笏', '왕홀', 1),
+('王', '王새매', '왕새매', 0),
+('새', '王새매', '왕새매', 1),
+('매', '王새매', '왕새매', 2),
+('玩', '玩具', '완구', 0),
+('具', '玩具', '완구', 1),
+('玳', '玳瑁', '대모', 0),
+('瑁', '玳瑁', '대모', 1),
+('玻', '玻璃', '파리', 0),
+('璃', '玻璃', '파리', 1),
+('珊', '珊瑚', '산호', 0),
+('瑚', '珊瑚', '산호', 1),
+('珊', '珊瑚海', '산호해', 0),
+('瑚', '珊瑚海', '산호해', 1),
+('海', '珊瑚海', '산호해', 2),
+('珊', '珊瑚礁', '산호초', 0),
+('瑚', '珊瑚礁', '산호초', 1),
+('礁', '珊瑚礁', '산호초', 2),
+('珍', '珍品', '진품', 0),
+('品', '珍品', '진품', 1),
+('珍', '珍妙', '진묘', 0),
+('妙', '珍妙', '진묘', 1),
+('珍', '珍獸', '진수', 0),
+('獸', '珍獸', '진수', 1),
+('珍', '珍珠', '진주', 0),
+('珠', '珍珠', '진주', 1),
+('珍', '珍珠層', '진주층', 0),
+('珠', '珍珠層', '진주층', 1),
+('層', '珍珠層', '진주층', 2),
+('珪', '珪化', '규화', 0),
+('化', '珪化', '규화', 1),
+('班', '班', '반', 0),
+('班', '班長', '반장', 0),
+('長', '班長', '반장', 1),
+('現', '現', '현', 0),
+('現', '現代', '현대', 0),
+('代', '現代', '현대', 1),
+('現', '現代 複合弓', '현대 복합궁', 0),
+('代', '現代 複合弓', '현대 복합궁', 1),
+('複', '現代 複合弓', '현대 복합궁', 3),
+('合', '現代 複合弓', '현대 복합궁', 4),
+('弓', '現代 複合弓', '현대 복합궁', 5),
+('現', '現代主義', '현대주의', 0),
+('代', '現代主義', '현대주의', 1),
+('主', '現代主義', '현대주의', 2),
+('義', '現代主義', '현대주의', 3),
+('現', '現代人', '현대인', 0),
+('代', '現代人', '현대인', 1),
+('人', '現代人', '현대인', 2),
+('現', '現代化', '현대화', 0),
+('代', '現代化', '현대화', 1),
+('化', '現代化', '현대화', 2),
+('現', '現代史', '현대사', 0),
+('代', '現代史', '현대사', 1),
+('史', '現代史', '현대사', 2),
+('現', '現代國語', '현대국어', 0),
+('代', '現代國語', '현대국어', 1),
+('國', '現代國語', '현대국어', 2),
+('語', '現代國語', '현대국어', 3),
+('現', '現代的', '현대적', 0),
+('代', '現代的', '현대적', 1),
+('的', '現代的', '현대적', 2),
+('現', '現代語', '현대어', 0),
+('代', '現代語', '현대어', 1),
+('語', '現代語', '현대어', 2),
+('現', '現出', '현출', 0),
+('出', '現出', '현출', 1),
+('現', '現品', '현품', 0),
+('品', '現品', '현품', 1),
+('現', '現在', '현재', 0),
+('在', '現在', '현재', 1),
+('現', '現在分詞', '현재분사', 0),
+('在', '現在分詞', '현재분사', 1),
+('分', '現在分詞', '현재분사', 2),
+('詞', '現在分詞', '현재분사', 3),
+('現', '現在時制', '현재시제', 0),
+('在', '現在時制', '현재시제', 1),
+('時', '現在時制', '현재시제', 2),
+('制', '現在時制', '현재시제', 3),
+('現', '現地', '현지', 0),
+('地', '現地', '현지', 1),
+('現', '現場', '현장', 0),
+('場', '現場', '현장', 1),
+('現', '現存', '현존', 0),
+('存', '現存', '현존', 1),
+('現', '現實', '현실', 0),
+('實', '現實', '현실', 1),
+('現', '現實化', '현실화', 0),
+('實', '現實化', '현실화', 1),
+('化', '現實化', '현실화', 2),
+('現', '現實的', '현실적', 0),
+('實', '現實的', '현실적', 1),
+('的', '現實的', '현실적', 2),
+('現', '現實逃避', '현실도피', 0),
+('實', '現實逃避', '현실도피', 1),
+('逃', '現實逃避', '현실도피', 2),
+('避', '現實逃避', '현실도피', 3),
+('現', '現役', '현역', 0),
+('役', '現役', '현역', 1),
+('現', '現札', '현찰', 0),
+('札', '現札', '현찰', 1),
+('現', '現況', '현황', 0),
+('況', '現況', '현황', 1),
+('現', '現狀', '현상', 0),
+('狀', '現狀', '현상', 1),
+('現', '現行', '현행', 0),
+('行', '現行', '현행', 1),
+('現', '現象', '현상', 0),
+('象', '現象', '현상', 1),
+('現', '現象學', '현상학', 0),
+('象', '現象學', '현상학', 1),
+('學', '現象學', '현상학', 2),
+('現', '現金', '현금', 0),
+('金', '現金', '현금', 1),
+('現', '現金', '현금', 0),
+('金', '現金', '현금', 1),
+('球', '球', '구', 0),
+('球', '球場', '구장', 0),
+('場', '球場', '구장', 1),
+('球', '球威', '구위', 0),
+('威', '球威', '구위', 1),
+('球', '球心', '구심', 0),
+('心', '球心', '구심', 1),
+('球', '球根', '구근', 0),
+('根', '球根', '구근', 1),
+('球', '球種', '구종', 0),
+('種', '球種', '구종', 1),
+('球', '球莖', '구경', 0),
+('莖', '球莖', '구경', 1),
+('球', '球菌', '구균', 0),
+('菌', '球菌', '구균', 1),
+('球', '球速', '구속', 0),
+('速', '球速', '구속', 1),
+('球', '球面角', '구면각', 0),
+('面', '球面角', '구면각', 1),
+('角', '球面角', '구면각', 2),
+('球', '球體', '구체', 0),
+('體', '球體', '구체', 1),
+('理', '理', '리', 0),
+('理', '理', '이', 0),
+('理', '理事', '이사', 0),
+('事', '理事', '이사', 1),
+('理', '理事會', '이사회', 0),
+('事', '理事會', '이사회', 1),
+('會', '理事會', '이사회', 2),
+('理', '理事長', '이사장', 0),
+('事', '理事長', '이사장', 1),
+('長', '理事長', '이사장', 2),
+('理', '理容', '이용', 0),
+('容', '理容', '이용', 1),
+('理', '理容室', '이용실', 0),
+('容', '理容室', '이용실', 1),
+('室', '理容室', '이용실', 2),
+('理', '理容師', '이용사', 0),
+('容', '理容師', '이용사', 1),
+('師', '理容師', '이용사', 2),
+('理', '理工', '이공', 0),
+('工', '理工', '이공', 1),
+('理', '理念', '이념', 0),
+('念', '理念', '이념', 1),
+('理', '理性', '이성', 0),
+('性', '理性', '이성', 1),
+('理', '理性主義', '이성주의', 0),
+('性', '理性主義', '이성주의', 1),
+('主', '理性主義', '이성주의', 2),
+('義', '理性主義', '이성주의', 3),
+('理', '理性論', '이성론', 0),
+('性', '理性論', '이성론', 1),
+('論', '理性論', '이성론', 2),
+('理', '理想', '이상', 0),
+('想', '理想', '이상', 1),
+('理', '理想主義', '리상주의', 0),
+('想', '理想主義', '리상주의', 1),
+('主', '理想主義', '리상주의', 2),
+('義', '理想主義', '리상주의', 3),
+('理', '理想主義', '이상주의', 0),
+('想', '理想主義', '이상주의', 1),
+('主', '理想主義', '이상주의', 2),
+('義', '理想主義', '이상주의', 3),
+('理', '理想化', '이상화', 0),
+('想', '理想化', '이상화', 1),
+('化', '理想化', '이상화', 2),
+('理', '理想的', '이상적', 0),
+('想', '理想的', '이상적', 1),
+('的', '理想的', '이상적', 2),
+('理', '理想鄕', '이상향', 0),
+('想', '理想鄕', '이상향', 1),
+('鄕', '理想鄕', '이상향', 2),
+('理', '理由', '리유', 0),
+('由', '理由', '리유', 1),
+('理', '理由', '이유', 0),
+('由', '理由', '이유', 1),
+('理', '理神論', '이신론', 0),
+('神', '理神論', '이신론', 1),
+('論', '理神論', '이신론', 2),
+('理', '理科', '이과', 0),
+('科', '理科', '이과', 1),
+('理', '理致', '리치', 0),
+('致', '理致', '리치', 1),
+('理', '理致', '이치', 0),
+('致', '理致', '이치', 1),
+('理', '理解', '리해', 0),
+('解', '理解', '리해', 1),
+('理', '理解', '이해', 0),
+('解', '理解', '이해', 1),
+('理', '理論', '이론', 0),
+('論', '理論', '이론', 1),
+('理', '理論家', '리론가', 0),
+('論', '理論家', '리론가', 1),
+('家', '理論家', '리론가', 2),
+('理', '理論家', '이론가', 0),
+('論', '理論家', '이론가', 1),
+('家', '理論家', '이론가', 2),
+('理', '理馬', '이마', 0),
+('馬', '理馬', '이마', 1),
+('理', '理髮', '이발', 0),
+('髮', '理髮', '이발', 1),
+('理', '理髮師', '이발사', 0),
+('髮', '理髮師', '이발사', 1),
+('師', '理髮師', '이발사', 2),
+('理', '理髮所', '이발소', 0),
+('髮', '理髮所', '이발소', 1),
+('所', '理髮所', '이발소', 2),
+('琉', '琉璃', '유리', 0),
+('璃', '琉璃', '유리', 1),
+('琉', '琉璃盞', '유리잔', 0),
+('璃', '琉璃盞', '유리잔', 1),
+('盞', '琉璃盞', '유리잔', 2),
+('琉', '琉璃窓', '유리창', 0),
+('璃', '琉璃窓', '유리창', 1),
+('窓', '琉璃窓', '유리창', 2),
+('琥', '琥珀', '호박', 0),
+('珀', '琥珀', '호박', 1),
+('琥', '琥珀色', '호박색', 0),
+('珀', '琥珀色', '호박색', 1),
+('色', '琥珀色', '호박색', 2),
+('琥', '琥珀酸', '호박산', 0),
+('珀', '琥珀酸', '호박산', 1),
+('酸', '琥珀酸', '호박산', 2),
+('琵', '琵琶', '비파', 0),
+('琶', '琵琶', '비파', 1),
+('琺', '琺瑯', '법랑', 0),
+('瑯', '琺瑯', '법랑', 1),
+('琺', '琺瑯質', '법랑질', 0),
+('瑯', '琺瑯質', '법랑질', 1),
+('質', '琺瑯質', '법랑질', 2),
+('瑇', '瑇瑁', '대모', 0),
+('瑁', '瑇瑁', '대모', 1),
+('瑕', '瑕疵', '하자', 0),
+('疵', '瑕疵', '하자', 1),
+('瑞', '瑞典', '서전', 0),
+('典', '瑞典', '서전', 1),
+('瑞', '瑞祥', '서상', 0),
+('祥', '瑞祥', '서상', 1),
+('瑞', '瑞西', '서서', 0),
+('西', '瑞西', '서서', 1),
+('瑠', '瑠璃', '유리', 0),
+('璃', '瑠璃', '유리', 1),
+('瑪', '瑪瑙', '마노', 0),
+('瑙', '瑪瑙', '마노', 1),
+('璧', '璧', '벽', 0),
+('環', '環刀', '환도', 0),
+('刀', '環刀', '환도', 1),
+('環', '環境', '환경', 0),
+('境', '環境', '환경', 1),
+('環', '環境汚染', '환경오염', 0),
+('境', '環境汚染', '환경오염', 1),
+('汚', '環境汚染', '환경오염', 2),
+('染', '環境汚染', '환경오염', 3),
+('環', '環海', '환해', 0),
+('海', '環海', '환해', 1),
+('環', '環礁', '환초', 0),
+('礁', '環礁', '환초', 1),
+('璽', '璽', '새', 0),
+('瓊', '瓊團', '경단', 0),
+('團', '瓊團', '경단', 1),
+('瓔', '瓔珞', '영락', 0),
+('珞', '瓔珞', '영락', 1),
+('瓣', '瓣', '판', 0),
+('瓦', '瓦解', '와해', 0),
+('解', '瓦解', '와해', 1),
+('甁', '甁', '병', 0),
+('甓', '甓', '벽', 0),
+('甕', '甕器', '옹기', 0),
+('器', '甕器', '옹기', 1),
+('甕', '甕津', '옹진', 0),
+('津', '甕津', '옹진', 1),
+('甘', '甘', '감', 0),
+('甘', '甘受', '감수', 0),
+('受', '甘受', '감수', 1),
+('甘', '甘味', '감미', 0),
+('味', '甘味', '감미', 1),
+('甘', '甘味料', '감미료', 0),
+('味', '甘味料', '감미료', 1),
+('料', '甘味料', '감미료', 2),
+('甘', '甘味롭다', '감미롭다', 0),
+('味', '甘味롭다', '감미롭다', 1),
+('롭', '甘味롭다', '감미롭다', 2),
+('다', '甘味롭다', '감미롭다', 3),
+('甘', '甘松', '감송', 0),
+('松', '甘松', '감송', 1),
+('甘', '甘水', '감수', 0),
+('水', '甘水', '감수', 1),
+('甘', '甘肅', '감숙', 0),
+('肅', '甘肅', '감숙', 1),
+('甘', '甘草', '감초', 0),
+('草', '甘草', '감초', 1),
+('甘', '甘藍', '감람', 0),
+('藍', '甘藍', '감람', 1),
+('甘', '甘藷湯', '감자탕', 0),
+('藷', '甘藷湯', '감자탕', 1),
+('湯', '甘藷湯', '감자탕', 2),
+('甘', '甘遂', '감수', 0),
+('遂', '甘遂', '감수', 1),
+('甘', '甘露', '감로', 0),
+('露', '甘露', '감로', 1),
+('甘', '甘露水', '감로수', 0),
+('露', '甘露水', '감로수', 1),
+('水', '甘露水', '감로수', 2),
+('甘', '甘露酒', '감로주', 0),
+('露', '甘露酒', '감로주', 1),
+('酒', '甘露酒', '감로주', 2),
+('甚', '甚', '심', 0),
+('甚', '甚至於', '심지어', 0),
+('至', '甚至於', '심지어', 1),
+('於', '甚至於', '심지어', 2),
+('生', '生', '생', 0),
+('生', '生前', '생전', 0),
+('前', '生前', '생전', 1),
+('生', '生化學', '생화학', 0),
+('化', '生化學', '생화학', 1),
+('學', '生化學', '생화학', 2),
+('生', '生命', '생명', 0),
+('命', '生命', '생명', 1),
+('生', '生命保險', '생명보험', 0),
+('命', '生命保險', '생명보험', 1),
+('保', '生命保險', '생명보험', 2),
+('險', '生命保險', '생명보험', 3),
+('生', '生命力', '생명력', 0),
+('命', '生命力', '생명력', 1),
+('力', '生命力', '생명력', 2),
+('生', '生命權', '생명권', 0),
+('命', '生命權', '생명권', 1),
+('權', '生命權', '생명권', 2),
+('生', '生存', '생존', 0),
+('存', '生存', '생존', 1),
+('生', '生存者', '생존자', 0),
+('存', '生存者', '생존자', 1),
+('者', '生存者', '생존자', 2),
+('生', '生家', '생가', 0),
+('家', '生家', '생가', 1),
+('生', '生年月日', '생년월일', 0),
+('年', '生年月日', '생년월일', 1),
+('月', '生年月日', '생년월일', 2),
+('日', '生年月日', '생년월일', 3),
+('生', '生徒', '생도', 0),
+('徒', '生徒', '생도', 1),
+('生', '生得', '생득', 0),
+('得', '生得', '생득', 1),
+('生', '生態', '생태', 0),
+('態', '生態', '생태', 1),
+('生', '生態地域', '생태지역', 0),
+('態', '生態地域', '생태지역', 1),
+('地', '生態地域', '생태지역', 2),
+('域', '生態地域', '생태지역', 3),
+('生', '生態學', '생태학', 0),
+('態', '生態學', '생태학', 1),
+('學', '生態學', '생태학', 2),
+('生', '生態系', '생태계', 0),
+('態', '生態系', '생태계', 1),
+('系', '生態系', '생태계', 2),
+('生', '生捕', '생포', 0),
+('捕', '生捕', '생포', 1),
+('生', '生放送', '생방송', 0),
+('放', '生放送', '생방송', 1),
+('送', '生放送', '생방송', 2),
+('生', '生日', '생일', 0),
+('日', '生日', '생일', 1),
+('生', '生死', '생사', 0),
+('死', '生死', '생사', 1),
+('生', '生死與奪權', '생사여탈권', 0),
+('死', '生死與奪權', '생사여탈권', 1),
+('與', '生死與奪權', '생사여탈권', 2),
+('奪', '生死與奪權', '생사여탈권', 3),
+('權', '生死與奪權', '생사여탈권', 4),
+('生', '生殖', '생식', 0),
+('殖', '生殖', '생식', 1),
+('生', '生殖器', '생식기', 0),
+('殖', '生殖器', '생식기', 1),
+('器', '生殖器', '생식기', 2),
+('生', '生殺與奪權', '생살여탈권', 0),
+('殺', '生殺與奪權', '생살여탈권', 1),
+('與', '生殺與奪權', '생살여탈권', 2),
+('奪', '生殺與奪權', '생살여탈권', 3),
+('權', '生殺與奪權', '생살여탈권', 4),
+('生', '生氣', '생기', 0),
+('氣', '生氣', '생기', 1),
+('生', '生水', '생수', 0),
+('水', '生水', '생수', 1),
+('生', '生活', '생활', 0),
+('活', '生活', '생활', 1),
+('生', '生活水準', '생활수준', 0),
+('活', '生活水準', '생활수준', 1),
+('水', '生活水準', '생활수준', 2),
+('準', '生活水準', '생활수준', 3),
+('生', '生活環境', '생활환경', 0),
+('活', '生活環境', '생활환경', 1),
+('環', '生活環境', '생활환경', 2),
+('境', '生活環境', '생활환경', 3),
+('生', '生活用品', '생활용품', 0),
+('活', '生活用品', '생활용품', 1),
+('用', '生活用品', '생활용품', 2),
+('品', '生活用品', '생활용품', 3),
+('生', '生活費', '생활비', 0),
+('活', '生活費', '생활비', 1),
+('費', '生活費', '생활비', 2),
+('生', '生活賃金', '생활임금', 0),
+('活', '生活賃金', '생활임금', 1),
+('賃', '生活賃金', '생활임금', 2),
+('金', '生活賃金', '생활임금', 3),
+('生', '生涯', '생애', 0),
+('涯', '生涯', '생애', 1),
+('生', '生滅', '생멸', 0),
+('滅', '生滅', '생멸', 1),
+('生', '生物', '생물', 0),
+('物', '生物', '생물', 1),
+('生', '生物化學', '생물화학', 0),
+('物', '生物化學', '생물화학', 1),
+('化', '生物化學', '생물화학', 2),
+('學', '生物化學', '생물화학', 3),
+('生', '生物圈', '생물권', 0),
+('物', '生物圈', '생물권', 1),
+('圈', '生物圈', '생물권', 2),
+('生', '生物學', '생물학', 0),
+('物', '生物學', '생물학', 1),
+('學', '生物學', '생물학', 2),
+('生', '生物學者', '생물학자', 0),
+('物', '生物學者', '생물학자', 1),
+('學', '生物學者', '생물학자', 2),
+('者', '生物學者', '생물학자', 3),
+('生', '生物物理學', '생물물리학', 0),
+('物', '生物物理學', '생물물리학', 1),
+('物', '生物物理學', '생물물리학', 2),
+('理', '生物物理學', '생물물리학', 3),
+('學', '生物物理學', '생물물리학', 4),
+('生', '生物體', '생물체', 0),
+('物', '生物體', '생물체', 1),
+('體', '生物體', '생물체', 2),
+('生', '生理', '생리', 0),
+('理', '生理', '생리', 1),
+('生', '生理學', '생리학', 0),
+('理', '生理學', '생리학', 1),
+('學', '生理學', '생리학', 2),
+('生', '生生', '생생', 0),
+('生', '生生', '생생', 1),
+('生', '生産', '생산', 0),
+('産', '生産', '생산', 1),
+('生', '生産力', '생산력', 0),
+('産', '生産力', '생산력', 1),
+('力', '生産力', '생산력', 2),
+('生', '生産性', '생산성', 0),
+('産', '生産性', '생산성', 1),
+('性', '生産性', '생산성', 2),
+('生', '生産者', '생산자', 0),
+('産', '生産者', '생산자', 1),
+('者', '生産者', '생산자', 2),
+('生', '生石灰', '생석회', 0),
+('石', '生石灰', '생석회', 1),
+('灰', '生石灰', '생석회', 2),
+('生', '生綃', '생초', 0),
+('綃', '生綃', '생초', 1),
+('生', '生老病死', '생로병사', 0),
+('老', '生老病死', '생로병사', 1),
+('病', '生老病死', '생로병사', 2),
+('死', '生老病死', '생로병사', 3),
+('生', '生肖', '생초', 0),
+('肖', '生肖', '생초', 1),
+('生', '生育', '생육', 0),
+('育', '生育', '생육', 1),
+('生', '生草', '생초', 0),
+('草', '生草', '생초', 1),
+('生', '生薑', '생강', 0),
+('薑', '生薑', '생강', 1),
+('生', '生覺', '생각', 0),
+('覺', '生覺', '생각', 1),
+('生', '生計', '생계', 0),
+('計', '生計', '생계', 1),
+('生', '生辰', '생신', 0),
+('辰', '生辰', '생신', 1),
+('生', '生長', '생장', 0),
+('長', '生長', '생장', 1),
+('生', '生離別', '생이별', 0),
+('離', '生離別', '생이별', 1),
+('別', '生離別', '생이별', 2),
+('生', '生鮮', '생선', 0),
+('鮮', '生鮮', '생선', 1),
+('生', '生鮮膾', '생선회', 0),
+('鮮', '生鮮膾', '생선회', 1),
+('膾', '生鮮膾', '생선회', 2),
+('生', '生사람', '생사람', 0),
+('사', '生사람', '생사람', 1),
+('람', '生사람', '생사람', 2),
+('生', '生크림', '생크림', 0),
+('크', '生크림', '생크림', 1),
+('림', '生크림', '생크림', 2),
+('生', '生辰', '생신', 0),
+('辰', '生辰', '생신', 1),
+('産', '産兒', '산아', 0),
+('兒', '産兒', '산아', 1),
+('産', '産出', '산출', 0),
+('出', '産出', '산출', 1),
+('産', '産婆', '산파', 0),
+('婆', '産婆', '산파', 1),
+('産', '産婦人科', '산부인과', 0),
+('婦', '産婦人科', '산부인과', 1),
+('人', '産婦人科', '산부인과', 2),
+('科', '産婦人科', '산부인과', 3),
+('産', '産業', '산업', 0),
+('業', '産業', '산업', 1),
+('産', '産業化', '산업화', 0),
+('業', '産業化', '산업화', 1),
+('化', '産業化', '산업화', 2),
+('産', '産科', '산과', 0),
+('科', '産科', '산과', 1),
+('産', '産聲', '산성', 0),
+('聲', '産聲', '산성', 1),
+('用', '用-', '용돈', 0),
+('-', '用-', '용돈', 1),
+('用', '用件', '용건', 0),
+('件', '用件', '용건', 1),
+('用', '用具', '용구', 0),
+('具', '用具', '용구', 1),
+('用', '用地', '용지', 0),
+('地', '用地', '용지', 1),
+('用', '用役', '용역', 0),
+('役', '用役', '용역', 1),
+('用', '用紙', '용지', 0),
+('紙', '用紙', '용지', 1),
+('用', '用言', '용언', 0),
+('言', '用言', '용언', 1),
+('用', '用語', '용어', 0),
+('語', '用語', '용어', 1),
+('用', '用途', '용도', 0),
+('途', '用途', '용도', 1),
+('田', '田', '전', 0),
+('田', '田園', '전원', 0),
+('園', '田園', '전원', 1),
+('田', '田畓', '전답', 0),
+('畓', '田畓', '전답', 1),
+('由', '由來', '유래', 0),
+('來', '由來', '유래', 1),
+('甲', '甲', '갑', 0),
+('甲', '甲午', '갑오', 0),
+('午', '甲午', '갑오', 1),
+('甲', '甲子', '갑자', 0),
+('子', '甲子', '갑자', 1),
+('甲', '甲寅', '갑인', 0),
+('寅', '甲寅', '갑인', 1),
+('甲', '甲戌', '갑술', 0),
+('戌', '甲戌', '갑술', 1),
+('甲', '甲板', '갑판', 0),
+('板', '甲板', '갑판', 1),
+('甲', '甲殼', '갑각', 0),
+('殼', '甲殼', '갑각', 1),
+('甲', '甲殼類', '갑각류', 0),
+('殼', '甲殼類', '갑각류', 1),
+('類', '甲殼類', '갑각류', 2),
+('甲', '甲狀腺腫', '갑상선종', 0),
+('狀', '甲狀腺腫', '갑상선종', 1),
+('腺', '甲狀腺腫', '갑상선종', 2),
+('腫', '甲狀腺腫', '갑상선종', 3),
+('甲', '甲申', '갑신', 0),
+('申', '甲申', '갑신', 1),
+('甲', '甲蟲', '갑충', 0),
+('蟲', '甲蟲', '갑충', 1),
+('甲', '甲軍', '갑군', 0),
+('軍', '甲軍', '갑군', 1),
+('甲', '甲辰', '갑진', 0),
+('辰', '甲辰', '갑진', 1),
+('甲', '甲옷', '갑옷', 0),
+('옷', '甲옷', '갑옷', 1),
+('甲', '甲질', '갑질', 0),
+('질', '甲질', '갑질', 1),
+('申', '申告', '신고', 0),
+('告', '申告', '신고', 1),
+('申', '申告人', '신고인', 0),
+('告', '申告人', '신고인', 1),
+('人', '申告人', '신고인', 2),
+('申', '申命記', '신명기', 0),
+('命', '申命記', '신명기', 1),
+('記', '申命記', '신명기', 2),
+('申', '申請', '신청', 0),
+('請', '申請', '신청', 1),
+('申', '申請書', '신청서', 0),
+('請', '申請書', '신청서', 1),
+('書', '申請書', '신청서', 2),
+('申', '申請者', '신청자', 0),
+('請', '申請者', '신청자', 1),
+('者', '申請者', '신청자', 2),
+('男', '男', '남', 0),
+('男', '男--', '남동생', 0),
+('-', '男--', '남동생', 1),
+('-', '男--', '남동생', 2),
+('男', '男便', '남편', 0),
+('便', '男便', '남편', 1),
+('男', '男優', '남우', 0),
+('優', '男優', '남우', 1),
+('男', '男同生', '남동생', 0),
+('同', '男同生', '남동생', 1),
+('生', '男同生', '남동생', 2),
+('男', '男女', '남녀', 0),
+('女', '男女', '남녀', 1),
+('男', '男女老少', '남녀노소', 0),
+('女', '男女老少', '남녀노소', 1),
+('老', '男女老少', '남녀노소', 2),
+('少', '男女老少', '남녀노소', 3),
+('男', '男妹', '남매', 0),
+('妹', '男妹', '남매', 1),
+('男', '男娼', '남창', 0),
+('娼', '男娼', '남창', 1),
+('男', '男子', '남자', 0),
+('子', '男子', '남자', 1),
+('男', '男子親舊', '남자친구', 0),
+('子', '男子親舊', '남자친구', 1),
+('親', '男子親舊', '남자친구', 2),
+('舊', '男子親舊', '남자친구', 3),
+('男', '男學生', '남학생', 0),
+('學', '男學生', '남학생', 1),
+('生', '男學生', '남학생', 2),
+('男', '男尊女卑', '남존여비', 0),
+('尊', '男尊女卑', '남존여비', 1),
+('女', '男尊女卑', '남존여비', 2),
+('卑', '男尊女卑', '남존여비', 3),
+('男', '男性', '남성', 0),
+('性', '男性', '남성', 1),
+('男', '男性嫌惡', '남성혐오', 0),
+('性', '男性嫌惡', '남성혐오', 1),
+('嫌', '男性嫌惡', '남성혐오', 2),
+('惡', '男性嫌惡', '남성혐오', 3),
+('男', '男性的', '남성적', 0),
+('性', '男性的', '남성적', 1),
+('的', '男性的', '남성적', 2),
+('男', '男性語', '남성어', 0),
+('性', '男性語', '남성어', 1),
+('語', '男性語', '남성어', 2),
+('男', '男根', '남근', 0),
+('根', '男根', '남근', 1),
+('男', '男爵', '남작', 0),
+('爵', '男爵', '남작', 1),
+('男', '男聲中音', '남성중음', 0),
+('聲', '男聲中音', '남성중음', 1),
+('中', '男聲中音', '남성중음', 2),
+('音', '男聲中音', '남성중음', 3),
+('男', '男聲低音', '남성저음', 0),
+('聲', '男聲低音', '남성저음', 1),
+('低', '男聲低音', '남성저음', 2),
+('音', '男聲低音', '남성저음', 3),
+('男', '男聲高音', '남성고음', 0),
+('聲', '男聲高音', '남성고음', 1),
+('高', '男聲高音', '남성고음', 2),
+('音', '男聲高音', '남성고음', 3),
+('男', '男色', '남색', 0),
+('色', '男色', '남색', 1),
+('男', '男裝', '남장', 0),
+('裝', '男裝', '남장', 1),
+('男', '男親', '남친', 0),
+('親', '男親', '남친', 1),
+('男', '男超', '남초', 0),
+('超', '男超', '남초', 1),
+('男', '男體', '남체', 0),
+('體', '男體', '남체', 1),
+('男', '男캐', '남캐', 0),
+('캐', '男캐', '남캐', 1),
+('畓', '畓', '답', 0),
+('留', '留', '유', 0),
+('留', '留保', '류보', 0),
+('保', '留保', '류보', 1),
+('留', '留保', '유보', 0),
+('保', '留保', '유보', 1),
+('留', '留學', '유학', 0),
+('學', '留學', '유학', 1),
+('留', '留學生', '유학생', 0),
+('學', '留學生', '유학생', 1),
+('生', '留學生', '유학생', 2),
+('留', '留守', '유수', 0),
+('守', '留守', '유수', 1),
+('留', '留心', '유심', 0),
+('心', '留心', '유심', 1),
+('留', '留置', '유치', 0),
+('置', '留置', '유치', 1),
+('畜', '畜生', '축생', 0),
+('生', '畜生', '축생', 1),
+('畜', '畜産', '축산', 0),
+('産', '畜産', '축산', 1),
+('畜', '畜舍', '축사', 0),
+('舍', '畜舍', '축사', 1),
+('畢', '畢業', '필업', 0),
+('業', '畢業', '필업', 1),
+('畢', '畢證', '필증', 0),
+('證', '畢證', '필증', 1),
+('略', '略史', '약사', 0),
+('史', '略史', '약사', 1),
+('略', '略圖', '약도', 0),
+('圖', '略圖', '약도', 1),
+('略', '略字', '약자', 0),
+('字', '略字', '약자', 1),
+('略', '略式', '약식', 0),
+('式', '略式', '약식', 1),
+('略', '略歷', '약력', 0),
+('歷', '略歷', '약력', 1),
+('略', '略稱', '약칭', 0),
+('稱', '略稱', '약칭', 1),
+('略', '略號', '약호', 0),
+('號', '略號', '약호', 1),
+('略', '略語', '략어', 0),
+('語', '略語', '략어', 1),
+('略', '略語', '약어', 0),
+('語', '略語', '약어', 1),
+('番', '番', '번', 0),
+('番', '番-', '번째', 0),
+('-', '番-', '번째', 1),
+('番', '番地', '번지', 0),
+('地', '番地', '번지', 1),
+('番', '番號', '번호', 0),
+('號', '番號', '번호', 1),
+('番', '番號版', '번호판', 0),
+('號', '番號版', '번호판', 1),
+('版', '番號版', '번호판', 2),
+('畫', '畫像', '화상', 0),
+('像', '畫像', '화상', 1),
+('畫', '畫匠', '화장', 0),
+('匠', '畫匠', '화장', 1),
+('畫', '畫商', '화상', 0),
+('商', '畫商', '화상', 1),
+('畫', '畫報', '화보', 0),
+('報', '畫報', '화보', 1),
+('畫', '畫家', '화가', 0),
+('家', '畫家', '화가', 1),
+('畫', '畫屛', '화병', 0),
+('屛', '畫屛', '화병', 1),
+('畫', '畫幅', '화폭', 0),
+('幅', '畫幅', '화폭', 1),
+('畫', '畫廊', '화랑', 0),
+('廊', '畫廊', '화랑', 1),
+('畫', '畫甁', '화병', 0),
+('甁', '畫甁', '화병', 1),
+('畫', '畫質', '화질', 0),
+('質', '畫質', '화질', 1),
+('畫', '畫面', '화면', 0),
+('面', '畫面', '화면', 1),
+('畫', '畫餠', '화병', 0),
+('餠', '畫餠', '화병', 1),
+('異', '異人', '이인', 0),
+('人', '異人', '이인', 1),
+('異', '異名', '이명', 0),
+('名', '異名', '이명', 1),
+('異', '異國人', '이국인', 0),
+('國', '異國人', '이국인', 1),
+('人', '異國人', '이국인', 2),
+('異', '異常', '이상', 0),
+('常', '異常', '이상', 1),
+('異', '異形', '이형', 0),
+('形', '異形', '이형', 1),
+('異', '異性', '이성', 0),
+('性', '異性', '이성', 1),
+('異', '異性愛', '이성애', 0),
+('性', '異性愛', '이성애', 1),
+('愛', '異性愛', '이성애', 2),
+('異', '異性愛者', '이성애자', 0),
+('性', '異性愛者', '이성애자', 1),
+('愛', '異性愛者', '이성애자', 2),
+('者', '異性愛者', '이성애자', 3),
+('異', '異意', '이의', 0),
+('意', '異意', '이의', 1),
+('異', '異敎', '이교', 0),
+('敎', '異敎', '이교', 1),
+('異', '異敎徒', '이교도', 0),
+('敎', '異敎徒', '이교도', 1),
+('徒', '異敎徒', '이교도', 2),
+('異', '異教', '이교', 0),
+('教', '異教', '이교', 1),
+('異', '異朝', '이조', 0),
+('朝', '異朝', '이조', 1),
+('異', '異榮養症', '이영양증', 0),
+('榮', '異榮養症', '이영양증', 1),
+('養', '異榮養症', '이영양증', 2),
+('症', '異榮養症', '이영양증', 3),
+('異', '異母', '이모', 0),
+('母', '異母', '이모', 1),
+('異', '異端', '이단', 0),
+('端', '異端', '이단', 1),
+('異', '異端者', '이단자', 0),
+('端', '異端者', '이단자', 1),
+('者', '異端者', '이단자', 2),
+('異', '異義', '이의', 0),
+('義', '異義', '이의', 1),
+('異', '異般', '이반', 0),
+('般', '異般', '이반', 1),
+('異', '異見', '이견', 0),
+('見', '異見', '이견', 1),
+('異', '異議', '이의', 0),
+('議', '異議', '이의', 1),
+('異', '異變', '이변', 0),
+('變', '異變', '이변', 1),
+('異', '異質', '이질', 0),
+('質', '異質', '이질', 1),
+('異', '異邦', '이방', 0),
+('邦', '異邦', '이방', 1),
+('異', '異邦人', '이방인', 0),
+('邦', '異邦人', '이방인', 1),
+('人', '異邦人', '이방인', 2),
+('異', '異體字', '이체자', 0),
+('體', '異體字', '이체자', 1),
+('字', '異體字', '이체자', 2),
+('畵', '畵像', '화상', 0),
+('像', '畵像', '화상', 1),
+('畵', '畵商', '화상', 0),
+('商', '畵商', '화상', 1),
+('畵', '畵室', '화실', 0),
+('室', '畵室', '화실', 1),
+('畵', '畵家', '화가', 0),
+('家', '畵家', '화가', 1),
+('畵', '畵法', '화법', 0),
+('法', '畵法', '화법', 1),
+('畵', '畵質', '화질', 0),
+('質', '畵質', '화질', 1),
+('畵', '畵面', '화면', 0),
+('面', '畵面', '화면', 1),
+('畵', '畵龍點睛', '화룡점정', 0),
+('龍', '畵龍點睛', '화룡점정', 1),
+('點', '畵龍點睛', '화룡점정', 2),
+('睛', '畵龍點睛', '화룡점정', 3),
+('當', '當', '당', 0),
+('當', '當事', '당사', 0),
+('事', '當事', '당사', 1),
+('當', '當付', '당부', 0),
+('付', '當付', '당부', 1),
+('當', '當代', '당대', 0),
+('代', '當代', '당대', 1),
+('當', '當分間', '당분간', 0),
+('分', '當分間', '당분간', 1),
+('間', '當分間', '당분간', 2),
+('當', '當場', '당장', 0),
+('場', '當場', '당장', 1),
+('當', '當局', '당국', 0),
+('局', '當局', '당국', 1),
+('當', '當惑', '당혹', 0),
+('惑', '當惑', '당혹', 1),
+('當', '當日', '당일', 0),
+('日', '當日', '당일', 1),
+('當', '當時', '당시', 0),
+('時', '當時', '당시', 1),
+('當', '當然', '당연', 0),
+('然', '當然', '당연', 1),
+('當', '當社', '당사', 0),
+('社', '當社', '당사', 1),
+('當', '當籤', '당첨', 0),
+('籤', '當籤', '당첨', 1),
+('當', '當身', '당신', 0),
+('身', '當身', '당신', 1),
+('當', '當選', '당선', 0),
+('選', '當選', '당선', 1),
+('畸', '畸形', '기형', 0),
+('形', '畸形', '기형', 1),
+('疇', '疇日', '주일', 0),
+('日', '疇日', '주일', 1),
+('疊', '疊疊', '첩첩', 0),
+('疊', '疊疊', '첩첩', 1),
+('疎', '疎外', '소외', 0),
+('外', '疎外', '소외', 1),
+('疎', '疎遠', '소원', 0),
+('遠', '疎遠', '소원', 1),
+('疎', '疎開', '소개', 0),
+('開', '疎開', '소개', 1),
+('疏', '疏外', '소외', 0),
+('外', '疏外', '소외', 1),
+('疏', '疏忽', '소홀', 0),
+('忽', '疏忽', '소홀', 1),
+('疏', '疏通', '소통', 0),
+('通', '疏通', '소통', 1),
+('疑', '疑問', '의문', 0),
+('問', '疑問', '의문', 1),
+('疑', '疑問死', '의문사', 0),
+('問', '疑問死', '의문사', 1),
+('死', '疑問死', '의문사', 2),
+('疑', '疑問詞', '의문사', 0),
+('問', '疑問詞', '의문사', 1),
+('詞', '疑問詞', '의문사', 2),
+('疑', '疑心', '의심', 0),
+('心', '疑心', '의심', 1),
+('疑', '疑惑', '의혹', 0),
+('惑', '疑惑', '의혹', 1),
+('疑', '疑獄', '의옥', 0),
+('獄', '疑獄', '의옥', 1),
+('疑', '疑訝', '의아', 0),
+('訝', '疑訝', '의아', 1),
+('疥', '疥瘡', '개창', 0),
+('瘡', '疥瘡', '개창', 1),
+('疥', '疥癬', '개선', 0),
+('癬', '疥癬', '개선', 1),
+('疫', '疫學', '역학', 0),
+('學', '疫學', '역학', 1),
+('疫', '疫病', '역병', 0),
+('病', '疫病', '역병', 1),
+('疱', '疱疹', '포진', 0),
+('疹', '疱疹', '포진', 1),
+('疲', '疲勞', '피로', 0),
+('勞', '疲勞', '피로', 1),
+('疲', '疲困', '피곤', 0),
+('困', '疲困', '피곤', 1),
+('疲', '疲弊', '피폐', 0),
+('弊', '疲弊', '피폐', 1),
+('疾', '疾患', '질환', 0),
+('患', '疾患', '질환', 1),
+('疾', '疾病', '질병', 0),
+('病', '疾病', '질병', 1),
+('疾', '疾走', '질주', 0),
+('走', '疾走', '질주', 1),
+('疾', '疾風', '질풍', 0),
+('風', '疾風', '질풍', 1),
+('疾', '疾風怒濤', '질풍노도', 0),
+('風', '疾風怒濤', '질풍노도', 1),
+('怒', '疾風怒濤', '질풍노도', 2),
+('濤', '疾風怒濤', '질풍노도', 3),
+('病', '病', '병', 0),
+('病', '病--', '병들다', 0),
+('-', '病--', '병들다', 1),
+('-', '病--', '병들다', 2),
+('病', '病兒', '병아', 0),
+('兒', '病兒', '병아', 1),
+('病', '病室', '병실', 0),
+('室', '病室', '병실', 1),
+('病', '病床', '병상', 0),
+('床', '病床', '병상', 1),
+('病', '病弱', '병약', 0),
+('弱', '病弱', '병약', 1),
+('病', '病期', '병기', 0),
+('期', '病期', '병기', 1),
+('病', '病棟', '병동', 0),
+('棟', '病棟', '병동', 1),
+('病', '病歷', '병력', 0),
+('歷', '病歷', '병력', 1),
+('病', '病毒', '병독', 0),
+('毒', '病毒', '병독', 1),
+('病', '病氣', '병기', 0),
+('氣', '病氣', '병기', 1),
+('病', '病理', '병리', 0),
+('理', '病理', '병리', 1),
+('病', '病理學', '병리학', 0),
+('理', '病理學', '병리학', 1),
+('學', '病理學', '병리학', 2),
+('病', '病者', '병자', 0),
+('者', '病者', '병자', 1),
+('病', '病身', '병신', 0),
+('身', '病身', '병신', 1),
+('病', '病院', '병원', 0),
+('院', '病院', '병원', 1),
+('病', '病맛', '병맛', 0),
+('맛', '病맛', '병맛', 1),
+('症', '症候', '증후', 0),
+('候', '症候', '증후', 1),
+('症', '症候群', '증후군', 0),
+('候', '症候群', '증후군', 1),
+('群', '症候群', '증후군', 2),
+('症', '症勢', '증세', 0),
+('勢', '症勢', '증세', 1),
+('症', '症狀', '증상', 0),
+('狀', '症狀', '증상', 1),
+('痔', '痔核', '치핵', 0),
+('核', '痔核', '치핵', 1),
+('痔', '痔疾', '치질', 0),
+('疾', '痔疾', '치질', 1),
+('痔', '痔瘻', '치루', 0),
+('瘻', '痔瘻', '치루', 1),
+('痔', '痔裂', '치열', 0),
+('裂', '痔裂', '치열', 1),
+('痕', '痕跡', '흔적', 0),
+('跡', '痕跡', '흔적', 1),
+('痕', '痕迹', '흔적', 0),
+('迹', '痕迹', '흔적', 1),
+('痘', '痘瘡', '두창', 0),
+('瘡', '痘瘡', '두창', 1),
+('痘', '痘苗', '두묘', 0),
+('苗', '痘苗', '두묘', 1),
+('痙', '痙攣', '경련', 0),
+('攣', '痙攣', '경련', 1),
+('痛', '痛症', '통증', 0),
+('症', '痛症', '통증', 1),
+('痛', '痛痒', '통양', 0),
+('痒', '痛痒', '통양', 1),
+('痛', '痛風', '통풍', 0),
+('風', '痛風', '통풍', 1),
+('痢', '痢疾', '이질', 0),
+('疾', '痢疾', '이질', 1),
+('痤', '痤瘡', '좌창', 0),
+('瘡', '痤瘡', '좌창', 1),
+('痰', '痰', '담', 0),
+('痲', '痲痺', '마비', 0),
+('痺', '痲痺', '마비', 1),
+('痲', '痲藥', '마약', 0),
+('藥', '痲藥', '마약', 1),
+('痲', '痲醉', '마취', 0),
+('醉', '痲醉', '마취', 1),
+('痲', '痲醉劑', '마취제', 0),
+('醉', '痲醉劑', '마취제', 1),
+('劑', '痲醉劑', '마취제', 2),
+('痲', '痲醉藥', '마취약', 0),
+('醉', '痲醉藥', '마취약', 1),
+('藥', '痲醉藥', '마취약', 2),
+('痼', '痼疾病', '고질병', 0),
+('疾', '痼疾病', '고질병', 1),
+('病', '痼疾病', '고질병', 2),
+('瘦', '瘦果', '수과', 0),
+('果', '瘦果', '수과', 1),
+('瘦', '瘦身', '수신', 0),
+('身', '瘦身', '수신', 1),
+('瘧', '瘧', '학', 0),
+('瘴', '瘴氣', '장기', 0),
+('氣', '瘴氣', '장기', 1),
+('瘴', '瘴癘', '장려', 0),
+('癘', '瘴癘', '장려', 1),
+('療', '療法', '료법', 0),
+('法', '療法', '료법', 1),
+('療', '療法', '요법', 0),
+('法', '療法', '요법', 1),
+('療', '療養', '요양', 0),
+('養', '療養', '요양', 1),
+('療', '療養所', '요양소', 0),
+('養', '療養所', '요양소', 1),
+('所', '療養所', '요양소', 2),
+('療', '療養院', '요양원', 0),
+('養', '療養院', '요양원', 1),
+('院', '療養院', '요양원', 2),
+('癌', '癌', '암', 0),
+('癌', '癌腫', '암종', 0),
+('腫', '癌腫', '암종', 1),
+('癎', '癎疾', '간질', 0),
+('疾', '癎疾', '간질', 1),
+('癒', '癒着', '유착', 0),
+('着', '癒着', '유착', 1),
+('癖', '癖', '벽', 0),
+('癡', '癡', '치', 0),
+('癡', '癡呆', '치매', 0),
+('呆', '癡呆', '치매', 1),
+('癡', '癡漢', '치한', 0),
+('漢', '癡漢', '치한', 1),
+('癩', '癩患者', '나환자', 0),
+('患', '癩患者', '나환자', 1),
+('者', '癩患者', '나환자', 2),
+('癩', '癩病', '나병', 0),
+('病', '癩病', '나병', 1),
+('癬', '癬瘡', '선창', 0),
+('瘡', '癬瘡', '선창', 1),
+('癸', '癸', '계', 0),
+('癸', '癸丑', '계축', 0),
+('丑', '癸丑', '계축', 1),
+('癸', '癸亥', '계해', 0),
+('亥', '癸亥', '계해', 1),
+('癸', '癸卯', '계묘', 0),
+('卯', '癸卯', '계묘', 1),
+('癸', '癸巳', '계사', 0),
+('巳', '癸巳', '계사', 1),
+('癸', '癸未', '계미', 0),
+('未', '癸未', '계미', 1),
+('癸', '癸酉', '계유', 0),
+('酉', '癸酉', '계유', 1),
+('登', '登場', '등장', 0),
+('場', '登場', '등장', 1),
+('登', '登場人物', '등장인물', 0),
+('場', '登場人物', '등장인물', 1),
+('人', '登場人物', '등장인물', 2),
+('物', '登場人物', '등장인물', 3),
+('登', '登壇', '등단', 0),
+('壇', '登壇', '등단', 1),
+('登', '登山', '등산', 0),
+('山', '登山', '등산', 1),
+('登', '登山客', '등산객', 0),
+('山', '登山客', '등산객', 1),
+('客', '登山客', '등산객', 2),
+('登', '登山路', '등산로', 0),
+('山', '登山路', '등산로', 1),
+('路', '登山路', '등산로', 2),
+('登', '登攀', '등반', 0),
+('攀', '登攀', '등반', 1),
+('登', '登板', '등판', 0),
+('板', '登板', '등판', 1),
+('登', '登校', '등교', 0),
+('校', '登校', '등교', 1),
+('登', '登極', '등극', 0),
+('極', '登極', '등극', 1),
+('登', '登記', '등기', 0),
+('記', '登記', '등기', 1),
+('登', '登記郵便', '등기우편', 0),
+('記', '登記郵便', '등기우편', 1),
+('郵', '登記郵便', '등기우편', 2),
+('便', '登記郵便', '등기우편', 3),
+('登', '登錄', '등록', 0),
+('錄', '登錄', '등록', 1),
+('登', '登錄器', '등록기', 0),
+('錄', '登錄器', '등록기', 1),
+('器', '登錄器', '등록기', 2),
+('登', '登錄證', '등록증', 0),
+('錄', '登錄證', '등록증', 1),
+('證', '登錄證', '등록증', 2),
+('登', '登頂', '등정', 0),
+('頂', '登頂', '등정', 1),
+('發', '發作', '발작', 0),
+('作', '發作', '발작', 1),
+('發', '發信', '발신', 0),
+('信', '發信', '발신', 1),
+('發', '發光', '발광', 0),
+('光', '發光', '발광', 1),
+('發', '發光민大口', '발광민대구', 0),
+('光', '發光민大口', '발광민대구', 1),
+('민', '發光민大口', '발광민대구', 2),
+('大', '發光민大口', '발광민대구', 3),
+('口', '發光민大口', '발광민대구', 4),
+('發', '發刊', '발간', 0),
+('刊', '發刊', '발간', 1),
+('發', '發刊辭', '발간사', 0),
+('刊', '發刊辭', '발간사', 1),
+('辭', '發刊辭', '발간사', 2),
+('發', '發射', '발사', 0),
+('射', '發射', '발사', 1),
+('發', '發展', '발전', 0),
+('展', '發展', '발전', 1),
+('發', '發展期', '발전기', 0),
+('展', '發展期', '발전기', 1),
+('期', '發展期', '발전기', 2),
+('發', '發展途上國', '발전도상국', 0),
+('展', '發展途上國', '발전도상국', 1),
+('途', '發展途上國', '발전도상국', 2),
+('上', '發展途上國', '발전도상국', 3),
+('國', '發展途上國', '발전도상국', 4),
+('發', '發情', '발정', 0),
+('情', '發情', '발정', 1),
+('發', '發情期', '발정기', 0),
+('情', '發情期', '발정기', 1),
+('期', '發情期', '발정기', 2),
+('發', '發想', '발상', 0),
+('想', '發想', '발상', 1),
+('發', '發振器', '발진기', 0),
+('振', '發振器', '발진기', 1),
+('器', '發振器', '발진기', 2),
+('發', '發掘', '발굴', 0),
+('掘', '發掘', '발굴', 1),
+('發', '發揮', '발휘', 0),
+('揮', '發揮', '발휘', 1),
+('發', '發效', '발효', 0),
+('效', '發效', '발효', 1),
+('發', '發明', '발명', 0),
+('明', '發明', '발명', 1),
+('發', '發汗', '발한', 0),
+('汗', '發汗', '발한', 1),
+('發', '發泡酒', '발포주', 0),
+('泡', '發泡酒', '발포주', 1),
+('酒', '發泡酒', '발포주', 2),
+('發', '發注', '발주', 0),
+('注', '發注', '발주', 1),
+('發', '發火', '발화', 0),
+('火', '發火', '발화', 1),
+('發', '發煙器', '발연기', 0),
+('煙', '發煙器', '발연기', 1),
+('器', '發煙器', '발연기', 2),
+('發', '發熱', '발열', 0),
+('熱', '發熱', '발열', 1),
+('發', '發狂', '발광', 0),
+('狂', '發狂', '발광', 1),
+('發', '發生', '발생', 0),
+('生', '發生', '발생', 1),
+('發', '發生學', '발생학', 0),
+('生', '發生學', '발생학', 1),
+('學', '發生學', '발생학', 2),
+('發', '發疹', '발진', 0),
+('疹', '發疹', '발진', 1),
+('發', '發病', '발병', 0),
+('病', '發病', '발병', 1),
+('發', '發癌', '발암', 0),
+('癌', '發癌', '발암', 1),
+('發', '發砲', '발포', 0),
+('砲', '發砲', '발포', 1),
+('發', '發破', '발파', 0),
+('破', '發破', '발파', 1),
+('發', '發祥地', '발상지', 0),
+('祥', '發祥地', '발상지', 1),
+('地', '發祥地', '발상지', 2),
+('發', '發端', '발단', 0),
+('端', '發端', '발단', 1),
+('發', '發給', '발급', 0),
+('給', '發給', '발급', 1),
+('發', '發聲', '발성', 0),
+('聲', '發聲', '발성', 1),
+('發', '發育', '발육', 0),
+('育', '發育', '발육', 1),
+('發', '發行', '발행', 0),
+('行', '發行', '발행', 1),
+('發', '發行人', '발행인', 0),
+('行', '發行人', '발행인', 1),
+('人', '發行人', '발행인', 2),
+('發', '發行所', '발행소', 0),
+('行', '發行所', '발행소', 1),
+('所', '發行所', '발행소', 2),
+('發', '發表', '발표', 0),
+('表', '發表', '발표', 1),
+('發', '發見', '발견', 0),
+('見', '發見', '발견', 1),
+('發', '發見者', '발견자', 0),
+('見', '發見者', '발견자', 1),
+('者', '發見者', '발견자', 2),
+('發', '發覺', '발각', 0),
+('覺', '發覺', '발각', 1),
+('發', '發言', '발언', 0),
+('言', '發言', '발언', 1),
+('發', '發賣', '발매', 0),
+('賣', '發賣', '발매', 1),
+('發', '發賣機', '발매기', 0),
+('賣', '發賣機', '발매기', 1),
+('機', '發賣機', '발매기', 2),
+('發', '發起', '발기', 0),
+('起', '發起', '발기', 1),
+('發', '發足', '발족', 0),
+('足', '發足', '발족', 1),
+('發', '發送', '발송', 0),
+('送', '發送', '발송', 1),
+('發', '發送者', '발송자', 0),
+('送', '發送者', '발송자', 1),
+('者', '發送者', '발송자', 2),
+('發', '發達', '발달', 0),
+('達', '發達', '발달', 1),
+('發', '發電', '발전', 0),
+('電', '發電', '발전', 1),
+('發', '發電所', '발전소', 0),
+('電', '發電所', '발전소', 1),
+('所', '發電所', '발전소', 2),
+('發', '發電機', '발전기', 0),
+('電', '發電機', '발전기', 1),
+('機', '發電機', '발전기', 2),
+('發', '發靷', '발인', 0),
+('靷', '發靷', '발인', 1),
+('發', '發音', '발음', 0),
+('音', '發音', '발음', 1),
+('發', '發音器官', '발음기관', 0),
+('音', '發音器官', '발음기관', 1),
+('器', '發音器官', '발음기관', 2),
+('官', '發音器官', '발음기관', 3),
+('發', '發音法', '발음법', 0),
+('音', '發音法', '발음법', 1),
+('法', '發音法', '발음법', 2),
+('白', '白丁', '백정', 0),
+('丁', '白丁', '백정', 1),
+('白', '白人', '백인', 0),
+('人', '白人', '백인', 1),
+('白', '白兔', '백토', 0),
+('兔', '白兔', '백토', 1),
+('白', '白內障', '백내장', 0),
+('內', '白內障', '백내장', 1),
+('障', '白內障', '백내장', 2),
+('白', '白土', '백토', 0),
+('土', '白土', '백토', 1),
+('白', '白地', '백지', 0),
+('地', '白地', '백지', 1),
+('白', '白堊', '백악', 0),
+('堊', '白堊', '백악', 1),
+('白', '白堊紀', '백악기', 0),
+('堊', '白堊紀', '백악기', 1),
+('紀', '白堊紀', '백악기', 2),
+('白', '白堊館', '백악관', 0),
+('堊', '白堊館', '백악관', 1),
+('館', '白堊館', '백악관', 2),
+('白', '白夜', '백야', 0),
+('夜', '白夜', '백야', 1),
+('白', '白手', '백수', 0),
+('手', '白手', '백수', 1),
+('白', '白日夢', '백일몽', 0),
+('日', '白日夢', '백일몽', 1),
+('夢', '白日夢', '백일몽', 2),
+('白', '白書', '백서', 0),
+('書', '白書', '백서', 1),
+('白', '白木蓮', '백목련', 0),
+('木', '白木蓮', '백목련', 1),
+('蓮', '白木蓮', '백목련', 2),
+('白', '白松', '백송', 0),
+('松', '白松', '백송', 1),
+('白', '白板', '백판', 0),
+('板', '白板', '백판', 1),
+('白', '白條漁', '백조어', 0),
+('條', '白條漁', '백조어', 1),
+('漁', '白條漁', '백조어', 2),
+('白', '白業', '백업', 0),
+('業', '白業', '백업', 1),
+('白', '白樺', '백화', 0),
+('樺', '白樺', '백화', 1),
+('白', '白檀', '백단', 0),
+('檀', '白檀', '백단', 1),
+('白', '白沙場', '백사장', 0),
+('沙', '白沙場', '백사장', 1),
+('場', '白沙場', '백사장', 2),
+('白', '白熱', '백열', 0),
+('熱', '白熱', '백열', 1),
+('白', '白瓜', '백과', 0),
+('瓜', '白瓜', '백과', 1),
+('白', '白痴', '백치', 0),
+('痴', '白痴', '백치', 1),
+('白', '白癡', '백치', 0),
+('癡', '白癡', '백치', 1),
+('白', '白癬', '백선', 0),
+('癬', '白癬', '백선', 1),
+('白', '白砂糖', '백사탕', 0),
+('砂', '白砂糖', '백사탕', 1),
+('糖', '白砂糖', '백사탕', 2),
+('白', '白紙', '백지', 0),
+('紙', '白紙', '백지', 1),
+('白', '白色', '백색', 0),
+('色', '白色', '백색', 1),
+('白', '白色症', '백색증', 0),
+('色', '白色症', '백색증', 1),
+('症', '白色症', '백색증', 2),
+('白', '白芷', '백지', 0),
+('芷', '白芷', '백지', 1),
+('白', '白菜', '백채', 0),
+('菜', '白菜', '백채', 1),
+('白', '白葡萄酒', '백포도주', 0),
+('葡', '白葡萄酒', '백포도주', 1),
+('萄', '白葡萄酒', '백포도주', 2),
+('酒', '白葡萄酒', '백포도주', 3),
+('白', '白血球', '백혈구', 0),
+('血', '白血球', '백혈구', 1),
+('球', '白血球', '백혈구', 2),
+('白', '白血病', '백혈병', 0),
+('血', '白血病', '백혈병', 1),
+('病', '白血病', '백혈병', 2),
+('白', '白衣民族', '백의민족', 0),
+('衣', '白衣民族', '백의민족', 1),
+('民', '白衣民族', '백의민족', 2),
+('族', '白衣民族', '백의민족', 3),
+('白', '白質', '백질', 0),
+('質', '白質', '백질', 1),
+('白', '白金', '백금', 0),
+('金', '白金', '백금', 1),
+('白', '白銀', '백은', 0),
+('銀', '白銀', '백은', 1),
+('白', '白鐵鑛', '백철광', 0),
+('鐵', '白鐵鑛', '백철광', 1),
+('鑛', '白鐵鑛', '백철광', 2),
+('白', '白雪', '백설', 0),
+('雪', '白雪', '백설', 1),
+('白', '白雪糖', '백설탕', 0),
+('雪', '白雪糖', '백설탕', 1),
+('糖', '白雪糖', '백설탕', 2),
+('白', '白雲石', '백운석', 0),
+('雲', '白雲石', '백운석', 1),
+('石', '白雲石', '백운석', 2),
+('白', '白露', '백로', 0),
+('露', '白露', '백로', 1),
+('白', '白頭', '백두', 0),
+('頭', '白頭', '백두', 1),
+('白', '白頭山', '백두산', 0),
+('頭', '白頭山', '백두산', 1),
+('山', '白頭山', '백두산', 2),
+('白', '白飯', '백반', 0),
+('飯', '白飯', '백반', 1),
+('白', '白馬', '백마', 0),
+('馬', '白馬', '백마', 1),
+('白', '白鮮', '백선', 0),
+('鮮', '白鮮', '백선', 1),
+('白', '白鰱魚', '백련어', 0),
+('鰱', '白鰱魚', '백련어', 1),
+('魚', '白鰱魚', '백련어', 2),
+('白', '白鳥', '백조', 0),
+('鳥', '白鳥', '백조', 1),
+('白', '白鶴', '백학', 0),
+('鶴', '白鶴', '백학', 1),
+('白', '白鷺', '백로', 0),
+('鷺', '白鷺', '백로', 1),
+('白', '白鼠', '백서', 0),
+('鼠', '白鼠', '백서', 1),
+('白', '白齒', '백치', 0),
+('齒', '白齒', '백치', 1),
+('百', '百', '백', 0),
+('百', '百兩金', '백량금', 0),
+('兩', '百兩金', '백량금', 1),
+('金', '百兩金', '백량금', 2),
+('百', '百八煩惱', '백팔번뇌', 0),
+('八', '百八煩惱', '백팔번뇌', 1),
+('煩', '百八煩惱', '백팔번뇌', 2),
+('惱', '百八煩惱', '백팔번뇌', 3),
+('百', '百分比', '백분비', 0),
+('分', '百分比', '백분비', 1),
+('比', '百分比', '백분비', 2),
+('百', '百分率', '백분율', 0),
+('分', '百分率', '백분율', 1),
+('率', '百分率', '백분율', 2),
+('百', '百合', '백합', 0),
+('合', '百合', '백합', 1),
+('百', '百姓', '백성', 0),
+('姓', '百姓', '백성', 1),
+('百', '百尺竿頭', '백척간두', 0),
+('尺', '百尺竿頭', '백척간두', 1),
+('竿', '百尺竿頭', '백척간두', 2),
+('頭', '百尺竿頭', '백척간두', 3),
+('百', '百戰百勝', '백전백승', 0),
+('戰', '百戰百勝', '백전백승', 1),
+('百', '百戰百勝', '백전백승', 2),
+('勝', '百戰百勝', '백전백승', 3),
+('百', '百方', '백방', 0),
+('方', '百方', '백방', 1),
+('百', '百日', '백일', 0),
+('日', '百日', '백일', 1),
+('百', '百日咳', '백일해', 0),
+('日', '百日咳', '백일해', 1),
+('咳', '百日咳', '백일해', 2),
+('百', '百日天下', '백일천하', 0),
+('日', '百日天下', '백일천하', 1),
+('天', '百日天下', '백일천하', 2),
+('下', '百日天下', '백일천하', 3),
+('百', '百日紅', '백일홍', 0),
+('日', '百日紅', '백일홍', 1),
+('紅', '百日紅', '백일홍', 2),
+('百', '百日齋', '백일재', 0),
+('日', '百日齋', '백일재', 1),
+('齋', '百日齋', '백일재', 2),
+('百', '百濟', '백제', 0),
+('濟', '百濟', '백제', 1),
+('百', '百科', '백과', 0),
+('科', '百科', '백과', 1),
+('百', '百科事典', '백과사전', 0),
+('科', '百科事典', '백과사전', 1),
+('事', '百科事典', '백과사전', 2),
+('典', '百科事典', '백과사전', 3),
+('百', '百科全書', '백과전서', 0),
+('科', '百科全書', '백과전서', 1),
+('全', '百科全書', '백과전서', 2),
+('書', '百科全書', '백과전서', 3),
+('百', '百聞不如一見', '백문불여일견', 0),
+('聞', '百聞不如一見', '백문불여일견', 1),
+('不', '百聞不如一見', '백문불여일견', 2),
+('如', '百聞不如一見', '백문불여일견', 3),
+('一', '百聞不如一見', '백문불여일견', 4),
+('見', '百聞不如一見', '백문불여일견', 5),
+('百', '百聞이  不如一', '백문이 불여일견', 0),
+('聞', '百聞이  不如一', '백문이 불여일견', 1),
+('이', '百聞이  不如一', '백문이 불여일견', 2),
+('不', '百聞이  不如一', '백문이 불여일견', 5),
+('如', '百聞이  不如一', '백문이 불여일견', 6),
+('一', '百聞이  不如一', '백문이 불여일견', 7),
+('百', '百萬', '백만', 0),
+('萬', '百萬', '백만', 1),
+('百', '百貨店', '백화점', 0),
+('貨', '百貨店', '백화점', 1),
+('店', '百貨店', '백화점', 2),
+('百', '百選', '백선', 0),
+('選', '百選', '백선', 1),
+('百', '百날기침', '백날기침', 0),
+('날', '百날기침', '백날기침', 1),
+('기', '百날기침', '백날기침', 2),
+('침', '百날기침', '백날기침', 3),
+('的', '的', '적', 0),
+('的', '的中', '적중', 0),
+('中', '的中', '적중', 1),
+('的', '的例', '적례', 0),
+('例', '的例', '적례', 1),
+('的', '的然', '적연', 0),
+('然', '的然', '적연', 1),
+('皇', '皇后', '황후', 0),
+('后', '皇后', '황후', 1),
+('皇', '皇天', '황천', 0),
+('天', '皇天', '황천', 1),
+('皇', '皇太后', '황태후', 0),
+('太', '皇太后', '황태후', 1),
+('后', '皇太后', '황태후', 2),
+('皇', '皇太子', '황태자', 0),
+('太', '皇太子', '황태자', 1),
+('子', '皇太子', '황태자', 2),
+('皇', '皇子', '황자', 0),
+('子', '皇子', '황자', 1),
+('皇', '皇帝', '황제', 0),
+('帝', '皇帝', '황제', 1),
+('皇', '皇族', '황족', 0),
+('族', '皇族', '황족', 1),
+('皇', '皇朝', '황조', 0),
+('朝', '皇朝', '황조', 1),
+('皇', '皇皇', '황황', 0),
+('皇', '皇皇', '황황', 1),
+('皎', '皎皎', '교교', 0),
+('皎', '皎皎', '교교', 1),
+('皮', '皮下', '피하', 0),
+('下', '皮下', '피하', 1),
+('皮', '皮下組織', '피하조직', 0),
+('下', '皮下組織', '피하조직', 1),
+('組', '皮下組織', '피하조직', 2),
+('織', '皮下組織', '피하조직', 3),
+('皮', '皮層', '피층', 0),
+('層', '皮層', '피층', 1),
+('皮', '皮脂', '피지', 0),
+('脂', '皮脂', '피지', 1),
+('皮', '皮膚', '피부', 0),
+('膚', '皮膚', '피부', 1),
+('皮', '皮膚癌', '피부암', 0),
+('膚', '皮膚癌', '피부암', 1),
+('癌', '皮膚癌', '피부암', 2),
+('皮', '皮膚科', '피부과', 0),
+('膚', '皮膚科', '피부과', 1),
+('科', '皮膚科', '피부과', 2),
+('皮', '皮膚科學', '피부과학', 0),
+('膚', '皮膚科學', '피부과학', 1),
+('科', '皮膚科學', '피부과학', 2),
+('學', '皮膚科學', '피부과학', 3),
+('皮', '皮膚色', '피부색', 0),
+('膚', '皮膚色', '피부색', 1),
+('色', '皮膚色', '피부색', 2),
+('皮', '皮蛋', '피단', 0),
+('蛋', '皮蛋', '피단', 1),
+('皮', '皮質', '피질', 0),
+('質', '皮質', '피질', 1),
+('皮', '皮革', '피혁', 0),
+('革', '皮革', '피혁', 1),
+('盆', '盆地', '분지', 0),
+('地', '盆地', '분지', 1),
+('盆', '盆景', '분경', 0),
+('景', '盆景', '분경', 1),
+('盆', '盆栽', '분재', 0),
+('栽', '盆栽', '분재', 1),
+('盖', '盖碗', '개완', 0),
+('碗', '盖碗', '개완', 1),
+('盛', '盛德', '성덕', 0),
+('德', '盛德', '성덕', 1),
+('盛', '盛恩', '성은', 0),
+('恩', '盛恩', '성은', 1),
+('盛', '盛況', '성황', 0),
+('況', '盛況', '성황', 1),
+('盛', '盛衰', '성쇠', 0),
+('衰', '盛衰', '성쇠', 1),
+('盛', '盛饌', '성찬', 0),
+('饌', '盛饌', '성찬', 1),
+('盜', '盜作', '도작', 0),
+('作', '盜作', '도작', 1),
+('盜', '盜壘', '도루', 0),
+('壘', '盜壘', '도루', 1),
+('盜', '盜癖', '도벽', 0),
+('癖', '盜癖', '도벽', 1),
+('盜', '盜聽', '도청', 0),
+('聽', '盜聽', '도청', 1),
+('盜', '盜聽機', '도청기', 0),
+('聽', '盜聽機', '도청기', 1),
+('機', '盜聽機', '도청기', 2),
+('盜', '盜賊', '도적', 0),
+('賊', '盜賊', '도적', 1),
+('盜', '盜錄', '도록', 0),
+('錄', '盜錄', '도록', 1),
+('盜', '盜難', '도난', 0),
+('難', '盜難', '도난', 1),
+('盞', '盞', '잔', 0),
+('盟', '盟約', '맹약', 0),
+('約', '盟約', '맹약', 1),
+('盟', '盟誓', '맹세', 0),
+('誓', '盟誓', '맹세', 1),
+('盡', '盡力', '진력', 0),
+('力', '盡力', '진력', 1),
+('盡', '盡終日', '진종일', 0),
+('終', '盡終日', '진종일', 1),
+('日', '盡終日', '진종일', 2),
+('監', '監修', '감수', 0),
+('修', '監修', '감수', 1),
+('監', '監守', '감수', 0),
+('守', '監守', '감수', 1),
+('監', '監察', '감찰', 0),
+('察', '監察', '감찰', 1),
+('監', '監房', '감방', 0),
+('房', '監房', '감방', 1),
+('監', '監房', '깜빵', 0),
+('房', '監房', '깜빵', 1),
+('監', '監査', '감사', 0),
+('査', '監査', '감사', 1),
+('監', '監査官', '감사관', 0),
+('査', '監査官', '감사관', 1),
+('官', '監査官', '감사관', 2),
+('監', '監査役', '감사역', 0),
+('査', '監査役', '감사역', 1),
+('役', '監査役', '감사역', 2),
+('監', '監牧', '감목', 0),
+('牧', '監牧', '감목', 1),
+('監', '監獄', '감옥', 0),
+('獄', '監獄', '감옥', 1),
+('監', '監理敎', '감리교', 0),
+('理', '監理敎', '감리교', 1),
+('敎', '監理敎', '감리교', 2),
+('監', '監督', '감독', 0),
+('督', '監督', '감독', 1),
+('監', '監督官', '감독관', 0),
+('督', '監督官', '감독관', 1),
+('官', '監督官', '감독관', 2),
+('監', '監督者', '감독자', 0),
+('督', '監督者', '감독자', 1),
+('者', '監督者', '감독자', 2),
+('監', '監禁', '감금', 0),
+('禁', '監禁', '감금', 1),
+('監', '監置', '감치', 0),
+('置', '監置', '감치', 1),
+('監', '監視', '감시', 0),
+('視', '監視', '감시', 1),
+('盤', '盤城', '반성', 0),
+('城', '盤城', '반성', 1),
+('盤', '盤面', '반면', 0),
+('面', '盤面', '반면', 1),
+('盥', '盥洗', '관세', 0),
+('洗', '盥洗', '관세', 1),
+('盥', '盥漱', '관수', 0),
+('漱', '盥漱', '관수', 1),
+('盧', '盧', '노', 0),
+('目', '目', '목', 0),
+('目', '目前', '목전', 0),
+('前', '目前', '목전', 1),
+('目', '目擊', '목격', 0),
+('擊', '目擊', '목격', 1),
+('目', '目擊者', '목격자', 0),
+('擊', '目擊者', '목격자', 1),
+('者', '目擊者', '목격자', 2),
+('目', '目標', '목표', 0),
+('標', '目標', '목표', 1),
+('目', '目標語', '목표어', 0),
+('標', '目標語', '목표어', 1),
+('語', '目標語', '목표어', 2),
+('目', '目次', '목차', 0),
+('次', '目次', '목차', 1),
+('目', '目痛', '목통', 0),
+('痛', '目痛', '목통', 1),
+('目', '目的', '목적', 0),
+('的', '目的', '목적', 1),
+('目', '目的地', '목적지', 0),
+('的', '目的地', '목적지', 1),
+('地', '目的地', '목적지', 2),
+('目', '目的格助詞', '목적격조사', 0),
+('的', '目的格助詞', '목적격조사', 1),
+('格', '目的格助詞', '목적격조사', 2),
+('助', '目的格助詞', '목적격조사', 3),
+('詞', '目的格助詞', '목적격조사', 4),
+('目', '目的語', '목적어', 0),
+('的', '目的語', '목적어', 1),
+('語', '目的語', '목적어', 2),
+('目', '目的論', '목적론', 0),
+('的', '目的論', '목적론', 1),
+('論', '目的論', '목적론', 2),
+('目', '目睹', '목도', 0),
+('睹', '目睹', '목도', 1),
+('目', '目錄', '목록', 0),
+('錄', '目錄', '목록', 1),
+('盲', '盲人', '맹인', 0),
+('人', '盲人', '맹인', 1),
+('盲', '盲目的', '맹목적', 0),
+('目', '盲目的', '맹목적', 1),
+('的', '盲目的', '맹목적', 2),
+('盲', '盲腸炎', '맹장염', 0),
+('腸', '盲腸炎', '맹장염', 1),
+('炎', '盲腸炎', '맹장염', 2),
+('盲', '盲點', '맹점', 0),
+('點', '盲點', '맹점', 1),
+('直', '直前', '직전', 0),
+('前', '直前', '직전', 1),
+('直', '直升機', '직승기', 0),
+('升', '直升機', '직승기', 1),
+('機', '直升機', '직승기', 2),
+('直', '直四角形', '직사각형', 0),
+('四', '直四角形', '직사각형', 1),
+('角', '直四角形', '직사각형', 2),
+('形', '直四角形', '직사각형', 3),
+('直', '直後', '직후', 0),
+('後', '直後', '직후', 1),
+('直', '直徑', '직경', 0),
+('徑', '直徑', '직경', 1),
+('直', '直感', '직감', 0),
+('感', '直感', '직감', 1),
+('直', '直接', '직접', 0),
+('接', '直接', '직접', 1),
+('直', '直接的', '직접적', 0),
+('接', '直接的', '직접적', 1),
+('的', '直接的', '직접적', 2),
+('直', '直接話法', '직접화법', 0),
+('接', '直接話法', '직접화법', 1),
+('話', '直接話法', '직접화법', 2),
+('法', '直接話法', '직접화법', 3),
+('直', '直流', '직류', 0),
+('流', '直流', '직류', 1),
+('直', '直球', '직구', 0),
+('球', '直球', '직구', 1),
+('直', '直線', '직선', 0),
+('線', '直線', '직선', 1),
+('直', '直線打', '직선타', 0),
+('線', '直線打', '직선타', 1),
+('打', '直線打', '직선타', 2),
+('直', '直腸', '직장', 0),
+('腸', '直腸', '직장', 1),
+('直', '直行', '직행', 0),
+('行', '直行', '직행', 1),
+('直', '直觀', '직관', 0),
+('觀', '直觀', '직관', 1),
+('直', '直角', '직각', 0),
+('角', '直角', '직각', 1),
+('直', '直言', '직언', 0),
+('言', '直言', '직언', 1),
+('直', '直說法', '직설법', 0),
+('說', '直說法', '직설법', 1),
+('法', '直說法', '직설법', 2),
+('直', '直轄', '직할', 0),
+('轄', '直轄', '직할', 1),
+('直', '直轄市', '직할시', 0),
+('轄', '直轄市', '직할시', 1),
+('市', '直轄市', '직할시', 2),
+('直', '直選', '직선', 0),
+('選', '直選', '직선', 1),
+('直', '直面', '직면', 0),
+('面', '直面', '직면', 1),
+('相', '相', '상', 0),
+('相', '相互', '상호', 0),
+('互', '相互', '상호', 1),
+('相', '相互作用', '상호작용', 0),
+('互', '相互作用', '상호작용', 1),
+('作', '相互作用', '상호작용', 2),
+('用', '相互作用', '상호작용', 3),
+('相', '相互確實破壞', '상호확실파괴', 0),
+('互', '相互確實破壞', '상호확실파괴', 1),
+('確', '相互確實破壞', '상호확실파괴', 2),
+('實', '相互確實破壞', '상호확실파괴', 3),
+('破', '相互確實破壞', '상호확실파괴', 4),
+('壞', '相互確實破壞', '상호확실파괴', 5),
+('相', '相互確證破壞', '상호확증파괴', 0),
+('互', '相互確證破壞', '상호확증파괴', 1),
+('確', '相互確證破壞', '상호확증파괴', 2),
+('證', '相互確證破壞', '상호확증파괴', 3),
+('破', '相互確證破壞', '상호확증파괴', 4),
+('壞', '相互確證破壞', '상호확증파괴', 5),
+('相', '相似', '상사', 0),
+('似', '相似', '상사', 1),
+('相', '相反', '상반', 0),
+('反', '相反', '상반', 1),
+('相', '相姦', '상간', 0),
+('姦', '相姦', '상간', 1),
+('相', '相對', '상대', 0),
+('對', '相對', '상대', 1),
+('相', '相對主義', '상대주의', 0),
+('對', '相對主義', '상대주의', 1),
+('主', '相對主義', '상대주의', 2),
+('義', '相對主義', '상대주의', 3),
+('相', '相對便', '상대편', 0),
+('對', '相對便', '상대편', 1),
+('便', '相對便', '상대편', 2),
+('相', '相對性', '상대성', 0),
+('對', '相對性', '상대성', 1),
+('性', '相對性', '상대성', 2),
+('相', '相對方', '상대방', 0),
+('對', '相對方', '상대방', 1),
+('方', '相對方', '상대방', 2),
+('相', '相對的', '상대적', 0),
+('對', '相對的', '상대적', 1),
+('的', '相對的', '상대적', 2),
+('相', '相思病', '상사병', 0),
+('思', '相思病', '상사병', 1),
+('病', '相思病', '상사병', 2),
+('相', '相性', '상성', 0),
+('性', '相性', '상성', 1),
+('相', '相應', '상응', 0),
+('應', '相應', '상응', 1),
+('相', '相殺', '상쇄', 0),
+('殺', '相殺', '상쇄', 1),
+('相', '相當', '상당', 0),
+('當', '相當', '상당', 1),
+('相', '相當數', '상당수', 0),
+('當', '相當數', '상당수', 1),
+('數', '相當數', '상당수', 2),
+('相', '相續', '상속', 0),
+('續', '相續', '상속', 1),
+('相', '相續人', '상속인', 0),
+('續', '相續人', '상속인', 1),
+('人', '相續人', '상속인', 2),
+('相', '相見禮', '상견례', 0),
+('見', '相見禮', '상견례', 1),
+('禮', '相見禮', '상견례', 2),
+('相', '相談', '상담', 0),
+('談', '相談', '상담', 1),
+('相', '相議', '상의', 0),
+('議', '相議', '상의', 1),
+('相', '相關', '상관', 0),
+('關', '相關', '상관', 1),
+('相', '相關--', '상관없다', 0),
+('關', '相關--', '상관없다', 1),
+('-', '相關--', '상관없다', 2),
+('-', '相關--', '상관없다', 3),
+('相', '相關--', '상관없이', 0),
+('關', '相關--', '상관없이', 1),
+('-', '相關--', '상관없이', 2),
+('-', '相關--', '상관없이', 3),
+('省', '省墓', '성묘', 0),
+('墓', '省墓', '성묘', 1),
+('省', '省略', '생략', 0),
+('略', '省略', '생략', 1),
+('眉', '眉宇', '미우', 0),
+('宇', '眉宇', '미우', 1),
+('看', '看做', '간주', 0),
+('做', '看做', '간주', 1),
+('看', '看板', '간판', 0),
+('板', '看板', '간판', 1),
+('看', '看病', '간병', 0),
+('病', '看病', '간병', 1),
+('看', '看病人', '간병인', 0),
+('病', '看病人', '간병인', 1),
+('人', '看病人', '간병인', 2),
+('看', '看破', '간파', 0),
+('破', '看破', '간파', 1),
+('看', '看護', '간호', 0),
+('護', '看護', '간호', 1),
+('看', '看護員', '간호원', 0),
+('護', '看護員', '간호원', 1),
+('員', '看護員', '간호원', 2),
+('看', '看護師', '간호사', 0),
+('護', '看護師', '간호사', 1),
+('師', '看護師', '간호사', 2),
+('看', '看過', '간과', 0),
+('過', '看過', '간과', 1),
+('眞', '眞-', '진짜', 0),
+('-', '眞-', '진짜', 1),
+('眞', '眞像', '진상', 0),
+('像', '眞像', '진상', 1),
+('眞', '眞如', '진여', 0),
+('如', '眞如', '진여', 1),
+('眞', '眞宗', '진종', 0),
+('宗', '眞宗', '진종', 1),
+('眞', '眞實', '진실', 0),
+('實', '眞實', '진실', 1),
+('眞', '眞實性', '진실성', 0),
+('實', '眞實性', '진실성', 1),
+('性', '眞實性', '진실성', 2),
+('眞', '眞實게임', '진실게임', 0),
+('實', '眞實게임', '진실게임', 1),
+('게', '眞實게임', '진실게임', 2),
+('임', '眞實게임', '진실게임', 3),
+('眞', '眞心', '진심', 0),
+('心', '眞心', '진심', 1),
+('眞', '眞情', '진정', 0),
+('情', '眞情', '진정', 1),
+('眞', '眞摯', '진지', 0),
+('摯', '眞摯', '진지', 1),
+('眞', '眞書', '진서', 0),
+('書', '眞書', '진서', 1),
+('眞', '眞正', '진정', 0),
+('正', '眞正', '진정', 1),
+('眞', '眞率', '진솔', 0),
+('率', '眞率', '진솔', 1),
+('眞', '眞珠', '진주', 0),
+('珠', '眞珠', '진주', 1),
+('眞', '眞理', '진리', 0),
+('理', '眞理', '진리', 1),
+('眞', '眞相', '진상', 0),
+('相', '眞相', '진상', 1),
+('眞', '眞空', '진공', 0),
+('空', '眞空', '진공', 1),
+('眞', '眞空淸掃器', '진공청소기', 0),
+('空', '眞空淸掃器', '진공청소기', 1),
+('淸', '眞空淸掃器', '진공청소기', 2),
+('掃', '眞空淸掃器', '진공청소기', 3),
+('器', '眞空淸掃器', '진공청소기', 4),
+('眞', '眞空管', '진공관', 0),
+('空', '眞空管', '진공관', 1),
+('管', '眞空管', '진공관', 2),
+('眞', '眞臘', '진랍', 0),
+('臘', '眞臘', '진랍', 1),
+('眞', '眞菌', '진균', 0),
+('菌', '眞菌', '진균', 1),
+('眞', '眞言', '진언', 0),
+('言', '眞言', '진언', 1),
+('眞', '眞髓', '진수', 0),
+('髓', '眞髓', '진수', 1),
+('真', '真如', '진여', 0),
+('如', '真如', '진여', 1),
+('真', '真實', '진실', 0),
+('實', '真實', '진실', 1),
+('真', '真書', '진서', 0),
+('書', '真書', '진서', 1),
+('真', '真理', '진리', 0),
+('理', '真理', '진리', 1),
+('真', '真空', '진공', 0),
+('空', '真空', '진공', 1),
+('眩', '眩惑', '현혹', 0),
+('惑', '眩惑', '현혹', 1),
+('眩', '眩耀', '현요', 0),
+('耀', '眩耀', '현요', 1),
+('眷', '眷顧', '권고', 0),
+('顧', '眷顧', '권고', 1),
+('眷', '眷黨', '권당', 0),
+('黨', '眷黨', '권당', 1),
+('眺', '眺望', '조망', 0),
+('望', '眺望', '조망', 1),
+('眼', '眼帶', '안대', 0),
+('帶', '眼帶', '안대', 1),
+('眼', '眼濕', '안습', 0),
+('濕', '眼濕', '안습', 1),
+('眼', '眼球', '안구', 0),
+('球', '眼球', '안구', 1),
+('眼', '眼目', '안목', 0),
+('目', '眼目', '안목', 1),
+('眼', '眼科', '안과', 0),
+('科', '眼科', '안과', 1),
+('眼', '眼窩', '안와', 0),
+('窩', '眼窩', '안와', 1),
+('眼', '眼識', '안식', 0),
+('識', '眼識', '안식', 1),
+('眼', '眼鏡', '안경', 0),
+('鏡', '眼鏡', '안경', 1),
+('眼', '眼鏡士', '안경사', 0),
+('鏡', '眼鏡士', '안경사', 1),
+('士', '眼鏡士', '안경사', 2),
+('着', '着低', '착저', 0),
+('低', '着低', '착저', 1),
+('着', '着地', '착지', 0),
+('地', '着地', '착지', 1),
+('着', '着工', '착공', 0),
+('工', '着工', '착공', 1),
+('着', '着席', '착석', 0),
+('席', '着席', '착석', 1),
+('着', '着陸', '착륙', 0),
+('陸', '着陸', '착륙', 1),
+('睡', '睡眠', '수면', 0),
+('眠', '睡眠', '수면', 1),
+('睡', '睡眠不足', '수면부족', 0),
+('眠', '睡眠不足', '수면부족', 1),
+('不', '睡眠不足', '수면부족', 2),
+('足', '睡眠不足', '수면부족', 3),
+('睡', '睡眠劑', '수면제', 0),
+('眠', '睡眠劑', '수면제', 1),
+('劑', '睡眠劑', '수면제', 2),
+('睡', '睡蓮', '수련', 0),
+('蓮', '睡蓮', '수련', 1),
+('督', '督促', '독촉', 0),
+('促', '督促', '독촉', 1),
+('睾', '睾丸', '고환', 0),
+('丸', '睾丸', '고환', 1),
+('瞑', '瞑想', '명상', 0),
+('想', '瞑想', '명상', 1),
+('瞬', '瞬息間', '순식간', 0),
+('息', '瞬息間', '순식간', 1),
+('間', '瞬息間', '순식간', 2),
+('瞬', '瞬間', '순간', 0),
+('間', '瞬間', '순간', 1),
+('瞬', '瞬間的', '순간적', 0),
+('間', '瞬間的', '순간적', 1),
+('的', '瞬間的', '순간적', 2),
+('瞳', '瞳人', '동인', 0),
+('人', '瞳人', '동인', 1),
+('瞳', '瞳子', '동자', 0),
+('子', '瞳子', '동자', 1),
+('瞳', '瞳孔', '동공', 0),
+('孔', '瞳孔', '동공', 1),
+('矛', '矛盾', '모순', 0),
+('盾', '矛盾', '모순', 1),
+('知', '知事', '지사', 0),
+('事', '知事', '지사', 1),
+('知', '知人', '지인', 0),
+('人', '知人', '지인', 1),
+('知', '知性', '지성', 0),
+('性', '知性', '지성', 1),
+('知', '知慧', '지혜', 0),
+('慧', '知慧', '지혜', 1),
+('知', '知的', '지적', 0),
+('的', '知的', '지적', 1),
+('知', '知能', '지능', 0),
+('能', '知能', '지능', 1),
+('知', '知覺', '지각', 0),
+('覺', '知覺', '지각', 1),
+('知', '知識', '지식', 0),
+('識', '知識', '지식', 1),
+('知', '知識人', '지식인', 0),
+('識', '知識人', '지식인', 1),
+('人', '知識人', '지식인', 2),
+('短', '短刀', '단도', 0),
+('刀', '短刀', '단도', 1),
+('短', '短劍', '단검', 0),
+('劍', '短劍', '단검', 1),
+('短', '短所', '단소', 0),
+('所', '短所', '단소', 1),
+('短', '短期', '단기', 0),
+('期', '短期', '단기', 1),
+('短', '短波', '단파', 0),
+('波', '短波', '단파', 1),
+('短', '短篇', '단편', 0),
+('篇', '短篇', '단편', 1),
+('短', '短篇 小說', '단편 소설', 0),
+('篇', '短篇 小說', '단편 소설', 1),
+('小', '短篇 小說', '단편 소설', 3),
+('說', '短篇 小說', '단편 소설', 4),
+('短', '短篇 小說家', '단편 소설가', 0),
+('篇', '短篇 小說家', '단편 소설가', 1),
+('小', '短篇 小說家', '단편 소설가', 3),
+('說', '短篇 小說家', '단편 소설가', 4),
+('家', '短篇 小說家', '단편 소설가', 5),
+('短', '短篇映畫', '단편영화', 0),
+('篇', '短篇映畫', '단편영화', 1),
+('映', '短篇映畫', '단편영화', 2),
+('畫', '短篇映畫', '단편영화', 3),
+('短', '短篇集', '단편집', 0),
+('篇', '短篇集', '단편집', 1),
+('集', '短篇集', '단편집', 2),
+('短', '短簫', '단소', 0),
+('簫', '短簫', '단소', 1),
+('短', '短絡', '단락', 0),
+('絡', '短絡', '단락', 1),
+('短', '短縮', '단축', 0),
+('縮', '短縮', '단축', 1),
+('短', '短調', '단조', 0),
+('調', '短調', '단조', 1),
+('短', '短針', '단침', 0),
+('針', '短針', '단침', 1),
+('短', '短銃', '단총', 0),
+('銃', '短銃', '단총', 1),
+('短', '短靴', '단화', 0),
+('靴', '短靴', '단화', 1),
+('短', '短音', '단음', 0),
+('音', '短音', '단음', 1),
+('短', '短髮', '단발', 0),
+('髮', '短髮', '단발', 1),
+('短', '短點', '단점', 0),
+('點', '短點', '단점', 1),
+('矮', '矮性', '왜성', 0),
+('性', '矮性', '왜성', 1),
+('矮', '矮星', '왜성', 0),
+('星', '矮星', '왜성', 1),
+('矮', '矮行星', '왜행성', 0),
+('行', '矮行星', '왜행성', 1),
+('星', '矮行星', '왜행성', 2),
+('矮', '矮몰개', '왜몰개', 0),
+('몰', '矮몰개', '왜몰개', 1),
+('개', '矮몰개', '왜몰개', 2),
+('矯', '矯導官', '교도관', 0),
+('導', '矯導官', '교도관', 1),
+('官', '矯導官', '교도관', 2),
+('矯', '矯導所', '교도소', 0),
+('導', '矯導所', '교도소', 1),
+('所', '矯導所', '교도소', 2),
+('矯', '矯正', '교정', 0),
+('正', '矯正', '교정', 1),
+('石', '石器 時代', '석기 시대', 0),
+('器', '石器 時代', '석기 시대', 1),
+('時', '石器 時代', '석기 시대', 3),
+('代', '石器 時代', '석기 시대', 4),
+('石', '石塔', '석탑', 0),
+('塔', '石塔', '석탑', 1),
+('石', '石墨', '석묵', 0),
+('墨', '石墨', '석묵', 1),
+('石', '石工', '석공', 0),
+('工', '石工', '석공', 1),
+('石', '石弓', '석궁', 0),
+('弓', '石弓', '석궁', 1),
+('石', '石材', '석재', 0),
+('材', '石材', '석재', 1),
+('石', '石棺', '석관', 0),
+('棺', '石棺', '석관', 1),
+('石', '石榴', '석류', 0),
+('榴', '石榴', '석류', 1),
+('石', '石榴石', '석류석', 0),
+('榴', '石榴石', '석류석', 1),
+('石', '石榴石', '석류석', 2),
+('石', '石油', '석유', 0),
+('油', '石油', '석유', 1),
+('石', '石灰', '석회', 0),
+('灰', '石灰', '석회', 1),
+('石', '石灰岩', '석회암', 0),
+('灰', '石灰岩', '석회암', 1),
+('岩', '石灰岩', '석회암', 2),
+('石', '石灰石', '석회석', 0),
+('灰', '石灰石', '석회석', 1),
+('石', '石灰石', '석회석', 2),
+('石', '石炭', '석탄', 0),
+('炭', '石炭', '석탄', 1),
+('石', '石炭酸', '석탄산', 0),
+('炭', '石炭酸', '석탄산', 1),
+('酸', '石炭酸', '석탄산', 2),
+('石', '石筍', '석순', 0),
+('筍', '石筍', '석순', 1),
+('石', '石綿', '석면', 0),
+('綿', '石綿', '석면', 1),
+('石', '石耳', '석이', 0),
+('耳', '石耳', '석이', 1),
+('石', '石膏', '석고', 0),
+('膏', '石膏', '석고', 1),
+('石', '石膏板', '석고판', 0),
+('膏', '石膏板', '석고판', 1),
+('板', '石膏板', '석고판', 2),
+('石', '石英', '석영', 0),
+('英', '石英', '석영', 1),
+('石', '石菖蒲', '석창포', 0),
+('菖', '石菖蒲', '석창포', 1),
+('蒲', '石菖蒲', '석창포', 2),
+('石', '石蠟', '석랍', 0),
+('蠟', '石蠟', '석랍', 1),
+('石', '石距', '석거', 0),
+('距', '石距', '석거', 1),
+('石', '石鹼', '석감', 0),
+('鹼', '石鹼', '석감', 1),
+('砂', '砂場', '사장', 0),
+('場', '砂場', '사장', 1),
+('砂', '砂岩', '사암', 0),
+('岩', '砂岩', '사암', 1),
+('砂', '砂布', '사포', 0),
+('布', '砂布', '사포', 1),
+('砂', '砂時計', '사시계', 0),
+('時', '砂時計', '사시계', 1),
+('計', '砂時計', '사시계', 2),
+('砂', '砂果', '사과', 0),
+('果', '砂果', '사과', 1),
+('砂', '砂洲', '사주', 0),
+('洲', '砂洲', '사주', 1),
+('砂', '砂漏', '사루', 0),
+('漏', '砂漏', '사루', 1),
+('砂', '砂漠', '사막', 0),
+('漠', '砂漠', '사막', 1),
+('砂', '砂濱', '사빈', 0),
+('濱', '砂濱', '사빈', 1),
+('砂', '砂疥', '사개', 0),
+('疥', '砂疥', '사개', 1),
+('砂', '砂糖', '사탕', 0),
+('糖', '砂糖', '사탕', 1),
+('砂', '砂鐵', '사철', 0),
+('鐵', '砂鐵', '사철', 1),
+('砒', '砒素', '비소', 0),
+('素', '砒素', '비소', 1),
+('研', '研究', '연구', 0),
+('究', '研究', '연구', 1),
+('研', '研究生', '연구생', 0),
+('究', '研究生', '연구생', 1),
+('生', '研究生', '연구생', 2),
+('砲', '砲', '포', 0),
+('砲', '砲丸', '포환', 0),
+('丸', '砲丸', '포환', 1),
+('砲', '砲兵', '포병', 0),
+('兵', '砲兵', '포병', 1),
+('砲', '砲塔', '포탑', 0),
+('塔', '砲塔', '포탑', 1),
+('砲', '砲彈', '포탄', 0),
+('彈', '砲彈', '포탄', 1),
+('砲', '砲手', '포수', 0),
+('手', '砲手', '포수', 1),
+('砲', '砲擊', '포격', 0),
+('擊', '砲擊', '포격', 1),
+('砲', '砲架', '포가', 0),
+('架', '砲架', '포가', 1),
+('砲', '砲火', '포화', 0),
+('火', '砲火', '포화', 1),
+('砲', '砲煙', '포연', 0),
+('煙', '砲煙', '포연', 1),
+('砲', '砲臺', '포대', 0),
+('臺', '砲臺', '포대', 1),
+('砲', '砲艦', '포함', 0),
+('艦', '砲艦', '포함', 1),
+('砲', '砲術', '포술', 0),
+('術', '砲術', '포술', 1),
+('砲', '砲身', '포신', 0),
+('身', '砲身', '포신', 1),
+('砲', '砲車', '포차', 0),
+('車', '砲車', '포차', 1),
+('砲', '砲隊', '포대', 0),
+('隊', '砲隊', '포대', 1),
+('破', '破傷風', '파상풍', 0),
+('傷', '破傷風', '파상풍', 1),
+('風', '破傷風', '파상풍', 2),
+('破', '破城槌', '파성퇴', 0),
+('城', '破城槌', '파성퇴', 1),
+('槌', '破城槌', '파성퇴', 2),
+('破', '破壞', '파괴', 0),
+('壞', '破壞', '파괴', 1),
+('破', '破壞者', '파괴자', 0),
+('壞', '破壞者', '파괴자', 1),
+('者', '破壞者', '파괴자', 2),
+('破', '破廉恥', '파렴치', 0),
+('廉', '破廉恥', '파렴치', 1),
+('恥', '破廉恥', '파렴치', 2),
+('破', '破斷', '파단', 0),
+('斷', '破斷', '파단', 1),
+('破', '破本', '파본', 0),
+('本', '破本', '파본', 1),
+('破', '破棄', '파기', 0),
+('棄', '破棄', '파기', 1),
+('破', '破滅', '파멸', 0),
+('滅', '破滅', '파멸', 1),
+('破', '破片', '파편', 0),
+('片', '破片', '파편', 1),
+('破', '破産', '파산', 0),
+('産', '破産', '파산', 1),
+('破', '破綻', '파탄', 0),
+('綻', '破綻', '파탄', 1),
+('破', '破裂', '파열', 0),
+('裂', '破裂', '파열', 1),
+('破', '破談', '파담', 0),
+('談', '破談', '파담', 1),
+('破', '破釜沈舟', '파부침주', 0),
+('釜', '破釜沈舟', '파부침주', 1),
+('沈', '破釜沈舟', '파부침주', 2),
+('舟', '破釜沈舟', '파부침주', 3),
+('破', '破門', '파문', 0),
+('門', '破門', '파문', 1),
+('硅', '硅化', '규화', 0),
+('化', '硅化', '규화', 1),
+('硅', '硅素', '규소', 0),
+('素', '硅素', '규소', 1),
+('硅', '硅素 樹脂', '규소 수지', 0),
+('素', '硅素 樹脂', '규소 수지', 1),
+('樹', '硅素 樹脂', '규소 수지', 3),
+('脂', '硅素 樹脂', '규소 수지', 4),
+('硅', '硅素樹脂', '규소수지', 0),
+('素', '硅素樹脂', '규소수지', 1),
+('樹', '硅素樹脂', '규소수지', 2),
+('脂', '硅素樹脂', '규소수지', 3),
+('硏', '硏修', '연수', 0),
+('修', '硏修', '연수', 1),
+('硏', '硏修生', '연수생', 0),
+('修', '硏修生', '연수생', 1),
+('生', '硏修生', '연수생', 2),
+('硏', '硏磨', '연마', 0),
+('磨', '硏磨', '연마', 1),
+('硏', '硏究', '연구', 0),
+('究', '硏究', '연구', 1),
+('硏', '硏究員', '연구원', 0),
+('究', '硏究員', '연구원', 1),
+('員', '硏究員', '연구원', 2),
+('硏', '硏究室', '연구실', 0),
+('究', '硏究室', '연구실', 1),
+('室', '硏究室', '연구실', 2),
+('硏', '硏究所', '연구소', 0),
+('究', '硏究所', '연구소', 1),
+('所', '硏究所', '연구소', 2),
+('硏', '硏究生', '연구생', 0),
+('究', '硏究生', '연구생', 1),
+('生', '硏究生', '연구생', 2),
+('硏', '硏究者', '연구자', 0),
+('究', '硏究者', '연구자', 1),
+('者', '硏究者', '연구자', 2),
+('硏', '硏究院', '연구원', 0),
+('究', '硏究院', '연구원', 1),
+('院', '硏究院', '연구원', 2),
+('硏', '硏究院生', '연구원생', 0),
+('究', '硏究院生', '연구원생', 1),
+('院', '硏究院生', '연구원생', 2),
+('生', '硏究院生', '연구원생', 3),
+('硝', '硝石', '초석', 0),
+('石', '硝石', '초석', 1),
+('硫', '硫化水素', '유화수소', 0),
+('化', '硫化水素', '유화수소', 1),
+('水', '硫化水素', '유화수소', 2),
+('素', '硫化水素', '유화수소', 3),
+('硫', '硫酸', '유산', 0),
+('酸', '硫酸', '유산', 1),
+('硫', '硫黃', '유황', 0),
+('黃', '硫黃', '유황', 1),
+('硬', '硬化', '경화', 0),
+('化', '硬化', '경화', 1),
+('硬', '硬口盖', '경구개', 0),
+('口', '硬口盖', '경구개', 1),
+('盖', '硬口盖', '경구개', 2),
+('硬', '硬口蓋', '경구개', 0),
+('口', '硬口蓋', '경구개', 1),
+('蓋', '硬口蓋', '경구개', 2),
+('硬', '硬口蓋音', '경구개음', 0),
+('口', '硬口蓋音', '경구개음', 1),
+('蓋', '硬口蓋音', '경구개음', 2),
+('音', '硬口蓋音', '경구개음', 3),
+('硬', '硬度', '경도', 0),
+('度', '硬度', '경도', 1),
+('硬', '硬性', '경성', 0),
+('性', '硬性', '경성', 1),
+('硬', '硬水', '경수', 0),
+('水', '硬水', '경수', 1),
+('硬', '硬玉', '경옥', 0),
+('玉', '硬玉', '경옥', 1),
+('硬', '硬直', '경직', 0),
+('直', '硬直', '경직', 1),
+('硬', '硬直性', '경직성', 0),
+('直', '硬直性', '경직성', 1),
+('性', '硬直性', '경직성', 2),
+('硬', '硬直結腸炎', '경직결장염', 0),
+('直', '硬直結腸炎', '경직결장염', 1),
+('結', '硬直結腸炎', '경직결장염', 2),
+('腸', '硬直結腸炎', '경직결장염', 3),
+('炎', '硬直結腸炎', '경직결장염', 4),
+('硬', '硬石膏', '경석고', 0),
+('石', '硬石膏', '경석고', 1),
+('膏', '硬石膏', '경석고', 2),
+('硬', '硬貨', '경화', 0),
+('貨', '硬貨', '경화', 1),
+('硬', '硬質', '경질', 0),
+('質', '硬質', '경질', 1),
+('硯', '硯水', '연수', 0),
+('水', '硯水', '연수', 1),
+('硼', '硼素', '붕소', 0),
+('素', '硼素', '붕소', 1),
+('碁', '碁盤', '기반', 0),
+('盤', '碁盤', '기반', 1),
+('碁', '碁石', '기석', 0),
+('石', '碁石', '기석', 1),
+('碇', '碇', '정', 0),
+('碑', '碑', '비', 0),
+('碑', '碑文', '비문', 0),
+('文', '碑文', '비문', 1),
+('碑', '碑銘', '비명', 0),
+('銘', '碑銘', '비명', 1),
+('碧', '碧', '벽', 0),
+('碧', '碧玉', '벽옥', 0),
+('玉', '碧玉', '벽옥', 1),
+('碧', '碧眼', '벽안', 0),
+('眼', '碧眼', '벽안', 1),
+('碧', '碧空', '벽공', 0),
+('空', '碧空', '벽공', 1),
+('碩', '碩士', '석사', 0),
+('士', '碩士', '석사', 1),
+('確', '確保', '확보', 0),
+('保', '確保', '확보', 1),
+('確', '確信', '확신', 0),
+('信', '確信', '확신', 1),
+('確', '確固', '확고', 0),
+('固', '確固', '확고', 1),
+('確', '確定', '확정', 0),
+('定', '確定', '확정', 1),
+('確', '確實', '확실', 0),
+('實', '確實', '확실', 1),
+('確', '確實性', '확실성', 0),
+('實', '確實性', '확실성', 1),
+('性', '確實性', '확실성', 2),
+('確', '確率', '확률', 0),
+('率', '確率', '확률', 1),
+('確', '確立', '확립', 0),
+('立', '確立', '확립', 1),
+('確', '確約', '확약', 0),
+('約', '確約', '확약', 1),
+('確', '確診者', '확진자', 0),
+('診', '確診者', '확진자', 1),
+('者', '確診者', '확진자', 2),
+('確', '確認', '확인', 0),
+('認', '確認', '확인', 1),
+('確', '確證', '확증', 0),
+('證', '確證', '확증', 1),
+('確', '確證偏向', '확증편향', 0),
+('證', '確證偏向', '확증편향', 1),
+('偏', '確證偏向', '확증편향', 2),
+('向', '確證偏向', '확증편향', 3),
+('磁', '磁力', '자력', 0),
+('力', '磁力', '자력', 1),
+('磁', '磁器', '자기', 0),
+('器', '磁器', '자기', 1),
+('磁', '磁場', '자장', 0),
+('場', '磁場', '자장', 1),
+('磁', '磁束', '자속', 0),
+('束', '磁束', '자속', 1),
+('磁', '磁極', '자극', 0),
+('極', '磁極', '자극', 1),
+('磁', '磁氣', '자기', 0),
+('氣', '磁氣', '자기', 1),
+('磁', '磁界', '자계', 0),
+('界', '磁界', '자계', 1),
+('磁', '磁石', '자석', 0),
+('石', '磁石', '자석', 1),
+('磁', '磁針', '자침', 0),
+('針', '磁針', '자침', 1),
+('磁', '磁鐵鑛', '자철광', 0),
+('鐵', '磁鐵鑛', '자철광', 1),
+('鑛', '磁鐵鑛', '자철광', 2),
+('磠', '磠砂', '노사', 0),
+('砂', '磠砂', '노사', 1),
+('礎', '礎石', '초석', 0),
+('石', '礎石', '초석', 1),
+('示', '示唆', '시사', 0),
+('唆', '示唆', '시사', 1),
+('示', '示威', '시위', 0),
+('威', '示威', '시위', 1),
+('示', '示威者', '시위자', 0),
+('威', '示威者', '시위자', 1),
+('者', '示威者', '시위자', 2),
+('示', '示威隊', '시위대', 0),
+('威', '示威隊', '시위대', 1),
+('隊', '示威隊', '시위대', 2),
+('示', '示範', '시범', 0),
+('範', '示範', '시범', 1),
+('社', '社', '사', 0),
+('社', '社交', '사교', 0),
+('交', '社交', '사교', 1),
+('社', '社倉', '사창', 0),
+('倉', '社倉', '사창', 1),
+('社', '社內', '사내', 0),
+('內', '社內', '사내', 1),
+('社', '社內政治', '사내정치', 0),
+('內', '社內政治', '사내정치', 1),
+('政', '社內政治', '사내정치', 2),
+('治', '社內政治', '사내정치', 3),
+('社', '社友', '사우', 0),
+('友', '社友', '사우', 1),
+('社', '社員', '사원', 0),
+('員', '社員', '사원', 1),
+('社', '社團', '사단', 0),
+('團', '社團', '사단', 1),
+('社', '社會', '사회', 0),
+('會', '社會', '사회', 1),
+('社', '社會 連結網', '사회 연결망', 0),
+('會', '社會 連結網', '사회 연결망', 1),
+('連', '社會 連結網', '사회 연결망', 3),
+('結', '社會 連結網', '사회 연결망', 4),
+('網', '社會 連結網', '사회 연결망', 5),
+('社', '社會主義', '사회주의', 0),
+('會', '社會主義', '사회주의', 1),
+('主', '社會主義', '사회주의', 2),
+('義', '社會主義', '사회주의', 3),
+('社', '社會保障', '사회보장', 0),
+('會', '社會保障', '사회보장', 1),
+('保', '社會保障', '사회보장', 2),
+('障', '社會保障', '사회보장', 3),
+('社', '社會學', '사회학', 0),
+('會', '社會學', '사회학', 1),
+('學', '社會學', '사회학', 2),
+('社', '社會生活', '사회생활', 0),
+('會', '社會生活', '사회생활', 1),
+('生', '社會生活', '사회생활', 2),
+('活', '社會生活', '사회생활', 3),
+('社', '社會的', '사회적', 0),
+('會', '社會的', '사회적', 1),
+('的', '社會的', '사회적', 2),
+('社', '社稷', '사직', 0),
+('稷', '社稷', '사직', 1),
+('社', '社說', '사설', 0),
+('說', '社說', '사설', 1),
+('社', '社長', '사장', 0),
+('長', '社長', '사장', 1),
+('祈', '祈禱', '기도', 0),
+('禱', '祈禱', '기도', 1),
+('祈', '祈禱書', '기도서', 0),
+('禱', '祈禱書', '기도서', 1),
+('書', '祈禱書', '기도서', 2),
+('祈', '祈願', '기원', 0),
+('願', '祈願', '기원', 1),
+('祕', '祕密', '비밀', 0),
+('密', '祕密', '비밀', 1),
+('祖', '祖上', '조상', 0),
+('上', '祖上', '조상', 1),
+('祖', '祖先', '조선', 0),
+('先', '祖先', '조선', 1),
+('祖', '祖國', '조국', 0),
+('國', '祖國', '조국', 1),
+('祖', '祖國解放戰爭', '조국해방전쟁', 0),
+('國', '祖國解放戰爭', '조국해방전쟁', 1),
+('解', '祖國解放戰爭', '조국해방전쟁', 2),
+('放', '祖國解放戰爭', '조국해방전쟁', 3),
+('戰', '祖國解放戰爭', '조국해방전쟁', 4),
+('爭', '祖國解放戰爭', '조국해방전쟁', 5),
+('祖', '祖宗', '조종', 0),
+('宗', '祖宗', '조종', 1),
+('祖', '祖師', '조사', 0),
+('師', '祖師', '조사', 1),
+('祖', '祖母', '조모', 0),
+('母', '祖母', '조모', 1),
+('祖', '祖父', '조부', 0),
+('父', '祖父', '조부', 1),
+('祖', '祖父母', '조부모', 0),
+('父', '祖父母', '조부모', 1),
+('母', '祖父母', '조부모', 2),
+('祖', '祖語', '조어', 0),
+('語', '祖語', '조어', 1),
+('祗', '祗候', '지후', 0),
+('候', '祗候', '지후', 1),
+('祛', '祛痰劑', '거담제', 0),
+('痰', '祛痰劑', '거담제', 1),
+('劑', '祛痰劑', '거담제', 2),
+('祝', '祝典', '축전', 0),
+('典', '祝典', '축전', 1),
+('祝', '祝宴', '축연', 0),
+('宴', '祝宴', '축연', 1),
+('祝', '祝日', '축일', 0),
+('日', '祝日', '축일', 1),
+('祝', '祝杯', '축배', 0),
+('杯', '祝杯', '축배', 1),
+('祝', '祝祭', '축제', 0),
+('祭', '祝祭', '축제', 1),
+('祝', '祝祭日', '축제일', 0),
+('祭', '祝祭日', '축제일', 1),
+('日', '祝祭日', '축제일', 2),
+('祝', '祝福', '축복', 0),
+('福', '祝福', '축복', 1),
+('祝', '祝賀', '축하', 0),
+('賀', '祝賀', '축하', 1),
+('神', '神', '신', 0),
+('神', '神主', '신주', 0),
+('主', '神主', '신주', 1),
+('神', '神仙', '신선', 0),
+('仙', '神仙', '신선', 1),
+('神', '神仙爐', '신선로', 0),
+('仙', '神仙爐', '신선로', 1),
+('爐', '神仙爐', '신선로', 2),
+('神', '神兵', '신병', 0),
+('兵', '神兵', '신병', 1),
+('神', '神占', '신점', 0),
+('占', '神占', '신점', 1),
+('神', '神壇', '신단', 0),
+('壇', '神壇', '신단', 1),
+('神', '神奇', '신기', 0),
+('奇', '神奇', '신기', 1),
+('神', '神子息', '신자식', 0),
+('子', '神子息', '신자식', 1),
+('息', '神子息', '신자식', 2),
+('神', '神學', '신학', 0),
+('學', '神學', '신학', 1),
+('神', '神官', '신관', 0),
+('官', '神官', '신관', 1),
+('神', '神山', '신산', 0),
+('山', '神山', '신산', 1),
+('神', '神性', '신성', 0),
+('性', '神性', '신성', 1),
+('神', '神政', '신정', 0),
+('政', '神政', '신정', 1),
+('神', '神智學', '신지학', 0),
+('智', '神智學', '신지학', 1),
+('學', '神智學', '신지학', 2),
+('神', '神格', '신격', 0),
+('格', '神格', '신격', 1),
+('神', '神格化', '신격화', 0),
+('格', '神格化', '신격화', 1),
+('化', '神格化', '신격화', 2),
+('神', '神機箭', '신기전', 0),
+('機', '神機箭', '신기전', 1),
+('箭', '神機箭', '신기전', 2),
+('神', '神權', '신권', 0),
+('權', '神權', '신권', 1),
+('神', '神權政治', '신권정치', 0),
+('權', '神權政治', '신권정치', 1),
+('政', '神權政治', '신권정치', 2),
+('治', '神權政治', '신권정치', 3),
+('神', '神殿', '신전', 0),
+('殿', '神殿', '신전', 1),
+('神', '神法', '신법', 0),
+('法', '神法', '신법', 1),
+('神', '神父', '신부', 0),
+('父', '神父', '신부', 1),
+('神', '神父母', '신부모', 0),
+('父', '神父母', '신부모', 1),
+('母', '神父母', '신부모', 2),
+('神', '神社', '신사', 0),
+('社', '神社', '신사', 1),
+('神', '神秘', '신비', 0),
+('秘', '神秘', '신비', 1),
+('神', '神童', '신동', 0),
+('童', '神童', '신동', 1),
+('神', '神經', '신경', 0),
+('經', '神經', '신경', 1),
+('神', '神經 細胞', '신경 세포', 0),
+('經', '神經 細胞', '신경 세포', 1),
+('細', '神經 細胞', '신경 세포', 3),
+('胞', '神經 細胞', '신경 세포', 4),
+('神', '神經傳導物質', '신경전달물질', 0),
+('經', '神經傳導物質', '신경전달물질', 1),
+('傳', '神經傳導物質', '신경전달물질', 2),
+('導', '神經傳導物質', '신경전달물질', 3),
+('物', '神經傳導物質', '신경전달물질', 4),
+('質', '神經傳導物質', '신경전달물질', 5),
+('神', '神經多樣性', '신경다양성', 0),
+('經', '神經多樣性', '신경다양성', 1),
+('多', '神經多樣性', '신경다양성', 2),
+('樣', '神經多樣性', '신경다양성', 3),
+('性', '神經多樣性', '신경다양성', 4),
+('神', '神經學', '신경학', 0),
+('經', '神經學', '신경학', 1),
+('學', '神經學', '신경학', 2),
+('神', '神經系', '신경계', 0),
+('經', '神經系', '신경계', 1),
+('系', '神經系', '신경계', 2),
+('神', '神經言語學', '신경언어학', 0),
+('經', '神經言語學', '신경언어학', 1),
+('言', '神經言語學', '신경언어학', 2),
+('語', '神經言語學', '신경언어학', 3),
+('學', '神經言語學', '신경언어학', 4),
+('神', '神聖', '신성', 0),
+('聖', '神聖', '신성', 1),
+('神', '神話', '신화', 0),
+('話', '神話', '신화', 1),
+('神', '神農', '신농', 0),
+('農', '神農', '신농', 1),
+('神', '神道', '신도', 0),
+('道', '神道', '신도', 1),
+('神', '神鈴', '신령', 0),
+('鈴', '神鈴', '신령', 1),
+('神', '神靈', '신령', 0),
+('靈', '神靈', '신령', 1),
+('神', '神饌', '신찬', 0),
+('饌', '神饌', '신찬', 1),
+('祠', '祠堂', '사당', 0),
+('堂', '祠堂', '사당', 1),
+('祥', '祥瑞', '상서', 0),
+('瑞', '祥瑞', '상서', 1),
+('票', '票', '표', 0),
+('祭', '祭壇', '제단', 0),
+('壇', '祭壇', '제단', 1),
+('祭', '祭日', '제일', 0),
+('日', '祭日', '제일', 1),
+('祭', '祭物', '제물', 0),
+('物', '祭物', '제물', 1),
+('祭', '祭祀', '제사', 0),
+('祀', '祭祀', '제사', 1),
+('祭', '祭祀-', '제삿날', 0),
+('祀', '祭祀-', '제삿날', 1),
+('-', '祭祀-', '제삿날', 2),
+('祭', '祭肉', '제육', 0),
+('肉', '祭肉', '제육', 1),
+('祿', '祿', '녹', 0),
+('禁', '禁', '금', 0),
+('禁', '禁令', '금령', 0),
+('令', '禁令', '금령', 1),
+('禁', '禁制', '금제', 0),
+('制', '禁制', '금제', 1),
+('禁', '禁忌', '금기', 0),
+('忌', '禁忌', '금기', 1),
+('禁', '禁忌視', '금기시', 0),
+('忌', '禁忌視', '금기시', 1),
+('視', '禁忌視', '금기시', 2),
+('禁', '禁慾', '금욕', 0),
+('慾', '禁慾', '금욕', 1),
+('禁', '禁止', '금지', 0),
+('止', '禁止', '금지', 1),
+('禁', '禁煙', '금연', 0),
+('煙', '禁煙', '금연', 1),
+('禁', '禁輸', '금수', 0),
+('輸', '禁輸', '금수', 1),
+('禁', '禁酒', '금주', 0),
+('酒', '禁酒', '금주', 1),
+('禁', '禁錮', '금고', 0),
+('錮', '禁錮', '금고', 1),
+('禁', '禁食', '금식', 0),
+('食', '禁食', '금식', 1),
+('禍', '禍', '화', 0),
+('福', '福', '복', 0),
+('福', '福不福', '복불복', 0),
+('不', '福不福', '복불복', 1),
+('福', '福不福', '복불복', 2),
+('福', '福利', '복리', 0),
+('利', '福利', '복리', 1),
+('福', '福券', '복권', 0),
+('券', '福券', '복권', 1),
+('福', '福力', '복력', 0),
+('力', '福力', '복력', 1),
+('福', '福建', '복건', 0),
+('建', '福建', '복건', 1),
+('福', '福祉', '복지', 0),
+('祉', '福祉', '복지', 1),
+('福', '福音', '복음', 0),
+('音', '福音', '복음', 1),
+('福', '福音書', '복음서', 0),
+('音', '福音書', '복음서', 1),
+('書', '福音書', '복음서', 2),
+('福', '福스럽다', '복스럽다', 0),
+('스', '福스럽다', '복스럽다', 1),
+('럽', '福스럽다', '복스럽다', 2),
+('다', '福스럽다', '복스럽다', 3),
+('禪', '禪宗', '선종', 0),
+('宗', '禪宗', '선종', 1),
+('禪', '禪師', '선사', 0),
+('師', '禪師', '선사', 1),
+('禪', '禪心', '선심', 0),
+('心', '禪心', '선심', 1),
+('禪', '禪敎', '선교', 0),
+('敎', '禪敎', '선교', 1),
+('禮', '禮', '예', 0),
+('禮', '禮儀', '례의', 0),
+('儀', '禮儀', '례의', 1),
+('禮', '禮儀', '예의', 0),
+('儀', '禮儀', '예의', 1),
+('禮', '禮式', '예식', 0),
+('式', '禮式', '예식', 1),
+('禮', '禮拜', '례배', 0),
+('拜', '禮拜', '례배', 1),
+('禮', '禮拜', '예배', 0),
+('拜', '禮拜', '예배', 1),
+('禮', '禮拜堂', '예배당', 0),
+('拜', '禮拜堂', '예배당', 1),
+('堂', '禮拜堂', '예배당', 2),
+('禮', '禮服', '예복', 0),
+('服', '禮服', '예복', 1),
+('禮', '禮法', '예법', 0),
+('法', '禮法', '예법', 1),
+('禮', '禮物', '예물', 0),
+('物', '禮物', '예물', 1),
+('禮', '禮砲', '예포', 0),
+('砲', '禮砲', '예포', 1),
+('禮', '禮節', '례절', 0),
+('節', '禮節', '례절', 1),
+('禮', '禮節', '예절', 0),
+('節', '禮節', '예절', 1),
+('禮', '禮記', '예기', 0),
+('記', '禮記', '예기', 1),
+('禱', '禱祀', '도사', 0),
+('祀', '禱祀', '도사', 1),
+('禽', '禽獸', '금수', 0),
+('獸', '禽獸', '금수', 1),
+('禾', '禾本學', '화본학', 0),
+('本', '禾本學', '화본학', 1),
+('學', '禾本學', '화본학', 2),
+('秀', '秀逸', '수일', 0),
+('逸', '秀逸', '수일', 1),
+('私', '私', '사', 0),
+('私', '私事', '사사', 0),
+('事', '私事', '사사', 1),
+('私', '私人', '사인', 0),
+('人', '私人', '사인', 1),
+('私', '私利', '사리', 0),
+('利', '私利', '사리', 1),
+('私', '私利私慾', '사리사욕', 0),
+('利', '私利私慾', '사리사욕', 1),
+('私', '私利私慾', '사리사욕', 2),
+('慾', '私利私慾', '사리사욕', 3),
+('私', '私和', '사화', 0),
+('和', '私和', '사화', 1),
+('私', '私娼', '사창', 0),
+('娼', '私娼', '사창', 1),
+('私', '私席', '사석', 0),
+('席', '私席', '사석', 1),
+('私', '私心', '사심', 0),
+('心', '私心', '사심', 1),
+('私', '私戰', '사전', 0),
+('戰', '私戰', '사전', 1),
+('私', '私掠船', '사략선', 0),
+('掠', '私掠船', '사략선', 1),
+('船', '私掠船', '사략선', 2),
+('私', '私書函', '사서함', 0),
+('書', '私書函', '사서함', 1),
+('函', '私書函', '사서함', 2),
+('私', '私有', '사유', 0),
+('有', '私有', '사유', 1),
+('私', '私權', '사권', 0),
+('權', '私權', '사권', 1),
+('私', '私法', '사법', 0),
+('法', '私法', '사법', 1),
+('私', '私生', '사생', 0),
+('生', '私生', '사생', 1),
+('私', '私生兒', '사생아', 0),
+('生', '私生兒', '사생아', 1),
+('兒', '私生兒', '사생아', 2),
+('私', '私生子', '사생자', 0),
+('生', '私生子', '사생자', 1),
+('子', '私生子', '사생자', 2),
+('私', '私生活', '사생활', 0),
+('生', '私生活', '사생활', 1),
+('活', '私生活', '사생활', 2),
+('私', '私生팬', '사생팬', 0),
+('生', '私生팬', '사생팬', 1),
+('팬', '私生팬', '사생팬', 2),
+('私', '私的', '사적', 0),
+('的', '私的', '사적', 1),
+('私', '私益', '사익', 0),
+('益', '私益', '사익', 1),
+('私', '私私롭다', '사사롭다', 0),
+('私', '私私롭다', '사사롭다', 1),
+('롭', '私私롭다', '사사롭다', 2),
+('다', '私私롭다', '사사롭다', 3),
+('私', '私立', '사립', 0),
+('立', '私立', '사립', 1),
+('私', '私見', '사견', 0),
+('見', '私見', '사견', 1),
+('私', '私設', '사설', 0),
+('設', '私設', '사설', 1),
+('私', '私談', '사담', 0),
+('談', '私談', '사담', 1),
+('私', '私讐', '사수', 0),
+('讐', '私讐', '사수', 1),
+('私', '私通', '사통', 0),
+('通', '私通', '사통', 1),
+('私', '私邸', '사저', 0),
+('邸', '私邸', '사저', 1),
+('秋', '秋夕', '추석', 0),
+('夕', '秋夕', '추석', 1),
+('秋', '秋季', '추계', 0),
+('季', '秋季', '추계', 1),
+('秋', '秋播', '추파', 0),
+('播', '秋播', '추파', 1),
+('秋', '秋收', '추수', 0),
+('收', '秋收', '추수', 1),
+('秋', '秋收 感謝節', '추수 감사절', 0),
+('收', '秋收 感謝節', '추수 감사절', 1),
+('感', '秋收 感謝節', '추수 감사절', 3),
+('謝', '秋收 感謝節', '추수 감사절', 4),
+('節', '秋收 感謝節', '추수 감사절', 5),
+('秋', '秋服', '추복', 0),
+('服', '秋服', '추복', 1),
+('秋', '秋毫', '추호', 0),
+('毫', '秋毫', '추호', 1),
+('秋', '秋波', '추파', 0),
+('波', '秋波', '추파', 1),
+('秋', '秋色', '추색', 0),
+('色', '秋色', '추색', 1),
+('秋', '秋雨', '추우', 0),
+('雨', '秋雨', '추우', 1),
+('秋', '秋霖', '추림', 0),
+('霖', '秋霖', '추림', 1),
+('秋', '秋風', '추풍', 0),
+('風', '秋風', '추풍', 1),
+('科', '科', '과', 0),
+('科', '科學', '과학', 0),
+('學', '科學', '과학', 1),
+('科', '科學博物館', '과학박물관', 0),
+('學', '科學博物館', '과학박물관', 1),
+('博', '科學博物館', '과학박물관', 2),
+('物', '科學博物館', '과학박물관', 3),
+('館', '科學博物館', '과학박물관', 4),
+('科', '科學小說', '과학소설', 0),
+('學', '科學小說', '과학소설', 1),
+('小', '科學小說', '과학소설', 2),
+('說', '科學小說', '과학소설', 3),
+('科', '科學技術', '과학기술', 0),
+('學', '科學技術', '과학기술', 1),
+('技', '科學技術', '과학기술', 2),
+('術', '科學技術', '과학기술', 3),
+('科', '科學的', '과학적', 0),
+('學', '科學的', '과학적', 1),
+('的', '科學的', '과학적', 2),
+('科', '科學者', '과학자', 0),
+('學', '科學者', '과학자', 1),
+('者', '科學者', '과학자', 2),
+('科', '科學館', '과학관', 0),
+('學', '科學館', '과학관', 1),
+('館', '科學館', '과학관', 2),
+('科', '科客', '과객', 0),
+('客', '科客', '과객', 1),
+('科', '科抛者', '과포자', 0),
+('抛', '科抛者', '과포자', 1),
+('者', '科抛者', '과포자', 2),
+('科', '科擧', '과거', 0),
+('擧', '科擧', '과거', 1),
+('科', '科目', '과목', 0),
+('目', '科目', '과목', 1),
+('秒', '秒', '초', 0),
+('秒', '秒時計', '초시계', 0),
+('時', '秒時計', '초시계', 1),
+('計', '秒時計', '초시계', 2),
+('秒', '秒殺', '초살', 0),
+('殺', '秒殺', '초살', 1),
+('秒', '秒針', '초침', 0),
+('針', '秒針', '초침', 1),
+('秘', '秘匿', '비닉', 0),
+('匿', '秘匿', '비닉', 1),
+('秘', '秘境', '비경', 0),
+('境', '秘境', '비경', 1),
+('秘', '秘密', '비밀', 0),
+('密', '秘密', '비밀', 1),
+('秘', '秘密番號', '비밀번호', 0),
+('密', '秘密番號', '비밀번호', 1),
+('番', '秘密番號', '비밀번호', 2),
+('號', '秘密番號', '비밀번호', 3),
+('秘', '秘密裏', '비밀리', 0),
+('密', '秘密裏', '비밀리', 1),
+('裏', '秘密裏', '비밀리', 2),
+('秘', '秘書', '비서', 0),
+('書', '秘書', '비서', 1),
+('秘', '秘法', '비법', 0),
+('法', '秘法', '비법', 1),
+('秘', '秘番', '비번', 0),
+('番', '秘番', '비번', 1),
+('秘', '秘藏', '비장', 0),
+('藏', '秘藏', '비장', 1),
+('秘', '秘訣', '비결', 0),
+('訣', '秘訣', '비결', 1),
+('秘', '秘資金', '비자금', 0),
+('資', '秘資金', '비자금', 1),
+('金', '秘資金', '비자금', 2),
+('租', '租借', '조차', 0),
+('借', '租借', '조차', 1),
+('租', '租借地', '조차지', 0),
+('借', '租借地', '조차지', 1),
+('地', '租借地', '조차지', 2),
+('租', '租界', '조계', 0),
+('界', '租界', '조계', 1),
+('租', '租稅', '조세', 0),
+('稅', '租稅', '조세', 1),
+('秩', '秩', '질', 0),
+('秩', '秩序', '질서', 0),
+('序', '秩序', '질서', 1),
+('移', '移住', '이주', 0),
+('住', '移住', '이주', 1),
+('移', '移住者', '이주자', 0),
+('住', '移住者', '이주자', 1),
+('者', '移住者', '이주자', 2),
+('移', '移動', '이동', 0),
+('動', '移動', '이동', 1),
+('移', '移徙', '이사', 0),
+('徙', '移徙', '이사', 1),
+('移', '移替', '이체', 0),
+('替', '移替', '이체', 1),
+('移', '移植', '이식', 0),
+('植', '移植', '이식', 1),
+('移', '移民', '이민', 0),
+('民', '移民', '이민', 1),
+('移', '移民者', '이민자', 0),
+('民', '移民者', '이민자', 1),
+('者', '移民者', '이민자', 2),
+('移', '移葬', '이장', 0),
+('葬', '移葬', '이장', 1),
+('移', '移行', '이행', 0),
+('行', '移行', '이행', 1),
+('移', '移調', '이조', 0),
+('調', '移調', '이조', 1),
+('移', '移項', '이항', 0),
+('項', '移項', '이항', 1),
+('稀', '稀微', '희미', 0),
+('微', '稀微', '희미', 1),
+('稀', '稀罕', '희한', 0),
+('罕', '稀罕', '희한', 1),
+('稀', '稀貴', '희귀', 0),
+('貴', '稀貴', '희귀', 1),
+('稀', '稀貴性', '희귀성', 0),
+('貴', '稀貴性', '희귀성', 1),
+('性', '稀貴性', '희귀성', 2),
+('稀', '稀貴本', '희귀본', 0),
+('貴', '稀貴本', '희귀본', 1),
+('本', '稀貴本', '희귀본', 2),
+('稀', '稀貴病', '희귀병', 0),
+('貴', '稀貴病', '희귀병', 1),
+('病', '稀貴病', '희귀병', 2),
+('稀', '稀釋', '희석', 0),
+('釋', '稀釋', '희석', 1),
+('稅', '稅率', '세율', 0),
+('率', '稅率', '세율', 1),
+('稅', '稅金', '세금', 0),
+('金', '稅金', '세금', 1),
+('稅', '稅關', '세관', 0),
+('關', '稅關', '세관', 1),
+('稅', '稅金', '세금', 0),
+('金', '稅金', '세금', 1),
+('程', '程度', '정도', 0),
+('度', '程度', '정도', 1),
+('程', '程式', '정식', 0),
+('式', '程式', '정식', 1),
+('稗', '稗官', '패관', 0),
+('官', '稗官', '패관', 1),
+('稚', '稚氣滿滿', '치기만만', 0),
+('氣', '稚氣滿滿', '치기만만', 1),
+('滿', '稚氣滿滿', '치기만만', 2),
+('滿', '稚氣滿滿', '치기만만', 3),
+('稜', '稜線', '능선', 0),
+('線', '稜線', '능선', 1),
+('稟', '稟告', '품고', 0),
+('告', '稟告', '품고', 1),
+('種', '種', '종', 0),
+('種', '種別', '종별', 0),
+('別', '種別', '종별', 1),
+('種', '種子', '종자', 0),
+('子', '種子', '종자', 1),
+('種', '種族', '종족', 0),
+('族', '種族', '종족', 1),
+('種', '種痘', '종두', 0),
+('痘', '種痘', '종두', 1),
+('種', '種皮', '종피', 0),
+('皮', '種皮', '종피', 1),
+('種', '種目', '종목', 0),
+('目', '種目', '종목', 1),
+('種', '種種', '종종', 0),
+('種', '種種', '종종', 1),
+('種', '種類', '종류', 0),
+('類', '種類', '종류', 1),
+('種', '種馬', '종마', 0),
+('馬', '種馬', '종마', 1),
+('種', '種麴', '종국', 0),
+('麴', '種麴', '종국', 1),
+('稱', '稱', '칭', 0),
+('稱', '稱號', '칭호', 0),
+('號', '稱號', '칭호', 1),
+('稱', '稱讚', '칭찬', 0),
+('讚', '稱讚', '칭찬', 1),
+('稻', '稻米', '도미', 0),
+('米', '稻米', '도미', 1),
+('稼', '稼動', '가동', 0),
+('動', '稼動', '가동', 1),
+('穀', '穀倉', '곡창', 0),
+('倉', '穀倉', '곡창', 1),
+('穀', '穀倉地帶', '곡창지대', 0),
+('倉', '穀倉地帶', '곡창지대', 1),
+('地', '穀倉地帶', '곡창지대', 2),
+('帶', '穀倉地帶', '곡창지대', 3),
+('穀', '穀物', '곡물', 0),
+('物', '穀物', '곡물', 1),
+('穀', '穀類', '곡류', 0),
+('類', '穀類', '곡류', 1),
+('穀', '穀食', '곡식', 0),
+('食', '穀食', '곡식', 1),
+('積', '積', '적', 0),
+('積', '積分', '적분', 0),
+('分', '積分', '적분', 1),
+('積', '積分學', '적분학', 0),
+('分', '積分學', '적분학', 1),
+('學', '積分學', '적분학', 2),
+('積', '積極', '적극', 0),
+('極', '積極', '적극', 1),
+('積', '積極的', '적극적', 0),
+('極', '積極的', '적극적', 1),
+('的', '積極的', '적극적', 2),
+('積', '積載', '적재', 0),
+('載', '積載', '적재', 1),
+('穎', '穎悟', '영오', 0),
+('悟', '穎悟', '영오', 1),
+('穎', '穎果', '영과', 0),
+('果', '穎果', '영과', 1),
+('究', '究明', '구명', 0),
+('明', '究明', '구명', 1),
+('究', '究竟', '구경', 0),
+('竟', '究竟', '구경', 1),
+('穹', '穹窿', '궁륭', 0),
+('窿', '穹窿', '궁륭', 1),
+('穹', '穹蒼', '궁창', 0),
+('蒼', '穹蒼', '궁창', 1),
+('空', '空-', '공짜', 0),
+('-', '空-', '공짜', 1),
+('空', '空中', '공중', 0),
+('中', '空中', '공중', 1),
+('空', '空乏', '공핍', 0),
+('乏', '空乏', '공핍', 1),
+('空', '空冊', '공책', 0),
+('冊', '空冊', '공책', 1),
+('空', '空唱', '공창', 0),
+('唱', '空唱', '공창', 1),
+('空', '空器', '공기', 0),
+('器', '空器', '공기', 1),
+('空', '空城計', '공성계', 0),
+('城', '空城計', '공성계', 1),
+('計', '空城計', '공성계', 2),
+('空', '空寂', '공적', 0),
+('寂', '空寂', '공적', 1),
+('空', '空席', '공석', 0),
+('席', '空席', '공석', 1),
+('空', '空心菜', '공심채', 0),
+('心', '空心菜', '공심채', 1),
+('菜', '空心菜', '공심채', 2),
+('空', '空想', '공상', 0),
+('想', '空想', '공상', 1),
+('空', '空想家', '공상가', 0),
+('想', '空想家', '공상가', 1),
+('家', '空想家', '공상가', 2),
+('空', '空手道', '공수도', 0),
+('手', '空手道', '공수도', 1),
+('道', '空手道', '공수도', 2),
+('空', '空氣', '공기', 0),
+('氣', '空氣', '공기', 1),
+('空', '空氣方席', '공기방석', 0),
+('氣', '空氣方席', '공기방석', 1),
+('方', '空氣方席', '공기방석', 2),
+('席', '空氣方席', '공기방석', 3),
+('空', '空氣方席自動車', '공기방석자동차', 0),
+('氣', '空氣方席自動車', '공기방석자동차', 1),
+('方', '空氣方席自動車', '공기방석자동차', 2),
+('席', '空氣方席自動車', '공기방석자동차', 3),
+('自', '空氣方席自動車', '공기방석자동차', 4),
+('動', '空氣方席自動車', '공기방석자동차', 5),
+('車', '空氣方席自動車', '공기방석자동차', 6),
+('空', '空洞', '공동', 0),
+('洞', '空洞', '공동', 1),
+('空', '空港', '공항', 0),
+('港', '空港', '공항', 1),
+('空', '空然', '공연', 0),
+('然', '空然', '공연', 1),
+('空', '空爆', '공폭', 0),
+('爆', '空爆', '공폭', 1),
+('空', '空白', '공백', 0),
+('白', '空白', '공백', 1),
+('空', '空腸', '공장', 0),
+('腸', '空腸', '공장', 1),
+('空', '空腹', '공복', 0),
+('腹', '空腹', '공복', 1),
+('空', '空虛', '공허', 0),
+('虛', '空虛', '공허', 1),
+('空', '空襲', '공습', 0),
+('襲', '空襲', '공습', 1),
+('空', '空言', '공언', 0),
+('言', '空言', '공언', 1),
+('空', '空講', '공강', 0),
+('講', '空講', '공강', 1),
+('空', '空賣渡', '공매도', 0),
+('賣', '空賣渡', '공매도', 1),
+('渡', '空賣渡', '공매도', 2),
+('空', '空車', '공차', 0),
+('車', '空車', '공차', 1),
+('空', '空軍', '공군', 0),
+('軍', '空軍', '공군', 1),
+('空', '空輸', '공수', 0),
+('輸', '空輸', '공수', 1),
+('空', '空輸部隊', '공수부대', 0),
+('輸', '空輸部隊', '공수부대', 1),
+('部', '空輸部隊', '공수부대', 2),
+('隊', '空輸部隊', '공수부대', 3),
+('空', '空間', '공간', 0),
+('間', '空間', '공간', 1),
+('穿', '穿孔', '천공', 0),
+('孔', '穿孔', '천공', 1),
+('穿', '穿山甲', '천산갑', 0),
+('山', '穿山甲', '천산갑', 1),
+('甲', '穿山甲', '천산갑', 2),
+('突', '突入', '돌입', 0),
+('入', '突入', '돌입', 1),
+('突', '突出', '돌출', 0),
+('出', '突出', '돌출', 1),
+('突', '突厥', '돌궐', 0),
+('厥', '突厥', '돌궐', 1),
+('突', '突擊', '돌격', 0),
+('擊', '突擊', '돌격', 1),
+('突', '突然', '돌연', 0),
+('然', '突然', '돌연', 1),
+('突', '突然死', '돌연사', 0),
+('然', '突然死', '돌연사', 1),
+('死', '突然死', '돌연사', 2),
+('突', '突然變異', '돌연변이', 0),
+('然', '突然變異', '돌연변이', 1),
+('變', '突然變異', '돌연변이', 2),
+('異', '突然變異', '돌연변이', 3),
+('突', '突發', '돌발', 0),
+('發', '突發', '돌발', 1),
+('突', '突發死', '돌발사', 0),
+('發', '突發死', '돌발사', 1),
+('死', '突發死', '돌발사', 2),
+('突', '突破', '돌파', 0),
+('破', '突破', '돌파', 1),
+('突', '突破口', '돌파구', 0),
+('破', '突破口', '돌파구', 1),
+('口', '突破口', '돌파구', 2),
+('突', '突變', '돌변', 0),
+('變', '突變', '돌변', 1),
+('突', '突起', '돌기', 0),
+('起', '突起', '돌기', 1),
+('突', '突進', '돌진', 0),
+('進', '突進', '돌진', 1),
+('突', '突風', '돌풍', 0),
+('風', '突風', '돌풍', 1),
+('窈', '窈窕淑女', '요조숙녀', 0),
+('窕', '窈窕淑女', '요조숙녀', 1),
+('淑', '窈窕淑女', '요조숙녀', 2),
+('女', '窈窕淑女', '요조숙녀', 3),
+('窒', '窒化', '질화', 0),
+('化', '窒化', '질화', 1),
+('窒', '窒塞', '질색', 0),
+('塞', '窒塞', '질색', 1),
+('窒', '窒息', '질식', 0),
+('息', '窒息', '질식', 1),
+('窒', '窒素', '질소', 0),
+('素', '窒素', '질소', 1),
+('窓', '窓', '창', 0),
+('窓', '窓-', '창가', 0),
+('-', '窓-', '창가', 1),
+('窓', '窓-', '창밖', 0),
+('-', '窓-', '창밖', 1),
+('窓', '窓口', '창구', 0),
+('口', '窓口', '창구', 1),
+('窓', '窓門', '창문', 0),
+('門', '窓門', '창문', 1),
+('窓', '窓가', '창가', 0),
+('가', '窓가', '창가', 1),
+('窟', '窟', '굴', 0),
+('窪', '窪地', '와지', 0),
+('地', '窪地', '와지', 1),
+('窮', '窮', '궁', 0),
+('窮', '窮乏', '궁핍', 0),
+('乏', '窮乏', '궁핍', 1),
+('窮', '窮地', '궁지', 0),
+('地', '窮地', '궁지', 1),
+('窮', '窮境', '궁경', 0),
+('境', '窮境', '궁경', 1),
+('窮', '窮極的', '궁극적', 0),
+('極', '窮極的', '궁극적', 1),
+('的', '窮極的', '궁극적', 2),
+('窮', '窮民', '궁민', 0),
+('民', '窮民', '궁민', 1),
+('窮', '窮理', '궁리', 0),
+('理', '窮理', '궁리', 1),
+('窯', '窯業', '요업', 0),
+('業', '窯業', '요업', 1),
+('竈', '竈王', '조왕', 0),
+('王', '竈王', '조왕', 1),
+('竊', '竊盜', '절도', 0),
+('盜', '竊盜', '절도', 1),
+('竊', '竊盜罪', '절도죄', 0),
+('盜', '竊盜罪', '절도죄', 1),
+('罪', '竊盜罪', '절도죄', 2),
+('立', '立場', '입장', 0),
+('場', '立場', '입장', 1),
+('立', '立憲', '입헌', 0),
+('憲', '立憲', '입헌', 1),
+('立', '立憲君主制', '입헌군주제', 0),
+('憲', '立憲君主制', '입헌군주제', 1),
+('君', '立憲君主制', '입헌군주제', 2),
+('主', '立憲君主制', '입헌군주제', 3),
+('制', '立憲君主制', '입헌군주제', 4),
+('立', '立方', '입방', 0),
+('方', '立方', '입방', 1),
+('立', '立方體', '입방체', 0),
+('方', '立方體', '입방체', 1),
+('體', '立方體', '입방체', 2),
+('立', '立法', '립법', 0),
+('法', '立法', '립법', 1),
+('立', '立法', '입법', 0),
+('法', '立法', '입법', 1),
+('立', '立法者', '립법자', 0),
+('法', '立法者', '립법자', 1),
+('者', '立法者', '립법자', 2),
+('立', '立法者', '입법자', 0),
+('法', '立法者', '입법자', 1),
+('者', '立法者', '입법자', 2),
+('立', '立證', '입증', 0),
+('證', '立證', '입증', 1),
+('竝', '竝記', '병기', 0),
+('記', '竝記', '병기', 1),
+('章', '章', '장', 0),
+('章', '章數', '장수', 0),
+('數', '章數', '장수', 1),
+('竣', '竣工', '준공', 0),
+('工', '竣工', '준공', 1),
+('童', '童歌', '동가', 0),
+('歌', '童歌', '동가', 1),
+('童', '童話', '동화', 0),
+('話', '童話', '동화', 1),
+('童', '童話冊', '동화책', 0),
+('話', '童話冊', '동화책', 1),
+('冊', '童話冊', '동화책', 2),
+('童', '童話集', '동화집', 0),
+('話', '童話集', '동화집', 1),
+('集', '童話集', '동화집', 2),
+('童', '童謠', '동요', 0),
+('謠', '童謠', '동요', 1),
+('童', '童貞女', '동정녀', 0),
+('貞', '童貞女', '동정녀', 1),
+('女', '童貞女', '동정녀', 2),
+('童', '童貞男', '동정남', 0),
+('貞', '童貞男', '동정남', 1),
+('男', '童貞男', '동정남', 2),
+('端', '端', '단', 0),
+('端', '端子', '단자', 0),
+('子', '端子', '단자', 1),
+('端', '端川', '단천', 0),
+('川', '端川', '단천', 1),
+('端', '端末', '단말', 0),
+('末', '端末', '단말', 1),
+('端', '端末機', '단말기', 0),
+('末', '端末機', '단말기', 1),
+('機', '端末機', '단말기', 2),
+('競', '競合', '경합', 0),
+('合', '競合', '경합', 1),
+('競', '競技', '경기', 0),
+('技', '競技', '경기', 1),
+('競', '競技場', '경기장', 0),
+('技', '競技場', '경기장', 1),
+('場', '競技場', '경기장', 2),
+('競', '競技大會', '경기대회', 0),
+('技', '競技大會', '경기대회', 1),
+('大', '競技大會', '경기대회', 2),
+('會', '競技大會', '경기대회', 3),
+('競', '競技館', '경기관', 0),
+('技', '競技館', '경기관', 1),
+('館', '競技館', '경기관', 2),
+('競', '競爭', '경쟁', 0),
+('爭', '競爭', '경쟁', 1),
+('競', '競爭力', '경쟁력', 0),
+('爭', '競爭力', '경쟁력', 1),
+('力', '競爭力', '경쟁력', 2),
+('競', '競爭者', '경쟁자', 0),
+('爭', '競爭者', '경쟁자', 1),
+('者', '競爭者', '경쟁자', 2),
+('競', '競賣', '경매', 0),
+('賣', '競賣', '경매', 1),
+('競', '競走', '경주', 0),
+('走', '競走', '경주', 1),
+('競', '競馬', '경마', 0),
+('馬', '競馬', '경마', 1),
+('競', '競馬場', '경마장', 0),
+('馬', '競馬場', '경마장', 1),
+('場', '競馬場', '경마장', 2),
+('竹', '竹夫人', '죽부인', 0),
+('夫', '竹夫人', '죽부인', 1),
+('人', '竹夫人', '죽부인', 2),
+('竹', '竹林', '죽림', 0),
+('林', '竹林', '죽림', 1),
+('竹', '竹片', '죽편', 0),
+('片', '竹片', '죽편', 1),
+('竹', '竹筍', '죽순', 0),
+('筍', '竹筍', '죽순', 1),
+('竹', '竹簡', '죽간', 0),
+('簡', '竹簡', '죽간', 1),
+('竹', '竹馬', '죽마', 0),
+('馬', '竹馬', '죽마', 1),
+('竹', '竹馬古友', '죽마고우', 0),
+('馬', '竹馬古友', '죽마고우', 1),
+('古', '竹馬古友', '죽마고우', 2),
+('友', '竹馬古友', '죽마고우', 3),
+('竹', '竹鹽', '죽염', 0),
+('鹽', '竹鹽', '죽염', 1),
+('笊', '笊籬', '조리', 0),
+('籬', '笊籬', '조리', 1),
+('笑', '笑劇', '소극', 0),
+('劇', '笑劇', '소극', 1),
+('笑', '笑氣', '소기', 0),
+('氣', '笑氣', '소기', 1),
+('笑', '笑覽', '소람', 0),
+('覽', '笑覽', '소람', 1),
+('笙', '笙簧', '생황', 0),
+('簧', '笙簧', '생황', 1),
+('笛', '笛', '적', 0),
+('符', '符合', '부합', 0),
+('合', '符合', '부합', 1),
+('符', '符籍', '부적', 0),
+('籍', '符籍', '부적', 1),
+('符', '符號', '부호', 0),
+('號', '符號', '부호', 1),
+('第', '第一', '제일', 0),
+('一', '第一', '제일', 1),
+('第', '第一人稱', '제일인칭', 0),
+('一', '第一人稱', '제일인칭', 1),
+('人', '第一人稱', '제일인칭', 2),
+('稱', '第一人稱', '제일인칭', 3),
+('第', '第三國', '제삼국', 0),
+('三', '第三國', '제삼국', 1),
+('國', '第三國', '제삼국', 2),
+('第', '第三帝國', '제삼제국', 0),
+('三', '第三帝國', '제삼제국', 1),
+('帝', '第三帝國', '제삼제국', 2),
+('國', '第三帝國', '제삼제국', 3),
+('第', '第六感', '제육감', 0),
+('六', '第六感', '제육감', 1),
+('感', '第六感', '제육감', 2),
+('笳', '笳管', '가관', 0),
+('管', '笳管', '가관', 1),
+('筆', '筆劃', '필획', 0),
+('劃', '筆劃', '필획', 1),
+('筆', '筆名', '필명', 0),
+('名', '筆名', '필명', 1),
+('筆', '筆生', '필생', 0),
+('生', '筆生', '필생', 1),
+('筆', '筆筒', '필통', 0),
+('筒', '筆筒', '필통', 1),
+('筆', '筆答', '필답', 0),
+('答', '筆答', '필답', 1),
+('筆', '筆者', '필자', 0),
+('者', '筆者', '필자', 1),
+('筆', '筆記者', '필기자', 0),
+('記', '筆記者', '필기자', 1),
+('者', '筆記者', '필기자', 2),
+('筆', '筆談', '필담', 0),
+('談', '筆談', '필담', 1),
+('筆', '筆跡', '필적', 0),
+('跡', '筆跡', '필적', 1),
+('筆', '筆跡學', '필적학', 0),
+('跡', '筆跡學', '필적학', 1),
+('學', '筆跡學', '필적학', 2),
+('筆', '筆順', '필순', 0),
+('順', '筆順', '필순', 1),
+('等', '等', '등', 0),
+('等', '等價', '등가', 0),
+('價', '等價', '등가', 1),
+('等', '等價物', '등가물', 0),
+('價', '等價物', '등가물', 1),
+('物', '等價物', '등가물', 2),
+('等', '等分', '등분', 0),
+('分', '等分', '등분', 1),
+('等', '等差', '등차', 0),
+('差', '等差', '등차', 1),
+('等', '等差數列', '등차수열', 0),
+('差', '等差數列', '등차수열', 1),
+('數', '等差數列', '등차수열', 2),
+('列', '等差數列', '등차수열', 3),
+('等', '等式', '등식', 0),
+('式', '等式', '등식', 1),
+('等', '等神', '등신', 0),
+('神', '等神', '등신', 1),
+('等', '等等', '등등', 0),
+('等', '等等', '등등', 1),
+('等', '等級', '등급', 0),
+('級', '等級', '등급', 1),
+('筋', '筋', '근', 0),
+('筋', '筋力', '근력', 0),
+('力', '筋力', '근력', 1),
+('筋', '筋肉', '근육', 0),
+('肉', '筋肉', '근육', 1),
+('筍', '筍', '순', 0),
+('筒', '筒箇', '동개', 0),
+('箇', '筒箇', '동개', 1),
+('筒', '筒발', '통발', 0),
+('발', '筒발', '통발', 1),
+('答', '答', '답', 0),
+('答', '答定—', '답정너', 0),
+('定', '答定—', '답정너', 1),
+('—', '答定—', '답정너', 2),
+('答', '答案', '답안', 0),
+('案', '答案', '답안', 1),
+('答', '答狀', '답장', 0),
+('狀', '答狀', '답장', 1),
+('答', '答申', '답신', 0),
+('申', '答申', '답신', 1),
+('答', '答辯', '답변', 0),
+('辯', '答辯', '답변', 1),
+('答', '答글', '답글', 0),
+('글', '答글', '답글', 1),
+('答', '答狀', '답장', 0),
+('狀', '答狀', '답장', 1),
+('策', '策動', '책동', 0),
+('動', '策動', '책동', 1),
+('策', '策士', '책사', 0),
+('士', '策士', '책사', 1),
+('策', '策應', '책응', 0),
+('應', '策應', '책응', 1),
+('策', '策略', '책략', 0),
+('略', '策略', '책략', 1),
+('算', '算', '산', 0),
+('算', '算定', '산정', 0),
+('定', '算定', '산정', 1),
+('算', '算數', '산수', 0),
+('數', '算數', '산수', 1),
+('算', '算板', '산판', 0),
+('板', '算板', '산판', 1),
+('算', '算法', '산법', 0),
+('法', '算法', '산법', 1),
+('算', '算術', '산술', 0),
+('術', '算術', '산술', 1),
+('箜', '箜篌', '공후', 0),
+('篌', '箜篌', '공후', 1),
+('管', '管', '관', 0),
+('管', '管制', '관제', 0),
+('制', '管制', '관제', 1),
+('管', '管制塔', '관제탑', 0),
+('制', '管制塔', '관제탑', 1),
+('塔', '管制塔', '관제탑', 2),
+('管', '管樂', '관악', 0),
+('樂', '管樂', '관악', 1),
+('管', '管樂器', '관악기', 0),
+('樂', '管樂器', '관악기', 1),
+('器', '管樂器', '관악기', 2),
+('管', '管理', '관리', 0),
+('理', '管理', '관리', 1),
+('管', '管理人', '관리인', 0),
+('理', '管理人', '관리인', 1),
+('人', '管理人', '관리인', 2),
+('管', '管理所', '관리소', 0),
+('理', '管理所', '관리소', 1),
+('所', '管理所', '관리소', 2),
+('管', '管理者', '관리자', 0),
+('理', '管理者', '관리자', 1),
+('者', '管理者', '관리자', 2),
+('管', '管絃樂團', '관현악단', 0),
+('絃', '管絃樂團', '관현악단', 1),
+('樂', '管絃樂團', '관현악단', 2),
+('團', '管絃樂團', '관현악단', 3),
+('管', '管路', '관로', 0),
+('路', '管路', '관로', 1),
+('管', '管轄', '관할', 0),
+('轄', '管轄', '관할', 1),
+('管', '管風琴', '관풍금', 0),
+('風', '管風琴', '관풍금', 1),
+('琴', '管風琴', '관풍금', 2),
+('箭', '箭桐', '전동', 0),
+('桐', '箭桐', '전동', 1),
+('箱', '箱子', '상자', 0),
+('子', '箱子', '상자', 1),
+('箴', '箴言', '잠언', 0),
+('言', '箴言', '잠언', 1),
+('箸', '箸', '저', 0),
+('節', '節', '절', 0),
+('節', '節制', '절제', 0),
+('制', '節制', '절제', 1),
+('節', '節度使', '절도사', 0),
+('度', '節度使', '절도사', 1),
+('使', '節度使', '절도사', 2),
+('節', '節操', '절조', 0),
+('操', '節操', '절조', 1),
+('節', '節次', '절차', 0),
+('次', '節次', '절차', 1),
+('節', '節氣', '절기', 0),
+('氣', '節氣', '절기', 1),
+('節', '節減', '절감', 0),
+('減', '節減', '절감', 1),
+('節', '節約', '절약', 0),
+('約', '節約', '절약', 1),
+('節', '節酒', '절주', 0),
+('酒', '節酒', '절주', 1),
+('範', '範例', '범례', 0),
+('例', '範例', '범례', 1),
+('範', '範圍', '범위', 0),
+('圍', '範圍', '범위', 1),
+('範', '範疇', '범주', 0),
+('疇', '範疇', '범주', 1),
+('篇', '篇', '편', 0),
+('築', '築城', '축성', 0),
+('城', '築城', '축성', 1),
+('築', '築堤', '축제', 0),
+('堤', '築堤', '축제', 1),
+('築', '築港', '축항', 0),
+('港', '築港', '축항', 1),
+('築', '築造', '축조', 0),
+('造', '築造', '축조', 1),
+('篪', '篪', '지', 0),
+('簒', '簒奪', '찬탈', 0),
+('奪', '簒奪', '찬탈', 1),
+('簡', '簡便', '간편', 0),
+('便', '簡便', '간편', 1),
+('簡', '簡單', '간단', 0),
+('單', '簡單', '간단', 1),
+('簡', '簡潔', '간결', 0),
+('潔', '簡潔', '간결', 1),
+('簡', '簡牘', '간독', 0),
+('牘', '簡牘', '간독', 1),
+('簡', '簡素', '간소', 0),
+('素', '簡素', '간소', 1),
+('簡', '簡體', '간체', 0),
+('體', '簡體', '간체', 1),
+('簡', '簡體字', '간체자', 0),
+('體', '簡體字', '간체자', 1),
+('字', '簡體字', '간체자', 2),
+('簿', '簿記', '부기', 0),
+('記', '簿記', '부기', 1),
+('籌', '籌板', '주판', 0),
+('板', '籌板', '주판', 1),
+('籍', '籍', '적', 0),
+('籠', '籠欌', '농장', 0),
+('欌', '籠欌', '농장', 1),
+('籠', '籠球', '농구', 0),
+('球', '籠球', '농구', 1),
+('籠', '籠球', '롱구', 0),
+('球', '籠球', '롱구', 1),
+('籥', '籥', '약', 0),
+('米', '米作', '미작', 0),
+('作', '米作', '미작', 1),
+('米', '米作地帶', '미작지대', 0),
+('作', '米作地帶', '미작지대', 1),
+('地', '米作地帶', '미작지대', 2),
+('帶', '米作地帶', '미작지대', 3),
+('米', '米作豫想', '미작예상', 0),
+('作', '米作豫想', '미작예상', 1),
+('豫', '米作豫想', '미작예상', 2),
+('想', '米作豫想', '미작예상', 3),
+('米', '米作豫想收穫量', '미작예상수확량', 0),
+('作', '米作豫想收穫量', '미작예상수확량', 1),
+('豫', '米作豫想收穫量', '미작예상수확량', 2),
+('想', '米作豫想收穫量', '미작예상수확량', 3),
+('收', '米作豫想收穫量', '미작예상수확량', 4),
+('穫', '米作豫想收穫量', '미작예상수확량', 5),
+('量', '米作豫想收穫量', '미작예상수확량', 6),
+('米', '米糠油', '미강유', 0),
+('糠', '米糠油', '미강유', 1),
+('油', '米糠油', '미강유', 2),
+('米', '米酒', '미주', 0),
+('酒', '米酒', '미주', 1),
+('米', '米飮床', '미음상', 0),
+('飮', '米飮床', '미음상', 1),
+('床', '米飮床', '미음상', 2),
+('粉', '粉末', '분말', 0),
+('末', '粉末', '분말', 1),
+('粉', '粉碎', '분쇄', 0),
+('碎', '粉碎', '분쇄', 1),
+('粉', '粉碎機', '분쇄기', 0),
+('碎', '粉碎機', '분쇄기', 1),
+('機', '粉碎機', '분쇄기', 2),
+('粉', '粉筆', '분필', 0),
+('筆', '粉筆', '분필', 1),
+('粉', '粉紅', '분홍', 0),
+('紅', '粉紅', '분홍', 1),
+('粉', '粉紅色', '분홍색', 0),
+('紅', '粉紅色', '분홍색', 1),
+('色', '粉紅色', '분홍색', 2),
+('粉', '粉食店', '분식점', 0),
+('食', '粉食店', '분식점', 1),
+('店', '粉食店', '분식점', 2),
+('粉', '粉食類', '분식류', 0),
+('食', '粉食類', '분식류', 1),
+('類', '粉食類', '분식류', 2),
+('粒', '粒子', '입자', 0),
+('子', '粒子', '입자', 1),
+('粒', '粒子加速器', '입자가속기', 0),
+('子', '粒子加速器', '입자가속기', 1),
+('加', '粒子加速器', '입자가속기', 2),
+('速', '粒子加速器', '입자가속기', 3),
+('器', '粒子加速器', '입자가속기', 4),
+('粒', '粒子物理學', '입자물리학', 0),
+('子', '粒子物理學', '입자물리학', 1),
+('物', '粒子物理學', '입자물리학', 2),
+('理', '粒子物理學', '입자물리학', 3),
+('學', '粒子物理學', '입자물리학', 4),
+('粗', '粗製', '조제', 0),
+('製', '粗製', '조제', 1),
+('粘', '粘土', '점토', 0),
+('土', '粘土', '점토', 1),
+('粘', '粘度', '점도', 0),
+('度', '粘度', '점도', 1),
+('粘', '粘板岩', '점판암', 0),
+('板', '粘板岩', '점판암', 1),
+('岩', '粘板岩', '점판암', 2),
+('粘', '粘液', '점액', 0),
+('液', '粘液', '점액', 1),
+('粘', '粘着', '점착', 0),
+('着', '粘着', '점착', 1),
+('粘', '粘膜', '점막', 0),
+('膜', '粘膜', '점막', 1),
+('粥', '粥', '죽', 0),
+('粵', '粵拼', '월병', 0),
+('拼', '粵拼', '월병', 1),
+('粵', '粵語', '월어', 0),
+('語', '粵語', '월어', 1),
+('精', '精力', '정력', 0),
+('力', '精力', '정력', 1),
+('精', '精子', '정자', 0),
+('子', '精子', '정자', 1),
+('精', '精油', '정유', 0),
+('油', '精油', '정유', 1),
+('精', '精液', '정액', 0),
+('液', '精液', '정액', 1),
+('精', '精神', '정신', 0),
+('神', '精神', '정신', 1),
+('精', '精神分裂病', '정신분열병', 0),
+('神', '精神分裂病', '정신분열병', 1),
+('分', '精神分裂病', '정신분열병', 2),
+('裂', '精神分裂病', '정신분열병', 3),
+('病', '精神分裂病', '정신분열병', 4),
+('精', '精神分裂症', '정신분열증', 0),
+('神', '精神分裂症', '정신분열증', 1),
+('分', '精神分裂症', '정신분열증', 2),
+('裂', '精神分裂症', '정신분열증', 3),
+('症', '精神分裂症', '정신분열증', 4),
+('精', '精神勝利', '정신승리', 0),
+('神', '精神勝利', '정신승리', 1),
+('勝', '精神勝利', '정신승리', 2),
+('利', '精神勝利', '정신승리', 3),
+('精', '精神病', '정신병', 0),
+('神', '精神病', '정신병', 1),
+('病', '精神病', '정신병', 2),
+('精', '精神病者', '정신병자', 0),
+('神', '精神病者', '정신병자', 1),
+('病', '精神病者', '정신병자', 2),
+('者', '精神病者', '정신병자', 3),
+('精', '精神病院', '정신병원', 0),
+('神', '精神病院', '정신병원', 1),
+('病', '精神病院', '정신병원', 2),
+('院', '精神病院', '정신병원', 3),
+('精', '精神的', '정신적', 0),
+('神', '精神的', '정신적', 1),
+('的', '精神的', '정신적', 2),
+('精', '精神科', '정신과', 0),
+('神', '精神科', '정신과', 1),
+('科', '精神科', '정신과', 2),
+('精', '精神科醫', '정신과의', 0),
+('神', '精神科醫', '정신과의', 1),
+('科', '精神科醫', '정신과의', 2),
+('醫', '精神科醫', '정신과의', 3),
+('精', '精神醫學', '정신의학', 0),
+('神', '精神醫學', '정신의학', 1),
+('醫', '精神醫學', '정신의학', 2),
+('學', '精神醫學', '정신의학', 3),
+('精', '精肉店', '정육점', 0),
+('肉', '精肉店', '정육점', 1),
+('店', '精肉店', '정육점', 2),
+('精', '精蟲', '정충', 0),
+('蟲', '精蟲', '정충', 1),
+('精', '精製', '정제', 0),
+('製', '精製', '정제', 1),
+('精', '精誠', '정성', 0),
+('誠', '精誠', '정성', 1),
+('精', '精讀', '정독', 0),
+('讀', '精讀', '정독', 1),
+('精', '精銳', '정예', 0),
+('銳', '精銳', '정예', 1),
+('精', '精靈', '정령', 0),
+('靈', '精靈', '정령', 1),
+('精', '精髓', '정수', 0),
+('髓', '精髓', '정수', 1),
+('糊', '糊精', '호정', 0),
+('精', '糊精', '호정', 1),
+('糖', '糖', '당', 0),
+('糖', '糖尿病', '당뇨병', 0),
+('尿', '糖尿病', '당뇨병', 1),
+('病', '糖尿病', '당뇨병', 2),
+('糖', '糖水肉', '탕수육', 0),
+('水', '糖水肉', '탕수육', 1),
+('肉', '糖水肉', '탕수육', 2),
+('糖', '糖蜜', '당밀', 0),
+('蜜', '糖蜜', '당밀', 1),
+('糖', '糖質', '당질', 0),
+('質', '糖質', '당질', 1),
+('糖', '糖類', '당류', 0),
+('類', '糖類', '당류', 1),
+('糞', '糞', '분', 0),
+('糞', '糞蟲', '분충', 0),
+('蟲', '糞蟲', '분충', 1),
+('糟', '糟糠', '조강', 0),
+('糠', '糟糠', '조강', 1),
+('糧', '糧食', '양식', 0),
+('食', '糧食', '양식', 1),
+('糶', '糶糴', '조적', 0),
+('糴', '糶糴', '조적', 1),
+('糶', '糶賣', '조매', 0),
+('賣', '糶賣', '조매', 1),
+('系', '系列', '계렬', 0),
+('列', '系列', '계렬', 1),
+('系', '系列', '계열', 0),
+('列', '系列', '계열', 1),
+('系', '系圖', '계도', 0),
+('圖', '系圖', '계도', 1),
+('系', '系統', '계통', 0),
+('統', '系統', '계통', 1),
+('系', '系譜', '계보', 0),
+('譜', '系譜', '계보', 1),
+('糾', '糾合', '규합', 0),
+('合', '糾合', '규합', 1),
+('糾', '糾彈', '규탄', 0),
+('彈', '糾彈', '규탄', 1),
+('紀', '紀元', '기원', 0),
+('元', '紀元', '기원', 1),
+('紀', '紀元前', '기원전', 0),
+('元', '紀元前', '기원전', 1),
+('前', '紀元前', '기원전', 2),
+('紀', '紀元後', '기원후', 0),
+('元', '紀元後', '기원후', 1),
+('後', '紀元後', '기원후', 2),
+('紀', '紀念', '기념', 0),
+('念', '紀念', '기념', 1),
+('紀', '紀念品', '기념품', 0),
+('念', '紀念品', '기념품', 1),
+('品', '紀念品', '기념품', 2),
+('紀', '紀念日', '기념일', 0),
+('念', '紀念日', '기념일', 1),
+('日', '紀念日', '기념일', 2),
+('紀', '紀念物', '기념물', 0),
+('念', '紀念物', '기념물', 1),
+('物', '紀念物', '기념물', 2),
+('紀', '紀要', '기요', 0),
+('要', '紀要', '기요', 1),
+('約', '約', '약', 0),
+('約', '約婚', '약혼', 0),
+('婚', '約婚', '약혼', 1),
+('約', '約婚半指', '약혼반지', 0),
+('婚', '約婚半指', '약혼반지', 1),
+('半', '約婚半指', '약혼반지', 2),
+('指', '約婚半指', '약혼반지', 3),
+('約', '約婚女', '약혼녀', 0),
+('婚', '約婚女', '약혼녀', 1),
+('女', '約婚女', '약혼녀', 2),
+('約', '約婚式', '약혼식', 0),
+('婚', '約婚式', '약혼식', 1),
+('式', '約婚式', '약혼식', 2),
+('約', '約婚者', '약혼자', 0),
+('婚', '約婚者', '약혼자', 1),
+('者', '約婚者', '약혼자', 2),
+('約', '約定', '약정', 0),
+('定', '約定', '약정', 1),
+('約', '約束', '약속', 0),
+('束', '約束', '약속', 1),
+('約', '約款', '약관', 0),
+('款', '約款', '약관', 1),
+('約', '約物', '약물', 0),
+('物', '約物', '약물', 1),
+('紅', '紅唐무', '홍당무', 0),
+('唐', '紅唐무', '홍당무', 1),
+('무', '紅唐무', '홍당무', 2),
+('紅', '紅塵', '홍진', 0),
+('塵', '紅塵', '홍진', 1),
+('紅', '紅松漁', '홍송어', 0),
+('松', '紅松漁', '홍송어', 1),
+('漁', '紅松漁', '홍송어', 2),
+('紅', '紅柹', '홍시', 0),
+('柹', '紅柹', '홍시', 1),
+('紅', '紅海', '홍해', 0),
+('海', '紅海', '홍해', 1),
+('紅', '紅潮', '홍조', 0),
+('潮', '紅潮', '홍조', 1),
+('紅', '紅玉', '홍옥', 0),
+('玉', '紅玉', '홍옥', 1),
+('紅', '紅疫', '홍역', 0),
+('疫', '紅疫', '홍역', 1),
+('紅', '紅茶', '홍차', 0),
+('茶', '紅茶', '홍차', 1),
+('紅', '紅葉', '홍엽', 0),
+('葉', '紅葉', '홍엽', 1),
+('紅', '紅蛤', '홍합', 0),
+('蛤', '紅蛤', '홍합', 1),
+('紅', '紅衛兵', '홍위병', 0),
+('衛', '紅衛兵', '홍위병', 1),
+('兵', '紅衛兵', '홍위병', 2),
+('紅', '紅鶴', '홍학', 0),
+('鶴', '紅鶴', '홍학', 1),
+('紅', '紅머리오리', '홍머리오리', 0),
+('머', '紅머리오리', '홍머리오리', 1),
+('리', '紅머리오리', '홍머리오리', 2),
+('오', '紅머리오리', '홍머리오리', 3),
+('리', '紅머리오리', '홍머리오리', 4),
+('紅', '紅살門', '홍살문', 0),
+('살', '紅살門', '홍살문', 1),
+('門', '紅살門', '홍살문', 2),
+('紅', '紅茶', '홍차', 0),
+('茶', '紅茶', '홍차', 1),
+('紊', '紊亂', '문란', 0),
+('亂', '紊亂', '문란', 1),
+('紋', '紋章', '문장', 0),
+('章', '紋章', '문장', 1),
+('納', '納凉', '납량', 0),
+('凉', '納凉', '납량', 1),
+('納', '納品', '납품', 0),
+('品', '納品', '납품', 1),
+('納', '納得', '납득', 0),
+('得', '納得', '납득', 1),
+('納', '納棺', '납관', 0),
+('棺', '納棺', '납관', 1),
+('納', '納稅者', '납세자', 0),
+('稅', '納稅者', '납세자', 1),
+('者', '納稅者', '납세자', 2),
+('純', '純', '순', 0),
+('純', '純化', '순화', 0),
+('化', '純化', '순화', 1),
+('純', '純度', '순도', 0),
+('度', '純度', '순도', 1),
+('純', '純愛', '순애', 0),
+('愛', '純愛', '순애', 1),
+('純', '純文學', '순문학', 0),
+('文', '純文學', '순문학', 1),
+('學', '純文學', '순문학', 2),
+('純', '純潔', '순결', 0),
+('潔', '純潔', '순결', 1),
+('純', '純眞', '순진', 0),
+('眞', '純眞', '순진', 1),
+('純', '純粹', '순수', 0),
+('粹', '純粹', '순수', 1),
+('純', '純血', '순혈', 0),
+('血', '純血', '순혈', 1),
+('紗', '紗帽', '사모', 0),
+('帽', '紗帽', '사모', 1),
+('紗', '紗帽뿔', '사모뿔', 0),
+('帽', '紗帽뿔', '사모뿔', 1),
+('뿔', '紗帽뿔', '사모뿔', 2),
+('紗', '紗窓', '사창', 0),
+('窓', '紗窓', '사창', 1),
+('紙', '紙上', '지상', 0),
+('上', '紙上', '지상', 1),
+('紙', '紙匣', '지갑', 0),
+('匣', '紙匣', '지갑', 1),
+('紙', '紙幣', '지폐', 0),
+('幣', '紙幣', '지폐', 1),
+('紙', '紙袋', '지대', 0),
+('袋', '紙袋', '지대', 1),
+('紙', '紙面', '지면', 0),
+('面', '紙面', '지면', 1),
+('紙', '紙鳶', '지연', 0),
+('鳶', '紙鳶', '지연', 1),
+('級', '級', '급', 0),
+('級', '級友', '급우', 0),
+('友', '級友', '급우', 1),
+('紛', '紛爭', '분쟁', 0),
+('爭', '紛爭', '분쟁', 1),
+('素', '素描', '소묘', 0),
+('描', '素描', '소묘', 1),
+('素', '素數', '소수', 0),
+('數', '素數', '소수', 1),
+('素', '素朴', '소박', 0),
+('朴', '素朴', '소박', 1),
+('素', '素材', '소재', 0),
+('材', '素材', '소재', 1),
+('素', '素樸', '소박', 0),
+('樸', '素樸', '소박', 1),
+('素', '素粒子', '소립자', 0),
+('粒', '素粒子', '소립자', 1),
+('子', '素粒子', '소립자', 2),
+('素', '素質', '소질', 0),
+('質', '素質', '소질', 1),
+('紡', '紡織', '방직', 0),
+('織', '紡織', '방직', 1),
+('紡', '紡織業', '방직업', 0),
+('織', '紡織業', '방직업', 1),
+('業', '紡織業', '방직업', 2),
+('紡', '紡錘', '방추', 0),
+('錘', '紡錘', '방추', 1),
+('索', '索引', '색인', 0),
+('引', '索引', '색인', 1),
+('索', '索麵', '삭면', 0),
+('麵', '索麵', '삭면', 1),
+('紫', '紫地', '자지', 0),
+('地', '紫地', '자지', 1),
+('紫', '紫外', '자외', 0),
+('外', '紫外', '자외', 1),
+('紫', '紫外線', '자외선', 0),
+('外', '紫外線', '자외선', 1),
+('線', '紫外線', '자외선', 2),
+('紫', '紫木蓮', '자목련', 0),
+('木', '紫木蓮', '자목련', 1),
+('蓮', '紫木蓮', '자목련', 2),
+('紫', '紫朱', '자주', 0),
+('朱', '紫朱', '자주', 1),
+('紫', '紫檀', '자단', 0),
+('檀', '紫檀', '자단', 1),
+('紫', '紫水晶', '자수정', 0),
+('水', '紫水晶', '자수정', 1),
+('晶', '紫水晶', '자수정', 2),
+('紫', '紫紅色', '자홍색', 0),
+('紅', '紫紅色', '자홍색', 1),
+('色', '紫紅色', '자홍색', 2),
+('紫', '紫芝', '자지', 0),
+('芝', '紫芝', '자지', 1),
+('紫', '紫遮', '자차', 0),
+('遮', '紫遮', '자차', 1),
+('累', '累積', '누적', 0),
+('積', '累積', '누적', 1),
+('累', '累計', '누계', 0),
+('計', '累計', '누계', 1),
+('細', '細切機', '세절기', 0),
+('切', '細切機', '세절기', 1),
+('機', '細切機', '세절기', 2),
+('細', '細孔', '세공', 0),
+('孔', '細孔', '세공', 1),
+('細', '細字', '세자', 0),
+('字', '細字', '세자', 1),
+('細', '細工', '세공', 0),
+('工', '細工', '세공', 1),
+('細', '細斷機', '세단기', 0),
+('斷', '細斷機', '세단기', 1),
+('機', '細斷機', '세단기', 2),
+('細', '細毛', '세모', 0),
+('毛', '細毛', '세모', 1),
+('細', '細管', '세관', 0),
+('管', '細管', '세관', 1),
+('細', '細胞', '세포', 0),
+('胞', '細胞', '세포', 1),
+('細', '細胞分裂', '세포분열', 0),
+('胞', '細胞分裂', '세포분열', 1),
+('分', '細胞分裂', '세포분열', 2),
+('裂', '細胞分裂', '세포분열', 3),
+('細', '細胞學', '세포학', 0),
+('胞', '細胞學', '세포학', 1),
+('學', '細胞學', '세포학', 2),
+('細', '細胞核', '세포핵', 0),
+('胞', '細胞核', '세포핵', 1),
+('核', '細胞核', '세포핵', 2),
+('細', '細胞膜', '세포막', 0),
+('胞', '細胞膜', '세포막', 1),
+('膜', '細胞膜', '세포막', 2),
+('細', '細胞質', '세포질', 0),
+('胞', '細胞質', '세포질', 1),
+('質', '細胞質', '세포질', 2),
+('細', '細菌', '세균', 0),
+('菌', '細菌', '세균', 1),
+('細', '細部', '세부', 0),
+('部', '細部', '세부', 1),
+('紳', '紳士', '신사', 0),
+('士', '紳士', '신사', 1),
+('紹', '紹介', '소개', 0),
+('介', '紹介', '소개', 1),
+('紺', '紺色', '감색', 0),
+('色', '紺色', '감색', 1),
+('終', '終了', '종료', 0),
+('了', '終了', '종료', 1),
+('終', '終夜燈', '종야등', 0),
+('夜', '終夜燈', '종야등', 1),
+('燈', '終夜燈', '종야등', 2),
+('終', '終始', '종시', 0),
+('始', '終始', '종시', 1),
+('終', '終局', '종국', 0),
+('局', '終局', '종국', 1),
+('終', '終日', '종일', 0),
+('日', '終日', '종일', 1),
+('終', '終止', '종지', 0),
+('止', '終止', '종지', 1),
+('終', '終止符', '종지부', 0),
+('止', '終止符', '종지부', 1),
+('符', '終止符', '종지부', 2),
+('終', '終熄', '종식', 0),
+('熄', '終熄', '종식', 1),
+('終', '終着', '종착', 0),
+('着', '終着', '종착', 1),
+('終', '終着', '중착', 0),
+('着', '終着', '중착', 1),
+('終', '終着驛', '종착역', 0),
+('着', '終着驛', '종착역', 1),
+('驛', '終着驛', '종착역', 2),
+('終', '終結', '종결', 0),
+('結', '終結', '종결', 1),
+('終', '終聲', '종성', 0),
+('聲', '終聲', '종성', 1),
+('終', '終點', '종점', 0),
+('點', '終點', '종점', 1),
+('組', '組', '조', 0),
+('組', '組合', '조합', 0),
+('合', '組合', '조합', 1),
+('組', '組合型', '조합형', 0),
+('合', '組合型', '조합형', 1),
+('型', '組合型', '조합형', 2),
+('組', '組成', '조성', 0),
+('成', '組成', '조성', 1),
+('組', '組暴', '조폭', 0),
+('暴', '組暴', '조폭', 1),
+('組', '組版', '조판', 0),
+('版', '組版', '조판', 1),
+('組', '組立', '조립', 0),
+('立', '組立', '조립', 1),
+('組', '組織', '조직', 0),
+('織', '組織', '조직', 1),
+('組', '組織學', '조직학', 0),
+('織', '組織學', '조직학', 1),
+('學', '組織學', '조직학', 2),
+('組', '組織暴力輩', '조직폭력배', 0),
+('織', '組織暴力輩', '조직폭력배', 1),
+('暴', '組織暴力輩', '조직폭력배', 2),
+('力', '組織暴力輩', '조직폭력배', 3),
+('輩', '組織暴力輩', '조직폭력배', 4),
+('組', '組織者', '조직자', 0),
+('織', '組織者', '조직자', 1),
+('者', '組織者', '조직자', 2),
+('組', '組長', '조장', 0),
+('長', '組長', '조장', 1),
+('組', '組閣', '조각', 0),
+('閣', '組閣', '조각', 1),
+('絆', '絆瘡膏', '반창고', 0),
+('瘡', '絆瘡膏', '반창고', 1),
+('膏', '絆瘡膏', '반창고', 2),
+('結', '結', '결', 0),
+('結', '結了', '결료', 0),
+('了', '結了', '결료', 1),
+('結', '結合', '결합', 0),
+('合', '結合', '결합', 1),
+('結', '結婚', '결혼', 0),
+('婚', '結婚', '결혼', 1),
+('結', '結婚式', '결혼식', 0),
+('婚', '結婚式', '결혼식', 1),
+('式', '結婚式', '결혼식', 2),
+('結', '結實', '결실', 0),
+('實', '結實', '결실', 1),
+('結', '結局', '결국', 0),
+('局', '結局', '결국', 1),
+('結', '結晶', '결정', 0),
+('晶', '結晶', '결정', 1),
+('結', '結晶化', '결정화', 0),
+('晶', '結晶化', '결정화', 1),
+('化', '結晶化', '결정화', 2),
+('結', '結晶水', '결정수', 0),
+('晶', '結晶水', '결정수', 1),
+('水', '結晶水', '결정수', 2),
+('結', '結末', '결말', 0),
+('末', '結末', '결말', 1),
+('結', '結束', '결속', 0),
+('束', '結束', '결속', 1),
+('結', '結果', '결과', 0),
+('果', '結果', '결과', 1),
+('結', '結果的', '결과적', 0),
+('果', '結果的', '결과적', 1),
+('的', '結果的', '결과적', 2),
+('結', '結核', '결핵', 0),
+('核', '結核', '결핵', 1),
+('結', '結構', '결구', 0),
+('構', '結構', '결구', 1),
+('結', '結氷', '결빙', 0),
+('氷', '結氷', '결빙', 1),
+('結', '結石', '결석', 0),
+('石', '結石', '결석', 1),
+('結', '結腸', '결장', 0),
+('腸', '結腸', '결장', 1),
+('結', '結膜炎', '결막염', 0),
+('膜', '結膜炎', '결막염', 1),
+('炎', '結膜炎', '결막염', 2),
+('結', '結託', '결탁', 0),
+('託', '結託', '결탁', 1),
+('結', '結論', '결론', 0),
+('論', '結論', '결론', 1),
+('結', '結跏趺坐', '결가부좌', 0),
+('跏', '結跏趺坐', '결가부좌', 1),
+('趺', '結跏趺坐', '결가부좌', 2),
+('坐', '結跏趺坐', '결가부좌', 3),
+('絕', '絕對', '절대', 0),
+('對', '絕對', '절대', 1),
+('絕', '絕望', '절망', 0),
+('望', '絕望', '절망', 1),
+('絞', '絞死', '교사', 0),
+('死', '絞死', '교사', 1),
+('絞', '絞殺', '교살', 0),
+('殺', '絞殺', '교살', 1),
+('絞', '絞首臺', '교수대', 0),
+('首', '絞首臺', '교수대', 1),
+('臺', '絞首臺', '교수대', 2),
+('絡', '絡蹄', '낙제', 0),
+('蹄', '絡蹄', '낙제', 1),
+('絢', '絢爛', '현란', 0),
+('爛', '絢爛', '현란', 1),
+('給', '給料', '급료', 0),
+('料', '給料', '급료', 1),
+('給', '給水', '급수', 0),
+('水', '給水', '급수', 1),
+('給', '給油', '급유', 0),
+('油', '給油', '급유', 1),
+('給', '給與', '급여', 0),
+('與', '給與', '급여', 1),
+('絨', '絨毛', '융모', 0),
+('毛', '絨毛', '융모', 1),
+('絨', '絨緞', '융단', 0),
+('緞', '絨緞', '융단', 1),
+('絨', '絨緞爆擊', '융단폭격', 0),
+('緞', '絨緞爆擊', '융단폭격', 1),
+('爆', '絨緞爆擊', '융단폭격', 2),
+('擊', '絨緞爆擊', '융단폭격', 3),
+('統', '統一', '통일', 0),
+('一', '統一', '통일', 1),
+('統', '統一案', '통일안', 0),
+('一', '統一案', '통일안', 1),
+('案', '統一案', '통일안', 2),
+('統', '統制', '통제', 0),
+('制', '統制', '통제', 1),
+('統', '統合', '통합', 0),
+('合', '統合', '통합', 1),
+('統', '統治', '통치', 0),
+('治', '統治', '통치', 1),
+('統', '統治者', '통치자', 0),
+('治', '統治者', '통치자', 1),
+('者', '統治者', '통치자', 2),
+('統', '統率', '통솔', 0),
+('率', '統率', '통솔', 1),
+('統', '統率者', '통솔자', 0),
+('率', '統率者', '통솔자', 1),
+('者', '統率者', '통솔자', 2),
+('統', '統計', '통계', 0),
+('計', '統計', '통계', 1),
+('統', '統計學', '통계학', 0),
+('計', '統計學', '통계학', 1),
+('學', '統計學', '통계학', 2),
+('統', '統語論', '통어론', 0),
+('語', '統語論', '통어론', 1),
+('論', '統語論', '통어론', 2),
+('統', '統辭論', '통사론', 0),
+('辭', '統辭論', '통사론', 1),
+('論', '統辭論', '통사론', 2),
+('絶', '絶交', '절교', 0),
+('交', '絶交', '절교', 1),
+('絶', '絶叫', '절규', 0),
+('叫', '絶叫', '절규', 1),
+('絶', '絶壁', '절벽', 0),
+('壁', '絶壁', '절벽', 1),
+('絶', '絶對', '절대', 0),
+('對', '絶對', '절대', 1),
+('絶', '絶對-', '절대로', 0),
+('對', '絶對-', '절대로', 1),
+('-', '絶對-', '절대로', 2),
+('絶', '絶對的', '절대적', 0),
+('對', '絶對的', '절대적', 1),
+('的', '絶對的', '절대적', 2),
+('絶', '絶對領域', '절대영역', 0),
+('對', '絶對領域', '절대영역', 1),
+('領', '絶對領域', '절대영역', 2),
+('域', '絶對領域', '절대영역', 3),
+('絶', '絶望', '절망', 0),
+('望', '絶望', '절망', 1),
+('絶', '絶頂', '절정', 0),
+('頂', '絶頂', '절정', 1),
+('絶', '絶食', '절식', 0),
+('食', '絶食', '절식', 1),
+('絹', '絹', '견', 0),
+('經', '經典', '경전', 0),
+('典', '經典', '경전', 1),
+('經', '經口', '경구', 0),
+('口', '經口', '경구', 1),
+('經', '經度', '경도', 0),
+('度', '經度', '경도', 1),
+('經', '經歷', '경력', 0),
+('歷', '經歷', '경력', 1),
+('經', '經濟', '갱제', 0),
+('濟', '經濟', '갱제', 1),
+('經', '經濟', '경제', 0),
+('濟', '經濟', '경제', 1),
+('經', '經濟力', '경제력', 0),
+('濟', '經濟力', '경제력', 1),
+('力', '經濟力', '경제력', 2),
+('經', '經濟學', '경제학', 0),
+('濟', '經濟學', '경제학', 1),
+('學', '經濟學', '경제학', 2),
+('經', '經濟的', '경제적', 0),
+('濟', '經濟的', '경제적', 1),
+('的', '經濟的', '경제적', 2),
+('經', '經濟科學', '경제과학', 0),
+('濟', '經濟科學', '경제과학', 1),
+('科', '經濟科學', '경제과학', 2),
+('學', '經濟科學', '경제과학', 3),
+('經', '經營', '경영', 0),
+('營', '經營', '경영', 1),
+('經', '經營者', '경영자', 0),
+('營', '經營者', '경영자', 1),
+('者', '經營者', '경영자', 2),
+('經', '經由', '경유', 0),
+('由', '經由', '경유', 1),
+('經', '經費', '경비', 0),
+('費', '經費', '경비', 1),
+('經', '經路', '경로', 0),
+('路', '經路', '경로', 1),
+('經', '經過', '경과', 0),
+('過', '經過', '경과', 1),
+('經', '經驗', '경험', 0),
+('驗', '經驗', '경험', 1),
+('經', '經驗値', '경험치', 0),
+('驗', '經驗値', '경험치', 1),
+('値', '經驗値', '경험치', 2),
+('經', '經驗論', '경험론', 0),
+('驗', '經驗論', '경험론', 1),
+('論', '經驗論', '경험론', 2),
+('綜', '綜合', '종합', 0),
+('合', '綜合', '종합', 1),
+('綠', '綠', '녹', 0),
+('綠', '綠化', '녹화', 0),
+('化', '綠化', '녹화', 1),
+('綠', '綠末', '녹말', 0),
+('末', '綠末', '녹말', 1),
+('綠', '綠色', '녹색', 0),
+('色', '綠色', '녹색', 1),
+('綠', '綠茶', '녹차', 0),
+('茶', '綠茶', '녹차', 1),
+('綠', '綠豆', '녹두', 0),
+('豆', '綠豆', '녹두', 1),
+('綠', '綠豆煎', '녹두전', 0),
+('豆', '綠豆煎', '녹두전', 1),
+('煎', '綠豆煎', '녹두전', 2),
+('綠', '綠釉', '녹유', 0),
+('釉', '綠釉', '녹유', 1),
+('維', '維持', '유지', 0),
+('持', '維持', '유지', 1),
+('維', '維新', '유신', 0),
+('新', '維新', '유신', 1),
+('綱', '綱', '강', 0),
+('綱', '綱要', '강요', 0),
+('要', '綱要', '강요', 1),
+('綱', '綱領', '강령', 0),
+('領', '綱領', '강령', 1),
+('網', '網', '망', 0),
+('網', '網市民', '망시민', 0),
+('市', '網市民', '망시민', 1),
+('民', '網市民', '망시민', 2),
+('網', '網羅', '망라', 0),
+('羅', '網羅', '망라', 1),
+('網', '網膜', '망막', 0),
+('膜', '網膜', '망막', 1),
+('綴', '綴字', '철자', 0),
+('字', '綴字', '철자', 1),
+('綴', '綴字法', '철자법', 0),
+('字', '綴字法', '철자법', 1),
+('法', '綴字法', '철자법', 2),
+('綺', '綺羅星', '기라성', 0),
+('羅', '綺羅星', '기라성', 1),
+('星', '綺羅星', '기라성', 2),
+('綻', '綻露', '탄로', 0),
+('露', '綻露', '탄로', 1),
+('綽', '綽約', '작약', 0),
+('約', '綽約', '작약', 1),
+('綿', '綿', '면', 0),
+('綿', '綿實油', '면실유', 0),
+('實', '綿實油', '면실유', 1),
+('油', '綿實油', '면실유', 2),
+('綿', '綿布', '면포', 0),
+('布', '綿布', '면포', 1),
+('綿', '綿棒', '면봉', 0),
+('棒', '綿棒', '면봉', 1),
+('綿', '綿火藥', '면화약', 0),
+('火', '綿火藥', '면화약', 1),
+('藥', '綿火藥', '면화약', 2),
+('綿', '綿絲', '면사', 0),
+('絲', '綿絲', '면사', 1),
+('綿', '綿羊', '면양', 0),
+('羊', '綿羊', '면양', 1),
+('綿', '綿製品', '면제품', 0),
+('製', '綿製品', '면제품', 1),
+('品', '綿製品', '면제품', 2),
+('緊', '緊張', '긴장', 0),
+('張', '緊張', '긴장', 1),
+('緊', '緊張感', '긴장감', 0),
+('張', '緊張感', '긴장감', 1),
+('感', '緊張感', '긴장감', 2),
+('緊', '緊急', '긴급', 0),
+('急', '緊急', '긴급', 1),
+('緊', '緊縮', '긴축', 0),
+('縮', '緊縮', '긴축', 1),
+('緊', '緊要', '긴요', 0),
+('要', '緊要', '긴요', 1),
+('緊', '緊迫', '긴박', 0),
+('迫', '緊迫', '긴박', 1),
+('緋', '緋緞', '비단', 0),
+('緞', '緋緞', '비단', 1),
+('緖', '緖戰', '서전', 0),
+('戰', '緖戰', '서전', 1),
+('緘', '緘口症', '함구증', 0),
+('口', '緘口症', '함구증', 1),
+('症', '緘口症', '함구증', 2),
+('緘', '緘默症', '함묵증', 0),
+('默', '緘默症', '함묵증', 1),
+('症', '緘默症', '함묵증', 2),
+('線', '線', '선', 0),
+('線', '線審', '선심', 0),
+('審', '線審', '선심', 1),
+('線', '線形動物', '선형동물', 0),
+('形', '線形動物', '선형동물', 1),
+('動', '線形動物', '선형동물', 2),
+('物', '線形動物', '선형동물', 3),
+('線', '線畫', '선화', 0),
+('畫', '線畫', '선화', 1),
+('線', '線路', '선로', 0),
+('路', '線路', '선로', 1),
+('締', '締結', '체결', 0),
+('結', '締結', '체결', 1),
+('緣', '緣分', '연분', 0),
+('分', '緣分', '연분', 1),
+('緣', '緣石', '연석', 0),
+('石', '緣石', '연석', 1),
+('緣', '緣起', '연기', 0),
+('起', '緣起', '연기', 1),
+('編', '編入', '편입', 0),
+('入', '編入', '편입', 1),
+('編', '編制', '편제', 0),
+('制', '編制', '편제', 1),
+('編', '編年', '편년', 0),
+('年', '編年', '편년', 1),
+('編', '編成', '편성', 0),
+('成', '編成', '편성', 1),
+('編', '編曲', '편곡', 0),
+('曲', '編曲', '편곡', 1),
+('編', '編物', '편물', 0),
+('物', '編物', '편물', 1),
+('編', '編磬', '편경', 0),
+('磬', '編磬', '편경', 1),
+('編', '編者', '편자', 0),
+('者', '編者', '편자', 1),
+('編', '編輯', '편집', 0),
+('輯', '編輯', '편집', 1),
+('編', '編輯人', '편집인', 0),
+('輯', '編輯人', '편집인', 1),
+('人', '編輯人', '편집인', 2),
+('編', '編輯機', '편집기', 0),
+('輯', '編輯機', '편집기', 1),
+('機', '編輯機', '편집기', 2),
+('編', '編輯者', '편집자', 0),
+('輯', '編輯者', '편집자', 1),
+('者', '編輯者', '편집자', 2),
+('編', '編輯長', '편집장', 0),
+('輯', '編輯長', '편집장', 1),
+('長', '編輯長', '편집장', 2),
+('編', '編鐘', '편종', 0),
+('鐘', '編鐘', '편종', 1),
+('編', '編隊', '편대', 0),
+('隊', '編隊', '편대', 1),
+('緩', '緩和', '완화', 0),
+('和', '緩和', '완화', 1),
+('緩', '緩行', '완행', 0),
+('行', '緩行', '완행', 1),
+('緩', '緩衝器', '완충기', 0),
+('衝', '緩衝器', '완충기', 1),
+('器', '緩衝器', '완충기', 2),
+('緩', '緩解', '완해', 0),
+('解', '緩解', '완해', 1),
+('緬', '緬甸', '면전', 0),
+('甸', '緬甸', '면전', 1),
+('緬', '緬羊', '면양', 0),
+('羊', '緬羊', '면양', 1),
+('緯', '緯', '위', 0),
+('緯', '緯度', '위도', 0),
+('度', '緯度', '위도', 1),
+('緯', '緯線', '위선', 0),
+('線', '緯線', '위선', 1),
+('緯', '緯車', '위거', 0),
+('車', '緯車', '위거', 1),
+('練', '練習', '련습', 0),
+('習', '練習', '련습', 1),
+('練', '練習', '연습', 0),
+('習', '練習', '연습', 1),
+('練', '練習帳', '연습장', 0),
+('習', '練習帳', '연습장', 1),
+('帳', '練習帳', '연습장', 2),
+('練', '練習曲', '연습곡', 0),
+('習', '練習曲', '연습곡', 1),
+('曲', '練習曲', '연습곡', 2),
+('練', '練肉', '연육', 0),
+('肉', '練肉', '연육', 1),
+('縊', '縊死', '액사', 0),
+('死', '縊死', '액사', 1),
+('縣', '縣', '현', 0),
+('縣', '縣人', '현인', 0),
+('人', '縣人', '현인', 1),
+('縫', '縫合', '봉합', 0),
+('合', '縫合', '봉합', 1),
+('縫', '縫製', '봉제', 0),
+('製', '縫製', '봉제', 1),
+('縮', '縮地法', '축지법', 0),
+('地', '縮地法', '축지법', 1),
+('法', '縮地法', '축지법', 2),
+('縮', '縮小', '축소', 0),
+('小', '縮小', '축소', 1),
+('縮', '縮尺', '축척', 0),
+('尺', '縮尺', '축척', 1),
+('縮', '縮約', '축약', 0),
+('約', '縮約', '축약', 1),
+('縱', '縱列', '종렬', 0),
+('列', '縱列', '종렬', 1),
+('縱', '縱橫', '종횡', 0),
+('橫', '縱橫', '종횡', 1),
+('縱', '縱波', '종파', 0),
+('波', '縱波', '종파', 1),
+('縱', '縱的', '종적', 0),
+('的', '縱的', '종적', 1),
+('縱', '縱陣', '종진', 0),
+('陣', '縱陣', '종진', 1),
+('縱', '縱隊', '종대', 0),
+('隊', '縱隊', '종대', 1),
+('總', '總', '총', 0),
+('總', '總則', '총칙', 0),
+('則', '總則', '총칙', 1),
+('總', '總合', '총합', 0),
+('合', '總合', '총합', 1),
+('總', '總和', '총화', 0),
+('和', '總和', '총화', 1),
+('總', '總大主敎', '총대주교', 0),
+('大', '總大主敎', '총대주교', 1),
+('主', '總大主敎', '총대주교', 2),
+('敎', '總大主敎', '총대주교', 3),
+('總', '總支配人', '총지배인', 0),
+('支', '總支配人', '총지배인', 1),
+('配', '總支配人', '총지배인', 2),
+('人', '總支配人', '총지배인', 3),
+('總', '總書記', '총서기', 0),
+('書', '總書記', '총서기', 1),
+('記', '總書記', '총서기', 2),
+('總', '總會', '총회', 0),
+('會', '總會', '총회', 1),
+('總', '總理', '총리', 0),
+('理', '總理', '총리', 1),
+('總', '總督府', '총독부', 0),
+('督', '總督府', '총독부', 1),
+('府', '總督府', '총독부', 2),
+('總', '總祕書', '총비서', 0),
+('祕', '總祕書', '총비서', 1),
+('書', '總祕書', '총비서', 2),
+('總', '總稱', '총칭', 0),
+('稱', '總稱', '총칭', 1),
+('總', '總統', '총통', 0),
+('統', '總統', '총통', 1),
+('總', '總罷業', '총파업', 0),
+('罷', '總罷業', '총파업', 1),
+('業', '總罷業', '총파업', 2),
+('總', '總裁', '총재', 0),
+('裁', '總裁', '총재', 1),
+('總', '總角', '총각', 0),
+('角', '總角', '총각', 1),
+('總', '總角김치', '총각김치', 0),
+('角', '總角김치', '총각김치', 1),
+('김', '總角김치', '총각김치', 2),
+('치', '總角김치', '총각김치', 3),
+('總', '總選擧', '총선거', 0),
+('選', '總選擧', '총선거', 1),
+('擧', '總選擧', '총선거', 2),
+('總', '總長', '총장', 0),
+('長', '總長', '총장', 1),
+('總', '總領事', '총영사', 0),
+('領', '總領事', '총영사', 1),
+('事', '總領事', '총영사', 2),
+('總', '總領事館', '총영사관', 0),
+('領', '總領事館', '총영사관', 1),
+('事', '總領事館', '총영사관', 2),
+('館', '總領事館', '총영사관', 3),
+('總', '總體的', '총체적', 0),
+('體', '總體的', '총체적', 1),
+('的', '總體的', '총체적', 2),
+('繁', '繁忙', '번망', 0),
+('忙', '繁忙', '번망', 1),
+('繁', '繁昌', '번창', 0),
+('昌', '繁昌', '번창', 1),
+('繁', '繁柯', '번가', 0),
+('柯', '繁柯', '번가', 1),
+('繁', '繁榮', '번영', 0),
+('榮', '繁榮', '번영', 1),
+('繁', '繁殖', '번식', 0),
+('殖', '繁殖', '번식', 1),
+('繁', '繁盛', '번성', 0),
+('盛', '繁盛', '번성', 1),
+('繁', '繁苛', '번가', 0),
+('苛', '繁苛', '번가', 1),
+('繁', '繁華', '번화', 0),
+('華', '繁華', '번화', 1),
+('繁', '繁華街', '번화가', 0),
+('華', '繁華街', '번화가', 1),
+('街', '繁華街', '번화가', 2),
+('繁', '繁體', '번체', 0),
+('體', '繁體', '번체', 1),
+('繁', '繁體字', '번체자', 0),
+('體', '繁體字', '번체자', 1),
+('字', '繁體字', '번체자', 2),
+('繃', '繃帶', '붕대', 0),
+('帶', '繃帶', '붕대', 1),
+('織', '織機', '직기', 0),
+('機', '織機', '직기', 1),
+('織', '織物', '직물', 0),
+('物', '織物', '직물', 1),
+('繡', '繡', '수', 0),
+('繪', '繪文字', '회문자', 0),
+('文', '繪文字', '회문자', 1),
+('字', '繪文字', '회문자', 2),
+('繪', '繪畵', '회화', 0),
+('畵', '繪畵', '회화', 1),
+('繫', '繫辭', '계사', 0),
+('辭', '繫辭', '계사', 1),
+('繼', '繼承', '계승', 0),
+('承', '繼承', '계승', 1),
+('繼', '繼承者', '계승자', 0),
+('承', '繼承者', '계승자', 1),
+('者', '繼承者', '계승자', 2),
+('繼', '繼投', '계투', 0),
+('投', '繼投', '계투', 1),
+('繼', '繼母', '계모', 0),
+('母', '繼母', '계모', 1),
+('繼', '繼父', '계부', 0),
+('父', '繼父', '계부', 1),
+('繼', '繼續', '계속', 0),
+('續', '繼續', '계속', 1),
+('繼', '繼鐵', '계철', 0),
+('鐵', '繼鐵', '계철', 1),
+('繼', '繼電氣', '계전기', 0),
+('電', '繼電氣', '계전기', 1),
+('氣', '繼電氣', '계전기', 2),
+('續', '續編', '속편', 0),
+('編', '續編', '속편', 1),
+('續', '續續', '속속', 0),
+('續', '續續', '속속', 1),
+('纖', '纖維', '섬유', 0),
+('維', '纖維', '섬유', 1),
+('纖', '纖維素', '섬유소', 0),
+('維', '纖維素', '섬유소', 1),
+('素', '纖維素', '섬유소', 2),
+('纖', '纖纖玉手', '섬섬옥수', 0),
+('纖', '纖纖玉手', '섬섬옥수', 1),
+('玉', '纖纖玉手', '섬섬옥수', 2),
+('手', '纖纖玉手', '섬섬옥수', 3),
+('结', '结晶水', '결정수', 0),
+('晶', '结晶水', '결정수', 1),
+('水', '结晶水', '결정수', 2),
+('缸', '缸아리', '항아리', 0),
+('아', '缸아리', '항아리', 1),
+('리', '缸아리', '항아리', 2),
+('缺', '缺乏', '결핍', 0),
+('乏', '缺乏', '결핍', 1),
+('缺', '缺如', '결여', 0),
+('如', '缺如', '결여', 1),
+('缺', '缺席', '결석', 0),
+('席', '缺席', '결석', 1),
+('缺', '缺損', '결손', 0),
+('損', '缺損', '결손', 1),
+('缺', '缺陷', '결함', 0),
+('陷', '缺陷', '결함', 1),
+('缺', '缺點', '결점', 0),
+('點', '缺點', '결점', 1),
+('罔', '罔極', '망극', 0),
+('極', '罔極', '망극', 1),
+('罪', '罪', '죄', 0),
+('罪', '罪人', '죄인', 0),
+('人', '罪人', '죄인', 1),
+('罪', '罪囚', '죄수', 0),
+('囚', '罪囚', '죄수', 1),
+('罪', '罪囚服', '죄수복', 0),
+('囚', '罪囚服', '죄수복', 1),
+('服', '罪囚服', '죄수복', 2),
+('罪', '罪悚', '죄송', 0),
+('悚', '罪悚', '죄송', 1),
+('罪', '罪惡', '죄악', 0),
+('惡', '罪惡', '죄악', 1),
+('罪', '罪意識', '죄의식', 0),
+('意', '罪意識', '죄의식', 1),
+('識', '罪意識', '죄의식', 2),
+('罪', '罪業', '죄업', 0),
+('業', '罪業', '죄업', 1),
+('罪', '罪累', '죄루', 0),
+('累', '罪累', '죄루', 1),
+('罪', '罪責感', '죄책감', 0),
+('責', '罪責感', '죄책감', 1),
+('感', '罪責感', '죄책감', 2),
+('罫', '罫線', '괘선', 0),
+('線', '罫線', '괘선', 1),
+('置', '置換', '치환', 0),
+('換', '置換', '치환', 1),
+('罰', '罰', '벌', 0),
+('罰', '罰金', '벌금', 0),
+('金', '罰金', '벌금', 1),
+('罰', '罰金', '벌금', 0),
+('金', '罰金', '벌금', 1),
+('署', '署', '서', 0),
+('署', '署名', '서명', 0),
+('名', '署名', '서명', 1),
+('署', '署理', '서리', 0),
+('理', '署理', '서리', 1),
+('罵', '罵倒', '매도', 0),
+('倒', '罵倒', '매도', 1),
+('罷', '罷業', '파업', 0),
+('業', '罷業', '파업', 1),
+('罷', '罷業破壞者', '파업파괴자', 0),
+('業', '罷業破壞者', '파업파괴자', 1),
+('破', '罷業破壞者', '파업파괴자', 2),
+('壞', '罷業破壞者', '파업파괴자', 3),
+('者', '罷業破壞者', '파업파괴자', 4),
+('罹', '罹災民', '이재민', 0),
+('災', '罹災民', '이재민', 1),
+('民', '罹災民', '이재민', 2),
+('羅', '羅先', '나선', 0),
+('先', '羅先', '나선', 1),
+('羅', '羅先', '라선', 0),
+('先', '羅先', '라선', 1),
+('羅', '羅先特別市', '라선특별시', 0),
+('先', '羅先特別市', '라선특별시', 1),
+('特', '羅先特別市', '라선특별시', 2),
+('別', '羅先特別市', '라선특별시', 3),
+('市', '羅先特別市', '라선특별시', 4),
+('羅', '羅列', '나열', 0),
+('列', '羅列', '나열', 1),
+('羅', '羅列', '라렬', 0),
+('列', '羅列', '라렬', 1),
+('羅', '羅刹', '나찰', 0),
+('刹', '羅刹', '나찰', 1),
+('羅', '羅刹', '라찰', 0),
+('刹', '羅刹', '라찰', 1),
+('羅', '羅城', '나성', 0),
+('城', '羅城', '나성', 1),
+('羅', '羅漢', '나한', 0),
+('漢', '羅漢', '나한', 1),
+('羅', '羅漢', '라한', 0),
+('漢', '羅漢', '라한', 1),
+('羅', '羅甸', '나전', 0),
+('甸', '羅甸', '나전', 1),
+('羅', '羅針盤', '나침반', 0),
+('針', '羅針盤', '나침반', 1),
+('盤', '羅針盤', '나침반', 2),
+('羅', '羅針盤', '라침반', 0),
+('針', '羅針盤', '라침반', 1),
+('盤', '羅針盤', '라침반', 2),
+('羅', '羅馬', '나마', 0),
+('馬', '羅馬', '나마', 1),
+('羊', '羊', '양', 0),
+('羊', '羊乳', '양유', 0),
+('乳', '羊乳', '양유', 1),
+('羊', '羊毛', '양모', 0),
+('毛', '羊毛', '양모', 1),
+('羊', '羊毛脂', '양모지', 0),
+('毛', '羊毛脂', '양모지', 1),
+('脂', '羊毛脂', '양모지', 2),
+('羊', '羊水', '양수', 0),
+('水', '羊水', '양수', 1),
+('羊', '羊皮紙', '양피지', 0),
+('皮', '羊皮紙', '양피지', 1),
+('紙', '羊皮紙', '양피지', 2),
+('羊', '羊膜', '양막', 0),
+('膜', '羊膜', '양막', 1),
+('羌', '羌活', '강활', 0),
+('活', '羌活', '강활', 1),
+('美', '美', '미', 0),
+('美', '美人', '미인', 0),
+('人', '美人', '미인', 1),
+('美', '美人計', '미인계', 0),
+('人', '美人計', '미인계', 1),
+('計', '美人計', '미인계', 2),
+('美', '美化', '미화', 0),
+('化', '美化', '미화', 1),
+('美', '美合衆國', '미합중국', 0),
+('合', '美合衆國', '미합중국', 1),
+('衆', '美合衆國', '미합중국', 2),
+('國', '美合衆國', '미합중국', 3),
+('美', '美味', '미미', 0),
+('味', '美味', '미미', 1),
+('美', '美國', '미국', 0),
+('國', '美國', '미국', 1),
+('美', '美國人', '미국인', 0),
+('國', '美國人', '미국인', 1),
+('人', '美國人', '미국인', 2),
+('美', '美國化', '미국화', 0),
+('國', '美國化', '미국화', 1),
+('化', '美國化', '미국화', 2),
+('美', '美大', '미대', 0),
+('大', '美大', '미대', 1),
+('美', '美女', '미녀', 0),
+('女', '美女', '미녀', 1),
+('美', '美學', '미학', 0),
+('學', '美學', '미학', 1),
+('美', '美容', '미용', 0),
+('容', '美容', '미용', 1),
+('美', '美容室', '미용실', 0),
+('容', '美容室', '미용실', 1),
+('室', '美容室', '미용실', 2),
+('美', '美容師', '미용사', 0),
+('容', '美容師', '미용사', 1),
+('師', '美容師', '미용사', 2),
+('美', '美容院', '미용원', 0),
+('容', '美容院', '미용원', 1),
+('院', '美容院', '미용원', 2),
+('美', '美少女', '미소녀', 0),
+('少', '美少女', '미소녀', 1),
+('女', '美少女', '미소녀', 2),
+('美', '美少年', '미소년', 0),
+('少', '美少年', '미소년', 1),
+('年', '美少年', '미소년', 2),
+('美', '美帝', '미제', 0),
+('帝', '美帝', '미제', 1),
+('美', '美式蹴球', '미식축구', 0),
+('式', '美式蹴球', '미식축구', 1),
+('蹴', '美式蹴球', '미식축구', 2),
+('球', '美式蹴球', '미식축구', 3),
+('美', '美德', '미덕', 0),
+('德', '美德', '미덕', 1),
+('美', '美洲', '미주', 0),
+('洲', '美洲', '미주', 1),
+('美', '美男', '미남', 0),
+('男', '美男', '미남', 1),
+('美', '美男子', '미남자', 0),
+('男', '美男子', '미남자', 1),
+('子', '美男子', '미남자', 2),
+('美', '美的', '미적', 0),
+('的', '美的', '미적', 1),
+('美', '美童', '미동', 0),
+('童', '美童', '미동', 1),
+('美', '美粧院', '미장원', 0),
+('粧', '美粧院', '미장원', 1),
+('院', '美粧院', '미장원', 2),
+('美', '美聲', '미성', 0),
+('聲', '美聲', '미성', 1),
+('美', '美術', '미술', 0),
+('術', '美術', '미술', 1),
+('美', '美術史', '미술사', 0),
+('術', '美術史', '미술사', 1),
+('史', '美術史', '미술사', 2),
+('美', '美術品', '미술품', 0),
+('術', '美術品', '미술품', 1),
+('品', '美術品', '미술품', 2),
+('美', '美術大學', '미술대학', 0),
+('術', '美術大學', '미술대학', 1),
+('大', '美術大學', '미술대학', 2),
+('學', '美術大學', '미술대학', 3),
+('美', '美術館', '미술관', 0),
+('術', '美術館', '미술관', 1),
+('館', '美術館', '미술관', 2),
+('美', '美製', '미제', 0),
+('製', '美製', '미제', 1),
+('美', '美語', '미어', 0),
+('語', '美語', '미어', 1),
+('美', '美貌', '미모', 0),
+('貌', '美貌', '미모', 1),
+('美', '美貨', '미화', 0),
+('貨', '美貨', '미화', 1),
+('美', '美軍', '미군', 0),
+('軍', '美軍', '미군', 1),
+('美', '美辭學', '미사학', 0),
+('辭', '美辭學', '미사학', 1),
+('學', '美辭學', '미사학', 2),
+('美', '美辭麗句', '미사여구', 0),
+('辭', '美辭麗句', '미사여구', 1),
+('麗', '美辭麗句', '미사여구', 2),
+('句', '美辭麗句', '미사여구', 3),
+('美', '美風', '미풍', 0),
+('風', '美風', '미풍', 1),
+('美', '美點', '미점', 0),
+('點', '美點', '미점', 1),
+('羘', '羘곱창', '양곱창', 0),
+('곱', '羘곱창', '양곱창', 1),
+('창', '羘곱창', '양곱창', 2),
+('羚', '羚羊', '영양', 0),
+('羊', '羚羊', '영양', 1),
+('羞', '羞恥', '수치', 0),
+('恥', '羞恥', '수치', 1),
+('羞', '羞明', '수명', 0),
+('明', '羞明', '수명', 1),
+('群', '群島', '군도', 0),
+('島', '群島', '군도', 1),
+('群', '群棲', '군서', 0),
+('棲', '群棲', '군서', 1),
+('群', '群民', '군민', 0),
+('民', '群民', '군민', 1),
+('群', '群生', '군생', 0),
+('生', '群生', '군생', 1),
+('群', '群衆', '군중', 0),
+('衆', '群衆', '군중', 1),
+('群', '群衆歌謠', '군중가요', 0),
+('衆', '群衆歌謠', '군중가요', 1),
+('歌', '群衆歌謠', '군중가요', 2),
+('謠', '群衆歌謠', '군중가요', 3),
+('群', '群集', '군집', 0),
+('集', '群集', '군집', 1),
+('群', '群靑', '군청', 0),
+('靑', '群靑', '군청', 1),
+('群', '群體', '군체', 0),
+('體', '群體', '군체', 1),
+('義', '義', '의', 0),
+('義', '義人', '의인', 0),
+('人', '義人', '의인', 1),
+('義', '義俠心', '의협심', 0),
+('俠', '義俠心', '의협심', 1),
+('心', '義俠心', '의협심', 2),
+('義', '義兄弟', '의형제', 0),
+('兄', '義兄弟', '의형제', 1),
+('弟', '義兄弟', '의형제', 2),
+('義', '義勇', '의용', 0),
+('勇', '義勇', '의용', 1),
+('義', '義勇兵', '의용병', 0),
+('勇', '義勇兵', '의용병', 1),
+('兵', '義勇兵', '의용병', 2),
+('義', '義勇艦隊', '의용함대', 0),
+('勇', '義勇艦隊', '의용함대', 1),
+('艦', '義勇艦隊', '의용함대', 2),
+('隊', '義勇艦隊', '의용함대', 3),
+('義', '義勇軍', '의용군', 0),
+('勇', '義勇軍', '의용군', 1),
+('軍', '義勇軍', '의용군', 2),
+('義', '義務', '의무', 0),
+('務', '義務', '의무', 1),
+('義', '義士', '의사', 0),
+('士', '義士', '의사', 1),
+('義', '義憤', '의분', 0),
+('憤', '義憤', '의분', 1),
+('義', '義捐金', '의연금', 0),
+('捐', '義捐金', '의연금', 1),
+('金', '義捐金', '의연금', 2),
+('義', '義母', '의모', 0),
+('母', '義母', '의모', 1),
+('義', '義烈團', '의열단', 0),
+('烈', '義烈團', '의열단', 1),
+('團', '義烈團', '의열단', 2),
+('義', '義父', '의부', 0),
+('父', '義父', '의부', 1),
+('義', '義理', '의리', 0),
+('理', '義理', '의리', 1),
+('羯', '羯鼓', '갈고', 0),
+('鼓', '羯鼓', '갈고', 1),
+('羽', '羽', '우', 0),
+('羽', '羽毛', '우모', 0),
+('毛', '羽毛', '우모', 1),
+('羽', '羽緞', '우단', 0),
+('緞', '羽緞', '우단', 1),
+('羿', '羿', '예', 0),
+('翌', '翌年', '익년', 0),
+('年', '翌年', '익년', 1),
+('翌', '翌日', '익일', 0),
+('日', '翌日', '익일', 1),
+('翌', '翌月', '익월', 0),
+('月', '翌月', '익월', 1),
+('習', '習作', '습작', 0),
+('作', '習作', '습작', 1),
+('習', '習俗', '습속', 0),
+('俗', '習俗', '습속', 1),
+('習', '習字', '습자', 0),
+('字', '習字', '습자', 1),
+('習', '習得', '습득', 0),
+('得', '習得', '습득', 1),
+('習', '習得力', '습득력', 0),
+('得', '習得力', '습득력', 1),
+('力', '習得力', '습득력', 2),
+('習', '習性', '습성', 0),
+('性', '習性', '습성', 1),
+('習', '習慣', '습관', 0),
+('慣', '習慣', '습관', 1),
+('習', '習慣的', '습관적', 0),
+('慣', '習慣的', '습관적', 1),
+('的', '習慣的', '습관적', 2),
+('習', '習知', '습지', 0),
+('知', '習知', '습지', 1),
+('翡', '翡翠', '비취', 0),
+('翠', '翡翠', '비취', 1),
+('翰', '翰林', '한림', 0),
+('林', '翰林', '한림', 1),
+('翰', '翰林院', '한림원', 0),
+('林', '翰林院', '한림원', 1),
+('院', '翰林院', '한림원', 2),
+('翻', '翻譯', '번역', 0),
+('譯', '翻譯', '번역', 1),
+('翻', '翻譯借用', '번역차용', 0),
+('譯', '翻譯借用', '번역차용', 1),
+('借', '翻譯借用', '번역차용', 2),
+('用', '翻譯借用', '번역차용', 3),
+('翼', '翼龍', '익룡', 0),
+('龍', '翼龍', '익룡', 1),
+('老', '老人', '노인', 0),
+('人', '老人', '노인', 1),
+('老', '老人學', '노인학', 0),
+('人', '老人學', '노인학', 1),
+('學', '老人學', '노인학', 2),
+('老', '老人病學', '노인병학', 0),
+('人', '老人病學', '노인병학', 1),
+('病', '老人病學', '노인병학', 2),
+('學', '老人病學', '노인병학', 3),
+('老', '老兵', '노병', 0),
+('兵', '老兵', '노병', 1),
+('老', '老兵', '로병', 0),
+('兵', '老兵', '로병', 1),
+('老', '老化', '노화', 0),
+('化', '老化', '노화', 1),
+('老', '老妄', '노망', 0),
+('妄', '老妄', '노망', 1),
+('老', '老妄', '로망', 0),
+('妄', '老妄', '로망', 1),
+('老', '老婆', '노파', 0),
+('婆', '老婆', '노파', 1),
+('老', '老婆心', '노파심', 0),
+('婆', '老婆心', '노파심', 1),
+('心', '老婆心', '노파심', 2),
+('老', '老婦人', '노부인', 0),
+('婦', '老婦人', '노부인', 1),
+('人', '老婦人', '노부인', 2),
+('老', '老宅', '노댁', 0),
+('宅', '老宅', '노댁', 1),
+('老', '老師', '노사', 0),
+('師', '老師', '노사', 1),
+('老', '老師', '로사', 0),
+('師', '老師', '로사', 1),
+('老', '老年', '노년', 0),
+('年', '老年', '노년', 1),
+('老', '老年醫學', '노인의학', 0),
+('年', '老年醫學', '노인의학', 1),
+('醫', '老年醫學', '노인의학', 2),
+('學', '老年醫學', '노인의학', 3),
+('老', '老患', '노환', 0),
+('患', '老患', '노환', 1),
+('老', '老朽', '노후', 0),
+('朽', '老朽', '노후', 1),
+('老', '老死', '노사', 0),
+('死', '老死', '노사', 1),
+('老', '老熟', '노숙', 0),
+('熟', '老熟', '노숙', 1),
+('老', '老爺', '노야', 0),
+('爺', '老爺', '노야', 1),
+('老', '老獪', '노회', 0),
+('獪', '老獪', '노회', 1),
+('老', '老眼', '노안', 0),
+('眼', '老眼', '노안', 1),
+('老', '老眼', '로안', 0),
+('眼', '老眼', '로안', 1),
+('老', '老練者', '노련자', 0),
+('練', '老練者', '노련자', 1),
+('者', '老練者', '노련자', 2),
+('老', '老處女', '노처녀', 0),
+('處', '老處女', '노처녀', 1),
+('女', '老處女', '노처녀', 2),
+('老', '老處女', '로처녀', 0),
+('處', '老處女', '로처녀', 1),
+('女', '老處女', '로처녀', 2),
+('老', '老衰', '노쇠', 0),
+('衰', '老衰', '노쇠', 1),
+('老', '老顔', '노안', 0),
+('顔', '老顔', '노안', 1),
+('考', '考古學', '고고학', 0),
+('古', '考古學', '고고학', 1),
+('學', '考古學', '고고학', 2),
+('考', '考妣', '고비', 0),
+('妣', '考妣', '고비', 1),
+('考', '考察', '고찰', 0),
+('察', '考察', '고찰', 1),
+('考', '考慮', '고려', 0),
+('慮', '考慮', '고려', 1),
+('考', '考査', '고사', 0),
+('査', '考査', '고사', 1),
+('考', '考案', '고안', 0),
+('案', '考案', '고안', 1),
+('考', '考試', '고시', 0),
+('試', '考試', '고시', 1),
+('考', '考試院', '고시원', 0),
+('試', '考試院', '고시원', 1),
+('院', '考試院', '고시원', 2),
+('者', '者', '자', 0),
+('耐', '耐久性', '내구성', 0),
+('久', '耐久性', '내구성', 1),
+('性', '耐久性', '내구성', 2),
+('耐', '耐性', '내성', 0),
+('性', '耐性', '내성', 1),
+('耐', '耐用', '내용', 0),
+('用', '耐用', '내용', 1),
+('耕', '耕作', '경작', 0),
+('作', '耕作', '경작', 1),
+('耕', '耕作者', '경작자', 0),
+('作', '耕作者', '경작자', 1),
+('者', '耕作者', '경작자', 2),
+('耕', '耕耘', '경운', 0),
+('耘', '耕耘', '경운', 1),
+('耕', '耕耘機', '경운기', 0),
+('耘', '耕耘機', '경운기', 1),
+('機', '耕耘機', '경운기', 2),
+('耳', '耳垂', '이수', 0),
+('垂', '耳垂', '이수', 1),
+('耳', '耳漏', '이루', 0),
+('漏', '耳漏', '이루', 1),
+('耳', '耳痛', '이통', 0),
+('痛', '耳痛', '이통', 1),
+('耳', '耳目口鼻', '이목구비', 0),
+('目', '耳目口鼻', '이목구비', 1),
+('口', '耳目口鼻', '이목구비', 2),
+('鼻', '耳目口鼻', '이목구비', 3),
+('耳', '耳聾', '이롱', 0),
+('聾', '耳聾', '이롱', 1),
+('耳', '耳鳴', '이명', 0),
+('鳴', '耳鳴', '이명', 1),
+('耽', '耽溺', '탐닉', 0),
+('溺', '耽溺', '탐닉', 1),
+('耽', '耽羅', '탐라', 0),
+('羅', '耽羅', '탐라', 1),
+('聖', '聖', '성', 0),
+('聖', '聖下', '성하', 0),
+('下', '聖下', '성하', 1),
+('聖', '聖事', '성사', 0),
+('事', '聖事', '성사', 1),
+('聖', '聖人', '성인', 0),
+('人', '聖人', '성인', 1),
+('聖', '聖像', '성상', 0),
+('像', '聖像', '성상', 1),
+('聖', '聖光', '성광', 0),
+('光', '聖光', '성광', 1),
+('聖', '聖典', '성전', 0),
+('典', '聖典', '성전', 1),
+('聖', '聖君', '성군', 0),
+('君', '聖君', '성군', 1),
+('聖', '聖地', '성지', 0),
+('地', '聖地', '성지', 1),
+('聖', '聖堂', '성당', 0),
+('堂', '聖堂', '성당', 1),
+('聖', '聖女', '성녀', 0),
+('女', '聖女', '성녀', 1),
+('聖', '聖子', '성자', 0),
+('子', '聖子', '성자', 1),
+('聖', '聖德', '성덕', 0),
+('德', '聖德', '성덕', 1),
+('聖', '聖恩', '성은', 0),
+('恩', '聖恩', '성은', 1),
+('聖', '聖戰士', '성전사', 0),
+('戰', '聖戰士', '성전사', 1),
+('士', '聖戰士', '성전사', 2),
+('聖', '聖書', '성서', 0),
+('書', '聖書', '성서', 1),
+('聖', '聖歌', '성가', 0),
+('歌', '聖歌', '성가', 1),
+('聖', '聖殿', '성전', 0),
+('殿', '聖殿', '성전', 1),
+('聖', '聖母', '성모', 0),
+('母', '聖母', '성모', 1),
+('聖', '聖水', '성수', 0),
+('水', '聖水', '성수', 1),
+('聖', '聖爵', '성작', 0),
+('爵', '聖爵', '성작', 1),
+('聖', '聖父', '성부', 0),
+('父', '聖父', '성부', 1),
+('聖', '聖神', '성신', 0),
+('神', '聖神', '성신', 1),
+('聖', '聖經', '성경', 0),
+('經', '聖經', '성경', 1),
+('聖', '聖職', '성직', 0),
+('職', '聖職', '성직', 1),
+('聖', '聖職者', '성직자', 0),
+('職', '聖職者', '성직자', 1),
+('者', '聖職者', '성직자', 2),
+('聖', '聖讀', '성독', 0),
+('讀', '聖讀', '성독', 1),
+('聖', '聖餐', '성찬', 0),
+('餐', '聖餐', '성찬', 1),
+('聖', '聖體', '성체', 0),
+('體', '聖體', '성체', 1),
+('聖', '聖體聖事', '성체성사', 0),
+('體', '聖體聖事', '성체성사', 1),
+('聖', '聖體聖事', '성체성사', 2),
+('事', '聖體聖事', '성체성사', 3),
+('聞', '聞一知十', '문일지십', 0),
+('一', '聞一知十', '문일지십', 1),
+('知', '聞一知十', '문일지십', 2),
+('十', '聞一知十', '문일지십', 3),
+('聞', '聞慶', '문경', 0),
+('慶', '聞慶', '문경', 1),
+('聯', '聯合', '련합', 0),
+('合', '聯合', '련합', 1),
+('聯', '聯合', '연합', 0),
+('合', '聯合', '연합', 1),
+('聯', '聯合 王國', '련합 왕국', 0),
+('合', '聯合 王國', '련합 왕국', 1),
+('王', '聯合 王國', '련합 왕국', 3),
+('國', '聯合 王國', '련합 왕국', 4),
+('聯', '聯合 王國', '연합 왕국', 0),
+('合', '聯合 王國', '연합 왕국', 1),
+('王', '聯合 王國', '연합 왕국', 3),
+('國', '聯合 王國', '연합 왕국', 4),
+('聯', '聯合國', '연합국', 0),
+('合', '聯合國', '연합국', 1),
+('國', '聯合國', '연합국', 2),
+('聯', '聯想', '연상', 0),
+('想', '聯想', '연상', 1),
+('聯', '聯盟', '련맹', 0),
+('盟', '聯盟', '련맹', 1),
+('聯', '聯盟', '연맹', 0),
+('盟', '聯盟', '연맹', 1),
+('聯', '聯立', '연립', 0),
+('立', '聯立', '연립', 1),
+('聯', '聯絡', '련락', 0),
+('絡', '聯絡', '련락', 1),
+('聯', '聯絡', '연락', 0),
+('絡', '聯絡', '연락', 1),
+('聯', '聯邦', '련방', 0),
+('邦', '聯邦', '련방', 1),
+('聯', '聯邦', '연방', 0),
+('邦', '聯邦', '연방', 1),
+('聯', '聯隊', '연대', 0),
+('隊', '聯隊', '연대', 1),
+('聰', '聰明', '총명', 0),
+('明', '聰明', '총명', 1),
+('聲', '聲優', '성우', 0),
+('優', '聲優', '성우', 1),
+('聲', '聲區', '성구', 0),
+('區', '聲區', '성구', 1),
+('聲', '聲帶', '성대', 0),
+('帶', '聲帶', '성대', 1),
+('聲', '聲明', '성명', 0),
+('明', '聲明', '성명', 1),
+('聲', '聲明書', '성명서', 0),
+('明', '聲明書', '성명서', 1),
+('書', '聲明書', '성명서', 2),
+('聲', '聲望', '성망', 0),
+('望', '聲望', '성망', 1),
+('聲', '聲樂', '성악', 0),
+('樂', '聲樂', '성악', 1),
+('聲', '聲調', '성조', 0),
+('調', '聲調', '성조', 1),
+('聲', '聲讀', '성독', 0),
+('讀', '聲讀', '성독', 1),
+('聲', '聲門', '성문', 0),
+('門', '聲門', '성문', 1),
+('聳', '聳上', '용상', 0),
+('上', '聳上', '용상', 1),
+('職', '職位', '직위', 0),
+('位', '職位', '직위', 1),
+('職', '職分', '직분', 0),
+('分', '職分', '직분', 1),
+('職', '職務', '직무', 0),
+('務', '職務', '직무', 1),
+('職', '職名', '직명', 0),
+('名', '職名', '직명', 1),
+('職', '職員', '직원', 0),
+('員', '職員', '직원', 1),
+('職', '職場', '직장', 0),
+('場', '職場', '직장', 1),
+('職', '職場人', '직장인', 0),
+('場', '職場人', '직장인', 1),
+('人', '職場人', '직장인', 2),
+('職', '職業', '직업', 0),
+('業', '職業', '직업', 1),
+('職', '職業女性', '직업여성', 0),
+('業', '職業女性', '직업여성', 1),
+('女', '職業女性', '직업여성', 2),
+('性', '職業女性', '직업여성', 3),
+('職', '職業病', '직업병', 0),
+('業', '職業病', '직업병', 1),
+('病', '職業病', '직업병', 2),
+('職', '職權', '직권', 0),
+('權', '職權', '직권', 1),
+('職', '職딩', '직딩', 0),
+('딩', '職딩', '직딩', 1),
+('聽', '聽力', '청력', 0),
+('力', '聽力', '청력', 1),
+('聽', '聽取', '청취', 0),
+('取', '聽取', '청취', 1),
+('聽', '聽取力', '청취력', 0),
+('取', '聽取力', '청취력', 1),
+('力', '聽取力', '청취력', 2),
+('聽', '聽取者', '청취자', 0),
+('取', '聽取者', '청취자', 1),
+('者', '聽取者', '청취자', 2),
+('聽', '聽聞會', '청문회', 0),
+('聞', '聽聞會', '청문회', 1),
+('會', '聽聞會', '청문회', 2),
+('聽', '聽衆', '청중', 0),
+('衆', '聽衆', '청중', 1),
+('聽', '聽覺', '청각', 0),
+('覺', '聽覺', '청각', 1),
+('聽', '聽診', '청진', 0),
+('診', '聽診', '청진', 1),
+('聽', '聽診器', '청진기', 0),
+('診', '聽診器', '청진기', 1),
+('器', '聽診器', '청진기', 2),
+('聽', '聽講', '청강', 0),
+('講', '聽講', '청강', 1),
+('聾', '聾啞', '농아', 0),
+('啞', '聾啞', '농아', 1),
+('肅', '肅淸', '숙청', 0),
+('淸', '肅淸', '숙청', 1),
+('肉', '肉', '육', 0),
+('肉', '肉峯', '육봉', 0),
+('峯', '肉峯', '육봉', 1),
+('肉', '肉德', '육덕', 0),
+('德', '肉德', '육덕', 1),
+('肉', '肉感', '육감', 0),
+('感', '肉感', '육감', 1),
+('肉', '肉棒', '육봉', 0),
+('棒', '肉棒', '육봉', 1),
+('肉', '肉水', '육수', 0),
+('水', '肉水', '육수', 1),
+('肉', '肉眼', '육안', 0),
+('眼', '肉眼', '육안', 1),
+('肉', '肉筆', '육필', 0),
+('筆', '肉筆', '육필', 1),
+('肉', '肉細切機', '육세절기', 0),
+('細', '肉細切機', '육세절기', 1),
+('切', '肉細切機', '육세절기', 2),
+('機', '肉細切機', '육세절기', 3),
+('肉', '肉腫', '육종', 0),
+('腫', '肉腫', '육종', 1),
+('肉', '肉膾', '육회', 0),
+('膾', '肉膾', '육회', 1),
+('肉', '肉食 動物', '육식 동물', 0),
+('食', '肉食 動物', '육식 동물', 1),
+('動', '肉食 動物', '육식 동물', 3),
+('物', '肉食 動物', '육식 동물', 4),
+('肉', '肉體', '육체', 0),
+('體', '肉體', '육체', 1),
+('肉', '肉體的', '육체적', 0),
+('體', '肉體的', '육체적', 1),
+('的', '肉體的', '육체적', 2),
+('肉', '肉고기', '육고기', 0),
+('고', '肉고기', '육고기', 1),
+('기', '肉고기', '육고기', 2),
+('肋', '肋骨', '늑골', 0),
+('骨', '肋骨', '늑골', 1),
+('肖', '肖像', '초상', 0),
+('像', '肖像', '초상', 1),
+('肖', '肖像畵', '초상화', 0),
+('像', '肖像畵', '초상화', 1),
+('畵', '肖像畵', '초상화', 2),
+('肛', '肛門', '항문', 0),
+('門', '肛門', '항문', 1),
+('肛', '肛門 括約筋', '항문 괄약근', 0),
+('門', '肛門 括約筋', '항문 괄약근', 1),
+('括', '肛門 括約筋', '항문 괄약근', 3),
+('約', '肛門 括約筋', '항문 괄약근', 4),
+('筋', '肛門 括約筋', '항문 괄약근', 5),
+('肛', '肛門性交', '항문성교', 0),
+('門', '肛門性交', '항문성교', 1),
+('性', '肛門性交', '항문성교', 2),
+('交', '肛門性交', '항문성교', 3),
+('肝', '肝', '간', 0),
+('肝', '肝油', '간유', 0),
+('油', '肝油', '간유', 1),
+('肝', '肝炎', '간염', 0),
+('炎', '肝炎', '간염', 1),
+('肝', '肝癌', '간암', 0),
+('癌', '肝癌', '간암', 1),
+('肝', '肝移植', '간이식', 0),
+('移', '肝移植', '간이식', 1),
+('植', '肝移植', '간이식', 2),
+('肝', '肝臟', '간장', 0),
+('臟', '肝臟', '간장', 1),
+('股', '股腓', '고비', 0),
+('腓', '股腓', '고비', 1),
+('肢', '肢帶', '지대', 0),
+('帶', '肢帶', '지대', 1),
+('肢', '肢帶筋異營養症', '지대근이영양증', 0),
+('帶', '肢帶筋異營養症', '지대근이영양증', 1),
+('筋', '肢帶筋異營養症', '지대근이영양증', 2),
+('異', '肢帶筋異營養症', '지대근이영양증', 3),
+('營', '肢帶筋異營養症', '지대근이영양증', 4),
+('養', '肢帶筋異營養症', '지대근이영양증', 5),
+('症', '肢帶筋異營養症', '지대근이영양증', 6),
+('肥', '肥大', '비대', 0),
+('大', '肥大', '비대', 1),
+('肥', '肥料', '비료', 0),
+('料', '肥料', '비료', 1),
+('肥', '肥沃', '비옥', 0),
+('沃', '肥沃', '비옥', 1),
+('肥', '肥滿', '비만', 0),
+('滿', '肥滿', '비만', 1),
+('肩', '肩章', '견장', 0),
+('章', '肩章', '견장', 1),
+('肯', '肯定', '긍정', 0),
+('定', '肯定', '긍정', 1),
+('肯', '肯定的', '긍정적', 0),
+('定', '肯定的', '긍정적', 1),
+('的', '肯定的', '긍정적', 2),
+('育', '育兒', '육아', 0),
+('兒', '育兒', '육아', 1),
+('肺', '肺', '폐', 0),
+('肺', '肺氣腫', '폐기종', 0),
+('氣', '肺氣腫', '폐기종', 1),
+('腫', '肺氣腫', '폐기종', 2),
+('肺', '肺炎', '폐렴', 0),
+('炎', '肺炎', '폐렴', 1),
+('肺', '肺癌', '폐암', 0),
+('癌', '肺癌', '폐암', 1),
+('肺', '肺結核', '폐결핵', 0),
+('結', '肺結核', '폐결핵', 1),
+('核', '肺結核', '폐결핵', 2),
+('肺', '肺胞', '폐포', 0),
+('胞', '肺胞', '폐포', 1),
+('肺', '肺魚', '폐어', 0),
+('魚', '肺魚', '폐어', 1),
+('胃', '胃', '위', 0),
+('胃', '胃下垂', '위하수', 0),
+('下', '胃下垂', '위하수', 1),
+('垂', '胃下垂', '위하수', 2),
+('胃', '胃弱', '위약', 0),
+('弱', '胃弱', '위약', 1),
+('胃', '胃液', '위액', 0),
+('液', '胃液', '위액', 1),
+('胃', '胃炎', '위염', 0),
+('炎', '胃炎', '위염', 1),
+('胃', '胃痙攣', '위경련', 0),
+('痙', '胃痙攣', '위경련', 1),
+('攣', '胃痙攣', '위경련', 2),
+('胃', '胃痛', '위통', 0),
+('痛', '胃痛', '위통', 1),
+('胃', '胃鏡', '위경', 0),
+('鏡', '胃鏡', '위경', 1),
+('背', '背信', '배신', 0),
+('信', '背信', '배신', 1),
+('背', '背反', '배반', 0),
+('反', '背反', '배반', 1),
+('背', '背反者', '배반자', 0),
+('反', '背反者', '배반자', 1),
+('者', '背反者', '배반자', 2),
+('背', '背叛', '배반', 0),
+('叛', '背叛', '배반', 1),
+('背', '背叛者', '배반자', 0),
+('叛', '背叛者', '배반자', 1),
+('者', '背叛者', '배반자', 2),
+('背', '背囊', '배낭', 0),
+('囊', '背囊', '배낭', 1),
+('背', '背囊旅行', '배낭여행', 0),
+('囊', '背囊旅行', '배낭여행', 1),
+('旅', '背囊旅行', '배낭여행', 2),
+('行', '背囊旅行', '배낭여행', 3),
+('背', '背後', '배후', 0),
+('後', '背後', '배후', 1),
+('背', '背敎', '배교', 0),
+('敎', '背敎', '배교', 1),
+('背', '背敎者', '배교자', 0),
+('敎', '背敎者', '배교자', 1),
+('者', '背敎者', '배교자', 2),
+('背', '背斜', '배사', 0),
+('斜', '背斜', '배사', 1),
+('背', '背景', '배경', 0),
+('景', '背景', '배경', 1),
+('背', '背泳', '배영', 0),
+('泳', '背泳', '배영', 1),
+('背', '背部', '배부', 0),
+('部', '背部', '배부', 1),
+('背', '背面', '배면', 0),
+('面', '背面', '배면', 1),
+('背', '背馳', '배치', 0),
+('馳', '背馳', '배치', 1),
+('胎', '胎倦', '태권', 0),
+('倦', '胎倦', '태권', 1),
+('胎', '胎兒', '태아', 0),
+('兒', '胎兒', '태아', 1),
+('胎', '胎生', '태생', 0),
+('生', '胎生', '태생', 1),
+('胎', '胎盤', '태반', 0),
+('盤', '胎盤', '태반', 1),
+('胚', '胚乳', '배유', 0),
+('乳', '胚乳', '배유', 1),
+('胚', '胚囊', '배낭', 0),
+('囊', '胚囊', '배낭', 1),
+('胚', '胚芽', '배아', 0),
+('芽', '胚芽', '배아', 1),
+('胞', '胞子', '포자', 0),
+('子', '胞子', '포자', 1),
+('胡', '胡---', '호주머니', 0),
+('-', '胡---', '호주머니', 1),
+('-', '胡---', '호주머니', 2),
+('-', '胡---', '호주머니', 3),
+('胡', '胡志明', '호지명', 0),
+('志', '胡志明', '호지명', 1),
+('明', '胡志明', '호지명', 2),
+('胡', '胡椒', '호초', 0),
+('椒', '胡椒', '호초', 1),
+('胡', '胡琴', '호금', 0),
+('琴', '胡琴', '호금', 1),
+('胡', '胡蝶', '호접', 0),
+('蝶', '胡蝶', '호접', 1),
+('胡', '胡밀', '호밀', 0),
+('밀', '胡밀', '호밀', 1),
+('胴', '胴體', '동체', 0),
+('體', '胴體', '동체', 1),
+('胸', '胸', '흉', 0),
+('胸', '胸像', '흉상', 0),
+('像', '胸像', '흉상', 1),
+('胸', '胸壁', '흉벽', 0),
+('壁', '胸壁', '흉벽', 1),
+('胸', '胸廓', '흉곽', 0),
+('廓', '胸廓', '흉곽', 1),
+('胸', '胸部', '흉부', 0),
+('部', '胸部', '흉부', 1),
+('胸', '胸郭', '흉곽', 0),
+('郭', '胸郭', '흉곽', 1),
+('胸', '胸骨', '흉골', 0),
+('骨', '胸骨', '흉골', 1),
+('能', '能', '능', 0),
+('能', '能力', '능력', 0),
+('力', '能力', '능력', 1),
+('能', '能動態', '능동태', 0),
+('動', '能動態', '능동태', 1),
+('態', '能動態', '능동태', 2),
+('能', '能動的', '능동적', 0),
+('動', '能動的', '능동적', 1),
+('的', '能動的', '능동적', 2),
+('能', '能手', '능수', 0),
+('手', '能手', '능수', 1),
+('能', '能格', '능격', 0),
+('格', '能格', '능격', 1),
+('能', '能率', '능률', 0),
+('率', '能率', '능률', 1),
+('脂', '脂肪', '지방', 0),
+('肪', '脂肪', '지방', 1),
+('脂', '脂肪族', '지방족', 0),
+('肪', '脂肪族', '지방족', 1),
+('族', '脂肪族', '지방족', 2),
+('脂', '脂肪酸', '지방산', 0),
+('肪', '脂肪酸', '지방산', 1),
+('酸', '脂肪酸', '지방산', 2),
+('脂', '脂質', '지질', 0),
+('質', '脂質', '지질', 1),
+('脅', '脅迫', '협박', 0),
+('迫', '脅迫', '협박', 1),
+('脅', '脅迫者', '협박자', 0),
+('迫', '脅迫者', '협박자', 1),
+('者', '脅迫者', '협박자', 2),
+('脆', '脆弱', '취약', 0),
+('弱', '脆弱', '취약', 1),
+('脆', '脆弱性', '취약성', 0),
+('弱', '脆弱性', '취약성', 1),
+('性', '脆弱性', '취약성', 2),
+('脆', '脆性', '취성', 0),
+('性', '脆性', '취성', 1),
+('脈', '脈', '맥', 0),
+('脈', '脈拍', '맥박', 0),
+('拍', '脈拍', '맥박', 1),
+('脈', '脈搏', '맥박', 0),
+('搏', '脈搏', '맥박', 1),
+('脈', '脈石', '맥석', 0),
+('石', '脈石', '맥석', 1),
+('脈', '脈絡', '맥락', 0),
+('絡', '脈絡', '맥락', 1),
+('脈', '脈點', '맥점', 0),
+('點', '脈點', '맥점', 1),
+('脊', '脊柱', '척주', 0),
+('柱', '脊柱', '척주', 1),
+('脊', '脊梁', '척량', 0),
+('梁', '脊梁', '척량', 1),
+('脊', '脊椎', '척추', 0),
+('椎', '脊椎', '척추', 1),
+('脊', '脊椎動物', '척추동물', 0),
+('椎', '脊椎動物', '척추동물', 1),
+('動', '脊椎動物', '척추동물', 2),
+('物', '脊椎動物', '척추동물', 3),
+('脊', '脊椎起立筋', '척추기립근', 0),
+('椎', '脊椎起立筋', '척추기립근', 1),
+('起', '脊椎起立筋', '척추기립근', 2),
+('立', '脊椎起立筋', '척추기립근', 3),
+('筋', '脊椎起立筋', '척추기립근', 4),
+('脊', '脊索', '척삭', 0),
+('索', '脊索', '척삭', 1),
+('脊', '脊索動物', '척삭동물', 0),
+('索', '脊索動物', '척삭동물', 1),
+('動', '脊索動物', '척삭동물', 2),
+('物', '脊索動物', '척삭동물', 3),
+('脊', '脊髓', '척수', 0),
+('髓', '脊髓', '척수', 1),
+('脚', '脚光', '각광', 0),
+('光', '脚光', '각광', 1),
+('脚', '脚本', '각본', 0),
+('本', '脚本', '각본', 1),
+('脚', '脚氣', '각기', 0),
+('氣', '脚氣', '각기', 1),
+('脚', '脚注', '각주', 0),
+('注', '脚注', '각주', 1),
+('脚', '脚絆', '각반', 0),
+('絆', '脚絆', '각반', 1),
+('脚', '脚線美', '각선미', 0),
+('線', '脚線美', '각선미', 1),
+('美', '脚線美', '각선미', 2),
+('脚', '脚色', '각색', 0),
+('色', '脚色', '각색', 1),
+('脚', '脚註', '각주', 0),
+('註', '脚註', '각주', 1),
+('脛', '脛骨', '경골', 0),
+('骨', '脛骨', '경골', 1),
+('脫', '脫出', '탈출', 0),
+('出', '脫出', '탈출', 1),
+('脫', '脫出記', '탈출기', 0),
+('出', '脫出記', '탈출기', 1),
+('記', '脫出記', '탈출기', 2),
+('脫', '脫北', '탈북', 0),
+('北', '脫北', '탈북', 1),
+('脫', '脫北者', '탈북자', 0),
+('北', '脫北者', '탈북자', 1),
+('者', '脫北者', '탈북자', 2),
+('脫', '脫漏', '탈루', 0),
+('漏', '脫漏', '탈루', 1),
+('脫', '脫營', '탈영', 0),
+('營', '脫營', '탈영', 1),
+('脫', '脫營兵', '탈영병', 0),
+('營', '脫營兵', '탈영병', 1),
+('兵', '脫營兵', '탈영병', 2),
+('脫', '脫營者', '탈영자', 0),
+('營', '脫營者', '탈영자', 1),
+('者', '脫營者', '탈영자', 2),
+('脫', '脫稅', '탈세', 0),
+('稅', '脫稅', '탈세', 1),
+('脫', '脫臭劑', '탈취제', 0),
+('臭', '脫臭劑', '탈취제', 1),
+('劑', '脫臭劑', '탈취제', 2),
+('脫', '脫臼', '탈구', 0),
+('臼', '脫臼', '탈구', 1),
+('脫', '脫落', '탈락', 0),
+('落', '脫落', '탈락', 1),
+('脫', '脫衣室', '탈의실', 0),
+('衣', '脫衣室', '탈의실', 1),
+('室', '脫衣室', '탈의실', 2),
+('脫', '脫走兵', '탈주병', 0),
+('走', '脫走兵', '탈주병', 1),
+('兵', '脫走兵', '탈주병', 2),
+('脫', '脫走者', '탈주자', 0),
+('走', '脫走者', '탈주자', 1),
+('者', '脫走者', '탈주자', 2),
+('脫', '脫退', '탈퇴', 0),
+('退', '脫退', '탈퇴', 1),
+('脾', '脾臟', '비장', 0),
+('臟', '脾臟', '비장', 1),
+('腋', '腋臭', '액취', 0),
+('臭', '腋臭', '액취', 1),
+('腎', '腎', '신', 0),
+('腎', '腎病', '신병', 0),
+('病', '腎病', '신병', 1),
+('腎', '腎精', '신정', 0),
+('精', '腎精', '신정', 1),
+('腎', '腎臟', '신장', 0),
+('臟', '腎臟', '신장', 1),
+('腐', '腐女子', '부녀자', 0),
+('女', '腐女子', '부녀자', 1),
+('子', '腐女子', '부녀자', 2),
+('腐', '腐敗', '부패', 0),
+('敗', '腐敗', '부패', 1),
+('腐', '腐植土', '부식토', 0),
+('植', '腐植土', '부식토', 1),
+('土', '腐植土', '부식토', 2),
+('腐', '腐葉土', '부엽토', 0),
+('葉', '腐葉土', '부엽토', 1),
+('土', '腐葉土', '부엽토', 2),
+('腐', '腐蝕', '부식', 0),
+('蝕', '腐蝕', '부식', 1),
+('腓', '腓骨', '비골', 0),
+('骨', '腓骨', '비골', 1),
+('腦', '腦', '뇌', 0),
+('腦', '腦下垂體', '뇌하수체', 0),
+('下', '腦下垂體', '뇌하수체', 1),
+('垂', '腦下垂體', '뇌하수체', 2),
+('體', '腦下垂體', '뇌하수체', 3),
+('腦', '腦卒中', '뇌졸중', 0),
+('卒', '腦卒中', '뇌졸중', 1),
+('中', '腦卒中', '뇌졸중', 2),
+('腦', '腦卒症', '뇌졸증', 0),
+('卒', '腦卒症', '뇌졸증', 1),
+('症', '腦卒症', '뇌졸증', 2),
+('腦', '腦回', '뇌회', 0),
+('回', '腦回', '뇌회', 1),
+('腦', '腦幹', '뇌간', 0),
+('幹', '腦幹', '뇌간', 1),
+('腦', '腦波', '뇌파', 0),
+('波', '腦波', '뇌파', 1),
+('腦', '腦炎', '뇌염', 0),
+('炎', '腦炎', '뇌염', 1),
+('腦', '腦癌', '뇌암', 0),
+('癌', '腦癌', '뇌암', 1),
+('腦', '腦神經', '뇌신경', 0),
+('神', '腦神經', '뇌신경', 1),
+('經', '腦神經', '뇌신경', 2),
+('腦', '腦脊髓液', '뇌척수액', 0),
+('脊', '腦脊髓液', '뇌척수액', 1),
+('髓', '腦脊髓液', '뇌척수액', 2),
+('液', '腦脊髓液', '뇌척수액', 3),
+('腦', '腦脊髓膜炎', '뇌척수막염', 0),
+('脊', '腦脊髓膜炎', '뇌척수막염', 1),
+('髓', '腦脊髓膜炎', '뇌척수막염', 2),
+('膜', '腦脊髓膜炎', '뇌척수막염', 3),
+('炎', '腦脊髓膜炎', '뇌척수막염', 4),
+('腦', '腦膜', '뇌막', 0),
+('膜', '腦膜', '뇌막', 1),
+('腦', '腦裏', '뇌리', 0),
+('裏', '腦裏', '뇌리', 1),
+('腦', '腦貧血', '뇌빈혈', 0),
+('貧', '腦貧血', '뇌빈혈', 1),
+('血', '腦貧血', '뇌빈혈', 2),
+('腦', '腦震蕩', '뇌진탕', 0),
+('震', '腦震蕩', '뇌진탕', 1),
+('蕩', '腦震蕩', '뇌진탕', 2),
+('腦', '腦髓', '뇌수', 0),
+('髓', '腦髓', '뇌수', 1),
+('腦', '腦피셜', '뇌피셜', 0),
+('피', '腦피셜', '뇌피셜', 1),
+('셜', '腦피셜', '뇌피셜', 2),
+('腫', '腫', '종', 0),
+('腫', '腫瘍', '종양', 0),
+('瘍', '腫瘍', '종양', 1),
+('腫', '腫瘍學', '종양학', 0),
+('瘍', '腫瘍學', '종양학', 1),
+('學', '腫瘍學', '종양학', 2),
+('腰', '腰方形筋', '요방형근', 0),
+('方', '腰方形筋', '요방형근', 1),
+('形', '腰方形筋', '요방형근', 2),
+('筋', '腰方形筋', '요방형근', 3),
+('腰', '腰痛', '요통', 0),
+('痛', '腰痛', '요통', 1),
+('腰', '腰部', '요부', 0),
+('部', '腰部', '요부', 1),
+('腸', '腸', '장', 0),
+('腸', '腸子', '창자', 0),
+('子', '腸子', '창자', 1),
+('腸', '腸炎', '장염', 0),
+('炎', '腸炎', '장염', 1),
+('腸', '腸病', '장병', 0),
+('病', '腸病', '장병', 1),
+('腸', '腸線', '장선', 0),
+('線', '腸線', '장선', 1),
+('腸', '腸腰筋', '광배근', 0),
+('腰', '腸腰筋', '광배근', 1),
+('筋', '腸腰筋', '광배근', 2),
+('腸', '腸腰筋', '장요근', 0),
+('腰', '腸腰筋', '장요근', 1),
+('筋', '腸腰筋', '장요근', 2),
+('腹', '腹柄', '복병', 0),
+('柄', '腹柄', '복병', 1),
+('腹', '腹案', '복안', 0),
+('案', '腹案', '복안', 1),
+('腹', '腹直筋', '복직근', 0),
+('直', '腹直筋', '복직근', 1),
+('筋', '腹直筋', '복직근', 2),
+('腹', '腹筋', '복근', 0),
+('筋', '腹筋', '복근', 1),
+('腹', '腹膜', '복막', 0),
+('膜', '腹膜', '복막', 1),
+('腹', '腹話術', '복화술', 0),
+('話', '腹話術', '복화술', 1),
+('術', '腹話術', '복화술', 2),
+('腹', '腹話術師', '복화술사', 0),
+('話', '腹話術師', '복화술사', 1),
+('術', '腹話術師', '복화술사', 2),
+('師', '腹話術師', '복화술사', 3),
+('腹', '腹部', '복부', 0),
+('部', '腹部', '복부', 1),
+('膀', '膀胱', '방광', 0),
+('胱', '膀胱', '방광', 1),
+('膀', '膀胱炎', '방광염', 0),
+('胱', '膀胱炎', '방광염', 1),
+('炎', '膀胱炎', '방광염', 2),
+('膀', '膀胱癌', '방광암', 0),
+('胱', '膀胱癌', '방광암', 1),
+('癌', '膀胱癌', '방광암', 2),
+('膂', '膂力', '여력', 0),
+('力', '膂力', '여력', 1),
+('膜', '膜狀', '막상', 0),
+('狀', '膜狀', '막상', 1),
+('膝', '膝下', '슬하', 0),
+('下', '膝下', '슬하', 1),
+('膝', '膝窩', '슬와', 0),
+('窩', '膝窩', '슬와', 1),
+('膝', '膝蓋骨', '슬개골', 0),
+('蓋', '膝蓋骨', '슬개골', 1),
+('骨', '膝蓋骨', '슬개골', 2),
+('膠', '膠着', '교착', 0),
+('着', '膠着', '교착', 1),
+('膠', '膠着語', '교착어', 0),
+('着', '膠着語', '교착어', 1),
+('語', '膠着語', '교착어', 2),
+('膣', '膣', '질', 0),
+('膨', '膨化', '팽화', 0),
+('化', '膨化', '팽화', 1),
+('膨', '膨脹', '팽창', 0),
+('脹', '膨脹', '팽창', 1),
+('膨', '膨脹主義', '팽창주의', 0),
+('脹', '膨脹主義', '팽창주의', 1),
+('主', '膨脹主義', '팽창주의', 2),
+('義', '膨脹主義', '팽창주의', 3),
+('膳', '膳物', '선물', 0),
+('物', '膳物', '선물', 1),
+('膵', '膵臟', '췌장', 0),
+('臟', '膵臟', '췌장', 1),
+('膵', '膵臟癌', '췌장암', 0),
+('臟', '膵臟癌', '췌장암', 1),
+('癌', '膵臟癌', '췌장암', 2),
+('膺', '膺懲', '응징', 0),
+('懲', '膺懲', '응징', 1),
+('膽', '膽', '담', 0),
+('膽', '膽力', '담력', 0),
+('力', '膽力', '담력', 1),
+('膽', '膽囊', '담낭', 0),
+('囊', '膽囊', '담낭', 1),
+('膽', '膽汁', '담즙', 0),
+('汁', '膽汁', '담즙', 1),
+('膽', '膽汁酸', '담즙산', 0),
+('汁', '膽汁酸', '담즙산', 1),
+('酸', '膽汁酸', '담즙산', 2),
+('膽', '膽石', '담석', 0),
+('石', '膽石', '담석', 1),
+('膾', '膾', '휘', 0),
+('膾', '膾炙', '회자', 0),
+('炙', '膾炙', '회자', 1),
+('膿', '膿疱', '농포', 0),
+('疱', '膿疱', '농포', 1),
+('膿', '膿瘍', '농양', 0),
+('瘍', '膿瘍', '농양', 1),
+('臂', '臂脚', '비각', 0),
+('脚', '臂脚', '비각', 1),
+('臆', '臆測', '억측', 0),
+('測', '臆測', '억측', 1),
+('臍', '臍帶', '제대', 0),
+('帶', '臍帶', '제대', 1),
+('臍', '臍炎', '제염', 0),
+('炎', '臍炎', '제염', 1),
+('臙', '臙脂', '연지', 0),
+('脂', '臙脂', '연지', 1),
+('臟', '臟器', '장기', 0),
+('器', '臟器', '장기', 1),
+('臣', '臣', '신', 0),
+('臣', '臣下', '신하', 0),
+('下', '臣下', '신하', 1),
+('臣', '臣民', '신민', 0),
+('民', '臣民', '신민', 1),
+('臥', '臥床', '와상', 0),
+('床', '臥床', '와상', 1),
+('臨', '臨床', '임상', 0),
+('床', '臨床', '임상', 1),
+('臨', '臨時', '임시', 0),
+('時', '臨時', '임시', 1),
+('臨', '臨津江', '임진강', 0),
+('津', '臨津江', '임진강', 1),
+('江', '臨津江', '임진강', 2),
+('臨', '臨終', '임종', 0),
+('終', '臨終', '임종', 1),
+('自', '自—', '자뻑', 0),
+('—', '自—', '자뻑', 1),
+('自', '自主', '자주', 0),
+('主', '自主', '자주', 1),
+('自', '自主的', '자주적', 0),
+('主', '自主的', '자주적', 1),
+('的', '自主的', '자주적', 2),
+('自', '自他共認', '자타공인', 0),
+('他', '自他共認', '자타공인', 1),
+('共', '自他共認', '자타공인', 2),
+('認', '自他共認', '자타공인', 3),
+('自', '自作自演', '자작자연', 0),
+('作', '自作自演', '자작자연', 1),
+('自', '自作自演', '자작자연', 2),
+('演', '自作自演', '자작자연', 3),
+('自', '自供', '자공', 0),
+('供', '自供', '자공', 1),
+('自', '自信', '자신', 0),
+('信', '自信', '자신', 1),
+('自', '自信感', '자신감', 0),
+('信', '自信感', '자신감', 1),
+('感', '自信感', '자신감', 2),
+('自', '自做', '자주', 0),
+('做', '自做', '자주', 1),
+('自', '自傷', '자상', 0),
+('傷', '自傷', '자상', 1),
+('自', '自初至終', '자초지종', 0),
+('初', '自初至終', '자초지종', 1),
+('至', '自初至終', '자초지종', 2),
+('終', '自初至終', '자초지종', 3),
+('自', '自制', '자제', 0),
+('制', '自制', '자제', 1),
+('自', '自力更生', '자력갱생', 0),
+('力', '自力更生', '자력갱생', 1),
+('更', '自力更生', '자력갱생', 2),
+('生', '自力更生', '자력갱생', 3),
+('自', '自動', '자동', 0),
+('動', '自動', '자동', 1),
+('自', '自動 應答機', '자동 응답기', 0),
+('動', '自動 應答機', '자동 응답기', 1),
+('應', '自動 應答機', '자동 응답기', 3),
+('答', '自動 應答機', '자동 응답기', 4),
+('機', '自動 應答機', '자동 응답기', 5),
+('自', '自動化', '자동화', 0),
+('動', '自動化', '자동화', 1),
+('化', '自動化', '자동화', 2),
+('自', '自動拳銃', '자동권총', 0),
+('動', '自動拳銃', '자동권총', 1),
+('拳', '自動拳銃', '자동권총', 2),
+('銃', '自動拳銃', '자동권총', 3),
+('自', '自動的', '자동적', 0),
+('動', '自動的', '자동적', 1),
+('的', '自動的', '자동적', 2),
+('自', '自動詞', '자동사', 0),
+('動', '自動詞', '자동사', 1),
+('詞', '自動詞', '자동사', 2),
+('自', '自動販賣機', '자동판매기', 0),
+('動', '自動販賣機', '자동판매기', 1),
+('販', '自動販賣機', '자동판매기', 2),
+('賣', '自動販賣機', '자동판매기', 3),
+('機', '自動販賣機', '자동판매기', 4),
+('自', '自動車', '자동차', 0),
+('動', '自動車', '자동차', 1),
+('車', '自動車', '자동차', 2),
+('自', '自動階段', '자동계단', 0),
+('動', '自動階段', '자동계단', 1),
+('階', '自動階段', '자동계단', 2),
+('段', '自動階段', '자동계단', 3),
+('自', '自嘲', '자조', 0),
+('嘲', '自嘲', '자조', 1),
+('自', '自國', '자국', 0),
+('國', '自國', '자국', 1),
+('自', '自害', '자해', 0),
+('害', '自害', '자해', 1),
+('自', '自家', '자가', 0),
+('家', '自家', '자가', 1),
+('自', '自家用', '자가용', 0),
+('家', '自家用', '자가용', 1),
+('用', '自家用', '자가용', 2),
+('自', '自家用車', '자가용차', 0),
+('家', '自家用車', '자가용차', 1),
+('用', '自家用車', '자가용차', 2),
+('車', '自家用車', '자가용차', 3),
+('自', '自尊心', '자존심', 0),
+('尊', '自尊心', '자존심', 1),
+('心', '自尊心', '자존심', 2),
+('自', '自尊感', '자존감', 0),
+('尊', '自尊感', '자존감', 1),
+('感', '自尊感', '자존감', 2),
+('自', '自小說', '자소설', 0),
+('小', '自小說', '자소설', 1),
+('說', '自小說', '자소설', 2),
+('自', '自己', '자기', 0),
+('己', '自己', '자기', 1),
+('自', '自己愛', '자기애', 0),
+('己', '自己愛', '자기애', 1),
+('愛', '自己愛', '자기애', 2),
+('自', '自己紹介', '자기소개', 0),
+('己', '自己紹介', '자기소개', 1),
+('紹', '自己紹介', '자기소개', 2),
+('介', '自己紹介', '자기소개', 3),
+('自', '自己紹介書', '자기소개서', 0),
+('己', '自己紹介書', '자기소개서', 1),
+('紹', '自己紹介書', '자기소개서', 2),
+('介', '自己紹介書', '자기소개서', 3),
+('書', '自己紹介書', '자기소개서', 4),
+('自', '自己防禦', '자기방어', 0),
+('己', '自己防禦', '자기방어', 1),
+('防', '自己防禦', '자기방어', 2),
+('禦', '自己防禦', '자기방어', 3),
+('自', '自律', '자율', 0),
+('律', '自律', '자율', 1),
+('自', '自意', '자의', 0),
+('意', '自意', '자의', 1),
+('自', '自愛', '자애', 0),
+('愛', '自愛', '자애', 1),
+('自', '自愧感', '자괴감', 0),
+('愧', '自愧感', '자괴감', 1),
+('感', '自愧感', '자괴감', 2),
+('自', '自慢', '자만', 0),
+('慢', '自慢', '자만', 1),
+('自', '自慰', '자위', 0),
+('慰', '自慰', '자위', 1),
+('自', '自我', '자아', 0),
+('我', '自我', '자아', 1),
+('自', '自敍傳', '자서전', 0),
+('敍', '自敍傳', '자서전', 1),
+('傳', '自敍傳', '자서전', 2),
+('自', '自暴自棄', '자포자기', 0),
+('暴', '自暴自棄', '자포자기', 1),
+('自', '自暴自棄', '자포자기', 2),
+('棄', '自暴自棄', '자포자기', 3),
+('自', '自業自得', '자업자득', 0),
+('業', '自業自得', '자업자득', 1),
+('自', '自業自得', '자업자득', 2),
+('得', '自業自得', '자업자득', 3),
+('自', '自殺', '자살', 0),
+('殺', '自殺', '자살', 1),
+('自', '自殺者', '자살자', 0),
+('殺', '自殺者', '자살자', 1),
+('者', '自殺者', '자살자', 2),
+('自', '自求多福', '자구다복', 0),
+('求', '自求多福', '자구다복', 1),
+('多', '自求多福', '자구다복', 2),
+('福', '自求多福', '자구다복', 3),
+('自', '自決', '자결', 0),
+('決', '自決', '자결', 1),
+('自', '自治', '자치', 0),
+('治', '自治', '자치', 1),
+('自', '自治制', '자치제', 0),
+('治', '自治制', '자치제', 1),
+('制', '自治制', '자치제', 2),
+('自', '自治州', '자치주', 0),
+('治', '自治州', '자치주', 1),
+('州', '自治州', '자치주', 2),
+('自', '自治旗', '자치기', 0),
+('治', '自治旗', '자치기', 1),
+('旗', '自治旗', '자치기', 2),
+('自', '自治體', '자치체', 0),
+('治', '自治體', '자치체', 1),
+('體', '自治體', '자치체', 2),
+('自', '自激之心', '자격지심', 0),
+('激', '自激之心', '자격지심', 1),
+('之', '自激之心', '자격지심', 2),
+('心', '自激之心', '자격지심', 3),
+('自', '自炊', '자취', 0),
+('炊', '自炊', '자취', 1),
+('自', '自然', '자연', 0),
+('然', '自然', '자연', 1),
+('自', '自然人', '자연인', 0),
+('然', '自然人', '자연인', 1),
+('人', '自然人', '자연인', 2),
+('自', '自然死', '자연사', 0),
+('然', '自然死', '자연사', 1),
+('死', '自然死', '자연사', 2),
+('自', '自然法', '자연법', 0),
+('然', '自然法', '자연법', 1),
+('法', '自然法', '자연법', 2),
+('自', '自然淘汰', '자연도태', 0),
+('然', '自然淘汰', '자연도태', 1),
+('淘', '自然淘汰', '자연도태', 2),
+('汰', '自然淘汰', '자연도태', 3),
+('自', '自然現象', '자연현상', 0),
+('然', '自然現象', '자연현상', 1),
+('現', '自然現象', '자연현상', 2),
+('象', '自然現象', '자연현상', 3),
+('自', '自然環境', '자연환경', 0),
+('然', '自然環境', '자연환경', 1),
+('環', '自然環境', '자연환경', 2),
+('境', '自然環境', '자연환경', 3),
+('自', '自由', '자유', 0),
+('由', '自由', '자유', 1),
+('自', '自由 貿易', '자유 무역', 0),
+('由', '自由 貿易', '자유 무역', 1),
+('貿', '自由 貿易', '자유 무역', 3),
+('易', '自由 貿易', '자유 무역', 4),
+('自', '自由中國', '자유중국', 0),
+('由', '自由中國', '자유중국', 1),
+('中', '自由中國', '자유중국', 2),
+('國', '自由中國', '자유중국', 3),
+('自', '自由主義', '자유주의', 0),
+('由', '自由主義', '자유주의', 1),
+('主', '自由主義', '자유주의', 2),
+('義', '自由主義', '자유주의', 3),
+('自', '自由人', '자유인', 0),
+('由', '自由人', '자유인', 1),
+('人', '自由人', '자유인', 2),
+('自', '自由化', '자유화', 0),
+('由', '自由化', '자유화', 1),
+('化', '自由化', '자유화', 2),
+('自', '自由奔放', '자유분방', 0),
+('由', '自由奔放', '자유분방', 1),
+('奔', '自由奔放', '자유분방', 2),
+('放', '自由奔放', '자유분방', 3),
+('自', '自由意志主義', '자유의지주의', 0),
+('由', '自由意志主義', '자유의지주의', 1),
+('意', '自由意志主義', '자유의지주의', 2),
+('志', '自由意志主義', '자유의지주의', 3),
+('主', '自由意志主義', '자유의지주의', 4),
+('義', '自由意志主義', '자유의지주의', 5),
+('自', '自由民', '자유민', 0),
+('由', '自由民', '자유민', 1),
+('民', '自由民', '자유민', 2),
+('自', '自由的', '자유적', 0),
+('由', '自由的', '자유적', 1),
+('的', '自由的', '자유적', 2),
+('自', '自由自在', '자유자재', 0),
+('由', '自由自在', '자유자재', 1),
+('自', '自由自在', '자유자재', 2),
+('在', '自由自在', '자유자재', 3),
+('自', '自由至上主義', '자유지상주의', 0),
+('由', '自由至上主義', '자유지상주의', 1),
+('至', '自由至上主義', '자유지상주의', 2),
+('上', '自由至上主義', '자유지상주의', 3),
+('主', '自由至上主義', '자유지상주의', 4),
+('義', '自由至上主義', '자유지상주의', 5),
+('自', '自畫自讚', '자화자찬', 0),
+('畫', '自畫自讚', '자화자찬', 1),
+('自', '自畫自讚', '자화자찬', 2),
+('讚', '自畫自讚', '자화자찬', 3),
+('自', '自畵自讚', '자화자찬', 0),
+('畵', '自畵自讚', '자화자찬', 1),
+('自', '自畵自讚', '자화자찬', 2),
+('讚', '自畵自讚', '자화자찬', 3),
+('自', '自發的', '자발적', 0),
+('發', '自發的', '자발적', 1),
+('的', '自發的', '자발적', 2),
+('自', '自白', '자백', 0),
+('白', '自白', '자백', 1),
+('自', '自立', '자립', 0),
+('立', '自立', '자립', 1),
+('自', '自立名詞', '자립명사', 0),
+('立', '自立名詞', '자립명사', 1),
+('名', '自立名詞', '자립명사', 2),
+('詞', '自立名詞', '자립명사', 3),
+('自', '自紹書', '자소서', 0),
+('紹', '自紹書', '자소서', 1),
+('書', '自紹書', '자소서', 2),
+('自', '自給自足', '자급자족', 0),
+('給', '自給自足', '자급자족', 1),
+('自', '自給自足', '자급자족', 2),
+('足', '自給自足', '자급자족', 3),
+('自', '自署', '자서', 0),
+('署', '自署', '자서', 1),
+('自', '自若', '자약', 0),
+('若', '自若', '자약', 1),
+('自', '自虐', '자학', 0),
+('虐', '自虐', '자학', 1),
+('自', '自行', '자행', 0),
+('行', '自行', '자행', 1),
+('自', '自行車', '자행거', 0),
+('行', '自行車', '자행거', 1),
+('車', '自行車', '자행거', 2),
+('自', '自衛', '자위', 0),
+('衛', '自衛', '자위', 1),
+('自', '自衛隊', '자위대', 0),
+('衛', '自衛隊', '자위대', 1),
+('隊', '自衛隊', '자위대', 2),
+('自', '自覺', '자각', 0),
+('覺', '自覺', '자각', 1),
+('自', '自覺夢', '자각몽', 0),
+('覺', '自覺夢', '자각몽', 1),
+('夢', '自覺夢', '자각몽', 2),
+('自', '自註', '자주', 0),
+('註', '自註', '자주', 1),
+('自', '自認', '자인', 0),
+('認', '自認', '자인', 1),
+('自', '自警團', '자경단', 0),
+('警', '自警團', '자경단', 1),
+('團', '自警團', '자경단', 2),
+('自', '自讚', '자찬', 0),
+('讚', '自讚', '자찬', 1),
+('自', '自負心', '자부심', 0),
+('負', '自負心', '자부심', 1),
+('心', '自負心', '자부심', 2),
+('自', '自販機', '자판기', 0),
+('販', '自販機', '자판기', 1),
+('機', '自販機', '자판기', 2),
+('自', '自責', '자책', 0),
+('責', '自責', '자책', 1),
+('自', '自責感', '자책감', 0),
+('責', '自責感', '자책감', 1),
+('感', '自責感', '자책감', 2),
+('自', '自身', '자신', 0),
+('身', '自身', '자신', 1),
+('自', '自轉', '자전', 0),
+('轉', '自轉', '자전', 1),
+('自', '自轉車', '자전거', 0),
+('轉', '自轉車', '자전거', 1),
+('車', '自轉車', '자전거', 2),
+('自', '自轉車', '재앤고', 0),
+('轉', '自轉車', '재앤고', 1),
+('車', '自轉車', '재앤고', 2),
+('自', '自轉車', '자전거', 0),
+('轉', '自轉車', '자전거', 1),
+('車', '自轉車', '자전거', 2),
+('自', '自進', '자진', 0),
+('進', '自進', '자진', 1),
+('自', '自重', '자중', 0),
+('重', '自重', '자중', 1),
+('自', '自閉症', '자폐증', 0),
+('閉', '自閉症', '자폐증', 1),
+('症', '自閉症', '자폐증', 2),
+('自', '自首', '자수', 0),
+('首', '自首', '자수', 1),
+('自', '自體', '자체', 0),
+('體', '自體', '자체', 1),
+('自', '自鳴琴', '자명금', 0),
+('鳴', '自鳴琴', '자명금', 1),
+('琴', '自鳴琴', '자명금', 2),
+('自', '自鳴鐘', '자명종', 0),
+('鳴', '自鳴鐘', '자명종', 1),
+('鐘', '自鳴鐘', '자명종', 2),
+('臭', '臭素', '취소', 0),
+('素', '臭素', '취소', 1),
+('臭', '臭豆腐', '취두부', 0),
+('豆', '臭豆腐', '취두부', 1),
+('腐', '臭豆腐', '취두부', 2),
+('至', '至情', '지정', 0),
+('情', '至情', '지정', 1),
+('至', '至極', '지극', 0),
+('極', '至極', '지극', 1),
+('至', '至福', '지복', 0),
+('福', '至福', '지복', 1),
+('至', '至福直觀', '지복직관', 0),
+('福', '至福直觀', '지복직관', 1),
+('直', '至福直觀', '지복직관', 2),
+('觀', '至福直觀', '지복직관', 3),
+('至', '至言', '지언', 0),
+('言', '至言', '지언', 1),
+('至', '至高', '지고', 0),
+('高', '至高', '지고', 1),
+('致', '致命率', '치명률', 0),
+('命', '致命率', '치명률', 1),
+('率', '致命率', '치명률', 2),
+('致', '致命的', '치명적', 0),
+('命', '致命的', '치명적', 1),
+('的', '致命的', '치명적', 2),
+('致', '致死的', '치사적', 0),
+('死', '致死的', '치사적', 1),
+('的', '致死的', '치사적', 2),
+('臺', '臺', '대', 0),
+('臺', '臺北', '대북', 0),
+('北', '臺北', '대북', 1),
+('臺', '臺地', '대지', 0),
+('地', '臺地', '대지', 1),
+('臺', '臺帳', '대장', 0),
+('帳', '臺帳', '대장', 1),
+('臺', '臺座', '대좌', 0),
+('座', '臺座', '대좌', 1),
+('臺', '臺本', '대본', 0),
+('本', '臺本', '대본', 1),
+('臺', '臺灣', '대만', 0),
+('灣', '臺灣', '대만', 1),
+('臺', '臺灣 海峽', '대만 해협', 0),
+('灣', '臺灣 海峽', '대만 해협', 1),
+('海', '臺灣 海峽', '대만 해협', 3),
+('峽', '臺灣 海峽', '대만 해협', 4),
+('臺', '臺紙', '대지', 0),
+('紙', '臺紙', '대지', 1),
+('臺', '臺詞', '대사', 0),
+('詞', '臺詞', '대사', 1),
+('臼', '臼齒', '구치', 0),
+('齒', '臼齒', '구치', 1),
+('與', '與', '여', 0),
+('與', '與件', '여건', 0),
+('件', '與件', '여건', 1),
+('與', '與圈', '여권', 0),
+('圈', '與圈', '여권', 1),
+('與', '與論', '여론', 0),
+('論', '與論', '여론', 1),
+('與', '與野', '여야', 0),
+('野', '與野', '여야', 1),
+('與', '與黨', '여당', 0),
+('黨', '與黨', '여당', 1),
+('興', '興', '흥', 0),
+('興', '興南 撤收', '흥남 철수', 0),
+('南', '興南 撤收', '흥남 철수', 1),
+('撤', '興南 撤收', '흥남 철수', 3),
+('收', '興南 撤收', '흥남 철수', 4),
+('興', '興味', '흥미', 0),
+('味', '興味', '흥미', 1),
+('興', '興味--', '흥미롭다', 0),
+('味', '興味--', '흥미롭다', 1),
+('-', '興味--', '흥미롭다', 2),
+('-', '興味--', '흥미롭다', 3),
+('興', '興奮', '흥분', 0),
+('奮', '興奮', '흥분', 1),
+('興', '興行', '흥행', 0),
+('行', '興行', '흥행', 1),
+('興', '興行場', '흥행장', 0),
+('行', '興行場', '흥행장', 1),
+('場', '興行場', '흥행장', 2),
+('興', '興隆', '흥륭', 0),
+('隆', '興隆', '흥륭', 1),
+('舊', '舊世界', '구세계', 0),
+('世', '舊世界', '구세계', 1),
+('界', '舊世界', '구세계', 2),
+('舊', '舊人', '구인', 0),
+('人', '舊人', '구인', 1),
+('舊', '舊字體', '구자체', 0),
+('字', '舊字體', '구자체', 1),
+('體', '舊字體', '구자체', 2),
+('舊', '舊家', '구가', 0),
+('家', '舊家', '구가', 1),
+('舊', '舊式', '구식', 0),
+('式', '舊式', '구식', 1),
+('舊', '舊約聖經', '구약성경', 0),
+('約', '舊約聖經', '구약성경', 1),
+('聖', '舊約聖經', '구약성경', 2),
+('經', '舊約聖經', '구약성경', 3),
+('舊', '舊習', '구습', 0),
+('習', '舊習', '구습', 1),
+('舊', '舊跡', '구적', 0),
+('跡', '舊跡', '구적', 1),
+('舊', '舊蹟', '구적', 0),
+('蹟', '舊蹟', '구적', 1),
+('舌', '舌戰', '설전', 0),
+('戰', '舌戰', '설전', 1),
+('舌', '舌癌', '설암', 0),
+('癌', '舌癌', '설암', 1),
+('舍', '舍利', '사리', 0),
+('利', '舍利', '사리', 1),
+('舍', '舍廊', '사랑', 0),
+('廊', '舍廊', '사랑', 1),
+('舞', '舞', '무', 0),
+('舞', '舞女', '무녀', 0),
+('女', '舞女', '무녀', 1),
+('舞', '舞樂', '무악', 0),
+('樂', '舞樂', '무악', 1),
+('舞', '舞臺', '무대', 0),
+('臺', '舞臺', '무대', 1),
+('舞', '舞踊', '무용', 0),
+('踊', '舞踊', '무용', 1),
+('舞', '舞踊家', '무용가', 0),
+('踊', '舞踊家', '무용가', 1),
+('家', '舞踊家', '무용가', 2),
+('舞', '舞蹈', '무도', 0),
+('蹈', '舞蹈', '무도', 1),
+('舞', '舞雩', '무우', 0),
+('雩', '舞雩', '무우', 1),
+('舟', '舟艇', '주정', 0),
+('艇', '舟艇', '주정', 1),
+('航', '航海', '항해', 0),
+('海', '航海', '항해', 1),
+('航', '航程', '항정', 0),
+('程', '航程', '항정', 1),
+('航', '航空', '항공', 0),
+('空', '航空', '항공', 1),
+('航', '航空交通管制', '항공교통관제', 0),
+('空', '航空交通管制', '항공교통관제', 1),
+('交', '航空交通管制', '항공교통관제', 2),
+('通', '航空交通管制', '항공교통관제', 3),
+('管', '航空交通管制', '항공교통관제', 4),
+('制', '航空交通管制', '항공교통관제', 5),
+('航', '航空便', '항공편', 0),
+('空', '航空便', '항공편', 1),
+('便', '航空便', '항공편', 2),
+('航', '航空券', '항공권', 0),
+('空', '航空券', '항공권', 1),
+('券', '航空券', '항공권', 2),
+('航', '航空宇宙', '항공우주', 0),
+('空', '航空宇宙', '항공우주', 1),
+('宇', '航空宇宙', '항공우주', 2),
+('宙', '航空宇宙', '항공우주', 3),
+('航', '航空料', '항공료', 0),
+('空', '航空料', '항공료', 1),
+('料', '航空料', '항공료', 2),
+('航', '航空機', '항공기', 0),
+('空', '航空機', '항공기', 1),
+('機', '航空機', '항공기', 2),
+('航', '航空母艦', '항공모함', 0),
+('空', '航空母艦', '항공모함', 1),
+('母', '航空母艦', '항공모함', 2),
+('艦', '航空母艦', '항공모함', 3),
+('航', '航空社', '항공사', 0),
+('空', '航空社', '항공사', 1),
+('社', '航空社', '항공사', 2),
+('航', '航空郵便', '항공우편', 0),
+('空', '航空郵便', '항공우편', 1),
+('郵', '航空郵便', '항공우편', 2),
+('便', '航空郵便', '항공우편', 3),
+('航', '航空驛', '항공역', 0),
+('空', '航空驛', '항공역', 1),
+('驛', '航空驛', '항공역', 2),
+('航', '航行', '항행', 0),
+('行', '航行', '항행', 1),
+('航', '航路', '항로', 0),
+('路', '航路', '항로', 1),
+('般', '般涅槃', '반열반', 0),
+('涅', '般涅槃', '반열반', 1),
+('槃', '般涅槃', '반열반', 2),
+('舵', '舵', '타', 0),
+('舵', '舵手', '타수', 0),
+('手', '舵手', '타수', 1),
+('舵', '舵輪', '타륜', 0),
+('輪', '舵輪', '타륜', 1),
+('舷', '舷窓', '현창', 0),
+('窓', '舷窓', '현창', 1),
+('船', '船上', '선상', 0),
+('上', '船上', '선상', 1),
+('船', '船主', '선주', 0),
+('主', '船主', '선주', 1),
+('船', '船倉', '선창', 0),
+('倉', '船倉', '선창', 1),
+('船', '船員', '선원', 0),
+('員', '船員', '선원', 1),
+('船', '船團', '선단', 0),
+('團', '船團', '선단', 1),
+('船', '船客', '선객', 0),
+('客', '船客', '선객', 1),
+('船', '船室', '선실', 0),
+('室', '船室', '선실', 1),
+('船', '船尾', '선미', 0),
+('尾', '船尾', '선미', 1),
+('船', '船廠', '선창', 0),
+('廠', '船廠', '선창', 1),
+('船', '船着場', '선착장', 0),
+('着', '船着場', '선착장', 1),
+('場', '船着場', '선착장', 2),
+('船', '船窓', '선창', 0),
+('窓', '船窓', '선창', 1),
+('船', '船舶', '선박', 0),
+('舶', '船舶', '선박', 1),
+('船', '船艙', '선창', 0),
+('艙', '船艙', '선창', 1),
+('船', '船荷', '선하', 0),
+('荷', '船荷', '선하', 1),
+('船', '船長', '선장', 0),
+('長', '船長', '선장', 1),
+('船', '船隊', '선대', 0),
+('隊', '船隊', '선대', 1),
+('船', '船體', '선체', 0),
+('體', '船體', '선체', 1),
+('艇', '艇長', '정장', 0),
+('長', '艇長', '정장', 1),
+('艙', '艙口', '창구', 0),
+('口', '艙口', '창구', 1),
+('艦', '艦', '함', 0),
+('艦', '艦橋', '함교', 0),
+('橋', '艦橋', '함교', 1),
+('艦', '艦船', '함선', 0),
+('船', '艦船', '함선', 1),
+('艦', '艦艇', '함정', 0),
+('艇', '艦艇', '함정', 1),
+('艦', '艦隊', '함대', 0),
+('隊', '艦隊', '함대', 1),
+('良', '良', '양', 0),
+('良', '良人', '양인', 0),
+('人', '良人', '양인', 1),
+('良', '良友', '량우', 0),
+('友', '良友', '량우', 1),
+('良', '良友', '양우', 0),
+('友', '良友', '양우', 1),
+('良', '良心', '량심', 0),
+('心', '良心', '량심', 1),
+('良', '良心', '양심', 0),
+('心', '良心', '양심', 1),
+('良', '良心的  兵役拒否', '양심적 병역거부자', 0),
+('心', '良心的  兵役拒否', '양심적 병역거부자', 1),
+('的', '良心的  兵役拒否', '양심적 병역거부자', 2),
+('兵', '良心的  兵役拒否', '양심적 병역거부자', 5),
+('役', '良心的  兵役拒否', '양심적 병역거부자', 6),
+('拒', '良心的  兵役拒否', '양심적 병역거부자', 7),
+('否', '良心的  兵役拒否', '양심적 병역거부자', 8),
+('良', '良臣', '양신', 0),
+('臣', '良臣', '양신', 1),
+('良', '良貨', '양화', 0),
+('貨', '良貨', '양화', 1),
+('良', '良質', '양질', 0),
+('質', '良質', '양질', 1),
+('良', '良輔', '양보', 0),
+('輔', '良輔', '양보', 1),
+('良', '良辰', '양신', 0),
+('辰', '良辰', '양신', 1),
+('艱', '艱辛', '간신', 0),
+('辛', '艱辛', '간신', 1),
+('艱', '艱難', '간난', 0),
+('難', '艱難', '간난', 1),
+('色', '色', '색', 0),
+('色', '色-', '색깔', 0),
+('-', '色-', '색깔', 1),
+('色', '色---', '색다르다', 0),
+('-', '色---', '색다르다', 1),
+('-', '色---', '색다르다', 2),
+('-', '色---', '색다르다', 3),
+('色', '色弱', '색약', 0),
+('弱', '色弱', '색약', 1),
+('色', '色彩', '색채', 0),
+('彩', '色彩', '색채', 1),
+('色', '色情', '색정', 0),
+('情', '色情', '색정', 1),
+('色', '色慾', '색욕', 0),
+('慾', '色慾', '색욕', 1),
+('色', '色漆', '색칠', 0),
+('漆', '色漆', '색칠', 1),
+('色', '色盲', '색맹', 0),
+('盲', '色盲', '색맹', 1),
+('色', '色相', '색상', 0),
+('相', '色相', '색상', 1),
+('色', '色相環', '색상환', 0),
+('相', '色相環', '색상환', 1),
+('環', '色相環', '색상환', 2),
+('色', '色眼鏡', '색안경', 0),
+('眼', '色眼鏡', '색안경', 1),
+('鏡', '色眼鏡', '색안경', 2),
+('色', '色素', '색소', 0),
+('素', '色素', '색소', 1),
+('色', '色鉛筆', '색연필', 0),
+('鉛', '色鉛筆', '색연필', 1),
+('筆', '色鉛筆', '색연필', 2),
+('色', '色종이', '색종이', 0),
+('종', '色종이', '색종이', 1),
+('이', '色종이', '색종이', 2),
+('艶', '艶歌', '염가', 0),
+('歌', '艶歌', '염가', 1),
+('艷', '艷福', '염복', 0),
+('福', '艷福', '염복', 1),
+('艷', '艷話', '염화', 0),
+('話', '艷話', '염화', 1),
+('芍', '芍藥', '작약', 0),
+('藥', '芍藥', '작약', 1),
+('芒', '芒角', '망각', 0),
+('角', '芒角', '망각', 1),
+('芭', '芭蕉', '파초', 0),
+('蕉', '芭蕉', '파초', 1),
+('芭', '芭蕉—', '파초꽃', 0),
+('蕉', '芭蕉—', '파초꽃', 1),
+('—', '芭蕉—', '파초꽃', 2),
+('芭', '芭蕉一葉', '파초일엽', 0),
+('蕉', '芭蕉一葉', '파초일엽', 1),
+('一', '芭蕉一葉', '파초일엽', 2),
+('葉', '芭蕉一葉', '파초일엽', 3),
+('芭', '芭蕉열매', '파초열매', 0),
+('蕉', '芭蕉열매', '파초열매', 1),
+('열', '芭蕉열매', '파초열매', 2),
+('매', '芭蕉열매', '파초열매', 3),
+('花', '花冠', '화관', 0),
+('冠', '花冠', '화관', 1),
+('花', '花卉', '화훼', 0),
+('卉', '花卉', '화훼', 1),
+('花', '花園', '화원', 0),
+('園', '花園', '화원', 1),
+('花', '花壇', '화단', 0),
+('壇', '花壇', '화단', 1),
+('花', '花崗岩', '화강암', 0),
+('崗', '花崗岩', '화강암', 1),
+('岩', '花崗岩', '화강암', 2),
+('花', '花崗巖', '화강암', 0),
+('崗', '花崗巖', '화강암', 1),
+('巖', '花崗巖', '화강암', 2),
+('花', '花序', '화서', 0),
+('序', '花序', '화서', 1),
+('花', '花形', '화형', 0),
+('形', '花形', '화형', 1),
+('花', '花押', '화압', 0),
+('押', '花押', '화압', 1),
+('花', '花木', '화목', 0),
+('木', '花木', '화목', 1),
+('花', '花柄', '화병', 0),
+('柄', '花柄', '화병', 1),
+('花', '花柱', '화주', 0),
+('柱', '花柱', '화주', 1),
+('花', '花柳病', '화류병', 0),
+('柳', '花柳病', '화류병', 1),
+('病', '花柳病', '화류병', 2),
+('花', '花樣年華', '화양연화', 0),
+('樣', '花樣年華', '화양연화', 1),
+('年', '花樣年華', '화양연화', 2),
+('華', '花樣年華', '화양연화', 3),
+('花', '花環', '화환', 0),
+('環', '花環', '화환', 1),
+('花', '花甁', '화병', 0),
+('甁', '花甁', '화병', 1),
+('花', '花盆', '화분', 0),
+('盆', '花盆', '화분', 1),
+('花', '花粉', '화분', 0),
+('粉', '花粉', '화분', 1),
+('花', '花菜', '화채', 0),
+('菜', '花菜', '화채', 1),
+('花', '花蛇', '화사', 0),
+('蛇', '花蛇', '화사', 1),
+('花', '花蜜', '화밀', 0),
+('蜜', '花蜜', '화밀', 1),
+('花', '花被', '화피', 0),
+('被', '花被', '화피', 1),
+('芳', '芳名', '방명', 0),
+('名', '芳名', '방명', 1),
+('芳', '芳年', '방년', 0),
+('年', '芳年', '방년', 1),
+('芳', '芳心', '방심', 0),
+('心', '芳心', '방심', 1),
+('芳', '芳香', '방향', 0),
+('香', '芳香', '방향', 1),
+('芳', '芳香族', '방향족', 0),
+('香', '芳香族', '방향족', 1),
+('族', '芳香族', '방향족', 2),
+('苗', '苗圃', '묘포', 0),
+('圃', '苗圃', '묘포', 1),
+('苗', '苗床', '묘상', 0),
+('床', '苗床', '묘상', 1),
+('苗', '苗木', '묘목', 0),
+('木', '苗木', '묘목', 1),
+('苛', '苛刻', '가각', 0),
+('刻', '苛刻', '가각', 1),
+('苛', '苛酷', '가혹', 0),
+('酷', '苛酷', '가혹', 1),
+('苞', '苞葉', '포엽', 0),
+('葉', '苞葉', '포엽', 1),
+('若', '若干', '약간', 0),
+('干', '若干', '약간', 1),
+('苦', '苦', '고', 0),
+('苦', '苦受', '고수', 0),
+('受', '苦受', '고수', 1),
+('苦', '苦待', '고대', 0),
+('待', '苦待', '고대', 1),
+('苦', '苦心', '고심', 0),
+('心', '苦心', '고심', 1),
+('苦', '苦悲', '고비', 0),
+('悲', '苦悲', '고비', 1),
+('苦', '苦悶', '고민', 0),
+('悶', '苦悶', '고민', 1),
+('苦', '苦惱', '고뇌', 0),
+('惱', '苦惱', '고뇌', 1),
+('苦', '苦椒', '고초', 0),
+('椒', '苦椒', '고초', 1),
+('苦', '苦楚', '고초', 0),
+('楚', '苦楚', '고초', 1),
+('苦', '苦生', '고생', 0),
+('生', '苦生', '고생', 1),
+('苦', '苦痛', '고통', 0),
+('痛', '苦痛', '고통', 1),
+('苦', '苦笑', '고소', 0),
+('笑', '苦笑', '고소', 1),
+('苦', '苦草', '고초', 0),
+('草', '苦草', '고초', 1),
+('苦', '苦行', '고행', 0),
+('行', '苦行', '고행', 1),
+('苦', '苦難', '고난', 0),
+('難', '苦難', '고난', 1),
+('苦', '苦鬪', '고투', 0),
+('鬪', '苦鬪', '고투', 1),
+('英', '英國', '영국', 0),
+('國', '英國', '영국', 1),
+('英', '英國 海峽', '영국 해협', 0),
+('國', '英國 海峽', '영국 해협', 1),
+('海', '英國 海峽', '영국 해협', 3),
+('峽', '英國 海峽', '영국 해협', 4),
+('英', '英國人', '영국인', 0),
+('國', '英國人', '영국인', 1),
+('人', '英國人', '영국인', 2),
+('英', '英才', '영재', 0),
+('才', '英才', '영재', 1),
+('英', '英抛者', '영포자', 0),
+('抛', '英抛者', '영포자', 1),
+('者', '英抛者', '영포자', 2),
+('英', '英文', '영문', 0),
+('文', '英文', '영문', 1),
+('英', '英氣', '영기', 0),
+('氣', '英氣', '영기', 1),
+('英', '英美圈', '영미권', 0),
+('美', '英美圈', '영미권', 1),
+('圈', '英美圈', '영미권', 2),
+('英', '英聯邦', '영연방', 0),
+('聯', '英聯邦', '영연방', 1),
+('邦', '英聯邦', '영연방', 2),
+('英', '英語', '영어', 0),
+('語', '英語', '영어', 1),
+('英', '英語圈', '영어권', 0),
+('語', '英語圈', '영어권', 1),
+('圈', '英語圈', '영어권', 2),
+('英', '英雄', '영웅', 0),
+('雄', '英雄', '영웅', 1),
+('英', '英雄主義', '영웅주의', 0),
+('雄', '英雄主義', '영웅주의', 1),
+('主', '英雄主義', '영웅주의', 2),
+('義', '英雄主義', '영웅주의', 3),
+('英', '英雄敍事詩', '영웅서사시', 0),
+('雄', '英雄敍事詩', '영웅서사시', 1),
+('敍', '英雄敍事詩', '영웅서사시', 2),
+('事', '英雄敍事詩', '영웅서사시', 3),
+('詩', '英雄敍事詩', '영웅서사시', 4),
+('英', '英雄時代', '영웅시대', 0),
+('雄', '英雄時代', '영웅시대', 1),
+('時', '英雄時代', '영웅시대', 2),
+('代', '英雄時代', '영웅시대', 3),
+('英', '英雄譚', '영웅담', 0),
+('雄', '英雄譚', '영웅담', 1),
+('譚', '英雄譚', '영웅담', 2),
+('英', '英韓', '영한', 0),
+('韓', '英韓', '영한', 1),
+('茂', '茂山郡', '무산군', 0),
+('山', '茂山郡', '무산군', 1),
+('郡', '茂山郡', '무산군', 2),
+('范', '范', '범', 0),
+('茘', '茘枝', '여지', 0),
+('枝', '茘枝', '여지', 1),
+('茫', '茫然', '망연', 0),
+('然', '茫然', '망연', 1),
+('茶', '茶', '차', 0),
+('茶', '茶房', '다방', 0),
+('房', '茶房', '다방', 1),
+('茶', '茶盤', '다반', 0),
+('盤', '茶盤', '다반', 1),
+('茶', '茶盤', '차반', 0),
+('盤', '茶盤', '차반', 1),
+('茶', '茶碗', '다완', 0),
+('碗', '茶碗', '다완', 1),
+('茶', '茶色', '차색', 0),
+('色', '茶色', '차색', 1),
+('茶', '茶菓', '다과', 0),
+('菓', '茶菓', '다과', 1),
+('茶', '茶葉', '다엽', 0),
+('葉', '茶葉', '다엽', 1),
+('茶', '茶葉蛋', '차예단', 0),
+('葉', '茶葉蛋', '차예단', 1),
+('蛋', '茶葉蛋', '차예단', 2),
+('茶', '茶褐色', '다갈색', 0),
+('褐', '茶褐色', '다갈색', 1),
+('色', '茶褐色', '다갈색', 2),
+('茶', '茶道', '다도', 0),
+('道', '茶道', '다도', 1),
+('茶', '茶道', '차도', 0),
+('道', '茶道', '차도', 1),
+('茶', '茶酒煎子', '찻주전자', 0),
+('酒', '茶酒煎子', '찻주전자', 1),
+('煎', '茶酒煎子', '찻주전자', 2),
+('子', '茶酒煎子', '찻주전자', 3),
+('茶', '茶食', '다식', 0),
+('食', '茶食', '다식', 1),
+('茶', '茶飯', '차반', 0),
+('飯', '茶飯', '차반', 1),
+('茹', '茹茹', '여여', 0),
+('茹', '茹茹', '여여', 1),
+('草', '草具', '초구', 0),
+('具', '草具', '초구', 1),
+('草', '草創', '초창', 0),
+('創', '草創', '초창', 1),
+('草', '草原', '초원', 0),
+('原', '草原', '초원', 1),
+('草', '草原수리', '초원수리', 0),
+('原', '草原수리', '초원수리', 1),
+('수', '草原수리', '초원수리', 2),
+('리', '草原수리', '초원수리', 3),
+('草', '草地', '초지', 0),
+('地', '草地', '초지', 1),
+('草', '草書', '초서', 0),
+('書', '草書', '초서', 1),
+('草', '草木', '초목', 0),
+('木', '草木', '초목', 1),
+('草', '草本', '초본', 0),
+('本', '草本', '초본', 1),
+('草', '草果', '초과', 0),
+('果', '草果', '초과', 1),
+('草', '草案', '초안', 0),
+('案', '草案', '초안', 1),
+('草', '草石蠶', '초석잠', 0),
+('石', '草石蠶', '초석잠', 1),
+('蠶', '草石蠶', '초석잠', 2),
+('草', '草稿', '초고', 0),
+('稿', '草稿', '초고', 1),
+('草', '草綠', '초록', 0),
+('綠', '草綠', '초록', 1),
+('草', '草綠色', '초록색', 0),
+('綠', '草綠色', '초록색', 1),
+('色', '草綠色', '초록색', 2),
+('草', '草草', '초초', 0),
+('草', '草草', '초초', 1),
+('草', '草露', '초로', 0),
+('露', '草露', '초로', 1),
+('草', '草鞋', '초혜', 0),
+('鞋', '草鞋', '초혜', 1),
+('草', '草食 動物', '초식 동물', 0),
+('食', '草食 動物', '초식 동물', 1),
+('動', '草食 動物', '초식 동물', 3),
+('物', '草食 動物', '초식 동물', 4),
+('草', '草魚', '초어', 0),
+('魚', '草魚', '초어', 1),
+('荒', '荒唐', '황당', 0),
+('唐', '荒唐', '황당', 1),
+('荒', '荒唐無稽', '황당무계', 0),
+('唐', '荒唐無稽', '황당무계', 1),
+('無', '荒唐無稽', '황당무계', 2),
+('稽', '荒唐無稽', '황당무계', 3),
+('荒', '荒地', '황지', 0),
+('地', '荒地', '황지', 1),
+('荒', '荒天', '황천', 0),
+('天', '荒天', '황천', 1),
+('荒', '荒涼', '황량', 0),
+('涼', '荒涼', '황량', 1),
+('荒', '荒蕪地', '황무지', 0),
+('蕪', '荒蕪地', '황무지', 1),
+('地', '荒蕪地', '황무지', 2),
+('荒', '荒野', '황야', 0),
+('野', '荒野', '황야', 1),
+('荷', '荷物', '하물', 0),
+('物', '荷物', '하물', 1),
+('荷', '荷重', '하중', 0),
+('重', '荷重', '하중', 1),
+('莊', '莊', '장', 0),
+('莊', '莊嚴', '장엄', 0),
+('嚴', '莊嚴', '장엄', 1),
+('莊', '莊園', '장원', 0),
+('園', '莊園', '장원', 1),
+('莊', '莊子', '장자', 0),
+('子', '莊子', '장자', 1),
+('莎', '莎草', '사초', 0),
+('草', '莎草', '사초', 1),
+('莫', '莫上莫下', '막상막하', 0),
+('上', '莫上莫下', '막상막하', 1),
+('莫', '莫上莫下', '막상막하', 2),
+('下', '莫上莫下', '막상막하', 3),
+('莫', '莫大', '막대', 0),
+('大', '莫大', '막대', 1),
+('菊', '菊花', '국화', 0),
+('花', '菊花', '국화', 1),
+('菌', '菌界', '균계', 0),
+('界', '菌界', '균계', 1),
+('菌', '菌絲', '균사', 0),
+('絲', '菌絲', '균사', 1),
+('菌', '菌類', '균류', 0),
+('類', '菌類', '균류', 1),
+('菓', '菓子', '과자', 0),
+('子', '菓子', '과자', 1),
+('菓', '菓子', '까자', 0),
+('子', '菓子', '까자', 1),
+('菖', '菖蒲劒', '창포검', 0),
+('蒲', '菖蒲劒', '창포검', 1),
+('劒', '菖蒲劒', '창포검', 2),
+('菜', '菜園', '채원', 0),
+('園', '菜園', '채원', 1),
+('菜', '菜種', '채종', 0),
+('種', '菜種', '채종', 1),
+('菜', '菜種油', '채종유', 0),
+('種', '菜種油', '채종유', 1),
+('油', '菜種油', '채종유', 2),
+('菜', '菜花', '채화', 0),
+('花', '菜花', '채화', 1),
+('菜', '菜蔬', '채소', 0),
+('蔬', '菜蔬', '채소', 1),
+('菜', '菜食', '채식', 0),
+('食', '菜食', '채식', 1),
+('菜', '菜食主義', '채식주의', 0),
+('食', '菜食主義', '채식주의', 1),
+('主', '菜食主義', '채식주의', 2),
+('義', '菜食主義', '채식주의', 3),
+('菜', '菜食主義者', '채식주의자', 0),
+('食', '菜食主義者', '채식주의자', 1),
+('主', '菜食主義者', '채식주의자', 2),
+('義', '菜食主義者', '채식주의자', 3),
+('者', '菜食主義者', '채식주의자', 4),
+('菩', '菩提', '보리', 0),
+('提', '菩提', '보리', 1),
+('菩', '菩提樹', '보리수', 0),
+('提', '菩提樹', '보리수', 1),
+('樹', '菩提樹', '보리수', 2),
+('菩', '菩薩', '보살', 0),
+('薩', '菩薩', '보살', 1),
+('華', '華僑', '화교', 0),
+('僑', '華僑', '화교', 1),
+('華', '華商', '화상', 0),
+('商', '華商', '화상', 1),
+('華', '華夏', '화하', 0),
+('夏', '華夏', '화하', 1),
+('華', '華府', '화부', 0),
+('府', '華府', '화부', 1),
+('華', '華氏', '화씨', 0),
+('氏', '華氏', '화씨', 1),
+('華', '華語', '화어', 0),
+('語', '華語', '화어', 1),
+('華', '華陀', '화타', 0),
+('陀', '華陀', '화타', 1),
+('華', '華麗', '화려', 0),
+('麗', '華麗', '화려', 1),
+('菹', '菹醢', '저해', 0),
+('醢', '菹醢', '저해', 1),
+('菽', '菽水', '숙수', 0),
+('水', '菽水', '숙수', 1),
+('萌', '萌芽', '맹아', 0),
+('芽', '萌芽', '맹아', 1),
+('萎', '萎縮', '위축', 0),
+('縮', '萎縮', '위축', 1),
+('萬', '萬', '만', 0),
+('萬', '萬一', '만일', 0),
+('一', '萬一', '만일', 1),
+('萬', '萬丈', '만장', 0),
+('丈', '萬丈', '만장', 1),
+('萬', '萬事', '만사', 0),
+('事', '萬事', '만사', 1),
+('萬', '萬人', '만인', 0),
+('人', '萬人', '만인', 1),
+('萬', '萬億', '만억', 0),
+('億', '萬億', '만억', 1),
+('萬', '萬國', '만국', 0),
+('國', '萬國', '만국', 1),
+('萬', '萬國旗', '만국기', 0),
+('國', '萬國旗', '만국기', 1),
+('旗', '萬國旗', '만국기', 2),
+('萬', '萬壽', '만수', 0),
+('壽', '萬壽', '만수', 1),
+('萬', '萬壽無疆', '만수무강', 0),
+('壽', '萬壽無疆', '만수무강', 1),
+('無', '萬壽無疆', '만수무강', 2),
+('疆', '萬壽無疆', '만수무강', 3),
+('萬', '萬年筆', '만년필', 0),
+('年', '萬年筆', '만년필', 1),
+('筆', '萬年筆', '만년필', 2),
+('萬', '萬愚節', '만우절', 0),
+('愚', '萬愚節', '만우절', 1),
+('節', '萬愚節', '만우절', 2),
+('萬', '萬景臺', '만경대', 0),
+('景', '萬景臺', '만경대', 1),
+('臺', '萬景臺', '만경대', 2),
+('萬', '萬有', '만유', 0),
+('有', '萬有', '만유', 1),
+('萬', '萬有引力', '만유인력', 0),
+('有', '萬有引力', '만유인력', 1),
+('引', '萬有引力', '만유인력', 2),
+('力', '萬有引力', '만유인력', 3),
+('萬', '萬機', '만기', 0),
+('機', '萬機', '만기', 1),
+('萬', '萬歲', '만세', 0),
+('歲', '萬歲', '만세', 1),
+('萬', '萬民法', '만민법', 0),
+('民', '萬民法', '만민법', 1),
+('法', '萬民法', '만민법', 2),
+('萬', '萬物', '만물', 0),
+('物', '萬物', '만물', 1),
+('萬', '萬狀', '만상', 0),
+('狀', '萬狀', '만상', 1),
+('萬', '萬病', '만병', 0),
+('病', '萬病', '만병', 1),
+('萬', '萬病通治藥', '만병통치약', 0),
+('病', '萬病通治藥', '만병통치약', 1),
+('通', '萬病通治藥', '만병통치약', 2),
+('治', '萬病通治藥', '만병통치약', 3),
+('藥', '萬病通治藥', '만병통치약', 4),
+('萬', '萬神', '만신', 0),
+('神', '萬神', '만신', 1),
+('萬', '萬能', '만능', 0),
+('能', '萬能', '만능', 1),
+('萬', '萬若', '만약', 0),
+('若', '萬若', '만약', 1),
+('萬', '萬華鏡', '만화경', 0),
+('華', '萬華鏡', '만화경', 1),
+('鏡', '萬華鏡', '만화경', 2),
+('萬', '萬萬歲', '만만세', 0),
+('萬', '萬萬歲', '만만세', 1),
+('歲', '萬萬歲', '만만세', 2),
+('萬', '萬葉集', '만엽집', 0),
+('葉', '萬葉集', '만엽집', 1),
+('集', '萬葉集', '만엽집', 2),
+('萬', '萬象', '만상', 0),
+('象', '萬象', '만상', 1),
+('萬', '萬里花', '만리화', 0),
+('里', '萬里花', '만리화', 1),
+('花', '萬里花', '만리화', 2),
+('萬', '萬里長城', '만리장성', 0),
+('里', '萬里長城', '만리장성', 1),
+('長', '萬里長城', '만리장성', 2),
+('城', '萬里長城', '만리장성', 3),
+('落', '落下', '낙하', 0),
+('下', '落下', '낙하', 1),
+('落', '落下傘', '낙하산', 0),
+('下', '落下傘', '낙하산', 1),
+('傘', '落下傘', '낙하산', 2),
+('落', '落下傘', '락하산', 0),
+('下', '落下傘', '락하산', 1),
+('傘', '落下傘', '락하산', 2),
+('落', '落書', '낙서', 0),
+('書', '落書', '낙서', 1),
+('落', '落望', '낙망', 0),
+('望', '落望', '낙망', 1),
+('落', '落水', '낙수', 0),
+('水', '落水', '낙수', 1),
+('落', '落穗', '낙수', 0),
+('穗', '落穗', '낙수', 1),
+('落', '落第', '낙제', 0),
+('第', '落第', '낙제', 1),
+('落', '落第點', '낙제점', 0),
+('第', '落第點', '낙제점', 1),
+('點', '落第點', '낙제점', 2),
+('落', '落胎', '낙태', 0),
+('胎', '落胎', '낙태', 1),
+('落', '落膽', '낙담', 0),
+('膽', '落膽', '낙담', 1),
+('落', '落花生', '낙화생', 0),
+('花', '落花生', '낙화생', 1),
+('生', '落花生', '낙화생', 2),
+('落', '落葉', '낙엽', 0),
+('葉', '落葉', '낙엽', 1),
+('落', '落葉松', '낙엽송', 0),
+('葉', '落葉松', '낙엽송', 1),
+('松', '落葉松', '낙엽송', 2),
+('落', '落薦', '낙천', 0),
+('薦', '落薦', '낙천', 1),
+('落', '落薦者', '낙천자', 0),
+('薦', '落薦者', '낙천자', 1),
+('者', '落薦者', '낙천자', 2),
+('落', '落鄕', '낙향', 0),
+('鄕', '落鄕', '낙향', 1),
+('葉', '葉', '엽', 0),
+('葉', '葉卷煙', '엽궐련', 0),
+('卷', '葉卷煙', '엽궐련', 1),
+('煙', '葉卷煙', '엽궐련', 2),
+('葉', '葉書', '엽서', 0),
+('書', '葉書', '엽서', 1),
+('葉', '葉綠素', '엽록소', 0),
+('綠', '葉綠素', '엽록소', 1),
+('素', '葉綠素', '엽록소', 2),
+('葉', '葉綠體', '엽록체', 0),
+('綠', '葉綠體', '엽록체', 1),
+('體', '葉綠體', '엽록체', 2),
+('葉', '葉脈', '엽맥', 0),
+('脈', '葉脈', '엽맥', 1),
+('葉', '葉芽', '엽아', 0),
+('芽', '葉芽', '엽아', 1),
+('葉', '葉蘭', '엽란', 0),
+('蘭', '葉蘭', '엽란', 1),
+('葉', '葉酸', '엽산', 0),
+('酸', '葉酸', '엽산', 1),
+('葉', '葉錢', '엽전', 0),
+('錢', '葉錢', '엽전', 1),
+('著', '著', '저', 0),
+('著', '著作', '저작', 0),
+('作', '著作', '저작', 1),
+('著', '著作權', '저작권', 0),
+('作', '著作權', '저작권', 1),
+('權', '著作權', '저작권', 2),
+('著', '著者', '저자', 0),
+('者', '著者', '저자', 1),
+('著', '著述', '저술', 0),
+('述', '著述', '저술', 1),
+('葛', '葛藤', '갈등', 0),
+('藤', '葛藤', '갈등', 1),
+('葡', '葡萄', '포도', 0),
+('萄', '葡萄', '포도', 1),
+('葡', '葡萄園', '포도원', 0),
+('萄', '葡萄園', '포도원', 1),
+('園', '葡萄園', '포도원', 2),
+('葡', '葡萄彈', '포도탄', 0),
+('萄', '葡萄彈', '포도탄', 1),
+('彈', '葡萄彈', '포도탄', 2),
+('葡', '葡萄牙', '포도아', 0),
+('萄', '葡萄牙', '포도아', 1),
+('牙', '葡萄牙', '포도아', 2),
+('葡', '葡萄狀球菌', '포도상구균', 0),
+('萄', '葡萄狀球菌', '포도상구균', 1),
+('狀', '葡萄狀球菌', '포도상구균', 2),
+('球', '葡萄狀球菌', '포도상구균', 3),
+('菌', '葡萄狀球菌', '포도상구균', 4),
+('葡', '葡萄球菌', '포도구균', 0),
+('萄', '葡萄球菌', '포도구균', 1),
+('球', '葡萄球菌', '포도구균', 2),
+('菌', '葡萄球菌', '포도구균', 3),
+('葡', '葡萄糖', '포도당', 0),
+('萄', '葡萄糖', '포도당', 1),
+('糖', '葡萄糖', '포도당', 2),
+('葡', '葡萄色', '포도색', 0),
+('萄', '葡萄色', '포도색', 1),
+('色', '葡萄色', '포도색', 2),
+('葡', '葡萄酒', '포도주', 0),
+('萄', '葡萄酒', '포도주', 1),
+('酒', '葡萄酒', '포도주', 2),
+('葡', '葡語', '포어', 0),
+('語', '葡語', '포어', 1),
+('葬', '葬式', '장식', 0),
+('式', '葬式', '장식', 1),
+('葬', '葬禮', '장례', 0),
+('禮', '葬禮', '장례', 1),
+('葬', '葬禮式', '장례식', 0),
+('禮', '葬禮式', '장례식', 1),
+('式', '葬禮式', '장례식', 2),
+('葬', '葬需', '장수', 0),
+('需', '葬需', '장수', 1),
+('葶', '葶藶', '정력', 0),
+('藶', '葶藶', '정력', 1),
+('蒐', '蒐集', '수집', 0),
+('集', '蒐集', '수집', 1),
+('蒙', '蒙古', '몽고', 0),
+('古', '蒙古', '몽고', 1),
+('蒙', '蒙古人', '몽고인', 0),
+('古', '蒙古人', '몽고인', 1),
+('人', '蒙古人', '몽고인', 2),
+('蒙', '蒙古斑', '몽고반', 0),
+('古', '蒙古斑', '몽고반', 1),
+('斑', '蒙古斑', '몽고반', 2),
+('蒙', '蒙古點', '몽고점', 0),
+('古', '蒙古點', '몽고점', 1),
+('點', '蒙古點', '몽고점', 2),
+('蒙', '蒙昧', '몽매', 0),
+('昧', '蒙昧', '몽매', 1),
+('蒙', '蒙昧主義', '몽매주의', 0),
+('昧', '蒙昧主義', '몽매주의', 1),
+('主', '蒙昧主義', '몽매주의', 2),
+('義', '蒙昧主義', '몽매주의', 3),
+('蒙', '蒙疆', '몽강', 0),
+('疆', '蒙疆', '몽강', 1),
+('蒙', '蒙語', '몽어', 0),
+('語', '蒙語', '몽어', 1),
+('蒙', '蒙首', '몽수', 0),
+('首', '蒙首', '몽수', 1),
+('蒲', '蒲希米亞', '포희미아', 0),
+('希', '蒲希米亞', '포희미아', 1),
+('米', '蒲希米亞', '포희미아', 2),
+('亞', '蒲希米亞', '포희미아', 3),
+('蒸', '蒸氣', '증기', 0),
+('氣', '蒸氣', '증기', 1),
+('蒸', '蒸氣船', '증기선', 0),
+('氣', '蒸氣船', '증기선', 1),
+('船', '蒸氣船', '증기선', 2),
+('蒸', '蒸溜', '증류', 0),
+('溜', '蒸溜', '증류', 1),
+('蒸', '蒸溜水', '증류수', 0),
+('溜', '蒸溜水', '증류수', 1),
+('水', '蒸溜水', '증류수', 2),
+('蒸', '蒸發', '증발', 0),
+('發', '蒸發', '증발', 1),
+('蒸', '蒸편', '증편', 0),
+('편', '蒸편', '증편', 1),
+('蒼', '蒼朮', '창출', 0),
+('朮', '蒼朮', '창출', 1),
+('蒼', '蒼白', '창백', 0),
+('白', '蒼白', '창백', 1),
+('蒼', '蒼空', '창공', 0),
+('空', '蒼空', '창공', 1),
+('蒼', '蒼蒼', '창창', 0),
+('蒼', '蒼蒼', '창창', 1),
+('蒼', '蒼鉛', '창연', 0),
+('鉛', '蒼鉛', '창연', 1),
+('蓄', '蓄積', '축적', 0),
+('積', '蓄積', '축적', 1),
+('蓄', '蓄膿症', '축농증', 0),
+('膿', '蓄膿症', '축농증', 1),
+('症', '蓄膿症', '축농증', 2),
+('蓄', '蓄電器', '축전기', 0),
+('電', '蓄電器', '축전기', 1),
+('器', '蓄電器', '축전기', 2),
+('蓄', '蓄電池', '축전지', 0),
+('電', '蓄電池', '축전지', 1),
+('池', '蓄電池', '축전지', 2),
+('蓄', '蓄音機', '축음기', 0),
+('音', '蓄音機', '축음기', 1),
+('機', '蓄音機', '축음기', 2),
+('蓋', '蓋然性', '개연성', 0),
+('然', '蓋然性', '개연성', 1),
+('性', '蓋然性', '개연성', 2),
+('蓚', '蓚酸', '수산', 0),
+('酸', '蓚酸', '수산', 1),
+('蓬', '蓬荗', '봉술', 0),
+('荗', '蓬荗', '봉술', 1),
+('蓮', '蓮—', '연꽃', 0),
+('—', '蓮—', '연꽃', 1),
+('蓮', '蓮子', '연자', 0),
+('子', '蓮子', '연자', 1),
+('蓮', '蓮根', '연근', 0),
+('根', '蓮根', '연근', 1),
+('蓮', '蓮뿌리', '연뿌리', 0),
+('뿌', '蓮뿌리', '연뿌리', 1),
+('리', '蓮뿌리', '연뿌리', 2),
+('蓴', '蓴菜', '순채', 0),
+('菜', '蓴菜', '순채', 1),
+('蔑', '蔑視', '멸시', 0),
+('視', '蔑視', '멸시', 1),
+('蔓', '蔓延', '만연', 0),
+('延', '蔓延', '만연', 1),
+('蔓', '蔓衍', '만연', 0),
+('衍', '蔓衍', '만연', 1),
+('蔓', '蔓衍體', '만연체', 0),
+('衍', '蔓衍體', '만연체', 1),
+('體', '蔓衍體', '만연체', 2),
+('蔗', '蔗糖', '자당', 0),
+('糖', '蔗糖', '자당', 1),
+('蔘', '蔘茶', '삼다', 0),
+('茶', '蔘茶', '삼다', 1),
+('蔘', '蔘鷄湯', '삼계탕', 0),
+('鷄', '蔘鷄湯', '삼계탕', 1),
+('湯', '蔘鷄湯', '삼계탕', 2),
+('蔚', '蔚山', '울산', 0),
+('山', '蔚山', '울산', 1),
+('蔽', '蔽空', '폐공', 0),
+('空', '蔽空', '폐공', 1),
+('蕃', '蕃息', '번식', 0),
+('息', '蕃息', '번식', 1),
+('蕃', '蕃族', '번족', 0),
+('族', '蕃族', '번족', 1),
+('蕃', '蕃殖', '번식', 0),
+('殖', '蕃殖', '번식', 1),
+('蕎', '蕎麥', '교맥', 0),
+('麥', '蕎麥', '교맥', 1),
+('蕩', '蕩子', '탕자', 0),
+('子', '蕩子', '탕자', 1),
+('蕩', '蕩平菜', '탕평채', 0),
+('平', '蕩平菜', '탕평채', 1),
+('菜', '蕩平菜', '탕평채', 2),
+('蕪', '蕪菁', '무청', 0),
+('菁', '蕪菁', '무청', 1),
+('蕭', '蕭瑟', '소슬', 0),
+('瑟', '蕭瑟', '소슬', 1),
+('薄', '薄俸', '박봉', 0),
+('俸', '薄俸', '박봉', 1),
+('薄', '薄命', '박명', 0),
+('命', '薄命', '박명', 1),
+('薄', '薄弱', '박약', 0),
+('弱', '薄弱', '박약', 1),
+('薄', '薄明', '박명', 0),
+('明', '薄明', '박명', 1),
+('薄', '薄荷', '박하', 0),
+('荷', '薄荷', '박하', 1),
+('薄', '薄葉紙', '박엽지', 0),
+('葉', '薄葉紙', '박엽지', 1),
+('紙', '薄葉紙', '박엽지', 2),
+('薇', '薇菜', '미채', 0),
+('菜', '薇菜', '미채', 1),
+('薑', '薑板', '강판', 0),
+('板', '薑板', '강판', 1),
+('薔', '薔薇', '장미', 0),
+('薇', '薔薇', '장미', 1),
+('薔', '薔薇水', '장미수', 0),
+('薇', '薔薇水', '장미수', 1),
+('水', '薔薇水', '장미수', 2),
+('薛', '薛延陀', '설연타', 0),
+('延', '薛延陀', '설연타', 1),
+('陀', '薛延陀', '설연타', 2),
+('薜', '薜', '벽', 0),
+('薦', '薦引', '천인', 0),
+('引', '薦引', '천인', 1),
+('薦', '薦擧', '천거', 0),
+('擧', '薦擧', '천거', 1),
+('薪', '薪柴', '신시', 0),
+('柴', '薪柴', '신시', 1),
+('薰', '薰製', '훈제', 0),
+('製', '薰製', '훈제', 1),
+('藁', '藁草', '고초', 0),
+('草', '藁草', '고초', 1),
+('藍', '藍色', '남색', 0),
+('色', '藍色', '남색', 1),
+('藏', '藏書', '장서', 0),
+('書', '藏書', '장서', 1),
+('藝', '藝名', '예명', 0),
+('名', '藝名', '예명', 1),
+('藝', '藝能', '예능', 0),
+('能', '藝能', '예능', 1),
+('藝', '藝術', '예술', 0),
+('術', '藝術', '예술', 1),
+('藝', '藝術品', '예술품', 0),
+('術', '藝術品', '예술품', 1),
+('品', '藝術品', '예술품', 2),
+('藝', '藝術家', '예술가', 0),
+('術', '藝術家', '예술가', 1),
+('家', '藝術家', '예술가', 2),
+('藝', '藝術界', '예술계', 0),
+('術', '藝術界', '예술계', 1),
+('界', '藝術界', '예술계', 2),
+('藤', '藤本', '등본', 0),
+('本', '藤本', '등본', 1),
+('藥', '藥', '약', 0),
+('藥', '藥劑', '약제', 0),
+('劑', '藥劑', '약제', 1),
+('藥', '藥劑學', '약제학', 0),
+('劑', '藥劑學', '약제학', 1),
+('學', '藥劑學', '약제학', 2),
+('藥', '藥劑師', '약제사', 0),
+('劑', '藥劑師', '약제사', 1),
+('師', '藥劑師', '약제사', 2),
+('藥', '藥品', '약품', 0),
+('品', '藥品', '약품', 1),
+('藥', '藥大', '약대', 0),
+('大', '藥大', '약대', 1),
+('藥', '藥學', '약학', 0),
+('學', '藥學', '약학', 1),
+('藥', '藥室', '약실', 0),
+('室', '藥室', '약실', 1),
+('藥', '藥局', '약국', 0),
+('局', '藥局', '약국', 1),
+('藥', '藥師', '약사', 0),
+('師', '藥師', '약사', 1),
+('藥', '藥房', '약방', 0),
+('房', '藥房', '약방', 1),
+('藥', '藥指', '약지', 0),
+('指', '藥指', '약지', 1),
+('藥', '藥效', '약효', 0),
+('效', '藥效', '약효', 1),
+('藥', '藥材', '약재', 0),
+('材', '藥材', '약재', 1),
+('藥', '藥果', '약과', 0),
+('果', '藥果', '약과', 1),
+('藥', '藥水', '약수', 0),
+('水', '藥水', '약수', 1),
+('藥', '藥物', '약물', 0),
+('物', '藥物', '약물', 1),
+('藥', '藥理學', '약리학', 0),
+('理', '藥理學', '약리학', 1),
+('學', '藥理學', '약리학', 2),
+('藥', '藥瓶', '약병', 0),
+('瓶', '藥瓶', '약병', 1),
+('藥', '藥疹', '약진', 0),
+('疹', '藥疹', '약진', 1),
+('藥', '藥草', '약초', 0),
+('草', '藥草', '약초', 1),
+('藥', '藥草學者', '약초학자', 0),
+('草', '藥草學者', '약초학자', 1),
+('學', '藥草學者', '약초학자', 2),
+('者', '藥草學者', '약초학자', 3),
+('藥', '藥莢', '약협', 0),
+('莢', '藥莢', '약협', 1),
+('藥', '藥酒', '약주', 0),
+('酒', '藥酒', '약주', 1),
+('藥', '藥食', '약식', 0),
+('食', '藥食', '약식', 1),
+('藥', '藥밥', '약밥', 0),
+('밥', '藥밥', '약밥', 1),
+('藻', '藻類', '조류', 0),
+('類', '藻類', '조류', 1),
+('藻', '藻類學', '조류학', 0),
+('類', '藻類學', '조류학', 1),
+('學', '藻類學', '조류학', 2),
+('蘇', '蘇生', '소생', 0),
+('生', '蘇生', '소생', 1),
+('蘇', '蘇芳', '소방', 0),
+('芳', '蘇芳', '소방', 1),
+('蘘', '蘘荷', '양하', 0),
+('荷', '蘘荷', '양하', 1),
+('蘭', '蘭', '란', 0),
+('蘭', '蘭學', '난학', 0),
+('學', '蘭學', '난학', 1),
+('蘭', '蘭草', '난초', 0),
+('草', '蘭草', '난초', 1),
+('蘿', '蘿蔔', '나복', 0),
+('蔔', '蘿蔔', '나복', 1),
+('虎', '虎列刺', '호열자', 0),
+('列', '虎列刺', '호열자', 1),
+('刺', '虎列刺', '호열자', 2),
+('虎', '虎口', '호구', 0),
+('口', '虎口', '호구', 1),
+('虎', '虎杖根', '호장근', 0),
+('杖', '虎杖根', '호장근', 1),
+('根', '虎杖根', '호장근', 2),
+('虎', '虎狼', '호랑', 0),
+('狼', '虎狼', '호랑', 1),
+('虎', '虎狼-', '호랑이', 0),
+('狼', '虎狼-', '호랑이', 1),
+('-', '虎狼-', '호랑이', 2),
+('虎', '虎狼이', '호랑이', 0),
+('狼', '虎狼이', '호랑이', 1),
+('이', '虎狼이', '호랑이', 2),
+('虎', '虎皮', '호피', 0),
+('皮', '虎皮', '호피', 1),
+('虐', '虐待', '학대', 0),
+('待', '虐待', '학대', 1),
+('虐', '虐殺', '학살', 0),
+('殺', '虐殺', '학살', 1),
+('處', '處分', '처분', 0),
+('分', '處分', '처분', 1),
+('處', '處刑', '처형', 0),
+('刑', '處刑', '처형', 1),
+('處', '處地', '처지', 0),
+('地', '處地', '처지', 1),
+('處', '處女', '처녀', 0),
+('女', '處女', '처녀', 1),
+('處', '處女性', '처녀성', 0),
+('女', '處女性', '처녀성', 1),
+('性', '處女性', '처녀성', 2),
+('處', '處女林', '처녀림', 0),
+('女', '處女林', '처녀림', 1),
+('林', '處女林', '처녀림', 2),
+('處', '處女膜', '처녀막', 0),
+('女', '處女膜', '처녀막', 1),
+('膜', '處女膜', '처녀막', 2),
+('處', '處子', '처자', 0),
+('子', '處子', '처자', 1),
+('處', '處斬', '처참', 0),
+('斬', '處斬', '처참', 1),
+('處', '處方', '처방', 0),
+('方', '處方', '처방', 1),
+('處', '處方箋', '처방전', 0),
+('方', '處方箋', '처방전', 1),
+('箋', '處方箋', '처방전', 2),
+('處', '處格', '처격', 0),
+('格', '處格', '처격', 1),
+('處', '處理', '처리', 0),
+('理', '處理', '처리', 1),
+('處', '處置', '처치', 0),
+('置', '處置', '처치', 1),
+('處', '處罰', '처벌', 0),
+('罰', '處罰', '처벌', 1),
+('處', '處身', '처신', 0),
+('身', '處身', '처신', 1),
+('虛', '虛僞', '허위', 0),
+('僞', '虛僞', '허위', 1),
+('虛', '虛勢', '허세', 0),
+('勢', '虛勢', '허세', 1),
+('虛', '虛弱', '허약', 0),
+('弱', '虛弱', '허약', 1),
+('虛', '虛數', '허수', 0),
+('數', '虛數', '허수', 1),
+('虛', '虛榮', '허영', 0),
+('榮', '虛榮', '허영', 1),
+('虛', '虛榮心', '허영심', 0),
+('榮', '虛榮心', '허영심', 1),
+('心', '虛榮心', '허영심', 2),
+('虛', '虛構', '허구', 0),
+('構', '虛構', '허구', 1),
+('虛', '虛無主義', '허무주의', 0),
+('無', '虛無主義', '허무주의', 1),
+('主', '虛無主義', '허무주의', 2),
+('義', '虛無主義', '허무주의', 3),
+('虛', '虛無孟浪', '허무맹랑', 0),
+('無', '虛無孟浪', '허무맹랑', 1),
+('孟', '虛無孟浪', '허무맹랑', 2),
+('浪', '虛無孟浪', '허무맹랑', 3),
+('虛', '虛空', '허공', 0),
+('空', '虛空', '허공', 1),
+('虛', '虛風', '허풍', 0),
+('風', '虛風', '허풍', 1),
+('虛', '虛點', '허점', 0),
+('點', '虛點', '허점', 1),
+('虜', '虜獲', '로획', 0),
+('獲', '虜獲', '로획', 1),
+('虞', '虞人', '우인', 0),
+('人', '虞人', '우인', 1),
+('號', '號', '호', 0),
+('號', '號哭', '호곡', 0),
+('哭', '號哭', '호곡', 1),
+('號', '號外', '호외', 0),
+('外', '號外', '호외', 1),
+('號', '號室', '호실', 0),
+('室', '號室', '호실', 1),
+('號', '號數', '호수', 0),
+('數', '號數', '호수', 1),
+('號', '號泣', '호읍', 0),
+('泣', '號泣', '호읍', 1),
+('號', '號線', '호선', 0),
+('線', '號線', '호선', 1),
+('號', '號角', '호각', 0),
+('角', '號角', '호각', 1),
+('虹', '虹彩', '홍채', 0),
+('彩', '虹彩', '홍채', 1),
+('虹', '虹霓', '홍예', 0),
+('霓', '虹霓', '홍예', 1),
+('蚩', '蚩尤', '치우', 0),
+('尤', '蚩尤', '치우', 1),
+('蚯', '蚯蚓', '구인', 0),
+('蚓', '蚯蚓', '구인', 1),
+('蛇', '蛇紋石', '사문석', 0),
+('紋', '蛇紋石', '사문석', 1),
+('石', '蛇紋石', '사문석', 2),
+('蛇', '蛇行', '사행', 0),
+('行', '蛇行', '사행', 1),
+('蛇', '蛇足', '사족', 0),
+('足', '蛇足', '사족', 1),
+('蛇', '蛇頭貝母', '사두패모', 0),
+('頭', '蛇頭貝母', '사두패모', 1),
+('貝', '蛇頭貝母', '사두패모', 2),
+('母', '蛇頭貝母', '사두패모', 3),
+('蛋', '蛋白', '단백', 0),
+('白', '蛋白', '단백', 1),
+('蛋', '蛋白質', '단백질', 0),
+('白', '蛋白質', '단백질', 1),
+('質', '蛋白質', '단백질', 2),
+('蛔', '蛔', '휘', 0),
+('蛔', '蛔蟲', '회충', 0),
+('蟲', '蛔蟲', '회충', 1),
+('蛞', '蛞蝓', '활유', 0),
+('蝓', '蛞蝓', '활유', 1),
+('蜂', '蜂巢', '봉소', 0),
+('巢', '蜂巢', '봉소', 1),
+('蜂', '蜂蜜', '봉밀', 0),
+('蜜', '蜂蜜', '봉밀', 1),
+('蜂', '蜂蠟', '봉랍', 0),
+('蠟', '蜂蠟', '봉랍', 1),
+('蜂', '蜂起', '봉기', 0),
+('起', '蜂起', '봉기', 1),
+('蜃', '蜃氣樓', '신기루', 0),
+('氣', '蜃氣樓', '신기루', 1),
+('樓', '蜃氣樓', '신기루', 2),
+('蜘', '蜘蛛', '지주', 0),
+('蛛', '蜘蛛', '지주', 1),
+('蜜', '蜜', '밀', 0),
+('蜜', '蜜月', '밀월', 0),
+('月', '蜜月', '밀월', 1),
+('蜜', '蜜柑', '밀감', 0),
+('柑', '蜜柑', '밀감', 1),
+('蜜', '蜜蠟', '밀랍', 0),
+('蠟', '蜜蠟', '밀랍', 1),
+('蜜', '蜜酒', '밀주', 0),
+('酒', '蜜酒', '밀주', 1),
+('蜿', '蜿蜒', '완연', 0),
+('蜒', '蜿蜒', '완연', 1),
+('蝙', '蝙蝠', '편복', 0),
+('蝠', '蝙蝠', '편복', 1),
+('蝴', '蝴蝶', '호접', 0),
+('蝶', '蝴蝶', '호접', 1),
+('蝸', '蝸牛', '와우', 0),
+('牛', '蝸牛', '와우', 1),
+('蝸', '蝸角之爭', '와각지쟁', 0),
+('角', '蝸角之爭', '와각지쟁', 1),
+('之', '蝸角之爭', '와각지쟁', 2),
+('爭', '蝸角之爭', '와각지쟁', 3),
+('蝾', '蝾螈', '영원', 0),
+('螈', '蝾螈', '영원', 1),
+('融', '融合', '융합', 0),
+('合', '融合', '융합', 1),
+('融', '融和', '융화', 0),
+('和', '融和', '융화', 1),
+('融', '融解', '융해', 0),
+('解', '融解', '융해', 1),
+('融', '融資', '융자', 0),
+('資', '融資', '융자', 1),
+('融', '融資金', '융자금', 0),
+('資', '融資金', '융자금', 1),
+('金', '融資金', '융자금', 2),
+('融', '融通', '융통', 0),
+('通', '融通', '융통', 1),
+('融', '融點', '융점', 0),
+('點', '融點', '융점', 1),
+('螢', '螢', '형', 0),
+('螢', '螢光', '형광', 0),
+('光', '螢光', '형광', 1),
+('螢', '螢光燈', '형광등', 0),
+('光', '螢光燈', '형광등', 1),
+('燈', '螢光燈', '형광등', 2),
+('螢', '螢光色', '형광색', 0),
+('光', '螢光色', '형광색', 1),
+('色', '螢光色', '형광색', 2),
+('螢', '螢火', '형화', 0),
+('火', '螢火', '형화', 1),
+('螢', '螢石', '형석', 0),
+('石', '螢石', '형석', 1),
+('螳', '螳螂', '당랑', 0),
+('螂', '螳螂', '당랑', 1),
+('螺', '螺旋', '나선', 0),
+('旋', '螺旋', '나선', 1),
+('螺', '螺旋', '라선', 0),
+('旋', '螺旋', '라선', 1),
+('螺', '螺旋形', '나선형', 0),
+('旋', '螺旋形', '나선형', 1),
+('形', '螺旋形', '나선형', 2),
+('螺', '螺旋狀', '나선상', 0),
+('旋', '螺旋狀', '나선상', 1),
+('狀', '螺旋狀', '나선상', 2),
+('螺', '螺絲', '나사', 0),
+('絲', '螺絲', '나사', 1),
+('螺', '螺角', '나각', 0),
+('角', '螺角', '나각', 1),
+('螺', '螺鈿', '나전', 0),
+('鈿', '螺鈿', '나전', 1),
+('蟋', '蟋蟀', '실솔', 0),
+('蟀', '蟋蟀', '실솔', 1),
+('蟯', '蟯蟲', '요충', 0),
+('蟲', '蟯蟲', '요충', 1),
+('蟲', '蟲', '충', 0),
+('蟲', '蟲垂', '충수', 0),
+('垂', '蟲垂', '충수', 1),
+('蟲', '蟲疥', '충개', 0),
+('疥', '蟲疥', '충개', 1),
+('蟲', '蟲豸', '충치', 0),
+('豸', '蟲豸', '충치', 1),
+('蟲', '蟲齒', '충치', 0),
+('齒', '蟲齒', '충치', 1),
+('蠑', '蠑螈', '영원', 0),
+('螈', '蠑螈', '영원', 1),
+('蠟', '蠟燭', '납촉', 0),
+('燭', '蠟燭', '납촉', 1),
+('蠟', '蠟石', '납석', 0),
+('石', '蠟石', '납석', 1),
+('蠟', '蠟紙', '납지', 0),
+('紙', '蠟紙', '납지', 1),
+('蠱', '蠱毒', '고독', 0),
+('毒', '蠱毒', '고독', 1),
+('蠶', '蠶豆', '잠두', 0),
+('豆', '蠶豆', '잠두', 1),
+('蠶', '蠶食', '잠식', 0),
+('食', '蠶食', '잠식', 1),
+('蠻', '蠻人', '만인', 0),
+('人', '蠻人', '만인', 1),
+('蠻', '蠻勇', '만용', 0),
+('勇', '蠻勇', '만용', 1),
+('蠻', '蠻夷', '만이', 0),
+('夷', '蠻夷', '만이', 1),
+('蠻', '蠻族', '만족', 0),
+('族', '蠻族', '만족', 1),
+('蠻', '蠻行', '만행', 0),
+('行', '蠻行', '만행', 1),
+('血', '血', '혈', 0),
+('血', '血塊', '혈괴', 0),
+('塊', '血塊', '혈괴', 1),
+('血', '血壓', '혈압', 0),
+('壓', '血壓', '혈압', 1),
+('血', '血壓計', '혈압계', 0),
+('壓', '血壓計', '혈압계', 1),
+('計', '血壓計', '혈압계', 2),
+('血', '血小板', '혈소판', 0),
+('小', '血小板', '혈소판', 1),
+('板', '血小板', '혈소판', 2),
+('血', '血栓', '혈전', 0),
+('栓', '血栓', '혈전', 1),
+('血', '血氣', '혈기', 0),
+('氣', '血氣', '혈기', 1),
+('血', '血液', '혈액', 0),
+('液', '血液', '혈액', 1),
+('血', '血液型', '혈액형', 0),
+('液', '血液型', '혈액형', 1),
+('型', '血液型', '혈액형', 2),
+('血', '血液學', '혈액학', 0),
+('液', '血液學', '혈액학', 1),
+('學', '血液學', '혈액학', 2),
+('血', '血淸', '혈청', 0),
+('淸', '血淸', '혈청', 1),
+('血', '血淸學', '혈청학', 0),
+('淸', '血淸學', '혈청학', 1),
+('學', '血淸學', '혈청학', 2),
+('血', '血清', '혈청', 0),
+('清', '血清', '혈청', 1),
+('血', '血清學', '혈청학', 0),
+('清', '血清學', '혈청학', 1),
+('學', '血清學', '혈청학', 2),
+('血', '血漿', '혈장', 0),
+('漿', '血漿', '혈장', 1),
+('血', '血球', '혈구', 0),
+('球', '血球', '혈구', 1),
+('血', '血痕', '혈흔', 0),
+('痕', '血痕', '혈흔', 1),
+('血', '血管', '혈관', 0),
+('管', '血管', '혈관', 1),
+('血', '血統', '혈통', 0),
+('統', '血統', '혈통', 1),
+('血', '血緣', '혈연', 0),
+('緣', '血緣', '혈연', 1),
+('血', '血緣關係', '혈연관계', 0),
+('緣', '血緣關係', '혈연관계', 1),
+('關', '血緣關係', '혈연관계', 2),
+('係', '血緣關係', '혈연관계', 3),
+('血', '血脈', '혈맥', 0),
+('脈', '血脈', '혈맥', 1),
+('血', '血色素', '혈색소', 0),
+('色', '血色素', '혈색소', 1),
+('素', '血色素', '혈색소', 2),
+('衆', '衆智', '중지', 0),
+('智', '衆智', '중지', 1),
+('衆', '衆生', '중생', 0),
+('生', '衆生', '중생', 1),
+('行', '行', '행', 0),
+('行', '行事', '행사', 0),
+('事', '行事', '행사', 1),
+('行', '行人', '행인', 0),
+('人', '行人', '행인', 1),
+('行', '行使', '행사', 0),
+('使', '行使', '행사', 1),
+('行', '行列', '행렬', 0),
+('列', '行列', '행렬', 1),
+('行', '行列字', '항렬자', 0),
+('列', '行列字', '항렬자', 1),
+('字', '行列字', '항렬자', 2),
+('行', '行列式', '행렬식', 0),
+('列', '行列式', '행렬식', 1),
+('式', '行列式', '행렬식', 2),
+('行', '行動', '행동', 0),
+('動', '行動', '행동', 1),
+('行', '行商', '행상', 0),
+('商', '行商', '행상', 1),
+('行', '行實', '행실', 0),
+('實', '行實', '행실', 1),
+('行', '行政', '행정', 0),
+('政', '行政', '행정', 1),
+('行', '行政區', '행정구', 0),
+('政', '行政區', '행정구', 1),
+('區', '行政區', '행정구', 2),
+('行', '行政區劃', '행정구획', 0),
+('政', '行政區劃', '행정구획', 1),
+('區', '行政區劃', '행정구획', 2),
+('劃', '行政區劃', '행정구획', 3),
+('行', '行政學', '행정학', 0),
+('政', '行政學', '행정학', 1),
+('學', '行政學', '행정학', 2),
+('行', '行方', '행방', 0),
+('方', '行方', '행방', 1),
+('行', '行星', '행성', 0),
+('星', '行星', '행성', 1),
+('行', '行書', '행서', 0),
+('書', '行書', '행서', 1),
+('行', '行李', '행리', 0),
+('李', '行李', '행리', 1),
+('行', '行次', '행차', 0),
+('次', '行次', '행차', 1),
+('行', '行爲', '행위', 0),
+('爲', '行爲', '행위', 1),
+('行', '行狀', '행장', 0),
+('狀', '行狀', '행장', 1),
+('行', '行程', '행정', 0),
+('程', '行程', '행정', 1),
+('行', '行裝', '행장', 0),
+('裝', '行裝', '행장', 1),
+('行', '行軍', '행군', 0),
+('軍', '行軍', '행군', 1),
+('行', '行進', '행진', 0),
+('進', '行進', '행진', 1),
+('行', '行間', '행간', 0),
+('間', '行間', '행간', 1),
+('行', '行首', '행수', 0),
+('首', '行首', '행수', 1),
+('衒', '衒學', '현학', 0),
+('學', '衒學', '현학', 1),
+('術', '術語', '술어', 0),
+('語', '術語', '술어', 1),
+('街', '街娼', '가창', 0),
+('娼', '街娼', '가창', 1),
+('街', '街角', '가각', 0),
+('角', '街角', '가각', 1),
+('街', '街販臺', '가판대', 0),
+('販', '街販臺', '가판대', 1),
+('臺', '街販臺', '가판대', 2),
+('街', '街路', '가로', 0),
+('路', '街路', '가로', 1),
+('街', '街路樹', '가로수', 0),
+('路', '街路樹', '가로수', 1),
+('樹', '街路樹', '가로수', 2),
+('街', '街路燈', '가로등', 0),
+('路', '街路燈', '가로등', 1),
+('燈', '街路燈', '가로등', 2),
+('街', '街頭女性', '가두녀성', 0),
+('頭', '街頭女性', '가두녀성', 1),
+('女', '街頭女性', '가두녀성', 2),
+('性', '街頭女性', '가두녀성', 3),
+('衙', '衙婢', '아비', 0),
+('婢', '衙婢', '아비', 1),
+('衛', '衛兵', '위병', 0),
+('兵', '衛兵', '위병', 1),
+('衛', '衛星', '위성', 0),
+('星', '衛星', '위성', 1),
+('衛', '衛生', '위생', 0),
+('生', '衛生', '위생', 1),
+('衛', '衛生室', '위생실', 0),
+('生', '衛生室', '위생실', 1),
+('室', '衛生室', '위생실', 2),
+('衝', '衝動', '충동', 0),
+('動', '衝動', '충동', 1),
+('衝', '衝擊', '충격', 0),
+('擊', '衝擊', '충격', 1),
+('衝', '衝突', '충돌', 0),
+('突', '衝突', '충돌', 1),
+('衢', '衢街', '구가', 0),
+('街', '衢街', '구가', 1),
+('衣', '衣服', '의복', 0),
+('服', '衣服', '의복', 1),
+('衣', '衣欌', '의장', 0),
+('欌', '衣欌', '의장', 1),
+('衣', '衣裳', '의상', 0),
+('裳', '衣裳', '의상', 1),
+('衣', '衣類', '의류', 0),
+('類', '衣類', '의류', 1),
+('衣', '衣食住', '의식주', 0),
+('食', '衣食住', '의식주', 1),
+('住', '衣食住', '의식주', 2),
+('表', '表', '표', 0),
+('表', '表情', '표정', 0),
+('情', '表情', '표정', 1),
+('表', '表意', '표의', 0),
+('意', '表意', '표의', 1),
+('表', '表意文字', '표의문자', 0),
+('意', '表意文字', '표의문자', 1),
+('文', '表意文字', '표의문자', 2),
+('字', '表意文字', '표의문자', 3),
+('表', '表明', '표명', 0),
+('明', '表明', '표명', 1),
+('表', '表決', '표결', 0),
+('決', '表決', '표결', 1),
+('表', '表現', '표현', 0),
+('現', '表現', '표현', 1),
+('表', '表現主義', '표현주의', 0),
+('現', '表現主義', '표현주의', 1),
+('主', '表現主義', '표현주의', 2),
+('義', '表現主義', '표현주의', 3),
+('表', '表現型', '표현형', 0),
+('現', '表現型', '표현형', 1),
+('型', '表現型', '표현형', 2),
+('表', '表示', '표시', 0),
+('示', '表示', '표시', 1),
+('表', '表紙', '표지', 0),
+('紙', '表紙', '표지', 1),
+('表', '表記', '표기', 0),
+('記', '表記', '표기', 1),
+('表', '表記法', '표기법', 0),
+('記', '表記法', '표기법', 1),
+('法', '表記法', '표기법', 2),
+('表', '表語文字', '표어문자', 0),
+('語', '表語文字', '표어문자', 1),
+('文', '表語文字', '표어문자', 2),
+('字', '表語文字', '표어문자', 3),
+('表', '表面', '표면', 0),
+('面', '表面', '표면', 1),
+('表', '表面張力', '표면장력', 0),
+('面', '表面張力', '표면장력', 1),
+('張', '表面張力', '표면장력', 2),
+('力', '表面張力', '표면장력', 3),
+('表', '表音', '표음', 0),
+('音', '表音', '표음', 1),
+('表', '表題', '표제', 0),
+('題', '表題', '표제', 1),
+('表', '表題語', '표제어', 0),
+('題', '表題語', '표제어', 1),
+('語', '表題語', '표제어', 2),
+('衰', '衰弱', '쇠약', 0),
+('弱', '衰弱', '쇠약', 1),
+('衰', '衰微', '쇠미', 0),
+('微', '衰微', '쇠미', 1),
+('衰', '衰減', '쇠감', 0),
+('減', '衰減', '쇠감', 1),
+('衰', '衰退', '쇠퇴', 0),
+('退', '衰退', '쇠퇴', 1),
+('衰', '衰頹', '쇠퇴', 0),
+('頹', '衰頹', '쇠퇴', 1),
+('衷', '衷心', '충심', 0),
+('心', '衷心', '충심', 1),
+('袂', '袂別', '몌별', 0),
+('別', '袂別', '몌별', 1),
+('袈', '袈裟', '가사', 0),
+('裟', '袈裟', '가사', 1),
+('袖', '袖珍本', '수진본', 0),
+('珍', '袖珍本', '수진본', 1),
+('本', '袖珍本', '수진본', 2),
+('被', '被乘數', '피승수', 0),
+('乘', '被乘數', '피승수', 1),
+('數', '被乘數', '피승수', 2),
+('被', '被加數', '피가수', 0),
+('加', '被加數', '피가수', 1),
+('數', '被加數', '피가수', 2),
+('被', '被動詞', '피동사', 0),
+('動', '被動詞', '피동사', 1),
+('詞', '被動詞', '피동사', 2),
+('被', '被告', '피고', 0),
+('告', '被告', '피고', 1),
+('被', '被告席', '피고석', 0),
+('告', '被告席', '피고석', 1),
+('席', '被告席', '피고석', 2),
+('被', '被子植物', '피자식물', 0),
+('子', '被子植物', '피자식물', 1),
+('植', '被子植物', '피자식물', 2),
+('物', '被子植物', '피자식물', 3),
+('被', '被害', '피해', 0),
+('害', '被害', '피해', 1),
+('被', '被害妄想', '피해망상', 0),
+('害', '被害妄想', '피해망상', 1),
+('妄', '被害妄想', '피해망상', 2),
+('想', '被害妄想', '피해망상', 3),
+('被', '被害者', '피해자', 0),
+('害', '被害者', '피해자', 1),
+('者', '被害者', '피해자', 2),
+('被', '被拉', '피랍', 0),
+('拉', '被拉', '피랍', 1),
+('被', '被擊', '피격', 0),
+('擊', '被擊', '피격', 1),
+('被', '被曝', '피폭', 0),
+('曝', '被曝', '피폭', 1),
+('被', '被減數', '피감수', 0),
+('減', '被減數', '피감수', 1),
+('數', '被減數', '피감수', 2),
+('被', '被爆者', '피폭자', 0),
+('爆', '被爆者', '피폭자', 1),
+('者', '被爆者', '피폭자', 2),
+('被', '被膜', '피막', 0),
+('膜', '被膜', '피막', 1),
+('被', '被虐', '피학', 0),
+('虐', '被虐', '피학', 1),
+('被', '被除數', '피제수', 0),
+('除', '被除數', '피제수', 1),
+('數', '被除數', '피제수', 2),
+('袷', '袷', '겹', 0),
+('裁', '裁判', '재판', 0),
+('判', '裁判', '재판', 1),
+('裁', '裁判官', '재판관', 0),
+('判', '裁判官', '재판관', 1),
+('官', '裁判官', '재판관', 2),
+('裁', '裁判所', '재판소', 0),
+('判', '裁判所', '재판소', 1),
+('所', '裁判所', '재판소', 2),
+('裁', '裁判權', '재판권', 0),
+('判', '裁判權', '재판권', 1),
+('權', '裁判權', '재판권', 2),
+('裁', '裁可', '재가', 0),
+('可', '裁可', '재가', 1),
+('裁', '裁定', '재정', 0),
+('定', '裁定', '재정', 1),
+('裁', '裁斷師', '재단사', 0),
+('斷', '裁斷師', '재단사', 1),
+('師', '裁斷師', '재단사', 2),
+('裁', '裁縫', '재봉', 0),
+('縫', '裁縫', '재봉', 1),
+('裁', '裁縫師', '재봉사', 0),
+('縫', '裁縫師', '재봉사', 1),
+('師', '裁縫師', '재봉사', 2),
+('裁', '裁縫틀', '재봉틀', 0),
+('縫', '裁縫틀', '재봉틀', 1),
+('틀', '裁縫틀', '재봉틀', 2),
+('裁', '裁量', '재량', 0),
+('量', '裁量', '재량', 1),
+('裂', '裂果', '열과', 0),
+('果', '裂果', '열과', 1),
+('裂', '裂罅', '열하', 0),
+('罅', '裂罅', '열하', 1),
+('裏', '裏作', '이작', 0),
+('作', '裏作', '이작', 1),
+('裏', '裏書', '이서', 0),
+('書', '裏書', '이서', 1),
+('裏', '裏面', '이면', 0),
+('面', '裏面', '이면', 1),
+('補', '補修', '보수', 0),
+('修', '補修', '보수', 1),
+('補', '補償', '보상', 0),
+('償', '補償', '보상', 1),
+('補', '補充', '보충', 0),
+('充', '補充', '보충', 1),
+('補', '補充法', '보충법', 0),
+('充', '補充法', '보충법', 1),
+('法', '補充法', '보충법', 2),
+('補', '補助', '보조', 0),
+('助', '補助', '보조', 1),
+('補', '補助動詞', '보조동사', 0),
+('助', '補助動詞', '보조동사', 1),
+('動', '補助動詞', '보조동사', 2),
+('詞', '補助動詞', '보조동사', 3),
+('補', '補助定理', '보조정리', 0),
+('助', '補助定理', '보조정리', 1),
+('定', '補助定理', '보조정리', 2),
+('理', '補助定理', '보조정리', 3),
+('補', '補助詞', '보조사', 0),
+('助', '補助詞', '보조사', 1),
+('詞', '補助詞', '보조사', 2),
+('補', '補完', '보완', 0),
+('完', '補完', '보완', 1),
+('補', '補正', '보정', 0),
+('正', '補正', '보정', 1),
+('補', '補給', '보급', 0),
+('給', '補給', '보급', 1),
+('補', '補綴', '보철', 0),
+('綴', '補綴', '보철', 1),
+('補', '補聽器', '보청기', 0),
+('聽', '補聽器', '보청기', 1),
+('器', '補聽器', '보청기', 2),
+('補', '補藥', '보약', 0),
+('藥', '補藥', '보약', 1),
+('補', '補語', '보어', 0),
+('語', '補語', '보어', 1),
+('補', '補足', '보족', 0),
+('足', '補足', '보족', 1),
+('補', '補身湯', '보신탕', 0),
+('身', '補身湯', '보신탕', 1),
+('湯', '補身湯', '보신탕', 2),
+('補', '補遺', '보유', 0),
+('遺', '補遺', '보유', 1),
+('補', '補體', '보체', 0),
+('體', '補體', '보체', 1),
+('裝', '裝備', '장비', 0),
+('備', '裝備', '장비', 1),
+('裝', '裝幀', '장정', 0),
+('幀', '裝幀', '장정', 1),
+('裝', '裝甲', '장갑', 0),
+('甲', '裝甲', '장갑', 1),
+('裝', '裝甲列車', '장갑렬차', 0),
+('甲', '裝甲列車', '장갑렬차', 1),
+('列', '裝甲列車', '장갑렬차', 2),
+('車', '裝甲列車', '장갑렬차', 3),
+('裝', '裝甲列車', '장갑열차', 0),
+('甲', '裝甲列車', '장갑열차', 1),
+('列', '裝甲列車', '장갑열차', 2),
+('車', '裝甲列車', '장갑열차', 3),
+('裝', '裝置', '장치', 0),
+('置', '裝置', '장치', 1),
+('裝', '裝訂', '장정', 0),
+('訂', '裝訂', '장정', 1),
+('裝', '裝飾', '장식', 0),
+('飾', '裝飾', '장식', 1),
+('裸', '裸像', '나상', 0),
+('像', '裸像', '나상', 1),
+('裸', '裸地', '나지', 0),
+('地', '裸地', '나지', 1),
+('裸', '裸眼', '나안', 0),
+('眼', '裸眼', '나안', 1),
+('裸', '裸體', '나체', 0),
+('體', '裸體', '나체', 1),
+('裸', '裸體', '라체', 0),
+('體', '裸體', '라체', 1),
+('製', '製作', '제작', 0),
+('作', '製作', '제작', 1),
+('製', '製作者', '제작자', 0),
+('作', '製作者', '제작자', 1),
+('者', '製作者', '제작자', 2),
+('製', '製品', '제품', 0),
+('品', '製品', '제품', 1),
+('製', '製圖', '제도', 0),
+('圖', '製圖', '제도', 1),
+('製', '製材所', '제재소', 0),
+('材', '製材所', '제재소', 1),
+('所', '製材所', '제재소', 2),
+('製', '製法', '제법', 0),
+('法', '製法', '제법', 1),
+('製', '製炭', '제탄', 0),
+('炭', '製炭', '제탄', 1),
+('製', '製粉所', '제분소', 0),
+('粉', '製粉所', '제분소', 1),
+('所', '製粉所', '제분소', 2),
+('製', '製菓店', '제과점', 0),
+('菓', '製菓店', '제과점', 1),
+('店', '製菓店', '제과점', 2),
+('製', '製造', '제조', 0),
+('造', '製造', '제조', 1),
+('製', '製造業', '제조업', 0),
+('造', '製造業', '제조업', 1),
+('業', '製造業', '제조업', 2),
+('製', '製造者', '제조자', 0),
+('造', '製造者', '제조자', 1),
+('者', '製造者', '제조자', 2),
+('製', '製鐵所', '제철소', 0),
+('鐵', '製鐵所', '제철소', 1),
+('所', '製鐵所', '제철소', 2),
+('製', '製靴', '제화', 0),
+('靴', '製靴', '제화', 1),
+('製', '製靴工', '제화공', 0),
+('靴', '製靴工', '제화공', 1),
+('工', '製靴工', '제화공', 2),
+('複', '複利', '복리', 0),
+('利', '複利', '복리', 1),
+('複', '複合', '복합', 0),
+('合', '複合', '복합', 1),
+('複', '複合語', '복합어', 0),
+('合', '複合語', '복합어', 1),
+('語', '複合語', '복합어', 2),
+('複', '複寫', '복사', 0),
+('寫', '複寫', '복사', 1),
+('複', '複寫機', '복사기', 0),
+('寫', '複寫機', '복사기', 1),
+('機', '複寫機', '복사기', 2),
+('複', '複屈折', '복굴절', 0),
+('屈', '複屈折', '복굴절', 1),
+('折', '複屈折', '복굴절', 2),
+('複', '複數', '복수', 0),
+('數', '複數', '복수', 1),
+('複', '複數形', '복수형', 0),
+('數', '複數形', '복수형', 1),
+('形', '複數形', '복수형', 2),
+('複', '複本位制', '복본위제', 0),
+('本', '複本位制', '복본위제', 1),
+('位', '複本位制', '복본위제', 2),
+('制', '複本位制', '복본위제', 3),
+('複', '複母音', '복모음', 0),
+('母', '複母音', '복모음', 1),
+('音', '複母音', '복모음', 2),
+('複', '複素數', '복소수', 0),
+('素', '複素數', '복소수', 1),
+('數', '複素數', '복소수', 2),
+('複', '複葉', '복엽', 0),
+('葉', '複葉', '복엽', 1),
+('複', '複葉機', '복엽기', 0),
+('葉', '複葉機', '복엽기', 1),
+('機', '複葉機', '복엽기', 2),
+('複', '複製', '복제', 0),
+('製', '複製', '복제', 1),
+('複', '複道', '복도', 0),
+('道', '複道', '복도', 1),
+('複', '複雜', '복잡', 0),
+('雜', '複雜', '복잡', 1),
+('褐', '褐炭', '갈탄', 0),
+('炭', '褐炭', '갈탄', 1),
+('褐', '褐色', '갈색', 0),
+('色', '褐色', '갈색', 1),
+('褒', '褒賞', '포상', 0),
+('賞', '褒賞', '포상', 1),
+('褒', '褒賞金', '포상금', 0),
+('賞', '褒賞金', '포상금', 1),
+('金', '褒賞金', '포상금', 2),
+('褓', '褓--', '보자기', 0),
+('-', '褓--', '보자기', 1),
+('-', '褓--', '보자기', 2),
+('褓', '褓따리', '보따리', 0),
+('따', '褓따리', '보따리', 1),
+('리', '褓따리', '보따리', 2),
+('襤', '襤褸', '남루', 0),
+('褸', '襤褸', '남루', 1),
+('襲', '襲擊', '습격', 0),
+('擊', '襲擊', '습격', 1),
+('西', '西', '서', 0),
+('西', '西-', '서쪽', 0),
+('-', '西-', '서쪽', 1),
+('西', '西人', '서인', 0),
+('人', '西人', '서인', 1),
+('西', '西北', '서북', 0),
+('北', '西北', '서북', 1),
+('西', '西半球', '서반구', 0),
+('半', '西半球', '서반구', 1),
+('球', '西半球', '서반구', 2),
+('西', '西南', '서남', 0),
+('南', '西南', '서남', 1),
+('西', '西印度 諸島', '서인도 제도', 0),
+('印', '西印度 諸島', '서인도 제도', 1),
+('度', '西印度 諸島', '서인도 제도', 2),
+('諸', '西印度 諸島', '서인도 제도', 4),
+('島', '西印度 諸島', '서인도 제도', 5),
+('西', '西夏', '서하', 0),
+('夏', '西夏', '서하', 1),
+('西', '西安', '서안', 0),
+('安', '西安', '서안', 1),
+('西', '西敎', '서교', 0),
+('敎', '西敎', '서교', 1),
+('西', '西方', '서방', 0),
+('方', '西方', '서방', 1),
+('西', '西晉', '서진', 0),
+('晉', '西晉', '서진', 1),
+('西', '西曆', '서력', 0),
+('曆', '西曆', '서력', 1),
+('西', '西歐', '서구', 0),
+('歐', '西歐', '서구', 1),
+('西', '西歐人', '서구인', 0),
+('歐', '西歐人', '서구인', 1),
+('人', '西歐人', '서구인', 2),
+('西', '西歐圈', '서구권', 0),
+('歐', '西歐圈', '서구권', 1),
+('圈', '西歐圈', '서구권', 2),
+('西', '西江', '서강', 0),
+('江', '西江', '서강', 1),
+('西', '西洋', '서양', 0),
+('洋', '西洋', '서양', 1),
+('西', '西洋人', '서양인', 0),
+('洋', '西洋人', '서양인', 1),
+('人', '西洋人', '서양인', 2),
+('西', '西洋化', '서양화', 0),
+('洋', '西洋化', '서양화', 1),
+('化', '西洋化', '서양화', 2),
+('西', '西洋畫', '서양화', 0),
+('洋', '西洋畫', '서양화', 1),
+('畫', '西洋畫', '서양화', 2),
+('西', '西海', '서해', 0),
+('海', '西海', '서해', 1),
+('西', '西獨', '서독', 0),
+('獨', '西獨', '서독', 1),
+('西', '西班牙', '서반아', 0),
+('班', '西班牙', '서반아', 1),
+('牙', '西班牙', '서반아', 2),
+('西', '西瓜', '서과', 0),
+('瓜', '西瓜', '서과', 1),
+('西', '西秦', '서진', 0),
+('秦', '西秦', '서진', 1),
+('西', '西紀', '서기', 0),
+('紀', '西紀', '서기', 1),
+('西', '西藏', '서장', 0),
+('藏', '西藏', '서장', 1),
+('西', '西道', '서도', 0),
+('道', '西道', '서도', 1),
+('西', '西部', '서부', 0),
+('部', '西部', '서부', 1),
+('西', '西部劇', '서부극', 0),
+('部', '西部劇', '서부극', 1),
+('劇', '西部劇', '서부극', 2),
+('要', '要', '요', 0),
+('要', '要人', '요인', 0),
+('人', '要人', '요인', 1),
+('要', '要件', '요건', 0),
+('件', '要件', '요건', 1),
+('要', '要員', '요원', 0),
+('員', '要員', '요원', 1),
+('要', '要因', '요인', 0),
+('因', '要因', '요인', 1),
+('要', '要塞', '요새', 0),
+('塞', '要塞', '요새', 1),
+('要', '要害', '요해', 0),
+('害', '要害', '요해', 1),
+('要', '要旨', '요지', 0),
+('旨', '要旨', '요지', 1),
+('要', '要望', '요망', 0),
+('望', '要望', '요망', 1),
+('要', '要求', '요구', 0),
+('求', '要求', '요구', 1),
+('要', '要求者', '요구자', 0),
+('求', '要求者', '요구자', 1),
+('者', '要求者', '요구자', 2),
+('要', '要石', '요석', 0),
+('石', '要石', '요석', 1),
+('要', '要約', '요약', 0),
+('約', '要約', '요약', 1),
+('要', '要素', '요소', 0),
+('素', '要素', '요소', 1),
+('要', '要緊', '요긴', 0),
+('緊', '要緊', '요긴', 1),
+('要', '要義', '요의', 0),
+('義', '要義', '요의', 1),
+('要', '要衝', '요충', 0),
+('衝', '要衝', '요충', 1),
+('要', '要請', '요청', 0),
+('請', '要請', '요청', 1),
+('要', '要領', '요령', 0),
+('領', '要領', '요령', 1),
+('要', '要點', '요점', 0),
+('點', '要點', '요점', 1),
+('覆', '覆盆子', '복분자', 0),
+('盆', '覆盆子', '복분자', 1),
+('子', '覆盆子', '복분자', 2),
+('覇', '覇權', '패권', 0),
+('權', '覇權', '패권', 1),
+('覇', '覇氣', '패기', 0),
+('氣', '覇氣', '패기', 1),
+('見', '見性', '견성', 0),
+('性', '見性', '견성', 1),
+('見', '見本', '견본', 0),
+('本', '見本', '견본', 1),
+('見', '見積', '견적', 0),
+('積', '見積', '견적', 1),
+('見', '見習', '견습', 0),
+('習', '見習', '견습', 1),
+('見', '見習生', '견습생', 0),
+('習', '見習生', '견습생', 1),
+('生', '見習生', '견습생', 2),
+('見', '見聞', '견문', 0),
+('聞', '見聞', '견문', 1),
+('見', '見蚊拔劒', '견문발검', 0),
+('蚊', '見蚊拔劒', '견문발검', 1),
+('拔', '見蚊拔劒', '견문발검', 2),
+('劒', '見蚊拔劒', '견문발검', 3),
+('見', '見解', '견해', 0),
+('解', '見解', '견해', 1),
+('規', '規制', '규제', 0),
+('制', '規制', '규제', 1),
+('規', '規則', '규칙', 0),
+('則', '規則', '규칙', 1),
+('規', '規則的', '규칙적', 0),
+('則', '規則的', '규칙적', 1),
+('的', '規則的', '규칙적', 2),
+('規', '規定', '규정', 0),
+('定', '規定', '규정', 1),
+('規', '規律', '규률', 0),
+('律', '規律', '규률', 1),
+('規', '規律', '규율', 0),
+('律', '規律', '규율', 1),
+('規', '規模', '규모', 0),
+('模', '規模', '규모', 1),
+('規', '規範', '규범', 0),
+('範', '規範', '규범', 1),
+('規', '規範的', '규범적', 0),
+('範', '規範的', '규범적', 1),
+('的', '規範的', '규범적', 2),
+('規', '規約', '규약', 0),
+('約', '規約', '규약', 1),
+('視', '視力', '시력', 0),
+('力', '視力', '시력', 1),
+('視', '視察', '시찰', 0),
+('察', '視察', '시찰', 1),
+('視', '視差', '시차', 0),
+('差', '視差', '시차', 1),
+('視', '視床', '시상', 0),
+('床', '視床', '시상', 1),
+('視', '視床下部', '시상하부', 0),
+('床', '視床下部', '시상하부', 1),
+('下', '視床下部', '시상하부', 2),
+('部', '視床下部', '시상하부', 3),
+('視', '視界', '시계', 0),
+('界', '視界', '시계', 1),
+('視', '視界飛行', '시계비행', 0),
+('界', '視界飛行', '시계비행', 1),
+('飛', '視界飛行', '시계비행', 2),
+('行', '視界飛行', '시계비행', 3),
+('視', '視神經', '시신경', 0),
+('神', '視神經', '시신경', 1),
+('經', '視神經', '시신경', 2),
+('視', '視線', '시선', 0),
+('線', '視線', '시선', 1),
+('視', '視聽', '시청', 0),
+('聽', '視聽', '시청', 1),
+('視', '視聽者', '시청자', 0),
+('聽', '視聽者', '시청자', 1),
+('者', '視聽者', '시청자', 2),
+('視', '視聽率', '시청률', 0),
+('聽', '視聽率', '시청률', 1),
+('率', '視聽率', '시청률', 2),
+('視', '視覺', '시각', 0),
+('覺', '視覺', '시각', 1),
+('視', '視覺 藝術', '시각 예술', 0),
+('覺', '視覺 藝術', '시각 예술', 1),
+('藝', '視覺 藝術', '시각 예술', 3),
+('術', '視覺 藝術', '시각 예술', 4),
+('視', '視覺皮質', '시각피질', 0),
+('覺', '視覺皮質', '시각피질', 1),
+('皮', '視覺皮質', '시각피질', 2),
+('質', '視覺皮質', '시각피질', 3),
+('視', '視角', '시각', 0),
+('角', '視角', '시각', 1),
+('視', '視野', '시야', 0),
+('野', '視野', '시야', 1),
+('視', '視點', '시점', 0),
+('點', '視點', '시점', 1),
+('親', '親', '친', 0),
+('親', '親三寸', '친삼촌', 0),
+('三', '親三寸', '친삼촌', 1),
+('寸', '親三寸', '친삼촌', 2),
+('親', '親交', '친교', 0),
+('交', '親交', '친교', 1),
+('親', '親兄弟', '친형제', 0),
+('兄', '親兄弟', '친형제', 1),
+('弟', '親兄弟', '친형제', 2),
+('親', '親切', '친절', 0),
+('切', '親切', '친절', 1),
+('親', '親友', '친우', 0),
+('友', '親友', '친우', 1),
+('親', '親善', '친선', 0),
+('善', '親善', '친선', 1),
+('親', '親善都市', '친선도시', 0),
+('善', '親善都市', '친선도시', 1),
+('都', '親善都市', '친선도시', 2),
+('市', '親善都市', '친선도시', 3),
+('親', '親姊妹', '친자매', 0),
+('姊', '親姊妹', '친자매', 1),
+('妹', '親姊妹', '친자매', 2),
+('親', '親密', '친밀', 0),
+('密', '親密', '친밀', 1),
+('親', '親庭', '친정', 0),
+('庭', '親庭', '친정', 1),
+('親', '親愛', '친애', 0),
+('愛', '親愛', '친애', 1),
+('親', '親戚', '친척', 0),
+('戚', '親戚', '친척', 1),
+('親', '親族', '친족', 0),
+('族', '親族', '친족', 1),
+('親', '親族 關係', '친족 관계', 0),
+('族', '親族 關係', '친족 관계', 1),
+('關', '親族 關係', '친족 관계', 3),
+('係', '親族 關係', '친족 관계', 4),
+('親', '親日派', '친일파', 0),
+('日', '親日派', '친일파', 1),
+('派', '親日派', '친일파', 2),
+('親', '親權', '친권', 0),
+('權', '親權', '친권', 1),
+('親', '親王', '친왕', 0),
+('王', '親王', '친왕', 1),
+('親', '親知', '친지', 0),
+('知', '親知', '친지', 1),
+('親', '親美', '친미', 0),
+('美', '親美', '친미', 1),
+('親', '親舊', '친구', 0),
+('舊', '親舊', '친구', 1),
+('親', '親衛隊', '친위대', 0),
+('衛', '親衛隊', '친위대', 1),
+('隊', '親衛隊', '친위대', 2),
+('親', '親近', '친근', 0),
+('近', '親近', '친근', 1),
+('親', '親近感', '친근감', 0),
+('近', '親近感', '친근감', 1),
+('感', '親近感', '친근감', 2),
+('覺', '覺悟', '각오', 0),
+('悟', '覺悟', '각오', 1),
+('覺', '覺書', '각서', 0),
+('書', '覺書', '각서', 1),
+('覺', '覺醒', '각성', 0),
+('醒', '覺醒', '각성', 1),
+('覿', '覿面', '적면', 0),
+('面', '覿面', '적면', 1),
+('觀', '觀世音菩薩', '관세음보살', 0),
+('世', '觀世音菩薩', '관세음보살', 1),
+('音', '觀世音菩薩', '관세음보살', 2),
+('菩', '觀世音菩薩', '관세음보살', 3),
+('薩', '觀世音菩薩', '관세음보살', 4),
+('觀', '觀光', '관광', 0),
+('光', '觀光', '관광', 1),
+('觀', '觀光--', '관광버스', 0),
+('光', '觀光--', '관광버스', 1),
+('-', '觀光--', '관광버스', 2),
+('-', '觀光--', '관광버스', 3),
+('觀', '觀光地', '관광지', 0),
+('光', '觀光地', '관광지', 1),
+('地', '觀光地', '관광지', 2),
+('觀', '觀光學', '관광학', 0),
+('光', '觀光學', '관광학', 1),
+('學', '觀光學', '관광학', 2),
+('觀', '觀光客', '관광객', 0),
+('光', '觀光客', '관광객', 1),
+('客', '觀光客', '관광객', 2),
+('觀', '觀兵式', '관병식', 0),
+('兵', '觀兵式', '관병식', 1),
+('式', '觀兵式', '관병식', 2),
+('觀', '觀勢', '관세', 0),
+('勢', '觀勢', '관세', 1),
+('觀', '觀客', '관객', 0),
+('客', '觀客', '관객', 1),
+('觀', '觀察', '관찰', 0),
+('察', '觀察', '관찰', 1),
+('觀', '觀察者', '관찰자', 0),
+('察', '觀察者', '관찰자', 1),
+('者', '觀察者', '관찰자', 2),
+('觀', '觀念', '관념', 0),
+('念', '觀念', '관념', 1),
+('觀', '觀測', '관측', 0),
+('測', '觀測', '관측', 1),
+('觀', '觀衆', '관중', 0),
+('衆', '觀衆', '관중', 1),
+('觀', '觀覽', '관람', 0),
+('覽', '觀覽', '관람', 1),
+('觀', '觀覽者', '관람자', 0),
+('覽', '觀覽者', '관람자', 1),
+('者', '觀覽者', '관람자', 2),
+('觀', '觀覽車', '관람차', 0),
+('覽', '觀覽車', '관람차', 1),
+('車', '觀覽車', '관람차', 2),
+('觀', '觀點', '관점', 0),
+('點', '觀點', '관점', 1),
+('角', '角', '각', 0),
+('角', '角度', '각도', 0),
+('度', '角度', '각도', 1),
+('角', '角木', '각목', 0),
+('木', '角木', '각목', 1),
+('角', '角皮', '각피', 0),
+('皮', '角皮', '각피', 1),
+('角', '角膜', '각막', 0),
+('膜', '角膜', '각막', 1),
+('角', '角逐', '각축', 0),
+('逐', '角逐', '각축', 1),
+('角', '角速度', '각속도', 0),
+('速', '角速度', '각속도', 1),
+('度', '角速度', '각속도', 2),
+('角', '角錐', '각추', 0),
+('錐', '角錐', '각추', 1),
+('角', '角雪糖', '각설탕', 0),
+('雪', '角雪糖', '각설탕', 1),
+('糖', '角雪糖', '각설탕', 2),
+('解', '解', '해', 0),
+('解', '解像度', '해상도', 0),
+('像', '解像度', '해상도', 1),
+('度', '解像度', '해상도', 2),
+('解', '解凍', '해동', 0),
+('凍', '解凍', '해동', 1),
+('解', '解剖', '해부', 0),
+('剖', '解剖', '해부', 1),
+('解', '解剖學', '해부학', 0),
+('剖', '解剖學', '해부학', 1),
+('學', '解剖學', '해부학', 2),
+('解', '解放', '해방', 0),
+('放', '解放', '해방', 1),
+('解', '解散', '해산', 0),
+('散', '解散', '해산', 1),
+('解', '解明', '해명', 0),
+('明', '解明', '해명', 1),
+('解', '解析', '해석', 0),
+('析', '解析', '해석', 1),
+('解', '解止', '해지', 0),
+('止', '解止', '해지', 1),
+('解', '解決', '해결', 0),
+('決', '解決', '해결', 1),
+('解', '解決策', '해결책', 0),
+('決', '解決策', '해결책', 1),
+('策', '解決策', '해결책', 2),
+('解', '解消', '해소', 0),
+('消', '解消', '해소', 1),
+('解', '解熱', '해열', 0),
+('熱', '解熱', '해열', 1),
+('解', '解熱劑', '해열제', 0),
+('熱', '解熱劑', '해열제', 1),
+('劑', '解熱劑', '해열제', 2),
+('解', '解熱藥', '해열약', 0),
+('熱', '解熱藥', '해열약', 1),
+('藥', '解熱藥', '해열약', 2),
+('解', '解産', '해산', 0),
+('産', '解産', '해산', 1),
+('解', '解禁', '해금', 0),
+('禁', '解禁', '해금', 1),
+('解', '解答', '해답', 0),
+('答', '解答', '해답', 1),
+('解', '解脫', '해탈', 0),
+('脫', '解脫', '해탈', 1),
+('解', '解說', '해설', 0),
+('說', '解說', '해설', 1),
+('解', '解說者', '해설자', 0),
+('說', '解說者', '해설자', 1),
+('者', '解說者', '해설자', 2),
+('解', '解酲', '해장', 0),
+('酲', '解酲', '해장', 1),
+('解', '解酲국', '해장국', 0),
+('酲', '解酲국', '해장국', 1),
+('국', '解酲국', '해장국', 2),
+('解', '解釋', '해석', 0),
+('釋', '解釋', '해석', 1),
+('解', '解釋學', '해석학', 0),
+('釋', '解釋學', '해석학', 1),
+('學', '解釋學', '해석학', 2),
+('解', '解釋者', '해석자', 0),
+('釋', '解釋者', '해석자', 1),
+('者', '解釋者', '해석자', 2),
+('解', '解除', '해제', 0),
+('除', '解除', '해제', 1),
+('解', '解雇', '해고', 0),
+('雇', '解雇', '해고', 1),
+('解', '解題', '해제', 0),
+('題', '解題', '해제', 1),
+('觱', '觱篥', '필률', 0),
+('篥', '觱篥', '필률', 1),
+('觸', '觸媒', '촉매', 0),
+('媒', '觸媒', '촉매', 1),
+('觸', '觸手', '촉수', 0),
+('手', '觸手', '촉수', 1),
+('觸', '觸法少年', '촉법소년', 0),
+('法', '觸法少年', '촉법소년', 1),
+('少', '觸法少年', '촉법소년', 2),
+('年', '觸法少年', '촉법소년', 3),
+('觸', '觸肢', '촉지', 0),
+('肢', '觸肢', '촉지', 1),
+('觸', '觸覺', '촉각', 0),
+('覺', '觸覺', '촉각', 1),
+('觸', '觸角', '촉각', 0),
+('角', '觸角', '촉각', 1),
+('觸', '觸診', '촉진', 0),
+('診', '觸診', '촉진', 1),
+('言', '言動', '언동', 0),
+('動', '言動', '언동', 1),
+('言', '言及', '언급', 0),
+('及', '言及', '언급', 1),
+('言', '言行一致', '언행일치', 0),
+('行', '言行一致', '언행일치', 1),
+('一', '言行一致', '언행일치', 2),
+('致', '言行一致', '언행일치', 3),
+('言', '言語', '언어', 0),
+('語', '言語', '언어', 1),
+('言', '言語學', '언어학', 0),
+('語', '言語學', '언어학', 1),
+('學', '言語學', '언어학', 2),
+('言', '言語道斷', '언어도단', 0),
+('語', '言語道斷', '언어도단', 1),
+('道', '言語道斷', '언어도단', 2),
+('斷', '言語道斷', '언어도단', 3),
+('言', '言論', '언론', 0),
+('論', '言論', '언론', 1),
+('言', '言論人', '언론인', 0),
+('論', '言論人', '언론인', 1),
+('人', '言論人', '언론인', 2),
+('言', '言論學', '언론학', 0),
+('論', '言論學', '언론학', 1),
+('學', '言論學', '언론학', 2),
+('言', '言論學者', '언론학자', 0),
+('論', '言論學者', '언론학자', 1),
+('學', '言論學者', '언론학자', 2),
+('者', '言論學者', '언론학자', 3),
+('言', '言論家', '언론가', 0),
+('論', '言論家', '언론가', 1),
+('家', '言論家', '언론가', 2),
+('言', '言質', '언질', 0),
+('質', '言質', '언질', 1),
+('訂', '訂正', '정정', 0),
+('正', '訂正', '정정', 1),
+('訃', '訃告', '부고', 0),
+('告', '訃告', '부고', 1),
+('訃', '訃音', '부음', 0),
+('音', '訃音', '부음', 1),
+('計', '計', '계', 0),
+('計', '計劃', '계획', 0),
+('劃', '計劃', '계획', 1),
+('計', '計器', '계기', 0),
+('器', '計器', '계기', 1),
+('計', '計器板', '계기판', 0),
+('器', '計器板', '계기판', 1),
+('板', '計器板', '계기판', 2),
+('計', '計器飛行', '계기비행', 0),
+('器', '計器飛行', '계기비행', 1),
+('飛', '計器飛行', '계기비행', 2),
+('行', '計器飛行', '계기비행', 3),
+('計', '計定', '계정', 0),
+('定', '計定', '계정', 1),
+('計', '計座', '계좌', 0),
+('座', '計座', '계좌', 1),
+('計', '計略', '계략', 0),
+('略', '計略', '계략', 1),
+('計', '計畫', '계획', 0),
+('畫', '計畫', '계획', 1),
+('計', '計算', '계산', 0),
+('算', '計算', '계산', 1),
+('計', '計算員', '계산원', 0),
+('算', '計算員', '계산원', 1),
+('員', '計算員', '계산원', 2),
+('計', '計算器', '계산기', 0),
+('算', '計算器', '계산기', 1),
+('器', '計算器', '계산기', 2),
+('計', '計算尺', '계산척', 0),
+('算', '計算尺', '계산척', 1),
+('尺', '計算尺', '계산척', 2),
+('計', '計算書', '계산서', 0),
+('算', '計算書', '계산서', 1),
+('書', '計算書', '계산서', 2),
+('計', '計算機', '계산기', 0),
+('算', '計算機', '계산기', 1),
+('機', '計算機', '계산기', 2),
+('計', '計算臺', '계산대', 0),
+('算', '計算臺', '계산대', 1),
+('臺', '計算臺', '계산대', 2),
+('計', '計量', '계량', 0),
+('量', '計量', '계량', 1),
+('計', '計量器', '계량기', 0),
+('量', '計量器', '계량기', 1),
+('器', '計量器', '계량기', 2),
+('計', '計量經濟學', '계량경제학', 0),
+('量', '計量經濟學', '계량경제학', 1),
+('經', '計量經濟學', '계량경제학', 2),
+('濟', '計量經濟學', '계량경제학', 3),
+('學', '計量經濟學', '계량경제학', 4),
+('討', '討伐', '토벌', 0),
+('伐', '討伐', '토벌', 1),
+('討', '討論', '토론', 0),
+('論', '討論', '토론', 1),
+('討', '討論會', '토론회', 0),
+('論', '討論會', '토론회', 1),
+('會', '討論會', '토론회', 2),
+('討', '討論者', '토론자', 0),
+('論', '討論者', '토론자', 1),
+('者', '討論者', '토론자', 2),
+('討', '討議', '토의', 0),
+('議', '討議', '토의', 1),
+('訓', '訓', '훈', 0),
+('訓', '訓主音從', '훈주음종', 0),
+('主', '訓主音從', '훈주음종', 1),
+('音', '訓主音從', '훈주음종', 2),
+('從', '訓主音從', '훈주음종', 3),
+('訓', '訓令', '훈령', 0),
+('令', '訓令', '훈령', 1),
+('訓', '訓假字', '훈가자', 0),
+('假', '訓假字', '훈가자', 1),
+('字', '訓假字', '훈가자', 2),
+('訓', '訓戒', '훈계', 0),
+('戒', '訓戒', '훈계', 1),
+('訓', '訓民正音', '훈민정음', 0),
+('民', '訓民正音', '훈민정음', 1),
+('正', '訓民正音', '훈민정음', 2),
+('音', '訓民正音', '훈민정음', 3),
+('訓', '訓練', '훈련', 0),
+('練', '訓練', '훈련', 1),
+('訓', '訓育', '훈육', 0),
+('育', '訓育', '훈육', 1),
+('訓', '訓詁學', '훈고학', 0),
+('詁', '訓詁學', '훈고학', 1),
+('學', '訓詁學', '훈고학', 2),
+('訓', '訓讀', '훈독', 0),
+('讀', '訓讀', '훈독', 1),
+('訓', '訓鍊', '훈련', 0),
+('鍊', '訓鍊', '훈련', 1),
+('託', '託兒所', '탁아소', 0),
+('兒', '託兒所', '탁아소', 1),
+('所', '託兒所', '탁아소', 2),
+('託', '託治', '탁치', 0),
+('治', '託治', '탁치', 1),
+('託', '託送', '탁송', 0),
+('送', '託送', '탁송', 1),
+('記', '記事', '기사', 0),
+('事', '記事', '기사', 1),
+('記', '記入', '기입', 0),
+('入', '記入', '기입', 1),
+('記', '記念', '기념', 0),
+('念', '記念', '기념', 1),
+('記', '記念品', '기념품', 0),
+('念', '記念品', '기념품', 1),
+('品', '記念品', '기념품', 2),
+('記', '記念日', '기념일', 0),
+('念', '記念日', '기념일', 1),
+('日', '記念日', '기념일', 2),
+('記', '記念碑', '기념비', 0),
+('念', '記念碑', '기념비', 1),
+('碑', '記念碑', '기념비', 2),
+('記', '記念館', '기념관', 0),
+('念', '記念館', '기념관', 1),
+('館', '記念館', '기념관', 2),
+('記', '記憶', '기억', 0),
+('憶', '記憶', '기억', 1),
+('記', '記憶力', '기억력', 0),
+('憶', '記憶力', '기억력', 1),
+('力', '記憶力', '기억력', 2),
+('記', '記憶術', '기억술', 0),
+('憶', '記憶術', '기억술', 1),
+('術', '記憶術', '기억술', 2),
+('記', '記章', '기장', 0),
+('章', '記章', '기장', 1),
+('記', '記者', '기자', 0),
+('者', '記者', '기자', 1),
+('記', '記者團', '기자단', 0),
+('者', '記者團', '기자단', 1),
+('團', '記者團', '기자단', 2),
+('記', '記者會見', '기자회견', 0),
+('者', '記者會見', '기자회견', 1),
+('會', '記者會見', '기자회견', 2),
+('見', '記者會見', '기자회견', 3),
+('記', '記號', '기호', 0),
+('號', '記號', '기호', 1),
+('記', '記述', '기술', 0),
+('述', '記述', '기술', 1),
+('記', '記錄', '기록', 0),
+('錄', '記錄', '기록', 1),
+('記', '記錄映畫', '기록영화', 0),
+('錄', '記錄映畫', '기록영화', 1),
+('映', '記錄映畫', '기록영화', 2),
+('畫', '記錄映畫', '기록영화', 3),
+('記', '記錄的', '기록적', 0),
+('錄', '記錄的', '기록적', 1),
+('的', '記錄的', '기록적', 2),
+('訛', '訛傳', '와전', 0),
+('傳', '訛傳', '와전', 1),
+('訪', '訪問', '방문', 0),
+('問', '訪問', '방문', 1),
+('訪', '訪問客', '방문객', 0),
+('問', '訪問客', '방문객', 1),
+('客', '訪問客', '방문객', 2),
+('訪', '訪問者', '방문자', 0),
+('問', '訪問者', '방문자', 1),
+('者', '訪問者', '방문자', 2),
+('訪', '訪客', '방객', 0),
+('客', '訪客', '방객', 1),
+('訪', '訪韓', '방한', 0),
+('韓', '訪韓', '방한', 1),
+('設', '設令', '설령', 0),
+('令', '設令', '설령', 1),
+('設', '設使', '설사', 0),
+('使', '設使', '설사', 1),
+('設', '設備', '설비', 0),
+('備', '設備', '설비', 1),
+('設', '設問', '설문', 0),
+('問', '設問', '설문', 1),
+('設', '設問紙', '설문지', 0),
+('問', '設問紙', '설문지', 1),
+('紙', '設問紙', '설문지', 2),
+('設', '設定', '설정', 0),
+('定', '設定', '설정', 1),
+('設', '設立', '설립', 0),
+('立', '設立', '설립', 1),
+('設', '設立者', '설립자', 0),
+('立', '設立者', '설립자', 1),
+('者', '設立者', '설립자', 2),
+('設', '設置', '설치', 0),
+('置', '設置', '설치', 1),
+('設', '設計', '설계', 0),
+('計', '設計', '설계', 1),
+('設', '設計圖', '설계도', 0),
+('計', '設計圖', '설계도', 1),
+('圖', '設計圖', '설계도', 2),
+('許', '許', '허', 0),
+('許', '許可', '허가', 0),
+('可', '許可', '허가', 1),
+('許', '許婚', '허혼', 0),
+('婚', '許婚', '허혼', 1),
+('許', '許容', '허용', 0),
+('容', '許容', '허용', 1),
+('許', '許諾', '허락', 0),
+('諾', '許諾', '허락', 1),
+('許', '許諾', '허락', 0),
+('諾', '許諾', '허락', 1),
+('訴', '訴訟', '소송', 0),
+('訟', '訴訟', '소송', 1),
+('訴', '訴願', '소원', 0),
+('願', '訴願', '소원', 1),
+('診', '診察', '진찰', 0),
+('察', '診察', '진찰', 1),
+('診', '診察臺', '진찰대', 0),
+('察', '診察臺', '진찰대', 1),
+('臺', '診察臺', '진찰대', 2),
+('診', '診斷', '진단', 0),
+('斷', '診斷', '진단', 1),
+('診', '診療', '진료', 0),
+('療', '診療', '진료', 1),
+('診', '診療所', '진료소', 0),
+('療', '診療所', '진료소', 1),
+('所', '診療所', '진료소', 2),
+('註', '註', '주', 0),
+('註', '註文', '주문', 0),
+('文', '註文', '주문', 1),
+('註', '註解', '주해', 0),
+('解', '註解', '주해', 1),
+('註', '註記', '주기', 0),
+('記', '註記', '주기', 1),
+('註', '註釋', '주석', 0),
+('釋', '註釋', '주석', 1),
+('証', '証人', '증인', 0),
+('人', '証人', '증인', 1),
+('詐', '詐取', '사취', 0),
+('取', '詐取', '사취', 1),
+('詐', '詐欺', '사기', 0),
+('欺', '詐欺', '사기', 1),
+('詐', '詐欺罪', '사기죄', 0),
+('欺', '詐欺罪', '사기죄', 1),
+('罪', '詐欺罪', '사기죄', 2),
+('詐', '詐稱', '사칭', 0),
+('稱', '詐稱', '사칭', 1),
+('評', '評', '평', 0),
+('評', '評傳', '평전', 0),
+('傳', '評傳', '평전', 1),
+('評', '評價', '평가', 0),
+('價', '評價', '평가', 1),
+('評', '評判', '평판', 0),
+('判', '評判', '평판', 1),
+('評', '評決', '평결', 0),
+('決', '評決', '평결', 1),
+('評', '評語', '평어', 0),
+('語', '評語', '평어', 1),
+('評', '評論', '평론', 0),
+('論', '評論', '평론', 1),
+('評', '評論家', '평론가', 0),
+('論', '評論家', '평론가', 1),
+('家', '評論家', '평론가', 2),
+('評', '評議會', '평의회', 0),
+('議', '評議會', '평의회', 1),
+('會', '評議會', '평의회', 2),
+('詛', '詛呪', '저주', 0),
+('呪', '詛呪', '저주', 1),
+('詞', '詞林', '사림', 0),
+('林', '詞林', '사림', 1),
+('詞', '詞華', '사화', 0),
+('華', '詞華', '사화', 1),
+('詞', '詞藻', '사조', 0),
+('藻', '詞藻', '사조', 1),
+('詞', '詞話', '사화', 0),
+('話', '詞話', '사화', 1),
+('詠', '詠春拳', '영춘권', 0),
+('春', '詠春拳', '영춘권', 1),
+('拳', '詠春拳', '영춘권', 2),
+('試', '試合', '시합', 0),
+('合', '試合', '시합', 1),
+('試', '試圖', '시도', 0),
+('圖', '試圖', '시도', 1),
+('試', '試掘者', '시굴자', 0),
+('掘', '試掘者', '시굴자', 1),
+('者', '試掘者', '시굴자', 2),
+('試', '試算', '시산', 0),
+('算', '試算', '시산', 1),
+('試', '試練', '시련', 0),
+('練', '試練', '시련', 1),
+('試', '試藥', '시약', 0),
+('藥', '試藥', '시약', 1),
+('試', '試行錯誤', '시행착오', 0),
+('行', '試行錯誤', '시행착오', 1),
+('錯', '試行錯誤', '시행착오', 2),
+('誤', '試行錯誤', '시행착오', 3),
+('試', '試論', '시론', 0),
+('論', '試論', '시론', 1),
+('試', '試運轉', '시운전', 0),
+('運', '試運轉', '시운전', 1),
+('轉', '試運轉', '시운전', 2),
+('試', '試鍊', '시련', 0),
+('鍊', '試鍊', '시련', 1),
+('試', '試飮', '시음', 0),
+('飮', '試飮', '시음', 1),
+('試', '試驗', '시험', 0),
+('驗', '試驗', '시험', 1),
+('試', '試驗管', '시험관', 0),
+('驗', '試驗管', '시험관', 1),
+('管', '試驗管', '시험관', 2),
+('詩', '詩', '시', 0),
+('詩', '詩人', '시인', 0),
+('人', '詩人', '시인', 1),
+('詩', '詩作', '시작', 0),
+('作', '詩作', '시작', 1),
+('詩', '詩品', '시품', 0),
+('品', '詩品', '시품', 1),
+('詩', '詩形', '시형', 0),
+('形', '詩形', '시형', 1),
+('詩', '詩文', '시문', 0),
+('文', '詩文', '시문', 1),
+('詩', '詩歌', '시가', 0),
+('歌', '詩歌', '시가', 1),
+('詩', '詩歌 選集', '시가 선집', 0),
+('歌', '詩歌 選集', '시가 선집', 1),
+('選', '詩歌 選集', '시가 선집', 3),
+('集', '詩歌 選集', '시가 선집', 4),
+('詩', '詩的', '시적', 0),
+('的', '詩的', '시적', 1),
+('詩', '詩集', '시집', 0),
+('集', '詩集', '시집', 1),
+('詭', '詭辯', '궤변', 0),
+('辯', '詭辯', '궤변', 1),
+('詰', '詰責', '힐책', 0),
+('責', '詰責', '힐책', 1),
+('詰', '詰難', '힐난', 0),
+('難', '詰難', '힐난', 1),
+('話', '話法', '화법', 0),
+('法', '話法', '화법', 1),
+('話', '話者', '화자', 0),
+('者', '話者', '화자', 1),
+('話', '話頭', '화두', 0),
+('頭', '話頭', '화두', 1),
+('話', '話題', '화제', 0),
+('題', '話題', '화제', 1),
+('該', '該當', '해당', 0),
+('當', '該當', '해당', 1),
+('詳', '詳述', '상술', 0),
+('述', '詳述', '상술', 1),
+('誇', '誇張', '과장', 0),
+('張', '誇張', '과장', 1),
+('誇', '誇示', '과시', 0),
+('示', '誇示', '과시', 1),
+('認', '認可', '인가', 0),
+('可', '認可', '인가', 1),
+('認', '認定', '인정', 0),
+('定', '認定', '인정', 1),
+('認', '認知', '인지', 0),
+('知', '認知', '인지', 1),
+('認', '認證', '인증', 0),
+('證', '認證', '인증', 1),
+('認', '認證書', '인정서', 0),
+('證', '認證書', '인정서', 1),
+('書', '認證書', '인정서', 2),
+('認', '認識', '인식', 0),
+('識', '認識', '인식', 1),
+('認', '認識票', '인식표', 0),
+('識', '認識票', '인식표', 1),
+('票', '認識票', '인식표', 2),
+('認', '認識論', '인식론', 0),
+('識', '認識論', '인식론', 1),
+('論', '認識論', '인식론', 2),
+('誓', '誓約', '서약', 0),
+('約', '誓約', '서약', 1),
+('誓', '誓願', '서원', 0),
+('願', '誓願', '서원', 1),
+('誕', '誕生', '탄생', 0),
+('生', '誕生', '탄생', 1),
+('誕', '誕生日', '탄생일', 0),
+('生', '誕生日', '탄생일', 1),
+('日', '誕生日', '탄생일', 2),
+('誘', '誘因', '유인', 0),
+('因', '誘因', '유인', 1),
+('誘', '誘導', '유도', 0),
+('導', '誘導', '유도', 1),
+('誘', '誘導彈', '유도탄', 0),
+('導', '誘導彈', '유도탄', 1),
+('彈', '誘導彈', '유도탄', 2),
+('誘', '誘導機', '유도기', 0),
+('導', '誘導機', '유도기', 1),
+('機', '誘導機', '유도기', 2),
+('誘', '誘引', '유인', 0),
+('引', '誘引', '유인', 1),
+('誘', '誘惑', '유혹', 0),
+('惑', '誘惑', '유혹', 1),
+('誘', '誘拐', '유괴', 0),
+('拐', '誘拐', '유괴', 1),
+('誘', '誘拐犯', '유괴범', 0),
+('拐', '誘拐犯', '유괴범', 1),
+('犯', '誘拐犯', '유괴범', 2),
+('誘', '誘發', '유발', 0),
+('發', '誘發', '유발', 1),
+('誘', '誘致', '유치', 0),
+('致', '誘致', '유치', 1),
+('誘', '誘電率', '유전율', 0),
+('電', '誘電率', '유전율', 1),
+('率', '誘電率', '유전율', 2),
+('語', '語不成說', '어불성설', 0),
+('不', '語不成說', '어불성설', 1),
+('成', '語不成說', '어불성설', 2),
+('說', '語不成說', '어불성설', 3),
+('語', '語助辭', '어조사', 0),
+('助', '語助辭', '어조사', 1),
+('辭', '語助辭', '어조사', 2),
+('語', '語句', '어구', 0),
+('句', '語句', '어구', 1),
+('語', '語句', '어귀', 0),
+('句', '語句', '어귀', 1),
+('語', '語塞', '어색', 0),
+('塞', '語塞', '어색', 1),
+('語', '語學', '어학', 0),
+('學', '語學', '어학', 1),
+('語', '語尾', '어미', 0),
+('尾', '語尾', '어미', 1),
+('語', '語幹', '어간', 0),
+('幹', '語幹', '어간', 1),
+('語', '語弊', '어폐', 0),
+('弊', '語弊', '어폐', 1),
+('語', '語彙', '어휘', 0),
+('彙', '語彙', '어휘', 1),
+('語', '語彙場', '어휘장', 0),
+('彙', '語彙場', '어휘장', 1),
+('場', '語彙場', '어휘장', 2),
+('語', '語彙集', '어휘집', 0),
+('彙', '語彙集', '어휘집', 1),
+('集', '語彙集', '어휘집', 2),
+('語', '語形', '어형', 0),
+('形', '語形', '어형', 1),
+('語', '語感', '어감', 0),
+('感', '語感', '어감', 1),
+('語', '語族', '어족', 0),
+('族', '語族', '어족', 1),
+('語', '語末', '어말', 0),
+('末', '語末', '어말', 1),
+('語', '語根', '어근', 0),
+('根', '語根', '어근', 1),
+('語', '語法', '어법', 0),
+('法', '語法', '어법', 1),
+('語', '語派', '어파', 0),
+('派', '語派', '어파', 1),
+('語', '語源', '어원', 0),
+('源', '語源', '어원', 1),
+('語', '語源學', '어원학', 0),
+('源', '語源學', '어원학', 1),
+('學', '語源學', '어원학', 2),
+('語', '語義', '어의', 0),
+('義', '語義', '어의', 1),
+('語', '語調', '어조', 0),
+('調', '語調', '어조', 1),
+('語', '語辭', '어사', 0),
+('辭', '語辭', '어사', 1),
+('語', '語順', '어순', 0),
+('順', '語順', '어순', 1),
+('語', '語塞', '어색', 0),
+('塞', '語塞', '어색', 1),
+('誠', '誠實', '성실', 0),
+('實', '誠實', '성실', 1),
+('誠', '誠心', '성심', 0),
+('心', '誠心', '성심', 1),
+('誠', '誠意', '성의', 0),
+('意', '誠意', '성의', 1),
+('誡', '誡命', '계명', 0),
+('命', '誡命', '계명', 1),
+('誣', '誣告', '무고', 0),
+('告', '誣告', '무고', 1),
+('誤', '誤作動', '오작동', 0),
+('作', '誤作動', '오작동', 1),
+('動', '誤作動', '오작동', 2),
+('誤', '誤信', '오신', 0),
+('信', '誤信', '오신', 1),
+('誤', '誤傳', '오전', 0),
+('傳', '誤傳', '오전', 1),
+('誤', '誤判', '오판', 0),
+('判', '誤判', '오판', 1),
+('誤', '誤嚥', '오연', 0),
+('嚥', '誤嚥', '오연', 1),
+('誤', '誤報', '오보', 0),
+('報', '誤報', '오보', 1),
+('誤', '誤字', '오자', 0),
+('字', '誤字', '오자', 1),
+('誤', '誤審', '오심', 0),
+('審', '誤審', '오심', 1),
+('誤', '誤差', '오차', 0),
+('差', '誤差', '오차', 1),
+('誤', '誤打', '오타', 0),
+('打', '誤打', '오타', 1),
+('誤', '誤植', '오식', 0),
+('植', '誤植', '오식', 1),
+('誤', '誤爆', '오폭', 0),
+('爆', '誤爆', '오폭', 1),
+('誤', '誤用', '오용', 0),
+('用', '誤用', '오용', 1),
+('誤', '誤稱', '오칭', 0),
+('稱', '誤稱', '오칭', 1),
+('誤', '誤答', '오답', 0),
+('答', '誤答', '오답', 1),
+('誤', '誤算', '오산', 0),
+('算', '誤算', '오산', 1),
+('誤', '誤解', '오해', 0),
+('解', '誤解', '오해', 1),
+('誤', '誤記', '오기', 0),
+('記', '誤記', '오기', 1),
+('誤', '誤診', '오진', 0),
+('診', '誤診', '오진', 1),
+('誤', '誤認', '오인', 0),
+('認', '誤認', '오인', 1),
+('誤', '誤謬', '오류', 0),
+('謬', '誤謬', '오류', 1),
+('誤', '誤譯', '오역', 0),
+('譯', '誤譯', '오역', 1),
+('誤', '誤讀', '오독', 0),
+('讀', '誤讀', '오독', 1),
+('說', '說', '설', 0),
+('說', '說問', '설문', 0),
+('問', '說問', '설문', 1),
+('說', '說得', '설득', 0),
+('得', '說得', '설득', 1),
+('說', '說敎', '설교', 0),
+('敎', '說敎', '설교', 1),
+('說', '說敎者', '설교자', 0),
+('敎', '說敎者', '설교자', 1),
+('者', '說敎者', '설교자', 2),
+('說', '說教', '설교', 0),
+('教', '說教', '설교', 1),
+('說', '說明', '설명', 0),
+('明', '說明', '설명', 1),
+('說', '說話', '설화', 0),
+('話', '說話', '설화', 1),
+('課', '課', '과', 0),
+('課', '課外', '과외', 0),
+('外', '課外', '과외', 1),
+('課', '課業', '과업', 0),
+('業', '課業', '과업', 1),
+('課', '課稅', '과세', 0),
+('稅', '課稅', '과세', 1),
+('課', '課程', '과정', 0),
+('程', '課程', '과정', 1),
+('課', '課金', '과금', 0),
+('金', '課金', '과금', 1),
+('課', '課長', '과장', 0),
+('長', '課長', '과장', 1),
+('課', '課題', '과제', 0),
+('題', '課題', '과제', 1),
+('誹', '誹謗', '비방', 0),
+('謗', '誹謗', '비방', 1),
+('調', '調停', '조정', 0),
+('停', '調停', '조정', 1),
+('調', '調停者', '조정자', 0),
+('停', '調停者', '조정자', 1),
+('者', '調停者', '조정자', 2),
+('調', '調劑', '조제', 0),
+('劑', '調劑', '조제', 1),
+('調', '調劑學', '조제학', 0),
+('劑', '調劑學', '조제학', 1),
+('學', '調劑學', '조제학', 2),
+('調', '調味', '조미', 0),
+('味', '調味', '조미', 1),
+('調', '調味料', '조미료', 0),
+('味', '調味料', '조미료', 1),
+('料', '調味料', '조미료', 2),
+('調', '調和', '조화', 0),
+('和', '調和', '조화', 1),
+('調', '調和롭다', '조화롭다', 0),
+('和', '調和롭다', '조화롭다', 1),
+('롭', '調和롭다', '조화롭다', 2),
+('다', '調和롭다', '조화롭다', 3),
+('調', '調律', '조율', 0),
+('律', '調律', '조율', 1),
+('調', '調敎', '조교', 0),
+('敎', '調敎', '조교', 1),
+('調', '調整', '조정', 0),
+('整', '調整', '조정', 1),
+('調', '調査', '조사', 0),
+('査', '調査', '조사', 1),
+('調', '調査官', '조사관', 0),
+('査', '調査官', '조사관', 1),
+('官', '調査官', '조사관', 2),
+('調', '調理', '조리', 0),
+('理', '調理', '조리', 1),
+('調', '調理士', '조리사', 0),
+('理', '調理士', '조리사', 1),
+('士', '調理士', '조리사', 2),
+('調', '調理師', '조리사', 0),
+('理', '調理師', '조리사', 1),
+('師', '調理師', '조리사', 2),
+('調', '調節', '조절', 0),
+('節', '調節', '조절', 1),
+('調', '調絃病', '조현병', 0),
+('絃', '調絃病', '조현병', 1),
+('病', '調絃病', '조현병', 2),
+('調', '調製', '조제', 0),
+('製', '調製', '조제', 1),
+('調', '調達', '조달', 0),
+('達', '調達', '조달', 1),
+('談', '談話', '담화', 0),
+('話', '談話', '담화', 1),
+('請', '請', '청', 0),
+('請', '請婚', '청혼', 0),
+('婚', '請婚', '청혼', 1),
+('請', '請求', '청구', 0),
+('求', '請求', '청구', 1),
+('請', '請求書', '청구서', 0),
+('求', '請求書', '청구서', 1),
+('書', '請求書', '청구서', 2),
+('請', '請牒狀', '청첩장', 0),
+('牒', '請牒狀', '청첩장', 1),
+('狀', '請牒狀', '청첩장', 2),
+('請', '請託', '청탁', 0),
+('託', '請託', '청탁', 1),
+('請', '請願', '청원', 0),
+('願', '請願', '청원', 1),
+('請', '請願者', '청원자', 0),
+('願', '請願者', '청원자', 1),
+('者', '請願者', '청원자', 2),
+('諒', '諒解', '양해', 0),
+('解', '諒解', '양해', 1),
+('論', '論', '논', 0),
+('論', '論', '론', 0),
+('論', '論功行賞', '논공행상', 0),
+('功', '論功行賞', '논공행상', 1),
+('行', '論功行賞', '논공행상', 2),
+('賞', '論功行賞', '논공행상', 3),
+('論', '論壇', '논단', 0),
+('壇', '論壇', '논단', 1),
+('論', '論壇', '론단', 0),
+('壇', '論壇', '론단', 1),
+('論', '論客', '논객', 0),
+('客', '論客', '논객', 1),
+('論', '論文', '논문', 0),
+('文', '論文', '논문', 1),
+('論', '論文', '론문', 0),
+('文', '論文', '론문', 1),
+('論', '論文集', '논문집', 0),
+('文', '論文集', '논문집', 1),
+('集', '論文集', '논문집', 2),
+('論', '論斷', '논단', 0),
+('斷', '論斷', '논단', 1),
+('論', '論斷', '론단', 0),
+('斷', '論斷', '론단', 1),
+('論', '論旨', '논지', 0),
+('旨', '論旨', '논지', 1),
+('論', '論法', '논법', 0),
+('法', '論法', '논법', 1),
+('論', '論爭', '논쟁', 0),
+('爭', '論爭', '논쟁', 1),
+('論', '論爭', '론쟁', 0),
+('爭', '論爭', '론쟁', 1),
+('論', '論爭者', '논쟁자', 0),
+('爭', '論爭者', '논쟁자', 1),
+('者', '論爭者', '논쟁자', 2),
+('論', '論爭點', '논쟁점', 0),
+('爭', '論爭點', '논쟁점', 1),
+('點', '論爭點', '논쟁점', 2),
+('論', '論理', '논리', 0),
+('理', '論理', '논리', 1),
+('論', '論理主義者', '논리주의자', 0),
+('理', '論理主義者', '논리주의자', 1),
+('主', '論理主義者', '논리주의자', 2),
+('義', '論理主義者', '논리주의자', 3),
+('者', '論理主義者', '논리주의자', 4),
+('論', '論理學', '논리학', 0),
+('理', '論理學', '논리학', 1),
+('學', '論理學', '논리학', 2),
+('論', '論理的', '논리적', 0),
+('理', '論理的', '논리적', 1),
+('的', '論理的', '논리적', 2),
+('論', '論理積', '논리적', 0),
+('理', '論理積', '논리적', 1),
+('積', '論理積', '논리적', 2),
+('論', '論破', '논파', 0),
+('破', '論破', '논파', 1),
+('論', '論評', '논평', 0),
+('評', '論評', '논평', 1),
+('論', '論語', '논어', 0),
+('語', '論語', '논어', 1),
+('論', '論證', '논증', 0),
+('證', '論證', '논증', 1),
+('論', '論證', '론증', 0),
+('證', '論證', '론증', 1),
+('論', '論議', '논의', 0),
+('議', '論議', '논의', 1),
+('論', '論述', '논술', 0),
+('述', '論述', '논술', 1),
+('論', '論難', '논란', 0),
+('難', '論難', '논란', 1),
+('論', '論題', '논제', 0),
+('題', '論題', '논제', 1),
+('論', '論駁', '논박', 0),
+('駁', '論駁', '논박', 1),
+('論', '論點', '논점', 0),
+('點', '論點', '논점', 1),
+('諛', '諛言', '유언', 0),
+('言', '諛言', '유언', 1),
+('諜', '諜報', '첩보', 0),
+('報', '諜報', '첩보', 1),
+('諡', '諡號', '시호', 0),
+('號', '諡號', '시호', 1),
+('諦', '諦念', '체념', 0),
+('念', '諦念', '체념', 1),
+('諧', '諧調', '해조', 0),
+('調', '諧調', '해조', 1),
+('諧', '諧謔', '해학', 0),
+('謔', '諧謔', '해학', 1),
+('諮', '諮問', '자문', 0),
+('問', '諮問', '자문', 1),
+('諷', '諷刺', '풍자', 0),
+('刺', '諷刺', '풍자', 1),
+('諷', '諷刺文', '풍자문', 0),
+('刺', '諷刺文', '풍자문', 1),
+('文', '諷刺文', '풍자문', 2),
+('諸', '諸元', '제원', 0),
+('元', '諸元', '제원', 1),
+('諸', '諸子百家', '제자백가', 0),
+('子', '諸子百家', '제자백가', 1),
+('百', '諸子百家', '제자백가', 2),
+('家', '諸子百家', '제자백가', 3),
+('諸', '諸島', '제도', 0),
+('島', '諸島', '제도', 1),
+('諸', '諸法', '제법', 0),
+('法', '諸法', '제법', 1),
+('諸', '諸葛亮', '제갈량', 0),
+('葛', '諸葛亮', '제갈량', 1),
+('亮', '諸葛亮', '제갈량', 2),
+('諸', '諸行無常', '제행무상', 0),
+('行', '諸行無常', '제행무상', 1),
+('無', '諸行無常', '제행무상', 2),
+('常', '諸行無常', '제행무상', 3),
+('諺', '諺文', '언문', 0),
+('文', '諺文', '언문', 1),
+('諺', '諺簡', '언간', 0),
+('簡', '諺簡', '언간', 1),
+('諺', '諺解', '언해', 0),
+('解', '諺解', '언해', 1),
+('謀', '謀反', '모반', 0),
+('反', '謀反', '모반', 1),
+('謀', '謀叛', '모반', 0),
+('叛', '謀叛', '모반', 1),
+('謀', '謀殺', '모살', 0),
+('殺', '謀殺', '모살', 1),
+('謀', '謀略', '모략', 0),
+('略', '謀略', '모략', 1),
+('謀', '謀議', '모의', 0),
+('議', '謀議', '모의', 1),
+('謁', '謁見', '알현', 0),
+('見', '謁見', '알현', 1),
+('謂', '謂', '위', 0),
+('謄', '謄寫', '등사', 0),
+('寫', '謄寫', '등사', 1),
+('謄', '謄寫版', '등사판', 0),
+('寫', '謄寫版', '등사판', 1),
+('版', '謄寫版', '등사판', 2),
+('謄', '謄本', '등본', 0),
+('本', '謄本', '등본', 1),
+('謄', '謄送', '등송', 0),
+('送', '謄送', '등송', 1),
+('謎', '謎題', '미제', 0),
+('題', '謎題', '미제', 1),
+('謙', '謙讓', '겸양', 0),
+('讓', '謙讓', '겸양', 1),
+('謙', '謙讓語', '겸양어', 0),
+('讓', '謙讓語', '겸양어', 1),
+('語', '謙讓語', '겸양어', 2),
+('謙', '謙遜', '겸손', 0),
+('遜', '謙遜', '겸손', 1),
+('講', '講和', '강화', 0),
+('和', '講和', '강화', 1),
+('講', '講唱', '강창', 0),
+('唱', '講唱', '강창', 1),
+('講', '講堂', '강당', 0),
+('堂', '講堂', '강당', 1),
+('講', '講壇', '강단', 0),
+('壇', '講壇', '강단', 1),
+('講', '講師', '강사', 0),
+('師', '講師', '강사', 1),
+('講', '講座', '강좌', 0),
+('座', '講座', '강좌', 1),
+('講', '講演', '강연', 0),
+('演', '講演', '강연', 1),
+('講', '講演者', '강연자', 0),
+('演', '講演者', '강연자', 1),
+('者', '講演者', '강연자', 2),
+('講', '講義', '강의', 0),
+('義', '講義', '강의', 1),
+('講', '講話', '강화', 0),
+('話', '講話', '강화', 1),
+('講', '講讀', '강독', 0),
+('讀', '講讀', '강독', 1),
+('講', '講釋', '강석', 0),
+('釋', '講釋', '강석', 1),
+('謝', '謝意', '사의', 0),
+('意', '謝意', '사의', 1),
+('謝', '謝禮', '사례', 0),
+('禮', '謝禮', '사례', 1),
+('謝', '謝禮金', '사례금', 0),
+('禮', '謝禮金', '사례금', 1),
+('金', '謝禮金', '사례금', 2),
+('謝', '謝罪', '사죄', 0),
+('罪', '謝罪', '사죄', 1),
+('謝', '謝肉祭', '사육제', 0),
+('肉', '謝肉祭', '사육제', 1),
+('祭', '謝肉祭', '사육제', 2),
+('謝', '謝過', '사과', 0),
+('過', '謝過', '사과', 1),
+('謬', '謬算', '유산', 0),
+('算', '謬算', '유산', 1),
+('謳', '謳歌', '구가', 0),
+('歌', '謳歌', '구가', 1),
+('謹', '謹嚴', '근엄', 0),
+('嚴', '謹嚴', '근엄', 1),
+('謹', '謹愼', '근신', 0),
+('愼', '謹愼', '근신', 1),
+('證', '證人', '증인', 0),
+('人', '證人', '증인', 1),
+('證', '證券', '증권', 0),
+('券', '證券', '증권', 1),
+('證', '證券社', '증권사', 0),
+('券', '證券社', '증권사', 1),
+('社', '證券社', '증권사', 2),
+('證', '證據', '증거', 0),
+('據', '證據', '증거', 1),
+('證', '證明', '증명', 0),
+('明', '證明', '증명', 1),
+('證', '證明書', '증명서', 0),
+('明', '證明書', '증명서', 1),
+('書', '證明書', '증명서', 2),
+('證', '證書', '증서', 0),
+('書', '證書', '증서', 1),
+('證', '證言', '증언', 0),
+('言', '證言', '증언', 1),
+('識', '識別', '식별', 0),
+('別', '識別', '식별', 1),
+('識', '識別子', '식별자', 0),
+('別', '識別子', '식별자', 1),
+('子', '識別子', '식별자', 2),
+('識', '識字憂患', '식자우환', 0),
+('字', '識字憂患', '식자우환', 1),
+('憂', '識字憂患', '식자우환', 2),
+('患', '識字憂患', '식자우환', 3),
+('識', '識度', '식도', 0),
+('度', '識度', '식도', 1),
+('識', '識者', '식자', 0),
+('者', '識者', '식자', 1),
+('識', '識見', '식견', 0),
+('見', '識見', '식견', 1),
+('譜', '譜學', '보학', 0),
+('學', '譜學', '보학', 1),
+('譜', '譜表', '보표', 0),
+('表', '譜表', '보표', 1),
+('警', '警備', '경비', 0),
+('備', '警備', '경비', 1),
+('警', '警備兵', '경비병', 0),
+('備', '警備兵', '경비병', 1),
+('兵', '警備兵', '경비병', 2),
+('警', '警備員', '경비원', 0),
+('備', '警備員', '경비원', 1),
+('員', '警備員', '경비원', 2),
+('警', '警備隊', '경비대', 0),
+('備', '警備隊', '경비대', 1),
+('隊', '警備隊', '경비대', 2),
+('警', '警句', '경구', 0),
+('句', '警句', '경구', 1),
+('警', '警告', '경고', 0),
+('告', '警告', '경고', 1),
+('警', '警告窓', '경고창', 0),
+('告', '警告窓', '경고창', 1),
+('窓', '警告窓', '경고창', 2),
+('警', '警報', '경보', 0),
+('報', '警報', '경보', 1),
+('警', '警報器', '경보기', 0),
+('報', '警報器', '경보기', 1),
+('器', '警報器', '경보기', 2),
+('警', '警官', '경관', 0),
+('官', '警官', '경관', 1),
+('警', '警察', '경찰', 0),
+('察', '警察', '경찰', 1),
+('警', '警察官', '경찰관', 0),
+('察', '警察官', '경찰관', 1),
+('官', '警察官', '경찰관', 2),
+('警', '警察犬', '경찰견', 0),
+('察', '警察犬', '경찰견', 1),
+('犬', '警察犬', '경찰견', 2),
+('警', '警察署', '경찰서', 0),
+('察', '警察署', '경찰서', 1),
+('署', '警察署', '경찰서', 2),
+('警', '警察車', '경찰차', 0),
+('察', '警察車', '경찰차', 1),
+('車', '警察車', '경찰차', 2),
+('警', '警戒', '경계', 0),
+('戒', '警戒', '경계', 1),
+('警', '警笛', '경적', 0),
+('笛', '警笛', '경적', 1),
+('警', '警衛', '경위', 0),
+('衛', '警衛', '경위', 1),
+('警', '警護員', '경호원', 0),
+('護', '警護員', '경호원', 1),
+('員', '警護員', '경호원', 2),
+('警', '警醒', '경성', 0),
+('醒', '警醒', '경성', 1),
+('警', '警鐘', '경종', 0),
+('鐘', '警鐘', '경종', 1),
+('警', '警音機', '경음기', 0),
+('音', '警音機', '경음기', 1),
+('機', '警音機', '경음기', 2),
+('譫', '譫妄', '섬망', 0),
+('妄', '譫妄', '섬망', 1),
+('譬', '譬喩的', '비유적', 0),
+('喩', '譬喩的', '비유적', 1),
+('的', '譬喩的', '비유적', 2),
+('譯', '譯者', '역자', 0),
+('者', '譯者', '역자', 1),
+('譯', '譯註', '역주', 0),
+('註', '譯註', '역주', 1),
+('議', '議事', '의사', 0),
+('事', '議事', '의사', 1),
+('議', '議事日程', '의사일정', 0),
+('事', '議事日程', '의사일정', 1),
+('日', '議事日程', '의사일정', 2),
+('程', '議事日程', '의사일정', 3),
+('議', '議事錄', '의사록', 0),
+('事', '議事錄', '의사록', 1),
+('錄', '議事錄', '의사록', 2),
+('議', '議員', '의원', 0),
+('員', '議員', '의원', 1),
+('議', '議定書', '의정서', 0),
+('定', '議定書', '의정서', 1),
+('書', '議定書', '의정서', 2),
+('議', '議會', '의회', 0),
+('會', '議會', '의회', 1),
+('議', '議會主義', '의회주의', 0),
+('會', '議會主義', '의회주의', 1),
+('主', '議會主義', '의회주의', 2),
+('義', '議會主義', '의회주의', 3),
+('議', '議決', '의결', 0),
+('決', '議決', '의결', 1),
+('議', '議論', '의논', 0),
+('論', '議論', '의논', 1),
+('議', '議長', '의장', 0),
+('長', '議長', '의장', 1),
+('議', '議院', '의원', 0),
+('院', '議院', '의원', 1),
+('議', '議題', '의제', 0),
+('題', '議題', '의제', 1),
+('議', '議論', '의논', 0),
+('論', '議論', '의논', 1),
+('譴', '譴責', '견책', 0),
+('責', '譴責', '견책', 1),
+('護', '護憲', '호헌', 0),
+('憲', '護憲', '호헌', 1),
+('護', '護法', '호법', 0),
+('法', '護法', '호법', 1),
+('護', '護衛', '호위', 0),
+('衛', '護衛', '호위', 1),
+('護', '護身', '호신', 0),
+('身', '護身', '호신', 1),
+('護', '護身用', '호신용', 0),
+('身', '護身用', '호신용', 1),
+('用', '護身用', '호신용', 2),
+('護', '護身術', '호신술', 0),
+('身', '護身術', '호신술', 1),
+('術', '護身術', '호신술', 2),
+('護', '護送', '호송', 0),
+('送', '護送', '호송', 1),
+('讀', '讀心術', '독심술', 0),
+('心', '讀心術', '독심술', 1),
+('術', '讀心術', '독심술', 2),
+('讀', '讀書', '독서', 0),
+('書', '讀書', '독서', 1),
+('讀', '讀書室', '독서실', 0),
+('書', '讀書室', '독서실', 1),
+('室', '讀書室', '독서실', 2),
+('讀', '讀書狂', '독서광', 0),
+('書', '讀書狂', '독서광', 1),
+('狂', '讀書狂', '독서광', 2),
+('讀', '讀本', '독본', 0),
+('本', '讀本', '독본', 1),
+('讀', '讀經', '독경', 0),
+('經', '讀經', '독경', 1),
+('讀', '讀者', '독자', 0),
+('者', '讀者', '독자', 1),
+('讀', '讀解', '독해', 0),
+('解', '讀解', '독해', 1),
+('讀', '讀音', '독음', 0),
+('音', '讀音', '독음', 1),
+('變', '變', '변', 0),
+('變', '變則', '변칙', 0),
+('則', '變則', '변칙', 1),
+('變', '變動', '변동', 0),
+('動', '變動', '변동', 1),
+('變', '變化', '변화', 0),
+('化', '變化', '변화', 1),
+('變', '變化球', '변화구', 0),
+('化', '變化球', '변화구', 1),
+('球', '變化球', '변화구', 2),
+('變', '變壓器', '변압기', 0),
+('壓', '變壓器', '변압기', 1),
+('器', '變壓器', '변압기', 2),
+('變', '變奏', '변주', 0),
+('奏', '變奏', '변주', 1),
+('變', '變奏曲', '변주곡', 0),
+('奏', '變奏曲', '변주곡', 1),
+('曲', '變奏曲', '변주곡', 2),
+('變', '變形', '변형', 0),
+('形', '變形', '변형', 1),
+('變', '變形力', '변형력', 0),
+('形', '變形力', '변형력', 1),
+('力', '變形力', '변형력', 2),
+('變', '變德스럽다', '변덕스럽다', 0),
+('德', '變德스럽다', '변덕스럽다', 1),
+('스', '變德스럽다', '변덕스럽다', 2),
+('럽', '變德스럽다', '변덕스럽다', 3),
+('다', '變德스럽다', '변덕스럽다', 4),
+('變', '變態', '변태', 0),
+('態', '變態', '변태', 1),
+('變', '變成岩', '변성암', 0),
+('成', '變成岩', '변성암', 1),
+('岩', '變成岩', '변성암', 2),
+('變', '變換', '변환', 0),
+('換', '變換', '변환', 1),
+('變', '變數', '변수', 0),
+('數', '變數', '변수', 1),
+('變', '變更', '변경', 0),
+('更', '變更', '변경', 1),
+('變', '變溫動物', '변온동물', 0),
+('溫', '變溫動物', '변온동물', 1),
+('動', '變溫動物', '변온동물', 2),
+('物', '變溫動物', '변온동물', 3),
+('變', '變異', '변이', 0),
+('異', '變異', '변이', 1),
+('變', '變異  脂', '변이 지방', 0),
+('異', '變異  脂', '변이 지방', 1),
+('脂', '變異  脂', '변이 지방', 4),
+('變', '變移', '변이', 0),
+('移', '變移', '변이', 1),
+('變', '變種', '변종', 0),
+('種', '變種', '변종', 1),
+('變', '變節', '변절', 0),
+('節', '變節', '변절', 1),
+('變', '變節者', '변절자', 0),
+('節', '變節者', '변절자', 1),
+('者', '變節者', '변절자', 2),
+('變', '變色', '변색', 0),
+('色', '變色', '변색', 1),
+('變', '變裝', '변장', 0),
+('裝', '變裝', '변장', 1),
+('變', '變貌', '변모', 0),
+('貌', '變貌', '변모', 1),
+('變', '變身', '변신', 0),
+('身', '變身', '변신', 1),
+('變', '變遷', '변천', 0),
+('遷', '變遷', '변천', 1),
+('變', '變體', '변체', 0),
+('體', '變體', '변체', 1),
+('讓', '讓步', '양보', 0),
+('步', '讓步', '양보', 1),
+('讖', '讖緯', '참위', 0),
+('緯', '讖緯', '참위', 1),
+('讖', '讖語', '참어', 0),
+('語', '讖語', '참어', 1),
+('讚', '讚揚', '찬양', 0),
+('揚', '讚揚', '찬양', 1),
+('讚', '讚歌', '찬가', 0),
+('歌', '讚歌', '찬가', 1),
+('讚', '讚美', '찬미', 0),
+('美', '讚美', '찬미', 1),
+('讚', '讚辭', '찬사', 0),
+('辭', '讚辭', '찬사', 1),
+('谷', '谷', '곡', 0),
+('谷', '谷蠡', '녹려', 0),
+('蠡', '谷蠡', '녹려', 1),
+('谷', '谷風', '곡풍', 0),
+('風', '谷風', '곡풍', 1),
+('豆', '豆乳', '두유', 0),
+('乳', '豆乳', '두유', 1),
+('豆', '豆瓣醬', '두반장', 0),
+('瓣', '豆瓣醬', '두반장', 1),
+('醬', '豆瓣醬', '두반장', 2),
+('豆', '豆腐', '두부', 0),
+('腐', '豆腐', '두부', 1),
+('豆', '豆豉', '두시', 0),
+('豉', '豆豉', '두시', 1),
+('豊', '豊富', '풍부', 0),
+('富', '豊富', '풍부', 1),
+('豊', '豊年', '풍년', 0),
+('年', '豊年', '풍년', 1),
+('豊', '豊年花', '풍년화', 0),
+('年', '豊年花', '풍년화', 1),
+('花', '豊年花', '풍년화', 2),
+('豊', '豊滿', '풍만', 0),
+('滿', '豊滿', '풍만', 1),
+('豊', '豊饒', '풍요', 0),
+('饒', '豊饒', '풍요', 1),
+('豌', '豌豆', '완두', 0),
+('豆', '豌豆', '완두', 1),
+('豐', '豐', '풍', 0),
+('豐', '豐富', '풍부', 0),
+('富', '豐富', '풍부', 1),
+('豐', '豐足', '풍족', 0),
+('足', '豐足', '풍족', 1),
+('豐', '豐頰', '풍협', 0),
+('頰', '豐頰', '풍협', 1),
+('豐', '豐頰美人', '풍협미인', 0),
+('頰', '豐頰美人', '풍협미인', 1),
+('美', '豐頰美人', '풍협미인', 2),
+('人', '豐頰美人', '풍협미인', 3),
+('象', '象形', '상형', 0),
+('形', '象形', '상형', 1),
+('象', '象形文字', '상형문자', 0),
+('形', '象形文字', '상형문자', 1),
+('文', '象形文字', '상형문자', 2),
+('字', '象形文字', '상형문자', 3),
+('象', '象徵', '상징', 0),
+('徵', '象徵', '상징', 1),
+('象', '象徵的', '상징적', 0),
+('徵', '象徵的', '상징적', 1),
+('的', '象徵的', '상징적', 2),
+('象', '象牙', '상아', 0),
+('牙', '象牙', '상아', 1),
+('象', '象牙塔', '상아탑', 0),
+('牙', '象牙塔', '상아탑', 1),
+('塔', '象牙塔', '상아탑', 2),
+('象', '象牙海岸', '상아해안', 0),
+('牙', '象牙海岸', '상아해안', 1),
+('海', '象牙海岸', '상아해안', 2),
+('岸', '象牙海岸', '상아해안', 3),
+('豪', '豪勢', '호세', 0),
+('勢', '豪勢', '호세', 1),
+('豪', '豪奢비오리', '호사비오리', 0),
+('奢', '豪奢비오리', '호사비오리', 1),
+('비', '豪奢비오리', '호사비오리', 2),
+('오', '豪奢비오리', '호사비오리', 3),
+('리', '豪奢비오리', '호사비오리', 4),
+('豪', '豪快', '호쾌', 0),
+('快', '豪快', '호쾌', 1),
+('豪', '豪雨', '호우', 0),
+('雨', '豪雨', '호우', 1),
+('豫', '豫備', '예비', 0),
+('備', '豫備', '예비', 1),
+('豫', '豫備兵', '예비병', 0),
+('備', '豫備兵', '예비병', 1),
+('兵', '豫備兵', '예비병', 2),
+('豫', '豫備訊問', '예비신문', 0),
+('備', '豫備訊問', '예비신문', 1),
+('訊', '豫備訊問', '예비신문', 2),
+('問', '豫備訊問', '예비신문', 3),
+('豫', '豫備軍', '예비군', 0),
+('備', '豫備軍', '예비군', 1),
+('軍', '豫備軍', '예비군', 2),
+('豫', '豫告', '예고', 0),
+('告', '豫告', '예고', 1),
+('豫', '豫報', '예보', 0),
+('報', '豫報', '예보', 1),
+('豫', '豫定', '예정', 0),
+('定', '豫定', '예정', 1),
+('豫', '豫後', '예후', 0),
+('後', '豫後', '예후', 1),
+('豫', '豫想', '예상', 0),
+('想', '豫想', '예상', 1),
+('豫', '豫感', '예감', 0),
+('感', '豫感', '예감', 1),
+('豫', '豫斷', '예단', 0),
+('斷', '豫斷', '예단', 1),
+('豫', '豫期', '예기', 0),
+('期', '豫期', '예기', 1),
+('豫', '豫測', '예측', 0),
+('測', '豫測', '예측', 1),
+('豫', '豫熱', '예열', 0),
+('熱', '豫熱', '예열', 1),
+('豫', '豫知', '예지', 0),
+('知', '豫知', '예지', 1),
+('豫', '豫示', '예시', 0),
+('示', '豫示', '예시', 1),
+('豫', '豫算', '예산', 0),
+('算', '豫算', '예산', 1),
+('豫', '豫約', '예약', 0),
+('約', '豫約', '예약', 1),
+('豫', '豫約者', '예약자', 0),
+('約', '豫約者', '예약자', 1),
+('者', '豫約者', '예약자', 2),
+('豫', '豫習', '예습', 0),
+('習', '豫習', '예습', 1),
+('豫', '豫行', '예행', 0),
+('行', '豫行', '예행', 1),
+('豫', '豫見', '예견', 0),
+('見', '豫見', '예견', 1),
+('豫', '豫言', '예언', 0),
+('言', '豫言', '예언', 1),
+('豫', '豫言者', '예언자', 0),
+('言', '豫言者', '예언자', 1),
+('者', '豫言者', '예언자', 2),
+('豫', '豫買', '예매', 0),
+('買', '豫買', '예매', 1),
+('豫', '豫選', '예선', 0),
+('選', '豫選', '예선', 1),
+('豫', '豫防', '예방', 0),
+('防', '豫防', '예방', 1),
+('豫', '豫防接種', '예방접종', 0),
+('防', '豫防接種', '예방접종', 1),
+('接', '豫防接種', '예방접종', 2),
+('種', '豫防接種', '예방접종', 3),
+('貊', '貊', '맥', 0),
+('貔', '貔貅', '비휴', 0),
+('貅', '貔貅', '비휴', 1),
+('貘', '貘', '맥', 0),
+('貝', '貝塚', '패총', 0),
+('塚', '貝塚', '패총', 1),
+('貝', '貝殼', '패각', 0),
+('殼', '貝殼', '패각', 1),
+('貝', '貝母', '패모', 0),
+('母', '貝母', '패모', 1),
+('貞', '貞操', '정조', 0),
+('操', '貞操', '정조', 1),
+('貞', '貞操帶', '정조대', 0),
+('操', '貞操帶', '정조대', 1),
+('帶', '貞操帶', '정조대', 2),
+('貞', '貞淑', '정숙', 0),
+('淑', '貞淑', '정숙', 1),
+('貞', '貞潔', '정결', 0),
+('潔', '貞潔', '정결', 1),
+('負', '負債', '부채', 0),
+('債', '負債', '부채', 1),
+('負', '負傷', '부상', 0),
+('傷', '負傷', '부상', 1),
+('負', '負傷者', '부상자', 0),
+('傷', '負傷者', '부상자', 1),
+('者', '負傷者', '부상자', 2),
+('負', '負擔', '부담', 0),
+('擔', '負擔', '부담', 1),
+('負', '負荷', '부하', 0),
+('荷', '負荷', '부하', 1),
+('負', '負號', '부호', 0),
+('號', '負號', '부호', 1),
+('財', '財寶', '재보', 0),
+('寶', '財寶', '재보', 1),
+('財', '財政', '재정', 0),
+('政', '財政', '재정', 1),
+('財', '財政的', '재정적', 0),
+('政', '財政的', '재정적', 1),
+('的', '財政的', '재정적', 2),
+('財', '財數', '재수', 0),
+('數', '財數', '재수', 1),
+('財', '財源', '재원', 0),
+('源', '財源', '재원', 1),
+('財', '財物', '재물', 0),
+('物', '財物', '재물', 1),
+('財', '財産', '재산', 0),
+('産', '財産', '재산', 1),
+('財', '財界', '재계', 0),
+('界', '財界', '재계', 1),
+('財', '財貨', '재화', 0),
+('貨', '財貨', '재화', 1),
+('財', '財閥', '재벌', 0),
+('閥', '財閥', '재벌', 1),
+('貢', '貢物', '공물', 0),
+('物', '貢物', '공물', 1),
+('貢', '貢獻', '공헌', 0),
+('獻', '貢獻', '공헌', 1),
+('貢', '貢賦', '공부', 0),
+('賦', '貢賦', '공부', 1),
+('貧', '貧乳', '빈유', 0),
+('乳', '貧乳', '빈유', 1),
+('貧', '貧困', '빈곤', 0),
+('困', '貧困', '빈곤', 1),
+('貧', '貧困線', '빈곤선', 0),
+('困', '貧困線', '빈곤선', 1),
+('線', '貧困線', '빈곤선', 2),
+('貧', '貧富', '빈부', 0),
+('富', '貧富', '빈부', 1),
+('貧', '貧弱', '빈약', 0),
+('弱', '貧弱', '빈약', 1),
+('貧', '貧民', '빈민', 0),
+('民', '貧民', '빈민', 1),
+('貧', '貧民窟', '빈민굴', 0),
+('民', '貧民窟', '빈민굴', 1),
+('窟', '貧民窟', '빈민굴', 2),
+('貧', '貧民街', '빈민가', 0),
+('民', '貧民街', '빈민가', 1),
+('街', '貧民街', '빈민가', 2),
+('貧', '貧者', '빈자', 0),
+('者', '貧者', '빈자', 1),
+('貨', '貨幣', '화폐', 0),
+('幣', '貨幣', '화폐', 1),
+('貨', '貨幣學', '화폐학', 0),
+('幣', '貨幣學', '화폐학', 1),
+('學', '貨幣學', '화폐학', 2),
+('貨', '貨物', '화물', 0),
+('物', '貨物', '화물', 1),
+('貨', '貨物船', '화물선', 0),
+('物', '貨物船', '화물선', 1),
+('船', '貨物船', '화물선', 2),
+('貨', '貨車', '화차', 0),
+('車', '貨車', '화차', 1),
+('販', '販促', '판촉', 0),
+('促', '販促', '판촉', 1),
+('販', '販賣', '판매', 0),
+('賣', '販賣', '판매', 1),
+('販', '販賣人', '판매인', 0),
+('賣', '販賣人', '판매인', 1),
+('人', '販賣人', '판매인', 2),
+('販', '販賣促進', '판매촉진', 0),
+('賣', '販賣促進', '판매촉진', 1),
+('促', '販賣促進', '판매촉진', 2),
+('進', '販賣促進', '판매촉진', 3),
+('販', '販賣員', '판매원', 0),
+('賣', '販賣員', '판매원', 1),
+('員', '販賣員', '판매원', 2),
+('販', '販賣店', '판매점', 0),
+('賣', '販賣店', '판매점', 1),
+('店', '販賣店', '판매점', 2),
+('販', '販賣臺', '판매대', 0),
+('賣', '販賣臺', '판매대', 1),
+('臺', '販賣臺', '판매대', 2),
+('販', '販路', '판로', 0),
+('路', '販路', '판로', 1),
+('貪', '貪', '탐', 0),
+('貪', '貪官汚吏', '탐관오리', 0),
+('官', '貪官汚吏', '탐관오리', 1),
+('汚', '貪官汚吏', '탐관오리', 2),
+('吏', '貪官汚吏', '탐관오리', 3),
+('貪', '貪慾', '탐욕', 0),
+('慾', '貪慾', '탐욕', 1),
+('貫', '貫子', '관자', 0),
+('子', '貫子', '관자', 1),
+('貫', '貫祿', '관록', 0),
+('祿', '貫祿', '관록', 1),
+('貫', '貫通', '관통', 0),
+('通', '貫通', '관통', 1),
+('責', '責任', '책임', 0),
+('任', '責任', '책임', 1),
+('責', '責任感', '책임감', 0),
+('任', '責任感', '책임감', 1),
+('感', '責任感', '책임감', 2),
+('責', '責任者', '책임자', 0),
+('任', '責任者', '책임자', 1),
+('者', '責任者', '책임자', 2),
+('責', '責應', '책응', 0),
+('應', '責應', '책응', 1),
+('責', '責望', '책망', 0),
+('望', '責望', '책망', 1),
+('貯', '貯水池', '저수지', 0),
+('水', '貯水池', '저수지', 1),
+('池', '貯水池', '저수지', 2),
+('貯', '貯蓄', '저축', 0),
+('蓄', '貯蓄', '저축', 1),
+('貯', '貯藏', '저장', 0),
+('藏', '貯藏', '저장', 1),
+('貯', '貯藏所', '저장소', 0),
+('藏', '貯藏所', '저장소', 1),
+('所', '貯藏所', '저장소', 2),
+('貯', '貯金', '저금', 0),
+('金', '貯金', '저금', 1),
+('貯', '貯金筒', '저금통', 0),
+('金', '貯金筒', '저금통', 1),
+('筒', '貯金筒', '저금통', 2),
+('貰', '貰入者', '세입자', 0),
+('入', '貰入者', '세입자', 1),
+('者', '貰入者', '세입자', 2),
+('貴', '貴', '귀', 0),
+('貴', '貴下', '귀하', 0),
+('下', '貴下', '귀하', 1),
+('貴', '貴人', '귀인', 0),
+('人', '貴人', '귀인', 1),
+('貴', '貴女', '귀녀', 0),
+('女', '貴女', '귀녀', 1),
+('貴', '貴婦人', '귀부인', 0),
+('婦', '貴婦人', '귀부인', 1),
+('人', '貴婦人', '귀부인', 2),
+('貴', '貴嬪', '귀빈', 0),
+('嬪', '貴嬪', '귀빈', 1),
+('貴', '貴州', '귀주', 0),
+('州', '貴州', '귀주', 1),
+('貴', '貴族', '귀족', 0),
+('族', '貴族', '귀족', 1),
+('貴', '貴賓', '귀빈', 0),
+('賓', '貴賓', '귀빈', 1),
+('貴', '貴重', '귀중', 0),
+('重', '貴重', '귀중', 1),
+('貶', '貶下', '폄하', 0),
+('下', '貶下', '폄하', 1),
+('貶', '貶毁', '폄훼', 0),
+('毁', '貶毁', '폄훼', 1),
+('買', '買收', '매수', 0),
+('收', '買收', '매수', 1),
+('買', '買春', '매춘', 0),
+('春', '買春', '매춘', 1),
+('貸', '貸付', '대부', 0),
+('付', '貸付', '대부', 1),
+('貸', '貸付金', '대부금', 0),
+('付', '貸付金', '대부금', 1),
+('金', '貸付金', '대부금', 2),
+('貸', '貸借', '대차', 0),
+('借', '貸借', '대차', 1),
+('貸', '貸出', '대출', 0),
+('出', '貸出', '대출', 1),
+('貸', '貸出金', '대출금', 0),
+('出', '貸出金', '대출금', 1),
+('金', '貸出金', '대출금', 2),
+('貸', '貸款', '대콴', 0),
+('款', '貸款', '대콴', 1),
+('貸', '貸與', '대여', 0),
+('與', '貸與', '대여', 1),
+('費', '費用', '비용', 0),
+('用', '費用', '비용', 1),
+('貼', '貼', '첩', 0),
+('貼', '貼付', '첩부', 0),
+('付', '貼付', '첩부', 1),
+('貿', '貿易', '무역', 0),
+('易', '貿易', '무역', 1),
+('貿', '貿易港', '무역항', 0),
+('易', '貿易港', '무역항', 1),
+('港', '貿易港', '무역항', 2),
+('貿', '貿易風', '무역풍', 0),
+('易', '貿易風', '무역풍', 1),
+('風', '貿易風', '무역풍', 2),
+('賀', '賀客', '하객', 0),
+('客', '賀客', '하객', 1),
+('賂', '賂物', '뇌물', 0),
+('物', '賂物', '뇌물', 1),
+('賃', '賃貸', '임대', 0),
+('貸', '賃貸', '임대', 1),
+('賃', '賃金', '임금', 0),
+('金', '賃金', '임금', 1),
+('賃', '賃金', '임금', 0),
+('金', '賃金', '임금', 1),
+('賄', '賄賂', '회뢰', 0),
+('賂', '賄賂', '회뢰', 1),
+('資', '資力', '자력', 0),
+('力', '資力', '자력', 1),
+('資', '資料', '자료', 0),
+('料', '資料', '자료', 1),
+('資', '資料集', '자료집', 0),
+('料', '資料集', '자료집', 1),
+('集', '資料集', '자료집', 2),
+('資', '資本', '자본', 0),
+('本', '資本', '자본', 1),
+('資', '資本主義', '자본주의', 0),
+('本', '資本主義', '자본주의', 1),
+('主', '資本主義', '자본주의', 2),
+('義', '資本主義', '자본주의', 3),
+('資', '資本家', '자본가', 0),
+('本', '資本家', '자본가', 1),
+('家', '資本家', '자본가', 2),
+('資', '資材', '자재', 0),
+('材', '資材', '자재', 1),
+('資', '資格', '자격', 0),
+('格', '資格', '자격', 1),
+('資', '資格證', '자격증', 0),
+('格', '資格證', '자격증', 1),
+('證', '資格證', '자격증', 2),
+('資', '資源', '자원', 0),
+('源', '資源', '자원', 1),
+('資', '資産', '자산', 0),
+('産', '資産', '자산', 1),
+('資', '資質', '자질', 0),
+('質', '資質', '자질', 1),
+('資', '資金', '자금', 0),
+('金', '資金', '자금', 1),
+('資', '資金洗濯', '자금세탁', 0),
+('金', '資金洗濯', '자금세탁', 1),
+('洗', '資金洗濯', '자금세탁', 2),
+('濯', '資金洗濯', '자금세탁', 3),
+('賊', '賊反荷杖', '적반하장', 0),
+('反', '賊反荷杖', '적반하장', 1),
+('荷', '賊反荷杖', '적반하장', 2),
+('杖', '賊反荷杖', '적반하장', 3),
+('賜', '賜暇', '사가', 0),
+('暇', '賜暇', '사가', 1),
+('賜', '賜花', '사화', 0),
+('花', '賜花', '사화', 1),
+('賞', '賞', '상', 0),
+('賞', '賞味', '상미', 0),
+('味', '賞味', '상미', 1),
+('賞', '賞品', '상품', 0),
+('品', '賞品', '상품', 1),
+('賞', '賞善罰惡', '상선벌악', 0),
+('善', '賞善罰惡', '상선벌악', 1),
+('罰', '賞善罰惡', '상선벌악', 2),
+('惡', '賞善罰惡', '상선벌악', 3),
+('賞', '賞杯', '상배', 0),
+('杯', '賞杯', '상배', 1),
+('賞', '賞牌', '상패', 0),
+('牌', '賞牌', '상패', 1),
+('賞', '賞盃', '상배', 0),
+('盃', '賞盃', '상배', 1),
+('賞', '賞與', '상여', 0),
+('與', '賞與', '상여', 1),
+('賞', '賞金', '상금', 0),
+('金', '賞金', '상금', 1),
+('賞', '賞金', '상금', 0),
+('金', '賞金', '상금', 1),
+('賠', '賠償', '배상', 0),
+('償', '賠償', '배상', 1),
+('賢', '賢人', '현인', 0),
+('人', '賢人', '현인', 1),
+('賢', '賢夫人', '현부인', 0),
+('夫', '賢夫人', '현부인', 1),
+('人', '賢夫人', '현부인', 2),
+('賢', '賢愚', '현우', 0),
+('愚', '賢愚', '현우', 1),
+('賢', '賢明', '현명', 0),
+('明', '賢明', '현명', 1),
+('賢', '賢母良妻', '형모양처', 0),
+('母', '賢母良妻', '형모양처', 1),
+('良', '賢母良妻', '형모양처', 2),
+('妻', '賢母良妻', '형모양처', 3),
+('賢', '賢者', '현자', 0),
+('者', '賢者', '현자', 1),
+('賣', '賣上高', '매상고', 0),
+('上', '賣上高', '매상고', 1),
+('高', '賣上高', '매상고', 2),
+('賣', '賣出', '매출', 0),
+('出', '賣出', '매출', 1),
+('賣', '賣出額', '매출액', 0),
+('出', '賣出額', '매출액', 1),
+('額', '賣出額', '매출액', 2),
+('賣', '賣却', '매각', 0),
+('却', '賣却', '매각', 1),
+('賣', '賣國', '매국', 0),
+('國', '賣國', '매국', 1),
+('賣', '賣國奴', '매국노', 0),
+('國', '賣國奴', '매국노', 1),
+('奴', '賣國奴', '매국노', 2),
+('賣', '賣場', '매장', 0),
+('場', '賣場', '매장', 1),
+('賣', '賣店', '매점', 0),
+('店', '賣店', '매점', 1),
+('賣', '賣春', '매춘', 0),
+('春', '賣春', '매춘', 1),
+('賣', '賣春婦', '매춘부', 0),
+('春', '賣春婦', '매춘부', 1),
+('婦', '賣春婦', '매춘부', 2),
+('賣', '賣春窟', '매춘굴', 0),
+('春', '賣春窟', '매춘굴', 1),
+('窟', '賣春窟', '매춘굴', 2),
+('賣', '賣淫', '매음', 0),
+('淫', '賣淫', '매음', 1),
+('賣', '賣淫窟', '매음굴', 0),
+('淫', '賣淫窟', '매음굴', 1),
+('窟', '賣淫窟', '매음굴', 2),
+('賣', '賣渡', '매도', 0),
+('渡', '賣渡', '매도', 1),
+('賣', '賣物', '매물', 0),
+('物', '賣物', '매물', 1),
+('賣', '賣票口', '매표구', 0),
+('票', '賣票口', '매표구', 1),
+('口', '賣票口', '매표구', 2),
+('賣', '賣票所', '매표소', 0),
+('票', '賣票所', '매표소', 1),
+('所', '賣票所', '매표소', 2),
+('賣', '賣藥', '매약', 0),
+('藥', '賣藥', '매약', 1),
+('賣', '賣買', '매매', 0),
+('買', '賣買', '매매', 1),
+('賤', '賤人', '천인', 0),
+('人', '賤人', '천인', 1),
+('賤', '賤妓', '천기', 0),
+('妓', '賤妓', '천기', 1),
+('賤', '賤技', '천기', 0),
+('技', '賤技', '천기', 1),
+('賤', '賤民', '천민', 0),
+('民', '賤民', '천민', 1),
+('賤', '賤稱', '천칭', 0),
+('稱', '賤稱', '천칭', 1),
+('賦', '賦課', '부과', 0),
+('課', '賦課', '부과', 1),
+('質', '質', '질', 0),
+('質', '質問', '질문', 0),
+('問', '質問', '질문', 1),
+('質', '質問者', '질문자', 0),
+('問', '質問者', '질문자', 1),
+('者', '質問者', '질문자', 2),
+('質', '質權', '질권', 0),
+('權', '質權', '질권', 1),
+('質', '質疑', '질의', 0),
+('疑', '質疑', '질의', 1),
+('質', '質的', '질적', 0),
+('的', '質的', '질적', 1),
+('質', '質量', '질량', 0),
+('量', '質量', '질량', 1),
+('賭', '賭博', '도박', 0),
+('博', '賭博', '도박', 1),
+('購', '購入', '구입', 0),
+('入', '購入', '구입', 1),
+('購', '購入處', '구입처', 0),
+('入', '購入處', '구입처', 1),
+('處', '購入處', '구입처', 2),
+('購', '購讀', '구독', 0),
+('讀', '購讀', '구독', 1),
+('購', '購讀料', '구독료', 0),
+('讀', '購讀料', '구독료', 1),
+('料', '購讀料', '구독료', 2),
+('購', '購讀者', '구독자', 0),
+('讀', '購讀者', '구독자', 1),
+('者', '購讀者', '구독자', 2),
+('購', '購販', '구판', 0),
+('販', '購販', '구판', 1),
+('購', '購買', '구매', 0),
+('買', '購買', '구매', 1),
+('購', '購買者', '구매자', 0),
+('買', '購買者', '구매자', 1),
+('者', '購買者', '구매자', 2),
+('贈', '贈呈', '증정', 0),
+('呈', '贈呈', '증정', 1),
+('贈', '贈收賄', '증수회', 0),
+('收', '贈收賄', '증수회', 1),
+('賄', '贈收賄', '증수회', 2),
+('贈', '贈與', '증여', 0),
+('與', '贈與', '증여', 1),
+('贊', '贊', '찬', 0),
+('贊', '贊反', '찬반', 0),
+('反', '贊反', '찬반', 1),
+('贊', '贊成', '찬성', 0),
+('成', '贊成', '찬성', 1),
+('贊', '贊成者', '찬성자', 0),
+('成', '贊成者', '찬성자', 1),
+('者', '贊成者', '찬성자', 2),
+('贓', '贓物', '장물', 0),
+('物', '贓物', '장물', 1),
+('贛', '贛語', '간어', 0),
+('語', '贛語', '간어', 1),
+('赤', '赤', '적', 0),
+('赤', '赤信號', '적신호', 0),
+('信', '赤信號', '적신호', 1),
+('號', '赤信號', '적신호', 2),
+('赤', '赤化', '적화', 0),
+('化', '赤化', '적화', 1),
+('赤', '赤地', '적지', 0),
+('地', '赤地', '적지', 1),
+('赤', '赤外', '적외', 0),
+('外', '赤外', '적외', 1),
+('赤', '赤外線', '적외선', 0),
+('外', '赤外線', '적외선', 1),
+('線', '赤外線', '적외선', 2),
+('赤', '赤字', '적자', 0),
+('字', '赤字', '적자', 1),
+('赤', '赤潮', '적조', 0),
+('潮', '赤潮', '적조', 1),
+('赤', '赤經', '적경', 0),
+('經', '赤經', '적경', 1),
+('赤', '赤線', '적선', 0),
+('線', '赤線', '적선', 1),
+('赤', '赤緯', '적위', 0),
+('緯', '赤緯', '적위', 1),
+('赤', '赤色', '적색', 0),
+('色', '赤色', '적색', 1),
+('赤', '赤葡萄酒', '적포도주', 0),
+('葡', '赤葡萄酒', '적포도주', 1),
+('萄', '赤葡萄酒', '적포도주', 2),
+('酒', '赤葡萄酒', '적포도주', 3),
+('赤', '赤血球', '적혈구', 0),
+('血', '赤血球', '적혈구', 1),
+('球', '赤血球', '적혈구', 2),
+('赤', '赤裸裸', '적나라', 0),
+('裸', '赤裸裸', '적나라', 1),
+('裸', '赤裸裸', '적나라', 2),
+('赤', '赤褐色', '적갈색', 0),
+('褐', '赤褐色', '적갈색', 1),
+('色', '赤褐色', '적갈색', 2),
+('赤', '赤道', '적도', 0),
+('道', '赤道', '적도', 1),
+('赤', '赤鐵鑛', '적철광', 0),
+('鐵', '赤鐵鑛', '적철광', 1),
+('鑛', '赤鐵鑛', '적철광', 2),
+('赤', '赤面', '적면', 0),
+('面', '赤面', '적면', 1),
+('赦', '赦免', '사면', 0),
+('免', '赦免', '사면', 1),
+('赦', '赦罪', '사죄', 0),
+('罪', '赦罪', '사죄', 1),
+('走', '走壘', '주루', 0),
+('壘', '走壘', '주루', 1),
+('走', '走査', '주사', 0),
+('査', '走査', '주사', 1),
+('走', '走査率', '주사율', 0),
+('査', '走査率', '주사율', 1),
+('率', '走査率', '주사율', 2),
+('走', '走狗', '주구', 0),
+('狗', '走狗', '주구', 1),
+('走', '走者', '주자', 0),
+('者', '走者', '주자', 1),
+('赴', '赴任', '부임', 0),
+('任', '赴任', '부임', 1),
+('赴', '赴戰嶺', '부전령', 0),
+('戰', '赴戰嶺', '부전령', 1),
+('嶺', '赴戰嶺', '부전령', 2),
+('起', '起伏', '기복', 0),
+('伏', '起伏', '기복', 1),
+('起', '起動', '기동', 0),
+('動', '起動', '기동', 1),
+('起', '起原', '기원', 0),
+('原', '起原', '기원', 1),
+('起', '起床', '기상', 0),
+('床', '起床', '기상', 1),
+('起', '起業', '기업', 0),
+('業', '起業', '기업', 1),
+('起', '起源', '기원', 0),
+('源', '起源', '기원', 1),
+('起', '起牀', '기상', 0),
+('牀', '起牀', '기상', 1),
+('起', '起用', '기용', 0),
+('用', '起用', '기용', 1),
+('起', '起訴', '기소', 0),
+('訴', '起訴', '기소', 1),
+('起', '起酒떡', '기주떡', 0),
+('酒', '起酒떡', '기주떡', 1),
+('떡', '起酒떡', '기주떡', 2),
+('起', '起重機', '기중기', 0),
+('重', '起重機', '기중기', 1),
+('機', '起重機', '기중기', 2),
+('起', '起點', '기점', 0),
+('點', '起點', '기점', 1),
+('超', '超人', '초인', 0),
+('人', '超人', '초인', 1),
+('超', '超大型', '초대형', 0),
+('大', '超大型', '초대형', 1),
+('型', '超大型', '초대형', 2),
+('超', '超強大國', '초강대국', 0),
+('強', '超強大國', '초강대국', 1),
+('大', '超強大國', '초강대국', 2),
+('國', '超強大國', '초강대국', 3),
+('超', '超心理學', '초심리학', 0),
+('心', '超心理學', '초심리학', 1),
+('理', '超心理學', '초심리학', 2),
+('學', '超心理學', '초심리학', 3),
+('超', '超新星', '초신성', 0),
+('新', '超新星', '초신성', 1),
+('星', '超新星', '초신성', 2),
+('超', '超特級', '초특급', 0),
+('特', '超特級', '초특급', 1),
+('級', '超特級', '초특급', 2),
+('超', '超現實', '초현실', 0),
+('現', '超現實', '초현실', 1),
+('實', '超現實', '초현실', 2),
+('超', '超現實主義', '초현실주의', 0),
+('現', '超現實主義', '초현실주의', 1),
+('實', '超現實主義', '초현실주의', 2),
+('主', '超現實主義', '초현실주의', 3),
+('義', '超現實主義', '초현실주의', 4),
+('超', '超短波', '초단파', 0),
+('短', '超短波', '초단파', 1),
+('波', '超短波', '초단파', 2),
+('超', '超科', '초과', 0),
+('科', '超科', '초과', 1),
+('超', '超能力', '초능력', 0),
+('能', '超能力', '초능력', 1),
+('力', '超能力', '초능력', 2),
+('超', '超自然的', '초자연적', 0),
+('自', '超自然的', '초자연적', 1),
+('然', '超自然的', '초자연적', 2),
+('的', '超自然的', '초자연적', 3),
+('超', '超越', '초월', 0),
+('越', '超越', '초월', 1),
+('超', '超過', '초과', 0),
+('過', '超過', '초과', 1),
+('超', '超過勤務', '초과근무', 0),
+('過', '超過勤務', '초과근무', 1),
+('勤', '超過勤務', '초과근무', 2),
+('務', '超過勤務', '초과근무', 3),
+('超', '超銀河團', '초은하단', 0),
+('銀', '超銀河團', '초은하단', 1),
+('河', '超銀河團', '초은하단', 2),
+('團', '超銀河團', '초은하단', 3),
+('超', '超音波', '초음파', 0),
+('音', '超音波', '초음파', 1),
+('波', '超音波', '초음파', 2),
+('超', '超音速', '초음속', 0),
+('音', '超音速', '초음속', 1),
+('速', '超音速', '초음속', 2),
+('超', '超高速', '초고속', 0),
+('高', '超高速', '초고속', 1),
+('速', '超高速', '초고속', 2),
+('越', '越冬', '월동', 0),
+('冬', '越冬', '월동', 1),
+('越', '越北', '월북', 0),
+('北', '越北', '월북', 1),
+('越', '越南', '월남', 0),
+('南', '越南', '월남', 1),
+('越', '越境地', '월경지', 0),
+('境', '越境地', '월경지', 1),
+('地', '越境地', '월경지', 2),
+('越', '越軍', '월군', 0),
+('軍', '越軍', '월군', 1),
+('趣', '趣向', '취향', 0),
+('向', '趣向', '취향', 1),
+('趣', '趣味', '취미', 0),
+('味', '趣味', '취미', 1),
+('趣', '趣旨', '취지', 0),
+('旨', '趣旨', '취지', 1),
+('趨', '趨勢', '추세', 0),
+('勢', '趨勢', '추세', 1),
+('足', '足', '족', 0),
+('足', '足浴', '족욕', 0),
+('浴', '足浴', '족욕', 1),
+('足', '足跡', '족적', 0),
+('跡', '足跡', '족적', 1),
+('足', '足발', '족발', 0),
+('발', '足발', '족발', 1),
+('跆', '跆拳', '태권', 0),
+('拳', '跆拳', '태권', 1),
+('跆', '跆拳道', '태권도', 0),
+('拳', '跆拳道', '태권도', 1),
+('道', '跆拳道', '태권도', 2),
+('跋', '跋文', '발문', 0),
+('文', '跋文', '발문', 1),
+('跏', '跏趺坐', '가부좌', 0),
+('趺', '跏趺坐', '가부좌', 1),
+('坐', '跏趺坐', '가부좌', 2),
+('跛', '跛行', '파행', 0),
+('行', '跛行', '파행', 1),
+('距', '距離', '거리', 0),
+('離', '距離', '거리', 1),
+('距', '距骨', '거골', 0),
+('骨', '距骨', '거골', 1),
+('路', '路上', '노상', 0),
+('上', '路上', '노상', 1),
+('路', '路線', '노선', 0),
+('線', '路線', '노선', 1),
+('路', '路線', '로선', 0),
+('線', '路線', '로선', 1),
+('路', '路線圖', '노선도', 0),
+('線', '路線圖', '노선도', 1),
+('圖', '路線圖', '노선도', 2),
+('路', '路面', '노면', 0),
+('面', '路面', '노면', 1),
+('路', '路面電車', '노면전차', 0),
+('面', '路面電車', '노면전차', 1),
+('電', '路面電車', '노면전차', 2),
+('車', '路面電車', '노면전차', 3),
+('路', '路鼗', '노도', 0),
+('鼗', '路鼗', '노도', 1),
+('跳', '跳躍', '도약', 0),
+('躍', '跳躍', '도약', 1),
+('踏', '踏査', '답사', 0),
+('査', '踏査', '답사', 1),
+('踏', '踏破', '답파', 0),
+('破', '踏破', '답파', 1),
+('踏', '踏襲', '답습', 0),
+('襲', '踏襲', '답습', 1),
+('蹂', '蹂蹸', '유린', 0),
+('蹸', '蹂蹸', '유린', 1),
+('蹂', '蹂躙', '유린', 0),
+('躙', '蹂躙', '유린', 1),
+('蹂', '蹂躪', '유린', 0),
+('躪', '蹂躪', '유린', 1),
+('蹈', '蹈襲', '도습', 0),
+('襲', '蹈襲', '도습', 1),
+('蹉', '蹉跌', '차질', 0),
+('跌', '蹉跌', '차질', 1),
+('蹤', '蹤跡', '종적', 0),
+('跡', '蹤跡', '종적', 1),
+('蹴', '蹴球', '축구', 0),
+('球', '蹴球', '축구', 1),
+('蹴', '蹴球場', '축구장', 0),
+('球', '蹴球場', '축구장', 1),
+('場', '蹴球場', '축구장', 2),
+('蹴', '蹴球選手', '축구선수', 0),
+('球', '蹴球選手', '축구선수', 1),
+('選', '蹴球選手', '축구선수', 2),
+('手', '蹴球選手', '축구선수', 3),
+('蹶', '蹶起', '궐기', 0),
+('起', '蹶起', '궐기', 1),
+('躊', '躊躇', '주저', 0),
+('躇', '躊躇', '주저', 1),
+('躍', '躍進', '약진', 0),
+('進', '躍進', '약진', 1),
+('身', '身世', '신세', 0),
+('世', '身世', '신세', 1),
+('身', '身分', '신분', 0),
+('分', '身分', '신분', 1),
+('身', '身分證', '신분증', 0),
+('分', '身分證', '신분증', 1),
+('證', '身分證', '신분증', 2),
+('身', '身廊', '신랑', 0),
+('廊', '身廊', '신랑', 1),
+('身', '身彌', '신미', 0),
+('彌', '身彌', '신미', 1),
+('身', '身後', '신후', 0),
+('後', '身後', '신후', 1),
+('身', '身手', '신수', 0),
+('手', '身手', '신수', 1),
+('身', '身柄', '신병', 0),
+('柄', '身柄', '신병', 1),
+('身', '身病', '신병', 0),
+('病', '身病', '신병', 1),
+('身', '身邊雜記', '신변잡기', 0),
+('邊', '身邊雜記', '신변잡기', 1),
+('雜', '身邊雜記', '신변잡기', 2),
+('記', '身邊雜記', '신변잡기', 3),
+('身', '身長', '신장', 0),
+('長', '身長', '신장', 1),
+('身', '身體', '신체', 0),
+('體', '身體', '신체', 1),
+('身', '身體的', '신체적', 0),
+('體', '身體的', '신체적', 1),
+('的', '身體的', '신체적', 2),
+('車', '車', '차', 0),
+('車', '車主', '차주', 0),
+('主', '車主', '차주', 1),
+('車', '車庫', '차고', 0),
+('庫', '車庫', '차고', 1),
+('車', '車掌', '차장', 0),
+('掌', '車掌', '차장', 1),
+('車', '車窓', '차창', 0),
+('窓', '車窓', '차창', 1),
+('車', '車線', '차선', 0),
+('線', '車線', '차선', 1),
+('車', '車費', '차비', 0),
+('費', '車費', '차비', 1),
+('車', '車軸', '차축', 0),
+('軸', '車軸', '차축', 1),
+('車', '車輛', '차량', 0),
+('輛', '車輛', '차량', 1),
+('車', '車輪', '차륜', 0),
+('輪', '車輪', '차륜', 1),
+('車', '車道', '차도', 0),
+('道', '車道', '차도', 1),
+('車', '車馬', '차마', 0),
+('馬', '車馬', '차마', 1),
+('車', '車마당', '차마당', 0),
+('마', '車마당', '차마당', 1),
+('당', '車마당', '차마당', 2),
+('軋', '軋轢', '알력', 0),
+('轢', '軋轢', '알력', 1),
+('軌', '軌跡', '궤적', 0),
+('跡', '軌跡', '궤적', 1),
+('軌', '軌道', '궤도', 0),
+('道', '軌道', '궤도', 1),
+('軍', '軍', '군', 0),
+('軍', '軍事', '군사', 0),
+('事', '軍事', '군사', 1),
+('軍', '軍事力', '군사력', 0),
+('事', '軍事力', '군사력', 1),
+('力', '軍事力', '군사력', 2),
+('軍', '軍事化', '군사화', 0),
+('事', '軍事化', '군사화', 1),
+('化', '軍事化', '군사화', 2),
+('軍', '軍事政權', '군사정권', 0),
+('事', '軍事政權', '군사정권', 1),
+('政', '軍事政權', '군사정권', 2),
+('權', '軍事政權', '군사정권', 3),
+('軍', '軍事演習', '군사연습', 0),
+('事', '軍事演習', '군사연습', 1),
+('演', '軍事演習', '군사연습', 2),
+('習', '軍事演習', '군사연습', 3),
+('軍', '軍事行政', '군사행정', 0),
+('事', '軍事行政', '군사행정', 1),
+('行', '軍事行政', '군사행정', 2),
+('政', '軍事行政', '군사행정', 3),
+('軍', '軍事警察', '군사경찰', 0),
+('事', '軍事警察', '군사경찰', 1),
+('警', '軍事警察', '군사경찰', 2),
+('察', '軍事警察', '군사경찰', 3),
+('軍', '軍人', '군인', 0),
+('人', '軍人', '군인', 1),
+('軍', '軍令', '군령', 0),
+('令', '軍令', '군령', 1),
+('軍', '軍備', '군비', 0),
+('備', '軍備', '군비', 1),
+('軍', '軍刀', '군도', 0),
+('刀', '軍刀', '군도', 1),
+('軍', '軍務', '군무', 0),
+('務', '軍務', '군무', 1),
+('軍', '軍勢', '군세', 0),
+('勢', '軍勢', '군세', 1),
+('軍', '軍國主義', '군국주의', 0),
+('國', '軍國主義', '군국주의', 1),
+('主', '軍國主義', '군국주의', 2),
+('義', '軍國主義', '군국주의', 3),
+('軍', '軍團', '군단', 0),
+('團', '軍團', '군단', 1),
+('軍', '軍士', '군사', 0),
+('士', '軍士', '군사', 1),
+('軍', '軍官', '군관', 0),
+('官', '軍官', '군관', 1),
+('軍', '軍政', '군정', 0),
+('政', '軍政', '군정', 1),
+('軍', '軍旗', '군기', 0),
+('旗', '軍旗', '군기', 1),
+('軍', '軍服', '군복', 0),
+('服', '軍服', '군복', 1),
+('軍', '軍民', '군민', 0),
+('民', '軍民', '군민', 1),
+('軍', '軍法', '군법', 0),
+('法', '軍法', '군법', 1),
+('軍', '軍港', '군항', 0),
+('港', '軍港', '군항', 1),
+('軍', '軍犬', '군견', 0),
+('犬', '軍犬', '군견', 1),
+('軍', '軍番', '군번', 0),
+('番', '軍番', '군번', 1),
+('軍', '軍神', '군신', 0),
+('神', '軍神', '군신', 1),
+('軍', '軍票', '군표', 0),
+('票', '軍票', '군표', 1),
+('軍', '軍紀訓鍊', '군기훈련', 0),
+('紀', '軍紀訓鍊', '군기훈련', 1),
+('訓', '軍紀訓鍊', '군기훈련', 2),
+('鍊', '軍紀訓鍊', '군기훈련', 3),
+('軍', '軍縮', '군축', 0),
+('縮', '軍縮', '군축', 1),
+('軍', '軍艦', '군함', 0),
+('艦', '軍艦', '군함', 1),
+('軍', '軍艦鳥', '군함조', 0),
+('艦', '軍艦鳥', '군함조', 1),
+('鳥', '軍艦鳥', '군함조', 2),
+('軍', '軍談', '군담', 0),
+('談', '軍談', '군담', 1),
+('軍', '軍費', '군비', 0),
+('費', '軍費', '군비', 1),
+('軍', '軍部', '군부', 0),
+('部', '軍部', '군부', 1),
+('軍', '軍醫', '군의', 0),
+('醫', '軍醫', '군의', 1),
+('軍', '軍閥', '군벌', 0),
+('閥', '軍閥', '군벌', 1),
+('軍', '軍隊', '군대', 0),
+('隊', '軍隊', '군대', 1),
+('軍', '軍靴', '군화', 0),
+('靴', '軍靴', '군화', 1),
+('軍', '軍馬', '군마', 0),
+('馬', '軍馬', '군마', 1),
+('軟', '軟', '연', 0),
+('軟', '軟化', '연화', 0),
+('化', '軟化', '연화', 1),
+('軟', '軟口蓋', '연구개', 0),
+('口', '軟口蓋', '연구개', 1),
+('蓋', '軟口蓋', '연구개', 2),
+('軟', '軟口蓋音', '연구개음', 0),
+('口', '軟口蓋音', '연구개음', 1),
+('蓋', '軟口蓋音', '연구개음', 2),
+('音', '軟口蓋音', '연구개음', 3),
+('軟', '軟弱', '연약', 0),
+('弱', '軟弱', '연약', 1),
+('軟', '軟水', '연수', 0),
+('水', '軟水', '연수', 1),
+('軟', '軟膏', '연고', 0),
+('膏', '軟膏', '연고', 1),
+('軟', '軟豆', '연두', 0),
+('豆', '軟豆', '연두', 1),
+('軟', '軟豆色', '연두색', 0),
+('豆', '軟豆色', '연두색', 1),
+('色', '軟豆色', '연두색', 2),
+('軟', '軟鋼', '연강', 0),
+('鋼', '軟鋼', '연강', 1),
+('軟', '軟音化', '연음화', 0),
+('音', '軟音化', '연음화', 1),
+('化', '軟音化', '연음화', 2),
+('軟', '軟骨', '연골', 0),
+('骨', '軟骨', '연골', 1),
+('軟', '軟體動物', '연체동물', 0),
+('體', '軟體動物', '연체동물', 1),
+('動', '軟體動物', '연체동물', 2),
+('物', '軟體動物', '연체동물', 3),
+('軸', '軸', '축', 0),
+('軺', '軺軒', '초헌', 0),
+('軒', '軺軒', '초헌', 1),
+('軼', '軼事', '일사', 0),
+('事', '軼事', '일사', 1),
+('較', '較正', '교정', 0),
+('正', '較正', '교정', 1),
+('輓', '輓歌', '만가', 0),
+('歌', '輓歌', '만가', 1),
+('輔', '輔弼', '보필', 0),
+('弼', '輔弼', '보필', 1),
+('輔', '輔翊', '보익', 0),
+('翊', '輔翊', '보익', 1),
+('輔', '輔翼', '보익', 0),
+('翼', '輔翼', '보익', 1),
+('輕', '輕卒', '경졸', 0),
+('卒', '輕卒', '경졸', 1),
+('輕', '輕工業', '경공업', 0),
+('工', '輕工業', '경공업', 1),
+('業', '輕工業', '경공업', 2),
+('輕', '輕快', '경쾌', 0),
+('快', '輕快', '경쾌', 1),
+('輕', '輕油', '경유', 0),
+('油', '輕油', '경유', 1),
+('輕', '輕率', '경솔', 0),
+('率', '輕率', '경솔', 1),
+('輕', '輕科', '경과', 0),
+('科', '輕科', '경과', 1),
+('輕', '輕粒子', '경입자', 0),
+('粒', '輕粒子', '경입자', 1),
+('子', '輕粒子', '경입자', 2),
+('輕', '輕罪', '경죄', 0),
+('罪', '輕罪', '경죄', 1),
+('輕', '輕蔑', '경멸', 0),
+('蔑', '輕蔑', '경멸', 1),
+('輕', '輕蔑感', '경멸감', 0),
+('蔑', '輕蔑感', '경멸감', 1),
+('感', '輕蔑感', '경멸감', 2),
+('輕', '輕蔑的', '경멸적', 0),
+('蔑', '輕蔑的', '경멸적', 1),
+('的', '輕蔑的', '경멸적', 2),
+('輕', '輕視', '경시', 0),
+('視', '輕視', '경시', 1),
+('輕', '輕量', '경량', 0),
+('量', '輕量', '경량', 1),
+('輕', '輕音樂', '경음악', 0),
+('音', '輕音樂', '경음악', 1),
+('樂', '輕音樂', '경음악', 2),
+('輕', '輕騎兵', '경기병', 0),
+('騎', '輕騎兵', '경기병', 1),
+('兵', '輕騎兵', '경기병', 2),
+('輝', '輝石', '휘석', 0),
+('石', '輝石', '휘석', 1),
+('輪', '輪', '륜', 0),
+('輪', '輪姦', '륜간', 0),
+('姦', '輪姦', '륜간', 1),
+('輪', '輪姦', '윤간', 0),
+('姦', '輪姦', '윤간', 1),
+('輪', '輪廓', '륜곽', 0),
+('廓', '輪廓', '륜곽', 1),
+('輪', '輪廓', '윤곽', 0),
+('廓', '輪廓', '윤곽', 1),
+('輪', '輪廻', '륜회', 0),
+('廻', '輪廻', '륜회', 1),
+('輪', '輪廻', '윤회', 0),
+('廻', '輪廻', '윤회', 1),
+('輪', '輪扇', '윤선', 0),
+('扇', '輪扇', '윤선', 1),
+('輪', '輪旋', '윤선', 0),
+('旋', '輪旋', '윤선', 1),
+('輪', '輪番', '윤번', 0),
+('番', '輪番', '윤번', 1),
+('輪', '輪癬', '윤선', 0),
+('癬', '輪癬', '윤선', 1),
+('輪', '輪船', '윤선', 0),
+('船', '輪船', '윤선', 1),
+('輸', '輸入', '수입', 0),
+('入', '輸入', '수입', 1),
+('輸', '輸入品', '수입품', 0),
+('入', '輸入品', '수입품', 1),
+('品', '輸入品', '수입품', 2),
+('輸', '輸出', '수출', 0),
+('出', '輸出', '수출', 1),
+('輸', '輸出品', '수출품', 0),
+('出', '輸出品', '수출품', 1),
+('品', '輸出品', '수출품', 2),
+('輸', '輸卵管', '수란관', 0),
+('卵', '輸卵管', '수란관', 1),
+('管', '輸卵管', '수란관', 2),
+('輸', '輸尿管', '수뇨관', 0),
+('尿', '輸尿管', '수뇨관', 1),
+('管', '輸尿管', '수뇨관', 2),
+('輸', '輸血', '수혈', 0),
+('血', '輸血', '수혈', 1),
+('輸', '輸送', '수송', 0),
+('送', '輸送', '수송', 1),
+('輸', '輸送船', '수송선', 0),
+('送', '輸送船', '수송선', 1),
+('船', '輸送船', '수송선', 2),
+('輻', '輻射', '복사', 0),
+('射', '輻射', '복사', 1),
+('輿', '輿望', '여망', 0),
+('望', '輿望', '여망', 1),
+('輿', '輿論', '여론', 0),
+('論', '輿論', '여론', 1),
+('轉', '轉位', '전위', 0),
+('位', '轉位', '전위', 1),
+('轉', '轉借', '전차', 0),
+('借', '轉借', '전차', 1),
+('轉', '轉勤', '전근', 0),
+('勤', '轉勤', '전근', 1),
+('轉', '轉化', '전화', 0),
+('化', '轉化', '전화', 1),
+('轉', '轉向', '전향', 0),
+('向', '轉向', '전향', 1),
+('轉', '轉學', '전학', 0),
+('學', '轉學', '전학', 1),
+('轉', '轉寫', '전사', 0),
+('寫', '轉寫', '전사', 1),
+('轉', '轉成冠形詞', '전성관형사', 0),
+('成', '轉成冠形詞', '전성관형사', 1),
+('冠', '轉成冠形詞', '전성관형사', 2),
+('形', '轉成冠形詞', '전성관형사', 3),
+('詞', '轉成冠形詞', '전성관형사', 4),
+('轉', '轉折', '전절', 0),
+('折', '轉折', '전절', 1),
+('轉', '轉換', '전환', 0),
+('換', '轉換', '전환', 1),
+('轉', '轉換 治療', '전환 치료', 0),
+('換', '轉換 治療', '전환 치료', 1),
+('治', '轉換 治療', '전환 치료', 3),
+('療', '轉換 治療', '전환 치료', 4),
+('轉', '轉注', '전주', 0),
+('注', '轉注', '전주', 1),
+('轉', '轉用', '전용', 0),
+('用', '轉用', '전용', 1),
+('轉', '轉移', '전이', 0),
+('移', '轉移', '전이', 1),
+('轉', '轉筆', '전필', 0),
+('筆', '轉筆', '전필', 1),
+('轉', '轉職', '전직', 0),
+('職', '轉職', '전직', 1),
+('轉', '轉訛', '전와', 0),
+('訛', '轉訛', '전와', 1),
+('轉', '轉賣', '전매', 0),
+('賣', '轉賣', '전매', 1),
+('轟', '轟音', '굉음', 0),
+('音', '轟音', '굉음', 1),
+('轢', '轢死', '역사', 0),
+('死', '轢死', '역사', 1),
+('辛', '辛', '신', 0),
+('辛', '辛丑', '신축', 0),
+('丑', '辛丑', '신축', 1),
+('辛', '辛亥', '신해', 0),
+('亥', '辛亥', '신해', 1),
+('辛', '辛卯', '신묘', 0),
+('卯', '辛卯', '신묘', 1),
+('辛', '辛巳', '신사', 0),
+('巳', '辛巳', '신사', 1),
+('辛', '辛未', '신미', 0),
+('未', '辛未', '신미', 1),
+('辛', '辛酉', '신유', 0),
+('酉', '辛酉', '신유', 1),
+('辦', '辦公室', '판공실', 0),
+('公', '辦公室', '판공실', 1),
+('室', '辦公室', '판공실', 2),
+('辨', '辨償', '변상', 0),
+('償', '辨償', '변상', 1),
+('辨', '辨明', '변명', 0),
+('明', '辨明', '변명', 1),
+('辨', '辨濟', '변제', 0),
+('濟', '辨濟', '변제', 1),
+('辨', '辨護', '변호', 0),
+('護', '辨護', '변호', 1),
+('辭', '辭任', '사임', 0),
+('任', '辭任', '사임', 1),
+('辭', '辭典', '사전', 0),
+('典', '辭典', '사전', 1),
+('辭', '辭書', '사서', 0),
+('書', '辭書', '사서', 1),
+('辭', '辭職', '사직', 0),
+('職', '辭職', '사직', 1),
+('辭', '辭表', '사표', 0),
+('表', '辭表', '사표', 1),
+('辭', '辭讓', '사양', 0),
+('讓', '辭讓', '사양', 1),
+('辭', '辭退', '사퇴', 0),
+('退', '辭退', '사퇴', 1),
+('辯', '辯論', '변론', 0),
+('論', '辯論', '변론', 1),
+('辯', '辯論家', '변론가', 0),
+('論', '辯論家', '변론가', 1),
+('家', '辯論家', '변론가', 2),
+('辯', '辯護人', '변호인', 0),
+('護', '辯護人', '변호인', 1),
+('人', '辯護人', '변호인', 2),
+('辯', '辯護士', '벤호사', 0),
+('護', '辯護士', '벤호사', 1),
+('士', '辯護士', '벤호사', 2),
+('辯', '辯護士', '변호사', 0),
+('護', '辯護士', '변호사', 1),
+('士', '辯護士', '변호사', 2),
+('辯', '辯髮', '변발', 0),
+('髮', '辯髮', '변발', 1),
+('辰', '辰韓', '진한', 0),
+('韓', '辰韓', '진한', 1),
+('辱', '辱', '욕', 0),
+('辱', '辱說', '욕설', 0),
+('說', '辱說', '욕설', 1),
+('農', '農事', '농사', 0),
+('事', '農事', '농사', 1),
+('農', '農事-', '농사일', 0),
+('事', '農事-', '농사일', 1),
+('-', '農事-', '농사일', 2),
+('農', '農事--', '농사짓다', 0),
+('事', '農事--', '농사짓다', 1),
+('-', '農事--', '농사짓다', 2),
+('-', '農事--', '농사짓다', 3),
+('農', '農作', '농작', 0),
+('作', '農作', '농작', 1),
+('農', '農作物', '농작물', 0),
+('作', '農作物', '농작물', 1),
+('物', '農作物', '농작물', 2),
+('農', '農園', '농원', 0),
+('園', '農園', '농원', 1),
+('農', '農場', '농장', 0),
+('場', '農場', '농장', 1),
+('農', '農夫', '농부', 0),
+('夫', '農夫', '농부', 1),
+('農', '農奴', '농노', 0),
+('奴', '農奴', '농노', 1),
+('農', '農婦', '농부', 0),
+('婦', '農婦', '농부', 1),
+('農', '農學', '농학', 0),
+('學', '農學', '농학', 1),
+('農', '農學者', '농학자', 0),
+('學', '農學者', '농학자', 1),
+('者', '農學者', '농학자', 2),
+('農', '農曆', '농력', 0),
+('曆', '農曆', '농력', 1),
+('農', '農村', '농촌', 0),
+('村', '農村', '농촌', 1),
+('農', '農業', '농업', 0),
+('業', '農業', '농업', 1),
+('農', '農樂', '농악', 0),
+('樂', '農樂', '농악', 1),
+('農', '農機', '농기', 0),
+('機', '農機', '농기', 1),
+('農', '農民', '농민', 0),
+('民', '農民', '농민', 1),
+('農', '農産物', '농산물', 0),
+('産', '農産物', '농산물', 1),
+('物', '農産物', '농산물', 2),
+('農', '農耕', '농경', 0),
+('耕', '農耕', '농경', 1),
+('農', '農舞', '농무', 0),
+('舞', '農舞', '농무', 1),
+('農', '農藥', '농약', 0),
+('藥', '農藥', '농약', 1),
+('農', '農謠', '농요', 0),
+('謠', '農謠', '농요', 1),
+('迂', '迂回', '우회', 0),
+('回', '迂回', '우회', 1),
+('迂', '迂廻', '우회', 0),
+('廻', '迂廻', '우회', 1),
+('迅', '迅速', '신속', 0),
+('速', '迅速', '신속', 1),
+('迎', '迎合', '영합', 0),
+('合', '迎合', '영합', 1),
+('近', '近代', '근대', 0),
+('代', '近代', '근대', 1),
+('近', '近代 韓國語', '근대 한국어', 0),
+('代', '近代 韓國語', '근대 한국어', 1),
+('韓', '近代 韓國語', '근대 한국어', 3),
+('國', '近代 韓國語', '근대 한국어', 4),
+('語', '近代 韓國語', '근대 한국어', 5),
+('近', '近代國語', '근대국어', 0),
+('代', '近代國語', '근대국어', 1),
+('國', '近代國語', '근대국어', 2),
+('語', '近代國語', '근대국어', 3),
+('近', '近代的', '근대적', 0),
+('代', '近代的', '근대적', 1),
+('的', '近代的', '근대적', 2),
+('近', '近似', '근사', 0),
+('似', '近似', '근사', 1),
+('近', '近似値', '근사치', 0),
+('似', '近似値', '근사치', 1),
+('値', '近似値', '근사치', 2),
+('近', '近來', '근래', 0),
+('來', '近來', '근래', 1),
+('近', '近古', '근고', 0),
+('古', '近古', '근고', 1),
+('近', '近地點', '근지점', 0),
+('地', '近地點', '근지점', 1),
+('點', '近地點', '근지점', 2),
+('近', '近接', '근접', 0),
+('接', '近接', '근접', 1),
+('近', '近日', '근일', 0),
+('日', '近日', '근일', 1),
+('近', '近日点', '근일점', 0),
+('日', '近日点', '근일점', 1),
+('点', '近日点', '근일점', 2),
+('近', '近日點', '근일점', 0),
+('日', '近日點', '근일점', 1),
+('點', '近日點', '근일점', 2),
+('近', '近況', '근황', 0),
+('況', '近況', '근황', 1),
+('近', '近處', '근처', 0),
+('處', '近處', '근처', 1),
+('近', '近視', '근시', 0),
+('視', '近視', '근시', 1),
+('近', '近親', '근친', 0),
+('親', '近親', '근친', 1),
+('近', '近親相姦', '근친상간', 0),
+('親', '近親相姦', '근친상간', 1),
+('相', '近親相姦', '근친상간', 2),
+('姦', '近親相姦', '근친상간', 3),
+('近', '近郊', '근교', 0),
+('郊', '近郊', '근교', 1),
+('返', '返品', '반품', 0),
+('品', '返品', '반품', 1),
+('返', '返戾', '반려', 0),
+('戾', '返戾', '반려', 1),
+('返', '返還', '반환', 0),
+('還', '返還', '반환', 1),
+('迦', '迦羅', '가라', 0),
+('羅', '迦羅', '가라', 1),
+('迫', '迫害者', '박해자', 0),
+('害', '迫害者', '박해자', 1),
+('者', '迫害者', '박해자', 2),
+('述', '述語', '술어', 0),
+('語', '述語', '술어', 1),
+('迷', '迷信', '미신', 0),
+('信', '迷信', '미신', 1),
+('迷', '迷兒', '미아', 0),
+('兒', '迷兒', '미아', 1),
+('迷', '迷妄', '미망', 0),
+('妄', '迷妄', '미망', 1),
+('迷', '迷宮', '미궁', 0),
+('宮', '迷宮', '미궁', 1),
+('迷', '迷彩', '미채', 0),
+('彩', '迷彩', '미채', 1),
+('迷', '迷惑', '미혹', 0),
+('惑', '迷惑', '미혹', 1),
+('迷', '迷路', '미로', 0),
+('路', '迷路', '미로', 1),
+('追', '追伸', '추신', 0),
+('伸', '追伸', '추신', 1),
+('追', '追加', '추가', 0),
+('加', '追加', '추가', 1),
+('追', '追及', '추급', 0),
+('及', '追及', '추급', 1),
+('追', '追後', '추후', 0),
+('後', '追後', '추후', 1),
+('追', '追從', '추종', 0),
+('從', '追從', '추종', 1),
+('追', '追悼', '추도', 0),
+('悼', '追悼', '추도', 1),
+('追', '追想', '추상', 0),
+('想', '追想', '추상', 1),
+('追', '追慕', '추모', 0),
+('慕', '追慕', '추모', 1),
+('追', '追憶', '추억', 0),
+('憶', '追憶', '추억', 1),
+('追', '追擊', '추격', 0),
+('擊', '追擊', '추격', 1),
+('追', '追放', '추방', 0),
+('放', '追放', '추방', 1),
+('追', '追求', '추구', 0),
+('求', '追求', '추구', 1),
+('追', '追白', '추백', 0),
+('白', '追白', '추백', 1),
+('追', '追突', '추돌', 0),
+('突', '追突', '추돌', 1),
+('追', '追記', '추기', 0),
+('記', '追記', '추기', 1),
+('追', '追認', '추인', 0),
+('認', '追認', '추인', 1),
+('追', '追跡', '추적', 0),
+('跡', '追跡', '추적', 1),
+('追', '追跡者', '추적자', 0),
+('跡', '追跡者', '추적자', 1),
+('者', '追跡者', '추적자', 2),
+('追', '追隨', '추수', 0),
+('隨', '追隨', '추수', 1),
+('退', '退位', '퇴위', 0),
+('位', '退位', '퇴위', 1),
+('退', '退出', '퇴출', 0),
+('出', '退出', '퇴출', 1),
+('退', '退勤', '퇴근', 0),
+('勤', '退勤', '퇴근', 1),
+('退', '退化', '퇴화', 0),
+('化', '退化', '퇴화', 1),
+('退', '退却', '퇴각', 0),
+('却', '退却', '퇴각', 1),
+('退', '退去', '퇴거', 0),
+('去', '退去', '퇴거', 1),
+('退', '退場', '퇴장', 0),
+('場', '退場', '퇴장', 1),
+('退', '退學', '퇴학', 0),
+('學', '退學', '퇴학', 1),
+('退', '退職', '퇴직', 0),
+('職', '退職', '퇴직', 1),
+('退', '退職者', '퇴직자', 0),
+('職', '退職者', '퇴직자', 1),
+('者', '退職者', '퇴직자', 2),
+('退', '退職金', '퇴직금', 0),
+('職', '退職金', '퇴직금', 1),
+('金', '退職金', '퇴직금', 2),
+('退', '退職金', '퇴직금', 0),
+('職', '退職金', '퇴직금', 1),
+('金', '退職金', '퇴직금', 2),
+('退', '退避', '퇴피', 0),
+('避', '退避', '퇴피', 1),
+('退', '退院', '퇴원', 0),
+('院', '退院', '퇴원', 1),
+('退', '退陣', '퇴진', 0),
+('陣', '退陣', '퇴진', 1),
+('送', '送付', '송부', 0),
+('付', '送付', '송부', 1),
+('送', '送信', '송신', 0),
+('信', '送信', '송신', 1),
+('送', '送年會', '송년회', 0),
+('年', '送年會', '송년회', 1),
+('會', '送年會', '송년회', 2),
+('送', '送狀', '송장', 0),
+('狀', '送狀', '송장', 1),
+('送', '送球', '송구', 0),
+('球', '送球', '송구', 1),
+('送', '送金', '송금', 0),
+('金', '送金', '송금', 1),
+('逃', '逃亡', '도망', 0),
+('亡', '逃亡', '도망', 1),
+('逃', '逃亡者', '도망자', 0),
+('亡', '逃亡者', '도망자', 1),
+('者', '逃亡者', '도망자', 2),
+('逃', '逃去', '도거', 0),
+('去', '逃去', '도거', 1),
+('逃', '逃走', '도주', 0),
+('走', '逃走', '도주', 1),
+('逃', '逃避', '도피', 0),
+('避', '逃避', '도피', 1),
+('逃', '逃避主義', '도피주의', 0),
+('避', '逃避主義', '도피주의', 1),
+('主', '逃避主義', '도피주의', 2),
+('義', '逃避主義', '도피주의', 3),
+('逆', '逆境', '역경', 0),
+('境', '逆境', '역경', 1),
+('逆', '逆宣傳', '역선전', 0),
+('宣', '逆宣傳', '역선전', 1),
+('傳', '逆宣傳', '역선전', 2),
+('逆', '逆情', '역정', 0),
+('情', '逆情', '역정', 1),
+('逆', '逆斜線', '역사선', 0),
+('斜', '逆斜線', '역사선', 1),
+('線', '逆斜線', '역사선', 2),
+('逆', '逆臣', '역신', 0),
+('臣', '逆臣', '역신', 1),
+('逆', '逆行', '역행', 0),
+('行', '逆行', '역행', 1),
+('逆', '逆行同化', '역행동화', 0),
+('行', '逆行同化', '역행동화', 1),
+('同', '逆行同化', '역행동화', 2),
+('化', '逆行同化', '역행동화', 3),
+('逆', '逆襲', '역습', 0),
+('襲', '逆襲', '역습', 1),
+('逆', '逆賊', '역적', 0),
+('賊', '逆賊', '역적', 1),
+('逆', '逆轉', '역전', 0),
+('轉', '逆轉', '역전', 1),
+('逍', '逍風', '소풍', 0),
+('風', '逍風', '소풍', 1),
+('透', '透寫', '투사', 0),
+('寫', '透寫', '투사', 1),
+('透', '透寫紙', '투사지', 0),
+('寫', '透寫紙', '투사지', 1),
+('紙', '透寫紙', '투사지', 2),
+('透', '透明', '투명', 0),
+('明', '透明', '투명', 1),
+('透', '透視', '투시', 0),
+('視', '透視', '투시', 1),
+('途', '途中', '도중', 0),
+('中', '途中', '도중', 1),
+('這', '這番', '저번', 0),
+('番', '這番', '저번', 1),
+('通', '通', '통', 0),
+('通', '通信', '통신', 0),
+('信', '通信', '통신', 1),
+('通', '通信員', '통신원', 0),
+('信', '通信員', '통신원', 1),
+('員', '通信員', '통신원', 2),
+('通', '通分', '통분', 0),
+('分', '通分', '통분', 1),
+('通', '通刺', '통자', 0),
+('刺', '通刺', '통자', 1),
+('通', '通勤', '통근', 0),
+('勤', '通勤', '통근', 1),
+('通', '通告', '통고', 0),
+('告', '通告', '통고', 1),
+('通', '通商', '통상', 0),
+('商', '通商', '통상', 1),
+('通', '通報', '통보', 0),
+('報', '通報', '통보', 1),
+('通', '通寶', '통보', 0),
+('寶', '通寶', '통보', 1),
+('通', '通帳', '통장', 0),
+('帳', '通帳', '통장', 1),
+('通', '通常', '통상', 0),
+('常', '通常', '통상', 1),
+('通', '通常的', '통상적', 0),
+('常', '通常的', '통상적', 1),
+('的', '通常的', '통상적', 2),
+('通', '通念', '통념', 0),
+('念', '通念', '통념', 1),
+('通', '通時的', '통시적', 0),
+('時', '通時的', '통시적', 1),
+('的', '通時的', '통시적', 2),
+('通', '通曉', '통효', 0),
+('曉', '通曉', '통효', 1),
+('通', '通用', '통용', 0),
+('用', '通用', '통용', 1),
+('通', '通知', '통지', 0),
+('知', '通知', '통지', 1),
+('通', '通禁', '통금', 0),
+('禁', '通禁', '통금', 1),
+('通', '通稱', '통칭', 0),
+('稱', '通稱', '통칭', 1),
+('通', '通算', '통산', 0),
+('算', '通算', '통산', 1),
+('通', '通美封南', '통미봉남', 0),
+('美', '通美封南', '통미봉남', 1),
+('封', '通美封南', '통미봉남', 2),
+('南', '通美封南', '통미봉남', 3),
+('通', '通行', '통행', 0),
+('行', '通行', '통행', 1),
+('通', '通行人', '통행인', 0),
+('行', '通行人', '통행인', 1),
+('人', '通行人', '통행인', 2),
+('通', '通行料', '통행료', 0),
+('行', '通行料', '통행료', 1),
+('料', '通行料', '통행료', 2),
+('通', '通話', '통화', 0),
+('話', '通話', '통화', 1),
+('通', '通謀', '통모', 0),
+('謀', '通謀', '통모', 1),
+('通', '通譯', '통역', 0),
+('譯', '通譯', '통역', 1),
+('通', '通譯士', '통역사', 0),
+('譯', '通譯士', '통역사', 1),
+('士', '通譯士', '통역사', 2),
+('通', '通譯者', '통역자', 0),
+('譯', '通譯者', '통역자', 1),
+('者', '通譯者', '통역자', 2),
+('通', '通貨', '통화', 0),
+('貨', '通貨', '통화', 1),
+('通', '通路', '통로', 0),
+('路', '通路', '통로', 1),
+('通', '通過', '통과', 0),
+('過', '通過', '통과', 1),
+('通', '通過暗號', '통과암호', 0),
+('過', '通過暗號', '통과암호', 1),
+('暗', '通過暗號', '통과암호', 2),
+('號', '通過暗號', '통과암호', 3),
+('通', '通達', '통달', 0),
+('達', '通達', '통달', 1),
+('通', '通風', '통풍', 0),
+('風', '通風', '통풍', 1),
+('逝', '逝去', '서거', 0),
+('去', '逝去', '서거', 1),
+('速', '速', '속', 0),
+('速', '速力', '속력', 0),
+('力', '速力', '속력', 1),
+('速', '速報', '속보', 0),
+('報', '速報', '속보', 1),
+('速', '速寫', '속사', 0),
+('寫', '速寫', '속사', 1),
+('速', '速度', '속도', 0),
+('度', '速度', '속도', 1),
+('速', '速度違反', '속도위반', 0),
+('度', '速度違反', '속도위반', 1),
+('違', '速度違反', '속도위반', 2),
+('反', '速度違反', '속도위반', 3),
+('速', '速成飮食', '속성음식', 0),
+('成', '速成飮食', '속성음식', 1),
+('飮', '速成飮食', '속성음식', 2),
+('食', '速成飮食', '속성음식', 3),
+('速', '速戰速決', '속전속결', 0),
+('戰', '速戰速決', '속전속결', 1),
+('速', '速戰速決', '속전속결', 2),
+('決', '速戰速決', '속전속결', 3),
+('速', '速球', '속구', 0),
+('球', '速球', '속구', 1),
+('速', '速記', '속기', 0),
+('記', '速記', '속기', 1),
+('造', '造作', '조작', 0),
+('作', '造作', '조작', 1),
+('造', '造化', '조화', 0),
+('化', '造化', '조화', 1),
+('造', '造園', '조원', 0),
+('園', '造園', '조원', 1),
+('造', '造幣', '조폐', 0),
+('幣', '造幣', '조폐', 1),
+('造', '造幣局', '조폐국', 0),
+('幣', '造幣局', '조폐국', 1),
+('局', '造幣局', '조폐국', 2),
+('造', '造形', '조형', 0),
+('形', '造形', '조형', 1),
+('造', '造成', '조성', 0),
+('成', '造成', '조성', 1),
+('造', '造林', '조림', 0),
+('林', '造林', '조림', 1),
+('造', '造果', '조과', 0),
+('果', '造果', '조과', 1),
+('造', '造淸', '조청', 0),
+('淸', '造淸', '조청', 1),
+('造', '造物主', '조물주', 0),
+('物', '造物主', '조물주', 1),
+('主', '造物主', '조물주', 2),
+('造', '造船', '조선', 0),
+('船', '造船', '조선', 1),
+('造', '造花', '조화', 0),
+('花', '造花', '조화', 1),
+('造', '造血', '조혈', 0),
+('血', '造血', '조혈', 1),
+('造', '造詣', '조예', 0),
+('詣', '造詣', '조예', 1),
+('造', '造語', '조어', 0),
+('語', '造語', '조어', 1),
+('造', '造酒技能士', '조주기능사', 0),
+('酒', '造酒技能士', '조주기능사', 1),
+('技', '造酒技能士', '조주기능사', 2),
+('能', '造酒技能士', '조주기능사', 3),
+('士', '造酒技能士', '조주기능사', 4),
+('逢', '逢着', '봉착', 0),
+('着', '逢着', '봉착', 1),
+('連', '連', '연', 0),
+('連', '連休', '연휴', 0),
+('休', '連休', '연휴', 1),
+('連', '連信', '연신', 0),
+('信', '連信', '연신', 1),
+('連', '連動', '연동', 0),
+('動', '連動', '연동', 1),
+('連', '連勝', '연승', 0),
+('勝', '連勝', '연승', 1),
+('連', '連姻', '연인', 0),
+('姻', '連姻', '연인', 1),
+('連', '連帶', '연대', 0),
+('帶', '連帶', '연대', 1),
+('連', '連投', '연투', 0),
+('投', '連投', '연투', 1),
+('連', '連敗', '연패', 0),
+('敗', '連敗', '연패', 1),
+('連', '連棋', '연기', 0),
+('棋', '連棋', '연기', 1),
+('連', '連濁', '연탁', 0),
+('濁', '連濁', '연탁', 1),
+('連', '連立', '연립', 0),
+('立', '連立', '연립', 1),
+('連', '連累', '연루', 0),
+('累', '連累', '연루', 1),
+('連', '連結', '련결', 0),
+('結', '連結', '련결', 1),
+('連', '連結', '연결', 0),
+('結', '連結', '연결', 1),
+('連', '連結網', '연결망', 0),
+('結', '連結網', '연결망', 1),
+('網', '連結網', '연결망', 2),
+('連', '連絡', '련락', 0),
+('絡', '連絡', '련락', 1),
+('連', '連絡', '연락', 0),
+('絡', '連絡', '연락', 1),
+('連', '連絡船', '연락선', 0),
+('絡', '連絡船', '연락선', 1),
+('船', '連絡船', '연락선', 2),
+('連', '連絡處', '연락처', 0),
+('絡', '連絡處', '연락처', 1),
+('處', '連絡處', '연락처', 2),
+('連', '連續', '연속', 0),
+('續', '連續', '연속', 1),
+('連', '連續劇', '련속극', 0),
+('續', '連續劇', '련속극', 1),
+('劇', '連續劇', '련속극', 2),
+('連', '連續劇', '연속극', 0),
+('續', '連續劇', '연속극', 1),
+('劇', '連續劇', '연속극', 2),
+('連', '連續的', '연속적', 0),
+('續', '連續的', '연속적', 1),
+('的', '連續的', '연속적', 2),
+('連', '連覇', '연패', 0),
+('覇', '連覇', '연패', 1),
+('連', '連記', '연기', 0),
+('記', '連記', '연기', 1),
+('連', '連語', '연어', 0),
+('語', '連語', '연어', 1),
+('連', '連載', '연재', 0),
+('載', '連載', '연재', 1),
+('連', '連邦', '연방', 0),
+('邦', '連邦', '연방', 1),
+('連', '連鎖', '연쇄', 0),
+('鎖', '連鎖', '연쇄', 1),
+('連', '連鎖店', '연쇄점', 0),
+('鎖', '連鎖店', '연쇄점', 1),
+('店', '連鎖店', '연쇄점', 2),
+('連', '連鎖殺人犯', '연쇄살인범', 0),
+('鎖', '連鎖殺人犯', '연쇄살인범', 1),
+('殺', '連鎖殺人犯', '연쇄살인범', 2),
+('人', '連鎖殺人犯', '연쇄살인범', 3),
+('犯', '連鎖殺人犯', '연쇄살인범', 4),
+('逮', '逮捕', '체포', 0),
+('捕', '逮捕', '체포', 1),
+('逮', '逮捕者', '체포자', 0),
+('捕', '逮捕者', '체포자', 1),
+('者', '逮捕者', '체포자', 2),
+('週', '週', '주', 0),
+('週', '週中', '주중', 0),
+('中', '週中', '주중', 1),
+('週', '週刊', '주간', 0),
+('刊', '週刊', '주간', 1),
+('週', '週刊誌', '주간지', 0),
+('刊', '週刊誌', '주간지', 1),
+('誌', '週刊誌', '주간지', 2),
+('週', '週報', '주보', 0),
+('報', '週報', '주보', 1),
+('週', '週日', '주일', 0),
+('日', '週日', '주일', 1),
+('週', '週期', '주기', 0),
+('期', '週期', '주기', 1),
+('週', '週期律表', '주기률표', 0),
+('期', '週期律表', '주기률표', 1),
+('律', '週期律表', '주기률표', 2),
+('表', '週期律表', '주기률표', 3),
+('週', '週期律表', '주기율표', 0),
+('期', '週期律表', '주기율표', 1),
+('律', '週期律表', '주기율표', 2),
+('表', '週期律表', '주기율표', 3),
+('週', '週末', '주말', 0),
+('末', '週末', '주말', 1),
+('週', '週番', '주번', 0),
+('番', '週番', '주번', 1),
+('進', '進上', '진상', 0),
+('上', '進上', '진상', 1),
+('進', '進入', '진입', 0),
+('入', '進入', '진입', 1),
+('進', '進出', '진출', 0),
+('出', '進出', '진출', 1),
+('進', '進化', '진화', 0),
+('化', '進化', '진화', 1),
+('進', '進取', '진취', 0),
+('取', '進取', '진취', 1),
+('進', '進呈', '진정', 0),
+('呈', '進呈', '진정', 1),
+('進', '進壘', '진루', 0),
+('壘', '進壘', '진루', 1),
+('進', '進步', '진보', 0),
+('步', '進步', '진보', 1),
+('進', '進獻', '진헌', 0),
+('獻', '進獻', '진헌', 1),
+('進', '進相', '진상', 0),
+('相', '進相', '진상', 1),
+('進', '進級', '진급', 0),
+('級', '進級', '진급', 1),
+('進', '進行', '진행', 0),
+('行', '進行', '진행', 1),
+('進', '進行者', '진행자', 0),
+('行', '進行者', '진행자', 1),
+('者', '進行者', '진행자', 2),
+('進', '進言', '진언', 0),
+('言', '進言', '진언', 1),
+('進', '進貢', '진공', 0),
+('貢', '進貢', '진공', 1),
+('進', '進路', '진로', 0),
+('路', '進路', '진로', 1),
+('進', '進軍', '진군', 0),
+('軍', '進軍', '진군', 1),
+('逸', '逸事', '일사', 0),
+('事', '逸事', '일사', 1),
+('逸', '逸出', '일출', 0),
+('出', '逸出', '일출', 1),
+('逸', '逸品', '일품', 0),
+('品', '逸品', '일품', 1),
+('逸', '逸脫', '일탈', 0),
+('脫', '逸脫', '일탈', 1),
+('逸', '逸話', '일화', 0),
+('話', '逸話', '일화', 1),
+('逸', '逸走', '일주', 0),
+('走', '逸走', '일주', 1),
+('逼', '逼迫', '핍박', 0),
+('迫', '逼迫', '핍박', 1),
+('逾', '逾越節', '유월절', 0),
+('越', '逾越節', '유월절', 1),
+('節', '逾越節', '유월절', 2),
+('遁', '遁甲', '둔갑', 0),
+('甲', '遁甲', '둔갑', 1),
+('遁', '遁甲法', '둔갑법', 0),
+('甲', '遁甲法', '둔갑법', 1),
+('法', '遁甲法', '둔갑법', 2),
+('遂', '遂行', '수행', 0),
+('行', '遂行', '수행', 1),
+('遂', '遂行評價', '수행평가', 0),
+('行', '遂行評價', '수행평가', 1),
+('評', '遂行評價', '수행평가', 2),
+('價', '遂行評價', '수행평가', 3),
+('遊', '遊休', '유휴', 0),
+('休', '遊休', '유휴', 1),
+('遊', '遊園地', '유원지', 0),
+('園', '遊園地', '유원지', 1),
+('地', '遊園地', '유원지', 2),
+('遊', '遊客', '유객', 0),
+('客', '遊客', '유객', 1),
+('遊', '遊山', '유산', 0),
+('山', '遊山', '유산', 1),
+('遊', '遊廓', '유곽', 0),
+('廓', '遊廓', '유곽', 1),
+('遊', '遊戲', '유희', 0),
+('戲', '遊戲', '유희', 1),
+('遊', '遊擊', '유격', 0),
+('擊', '遊擊', '유격', 1),
+('遊', '遊擊戰', '유격전', 0),
+('擊', '遊擊戰', '유격전', 1),
+('戰', '遊擊戰', '유격전', 2),
+('遊', '遊擊手', '유격수', 0),
+('擊', '遊擊手', '유격수', 1),
+('手', '遊擊手', '유격수', 2),
+('遊', '遊星', '유성', 0),
+('星', '遊星', '유성', 1),
+('遊', '遊步', '유보', 0),
+('步', '遊步', '유보', 1),
+('遊', '遊泳', '유영', 0),
+('泳', '遊泳', '유영', 1),
+('遊', '遊牧民', '유목민', 0),
+('牧', '遊牧民', '유목민', 1),
+('民', '遊牧民', '유목민', 2),
+('遊', '遊覽', '유람', 0),
+('覽', '遊覽', '유람', 1),
+('遊', '遊覽船', '유람선', 0),
+('覽', '遊覽船', '유람선', 1),
+('船', '遊覽船', '유람선', 2),
+('遊', '遊記', '유기', 0),
+('記', '遊記', '유기', 1),
+('遊', '遊說', '유세', 0),
+('說', '遊說', '유세', 1),
+('遊', '遊離', '유리', 0),
+('離', '遊離', '유리', 1),
+('遊', '遊離 脂肪酸', '유리 지방산', 0),
+('離', '遊離 脂肪酸', '유리 지방산', 1),
+('脂', '遊離 脂肪酸', '유리 지방산', 3),
+('肪', '遊離 脂肪酸', '유리 지방산', 4),
+('酸', '遊離 脂肪酸', '유리 지방산', 5),
+('遊', '遊離基', '유리기', 0),
+('離', '遊離基', '유리기', 1),
+('基', '遊離基', '유리기', 2),
+('運', '運', '운', 0),
+('運', '運動', '운동', 0),
+('動', '運動', '운동', 1),
+('運', '運動公園', '운동공원', 0),
+('動', '運動公園', '운동공원', 1),
+('公', '運動公園', '운동공원', 2),
+('園', '運動公園', '운동공원', 3),
+('運', '運動員', '운동원', 0),
+('動', '運動員', '운동원', 1),
+('員', '運動員', '운동원', 2),
+('運', '運動場', '운동장', 0),
+('動', '運動場', '운동장', 1),
+('場', '運動場', '운동장', 2),
+('運', '運動服', '운동복', 0),
+('動', '運動服', '운동복', 1),
+('服', '運動服', '운동복', 2),
+('運', '運動選手', '운동선수', 0),
+('動', '運動選手', '운동선수', 1),
+('選', '運動選手', '운동선수', 2),
+('手', '運動選手', '운동선수', 3),
+('運', '運動量', '운동량', 0),
+('動', '運動量', '운동량', 1),
+('量', '運動量', '운동량', 2),
+('運', '運動靴', '운동화', 0),
+('動', '運動靴', '운동화', 1),
+('靴', '運動靴', '운동화', 2),
+('運', '運勢', '운세', 0),
+('勢', '運勢', '운세', 1),
+('運', '運命', '운명', 0),
+('命', '運命', '운명', 1),
+('運', '運命論', '운명론', 0),
+('命', '運命論', '운명론', 1),
+('論', '運命論', '운명론', 2),
+('運', '運搬', '운반', 0),
+('搬', '運搬', '운반', 1),
+('運', '運數', '운수', 0),
+('數', '運數', '운수', 1),
+('運', '運河', '운하', 0),
+('河', '運河', '운하', 1),
+('運', '運營', '운영', 0),
+('營', '運營', '운영', 1),
+('運', '運營體制', '운영체제', 0),
+('營', '運營體制', '운영체제', 1),
+('體', '運營體制', '운영체제', 2),
+('制', '運營體制', '운영체제', 3),
+('運', '運行', '운행', 0),
+('行', '運行', '운행', 1),
+('運', '運輸', '운수', 0),
+('輸', '運輸', '운수', 1),
+('運', '運轉', '운전', 0),
+('轉', '運轉', '운전', 1),
+('運', '運轉 免許證', '운전 면허증', 0),
+('轉', '運轉 免許證', '운전 면허증', 1),
+('免', '運轉 免許證', '운전 면허증', 3),
+('許', '運轉 免許證', '운전 면허증', 4),
+('證', '運轉 免許證', '운전 면허증', 5),
+('運', '運轉士', '운전사', 0),
+('轉', '運轉士', '운전사', 1),
+('士', '運轉士', '운전사', 2),
+('運', '運轉手', '운전수', 0),
+('轉', '運轉手', '운전수', 1),
+('手', '運轉手', '운전수', 2),
+('運', '運轉技士', '운전기사', 0),
+('轉', '運轉技士', '운전기사', 1),
+('技', '運轉技士', '운전기사', 2),
+('士', '運轉技士', '운전기사', 3),
+('運', '運轉者', '운전자', 0),
+('轉', '運轉者', '운전자', 1),
+('者', '運轉者', '운전자', 2),
+('運', '運送', '운송', 0),
+('送', '運送', '운송', 1),
+('遍', '遍在', '편재', 0),
+('在', '遍在', '편재', 1),
+('過', '過', '과', 0),
+('過', '過剩', '과잉', 0),
+('剩', '過剩', '과잉', 1),
+('過', '過勞', '과로', 0),
+('勞', '過勞', '과로', 1),
+('過', '過勞死', '과로사', 0),
+('勞', '過勞死', '과로사', 1),
+('死', '過勞死', '과로사', 2),
+('過', '過去', '과거', 0),
+('去', '過去', '과거', 1),
+('過', '過去分詞', '과거분사', 0),
+('去', '過去分詞', '과거분사', 1),
+('分', '過去分詞', '과거분사', 2),
+('詞', '過去分詞', '과거분사', 3),
+('過', '過去完了', '과거완료', 0),
+('去', '過去完了', '과거완료', 1),
+('完', '過去完了', '과거완료', 2),
+('了', '過去完了', '과거완료', 3),
+('過', '過去形', '과거형', 0),
+('去', '過去形', '과거형', 1),
+('形', '過去形', '과거형', 2),
+('過', '過去時制', '과거시제', 0),
+('去', '過去時制', '과거시제', 1),
+('時', '過去時制', '과거시제', 2),
+('制', '過去時制', '과거시제', 3),
+('過', '過呼吸', '과호흡', 0),
+('呼', '過呼吸', '과호흡', 1),
+('吸', '過呼吸', '과호흡', 2),
+('過', '過多', '과다', 0),
+('多', '過多', '과다', 1),
+('過', '過大評價', '과대평가', 0),
+('大', '過大評價', '과대평가', 1),
+('評', '過大評價', '과대평가', 2),
+('價', '過大評價', '과대평가', 3),
+('過', '過失', '과실', 0),
+('失', '過失', '과실', 1),
+('過', '過客', '과객', 0),
+('客', '過客', '과객', 1),
+('過', '過小評價', '과소평가', 0),
+('小', '過小評價', '과소평가', 1),
+('評', '過小評價', '과소평가', 2),
+('價', '過小評價', '과소평가', 3),
+('過', '過度', '과도', 0),
+('度', '過度', '과도', 1),
+('過', '過怠料', '과태료', 0),
+('怠', '過怠料', '과태료', 1),
+('料', '過怠料', '과태료', 2),
+('過', '過慾', '과욕', 0),
+('慾', '過慾', '과욕', 1),
+('過', '過擧', '과거', 0),
+('擧', '過擧', '과거', 1),
+('過', '過渡', '과도', 0),
+('渡', '過渡', '과도', 1),
+('過', '過渡期', '과도기', 0),
+('渡', '過渡期', '과도기', 1),
+('期', '過渡期', '과도기', 2),
+('過', '過渡的', '과도적', 0),
+('渡', '過渡的', '과도적', 1),
+('的', '過渡的', '과도적', 2),
+('過', '過程', '과정', 0),
+('程', '過程', '과정', 1),
+('過', '過食', '과식', 0),
+('食', '過食', '과식', 1),
+('遐', '遐邇', '하이', 0),
+('邇', '遐邇', '하이', 1),
+('道', '道', '도', 0),
+('道', '道使', '도사', 0),
+('使', '道使', '도사', 1),
+('道', '道具', '도구', 0),
+('具', '道具', '도구', 1),
+('道', '道場', '도장', 0),
+('場', '道場', '도장', 1),
+('道', '道士', '도사', 0),
+('士', '道士', '도사', 1),
+('道', '道廳', '도청', 0),
+('廳', '道廳', '도청', 1),
+('道', '道德', '도덕', 0),
+('德', '道德', '도덕', 1),
+('道', '道德經', '도덕경', 0),
+('德', '道德經', '도덕경', 1),
+('經', '道德經', '도덕경', 2),
+('道', '道敎', '도교', 0),
+('敎', '道敎', '도교', 1),
+('道', '道教', '도교', 0),
+('教', '道教', '도교', 1),
+('道', '道標', '도표', 0),
+('標', '道標', '도표', 1),
+('道', '道理', '도리', 0),
+('理', '道理', '도리', 1),
+('道', '道知事', '도지사', 0),
+('知', '道知事', '도지사', 1),
+('事', '道知事', '도지사', 2),
+('道', '道程', '도정', 0),
+('程', '道程', '도정', 1),
+('道', '道義', '도의', 0),
+('義', '道義', '도의', 1),
+('道', '道路', '도로', 0),
+('路', '道路', '도로', 1),
+('道', '道路地圖', '도로지도', 0),
+('路', '道路地圖', '도로지도', 1),
+('地', '道路地圖', '도로지도', 2),
+('圖', '道路地圖', '도로지도', 3),
+('道', '道路標識', '도로표지', 0),
+('路', '道路標識', '도로표지', 1),
+('標', '道路標識', '도로표지', 2),
+('識', '道路標識', '도로표지', 3),
+('達', '達人', '달인', 0),
+('人', '達人', '달인', 1),
+('達', '達八十', '팔팔십', 0),
+('八', '達八十', '팔팔십', 1),
+('十', '達八十', '팔팔십', 2),
+('達', '達成', '달성', 0),
+('成', '達成', '달성', 1),
+('達', '達摩', '달마', 0),
+('摩', '達摩', '달마', 1),
+('達', '達筆', '달필', 0),
+('筆', '達筆', '달필', 1),
+('違', '違反', '위반', 0),
+('反', '違反', '위반', 1),
+('違', '違和感', '위화감', 0),
+('和', '違和感', '위화감', 1),
+('感', '違和感', '위화감', 2),
+('違', '違憲', '위헌', 0),
+('憲', '違憲', '위헌', 1),
+('違', '違法', '위법', 0),
+('法', '違法', '위법', 1),
+('違', '違背', '위배', 0),
+('背', '違背', '위배', 1),
+('遞', '遞傳', '체전', 0),
+('傳', '遞傳', '체전', 1),
+('遠', '遠來', '원래', 0),
+('來', '遠來', '원래', 1),
+('遠', '遠心', '원심', 0),
+('心', '遠心', '원심', 1),
+('遠', '遠心分離機', '원심분리기', 0),
+('心', '遠心分離機', '원심분리기', 1),
+('分', '遠心分離機', '원심분리기', 2),
+('離', '遠心分離機', '원심분리기', 3),
+('機', '遠心分離機', '원심분리기', 4),
+('遠', '遠心力', '원심력', 0),
+('心', '遠心力', '원심력', 1),
+('力', '遠心力', '원심력', 2),
+('遠', '遠志', '원지', 0),
+('志', '遠志', '원지', 1),
+('遠', '遠視', '원시', 0),
+('視', '遠視', '원시', 1),
+('遠', '遠足', '원족', 0),
+('足', '遠足', '원족', 1),
+('遠', '遠隔', '원격', 0),
+('隔', '遠隔', '원격', 1),
+('遠', '遠隔操作', '원격조작', 0),
+('隔', '遠隔操作', '원격조작', 1),
+('操', '遠隔操作', '원격조작', 2),
+('作', '遠隔操作', '원격조작', 3),
+('遠', '遠隔操縱', '원격조종', 0),
+('隔', '遠隔操縱', '원격조종', 1),
+('操', '遠隔操縱', '원격조종', 2),
+('縱', '遠隔操縱', '원격조종', 3),
+('遡', '遡及', '소급', 0),
+('及', '遡及', '소급', 1),
+('適', '適中', '적중', 0),
+('中', '適中', '적중', 1),
+('適', '適任', '적임', 0),
+('任', '適任', '적임', 1),
+('適', '適例', '적례', 0),
+('例', '適例', '적례', 1),
+('適', '適切', '적절', 0),
+('切', '適切', '적절', 1),
+('適', '適合', '적합', 0),
+('合', '適合', '적합', 1),
+('適', '適地', '적지', 0),
+('地', '適地', '적지', 1),
+('適', '適宜', '적의', 0),
+('宜', '適宜', '적의', 1),
+('適', '適度', '적도', 0),
+('度', '適度', '적도', 1),
+('適', '適性', '적성', 0),
+('性', '適性', '적성', 1),
+('適', '適應', '적응', 0),
+('應', '適應', '적응', 1),
+('適', '適應度', '적응도', 0),
+('應', '適應度', '적응도', 1),
+('度', '適應度', '적응도', 2),
+('適', '適所', '적소', 0),
+('所', '適所', '적소', 1),
+('適', '適時', '적시', 0),
+('時', '適時', '적시', 1),
+('適', '適材', '적재', 0),
+('材', '適材', '적재', 1),
+('適', '適材適所', '적재적소', 0),
+('材', '適材適所', '적재적소', 1),
+('適', '適材適所', '적재적소', 2),
+('所', '適材適所', '적재적소', 3),
+('適', '適格', '적격', 0),
+('格', '適格', '적격', 1),
+('適', '適正', '적정', 0),
+('正', '適正', '적정', 1),
+('適', '適正量', '적정량', 0),
+('正', '適正量', '적정량', 1),
+('量', '適正量', '적정량', 2),
+('適', '適法', '적법', 0),
+('法', '適法', '적법', 1),
+('適', '適用', '적용', 0),
+('用', '適用', '적용', 1),
+('適', '適當', '적당', 0),
+('當', '適當', '적당', 1),
+('適', '適當量', '적당량', 0),
+('當', '適當量', '적당량', 1),
+('量', '適當量', '적당량', 2),
+('適', '適者', '적자', 0),
+('者', '適者', '적자', 1),
+('適', '適者生存', '적자생존', 0),
+('者', '適者生存', '적자생존', 1),
+('生', '適者生存', '적자생존', 2),
+('存', '適者生存', '적자생존', 3),
+('適', '適量', '적량', 0),
+('量', '適量', '적량', 1),
+('適', '適齡', '적령', 0),
+('齡', '適齡', '적령', 1),
+('遭', '遭遇', '조우', 0),
+('遇', '遭遇', '조우', 1),
+('遭', '遭遇戰', '조우전', 0),
+('遇', '遭遇戰', '조우전', 1),
+('戰', '遭遇戰', '조우전', 2),
+('遮', '遮斷', '차단', 0),
+('斷', '遮斷', '차단', 1),
+('遲', '遲刻', '지각', 0),
+('刻', '遲刻', '지각', 1),
+('遲', '遲刻者', '지각자', 0),
+('刻', '遲刻者', '지각자', 1),
+('者', '遲刻者', '지각자', 2),
+('遲', '遲延', '지연', 0),
+('延', '遲延', '지연', 1),
+('遲', '遲滯', '지체', 0),
+('滯', '遲滯', '지체', 1),
+('遲', '遲漏', '지루', 0),
+('漏', '遲漏', '지루', 1),
+('遲', '遲緩', '지완', 0),
+('緩', '遲緩', '지완', 1),
+('遲', '遲遲不進', '지지부진', 0),
+('遲', '遲遲不進', '지지부진', 1),
+('不', '遲遲不進', '지지부진', 2),
+('進', '遲遲不進', '지지부진', 3),
+('遵', '遵守', '준수', 0),
+('守', '遵守', '준수', 1),
+('遷', '遷人', '천인', 0),
+('人', '遷人', '천인', 1),
+('遷', '遷移', '천이', 0),
+('移', '遷移', '천이', 1),
+('遷', '遷都', '천도', 0),
+('都', '遷都', '천도', 1),
+('選', '選任', '선임', 0),
+('任', '選任', '선임', 1),
+('選', '選別', '선별', 0),
+('別', '選別', '선별', 1),
+('選', '選好', '선호', 0),
+('好', '選好', '선호', 1),
+('選', '選定', '선정', 0),
+('定', '選定', '선정', 1),
+('選', '選手', '선수', 0),
+('手', '選手', '선수', 1),
+('選', '選拔', '선발', 0),
+('拔', '選拔', '선발', 1),
+('選', '選擇', '선택', 0),
+('擇', '選擇', '선택', 1),
+('選', '選擇權', '선택권', 0),
+('擇', '選擇權', '선택권', 1),
+('權', '選擇權', '선택권', 2),
+('選', '選擧', '선거', 0),
+('擧', '選擧', '선거', 1),
+('選', '選擧人', '선거인', 0),
+('擧', '選擧人', '선거인', 1),
+('人', '選擧人', '선거인', 2),
+('選', '選擧區', '선거구', 0),
+('擧', '選擧區', '선거구', 1),
+('區', '選擧區', '선거구', 2),
+('選', '選擧桶', '선거통', 0),
+('擧', '選擧桶', '선거통', 1),
+('桶', '選擧桶', '선거통', 2),
+('選', '選球', '선구', 0),
+('球', '選球', '선구', 1),
+('選', '選球眼', '선구안', 0),
+('球', '選球眼', '선구안', 1),
+('眼', '選球眼', '선구안', 2),
+('選', '選舉', '선거', 0),
+('舉', '選舉', '선거', 1),
+('選', '選集', '선집', 0),
+('集', '選集', '선집', 1),
+('遺', '遺傳', '유전', 0),
+('傳', '遺傳', '유전', 1),
+('遺', '遺傳子', '유전자', 0),
+('傳', '遺傳子', '유전자', 1),
+('子', '遺傳子', '유전자', 2),
+('遺', '遺傳學', '유전학', 0),
+('傳', '遺傳學', '유전학', 1),
+('學', '遺傳學', '유전학', 2),
+('遺', '遺命', '유명', 0),
+('命', '遺命', '유명', 1),
+('遺', '遺家族', '유가족', 0),
+('家', '遺家族', '유가족', 1),
+('族', '遺家族', '유가족', 2),
+('遺', '遺恨', '유한', 0),
+('恨', '遺恨', '유한', 1),
+('遺', '遺憾', '유감', 0),
+('憾', '遺憾', '유감', 1),
+('遺', '遺書', '유서', 0),
+('書', '遺書', '유서', 1),
+('遺', '遺棄', '유기', 0),
+('棄', '遺棄', '유기', 1),
+('遺', '遺棄犬', '유기견', 0),
+('棄', '遺棄犬', '유기견', 1),
+('犬', '遺棄犬', '유기견', 2),
+('遺', '遺烈', '유열', 0),
+('烈', '遺烈', '유열', 1),
+('遺', '遺物', '유물', 0),
+('物', '遺物', '유물', 1),
+('遺', '遺産', '유산', 0),
+('産', '遺産', '유산', 1),
+('遺', '遺言', '유언', 0),
+('言', '遺言', '유언', 1),
+('遺', '遺言者', '유언자', 0),
+('言', '遺言者', '유언자', 1),
+('者', '遺言者', '유언자', 2),
+('遺', '遺贈', '유증', 0),
+('贈', '遺贈', '유증', 1),
+('遺', '遺跡', '유적', 0),
+('跡', '遺跡', '유적', 1),
+('遺', '遺跡地', '유적지', 0),
+('跡', '遺跡地', '유적지', 1),
+('地', '遺跡地', '유적지', 2),
+('遺', '遺蹟', '유적', 0),
+('蹟', '遺蹟', '유적', 1),
+('遺', '遺骨', '유골', 0),
+('骨', '遺骨', '유골', 1),
+('遺', '遺骸', '유해', 0),
+('骸', '遺骸', '유해', 1),
+('遼', '遼', '요', 0),
+('遼', '遼寧', '요녕', 0),
+('寧', '遼寧', '요녕', 1),
+('避', '避', '피', 0),
+('避', '避匿', '피닉', 0),
+('匿', '避匿', '피닉', 1),
+('避', '避妊', '피임', 0),
+('妊', '避妊', '피임', 1),
+('避', '避妊藥', '피임약', 0),
+('妊', '避妊藥', '피임약', 1),
+('藥', '避妊藥', '피임약', 2),
+('避', '避姙', '피임', 0),
+('姙', '避姙', '피임', 1),
+('避', '避姙藥', '피임약', 0),
+('姙', '避姙藥', '피임약', 1),
+('藥', '避姙藥', '피임약', 2),
+('避', '避暑', '피서', 0),
+('暑', '避暑', '피서', 1),
+('避', '避暑地', '피서지', 0),
+('暑', '避暑地', '피서지', 1),
+('地', '避暑地', '피서지', 2),
+('避', '避球', '피구', 0),
+('球', '避球', '피구', 1),
+('避', '避難', '피난', 0),
+('難', '避難', '피난', 1),
+('避', '避難者', '피난자', 0),
+('難', '避難者', '피난자', 1),
+('者', '避難者', '피난자', 2),
+('避', '避難處', '피난처', 0),
+('難', '避難處', '피난처', 1),
+('處', '避難處', '피난처', 2),
+('避', '避雷', '피뢰', 0),
+('雷', '避雷', '피뢰', 1),
+('避', '避雷針', '피뢰침', 0),
+('雷', '避雷針', '피뢰침', 1),
+('針', '避雷針', '피뢰침', 2),
+('邀', '邀擊', '요격', 0),
+('擊', '邀擊', '요격', 1),
+('還', '還付', '환부', 0),
+('付', '還付', '환부', 1),
+('還', '還拂', '환불', 0),
+('拂', '還拂', '환불', 1),
+('還', '還拂金', '환불금', 0),
+('拂', '還拂金', '환불금', 1),
+('金', '還拂金', '환불금', 2),
+('還', '還流', '환류', 0),
+('流', '還流', '환류', 1),
+('還', '還甲', '환갑', 0),
+('甲', '還甲', '환갑', 1),
+('邊', '邊際', '변제', 0),
+('際', '邊際', '변제', 1),
+('邑', '邑', '읍', 0),
+('那', '那由他', '나유타', 0),
+('由', '那由他', '나유타', 1),
+('他', '那由他', '나유타', 2),
+('邦', '邦人', '방인', 0),
+('人', '邦人', '방인', 1),
+('邦', '邦家', '방가', 0),
+('家', '邦家', '방가', 1),
+('邦', '邦畫', '방화', 0),
+('畫', '邦畫', '방화', 1),
+('邦', '邦語', '방어', 0),
+('語', '邦語', '방어', 1),
+('邦', '邦譯', '방역', 0),
+('譯', '邦譯', '방역', 1),
+('邦', '邦貨', '방화', 0),
+('貨', '邦貨', '방화', 1),
+('邪', '邪世', '사세', 0),
+('世', '邪世', '사세', 1),
+('邪', '邪宗', '사종', 0),
+('宗', '邪宗', '사종', 1),
+('邪', '邪惡', '사악', 0),
+('惡', '邪惡', '사악', 1),
+('邪', '邪敎', '사교', 0),
+('敎', '邪敎', '사교', 1),
+('邪', '邪視', '사시', 0),
+('視', '邪視', '사시', 1),
+('邪', '邪鬼', '사귀', 0),
+('鬼', '邪鬼', '사귀', 1),
+('邸', '邸宅', '저택', 0),
+('宅', '邸宅', '저택', 1),
+('郊', '郊外', '교외', 0),
+('外', '郊外', '교외', 1),
+('郡', '郡', '군', 0),
+('郡', '郡公', '군공', 0),
+('公', '郡公', '군공', 1),
+('郡', '郡民', '군민', 0),
+('民', '郡民', '군민', 1),
+('郡', '郡王', '군왕', 0),
+('王', '郡王', '군왕', 1),
+('部', '部', '부', 0),
+('部', '部下', '부하', 0),
+('下', '部下', '부하', 1),
+('部', '部位', '부위', 0),
+('位', '部位', '부위', 1),
+('部', '部分', '부분', 0),
+('分', '部分', '부분', 1),
+('部', '部分的', '부분적', 0),
+('分', '部分的', '부분적', 1),
+('的', '部分的', '부분적', 2),
+('部', '部品', '부품', 0),
+('品', '部品', '부품', 1),
+('部', '部員', '부원', 0),
+('員', '部員', '부원', 1),
+('部', '部族', '부족', 0),
+('族', '部族', '부족', 1),
+('部', '部署', '부서', 0),
+('署', '部署', '부서', 1),
+('部', '部處', '부처', 0),
+('處', '部處', '부처', 1),
+('部', '部長', '부장', 0),
+('長', '部長', '부장', 1),
+('部', '部門', '부문', 0),
+('門', '部門', '부문', 1),
+('部', '部隊', '부대', 0),
+('隊', '部隊', '부대', 1),
+('部', '部隊찌개', '부대찌개', 0),
+('隊', '部隊찌개', '부대찌개', 1),
+('찌', '部隊찌개', '부대찌개', 2),
+('개', '部隊찌개', '부대찌개', 3),
+('部', '部類', '부류', 0),
+('類', '部類', '부류', 1),
+('部', '部首', '부수', 0),
+('首', '部首', '부수', 1),
+('郵', '郵便', '우편', 0),
+('便', '郵便', '우편', 1),
+('郵', '郵便函', '우편함', 0),
+('便', '郵便函', '우편함', 1),
+('函', '郵便函', '우편함', 2),
+('郵', '郵便局', '우편국', 0),
+('便', '郵便局', '우편국', 1),
+('局', '郵便局', '우편국', 2),
+('郵', '郵便番號', '우편번호', 0),
+('便', '郵便番號', '우편번호', 1),
+('番', '郵便番號', '우편번호', 2),
+('號', '郵便番號', '우편번호', 3),
+('郵', '郵便葉書', '우편엽서', 0),
+('便', '郵便葉書', '우편엽서', 1),
+('葉', '郵便葉書', '우편엽서', 2),
+('書', '郵便葉書', '우편엽서', 3),
+('郵', '郵便集配員', '우편집배원', 0),
+('便', '郵便集配員', '우편집배원', 1),
+('集', '郵便集配員', '우편집배원', 2),
+('配', '郵便集配員', '우편집배원', 3),
+('員', '郵便集配員', '우편집배원', 4),
+('郵', '郵政', '우정', 0),
+('政', '郵政', '우정', 1),
+('郵', '郵票', '우표', 0),
+('票', '郵票', '우표', 1),
+('郵', '郵送', '우송', 0),
+('送', '郵送', '우송', 1),
+('郵', '郵遞夫', '우체부', 0),
+('遞', '郵遞夫', '우체부', 1),
+('夫', '郵遞夫', '우체부', 2),
+('郵', '郵遞局', '우체국', 0),
+('遞', '郵遞局', '우체국', 1),
+('局', '郵遞局', '우체국', 2),
+('郵', '郵遞筒', '우체통', 0),
+('遞', '郵遞筒', '우체통', 1),
+('筒', '郵遞筒', '우체통', 2),
+('都', '都事', '도사', 0),
+('事', '都事', '도사', 1),
+('都', '都合', '도합', 0),
+('合', '都合', '도합', 1),
+('都', '都大體', '도대체', 0),
+('大', '都大體', '도대체', 1),
+('體', '都大體', '도대체', 2),
+('都', '都市', '도시', 0),
+('市', '都市', '도시', 1),
+('都', '都市化', '도시화', 0),
+('市', '都市化', '도시화', 1),
+('化', '都市化', '도시화', 2),
+('都', '都心', '도심', 0),
+('心', '都心', '도심', 1),
+('都', '都是', '도시', 0),
+('是', '都是', '도시', 1),
+('都', '都會', '도회', 0),
+('會', '都會', '도회', 1),
+('都', '都會人', '도회인', 0),
+('會', '都會人', '도회인', 1),
+('人', '都會人', '도회인', 2),
+('都', '都講', '도강', 0),
+('講', '都講', '도강', 1),
+('都', '都賣', '도매', 0),
+('賣', '都賣', '도매', 1),
+('都', '都錄', '도록', 0),
+('錄', '都錄', '도록', 1),
+('鄕', '鄕土 民謠', '향토 민요', 0),
+('土', '鄕土 民謠', '향토 민요', 1),
+('民', '鄕土 民謠', '향토 민요', 3),
+('謠', '鄕土 民謠', '향토 민요', 4),
+('鄕', '鄕土 飮食', '향토 음식', 0),
+('土', '鄕土 飮食', '향토 음식', 1),
+('飮', '鄕土 飮食', '향토 음식', 3),
+('食', '鄕土 飮食', '향토 음식', 4),
+('鄕', '鄕愁', '향수', 0),
+('愁', '鄕愁', '향수', 1),
+('鄕', '鄕札', '향찰', 0),
+('札', '鄕札', '향찰', 1),
+('鄕', '鄕樂', '향악', 0),
+('樂', '鄕樂', '향악', 1),
+('鄙', '鄙語', '비어', 0),
+('語', '鄙語', '비어', 1),
+('鄭', '鄭', '정', 0),
+('鄭', '鄭重', '정중', 0),
+('重', '鄭重', '정중', 1),
+('鄰', '鄰國', '인국', 0),
+('國', '鄰國', '인국', 1),
+('配', '配偶者', '배우자', 0),
+('偶', '配偶者', '배우자', 1),
+('者', '配偶者', '배우자', 2),
+('配', '配備', '배비', 0),
+('備', '配備', '배비', 1),
+('配', '配分', '배분', 0),
+('分', '配分', '배분', 1),
+('配', '配列', '배열', 0),
+('列', '配列', '배열', 1),
+('配', '配合', '배합', 0),
+('合', '配合', '배합', 1),
+('配', '配布', '배포', 0),
+('布', '配布', '배포', 1),
+('配', '配役', '배역', 0),
+('役', '配役', '배역', 1),
+('配', '配慮', '배려', 0),
+('慮', '配慮', '배려', 1),
+('配', '配水管', '배수관', 0),
+('水', '配水管', '배수관', 1),
+('管', '配水管', '배수관', 2),
+('配', '配球', '배구', 0),
+('球', '配球', '배구', 1),
+('配', '配當', '배당', 0),
+('當', '配當', '배당', 1),
+('配', '配當金', '배당금', 0),
+('當', '配當金', '배당금', 1),
+('金', '配當金', '배당금', 2),
+('配', '配管', '배관', 0),
+('管', '配管', '배관', 1),
+('配', '配管工', '배관공', 0),
+('管', '配管工', '배관공', 1),
+('工', '配管工', '배관공', 2),
+('配', '配給', '배급', 0),
+('給', '配給', '배급', 1),
+('配', '配置', '배치', 0),
+('置', '配置', '배치', 1),
+('配', '配送', '배송', 0),
+('送', '配送', '배송', 1),
+('配', '配達', '배달', 0),
+('達', '配達', '배달', 1),
+('配', '配達員', '배달원', 0),
+('達', '配達員', '배달원', 1),
+('員', '配達員', '배달원', 2),
+('配', '配電', '배전', 0),
+('電', '配電', '배전', 1),
+('配', '配電盤', '배전반', 0),
+('電', '配電盤', '배전반', 1),
+('盤', '配電盤', '배전반', 2),
+('酒', '酒令具', '주령구', 0),
+('令', '酒令具', '주령구', 1),
+('具', '酒令具', '주령구', 2),
+('酒', '酒宴', '주연', 0),
+('宴', '酒宴', '주연', 1),
+('酒', '酒幕', '주막', 0),
+('幕', '酒幕', '주막', 1),
+('酒', '酒店', '주점', 0),
+('店', '酒店', '주점', 1),
+('酒', '酒煎子', '주전자', 0),
+('煎', '酒煎子', '주전자', 1),
+('子', '酒煎子', '주전자', 2),
+('酒', '酒煎子', '주전재', 0),
+('煎', '酒煎子', '주전재', 1),
+('子', '酒煎子', '주전재', 2),
+('酒', '酒色', '주색', 0),
+('色', '酒色', '주색', 1),
+('酒', '酒色雜技', '주색잡기', 0),
+('色', '酒色雜技', '주색잡기', 1),
+('雜', '酒色雜技', '주색잡기', 2),
+('技', '酒色雜技', '주색잡기', 3),
+('酒', '酒酊', '주정', 0),
+('酊', '酒酊', '주정', 1),
+('酒', '酒類', '주류', 0),
+('類', '酒類', '주류', 1),
+('酒', '酒食', '주식', 0),
+('食', '酒食', '주식', 1),
+('酪', '酪農業', '낙농업', 0),
+('農', '酪農業', '낙농업', 1),
+('業', '酪農業', '낙농업', 2),
+('酵', '酵母', '효모', 0),
+('母', '酵母', '효모', 1),
+('酵', '酵素', '효소', 0),
+('素', '酵素', '효소', 1),
+('酵', '酵素學', '효소학', 0),
+('素', '酵素學', '효소학', 1),
+('學', '酵素學', '효소학', 2),
+('酸', '酸', '산', 0),
+('酸', '酸化', '산화', 0),
+('化', '酸化', '산화', 1),
+('酸', '酸化劑', '산화제', 0),
+('化', '酸化劑', '산화제', 1),
+('劑', '酸化劑', '산화제', 2),
+('酸', '酸化物', '산화물', 0),
+('化', '酸化物', '산화물', 1),
+('物', '酸化物', '산화물', 2),
+('酸', '酸性', '산성', 0),
+('性', '酸性', '산성', 1),
+('酸', '酸敗', '산패', 0),
+('敗', '酸敗', '산패', 1),
+('酸', '酸素', '산소', 0),
+('素', '酸素', '산소', 1),
+('酸', '酸素呼吸器', '산소호흡기', 0),
+('素', '酸素呼吸器', '산소호흡기', 1),
+('呼', '酸素呼吸器', '산소호흡기', 2),
+('吸', '酸素呼吸器', '산소호흡기', 3),
+('器', '酸素呼吸器', '산소호흡기', 4),
+('醇', '醇化', '순화', 0),
+('化', '醇化', '순화', 1),
+('醉', '醉', '취', 0),
+('醉', '醉狂', '취광', 0),
+('狂', '醉狂', '취광', 1),
+('醉', '醉興', '취흥', 0),
+('興', '醉興', '취흥', 1),
+('醋', '醋-', '초밥', 0),
+('-', '醋-', '초밥', 1),
+('醋', '醋酸', '초산', 0),
+('酸', '醋酸', '초산', 1),
+('醜', '醜惡', '추악', 0),
+('惡', '醜惡', '추악', 1),
+('醜', '醜聞', '추문', 0),
+('聞', '醜聞', '추문', 1),
+('醫', '醫學', '의학', 0),
+('學', '醫學', '의학', 1),
+('醫', '醫師', '의사', 0),
+('師', '醫師', '의사', 1),
+('醫', '醫生', '의생', 0),
+('生', '醫生', '의생', 1),
+('醫', '醫療', '의료', 0),
+('療', '醫療', '의료', 1),
+('醫', '醫療保險證', '의료보험증', 0),
+('療', '醫療保險證', '의료보험증', 1),
+('保', '醫療保險證', '의료보험증', 2),
+('險', '醫療保險證', '의료보험증', 3),
+('證', '醫療保險證', '의료보험증', 4),
+('醫', '醫科', '의과', 0),
+('科', '醫科', '의과', 1),
+('醫', '醫術', '의술', 0),
+('術', '醫術', '의술', 1),
+('醫', '醫院', '의원', 0),
+('院', '醫院', '의원', 1),
+('醬', '醬', '장', 0),
+('醬', '醬독', '장독', 0),
+('독', '醬독', '장독', 1),
+('醬', '醬독臺', '장독대', 0),
+('독', '醬독臺', '장독대', 1),
+('臺', '醬독臺', '장독대', 2),
+('醱', '醱酵', '발효', 0),
+('酵', '醱酵', '발효', 1),
+('醵', '醵出', '갹출', 0),
+('出', '醵出', '갹출', 1),
+('醵', '醵金', '갹금', 0),
+('金', '醵金', '갹금', 1),
+('釀', '釀蜜', '양밀', 0),
+('蜜', '釀蜜', '양밀', 1),
+('釀', '釀造場', '양조장', 0),
+('造', '釀造場', '양조장', 1),
+('場', '釀造場', '양조장', 2),
+('采', '采詩', '채시', 0),
+('詩', '采詩', '채시', 1),
+('釉', '釉藥', '유약', 0),
+('藥', '釉藥', '유약', 1),
+('釋', '釋放', '석방', 0),
+('放', '釋放', '석방', 1),
+('釋', '釋義', '석의', 0),
+('義', '釋義', '석의', 1),
+('釋', '釋迦牟尼', '석가모니', 0),
+('迦', '釋迦牟尼', '석가모니', 1),
+('牟', '釋迦牟尼', '석가모니', 2),
+('尼', '釋迦牟尼', '석가모니', 3),
+('里', '里', '리', 0),
+('里', '里程標', '리정표', 0),
+('程', '里程標', '리정표', 1),
+('標', '里程標', '리정표', 2),
+('里', '里程標', '이정표', 0),
+('程', '里程標', '이정표', 1),
+('標', '里程標', '이정표', 2),
+('里', '里長', '이장', 0),
+('長', '里長', '이장', 1),
+('重', '重', '중', 0),
+('重', '重任', '중임', 0),
+('任', '重任', '중임', 1),
+('重', '重傷', '중상', 0),
+('傷', '重傷', '중상', 1),
+('重', '重力', '중력', 0),
+('力', '重力', '중력', 1),
+('重', '重力子', '중력자', 0),
+('力', '重力子', '중력자', 1),
+('子', '重力子', '중력자', 2),
+('重', '重商主義', '중상주의', 0),
+('商', '重商主義', '중상주의', 1),
+('主', '重商主義', '중상주의', 2),
+('義', '重商主義', '중상주의', 3),
+('重', '重大', '중대', 0),
+('大', '重大', '중대', 1),
+('重', '重婚', '중혼', 0),
+('婚', '重婚', '중혼', 1),
+('重', '重婚者', '중혼자', 0),
+('婚', '重婚者', '중혼자', 1),
+('者', '重婚者', '중혼자', 2),
+('重', '重工業', '중공업', 0),
+('工', '重工業', '중공업', 1),
+('業', '重工業', '중공업', 2),
+('重', '重度', '중도', 0),
+('度', '重度', '중도', 1),
+('重', '重役', '중역', 0),
+('役', '重役', '중역', 1),
+('重', '重心', '중심', 0),
+('心', '重心', '중심', 1),
+('重', '重態', '중태', 0),
+('態', '重態', '중태', 1),
+('重', '重慶', '중경', 0),
+('慶', '重慶', '중경', 1),
+('重', '重慶', '충칭', 0),
+('慶', '重慶', '충칭', 1),
+('重', '重懲戒', '중징계', 0),
+('懲', '重懲戒', '중징계', 1),
+('戒', '重懲戒', '중징계', 2),
+('重', '重曹', '중조', 0),
+('曹', '重曹', '중조', 1),
+('重', '重水', '중수', 0),
+('水', '重水', '중수', 1),
+('重', '重水素', '중수소', 0),
+('水', '重水素', '중수소', 1),
+('素', '重水素', '중수소', 2),
+('重', '重油', '중유', 0),
+('油', '重油', '중유', 1),
+('重', '重泉', '중천', 0),
+('泉', '重泉', '중천', 1),
+('重', '重男輕女', '중남경녀', 0),
+('男', '重男輕女', '중남경녀', 1),
+('輕', '重男輕女', '중남경녀', 2),
+('女', '重男輕女', '중남경녀', 3),
+('重', '重症', '중증', 0),
+('症', '重症', '중증', 1),
+('重', '重盜', '중도', 0),
+('盜', '重盜', '중도', 1),
+('重', '重積分', '중적분', 0),
+('積', '重積分', '중적분', 1),
+('分', '重積分', '중적분', 2),
+('重', '重罪', '중죄', 0),
+('罪', '重罪', '중죄', 1),
+('重', '重複', '중복', 0),
+('複', '重複', '중복', 1),
+('重', '重要', '중요', 0),
+('要', '重要', '중요', 1),
+('重', '重要性', '중요성', 0),
+('要', '重要性', '중요성', 1),
+('性', '重要性', '중요성', 2),
+('重', '重要視', '중요시', 0),
+('要', '重要視', '중요시', 1),
+('視', '重要視', '중요시', 2),
+('重', '重訂', '중정', 0),
+('訂', '重訂', '중정', 1),
+('重', '重譯', '중역', 0),
+('譯', '重譯', '중역', 1),
+('重', '重車', '중거', 0),
+('車', '重車', '중거', 1),
+('重', '重農主義者', '중농주의자', 0),
+('農', '重農主義者', '중농주의자', 1),
+('主', '重農主義者', '중농주의자', 2),
+('義', '重農主義者', '중농주의자', 3),
+('者', '重農主義者', '중농주의자', 4),
+('重', '重量', '중량', 0),
+('量', '重量', '중량', 1),
+('野', '野', '야', 0),
+('野', '野人', '야인', 0),
+('人', '野人', '야인', 1),
+('野', '野卑', '야비', 0),
+('卑', '野卑', '야비', 1),
+('野', '野外', '야외', 0),
+('外', '野外', '야외', 1),
+('野', '野心', '야심', 0),
+('心', '野心', '야심', 1),
+('野', '野性', '야성', 0),
+('性', '野性', '야성', 1),
+('野', '野手', '야수', 0),
+('手', '野手', '야수', 1),
+('野', '野手選擇', '야수선택', 0),
+('手', '野手選擇', '야수선택', 1),
+('選', '野手選擇', '야수선택', 2),
+('擇', '野手選擇', '야수선택', 3),
+('野', '野望', '야망', 0),
+('望', '野望', '야망', 1),
+('野', '野民正音', '야민정음', 0),
+('民', '野民正音', '야민정음', 1),
+('正', '野民正音', '야민정음', 2),
+('音', '野民正音', '야민정음', 3),
+('野', '野營', '야영', 0),
+('營', '野營', '야영', 1),
+('野', '野犬', '야견', 0),
+('犬', '野犬', '야견', 1),
+('野', '野狐', '야호', 0),
+('狐', '野狐', '야호', 1),
+('野', '野獸', '야수', 0),
+('獸', '野獸', '야수', 1),
+('野', '野球', '야구', 0),
+('球', '野球', '야구', 1),
+('野', '野球 選手', '야구 선수', 0),
+('球', '野球 選手', '야구 선수', 1),
+('選', '野球 選手', '야구 선수', 3),
+('手', '野球 選手', '야구 선수', 4),
+('野', '野球場', '야구장', 0),
+('球', '野球場', '야구장', 1),
+('場', '野球場', '야구장', 2),
+('野', '野生', '야생', 0),
+('生', '野生', '야생', 1),
+('野', '野生 動物', '야생 동물', 0),
+('生', '野生 動物', '야생 동물', 1),
+('動', '野生 動物', '야생 동물', 3),
+('物', '野生 動物', '야생 동물', 4),
+('野', '野生動物', '야생동물', 0),
+('生', '野生動物', '야생동물', 1),
+('動', '野生動物', '야생동물', 2),
+('物', '野生動物', '야생동물', 3),
+('野', '野砲', '야포', 0),
+('砲', '野砲', '야포', 1),
+('野', '野菜', '야채', 0),
+('菜', '野菜', '야채', 1),
+('野', '野蒜', '야산', 0),
+('蒜', '野蒜', '야산', 1),
+('野', '野蠻', '야만', 0),
+('蠻', '野蠻', '야만', 1),
+('野', '野蠻人', '야만인', 0),
+('蠻', '野蠻人', '야만인', 1),
+('人', '野蠻人', '야만인', 2),
+('野', '野說', '야설', 0),
+('說', '野說', '야설', 1),
+('野', '野鄙', '야비', 0),
+('鄙', '野鄙', '야비', 1),
+('野', '野鴨', '야압', 0),
+('鴨', '野鴨', '야압', 1),
+('野', '野黨', '야당', 0),
+('黨', '野黨', '야당', 1),
+('量', '量', '양', 0),
+('量', '量子', '량자', 0),
+('子', '量子', '량자', 1),
+('量', '量子', '양자', 0),
+('子', '量子', '양자', 1),
+('量', '量子力學', '양자역학', 0),
+('子', '量子力學', '양자역학', 1),
+('力', '量子力學', '양자역학', 2),
+('學', '量子力學', '양자역학', 3),
+('量', '量子化', '양자화', 0),
+('子', '量子化', '양자화', 1),
+('化', '量子化', '양자화', 2),
+('量', '量子論', '양자론', 0),
+('子', '量子論', '양자론', 1),
+('論', '量子論', '양자론', 2),
+('量', '量子電氣力學', '양자전기역학', 0),
+('子', '量子電氣力學', '양자전기역학', 1),
+('電', '量子電氣力學', '양자전기역학', 2),
+('氣', '量子電氣力學', '양자전기역학', 3),
+('力', '量子電氣力學', '양자전기역학', 4),
+('學', '量子電氣力學', '양자전기역학', 5),
+('量', '量數詞', '양수사', 0),
+('數', '量數詞', '양수사', 1),
+('詞', '量數詞', '양수사', 2),
+('量', '量産', '양산', 0),
+('産', '量産', '양산', 1),
+('金', '金', '금', 0),
+('金', '金', '김', 0),
+('金', '金利', '금리', 0),
+('利', '金利', '금리', 1),
+('金', '金剛山', '금강산', 0),
+('剛', '金剛山', '금강산', 1),
+('山', '金剛山', '금강산', 2),
+('金', '金剛鸚鵡', '금강앵무', 0),
+('剛', '金剛鸚鵡', '금강앵무', 1),
+('鸚', '金剛鸚鵡', '금강앵무', 2),
+('鵡', '金剛鸚鵡', '금강앵무', 3),
+('金', '金半指', '금반지', 0),
+('半', '金半指', '금반지', 1),
+('指', '金半指', '금반지', 2),
+('金', '金品', '금품', 0),
+('品', '金品', '금품', 1),
+('金', '金塊', '금괴', 0),
+('塊', '金塊', '금괴', 1),
+('金', '金字塔', '금자탑', 0),
+('字', '金字塔', '금자탑', 1),
+('塔', '金字塔', '금자탑', 2),
+('金', '金屬', '금속', 0),
+('屬', '金屬', '금속', 1),
+('金', '金庫', '금고', 0),
+('庫', '金庫', '금고', 1),
+('金', '金日成花', '김일성화', 0),
+('日', '金日成花', '김일성화', 1),
+('成', '金日成花', '김일성화', 2),
+('花', '金日成花', '김일성화', 3),
+('金', '金曜日', '금요일', 0),
+('曜', '金曜日', '금요일', 1),
+('日', '金曜日', '금요일', 2),
+('金', '金橘', '금귤', 0),
+('橘', '金橘', '금귤', 1),
+('金', '金正日花', '김정일화', 0),
+('正', '金正日花', '김정일화', 1),
+('日', '金正日花', '김정일화', 2),
+('花', '金正日花', '김정일화', 3),
+('金', '金浦空港', '김포공항', 0),
+('浦', '金浦空港', '김포공항', 1),
+('空', '金浦空港', '김포공항', 2),
+('港', '金浦空港', '김포공항', 3),
+('金', '金石學', '금석학', 0),
+('石', '金石學', '금석학', 1),
+('學', '金石學', '금석학', 2),
+('金', '金策', '김책', 0),
+('策', '金策', '김책', 1),
+('金', '金箔', '금박', 0),
+('箔', '金箔', '금박', 1),
+('金', '金融', '금융', 0),
+('融', '金融', '금융', 1),
+('金', '金貨', '금화', 0),
+('貨', '金貨', '금화', 1),
+('金', '金銀', '금은', 0),
+('銀', '金銀', '금은', 1),
+('金', '金錢', '금전', 0),
+('錢', '金錢', '금전', 1),
+('金', '金額', '금액', 0),
+('額', '金額', '금액', 1),
+('金', '金髪', '금발', 0),
+('髪', '金髪', '금발', 1),
+('金', '金髮', '금발', 0),
+('髮', '金髮', '금발', 1),
+('金', '金髮碧眼', '금발벽안', 0),
+('髮', '金髮碧眼', '금발벽안', 1),
+('碧', '金髮碧眼', '금발벽안', 2),
+('眼', '金髮碧眼', '금발벽안', 3),
+('金', '金메달', '금메달', 0),
+('메', '金메달', '금메달', 1),
+('달', '金메달', '금메달', 2),
+('釜', '釜', '부', 0),
+('釜', '釜山', '부산', 0),
+('山', '釜山', '부산', 1),
+('針', '針', '침', 0),
+('針', '針小棒大', '침소봉대', 0),
+('小', '針小棒大', '침소봉대', 1),
+('棒', '針小棒大', '침소봉대', 2),
+('大', '針小棒大', '침소봉대', 3),
+('針', '針母', '침모', 0),
+('母', '針母', '침모', 1),
+('針', '針葉', '침엽', 0),
+('葉', '針葉', '침엽', 1),
+('針', '針葉樹', '침엽수', 0),
+('葉', '針葉樹', '침엽수', 1),
+('樹', '針葉樹', '침엽수', 2),
+('針', '針葉樹林', '침엽수림', 0),
+('葉', '針葉樹林', '침엽수림', 1),
+('樹', '針葉樹林', '침엽수림', 2),
+('林', '針葉樹林', '침엽수림', 3),
+('針', '針路', '침로', 0),
+('路', '針路', '침로', 1),
+('釣', '釣竿', '조간', 0),
+('竿', '釣竿', '조간', 1),
+('釣', '釣船', '조선', 0),
+('船', '釣船', '조선', 1),
+('釣', '釣魚', '조어', 0),
+('魚', '釣魚', '조어', 1),
+('鈍', '鈍', '둔', 0),
+('鈍', '鈍器', '둔기', 0),
+('器', '鈍器', '둔기', 1),
+('鈍', '鈍感', '둔감', 0),
+('感', '鈍感', '둔감', 1),
+('鉛', '鉛刀', '연도', 0),
+('刀', '鉛刀', '연도', 1),
+('鉛', '鉛毒', '연독', 0),
+('毒', '鉛毒', '연독', 1),
+('鉛', '鉛筆', '연필', 0),
+('筆', '鉛筆', '연필', 1),
+('鉛', '鉛管工', '연관공', 0),
+('管', '鉛管工', '연관공', 1),
+('工', '鉛管工', '연관공', 2),
+('鉛', '鉛糖', '연당', 0),
+('糖', '鉛糖', '연당', 1),
+('銀', '銀', '은', 0),
+('銀', '銀杏', '은행', 0),
+('杏', '銀杏', '은행', 1),
+('銀', '銀杏--', '은행나무', 0),
+('杏', '銀杏--', '은행나무', 1),
+('-', '銀杏--', '은행나무', 2),
+('-', '銀杏--', '은행나무', 3),
+('銀', '銀杏— ', '은행나무', 0),
+('杏', '銀杏— ', '은행나무', 1),
+('—', '銀杏— ', '은행나무', 2),
+('銀', '銀河', '은하', 0),
+('河', '銀河', '은하', 1),
+('銀', '銀河團', '은하단', 0),
+('河', '銀河團', '은하단', 1),
+('團', '銀河團', '은하단', 2),
+('銀', '銀河水', '은하수', 0),
+('河', '銀河水', '은하수', 1),
+('水', '銀河水', '은하수', 2),
+('銀', '銀河系', '은하계', 0),
+('河', '銀河系', '은하계', 1),
+('系', '銀河系', '은하계', 2),
+('銀', '銀色', '은색', 0),
+('色', '銀色', '은색', 1),
+('銀', '銀行', '은행', 0),
+('行', '銀行', '은행', 1),
+('銀', '銀行券', '은행권', 0),
+('行', '銀行券', '은행권', 1),
+('券', '銀行券', '은행권', 2),
+('銀', '銀貨', '은화', 0),
+('貨', '銀貨', '은화', 1),
+('銀', '銀魚', '은어', 0),
+('魚', '銀魚', '은어', 1),
+('銀', '銀鰱魚', '은연어', 0),
+('鰱', '銀鰱魚', '은연어', 1),
+('魚', '銀鰱魚', '은연어', 2),
+('銃', '銃', '총', 0),
+('銃', '銃劍', '총검', 0),
+('劍', '銃劍', '총검', 1),
+('銃', '銃口', '총구', 0),
+('口', '銃口', '총구', 1),
+('銃', '銃士', '총사', 0),
+('士', '銃士', '총사', 1),
+('銃', '銃床', '총상', 0),
+('床', '銃床', '총상', 1),
+('銃', '銃殺', '총살', 0),
+('殺', '銃殺', '총살', 1),
+('銃', '銃筒', '총통', 0),
+('筒', '銃筒', '총통', 1),
+('銃', '銃筩', '총통', 0),
+('筩', '銃筩', '총통', 1),
+('銃', '銃聲', '총성', 0),
+('聲', '銃聲', '총성', 1),
+('銃', '銃身', '총신', 0),
+('身', '銃身', '총신', 1),
+('銃', '銃알', '총알', 0),
+('알', '銃알', '총알', 1),
+('銅', '銅', '동', 0),
+('銅', '銅人', '동인', 0),
+('人', '銅人', '동인', 1),
+('銅', '銅印', '동인', 0),
+('印', '銅印', '동인', 1),
+('銅', '銅錢', '동전', 0),
+('錢', '銅錢', '동전', 1),
+('銅', '銅錢株', '동전주', 0),
+('錢', '銅錢株', '동전주', 1),
+('株', '銅錢株', '동전주', 2),
+('銅', '銅鏡', '동경', 0),
+('鏡', '銅鏡', '동경', 1),
+('銘', '銘文', '명문', 0),
+('文', '銘文', '명문', 1),
+('銛', '銛', '섬', 0),
+('銳', '銳敏', '예민', 0),
+('敏', '銳敏', '예민', 1),
+('鋤', '鋤骨', '서골', 0),
+('骨', '鋤骨', '서골', 1),
+('鋪', '鋪石', '포석', 0),
+('石', '鋪石', '포석', 1),
+('鋪', '鋪裝', '포장', 0),
+('裝', '鋪裝', '포장', 1),
+('鋪', '鋪道', '포도', 0),
+('道', '鋪道', '포도', 1),
+('鋼', '鋼材', '강재', 0),
+('材', '鋼材', '강재', 1),
+('鋼', '鋼玉', '강옥', 0),
+('玉', '鋼玉', '강옥', 1),
+('鋼', '鋼管', '강관', 0),
+('管', '鋼管', '강관', 1),
+('鋼', '鋼線', '강선', 0),
+('線', '鋼線', '강선', 1),
+('鋼', '鋼鐵', '강철', 0),
+('鐵', '鋼鐵', '강철', 1),
+('錄', '錄畫', '녹화', 0),
+('畫', '錄畫', '녹화', 1),
+('錄', '錄畵', '녹화', 0),
+('畵', '錄畵', '녹화', 1),
+('錄', '錄音', '녹음', 0),
+('音', '錄音', '녹음', 1),
+('錄', '錄音', '록음', 0),
+('音', '錄音', '록음', 1),
+('錄', '錄音器', '녹음기', 0),
+('音', '錄音器', '녹음기', 1),
+('器', '錄音器', '녹음기', 2),
+('錄', '錄音器', '록음기', 0),
+('音', '錄音器', '록음기', 1),
+('器', '錄音器', '록음기', 2),
+('錄', '錄音室', '녹음실', 0),
+('音', '錄音室', '녹음실', 1),
+('室', '錄音室', '녹음실', 2),
+('錚', '錚盤', '쟁반', 0),
+('盤', '錚盤', '쟁반', 1),
+('錚', '錚錚', '쟁쟁', 0),
+('錚', '錚錚', '쟁쟁', 1),
+('錠', '錠劑', '정제', 0),
+('劑', '錠劑', '정제', 1),
+('錢', '錢', '전', 0),
+('錢', '錢局', '전국', 0),
+('局', '錢局', '전국', 1),
+('錢', '錢漁', '전어', 0),
+('漁', '錢漁', '전어', 1),
+('錦', '錦繡', '금수', 0),
+('繡', '錦繡', '금수', 1),
+('錦', '錦繡江山', '금수강산', 0),
+('繡', '錦繡江山', '금수강산', 1),
+('江', '錦繡江山', '금수강산', 2),
+('山', '錦繡江山', '금수강산', 3),
+('錫', '錫杖', '석장', 0),
+('杖', '錫杖', '석장', 1),
+('錫', '錫箔', '석박', 0),
+('箔', '錫箔', '석박', 1),
+('錯', '錯視', '착시', 0),
+('視', '錯視', '착시', 1),
+('錯', '錯覺', '착각', 0),
+('覺', '錯覺', '착각', 1),
+('錯', '錯誤', '착오', 0),
+('誤', '錯誤', '착오', 1),
+('錯', '錯雜', '착잡', 0),
+('雜', '錯雜', '착잡', 1),
+('鍍', '鍍金', '도금', 0),
+('金', '鍍金', '도금', 1),
+('鍵', '鍵盤', '건반', 0),
+('盤', '鍵盤', '건반', 1),
+('鍼', '鍼', '침', 0),
+('鍼', '鍼術', '침술', 0),
+('術', '鍼術', '침술', 1),
+('鍾', '鍾乳石', '종유석', 0),
+('乳', '鍾乳石', '종유석', 1),
+('石', '鍾乳石', '종유석', 2),
+('鍾', '鍾路', '종로', 0),
+('路', '鍾路', '종로', 1),
+('鎔', '鎔冶', '용야', 0),
+('冶', '鎔冶', '용야', 1),
+('鎔', '鎔接', '용접', 0),
+('接', '鎔接', '용접', 1),
+('鎔', '鎔接工', '용접공', 0),
+('接', '鎔接工', '용접공', 1),
+('工', '鎔接工', '용접공', 2),
+('鎔', '鎔解', '용해', 0),
+('解', '鎔解', '용해', 1),
+('鎔', '鎔鑛爐', '용광로', 0),
+('鑛', '鎔鑛爐', '용광로', 1),
+('爐', '鎔鑛爐', '용광로', 2),
+('鎖', '鎖國', '쇄국', 0),
+('國', '鎖國', '쇄국', 1),
+('鎖', '鎖骨', '쇄골', 0),
+('骨', '鎖骨', '쇄골', 1),
+('鎭', '鎭壓', '진압', 0),
+('壓', '鎭壓', '진압', 1),
+('鎭', '鎭守', '진수', 0),
+('守', '鎭守', '진수', 1),
+('鎭', '鎭守府', '진수부', 0),
+('守', '鎭守府', '진수부', 1),
+('府', '鎭守府', '진수부', 2),
+('鎭', '鎭火', '진화', 0),
+('火', '鎭火', '진화', 1),
+('鎭', '鎭痛', '진통', 0),
+('痛', '鎭痛', '진통', 1),
+('鎭', '鎭痛劑', '진통제', 0),
+('痛', '鎭痛劑', '진통제', 1),
+('劑', '鎭痛劑', '진통제', 2),
+('鎭', '鎭靜', '진정', 0),
+('靜', '鎭靜', '진정', 1),
+('鎭', '鎭靜劑', '진정제', 0),
+('靜', '鎭靜劑', '진정제', 1),
+('劑', '鎭靜劑', '진정제', 2),
+('鎭', '鎭魂', '진혼', 0),
+('魂', '鎭魂', '진혼', 1),
+('鎭', '鎭魂祭', '진혼제', 0),
+('魂', '鎭魂祭', '진혼제', 1),
+('祭', '鎭魂祭', '진혼제', 2),
+('鏌', '鏌鎁', '막야', 0),
+('鎁', '鏌鎁', '막야', 1),
+('鏘', '鏘鏘', '장장', 0),
+('鏘', '鏘鏘', '장장', 1),
+('鏜', '鏜鈀', '당파', 0),
+('鈀', '鏜鈀', '당파', 1),
+('鏡', '鏡城', '경성', 0),
+('城', '鏡城', '경성', 1),
+('鐘', '鐘', '종', 0),
+('鐘', '鐘--', '종소리', 0),
+('-', '鐘--', '종소리', 1),
+('-', '鐘--', '종소리', 2),
+('鐘', '鐘樓', '종루', 0),
+('樓', '鐘樓', '종루', 1),
+('鐙', '鐙子', '등자', 0),
+('子', '鐙子', '등자', 1),
+('鐵', '鐵', '철', 0),
+('鐵', '鐵人', '철인', 0),
+('人', '鐵人', '철인', 1),
+('鐵', '鐵分', '철분', 0),
+('分', '鐵分', '철분', 1),
+('鐵', '鐵原', '철원', 0),
+('原', '鐵原', '철원', 1),
+('鐵', '鐵器', '철기', 0),
+('器', '鐵器', '철기', 1),
+('鐵', '鐵器 時代', '철기 시대', 0),
+('器', '鐵器 時代', '철기 시대', 1),
+('時', '鐵器 時代', '철기 시대', 3),
+('代', '鐵器 時代', '철기 시대', 4),
+('鐵', '鐵工', '철공', 0),
+('工', '鐵工', '철공', 1),
+('鐵', '鐵材', '철재', 0),
+('材', '鐵材', '철재', 1),
+('鐵', '鐵板', '철판', 0),
+('板', '鐵板', '철판', 1),
+('鐵', '鐵槌', '철퇴', 0),
+('槌', '鐵槌', '철퇴', 1),
+('鐵', '鐵片', '철편', 0),
+('片', '鐵片', '철편', 1),
+('鐵', '鐵物店', '철물점', 0),
+('物', '鐵物店', '철물점', 1),
+('店', '鐵物店', '철물점', 2),
+('鐵', '鐵甲', '철갑', 0),
+('甲', '鐵甲', '철갑', 1),
+('鐵', '鐵甲상어', '철갑상어', 0),
+('甲', '鐵甲상어', '철갑상어', 1),
+('상', '鐵甲상어', '철갑상어', 2),
+('어', '鐵甲상어', '철갑상어', 3),
+('鐵', '鐵砲', '철포', 0),
+('砲', '鐵砲', '철포', 1),
+('鐵', '鐵筆', '철필', 0),
+('筆', '鐵筆', '철필', 1),
+('鐵', '鐵絲', '철사', 0),
+('絲', '鐵絲', '철사', 1),
+('鐵', '鐵色', '철색', 0),
+('色', '鐵色', '철색', 1),
+('鐵', '鐵製', '철제', 0),
+('製', '鐵製', '철제', 1),
+('鐵', '鐵觀音', '철관음', 0),
+('觀', '鐵觀音', '철관음', 1),
+('音', '鐵觀音', '철관음', 2),
+('鐵', '鐵道', '철도', 0),
+('道', '鐵道', '철도', 1),
+('鐵', '鐵道驛', '철도역', 0),
+('道', '鐵道驛', '철도역', 1),
+('驛', '鐵道驛', '철도역', 2),
+('鐵', '鐵鑛石', '철광석', 0),
+('鑛', '鐵鑛石', '철광석', 1),
+('石', '鐵鑛石', '철광석', 2),
+('鐵', '鐵馬', '철마', 0),
+('馬', '鐵馬', '철마', 1),
+('鐵', '鐵의  帳', '철의 장막', 0),
+('의', '鐵의  帳', '철의 장막', 1),
+('帳', '鐵의  帳', '철의 장막', 4),
+('鑄', '鑄型', '주형', 0),
+('型', '鑄型', '주형', 1),
+('鑄', '鑄型工', '주형공', 0),
+('型', '鑄型工', '주형공', 1),
+('工', '鑄型工', '주형공', 2),
+('鑄', '鑄型油', '주형유', 0),
+('型', '鑄型油', '주형유', 1),
+('油', '鑄型油', '주형유', 2),
+('鑄', '鑄物', '주물', 0),
+('物', '鑄物', '주물', 1),
+('鑄', '鑄造', '주조', 0),
+('造', '鑄造', '주조', 1),
+('鑄', '鑄鋼', '주강', 0),
+('鋼', '鑄鋼', '주강', 1),
+('鑄', '鑄鐵', '주철', 0),
+('鐵', '鑄鐵', '주철', 1),
+('鑑', '鑑定', '감정', 0),
+('定', '鑑定', '감정', 1),
+('鑑', '鑑定價', '감정가', 0),
+('定', '鑑定價', '감정가', 1),
+('價', '鑑定價', '감정가', 2),
+('鑑', '鑑定家', '감정가', 0),
+('定', '鑑定家', '감정가', 1),
+('家', '鑑定家', '감정가', 2),
+('鑑', '鑑賞', '감상', 0),
+('賞', '鑑賞', '감상', 1),
+('鑛', '鑛區', '광구', 0),
+('區', '鑛區', '광구', 1),
+('鑛', '鑛口', '광구', 0),
+('口', '鑛口', '광구', 1),
+('鑛', '鑛夫', '광부', 0),
+('夫', '鑛夫', '광부', 1),
+('鑛', '鑛山', '광산', 0),
+('山', '鑛山', '광산', 1),
+('鑛', '鑛業', '광업', 0),
+('業', '鑛業', '광업', 1),
+('鑛', '鑛油', '광유', 0),
+('油', '鑛油', '광유', 1),
+('鑛', '鑛泉水', '광천수', 0),
+('泉', '鑛泉水', '광천수', 1),
+('水', '鑛泉水', '광천수', 2),
+('鑛', '鑛物', '광물', 0),
+('物', '鑛物', '광물', 1),
+('鑛', '鑛物學', '광물학', 0),
+('物', '鑛物學', '광물학', 1),
+('學', '鑛物學', '광물학', 2),
+('鑛', '鑛物油', '광물유', 0),
+('物', '鑛物油', '광물유', 1),
+('油', '鑛物油', '광물유', 2),
+('鑛', '鑛石', '광석', 0),
+('石', '鑛石', '광석', 1),
+('鑛', '鑛脈', '광맥', 0),
+('脈', '鑛脈', '광맥', 1),
+('鑿', '鑿岩機', '착암기', 0),
+('岩', '鑿岩機', '착암기', 1),
+('機', '鑿岩機', '착암기', 2),
+('鑿', '鑿巖機', '착암기', 0),
+('巖', '鑿巖機', '착암기', 1),
+('機', '鑿巖機', '착암기', 2),
+('長', '長', '장', 0),
+('長', '長壽', '장수', 0),
+('壽', '長壽', '장수', 1),
+('長', '長女', '장녀', 0),
+('女', '長女', '장녀', 1),
+('長', '長嫂', '장수', 0),
+('嫂', '長嫂', '장수', 1),
+('長', '長子', '장자', 0),
+('子', '長子', '장자', 1),
+('長', '長官', '장관', 0),
+('官', '長官', '장관', 1),
+('長', '長廣舌', '장광설', 0),
+('廣', '長廣舌', '장광설', 1),
+('舌', '長廣舌', '장광설', 2),
+('長', '長弓', '장궁', 0),
+('弓', '長弓', '장궁', 1),
+('長', '長征', '장정', 0),
+('征', '長征', '장정', 1),
+('長', '長所', '장소', 0),
+('所', '長所', '장소', 1),
+('長', '長打率', '장타율', 0),
+('打', '長打率', '장타율', 1),
+('率', '長打率', '장타율', 2),
+('長', '長承', '장승', 0),
+('承', '長承', '장승', 1),
+('長', '長技', '장기', 0),
+('技', '長技', '장기', 1),
+('長', '長技 자랑', '장기 자랑', 0),
+('技', '長技 자랑', '장기 자랑', 1),
+('자', '長技 자랑', '장기 자랑', 3),
+('랑', '長技 자랑', '장기 자랑', 4),
+('長', '長文', '장문', 0),
+('文', '長文', '장문', 1),
+('長', '長斫', '장작', 0),
+('斫', '長斫', '장작', 1),
+('長', '長斫—', '장작불', 0),
+('斫', '長斫—', '장작불', 1),
+('—', '長斫—', '장작불', 2),
+('長', '長斫— ', '장작개비', 0),
+('斫', '長斫— ', '장작개비', 1),
+('—', '長斫— ', '장작개비', 2),
+('長', '長期', '장기', 0),
+('期', '長期', '장기', 1),
+('長', '長期的', '장기적', 0),
+('期', '長期的', '장기적', 1),
+('的', '長期的', '장기적', 2),
+('長', '長期間', '장기간', 0),
+('期', '長期間', '장기간', 1),
+('間', '長期間', '장기간', 2),
+('長', '長江', '장강', 0),
+('江', '長江', '장강', 1),
+('長', '長波', '장파', 0),
+('波', '長波', '장파', 1),
+('長', '長男', '장남', 0),
+('男', '長男', '장남', 1),
+('長', '長病', '장병', 0),
+('病', '長病', '장병', 1),
+('長', '長短點', '장단점', 0),
+('短', '長短點', '장단점', 1),
+('點', '長短點', '장단점', 2),
+('長', '長石', '장석', 0),
+('石', '長石', '장석', 1),
+('長', '長篇', '장편', 0),
+('篇', '長篇', '장편', 1),
+('長', '長篇小說', '장편소설', 0),
+('篇', '長篇小說', '장편소설', 1),
+('小', '長篇小說', '장편소설', 2),
+('說', '長篇小說', '장편소설', 3),
+('長', '長老', '장로', 0),
+('老', '長老', '장로', 1),
+('長', '長老政治', '장로정치', 0),
+('老', '長老政治', '장로정치', 1),
+('政', '長老政治', '장로정치', 2),
+('治', '長老政治', '장로정치', 3),
+('長', '長老敎', '장로교', 0),
+('老', '長老敎', '장로교', 1),
+('敎', '長老敎', '장로교', 2),
+('長', '長老敎會', '장로교회', 0),
+('老', '長老敎會', '장로교회', 1),
+('敎', '長老敎會', '장로교회', 2),
+('會', '長老敎會', '장로교회', 3),
+('長', '長考', '장고', 0),
+('考', '長考', '장고', 1),
+('長', '長者', '장자', 0),
+('者', '長者', '장자', 1),
+('長', '長股', '장고', 0),
+('股', '長股', '장고', 1),
+('長', '長袖', '장수', 0),
+('袖', '長袖', '장수', 1),
+('長', '長調', '장조', 0),
+('調', '長調', '장조', 1),
+('長', '長針', '장침', 0),
+('針', '長針', '장침', 1),
+('長', '長靴', '장화', 0),
+('靴', '長靴', '장화', 1),
+('長', '長音', '장음', 0),
+('音', '長音', '장음', 1),
+('長', '長音階', '장음계', 0),
+('音', '長音階', '장음계', 1),
+('階', '長音階', '장음계', 2),
+('長', '長髮', '장발', 0),
+('髮', '長髮', '장발', 1),
+('長', '長魚', '장어', 0),
+('魚', '長魚', '장어', 1),
+('長', '長點', '장점', 0),
+('點', '長點', '장점', 1),
+('長', '長鼓', '장고', 0),
+('鼓', '長鼓', '장고', 1),
+('門', '門', '문', 0),
+('門', '門-', '문밖', 0),
+('-', '門-', '문밖', 1),
+('門', '門地枋', '문지방', 0),
+('地', '門地枋', '문지방', 1),
+('枋', '門地枋', '문지방', 2),
+('門', '門外漢', '문외한', 0),
+('外', '門外漢', '문외한', 1),
+('漢', '門外漢', '문외한', 2),
+('門', '門徒', '문도', 0),
+('徒', '門徒', '문도', 1),
+('門', '門衡', '문형', 0),
+('衡', '門衡', '문형', 1),
+('門', '門限', '문한', 0),
+('限', '門限', '문한', 1),
+('門', '門齒', '문치', 0),
+('齒', '門齒', '문치', 1),
+('門', '門손잡이', '문손잡이', 0),
+('손', '門손잡이', '문손잡이', 1),
+('잡', '門손잡이', '문손잡이', 2),
+('이', '門손잡이', '문손잡이', 3),
+('門', '門틈', '문틈', 0),
+('틈', '門틈', '문틈', 1),
+('閃', '閃光', '섬광', 0),
+('光', '閃光', '섬광', 1),
+('閉', '閉回路', '폐회로', 0),
+('回', '閉回路', '폐회로', 1),
+('路', '閉回路', '폐회로', 2),
+('閉', '閉幕式', '폐막식', 0),
+('幕', '閉幕式', '폐막식', 1),
+('式', '閉幕式', '폐막식', 2),
+('閉', '閉店', '폐점', 0),
+('店', '閉店', '폐점', 1),
+('閉', '閉會式', '폐회식', 0),
+('會', '閉會式', '폐회식', 1),
+('式', '閉會式', '폐회식', 2),
+('閉', '閉止', '폐지', 0),
+('止', '閉止', '폐지', 1),
+('閉', '閉經', '폐경', 0),
+('經', '閉經', '폐경', 1),
+('閉', '閉經期', '폐경기', 0),
+('經', '閉經期', '폐경기', 1),
+('期', '閉經期', '폐경기', 2),
+('閉', '閉鎖', '폐쇄', 0),
+('鎖', '閉鎖', '폐쇄', 1),
+('閉', '閉館', '폐관', 0),
+('館', '閉館', '폐관', 1),
+('開', '開催', '개최', 0),
+('催', '開催', '개최', 1),
+('開', '開創', '개창', 0),
+('創', '開創', '개창', 1),
+('開', '開化', '개화', 0),
+('化', '開化', '개화', 1),
+('開', '開化人', '개화인', 0),
+('化', '開化人', '개화인', 1),
+('人', '開化人', '개화인', 2),
+('開', '開國', '개국', 0),
+('國', '開國', '개국', 1),
+('開', '開城', '개성', 0),
+('城', '開城', '개성', 1),
+('開', '開場', '개장', 0),
+('場', '開場', '개장', 1),
+('開', '開始', '개시', 0),
+('始', '開始', '개시', 1),
+('開', '開學', '개학', 0),
+('學', '開學', '개학', 1),
+('開', '開封', '개봉', 0),
+('封', '開封', '개봉', 1),
+('開', '開局', '개국', 0),
+('局', '開局', '개국', 1),
+('開', '開幕式', '개막식', 0),
+('幕', '開幕式', '개막식', 1),
+('式', '開幕式', '개막식', 2),
+('開', '開店', '개점', 0),
+('店', '開店', '개점', 1),
+('開', '開戰', '개전', 0),
+('戰', '開戰', '개전', 1),
+('開', '開拓', '개척', 0),
+('拓', '開拓', '개척', 1),
+('開', '開拓者', '개척자', 0),
+('拓', '開拓者', '개척자', 1),
+('者', '開拓者', '개척자', 2),
+('開', '開放', '개방', 0),
+('放', '開放', '개방', 1),
+('開', '開敞', '개창', 0),
+('敞', '開敞', '개창', 1),
+('開', '開會式', '개회식', 0),
+('會', '開會式', '개회식', 1),
+('式', '開會式', '개회식', 2),
+('開', '開發', '개발', 0),
+('發', '開發', '개발', 1),
+('開', '開發者', '개발자', 0),
+('發', '開發者', '개발자', 1),
+('者', '開發者', '개발자', 2),
+('開', '開發途上國', '개발도상국', 0),
+('發', '開發途上國', '개발도상국', 1),
+('途', '開發途上國', '개발도상국', 2),
+('上', '開發途上國', '개발도상국', 3),
+('國', '開發途上國', '개발도상국', 4),
+('開', '開眼', '개안', 0),
+('眼', '開眼', '개안', 1),
+('開', '開窓', '개창', 0),
+('窓', '開窓', '개창', 1),
+('開', '開花', '개화', 0),
+('花', '開花', '개화', 1),
+('開', '開途國', '개도국', 0),
+('途', '開途國', '개도국', 1),
+('國', '開途國', '개도국', 2),
+('開', '開通', '개통', 0),
+('通', '開通', '개통', 1),
+('開', '開閉器', '개폐기', 0),
+('閉', '開閉器', '개폐기', 1),
+('器', '開閉器', '개폐기', 2),
+('開', '開闢', '개벽', 0),
+('闢', '開闢', '개벽', 1),
+('開', '開館', '개관', 0),
+('館', '開館', '개관', 1),
+('開', '開館式', '개관식', 0),
+('館', '開館式', '개관식', 1),
+('式', '開館式', '개관식', 2),
+('閏', '閏年', '윤년', 0),
+('年', '閏年', '윤년', 1),
+('閏', '閏日', '윤일', 0),
+('日', '閏日', '윤일', 1),
+('閑', '閑人', '한인', 0),
+('人', '閑人', '한인', 1),
+('閑', '閑暇', '한가', 0),
+('暇', '閑暇', '한가', 1),
+('閑', '閑職', '한직', 0),
+('職', '閑職', '한직', 1),
+('閑', '閑談', '한담', 0),
+('談', '閑談', '한담', 1),
+('間', '間', '간', 0),
+('間', '間奏', '간주', 0),
+('奏', '間奏', '간주', 1),
+('間', '間或', '간혹', 0),
+('或', '間或', '간혹', 1),
+('間', '間接', '간접', 0),
+('接', '間接', '간접', 1),
+('間', '間接話法', '간접화법', 0),
+('接', '間接話法', '간접화법', 1),
+('話', '間接話法', '간접화법', 2),
+('法', '間接話法', '간접화법', 3),
+('間', '間斷', '간단', 0),
+('斷', '間斷', '간단', 1),
+('間', '間歇', '간헐', 0),
+('歇', '間歇', '간헐', 1),
+('間', '間歇泉', '간헐천', 0),
+('歇', '間歇泉', '간헐천', 1),
+('泉', '間歇泉', '간헐천', 2),
+('間', '間節氣', '간절기', 0),
+('節', '間節氣', '간절기', 1),
+('氣', '間節氣', '간절기', 2),
+('間', '間諜', '간첩', 0),
+('諜', '間諜', '간첩', 1),
+('間', '間隔', '간격', 0),
+('隔', '間隔', '간격', 1),
+('間', '間隙', '간극', 0),
+('隙', '間隙', '간극', 1),
+('間', '間食', '간식', 0),
+('食', '間食', '간식', 1),
+('閣', '閣', '각', 0),
+('閣', '閣下', '각하', 0),
+('下', '閣下', '각하', 1),
+('閥', '閥族', '벌족', 0),
+('族', '閥族', '벌족', 1),
+('閨', '閨怨', '규원', 0),
+('怨', '閨怨', '규원', 1),
+('閩', '閩南語', '민남어', 0),
+('南', '閩南語', '민남어', 1),
+('語', '閩南語', '민남어', 2),
+('閱', '閱覽', '열람', 0),
+('覽', '閱覽', '열람', 1),
+('閱', '閱覽室', '열람실', 0),
+('覽', '閱覽室', '열람실', 1),
+('室', '閱覽室', '열람실', 2),
+('閻', '閻', '염', 0),
+('閻', '閻羅', '염라', 0),
+('羅', '閻羅', '염라', 1),
+('闊', '闊葉樹', '활엽수', 0),
+('葉', '闊葉樹', '활엽수', 1),
+('樹', '闊葉樹', '활엽수', 2),
+('關', '關', '관', 0),
+('關', '關係', '관계', 0),
+('係', '關係', '관계', 1),
+('關', '關係代名詞', '관계대명사', 0),
+('係', '關係代名詞', '관계대명사', 1),
+('代', '關係代名詞', '관계대명사', 2),
+('名', '關係代名詞', '관계대명사', 3),
+('詞', '關係代名詞', '관계대명사', 4),
+('關', '關係者', '관계자', 0),
+('係', '關係者', '관계자', 1),
+('者', '關係者', '관계자', 2),
+('關', '關係語', '관계어', 0),
+('係', '關係語', '관계어', 1),
+('語', '關係語', '관계어', 2),
+('關', '關心', '관심', 0),
+('心', '關心', '관심', 1),
+('關', '關心事', '관심사', 0),
+('心', '關心事', '관심사', 1),
+('事', '關心事', '관심사', 2),
+('關', '關心種子', '관심종자', 0),
+('心', '關心種子', '관심종자', 1),
+('種', '關心種子', '관심종자', 2),
+('子', '關心種子', '관심종자', 3),
+('關', '關東八景', '관동팔경', 0),
+('東', '關東八景', '관동팔경', 1),
+('八', '關東八景', '관동팔경', 2),
+('景', '關東八景', '관동팔경', 3),
+('關', '關稅', '관세', 0),
+('稅', '關稅', '관세', 1),
+('關', '關種', '관종', 0),
+('種', '關種', '관종', 1),
+('關', '關節', '관절', 0),
+('節', '關節', '관절', 1),
+('關', '關節炎', '관절염', 0),
+('節', '關節炎', '관절염', 1),
+('炎', '關節炎', '관절염', 2),
+('關', '關聯', '관련', 0),
+('聯', '關聯', '관련', 1),
+('關', '關聯性', '관련성', 0),
+('聯', '關聯性', '관련성', 1),
+('性', '關聯性', '관련성', 2),
+('關', '關與', '관여', 0),
+('與', '關與', '관여', 1),
+('關', '關鍵', '관건', 0),
+('鍵', '關鍵', '관건', 1),
+('關', '關門', '관문', 0),
+('門', '關門', '관문', 1),
+('闡', '闡明', '천명', 0),
+('明', '闡明', '천명', 1),
+('防', '防塵', '방진', 0),
+('塵', '防塵', '방진', 1),
+('防', '防彈', '방탄', 0),
+('彈', '防彈', '방탄', 1),
+('防', '防彈服', '방탄복', 0),
+('彈', '防彈服', '방탄복', 1),
+('服', '防彈服', '방탄복', 2),
+('防', '防止', '방지', 0),
+('止', '防止', '방지', 1),
+('防', '防水', '방수', 0),
+('水', '防水', '방수', 1),
+('防', '防水布', '방수포', 0),
+('水', '防水布', '방수포', 1),
+('布', '防水布', '방수포', 2),
+('防', '防波堤', '방파제', 0),
+('波', '防波堤', '방파제', 1),
+('堤', '防波堤', '방파제', 2),
+('防', '防潮堤', '방조제', 0),
+('潮', '防潮堤', '방조제', 1),
+('堤', '防潮堤', '방조제', 2),
+('防', '防火', '방화', 0),
+('火', '防火', '방화', 1),
+('防', '防火壁', '방화벽', 0),
+('火', '防火壁', '방화벽', 1),
+('壁', '防火壁', '방화벽', 2),
+('防', '防火線', '방화선', 0),
+('火', '防火線', '방화선', 1),
+('線', '防火線', '방화선', 2),
+('防', '防牌', '방패', 0),
+('牌', '防牌', '방패', 1),
+('防', '防疫', '방역', 0),
+('疫', '防疫', '방역', 1),
+('防', '防禦', '방어', 0),
+('禦', '防禦', '방어', 1),
+('防', '防禦機制', '방어기제', 0),
+('禦', '防禦機制', '방어기제', 1),
+('機', '防禦機制', '방어기제', 2),
+('制', '防禦機制', '방어기제', 3),
+('防', '防禦率', '방어율', 0),
+('禦', '防禦率', '방어율', 1),
+('率', '防禦率', '방어율', 2),
+('防', '防禦者', '방어자', 0),
+('禦', '防禦者', '방어자', 1),
+('者', '防禦者', '방어자', 2),
+('防', '防空', '방공', 0),
+('空', '防空', '방공', 1),
+('防', '防空壕', '방공호', 0),
+('空', '防空壕', '방공호', 1),
+('壕', '防空壕', '방공호', 2),
+('防', '防腐', '방부', 0),
+('腐', '防腐', '방부', 1),
+('防', '防蝕', '방식', 0),
+('蝕', '防蝕', '방식', 1),
+('防', '防衛', '방위', 0),
+('衛', '防衛', '방위', 1),
+('防', '防衛産業體', '방위산업체', 0),
+('衛', '防衛産業體', '방위산업체', 1),
+('産', '防衛産業體', '방위산업체', 2),
+('業', '防衛産業體', '방위산업체', 3),
+('體', '防衛産業體', '방위산업체', 4),
+('防', '防衛者', '방위자', 0),
+('衛', '防衛者', '방위자', 1),
+('者', '防衛者', '방위자', 2),
+('防', '防衛軍', '방위군', 0),
+('衛', '防衛軍', '방위군', 1),
+('軍', '防衛軍', '방위군', 2),
+('防', '防諜', '방첩', 0),
+('諜', '防諜', '방첩', 1),
+('防', '防護', '방호', 0),
+('護', '防護', '방호', 1),
+('防', '防護服', '방호복', 0),
+('護', '防護服', '방호복', 1),
+('服', '防護服', '방호복', 2),
+('防', '防銹', '방수', 0),
+('銹', '防銹', '방수', 1),
+('防', '防音', '방음', 0),
+('音', '防音', '방음', 1),
+('阿', '阿修羅', '아수라', 0),
+('修', '阿修羅', '아수라', 1),
+('羅', '阿修羅', '아수라', 2),
+('阿', '阿堵', '아도', 0),
+('堵', '阿堵', '아도', 1),
+('阿', '阿弗利加', '아불리가', 0),
+('弗', '阿弗利加', '아불리가', 1),
+('利', '阿弗利加', '아불리가', 2),
+('加', '阿弗利加', '아불리가', 3),
+('阿', '阿房宮', '아방궁', 0),
+('房', '阿房宮', '아방궁', 1),
+('宮', '阿房宮', '아방궁', 2),
+('阿', '阿斯達', '아사달', 0),
+('斯', '阿斯達', '아사달', 1),
+('達', '阿斯達', '아사달', 2),
+('阿', '阿毘達磨', '아비달마', 0),
+('毘', '阿毘達磨', '아비달마', 1),
+('達', '阿毘達磨', '아비달마', 2),
+('磨', '阿毘達磨', '아비달마', 3),
+('阿', '阿片', '아편', 0),
+('片', '阿片', '아편', 1),
+('阿', '阿羅漢', '아라한', 0),
+('羅', '阿羅漢', '아라한', 1),
+('漢', '阿羅漢', '아라한', 2),
+('阿', '阿膠', '아교', 0),
+('膠', '阿膠', '아교', 1),
+('阿', '阿諂', '아첨', 0),
+('諂', '阿諂', '아첨', 1),
+('阿', '阿諛', '아유', 0),
+('諛', '阿諛', '아유', 1),
+('阿', '阿賴耶識', '아뢰야식', 0),
+('賴', '阿賴耶識', '아뢰야식', 1),
+('耶', '阿賴耶識', '아뢰야식', 2),
+('識', '阿賴耶識', '아뢰야식', 3),
+('阿', '阿鼻叫喚', '아비규환', 0),
+('鼻', '阿鼻叫喚', '아비규환', 1),
+('叫', '阿鼻叫喚', '아비규환', 2),
+('喚', '阿鼻叫喚', '아비규환', 3),
+('阿', '阿鼻地獄', '아비지옥', 0),
+('鼻', '阿鼻地獄', '아비지옥', 1),
+('地', '阿鼻地獄', '아비지옥', 2),
+('獄', '阿鼻地獄', '아비지옥', 3),
+('附', '附則', '부칙', 0),
+('則', '附則', '부칙', 1),
+('附', '附加', '부가', 0),
+('加', '附加', '부가', 1),
+('附', '附圖', '부도', 0),
+('圖', '附圖', '부도', 1),
+('附', '附屬', '부속', 0),
+('屬', '附屬', '부속', 1),
+('附', '附帶', '부대', 0),
+('帶', '附帶', '부대', 1),
+('附', '附着力', '부착력', 0),
+('着', '附着力', '부착력', 1),
+('力', '附着力', '부착력', 2),
+('附', '附票', '부표', 0),
+('票', '附票', '부표', 1),
+('附', '附與', '부여', 0),
+('與', '附與', '부여', 1),
+('附', '附表', '부표', 0),
+('表', '附表', '부표', 1),
+('附', '附言', '부언', 0),
+('言', '附言', '부언', 1),
+('附', '附記', '부기', 0),
+('記', '附記', '부기', 1),
+('附', '附近', '부근', 0),
+('近', '附近', '부근', 1),
+('附', '附錄', '부록', 0),
+('錄', '附錄', '부록', 1),
+('附', '附隨', '부수', 0),
+('隨', '附隨', '부수', 1),
+('降', '降下', '강하', 0),
+('下', '降下', '강하', 1),
+('降', '降伏', '항복', 0),
+('伏', '降伏', '항복', 1),
+('降', '降服', '항복', 0),
+('服', '降服', '항복', 1),
+('降', '降板', '강판', 0),
+('板', '降板', '강판', 1),
+('降', '降水', '강수', 0),
+('水', '降水', '강수', 1),
+('降', '降水量', '강수량', 0),
+('水', '降水量', '강수량', 1),
+('量', '降水量', '강수량', 2),
+('降', '降生', '강생', 0),
+('生', '降生', '강생', 1),
+('降', '降神巫', '강신무', 0),
+('神', '降神巫', '강신무', 1),
+('巫', '降神巫', '강신무', 2),
+('降', '降神術', '강신술', 0),
+('神', '降神術', '강신술', 1),
+('術', '降神術', '강신술', 2),
+('降', '降等', '강등', 0),
+('等', '降等', '강등', 1),
+('降', '降臨', '강림', 0),
+('臨', '降臨', '강림', 1),
+('降', '降雨', '강우', 0),
+('雨', '降雨', '강우', 1),
+('降', '降雪', '강설', 0),
+('雪', '降雪', '강설', 1),
+('限', '限', '한', 0),
+('限', '限定', '한정', 0),
+('定', '限定', '한정', 1),
+('限', '限定版', '한정판', 0),
+('定', '限定版', '한정판', 1),
+('版', '限定版', '한정판', 2),
+('限', '限定詞', '한정사', 0),
+('定', '限定詞', '한정사', 1),
+('詞', '限定詞', '한정사', 2),
+('限', '限度', '한도', 0),
+('度', '限度', '한도', 1),
+('限', '限月', '한월', 0),
+('月', '限月', '한월', 1),
+('限', '限界', '한계', 0),
+('界', '限界', '한계', 1),
+('陛', '陛下', '폐하', 0),
+('下', '陛下', '폐하', 1),
+('陜', '陜西', '합서', 0),
+('西', '陜西', '합서', 1),
+('陜', '陜西', '협서', 0),
+('西', '陜西', '협서', 1),
+('陝', '陝西', '섬서', 0),
+('西', '陝西', '섬서', 1),
+('院', '院長', '원장', 0),
+('長', '院長', '원장', 1),
+('陣', '陣地', '진지', 0),
+('地', '陣地', '진지', 1),
+('陣', '陣容', '진용', 0),
+('容', '陣容', '진용', 1),
+('陣', '陣痛', '진통', 0),
+('痛', '陣痛', '진통', 1),
+('除', '除去', '제거', 0),
+('去', '除去', '제거', 1),
+('除', '除名', '제명', 0),
+('名', '除名', '제명', 1),
+('除', '除外', '제외', 0),
+('外', '除外', '제외', 1),
+('除', '除數', '제수', 0),
+('數', '除數', '제수', 1),
+('除', '除日', '제일', 0),
+('日', '除日', '제일', 1),
+('除', '除濕機', '제습기', 0),
+('濕', '除濕機', '제습기', 1),
+('機', '除濕機', '제습기', 2),
+('除', '除算', '제산', 0),
+('算', '除算', '제산', 1),
+('除', '除蟲菊', '제충국', 0),
+('蟲', '除蟲菊', '제충국', 1),
+('菊', '除蟲菊', '제충국', 2),
+('除', '除隊', '제대', 0),
+('隊', '除隊', '제대', 1),
+('除', '除雪機', '제설기', 0),
+('雪', '除雪機', '제설기', 1),
+('機', '除雪機', '제설기', 2),
+('除', '除雪車', '제설차', 0),
+('雪', '除雪車', '제설차', 1),
+('車', '除雪車', '제설차', 2),
+('陪', '陪審', '배심', 0),
+('審', '陪審', '배심', 1),
+('陪', '陪審員', '배심원', 0),
+('審', '陪審員', '배심원', 1),
+('員', '陪審員', '배심원', 2),
+('陰', '陰', '음', 0),
+('陰', '陰囊', '음낭', 0),
+('囊', '陰囊', '음낭', 1),
+('陰', '陰地', '음지', 0),
+('地', '陰地', '음지', 1),
+('陰', '陰影', '음영', 0),
+('影', '陰影', '음영', 1),
+('陰', '陰性', '음성', 0),
+('性', '陰性', '음성', 1),
+('陰', '陰性母音', '음성모음', 0),
+('性', '陰性母音', '음성모음', 1),
+('母', '陰性母音', '음성모음', 2),
+('音', '陰性母音', '음성모음', 3),
+('陰', '陰數', '음수', 0),
+('數', '陰數', '음수', 1),
+('陰', '陰曆', '음력', 0),
+('曆', '陰曆', '음력', 1),
+('陰', '陰核', '음핵', 0),
+('核', '陰核', '음핵', 1),
+('陰', '陰極', '음극', 0),
+('極', '陰極', '음극', 1),
+('陰', '陰毛', '음모', 0),
+('毛', '陰毛', '음모', 1),
+('陰', '陰目', '음목', 0),
+('目', '陰目', '음목', 1),
+('陰', '陰脣', '음순', 0),
+('脣', '陰脣', '음순', 1),
+('陰', '陰莖', '음경', 0),
+('莖', '陰莖', '음경', 1),
+('陰', '陰莖骨', '음경골', 0),
+('莖', '陰莖骨', '음경골', 1),
+('骨', '陰莖骨', '음경골', 2),
+('陰', '陰裂', '음렬', 0),
+('裂', '陰裂', '음렬', 1),
+('陰', '陰語', '음어', 0),
+('語', '陰語', '음어', 1),
+('陰', '陰謀', '음모', 0),
+('謀', '陰謀', '음모', 1),
+('陰', '陰謀說', '음모설', 0),
+('謀', '陰謀說', '음모설', 1),
+('說', '陰謀說', '음모설', 2),
+('陰', '陰謀論', '음모론', 0),
+('謀', '陰謀論', '음모론', 1),
+('論', '陰謀論', '음모론', 2),
+('陰', '陰部', '음부', 0),
+('部', '陰部', '음부', 1),
+('陰', '陰門', '음문', 0),
+('門', '陰門', '음문', 1),
+('陰', '陰陽', '음양', 0),
+('陽', '陰陽', '음양', 1),
+('陰', '陰電子', '음전자', 0),
+('電', '陰電子', '음전자', 1),
+('子', '陰電子', '음전자', 2),
+('陰', '陰鬱', '음울', 0),
+('鬱', '陰鬱', '음울', 1),
+('陳', '陳列', '진열', 0),
+('列', '陳列', '진열', 1),
+('陳', '陳列欌', '진열장', 0),
+('列', '陳列欌', '진열장', 1),
+('欌', '陳列欌', '진열장', 2),
+('陳', '陳情', '진정', 0),
+('情', '陳情', '진정', 1),
+('陳', '陳腐', '진부', 0),
+('腐', '陳腐', '진부', 1),
+('陳', '陳謝', '진사', 0),
+('謝', '陳謝', '진사', 1),
+('陳', '陳述', '진술', 0),
+('述', '陳述', '진술', 1),
+('陵', '陵虐', '능학', 0),
+('虐', '陵虐', '능학', 1),
+('陶', '陶器', '도기', 0),
+('器', '陶器', '도기', 1),
+('陶', '陶工', '도공', 0),
+('工', '陶工', '도공', 1),
+('陶', '陶瓷器', '도자기', 0),
+('瓷', '陶瓷器', '도자기', 1),
+('器', '陶瓷器', '도자기', 2),
+('陶', '陶藝', '도예', 0),
+('藝', '陶藝', '도예', 1),
+('陶', '陶藝家', '도예가', 0),
+('藝', '陶藝家', '도예가', 1),
+('家', '陶藝家', '도예가', 2),
+('陶', '陶醉', '도취', 0),
+('醉', '陶醉', '도취', 1),
+('陷', '陷入', '함입', 0),
+('入', '陷入', '함입', 1),
+('陷', '陷沒', '함몰', 0),
+('沒', '陷沒', '함몰', 1),
+('陷', '陷穽', '함정', 0),
+('穽', '陷穽', '함정', 1),
+('陷', '陷落', '함락', 0),
+('落', '陷落', '함락', 1),
+('陸', '陸', '육', 0),
+('陸', '陸上', '육상', 0),
+('上', '陸上', '육상', 1),
+('陸', '陸上 競技', '육상 경기', 0),
+('上', '陸上 競技', '육상 경기', 1),
+('競', '陸上 競技', '육상 경기', 3),
+('技', '陸上 競技', '육상 경기', 4),
+('陸', '陸上競技', '육상경기', 0),
+('上', '陸上競技', '육상경기', 1),
+('競', '陸上競技', '육상경기', 2),
+('技', '陸上競技', '육상경기', 3),
+('陸', '陸地', '륙지', 0),
+('地', '陸地', '륙지', 1),
+('陸', '陸地', '육지', 0),
+('地', '陸地', '육지', 1),
+('陸', '陸封', '육봉', 0),
+('封', '陸封', '육봉', 1),
+('陸', '陸橋', '육교', 0),
+('橋', '陸橋', '육교', 1),
+('陸', '陸海空', '육해공', 0),
+('海', '陸海空', '육해공', 1),
+('空', '陸海空', '육해공', 2),
+('陸', '陸軍', '륙군', 0),
+('軍', '陸軍', '륙군', 1),
+('陸', '陸軍', '육군', 0),
+('軍', '陸軍', '육군', 1),
+('陽', '陽', '양', 0),
+('陽', '陽傘', '양산', 0),
+('傘', '陽傘', '양산', 1),
+('陽', '陽光', '양광', 0),
+('光', '陽光', '양광', 1),
+('陽', '陽地', '양지', 0),
+('地', '陽地', '양지', 1),
+('陽', '陽報', '양보', 0),
+('報', '陽報', '양보', 1),
+('陽', '陽子', '양자', 0),
+('子', '陽子', '양자', 1),
+('陽', '陽性', '양성', 0),
+('性', '陽性', '양성', 1),
+('陽', '陽性子', '양성자', 0),
+('性', '陽性子', '양성자', 1),
+('子', '陽性子', '양성자', 2),
+('陽', '陽數', '양수', 0),
+('數', '陽數', '양수', 1),
+('陽', '陽曆', '양력', 0),
+('曆', '陽曆', '양력', 1),
+('陽', '陽極', '양극', 0),
+('極', '陽極', '양극', 1),
+('陽', '陽炎', '양염', 0),
+('炎', '陽炎', '양염', 1),
+('陽', '陽電子', '양전자', 0),
+('電', '陽電子', '양전자', 1),
+('子', '陽電子', '양전자', 2),
+('陽', '陽電氣', '양전기', 0),
+('電', '陽電氣', '양전기', 1),
+('氣', '陽電氣', '양전기', 2),
+('隆', '隆起', '융기', 0),
+('起', '隆起', '융기', 1),
+('隊', '隊', '대', 0),
+('隊', '隊員', '대원', 0),
+('員', '隊員', '대원', 1),
+('隊', '隊商', '대상', 0),
+('商', '隊商', '대상', 1),
+('隊', '隊長', '대장', 0),
+('長', '隊長', '대장', 1),
+('隋', '隋', '수', 0),
+('階', '階乘', '계승', 0),
+('乘', '階乘', '계승', 1),
+('階', '階層', '계층', 0),
+('層', '階層', '계층', 1),
+('階', '階段', '계단', 0),
+('段', '階段', '계단', 1),
+('階', '階級', '계급', 0),
+('級', '階級', '계급', 1),
+('階', '階級章', '계급장', 0),
+('級', '階級章', '계급장', 1),
+('章', '階級章', '계급장', 2),
+('隔', '隔週', '격주', 0),
+('週', '隔週', '격주', 1),
+('隔', '隔離', '격리', 0),
+('離', '隔離', '격리', 1),
+('隕', '隕石', '운석', 0),
+('石', '隕石', '운석', 1),
+('隘', '隘路', '애로', 0),
+('路', '隘路', '애로', 1),
+('際', '際限', '제한', 0),
+('限', '際限', '제한', 1),
+('障', '障壁', '장벽', 0),
+('壁', '障壁', '장벽', 1),
+('障', '障害', '장해', 0),
+('害', '障害', '장해', 1),
+('障', '障碍', '장애', 0),
+('碍', '障碍', '장애', 1),
+('障', '障碍人', '장애인', 0),
+('碍', '障碍人', '장애인', 1),
+('人', '障碍人', '장애인', 2),
+('障', '障碍物', '장애물', 0),
+('碍', '障碍物', '장애물', 1),
+('物', '障碍物', '장애물', 2),
+('障', '障礙', '장애', 0),
+('礙', '障礙', '장애', 1),
+('障', '障礙人', '장애인', 0),
+('礙', '障礙人', '장애인', 1),
+('人', '障礙人', '장애인', 2),
+('隣', '隣接', '인접', 0),
+('接', '隣接', '인접', 1),
+('隣', '隣近', '인근', 0),
+('近', '隣近', '인근', 1),
+('隧', '隧道', '수도', 0),
+('道', '隧道', '수도', 1),
+('隨', '隨一', '수일', 0),
+('一', '隨一', '수일', 1),
+('隨', '隨伴', '수반', 0),
+('伴', '隨伴', '수반', 1),
+('隨', '隨時', '수시', 0),
+('時', '隨時', '수시', 1),
+('隨', '隨時-', '수시로', 0),
+('時', '隨時-', '수시로', 1),
+('-', '隨時-', '수시로', 2),
+('隨', '隨筆', '수필', 0),
+('筆', '隨筆', '수필', 1),
+('隨', '隨筆集', '수필집', 0),
+('筆', '隨筆集', '수필집', 1),
+('集', '隨筆集', '수필집', 2),
+('隨', '隨行', '수행', 0),
+('行', '隨行', '수행', 1),
+('險', '險談', '험담', 0),
+('談', '險談', '험담', 1),
+('隱', '隱匿', '은닉', 0),
+('匿', '隱匿', '은닉', 1),
+('隱', '隱喩', '은유', 0),
+('喩', '隱喩', '은유', 1),
+('隱', '隱居', '은거', 0),
+('居', '隱居', '은거', 1),
+('隱', '隱者', '은자', 0),
+('者', '隱者', '은자', 1),
+('隱', '隱花果', '은화과', 0),
+('花', '隱花果', '은화과', 1),
+('果', '隱花果', '은화과', 2),
+('隱', '隱蔽', '은폐', 0),
+('蔽', '隱蔽', '은폐', 1),
+('隱', '隱語', '은어', 0),
+('語', '隱語', '은어', 1),
+('隱', '隱身', '은신', 0),
+('身', '隱身', '은신', 1),
+('隱', '隱身處', '은신처', 0),
+('身', '隱身處', '은신처', 1),
+('處', '隱身處', '은신처', 2),
+('隱', '隱退', '은퇴', 0),
+('退', '隱退', '은퇴', 1),
+('隱', '隱逸', '은일', 0),
+('逸', '隱逸', '은일', 1),
+('隱', '隱避', '은피', 0),
+('避', '隱避', '은피', 1),
+('隱', '隱隱', '은은', 0),
+('隱', '隱隱', '은은', 1),
+('隻', '隻', '척', 0),
+('雀', '雀躍', '작약', 0),
+('躍', '雀躍', '작약', 1),
+('雄', '雄壯', '웅장', 0),
+('壯', '雄壯', '웅장', 1),
+('雄', '雄大', '웅대', 0),
+('大', '雄大', '웅대', 1),
+('雄', '雄辯', '웅변', 0),
+('辯', '雄辯', '웅변', 1),
+('雅', '雅樂', '아악', 0),
+('樂', '雅樂', '아악', 1),
+('雅', '雅歌', '아가', 0),
+('歌', '雅歌', '아가', 1),
+('雅', '雅號', '아호', 0),
+('號', '雅號', '아호', 1),
+('雅', '雅量', '아량', 0),
+('量', '雅量', '아량', 1),
+('集', '集中', '집중', 0),
+('中', '集中', '집중', 1),
+('集', '集中力', '집중력', 0),
+('中', '集中力', '집중력', 1),
+('力', '集中力', '집중력', 2),
+('集', '集合', '집합', 0),
+('合', '集合', '집합', 1),
+('集', '集合名詞', '집합명사', 0),
+('合', '集合名詞', '집합명사', 1),
+('名', '集合名詞', '집합명사', 2),
+('詞', '集合名詞', '집합명사', 3),
+('集', '集團', '집단', 0),
+('團', '集團', '집단', 1),
+('集', '集團化', '집단화', 0),
+('團', '集團化', '집단화', 1),
+('化', '集團化', '집단화', 2),
+('集', '集團殺害', '집단살해', 0),
+('團', '集團殺害', '집단살해', 1),
+('殺', '集團殺害', '집단살해', 2),
+('害', '集團殺害', '집단살해', 3),
+('集', '集團虐殺', '집단학살', 0),
+('團', '集團虐殺', '집단학살', 1),
+('虐', '集團虐殺', '집단학살', 2),
+('殺', '集團虐殺', '집단학살', 3),
+('集', '集姓村', '집성촌', 0),
+('姓', '集姓村', '집성촌', 1),
+('村', '集姓村', '집성촌', 2),
+('集', '集成', '집성', 0),
+('成', '集成', '집성', 1),
+('集', '集會', '집회', 0),
+('會', '集會', '집회', 1),
+('集', '集會書', '집회서', 0),
+('會', '集會書', '집회서', 1),
+('書', '集會書', '집회서', 2),
+('集', '集積', '집적', 0),
+('積', '集積', '집적', 1),
+('集', '集約的', '집약적', 0),
+('約', '集約的', '집약적', 1),
+('的', '集約的', '집약적', 2),
+('集', '集結', '집결', 0),
+('結', '集結', '집결', 1),
+('集', '集落', '집락', 0),
+('落', '集落', '집락', 1),
+('集', '集計', '집계', 0),
+('計', '集計', '집계', 1),
+('集', '集配', '집배', 0),
+('配', '集配', '집배', 1),
+('集', '集配員', '집배원', 0),
+('配', '集配員', '집배원', 1),
+('員', '集配員', '집배원', 2),
+('集', '集電裝置', '집전장치', 0),
+('電', '集電裝置', '집전장치', 1),
+('裝', '集電裝置', '집전장치', 2),
+('置', '集電裝置', '집전장치', 3),
+('集', '集體', '집체', 0),
+('體', '集體', '집체', 1),
+('雇', '雇傭', '고용', 0),
+('傭', '雇傭', '고용', 1),
+('雇', '雇用', '고용', 0),
+('用', '雇用', '고용', 1),
+('雇', '雇用主', '고용주', 0),
+('用', '雇用主', '고용주', 1),
+('主', '雇用主', '고용주', 2),
+('雌', '雌蕊', '자예', 0),
+('蕊', '雌蕊', '자예', 1),
+('雙', '雙', '쌍', 0),
+('雙', '雙--', '쌍둥이', 0),
+('-', '雙--', '쌍둥이', 1),
+('-', '雙--', '쌍둥이', 2),
+('雙', '雙六', '쌍륙', 0),
+('六', '雙六', '쌍륙', 1),
+('雙', '雙半點', '쌍반점', 0),
+('半', '雙半點', '쌍반점', 1),
+('點', '雙半點', '쌍반점', 2),
+('雙', '雙峰駱駝', '쌍봉낙타', 0),
+('峰', '雙峰駱駝', '쌍봉낙타', 1),
+('駱', '雙峰駱駝', '쌍봉낙타', 2),
+('駝', '雙峰駱駝', '쌍봉낙타', 3),
+('雙', '雙截棍', '쌍절곤', 0),
+('截', '雙截棍', '쌍절곤', 1),
+('棍', '雙截棍', '쌍절곤', 2),
+('雙', '雙方', '쌍방', 0),
+('方', '雙方', '쌍방', 1),
+('雙', '雙晶', '쌍정', 0),
+('晶', '雙晶', '쌍정', 1),
+('雙', '雙曲線', '쌍곡선', 0),
+('曲', '雙曲線', '쌍곡선', 1),
+('線', '雙曲線', '쌍곡선', 2),
+('雙', '雙璧', '쌍벽', 0),
+('璧', '雙璧', '쌍벽', 1),
+('雙', '雙眼鏡', '쌍안경', 0),
+('眼', '雙眼鏡', '쌍안경', 1),
+('鏡', '雙眼鏡', '쌍안경', 2),
+('雙', '雙親', '쌍친', 0),
+('親', '雙親', '쌍친', 1),
+('雙', '雙頭', '쌍두', 0),
+('頭', '雙頭', '쌍두', 1),
+('雙', '雙點', '쌍점', 0),
+('點', '雙點', '쌍점', 1),
+('雜', '雜交配', '자고배', 0),
+('交', '雜交配', '자고배', 1),
+('配', '雜交配', '자고배', 2),
+('雜', '雜像', '잡상', 0),
+('像', '雜像', '잡상', 1),
+('雜', '雜商', '잡상', 0),
+('商', '雜商', '잡상', 1),
+('雜', '雜技', '잡기', 0),
+('技', '雜技', '잡기', 1),
+('雜', '雜木', '잡목', 0),
+('木', '雜木', '잡목', 1),
+('雜', '雜神', '잡신', 0),
+('神', '雜神', '잡신', 1),
+('雜', '雜種', '잡종', 0),
+('種', '雜種', '잡종', 1),
+('雜', '雜種犬', '잡종견', 0),
+('種', '雜種犬', '잡종견', 1),
+('犬', '雜種犬', '잡종견', 2),
+('雜', '雜穀', '잡곡', 0),
+('穀', '雜穀', '잡곡', 1),
+('雜', '雜穀—', '잡곡밥', 0),
+('穀', '雜穀—', '잡곡밥', 1),
+('—', '雜穀—', '잡곡밥', 2),
+('雜', '雜草', '잡초', 0),
+('草', '雜草', '잡초', 1),
+('雜', '雜菜', '잡채', 0),
+('菜', '雜菜', '잡채', 1),
+('雜', '雜言', '잡언', 0),
+('言', '雜言', '잡언', 1),
+('雜', '雜誌', '잡지', 0),
+('誌', '雜誌', '잡지', 1),
+('雜', '雜談', '잡담', 0),
+('談', '雜談', '잡담', 1),
+('雜', '雜貨', '잡화', 0),
+('貨', '雜貨', '잡화', 1),
+('雜', '雜食 動物', '잡식 동물', 0),
+('食', '雜食 動物', '잡식 동물', 1),
+('動', '雜食 動物', '잡식 동물', 3),
+('物', '雜食 動物', '잡식 동물', 4),
+('離', '離乳', '리유', 0),
+('乳', '離乳', '리유', 1),
+('離', '離乳', '이유', 0),
+('乳', '離乳', '이유', 1),
+('離', '離別', '이별', 0),
+('別', '離別', '이별', 1),
+('離', '離反', '이반', 0),
+('反', '離反', '이반', 1),
+('離', '離婚', '이혼', 0),
+('婚', '離婚', '이혼', 1),
+('離', '離脫', '이탈', 0),
+('脫', '離脫', '이탈', 1),
+('離', '離調', '이조', 0),
+('調', '離調', '이조', 1),
+('離', '離間', '이간', 0),
+('間', '離間', '이간', 1),
+('離', '離間질', '이간질', 0),
+('間', '離間질', '이간질', 1),
+('질', '離間질', '이간질', 2),
+('離', '離陸', '이륙', 0),
+('陸', '離陸', '이륙', 1),
+('難', '難問', '난문', 0),
+('問', '難問', '난문', 1),
+('難', '難攻不落', '난공불락', 0),
+('攻', '難攻不落', '난공불락', 1),
+('不', '難攻不落', '난공불락', 2),
+('落', '難攻不落', '난공불락', 3),
+('難', '難文', '난문', 0),
+('文', '難文', '난문', 1),
+('難', '難民', '난민', 0),
+('民', '難民', '난민', 1),
+('難', '難治', '난치', 0),
+('治', '難治', '난치', 1),
+('難', '難讀症', '난독증', 0),
+('讀', '難讀症', '난독증', 1),
+('症', '難讀症', '난독증', 2),
+('難', '難關', '난관', 0),
+('關', '難關', '난관', 1),
+('難', '難題', '난제', 0),
+('題', '難題', '난제', 1),
+('雨', '雨傘', '우산', 0),
+('傘', '雨傘', '우산', 1),
+('雨', '雨期', '우기', 0),
+('期', '雨期', '우기', 1),
+('雨', '雨林', '우림', 0),
+('林', '雨林', '우림', 1),
+('雨', '雨水', '우수', 0),
+('水', '雨水', '우수', 1),
+('雨', '雨氷', '우빙', 0),
+('氷', '雨氷', '우빙', 1),
+('雨', '雨滴', '우적', 0),
+('滴', '雨滴', '우적', 1),
+('雨', '雨衣', '우의', 0),
+('衣', '雨衣', '우의', 1),
+('雨', '雨量計', '우량계', 0),
+('量', '雨量計', '우량계', 1),
+('計', '雨量計', '우량계', 2),
+('雨', '雨雪', '우설', 0),
+('雪', '雨雪', '우설', 1),
+('雨', '雨雹', '우박', 0),
+('雹', '雨雹', '우박', 1),
+('雨', '雨露', '우로', 0),
+('露', '雨露', '우로', 1),
+('雪', '雪上加霜', '설상가상', 0),
+('上', '雪上加霜', '설상가상', 1),
+('加', '雪上加霜', '설상가상', 2),
+('霜', '雪上加霜', '설상가상', 3),
+('雪', '雪人', '설인', 0),
+('人', '雪人', '설인', 1),
+('雪', '雪原', '설원', 0),
+('原', '雪原', '설원', 1),
+('雪', '雪山', '설산', 0),
+('山', '雪山', '설산', 1),
+('雪', '雪嶽山', '설악산', 0),
+('嶽', '雪嶽山', '설악산', 1),
+('山', '雪嶽山', '설악산', 2),
+('雪', '雪濃湯', '설농탕', 0),
+('濃', '雪濃湯', '설농탕', 1),
+('湯', '雪濃湯', '설농탕', 2),
+('雪', '雪糖', '설탕', 0),
+('糖', '雪糖', '설탕', 1),
+('雪', '雪花', '설화', 0),
+('花', '雪花', '설화', 1),
+('雰', '雰圍氣', '분위기', 0),
+('圍', '雰圍氣', '분위기', 1),
+('氣', '雰圍氣', '분위기', 2),
+('雲', '雲劍', '운검', 0),
+('劍', '雲劍', '운검', 1),
+('雲', '雲半', '운반', 0),
+('半', '雲半', '운반', 1),
+('雲', '雲南', '운남', 0),
+('南', '雲南', '운남', 1),
+('雲', '雲岫', '운수', 0),
+('岫', '雲岫', '운수', 1),
+('雲', '雲樹', '운수', 0),
+('樹', '雲樹', '운수', 1),
+('雲', '雲母', '운모', 0),
+('母', '雲母', '운모', 1),
+('雲', '雲水', '운수', 0),
+('水', '雲水', '운수', 1),
+('雲', '雲羅', '운라', 0),
+('羅', '雲羅', '운라', 1),
+('雲', '雲鑼', '운라', 0),
+('鑼', '雲鑼', '운라', 1),
+('雲', '雲霧林', '운무림', 0),
+('霧', '雲霧林', '운무림', 1),
+('林', '雲霧林', '운무림', 2),
+('雲', '雲靉', '운애', 0),
+('靉', '雲靉', '운애', 1),
+('零', '零下', '영하', 0),
+('下', '零下', '영하', 1),
+('零', '零個  國', '0개 국어', 0),
+('個', '零個  國', '0개 국어', 1),
+('國', '零個  國', '0개 국어', 4),
+('零', '零本', '영본', 0),
+('本', '零本', '영본', 1),
+('零', '零派生', '영파생', 0),
+('派', '零派生', '영파생', 1),
+('生', '零派生', '영파생', 2),
+('零', '零落', '영락', 0),
+('落', '零落', '영락', 1),
+('零', '零點', '영점', 0),
+('點', '零點', '영점', 1),
+('雷', '雷擊', '뇌격', 0),
+('擊', '雷擊', '뇌격', 1),
+('雷', '雷管', '뇌관', 0),
+('管', '雷管', '뇌관', 1),
+('雷', '雷酸', '뇌산', 0),
+('酸', '雷酸', '뇌산', 1),
+('雷', '雷雨', '뇌우', 0),
+('雨', '雷雨', '뇌우', 1),
+('雷', '雷鳥', '뇌조', 0),
+('鳥', '雷鳥', '뇌조', 1),
+('雷', '雷鳴', '뇌명', 0),
+('鳴', '雷鳴', '뇌명', 1),
+('電', '電信', '전신', 0),
+('信', '電信', '전신', 1),
+('電', '電信케블', '전신케블', 0),
+('信', '電信케블', '전신케블', 1),
+('케', '電信케블', '전신케블', 2),
+('블', '電信케블', '전신케블', 3),
+('電', '電光', '전광', 0),
+('光', '電光', '전광', 1),
+('電', '電光板', '전광판', 0),
+('光', '電光板', '전광판', 1),
+('板', '電光板', '전광판', 2),
+('電', '電力', '전력', 0),
+('力', '電力', '전력', 1),
+('電', '電動', '전동', 0),
+('動', '電動', '전동', 1),
+('電', '電化', '전화', 0),
+('化', '電化', '전화', 1),
+('電', '電報', '전보', 0),
+('報', '電報', '전보', 1),
+('電', '電壓', '전압', 0),
+('壓', '電壓', '전압', 1),
+('電', '電子', '전자', 0),
+('子', '電子', '전자', 1),
+('電', '電子冊', '전자책', 0),
+('子', '電子冊', '전자책', 1),
+('冊', '電子冊', '전자책', 2),
+('電', '電子娛樂', '전자오락', 0),
+('子', '電子娛樂', '전자오락', 1),
+('娛', '電子娛樂', '전자오락', 2),
+('樂', '電子娛樂', '전자오락', 3),
+('電', '電子工學', '전자공학', 0),
+('子', '電子工學', '전자공학', 1),
+('工', '電子工學', '전자공학', 2),
+('學', '電子工學', '전자공학', 3),
+('電', '電子揭示板', '전자게시판', 0),
+('子', '電子揭示板', '전자게시판', 1),
+('揭', '電子揭示板', '전자게시판', 2),
+('示', '電子揭示板', '전자게시판', 3),
+('板', '電子揭示板', '전자게시판', 4),
+('電', '電子書籍', '전자서적', 0),
+('子', '電子書籍', '전자서적', 1),
+('書', '電子書籍', '전자서적', 2),
+('籍', '電子書籍', '전자서적', 3),
+('電', '電子計算機', '전자계산기', 0),
+('子', '電子計算機', '전자계산기', 1),
+('計', '電子計算機', '전자계산기', 2),
+('算', '電子計算機', '전자계산기', 3),
+('機', '電子計算機', '전자계산기', 4),
+('電', '電子郵便', '전자우편', 0),
+('子', '電子郵便', '전자우편', 1),
+('郵', '電子郵便', '전자우편', 2),
+('便', '電子郵便', '전자우편', 3),
+('電', '電子가마', '전자가마', 0),
+('子', '電子가마', '전자가마', 1),
+('가', '電子가마', '전자가마', 2),
+('마', '電子가마', '전자가마', 3),
+('電', '電子레인지', '전자레인지', 0),
+('子', '電子레인지', '전자레인지', 1),
+('레', '電子레인지', '전자레인지', 2),
+('인', '電子레인지', '전자레인지', 3),
+('지', '電子레인지', '전자레인지', 4),
+('電', '電工', '전공', 0),
+('工', '電工', '전공', 1),
+('電', '電擊戰', '전격전', 0),
+('擊', '電擊戰', '전격전', 1),
+('戰', '電擊戰', '전격전', 2),
+('電', '電文', '전문', 0),
+('文', '電文', '전문', 1),
+('電', '電極', '전극', 0),
+('極', '電極', '전극', 1),
+('電', '電氣', '전기', 0),
+('氣', '電氣', '전기', 1),
+('電', '電氣工學', '전기공학', 0),
+('氣', '電氣工學', '전기공학', 1),
+('工', '電氣工學', '전기공학', 2),
+('學', '電氣工學', '전기공학', 3),
+('電', '電氣椅子', '전기의자', 0),
+('氣', '電氣椅子', '전기의자', 1),
+('椅', '電氣椅子', '전기의자', 2),
+('子', '電氣椅子', '전기의자', 3),
+('電', '電氣石', '전기석', 0),
+('氣', '電氣石', '전기석', 1),
+('石', '電氣石', '전기석', 2),
+('電', '電氣綜合樂器', '전기종합악기', 0),
+('氣', '電氣綜合樂器', '전기종합악기', 1),
+('綜', '電氣綜合樂器', '전기종합악기', 2),
+('合', '電氣綜合樂器', '전기종합악기', 3),
+('樂', '電氣綜合樂器', '전기종합악기', 4),
+('器', '電氣綜合樂器', '전기종합악기', 5),
+('電', '電氣自動車', '전기자동차', 0),
+('氣', '電氣自動車', '전기자동차', 1),
+('自', '電氣自動車', '전기자동차', 2),
+('動', '電氣自動車', '전기자동차', 3),
+('車', '電氣自動車', '전기자동차', 4),
+('電', '電氣通信士', '전기통신사', 0),
+('氣', '電氣通信士', '전기통신사', 1),
+('通', '電氣通信士', '전기통신사', 2),
+('信', '電氣通信士', '전기통신사', 3),
+('士', '電氣通信士', '전기통신사', 4),
+('電', '電氣面刀器', '전기면도기', 0),
+('氣', '電氣面刀器', '전기면도기', 1),
+('面', '電氣面刀器', '전기면도기', 2),
+('刀', '電氣面刀器', '전기면도기', 3),
+('器', '電氣面刀器', '전기면도기', 4),
+('電', '電池', '전지', 0),
+('池', '電池', '전지', 1),
+('電', '電波', '전파', 0),
+('波', '電波', '전파', 1),
+('電', '電波 探知機', '전파 탐지기', 0),
+('波', '電波 探知機', '전파 탐지기', 1),
+('探', '電波 探知機', '전파 탐지기', 3),
+('知', '電波 探知機', '전파 탐지기', 4),
+('機', '電波 探知機', '전파 탐지기', 5),
+('電', '電流', '전류', 0),
+('流', '電流', '전류', 1),
+('電', '電源', '전원', 0),
+('源', '電源', '전원', 1),
+('電', '電燈', '전등', 0),
+('燈', '電燈', '전등', 1),
+('電', '電球', '전구', 0),
+('球', '電球', '전구', 1),
+('電', '電番', '전번', 0),
+('番', '電番', '전번', 1),
+('電', '電磁', '전자', 0),
+('磁', '電磁', '전자', 1),
+('電', '電磁氣', '전자기', 0),
+('磁', '電磁氣', '전자기', 1),
+('氣', '電磁氣', '전자기', 2),
+('電', '電磁氣波', '전자기파', 0),
+('磁', '電磁氣波', '전자기파', 1),
+('氣', '電磁氣波', '전자기파', 2),
+('波', '電磁氣波', '전자기파', 3),
+('電', '電線', '전선', 0),
+('線', '電線', '전선', 1),
+('電', '電荷', '전하', 0),
+('荷', '電荷', '전하', 1),
+('電', '電視', '땐스', 0),
+('視', '電視', '땐스', 1),
+('電', '電解', '전해', 0),
+('解', '電解', '전해', 1),
+('電', '電話', '전화', 0),
+('話', '電話', '전화', 1),
+('電', '電話機', '전화기', 0),
+('話', '電話機', '전화기', 1),
+('機', '電話機', '전화기', 2),
+('電', '電話番號', '전화번호', 0),
+('話', '電話番號', '전화번호', 1),
+('番', '電話番號', '전화번호', 2),
+('號', '電話番號', '전화번호', 3),
+('電', '電話費', '전화비', 0),
+('話', '電話費', '전화비', 1),
+('費', '電話費', '전화비', 2),
+('電', '電車', '전차', 0),
+('車', '電車', '전차', 1),
+('電', '電鈴', '전령', 0),
+('鈴', '電鈴', '전령', 1),
+('電', '電鐵', '전철', 0),
+('鐵', '電鐵', '전철', 1),
+('電', '電離', '전리', 0),
+('離', '電離', '전리', 1),
+('電', '電離層', '전리층', 0),
+('離', '電離層', '전리층', 1),
+('層', '電離層', '전리층', 2),
+('需', '需要', '수요', 0),
+('要', '需要', '수요', 1),
+('震', '震動', '진동', 0),
+('動', '震動', '진동', 1),
+('震', '震央', '진앙', 0),
+('央', '震央', '진앙', 1),
+('震', '震源地', '진원지', 0),
+('源', '震源地', '진원지', 1),
+('地', '震源地', '진원지', 2),
+('霜', '霜降', '상강', 0),
+('降', '霜降', '상강', 1),
+('霧', '霧氷', '무빙', 0),
+('氷', '霧氷', '무빙', 1),
+('霰', '霰彈', '산탄', 0),
+('彈', '霰彈', '산탄', 1),
+('露', '露出', '노출', 0),
+('出', '露出', '노출', 1),
+('露', '露出症', '노출증', 0),
+('出', '露出症', '노출증', 1),
+('症', '露出症', '노출증', 2),
+('露', '露國', '노국', 0),
+('國', '露國', '노국', 1),
+('露', '露國', '로국', 0),
+('國', '露國', '로국', 1),
+('露', '露天', '노천', 0),
+('天', '露天', '노천', 1),
+('露', '露天', '로천', 0),
+('天', '露天', '로천', 1),
+('露', '露天鑛', '노천광', 0),
+('天', '露天鑛', '노천광', 1),
+('鑛', '露天鑛', '노천광', 2),
+('露', '露宿', '노숙', 0),
+('宿', '露宿', '노숙', 1),
+('露', '露宿者', '노숙자', 0),
+('宿', '露宿者', '노숙자', 1),
+('者', '露宿者', '노숙자', 2),
+('露', '露店', '노점', 0),
+('店', '露店', '노점', 1),
+('露', '露營', '노영', 0),
+('營', '露營', '노영', 1),
+('露', '露西亞', '노서아', 0),
+('西', '露西亞', '노서아', 1),
+('亞', '露西亞', '노서아', 2),
+('露', '露西亞', '로서아', 0),
+('西', '露西亞', '로서아', 1),
+('亞', '露西亞', '로서아', 2),
+('露', '露語', '노어', 0),
+('語', '露語', '노어', 1),
+('露', '露語', '로어', 0),
+('語', '露語', '로어', 1),
+('露', '露霜', '노상', 0),
+('霜', '露霜', '노상', 1),
+('露', '露點', '노점', 0),
+('點', '露點', '노점', 1),
+('霹', '霹', '벽', 0),
+('霹', '霹靂', '벽력', 0),
+('靂', '霹靂', '벽력', 1),
+('靈', '靈', '영', 0),
+('靈', '靈安室', '영안실', 0),
+('安', '靈安室', '영안실', 1),
+('室', '靈安室', '영안실', 2),
+('靈', '靈廟', '영묘', 0),
+('廟', '靈廟', '영묘', 1),
+('靈', '靈性', '영성', 0),
+('性', '靈性', '영성', 1),
+('靈', '靈感', '영감', 0),
+('感', '靈感', '영감', 1),
+('靈', '靈柩', '영구', 0),
+('柩', '靈柩', '영구', 1),
+('靈', '靈柩車', '영구차', 0),
+('柩', '靈柩車', '영구차', 1),
+('車', '靈柩車', '영구차', 2),
+('靈', '靈氣', '영기', 0),
+('氣', '靈氣', '영기', 1),
+('靈', '靈的', '영적', 0),
+('的', '靈的', '영적', 1),
+('靈', '靈芝', '영지', 0),
+('芝', '靈芝', '영지', 1),
+('靈', '靈藥', '영약', 0),
+('藥', '靈藥', '영약', 1),
+('靈', '靈長類', '영장류', 0),
+('長', '靈長類', '영장류', 1),
+('類', '靈長類', '영장류', 2),
+('靈', '靈驗', '영험', 0),
+('驗', '靈驗', '영험', 1),
+('靈', '靈魂', '영혼', 0),
+('魂', '靈魂', '영혼', 1),
+('靑', '靑--', '청바지', 0),
+('-', '靑--', '청바지', 1),
+('-', '靑--', '청바지', 2),
+('靑', '靑丘', '청구', 0),
+('丘', '靑丘', '청구', 1),
+('靑', '靑信號', '청신호', 0),
+('信', '靑信號', '청신호', 1),
+('號', '靑信號', '청신호', 2),
+('靑', '靑南方', '청남방', 0),
+('南', '靑南方', '청남방', 1),
+('方', '靑南方', '청남방', 2),
+('靑', '靑天霹靂', '청천벽력', 0),
+('天', '靑天霹靂', '청천벽력', 1),
+('霹', '靑天霹靂', '청천벽력', 2),
+('靂', '靑天霹靂', '청천벽력', 3),
+('靑', '靑寫眞', '청사진', 0),
+('寫', '靑寫眞', '청사진', 1),
+('眞', '靑寫眞', '청사진', 2),
+('靑', '靑少年', '청소년', 0),
+('少', '靑少年', '청소년', 1),
+('年', '靑少年', '청소년', 2),
+('靑', '靑山', '청산', 0),
+('山', '靑山', '청산', 1),
+('靑', '靑島', '청도', 0),
+('島', '靑島', '청도', 1),
+('靑', '靑年', '청년', 0),
+('年', '靑年', '청년', 1),
+('靑', '靑春', '청춘', 0),
+('春', '靑春', '청춘', 1),
+('靑', '靑玉', '청옥', 0),
+('玉', '靑玉', '청옥', 1),
+('靑', '靑瓦臺', '청와대', 0),
+('瓦', '靑瓦臺', '청와대', 1),
+('臺', '靑瓦臺', '청와대', 2),
+('靑', '靑空', '청공', 0),
+('空', '靑空', '청공', 1),
+('靑', '靑色', '청색', 0),
+('色', '靑色', '청색', 1),
+('靑', '靑菜', '청채', 0),
+('菜', '靑菜', '청채', 1),
+('靑', '靑葡萄', '청포도', 0),
+('葡', '靑葡萄', '청포도', 1),
+('萄', '靑葡萄', '청포도', 2),
+('靑', '靑蛙', '청와', 0),
+('蛙', '靑蛙', '청와', 1),
+('靑', '靑角', '청각', 0),
+('角', '靑角', '청각', 1),
+('靑', '靑酸', '청산', 0),
+('酸', '靑酸', '청산', 1),
+('靑', '靑酸加里', '청산가리', 0),
+('酸', '靑酸加里', '청산가리', 1),
+('加', '靑酸加里', '청산가리', 2),
+('里', '靑酸加里', '청산가리', 3),
+('靑', '靑金石', '청금석', 0),
+('金', '靑金石', '청금석', 1),
+('石', '靑金石', '청금석', 2),
+('靑', '靑鉛石', '청연석', 0),
+('鉛', '靑鉛石', '청연석', 1),
+('石', '靑鉛石', '청연석', 2),
+('靑', '靑鉛鑛', '청연광', 0),
+('鉛', '靑鉛鑛', '청연광', 1),
+('鑛', '靑鉛鑛', '청연광', 2),
+('靑', '靑銅', '청동', 0),
+('銅', '靑銅', '청동', 1),
+('靑', '靑銅器 時代', '청동기 시대', 0),
+('銅', '靑銅器 時代', '청동기 시대', 1),
+('器', '靑銅器 時代', '청동기 시대', 2),
+('時', '靑銅器 時代', '청동기 시대', 4),
+('代', '靑銅器 時代', '청동기 시대', 5),
+('靑', '靑陽', '청양', 0),
+('陽', '靑陽', '청양', 1),
+('靑', '靑魚', '청어', 0),
+('魚', '靑魚', '청어', 1),
+('靑', '靑머리오리', '청머리오리', 0),
+('머', '靑머리오리', '청머리오리', 1),
+('리', '靑머리오리', '청머리오리', 2),
+('오', '靑머리오리', '청머리오리', 3),
+('리', '靑머리오리', '청머리오리', 4),
+('青', '青少年', '청소년', 0),
+('少', '青少年', '청소년', 1),
+('年', '青少年', '청소년', 2),
+('青', '青年', '청년', 0),
+('年', '青年', '청년', 1),
+('青', '青春', '청춘', 0),
+('春', '青春', '청춘', 1),
+('青', '青梅', '청매', 0),
+('梅', '青梅', '청매', 1),
+('青', '青海', '청해', 0),
+('海', '青海', '청해', 1),
+('青', '青金石', '청금석', 0),
+('金', '青金石', '청금석', 1),
+('石', '青金石', '청금석', 2),
+('靚', '靚飾', '정식', 0),
+('飾', '靚飾', '정식', 1),
+('靜', '靜力學', '정역학', 0),
+('力', '靜力學', '정역학', 1),
+('學', '靜力學', '정역학', 2),
+('靜', '靜息', '정식', 0),
+('息', '靜息', '정식', 1),
+('靜', '靜止', '정지', 0),
+('止', '靜止', '정지', 1),
+('靜', '靜物畵', '정물화', 0),
+('物', '靜物畵', '정물화', 1),
+('畵', '靜物畵', '정물화', 2),
+('靜', '靜脈', '정맥', 0),
+('脈', '靜脈', '정맥', 1),
+('靜', '靜電氣', '정전기', 0),
+('電', '靜電氣', '정전기', 1),
+('氣', '靜電氣', '정전기', 2),
+('非', '非上場 株式', '비상장 주식', 0),
+('上', '非上場 株式', '비상장 주식', 1),
+('場', '非上場 株式', '비상장 주식', 2),
+('株', '非上場 株式', '비상장 주식', 4),
+('式', '非上場 株式', '비상장 주식', 5),
+('非', '非人道的', '비인도적', 0),
+('人', '非人道的', '비인도적', 1),
+('道', '非人道的', '비인도적', 2),
+('的', '非人道的', '비인도적', 3),
+('非', '非但', '비단', 0),
+('但', '非但', '비단', 1),
+('非', '非凡', '비범', 0),
+('凡', '非凡', '비범', 1),
+('非', '非對稱', '비대칭', 0),
+('對', '非對稱', '비대칭', 1),
+('稱', '非對稱', '비대칭', 2),
+('非', '非常', '비상', 0),
+('常', '非常', '비상', 1),
+('非', '非常事態', '비상사태', 0),
+('常', '非常事態', '비상사태', 1),
+('事', '非常事態', '비상사태', 2),
+('態', '非常事態', '비상사태', 3),
+('非', '非常事態宣言', '비상사태선언', 0),
+('常', '非常事態宣言', '비상사태선언', 1),
+('事', '非常事態宣言', '비상사태선언', 2),
+('態', '非常事態宣言', '비상사태선언', 3),
+('宣', '非常事態宣言', '비상사태선언', 4),
+('言', '非常事態宣言', '비상사태선언', 5),
+('非', '非常口', '비상구', 0),
+('常', '非常口', '비상구', 1),
+('口', '非常口', '비상구', 2),
+('非', '非戰鬪員', '비전투원', 0),
+('戰', '非戰鬪員', '비전투원', 1),
+('鬪', '非戰鬪員', '비전투원', 2),
+('員', '非戰鬪員', '비전투원', 3),
+('非', '非暴力', '비폭력', 0),
+('暴', '非暴力', '비폭력', 1),
+('力', '非暴力', '비폭력', 2),
+('非', '非核化', '비핵화', 0),
+('核', '非核化', '비핵화', 1),
+('化', '非核化', '비핵화', 2),
+('非', '非營利', '비영리', 0),
+('營', '非營利', '비영리', 1),
+('利', '非營利', '비영리', 2),
+('非', '非營利團體', '비영리단체', 0),
+('營', '非營利團體', '비영리단체', 1),
+('利', '非營利團體', '비영리단체', 2),
+('團', '非營利團體', '비영리단체', 3),
+('體', '非營利團體', '비영리단체', 4),
+('非', '非營利的', '비영리적', 0),
+('營', '非營利的', '비영리적', 1),
+('利', '非營利的', '비영리적', 2),
+('的', '非營利的', '비영리적', 3),
+('非', '非番', '비번', 0),
+('番', '非番', '비번', 1),
+('非', '非行', '비행', 0),
+('行', '非行', '비행', 1),
+('非', '非論理的', '비논리적', 0),
+('論', '非論理的', '비논리적', 1),
+('理', '非論理的', '비논리적', 2),
+('的', '非論理的', '비논리적', 3),
+('非', '非軍事化', '비군사화', 0),
+('軍', '非軍事化', '비군사화', 1),
+('事', '非軍事化', '비군사화', 2),
+('化', '非軍事化', '비군사화', 3),
+('非', '非道', '비도', 0),
+('道', '非道', '비도', 1),
+('非', '非難', '비난', 0),
+('難', '非難', '비난', 1),
+('非', '非難者', '비난자', 0),
+('難', '非難者', '비난자', 1),
+('者', '非難者', '비난자', 2),
+('面', '面', '면', 0),
+('面', '面刀', '면도', 0),
+('刀', '面刀', '면도', 1),
+('面', '面刀器', '면도기', 0),
+('刀', '面刀器', '면도기', 1),
+('器', '面刀器', '면도기', 2),
+('面', '面前', '면전', 0),
+('前', '面前', '면전', 1),
+('面', '面接', '면접', 0),
+('接', '面接', '면접', 1),
+('面', '面接官', '면접관', 0),
+('接', '面接官', '면접관', 1),
+('官', '面接官', '면접관', 2),
+('面', '面目', '면목', 0),
+('目', '面目', '면목', 1),
+('面', '面積', '면적', 0),
+('積', '面積', '면적', 1),
+('面', '面談', '면담', 0),
+('談', '面談', '면담', 1),
+('面', '面識', '면식', 0),
+('識', '面識', '면식', 1),
+('面', '面貌', '면모', 0),
+('貌', '面貌', '면모', 1),
+('面', '面面', '면면', 0),
+('面', '面面', '면면', 1),
+('革', '革命', '혁명', 0),
+('命', '革命', '혁명', 1),
+('革', '革命家', '혁명가', 0),
+('命', '革命家', '혁명가', 1),
+('家', '革命家', '혁명가', 2),
+('革', '革命歌劇', '혁명가극', 0),
+('命', '革命歌劇', '혁명가극', 1),
+('歌', '革命歌劇', '혁명가극', 2),
+('劇', '革命歌劇', '혁명가극', 3),
+('革', '革新', '혁신', 0),
+('新', '革新', '혁신', 1),
+('革', '革新家', '혁신가', 0),
+('新', '革新家', '혁신가', 1),
+('家', '革新家', '혁신가', 2),
+('靭', '靭帶', '인대', 0),
+('帶', '靭帶', '인대', 1),
+('鞍', '鞍裝', '안장', 0),
+('裝', '鞍裝', '안장', 1),
+('鞭', '鞭毛', '편모', 0),
+('毛', '鞭毛', '편모', 1),
+('韓', '韓', '한', 0),
+('韓', '韓中', '한중', 0),
+('中', '韓中', '한중', 1),
+('韓', '韓人', '한인', 0),
+('人', '韓人', '한인', 1),
+('韓', '韓人會', '한인회', 0),
+('人', '韓人會', '한인회', 1),
+('會', '韓人會', '한인회', 2),
+('韓', '韓半島', '한반도', 0),
+('半', '韓半島', '한반도', 1),
+('島', '韓半島', '한반도', 2),
+('韓', '韓國', '한국', 0),
+('國', '韓國', '한국', 1),
+('韓', '韓國—', '한국말', 0),
+('國', '韓國—', '한국말', 1),
+('—', '韓國—', '한국말', 2),
+('韓', '韓國人', '한국인', 0),
+('國', '韓國人', '한국인', 1),
+('人', '韓國人', '한국인', 2),
+('韓', '韓國學', '한국학', 0),
+('國', '韓國學', '한국학', 1),
+('學', '韓國學', '한국학', 2),
+('韓', '韓國戰爭', '한국전쟁', 0),
+('國', '韓國戰爭', '한국전쟁', 1),
+('戰', '韓國戰爭', '한국전쟁', 2),
+('爭', '韓國戰爭', '한국전쟁', 3),
+('韓', '韓國語', '한국어', 0),
+('國', '韓國語', '한국어', 1),
+('語', '韓國語', '한국어', 2),
+('韓', '韓屋', '한옥', 0),
+('屋', '韓屋', '한옥', 1),
+('韓', '韓族', '한족', 0),
+('族', '韓族', '한족', 1),
+('韓', '韓服', '한복', 0),
+('服', '韓服', '한복', 1),
+('韓', '韓本語', '한본어', 0),
+('本', '韓本語', '한본어', 1),
+('語', '韓本語', '한본어', 2),
+('韓', '韓民族', '한민족', 0),
+('民', '韓民族', '한민족', 1),
+('族', '韓民族', '한민족', 2),
+('韓', '韓流', '한류', 0),
+('流', '韓流', '한류', 1),
+('韓', '韓男', '한남', 0),
+('男', '韓男', '한남', 1),
+('韓', '韓英', '한영', 0),
+('英', '韓英', '한영', 1),
+('韓', '韓菓', '한과', 0),
+('菓', '韓菓', '한과', 1),
+('韓', '韓藥', '한약', 0),
+('藥', '韓藥', '한약', 1),
+('韓', '韓語', '한어', 0),
+('語', '韓語', '한어', 1),
+('韓', '韓食', '한식', 0),
+('食', '韓食', '한식', 1),
+('韓', '韓食堂', '한식당', 0),
+('食', '韓食堂', '한식당', 1),
+('堂', '韓食堂', '한식당', 2),
+('音', '音', '음', 0),
+('音', '音便', '음편', 0),
+('便', '音便', '음편', 1),
+('音', '音信', '음신', 0),
+('信', '音信', '음신', 1),
+('音', '音價', '음가', 0),
+('價', '音價', '음가', 1),
+('音', '音叉', '음차', 0),
+('叉', '音叉', '음차', 1),
+('音', '音域', '음역', 0),
+('域', '音域', '음역', 1),
+('音', '音樂', '음악', 0),
+('樂', '音樂', '음악', 1),
+('音', '音樂學', '음악학', 0),
+('樂', '音樂學', '음악학', 1),
+('學', '音樂學', '음악학', 2),
+('音', '音樂家', '음악가', 0),
+('樂', '音樂家', '음악가', 1),
+('家', '音樂家', '음악가', 2),
+('音', '音樂會', '음악회', 0),
+('樂', '音樂會', '음악회', 1),
+('會', '音樂會', '음악회', 2),
+('音', '音標', '음표', 0),
+('標', '音標', '음표', 1),
+('音', '音波', '음파', 0),
+('波', '音波', '음파', 1),
+('音', '音源', '음원', 0),
+('源', '音源', '음원', 1),
+('音', '音盤', '음반', 0),
+('盤', '音盤', '음반', 1),
+('音', '音程', '음정', 0),
+('程', '音程', '음정', 1),
+('音', '音節', '음절', 0),
+('節', '音節', '음절', 1),
+('音', '音節文字', '음절문자', 0),
+('節', '音節文字', '음절문자', 1),
+('文', '音節文字', '음절문자', 2),
+('字', '音節文字', '음절문자', 3),
+('音', '音素', '음소', 0),
+('素', '音素', '음소', 1),
+('音', '音素文字', '음소문자', 0),
+('素', '音素文字', '음소문자', 1),
+('文', '音素文字', '음소문자', 2),
+('字', '音素文字', '음소문자', 3),
+('音', '音聲', '음성', 0),
+('聲', '音聲', '음성', 1),
+('音', '音聲 私書函', '음성 사서함', 0),
+('聲', '音聲 私書函', '음성 사서함', 1),
+('私', '音聲 私書函', '음성 사서함', 3),
+('書', '音聲 私書函', '음성 사서함', 4),
+('函', '音聲 私書函', '음성 사서함', 5),
+('音', '音聲學', '음성학', 0),
+('聲', '音聲學', '음성학', 1),
+('學', '音聲學', '음성학', 2),
+('音', '音色', '음색', 0),
+('色', '音色', '음색', 1),
+('音', '音訓', '음훈', 0),
+('訓', '音訓', '음훈', 1),
+('音', '音調', '음조', 0),
+('調', '音調', '음조', 1),
+('音', '音譯', '음역', 0),
+('譯', '音譯', '음역', 1),
+('音', '音譯字', '음역자', 0),
+('譯', '音譯字', '음역자', 1),
+('字', '音譯字', '음역자', 2),
+('音', '音讀', '음독', 0),
+('讀', '音讀', '음독', 1),
+('音', '音質', '음질', 0),
+('質', '音質', '음질', 1),
+('音', '音量', '음량', 0),
+('量', '音量', '음량', 1),
+('音', '音階', '음계', 0),
+('階', '音階', '음계', 1),
+('音', '音韻', '음운', 0),
+('韻', '音韻', '음운', 1),
+('音', '音韻論', '음운론', 0),
+('韻', '音韻論', '음운론', 1),
+('論', '音韻論', '음운론', 2),
+('音', '音響', '음향', 0),
+('響', '音響', '음향', 1),
+('音', '音響量子', '음향양자', 0),
+('響', '音響量子', '음향양자', 1),
+('量', '音響量子', '음향양자', 2),
+('子', '音響量子', '음향양자', 3),
+('韻', '韻律', '운율', 0),
+('律', '韻律', '운율', 1),
+('韻', '韻文', '운문', 0),
+('文', '韻文', '운문', 1),
+('韻', '韻致', '운치', 0),
+('致', '韻致', '운치', 1),
+('響', '響應', '향응', 0),
+('應', '響應', '향응', 1),
+('頁', '頁岩', '혈암', 0),
+('岩', '頁岩', '혈암', 1),
+('頂', '頂上', '정상', 0),
+('上', '頂上', '정상', 1),
+('頂', '頂上會談', '정상회담', 0),
+('上', '頂上會談', '정상회담', 1),
+('會', '頂上會談', '정상회담', 2),
+('談', '頂上會談', '정상회담', 3),
+('頂', '頂板', '정판', 0),
+('板', '頂板', '정판', 1),
+('頂', '頂點', '정점', 0),
+('點', '頂點', '정점', 1),
+('頂', '頂수리', '정수리', 0),
+('수', '頂수리', '정수리', 1),
+('리', '頂수리', '정수리', 2),
+('項', '項', '항', 0),
+('項', '項目', '항목', 0),
+('目', '項目', '항목', 1),
+('順', '順', '순', 0),
+('順', '順位', '순위', 0),
+('位', '順位', '순위', 1),
+('順', '順列', '순열', 0),
+('列', '順列', '순열', 1),
+('順', '順川', '순천', 0),
+('川', '順川', '순천', 1),
+('順', '順序', '순서', 0),
+('序', '順序', '순서', 1),
+('順', '順應', '순응', 0),
+('應', '順應', '순응', 1),
+('順', '順興', '순흥', 0),
+('興', '順興', '순흥', 1),
+('頉', '頉', '탈', 0),
+('頌', '頌歌', '송가', 0),
+('歌', '頌歌', '송가', 1),
+('預', '預言', '예언', 0),
+('言', '預言', '예언', 1),
+('預', '預言者', '예언자', 0),
+('言', '預言者', '예언자', 1),
+('者', '預言者', '예언자', 2),
+('預', '預金', '예금', 0),
+('金', '預金', '예금', 1),
+('預', '預金者', '예금자', 0),
+('金', '預金者', '예금자', 1),
+('者', '預金者', '예금자', 2),
+('預', '預金', '예금', 0),
+('金', '預金', '예금', 1),
+('頑', '頑丈', '완장', 0),
+('丈', '頑丈', '완장', 1),
+('頑', '頑固', '완고', 0),
+('固', '頑固', '완고', 1),
+('頒', '頒布', '반포', 0),
+('布', '頒布', '반포', 1),
+('頓', '頓菜飯', '돈채반', 0),
+('菜', '頓菜飯', '돈채반', 1),
+('飯', '頓菜飯', '돈채반', 2),
+('領', '領主', '영주', 0),
+('主', '領主', '영주', 1),
+('領', '領事', '령사', 0),
+('事', '領事', '령사', 1),
+('領', '領事', '영사', 0),
+('事', '領事', '영사', 1),
+('領', '領事官', '영사관', 0),
+('事', '領事官', '영사관', 1),
+('官', '領事官', '영사관', 2),
+('領', '領事館', '령사관', 0),
+('事', '領事館', '령사관', 1),
+('館', '領事館', '령사관', 2),
+('領', '領事館', '영사관', 0),
+('事', '領事館', '영사관', 1),
+('館', '領事館', '영사관', 2),
+('領', '領土', '영토', 0),
+('土', '領土', '영토', 1),
+('領', '領地', '영지', 0),
+('地', '領地', '영지', 1),
+('領', '領域', '영역', 0),
+('域', '領域', '영역', 1),
+('領', '領官', '영관', 0),
+('官', '領官', '영관', 1),
+('領', '領導者', '령도자', 0),
+('導', '領導者', '령도자', 1),
+('者', '領導者', '령도자', 2),
+('領', '領導者', '영도자', 0),
+('導', '領導者', '영도자', 1),
+('者', '領導者', '영도자', 2),
+('領', '領收', '영수', 0),
+('收', '領收', '영수', 1),
+('領', '領收證', '영수증', 0),
+('收', '領收證', '영수증', 1),
+('證', '領收證', '영수증', 2),
+('領', '領海', '영해', 0),
+('海', '領海', '영해', 1),
+('領', '領空', '령공', 0),
+('空', '領空', '령공', 1),
+('領', '領空', '영공', 0),
+('空', '領空', '영공', 1),
+('領', '領聖體', '영성체', 0),
+('聖', '領聖體', '영성체', 1),
+('體', '領聖體', '영성체', 2),
+('頭', '頭', '두', 0),
+('頭', '頭上', '두상', 0),
+('上', '頭上', '두상', 1),
+('頭', '頭像', '두상', 0),
+('像', '頭像', '두상', 1),
+('頭', '頭巾', '두건', 0),
+('巾', '頭巾', '두건', 1),
+('頭', '頭文字', '두문자', 0),
+('文', '頭文字', '두문자', 1),
+('字', '頭文字', '두문자', 2),
+('頭', '頭痛', '두통', 0),
+('痛', '頭痛', '두통', 1),
+('頭', '頭痛藥', '두통약', 0),
+('痛', '頭痛藥', '두통약', 1),
+('藥', '頭痛藥', '두통약', 2),
+('頭', '頭目', '두목', 0),
+('目', '頭目', '두목', 1),
+('頭', '頭索動物', '두삭동물', 0),
+('索', '頭索動物', '두삭동물', 1),
+('動', '頭索動物', '두삭동물', 2),
+('物', '頭索動物', '두삭동물', 3),
+('頭', '頭腦', '두뇌', 0),
+('腦', '頭腦', '두뇌', 1),
+('頭', '頭腦 集團', '두뇌 집단', 0),
+('腦', '頭腦 集團', '두뇌 집단', 1),
+('集', '頭腦 集團', '두뇌 집단', 3),
+('團', '頭腦 集團', '두뇌 집단', 4),
+('頭', '頭蓋', '두개', 0),
+('蓋', '頭蓋', '두개', 1),
+('頭', '頭蓋腔', '두개강', 0),
+('蓋', '頭蓋腔', '두개강', 1),
+('腔', '頭蓋腔', '두개강', 2),
+('頭', '頭蓋骨', '두개골', 0),
+('蓋', '頭蓋骨', '두개골', 1),
+('骨', '頭蓋骨', '두개골', 2),
+('頭', '頭註', '두주', 0),
+('註', '頭註', '두주', 1),
+('頭', '頭足類', '두족류', 0),
+('足', '頭足類', '두족류', 1),
+('類', '頭足類', '두족류', 2),
+('頭', '頭音', '두음', 0),
+('音', '頭音', '두음', 1),
+('頭', '頭音 法則', '두음 법칙', 0),
+('音', '頭音 法則', '두음 법칙', 1),
+('法', '頭音 法則', '두음 법칙', 3),
+('則', '頭音 法則', '두음 법칙', 4),
+('頭', '頭韻', '두운', 0),
+('韻', '頭韻', '두운', 1),
+('頭', '頭髮', '두발', 0),
+('髮', '頭髮', '두발', 1),
+('頸', '頸長筋', '경장근', 0),
+('長', '頸長筋', '경장근', 1),
+('筋', '頸長筋', '경장근', 2),
+('頹', '頹廢', '퇴폐', 0),
+('廢', '頹廢', '퇴폐', 1),
+('頻', '頻尿', '빈뇨', 0),
+('尿', '頻尿', '빈뇨', 1),
+('頻', '頻度', '빈도', 0),
+('度', '頻度', '빈도', 1),
+('頻', '頻發', '빈발', 0),
+('發', '頻發', '빈발', 1),
+('頻', '頻繁', '빈번', 0),
+('繁', '頻繁', '빈번', 1),
+('顆', '顆粒', '과립', 0),
+('粒', '顆粒', '과립', 1),
+('題', '題目', '제목', 0),
+('目', '題目', '제목', 1),
+('額', '額數', '액수', 0),
+('數', '額數', '액수', 1),
+('額', '額面', '액면', 0),
+('面', '額面', '액면', 1),
+('額', '額面價', '액면가', 0),
+('面', '額面價', '액면가', 1),
+('價', '額面價', '액면가', 2),
+('額', '額面分割', '액면분할', 0),
+('面', '額面分割', '액면분할', 1),
+('分', '額面分割', '액면분할', 2),
+('割', '額面分割', '액면분할', 3),
+('顎', '顎肢', '악지', 0),
+('肢', '顎肢', '악지', 1),
+('顔', '顔料', '안료', 0),
+('料', '顔料', '안료', 1),
+('顔', '顔色', '안색', 0),
+('色', '顔色', '안색', 1),
+('顔', '顔面', '안면', 0),
+('面', '顔面', '안면', 1),
+('顔', '顔面乘馬', '안면승마', 0),
+('面', '顔面乘馬', '안면승마', 1),
+('乘', '顔面乘馬', '안면승마', 2),
+('馬', '顔面乘馬', '안면승마', 3),
+('願', '願', '원', 0),
+('願', '願書', '원서', 0),
+('書', '願書', '원서', 1),
+('願', '願望', '원망', 0),
+('望', '願望', '원망', 1),
+('顚', '顚覆', '전복', 0),
+('覆', '顚覆', '전복', 1),
+('類', '類', '류', 0),
+('類', '類', '유', 0),
+('類', '類人猿', '유인원', 0),
+('人', '類人猿', '유인원', 1),
+('猿', '類人猿', '유인원', 2),
+('類', '類似', '유사', 0),
+('似', '類似', '유사', 1),
+('類', '類型', '류형', 0),
+('型', '類型', '류형', 1),
+('類', '類型', '유형', 0),
+('型', '類型', '유형', 1),
+('類', '類推', '유추', 0),
+('推', '類推', '유추', 1),
+('類', '類義語', '유의어', 0),
+('義', '類義語', '유의어', 1),
+('語', '類義語', '유의어', 2),
+('類', '類類相從', '유유상종', 0),
+('類', '類類相從', '유유상종', 1),
+('相', '類類相從', '유유상종', 2),
+('從', '類類相從', '유유상종', 3),
+('顧', '顧問', '고문', 0),
+('問', '顧問', '고문', 1),
+('顧', '顧問官', '고문관', 0),
+('問', '顧問官', '고문관', 1),
+('官', '顧問官', '고문관', 2),
+('顧', '顧客', '고객', 0),
+('客', '顧客', '고객', 1),
+('顧', '顧慮', '고려', 0),
+('慮', '顧慮', '고려', 1),
+('顫', '顫動', '전동', 0),
+('動', '顫動', '전동', 1),
+('顯', '顯出', '현출', 0),
+('出', '顯出', '현출', 1),
+('顯', '顯學', '현학', 0),
+('學', '顯學', '현학', 1),
+('顯', '顯彰', '현창', 0),
+('彰', '顯彰', '현창', 1),
+('顯', '顯微鏡', '현미경', 0),
+('微', '顯微鏡', '현미경', 1),
+('鏡', '顯微鏡', '현미경', 2),
+('風', '風', '풍', 0),
+('風', '風俗', '풍속', 0),
+('俗', '風俗', '풍속', 1),
+('風', '風力團地', '풍력단지', 0),
+('力', '風力團地', '풍력단지', 1),
+('團', '風力團地', '풍력단지', 2),
+('地', '風力團地', '풍력단지', 3),
+('風', '風化', '풍화', 0),
+('化', '風化', '풍화', 1),
+('風', '風味', '풍미', 0),
+('味', '風味', '풍미', 1),
+('風', '風情', '풍정', 0),
+('情', '風情', '풍정', 1),
+('風', '風景', '풍경', 0),
+('景', '風景', '풍경', 1),
+('風', '風水', '풍수', 0),
+('水', '風水', '풍수', 1),
+('風', '風潮', '풍조', 0),
+('潮', '風潮', '풍조', 1),
+('風', '風燈', '풍등', 0),
+('燈', '風燈', '풍등', 1),
+('風', '風物詩', '풍물시', 0),
+('物', '風物詩', '풍물시', 1),
+('詩', '風物詩', '풍물시', 2),
+('風', '風物놀이', '풍물놀이', 0),
+('物', '風物놀이', '풍물놀이', 1),
+('놀', '風物놀이', '풍물놀이', 2),
+('이', '風物놀이', '풍물놀이', 3),
+('風', '風琴', '풍금', 0),
+('琴', '風琴', '풍금', 1),
+('風', '風琴鳥', '풍금조', 0),
+('琴', '風琴鳥', '풍금조', 1),
+('鳥', '風琴鳥', '풍금조', 2),
+('風', '風疹', '풍진', 0),
+('疹', '風疹', '풍진', 1),
+('風', '風習', '풍습', 0),
+('習', '風習', '풍습', 1),
+('風', '風聞', '풍문', 0),
+('聞', '風聞', '풍문', 1),
+('風', '風致', '풍치', 0),
+('致', '風致', '풍치', 1),
+('風', '風船', '풍선', 0),
+('船', '風船', '풍선', 1),
+('風', '風蝶草', '풍접초', 0),
+('蝶', '風蝶草', '풍접초', 1),
+('草', '風蝶草', '풍접초', 2),
+('風', '風說', '풍설', 0),
+('說', '風說', '풍설', 1),
+('風', '風貌', '풍모', 0),
+('貌', '風貌', '풍모', 1),
+('風', '風車', '풍차', 0),
+('車', '風車', '풍차', 1),
+('風', '風速', '풍속', 0),
+('速', '風速', '풍속', 1),
+('風', '風速計', '풍속계', 0),
+('速', '風速計', '풍속계', 1),
+('計', '風速計', '풍속계', 2),
+('風', '風采', '풍채', 0),
+('采', '風采', '풍채', 1),
+('風', '風鈴', '풍령', 0),
+('鈴', '風鈴', '풍령', 1),
+('風', '風靡', '풍미', 0),
+('靡', '風靡', '풍미', 1),
+('風', '風飛雹散', '풍비박산', 0),
+('飛', '風飛雹散', '풍비박산', 1),
+('雹', '風飛雹散', '풍비박산', 2),
+('散', '風飛雹散', '풍비박산', 3),
+('颱', '颱風', '태풍', 0),
+('風', '颱風', '태풍', 1),
+('飛', '飛來', '비래', 0),
+('來', '飛來', '비래', 1),
+('飛', '飛檄', '비격', 0),
+('檄', '飛檄', '비격', 1),
+('飛', '飛翔', '비상', 0),
+('翔', '飛翔', '비상', 1),
+('飛', '飛虎', '비호', 0),
+('虎', '飛虎', '비호', 1),
+('飛', '飛行', '비행', 0),
+('行', '飛行', '비행', 1),
+('飛', '飛行場', '비행장', 0),
+('行', '飛行場', '비행장', 1),
+('場', '飛行場', '비행장', 2),
+('飛', '飛行士', '비행사', 0),
+('行', '飛行士', '비행사', 1),
+('士', '飛行士', '비행사', 2),
+('飛', '飛行機', '비행기', 0),
+('行', '飛行機', '비행기', 1),
+('機', '飛行機', '비행기', 2),
+('飛', '飛行機票', '비행기표', 0),
+('行', '飛行機票', '비행기표', 1),
+('機', '飛行機票', '비행기표', 2),
+('票', '飛行機票', '비행기표', 3),
+('飛', '飛行船', '비행선', 0),
+('行', '飛行船', '비행선', 1),
+('船', '飛行船', '비행선', 2),
+('飛', '飛行記錄裝置', '비행기록장치', 0),
+('行', '飛行記錄裝置', '비행기록장치', 1),
+('記', '飛行記錄裝置', '비행기록장치', 2),
+('錄', '飛行記錄裝置', '비행기록장치', 3),
+('裝', '飛行記錄裝置', '비행기록장치', 4),
+('置', '飛行記錄裝置', '비행기록장치', 5),
+('飛', '飛階', '비계', 0),
+('階', '飛階', '비계', 1),
+('飜', '飜刻', '번각', 0),
+('刻', '飜刻', '번각', 1),
+('飜', '飜譯', '번역', 0),
+('譯', '飜譯', '번역', 1),
+('飜', '飜譯家', '번역가', 0),
+('譯', '飜譯家', '번역가', 1),
+('家', '飜譯家', '번역가', 2),
+('飜', '飜譯機', '번역기', 0),
+('譯', '飜譯機', '번역기', 1),
+('機', '飜譯機', '번역기', 2),
+('飜', '飜譯者', '번역자', 0),
+('譯', '飜譯者', '번역자', 1),
+('者', '飜譯者', '번역자', 2),
+('飜', '飜譯體', '번역체', 0),
+('譯', '飜譯體', '번역체', 1),
+('體', '飜譯體', '번역체', 2),
+('食', '食-', '식빵', 0),
+('-', '食-', '식빵', 1),
+('食', '食中毒', '식중독', 0),
+('中', '食中毒', '식중독', 1),
+('毒', '食中毒', '식중독', 2),
+('食', '食事', '식사', 0),
+('事', '食事', '식사', 1),
+('食', '食人', '식인', 0),
+('人', '食人', '식인', 1),
+('食', '食人種', '식인종', 0),
+('人', '食人種', '식인종', 1),
+('種', '食人種', '식인종', 2),
+('食', '食刀', '식도', 0),
+('刀', '食刀', '식도', 1),
+('食', '食券', '식권', 0),
+('券', '食券', '식권', 1),
+('食', '食卓', '식탁', 0),
+('卓', '食卓', '식탁', 1),
+('食', '食卓褓', '식탁보', 0),
+('卓', '食卓褓', '식탁보', 1),
+('褓', '食卓褓', '식탁보', 2),
+('食', '食口', '식구', 0),
+('口', '食口', '식구', 1),
+('食', '食品', '식품', 0),
+('品', '食品', '식품', 1),
+('食', '食品保存料', '식품보존료', 0),
+('品', '食品保存料', '식품보존료', 1),
+('保', '食品保存料', '식품보존료', 2),
+('存', '食品保存料', '식품보존료', 3),
+('料', '食品保存料', '식품보존료', 4),
+('食', '食品店', '식품점', 0),
+('品', '食品店', '식품점', 1),
+('店', '食品店', '식품점', 2),
+('食', '食單', '식단', 0),
+('單', '食單', '식단', 1),
+('食', '食器', '식기', 0),
+('器', '食器', '식기', 1),
+('食', '食器洗滌機', '식기세척기', 0),
+('器', '食器洗滌機', '식기세척기', 1),
+('洗', '食器洗滌機', '식기세척기', 2),
+('滌', '食器洗滌機', '식기세척기', 3),
+('機', '食器洗滌機', '식기세척기', 4),
+('食', '食堂', '식당', 0),
+('堂', '食堂', '식당', 1),
+('食', '食後', '식후', 0),
+('後', '食後', '식후', 1),
+('食', '食性', '식성', 0),
+('性', '食性', '식성', 1),
+('食', '食感', '식감', 0),
+('感', '食感', '식감', 1),
+('食', '食慾', '식욕', 0),
+('慾', '食慾', '식욕', 1),
+('食', '食料', '식료', 0),
+('料', '食料', '식료', 1),
+('食', '食料品', '식료품', 0),
+('料', '食料品', '식료품', 1),
+('品', '食料品', '식료품', 2),
+('食', '食料品店', '식료품점', 0),
+('料', '食料品店', '식료품점', 1),
+('品', '食料品店', '식료품점', 2),
+('店', '食料品店', '식료품점', 3),
+('食', '食水', '식수', 0),
+('水', '食水', '식수', 1),
+('食', '食生活', '식생활', 0),
+('生', '食生活', '식생활', 1),
+('活', '食生活', '식생활', 2),
+('食', '食用油', '식용유', 0),
+('用', '食用油', '식용유', 1),
+('油', '食用油', '식용유', 2),
+('食', '食管', '식관', 0),
+('管', '食管', '식관', 1),
+('食', '食糧', '식량', 0),
+('糧', '食糧', '식량', 1),
+('食', '食費', '식비', 0),
+('費', '食費', '식비', 1),
+('食', '食道', '식도', 0),
+('道', '食道', '식도', 1),
+('食', '食醋', '식초', 0),
+('醋', '食醋', '식초', 1),
+('食', '食醢', '식해', 0),
+('醢', '食醢', '식해', 1),
+('食', '食醯', '식혜', 0),
+('醯', '食醯', '식혜', 1),
+('食', '食빵', '식빵', 0),
+('빵', '食빵', '식빵', 1),
+('食', '食칼', '식칼', 0),
+('칼', '食칼', '식칼', 1),
+('飢', '飢餓', '기아', 0),
+('餓', '飢餓', '기아', 1),
+('飢', '飢饉', '기근', 0),
+('饉', '飢饉', '기근', 1),
+('飮', '飮料', '음료', 0),
+('料', '飮料', '음료', 1),
+('飮', '飮料水', '음료수', 0),
+('料', '飮料水', '음료수', 1),
+('水', '飮料水', '음료수', 2),
+('飮', '飮水', '음수', 0),
+('水', '飮水', '음수', 1),
+('飮', '飮淸類', '음청류', 0),
+('淸', '飮淸類', '음청류', 1),
+('類', '飮淸類', '음청류', 2),
+('飮', '飮用水', '음용수', 0),
+('用', '飮用水', '음용수', 1),
+('水', '飮用水', '음용수', 2),
+('飮', '飮酒', '음주', 0),
+('酒', '飮酒', '음주', 1),
+('飮', '飮食', '음식', 0),
+('食', '飮食', '음식', 1),
+('飮', '飮食店', '음식점', 0),
+('食', '飮食店', '음식점', 1),
+('店', '飮食店', '음식점', 2),
+('飮', '飮食物', '음식물', 0),
+('食', '飮食物', '음식물', 1),
+('物', '飮食物', '음식물', 2),
+('飯', '飯饌', '반찬', 0),
+('饌', '飯饌', '반찬', 1),
+('飲', '飲料', '음료', 0),
+('料', '飲料', '음료', 1),
+('飲', '飲食', '음식', 0),
+('食', '飲食', '음식', 1),
+('飼', '飼料', '사료', 0),
+('料', '飼料', '사료', 1),
+('飼', '飼育', '사육', 0),
+('育', '飼育', '사육', 1),
+('飽', '飽和', '포화', 0),
+('和', '飽和', '포화', 1),
+('飽', '飽和 脂肪酸', '포화 지방산', 0),
+('和', '飽和 脂肪酸', '포화 지방산', 1),
+('脂', '飽和 脂肪酸', '포화 지방산', 3),
+('肪', '飽和 脂肪酸', '포화 지방산', 4),
+('酸', '飽和 脂肪酸', '포화 지방산', 5),
+('飽', '飽和脂肪', '포화지방', 0),
+('和', '飽和脂肪', '포화지방', 1),
+('脂', '飽和脂肪', '포화지방', 2),
+('肪', '飽和脂肪', '포화지방', 3),
+('飽', '飽滿', '포만', 0),
+('滿', '飽滿', '포만', 1),
+('飾', '飾詐', '식사', 0),
+('詐', '飾詐', '식사', 1),
+('養', '養女', '양녀', 0),
+('女', '養女', '양녀', 1),
+('養', '養成', '양성', 0),
+('成', '養成', '양성', 1),
+('養', '養殖', '양식', 0),
+('殖', '養殖', '양식', 1),
+('養', '養母', '양모', 0),
+('母', '養母', '양모', 1),
+('養', '養父', '양부', 0),
+('父', '養父', '양부', 1),
+('養', '養老院', '양로원', 0),
+('老', '養老院', '양로원', 1),
+('院', '養老院', '양로원', 2),
+('養', '養育', '양육', 0),
+('育', '養育', '양육', 1),
+('養', '養育權', '양육권', 0),
+('育', '養育權', '양육권', 1),
+('權', '養育權', '양육권', 2),
+('養', '養蜂', '양봉', 0),
+('蜂', '養蜂', '양봉', 1),
+('養', '養蜂場', '양봉장', 0),
+('蜂', '養蜂場', '양봉장', 1),
+('場', '養蜂場', '양봉장', 2),
+('養', '養蜂家', '양봉가', 0),
+('蜂', '養蜂家', '양봉가', 1),
+('家', '養蜂家', '양봉가', 2),
+('養', '養蠶', '양잠', 0),
+('蠶', '養蠶', '양잠', 1),
+('餓', '餓倒', '아도', 0),
+('倒', '餓倒', '아도', 1),
+('餓', '餓死', '아사', 0),
+('死', '餓死', '아사', 1),
+('餓', '餓鬼', '아귀', 0),
+('鬼', '餓鬼', '아귀', 1),
+('餘', '餘勢', '여세', 0),
+('勢', '餘勢', '여세', 1),
+('餘', '餘地', '여지', 0),
+('地', '餘地', '여지', 1),
+('餘', '餘弦', '여현', 0),
+('弦', '餘弦', '여현', 1),
+('餘', '餘念', '여념', 0),
+('念', '餘念', '여념', 1),
+('餘', '餘技', '여기', 0),
+('技', '餘技', '여기', 1),
+('餘', '餘暇', '여가', 0),
+('暇', '餘暇', '여가', 1),
+('餘', '餘望', '여망', 0),
+('望', '餘望', '여망', 1),
+('餘', '餘波', '여파', 0),
+('波', '餘波', '여파', 1),
+('餘', '餘熱', '여열', 0),
+('熱', '餘熱', '여열', 1),
+('餘', '餘燼', '여신', 0),
+('燼', '餘燼', '여신', 1),
+('餘', '餘病', '여병', 0),
+('病', '餘病', '여병', 1),
+('餘', '餘白', '여백', 0),
+('白', '餘白', '여백', 1),
+('餘', '餘矢', '여시', 0),
+('矢', '餘矢', '여시', 1),
+('餘', '餘興', '여흥', 0),
+('興', '餘興', '여흥', 1),
+('餘', '餘裕', '여유', 0),
+('裕', '餘裕', '여유', 1),
+('餘', '餘角', '여각', 0),
+('角', '餘角', '여각', 1),
+('餘', '餘談', '여담', 0),
+('談', '餘談', '여담', 1),
+('餘', '餘震', '여진', 0),
+('震', '餘震', '여진', 1),
+('館', '館員', '관원', 0),
+('員', '館員', '관원', 1),
+('館', '館長', '관장', 0),
+('長', '館長', '관장', 1),
+('饅', '饅頭', '만두', 0),
+('頭', '饅頭', '만두', 1),
+('饌', '饌欌', '찬장', 0),
+('欌', '饌欌', '찬장', 1),
+('饑', '饑餓', '기아', 0),
+('餓', '饑餓', '기아', 1),
+('饑', '饑饉', '기근', 0),
+('饉', '饑饉', '기근', 1),
+('饗', '饗應', '향응', 0),
+('應', '饗應', '향응', 1),
+('首', '首位', '수위', 0),
+('位', '首位', '수위', 1),
+('首', '首堂', '수당', 0),
+('堂', '首堂', '수당', 1),
+('首', '首席', '수석', 0),
+('席', '首席', '수석', 1),
+('首', '首府', '수부', 0),
+('府', '首府', '수부', 1),
+('首', '首弟子', '수제자', 0),
+('弟', '首弟子', '수제자', 1),
+('子', '首弟子', '수제자', 2),
+('首', '首相', '수상', 0),
+('相', '首相', '수상', 1),
+('首', '首級', '수급', 0),
+('級', '首級', '수급', 1),
+('首', '首腦會談', '수뇌회담', 0),
+('腦', '首腦會談', '수뇌회담', 1),
+('會', '首腦會談', '수뇌회담', 2),
+('談', '首腦會談', '수뇌회담', 3),
+('首', '首腦相逢', '수뇌상봉', 0),
+('腦', '首腦相逢', '수뇌상봉', 1),
+('相', '首腦相逢', '수뇌상봉', 2),
+('逢', '首腦相逢', '수뇌상봉', 3),
+('首', '首都', '수도', 0),
+('都', '首都', '수도', 1),
+('首', '首都圈', '수도권', 0),
+('都', '首都圈', '수도권', 1),
+('圈', '首都圈', '수도권', 2),
+('首', '首長國', '수장국', 0),
+('長', '首長國', '수장국', 1),
+('國', '首長國', '수장국', 2),
+('首', '首長龍', '수장룡', 0),
+('長', '首長龍', '수장룡', 1),
+('龍', '首長龍', '수장룡', 2),
+('首', '首領', '수령', 0),
+('領', '首領', '수령', 1),
+('首', '首魁', '수괴', 0),
+('魁', '首魁', '수괴', 1),
+('香', '香', '향', 0),
+('香', '香匠', '향장', 0),
+('匠', '香匠', '향장', 1),
+('香', '香味', '향미', 0),
+('味', '香味', '향미', 1),
+('香', '香料', '향료', 0),
+('料', '香料', '향료', 1),
+('香', '香氣', '향기', 0),
+('氣', '香氣', '향기', 1),
+('香', '香水', '향수', 0),
+('水', '香水', '향수', 1),
+('香', '香油', '향유', 0),
+('油', '香油', '향유', 1),
+('香', '香港', '향항', 0),
+('港', '香港', '향항', 1),
+('香', '香爐', '향로', 0),
+('爐', '香爐', '향로', 1),
+('香', '香爐石', '향로석', 0),
+('爐', '香爐石', '향로석', 1),
+('石', '香爐石', '향로석', 2),
+('香', '香草', '향초', 0),
+('草', '香草', '향초', 1),
+('香', '香菜', '향채', 0),
+('菜', '香菜', '향채', 1),
+('香', '香辛料', '향신료', 0),
+('辛', '香辛料', '향신료', 1),
+('料', '香辛料', '향신료', 2),
+('馬', '馬乳', '마유', 0),
+('乳', '馬乳', '마유', 1),
+('馬', '馬具', '마구', 0),
+('具', '馬具', '마구', 1),
+('馬', '馬力', '마력', 0),
+('力', '馬力', '마력', 1),
+('馬', '馬印語', '마인어', 0),
+('印', '馬印語', '마인어', 1),
+('語', '馬印語', '마인어', 2),
+('馬', '馬夫', '마부', 0),
+('夫', '馬夫', '마부', 1),
+('馬', '馬廏', '마구', 0),
+('廏', '馬廏', '마구', 1),
+('馬', '馬廐間', '마구간', 0),
+('廐', '馬廐間', '마구간', 1),
+('間', '馬廐間', '마구간', 2),
+('馬', '馬肉', '마육', 0),
+('肉', '馬肉', '마육', 1),
+('馬', '馬術', '마술', 0),
+('術', '馬術', '마술', 1),
+('馬', '馬褂', '마괘', 0),
+('褂', '馬褂', '마괘', 1),
+('馬', '馬車', '마차', 0),
+('車', '馬車', '마차', 1),
+('馬', '馬韓', '마한', 0),
+('韓', '馬韓', '마한', 1),
+('馬', '馬頭琴', '마두금', 0),
+('頭', '馬頭琴', '마두금', 1),
+('琴', '馬頭琴', '마두금', 2),
+('馴', '馴鹿', '순록', 0),
+('鹿', '馴鹿', '순록', 1),
+('駐', '駐在', '주재', 0),
+('在', '駐在', '주재', 1),
+('駐', '駐屯', '주둔', 0),
+('屯', '駐屯', '주둔', 1),
+('駐', '駐屯地', '주둔지', 0),
+('屯', '駐屯地', '주둔지', 1),
+('地', '駐屯地', '주둔지', 2),
+('駐', '駐日', '주일', 0),
+('日', '駐日', '주일', 1),
+('駐', '駐留', '주류', 0),
+('留', '駐留', '주류', 1),
+('駐', '駐車', '주차', 0),
+('車', '駐車', '주차', 1),
+('駐', '駐車場', '주차장', 0),
+('車', '駐車場', '주차장', 1),
+('場', '駐車場', '주차장', 2),
+('駐', '駐韓', '주한', 0),
+('韓', '駐韓', '주한', 1),
+('駛', '駛河', '사하', 0),
+('河', '駛河', '사하', 1),
+('駝', '駝酪', '타락', 0),
+('酪', '駝酪', '타락', 1),
+('駝', '駝鳥', '타조', 0),
+('鳥', '駝鳥', '타조', 1),
+('駟', '駟馬', '사마', 0),
+('馬', '駟馬', '사마', 1),
+('駱', '駱駝', '낙타', 0),
+('駝', '駱駝', '낙타', 1),
+('駱', '駱駝', '락타', 0),
+('駝', '駱駝', '락타', 1),
+('駱', '駱駞', '낙타', 0),
+('駞', '駱駞', '낙타', 1),
+('駱', '駱駞', '락타', 0),
+('駞', '駱駞', '락타', 1),
+('駿', '駿逸', '준일', 0),
+('逸', '駿逸', '준일', 1),
+('騎', '騎乘位', '기승위', 0),
+('乘', '騎乘位', '기승위', 1),
+('位', '騎乘位', '기승위', 2),
+('騎', '騎兵', '기병', 0),
+('兵', '騎兵', '기병', 1),
+('騎', '騎士', '기사', 0),
+('士', '騎士', '기사', 1),
+('騎', '騎士道', '기사도', 0),
+('士', '騎士道', '기사도', 1),
+('道', '騎士道', '기사도', 2),
+('騎', '騎手', '기수', 0),
+('手', '騎手', '기수', 1),
+('騎', '騎馬', '기마', 0),
+('馬', '騎馬', '기마', 1),
+('騙', '騙取', '편취', 0),
+('取', '騙取', '편취', 1),
+('騰', '騰空', '등공', 0),
+('空', '騰空', '등공', 1),
+('騰', '騰落', '등락', 0),
+('落', '騰落', '등락', 1),
+('騰', '騰貴', '등귀', 0),
+('貴', '騰貴', '등귀', 1),
+('騷', '騷動', '소동', 0),
+('動', '騷動', '소동', 1),
+('騷', '騷擾', '소요', 0),
+('擾', '騷擾', '소요', 1),
+('騷', '騷音', '소음', 0),
+('音', '騷音', '소음', 1),
+('驅', '驅人', '구인', 0),
+('人', '驅人', '구인', 1),
+('驅', '驅使', '구사', 0),
+('使', '驅使', '구사', 1),
+('驅', '驅步', '구보', 0),
+('步', '驅步', '구보', 1),
+('驅', '驅逐', '구축', 0),
+('逐', '驅逐', '구축', 1),
+('驅', '驅逐艦', '구축함', 0),
+('逐', '驅逐艦', '구축함', 1),
+('艦', '驅逐艦', '구축함', 2),
+('驅', '驅除', '구제', 0),
+('除', '驅除', '구제', 1),
+('驅', '驅魔', '구마', 0),
+('魔', '驅魔', '구마', 1),
+('驍', '驍將', '효장', 0),
+('將', '驍將', '효장', 1),
+('驕', '驕慢', '교만', 0),
+('慢', '驕慢', '교만', 1),
+('驚', '驚愕', '경악', 0),
+('愕', '驚愕', '경악', 1),
+('驛', '驛', '역', 0),
+('驛', '驛舍', '역사', 0),
+('舍', '驛舍', '역사', 1),
+('驛', '驛馬', '역마', 0),
+('馬', '驛馬', '역마', 1),
+('驛', '驛馬車', '역마차', 0),
+('馬', '驛馬車', '역마차', 1),
+('車', '驛馬車', '역마차', 2),
+('骨', '骨', '골', 0),
+('骨', '骨子', '골자', 0),
+('子', '骨子', '골자', 1),
+('骨', '骨折', '골절', 0),
+('折', '骨折', '골절', 1),
+('骨', '骨格', '골격', 0),
+('格', '骨格', '골격', 1),
+('骨', '骨炭', '골탄', 0),
+('炭', '骨炭', '골탄', 1),
+('骨', '骨牌', '골패', 0),
+('牌', '骨牌', '골패', 1),
+('骨', '骨盤', '골반', 0),
+('盤', '骨盤', '골반', 1),
+('骨', '骨相學', '골상학', 0),
+('相', '骨相學', '골상학', 1),
+('學', '骨相學', '골상학', 2),
+('骨', '骨膜', '골막', 0),
+('膜', '骨膜', '골막', 1),
+('骨', '骨董品', '골동품', 0),
+('董', '骨董品', '골동품', 1),
+('品', '骨董品', '골동품', 2),
+('骨', '骨關節炎', '골관절염', 0),
+('關', '骨關節炎', '골관절염', 1),
+('節', '骨關節炎', '골관절염', 2),
+('炎', '骨關節炎', '골관절염', 3),
+('骨', '骨骼', '골격', 0),
+('骼', '骨骼', '골격', 1),
+('骨', '骨髓', '골수', 0),
+('髓', '骨髓', '골수', 1),
+('骸', '骸炭', '해탄', 0),
+('炭', '骸炭', '해탄', 1),
+('骸', '骸骨', '해골', 0),
+('骨', '骸骨', '해골', 1),
+('髓', '髓', '수', 0),
+('體', '體', '체', 0),
+('體', '體位', '체위', 0),
+('位', '體位', '체위', 1),
+('體', '體內', '체내', 0),
+('內', '體內', '체내', 1),
+('體', '體制', '체제', 0),
+('制', '體制', '체제', 1),
+('體', '體力', '체력', 0),
+('力', '體力', '체력', 1),
+('體', '體型', '체형', 0),
+('型', '體型', '체형', 1),
+('體', '體外', '체외', 0),
+('外', '體外', '체외', 1),
+('體', '體外射精', '체외사정', 0),
+('外', '體外射精', '체외사정', 1),
+('射', '體外射精', '체외사정', 2),
+('精', '體外射精', '체외사정', 3),
+('體', '體容', '체용', 0),
+('容', '體容', '체용', 1),
+('體', '體操', '체조', 0),
+('操', '體操', '체조', 1),
+('體', '體格', '체격', 0),
+('格', '體格', '체격', 1),
+('體', '體毛', '체모', 0),
+('毛', '體毛', '체모', 1),
+('體', '體溫', '체온', 0),
+('溫', '體溫', '체온', 1),
+('體', '體溫計', '체온계', 0),
+('溫', '體溫計', '체온계', 1),
+('計', '體溫計', '체온계', 2),
+('體', '體現', '체현', 0),
+('現', '體現', '체현', 1),
+('體', '體用', '체용', 0),
+('用', '體用', '체용', 1),
+('體', '體積', '체적', 0),
+('積', '體積', '체적', 1),
+('體', '體系', '체계', 0),
+('系', '體系', '체계', 1),
+('體', '體罰', '체벌', 0),
+('罰', '體罰', '체벌', 1),
+('體', '體育', '체육', 0),
+('育', '體育', '체육', 1),
+('體', '體育館', '체육관', 0),
+('育', '體育館', '체육관', 1),
+('館', '體育館', '체육관', 2),
+('體', '體腔', '체강', 0),
+('腔', '體腔', '체강', 1),
+('體', '體裁', '체재', 0),
+('裁', '體裁', '체재', 1),
+('體', '體言', '체언', 0),
+('言', '體言', '체언', 1),
+('體', '體質', '체질', 0),
+('質', '體質', '체질', 1),
+('體', '體軀', '체구', 0),
+('軀', '體軀', '체구', 1),
+('體', '體重', '체중', 0),
+('重', '體重', '체중', 1),
+('體', '體面', '체면', 0),
+('面', '體面', '체면', 1),
+('體', '體驗', '체험', 0),
+('驗', '體驗', '체험', 1),
+('高', '高', '고', 0),
+('高', '高位', '고위', 0),
+('位', '高位', '고위', 1),
+('高', '高低', '고저', 0),
+('低', '高低', '고저', 1),
+('高', '高低  악센', '고저 악센트', 0),
+('低', '高低  악센', '고저 악센트', 1),
+('악', '高低  악센', '고저 악센트', 4),
+('센', '高低  악센', '고저 악센트', 5),
+('高', '高僧', '고승', 0),
+('僧', '高僧', '고승', 1),
+('高', '高價', '고가', 0),
+('價', '高價', '고가', 1),
+('高', '高出産', '고출산', 0),
+('出', '高出産', '고출산', 1),
+('産', '高出産', '고출산', 2),
+('高', '高利', '고리', 0),
+('利', '高利', '고리', 1),
+('高', '高原', '고원', 0),
+('原', '高原', '고원', 1),
+('高', '高原地帶', '고원지대', 0),
+('原', '高原地帶', '고원지대', 1),
+('地', '高原地帶', '고원지대', 2),
+('帶', '高原地帶', '고원지대', 3),
+('高', '高句麗', '고구려', 0),
+('句', '高句麗', '고구려', 1),
+('麗', '高句麗', '고구려', 2),
+('高', '高名', '고명', 0),
+('名', '高名', '고명', 1),
+('高', '高周波', '고주파', 0),
+('周', '高周波', '고주파', 1),
+('波', '高周波', '고주파', 2),
+('高', '高喊', '고함', 0),
+('喊', '高喊', '고함', 1),
+('高', '高地', '고지', 0),
+('地', '高地', '고지', 1),
+('高', '高大', '고대', 0),
+('大', '高大', '고대', 1),
+('高', '高官', '고관', 0),
+('官', '高官', '고관', 1),
+('高', '高射砲', '고사포', 0),
+('射', '高射砲', '고사포', 1),
+('砲', '高射砲', '고사포', 2),
+('高', '高層', '고층', 0),
+('層', '高層', '고층', 1),
+('高', '高山', '고산', 0),
+('山', '高山', '고산', 1),
+('高', '高山病', '고산병', 0),
+('山', '高山病', '고산병', 1),
+('病', '高山病', '고산병', 2),
+('高', '高帽', '고모', 0),
+('帽', '高帽', '고모', 1),
+('高', '高度', '고도', 0),
+('度', '高度', '고도', 1),
+('高', '高所', '고소', 0),
+('所', '高所', '고소', 1),
+('高', '高所恐怖症', '고소공포증', 0),
+('所', '高所恐怖症', '고소공포증', 1),
+('恐', '高所恐怖症', '고소공포증', 2),
+('怖', '高所恐怖症', '고소공포증', 3),
+('症', '高所恐怖症', '고소공포증', 4),
+('高', '高手', '고수', 0),
+('手', '高手', '고수', 1),
+('高', '高批', '고비', 0),
+('批', '高批', '고비', 1),
+('高', '高架', '고가', 0),
+('架', '高架', '고가', 1),
+('高', '高架橋', '고가교', 0),
+('架', '高架橋', '고가교', 1),
+('橋', '高架橋', '고가교', 2),
+('高', '高校', '고교', 0),
+('校', '高校', '고교', 1),
+('高', '高校生', '고교생', 0),
+('校', '高校生', '고교생', 1),
+('生', '高校生', '고교생', 2),
+('高', '高梁酒', '고량주', 0),
+('梁', '高梁酒', '고량주', 1),
+('酒', '高梁酒', '고량주', 2),
+('高', '高段數', '고단수', 0),
+('段', '高段數', '고단수', 1),
+('數', '高段數', '고단수', 2),
+('高', '高氣壓', '고기압', 0),
+('氣', '高氣壓', '고기압', 1),
+('壓', '高氣壓', '고기압', 2),
+('高', '高溫', '고온', 0),
+('溫', '高溫', '고온', 1),
+('高', '高潮', '고조', 0),
+('潮', '高潮', '고조', 1),
+('高', '高熱', '고열', 0),
+('熱', '高熱', '고열', 1),
+('高', '高爐', '고로', 0),
+('爐', '高爐', '고로', 1),
+('高', '高率', '고율', 0),
+('率', '高率', '고율', 1),
+('高', '高祖母', '고조모', 0),
+('祖', '高祖母', '고조모', 1),
+('母', '高祖母', '고조모', 2),
+('高', '高祖父', '고조부', 0),
+('祖', '高祖父', '고조부', 1),
+('父', '高祖父', '고조부', 2),
+('高', '高空', '고공', 0),
+('空', '高空', '고공', 1),
+('高', '高等', '고등', 0),
+('等', '高等', '고등', 1),
+('高', '高等學校', '고등학교', 0),
+('等', '高等學校', '고등학교', 1),
+('學', '高等學校', '고등학교', 2),
+('校', '高等學校', '고등학교', 3),
+('高', '高等學生', '고등학생', 0),
+('等', '高等學生', '고등학생', 1),
+('學', '高等學生', '고등학생', 2),
+('生', '高等學生', '고등학생', 3),
+('高', '高等小學校', '고등소학교', 0),
+('等', '高等小學校', '고등소학교', 1),
+('小', '高等小學校', '고등소학교', 2),
+('學', '高等小學校', '고등소학교', 3),
+('校', '高等小學校', '고등소학교', 4),
+('高', '高等敎育', '고등교육', 0),
+('等', '高等敎育', '고등교육', 1),
+('敎', '高等敎育', '고등교육', 2),
+('育', '高等敎育', '고등교육', 3),
+('高', '高級', '고급', 0),
+('級', '高級', '고급', 1),
+('高', '高級 脂肪酸', '고급 지방산', 0),
+('級', '高級 脂肪酸', '고급 지방산', 1),
+('脂', '高級 脂肪酸', '고급 지방산', 3),
+('肪', '高級 脂肪酸', '고급 지방산', 4),
+('酸', '高級 脂肪酸', '고급 지방산', 5),
+('高', '高聲', '고성', 0),
+('聲', '高聲', '고성', 1),
+('高', '高脂血症', '고지혈증', 0),
+('脂', '高脂血症', '고지혈증', 1),
+('血', '高脂血症', '고지혈증', 2),
+('症', '高脂血症', '고지혈증', 3),
+('高', '高臺', '고대', 0),
+('臺', '高臺', '고대', 1),
+('高', '高血壓', '고혈압', 0),
+('血', '高血壓', '고혈압', 1),
+('壓', '高血壓', '고혈압', 2),
+('高', '高速', '고속', 0),
+('速', '高速', '고속', 1),
+('高', '高速 道路', '고속 도로', 0),
+('速', '高速 道路', '고속 도로', 1),
+('道', '高速 道路', '고속 도로', 3),
+('路', '高速 道路', '고속 도로', 4),
+('高', '高速--', '고속버스', 0),
+('速', '高速--', '고속버스', 1),
+('-', '高速--', '고속버스', 2),
+('-', '高速--', '고속버스', 3),
+('高', '高速道路', '고속도로', 0),
+('速', '高速道路', '고속도로', 1),
+('道', '高速道路', '고속도로', 2),
+('路', '高速道路', '고속도로', 3),
+('高', '高道', '고도', 0),
+('道', '高道', '고도', 1),
+('高', '高雅', '고아', 0),
+('雅', '高雅', '고아', 1),
+('高', '高飛', '고비', 0),
+('飛', '高飛', '고비', 1),
+('高', '高騰', '고등', 0),
+('騰', '高騰', '고등', 1),
+('高', '高體溫', '고체온', 0),
+('體', '高體溫', '고체온', 1),
+('溫', '高體溫', '고체온', 2),
+('高', '高麗', '고려', 0),
+('麗', '高麗', '고려', 1),
+('鬚', '鬚髥', '수염', 0),
+('髥', '鬚髥', '수염', 1),
+('鬚', '鬚髥수리', '수염수리', 0),
+('髥', '鬚髥수리', '수염수리', 1),
+('수', '鬚髥수리', '수염수리', 2),
+('리', '鬚髥수리', '수염수리', 3),
+('鬪', '鬪士', '투사', 0),
+('士', '鬪士', '투사', 1),
+('鬪', '鬪爭', '투쟁', 0),
+('爭', '鬪爭', '투쟁', 1),
+('鬪', '鬪病', '투병', 0),
+('病', '鬪病', '투병', 1),
+('鬪', '鬪鷄', '투계', 0),
+('鷄', '鬪鷄', '투계', 1),
+('鬱', '鬱勃', '울발', 0),
+('勃', '鬱勃', '울발', 1),
+('鬱', '鬱憤', '울분', 0),
+('憤', '鬱憤', '울분', 1),
+('鬼', '鬼哭', '귀곡', 0),
+('哭', '鬼哭', '귀곡', 1),
+('鬼', '鬼哭聲', '귀곡성', 0),
+('哭', '鬼哭聲', '귀곡성', 1),
+('聲', '鬼哭聲', '귀곡성', 2),
+('鬼', '鬼女', '귀녀', 0),
+('女', '鬼女', '귀녀', 1),
+('鬼', '鬼才', '귀재', 0),
+('才', '鬼才', '귀재', 1),
+('鬼', '鬼接', '귀접', 0),
+('接', '鬼接', '귀접', 1),
+('鬼', '鬼神', '귀신', 0),
+('神', '鬼神', '귀신', 1),
+('魂', '魂', '혼', 0),
+('魂', '魂--', '혼나다', 0),
+('-', '魂--', '혼나다', 1),
+('-', '魂--', '혼나다', 2),
+('魂', '魂靈', '혼령', 0),
+('靈', '魂靈', '혼령', 1),
+('魂', '魂飛魄散', '혼비백산', 0),
+('飛', '魂飛魄散', '혼비백산', 1),
+('魄', '魂飛魄散', '혼비백산', 2),
+('散', '魂飛魄散', '혼비백산', 3),
+('魂', '魂魄', '혼백', 0),
+('魄', '魂魄', '혼백', 1),
+('魅', '魅力', '매력', 0),
+('力', '魅力', '매력', 1),
+('魅', '魅惑', '매혹', 0),
+('惑', '魅惑', '매혹', 1),
+('魔', '魔', '마', 0),
+('魔', '魔力', '마력', 0),
+('力', '魔力', '마력', 1),
+('魔', '魔女', '마녀', 0),
+('女', '魔女', '마녀', 1),
+('魔', '魔法', '마법', 0),
+('法', '魔法', '마법', 1),
+('魔', '魔法少女', '마법소녀', 0),
+('法', '魔法少女', '마법소녀', 1),
+('少', '魔法少女', '마법소녀', 2),
+('女', '魔法少女', '마법소녀', 3),
+('魔', '魔法師', '마법사', 0),
+('法', '魔法師', '마법사', 1),
+('師', '魔法師', '마법사', 2),
+('魔', '魔王', '마왕', 0),
+('王', '魔王', '마왕', 1),
+('魔', '魔球', '마구', 0),
+('球', '魔球', '마구', 1),
+('魔', '魔術', '마술', 0),
+('術', '魔術', '마술', 1),
+('魔', '魔術師', '마술사', 0),
+('術', '魔術師', '마술사', 1),
+('師', '魔術師', '마술사', 2),
+('魔', '魔道', '마도', 0),
+('道', '魔道', '마도', 1),
+('魔', '魔鬼', '마귀', 0),
+('鬼', '魔鬼', '마귀', 1),
+('魚', '魚介', '어개', 0),
+('介', '魚介', '어개', 1),
+('魚', '魚卵', '어란', 0),
+('卵', '魚卵', '어란', 1),
+('魚', '魚尾', '어미', 0),
+('尾', '魚尾', '어미', 1),
+('魚', '魚市場', '어시장', 0),
+('市', '魚市場', '어시장', 1),
+('場', '魚市場', '어시장', 2),
+('魚', '魚油', '어유', 0),
+('油', '魚油', '어유', 1),
+('魚', '魚白', '어백', 0),
+('白', '魚白', '어백', 1),
+('魚', '魚粉', '어분', 0),
+('粉', '魚粉', '어분', 1),
+('魚', '魚網', '어망', 0),
+('網', '魚網', '어망', 1),
+('魚', '魚缸', '어항', 0),
+('缸', '魚缸', '어항', 1),
+('魚', '魚肉', '어육', 0),
+('肉', '魚肉', '어육', 1),
+('魚', '魚論', '어론', 0),
+('論', '魚論', '어론', 1),
+('魚', '魚道', '어도', 0),
+('道', '魚道', '어도', 1),
+('魚', '魚醬', '어장', 0),
+('醬', '魚醬', '어장', 1),
+('魚', '魚雷', '어뢰', 0),
+('雷', '魚雷', '어뢰', 1),
+('魚', '魚香', '어향', 0),
+('香', '魚香', '어향', 1),
+('魚', '魚龍', '어룡', 0),
+('龍', '魚龍', '어룡', 1),
+('魯', '魯', '노', 0),
+('魴', '魴魚', '방어', 0),
+('魚', '魴魚', '방어', 1),
+('鮟', '鮟鱇', '안강', 0),
+('鱇', '鮟鱇', '안강', 1),
+('鮮', '鮮卑', '선비', 0),
+('卑', '鮮卑', '선비', 1),
+('鮮', '鮮度', '선도', 0),
+('度', '鮮度', '선도', 1),
+('鮮', '鮮明', '선명', 0),
+('明', '鮮明', '선명', 1),
+('鮮', '鮮血', '선혈', 0),
+('血', '鮮血', '선혈', 1),
+('鯤', '鯤鮞', '곤이', 0),
+('鮞', '鯤鮞', '곤이', 1),
+('鯨', '鯨油', '경유', 0),
+('油', '鯨油', '경유', 1),
+('鯨', '鯨鯢', '경예', 0),
+('鯢', '鯨鯢', '경예', 1),
+('鰐', '鰐魚', '악어', 0),
+('魚', '鰐魚', '악어', 1),
+('鰒', '鰒', '복', 0),
+('鰱', '鰱魚', '연어', 0),
+('魚', '鰱魚', '연어', 1),
+('鳥', '鳥瞰', '조감', 0),
+('瞰', '鳥瞰', '조감', 1),
+('鳥', '鳥瞰圖', '조감도', 0),
+('瞰', '鳥瞰圖', '조감도', 1),
+('圖', '鳥瞰圖', '조감도', 2),
+('鳥', '鳥類學', '조류학', 0),
+('類', '鳥類學', '조류학', 1),
+('學', '鳥類學', '조류학', 2),
+('鳳', '鳳', '봉', 0),
+('鳳', '鳳仙花', '봉선화', 0),
+('仙', '鳳仙花', '봉선화', 1),
+('花', '鳳仙花', '봉선화', 2),
+('鳳', '鳳凰', '봉황', 0),
+('凰', '鳳凰', '봉황', 1),
+('鳳', '鳳簫', '봉소', 0),
+('簫', '鳳簫', '봉소', 1),
+('鳴', '鳴動', '명동', 0),
+('動', '鳴動', '명동', 1),
+('鳴', '鳴禽', '명금', 0),
+('禽', '鳴禽', '명금', 1),
+('鳴', '鳴管', '명관', 0),
+('管', '鳴管', '명관', 1),
+('鴉', '鴉片', '아편', 0),
+('片', '鴉片', '아편', 1),
+('鴛', '鴛鴦', '원앙', 0),
+('鴦', '鴛鴦', '원앙', 1),
+('鴛', '鴛鴦四寸', '원앙사촌', 0),
+('鴦', '鴛鴦四寸', '원앙사촌', 1),
+('四', '鴛鴦四寸', '원앙사촌', 2),
+('寸', '鴛鴦四寸', '원앙사촌', 3),
+('鴨', '鴨綠江', '압록강', 0),
+('綠', '鴨綠江', '압록강', 1),
+('江', '鴨綠江', '압록강', 2),
+('鵜', '鵜鶘', '제호', 0),
+('鶘', '鵜鶘', '제호', 1),
+('鶴', '鶴', '학', 0),
+('鶺', '鶺鴒', '척령', 0),
+('鴒', '鶺鴒', '척령', 1),
+('鷄', '鷄卵', '계란', 0),
+('卵', '鷄卵', '계란', 1),
+('鷄', '鷄卵有骨', '계란유골', 0),
+('卵', '鷄卵有骨', '계란유골', 1),
+('有', '鷄卵有骨', '계란유골', 2),
+('骨', '鷄卵有骨', '계란유골', 3),
+('鷄', '鷄卵찜', '계란찜', 0),
+('卵', '鷄卵찜', '계란찜', 1),
+('찜', '鷄卵찜', '계란찜', 2),
+('鷄', '鷄姦', '계간', 0),
+('姦', '鷄姦', '계간', 1),
+('鷄', '鷄林', '계림', 0),
+('林', '鷄林', '계림', 1),
+('鷙', '鷙勇', '지용', 0),
+('勇', '鷙勇', '지용', 1),
+('鷙', '鷙鳥', '지조', 0),
+('鳥', '鷙鳥', '지조', 1),
+('鸚', '鸚鵡', '앵무', 0),
+('鵡', '鸚鵡', '앵무', 1),
+('鸚', '鸚鵡새', '앵무새', 0),
+('鵡', '鸚鵡새', '앵무새', 1),
+('새', '鸚鵡새', '앵무새', 2),
+('鹵', '鹵獲', '노획', 0),
+('獲', '鹵獲', '노획', 1),
+('鹵', '鹵獲', '로획', 0),
+('獲', '鹵獲', '로획', 1),
+('鹼', '鹼化', '감화', 0),
+('化', '鹼化', '감화', 1),
+('鹽', '鹽', '염', 0),
+('鹽', '鹽化', '염화', 0),
+('化', '鹽化', '염화', 1),
+('鹽', '鹽化 水素', '염화 수소', 0),
+('化', '鹽化 水素', '염화 수소', 1),
+('水', '鹽化 水素', '염화 수소', 3),
+('素', '鹽化 水素', '염화 수소', 4),
+('鹽', '鹽基', '염기', 0),
+('基', '鹽基', '염기', 1),
+('鹽', '鹽水', '염수', 0),
+('水', '鹽水', '염수', 1),
+('鹽', '鹽湖', '염호', 0),
+('湖', '鹽湖', '염호', 1),
+('鹽', '鹽田', '염전', 0),
+('田', '鹽田', '염전', 1),
+('鹽', '鹽素', '염소', 0),
+('素', '鹽素', '염소', 1),
+('鹽', '鹽藏', '염장', 0),
+('藏', '鹽藏', '염장', 1),
+('鹽', '鹽貨', '염화', 0),
+('貨', '鹽貨', '염화', 1),
+('鹽', '鹽酸', '염산', 0),
+('酸', '鹽酸', '염산', 1),
+('鹿', '鹿角', '녹각', 0),
+('角', '鹿角', '녹각', 1),
+('麒', '麒麟', '기린', 0),
+('麟', '麒麟', '기린', 1),
+('麒', '麒麟羚羊', '기린영양', 0),
+('麟', '麒麟羚羊', '기린영양', 1),
+('羚', '麒麟羚羊', '기린영양', 2),
+('羊', '麒麟羚羊', '기린영양', 3),
+('麝', '麝香', '사향', 0),
+('香', '麝香', '사향', 1),
+('麝', '麝香고양이', '사향고양이', 0),
+('香', '麝香고양이', '사향고양이', 1),
+('고', '麝香고양이', '사향고양이', 2),
+('양', '麝香고양이', '사향고양이', 3),
+('이', '麝香고양이', '사향고양이', 4),
+('麥', '麥嶺', '맥령', 0),
+('嶺', '麥嶺', '맥령', 1),
+('麥', '麥秋', '맥추', 0),
+('秋', '麥秋', '맥추', 1),
+('麥', '麥芽', '맥아', 0),
+('芽', '麥芽', '맥아', 1),
+('麥', '麥芽糖', '맥아당', 0),
+('芽', '麥芽糖', '맥아당', 1),
+('糖', '麥芽糖', '맥아당', 2),
+('麥', '麥茶', '맥다', 0),
+('茶', '麥茶', '맥다', 1),
+('麥', '麥酒', '맥주', 0),
+('酒', '麥酒', '맥주', 1),
+('麴', '麴菌', '국균', 0),
+('菌', '麴菌', '국균', 1),
+('麵', '麵', '면', 0),
+('麵', '麵棒', '면봉', 0),
+('棒', '麵棒', '면봉', 1),
+('麵', '麵類', '면류', 0),
+('類', '麵類', '면류', 1),
+('麵', '麵麭', '면포', 0),
+('麭', '麵麭', '면포', 1),
+('麵', '麵발', '면발', 0),
+('발', '麵발', '면발', 1),
+('麻', '麻', '마', 0),
+('麻', '麻姑', '마고', 0),
+('姑', '麻姑', '마고', 1),
+('麻', '麻婆豆腐', '마파두부', 0),
+('婆', '麻婆豆腐', '마파두부', 1),
+('豆', '麻婆豆腐', '마파두부', 2),
+('腐', '麻婆豆腐', '마파두부', 3),
+('麻', '麻將', '마장', 0),
+('將', '麻將', '마장', 1),
+('麻', '麻痺', '마비', 0),
+('痺', '麻痺', '마비', 1),
+('麻', '麻立干', '마립간', 0),
+('立', '麻立干', '마립간', 1),
+('干', '麻立干', '마립간', 2),
+('麻', '麻莖', '마경', 0),
+('莖', '麻莖', '마경', 1),
+('麻', '麻藥', '마약', 0),
+('藥', '麻藥', '마약', 1),
+('麻', '麻雀', '마작', 0),
+('雀', '麻雀', '마작', 1),
+('黃', '黃', '황', 0),
+('黃', '黃帝', '황제', 0),
+('帝', '黃帝', '황제', 1),
+('黃', '黃昏', '황혼', 0),
+('昏', '黃昏', '황혼', 1),
+('黃', '黃河', '황하', 0),
+('河', '黃河', '황하', 1),
+('黃', '黃泉', '황천', 0),
+('泉', '黃泉', '황천', 1),
+('黃', '黃海', '황해', 0),
+('海', '黃海', '황해', 1),
+('黃', '黃海北道', '황해북도', 0),
+('海', '黃海北道', '황해북도', 1),
+('北', '黃海北道', '황해북도', 2),
+('道', '黃海北道', '황해북도', 3),
+('黃', '黃海南道', '황해남도', 0),
+('海', '黃海南道', '황해남도', 1),
+('南', '黃海南道', '황해남도', 2),
+('道', '黃海南道', '황해남도', 3),
+('黃', '黃海道', '황해도', 0),
+('海', '黃海道', '황해도', 1),
+('道', '黃海道', '황해도', 2),
+('黃', '黃玉', '황옥', 0),
+('玉', '黃玉', '황옥', 1),
+('黃', '黃砂', '황사', 0),
+('砂', '黃砂', '황사', 1),
+('黃', '黃紙', '황지', 0),
+('紙', '黃紙', '황지', 1),
+('黃', '黃色', '황색', 0),
+('色', '黃色', '황색', 1),
+('黃', '黃花九輪草', '황화구륜초', 0),
+('花', '黃花九輪草', '황화구륜초', 1),
+('九', '黃花九輪草', '황화구륜초', 2),
+('輪', '黃花九輪草', '황화구륜초', 3),
+('草', '黃花九輪草', '황화구륜초', 4),
+('黃', '黃連', '황련', 0),
+('連', '黃連', '황련', 1),
+('黃', '黃道', '황도', 0),
+('道', '黃道', '황도', 1),
+('黃', '黃酸', '황산', 0),
+('酸', '黃酸', '황산', 1),
+('黃', '黃金', '황금', 0),
+('金', '黃金', '황금', 1),
+('黃', '黃銅', '황동', 0),
+('銅', '黃銅', '황동', 1),
+('黃', '黃雀', '황작', 0),
+('雀', '黃雀', '황작', 1),
+('黃', '黃鶴樓', '황학루', 0),
+('鶴', '黃鶴樓', '황학루', 1),
+('樓', '黃鶴樓', '황학루', 2),
+('黃', '黃鷺', '황로', 0),
+('鷺', '黃鷺', '황로', 1),
+('黃', '黃麻', '황마', 0),
+('麻', '黃麻', '황마', 1),
+('黃', '黃오리', '황오리', 0),
+('오', '黃오리', '황오리', 1),
+('리', '黃오리', '황오리', 2),
+('黎', '黎明', '여명', 0),
+('明', '黎明', '여명', 1),
+('黎', '黎民', '려민', 0),
+('民', '黎民', '려민', 1),
+('黎', '黎民', '여민', 0),
+('民', '黎民', '여민', 1),
+('黑', '黑', '흑', 0),
+('黑', '黑人', '흑인', 0),
+('人', '黑人', '흑인', 1),
+('黑', '黑兄', '흑형', 0),
+('兄', '黑兄', '흑형', 1),
+('黑', '黑化', '흑화', 0),
+('化', '黑化', '흑화', 1),
+('黑', '黑字', '흑자', 0),
+('字', '黑字', '흑자', 1),
+('黑', '黑板', '흑판', 0),
+('板', '黑板', '흑판', 1),
+('黑', '黑業', '흑업', 0),
+('業', '黑業', '흑업', 1),
+('黑', '黑歷史', '흑역사', 0),
+('歷', '黑歷史', '흑역사', 1),
+('史', '黑歷史', '흑역사', 2),
+('黑', '黑死病', '흑사병', 0),
+('死', '黑死病', '흑사병', 1),
+('病', '黑死病', '흑사병', 2),
+('黑', '黑洞', '흑동', 0),
+('洞', '黑洞', '흑동', 1),
+('黑', '黑海', '흑해', 0),
+('海', '黑海', '흑해', 1),
+('黑', '黑牛', '흑우', 0),
+('牛', '黑牛', '흑우', 1),
+('黑', '黑白', '흑백', 0),
+('白', '黑白', '흑백', 1),
+('黑', '黑色', '흑색', 0),
+('色', '黑色', '흑색', 1),
+('黑', '黑色症', '흑색증', 0),
+('色', '黑色症', '흑색증', 1),
+('症', '黑色症', '흑색증', 2),
+('黑', '黑色腫', '흑색종', 0),
+('色', '黑色腫', '흑색종', 1),
+('腫', '黑色腫', '흑색종', 2),
+('黑', '黑鉛', '흑연', 0),
+('鉛', '黑鉛', '흑연', 1),
+('黑', '黑雪糖', '흑설탕', 0),
+('雪', '黑雪糖', '흑설탕', 1),
+('糖', '黑雪糖', '흑설탕', 2),
+('黑', '黑騎士', '흑기사', 0),
+('騎', '黑騎士', '흑기사', 1),
+('士', '黑騎士', '흑기사', 2),
+('黑', '黑體', '흑체', 0),
+('體', '黑體', '흑체', 1),
+('黑', '黑髮', '흑발', 0),
+('髮', '黑髮', '흑발', 1),
+('黑', '黑鷺', '흑로', 0),
+('鷺', '黑鷺', '흑로', 1),
+('黑', '黑點', '흑점', 0),
+('點', '黑點', '흑점', 1),
+('黑', '黑龍江', '흑룡강', 0),
+('龍', '黑龍江', '흑룡강', 1),
+('江', '黑龍江', '흑룡강', 2),
+('黑', '黑기러기', '흑기러기', 0),
+('기', '黑기러기', '흑기러기', 1),
+('러', '黑기러기', '흑기러기', 2),
+('기', '黑기러기', '흑기러기', 3),
+('默', '默念', '묵념', 0),
+('念', '默念', '묵념', 1),
+('默', '默想', '묵상', 0),
+('想', '默想', '묵상', 1),
+('默', '默殺', '묵살', 0),
+('殺', '默殺', '묵살', 1),
+('默', '默珠', '묵주', 0),
+('珠', '默珠', '묵주', 1),
+('默', '默示', '묵시', 0),
+('示', '默示', '묵시', 1),
+('默', '默禱', '묵도', 0),
+('禱', '默禱', '묵도', 1),
+('默', '默考', '묵고', 0),
+('考', '默考', '묵고', 1),
+('默', '默認', '묵인', 0),
+('認', '默認', '묵인', 1),
+('黙', '黙示', '묵시', 0),
+('示', '黙示', '묵시', 1),
+('點', '點', '점', 0),
+('點', '點呼', '점호', 0),
+('呼', '點呼', '점호', 1),
+('點', '點字', '점자', 0),
+('字', '點字', '점자', 1),
+('點', '點對稱', '점대칭', 0),
+('對', '點對稱', '점대칭', 1),
+('稱', '點對稱', '점대칭', 2),
+('點', '點心', '점심', 0),
+('心', '點心', '점심', 1),
+('點', '點心時間', '점심시간', 0),
+('心', '點心時間', '점심시간', 1),
+('時', '點心時間', '점심시간', 2),
+('間', '點心時間', '점심시간', 3),
+('點', '點數', '점수', 0),
+('數', '點數', '점수', 1),
+('點', '點檢', '점검', 0),
+('檢', '點檢', '점검', 1),
+('點', '點滅', '점멸', 0),
+('滅', '點滅', '점멸', 1),
+('點', '點火', '점화', 0),
+('火', '點火', '점화', 1),
+('點', '點眼', '점안', 0),
+('眼', '點眼', '점안', 1),
+('點', '點線', '점선', 0),
+('線', '點線', '점선', 1),
+('點', '點點點', '점점점', 0),
+('點', '點點點', '점점점', 1),
+('點', '點點點', '점점점', 2),
+('黨', '黨', '당', 0),
+('黨', '黨中央', '당중앙', 0),
+('中', '黨中央', '당중앙', 1),
+('央', '黨中央', '당중앙', 2),
+('黨', '黨人', '당인', 0),
+('人', '黨人', '당인', 1),
+('黨', '黨員', '당원', 0),
+('員', '黨員', '당원', 1),
+('黨', '黨派', '당파', 0),
+('派', '黨派', '당파', 1),
+('黨', '黨章', '당장', 0),
+('章', '黨章', '당장', 1),
+('黨', '黨葬', '당장', 0),
+('葬', '黨葬', '당장', 1),
+('黨', '黨마크', '당마크', 0),
+('마', '黨마크', '당마크', 1),
+('크', '黨마크', '당마크', 2),
+('鼎', '鼎食', '정식', 0),
+('食', '鼎食', '정식', 1),
+('鼓', '鼓動', '고동', 0),
+('動', '鼓動', '고동', 1),
+('鼓', '鼓吹', '고취', 0),
+('吹', '鼓吹', '고취', 1),
+('鼓', '鼓吹樂', '고취악', 0),
+('吹', '鼓吹樂', '고취악', 1),
+('樂', '鼓吹樂', '고취악', 2),
+('鼓', '鼓手', '고수', 0),
+('手', '鼓手', '고수', 1),
+('鼓', '鼓膜', '고막', 0),
+('膜', '鼓膜', '고막', 1),
+('鼓', '鼓舞', '고무', 0),
+('舞', '鼓舞', '고무', 1),
+('鼠', '鼠姑', '서고', 0),
+('姑', '鼠姑', '서고', 1),
+('鼠', '鼠蹊', '서혜', 0),
+('蹊', '鼠蹊', '서혜', 1),
+('鼻', '鼻炎', '비염', 0),
+('炎', '鼻炎', '비염', 1),
+('鼻', '鼻門', '비문', 0),
+('門', '鼻門', '비문', 1),
+('鼻', '鼻音', '비음', 0),
+('音', '鼻音', '비음', 1),
+('齊', '齊唱', '제창', 0),
+('唱', '齊唱', '제창', 1),
+('齋', '齋戒', '재계', 0),
+('戒', '齋戒', '재계', 1),
+('齒', '齒-', '칫솔', 0),
+('-', '齒-', '칫솔', 1),
+('齒', '齒列', '치열', 0),
+('列', '齒列', '치열', 1),
+('齒', '齒垢', '치구', 0),
+('垢', '齒垢', '치구', 1),
+('齒', '齒牙', '치아', 0),
+('牙', '齒牙', '치아', 1),
+('齒', '齒痛', '치통', 0),
+('痛', '齒痛', '치통', 1),
+('齒', '齒石', '치석', 0),
+('石', '齒石', '치석', 1),
+('齒', '齒科', '치과', 0),
+('科', '齒科', '치과', 1),
+('齒', '齒藥', '치약', 0),
+('藥', '齒藥', '치약', 1),
+('齒', '齒髓', '치수', 0),
+('髓', '齒髓', '치수', 1),
+('齧', '齧齒類', '설치류', 0),
+('齒', '齧齒類', '설치류', 1),
+('類', '齧齒類', '설치류', 2),
+('齷', '齷齪', '악착', 0),
+('齪', '齷齪', '악착', 1),
+('龍', '龍', '룡', 0),
+('龍', '龍', '용', 0),
+('龍', '龍台', '용대', 0),
+('台', '龍台', '용대', 1),
+('龍', '龍果', '용과', 0),
+('果', '龍果', '용과', 1),
+('龍', '龍涎香', '용연향', 0),
+('涎', '龍涎香', '용연향', 1),
+('香', '龍涎香', '용연향', 2),
+('龍', '龍眼', '용안', 0),
+('眼', '龍眼', '용안', 1),
+('龍', '龍舌蘭', '용설란', 0),
+('舌', '龍舌蘭', '용설란', 1),
+('蘭', '龍舌蘭', '용설란', 2),
+('龍', '龍飛御天歌', '용비어천가', 0),
+('飛', '龍飛御天歌', '용비어천가', 1),
+('御', '龍飛御天歌', '용비어천가', 2),
+('天', '龍飛御天歌', '용비어천가', 3),
+('歌', '龍飛御天歌', '용비어천가', 4),
+('龍', '龍鬚鐵', '용수철', 0),
+('鬚', '龍鬚鐵', '용수철', 1),
+('鐵', '龍鬚鐵', '용수철', 2),
+('龜', '龜城', '구성', 0),
+('城', '龜城', '구성', 1),
+('龜', '龜尾', '구미', 0),
+('尾', '龜尾', '구미', 1),
+('龜', '龜鑑', '귀감', 0),
+('鑑', '龜鑑', '귀감', 1),
+('龜', '龜頭', '귀두', 0),
+('頭', '龜頭', '귀두', 1),
+('가', '가나다順', '가나다순', 0),
+('나', '가나다順', '가나다순', 1),
+('다', '가나다順', '가나다순', 2),
+('順', '가나다順', '가나다순', 3),
+('가', '가위바위褓', '가위바위보', 0),
+('위', '가위바위褓', '가위바위보', 1),
+('바', '가위바위褓', '가위바위보', 2),
+('위', '가위바위褓', '가위바위보', 3),
+('褓', '가위바위褓', '가위바위보', 4),
+('갈', '갈비湯', '갈비탕', 0),
+('비', '갈비湯', '갈비탕', 1),
+('湯', '갈비湯', '갈비탕', 2),
+('개', '개醬', '개장', 0),
+('醬', '개醬', '개장', 1),
+('개', '개醬국', '개장국', 0),
+('醬', '개醬국', '개장국', 1),
+('국', '개醬국', '개장국', 2),
+('고', '고딕體', '고딕체', 0),
+('딕', '고딕體', '고딕체', 1),
+('體', '고딕體', '고딕체', 2),
+('곤', '곤色', '곤색', 0),
+('色', '곤色', '곤색', 1),
+('골', '골草', '골초', 0),
+('草', '골草', '골초', 1),
+('곱', '곱사鰱魚', '곱사연어', 0),
+('사', '곱사鰱魚', '곱사연어', 1),
+('鰱', '곱사鰱魚', '곱사연어', 2),
+('魚', '곱사鰱魚', '곱사연어', 3),
+('교', '교량', '다리', 0),
+('량', '교량', '다리', 1),
+('그', '그女', '그녀', 0),
+('女', '그女', '그녀', 1),
+('그', '그라프 理論', '그라프 리론', 0),
+('라', '그라프 理論', '그라프 리론', 1),
+('프', '그라프 理論', '그라프 리론', 2),
+('理', '그라프 理論', '그라프 리론', 4),
+('論', '그라프 理論', '그라프 리론', 5),
+('그', '그림冊', '그림책', 0),
+('림', '그림冊', '그림책', 1),
+('冊', '그림冊', '그림책', 2),
+('글', '글體', '글체', 0),
+('體', '글體', '글체', 1),
+('기', '기둥書房', '기둥서방', 0),
+('둥', '기둥書房', '기둥서방', 1),
+('書', '기둥書房', '기둥서방', 2),
+('房', '기둥書房', '기둥서방', 3),
+('기', '기름醬', '기름장', 0),
+('름', '기름醬', '기름장', 1),
+('醬', '기름醬', '기름장', 2),
+('꼬', '꼬리票', '꼬리표', 0),
+('리', '꼬리票', '꼬리표', 1),
+('票', '꼬리票', '꼬리표', 2),
+('낱', '낱字', '낱자', 0),
+('字', '낱字', '낱자', 1),
+('내', '내로남不', '내로남불', 0),
+('로', '내로남不', '내로남불', 1),
+('남', '내로남不', '내로남불', 2),
+('不', '내로남不', '내로남불', 3),
+('노', '노랑부리白鷺', '노랑부리백로', 0),
+('랑', '노랑부리白鷺', '노랑부리백로', 1),
+('부', '노랑부리白鷺', '노랑부리백로', 2),
+('리', '노랑부리白鷺', '노랑부리백로', 3),
+('白', '노랑부리白鷺', '노랑부리백로', 4),
+('鷺', '노랑부리白鷺', '노랑부리백로', 5),
+('놀', '놀이公園', '놀이공원', 0),
+('이', '놀이公園', '놀이공원', 1),
+('公', '놀이公園', '놀이공원', 2),
+('園', '놀이公園', '놀이공원', 3),
+('놀', '놀이機構', '놀이기구', 0),
+('이', '놀이機構', '놀이기구', 1),
+('機', '놀이機構', '놀이기구', 2),
+('構', '놀이機構', '놀이기구', 3),
+('닉', '닉스타말化', '닉스타말화', 0),
+('스', '닉스타말化', '닉스타말화', 1),
+('타', '닉스타말化', '닉스타말화', 2),
+('말', '닉스타말化', '닉스타말화', 3),
+('化', '닉스타말化', '닉스타말화', 4),
+('단', '단고기湯', '단고기탕', 0),
+('고', '단고기湯', '단고기탕', 1),
+('기', '단고기湯', '단고기탕', 2),
+('湯', '단고기湯', '단고기탕', 3),
+('달', '달팽이管', '달팽이관', 0),
+('팽', '달팽이管', '달팽이관', 1),
+('이', '달팽이管', '달팽이관', 2),
+('管', '달팽이管', '달팽이관', 3),
+('돈', '돈票', '돈표', 0),
+('票', '돈票', '돈표', 1),
+('된', '된醬', '된장', 0),
+('醬', '된醬', '된장', 1),
+('뒷', '뒷面', '뒷면', 0),
+('面', '뒷面', '뒷면', 1),
+('등', '등沐', '등목', 0),
+('沐', '등沐', '등목', 1),
+('따', '따옴標', '따옴표', 0),
+('옴', '따옴標', '따옴표', 1),
+('標', '따옴標', '따옴표', 2),
+('땅', '땅크兵', '땅크병', 0),
+('크', '땅크兵', '땅크병', 1),
+('兵', '땅크兵', '땅크병', 2),
+('라', '라오語', '라오어', 0),
+('오', '라오語', '라오어', 1),
+('語', '라오語', '라오어', 2),
+('레', '레토르트  食', '레토르트 식품', 0),
+('토', '레토르트  食', '레토르트 식품', 1),
+('르', '레토르트  食', '레토르트 식품', 2),
+('트', '레토르트  食', '레토르트 식품', 3),
+('食', '레토르트  食', '레토르트 식품', 6),
+('로', '로마字', '로마자', 0),
+('마', '로마字', '로마자', 1),
+('字', '로마字', '로마자', 2),
+('막', '막場', '막장', 0),
+('場', '막場', '막장', 1),
+('막', '막杖', '막장', 0),
+('杖', '막杖', '막장', 1),
+('막', '막醬', '막장', 0),
+('醬', '막醬', '막장', 1),
+('말', '말套', '말투', 0),
+('套', '말套', '말투', 1),
+('멍', '멍멍湯', '멍멍탕', 0),
+('멍', '멍멍湯', '멍멍탕', 1),
+('湯', '멍멍湯', '멍멍탕', 2),
+('메', '메서드 演技', '메서드 연기', 0),
+('서', '메서드 演技', '메서드 연기', 1),
+('드', '메서드 演技', '메서드 연기', 2),
+('演', '메서드 演技', '메서드 연기', 4),
+('技', '메서드 演技', '메서드 연기', 5),
+('메', '메소드 演技', '메소드 연기', 0),
+('소', '메소드 演技', '메소드 연기', 1),
+('드', '메소드 演技', '메소드 연기', 2),
+('演', '메소드 演技', '메소드 연기', 4),
+('技', '메소드 演技', '메소드 연기', 5),
+('모', '모種', '모종', 0),
+('種', '모種', '모종', 1),
+('모', '모래箱子', '모래상자', 0),
+('래', '모래箱子', '모래상자', 1),
+('箱', '모래箱子', '모래상자', 2),
+('子', '모래箱子', '모래상자', 3),
+('몽', '몽골斑', '몽골반', 0),
+('골', '몽골斑', '몽골반', 1),
+('斑', '몽골斑', '몽골반', 2),
+('무', '무게感', '무게감', 0),
+('게', '무게感', '무게감', 1),
+('感', '무게感', '무게감', 2),
+('바', '바다色', '바다색', 0),
+('다', '바다色', '바다색', 1),
+('色', '바다色', '바다색', 2),
+('바', '바람壁', '바람벽', 0),
+('람', '바람壁', '바람벽', 1),
+('壁', '바람壁', '바람벽', 2),
+('발', '발病', '발병', 0),
+('病', '발病', '발병', 1),
+('발', '발트海', '발트해', 0),
+('트', '발트海', '발트해', 1),
+('海', '발트海', '발트해', 2),
+('밤', '밤中', '밤중', 0),
+('中', '밤中', '밤중', 1),
+('밥', '밥床', '밥상', 0),
+('床', '밥床', '밥상', 1),
+('배', '배便', '배편', 0),
+('便', '배便', '배편', 1),
+('베', '베레帽', '베레모', 0),
+('레', '베레帽', '베레모', 1),
+('帽', '베레帽', '베레모', 2),
+('벵', '벵골語', '벵골어', 0),
+('골', '벵골語', '벵골어', 1),
+('語', '벵골語', '벵골어', 2),
+('불', '불常놈', '불상놈', 0),
+('常', '불常놈', '불상놈', 1),
+('놈', '불常놈', '불상놈', 2),
+('붉', '붉은  軍', '붉은 군대', 0),
+('은', '붉은  軍', '붉은 군대', 1),
+('軍', '붉은  軍', '붉은 군대', 4),
+('붉', '붉은旗', '붉은기', 0),
+('은', '붉은旗', '붉은기', 1),
+('旗', '붉은旗', '붉은기', 2),
+('빈', '빈房', '빈방', 0),
+('房', '빈房', '빈방', 1),
+('빠', '빠른  生', '빠른 생일', 0),
+('른', '빠른  生', '빠른 생일', 1),
+('生', '빠른  生', '빠른 생일', 4),
+('뼈', '뼈解酲국', '뼈해장국', 0),
+('解', '뼈解酲국', '뼈해장국', 1),
+('酲', '뼈解酲국', '뼈해장국', 2),
+('국', '뼈解酲국', '뼈해장국', 3),
+('뼈', '뼈살鏃', '뼈살촉', 0),
+('살', '뼈살鏃', '뼈살촉', 1),
+('鏃', '뼈살鏃', '뼈살촉', 2),
+('상', '상하이語', '상하이어', 0),
+('하', '상하이語', '상하이어', 1),
+('이', '상하이語', '상하이어', 2),
+('語', '상하이語', '상하이어', 3),
+('새', '새알心', '새알심', 0),
+('알', '새알心', '새알심', 1),
+('心', '새알心', '새알심', 2),
+('소', '소비에트 社會主義 共和國 聯邦', '소비에트 사회주의 공화국 연방', 0),
+('비', '소비에트 社會主義 共和國 聯邦', '소비에트 사회주의 공화국 연방', 1),
+('에', '소비에트 社會主義 共和國 聯邦', '소비에트 사회주의 공화국 연방', 2),
+('트', '소비에트 社會主義 共和國 聯邦', '소비에트 사회주의 공화국 연방', 3),
+('社', '소비에트 社會主義 共和國 聯邦', '소비에트 사회주의 공화국 연방', 5),
+('會', '소비에트 社會主義 共和國 聯邦', '소비에트 사회주의 공화국 연방', 6),
+('主', '소비에트 社會主義 共和國 聯邦', '소비에트 사회주의 공화국 연방', 7),
+('義', '소비에트 社會主義 共和國 聯邦', '소비에트 사회주의 공화국 연방', 8),
+('共', '소비에트 社會主義 共和國 聯邦', '소비에트 사회주의 공화국 연방', 10),
+('和', '소비에트 社會主義 共和國 聯邦', '소비에트 사회주의 공화국 연방', 11),
+('國', '소비에트 社會主義 共和國 聯邦', '소비에트 사회주의 공화국 연방', 12),
+('聯', '소비에트 社會主義 共和國 聯邦', '소비에트 사회주의 공화국 연방', 14),
+('邦', '소비에트 社會主義 共和國 聯邦', '소비에트 사회주의 공화국 연방', 15),
+('소', '소비에트 聯邦', '소비에트 연방', 0),
+('비', '소비에트 聯邦', '소비에트 연방', 1),
+('에', '소비에트 聯邦', '소비에트 연방', 2),
+('트', '소비에트 聯邦', '소비에트 연방', 3),
+('聯', '소비에트 聯邦', '소비에트 연방', 5),
+('邦', '소비에트 聯邦', '소비에트 연방', 6),
+('솜', '솜砂糖', '솜사탕', 0),
+('砂', '솜砂糖', '솜사탕', 1),
+('糖', '솜砂糖', '솜사탕', 2),
+('순', '순豆腐白飯', '순두부백반', 0),
+('豆', '순豆腐白飯', '순두부백반', 1),
+('腐', '순豆腐白飯', '순두부백반', 2),
+('白', '순豆腐白飯', '순두부백반', 3),
+('飯', '순豆腐白飯', '순두부백반', 4),
+('술', '술桶', '술통', 0),
+('桶', '술桶', '술통', 1),
+('시', '시토會', '시토회', 0),
+('토', '시토會', '시토회', 1),
+('會', '시토會', '시토회', 2),
+('신', '신欌', '신장', 0),
+('欌', '신欌', '신장', 1),
+('쏘', '쏘비에트 社會主義 共和國 聯邦', '쏘비에트 사회주의 공화국 련방', 0),
+('비', '쏘비에트 社會主義 共和國 聯邦', '쏘비에트 사회주의 공화국 련방', 1),
+('에', '쏘비에트 社會主義 共和國 聯邦', '쏘비에트 사회주의 공화국 련방', 2),
+('트', '쏘비에트 社會主義 共和國 聯邦', '쏘비에트 사회주의 공화국 련방', 3),
+('社', '쏘비에트 社會主義 共和國 聯邦', '쏘비에트 사회주의 공화국 련방', 5),
+('會', '쏘비에트 社會主義 共和國 聯邦', '쏘비에트 사회주의 공화국 련방', 6),
+('主', '쏘비에트 社會主義 共和國 聯邦', '쏘비에트 사회주의 공화국 련방', 7),
+('義', '쏘비에트 社會主義 共和國 聯邦', '쏘비에트 사회주의 공화국 련방', 8),
+('共', '쏘비에트 社會主義 共和國 聯邦', '쏘비에트 사회주의 공화국 련방', 10),
+('和', '쏘비에트 社會主義 共和國 聯邦', '쏘비에트 사회주의 공화국 련방', 11),
+('國', '쏘비에트 社會主義 共和國 聯邦', '쏘비에트 사회주의 공화국 련방', 12),
+('聯', '쏘비에트 社會主義 共和國 聯邦', '쏘비에트 사회주의 공화국 련방', 14),
+('邦', '쏘비에트 社會主義 共和國 聯邦', '쏘비에트 사회주의 공화국 련방', 15),
+('쏘', '쏘비에트 聯邦', '쏘비에트 련방', 0),
+('비', '쏘비에트 聯邦', '쏘비에트 련방', 1),
+('에', '쏘비에트 聯邦', '쏘비에트 련방', 2),
+('트', '쏘비에트 聯邦', '쏘비에트 련방', 3),
+('聯', '쏘비에트 聯邦', '쏘비에트 련방', 5),
+('邦', '쏘비에트 聯邦', '쏘비에트 련방', 6),
+('아', '아무르江', '아무르강', 0),
+('무', '아무르江', '아무르강', 1),
+('르', '아무르江', '아무르강', 2),
+('江', '아무르江', '아무르강', 3),
+('알', '알穀', '알곡', 0),
+('穀', '알穀', '알곡', 1),
+('앞', '앞面', '앞면', 0),
+('面', '앞面', '앞면', 1),
+('오', '오키나와語', '오키나와어', 0),
+('키', '오키나와語', '오키나와어', 1),
+('나', '오키나와語', '오키나와어', 2),
+('와', '오키나와語', '오키나와어', 3),
+('語', '오키나와語', '오키나와어', 4),
+('오', '오호츠크海', '오호츠크해', 0),
+('호', '오호츠크海', '오호츠크해', 1),
+('츠', '오호츠크海', '오호츠크해', 2),
+('크', '오호츠크海', '오호츠크해', 3),
+('海', '오호츠크海', '오호츠크해', 4),
+('위', '위키化', '위키화', 0),
+('키', '위키化', '위키화', 1),
+('化', '위키化', '위키화', 2),
+('유', '유럽 同盟', '유럽 동맹', 0),
+('럽', '유럽 同盟', '유럽 동맹', 1),
+('同', '유럽 同盟', '유럽 동맹', 3),
+('盟', '유럽 同盟', '유럽 동맹', 4),
+('유', '유럽 聯合', '유럽 련합', 0),
+('럽', '유럽 聯合', '유럽 련합', 1),
+('聯', '유럽 聯合', '유럽 련합', 3),
+('合', '유럽 聯合', '유럽 련합', 4),
+('유', '유럽 聯合', '유럽 연합', 0),
+('럽', '유럽 聯合', '유럽 연합', 1),
+('聯', '유럽 聯合', '유럽 연합', 3),
+('合', '유럽 聯合', '유럽 연합', 4),
+('이', '이슬람敎徒', '이슬람교도', 0),
+('슬', '이슬람敎徒', '이슬람교도', 1),
+('람', '이슬람敎徒', '이슬람교도', 2),
+('敎', '이슬람敎徒', '이슬람교도', 3),
+('徒', '이슬람敎徒', '이슬람교도', 4),
+('인', '인小', '인소', 0),
+('小', '인小', '인소', 1),
+('인', '인터넷  小', '인터넷 소설', 0),
+('터', '인터넷  小', '인터넷 소설', 1),
+('넷', '인터넷  小', '인터넷 소설', 2),
+('小', '인터넷  小', '인터넷 소설', 5),
+('일', '일率', '일률', 0),
+('率', '일率', '일률', 1),
+('저', '저便', '저편', 0),
+('便', '저便', '저편', 1),
+('조', '조개貫子', '조개관자', 0),
+('개', '조개貫子', '조개관자', 1),
+('貫', '조개貫子', '조개관자', 2),
+('子', '조개貫子', '조개관자', 3),
+('집', '집幽靈거미', '집유령거미', 0),
+('幽', '집幽靈거미', '집유령거미', 1),
+('靈', '집幽靈거미', '집유령거미', 2),
+('거', '집幽靈거미', '집유령거미', 3),
+('미', '집幽靈거미', '집유령거미', 4),
+('체', '체크語', '체크어', 0),
+('크', '체크語', '체크어', 1),
+('語', '체크語', '체크어', 2),
+('카', '카드紙匣', '카드지갑', 0),
+('드', '카드紙匣', '카드지갑', 1),
+('紙', '카드紙匣', '카드지갑', 2),
+('匣', '카드紙匣', '카드지갑', 3),
+('통', '통字', '통자', 0),
+('字', '통字', '통자', 1),
+('트', '트랜스脂肪', '트랜스지방', 0),
+('랜', '트랜스脂肪', '트랜스지방', 1),
+('스', '트랜스脂肪', '트랜스지방', 2),
+('脂', '트랜스脂肪', '트랜스지방', 3),
+('肪', '트랜스脂肪', '트랜스지방', 4),
+('팜', '팜油', '팜유', 0),
+('油', '팜油', '팜유', 1),
+('팥', '팥氷水', '팥빙수', 0),
+('氷', '팥氷水', '팥빙수', 1),
+('水', '팥氷水', '팥빙수', 2),
+('퐁', '퐁퐁男', '퐁퐁남', 0),
+('퐁', '퐁퐁男', '퐁퐁남', 1),
+('男', '퐁퐁男', '퐁퐁남', 2),
+('프', '프랑스語', '프랑스어', 0),
+('랑', '프랑스語', '프랑스어', 1),
+('스', '프랑스語', '프랑스어', 2),
+('語', '프랑스語', '프랑스어', 3),
+('피', '피시房', '피시방', 0),
+('시', '피시房', '피시방', 1),
+('房', '피시房', '피시방', 2),
+('피', '피씨房', '피씨방', 0),
+('씨', '피씨房', '피씨방', 1),
+('房', '피씨房', '피씨방', 2),
+('하', '하나會', '하나회', 0),
+('나', '하나會', '하나회', 1),
+('會', '하나會', '하나회', 2),
+('햇', '햇數', '햇수', 0),
+('數', '햇數', '햇수', 1),
+('金', '金', '금', 0),
+('金', '金--', '금메달', 0),
+('-', '金--', '금메달', 1),
+('-', '金--', '금메달', 2),
+('金', '金剛山', '금강산', 0),
+('剛', '金剛山', '금강산', 1),
+('山', '金剛山', '금강산', 2),
+('金', '金庫', '금고', 0),
+('庫', '金庫', '금고', 1),
+('金', '金額', '금액', 0),
+('額', '金額', '금액', 1),
+('羅', '羅針盤', '나침반', 0),
+('針', '羅針盤', '나침반', 1),
+('盤', '羅針盤', '나침반', 2),
+('來', '來-', '내달', 0),
+('-', '來-', '내달', 1),
+('來', '來後年', '내후년', 0),
+('後', '來後年', '내후년', 1),
+('年', '來後年', '내후년', 2),
+('來', '來日', '내일', 0),
+('日', '來日', '내일', 1),
+('綠', '綠茶', '녹차', 0),
+('茶', '綠茶', '녹차', 1),
+('論', '論', '논', 0),
+('論', '論爭', '논쟁', 0),
+('爭', '論爭', '논쟁', 1),
+('論', '論理', '논리', 0),
+('理', '論理', '논리', 1),
+('不', '不便', '불편', 0),
+('便', '不便', '불편', 1),
+('不', '不利', '불리', 0),
+('利', '不利', '불리', 1),
+('不', '不利益', '불이익', 0),
+('利', '不利益', '불이익', 1),
+('益', '不利益', '불이익', 2),
+('不', '不可能', '불가능', 0),
+('可', '不可能', '불가능', 1),
+('能', '不可能', '불가능', 2),
+('不', '不可避', '불가피', 0),
+('可', '不可避', '불가피', 1),
+('避', '不可避', '불가피', 2),
+('不', '不安', '불안', 0),
+('安', '不安', '불안', 1),
+('不', '不完全', '불완전', 0),
+('完', '不完全', '불완전', 1),
+('全', '不完全', '불완전', 2),
+('不', '不平', '불평', 0),
+('平', '不平', '불평', 1),
+('不', '不平等', '불평등', 0),
+('平', '不平等', '불평등', 1),
+('等', '不平等', '불평등', 2),
+('不', '不幸', '불행', 0),
+('幸', '不幸', '불행', 1),
+('不', '不必要', '불필요', 0),
+('必', '不必要', '불필요', 1),
+('要', '不必要', '불필요', 2),
+('不', '不拘', '불구', 0),
+('拘', '不拘', '불구', 1),
+('不', '不殺生', '불살생', 0),
+('殺', '不殺生', '불살생', 1),
+('生', '不殺生', '불살생', 2),
+('不', '不法', '불법', 0),
+('法', '不法', '불법', 1),
+('不', '不滿', '불만', 0),
+('滿', '不滿', '불만', 1),
+('不', '不確實', '불확실', 0),
+('確', '不確實', '불확실', 1),
+('實', '不確實', '불확실', 2),
+('不', '不過', '불과', 0),
+('過', '不過', '불과', 1),
+('兩', '兩', '양', 0),
+('兩', '兩-', '양옆', 0),
+('-', '兩-', '양옆', 1),
+('兩', '兩-', '양쪽', 0),
+('-', '兩-', '양쪽', 1),
+('兩', '兩國', '양국', 0),
+('國', '兩國', '양국', 1),
+('良', '良心', '양심', 0),
+('心', '良心', '양심', 1),
+('量', '量', '양', 0),
+('女', '女', '여', 0),
+('女', '女人', '여인', 0),
+('人', '女人', '여인', 1),
+('女', '女同生', '여동생', 0),
+('同', '女同生', '여동생', 1),
+('生', '女同生', '여동생', 2),
+('女', '女大生', '여대생', 0),
+('大', '女大生', '여대생', 1),
+('生', '女大生', '여대생', 2),
+('女', '女子', '여자', 0),
+('子', '女子', '여자', 1),
+('女', '女學生', '여학생', 0),
+('學', '女學生', '여학생', 1),
+('生', '女學生', '여학생', 2),
+('女', '女性', '여성', 0),
+('性', '女性', '여성', 1),
+('女', '女王', '여왕', 0),
+('王', '女王', '여왕', 1),
+('女', '女職員', '여직원', 0),
+('職', '女職員', '여직원', 1),
+('員', '女職員', '여직원', 2),
+('女', '女軍', '여군', 0),
+('軍', '女軍', '여군', 1),
+('旅', '旅券', '여권', 0),
+('券', '旅券', '여권', 1),
+('旅', '旅行', '여행', 0),
+('行', '旅行', '여행', 1),
+('旅', '旅行社', '여행사', 0),
+('行', '旅行社', '여행사', 1),
+('社', '旅行社', '여행사', 2),
+('旅', '旅館', '여관', 0),
+('館', '旅館', '여관', 1),
+('歷', '歷史', '역사', 0),
+('史', '歷史', '역사', 1),
+('歷', '歷史上', '역사상', 0),
+('史', '歷史上', '역사상', 1),
+('上', '歷史上', '역사상', 2),
+('歷', '歷史學', '역사학', 0),
+('史', '歷史學', '역사학', 1),
+('學', '歷史學', '역사학', 2),
+('歷', '歷史家', '역사가', 0),
+('史', '歷史家', '역사가', 1),
+('家', '歷史家', '역사가', 2),
+('年', '年末', '연말', 0),
+('末', '年末', '연말', 1),
+('年', '年歲', '연세', 0),
+('歲', '年歲', '연세', 1),
+('年', '年間', '연간', 0),
+('間', '年間', '연간', 1),
+('年', '年齡', '연령', 0),
+('齡', '年齡', '연령', 1),
+('戀', '戀人', '연인', 0),
+('人', '戀人', '연인', 1),
+('戀', '戀愛', '연애', 0),
+('愛', '戀愛', '연애', 1),
+('練', '練習', '연습', 0),
+('習', '練習', '연습', 1),
+('聯', '聯合', '연합', 0),
+('合', '聯合', '연합', 1),
+('聯', '聯想', '연상', 0),
+('想', '聯想', '연상', 1),
+('聯', '聯關', '연관', 0),
+('關', '聯關', '연관', 1),
+('連', '連休', '연휴', 0),
+('休', '連休', '연휴', 1),
+('連', '連結', '연결', 0),
+('結', '連結', '연결', 1),
+('連', '連絡', '연락', 0),
+('絡', '連絡', '연락', 1),
+('連', '連絡處', '연락처', 0),
+('絡', '連絡處', '연락처', 1),
+('處', '連絡處', '연락처', 2),
+('連', '連續', '연속', 0),
+('續', '連續', '연속', 1),
+('列', '列車', '열차', 0),
+('車', '列車', '열차', 1),
+('念', '念慮', '염려', 0),
+('慮', '念慮', '염려', 1),
+('嶺', '嶺南', '영남', 0),
+('南', '嶺南', '영남', 1),
+('零', '零上', '영상', 0),
+('上', '零上', '영상', 1),
+('零', '零下', '영하', 0),
+('下', '零下', '영하', 1),
+('靈', '靈魂', '영혼', 0),
+('魂', '靈魂', '영혼', 1),
+('領', '領域', '영역', 0),
+('域', '領域', '영역', 1),
+('例', '例', '예', 0),
+('例', '例--', '예컨대', 0),
+('-', '例--', '예컨대', 1),
+('-', '例--', '예컨대', 2),
+('例', '例外', '예외', 0),
+('外', '例外', '예외', 1),
+('禮', '禮儀', '예의', 0),
+('儀', '禮儀', '예의', 1),
+('禮', '禮式場', '예식장', 0),
+('式', '禮式場', '예식장', 1),
+('場', '禮式場', '예식장', 2),
+('禮', '禮節', '예절', 0),
+('節', '禮節', '예절', 1),
+('料', '料理', '요리', 0),
+('理', '料理', '요리', 1),
+('料', '料理師', '요리사', 0),
+('理', '料理師', '요리사', 1),
+('師', '料理師', '요리사', 2),
+('料', '料金', '요금', 0),
+('金', '料金', '요금', 1),
+('龍', '龍', '용', 0),
+('流', '流刑', '유형', 0),
+('刑', '流刑', '유형', 1),
+('流', '流刑者', '유형자', 0),
+('刑', '流刑者', '유형자', 1),
+('者', '流刑者', '유형자', 2),
+('流', '流砂', '유사', 0),
+('砂', '流砂', '유사', 1),
+('流', '流血', '유혈', 0),
+('血', '流血', '유혈', 1),
+('流', '流行', '유행', 0),
+('行', '流行', '유행', 1),
+('琉', '琉璃', '유리', 0),
+('璃', '琉璃', '유리', 1),
+('琉', '琉璃窓', '유리창', 0),
+('璃', '琉璃窓', '유리창', 1),
+('窓', '琉璃窓', '유리창', 2),
+('留', '留學', '유학', 0),
+('學', '留學', '유학', 1),
+('留', '留學生', '유학생', 0),
+('學', '留學生', '유학생', 1),
+('生', '留學生', '유학생', 2),
+('留', '留意', '유의', 0),
+('意', '留意', '유의', 1),
+('類', '類似', '유사', 0),
+('似', '類似', '유사', 1),
+('類', '類型', '유형', 0),
+('型', '類型', '유형', 1),
+('六', '六', '육', 0),
+('六', '六十', '육십', 0),
+('十', '六十', '육십', 1),
+('六', '六月', '유월', 0),
+('月', '六月', '유월', 1),
+('陸', '陸上', '육상', 0),
+('上', '陸上', '육상', 1),
+('陸', '陸軍', '육군', 0),
+('軍', '陸軍', '육군', 1),
+('利', '利--', '이롭다', 0),
+('-', '利--', '이롭다', 1),
+('-', '利--', '이롭다', 2),
+('利', '利子', '이자', 0),
+('子', '利子', '이자', 1),
+('利', '利用', '이용', 0),
+('用', '利用', '이용', 1),
+('利', '利用者', '이용자', 0),
+('用', '利用者', '이용자', 1),
+('者', '利用者', '이용자', 2),
+('理', '理性', '이성', 0),
+('性', '理性', '이성', 1),
+('理', '理解', '이해', 0),
+('解', '理解', '이해', 1),
+('理', '理論的', '이론적', 0),
+('論', '理論的', '이론적', 1),
+('的', '理論的', '이론적', 2),
+('隣', '隣近', '인근', 0),
+('近', '隣近', '인근', 1),
+('臨', '臨時', '임시', 0),
+('時', '臨時', '임시', 1),
+('茶', '茶', '차', 0),
+('茶', '茶盞', '찻잔', 0),
+('盞', '茶盞', '찻잔', 1)
+ON CONFLICT DO NOTHING;
\ No newline at end of file
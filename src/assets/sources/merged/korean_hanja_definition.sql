@@ -0,0 +1,41258 @@
+INSERT INTO `korean_hanja_definition` VALUES
+('㐀', 'Alternative form of 丘 (“Hanja form of 구 (“small hill”).”)'),
+('㐀', '구'),
+('㐀', '언덕'),
+('㐁', 'a bamboo sheath'),
+('㐁', 'to have a thin tongue'),
+('㐁', 'to lick'),
+('㐁', '첨'),
+('㐁', '핥다'),
+('㐁', '핥을'),
+('㐂', 'Alternative form of 喜'),
+('㐂', '기쁘다'),
+('㐂', '기쁠'),
+('㐂', '희'),
+('㐃', 'Alternative form of 亇 (“Hanja form of 마 (“hammer”).”)'),
+('㐃', '마'),
+('㐃', '망치'),
+('㐄', '걷다'),
+('㐄', '걸을'),
+('㐄', '과'),
+('㐅', '다섯'),
+('㐅', '오'),
+('㐆', '돌아오다'),
+('㐆', '돌아올'),
+('㐆', '은'),
+('㐇', 'a personal name'),
+('㐇', 'gul'),
+('㐇', 'kul'),
+('㐇', 'kwul'),
+('㐇', 'name of dried fish'),
+('㐇', '굴'),
+('㐈', 'Hanja form of 둘.'),
+('㐈', '둘'),
+('㐈', '음역자'),
+('㐉', 'a slave; a maid'),
+('㐉', 'cel'),
+('㐉', 'chŏl'),
+('㐉', 'jeol'),
+('㐉', '절'),
+('㐊', 'Hanja form of 살 (“hanja used for transliteration”).'),
+('㐊', '살'),
+('㐊', '음역자'),
+('㐋', 'Hanja form of 톨 (“hanja used for transliteration”).'),
+('㐋', '음역자'),
+('㐋', '톨'),
+('㐌', '이'),
+('㐍', 'chol'),
+('㐍', 'col'),
+('㐍', 'jol'),
+('㐍', '졸'),
+('㐎', 'Hanja form of 글.'),
+('㐎', '글'),
+('㐎', '음역자'),
+('㐏', 'ol'),
+('㐏', '올'),
+('㐐', 'nol'),
+('㐐', '놀'),
+('㐑', 'Hanja form of 돌 (“hanja used for transliteration”).'),
+('㐑', 'dol'),
+('㐑', 'tol'),
+('㐑', '돌'),
+('㐒', 'sol'),
+('㐒', '솔'),
+('㐓', '갈'),
+('㐓', '까치'),
+('㐔', 'gol'),
+('㐔', 'kol'),
+('㐔', '골'),
+('㐕', 'yul'),
+('㐕', '율'),
+('㐖', 'hyel'),
+('㐖', 'hyeol'),
+('㐖', 'hyŏl'),
+('㐖', '혈'),
+('㐗', 'nol'),
+('㐗', '놀'),
+('㐘', 'rice'),
+('㐘', 'ssal'),
+('㐘', '쌀'),
+('㐙', 'dul'),
+('㐙', 'tul'),
+('㐙', 'twul'),
+('㐙', '둘'),
+('㐚', 'ol'),
+('㐚', '올'),
+('㐛', 'ul'),
+('㐛', 'wul'),
+('㐛', '울'),
+('㐜', '구'),
+('㐜', '원수'),
+('㐝', 'gul'),
+('㐝', 'kul'),
+('㐝', 'kwul'),
+('㐝', '굴'),
+('㐞', 'gil'),
+('㐞', 'kil'),
+('㐞', '길'),
+('㐟', 'gil'),
+('㐟', 'kil'),
+('㐟', '길'),
+('㐠', 'yul'),
+('㐠', '율'),
+('㐡', '나약하다'),
+('㐡', '나약할'),
+('㐡', '유'),
+('㐢', 'Hanja form of 뜰.'),
+('㐢', '뜰'),
+('㐢', '음역자'),
+('㐣', 'gol'),
+('㐣', 'kol'),
+('㐣', '골'),
+('㐤', 'gu'),
+('㐤', 'ku'),
+('㐤', 'kwu'),
+('㐤', '구'),
+('㐥', 'sel'),
+('㐥', 'seol'),
+('㐥', 'sŏl'),
+('㐥', '설'),
+('㐦', 'geol'),
+('㐦', 'kel'),
+('㐦', 'kŏl'),
+('㐦', '걸'),
+('㐨', 'se'),
+('㐨', 'seo'),
+('㐨', 'sŏ'),
+('㐨', '서'),
+('㐩', '술독'),
+('㐩', '형'),
+('㐫', 'Alternative form of 凶'),
+('㐫', '흉'),
+('㐫', '흉하다'),
+('㐫', '흉할'),
+('㐬', '거칠'),
+('㐬', '거칠다'),
+('㐬', '깃발'),
+('㐬', '류'),
+('㐬', '유'),
+('㐬', '황'),
+('㐭', '곳집'),
+('㐭', '늠'),
+('㐭', '름'),
+('㐮', '도울'),
+('㐮', '돕다'),
+('㐮', '양'),
+('㐯', '쓰다'),
+('㐯', '쓸'),
+('㐯', '용'),
+('㐰', '믿다'),
+('㐰', '믿을'),
+('㐰', '신'),
+('㐱', '진'),
+('㐲', 'dae'),
+('㐲', 'tae'),
+('㐲', 'tay'),
+('㐲', '대'),
+('㐳', '불안하다'),
+('㐳', '불안할'),
+('㐳', '올'),
+('㐴', 'ban'),
+('㐴', 'pan'),
+('㐴', '반'),
+('㐵', '선비'),
+('㐵', '유'),
+('㐶', '되다'),
+('㐶', '될'),
+('㐶', '화'),
+('㐸', '하품'),
+('㐸', '흠'),
+('㐹', '날래다'),
+('㐹', '날랠'),
+('㐹', '흘'),
+('㐺', '무리'),
+('㐺', '중'),
+('㐻', 'nae'),
+('㐻', 'nay'),
+('㐻', '내'),
+('㐼', 'seung'),
+('㐼', 'sung'),
+('㐼', 'sŭng'),
+('㐼', '승'),
+('㐾', 'wen'),
+('㐾', 'won'),
+('㐾', 'wŏn'),
+('㐾', '원'),
+('㐿', '격'),
+('㐿', '치다'),
+('㐿', '칠'),
+('㑀', 't''ae'),
+('㑀', 'tae'),
+('㑀', 'thay'),
+('㑀', '태'),
+('㑁', '짧다'),
+('㑁', '짧을'),
+('㑁', '출'),
+('㑂', '방'),
+('㑂', '헤매다'),
+('㑂', '헤맬'),
+('㑃', '요'),
+('㑃', '헤매다'),
+('㑃', '헤맬'),
+('㑄', '모'),
+('㑄', '업신여기다'),
+('㑄', '업신여길'),
+('㑅', '작'),
+('㑅', '지을'),
+('㑅', '짓다'),
+('㑆', '게으르다'),
+('㑆', '게으를'),
+('㑆', '이'),
+('㑉', '숙'),
+('㑉', '펴지지 않을'),
+('㑊', 'yek'),
+('㑊', 'yeok'),
+('㑊', 'yŏk'),
+('㑊', '역'),
+('㑋', 'gung'),
+('㑋', 'kung'),
+('㑋', 'kwung'),
+('㑋', '궁'),
+('㑌', 'wang'),
+('㑌', '왕'),
+('㑍', '뇌'),
+('㑍', '뢰'),
+('㑍', '버금'),
+('㑎', 'noe'),
+('㑎', 'noy'),
+('㑎', '뇌'),
+('㑏', '우두커니'),
+('㑏', '저'),
+('㑐', '숙'),
+('㑑', 'ca'),
+('㑑', 'cha'),
+('㑑', 'ja'),
+('㑑', '자'),
+('㑖', 'chung'),
+('㑖', 'cwung'),
+('㑖', 'jung'),
+('㑖', '중'),
+('㑗', '계집'),
+('㑗', '신'),
+('㑘', '개'),
+('㑘', '착하다'),
+('㑘', '착할'),
+('㑙', 'cep'),
+('㑙', 'chŏp'),
+('㑙', 'jeop'),
+('㑙', '접'),
+('㑚', '나'),
+('㑚', '어찌'),
+('㑛', 'sok'),
+('㑛', '속'),
+('㑜', '새기다'),
+('㑜', '새길'),
+('㑜', '절'),
+('㑝', '농'),
+('㑝', '롱'),
+('㑝', '어리석다'),
+('㑝', '어리석을'),
+('㑞', '딸려보내다'),
+('㑞', '딸려보낼'),
+('㑞', '잉'),
+('㑟', '거짓말하다'),
+('㑟', '거짓말할'),
+('㑟', '팽'),
+('㑡', 'chŭk'),
+('㑡', 'cuk'),
+('㑡', 'jeuk'),
+('㑡', '즉'),
+('㑣', '남'),
+('㑣', '람'),
+('㑣', '투미하다'),
+('㑣', '투미할'),
+('㑤', 'myo'),
+('㑤', '묘'),
+('㑥', '업신여기다'),
+('㑥', '업신여길'),
+('㑥', '이'),
+('㑦', '려'),
+('㑦', '성내다'),
+('㑦', '성낼'),
+('㑦', '여'),
+('㑧', '계'),
+('㑧', '두근거리다'),
+('㑧', '두근거릴'),
+('㑨', 'o'),
+('㑨', '오'),
+('㑮', 'hon'),
+('㑮', '혼'),
+('㑯', 'su'),
+('㑯', '수'),
+('㑰', '게으르다'),
+('㑰', '게으를'),
+('㑰', '훼'),
+('㑺', 'Alternative form of 俊.'),
+('㑺', '준'),
+('㑺', '준걸'),
+('㒱', 'Alternative form of 夢'),
+('㒱', 'mong'),
+('㒱', '몽'),
+('㒲', 'Alternative form of 暮'),
+('㒲', '모'),
+('㓂', '구'),
+('㓂', '도적'),
+('㓒', 'Alternative form of 漆.'),
+('㓒', '삼가다'),
+('㓒', '삼갈'),
+('㓒', '옻'),
+('㓒', '일곱'),
+('㓒', '칠'),
+('㔔', 'Hanja form of 강 (“hanja used for transliteration”).'),
+('㔔', 'Hanja form of 덩 (“hanja used for transliteration”).'),
+('㔔', '강'),
+('㔔', '덩'),
+('㔔', '음역자'),
+('㔖', 'Hanja form of 각 (“hanja used for transliteration”).'),
+('㔖', 'Hanja form of 덕 (“hanja used for transliteration”).'),
+('㔖', '각'),
+('㔖', '덕'),
+('㔖', '음역자'),
+('㔛', 'hal'),
+('㔛', '할'),
+('㔡', '별'),
+('㔡', '크다'),
+('㔡', '클'),
+('㕾', 'a personal name'),
+('㕾', 'sos'),
+('㕾', 'sot'),
+('㕾', '솟'),
+('㖋', 'gaet'),
+('㖋', 'kaet'),
+('㖋', 'kays'),
+('㖋', '갯'),
+('㖌', 'gut'),
+('㖌', 'kut'),
+('㖌', 'kwus'),
+('㖌', '굿'),
+('㖍', 'dut'),
+('㖍', 'tus'),
+('㖍', 'tut'),
+('㖍', '둣'),
+('㖎', 'gaet'),
+('㖎', 'kaet'),
+('㖎', 'kays'),
+('㖎', '갯'),
+('㖙', 'Hanja form of 갓 (“hanja used for transliteration”).'),
+('㖙', '갓'),
+('㖙', '음역자'),
+('㗎', 'a transliteration sinogram'),
+('㗎', '가'),
+('㗎', '음역자'),
+('㗏', 'the call of a person'),
+('㗏', '사람 부르는 소리'),
+('㗏', '왜'),
+('㗡', '㗡臺 (늣태) ― Neuttae ― Neungpo-dong, Geoje, South Korea'),
+('㗡', '늣'),
+('㗡', '음역자'),
+('㗸', 'ham'),
+('㗸', '함'),
+('㘘', 'bi'),
+('㘘', 'pi'),
+('㘘', '비'),
+('㘽', 'cay'),
+('㘽', 'chae'),
+('㘽', 'jae'),
+('㘽', '재'),
+('㙖', 'u'),
+('㙖', 'wu'),
+('㙖', '우'),
+('㙽', 'sek'),
+('㙽', 'seok'),
+('㙽', 'sŏk'),
+('㙽', '석'),
+('㙿', 'hui'),
+('㙿', 'huy'),
+('㙿', 'hŭi'),
+('㙿', '희'),
+('㝳', 'Alternative form of 等'),
+('㝳', '등'),
+('㝳', '무리'),
+('㟣', '높다'),
+('㟣', '높을'),
+('㟣', '숭'),
+('㟺', '누'),
+('㟺', '루'),
+('㟺', '봉우리'),
+('㠞', 'ching'),
+('㠞', 'cing'),
+('㠞', 'jing'),
+('㠞', '징'),
+('㠫', 'bu'),
+('㠫', 'pu'),
+('㠫', 'pwu'),
+('㠫', '부'),
+('㠬', 'bu'),
+('㠬', 'pu'),
+('㠬', 'pwu'),
+('㠬', '부'),
+('㠰', 'deol'),
+('㠰', '덜'),
+('㠳', 'Alternative form of 幕'),
+('㠳', '막'),
+('㠳', '만'),
+('㠳', '장막'),
+('㠳', '화폐의 뒷면'),
+('㡤', 'bok'),
+('㡤', 'pok'),
+('㡤', '복'),
+('㢇', 'en'),
+('㢇', 'eon'),
+('㢇', 'ŏn'),
+('㢇', '언'),
+('㢤', 'cay'),
+('㢤', 'chae'),
+('㢤', 'jae'),
+('㢤', '재'),
+('㢱', 'Used only in pre-twentieth century Idu script glosses'),
+('㢱', '며'),
+('㢿', 'hu'),
+('㢿', 'hwu'),
+('㢿', '후'),
+('㣊', '수'),
+('㣕', 'dae'),
+('㣕', 'tae'),
+('㣕', 'tay'),
+('㣕', '대'),
+('㣖', 't''ae'),
+('㣖', 'tae'),
+('㣖', 'thay'),
+('㣖', '태'),
+('㣡', 'chung'),
+('㣡', 'cwung'),
+('㣡', 'jung'),
+('㣡', '중'),
+('㣥', 'ch''i'),
+('㣥', 'chi'),
+('㣥', '치'),
+('㣨', 'go'),
+('㣨', 'ko'),
+('㣨', '고'),
+('㣮', 'nam'),
+('㣮', '남'),
+('㣳', 'mu'),
+('㣳', 'mwu'),
+('㣳', '무'),
+('㣴', 'Hanja form of 황 (“the first note, 황종 (黃鐘, hwangjong) of the Shí-èr-lǜ musical scale”).'),
+('㣴', '황'),
+('㣸', 'yu'),
+('㣸', '유'),
+('㣹', 'eung'),
+('㣹', 'ung'),
+('㣹', 'ŭng'),
+('㣹', '응'),
+('㤀', 'mang'),
+('㤀', '망'),
+('㤼', 'geop'),
+('㤼', 'kep'),
+('㤼', 'kŏp'),
+('㤼', '겁'),
+('㥘', 'geop'),
+('㥘', 'kep'),
+('㥘', 'kŏp'),
+('㥘', '겁'),
+('㥙', 'ch''ung'),
+('㥙', 'chung'),
+('㥙', 'chwung'),
+('㥙', '충'),
+('㥻', 'ch''ŏk'),
+('㥻', 'chek'),
+('㥻', 'cheok'),
+('㥻', '척'),
+('㨣', '옹'),
+('㨣', '품다'),
+('㨣', '품을'),
+('㪲', 'Hanja form of 둑 (“hanja used for transliteration”).'),
+('㪲', '둑'),
+('㪲', '음역자'),
+('㪳', 'Hanja form of 둥 (“hanja used for transliteration”).'),
+('㪳', '둥'),
+('㪳', '음역자'),
+('㫇', 'Hanja form of 억 (“hanja used for transliteration”).'),
+('㫇', '억'),
+('㫇', '음역자'),
+('㫈', 'Hanja form of 엉 (“hanja used for transliteration”).'),
+('㫈', '엉'),
+('㫈', '음역자'),
+('㭐', 'daenama (대나마, 大奈麻)'),
+('㭐', '말'),
+('㭐', '음역자'),
+('㭗', 'Alternative form of 鬱 (“stuffy;suffocating”)'),
+('㭗', '울'),
+('㳓', 'Taedong River (대동강)'),
+('㳓', '물 이름'),
+('㳓', '우'),
+('㳲', 'Hanja form of 태 (“the third note, 태주 (太簇, taeju) of the Shí-èr-lǜ musical scale that is two octaves higher”).'),
+('㳲', '태'),
+('㵜', 'Hanja form of 남 (“the tenth note, 남려 (南呂, namnyeo) of the Shí-èr-lǜ musical scale that is two octaves higher”).'),
+('㵜', '남'),
+('㶂', 'Hanja form of 황 (“the first note, 황종 (黃鍾, hwangjong) of the Shí-èr-lǜ musical scale that is two octaves higher”).'),
+('㶂', '황'),
+('㶃', 'Hanja form of 무 (“the eleventh note, 무역 (無射, muyeok) of the Shí-èr-lǜ musical scale that is two octaves higher”).'),
+('㶃', '무'),
+('㶱', '본'),
+('㸴', 'So'),
+('㸴', 'a rare surname'),
+('㸴', '소'),
+('㺋', '돼지'),
+('㺋', '옹'),
+('㾳', 'cha'),
+('㾳', 'ja'),
+('㾳', '자'),
+('䃼', 'Alternative form of 福 (“happiness; good fortune”)'),
+('䃼', '복'),
+('䆆', 'dry rice'),
+('䆆', '마른 벼'),
+('䆆', '조'),
+('䍃', 'yo'),
+('䍃', '요'),
+('䍃', '질그릇: earthenware'),
+('䎑', '녹'),
+('䎑', '록'),
+('䎑', '물 위로 날'),
+('䎚', '짧은 깃'),
+('䎚', '혜'),
+('䐥', '냄새날'),
+('䐥', '옹'),
+('䒆', '배'),
+('䒆', '철'),
+('䔁', 'water caltrop, water chestnut'),
+('䔁', '률'),
+('䔁', '율'),
+('䖵', 'gon'),
+('䖵', 'insects'),
+('䖵', 'kon'),
+('䖵', '곤'),
+('䙍', 'Hanja form of 비 (“Only used in 䙍褙”).'),
+('䙍', 'Hanja form of 비 (“Only used in 䙍褙”). [only used in Literary Chinese]'),
+('䙍', '비'),
+('䙍', '비빌'),
+('䜳', '둔'),
+('䜳', '음역자'),
+('䢖', 'Alternative form of 建 (“Hanja form of 건 (“build; establish”).”)'),
+('䢖', '건'),
+('䢖', '세우다'),
+('䢖', '세울'),
+('䢘', 'This term is used in Korean place names from the first millennium and has also been attested in wooden tablets from the same period, where it apparently intervenes between the name of a gate or building and a personal name. The meaning of this term is uncertain. Possibilities include'),
+('䢘', 'This term is used in Korean place names from the first millennium and has also been attested in wooden tablets from the same period, where it apparently intervenes between the name of a gate or building and a personal name. The meaning of this term is uncertain. Possibilities include:'),
+('䢘', 'guard, gatekeeper'),
+('䢘', '땅 이름'),
+('䢘', '수'),
+('䤧', '철기'),
+('䤧', '회'),
+('䦉', 'sa'),
+('䦉', '사'),
+('䦞', 'Alternative form of 閏 (“Hanja form of 윤 (“intercalary”).”)'),
+('䦞', '윤'),
+('䦞', '윤달'),
+('䭏', '떡'),
+('䭏', '편'),
+('䰶', 'Hanja form of 망 (“common goby”).'),
+('䰶', 'Hanja form of 망 (“common goby”). [affix]'),
+('䰶', '망'),
+('䰶', '망둥이'),
+('䳥', '두루미'),
+('䳥', '령'),
+('䳥', '영'),
+('䳥', '작은 새'),
+('䳥', '잠'),
+('䶈', 'bak'),
+('䶈', 'pak'),
+('䶈', '박'),
+('䶬', '견'),
+('䶬', '용의 등 갈기'),
+('一', 'Hanja form of 일 (“one”).'),
+('一', '일'),
+('一', '한'),
+('一', '한 일'),
+('丁', ' 네째 천간 정'),
+('丁', 'Hanja form of 정 (“male adult; man”).'),
+('丁', 'Hanja form of 정 (“the fourth of the ten heavenly stems; something D”).'),
+('丁', '고무래'),
+('丁', '넷째 천간(天干)'),
+('丁', '장정'),
+('丁', '장정 정'),
+('丁', '정'),
+('丂', '공교하다'),
+('丂', '공교할'),
+('丂', '교'),
+('丂', '교묘할 교'),
+('七', ' 글체이름 칠'),
+('七', 'Hanja form of 칠 (“seven”).'),
+('七', '일곱'),
+('七', '일곱 칠'),
+('七', '칠'),
+('丄', '상'),
+('丄', '위'),
+('丅', '下의 簡體字'),
+('丅', '아래'),
+('丅', '하'),
+('丆', 'Kwukyel form of 면 (myeon)'),
+('丆', '구결자'),
+('丆', '면'),
+('万', 'Alternative form of 萬.'),
+('万', '만'),
+('万', '성씨 묵'),
+('万', '일'),
+('万', '일만 만'),
+('丈', 'A unit of measurement equal to the Chinese zhang'),
+('丈', '어른'),
+('丈', '어른 장'),
+('丈', '장'),
+('三', 'Hanja form of 삼 (“three”).'),
+('三', '삼'),
+('三', '석 삼'),
+('三', '셋'),
+('上', 'Hanja form of 상 (“up; top; first; best”).'),
+('上', '상'),
+('上', '위'),
+('上', '위 상'),
+('上', '윗'),
+('下', 'Hanja form of 하 (“below; bottom; lower; underneath”).'),
+('下', '아래'),
+('下', '아래 하'),
+('下', '하'),
+('丌', '그'),
+('丌', '기'),
+('丌', '책상'),
+('丌', '책상 기'),
+('不', 'Hanja form of 부 (“not”).'),
+('不', 'Hanja form of 불 (“not”).'),
+('不', '부'),
+('不', '불'),
+('不', '아니다'),
+('不', '아닐'),
+('不', '아닐 부'),
+('不', '아닐 불'),
+('与', 'Alternative form of 與 (“Hanja form of 여 (“give; participate”).”)'),
+('与', '與와 同字'),
+('与', '여'),
+('与', '주다'),
+('与', '줄'),
+('丏', '가리다'),
+('丏', '가릴'),
+('丏', '가릴 면'),
+('丏', '면'),
+('丐', ' 줄 갈'),
+('丐', '개'),
+('丐', '거지 갈'),
+('丐', '빌'),
+('丐', '빌 개'),
+('丐', '빌다'),
+('丑', ' 북동쪽 축'),
+('丑', ' 사람이름 추'),
+('丑', ' 축시 축'),
+('丑', 'Hanja form of 축 (“ox; second earthly branch”).'),
+('丑', 'Used in personal names.'),
+('丑', '둘째 지지'),
+('丑', '사람 이름'),
+('丑', '소'),
+('丑', '소 축'),
+('丑', '수갑 추'),
+('丑', '추'),
+('丑', '축'),
+('且', ' 많을 저'),
+('且', ' 파초 저'),
+('且', 'Alternative form of 俎 (“Hanja form of 조 (“a sacrificial altar; a cutting board, a chopping board”).”)'),
+('且', 'Hanja form of 저 (“respect”).'),
+('且', 'Hanja form of 차 (“moreover; also”).'),
+('且', '공경하다'),
+('且', '공경할'),
+('且', '공손할 저'),
+('且', '도마'),
+('且', '또'),
+('且', '또 차'),
+('且', '저'),
+('且', '조'),
+('且', '차'),
+('丕', 'Hanja form of 비 (“large; grand”).'),
+('丕', '비'),
+('丕', '크다'),
+('丕', '클'),
+('丕', '클 비'),
+('世', ' 백년 세'),
+('世', ' 평생 세'),
+('世', 'Hanja form of 세 (“lineage; generation”).'),
+('世', 'Hanja form of 세 (“world”).'),
+('世', '세'),
+('世', '세상 세'),
+('世', '인간(人間)'),
+('丗', 'thirty; thirtieth'),
+('丗', 'world; society'),
+('丗', '대'),
+('丗', '세'),
+('丗', '인간'),
+('丘', 'Hanja form of 구 (“small hill”).'),
+('丘', '구'),
+('丘', '언덕'),
+('丘', '언덕 구'),
+('丙', 'Hanja form of 병 (“south, southern”).'),
+('丙', 'Hanja form of 병 (“third heavenly stem”).'),
+('丙', 'Hanja form of 병 (“third”).'),
+('丙', '남녘'),
+('丙', '남녘 병'),
+('丙', '병'),
+('丙', '셋째 천간'),
+('业', 'Alternative form of 北 (“Hanja form of 배 (“to escape; to flee”).”)'),
+('业', 'Alternative form of 北 (“Hanja form of 북 (“north”).”)'),
+('业', 'Alternative form of 業 (“Hanja form of 업 (“work”).”)'),
+('业', '달아나다'),
+('业', '달아날'),
+('业', '배'),
+('业', '북'),
+('业', '북녘'),
+('业', '업'),
+('业', '일'),
+('丞', ' 도울 승'),
+('丞', ' 벼슬의 이름 승'),
+('丞', ' 향상할 승'),
+('丞', 'Alternative form of 拯 (“Hanja form of 증 (“help”).”)'),
+('丞', 'Hanja form of 승 (“help”).'),
+('丞', '구원하다'),
+('丞', '구원할'),
+('丞', '도울'),
+('丞', '돕다'),
+('丞', '승'),
+('丞', '이을 승'),
+('丞', '증'),
+('丟', '갈 주'),
+('丟', '아주 가다'),
+('丟', '아주 갈'),
+('丟', '주'),
+('丠', 'gu'),
+('丠', 'ku'),
+('丠', '丘와 同字'),
+('丠', '구'),
+('両', '兩의 俗字'),
+('丢', '잃어버릴 주'),
+('丣', 'yu'),
+('丣', '酉의 古字'),
+('丣', '유'),
+('两', '쌍 량'),
+('並', 'Hanja form of 반 (“used in place names”).'),
+('並', 'Hanja form of 방 (“side, vicinity”).'),
+('並', 'Hanja form of 병 (“combine, annex”).'),
+('並', 'Hanja form of 병 (“side by side, together, in order”).'),
+('並', '竝과 同字'),
+('並', '곁'),
+('並', '나란히'),
+('並', '땅 이름'),
+('並', '반'),
+('並', '방'),
+('並', '병'),
+('並', '아우르다'),
+('並', '아우를'),
+('丨', 'go through'),
+('丨', 'pierce'),
+('丨', '곤'),
+('丨', '뚫다'),
+('丨', '뚫을'),
+('丨', '뚫을 곤'),
+('丩', 'gu'),
+('丩', 'ku'),
+('丩', '구'),
+('丩', '넝쿨 구'),
+('个', 'small piece'),
+('个', '개'),
+('个', '낱'),
+('个', '낱 개'),
+('个', '명당 곁방 가'),
+('丫', '가닥'),
+('丫', '가장귀 아'),
+('丫', '아'),
+('中', 'Hanja form of 중 (“China (in compounds or in news media)”).'),
+('中', 'Hanja form of 중 (“amongst”).'),
+('中', 'Hanja form of 중 (“average (grade or class)”).'),
+('中', 'Hanja form of 중 (“in the course of; during”).'),
+('中', 'Hanja form of 중 (“middle; medium”).'),
+('中', '가운데'),
+('中', '가운데 중'),
+('中', '중'),
+('丮', 'catch'),
+('丮', '극'),
+('丮', '잡을 극'),
+('丰', '봉'),
+('丰', '예쁘다'),
+('丰', '예쁠'),
+('丰', '예쁠 봉'),
+('丱', '관'),
+('丱', '쌍상투'),
+('丱', '쌍상투 관'),
+('串', 'Hanja form of 곶 (“cape”).'),
+('串', 'Hanja form of 곶 (“used as a suffix in placenames”).'),
+('串', 'Hanja form of 관 (“to become habituated to something”).'),
+('串', 'Hanja form of 관 (“to string; to thread; to skewer”).'),
+('串', 'Hanja form of 찬 (“skewer”).'),
+('串', 'Hanja form of 천 (“receipt”).'),
+('串', 'Hanja form of 천 (“string; chain; skewer”).'),
+('串', '곶'),
+('串', '관'),
+('串', '꼬챙이'),
+('串', '꿰미'),
+('串', '꿸 천'),
+('串', '땅 이름'),
+('串', '땅이름 곶'),
+('串', '익히다'),
+('串', '익힐'),
+('串', '익힐 관'),
+('串', '찬'),
+('串', '천'),
+('丳', 'ch''an'),
+('丳', 'chan'),
+('丳', '꼬챙이 찬'),
+('丳', '찬'),
+('丵', 'ch''ak'),
+('丵', 'chak'),
+('丵', 'thick (grass)'),
+('丵', '착'),
+('丵', '풀이 우거질 착'),
+('丶', 'comma'),
+('丶', '심지 주'),
+('丶', '점'),
+('丶', '주'),
+('丷', '구결 하'),
+('丸', '둥글'),
+('丸', '둥글다'),
+('丸', '알 환'),
+('丸', '환'),
+('丹', 'Hanja form of 단 (“red”).'),
+('丹', 'Hanja form of 란 (“devotion”).'),
+('丹', '난'),
+('丹', '단'),
+('丹', '란'),
+('丹', '붉다'),
+('丹', '붉을'),
+('丹', '붉을 단'),
+('丹', '정성스러울'),
+('丹', '정성스럽다'),
+('主', 'Hanja form of 주 (“king”).'),
+('主', 'Hanja form of 주 (“master; host; main”).'),
+('主', '임금'),
+('主', '주'),
+('主', '주인'),
+('主', '주인 주'),
+('丼', ' 샘 정'),
+('丼', '우물 정'),
+('丼', '정'),
+('丿', 'KangXi radical 4'),
+('丿', 'line'),
+('丿', '별'),
+('丿', '삐침'),
+('丿', '삐침 별'),
+('乀', '불'),
+('乀', '파임 불'),
+('乂', ' 다스릴 예'),
+('乂', 'Alternative form of 刈 (“Hanja form of 예 (“to weed; to mow”).”)'),
+('乂', 'Alternative form of 艾 (“Hanja form of 예 (“to govern; to control; to manage”).”)'),
+('乂', 'Hanja form of 애 (“to discipline; to punish”).'),
+('乂', 'Hanja form of 예 (“to govern; to control; to manage”).'),
+('乂', 'Hanja form of 예 (“to weed; to mow”).'),
+('乂', '다스리다'),
+('乂', '다스릴'),
+('乂', '베다'),
+('乂', '벨'),
+('乂', '애'),
+('乂', '예'),
+('乂', '징계하다'),
+('乂', '징계할'),
+('乂', '풀 벨 예'),
+('乃', 'Hanja form of 내 (“as it turned out, after all”).'),
+('乃', 'Hanja form of 내 (“really, indeed”).'),
+('乃', 'Hanja form of 내 (“then”).'),
+('乃', '내'),
+('乃', '이에'),
+('乃', '이에 내'),
+('久', 'Hanja form of 구 (“to be long”).'),
+('久', '구'),
+('久', '오래다'),
+('久', '오랠'),
+('久', '오랠 구'),
+('乆', 'gu'),
+('乆', 'ku'),
+('乆', '久의 俗字'),
+('乆', '구'),
+('乇', 'leaf'),
+('乇', 't''ak'),
+('乇', 'tak'),
+('乇', 'thak'),
+('乇', 'to request'),
+('乇', '탁'),
+('乇', '풀잎 적'),
+('么', 'yo'),
+('么', '幺의 俗字'),
+('么', '요'),
+('乊', 'Kwukyel form of 호 (ho)'),
+('乊', '구결자'),
+('乊', '호'),
+('之', '가다'),
+('之', '갈'),
+('之', '갈 지'),
+('之', '지'),
+('乍', 'a short time'),
+('乍', '사'),
+('乍', '잠깐'),
+('乍', '잠깐 사'),
+('乎', '어조사'),
+('乎', '인가 호'),
+('乎', '호'),
+('乏', ' 다할 핍'),
+('乏', ' 옹색할 핍'),
+('乏', 'Hanja form of 핍 (“lack”).'),
+('乏', '모자라다'),
+('乏', '모자랄'),
+('乏', '없을 핍'),
+('乏', '핍'),
+('乑', ' 기어 오를 임'),
+('乑', 'im'),
+('乑', '나란히 설 임'),
+('乑', '임'),
+('乖', '괴'),
+('乖', '어그러지다'),
+('乖', '어그러질'),
+('乖', '어그러질 괴'),
+('乗', '乘의 俗字'),
+('乗', '승'),
+('乗', '타다'),
+('乗', '탈'),
+('乘', ' 같은 물건 네 개 승'),
+('乘', ' 곱할 승'),
+('乘', ' 셈하는 단위 승'),
+('乘', 'exponent'),
+('乘', 'to mount, to ride'),
+('乘', 'to take (a form of transport)'),
+('乘', '승'),
+('乘', '오를 승'),
+('乘', '타다'),
+('乘', '탈'),
+('乙', ' 굽힐 을'),
+('乙', ' 모모 을'),
+('乙', ' 생선의 창자 을'),
+('乙', ' 천간 이름 을'),
+('乙', 'bird'),
+('乙', '새'),
+('乙', '새 을'),
+('乙', '을'),
+('乜', '먀'),
+('乜', '사팔 뜨기 먀'),
+('乜', '사팔뜨기'),
+('九', 'Hanja form of 구 (“nine”).'),
+('九', 'Hanja form of 규 (“to gather; to collect”).'),
+('九', '구'),
+('九', '규'),
+('九', '모으다'),
+('九', '모을'),
+('九', '모을 규'),
+('九', '아홉'),
+('九', '아홉 구'),
+('乞', ' 거지 걸'),
+('乞', ' 요구할 걸'),
+('乞', ' 원할 걸'),
+('乞', 'Hanja form of 걸 (“to beg”).'),
+('乞', '걸'),
+('乞', '구걸할 걸'),
+('乞', '빌'),
+('乞', '빌다'),
+('乞', '줄 기'),
+('也', '단정의 어조사 야'),
+('也', '야'),
+('也', '어조사'),
+('也', '잇기'),
+('也', '잇달다'),
+('也', '잇달을'),
+('乣', 'gyu'),
+('乣', 'kyu'),
+('乣', '糺의 譌字 '),
+('乣', '규'),
+('乤', 'First character in place name 乤浦 "Halpho" (Korean gugja)'),
+('乤', '고을 이름 할'),
+('乤', '할'),
+('乥', 'Kwukyel form of 홀 (hol)'),
+('乥', '홀'),
+('乧', 'Hanja form of 둘 (“hanja used for transliteration”).'),
+('乧', '둘'),
+('乧', '음역자'),
+('乧', '음역자 둘 '),
+('乨', 'si'),
+('乨', '시'),
+('乩', 'gye'),
+('乩', 'kye'),
+('乩', '계'),
+('乩', '점칠 계'),
+('乫', 'Only used in native place names.'),
+('乫', '乫串里 (갈곶리) ― Galgot-ri ― a placename in Geoje, South Korea'),
+('乫', '新乫坡鎭 (신갈파진) ― Singalpajin ― a placename in Kimjongsuk County, North Korea'),
+('乫', '갈'),
+('乫', '땅 이름'),
+('乫', '땅이름 갈'),
+('乬', 'geol'),
+('乬', 'kel'),
+('乬', 'kŏl'),
+('乬', '갈 걸'),
+('乬', '걸'),
+('乭', 'Hanja form of 돌 (“hanja used for transliteration, mainly used in personal names”).'),
+('乭', '돌'),
+('乭', '음역자'),
+('乭', '이름 돌'),
+('乮', 'myol'),
+('乮', '묠'),
+('乯', '올'),
+('乯', '음역자'),
+('乱', '어지러울 란'),
+('乲', 'cal'),
+('乲', 'chal'),
+('乲', 'jal'),
+('乲', '봉호 잘 '),
+('乲', '잘'),
+('乳', ' 기를 유'),
+('乳', ' 낳을 유'),
+('乳', ' 젖먹일 유'),
+('乳', ' 종유석 유'),
+('乳', 'Hanja form of 유 (“breast”).'),
+('乳', 'Hanja form of 유 (“milk”).'),
+('乳', '유'),
+('乳', '젖'),
+('乳', '젖 유'),
+('乶', '땅 이름'),
+('乶', '땅이름 폴'),
+('乶', '볼'),
+('乶', '음역자'),
+('乶', '폴'),
+('乷', 'Hanja form of 살 (“hanja used for transliteration”).'),
+('乷', '살'),
+('乷', '음역자'),
+('乷', '음역자 살 '),
+('乺', ' 땅이름 솔'),
+('乺', 'painting tool'),
+('乺', 'sol'),
+('乺', '솔'),
+('乺', '솔 솔'),
+('乻', 'el'),
+('乻', 'eol'),
+('乻', 'ŏl'),
+('乻', '얼'),
+('乼', 'Hanja form of 줄 (“hanja used for transliteration, mainly used in placenames”).'),
+('乼', '음역자'),
+('乼', '줄'),
+('乼', '줄 줄'),
+('乽', 'Hanja form of 잘 (“honorific title for members of the imperial clan”).'),
+('乽', '봉호'),
+('乽', '잘'),
+('乾', ' 괘 이름 건'),
+('乾', ' 굳셀 건'),
+('乾', ' 서북쪽 건'),
+('乾', ' 임금 건'),
+('乾', 'Hanja form of 건 (“dry”).'),
+('乾', 'Hanja form of 건 (“in vain; for nothing; superficially”).'),
+('乾', 'Hanja form of 건 (“king”).'),
+('乾', 'Hanja form of 건 (“moistureless; waterless; arid”).'),
+('乾', 'Hanja form of 건 (“sky”).'),
+('乾', 'Hanja form of 건 (“☷ or the first of the eight trigrams (bagua) (☰☱☲☳☴☵☶☷ or 팔괘 (八卦, palgwae, “Bagua”))”).'),
+('乾', '건'),
+('乾', '마르다'),
+('乾', '마를'),
+('乾', '마를 간'),
+('乾', '하늘'),
+('乾', '하늘 건'),
+('亀', '龜의 略字'),
+('亁', '乾과 同字'),
+('亁', '乾의 俗字'),
+('亁', '간'),
+('亁', '건'),
+('亂', 'Hanja form of 란/난 (“confusion, state of chaos”).'),
+('亂', 'Hanja form of 란/난 (“create chaos, revolt”).'),
+('亂', '난'),
+('亂', '란'),
+('亂', '어지러울'),
+('亂', '어지러울 란'),
+('亂', '어지럽다'),
+('亄', ' 아낄 의'),
+('亄', ' 인색할 의'),
+('亄', '탐할 의'),
+('亅', 'hook'),
+('亅', '갈고리'),
+('亅', '갈고리 궐'),
+('亅', '궐'),
+('了', 'Hanja form of 료/요 (“finish, complete”).'),
+('了', '료'),
+('了', '마치다'),
+('了', '마칠'),
+('了', '마칠 료'),
+('了', '요'),
+('亇', 'hammer'),
+('亇', '마'),
+('亇', '망치'),
+('亇', '망치 마'),
+('予', '여'),
+('予', '자기 여'),
+('亊', 'sa'),
+('亊', '사'),
+('事', '일 사'),
+('二', ' 같을 이'),
+('二', ' 의심할 이'),
+('二', ' 풍신 이'),
+('二', 'Hanja form of 이 (“two”).'),
+('二', '두'),
+('二', '두 이'),
+('二', '둘'),
+('二', '이'),
+('亍', ' 겨우 디딜 촉'),
+('亍', '땅 이름 마'),
+('亍', '자축거릴 촉'),
+('于', ' 만족할 우'),
+('于', ' 여기 우'),
+('于', ' 탄식의 어조사 우'),
+('于', '갈 우'),
+('于', '우'),
+('亏', '于의 本字'),
+('亐', '땅 이름'),
+('亐', '어조사'),
+('亐', '우'),
+('亐', '울'),
+('云', ' 돌아갈 운'),
+('云', ' 움직일 운'),
+('云', '운'),
+('云', '이를 운'),
+('互', ' 함께 호'),
+('互', '서로 호'),
+('互', '호'),
+('亓', 'gi'),
+('亓', 'ki'),
+('亓', '其의 古字'),
+('亓', '기'),
+('五', 'Hanja form of 오 (“five”).'),
+('五', '다섯'),
+('五', '다섯 오'),
+('五', '오'),
+('井', ' 괘 이름 정'),
+('井', ' 단정할 정'),
+('井', ' 저자 정'),
+('井', ' 천정 정'),
+('井', 'Hanja form of 정 (“well (a hole sunk into the ground)”).'),
+('井', '우물'),
+('井', '우물 정'),
+('井', '정'),
+('亘', '구할 선'),
+('亘', '굳셀 환'),
+('亙', '긍'),
+('亙', '뻗칠 긍'),
+('些', 'little'),
+('些', '사'),
+('些', '적을 사'),
+('亜', 'Alternative form of 亞 (“Hanja form of 아 (“second; sub-”).”)'),
+('亜', '亞의 略字'),
+('亜', '버금'),
+('亜', '아'),
+('亝', 'che'),
+('亝', 'je'),
+('亝', '재계할 제'),
+('亝', '제'),
+('亞', 'Hanja form of 아 (“Asia (abbreviation)”).'),
+('亞', 'Hanja form of 아 (“ranking next; coming after”).'),
+('亞', 'Hanja form of 아 (“second; sub-”).'),
+('亞', 'Hanja form of 아 (“used as a prefix to names”).'),
+('亞', '버금'),
+('亞', '버금 아'),
+('亞', '아'),
+('亟', '빠를 극'),
+('亟', '자주 기'),
+('亠', '두'),
+('亠', '뜻 없는 토 두'),
+('亡', 'Alternative form of 無 (“Hanja form of 무 (“not”).”)'),
+('亡', 'Hanja form of 망 (“destroy; collapse”).'),
+('亡', '망'),
+('亡', '망하다'),
+('亡', '망할'),
+('亡', '망할 망'),
+('亡', '무'),
+('亡', '없다'),
+('亡', '없을'),
+('亡', '없을 무'),
+('亢', ' 가릴 항'),
+('亢', ' 기둥 항'),
+('亢', ' 높을 항'),
+('亢', ' 별이름 항'),
+('亢', '목 항'),
+('亢', '항'),
+('交', 'Hanja form of 교 (“to intersect”).'),
+('交', '교'),
+('交', '사귀다'),
+('交', '사귈'),
+('交', '사귈 교'),
+('亥', ' 돼지 해'),
+('亥', ' 서북쪽과 북쪽의 사이 방향 해'),
+('亥', ' 음력 시월 해'),
+('亥', '열 둘째 지지 해'),
+('亥', '해'),
+('亦', ' 모두 역'),
+('亦', '또 역'),
+('亦', '역'),
+('亨', ' 제사 형'),
+('亨', '삶을 팽'),
+('亨', '형통할 형'),
+('亪', 'Kwukyel form of 난 (nan)'),
+('亪', 'Kwukyel form of 란 (ran)'),
+('亪', 'Kwukyel form of 역 (yeok)'),
+('亪', '구결자'),
+('亪', '난'),
+('亪', '란'),
+('亪', '역'),
+('享', ' 잔치 향'),
+('享', ' 제사지낼 향'),
+('享', ' 흠향할 향'),
+('享', 'Hanja form of 향 (“to enjoy”).'),
+('享', 'Hanja form of 향 (“to enjoy”). [affix]'),
+('享', '누리다'),
+('享', '누릴'),
+('享', '드릴 향'),
+('享', '향'),
+('京', 'Hanja form of 경 (“10,000,000,000,000,000, 10¹⁶, (US) ten quadrillion, (UK) ten thousand billion”).'),
+('京', 'Hanja form of 경 (“capital”).'),
+('京', '경'),
+('京', '서울'),
+('京', '서울 경'),
+('亭', ' 고를 정'),
+('亭', ' 여관 정'),
+('亭', 'chŏng'),
+('亭', 'jeong'),
+('亭', '정'),
+('亭', '정자 정'),
+('亮', '량'),
+('亮', '밝을 량'),
+('亰', 'Alternative form of 京 (“Hanja form of 경 (“capital city”).”)'),
+('亰', '경'),
+('亰', '서울'),
+('亰', '서울 경'),
+('亱', '야'),
+('亳', 'bak'),
+('亳', 'pak'),
+('亳', '땅이름 박'),
+('亳', '박'),
+('亴', 'yu'),
+('亴', '유'),
+('亶', '믿을 단'),
+('亷', '렴'),
+('亹', ' 문채가 있는 모양 미'),
+('亹', '땅이름 문'),
+('亹', '힘쓸 미'),
+('人', 'Hanja form of 인 (“human; person”).'),
+('人', '사람'),
+('人', '사람 인'),
+('人', '인'),
+('亻', '사'),
+('亼', 'chip'),
+('亼', 'jip'),
+('亼', '집'),
+('亾', '兦과 同字'),
+('什', '세간 집'),
+('什', '열 사람 십'),
+('仁', 'Hanja form of 인 (“benevolence”).'),
+('仁', '어질'),
+('仁', '어질 인'),
+('仁', '어질다'),
+('仁', '인'),
+('仂', 'reuk'),
+('仂', 'rŭk'),
+('仂', '나머지 륵'),
+('仂', '륵'),
+('仄', ' 돈 이름 측'),
+('仄', ' 물이 괄괄 흐를 측'),
+('仄', ' 성조 측'),
+('仄', ' 옆 측'),
+('仄', ' 희미할 측'),
+('仄', '기울 측'),
+('仄', '측'),
+('仆', '부'),
+('仆', '엎드릴 부'),
+('仇', 'enemy'),
+('仇', 'enmity'),
+('仇', 'hate, hatred'),
+('仇', '구'),
+('仇', '짝 구'),
+('今', 'Hanja form of 금 (“now; at present”).'),
+('今', 'Hanja form of 금 (“this”).'),
+('今', '금'),
+('今', '이제'),
+('今', '이제 금'),
+('介', ' 도울 개'),
+('介', ' 맬 개'),
+('介', ' 중매할 개'),
+('介', ' 클 개'),
+('介', 'forerunner, herald, harbinger'),
+('介', 'sea shell'),
+('介', 'to lie between'),
+('介', 'to wear armor'),
+('介', '개'),
+('介', '낄 개'),
+('仍', '인할 잉'),
+('仍', '잉'),
+('从', '從의 古字'),
+('仏', '佛의 古字'),
+('仒', 'Kwukyel form of 샤 (sya)'),
+('仒', '샤'),
+('仔', '자'),
+('仔', '자세할 자'),
+('仕', 'Hanja form of 사 (“serve; official”).'),
+('仕', '벼슬할 사'),
+('仕', '사'),
+('仕', '섬길'),
+('他', ' 간사할 타'),
+('他', ' 저 타'),
+('他', 'Hanja form of 타 (“another, other, some other”).'),
+('他', '남'),
+('他', '다를 타'),
+('他', '타'),
+('仗', '병장기 장'),
+('仗', '장'),
+('付', 'Hanja form of 부 (“entrust”).'),
+('付', 'Hanja form of 부 (“give, deliver, pay, hand over”).'),
+('付', '부'),
+('付', '주다'),
+('付', '줄'),
+('付', '줄 부'),
+('仙', 'Hanja form of 선 (“a sage or hermit, an enlightened person, usually immortal and ageless”).'),
+('仙', '선'),
+('仙', '신선'),
+('仙', '신선 선'),
+('仚', 'Alternative form of 仙 (“Hanja form of 선 (“a sage or hermit, an enlightened person, usually immortal and ageless”).”)'),
+('仚', 'Hanja form of 선 (“to fly”).'),
+('仚', 'Hanja form of 헌 (“There are people on the top of a mountain”).'),
+('仚', '날듯할 헌'),
+('仚', '산 위에 사람 있을'),
+('仚', '선'),
+('仚', '신선'),
+('仚', '헌'),
+('仛', ' 다를 탁'),
+('仛', '부칠 탁'),
+('仛', '위탁할 차'),
+('仝', 'dong'),
+('仝', 'tong'),
+('仝', '同의 古字'),
+('仝', '동'),
+('仞', '길 인'),
+('仞', '인'),
+('仟', 'ch''ŏn'),
+('仟', 'cheon'),
+('仟', '일천 천'),
+('仟', '천'),
+('仡', 'high'),
+('仡', 'quick'),
+('仡', 'shake'),
+('仡', '날래다'),
+('仡', '날랠'),
+('仡', '날랠 흘'),
+('仡', '흘'),
+('仢', 'cak'),
+('仢', 'chak'),
+('仢', 'jak'),
+('仢', '외나무 다리 작 '),
+('仢', '작'),
+('代', 'Hanja form of 대 (“generation”).'),
+('代', 'Hanja form of 대 (“generation”). [noun; suffix; affix]'),
+('代', 'Hanja form of 대 (“to replace”).'),
+('代', 'Hanja form of 대 (“to replace”). [prefix; affix]'),
+('代', '대'),
+('代', '대신할'),
+('代', '대신할 대'),
+('代', '세대'),
+('令', ' 시킬 령'),
+('令', 'Hanja form of 령/영 (“an order; a command”).'),
+('令', 'Hanja form of 령/영 (“to cause; to allow”).'),
+('令', 'Hanja form of 령/영 (“to order; to command”).'),
+('令', '령'),
+('令', '명령 령'),
+('令', '영'),
+('令', '하여금'),
+('以', ' 거느릴 이'),
+('以', ' 까닭 이'),
+('以', ' 쓸 이'),
+('以', ' 함께 이'),
+('以', 'Hanja form of 이 (“because”).'),
+('以', 'Hanja form of 이 (“by means of”).'),
+('以', 'Hanja form of 이 (“compared to”).'),
+('以', 'Hanja form of 이 (“compared with”).'),
+('以', 'Hanja form of 이 (“in view of”).'),
+('以', 'Hanja form of 이 (“than”).'),
+('以', '써'),
+('以', '써 이'),
+('以', '이'),
+('仭', ' 깊을 인'),
+('仭', ' 잴 인'),
+('仭', ' 찰 인'),
+('仭', 'in'),
+('仭', '길 인'),
+('仭', '인'),
+('仮', '假의 略字'),
+('仮', '反과 同字'),
+('仰', 'to look up; to rely on; to admire'),
+('仰', 'to raise the head to look'),
+('仰', '앙'),
+('仰', '우러를 앙'),
+('仲', '버금 중'),
+('仲', '중'),
+('仳', '떠날 비'),
+('仳', '비'),
+('仵', ' 같을 오'),
+('仵', 'o'),
+('仵', '오'),
+('仵', '짝 오'),
+('件', ' 가지 건'),
+('件', ' 구별할 건'),
+('件', ' 나눌 건'),
+('件', 'Hanja form of 건 (“case”).'),
+('件', 'Hanja form of 건 (“example”).'),
+('件', 'Hanja form of 건 (“matter”).'),
+('件', 'Hanja form of 건 (“precedent”).'),
+('件', 'Hanja form of 건 (“subject”).'),
+('件', '건'),
+('件', '물건'),
+('件', '조건 건'),
+('价', ' 사신 개'),
+('价', ' 클 개'),
+('价', 'gae'),
+('价', 'kae'),
+('价', '개'),
+('价', '착할 개'),
+('任', 'Hanja form of 임 (“duty; responsibility”).'),
+('任', '맡길'),
+('任', '맡길 임'),
+('任', '임'),
+('份', 'duty'),
+('份', 'part'),
+('份', 'portion'),
+('份', '빈'),
+('份', '빛날 빈'),
+('仿', 'imitate'),
+('仿', 'similar to'),
+('仿', '방'),
+('仿', '헤멜 방'),
+('伀', 'chong'),
+('伀', 'jong'),
+('伀', '두려워할 종'),
+('伀', '종'),
+('企', 'Hanja form of 기 (“plan”).'),
+('企', '기'),
+('企', '꾀하다'),
+('企', '꾀할'),
+('企', '꾀할 기'),
+('伃', ' 아름다울 여'),
+('伃', 'beautiful'),
+('伃', 'yeo'),
+('伃', 'yŏ'),
+('伃', '궁녀 벼슬이름 여'),
+('伃', '여'),
+('伅', 'don'),
+('伅', 'ton'),
+('伅', '돈'),
+('伅', '어두울 돈 '),
+('伇', 'yeok'),
+('伇', 'yŏk'),
+('伇', '役의 古字 '),
+('伇', '역'),
+('伈', '두려워할 심'),
+('伈', '두려워할 침'),
+('伉', ' 겨룰 항'),
+('伉', ' 배필 항'),
+('伉', ' 우뚝할 항'),
+('伉', 'hang'),
+('伉', '강직할 항'),
+('伉', '항'),
+('伊', ' 답답할 이'),
+('伊', ' 성씨 이'),
+('伊', ' 오직 이'),
+('伊', ' 이 이'),
+('伊', '이'),
+('伊', '저'),
+('伊', '저 이'),
+('伋', 'geup'),
+('伋', 'kŭp'),
+('伋', '급'),
+('伋', '속일 급'),
+('伍', ' 다섯 사람 오'),
+('伍', ' 무리 오'),
+('伍', 'Hanja form of 오 (“five”).'),
+('伍', '五의 갖은자'),
+('伍', '다섯사람'),
+('伍', '오'),
+('伎', 'gi'),
+('伎', 'ki'),
+('伎', '기'),
+('伎', '재주 기'),
+('伏', 'Hanja form of 복 (“crouch, crawl, lie hidden, conceal”).'),
+('伏', 'Hanja form of 복 (“embrace, hold something in one''s arms”).'),
+('伏', '복'),
+('伏', '부'),
+('伏', '안다'),
+('伏', '안을'),
+('伏', '알 안을 부'),
+('伏', '엎드리다'),
+('伏', '엎드릴'),
+('伏', '엎드릴 복'),
+('伐', 'Hanja form of 벌 (“to attack, to strike, to cut”).'),
+('伐', '벌'),
+('伐', '치다'),
+('伐', '칠'),
+('伐', '칠 벌'),
+('休', 'Hanja form of 휴 (“rest; relax”).'),
+('休', '쉬다'),
+('休', '쉴'),
+('休', '쉴 휴'),
+('休', '휴'),
+('伙', '세간 화'),
+('伙', '화'),
+('会', '會의 俗字'),
+('会', '會의 略字'),
+('伜', '사'),
+('伜', '촐'),
+('伝', 'cen'),
+('伝', 'chŏn'),
+('伝', 'jeon'),
+('伝', '傳의 略字'),
+('伝', '전'),
+('伣', '俔과 同字'),
+('伩', '信과 同字'),
+('伩', '신'),
+('伯', ' 으뜸 패'),
+('伯', 'Alternative form of 陌 (맥 (maek))'),
+('伯', 'Hanja form of 백 (“eldest brother”).'),
+('伯', 'Hanja form of 백 (“father''s elder brother”).'),
+('伯', 'Hanja form of 패 (“feudal chief; chieftain; feudal rank count; earl (abolished in the late 14th century)”).'),
+('伯', '길'),
+('伯', '두목'),
+('伯', '맏'),
+('伯', '맏 백'),
+('伯', '맥'),
+('伯', '백'),
+('伯', '우두머리'),
+('伯', '우두머리 패'),
+('伯', '큰아버지'),
+('伯', '패'),
+('估', '값 고'),
+('估', '고'),
+('伴', 'Hanja form of 반 (“companion”).'),
+('伴', '반'),
+('伴', '짝'),
+('伴', '짝 반'),
+('伶', ' 광대 령'),
+('伶', ' 악공 령'),
+('伶', '령'),
+('伶', '영리할 령'),
+('伸', ' 기지개 신'),
+('伸', ' 다스릴 신'),
+('伸', '신'),
+('伸', '펴다'),
+('伸', '펼'),
+('伸', '펼 신'),
+('伺', 'sa'),
+('伺', '사'),
+('伺', '엿볼 사'),
+('伻', ' 좇을 팽'),
+('伻', 'p''aeng'),
+('伻', 'paeng'),
+('伻', '부릴 팽'),
+('伻', '팽'),
+('似', '같을 사'),
+('似', '사'),
+('伽', '가'),
+('伽', '절'),
+('伽', '절 가'),
+('伾', 'bi'),
+('伾', 'pi'),
+('伾', '비'),
+('伾', '힘셀 비'),
+('佀', 'sa'),
+('佀', '같을 사'),
+('佀', '사'),
+('佁', 'i'),
+('佁', '미련스러울 이 '),
+('佁', '이'),
+('佂', 'chŏng'),
+('佂', 'jeong'),
+('佂', '두려워할 정 '),
+('佂', '정'),
+('佃', ' 머슴꾼 전'),
+('佃', ' 사냥할 전'),
+('佃', '밭 맬 전'),
+('佃', '전'),
+('但', 'Hanja form of 단 (“but, however, yet, still”).'),
+('但', 'Hanja form of 단 (“only”).'),
+('但', '다만'),
+('但', '다만 단'),
+('但', '단'),
+('佇', ' 기다릴 저'),
+('佇', ' 잠깐 머물 저'),
+('佇', 'to stand (for a while)'),
+('佇', 'to stay'),
+('佇', 'to store; to accumulate'),
+('佇', 'to wait for'),
+('佇', '오래 설 저'),
+('佇', '우두커니 설'),
+('佇', '저'),
+('佈', '펼칠 포'),
+('佈', '포'),
+('佉', '나라 이름 구'),
+('佉', '나라이름 거'),
+('佊', '간사할 피 '),
+('佊', '피'),
+('佋', ' 댓수의 차례 소'),
+('佋', ' 사신 소'),
+('佋', 'so'),
+('佋', '소'),
+('佋', '소개할 소'),
+('位', ' 방위 위'),
+('位', ' 임금의 신분 위'),
+('位', ' 자리 위'),
+('位', 'Hanja form of 위 (“rank, place”).'),
+('位', 'Hanja form of 위 (“rank, place”). [counter]'),
+('位', 'Hanja form of 위 (“status, position”).'),
+('位', 'Hanja form of 위 (“status, position”). [noun]'),
+('位', '벼슬 위'),
+('位', '위'),
+('位', '자리'),
+('低', ' 값 쌀 저'),
+('低', ' 머뭇거릴 저'),
+('低', ' 소리 약할 저'),
+('低', ' 숙일 저'),
+('低', 'Hanja form of 저 (“cheap”).'),
+('低', 'Hanja form of 저 (“low”).'),
+('低', '낮다'),
+('低', '낮을'),
+('低', '낮을 저'),
+('低', '저'),
+('住', 'Hanja form of 주 (“resident”).'),
+('住', 'Hanja form of 주 (“to pick up, to raise”).'),
+('住', 'Hanja form of 주 (“to reside”).'),
+('住', 'Hanja form of 주 (“to stay at”).'),
+('住', 'Hanja form of 주 (“to stop”).'),
+('住', 'Hanja form of 주 (“whereabouts, house”).'),
+('住', '살'),
+('住', '살 주'),
+('住', '살다'),
+('住', '주'),
+('佐', 'Hanja form of 좌 (“(literary) subordinate”).'),
+('佐', 'Hanja form of 좌 (“(military) commander; a field grade officer in the Korean People''s Army”).'),
+('佐', '도울'),
+('佐', '도울 좌'),
+('佐', '돕다'),
+('佐', '좌'),
+('佑', 'u'),
+('佑', '도울 우'),
+('佑', '우'),
+('佒', 'ang'),
+('佒', '몸 거북할 앙 '),
+('佒', '앙'),
+('体', 'Alternative form of 笨 (“Hanja form of 분 (“mediocre; rough”).”)'),
+('体', 'Alternative form of 體 (“Hanja form of 체 (“body”).”)'),
+('体', '몸'),
+('体', '몸 체'),
+('体', '분'),
+('体', '용렬하다'),
+('体', '용렬할'),
+('体', '용렬할 분'),
+('体', '체'),
+('佔', ' 숙일 점'),
+('佔', 'occupy'),
+('佔', 'seize'),
+('佔', 'take'),
+('佔', '엿볼 점'),
+('佔', '점'),
+('何', 'Hanja form of 하 (“how; what”).'),
+('何', '어찌'),
+('何', '어찌 하'),
+('何', '하'),
+('佖', ' 가득할 필 '),
+('佖', 'p''il'),
+('佖', 'pil'),
+('佖', '점잔피울 필'),
+('佖', '필'),
+('佗', ' 더할 타'),
+('佗', ' 마음에 든든할 타'),
+('佗', ' 입을 타'),
+('佗', ' 저 타'),
+('佗', ' 짊어질 타'),
+('佗', '다를 타'),
+('佗', '타'),
+('佘', '사'),
+('佘', '산 이름 사'),
+('余', ' 남을 여'),
+('余', '여'),
+('余', '자기 여'),
+('佚', '편안할 일'),
+('佚', '흐릴 질'),
+('佛', ' 도울 필'),
+('佛', 'Hanja form of 불 (“Buddha”).'),
+('佛', 'Hanja form of 불 (“France (in compounds, in news media)”).'),
+('佛', '부처'),
+('佛', '부처 불'),
+('佛', '불'),
+('佛', '흥할 필'),
+('作', 'Alternative form of 做 (“Hanja form of 주/자 (“to make”).”)'),
+('作', 'Alternative form of 詛 (“Hanja form of 저 (“to curse”).”)'),
+('作', 'Hanja form of 작 (“composition”).'),
+('作', '만들'),
+('作', '만들다'),
+('作', '원망할 주'),
+('作', '자'),
+('作', '작'),
+('作', '저'),
+('作', '저주하다'),
+('作', '저주할'),
+('作', '주'),
+('作', '지을'),
+('作', '지을 작'),
+('佝', 'gu'),
+('佝', 'ku'),
+('佝', '구'),
+('佝', '꼽추 구'),
+('佞', 'flattery'),
+('佞', 'glib'),
+('佞', '녕'),
+('佞', '재주 녕'),
+('佟', 't''ung'),
+('佟', 'tung'),
+('佟', '퉁'),
+('你', '너 니'),
+('你', '니'),
+('佢', 'Hanja form of 거 (“he, him”).'),
+('佢', '거'),
+('佢', '그'),
+('佩', ' 마음에 먹을 패'),
+('佩', ' 물이 흘러서 합할 패'),
+('佩', ' 찰 패'),
+('佩', '패'),
+('佩', '패옥 패'),
+('佪', 'hoe'),
+('佪', '어정거릴 회'),
+('佪', '회'),
+('佮', 'hap'),
+('佮', '합'),
+('佯', ' 어정거릴 양'),
+('佯', 'yang'),
+('佯', '거짓 양'),
+('佯', '양'),
+('佰', 'centurion'),
+('佰', 'hundred'),
+('佰', '백'),
+('佳', ' 좋아할 개'),
+('佳', ' 좋을 개'),
+('佳', 'Hanja form of 가 (“good; auspicious, beautiful, delightful”).'),
+('佳', 'Hanja form of 가 (“good; auspicious, beautiful, delightful”). [affix]'),
+('佳', '가'),
+('佳', '아름다울'),
+('佳', '아름다울 가'),
+('佳', '아름답다'),
+('佳', '착할 개'),
+('佴', 'i'),
+('佴', '버금 이'),
+('佴', '이'),
+('併', '倂의 俗字'),
+('併', '병'),
+('佶', 'gil'),
+('佶', 'kil'),
+('佶', '건장할 길'),
+('佶', '길'),
+('佷', ' 고을이름 항'),
+('佷', '돌아올 항'),
+('佷', '잔인할 한'),
+('佸', 'gwal'),
+('佸', 'kwal'),
+('佸', '괄'),
+('佸', '힘 쓸 괄'),
+('佹', 'deceive'),
+('佹', 'go against'),
+('佹', 'gwe'),
+('佹', 'kwe'),
+('佹', 'strange'),
+('佹', '궤'),
+('佹', '포갤 궤'),
+('佺', 'chŏn'),
+('佺', 'jeon'),
+('佺', '신선이름 전'),
+('佺', '전'),
+('佻', '방정맞을 조'),
+('佻', '조'),
+('佼', 'gyo'),
+('佼', 'kyo'),
+('佼', '교'),
+('佼', '예쁠 교'),
+('佽', 'ch''a'),
+('佽', 'cha'),
+('佽', '도울 차'),
+('佽', '차'),
+('佾', 'il'),
+('佾', '일'),
+('佾', '춤 일'),
+('使', 'Hanja form of 사 (“envoy; messenger”).'),
+('使', 'Hanja form of 사 (“in order to do”).'),
+('使', 'Hanja form of 사 (“to use; to employ”).'),
+('使', '부릴'),
+('使', '사'),
+('使', '하여금 사'),
+('侀', ' 모일 형'),
+('侀', 'hyeong'),
+('侀', 'hyŏng'),
+('侀', '이룰 형'),
+('侀', '형'),
+('侁', 'sin'),
+('侁', '떼지어 갈 신'),
+('侁', '신'),
+('侂', ' 부탁할 탁'),
+('侂', 't''ak'),
+('侂', 'tak'),
+('侂', '부칠 탁'),
+('侂', '탁'),
+('侃', 'gan'),
+('侃', 'kan'),
+('侃', '간'),
+('侃', '강직할 간'),
+('侄', 'chil'),
+('侄', 'jil'),
+('侄', '어리석을 질'),
+('侄', '질'),
+('侅', '이상할 해'),
+('侅', '해'),
+('來', 'Hanja form of 래 (“to come; to arrive”).'),
+('來', '내'),
+('來', '래'),
+('來', '오다'),
+('來', '올'),
+('來', '올 래'),
+('侇', ' 주검 이'),
+('侇', '무리 이'),
+('侇', '이'),
+('侈', ' 넓을 치'),
+('侈', ' 많을 치'),
+('侈', ' 풍부할 치'),
+('侈', '사치할 치'),
+('侈', '치'),
+('侉', 'gwa'),
+('侉', 'kwa'),
+('侉', '과'),
+('侉', '자랑할 과 '),
+('侊', 'gwang'),
+('侊', 'kwang'),
+('侊', '광'),
+('侊', '성한 모양 광'),
+('例', 'Hanja form of 례/예 (“example”).'),
+('例', 'Hanja form of 례/예 (“rule; formalities; process”).'),
+('例', '례'),
+('例', '법식 례'),
+('例', '법식(法式)'),
+('例', '예'),
+('侌', 'eum'),
+('侌', 'um'),
+('侌', 'ŭm'),
+('侌', '그늘: shade, shadow'),
+('侌', '음'),
+('侍', ' 가까울 시'),
+('侍', ' 좇을 시'),
+('侍', '모실 시'),
+('侍', '시'),
+('侎', 'mi'),
+('侎', '미'),
+('侎', '어루만질 미'),
+('侏', '난쟁이 주'),
+('侏', '주'),
+('侐', 'hyeok'),
+('侐', 'hyŏk'),
+('侐', '고요할 혁'),
+('侐', '혁'),
+('侑', ' 권할 유'),
+('侑', ' 귀인을 모시고 밥먹을 유'),
+('侑', 'help, assist'),
+('侑', 'repay kindness'),
+('侑', '도울 유'),
+('侑', '유'),
+('侒', 'an'),
+('侒', '안'),
+('侒', '편안할 안 '),
+('侔', '가지런 할 모'),
+('侔', '모'),
+('侖', '둥글 륜'),
+('侗', 'dong'),
+('侗', 'tong'),
+('侗', '동'),
+('侗', '무지할 동'),
+('侘', '실의할 차'),
+('侘', '차'),
+('侙', 'ch''ik'),
+('侙', 'chik'),
+('侙', '두려워할 칙 '),
+('侙', '칙'),
+('侚', ' 빠를 순'),
+('侚', ' 조리 돌릴 순'),
+('侚', 'sun'),
+('侚', '순'),
+('侚', '좇을 순'),
+('供', 'Hanja form of 공 (“contribute, supply, provide”).'),
+('供', '공'),
+('供', '이바지하다'),
+('供', '이바지할'),
+('供', '이바지할 공'),
+('侜', '속일 주'),
+('侜', '주'),
+('依', ' 기댈 의'),
+('依', ' 따를 의'),
+('依', ' 병풍 의'),
+('依', ' 비슷할 의'),
+('依', ' 비유할 의'),
+('依', '의'),
+('依', '의지할 의'),
+('侞', 'yeo'),
+('侞', 'yŏ'),
+('侞', '여'),
+('侞', '온순할 여 '),
+('侠', '俠과 同字'),
+('侠', '俠의 俗字'),
+('価', '價의 略字'),
+('侤', 'go'),
+('侤', 'ko'),
+('侤', '고'),
+('侤', '생각할 고 '),
+('侮', 'Hanja form of 모 (“insult, ridicule, disgrace”).'),
+('侮', '모'),
+('侮', '업신여기다'),
+('侮', '업신여길'),
+('侮', '업신여길 모'),
+('侯', 'Hanja form of 후 (“marquis; lord”).'),
+('侯', 'Hanja form of 후 (“target in archery”).'),
+('侯', '과녁 후'),
+('侯', '제후'),
+('侯', '후'),
+('侲', 'chin'),
+('侲', 'jin'),
+('侲', '동자 진 '),
+('侲', '진'),
+('侳', 'chwa'),
+('侳', 'jwa'),
+('侳', '욕보일 좌 '),
+('侳', '좌'),
+('侵', ' 습격할 침'),
+('侵', ' 침노할 침'),
+('侵', ' 흉작 침'),
+('侵', '범할 침'),
+('侵', '침'),
+('侶', 'Hanja form of 려/여 (“companion”).'),
+('侶', '려'),
+('侶', '여'),
+('侶', '짝'),
+('侶', '짝 려'),
+('侷', 'guk'),
+('侷', 'kuk'),
+('侷', '국'),
+('侷', '죄어칠 국'),
+('侸', 'du'),
+('侸', 'tu'),
+('侸', 'twu'),
+('侸', '두'),
+('侸', '마를 두 '),
+('侹', ' 멀쑥할 정 '),
+('侹', 'chŏng'),
+('侹', 'jeong'),
+('侹', '정'),
+('侹', '평평할 정'),
+('侻', ' 가벼울 탈'),
+('侻', ' 간략할 탈 '),
+('侻', 't''al'),
+('侻', 'tal'),
+('侻', '간사할 탈'),
+('侻', '탈'),
+('便', ' 소식 편'),
+('便', ' 오줌 편'),
+('便', ' 익힐 편'),
+('便', 'Hanja form of 변 (“feces and urine”).'),
+('便', 'Hanja form of 편 (“convenience; ease; comfortability”).'),
+('便', '똥오줌'),
+('便', '똥오줌 변'),
+('便', '변'),
+('便', '편'),
+('便', '편하다'),
+('便', '편할'),
+('便', '편할 편'),
+('俁', 'u'),
+('俁', '우'),
+('係', 'Hanja form of 계 (“connection”).'),
+('係', '걸릴 계'),
+('係', '계'),
+('係', '매다'),
+('係', '맬'),
+('促', ' 빠를 촉'),
+('促', ' 좁을 촉'),
+('促', ' 짧을 촉'),
+('促', ' 촉박할 촉'),
+('促', '촉'),
+('促', '핍박할 촉'),
+('俄', '갑자기 아'),
+('俄', '아'),
+('俅', 'gu'),
+('俅', 'ku'),
+('俅', 'polite'),
+('俅', 'respectful'),
+('俅', '공손할 구'),
+('俅', '구'),
+('俇', 'gwang'),
+('俇', 'kwang'),
+('俇', '광'),
+('俇', '허둥지둥할 광 '),
+('俉', 'o'),
+('俉', '맞이할 오 '),
+('俉', '오'),
+('俊', 'Hanja form of 준 (“a surname.”).'),
+('俊', 'Hanja form of 준 (“beautiful; handsome”).'),
+('俊', 'Hanja form of 준 (“person of outstanding talent”).'),
+('俊', '준'),
+('俊', '준걸 준'),
+('俊', '준걸(俊傑)'),
+('俋', ' 밭 가는 모양 읍 '),
+('俋', 'eup'),
+('俋', 'ŭp'),
+('俋', '날쌜 읍'),
+('俋', '읍'),
+('俌', 'bo'),
+('俌', 'po'),
+('俌', '도울 보 '),
+('俌', '보'),
+('俍', 'ryang'),
+('俍', '良과 同字 '),
+('俍', '량'),
+('俎', 'cho'),
+('俎', 'jo'),
+('俎', '도마 조'),
+('俎', '조'),
+('俏', 'like'),
+('俏', 'pretty'),
+('俏', 'resemble'),
+('俏', 'similar'),
+('俏', '거문고 뒤치는 소리 소'),
+('俏', '소'),
+('俐', '똑똑할 리'),
+('俐', '리'),
+('俑', '시체와 함께 매장하는 허수아비 인형 용'),
+('俑', '용'),
+('俒', 'heun'),
+('俒', 'hŭn'),
+('俒', '완전할 흔 '),
+('俒', '흔'),
+('俓', 'gyeong'),
+('俓', 'kyŏng'),
+('俓', '徑과 同字'),
+('俓', '경'),
+('俔', ' 풍세보는 깃 현'),
+('俔', 'hyeon'),
+('俔', 'hyŏn'),
+('俔', '연탐할 현'),
+('俔', '현'),
+('俗', ' 버릇 속'),
+('俗', ' 세상 속'),
+('俗', ' 풍속 속'),
+('俗', 'Hanja form of 속 (“vulgar; unrefined; common; popular; vernacular”).'),
+('俗', '속'),
+('俗', '익을 속'),
+('俗', '풍속'),
+('俘', 'bu'),
+('俘', 'captive'),
+('俘', 'pu'),
+('俘', '부'),
+('俘', '사로잡을 부'),
+('俙', ' 어슴프레할 희'),
+('俙', ' 희미할 희'),
+('俙', 'hui'),
+('俙', 'hŭi'),
+('俙', '비슷할 희'),
+('俙', '희'),
+('俚', '리'),
+('俚', '속될 리'),
+('俛', '면'),
+('俛', '힘쓸 면'),
+('俜', 'bing'),
+('俜', 'ping'),
+('俜', '비틀거리다 빙'),
+('俜', '빙'),
+('保', 'Hanja form of 보 (“guarantee”).'),
+('保', 'Hanja form of 보 (“protection”).'),
+('保', '보'),
+('保', '지키다'),
+('保', '지킬'),
+('保', '지킬 보'),
+('俞', '兪의 俗字'),
+('俞', '유'),
+('俟', '기다릴 사'),
+('俟', '성씨 기'),
+('俠', ' 사이에 낄 협'),
+('俠', 'chivalrous person'),
+('俠', 'hyeop'),
+('俠', 'hyŏp'),
+('俠', 'knight-errant'),
+('俠', '아오를 겹'),
+('俠', '의기 협'),
+('俠', '협'),
+('信', ' 맏길 신'),
+('信', ' 밝힐 신'),
+('信', ' 사신 신'),
+('信', ' 이틀 밤을 잘 신'),
+('信', 'Hanja form of 신 (“believe; trust”).'),
+('信', '믿을'),
+('信', '믿을 신'),
+('信', '신'),
+('俣', '갈래질 오'),
+('俤', 'che'),
+('俤', 'je'),
+('俤', '용모 제'),
+('俤', '제'),
+('俥', '거'),
+('俥', '인력거 거'),
+('修', ' 꾸밀 수'),
+('修', ' 옳게할 수'),
+('修', ' 정리할 수'),
+('修', 'Hanja form of 수 (“discipline”).'),
+('修', '닦다'),
+('修', '닦을'),
+('修', '닦을 수'),
+('修', '수'),
+('俯', '구푸릴 부'),
+('俯', '부'),
+('俰', 'hwa'),
+('俰', '화'),
+('俰', '화할 화 '),
+('俱', 'Hanja form of 구 (“accompany, together”).'),
+('俱', '구'),
+('俱', '함께'),
+('俱', '함께 구'),
+('俲', ' 닮을 효'),
+('俲', ' 배울 효'),
+('俲', 'hyo'),
+('俲', '본받을 효'),
+('俲', '효'),
+('俳', 'bae'),
+('俳', 'pae'),
+('俳', '광대 배'),
+('俳', '배'),
+('俴', '엷을 천'),
+('俴', '천'),
+('俵', ' 가마니 표'),
+('俵', ' 흩어질 표'),
+('俵', '나누어 줄 표'),
+('俵', '표'),
+('俶', ' 지을 숙'),
+('俶', ' 처음 숙'),
+('俶', '비롯할 숙'),
+('俶', '시작할 척'),
+('俷', 'bi'),
+('俷', 'pi'),
+('俷', '등질 비 '),
+('俷', '비'),
+('俸', '녹 봉'),
+('俸', '봉'),
+('俹', ' 거만할 아 '),
+('俹', ' 의지할 아'),
+('俹', 'a'),
+('俹', '기댈 아'),
+('俹', '아'),
+('俺', ' 클 엄'),
+('俺', ' 클 업'),
+('俺', '자기 엄'),
+('俺', '자기 업'),
+('俻', ' 좇을 비'),
+('俻', ' 흘겨볼 비'),
+('俻', 'i'),
+('俻', '기'),
+('俻', '하여금 비'),
+('俾', '더할 비'),
+('俾', '비'),
+('倀', '미칠 창'),
+('倀', '창'),
+('倂', '아우를 병'),
+('倃', 'gu'),
+('倃', 'ku'),
+('倃', '구'),
+('倃', '훼방할 구'),
+('倄', ' 끙끙 앓을 효'),
+('倄', ' 한탄할 효 '),
+('倄', 'hyo'),
+('倄', '찌를 효'),
+('倄', '효'),
+('倅', ' 아직 벼슬자리에 오르지 않은 아들 쉬'),
+('倅', ' 원님 쉬'),
+('倅', '버금 쉬'),
+('倆', '량'),
+('倆', '재주 량'),
+('倉', 'Hanja form of 창 (“granary”).'),
+('倉', 'Hanja form of 창 (“warehouse; storage”).'),
+('倉', '곳집'),
+('倉', '곳집 창'),
+('倉', '창'),
+('個', ' 치우칠 개'),
+('個', 'Hanja form of 개 (“a piece”).'),
+('個', 'Hanja form of 개 (“a unit”).'),
+('個', 'Hanja form of 개 (“an item”).'),
+('個', '개'),
+('個', '낱'),
+('個', '낱 개'),
+('倌', '관'),
+('倌', '수레 모는 사람 관'),
+('倍', ' 떨어질 패'),
+('倍', ' 암송할 패'),
+('倍', 'Hanja form of 배 (“twice; double”).'),
+('倍', '곱'),
+('倍', '곱 배'),
+('倍', '배'),
+('倍', '어길 패'),
+('倎', 'chŏn'),
+('倎', 'jeon'),
+('倎', '두터울 전 '),
+('倎', '전'),
+('倏', ' 개의 빨리 달리는 모양 숙'),
+('倏', ' 홀연 숙'),
+('倏', 'suk'),
+('倏', '숙'),
+('倏', '잠간 숙'),
+('倐', 'suk'),
+('倐', '倏의 俗字'),
+('倐', '숙'),
+('們', ' 무리 문'),
+('們', '들 문'),
+('們', '문'),
+('倒', 'Hanja form of 도 (“fall over”).'),
+('倒', 'Hanja form of 도 (“lie down”).'),
+('倒', 'Hanja form of 도 (“take turns”).'),
+('倒', '넘어지다'),
+('倒', '넘어질'),
+('倒', '넘어질 도'),
+('倒', '도'),
+('倓', '담'),
+('倓', '편안할 담 '),
+('倔', '굴'),
+('倔', '딱딱할 굴'),
+('倕', ' 이름 수 '),
+('倕', 'su'),
+('倕', '무거울 수'),
+('倕', '수'),
+('倖', ' 괴일 행'),
+('倖', ' 아당할 행'),
+('倖', ' 친할 행'),
+('倖', '요행 행'),
+('倖', '행'),
+('倗', '부탁할 붕 '),
+('倗', '붕'),
+('倘', '당'),
+('倘', '혹시 당'),
+('候', 'Hanja form of 후 (“climate; season”).'),
+('候', 'Hanja form of 후 (“to forecast; to wait”).'),
+('候', '기후'),
+('候', '물을 후'),
+('候', '후'),
+('倚', ' 믿을 의'),
+('倚', ' 의지할 의'),
+('倚', '기댈 의'),
+('倚', '기이할 기'),
+('倛', '기'),
+('倛', '탈 기 '),
+('倜', '대범할 척'),
+('倜', '척'),
+('倝', '간'),
+('倝', '해 돋을 간'),
+('倞', 'gyeong'),
+('倞', 'kyŏng'),
+('倞', '경'),
+('倞', '굳셀 경'),
+('借', ' 도울 적'),
+('借', ' 빚 적'),
+('借', ' 허락할 적'),
+('借', '빌 차'),
+('借', '빌릴 적'),
+('借', '적'),
+('借', '차'),
+('倠', 'hyu'),
+('倠', '추할 휴 '),
+('倠', '휴'),
+('倡', '여광대 창'),
+('倡', '창'),
+('倢', 'beautiful'),
+('倢', 'ch''ŏp'),
+('倢', 'cheop'),
+('倢', 'handsome'),
+('倢', 'woman'),
+('倢', '빠를 첩'),
+('倢', '첩'),
+('倣', 'Hanja form of 방 (“imitate”).'),
+('倣', '방'),
+('倣', '본뜨다'),
+('倣', '본뜰'),
+('倣', '본뜰 방'),
+('値', ' 가치있을 치'),
+('値', ' 당할 치'),
+('値', ' 만날 치'),
+('値', '값 치'),
+('値', '치'),
+('倥', 'gong'),
+('倥', 'kong'),
+('倥', '공'),
+('倥', '어리석을 공'),
+('倦', 'Hanja form of 권 (“languor”).'),
+('倦', '게으르다'),
+('倦', '게으를'),
+('倦', '게으를 권'),
+('倦', '권'),
+('倧', '상고 신인 종 '),
+('倧', '종'),
+('倨', ' 걸터 앉을 거'),
+('倨', ' 굽을 거'),
+('倨', 'geo'),
+('倨', 'kŏ'),
+('倨', '거'),
+('倨', '거만할 거'),
+('倩', '예쁠 천'),
+('倩', '천'),
+('倪', ' 끝 예'),
+('倪', ' 도울 예'),
+('倪', '어릴 예'),
+('倪', '예'),
+('倫', 'Hanja form of 륜/윤 (“duty”).'),
+('倫', 'Hanja form of 륜/윤 (“morality, humanity, ethics”).'),
+('倫', '륜'),
+('倫', '윤'),
+('倫', '인륜'),
+('倫', '인륜 륜'),
+('倬', ' 클 탁'),
+('倬', '탁'),
+('倬', '환할 탁'),
+('倭', ' 빙글 돌아올 위'),
+('倭', 'Hanja form of 왜 (“ancient Japan, Yamato”).'),
+('倭', 'Hanja form of 위 (“docile, obedient”).'),
+('倭', '柔順'),
+('倭', '나라이름 왜'),
+('倭', '순한 모양 위'),
+('倭', '왜'),
+('倭', '왜나라'),
+('倭', '위'),
+('倭', '유순할'),
+('倮', 'get rid of'),
+('倮', 'naked, bare'),
+('倮', '라'),
+('倮', '알몸 라'),
+('倰', 'reung'),
+('倰', 'rŭng'),
+('倰', '릉'),
+('倰', '속일 릉 '),
+('倱', 'hon'),
+('倱', '혼'),
+('倱', '흐릿할 혼 '),
+('倲', 'dong'),
+('倲', 'tong'),
+('倲', '동'),
+('倲', '어리석을 동 '),
+('倳', 'sa'),
+('倳', '사'),
+('倳', '찌를 사 '),
+('倴', ' 둔한 사람 분 '),
+('倴', 'bun'),
+('倴', 'pun'),
+('倴', '분'),
+('倴', '사람이름 분'),
+('倶', 'gu'),
+('倶', 'ku'),
+('倶', '俱와 同字'),
+('倶', '구'),
+('倹', 'geom'),
+('倹', 'kŏm'),
+('倹', '儉의 略字'),
+('倹', '검'),
+('倻', '땅이름 야'),
+('倻', '야'),
+('值', '値와 同字'),
+('值', '치'),
+('偁', 'ch''ing'),
+('偁', 'ching'),
+('偁', '稱의 本字'),
+('偁', '칭'),
+('偃', '언'),
+('偃', '자빠질 언'),
+('偄', ' 공손할 연'),
+('偄', '언약할 난'),
+('偄', '연약할 연'),
+('偅', '동'),
+('偅', '흐리멍텅할 동 '),
+('偆', ' 두터울 춘 '),
+('偆', 'Jun'),
+('偆', 'ch''un'),
+('偆', '가멸할 춘'),
+('偆', '준'),
+('假', 'Alternative form of 格 (“Hanja form of 격 (“to come; to arrive; to go to”).”)'),
+('假', 'Alternative form of 遐 (“Hanja form of 하 (“afar; distant”).”)'),
+('假', 'Hanja form of 가 (“false, fake”).'),
+('假', '가'),
+('假', '거짓'),
+('假', '거짓 가'),
+('假', '거짓 하'),
+('假', '격'),
+('假', '멀'),
+('假', '멀다'),
+('假', '이르다'),
+('假', '이를'),
+('假', '하'),
+('偈', ' 게타 게'),
+('偈', ' 글귀 게'),
+('偈', ' 빠를 걸'),
+('偈', ' 헌걸찰 걸'),
+('偈', '쉴 게'),
+('偈', '힘 빼두를 걸'),
+('偉', ' 기특할 위'),
+('偉', ' 넉넉할 위'),
+('偉', 'Hanja form of 위 (“to be extraordinary”).'),
+('偉', '위'),
+('偉', '클 위'),
+('偉', '훌륭하다'),
+('偉', '훌륭할'),
+('偊', 'walk alone'),
+('偊', '유'),
+('偌', ' 너무 야'),
+('偌', '성씨 야'),
+('偌', '야'),
+('偎', ' 가물거릴 외'),
+('偎', 'approach'),
+('偎', 'come close'),
+('偎', 'embrace'),
+('偎', 'faint, vague'),
+('偎', '사랑할 외'),
+('偎', '외'),
+('偏', ' 간사한 모양 편'),
+('偏', ' 무리 편'),
+('偏', ' 오십명 편'),
+('偏', '치우칠 편'),
+('偏', '편'),
+('偐', '거짓 안'),
+('偐', '안'),
+('偒', 't''ang'),
+('偒', 'tang'),
+('偒', '탕'),
+('偒', '헌걸찰 탕 '),
+('偓', 'ak'),
+('偓', 'narrow-mindedness'),
+('偓', 'stubbornness'),
+('偓', 'tenacity'),
+('偓', 'wickedness'),
+('偓', '거리낄 악'),
+('偓', '악'),
+('偕', ' 굳셀 해'),
+('偕', ' 화할 혜'),
+('偕', '같을 혜'),
+('偕', '함께할 해'),
+('偖', '찢을 차'),
+('偖', '차'),
+('偘', 'gan'),
+('偘', 'kan'),
+('偘', '侃과 同字'),
+('偘', '간'),
+('做', '지을 자'),
+('做', '지을 주'),
+('偛', '삽'),
+('偛', '키작을 삽 '),
+('停', ' 늦어질 정'),
+('停', 'Hanja form of 정 (“to stop”).'),
+('停', '머무르다'),
+('停', '머무를'),
+('停', '머무를 정'),
+('停', '정'),
+('偝', '배'),
+('偝', '버릴 배'),
+('偞', ' 낮을 엽'),
+('偞', ' 얼굴 예쁠 엽 '),
+('偞', 'yeop'),
+('偞', 'yŏp'),
+('偞', '가벼울 엽'),
+('偞', '엽'),
+('偟', 'fearful'),
+('偟', 'hwang'),
+('偟', 'leisure'),
+('偟', 'wander'),
+('偟', '노닐 황'),
+('偟', '황'),
+('偠', 'yo'),
+('偠', '요'),
+('偠', '허리 가늘 요 '),
+('偢', '얼이 빠져 있을 초'),
+('偢', '초'),
+('健', ' 병 없을 건'),
+('健', ' 탐할 건'),
+('健', 'Hanja form of 건 (“strong; firm”).'),
+('健', 'Hanja form of 건 (“used to form nouns related to health”).'),
+('健', '건'),
+('健', '건강하다'),
+('健', '건강할'),
+('健', '굳세다'),
+('健', '굳셀'),
+('健', '굳셀 건'),
+('健', '탐할 견'),
+('偨', ' 오르락 내리락할 치'),
+('偨', '가지런하지 않을 치'),
+('偨', '치'),
+('偩', 'bu'),
+('偩', 'pu'),
+('偩', '본뜰 부'),
+('偩', '부'),
+('偪', ' 가까울 핍'),
+('偪', 'compel, force'),
+('偪', 'narrow'),
+('偪', '핍'),
+('偪', '핍박할 핍'),
+('偫', ' 갖출 치'),
+('偫', 'ch''i'),
+('偫', 'chi'),
+('偫', '기다릴 치'),
+('偫', '치'),
+('偬', 'ch''ong'),
+('偬', 'chong'),
+('偬', '傯의 俗字'),
+('偬', '총'),
+('偭', 'face to'),
+('偭', '면'),
+('偭', '향할 면'),
+('偯', 'ui'),
+('偯', 'ŭi'),
+('偯', '울음 끝소리 의'),
+('偯', '의'),
+('偰', 'Hanja form of 설 (“clear”).'),
+('偰', '맑다'),
+('偰', '맑을'),
+('偰', '맑을 설 '),
+('偰', '설'),
+('偲', ' 굳셀 시'),
+('偲', ' 살피고 힘쓸 시'),
+('偲', 'si'),
+('偲', '간절히 책망할 시'),
+('偲', '시'),
+('側', ' 가까울 측'),
+('側', ' 기울어질 측'),
+('側', ' 미천할 측'),
+('側', ' 배반할 측'),
+('側', ' 아플 측'),
+('側', ' 저물 측'),
+('側', 'side'),
+('側', '곁 측'),
+('側', '측'),
+('偵', ' 물을 정'),
+('偵', ' 정탐할 정'),
+('偵', 'Hanja form of 정 (“investigation; spy”).'),
+('偵', '염탐하다'),
+('偵', '염탐할'),
+('偵', '엿볼 정'),
+('偵', '정'),
+('偶', ' 뜻밖에 우'),
+('偶', ' 무리 우'),
+('偶', 'Hanja form of 우 (“by chance; accidentally; coincidentally”).'),
+('偶', 'Hanja form of 우 (“even (number)”).'),
+('偶', 'Hanja form of 우 (“idol; pair”).'),
+('偶', '마침'),
+('偶', '우'),
+('偶', '짝'),
+('偶', '짝지울 우'),
+('偷', '偸와 同字'),
+('偷', '투'),
+('偸', ' 구차할 투'),
+('偸', ' 엷을 투'),
+('偸', ' 인정머리없을 투'),
+('偸', 't''u'),
+('偸', 'tu'),
+('偸', '투'),
+('偸', '훔칠 투'),
+('偹', 'bi'),
+('偹', 'pi'),
+('偹', '비'),
+('偽', '僞의 略字'),
+('偽', '위'),
+('傀', 'Hanja form of 괴 (“large”).'),
+('傀', 'Hanja form of 괴 (“puppet”).'),
+('傀', '괴'),
+('傀', '꼭두각시/허수아비'),
+('傀', '크다'),
+('傀', '클'),
+('傀', '클 괴'),
+('傃', ' 떳떳할 소 '),
+('傃', 'so'),
+('傃', '소'),
+('傃', '향할 소'),
+('傅', '부'),
+('傅', '스승 부'),
+('傋', 'gang'),
+('傋', 'kang'),
+('傋', '강'),
+('傋', '아첨 아니할 강 '),
+('傌', '마'),
+('傌', '욕할 마'),
+('傍', 'Hanja form of 방 (“by side of, beside, near, close”).'),
+('傍', 'Hanja form of 팽 (“compel”).'),
+('傍', 'Hanja form of 팽 (“rely on, depend on”).'),
+('傍', '곁'),
+('傍', '곁 방'),
+('傍', '마지못하다'),
+('傍', '마지못할'),
+('傍', '마지못할 팽'),
+('傍', '방'),
+('傍', '팽'),
+('傎', 'chŏn'),
+('傎', 'jeon'),
+('傎', '엎드러질 전'),
+('傎', '전'),
+('傏', '당'),
+('傏', '당돌할'),
+('傑', ' 거만할 걸'),
+('傑', ' 떡잎 걸'),
+('傑', ' 뛰어날 걸'),
+('傑', ' 준걸 걸'),
+('傑', 'Hanja form of 걸 (“hero”).'),
+('傑', 'Hanja form of 걸 (“remarkable, outstanding”).'),
+('傑', '걸'),
+('傑', '호걸'),
+('傑', '호걸 걸'),
+('傒', 'hye'),
+('傒', '묶을 혜'),
+('傒', '혜'),
+('傓', 'seon'),
+('傓', 'sŏn'),
+('傓', '매우 성할 선 '),
+('傓', '선'),
+('傔', 'gyeom'),
+('傔', 'kyŏm'),
+('傔', '겸'),
+('傔', '겸종 겸'),
+('傕', '각'),
+('傕', '성 각 '),
+('傖', 'ch''ang'),
+('傖', 'chang'),
+('傖', 'country man'),
+('傖', 'vulgar person'),
+('傖', '창'),
+('傖', '천할 창'),
+('傘', 'Hanja form of 산 (“umbrella”).'),
+('傘', '산'),
+('傘', '우산'),
+('傘', '우산 산'),
+('備', 'Hanja form of 비 (“equip, provision”).'),
+('備', '갖추다'),
+('備', '갖출'),
+('備', '깆출 비'),
+('備', '비'),
+('傚', 'hyo'),
+('傚', '본받을 효'),
+('傚', '효'),
+('傛', ' 몸 굽힐 용 '),
+('傛', 'yong'),
+('傛', '용'),
+('傛', '혁혁할 용'),
+('傜', ' 별이름 요'),
+('傜', '부릴 요'),
+('傜', '요'),
+('傝', ' 불안할 탑'),
+('傝', ' 어리석을 탑'),
+('傝', ' 용렬할 탑 '),
+('傝', 't''ap'),
+('傝', 'tap'),
+('傝', '답답할 탑'),
+('傝', '탑'),
+('傞', '사'),
+('傞', '취하여 춤추는 모양 사'),
+('傢', '가'),
+('傢', '세간 가'),
+('催', ' 일어날 최'),
+('催', ' 핍박할 최'),
+('催', '재촉할 최'),
+('催', '최'),
+('傭', ' 가지런할 충'),
+('傭', ' 삯 용'),
+('傭', ' 지을 용'),
+('傭', 'Hanja form of 용 (“employ; hire”).'),
+('傭', 'Hanja form of 총 (“even; fair”).'),
+('傭', '고르다'),
+('傭', '고를'),
+('傭', '고를 충'),
+('傭', '머슴 용'),
+('傭', '용'),
+('傭', '총'),
+('傭', '품팔이'),
+('傮', '마칠 조'),
+('傮', '조'),
+('傯', ' 곤궁할 총'),
+('傯', 'ch''ong'),
+('傯', 'chong'),
+('傯', '바쁠 총'),
+('傯', '총'),
+('傰', 'bung'),
+('傰', 'pung'),
+('傰', '붕'),
+('傰', '성 붕 '),
+('傱', '종'),
+('傱', '종종 걸음칠'),
+('傲', ' 즐길 오'),
+('傲', '업신여길 오'),
+('傲', '오'),
+('傳', ' 이을 전'),
+('傳', ' 주막 전'),
+('傳', ' 책 전'),
+('傳', ' 펼 전'),
+('傳', 'Hanja form of 전 (“transfer”).'),
+('傳', '전'),
+('傳', '전할'),
+('傳', '전할 전'),
+('傴', 'gu'),
+('傴', 'ku'),
+('傴', '구'),
+('傴', '구부릴 구'),
+('債', '빚 채'),
+('債', '채'),
+('傷', 'sang'),
+('傷', '상'),
+('傷', '상처 상'),
+('傺', 'che'),
+('傺', 'je'),
+('傺', '묵을 제'),
+('傺', '제'),
+('傻', '사'),
+('傻', '약을 사'),
+('傽', 'chang'),
+('傽', 'jang'),
+('傽', '놀랄 장'),
+('傽', '장'),
+('傾', 'Hanja form of 경 (“incline, tilt”).'),
+('傾', 'Hanja form of 경 (“upset, overflow”).'),
+('傾', '경'),
+('傾', '기울'),
+('傾', '기울 경'),
+('傾', '기울다'),
+('傿', 'eon'),
+('傿', 'ŏn'),
+('傿', '鄢과 同字 '),
+('傿', '언'),
+('僁', 'seol'),
+('僁', 'sŏl'),
+('僁', '설'),
+('僁', '소근거릴 설 '),
+('僂', '구부릴 루'),
+('僂', '루'),
+('僄', ' 진중치 못할 표'),
+('僄', 'airy'),
+('僄', 'light'),
+('僄', '몸이 가벼울 표'),
+('僄', '표'),
+('僅', 'Hanja form of 근 (“only, merely, solely, just”).'),
+('僅', '겨우'),
+('僅', '겨우 근'),
+('僅', '근'),
+('僆', 'ryeon'),
+('僆', 'ryŏn'),
+('僆', '련'),
+('僆', '쌍둥이 련 '),
+('僇', 'humiliate'),
+('僇', 'kill'),
+('僇', 'ryuk'),
+('僇', 'slow'),
+('僇', '륙'),
+('僇', '욕보일 륙'),
+('僈', 'man'),
+('僈', '만'),
+('僈', '얕볼 만'),
+('僉', 'ch''ŏm'),
+('僉', 'chem'),
+('僉', 'cheom'),
+('僉', '다 첨'),
+('僉', '첨'),
+('僊', 'seon'),
+('僊', 'sŏn'),
+('僊', '선'),
+('僊', '춤출 선'),
+('僋', ' 어리석을 탐 '),
+('僋', 't''am'),
+('僋', 'tam'),
+('僋', '늘어날 탐'),
+('僋', '탐'),
+('働', '궁닐 동'),
+('僎', '갖출 선'),
+('僎', '향음 주인 돕는 사람 준'),
+('像', '상'),
+('像', '형상'),
+('像', '형상 상'),
+('僑', 'gyo'),
+('僑', 'kyo'),
+('僑', '교'),
+('僑', '높을 교'),
+('僒', 'gun'),
+('僒', 'kun'),
+('僒', 'kwun'),
+('僒', '구부릴 군 '),
+('僒', '군'),
+('僔', 'chun'),
+('僔', 'jun'),
+('僔', '모을 준 '),
+('僔', '준'),
+('僕', '복'),
+('僕', '종 복'),
+('僖', '기쁠 희'),
+('僖', '희'),
+('僚', 'Hanja form of 료/요 (“colleague”).'),
+('僚', '동료'),
+('僚', '동료 료'),
+('僚', '료'),
+('僚', '요'),
+('僛', 'gi'),
+('僛', 'ki'),
+('僛', '기'),
+('僛', '취하여 춤추는 모양 기 '),
+('僝', 'chan'),
+('僝', 'jan'),
+('僝', '욕할 잔'),
+('僝', '잔'),
+('僞', ' 속일 위'),
+('僞', 'wi'),
+('僞', '거짓 위'),
+('僞', '위'),
+('僟', 'gi'),
+('僟', 'ki'),
+('僟', '기'),
+('僟', '삼갈 기 '),
+('僢', 'ch''ŏn'),
+('僢', 'cheon'),
+('僢', '어그러질 천 '),
+('僢', '천'),
+('僣', 'ch''am'),
+('僣', 'cham'),
+('僣', '교활할 참'),
+('僣', '참'),
+('僤', ' 빠를 탄'),
+('僤', '도타울 탄'),
+('僤', '탄'),
+('僥', ' 난장이 요'),
+('僥', '거짓 요'),
+('僥', '요'),
+('僦', ' 고용할 추'),
+('僦', 'ch''u'),
+('僦', 'chu'),
+('僦', '임금 추'),
+('僦', '추'),
+('僧', 'Hanja form of 승 (“a Buddhist monk”).'),
+('僧', '승'),
+('僧', '중'),
+('僧', '중 승'),
+('僨', 'bun'),
+('僨', 'pun'),
+('僨', '넘어질 분'),
+('僨', '분'),
+('僩', 'han'),
+('僩', '노할 한'),
+('僩', '한'),
+('僪', ' 미칠 결 '),
+('僪', '결'),
+('僪', '해무리 결'),
+('僬', '밝게 살필 초'),
+('僬', '초'),
+('僭', 'ch''am'),
+('僭', 'cham'),
+('僭', '참'),
+('僭', '참람할 참'),
+('僮', '동'),
+('僮', '아이 동'),
+('僰', '북'),
+('僰', '오랑캐 북'),
+('僵', ' 쓰러질 강'),
+('僵', '강'),
+('僵', '엎드러질 강'),
+('僶', '민'),
+('僶', '어거지로 할 민 '),
+('僷', ' 펴지 않을 엽 '),
+('僷', 'yeop'),
+('僷', 'yep'),
+('僷', 'yŏp'),
+('僷', '얼굴 예쁠 엽'),
+('僷', '엽'),
+('僸', 'geum'),
+('僸', 'kŭm'),
+('僸', '금'),
+('僸', '우러를 금 '),
+('價', 'Hanja form of 가 (“price; value”).'),
+('價', '가'),
+('價', '값'),
+('價', '값 가'),
+('僻', 'Hanja form of 벽 (“remote; out of the way”).'),
+('僻', 'Hanja form of 벽 (“uncommon; rare”).'),
+('僻', '벽'),
+('僻', '피할 피'),
+('僻', '후미지다'),
+('僻', '후미질'),
+('僻', '후미질 벽'),
+('僽', '몹시 욕할 추 '),
+('僽', '추'),
+('僾', 'ae'),
+('僾', '애'),
+('僾', '어렴풋할 애'),
+('僿', 'sa'),
+('僿', '사'),
+('僿', '잘게 부슬 사'),
+('儀', ' 모양 의'),
+('儀', ' 법도 의'),
+('儀', ' 좋을 의'),
+('儀', 'ceremony'),
+('儀', 'model'),
+('儀', '꼴 의'),
+('儀', '의'),
+('儁', '雋·俊과 同字'),
+('儁', '준'),
+('儁', '준걸'),
+('儂', '나 농'),
+('儂', '농'),
+('儃', 'ch''ŏn'),
+('儃', 'cheon'),
+('儃', '머뭇거릴 천 '),
+('儃', '천'),
+('億', ' 이바지할 억'),
+('億', ' 인민 억'),
+('億', ' 편안할 억'),
+('億', ' 헤아릴 억'),
+('億', 'Hanja form of 억 (“a hundred million, 10⁸”).'),
+('億', '억'),
+('億', '억 억'),
+('儆', 'outpost'),
+('儆', 'to guard'),
+('儆', 'to warn'),
+('儆', '경'),
+('儆', '경계할 경'),
+('儇', ' 빠를 현'),
+('儇', 'hyeon'),
+('儇', 'hyŏn'),
+('儇', '영리할 현'),
+('儇', '현'),
+('儈', '거간군 괴'),
+('儈', '괴'),
+('儉', ' 가난할 검'),
+('儉', ' 적을 검'),
+('儉', ' 흉년들 검'),
+('儉', 'Hanja form of 검 (“frugal, temperate”).'),
+('儉', '검'),
+('儉', '검소하'),
+('儉', '검소하다'),
+('儉', '검소할 검'),
+('儋', 'small jar'),
+('儋', '기운차고 날쌜해집 담'),
+('儋', '담'),
+('儌', 'gyo'),
+('儌', 'kyo'),
+('儌', '갈 교'),
+('儌', '교'),
+('儐', 'bin'),
+('儐', 'pin'),
+('儐', '빈'),
+('儐', '인도할 빈'),
+('儑', ' 용렬할 압 '),
+('儑', 'ap'),
+('儑', '압'),
+('儑', '잔피할 압'),
+('儒', ' 광대 유'),
+('儒', ' 나장이 유'),
+('儒', ' 유도 유'),
+('儒', 'Hanja form of 유 (“Confucianism”).'),
+('儒', 'Hanja form of 유 (“scholar”).'),
+('儒', '선비'),
+('儒', '선비 유'),
+('儒', '유'),
+('儓', '대'),
+('儓', '하인 대'),
+('儔', '무리 주'),
+('儔', '주'),
+('儕', '동배 제'),
+('儕', '제'),
+('儗', ' 참람할 의'),
+('儗', '서로 못믿을 의'),
+('儗', '의'),
+('儘', '盡과 同字'),
+('儘', '진'),
+('儚', 'meong'),
+('儚', 'mŏng'),
+('儚', '멍'),
+('儛', '舞와 同字'),
+('儛', '무'),
+('儜', 'nyeong'),
+('儜', 'nyŏng'),
+('儜', 'suffer'),
+('儜', 'weak'),
+('儜', '고달플 녕'),
+('儜', '녕'),
+('償', '갚을 상'),
+('償', '상'),
+('儠', 'ryeop'),
+('儠', 'ryŏp'),
+('儠', '렵'),
+('儠', '풍신 좃을 렵 '),
+('儡', 'Hanja form of 뢰/뇌 (“puppet”).'),
+('儡', '꼭두각시'),
+('儡', '뇌'),
+('儡', '뢰'),
+('儡', '영락할 뢰'),
+('儢', 'ryeo'),
+('儢', 'ryŏ'),
+('儢', '려'),
+('儢', '맘에 하기 싫을 려 '),
+('儤', 'p''o'),
+('儤', 'po'),
+('儤', '포'),
+('儥', ' 길 육 '),
+('儥', 'yuk'),
+('儥', '육'),
+('儥', '팔 육'),
+('儦', ' 많을 표'),
+('儦', 'p''yo'),
+('儦', 'pyo'),
+('儦', '떼지어 걷는 모양 표'),
+('儦', '표'),
+('儧', '모일 찬 '),
+('儧', '찬'),
+('儨', 'chil'),
+('儨', 'jil'),
+('儨', '바를 질 '),
+('儨', '질'),
+('儩', 'sa'),
+('儩', '다할 사'),
+('儩', '사'),
+('優', ' 결단성 없을 우'),
+('優', ' 나을 우'),
+('優', ' 부드러울 우'),
+('優', 'Hanja form of 우 (“actor”).'),
+('優', 'Hanja form of 우 (“excellent; superior”).'),
+('優', '넉넉하다'),
+('優', '넉넉할'),
+('優', '넉넉할 우'),
+('優', '우'),
+('儫', 'ho'),
+('儫', '영웅 호 '),
+('儫', '호'),
+('儭', 'ch''ŭn'),
+('儭', 'cheun'),
+('儭', '속옷 츤'),
+('儭', '츤'),
+('儱', 'rong'),
+('儱', '건목칠 롱'),
+('儱', '롱'),
+('儲', ' 버금 저'),
+('儲', ' 용납할 저'),
+('儲', '쌓을 저'),
+('儲', '저'),
+('儳', 'mix'),
+('儳', 'obstinate'),
+('儳', 'stupid'),
+('儳', 'uneven'),
+('儳', '어긋날 참'),
+('儳', '참'),
+('儴', ' 인연할 상 '),
+('儴', ' 훔칠 상'),
+('儴', 'sang'),
+('儴', '고생할 상'),
+('儴', '상'),
+('儵', ' 갑자기 숙 '),
+('儵', ' 남해 임금 숙'),
+('儵', ' 독화당할 숙'),
+('儵', '숙'),
+('儵', '잿빛 숙'),
+('儶', ' 잴 혜'),
+('儶', '끝 휴'),
+('儶', '빠를 혜'),
+('儷', '려'),
+('儷', '짝 려'),
+('儸', 'ra'),
+('儸', '간능할 라'),
+('儸', '라'),
+('儹', 'ch''an'),
+('儹', 'chan'),
+('儹', '모을 찬'),
+('儹', '찬'),
+('儺', '나'),
+('儺', '역귀 쫓을 나'),
+('儻', '당'),
+('儻', '빼어날 당'),
+('儼', '공경할 엄'),
+('儼', '엄'),
+('儽', 'rae'),
+('儽', '게으를 래'),
+('儽', '래'),
+('儿', 'person'),
+('儿', '사람'),
+('儿', '어진 사람 궤'),
+('儿', '어진사람 인'),
+('儿', '인'),
+('兀', ' 움직이지 않을 올'),
+('兀', '올'),
+('兀', '우뚝할 올'),
+('允', ' 마땅할 윤'),
+('允', ' 옳게 여길 윤'),
+('允', ' 좇을 윤'),
+('允', ' 허락할 윤'),
+('允', '미쁠 윤'),
+('允', '윤'),
+('兂', 'cham'),
+('兂', 'jam'),
+('兂', '잠'),
+('元', ' 백성 원'),
+('元', ' 일 년의 첫 날 원'),
+('元', ' 임금 원'),
+('元', ' 착하고 어질 원'),
+('元', ' 하늘 원'),
+('元', 'Hanja form of 원 (“chief”).'),
+('元', '원'),
+('元', '으뜸'),
+('元', '으뜸 원'),
+('兄', 'Hanja form of 형 (“older brother of a male”).'),
+('兄', 'Hanja form of 형 (“older brother of a male”). [noun]'),
+('兄', '맏이 형'),
+('兄', '형'),
+('充', ' 당할 충'),
+('充', ' 막을 충'),
+('充', 'Hanja form of 충 (“to fill”).'),
+('充', '가득찰 충'),
+('充', '채우다'),
+('充', '채울'),
+('充', '충'),
+('兆', 'Hanja form of 조 (“a trillion”).'),
+('兆', '조'),
+('兆', '조짐 조'),
+('兇', '흉'),
+('兇', '흉악하다'),
+('兇', '흉악할'),
+('兇', '흉악할 흉'),
+('先', 'Hanja form of 선 (“first; foremost”).'),
+('先', 'Hanja form of 선 (“former; previous”).'),
+('先', 'Hanja form of 세 (“to lead; to guide”).'),
+('先', '먼저'),
+('先', '먼저 선'),
+('先', '선'),
+('先', '세'),
+('先', '전구(前驅)'),
+('光', 'Hanja form of 광 (“light; shine, lustre”).'),
+('光', 'Hanja form of 광 (“light; shine, lustre”). [noun]'),
+('光', 'Hanja form of 광 (“light”).'),
+('光', 'Hanja form of 광 (“light”). [affix]'),
+('光', '광'),
+('光', '빛'),
+('光', '빛 광'),
+('兊', 't''ae'),
+('兊', 'tae'),
+('兊', '兌의 俗字 '),
+('兊', '태'),
+('克', 'Hanja form of 극 (“to win; to beat; able; competent”).'),
+('克', '극'),
+('克', '이기다'),
+('克', '이길'),
+('克', '이길 극'),
+('兌', ' 곧을 태'),
+('兌', ' 괘 이름 태'),
+('兌', ' 구멍 태'),
+('兌', ' 모일 태'),
+('兌', ' 바꿀 태'),
+('兌', ' 지름길 태'),
+('兌', ' 통할 태'),
+('兌', '기쁠 태'),
+('兌', '날카로울 예'),
+('免', ' 통건 쓸 문'),
+('免', 'Hanja form of 면 (“spare, excuse from, evade”).'),
+('免', 'Hanja form of 문 (“dismiss, discharge, disband”).'),
+('免', '면'),
+('免', '면하다'),
+('免', '면할'),
+('免', '면할 면'),
+('免', '문'),
+('免', '해산할'),
+('免', '해산할 문'),
+('兎', '兔의 俗字'),
+('兎', '달 (dar, dal) moon'),
+('兎', '토'),
+('兎', '토끼 (tokki) rabbit, hare'),
+('児', 'Alternative form of 兒 (“Hanja form of 아 (“child”).”)'),
+('児', '兒의 略字'),
+('児', '아'),
+('児', '아이'),
+('兑', '兌와 同字'),
+('兒', 'Hanja form of 아 (“child”).'),
+('兒', 'Hanja form of 예 (“used in personal names”).'),
+('兒', '다시 난 이'),
+('兒', '아'),
+('兒', '아이'),
+('兒', '아이 아'),
+('兒', '예'),
+('兓', ' 기릴 찬'),
+('兓', '날카로울 침 '),
+('兓', '도울 찬'),
+('兔', 'Hanja form of 토 (“rabbit, hare”).'),
+('兔', '토'),
+('兔', '토끼'),
+('兔', '토끼 토'),
+('兕', '시'),
+('兕', '외뿔난 소 시'),
+('兖', '兗의 俗字'),
+('兗', ' 단정할 연'),
+('兗', ' 믿을 연'),
+('兗', 'yeon'),
+('兗', 'yŏn'),
+('兗', '고을이름 연'),
+('兗', '연'),
+('兙', 'sip'),
+('兙', '십'),
+('党', '黨의 略字'),
+('兛', '천'),
+('兛', '킬로그램 천'),
+('兜', 'helmet (especially, made of iron)'),
+('兜', '두'),
+('兜', '투구 두'),
+('兟', ' 총총 들어설 신'),
+('兟', '나아갈 신'),
+('兟', '신'),
+('兡', 'baek'),
+('兡', 'paek'),
+('兡', 'payk'),
+('兡', '백'),
+('兡', '헥트르램 백'),
+('兢', '긍'),
+('兢', '삼갈 긍'),
+('入', 'Hanja form of 입 (“come in (to); join”).'),
+('入', 'Hanja form of 입 (“enter”).'),
+('入', '들'),
+('入', '들 입'),
+('入', '들다'),
+('入', '입'),
+('兦', '亡의 本字'),
+('兦', '없을 무'),
+('內', 'Hanja form of 내 (“inside; within”).'),
+('內', 'Hanja form of 내 (“inside; within”). [dependent noun; prefix]'),
+('內', '내'),
+('內', '들일 납'),
+('內', '안'),
+('內', '안 내'),
+('全', ' 갖출 전'),
+('全', 'Hanja form of 전 (“intact”).'),
+('全', '온전하다'),
+('全', '온전할'),
+('全', '온전할 전'),
+('全', '전'),
+('兩', 'Hanja form of 냥 (“(archaic) (units of coinage) a nyang”).'),
+('兩', 'Hanja form of 냥 (“(archaic) (units of measure) a liang or tael, a unit of weight equivalent to about 40g”).'),
+('兩', 'Hanja form of 량 (“both”).'),
+('兩', '냥'),
+('兩', '두'),
+('兩', '두 량'),
+('兩', '량'),
+('兩', '양'),
+('兪', ' 공손할 유'),
+('兪', ' 대답할 유'),
+('兪', 'yu'),
+('兪', '그럴 유'),
+('兪', '유'),
+('八', 'Hanja form of 팔 (“eight”).'),
+('八', '여덟'),
+('八', '여덟 팔'),
+('八', '팔'),
+('公', 'Hanja form of 공 (“fair; official”).'),
+('公', '공'),
+('公', '공변될 공'),
+('公', '공평하다'),
+('公', '공평할'),
+('六', 'Hanja form of 륙/육 (“six”).'),
+('六', '륙'),
+('六', '여섯'),
+('六', '여섯 륙'),
+('六', '육'),
+('兮', '어조사 혜'),
+('兮', '혜'),
+('兯', 'Kwukyel form of 한 (han)'),
+('兯', '한'),
+('共', 'Hanja form of 공 (“common; together”).'),
+('共', '공'),
+('共', '함께'),
+('共', '함께 공'),
+('兵', 'Hanja form of 병 (“soldier”).'),
+('兵', '군사'),
+('兵', '군사 병'),
+('兵', '병'),
+('其', 'Hanja form of 기 (“his; her; its; their”).'),
+('其', 'Hanja form of 기 (“that; those”).'),
+('其', 'Hanja form of 기 (“therein”).'),
+('其', '그'),
+('其', '그 기'),
+('其', '그#Determiner'),
+('其', '기'),
+('具', 'Hanja form of 구 (“tool”).'),
+('具', '갖추다'),
+('具', '갖출'),
+('具', '갖출 구'),
+('具', '구'),
+('典', ' 도덕 전'),
+('典', ' 맡을 전'),
+('典', ' 법 전'),
+('典', 'Hanja form of 전 (“rule; law”).'),
+('典', '법'),
+('典', '전'),
+('典', '책 전'),
+('兹', '무성할 자'),
+('兺', '그 뿐 '),
+('兺', '뿐'),
+('兼', ' 둘 얻을 겸'),
+('兼', ' 모을 겸'),
+('兼', ' 아우를 겸'),
+('兼', 'Hanja form of 겸 (“unite, connect, combine”).'),
+('兼', '겸'),
+('兼', '겸하다'),
+('兼', '겸할'),
+('兼', '겸할 겸'),
+('冀', 'Hanja form of 기 (“to hope; to wish”).'),
+('冀', '기'),
+('冀', '바라다'),
+('冀', '바랄'),
+('冀', '바랄 기'),
+('冂', 'remote'),
+('冂', '경'),
+('冂', '먼데 경'),
+('冂', '멀'),
+('冂', '멀다'),
+('冃', '모'),
+('冃', '어린이 머리 건 모 '),
+('冄', 'yeom'),
+('冄', 'yŏm'),
+('冄', '冉과 同字'),
+('冄', '염'),
+('内', '납'),
+('内', '내'),
+('内', '들이다'),
+('内', '들일'),
+('内', '받아들일 납'),
+('内', '안'),
+('円', 'hanja for names'),
+('円', '圓의 俗字'),
+('円', '엔'),
+('冉', ' 남생이 등 언저리 염'),
+('冉', ' 침노할 염'),
+('冉', '가는 털 늘어질 염'),
+('冉', '염'),
+('冊', 'Hanja form of 책 (“book”).'),
+('冊', '책'),
+('冊', '책 책'),
+('冋', '경'),
+('册', '책 책'),
+('再', ' 거듭 재'),
+('再', 'Hanja form of 재 (“again”).'),
+('再', 'Hanja form of 재 (“twice”).'),
+('再', '다시'),
+('再', '두'),
+('再', '두 번 재'),
+('再', '재'),
+('冎', 'tear [peel, strip, split, take] off: pare; rind; shuck; shell; hull; crack; remove; ex) ~ bone a chicken, ~clean[bone] a fish'),
+('冎', '과'),
+('冏', 'Hanja form of 경 (“Used in personal names”).'),
+('冏', 'Hanja form of 경 (“to shine; to be bright”).'),
+('冏', '경'),
+('冏', '빛나다'),
+('冏', '빛날'),
+('冏', '빛날 경 '),
+('冐', 'mo'),
+('冐', '冒의 俗字'),
+('冐', '모'),
+('冑', 'chu'),
+('冑', 'helmet (especially, made of iron)'),
+('冑', 'ju'),
+('冑', '주'),
+('冑', '투구 주'),
+('冒', 'Hanja form of 모 (“cover, hide, conceal, veil”).'),
+('冒', 'Hanja form of 목 (“risk, brave, dare”).'),
+('冒', '가리다'),
+('冒', '가릴'),
+('冒', '가릴 모'),
+('冒', '모'),
+('冒', '목'),
+('冒', '무릅쓰다'),
+('冒', '무릅쓸'),
+('冒', '무릅쓸 목'),
+('冓', '구'),
+('冓', '재목 어긋매겨 쌓을 구'),
+('冔', '관 후'),
+('冔', '후'),
+('冕', 'crown'),
+('冕', '면'),
+('冕', '면류관'),
+('冕', '면류관 면'),
+('冖', 'cover'),
+('冖', '덮다'),
+('冖', '덮을'),
+('冖', '덮을 멱'),
+('冖', '멱'),
+('冗', '宂과 同字'),
+('冗', '용'),
+('冘', ' 갈 유'),
+('冘', '머뭇거릴 유'),
+('冘', '유'),
+('写', '冩의 略字'),
+('冝', 'ui'),
+('冝', 'uy'),
+('冝', 'ŭi'),
+('冝', '宜의 俗字'),
+('冝', '의'),
+('冞', ' 두루 다닐 미'),
+('冞', 'mi'),
+('冞', '미'),
+('冞', '점점 미'),
+('冟', ' 고르지 않을 석'),
+('冟', ' 알맞게 된 밥 석 '),
+('冟', 'seok'),
+('冟', 'sŏk'),
+('冟', '고룰 석'),
+('冟', '석'),
+('冠', 'Hanja form of 관 (“crown; hat”).'),
+('冠', '갓'),
+('冠', '갓 관'),
+('冠', '관'),
+('冡', '덮어쓸 몽 '),
+('冡', '몽'),
+('冢', 'ch''ong'),
+('冢', 'chong'),
+('冢', '무덤 총'),
+('冢', '총'),
+('冣', ' 모을 취 '),
+('冣', 'ch''wi'),
+('冣', 'chwi'),
+('冣', '쌓을 취'),
+('冣', '취'),
+('冤', ' 원한 원'),
+('冤', 'Hanja form of 원 (“grievance; injustice; wrong”).'),
+('冤', '원'),
+('冤', '원통하다'),
+('冤', '원통할'),
+('冤', '원통할 원'),
+('冥', 'Hanja form of 명 (“dark, gloomy, night”).'),
+('冥', 'Hanja form of 명 (“deep”).'),
+('冥', '명'),
+('冥', '어두울'),
+('冥', '어두울 명'),
+('冥', '어둡다'),
+('冦', '구'),
+('冦', '도둑'),
+('冧', 'flower bud'),
+('冧', '림'),
+('冨', 'bu'),
+('冨', 'pu'),
+('冨', 'pwu'),
+('冨', '富의 俗字'),
+('冨', '부'),
+('冩', '베낄 사'),
+('冩', '사'),
+('冪', 'myeok'),
+('冪', 'myŏk'),
+('冪', '덮을 멱'),
+('冪', '멱'),
+('冫', 'Definition: pure ice/water of which 빙 derives from the modern Beijing pronunciation of 水'),
+('冫', '빙'),
+('冫', '얼음'),
+('冫', '얼음 빙'),
+('冬', 'Hanja form of 동 (“winter”).'),
+('冬', '겨울'),
+('冬', '겨울 동'),
+('冬', '동'),
+('冰', 'Alternative form of 氷 (“Hanja form of 빙 (“ice”).”)'),
+('冰', '氷의 本字'),
+('冰', '빙'),
+('冰', '얼음'),
+('冱', ' 막을 호'),
+('冱', ' 얼 호'),
+('冱', 'ho'),
+('冱', '찰 호'),
+('冱', '호'),
+('冲', ' 어릴 충'),
+('冲', ' 온화할 충'),
+('冲', '깊을 충'),
+('冲', '충'),
+('决', 'gyeol'),
+('决', 'kyŏl'),
+('决', '決의 俗字'),
+('决', '결'),
+('冴', 'ho'),
+('冴', '冱의 俗字'),
+('冴', '호'),
+('况', '況의 俗字'),
+('况', '황'),
+('冶', ' 대장장이 야'),
+('冶', 'Hanja form of 야 (“lewd, NSFW, erotic, sexy”).'),
+('冶', 'Hanja form of 야 (“lewd, NSFW, erotic, sexy”). [prefix; adjectival root]'),
+('冶', 'Hanja form of 야 (“smelting; smelter”).'),
+('冶', 'Hanja form of 야 (“smelting; smelter”). [affix]'),
+('冶', '단련할 야'),
+('冶', '야'),
+('冶', '풀무'),
+('冷', 'Hanja form of 랭/냉 (“cold”).'),
+('冷', '냉'),
+('冷', '랭'),
+('冷', '차다'),
+('冷', '찰'),
+('冷', '찰 랭'),
+('冸', 'ban'),
+('冸', 'melt (ice)'),
+('冸', 'pan'),
+('冸', '녹을 반 '),
+('冸', '반'),
+('冹', 'bul'),
+('冹', 'pul'),
+('冹', '불'),
+('冹', '찰 불 '),
+('冽', '렬'),
+('冽', '찰 렬'),
+('凁', ' 얻을 수 '),
+('凁', 'su'),
+('凁', '수'),
+('凁', '싸늘할 수'),
+('凄', '쓸쓸할 처'),
+('凄', '처'),
+('凅', 'go'),
+('凅', 'ko'),
+('凅', '고'),
+('凅', '얼어붙을 고'),
+('准', '승인할 준'),
+('准', '준'),
+('凇', '산유화 송'),
+('凇', '송'),
+('凈', '정'),
+('凈', '찰 정'),
+('凉', 'lyang'),
+('凉', 'ryang'),
+('凉', '涼의 俗字'),
+('凉', '량'),
+('凊', '서늘하다'),
+('凊', '서늘할'),
+('凊', '서늘할 청'),
+('凊', '청'),
+('凋', '시들 조'),
+('凋', '조'),
+('凌', 'Hanja form of 릉 (“to place oneself above; to override”).'),
+('凌', '능'),
+('凌', '능가하다'),
+('凌', '능가할'),
+('凌', '능가할 릉'),
+('凌', '릉'),
+('凌', '업신여기다'),
+('凌', '업신여길'),
+('凍', 'Hanja form of 동 (“cold, congeal”).'),
+('凍', 'Hanja form of 동 (“freeze”).'),
+('凍', 'Hanja form of 동 (“jelly”).'),
+('凍', '동'),
+('凍', '얼'),
+('凍', '얼 동'),
+('凍', '얼다'),
+('减', '減의 俗字'),
+('凑', '모일 주'),
+('凒', 'ui'),
+('凒', 'ŭi'),
+('凒', '눈서리 쌓일 의 '),
+('凒', '의'),
+('凓', 'yul'),
+('凓', '율'),
+('凓', '찬 기운 률'),
+('凔', 'ch''ang'),
+('凔', 'chang'),
+('凔', '찰 창'),
+('凔', '창'),
+('凖', '準의 俗字'),
+('凖', '준'),
+('凗', '눈서리 쌓일 최 '),
+('凗', '최'),
+('凘', '성에 시 '),
+('凘', '시'),
+('凚', 'geum'),
+('凚', 'kum'),
+('凚', 'kŭm'),
+('凚', '금'),
+('凚', '쌀쌀하게 추울 금'),
+('凛', '름'),
+('凛', '찰 름'),
+('凜', '름'),
+('凜', '찰 름'),
+('凝', ' 열중할 응'),
+('凝', ' 이룰 응'),
+('凝', '엉길 응'),
+('凝', '응'),
+('凞', 'hui'),
+('凞', 'hŭi'),
+('凞', '빛날 희'),
+('凞', '희'),
+('几', 'back rest'),
+('几', 'desk'),
+('几', '궤'),
+('几', '안석'),
+('几', '안석 궤'),
+('凡', 'Hanja form of 범 (“all, any, every”).'),
+('凡', 'Hanja form of 범 (“ordinary, common”).'),
+('凡', '무릇'),
+('凡', '무릇 범'),
+('凡', '범'),
+('凢', 'beom'),
+('凢', 'pem'),
+('凢', 'pŏm'),
+('凢', '凡의 俗字'),
+('凢', '범'),
+('凣', 'beom'),
+('凣', 'pŏm'),
+('凣', '凡의 俗字'),
+('凣', '범'),
+('凥', 'geo'),
+('凥', 'kŏ'),
+('凥', '居와 同字'),
+('凥', '거'),
+('処', '위치할 처'),
+('処', '처'),
+('凨', 'p''ung'),
+('凨', 'pung'),
+('凨', '風과 同字'),
+('凨', '풍'),
+('凩', 'mok'),
+('凩', '목'),
+('凩', '찬바람 목'),
+('凪', 'chi'),
+('凪', 'ji'),
+('凪', '바람이 자고 파도 그칠 지'),
+('凪', '지'),
+('凭', '기대다 빙'),
+('凮', '風의 譌字'),
+('凮', '풍'),
+('凰', '봉황새 황'),
+('凰', '황'),
+('凱', ' 마파람 개'),
+('凱', ' 좋은 사람 개'),
+('凱', ' 착할 개'),
+('凱', '개'),
+('凱', '싸움 이긴 풍류 개'),
+('凳', '걸상 등'),
+('凳', '등'),
+('凴', 'bing'),
+('凴', 'ping'),
+('凴', '凭과 同字'),
+('凴', '빙'),
+('凵', ' 위가 벌어진 그릇 감'),
+('凵', 'open one''s mouth'),
+('凵', '경'),
+('凵', '벌리다'),
+('凵', '입 벌릴'),
+('凵', '입 벌릴 감'),
+('凶', 'Hanja form of 흉 (“ominous; terrible”).'),
+('凶', '흉'),
+('凶', '흉하다'),
+('凶', '흉할'),
+('凶', '흉할 흉'),
+('凷', 'goe'),
+('凷', 'koe'),
+('凷', 'koy'),
+('凷', '괴'),
+('凷', '흙덩이 괴'),
+('凸', ' 내밀 돌'),
+('凸', ' 도도록할 돌'),
+('凸', '볼록하다'),
+('凸', '볼록할 철'),
+('凸', '뾰족할 돌'),
+('凸', '철'),
+('凹', '오목하다'),
+('凹', '오목할'),
+('凹', '오목할 요'),
+('凹', '요'),
+('出', ' 게울 출'),
+('出', ' 낳을 출'),
+('出', ' 도망할 출'),
+('出', ' 물러갈 출'),
+('出', ' 보일 출'),
+('出', ' 생질 출'),
+('出', 'Alternative form of 齣 (“Hanja form of 척 (“act, scene, as of a play or movie”).”)'),
+('出', 'Hanja form of 출 (“to come out; to go out”).'),
+('出', '나다'),
+('出', '날'),
+('出', '날 출'),
+('出', '내보낼 추'),
+('出', '단락'),
+('出', '척'),
+('出', '출'),
+('函', 'Hanja form of 함 (“box”).'),
+('函', 'Hanja form of 함 (“box”). [noun]'),
+('函', '상자 함'),
+('函', '함'),
+('凾', '상자 함'),
+('凾', '함'),
+('刀', 'Hanja form of 도 (“sword; knife”).'),
+('刀', 'Hanja form of 도 (“sword; knife”). [affix]'),
+('刀', '도'),
+('刀', '칼'),
+('刀', '칼 도'),
+('刁', '바라 조'),
+('刁', '조'),
+('刂', '刀와 同字'),
+('刂', '도'),
+('刃', '인'),
+('刃', '칼날 인'),
+('刄', 'in'),
+('刄', '刃의 俗字'),
+('刄', '인'),
+('刅', 'ch''ang'),
+('刅', 'chang'),
+('刅', '창'),
+('刅', '해칠 창'),
+('分', 'Hanja form of 분 (“component”).'),
+('分', 'Hanja form of 분 (“duty; responsibility”).'),
+('分', 'Hanja form of 분 (“fraction”).'),
+('分', 'Hanja form of 분 (“minute (unit of time)”).'),
+('分', 'Hanja form of 분 (“mutual affection”).'),
+('分', 'Hanja form of 분 (“part; portion”).'),
+('分', 'Hanja form of 분 (“status; standing”).'),
+('分', 'Hanja form of 분 (“to distinguish”).'),
+('分', 'Hanja form of 분 (“to distribute”).'),
+('分', 'Hanja form of 분 (“to divide”).'),
+('分', '나누다'),
+('分', '나눌'),
+('分', '나눌 분'),
+('分', '분'),
+('分', '분수(分數)'),
+('分', '세는 단위 푼'),
+('切', ' 급할 절'),
+('切', ' 저밀 절'),
+('切', ' 정성스럴 절'),
+('切', ' 진맥할 절'),
+('切', 'Hanja form of 절 (“to cut”).'),
+('切', 'Hanja form of 절 (“to cut”). [affix]'),
+('切', 'Hanja form of 체 (“Only used in 일체(一切) (ilche, “all, everything”): whole”).'),
+('切', '끊다'),
+('切', '끊을'),
+('切', '끊을 절'),
+('切', '온통'),
+('切', '온통 체'),
+('切', '절'),
+('切', '체'),
+('刈', ' 죽일 예'),
+('刈', 'Hanja form of 예 (“to mow”).'),
+('刈', '깍다'),
+('刈', '깍을'),
+('刈', '예'),
+('刈', '풀 벨 예'),
+('刊', 'publication, periodical'),
+('刊', 'publish'),
+('刊', '간'),
+('刊', '책 펴낼 간'),
+('刋', 'ch''ŏn'),
+('刋', 'cheon'),
+('刋', '끊을 천'),
+('刋', '천'),
+('刌', '끊을 촌 '),
+('刌', '촌'),
+('刎', ' 끊을 문'),
+('刎', ' 자를 문'),
+('刎', '목 벨 문'),
+('刎', '문'),
+('刏', '기'),
+('刏', '찌를 기 '),
+('刑', ' 죽일 형'),
+('刑', 'law'),
+('刑', 'punishment, penalty'),
+('刑', '형'),
+('刑', '형벌 형'),
+('划', '삿대 화'),
+('划', '화'),
+('刓', 'to trim'),
+('刓', '깎을 완'),
+('刓', '완'),
+('刔', 'gyeol'),
+('刔', 'kyŏl'),
+('刔', '抉과 同字'),
+('刔', '결'),
+('刕', '벨 리 '),
+('刖', '발꿈치 자를 월'),
+('刖', '월'),
+('列', 'Hanja form of 렬/열 (“line, row”).'),
+('列', '렬'),
+('列', '열'),
+('列', '줄'),
+('列', '줄 렬'),
+('刘', '劉의 略字'),
+('刜', 'bul'),
+('刜', 'pul'),
+('刜', '불'),
+('刜', '칠 불'),
+('初', 'Hanja form of 초 (“beginning; start”).'),
+('初', '처음'),
+('初', '처음 초'),
+('初', '초'),
+('删', '刪의 略字'),
+('删', '산'),
+('判', ' 맡을 판'),
+('判', ' 쪼갤 판'),
+('判', '판'),
+('判', '판단할 판'),
+('別', 'Hanja form of 별 (“difference”).'),
+('別', '나눌 별'),
+('別', '다를'),
+('別', '별'),
+('刦', ' 구속할 겁'),
+('刦', '겁'),
+('刦', '겁탈할 겁'),
+('刧', '刦의 俗字'),
+('刧', '겁'),
+('刨', 'carpenter''s plane'),
+('刨', 'level'),
+('刨', 'plane'),
+('刨', '깎을 포'),
+('刨', '포'),
+('利', 'Hanja form of 리 (“benefit”).'),
+('利', '날카로울 리'),
+('利', '리'),
+('利', '이'),
+('利', '이로울'),
+('刪', '깎을 산'),
+('刪', '산'),
+('别', '別의 俗字'),
+('别', '별'),
+('刮', 'Hanja form of 괄 (“to cut; to shave; to peel”).'),
+('刮', '괄'),
+('刮', '깍을 괄'),
+('刮', '깎다'),
+('刮', '깎을'),
+('到', 'Hanja form of 도 (“arrival”).'),
+('到', '도'),
+('到', '이르다'),
+('到', '이를'),
+('到', '이를 도'),
+('刱', 'ch''ang'),
+('刱', 'chang'),
+('刱', '비롯할 창'),
+('刱', '창'),
+('刲', 'gyu'),
+('刲', 'kyu'),
+('刲', '규'),
+('刲', '찌를 규'),
+('刳', '가를 고'),
+('刳', '고'),
+('刴', ' 꺾을 타'),
+('刴', 't''a'),
+('刴', 'ta'),
+('刴', '찍을 타'),
+('刴', '타'),
+('刵', '귀 베일 이'),
+('刵', '이'),
+('制', 'Hanja form of 제 (“plan; regulate”).'),
+('制', '억제할 제'),
+('制', '절제하다'),
+('制', '절제할'),
+('制', '제'),
+('刷', ' 고칠 쇄'),
+('刷', ' 문지를 쇄'),
+('刷', ' 빗을 쇄'),
+('刷', '긁을 쇄'),
+('刷', '쇄'),
+('券', 'Hanja form of 권 (“certificate, ticket”).'),
+('券', 'Hanja form of 권 (“title deeds”).'),
+('券', '권'),
+('券', '엄쪽'),
+('券', '엄쪽(어음을 쪼갠 한 쪽) 권'),
+('刹', 'Hanja form of 찰 (“Buddhist temple; pagoda”).'),
+('刹', '절'),
+('刹', '절 찰'),
+('刹', '찰'),
+('刺', 'Hanja form of 자 (“spike; thorn”).'),
+('刺', 'Hanja form of 자 (“to stab; to prick”).'),
+('刺', 'Hanja form of 척 (“to stab; to prick”).'),
+('刺', 'Hanja form of 체 (“scold”).'),
+('刺', '나무라다'),
+('刺', '나무랄'),
+('刺', '자'),
+('刺', '찌르다'),
+('刺', '찌를'),
+('刺', '찌를 자'),
+('刺', '찌를 척'),
+('刺', '척'),
+('刺', '체'),
+('刻', 'Hanja form of 각 (“engrave, carve”).'),
+('刻', '각'),
+('刻', '새기다'),
+('刻', '새길'),
+('刻', '새길 각'),
+('剃', '머리 깎을 체'),
+('剃', '체'),
+('剄', 'gyeong'),
+('剄', 'kyŏng'),
+('剄', '경'),
+('剄', '목 벨 경'),
+('則', ' 때 측'),
+('則', ' 모범 측'),
+('則', ' 모범 칙'),
+('則', ' 본받을 측'),
+('則', ' 본받을 칙'),
+('則', ' 조목 칙'),
+('則', 'Hanja form of 즉 (“particle in literary Chinese texts”).'),
+('則', 'Hanja form of 칙 (“rule; law; regulation”).'),
+('則', 'Hanja form of 칙 (“rule; law; regulation”). [affix]'),
+('則', '곧'),
+('則', '법칙 측'),
+('則', '법칙 칙'),
+('則', '법칙(法則)'),
+('則', '즉'),
+('則', '칙'),
+('剉', 'chwa'),
+('剉', 'cut'),
+('剉', 'file'),
+('剉', 'jwa'),
+('剉', 'trim'),
+('剉', '꺽을 좌'),
+('剉', '좌'),
+('削', 'Hanja form of 삭 (“cut”).'),
+('削', '깎다'),
+('削', '깎을'),
+('削', '깎을 삭'),
+('削', '삭'),
+('剋', 'geuk'),
+('剋', 'kŭk'),
+('剋', '극'),
+('剋', '깍일 극'),
+('剌', 'ral'),
+('剌', '랄'),
+('剌', '어그러질 랄'),
+('前', ' 옛 전'),
+('前', ' 인도할 전'),
+('前', 'Hanja form of 전 (“ex-; previous”).'),
+('前', 'Hanja form of 전 (“ex-; previous”). [prefix]'),
+('前', 'Hanja form of 전 (“front; before”).'),
+('前', 'Hanja form of 전 (“front; before”). [noun]'),
+('前', '앞'),
+('前', '앞 전'),
+('前', '전'),
+('剎', 'ch''al'),
+('剎', 'chal'),
+('剎', '절 찰'),
+('剎', '찰'),
+('剏', 'ch''ang'),
+('剏', 'chang'),
+('剏', '비롯할 창'),
+('剏', '창'),
+('剒', '건목칠 작'),
+('剒', '벨 착 '),
+('剓', 'li'),
+('剓', 'ri'),
+('剓', '리'),
+('剓', '뱃길 리 '),
+('剔', '바를 척'),
+('剔', '척'),
+('剕', '발 벨 비 '),
+('剕', '비'),
+('剖', '부'),
+('剖', '쪼갤 부'),
+('剗', 'chan'),
+('剗', 'jan'),
+('剗', 'to level off'),
+('剗', 'to pare down'),
+('剗', 'to trim'),
+('剗', '깍을 잔'),
+('剗', '잔'),
+('剙', 'ch''ang'),
+('剙', 'chang'),
+('剙', '비롯할 창'),
+('剙', '창'),
+('剚', 'sa'),
+('剚', '사'),
+('剚', '찌를 사'),
+('剛', ' 굳셀 강'),
+('剛', ' 꼬장할 강'),
+('剛', ' 바야흐로 강'),
+('剛', '강'),
+('剛', '굳을 강'),
+('剜', '깎을 완'),
+('剜', '완'),
+('剝', 'injure'),
+('剝', 'to cut, trim'),
+('剝', 'to strip'),
+('剝', 'undress'),
+('剝', '박'),
+('剝', '벗길 박'),
+('剞', 'gi'),
+('剞', 'ki'),
+('剞', '기'),
+('剞', '새김칼 기'),
+('剟', 'ch''ŏl'),
+('剟', 'cheol'),
+('剟', '깎을 철'),
+('剟', '철'),
+('剠', '鯨과 同字'),
+('剡', 'sharp'),
+('剡', '땅이름 섬'),
+('剡', '섬'),
+('剡', '염'),
+('剣', '劍과 同字'),
+('剦', 'em'),
+('剦', 'eom'),
+('剦', 'ŏm'),
+('剦', '엄'),
+('剨', 'goek'),
+('剨', 'koek'),
+('剨', '괵'),
+('剨', '자끈할 괵'),
+('剩', 'ing'),
+('剩', 'leftover'),
+('剩', 'remainder'),
+('剩', 'residue'),
+('剩', '남을 잉'),
+('剩', '잉'),
+('剪', '가위 전'),
+('剪', '전'),
+('剫', ' 건목칠 탁 '),
+('剫', 't''ak'),
+('剫', 'tak'),
+('剫', '쪼갤 탁'),
+('剫', '탁'),
+('剬', 'dan'),
+('剬', 'tan'),
+('剬', '단'),
+('剬', '단정할 단 '),
+('剭', '목 벨 옥 '),
+('剭', '형벌할 악'),
+('剮', '과'),
+('剮', '바를 과'),
+('副', 'Hanja form of 부 (“secondary; auxiliary”).'),
+('副', '버금'),
+('副', '버금 복'),
+('副', '버금 부'),
+('副', '부'),
+('割', '베다'),
+('割', '벨'),
+('割', '벨 할'),
+('割', '할'),
+('剳', 'ch''a'),
+('剳', 'cha'),
+('剳', '낫 차'),
+('剳', '차'),
+('剴', ' 가까울 개'),
+('剴', ' 간절할 개'),
+('剴', 'gae'),
+('剴', 'kae'),
+('剴', '개'),
+('剴', '낫 개'),
+('創', 'Hanja form of 창 (“damage; wound”).'),
+('創', 'Hanja form of 창 (“to start; to originate”).'),
+('創', 'Hanja form of 창 (“unique; special; creative”).'),
+('創', '다치다'),
+('創', '다칠'),
+('創', '비롯하다'),
+('創', '비롯할'),
+('創', '비롯할 창'),
+('創', '창'),
+('剷', 'san'),
+('剷', '깎을 산'),
+('剷', '산'),
+('剸', ' 저밀 전'),
+('剸', '끊을 단'),
+('剸', '오로지 전'),
+('剹', 'lyuk'),
+('剹', 'ryuk'),
+('剹', '깎을 륙 '),
+('剹', '륙'),
+('剺', 'ri'),
+('剺', '리'),
+('剺', '벗길 리'),
+('剽', ' 겁박할 표'),
+('剽', ' 긁을 표'),
+('剽', ' 끝 표'),
+('剽', ' 빠를 표'),
+('剽', ' 찌를 표'),
+('剽', 'p''yo'),
+('剽', 'pyo'),
+('剽', '표'),
+('剽', '표독할 표'),
+('剿', '죽일 초'),
+('剿', '초'),
+('劀', 'gwal'),
+('劀', 'kwal'),
+('劀', '괄'),
+('劀', '궂은 살을 잘라낼 괄 '),
+('劂', 'gwe'),
+('劂', 'kwe'),
+('劂', '궤'),
+('劃', 'Hanja form of 획 (“to carve; to set in stone”).'),
+('劃', 'Hanja form of 획 (“to draw a line; to mark”).'),
+('劃', 'Hanja form of 획 (“to plan”).'),
+('劃', '그을'),
+('劃', '긋다'),
+('劃', '쪼갤 획'),
+('劃', '획'),
+('劄', '차'),
+('劄', '차자 차'),
+('劇', 'Hanja form of 극 (“excessive, extreme”).'),
+('劇', 'Hanja form of 극 (“theatrical plays, opera, drama”).'),
+('劇', '극'),
+('劇', '심하다'),
+('劇', '심할'),
+('劇', '심할 극'),
+('劈', 'byeok'),
+('劈', 'pyŏk'),
+('劈', '벽'),
+('劈', '쪼갤 벽'),
+('劉', 'Hanja form of 류/유 (“to kill”).'),
+('劉', '류'),
+('劉', '유'),
+('劉', '죽이다'),
+('劉', '죽일'),
+('劉', '죽일 류'),
+('劊', '끊을 괴'),
+('劊', '끊을 회'),
+('劋', 'cho'),
+('劋', 'jo'),
+('劋', '끊을 조 '),
+('劋', '조'),
+('劌', '귀'),
+('劌', '상할 귀'),
+('劍', ' 칼 쓰는법 검'),
+('劍', ' 칼로 찔러 죽일 검'),
+('劍', 'Hanja form of 검 (“sword; knife”).'),
+('劍', '검'),
+('劍', '칼'),
+('劍', '칼 검'),
+('劎', 'geom'),
+('劎', 'kŏm'),
+('劎', '劍과 同字'),
+('劎', '검'),
+('劐', '끊을 확'),
+('劐', '확'),
+('劑', '약 지을 제'),
+('劑', '제'),
+('劒', 'Alternative form of 劍 (“Hanja form of 검 (“sword, knife”).”)'),
+('劒', '劎의 譌字'),
+('劒', '검'),
+('劒', '칼'),
+('劓', ' 베일 의'),
+('劓', '의'),
+('劓', '코 베일 의'),
+('劔', 'geom'),
+('劔', 'kŏm'),
+('劔', '劎의 俗字'),
+('劔', '검'),
+('劖', 'ch''am'),
+('劖', 'cham'),
+('劖', '새길 참'),
+('劖', '참'),
+('劗', 'ch''an'),
+('劗', 'chan'),
+('劗', '끊을 찬 '),
+('劗', '찬'),
+('劘', '깍을 마'),
+('劘', '마'),
+('劙', '가를 례'),
+('劙', '가를 리'),
+('劚', 'ch''ok'),
+('劚', 'chok'),
+('劚', '깎을 촉'),
+('劚', '촉'),
+('力', 'Hanja form of 력/역 (“power; force”).'),
+('力', 'Hanja form of 력/역 (“power; force”). [affix]'),
+('力', '력'),
+('力', '역'),
+('力', '힘'),
+('力', '힘 력'),
+('功', 'Hanja form of 공 (“effort; labor; elaboration”).'),
+('功', 'Hanja form of 공 (“service; credit; meritorious deed”).'),
+('功', '공'),
+('功', '공 공'),
+('加', 'Hanja form of 가 (“to add”).'),
+('加', '가'),
+('加', '더하다'),
+('加', '더할'),
+('加', '더할 가'),
+('劣', 'Hanja form of 렬/열 (“bad; poor”).'),
+('劣', 'Hanja form of 렬/열 (“inferior”).'),
+('劣', '렬'),
+('劣', '못하다'),
+('劣', '못할'),
+('劣', '못할 렬'),
+('劣', '열'),
+('劤', 'geun'),
+('劤', 'kŭn'),
+('劤', '근'),
+('劤', '힘많을 근'),
+('劦', 'hyeop'),
+('劦', 'hyep'),
+('劦', 'hyŏp'),
+('劦', '협'),
+('劦', '힘을 합할 협 '),
+('助', 'Hanja form of 조 (“help”).'),
+('助', '도울'),
+('助', '도울 조'),
+('助', '돕다'),
+('助', '조'),
+('努', 'Hanja form of 노 (“exertion; striving; making an effort”).'),
+('努', '노'),
+('努', '힘쓰다'),
+('努', '힘쓸'),
+('努', '힘쓸 노'),
+('劫', ' 겁 겁'),
+('劫', ' 겁탈할 겁'),
+('劫', ' 대궐 층계 겁'),
+('劫', ' 부지런할 겁'),
+('劫', ' 화재 겁'),
+('劫', 'Hanja form of 겁 (“coerce; threaten”).'),
+('劫', 'Hanja form of 겁 (“coerce; threaten”). [affix]'),
+('劫', 'Hanja form of 겁 (“kalpa”).'),
+('劫', 'Hanja form of 겁 (“kalpa”). [noun]'),
+('劫', '겁'),
+('劫', '위협하다'),
+('劫', '위협할'),
+('劫', '위협할 겁'),
+('劬', 'gu'),
+('劬', 'ku'),
+('劬', '구'),
+('劬', '수고로울 구'),
+('劭', '초'),
+('劭', '힘쓸 초'),
+('劮', 'il'),
+('劮', '기쁠 일 '),
+('劮', '일'),
+('励', 'ryeo'),
+('励', 'ryŏ'),
+('励', '勵의 略字'),
+('励', '려'),
+('労', 'ro'),
+('労', '勞의 略字'),
+('労', '로'),
+('劵', ' 고달플 권'),
+('劵', ' 수고로울 권'),
+('劵', 'gwon'),
+('劵', 'kwŏn'),
+('劵', '게으를 권'),
+('劵', '권'),
+('劶', 'gu'),
+('劶', 'ku'),
+('劶', '구'),
+('劶', '부지런할 구 '),
+('効', 'hyo'),
+('効', '效의 俗字'),
+('効', '효'),
+('劻', 'gwang'),
+('劻', 'kwang'),
+('劻', '광'),
+('劻', '급할 광'),
+('劼', 'hal'),
+('劼', '삼갈 할'),
+('劼', '할'),
+('劾', ' 핵실할 핵'),
+('劾', ' 힘쓸 해'),
+('劾', 'Hanja form of 핵 (“scold; inquire”).'),
+('劾', '꾸짖다'),
+('劾', '꾸짖을'),
+('劾', '안찰할 해'),
+('劾', '캐물을 핵'),
+('劾', '핵'),
+('勀', 'geuk'),
+('勀', 'kŭk'),
+('勀', '극'),
+('勀', '이길 극 '),
+('勁', '경'),
+('勁', '굳셀 경'),
+('勃', 'Hanja form of 발 (“rise”).'),
+('勃', '갑작스러울 발'),
+('勃', '노하다'),
+('勃', '노할'),
+('勃', '발'),
+('勅', ' 칙령 칙'),
+('勅', 'Hanja form of 칙 (“imperial edict”).'),
+('勅', '신칙할 칙'),
+('勅', '조서(詔書)'),
+('勅', '칙'),
+('勇', ' 용맹할 용'),
+('勇', 'Hanja form of 용 (“bravery; courage”).'),
+('勇', '날랠 용'),
+('勇', '날쌜'),
+('勇', '용'),
+('勉', 'Hanja form of 면 (“strive; make an effort”).'),
+('勉', '면'),
+('勉', '힘쓰다'),
+('勉', '힘쓸'),
+('勉', '힘쓸 면'),
+('勌', 'gwon'),
+('勌', 'kwŏn'),
+('勌', '倦과 同字'),
+('勌', '권'),
+('勍', 'gyeong'),
+('勍', 'kyŏng'),
+('勍', '경'),
+('勍', '셀 경'),
+('勑', ' 다스릴 칙'),
+('勑', '바를 칙'),
+('勑', '위로할 래'),
+('勒', '굴레 륵'),
+('勒', '륵'),
+('勔', ' 힘쓸 민'),
+('勔', 'min'),
+('勔', '권면할 민'),
+('勔', '민'),
+('動', 'Hanja form of 동 (“move”).'),
+('動', '동'),
+('動', '움직일'),
+('動', '움직일 동'),
+('勖', 'to exert oneself'),
+('勖', '욱'),
+('勖', '힘쓸 욱'),
+('勗', 'uk'),
+('勗', '勖의 譌字'),
+('勗', '욱'),
+('勘', ' 정할 감'),
+('勘', 'Hanja form of 감 (“consideration”).'),
+('勘', '감'),
+('勘', '마감할 감'),
+('勘', '헤아리다'),
+('勘', '헤아릴'),
+('務', ' 권장할 무'),
+('務', ' 힘쓸 무'),
+('務', 'Hanja form of 무 (“to be engaged in; to be devoted to”).'),
+('務', '무'),
+('務', '일 무'),
+('務', '힘쓰다'),
+('務', '힘쓸'),
+('勛', '勳의 古字'),
+('勛', '훈'),
+('勝', ' 가질 승'),
+('勝', ' 경치가 좋을 승'),
+('勝', 'Hanja form of 승 (“to win, to beat”).'),
+('勝', '승'),
+('勝', '이기다'),
+('勝', '이길'),
+('勝', '이길 승'),
+('勞', 'Hanja form of 로/노 (“work”).'),
+('勞', '노'),
+('勞', '로'),
+('勞', '일할'),
+('勞', '일할 로'),
+('募', 'Hanja form of 모 (“levy, raise”).'),
+('募', 'Hanja form of 모 (“recruit”).'),
+('募', 'Hanja form of 모 (“summon”).'),
+('募', '모'),
+('募', '모으다'),
+('募', '모을'),
+('募', '모을 모'),
+('勠', 'ryuk'),
+('勠', '륙'),
+('勠', '협력할 륙'),
+('勡', ' 겁박할 표 '),
+('勡', 'p''yo'),
+('勡', 'pyo'),
+('勡', '겁탈할 표'),
+('勡', '표'),
+('勢', ' 기회 세'),
+('勢', ' 불알 세'),
+('勢', ' 위엄 세'),
+('勢', 'Hanja form of 세 (“force”).'),
+('勢', '권세 세'),
+('勢', '세'),
+('勢', '형세'),
+('勣', ' 사업 적'),
+('勣', '공적 적'),
+('勣', '적'),
+('勤', 'Hanja form of 근 (“industrious, diligent, attentive”).'),
+('勤', '근'),
+('勤', '부지런하다'),
+('勤', '부지런할'),
+('勤', '부지런할 근'),
+('勦', '수고롭게 할 초'),
+('勦', '초'),
+('勧', '勸의 略字'),
+('勨', ' 움직일 상'),
+('勨', ' 움직일 양 '),
+('勨', ' 힘쓸 상'),
+('勨', ' 힘쓸 양'),
+('勨', '느즈러질 상'),
+('勨', '느즈러질 양'),
+('勩', '수고로울 예'),
+('勩', '수고로울 이'),
+('勮', ' 두려울 거 '),
+('勮', 'geo'),
+('勮', 'ke'),
+('勮', 'kŏ'),
+('勮', '거'),
+('勮', '부지런히 힘쓸 거'),
+('勯', 'dan'),
+('勯', 'tan'),
+('勯', '단'),
+('勯', '힘다할 단'),
+('勰', ' 조화할 협'),
+('勰', '생각할 협'),
+('勰', '협'),
+('勱', 'mae'),
+('勱', '매'),
+('勱', '힘쓸 매'),
+('勲', 'hun'),
+('勲', '勳의 俗字'),
+('勲', '훈'),
+('勳', '공'),
+('勳', '공 훈'),
+('勳', '훈'),
+('勴', 'ryeo'),
+('勴', 'ryŏ'),
+('勴', '려'),
+('勴', '마음으로 도울 려 '),
+('勵', 'Hanja form of 려/여 (“encourage”).'),
+('勵', 'Hanja form of 려/여 (“strive”).'),
+('勵', '려'),
+('勵', '여'),
+('勵', '힘쓰다'),
+('勵', '힘쓸'),
+('勵', '힘쓸 려'),
+('勶', ' 사무칠 철 '),
+('勶', ' 일으킬 철'),
+('勶', '버릴 철'),
+('勶', '쏠'),
+('勶', '쏠다'),
+('勶', '철'),
+('勷', 'yang'),
+('勷', '급할 양'),
+('勷', '양'),
+('勸', 'Hanja form of 권 (“recommend, advise, urge”).'),
+('勸', '권'),
+('勸', '권하다'),
+('勸', '권할'),
+('勸', '권할 권'),
+('勹', ' 쌀 포'),
+('勹', 'wrap'),
+('勹', '꾸릴 포'),
+('勹', '싸다'),
+('勹', '쌀'),
+('勹', '포'),
+('勺', 'Hanja form of 작 (“a unit of measure”).'),
+('勺', '구기 작'),
+('勺', '작'),
+('勻', ' 적을 윤'),
+('勻', '가지런할 윤'),
+('勻', '고를 균'),
+('勼', 'gu'),
+('勼', 'ku'),
+('勼', '구'),
+('勼', '모을 구 '),
+('勽', '덮을 문'),
+('勽', '문'),
+('勾', '句와 同字'),
+('勾', '글귀절 구'),
+('勿', ' 깃발 물'),
+('勿', ' 아닐 물'),
+('勿', 'Hanja form of 물 (“must not, do not”).'),
+('勿', 'Hanja form of 물 (“never”).'),
+('勿', 'Hanja form of 물 (“without, lacking”).'),
+('勿', '말'),
+('勿', '말 물'),
+('勿', '말다'),
+('勿', '몰'),
+('勿', '물'),
+('勿', '아니다'),
+('勿', '아닐'),
+('勿', '없다'),
+('勿', '없을'),
+('勿', '없을 몰'),
+('匀', '勻과 同字'),
+('匀', '고를 균'),
+('匁', 'mun'),
+('匁', '몸메 문'),
+('匁', '문'),
+('匂', '내'),
+('匂', '향내 내'),
+('匃', ' 빌 개'),
+('匃', ' 줄 개'),
+('匃', 'gae'),
+('匃', 'kae'),
+('匃', '개'),
+('匃', '청구할 개'),
+('匄', ' 빌 갈'),
+('匄', ' 줄 갈'),
+('匄', '匃와 同字'),
+('匄', '청구할 갈'),
+('包', ' 더부룩히 날 포'),
+('包', ' 보따리 포'),
+('包', ' 용납할 포'),
+('包', '꾸러미'),
+('包', '꾸릴 포'),
+('包', '싸다'),
+('包', '쌀'),
+('包', '포'),
+('匆', '바쁠 총'),
+('匆', '총'),
+('匈', 'barbarian'),
+('匈', 'foreigner'),
+('匈', 'savage'),
+('匈', '오랑캐'),
+('匈', '흉'),
+('匉', 'p''yŏng'),
+('匉', 'pyeong'),
+('匉', '크게 소리지를 평'),
+('匉', '평'),
+('匊', 'clasp'),
+('匊', 'grab'),
+('匊', 'handful'),
+('匊', 'the palm of the hand'),
+('匊', '국'),
+('匊', '움켜 뜰 국'),
+('匋', '기오 굽는 가마 요'),
+('匋', '질그릇 도'),
+('匌', '기운 답답할 합 '),
+('匌', '합'),
+('匍', ' 엎드러질 포'),
+('匍', '엉금엉금 길 포'),
+('匍', '포'),
+('匎', ' 검약할 압 '),
+('匎', 'ap'),
+('匎', '사치스럽지 않을 압'),
+('匎', '압'),
+('匏', ' 바가지 포'),
+('匏', ' 퉁소 포'),
+('匏', 'p''o'),
+('匏', 'po'),
+('匏', '박 포'),
+('匏', '포'),
+('匐', 'bok'),
+('匐', 'pok'),
+('匐', '길 복'),
+('匐', '복'),
+('匑', 'gung'),
+('匑', 'kung'),
+('匑', '공손할 궁 '),
+('匑', '궁'),
+('匒', 'dap'),
+('匒', 'tap'),
+('匒', '답'),
+('匒', '포갤 답 '),
+('匓', '구'),
+('匓', '배불러 싫을 구 '),
+('匕', 'dagger'),
+('匕', 'spoon'),
+('匕', '비'),
+('匕', '비수'),
+('匕', '비수 비'),
+('化', 'Hanja form of 화 (“-ization; -ification”).'),
+('化', 'Hanja form of 화 (“-ization; -ification”). [suffix]'),
+('化', 'Hanja form of 화 (“to be; to become”).'),
+('化', 'Hanja form of 화 (“to be; to become”). [affix]'),
+('化', '되다'),
+('化', '될'),
+('化', '될 화'),
+('化', '화'),
+('北', 'Hanja form of 배 (“to escape; to flee”).'),
+('北', 'Hanja form of 북 (“north”).'),
+('北', '달아나다'),
+('北', '달아날'),
+('北', '배'),
+('北', '북'),
+('北', '북녘'),
+('北', '북녘 북'),
+('匘', 'noe'),
+('匘', '뇌'),
+('匘', '살찐 모양 뇌'),
+('匙', ' 열쇠 시'),
+('匙', '숟가락 시'),
+('匙', '시'),
+('匚', 'box'),
+('匚', '방'),
+('匚', '상자'),
+('匚', '상자 방'),
+('匛', ' 널 구 '),
+('匛', 'gu'),
+('匛', 'ku'),
+('匛', '관 구'),
+('匛', '구'),
+('匜', ' 술잔 이'),
+('匜', 'i'),
+('匜', '손대야 이'),
+('匜', '이'),
+('匝', '돌 잡'),
+('匝', '잡'),
+('匞', 'chang'),
+('匞', 'jang'),
+('匞', '匠의 本字 '),
+('匞', '장'),
+('匟', 'gang'),
+('匟', 'kang'),
+('匟', '강'),
+('匟', '평상 강'),
+('匠', 'Hanja form of 장 (“craftsman, artisan”).'),
+('匠', '장'),
+('匠', '장인'),
+('匠', '장인 장'),
+('匡', '광'),
+('匡', '바룰 광'),
+('匣', ' 상자 갑'),
+('匣', 'coffer'),
+('匣', 'small box, case'),
+('匣', '갑'),
+('匣', '궤 갑'),
+('匥', ' 대그릇 변 '),
+('匥', ' 옷상자 변'),
+('匥', '관갑 변'),
+('匥', '변'),
+('匧', ' 꿰맬 협'),
+('匧', 'a portfolio'),
+('匧', 'a trunk'),
+('匧', 'hyeop'),
+('匧', 'hyŏp'),
+('匧', '옷상자 협'),
+('匧', '협'),
+('匪', '나눌 분'),
+('匪', '대상자 비'),
+('匬', 'yu'),
+('匬', '곡식 셈하는 단위 휘 유 '),
+('匬', '유'),
+('匭', '갑 궤'),
+('匭', '궤'),
+('匯', '물돌 회'),
+('匯', '회'),
+('匰', 'dan'),
+('匰', 'tan'),
+('匰', '단'),
+('匰', '신주독 단 '),
+('匱', '갑 궤'),
+('匱', '궤'),
+('匲', '경대 렴 '),
+('匲', '렴'),
+('匲', '염'),
+('匲', '화장 상자'),
+('匳', '경대 렴'),
+('匳', '렴'),
+('匳', '염'),
+('匳', '화장 상자'),
+('匴', 'san'),
+('匴', '관상자 산 '),
+('匴', '산'),
+('匵', '독'),
+('匵', '손궤 독'),
+('匶', 'gu'),
+('匶', 'ku'),
+('匶', '柩의 古字 '),
+('匶', '구'),
+('匸', ' 덮을 혜'),
+('匸', 'hide'),
+('匸', '감추다'),
+('匸', '감출'),
+('匸', '감출 혜'),
+('匸', '혜'),
+('匹', ' 둘 필'),
+('匹', ' 무리 필'),
+('匹', ' 벗 필'),
+('匹', ' 한마리 필'),
+('匹', '집 오리 목'),
+('匹', '짝 필'),
+('区', '區와 同字'),
+('区', '區의 略字'),
+('医', 'Alternative form of 醫 (“Hanja form of 의 (“doctor”).”)'),
+('医', 'Hanja form of 예 (“quiver; a tool for storing a bow and crossbow”).'),
+('医', 'Hanja form of 예 (“used in personal names”).'),
+('医', '醫의 略字'),
+('医', '동개'),
+('医', '예'),
+('医', '의'),
+('医', '의원'),
+('医', '화살통 예'),
+('匼', 'ap'),
+('匼', '압'),
+('匽', ' 길 곁 언'),
+('匽', ' 한데 뒷간 언'),
+('匽', 'eon'),
+('匽', 'fall down'),
+('匽', 'latrine'),
+('匽', 'lay down'),
+('匽', 'to rest'),
+('匽', 'ŏn'),
+('匽', '숨길 언'),
+('匽', '언'),
+('匾', '편'),
+('匿', 'Hanja form of 닉/익 (“to hide”).'),
+('匿', '닉'),
+('匿', '숨기다'),
+('匿', '숨길'),
+('匿', '숨쉴 닉'),
+('匿', '익'),
+('區', ' 숨길 우'),
+('區', ' 저울 네 눈 우'),
+('區', 'Hanja form of 구 (“area; district; region; ward”).'),
+('區', '감출 구'),
+('區', '경계 우'),
+('區', '구'),
+('區', '구역'),
+('十', ' 전부 십'),
+('十', 'Hanja form of 십 (“ten”).'),
+('十', 'Hanja form of 십 (“whole; complete; perfect”).'),
+('十', '십'),
+('十', '열'),
+('十', '열 십'),
+('卂', ' 급히 날 신'),
+('卂', '빠를 신'),
+('卂', '신'),
+('千', 'Hanja form of 천 (“thousand”).'),
+('千', '일천 천'),
+('千', '일천(一千)'),
+('千', '천'),
+('卄', '스물'),
+('卄', '스물 입'),
+('卄', '입'),
+('卅', 'thirty, thirtieth'),
+('卅', '삼십'),
+('卅', '삽'),
+('卅', '서른'),
+('卅', '서른 삽'),
+('卆', '卒과 同字'),
+('卆', '졸'),
+('升', ' 괘 이름 승'),
+('升', ' 오를 승'),
+('升', ' 피륙의 짜인 날을 세는 단위 새 승'),
+('升', 'A unit of volume equivalent to about 1.8 L.'),
+('升', '되 승'),
+('升', '승'),
+('午', ' 남쪽 오'),
+('午', ' 말 오'),
+('午', 'Hanja form of 오 (“noon; daytime”).'),
+('午', 'Hanja form of 오 (“noon; daytime”). [affix]'),
+('午', '낮'),
+('午', '낮 오'),
+('午', '오'),
+('卉', '풀 훼'),
+('卉', '훼'),
+('半', 'Hanja form of 반 (“half”).'),
+('半', '반'),
+('半', '반 반'),
+('卋', '世의 古字'),
+('卋', '세'),
+('卌', 'forty; fortieth'),
+('卌', '마흔'),
+('卌', '사십'),
+('卌', '사십 십'),
+('卌', '십'),
+('卍', '만'),
+('卍', '만자 만'),
+('卐', 'swastika'),
+('卐', '만'),
+('卑', 'Hanja form of 비 (“low; inferior”).'),
+('卑', '낮다'),
+('卑', '낮을'),
+('卑', '낮을 비'),
+('卑', '비'),
+('卒', 'Hanja form of 졸 (“soldier”).'),
+('卒', 'Hanja form of 졸 (“to finish”).'),
+('卒', 'Hanja form of 졸 (“to pass away; to die”).'),
+('卒', '군사'),
+('卒', '군사 졸'),
+('卒', '마치다'),
+('卒', '마칠'),
+('卒', '졸'),
+('卓', ' 뛰어날 탁'),
+('卓', ' 성씨 탁'),
+('卓', ' 책상 탁'),
+('卓', 'Hanja form of 탁 (“high; table; desk”).'),
+('卓', '높다'),
+('卓', '높을'),
+('卓', '높을 탁'),
+('卓', '탁'),
+('協', ' 도울 협'),
+('協', ' 맞을 협'),
+('協', '조화할 협'),
+('協', '협'),
+('单', '單의 簡體字'),
+('单', '홀로 단'),
+('南', 'Hanja form of 나 (“Only used in 나무 (南無, namu)”).'),
+('南', 'Hanja form of 남 (“south; southern”).'),
+('南', '나'),
+('南', '나무'),
+('南', '남'),
+('南', '남녘'),
+('南', '남녘 남'),
+('単', '單의 略字'),
+('卙', 'chip'),
+('卙', 'jip'),
+('卙', '많을 집 '),
+('卙', '집'),
+('博', 'Hanja form of 박 (“wide; broad”).'),
+('博', '넓다'),
+('博', '넓을'),
+('博', '넓을 박'),
+('博', '박'),
+('卜', 'Hanja form of 복 (“to divine”).'),
+('卜', '복'),
+('卜', '점'),
+('卜', '점 복'),
+('卝', '丱과 同字'),
+('卞', 'excitable'),
+('卞', 'to be impatient, in a hurry'),
+('卞', '변'),
+('卞', '조급할 변'),
+('卟', ' 생각할 게'),
+('卟', 'ge'),
+('卟', 'ke'),
+('卟', '게'),
+('卟', '점칠 게'),
+('占', ' 날씨 볼 점'),
+('占', ' 점령할 점'),
+('占', 'Hanja form of 점 (“to augur; to divine”).'),
+('占', 'Hanja form of 점 (“to hold; to occupy”).'),
+('占', '점'),
+('占', '점치다'),
+('占', '점칠'),
+('占', '점칠 점'),
+('占', '차지하다'),
+('占', '차지할'),
+('卡', '관 잡'),
+('卡', '잡'),
+('卣', 'Hanja form of 유 (“wine vessel used in ancient China”).'),
+('卣', '술통'),
+('卣', '유'),
+('卣', '중술통 유'),
+('卦', '걸 괘'),
+('卦', '괘'),
+('卨', 'seol'),
+('卨', 'sŏl'),
+('卨', '사람이름 설 '),
+('卨', '설'),
+('卩', ' 병부 절'),
+('卩', 'military authorization seals'),
+('卩', '몸기 절'),
+('卩', '병부'),
+('卩', '절'),
+('卪', 'cel'),
+('卪', 'chŏl'),
+('卪', 'jeol'),
+('卪', '절'),
+('卬', 'I, oneself'),
+('卬', 'ang'),
+('卬', 'high'),
+('卬', 'raise'),
+('卬', '앙'),
+('卬', '자기 앙'),
+('卭', 'gong'),
+('卭', 'kong'),
+('卭', '공'),
+('卭', '병될 공'),
+('卮', ' 연지 치'),
+('卮', '술잔 치'),
+('卮', '치'),
+('卯', 'Hanja form of 묘 (“fourth Earthly Branch”).'),
+('卯', 'Hanja form of 묘 (“rabbit”).'),
+('卯', '넷째 지지'),
+('卯', '묘'),
+('卯', '토끼'),
+('卯', '토끼 묘'),
+('印', 'Hanja form of 인 (“seal, stamp”).'),
+('印', 'Hanja form of 인 (“seal, stamp”). [noun]'),
+('印', '끝(官簿之末端書字) 끝'),
+('印', '도장 인'),
+('印', '도장(圖章)'),
+('印', '인'),
+('危', ' 높을 위'),
+('危', ' 무너질 위'),
+('危', ' 별 이름 위'),
+('危', ' 상할 위'),
+('危', 'dangerous, precarious'),
+('危', 'high'),
+('危', '위'),
+('危', '위태하다'),
+('危', '위태할'),
+('危', '위태할 위'),
+('卲', ' 성씨 소'),
+('卲', 'so'),
+('卲', '높을 소'),
+('卲', '소'),
+('即', 'Alternative form of 卽 (“immediately; in other words”)'),
+('即', '卽의 俗字'),
+('即', '곧'),
+('即', '즉'),
+('却', '각'),
+('却', '물리칠 각'),
+('卵', 'Hanja form of 란/난 (“ovum”).'),
+('卵', '난'),
+('卵', '란'),
+('卵', '알'),
+('卵', '알 란'),
+('卶', 'si'),
+('卶', '시'),
+('卶', '크게 경사스러울 시 '),
+('卷', 'Hanja form of 권 (“curl”).'),
+('卷', 'Hanja form of 권 (“scroll”).'),
+('卷', '굽다'),
+('卷', '굽을'),
+('卷', '굽을 권'),
+('卷', '권'),
+('卸', 'sa'),
+('卸', '사'),
+('卸', '풀 사'),
+('卹', 'hyul'),
+('卹', '가엾이 여길 휼'),
+('卹', '휼'),
+('卺', 'geun'),
+('卺', 'kŭn'),
+('卺', '근'),
+('卺', '합환주잔 근'),
+('卻', '却의 本字'),
+('卻', '각'),
+('卼', 'ol'),
+('卼', '올'),
+('卼', '위태할 올'),
+('卽', 'Hanja form of 즉 (“immediate”).'),
+('卽', 'Hanja form of 즉 (“in other words, i.e.”).'),
+('卽', 'Hanja form of 즉 (“to ascend”).'),
+('卽', '곧'),
+('卽', '곧 즉'),
+('卽', '즉'),
+('卾', 'ak'),
+('卾', '악'),
+('卾', '윗턱 악 '),
+('卿', 'Hanja form of 경 (“noble”).'),
+('卿', '경'),
+('卿', '벼슬'),
+('卿', '벼슬 경'),
+('厀', 'seul'),
+('厀', 'sŭl'),
+('厀', '膝의 本字 '),
+('厀', '슬'),
+('厁', 'Hanja form of 산 (“placename”).'),
+('厁', '땅 이름'),
+('厁', '산'),
+('厂', ' 기슭 엄'),
+('厂', '굴바위 엄'),
+('厂', '사람 이름 한'),
+('厃', ' 평고대 위'),
+('厃', '우러러 볼 위'),
+('厃', '우러러 볼 점'),
+('厄', '액'),
+('厄', '재앙'),
+('厄', '재앙 액'),
+('厇', '찢을 책 '),
+('厇', '책'),
+('厉', '厲의 略字'),
+('厊', 'a'),
+('厊', '아'),
+('厊', '어긋날 아 '),
+('厎', 'whetstone'),
+('厎', '숫돌 지'),
+('厎', '지'),
+('厓', ' 물가 애'),
+('厓', 'boundary'),
+('厓', 'hill, cliff'),
+('厓', 'the edge'),
+('厓', '애'),
+('厓', '언덕 애'),
+('厔', 'chil'),
+('厔', 'jil'),
+('厔', '막을 질'),
+('厔', '질'),
+('厖', 'bang'),
+('厖', 'pang'),
+('厖', '방'),
+('厖', '클 방'),
+('厘', ' 터전 전'),
+('厘', '釐의 俗字'),
+('厘', '전방 전'),
+('厚', '두터울 후'),
+('厚', '후'),
+('厝', 'a grave or tombstone'),
+('厝', 'to cut or engrave'),
+('厝', '措와 同字'),
+('厝', '조'),
+('厞', 'bi'),
+('厞', 'pi'),
+('厞', '더러울 비 '),
+('厞', '비'),
+('原', ' 거듭 원'),
+('原', ' 기인할 원'),
+('原', ' 들판 원'),
+('原', ' 언덕 원'),
+('原', 'Hanja form of 원 (“meadow”).'),
+('原', 'Hanja form of 원 (“origin”).'),
+('原', '근본 원'),
+('原', '근원'),
+('原', '언덕'),
+('原', '원'),
+('厠', ' 섞일 측'),
+('厠', ' 평상 가장자리 측'),
+('厠', 'ch''ŭk'),
+('厠', 'cheuk'),
+('厠', '뒷간 측'),
+('厠', '측'),
+('厤', 'calculation for calendars'),
+('厤', '다스릴 력'),
+('厤', '력'),
+('厥', 'Hanja form of 굴 (“used in place names”).'),
+('厥', 'Hanja form of 궐 (“he, she, it, they”).'),
+('厥', 'barbarian tribe or country, eg., 突厥 (돌궐, originally, 돌굴), compare 蕃國 (번국), 藩國 (번국)'),
+('厥', '굴'),
+('厥', '궐'),
+('厥', '그'),
+('厥', '그 궐'),
+('厥', '나라이름'),
+('厥', '나라이름 굴'),
+('厦', '큰 집 하'),
+('厦', '하'),
+('厨', '廚의 俗字'),
+('厩', 'gu'),
+('厩', 'ku'),
+('厩', '구'),
+('厩', '마구 구'),
+('厪', 'geun'),
+('厪', 'kun'),
+('厪', 'kŭn'),
+('厪', '근'),
+('厪', '적을 근'),
+('厬', 'gwe'),
+('厬', 'kwe'),
+('厬', '궤'),
+('厬', '목마를 궤 '),
+('厭', ' 게으를 염'),
+('厭', ' 괴로울 엽'),
+('厭', ' 누를 엽'),
+('厭', ' 덜 엽'),
+('厭', ' 만족할 염'),
+('厭', ' 모을 엽'),
+('厭', ' 미워할 염'),
+('厭', ' 숨길 엽'),
+('厭', ' 아름다울 염'),
+('厭', ' 축하할 엽'),
+('厭', 'Hanja form of 염 (“to detest”).'),
+('厭', '넉넉할 염'),
+('厭', '싫어하다'),
+('厭', '싫어할'),
+('厭', '염'),
+('厭', '제사할 엽'),
+('厮', ' 나눌 시'),
+('厮', ' 마부 시'),
+('厮', 'si'),
+('厮', '부릴 시'),
+('厮', '시'),
+('厱', 'eom'),
+('厱', 'ŏm'),
+('厱', '언덕 비탈 엄 '),
+('厱', '엄'),
+('厲', '갈 려'),
+('厲', '려'),
+('厳', '嚴과 同字'),
+('厴', 'shells'),
+('厴', 'yem'),
+('厴', 'yeom'),
+('厴', 'yŏm'),
+('厴', '염'),
+('厵', 'won'),
+('厵', 'wŏn'),
+('厵', '源과 同字'),
+('厵', '원'),
+('厶', '사사 사'),
+('厷', 'goeng'),
+('厷', 'koeng'),
+('厷', '굉'),
+('厷', '둥글 굉'),
+('厸', 'rin'),
+('厸', '鄰의 古字 '),
+('厸', '린'),
+('厹', '구'),
+('厹', '세모창 구'),
+('厺', 'geo'),
+('厺', 'kŏ'),
+('厺', '去의 本字'),
+('厺', '거'),
+('去', ' 감출 거'),
+('去', ' 떨어질 거'),
+('去', ' 버릴 거'),
+('去', ' 오래될 거'),
+('去', ' 쫓을 거'),
+('去', 'Hanja form of 거 (“to leave; to go away”).'),
+('去', '갈'),
+('去', '갈 거'),
+('去', '거'),
+('厼', 'Kwukyel form of 며 (myeo)'),
+('厼', 'Kwukyel form of 이 (i)'),
+('厼', '구결자'),
+('厼', '너'),
+('厼', '너 (neo, “(informal) you”)'),
+('厼', '며'),
+('厼', '이'),
+('厽', '흙을 쌓아서 담 쌀 참 '),
+('厽', '흙을 쌓아서 담 쌓을 뤼'),
+('叀', 'cen'),
+('叀', 'chŏn'),
+('叀', 'jeon'),
+('叀', 'only'),
+('叀', 'wholly'),
+('叀', '전'),
+('叁', '參의 略字'),
+('叁', '삼'),
+('参', '參의 略字'),
+('参', '간여할 참'),
+('參', 'Alternative form of 三 (“Hanja form of 삼 (“three”).”)'),
+('參', 'Hanja form of 삼 (“(Chinese astronomy) Three Stars mansion (one of the Twenty-Eight Mansions)”).'),
+('參', 'Hanja form of 참 (“jagged; uneven”).'),
+('參', 'Hanja form of 참 (“to join; to participate”).'),
+('參', 'Hanja form of 참 (“to join; to participate”). [affix]'),
+('參', '간여할 참'),
+('參', '들쭉날쭉하다'),
+('參', '들쭉날쭉할'),
+('參', '별 이름'),
+('參', '삼'),
+('參', '석'),
+('參', '석 삼'),
+('參', '참'),
+('參', '참여할'),
+('叄', 'Alternative form of 參 (삼 (sam), “three”)'),
+('叄', '參의 俗字'),
+('叄', '간여할 참'),
+('叄', '삼'),
+('叄', '석'),
+('叅', 'Alternative form of 參 (참 (cham), “to participate”)'),
+('叅', '의논할 참'),
+('叅', '참'),
+('叅', '참여하다'),
+('叅', '참여할'),
+('又', ' 용서할 우'),
+('又', 'Hanja form of 우 (“again; and, also”).'),
+('又', 'Hanja form of 우 (“again; and, also”). [affix]'),
+('又', '또'),
+('又', '또 우'),
+('又', '우'),
+('叉', 'Hanja form of 차 (“to cross; to intersect”).'),
+('叉', '갈래'),
+('叉', '깍지낄 차'),
+('叉', '차'),
+('及', 'Hanja form of 급 (“come up to”).'),
+('及', 'Hanja form of 급 (“extend”).'),
+('及', 'Hanja form of 급 (“reach”).'),
+('及', '급'),
+('及', '미치다'),
+('及', '미칠'),
+('及', '미칠 급'),
+('友', ' 합할 우'),
+('友', 'Hanja form of 우 (“friend; companion”).'),
+('友', '벗'),
+('友', '벗 우'),
+('友', '우'),
+('双', 'Alternative form of 雙'),
+('双', '雙의 略字'),
+('双', '쌍'),
+('反', 'Alternative form of 販 (“Hanja form of 판 (“to sell”).”)'),
+('反', 'Hanja form of 반 (“reverse; anti-”).'),
+('反', 'Hanja form of 번 (“to flip over”).'),
+('反', '돌이킬 반'),
+('反', '되돌리다'),
+('反', '되돌릴'),
+('反', '되돌릴 번'),
+('反', '뒤집다'),
+('反', '뒤집을'),
+('反', '반'),
+('反', '번'),
+('反', '판'),
+('反', '팔'),
+('反', '팔다'),
+('叏', 'gwae'),
+('叏', 'kwae'),
+('叏', '괘'),
+('叏', '나누어 가를 괘 '),
+('叒', 'obedient'),
+('叒', 'united'),
+('叒', '동방귀신나무 약'),
+('叒', '약'),
+('叓', '事의 古字'),
+('叓', '사'),
+('叔', ' 끝 숙'),
+('叔', ' 어릴 숙'),
+('叔', ' 주울 숙'),
+('叔', 'Hanja form of 숙 (“uncle”).'),
+('叔', '숙'),
+('叔', '아재비 숙'),
+('叔', '아저씨'),
+('叕', ' 잇댈 철 '),
+('叕', 'Hanja form of 철 (“to put together in a file”).'),
+('叕', '이을 철'),
+('叕', '철'),
+('取', ' 받을 취'),
+('取', ' 빼앗을 취'),
+('取', ' 장가들 취'),
+('取', ' 찾을 취'),
+('取', 'Hanja form of 취 (“to take; to fetch”).'),
+('取', '가지다'),
+('取', '가질'),
+('取', '거둘 취'),
+('取', '취'),
+('受', ' 담을 수'),
+('受', ' 받을 수'),
+('受', ' 얻을 수'),
+('受', 'Hanja form of 수 (“accept”).'),
+('受', '받다'),
+('受', '받을'),
+('受', '수'),
+('受', '이을 수'),
+('叙', '敍의 俗字'),
+('叚', '가'),
+('叚', '빌 가'),
+('叛', 'Hanja form of 반 (“rebel, rebellion, rebellious”).'),
+('叛', '반'),
+('叛', '배반하다'),
+('叛', '배반할'),
+('叛', '배반할 반'),
+('叞', ' 다리미 위 '),
+('叞', 'wi'),
+('叞', '안위할 위'),
+('叞', '위'),
+('叟', ' 쌀 씻는 소리 수'),
+('叟', '수'),
+('叟', '어른 수'),
+('叡', ' 어질 예'),
+('叡', ' 임금 예'),
+('叡', '밝을 예'),
+('叡', '예'),
+('叢', ' 모을 총'),
+('叢', ' 번잡할 총'),
+('叢', '떨기 총'),
+('叢', '총'),
+('口', 'Hanja form of 구 (“entrance; opening”).'),
+('口', 'Hanja form of 구 (“hole”).'),
+('口', 'Hanja form of 구 (“mouth”).'),
+('口', '구'),
+('口', '입'),
+('口', '입 구'),
+('古', 'Hanja form of 고 (“old; ancient”).'),
+('古', '고'),
+('古', '옛'),
+('古', '옛 고'),
+('句', 'Hanja form of 구 (“sentence; phrase”).'),
+('句', '구'),
+('句', '글귀'),
+('句', '글귀 귀'),
+('句', '글귀절 구'),
+('另', ' 다를 령'),
+('另', ' 헤어질 령'),
+('另', '나눌 령'),
+('另', '령'),
+('叧', 'gwa'),
+('叧', 'kwa'),
+('叧', '과'),
+('叨', '도'),
+('叨', '탐할 도'),
+('叩', 'go'),
+('叩', 'ko'),
+('叩', '고'),
+('叩', '두드릴 고'),
+('只', '다만 지'),
+('只', '지'),
+('叫', 'Hanja form of 규 (“shout”).'),
+('叫', '규'),
+('叫', '부르짖다'),
+('叫', '부르짖을'),
+('叫', '부를 규'),
+('召', ' 과부 소'),
+('召', ' 청할 소'),
+('召', '대추 조'),
+('召', '부를 소'),
+('叭', ' 입 벌릴 팔'),
+('叭', '나팔 팔'),
+('叭', '팔'),
+('叮', ' 정성스러울 정'),
+('叮', '단단히 부탁할 정'),
+('叮', '정'),
+('可', 'Hanja form of 가 (“possible; allowed”).'),
+('可', 'Hanja form of 극 (“barbarian”).'),
+('可', '가'),
+('可', '극'),
+('可', '오랑캐'),
+('可', '오랑캐 임금 이름 극'),
+('可', '옳다'),
+('可', '옳을'),
+('可', '옳을 가'),
+('台', ' 기를 이'),
+('台', ' 기쁠 이'),
+('台', ' 늙을 태'),
+('台', '별 태'),
+('台', '자신 이'),
+('叱', 'Hanja form of 질 (“scold”).'),
+('叱', '꾸짖다'),
+('叱', '꾸짖을'),
+('叱', '꾸짖을 질'),
+('叱', '질'),
+('史', 'Hanja form of 사 (“history”).'),
+('史', 'Hanja form of 사 (“history”). [noun, suffix]'),
+('史', '사'),
+('史', '사기(史記)'),
+('史', '역사 사'),
+('右', ' 강할 우'),
+('右', ' 높일 우'),
+('右', ' 도울 우'),
+('右', 'Hanja form of 우 (“right (direction)”).'),
+('右', 'Hanja form of 우 (“to help; to aid; to assist; to give a hand”).'),
+('右', '도울'),
+('右', '돕다'),
+('右', '오른쪽'),
+('右', '오른쪽 우'),
+('右', '우'),
+('叴', '구'),
+('叴', '소리 높일 구'),
+('叵', ' 드디어 파'),
+('叵', ' 술잔 파'),
+('叵', '못할 파'),
+('叵', '파'),
+('叶', 'hyŏp'),
+('叶', '협'),
+('叶', '화합할 협'),
+('号', 'Alternative form of 號 (“Hanja form of 호 (“name; number”).”)'),
+('号', '號의 略字'),
+('号', '이름'),
+('号', '호'),
+('司', 'sa'),
+('司', '맡을 사'),
+('司', '사'),
+('叺', 'ip'),
+('叺', 'straw bag'),
+('叺', 'tobacco pouch'),
+('叺', '가마니 입'),
+('叺', '입'),
+('吁', 'yu'),
+('吁', '유'),
+('吃', '말더듬을 흘'),
+('吃', '흘'),
+('各', 'Hanja form of 각 (“each”).'),
+('各', '각'),
+('各', '각각'),
+('各', '각각 각'),
+('吅', '부르짖을 현 '),
+('吅', '현'),
+('吆', '애통하는 소리 요'),
+('吆', '요'),
+('合', ' 같을 합'),
+('合', ' 대답할 합'),
+('合', ' 짝 합'),
+('合', ' 홉 갑'),
+('合', 'Hanja form of 합 (“to unite”).'),
+('合', '부를 갑'),
+('合', '합'),
+('合', '합하다'),
+('合', '합할'),
+('合', '합할 합'),
+('吉', 'Hanja form of 길 (“luck”).'),
+('吉', '길'),
+('吉', '길하다'),
+('吉', '길할'),
+('吉', '길할 길'),
+('吊', '弔의 俗字'),
+('吊', '적'),
+('吋', 'ch''on'),
+('吋', 'chon'),
+('吋', '인치(inch) 촌'),
+('吋', '촌'),
+('同', 'Hanja form of 동 (“same; identical”).'),
+('同', '같을 동'),
+('同', '동'),
+('同', '한가지'),
+('名', 'Hanja form of 명 (“famous; great; noted”).'),
+('名', 'Hanja form of 명 (“famous; great; noted”). [prefix]'),
+('名', 'Hanja form of 명 (“name”).'),
+('名', 'Hanja form of 명 (“name”). [noun]'),
+('名', '명'),
+('名', '이름'),
+('名', '이름 명'),
+('后', 'Hanja form of 후 (“queen; empress”).'),
+('后', 'Hanja form of 후 (“ruler; monarch”).'),
+('后', '임금'),
+('后', '임금 후'),
+('后', '후'),
+('吏', 'Hanja form of 리/이 (“government official”).'),
+('吏', '리'),
+('吏', '벼슬아치'),
+('吏', '벼슬아치 리'),
+('吏', '이'),
+('吐', ' 나올 토'),
+('吐', ' 펼 토'),
+('吐', 'Kwukyel form of 토 (to)'),
+('吐', '토'),
+('吐', '토할 토'),
+('向', ' 기울어질 향'),
+('向', ' 나아갈 향'),
+('向', ' 북쪽 창 향'),
+('向', 'Hanja form of 상 (“a surname.”).'),
+('向', 'Hanja form of 향 (“facing”).'),
+('向', '상'),
+('向', '성'),
+('向', '성 상'),
+('向', '향'),
+('向', '향할'),
+('向', '향할 향'),
+('吒', '咤와 同字'),
+('吒', '조롱할 탁'),
+('吘', 'u'),
+('吘', '부를 우 '),
+('吘', '우'),
+('吚', ' 신음할 의'),
+('吚', 'ui'),
+('吚', 'ŭi'),
+('吚', '의'),
+('吚', '탄식할 의'),
+('君', 'Hanja form of 군 (“sovereign”).'),
+('君', 'Hanja form of 군 (“young man; young sir”).'),
+('君', '군'),
+('君', '임금'),
+('君', '임금 군'),
+('吝', '린'),
+('吝', '아낄 린'),
+('吞', 't''an'),
+('吞', 'tan'),
+('吞', '呑과 同字'),
+('吞', '탄'),
+('吟', ' 끙끙거릴 음'),
+('吟', ' 노래할 음'),
+('吟', ' 말 더듬을 음'),
+('吟', ' 울 음'),
+('吟', ' 탄식할 음'),
+('吟', ' 턱 끄덕거릴 음'),
+('吟', 'eum'),
+('吟', 'ŭm'),
+('吟', '읊을 음'),
+('吟', '음'),
+('吠', ' 땅이름 폐'),
+('吠', '짖을 폐'),
+('吠', '폐'),
+('吡', 'p''il'),
+('吡', 'pil'),
+('吡', '새소리 필'),
+('吡', '필'),
+('吢', 'sim'),
+('吢', '개가 토할 심'),
+('吢', '심'),
+('否', ' 더러울 비'),
+('否', ' 악할 비'),
+('否', 'Hanja form of 부 (“not, no, negative”).'),
+('否', 'Hanja form of 비 (“obstruct, block”).'),
+('否', '막다'),
+('否', '막힐'),
+('否', '막힐 비'),
+('否', '부'),
+('否', '비'),
+('否', '아니다'),
+('否', '아닐'),
+('否', '아닐 부'),
+('吧', '아이 다툴 파'),
+('吧', '파'),
+('吨', 'dun'),
+('吨', 'tun'),
+('吨', '둔'),
+('吨', '말 분명치 못할 둔'),
+('吩', 'bun'),
+('吩', 'pun'),
+('吩', 'to instruct, to order'),
+('吩', '분'),
+('吩', '뿜을 분'),
+('吪', ' 거짓말 와'),
+('吪', ' 사투리 와'),
+('吪', 'wa'),
+('吪', '와'),
+('吪', '움직일 와'),
+('含', '머금다'),
+('含', '머금을'),
+('含', '머금을 함'),
+('含', '함'),
+('听', ' 들을 은'),
+('听', ' 입이 큰 모양 은'),
+('听', '벙긋거릴 은'),
+('吭', ' 새 목구멍 항'),
+('吭', 'hang'),
+('吭', 'throat'),
+('吭', '목구멍 항'),
+('吭', '항'),
+('吮', '빨 전'),
+('吮', '전'),
+('启', '啓와 同字'),
+('吱', '가는 소리 지'),
+('吱', '지'),
+('吲', 'sin'),
+('吲', '비웃을 신'),
+('吲', '신'),
+('吳', ' 성씨 오'),
+('吳', ' 큰소리 지를 오'),
+('吳', '성씨'),
+('吳', '오'),
+('吳', '오나라 오'),
+('吳', '큰소리치다'),
+('吳', '큰소리칠'),
+('吳', '화'),
+('吴', 'o'),
+('吴', '吳와 同字'),
+('吴', '오'),
+('吵', '묘'),
+('吵', '지저궐 초'),
+('吵', '지저귈 묘'),
+('吵', '초'),
+('吶', ' 함성 지를 열'),
+('吶', '납'),
+('吶', '눌'),
+('吶', '떠들'),
+('吶', '떠들다'),
+('吶', '말 느리게 할 열'),
+('吶', '말 더듬을 눌'),
+('吶', '말을 더듬을'),
+('吷', ' 새소리 혈'),
+('吷', ' 작은소리 혈 '),
+('吷', 'hyeol'),
+('吷', 'hyŏl'),
+('吷', '마실 혈'),
+('吷', '혈'),
+('吸', 'Hanja form of 흡 (“to drink, suck in, to inhale, to attract”).'),
+('吸', '마시다'),
+('吸', '마실'),
+('吸', '숨 들이쉴 흡'),
+('吸', '흡'),
+('吹', ' 부를 취'),
+('吹', ' 숨쉴 취'),
+('吹', ' 악기 불 취'),
+('吹', ' 충동할 취'),
+('吹', 'Hanja form of 취 (“to blow”).'),
+('吹', '불'),
+('吹', '불 취'),
+('吹', '불다'),
+('吹', '취'),
+('吺', 'du'),
+('吺', 'tu'),
+('吺', '두'),
+('吺', '말 많을 두 '),
+('吻', ' 입가 문'),
+('吻', 'mun'),
+('吻', '문'),
+('吻', '입술 문'),
+('吼', '울 후'),
+('吼', '후'),
+('吽', ' 개 짖는 소리 우'),
+('吽', '개 싸울 우'),
+('吽', '소 울 음'),
+('吾', ' 아들 오'),
+('吾', 'o'),
+('吾', '오'),
+('吾', '자기 오'),
+('吿', '告과 同字'),
+('吿', '告와 同字'),
+('呀', '입 벌릴 하'),
+('呀', '하'),
+('呂', '려'),
+('呂', '음률 려'),
+('呃', '애'),
+('呃', '재채기할 애'),
+('呅', '웃을 매'),
+('呅', '웃을 문'),
+('呆', 'Hanja form of 매 (“dull-minded; simple; stupid”).'),
+('呆', '保와 同字'),
+('呆', '매'),
+('呆', '어리석다'),
+('呆', '어리석을'),
+('呆', '어리석을 매'),
+('呈', ' 드러낼 정'),
+('呈', '보일 정'),
+('呈', '정'),
+('呉', '吳와 同字'),
+('告', 'Hanja form of 고 (“report”).'),
+('告', 'Hanja form of 곡 (“asking”).'),
+('告', '고'),
+('告', '곡'),
+('告', '알리다'),
+('告', '알릴'),
+('告', '알릴 고'),
+('告', '청하다'),
+('告', '청할'),
+('告', '청할 곡'),
+('呌', 'gyu'),
+('呌', 'kyu'),
+('呌', '규'),
+('呌', '부르짖을 규'),
+('呎', 'foot'),
+('呎', '길이 단위 척'),
+('呎', '척'),
+('呏', 'seung'),
+('呏', 'sŭng'),
+('呏', '승'),
+('呏', '용량의 단위 갤런(gallon) 승'),
+('呐', '吶과 同字'),
+('呑', ' 감출 탄'),
+('呑', ' 멸할 탄'),
+('呑', ' 휩쌀 탄'),
+('呑', 't''an'),
+('呑', 'tan'),
+('呑', '삼킬 탄'),
+('呑', '탄'),
+('呝', 'aek'),
+('呝', 'ayk'),
+('呝', '액'),
+('呝', '울 액 '),
+('呟', 'hyeon'),
+('呟', 'hyŏn'),
+('呟', '소리 현'),
+('呟', '현'),
+('呢', '니'),
+('呢', '소근거릴 니'),
+('呤', 'ryeong'),
+('呤', 'ryŏng'),
+('呤', '령'),
+('呤', '속삭일 령 '),
+('呦', ' 새짐승 우는 소리 유'),
+('呦', '사슴 우는 소리 유'),
+('呦', '유'),
+('呧', ' 비방할 제'),
+('呧', 'che'),
+('呧', 'je'),
+('呧', '꾸짖을 제'),
+('呧', '제'),
+('周', '두루'),
+('周', '두루 주'),
+('周', '주'),
+('呪', 'Hanja form of 주 (“charm; curse”).'),
+('呪', '빌'),
+('呪', '빌 주'),
+('呪', '빌다'),
+('呪', '주'),
+('呫', ' 귀에 대고 소근거릴 첩'),
+('呫', ' 앙징할 첩'),
+('呫', 'chatter'),
+('呫', 'taste'),
+('呫', 'whisper, murmur'),
+('呫', '맛 볼 첩'),
+('呫', '첩'),
+('呬', '숨 쉴 히'),
+('呬', '쉴 희'),
+('呬', '왁자할 령'),
+('呭', '말 수다스럴 예'),
+('呭', '예'),
+('呮', '걸터앉다'),
+('呮', '걸터앉을'),
+('呮', '기'),
+('呮', '도사리고 앉을 기'),
+('呰', 'cha'),
+('呰', 'ja'),
+('呰', '자'),
+('呰', '주차할 자 '),
+('呱', 'go'),
+('呱', 'ko'),
+('呱', '고'),
+('呱', '울 고'),
+('味', ' 뜻 미'),
+('味', 'Hanja form of 미 (“taste”).'),
+('味', '맛'),
+('味', '맛 미'),
+('味', '미'),
+('呴', 'breathe out'),
+('呴', 'gu'),
+('呴', 'ku'),
+('呴', 'roar'),
+('呴', '구'),
+('呴', '숨을 내쉴 구'),
+('呵', 'ga'),
+('呵', 'ka'),
+('呵', '가'),
+('呵', '꾸짖을 가'),
+('呶', 'no'),
+('呶', '노'),
+('呶', '들랠 노'),
+('呷', ' 떠들썩할 합'),
+('呷', ' 벌릴 합'),
+('呷', ' 집오리 우는 소리 합'),
+('呷', '빨아 마실 합'),
+('呷', '합'),
+('呸', '다투는 소리 비'),
+('呸', '비'),
+('呹', ' 재빠를 일'),
+('呹', '소리 질'),
+('呹', '풀 뜯어 먹을 일'),
+('呺', '큰체할 호'),
+('呺', '큰체할 효'),
+('呻', ' 끙끙거릴 신'),
+('呻', 'sin'),
+('呻', '신'),
+('呻', '읊조릴 신'),
+('呼', ' 숨 내쉴 호'),
+('呼', 'Hanja form of 호 (“to call; to shout”).'),
+('呼', 'Hanja form of 호 (“to exhale; to breathe out”).'),
+('呼', '부르다'),
+('呼', '부를'),
+('呼', '부를 호'),
+('呼', '호'),
+('命', 'Hanja form of 명 (“life”).'),
+('命', '명'),
+('命', '목숨'),
+('命', '목숨 명'),
+('呾', 'dal'),
+('呾', 'tal'),
+('呾', '달'),
+('呾', '마주 꾸짖을 달 '),
+('呿', 'geo'),
+('呿', 'kŏ'),
+('呿', '거'),
+('呿', '입 딱 벌일 거'),
+('咀', ' 깨달을 저'),
+('咀', ' 먹을 저'),
+('咀', 'chŏ'),
+('咀', 'jeo'),
+('咀', '씹을 저'),
+('咀', '저'),
+('咂', 'chap'),
+('咂', 'jap'),
+('咂', '빨 잡'),
+('咂', '잡'),
+('咄', 'dol'),
+('咄', 'tol'),
+('咄', '꾸짖을 돌'),
+('咄', '돌'),
+('咅', 'bu'),
+('咅', 'pu'),
+('咅', 'to spit out'),
+('咅', '부'),
+('咆', ' 불끈 성낼 포'),
+('咆', ' 짐승소리 포'),
+('咆', 'p''o'),
+('咆', 'po'),
+('咆', '고함지를 포'),
+('咆', '포'),
+('咇', 'p''il'),
+('咇', 'pil'),
+('咇', '필'),
+('咇', '향기날 필'),
+('咈', '불'),
+('咈', '어길 불'),
+('咉', 'ang'),
+('咉', '목메어 슬피 울 앙'),
+('咉', '앙'),
+('咊', 'hwa'),
+('咊', '순할 화'),
+('咊', '화'),
+('咋', '사'),
+('咋', '잠간 사'),
+('和', 'Hanja form of 화 (“a free-reed mouth organ with 13 bamboo pipes used in ancient times”).'),
+('和', 'Hanja form of 화 (“harmony; peace”).'),
+('和', '화'),
+('和', '화할'),
+('和', '화할 화'),
+('咍', 'hae'),
+('咍', '비웃을 해'),
+('咍', '해'),
+('咎', '허물 고'),
+('咎', '허물 구'),
+('咏', ' 읊을 영'),
+('咏', 'sing song or poem, hum, chant'),
+('咏', 'yeong'),
+('咏', 'yŏng'),
+('咏', '노래할 영'),
+('咏', '영'),
+('咐', 'bu'),
+('咐', 'pu'),
+('咐', 'to instruct, to order'),
+('咐', '부'),
+('咐', '분부할 부'),
+('咒', 'chu'),
+('咒', 'ju'),
+('咒', '呪와 同字'),
+('咒', '주'),
+('咕', 'go'),
+('咕', 'ko'),
+('咕', '고'),
+('咕', '투덜거릴 고'),
+('咖', ' 커피의 음차로 쓰는자 가'),
+('咖', '가'),
+('咖', '커피차 가'),
+('咜', 't''a'),
+('咜', 'ta'),
+('咜', '咤의 譌字'),
+('咜', '타'),
+('咠', '집'),
+('咠', '참소할 집'),
+('咡', 'i'),
+('咡', '이'),
+('咡', '입 어귀 이'),
+('咢', 'ak'),
+('咢', '놀랄 악'),
+('咢', '악'),
+('咤', ' 뿜을 타'),
+('咤', ' 슬플 타'),
+('咤', ' 쩍쩍 씹는소리 타'),
+('咤', 't''a'),
+('咤', 'ta'),
+('咤', '꾸짖을 타'),
+('咤', '타'),
+('咥', 'hui'),
+('咥', 'hŭi'),
+('咥', '허허 웃을 희'),
+('咥', '희'),
+('咦', ' 웃을 이'),
+('咦', ' 웃을 재'),
+('咦', '크게 부를 이'),
+('咦', '크게 부를 재'),
+('咧', '렬'),
+('咧', '새소리 렬'),
+('咨', '물을 자'),
+('咨', '자'),
+('咩', 'mi'),
+('咩', '미'),
+('咩', '양 울 미'),
+('咪', 'mi'),
+('咪', '咩와 同字'),
+('咪', '미'),
+('咫', '길이 지'),
+('咫', '여덟 치'),
+('咫', '지'),
+('咬', 'gyo'),
+('咬', 'kyo'),
+('咬', '교'),
+('咬', '새소리 교'),
+('咭', '웃는 모양 길'),
+('咭', '쥐 우는 소리 갈'),
+('咮', 'chu'),
+('咮', 'ju'),
+('咮', '부리 주'),
+('咮', '주'),
+('咯', 'gak'),
+('咯', 'kak'),
+('咯', '각'),
+('咯', '토할 각'),
+('咱', '나 찰'),
+('咱', '우리 차'),
+('咲', 'so'),
+('咲', '소'),
+('咲', '웃을 소'),
+('咳', ' 방글방글 웃을 해'),
+('咳', ' 침 뱉을 해'),
+('咳', '기침 해'),
+('咳', '해'),
+('咶', ' 이야기할 시'),
+('咶', ' 이야기할 활 '),
+('咶', '핥을 시'),
+('咶', '핥을 활'),
+('咷', 'cry loudly'),
+('咷', 'howl'),
+('咷', '도'),
+('咷', '아이 울음 끈질길 도'),
+('咸', '모두 함'),
+('咸', '함'),
+('咺', 'hwon'),
+('咺', 'hwŏn'),
+('咺', '섧게 울 훤'),
+('咺', '훤'),
+('咻', 'hyu'),
+('咻', '떠들 휴'),
+('咻', '휴'),
+('咼', 'gwae'),
+('咼', 'kwae'),
+('咼', 'kway'),
+('咼', '괘'),
+('咼', '입 비뚤어질 괘'),
+('咽', ' 막힐 열'),
+('咽', 'Hanja form of 열 (“Used in 오열(嗚咽) (oyeol, “sobbing”): choked; smothered”).'),
+('咽', 'Hanja form of 인 (“throat; pharynx”).'),
+('咽', 'Hanja form of 인 (“throat; pharynx”). [affix]'),
+('咽', '목 멜 열'),
+('咽', '목구멍'),
+('咽', '목구멍 인'),
+('咽', '목메다'),
+('咽', '목멜'),
+('咽', '열'),
+('咽', '인'),
+('咿', ' 책 읽는 소리 이'),
+('咿', 'i'),
+('咿', '선웃음칠 이'),
+('咿', '이'),
+('哀', ' 가여울 애'),
+('哀', 'ae'),
+('哀', 'grief, sorrow'),
+('哀', 'sad'),
+('哀', '슬플 애'),
+('哀', '애'),
+('品', ' 가지 품'),
+('品', ' 벼슬 차례 품'),
+('品', ' 품수 품'),
+('品', 'Hanja form of 품 (“article; goods”).'),
+('品', 'Hanja form of 품 (“personality; character”).'),
+('品', 'Hanja form of 품 (“quality”).'),
+('品', '물건(物件)'),
+('品', '뭇 품'),
+('品', '품'),
+('哂', ' 비웃을 신'),
+('哂', 'sin'),
+('哂', '빙그레 웃을 신'),
+('哂', '신'),
+('哃', 'dong'),
+('哃', 'tong'),
+('哃', '동'),
+('哃', '클말할 동 '),
+('哄', '떠들썩할 홍'),
+('哄', '홍'),
+('哅', 'hyung'),
+('哅', '떠들 흉 '),
+('哅', '흉'),
+('哆', '입 딱 벌일 치'),
+('哇', ' 게울 와'),
+('哇', '와'),
+('哇', '음란한 소리 와'),
+('哈', 'hap'),
+('哈', '한 모금 합'),
+('哈', '합'),
+('哉', ' 그런가 재'),
+('哉', ' 답다 재'),
+('哉', '비로소 재'),
+('哉', '재'),
+('哎', '애'),
+('哎', '애통하는 소리 애'),
+('哘', 'Only used in borrowings from Japanese words.'),
+('哘', '일본(日本) 지명(地名)'),
+('哘', '행'),
+('哛', '뿐'),
+('員', ' 둥글 원'),
+('員', 'Hanja form of 원 (“person, personnel, employee, member”).'),
+('員', '관원 원'),
+('員', '원'),
+('員', '인원'),
+('哢', 'rong'),
+('哢', '롱'),
+('哢', '지저귈 롱'),
+('哤', 'bang'),
+('哤', 'pang'),
+('哤', '난잡할 방'),
+('哤', '방'),
+('哥', '가'),
+('哥', '노래 가'),
+('哥', '성씨'),
+('哦', 'a'),
+('哦', '놀람의 어조사 아'),
+('哦', '아'),
+('哨', ' 잔말할 소'),
+('哨', '망 볼 초'),
+('哨', '입술 비뚤어질 소'),
+('哩', 'mile'),
+('哩', '리'),
+('哩', '어조사 리'),
+('哪', 'na'),
+('哪', '나'),
+('哪', '연귀 쫓는 소리 나'),
+('哫', '아첨할 족'),
+('哫', '족'),
+('哬', 'ha'),
+('哬', '꾸짖을 하 '),
+('哬', '하'),
+('哭', 'Hanja form of 곡 (“cry”).'),
+('哭', '곡'),
+('哭', '울'),
+('哭', '울 곡'),
+('哭', '울다'),
+('哮', '으르렁거릴 효'),
+('哮', '효'),
+('哯', 'hyeon'),
+('哯', 'hyŏn'),
+('哯', '아이 젖 토할 현 '),
+('哯', '현'),
+('哰', 'ro'),
+('哰', '로'),
+('哰', '말 알아듣지 못할 로'),
+('哱', '발'),
+('哱', '어지러울 발 '),
+('哲', 'wise man, sage'),
+('哲', 'wise, sagacious'),
+('哲', '밝다'),
+('哲', '밝을'),
+('哲', '밝을 철'),
+('哲', '철'),
+('哳', 'ch''al'),
+('哳', 'chal'),
+('哳', '새소리 찰 '),
+('哳', '찰'),
+('哶', 'ma'),
+('哶', '마'),
+('哶', '양울 마'),
+('哷', 'ryeol'),
+('哷', 'ryŏl'),
+('哷', '닭 우는 소리 렬 '),
+('哷', '렬'),
+('哹', ' 물새 우는 소리 부 '),
+('哹', 'bu'),
+('哹', 'pu'),
+('哹', 'pwu'),
+('哹', '부'),
+('哹', '부는 소리 부'),
+('哺', ' 먹일 포'),
+('哺', 'p''o'),
+('哺', 'po'),
+('哺', '씹어 먹을 포'),
+('哺', '포'),
+('哼', '겁낼 형'),
+('哼', '형'),
+('哽', 'gyeong'),
+('哽', 'kyŏng'),
+('哽', '경'),
+('哽', '목멜 경'),
+('哿', 'ga'),
+('哿', 'ka'),
+('哿', '가'),
+('哿', '좋을 가'),
+('唀', 'yu'),
+('唀', '誘와 同字 '),
+('唀', '유'),
+('唁', 'eon'),
+('唁', 'express condolence'),
+('唁', 'ŏn'),
+('唁', '언'),
+('唁', '위문할 언'),
+('唄', ' 노래부를 패'),
+('唄', 'The sound of reciting the Buddhist scriptures'),
+('唄', 'p''ae'),
+('唄', 'pae'),
+('唄', '염불소리 패'),
+('唄', '패'),
+('唅', '머금을 함'),
+('唅', '함'),
+('唆', 'sa'),
+('唆', '부추길 사'),
+('唆', '사'),
+('唇', 'chin'),
+('唇', 'cin'),
+('唇', 'jin'),
+('唇', '놀랄 진'),
+('唇', '진'),
+('唈', '숨 느껴 쉴 압'),
+('唈', '숨 느껴쉴 읍'),
+('唉', 'ae'),
+('唉', 'answer'),
+('唉', 'ask'),
+('唉', 'ay'),
+('唉', '대답하는 소리 애'),
+('唉', '애'),
+('唊', 'gyeop'),
+('唊', 'kyŏp'),
+('唊', '겹'),
+('唊', '망녕되이 말할 겹'),
+('唌', '참소리 단'),
+('唌', '참소할 연 '),
+('唍', 'wan'),
+('唍', '방긋 웃을 완 '),
+('唍', '완'),
+('唎', 'ri'),
+('唎', '가는 소리 리'),
+('唎', '리'),
+('唏', 'hui'),
+('唏', 'hŭi'),
+('唏', '슬퍼할 희'),
+('唏', '희'),
+('唐', 'Hanja form of 당 (“Chinese”).'),
+('唐', 'Hanja form of 당 (“Tang dynasty”).'),
+('唐', '당'),
+('唐', '당나라'),
+('唐', '당나라 당'),
+('唔', '글 읽는 소리 오'),
+('唔', '오'),
+('唕', '조'),
+('唕', '지저귈 조 '),
+('唖', 'a'),
+('唖', '啞의 略字'),
+('唖', '아'),
+('唚', 'ch''im'),
+('唚', 'chim'),
+('唚', '입맞출 침'),
+('唚', '침'),
+('唜', '끌 말 '),
+('唜', '말'),
+('唟', 'Geotdaemaeul (충청북도 청주시 상당구 것대마을)'),
+('唟', '것'),
+('唟', '땅 이름'),
+('唟', '땅이름 것'),
+('唤', '喚과 同字'),
+('唪', '껄껄 웃을 봉'),
+('唪', '봉'),
+('唫', 'geum'),
+('唫', 'kŭm'),
+('唫', '금'),
+('唫', '입 다물 금'),
+('唬', ' 외칠 호'),
+('唬', 'ho'),
+('唬', '범이 울 호'),
+('唬', '호'),
+('唭', 'gi'),
+('唭', 'ki'),
+('唭', '기'),
+('唭', '듣지도 보지도 않을 기 '),
+('售', ' 갚을 수'),
+('售', '수'),
+('售', '팔'),
+('售', '팔 수'),
+('售', '팔다'),
+('唯', ' 허락할 유'),
+('唯', 'yu'),
+('唯', '오직 유'),
+('唯', '유'),
+('唱', 'Hanja form of 창 (“to chant”).'),
+('唱', '노래 창'),
+('唱', '부르다'),
+('唱', '부를'),
+('唱', '창'),
+('唲', ' 응석 부릴 애'),
+('唲', '선웃음칠 아'),
+('唲', '아'),
+('唲', '애'),
+('唲', '어리광 부릴 애'),
+('唳', 'cry'),
+('唳', 'cry of bird'),
+('唳', 'ryeo'),
+('唳', 'ryŏ'),
+('唳', '려'),
+('唳', '울 려'),
+('唴', ' 울어 기진할 강 '),
+('唴', 'gang'),
+('唴', 'kang'),
+('唴', '강'),
+('唴', '어린아이 울 강'),
+('唶', '부르짖을 책'),
+('唶', '탄식할 차'),
+('唷', 'yuk'),
+('唷', '소리지를 육'),
+('唷', '육'),
+('唸', '신음할 전'),
+('唸', '신음할 점'),
+('唹', 'eo'),
+('唹', 'ŏ'),
+('唹', '고요히 웃을 어'),
+('唹', '어'),
+('唼', 'gobbling sound made by ducks'),
+('唼', 'sap'),
+('唼', 'speaking evil'),
+('唼', '삽'),
+('唼', '쪼아먹을 삽'),
+('唾', ' 버릴 타'),
+('唾', 'Hanja form of 타 (“saliva”).'),
+('唾', '침'),
+('唾', '침 타'),
+('唾', '타'),
+('唿', 'hol'),
+('唿', '근심할 홀'),
+('唿', '홀'),
+('啀', '물어뜯을 애'),
+('啀', '애'),
+('啁', '비웃을 조'),
+('啁', '새소리 주'),
+('啂', 'nyo'),
+('啂', '뇨'),
+('啃', 'sap'),
+('啃', '삽'),
+('啃', '입 다시는 소리 삽'),
+('啄', ' 문 두드릴 탁'),
+('啄', '쪼을 탁'),
+('啄', '탁'),
+('啅', '啄과 同字 '),
+('啅', '탁'),
+('商', 'Hanja form of 상 (“trade; commerce”).'),
+('商', '상'),
+('商', '장사'),
+('商', '헤아릴 상'),
+('啇', ' 밑둥 적'),
+('啇', ' 실과 꼭지 적'),
+('啇', 'base'),
+('啇', 'chŏk'),
+('啇', 'jeok'),
+('啇', 'root'),
+('啇', '나무 뿌리 적'),
+('啇', '적'),
+('啉', 'ram'),
+('啉', '람'),
+('啉', '술순배 람'),
+('啊', ' 어조사 아'),
+('啊', 'a'),
+('啊', 'love'),
+('啊', '사랑할 아'),
+('啊', '아'),
+('啋', '움직일 교'),
+('啍', ' 느럭느럭할 톤'),
+('啍', 't''on'),
+('啍', 'ton'),
+('啍', '입김 톤'),
+('啍', '톤'),
+('啎', 'o'),
+('啎', '거스를 오'),
+('啎', '오'),
+('問', ' 알릴 문'),
+('問', 'Hanja form of 문 (“ask; question”).'),
+('問', '문'),
+('問', '묻다'),
+('問', '물을'),
+('問', '물을 문'),
+('啐', ' 놀랄 쵀'),
+('啐', ' 맛 볼 쵀'),
+('啐', '부를 쵀'),
+('啐', '지껄일 줄'),
+('啑', '唼과 同字'),
+('啑', '오리가 텁석텁석 먹을 삽'),
+('啑', '콧김 불 체 '),
+('啓', 'Hanja form of 계 (“open, begin”).'),
+('啓', '계'),
+('啓', '열'),
+('啓', '열 계'),
+('啕', 'do'),
+('啕', 'to'),
+('啕', '도'),
+('啕', '수도할 도'),
+('啖', 'dam'),
+('啖', 'tam'),
+('啖', '담'),
+('啖', '씹을 담'),
+('啗', 'dam'),
+('啗', 'tam'),
+('啗', '담'),
+('啗', '씹을 담'),
+('啙', 'cha'),
+('啙', 'ja'),
+('啙', '약할 자'),
+('啙', '자'),
+('啚', 'bi'),
+('啚', 'cheap'),
+('啚', 'low, mean'),
+('啚', 'pi'),
+('啚', '鄙와 同字 '),
+('啚', '비'),
+('啜', '마실 철'),
+('啜', '철'),
+('啝', 'wa'),
+('啝', '와'),
+('啞', ' 놀랄 아'),
+('啞', 'a'),
+('啞', '벙어리 아'),
+('啞', '아'),
+('啟', 'gye'),
+('啟', 'kye'),
+('啟', '계'),
+('啟', '인도할 계'),
+('啡', '코 고는 소리 배'),
+('啡', '코 고는 소리 비'),
+('啣', 'ham'),
+('啣', '재갈 함'),
+('啣', '함'),
+('啻', ' 쯤 시'),
+('啻', '뿐 시'),
+('啻', '시'),
+('啼', 'cey'),
+('啼', 'che'),
+('啼', 'je'),
+('啼', '울 제'),
+('啼', '제'),
+('啽', 'am'),
+('啽', '암'),
+('啽', '잠꼬대 암'),
+('啾', ' 찍찍거릴 추'),
+('啾', 'ch''u'),
+('啾', 'chu'),
+('啾', '두런거릴 추'),
+('啾', '추'),
+('啿', '넉넉할 잠 '),
+('啿', '많을 담'),
+('喀', ' 토할 객'),
+('喀', 'gaek'),
+('喀', 'kaek'),
+('喀', 'kayk'),
+('喀', '객'),
+('喀', '기침할 객'),
+('喁', 'crouch'),
+('喁', 'quiver'),
+('喁', 'the mouth of a fish at the surface of the water'),
+('喁', '물고기 입 오물거릴 옹'),
+('喁', '서로 부를 우'),
+('喁', '옹'),
+('喁', '우'),
+('喂', '위'),
+('喃', 'nam'),
+('喃', '남'),
+('喃', '재잘거릴 남'),
+('善', 'Hanja form of 선 (“good, nice”).'),
+('善', '선'),
+('善', '착하다'),
+('善', '착할'),
+('善', '착할 선'),
+('喅', 'yuk'),
+('喅', '뭇 소리 육 '),
+('喅', '육'),
+('喆', '哲과 同字'),
+('喆', '철'),
+('喇', '나팔 라'),
+('喇', '말굽히할 랄'),
+('喈', ' 빠를 개'),
+('喈', 'gae'),
+('喈', 'kae'),
+('喈', 'sound of chirping'),
+('喈', '개'),
+('喈', '새소리 개'),
+('喉', 'Hanja form of 후 (“throat, gullet, larynx; guttural”).'),
+('喉', '목구멍'),
+('喉', '목구멍 후'),
+('喉', '후'),
+('喊', 'Hanja form of 함 (“shout”).'),
+('喊', '소리 함'),
+('喊', '소리치다'),
+('喊', '소리칠'),
+('喊', '함'),
+('喋', '오리와 기러기 텁석거려 먹는 소리 잡'),
+('喋', '재잘거릴 첩'),
+('喌', '닭 부르는 소리 주'),
+('喍', 'chae'),
+('喍', 'jae'),
+('喍', '개싸움할 재 '),
+('喍', '재'),
+('喏', 'ya'),
+('喏', '공손히 대답할 야'),
+('喏', '야'),
+('喑', ' 목 쉴 음'),
+('喑', ' 안간힘 쓸 음'),
+('喑', 'cry ceaselessly'),
+('喑', 'deaf mute'),
+('喑', 'eum'),
+('喑', 'ŭm'),
+('喑', '소리지를 음'),
+('喑', '음'),
+('喒', '나 잠'),
+('喒', '잠'),
+('喓', 'yo'),
+('喓', '벌레소리 요'),
+('喓', '요'),
+('喔', ' 아첨해 웃는 소리 악'),
+('喔', 'ak'),
+('喔', '닭 우는 소리 악'),
+('喔', '악'),
+('喗', ' 이빨 더러울 운 '),
+('喗', 'un'),
+('喗', '운'),
+('喗', '입 클 운'),
+('喘', 'ch''ŏn'),
+('喘', 'cheon'),
+('喘', '천'),
+('喘', '헐떡거릴 천'),
+('喙', 'hwe'),
+('喙', '부리 훼'),
+('喙', '훼'),
+('喚', 'Hanja form of 환 (“call”).'),
+('喚', '부르다'),
+('喚', '부를'),
+('喚', '부를 환'),
+('喚', '환'),
+('喛', ' 근심할 환 '),
+('喛', 'hwan'),
+('喛', '성낼 환'),
+('喛', '환'),
+('喜', 'happiness, enjoyment'),
+('喜', 'hui'),
+('喜', 'hŭi'),
+('喜', '기뻐할 희'),
+('喜', '희'),
+('喝', ' 성낸 소리 갈'),
+('喝', '꾸짖을 갈'),
+('喝', '목 쉴 애'),
+('喞', '두런거릴 즐'),
+('喞', '찍찍거릴 직'),
+('喟', '한숨쉴 괴'),
+('喟', '한숨쉴 위'),
+('喠', 'chong'),
+('喠', 'jong'),
+('喠', '말 못할 종 '),
+('喠', '종'),
+('喣', 'hu'),
+('喣', '불 후'),
+('喣', '후'),
+('喤', '어린아이 울음 황'),
+('喤', '황'),
+('喦', ' 다툴 엽'),
+('喦', 'nyeop'),
+('喦', 'nyŏp'),
+('喦', '녑'),
+('喦', '땅 이름 엽'),
+('喧', 'hwon'),
+('喧', 'hwŏn'),
+('喧', '의젓할 훤'),
+('喧', '훤'),
+('喨', 'neigh'),
+('喨', 'ryang'),
+('喨', 'wail, cry, yell'),
+('喨', '량'),
+('喨', '소리 맑을 량'),
+('喩', ' 비유할 유'),
+('喩', ' 알릴 유'),
+('喩', 'yu'),
+('喩', '깨우쳐 줄 유'),
+('喩', '유'),
+('喪', 'sang'),
+('喪', '상'),
+('喪', '죽을 상'),
+('喫', 'Hanja form of 끽 (“drink”).'),
+('喫', 'Hanja form of 끽 (“eat”).'),
+('喫', 'Hanja form of 끽 (“suffer; endure; bear”).'),
+('喫', '끽'),
+('喫', '마실 끽'),
+('喫', '먹을/마실'),
+('喬', 'gyo'),
+('喬', 'kyo'),
+('喬', '교'),
+('喬', '높을 교'),
+('喭', '조문할 언'),
+('喭', '추솔할 안'),
+('單', 'Hanja form of 단 (“single; individual; solitary”).'),
+('單', 'Hanja form of 선 (“a barbarian”).'),
+('單', '고을이름 선'),
+('單', '단'),
+('單', '선'),
+('單', '오랑캐 이름'),
+('單', '홀'),
+('單', '홀로 단'),
+('喰', 'chan'),
+('喰', '먹을 식'),
+('喰', '찬'),
+('喲', 'yak'),
+('喲', '감탄하는 어조사 약'),
+('喲', '약'),
+('喳', '사'),
+('喳', '예하고 대답하는 소리 사'),
+('営', '榮과 同字'),
+('喸', 'p''ot'),
+('喸', 'pot'),
+('喸', '땅이름 폿'),
+('喸', '폿'),
+('喻', 'yu'),
+('喻', '喩와 同字'),
+('喻', '유'),
+('喿', 'chirping of birds'),
+('喿', 'so'),
+('喿', '새 때지어 울 소'),
+('喿', '소'),
+('嗀', 'hak'),
+('嗀', '게울 학 '),
+('嗀', '학'),
+('嗁', 'che'),
+('嗁', 'je'),
+('嗁', '啼와 同字'),
+('嗁', '제'),
+('嗂', 'yo'),
+('嗂', '기꺼울 요 '),
+('嗂', '요'),
+('嗃', '꾸짖을 학'),
+('嗃', '성낸 소리 효'),
+('嗄', '목 쉴 애'),
+('嗄', '목 잠길 사'),
+('嗅', '맡을 후'),
+('嗅', '후'),
+('嗆', 'ch''ang'),
+('嗆', 'chang'),
+('嗆', '새 먹을 창'),
+('嗆', '창'),
+('嗇', 'miserly, thrifty, stingy'),
+('嗇', 'saek'),
+('嗇', 'stopped up, constipated'),
+('嗇', '색'),
+('嗇', '아낄 색'),
+('嗈', 'ong'),
+('嗈', '기러기 짝지어 울 옹'),
+('嗈', '옹'),
+('嗉', 'so'),
+('嗉', '멀떠구니 소'),
+('嗉', '소'),
+('嗊', 'hong'),
+('嗊', '노래 홍 '),
+('嗊', '홍'),
+('嗋', 'hyeop'),
+('嗋', 'hyŏp'),
+('嗋', '들이마실 협 '),
+('嗋', '협'),
+('嗌', '呝과 同字'),
+('嗎', '꾸짖을 마'),
+('嗎', '마'),
+('嗐', '감탄사 할'),
+('嗐', '하품할 해'),
+('嗑', ' 괘 이름 합'),
+('嗑', ' 웃는 소리 합'),
+('嗑', ' 입 다물 합'),
+('嗑', 'eat seeds'),
+('嗑', 'loquacious'),
+('嗑', 'reproach'),
+('嗑', '갑'),
+('嗑', '말이 많을'),
+('嗑', '입다물'),
+('嗑', '입다물다'),
+('嗑', '잔말할 합'),
+('嗑', '합'),
+('嗒', 'a Buddhist temple.'),
+('嗒', 'a temple.'),
+('嗒', 'a tower.'),
+('嗒', 'a vacant look.'),
+('嗒', 'to be careless.'),
+('嗒', 'to lick.'),
+('嗒', '멍하다'),
+('嗒', '멍할'),
+('嗒', '우두먼할 탑 '),
+('嗒', '탑'),
+('嗓', '목구멍 상'),
+('嗓', '상'),
+('嗔', '성낼 진'),
+('嗔', '진'),
+('嗕', '오랑캐 이름 욕 '),
+('嗕', '욕'),
+('嗙', 'bang'),
+('嗙', 'pang'),
+('嗙', '방'),
+('嗙', '웃을 방'),
+('嗚', 'o'),
+('嗚', '오'),
+('嗚', '탄식할 오'),
+('嗛', ' 겸손 겸'),
+('嗛', ' 입에 밥 물고 있을 겸'),
+('嗛', 'bad harvest'),
+('嗛', 'gyeom'),
+('嗛', 'humility'),
+('嗛', 'insufficient'),
+('嗛', 'kyŏm'),
+('嗛', 'regret'),
+('嗛', '겸'),
+('嗛', '부족히 여길 겸'),
+('嗜', 'gi'),
+('嗜', 'ki'),
+('嗜', '기'),
+('嗜', '즐길 기'),
+('嗝', ' 꿩 울 격'),
+('嗝', '격'),
+('嗝', '딸꾹질할 격'),
+('嗞', '자'),
+('嗞', '탄식할 자'),
+('嗟', 'ch''a'),
+('嗟', 'cha'),
+('嗟', '차'),
+('嗟', '탄식할 차'),
+('嗠', 'ra'),
+('嗠', '라'),
+('嗡', ' 벌레소리 옹'),
+('嗡', '소 울음'),
+('嗡', '소 울음소리 옹'),
+('嗡', '옹'),
+('嗢', 'ol'),
+('嗢', '목 멜 올 '),
+('嗢', '올'),
+('嗣', 'sa'),
+('嗣', '사'),
+('嗣', '이을 사'),
+('嗤', ' 냉소 치'),
+('嗤', 'ch''i'),
+('嗤', 'chi'),
+('嗤', '비웃을 치'),
+('嗤', '치'),
+('嗧', '갤런 륜 '),
+('嗧', '륜'),
+('嗩', 'swae'),
+('嗩', '뿔나팔 쇄'),
+('嗩', '쇄'),
+('嗭', 'chit'),
+('嗭', 'cis'),
+('嗭', 'jit'),
+('嗭', '땅 이름 짓'),
+('嗭', '짓'),
+('嗶', ' 잔말할 필'),
+('嗶', 'p''il'),
+('嗶', 'pil'),
+('嗶', '울 필'),
+('嗶', '필'),
+('嗷', 'o'),
+('嗷', '여럿이 걱정할 오'),
+('嗷', '오'),
+('嗸', '슬픈 소리 오'),
+('嗸', '오'),
+('嗹', 'ryeon'),
+('嗹', 'ryŏn'),
+('嗹', '길게 말할 련'),
+('嗹', '련'),
+('嗺', ' 급히 마실 최 '),
+('嗺', 'ch''oe'),
+('嗺', 'choe'),
+('嗺', 'choy'),
+('嗺', '입 옴칠 최'),
+('嗺', '최'),
+('嗻', 'ch''a'),
+('嗻', 'cha'),
+('嗻', '말 많을 차'),
+('嗻', '차'),
+('嗼', '고요할 막 '),
+('嗼', '막'),
+('嗽', ' 입가실 수'),
+('嗽', 'su'),
+('嗽', '기침할 수'),
+('嗽', '수'),
+('嗾', '부추길 주'),
+('嗾', '주'),
+('嗿', '여럿이 먹는 소리 탐'),
+('嗿', '탐'),
+('嘁', '측'),
+('嘂', '교'),
+('嘂', '크게 부르짖을 교'),
+('嘄', 'gyo'),
+('嘄', 'kyo'),
+('嘄', '교'),
+('嘄', '부르짖을 교 '),
+('嘅', ' 성낼 개'),
+('嘅', 'kae'),
+('嘅', '개'),
+('嘅', '탄식할 개'),
+('嘆', 'Alternative form of 歎 (“Hanja form of 탄 (“sigh”).”)'),
+('嘆', '탄'),
+('嘆', '탄식하다'),
+('嘆', '탄식할'),
+('嘆', '한숨쉴 탄'),
+('嘇', 'sam'),
+('嘇', '머금을 삼 '),
+('嘇', '삼'),
+('嘈', 'noisy'),
+('嘈', 'talking voice'),
+('嘈', 'to make noise'),
+('嘈', '들레다'),
+('嘈', '들렐'),
+('嘈', '조'),
+('嘈', '지껄일 조'),
+('嘉', 'beautiful'),
+('嘉', 'happy, joyous'),
+('嘉', '가'),
+('嘉', '아름다울 가'),
+('嘊', 'ae'),
+('嘊', '비틀거릴 애 '),
+('嘊', '애'),
+('嘌', ' 몰아갈 표 '),
+('嘌', 'p''yo'),
+('嘌', 'pyo'),
+('嘌', '표'),
+('嘌', '휙 불 표'),
+('嘍', '루'),
+('嘍', '시끄러울 루'),
+('嘎', 'al'),
+('嘎', '새소리 알'),
+('嘎', '알'),
+('嘏', ' 굳을 가'),
+('嘏', ' 멀 가'),
+('嘏', ' 복 가'),
+('嘏', '복 하'),
+('嘏', '클 가'),
+('嘐', 'gyo'),
+('嘐', 'kyo'),
+('嘐', '교'),
+('嘐', '닭 울 교'),
+('嘑', ' 거칠게 말할 호'),
+('嘑', 'ho'),
+('嘑', 'to bawl'),
+('嘑', 'to howl at'),
+('嘑', 'to menace'),
+('嘑', '부르짖을 호'),
+('嘑', '호'),
+('嘒', 'Used only when reading Classical Chinese texts.'),
+('嘒', '가냘플 혜'),
+('嘒', '작은 소리'),
+('嘒', '혜'),
+('嘓', 'goek'),
+('嘓', 'koek'),
+('嘓', '괵'),
+('嘓', '귀찮을 괵'),
+('嘔', '기쁠 후'),
+('嘔', '토할 구'),
+('嘕', ' 빙그레할 언 '),
+('嘕', ' 즐거워할 언'),
+('嘕', 'eon'),
+('嘕', 'ŏn'),
+('嘕', '기꺼워할 언'),
+('嘕', '언'),
+('嘖', 'ch''aek'),
+('嘖', 'chaek'),
+('嘖', '외칠 책'),
+('嘖', '책'),
+('嘗', 'sang'),
+('嘗', '맛볼 상'),
+('嘗', '상'),
+('嘘', '噓의 俗字'),
+('嘚', '득'),
+('嘚', '지껄이다'),
+('嘚', '지껄일'),
+('嘛', 'ma'),
+('嘛', '나마 마'),
+('嘛', '마'),
+('嘞', 'reuk'),
+('嘞', 'rŭk'),
+('嘞', '륵'),
+('嘞', '어조사 륵'),
+('嘟', 'do'),
+('嘟', 'to'),
+('嘟', '도'),
+('嘟', '칭찬할 도'),
+('嘠', '嘎의 俗字'),
+('嘨', 'so'),
+('嘨', '嘯와 同字'),
+('嘨', '소'),
+('嘩', 'hwa'),
+('嘩', '譁와 同字'),
+('嘩', '화'),
+('嘪', 'Hanja form of 매 (“sound made by a goat”).'),
+('嘪', '매'),
+('嘪', '양-의 소리'),
+('嘫', '대답할 연 '),
+('嘫', '연'),
+('嘬', ' 산적 한 입에 넣을 최'),
+('嘬', 'ch''oe'),
+('嘬', 'choe'),
+('嘬', 'to lap'),
+('嘬', 'to suck'),
+('嘬', '물 최'),
+('嘬', '최'),
+('嘮', 'ch''o'),
+('嘮', 'cho'),
+('嘮', '이야기할 초'),
+('嘮', '초'),
+('嘯', ' 세게 뿜을 소'),
+('嘯', ' 읊을 소'),
+('嘯', 'roar, howl, scream'),
+('嘯', 'so'),
+('嘯', 'whistle'),
+('嘯', '소'),
+('嘯', '휘파람 소'),
+('嘰', 'gi'),
+('嘰', 'ki'),
+('嘰', '기'),
+('嘰', '쪽잘거릴 기'),
+('嘱', 'ch''ok'),
+('嘱', 'chok'),
+('嘱', '囑의 俗字'),
+('嘱', '촉'),
+('嘲', 'cho'),
+('嘲', 'jo'),
+('嘲', '조'),
+('嘲', '조롱할 조'),
+('嘳', 'goe'),
+('嘳', 'koe'),
+('嘳', '괴'),
+('嘳', '한숨쉴 괴 '),
+('嘴', '부리 취'),
+('嘴', '취'),
+('嘵', 'argue, dispute'),
+('嘵', 'fear'),
+('嘵', 'hyo'),
+('嘵', 'noisy'),
+('嘵', '두려워할 효'),
+('嘵', '효'),
+('嘶', ' 목 쉴 시'),
+('嘶', ' 울부짖을 시'),
+('嘶', 'si'),
+('嘶', '말 울 시'),
+('嘶', '시'),
+('嘷', ' 외칠 호'),
+('嘷', 'ho'),
+('嘷', '짖을 호'),
+('嘷', '호'),
+('嘸', ' 모호한 모양 무'),
+('嘸', 'mu'),
+('嘸', '무'),
+('嘸', '분명하지 않을 무'),
+('嘹', 'resonant'),
+('嘹', 'ryo'),
+('嘹', 'used describe clarity of voice'),
+('嘹', '료'),
+('嘹', '울 료'),
+('嘺', 'gyo'),
+('嘺', 'kyo'),
+('嘺', '교'),
+('嘺', '입 비뚤러질 교'),
+('嘻', 'harmony'),
+('嘻', 'hui'),
+('嘻', 'hŭi'),
+('嘻', 'laugh'),
+('嘻', '웃을 희'),
+('嘻', '희'),
+('嘼', '쌓을 휴 '),
+('嘼', '휴'),
+('嘽', ' 기꺼워할 탄'),
+('嘽', ' 많을 탄'),
+('嘽', '많을 천'),
+('嘽', '헐떡거릴 탄'),
+('嘾', 'dam'),
+('嘾', 'tam'),
+('嘾', '담'),
+('嘾', '탐할 담 '),
+('嘿', ' 말 아니할 묵'),
+('嘿', 'muk'),
+('嘿', '고요할 묵'),
+('嘿', '묵'),
+('噀', 'son'),
+('噀', '물 뿜을 손'),
+('噀', '손'),
+('噁', 'o'),
+('噁', '성낼 오'),
+('噁', '오'),
+('噂', 'chun'),
+('噂', 'jun'),
+('噂', '수군거릴 준'),
+('噂', '준'),
+('噃', ' 소리 번'),
+('噃', 'eon'),
+('噃', 'ŏn'),
+('噃', '건'),
+('噃', '산돼지 번'),
+('噅', ' 곱사등이 위'),
+('噅', 'wi'),
+('噅', '거짓말 위'),
+('噅', '위'),
+('噆', '깨물 참 '),
+('噆', '참'),
+('噇', 'dam'),
+('噇', 'tam'),
+('噇', '담'),
+('噇', '먹는 모양 담 '),
+('噈', 'ch''uk'),
+('噈', 'chuk'),
+('噈', '입맞출 축 '),
+('噈', '축'),
+('噉', 'dam'),
+('噉', 'tam'),
+('噉', 'to eat'),
+('噉', 'to feed'),
+('噉', '담'),
+('噉', '씹을 담'),
+('噊', '위태할 술'),
+('噊', '위태할 율 '),
+('噋', 't''on'),
+('噋', 'ton'),
+('噋', '啍과 同字'),
+('噋', '톤'),
+('噌', '시끄러울 증'),
+('噌', '장사꾼 웅성거릴 쟁'),
+('噍', 'ch''o'),
+('噍', 'cho'),
+('噍', '먹을 초'),
+('噍', '초'),
+('噎', 'yeol'),
+('噎', 'yŏl'),
+('噎', '목 멜 열'),
+('噎', '열'),
+('噏', 'compress'),
+('噏', 'heup'),
+('噏', 'hŭp'),
+('噏', 'inhale, absorb, imbibe'),
+('噏', '숨 들이쉴 흡'),
+('噏', '흡'),
+('噐', 'gi'),
+('噐', 'ki'),
+('噐', '그릇 기'),
+('噐', '기'),
+('噓', ' 뿜을 허'),
+('噓', 'heo'),
+('噓', 'hŏ'),
+('噓', '불 허'),
+('噓', '허'),
+('噕', 'wi'),
+('噕', '噅와 同字'),
+('噕', '위'),
+('噞', '고기 우물거릴 엄'),
+('噞', '엄'),
+('噠', 'dal'),
+('噠', 'tal'),
+('噠', '달'),
+('噠', '오랑캐 나라 이름 달'),
+('噢', '슬퍼할 우'),
+('噢', '슬퍼할 욱'),
+('噣', '부리 주'),
+('噣', '쪼을 탁'),
+('噤', 'be silent, be unable speak'),
+('噤', 'close'),
+('噤', 'geum'),
+('噤', 'kŭm'),
+('噤', '금'),
+('噤', '입 다물 금'),
+('噥', '농'),
+('噥', '달게 먹을 농'),
+('噦', '새소리 홰'),
+('噦', '재채기할 얼'),
+('噧', '기운 높여 떠들 홰 '),
+('噧', '홰'),
+('器', 'Hanja form of 기 (“container; vessel”).'),
+('器', 'Hanja form of 기 (“device; instrument”).'),
+('器', '그릇'),
+('器', '그릇 기'),
+('器', '기'),
+('噩', 'ak'),
+('噩', '놀랄 악'),
+('噩', '악'),
+('噪', 'cho'),
+('噪', 'jo'),
+('噪', '떠들썩할 조'),
+('噪', '조'),
+('噫', 'Hanja form of 애 (“to belch; to burp”).'),
+('噫', 'Hanja form of 희 (“alas (expressing regret or surprise)”).'),
+('噫', 'Hanja form of 희 (“to sigh; to groan”).'),
+('噫', '애'),
+('噫', '탄식할 희'),
+('噫', '트림하다'),
+('噫', '트림할'),
+('噫', '트림할 애'),
+('噫', '한숨 쉴'),
+('噫', '희'),
+('噬', 'seo'),
+('噬', 'sŏ'),
+('噬', '서'),
+('噬', '씹을 서'),
+('噭', 'gyo'),
+('噭', 'kyo'),
+('噭', '교'),
+('噭', '부르짖을 교'),
+('噮', 'yeon'),
+('噮', 'yŏn'),
+('噮', '몹시 달 연 '),
+('噮', '연'),
+('噯', 'ae'),
+('噯', '애'),
+('噯', '트림할 애'),
+('噰', 'ong'),
+('噰', '옹'),
+('噰', '화한 소리 옹 '),
+('噱', ' 입 벌일 갹'),
+('噱', 'gyak'),
+('噱', 'kyak'),
+('噱', '갹'),
+('噱', '껄껄 웃을 갹'),
+('噲', ' 훨할 쾌'),
+('噲', 'k''wae'),
+('噲', 'kwae'),
+('噲', 'refreshing'),
+('噲', 'throat'),
+('噲', '목구멍 쾌'),
+('噲', '쾌'),
+('噳', 'u'),
+('噳', '뭇 사슴 우물거릴 우'),
+('噳', '우'),
+('噴', '분'),
+('噴', '뿜을'),
+('噴', '뿜을 분'),
+('噶', ' 땅이름 갈'),
+('噶', 'gal'),
+('噶', 'kal'),
+('噶', '갈'),
+('噶', '벼슬이름 갈'),
+('噸', 't''on'),
+('噸', '톤'),
+('噺', 'sin'),
+('噺', '신'),
+('噺', '이야기 신'),
+('嚀', 'nyeong'),
+('嚀', 'nyŏng'),
+('嚀', '녕'),
+('嚀', '정녕할 녕'),
+('嚂', '람'),
+('嚂', '먹을 람 '),
+('嚃', '탑'),
+('嚃', '훅 들어마실 탑'),
+('嚄', 'hoek'),
+('嚄', '외칠 획'),
+('嚄', '획'),
+('嚅', ' 잔말할 유'),
+('嚅', '말 머뭇거릴 유'),
+('嚅', '유'),
+('嚆', 'hyo'),
+('嚆', '울릴 효'),
+('嚆', '효'),
+('嚇', ' 꾸짖을 혁'),
+('嚇', '노할 혁'),
+('嚇', '놀라게 할 하'),
+('嚊', 'bi'),
+('嚊', 'pi'),
+('嚊', '비'),
+('嚊', '헐떡거릴 비'),
+('嚌', '맛볼 제'),
+('嚌', '제'),
+('嚍', 'chin'),
+('嚍', 'jin'),
+('嚍', '진'),
+('嚍', '화낼 진 '),
+('嚎', 'ho'),
+('嚎', '울부짖을 호'),
+('嚎', '호'),
+('嚏', 'ch''e'),
+('嚏', 'che'),
+('嚏', '재채기 할 체'),
+('嚏', '체'),
+('嚔', 'ch''e'),
+('嚔', 'che'),
+('嚔', '재채기 할 체'),
+('嚔', '체'),
+('嚕', 'ro'),
+('嚕', '로'),
+('嚕', '아까워할 로'),
+('嚗', ' 지팡이 던지는 소리 박 '),
+('嚗', 'bak'),
+('嚗', 'pak'),
+('嚗', '박'),
+('嚗', '역정낼 박'),
+('嚘', ' 탄식할 우 '),
+('嚘', 'u'),
+('嚘', '말 얼버무릴 우'),
+('嚘', '우'),
+('嚙', 'gyo'),
+('嚙', 'kyo'),
+('嚙', '교'),
+('嚙', '깨물 교'),
+('嚚', ' 말다툼할 은'),
+('嚚', ' 불칙하게 말할 은'),
+('嚚', '어리석을 은'),
+('嚚', '은'),
+('嚛', 'hak'),
+('嚛', '매울 학 '),
+('嚛', '학'),
+('嚜', ' 불만스러운 모양 묵'),
+('嚜', '거짓 묵'),
+('嚜', '거짓말할 매'),
+('嚜', '매'),
+('嚜', '묵'),
+('嚞', 'ch''ŏl'),
+('嚞', 'chel'),
+('嚞', 'cheol'),
+('嚞', '철'),
+('嚠', 'ryu'),
+('嚠', '瀏와 同字'),
+('嚠', '류'),
+('嚢', 'nang'),
+('嚢', '낭'),
+('嚥', ' 목구멍 연'),
+('嚥', 'yeon'),
+('嚥', 'yŏn'),
+('嚥', '연'),
+('嚥', '침 삼킬 연'),
+('嚦', 'ryeok'),
+('嚦', 'ryŏk'),
+('嚦', '력'),
+('嚦', '소리 력'),
+('嚧', 'ro'),
+('嚧', '로'),
+('嚧', '웃을 로 '),
+('嚨', 'rong'),
+('嚨', 'throat'),
+('嚨', '롱'),
+('嚨', '목구멍 롱'),
+('嚪', 'dam'),
+('嚪', 'tam'),
+('嚪', '담'),
+('嚪', '먹을 담 '),
+('嚫', 'ch''in'),
+('嚫', 'chin'),
+('嚫', '베풀 친'),
+('嚫', '친'),
+('嚬', 'bin'),
+('嚬', 'frown'),
+('嚬', 'pin'),
+('嚬', '빈'),
+('嚬', '찡그릴 빈'),
+('嚭', 'bi'),
+('嚭', 'pi'),
+('嚭', '비'),
+('嚭', '클 비'),
+('嚮', ' 누릴 향'),
+('嚮', ' 받을 향'),
+('嚮', ' 울릴 향'),
+('嚮', 'hyang'),
+('嚮', '향'),
+('嚮', '향할 향'),
+('嚱', ' 아아 경탄하는 소리 희'),
+('嚱', '소리낼 희'),
+('嚱', '희'),
+('嚲', 't''a'),
+('嚲', 'ta'),
+('嚲', '타'),
+('嚲', '휘늘어질 타'),
+('嚳', 'an urgent communication'),
+('嚳', 'mythical emperor'),
+('嚳', 'to inform quickly'),
+('嚳', '고할 고'),
+('嚳', '곡'),
+('嚴', ' 공경할 엄'),
+('嚴', ' 엄할 엄'),
+('嚴', 'eom'),
+('嚴', 'stern'),
+('嚴', 'strict, rigorous, rigid'),
+('嚴', 'ŏm'),
+('嚴', '굳셀 엄'),
+('嚴', '엄'),
+('嚶', 'aeng'),
+('嚶', '새 소리 앵'),
+('嚶', '앵'),
+('嚷', 'yang'),
+('嚷', '떠들 양'),
+('嚷', '양'),
+('嚻', 'hyo'),
+('嚻', '한가할 효'),
+('嚻', '효'),
+('嚼', 'chak'),
+('嚼', 'jak'),
+('嚼', '씹을 작'),
+('嚼', '작'),
+('嚾', '지껄일 환'),
+('嚾', '지껄일 훤 '),
+('囀', ' 후렴 전'),
+('囀', 'chŏn'),
+('囀', 'jeon'),
+('囀', '새 지저귈 전'),
+('囀', '전'),
+('囁', ' 입 다물 섭'),
+('囁', ' 중얼거릴 섭'),
+('囁', '말하려다 멈출 섭'),
+('囁', '섭'),
+('囁', '소곤거릴 엽'),
+('囁', '엽'),
+('囂', 'clamorous, noisy'),
+('囂', 'hyo'),
+('囂', '시끄럽다 효'),
+('囂', '효'),
+('囃', 'chap'),
+('囃', 'jap'),
+('囃', '잡'),
+('囃', '장단 잡을 잡'),
+('囅', '껄껄 웃을 철'),
+('囅', '웃는 모양 천'),
+('囆', 'ch''ae'),
+('囆', 'chae'),
+('囆', '사람 이름 채 '),
+('囆', '채'),
+('囈', ' 헛소리할 예'),
+('囈', '예'),
+('囈', '잠꼬대할 예'),
+('囉', 'ra'),
+('囉', '라'),
+('囉', '소리 읽힐 라'),
+('囊', 'bag'),
+('囊', 'pocket'),
+('囊', '낭'),
+('囊', '주머니'),
+('囊', '주머니 낭'),
+('囋', '기릴 찬'),
+('囋', '기릴 찰 '),
+('囍', 'Symbol of marriage between a man and a woman; double happiness'),
+('囍', 'hui'),
+('囍', 'hŭi'),
+('囍', '쌍희 희'),
+('囍', '희'),
+('囏', '艱의 古字 '),
+('囏', '간'),
+('囐', ' 나라이름 잘 '),
+('囐', 'chal'),
+('囐', 'jal'),
+('囐', '북소리 잘'),
+('囐', '잘'),
+('囑', 'ch''ok'),
+('囑', 'chok'),
+('囑', '부탁할 촉'),
+('囑', '촉'),
+('囒', 'ran'),
+('囒', '거짓말 할 란'),
+('囒', '란'),
+('囓', '齧과 同字'),
+('囗', '國의 古字'),
+('囗', '圍의 古字'),
+('囙', 'in'),
+('囙', '因의 俗字 '),
+('囙', '인'),
+('囚', ' 갇힐 수'),
+('囚', ' 묶일 수'),
+('囚', '가둘 수'),
+('囚', '수'),
+('四', 'Hanja form of 사 (“four”).'),
+('四', '넉'),
+('四', '넉 사'),
+('四', '사'),
+('囝', 'geon'),
+('囝', 'kŏn'),
+('囝', '건'),
+('囝', '아이 건'),
+('回', 'return to time'),
+('回', 'time, occurrence, occasion'),
+('回', '돌 회'),
+('回', '돌아오다'),
+('回', '돌아올'),
+('回', '회'),
+('囟', ' 정수리 신'),
+('囟', 'sin'),
+('囟', '숨구멍 신'),
+('囟', '신'),
+('因', 'Hanja form of 인 (“cause”).'),
+('因', '인'),
+('因', '인하다'),
+('因', '인할'),
+('因', '인할 인'),
+('団', '團의 略字'),
+('囤', 'don'),
+('囤', 'ton'),
+('囤', '돈'),
+('囤', '작을 곳집 돈'),
+('囦', 'yen'),
+('囦', 'yeon'),
+('囦', 'yŏn'),
+('囦', '물 깊을 연 '),
+('囦', '연'),
+('囧', 'Alternative form of 冏 (“Hanja form of 경 (“to shine; to be bright”).”)'),
+('囧', '冏과 同字 '),
+('囧', '경'),
+('囧', '빛나다'),
+('囧', '빛날'),
+('囩', 'un'),
+('囩', '돌릴 운 '),
+('囩', '운'),
+('囪', '囱과 同字'),
+('囪', '굴뚝 창'),
+('囫', 'hol'),
+('囫', '온전할 홀'),
+('囫', '홀'),
+('囬', 'hoe'),
+('囬', '回의 俗字'),
+('囬', '회'),
+('园', '둥글게 깎을 완'),
+('囮', '새 후릴 와'),
+('囮', '와'),
+('困', 'Hanja form of 경 (“suffer”).'),
+('困', 'Hanja form of 경 (“surround, besiege”).'),
+('困', '곤'),
+('困', '괴로울'),
+('困', '괴로울 곤'),
+('困', '괴롭다'),
+('囱', '굴뚝 총'),
+('囱', '천장 창'),
+('囲', 'surround, encircle, corral'),
+('囲', 'whip'),
+('囲', 'wi'),
+('囲', '圍의 略字'),
+('囲', '위'),
+('図', '圖의 俗字'),
+('囶', 'guk'),
+('囶', 'kuk'),
+('囶', '國의 古字 '),
+('囶', '국'),
+('囷', 'gyun'),
+('囷', 'kyun'),
+('囷', '균'),
+('囷', '둥근곳집 균'),
+('囹', 'ryeong'),
+('囹', 'ryŏng'),
+('囹', '령'),
+('囹', '옥 령'),
+('固', 'Hanja form of 고 (“solid”).'),
+('固', '고'),
+('固', '굳다'),
+('固', '굳을'),
+('固', '굳을 고'),
+('国', 'Alternative form of 國 (“Hanja form of 국 (“country; state; nation; land”).”)'),
+('国', '國의 略字'),
+('国', '국'),
+('国', '나라'),
+('囿', ' 고루할 유'),
+('囿', 'limit, constrain'),
+('囿', 'pen up'),
+('囿', 'yu'),
+('囿', '엔담 유'),
+('囿', '유'),
+('圀', 'guk'),
+('圀', 'kuk'),
+('圀', '國의 古字'),
+('圀', '국'),
+('圁', 'eun'),
+('圁', 'ŭn'),
+('圁', '물이름 은 '),
+('圁', '은'),
+('圂', 'hon'),
+('圂', '뒷간 혼'),
+('圂', '혼'),
+('圃', ' 곳 포'),
+('圃', ' 밭 갈 포'),
+('圃', ' 산이름 포'),
+('圃', 'p''o'),
+('圃', 'po'),
+('圃', '채마밭 포'),
+('圃', '포'),
+('圄', 'eo'),
+('圄', 'ŏ'),
+('圄', '가둘 어'),
+('圄', '어'),
+('圅', 'ham'),
+('圅', '담을 함'),
+('圅', '함'),
+('圇', 'ryun'),
+('圇', '륜'),
+('圇', '완전할 륜'),
+('圈', 'Hanja form of 권 (“area; region”).'),
+('圈', 'Hanja form of 권 (“circle; sphere”).'),
+('圈', 'Hanja form of 권 (“pen (for animals)”).'),
+('圈', '권'),
+('圈', '둥글 권'),
+('圈', '우리'),
+('圈', '우리#Etymology_2'),
+('圉', ' 변방 어'),
+('圉', 'eo'),
+('圉', 'ŏ'),
+('圉', '마부 어'),
+('圉', '어'),
+('圊', 'ch''ŏng'),
+('圊', 'cheong'),
+('圊', 'rest room'),
+('圊', '뒷간 청'),
+('圊', '청'),
+('國', 'Hanja form of 국 (“country; state; nation”).'),
+('國', 'Hanja form of 국 (“country; state; nation”). [affix]'),
+('國', '국'),
+('國', '나라'),
+('國', '나라 국'),
+('圌', 'ch''ŏn'),
+('圌', 'cheon'),
+('圌', '둥근 대그릇 천'),
+('圌', '천'),
+('圍', ' 에워 쌀 위'),
+('圍', ' 지킬 위'),
+('圍', ' 한아람 위'),
+('圍', '둘레 위'),
+('圍', '둘레, 에워쌀'),
+('圍', '위'),
+('圎', 'won'),
+('圎', 'wŏn'),
+('圎', '圓의 俗字'),
+('圎', '원'),
+('圏', 'gwon'),
+('圏', 'kwŏn'),
+('圏', '圈과 同字'),
+('圏', '권'),
+('園', ' 능 원'),
+('園', ' 울타리 원'),
+('園', 'Hanja form of 원 (“garden; orchard”).'),
+('園', '동산'),
+('園', '동산 원'),
+('園', '원'),
+('圓', ' 원만할 원'),
+('圓', ' 화폐의 단위 원'),
+('圓', 'Hanja form of 원 (“circle”).'),
+('圓', 'Hanja form of 원 (“won”).'),
+('圓', '둥글'),
+('圓', '둥글 원'),
+('圓', '둥글다'),
+('圓', '원'),
+('圕', 'Abbreviation of 圖書館: library'),
+('圕', '도서관'),
+('圕', '서'),
+('圖', 'Hanja form of 도 (“book”).'),
+('圖', 'Hanja form of 도 (“painting”).'),
+('圖', 'Hanja form of 도 (“stamp, seal”).'),
+('圖', '그림'),
+('圖', '그림 도'),
+('圖', '도'),
+('圗', 'do'),
+('圗', 'to'),
+('圗', '그림 도'),
+('圗', '도'),
+('團', 'Hanja form of 단 (“group”).'),
+('團', '단'),
+('團', '둥글'),
+('團', '둥글 단'),
+('團', '둥글다'),
+('圛', 'yeok'),
+('圛', 'yŏk'),
+('圛', '맴돌 역'),
+('圛', '역'),
+('圜', ' 둥글 원'),
+('圜', ' 제단 원'),
+('圜', '두를 환'),
+('圜', '옥담 원'),
+('圝', 'ran'),
+('圝', '둥글 란'),
+('圝', '란'),
+('土', ' 나라 토'),
+('土', ' 뭍 토'),
+('土', ' 뿌리 토'),
+('土', 'Hanja form of 토 (“Short for 토요일(土曜日) (toyoil, “Saturday”).”).'),
+('土', 'Hanja form of 토 (“earth; soil”).'),
+('土', 'Hanja form of 토 (“earth; soil”). [affix]'),
+('土', '뿌리 두'),
+('土', '토'),
+('土', '흙'),
+('土', '흙 토'),
+('圥', '록'),
+('圥', '버섯 록'),
+('圧', '壓의 略字'),
+('在', ' 곳 재'),
+('在', ' 살 재'),
+('在', ' 살필 재'),
+('在', 'Hanja form of 재 (“exist”).'),
+('在', '있을'),
+('在', '있을 재'),
+('在', '재'),
+('圩', 'concave'),
+('圩', 'dike'),
+('圩', '우'),
+('圬', 'trowel'),
+('圬', '오'),
+('圬', '흙손 오'),
+('圭', 'jade pointed at top'),
+('圭', '규'),
+('圭', '서옥 규'),
+('圮', '무너질 비'),
+('圮', '비'),
+('地', 'Hanja form of 지 (“earth; land; ground”).'),
+('地', 'Hanja form of 지 (“earth; land; ground”). [affix]'),
+('地', '땅'),
+('地', '땅 지'),
+('地', '지'),
+('圻', '경기 기'),
+('圻', '언덕 은'),
+('圾', '급'),
+('圾', '위태하다'),
+('圾', '위태할'),
+('圾', '위태할 급'),
+('址', '지'),
+('址', '터 지'),
+('坂', ' 산비탈 판'),
+('坂', ' 순나라 서울이름 판'),
+('坂', '언덕 판'),
+('坂', '판'),
+('均', 'Hanja form of 균 (“all, also”).'),
+('均', 'Hanja form of 균 (“equal, even, fair”).'),
+('均', '고르다'),
+('均', '고를'),
+('均', '고를 균'),
+('均', '균'),
+('坊', '동네 방'),
+('坊', '방'),
+('坌', 'bank of earth'),
+('坌', 'dust'),
+('坌', 'earth'),
+('坌', 'to bring together'),
+('坌', 'to dig'),
+('坌', '먼지 분'),
+('坌', '분'),
+('坍', '담'),
+('坍', '물이 언덕 찰 담'),
+('坎', ' 괘 이름 감'),
+('坎', ' 불우하여 뜻을 이루지 못할 감'),
+('坎', ' 작은 잔 감'),
+('坎', ' 험할 감'),
+('坎', 'crisis'),
+('坎', 'pit, hole'),
+('坎', 'snare, trap'),
+('坎', '감'),
+('坎', '구덩이 감'),
+('坏', '배'),
+('坏', '언덕 배'),
+('坐', 'Hanja form of 좌 (“to sit”).'),
+('坐', '앉다'),
+('坐', '앉을'),
+('坐', '앉을 좌'),
+('坐', '좌'),
+('坑', ' 구덩이 갱'),
+('坑', ' 묻을 갱'),
+('坑', 'Hanja form of 갱 (“pit”).'),
+('坑', '갱'),
+('坑', '구덩이'),
+('坑', '빠질 갱'),
+('坒', '비'),
+('坡', ' 제방 파'),
+('坡', 'p''a'),
+('坡', 'pa'),
+('坡', '언덕 파'),
+('坡', '파'),
+('坢', '반'),
+('坢', '편편하다'),
+('坢', '편편할'),
+('坤', 'Hanja form of 곤 (“earth”).'),
+('坤', 'queen'),
+('坤', '☷ or the eighth of the Eight Trigrams, (☰☱☲☳☴☵☶☷ or 팔괘 (八卦, palgwae)) that exactly match with the three-digit binary numbers, counting from 0 to 7. Four (0, 2, 5, 7) out of eight trigrams are placed in the four corners of the flag of South Korea.'),
+('坤', '곤'),
+('坤', '땅'),
+('坤', '땅 곤'),
+('坦', ' 넓을 탄'),
+('坦', ' 평평할 탄'),
+('坦', 'Hanja form of 탄 (“flat; level; even”).'),
+('坦', '너그러울 탄'),
+('坦', '탄'),
+('坦', '평평하다'),
+('坦', '평평할'),
+('坧', 'ch''ŏk'),
+('坧', 'cheok'),
+('坧', '기지 척 '),
+('坧', '척'),
+('坨', 'i'),
+('坨', '이'),
+('坩', 'earthenware, earthenware vessel'),
+('坩', 'gam'),
+('坩', 'kam'),
+('坩', '감'),
+('坩', '도가니 감'),
+('坪', ' 평평할 평'),
+('坪', 'Hanja form of 평 (“Pyeong, a traditional unit of measurement”).'),
+('坪', 'Hanja form of 평 (“plain; flatland; level ground; terrace”).'),
+('坪', '들'),
+('坪', '벌판 평'),
+('坪', '평'),
+('坫', ' 담 점'),
+('坫', ' 막을 점'),
+('坫', 'a saucer for a wine cup'),
+('坫', 'boundary'),
+('坫', 'limit'),
+('坫', '병풍 점'),
+('坫', '점'),
+('坮', 'dae'),
+('坮', 'tae'),
+('坮', '대'),
+('坮', '들 대'),
+('坯', 'bae'),
+('坯', 'pae'),
+('坯', '坏와 同字'),
+('坯', '배'),
+('坰', 'borderland, vicinity'),
+('坰', 'field'),
+('坰', 'gyeong'),
+('坰', 'kyŏng'),
+('坰', '경'),
+('坰', '들 경'),
+('坱', 'ang'),
+('坱', '앙'),
+('坱', '티끌 앙'),
+('坳', 'yo'),
+('坳', '凹와 同字'),
+('坳', '요'),
+('坵', 'gu'),
+('坵', 'ku'),
+('坵', '丘의 俗字'),
+('坵', '구'),
+('坷', 'ga'),
+('坷', 'ka'),
+('坷', '가'),
+('坷', '험할 가'),
+('坸', 'gu'),
+('坸', 'ku'),
+('坸', '垢와 同字 '),
+('坸', '구'),
+('坻', '모래섬 지'),
+('坼', ' 난산할 탁'),
+('坼', ' 싹 트일 탁'),
+('坼', ' 터질 탁'),
+('坼', 'open'),
+('坼', 'split'),
+('坼', 't''ak'),
+('坼', 'tak'),
+('坼', '찢을 탁'),
+('坼', '탁'),
+('垂', ' 거의 수'),
+('垂', ' 남길 수'),
+('垂', ' 변방 수'),
+('垂', '드리울 수'),
+('垂', '수'),
+('垈', 'dae'),
+('垈', 'lot (site of house, 집터)'),
+('垈', 'tae'),
+('垈', '대'),
+('垈', '터 대 '),
+('型', ' 본보기 형'),
+('型', '거푸집 형'),
+('型', '형'),
+('垌', 'a jar, a pot, a crock'),
+('垌', '동'),
+('垌', '동막이 (dongmagi, “throwing up levees”)'),
+('垌', '항아리'),
+('垌', '항아리 동 '),
+('垓', ' 계단 해'),
+('垓', ' 햇수 해'),
+('垓', 'border, boundary, frontier'),
+('垓', 'hae'),
+('垓', '땅 가장자리 해'),
+('垓', '해'),
+('垔', 'bury, get buried'),
+('垔', 'in'),
+('垔', 'ladder'),
+('垔', 'stop up, close, block'),
+('垔', '인'),
+('垕', 'hu'),
+('垕', '厚의 古字'),
+('垕', '후'),
+('垖', 'hill'),
+('垖', 'pile of earth'),
+('垖', 't''oe'),
+('垖', 'toe'),
+('垖', '퇴'),
+('垚', 'yo'),
+('垚', '요'),
+('垞', 't''a'),
+('垞', 'ta'),
+('垞', '타'),
+('垠', ' 경계 은'),
+('垠', ' 하늘 가장자리 은'),
+('垠', 'bank of stream or river'),
+('垠', 'boundary'),
+('垠', '언덕 은'),
+('垠', '은'),
+('垢', ' 더러울 구'),
+('垢', 'gu'),
+('垢', 'ku'),
+('垢', '구'),
+('垢', '때 구'),
+('垣', ' 별 이름 원'),
+('垣', ' 보호하는 사람 원'),
+('垣', '낮은 담 원'),
+('垤', 'chil'),
+('垤', 'jil'),
+('垤', '개밋둑 질'),
+('垤', '질'),
+('垩', 'seong'),
+('垩', 'sŏng'),
+('垩', '聖과 同字'),
+('垩', '성'),
+('垳', 'Used in borrowings of Japanese words.'),
+('垳', '일본(日本) 지명(地名)'),
+('垳', '행'),
+('垸', 'wan'),
+('垸', '완'),
+('垸', '회 섞어 바를 완 '),
+('垼', 'Alternative form of 坄.'),
+('垼', '굴뚝'),
+('垼', '역'),
+('垽', ' 찌끼 은'),
+('垽', 'eun'),
+('垽', 'ŭn'),
+('垽', '은'),
+('垽', '해감 은'),
+('埃', ' 속세 애'),
+('埃', 'fine dust, dirt'),
+('埃', '애'),
+('埃', '티끌'),
+('埃', '티끌 애'),
+('埆', '각'),
+('埆', '메마를 각'),
+('埇', ' 길 돋울 용'),
+('埇', '골목길 용'),
+('埇', '용'),
+('埈', 'chun'),
+('埈', 'jun'),
+('埈', '가파를 준'),
+('埈', '준'),
+('埉', 'hyeop'),
+('埉', 'hyŏp'),
+('埉', '협'),
+('埋', 'Hanja form of 매 (“bury, secrete, conceal”).'),
+('埋', '매'),
+('埋', '묻다'),
+('埋', '묻을'),
+('埋', '묻을 매'),
+('城', ' 서울 성'),
+('城', ' 재 성'),
+('城', 'Hanja form of 성 (“castle”).'),
+('城', '보루 성'),
+('城', '성'),
+('城', '재'),
+('埏', 'boundary'),
+('埏', 'yeon'),
+('埏', 'yŏn'),
+('埏', '땅 가장자리 연'),
+('埏', '연'),
+('埑', '밝을 철 '),
+('埑', '철'),
+('埒', 'ral'),
+('埒', '랄'),
+('埒', '바자울 랄'),
+('埜', 'Alternative form of 野 (“Hanja form of 야 (“field”).”)'),
+('埜', '들'),
+('埜', '들판 야'),
+('埜', '야'),
+('域', ' 범위 역'),
+('域', 'Hanja form of 역 (“region”).'),
+('域', '경계 역'),
+('域', '역'),
+('域', '지경'),
+('埠', 'bu'),
+('埠', 'pu'),
+('埠', '부'),
+('埠', '선창 부'),
+('埤', 'add'),
+('埤', 'attach'),
+('埤', 'bi'),
+('埤', 'increase'),
+('埤', 'low fence'),
+('埤', 'pi'),
+('埤', '더할 비'),
+('埤', '비'),
+('埦', 'a small cup'),
+('埦', 'wan'),
+('埦', '완'),
+('埭', 't''ae'),
+('埭', 'tae'),
+('埭', '보뚝 태'),
+('埭', '태'),
+('埰', '영지 채'),
+('埰', '채'),
+('埳', '감'),
+('埳', '구덩이 감'),
+('埴', ' 더듬어 걸을 식'),
+('埴', ' 흙 이길 식'),
+('埴', ' 흙 이길 치'),
+('埴', '찰진흙 식'),
+('埴', '찰진흙 치'),
+('埶', 'art'),
+('埶', 'grains'),
+('埶', 'plant'),
+('埶', 'se'),
+('埶', 'skill'),
+('埶', '세'),
+('執', 'hold in hand, keep, carry out'),
+('執', '잡을 집'),
+('執', '집'),
+('培', 'Hanja form of 배 (“bank up with dirt, raise, cultivate”).'),
+('培', 'Hanja form of 부 (“hill, mound”).'),
+('培', '무덤 부'),
+('培', '배'),
+('培', '부'),
+('培', '북돋을 배'),
+('培', '북을 돋울'),
+('培', '언덕'),
+('基', 'Hanja form of 기 (“foundation; basis”).'),
+('基', '기'),
+('基', '터'),
+('基', '터 기'),
+('埻', 'chun'),
+('埻', 'jun'),
+('埻', '과녘 준 '),
+('埻', '준'),
+('埼', 'gi'),
+('埼', 'ki'),
+('埼', '崎와 同字'),
+('埼', '기'),
+('埽', ' 그릴 소'),
+('埽', ' 언덕 소'),
+('埽', 'so'),
+('埽', '소'),
+('埽', '쓸 소'),
+('堀', '굴'),
+('堀', '굴뚝 굴'),
+('堂', 'Hanja form of 당 (“main room; room for a specific purpose”).'),
+('堂', '당'),
+('堂', '집'),
+('堂', '집 당'),
+('堃', 'gon'),
+('堃', 'kon'),
+('堃', '곤'),
+('堃', '따 곤'),
+('堅', ' 굳셀 견'),
+('堅', ' 반드시 견'),
+('堅', 'Hanja form of 경 (“hard, stiff”).'),
+('堅', '견'),
+('堅', '굳다'),
+('堅', '굳을'),
+('堅', '굳을 견'),
+('堆', ' 언덕 퇴'),
+('堆', 't''oe'),
+('堆', 'toe'),
+('堆', '퇴'),
+('堆', '흙무더기 퇴 놓을 퇴'),
+('堇', 'geun'),
+('堇', 'kŭn'),
+('堇', '근'),
+('堇', '노란진흙 근'),
+('堈', ' 밭 두둑 강'),
+('堈', 'gang'),
+('堈', 'kang'),
+('堈', '강'),
+('堈', '언덕 강'),
+('堉', 'yuk'),
+('堉', '기름진 땅 육'),
+('堉', '육'),
+('堊', 'ak'),
+('堊', '악'),
+('堊', '흰 흙 악'),
+('堋', 'bul'),
+('堋', 'pul'),
+('堋', '불'),
+('堕', ' 게으를 휴'),
+('堕', '墮와 同字'),
+('堕', '무너뜨릴 휴'),
+('堗', 'A chimney.'),
+('堗', 'A gudeul.'),
+('堗', '굴똑 돌 '),
+('堗', '굴뚝'),
+('堗', '돌'),
+('堙', 'in'),
+('堙', '막을 인'),
+('堙', '인'),
+('堝', 'gwa'),
+('堝', 'kwa'),
+('堝', '과'),
+('堝', '도가니 과'),
+('堞', 'ch''ŏp'),
+('堞', 'cheop'),
+('堞', '성가퀴 첩'),
+('堞', '첩'),
+('堠', 'high ground, heights'),
+('堠', 'hu'),
+('堠', 'watchtower'),
+('堠', '봉화대 후'),
+('堠', '후'),
+('堡', 'bo'),
+('堡', 'po'),
+('堡', '보'),
+('堡', '작은 성 보'),
+('堣', 'yu'),
+('堣', '유'),
+('堤', 'Hanja form of 제 (“dyke; embankment”).'),
+('堤', '둑'),
+('堤', '둑 제'),
+('堤', '제'),
+('堦', 'gye'),
+('堦', 'kye'),
+('堦', '계'),
+('堦', '섬돌 계'),
+('堧', 'yeon'),
+('堧', 'yŏn'),
+('堧', '빈 땅 연'),
+('堧', '연'),
+('堪', ' 맡을 감'),
+('堪', ' 산 모양이 기괴할 감'),
+('堪', ' 이길 감'),
+('堪', ' 하늘 감'),
+('堪', 'Hanja form of 감 (“capable”).'),
+('堪', 'Hanja form of 감 (“to endure; to bear”).'),
+('堪', '감'),
+('堪', '견디다'),
+('堪', '견딜'),
+('堪', '견딜 감'),
+('堯', ' 요임금 요'),
+('堯', 'yo'),
+('堯', '높을 요'),
+('堯', '요'),
+('堰', 'eon'),
+('堰', 'ŏn'),
+('堰', '방죽 언'),
+('堰', '언'),
+('報', 'Hanja form of 보 (“to announce; to inform; to report; to tell”).'),
+('報', 'Hanja form of 보 (“to repay; to requite; to recompense”).'),
+('報', '갚다'),
+('報', '갚을'),
+('報', '갚을 보'),
+('報', '나아갈 부'),
+('報', '보'),
+('報', '알리다'),
+('報', '알릴'),
+('場', 'Hanja form of 장 (“yard; place”).'),
+('場', '마당'),
+('場', '마당 장'),
+('場', '장'),
+('堵', 'do'),
+('堵', 'to'),
+('堵', '담 도'),
+('堵', '도'),
+('堺', 'gye'),
+('堺', 'kye'),
+('堺', '界와 同字'),
+('堺', '계'),
+('塀', 'byeong'),
+('塀', 'pyŏng'),
+('塀', '담 병'),
+('塀', '병'),
+('塉', 'ch''ŏk'),
+('塉', 'cheok'),
+('塉', '메마른 땅 척 '),
+('塉', '척'),
+('塊', 'Hanja form of 괴 (“piece; chunk; lump”).'),
+('塊', '괴'),
+('塊', '덩어리'),
+('塊', '흙덩이 괴'),
+('塋', 'yeong'),
+('塋', 'yŏng'),
+('塋', '무덤 영'),
+('塋', '영'),
+('塌', ' 떨어질 탑'),
+('塌', ' 초벌갈 탑'),
+('塌', 'collapse; break'),
+('塌', 'drop; hang down'),
+('塌', 'first ploughing of the rice field'),
+('塌', 'grind'),
+('塌', 't''ap'),
+('塌', 'tap'),
+('塌', '낮은 땅 탑'),
+('塌', '탑'),
+('塍', 'raised path between fields; dyke'),
+('塍', '밭두둑'),
+('塍', '승'),
+('塍', '증'),
+('塏', 'gae'),
+('塏', 'high and dry place'),
+('塏', 'highland'),
+('塏', 'kae'),
+('塏', '개'),
+('塏', '시원한 땅 개'),
+('塐', 'so'),
+('塐', '塑와 同字'),
+('塐', '소'),
+('塑', 'so'),
+('塑', '소'),
+('塑', '허수아비 소'),
+('塒', 'si'),
+('塒', '시'),
+('塒', '홰 시'),
+('塔', 'Hanja form of 탑 (“tower”).'),
+('塔', '탑'),
+('塔', '탑 탑'),
+('塕', '옹'),
+('塕', '티끌'),
+('塗', 'Hanja form of 도 (“paint”).'),
+('塗', 'Hanja form of 도 (“smear, daub, apply, spread”).'),
+('塗', '도'),
+('塗', '바르다'),
+('塗', '바를'),
+('塗', '바를 도'),
+('塘', 'dang'),
+('塘', 'tang'),
+('塘', '당'),
+('塘', '연못 당'),
+('塙', 'go'),
+('塙', 'ko'),
+('塙', '고'),
+('塙', '단단할 고'),
+('塚', 'cemetery'),
+('塚', 'ch''ong'),
+('塚', 'chong'),
+('塚', 'tomb, burial mound'),
+('塚', '冢의 俗字'),
+('塚', '총'),
+('塜', 'bong'),
+('塜', 'pong'),
+('塜', '먼지 일 봉'),
+('塜', '봉'),
+('塞', 'Hanja form of 새 (“fortress”).'),
+('塞', 'Hanja form of 새 (“frontier; border”).'),
+('塞', 'Hanja form of 색 (“block”).'),
+('塞', '막다'),
+('塞', '막을'),
+('塞', '막힐 색'),
+('塞', '변방 새'),
+('塞', '변방(邊方)'),
+('塞', '새'),
+('塞', '색'),
+('塡', ' 병들 전'),
+('塡', ' 북소리 전'),
+('塡', ' 순종할 전'),
+('塡', 'Alternative form of 鎭 (“Hanja form of 진 (“to quell”).”)'),
+('塡', 'Hanja form of 전 (“to fill up”).'),
+('塡', '누를 진'),
+('塡', '메우다'),
+('塡', '메울'),
+('塡', '메일 전'),
+('塡', '전'),
+('塡', '진'),
+('塡', '진정하다'),
+('塡', '진정할'),
+('塢', ' 마을 오'),
+('塢', 'o'),
+('塢', '산 언덕 오'),
+('塢', '오'),
+('塤', '壎과 同字'),
+('塤', '훈'),
+('塩', '鹽의 俗字'),
+('填', '塡의 俗字'),
+('填', '塼과 同字'),
+('塵', 'chin'),
+('塵', 'jin'),
+('塵', '띠끌 진'),
+('塵', '진'),
+('塹', 'ch''am'),
+('塹', 'cham'),
+('塹', '구덩이 참'),
+('塹', '참'),
+('塼', 'brick'),
+('塼', 'chŏn'),
+('塼', 'jeon'),
+('塼', '벽돌 전'),
+('塼', '전'),
+('塽', 'sang'),
+('塽', '높고밝은땅 상'),
+('塽', '상'),
+('塾', ' 기숙사 숙'),
+('塾', 'Hanja form of 숙 (“private school”).'),
+('塾', '글방'),
+('塾', '사랑방 숙'),
+('塾', '숙'),
+('墀', 'chi'),
+('墀', 'ji'),
+('墀', '계단 위의 공지 지'),
+('墀', '지'),
+('墁', 'man'),
+('墁', 'to coat'),
+('墁', 'trowel'),
+('墁', '만'),
+('墁', '흙손 만'),
+('境', 'Hanja form of 경 (“border; boundary; frontier”).'),
+('境', 'Hanja form of 경 (“condition; situation”).'),
+('境', 'Hanja form of 경 (“place; area; region”).'),
+('境', '경'),
+('境', '지경'),
+('境', '지경 경'),
+('墅', 'seo'),
+('墅', 'sŏ'),
+('墅', '농막 서'),
+('墅', '서'),
+('墉', ' 담벽 용'),
+('墉', '용'),
+('墉', '작은 성 용'),
+('墊', ' 축축할 점'),
+('墊', 'chŏm'),
+('墊', 'jeom'),
+('墊', '빠질 점'),
+('墊', '점'),
+('墍', 'gi'),
+('墍', 'ki'),
+('墍', '기'),
+('墍', '맥질할 기'),
+('墐', '근'),
+('墐', '진흙 근'),
+('墓', 'Hanja form of 모 (“grave; tomb”).'),
+('墓', 'Hanja form of 모 (“grave; tomb”). [noun]'),
+('墓', 'Hanja form of 묘 (“grave; tomb”).'),
+('墓', 'Hanja form of 묘 (“grave; tomb”). [affix]'),
+('墓', 'Hanja form of 묘 (“grave; tomb”). [noun]'),
+('墓', '모'),
+('墓', '묘'),
+('墓', '무덤'),
+('墓', '무덤 묘'),
+('増', 'chŭng'),
+('増', 'jeung'),
+('増', '더할 증'),
+('増', '증'),
+('墜', ' 잃을 추'),
+('墜', 'Hanja form of 추 (“fall”).'),
+('墜', '떨어지다'),
+('墜', '떨어질'),
+('墜', '떨어질 추'),
+('墜', '추'),
+('墝', ' 자갈 땅 요'),
+('墝', 'barren field'),
+('墝', 'yo'),
+('墝', '메마른 밭 요'),
+('墝', '요'),
+('增', 'Hanja form of 증 (“add to”).'),
+('增', 'Hanja form of 증 (“augment”).'),
+('增', 'Hanja form of 증 (“increase”).'),
+('增', '다하다'),
+('增', '더할'),
+('增', '불을 증'),
+('增', '증'),
+('墟', ' 장 허'),
+('墟', ' 큰 두덕 허'),
+('墟', 'heo'),
+('墟', 'hŏ'),
+('墟', '옛 터 허'),
+('墟', '허'),
+('墡', 'seon'),
+('墡', 'sŏn'),
+('墡', '백토 선 '),
+('墡', '선'),
+('墣', 'bok'),
+('墣', 'pok'),
+('墣', '복'),
+('墣', '흙덩이 복 '),
+('墦', 'beon'),
+('墦', 'pen'),
+('墦', 'pŏn'),
+('墦', 'tomb'),
+('墦', '번'),
+('墨', ' 형벌 이름 묵'),
+('墨', 'Hanja form of 묵 (“ink”).'),
+('墨', 'Hanja form of 미 (“sly, cunning”).'),
+('墨', '교활할'),
+('墨', '먹'),
+('墨', '먹 묵'),
+('墨', '묵'),
+('墨', '미'),
+('墩', 'don'),
+('墩', 'ton'),
+('墩', '돈'),
+('墩', '돈대 돈'),
+('墫', 'chun'),
+('墫', 'jun'),
+('墫', '樽·罇과 同字'),
+('墫', '준'),
+('墮', ' 상투 타'),
+('墮', ' 잃을 타'),
+('墮', 'Hanja form of 타 (“to fall; to degenerate”).'),
+('墮', '떨어지다'),
+('墮', '떨어질'),
+('墮', '떨어질 타'),
+('墮', '타'),
+('墰', 'dam'),
+('墰', 'tam'),
+('墰', '담'),
+('墰', '목긴 술병 담'),
+('墱', 'deung'),
+('墱', 'tŭng'),
+('墱', '등'),
+('墱', '자드락길 등 '),
+('墳', 'Hanja form of 분 (“bulge”).'),
+('墳', 'Hanja form of 분 (“grave, mound”).'),
+('墳', '무덤'),
+('墳', '무덤 분'),
+('墳', '분'),
+('墺', ' 물가 언덕 오'),
+('墺', ' 물가 언덕 옥'),
+('墺', '방 구들 오'),
+('墺', '방 구들 옥'),
+('墻', 'chang'),
+('墻', 'jang'),
+('墻', '牆과 同字'),
+('墻', '장'),
+('墾', 'gan'),
+('墾', 'kan'),
+('墾', '간'),
+('墾', '따비질할 간'),
+('壁', 'Hanja form of 벽 (“wall”).'),
+('壁', '벽'),
+('壁', '벽 벽'),
+('壃', 'gang'),
+('壃', 'kang'),
+('壃', '疆과 同字 '),
+('壃', '강'),
+('壅', ' 북돋울 옹'),
+('壅', 'Hanja form of 옹 (“to block; to obstruct”).'),
+('壅', '막다'),
+('壅', '막을'),
+('壅', '막을 옹'),
+('壅', '옹'),
+('壇', 'Hanja form of 제 (“altar”).'),
+('壇', '단'),
+('壇', '제단'),
+('壇', '제터 단'),
+('壌', '壤의 略字'),
+('壎', 'hun'),
+('壎', '진나팔 훈'),
+('壎', '훈'),
+('壑', 'hak'),
+('壑', '골짜기 학'),
+('壑', '학'),
+('壓', 'Hanja form of 압 (“pressure”).'),
+('壓', '누르다'),
+('壓', '누를'),
+('壓', '누를 압'),
+('壓', '압'),
+('壔', 'do'),
+('壔', 'fort'),
+('壔', 'mound'),
+('壔', 'to'),
+('壔', '도'),
+('壔', '작은 성 도'),
+('壕', 'ho'),
+('壕', '해자 호'),
+('壕', '호'),
+('壘', 'Hanja form of 루/누 (“(baseball) base”).'),
+('壘', 'Hanja form of 루/누 (“rampart”).'),
+('壘', '누'),
+('壘', '루'),
+('壘', '진'),
+('壘', '진 루'),
+('壙', 'gwang'),
+('壙', 'kwang'),
+('壙', '광'),
+('壙', '광 광'),
+('壚', 'black soil'),
+('壚', 'ro'),
+('壚', '로'),
+('壚', '흑토 로'),
+('壜', 'dam'),
+('壜', 'earthen jar or jug'),
+('壜', 'tam'),
+('壜', '담'),
+('壜', '술병 담'),
+('壝', ' 단 둘러쌓은 담 유'),
+('壝', 'yu'),
+('壝', '유'),
+('壝', '토담 유'),
+('壞', 'Hanja form of 괴 (“to break; to collapse”).'),
+('壞', '괴'),
+('壞', '무너지다'),
+('壞', '무너질'),
+('壞', '무너질 괴'),
+('壞', '혹 회'),
+('壟', 'rong'),
+('壟', '롱'),
+('壟', '언덕 롱'),
+('壤', ' 풍년들 양'),
+('壤', 'Hanja form of 양 (“soil”).'),
+('壤', '양'),
+('壤', '흙'),
+('壤', '흙 양'),
+('壩', ' 둑 파'),
+('壩', 'p''ae'),
+('壩', 'pa'),
+('壩', '방죽 파'),
+('壩', '패'),
+('士', 'Hanja form of 사 (“scholar; gentleman; soldier”).'),
+('士', '사'),
+('士', '선비'),
+('士', '선비 사'),
+('壬', 'im'),
+('壬', '아홉째천간 임'),
+('壬', '임'),
+('壭', 'Kwukyel form of 산 (san) < ᄉᆞᆫ (son)'),
+('壭', '구결자'),
+('壭', '산'),
+('壮', '씩씩할 장'),
+('壯', '씩씩할 장'),
+('壯', '장'),
+('声', '聲의 俗字'),
+('壱', '壹의 略字'),
+('売', '賣의 略字'),
+('壴', '북'),
+('壴', '주'),
+('壹', 'il'),
+('壹', '일'),
+('壹', '한 일'),
+('壺', ' 단지 호'),
+('壺', '병 호'),
+('壺', '호'),
+('壻', 'Hanja form of 서 (“son-in-law”).'),
+('壻', '사위'),
+('壻', '사위 서'),
+('壻', '서'),
+('壼', '2. Symbolism for a place to stay (=居)'),
+('壼', 'Court corridor (in a context for implying a woman''s domain such as in 閨壼, an inner chamber)'),
+('壼', 'Court corridor (in a context for implying a woman''s domain such as in 閨壼, an inner chamber)
+2. Symbolism for a place to stay (=居)'),
+('壼', 'gon'),
+('壼', '곤'),
+('壽', ' 나이 수'),
+('壽', ' 장수할 수'),
+('壽', ' 축복할 수'),
+('壽', '목숨 수'),
+('壽', '수'),
+('夅', 'gang'),
+('夅', 'kang'),
+('夅', '강'),
+('夆', 'bong'),
+('夆', 'chisel'),
+('夆', 'pong'),
+('夆', 'to guide, lead'),
+('夆', 'to pull'),
+('夆', '끌 봉'),
+('夆', '봉'),
+('夈', 'cay'),
+('夈', 'chae'),
+('夈', 'jae'),
+('夈', '재'),
+('変', '變의 俗字'),
+('変', '변'),
+('夋', 'chun'),
+('夋', 'jun'),
+('夋', '준'),
+('复', 'repeat'),
+('复', 'repeatedly'),
+('复', 'return'),
+('复', '다시'),
+('复', '복'),
+('复', '부'),
+('复', '회복하다'),
+('复', '회복할'),
+('夏', 'Hanja form of 하 (“summer”).'),
+('夏', '여름'),
+('夏', '여름 하'),
+('夏', '하'),
+('夐', ' 바라보는 모양 형'),
+('夐', '멀 형'),
+('夐', '형'),
+('夔', '기'),
+('夔', '조심할 기'),
+('夕', 'Hanja form of 사 (“A unit of capacity: one tenth of a 합 (合, hap), same as 작 (勺, jak)”).'),
+('夕', 'Hanja form of 석 (“evening”).'),
+('夕', '사'),
+('夕', '석'),
+('夕', '저녁'),
+('夕', '저녁 석'),
+('夕', '한 움큼'),
+('夕', '한 움큼 사'),
+('外', ' 다를 외'),
+('外', ' 아버지 외'),
+('外', ' 잃을 외'),
+('外', 'Hanja form of 외 (“outside; surface”).'),
+('外', 'Hanja form of 외 (“outside; surface”). [affix]'),
+('外', '바깥'),
+('外', '바깥 외'),
+('外', '외'),
+('夗', 'lie down'),
+('夗', '누워 뒹굴'),
+('夗', '원'),
+('夙', ' 빠를 숙'),
+('夙', ' 이미 숙'),
+('夙', ' 일찍 일어날 숙'),
+('夙', 'suk'),
+('夙', '숙'),
+('夙', '이를 숙'),
+('多', 'Hanja form of 다 (“many, a lot of”).'),
+('多', '다'),
+('多', '많다'),
+('多', '많을'),
+('多', '많을 다'),
+('夜', 'Hanja form of 야 (“night”).'),
+('夜', '밤'),
+('夜', '밤 야'),
+('夜', '야'),
+('夞', 'oet'),
+('夞', 'woys'),
+('夞', '욋'),
+('夢', 'Hanja form of 몽 (“dream”).'),
+('夢', 'Hanja form of 몽 (“dream”). [affix]'),
+('夢', '꿈'),
+('夢', '꿈 몽'),
+('夢', '몽'),
+('夤', 'in'),
+('夤', '인'),
+('夤', '조심할 인'),
+('夥', ' 동무 해'),
+('夥', 'Hanja form of 과.'),
+('夥', 'Hanja form of 화.'),
+('夥', '과'),
+('夥', '많다'),
+('夥', '많을'),
+('夥', '많을 과'),
+('夥', '많을 해'),
+('夥', '화'),
+('大', ' 굵을 태'),
+('大', 'Hanja form of 대 (“big, great; main, major”).'),
+('大', 'Hanja form of 대 (“big, great; main, major”). [affix]'),
+('大', 'Hanja form of 대 (“large; big”).'),
+('大', 'Hanja form of 대 (“large; big”). [noun]'),
+('大', '대'),
+('大', '크다'),
+('大', '큰'),
+('大', '큰 대'),
+('大', '클 태'),
+('天', 'Hanja form of 천 (“sky; heaven”).'),
+('天', '천'),
+('天', '하늘'),
+('天', '하늘 천'),
+('太', ' 굵을 태'),
+('太', ' 심할 태'),
+('太', ' 처음 태'),
+('太', ' 콩 태'),
+('太', 'Hanja form of 태 (“large; great; big; excessive”).'),
+('太', 'Hanja form of 태 (“large; great; big; excessive”). [affix]'),
+('太', 'Hanja form of 태 (“pollock”).'),
+('太', 'Hanja form of 태 (“pollock”). [affix]'),
+('太', 'Hanja form of 태 (“soybean”).'),
+('太', 'Hanja form of 태 (“soybean”). [affix]'),
+('太', 'Hanja form of 태.'),
+('太', 'Hanja form of 태. [surname]'),
+('太', '콩'),
+('太', '크다'),
+('太', '클'),
+('太', '클 태'),
+('太', '태'),
+('夫', 'Hanja form of 부 (“man; husband”).'),
+('夫', '부'),
+('夫', '사나이'),
+('夫', '지아비 부'),
+('夬', ' 괘 이름 쾌'),
+('夬', ' 나누어 정할 쾌'),
+('夬', 'k''wae'),
+('夬', 'kwae'),
+('夬', '결단할 쾌'),
+('夬', '쾌'),
+('夭', ' 끊어 죽일 요'),
+('夭', ' 무성할 요'),
+('夭', ' 뱃속에 든 아이 요'),
+('夭', ' 어릴 오'),
+('夭', ' 일찍 죽을 요'),
+('夭', ' 재앙 요'),
+('夭', '끊어 죽일 오'),
+('夭', '어여쁠 요'),
+('央', 'ang'),
+('央', '가운데 앙'),
+('央', '앙'),
+('夯', ' 다질 항'),
+('夯', 'hang'),
+('夯', '멜 항'),
+('夯', '항'),
+('失', ' 그르칠 실'),
+('失', 'Hanja form of 실 (“loss”).'),
+('失', '실'),
+('失', '잃다'),
+('失', '잃을'),
+('失', '잃을 실'),
+('夷', ' 괘 이름 이'),
+('夷', ' 기꺼울 이'),
+('夷', ' 베풀 이'),
+('夷', ' 상할 이'),
+('夷', ' 평평할 이'),
+('夷', 'Hanja form of 이 (“barbarian”).'),
+('夷', 'Hanja form of 이 (“flat; level; smooth”).'),
+('夷', '동쪽 오랑캐 이'),
+('夷', '오랑캐'),
+('夷', '이'),
+('夷', '평평하다'),
+('夷', '평평할'),
+('夸', '과'),
+('夸', '자랑할 과'),
+('夻', 'a cod'),
+('夻', '대구'),
+('夻', '대구 구'),
+('夻', '화'),
+('夾', ' 가까울 협'),
+('夾', ' 낄 협'),
+('夾', ' 성씨 협'),
+('夾', ' 잡을 협'),
+('夾', 'hyeop'),
+('夾', 'hyŏp'),
+('夾', '곁 협'),
+('夾', '협'),
+('奄', ' 가릴 엄'),
+('奄', ' 그칠 엄'),
+('奄', ' 오랠 엄'),
+('奄', 'eom'),
+('奄', 'ŏm'),
+('奄', '문득 엄'),
+('奄', '엄'),
+('奇', 'Hanja form of 기 (“strange, unusual, uncanny, occult”).'),
+('奇', '기'),
+('奇', '기이하다'),
+('奇', '기이할'),
+('奇', '기이할 기'),
+('奇', '의'),
+('奇', '의지하다'),
+('奇', '의지할'),
+('奈', 'Hanja form of 나 (“but; how”).'),
+('奈', 'Hanja form of 내 (“but; how”).'),
+('奈', '나'),
+('奈', '내'),
+('奈', '어찌'),
+('奈', '어찌 나'),
+('奈', '어찌 내'),
+('奉', 'Hanja form of 봉 (“to offer; to present”).'),
+('奉', '받들'),
+('奉', '받들 봉'),
+('奉', '봉'),
+('奌', 'Alternative form of 點 (“Hanja form of 점 (“point; dot; spot; speck”).”)'),
+('奌', '點의 略字'),
+('奌', '점'),
+('奎', 'star'),
+('奎', '규'),
+('奎', '별'),
+('奎', '별 규'),
+('奏', 'chu'),
+('奏', 'ju'),
+('奏', '아뢸 주'),
+('奏', '주'),
+('奐', 'be numerous, brilliant'),
+('奐', 'hwan'),
+('奐', '빛날 환'),
+('奐', '환'),
+('契', 'Hanja form of 결 (“to be assiduous; to work hard; to toil”).'),
+('契', 'Hanja form of 계 (“a Korean rotating savings and credit association”).'),
+('契', 'Hanja form of 계 (“contract, bond; deed; engrave”).'),
+('契', 'Hanja form of 글 (“a tribe name”).'),
+('契', 'Hanja form of 설 (“Xie (ancestor of the kings of the Shang dynasty)”).'),
+('契', 'Hanja form of 설 (“used in personal names”).'),
+('契', '결'),
+('契', '계'),
+('契', '글'),
+('契', '맺다'),
+('契', '맺을'),
+('契', '맺을 계'),
+('契', '부족 이름'),
+('契', '부족 이름 글'),
+('契', '사람 이름'),
+('契', '설'),
+('契', '애쓰다'),
+('契', '애쓸'),
+('奓', 'ch''a'),
+('奓', 'cha'),
+('奓', 'open'),
+('奓', '오만할 차'),
+('奓', '차'),
+('奔', 'Hanja form of 분 (“run fast, flee”).'),
+('奔', 'Hanja form of 분 (“run”).'),
+('奔', 'Hanja form of 분 (“rush about”).'),
+('奔', '달리다'),
+('奔', '달릴'),
+('奔', '달릴 분'),
+('奔', '분'),
+('奕', ' 근심할 혁'),
+('奕', ' 바둑 혁'),
+('奕', ' 빛날 혁'),
+('奕', ' 차례 혁'),
+('奕', ' 클 혁'),
+('奕', 'hyeok'),
+('奕', 'hyŏk'),
+('奕', '아름다울 혁'),
+('奕', '혁'),
+('套', ' 껍질 토'),
+('套', ' 땅이 굽어진 곳 토'),
+('套', ' 씌울 토'),
+('套', ' 캐캐묵을 토'),
+('套', 'Hanja form of 투 (“cover”).'),
+('套', '씌우다'),
+('套', '씌울'),
+('套', '장대할 토'),
+('套', '전례 투'),
+('套', '투'),
+('奘', 'chang'),
+('奘', 'jang'),
+('奘', '장'),
+('奘', '클 장'),
+('奚', ' 종 해'),
+('奚', ' 큰 배 해'),
+('奚', 'hae'),
+('奚', '어찌 해'),
+('奚', '해'),
+('奞', 'sun'),
+('奞', '순'),
+('奠', '멈추다'),
+('奠', '멈출'),
+('奠', '전'),
+('奠', '정'),
+('奠', '정(定)할'),
+('奠', '정하다'),
+('奠', '정할 전'),
+('奠', '제사(祭祀)'),
+('奢', 'sa'),
+('奢', '사'),
+('奢', '사치할 사'),
+('奥', 'Alternative form of 奧 (“Hanja form of 오 (“deep”).”).'),
+('奥', 'Alternative form of 燠.'),
+('奥', '奧와 同字'),
+('奥', '奧의 俗字'),
+('奥', '깊다'),
+('奥', '깊을'),
+('奥', '따뜻하다'),
+('奥', '따뜻할'),
+('奥', '오'),
+('奥', '욱'),
+('奧', ' 깊을 오'),
+('奧', ' 모퉁이 욱'),
+('奧', ' 비밀 오'),
+('奧', 'Alternative form of 燠 (“Hanja form of 옥 (“warmth”).”)'),
+('奧', 'Hanja form of 오 (“deep”).'),
+('奧', '깊다'),
+('奧', '깊을'),
+('奧', '따뜻하다'),
+('奧', '따뜻할'),
+('奧', '따스할 욱'),
+('奧', '속 오'),
+('奧', '오'),
+('奧', '옥'),
+('奨', 'chang'),
+('奨', 'jang'),
+('奨', '奬의 略字'),
+('奨', '장'),
+('奩', '렴'),
+('奩', '염'),
+('奩', '화장 상자'),
+('奩', '화장 상자 렴'),
+('奪', ' 깎을 탈'),
+('奪', ' 잃어버릴 탈'),
+('奪', ' 좁은 길 탈'),
+('奪', 't''al'),
+('奪', 'tal'),
+('奪', '빼앗을 탈'),
+('奪', '탈'),
+('奫', ' 물이 충충할 윤 '),
+('奫', 'yun'),
+('奫', '물 깊을 윤'),
+('奫', '윤'),
+('奬', '도울 장'),
+('奬', '장'),
+('奭', '성대할 학'),
+('奭', '클 석'),
+('奮', 'Hanja form of 분 (“arouse”).'),
+('奮', 'Hanja form of 분 (“strive, exert effort”).'),
+('奮', '떨치다'),
+('奮', '떨칠'),
+('奮', '떨칠 분'),
+('奮', '분'),
+('女', 'Hanja form of 녀/여 (“female; woman”).'),
+('女', 'Hanja form of 여 (“you”).'),
+('女', '계집'),
+('女', '계집 녀'),
+('女', '너'),
+('女', '녀'),
+('女', '여'),
+('奴', 'Hanja form of 노 (“slave, servant”).'),
+('奴', '노'),
+('奴', '종'),
+('奴', '종 노'),
+('奶', '내'),
+('奶', '젖'),
+('奶', '젖 내'),
+('奸', ' 간악할 간'),
+('奸', 'Hanja form of 간 (“evil, wicked”).'),
+('奸', '간'),
+('奸', '간사할'),
+('奸', '범할'),
+('奸', '범할 간'),
+('好', ' 옳을 호'),
+('好', 'ho'),
+('好', 'to like'),
+('好', '좋을 호'),
+('好', '호'),
+('妁', 'chak'),
+('妁', 'jak'),
+('妁', '작'),
+('妁', '중매 작'),
+('如', ' 만약 여'),
+('如', ' 어떠할 여'),
+('如', ' 이를 여'),
+('如', 'Hanja form of 여 (“to be like; as; as if; as though”).'),
+('如', '같다'),
+('如', '같을'),
+('如', '같을 여'),
+('如', '여'),
+('妃', 'Hanja form of 배 (“to marry”).'),
+('妃', 'Hanja form of 비 (“imperial concubine”).'),
+('妃', 'Hanja form of 비 (“wife; spouse”).'),
+('妃', '배'),
+('妃', '비'),
+('妃', '왕비'),
+('妃', '왕비 비'),
+('妃', '짝(配) 배'),
+('妃', '짝지을'),
+('妃', '짝짓다'),
+('妄', 'Hanja form of 망 (“absurd, foolish, reckless”).'),
+('妄', 'Hanja form of 망 (“false”).'),
+('妄', '망'),
+('妄', '허망하다'),
+('妄', '허망할'),
+('妄', '허망할 망'),
+('妊', 'Hanja form of 임 (“pregnancy”).'),
+('妊', '아이 밸'),
+('妊', '아이밸 임'),
+('妊', '임'),
+('妍', 'yeon'),
+('妍', 'yŏn'),
+('妍', '姸과 同字'),
+('妍', '연'),
+('妑', ' 갈래머리 파 '),
+('妑', 'p''a'),
+('妑', 'pa'),
+('妑', '새앙머리 파'),
+('妑', '파'),
+('妒', ' 강샘할 투'),
+('妒', ' 미워할 투'),
+('妒', ' 부러워할 투'),
+('妒', 'Alternative form of 妬 (“Hanja form of 투 (“to envy”).”)'),
+('妒', '샘내다'),
+('妒', '샘낼'),
+('妒', '투'),
+('妒', '투기할 투'),
+('妓', 'Hanja form of 기 (“prostitute”).'),
+('妓', '기'),
+('妓', '기생'),
+('妓', '기생 기'),
+('妖', ' 생긋생긋 웃는 모양 요'),
+('妖', '요'),
+('妖', '요괴로울 요'),
+('妗', '금'),
+('妗', '외숙모 금'),
+('妙', 'Hanja form of 묘 (“exquisite”).'),
+('妙', 'Hanja form of 묘 (“mysterious, subtle”).'),
+('妙', '묘'),
+('妙', '묘할'),
+('妙', '묘할 묘'),
+('妝', 'chang'),
+('妝', 'jang'),
+('妝', '꾸밀 장'),
+('妝', '장'),
+('妡', '아름다울'),
+('妡', '아름답다'),
+('妡', '흔'),
+('妣', 'bi'),
+('妣', 'pi'),
+('妣', '비'),
+('妣', '죽은 어미 비'),
+('妤', 'yeo'),
+('妤', 'yŏ'),
+('妤', '아름답다(=伃): beautiful, pretty, fair; handsome, good-looking'),
+('妤', '여'),
+('妥', ' 떨어질 타'),
+('妥', ' 일 없을 타'),
+('妥', ' 타협할 타'),
+('妥', '타'),
+('妥', '편안할 타'),
+('妧', ' 고울 완 '),
+('妧', 'wan'),
+('妧', '완'),
+('妧', '좋을 완'),
+('妨', 'Hanja form of 방 (“interfere with, impede, obstruct”).'),
+('妨', '방'),
+('妨', '방해하다'),
+('妨', '방해할'),
+('妨', '방해할 방'),
+('妬', ' 자식 없는 계집 투'),
+('妬', 'Hanja form of 투 (“to envy”).'),
+('妬', '샘내다'),
+('妬', '샘낼'),
+('妬', '투'),
+('妬', '투기할 투'),
+('妮', 'ni'),
+('妮', '니'),
+('妯', 'ch''uk'),
+('妯', 'chuk'),
+('妯', '동서 축'),
+('妯', '축'),
+('妲', 'dal'),
+('妲', 'tal'),
+('妲', '계집의 이름 달'),
+('妲', '달'),
+('妹', 'Hanja form of 매 (“younger sister”).'),
+('妹', '누이'),
+('妹', '누이 매'),
+('妹', '매'),
+('妻', 'Hanja form of 처 (“wife”).'),
+('妻', '아내'),
+('妻', '아내 처'),
+('妻', '처'),
+('妾', 'Hanja form of 첩 (“concubine”).'),
+('妾', '첩'),
+('妾', '첩 첩'),
+('姁', 'beautiful'),
+('姁', 'grandmother'),
+('姁', 'hu'),
+('姁', 'hwu'),
+('姁', '후'),
+('姃', '정'),
+('姆', 'child''s governess'),
+('姆', 'matron'),
+('姆', 'mo'),
+('姆', '모'),
+('姆', '여스승 모'),
+('姈', 'ryeong'),
+('姈', 'ryŏng'),
+('姈', '계집 슬기로울 령 '),
+('姈', '령'),
+('姉', '姊의 俗字'),
+('姊', 'Older sister'),
+('姊', '손윗누이'),
+('姊', '자'),
+('始', ' 별이름 시'),
+('始', ' 시작할 시'),
+('始', ' 처음 시'),
+('始', 'Hanja form of 시 (“beginning; start”).'),
+('始', 'Hanja form of 시 (“initial; first”).'),
+('始', '비로소'),
+('始', '비로소 시'),
+('始', '비롯하다'),
+('始', '비롯할'),
+('始', '시'),
+('姍', 'san'),
+('姍', '산'),
+('姍', '헐뜯을 산'),
+('姐', ' 교만할 저'),
+('姐', ' 아가씨 저'),
+('姐', '맏누이 저'),
+('姐', '저'),
+('姑', 'Hanja form of 고 (“mother-in-law”).'),
+('姑', '고'),
+('姑', '시어머니'),
+('姑', '시어미'),
+('姑', '시어미 고'),
+('姒', 'sa'),
+('姒', '동서 사'),
+('姒', '사'),
+('姓', ' 백성 성'),
+('姓', ' 아이 낳을 성'),
+('姓', 'Hanja form of 성 (“clan; family name”).'),
+('姓', '성'),
+('姓', '성씨'),
+('姓', '일가 성'),
+('委', ' 맘에 든든할 위'),
+('委', ' 버릴 위'),
+('委', ' 벼이삭 고개 숙일 위'),
+('委', 'Hanja form of 위 (“short for 위원회(委員會) (wiwonhoe, “committee”)”).'),
+('委', 'Hanja form of 위 (“short for 위원회(委員會) (wiwonhoe, “committee”)”). [noun]'),
+('委', 'Hanja form of 위 (“to entrust; to commission”).'),
+('委', 'Hanja form of 위 (“to entrust; to commission”). [verbal root; affix]'),
+('委', '맡기다'),
+('委', '맡길'),
+('委', '맡길 위'),
+('委', '위'),
+('姗', 'san'),
+('姗', '姍의 略字'),
+('姗', '산'),
+('姙', 'Alternative form of 妊 (“Hanja form of 임 (“pregnancy”).”)'),
+('姙', '妊과 同字'),
+('姙', '아이 밸'),
+('姙', '임'),
+('姚', ' 날랠 요'),
+('姚', ' 멀 요'),
+('姚', '어여쁠 요'),
+('姚', '예쁜'),
+('姚', '요'),
+('姜', ' 강할 강'),
+('姜', 'a surname'),
+('姜', 'gang'),
+('姜', 'kang'),
+('姜', '강'),
+('姜', '성씨 강'),
+('姝', 'a beautiful girl'),
+('姝', 'chu'),
+('姝', 'ju'),
+('姝', '예쁠 주'),
+('姝', '주'),
+('姞', 'gil'),
+('姞', 'kil'),
+('姞', '길'),
+('姞', '성 길'),
+('姢', 'yeon'),
+('姢', 'yŏn'),
+('姢', '娟과 同字'),
+('姢', '연'),
+('姣', 'gyo'),
+('姣', 'kyo'),
+('姣', 'lewdness'),
+('姣', 'lovely, charming'),
+('姣', '교'),
+('姣', '예쁠 교'),
+('姤', 'gu'),
+('姤', 'ku'),
+('姤', '구'),
+('姤', '만날 구'),
+('姥', 'maternal grandmother'),
+('姥', 'midwife'),
+('姥', '모'),
+('姥', '할미 모'),
+('姦', 'Hanja form of 간 (“evil; wicked; treacherous”).'),
+('姦', 'Hanja form of 간 (“to rape; to fornicate”).'),
+('姦', '간'),
+('姦', '간사할 간'),
+('姦', '간음하다'),
+('姦', '간음할'),
+('姨', ' 처이모 이'),
+('姨', 'i'),
+('姨', '이'),
+('姨', '이모 이'),
+('姪', ' 조카딸 절'),
+('姪', '조카 절'),
+('姪', '조카 질'),
+('姫', 'Hanja form of 희 (“Alternative form of 姬”).'),
+('姫', '姬의 俗字'),
+('姫', '희'),
+('姬', 'hui'),
+('姬', 'huy'),
+('姬', 'hŭi'),
+('姬', 'woman'),
+('姬', '성 희'),
+('姬', '희'),
+('姮', ' 달 부르는 다른 이름 항'),
+('姮', ' 달에 사는 미녀 항'),
+('姮', 'hang'),
+('姮', '항'),
+('姮', '항아 항'),
+('姱', 'gwa'),
+('姱', 'kwa'),
+('姱', '과'),
+('姱', '아름다울: beautiful'),
+('姸', ' 사랑스러울 연'),
+('姸', 'beautiful'),
+('姸', '고을 연'),
+('姸', '연'),
+('姺', '나라이름 신'),
+('姺', '신'),
+('姻', 'in'),
+('姻', '인'),
+('姻', '혼인 인'),
+('姿', 'cha'),
+('姿', 'ja'),
+('姿', '맵시 자'),
+('姿', '자'),
+('威', ' 두려울 위'),
+('威', 'dignity'),
+('威', '위'),
+('威', '위엄'),
+('威', '위엄 위'),
+('娃', ' 얼굴 아름다울 왜'),
+('娃', 'baby'),
+('娃', 'doll'),
+('娃', 'pretty girl'),
+('娃', '어여쁜 계집 왜'),
+('娃', '왜'),
+('娉', 'bing'),
+('娉', 'ping'),
+('娉', '빙'),
+('娉', '장가들다 빙'),
+('娑', 'dance, frolic'),
+('娑', 'lounge'),
+('娑', 'saunter'),
+('娑', '사'),
+('娑', '춤출 사'),
+('娓', ' 힘쓸 미'),
+('娓', 'mi'),
+('娓', '미'),
+('娓', '장황할 미'),
+('娘', 'Hanja form of 낭/랑 (“woman”).'),
+('娘', '낭'),
+('娘', '랑'),
+('娘', '아가씨'),
+('娘', '아가씨 낭'),
+('娙', ' 예쁠 형 '),
+('娙', 'hyeong'),
+('娙', 'hyŏng'),
+('娙', '여관 이름 형'),
+('娙', '형'),
+('娛', 'o'),
+('娛', '오'),
+('娛', '즐거울 오'),
+('娜', 'delicate'),
+('娜', 'elegant'),
+('娜', 'graceful'),
+('娜', 'na'),
+('娜', '나'),
+('娜', '아리따울 나'),
+('娟', ' 춤추는 모양 연'),
+('娟', 'Hanja form of 연 (“beautiful”).'),
+('娟', '어여쁠 연'),
+('娟', '연'),
+('娟', '예쁠'),
+('娠', ' 마부 신'),
+('娠', 'Hanja form of 신 (“with child”).'),
+('娠', '신'),
+('娠', '아이 밸'),
+('娠', '아이밸 신'),
+('娣', 'che'),
+('娣', 'je'),
+('娣', 'sister-in-law'),
+('娣', 'younger sister'),
+('娣', '여동생 제'),
+('娣', '제'),
+('娥', 'a'),
+('娥', '아'),
+('娥', '예쁠 아'),
+('娧', ' 더딜 태 '),
+('娧', 't''ae'),
+('娧', 'tae'),
+('娧', '기뻐할 태'),
+('娧', '태'),
+('娩', '만'),
+('娩', '해산할 만'),
+('娭', 'ae'),
+('娭', '계집종 애 '),
+('娭', '애'),
+('娯', 'o'),
+('娯', '娛와 同字'),
+('娯', '오'),
+('娵', ' 물고기 추'),
+('娵', ' 예쁜 여자 추'),
+('娵', 'ch''u'),
+('娵', 'chu'),
+('娵', '젊을 추'),
+('娵', '추'),
+('娶', ' 중개인 취'),
+('娶', '장가들 취'),
+('娶', '취'),
+('娼', 'Hanja form of 창 (“prostitute”).'),
+('娼', '몸 파는 여자 창'),
+('娼', '창'),
+('娼', '창녀'),
+('娿', 'a'),
+('娿', '아'),
+('娿', '아리따울 아 '),
+('婀', 'a'),
+('婀', 'be beautiful'),
+('婀', 'be graceful'),
+('婀', '娿와 同字'),
+('婀', '아'),
+('婁', 'a constellation'),
+('婁', 'to wear'),
+('婁', '루'),
+('婁', '별 이름 루'),
+('婆', ' 너풀너풀 춤출 파'),
+('婆', 'Hanja form of 파 (“old woman”).'),
+('婆', '파'),
+('婆', '할머니'),
+('婆', '할머니 파'),
+('婉', ' 예쁠 완'),
+('婉', ' 젊을 완'),
+('婉', '순할 완'),
+('婉', '완'),
+('婌', 'suk'),
+('婌', '궁녀 벼슬이름 숙 '),
+('婌', '숙'),
+('婌', '아름다울 숙 (고대한자), ENG: beautiful'),
+('婐', ' 단정할 와'),
+('婐', '와'),
+('婐', '정숙할 와'),
+('婕', 'beautiful'),
+('婕', 'ch''ŏp'),
+('婕', 'cheop'),
+('婕', 'imperial concubine'),
+('婕', '첩'),
+('婚', 'get married'),
+('婚', 'hon'),
+('婚', 'marriage, wedding'),
+('婚', '혼'),
+('婚', '혼인할 혼'),
+('婢', 'bi'),
+('婢', 'pi'),
+('婢', '비'),
+('婢', '여자종 비'),
+('婣', 'in'),
+('婣', '姻과 同字'),
+('婣', '인'),
+('婦', 'Hanja form of 부 (“married woman; lady; wife”).'),
+('婦', '며느리 부'),
+('婦', '부'),
+('婦', '아내'),
+('婧', 'chŏng'),
+('婧', 'jeong'),
+('婧', '정'),
+('婪', 'ram'),
+('婪', '람'),
+('婪', '탐할 람'),
+('婬', ' 새서방질할 음'),
+('婬', ' 음탕할 음'),
+('婬', 'eum'),
+('婬', 'ŭm'),
+('婬', '간통할 음'),
+('婬', '음'),
+('婲', 'hwa'),
+('婲', '예쁠 화 '),
+('婲', '화'),
+('婷', ' 쌀쌀할 정'),
+('婷', '아리따울 정'),
+('婷', '정'),
+('婾', 'enjoy'),
+('婾', 'steal'),
+('婾', 't''u'),
+('婾', 'tu'),
+('婾', '투'),
+('婿', 'seo'),
+('婿', 'sŏ'),
+('婿', '사위 서'),
+('婿', '서'),
+('媄', 'mi'),
+('媄', '미'),
+('媄', '빛 고울 미 '),
+('媍', 'bu'),
+('媍', 'pu'),
+('媍', 'pwu'),
+('媍', '婦와 同字 '),
+('媍', '부'),
+('媒', 'Hanja form of 매 (“medium”).'),
+('媒', '매'),
+('媒', '중매'),
+('媒', '중매 매'),
+('媓', 'hwang'),
+('媓', '어머니 황 '),
+('媓', '황'),
+('媕', '머뭇거릴 암'),
+('媕', '암'),
+('媚', ' 풍치가 아름다울 미'),
+('媚', 'attractive'),
+('媚', 'charming'),
+('媚', 'flatter'),
+('媚', '미'),
+('媚', '아첨할 미'),
+('媛', ' 여자 벼슬이름 원'),
+('媛', 'Hanja form of 원 (“a beauty”).'),
+('媛', '미녀'),
+('媛', '아리따운 여자 원'),
+('媛', '원'),
+('媟', 'act indecently'),
+('媟', 'lewd'),
+('媟', 'lust after'),
+('媟', 'seol'),
+('媟', 'sŏl'),
+('媟', '깔볼 설'),
+('媟', '설'),
+('媢', 'be jealous'),
+('媢', '강새암 할 모'),
+('媢', '모'),
+('媤', 'Hanja form of 사 (“used in girl names”).'),
+('媤', 'Hanja form of 시 (“husband''s family”).'),
+('媤', '사'),
+('媤', '시'),
+('媤', '시집'),
+('媤', '시집 시'),
+('媤', '여자의 자(字)'),
+('媧', '사람 이름 과'),
+('媧', '여자이름 왜'),
+('媪', ' 땅귀신 오'),
+('媪', 'o'),
+('媪', '오'),
+('媪', '할미 오'),
+('媱', 'yo'),
+('媱', '요'),
+('媳', '며느리 식'),
+('媳', '식'),
+('媵', 'give present'),
+('媵', 'maid who accompanies bride to her new home'),
+('媵', '보낼 잉'),
+('媵', '잉'),
+('媺', 'mi'),
+('媺', '미'),
+('媺', '착하고 아름다울 미'),
+('媻', 'ban'),
+('媻', 'pan'),
+('媻', '반'),
+('媻', '비틀거릴 반'),
+('媽', 'grandmother'),
+('媽', 'ma'),
+('媽', 'mother'),
+('媽', '마'),
+('媽', '어미 마'),
+('媾', '겹사돈 구'),
+('媾', '구'),
+('媿', 'goe'),
+('媿', 'koe'),
+('媿', '괴'),
+('媿', '창피줄 괴'),
+('嫁', 'Hanja form of 가 (“to marry; give a daughter in marriage”).'),
+('嫁', '가'),
+('嫁', '시집갈'),
+('嫁', '시집갈 가'),
+('嫂', 'Hanja form of 수 (“sister-in-law; elder brother''s wife”).'),
+('嫂', '수'),
+('嫂', '형수'),
+('嫂', '형수 수'),
+('嫄', '여자이름 원'),
+('嫄', '원'),
+('嫈', '앵'),
+('嫈', '예쁠 앵'),
+('嫉', 'Hanja form of 질 (“jealousy”).'),
+('嫉', '미워하다'),
+('嫉', '미워할'),
+('嫉', '미워할 질'),
+('嫉', '질'),
+('嫋', '가냘플 약'),
+('嫋', '날릴 뇨'),
+('嫌', ' 유쾌하지 않을 혐'),
+('嫌', ' 의심할 혐'),
+('嫌', 'Hanja form of 혐 (“to hate”).'),
+('嫌', 'Hanja form of 혐 (“to suspect”).'),
+('嫌', '싫어하다'),
+('嫌', '싫어할'),
+('嫌', '싫어할 혐'),
+('嫌', '혐'),
+('嫖', ' 날랠 표'),
+('嫖', ' 색에 빠질 표'),
+('嫖', 'p''yo'),
+('嫖', 'pyo'),
+('嫖', '가벼울 표'),
+('嫖', '표'),
+('嫗', 'gu'),
+('嫗', 'ku'),
+('嫗', 'old woman, hag'),
+('嫗', '구'),
+('嫗', '할미 구'),
+('嫙', 'seon'),
+('嫙', 'sŏn'),
+('嫙', '선'),
+('嫙', '예쁠 선 '),
+('嫚', 'beautiful (원)'),
+('嫚', 'belittle'),
+('嫚', 'despise'),
+('嫚', 'make dirty'),
+('嫚', '만'),
+('嫚', '업신여길 만'),
+('嫛', ' 갓난아이 예'),
+('嫛', 'ye'),
+('嫛', '예'),
+('嫛', '유순할 예'),
+('嫠', 'a widow'),
+('嫠', '과부 리'),
+('嫠', '리'),
+('嫡', ' 맏아들 적'),
+('嫡', 'Hanja form of 적 (“legitimate wife”).'),
+('嫡', '적'),
+('嫡', '정실 적'),
+('嫡', '정실(正室)'),
+('嫢', 'gyu'),
+('嫢', 'kyu'),
+('嫢', '가는 허리 규 '),
+('嫢', '규'),
+('嫣', 'beautiful, beauty'),
+('嫣', '생긋생긋 웃을 언'),
+('嫣', '언'),
+('嫥', 'chŏn'),
+('嫥', 'jeon'),
+('嫥', '아름다울 전 '),
+('嫥', '전'),
+('嫦', 'hang'),
+('嫦', '姮과 同字'),
+('嫦', '항'),
+('嫩', 'soft, tender, delicate'),
+('嫩', 'young'),
+('嫩', '눈'),
+('嫩', '어리다'),
+('嫩', '어릴'),
+('嫩', '언약할 눈'),
+('嫫', 'mo'),
+('嫫', '모'),
+('嫫', '예쁠 모 '),
+('嫮', ' 시기할 호 '),
+('嫮', '아름다울 호'),
+('嫮', '호'),
+('嫯', 'o'),
+('嫯', '업신여길 오 '),
+('嫯', '오'),
+('嫵', 'charming'),
+('嫵', 'gentle'),
+('嫵', 'mu'),
+('嫵', 'pretty'),
+('嫵', '무'),
+('嫶', '수척할 초 '),
+('嫶', '초'),
+('嫺', 'han'),
+('嫺', '우아할 한'),
+('嫺', '한'),
+('嫻', 'elegant'),
+('嫻', 'han'),
+('嫻', 'refined'),
+('嫻', 'skillful'),
+('嫻', '우아할 한'),
+('嫻', '한'),
+('嫽', 'ryo'),
+('嫽', '료'),
+('嫽', '외조모 료'),
+('嬀', 'gyu'),
+('嬀', 'kyu'),
+('嬀', '규'),
+('嬀', '성 규'),
+('嬅', 'hwa'),
+('嬅', '여자 이름 화 '),
+('嬅', '화'),
+('嬈', 'agony'),
+('嬈', 'charming'),
+('嬈', 'disarrange'),
+('嬈', 'dizzy'),
+('嬈', 'ridiculing'),
+('嬈', 'troublesome, suffer'),
+('嬈', 'weak'),
+('嬈', '예쁜체 할 요'),
+('嬈', '요'),
+('嬉', '즐길 희'),
+('嬉', '희'),
+('嬋', '고울 선'),
+('嬋', '선'),
+('嬌', 'gyo'),
+('嬌', 'kyo'),
+('嬌', '교'),
+('嬌', '아리따울 교'),
+('嬖', ' 벼슬이름 폐'),
+('嬖', ' 윗사람으로부터 사랑받을 폐'),
+('嬖', '사랑할 폐'),
+('嬖', '폐'),
+('嬙', 'lady'),
+('嬙', '궁녀 장'),
+('嬙', '장'),
+('嬛', 'hyeon'),
+('嬛', 'hyŏn'),
+('嬛', '산뜻할 현'),
+('嬛', '현'),
+('嬢', '孃의 略字'),
+('嬢', '양'),
+('嬥', '날씬할 조 '),
+('嬥', '조'),
+('嬨', 'cha'),
+('嬨', 'ja'),
+('嬨', '계집성품너그러고순할 자 '),
+('嬨', '자'),
+('嬪', 'Hanja form of 빈 (“court lady”).'),
+('嬪', '빈'),
+('嬪', '아내'),
+('嬪', '아내 빈'),
+('嬭', '내'),
+('嬭', '젖'),
+('嬭', '젖 내'),
+('嬰', ' 더할 영'),
+('嬰', ' 머리치장할 영'),
+('嬰', ' 물요괴 영'),
+('嬰', 'yeong'),
+('嬰', 'yŏng'),
+('嬰', '어릴 영'),
+('嬰', '영'),
+('嬲', 'nyo'),
+('嬲', 'to mess up'),
+('嬲', 'to taunt'),
+('嬲', '뇨'),
+('嬲', '샘낼 뇨'),
+('嬴', ' 가득할 영'),
+('嬴', ' 아름다울 영'),
+('嬴', ' 풀어낼 영'),
+('嬴', 'to be full of'),
+('嬴', 'yeong'),
+('嬴', 'yŏng'),
+('嬴', '성씨 영'),
+('嬴', '영'),
+('嬾', 'lazy'),
+('嬾', '게으를'),
+('嬾', '게으를 란'),
+('嬾', '난'),
+('嬿', '아름다울 연'),
+('嬿', '연'),
+('孀', 'widow'),
+('孀', '과부 상'),
+('孀', '상'),
+('孃', '계집아이 양'),
+('孃', '냥'),
+('孃', '아가씨'),
+('孃', '양'),
+('孅', 'seom'),
+('孅', 'sŏm'),
+('孅', '가늘 섬'),
+('孅', '섬'),
+('孌', '련'),
+('孌', '아름다울 련'),
+('子', 'Hanja form of 자 (“a noun suffix”).'),
+('子', 'Hanja form of 자 (“offspring”).'),
+('子', 'Hanja form of 자 (“son; man”).'),
+('子', '아들'),
+('子', '아들 자'),
+('子', '자'),
+('孑', ' 나머지 혈'),
+('孑', ' 창갈구리 혈'),
+('孑', '외로울 혈'),
+('孑', '혈'),
+('孔', 'Hanja form of 공 (“opening, hole”).'),
+('孔', '공'),
+('孔', '구멍'),
+('孔', '구멍 공'),
+('孕', 'ing'),
+('孕', '아이밸 잉'),
+('孕', '잉'),
+('孖', '쌍둥이 자'),
+('孖', '자'),
+('字', 'Hanja form of 자 (“letter; character”).'),
+('字', '글자'),
+('字', '글자 자'),
+('字', '자'),
+('存', 'to be living'),
+('存', 'to exist'),
+('存', 'to have'),
+('存', '있을 존'),
+('存', '존'),
+('孚', '미쁠 부'),
+('孚', '부'),
+('孛', '발'),
+('孛', '살별'),
+('孛', '안색 변할'),
+('孛', '패'),
+('孛', '혜성 패'),
+('孜', '자'),
+('孜', '힘쓸 자'),
+('孝', 'Hanja form of 효 (“filial piety”).'),
+('孝', '효'),
+('孝', '효도'),
+('孝', '효도 효'),
+('孟', 'Hanja form of 망 (“shrewd, impudent, difficult”).'),
+('孟', 'Hanja form of 맹 (“first in a series”).'),
+('孟', 'Hanja form of 맹 (“great, eminent”).'),
+('孟', '맏'),
+('孟', '맏 맹'),
+('孟', '망'),
+('孟', '맹'),
+('孟', '맹랑하다'),
+('孟', '맹랑할'),
+('孟', '맹랑할 망'),
+('孡', 't''ae'),
+('孡', 'tae'),
+('孡', '태'),
+('季', 'Hanja form of 계 (“end, final”).'),
+('季', 'Hanja form of 계 (“season”).'),
+('季', '계'),
+('季', '끝'),
+('季', '끝 계'),
+('孤', 'Hanja form of 고 (“solitude; orphan”).'),
+('孤', '고'),
+('孤', '외로울'),
+('孤', '외로울 고'),
+('孤', '외롭다'),
+('孥', 'no'),
+('孥', '노'),
+('孥', '자식 노'),
+('学', 'Alternative form of 學 (“Hanja form of 학 (“to learn”).”)'),
+('学', '學의 略字'),
+('学', '배우다'),
+('学', '배울'),
+('学', '학'),
+('孩', ' 방글방글 웃을 해'),
+('孩', 'hae'),
+('孩', '어린아이 해'),
+('孩', '해'),
+('孫', ' 순할 손'),
+('孫', ' 움 돋을 손'),
+('孫', ' 피할 손'),
+('孫', 'Hanja form of 손 (“a surname.”).'),
+('孫', 'Hanja form of 손 (“grandchild”).'),
+('孫', '손'),
+('孫', '손자'),
+('孫', '손자 손'),
+('孰', ' 살필 숙'),
+('孰', ' 어느 숙'),
+('孰', ' 익을 숙'),
+('孰', '누구 숙'),
+('孰', '숙'),
+('孱', '잔'),
+('孱', '잔약할 잔'),
+('孳', 'cha'),
+('孳', 'ja'),
+('孳', '자'),
+('孵', 'Hanja form of 부 (“hatch”).'),
+('孵', '부'),
+('孵', '알 깔'),
+('孵', '알 깔 부'),
+('孶', 'ca'),
+('孶', 'cha'),
+('孶', 'ja'),
+('孶', '부지런할 자'),
+('孶', '자'),
+('學', 'Hanja form of 학 (“-logy, -ics, -graphy, study of...”).'),
+('學', 'Hanja form of 학 (“-logy, -ics, -graphy, study of...”). [suffix]'),
+('學', 'Hanja form of 학 (“to learn, to study; to be taught”).'),
+('學', 'Hanja form of 학 (“to learn, to study; to be taught”). [affix]'),
+('學', '배우다'),
+('學', '배울'),
+('學', '배울 학'),
+('學', '학'),
+('孺', ' 딸릴 유'),
+('孺', ' 사모할 유'),
+('孺', '유'),
+('孺', '젖먹이 유'),
+('孼', ' 요물 얼'),
+('孼', 'Hanja form of 얼 (“evil”).'),
+('孼', 'Hanja form of 얼 (“son of a concubine”).'),
+('孼', '서자(庶子)'),
+('孼', '얼'),
+('孼', '첩자식 얼'),
+('孽', 'Alternative form of 孼 (“Hanja form of 얼 (“son of a concubine”).”)'),
+('孽', '孼과 同字'),
+('孽', '서자(庶子)'),
+('孽', '얼'),
+('孿', 'twins'),
+('孿', '산'),
+('孿', '쌍둥이 산'),
+('宀', '면'),
+('宀', '집'),
+('宁', ' 멈출 저'),
+('宁', 'chŏ'),
+('宁', 'garden'),
+('宁', 'jeo'),
+('宁', 'peace'),
+('宁', '저'),
+('宁', '조회 받는 곳 저'),
+('宂', ' 떠돌아 다닐 용'),
+('宂', ' 바쁠 용'),
+('宂', 'yong'),
+('宂', '번잡할 용'),
+('宂', '용'),
+('宅', ' 묘 구덩이 택'),
+('宅', ' 살 택'),
+('宅', ' 자리 택'),
+('宅', ' 정할 택'),
+('宅', 'Hanja form of 댁 (“a respectful term of address for someone of equal or lower status”).'),
+('宅', 'Hanja form of 댁 (“a respectful term of address for someone of equal or lower status”). [pronoun]'),
+('宅', 'Hanja form of 댁 (“residence”).'),
+('宅', 'Hanja form of 댁 (“residence”). [noun]'),
+('宅', 'Hanja form of 택 (“house; home”).'),
+('宅', 'Hanja form of 택 (“house; home”). [affix]'),
+('宅', '댁'),
+('宅', '집'),
+('宅', '집 댁'),
+('宅', '집 택'),
+('宅', '택'),
+('宇', ' 처마 기슭 우'),
+('宇', ' 하늘 우'),
+('宇', 'Hanja form of 우 (“house”).'),
+('宇', 'Hanja form of 우 (“whole world; universe”).'),
+('宇', '우'),
+('宇', '집'),
+('宇', '집 우'),
+('守', ' 기다릴 수'),
+('守', ' 보살필 수'),
+('守', ' 원님 수'),
+('守', 'Hanja form of 수 (“protection”).'),
+('守', '수'),
+('守', '지키다'),
+('守', '지킬'),
+('守', '지킬 수'),
+('安', ' 어찌 안'),
+('安', 'Hanja form of 안 (“peace, peacefulness”).'),
+('安', '안'),
+('安', '편안'),
+('安', '편안할 안'),
+('宊', 'ga'),
+('宊', 'ka'),
+('宊', '家와 同字 '),
+('宊', '가'),
+('宋', ' 성씨 송'),
+('宋', 'A surname'),
+('宋', 'referring to the Song Dynasty (宋朝)'),
+('宋', '송'),
+('宋', '송나라 송'),
+('完', ' 끝날 완'),
+('完', ' 지킬 완'),
+('完', 'Hanja form of 완 (“complete; whole”).'),
+('完', '완'),
+('完', '완전하다'),
+('完', '완전할'),
+('完', '완전할 완'),
+('宏', 'large; great'),
+('宏', '굉'),
+('宏', '클'),
+('宏', '클 굉'),
+('宓', 'bok'),
+('宓', 'comfortable'),
+('宓', 'pok'),
+('宓', 'secret'),
+('宓', 'silent'),
+('宓', '복'),
+('宓', '성 복'),
+('宕', ' 방탕할 탕'),
+('宕', ' 석수 탕'),
+('宕', 't''ang'),
+('宕', 'tang'),
+('宕', '골집 탕'),
+('宕', '탕'),
+('宖', '집 울릴 횡 '),
+('宖', '횡'),
+('宗', 'Hanja form of 종 (“fundamental knowledge”).'),
+('宗', 'Hanja form of 종 (“religion”).'),
+('宗', 'Hanja form of 종 (“root; ancestry”).'),
+('宗', '마루'),
+('宗', '마루 종'),
+('宗', '종'),
+('官', 'Hanja form of 관 (“government office”).'),
+('官', '관'),
+('官', '벼슬'),
+('官', '벼슬 관'),
+('宙', 'Hanja form of 주 (“house; ridgepole; pillar”).'),
+('宙', 'Hanja form of 주 (“infinite time in 우주 (宇宙, uju, “space”)”).'),
+('宙', '주'),
+('宙', '집'),
+('宙', '집 주'),
+('定', ' 고요할 정'),
+('定', ' 편안할 정'),
+('定', 'Hanja form of 정 (“decide, settle”).'),
+('定', 'Hanja form of 정 (“fix”).'),
+('定', '정'),
+('定', '정할'),
+('定', '정할 정'),
+('宛', ' 언덕 위 언덕 완'),
+('宛', '서쪽 나라이름 원'),
+('宛', '어슴푸레할 완'),
+('宜', ' 마땅할 의'),
+('宜', ' 유순할 의'),
+('宜', 'ui'),
+('宜', 'ŭi'),
+('宜', '옳을 의'),
+('宜', '의'),
+('宝', 'bo'),
+('宝', 'jewel'),
+('宝', 'po'),
+('宝', '寶의 俗字'),
+('宝', '보'),
+('実', '實의 略字'),
+('客', ' 나그네 객'),
+('客', ' 부칠 객'),
+('客', ' 지날 객'),
+('客', 'Hanja form of 객 (“guest”).'),
+('客', '객'),
+('客', '손'),
+('客', '손님 객'),
+('宣', 'To declare, to give, to bestow.'),
+('宣', 'seon'),
+('宣', 'sŏn'),
+('宣', '베풀 선'),
+('宣', '선'),
+('室', ' 아내 실'),
+('室', 'Hanja form of 실 (“room”).'),
+('室', '실'),
+('室', '집'),
+('室', '집 실'),
+('宥', ' 도울 유'),
+('宥', ' 죄 사할 유'),
+('宥', '너그러울 유'),
+('宥', '유'),
+('宦', 'Hanja form of 환 (“eunuch”).'),
+('宦', '벼슬'),
+('宦', '벼슬 환'),
+('宦', '환'),
+('宫', 'gung'),
+('宫', 'kung'),
+('宫', '宮의 略字'),
+('宫', '궁'),
+('宬', ' 도서실 성'),
+('宬', ' 창고 성'),
+('宬', '사고 성'),
+('宬', '성'),
+('宮', 'Hanja form of 궁 (“house”).'),
+('宮', 'Hanja form of 궁 (“palace”).'),
+('宮', '굴궐 궁'),
+('宮', '궁'),
+('宮', '대궐'),
+('宮', '집'),
+('宰', ' 다스릴 재'),
+('宰', ' 삶을 재'),
+('宰', ' 으뜸 재'),
+('宰', ' 재상 재'),
+('宰', 'Hanja form of 재 (“official (person)”).'),
+('宰', '재'),
+('宰', '재상'),
+('宰', '주관할 재'),
+('宱', '너그러울'),
+('宱', '너그럽다'),
+('宱', '자'),
+('害', ' 시기할 해'),
+('害', ' 죽일 해'),
+('害', 'Hanja form of 해 (“harm”).'),
+('害', '손해 할'),
+('害', '해'),
+('害', '해칠'),
+('害', '해할 해'),
+('宴', ' 편안할 연'),
+('宴', 'yeon'),
+('宴', 'yŏn'),
+('宴', '연'),
+('宴', '잔치할 연'),
+('宵', ' 벌레이름 소'),
+('宵', ' 작을 소'),
+('宵', 'Hanja form of 소 (“night”).'),
+('宵', '밤'),
+('宵', '밤 소'),
+('宵', '소'),
+('家', 'Alternative form of 姑 (“Hanja form of 고 (“woman”).”)'),
+('家', 'Hanja form of 가 (“home; family; household”).'),
+('家', '가'),
+('家', '고'),
+('家', '여자'),
+('家', '집'),
+('家', '집 가'),
+('宸', ' 대궐 신'),
+('宸', ' 처마 신'),
+('宸', 'sin'),
+('宸', '신'),
+('宸', '집 신'),
+('容', ' 감쌀 용'),
+('容', ' 용서할 용'),
+('容', 'Hanja form of 용 (“face; contain”).'),
+('容', '얼굴'),
+('容', '얼굴 용'),
+('容', '용'),
+('宺', '넓다'),
+('宺', '넓을'),
+('宺', '황'),
+('宻', 'mil'),
+('宻', '密의 俗字'),
+('宻', '밀'),
+('宼', '구'),
+('宼', '도적'),
+('宿', ' 머물 숙'),
+('宿', ' 성좌 수'),
+('宿', ' 지킬 숙'),
+('宿', 'Hanja form of 수 (“(Chinese astronomy) constellation; “mansion” of the zodiac”).'),
+('宿', 'Hanja form of 숙 (“sleep; lodging”).'),
+('宿', '떼별 수'),
+('宿', '별자리'),
+('宿', '수'),
+('宿', '숙'),
+('宿', '자다'),
+('宿', '잘'),
+('宿', '잘 숙'),
+('寀', '녹봉 채'),
+('寀', '채'),
+('寂', ' 쓸쓸할 적'),
+('寂', '고요할 적'),
+('寂', '적'),
+('寃', ' 굽힐 원'),
+('寃', ' 죄 없을 원'),
+('寃', 'Alternative form of 冤 (“grievance; injustice”)'),
+('寃', '원'),
+('寃', '원통할 원'),
+('寄', 'Hanja form of 기 (“rely on”).'),
+('寄', 'Hanja form of 기 (“send, transmit, mail”).'),
+('寄', '기'),
+('寄', '부치다'),
+('寄', '부칠'),
+('寄', '부칠 기'),
+('寅', ' 동북 이'),
+('寅', ' 범 이'),
+('寅', '공경할 이'),
+('寅', '세째지지 인'),
+('密', 'Hanja form of 밀 (“dense”).'),
+('密', '밀'),
+('密', '빽빽하다'),
+('密', '빽빽할'),
+('密', '빽빽할 밀'),
+('寇', 'Hanja form of 구 (“bandit; thief; invader”).'),
+('寇', '구'),
+('寇', '도둑'),
+('寇', '도둑 구'),
+('寊', '사람 이름'),
+('寊', '정'),
+('寋', '건'),
+('寋', '한갖 경쇠만 울릴'),
+('富', 'Hanja form of 부 (“wealth”).'),
+('富', '가멸 부'),
+('富', '부'),
+('富', '부유하다'),
+('富', '부유할'),
+('寐', 'mae'),
+('寐', '매'),
+('寐', '잠잘 매'),
+('寒', 'Hanja form of 한 (“cold; chilly”).'),
+('寒', '차다'),
+('寒', '찰'),
+('寒', '찰 한'),
+('寒', '한'),
+('寓', ' 부탁할 우'),
+('寓', ' 빙자할 우'),
+('寓', '살 우'),
+('寓', '우'),
+('寔', ' 뿐 식'),
+('寔', ' 참 식'),
+('寔', '식'),
+('寔', '이 식'),
+('寕', '녕'),
+('寕', '문안할 녕'),
+('寕', '영'),
+('寕', '편안하다'),
+('寕', '편안할'),
+('寖', ' 점점 침'),
+('寖', 'ch''im'),
+('寖', 'chim'),
+('寖', '젖을 침'),
+('寖', '침'),
+('寗', 'nyeong'),
+('寗', 'nyŏng'),
+('寗', '녕'),
+('寗', '편안할 녕'),
+('寘', ' 쉴 치'),
+('寘', ' 폐할 치'),
+('寘', '둘 치'),
+('寘', '치'),
+('寙', '게으르다'),
+('寙', '게으를'),
+('寙', '유'),
+('寛', 'gwan'),
+('寛', 'kwan'),
+('寛', '관'),
+('寛', '용서할 관'),
+('寜', 'nyeong'),
+('寜', 'nyŏng'),
+('寜', '녕'),
+('寜', '차라리 녕'),
+('寝', 'ch''im'),
+('寝', 'chim'),
+('寝', '寢과 同字'),
+('寝', '침'),
+('寞', 'Hanja form of 막 (“lonely; desolate”).'),
+('寞', '막'),
+('寞', '쓸쓸하다'),
+('寞', '쓸쓸할'),
+('寞', '쓸쓸할 막'),
+('察', 'ch''al'),
+('察', 'chal'),
+('察', '살필 찰'),
+('察', '찰'),
+('寠', '가난하다'),
+('寠', '가난할'),
+('寠', '구'),
+('寠', '누'),
+('寠', '루'),
+('寠', '좁고 비탈진 곳'),
+('寡', 'Hanja form of 과 (“widowed, alone”).'),
+('寡', '과'),
+('寡', '적다'),
+('寡', '적을'),
+('寡', '적을 과'),
+('寢', ' 못생길 침'),
+('寢', ' 방 침'),
+('寢', ' 쉴 침'),
+('寢', 'ch''im'),
+('寢', 'chim'),
+('寢', '잠잘 침'),
+('寢', '침'),
+('寣', '아이 울'),
+('寣', '홀'),
+('寤', ' 깨달을 오'),
+('寤', 'o'),
+('寤', '오'),
+('寤', '잠 깨어날 오'),
+('寥', 'ryo'),
+('寥', '료'),
+('寥', '쓸쓸할 료'),
+('實', 'Hanja form of 실 (“(literal) fruit”).'),
+('實', 'Hanja form of 실 (“reality; truth”).'),
+('實', '실'),
+('實', '열매'),
+('實', '열매 실'),
+('寧', 'Hanja form of 녕/영 (“peaceful”).'),
+('寧', 'Hanja form of 녕/영 (“repose, serenity peace”).'),
+('寧', '녕'),
+('寧', '영'),
+('寧', '편안하다'),
+('寧', '편안할'),
+('寧', '편안할 녕'),
+('寨', 'fort'),
+('寨', 'wooden fence'),
+('寨', '울짱 채'),
+('寨', '울짱, 목책'),
+('寨', '채'),
+('審', 'sim'),
+('審', '살필 심'),
+('審', '심'),
+('寫', 'Hanja form of 사 (“copy”).'),
+('寫', '베끼다'),
+('寫', '베낄'),
+('寫', '베낄 사'),
+('寫', '사'),
+('寬', 'Hanja form of 관 (“broad, wide, spacious”).'),
+('寬', '관'),
+('寬', '너그러울'),
+('寬', '너그러울 관'),
+('寬', '너그럽다'),
+('寭', ' 깨달을 혜 '),
+('寭', '밝히다'),
+('寭', '밝힐'),
+('寭', '밝힐 혜'),
+('寭', '혜'),
+('寮', 'ryo'),
+('寮', '료'),
+('寮', '벼슬아쳐 료'),
+('寯', '모이다'),
+('寯', '모일'),
+('寯', '모일 준 '),
+('寯', '준'),
+('寰', '기내 환'),
+('寰', '환'),
+('寳', 'bo'),
+('寳', 'po'),
+('寳', '寶의 俗字'),
+('寳', '보'),
+('寴', '친'),
+('寴', '친하다'),
+('寴', '친할'),
+('寵', ' 은혜 총'),
+('寵', ' 임금께 총애받을 총'),
+('寵', ' 첩 총'),
+('寵', '사랑할 총'),
+('寶', 'Hanja form of 보 (“treasure; riches; valuables; precious thing”).'),
+('寶', '보'),
+('寶', '보배'),
+('寶', '보배 보'),
+('寷', '큰 집'),
+('寷', '풍'),
+('寸', ' 마디 촌'),
+('寸', ' 조금 촌'),
+('寸', ' 헤아릴 촌'),
+('寸', 'Hanja form of 촌 (“degree of kinship”).'),
+('寸', 'Hanja form of 촌 (“degree of kinship”). [noun]'),
+('寸', '마디'),
+('寸', '촌'),
+('寸', '치 촌'),
+('对', '對의 略字'),
+('寺', 'Hanja form of 사 (“temple”).'),
+('寺', '내관 시'),
+('寺', '사'),
+('寺', '절'),
+('寺', '절 사'),
+('対', 'Hanja form of 대 (“Alternative form of 對”).'),
+('対', '對의 略字'),
+('対', '대'),
+('対', '대답하다'),
+('対', '대답할'),
+('寿', 'Alternative form of 壽'),
+('寿', '壽의 俗字'),
+('寿', '수'),
+('封', 'Hanja form of 봉 (“letter, envelope”).'),
+('封', 'Hanja form of 폄 (“close, hide, seal”).'),
+('封', '묻다'),
+('封', '묻을'),
+('封', '봉'),
+('封', '봉할'),
+('封', '봉할 봉'),
+('封', '폄'),
+('専', '專과 同字'),
+('尃', 'p''o'),
+('尃', 'pho'),
+('尃', 'po'),
+('尃', '포'),
+('射', 'Hanja form of 사 (“to shoot”).'),
+('射', 'Hanja form of 석 (“to hit with bow and arrow”).'),
+('射', 'Hanja form of 야 (“title of an official”).'),
+('射', 'Hanja form of 역 (“eleventh note of the Shí-èr-lǜ musical scale”).'),
+('射', '궁술 사'),
+('射', '맞히다'),
+('射', '맞힐'),
+('射', '맞힐 석'),
+('射', '벼슬 이름'),
+('射', '사'),
+('射', '석'),
+('射', '쏘다'),
+('射', '쏠'),
+('射', '야'),
+('射', '역'),
+('射', '음률(音律)'),
+('尅', 'geuk'),
+('尅', 'kŭk'),
+('尅', '剋과 同字'),
+('尅', '극'),
+('将', 'Alternative form of 將 (장 (jang))'),
+('将', '將의 略字'),
+('将', '장'),
+('将', '장수'),
+('將', 'Hanja form of 장 (“general; commander”).'),
+('將', 'Hanja form of 장 (“general; commander”). [noun]'),
+('將', 'Hanja form of 장 (“take, hold; from now on, in the future”).'),
+('將', 'Hanja form of 장 (“take, hold; from now on, in the future”). [affix]'),
+('將', '장'),
+('將', '장수(將帥)'),
+('將', '장차 장'),
+('將', '장차(將次)'),
+('專', 'cen'),
+('專', 'chŏn'),
+('專', 'jeon'),
+('專', '오로지 전'),
+('專', '전'),
+('尉', ' 눌릴 위'),
+('尉', '벼슬이름 위'),
+('尉', '성씨 울'),
+('尊', 'Hanja form of 존 (“respect; revere; veneration”).'),
+('尊', '樽·罇과 同字'),
+('尊', '높다'),
+('尊', '높을'),
+('尊', '존'),
+('尊', '존귀할 존'),
+('尋', '심'),
+('尋', '찾을 심'),
+('尌', '세우다'),
+('尌', '세울'),
+('尌', '세울 주'),
+('尌', '수'),
+('對', 'Hanja form of 대 (“opponent; counterpart; opposite; contrasting”).'),
+('對', 'Hanja form of 대 (“opponent; counterpart; opposite; contrasting”). [affix]'),
+('對', 'Hanja form of 대 (“pair; contrasting pair”).'),
+('對', 'Hanja form of 대 (“pair; contrasting pair”). [noun; affix]'),
+('對', 'Hanja form of 대 (“to answer; to reply”).'),
+('對', 'Hanja form of 대 (“to answer; to reply”). [affix]'),
+('對', 'Hanja form of 대 (“to be about; to concern”).'),
+('對', 'Hanja form of 대 (“to be about; to concern”). [verbal root; prefix; affix]'),
+('對', 'Hanja form of 대 (“to face; to confront”).'),
+('對', 'Hanja form of 대 (“to face; to confront”). [verbal root; prefix; affix]'),
+('對', 'Hanja form of 대 (“versus”).'),
+('對', 'Hanja form of 대 (“versus”). [noun]'),
+('對', '대'),
+('對', '대하다'),
+('對', '대할'),
+('對', '마주볼 대'),
+('導', 'Hanja form of 도 (“to direct, guide, lead, conduct”).'),
+('導', '도'),
+('導', '이끌 도'),
+('導', '인도하다'),
+('導', '인도할'),
+('小', ' 어릴 소'),
+('小', ' 적게 여길 소'),
+('小', ' 적을 소'),
+('小', ' 좁을 소'),
+('小', 'Hanja form of 소 (“smallness; small things”).'),
+('小', '소'),
+('小', '작다'),
+('小', '작을'),
+('小', '작을 소'),
+('少', ' 멸시할 소'),
+('少', ' 잠깐 소'),
+('少', ' 젊을 소'),
+('少', ' 조금 소'),
+('少', 'Hanja form of 소 (“(to be) little; (to be) few”).'),
+('少', '소'),
+('少', '적다'),
+('少', '적을'),
+('少', '적을 소'),
+('尒', '너'),
+('尒', '이'),
+('尓', '爾와 同字'),
+('尓', '너'),
+('尓', '이'),
+('尔', '爾와 同字'),
+('尔', '너'),
+('尔', '이'),
+('尖', 'ch''ŏm'),
+('尖', 'cheom'),
+('尖', '뾰족할 첨'),
+('尖', '첨'),
+('尗', '숙'),
+('尙', 'sang'),
+('尙', '상'),
+('尙', '오히려 상'),
+('尚', 'sang'),
+('尚', '尙의 略字'),
+('尚', '상'),
+('尟', '尠과 同字'),
+('尟', '선'),
+('尠', 'rarely'),
+('尠', 'seldom'),
+('尠', 'very few'),
+('尠', '선'),
+('尠', '적을 선'),
+('尡', 'The meaning of this term is uncertain.'),
+('尡', '곤'),
+('尣', '왕'),
+('尣', '절름발이'),
+('尤', ' 더욱 우'),
+('尤', ' 탓할 우'),
+('尤', 'especially, particularly'),
+('尤', 'u'),
+('尤', '가장 우'),
+('尤', '우'),
+('尦', '다리 꼬일'),
+('尦', '료'),
+('尦', '요'),
+('尦', '표'),
+('尨', 'Hanja form of 방 (“shaggy haired dog”).'),
+('尨', 'Hanja form of 봉 (“untidy”).'),
+('尨', '방'),
+('尨', '봉'),
+('尨', '삽살개'),
+('尨', '삽살개 방'),
+('尨', '어지럽다'),
+('尨', '어지로울'),
+('尨', '헝클어진 모양 봉'),
+('尫', ' 천상바라기 왕'),
+('尫', ' 파리할 왕'),
+('尫', 'wang'),
+('尫', '왕'),
+('尫', '절름발이 왕'),
+('尭', '堯와 同字'),
+('尮', '절름발이'),
+('尮', '타'),
+('尯', '고달플'),
+('尯', '귀'),
+('尯', '위'),
+('就', ' 가령 취'),
+('就', ' 곧 취'),
+('就', ' 능할 취'),
+('就', ' 이룰 취'),
+('就', ' 저자 취'),
+('就', '좇을 취'),
+('就', '취'),
+('尸', ' 주검 시'),
+('尸', '시'),
+('尸', '시동 시'),
+('尹', ' 믿을 윤'),
+('尹', ' 바를 윤'),
+('尹', ' 벼슬이름 윤'),
+('尹', 'a surname'),
+('尹', '다스릴 윤'),
+('尹', '성'),
+('尹', '윤'),
+('尺', 'Hanja form of 자 (“Korean foot (30.3cm)”).'),
+('尺', 'Hanja form of 자 (“ruler; straightedge”).'),
+('尺', '자 척'),
+('尺', '척'),
+('尻', 'buttocks, sacrum'),
+('尻', 'end of spine'),
+('尻', 'go'),
+('尻', 'ko'),
+('尻', '고'),
+('尻', '꽁무니 고'),
+('尼', ' 그칠 닐'),
+('尼', ' 정할 닐'),
+('尼', 'Hanja form of 니/이 (“a Buddhist nun”).'),
+('尼', '가까울 닐'),
+('尼', '니'),
+('尼', '여승'),
+('尼', '여승 니'),
+('尼', '이'),
+('尽', 'deplete'),
+('尽', 'exhaust, use up'),
+('尽', '盡의 俗字'),
+('尽', '진'),
+('尾', ' 등 미'),
+('尾', 'Hanja form of 미 (“end, stern”).'),
+('尾', 'Hanja form of 미 (“tail, extremity”).'),
+('尾', '꼬리'),
+('尾', '꼬리 미'),
+('尾', '미'),
+('尿', 'Hanja form of 뇨/요 (“urine”).'),
+('尿', '뇨'),
+('尿', '오줌'),
+('尿', '오줌 뇨'),
+('尿', '요'),
+('局', 'Hanja form of 국 (“bureau; department”).'),
+('局', '국'),
+('局', '부분 국'),
+('局', '판'),
+('屁', 'bi'),
+('屁', 'pi'),
+('屁', '방귀 비'),
+('屁', '비'),
+('居', ' 곳 거'),
+('居', ' 놓을 거'),
+('居', ' 쌓을 거'),
+('居', ' 앉을 거'),
+('居', '살 거'),
+('居', '어조사 기'),
+('屆', 'gye'),
+('屆', 'kye'),
+('屆', '계'),
+('屆', '이를 계'),
+('屇', 'cen'),
+('屇', 'chŏn'),
+('屇', 'jeon'),
+('屇', '구멍 전'),
+('屇', '전'),
+('屈', 'Hanja form of 굴 (“bend, flex”).'),
+('屈', 'Hanja form of 굴 (“bent, crooked”).'),
+('屈', 'Hanja form of 굴 (“crouch”).'),
+('屈', '굴'),
+('屈', '굽다'),
+('屈', '굽을'),
+('屈', '굽을 굴'),
+('屋', ' 거북 덮개 옥'),
+('屋', ' 지붕 옥'),
+('屋', 'Hanja form of 옥 (“house”).'),
+('屋', '옥'),
+('屋', '집'),
+('屋', '집 옥'),
+('屍', ' 송장 시'),
+('屍', 'si'),
+('屍', '시'),
+('屍', '주검 시'),
+('屎', 'Hanja form of 시 (“feces, excrement”).'),
+('屎', '끙끙거리다'),
+('屎', '끙끙거릴'),
+('屎', '똥'),
+('屎', '똥 시'),
+('屎', '시'),
+('屎', '히'),
+('屏', '屛의 俗字'),
+('屏', '병'),
+('屏', '병풍'),
+('屐', 'geuk'),
+('屐', 'kŭk'),
+('屐', '극'),
+('屐', '나막신 극'),
+('屑', 'sel'),
+('屑', 'seol'),
+('屑', 'sŏl'),
+('屑', '가루 설'),
+('屑', '설'),
+('展', ' 살필 전'),
+('展', ' 열릴 전'),
+('展', 'Hanja form of 전 (“to unfold, spread”).'),
+('展', '전'),
+('展', '펼'),
+('展', '펼치다'),
+('展', '펼칠 전'),
+('屛', 'Hanja form of 병 (“byeongpung, folding screen”).'),
+('屛', 'Hanja form of 병 (“dismiss, suppress, banish, reject”).'),
+('屛', '물리치다'),
+('屛', '물리칠'),
+('屛', '병'),
+('屛', '병풍'),
+('屛', '병풍 병'),
+('属', '屬의 俗字'),
+('屠', '잡을 도'),
+('屠', '흉노왕의 이름 저'),
+('屢', 'Hanja form of 루/누 (“many”).'),
+('屢', 'Hanja form of 루/누 (“often, frequently, again and again”).'),
+('屢', '누'),
+('屢', '루'),
+('屢', '창'),
+('屢', '창 루'),
+('層', ' 거듭 층'),
+('層', ' 층층대 층'),
+('層', '겹 층'),
+('層', '층'),
+('履', 'Hanja form of 리/이 (“footwear, shoes”).'),
+('履', 'Hanja form of 리/이 (“tread”).'),
+('履', 'Hanja form of 리/이 (“walk on”).'),
+('履', '리'),
+('履', '신'),
+('履', '신 리'),
+('履', '이'),
+('屨', 'footwear'),
+('屨', 'frequently'),
+('屨', 'often'),
+('屨', 'sandal'),
+('屨', 'straw sandals'),
+('屨', 'wear'),
+('屨', '구'),
+('屨', '삼으로 짠 신 구'),
+('屩', 'straw sandals'),
+('屩', '교'),
+('屫', '갹'),
+('屫', '교'),
+('屫', '짚신'),
+('屬', ' 거느릴 속'),
+('屬', ' 닿을 촉'),
+('屬', ' 모을 촉'),
+('屬', ' 부탁할 촉'),
+('屬', ' 붙이 속'),
+('屬', ' 조심할 촉'),
+('屬', ' 좇을 속'),
+('屬', 'Hanja form of 속 (“(biology, taxonomy) a genus”).'),
+('屬', 'Hanja form of 속 (“class; category; type”).'),
+('屬', 'Hanja form of 촉 (“to join; to combine”).'),
+('屬', '무리'),
+('屬', '무리 속'),
+('屬', '속'),
+('屬', '이을'),
+('屬', '이을 촉'),
+('屬', '잇다'),
+('屬', '촉'),
+('屮', 'Hanja form of 좌 (“left hand”).'),
+('屮', 'Hanja form of 철 (“to sprout”).'),
+('屮', 'Hanja form of 초 (“old grass radical (no. 45)”).'),
+('屮', '싹나다'),
+('屮', '싹날'),
+('屮', '왼손'),
+('屮', '좌'),
+('屮', '철'),
+('屮', '초'),
+('屮', '풀'),
+('屯', 'Hanja form of 둔 (“camp”).'),
+('屯', 'Hanja form of 둔 (“station (troops), quarter”).'),
+('屯', 'Hanja form of 둔 (“village, hamlet”).'),
+('屯', 'Hanja form of 준 (“challenging, difficult”).'),
+('屯', '둔'),
+('屯', '어려울'),
+('屯', '어려울 준'),
+('屯', '어렵다'),
+('屯', '준'),
+('屯', '진치다'),
+('屯', '진칠'),
+('屯', '진칠 둔'),
+('屰', 'counteract'),
+('屰', 'yek'),
+('屰', 'yeok'),
+('屰', 'yŏk'),
+('屰', '역'),
+('山', 'Hanja form of 산 (“mountain”).'),
+('山', '메/뫼'),
+('山', '뫼 산'),
+('山', '산'),
+('屲', '바르다'),
+('屲', '바를'),
+('屲', '정'),
+('屳', '날 선 '),
+('屳', '선'),
+('屳', '신선'),
+('屹', 'heul'),
+('屹', 'hŭl'),
+('屹', '산 우뚝솟을 흘'),
+('屹', '흘'),
+('屺', 'bare hill'),
+('屺', 'gi'),
+('屺', 'ki'),
+('屺', '기'),
+('屺', '민둥산 기'),
+('岀', '出과 同字'),
+('岀', '出와 同字'),
+('岃', '산 높은 모양'),
+('岃', '인'),
+('岆', '땅 이름'),
+('岆', '요'),
+('岇', '산 높은 모양'),
+('岇', '앙'),
+('岈', 'ha'),
+('岈', '하'),
+('岈', '휑뎅그렁할 하 '),
+('岊', 'chŏl'),
+('岊', 'jeol'),
+('岊', '산 모퉁이 우뚝 내밀 절'),
+('岊', '절'),
+('岋', '압'),
+('岋', '흔들리다'),
+('岋', '흔들릴'),
+('岌', '급'),
+('岌', '높다'),
+('岌', '높을'),
+('岌', '높을 급'),
+('岏', 'wan'),
+('岏', '산 뾰족할 완 '),
+('岏', '완'),
+('岐', '갈림길 기'),
+('岐', '기'),
+('岑', ' 낭떠러지 음'),
+('岑', ' 언덕 음'),
+('岑', '기슭 음'),
+('岑', '봉우리 잠'),
+('岒', 'gyeom'),
+('岒', 'kyŏm'),
+('岒', '겸'),
+('岒', '산 작고 높을 겸 '),
+('岔', '갈림길 차'),
+('岔', '차'),
+('岝', 'chak'),
+('岝', 'jak'),
+('岝', '산 높을 작'),
+('岝', '작'),
+('岠', '거'),
+('岠', '큰 산'),
+('岡', ' 산등성이 강'),
+('岡', 'Hanja form of 강 (“hill”).'),
+('岡', '강'),
+('岡', '멧동 강'),
+('岡', '산등성이'),
+('岣', 'gu'),
+('岣', 'ku'),
+('岣', '구'),
+('岣', '산이름 구'),
+('岥', '비탈지다'),
+('岥', '비탈질'),
+('岥', '산 비알질 파 '),
+('岥', '파'),
+('岦', '립'),
+('岦', '산 우뚝할'),
+('岦', '산 우뚝할 립 '),
+('岦', '입'),
+('岧', '산이 높을 초'),
+('岧', '초'),
+('岨', '돌산에 흙 덮일 저'),
+('岨', '저'),
+('岩', '巖의 俗字'),
+('岩', '암'),
+('岪', '불'),
+('岪', '산길 불 '),
+('岫', 'su'),
+('岫', '바위구멍 수'),
+('岫', '수'),
+('岬', ' 줄이 느런할 갑'),
+('岬', 'cape, headland'),
+('岬', 'gap'),
+('岬', 'kap'),
+('岬', '갑'),
+('岬', '산 허구리 갑'),
+('岭', '고개'),
+('岭', '령'),
+('岭', '산 이름 령'),
+('岭', '영'),
+('岮', '비탈'),
+('岮', '타'),
+('岱', 'dae'),
+('岱', 'tae'),
+('岱', '대'),
+('岱', '태산 대'),
+('岳', 'ak'),
+('岳', '악'),
+('岳', '큰 산 악'),
+('岵', 'ho'),
+('岵', 'mountain'),
+('岵', 'vegetation'),
+('岵', '산 호'),
+('岵', '호'),
+('岷', '민'),
+('岷', '산이름 민'),
+('岸', 'Hanja form of 안 (“bank”).'),
+('岸', '물가 언덕 안'),
+('岸', '안'),
+('岸', '언덕'),
+('岺', '고개'),
+('岺', '령'),
+('岺', '영'),
+('岺', '재 령'),
+('岾', 'Hanja form of 재 (“a mountain pass”).'),
+('岾', 'Hanja form of 점 (“jeom”).'),
+('岾', '고개'),
+('岾', '고개 점'),
+('岾', '땅 이름'),
+('岾', '재'),
+('岾', '점'),
+('峀', 'su'),
+('峀', '岫와 同字'),
+('峀', '수'),
+('峋', '순'),
+('峋', '후미질 순'),
+('峒', 'Hanja form of 동 (“mountain cave”).'),
+('峒', '동'),
+('峒', '산이름 동'),
+('峙', ' 갖출 치'),
+('峙', ' 쌓을 치'),
+('峙', '산이 우뚝 솟을 치'),
+('峙', '치'),
+('峠', 'sang'),
+('峠', '고개 상'),
+('峠', '상'),
+('峣', '嶢와 同字'),
+('峨', '산 높을 아'),
+('峨', '아'),
+('峩', '峨와 同字'),
+('峩', '아'),
+('峭', '가파를 초'),
+('峭', '초'),
+('峯', 'Hanja form of 봉 (“peak, summit”).'),
+('峯', '봉'),
+('峯', '봉우리'),
+('峯', '봉우리 봉'),
+('峰', 'bong'),
+('峰', 'pong'),
+('峰', '峯과 同字'),
+('峰', '봉'),
+('峱', 'no'),
+('峱', '노'),
+('峱', '산이름 노'),
+('峴', ' 산이름 현'),
+('峴', 'hyeon'),
+('峴', 'hyŏn'),
+('峴', '고개 현'),
+('峴', '현'),
+('島', 'Hanja form of 도 (“island”).'),
+('島', '도'),
+('島', '섬'),
+('島', '섬 도'),
+('峻', 'chun'),
+('峻', 'jun'),
+('峻', '높을 준'),
+('峻', '준'),
+('峽', ' 산이름 협'),
+('峽', 'hyeop'),
+('峽', 'hyŏp'),
+('峽', '물 낀 두메 협'),
+('峽', '협'),
+('崄', '嶮과 同字'),
+('崆', '공'),
+('崆', '산이름 공'),
+('崇', ' 공경할 숭'),
+('崇', ' 마칠 숭'),
+('崇', ' 산이름 숭'),
+('崇', 'sung'),
+('崇', '높을 숭'),
+('崇', '숭'),
+('崍', 'rae'),
+('崍', '래'),
+('崍', '산 이름 래'),
+('崎', 'gi'),
+('崎', 'ki'),
+('崎', '기'),
+('崎', '험할 기'),
+('崐', 'gon'),
+('崐', 'kon'),
+('崐', '곤'),
+('崐', '곤륜산 곤'),
+('崑', 'gon'),
+('崑', 'kon'),
+('崑', '곤'),
+('崑', '산이름 곤'),
+('崒', 'ch''we'),
+('崒', 'chwe'),
+('崒', 'chwey'),
+('崒', 'lofty and dangerous'),
+('崒', 'rocky peaks'),
+('崒', '췌'),
+('崔', ' 높고 가파를 최'),
+('崔', ' 성씨 최'),
+('崔', 'A surname'),
+('崔', 'High'),
+('崔', 'ch''oe'),
+('崔', 'choe'),
+('崔', 'choy'),
+('崔', '산 우뚝할 최'),
+('崔', '최'),
+('崕', 'ae'),
+('崕', '崖와 同字'),
+('崕', '애'),
+('崖', 'Hanja form of 애 (“cliff; precipice; precipitous”).'),
+('崖', '낭떠러지 애'),
+('崖', '벼랑'),
+('崖', '애'),
+('崖', '언덕 의'),
+('崗', 'Alternative form of 岡 (“Hanja form of 강 (“hill”).”)'),
+('崗', '岡의 俗字'),
+('崗', '강'),
+('崗', '산등성이'),
+('崙', '륜'),
+('崙', '산 이름 륜'),
+('崛', '굴'),
+('崛', '산 높을 굴'),
+('崟', ' 산 높을 음'),
+('崟', '멧부리 음'),
+('崟', '음'),
+('崢', ' 산 높을 쟁'),
+('崢', 'chaeng'),
+('崢', 'jaeng'),
+('崢', '가파를 쟁'),
+('崢', '쟁'),
+('崤', 'hyo'),
+('崤', '산 이름 효'),
+('崤', '효'),
+('崦', '엄'),
+('崦', '해 지는 산 이름 엄'),
+('崧', ' 산 웅장할 숭'),
+('崧', ' 산이름 숭'),
+('崧', '산 불끈 솟을 숭'),
+('崧', '숭'),
+('崩', 'bung'),
+('崩', 'pung'),
+('崩', '무너질 붕'),
+('崩', '붕'),
+('崴', '평평치 아니할 외'),
+('崽', ' 저 재'),
+('崽', '자식 재'),
+('崽', '재'),
+('嵁', '감'),
+('嵁', '산 험할 감'),
+('嵂', 'lyul'),
+('嵂', 'ryul'),
+('嵂', '가파를 률'),
+('嵂', '률'),
+('嵋', 'mi'),
+('嵋', '미'),
+('嵋', '산이름 미'),
+('嵌', ' 곁굴 감'),
+('嵌', ' 깊은 산 감'),
+('嵌', '감'),
+('嵌', '깊은 골 감'),
+('嵎', 'yu'),
+('嵎', '유'),
+('嵐', 'Hanja form of 람, 남 (“mountain mist”).'),
+('嵐', '남'),
+('嵐', '남기 람'),
+('嵐', '남기(嵐氣)'),
+('嵐', '람'),
+('嵒', 'am'),
+('嵒', '嵓과 同字'),
+('嵒', '암'),
+('嵓', ' 가파를 암 '),
+('嵓', 'am'),
+('嵓', '바위 암'),
+('嵓', '암'),
+('嵔', ' 산 높을 외 '),
+('嵔', 'oe'),
+('嵔', 'oy'),
+('嵔', '산이름 외'),
+('嵔', '외'),
+('嵚', '산 솟을 금'),
+('嵡', '산 이름'),
+('嵡', '옹'),
+('嵩', ' 산이름 숭'),
+('嵩', '높을 숭'),
+('嵩', '숭'),
+('嵬', ' 산 울뚝질뚝할 외'),
+('嵬', '산 뾰족할 외'),
+('嵬', '외'),
+('嵯', '산 울뚝질뚝할 치'),
+('嵯', '우뚝 솟을 차'),
+('嵱', 'yong'),
+('嵱', '봉우리 쭝굿쭝굿할 용 '),
+('嵱', '용'),
+('嵷', '높낮이-가 같지 않을'),
+('嵷', '산 우뚝할'),
+('嵷', '송'),
+('嵷', '종'),
+('嵾', 'ch''am'),
+('嵾', 'cham'),
+('嵾', 'uneven'),
+('嵾', '참'),
+('嶁', '누'),
+('嶁', '루'),
+('嶁', '봉우리'),
+('嶁', '봉우리 루'),
+('嶂', '높고 가파른 산 장'),
+('嶂', '장'),
+('嶃', 'ch''am'),
+('嶃', 'cham'),
+('嶃', 'high (mountain)'),
+('嶃', '참'),
+('嶄', '높을 참'),
+('嶄', '참'),
+('嶇', '구'),
+('嶇', '산험준할 구'),
+('嶋', 'do'),
+('嶋', 'to'),
+('嶋', '도'),
+('嶋', '섬 도'),
+('嶒', '산 높고 험할 증'),
+('嶒', '증'),
+('嶔', '금'),
+('嶔', '높고 험할 금'),
+('嶕', 'ch''o'),
+('嶕', 'cho'),
+('嶕', '높을 초 '),
+('嶕', '초'),
+('嶙', 'deep'),
+('嶙', 'precipitous'),
+('嶙', 'soar'),
+('嶙', 'upright, staunch'),
+('嶙', '가파를 린'),
+('嶙', '린'),
+('嶝', 'deung'),
+('嶝', 'tŭng'),
+('嶝', '고개 등'),
+('嶝', '등'),
+('嶠', 'alp'),
+('嶠', 'ghat'),
+('嶠', 'high'),
+('嶠', 'high mountain'),
+('嶠', '교'),
+('嶠', '뾰족하게 높을 교'),
+('嶢', '높을 요'),
+('嶢', '요'),
+('嶧', 'yeok'),
+('嶧', 'yŏk'),
+('嶧', '역'),
+('嶧', '연달아 있는 산 역'),
+('嶪', 'eop'),
+('嶪', 'ŏp'),
+('嶪', '산이 높고 웅장할 업 '),
+('嶪', '업'),
+('嶫', 'eop'),
+('嶫', 'ŏp'),
+('嶫', '嶪과 同字 '),
+('嶫', '업'),
+('嶮', '산 가파를 험'),
+('嶮', '험'),
+('嶰', ' 골 이름 해'),
+('嶰', 'hae'),
+('嶰', '골짝 사이 해'),
+('嶰', '해'),
+('嶶', '미'),
+('嶶', '산 이름'),
+('嶷', 'ui'),
+('嶷', 'ŭi'),
+('嶷', '산이름 의'),
+('嶷', '의'),
+('嶸', '산 높을 영'),
+('嶸', '영'),
+('嶺', 'Hanja form of 령/영 (“mountain ridge”).'),
+('嶺', '령'),
+('嶺', '영'),
+('嶺', '재'),
+('嶺', '재 령'),
+('嶼', 'Hanja form of 서 (“island”).'),
+('嶼', '서'),
+('嶼', '섬'),
+('嶼', '섬 서'),
+('嶽', '높은 산 악'),
+('嶽', '악'),
+('巉', '가파를 참'),
+('巉', '참'),
+('巋', 'gyu'),
+('巋', 'kyu'),
+('巋', '규'),
+('巋', '높고 험준할 규'),
+('巍', ' 높고 튼 모양 외'),
+('巍', 'Hanja form of 외 (“high and large”).'),
+('巍', '넢고 클'),
+('巍', '높고 크다'),
+('巍', '높을 외'),
+('巍', '외'),
+('巑', '높이 솟을 찬 '),
+('巑', '찬'),
+('巒', '만'),
+('巒', '뫼 만'),
+('巓', 'chŏn'),
+('巓', 'jeon'),
+('巓', '산 꼭대기 전'),
+('巓', '전'),
+('巔', 'chŏn'),
+('巔', 'jeon'),
+('巔', '巓과 同字'),
+('巔', '전'),
+('巖', ' 험할 암'),
+('巖', '높을 엄'),
+('巖', '바위 암'),
+('巘', '봉우리'),
+('巘', '헌'),
+('巚', ' 시루봉 헌 '),
+('巚', '봉우리'),
+('巚', '봉우리 헌'),
+('巚', '헌'),
+('川', 'Hanja form of 천 (“river; stream”).'),
+('川', 'Hanja form of 천 (“river; stream”). [affix]'),
+('川', '내'),
+('川', '내 천'),
+('川', '천'),
+('州', 'Hanja form of 주 (“state; province”).'),
+('州', '고을'),
+('州', '고을 주'),
+('州', '주'),
+('巠', 'gyeong'),
+('巠', 'kyŏng'),
+('巠', '경'),
+('巡', ' 두루 순'),
+('巡', ' 순행할 순'),
+('巡', 'sun'),
+('巡', '돌 순'),
+('巡', '순'),
+('巢', ' 도둑굴 소'),
+('巢', ' 새 보금자리 소'),
+('巢', ' 적진 망보는 높을 수레 소'),
+('巢', ' 집 지을 소'),
+('巢', ' 채소이름 소'),
+('巢', ' 큰 피리 소'),
+('巢', 'living quarter in tree'),
+('巢', 'nest'),
+('巢', 'so'),
+('巢', '새집 소'),
+('巢', '소'),
+('巣', 'Alternative form of 巢 (“nest”)'),
+('巣', 'so'),
+('巣', '소'),
+('工', 'Hanja form of 공 (“master craftsman; master artisan”).'),
+('工', '공'),
+('工', '장인'),
+('工', '장인 공'),
+('左', 'Hanja form of 좌 (“left (direction)”).'),
+('左', '왼'),
+('左', '왼 좌'),
+('左', '좌'),
+('巧', 'Hanja form of 교 (“skillful, ingenious, clever”).'),
+('巧', '공교하다'),
+('巧', '공교할'),
+('巧', '공교할 교'),
+('巧', '교'),
+('巨', ' 많을 거'),
+('巨', ' 억 거'),
+('巨', '거'),
+('巨', '클 거'),
+('巩', 'gong'),
+('巩', 'kong'),
+('巩', '공'),
+('巪', 'Hanja form of 걱/꺽 (“hanja used for transliteration, mainly used in personal names”).'),
+('巪', '걱'),
+('巪', '사람 이름'),
+('巪', '사람 이름자 걱'),
+('巫', ' 산 이름 무'),
+('巫', 'Hanja form of 무 (“shaman; something related to shamanism”).'),
+('巫', '무'),
+('巫', '무당'),
+('巫', '무당 무'),
+('巬', 'bu'),
+('巬', 'pu'),
+('巬', '부'),
+('巭', 'a worker'),
+('巭', '공부할 부'),
+('巭', '부'),
+('巭', '일꾼'),
+('差', ' 구분지을 치'),
+('差', ' 오르락 내리락할 치'),
+('差', 'Hanja form of 차 (“difference; to distinguish”).'),
+('差', 'Hanja form of 차 (“to recover from an illness”).'),
+('差', 'Hanja form of 차 (“to select; to assign; to dispatch”).'),
+('差', 'Hanja form of 치 (“uneven; irregular; rough”).'),
+('差', '다르다'),
+('差', '다를'),
+('差', '어긋나다'),
+('差', '어긋날'),
+('差', '어긋날 차'),
+('差', '어긋날 치'),
+('差', '차'),
+('差', '치'),
+('己', 'Hanja form of 기 (“self”).'),
+('己', '기'),
+('己', '자기'),
+('己', '자기 기'),
+('已', ' 그칠 이'),
+('已', ' 너무 이'),
+('已', ' 버릴 이'),
+('已', 'i'),
+('已', '이'),
+('已', '이미 이'),
+('巳', '6th terrestrial branch'),
+('巳', 'sa'),
+('巳', 'the hours from 9 to 11'),
+('巳', '사'),
+('巳', '여섯째 지지 사'),
+('巴', ' 땅이름 파'),
+('巴', ' 뱀 파'),
+('巴', 'Hanja form of 파 (“used in placenames”).'),
+('巴', '꼬리 파'),
+('巴', '땅 이름'),
+('巴', '파'),
+('巵', ' 연지 치'),
+('巵', 'ch''i'),
+('巵', 'chi'),
+('巵', '잔 치'),
+('巵', '치'),
+('巷', ' 내시 항'),
+('巷', ' 마을 항'),
+('巷', ' 복도 항'),
+('巷', '거리 항'),
+('巷', '항'),
+('巹', 'geun'),
+('巹', 'kŭn'),
+('巹', '근'),
+('巹', '받들 근 '),
+('巺', 'son'),
+('巺', '巽과 同字'),
+('巺', '손'),
+('巻', 'gwon'),
+('巻', 'kwŏn'),
+('巻', '卷의 俗字'),
+('巻', '권'),
+('巼', 'p''at'),
+('巼', 'pat'),
+('巼', '땅이름 팟'),
+('巼', '팟'),
+('巽', ' 괘 이름 손'),
+('巽', ' 낮은체 할 손'),
+('巽', ' 동과 남의 사이방향 손'),
+('巽', ' 부드러울 손'),
+('巽', '부드러울'),
+('巽', '부드럽다'),
+('巽', '사양할 손'),
+('巽', '손'),
+('巾', ' 덮을 건'),
+('巾', 'Hanja form of 건 (“headscarf”).'),
+('巾', 'Hanja form of 건 (“piece of cloth; fabric”).'),
+('巾', 'Hanja form of 건 (“towel”).'),
+('巾', '건'),
+('巾', '수건'),
+('巾', '수건 건'),
+('帀', '잡'),
+('市', ' 집 많은 동리 시'),
+('市', ' 흥정할 시'),
+('市', 'Hanja form of 시 (“city; town”).'),
+('市', 'Hanja form of 시 (“market”).'),
+('市', '시'),
+('市', '저자'),
+('市', '저자 시'),
+('布', ' 돈 포'),
+('布', ' 벌릴 포'),
+('布', ' 베풀 포'),
+('布', ' 피륙 포'),
+('布', '베 포'),
+('布', '포'),
+('帆', 'beom'),
+('帆', 'pŏm'),
+('帆', '돛 범'),
+('帆', '범'),
+('帉', ' 행주 분 '),
+('帉', 'bun'),
+('帉', 'pun'),
+('帉', '걸레 분'),
+('帉', '분'),
+('帋', '지'),
+('希', '바랄 희'),
+('希', '희'),
+('帑', '나라 곳집 탕'),
+('帑', '처자식 노'),
+('帕', '머리 동이수건 파'),
+('帕', '머리띠 말'),
+('帖', '문서'),
+('帖', '첩'),
+('帖', '체'),
+('帖', '체지'),
+('帖', '표제 첩'),
+('帖', '표제 체'),
+('帘', 'ryeom'),
+('帘', 'ryŏm'),
+('帘', '렴'),
+('帘', '주막기 렴'),
+('帙', 'Classifier for a set of books. volume'),
+('帙', 'folding case, wrapper (for books)'),
+('帙', '질'),
+('帙', '책갑 질'),
+('帚', ' 털 추'),
+('帚', 'ch''u'),
+('帚', 'chu'),
+('帚', '비 추'),
+('帚', '추'),
+('帛', 'silk'),
+('帛', '백'),
+('帛', '비단'),
+('帛', '비단 백'),
+('帝', 'Hanja form of 제 (“emperor”).'),
+('帝', '임금'),
+('帝', '임금 제'),
+('帝', '제'),
+('帥', ' 장수 수'),
+('帥', ' 좇을 솔'),
+('帥', 'Hanja form of 수 (“commander”).'),
+('帥', '거느릴 솔'),
+('帥', '수'),
+('帥', '장수'),
+('帥', '주장할 수'),
+('带', '띠 대'),
+('帨', ' 손수건 세'),
+('帨', 'se'),
+('帨', '세'),
+('帨', '차는 수건 세'),
+('師', 'Hanja form of 사 (“(military) division; army”).'),
+('師', 'Hanja form of 사 (“teacher; master; one''s mentor”).'),
+('師', '사'),
+('師', '스승'),
+('師', '스승 사'),
+('席', 'Hanja form of 석 (“seat”).'),
+('席', '석'),
+('席', '자리'),
+('席', '자리 석'),
+('帰', '歸의 俗字'),
+('帳', 'cang'),
+('帳', 'chang'),
+('帳', 'jang'),
+('帳', '장'),
+('帳', '휘장 장막 장'),
+('帶', 'Hanja form of 대 (“belt; ribbon; tape”).'),
+('帶', '대'),
+('帶', '띠'),
+('帶', '띠 대'),
+('帷', 'yu'),
+('帷', '유'),
+('帷', '휘장 유'),
+('常', 'Hanja form of 상 (“constant; frequent”).'),
+('常', 'Hanja form of 상 (“eternal; everlasting”).'),
+('常', 'Hanja form of 상 (“honorable; righteous; upright; dignified”).'),
+('常', '떳떳하다'),
+('常', '떳떳할'),
+('常', '상'),
+('常', '항상'),
+('常', '항상 상'),
+('帽', '모'),
+('帽', '모자 모'),
+('帿', 'hu'),
+('帿', '과녁 후'),
+('帿', '후'),
+('幀', '그림족자 정'),
+('幃', ' 홑휘장 위'),
+('幃', '위'),
+('幃', '향낭 위'),
+('幄', '악'),
+('幄', '장막 악'),
+('幅', ' 겉치레할 폭'),
+('幅', 'p''ok'),
+('幅', 'pok'),
+('幅', '폭'),
+('幅', '폭 폭'),
+('幇', 'bang'),
+('幇', 'pang'),
+('幇', '幫과 同字'),
+('幇', '방'),
+('幌', '황'),
+('幌', '휘장 황'),
+('幎', '덮을 멱'),
+('幎', '멱'),
+('幑', '표기'),
+('幑', '휘'),
+('幔', '막 만'),
+('幔', '만'),
+('幕', 'Hanja form of 막 (“curtain, screen, tent”).'),
+('幕', '막'),
+('幕', '막 막'),
+('幘', 'turban, A formal towel to the head'),
+('幘', '건 책'),
+('幘', '책'),
+('幚', 'bang'),
+('幚', 'pang'),
+('幚', '방'),
+('幞', 'headcloth'),
+('幞', 'wimple'),
+('幞', '건 복'),
+('幞', '복'),
+('幟', 'ch''i'),
+('幟', 'chi'),
+('幟', '깃대 치'),
+('幟', '치'),
+('幡', '기 번'),
+('幡', '번'),
+('幢', 'dang'),
+('幢', 'tang'),
+('幢', '기 당'),
+('幢', '당'),
+('幣', ' 돈 폐'),
+('幣', ' 예물 폐'),
+('幣', ' 재물 폐'),
+('幣', 'p''ye'),
+('幣', '폐'),
+('幣', '폐백 폐'),
+('幨', '첨'),
+('幨', '휘장 첨'),
+('幪', '덮을 몽'),
+('幪', '몽'),
+('幫', 'Hanja form of 방 (“help”).'),
+('幫', '도울'),
+('幫', '도울 방'),
+('幫', '돕다'),
+('幫', '방'),
+('幬', 'curtain'),
+('幬', 'to cover'),
+('幬', '주'),
+('幬', '휘장 주'),
+('幰', ' 휘장 헌'),
+('幰', '수레 안장 헌'),
+('幰', '헌'),
+('幱', 'ran'),
+('幱', '내리다지 란'),
+('幱', '란'),
+('干', 'shield'),
+('干', '간'),
+('干', '방패'),
+('干', '생강 강'),
+('平', ' 고를 평'),
+('平', ' 다스릴 평'),
+('平', ' 바를 평'),
+('平', ' 쉬울 평'),
+('平', ' 재관관 평'),
+('平', ' 풍년 평'),
+('平', ' 화친할 평'),
+('平', 'Hanja form of 평 (“to be flat, level, plane”).'),
+('平', '편편할 편'),
+('平', '평'),
+('平', '평탄할 평'),
+('平', '평평할'),
+('年', 'Hanja form of 년/연 (“year”).'),
+('年', '년'),
+('年', '연'),
+('年', '해'),
+('年', '해 년'),
+('幵', 'even, level'),
+('幵', '견'),
+('并', 'byeong'),
+('并', 'pyŏng'),
+('并', '幷의 俗字'),
+('并', '병'),
+('幷', '병'),
+('幷', '어우르다'),
+('幷', '어우를'),
+('幸', ' 바랄 행'),
+('幸', 'Hanja form of 행 (“fortune; good luck”).'),
+('幸', '다행'),
+('幸', '다행할 행'),
+('幸', '행'),
+('幹', ' 우물난간 간'),
+('幹', 'gan'),
+('幹', 'kan'),
+('幹', '간'),
+('幹', '줄기 간'),
+('幺', ' 어릴 요'),
+('幺', 'yo'),
+('幺', '요'),
+('幺', '작을 요'),
+('幻', 'hwan'),
+('幻', '변할 환'),
+('幻', '환'),
+('幼', ' 사랑할 유'),
+('幼', 'Hanja form of 유 (“childish; immature”).'),
+('幼', 'Hanja form of 유 (“infant; young child”).'),
+('幼', '어리다'),
+('幼', '어릴'),
+('幼', '어릴 유'),
+('幼', '유'),
+('幽', ' 귀신 유'),
+('幽', ' 그윽할 유'),
+('幽', ' 어두울 유'),
+('幽', ' 저승 유'),
+('幽', ' 적을 유'),
+('幽', 'yu'),
+('幽', '숨을 유'),
+('幽', '유'),
+('幾', 'Hanja form of 기 (“a few, some”).'),
+('幾', 'Hanja form of 기 (“how many, how much”).'),
+('幾', '기'),
+('幾', '기미'),
+('幾', '기미 기'),
+('广', '광'),
+('广', '넓다'),
+('广', '넓을'),
+('广', '바윗집 엄'),
+('广', '암'),
+('广', '암자'),
+('广', '엄'),
+('广', '집'),
+('庁', 'ch''ŏng'),
+('庁', 'cheong'),
+('庁', '관청 청'),
+('庁', '청'),
+('広', 'Alternative form of 廣 (“Hanja form of 광 (“vast”).”)'),
+('広', '廣의 略字'),
+('広', '광'),
+('広', '넓다'),
+('広', '넓을'),
+('庄', 'chang'),
+('庄', 'jang'),
+('庄', '장'),
+('庄', '장중할 장'),
+('庇', 'bi'),
+('庇', 'cover, shield, shelter, protect'),
+('庇', 'pi'),
+('庇', '덮을 비'),
+('庇', '비'),
+('床', 'Hanja form of 상 (“bed, couch; framework, chassis”).'),
+('床', '牀의 俗字'),
+('床', '상'),
+('床', '평상'),
+('庋', '기'),
+('庋', '시렁 기'),
+('庌', '아'),
+('庌', '집'),
+('序', 'Hanja form of 서 (“preface”).'),
+('序', 'Hanja form of 서 (“sequence; order”).'),
+('序', '서'),
+('序', '차례'),
+('序', '차례 서'),
+('底', ' 그칠 저'),
+('底', ' 이를 지'),
+('底', ' 정할 지'),
+('底', 'base of a logarithm'),
+('底', '밑 저'),
+('底', '이룰 지'),
+('底', '저'),
+('庖', ' 부엌 포'),
+('庖', '포'),
+('庖', '푸줏간 포'),
+('店', ' 주막 점'),
+('店', 'Hanja form of 점 (“store”).'),
+('店', '가게'),
+('店', '가게 점'),
+('店', '점'),
+('庚', 'Hanja form of 경 (“star”).'),
+('庚', '경'),
+('庚', '별'),
+('庚', '일곱째 천간 경'),
+('府', 'Hanja form of 부 (“government office”).'),
+('府', 'Hanja form of 부 (“warehouse”).'),
+('府', '곳집'),
+('府', '곳집 부'),
+('府', '관청'),
+('府', '부'),
+('庠', '상'),
+('庠', '학교 상'),
+('度', ' 벼슬이름 탁'),
+('度', ' 헤아릴 탁'),
+('度', 'Hanja form of 도 (“bound, limit, extent”).'),
+('度', 'Hanja form of 도 (“bound, limit, extent”). [noun]'),
+('度', 'Hanja form of 도 (“degree”).'),
+('度', 'Hanja form of 도 (“degree”). [dependent noun]'),
+('度', 'Hanja form of 탁 (“to speculate; to measure”).'),
+('度', 'Hanja form of 탁 (“to speculate; to measure”). [affix]'),
+('度', '꾀할 탁'),
+('度', '도'),
+('度', '법도 도'),
+('度', '법도(法度)'),
+('度', '탁'),
+('度', '헤아릴'),
+('座', '자리 좌'),
+('座', '좌'),
+('庫', 'Hanja form of 고 (“armory”).'),
+('庫', 'Hanja form of 고 (“warehouse, storehouse”).'),
+('庫', '고'),
+('庫', '곳집'),
+('庫', '곳집 고'),
+('庭', ' 곧을 정'),
+('庭', 'Hanja form of 정 (“courtyard; garden”).'),
+('庭', 'Hanja form of 정 (“courtyard; garden”). [affix]'),
+('庭', '뜰'),
+('庭', '뜰 정'),
+('庭', '정'),
+('庳', '비'),
+('庳', '집 낮을 비'),
+('庵', '암'),
+('庵', '암자'),
+('庵', '초막 암'),
+('庶', 'Hanja form of 서 (“numerous; many”).'),
+('庶', '서'),
+('庶', '여러'),
+('庶', '여러 서'),
+('康', ' 다섯거리 강'),
+('康', ' 즐거울 강'),
+('康', '강'),
+('康', '편안하다'),
+('康', '편안할'),
+('康', '편안할 강'),
+('庸', ' 떳떳할 용'),
+('庸', ' 물도랑 용'),
+('庸', ' 수고로울 용'),
+('庸', ' 어리석을 용'),
+('庸', '쓸 용'),
+('庸', '용'),
+('庻', 'seo'),
+('庻', 'sŏ'),
+('庻', '庶의 略字'),
+('庻', '서'),
+('庽', 'send; dispatch'),
+('庽', '부칠'),
+('庽', '유'),
+('庾', ' 곡식 셈하는 단위 휘 유'),
+('庾', '노적 유'),
+('庾', '유'),
+('廁', ' 버금 치'),
+('廁', ' 섞일 치'),
+('廁', ' 평상 가장자리 치'),
+('廁', '뒷간 치'),
+('廁', '치'),
+('廂', 'sang'),
+('廂', '상'),
+('廂', '행랑 상'),
+('廃', '廢의 略字'),
+('廄', 'gu'),
+('廄', 'ku'),
+('廄', '廐와 同字'),
+('廄', '구'),
+('廈', '큰 집 하'),
+('廈', '하'),
+('廉', 'Hanja form of 렴/염 (“to spy on”).'),
+('廉', 'Hanja form of 렴/염 (“upright, honorable, honest, pure”).'),
+('廉', '렴'),
+('廉', '염'),
+('廉', '청렴할'),
+('廉', '청렴할 렴'),
+('廊', 'Hanja form of 랑/낭 (“corridor, porch, veranda”).'),
+('廊', '낭'),
+('廊', '랑'),
+('廊', '복도'),
+('廊', '복도 랑'),
+('廋', 'conceal'),
+('廋', 'hide'),
+('廋', 'search for'),
+('廋', 'seek'),
+('廋', '수'),
+('廋', '숨길 수'),
+('廌', 'ch''i'),
+('廌', 'chi'),
+('廌', '치'),
+('廌', '해태: unicorn-lion'),
+('廏', 'Hanja form of 구 (“stable”).'),
+('廏', '廐와 同字'),
+('廏', '구'),
+('廏', '마구간'),
+('廐', 'gu'),
+('廐', 'ku'),
+('廐', '구'),
+('廐', '마구간 구'),
+('廑', '근'),
+('廑', '작은집 근'),
+('廓', 'Hanja form of 곽 (“girdle, circumference, outside, enclosure, wall”).'),
+('廓', 'Hanja form of 확 (“to widen; broaden; enlarge”).'),
+('廓', 'Hanja form of 확 (“wide; broad; large”).'),
+('廓', '곽'),
+('廓', '둘레'),
+('廓', '둘레 곽'),
+('廓', '크다'),
+('廓', '클'),
+('廓', '클 확'),
+('廓', '확'),
+('廕', '덮을 음'),
+('廕', '음'),
+('廖', '공허할 료'),
+('廖', '료'),
+('廚', 'chu'),
+('廚', 'ju'),
+('廚', '부엌 주'),
+('廚', '주'),
+('廛', ' 터전 전'),
+('廛', 'chŏn'),
+('廛', 'jeon'),
+('廛', '전'),
+('廛', '전방 전'),
+('廝', ' 마부 시'),
+('廝', ' 천할 시'),
+('廝', '부릴 시'),
+('廝', '시'),
+('廞', 'heum'),
+('廞', 'hŭm'),
+('廞', '진열할 흠'),
+('廞', '흠'),
+('廟', 'Hanja form of 묘 (“imperial court”).'),
+('廟', 'Hanja form of 묘 (“temple, shrine”).'),
+('廟', '묘'),
+('廟', '사당'),
+('廟', '사당 묘'),
+('廠', '창'),
+('廠', '헛간 창'),
+('廡', ' 지붕 무'),
+('廡', ' 처마 무'),
+('廡', '무'),
+('廡', '집 무'),
+('廢', ' 내칠 폐'),
+('廢', ' 떨어질 폐'),
+('廢', ' 집 쏠릴 폐'),
+('廢', 'Hanja form of 폐 (“to abandon”).'),
+('廢', 'Hanja form of 폐 (“to terminate”).'),
+('廢', '버리다'),
+('廢', '버릴'),
+('廢', '폐'),
+('廢', '폐하다'),
+('廢', '폐할'),
+('廢', '폐할 폐'),
+('廣', 'Hanja form of 광 (“broad, wide, extensive”).'),
+('廣', '광'),
+('廣', '넓다'),
+('廣', '넓을'),
+('廣', '넓을 광'),
+('廤', 'a place; a premise'),
+('廤', 'got'),
+('廤', 'koc'),
+('廤', 'kot'),
+('廤', 'to place something'),
+('廤', '곳 곶'),
+('廤', '곶'),
+('廥', 'goe'),
+('廥', 'koe'),
+('廥', '괴'),
+('廥', '여물광 괴 '),
+('廧', 'chang'),
+('廧', 'jang'),
+('廧', '담 장'),
+('廧', '장'),
+('廨', ' 공해 해'),
+('廨', 'hae'),
+('廨', '관청 해'),
+('廨', '해'),
+('廩', 'Alternative spelling of 濫'),
+('廩', 'granary'),
+('廩', '곳집'),
+('廩', '곳집 름'),
+('廩', '남'),
+('廩', '넘치다'),
+('廩', '넘칠'),
+('廩', '늠'),
+('廩', '람'),
+('廩', '름'),
+('廬', '려'),
+('廬', '오두막집 려'),
+('廱', 'ong'),
+('廱', '벽옹 옹'),
+('廱', '옹'),
+('廳', 'administrative headquarters'),
+('廳', '관청 청'),
+('廳', '청'),
+('廴', '길게 걸을'),
+('廴', '인'),
+('延', ' 닿을 연'),
+('延', 'Hanja form of 연 (“to stretch; to extend; to lengthen”).'),
+('延', '늘이다'),
+('延', '늘일'),
+('延', '미칠 연'),
+('延', '연'),
+('廷', ' 곧을 정'),
+('廷', ' 바를 정'),
+('廷', 'chŏng'),
+('廷', 'jeong'),
+('廷', 'royal court, in the capital. See also: 朝廷.'),
+('廷', 'rural court, in the village.'),
+('廷', '정'),
+('廷', '조정 정'),
+('建', ' 둘 건'),
+('建', ' 별이름 건'),
+('建', ' 심을 건'),
+('建', ' 칼집 건'),
+('建', 'Hanja form of 건 (“build; establish”).'),
+('建', '건'),
+('建', '세우다'),
+('建', '세울'),
+('建', '세울 건'),
+('廻', 'hoe'),
+('廻', '돌 회'),
+('廻', '회'),
+('廼', '迺의 俗字'),
+('廼', '내'),
+('廽', 'hoe'),
+('廽', '돌 회'),
+('廽', '회'),
+('廾', 'to support'),
+('廾', 'twenty'),
+('廾', '공'),
+('廾', '받들'),
+('廾', '받들다'),
+('廿', 'twenty; twentieth'),
+('廿', '스물'),
+('廿', '스물 입'),
+('廿', '이십'),
+('廿', '입'),
+('弁', '고깔 변'),
+('弁', '즐거워할 반'),
+('弃', 'gi'),
+('弃', 'ki'),
+('弃', '棄의 古字'),
+('弃', '기'),
+('弄', 'Hanja form of 롱/농 (“alley”).'),
+('弄', 'Hanja form of 롱/농 (“do, play or fiddle with, joke”).'),
+('弄', 'Hanja form of 롱/농 (“naughty”).'),
+('弄', '농'),
+('弄', '롱'),
+('弄', '희롱하다'),
+('弄', '희롱할'),
+('弄', '희롱할 롱'),
+('弇', ' 사람이름 감'),
+('弇', 'cover over, hide'),
+('弇', 'narrow-necked'),
+('弇', '감'),
+('弇', '뚜껑 감'),
+('弈', 'Chinese chess'),
+('弈', '바둑둘 혁'),
+('弈', '혁'),
+('弊', ' 결단할 폐'),
+('弊', ' 곤할 폐'),
+('弊', ' 곰곰 궁리할 폐'),
+('弊', ' 엎드릴 폐'),
+('弊', ' 폐단 폐'),
+('弊', 'p''ye'),
+('弊', 'phyey'),
+('弊', 'pye'),
+('弊', '폐'),
+('弊', '해질 폐'),
+('弋', ' 검을 익'),
+('弋', ' 벼슬이름 익'),
+('弋', ' 오랑캐 익'),
+('弋', ' 취할 익'),
+('弋', ' 홰 익'),
+('弋', '익'),
+('弋', '주살 익'),
+('弍', 'i'),
+('弍', '二의 古字'),
+('弍', '이'),
+('式', ' 수레 앞 가로막대 식'),
+('式', ' 쓸 식'),
+('式', ' 제도 식'),
+('式', 'Hanja form of 식 (“type”).'),
+('式', '법'),
+('式', '법 식'),
+('式', '식'),
+('弑', 'si'),
+('弑', '시'),
+('弑', '윗사람 죽일 시'),
+('弒', '弑의 本字'),
+('弒', '시'),
+('弓', 'Hanja form of 궁 (“bow (for shooting arrows”).'),
+('弓', '궁'),
+('弓', '활'),
+('弓', '활 궁'),
+('弔', '위문할 조'),
+('弔', '이를 적'),
+('引', 'Hanja form of 인 (“pull”).'),
+('引', '끌'),
+('引', '끌 인'),
+('引', '끌다'),
+('引', '인'),
+('弗', 'Repurposed for its visual similarity to the dollar symbol $.'),
+('弗', '불'),
+('弗', '아니다'),
+('弗', '아닐'),
+('弗', '아닐 불'),
+('弘', 'Hanja form of 홍 (“big”).'),
+('弘', '넓을 홍'),
+('弘', '크다'),
+('弘', '클'),
+('弘', '홍'),
+('弛', ' 방탕할 이'),
+('弛', ' 해이할 이'),
+('弛', ' 활 부릴 이'),
+('弛', '늦출 이'),
+('弟', 'Hanja form of 제 (“younger brother”).'),
+('弟', '아우'),
+('弟', '아우 제'),
+('弟', '제'),
+('弢', 'do'),
+('弢', 'to'),
+('弢', '도'),
+('弢', '활집 도'),
+('弥', '彌와 同字'),
+('弥', '미'),
+('弦', ' 땅이름 현'),
+('弦', ' 맥박 잦을 현'),
+('弦', ' 반달 현'),
+('弦', 'bowstring'),
+('弦', 'hyen'),
+('弦', 'hyeon'),
+('弦', 'hyŏn'),
+('弦', '시위 현'),
+('弦', '현'),
+('弧', 'ho'),
+('弧', '호'),
+('弧', '활 호'),
+('弩', 'no'),
+('弩', '노'),
+('弩', '쇠뇌(여러 개의 화살이나 돌을 잇따라 쏘게 된 큰 활) 노'),
+('弭', ' 그칠 미'),
+('弭', '미'),
+('弭', '활고자 미'),
+('弱', ' 어릴 약'),
+('弱', 'Hanja form of 약 (“weak”).'),
+('弱', '약'),
+('弱', '약하다'),
+('弱', '약할'),
+('弱', '약할 약'),
+('弴', '그림 그린 활 돈'),
+('弴', '그림 그린 활 조'),
+('張', 'give, throw, have (a party etc.).'),
+('張', 'grant (a favor), bestow, confer.'),
+('張', '베풀 장'),
+('張', '장'),
+('強', 'Hanja form of 강 (“strong; strength”).'),
+('強', 'Hanja form of 강 (“stubborn; obstinate”).'),
+('強', 'Hanja form of 강 (“to force; to coerce”).'),
+('強', '强의 本字'),
+('強', '강'),
+('強', '강하다'),
+('強', '강할'),
+('強', '힘쓰다'),
+('強', '힘쓸'),
+('弹', '彈과 同字'),
+('强', ' 나머지 강'),
+('强', ' 바구미 강'),
+('强', 'Alternative form of 強 (“Hanja form of 강 (“strong”).”)'),
+('强', '강'),
+('强', '강하다'),
+('强', '강할'),
+('强', '강할 강'),
+('弼', ' 거듭 필'),
+('弼', ' 도지개 필'),
+('弼', 'p''il'),
+('弼', 'phil'),
+('弼', 'pil'),
+('弼', '도울 필'),
+('弼', '필'),
+('弾', '彈의 略字'),
+('彀', 'draw a bow to the full'),
+('彀', 'shoot a bow'),
+('彀', '구'),
+('彀', '활 잔뜩 당길 구'),
+('彂', 'bal'),
+('彂', 'pal'),
+('彂', '발'),
+('彆', 'Hanja form of 별 (“warped bow”).'),
+('彆', '별'),
+('彆', '활 뒤틀릴'),
+('彆', '활 뒤틀릴 별'),
+('彈', ' 악기부릴 탄'),
+('彈', ' 탄알 탄'),
+('彈', ' 탄핵할 탄'),
+('彈', 't''an'),
+('彈', 'than'),
+('彈', '쏠 탄'),
+('彈', '탄'),
+('彊', ' 사나울 강'),
+('彊', ' 센 활 강'),
+('彊', ' 송장 뻣뻣할 강'),
+('彊', 'Hanja form of 강 (“to be strong”).'),
+('彊', '강'),
+('彊', '굳세다'),
+('彊', '굳셀'),
+('彊', '굳셀 강'),
+('彌', ' 널리 미'),
+('彌', '두루'),
+('彌', '두루 미'),
+('彌', '미'),
+('彌', '미륵'),
+('彎', '굽을 만'),
+('彎', '만'),
+('彐', '계'),
+('当', 'dang'),
+('当', 'tang'),
+('当', '當의 略字'),
+('当', '당'),
+('彔', '나무 깍을 록'),
+('彖', 'dan'),
+('彖', 'tan'),
+('彖', '결단할 단'),
+('彖', '단'),
+('彗', ' 꼬리별 혜'),
+('彗', 'Hanja form of 혜 (“comet”).'),
+('彗', '대빗자루 세'),
+('彗', '비 혜'),
+('彗', '살별'),
+('彗', '혜'),
+('彘', '돼지 체'),
+('彘', '체'),
+('彙', 'Hanja form of 휘 (“collection”).'),
+('彙', '모으다'),
+('彙', '모을'),
+('彙', '무리 휘'),
+('彙', '휘'),
+('彚', 'hwi'),
+('彚', '彙와 同字'),
+('彚', '휘'),
+('彛', 'i'),
+('彛', '彝의 俗字'),
+('彛', '이'),
+('彝', ' 법 이'),
+('彝', ' 술통 이'),
+('彝', ' 종묘 제기 이'),
+('彝', '떳떳할 이'),
+('彝', '이'),
+('彞', 'i'),
+('彞', '彛와 同字'),
+('彞', '이'),
+('形', ' 몸 형'),
+('形', 'Hanja form of 형 (“form; shape”).'),
+('形', '모양'),
+('形', '모양 형'),
+('形', '형'),
+('彤', 'dong'),
+('彤', 'name of an ancient state'),
+('彤', 'red, vermilion'),
+('彤', 'tong'),
+('彤', '동'),
+('彤', '붉은 칠 동'),
+('彥', ' 클 언'),
+('彥', 'en'),
+('彥', 'eon'),
+('彥', 'ŏn'),
+('彥', '언'),
+('彥', '착한 선비 언'),
+('彦', 'Alternative form of 彥'),
+('彦', '彥과 同字'),
+('彦', '언'),
+('彧', ' 문채날 욱'),
+('彧', 'beautiful coloring, a lovely sheen'),
+('彧', 'uk'),
+('彧', 'wuk'),
+('彧', '빛날 욱'),
+('彧', '욱'),
+('彩', 'Colorful'),
+('彩', '무늬 채'),
+('彩', '채'),
+('彪', ' 문채 표'),
+('彪', ' 작은 범 표'),
+('彪', 'p''yo'),
+('彪', 'phyo'),
+('彪', 'pyo'),
+('彪', '칡범 표'),
+('彪', '표'),
+('彫', 'cho'),
+('彫', 'co'),
+('彫', 'jo'),
+('彫', '새길 조'),
+('彫', '조'),
+('彬', 'bright'),
+('彬', '빈'),
+('彬', '빛나다'),
+('彬', '빛날'),
+('彬', '빛날 빈'),
+('彭', ' 땅이름 팽'),
+('彭', ' 방패 팽'),
+('彭', ' 북소리 팽'),
+('彭', ' 총소리 팽'),
+('彭', '많을 방'),
+('彭', '성씨 팽'),
+('彰', 'ch''ang'),
+('彰', 'chang'),
+('彰', '밝을 창'),
+('彰', '창'),
+('影', ' 형상 영'),
+('影', 'Hanja form of 영 (“shadow”).'),
+('影', '그림자'),
+('影', '그림자 영'),
+('影', '영'),
+('彳', 'walk slowly'),
+('彳', '조금 걸을'),
+('彳', '척'),
+('彷', '거닐 방'),
+('彷', '방'),
+('役', ' 국경 지킬 역'),
+('役', 'Hanja form of 역 (“duty; role”).'),
+('役', '부리다'),
+('役', '부릴'),
+('役', '부릴 역'),
+('役', '역'),
+('彼', 'Hanja form of 피 (“that; those”).'),
+('彼', '저'),
+('彼', '저 피'),
+('彼', '피'),
+('彽', 'chi'),
+('彽', 'ci'),
+('彽', 'ji'),
+('彽', 'wander'),
+('彽', 'waver'),
+('彽', '지'),
+('彿', 'bul'),
+('彿', 'pul'),
+('彿', '불'),
+('彿', '비슷할 불'),
+('往', ' 옛 왕'),
+('往', ' 이따금 왕'),
+('往', 'Hanja form of 왕 (“to go to”).'),
+('往', '가다'),
+('往', '갈'),
+('往', '갈 왕'),
+('往', '왕'),
+('征', ' 갈 정'),
+('征', '정'),
+('征', '칠 정'),
+('徂', '갈 조'),
+('徂', '조'),
+('径', 'gyeong'),
+('径', 'kyeng'),
+('径', 'kyŏng'),
+('径', '경'),
+('径', '통할 경'),
+('待', 'Hanja form of 대 (“wait”).'),
+('待', '기다리다'),
+('待', '기다릴'),
+('待', '기다릴 대'),
+('待', '대'),
+('徇', ' 따라 죽을 순'),
+('徇', ' 부릴 순'),
+('徇', ' 빠를 순'),
+('徇', 'sun'),
+('徇', 'swun'),
+('徇', '순'),
+('徇', '조리 돌릴 순'),
+('很', '패려궂다'),
+('很', '패려궂을'),
+('很', '패려궂을 흔'),
+('很', '흔'),
+('徉', '배회할 양'),
+('徉', '양'),
+('徊', 'hoe'),
+('徊', 'hoy'),
+('徊', '노닐 회'),
+('徊', '회'),
+('律', 'Hanja form of 률/율 (“law; rule”).'),
+('律', '률'),
+('律', '법 률'),
+('律', '법칙'),
+('律', '율'),
+('後', 'Hanja form of 후 (“after”).'),
+('後', 'Hanja form of 후 (“behind”).'),
+('後', '뒤'),
+('後', '뒤 후'),
+('後', '후'),
+('徐', 'a surname'),
+('徐', 'slow'),
+('徐', '서'),
+('徐', '천천할 서'),
+('徐', '천천히'),
+('徑', 'Hanja form of 경 (“shortcut, path”).'),
+('徑', '경'),
+('徑', '지름길'),
+('徑', '지름길 경'),
+('徒', 'Hanja form of 도 (“going on foot”).'),
+('徒', 'Hanja form of 도 (“party; gang; group; disciple”).'),
+('徒', 'Hanja form of 도 (“useless; in vain”).'),
+('徒', '도'),
+('徒', '무리'),
+('徒', '무리 도'),
+('従', '從의 略字'),
+('得', 'Hanja form of 득 (“gain, benefit”).'),
+('得', 'Hanja form of 득 (“obtain, achieve”).'),
+('得', 'Hanja form of 득 (“satisfaction”).'),
+('得', '득'),
+('得', '얻다'),
+('得', '얻을'),
+('得', '얻을 득'),
+('徘', 'bae'),
+('徘', 'pae'),
+('徘', 'pay'),
+('徘', '노닐 배'),
+('徘', '배'),
+('徙', '사'),
+('徙', '옮길 사'),
+('徜', '노닐 상'),
+('徜', '상'),
+('從', 'Hanja form of 종 (“from; since”).'),
+('從', 'Hanja form of 종 (“prefix indicating cousinhood”).'),
+('從', 'Hanja form of 종 (“to follow; to pursue”).'),
+('從', 'Hanja form of 종 (“to obey; to comply”).'),
+('從', '종'),
+('從', '좇다'),
+('從', '좇을'),
+('從', '좇을 종'),
+('徠', '올 래'),
+('御', '거느릴 어'),
+('御', '맞을 아'),
+('徣', 'ch''a'),
+('徣', 'cha'),
+('徣', '빌릴 차 '),
+('徣', '차'),
+('徧', 'universal'),
+('徧', 'widespread'),
+('徧', '편'),
+('徨', '노닐 황'),
+('徨', '황'),
+('復', 'Hanja form of 복 (“return”).'),
+('復', 'Hanja form of 부 (“again”).'),
+('復', '다시'),
+('復', '다시 부'),
+('復', '돌아오다'),
+('復', '돌아올'),
+('復', '돌아올 복'),
+('復', '복'),
+('復', '부'),
+('循', ' 돌 순'),
+('循', ' 돌아다닐 순'),
+('循', ' 의지할 순'),
+('循', ' 차례 순'),
+('循', '순'),
+('循', '좇을 순'),
+('徬', 'to be next to'),
+('徬', 'to wander about'),
+('徬', 'walk along side of'),
+('徬', '방'),
+('徬', '시중들 방'),
+('徭', 'yo'),
+('徭', '부릴 요'),
+('徭', '요'),
+('微', ' 자질구레할 미'),
+('微', 'Hanja form of 미 (“minor, trivial, trifling”).'),
+('微', 'Hanja form of 미 (“small, few, little, hidden”).'),
+('微', '미'),
+('微', '자질구레하다'),
+('微', '자질구레할'),
+('微', '작다'),
+('微', '작을'),
+('微', '작을 미'),
+('徯', ' 사잇길 혜'),
+('徯', 'dangerous'),
+('徯', 'pathway'),
+('徯', 'wait for'),
+('徯', '기다릴 혜'),
+('徯', '혜'),
+('徳', '德의 略字'),
+('徴', '徵의 略字'),
+('徴', '부를 징'),
+('徵', '부를 징'),
+('徵', '치성 치'),
+('德', 'Hanja form of 덕 (“benevolence; virtue”).'),
+('德', '덕'),
+('德', '큰 덕'),
+('徹', '철'),
+('徹', '통할 철'),
+('徼', ' 구할 요'),
+('徼', ' 변방 요'),
+('徼', ' 순라 요'),
+('徼', '돌아다닐 요'),
+('徼', '요'),
+('徽', 'a badge, insignia'),
+('徽', 'hwi'),
+('徽', '아름다울 휘'),
+('徽', '휘'),
+('忂', '가는 모양'),
+('忂', '구'),
+('心', 'Hanja form of 심 (“heart; feeling; emotion”).'),
+('心', '마음'),
+('心', '마음 심'),
+('心', '심'),
+('必', ' 기약 필'),
+('必', ' 살필 필'),
+('必', ' 오로지 필'),
+('必', 'Hanja form of 필 (“surely; certainly; without fail”).'),
+('必', '반드시'),
+('必', '반드시 필'),
+('必', '필'),
+('忉', 'distressed in mind'),
+('忉', 'grieved'),
+('忉', '근심할 도'),
+('忉', '도'),
+('忌', 'Hanja form of 기 (“fear”).'),
+('忌', 'Hanja form of 기 (“jealous, envious”).'),
+('忌', '기'),
+('忌', '꺼리다'),
+('忌', '꺼릴'),
+('忌', '꺼릴 기'),
+('忍', '인'),
+('忍', '참다'),
+('忍', '참을 인'),
+('忐', '탐'),
+('忒', ' 어기어질 특'),
+('忒', ' 의심할 특'),
+('忒', '변할 특'),
+('忒', '특'),
+('忖', ' 짐작할 촌'),
+('忖', '촌'),
+('忖', '헤아리다'),
+('忖', '헤아릴'),
+('忖', '헤아릴 촌'),
+('志', 'Hanja form of 지 (“intention, will”).'),
+('志', '뜻'),
+('志', '뜻 지'),
+('志', '지'),
+('忘', 'Hanja form of 망 (“forget”).'),
+('忘', 'Hanja form of 망 (“miss, omit”).'),
+('忘', 'Hanja form of 망 (“neglect”).'),
+('忘', '망'),
+('忘', '잊다'),
+('忘', '잊을'),
+('忘', '잊을 망'),
+('忙', 'Hanja form of 망 (“busy”).'),
+('忙', '망'),
+('忙', '바쁘다'),
+('忙', '바쁠'),
+('忙', '바쁠 망'),
+('応', '應의 略字'),
+('忝', 'ch''ŏm'),
+('忝', 'chem'),
+('忝', 'cheom'),
+('忝', '더럽힐 첨'),
+('忝', '첨'),
+('忞', '강인할 민 '),
+('忞', '민'),
+('忟', '강인할 민'),
+('忟', '민'),
+('忠', ' 곧을 충'),
+('忠', '충'),
+('忠', '충성 충'),
+('忡', '근심할 충'),
+('忡', '충'),
+('忢', '오'),
+('忤', ' 미워할 오'),
+('忤', 'o'),
+('忤', '거스릴 오'),
+('忤', '오'),
+('忨', ' 사랑할 완 '),
+('忨', '완'),
+('忨', '탐할 완'),
+('忩', 'Alternative form of 悤'),
+('忩', '바쁘다'),
+('忩', '바쁠'),
+('忩', '총'),
+('忩', '총명하다'),
+('忩', '총명할'),
+('快', ' 빠를 쾌'),
+('快', ' 시원할 쾌'),
+('快', '기분이 좋을 쾌'),
+('快', '쾌'),
+('快', '쾌하다'),
+('快', '쾌할'),
+('忭', 'delighted'),
+('忭', 'pleased'),
+('忭', '기뻐할 변'),
+('忭', '변'),
+('忮', '기'),
+('忮', '해칠 기'),
+('忱', ' 정성 침'),
+('忱', '믿을 침'),
+('忱', '침'),
+('念', 'Hanja form of 념/염 (“thought”).'),
+('念', '념'),
+('念', '생각'),
+('念', '생각 념'),
+('念', '염'),
+('忷', '恟과 同字'),
+('忷', '흉'),
+('忸', '익을 뉴'),
+('忻', 'heun'),
+('忻', 'hun'),
+('忻', 'hŭn'),
+('忻', '기뻐할 흔'),
+('忻', '흔'),
+('忼', ' 뜻이 크고 기개있을 강'),
+('忼', ' 탄식할 강 '),
+('忼', '강'),
+('忼', '강개할 강'),
+('忽', '소흘히 할 홀'),
+('忽', '홀'),
+('忿', 'exasperation'),
+('忿', 'fury'),
+('忿', 'get angry'),
+('忿', '분'),
+('忿', '성낼 분'),
+('怊', 'ch''o'),
+('怊', 'cho'),
+('怊', '슬퍼할 초 '),
+('怊', '초'),
+('怍', 'cak'),
+('怍', 'chak'),
+('怍', 'jak'),
+('怍', '부끄러울 작'),
+('怍', '작'),
+('怏', 'ang'),
+('怏', '앙'),
+('怏', '원망할 앙'),
+('怒', 'Hanja form of 노 (“anger; fury”).'),
+('怒', '노'),
+('怒', '성내다'),
+('怒', '성낼'),
+('怒', '성낼 노'),
+('怔', ' 가슴 두근두근할 정'),
+('怔', '정'),
+('怔', '황겁할 정'),
+('怕', '담담하다'),
+('怕', '담담할'),
+('怕', '두려울 파'),
+('怕', '두려워하다'),
+('怕', '두려워할'),
+('怕', '백'),
+('怕', '파'),
+('怖', ' 놀래킬 포'),
+('怖', 'p''o'),
+('怖', 'pho'),
+('怖', 'po'),
+('怖', '두려울 포'),
+('怖', '포'),
+('怗', 'observant'),
+('怗', 'quiet, peaceful'),
+('怗', '고요할 첩'),
+('怗', '첩'),
+('怙', '믿을 호'),
+('怙', '호'),
+('怛', '깜짝 놀랄 달'),
+('怛', '달'),
+('怜', '연리할 련'),
+('怜', '영리할 령'),
+('思', 'Alternative form of 䰄 (“Hanja form of 새 (“heavily bearded”).”)'),
+('思', 'Hanja form of 사 (“thought; thinking; idea”).'),
+('思', 'Hanja form of 사 (“thought”).'),
+('思', 'Hanja form of 사 (“to miss; to yearn for”).'),
+('思', 'Hanja form of 사 (“to think”).'),
+('思', '사'),
+('思', '새'),
+('思', '생각'),
+('思', '생각하다'),
+('思', '생각할'),
+('思', '생각할 사'),
+('思', '수염-이 많을'),
+('怠', ' 거만할 태'),
+('怠', ' 느릴 태'),
+('怠', 'lazy'),
+('怠', 'neglect'),
+('怠', 't''ae'),
+('怠', 'tae'),
+('怠', 'thay'),
+('怠', '게으를 태'),
+('怠', '태'),
+('怡', ' 즐거울 이'),
+('怡', 'i'),
+('怡', '기쁠 이'),
+('怡', '이'),
+('急', 'Hanja form of 급 (“rapid; sudden”).'),
+('急', '급'),
+('急', '급할'),
+('急', '급할 급'),
+('怦', ' 칼칼할 평'),
+('怦', '맘 급할 평'),
+('怦', '평'),
+('性', ' 마음 성'),
+('性', ' 바탕 성'),
+('性', ' 색욕 성'),
+('性', 'Hanja form of 성 (“-ness; -ity (suffix forming nouns and adjectives, denoting qualities)”).'),
+('性', 'Hanja form of 성 (“nature; character; sex”).'),
+('性', '성'),
+('性', '성품'),
+('性', '성품 성'),
+('怨', ' 분낼 원'),
+('怨', ' 원수 원'),
+('怨', 'wen'),
+('怨', 'won'),
+('怨', 'wŏn'),
+('怨', '원'),
+('怨', '원망할 원'),
+('怩', '부끄러워할 니'),
+('怪', 'Hanja form of 괴 (“strange; odd; unusual; peculiar”).'),
+('怪', '괴'),
+('怪', '괴이하다'),
+('怪', '괴이할'),
+('怪', '기이할 괴'),
+('怯', ' 겁낼 겁'),
+('怯', ' 으를 겁'),
+('怯', 'fear, fright'),
+('怯', '겁'),
+('怯', '겁(怯)낼'),
+('怯', '겁내다'),
+('怯', '무서워할 겁'),
+('怱', 'ch''ong'),
+('怱', 'chong'),
+('怱', '悤의 俗字'),
+('怱', '총'),
+('怳', 'hwang'),
+('怳', '멍할 황'),
+('怳', '황'),
+('怾', 'The name of the Korean mountain.'),
+('怾', '기'),
+('怾', '산 이름'),
+('怾', '산 이름 기'),
+('恁', 'im'),
+('恁', '생각할 임'),
+('恁', '임'),
+('恂', ' 믿을 순'),
+('恂', ' 온공스러울 순'),
+('恂', '갑자기 준'),
+('恂', '진실할 순'),
+('恃', ' 어머니 시'),
+('恃', ' 의지할 시'),
+('恃', '믿을 시'),
+('恃', '시'),
+('恆', 'hang'),
+('恆', '恒의 本字'),
+('恆', '항'),
+('恇', 'fear'),
+('恇', 'gwang'),
+('恇', 'kwang'),
+('恇', 'weak, tender'),
+('恇', '겁낼 광'),
+('恇', '광'),
+('恈', '모'),
+('恈', '탐할 모 '),
+('恊', ' 위협할 협'),
+('恊', 'hyeop'),
+('恊', 'hyep'),
+('恊', 'hyŏp'),
+('恊', '겁낼 협'),
+('恊', '협'),
+('恋', '戀의 俗字'),
+('恍', 'absent-minded'),
+('恍', 'hwang'),
+('恍', 'seemingly'),
+('恍', '황'),
+('恍', '황홀할 황'),
+('恐', 'Hanja form of 공 (“fear, be scared, be apprehensive”).'),
+('恐', '공'),
+('恐', '두려울'),
+('恐', '두려울 공'),
+('恐', '두렵다'),
+('恒', ' 두루할 긍'),
+('恒', ' 옛 항'),
+('恒', '늘 항'),
+('恒', '시위 긍'),
+('恕', 'se'),
+('恕', 'seo'),
+('恕', 'sŏ'),
+('恕', '서'),
+('恕', '용서할 서'),
+('恙', '근심 양'),
+('恙', '양'),
+('恚', ' 원망할 에'),
+('恚', 'anger, rage'),
+('恚', '성낼 에'),
+('恚', '에'),
+('恝', '걱정 없을 개'),
+('恝', '걱정 없을 괄'),
+('恟', '두려워할 흉'),
+('恟', '흉'),
+('恠', '怪의 俗字'),
+('恠', '괴'),
+('恢', '넓을 회'),
+('恢', '회'),
+('恣', '방자할 자'),
+('恣', '자'),
+('恤', 'hyul'),
+('恤', '구휼할 휼'),
+('恤', '휼'),
+('恥', ' 욕될 치'),
+('恥', 'ch''i'),
+('恥', 'chi'),
+('恥', '부끄럼 치'),
+('恥', '치'),
+('恨', 'Hanja form of 한 (“deep-seated resentment”).'),
+('恨', 'Hanja form of 한 (“deep-seated resentment”). [noun]'),
+('恨', 'Hanja form of 한 (“to resent; to hate”).'),
+('恨', 'Hanja form of 한 (“to resent; to hate”). [affix]'),
+('恨', '한'),
+('恨', '한탄하다'),
+('恨', '한탄할'),
+('恨', '한탄할 한'),
+('恩', ' 사랑할 은'),
+('恩', ' 신세 은'),
+('恩', 'Hanja form of 은 (“favor”).'),
+('恩', 'Hanja form of 은 (“grace”).'),
+('恩', 'Hanja form of 은 (“mercy”).'),
+('恩', '은'),
+('恩', '은혜'),
+('恩', '은혜 은'),
+('恪', '각'),
+('恪', '삼갈 각'),
+('恫', ' 아플 통'),
+('恫', ' 앓을 통'),
+('恫', 't''ong'),
+('恫', 'thong'),
+('恫', 'tong'),
+('恫', '슬플 통'),
+('恫', '통'),
+('恬', '편안할 념'),
+('恭', 'Hanja form of 공 (“respectful, polite, reverent”).'),
+('恭', '공'),
+('恭', '공손하다'),
+('恭', '공손할'),
+('恭', '공손할 공'),
+('息', ' 그칠 식'),
+('息', ' 기를 식'),
+('息', ' 자식 식'),
+('息', 'Hanja form of 식 (“breath”).'),
+('息', '숨쉬다'),
+('息', '숨쉴'),
+('息', '숨쉴 식'),
+('息', '식'),
+('恰', '마치 흡'),
+('恰', '흡'),
+('恿', 'yong'),
+('恿', '용'),
+('悁', ' 근심할 연'),
+('悁', '분하다'),
+('悁', '분할'),
+('悁', '분할 연'),
+('悁', '성내다'),
+('悁', '성낼'),
+('悁', '연'),
+('悃', 'gon'),
+('悃', 'kon'),
+('悃', '곤'),
+('悃', '정성 곤'),
+('悄', '근심할 초'),
+('悄', '초'),
+('悅', ' 복종할 열'),
+('悅', ' 성씨 열'),
+('悅', '열'),
+('悅', '즐거울 열'),
+('悉', 'sil'),
+('悉', '모두 실'),
+('悉', '실'),
+('悋', '아낄 린'),
+('悌', '공경할 제'),
+('悌', '제'),
+('悍', 'han'),
+('悍', '사나울 한'),
+('悍', '한'),
+('悏', 'hyeop'),
+('悏', 'hyep'),
+('悏', 'hyŏp'),
+('悏', '협'),
+('悒', ' 근심할 읍'),
+('悒', 'eup'),
+('悒', 'up'),
+('悒', 'ŭp'),
+('悒', '답답할 읍'),
+('悒', '읍'),
+('悔', 'hoe'),
+('悔', 'hoy'),
+('悔', '뉘우칠 회'),
+('悔', '회'),
+('悕', 'hui'),
+('悕', 'huy'),
+('悕', 'hŭi'),
+('悕', '슬퍼할 희 '),
+('悕', '희'),
+('悖', ' 어지러울 패'),
+('悖', 'Hanja form of 패 (“go against”).'),
+('悖', '거스르다'),
+('悖', '거스를'),
+('悖', '거스를 패'),
+('悖', '우쩍 일어날 발'),
+('悖', '패'),
+('悗', '문'),
+('悗', '잊어버릴 문 '),
+('悚', ' 송구할 송'),
+('悚', '두려울 송'),
+('悚', '송'),
+('悛', ' 차례 전'),
+('悛', '고칠 전'),
+('悛', '전'),
+('悟', 'o'),
+('悟', '깨우칠 오'),
+('悟', '오'),
+('悠', ' 근심할 유'),
+('悠', ' 생각할 유'),
+('悠', ' 한가할 유'),
+('悠', 'yu'),
+('悠', '멀 유'),
+('悠', '유'),
+('悢', '슬퍼할 량 '),
+('患', 'Hanja form of 환 (“worry”).'),
+('患', '근심'),
+('患', '근심 환'),
+('患', '환'),
+('悤', ' 덤빌 총'),
+('悤', 'Hanja form of 총 (“busy”).'),
+('悤', '바쁘다'),
+('悤', '바쁠'),
+('悤', '바쁠 총'),
+('悤', '총'),
+('悤', '총명하다'),
+('悤', '총명할'),
+('悦', 'yel'),
+('悦', 'yeol'),
+('悦', 'yŏl'),
+('悦', '悅의 略字'),
+('悦', '열'),
+('悧', '영리할 리'),
+('悩', '惱의 俗字'),
+('悪', '惡의 略字'),
+('悰', 'chong'),
+('悰', 'cong'),
+('悰', 'jong'),
+('悰', '종'),
+('悰', '즐길 종'),
+('悱', 'to be desirous of speaking'),
+('悱', '비'),
+('悱', '표현 못할 비'),
+('悲', 'Hanja form of 비 (“sad”).'),
+('悲', '비'),
+('悲', '슬프다'),
+('悲', '슬플'),
+('悲', '슬플 비'),
+('悳', 'deok'),
+('悳', 'tek'),
+('悳', 'tŏk'),
+('悳', '德의 古字'),
+('悳', '덕'),
+('悴', ' 파리할 췌'),
+('悴', ' 피폐할 췌'),
+('悴', '근심할 췌'),
+('悴', '췌'),
+('悵', '슬퍼할 창'),
+('悵', '창'),
+('悶', 'Hanja form of 민 (“agony”).'),
+('悶', '답답하다'),
+('悶', '답답할'),
+('悶', '민'),
+('悶', '번민할 민'),
+('悸', 'gye'),
+('悸', 'kye'),
+('悸', 'kyey'),
+('悸', '계'),
+('悸', '두근거를 계'),
+('悻', '발끈 성낼 행'),
+('悻', '행'),
+('悼', 'do'),
+('悼', 'to'),
+('悼', '도'),
+('悼', '슬퍼할 도'),
+('悽', '슬퍼할 처'),
+('悽', '처'),
+('悾', 'gong'),
+('悾', 'kong'),
+('悾', '공'),
+('悾', '정성 공'),
+('惄', '마음 졸일 녁'),
+('情', ' 마음속 정'),
+('情', 'Hanja form of 정 (“feeling; sentiment; emotion”).'),
+('情', '뜻'),
+('情', '뜻 정'),
+('情', '정'),
+('惆', ' 섭섭할 추'),
+('惆', '실심할 추'),
+('惆', '추'),
+('惇', '돈'),
+('惇', '두터울 돈'),
+('惉', 'ch''ŏm'),
+('惉', 'chem'),
+('惉', 'cheom'),
+('惉', '첨'),
+('惉', '팰 첨 '),
+('惋', ' 놀라 탄식할 완'),
+('惋', '완'),
+('惋', '한탄할 완'),
+('惏', '떨릴 람'),
+('惑', 'Hanja form of 혹 (“confusion”).'),
+('惑', 'Hanja form of 혹 (“confusion”). [affix]'),
+('惑', 'Hanja form of 혹 (“to beguile; to captivate”).'),
+('惑', 'Hanja form of 혹 (“to beguile; to captivate”). [verbal stem]'),
+('惑', '미혹할'),
+('惑', '미혹할 혹'),
+('惑', '혹'),
+('惓', '권'),
+('惓', '삼갈 권'),
+('惕', 'ch''ŏk'),
+('惕', 'chek'),
+('惕', 'cheok'),
+('惕', '두려워할 척'),
+('惕', '척'),
+('惖', 'ch''ŏk'),
+('惖', 'chek'),
+('惖', 'cheok'),
+('惖', '존경할 척'),
+('惖', '척'),
+('惘', '망'),
+('惘', '멍할 망'),
+('惙', 'anxiety'),
+('惙', 'ch''ŏl'),
+('惙', 'chel'),
+('惙', 'cheol'),
+('惙', 'to worry'),
+('惙', '근심할 철'),
+('惙', '철'),
+('惚', '홀'),
+('惚', '황홀할 홀'),
+('惛', 'hon'),
+('惛', '혼'),
+('惛', '흐릴 혼'),
+('惜', 'sek'),
+('惜', 'seok'),
+('惜', 'sŏk'),
+('惜', '석'),
+('惜', '아낄 석'),
+('惝', '멍할 창'),
+('惝', '창'),
+('惟', ' 생각할 유'),
+('惟', ' 오직 유'),
+('惟', 'yu'),
+('惟', '꾀할 유'),
+('惟', '유'),
+('惠', ' 사랑할 혜'),
+('惠', 'beautiful, fine'),
+('惠', 'good, gentle, nice'),
+('惠', 'grace, benefit, love'),
+('惠', 'wise, intelligent'),
+('惠', '은혜'),
+('惠', '은혜 혜'),
+('惠', '혜'),
+('惡', ' 부끄러울 오'),
+('惡', 'Hanja form of 악 (“evil; wickedness”).'),
+('惡', 'Hanja form of 악 (“evil; wickedness”). [noun]'),
+('惡', 'Hanja form of 오 (“to hate”).'),
+('惡', 'Hanja form of 오 (“to hate”). [affix]'),
+('惡', '나쁠 악'),
+('惡', '미워하다'),
+('惡', '미워할'),
+('惡', '미워할 오'),
+('惡', '악'),
+('惡', '악하다'),
+('惡', '악할'),
+('惡', '오'),
+('惢', '꽃술'),
+('惢', '솨'),
+('惢', '쇄'),
+('惢', '실망하는 모양'),
+('惢', '예'),
+('惢', '우'),
+('惢', '의심낼 솨 '),
+('惢', '의심하다'),
+('惢', '의심할'),
+('惣', 'ch''ong'),
+('惣', 'chong'),
+('惣', '摠의 譌字'),
+('惣', '총'),
+('惨', '참혹할 참'),
+('惪', 'deok'),
+('惪', 'tek'),
+('惪', 'tŏk'),
+('惪', '덕'),
+('惰', ' 태만할 타'),
+('惰', '게으를 타'),
+('惰', '타'),
+('惱', 'Hanja form of 뇌 (“angered, filled with hate”).'),
+('惱', '괴로워하다'),
+('惱', '괴로워할'),
+('惱', '괴로워할 뇌'),
+('惱', '뇌'),
+('惲', ' 혼후할 운'),
+('惲', 'un'),
+('惲', 'wun'),
+('惲', '운'),
+('惲', '의논할 운'),
+('想', 'Hanja form of 상 (“idea, thought”).'),
+('想', '상'),
+('想', '생각'),
+('想', '생각할 상'),
+('惴', '두려워할 췌'),
+('惴', '췌'),
+('惵', 'fear'),
+('惵', '접'),
+('惶', 'hwang'),
+('惶', '두려워할 황'),
+('惶', '황'),
+('惷', '어수선할 준'),
+('惷', '준'),
+('惸', '경'),
+('惸', '근심할 경'),
+('惹', ' 어지러울 야'),
+('惹', 'ya'),
+('惹', '끌릴 야'),
+('惹', '야'),
+('惺', ' 똑똑할 성'),
+('惺', ' 조용할 성'),
+('惺', '깨달을 성'),
+('惻', ' 감창할 측'),
+('惻', ' 불쌍할 측'),
+('惻', ' 아플 측'),
+('惻', '슬플 측'),
+('惻', '측'),
+('惼', ' 편협할 편'),
+('惼', 'narrow-minded'),
+('惼', '조급할 편'),
+('惼', '편'),
+('愀', '정색할 초'),
+('愀', '초'),
+('愁', ' 염려할 수'),
+('愁', ' 탄식할 수'),
+('愁', 'su'),
+('愁', 'swu'),
+('愁', '근심 수'),
+('愁', '수'),
+('愃', 'sen'),
+('愃', 'seon'),
+('愃', 'sŏn'),
+('愃', '선'),
+('愃', '쾌할 선'),
+('愆', ' 어기어질 건'),
+('愆', ' 허물 건'),
+('愆', '건'),
+('愆', '죄 건'),
+('愈', ' 더욱 유'),
+('愈', ' 병 나을 유'),
+('愈', ' 어질 유'),
+('愈', 'yu'),
+('愈', '나을 유'),
+('愈', '유'),
+('愉', ' 즐거울 유'),
+('愉', '기뻐할 유'),
+('愉', '유'),
+('愍', 'min'),
+('愍', '근심할 민'),
+('愍', '민'),
+('愎', ' 고집할 퍅'),
+('愎', 'Hanja form of 퍅 (“obstinate; stubborn; headstrong”).'),
+('愎', '강퍅하다'),
+('愎', '강퍅할'),
+('愎', '사나울 퍅'),
+('愎', '퍅'),
+('意', ' 생각 의'),
+('意', ' 의리 의'),
+('意', ' 형세 의'),
+('意', 'Alternative form of 噫 (“Hanja form of 희 (“sigh”).”)'),
+('意', 'Alternative form of 憶 (“Hanja form of 억 (“remember”).”)'),
+('意', 'Hanja form of 의 (“meaning”).'),
+('意', '기억하다'),
+('意', '기억할'),
+('意', '뜻'),
+('意', '뜻 의'),
+('意', '억'),
+('意', '의'),
+('意', '한숨 쉴'),
+('意', '희'),
+('愓', 'fast'),
+('愓', 'go faster'),
+('愓', 'sang'),
+('愓', '상'),
+('愔', ' 화평할 음'),
+('愔', 'eum'),
+('愔', 'um'),
+('愔', 'ŭm'),
+('愔', '음'),
+('愔', '조용할 음'),
+('愕', '놀랄 악'),
+('愕', '악'),
+('愚', ' 어두울 우'),
+('愚', ' 업신여길 우'),
+('愚', 'u'),
+('愚', 'wu'),
+('愚', '어리석을 우'),
+('愚', '우'),
+('愛', 'Hanja form of 애 (“love”).'),
+('愛', '사랑'),
+('愛', '사랑 애'),
+('愛', '애'),
+('愜', ' 뜻에 맞을 협'),
+('愜', 'be comfortable'),
+('愜', 'be satisfied'),
+('愜', '쾌할 협'),
+('愜', '협'),
+('感', ' 깨달을 감'),
+('感', ' 느낄 감'),
+('感', ' 찌를 감'),
+('感', 'Hanja form of 감 (“feeling”).'),
+('感', 'Hanja form of 감 (“feeling”). [noun; suffix]'),
+('感', '감'),
+('感', '감동할 감'),
+('感', '느끼다'),
+('感', '느낄'),
+('愠', 'on'),
+('愠', '慍의 俗字'),
+('愠', '온'),
+('愧', 'Hanja form of 괴 (“ashamed, conscience-stricken”).'),
+('愧', '괴'),
+('愧', '부끄러워하다'),
+('愧', '부끄러워할'),
+('愧', '부끄러워할 괴'),
+('愬', ' 알릴 소'),
+('愬', ' 참소할 소'),
+('愬', '고할 소'),
+('愬', '놀랍고두려울 색'),
+('愭', 'gi'),
+('愭', 'ki'),
+('愭', '공손할 기 '),
+('愭', '기'),
+('愰', 'hwang'),
+('愰', '밝을 황'),
+('愰', '황'),
+('愴', '슬퍼할 창'),
+('愴', '창'),
+('愷', ' 급할 개'),
+('愷', 'ease up'),
+('愷', 'enjoy'),
+('愷', 'peaceful'),
+('愷', '개'),
+('愷', '탐할 개'),
+('愼', ' 고요할 신'),
+('愼', ' 정성스러울 신'),
+('愼', '삼가다'),
+('愼', '삼갈'),
+('愼', '삼갈 신'),
+('愼', '신'),
+('愾', ' 성낼 개'),
+('愾', '한숨 쉴 개'),
+('愾', '한숨 희'),
+('愿', ' 삼갈 원'),
+('愿', ' 착할 원'),
+('愿', 'wen'),
+('愿', 'won'),
+('愿', 'wŏn'),
+('愿', '원'),
+('愿', '정성 원'),
+('慂', ' 거들어 말할 용'),
+('慂', '권할 용'),
+('慂', '용'),
+('慃', '앙'),
+('慃', '어그러지다'),
+('慃', '어그러질'),
+('慄', '두려워할 률'),
+('慆', 'delight'),
+('慆', 'do'),
+('慆', 'to'),
+('慆', '기뻐할 도'),
+('慆', '도'),
+('慇', ' 간절할 은'),
+('慇', ' 공손할 은'),
+('慇', '은'),
+('慇', '은근할 은'),
+('慈', 'ca'),
+('慈', 'cha'),
+('慈', 'ja'),
+('慈', '사랑할 자'),
+('慈', '자'),
+('慊', ' 불만족하게 생각할 겸'),
+('慊', ' 싫을 겸'),
+('慊', '앙심먹을 겸'),
+('慊', '족할 협'),
+('態', ' 뜻 태'),
+('態', 'manner, bearing, attitude'),
+('態', 't''ae'),
+('態', 'tae'),
+('態', 'thay'),
+('態', '모양 태'),
+('態', '태'),
+('慌', '어렴풋할 황'),
+('慌', '황'),
+('慍', ' 병 온'),
+('慍', '성낼 온'),
+('慍', '온'),
+('慒', 'chong'),
+('慒', 'cong'),
+('慒', 'jong'),
+('慒', '생각할 종 '),
+('慒', '종'),
+('慓', '급할 표 '),
+('慓', '표'),
+('慕', 'Hanja form of 모 (“admire”).'),
+('慕', 'Hanja form of 모 (“long for, desire”).'),
+('慕', '그리워하다'),
+('慕', '그리워할'),
+('慕', '그리워할 모'),
+('慕', '모'),
+('慘', '참혹할 참'),
+('慙', '부끄러울 참'),
+('慙', '참'),
+('慚', 'ch''am'),
+('慚', 'cham'),
+('慚', '부끄러울 참'),
+('慚', '참'),
+('慝', ' 간사할 특'),
+('慝', ' 더러울 특'),
+('慝', '간악할 특'),
+('慝', '특'),
+('慟', '서러울 통'),
+('慟', '통'),
+('慠', 'o'),
+('慠', '거만할 오 '),
+('慠', '오'),
+('慢', 'Hanja form of 만 (“slow, leisurely, sluggish”).'),
+('慢', '게으르다'),
+('慢', '게으를'),
+('慢', '게으를 만'),
+('慢', '만'),
+('慣', 'Hanja form of 관 (“custom; habit”).'),
+('慣', '관'),
+('慣', '버릇'),
+('慣', '버릇 관'),
+('慤', '각'),
+('慤', '삼갈 각'),
+('慧', ' 총명할 혜'),
+('慧', 'ability'),
+('慧', 'cunning, craft, wile'),
+('慧', 'wise, intelligent, bright, wisdom'),
+('慧', '슬기로울'),
+('慧', '슬기로울 혜'),
+('慧', '슬기롭다'),
+('慧', '혜'),
+('慨', ' 강개할 개'),
+('慨', ' 슬플 개'),
+('慨', 'gae'),
+('慨', 'kae'),
+('慨', 'kay'),
+('慨', '개'),
+('慨', '분할 개'),
+('慫', 'chong'),
+('慫', 'cong'),
+('慫', 'jong'),
+('慫', '권할 종'),
+('慫', '종'),
+('慮', 'Hanja form of 려/여 (“be concerned, worry about”).'),
+('慮', '려'),
+('慮', '생각하다'),
+('慮', '생각할'),
+('慮', '생각할 려'),
+('慮', '여'),
+('慰', 'Hanja form of 위 (“consolation”).'),
+('慰', '위'),
+('慰', '위로하다'),
+('慰', '위로할'),
+('慰', '위로할 위'),
+('慱', '근심할 단'),
+('慱', '단'),
+('慳', '간'),
+('慳', '아끼다'),
+('慳', '아낄'),
+('慳', '아낄 간'),
+('慴', ' 겁낼 습'),
+('慴', ' 겁낼 접'),
+('慴', '두려울 습'),
+('慴', '두려울 접'),
+('慵', '게으를 용'),
+('慵', '용'),
+('慶', ' 이에 강'),
+('慶', 'Hanja form of 경 (“celebration”).'),
+('慶', '경'),
+('慶', '경사'),
+('慶', '경사 경'),
+('慶', '복 강'),
+('慷', '강'),
+('慷', '강개할 강'),
+('慺', '정성스러울 루 '),
+('慼', 'ch''ŏk'),
+('慼', 'chek'),
+('慼', 'cheok'),
+('慼', '근심할 척'),
+('慼', '척'),
+('慽', 'ch''ŏk'),
+('慽', 'chek'),
+('慽', 'cheok'),
+('慽', '근심할 척'),
+('慽', '척'),
+('慾', ' 하고자할 욕'),
+('慾', 'yok'),
+('慾', '욕'),
+('慾', '욕심낼 욕'),
+('憁', ' 뜻 같지 않을 총 '),
+('憁', 'ch''ong'),
+('憁', 'chong'),
+('憁', '실심할 총'),
+('憁', '총'),
+('憂', ' 병 우'),
+('憂', ' 상제될 우'),
+('憂', 'u'),
+('憂', 'wu'),
+('憂', '근심 우'),
+('憂', '우'),
+('憃', '천치 용'),
+('憊', '고달플 비'),
+('憊', '비'),
+('憋', 'byeol'),
+('憋', 'pyel'),
+('憋', 'pyŏl'),
+('憋', '별'),
+('憋', '악할 별'),
+('憍', '교'),
+('憍', '교만할 교'),
+('憎', 'chŭng'),
+('憎', 'cung'),
+('憎', 'jeung'),
+('憎', '미워할 증'),
+('憎', '증'),
+('憐', 'Hanja form of 련/연 (“pity, sympathize”).'),
+('憐', '련'),
+('憐', '불쌍히 여길'),
+('憐', '불쌍히 여길 련'),
+('憐', '연'),
+('憑', 'Hanja form of 빙 (“lean”).'),
+('憑', '기대다'),
+('憑', '기대다 빙'),
+('憑', '기댈'),
+('憑', '빙'),
+('憒', 'be disturbed in mind'),
+('憒', 'foolish'),
+('憒', '궤'),
+('憒', '심란할 궤'),
+('憔', '수척할 초'),
+('憔', '초'),
+('憖', ' 공근할 은'),
+('憖', ' 서러워할 은'),
+('憖', ' 힘쓸 은'),
+('憖', '물을 은'),
+('憖', '은'),
+('憘', 'hui'),
+('憘', 'huy'),
+('憘', 'hŭi'),
+('憘', '憙의 古字'),
+('憘', '희'),
+('憙', '기뻐하다'),
+('憙', '기뻐할'),
+('憙', '성할 희'),
+('憙', '희'),
+('憚', ' 꺼릴 탄'),
+('憚', '수고로울 탄'),
+('憚', '탄'),
+('憝', 'don'),
+('憝', 'reproach'),
+('憝', 'to hate'),
+('憝', 'ton'),
+('憝', '돈'),
+('憤', 'Hanja form of 분 (“indignant”).'),
+('憤', 'Hanja form of 분 (“resent, hate”).'),
+('憤', '결낼 분'),
+('憤', '분'),
+('憤', '분할'),
+('憧', 'Hanja form of 동 (“longing, yearning”).'),
+('憧', '그리워하다'),
+('憧', '그리워할'),
+('憧', '동'),
+('憧', '동경할 동'),
+('憨', ' 미련할 감'),
+('憨', 'silly'),
+('憨', 'stupid'),
+('憨', '감'),
+('憨', '어리석을 감'),
+('憩', 'Hanja form of 게 (“to rest”).'),
+('憩', '게'),
+('憩', '쉬다'),
+('憩', '쉴'),
+('憩', '쉴 게'),
+('憫', 'Hanja form of 민 (“pity, sympathize with, grieve for”).'),
+('憫', '민'),
+('憫', '민망할'),
+('憫', '불쌍히 여길 민'),
+('憬', 'become conscious'),
+('憬', 'gyeong'),
+('憬', 'keyng'),
+('憬', 'kyŏng'),
+('憬', 'rouse, awaken'),
+('憬', '경'),
+('憬', '깨달을 경'),
+('憮', ' 애무할 무'),
+('憮', '무'),
+('憮', '어루만질 무'),
+('憯', '슬퍼할 참'),
+('憯', '참'),
+('憲', ' 고시할 헌'),
+('憲', ' 기뻐할 헌'),
+('憲', ' 표준될 헌'),
+('憲', 'Hanja form of 법 (“law”).'),
+('憲', '법'),
+('憲', '법 헌'),
+('憲', '헌'),
+('憶', 'ek'),
+('憶', 'eok'),
+('憶', 'memory'),
+('憶', 'reflect upon'),
+('憶', 'remember'),
+('憶', 'ŏk'),
+('憶', '생각 억'),
+('憶', '억'),
+('憸', 'sem'),
+('憸', 'seom'),
+('憸', 'sŏm'),
+('憸', '간사할 섬'),
+('憸', '섬'),
+('憺', '고요할 담'),
+('憺', '담'),
+('憻', 'Hanja form of 탄 (“to be generous”).'),
+('憻', '坦과 同字 '),
+('憻', '너그러울'),
+('憻', '너그럽다'),
+('憻', '탄'),
+('憼', 'gyeong'),
+('憼', 'kyeng'),
+('憼', 'kyŏng'),
+('憼', '경'),
+('憼', '공경할 경 '),
+('憾', ' 한할 감'),
+('憾', ' 한혐할 감'),
+('憾', '감'),
+('憾', '섭섭할 감'),
+('懂', '동'),
+('懂', '심란하다'),
+('懂', '심란할'),
+('懃', '근'),
+('懃', '은근할 근'),
+('懆', 'cho'),
+('懆', 'co'),
+('懆', 'jo'),
+('懆', '근심할 조'),
+('懆', '조'),
+('懇', 'gan'),
+('懇', 'kan'),
+('懇', '간'),
+('懇', '정성 간'),
+('懈', '게으를 해'),
+('懈', '해'),
+('應', ' 꼭 응'),
+('應', ' 대답할 응'),
+('應', ' 사랑할 응'),
+('應', 'Hanja form of 응 (“should; ought to”).'),
+('應', 'Hanja form of 응 (“to answer; to respond”).'),
+('應', '응'),
+('應', '응당 응'),
+('應', '응당(應當)'),
+('應', '응하다'),
+('應', '응할'),
+('懊', ' 번뇌할 오'),
+('懊', 'o'),
+('懊', '오'),
+('懊', '원망할 오'),
+('懋', ' 노력할 무'),
+('懋', '무'),
+('懋', '힘쓸 무'),
+('懌', 'yek'),
+('懌', 'yeok'),
+('懌', 'yŏk'),
+('懌', '기꺼울 역'),
+('懌', '역'),
+('懕', 'enough'),
+('懕', 'peaceful'),
+('懕', 'satisfied'),
+('懕', 'yem'),
+('懕', 'yeom'),
+('懕', 'yŏm'),
+('懕', '염'),
+('懕', '편안할 염'),
+('懗', 'ha'),
+('懗', '속일 하 '),
+('懗', '하'),
+('懞', '몽'),
+('懞', '어두울 몽 '),
+('懟', 'dae'),
+('懟', 'tae'),
+('懟', 'tay'),
+('懟', '대'),
+('懟', '원망할 대'),
+('懣', 'be sick at heart'),
+('懣', 'sorrowful, sad'),
+('懣', '문'),
+('懣', '번거로울 문'),
+('懦', ' 나약할 유'),
+('懦', '나약할 나'),
+('懦', '만만할 유'),
+('懲', '징'),
+('懲', '혼날 징'),
+('懶', '게으를 라'),
+('懶', '게으를 란'),
+('懶', '나'),
+('懶', '난'),
+('懶', '라'),
+('懶', '란'),
+('懷', 'hoe'),
+('懷', 'hoy'),
+('懷', '품을 회'),
+('懷', '회'),
+('懸', ' 멀 현'),
+('懸', '매달'),
+('懸', '매달 현'),
+('懸', '매달다'),
+('懸', '현'),
+('懺', 'ch''am'),
+('懺', 'cham'),
+('懺', '뉘우칠 참'),
+('懺', '참'),
+('懼', 'Hanja form of 구 (“fear, be afraid of, dread”).'),
+('懼', '구'),
+('懼', '두려워하다'),
+('懼', '두려워할'),
+('懼', '두려워할 구'),
+('懽', '기뻐할 환'),
+('懽', '환'),
+('懾', ' 두려울 섭'),
+('懾', 'seop'),
+('懾', 'sep'),
+('懾', 'sŏp'),
+('懾', '무서울 섭'),
+('懾', '섭'),
+('懿', ' 클 의'),
+('懿', 'ui'),
+('懿', 'uy'),
+('懿', 'ŭi'),
+('懿', '아름다울 의'),
+('懿', '의'),
+('戀', 'Hanja form of 련/연 (“long for, yearn for”).'),
+('戀', 'Hanja form of 련/연 (“love”).'),
+('戀', '련'),
+('戀', '사모할'),
+('戀', '사모할 련'),
+('戀', '연'),
+('戄', 'be surprised'),
+('戄', 'confusion'),
+('戄', 'hwak'),
+('戄', '확'),
+('戇', 'dang'),
+('戇', 'tang'),
+('戇', '당'),
+('戇', '어리석을 당'),
+('戈', '과'),
+('戈', '창'),
+('戈', '창 과'),
+('戉', '도끼'),
+('戉', '월'),
+('戊', ' 무성할 무'),
+('戊', 'Hanja form of 무 (“fifth heavenly stem”).'),
+('戊', '다섯째 천간'),
+('戊', '다섯째 천간 무'),
+('戊', '무'),
+('戌', ' 때려 부술 술'),
+('戌', ' 열한째 지지 술'),
+('戌', '11th terrestrial branch'),
+('戌', '개 술'),
+('戌', '술'),
+('戍', ' 막을 수'),
+('戍', ' 집 수'),
+('戍', 'su'),
+('戍', 'swu'),
+('戍', '수'),
+('戍', '수자리 수'),
+('戎', ' 너 융'),
+('戎', ' 도울 융'),
+('戎', ' 서쪽 오랑캐 융'),
+('戎', ' 싸움수레 융'),
+('戎', ' 클 융'),
+('戎', 'armaments'),
+('戎', 'arms'),
+('戎', 'military affair'),
+('戎', 'yung'),
+('戎', '병장기 융'),
+('戎', '융'),
+('成', ' 거듭 성'),
+('成', ' 마칠 성'),
+('成', ' 화목할 성'),
+('成', 'Hanja form of 성 (“accomplishment”).'),
+('成', '성'),
+('成', '이룰'),
+('成', '이룰 성'),
+('我', 'Hanja form of 아 (“I; me”).'),
+('我', 'Hanja form of 아 (“we; us; our”).'),
+('我', '나'),
+('我', '아'),
+('我', '자기 아'),
+('戒', 'Hanja form of 계 (“caution, warn”).'),
+('戒', '경계하다'),
+('戒', '경계할'),
+('戒', '경계할 계'),
+('戒', '계'),
+('戔', '쌓일 잔'),
+('戔', '잔'),
+('戕', 'hurt'),
+('戕', 'injure'),
+('戕', 'kill'),
+('戕', 'slay'),
+('戕', 'wound'),
+('戕', '장'),
+('戕', '죽이다'),
+('戕', '죽일'),
+('戕', '죽일 장'),
+('或', 'hok'),
+('或', '혹'),
+('或', '혹 혹'),
+('戚', 'Hanja form of 척 (“grieve”).'),
+('戚', 'Hanja form of 척 (“kin; relative”).'),
+('戚', '겨레 척'),
+('戚', '척'),
+('戚', '친척'),
+('戝', 'cek'),
+('戝', 'chŏk'),
+('戝', 'jeok'),
+('戝', '적'),
+('戞', '알'),
+('戞', '창 알'),
+('戟', 'Hanja form of 극 (“Ji, halberd used in ancient China”).'),
+('戟', '갈래진 창 극'),
+('戟', '극'),
+('戠', 'clay'),
+('戠', 'si'),
+('戠', '시'),
+('戡', ' 이길 감'),
+('戡', ' 죽일 감'),
+('戡', 'gam'),
+('戡', 'kam'),
+('戡', 'kill'),
+('戡', 'subdue, quell'),
+('戡', 'subjugate'),
+('戡', '감'),
+('戡', '찌를 감'),
+('戢', 'store up'),
+('戢', 'to cease'),
+('戢', 'to put away'),
+('戢', '그칠 집'),
+('戢', '집'),
+('戦', '戰과 同字'),
+('戧', '다칠 창'),
+('戧', '창'),
+('戩', 'cen'),
+('戩', 'chŏn'),
+('戩', 'jeon'),
+('戩', '전'),
+('截', ' 말 잘할 절'),
+('截', 'Hanja form of 절 (“sever”).'),
+('截', '끊다'),
+('截', '끊을'),
+('截', '끊을 절'),
+('截', '절'),
+('戮', '죽일 륙'),
+('戯', 'Alternative form of 戲/戱 (“Hanja form of 희 (“play”).”)'),
+('戯', '戱의 俗字'),
+('戯', '戲의 俗字'),
+('戯', '희'),
+('戯', '희롱하다'),
+('戯', '희롱할'),
+('戰', ' 경쟁할 전'),
+('戰', 'Hanja form of 전 (“fight”).'),
+('戰', '싸울'),
+('戰', '싸움 전'),
+('戰', '전'),
+('戱', ' 대장 깃발 휘'),
+('戱', 'Alternative form of 戲 (“Hanja form of 희 (“play”).”)'),
+('戱', '戲의 俗字'),
+('戱', '기 휘'),
+('戱', '희'),
+('戱', '희롱하다'),
+('戱', '희롱할'),
+('戲', 'Alternative form of 呼 (“Hanja form of 호 (“shout; sigh”).”)'),
+('戲', 'Alternative form of 麾 (“Hanja form of 휘 (“banner”).”)'),
+('戲', 'Hanja form of 희 (“play”).'),
+('戲', '기'),
+('戲', '놀이'),
+('戲', '서러울'),
+('戲', '서럽다'),
+('戲', '탄식하다'),
+('戲', '탄식할'),
+('戲', '탄식할 희'),
+('戲', '호'),
+('戲', '휘'),
+('戲', '희'),
+('戲', '희롱하다'),
+('戲', '희롱할'),
+('戳', 'ch''ak'),
+('戳', 'chak'),
+('戳', '착'),
+('戳', '창으로 찌를 착'),
+('戴', 'Hanja form of 대 (“to esteem”).'),
+('戴', '대'),
+('戴', '받들 대'),
+('戴', '이다'),
+('戴', '일'),
+('戵', 'gu'),
+('戵', 'ku'),
+('戵', 'kwu'),
+('戵', '구'),
+('戵', '창 구'),
+('戶', 'hole'),
+('戶', 'house'),
+('戶', '지게 호'),
+('戶', '지게문'),
+('戶', '호'),
+('戹', '액'),
+('戹', '재앙'),
+('戹', '좁다'),
+('戹', '좁을'),
+('戹', '좁을 액'),
+('戻', '수레 옆문 려'),
+('戾', ' 휘어질 렬'),
+('戾', '어그러질 렬'),
+('戾', '여그러질 려'),
+('房', 'Hanja form of 방 (“room”).'),
+('房', '방'),
+('房', '방 방'),
+('所', ' 가질 소'),
+('所', ' 곳 소'),
+('所', ' 얼마 소'),
+('所', ' 쯤 소'),
+('所', 'Hanja form of 소 (“place”).'),
+('所', '바'),
+('所', '바 소'),
+('所', '소'),
+('扁', ' 거룻배 편'),
+('扁', ' 모난 그릇 변'),
+('扁', ' 비천할 변'),
+('扁', 'Hanja form of 편 (“small; flat”).'),
+('扁', '작다'),
+('扁', '작을'),
+('扁', '특별할 편'),
+('扁', '편'),
+('扁', '현판 변'),
+('扂', 'door latch'),
+('扂', '점'),
+('扃', 'bolt for fastening a door from outside'),
+('扃', '경'),
+('扃', '빗장 경'),
+('扇', 'Hanja form of 선 (“fan”).'),
+('扇', '부채'),
+('扇', '사립문 선'),
+('扇', '선'),
+('扈', '뒤따를 호'),
+('扈', '호'),
+('扉', 'bi'),
+('扉', 'pi'),
+('扉', '문짝 비'),
+('扉', '비'),
+('扊', 'yem'),
+('扊', 'yeom'),
+('扊', 'yŏm'),
+('扊', '문 빗장 염'),
+('扊', '염'),
+('手', ' 잡을 수'),
+('手', ' 칠 수'),
+('手', 'Hanja form of 수 (“hand”).'),
+('手', 'Hanja form of 수 (“suffix related to one''s skill or occupation”).'),
+('手', '손'),
+('手', '손 수'),
+('手', '수'),
+('才', ' 능할 재'),
+('才', ' 바탕 재'),
+('才', ' 현인 재'),
+('才', 'Hanja form of 재 (“talent”).'),
+('才', '재'),
+('才', '재주'),
+('才', '재주 재'),
+('扎', '뺄 찰'),
+('扎', '찰'),
+('扑', '칠 복'),
+('扒', '배'),
+('扒', '뺄 배'),
+('打', 'Hanja form of 타 (“hit; strike”).'),
+('打', '때릴 타'),
+('打', '칠'),
+('打', '칠 정'),
+('打', '타'),
+('払', '拂의 略字'),
+('払', '떨칠 불'),
+('扗', '재'),
+('托', ' 떡국 탁'),
+('托', ' 차반 탁'),
+('托', '밀칠 탁'),
+('托', '탁'),
+('扛', '강'),
+('扛', '마주 들 강'),
+('扞', 'han'),
+('扞', '막을 한'),
+('扞', '한'),
+('扣', '고'),
+('扣', '구'),
+('扣', '두드리다'),
+('扣', '두드릴'),
+('扣', '두드릴 구'),
+('扨', 'pick up with fork or pincers'),
+('扨', '그러하나 인'),
+('扨', '인'),
+('扮', '꾸밀 반'),
+('扮', '꾸밀 분'),
+('扯', 'ch''a'),
+('扯', 'cha'),
+('扯', '찢어버릴 차'),
+('扯', '차'),
+('扱', ' 깊을 삽'),
+('扱', ' 당길 삽'),
+('扱', ' 들 삽'),
+('扱', 'Hanja form of 급 (“handle”).'),
+('扱', '거둘 삽'),
+('扱', '급'),
+('扱', '미치다'),
+('扱', '미칠'),
+('扱', '미칠 급'),
+('扳', 'ban'),
+('扳', 'pan'),
+('扳', '끌 반'),
+('扳', '반'),
+('扶', 'Alternative form of 匍 (“Hanja form of 포 (“to crawl; to creep”).”)'),
+('扶', 'Hanja form of 부 (“to help”).'),
+('扶', '기어가다'),
+('扶', '기어갈'),
+('扶', '도울'),
+('扶', '도울 부'),
+('扶', '돕다'),
+('扶', '부'),
+('扶', '포'),
+('批', '거스를 별'),
+('批', '칠 비'),
+('扺', '손바닥 지 '),
+('扺', '지'),
+('扼', 'aek'),
+('扼', 'ayk'),
+('扼', '액'),
+('扼', '움켜쥘 액'),
+('找', '삿대질하다'),
+('找', '삿대질할'),
+('找', '조'),
+('找', '채우다'),
+('找', '채울'),
+('找', '채울 조'),
+('找', '화'),
+('承', ' 도울 승'),
+('承', ' 이을 승'),
+('承', ' 차례 승'),
+('承', 'Alternative form of 拯 (“Hanja form of 증 (“help”).”)'),
+('承', 'Hanja form of 승 (“inherit”).'),
+('承', '건지다'),
+('承', '건질'),
+('承', '받들 승'),
+('承', '승'),
+('承', '이을'),
+('承', '잇다'),
+('承', '증'),
+('技', 'Hanja form of 기 (“skill”).'),
+('技', '기'),
+('技', '재주'),
+('技', '재주 기'),
+('抃', 'to cheer'),
+('抃', 'to clap hands'),
+('抃', '변'),
+('抃', '손뼉칠 변'),
+('抄', 'ch''o'),
+('抄', 'cho'),
+('抄', '베낄 초'),
+('抄', '초'),
+('抆', ' 문지를 문'),
+('抆', '닦을 문'),
+('抆', '문'),
+('抉', ' 당길 결'),
+('抉', 'choose, select'),
+('抉', 'gouge, pluck out'),
+('抉', 'gyeol'),
+('抉', 'kyel'),
+('抉', 'kyŏl'),
+('抉', '결'),
+('抉', '긁을 결'),
+('把', ' 헤칠 파'),
+('把', 'Hanja form of 파 (“to take; to hold”).'),
+('把', '잡다'),
+('把', '잡을'),
+('把', '잡을 파'),
+('把', '파'),
+('抑', ' 억울할 억'),
+('抑', 'ek'),
+('抑', 'eok'),
+('抑', 'ŏk'),
+('抑', '누를 억'),
+('抑', '억'),
+('抒', ' 북 저'),
+('抒', '당길 저'),
+('抒', '풀 서'),
+('抓', '긁을 조'),
+('抓', '조'),
+('抔', '부'),
+('抔', '움킬 부'),
+('投', ' 버릴 투'),
+('投', ' 의탁할 투'),
+('投', ' 줄 투'),
+('投', '던질 투'),
+('投', '투'),
+('抖', 'du'),
+('抖', 'give shake'),
+('抖', 'tremble, shake, rouse'),
+('抖', 'tu'),
+('抖', 'twu'),
+('抖', '두'),
+('抖', '퍼주거릴 두'),
+('抗', ' 겨룰 항'),
+('抗', ' 들 항'),
+('抗', 'Hanja form of 항 (“fight against”).'),
+('抗', '막다'),
+('抗', '막을'),
+('抗', '막을 항'),
+('抗', '항'),
+('折', ' 알맞을 절'),
+('折', ' 자를 절'),
+('折', ' 휘일 절'),
+('折', '꺾을 절'),
+('折', '천천히 할 제'),
+('抛', 'Alternative form of 拋 (“Hanja form of 포 (“to throw”).”)'),
+('抛', '拋와 同字'),
+('抛', '던지다'),
+('抛', '던질'),
+('抛', '포'),
+('抜', '拔와 同字'),
+('抜', '拔의 俗字'),
+('択', '擇의 略字'),
+('抨', '탄핵할 평'),
+('抨', '평'),
+('披', ' 찢어질 피'),
+('披', ' 흩어질 피'),
+('披', 'p''i'),
+('披', 'phi'),
+('披', 'pi'),
+('披', '피'),
+('披', '헤칠 피'),
+('抬', '칠 태'),
+('抬', '태'),
+('抱', ' 낄 포'),
+('抱', ' 품을 포'),
+('抱', '안다'),
+('抱', '안을'),
+('抱', '안을 포'),
+('抱', '포'),
+('抳', '가리키다'),
+('抳', '가리킬'),
+('抳', '니'),
+('抵', ' 다달을 저'),
+('抵', ' 당할 저'),
+('抵', ' 막을 저'),
+('抵', ' 씨름할 저'),
+('抵', '밀칠 저'),
+('抵', '칠 지'),
+('抹', 'mal'),
+('抹', '말'),
+('抹', '바랄 말'),
+('抻', 'sin'),
+('抻', '늘이다: stretch'),
+('抻', '신'),
+('押', ' 누를 압'),
+('押', ' 단속할 갑'),
+('押', ' 잡아들일 갑'),
+('押', '도울 갑'),
+('押', '수결 둘 압'),
+('抽', ' 거둘 추'),
+('抽', ' 당길 추'),
+('抽', ' 뽑을 추'),
+('抽', '뺄 추'),
+('抽', '추'),
+('拂', 'Hanja form of 불 (“shake off, brush away, dust”).'),
+('拂', 'Hanja form of 필 (“help, aid, assist”).'),
+('拂', '도울'),
+('拂', '도울 필'),
+('拂', '돕다'),
+('拂', '떨 불'),
+('拂', '떨치다'),
+('拂', '떨칠'),
+('拂', '불'),
+('拂', '필'),
+('拄', 'chu'),
+('拄', 'cwu'),
+('拄', 'ju'),
+('拄', '떠받칠 주'),
+('拄', '주'),
+('担', 'dan'),
+('担', 'tan'),
+('担', '단'),
+('担', '원숭이 같은 짐승 단'),
+('拆', ' 열릴 탁'),
+('拆', ' 찢어질 탁'),
+('拆', '탁'),
+('拆', '터질 탁'),
+('拇', 'big toe'),
+('拇', 'thumb'),
+('拇', '무'),
+('拇', '엄지손가락 무'),
+('拈', '집을 념'),
+('拉', 'Hanja form of 랍/납 (“to pull”).'),
+('拉', '꺽을 랍'),
+('拉', '끌'),
+('拉', '끌다'),
+('拉', '납'),
+('拉', '랍'),
+('拊', 'bu'),
+('拊', 'pu'),
+('拊', '부'),
+('拊', '어루만질 부'),
+('拋', ' 돌소뇌 포'),
+('拋', ' 버릴 포'),
+('拋', '던질 포'),
+('拋', '포'),
+('拌', 'ban'),
+('拌', 'pan'),
+('拌', '반'),
+('拌', '버릴 반'),
+('拍', 'Hanja form of 박 (“beat, rhythm”).'),
+('拍', 'Hanja form of 박 (“clap, tap, beat”).'),
+('拍', 'Hanja form of 박 (“shoulder”).'),
+('拍', '박'),
+('拍', '어깨'),
+('拍', '치다'),
+('拍', '칠'),
+('拍', '칠 박'),
+('拏', 'na'),
+('拏', '나'),
+('拏', '붙잡을 나'),
+('拐', 'Hanja form of 괴 (“kidnap; abduct; falsify”).'),
+('拐', '괴'),
+('拐', '속이다'),
+('拐', '속일'),
+('拐', '속일 괴'),
+('拑', 'tie down or pin down'),
+('拑', 'to clamp'),
+('拑', '겸'),
+('拑', '자갈 먹일 겸'),
+('拒', ' 다다를 거'),
+('拒', ' 다닥칠 거'),
+('拒', ' 맞설 거'),
+('拒', '막을 거'),
+('拒', '진이름 구'),
+('拓', ' 밀칠 탁'),
+('拓', ' 헤칠 탁'),
+('拓', 'Hanja form of 척 (“to open; to develop; to expand”).'),
+('拓', 'Hanja form of 탁 (“to make rubbings on something (e.g. inscriptions)”).'),
+('拓', '넓히다'),
+('拓', '넓힐'),
+('拓', '물리칠 탁'),
+('拓', '박다'),
+('拓', '박을'),
+('拓', '주울 척'),
+('拓', '척'),
+('拓', '탁'),
+('拔', ' 휘어 꺾을 패'),
+('拔', 'Hanja form of 발 (“pull, pick, pluck, uproot”).'),
+('拔', 'Hanja form of 패 (“thick, overgrown”).'),
+('拔', '무성하다'),
+('拔', '무성할'),
+('拔', '밋밋할 패'),
+('拔', '발'),
+('拔', '뺄 발'),
+('拔', '뽑다'),
+('拔', '뽑을'),
+('拔', '패'),
+('拕', ' 당길 타'),
+('拕', 't''a'),
+('拕', 'ta'),
+('拕', 'tha'),
+('拕', 'to drag'),
+('拕', 'to haul'),
+('拕', '끌 타'),
+('拕', '타'),
+('拖', 'Hanja form of 타 (“to drag”).'),
+('拖', '拕와 同字'),
+('拖', '끌'),
+('拖', '타'),
+('拗', 'yo'),
+('拗', '고집스러울 요'),
+('拗', '요'),
+('拘', 'Hanja form of 구 (“restrain, seize, detain”).'),
+('拘', '구'),
+('拘', '잡다'),
+('拘', '잡을'),
+('拘', '잡을 구'),
+('拙', 'chol'),
+('拙', 'col'),
+('拙', 'jol'),
+('拙', '서툴 졸'),
+('拙', '졸'),
+('招', '들 교'),
+('招', '부를 초'),
+('拜', 'Hanja form of 배 (“do obeisance; bow; kowtow”).'),
+('拜', 'Hanja form of 배 (“worship”).'),
+('拜', '배'),
+('拜', '절'),
+('拜', '절 배'),
+('拠', '據의 俗字'),
+('拡', '擴의 略字'),
+('拨', '撥의 簡體字'),
+('括', 'Hanja form of 괄 (“inclusion; encompass”).'),
+('括', '괄'),
+('括', '묶다'),
+('括', '묶을'),
+('括', '묶을 괄'),
+('拭', ' 다듬을 식'),
+('拭', 'Hanja form of 식 (“to wipe”).'),
+('拭', '닦을 식'),
+('拭', '식'),
+('拭', '씻다'),
+('拭', '씻을'),
+('拮', ' 열심히 일할 결'),
+('拮', '길거할 결'),
+('拮', '일할 길'),
+('拯', 'chŭng'),
+('拯', 'cung'),
+('拯', 'help, save, aid'),
+('拯', 'jeung'),
+('拯', 'lift, raise'),
+('拯', '건질 증'),
+('拯', '증'),
+('拱', 'bow, salute'),
+('拱', 'fold hands on breast'),
+('拱', 'gong'),
+('拱', 'kong'),
+('拱', '공'),
+('拱', '두 손 맞잡을 공'),
+('拳', 'Hanja form of 권 (“fist”).'),
+('拳', '권'),
+('拳', '주먹'),
+('拳', '주먹 권'),
+('拵', 'chon'),
+('拵', 'con'),
+('拵', 'jon'),
+('拵', '꽂을 존'),
+('拵', '존'),
+('拶', '찰'),
+('拶', '핍박할 찰'),
+('拷', 'go'),
+('拷', 'ko'),
+('拷', '가질 고'),
+('拷', '고'),
+('拼', '병'),
+('拼', '좇을 평'),
+('拽', 'ye'),
+('拽', 'yey'),
+('拽', '당길 예'),
+('拽', '예'),
+('拾', ' 거둘 습'),
+('拾', ' 벼슬이름 습'),
+('拾', ' 팔찌 습'),
+('拾', 'Alternative form of 十 (“Hanja form of 십 (“ten”).”)'),
+('拾', 'Hanja form of 섭 (“climb up”).'),
+('拾', 'Hanja form of 습 (“pick up”).'),
+('拾', '十의 갖은자'),
+('拾', '섭'),
+('拾', '습'),
+('拾', '십'),
+('拾', '열'),
+('拾', '오르다'),
+('拾', '오를'),
+('拾', '주울'),
+('拾', '주울 습'),
+('拾', '줍다'),
+('拿', 'Hanja form of 나 (“to take”).'),
+('拿', '나'),
+('拿', '붙잡을 나'),
+('拿', '잡다'),
+('拿', '잡을'),
+('持', '가질 지'),
+('持', '지'),
+('挂', 'gwae'),
+('挂', 'kwae'),
+('挂', 'kway'),
+('挂', '괘'),
+('挂', '그림족자 괘'),
+('指', 'Hanja form of 지 (“finger”).'),
+('指', '손가락'),
+('指', '손가락 지'),
+('指', '지'),
+('挈', '끊을 계'),
+('挈', '손에들 설'),
+('按', ' 어루만질 안'),
+('按', '막을 알'),
+('按', '살필 안'),
+('挌', ' 들 격'),
+('挌', 'gyeok'),
+('挌', 'kyek'),
+('挌', 'kyŏk'),
+('挌', '격'),
+('挌', '칠 격'),
+('挐', '붙잡을 나'),
+('挐', '이끌 녀'),
+('挑', 'Hanja form of 도/조 (“a load carried on the shoulders”).'),
+('挑', 'Hanja form of 도/조 (“carry”).'),
+('挑', '기리다'),
+('挑', '기릴'),
+('挑', '도'),
+('挑', '돋우다'),
+('挑', '돋울'),
+('挑', '돋울 조'),
+('挑', '돋을 도'),
+('挑', '조'),
+('挨', 'ae'),
+('挨', 'ay'),
+('挨', '밀칠 애'),
+('挨', '애'),
+('挪', 'na'),
+('挪', '나'),
+('挪', '옮길 나'),
+('挫', 'Hanja form of 좌 (“to bend; to flex”).'),
+('挫', '꺽을 좌'),
+('挫', '꺾다'),
+('挫', '꺾을'),
+('挫', '좌'),
+('振', 'Raise, excite'),
+('振', 'chin'),
+('振', 'cin'),
+('振', '떨칠 진'),
+('振', '진'),
+('挹', ' 잔질할 읍'),
+('挹', 'eup'),
+('挹', 'to bale out'),
+('挹', 'to decant liquids'),
+('挹', 'up'),
+('挹', 'ŭp'),
+('挹', '읍'),
+('挹', '잡아당길 읍'),
+('挺', ' 너그러울 정'),
+('挺', ' 향초이름 정'),
+('挺', 'ceng'),
+('挺', 'chŏng'),
+('挺', 'jeong'),
+('挺', '빼어날 정'),
+('挺', '정'),
+('挻', ' 달아날 연'),
+('挻', ' 손바닥으로 칠 연 '),
+('挻', 'yen'),
+('挻', 'yeon'),
+('挻', 'yŏn'),
+('挻', '당길 연'),
+('挻', '연'),
+('挽', '당길 만'),
+('挽', '만'),
+('挾', ' 도울 협'),
+('挾', ' 품을 협'),
+('挾', 'hyeop'),
+('挾', 'hyep'),
+('挾', 'hyŏp'),
+('挾', '낄 협'),
+('挾', '협'),
+('捂', ' 거스릴 오'),
+('捂', 'o'),
+('捂', '부닥칠 오'),
+('捂', '오'),
+('捃', 'gun'),
+('捃', 'kun'),
+('捃', 'kwun'),
+('捃', '군'),
+('捃', '주울 군 '),
+('捄', 'gu'),
+('捄', 'ku'),
+('捄', 'kwu'),
+('捄', '구'),
+('捄', '흙파올릴 구'),
+('捆', 'bind'),
+('捆', 'bundle'),
+('捆', 'tie up'),
+('捆', 'truss up'),
+('捆', '곤'),
+('捆', '두드릴 곤'),
+('捉', 'ch''ak'),
+('捉', 'chak'),
+('捉', '잡을 착'),
+('捉', '착'),
+('捌', ' 나눌 팔'),
+('捌', ' 칠 팔'),
+('捌', 'p''al'),
+('捌', 'pal'),
+('捌', 'phal'),
+('捌', '깨뜨릴 팔'),
+('捌', '팔'),
+('捍', 'han'),
+('捍', '막을 한'),
+('捍', '한'),
+('捎', ' 버릴 소'),
+('捎', ' 추릴 소'),
+('捎', ' 흔들거릴 소'),
+('捎', 'so'),
+('捎', '덜 소'),
+('捎', '소'),
+('捏', 'Hanja form of 날 (“knead”).'),
+('捏', '꾸미다'),
+('捏', '꾸밀'),
+('捏', '날'),
+('捏', '이길 날'),
+('捐', ' 병들어 죽을 연'),
+('捐', 'yen'),
+('捐', 'yeon'),
+('捐', 'yŏn'),
+('捐', '버릴 연'),
+('捐', '연'),
+('捕', '사로잡을 포'),
+('捕', '포'),
+('捗', 'ch''ŏk'),
+('捗', 'chek'),
+('捗', 'cheok'),
+('捗', '거둘 척'),
+('捗', '척'),
+('捘', 'chun'),
+('捘', 'jun'),
+('捘', '준'),
+('捛', 'Alternative form of 旅'),
+('捛', '려'),
+('捛', '스승'),
+('捛', '여'),
+('换', '換과 同字'),
+('捥', 'arm'),
+('捥', 'wan'),
+('捥', '완'),
+('捧', '받들 봉'),
+('捧', '봉'),
+('捨', 'sa'),
+('捨', '버릴 사'),
+('捨', '사'),
+('捩', '비틀 렬'),
+('捫', ' 쓰다듬을 문'),
+('捫', '문'),
+('捫', '어루만질 문'),
+('据', ' 길거할 거'),
+('据', ' 손병 거'),
+('据', ' 의지할 거'),
+('据', 'geo'),
+('据', 'ke'),
+('据', 'kŏ'),
+('据', '가질 거'),
+('据', '거'),
+('捱', 'ae'),
+('捱', 'ay'),
+('捱', '막을 애'),
+('捱', '애'),
+('捲', '거둘 권'),
+('捲', '권'),
+('捶', ' 짓찧을 추'),
+('捶', 'ch''u'),
+('捶', 'chu'),
+('捶', 'chwu'),
+('捶', '종아리 칠 추'),
+('捶', '추'),
+('捷', 'To be quick; to win.'),
+('捷', 'ch''ŏp'),
+('捷', 'cheop'),
+('捷', 'chep'),
+('捷', '이길 첩'),
+('捷', '첩'),
+('捺', '날'),
+('捺', '누를 날'),
+('捻', '비틀 념'),
+('捻', '비틀 녑'),
+('捽', 'chol'),
+('捽', 'jol'),
+('捽', '졸'),
+('捿', 'se'),
+('捿', 'seo'),
+('捿', 'sŏ'),
+('捿', '깃들일 서'),
+('捿', '서'),
+('掀', 'heun'),
+('掀', 'hun'),
+('掀', 'hŭn'),
+('掀', '치켜들 흔'),
+('掀', '흔'),
+('掃', ' 상투 소'),
+('掃', 'Hanja form of 소 (“sweep”).'),
+('掃', '소'),
+('掃', '쓸'),
+('掃', '쓸 소'),
+('掃', '쓸다'),
+('掄', '가릴 륜'),
+('掇', 'ch''ŏl'),
+('掇', 'chel'),
+('掇', 'cheol'),
+('掇', 'gather up'),
+('掇', 'pick up'),
+('掇', '주울 철'),
+('掇', '철'),
+('授', ' 부칠 수'),
+('授', 'Hanja form of 수 (“give”).'),
+('授', '수'),
+('授', '주다'),
+('授', '줄'),
+('授', '줄 수'),
+('掉', '도'),
+('掉', '흔들 도'),
+('掊', 'collect'),
+('掊', 'deep'),
+('掊', 'exploit'),
+('掊', 'gather'),
+('掊', 'push apart'),
+('掊', '그러모을 부'),
+('掊', '부'),
+('掌', 'Hanja form of 장 (“palm of the hand”).'),
+('掌', '손바닥'),
+('掌', '손바닥 장'),
+('掌', '장'),
+('掎', 'gi'),
+('掎', 'ki'),
+('掎', '기'),
+('掎', '끌 기'),
+('掏', '가릴(선택)할 도'),
+('掏', '도'),
+('排', 'Hanja form of 배 (“row, rank, line”).'),
+('排', '밀치다'),
+('排', '밀칠'),
+('排', '밀칠 배'),
+('排', '배'),
+('掖', '겨드랑이에 낄 액'),
+('掖', '액'),
+('掘', '뚫을 궐'),
+('掘', '팔 굴'),
+('掛', 'Hanja form of 괘 (“to hang; to suspend; to divide”).'),
+('掛', '걸'),
+('掛', '걸 괘'),
+('掛', '걸다'),
+('掛', '괘'),
+('掜', ' 당길 예 '),
+('掜', ' 비길 예'),
+('掜', ' 잡을 예'),
+('掜', 'ye'),
+('掜', 'yey'),
+('掜', '부칠 예'),
+('掜', '예'),
+('掟', 'ceng'),
+('掟', 'chŏng'),
+('掟', 'jeong'),
+('掟', '둘러칠 정'),
+('掟', '정'),
+('掠', 'Hanja form of 략/약 (“pass by”).'),
+('掠', 'Hanja form of 략/약 (“rob, ransack, plunder”).'),
+('掠', 'Hanja form of 량/양 (“flog, beat”).'),
+('掠', '노략질하다'),
+('掠', '노략질할'),
+('掠', '노략질할 략'),
+('掠', '략'),
+('掠', '량'),
+('掠', '볼기칠'),
+('掠', '볼기칠 량'),
+('掠', '약'),
+('掠', '양'),
+('採', 'ch''ae'),
+('採', 'chae'),
+('採', 'chay'),
+('採', '채'),
+('採', '캘 채'),
+('探', ' 염탐할 탐'),
+('探', ' 찾을 탐'),
+('探', ' 취할 탐'),
+('探', 'Hanja form of 탐 (“search”).'),
+('探', '더듬을 탐'),
+('探', '찾다'),
+('探', '찾을'),
+('探', '탐'),
+('掣', '끌 철'),
+('掣', '끌어당길 체'),
+('接', ' 잇닿을 접'),
+('接', 'Hanja form of 접 (“touch”).'),
+('接', '사귈 접'),
+('接', '이을'),
+('接', '잇다'),
+('接', '접'),
+('控', '당길 공'),
+('控', '칠 강'),
+('推', ' 가릴 추'),
+('推', ' 궁구할 추'),
+('推', '밀 퇴'),
+('推', '옮길 추'),
+('掩', ' 가릴 엄'),
+('掩', 'em'),
+('掩', 'eom'),
+('掩', 'ŏm'),
+('掩', '거둘 엄'),
+('掩', '엄'),
+('措', '둘 조'),
+('措', '둘 책'),
+('掬', 'guk'),
+('掬', 'kuk'),
+('掬', 'kwuk'),
+('掬', '국'),
+('掬', '두 손으로 움킬 국'),
+('掲', '揭과 同字'),
+('掲', '揭와 同字'),
+('掻', 'so'),
+('掻', '搔와 同字'),
+('掻', '소'),
+('掾', ' 기인할 연'),
+('掾', 'yen'),
+('掾', 'yeon'),
+('掾', 'yŏn'),
+('掾', '아전 연'),
+('掾', '연'),
+('揀', ' 분별할 련'),
+('揀', '가릴 간'),
+('揀', '가릴 련'),
+('揃', ' 가지런히 할 전'),
+('揃', ' 자를 전'),
+('揃', 'cen'),
+('揃', 'chŏn'),
+('揃', 'jeon'),
+('揃', '가를 전'),
+('揃', '전'),
+('揄', ' 칭찬할 유'),
+('揄', ' 희롱할 유'),
+('揄', 'yu'),
+('揄', '당길 유'),
+('揄', '유'),
+('揆', 'gyu'),
+('揆', 'kyu'),
+('揆', '규'),
+('揆', '헤아릴 규'),
+('揉', ' 부드럽게 할 유'),
+('揉', ' 희일 유'),
+('揉', 'yu'),
+('揉', '유'),
+('揉', '풀 유'),
+('描', 'Hanja form of 묘 (“copy”).'),
+('描', '그리다'),
+('描', '그릴'),
+('描', '그릴 묘'),
+('描', '묘'),
+('提', ' 고을이름 시'),
+('提', 'Hanja form of 시 (“fly”).'),
+('提', 'Hanja form of 제 (“to carry; to lift”).'),
+('提', '끌'),
+('提', '끌 제'),
+('提', '끌다'),
+('提', '날'),
+('提', '날다'),
+('提', '떼지어 날 시'),
+('提', '시'),
+('提', '제'),
+('插', 'sap'),
+('插', '揷의 略字'),
+('插', '삽'),
+('揕', 'ch''im'),
+('揕', 'chim'),
+('揕', 'to stab'),
+('揕', 'to strike'),
+('揕', '침'),
+('揖', ' 공손할 읍'),
+('揖', ' 깍지낄 읍'),
+('揖', ' 나아갈 읍'),
+('揖', '모을 즙'),
+('揖', '읍할 읍'),
+('揚', ' 칭찬할 양'),
+('揚', '날리다'),
+('揚', '날릴'),
+('揚', '드높일 양'),
+('揚', '양'),
+('揚', '오르다'),
+('揚', '오를'),
+('換', 'change, exchange'),
+('換', 'substitute'),
+('換', '바꿀 환'),
+('換', '환'),
+('揜', ' 곤박할 엄'),
+('揜', '덮을 암'),
+('揜', '찾아가질 엄'),
+('揟', 'se'),
+('揟', 'seo'),
+('揟', 'sŏ'),
+('揟', '나무이름 서 '),
+('揟', '서'),
+('揠', 'al'),
+('揠', 'extract'),
+('揠', 'pull out'),
+('揠', '뽑을 알'),
+('揠', '알'),
+('握', ' 손아귀 악'),
+('握', 'Hanja form of 악 (“to grasp; to hold fast; to take by hand”).'),
+('握', '악'),
+('握', '잡을 악'),
+('握', '쥐다'),
+('握', '쥘'),
+('揣', ' 시험할 취'),
+('揣', ' 요량할 취'),
+('揣', '잴 취'),
+('揣', '헤아릴 타'),
+('揩', ' 문질러 훔칠 개'),
+('揩', 'gae'),
+('揩', 'kae'),
+('揩', 'kay'),
+('揩', '개'),
+('揩', '문지를 개'),
+('揫', ' 거둘 추'),
+('揫', ' 모을 추'),
+('揫', 'ch''u'),
+('揫', 'chu'),
+('揫', 'chwu'),
+('揫', '묶을 추'),
+('揫', '추'),
+('揭', ' 등에 질 갈'),
+('揭', ' 등에 질 게'),
+('揭', ' 옷 걷고 물 건널 갈'),
+('揭', ' 옷 걷고 물 건널 게'),
+('揭', 'Hanja form of 게 (“to lift; to raise”).'),
+('揭', '게'),
+('揭', '높이 들'),
+('揭', '높이 들 갈'),
+('揭', '높이 들 게'),
+('揮', 'hwi'),
+('揮', '휘'),
+('揮', '휘두를 휘'),
+('揲', 'to fold'),
+('揲', 'to sort out the stalks used in divination'),
+('揲', '설'),
+('揲', '셀 설'),
+('援', ' 구원할 원'),
+('援', ' 사다리 원'),
+('援', 'aid, assist'),
+('援', 'cite'),
+('援', 'lead'),
+('援', 'wen'),
+('援', 'won'),
+('援', 'wŏn'),
+('援', '당길 원'),
+('援', '원'),
+('揵', ' 들 건'),
+('揵', ' 막을 건'),
+('揵', 'geon'),
+('揵', 'ken'),
+('揵', 'kŏn'),
+('揵', '건'),
+('揵', '멜 건'),
+('揶', 'ya'),
+('揶', '야'),
+('揶', '희롱할 야'),
+('揷', 'sap'),
+('揷', '꽂을 삽'),
+('揷', '삽'),
+('搆', 'gu'),
+('搆', 'ku'),
+('搆', 'kwu'),
+('搆', '구'),
+('搆', '얽어맬 구'),
+('搉', 'gak'),
+('搉', 'kak'),
+('搉', '각'),
+('搉', '칠 각'),
+('損', ' 괘 이름 손'),
+('損', ' 삼갈 손'),
+('損', ' 상할 손'),
+('損', ' 잃을 손'),
+('損', ' 피곤할 손'),
+('損', 'diminish'),
+('損', 'impair'),
+('損', 'injure'),
+('損', '덜 손'),
+('損', '손'),
+('搏', '두드리다'),
+('搏', '두드릴'),
+('搏', '박'),
+('搏', '어깨'),
+('搏', '칠 박'),
+('搐', 'hyuk'),
+('搐', '당길 휵'),
+('搐', '휵'),
+('搒', 'to beat with bamboo pole'),
+('搒', '방'),
+('搒', '배저을 방'),
+('搓', '비빌 차'),
+('搓', '차'),
+('搔', ' 분분할 소'),
+('搔', ' 휘저을 소'),
+('搔', 'so'),
+('搔', '긁을 소'),
+('搔', '소'),
+('搖', ' 별이름 요'),
+('搖', ' 회오리 바람 요'),
+('搖', '요'),
+('搖', '흔들 요'),
+('搗', '도'),
+('搗', '찧을 도'),
+('搜', ' 더듬을 수'),
+('搜', ' 어지러울 수'),
+('搜', ' 화살 빨리 가는 소리 수'),
+('搜', '수'),
+('搜', '찾을 수'),
+('搢', 'chin'),
+('搢', 'cin'),
+('搢', 'jin'),
+('搢', '꽂을 진'),
+('搢', '진'),
+('搤', 'aek'),
+('搤', 'ayk'),
+('搤', 'grab, seize'),
+('搤', 'hold'),
+('搤', 'obstruct, defend'),
+('搤', 'tie up'),
+('搤', '액'),
+('搤', '움켜쥘 액'),
+('搥', '북 칠 추'),
+('搨', ' 베낄 탑'),
+('搨', 't''ap'),
+('搨', 'tap'),
+('搨', 'thap'),
+('搨', '비문 박을 탑'),
+('搨', '탑'),
+('搪', 'dang'),
+('搪', 'tang'),
+('搪', '당'),
+('搪', '당동할 당'),
+('搫', 'ban'),
+('搫', 'pan'),
+('搫', '덜 반 '),
+('搫', '반'),
+('搬', 'pan'),
+('搬', '반'),
+('搬', '옮길 반'),
+('搭', ' 박을 탑'),
+('搭', '모뜰 탑'),
+('搭', '탑'),
+('搯', 'do'),
+('搯', 'to'),
+('搯', '도'),
+('搯', '두드릴 도'),
+('搰', 'dig'),
+('搰', 'tarnish'),
+('搰', '골'),
+('搰', '팔 골'),
+('搶', 'ch''ang'),
+('搶', 'chang'),
+('搶', '닿을 창'),
+('搶', '창'),
+('携', ' 가질 휴'),
+('携', ' 나눌 휴'),
+('携', ' 떠날 휴'),
+('携', ' 연속할 휴'),
+('携', '끌 휴'),
+('携', '메다'),
+('携', '멜'),
+('携', '휴'),
+('搽', 'ch''a'),
+('搽', 'cha'),
+('搽', '차'),
+('搽', '칠할 차'),
+('搾', 'ch''ak'),
+('搾', 'chak'),
+('搾', '짤 착'),
+('搾', '착'),
+('摂', '懾과 同字'),
+('摑', 'Hanja form of 괵 (“hit”).'),
+('摑', '괵'),
+('摑', '치다'),
+('摑', '칠'),
+('摒', '병'),
+('摒', '제거하다'),
+('摒', '제거할'),
+('摒', '제거할 병'),
+('摘', ' 돋구어낼 적'),
+('摘', ' 움직일 적'),
+('摘', '딸 적'),
+('摘', '적'),
+('摠', ' 모을 총'),
+('摠', ' 무리 총'),
+('摠', ' 장수 총'),
+('摠', 'ch''ong'),
+('摠', 'chong'),
+('摠', '거느릴 총'),
+('摠', '총'),
+('摧', ' 망할 최'),
+('摧', ' 저지할 최'),
+('摧', '꺾을 최'),
+('摧', '최'),
+('摩', 'Hanja form of 마 (“rub; chafe”).'),
+('摩', '갈'),
+('摩', '갈 마'),
+('摩', '갈다#Etymology_3'),
+('摩', '마'),
+('摭', 'ch''ŏk'),
+('摭', 'chek'),
+('摭', 'cheok'),
+('摭', 'pick up'),
+('摭', '주울 척'),
+('摭', '척'),
+('摯', 'chi'),
+('摯', 'ci'),
+('摯', 'ji'),
+('摯', '잡을 지'),
+('摯', '지'),
+('摳', 'gu'),
+('摳', 'ku'),
+('摳', 'kwu'),
+('摳', 'pull up, lift up'),
+('摳', '구'),
+('摳', '치마걷어들 구'),
+('摸', '모'),
+('摸', '찾을 모'),
+('摹', 'mo'),
+('摹', '모'),
+('摹', '베낄 모'),
+('摺', ' 패할 접'),
+('摺', 'cep'),
+('摺', 'chŏp'),
+('摺', 'jeop'),
+('摺', '접'),
+('摺', '접을 접'),
+('摻', 'sem'),
+('摻', 'seom'),
+('摻', 'sŏm'),
+('摻', '섬'),
+('摻', '섬섬할 섬'),
+('摽', ' 가슴 만질 표'),
+('摽', ' 두를 표'),
+('摽', ' 찔러 밀칠 표'),
+('摽', 'push out'),
+('摽', 'strike'),
+('摽', 'throw out'),
+('摽', '칠 표'),
+('摽', '표'),
+('撃', ' 눈에 마주칠 격'),
+('撃', ' 두드릴 격'),
+('撃', ' 죽일 격'),
+('撃', '칠 격'),
+('撅', 'gwe'),
+('撅', 'kwe'),
+('撅', 'kwey'),
+('撅', '궤'),
+('撅', '옷걷을 궤'),
+('撈', '잡을 로'),
+('撐', ' 취할 탱'),
+('撐', ' 헤칠 탱'),
+('撐', '버틸 탱'),
+('撐', '탱'),
+('撑', '撐의 俗字'),
+('撒', 'Hanja form of 살 (“scatter, sprinkle, strew”).'),
+('撒', '뿌리다'),
+('撒', '뿌릴'),
+('撒', '뿌릴 살'),
+('撒', '살'),
+('撓', ' 궁할 뇨'),
+('撓', ' 흔들 뇨'),
+('撓', 'yo'),
+('撓', '긁을 뇨'),
+('撓', '요'),
+('撕', '서'),
+('撘', '갑'),
+('撙', 'abide by, comply with'),
+('撙', 'economize'),
+('撙', '누를 준'),
+('撙', '준'),
+('撚', '년'),
+('撚', '비틀'),
+('撚', '비틀 년'),
+('撚', '비틀다'),
+('撚', '연'),
+('撝', 'modest, humble'),
+('撝', 'wave, brandish'),
+('撝', '찣을 휘'),
+('撝', '휘'),
+('撞', 'dang'),
+('撞', 'tang'),
+('撞', '당'),
+('撞', '두드릴 당'),
+('撟', 'to correct'),
+('撟', 'to hold'),
+('撟', 'to massage'),
+('撟', '교'),
+('撟', '들 교'),
+('撤', 'Hanja form of 철 (“to withdraw”).'),
+('撤', '거두다'),
+('撤', '거둘'),
+('撤', '거둘 철'),
+('撤', '철'),
+('撥', '다스리다'),
+('撥', '다스릴'),
+('撥', '다스릴 발'),
+('撥', '발'),
+('撥', '방패'),
+('撥', '벌'),
+('撩', '다스릴 료'),
+('撫', ' 누를 무'),
+('撫', 'mu'),
+('撫', '무'),
+('撫', '어루만질 무'),
+('播', ' 까불 파'),
+('播', ' 달아날 파'),
+('播', ' 버릴 파'),
+('播', ' 펼칠 파'),
+('播', 'to spray, spread, scatter, sow'),
+('播', '뿌리다'),
+('播', '뿌릴'),
+('播', '심을 파'),
+('播', '파'),
+('撮', ' 당길 촬'),
+('撮', ' 비칠 촬'),
+('撮', 'Hanja form of 촬 (“to take a photo; to record a video”).'),
+('撮', '머리 끄덩이 잡을 촬'),
+('撮', '모으다'),
+('撮', '모을'),
+('撮', '촬'),
+('撰', ' 가질 천'),
+('撰', ' 고를 천'),
+('撰', ' 모을 천'),
+('撰', '가리다'),
+('撰', '가릴'),
+('撰', '지을'),
+('撰', '지을 찬'),
+('撰', '지을 천'),
+('撰', '짓다'),
+('撰', '찬'),
+('撰', '천'),
+('撲', '닦을 복'),
+('撲', '업어질 박'),
+('撹', '攪의 略字'),
+('撻', '달'),
+('撻', '매질할 달'),
+('撼', ' 깨뜨릴 감'),
+('撼', ' 움직일 감'),
+('撼', 'gam'),
+('撼', 'kam'),
+('撼', '감'),
+('撼', '흔들 감'),
+('撾', 'gwa'),
+('撾', 'kwa'),
+('撾', '과'),
+('撾', '칠 과'),
+('撿', ' 관찰할 검'),
+('撿', ' 구속할 검'),
+('撿', ' 비교할 검'),
+('撿', 'geom'),
+('撿', 'kem'),
+('撿', 'kŏm'),
+('撿', '검'),
+('撿', '잡을 검'),
+('擁', ' 가질 옹'),
+('擁', ' 품을 옹'),
+('擁', '끼다'),
+('擁', '낄'),
+('擁', '안을 옹'),
+('擁', '옹'),
+('擄', '사로잡을 로'),
+('擅', 'ch''ŏn'),
+('擅', 'chen'),
+('擅', 'cheon'),
+('擅', '멋대로 천'),
+('擅', '천'),
+('擇', ' 차별할 택'),
+('擇', ' 추릴 택'),
+('擇', 'Hanja form of 택 (“to select; selection”).'),
+('擇', '가리다'),
+('擇', '가릴'),
+('擇', '가릴 택'),
+('擇', '택'),
+('擉', '찌를 착'),
+('擉', '착'),
+('擊', 'Hanja form of 격 (“strike”).'),
+('擊', '撃과 同字'),
+('擊', '격'),
+('擊', '치다'),
+('擊', '칠'),
+('操', 'Hanja form of 조 (“conduct; behaviour”).'),
+('操', 'Hanja form of 조 (“to control; to manage”).'),
+('操', 'Hanja form of 조 (“to drill; to train”).'),
+('操', 'Hanja form of 조 (“to operate; to manipulate”).'),
+('操', '잡다'),
+('操', '잡을'),
+('操', '잡을 조'),
+('操', '조'),
+('擎', 'gyeong'),
+('擎', 'kyeng'),
+('擎', 'kyŏng'),
+('擎', 'lift up'),
+('擎', 'to hold'),
+('擎', 'to support'),
+('擎', '경'),
+('擎', '들 경'),
+('擐', 'hwan'),
+('擐', '입을 환'),
+('擐', '환'),
+('擒', 'catch, capture, seize, arrest'),
+('擒', 'geum'),
+('擒', 'kum'),
+('擒', 'kŭm'),
+('擒', '금'),
+('擒', '사로잡을 금'),
+('擔', 'Hanja form of 담 (“bear”).'),
+('擔', 'Hanja form of 담 (“carry”).'),
+('擔', 'Hanja form of 담 (“raise”).'),
+('擔', 'Hanja form of 담 (“shouldering”).'),
+('擔', '담'),
+('擔', '메다'),
+('擔', '멜'),
+('擔', '질 담'),
+('擕', 'hyu'),
+('擕', '携와 同字 '),
+('擕', '휴'),
+('擗', 'byeok'),
+('擗', 'pyekaa'),
+('擗', 'pyŏk'),
+('擗', 'to beat the breast'),
+('擗', '가슴칠 벽'),
+('擗', '벽'),
+('擘', 'byeok'),
+('擘', 'pyek'),
+('擘', 'pyŏk'),
+('擘', '벽'),
+('擘', '엄지손가락 벽'),
+('據', ' 기댈 거'),
+('據', ' 웅거할 거'),
+('據', ' 짚을 거'),
+('據', 'geo'),
+('據', 'ke'),
+('據', 'kŏ'),
+('據', '거'),
+('據', '의지할 거'),
+('擟', '미'),
+('擟', '산 이름'),
+('擠', '물리칠 제'),
+('擠', '제'),
+('擡', '대'),
+('擡', '들 대'),
+('擢', ' 뺄 탁'),
+('擢', ' 솟을 탁'),
+('擢', ' 이길 탁'),
+('擢', '뽑을 탁'),
+('擢', '탁'),
+('擣', '도'),
+('擣', '찧을 도'),
+('擥', '攬과 同字'),
+('擦', 'ch''al'),
+('擦', 'chal'),
+('擦', '뿌릴 찰'),
+('擦', '찰'),
+('擧', ' 받들 거'),
+('擧', ' 움직일 거'),
+('擧', ' 일걸을 거'),
+('擧', 'Hanja form of 거 (“to raise; to lift up”).'),
+('擧', 'Hanja form of 거 (“to recommend”).'),
+('擧', '거'),
+('擧', '들'),
+('擧', '들 거'),
+('擧', '들다'),
+('擬', ' 헤아릴 의'),
+('擬', ' 흡사할 의'),
+('擬', 'Hanja form of 의 (“to compare”).'),
+('擬', 'Hanja form of 의 (“to imitate; to emulate”).'),
+('擬', '비기다'),
+('擬', '비길'),
+('擬', '의'),
+('擬', '의논할 의'),
+('擭', ' 함정 화'),
+('擭', '덫 화'),
+('擭', '화'),
+('擯', '물리칠 빈'),
+('擯', '빈'),
+('擱', 'delay'),
+('擱', 'place, put, lay down'),
+('擱', '각'),
+('擱', '놓을 각'),
+('擲', 'ch''ŏk'),
+('擲', 'chek'),
+('擲', 'cheok'),
+('擲', '던질 척'),
+('擲', '척'),
+('擴', '넓힐 광'),
+('擴', '넓힐 확'),
+('擷', 'gather up'),
+('擷', 'pick up'),
+('擷', 'pull up by hand'),
+('擷', '힐'),
+('擺', ' 손뼉칠 파'),
+('擺', ' 제거할 파'),
+('擺', ' 헤칠 파'),
+('擺', '열 파'),
+('擺', '파'),
+('擾', ' 번거로울 요'),
+('擾', 'yo'),
+('擾', '길들일 요'),
+('擾', '요'),
+('攀', '더위잡을 반'),
+('攀', '반'),
+('攂', '攏의 本字'),
+('攄', ' 날칠 터'),
+('攄', ' 비길 터'),
+('攄', ' 흩을 터'),
+('攄', 'Hanja form of 터 (“spread”).'),
+('攄', '터'),
+('攄', '펴다'),
+('攄', '펼'),
+('攄', '펼칠 터'),
+('攇', ' 물건 맬 헌 '),
+('攇', '비길 헌'),
+('攇', '헌'),
+('攏', '누를 롱'),
+('攔', '막을 란'),
+('攘', ' 빼앗을 양'),
+('攘', '물리칠 양'),
+('攘', '양'),
+('攙', 'to give a helping hand'),
+('攙', 'to support, hold up'),
+('攙', '찌를 참'),
+('攙', '참'),
+('攝', ' 거둘 섭'),
+('攝', ' 겸할 섭'),
+('攝', ' 고요할 녑'),
+('攝', ' 기록할 섭'),
+('攝', ' 끌 섭'),
+('攝', ' 단정하게 할 섭'),
+('攝', ' 항복할 섭'),
+('攝', '가질 녑'),
+('攝', '몰아 잡을 섭'),
+('攢', 'hoard'),
+('攢', 'save'),
+('攢', '모일 찬'),
+('攢', '찬'),
+('攣', '걸릴 련'),
+('攤', ' 펼칠 탄'),
+('攤', 'apportion'),
+('攤', 'spread out, open'),
+('攤', 't''an'),
+('攤', 'tan'),
+('攤', 'than'),
+('攤', '열 탄'),
+('攤', '탄'),
+('攪', 'gyo'),
+('攪', 'kyo'),
+('攪', '교'),
+('攪', '어지러울 교'),
+('攫', '붙잡을 확'),
+('攫', '확'),
+('攬', '잡을 람'),
+('支', '가를 지'),
+('支', '지'),
+('支', '지탱하다'),
+('支', '지탱할'),
+('攲', 'gi'),
+('攲', 'ki'),
+('攲', '기'),
+('攲', '기울기 기'),
+('攴', '복'),
+('攴', '치다'),
+('攴', '칠'),
+('攵', 'Hanja form of 복 (“to hit; strike”).'),
+('攵', '복'),
+('攵', '치다'),
+('攵', '칠'),
+('收', ' 거둘 수'),
+('收', ' 수레바퀴 수'),
+('收', ' 잡을 수'),
+('收', 'Hanja form of 수 (“collect”).'),
+('收', '거두다'),
+('收', '거둘'),
+('收', '모을 수'),
+('收', '수'),
+('攷', 'examine'),
+('攷', 'go'),
+('攷', 'investigate'),
+('攷', 'ko'),
+('攷', 'test'),
+('攷', '考의 古字'),
+('攷', '고'),
+('攸', ' 대롱거릴 유'),
+('攸', ' 아득할 유'),
+('攸', ' 휙 달아날 유'),
+('攸', 'yu'),
+('攸', '곳 유'),
+('攸', '유'),
+('改', ' 거듭할 개'),
+('改', ' 바꿀 개'),
+('改', 'Hanja form of 개 (“reform; fix”).'),
+('改', '개'),
+('改', '고치다'),
+('改', '고칠'),
+('改', '고칠 개'),
+('攻', 'Hanja form of 공 (“attack, hit”).'),
+('攻', '공'),
+('攻', '치다'),
+('攻', '칠'),
+('攻', '칠 공'),
+('攽', 'ban'),
+('攽', 'pan'),
+('攽', '나눌 반 '),
+('攽', '반'),
+('放', 'Hanja form of 방 (“to banish; to exile”).'),
+('放', 'Hanja form of 방 (“to release; to let go; to emit”).'),
+('放', 'Hanja form of 방 (“to shoot; to fire”).'),
+('放', '놓다'),
+('放', '놓을'),
+('放', '놓을 방'),
+('放', '방'),
+('政', ' 바르게 할 정'),
+('政', ' 조세 정'),
+('政', 'Hanja form of 정 (“political affairs, to hit”).'),
+('政', '정'),
+('政', '정사'),
+('政', '정사 정'),
+('政', '치다'),
+('政', '칠'),
+('敀', 'Alternative form of 歸 (“Hanja form of 귀 (“to return”).”)'),
+('敀', 'Alternative form of 迫 (“Hanja form of 박 (“to persecute”).”)'),
+('敀', '귀'),
+('敀', '돌아가다'),
+('敀', '돌아갈'),
+('敀', '박'),
+('敀', '핍박하다'),
+('敀', '핍박할'),
+('敃', 'bun'),
+('敃', 'pun'),
+('敃', 'pwun'),
+('敃', 'robust'),
+('敃', 'strong'),
+('敃', '분'),
+('故', 'Hanja form of 고 (“accident; unexpected event”).'),
+('故', 'Hanja form of 고 (“cause; reason”).'),
+('故', 'Hanja form of 고 (“late (deceased)”).'),
+('故', 'Hanja form of 고 (“old; ancient”).'),
+('故', '고'),
+('故', '옛'),
+('故', '옛 고'),
+('效', 'Hanja form of 효 (“effect”).'),
+('效', '본받다'),
+('效', '본받을'),
+('效', '본받을 효'),
+('效', '효'),
+('敉', '미'),
+('敉', '어루만질 미'),
+('敍', 'se'),
+('敍', 'seo'),
+('敍', 'sŏ'),
+('敍', '서'),
+('敍', '차례 서'),
+('敎', 'Hanja form of 교 (“religion; faith”).'),
+('敎', 'Hanja form of 교 (“religion; faith”). [noun]'),
+('敎', 'Hanja form of 교 (“teaching”).'),
+('敎', 'Hanja form of 교 (“teaching”). [affix]'),
+('敎', '가르치다'),
+('敎', '가르칠'),
+('敎', '가르침 교'),
+('敎', '교'),
+('敏', 'Hanja form of 민 (“hardworking”).'),
+('敏', 'Hanja form of 민 (“humble, well-mannered”).'),
+('敏', 'Hanja form of 민 (“nimble, agile”).'),
+('敏', 'Hanja form of 민 (“quick-witted”).'),
+('敏', 'Hanja form of 민 (“thorough”).'),
+('敏', '민'),
+('敏', '민첩하다'),
+('敏', '민첩할'),
+('敏', '민첩할 민'),
+('救', 'Hanja form of 구 (“help, aid”).'),
+('救', 'Hanja form of 구 (“save, rescue, relieve”).'),
+('救', '건지다'),
+('救', '건질'),
+('救', '구'),
+('救', '구원할 구'),
+('敔', ' 풍류그칠 어'),
+('敔', 'e'),
+('敔', 'eo'),
+('敔', 'ŏ'),
+('敔', '금할 어'),
+('敔', '어'),
+('敕', ' 기릴 칙'),
+('敕', ' 다스릴 칙'),
+('敕', ' 바를 칙'),
+('敕', ' 삼갈 칙'),
+('敕', ' 신칙할 칙'),
+('敕', ' 칙서 칙'),
+('敕', 'ch''ik'),
+('敕', 'chik'),
+('敕', '경계할 칙'),
+('敕', '칙'),
+('敖', ' 거만할 오'),
+('敖', '오'),
+('敖', '희롱할 오'),
+('敗', ' 깨어질 패'),
+('敗', ' 무너질 패'),
+('敗', ' 썪을 패'),
+('敗', 'Hanja form of 패 (“defeat; loss”).'),
+('敗', 'Hanja form of 패 (“defeat; loss”). [noun]'),
+('敗', '지다'),
+('敗', '질'),
+('敗', '패'),
+('敗', '헐어질 패'),
+('敘', 'se'),
+('敘', 'seo'),
+('敘', 'sŏ'),
+('敘', '敍의 俗字'),
+('敘', '서'),
+('教', 'Alternative form of 敎 (“Hanja form of 교 (“to teach; class”).”)'),
+('教', '敎의 俗字'),
+('教', '가르치다'),
+('教', '가르칠'),
+('教', '교'),
+('敝', ' 무너질 폐'),
+('敝', ' 버릴 폐'),
+('敝', ' 실패할 폐'),
+('敝', ' 활줌통 폐'),
+('敝', '옷 해질 폐'),
+('敝', '폐'),
+('敞', '높을 창'),
+('敞', '창'),
+('敡', ' 쉽게 말할 이'),
+('敡', 'Hanja form of 이 (“to look down on; to despise; to belittle; to disdain”).'),
+('敡', '업신여기다'),
+('敡', '업신여길'),
+('敡', '업신여길 이'),
+('敡', '이'),
+('敢', ' 구태여 감'),
+('敢', ' 날랠 감'),
+('敢', ' 용맹할 감'),
+('敢', 'Hanja form of 감 (“dare”).'),
+('敢', '감'),
+('敢', '감히'),
+('敢', '감히 감'),
+('散', 'san'),
+('散', '산'),
+('散', '흩을 산'),
+('敦', ' 곱송거릴 퇴'),
+('敦', ' 끊을 퇴'),
+('敦', ' 다스릴 퇴'),
+('敦', ' 모을 퇴'),
+('敦', ' 성낼 퇴'),
+('敦', 'Hanja form of 돈 (“esteem”).'),
+('敦', 'Hanja form of 돈 (“honest, candid, sincere”).'),
+('敦', 'Hanja form of 퇴 (“angry, furious”).'),
+('敦', 'Hanja form of 퇴 (“collect, gather”).'),
+('敦', 'Hanja form of 퇴 (“manage, govern, administer”).'),
+('敦', 'Hanja form of 퇴 (“peck”).'),
+('敦', 'Hanja form of 퇴 (“sever, cut off, put down”).'),
+('敦', '곱송거릴'),
+('敦', '끊다'),
+('敦', '끊을'),
+('敦', '다스리다'),
+('敦', '다스릴'),
+('敦', '도타울'),
+('敦', '도타울 돈'),
+('敦', '도탑다'),
+('敦', '돈'),
+('敦', '모으다'),
+('敦', '모을'),
+('敦', '성내다'),
+('敦', '성낼'),
+('敦', '쪼다'),
+('敦', '쪼을'),
+('敦', '쪼을 퇴'),
+('敦', '퇴'),
+('敩', '斆의 略字 '),
+('敫', 'gyo'),
+('敫', 'kyo'),
+('敫', '교'),
+('敬', 'Hanja form of 경 (“respect, honor”).'),
+('敬', 'Hanja form of 경 (“respectfully”).'),
+('敬', '경'),
+('敬', '공경할'),
+('敬', '공경할 경'),
+('敭', '양'),
+('敭', '오를 양'),
+('数', 'Alternative form of 數 (“Hanja form of 수 (“number”).”)'),
+('数', '數의 略字'),
+('数', '빽빽할 촉'),
+('数', '세다'),
+('数', '셀'),
+('数', '수'),
+('敲', 'Hanja form of 고 (“knock”).'),
+('敲', 'Hanja form of 교 (“knock”).'),
+('敲', 'Hanja form of 학 (“knock”).'),
+('敲', '고'),
+('敲', '교'),
+('敲', '두드릴'),
+('敲', '두드릴 고'),
+('敲', '두드릴 교'),
+('敲', '학'),
+('整', '가지런하다'),
+('整', '가지런할'),
+('整', '가지런할 정'),
+('整', '정'),
+('敵', ' 막을 적'),
+('敵', ' 무리 적'),
+('敵', ' 원수 적'),
+('敵', 'Hanja form of 적 (“enemy”).'),
+('敵', '대적할 적'),
+('敵', '원수'),
+('敵', '적'),
+('敷', 'bu'),
+('敷', 'pu'),
+('敷', '부'),
+('敷', '펼 부'),
+('數', ' 몇 수'),
+('數', ' 수죄할 수'),
+('數', ' 이치 수'),
+('數', 'Hanja form of 삭 (“often; frequently”).'),
+('數', 'Hanja form of 수 (“a little; a bit; a few; several”).'),
+('數', 'Hanja form of 수 (“fate; destiny”).'),
+('數', 'Hanja form of 수 (“grade”).'),
+('數', 'Hanja form of 수 (“manners”).'),
+('數', 'Hanja form of 수 (“means; method”).'),
+('數', 'Hanja form of 수 (“number; fixed quantity; figure”).'),
+('數', 'Hanja form of 수 (“obligation; duty”).'),
+('數', 'Hanja form of 수 (“skill; technique”).'),
+('數', 'Hanja form of 수 (“to count; to calculate”).'),
+('數', 'Hanja form of 수 (“trick; scheme”).'),
+('數', 'Hanja form of 촉 (“dense; thick”).'),
+('數', '삭'),
+('數', '세다'),
+('數', '셀'),
+('數', '셈'),
+('數', '수'),
+('數', '자주'),
+('數', '자주 삭'),
+('數', '촉'),
+('數', '촘촘하다'),
+('數', '촘촘할'),
+('數', '헤아릴 수'),
+('敾', 'sen'),
+('敾', 'seon'),
+('敾', 'sŏn'),
+('敾', '글잘쓸 선'),
+('敾', '선'),
+('斁', 'du'),
+('斁', 'tu'),
+('斁', 'twu'),
+('斁', '두'),
+('斁', '섞을 두'),
+('斂', '거둘 렴'),
+('斃', ' 엎드러질 폐'),
+('斃', 'p''ye'),
+('斃', 'phyey'),
+('斃', 'pye'),
+('斃', '죽을 폐'),
+('斃', '폐'),
+('斅', '가르칠 효'),
+('斅', '효'),
+('斆', 'hyo'),
+('斆', '斅와 同字'),
+('斆', '효'),
+('文', ' 얼룩 문'),
+('文', 'Hanja form of 문 (“writing”).'),
+('文', '글월'),
+('文', '무늬 문'),
+('文', '문'),
+('斈', 'hak'),
+('斈', '學의 略字'),
+('斈', '학'),
+('斌', 'bin'),
+('斌', 'having both appearance'),
+('斌', 'pin'),
+('斌', 'refined'),
+('斌', '빈'),
+('斌', '빛날 빈'),
+('斐', 'bi'),
+('斐', 'pi'),
+('斐', '비'),
+('斐', '오락가락할 비'),
+('斑', 'ban'),
+('斑', 'pan'),
+('斑', '반'),
+('斑', '얼룩 반'),
+('斗', 'Hanja form of 두 (“asterism around Polaris such as Big Dipper and Little Dipper”).'),
+('斗', 'Hanja form of 두 (“cauldron; cymbal”).'),
+('斗', 'Hanja form of 두 (“dipper, ladle”).'),
+('斗', 'Hanja form of 두 (“measure of about 18 liters; such measuring vessel”).'),
+('斗', '두'),
+('斗', '말'),
+('斗', '말 두'),
+('料', 'Hanja form of 료/요 (“fee; price; cost; count”).'),
+('料', 'Hanja form of 료/요 (“material; ingredient”).'),
+('料', 'Hanja form of 료/요 (“to predict; to anticipate”).'),
+('料', '되질할 료'),
+('料', '료'),
+('料', '요'),
+('料', '헤아리다'),
+('料', '헤아릴'),
+('斛', 'gok'),
+('斛', 'kok'),
+('斛', '곡'),
+('斛', '휘 곡'),
+('斜', 'Hanja form of 사 (“aslant”).'),
+('斜', '고을이름 야'),
+('斜', '비끼다'),
+('斜', '비낄'),
+('斜', '비낄 사'),
+('斜', '사'),
+('斝', '가'),
+('斝', '옥잔 가'),
+('斟', '술 따를 짐'),
+('斟', '짐'),
+('斡', ' 주선할 알'),
+('斡', 'Hanja form of 알 (“spin”).'),
+('斡', '관리할 간'),
+('斡', '돌'),
+('斡', '돌다'),
+('斡', '돌릴 알'),
+('斡', '알'),
+('斤', 'Hanja form of 근 (“axe”).'),
+('斤', 'Hanja form of 근 (“catty”).'),
+('斤', 'Hanja form of 근 (“keen, shrewd”).'),
+('斤', '근'),
+('斤', '근 근'),
+('斥', 'ch''ŏk'),
+('斥', 'chek'),
+('斥', 'cheok'),
+('斥', '물리칠 척'),
+('斥', '척'),
+('斧', '도끼 부'),
+('斧', '부'),
+('斫', '벨 작'),
+('斫', '작'),
+('斬', 'ch''am'),
+('斬', 'cham'),
+('斬', '벨 참'),
+('斬', '참'),
+('断', '어질 단'),
+('斮', 'ch''ak'),
+('斮', 'chak'),
+('斮', 'chop off'),
+('斮', '착'),
+('斯', 'sa'),
+('斯', '사'),
+('斯', '이 사'),
+('新', ' 고울 신'),
+('新', ' 처음 신'),
+('新', 'Hanja form of 신 (“new”).'),
+('新', '새'),
+('新', '새 신'),
+('新', '신'),
+('斱', 'cak'),
+('斱', 'chak'),
+('斱', 'jak'),
+('斱', '작'),
+('斱', '쪼갤 작 '),
+('斲', 'ch''ak'),
+('斲', 'chak'),
+('斲', '깎을 착'),
+('斲', '착'),
+('斷', 'Hanja form of 단 (“cut off”).'),
+('斷', 'Hanja form of 단 (“interrupt”).'),
+('斷', 'Hanja form of 단 (“sever”).'),
+('斷', '끊다'),
+('斷', '끊을'),
+('斷', '끊을 단'),
+('斷', '단'),
+('方', 'Hanja form of 방 (“direction”).'),
+('方', '모'),
+('方', '모 방'),
+('方', '방'),
+('於', ' 대신할 어'),
+('於', '감탄사'),
+('於', '방향의 어조사 어'),
+('於', '어'),
+('於', '어조사'),
+('於', '오'),
+('於', '오홉다 외칠 오'),
+('施', ' 공로 시'),
+('施', ' 더할 시'),
+('施', ' 미칠 이'),
+('施', ' 버릴 시'),
+('施', ' 벗을 이'),
+('施', ' 쓸 시'),
+('施', ' 안팎 곱사등이 시'),
+('施', ' 옮길 이'),
+('施', ' 은혜 시'),
+('施', ' 잘난체할 이'),
+('施', ' 줄 시'),
+('施', 'boast; exaggerate'),
+('施', 'conduct'),
+('施', 'reveal'),
+('施', 'to give (to help, to benefit)'),
+('施', 'widespread; breed'),
+('施', '베풀'),
+('施', '베풀 시'),
+('施', '베풀다#Etymology 3'),
+('施', '비뚤어질 이'),
+('施', '시'),
+('施', '옮기다#Etymology 3'),
+('施', '옮길'),
+('施', '이'),
+('斿', ' 깃술 유'),
+('斿', ' 면류관술 유'),
+('斿', 'yu'),
+('斿', '깃발 유'),
+('斿', '유'),
+('旀', 'An element in placenames.'),
+('旀', 'a surname'),
+('旀', '며'),
+('旀', '하며 며'),
+('旁', 'the right-hand component of a Chinese character'),
+('旁', '두루 방'),
+('旁', '방'),
+('旁', '휘몰아갈 팽'),
+('旂', '기'),
+('旂', '기 기'),
+('旃', ' 말 그칠 전'),
+('旃', 'cen'),
+('旃', 'chŏn'),
+('旃', 'jeon'),
+('旃', '기 전'),
+('旃', '전'),
+('旄', 'mo'),
+('旄', '깃대 장식 모'),
+('旄', '모'),
+('旅', 'Hanja form of 려/여 (“trip; travel”).'),
+('旅', '군사 려'),
+('旅', '나그네'),
+('旅', '려'),
+('旅', '여'),
+('旆', ' 깃발 날릴 패'),
+('旆', '기 패'),
+('旆', '패'),
+('旉', 'ga'),
+('旉', 'ka'),
+('旉', '가'),
+('旊', 'bang'),
+('旊', 'pang'),
+('旊', '방'),
+('旊', '옹기장 방 '),
+('旋', 'Hanja form of 선 (“revolve”).'),
+('旋', '돌'),
+('旋', '돌 선'),
+('旋', '돌다'),
+('旋', '선'),
+('旌', ' 표시할 정'),
+('旌', '장목기 정'),
+('旌', '정'),
+('族', 'Alternative form of 嗾'),
+('族', 'Hanja form of 족 (“clan; tribe; ethnic group”).'),
+('族', 'Hanja form of 족 (“group or class of things with common features”).'),
+('族', 'Hanja form of 주 (“to perform music”).'),
+('族', '겨레'),
+('族', '겨레 족'),
+('族', '족'),
+('族', '주'),
+('族', '풍류 가락'),
+('族', '풍류가락 주'),
+('旐', 'cho'),
+('旐', 'co'),
+('旐', 'jo'),
+('旐', '기: banner, flag'),
+('旐', '조'),
+('旒', '깃발'),
+('旒', '깃발 류'),
+('旒', '류'),
+('旒', '유'),
+('旕', ' 엇 엇'),
+('旕', 'Hanja form of 엇 (“hanja used for transliteration”).'),
+('旕', '땅이름 엇'),
+('旕', '엇'),
+('旕', '음역자'),
+('旗', 'Hanja form of 기 (“flag; banner”).'),
+('旗', 'Hanja form of 기 (“flag; banner”). [noun; affix]'),
+('旗', '기'),
+('旗', '기 기'),
+('旗', '깃발'),
+('旙', '기'),
+('旙', '번'),
+('无', 'Alternative form of 無'),
+('无', '무'),
+('无', '없을 무'),
+('既', 'Alternative form of 旣'),
+('既', 'gi'),
+('既', 'ki'),
+('既', '旣의 訛字'),
+('既', '기'),
+('旣', 'Hanja form of 기 (“already”).'),
+('旣', 'Hanja form of 기 (“de facto”).'),
+('旣', 'Hanja form of 기 (“since”).'),
+('旣', 'Hanja form of 기 (“then”).'),
+('旣', '기'),
+('旣', '이미'),
+('旣', '이미 기'),
+('日', 'Hanja form of 일 (“Short for 일요일(日曜日) (iryoil, “Sunday”).”).'),
+('日', 'Hanja form of 일 (“day”).'),
+('日', 'Hanja form of 일 (“day”). [noun]'),
+('日', 'Hanja form of 일 (“sun; daytime”).'),
+('日', 'Hanja form of 일 (“sun; daytime”). [affix]'),
+('日', '날'),
+('日', '날 일'),
+('日', '일'),
+('旦', 'Hanja form of 단 (“early morning; dawn”).'),
+('旦', '단'),
+('旦', '밝을 단'),
+('旦', '아침'),
+('旧', '舊의 略字'),
+('旨', 'Hanja form of 지 (“delicious; tasty”).'),
+('旨', 'Hanja form of 지 (“meaning; definition”).'),
+('旨', '뜻'),
+('旨', '맛있다'),
+('旨', '맛있을'),
+('旨', '맛있을 지'),
+('旨', '지'),
+('早', 'Hanja form of 조 (“early”).'),
+('早', '새벽 조'),
+('早', '일찍'),
+('早', '조'),
+('旬', ' 가득할 순'),
+('旬', ' 고를 순'),
+('旬', ' 두루할 순'),
+('旬', ' 요사스런 별 순'),
+('旬', 'Hanja form of 순 (“ten-day period”).'),
+('旬', '순'),
+('旬', '열흘'),
+('旬', '열흘 순'),
+('旭', ' 교만할 욱'),
+('旭', ' 햇살 치밀 욱'),
+('旭', 'brilliance'),
+('旭', 'radiant'),
+('旭', 'rising sun'),
+('旭', 'uk'),
+('旭', 'wuk'),
+('旭', '빛날 욱'),
+('旭', '욱'),
+('旰', 'gan'),
+('旰', 'kan'),
+('旰', '간'),
+('旰', '해질 간'),
+('旱', 'Hanja form of 한 (“drought”).'),
+('旱', '가물'),
+('旱', '가물 한'),
+('旱', '한'),
+('旲', 'dae'),
+('旲', 'tae'),
+('旲', 'tay'),
+('旲', '대'),
+('旲', '햇빛 대 '),
+('旴', ' 새벽 우'),
+('旴', '우'),
+('旴', '해 돋을 우'),
+('旺', ' 성할 왕'),
+('旺', ' 해무리 왕'),
+('旺', 'wang'),
+('旺', '고울 왕'),
+('旺', '왕'),
+('旻', '민'),
+('旻', '하늘 민'),
+('旼', 'different form of 旻; heaven'),
+('旼', 'gentle and affable'),
+('旼', 'min'),
+('旼', '민'),
+('旼', '온화할 민'),
+('旽', 'don'),
+('旽', 'ton'),
+('旽', '늘 돋을 돈'),
+('旽', '돈'),
+('旿', 'o'),
+('旿', '밝을 오 '),
+('旿', '오'),
+('昀', 'yun'),
+('昀', '윤'),
+('昂', 'ang'),
+('昂', '높을 앙'),
+('昂', '앙'),
+('昃', 'ch''i'),
+('昃', 'chi'),
+('昃', '치'),
+('昆', ' 서쪽 오랑캐 이름 혼'),
+('昆', 'Hanja form of 곤 (“swarm”).'),
+('昆', 'Hanja form of 곤 (“the eldest brother”).'),
+('昆', '곤'),
+('昆', '덩어리 혼'),
+('昆', '맏형'),
+('昆', '형 곤'),
+('昇', ' 풍년들 승'),
+('昇', 'seung'),
+('昇', 'sung'),
+('昇', 'sŭng'),
+('昇', '승'),
+('昇', '해 돋을 승'),
+('昉', 'bang'),
+('昉', 'begin'),
+('昉', 'bright'),
+('昉', 'pang'),
+('昉', '마침 방'),
+('昉', '방'),
+('昊', ' 큰 모양 호'),
+('昊', 'ho'),
+('昊', '하늘 호'),
+('昊', '호'),
+('昌', 'prosperity, flourishing, thriving'),
+('昌', '창'),
+('昌', '창성하다'),
+('昌', '창성할'),
+('昌', '창성할 창'),
+('明', 'Hanja form of 명 (“bright”).'),
+('明', '명'),
+('明', '밝을'),
+('明', '밝을 명'),
+('昏', 'Hanja form of 혼 (“dark; dusk”).'),
+('昏', '어두울'),
+('昏', '어두울 혼'),
+('昏', '어둡다'),
+('昏', '혼'),
+('昐', 'bun'),
+('昐', 'pun'),
+('昐', '분'),
+('昑', 'geum'),
+('昑', 'kum'),
+('昑', 'kŭm'),
+('昑', '금'),
+('昑', '밝을 금'),
+('易', ' 게으를 이'),
+('易', ' 다스릴 이'),
+('易', ' 편할 이'),
+('易', 'Hanja form of 역 (“change; alteration; modification”).'),
+('易', 'Hanja form of 이 (“easy”).'),
+('易', '바꾸다'),
+('易', '바꿀'),
+('易', '바꿀 역'),
+('易', '쉬울'),
+('易', '쉬울 이'),
+('易', '쉽다'),
+('易', '역'),
+('易', '이'),
+('昔', '옛 석'),
+('昔', '옛 착'),
+('昕', '아침 흔'),
+('昕', '흔'),
+('昛', '거'),
+('昛', '밝을 거 '),
+('昜', 'Hanja form of 양 (“the sun; sunlight; sunshine; sunbeam”).'),
+('昜', '볕'),
+('昜', '양'),
+('昞', '밝을 병'),
+('昞', '병'),
+('星', ' 성시 성'),
+('星', ' 세월 성'),
+('星', ' 희뜩희뜩할 성'),
+('星', 'Hanja form of 성 (“star; planet”).'),
+('星', '별'),
+('星', '별 성'),
+('星', '성'),
+('映', ' 빛날 영'),
+('映', 'Hanja form of 영 (“to project”).'),
+('映', 'Hanja form of 영 (“to reflect”).'),
+('映', 'Hanja form of 영 (“to shine; to light up; to flash”).'),
+('映', '비치다'),
+('映', '비칠'),
+('映', '비칠 영'),
+('映', '영'),
+('昡', 'hyen'),
+('昡', 'hyeon'),
+('昡', 'hyŏn'),
+('昡', '햇빛 현'),
+('昡', '현'),
+('昤', '날 빛 영롱할 령'),
+('春', ' 남녀의 정 춘'),
+('春', ' 술 춘'),
+('春', ' 온화할 춘'),
+('春', 'Hanja form of 춘 (“spring (season)”).'),
+('春', 'Hanja form of 춘 (“spring (season)”). [affix]'),
+('春', '봄'),
+('春', '봄 춘'),
+('春', '춘'),
+('昧', 'mae'),
+('昧', 'may'),
+('昧', '매'),
+('昧', '새벽 매'),
+('昨', 'Hanja form of 작 (“yesterday; last”).'),
+('昨', '어제'),
+('昨', '어제 작'),
+('昨', '작'),
+('昫', '구'),
+('昫', '해돋아 따뜻할 구'),
+('昭', ' 소목 소'),
+('昭', ' 태평세월 소'),
+('昭', '밝을 조'),
+('昭', '소명할 소'),
+('是', ' 곧을 시'),
+('是', ' 바를 시'),
+('是', 'Hanja form of 시 (“right”).'),
+('是', 'Hanja form of 시 (“this, to be”).'),
+('是', '바르다#Etymology 3'),
+('是', '바를'),
+('是', '시'),
+('是', '이'),
+('是', '이 시'),
+('昰', '是와 同字'),
+('昱', 'uk'),
+('昱', 'wuk'),
+('昱', '욱'),
+('昱', '햇빛 밝을 욱'),
+('昴', '묘'),
+('昴', '별자리 이름 묘'),
+('昵', '가깝게 할 닐'),
+('昵', '녜'),
+('昵', '닐'),
+('昵', '아비사당'),
+('昵', '아비사당 녜'),
+('昵', '예'),
+('昵', '일'),
+('昶', '밝을 창'),
+('昶', '창'),
+('昷', 'on'),
+('昷', '어질 온'),
+('昷', '온'),
+('昺', 'byeong'),
+('昺', 'pyeng'),
+('昺', 'pyŏng'),
+('昺', '昞과 同字'),
+('昺', '병'),
+('昻', ' 밝을 앙'),
+('昻', 'ang'),
+('昻', '앙'),
+('昻', '오를 앙'),
+('昼', '晝의 略字'),
+('晁', 'cho'),
+('晁', 'co'),
+('晁', 'jo'),
+('晁', '朝의 古字'),
+('晁', '조'),
+('時', ' 가끔 시'),
+('時', ' 끼니 시'),
+('時', ' 엿볼 시'),
+('時', ' 이 시'),
+('時', 'Hanja form of 시 (“correct, right, excellent, great, good, nice, beautiful, fine, well”).'),
+('時', 'Hanja form of 시 (“era; age; period”).'),
+('時', 'Hanja form of 시 (“opportunity; chance”).'),
+('時', 'Hanja form of 시 (“time; hour; season”).'),
+('時', '때'),
+('時', '때 시'),
+('時', '시'),
+('晃', 'hwang'),
+('晃', '밝을 황'),
+('晃', '황'),
+('晄', 'bright, dazzling'),
+('晄', 'hwang'),
+('晄', 'to sway, shake'),
+('晄', '晃과 同字'),
+('晄', '황'),
+('晈', 'gyo'),
+('晈', 'kyo'),
+('晈', '교'),
+('晈', '달 밝을 교 '),
+('晉', 'Hanja form of 진 (“advance, increase”).'),
+('晉', '進과 同字'),
+('晉', '나아가다'),
+('晉', '나아갈'),
+('晉', '진'),
+('晋', 'Alternative form of 晉'),
+('晋', '晉의 俗字'),
+('晋', '진'),
+('晌', '상'),
+('晌', '정오 상'),
+('晎', 'hong'),
+('晎', '날 밝으려 할 홍 '),
+('晎', '홍'),
+('晏', ' 편안할 안'),
+('晏', 'an'),
+('晏', '늦을 안'),
+('晏', '안'),
+('晙', 'chun'),
+('晙', 'cwun'),
+('晙', 'jun'),
+('晙', '밝을 준 '),
+('晙', '준'),
+('晚', 'Hanja form of 만 (“evening; night”).'),
+('晚', 'Hanja form of 만 (“late”).'),
+('晚', '늦다'),
+('晚', '늦을'),
+('晚', '만'),
+('晛', 'hyen'),
+('晛', 'hyeon'),
+('晛', 'hyŏn'),
+('晛', '햇발 현'),
+('晛', '현'),
+('晝', 'Hanja form of 주 (“daytime”).'),
+('晝', 'Hanja form of 주 (“daytime”). [affix]'),
+('晝', '낮'),
+('晝', '낮 주'),
+('晝', '주'),
+('晞', 'hui'),
+('晞', 'huy'),
+('晞', 'hŭi'),
+('晞', '마를 희'),
+('晞', '희'),
+('晟', ' 햇살 퍼질 성'),
+('晟', 'seng'),
+('晟', 'seong'),
+('晟', 'sŏng'),
+('晟', '밝을 성'),
+('晟', '성'),
+('晡', ' 해질 포'),
+('晡', 'dusk'),
+('晡', 'p.m. 3-5'),
+('晡', '신시 포'),
+('晡', '포'),
+('晢', ' 비칠 절'),
+('晢', '밝을 절'),
+('晢', '별이 반짝반짝 할 제'),
+('晤', ' 만날 오'),
+('晤', '밝을 오'),
+('晤', '오'),
+('晥', 'hwan'),
+('晥', '환'),
+('晥', '환할 환'),
+('晦', 'Hanja form of 회 (“last day of a lunar month”).'),
+('晦', '그믐'),
+('晦', '그믐 회'),
+('晦', '회'),
+('晧', ' 빛날 호'),
+('晧', 'ho'),
+('晧', '밝을 호'),
+('晧', '호'),
+('晨', ' 아침을 아뢸 신'),
+('晨', 'Hanja form of 신 (“dawn”).'),
+('晨', '새벽'),
+('晨', '샛별 신'),
+('晨', '신'),
+('晩', 'man'),
+('晩', '만'),
+('晩', '저물 만'),
+('晫', ' 밝을 탁 '),
+('晫', 't''ak'),
+('晫', 'tak'),
+('晫', 'thak'),
+('晫', '탁'),
+('晫', '환할 탁'),
+('晬', ' 첫 생일 수'),
+('晬', ' 첫 생일 쉬'),
+('晬', '돐 수'),
+('晬', '돐 쉬'),
+('普', 'Hanja form of 보 (“universal, general, widespread”).'),
+('普', '널리 보'),
+('普', '넓다'),
+('普', '넓을'),
+('普', '보'),
+('景', ' 옷 영'),
+('景', 'Alternative form of 影 (“Hanja form of 영 (“shadow”).”)'),
+('景', 'Hanja form of 경 (“view; vista”).'),
+('景', '경'),
+('景', '그림자'),
+('景', '그림자 영'),
+('景', '별 경'),
+('景', '볕'),
+('景', '영'),
+('晰', '밝을 석'),
+('晰', '석'),
+('晳', 'clear'),
+('晳', 'discriminate'),
+('晳', 'fair'),
+('晳', 'sek'),
+('晳', 'seok'),
+('晳', 'sŏk'),
+('晳', 'white'),
+('晳', '밝을 석'),
+('晳', '석'),
+('晴', 'Hanja form of 청 (“clear up”).'),
+('晴', '개다'),
+('晴', '갤'),
+('晴', '갤 청'),
+('晴', '청'),
+('晶', ' 맑을 정'),
+('晶', ' 빛날 정'),
+('晶', 'ceng'),
+('晶', 'chŏng'),
+('晶', 'jeong'),
+('晶', '수정 정'),
+('晶', '정'),
+('晷', 'sundial, sun''s shadow'),
+('晷', '귀'),
+('晷', '시각 귀'),
+('晸', 'ceng'),
+('晸', 'chŏng'),
+('晸', 'jeong'),
+('晸', '정'),
+('智', 'chi'),
+('智', 'ci'),
+('智', 'intelligence'),
+('智', 'ji'),
+('智', 'knowledge'),
+('智', 'wisdom'),
+('智', '슬기 지'),
+('智', '지'),
+('晻', '암'),
+('晻', '어두울 암 '),
+('暁', '曉와 同字'),
+('暄', '따뜻할 훤'),
+('暄', '훤'),
+('暇', 'ga'),
+('暇', 'ka'),
+('暇', '가'),
+('暇', '겨를 가'),
+('暈', ' 어지러울 운'),
+('暈', 'Hanja form of 운 (“halo”).'),
+('暈', '무리'),
+('暈', '무리 운'),
+('暈', '무리 훈'),
+('暈', '어지러울'),
+('暈', '어지럽다'),
+('暈', '운'),
+('暈', '훈'),
+('暉', '빛'),
+('暉', '빛 휘'),
+('暉', '휘'),
+('暋', 'min'),
+('暋', '굳셀 민'),
+('暋', '민'),
+('暌', '규'),
+('暌', '해질 규'),
+('暍', 'gal'),
+('暍', 'kal'),
+('暍', 'sunstroke'),
+('暍', '갈'),
+('暎', '비칠 영'),
+('暎', '영'),
+('暐', ' 빛 환할 위'),
+('暐', 'Hanja form of 위 (“sunlight; sunshine”).'),
+('暐', '위'),
+('暐', '햇빛'),
+('暐', '햇빛 위'),
+('暑', 'Hanja form of 서 (“hot”).'),
+('暑', '더울'),
+('暑', '더울 서'),
+('暑', '덥다'),
+('暑', '서'),
+('暖', 'Hanja form of 난 (“warm”).'),
+('暖', 'Hanja form of 훤 (“genial”).'),
+('暖', '난'),
+('暖', '따뜻하다'),
+('暖', '따뜻할'),
+('暖', '따뜻할 난'),
+('暖', '부드러울'),
+('暖', '부드러울 훤'),
+('暖', '부드럽다'),
+('暖', '훤'),
+('暗', ' 몰래 암'),
+('暗', ' 어리석을 암'),
+('暗', 'Hanja form of 암 (“darkness”).'),
+('暗', '암'),
+('暗', '어두울'),
+('暗', '어두울 암'),
+('暗', '어둡다'),
+('暘', 'yin and yang'),
+('暘', '양'),
+('暘', '해 돋을 양'),
+('暝', '명'),
+('暝', '어두울 명'),
+('暞', 'gyo'),
+('暞', 'kyo'),
+('暞', '교'),
+('暞', '밝을 교 '),
+('暠', '흴 고'),
+('暠', '흴 호'),
+('暡', '어두울'),
+('暡', '어둡다'),
+('暡', '옹'),
+('暢', 'ch''ang'),
+('暢', 'chang'),
+('暢', '창'),
+('暢', '펼 창'),
+('暣', 'gi'),
+('暣', 'ki'),
+('暣', '기'),
+('暣', '볕기운 기 '),
+('暨', 'gi'),
+('暨', 'ki'),
+('暨', '기'),
+('暫', 'Hanja form of 잠 (“temporary”).'),
+('暫', '잠'),
+('暫', '잠깐'),
+('暫', '잠시 잠'),
+('暬', 'sel'),
+('暬', 'seol'),
+('暬', 'sŏl'),
+('暬', '설'),
+('暬', '설만할 설 '),
+('暮', 'Hanja form of 모 (“evening; closing”).'),
+('暮', '모'),
+('暮', '저물'),
+('暮', '저물 모'),
+('暮', '저물다'),
+('暱', '칠근할 닐'),
+('暲', '장'),
+('暲', '햇발이 돋아올 장 '),
+('暳', 'twinkling star'),
+('暳', '반짝이다'),
+('暳', '반짝일'),
+('暳', '혜'),
+('暴', ' 급할 포'),
+('暴', ' 나타날 폭'),
+('暴', ' 드러날 폭'),
+('暴', ' 마를 포'),
+('暴', ' 맨손으로 칠 포'),
+('暴', ' 불끈 일어날 포'),
+('暴', ' 상할 포'),
+('暴', 'Hanja form of 박 (“sparse; bare; thin; skinny”).'),
+('暴', 'Hanja form of 포 (“fierce; violent; brutal”).'),
+('暴', 'Hanja form of 폭 (“fierce; violent; brutal”).'),
+('暴', 'Hanja form of 폭 (“to show; to appear; to manifest”).'),
+('暴', '나타날'),
+('暴', '나타내다'),
+('暴', '드러나다'),
+('暴', '드러날'),
+('暴', '박'),
+('暴', '사나울'),
+('暴', '사나울 포'),
+('暴', '사납다'),
+('暴', '앙상하다'),
+('暴', '앙상할'),
+('暴', '포'),
+('暴', '폭'),
+('暴', '햇빛 쪼일 폭'),
+('暵', 'han'),
+('暵', '말릴 한'),
+('暵', '한'),
+('暸', '밝을 료'),
+('暹', 'sem'),
+('暹', 'seom'),
+('暹', 'sŏm'),
+('暹', '섬'),
+('暹', '해돋을 섬'),
+('暻', 'gyeong'),
+('暻', 'kyeng'),
+('暻', 'kyŏng'),
+('暻', '경'),
+('暻', '밝을 경'),
+('暾', '돈'),
+('暾', '아침해 돈'),
+('暿', 'hui'),
+('暿', 'huy'),
+('暿', 'hŭi'),
+('暿', '웃을 희 '),
+('暿', '희'),
+('曀', ' 가리울 에'),
+('曀', '에'),
+('曀', '음산할 에'),
+('曁', 'gi'),
+('曁', 'ki'),
+('曁', '기'),
+('曁', '및 기'),
+('曄', ' 번개 번쩍거릴 엽'),
+('曄', 'yeop'),
+('曄', 'yep'),
+('曄', 'yŏp'),
+('曄', '빛날 엽'),
+('曄', '엽'),
+('曅', 'appearance of lightning strike'),
+('曅', 'to shine'),
+('曅', 'yeop'),
+('曅', 'yep'),
+('曅', 'yŏp'),
+('曅', '曄과 同字'),
+('曅', '엽'),
+('曆', 'Hanja form of 력/역 (“calendar”).'),
+('曆', '력'),
+('曆', '역'),
+('曆', '책력'),
+('曆', '책력 력'),
+('曇', 'dam'),
+('曇', 'tam'),
+('曇', '날 흐릴 담'),
+('曇', '담'),
+('曉', 'Hanja form of 효 (“dawn”).'),
+('曉', '새벽'),
+('曉', '새벽 효'),
+('曉', '효'),
+('曓', ' 창졸 포 '),
+('曓', 'p''o'),
+('曓', 'pho'),
+('曓', 'po'),
+('曓', '급할 포'),
+('曓', '포'),
+('曖', 'Hanja form of 애 (“dim”).'),
+('曖', '애'),
+('曖', '희미하다'),
+('曖', '희미할'),
+('曖', '희미할 애'),
+('曙', 'Hanja form of 서 (“dawn”).'),
+('曙', '새벽'),
+('曙', '새벽 서'),
+('曙', '서'),
+('曚', '몽'),
+('曚', '어두울 몽'),
+('曛', 'dusk'),
+('曛', 'hun'),
+('曛', 'hwun'),
+('曛', 'sunset'),
+('曛', 'twilight'),
+('曛', '삭양 빛 훈'),
+('曛', '훈'),
+('曜', ' 요일 요'),
+('曜', 'Hanja form of 요 (“day of the week (in this case, usually used with 일 (日, il))”).'),
+('曜', 'Hanja form of 요 (“shiny”).'),
+('曜', '빛나다'),
+('曜', '빛날'),
+('曜', '요'),
+('曜', '해 비칠 요'),
+('曝', ' 볕 쏘일 포'),
+('曝', '볕 쬘 포'),
+('曝', '햇볕에 말릴 폭'),
+('曠', 'empty'),
+('曠', 'extensive, wide, broad'),
+('曠', 'gwang'),
+('曠', 'kwang'),
+('曠', '광'),
+('曠', '밝을 광'),
+('曡', 'cep'),
+('曡', 'chŏp'),
+('曡', 'jeop'),
+('曡', '접'),
+('曣', ' 청명할 연 '),
+('曣', 'yen'),
+('曣', 'yeon'),
+('曣', 'yŏn'),
+('曣', '더울 연'),
+('曣', '연'),
+('曦', 'early dawn'),
+('曦', 'hui'),
+('曦', 'huy'),
+('曦', 'hŭi'),
+('曦', 'sunlight'),
+('曦', 'sunshine'),
+('曦', '햇빛 희'),
+('曦', '희'),
+('曨', '어스레할 롱'),
+('曩', '낭'),
+('曩', '접때 낭'),
+('曪', '날 흐릴 라 '),
+('曬', 'expose to the sun'),
+('曬', 'to bask'),
+('曬', 'to dry'),
+('曬', '쇄'),
+('曮', '엄'),
+('曮', '해 다니는 길 엄 '),
+('曯', 'ch''ok'),
+('曯', 'chok'),
+('曯', '비칠 촉 '),
+('曯', '촉'),
+('曰', 'Hanja form of 왈 (“...said (denoting the creator of a quote)”).'),
+('曰', 'Hanja form of 왈 (“...said (denoting the creator of a quote)”). [adverb]'),
+('曰', '가로'),
+('曰', '가로다'),
+('曰', '가로되 왈'),
+('曰', '왈'),
+('曲', 'Hanja form of 곡 (“a piece of music; tune”).'),
+('曲', 'Hanja form of 곡 (“bent; twisted; curved”).'),
+('曲', '곡'),
+('曲', '굽다'),
+('曲', '굽을'),
+('曲', '굽을 곡'),
+('曳', ' 당길 예'),
+('曳', ' 천천히 할 예'),
+('曳', '끌 예'),
+('曳', '예'),
+('更', 'Hanja form of 갱 (“again”).'),
+('更', 'Hanja form of 경 (“to change; to fix”).'),
+('更', '갱'),
+('更', '경'),
+('更', '고치다'),
+('更', '고칠'),
+('更', '고칠 경'),
+('更', '다시'),
+('更', '다시 갱'),
+('曷', ' 그칠 갈'),
+('曷', ' 벌레이름 갈'),
+('曷', 'gal'),
+('曷', 'kal'),
+('曷', '갈'),
+('曷', '어찌 갈'),
+('書', 'Hanja form of 서 (“document”).'),
+('書', '글'),
+('書', '서'),
+('書', '쓸 서'),
+('曹', '무리 조'),
+('曹', '조'),
+('曺', 'A government office.'),
+('曺', 'A group.'),
+('曺', 'A litigant.'),
+('曺', 'A partner.'),
+('曺', 'A room.'),
+('曺', 'A village.'),
+('曺', 'Memorial service.'),
+('曺', 'The State of Cao.'),
+('曺', 'a surname. Cho, Jo'),
+('曺', '무리'),
+('曺', '성 조 '),
+('曺', '성씨'),
+('曺', '조'),
+('曼', 'man'),
+('曼', '끌 만'),
+('曼', '만'),
+('曾', 'chŭng'),
+('曾', 'cung'),
+('曾', 'jeung'),
+('曾', '일찍 증'),
+('曾', '증'),
+('替', 'Hanja form of 체 (“to change; switch”).'),
+('替', '바꾸다'),
+('替', '바꿀'),
+('替', '바꿀 체'),
+('替', '체'),
+('最', ' 넉넉할 최'),
+('最', ' 우뚝할 최'),
+('最', 'Hanja form of 최 (“most”).'),
+('最', '가장'),
+('最', '가장 최'),
+('最', '최'),
+('會', 'Hanja form of 회 (“to gather, assemble”).'),
+('會', '그림 괴'),
+('會', '모이다'),
+('會', '모일'),
+('會', '모일 회'),
+('會', '회'),
+('朅', 'geol'),
+('朅', 'kel'),
+('朅', 'kŏl'),
+('朅', '갈 걸'),
+('朅', '걸'),
+('月', 'Hanja form of 월 (“Short for 월요일(月曜日) (woryoil, “Monday”).”).'),
+('月', 'Hanja form of 월 (“month”).'),
+('月', 'Hanja form of 월 (“month”). [noun]'),
+('月', 'Hanja form of 월 (“moon”).'),
+('月', 'Hanja form of 월 (“moon”). [affix]'),
+('月', '달'),
+('月', '달 월'),
+('月', '월'),
+('有', ' 과연 유'),
+('有', ' 또 유'),
+('有', ' 얻을 유'),
+('有', 'Hanja form of 유 (“to possess; to have; to exist”).'),
+('有', '유'),
+('有', '있다'),
+('有', '있을'),
+('有', '있을 유'),
+('朋', 'Hanja form of 붕 (“friend”).'),
+('朋', '벗'),
+('朋', '벗 붕'),
+('朋', '붕'),
+('朌', '頒과 同字'),
+('朌', '구실 반'),
+('服', 'Hanja form of 복 (“clothes, clothing”).'),
+('服', '복'),
+('服', '옷'),
+('服', '옷 복'),
+('朏', 'crescent'),
+('朏', '비'),
+('朔', 'Hanja form of 삭 (“the first day of the lunar month”).'),
+('朔', '삭'),
+('朔', '초하루'),
+('朔', '초하루 삭'),
+('朕', 'Hanja form of 짐 (“I; me”). (similar to the royal we)'),
+('朕', '나'),
+('朕', '나 짐'),
+('朕', '짐'),
+('朗', 'Hanja form of 랑/낭 (“clear; bright”).'),
+('朗', '낭'),
+('朗', '랑'),
+('朗', '밝다'),
+('朗', '밝을'),
+('朗', '밝을 랑'),
+('朙', 'myeong'),
+('朙', 'myŏng'),
+('朙', '명'),
+('望', 'Hanja form of 망 (“to admire; to respect”).'),
+('望', 'Hanja form of 망 (“to desire; to expect; to hope”).'),
+('望', 'Hanja form of 망 (“to gaze; to look”).'),
+('望', 'Hanja form of 망 (“to peek; to peep”).'),
+('望', '망'),
+('望', '바라다'),
+('望', '바랄'),
+('望', '바랄 망'),
+('朝', 'Hanja form of 조 (“Joseon”).'),
+('朝', 'Hanja form of 조 (“dynasty; imperial court”).'),
+('朝', 'Hanja form of 조 (“morning; day”).'),
+('朝', '아침'),
+('朝', '아침 조'),
+('朝', '조'),
+('朝', '조정(朝廷)'),
+('朞', '기'),
+('朞', '돌 기'),
+('期', 'Hanja form of 기 (“expect; time; period”).'),
+('期', '기'),
+('期', '기약하다'),
+('期', '기약할'),
+('期', '기약할 기'),
+('朣', 'dong'),
+('朣', 'tong'),
+('朣', '달 뜰 동'),
+('朣', '동'),
+('朦', 'Hanja form of 몽 (“Used in 몽롱(朦朧) (mongnong)”).'),
+('朦', '몽'),
+('朦', '풍부할 몽'),
+('朦', '흐리다'),
+('朦', '흐릴'),
+('朧', 'Hanja form of 롱/농 (“Used in 몽롱(朦朧) (mongnong)”).'),
+('朧', '농'),
+('朧', '롱'),
+('朧', '흐릿하다'),
+('朧', '흐릿할'),
+('朧', '흐릿할 롱'),
+('木', ' 목각활자 모'),
+('木', 'Hanja form of 목 (“Short for 목요일(木曜日) (mogyoil, “Thursday”).”).'),
+('木', 'Hanja form of 목 (“tree; wood; wooden”).'),
+('木', 'Hanja form of 목 (“tree; wood; wooden”). [affix]'),
+('木', '나무'),
+('木', '나무 목'),
+('木', '나무에 서화를 새길 모'),
+('木', '목'),
+('朩', 'Kwukyel form of 드 (deu)'),
+('朩', 'rank, grade'),
+('朩', 'skin of the hemp stalk'),
+('朩', '등'),
+('朩', '무리'),
+('朩', '빈'),
+('朩', '삼줄기 껍질'),
+('未', 'Hanja form of 미 (“not; un-; in- (not yet)”).'),
+('未', 'Hanja form of 미 (“to have not; not yet”).'),
+('未', '미'),
+('未', '아니다'),
+('未', '아닐'),
+('未', '아닐 미'),
+('末', 'flour, powder'),
+('末', 'something coarse, improper, inferior, trivial'),
+('末', 'the end, last, low'),
+('末', '끝'),
+('末', '끝 말'),
+('末', '말'),
+('本', 'Hanja form of 본 (“(finance) principal”).'),
+('本', 'Hanja form of 본 (“ancestor; fatherland; hometown”).'),
+('本', 'Hanja form of 본 (“counter for books; book; publication”).'),
+('本', 'Hanja form of 본 (“main; primary; principal”).'),
+('本', 'Hanja form of 본 (“mind; nature; essence; true self”).'),
+('本', 'Hanja form of 본 (“model; version”).'),
+('本', 'Hanja form of 본 (“root; basis; foundation; stem”).'),
+('本', 'Hanja form of 본 (“source; origin”).'),
+('本', 'Hanja form of 본 (“this; this very”).'),
+('本', '근본'),
+('本', '밑 본'),
+('本', '본'),
+('札', 'ch''al'),
+('札', 'chal'),
+('札', 'letter'),
+('札', '찰'),
+('札', '패 찰'),
+('朮', '삽주'),
+('朮', '삽주뿌리 출'),
+('朮', '출'),
+('术', 'ch''ul'),
+('术', 'chul'),
+('术', 'chwul'),
+('术', '출'),
+('朰', 'kwukyel form of 몰 (mol)'),
+('朰', '몰'),
+('朰', '음역자'),
+('朱', 'Hanja form of 주 (“vermillion, cinnabar”).'),
+('朱', '붉을'),
+('朱', '붉을 주'),
+('朱', '주'),
+('朳', 'p''a'),
+('朳', 'pa'),
+('朳', 'pha'),
+('朳', '파'),
+('朴', 'Hanja form of 박 (“a surname.”).'),
+('朴', 'Hanja form of 박 (“naive; simple”).'),
+('朴', '나무껍질 박'),
+('朴', '박'),
+('朴', '성씨'),
+('朴', '순박하다'),
+('朴', '순박할'),
+('朵', 't''a'),
+('朵', 'ta'),
+('朵', 'tha'),
+('朵', '朶와 同字'),
+('朵', '타'),
+('朶', ' 떨기 타'),
+('朶', ' 움킬 타'),
+('朶', 't''a'),
+('朶', 'ta'),
+('朶', 'tha'),
+('朶', '나무가지 휘늘어질 타'),
+('朶', '타'),
+('机', 'desk'),
+('机', 'gwe'),
+('机', 'kwe'),
+('机', 'kwey'),
+('机', '궤'),
+('机', '느티나무 궤'),
+('朽', '섞을 후'),
+('朽', '후'),
+('杅', 'bath tub'),
+('杅', 'bowl'),
+('杅', 'u'),
+('杅', '우'),
+('杆', ' 나무이름 간'),
+('杆', 'gan'),
+('杆', 'kan'),
+('杆', 'pole'),
+('杆', 'shaft of spear'),
+('杆', '간'),
+('杆', '지레 간'),
+('杇', 'o'),
+('杇', 'trowel'),
+('杇', '오'),
+('杈', '가지: branch'),
+('杈', '차'),
+('杉', 'Japanese cedar (cryptomeria)'),
+('杉', 'sam'),
+('杉', '삼'),
+('杉', '삼나무 삼'),
+('杋', 'beom'),
+('杋', 'pŏm'),
+('杋', '범'),
+('杌', '나무 그루터기: grubber, stump'),
+('杌', '올'),
+('李', 'Hanja form of 리/이 (“Lee, the second most common Korean surname.”).'),
+('李', 'Hanja form of 리/이 (“plum tree”).'),
+('李', '리'),
+('李', '오얏 리'),
+('李', '오얏나무'),
+('李', '이'),
+('杏', ' 은행 행'),
+('杏', 'Hanja form of 행 (“apricot”).'),
+('杏', '살구'),
+('杏', '살구 행'),
+('杏', '행'),
+('材', ' 늘미 재'),
+('材', ' 성품 재'),
+('材', ' 재주 재'),
+('材', 'Hanja form of 재 (“material; talent”).'),
+('材', '재'),
+('材', '재목'),
+('材', '재목 재'),
+('村', ' 밭집 촌'),
+('村', ' 시골 촌'),
+('村', 'Hanja form of 촌 (“village”).'),
+('村', '마을'),
+('村', '마을 촌'),
+('村', '촌'),
+('杓', '구기 작'),
+('杓', '북두자루 표'),
+('杖', 'cang'),
+('杖', 'chang'),
+('杖', 'jang'),
+('杖', '장'),
+('杖', '지팡이 장'),
+('杜', 'du'),
+('杜', 'tu'),
+('杜', 'twu'),
+('杜', '두'),
+('杜', '막을 두'),
+('杞', 'gi'),
+('杞', 'ki'),
+('杞', '기'),
+('杞', '나무 이름 기'),
+('束', ' 단나무 속'),
+('束', ' 비단 다섯끝 속'),
+('束', ' 약속할 속'),
+('束', 'Hanja form of 속 (“bunch; to bind”).'),
+('束', '묶다'),
+('束', '묶을'),
+('束', '묶을 속'),
+('束', '속'),
+('杠', ' 깃대 강'),
+('杠', ' 상 앞 가로막대 강'),
+('杠', ' 올릴 강'),
+('杠', 'gang'),
+('杠', 'kang'),
+('杠', '강'),
+('杠', '외나무 다리 강'),
+('条', '條의 略字'),
+('杪', '끝 초'),
+('杪', '초'),
+('杬', ' 나무이름 원 '),
+('杬', 'wen'),
+('杬', 'won'),
+('杬', 'wŏn'),
+('杬', '몸 주무를 원'),
+('杬', '원'),
+('杭', ' 거루 항'),
+('杭', ' 고을이름 항'),
+('杭', 'hang'),
+('杭', '건널 항'),
+('杭', '항'),
+('杮', 'p''ye'),
+('杮', 'phyey'),
+('杮', 'pye'),
+('杮', '대패밥 폐'),
+('杮', '폐'),
+('杯', 'Hanja form of 배 (“cup, glass”).'),
+('杯', '배'),
+('杯', '잔'),
+('杯', '잔 배'),
+('杰', 'geol'),
+('杰', 'kel'),
+('杰', 'kŏl'),
+('杰', '傑의 俗字'),
+('杰', '걸'),
+('東', 'Hanja form of 동 (“east; eastern”).'),
+('東', '동'),
+('東', '동녘'),
+('東', '동녘 동'),
+('杲', '고'),
+('杲', '밝을 고'),
+('杳', '어두울 묘'),
+('杵', ' 방망이 저'),
+('杵', ' 혜성 저'),
+('杵', '공이 저'),
+('杵', '저'),
+('杷', ' 써레 파'),
+('杷', ' 악기이름 파'),
+('杷', ' 칼자루 파'),
+('杷', 'p''a'),
+('杷', 'pa'),
+('杷', 'pha'),
+('杷', '비파나무 파'),
+('杷', '파'),
+('杻', ' 조막손이 추'),
+('杻', '수갑 추'),
+('杻', '옷 부드러울 뉴'),
+('杼', ' 도토리 저'),
+('杼', '북 저'),
+('杼', '저'),
+('松', ' 땅이름 송'),
+('松', ' 향풀 송'),
+('松', 'pine'),
+('松', '소나무'),
+('松', '소나무 송'),
+('松', '송'),
+('板', ' 널기와 판'),
+('板', ' 풍류이름 판'),
+('板', 'Hanja form of 판 (“plank”).'),
+('板', '널빤지'),
+('板', '널조각 판'),
+('板', '판'),
+('极', 'geuk'),
+('极', 'kuk'),
+('极', 'kŭk'),
+('极', '극'),
+('枇', 'bi'),
+('枇', 'pi'),
+('枇', '비'),
+('枇', '비파나무 비'),
+('枉', ' 원통할 왕'),
+('枉', 'wang'),
+('枉', '굽을 왕'),
+('枉', '왕'),
+('枋', '다목 방'),
+('枋', '방'),
+('枌', 'bun'),
+('枌', 'pun'),
+('枌', '나무 이름 분'),
+('枌', '분'),
+('枏', '남'),
+('枏', '녹나무 남'),
+('析', 'sek'),
+('析', 'seok'),
+('析', 'sŏk'),
+('析', '가를 석'),
+('析', '석'),
+('枓', 'arch'),
+('枓', 'small ladle, dipper'),
+('枓', '두'),
+('枓', '두공 두'),
+('枕', ' 소말뚝 침'),
+('枕', ' 수레뒤 가로댄 나무 침'),
+('枕', '베개 침'),
+('枕', '침'),
+('林', 'Hanja form of 림/임 (“forest”).'),
+('林', '림'),
+('林', '수풀'),
+('林', '수풀 림'),
+('林', '임'),
+('枘', '예'),
+('枘', '자루 예'),
+('枙', 'wa'),
+('枙', '옹이 와 '),
+('枙', '와'),
+('枚', '매'),
+('枚', '줄기 매'),
+('果', 'Hanja form of 과 (“fruit”).'),
+('果', 'Hanja form of 과 (“result”).'),
+('果', '과'),
+('果', '실과 과'),
+('果', '열매'),
+('枝', 'chi'),
+('枝', 'ci'),
+('枝', 'ji'),
+('枝', '가지 지'),
+('枝', '지'),
+('枯', 'Hanja form of 고 (“dry up, wither”).'),
+('枯', 'Hanja form of 고 (“thirst”).'),
+('枯', '고'),
+('枯', '마르다'),
+('枯', '마를'),
+('枯', '마를 고'),
+('枰', ' 바둑판 평'),
+('枰', ' 회양목 평'),
+('枰', 'p''yŏng'),
+('枰', 'phyeng'),
+('枰', 'pyeong'),
+('枰', '장기판 평'),
+('枰', '평'),
+('枱', 'dae'),
+('枱', 'tae'),
+('枱', 'tay'),
+('枱', '대'),
+('枲', ' 도꼬마리 시'),
+('枲', '수삼 시'),
+('枲', '시'),
+('枳', ' 사타구니 기'),
+('枳', '기'),
+('枳', '지'),
+('枳', '탱자'),
+('枳', '탱자나무'),
+('枳', '탱자나무 지'),
+('枳', '해할 기'),
+('架', 'ga'),
+('架', 'ka'),
+('架', '가'),
+('架', '시렁 가'),
+('枷', ' 도리깨채 가'),
+('枷', 'ga'),
+('枷', 'ka'),
+('枷', '가'),
+('枷', '목칼 가'),
+('枷', '칼'),
+('枸', 'gu'),
+('枸', 'ku'),
+('枸', 'kwu'),
+('枸', '구'),
+('枸', '구기자 구'),
+('枻', 'oar'),
+('枻', 'ye'),
+('枻', 'yey'),
+('枻', '예'),
+('枼', 'flat pieces of wood'),
+('枼', 'leaf'),
+('枼', 'slip'),
+('枼', 'table'),
+('枼', '엽'),
+('枾', 'si'),
+('枾', '柹의 本字'),
+('枾', '시'),
+('柁', 't''a'),
+('柁', 'ta'),
+('柁', 'tha'),
+('柁', '키 타'),
+('柁', '타'),
+('柄', 'byeong'),
+('柄', 'pyeng'),
+('柄', 'pyŏng'),
+('柄', '병'),
+('柄', '자루 병'),
+('柅', '니'),
+('柅', '얼레자루 니'),
+('柅', '이'),
+('柊', 'chong'),
+('柊', 'cong'),
+('柊', 'jong'),
+('柊', '방망이 종'),
+('柊', '종'),
+('柏', 'Used in the names of certain trees'),
+('柏', '나무 이름 백'),
+('柏', '백'),
+('某', 'Hanja form of 매 (“Prunus mume tree”).'),
+('某', 'Hanja form of 모 (“certain thing or person”).'),
+('某', '매'),
+('某', '매화나무'),
+('某', '매화나무 매'),
+('某', '모'),
+('某', '아무'),
+('某', '아무 모'),
+('柑', ' 감자 감'),
+('柑', '감귤 감'),
+('柒', 'ch''il'),
+('柒', 'chil'),
+('柒', '漆의 俗字'),
+('柒', '칠'),
+('染', ' 물들일 염'),
+('染', 'Hanja form of 염 (“dye”).'),
+('染', '꼭두서니 염'),
+('染', '물들이다'),
+('染', '물들일'),
+('染', '염'),
+('柔', ' 복종할 유'),
+('柔', ' 순할 유'),
+('柔', 'yu'),
+('柔', '부드러울 유'),
+('柔', '유'),
+('柗', 'pine tree'),
+('柗', '松과 同字 '),
+('柗', '소나무'),
+('柗', '송'),
+('柘', 'ca'),
+('柘', 'cha'),
+('柘', 'ja'),
+('柘', '산뽕나무 자'),
+('柘', '자'),
+('柙', ' 향나무 합'),
+('柙', 'wooden cage'),
+('柙', '우리 합'),
+('柙', '합'),
+('柚', '북 축'),
+('柚', '유자 유'),
+('柝', ' 목탁 탁'),
+('柝', ' 조두 탁'),
+('柝', '쪼갤 탁'),
+('柝', '탁'),
+('柞', '나무 이름 책'),
+('柞', '나무이름 작'),
+('柟', '枏의 俗字'),
+('柟', '남'),
+('柢', 'bottom, base'),
+('柢', 'ce'),
+('柢', 'chŏ'),
+('柢', 'jeo'),
+('柢', 'root'),
+('柢', '뿌리 저'),
+('柢', '저'),
+('查', 'Alternative form of 査'),
+('查', '사'),
+('查', '사실하다'),
+('查', '사실할'),
+('柩', 'coffin'),
+('柩', '관 구'),
+('柩', '구'),
+('柩', '널'),
+('柬', '가릴 간'),
+('柬', '간'),
+('柯', 'ga'),
+('柯', 'ka'),
+('柯', '가'),
+('柯', '가지 가'),
+('柰', '내'),
+('柰', '능금나무 내'),
+('柱', 'Hanja form of 주 (“pillar”).'),
+('柱', '기둥'),
+('柱', '기둥 주'),
+('柱', '주'),
+('柳', 'Hanja form of 류/유 (“willow tree”).'),
+('柳', '류'),
+('柳', '버드나무'),
+('柳', '버들'),
+('柳', '버들 류'),
+('柳', '유'),
+('柴', ' 불 땔 나무 시'),
+('柴', ' 시제지낼 시'),
+('柴', '섶 시'),
+('柴', '섶 채'),
+('柵', 'Hanja form of 책 (“fence”).'),
+('柵', '울짱 책'),
+('柵', '울타리'),
+('柵', '책'),
+('柶', '사'),
+('柶', '수저 사'),
+('柷', '축'),
+('柷', '축풍류 축'),
+('柹', '감 시'),
+('柹', '시'),
+('査', 'Hanja form of 사 (“investigate, inspect”).'),
+('査', '사'),
+('査', '사실할 사'),
+('査', '조사하다'),
+('査', '조사할'),
+('柾', ' 널 구'),
+('柾', '관 구'),
+('柾', '나무결 바를 정'),
+('柿', 'a persimmon'),
+('柿', 'si'),
+('柿', '柹의 俗字'),
+('柿', '시'),
+('栂', 'mae'),
+('栂', 'may'),
+('栂', '매'),
+('栃', 'hoe'),
+('栃', 'hoy'),
+('栃', 'stable'),
+('栃', 'type of oak'),
+('栃', '상수리나무 회'),
+('栃', '회'),
+('栄', '榮과 同字'),
+('栅', '울짱 책'),
+('栍', 'a tag'),
+('栍', '생'),
+('栍', '찌'),
+('栍', '찌 생'),
+('栒', ' 순나무 순'),
+('栒', 'sun'),
+('栒', 'swun'),
+('栒', '경쇠걸이 순'),
+('栒', '순'),
+('栓', 'cen'),
+('栓', 'chŏn'),
+('栓', 'jeon'),
+('栓', '말뚝 전'),
+('栓', '전'),
+('栖', 'se'),
+('栖', 'seo'),
+('栖', 'sŏ'),
+('栖', '깃들일 서'),
+('栖', '서'),
+('栗', 'Hanja form of 률/율 (“chestnut”).'),
+('栗', 'Hanja form of 률/율 (“chestnut”). [affix]'),
+('栗', '률'),
+('栗', '밤'),
+('栗', '밤나무 률'),
+('栗', '율'),
+('栝', 'an aged [old] pine tree'),
+('栝', 'firewood'),
+('栝', 'gwal'),
+('栝', 'kwal'),
+('栝', '괄'),
+('栝', '노송나무 괄'),
+('栞', 'gan'),
+('栞', 'kan'),
+('栞', '간'),
+('栞', '도표 간'),
+('校', 'Hanja form of 교 (“school; educational establishment”).'),
+('校', '교'),
+('校', '학교'),
+('校', '학교 교'),
+('校', '학궁 효'),
+('栢', 'baek'),
+('栢', 'paek'),
+('栢', 'payk'),
+('栢', '柏의 俗字'),
+('栢', '백'),
+('株', 'Hanja form of 주 (“stump of a tree”).'),
+('株', '그루'),
+('株', '그루 주'),
+('株', '주'),
+('栮', ' 느타리 이 '),
+('栮', 'i'),
+('栮', '버섯 이'),
+('栮', '이'),
+('栯', 'uk'),
+('栯', 'wuk'),
+('栯', '산앵두 욱 '),
+('栯', '욱'),
+('栱', 'arch'),
+('栱', 'gong'),
+('栱', 'kong'),
+('栱', 'peg'),
+('栱', '공'),
+('栱', '두공 공'),
+('栲', '고'),
+('栲', '북나무 고'),
+('栴', 'cen'),
+('栴', 'chŏn'),
+('栴', 'jeon'),
+('栴', 'sandalwood'),
+('栴', '전'),
+('栴', '향나무 전'),
+('核', ' 자세할 핵'),
+('核', 'Earth''s core'),
+('核', 'Short for 핵무기(核武器) (haengmugi, “nuclear weapons”).'),
+('核', 'atomic nucleus'),
+('核', 'cell nucleus'),
+('核', 'core of planets or other celestial bodies'),
+('核', 'core of planets or other celestial bodies:'),
+('核', 'core, kernel; centre'),
+('核', 'ring, such as a benzene ring'),
+('核', '실과 핵'),
+('核', '씨 홀'),
+('核', '핵'),
+('根', 'Hanja form of 근 (“root; base; stump”).'),
+('根', '근'),
+('根', '뿌리'),
+('根', '뿌리 근'),
+('栻', 'sik'),
+('栻', '식'),
+('栻', '점판 식'),
+('格', ' 감동할 격'),
+('格', ' 대적할 격'),
+('格', ' 바를 격'),
+('格', ' 올 격'),
+('格', 'Hanja form of 각 (“tree branch”).'),
+('格', 'Hanja form of 격 (“status”).'),
+('格', '가지'),
+('格', '각'),
+('格', '격'),
+('格', '막힐 락'),
+('格', '바로잡을'),
+('格', '이를 격'),
+('栽', 'cay'),
+('栽', 'chae'),
+('栽', 'jae'),
+('栽', '심을 재'),
+('栽', '재'),
+('桀', ' 멜 걸'),
+('桀', ' 빼어날 걸'),
+('桀', ' 사나을 걸'),
+('桀', ' 왕이름 걸'),
+('桀', ' 홰 걸'),
+('桀', '걸'),
+('桀', '찢을 걸'),
+('桁', ' 마개 형'),
+('桁', ' 배다리 항'),
+('桁', ' 횃대 항'),
+('桁', '수갑 항'),
+('桁', '시렁 형'),
+('桂', 'Hanja form of 경 (“cinnamon”).'),
+('桂', '계'),
+('桂', '계수나무'),
+('桂', '계수나무 계'),
+('桃', 'Hanja form of 도 (“marriage”).'),
+('桃', 'Hanja form of 도 (“peach”).'),
+('桃', '도'),
+('桃', '복숭아 나무'),
+('桃', '복숭아 나무 도'),
+('桄', '광'),
+('桄', '광랑나무 광'),
+('框', 'gwang'),
+('框', 'kwang'),
+('框', '광'),
+('框', '문테 광'),
+('案', ' 생각할 안'),
+('案', 'Hanja form of 안 (“(literal) desk; table”).'),
+('案', 'Hanja form of 안 (“idea; suggestion; opinion; thought”).'),
+('案', 'Hanja form of 안 (“plan; proposal; bill”).'),
+('案', '안'),
+('案', '책상'),
+('案', '책상 안'),
+('桉', '案과 同字 '),
+('桉', '안'),
+('桎', '질'),
+('桎', '차꼬 질'),
+('桐', '동'),
+('桐', '오동나무'),
+('桐', '오동나무 동'),
+('桑', 'Hanja form of 상 (“mulberry tree”).'),
+('桑', 'Hanja form of 상 (“mulberry tree”). [affix]'),
+('桑', '뽕나무'),
+('桑', '뽕나무 상'),
+('桑', '상'),
+('桓', 'hwan'),
+('桓', '푯말 환'),
+('桓', '환'),
+('桔', 'gil'),
+('桔', 'kil'),
+('桔', '길'),
+('桔', '도라지 길'),
+('桜', '벚나무 앵'),
+('桭', 'chin'),
+('桭', 'cin'),
+('桭', 'jin'),
+('桭', '진'),
+('桭', '평고대 진 '),
+('桯', ' 걸상 정'),
+('桯', 'ceng'),
+('桯', 'chŏng'),
+('桯', 'jeong'),
+('桯', '서안 정'),
+('桯', '정'),
+('桴', '마룻대 부'),
+('桴', '부'),
+('桶', 'Used in compounds to refer to body parts that resemble containers (being hollow, etc.), often with a colloquial nuance.'),
+('桶', 'barrel, bucket, cask, pail, vat'),
+('桶', '곡식 셈하는 단위 휘 용'),
+('桶', '엿되들이 통 통'),
+('桶', '통'),
+('桷', 'gak'),
+('桷', 'kak'),
+('桷', '각'),
+('桷', '서까래 각'),
+('桾', 'gun'),
+('桾', 'kun'),
+('桾', 'kwun'),
+('桾', '고욤나무 군 '),
+('桾', '군'),
+('桿', 'han'),
+('桿', '막대기 한'),
+('桿', '한'),
+('梁', 'Hanja form of 량/양 (“beam; bridge”).'),
+('梁', '들보'),
+('梁', '량'),
+('梁', '양'),
+('梁', '푸조나무 량'),
+('梃', ' 꼿꼿할 정'),
+('梃', ' 막대 정'),
+('梃', '외줄기 정'),
+('梃', '정'),
+('梅', 'Hanja form of 매 (“Prunus mume, a fruit tree”).'),
+('梅', 'Hanja form of 매 (“a Korean surname”).'),
+('梅', 'Hanja form of 매 (“plum blossom, a blossom of this tree”).'),
+('梅', '매'),
+('梅', '매화나무'),
+('梅', '매화나무 매'),
+('梆', '목어 방'),
+('梆', '방'),
+('梏', '곡'),
+('梏', '쇠고랑 곡'),
+('梓', ' 고향 재'),
+('梓', ' 목수 재'),
+('梓', ' 우러러 볼 재'),
+('梓', 'cay'),
+('梓', 'chae'),
+('梓', 'jae'),
+('梓', '가래나무 재'),
+('梓', '재'),
+('梔', '치'),
+('梔', '치자 치'),
+('梗', 'Hanja form of 경 (“stem; stalk”).'),
+('梗', '경'),
+('梗', '대개 경'),
+('梗', '줄기'),
+('梘', 'gyeon'),
+('梘', 'kyen'),
+('梘', 'kyŏn'),
+('梘', '견'),
+('梘', '홈통: gutter'),
+('梛', '나'),
+('梛', '나무 이름 나 '),
+('條', '가지 조'),
+('條', '조'),
+('梟', '올배미 효'),
+('梟', '올빼미'),
+('梟', '효'),
+('梠', '평고대 려'),
+('梡', ' 토막나무 완'),
+('梡', 'wan'),
+('梡', '네 발 도마 완'),
+('梡', '완'),
+('梢', 'ch''o'),
+('梢', 'cho'),
+('梢', '나무 끝 초'),
+('梢', '초'),
+('梣', 'ash tree'),
+('梣', '물푸레나무'),
+('梣', '물푸레나무 심 '),
+('梣', '침'),
+('梧', ' 버틸 오'),
+('梧', 'o'),
+('梧', '머귀나무 오'),
+('梧', '오'),
+('梨', 'Hanja form of 리/이 (“pear tree”).'),
+('梨', '리'),
+('梨', '배나무'),
+('梨', '이'),
+('梨', '태나무 리'),
+('梭', '북 사'),
+('梭', '사'),
+('梯', '사다리 제'),
+('梯', '제'),
+('械', 'Hanja form of 계 (“weapons, instruments”).'),
+('械', '계'),
+('械', '형틀'),
+('械', '형틀 계'),
+('梱', 'gon'),
+('梱', 'kon'),
+('梱', '곤'),
+('梱', '문지방 곤'),
+('梲', 'chŏl'),
+('梲', 'jeol'),
+('梲', 'joist'),
+('梲', 'stick'),
+('梲', '절'),
+('梳', 'comb, brush'),
+('梳', 'so'),
+('梳', '소'),
+('梳', '얼레빗 소'),
+('梵', 'beom'),
+('梵', 'pem'),
+('梵', 'pŏm'),
+('梵', '범'),
+('梵', '범어 범'),
+('梶', '나무 끝 미'),
+('梶', '미'),
+('棄', 'Hanja form of 기 (“reject, abandon, discard”).'),
+('棄', '기'),
+('棄', '버리다'),
+('棄', '버릴'),
+('棄', '버릴 기'),
+('棅', 'byeong'),
+('棅', 'pyeng'),
+('棅', 'pyŏng'),
+('棅', '柄과 同字'),
+('棅', '병'),
+('棉', '면'),
+('棉', '목화 면'),
+('棊', '棋와 同字'),
+('棊', '기'),
+('棋', 'gi'),
+('棋', 'ki'),
+('棋', '기'),
+('棋', '바둑 기'),
+('棌', '참나무 채 '),
+('棌', '채'),
+('棍', '몽둥이 곤'),
+('棍', '묶을 혼'),
+('棐', '도지개 비'),
+('棐', '비'),
+('棒', '몽둥이'),
+('棒', '몽둥이 봉'),
+('棒', '봉'),
+('棕', 'Hanja form of 종 (“palm tree”).'),
+('棕', '종'),
+('棕', '종려나무'),
+('棕', '종려나무 종'),
+('棖', ' 막대 정'),
+('棖', 'a prop'),
+('棖', 'door jam'),
+('棖', 'door stop'),
+('棖', 'post'),
+('棖', 'touch'),
+('棖', '문설주 정'),
+('棖', '정'),
+('棗', 'cho'),
+('棗', 'co'),
+('棗', 'jo'),
+('棗', '대추나무 조'),
+('棗', '조'),
+('棘', 'geuk'),
+('棘', 'kuk'),
+('棘', 'kŭk'),
+('棘', '가시나무 극'),
+('棘', '극'),
+('棚', '붕'),
+('棚', '시렁 붕'),
+('棟', 'dong'),
+('棟', 'tong'),
+('棟', '동'),
+('棟', '용마루 동'),
+('棠', 'dang'),
+('棠', 'tang'),
+('棠', '당'),
+('棠', '아가위 당'),
+('棣', 'Hanja form of 체 (“Vaccinium koreanum”).'),
+('棣', 'Hanja form of 체 (“to attain; to reach”).'),
+('棣', 'Hanja form of 태 (“courteous appearance”).'),
+('棣', '산앵두나무'),
+('棣', '산앵두나무 체'),
+('棣', '익숙하다'),
+('棣', '익숙할'),
+('棣', '체'),
+('棣', '태'),
+('棧', '잔교 잔'),
+('棨', 'gye'),
+('棨', 'kye'),
+('棨', 'kyey'),
+('棨', '계'),
+('棨', '창 계'),
+('棬', 'gwon'),
+('棬', 'kwen'),
+('棬', 'kwŏn'),
+('棬', '권'),
+('棬', '휘어만든 나무그릇 권'),
+('森', 'forest'),
+('森', '나무빽빽할 삼'),
+('森', '삼'),
+('森', '숲'),
+('棲', 'Hanja form of 서 (“roost”).'),
+('棲', '깃들일'),
+('棲', '살 서'),
+('棲', '서'),
+('棹', 'do'),
+('棹', 'to'),
+('棹', '노 저을 도'),
+('棹', '도'),
+('棺', 'Hanja form of 관 (“coffin”).'),
+('棺', '관'),
+('棺', '널'),
+('棺', '널 관'),
+('棻', '분'),
+('棼', 'disorder'),
+('棼', 'ridgepole'),
+('棼', '마룻대 분'),
+('棼', '분'),
+('椀', ' 사발 완'),
+('椀', '완'),
+('椀', '주발 완'),
+('椁', '관 곽'),
+('椄', ' 문설주 접'),
+('椄', ' 형벌틀 접'),
+('椄', 'cep'),
+('椄', 'chŏp'),
+('椄', 'jeop'),
+('椄', '나무 접붙일 접'),
+('椄', '접'),
+('椅', ' 교의 의'),
+('椅', 'Hanja form of 의 (“chair”).'),
+('椅', '가래나무 의'),
+('椅', '의'),
+('椅', '의자(椅子)'),
+('椋', '들보 량'),
+('植', ' 달굿대 치'),
+('植', ' 두목 치'),
+('植', ' 세울 식'),
+('植', ' 세울 치'),
+('植', ' 심을 치'),
+('植', ' 초목 식'),
+('植', 'Alternative form of 置 (“Hanja form of 치 (“to put”).”)'),
+('植', 'Hanja form of 식 (“to plant”).'),
+('植', '둘'),
+('植', '방망이 치'),
+('植', '식'),
+('植', '심을'),
+('植', '심을 식'),
+('植', '치'),
+('椎', ' 짓찧을 추'),
+('椎', ' 참나무 추'),
+('椎', ' 칠 추'),
+('椎', 'Hanja form of 추 (“(anatomy) spine”).'),
+('椎', 'Hanja form of 추 (“mallet”).'),
+('椎', '몽치'),
+('椎', '쇠몽둥이 추'),
+('椎', '추'),
+('椏', 'a'),
+('椏', '아'),
+('椑', 'bi'),
+('椑', 'pi'),
+('椑', '비'),
+('椑', '술통 비'),
+('椒', '산초나무'),
+('椒', '산초나무 초'),
+('椒', '초'),
+('椗', 'anchor, perhaps especially made of wood.'),
+('椗', 'ceng'),
+('椗', 'chŏng'),
+('椗', 'jeong'),
+('椗', '정'),
+('椙', 'ch''ang'),
+('椙', 'chang'),
+('椙', '삼나무 창 '),
+('椙', '창'),
+('検', '檢과 同字'),
+('椦', 'gwon'),
+('椦', 'kwen'),
+('椦', 'kwŏn'),
+('椦', '권'),
+('椧', 'gutter'),
+('椧', 'myeng'),
+('椧', 'myeong'),
+('椧', 'myŏng'),
+('椧', '명'),
+('椧', '홈 통 명'),
+('椰', 'ya'),
+('椰', '야'),
+('椰', '야자나무 야'),
+('椴', 'linden, lime tree'),
+('椴', '단'),
+('椴', '자작나무 단'),
+('椶', '棕과 同字'),
+('椶', '종'),
+('椹', ' 도끼바탕 침'),
+('椹', ' 토막 침'),
+('椹', 'ch''im'),
+('椹', 'chim'),
+('椹', 'chopping block'),
+('椹', 'mulberry fruit (桑實)'),
+('椹', '모탕 침'),
+('椹', '침'),
+('椺', 'bo'),
+('椺', 'po'),
+('椺', '들보 보'),
+('椺', '보'),
+('椽', '서까래 연'),
+('椿', ' 대춘나무 춘'),
+('椿', ' 어르신네 춘'),
+('椿', 'ch''un'),
+('椿', 'chun'),
+('椿', 'chwun'),
+('椿', '참죽나무 춘'),
+('椿', '춘'),
+('楂', '떼 사'),
+('楂', '사'),
+('楊', 'willow'),
+('楊', 'yang'),
+('楊', '갯버들 양'),
+('楊', '양'),
+('楏', 'gyu'),
+('楏', 'kyu'),
+('楏', '규'),
+('楏', '호미자루 규 '),
+('楓', ' 신나무 풍'),
+('楓', 'Hanja form of 풍 (“maple (tree)”).'),
+('楓', '단풍나무'),
+('楓', '단풍나무 풍'),
+('楓', '풍'),
+('楔', '문설주 설'),
+('楔', '설'),
+('楕', 'Hanja form of 타 (“long and round”).'),
+('楕', '橢의 略字'),
+('楕', '길고 둥글'),
+('楕', '타'),
+('楗', ' 문지방 건'),
+('楗', 'geon'),
+('楗', 'ken'),
+('楗', 'kŏn'),
+('楗', '건'),
+('楗', '문 빗장 건'),
+('楙', ' 아름다울 무'),
+('楙', 'name of plant; lush'),
+('楙', '무'),
+('楙', '무성할 무'),
+('楚', 'ch''o'),
+('楚', 'cho'),
+('楚', 'clear'),
+('楚', 'name of feudal state'),
+('楚', '초'),
+('楚', '회초리 초'),
+('楝', '멀구슬나무 련'),
+('楞', '모 릉'),
+('楠', 'nam'),
+('楠', '남'),
+('楠', '녹나무 남'),
+('楡', ' 서쪽 유'),
+('楡', 'elm tree'),
+('楡', 'yu'),
+('楡', '느름나무 유'),
+('楡', '유'),
+('楢', ' 홰 유'),
+('楢', '부드러운 나무 유'),
+('楢', '유'),
+('楣', ' 처마 미'),
+('楣', 'mi'),
+('楣', '문미 미'),
+('楣', '미'),
+('楥', ' 신골 원'),
+('楥', ' 실감개 원'),
+('楥', '떡갈나무 원'),
+('楥', '원'),
+('楦', '원'),
+('楨', ' 단단한 나무 정'),
+('楨', 'ceng'),
+('楨', 'chŏng'),
+('楨', 'hardwood'),
+('楨', 'jeong'),
+('楨', 'posts'),
+('楨', 'privet'),
+('楨', 'supports'),
+('楨', '담틀 마구리대 정'),
+('楨', '정'),
+('楪', 'cep'),
+('楪', 'chŏp'),
+('楪', 'jeop'),
+('楪', '널평상 접'),
+('楪', '접'),
+('楫', '노 접'),
+('楫', '노 즙'),
+('楬', 'gal'),
+('楬', 'kal'),
+('楬', '갈'),
+('楬', '패를 써서 표시할 갈'),
+('業', ' 공경할 업'),
+('業', ' 벌써 업'),
+('業', ' 씩씩할 업'),
+('業', ' 위태할 업'),
+('業', 'Hanja form of 업 (“work”).'),
+('業', '업'),
+('業', '일'),
+('業', '일 업'),
+('楮', ' 감매나무 저'),
+('楮', ' 종이돈 저'),
+('楮', 'paper'),
+('楮', 'paper money'),
+('楮', 'paper mulberry (닥나무, 꾸지나무)'),
+('楮', '닥나무 저'),
+('楮', '저'),
+('楯', ' 방패 순'),
+('楯', ' 뺄 순'),
+('楯', ' 상여 순'),
+('楯', '난간 순'),
+('楯', '순'),
+('楳', '梅의 古字'),
+('楳', '매'),
+('楴', '체'),
+('極', 'Hanja form of 극 (“pole; extremity”).'),
+('極', '가운데 극'),
+('極', '극'),
+('極', '다하다'),
+('極', '다할'),
+('楷', ' 법 해'),
+('楷', ' 본뜰 해'),
+('楷', ' 해자 해'),
+('楷', 'hae'),
+('楷', 'hay'),
+('楷', '해'),
+('楷', '해나무 해'),
+('楸', ' 노나무 추'),
+('楸', ' 바둑판 추'),
+('楸', ' 산유자 추'),
+('楸', '가래나무 추'),
+('楸', '추'),
+('楹', ' 하관들 영'),
+('楹', 'yeng'),
+('楹', 'yeong'),
+('楹', 'yŏng'),
+('楹', '기둥 영'),
+('楹', '영'),
+('楼', '樓의 俗字'),
+('概', '槪와 同字'),
+('概', '개'),
+('概', '대개'),
+('榆', 'yu'),
+('榆', '楡와 同字'),
+('榆', '유'),
+('榌', 'bi'),
+('榌', 'pi'),
+('榌', '비'),
+('榌', '사닥다리 비'),
+('榎', 'ga'),
+('榎', 'ka'),
+('榎', '檟와 同字'),
+('榎', '가'),
+('榑', '부'),
+('榑', '부상 부 '),
+('榔', '나무 이름 랑'),
+('榕', '용'),
+('榕', '용나무 용'),
+('榖', 'gok'),
+('榖', 'kok'),
+('榖', 'paper mulberry (꾸지나무, 닥나무)'),
+('榖', '穀의 俗字'),
+('榖', '곡'),
+('榘', 'gu'),
+('榘', 'ku'),
+('榘', 'kwu'),
+('榘', '곡척 구'),
+('榘', '구'),
+('榛', '개암나무 진'),
+('榛', '진'),
+('榜', ' 매 병'),
+('榜', ' 방 써붙일 병'),
+('榜', ' 볼기칠 병'),
+('榜', 'list of successful candidates'),
+('榜', 'notice (written to the public)'),
+('榜', '게시판 병'),
+('榜', '매 방'),
+('榜', '방'),
+('榟', '재'),
+('榤', 'geol'),
+('榤', 'kel'),
+('榤', 'kŏl'),
+('榤', '걸'),
+('榤', '닭의 홰 걸'),
+('榥', 'hwang'),
+('榥', '책상 황'),
+('榥', '황'),
+('榦', '幹의 本字'),
+('榦', '간'),
+('榧', '비'),
+('榧', '비자나무 비'),
+('榨', 'ca'),
+('榨', 'cha'),
+('榨', 'ja'),
+('榨', '술주자 자'),
+('榨', '자'),
+('榭', '사'),
+('榭', '정자 사'),
+('榮', ' 꽃다울 영'),
+('榮', ' 오동나무 영'),
+('榮', ' 추녀 영'),
+('榮', 'Hanja form of 영 (“flourish, prosper”).'),
+('榮', 'Hanja form of 영 (“glory, honour”).'),
+('榮', '꽃'),
+('榮', '영'),
+('榮', '영화로울 영'),
+('榰', 'chi'),
+('榰', 'ci'),
+('榰', 'ji'),
+('榰', '주춧돌 지 '),
+('榰', '지'),
+('榱', '서까래 최'),
+('榱', '최'),
+('榴', '석류나무 류'),
+('榷', 'gyo'),
+('榷', 'kyo'),
+('榷', '교'),
+('榷', '외나무 다리 교'),
+('榻', ' 모직 탑'),
+('榻', ' 자리 탑'),
+('榻', '탑'),
+('榻', '평상 탑'),
+('榼', ' 뚜껑 합'),
+('榼', ' 물통 합'),
+('榼', '술그릇 합'),
+('榼', '합'),
+('榾', 'pieces of wood'),
+('榾', '골'),
+('榾', '등걸 골'),
+('槀', 'go'),
+('槀', 'ko'),
+('槀', '고'),
+('槀', '마를 고'),
+('槁', '槀와 同字'),
+('槁', '고'),
+('槃', '반'),
+('槃', '쟁반 반'),
+('槊', '삭'),
+('槊', '창 삭'),
+('構', 'paper mulberry (꾸지나무, 닥나무)'),
+('構', 'to build, construct (얽다)'),
+('構', '구'),
+('構', '집세우다'),
+('構', '집세울'),
+('構', '집세울 구'),
+('槌', ' 너스레 퇴'),
+('槌', ' 누에시렁 퇴'),
+('槌', ' 던질 퇴'),
+('槌', '몽둥이 퇴'),
+('槌', '칠 추'),
+('槍', 'Hanja form of 창 (“spear”).'),
+('槍', '창'),
+('槍', '창 창'),
+('槍', '혜성 쟁'),
+('槎', '뗏목 차'),
+('槐', '괴'),
+('槐', '홰나무 괴'),
+('槓', 'gong'),
+('槓', 'kong'),
+('槓', '공'),
+('槓', '지렛대 공'),
+('槙', ' 자빠진 나무 전'),
+('槙', 'cen'),
+('槙', 'chŏn'),
+('槙', 'jeon'),
+('槙', '나무 끝 전'),
+('槙', '전'),
+('槥', ' 작은 관 혜'),
+('槥', 'hye'),
+('槥', 'hyey'),
+('槥', '널 혜'),
+('槥', '혜'),
+('槦', '병기 얹는 시렁 용 '),
+('槦', '용'),
+('槧', '판 참'),
+('槧', '편지 첨'),
+('槨', '곽'),
+('槨', '덧널 곽'),
+('槩', 'gae'),
+('槩', 'kae'),
+('槩', 'kay'),
+('槩', '槪와 同字'),
+('槩', '개'),
+('槪', ' 거리낄 개'),
+('槪', ' 대강 개'),
+('槪', ' 절개 개'),
+('槪', ' 칠한 술통 개'),
+('槪', '개'),
+('槪', '대개'),
+('槪', '평두목 개'),
+('槭', '나뭇잎 떨어져 앙상할 색'),
+('槭', '단풍나무 축'),
+('槭', '색'),
+('槭', '축'),
+('槮', 'plain and smooth'),
+('槮', 'sam'),
+('槮', '삼'),
+('槲', '곡'),
+('槲', '떡갈나무 곡'),
+('槵', 'Hanja form of 환 (“Sapindus saponaria”).'),
+('槵', '무환자나무'),
+('槵', '환'),
+('槹', 'go'),
+('槹', 'ko'),
+('槹', '고'),
+('槹', '두레박 고'),
+('槻', '규'),
+('槻', '물푸레나무 규'),
+('槽', 'cho'),
+('槽', 'co'),
+('槽', 'jo'),
+('槽', '구유 조'),
+('槽', '조'),
+('槿', 'geun'),
+('槿', 'kun'),
+('槿', 'kŭn'),
+('槿', '근'),
+('槿', '무궁화 근'),
+('樀', ' 도토마리 적'),
+('樀', ' 방망이 적 '),
+('樀', 'cek'),
+('樀', 'chŏk'),
+('樀', 'jeok'),
+('樀', '적'),
+('樀', '추녀 적'),
+('樂', 'Hanja form of 락/낙 (“to enjoy; happiness; pleasure”).'),
+('樂', 'Hanja form of 악 (“music; tune; melody; song”).'),
+('樂', 'Hanja form of 요 (“to be fond of; to like”).'),
+('樂', '낙'),
+('樂', '노래'),
+('樂', '락'),
+('樂', '악'),
+('樂', '요'),
+('樂', '좋아하다'),
+('樂', '좋아할'),
+('樂', '좋아할 요'),
+('樂', '즐기다'),
+('樂', '즐길'),
+('樂', '즐길 락'),
+('樂', '풍류 악'),
+('樅', '전나무 종'),
+('樅', '종'),
+('樊', 'beon'),
+('樊', 'pen'),
+('樊', 'pŏn'),
+('樊', '번'),
+('樊', '울 번'),
+('樋', ' 어름나무 통'),
+('樋', '대 홈 통'),
+('樋', '통'),
+('樑', '서늘할 량'),
+('樒', '밀'),
+('樒', '침향 밀'),
+('樓', 'Hanja form of 루/누 (“building of two or more stories”).'),
+('樓', '누'),
+('樓', '다락'),
+('樓', '다락 루'),
+('樓', '루'),
+('樔', ' 너스레 소 '),
+('樔', '소'),
+('樔', '풀막 소'),
+('樗', '가죽나무 저'),
+('樗', '저'),
+('標', ' 나무 끝 표'),
+('標', ' 높은 가지 표'),
+('標', ' 적을 표'),
+('標', 'mark, symbol, label, sign'),
+('標', 'p''yo'),
+('標', 'phyo'),
+('標', 'pyo'),
+('標', '표'),
+('標', '표시할 표'),
+('樛', '규'),
+('樛', '나무가지 휘어질 규'),
+('樞', ' 가운데 추'),
+('樞', ' 고동 추'),
+('樞', ' 긴요할 추'),
+('樞', ' 달 추'),
+('樞', ' 북두 첫째 별 추'),
+('樞', ' 지두리 추'),
+('樞', '느름나무 우'),
+('樞', '밑둥 추'),
+('樟', '녹나무'),
+('樟', '녹나무 장'),
+('樟', '장'),
+('模', 'Hanja form of 모 (“copy, imitate”).'),
+('模', 'Hanja form of 모 (“model, standard, pattern”).'),
+('模', '모'),
+('模', '법'),
+('模', '법 모'),
+('模', '본뜰'),
+('樣', ' 모범 양'),
+('樣', '橡의 略字'),
+('樣', '모양'),
+('樣', '모양 양'),
+('樣', '상'),
+('樣', '상수리나무'),
+('樣', '양'),
+('樨', 'ch''i'),
+('樨', 'chi'),
+('樨', '치'),
+('権', '權의 俗字'),
+('横', 'across'),
+('横', 'hoeng'),
+('横', 'hoyng'),
+('横', '비낄 횡'),
+('横', '횡'),
+('樫', 'gyeon'),
+('樫', 'kyen'),
+('樫', 'kyŏn'),
+('樫', '견'),
+('樫', '떡갈나무 견'),
+('樵', '땔나무 초'),
+('樵', '초'),
+('樸', '총생할 복'),
+('樸', '통나무 박'),
+('樹', ' 막을 수'),
+('樹', ' 세울 수'),
+('樹', ' 심을 수'),
+('樹', 'Hanja form of 수 (“tree; plant”).'),
+('樹', '나무'),
+('樹', '나무 수'),
+('樹', '수'),
+('樺', 'birch'),
+('樺', 'hwa'),
+('樺', '자작나무 화'),
+('樺', '화'),
+('樻', 'gwe'),
+('樻', 'kwe'),
+('樻', 'kwey'),
+('樻', '가마테나무 궤 '),
+('樻', '궤'),
+('樽', '술그릇 준'),
+('樽', '준'),
+('樿', 'coffin'),
+('樿', '전'),
+('橃', 'beol'),
+('橃', 'pel'),
+('橃', 'pŏl'),
+('橃', '떼 벌 '),
+('橃', '벌'),
+('橄', 'gam'),
+('橄', 'kam'),
+('橄', '감'),
+('橄', '감람나무 감'),
+('橇', '진흙 썰매 취'),
+('橇', '취'),
+('橈', '노 요'),
+('橈', '요'),
+('橊', '榴의 本字'),
+('橋', 'Hanja form of 교 (“bridge”).'),
+('橋', '고'),
+('橋', '교'),
+('橋', '다리'),
+('橋', '다리 교'),
+('橋', '빠르다'),
+('橋', '빠를'),
+('橐', ' 공잇소리 탁'),
+('橐', ' 도가니 탁'),
+('橐', ' 자루 탁'),
+('橐', ' 짐승이름 탁'),
+('橐', 'a bag opening at both ends'),
+('橐', 'a sack'),
+('橐', '전대 탁'),
+('橐', '탁'),
+('橒', 'un'),
+('橒', 'wun'),
+('橒', '나무 무늬 운'),
+('橒', '운'),
+('橓', 'sun'),
+('橓', 'swun'),
+('橓', '무궁화나무 순 '),
+('橓', '순'),
+('橘', 'Hanja form of 귤 (“tangerine”).'),
+('橘', '귤'),
+('橘', '귤나무'),
+('橘', '귤나무 귤'),
+('橙', '귤 증'),
+('橙', '등자나무 등'),
+('橚', 'suk'),
+('橚', 'swuk'),
+('橚', '길고 꼿꼿할 숙'),
+('橚', '숙'),
+('橛', 'Hanja form of 궐 (“stake”).'),
+('橛', '궐'),
+('橛', '말뚝'),
+('機', 'Hanja form of 기 (“machine”).'),
+('機', 'Hanja form of 기 (“opportunity; chance”).'),
+('機', '기'),
+('機', '틀'),
+('機', '틀 기'),
+('橡', 'sang'),
+('橡', '상'),
+('橡', '상수리나무 상'),
+('橢', ' 길죽한 그릇 타'),
+('橢', ' 수레통 가운데그릇 타'),
+('橢', '둥글길죽할 타'),
+('橢', '타'),
+('橤', '꽃술'),
+('橤', '예'),
+('橦', 'dong'),
+('橦', 'tong'),
+('橦', '나무이름 동'),
+('橦', '동'),
+('橧', 'chŭng'),
+('橧', 'cung'),
+('橧', 'jeung'),
+('橧', '증'),
+('橧', '집: home'),
+('橫', 'across'),
+('橫', 'horizontal, lateral'),
+('橫', '가로 횡'),
+('橫', '횡'),
+('橴', 'ca'),
+('橴', 'cha'),
+('橴', 'ja'),
+('橴', '땅이름 자'),
+('橴', '자'),
+('橵', 'san'),
+('橵', '산'),
+('橵', '산자 산'),
+('橻', 'ch''u'),
+('橻', 'chu'),
+('橻', 'chwu'),
+('橻', '추'),
+('橽', 'birch'),
+('橽', 'dal'),
+('橽', 'tal'),
+('橽', '달'),
+('橿', ' 사닥다리 강'),
+('橿', ' 억셀 강'),
+('橿', ' 호미자루 강'),
+('橿', 'gang'),
+('橿', 'kang'),
+('橿', '강'),
+('橿', '참죽나무 강'),
+('檀', 'Hanja form of 단 (“birch tree”).'),
+('檀', 'Hanja form of 단 (“birch tree”). [affix]'),
+('檀', 'Hanja form of 단 (“dana (Buddhism)”).'),
+('檀', 'Hanja form of 단 (“dana (Buddhism)”). [affix]'),
+('檀', 'Hanja form of 단 (“sandalwood tree”).'),
+('檀', 'Hanja form of 단 (“sandalwood tree”). [affix]'),
+('檀', 'Hanja form of 단 (“short for Dangun”).'),
+('檀', 'Hanja form of 단 (“short for Dangun”). [affix]'),
+('檀', '단'),
+('檀', '박달나무'),
+('檀', '향나무 단'),
+('檃', '은'),
+('檄', ' 격문 격'),
+('檄', ' 과격할 격'),
+('檄', '격'),
+('檄', '격서 격'),
+('檉', '능수버들 정'),
+('檉', '정'),
+('檍', ' 박달나무 억'),
+('檍', ' 싸리나무 억'),
+('檍', 'ek'),
+('檍', 'eok'),
+('檍', 'ŏk'),
+('檍', '억'),
+('檍', '참죽나무 억'),
+('檎', '금'),
+('檎', '능금나무 금'),
+('檐', '처마 첨'),
+('檐', '첨'),
+('檓', '훼'),
+('檔', '당'),
+('檔', '책상 당'),
+('檗', 'byeok'),
+('檗', 'pyek'),
+('檗', 'pyŏk'),
+('檗', '벽'),
+('檗', '황벽나무 벽'),
+('檜', ' 나라이름 괄'),
+('檜', '노송나무 회'),
+('檜', '전나무 괄'),
+('檝', 'chŭp'),
+('檝', 'cup'),
+('檝', 'jeup'),
+('檝', '楫과 同字'),
+('檝', '즙'),
+('檞', 'hae'),
+('檞', 'hay'),
+('檞', 'pine resin'),
+('檞', '해'),
+('檟', '가'),
+('檟', '오동나무 가'),
+('檠', 'gyeong'),
+('檠', 'kyeng'),
+('檠', 'kyŏng'),
+('檠', '경'),
+('檠', '도지개 경'),
+('檢', ' 금제할 검'),
+('檢', ' 법 검'),
+('檢', ' 봉할 검'),
+('檢', ' 수결둘 검'),
+('檢', ' 책메뚜기 검'),
+('檢', 'Hanja form of 검 (“check; examination; inspection”).'),
+('檢', '검'),
+('檢', '검사하다'),
+('檢', '검사할'),
+('檢', '교정할 검'),
+('檣', '돛대 장'),
+('檣', '장'),
+('檬', 'Hanja form of 몽 (“lemon”).'),
+('檬', '레몬 (lemon)'),
+('檬', '몽'),
+('檮', 'do'),
+('檮', 'to'),
+('檮', '그루터기 도'),
+('檮', '도'),
+('檯', 'dae'),
+('檯', 'tae'),
+('檯', 'tay'),
+('檯', '대'),
+('檯', '등대 대'),
+('檳', 'bin'),
+('檳', 'pin'),
+('檳', '빈'),
+('檳', '빈랑나무 빈'),
+('檶', 'yem'),
+('檶', 'yeom'),
+('檶', 'yŏm'),
+('檶', '개수통 염 '),
+('檶', '염'),
+('檸', 'Hanja form of 녕 (“lemon”).'),
+('檸', '녕'),
+('檸', '레몬 (lemon)'),
+('檸', '영'),
+('檻', '우리 함'),
+('檻', '함'),
+('檼', ' 대공 은'),
+('檼', 'eun'),
+('檼', 'un'),
+('檼', 'ŭn'),
+('檼', '은'),
+('檼', '집 마룻대 은'),
+('檿', '산뽕나무 염'),
+('檿', '염'),
+('櫂', '도'),
+('櫂', '상앗대 도'),
+('櫃', 'gwe'),
+('櫃', 'kwe'),
+('櫃', 'kwey'),
+('櫃', '궤'),
+('櫃', '상자 궤'),
+('櫓', 'Hanja form of 노 (“(South Korea) oar”).'),
+('櫓', 'Hanja form of 로 (“(North Korea) oar”).'),
+('櫓', '노'),
+('櫓', '로'),
+('櫓', '방패'),
+('櫓', '방패 로'),
+('櫚', '종려나무 려'),
+('櫛', '빗 즐'),
+('櫛', '즐'),
+('櫜', 'go'),
+('櫜', 'ko'),
+('櫜', '고'),
+('櫜', '활집 고'),
+('櫝', 'box'),
+('櫝', 'coffin'),
+('櫝', '독'),
+('櫝', '함 독'),
+('櫞', '연'),
+('櫞', '연나무 연'),
+('櫟', '상수리나무 력'),
+('櫪', '말구유 력'),
+('櫬', ' 땔나무 친'),
+('櫬', ' 무궁화나무 친'),
+('櫬', '관 친'),
+('櫬', '친'),
+('櫶', 'hen'),
+('櫶', 'heon'),
+('櫶', 'hŏn'),
+('櫶', '헌'),
+('櫷', 'gwi'),
+('櫷', 'kwi'),
+('櫷', '귀'),
+('櫷', '느티나무 귀 '),
+('櫻', 'aeng'),
+('櫻', 'ayng'),
+('櫻', '앵'),
+('櫻', '앵두나무 앵'),
+('櫼', 'ch''ŏm'),
+('櫼', 'chem'),
+('櫼', 'cheom'),
+('櫼', '쐐기 첨 '),
+('櫼', '첨'),
+('欂', 'bak'),
+('欂', 'pak'),
+('欂', '박'),
+('欂', '주두 박 '),
+('欃', 'ch''am'),
+('欃', 'cham'),
+('欃', '살별 참'),
+('欃', '참'),
+('欄', 'Hanja form of 란/난 (“animal pan”).'),
+('欄', 'Hanja form of 란/난 (“railing, balustrade”).'),
+('欄', '난'),
+('欄', '난간'),
+('欄', '난간 란'),
+('欄', '란'),
+('權', 'Hanja form of 권 (“power; right”).'),
+('權', '권'),
+('權', '권세'),
+('權', '권세 권'),
+('欌', 'Hanja form of 장 (“wardrobe; cabinet”).'),
+('欌', 'Hanja form of 장 (“wardrobe; cabinet”). [noun]'),
+('欌', '장'),
+('欌', '장농 장 '),
+('欌', '장롱(欌籠)'),
+('欑', 'ch''an'),
+('欑', 'chan'),
+('欑', '모일 찬'),
+('欑', '찬'),
+('欒', '나무 이름 란'),
+('欒', '난'),
+('欒', '둥글'),
+('欒', '둥글다'),
+('欒', '란'),
+('欒', '모감주나무'),
+('欕', 'em'),
+('欕', 'eom'),
+('欕', 'prickly castor oil tree (Kalopanax septemlobus)'),
+('欕', 'ŏm'),
+('欕', '엄'),
+('欕', '엄나무 엄'),
+('欖', '감람나무 람'),
+('欞', '격자창 령'),
+('欠', ' 기지개 켤 감'),
+('欠', ' 이지러질 감'),
+('欠', 'Hanja form of 흠 (“yawn”).'),
+('欠', '하품'),
+('欠', '하품 흠'),
+('欠', '하픔할 감'),
+('欠', '흠'),
+('次', 'Hanja form of 차 (“second; next”).'),
+('次', '버금'),
+('次', '버금 차'),
+('次', '차'),
+('欣', 'heun'),
+('欣', 'hun'),
+('欣', 'hŭn'),
+('欣', '기뻐할 흔'),
+('欣', '흔'),
+('欬', ' 일깨울 해'),
+('欬', ' 크게 부를 해'),
+('欬', 'to cough'),
+('欬', '기침할 해'),
+('欬', '해'),
+('欲', ' 하고자할 욕'),
+('欲', '바라다'),
+('欲', '바랄'),
+('欲', '욕'),
+('欲', '욕심낼 욕'),
+('欵', '관'),
+('欵', '정성: sincerity'),
+('欶', 'sak'),
+('欶', '삭'),
+('欷', 'hui'),
+('欷', 'huy'),
+('欷', 'hŭi'),
+('欷', '흐느낄 희'),
+('欷', '희'),
+('欸', '애'),
+('欸', '한숨쉴 애'),
+('欹', ' 거룩하다할 의'),
+('欹', 'ui'),
+('欹', 'uy'),
+('欹', 'ŭi'),
+('欹', '아름답다할 의'),
+('欹', '의'),
+('欺', 'Hanja form of 기 (“cheat, doublecross, deceive”).'),
+('欺', '기'),
+('欺', '속이다'),
+('欺', '속일'),
+('欺', '속일 기'),
+('欻', '문득 훌'),
+('欻', '훌'),
+('欽', 'heum'),
+('欽', 'hum'),
+('欽', 'hŭm'),
+('欽', '공경할 흠'),
+('欽', '흠'),
+('款', 'gwan'),
+('款', 'kwan'),
+('款', '관'),
+('款', '정성 관'),
+('欿', ' 걱정할 감'),
+('欿', ' 찌푸릴 감'),
+('欿', 'be full of worries'),
+('欿', 'gam'),
+('欿', 'kam'),
+('欿', 'sorrowful'),
+('欿', '감'),
+('欿', '서운할 감'),
+('歃', 'sap'),
+('歃', '마실 삽'),
+('歃', '삽'),
+('歆', 'heum'),
+('歆', 'hum'),
+('歆', 'hŭm'),
+('歆', 'to envy, be jealous'),
+('歆', 'to want, seek after'),
+('歆', '받을 흠'),
+('歆', '흠'),
+('歇', ' 나른할 헐'),
+('歇', ' 다할 헐'),
+('歇', ' 스러질 헐'),
+('歇', ' 으슥할 헐'),
+('歇', ' 흩어질 헐'),
+('歇', 'hel'),
+('歇', 'heol'),
+('歇', 'hŏl'),
+('歇', '쉴 헐'),
+('歇', '헐'),
+('歉', ' 나쁠 겸'),
+('歉', ' 적을 겸'),
+('歉', 'gyeom'),
+('歉', 'kyem'),
+('歉', 'kyŏm'),
+('歉', '겸'),
+('歉', '흉년들 겸'),
+('歌', 'Hanja form of 가 (“to sing, song”).'),
+('歌', '가'),
+('歌', '노래'),
+('歌', '노래 가'),
+('歎', ' 아름답다 할 탄'),
+('歎', ' 화답할 탄'),
+('歎', 'Hanja form of 탄 (“sigh”).'),
+('歎', '탄'),
+('歎', '탄식하다'),
+('歎', '탄식할'),
+('歎', '탄식할 탄'),
+('歐', 'Hanja form of 구 (“Europe”).'),
+('歐', '구'),
+('歐', '구라파'),
+('歐', '토할 구'),
+('歓', '歡과 同字'),
+('歔', ' 코로 숨 내쉴 허'),
+('歔', ' 흑흑 느껴 울 허'),
+('歔', '한숨 쉴 허'),
+('歔', '허'),
+('歙', 'to suck'),
+('歙', '줄일 흡'),
+('歙', '흡'),
+('歚', 'sen'),
+('歚', 'seon'),
+('歚', 'sŏn'),
+('歚', 'used in name of famous Korean painter Jeong Seon (鄭敾)'),
+('歚', '고을 선'),
+('歚', '선'),
+('歛', ' 구걸할 검'),
+('歛', 'geom'),
+('歛', 'kem'),
+('歛', 'kŏm'),
+('歛', '검'),
+('歛', '탐할 검'),
+('歟', '그런가할 어조사 여'),
+('歟', '여'),
+('歠', '마실 철'),
+('歠', '철'),
+('歡', 'hwan'),
+('歡', '기뻐할 환'),
+('歡', '환'),
+('止', 'Hanja form of 지 (“stop”).'),
+('止', '그치다'),
+('止', '그칠'),
+('止', '발 지'),
+('止', '지'),
+('正', ' 과녁 정'),
+('正', ' 남쪽으로 난 창 정'),
+('正', ' 분별할 정'),
+('正', ' 어른 정'),
+('正', 'Hanja form of 정 (“first (month of the lunar year)”).'),
+('正', 'Hanja form of 정 (“straight; upright; erect”).'),
+('正', 'Hanja form of 정 (“target”).'),
+('正', '바르다'),
+('正', '바를'),
+('正', '바를 정'),
+('正', '정'),
+('正', '정월(正月)'),
+('此', 'Hanja form of 차 (“here”).'),
+('此', 'Hanja form of 차 (“this”).'),
+('此', '이'),
+('此', '이 차'),
+('此', '차'),
+('步', 'Hanja form of 보 (“step”).'),
+('步', '걸을 보'),
+('步', '걸음'),
+('步', '보'),
+('武', ' 군인 무'),
+('武', ' 자만할 무'),
+('武', 'Hanja form of 무 (“courage, honor”).'),
+('武', 'Hanja form of 무 (“martial arts, wushu; to demonstrate military force: strategy, tactics, martial arts”).'),
+('武', 'Hanja form of 무 (“military nobility; soldier, warrior; weaponry, weapons”).'),
+('武', '굳세다'),
+('武', '굳셀'),
+('武', '굳셀 무'),
+('武', '무'),
+('歧', '岐와 同字'),
+('歧', '기'),
+('歩', 'Rare variant of 步 (to walk/step)'),
+('歩', 'bo'),
+('歩', 'po'),
+('歩', '步의 俗字'),
+('歩', '보'),
+('歪', ' 비뚤 왜'),
+('歪', '기울 왜'),
+('歯', '齒의 俗字'),
+('歲', ' 곡식 익을 세'),
+('歲', ' 돐 세'),
+('歲', ' 풍년 세'),
+('歲', 'Hanja form of 세 (“age (counter); year (about age)”).'),
+('歲', '세'),
+('歲', '해'),
+('歲', '해 세'),
+('歳', '歲와 同字'),
+('歷', 'Hanja form of 력/역 (“exhaust”).'),
+('歷', 'Hanja form of 력/역 (“experience”).'),
+('歷', 'Hanja form of 력/역 (“go through”).'),
+('歷', 'Hanja form of 력/역 (“undergo”).'),
+('歷', 'Hanja form of 력/역 (“use up”).'),
+('歷', '력'),
+('歷', '역'),
+('歷', '지내다'),
+('歷', '지낼'),
+('歷', '지낼 력'),
+('歸', 'Hanja form of 귀 (“to return, to go back”).'),
+('歸', '귀'),
+('歸', '돌아가다'),
+('歸', '돌아갈'),
+('歸', '돌아올 귀'),
+('歸', '먹일 궤'),
+('歹', ' 살 발린 뼈 알'),
+('歹', ' 잔골 알'),
+('歹', '거스릴 대'),
+('歹', '뼈 앙상할 알'),
+('死', 'Hanja form of 사 (“death”).'),
+('死', 'Hanja form of 사 (“death”). [noun, affix]'),
+('死', '사'),
+('死', '죽다'),
+('死', '죽을'),
+('死', '죽을 사'),
+('歿', 'mol'),
+('歿', '몰'),
+('歿', '죽을 몰'),
+('殀', '단명할 요'),
+('殀', '요'),
+('殂', '조'),
+('殂', '죽을 조'),
+('殃', 'ang'),
+('殃', '앙'),
+('殃', '재앙 앙'),
+('殄', '끊어질 진'),
+('殄', '진'),
+('殆', ' 가까이할 태'),
+('殆', ' 비롯할 태'),
+('殆', '위태할 태'),
+('殆', '태'),
+('殉', ' 구할 순'),
+('殉', ' 좇을 순'),
+('殉', '순'),
+('殉', '죽은 사람을 따라 죽을 순'),
+('殊', ' 끊어질 수'),
+('殊', ' 베일 수'),
+('殊', ' 지나갈 수'),
+('殊', 'su'),
+('殊', 'swu'),
+('殊', '수'),
+('殊', '죽을 수'),
+('残', '해칠 잔'),
+('殍', '굶어 죽을 표'),
+('殍', '표'),
+('殑', 'geung'),
+('殑', 'kung'),
+('殑', 'kŭng'),
+('殑', '긍'),
+('殑', '까무라칠 긍'),
+('殖', ' 성할 식'),
+('殖', ' 심을 식'),
+('殖', 'sik'),
+('殖', '날 식'),
+('殖', '식'),
+('殘', 'can'),
+('殘', 'chan'),
+('殘', 'jan'),
+('殘', '잔'),
+('殘', '해칠 잔'),
+('殞', ' 떨어질 운'),
+('殞', 'die, perish'),
+('殞', 'fall'),
+('殞', 'un'),
+('殞', 'vanish'),
+('殞', 'wun'),
+('殞', '운'),
+('殞', '죽을 운'),
+('殢', '나른할 체'),
+('殢', '체'),
+('殤', '상'),
+('殤', '일찍죽을 상'),
+('殫', '다할 탄'),
+('殫', '탄'),
+('殭', ' 마른 누에 강'),
+('殭', 'a stiff corpse'),
+('殭', '강'),
+('殭', '죽어 썩지 않을 강'),
+('殮', '염할 렴'),
+('殯', '빈'),
+('殯', '염할 빈'),
+('殲', 'Hanja form of 섬 (“annihilation”).'),
+('殲', '다죽일'),
+('殲', '다죽일 섬'),
+('殲', '섬'),
+('殳', 'long pole'),
+('殳', 'su'),
+('殳', '수'),
+('段', 'Hanja form of 단 (“step”).'),
+('段', '구분'),
+('段', '단'),
+('段', '층계 단'),
+('殷', ' 가운데 은'),
+('殷', ' 무리 은'),
+('殷', ' 융성할 은'),
+('殷', ' 은나라 은'),
+('殷', ' 천둥소리 은'),
+('殷', ' 클 은'),
+('殷', '검붉을 안'),
+('殷', '많을 은'),
+('殸', 'elegance'),
+('殸', 'honor'),
+('殸', 'seng'),
+('殸', 'seong'),
+('殸', 'song'),
+('殸', 'sŏng'),
+('殸', 'voice'),
+('殸', '성'),
+('殹', 'ye'),
+('殹', 'yey'),
+('殹', '예'),
+('殺', 'Hanja form of 살 (“to kill”).'),
+('殺', 'Hanja form of 쇄 (“to pare off; to diminish; to reduce; to clip”).'),
+('殺', '감하다'),
+('殺', '감할'),
+('殺', '살'),
+('殺', '쇄'),
+('殺', '죽이다'),
+('殺', '죽일'),
+('殺', '죽일 살'),
+('殼', 'Hanja form of 각 (“shell; husk; hull; skin; casing”).'),
+('殼', '각'),
+('殼', '껍질'),
+('殼', '껍질 각'),
+('殽', '섞일 효'),
+('殽', '효'),
+('殿', 'cen'),
+('殿', 'chŏn'),
+('殿', 'jeon'),
+('殿', '대궐 전'),
+('殿', '전'),
+('毀', '헐 훼'),
+('毀', '훼'),
+('毁', '毀의 俗字'),
+('毄', ' 창 격 '),
+('毄', ' 충돌할 격'),
+('毄', 'to hit against, to strike'),
+('毄', '격'),
+('毄', '맞부딛는 소리 격'),
+('毅', ' 발끈 성낼 의'),
+('毅', 'ui'),
+('毅', 'uy'),
+('毅', 'ŭi'),
+('毅', '굳셀 의'),
+('毅', '의'),
+('毆', '구'),
+('毆', '때릴 구'),
+('毋', 'do not'),
+('毋', 'mu'),
+('毋', 'not'),
+('毋', 'rad. 80'),
+('毋', 'surname'),
+('毋', '말 무'),
+('毋', '무'),
+('毌', 'pierce'),
+('毌', '관'),
+('毌', '꿰뚫다'),
+('毌', '꿰뚫을'),
+('母', 'Hanja form of 모 (“mother”).'),
+('母', '모'),
+('母', '어미'),
+('母', '어미 모'),
+('每', 'Hanja form of 매 (“always; every”).'),
+('每', 'Hanja form of 매 (“always; every”). [determiner]'),
+('每', '매'),
+('每', '매양'),
+('每', '매양 매'),
+('毒', 'Alternative form of 玳 (“Hanja form of 대 (“turtle”).”)'),
+('毒', 'Alternative form of 瑇 (“Hanja form of 대 (“turtle”).”)'),
+('毒', 'Hanja form of 독 (“poison”).'),
+('毒', '거북'),
+('毒', '대'),
+('毒', '독'),
+('毒', '독 독'),
+('毓', ' 많을 육'),
+('毓', ' 어릴 육'),
+('毓', '기를 육'),
+('毓', '육'),
+('比', 'Hanja form of 비 (“comparison”).'),
+('比', '견주다'),
+('比', '견줄'),
+('比', '견줄 비'),
+('比', '비'),
+('毖', '비'),
+('毖', '삼갈 비'),
+('毗', 'connect, adjoin'),
+('毗', 'help, assist'),
+('毗', '도울 비'),
+('毗', '비'),
+('毘', 'bi'),
+('毘', 'pi'),
+('毘', '毗와 同字'),
+('毘', '비'),
+('毚', 'cunning; crafty'),
+('毚', 'greedy'),
+('毚', '참'),
+('毚', '토끼 참'),
+('毛', 'Hanja form of 모 (“hair”).'),
+('毛', '모'),
+('毛', '터럭'),
+('毛', '털 모'),
+('毫', 'ho'),
+('毫', '가는 털 호'),
+('毫', '호'),
+('毬', 'ball, anything round, sphere'),
+('毬', 'gu'),
+('毬', 'ku'),
+('毬', 'kwu'),
+('毬', '구'),
+('毬', '제기 구'),
+('毯', 'dam'),
+('毯', 'tam'),
+('毯', '담'),
+('毯', '담자리 담'),
+('毳', ' 연하고 부드러울 취'),
+('毳', '솜털 취'),
+('毿', 'long feathers'),
+('毿', 'sam'),
+('毿', 'scraggy'),
+('毿', '삼'),
+('毿', '털긴 삼'),
+('氅', '새털 창'),
+('氅', '창'),
+('氈', ' 전방석 전'),
+('氈', '단자리 전'),
+('氈', '모전'),
+('氈', '전'),
+('氏', 'Hanja form of 씨 (“Mr.; Ms.”).'),
+('氏', 'Hanja form of 씨 (“lineage; surname”).'),
+('氏', 'Hanja form of 지 (“Only used in 월지 (月氏, wolji)”).'),
+('氏', '나라 이름'),
+('氏', '나라이름 지'),
+('氏', '성 씨'),
+('氏', '성씨(姓氏)'),
+('氏', '씨'),
+('氏', '지'),
+('氐', ' 근본 저'),
+('氐', ' 별이름 저'),
+('氐', ' 오랑캐 이름 저'),
+('氐', ' 이를 저'),
+('氐', 'foundation; basis; origin'),
+('氐', '낮을 저'),
+('氐', '저'),
+('民', 'Hanja form of 민 (“the people; the populace; the nation”).'),
+('民', '민'),
+('民', '백성'),
+('民', '백성 민'),
+('氓', 'maeng'),
+('氓', 'mayng'),
+('氓', '맹'),
+('氓', '백성 맹'),
+('氖', 'nae'),
+('氖', 'nay'),
+('氖', '내'),
+('気', '氣의 略字'),
+('氙', 'sen'),
+('氙', 'seon'),
+('氙', 'sŏn'),
+('氙', '선'),
+('氛', '기운 분'),
+('氛', '분'),
+('氟', 'bul'),
+('氟', 'pul'),
+('氟', '불'),
+('氣', 'Hanja form of 기 (“energy, aura, vitality, vigour”).'),
+('氣', 'Hanja form of 기 (“energy, aura, vitality, vigour”). [noun]'),
+('氣', '기'),
+('氣', '기운'),
+('氣', '기운 기'),
+('氤', '기운성할 인'),
+('氤', '인'),
+('氦', 'helium'),
+('氦', '해'),
+('氧', '양'),
+('氪', 'geuk'),
+('氪', 'kuk'),
+('氪', 'kŭk'),
+('氪', '극'),
+('氫', 'kyeng'),
+('氫', 'kyŏng'),
+('氫', '경'),
+('氬', 'a'),
+('氬', '아'),
+('氮', 'dam'),
+('氮', 'nitrogen'),
+('氮', 'tam'),
+('氮', '담'),
+('氯', '록'),
+('氲', '氳의 俗字'),
+('氳', ' 기운 성할 온'),
+('氳', 'aura'),
+('氳', 'prosperity'),
+('氳', 'swarm'),
+('氳', '기운 어릴 온'),
+('氳', '온'),
+('水', ' 고를 수'),
+('水', 'Hanja form of 수 (“Short for 수요일(水曜日) (suyoil, “Wednesday”).”).'),
+('水', 'Hanja form of 수 (“water”).'),
+('水', 'Hanja form of 수 (“water”). [affix]'),
+('水', '물'),
+('水', '물 수'),
+('水', '수'),
+('氷', 'Hanja form of 빙 (“ice”).'),
+('氷', '빙'),
+('氷', '얼음'),
+('氷', '얼음 빙'),
+('永', ' 오랠 영'),
+('永', 'Hanja form of 영 (“long, deep, forever”).'),
+('永', '길'),
+('永', '길 영'),
+('永', '영'),
+('氽', ' 헤엄칠 탄'),
+('氽', '뜰 탄'),
+('氽', '탄'),
+('氾', 'beom'),
+('氾', 'pem'),
+('氾', 'pŏm'),
+('氾', '넘칠 범'),
+('氾', '범'),
+('氿', 'gwe'),
+('氿', 'kwe'),
+('氿', 'kwey'),
+('氿', 'spring'),
+('氿', '궤'),
+('氿', '물가 궤'),
+('汀', ' 수렁 정'),
+('汀', 'Hanja form of 정 (“shore”).'),
+('汀', '물가'),
+('汀', '물가 정'),
+('汀', '정'),
+('汁', ' 국 집'),
+('汁', ' 진눈깨비 집'),
+('汁', 'juice; sap'),
+('汁', '즙'),
+('汁', '즙 즙'),
+('汁', '진액 집'),
+('求', 'Hanja form of 구 (“request, wish”).'),
+('求', '구'),
+('求', '구하다'),
+('求', '구할'),
+('求', '찾을 구'),
+('汃', 'p''a'),
+('汃', 'pa'),
+('汃', 'pha'),
+('汃', '파'),
+('汊', 'Hanja form of 차 (“branching of water”).'),
+('汊', '물 갈래지을'),
+('汊', '차'),
+('汋', 'cak'),
+('汋', 'chak'),
+('汋', 'jak'),
+('汋', '삶을 작'),
+('汋', '작'),
+('汎', '뜰 범'),
+('汎', '뜰 봉'),
+('汎', '범'),
+('汎', '봉'),
+('汏', '대'),
+('汏', '씻을 대 '),
+('汐', 'Hanja form of 석 (“night tides”).'),
+('汐', '석'),
+('汐', '조수'),
+('汐', '조수 석'),
+('汒', 'mang'),
+('汒', '망'),
+('汒', '황급할 망 '),
+('汔', '거의 흘 '),
+('汔', '흘'),
+('汕', 'san'),
+('汕', '산'),
+('汕', '오구 산'),
+('汗', 'flood'),
+('汗', 'khan'),
+('汗', 'sweat'),
+('汗', '땀 한'),
+('汗', '한'),
+('汙', '汚와 同字'),
+('汙', '오'),
+('汚', ' 웅덩이 오'),
+('汚', 'Hanja form of 오 (“dirty”).'),
+('汚', '더러울'),
+('汚', '더러울 오'),
+('汚', '더럽다'),
+('汚', '오'),
+('汛', '물뿌릴 신'),
+('汛', '신'),
+('汜', 'a stream which leaves the main branch then later returns'),
+('汜', 'sa'),
+('汜', '사'),
+('汜', '지류 사'),
+('汝', ' 물에 젖을 여'),
+('汝', 'the name of water, river'),
+('汝', 'ye'),
+('汝', 'yeo'),
+('汝', 'you'),
+('汝', 'yŏ'),
+('汝', '물 이름 여'),
+('汝', '여'),
+('汞', '수은 홍'),
+('汞', '홍'),
+('江', ' 물 강'),
+('江', 'Hanja form of 강 (“river”).'),
+('江', '가람 강'),
+('江', '강'),
+('池', 'a surname'),
+('池', 'pool, pond'),
+('池', '못 지'),
+('池', '물이름 타'),
+('池', '연못'),
+('池', '이름'),
+('池', '지'),
+('池', '타'),
+('污', 'o'),
+('污', '汚와 同字'),
+('污', '오'),
+('汨', '물이름 멱'),
+('汨', '빠질 골'),
+('汩', ' 걸을 율'),
+('汩', ' 북 울릴 율'),
+('汩', ' 빨리 걸을 율'),
+('汩', ' 환할 율'),
+('汩', 'yul'),
+('汩', '물 흐를 율'),
+('汩', '율'),
+('汪', ' 연못 왕'),
+('汪', 'wang'),
+('汪', '물 출렁출렁할 왕'),
+('汪', '왕'),
+('汭', ' 물 굽이 예'),
+('汭', 'river bends'),
+('汭', 'ye'),
+('汭', 'yey'),
+('汭', '물 이름 예'),
+('汭', '예'),
+('汰', ' 넘칠 태'),
+('汰', ' 사치할 태'),
+('汰', ' 씻길 태'),
+('汰', 'Hanja form of 태 (“scour, wash out”).'),
+('汰', '미끄러울 태'),
+('汰', '일'),
+('汰', '일다'),
+('汰', '태'),
+('汲', 'geup'),
+('汲', 'kup'),
+('汲', 'kŭp'),
+('汲', 'to draw water from a well'),
+('汲', '급'),
+('汲', '길을 급'),
+('汴', 'p''a'),
+('汴', 'pa'),
+('汴', 'pha'),
+('汴', '파'),
+('汶', ' 수치 문'),
+('汶', 'mun'),
+('汶', '내 이름 문'),
+('汶', '문'),
+('決', ' 끊을 결'),
+('決', ' 물골 터 놓을 결'),
+('決', ' 물이름 결'),
+('決', ' 이별할 결'),
+('決', 'Hanja form of 결 (“to decide; to determine; to judge”).'),
+('決', 'Hanja form of 결 (“to decide; to determine; to judge”). [affix]'),
+('決', '결'),
+('決', '결단하다'),
+('決', '결단할'),
+('決', '결단할 결'),
+('汽', 'Alternative form of 汔 (“Hanja form of 흘 (“nearly”).”)'),
+('汽', 'Hanja form of 기 (“steam; vapour”).'),
+('汽', '汔과 同字'),
+('汽', '거의'),
+('汽', '기'),
+('汽', '김'),
+('汽', '김 기'),
+('汽', '흘'),
+('汾', 'bun'),
+('汾', 'pun'),
+('汾', '분'),
+('汾', '클 분'),
+('沁', '스며들 심'),
+('沁', '심'),
+('沂', 'gi'),
+('沂', 'ki'),
+('沂', '기'),
+('沂', '물 이름 기'),
+('沃', ' 부드러울 옥'),
+('沃', ' 손 씻을 옥'),
+('沃', ' 아리따울 옥'),
+('沃', 'ok'),
+('沃', '기름질 옥'),
+('沃', '옥'),
+('沄', ' 끓을 운'),
+('沄', 'un'),
+('沄', 'wun'),
+('沄', '물 콸콸 흐를 운'),
+('沄', '운'),
+('沅', '물 이름 원'),
+('沅', '원'),
+('沆', ' 이슬 항'),
+('沆', ' 진펀할 항'),
+('沆', 'flow'),
+('沆', 'vast'),
+('沆', '큰 물 항'),
+('沆', '항'),
+('沇', 'yen'),
+('沇', 'yeon'),
+('沇', 'yŏn'),
+('沇', '물 졸졸 흐를 연'),
+('沇', '연'),
+('沈', ' 고요할 침'),
+('沈', ' 잠길 침'),
+('沈', ' 진펄 침'),
+('沈', ' 채색할 침'),
+('沈', 'Hanja form of 심 (“a surname.”).'),
+('沈', 'Hanja form of 침 (“dark; gloomy”).'),
+('沈', 'Hanja form of 침 (“to indulge in”).'),
+('沈', 'Hanja form of 침 (“to sink; to submerge”).'),
+('沈', '성 심'),
+('沈', '성씨'),
+('沈', '심'),
+('沈', '잠기다'),
+('沈', '잠길'),
+('沈', '장마물 침'),
+('沈', '침'),
+('沉', '沈과 同字'),
+('沉', '沈의 俗字'),
+('沌', 'Hanja form of 돈 (“disorderly; chaotic”).'),
+('沌', '기름 덩어리 돈'),
+('沌', '돈'),
+('沌', '엉기다'),
+('沌', '엉길'),
+('沍', '冱의 譌字'),
+('沍', '호'),
+('沐', 'mok'),
+('沐', '머리감을 목'),
+('沐', '목'),
+('沒', 'Hanja form of 몰 (“drown, sink”).'),
+('沒', 'Hanja form of 몰 (“not, have not, none”).'),
+('沒', '가라 앉을 몰'),
+('沒', '가라앉다'),
+('沒', '가라앉을'),
+('沒', '몰'),
+('沓', 'dap'),
+('沓', 'tap'),
+('沓', '거듭 답'),
+('沓', '답'),
+('沔', 'myen'),
+('沔', 'myeon'),
+('沔', 'myŏn'),
+('沔', '면'),
+('沔', '물 흐를 면'),
+('沕', ' 숨길 물'),
+('沕', '물'),
+('沕', '아득할 물'),
+('沖', ' 어릴 충'),
+('沖', ' 온화할 충'),
+('沖', 'ch''ung'),
+('沖', 'chung'),
+('沖', 'chwung'),
+('沖', '깊을 충'),
+('沖', '충'),
+('沘', 'bi'),
+('沘', 'pi'),
+('沘', '강 이름 비'),
+('沘', '비'),
+('沙', 'Hanja form of 사 (“sand”).'),
+('沙', '모래'),
+('沙', '모래 사'),
+('沙', '사'),
+('沚', '물가 지'),
+('沚', '지'),
+('沛', ' 넉넉할 패'),
+('沛', ' 비 쏟아질 패'),
+('沛', '둥둥 뜰 패'),
+('沛', '패'),
+('沢', '澤의 略字'),
+('沫', '거품 말'),
+('沫', '말'),
+('沬', 'mae'),
+('沬', 'may'),
+('沬', '매'),
+('沬', '지명 매'),
+('沮', ' 공갈할 저'),
+('沮', ' 나라이름 저'),
+('沮', ' 막을 저'),
+('沮', ' 무너질 저'),
+('沮', ' 물이 번질 저'),
+('沮', 'ce'),
+('沮', 'chŏ'),
+('沮', 'jeo'),
+('沮', '그칠 저'),
+('沮', '저'),
+('沰', ' 돌 던질 탁'),
+('沰', ' 떨어질 탁'),
+('沰', 't''ak'),
+('沰', 'tak'),
+('沰', 'thak'),
+('沰', '떨어뜨릴 탁'),
+('沰', '탁'),
+('沱', ' 눈물이 흐를 타'),
+('沱', ' 큰 비 타'),
+('沱', 't''a'),
+('沱', 'ta'),
+('沱', 'tha'),
+('沱', '물이 갈래질 타'),
+('沱', '타'),
+('河', 'Hanja form of 하 (“river”).'),
+('河', '물'),
+('河', '물 하'),
+('河', '하'),
+('沸', '끓을 비'),
+('沸', '용솟음할 불'),
+('油', ' 공손할 유'),
+('油', ' 구름 피어오를 유'),
+('油', 'Hanja form of 유 (“oil”).'),
+('油', '기름'),
+('油', '기름 유'),
+('油', '유'),
+('沺', 'cen'),
+('沺', 'chŏn'),
+('沺', 'jeon'),
+('沺', '전'),
+('治', ' 다듬을 치'),
+('治', ' 익을 치'),
+('治', ' 치료할 치'),
+('治', 'ch''i'),
+('治', 'chi'),
+('治', 'to govern; to manage'),
+('治', '다스릴 치'),
+('治', '치'),
+('沼', ' 늪 소'),
+('沼', 'Hanja form of 소 (“pond”).'),
+('沼', 'Hanja form of 소 (“swamp”).'),
+('沼', '못'),
+('沼', '못 소'),
+('沼', '소'),
+('沽', '고'),
+('沽', '팔 고'),
+('沾', 'Alternative form of 添 (“Hanja form of 첨 (“to append; to increase”).”)'),
+('沾', 'Hanja form of 첨 (“to soak; to moisten”).'),
+('沾', 'Hanja form of 첩 (“frivolous; discourteous; smug”).'),
+('沾', '경망할'),
+('沾', '경박하다'),
+('沾', '더하다'),
+('沾', '더할'),
+('沾', '더할 첨'),
+('沾', '시다'),
+('沾', '적실적'),
+('沾', '첨'),
+('沾', '첩'),
+('沿', ' 좇을 연'),
+('沿', 'Hanja form of 연 (“to continue”).'),
+('沿', 'Hanja form of 연 (“to follow a course”).'),
+('沿', '물 따라 내려갈 연'),
+('沿', '물 따라갈'),
+('沿', '연'),
+('況', 'hwang'),
+('況', '하물며 황'),
+('況', '황'),
+('泂', ' 깊고 넓은 모양 형'),
+('泂', ' 차가운 형'),
+('泂', 'deep, profound'),
+('泂', 'far, distant'),
+('泂', 'hyeng'),
+('泂', 'hyeong'),
+('泂', 'hyŏng'),
+('泂', '멀 형'),
+('泂', '형'),
+('泄', ' 날개 훨훨칠 예'),
+('泄', ' 흩을 예'),
+('泄', '내칠 예'),
+('泄', '샐 설'),
+('泅', '쉬'),
+('泆', '끊을 일'),
+('泆', '일'),
+('泉', 'Hanja form of 천 (“spring”).'),
+('泉', '샘'),
+('泉', '샘 천'),
+('泉', '천'),
+('泊', 'Hanja form of 박 (“stay; visit”).'),
+('泊', '머무르다'),
+('泊', '머무를'),
+('泊', '머무를 박'),
+('泊', '박'),
+('泌', ' 개천물 필'),
+('泌', 'Hanja form of 비 (“seeping out, excretion”).'),
+('泌', '도랑물 필'),
+('泌', '비'),
+('泌', '샘물 졸졸 흐를'),
+('泌', '샘물 흐르는 모양 비'),
+('泐', '돌 갈라질 륵'),
+('泑', ' 물이름 유'),
+('泑', '물빛이 검을 유'),
+('泑', '유'),
+('泓', '깊을 홍'),
+('泓', '홍'),
+('泔', '검'),
+('法', 'Hanja form of 법 (“law”).'),
+('法', '법'),
+('法', '법 법'),
+('泗', '물 이름 사'),
+('泗', '사'),
+('泘', '물 이름'),
+('泘', '호'),
+('泙', ' 물결 셀 평'),
+('泙', '물소리 평'),
+('泙', '평'),
+('泚', 'ca'),
+('泚', 'cha'),
+('泚', 'ja'),
+('泚', '맑을 자'),
+('泚', '자'),
+('泛', '뜰 범'),
+('泛', '엎을 봉'),
+('泜', '강 이름 지'),
+('泜', '지'),
+('泝', ' 흘러갈 소'),
+('泝', 'so'),
+('泝', '거슬러 올라갈 소'),
+('泝', '소'),
+('泠', '깨우칠 령'),
+('泡', ' 물 흐를 포'),
+('泡', ' 물이 솟아날 포'),
+('泡', ' 성할 포'),
+('泡', 'Hanja form of 포 (“bubbles”).'),
+('泡', '거품'),
+('泡', '물거품 포'),
+('泡', '포'),
+('波', ' 눈 광채 파'),
+('波', ' 달빛 파'),
+('波', ' 물 젖을 파'),
+('波', ' 움직일 파'),
+('波', 'Hanja form of 파 (“wave, undulation”).'),
+('波', '물결'),
+('波', '물결 파'),
+('波', '파'),
+('泣', ' 부글부글 끓는 소리 읍'),
+('泣', '눈물 줄줄 흘릴 읍'),
+('泣', '읍'),
+('泥', 'Hanja form of 니/이 (“mud; dirt”).'),
+('泥', '니'),
+('泥', '막힐 니'),
+('泥', '이'),
+('泥', '진흙'),
+('注', 'Hanja form of 주 (“pour”).'),
+('注', '물댈 주'),
+('注', '부을'),
+('注', '붓다'),
+('注', '주'),
+('泫', ' 눈물 줄줄 흘릴 현'),
+('泫', ' 이슬 맺힐 현'),
+('泫', 'cry'),
+('泫', 'glisten'),
+('泫', 'shine'),
+('泫', 'weep'),
+('泫', '물 깊을 현'),
+('泫', '현'),
+('泮', 'ban'),
+('泮', 'melt'),
+('泮', 'pan'),
+('泮', '반'),
+('泮', '학교 반'),
+('泯', '망할 민'),
+('泯', '민'),
+('泰', ' 괘 이름 태'),
+('泰', ' 너그러울 태'),
+('泰', ' 통할 태'),
+('泰', ' 편안할 태'),
+('泰', 'Tai (ethnic group)'),
+('泰', 'Thai'),
+('泰', '클 태'),
+('泰', '태'),
+('泱', '끝없을 앙'),
+('泱', '앙'),
+('泳', 'Hanja form of 영 (“dive”).'),
+('泳', 'Hanja form of 영 (“swim”).'),
+('泳', '영'),
+('泳', '헤엄치다'),
+('泳', '헤엄칠'),
+('泳', '헤엄칠 영'),
+('洄', 'foolish'),
+('洄', 'go against the current'),
+('洄', '거슬러 올라 갈 회'),
+('洄', '회'),
+('洇', '湮과 同字 '),
+('洇', '인'),
+('洊', '이를 천'),
+('洊', '천'),
+('洋', ' 넘칠 양'),
+('洋', 'Hanja form of 양 (“ocean; western”).'),
+('洋', '양'),
+('洋', '큰 바다'),
+('洋', '큰 바다 양'),
+('洌', '맑을 렬'),
+('洑', 'small dam or reservoir'),
+('洑', '보'),
+('洑', '보 보'),
+('洒', ' 설치할 세'),
+('洒', 'se'),
+('洒', 'sey'),
+('洒', '세'),
+('洒', '씻을 세'),
+('洗', ' 세수 그릇 세'),
+('洗', ' 율이름 선'),
+('洗', 'Hanja form of 세 (“wash”).'),
+('洗', '세'),
+('洗', '씻다'),
+('洗', '씻을'),
+('洗', '씻을 세'),
+('洗', '조촐할 선'),
+('洙', ' 물읾 수'),
+('洙', 'Hanja form of 수 (“name of a river in Shandong province”).'),
+('洙', '물가 수'),
+('洙', '수'),
+('洛', 'Synonym of 낙수(洛水) (“the Luo river”, a central Chinese river)'),
+('洛', 'Synonym of 낙양(洛陽) (“Luoyang”, Chinese city and ancient capital)'),
+('洛', '강이름 락'),
+('洛', '낙'),
+('洞', ' 깊을 통'),
+('洞', ' 밝을 통'),
+('洞', ' 빌 통'),
+('洞', 'Hanja form of 동 (“dong, a submunicipal administrative division in North and South Korea”).'),
+('洞', 'Hanja form of 동 (“hole; cavity; cave”).'),
+('洞', 'Hanja form of 통 (“bright; thorough; penetrating”).'),
+('洞', '골'),
+('洞', '구렁 통'),
+('洞', '동'),
+('洞', '마을 동'),
+('洞', '밝다'),
+('洞', '밝을'),
+('洞', '통'),
+('洟', ' 눈물 이'),
+('洟', ' 못이름 이'),
+('洟', '이'),
+('洟', '콧물 이'),
+('津', 'Hanja form of 진 (“ferry; ford”).'),
+('津', 'Hanja form of 진 (“ferry; ford”). [affix]'),
+('津', 'Hanja form of 진 (“resin; sap”).'),
+('津', 'Hanja form of 진 (“resin; sap”). [noun]'),
+('津', '나루'),
+('津', '나루 진'),
+('津', '진'),
+('洧', '물이름 유'),
+('洧', '유'),
+('洩', ' 날개 훨훨칠 예'),
+('洩', '샐 설'),
+('洩', '퍼질 예'),
+('洪', 'hong'),
+('洪', '큰물 홍'),
+('洪', '홍'),
+('洫', ' 봇도랑 혁'),
+('洫', ' 빌 혁'),
+('洫', '넘칠 혁'),
+('洫', '혁'),
+('洬', 'sok'),
+('洬', '속'),
+('洮', 'cleanse'),
+('洮', 'river in Gansu province'),
+('洮', '달아날 도'),
+('洮', '도'),
+('洲', 'Hanja form of 주 (“continent”).'),
+('洲', '물가'),
+('洲', '섬 주'),
+('洲', '주'),
+('洵', ' 믿을 순'),
+('洵', ' 소리없이 눈물흘릴 순'),
+('洵', '멀 현'),
+('洵', '웅덩이물 순'),
+('洶', '물살세찰 흉'),
+('洶', '흉'),
+('洸', '광'),
+('洸', '물 용솟음할 광'),
+('洹', ' 물 이름 원'),
+('洹', 'wen'),
+('洹', 'won'),
+('洹', 'wŏn'),
+('洹', '원'),
+('洹', '흐를 원'),
+('洺', '강 이름 명'),
+('洺', '명'),
+('活', 'Hanja form of 활 (“activity”).'),
+('活', 'Hanja form of 활 (“activity”). [affix]'),
+('活', '물 소리 괄'),
+('活', '살'),
+('活', '살 활'),
+('活', '살다'),
+('活', '활'),
+('洼', 'deep pond'),
+('洼', 'pool'),
+('洼', 'wa'),
+('洼', '물 이름 와'),
+('洼', '와'),
+('洽', 'heup'),
+('洽', 'hup'),
+('洽', 'hŭp'),
+('洽', '윤태하게 할 흡'),
+('洽', '흡'),
+('派', ' 나눌 파'),
+('派', ' 보낼 파'),
+('派', ' 파벌 파'),
+('派', 'Hanja form of 파 (“faction”).'),
+('派', '물 갈래 파'),
+('派', '물갈래'),
+('派', '파'),
+('洿', 'mud'),
+('洿', 'o'),
+('洿', 'pool'),
+('洿', '오'),
+('流', 'Hanja form of 류/유 (“flow”).'),
+('流', '류'),
+('流', '유'),
+('流', '흐르다'),
+('流', '흐를'),
+('流', '흐를 류'),
+('浅', '얕을 천'),
+('浌', 'Hanja form of 펄 (“tidal flat, mudflat”).'),
+('浌', 'Hanja form of 펄 (“tidal flat, mudflat”). [only used in Literary Chinese]'),
+('浌', '물 이름'),
+('浌', '벌'),
+('浙', ' 물이름 절'),
+('浙', '강'),
+('浙', '쌀 씻을 절'),
+('浙', '절'),
+('浚', 'chun'),
+('浚', 'cwun'),
+('浚', 'jun'),
+('浚', '깊을 준'),
+('浚', '준'),
+('浜', 'bin'),
+('浜', 'pin'),
+('浜', '물가 빈'),
+('浜', '빈'),
+('浡', '발'),
+('浡', '일어날 발'),
+('浣', ' 씻을 완'),
+('浣', 'to rinse'),
+('浣', 'to wash'),
+('浣', '옷 빨 완'),
+('浣', '완'),
+('浤', 'goeng'),
+('浤', 'koeng'),
+('浤', 'koyng'),
+('浤', '굉'),
+('浤', '용솟음할 굉'),
+('浥', ' 흠치르르할 읍'),
+('浥', 'eup'),
+('浥', 'up'),
+('浥', 'ŭp'),
+('浥', '읍'),
+('浥', '젖을 읍'),
+('浦', ' 갯가 포'),
+('浦', 'Hanja form of 포 (“estuary; riverbank”).'),
+('浦', '개'),
+('浦', '물가 포'),
+('浦', '포'),
+('浧', ' 앙금 영 '),
+('浧', '영'),
+('浧', '잠길 영'),
+('浩', 'great, numerous, vast, abundant'),
+('浩', '클 호'),
+('浩', '호'),
+('浪', 'Hanja form of 랑/낭 (“wave”).'),
+('浪', '낭'),
+('浪', '랑'),
+('浪', '물결'),
+('浪', '물결 랑'),
+('浬', '해리 리'),
+('浮', 'Hanja form of 부 (“to float”).'),
+('浮', '뜨다'),
+('浮', '뜰'),
+('浮', '뜰 부'),
+('浮', '부'),
+('浴', ' 못 이름 욕'),
+('浴', 'Hanja form of 욕 (“bathing”).'),
+('浴', '깨끗이할 욕'),
+('浴', '목욕하다'),
+('浴', '목욕할'),
+('浴', '욕'),
+('海', ' 많을 해'),
+('海', ' 세계 해'),
+('海', 'Hanja form of 해 (“sea; ocean”).'),
+('海', 'Hanja form of 해 (“sea; ocean”). [affix]'),
+('海', '바다'),
+('海', '바다 해'),
+('海', '해'),
+('浸', ' 번질 침'),
+('浸', ' 불릴 침'),
+('浸', ' 빠질 침'),
+('浸', 'ch''im'),
+('浸', 'chim'),
+('浸', 'soak, immerse, dip, percolate'),
+('浸', '적실 침'),
+('浸', '침'),
+('浹', ' 둘릴 협'),
+('浹', 'hyeop'),
+('浹', 'hyep'),
+('浹', 'hyŏp'),
+('浹', '사무칠 협'),
+('浹', '협'),
+('浼', 'Hanja form of 매 (“to besmirch; to request”).'),
+('浼', '매'),
+('浿', ' 물가 패 '),
+('浿', '물이름 패'),
+('浿', '패'),
+('涂', 'do'),
+('涂', 'to'),
+('涂', '길 도'),
+('涂', '도'),
+('涅', 'Hanja form of 녈 (“black soil”).'),
+('涅', '개흙'),
+('涅', '녈'),
+('涅', '앙금 흙 날'),
+('涅', '열'),
+('涅', '죽을 녈'),
+('涇', '경'),
+('涇', '통할 경'),
+('消', ' 꺼질 소'),
+('消', ' 풀릴 소'),
+('消', ' 해어질 소'),
+('消', 'Hanja form of 소 (“disappear; extinguish”).'),
+('消', '다할 소'),
+('消', '사라질'),
+('消', '소'),
+('涉', ' 돌아다닐 섭'),
+('涉', ' 지나칠 섭'),
+('涉', '물 건널 섭'),
+('涉', '섭'),
+('涌', ' 날칠 용'),
+('涌', 'yong'),
+('涌', '물 넘칠 용'),
+('涌', '용'),
+('涍', 'hyo'),
+('涍', '성 효 '),
+('涍', '효'),
+('涎', ' 물 졸졸 흐를 연'),
+('涎', '연'),
+('涎', '침 연'),
+('涑', 'so'),
+('涑', '소'),
+('涓', ' 조촐할 연'),
+('涓', 'yen'),
+('涓', 'yeon'),
+('涓', 'yŏn'),
+('涓', '물방울 떨어질 연'),
+('涓', '연'),
+('涔', '괸물 잠'),
+('涔', '잠'),
+('涕', '눈물 체'),
+('涕', '체'),
+('涖', '다다를 리'),
+('涛', '도'),
+('涛', '물결'),
+('涣', '渙과 同字'),
+('涪', 'bu'),
+('涪', 'pu'),
+('涪', '물거품 부'),
+('涪', '부'),
+('涫', 'gwan'),
+('涫', 'kwan'),
+('涫', '관'),
+('涫', '끓을 관 '),
+('涯', ' 물이름 의'),
+('涯', 'Hanja form of 애 (“shore”).'),
+('涯', '물가'),
+('涯', '물가 애'),
+('涯', '물가 언덕 의'),
+('涯', '애'),
+('液', 'Hanja form of 액 (“liquid”).'),
+('液', '액'),
+('液', '즙 액'),
+('液', '진'),
+('涴', ' 진흙 묻을 완'),
+('涴', '물 굽이쳐 흐를'),
+('涴', '물 굽이쳐 흐를 완'),
+('涴', '완'),
+('涵', '젖을 함'),
+('涵', '함'),
+('涷', 'dong'),
+('涷', 'tong'),
+('涷', '동'),
+('涷', '마룻대 동'),
+('涸', '마를 학'),
+('涸', '물 마를 후'),
+('涸', '학'),
+('涸', '후'),
+('涼', 'Hanja form of 량/양 (“cool, cold”).'),
+('涼', 'Hanja form of 량/양 (“disheartened”).'),
+('涼', '량'),
+('涼', '서늘하다'),
+('涼', '서늘할'),
+('涼', '서늘할 량'),
+('涼', '양'),
+('涿', ' 땅이름 탁'),
+('涿', ' 물이름 탁'),
+('涿', ' 칠 탁'),
+('涿', '물방울 떨어질 탁'),
+('涿', '탁'),
+('淀', ' 배 댈 정'),
+('淀', 'ceng'),
+('淀', 'chŏng'),
+('淀', 'jeong'),
+('淀', '얕은 물 정'),
+('淀', '정'),
+('淃', '권'),
+('淃', '물돌아 흐를 권 '),
+('淄', ' 검을 치'),
+('淄', '물이름 치'),
+('淄', '치'),
+('淅', '석'),
+('淅', '쌀일 석'),
+('淆', '뒤섞일 효'),
+('淆', '효'),
+('淇', 'gi'),
+('淇', 'ki'),
+('淇', '강 이름 기'),
+('淇', '기'),
+('淈', 'gul'),
+('淈', 'kul'),
+('淈', 'kwul'),
+('淈', '굴'),
+('淈', '흐릴 굴 '),
+('淋', '물뿌릴 림'),
+('淏', 'ho'),
+('淏', '맑을 호 '),
+('淏', '호'),
+('淑', ' 사모할 숙'),
+('淑', ' 착할 숙'),
+('淑', 'suk'),
+('淑', 'swuk'),
+('淑', '맑을 숙'),
+('淑', '숙'),
+('淒', 'ch''ŏ'),
+('淒', 'che'),
+('淒', 'cheo'),
+('淒', '쓸쓸할 처'),
+('淒', '처'),
+('淖', '진흙 뇨'),
+('淘', 'do'),
+('淘', 'to'),
+('淘', '도'),
+('淘', '일 도'),
+('淙', '물 소리 종'),
+('淙', '종'),
+('淚', 'Hanja form of 루/누 (“tear”).'),
+('淚', 'Hanja form of 루/누 (“weep, cry”).'),
+('淚', '누'),
+('淚', '눈물'),
+('淚', '눈물 루'),
+('淚', '루'),
+('淝', '강 이름 비'),
+('淝', '비'),
+('淞', 'song'),
+('淞', '강이름 송'),
+('淞', '송'),
+('淠', '강 이름 비 '),
+('淠', '비'),
+('淡', 'Hanja form of 담 (“clean; clear; pure”).'),
+('淡', '담'),
+('淡', '맑다'),
+('淡', '맑을'),
+('淡', '물모양 담'),
+('淢', 'yek'),
+('淢', 'yeok'),
+('淢', 'yŏk'),
+('淢', '빨리 흐를 역'),
+('淢', '역'),
+('淤', ' 진흙 어'),
+('淤', '앙금 어'),
+('淤', '어'),
+('淥', '밭을 록'),
+('淦', 'geom'),
+('淦', 'kem'),
+('淦', 'kŏm'),
+('淦', '검'),
+('淨', ' 조촐할 정'),
+('淨', '맑을 정'),
+('淨', '정'),
+('淪', '기운덩어리 론'),
+('淪', '물놀이 륜'),
+('淫', ' 간음할 음'),
+('淫', ' 넘칠 음'),
+('淫', ' 오랠 음'),
+('淫', ' 음란할 음'),
+('淫', ' 적실 음'),
+('淫', 'eum'),
+('淫', 'um'),
+('淫', 'ŭm'),
+('淫', '방탕할 음'),
+('淫', '음'),
+('淬', ' 물들일 쉬'),
+('淬', ' 범할 쉬'),
+('淬', '쉬'),
+('淬', '줄'),
+('淬', '쵀'),
+('淬', '칼 담글 쉬'),
+('淮', '강 이름 회'),
+('淮', '회'),
+('深', 'Hanja form of 심 (“deep”).'),
+('深', '깊다'),
+('深', '깊을'),
+('深', '깊을 심'),
+('深', '심'),
+('淳', ' 순박할 순'),
+('淳', '맑을 순'),
+('淵', ' 깊을 연'),
+('淵', ' 모래톱 연'),
+('淵', ' 북소리 둥둥할 연'),
+('淵', 'Hanja form of 연 (“abyss”).'),
+('淵', '못'),
+('淵', '못 연'),
+('淵', '연'),
+('淶', '강 이름 래'),
+('混', 'Hanja form of 곤 (“a barbarian”).'),
+('混', 'Hanja form of 혼 (“mix; confuse; blend”).'),
+('混', 'Hanja form of 혼 (“turbid; unclear; confuse”).'),
+('混', '곤'),
+('混', '서쪽 오랑캐 곤'),
+('混', '섞을'),
+('混', '섞을 혼'),
+('混', '오랑캐 이름'),
+('混', '혼'),
+('混', '흐릴'),
+('淸', 'Hanja form of 청 (“Qing dynasty”).'),
+('淸', 'Hanja form of 청 (“clear, clean”).'),
+('淸', '맑다'),
+('淸', '맑을'),
+('淸', '맑을 청'),
+('淸', '청'),
+('淹', ' 오래머물 엄'),
+('淹', 'em'),
+('淹', 'eom'),
+('淹', 'ŏm'),
+('淹', '담글 엄'),
+('淹', '엄'),
+('淺', 'ch''ŏn'),
+('淺', 'chen'),
+('淺', 'cheon'),
+('淺', '얕을 천'),
+('淺', '천'),
+('添', 'Hanja form of 첨 (“add”).'),
+('添', '더하다'),
+('添', '더할'),
+('添', '더할 첨'),
+('添', '첨'),
+('淼', 'a wide expanse of water'),
+('淼', 'myo'),
+('淼', '묘'),
+('淼', '물 아득할 묘'),
+('清', 'Alternative form of 淸'),
+('清', '맑다'),
+('清', '맑을'),
+('清', '맑을 청'),
+('清', '청'),
+('渇', '渴과 同字'),
+('済', '濟의 略字'),
+('渉', 'seop'),
+('渉', 'sep'),
+('渉', 'sŏp'),
+('渉', '涉과 同字'),
+('渉', '섭'),
+('渗', 's''am'),
+('渗', 'sam'),
+('渗', '삼'),
+('渗', '스밀 참'),
+('渙', 'scatter'),
+('渙', 'scattered, dispersed'),
+('渙', '환'),
+('渙', '흩어질 환'),
+('渚', ' 물 갈라질 저'),
+('渚', 'Hanja form of 저 (“shore”).'),
+('渚', '물가'),
+('渚', '물가 저'),
+('渚', '저'),
+('減', ' 가벼울 감'),
+('減', ' 무지러질 감'),
+('減', ' 물이름 감'),
+('減', 'Hanja form of 감 (“reduction”).'),
+('減', '감'),
+('減', '덜'),
+('減', '덜 감'),
+('減', '덜다'),
+('渝', ' 고을이름 투'),
+('渝', ' 더러워질 투'),
+('渝', '빛 변할 투'),
+('渝', '투'),
+('渟', ' 도랑 정'),
+('渟', ' 물가 정'),
+('渟', '물 고일 정'),
+('渟', '정'),
+('渠', ' 껄껄 웃을 거'),
+('渠', ' 도랑 거'),
+('渠', ' 무엇 거'),
+('渠', ' 클 거'),
+('渠', ' 휑덩그렁할 거'),
+('渠', '개천 거'),
+('渠', '거'),
+('渡', 'Hanja form of 도 (“cross, ferry over”).'),
+('渡', 'Hanja form of 도 (“ferry”).'),
+('渡', '건너다'),
+('渡', '건널'),
+('渡', '건널 도'),
+('渡', '도'),
+('渣', '사'),
+('渣', '찌끼 사'),
+('渤', 'bal'),
+('渤', 'pal'),
+('渤', '바다이름 발'),
+('渤', '발'),
+('渥', '두터울 악'),
+('渥', '악'),
+('渦', ' 시끄러울 와'),
+('渦', 'Hanja form of 과 (“name of a river”).'),
+('渦', 'Hanja form of 와 (“whirlpool; eddy; vortex”).'),
+('渦', '강 이름'),
+('渦', '과'),
+('渦', '소용돌이'),
+('渦', '소용돌이 와'),
+('渦', '와'),
+('渨', '더러울 외'),
+('渨', '외'),
+('渨', '위'),
+('温', '溫의 俗字'),
+('渫', '물결 출렁출렁할 접'),
+('渫', '칠 설'),
+('測', ' 깊을 측'),
+('測', ' 날카로울 측'),
+('測', ' 맑을 측'),
+('測', 'ch''ŭk'),
+('測', 'cheuk'),
+('測', 'chuk'),
+('測', '측'),
+('測', '측량할 측'),
+('渭', ' 속 끓일 위'),
+('渭', 'wi'),
+('渭', '물 이름 위'),
+('渭', '위'),
+('港', ' 뱃길 항'),
+('港', ' 항구 항'),
+('港', 'Hanja form of 항 (“harbour; port”).'),
+('港', 'Hanja form of 항 (“harbour; port”). [noun]'),
+('港', '물 갈라질 항'),
+('港', '항'),
+('港', '항구(港口)'),
+('渲', '바림 선'),
+('渲', '선'),
+('渴', ' 급할 갈'),
+('渴', 'Hanja form of 갈 (“thirsty”).'),
+('渴', '갈'),
+('渴', '목마르다'),
+('渴', '목마를'),
+('渴', '목마를 갈'),
+('渴', '물 잦을 걸'),
+('渶', 'yeng'),
+('渶', 'yeong'),
+('渶', 'yŏng'),
+('渶', '물 맑을 영 '),
+('渶', '영'),
+('渷', 'yen'),
+('渷', 'yeon'),
+('渷', 'yŏn'),
+('渷', '물 이름 연 '),
+('渷', '연'),
+('游', ' 깃발 유'),
+('游', ' 노닐 유'),
+('游', '유'),
+('游', '헤엄칠 유'),
+('渺', 'myo'),
+('渺', '묘'),
+('渺', '아득할 묘'),
+('渼', ' 내 이름 미'),
+('渼', '물놀이 미'),
+('渼', '미'),
+('渽', 'Name of waterbodies'),
+('渽', 'cay'),
+('渽', 'chae'),
+('渽', 'clear'),
+('渽', 'jae'),
+('渽', '맑을 재 '),
+('渽', '재'),
+('渾', 'blend, merge, mix'),
+('渾', 'hon'),
+('渾', 'muddy, turbid'),
+('渾', '혼'),
+('渾', '흐릴 혼'),
+('湃', 'sound of waves'),
+('湃', 'turbulent'),
+('湃', '물결 이는 모양 배'),
+('湃', '배'),
+('湄', ' 더운 물 미'),
+('湄', '물 가 미'),
+('湄', '미'),
+('湅', '누일 련'),
+('湉', 'ch''ŏm'),
+('湉', 'cheom'),
+('湉', '첨'),
+('湊', '모일 주'),
+('湊', '주'),
+('湍', '단'),
+('湍', '여울 단'),
+('湎', 'myen'),
+('湎', 'myeon'),
+('湎', 'myŏn'),
+('湎', '면'),
+('湎', '빠질 면'),
+('湑', 'se'),
+('湑', 'seo'),
+('湑', 'sŏ'),
+('湑', '거를 서'),
+('湑', '서'),
+('湓', '분'),
+('湓', '용솟음할 분'),
+('湔', ' 물 번질 전'),
+('湔', ' 씻을 전'),
+('湔', 'cleanse'),
+('湔', 'purge'),
+('湔', 'wash'),
+('湔', '빨 전'),
+('湔', '전'),
+('湖', 'Hanja form of 호 (“lake”).'),
+('湖', '호'),
+('湖', '호수'),
+('湖', '호수 호'),
+('湘', '강 이름'),
+('湘', '강이름 상'),
+('湘', '상'),
+('湛', ' 잠길 침'),
+('湛', '빠질 침'),
+('湛', '즐거울 담'),
+('湜', ' 엄숙할 식'),
+('湜', '물 맑을 식'),
+('湜', '식'),
+('湞', '물이름 정'),
+('湞', '정'),
+('湟', 'hwang'),
+('湟', '해자 황'),
+('湟', '황'),
+('湣', 'min'),
+('湣', '낚시줄 민'),
+('湣', '민'),
+('湧', '涌의 俗字'),
+('湧', '용'),
+('湫', ' 서늘할 추'),
+('湫', ' 찌푸릴 추'),
+('湫', ' 폭포 추'),
+('湫', '늪 추'),
+('湫', '추'),
+('湮', '인'),
+('湮', '잠길 인'),
+('湯', ' 물이름 탕'),
+('湯', ' 씻을 탕'),
+('湯', 'Hanja form of 탕 (“hot water”).'),
+('湯', '끓이다'),
+('湯', '끓일'),
+('湯', '물 끓일 탕'),
+('湯', '물흐를 상'),
+('湯', '탕'),
+('湲', ' 물 졸졸 흐를 원'),
+('湲', ' 물 졸졸 흐를 환'),
+('湲', '물소리 원'),
+('湲', '물소리 환'),
+('湳', '강 이름 남 '),
+('湳', '남'),
+('湺', 'bo'),
+('湺', 'po'),
+('湺', '보'),
+('湽', 'Zi River'),
+('湽', 'black, to dye black'),
+('湽', 'ch''i'),
+('湽', 'chi'),
+('湽', 'river in Shandong province'),
+('湽', '치'),
+('湿', '濕과 同字'),
+('溁', '濚과 同字 '),
+('溉', 'gae'),
+('溉', 'kae'),
+('溉', 'kay'),
+('溉', '漑와 同字'),
+('溉', '개'),
+('溏', '당'),
+('溏', '진수렁 당'),
+('源', ' 계속할 원'),
+('源', ' 샘 원'),
+('源', 'a spring'),
+('源', 'source'),
+('源', 'wen'),
+('源', 'won'),
+('源', 'wŏn'),
+('源', '근원 원'),
+('源', '원'),
+('溕', 'mong'),
+('溕', '몽'),
+('準', 'Hanja form of 절 (“nose bridge”).'),
+('準', 'Hanja form of 준 (“standard”).'),
+('準', '수준기 준'),
+('準', '절'),
+('準', '준'),
+('準', '준하다'),
+('準', '준할'),
+('準', '코마루 절'),
+('準', '콧마루'),
+('溘', ' 의지할 합'),
+('溘', ' 이를 합'),
+('溘', 'hap'),
+('溘', '문득 합'),
+('溘', '합'),
+('溜', '방울져 떨어질 류'),
+('溝', 'gu'),
+('溝', 'ku'),
+('溝', 'kwu'),
+('溝', '개천 구'),
+('溝', '구'),
+('溟', '명'),
+('溟', '어두울 명'),
+('溢', 'flood'),
+('溢', '넘칠 일'),
+('溢', '일'),
+('溥', '빽빽할 박'),
+('溥', '펼 부'),
+('溧', '강 이름 률'),
+('溪', 'Hanja form of 계 (“stream”).'),
+('溪', '계'),
+('溪', '시내'),
+('溪', '시내 계'),
+('溫', ' 부드러울 온'),
+('溫', 'Hanja form of 온 (“heat up”).'),
+('溫', 'Hanja form of 온 (“warm”).'),
+('溫', '따뜻할'),
+('溫', '따뜻할 온'),
+('溫', '온'),
+('溯', ' 빨래한 물 삭'),
+('溯', '거슬러 올라갈 소'),
+('溯', '물이름 삭'),
+('溱', 'chin'),
+('溱', 'cin'),
+('溱', 'jin'),
+('溱', '많을 진'),
+('溱', '진'),
+('溲', ' 반족할 수'),
+('溲', ' 적실 수'),
+('溲', 'su'),
+('溲', 'swu'),
+('溲', '수'),
+('溲', '오줌 수'),
+('溴', 'ch''u'),
+('溴', 'chu'),
+('溴', 'chwu'),
+('溴', '추'),
+('溵', ' 물이름 은 '),
+('溵', 'eun'),
+('溵', 'un'),
+('溵', 'ŭn'),
+('溵', '물소리 은'),
+('溵', '은'),
+('溶', ' 녹일 용'),
+('溶', '물 질펀히 흐를 용'),
+('溶', '용'),
+('溷', '어지러울 혼'),
+('溷', '혼'),
+('溺', 'Alternative form of 尿 (“Hanja form of 뇨/요 (“urine”).”)'),
+('溺', 'Hanja form of 닉/익 (“drown”).'),
+('溺', '뇨'),
+('溺', '닉'),
+('溺', '빠지다'),
+('溺', '빠질'),
+('溺', '빠질 닉'),
+('溺', '오줌'),
+('溺', '요'),
+('溺', '우줌눌 뇨'),
+('溺', '익'),
+('溽', ' 무더울 욕'),
+('溽', '욕'),
+('溽', '유월 더위 욕'),
+('滁', '물이름 저'),
+('滁', '저'),
+('滂', 'bang'),
+('滂', 'pang'),
+('滂', '방'),
+('滂', '비 퍼부을 방'),
+('滃', ' 안개 자욱할 옹'),
+('滃', '구름 일'),
+('滃', '구름 피어 오를 옹'),
+('滃', '옹'),
+('滄', 'ch''ang'),
+('滄', 'chang'),
+('滄', '찰 창'),
+('滄', '창'),
+('滅', 'Hanja form of 멸 (“destroy”).'),
+('滅', '멸'),
+('滅', '멸망하다'),
+('滅', '멸망할'),
+('滅', '멸망할 멸'),
+('滇', '고을 이름'),
+('滇', '성할'),
+('滇', '전'),
+('滇', '진'),
+('滈', 'ho'),
+('滈', '장마 호 '),
+('滈', '호'),
+('滉', 'hwang'),
+('滉', '물 깊고 넓을 황'),
+('滉', '황'),
+('滋', '붇다'),
+('滋', '불을'),
+('滋', '불을 자'),
+('滋', '자'),
+('滌', 'ch''ŏk'),
+('滌', 'chek'),
+('滌', 'cheok'),
+('滌', '씻을 척'),
+('滌', '척'),
+('滎', ' 물결 일 형'),
+('滎', 'hyeng'),
+('滎', 'hyeong'),
+('滎', 'hyŏng'),
+('滎', '실개천 형'),
+('滎', '형'),
+('滑', 'Hanja form of 골 (“comical”).'),
+('滑', 'Hanja form of 활 (“slippery”).'),
+('滑', '골'),
+('滑', '미끄러울'),
+('滑', '미끄러울 활'),
+('滑', '미끄럽다'),
+('滑', '어지러울 골'),
+('滑', '익살스러울'),
+('滑', '익살스럽다'),
+('滑', '활'),
+('滓', ' 찌끼 재'),
+('滓', 'cay'),
+('滓', 'chae'),
+('滓', 'jae'),
+('滓', '앙금 재'),
+('滓', '재'),
+('滔', '도'),
+('滔', '물 넘칠 도'),
+('滕', '등'),
+('滕', '물 솟을 등'),
+('滙', 'hoe'),
+('滙', 'hoy'),
+('滙', '匯와 同字'),
+('滙', '회'),
+('滚', '滾과 同字'),
+('滝', 'Alternative form of 瀧'),
+('滝', '농'),
+('滝', '롱'),
+('滝', '젖다'),
+('滝', '젖을'),
+('滬', 'ho'),
+('滬', '강 이름 호'),
+('滬', '호'),
+('滭', 'p''il'),
+('滭', 'phil'),
+('滭', 'pil'),
+('滭', '샘 끓어 솟을 필 '),
+('滭', '필'),
+('滯', '막힐 체'),
+('滯', '체'),
+('滲', '삼'),
+('滲', '스밀 참'),
+('滴', ' 물 댈 적'),
+('滴', '물방울 적'),
+('滴', '적'),
+('滵', 'mil'),
+('滵', '물 흐르는 모양 밀 '),
+('滵', '밀'),
+('滷', '소금밭 로'),
+('滸', 'riverbank, shore'),
+('滸', '물가 호'),
+('滸', '호'),
+('滹', '물가'),
+('滹', '호'),
+('滾', '곤'),
+('滾', '흐를 곤'),
+('滿', 'Hanja form of 만 (“full”).'),
+('滿', '만'),
+('滿', '차다'),
+('滿', '찰'),
+('滿', '찰 만'),
+('漁', 'Hanja form of 어 (“to fish”).'),
+('漁', '고기 잡을'),
+('漁', '물고기 잡을 어'),
+('漁', '어'),
+('漂', ' 높이 훨훨 날 표'),
+('漂', ' 움직일 표'),
+('漂', ' 으스스할 표'),
+('漂', 'Hanja form of 표 (“to float; to drift”).'),
+('漂', '떠다니다'),
+('漂', '떠다닐'),
+('漂', '뜰 표'),
+('漂', '표'),
+('漄', 'ae'),
+('漄', 'ay'),
+('漄', '물가 애 '),
+('漄', '애'),
+('漆', ' 물이름 칠'),
+('漆', '삼가다'),
+('漆', '삼갈'),
+('漆', '옻'),
+('漆', '옻나무 칠'),
+('漆', '일곱'),
+('漆', '칠'),
+('漉', '거를 록'),
+('漌', 'geun'),
+('漌', 'kun'),
+('漌', 'kŭn'),
+('漌', '근'),
+('漌', '맑을 근 '),
+('漏', 'Hanja form of 루/누 (“leak”).'),
+('漏', '누'),
+('漏', '루'),
+('漏', '새다'),
+('漏', '샐'),
+('漏', '샐 루'),
+('漑', ' 물 천천히 흐를 개'),
+('漑', ' 씻을 개'),
+('漑', 'gae'),
+('漑', 'kae'),
+('漑', 'kay'),
+('漑', '개'),
+('漑', '물 댈 개'),
+('漓', '스며들 리'),
+('演', ' 긴 물줄기 연'),
+('演', ' 넓힐 연'),
+('演', ' 윤택할 연'),
+('演', ' 통할 연'),
+('演', 'Hanja form of 연 (“performance”).'),
+('演', '연'),
+('演', '펴다'),
+('演', '펼'),
+('演', '펼칠 연'),
+('漕', '배로 실어 나를 조'),
+('漕', '조'),
+('漙', 'dan'),
+('漙', 'tan'),
+('漙', '단'),
+('漙', '이슬방울 맺을 단'),
+('漚', 'foam, bubble'),
+('漚', 'fragrance'),
+('漚', 'gu'),
+('漚', 'ku'),
+('漚', 'kwu'),
+('漚', 'to soak'),
+('漚', '구'),
+('漚', '물거품 구'),
+('漠', 'Hanja form of 막 (“aloof, indifferent, cool”).'),
+('漠', 'Hanja form of 막 (“desert”).'),
+('漠', '막'),
+('漠', '사막'),
+('漠', '사막 막'),
+('漢', 'Hanja form of 한 (“Han dynasty”).'),
+('漢', 'Hanja form of 한 (“Han dynasty”). [proper noun]'),
+('漢', 'Hanja form of 한 (“Sino-, China”).'),
+('漢', 'Hanja form of 한 (“Sino-, China”). [affix]'),
+('漢', 'Hanja form of 한 (“man; person”).'),
+('漢', 'Hanja form of 한 (“man; person”). [suffix]'),
+('漢', '^한나라'),
+('漢', '한'),
+('漢', '한수 한'),
+('漣', '련'),
+('漣', '물놀이 련'),
+('漣', '연'),
+('漪', '물놀이칠 의'),
+('漪', '의'),
+('漫', 'Hanja form of 만 (“overflow of water”).'),
+('漫', 'Hanja form of 만 (“spreading”).'),
+('漫', '만'),
+('漫', '질펀하다'),
+('漫', '질펀할'),
+('漫', '질펀할 만'),
+('漬', 'chi'),
+('漬', 'ci'),
+('漬', 'ji'),
+('漬', '담글 지'),
+('漬', '지'),
+('漭', 'mang'),
+('漭', '넓을 망'),
+('漭', '망'),
+('漰', 'bul'),
+('漰', 'pul'),
+('漰', '불'),
+('漱', ' 빨래할 수'),
+('漱', 'su'),
+('漱', 'swu'),
+('漱', '수'),
+('漱', '양치질할 수'),
+('漲', '불을 창'),
+('漲', '창'),
+('漳', 'cang'),
+('漳', 'chang'),
+('漳', 'jang'),
+('漳', '강이름 장'),
+('漳', '장'),
+('漸', ' 물 흘러 들어갈 점'),
+('漸', ' 점점 점'),
+('漸', ' 차차 점'),
+('漸', '번질 점'),
+('漸', '점점 참'),
+('漼', ' 고을 최'),
+('漼', ' 눈물 줄줄 흘릴 최'),
+('漼', ' 눈서리 쌓일 최'),
+('漼', 'ch''oe'),
+('漼', 'choe'),
+('漼', 'choy'),
+('漼', '깊을 최'),
+('漼', '최'),
+('漾', '물결 출렁거릴 양'),
+('漾', '양'),
+('漿', 'cang'),
+('漿', 'chang'),
+('漿', 'jang'),
+('漿', '미음 장'),
+('漿', '장'),
+('潁', ' 성씨 영'),
+('潁', '강 이름'),
+('潁', '물 이름 영'),
+('潁', '영'),
+('潃', '땅-이 마를'),
+('潃', '뜨물'),
+('潃', '수'),
+('潃', '순'),
+('潏', 'sandbank'),
+('潏', 'yul'),
+('潏', '물 흐를 율'),
+('潏', '율'),
+('潑', 'fierce'),
+('潑', 'sprinkle water'),
+('潑', '물뿌리다'),
+('潑', '물뿌릴'),
+('潑', '발'),
+('潑', '뿌릴 발'),
+('潔', ' 정결할 결'),
+('潔', ' 조촐할 결'),
+('潔', 'Hanja form of 결 (“clean; pure”).'),
+('潔', '결'),
+('潔', '깨끗하다'),
+('潔', '깨끗할'),
+('潔', '맑을 결'),
+('潗', 'chip'),
+('潗', 'cip'),
+('潗', 'jip'),
+('潗', '샘솟을 집 '),
+('潗', '집'),
+('潘', '넘칠 번'),
+('潘', '뜨물 반'),
+('潙', '규'),
+('潙', '물이름 규'),
+('潚', 'su'),
+('潚', 'suk'),
+('潚', 'swu'),
+('潚', '숙'),
+('潛', 'cam'),
+('潛', 'cham'),
+('潛', 'jam'),
+('潛', '잠'),
+('潛', '잠길 잠'),
+('潜', 'cam'),
+('潜', 'cham'),
+('潜', 'jam'),
+('潜', '潛의 俗字'),
+('潜', '잠'),
+('潝', 'heup'),
+('潝', 'hup'),
+('潝', 'hŭp'),
+('潝', '빨리 흐르는 소리 흡'),
+('潝', '흡'),
+('潞', '강 이름 로'),
+('潟', 'tidal flats'),
+('潟', '개펄'),
+('潟', '개펄 석'),
+('潟', '석'),
+('潡', 'don'),
+('潡', 'ton'),
+('潡', '돈'),
+('潡', '큰 물 돈 '),
+('潢', 'deep'),
+('潢', 'hwang'),
+('潢', 'pond'),
+('潢', 'pool'),
+('潢', '웅덩이 황'),
+('潢', '황'),
+('潤', 'yun'),
+('潤', '윤'),
+('潤', '젖을 륜'),
+('潦', '큰 비 료'),
+('潭', 'dam'),
+('潭', 'tam'),
+('潭', '깊을 담'),
+('潭', '담'),
+('潮', 'Hanja form of 조 (“tide”).'),
+('潮', '밀물'),
+('潮', '조'),
+('潮', '조수 조'),
+('潯', 'sim'),
+('潯', '물가 심'),
+('潯', '심'),
+('潰', 'gwe'),
+('潰', 'kwe'),
+('潰', 'kwey'),
+('潰', '궤'),
+('潰', '흩어질 궤'),
+('潴', 'ce'),
+('潴', 'chŏ'),
+('潴', 'jeo'),
+('潴', '瀦와 同字'),
+('潴', '저'),
+('潸', 'san'),
+('潸', '눈물흐를 산'),
+('潸', '산'),
+('潺', 'can'),
+('潺', 'chan'),
+('潺', 'jan'),
+('潺', '물이 줄줄 흐르는 모양 잔'),
+('潺', '잔'),
+('潼', 'dong'),
+('潼', 'tong'),
+('潼', '동'),
+('潼', '물 이름 동'),
+('潽', 'bo'),
+('潽', 'po'),
+('潽', '보'),
+('潾', '맑을 린'),
+('澁', '떫을 삽'),
+('澁', '삽'),
+('澂', 'ching'),
+('澂', 'cing'),
+('澂', 'jing'),
+('澂', '澄과 同字'),
+('澂', '징'),
+('澄', 'ching'),
+('澄', 'cing'),
+('澄', 'jing'),
+('澄', '맑을 징'),
+('澄', '징'),
+('澆', ' 물 끌어올 요'),
+('澆', 'yo'),
+('澆', '걸찰 요'),
+('澆', '요'),
+('澈', '물 맑을'),
+('澈', '물 맑을 철'),
+('澈', '철'),
+('澉', 'geom'),
+('澉', 'kem'),
+('澉', 'kŏm'),
+('澉', '검'),
+('澋', 'hoeng'),
+('澋', 'hoyng'),
+('澋', '물이 빙 돌 횡 '),
+('澋', '횡'),
+('澌', ' 다할 시'),
+('澌', '물 잦을 시'),
+('澌', '시'),
+('澍', '단비 주'),
+('澍', '주'),
+('澎', ' 물결 부딛는 형세 팽'),
+('澎', 'p''aeng'),
+('澎', 'paeng'),
+('澎', 'phayng'),
+('澎', '물소리 팽'),
+('澎', '팽'),
+('澐', 'un'),
+('澐', 'wun'),
+('澐', '운'),
+('澐', '큰 물결 운'),
+('澒', 'hong'),
+('澒', '수은 홍'),
+('澒', '홍'),
+('澔', 'ho'),
+('澔', '浩와 同字'),
+('澔', '호'),
+('澗', 'Hanja form of 간 (“mountain stream”).'),
+('澗', '간'),
+('澗', '산골 물'),
+('澗', '산골물 간'),
+('澘', 'san'),
+('澘', '潸의 略字 '),
+('澘', '산'),
+('澙', '潟의 俗字 '),
+('澟', '서늘할 름 '),
+('澡', 'cho'),
+('澡', 'co'),
+('澡', 'jo'),
+('澡', '씻을 조'),
+('澡', '조'),
+('澣', '빨 한'),
+('澣', '한'),
+('澤', ' 비와 이슬 택'),
+('澤', ' 윤택할 택'),
+('澤', ' 진액 택'),
+('澤', ' 진펄 택'),
+('澤', '못 택'),
+('澤', '택'),
+('澤', '풀 석'),
+('澦', 'ye'),
+('澦', 'yeo'),
+('澦', 'yŏ'),
+('澦', '여'),
+('澧', '강 이름 례'),
+('澨', 'se'),
+('澨', 'seo'),
+('澨', 'sŏ'),
+('澨', '물가 서'),
+('澨', '서'),
+('澮', 'hoe'),
+('澮', 'hoy'),
+('澮', '봇도랑 회'),
+('澮', '회'),
+('澯', 'ch''an'),
+('澯', 'chan'),
+('澯', '맑을 찬 '),
+('澯', '찬'),
+('澱', ' 물 고일 전'),
+('澱', 'cen'),
+('澱', 'chŏn'),
+('澱', 'jeon'),
+('澱', '전'),
+('澱', '찌끼 전'),
+('澳', ' 물 이름 오'),
+('澳', '깊을 오'),
+('澶', '물이름 전'),
+('澶', '전'),
+('澹', '맑을 담'),
+('澾', '단'),
+('激', ' 말 과격히 할 격'),
+('激', ' 맑은 소리 격'),
+('激', ' 찌를 격'),
+('激', 'Hanja form of 격 (“wave, tide”).'),
+('激', '격'),
+('激', '물결'),
+('激', '물결 부딪혀 흐를 격'),
+('濁', ' 더러울 탁'),
+('濁', ' 물이름 탁'),
+('濁', 'Hanja form of 탁 (“muddy, cloudy”).'),
+('濁', '탁'),
+('濁', '흐리다'),
+('濁', '흐릴'),
+('濁', '흐릴 탁'),
+('濂', '내 이름 렴'),
+('濃', '농'),
+('濃', '짙다'),
+('濃', '짙을'),
+('濃', '짙을 농'),
+('濆', 'bun'),
+('濆', 'pun'),
+('濆', '분'),
+('濆', '뿜을 분'),
+('濇', '껄끄러울 색'),
+('濇', '색'),
+('濉', 'su'),
+('濉', 'swu'),
+('濉', '수'),
+('濊', ' 물 넘칠 예'),
+('濊', 'A proto-Korean ethnicity who founded Buyeo, Okjeo and Dongye. Commonly grouped with the Maek ethnicity in a collective term, Yemaek.'),
+('濊', '예'),
+('濊', '흐릴 예'),
+('濕', ' 근심 습'),
+('濕', ' 소 귀 벌룩거릴 습'),
+('濕', 'seup'),
+('濕', 'sup'),
+('濕', 'sŭp'),
+('濕', '습'),
+('濕', '젖을 습'),
+('濘', '진흙 녕'),
+('濚', 'yeng'),
+('濚', 'yeong'),
+('濚', 'yŏng'),
+('濚', '물 돌아나갈 영 '),
+('濚', '영'),
+('濛', '가랑비 올 몽'),
+('濛', '몽'),
+('濞', '물 소리 비 '),
+('濞', '비'),
+('濟', 'Hanja form of 제 (“many”).'),
+('濟', 'Hanja form of 제 (“to cross a river”).'),
+('濟', 'Hanja form of 제 (“to help; to aid; to relieve”).'),
+('濟', '건너다'),
+('濟', '건널'),
+('濟', '나루 제'),
+('濟', '제'),
+('濠', ' 강 이름 호'),
+('濠', '해자 호'),
+('濠', '호'),
+('濡', ' 곱고 윤택할 유'),
+('濡', ' 막힐 유'),
+('濡', '유'),
+('濡', '적실 유'),
+('濤', 'Hanja form of 도 (“waves”).'),
+('濤', '도'),
+('濤', '물결'),
+('濤', '물결 도'),
+('濩', 'spread out'),
+('濩', '퍼질 호'),
+('濩', '호'),
+('濫', 'Hanja form of 람/남 (“excessive; superfluous”).'),
+('濫', 'Hanja form of 람/남 (“to overflow”).'),
+('濫', '남'),
+('濫', '넘쳐흐를 함'),
+('濫', '넘치다'),
+('濫', '넘칠'),
+('濫', '람'),
+('濫', '퍼질 람'),
+('濬', '준'),
+('濬', '칠 준'),
+('濮', '강 이름 복'),
+('濮', '복'),
+('濯', ' 놀 탁'),
+('濯', ' 빛날 탁'),
+('濯', ' 빨래할 탁'),
+('濯', ' 산 민둥민둥할 탁'),
+('濯', ' 살찔 탁'),
+('濯', ' 적실 탁'),
+('濯', ' 클 탁'),
+('濯', '씻을 탁'),
+('濯', '탁'),
+('濱', '물가'),
+('濱', '물가 빈'),
+('濱', '빈'),
+('濳', 'cam'),
+('濳', 'cham'),
+('濳', 'jam'),
+('濳', '潛의 俗字'),
+('濳', '잠'),
+('濴', 'yeng'),
+('濴', 'yeong'),
+('濴', 'yŏng'),
+('濴', '물 졸졸 흐를 영 '),
+('濴', '영'),
+('濺', '천'),
+('濺', '흩뿌릴 천'),
+('濾', '겨를 려'),
+('瀁', 'yang'),
+('瀁', '물결 일렁일 양'),
+('瀁', '양'),
+('瀅', ' 개천 형'),
+('瀅', '맑을 형'),
+('瀅', '물 맑을'),
+('瀅', '형'),
+('瀆', 'ditch'),
+('瀆', 'pollute'),
+('瀆', '도랑 독'),
+('瀆', '독'),
+('瀇', ' 고인 물 썪어 냄새날 왕 '),
+('瀇', ' 넓을 왕'),
+('瀇', 'wang'),
+('瀇', '아득할 왕'),
+('瀇', '왕'),
+('瀉', 'drain off, leak'),
+('瀉', 'flow, pour down'),
+('瀉', '사'),
+('瀉', '토할 사'),
+('瀋', 'sim'),
+('瀋', '심'),
+('瀏', '맑을 류'),
+('瀑', ' 물거품 포'),
+('瀑', '소나기 포'),
+('瀑', '폭포수 폭'),
+('瀒', 'saek'),
+('瀒', 'sayk'),
+('瀒', '濇의 俗字'),
+('瀒', '색'),
+('瀓', 'ching'),
+('瀓', 'cing'),
+('瀓', 'jing'),
+('瀓', '맑을 징 '),
+('瀓', '징'),
+('瀕', '물가 빈'),
+('瀕', '빈'),
+('瀘', '강 이름 로'),
+('瀚', 'han'),
+('瀚', '넓고 큰 한'),
+('瀚', '한'),
+('瀛', ' 신선 사는 산 영'),
+('瀛', 'sea'),
+('瀛', '영'),
+('瀛', '큰 바다 영'),
+('瀜', 'yung'),
+('瀜', '물 깊을 륭 '),
+('瀜', '융'),
+('瀝', '거를 력'),
+('瀞', ' 정결할 정'),
+('瀞', 'ceng'),
+('瀞', 'chŏng'),
+('瀞', 'jeong'),
+('瀞', '맑을 정'),
+('瀞', '정'),
+('瀟', ' 강이름 소'),
+('瀟', ' 비바람 몰아칠 소'),
+('瀟', '물 맑을 소'),
+('瀟', '소'),
+('瀣', ' 이슬 기운 해'),
+('瀣', '찬이슬 해'),
+('瀣', '해'),
+('瀦', ' 못 저'),
+('瀦', 'ce'),
+('瀦', 'chŏ'),
+('瀦', 'jeo'),
+('瀦', '물 괼 저'),
+('瀦', '저'),
+('瀧', '룡'),
+('瀧', '비 올 룡'),
+('瀧', '용'),
+('瀨', 'Hanja form of 뢰/뇌 (“rapids”).'),
+('瀨', '뇌'),
+('瀨', '뢰'),
+('瀨', '여울'),
+('瀨', '여울 뢰'),
+('瀬', '여울 뢰'),
+('瀯', ' 물 돌아나갈 영'),
+('瀯', ' 물웅덩이 영 '),
+('瀯', 'yeng'),
+('瀯', 'yeong'),
+('瀯', 'yŏng'),
+('瀯', '물소리 영'),
+('瀯', '영'),
+('瀰', '물 넓을 미'),
+('瀰', '미'),
+('瀲', '넘칠 렴'),
+('瀷', 'ik'),
+('瀷', '강이름 익 '),
+('瀷', '익'),
+('瀸', 'ch''ŏm'),
+('瀸', 'chem'),
+('瀸', 'cheom'),
+('瀸', '적실 첨 '),
+('瀸', '첨'),
+('瀹', 'soak'),
+('瀹', 'to boil'),
+('瀹', 'to wash'),
+('瀹', '약'),
+('瀼', ' 강이름 양'),
+('瀼', 'yang'),
+('瀼', '양'),
+('瀼', '이슬 많은 모양 양'),
+('瀾', 'Hanja form of 란/난 (“wave”).'),
+('瀾', '난'),
+('瀾', '란'),
+('瀾', '물결'),
+('瀾', '물결 란'),
+('灄', ' 떼 섭'),
+('灄', ' 물이름 섭'),
+('灄', 'seop'),
+('灄', 'sep'),
+('灄', 'sŏp'),
+('灄', '섭'),
+('灄', '흠치르르할 섭'),
+('灌', 'irrigate, flood'),
+('灌', 'pour'),
+('灌', 'water'),
+('灌', '관'),
+('灌', '물 댈 관'),
+('灎', 'yem'),
+('灎', 'yeom'),
+('灎', 'yŏm'),
+('灎', '灩의 俗字'),
+('灎', '염'),
+('灐', 'hyeng'),
+('灐', 'hyeong'),
+('灐', 'hyŏng'),
+('灐', '물 이름 형 '),
+('灐', '형'),
+('灑', ' 깜짝 놀랄 새'),
+('灑', ' 깜짝 놀랄 쇄'),
+('灑', '뿌릴 새'),
+('灑', '뿌릴 쇄'),
+('灓', '적실 란 '),
+('灘', ' 해 이름 탄'),
+('灘', 'Hanja form of 탄 (“shoal”).'),
+('灘', '여울'),
+('灘', '여울 탄'),
+('灘', '탄'),
+('灝', ' 콩 삶은 물 호'),
+('灝', 'ho'),
+('灝', '넓을 호'),
+('灝', '호'),
+('灞', 'p''a'),
+('灞', 'pa'),
+('灞', 'pha'),
+('灞', '물이름 파'),
+('灞', '파'),
+('灣', 'Hanja form of 만 (“(geography) bay; gulf”).'),
+('灣', 'Hanja form of 만 (“(geography) bay; gulf”). [noun]'),
+('灣', '만'),
+('灣', '물굽이'),
+('灣', '물굽이 만'),
+('灧', 'yem'),
+('灧', 'yeom'),
+('灧', 'yŏm'),
+('灧', '灩의 俗字'),
+('灧', '염'),
+('灩', ' 물결 출렁거릴 염'),
+('灩', 'yem'),
+('灩', 'yeom'),
+('灩', 'yŏm'),
+('灩', '물 그득할 염'),
+('灩', '염'),
+('火', 'Hanja form of 화 (“(as an abbreviation) Mars”).'),
+('火', 'Hanja form of 화 (“Short for 화요일(火曜日) (hwayoil, “Tuesday”).”).'),
+('火', 'Hanja form of 화 (“anger”).'),
+('火', 'Hanja form of 화 (“anger”). [noun]'),
+('火', 'Hanja form of 화 (“fire; heat”).'),
+('火', 'Hanja form of 화 (“fire; heat”). [affix]'),
+('火', '불'),
+('火', '불 화'),
+('火', '화'),
+('灯', '燈의 略字'),
+('灰', 'Hanja form of 회 (“ashes; dust; lime; mortar”).'),
+('灰', '재'),
+('灰', '재 회'),
+('灰', '회'),
+('灵', '靈의 俗字'),
+('灷', 'a live coal'),
+('灷', 'sen'),
+('灷', 'seon'),
+('灷', 'sŏn'),
+('灷', '선'),
+('灸', 'gu'),
+('灸', 'ku'),
+('灸', 'kwu'),
+('灸', 'moxibustion'),
+('灸', '구'),
+('灸', '지질 구'),
+('灼', '사를 작'),
+('災', ' 천벌 재'),
+('災', ' 횡액 재'),
+('災', 'Hanja form of 재 (“disaster”).'),
+('災', '재'),
+('災', '재앙'),
+('災', '재앙 재'),
+('灾', '災와 同字'),
+('炁', 'gi'),
+('炁', 'ki'),
+('炁', '기'),
+('炁', '기운 기'),
+('炅', 'A Korean family name (pronounced 계, Romanized as Gye or Kye)'),
+('炅', 'Brightening, illuminating'),
+('炅', 'Heat'),
+('炅', 'Shining, glowing'),
+('炅', 'appearance of smoke being formed from something that is burning'),
+('炅', 'gyeong'),
+('炅', 'kyeng'),
+('炅', 'kyŏng'),
+('炅', '경'),
+('炅', '빛날 경'),
+('炆', 'mun'),
+('炆', '따뜻할 문'),
+('炆', '문'),
+('炉', '爐의 略字'),
+('炊', ' 밥 지을 취'),
+('炊', '불 땔'),
+('炊', '불 지필 취'),
+('炊', '취'),
+('炎', ' 임금의 호 염'),
+('炎', 'Hanja form of 염 (“(medicine) inflammation”).'),
+('炎', 'Hanja form of 염 (“flame”).'),
+('炎', '불꽃'),
+('炎', '불꽃 염'),
+('炎', '염'),
+('炒', 'ch''o'),
+('炒', 'cho'),
+('炒', '볶을 초'),
+('炒', '초'),
+('炕', ' 구들 항'),
+('炕', ' 구울 항'),
+('炕', 'hang'),
+('炕', 'hypocaust'),
+('炕', 'hypocaust floor'),
+('炕', '마를 항'),
+('炕', '항'),
+('炘', 'heun'),
+('炘', 'hun'),
+('炘', 'hŭn'),
+('炘', '화끈거릴 흔'),
+('炘', '흔'),
+('炙', ' 김 쏘일 적'),
+('炙', ' 냄새 퍼질 적'),
+('炙', 'Hanja form of 자 (“to roast; to broil”).'),
+('炙', 'Hanja form of 적 (“jeok (a Korean meat dish)”).'),
+('炙', '고기구을 자'),
+('炙', '고기구이 적'),
+('炙', '구울'),
+('炙', '굽다'),
+('炙', '자'),
+('炙', '적'),
+('炚', 'Alternative form of 光 (“Hanja form of 광 (“light”).”)'),
+('炚', '광'),
+('炚', '빛'),
+('炚', '햇빚 뜨거울 광 '),
+('炛', 'Alternative form of 光 (“Hanja form of 광 (“light”).”)'),
+('炛', '광'),
+('炛', '빛'),
+('炡', ' 불 번쩍거릴 정 '),
+('炡', '데칠 정'),
+('炤', '照와 同字'),
+('炤', '밝을 소'),
+('炫', ' 불빛 현'),
+('炫', 'flaunt'),
+('炫', 'glitter'),
+('炫', 'shine'),
+('炫', 'show off'),
+('炫', '밝을 현'),
+('炫', '현'),
+('炬', ' 불 땔 거'),
+('炬', 'geo'),
+('炬', 'ke'),
+('炬', 'kŏ'),
+('炬', '거'),
+('炬', '횃불 거'),
+('炭', ' 볶일 탄'),
+('炭', ' 불똥 탄'),
+('炭', 'Hanja form of 탄 (“charcoal; coal; carbon”).'),
+('炭', '숯'),
+('炭', '숯 탄'),
+('炭', '탄'),
+('炮', ' 싸서 구울 포'),
+('炮', ' 형벌 포'),
+('炮', '그슬릴 포'),
+('炮', '포'),
+('炯', ' 밝을 형'),
+('炯', 'Shining bright'),
+('炯', '빛날 형'),
+('炯', '형'),
+('炰', ' 까불거릴 포'),
+('炰', 'bake'),
+('炰', 'broil'),
+('炰', 'roast'),
+('炰', '그슬 포'),
+('炰', '포'),
+('炳', 'bright, luminous'),
+('炳', 'byeong'),
+('炳', 'glorious'),
+('炳', 'pyeng'),
+('炳', 'pyŏng'),
+('炳', '밝을 병'),
+('炳', '병'),
+('炵', 'dong'),
+('炵', 'tong'),
+('炵', '동'),
+('炵', '불꽃 동 '),
+('炷', 'chu'),
+('炷', 'cwu'),
+('炷', 'ju'),
+('炷', '심지 주'),
+('炷', '주'),
+('炸', '작'),
+('炸', '터질 작'),
+('点', 'Alternative form of 點 (“Hanja form of 점 (“point; dot; spot; speck”).”)'),
+('点', '點의 略字'),
+('点', '점'),
+('為', 'Alternative form of 爲 (“to do; act”)'),
+('為', '爲와 同字'),
+('為', '위'),
+('為', '하다'),
+('為', '할'),
+('烀', '삶다'),
+('烀', '삶을'),
+('烀', '호'),
+('烈', 'Hanja form of 렬/열 (“fiery, violent, vehement, ardent”).'),
+('烈', '렬'),
+('烈', '세차다'),
+('烈', '세찰'),
+('烈', '세찰 렬'),
+('烈', '열'),
+('烉', 'hwan'),
+('烉', '煥의 俗字'),
+('烉', '환'),
+('烊', ' 녹일 양'),
+('烊', 'yang'),
+('烊', '구울 양'),
+('烊', '양'),
+('烋', '거들거릴 효'),
+('烋', '경사로울 휴'),
+('烎', 'eum'),
+('烎', 'um'),
+('烎', 'ŭm'),
+('烎', '음'),
+('烏', ' 검을 오'),
+('烏', ' 어찌 오'),
+('烏', ' 탄식할 오'),
+('烏', 'Hanja form of 오 (“crow”).'),
+('烏', 'o'),
+('烏', '까마귀 오'),
+('烏', '오'),
+('烓', 'gye'),
+('烓', 'kye'),
+('烓', 'kyey'),
+('烓', 'stove'),
+('烓', '계'),
+('烓', '화덕 계'),
+('烘', 'hong'),
+('烘', '홍'),
+('烘', '횃불 홍'),
+('烙', '지질 락'),
+('烜', 'light of the sun'),
+('烜', 'to dry in the sun'),
+('烜', '마를 훤'),
+('烜', '훤'),
+('烝', 'chŭng'),
+('烝', 'cung'),
+('烝', 'jeung'),
+('烝', 'many, numerous'),
+('烝', 'rise'),
+('烝', 'steam'),
+('烝', '김 오를 증'),
+('烝', '증'),
+('烟', 'smoke'),
+('烟', 'yen'),
+('烟', 'yeon'),
+('烟', 'yŏn'),
+('烟', '煙과 同字'),
+('烟', '연'),
+('烣', 'hoe'),
+('烣', 'hoy'),
+('烣', '넓힐 회 '),
+('烣', '회'),
+('烱', 'gyeong'),
+('烱', 'kyeng'),
+('烱', 'kyŏng'),
+('烱', '경'),
+('烱', '빛날 경'),
+('烹', ' 요리 팽'),
+('烹', 'p''aeng'),
+('烹', 'paeng'),
+('烹', 'phayng'),
+('烹', '삶을 팽'),
+('烹', '팽'),
+('烽', 'bong'),
+('烽', 'pong'),
+('烽', '봉'),
+('烽', '봉화 봉'),
+('焄', 'hun'),
+('焄', 'hwun'),
+('焄', 'menace'),
+('焄', 'smoke'),
+('焄', 'steam up'),
+('焄', '연기에 그을릴 훈'),
+('焄', '훈'),
+('焉', ' 의심쩍을 언'),
+('焉', '어찌'),
+('焉', '어찌 언'),
+('焉', '언'),
+('焌', 'chun'),
+('焌', 'cwun'),
+('焌', 'jun'),
+('焌', '굽을 준'),
+('焌', '준'),
+('焔', 'yen'),
+('焔', 'yeon'),
+('焔', 'yŏn'),
+('焔', '연'),
+('焕', '빛날 환'),
+('焙', 'bae'),
+('焙', 'pae'),
+('焙', 'pay'),
+('焙', '배'),
+('焙', '불에 쬘 배'),
+('焚', 'Hanja form of 분 (“burn”).'),
+('焚', '분'),
+('焚', '불사르다'),
+('焚', '불사를'),
+('焚', '불사를 분'),
+('焜', 'hon'),
+('焜', '빛날 혼'),
+('焜', '혼'),
+('焞', 'don'),
+('焞', 'ton'),
+('焞', '귀갑 지지는 불 돈'),
+('焞', '돈'),
+('焠', ' 지질 쉬'),
+('焠', ' 칼날 물에 담글 쉬'),
+('焠', ' 태울 쉬'),
+('焠', 'burn'),
+('焠', 'temper'),
+('焠', '물들일 쉬'),
+('焠', '쉬'),
+('焠', '쵀'),
+('無', 'Hanja form of 무 (“(Buddhism) the null set: neither yes nor no (in response to a koan or a question that mistakenly assumes an affirmative or negative answer)”).'),
+('無', 'Hanja form of 무 (“no; non”).'),
+('無', 'Hanja form of 무 (“nothing”).'),
+('無', '무'),
+('無', '없다'),
+('無', '없을'),
+('無', '없을 무'),
+('焦', 'ch''o'),
+('焦', 'cho'),
+('焦', '그슬릴 초'),
+('焦', '초'),
+('焭', 'gyeong'),
+('焭', 'kyeng'),
+('焭', 'kyŏng'),
+('焭', '경'),
+('焭', '근싱할 경'),
+('焮', 'heun'),
+('焮', 'hun'),
+('焮', 'hŭn'),
+('焮', '불사를 흔'),
+('焮', '흔'),
+('焯', 'cak'),
+('焯', 'chak'),
+('焯', 'jak'),
+('焯', '밝을 작 '),
+('焯', '작'),
+('焰', 'Hanja form of 염 (“flame; blaze; glowing”).'),
+('焰', '불꽃'),
+('焰', '염'),
+('焱', '불꽃 혁'),
+('焱', '혁'),
+('然', ' 그러나 연'),
+('然', ' 그러할 연'),
+('然', ' 허락할 연'),
+('然', 'Hanja form of 연 (“be as it is”).'),
+('然', '그러하다'),
+('然', '그러할'),
+('然', '불사를 연'),
+('然', '연'),
+('焼', '燒와 同字'),
+('煆', 'ha'),
+('煆', '불사를 하'),
+('煆', '하'),
+('煇', '빛날 휘'),
+('煇', '지질 훈'),
+('煉', '불릴 련'),
+('煊', 'hwen'),
+('煊', 'hwon'),
+('煊', 'hwŏn'),
+('煊', '따뜻할 훤'),
+('煊', '훤'),
+('煌', 'hwang'),
+('煌', '빛날 황'),
+('煌', '황'),
+('煎', ' 불에 말릴 전'),
+('煎', 'cen'),
+('煎', 'chŏn'),
+('煎', 'jeon'),
+('煎', '달일 전'),
+('煎', '전'),
+('煐', 'yeng'),
+('煐', 'yeong'),
+('煐', 'yŏng'),
+('煐', '빛날 영 '),
+('煐', '영'),
+('煑', 'ca'),
+('煑', 'cha'),
+('煑', 'ja'),
+('煑', '자'),
+('煒', ' 환할 위'),
+('煒', 'crimson'),
+('煒', 'glowing'),
+('煒', 'wi'),
+('煒', '벌그레할 위'),
+('煒', '위'),
+('煕', 'bright, splendid, glorious'),
+('煕', 'hui'),
+('煕', 'huy'),
+('煕', 'hŭi'),
+('煕', '熙와 同字'),
+('煕', '희'),
+('煖', 'genial'),
+('煖', 'nan'),
+('煖', 'warm'),
+('煖', '난'),
+('煖', '따뜻할 난'),
+('煗', '난'),
+('煗', '터울 난 '),
+('煙', ' 기운 인'),
+('煙', ' 숯 그을음 인'),
+('煙', ' 안개 인'),
+('煙', 'Hanja form of 연 (“smoke”).'),
+('煙', '김 인'),
+('煙', '연'),
+('煙', '연기'),
+('煙', '연기 연'),
+('煜', ' 불꽃 욱'),
+('煜', ' 불꽃 읍'),
+('煜', ' 불빛 비칠 읍'),
+('煜', ' 성할 욱'),
+('煜', ' 성할 읍'),
+('煜', '비칠 욱'),
+('煜', '비칠 읍'),
+('煞', 'sal'),
+('煞', '살'),
+('煞', '죽일 살'),
+('煠', 'chap'),
+('煠', 'jap'),
+('煠', 'to boil'),
+('煠', 'to fry in fat or oil'),
+('煠', '잡'),
+('煢', 'gyeong'),
+('煢', 'kyeng'),
+('煢', 'kyŏng'),
+('煢', '경'),
+('煢', '외로울 경'),
+('煤', 'Hanja form of 매 (“soot”).'),
+('煤', '그을음'),
+('煤', '그을음 매'),
+('煤', '매'),
+('煥', 'hwan'),
+('煥', 'lustrous'),
+('煥', 'shining, brilliant'),
+('煥', '불꽃 환'),
+('煥', '환'),
+('煦', 'genial'),
+('煦', 'gracious'),
+('煦', 'hu'),
+('煦', 'hwu'),
+('煦', 'kind, gentle'),
+('煦', '따뜻하게 할 후'),
+('煦', '후'),
+('照', 'Hanja form of 조 (“to contrast; to compare”).'),
+('照', 'Hanja form of 조 (“to illuminate; to shine”).'),
+('照', '비출 조'),
+('照', '비치다'),
+('照', '비칠'),
+('照', '조'),
+('煨', ' 그슬릴 외'),
+('煨', ' 사람이름 외'),
+('煨', 'ashes'),
+('煨', 'embers, a live coal'),
+('煨', 'flame'),
+('煨', 'oe'),
+('煨', 'oy'),
+('煨', 'ripen'),
+('煨', 'roast, bake'),
+('煨', '불에 묻어 구울 외'),
+('煨', '외'),
+('煩', 'Hanja form of 번 (“bother, vex, trouble”).'),
+('煩', 'Hanja form of 번 (“troublesome”).'),
+('煩', '괴로워할 번'),
+('煩', '번'),
+('煩', '번거로울'),
+('煩', '번거롭다'),
+('煬', 'yang'),
+('煬', '구울 양'),
+('煬', '양'),
+('煮', 'ca'),
+('煮', 'cha'),
+('煮', 'ja'),
+('煮', '삶을 자'),
+('煮', '자'),
+('煽', 'Hanja form of 선 (“to fan”).'),
+('煽', '부치다'),
+('煽', '부칠'),
+('煽', '부칠 선'),
+('煽', '선'),
+('熀', 'yeop'),
+('熀', 'yep'),
+('熀', 'yŏp'),
+('熀', '불빛 이글이글할 녑'),
+('熀', '엽'),
+('熄', ' 마칠 식'),
+('熄', ' 없어질 식'),
+('熄', 'put out, extinguish'),
+('熄', 'quash'),
+('熄', 'sik'),
+('熄', '불 꺼질 식'),
+('熄', '식'),
+('熅', ' 따뜻할 온'),
+('熅', ' 숯불 온'),
+('熅', 'charcoal'),
+('熅', 'dimness'),
+('熅', 'on'),
+('熅', 'to iron'),
+('熅', 'warm'),
+('熅', '서린 연기 온'),
+('熅', '온'),
+('熇', '뜨거울 혹'),
+('熇', '불김 효'),
+('熈', 'bright, splendid, glorious'),
+('熈', 'hui'),
+('熈', 'huy'),
+('熈', 'hŭi'),
+('熈', '熙와 同字'),
+('熈', '희'),
+('熉', 'un'),
+('熉', 'wun'),
+('熉', '누른 빛 운 '),
+('熉', '운'),
+('熊', ' 빛날 웅'),
+('熊', 'Hanja form of 웅 (“bear”).'),
+('熊', '곰'),
+('熊', '곰 웅'),
+('熊', '웅'),
+('熏', 'hun'),
+('熏', 'hwun'),
+('熏', '연기 낄 훈'),
+('熏', '훈'),
+('熒', 'hyeng'),
+('熒', 'hyeong'),
+('熒', 'hyŏng'),
+('熒', 'lamplight'),
+('熒', 'shine'),
+('熒', 'the glow of a firefly'),
+('熒', '등불 형'),
+('熒', '형'),
+('熔', 'yong'),
+('熔', '鎔의 俗字'),
+('熔', '용'),
+('熙', 'hui'),
+('熙', 'huy'),
+('熙', 'hŭi'),
+('熙', '빛날 희'),
+('熙', '희'),
+('熛', ' 붉을 표'),
+('熛', ' 빛날 표'),
+('熛', ' 성낼 표'),
+('熛', 'blaze'),
+('熛', 'p''yo'),
+('熛', 'phyo'),
+('熛', 'pyo'),
+('熛', '불똥 튈 표'),
+('熛', '표'),
+('熟', ' 삶을 숙'),
+('熟', ' 풍년들 숙'),
+('熟', 'suk'),
+('熟', 'swuk'),
+('熟', '숙'),
+('熟', '익힐 숙'),
+('熠', ' 반딧불 반짝거릴 습'),
+('熠', ' 선명할 습'),
+('熠', 'seup'),
+('熠', 'sup'),
+('熠', 'sŭp'),
+('熠', '습'),
+('熠', '환할 습'),
+('熢', 'bong'),
+('熢', 'pong'),
+('熢', '봉'),
+('熢', '연기 자욱할 봉 '),
+('熤', ' 사람이름 익 '),
+('熤', 'ik'),
+('熤', '빛날 익'),
+('熤', '익'),
+('熨', ' 고약 붙일 위'),
+('熨', 'iron'),
+('熨', 'press'),
+('熨', '다리미 위'),
+('熨', '위'),
+('熬', ' 애 끓는 소리 오'),
+('熬', '볶을 오'),
+('熬', '오'),
+('熯', ' 공경할 선'),
+('熯', ' 태울 선'),
+('熯', 'by fire'),
+('熯', 'sen'),
+('熯', 'seon'),
+('熯', 'sŏn'),
+('熯', '불 이글이글할 선'),
+('熯', '선'),
+('熱', ' 쏠릴 열'),
+('熱', 'Hanja form of 열 (“fever; heat”).'),
+('熱', '더울'),
+('熱', '덥다'),
+('熱', '뜨거울 열'),
+('熱', '열'),
+('熲', 'gyeong'),
+('熲', 'kyeng'),
+('熲', 'kyŏng'),
+('熲', '경'),
+('熲', '빛날 경'),
+('熹', '성할 희'),
+('熹', '희'),
+('熺', 'hui'),
+('熺', 'huy'),
+('熺', 'hŭi'),
+('熺', '熹와 同字'),
+('熺', '희'),
+('熾', '불 활활 붙을 치'),
+('熾', '치'),
+('燁', ' 번쩍번쩍할 엽'),
+('燁', 'flash in rapid succession'),
+('燁', 'glorious'),
+('燁', 'shine'),
+('燁', '불 이글글할 엽'),
+('燁', '엽'),
+('燃', ' 연등절 연'),
+('燃', 'Hanja form of 연 (“burn, light fire, ignite”).'),
+('燃', '불사를 연'),
+('燃', '연'),
+('燃', '탈'),
+('燈', 'Hanja form of 등 (“lamp, lantern, light”).'),
+('燈', '등'),
+('燈', '등잔 등'),
+('燉', 'ton'),
+('燉', '돈'),
+('燉', '불 성할 돈'),
+('燋', 'burn'),
+('燋', 'ch''o'),
+('燋', 'cho'),
+('燋', 'scald'),
+('燋', 'scorch'),
+('燋', 'torch'),
+('燋', '초'),
+('燋', '홰 초'),
+('燎', '화톳불 료'),
+('燐', '도깨비불 린'),
+('燐', '린'),
+('燐', '인'),
+('燒', ' 들불 소'),
+('燒', ' 불 놓을 소'),
+('燒', 'Hanja form of 소 (“burn; fire”).'),
+('燒', '불 붙을 소'),
+('燒', '불사르다'),
+('燒', '불사를'),
+('燒', '소'),
+('燔', 'beon'),
+('燔', 'pen'),
+('燔', 'pŏn'),
+('燔', '구울 번'),
+('燔', '번'),
+('燕', ' 나라이름 연'),
+('燕', ' 잔치 연'),
+('燕', ' 편안할 연'),
+('燕', '연'),
+('燕', '제비 연'),
+('燖', 're-heat food'),
+('燖', 'sim'),
+('燖', '삶을 심'),
+('燖', '심'),
+('燙', ' 불에 델 탕'),
+('燙', 't''ang'),
+('燙', 'tang'),
+('燙', 'thang'),
+('燙', '씻을 탕'),
+('燙', '탕'),
+('營', ' 다스릴 영'),
+('營', ' 진 영'),
+('營', ' 헤아릴 영'),
+('營', 'Hanja form of 영 (“encampment; barracks”).'),
+('營', 'Hanja form of 영 (“to build; to construct”).'),
+('營', 'Hanja form of 영 (“to manage; to operate”).'),
+('營', '경영하다'),
+('營', '경영할'),
+('營', '별이름 형'),
+('營', '영'),
+('營', '지을 영'),
+('燠', '더울 욱'),
+('燠', '따뜻하다'),
+('燠', '따뜻할'),
+('燠', '불'),
+('燠', '오'),
+('燠', '우'),
+('燠', '욱'),
+('燠', '위로하다'),
+('燠', '위로할'),
+('燥', 'cho'),
+('燥', 'co'),
+('燥', 'jo'),
+('燥', 'to be dry'),
+('燥', '마를 조'),
+('燥', '조'),
+('燦', '빛날 찬'),
+('燦', '찬'),
+('燧', ' 나무 문질러 불낼 수'),
+('燧', ' 불 수'),
+('燧', 'su'),
+('燧', 'swu'),
+('燧', '봉화 수'),
+('燧', '수'),
+('燬', 'blaze, fire'),
+('燬', 'burn down'),
+('燬', '불 훼'),
+('燬', '훼'),
+('燭', '爥의 俗字'),
+('燭', '촉'),
+('燮', ' 불꽃 섭'),
+('燮', ' 조화로울 섭'),
+('燮', 'adjust'),
+('燮', 'harmonize, blend'),
+('燮', '불꽃'),
+('燮', '불에 익힐 섭'),
+('燮', '섭'),
+('燰', 'ae'),
+('燰', '애'),
+('燹', 'fire'),
+('燹', 'wild fires'),
+('燹', '들불 희'),
+('燹', '희'),
+('燻', 'hun'),
+('燻', 'hwun'),
+('燻', '연기 낄 훈'),
+('燻', '훈'),
+('燼', ' 불똥 신'),
+('燼', ' 재난의 뒤 신'),
+('燼', 'sin'),
+('燼', '깜부기불 신'),
+('燼', '신'),
+('燾', 'do'),
+('燾', 'to'),
+('燾', '도'),
+('燾', '비칠 도'),
+('燿', ' 빛날 요'),
+('燿', 'yo'),
+('燿', '비칠 요'),
+('燿', '요'),
+('爀', ' 빛날 혁 '),
+('爀', 'red'),
+('爀', '불빛 혁'),
+('爀', '혁'),
+('爆', 'Hanja form of 박 (“to sear; scorch”).'),
+('爆', 'Hanja form of 폭 (“to explode”).'),
+('爆', '박'),
+('爆', '불터질 폭'),
+('爆', '지지다'),
+('爆', '지질'),
+('爆', '지질 박'),
+('爆', '터지다'),
+('爆', '터질'),
+('爆', '폭'),
+('爇', 'sel'),
+('爇', 'seol'),
+('爇', 'sŏl'),
+('爇', '불사를 설'),
+('爇', '설'),
+('爋', 'hun'),
+('爋', 'hwun'),
+('爋', '불에 말릴 훈 '),
+('爋', '훈'),
+('爌', 'gwang'),
+('爌', 'kwang'),
+('爌', '광'),
+('爌', '불 빛 환할 광 '),
+('爍', '빛날 삭'),
+('爍', '삭'),
+('爐', 'Hanja form of 로/노 (“fireplace, stove, oven, furnace”).'),
+('爐', '노'),
+('爐', '로'),
+('爐', '화로'),
+('爐', '화로 로'),
+('爔', 'hui'),
+('爔', 'huy'),
+('爔', 'hŭi'),
+('爔', '불 희 '),
+('爔', '희'),
+('爗', ' 번쩍번쩍할 엽 '),
+('爗', 'yeop'),
+('爗', 'yep'),
+('爗', 'yŏp'),
+('爗', '불 이글글할 엽'),
+('爗', '엽'),
+('爚', 'yak'),
+('爚', '스러질 약'),
+('爚', '약'),
+('爛', '문드러질 란'),
+('爟', 'gwan'),
+('爟', 'kwan'),
+('爟', '관'),
+('爟', '봉화 관'),
+('爥', 'ch''ok'),
+('爥', 'chok'),
+('爥', '비칠 촉'),
+('爥', '촉'),
+('爨', '부뚜막'),
+('爨', '불땔 찬'),
+('爨', '찬'),
+('爪', 'Hanja form of 조 (“nail; claw”).'),
+('爪', '손톱'),
+('爪', '손톱 조'),
+('爪', '조'),
+('爬', ' 기어다닐 파'),
+('爬', '긁을 파'),
+('爬', '파'),
+('爭', ' 다스릴 쟁'),
+('爭', ' 분별할 쟁'),
+('爭', 'Hanja form of 쟁 (“dispute; fight”).'),
+('爭', '다투다'),
+('爭', '다툴'),
+('爭', '다툴 쟁'),
+('爭', '쟁'),
+('爯', 'ch''ing'),
+('爯', 'ching'),
+('爯', '칭'),
+('爰', ' 가로되 원'),
+('爰', ' 이끌 원'),
+('爰', 'lead on to'),
+('爰', 'then'),
+('爰', 'therefore'),
+('爰', 'wen'),
+('爰', 'won'),
+('爰', 'wŏn'),
+('爰', '당길 원'),
+('爰', '원'),
+('爲', ' 다스릴 위'),
+('爲', ' 어미원숭이 위'),
+('爲', ' 이룰 위'),
+('爲', ' 하여금 위'),
+('爲', 'Hanja form of 위 (“to do; act”).'),
+('爲', '위'),
+('爲', '하다'),
+('爲', '할'),
+('爲', '할 위'),
+('爵', 'cak'),
+('爵', 'chak'),
+('爵', 'jak'),
+('爵', '벼슬 작'),
+('爵', '작'),
+('父', 'Hanja form of 보 (“respectful term for an elderly man”).'),
+('父', 'Hanja form of 부 (“elderly male relative”).'),
+('父', 'Hanja form of 부 (“father”).'),
+('父', '남자의 미칭(美稱) 보'),
+('父', '보'),
+('父', '부'),
+('父', '사내'),
+('父', '아비'),
+('父', '아비 부'),
+('爸', 'p''a'),
+('爸', 'pa'),
+('爸', 'pha'),
+('爸', '아비 파'),
+('爸', '파'),
+('爹', '다'),
+('爹', '아비 다'),
+('爺', ' 노인 야'),
+('爺', '아비'),
+('爺', '아비 야'),
+('爺', '야'),
+('爻', 'hyo'),
+('爻', '효'),
+('爻', '효 효'),
+('爽', 'Hanja form of 상 (“refreshing; pleasurable; invigorating”).'),
+('爽', '상'),
+('爽', '시원하다'),
+('爽', '시원할'),
+('爽', '시원할 상'),
+('爾', ' 가까울 이'),
+('爾', ' 오직 이'),
+('爾', '너'),
+('爾', '너 이'),
+('爾', '이'),
+('爿', '나뭇조각'),
+('爿', '장'),
+('牀', 'Hanja form of 상 (“bed”).'),
+('牀', '상'),
+('牀', '평상'),
+('牀', '평상 상'),
+('牂', '암양 장'),
+('牂', '장'),
+('牆', 'cang'),
+('牆', 'chang'),
+('牆', 'jang'),
+('牆', '담 장'),
+('牆', '장'),
+('片', ' 성씨 편'),
+('片', ' 쪼갤 편'),
+('片', '조각'),
+('片', '조각 편'),
+('片', '편'),
+('版', ' 국경 판'),
+('版', ' 인쇄할 판'),
+('版', ' 한 길 판'),
+('版', ' 호적 판'),
+('版', 'p''an'),
+('版', 'pan'),
+('版', 'phan'),
+('版', '조각 판'),
+('版', '판'),
+('牋', ' 문체이름 전'),
+('牋', ' 표 전'),
+('牋', 'cen'),
+('牋', 'chŏn'),
+('牋', 'jeon'),
+('牋', '글 전'),
+('牋', '전'),
+('牌', ' 방패 패'),
+('牌', ' 호패 패'),
+('牌', 'Hanja form of 패 (“tablet”).'),
+('牌', '방 붙일 패'),
+('牌', '배지 배'),
+('牌', '패'),
+('牒', 'ch''ŏp'),
+('牒', 'cheop'),
+('牒', 'chep'),
+('牒', '글씨판 첩'),
+('牒', '첩'),
+('牓', 'bang'),
+('牓', 'pang'),
+('牓', 'public notice'),
+('牓', 'register'),
+('牓', 'tablet'),
+('牓', '방'),
+('牓', '패 방'),
+('牔', 'bak'),
+('牔', 'pak'),
+('牔', '박'),
+('牔', '박공 박'),
+('牖', ' 들창 유'),
+('牖', ' 밝을 유'),
+('牖', ' 인도할 유'),
+('牖', 'yu'),
+('牖', '엇살창 유'),
+('牖', '유'),
+('牘', 'dok'),
+('牘', 'tok'),
+('牘', '독'),
+('牘', '편지 독'),
+('牙', ' 대장 기 아'),
+('牙', 'Hanja form of 아 (“molar; cheek tooth”).'),
+('牙', '아'),
+('牙', '어금니'),
+('牙', '어금니 아'),
+('牚', 'brace'),
+('牚', 'prop up'),
+('牚', 'support'),
+('牚', '탱'),
+('牛', ' 별 이름 우'),
+('牛', 'Hanja form of 우 (“cow”).'),
+('牛', '소'),
+('牛', '소 우'),
+('牛', '우'),
+('牝', 'bin'),
+('牝', 'pin'),
+('牝', '빈'),
+('牝', '암컷 빈'),
+('牟', 'mo'),
+('牟', '모'),
+('牟', '소 우는 소리 모'),
+('牡', 'mo'),
+('牡', '모'),
+('牡', '수컷 모'),
+('牢', '우리 로'),
+('牢', '우리 뢰'),
+('牣', 'in'),
+('牣', 'teem'),
+('牣', '인'),
+('牧', 'Hanja form of 목 (“to herd”).'),
+('牧', '목'),
+('牧', '치다'),
+('牧', '칠'),
+('牧', '칠 목'),
+('物', ' 무리 물'),
+('物', 'Hanja form of 물 (“thing; stuff”).'),
+('物', '만물 물'),
+('物', '물'),
+('物', '물건(物件)'),
+('牯', 'go'),
+('牯', 'ko'),
+('牯', '고'),
+('牯', '암소 고'),
+('牲', 'saeng'),
+('牲', 'sayng'),
+('牲', '생'),
+('牲', '희생 생'),
+('牴', ' 당할 저'),
+('牴', ' 대강 저'),
+('牴', ' 씨름 저'),
+('牴', 'ce'),
+('牴', 'chŏ'),
+('牴', 'jeo'),
+('牴', '저'),
+('牴', '찌를 저'),
+('牸', 'ca'),
+('牸', 'cha'),
+('牸', 'ja'),
+('牸', '암컷 자'),
+('牸', '자'),
+('特', ' 다만 특'),
+('特', ' 뛰어날 특'),
+('特', ' 세 살 먹은 짐승 특'),
+('特', ' 숫소 특'),
+('特', 'Hanja form of 특 (“male animal”).'),
+('特', 'Hanja form of 특 (“special; exceptional”).'),
+('特', '수컷'),
+('特', '우뚝할 특'),
+('特', '특'),
+('特', '특별하다'),
+('特', '특별할'),
+('牽', ' 거리낄 견'),
+('牽', ' 볏줄 견'),
+('牽', ' 빠를 견'),
+('牽', ' 이끌 견'),
+('牽', 'Hanja form of 견 (“draw, pull, attract”).'),
+('牽', '견'),
+('牽', '당기다'),
+('牽', '당길'),
+('牽', '당길 견'),
+('犀', 'Hanja form of 서 (“rhinoceros”).'),
+('犀', '무소'),
+('犀', '무소 서'),
+('犀', '서'),
+('犁', '얼룩소 리'),
+('犂', 'Hanja form of 려/여 (“plough”).'),
+('犂', 'Hanja form of 류/유 (“to tremble in fear”).'),
+('犂', 'Hanja form of 리/이 (“speckles on the skin of an elderly person”).'),
+('犂', 'Hanja form of 리/이 (“spotted cow”).'),
+('犂', '떨'),
+('犂', '떨다'),
+('犂', '려'),
+('犂', '류'),
+('犂', '리'),
+('犂', '얼룩소'),
+('犂', '여'),
+('犂', '유'),
+('犂', '이'),
+('犂', '쟁기'),
+('犇', 'bun'),
+('犇', 'pun'),
+('犇', 'run'),
+('犇', 'run fast, flee'),
+('犇', 'rush about'),
+('犇', '달아날 분'),
+('犇', '분'),
+('犍', ' 짐승이름 건'),
+('犍', ' 촉나라 고을이름 건'),
+('犍', 'geon'),
+('犍', 'ken'),
+('犍', 'kŏn'),
+('犍', '건'),
+('犍', '불친 소 건'),
+('犒', 'ho'),
+('犒', '호'),
+('犒', '호궤할 호'),
+('犖', '얼룩소 락'),
+('犜', 'don'),
+('犜', 'ton'),
+('犜', '돈'),
+('犜', '돈피 돈 '),
+('犢', 'dok'),
+('犢', 'tok'),
+('犢', '독'),
+('犢', '송아지 독'),
+('犧', '술그릇 사'),
+('犧', '희생 희'),
+('犬', 'Hanja form of 견 (“dog”).'),
+('犬', 'Hanja form of 견 (“dog”). [noun; affix]'),
+('犬', '개'),
+('犬', '견'),
+('犬', '큰 개 견'),
+('犮', 'bal'),
+('犮', 'pal'),
+('犮', 'pull out'),
+('犮', 'remove, discard'),
+('犮', 'run'),
+('犮', 'shape of running dog'),
+('犮', '발'),
+('犯', 'Hanja form of 범 (“count of crime”).'),
+('犯', 'Hanja form of 범 (“count of crime”). [counter]'),
+('犯', 'Hanja form of 범 (“criminal”).'),
+('犯', 'Hanja form of 범 (“criminal”). [suffix]'),
+('犯', 'Hanja form of 범 (“to violate; to commit”).'),
+('犯', 'Hanja form of 범 (“to violate; to commit”). [verbal root]'),
+('犯', '범'),
+('犯', '범할'),
+('犯', '범할 범'),
+('犳', '아롱 짐승 작 '),
+('犳', '작'),
+('犴', 'an'),
+('犴', '들개 안'),
+('犴', '안'),
+('犵', 'hil'),
+('犵', '오랑캐이름 힐'),
+('犵', '힐'),
+('状', '狀의 俗字'),
+('状', '狀의 略字'),
+('狀', 'Hanja form of 상 (“form; appearance; state”).'),
+('狀', 'Hanja form of 상 (“shape”).'),
+('狀', 'Hanja form of 장 (“document; certificate”).'),
+('狀', '모양 형상 장'),
+('狀', '문서'),
+('狀', '상'),
+('狀', '장'),
+('狀', '형상 상'),
+('狀', '형상(形狀)'),
+('狂', 'Hanja form of 광 (“insane, violent, mad, wild”).'),
+('狂', '광'),
+('狂', '미질'),
+('狂', '미질 광'),
+('狄', ' 꿩 그린 옷 적'),
+('狄', ' 멀 적'),
+('狄', 'Hanja form of 적 (“tribe from northern China”).'),
+('狄', '북방 오랑캐 적'),
+('狄', '오랑캐'),
+('狄', '적'),
+('狆', 'name of barbarians had been living in Yunnan and Guizhou'),
+('狆', '오랑캐'),
+('狆', '중'),
+('狉', 'bi'),
+('狉', 'pi'),
+('狉', '비'),
+('狉', '삵의 새끼 비'),
+('狌', 'seong'),
+('狌', 'wildcat, lynx'),
+('狌', '성'),
+('狎', ' 업신여길 압'),
+('狎', 'ap'),
+('狎', '압'),
+('狎', '친근할 압'),
+('狐', 'Hanja form of 호 (“fox”).'),
+('狐', 'Hanja form of 호 (“fox”). [affix]'),
+('狐', '여우'),
+('狐', '여우 호'),
+('狐', '호'),
+('狒', 'bi'),
+('狒', 'pi'),
+('狒', '비'),
+('狒', '비비 비'),
+('狗', 'Hanja form of 구 (“dog”).'),
+('狗', '개'),
+('狗', '개 구'),
+('狗', '구'),
+('狙', ' 살필 저'),
+('狙', ' 엿볼 저'),
+('狙', 'Hanja form of 저 (“monkey”).'),
+('狙', 'Hanja form of 저 (“to peek”).'),
+('狙', '엿보다'),
+('狙', '엿볼'),
+('狙', '원숭이'),
+('狙', '원숭이 저'),
+('狙', '원숭이 처'),
+('狙', '저'),
+('狡', 'gyo'),
+('狡', 'kyo'),
+('狡', '교'),
+('狡', '교활할 교'),
+('狢', 'badger'),
+('狢', 'hak'),
+('狢', '오소리 학'),
+('狢', '학'),
+('狥', 'sun'),
+('狥', 'swun'),
+('狥', '徇의 俗字'),
+('狥', '순'),
+('狨', '원숭이 융 '),
+('狨', '융'),
+('狩', ' 순행할 수'),
+('狩', '겨울사냥 수'),
+('狩', '수'),
+('独', '獨의 俗字'),
+('狴', ' 들개 폐'),
+('狴', ' 옥 폐'),
+('狴', 'p''ye'),
+('狴', 'phyey'),
+('狴', 'pye'),
+('狴', '짐승이름 폐'),
+('狴', '폐'),
+('狷', ' 조수할 견'),
+('狷', ' 편협할 견'),
+('狷', 'gyeon'),
+('狷', 'kyen'),
+('狷', 'kyŏn'),
+('狷', '견'),
+('狷', '고집스러울 견'),
+('狸', '貍와 同字'),
+('狹', 'hyeop'),
+('狹', 'hyep'),
+('狹', 'hyŏp'),
+('狹', '좁을 협'),
+('狹', '협'),
+('狺', 'eun'),
+('狺', 'un'),
+('狺', 'ŭn'),
+('狺', '뭇 개 짖는 소리 은'),
+('狺', '은'),
+('狻', 'san'),
+('狻', '사자 산'),
+('狻', '산'),
+('狼', 'Hanja form of 랑/낭 (“wolf”).'),
+('狼', '낭'),
+('狼', '랑'),
+('狼', '이리'),
+('狼', '이리 랑'),
+('狽', 'p''ae'),
+('狽', 'pae'),
+('狽', 'phay'),
+('狽', '이리 패'),
+('狽', '패'),
+('猉', 'gi'),
+('猉', 'ki'),
+('猉', '기'),
+('猊', 'ye'),
+('猊', 'yey'),
+('猊', '사자 예'),
+('猊', '예'),
+('猋', 'p''yo'),
+('猋', 'pyo'),
+('猋', '표'),
+('猋', '회오리바람: whirlwind'),
+('猑', 'big dog'),
+('猑', 'gon'),
+('猑', '곤'),
+('猓', 'gwa'),
+('猓', 'kwa'),
+('猓', '과'),
+('猓', '긴 꼬리 원숭이 과'),
+('猖', 'ch''ang'),
+('猖', 'chang'),
+('猖', '미쳐 날뛸 창'),
+('猖', '창'),
+('猗', ' 길 의'),
+('猗', ' 탄식할 의'),
+('猗', '부드러울 아'),
+('猗', '불 깐 개 의'),
+('猘', 'cey'),
+('猘', 'che'),
+('猘', 'je'),
+('猘', '미친개 제'),
+('猘', '제'),
+('猙', ' 짐승이름 쟁'),
+('猙', 'cayng'),
+('猙', 'chaeng'),
+('猙', 'jaeng'),
+('猙', '밉살스럴 쟁'),
+('猙', '쟁'),
+('猛', 'Hanja form of 맹 (“bold”).'),
+('猛', 'Hanja form of 맹 (“violent, savage, cruel”).'),
+('猛', '맹'),
+('猛', '사나울'),
+('猛', '사나울 맹'),
+('猛', '사납다'),
+('猜', ' 두려워할 시'),
+('猜', ' 사나울 시'),
+('猜', ' 시기할 시'),
+('猜', 'Hanja form of 시 (“jealousy”).'),
+('猜', '시'),
+('猜', '시기하다'),
+('猜', '시기할'),
+('猜', '의심낼 시'),
+('猝', '갑자기 졸'),
+('猝', '졸'),
+('猠', 'cen'),
+('猠', 'chŏn'),
+('猠', 'goat'),
+('猠', 'jeon'),
+('猠', '전'),
+('猢', 'ho'),
+('猢', '원숭이 호'),
+('猢', '호'),
+('猥', ' 개 새끼 셋 낳을 외'),
+('猥', ' 굽을 외'),
+('猥', ' 섞일 외'),
+('猥', '더러울 외'),
+('猥', '외'),
+('猧', 'wa'),
+('猧', '와'),
+('猧', '와개 와 '),
+('猨', 'wen'),
+('猨', 'won'),
+('猨', 'wŏn'),
+('猨', '猿과 同字'),
+('猨', '원'),
+('猩', '성'),
+('猩', '성성이 성'),
+('猪', '豬의 俗字'),
+('猫', 'Hanja form of 묘 (“cat”).'),
+('猫', '고양이'),
+('猫', '고양이 묘'),
+('猫', '묘'),
+('献', '獻의 俗字'),
+('猱', 'monkey'),
+('猱', '노'),
+('猱', '못할 노'),
+('猴', 'monkey, macaque'),
+('猴', '원숭이 후'),
+('猴', '후'),
+('猶', ' 같을 유'),
+('猶', ' 오히려 유'),
+('猶', '어미 원숭이 유'),
+('猶', '유'),
+('猷', ' 그릴 유'),
+('猷', ' 옳을 유'),
+('猷', ' 탄식할 유'),
+('猷', '꾀 유'),
+('猷', '유'),
+('猾', 'crafty, cunning, shrewd'),
+('猾', 'deceitful'),
+('猾', 'hwal'),
+('猾', '교활할 활'),
+('猾', '활'),
+('猿', ' 잔나비 원'),
+('猿', 'Hanja form of 원 (“ape”).'),
+('猿', '원'),
+('猿', '원숭이'),
+('猿', '원숭이 원'),
+('獃', 'ae'),
+('獃', 'ay'),
+('獃', '애'),
+('獃', '어리석을 애'),
+('獄', '감옥 옥'),
+('獄', '옥'),
+('獅', 'Hanja form of 사 (“lion”).'),
+('獅', '사'),
+('獅', '사자'),
+('獅', '사자 사'),
+('獎', 'Alternative form of 奬'),
+('獎', '장'),
+('獐', 'roe deer'),
+('獐', '노루'),
+('獐', '노루 장'),
+('獐', '장'),
+('獒', 'o'),
+('獒', '사나운 개 오'),
+('獒', '오'),
+('獗', 'gwol'),
+('獗', 'kwel'),
+('獗', 'kwŏl'),
+('獗', '궐'),
+('獗', '도둑 일어날 궐'),
+('獘', ' 엎드러질 폐'),
+('獘', ' 죽을 폐'),
+('獘', ' 폐단 폐'),
+('獘', 'p''ye'),
+('獘', 'phyey'),
+('獘', 'pye'),
+('獘', '곤할 폐'),
+('獘', '폐'),
+('獜', '튼튼할 린 '),
+('獠', '밤사냥 료'),
+('獣', '獸와 同字'),
+('獤', 'Hanja form of 돈 (“hide of a marten”).'),
+('獤', '돈'),
+('獤', '돈피'),
+('獤', '돈피 돈 '),
+('獧', 'gyeon'),
+('獧', 'kyen'),
+('獧', 'kyŏn'),
+('獧', 'obstinacy'),
+('獧', 'stubbornness'),
+('獧', '견'),
+('獨', 'Hanja form of 독 (“alone”).'),
+('獨', 'Hanja form of 독 (“alone”). [affix]'),
+('獨', '독'),
+('獨', '홀로'),
+('獨', '홀로 독'),
+('獩', 'ye'),
+('獩', 'yey'),
+('獩', '민족이름 예 '),
+('獩', '예'),
+('獪', ' 교활할 쾌'),
+('獪', '간교할 쾌'),
+('獪', '교활할 회'),
+('獫', '험'),
+('獫', '험윤 오랑캐 험'),
+('獬', ' 해갓 해'),
+('獬', 'hae'),
+('獬', 'hay'),
+('獬', '신통한 양 해'),
+('獬', '해'),
+('獮', '선'),
+('獮', '죽이다'),
+('獮', '죽일'),
+('獯', 'hun'),
+('獯', 'hwun'),
+('獯', '오랑캐 이름 훈'),
+('獯', '훈'),
+('獰', ' 삽살개 털 녕'),
+('獰', ' 영악할 녕'),
+('獰', 'Hanja form of 녕/영 (“ferocious; hideous”).'),
+('獰', '녕'),
+('獰', '모질'),
+('獰', '모질 녕'),
+('獰', '모질다'),
+('獰', '영'),
+('獱', 'bin'),
+('獱', 'pin'),
+('獱', '빈'),
+('獱', '수달: otter'),
+('獲', '낙심할 확'),
+('獲', '얻을 획'),
+('獵', 'Hanja form of 렵/엽 (“to hunt”).'),
+('獵', '렵'),
+('獵', '사냥'),
+('獵', '사냥 렵'),
+('獵', '엽'),
+('獷', 'gwang'),
+('獷', 'kwang'),
+('獷', '광'),
+('獷', '사나울 광'),
+('獸', 'su'),
+('獸', 'swu'),
+('獸', '수'),
+('獸', '짐승 수'),
+('獺', 'Hanja form of 달 (“otter”).'),
+('獺', '달'),
+('獺', '수달'),
+('獺', '수달 달'),
+('獺', '수달 찰'),
+('獻', ' 어진이 헌'),
+('獻', ' 음식 헌'),
+('獻', '바칠 헌'),
+('獻', '술통 사'),
+('獼', 'mi'),
+('獼', 'monkey, macaque'),
+('獼', '미'),
+('獼', '원숭이 미'),
+('玁', '獫과 同字'),
+('玁', '오랑캐 이름'),
+('玁', '험'),
+('玃', 'hwak'),
+('玃', '원숭이: ape'),
+('玃', '확'),
+('玄', ' 검붉을 현'),
+('玄', ' 고요할 현'),
+('玄', ' 아득할 현'),
+('玄', ' 하늘 현'),
+('玄', 'hyen'),
+('玄', 'hyeon'),
+('玄', 'hyŏn'),
+('玄', '검을 현'),
+('玄', '현'),
+('玆', 'ca'),
+('玆', 'cha'),
+('玆', 'ja'),
+('玆', '이 자'),
+('玆', '자'),
+('率', ' 공경할 솔'),
+('率', ' 대강 솔'),
+('率', ' 뱀 이름 솔'),
+('率', ' 쓸 솔'),
+('率', ' 좇을 솔'),
+('率', 'Alternative form of 帥 (“Hanja form of 수 (“commander”).”)'),
+('率', 'Hanja form of 률/율 (“rate, ratio”).'),
+('率', 'Hanja form of 솔 (“frank; straightforward”).'),
+('率', 'Hanja form of 솔 (“to lead”).'),
+('率', '거느리다'),
+('率', '거느릴'),
+('率', '거느릴 률'),
+('率', '거느릴 솔'),
+('率', '률'),
+('率', '비율'),
+('率', '솔'),
+('率', '수'),
+('率', '우두머리'),
+('率', '율'),
+('玈', '검을 로'),
+('玉', ' 사랑할 옥'),
+('玉', ' 이룰 옥'),
+('玉', 'Hanja form of 옥 (“jade”). See there for further compounds.'),
+('玉', '구슬'),
+('玉', '구슬 옥'),
+('玉', '옥'),
+('玊', '구슬'),
+('玊', '숙'),
+('玊', '옥'),
+('玊', '옥 다듬는 장인'),
+('王', ' 할아버지 왕'),
+('王', 'Hanja form of 왕 (“king; monarch”).'),
+('王', '왕'),
+('王', '임금'),
+('王', '임금 왕'),
+('玎', 'ceng'),
+('玎', 'chŏng'),
+('玎', 'jeong'),
+('玎', '옥소리 정'),
+('玎', '정'),
+('玔', 'ch''ŏn'),
+('玔', 'chen'),
+('玔', 'cheon'),
+('玔', '옥고리 천'),
+('玔', '천'),
+('玕', 'gan'),
+('玕', 'kan'),
+('玕', '간'),
+('玕', '옥돌 간'),
+('玖', 'gu'),
+('玖', 'ku'),
+('玖', 'kwu'),
+('玖', '구'),
+('玖', '옥 다음가는 돌 구'),
+('玗', ' 우기나무 우'),
+('玗', 'jade'),
+('玗', '옥돌 우'),
+('玗', '우'),
+('玘', 'gi'),
+('玘', 'ki'),
+('玘', '기'),
+('玘', '패옥 기'),
+('玙', 'Hanja form of 여 (“jade”).'),
+('玙', 'ye'),
+('玙', 'yeo'),
+('玙', 'yŏ'),
+('玙', '여'),
+('玞', 'bu'),
+('玞', 'pu'),
+('玞', '부'),
+('玞', '옥돌 부'),
+('玟', '민'),
+('玟', '옥돌 민'),
+('玠', 'gae'),
+('玠', 'kae'),
+('玠', 'kay'),
+('玠', '개'),
+('玠', '큰 서옥 개'),
+('玦', ' 활 깍지 결'),
+('玦', 'gyeol'),
+('玦', 'jade ring'),
+('玦', 'kyel'),
+('玦', 'kyŏl'),
+('玦', '결'),
+('玦', '옥패 결'),
+('玧', '귀막이 구슬 윤'),
+('玧', '윤'),
+('玨', '珏의 古字'),
+('玩', ' 보배 완'),
+('玩', 'Hanja form of 완 (“play”).'),
+('玩', '완'),
+('玩', '즐기다'),
+('玩', '즐길'),
+('玩', '희롱할 완'),
+('玫', '매'),
+('玫', '매괴 매'),
+('玭', 'bin'),
+('玭', 'pin'),
+('玭', '구슬 이름 빈 '),
+('玭', '빈'),
+('玲', 'Hanja form of 령/영 (“mainly used in personal names”).'),
+('玲', '령'),
+('玲', '영'),
+('玲', '옥소리'),
+('玲', '옥이름 령'),
+('玳', 'dae'),
+('玳', 'tae'),
+('玳', 'tay'),
+('玳', '대'),
+('玳', '대모(바다거북) 대'),
+('玷', ' 흠각 점'),
+('玷', 'cem'),
+('玷', 'chŏm'),
+('玷', 'jeom'),
+('玷', '옥의 티 점'),
+('玷', '점'),
+('玹', 'hyen'),
+('玹', 'hyeon'),
+('玹', 'hyŏn'),
+('玹', '현'),
+('玻', ' 유리옥 파'),
+('玻', 'p''a'),
+('玻', 'pa'),
+('玻', 'pha'),
+('玻', '파'),
+('玻', '파려옥 파'),
+('珀', 'bak'),
+('珀', 'pak'),
+('珀', '박'),
+('珀', '호박 박'),
+('珂', 'ga'),
+('珂', 'ka'),
+('珂', '가'),
+('珂', '옥 이름 가'),
+('珆', 'i'),
+('珆', '이'),
+('珈', 'ga'),
+('珈', 'ka'),
+('珈', '가'),
+('珈', '머리꾸미개 가'),
+('珉', 'min'),
+('珉', 'stone resembling jade'),
+('珉', '민'),
+('珉', '아름다운돌 민'),
+('珊', '산'),
+('珊', '산호 산'),
+('珌', 'p''il'),
+('珌', 'phil'),
+('珌', 'pil'),
+('珌', '칼 장식 옥 필'),
+('珌', '필'),
+('珍', '보배'),
+('珍', '보배 진'),
+('珍', '진'),
+('珏', '쌍옥 각'),
+('珏', '쌍옥 곡'),
+('珒', 'chin'),
+('珒', 'cin'),
+('珒', 'jin'),
+('珒', '옥 이름 진 '),
+('珒', '진'),
+('珖', 'gwang'),
+('珖', 'kwang'),
+('珖', '광'),
+('珖', '옥피리 광'),
+('珙', 'gong'),
+('珙', 'kong'),
+('珙', '공'),
+('珙', '큰 옥 공'),
+('珝', 'hu'),
+('珝', 'hwu'),
+('珝', '옥 이름 후 '),
+('珝', '후'),
+('珞', '구슬 목걸이 락'),
+('珠', 'bead'),
+('珠', 'pearl, gem, jewel'),
+('珠', '구슬'),
+('珠', '구슬 주'),
+('珠', '주'),
+('珢', '부르터 삐어진 흔적 있는 옥 간'),
+('珢', '옥돌 은'),
+('珣', ' 옥 이름 순'),
+('珣', 'sun'),
+('珣', 'swun'),
+('珣', '순'),
+('珣', '옥그릇 순'),
+('珤', 'bo'),
+('珤', 'po'),
+('珤', '寶의 古字'),
+('珤', '보'),
+('珥', ' 귀고리 이'),
+('珥', ' 해무리 이'),
+('珥', 'earring'),
+('珥', 'i'),
+('珥', '귀막이 옥 이'),
+('珥', '이'),
+('珦', 'hyang'),
+('珦', '향'),
+('珩', ' 갓끈 형'),
+('珩', 'a hat string (tied under the chin)'),
+('珩', 'hyeng'),
+('珩', 'hyeong'),
+('珩', 'hyŏng'),
+('珩', 'ornaments'),
+('珩', 'the top gem of the pendants'),
+('珩', '노리개 형'),
+('珩', '형'),
+('珪', 'gyu'),
+('珪', 'kyu'),
+('珪', '圭와 同字'),
+('珪', '규'),
+('珫', 'ch''ung'),
+('珫', 'chung'),
+('珫', 'chwung'),
+('珫', '충'),
+('班', 'Hanja form of 반 (“group; class”).'),
+('班', '나눌'),
+('班', '나눌 반'),
+('班', '반'),
+('珮', ' 찰 패'),
+('珮', '노리개 패'),
+('珮', '패'),
+('珵', ' 패옥 정 '),
+('珵', 'ceng'),
+('珵', 'chŏng'),
+('珵', 'jeong'),
+('珵', '노리개 정'),
+('珵', '정'),
+('珷', '무'),
+('珷', '옥돌 무'),
+('珹', 'seng'),
+('珹', 'seong'),
+('珹', 'sŏng'),
+('珹', '성'),
+('珽', 'ceng'),
+('珽', 'chŏng'),
+('珽', 'jeong'),
+('珽', '옥 이름 정'),
+('珽', '정'),
+('現', ' 옥빛 현'),
+('現', ' 지금 현'),
+('現', 'Hanja form of 현 (“appear”).'),
+('現', 'Hanja form of 현 (“current; present; existing”).'),
+('現', '나타나다'),
+('現', '나타날'),
+('現', '나타날 현'),
+('現', '현'),
+('琁', 'sen'),
+('琁', 'seon'),
+('琁', 'sŏn'),
+('琁', '선'),
+('琁', '옥 선'),
+('球', 'Hanja form of 구 (“ball”).'),
+('球', '공'),
+('球', '구'),
+('球', '옥경쇠 구'),
+('琄', 'hyen'),
+('琄', 'hyeon'),
+('琄', 'hyŏn'),
+('琄', '현'),
+('琅', '옥 이름 랑'),
+('理', 'Hanja form of 리/이 (“reason; logic”).'),
+('理', '다스리다'),
+('理', '다스릴'),
+('理', '다스릴 리'),
+('理', '리'),
+('理', '이'),
+('琇', ' 옥돌 수'),
+('琇', 'su'),
+('琇', 'swu'),
+('琇', '귀막이 수'),
+('琇', '수'),
+('琉', 'Hanja form of 류/유 (“glass”).'),
+('琉', '류'),
+('琉', '유'),
+('琉', '유리'),
+('琉', '유리 류'),
+('琎', 'chin'),
+('琎', 'cin'),
+('琎', 'jin'),
+('琎', '옥돌 진 '),
+('琎', '진'),
+('琓', 'wan'),
+('琓', '완'),
+('琛', 'ch''im'),
+('琛', 'chim'),
+('琛', '보배 침'),
+('琛', '침'),
+('琠', 'cen'),
+('琠', 'chŏn'),
+('琠', 'jeon'),
+('琠', '전'),
+('琡', 'su'),
+('琡', 'swu'),
+('琡', '수'),
+('琢', ' 가릴 탁'),
+('琢', ' 옥 다듬을 탁'),
+('琢', '다듬다'),
+('琢', '다듬을'),
+('琢', '옥 쪼을 탁'),
+('琢', '탁'),
+('琤', 'cayng'),
+('琤', 'chaeng'),
+('琤', 'jaeng'),
+('琤', '옥소리 쟁'),
+('琤', '쟁'),
+('琥', 'ho'),
+('琥', '호'),
+('琥', '호박 호'),
+('琦', 'gi'),
+('琦', 'ki'),
+('琦', 'rare'),
+('琦', 'strange, odd'),
+('琦', 'type of jade'),
+('琦', '기'),
+('琦', '옥 이름 기'),
+('琨', 'gon'),
+('琨', 'kon'),
+('琨', 'precious stone, gem'),
+('琨', '곤'),
+('琨', '옥돌 곤'),
+('琪', 'fine jade'),
+('琪', 'gi'),
+('琪', 'ki'),
+('琪', '기'),
+('琪', '옥 기'),
+('琫', '봉'),
+('琫', '칼집 장식 봉'),
+('琬', ' 아름다운 옥 완'),
+('琬', 'wan'),
+('琬', '보석 완'),
+('琬', '완'),
+('琮', 'chong'),
+('琮', 'cong'),
+('琮', 'jong'),
+('琮', 'octagonal piece of jade with hole in middle'),
+('琮', '옥홀 종'),
+('琮', '종'),
+('琯', 'gwan'),
+('琯', 'jade tube used as an instrument'),
+('琯', 'kwan'),
+('琯', '관'),
+('琯', '옥피리 관'),
+('琰', ' 비취옥 염'),
+('琰', 'name of a beautiful jade'),
+('琰', '아름다운 옥 염'),
+('琰', '염'),
+('琲', '구슬 꿰미 배'),
+('琲', '배'),
+('琳', '아름다운 옥 림'),
+('琴', 'Hanja form of 금 (“geomungo, a six-stringed Korean zither”).'),
+('琴', '거문고'),
+('琴', '거문고 금'),
+('琴', '금'),
+('琵', 'bi'),
+('琵', 'pi'),
+('琵', '비'),
+('琵', '비파 비'),
+('琶', 'p''a'),
+('琶', 'pa'),
+('琶', 'pha'),
+('琶', '비파 파'),
+('琶', '파'),
+('琸', 't''ak'),
+('琸', 'tak'),
+('琸', 'thak'),
+('琸', '사람이름 탁 '),
+('琸', '탁'),
+('琺', 'beop'),
+('琺', 'pep'),
+('琺', 'pŏp'),
+('琺', '법'),
+('琺', '법랑 법'),
+('琿', 'beautiful jade, gem'),
+('琿', 'heun'),
+('琿', 'hun'),
+('琿', 'hŭn'),
+('琿', '흔'),
+('瑀', 'u'),
+('瑀', 'wu'),
+('瑀', '옥돌 우'),
+('瑀', '우'),
+('瑁', '서옥 모'),
+('瑃', 'ch''un'),
+('瑃', 'chun'),
+('瑃', 'chwun'),
+('瑃', '춘'),
+('瑄', 'sen'),
+('瑄', 'seon'),
+('瑄', 'sŏn'),
+('瑄', '도리옥 선'),
+('瑄', '선'),
+('瑅', 'cey'),
+('瑅', 'che'),
+('瑅', 'je'),
+('瑅', '제'),
+('瑅', '제당 제 '),
+('瑆', 'seng'),
+('瑆', 'seong'),
+('瑆', 'sŏng'),
+('瑆', '성'),
+('瑋', ' 노리개 위'),
+('瑋', 'wi'),
+('瑋', '위'),
+('瑋', '위옥 위'),
+('瑎', 'hae'),
+('瑎', 'hay'),
+('瑎', '해'),
+('瑕', 'ha'),
+('瑕', '티 하'),
+('瑕', '하'),
+('瑗', ' 구멍 큰 둥근 옥 원'),
+('瑗', 'gem, jade'),
+('瑗', 'wen'),
+('瑗', 'won'),
+('瑗', 'wŏn'),
+('瑗', '도리옥 원'),
+('瑗', '원'),
+('瑙', 'no'),
+('瑙', '노'),
+('瑙', '마노 노'),
+('瑚', '산호'),
+('瑚', '산호 호'),
+('瑚', '호'),
+('瑛', ' 수정 영'),
+('瑛', '영'),
+('瑛', '옥빛 영'),
+('瑜', 'beautiful jade'),
+('瑜', '아름다운 옥'),
+('瑜', '아름다운 옥 유'),
+('瑜', '유'),
+('瑝', 'hwang'),
+('瑝', '옥 소리 황 '),
+('瑝', '황'),
+('瑞', 'Hanja form of 서 (“auspicious; lucky”).'),
+('瑞', '상서 서'),
+('瑞', '상서로울'),
+('瑞', '상서롭다'),
+('瑞', '서'),
+('瑟', ' 거문고 슬'),
+('瑟', ' 깨끗한체할 슬'),
+('瑟', ' 바람소리 슬'),
+('瑟', 'seul'),
+('瑟', 'sul'),
+('瑟', 'sŭl'),
+('瑟', '비파 슬'),
+('瑟', '슬'),
+('瑠', '琉와 同字'),
+('瑠', '류'),
+('瑠', '맑은 유리'),
+('瑠', '유'),
+('瑢', 'yong'),
+('瑢', '용'),
+('瑢', '패옥소리 용 '),
+('瑣', ' 가늘 쇄'),
+('瑣', ' 대궐문 아로새길 쇄'),
+('瑣', ' 좀스러울 쇄'),
+('瑣', 'swae'),
+('瑣', 'sway'),
+('瑣', '쇄'),
+('瑣', '옥가루 쇄'),
+('瑤', ' 못 이름 요'),
+('瑤', 'yo'),
+('瑤', '아름다운 옥 요'),
+('瑤', '요'),
+('瑥', 'on'),
+('瑥', '사람이름 온 '),
+('瑥', '온'),
+('瑨', 'chin'),
+('瑨', 'cin'),
+('瑨', 'jin'),
+('瑨', '아름다운 돌 진'),
+('瑨', '진'),
+('瑩', ' 밝을 영'),
+('瑩', 'bright, lustrous'),
+('瑩', 'lustre of gems'),
+('瑩', '귀막이 옥 영'),
+('瑩', '밝을 형'),
+('瑩', '영'),
+('瑪', 'ma'),
+('瑪', '마'),
+('瑪', '마노 마'),
+('瑭', '당'),
+('瑭', '옥이름 당'),
+('瑯', '고을 이름 랑'),
+('瑰', 'extraordinary, fabulous'),
+('瑰', 'goe'),
+('瑰', 'koe'),
+('瑰', 'koy'),
+('瑰', 'rose'),
+('瑰', '괴'),
+('瑰', '슬이름 괴'),
+('瑱', ' 옥이름 전'),
+('瑱', 'earmuffs'),
+('瑱', '귀막이옥 전'),
+('瑱', '전'),
+('瑲', 'ch''ang'),
+('瑲', 'chang'),
+('瑲', '옥 소리 창'),
+('瑲', '창'),
+('瑳', 'ch''a'),
+('瑳', 'cha'),
+('瑳', '깨끗할 차'),
+('瑳', '차'),
+('瑶', 'yo'),
+('瑶', '瑤와 同字'),
+('瑶', '요'),
+('瑽', '종'),
+('瑽', '패옥소리 종'),
+('瑾', '근'),
+('瑾', '붉은옥 근'),
+('璀', ' 구슬 주렁주렁 달릴 최'),
+('璀', 'ch''oe'),
+('璀', 'choe'),
+('璀', 'choy'),
+('璀', '옥빛 찬란할 최'),
+('璀', '최'),
+('璂', 'gi'),
+('璂', 'ki'),
+('璂', '기'),
+('璂', '피변 꾸미개 기'),
+('璃', 'Hanja form of 리/이 (“glassy”).'),
+('璃', '리'),
+('璃', '유리'),
+('璃', '유리 리'),
+('璃', '이'),
+('璆', 'beautiful jade'),
+('璆', 'tinkle'),
+('璆', '구'),
+('璆', '아름다운 옥(玉)'),
+('璆', '옥경쇠 구'),
+('璇', 'sen'),
+('璇', 'seon'),
+('璇', 'sŏn'),
+('璇', '선'),
+('璇', '아름다운옥 선'),
+('璉', '련'),
+('璉', '연'),
+('璉', '호련'),
+('璉', '호련 련'),
+('璊', '문'),
+('璊', '붉은 옥 문'),
+('璋', 'cang'),
+('璋', 'chang'),
+('璋', 'jang'),
+('璋', '끝의 반을 깎아 뾰족하게 한 홀 장'),
+('璋', '장'),
+('璘', 'emerald'),
+('璘', 'gloss'),
+('璘', 'luster of jade'),
+('璘', '린'),
+('璘', '옥빛 린'),
+('璘', '인'),
+('璜', 'a semicircular jade ornament used as a pendant'),
+('璜', 'hwang'),
+('璜', '서옥 황'),
+('璜', '황'),
+('璝', 'goe'),
+('璝', 'koe'),
+('璝', 'koy'),
+('璝', '괴'),
+('璝', '옥돌 괴 '),
+('璞', '박'),
+('璞', '옥덩어리 박'),
+('璞', '옥돌'),
+('璟', 'gyeong'),
+('璟', 'kyeng'),
+('璟', 'kyŏng'),
+('璟', '경'),
+('璟', '옥 빛 경'),
+('璡', 'chin'),
+('璡', 'cin'),
+('璡', 'jin'),
+('璡', '옥돌 진'),
+('璡', '진'),
+('璢', '류'),
+('璢', '유'),
+('璢', '유리'),
+('璣', 'gi'),
+('璣', 'ki'),
+('璣', '구슬 기'),
+('璣', '기'),
+('璥', 'gyeong'),
+('璥', 'kyeng'),
+('璥', 'kyŏng'),
+('璥', '경'),
+('璥', '경옥 경'),
+('璧', 'Hanja form of 벽 (“jade”).'),
+('璧', '구슬'),
+('璧', '동근 옥 벽'),
+('璧', '벽'),
+('璨', 'ch''an'),
+('璨', 'chan'),
+('璨', '빛날 찬'),
+('璨', '찬'),
+('璪', '면루관 드림 옥 조'),
+('璪', '조'),
+('璫', 'dang'),
+('璫', 'jade earrings'),
+('璫', 'tang'),
+('璫', '귀고리 당'),
+('璫', '당'),
+('環', 'jade ring or bracelet'),
+('環', 'ring'),
+('環', '고리 환'),
+('環', '환'),
+('璲', ' 패옥 수'),
+('璲', 'su'),
+('璲', 'swu'),
+('璲', '서옥 수'),
+('璲', '수'),
+('璵', 'Hanja form of 여 (“jade”).'),
+('璵', 'ye'),
+('璵', 'yeo'),
+('璵', 'yŏ'),
+('璵', '보배옥 여'),
+('璵', '여'),
+('璹', 'su'),
+('璹', 'swu'),
+('璹', '수'),
+('璽', 'Hanja form of 새 (“royal seal”).'),
+('璽', 'Hanja form of 새 (“royal seal”). [noun]'),
+('璽', '도장'),
+('璽', '도장 새'),
+('璽', '새'),
+('璿', 'sen'),
+('璿', 'seon'),
+('璿', 'sŏn'),
+('璿', '선'),
+('璿', '아름다운옥 선'),
+('瓆', 'chil'),
+('瓆', 'cil'),
+('瓆', 'jil'),
+('瓆', '사람 이름 질 '),
+('瓆', '질'),
+('瓊', 'gyeong'),
+('瓊', 'kyeng'),
+('瓊', 'kyŏng'),
+('瓊', '경'),
+('瓊', '옥 경'),
+('瓏', '옥소리 룡'),
+('瓔', ' 구슬 목걸이 영'),
+('瓔', 'yeng'),
+('瓔', 'yeong'),
+('瓔', 'yŏng'),
+('瓔', '영'),
+('瓔', '옥돌 영'),
+('瓘', 'gwan'),
+('瓘', 'kwan'),
+('瓘', '관'),
+('瓘', '옥 이름 관'),
+('瓚', 'ceremonial libation cup'),
+('瓚', '제기'),
+('瓚', '제기 찬'),
+('瓚', '찬'),
+('瓛', 'hwan'),
+('瓛', '옥홀 환'),
+('瓛', '환'),
+('瓜', 'cucumber'),
+('瓜', '과'),
+('瓜', '오이'),
+('瓜', '오이 과'),
+('瓠', ' 단지 호'),
+('瓠', 'ho'),
+('瓠', '표주박 호'),
+('瓠', '호'),
+('瓢', 'Wooden ladle. They cut a dried gourd in half, and use each as a ladle.'),
+('瓢', '표'),
+('瓢', '표주박 표'),
+('瓣', ' 꽃잎 판'),
+('瓣', ' 실과씨 판'),
+('瓣', '외씨 판'),
+('瓣', '판'),
+('瓦', ' 기와 와'),
+('瓦', 'Hanja form of 와 (“roof tile”).'),
+('瓦', '기와'),
+('瓦', '와'),
+('瓦', '질그릇 와'),
+('瓩', '천'),
+('瓩', '킬로그램 천'),
+('瓮', 'ong'),
+('瓮', '옹'),
+('瓮', '항아리 옹'),
+('瓲', 't''on'),
+('瓲', 'thon'),
+('瓲', 'ton'),
+('瓲', '톤'),
+('瓶', 'Hanja form of 병 (“bottle; jar”).'),
+('瓶', '甁의 俗字'),
+('瓶', '병'),
+('瓷', '오지그릇 자'),
+('瓷', '자'),
+('瓿', 'bu'),
+('瓿', 'pu'),
+('瓿', '단지: jar, pot'),
+('瓿', '부'),
+('甁', 'Hanja form of 병 (“bottle; jar”).'),
+('甁', '병'),
+('甁', '병 병'),
+('甃', 'ch''u'),
+('甃', 'chu'),
+('甃', 'chwu'),
+('甃', '우물 벽돌 추'),
+('甃', '추'),
+('甄', ' 면할 견'),
+('甄', ' 밝을 견'),
+('甄', ' 살필 견'),
+('甄', ' 진 이름 견'),
+('甄', ' 표시할 견'),
+('甄', '질그릇 견'),
+('甄', '질그릇 구울 진'),
+('甌', 'bowl, cup'),
+('甌', 'small tray'),
+('甌', '구'),
+('甌', '사발 구'),
+('甍', 'meng'),
+('甍', 'meong'),
+('甍', 'mŏng'),
+('甍', '멍'),
+('甎', ' 기와 전'),
+('甎', 'cen'),
+('甎', 'chŏn'),
+('甎', 'jeon'),
+('甎', '벽돌 전'),
+('甎', '전'),
+('甑', 'chŭng'),
+('甑', 'cung'),
+('甑', 'jeung'),
+('甑', '시루 증'),
+('甑', '증'),
+('甓', 'byeok'),
+('甓', 'pyek'),
+('甓', 'pyŏk'),
+('甓', '벽'),
+('甓', '벽돌 벽'),
+('甕', ' 물장군 옹'),
+('甕', 'ong'),
+('甕', '옹'),
+('甕', '항아리 옹'),
+('甘', ' 달게 여길 감'),
+('甘', 'gam'),
+('甘', 'kam'),
+('甘', '감'),
+('甘', '달 감'),
+('甚', ' 무엇 심'),
+('甚', 'considerably'),
+('甚', 'great extent'),
+('甚', '심'),
+('甚', '심할'),
+('甚', '심할 심'),
+('甛', 'ch''ŏm'),
+('甛', 'chem'),
+('甛', 'cheom'),
+('甛', '달 첨'),
+('甛', '첨'),
+('甜', 'Hanja form of 첨 (“sweet”).'),
+('甜', '달'),
+('甜', '달 첨'),
+('甜', '첨'),
+('甞', 'sang'),
+('甞', '맛볼 상'),
+('甞', '상'),
+('生', 'Hanja form of 생 (“of life; to be born”).'),
+('生', 'Hanja form of 생 (“raw; uncooked”).'),
+('生', 'Hanja form of 생 (“to produce”).'),
+('生', '나다'),
+('生', '날'),
+('生', '날 생'),
+('生', '생'),
+('產', 'Alternative form of 産 (“Hanja form of 산 (“born”).”)'),
+('產', '産의 略字'),
+('產', '낳다'),
+('產', '낳을'),
+('產', '산'),
+('産', 'Hanja form of 산 (“being born; birth”).'),
+('産', 'Hanja form of 산 (“product”).'),
+('産', 'Hanja form of 산 (“property”).'),
+('産', '낳다'),
+('産', '낳을'),
+('産', '낳을 산'),
+('産', '산'),
+('甥', '생'),
+('甥', '생질'),
+('甥', '생질 생'),
+('甦', ' 숨 쉴 소'),
+('甦', '깨어날 소'),
+('甦', '소'),
+('用', ' 재물 용'),
+('用', ' 통할 용'),
+('用', 'Hanja form of 용 (“use”).'),
+('用', '쓰다'),
+('用', '쓸'),
+('用', '쓸 용'),
+('用', '용'),
+('甫', 'bo'),
+('甫', 'po'),
+('甫', '보'),
+('甫', '클 보'),
+('甬', ' 곡식 셈하는 단위 휘 용'),
+('甬', ' 골목길 용'),
+('甬', ' 쇠북 꼭지 용'),
+('甬', '물 솟아 오를 용'),
+('甬', '양쪽에 담을 쌓은 길'),
+('甬', '용'),
+('甯', '편안할 녕'),
+('田', ' 논 전'),
+('田', ' 사냥할 전'),
+('田', 'Hanja form of 전 (“A surname”).'),
+('田', 'Hanja form of 전 (“cultivated patch of land”).'),
+('田', 'Hanja form of 전 (“cultivated patch of land”). [noun]'),
+('田', '밭'),
+('田', '밭 전'),
+('田', '전'),
+('由', ' 쓸 유'),
+('由', ' 지날 유'),
+('由', 'Hanja form of 유 (“cause; reason”).'),
+('由', '말미암을'),
+('由', '말미암을 유'),
+('由', '유'),
+('甲', ' 대궐 갑'),
+('甲', ' 떡잎 날 갑'),
+('甲', ' 법령 갑'),
+('甲', ' 비롯할 갑'),
+('甲', ' 첫째 천간 갑'),
+('甲', 'Hanja form of 갑 (“armor; shell”).'),
+('甲', 'Hanja form of 갑 (“the first of the ten heavenly stems; something A”).'),
+('甲', '갑'),
+('甲', '갑옷'),
+('甲', '갑옷 갑'),
+('甲', '첫째 천간(天干)'),
+('申', ' 거듭 신'),
+('申', ' 기지개켤 신'),
+('申', ' 아홉째 지지 신'),
+('申', ' 원숭이 신'),
+('申', 'Hanja form of 신 (“to extend; to stretch”).'),
+('申', '신'),
+('申', '펼 신'),
+('申', '펼치다'),
+('申', '펼칠'),
+('男', 'Hanja form of 남 (“man”).'),
+('男', '남'),
+('男', '사내'),
+('男', '사내 남'),
+('甸', ' 수레 승'),
+('甸', '경기 전'),
+('甸', '다스릴 승'),
+('甹', 'byeong'),
+('甹', 'pyeng'),
+('甹', 'pyŏng'),
+('甹', '병'),
+('町', ' 시가 정'),
+('町', ' 정보 정'),
+('町', 'A boundary.'),
+('町', 'A ridge between fields.'),
+('町', '밭 두덕 정'),
+('町', '밭두둑'),
+('町', '정'),
+('画', 'Alternative form of 畫'),
+('画', '畫의 略字'),
+('画', '그림'),
+('画', '그을'),
+('画', '긋다'),
+('画', '화'),
+('画', '획'),
+('甼', '정'),
+('甽', 'gyeon'),
+('甽', 'kyen'),
+('甽', 'kyŏn'),
+('甽', '畎의 古字'),
+('甽', '견'),
+('甾', 'an ancient pottery'),
+('甾', 'calamity'),
+('甾', 'chae'),
+('甾', 'jae'),
+('甾', 'pheasant'),
+('甾', '재'),
+('甿', '멍'),
+('畀', 'to give'),
+('畀', '비'),
+('畀', '줄 비'),
+('畇', '균'),
+('畇', '밭개간할 균'),
+('畊', 'gyeong'),
+('畊', 'kyeng'),
+('畊', 'kyŏng'),
+('畊', 'to plow; to cultivate'),
+('畊', '耕의 古字'),
+('畊', '경'),
+('畋', 'cen'),
+('畋', 'chŏn'),
+('畋', 'jeon'),
+('畋', '사냥할 전'),
+('畋', '전'),
+('界', 'Hanja form of 계 (“boundary”).'),
+('界', '계'),
+('界', '지경'),
+('界', '지경 계'),
+('畎', ' 산골 도랑 견'),
+('畎', 'gyeon'),
+('畎', 'kyen'),
+('畎', 'kyŏn'),
+('畎', '견'),
+('畎', '밭 도랑 견'),
+('畏', ' 겁낼 외'),
+('畏', '두려울 외'),
+('畏', '외'),
+('畐', 'bok'),
+('畐', 'pok'),
+('畐', '복'),
+('畑', ' 밭 전'),
+('畑', 'cen'),
+('畑', 'chŏn'),
+('畑', 'jeon'),
+('畑', '전'),
+('畑', '화전 전'),
+('畓', 'Hanja form of 답 (“rice paddy”).'),
+('畓', '논'),
+('畓', '논 답'),
+('畓', '답'),
+('畔', 'ban'),
+('畔', 'pan'),
+('畔', '반'),
+('畔', '지경 반'),
+('留', 'Hanja form of 류/유 (“stay”).'),
+('留', '류'),
+('留', '머무르다'),
+('留', '머무를'),
+('留', '머무를 류'),
+('留', '유'),
+('畚', 'bun'),
+('畚', 'pun'),
+('畚', '분'),
+('畚', '삼태기 분'),
+('畛', '두렁길 진'),
+('畛', '진'),
+('畜', ' 그칠 축'),
+('畜', ' 쌓을 축'),
+('畜', ' 용납할 휵'),
+('畜', '가축 축'),
+('畜', '기를 휵'),
+('畝', 'Hanja form of 무/묘 (“mu (Chinese unit of surface area)”).'),
+('畝', '묘'),
+('畝', '무'),
+('畝', '이랑'),
+('畝', '이랑 무'),
+('畟', 'ch''ŭk'),
+('畟', 'cheuk'),
+('畟', '측'),
+('畠', 'cen'),
+('畠', 'chŏn'),
+('畠', 'jeon'),
+('畠', '밭 전'),
+('畠', '전'),
+('畢', ' 고기 꿰 다는 나무 필'),
+('畢', ' 다할 필'),
+('畢', ' 책 필'),
+('畢', ' 토끼그물 필'),
+('畢', ' 편지 필'),
+('畢', 'p''il'),
+('畢', 'phil'),
+('畢', 'pil'),
+('畢', '마칠 필'),
+('畢', '필'),
+('畤', 'ch''i'),
+('畤', 'chi'),
+('畤', '제터 치'),
+('畤', '치'),
+('略', 'Hanja form of 략/약 (“approximately, roughly”).'),
+('略', 'Hanja form of 략/약 (“brief, concise”).'),
+('略', 'Hanja form of 략/약 (“outline”).'),
+('略', '간략하다'),
+('略', '간략할'),
+('略', '다스리다'),
+('略', '다스릴'),
+('略', '다스릴 략'),
+('略', '략'),
+('略', '약'),
+('畦', 'hyu'),
+('畦', 'sections in vegetable farm'),
+('畦', '밭두둑 휴'),
+('畦', '휴'),
+('畧', '略과 同字'),
+('番', ' 땅이름 반'),
+('番', ' 차례 반'),
+('番', 'Hanja form of 반 (“a placename”).'),
+('番', 'Hanja form of 반 (“a surname”).'),
+('番', 'Hanja form of 번 (“turn”).'),
+('番', 'Hanja form of 파 (“valiant”).'),
+('番', '갈마들 번'),
+('番', '갈아치울 반'),
+('番', '날래다'),
+('番', '날랠'),
+('番', '땅 이름'),
+('番', '반'),
+('番', '번'),
+('番', '차례(次例)'),
+('番', '파'),
+('畫', 'Alternative form of 劃 (“Hanja form of 획 (“to draw a line; to mark”).”)'),
+('畫', 'Hanja form of 화 (“picture; drawing; painting”).'),
+('畫', '그림'),
+('畫', '그림 화'),
+('畫', '그을'),
+('畫', '그을 획'),
+('畫', '긋다'),
+('畫', '화'),
+('畫', '획'),
+('畮', '畝의 正字 '),
+('畮', '무'),
+('畯', 'a farmer'),
+('畯', 'chun'),
+('畯', 'cwun'),
+('畯', 'jun'),
+('畯', '俊과 同字'),
+('畯', '준'),
+('異', ' 괴이할 이'),
+('異', ' 나눌 이'),
+('異', 'Hanja form of 이 (“different; unusual”).'),
+('異', 'Only used in certain placenames.'),
+('異', '다르다'),
+('異', '다를'),
+('異', '다를 이'),
+('異', '리'),
+('異', '이'),
+('畵', 'Alternative form of 畫 (“Hanja form of 화 (“picture; drawing; painting”).”)'),
+('畵', 'Alternative form of 畫 (“Hanja form of 획 (“to draw a line; to mark”).”)'),
+('畵', 'episode (in K-drama)'),
+('畵', '畫의 俗字'),
+('畵', '그림'),
+('畵', '그림 화'),
+('畵', '그을'),
+('畵', '긋다'),
+('畵', '화'),
+('畵', '획'),
+('當', 'Hanja form of 당 (“appropriate”).'),
+('當', '당'),
+('當', '마땅할'),
+('當', '마땅할 당'),
+('畸', 'gi'),
+('畸', 'ki'),
+('畸', '기'),
+('畸', '뙈기 밭 기'),
+('畺', 'border'),
+('畺', 'boundary'),
+('畺', 'country'),
+('畺', 'gang'),
+('畺', 'kang'),
+('畺', 'territory'),
+('畺', '疆과 同字'),
+('畺', '강'),
+('畿', 'Hanja form of 기 (“area near the capital”).'),
+('畿', '경기'),
+('畿', '경기 기'),
+('畿', '기'),
+('疆', ' 갈피 강'),
+('疆', ' 굳셀 강'),
+('疆', ' 변방 강'),
+('疆', 'gang'),
+('疆', 'kang'),
+('疆', '강'),
+('疆', '땅 경계 강'),
+('疇', 'Hanja form of 주 (“furrow”).'),
+('疇', '밭두둑 주'),
+('疇', '밭이랑'),
+('疇', '주'),
+('疈', '가를 벽 '),
+('疈', '벽'),
+('疊', ' 포갤 첩'),
+('疊', 'ch''ŏp'),
+('疊', 'cheop'),
+('疊', 'chep'),
+('疊', '거듭 첩'),
+('疊', '첩'),
+('疋', ' 끝 필'),
+('疋', '밭 소'),
+('疋', '짝 필'),
+('疌', 'Hanja form of 섭 (“Alternative form of 捷”).'),
+('疌', '섭'),
+('疎', ' 드물 소'),
+('疎', 'Alternative form of 疏'),
+('疎', '성기다'),
+('疎', '성길'),
+('疎', '성길 소'),
+('疎', '소'),
+('疏', ' 나눌 소'),
+('疏', ' 드물 소'),
+('疏', ' 멀 소'),
+('疏', ' 추할 소'),
+('疏', 'so'),
+('疏', '뚫릴 소'),
+('疏', '소'),
+('疑', ' 그럴듯할 의'),
+('疑', ' 두려워할 의'),
+('疑', '의심할 의'),
+('疑', '정할 응'),
+('疒', 'Hanja form of 녁/역 (“Kangxi radical for sickness”).'),
+('疒', '녁'),
+('疒', '병들'),
+('疒', '병들다'),
+('疒', '역'),
+('疔', 'ceng'),
+('疔', 'chŏng'),
+('疔', 'jeong'),
+('疔', '정'),
+('疔', '헌데 정'),
+('疙', 'heul'),
+('疙', 'hul'),
+('疙', 'hŭl'),
+('疙', '쥐부스럼 흘'),
+('疙', '흘'),
+('疚', 'gu'),
+('疚', 'ku'),
+('疚', 'kwu'),
+('疚', '구'),
+('疚', '오랜 병 구'),
+('疝', 'san'),
+('疝', '산'),
+('疝', '산증 산'),
+('疣', 'yu'),
+('疣', '유'),
+('疤', 'p''a'),
+('疤', 'pa'),
+('疤', 'pha'),
+('疤', '파'),
+('疤', '흉터 파'),
+('疥', 'gae'),
+('疥', 'kae'),
+('疥', 'kay'),
+('疥', 'scabies, itch'),
+('疥', '개'),
+('疥', '옴 개'),
+('疩', 'ch''wi'),
+('疩', 'chwi'),
+('疩', '취'),
+('疫', 'yek'),
+('疫', 'yeok'),
+('疫', 'yŏk'),
+('疫', '역'),
+('疫', '염병 역'),
+('疱', ' 부르틀 포'),
+('疱', 'p''o'),
+('疱', 'pho'),
+('疱', 'po'),
+('疱', '부풀 포'),
+('疱', '포'),
+('疲', ' 나른할 피'),
+('疲', 'p''i'),
+('疲', 'phi'),
+('疲', 'pi'),
+('疲', '피'),
+('疲', '피곤할 피'),
+('疳', ' 궤양 감'),
+('疳', ' 종기 아플 감'),
+('疳', ' 창병 감'),
+('疳', 'childhood diseases'),
+('疳', 'gam'),
+('疳', 'kam'),
+('疳', '감'),
+('疳', '감질병 감'),
+('疴', 'a'),
+('疴', '아'),
+('疴', '앓을 아'),
+('疵', 'ca'),
+('疵', 'cha'),
+('疵', 'ja'),
+('疵', '자'),
+('疵', '흠 자'),
+('疸', 'dal'),
+('疸', 'tal'),
+('疸', '달'),
+('疸', '황달 달'),
+('疹', 'chin'),
+('疹', 'cin'),
+('疹', 'jin'),
+('疹', '진'),
+('疹', '홍역 진'),
+('疼', 'dong'),
+('疼', 'tong'),
+('疼', '동'),
+('疼', '아플 동'),
+('疽', 'ce'),
+('疽', 'chŏ'),
+('疽', 'jeo'),
+('疽', '등창 저'),
+('疽', '저'),
+('疾', 'illness, disease, sickness'),
+('疾', 'to hate'),
+('疾', '병'),
+('疾', '병 질'),
+('疾', '질'),
+('痀', 'gu'),
+('痀', 'humpback'),
+('痀', 'ku'),
+('痀', 'kwu'),
+('痀', '곱사등이 구'),
+('痀', '구'),
+('痂', 'ga'),
+('痂', 'ka'),
+('痂', '가'),
+('痂', '헌데 딱지 가'),
+('痃', ' 적병 현'),
+('痃', 'hyen'),
+('痃', 'hyeon'),
+('痃', 'hyŏn'),
+('痃', '현'),
+('痃', '힘줄 당기는 병 현'),
+('病', 'Hanja form of 병 (“illness; disease”).'),
+('病', '병'),
+('病', '병 병'),
+('病', '병들'),
+('症', 'chŭng'),
+('症', 'cung'),
+('症', 'jeung'),
+('症', '증'),
+('症', '증세 증'),
+('痊', 'cen'),
+('痊', 'chŏn'),
+('痊', 'jeon'),
+('痊', '병 나을 전'),
+('痊', '전'),
+('痍', ' 다칠 이'),
+('痍', ' 흠집 이'),
+('痍', '상할 이'),
+('痍', '이'),
+('痎', ' 하루거리 해 '),
+('痎', 'hae'),
+('痎', 'hay'),
+('痎', '학질 해'),
+('痎', '해'),
+('痒', ' 옴 양'),
+('痒', 'yang'),
+('痒', '가려울 양'),
+('痒', '양'),
+('痓', ' 악할 치 '),
+('痓', 'ch''i'),
+('痓', 'chi'),
+('痓', '치'),
+('痓', '풍병 치'),
+('痔', 'ch''i'),
+('痔', 'chi'),
+('痔', '치'),
+('痔', '치질 치'),
+('痕', 'Hanja form of 흔 (“mark; trace”).'),
+('痕', 'Hanja form of 흔 (“scar”).'),
+('痕', '흉터 흔'),
+('痕', '흔'),
+('痕', '흔적'),
+('痘', 'Hanja form of 두 (“smallpox”).'),
+('痘', '두'),
+('痘', '마마 두'),
+('痘', '천연두(天然痘)'),
+('痙', 'gyeong'),
+('痙', 'kyeng'),
+('痙', 'kyŏng'),
+('痙', '경'),
+('痙', '심줄 땅길 경'),
+('痛', ' 몹시 통'),
+('痛', ' 상할 통'),
+('痛', ' 심할 통'),
+('痛', 'Hanja form of 통 (“pain”).'),
+('痛', '아프다'),
+('痛', '아플'),
+('痛', '아플 통'),
+('痛', '통'),
+('痞', 'bi'),
+('痞', 'pi'),
+('痞', '뱃속 결릴 비'),
+('痞', '비'),
+('痡', 'bu'),
+('痡', 'pu'),
+('痡', '부'),
+('痡', '앓다: be ill'),
+('痢', '리'),
+('痢', '설사 리'),
+('痢', '이'),
+('痣', '사마귀 지'),
+('痣', '지'),
+('痤', 'a swelling of the lymph nodes'),
+('痤', 'chwa'),
+('痤', 'cwa'),
+('痤', 'jwa'),
+('痤', '뾰루지 좌'),
+('痤', '좌'),
+('痧', 'sa'),
+('痧', '사'),
+('痧', '쥐통 사'),
+('痩', 'su'),
+('痩', 'swu'),
+('痩', '瘦와 同字'),
+('痩', '수'),
+('痰', 'dam'),
+('痰', 'tam'),
+('痰', '가래 담'),
+('痰', '담'),
+('痲', 'ma'),
+('痲', '마'),
+('痲', '저릴 마'),
+('痳', '임질 림'),
+('痴', 'Alternative form of 癡'),
+('痴', '癡의 俗字'),
+('痴', '치'),
+('痹', 'bi'),
+('痹', 'pi'),
+('痹', '비'),
+('痹', '저릴 비'),
+('痺', 'bi'),
+('痺', 'pi'),
+('痺', '비'),
+('痺', '암메추라기 비'),
+('痼', 'Hanja form of 고 (“chronic”).'),
+('痼', '고'),
+('痼', '고질'),
+('痼', '고질 고'),
+('痿', ' 음위증 위'),
+('痿', ' 잘름거릴 위'),
+('痿', 'wi'),
+('痿', '습병 위'),
+('痿', '위'),
+('瘀', 'e'),
+('瘀', 'eo'),
+('瘀', 'ŏ'),
+('瘀', '어'),
+('瘀', '어혈질 어'),
+('瘁', 'ch''wi'),
+('瘁', 'chwi'),
+('瘁', '취'),
+('瘇', 'chong'),
+('瘇', 'cong'),
+('瘇', 'jong'),
+('瘇', '수종 종'),
+('瘇', '종'),
+('瘈', 'gye'),
+('瘈', 'kye'),
+('瘈', 'kyey'),
+('瘈', '계'),
+('瘈', '미칠 계'),
+('瘉', 'yu'),
+('瘉', '癒와 同字'),
+('瘉', '유'),
+('瘋', ' 미치광이 풍'),
+('瘋', 'p''ung'),
+('瘋', 'phung'),
+('瘋', 'pung'),
+('瘋', '두풍 풍'),
+('瘋', '풍'),
+('瘍', ' 종기 양'),
+('瘍', 'yang'),
+('瘍', '머리헐 양'),
+('瘍', '양'),
+('瘏', 'do'),
+('瘏', 'to'),
+('瘏', '도'),
+('瘏', '앓을: be ill'),
+('瘐', 'yu'),
+('瘐', '유'),
+('瘐', '죄인 주려 죽을 유'),
+('瘕', 'ha'),
+('瘕', '이질 하'),
+('瘕', '하'),
+('瘖', 'darkness'),
+('瘖', 'deaf'),
+('瘖', 'mute'),
+('瘖', '음'),
+('瘙', ' 종기 소'),
+('瘙', 'so'),
+('瘙', '소'),
+('瘙', '옴 소'),
+('瘟', ' 온역 온'),
+('瘟', 'on'),
+('瘟', '염병 온'),
+('瘟', '온'),
+('瘠', 'ch''ŏk'),
+('瘠', 'chek'),
+('瘠', 'cheok'),
+('瘠', '척'),
+('瘠', '파리할 척'),
+('瘡', 'ch''ang'),
+('瘡', 'chang'),
+('瘡', '부스럼 창'),
+('瘡', '창'),
+('瘢', 'ban'),
+('瘢', 'pan'),
+('瘢', '반'),
+('瘢', '흉터 반'),
+('瘤', '혹 류'),
+('瘦', ' 가늘 수'),
+('瘦', 'emaciated'),
+('瘦', 'lean'),
+('瘦', 'meager'),
+('瘦', 'su'),
+('瘦', 'swu'),
+('瘦', 'thin'),
+('瘦', '수'),
+('瘦', '파리할 수'),
+('瘧', 'hak'),
+('瘧', '학'),
+('瘧', '학질 학'),
+('瘭', 'p''yo'),
+('瘭', 'phyo'),
+('瘭', 'pyo'),
+('瘭', '생인손: whitlow'),
+('瘭', '표'),
+('瘯', 'chok'),
+('瘯', 'cok'),
+('瘯', 'jok'),
+('瘯', '족'),
+('瘯', '피부병 이름 족'),
+('瘰', '연주창 라'),
+('瘳', ' 덜릴 추'),
+('瘳', 'be better'),
+('瘳', 'ch''u'),
+('瘳', 'chu'),
+('瘳', 'chwu'),
+('瘳', 'to recover'),
+('瘳', 'to reduce'),
+('瘳', '병 나을 추'),
+('瘳', '추'),
+('瘴', 'cang'),
+('瘴', 'chang'),
+('瘴', 'jang'),
+('瘴', '장'),
+('瘴', '장기 장'),
+('瘻', '부스럼 루'),
+('療', 'Hanja form of 료/요 (“heal; cure”).'),
+('療', '고치다'),
+('療', '고칠'),
+('療', '료'),
+('療', '병고칠 료'),
+('療', '요'),
+('癃', '느른할 륭'),
+('癆', '종독 로'),
+('癈', 'p''ye'),
+('癈', 'phyey'),
+('癈', 'pye'),
+('癈', '고질병 폐'),
+('癈', '폐'),
+('癉', '단'),
+('癉', '황달 단'),
+('癌', 'Hanja form of 암 (“cancer”).'),
+('癌', '암'),
+('癌', '종양 암'),
+('癎', 'gan'),
+('癎', 'kan'),
+('癎', '간'),
+('癎', '경풍 간'),
+('癒', ' 병들 유'),
+('癒', 'yu'),
+('癒', '병 나을 유'),
+('癒', '유'),
+('癕', 'ong'),
+('癕', '등창 옹'),
+('癕', '옹'),
+('癖', 'Hanja form of 벽 (“habit”).'),
+('癖', '버릇'),
+('癖', '벽'),
+('癖', '적취 벽'),
+('癘', '창질 려'),
+('癜', 'cen'),
+('癜', 'chŏn'),
+('癜', 'jeon'),
+('癜', '어루러기 전'),
+('癜', '전'),
+('癡', ' 미련할 치'),
+('癡', ' 미치광이 치'),
+('癡', ' 주근깨 치'),
+('癡', 'ch''i'),
+('癡', 'chi'),
+('癡', '어리석을 치'),
+('癡', '치'),
+('癢', 'yang'),
+('癢', '가려울 양'),
+('癢', '양'),
+('癤', ' 부스럼 절'),
+('癤', 'cel'),
+('癤', 'chŏl'),
+('癤', 'jeol'),
+('癤', '멍울 절'),
+('癤', '절'),
+('癥', 'ching'),
+('癥', 'cing'),
+('癥', 'jing'),
+('癥', '적취 징'),
+('癥', '징'),
+('癧', '연주창 력'),
+('癨', 'gwak'),
+('癨', 'kwak'),
+('癨', '곽'),
+('癨', '곽란 곽'),
+('癩', 'Hanja form of 나 (“leprosy”).'),
+('癩', 'la>na'),
+('癩', 'ra>na'),
+('癩', '라>나'),
+('癩', '약물 중독 라'),
+('癬', 'sen'),
+('癬', 'seon'),
+('癬', 'sŏn'),
+('癬', '선'),
+('癬', '옴 선'),
+('癭', 'deaf-mute'),
+('癭', 'superfluous'),
+('癭', 'swelling'),
+('癭', 'yeng'),
+('癭', 'yeong'),
+('癭', 'yŏng'),
+('癭', '목 혹 영'),
+('癭', '영'),
+('癮', '두드러기 은'),
+('癮', '은'),
+('癯', 'emaciated'),
+('癯', 'gu'),
+('癯', 'ku'),
+('癯', 'kwu'),
+('癯', 'thin'),
+('癯', '구'),
+('癯', '여윌 구'),
+('癰', 'yong'),
+('癰', '용'),
+('癱', ' 사지 틀릴 탄'),
+('癱', 't''an'),
+('癱', 'tan'),
+('癱', 'than'),
+('癱', '중풍증 탄'),
+('癱', '탄'),
+('癲', 'cen'),
+('癲', 'chŏn'),
+('癲', 'jeon'),
+('癲', '미칠 전'),
+('癲', '전'),
+('癶', '등지다'),
+('癶', '등질'),
+('癶', '발'),
+('癸', 'Hanja form of 계 (“tenth heavenly stem”).'),
+('癸', '계'),
+('癸', '열째 천간 계'),
+('癸', '천간'),
+('発', '일어날 발'),
+('登', 'Hanja form of 등 (“to go up; to climb”).'),
+('登', '등'),
+('登', '오를'),
+('登', '오를 등'),
+('發', 'Hanja form of 발 (“departing from; originating from”).'),
+('發', 'Hanja form of 발 (“departing from; originating from”). [suffix]'),
+('發', 'Hanja form of 발 (“to shoot; to emit; to discharge”).'),
+('發', 'Hanja form of 발 (“to shoot; to emit; to discharge”). [affix]'),
+('發', '발'),
+('發', '쏠 발'),
+('發', '피다'),
+('發', '필'),
+('白', 'Hanja form of 백 (“tell, inform”).'),
+('白', 'Hanja form of 백 (“white”).'),
+('白', '땅이름 배'),
+('白', '백'),
+('白', '아뢰다'),
+('白', '아뢸'),
+('白', '희다'),
+('白', '흰'),
+('白', '흰 백'),
+('百', 'Hanja form of 백 (“hundred”).'),
+('百', '백'),
+('百', '일백 백'),
+('百', '일백(一百)'),
+('百', '힘쓸 맥'),
+('皀', 'geup'),
+('皀', 'kup'),
+('皀', 'kŭp'),
+('皀', '고소할 급'),
+('皀', '급'),
+('皁', 'cho'),
+('皁', 'co'),
+('皁', 'jo'),
+('皁', '조'),
+('皁', '하인 조'),
+('皃', 'mo'),
+('皃', '貌와 同字'),
+('皃', '모'),
+('的', ' 꼭 그러할 적'),
+('的', ' 밝을 적'),
+('的', 'Hanja form of 적 (“-ive, -like, -ish, -ic, -ical, -y, kind of, sort of”).'),
+('的', 'Hanja form of 적 (“target”).'),
+('的', '과녁'),
+('的', '과녁 적'),
+('的', '적'),
+('皅', 'flowers'),
+('皅', 'p''a'),
+('皅', 'pa'),
+('皅', 'pha'),
+('皅', '파'),
+('皆', ' 같을 개'),
+('皆', ' 한 가지 개'),
+('皆', 'gae'),
+('皆', 'kae'),
+('皆', 'kay'),
+('皆', '개'),
+('皆', '모두 개'),
+('皇', 'Hanja form of 왕 (“to be solemn”).'),
+('皇', 'Hanja form of 황 (“king; monarch; ruler”).'),
+('皇', '엄숙하다'),
+('皇', '엄숙할'),
+('皇', '엄숙할 왕'),
+('皇', '왕'),
+('皇', '임금'),
+('皇', '임금 황'),
+('皇', '황'),
+('皋', 'Alternative form of 皐 (“Hanja form of 고 (“highland”).”)'),
+('皋', '고'),
+('皋', '못 고'),
+('皋', '언덕'),
+('皎', '교'),
+('皎', '달빛 교'),
+('皐', 'Hanja form of 고 (“highland”).'),
+('皐', '고'),
+('皐', '부르는 소리 고'),
+('皐', '부를 호'),
+('皐', '언덕'),
+('皓', ' 깨끗할 호'),
+('皓', 'ho'),
+('皓', '호'),
+('皓', '흴 호'),
+('皕', 'two hundred'),
+('皕', '벽'),
+('皕', '비'),
+('皕', '이백'),
+('皕', '핍'),
+('皖', 'hwan'),
+('皖', '샛별 환'),
+('皖', '환'),
+('皚', 'ae'),
+('皚', 'ya'),
+('皚', '애'),
+('皚', '흴 애'),
+('皛', 'hyo'),
+('皛', '나타날 효 '),
+('皛', '효'),
+('皜', ' 흰 모양 호'),
+('皜', 'clean, pure'),
+('皜', 'ho'),
+('皜', 'illuminate'),
+('皜', 'white'),
+('皜', '호'),
+('皜', '흴 호'),
+('皞', ' 흴 호'),
+('皞', 'ho'),
+('皞', '밝을 호'),
+('皞', '호'),
+('皤', ' 귀 밑에 희끗희끗할 파'),
+('皤', ' 배 불룩할 파'),
+('皤', 'p''a'),
+('皤', 'pa'),
+('皤', 'pha'),
+('皤', 'white'),
+('皤', '파'),
+('皤', '흴 파'),
+('皬', 'hak'),
+('皬', '학'),
+('皬', '흴 학 '),
+('皮', ' 껍질 피'),
+('皮', ' 성씨 피'),
+('皮', 'Hanja form of 피 (“skin”).'),
+('皮', '가죽'),
+('皮', '가죽 피'),
+('皮', '피'),
+('皴', 'chun'),
+('皴', 'cwun'),
+('皴', 'jun'),
+('皴', '주름 준'),
+('皴', '준'),
+('皶', 'sa'),
+('皶', '사'),
+('皸', '군'),
+('皸', '얼어터질 군'),
+('皸', '트다'),
+('皸', '틀'),
+('皺', 'ch''u'),
+('皺', 'chu'),
+('皺', 'chwu'),
+('皺', '쭈그러질 추'),
+('皺', '추'),
+('皿', 'Hanja form of 명 (“dish”).'),
+('皿', '그릇'),
+('皿', '그릇 명'),
+('皿', '명'),
+('盂', ' 사냥하는 진 우'),
+('盂', 'u'),
+('盂', 'wu'),
+('盂', '바리 우'),
+('盂', '우'),
+('盃', 'bae'),
+('盃', 'pae'),
+('盃', 'pay'),
+('盃', '杯의 俗字'),
+('盃', '배'),
+('盅', 'ch''ung'),
+('盅', 'chung'),
+('盅', 'chwung'),
+('盅', 'small bowl'),
+('盅', 'small cup'),
+('盅', '충'),
+('盆', '동이 분'),
+('盆', '분'),
+('盈', ' 넘칠 영'),
+('盈', ' 물 흐를 영'),
+('盈', 'yeng'),
+('盈', 'yeong'),
+('盈', 'yŏng'),
+('盈', '가득할 영'),
+('盈', '영'),
+('益', 'Hanja form of 익 (“gain; benefit”).'),
+('益', '더하다'),
+('益', '더할'),
+('益', '더할 익'),
+('益', '익'),
+('盌', 'wan'),
+('盌', '완'),
+('盌', '은 바리 완'),
+('盍', ' 어찌 아니할 합'),
+('盍', ' 합할 합'),
+('盍', '덮을 합'),
+('盍', '합'),
+('盎', 'ang'),
+('盎', 'spill over'),
+('盎', '동이 앙'),
+('盎', '동이: an earthen vessel with a big belly and a small mouth'),
+('盎', '앙'),
+('盒', ' 합 합'),
+('盒', 'hap'),
+('盒', '소반 뚜껑 합'),
+('盒', '합'),
+('盔', 'hoe'),
+('盔', 'hoy'),
+('盔', '바리 회'),
+('盔', '회'),
+('盖', 'Alternative form of 蓋 (“Hanja form of 개 (“cover”).”)'),
+('盖', '蓋과 同字'),
+('盖', '蓋의 俗字'),
+('盖', '개'),
+('盖', '덮다'),
+('盖', '덮을'),
+('盙', 'bo'),
+('盙', 'po'),
+('盙', '簠의 本字'),
+('盙', '보'),
+('盛', ' 많을 성'),
+('盛', ' 이룰 성'),
+('盛', ' 정제할 성'),
+('盛', 'Hanja form of 성 (“prosper”).'),
+('盛', '담을 성'),
+('盛', '성'),
+('盛', '성하다'),
+('盛', '성할'),
+('盜', 'Hanja form of 도 (“thief”).'),
+('盜', '도'),
+('盜', '도둑'),
+('盜', '도둑 도'),
+('盞', 'can'),
+('盞', 'chan'),
+('盞', 'jan'),
+('盞', '작은 술잔 잔'),
+('盞', '잔'),
+('盟', 'Hanja form of 맹 (“oath, covenant, alliance”).'),
+('盟', 'Hanja form of 맹 (“swear”).'),
+('盟', '맹'),
+('盟', '맹세하다'),
+('盟', '맹세할'),
+('盟', '맹세할 맹'),
+('盡', 'deplete'),
+('盡', 'exhaust, use up'),
+('盡', '다할 진'),
+('盡', '진'),
+('監', ' 감옥 감'),
+('監', ' 벼슬 감'),
+('監', ' 볼 감'),
+('監', ' 살필 감'),
+('監', 'Hanja form of 감 (“supervision; overseeing”).'),
+('監', '감'),
+('監', '거느릴 감'),
+('監', '보다'),
+('監', '볼'),
+('盤', 'Hanja form of 반 (“disc”).'),
+('盤', 'Hanja form of 반 (“match; game”).'),
+('盤', 'Hanja form of 반 (“plot; territory”).'),
+('盤', 'Hanja form of 반 (“tray; dish”).'),
+('盤', '반'),
+('盤', '소반 반'),
+('盤', '소반(小盤)'),
+('盥', 'gwan'),
+('盥', 'kwan'),
+('盥', '관'),
+('盥', '대야 관'),
+('盧', '노'),
+('盧', '로'),
+('盧', '밥그릇'),
+('盧', '밥그릇 로'),
+('盪', ' 그릇 부실 탕'),
+('盪', ' 뭍 배질할 탕'),
+('盪', ' 움직일 탕'),
+('盪', ' 진동할 탕'),
+('盪', 't''ang'),
+('盪', 'tang'),
+('盪', 'thang'),
+('盪', '씻을 탕'),
+('盪', '탕'),
+('盬', 'go'),
+('盬', 'ko'),
+('盬', 'salt'),
+('盬', '고'),
+('盬', '염지 고'),
+('目', 'Hanja form of 목 (“(taxonomy) class”).'),
+('目', 'Hanja form of 목 (“(taxonomy) class”). [noun]'),
+('目', 'Hanja form of 목 (“eye”).'),
+('目', 'Hanja form of 목 (“eye”). [affix]'),
+('目', '눈'),
+('目', '눈 목'),
+('目', '목'),
+('盱', 'look up'),
+('盱', 'stare'),
+('盱', '우'),
+('盲', 'Hanja form of 맹 (“blind”).'),
+('盲', '맹'),
+('盲', '소경'),
+('盲', '소경 맹'),
+('直', 'Hanja form of 직 (“straight”).'),
+('直', '곧을'),
+('直', '곧을 직'),
+('直', '직'),
+('相', 'Hanja form of 상 (“looks; appearance”).'),
+('相', 'Hanja form of 상 (“minister of state”).'),
+('相', 'Hanja form of 상 (“mutual; together”).'),
+('相', '바탕'),
+('相', '상'),
+('相', '서로'),
+('相', '서로 상'),
+('盹', ' 졸 순'),
+('盹', 'sun'),
+('盹', 'swun'),
+('盹', '눈 감을 순'),
+('盹', '순'),
+('盻', ' 돌아볼 혜'),
+('盻', 'hye'),
+('盻', 'hyey'),
+('盻', '혜'),
+('盻', '흘겨볼 혜'),
+('盼', 'expect'),
+('盼', 'gaze'),
+('盼', 'hope for'),
+('盼', 'look'),
+('盼', '곁눈질 할 반'),
+('盼', '반'),
+('盾', ' 벼슬이름 순'),
+('盾', 'Hanja form of 순 (“shield”).'),
+('盾', '방패'),
+('盾', '방패 순'),
+('盾', '사람이름 돈'),
+('盾', '순'),
+('省', 'Hanja form of 생 (“saving; conservation”).'),
+('省', 'Hanja form of 생 (“to reduce; to omit”).'),
+('省', 'Hanja form of 성 (“Chinese province”).'),
+('省', 'Hanja form of 성 (“ministry; department”).'),
+('省', 'Hanja form of 성 (“to examine; to inspect”).'),
+('省', '덜'),
+('省', '덜 생'),
+('省', '살필'),
+('省', '살필 성'),
+('省', '생'),
+('省', '성'),
+('眄', 'looking dull'),
+('眄', 'to look askance'),
+('眄', '면'),
+('眄', '애꾸눈 면'),
+('眇', 'myo'),
+('眇', '묘'),
+('眇', '애꾸눈 묘'),
+('眈', ' 즐길 탐'),
+('眈', 'Hanja form of 탐 (“to stare at”).'),
+('眈', '노려보다'),
+('眈', '노려볼'),
+('眈', '노려볼 탐'),
+('眈', '탐'),
+('眉', ' 노인 미'),
+('眉', 'Hanja form of 미 (“eyebrow”).'),
+('眉', '눈썹'),
+('眉', '눈썹 미'),
+('眉', '미'),
+('眊', 'blurred eyesight'),
+('眊', '눈 흐릴 모'),
+('眊', '모'),
+('看', '간'),
+('看', '볼'),
+('看', '볼 간'),
+('県', ' 지방 현'),
+('県', 'hyen'),
+('県', 'hyeon'),
+('県', 'hyŏn'),
+('県', '고을 현'),
+('県', '현'),
+('眚', 'saeng'),
+('眚', 'sayng'),
+('眚', '눈에백태낄 생'),
+('眚', '생'),
+('眛', '매'),
+('眛', '어두울 매'),
+('眞', 'Hanja form of 진 (“a surname.”).'),
+('眞', 'Hanja form of 진 (“truth”).'),
+('眞', '진'),
+('眞', '참'),
+('眞', '참 진'),
+('真', 'Alternative form of 眞'),
+('真', '진'),
+('真', '참'),
+('眠', 'Hanja form of 면 (“close eyes, sleep”).'),
+('眠', 'Hanja form of 면 (“hibernate”).'),
+('眠', '면'),
+('眠', '잠자다'),
+('眠', '잠잘'),
+('眠', '잠잘 면'),
+('眥', '자'),
+('眥', '흘길 자'),
+('眦', 'ca'),
+('眦', 'cha'),
+('眦', 'ja'),
+('眦', '眥와 同字'),
+('眦', '자'),
+('眨', 'cap'),
+('眨', 'chap'),
+('眨', 'jap'),
+('眨', 'wink'),
+('眨', '눈 깜작일 잡'),
+('眨', '잡'),
+('眩', ' 현혹할 현'),
+('眩', '아찔할 현'),
+('眩', '요술 환'),
+('眴', 'dazzle'),
+('眴', 'see'),
+('眴', 'wink'),
+('眴', '눈짓할 순'),
+('眴', '순'),
+('眷', '권'),
+('眷', '돌아볼 권'),
+('眸', 'mo'),
+('眸', '눈동자 모'),
+('眸', '모'),
+('眺', 'Hanja form of 조 (“to look at; to gaze”).'),
+('眺', '바라보다'),
+('眺', '바라볼'),
+('眺', '바라볼 조'),
+('眺', '조'),
+('眻', 'yang'),
+('眻', '눈 아름다울 양 '),
+('眻', '양'),
+('眼', 'Hanja form of 안 (“eye”).'),
+('眼', 'Hanja form of 안 (“eye”). [affix]'),
+('眼', '눈'),
+('眼', '눈 안'),
+('眼', '안'),
+('眾', 'chung'),
+('眾', 'cwung'),
+('眾', 'jung'),
+('眾', '衆의 本字'),
+('眾', '중'),
+('着', 'Hanja form of 착 (“arriving; wearing”).'),
+('着', '붙다'),
+('着', '붙을'),
+('着', '붙을 착'),
+('着', '착'),
+('睆', 'beautiful'),
+('睆', 'bright'),
+('睆', 'hwan'),
+('睆', 'protruding eyeball'),
+('睆', '가득 차 있는 모양 환'),
+('睆', '환'),
+('睇', 'cey'),
+('睇', 'che'),
+('睇', 'je'),
+('睇', '제'),
+('睇', '흘끗 볼 제'),
+('睊', 'gyeon'),
+('睊', 'kyen'),
+('睊', 'kyŏn'),
+('睊', 'to leer at (a person)'),
+('睊', '견'),
+('睍', ' 고울 현'),
+('睍', 'goggle-eyed'),
+('睍', 'hyen'),
+('睍', 'hyeon'),
+('睍', 'hyŏn'),
+('睍', '물끄러미 볼 현'),
+('睍', '현'),
+('睎', 'glimpse'),
+('睎', 'hui'),
+('睎', 'hŭi'),
+('睎', 'long for'),
+('睎', 'look at'),
+('睎', '희'),
+('睒', 'sem'),
+('睒', 'seom'),
+('睒', 'sŏm'),
+('睒', '번개빛 섬'),
+('睒', '섬'),
+('睘', 'gyeong'),
+('睘', 'kyeng'),
+('睘', 'kyŏng'),
+('睘', '경'),
+('睚', 'ae'),
+('睚', 'ay'),
+('睚', '눈흘길 애'),
+('睚', '애'),
+('睛', ' 눈동자 정'),
+('睛', 'Hanja form of 정 (“pupil”).'),
+('睛', '눈 검은자위 정'),
+('睛', '눈동자'),
+('睛', '정'),
+('睜', 'chŏng'),
+('睜', 'jeong'),
+('睜', 'pupil'),
+('睜', '정'),
+('睟', ' 윤택할 수'),
+('睟', 'clear-eyed'),
+('睟', 'su'),
+('睟', 'swu'),
+('睟', '똑바로 볼 수'),
+('睟', '수'),
+('睠', 'gwon'),
+('睠', 'kwen'),
+('睠', 'kwŏn'),
+('睠', '眷과 同字'),
+('睠', '권'),
+('睡', ' 잠 수'),
+('睡', 'Hanja form of 수 (“sleeping”).'),
+('睡', '수'),
+('睡', '졸음'),
+('睡', '졸음 수'),
+('睢', 'gaze at'),
+('睢', 'stare at'),
+('睢', 'su'),
+('睢', 'swu'),
+('睢', 'uninhibited'),
+('睢', '물이름 수'),
+('睢', '수'),
+('督', 'Hanja form of 독 (“supervise, direct”).'),
+('督', '감독할 독'),
+('督', '독'),
+('督', '살피다'),
+('督', '살필'),
+('睥', 'bi'),
+('睥', 'pi'),
+('睥', '비'),
+('睥', '흘겨볼 비'),
+('睦', 'Hanja form of 목 (“friendly, amiable, peaceful”).'),
+('睦', '목'),
+('睦', '화목하다'),
+('睦', '화목할'),
+('睦', '화목할 목'),
+('睨', ' 해 기울어질 예'),
+('睨', 'ye'),
+('睨', 'yey'),
+('睨', '예'),
+('睨', '흘겨볼 예'),
+('睪', 'go'),
+('睪', 'ko'),
+('睪', '고'),
+('睫', 'ch''ŏp'),
+('睫', 'cheop'),
+('睫', 'chep'),
+('睫', '속눈썹 첩'),
+('睫', '첩'),
+('睬', '주목할 채'),
+('睬', '채'),
+('睴', '곤'),
+('睴', '큰 눈 툭 불거질'),
+('睷', 'geon'),
+('睷', 'ken'),
+('睷', 'kŏn'),
+('睷', '건'),
+('睷', '눈으로 세어볼 건 '),
+('睹', 'do'),
+('睹', 'to'),
+('睹', '도'),
+('睹', '볼 도'),
+('睽', 'squint, strabismus'),
+('睽', 'stare'),
+('睽', '규'),
+('睽', '어그러질 규'),
+('睾', 'go'),
+('睾', 'ko'),
+('睾', '고'),
+('睾', '못 고'),
+('睿', ' 밝을 예'),
+('睿', ' 통할 예'),
+('睿', 'ye'),
+('睿', 'yey'),
+('睿', '슬기로울 예'),
+('睿', '예'),
+('瞀', 'cloudy'),
+('瞀', 'dim'),
+('瞀', 'ignorant'),
+('瞀', '무'),
+('瞈', '밝지 않을'),
+('瞈', '옹'),
+('瞋', 'chin'),
+('瞋', 'cin'),
+('瞋', 'glare with anger'),
+('瞋', 'jin'),
+('瞋', '부릅뜰 진'),
+('瞋', '진'),
+('瞍', ' 장님 수'),
+('瞍', ' 판수 수'),
+('瞍', 'blind'),
+('瞍', 'no pupil in the eye'),
+('瞍', 'su'),
+('瞍', 'swu'),
+('瞍', '소경 수'),
+('瞍', '수'),
+('瞎', '애꾸눈'),
+('瞎', '애꾸눈 할'),
+('瞎', '할'),
+('瞏', 'gyeong'),
+('瞏', 'kyeng'),
+('瞏', 'kyŏng'),
+('瞏', 'lonely'),
+('瞏', 'to blink'),
+('瞏', '경'),
+('瞑', '눈 감을 면'),
+('瞑', '눈 감을 명'),
+('瞖', 'ye'),
+('瞖', 'yey'),
+('瞖', '눈에 백태 낄 예'),
+('瞖', '예'),
+('瞙', 'mak'),
+('瞙', '눈 흐릴 막 '),
+('瞙', '막'),
+('瞞', 'deceive'),
+('瞞', 'eyes half-closed'),
+('瞞', 'lie'),
+('瞞', 'man'),
+('瞞', '만'),
+('瞞', '속일 만'),
+('瞠', '똑바로 볼 쟁'),
+('瞠', '바로볼 당'),
+('瞢', 'mong'),
+('瞢', '몽'),
+('瞢', '어두울 몽'),
+('瞥', 'Hanja form of 별 (“shoot a glance at”).'),
+('瞥', '깜짝할'),
+('瞥', '별'),
+('瞥', '언뜻 볼 별'),
+('瞩', 'ch''ok'),
+('瞩', 'chok'),
+('瞩', 'focus on'),
+('瞩', 'stare at'),
+('瞩', 'watch carefully'),
+('瞩', '촉'),
+('瞪', 'ching'),
+('瞪', 'cing'),
+('瞪', 'jing'),
+('瞪', '바로 볼 징'),
+('瞪', '징'),
+('瞬', ' 잠깐 순'),
+('瞬', 'a flash'),
+('瞬', 'blink'),
+('瞬', 'in a wink'),
+('瞬', 'sun'),
+('瞬', 'swun'),
+('瞬', 'wink'),
+('瞬', '눈 깜작일 순'),
+('瞬', '순'),
+('瞭', '밝을 료'),
+('瞯', 'peep'),
+('瞯', 'watch, see'),
+('瞯', '간'),
+('瞯', '한'),
+('瞰', ' 내려다 볼 감'),
+('瞰', 'gam'),
+('瞰', 'kam'),
+('瞰', 'to overlook, look down'),
+('瞰', 'to watch'),
+('瞰', '감'),
+('瞰', '굽어볼 감'),
+('瞳', 'Hanja form of 동 (“pupil”).'),
+('瞳', '눈동자'),
+('瞳', '눈동자 동'),
+('瞳', '동'),
+('瞹', 'ae'),
+('瞹', 'ay'),
+('瞹', 'clouded'),
+('瞹', 'obscure'),
+('瞹', '애'),
+('瞹', '흐릿할 애'),
+('瞻', 'ch''ŏm'),
+('瞻', 'chem'),
+('瞻', 'cheom'),
+('瞻', '볼 첨'),
+('瞻', '첨'),
+('瞼', 'Hanja form of 검 (“(anatomy) eyelid”).'),
+('瞼', '검'),
+('瞼', '눈꺼풀'),
+('瞼', '눈시울 검'),
+('瞽', 'go'),
+('瞽', 'ko'),
+('瞽', '고'),
+('瞽', '소경 고'),
+('瞿', 'gu'),
+('瞿', 'ku'),
+('瞿', 'kwu'),
+('瞿', '구'),
+('瞿', '놀라서 볼 구'),
+('矃', 'me'),
+('矃', 'meo'),
+('矃', 'mŏ'),
+('矃', '머'),
+('矇', 'mong'),
+('矇', '몽'),
+('矇', '소경 몽'),
+('矉', 'bin'),
+('矉', 'frown'),
+('矉', 'pin'),
+('矉', '빈'),
+('矉', '찡그릴 빈'),
+('矍', 'look about in fright or alarm'),
+('矍', '두리번거릴 확'),
+('矍', '확'),
+('矕', '만'),
+('矗', ' 우뚝 솟을 촉'),
+('矗', 'ch''ok'),
+('矗', 'chok'),
+('矗', '곧을 촉'),
+('矗', '촉'),
+('矙', 'geom'),
+('矙', 'kem'),
+('矙', 'kŏm'),
+('矙', '검'),
+('矚', 'ch''ok'),
+('矚', 'chok'),
+('矚', 'focus on'),
+('矚', 'stare at'),
+('矚', 'watch carefully'),
+('矚', '볼 촉'),
+('矚', '촉'),
+('矛', 'Hanja form of 모 (“spear; lance”).'),
+('矛', '모'),
+('矛', '창'),
+('矛', '창 모'),
+('矜', '불쌍히 여길 긍'),
+('矜', '창자루 근'),
+('矞', ' 궤휼할 율'),
+('矞', ' 귀신이름 율'),
+('矞', ' 상서구름 율'),
+('矞', 'pierce through with an awl'),
+('矞', 'yul'),
+('矞', '송곳질할 율'),
+('矞', '율'),
+('矠', 'saek'),
+('矠', 'spear'),
+('矠', '색'),
+('矡', 'hwak'),
+('矡', '호미 확 '),
+('矡', '확'),
+('矢', ' 곧을 시'),
+('矢', ' 똥 시'),
+('矢', ' 베풀 시'),
+('矢', ' 소리살 시'),
+('矢', 'Hanja form of 시 (“arrow”).'),
+('矢', '살 시'),
+('矢', '시'),
+('矢', '화살'),
+('矣', '말 그칠 의'),
+('矣', '어조사'),
+('矣', '의'),
+('知', 'Hanja form of 지 (“know”).'),
+('知', '알'),
+('知', '알 지'),
+('知', '알다'),
+('知', '지'),
+('矦', 'hu'),
+('矦', 'hwu'),
+('矦', '임금 (imgeum) king'),
+('矦', '후'),
+('矧', ' 잇속 드러날 신'),
+('矧', '신'),
+('矧', '하물며 신'),
+('矩', 'gu'),
+('矩', 'ku'),
+('矩', 'kwu'),
+('矩', '곡척 구'),
+('矩', '구'),
+('短', 'Hanja form of 단 (“short”).'),
+('短', '단'),
+('短', '짧을'),
+('短', '짧을 단'),
+('矮', 'wae'),
+('矮', 'way'),
+('矮', '난장이 왜'),
+('矮', '왜'),
+('矯', 'Hanja form of 교 (“correct, rectify, straighten out”).'),
+('矯', '교'),
+('矯', '바로잡다'),
+('矯', '바로잡을'),
+('矯', '바로잡을 교'),
+('矰', 'arrow with attached silk cord'),
+('矰', 'chŭng'),
+('矰', 'cung'),
+('矰', 'jeung'),
+('矰', '주살 증'),
+('矰', '증'),
+('石', 'Hanja form of 석 (“stone”).'),
+('石', '돌'),
+('石', '돌 석'),
+('石', '석'),
+('矺', '나무이름 탁'),
+('矺', '탁'),
+('矻', 'gol'),
+('矻', 'kol'),
+('矻', 'stone'),
+('矻', '골'),
+('矻', '돌 골'),
+('矼', ' 성실할 강'),
+('矼', ' 징검다리 강'),
+('矼', '강'),
+('矼', '돌다리 강'),
+('矽', 'sek'),
+('矽', 'seok'),
+('矽', 'sŏk'),
+('矽', '석'),
+('矽', '석비레 석'),
+('砂', 'sa'),
+('砂', '모래 사'),
+('砂', '사'),
+('砌', 'ch''e'),
+('砌', 'che'),
+('砌', 'chey'),
+('砌', '섬돌 체'),
+('砌', '체'),
+('砏', 'bun'),
+('砏', 'pun'),
+('砏', '분'),
+('砏', '큰 소리 분 '),
+('砑', '갈 아'),
+('砑', '아'),
+('砒', 'arsenic'),
+('砒', 'bi'),
+('砒', 'pi'),
+('砒', '비'),
+('砒', '비상 비'),
+('研', 'Alternative form of 硏 (“Hanja form of 연 (“grinding”).”)'),
+('研', '硏과 同字'),
+('研', '갈'),
+('研', '갈다'),
+('研', '연'),
+('砕', 'swae'),
+('砕', 'sway'),
+('砕', '碎와 同字'),
+('砕', '쇄'),
+('砢', '돌 쌓일 라'),
+('砥', 'chi'),
+('砥', 'ci'),
+('砥', 'ji'),
+('砥', '숫돌 지'),
+('砥', '지'),
+('砦', '울타리 채'),
+('砦', '채'),
+('砧', ' 다듬잇돌 침'),
+('砧', 'ch''im'),
+('砧', 'chim'),
+('砧', '방칫돌 침'),
+('砧', '침'),
+('砬', '돌 소리 립'),
+('砭', 'p''yŏm'),
+('砭', 'phyem'),
+('砭', 'pyeom'),
+('砭', 'stone needle'),
+('砭', '돌침 폄'),
+('砭', '폄'),
+('砰', 'p''aeng'),
+('砰', 'paeng'),
+('砰', 'phayng'),
+('砰', '여울 물소리 팽'),
+('砰', '팽'),
+('砲', ' 돌 튀기는 화살 포'),
+('砲', ' 돌쇠뇌 포'),
+('砲', 'Hanja form of 포 (“cannon”).'),
+('砲', '대포'),
+('砲', '큰 대포 포'),
+('砲', '포'),
+('破', ' 갈라질 파'),
+('破', ' 다할 파'),
+('破', '깨뜨릴 파'),
+('破', '파'),
+('砷', 'shin'),
+('砷', 'sin'),
+('砷', '신'),
+('砺', '礪의 略字'),
+('硃', 'chu'),
+('硃', 'cinnabar'),
+('硃', 'cwu'),
+('硃', 'ju'),
+('硃', '주'),
+('硃', '주사 주'),
+('硅', '규'),
+('硅', '유리만드는 흙 규'),
+('硇', 'ammonium chloride'),
+('硇', '뇨'),
+('硇', '약(藥)돌'),
+('硇', '요'),
+('硏', 'Hanja form of 연 (“grinding”).'),
+('硏', '갈'),
+('硏', '갈다'),
+('硏', '연'),
+('硏', '연마할 연'),
+('硒', 'se'),
+('硒', 'seo'),
+('硒', 'sŏ'),
+('硒', '서'),
+('硜', ' 돌소리 갱'),
+('硜', ' 알랑알랑할 갱'),
+('硜', 'gaeng'),
+('硜', 'kaeng'),
+('硜', 'kayng'),
+('硜', '갱'),
+('硜', '아릿아릿할 갱'),
+('硝', 'ch''o'),
+('硝', 'cho'),
+('硝', '초'),
+('硝', '초석 초'),
+('硠', '돌 부딪는 소라 랑 '),
+('硧', 'yong'),
+('硧', '용'),
+('硨', 'ch''a'),
+('硨', 'cha'),
+('硨', '조개 이름 차'),
+('硨', '차'),
+('硫', '류'),
+('硫', '유'),
+('硫', '유황 류'),
+('硬', 'Hanja form of 경 (“harden, stiffen”).'),
+('硬', '경'),
+('硬', '굳다'),
+('硬', '굳을'),
+('硬', '굳을 경'),
+('确', 'a stony mountain'),
+('确', 'barren'),
+('确', 'gravel land'),
+('确', 'hak'),
+('确', 'hard'),
+('确', 'scarce'),
+('确', 'solid'),
+('确', '학'),
+('确', '확실할 학'),
+('硯', ' 돌 연'),
+('硯', 'yen'),
+('硯', 'yeon'),
+('硯', 'yŏn'),
+('硯', '벼루 연'),
+('硯', '연'),
+('硼', '붕산 붕'),
+('硼', '평돌 평'),
+('碁', 'gi'),
+('碁', 'ki'),
+('碁', '棋와 同字'),
+('碁', '기'),
+('碇', ' 배 멈출 정'),
+('碇', 'anchor'),
+('碇', 'ceng'),
+('碇', 'chŏng'),
+('碇', 'jeong'),
+('碇', '닻돌 정'),
+('碇', '정'),
+('碌', '녹'),
+('碌', '돌 모양 록'),
+('碌', '록'),
+('碍', 'Alternative form of 礙 (“Hanja form of 애 (“to obstruct; to block; to hinder; to deter”).”)'),
+('碍', '礙의 俗字'),
+('碍', '막다'),
+('碍', '막을'),
+('碍', '애'),
+('碎', ' 잘 쇄'),
+('碎', 'Hanja form of 쇄 (“shred”).'),
+('碎', '부수다'),
+('碎', '부술'),
+('碎', '부술 쇄'),
+('碎', '쇄'),
+('碏', 'cak'),
+('碏', 'chak'),
+('碏', 'jak'),
+('碏', '삼갈 작'),
+('碏', '작'),
+('碑', 'bi'),
+('碑', 'pi'),
+('碑', '돌기둥 비'),
+('碑', '비'),
+('碓', 'dae'),
+('碓', 'tae'),
+('碓', 'tay'),
+('碓', '대'),
+('碓', '방아 대'),
+('碗', 'Hanja form of 완 (“(porcelain) bowl”).'),
+('碗', '그릇 완'),
+('碗', '사발'),
+('碗', '완'),
+('碘', 'cen'),
+('碘', 'chŏn'),
+('碘', 'jeon'),
+('碘', '전'),
+('碟', 'sel'),
+('碟', 'seol'),
+('碟', 'sŏl'),
+('碟', '가죽다룰 설'),
+('碟', '설'),
+('碣', ' 동해의 산이름 갈'),
+('碣', ' 우뚝선 돌 갈'),
+('碣', '돌 세울 게'),
+('碣', '비 갈'),
+('碤', 'yeng'),
+('碤', 'yeong'),
+('碤', 'yŏng'),
+('碤', '물 속 돌 영 '),
+('碤', '영'),
+('碧', 'Hanja form of 벽 (“blue-green”).'),
+('碧', '벽'),
+('碧', '푸르다'),
+('碧', '푸를'),
+('碧', '푸를 벽'),
+('碨', ' 바위 옹두라지 외 '),
+('碨', '돌 자갈 땅 외'),
+('碨', '아'),
+('碩', 'sek'),
+('碩', 'seok'),
+('碩', 'sŏk'),
+('碩', '석'),
+('碩', '클 석'),
+('碭', ' 넘칠 탕'),
+('碭', ' 산이름 탕'),
+('碭', ' 흰 기운 탕'),
+('碭', 't''ang'),
+('碭', 'tang'),
+('碭', 'thang'),
+('碭', '무늬진 돌 탕'),
+('碭', '탕'),
+('碲', 'cey'),
+('碲', 'che'),
+('碲', 'je'),
+('碲', '제'),
+('碳', '탄'),
+('確', 'hwak'),
+('確', '굳을 확'),
+('確', '확'),
+('碻', 'hwak'),
+('碻', '굳을 확'),
+('碻', '확'),
+('碼', '마'),
+('碼', '마노 마'),
+('碾', '맷돌 년'),
+('磁', 'ca'),
+('磁', 'cha'),
+('磁', 'ja'),
+('磁', '자'),
+('磁', '자석 자'),
+('磅', 'bang'),
+('磅', 'pang'),
+('磅', '돌 떨어지는 소리 방'),
+('磅', '방'),
+('磈', '돌 사닥다리 외 '),
+('磈', '아'),
+('磊', '돌무더기 뢰'),
+('磋', 'ch''a'),
+('磋', 'cha'),
+('磋', '윤낼 차'),
+('磋', '차'),
+('磌', 'cen'),
+('磌', 'chŏn'),
+('磌', 'jeon'),
+('磌', 'sound of falling stones'),
+('磌', '전'),
+('磎', 'gye'),
+('磎', 'kye'),
+('磎', 'kyey'),
+('磎', '谿와 同字'),
+('磎', '계'),
+('磏', '거친 숫돌 렴 '),
+('磐', 'ban'),
+('磐', 'pan'),
+('磐', '넓을 반'),
+('磐', '반'),
+('磑', 'ae'),
+('磑', 'ay'),
+('磑', '맷돌 애'),
+('磑', '애'),
+('磔', 'ch''aek'),
+('磔', 'chaek'),
+('磔', 'chayk'),
+('磔', '찢을 책'),
+('磔', '책'),
+('磕', 'bump'),
+('磕', 'drumbeat'),
+('磕', 'gae'),
+('磕', 'kae'),
+('磕', 'kay'),
+('磕', '개'),
+('磕', '돌 부딪는 소리 개'),
+('磚', ' 기와 전'),
+('磚', 'cen'),
+('磚', 'chŏn'),
+('磚', 'jeon'),
+('磚', '벽돌 전'),
+('磚', '전'),
+('磠', 'ammonium'),
+('磠', 'sand'),
+('磠', '노'),
+('磠', '뇨'),
+('磠', '로'),
+('磠', '모래'),
+('磠', '약(藥)돌'),
+('磠', '약돌 뇨'),
+('磠', '요'),
+('磧', ' 모래벌 적'),
+('磧', 'Hanja form of 적 (“body of water with pebbles”).'),
+('磧', '돌무더기 적'),
+('磧', '서덜'),
+('磧', '적'),
+('磨', 'Hanja form of 마 (“grind, polish, rub, wear out”).'),
+('磨', 'Hanja form of 마 (“millstone”).'),
+('磨', '가다'),
+('磨', '갈'),
+('磨', '갈 마'),
+('磨', '마'),
+('磪', 'ch''oe'),
+('磪', 'choe'),
+('磪', 'choy'),
+('磪', '최'),
+('磪', '험하고 높을 최'),
+('磬', '경'),
+('磬', '경쇠 경'),
+('磯', 'gi'),
+('磯', 'ki'),
+('磯', '기'),
+('磯', '물가 기'),
+('磴', 'deung'),
+('磴', 'tung'),
+('磴', 'tŭng'),
+('磴', '돌 비탈길 등'),
+('磴', '등'),
+('磵', ' 석간수 간'),
+('磵', 'gan'),
+('磵', 'kan'),
+('磵', '간'),
+('磵', '산골 시내 간'),
+('磷', '돌 을 틈물이 흐르는 모양 린'),
+('磺', 'gwang'),
+('磺', 'kwang'),
+('磺', '광'),
+('磺', '쇳돌 광'),
+('磻', '강이름 반'),
+('磻', '강이름 번'),
+('磼', 'cap'),
+('磼', 'chap'),
+('磼', 'jap'),
+('磼', '산 높을 잡 '),
+('磼', '잡'),
+('磽', 'gyo'),
+('磽', 'kyo'),
+('磽', '교'),
+('磽', '메마른 땅 교'),
+('磾', '제'),
+('礁', 'Hanja form of 초 (“reef”).'),
+('礁', '암초'),
+('礁', '암초 초'),
+('礁', '초'),
+('礌', '뇌'),
+('礌', '돌 굴러내릴 뢰 '),
+('礌', '뢰'),
+('礌', '바위'),
+('礎', 'Hanja form of 초 (“cornerstone”).'),
+('礎', '주춧돌'),
+('礎', '주춧돌 초'),
+('礎', '초'),
+('礏', 'geup'),
+('礏', 'kup'),
+('礏', 'kŭp'),
+('礏', '급'),
+('礏', '산 높은 모양 급 '),
+('礑', 'dang'),
+('礑', 'tang'),
+('礑', '당'),
+('礑', '밑바닥 당 '),
+('礒', '바위 의 '),
+('礒', '의'),
+('礖', 'ye'),
+('礖', 'yeo'),
+('礖', 'yŏ'),
+('礖', '여'),
+('礖', '여돌 여 '),
+('礙', 'ae'),
+('礙', 'ay'),
+('礙', '막을 애'),
+('礙', '애'),
+('礦', '쇳돌 광'),
+('礦', '쇳돌 황'),
+('礧', '바위너설 뢰'),
+('礪', '거친 숫돌 려'),
+('礫', 'Hanja form of 력/역 (“pebble”).'),
+('礫', '력'),
+('礫', '역'),
+('礫', '조약돌'),
+('礫', '조약돌 력'),
+('礬', '명반 반'),
+('礬', '반'),
+('礭', 'hwak'),
+('礭', '확'),
+('礭', '회초리 확 '),
+('礱', '갈 롱'),
+('示', ' 가르칠 시'),
+('示', ' 바칠 시'),
+('示', 'Hanja form of 시 (“to show; to display; to demonstrate; to exhibit”).'),
+('示', '땅 귀신 기'),
+('示', '보이다'),
+('示', '보일'),
+('示', '보일 시'),
+('示', '시'),
+('礼', 'Alternative form of 禮'),
+('礼', '禮의 古字'),
+('礼', '례'),
+('礼', '예'),
+('社', 'Hanja form of 사 (“company”).'),
+('社', 'Hanja form of 사 (“company”). [noun]'),
+('社', 'Hanja form of 사 (“social”).'),
+('社', 'Hanja form of 사 (“social”). [affix]'),
+('社', '모이다'),
+('社', '모일'),
+('社', '사'),
+('社', '토지의 신 사'),
+('礿', 'spring offerings'),
+('礿', '약'),
+('祀', '사'),
+('祀', '제사 사'),
+('祁', 'gi'),
+('祁', 'ki'),
+('祁', '기'),
+('祁', '성할 기'),
+('祅', 'yo'),
+('祅', '요'),
+('祅', '재앙 요'),
+('祆', '천'),
+('祆', '하늘 천'),
+('祇', '마침 지'),
+('祇', '토지의 신 기'),
+('祈', 'Hanja form of 기 (“entreat, beseech”).'),
+('祈', 'Hanja form of 기 (“pray”).'),
+('祈', '기'),
+('祈', '비다'),
+('祈', '빌'),
+('祈', '빌 기'),
+('祉', 'chi'),
+('祉', 'ci'),
+('祉', 'ji'),
+('祉', '복 지'),
+('祉', '지'),
+('祊', 'p''aeng'),
+('祊', 'paeng'),
+('祊', 'phayng'),
+('祊', '사당문 제사 팽'),
+('祊', '팽'),
+('祌', 'ch''ung'),
+('祌', 'chung'),
+('祌', 'chwung'),
+('祌', 'name of God'),
+('祌', '충'),
+('祐', ' 다행할 우'),
+('祐', 'u'),
+('祐', 'wu'),
+('祐', '도울 우'),
+('祐', '우'),
+('祓', 'bul'),
+('祓', 'pul'),
+('祓', '불'),
+('祓', '푸닥거리할 불'),
+('祔', 'bu'),
+('祔', 'pu'),
+('祔', 'worship ancestors'),
+('祔', '부'),
+('祔', '합사할 부'),
+('祕', 'bi'),
+('祕', 'pi'),
+('祕', '귀신 비'),
+('祕', '비'),
+('祖', 'Hanja form of 조 (“grandfather; ancestor”).'),
+('祖', '조'),
+('祖', '조상 조'),
+('祖', '할아버지'),
+('祗', '공경(恭敬)할'),
+('祗', '공경할 지'),
+('祗', '지'),
+('祘', 'san'),
+('祘', '산'),
+('祚', 'cho'),
+('祚', 'co'),
+('祚', 'jo'),
+('祚', '복 조'),
+('祚', '조'),
+('祛', ' 굳셀 거'),
+('祛', ' 빌 거'),
+('祛', 'exorcise'),
+('祛', 'geo'),
+('祛', 'ke'),
+('祛', 'kŏ'),
+('祛', 'shiver'),
+('祛', '거'),
+('祛', '물리칠 거'),
+('祜', 'ho'),
+('祜', '복 호'),
+('祜', '호'),
+('祝', ' 끊을 축'),
+('祝', ' 비로소 축'),
+('祝', 'Hanja form of 축 (“wish; celebrating”).'),
+('祝', '빌'),
+('祝', '빌 축'),
+('祝', '빌다'),
+('祝', '축'),
+('祝', '축문 주'),
+('神', ' 신명 신'),
+('神', ' 영검할 신'),
+('神', ' 정신 신'),
+('神', 'Hanja form of 신 (“ghost; spirit; phantom; god”).'),
+('神', '귀신'),
+('神', '신'),
+('神', '천신 신'),
+('祟', '빌미 수'),
+('祟', '수'),
+('祠', 'sa'),
+('祠', '사'),
+('祠', '사당 사'),
+('祢', '아비사당 니'),
+('祥', 'sang'),
+('祥', '상'),
+('祥', '상서로울 상'),
+('祧', 'ancestral temple'),
+('祧', 'cho'),
+('祧', 'co'),
+('祧', 'jo'),
+('祧', '조'),
+('祧', '조묘 조'),
+('票', ' 날랠 표'),
+('票', ' 문서 표'),
+('票', ' 불날릴 표'),
+('票', ' 훌쩍 날 표'),
+('票', '쪽지 표'),
+('票', '표'),
+('祫', 'enshrining together'),
+('祫', 'hyeop'),
+('祫', 'hyŏp'),
+('祫', '협'),
+('祭', '제사 제'),
+('祭', '제사 채'),
+('祵', 'alternative character for the surname 李'),
+('祵', '리'),
+('祵', '이'),
+('祷', 'do'),
+('祷', 'to'),
+('祷', '도'),
+('祺', 'gi'),
+('祺', 'ki'),
+('祺', '기'),
+('祺', '복 기'),
+('祼', 'sacrificial ceremony of pouring water to irrigate the field'),
+('祼', '강신제 관'),
+('祼', '관'),
+('祿', 'Hanja form of 복/록 (“blessing, happiness, fortune”).'),
+('祿', 'Hanja form of 복/록 (“bless”).'),
+('祿', 'Hanja form of 복/록 (“green, official salary”).'),
+('祿', 'Hanja form of 복/록 (“pay salary”).'),
+('祿', 'Hanja form of 복/록 (“sacrificial meat”).'),
+('祿', '녹'),
+('祿', '록'),
+('祿', '복'),
+('祿', '복 록'),
+('禀', ' 받을 품'),
+('禀', ' 사뢸 품'),
+('禀', ' 성품 품'),
+('禀', '여쭐 품'),
+('禁', 'Hanja form of 금 (“prohibition”).'),
+('禁', '금'),
+('禁', '금하다'),
+('禁', '금할'),
+('禁', '금할 금'),
+('禅', 'Zen'),
+('禅', 'sen'),
+('禅', 'seon'),
+('禅', 'sŏn'),
+('禅', '禪의 略字'),
+('禅', '선'),
+('禊', 'gye'),
+('禊', 'kye'),
+('禊', 'kyey'),
+('禊', 'semi-annual ceremony of purification'),
+('禊', '계'),
+('禊', '계제 계'),
+('禋', 'in'),
+('禋', 'offer sacrifice'),
+('禋', 'sacrifice'),
+('禋', '인'),
+('禋', '제사지낼 인'),
+('禍', 'disaster, calamity'),
+('禍', 'hwa'),
+('禍', '재화 화'),
+('禍', '화'),
+('禎', 'ceng'),
+('禎', 'chŏng'),
+('禎', 'jeong'),
+('禎', '상서로울 정'),
+('禎', '정'),
+('福', 'Hanja form of 복 (“fortune”).'),
+('福', '복'),
+('福', '복 복'),
+('禑', '복'),
+('禑', '우'),
+('禔', ' 편안할 시'),
+('禔', '복 시'),
+('禔', '복 제'),
+('禖', 'Hanja form of 매 (“ancient Chinese sacrifice held to get a son”).'),
+('禖', '매'),
+('禝', 'chik'),
+('禝', 'cik'),
+('禝', 'jik'),
+('禝', '사람 이름 직 '),
+('禝', '직'),
+('禦', ' 그칠 어'),
+('禦', '막을 어'),
+('禦', '어'),
+('禧', 'hui'),
+('禧', 'huy'),
+('禧', 'hŭi'),
+('禧', '복 희'),
+('禧', '희'),
+('禨', 'gi'),
+('禨', 'ki'),
+('禨', '기'),
+('禨', '조짐 기'),
+('禪', 'Zen'),
+('禪', 'sen'),
+('禪', 'seon'),
+('禪', 'sŏn'),
+('禪', '봉선 선'),
+('禪', '선'),
+('禫', 'dam'),
+('禫', 'tam'),
+('禫', '담'),
+('禫', '담제 담'),
+('禮', 'Hanja form of 례/예 (“manners; etiquette”).'),
+('禮', '례'),
+('禮', '례도/예도'),
+('禮', '예'),
+('禮', '예도 례'),
+('禰', '니'),
+('禰', '아비사당 니'),
+('禰', '이'),
+('禱', 'do'),
+('禱', 'to'),
+('禱', 'to pray'),
+('禱', '도'),
+('禱', '빌 도'),
+('禳', 'yang'),
+('禳', '양'),
+('禳', '푸닥거리할 양'),
+('禴', 'yak'),
+('禴', '약'),
+('禴', '종묘의 여름제사 약'),
+('禹', ' 느릴 우'),
+('禹', ' 성씨 우'),
+('禹', 'Yu the Great'),
+('禹', 'a surname'),
+('禹', 'king'),
+('禹', 'steel square'),
+('禹', 'u'),
+('禹', 'worm'),
+('禹', 'wu'),
+('禹', '우'),
+('禹', '하우씨 우'),
+('禺', 'ong'),
+('禺', '땅 이름 옹'),
+('禺', '옹'),
+('离', '산신 리'),
+('禽', 'Hanja form of 금 (“birds, fowl, winged animals”).'),
+('禽', '금'),
+('禽', '날짐승'),
+('禽', '날짐승 금'),
+('禾', 'rice'),
+('禾', 'the number of horse teeth'),
+('禾', '말 이빨의 수효'),
+('禾', '벼'),
+('禾', '벼 화'),
+('禾', '수'),
+('禾', '화'),
+('禿', 'Bald'),
+('禿', 'dok'),
+('禿', 'tok'),
+('禿', '대머리 독'),
+('禿', '독'),
+('秀', ' 벼 패일 수'),
+('秀', ' 아름다울 수'),
+('秀', ' 이삭 수'),
+('秀', 'outstanding, remarkable, excellent'),
+('秀', '빼어나다'),
+('秀', '빼어날'),
+('秀', '빼어날 수'),
+('秀', '수'),
+('私', 'Hanja form of 사 (“private, personal”).'),
+('私', '사'),
+('私', '사사'),
+('私', '사사 사'),
+('秃', 'dok'),
+('秃', 'tok'),
+('秃', '독'),
+('秆', 'gan'),
+('秆', 'kan'),
+('秆', '稈과 同字'),
+('秆', '간'),
+('秉', '병'),
+('秉', '잡을 병'),
+('秊', '年의 本字'),
+('秋', ' 때 추'),
+('秋', ' 말이 뛰놀 추'),
+('秋', ' 성씨 추'),
+('秋', ' 세월 추'),
+('秋', 'Hanja form of 추 (“autumn; fall”).'),
+('秋', 'Hanja form of 추 (“autumn; fall”). [affix]'),
+('秋', '가을'),
+('秋', '가을 추'),
+('秋', '추'),
+('种', '어릴 충'),
+('种', '충'),
+('科', 'Hanja form of 과 (“sort; class”).'),
+('科', '과'),
+('科', '과정'),
+('科', '과정 과'),
+('秒', 'Hanja form of 초 (“(geometry) a second of arc”).'),
+('秒', 'Hanja form of 초 (“the SI unit of time, second”).'),
+('秒', '까끄라기 묘'),
+('秒', '시간 단위 초'),
+('秒', '초'),
+('秕', 'bi'),
+('秕', 'pi'),
+('秕', '비'),
+('秕', '쭉정이 비'),
+('秖', 'chi'),
+('秖', 'ci'),
+('秖', 'ji'),
+('秖', '마침 지 '),
+('秖', '지'),
+('秘', 'bi'),
+('秘', 'pi'),
+('秘', '비'),
+('秘', '숨길 비'),
+('租', 'cho'),
+('租', 'co'),
+('租', 'jo'),
+('租', '구실 조'),
+('租', '조'),
+('秢', '벼 처음 익을 령 '),
+('秣', 'mal'),
+('秣', '꼴 말'),
+('秣', '말'),
+('秤', ' 백 근 칭'),
+('秤', 'balance, scale.'),
+('秤', 'ch''ing'),
+('秤', 'ching'),
+('秤', '저울 칭'),
+('秤', '칭'),
+('秦', 'Qin'),
+('秦', 'chin'),
+('秦', 'cin'),
+('秦', 'jin'),
+('秦', '벼 이름 진'),
+('秦', '진'),
+('秧', 'ang'),
+('秧', '모 앙'),
+('秧', '앙'),
+('秩', '질'),
+('秩', '차례 질'),
+('秪', 'chi'),
+('秪', 'ci'),
+('秪', 'ji'),
+('秪', '벼 처음 익을 지'),
+('秪', '지'),
+('秫', '차조'),
+('秫', '차조 출'),
+('秫', '출'),
+('秬', '거'),
+('秬', '검은 기장 거'),
+('秭', 'cha'),
+('秭', 'ja'),
+('秭', '자'),
+('称', 'ch''ing'),
+('称', 'ching'),
+('称', '稱과 同字'),
+('称', '칭'),
+('秸', ' 짚 고갱이 갈'),
+('秸', 'gal'),
+('秸', 'kal'),
+('秸', 'straw'),
+('秸', '갈'),
+('秸', '볏짚 갈'),
+('移', ' 모낼 이'),
+('移', ' 변할 이'),
+('移', 'Hanja form of 이 (“to change place”).'),
+('移', '옮기다'),
+('移', '옮길'),
+('移', '옮길 이'),
+('移', '이'),
+('稀', 'hui'),
+('稀', 'huy'),
+('稀', 'hŭi'),
+('稀', '드물 희'),
+('稀', '희'),
+('稁', 'go'),
+('稁', 'ko'),
+('稁', '稿와 同字 '),
+('稁', '고'),
+('稂', '강아지 풀 랑'),
+('稅', ' 거둘 세'),
+('稅', ' 끌를 탈'),
+('稅', ' 놓을 세'),
+('稅', ' 쉴 세'),
+('稅', 'Hanja form of 세 (“tax”).'),
+('稅', '구실 세'),
+('稅', '세'),
+('稅', '세금'),
+('稅', '풀 탈'),
+('稈', '간'),
+('稈', '짚 간'),
+('稊', 'darnels'),
+('稊', 'tares'),
+('稊', '강아지풀 제'),
+('稊', '제'),
+('程', ' 과정 정'),
+('程', ' 길 정'),
+('程', ' 품수 정'),
+('程', ' 한정 정'),
+('程', ' 헤아릴 정'),
+('程', 'ceng'),
+('程', 'chŏng'),
+('程', 'jeong'),
+('程', '법 정'),
+('程', '정'),
+('稌', '도'),
+('稌', '찰벼 도'),
+('稍', '벼 줄기 끝 초'),
+('稍', '초'),
+('税', '稅과 同字'),
+('税', '稅와 同字'),
+('稔', ' 오랠 염'),
+('稔', ' 해 염'),
+('稔', '곡식익을 임'),
+('稔', '풍년들 염'),
+('稗', ' 조그마할 패'),
+('稗', '돌피 패'),
+('稗', '패'),
+('稙', '올벼 직'),
+('稙', '직'),
+('稚', ' 늦을 치'),
+('稚', ' 어릴 치'),
+('稚', 'Hanja form of 치 (“infantile”).'),
+('稚', '어리다'),
+('稚', '어린 벼 치'),
+('稚', '어릴'),
+('稚', '치'),
+('稜', '모 릉'),
+('稞', '과'),
+('稞', '보리 과'),
+('稟', ' 받을 품'),
+('稟', ' 성품 품'),
+('稟', ' 줄 품'),
+('稟', '여쭐 품'),
+('稠', '빽빽할 조'),
+('稠', '빽빽할 주'),
+('稧', 'sel'),
+('稧', 'seol'),
+('稧', 'sŏl'),
+('稧', '볏단 설 '),
+('稧', '설'),
+('稭', 'gae'),
+('稭', 'kae'),
+('稭', '개'),
+('稭', '짚고갱이: straw'),
+('種', 'Hanja form of 종 (“(taxonomy) species”).'),
+('種', 'Hanja form of 종 (“kind; sort; type”).'),
+('種', 'Hanja form of 종 (“seed; kernel”).'),
+('種', 'Hanja form of 종 (“to plant; to cultivate”).'),
+('種', 'Hanja form of 종 (“to transplant; to inoculate”).'),
+('種', '심다'),
+('種', '심을'),
+('種', '씨'),
+('種', '씨 종'),
+('種', '종'),
+('稱', ' 같을 칭'),
+('稱', ' 일컬을 칭'),
+('稱', ' 헤아릴 칭'),
+('稱', 'ch''ing'),
+('稱', 'ching'),
+('稱', '저울질할 칭'),
+('稱', '칭'),
+('稲', 'do'),
+('稲', 'to'),
+('稲', '稻의 俗字'),
+('稲', '도'),
+('稳', 'on'),
+('稳', '穩의 俗字'),
+('稳', '온'),
+('稶', 'uk'),
+('稶', 'wuk'),
+('稶', '서직 무성할 욱 '),
+('稶', '욱'),
+('稷', 'chik'),
+('稷', 'cik'),
+('稷', 'jik'),
+('稷', '기장 직'),
+('稷', '직'),
+('稹', 'chin'),
+('稹', 'cin'),
+('稹', 'jin'),
+('稹', '떨기로 날 진 '),
+('稹', '진'),
+('稻', 'Hanja form of 도 (“rice plant”).'),
+('稻', '도'),
+('稻', '벼'),
+('稻', '벼 도'),
+('稼', 'Hanja form of 가 (“work”).'),
+('稼', '가'),
+('稼', '심다'),
+('稼', '심을'),
+('稼', '심을 가'),
+('稽', 'Hanja form of 계 (“to examine”).'),
+('稽', '계'),
+('稽', '머무를 계'),
+('稽', '상고하다'),
+('稽', '상고할'),
+('稿', 'Hanja form of 고 (“draft, manuscript”).'),
+('稿', '고'),
+('稿', '볏집'),
+('稿', '볏집 고'),
+('穀', 'Hanja form of 곡 (“grain”).'),
+('穀', '곡'),
+('穀', '곡식'),
+('穀', '곡식 곡'),
+('穀', '구'),
+('穀', '녹봉 구'),
+('穅', ' 악기이름 강'),
+('穅', '강'),
+('穅', '겨 강'),
+('穆', 'mok'),
+('穆', '목'),
+('穆', '화목할 목'),
+('穉', 'Alternative form of 稚 (“Hanja form of 치 (“infantile”).”)'),
+('穉', '稚와 同字'),
+('穉', '어리다'),
+('穉', '어릴'),
+('穉', '치'),
+('穌', ' 기뻐할 소'),
+('穌', ' 숨 쉴 소'),
+('穌', 'so'),
+('穌', '깨어날 소'),
+('穌', '소'),
+('積', ' 넓이 적'),
+('積', ' 모을 적'),
+('積', ' 부피 적'),
+('積', 'product'),
+('積', '저출할 자'),
+('積', '적'),
+('積', '포갤 적'),
+('穎', ' 빼어날 영'),
+('穎', ' 송곳 끝 영'),
+('穎', 'yeng'),
+('穎', 'yeong'),
+('穎', 'yŏng'),
+('穎', '영'),
+('穎', '이삭 영'),
+('穏', '穩과 同字'),
+('穐', '秋의 古字'),
+('穗', 'su'),
+('穗', 'swu'),
+('穗', '수'),
+('穗', '이삭 수'),
+('穜', 'dong'),
+('穜', 'tong'),
+('穜', '늦벼: late crop'),
+('穜', '동'),
+('穠', 'dense'),
+('穠', 'luxuriant'),
+('穠', 'nong'),
+('穠', 'profound'),
+('穠', '농'),
+('穠', '후한 제사 농'),
+('穡', 'farm, harvest grain'),
+('穡', 'saek'),
+('穡', 'sayk'),
+('穡', 'stingy'),
+('穡', '거둘 색'),
+('穡', '색'),
+('穢', ' 거칠 예'),
+('穢', 'ye'),
+('穢', 'yey'),
+('穢', '더러울 예'),
+('穢', '예'),
+('穩', ' 곡식 걷어 모을 온'),
+('穩', 'Hanja form of 온 (“peaceful”).'),
+('穩', '온'),
+('穩', '편안하다'),
+('穩', '편안할'),
+('穩', '편안할 온'),
+('穫', 'Hanja form of 호 (“only used in 초호 (焦穫, Choho), historical place in ancient China”).'),
+('穫', 'Hanja form of 확 (“to cut grain”).'),
+('穫', 'Hanja form of 확 (“to harvest; to reap”).'),
+('穫', '땅 이름'),
+('穫', '땅 이름 호'),
+('穫', '벼 벨'),
+('穫', '벼 벨 확'),
+('穫', '호'),
+('穫', '확'),
+('穰', 'Hanja form of 양 (“rice straw”).'),
+('穰', '양'),
+('穰', '짚'),
+('穰', '풍년들 양'),
+('穴', ' 굿 혈'),
+('穴', ' 움 혈'),
+('穴', ' 틈 혈'),
+('穴', 'cave, cavern, cavity; den, burrow, sett'),
+('穴', 'dugout'),
+('穴', 'hole, hollow'),
+('穴', 'pit, ditch'),
+('穴', '구멍'),
+('穴', '굴 혈'),
+('穴', '혈'),
+('穵', '구멍 알'),
+('穵', '알'),
+('究', 'Hanja form of 구 (“examine, investigate”).'),
+('究', '구'),
+('究', '궁리할 구'),
+('究', '연구하다'),
+('究', '연구할'),
+('穹', 'Hanja form of 궁 (“arched”).'),
+('穹', 'Hanja form of 궁 (“sky; heaven”).'),
+('穹', '궁'),
+('穹', '높을 궁'),
+('穹', '하늘'),
+('空', 'Hanja form of 공 (“empty; void”).'),
+('空', 'Hanja form of 공 (“sky; air”).'),
+('空', 'Hanja form of 공 (“zero”).'),
+('空', '공'),
+('空', '비다'),
+('空', '빌'),
+('空', '빌 공'),
+('穽', ' 함정 정'),
+('穽', 'ceng'),
+('穽', 'chŏng'),
+('穽', 'jeong'),
+('穽', '구덩이 정'),
+('穽', '정'),
+('穾', ' 골방 요 '),
+('穾', 'yo'),
+('穾', '깊숙할 요'),
+('穾', '요'),
+('穿', 'Hanja form of 천 (“to put on”).'),
+('穿', '뚫다'),
+('穿', '뚫을'),
+('穿', '뚫을 천'),
+('穿', '천'),
+('窀', 'dun'),
+('窀', 'tun'),
+('窀', 'twun'),
+('窀', '광중 둔'),
+('窀', '둔'),
+('突', 'Hanja form of 돌 (“dash; clash”).'),
+('突', 'Hanja form of 돌 (“protrusion; penetration; piercing”).'),
+('突', 'Hanja form of 돌 (“sudden”).'),
+('突', '갑자기'),
+('突', '돌'),
+('突', '부딪칠 돌'),
+('窂', '우리 로 '),
+('窃', '竊의 俗字'),
+('窄', 'ch''ak'),
+('窄', 'chak'),
+('窄', '좁을 착'),
+('窄', '착'),
+('窅', ' 까마득할 요'),
+('窅', 'yo'),
+('窅', '요'),
+('窅', '움펑눈 요'),
+('窆', ' 광중 폄'),
+('窆', 'p''yŏm'),
+('窆', 'phyem'),
+('窆', 'pyeom'),
+('窆', 'to put a coffin in a grave'),
+('窆', '폄'),
+('窆', '하관할 폄'),
+('窈', ' 깊을 요'),
+('窈', '고요할 요'),
+('窈', '요'),
+('窊', 'wa'),
+('窊', '와'),
+('窊', '웅덩이 와'),
+('窒', ' 가득할 절'),
+('窒', '막을 절'),
+('窒', '막을 질'),
+('窓', 'Hanja form of 창 (“window”).'),
+('窓', '창'),
+('窓', '창 창'),
+('窓', '창문'),
+('窕', 'cho'),
+('窕', 'co'),
+('窕', 'jo'),
+('窕', '정숙할 조'),
+('窕', '조'),
+('窗', '창'),
+('窗', '창 창'),
+('窘', 'embarrassed'),
+('窘', 'hard-pressed'),
+('窘', '군'),
+('窘', '군색할 군'),
+('窛', '구'),
+('窛', '노략질할 구 '),
+('窛', '도적'),
+('窟', 'Hanja form of 굴 (“cave; hole”).'),
+('窟', 'Hanja form of 굴 (“cave; hole”). [noun]'),
+('窟', '구멍 굴'),
+('窟', '굴'),
+('窠', 'den'),
+('窠', 'hole'),
+('窠', 'indentation'),
+('窠', 'nest'),
+('窠', '과'),
+('窠', '보금자리 과'),
+('窣', ' 구멍으로 나올 솔'),
+('窣', ' 우지직거릴 솔'),
+('窣', 'sol'),
+('窣', '느릿느릿 걸을 솔'),
+('窣', '솔'),
+('窩', ' 움집 와'),
+('窩', 'a dugout hut'),
+('窩', 'cave'),
+('窩', 'nest'),
+('窩', '굴 와'),
+('窩', '와'),
+('窪', ' 깊을 와'),
+('窪', '도랑 와'),
+('窪', '와'),
+('窬', 'penetrate'),
+('窬', 'wickets'),
+('窬', 'yu'),
+('窬', '유'),
+('窬', '판장문 유'),
+('窮', 'Hanja form of 궁 (“poor, destitute, impoverished”).'),
+('窮', '궁'),
+('窮', '궁할'),
+('窮', '다할'),
+('窮', '다할 궁'),
+('窯', ' 오지그릇 요'),
+('窯', 'yo'),
+('窯', '기와가마 요'),
+('窯', '요'),
+('窳', ' 약할 유'),
+('窳', ' 짐승이름 유'),
+('窳', 'yu'),
+('窳', '유'),
+('窳', '이지러질 유'),
+('窶', 'gu'),
+('窶', 'ku'),
+('窶', 'kwu'),
+('窶', '가난하여 예절없을 구'),
+('窶', '구'),
+('窹', '아궁이 오 '),
+('窹', '오'),
+('窺', 'gyu'),
+('窺', 'kyu'),
+('窺', '규'),
+('窺', '엿볼 규'),
+('窻', '창 창 '),
+('窾', 'gwan'),
+('窾', 'kwan'),
+('窾', '관'),
+('窾', '빌 관'),
+('窿', '활꼴 륭'),
+('竄', '숨을 찬'),
+('竄', '찬'),
+('竅', 'gyu'),
+('竅', 'kyu'),
+('竅', '구멍 규'),
+('竅', '규'),
+('竇', '구멍 두'),
+('竇', '두'),
+('竈', '부엌 조'),
+('竈', '조'),
+('竊', ' 얕을 절'),
+('竊', 'Hanja form of 절 (“to steal”).'),
+('竊', '절'),
+('竊', '좀도둑 절'),
+('竊', '훔치다'),
+('竊', '훔칠'),
+('立', 'Hanja form of 립/입 (“to stand; to make erect; to establish”).'),
+('立', '립'),
+('立', '서다'),
+('立', '설'),
+('立', '설 립'),
+('立', '입'),
+('竗', 'myo'),
+('竗', '땅 이름 묘 '),
+('竗', '묘'),
+('站', '우두커니 설 참'),
+('站', '참'),
+('竚', '저'),
+('竜', '龍의 古字'),
+('竜', '두덕 롱'),
+('竝', ' 고을이름 반'),
+('竝', 'Hanja form of 반 (“used in place names”).'),
+('竝', 'Hanja form of 방 (“side, vicinity”).'),
+('竝', 'Hanja form of 병 (“combine, annex”).'),
+('竝', 'Hanja form of 병 (“side by side, together, in order”).'),
+('竝', '곁'),
+('竝', '나란히'),
+('竝', '땅 이름'),
+('竝', '반'),
+('竝', '방'),
+('竝', '병'),
+('竝', '아우르다'),
+('竝', '아우를'),
+('竝', '아우를 병'),
+('竝', '짝지을 반'),
+('竟', 'Hanja form of 경 (“exhaust, end”).'),
+('竟', '경'),
+('竟', '다하다'),
+('竟', '다할'),
+('竟', '다할 경'),
+('章', 'Hanja form of 장 (“chapter”).'),
+('章', '글'),
+('章', '문채 장'),
+('章', '장'),
+('竢', 'as soon as'),
+('竢', 'sa'),
+('竢', 'wait for'),
+('竢', 'wait until'),
+('竢', '기다릴 사'),
+('竢', '사'),
+('竣', ' 물러설 전'),
+('竣', '마칠 준'),
+('竣', '일 마칠 전'),
+('童', 'Hanja form of 동 (“child”).'),
+('童', '동'),
+('童', '아이'),
+('童', '아이 동'),
+('竦', ' 높일 송'),
+('竦', ' 두려울 송'),
+('竦', ' 솟을 송'),
+('竦', '공경할 송'),
+('竦', '송'),
+('竪', ' 더벅머리 수'),
+('竪', ' 서있을 수'),
+('竪', 'su'),
+('竪', 'swu'),
+('竪', '세울 수'),
+('竪', '수'),
+('竭', ' 마를 갈'),
+('竭', ' 마를 걸'),
+('竭', '다할 갈'),
+('竭', '다할 걸'),
+('端', 'Hanja form of 단 (“(geography) cape”).'),
+('端', 'Hanja form of 단 (“clue”).'),
+('端', 'Hanja form of 단 (“end”).'),
+('端', '끝'),
+('端', '끝 단'),
+('端', '단'),
+('競', 'Hanja form of 경 (“competition”).'),
+('競', '겨룰 경'),
+('競', '경'),
+('競', '다투다'),
+('競', '다툴'),
+('竸', 'gyeong'),
+('竸', 'kyeng'),
+('竸', 'kyŏng'),
+('竸', '競과 同字'),
+('竸', '경'),
+('竹', 'Hanja form of 죽 (“bamboo”).'),
+('竹', '대 죽'),
+('竹', '대나무'),
+('竹', '죽'),
+('竺', '나라이름 축'),
+('竺', '두터울 독'),
+('竽', 'chief'),
+('竽', 'flute'),
+('竽', '우'),
+('竽', '큰 생황 우'),
+('竽', '피리'),
+('竿', ' 화살대 간'),
+('竿', ' 횃대 간'),
+('竿', 'gan'),
+('竿', 'kan'),
+('竿', '간'),
+('竿', '장대 간'),
+('笆', ' 울타리 파'),
+('笆', '가시 대 파'),
+('笆', '파'),
+('笈', '급'),
+('笈', '책상자 급'),
+('笊', 'cho'),
+('笊', 'co'),
+('笊', 'jo'),
+('笊', '조'),
+('笊', '조리 조'),
+('笋', 'sun'),
+('笋', 'swun'),
+('笋', '순'),
+('笋', '초목 성할 순'),
+('笌', 'a'),
+('笌', '대싹 아 '),
+('笌', '아'),
+('笏', 'a tablet held by officials at court (used to take notes, or for ceremonial purposes)'),
+('笏', 'hol'),
+('笏', '홀'),
+('笏', '홀 홀'),
+('笑', 'Hanja form of 소 (“laugh”).'),
+('笑', '소'),
+('笑', '웃다'),
+('笑', '웃을'),
+('笑', '웃음 소'),
+('笒', 'geum'),
+('笒', 'kum'),
+('笒', 'kŭm'),
+('笒', '금'),
+('笒', '첨대 금 '),
+('笘', '점'),
+('笙', 'saeng'),
+('笙', 'sayng'),
+('笙', '생'),
+('笙', '생황 생'),
+('笛', ' 날라리 적'),
+('笛', 'cek'),
+('笛', 'chŏk'),
+('笛', 'jeok'),
+('笛', '적'),
+('笛', '피리 적'),
+('笞', 't''ae'),
+('笞', 'tae'),
+('笞', 'thay'),
+('笞', 'whip'),
+('笞', '볼기칠 태'),
+('笞', '태'),
+('笠', '립'),
+('笠', '삿갓'),
+('笠', '우리 립'),
+('笠', '입'),
+('笥', 'sa'),
+('笥', '사'),
+('笥', '상자 사'),
+('符', 'Hanja form of 부 (“mark, tally, symbol, charm, ID tag”).'),
+('符', '부'),
+('符', '부신 부'),
+('符', '부호'),
+('笧', 'ch''aek'),
+('笧', 'chaek'),
+('笧', 'chayk'),
+('笧', 'to check (a current) with a weir'),
+('笧', 'to entwine around'),
+('笧', '책'),
+('笧', '책 상자 책'),
+('笨', 'Hanja form of 분 (“mediocre; rough”).'),
+('笨', 'bun'),
+('笨', 'pun'),
+('笨', '거칠 분'),
+('笨', '분'),
+('笪', 't'),
+('笪', '갇'),
+('笪', '고리짝 단'),
+('第', 'Hanja form of 제 (“turn; sequence”).'),
+('第', '제'),
+('第', '집 제'),
+('第', '차례(次例)'),
+('笭', '도꼬마리 령'),
+('笯', '노'),
+('笯', '새장 노'),
+('笱', 'a fish trap'),
+('笱', 'a weir made of willow or bamboo'),
+('笱', 'gu'),
+('笱', 'ku'),
+('笱', 'kwu'),
+('笱', '구'),
+('笳', '가'),
+('笳', '갈잎피리 가'),
+('笵', 'beom'),
+('笵', 'pem'),
+('笵', 'pŏm'),
+('笵', '범'),
+('笵', '법 범'),
+('笹', 'Hanja form of 세 (“Sasa borealis”).'),
+('笹', '가는 대 세'),
+('笹', '세'),
+('笹', '조릿대'),
+('笻', 'gong'),
+('笻', 'kong'),
+('笻', '공'),
+('笻', '대이름 공 '),
+('筅', 'sen'),
+('筅', 'seon'),
+('筅', 'sŏn'),
+('筅', '선'),
+('筅', '솔 선'),
+('筆', ' 오랑캐 이름 필'),
+('筆', 'Hanja form of 필 (“writing brush; to write; stroke”).'),
+('筆', '붓'),
+('筆', '붓 필'),
+('筆', '필'),
+('筈', 'gwal'),
+('筈', 'kwal'),
+('筈', '괄'),
+('筈', '하눌타리 괄'),
+('等', 'Hanja form of 등 (“et cetera”).'),
+('等', 'Hanja form of 등 (“rank, class, order”).'),
+('等', '가지런할 등'),
+('等', '등'),
+('等', '무리'),
+('筋', 'geun'),
+('筋', 'kun'),
+('筋', 'kŭn'),
+('筋', '근'),
+('筋', '힘줄 근'),
+('筌', '전'),
+('筌', '통발'),
+('筌', '통발 전'),
+('筍', ' 대싹 순'),
+('筍', 'sprout, shoot'),
+('筍', 'sun'),
+('筍', 'swun'),
+('筍', '순'),
+('筍', '죽순 순'),
+('筏', '떼 벌'),
+('筏', '벌'),
+('筐', 'basket made of bamboo'),
+('筐', '광'),
+('筐', '광주리 광'),
+('筑', '비파 축'),
+('筑', '축'),
+('筒', ' 통 통'),
+('筒', 't''ong'),
+('筒', 'thong'),
+('筒', 'tong'),
+('筒', '사통대 통'),
+('筒', '통'),
+('筓', 'gye'),
+('筓', 'kye'),
+('筓', 'kyey'),
+('筓', '계'),
+('筓', '비녀 계'),
+('答', 'Hanja form of 답 (“answer”).'),
+('答', '답'),
+('答', '답하다'),
+('答', '답할'),
+('答', '젖을 답'),
+('筕', '거친 대자리'),
+('筕', '행'),
+('策', 'ch''aek'),
+('策', 'chaek'),
+('策', 'chayk'),
+('策', '채찍 책'),
+('策', '책'),
+('筟', 'bu'),
+('筟', 'pu'),
+('筟', '대청 부 '),
+('筟', '부'),
+('筠', 'gyun'),
+('筠', 'kyun'),
+('筠', '균'),
+('筠', '대껍질 균'),
+('筥', ' 볏단 거'),
+('筥', 'geo'),
+('筥', 'ke'),
+('筥', 'kŏ'),
+('筥', '거'),
+('筥', '쌀 담는 광주리 거'),
+('筦', 'a wind instrument'),
+('筦', 'administer'),
+('筦', 'flute'),
+('筦', 'gwan'),
+('筦', 'kwan'),
+('筦', '관'),
+('筦', '피리 관'),
+('筧', 'gyeon'),
+('筧', 'kyen'),
+('筧', 'kyŏn'),
+('筧', '견'),
+('筧', '대 홈통 견'),
+('筩', ' 낚시 통'),
+('筩', 't''ong'),
+('筩', 'thong'),
+('筩', 'tong'),
+('筩', 'tube made of bamboo'),
+('筩', '대나무통 통'),
+('筩', '통'),
+('筬', 'seng'),
+('筬', 'seong'),
+('筬', 'sŏng'),
+('筬', '바디 성'),
+('筬', '성'),
+('筮', 'se'),
+('筮', 'seo'),
+('筮', 'sŏ'),
+('筮', '서'),
+('筮', '점대 서'),
+('筱', 'so'),
+('筱', '가는 대 소'),
+('筱', '소'),
+('筲', 'a bamboo bowl'),
+('筲', 'bamboo ware'),
+('筲', '소'),
+('筳', '대쪽 정'),
+('筳', '정'),
+('筵', 'yen'),
+('筵', 'yeon'),
+('筵', 'yŏn'),
+('筵', '대자리 연'),
+('筵', '연'),
+('筽', 'A willow trunk.'),
+('筽', '버들 고리 오 '),
+('筽', '버들고리'),
+('筽', '오'),
+('筿', 'so'),
+('筿', '篠와 同字 '),
+('筿', '소'),
+('箇', ' 개수 개'),
+('箇', 'Alternative form of 個 (“Hanja form of 개 (“piece”).”)'),
+('箇', '개'),
+('箇', '낱'),
+('箇', '낱 개'),
+('箋', ' 글 전'),
+('箋', 'Hanja form of 전 (“record”).'),
+('箋', '기록하다'),
+('箋', '기록할'),
+('箋', '기록할 전'),
+('箋', '전'),
+('箍', 'go'),
+('箍', 'ko'),
+('箍', '고'),
+('箍', '테 고'),
+('箎', 'ho'),
+('箎', '긴 대 호'),
+('箎', '호'),
+('箏', ' 풍경 쟁'),
+('箏', 'cayng'),
+('箏', 'chaeng'),
+('箏', 'jaeng'),
+('箏', '쟁'),
+('箏', '쟁 쟁'),
+('箒', 'broom'),
+('箒', 'ch''u'),
+('箒', 'chu'),
+('箒', 'chwu'),
+('箒', 'to sweep'),
+('箒', '비 추'),
+('箒', '추'),
+('箔', 'bak'),
+('箔', 'pak'),
+('箔', '박'),
+('箔', '발 박'),
+('箕', 'gi'),
+('箕', 'ki'),
+('箕', '기'),
+('箕', '키 기'),
+('算', 'Hanja form of 산 (“to count; to calculate”).'),
+('算', '산'),
+('算', '셀 산'),
+('算', '셈'),
+('箙', 'bok'),
+('箙', 'pok'),
+('箙', '복'),
+('箙', '전동 복'),
+('箚', 'ch''a'),
+('箚', 'cha'),
+('箚', '차'),
+('箚', '차자 차'),
+('箜', 'gong'),
+('箜', 'kong'),
+('箜', '공'),
+('箜', '공후 공'),
+('箝', ' 목 잠글 겸'),
+('箝', ' 족집개 겸'),
+('箝', 'gyeom'),
+('箝', 'kyem'),
+('箝', 'kyŏm'),
+('箝', 'pincers'),
+('箝', 'pliers'),
+('箝', 'tongs'),
+('箝', 'tweezers'),
+('箝', '겸'),
+('箝', '재갈 겸'),
+('箠', ' 볼기채 추'),
+('箠', 'ch''u'),
+('箠', 'chu'),
+('箠', 'chwu'),
+('箠', 'rod'),
+('箠', 'whip'),
+('箠', '채찍 추'),
+('箠', '추'),
+('管', 'Hanja form of 관 (“pipe, tube”).'),
+('管', 'Hanja form of 관 (“piri, a woodwind instrument”).'),
+('管', '관'),
+('管', '피리'),
+('管', '피리 관'),
+('箪', '단'),
+('箪', '밥그릇 단'),
+('箭', ' 약이름 전'),
+('箭', 'Hanja form of 전 (“arrow”).'),
+('箭', '전'),
+('箭', '화살'),
+('箭', '화살 전'),
+('箱', 'Hanja form of 상 (“box”).'),
+('箱', '상'),
+('箱', '상자'),
+('箱', '상자 상'),
+('箴', 'cam'),
+('箴', 'cham'),
+('箴', 'jam'),
+('箴', '바늘 잠'),
+('箴', '잠'),
+('箸', 'ce'),
+('箸', 'chŏ'),
+('箸', 'jeo'),
+('箸', '저'),
+('箸', '젓가락 저'),
+('箾', 'so'),
+('箾', '상소 소'),
+('箾', '소'),
+('節', ' 절개 절'),
+('節', 'Hanja form of 절 (“anniversary”).'),
+('節', 'Hanja form of 절 (“etiquette”).'),
+('節', 'Hanja form of 절 (“node; joint; incision”).'),
+('節', 'Hanja form of 절 (“verse; beat”).'),
+('節', '마디'),
+('節', '마디 절'),
+('節', '절'),
+('篁', 'bamboo grove'),
+('篁', 'hwang'),
+('篁', '대숲 황'),
+('篁', '황'),
+('範', 'Hanja form of 범 (“pattern, model, rule, law”).'),
+('範', '범'),
+('範', '법'),
+('範', '법 범'),
+('篆', 'cen'),
+('篆', 'chŏn'),
+('篆', 'jeon'),
+('篆', '문체이름 전'),
+('篆', '전'),
+('篇', ' 편차할 편'),
+('篇', '책 편'),
+('篇', '편'),
+('築', ' 쌓을 축'),
+('築', '다질 축'),
+('築', '쌓다'),
+('築', '쌓을'),
+('築', '축'),
+('篊', 'hong'),
+('篊', '홈통 홍 '),
+('篊', '홍'),
+('篋', ' 행담 협'),
+('篋', 'case'),
+('篋', 'hyeop'),
+('篋', 'hyep'),
+('篋', 'hyŏp'),
+('篋', 'rattan box, suitcase'),
+('篋', '상자 협'),
+('篋', '협'),
+('篌', 'hu'),
+('篌', 'hwu'),
+('篌', '공후 후'),
+('篌', '후'),
+('篒', 'A bamboo rice-tub.'),
+('篒', '대밥통'),
+('篒', '식'),
+('篔', 'un'),
+('篔', 'wun'),
+('篔', '왕대나무 운'),
+('篔', '운'),
+('篙', 'a punting pole'),
+('篙', 'go'),
+('篙', 'ko'),
+('篙', 'oar'),
+('篙', '고'),
+('篙', '상앗대 고'),
+('篛', 'yak'),
+('篛', '약'),
+('篛', '죽순 약'),
+('篝', 'gu'),
+('篝', 'ku'),
+('篝', 'kwu'),
+('篝', '구'),
+('篝', '불덮개 구'),
+('篠', 'so'),
+('篠', '가는 대 소'),
+('篠', '소'),
+('篡', 'ch''an'),
+('篡', 'chan'),
+('篡', '빼앗을 찬'),
+('篡', '찬'),
+('篤', 'Hanja form of 독 (“deep, true, sincere, genuine”).'),
+('篤', '도타울'),
+('篤', '도타울 독'),
+('篤', '도탑다'),
+('篤', '독'),
+('篥', '대 이름 률'),
+('篦', 'bi'),
+('篦', 'pi'),
+('篦', '비'),
+('篦', '빗치개 비'),
+('篩', 'sa'),
+('篩', '사'),
+('篩', '체 사'),
+('篪', 'chi'),
+('篪', 'ci'),
+('篪', 'ji'),
+('篪', '저 이름 지'),
+('篪', '지'),
+('篭', '籠과 同字'),
+('篳', ' 나무 실은 수레 필'),
+('篳', 'p''il'),
+('篳', 'phil'),
+('篳', 'pil'),
+('篳', '대 사립문 필'),
+('篳', '필'),
+('篷', 'bong'),
+('篷', 'pong'),
+('篷', '뜸 봉'),
+('篷', '봉'),
+('篸', 'hairpin'),
+('篸', 'needle'),
+('篸', '잠'),
+('篾', 'myel'),
+('篾', 'myeol'),
+('篾', 'myŏl'),
+('篾', '대 껍질 멸'),
+('篾', '멸'),
+('簀', 'ch''aek'),
+('簀', 'chaek'),
+('簀', 'chayk'),
+('簀', '살평상 책'),
+('簀', '책'),
+('簇', 'chok'),
+('簇', 'cok'),
+('簇', 'jok'),
+('簇', '모일 족'),
+('簇', '족'),
+('簉', ' 가지런히 날 추'),
+('簉', '버금 추'),
+('簉', '추'),
+('簋', 'gwe'),
+('簋', 'kwe'),
+('簋', 'kwey'),
+('簋', '궤'),
+('簋', '대제기 궤'),
+('簏', '대 상자 록'),
+('簑', 'sa'),
+('簑', '蓑와 同字'),
+('簑', '사'),
+('簒', 'ch''an'),
+('簒', 'chan'),
+('簒', 'usurp'),
+('簒', '빼앗을 찬'),
+('簒', '찬'),
+('簔', 'sa'),
+('簔', '사'),
+('簘', 'so'),
+('簘', '簫와 同字'),
+('簘', '소'),
+('簞', 'a bamboo basket'),
+('簞', '단'),
+('簞', '대광주리'),
+('簞', '소쿠리 단'),
+('簟', ' 대 이름 점'),
+('簟', 'cem'),
+('簟', 'chŏm'),
+('簟', 'jeom'),
+('簟', '삿자리 점'),
+('簟', '점'),
+('簠', 'bo'),
+('簠', 'po'),
+('簠', '보'),
+('簠', '제기 이름 보'),
+('簡', 'Hanja form of 간 (“concise; brief”).'),
+('簡', 'Hanja form of 간 (“letter; epistle”).'),
+('簡', 'Hanja form of 간 (“simple; uncomplicated”).'),
+('簡', 'Hanja form of 간 (“to select; to choose; to pick”).'),
+('簡', '간'),
+('簡', '대쪽'),
+('簡', '대쪽 간'),
+('簧', 'reed of woodwind instrument'),
+('簧', '혀 황'),
+('簧', '황'),
+('簪', 'cam'),
+('簪', 'cham'),
+('簪', 'jam'),
+('簪', '비녀 잠'),
+('簪', '잠'),
+('簫', ' 활고지 소'),
+('簫', 'so'),
+('簫', '소'),
+('簫', '퉁소 소'),
+('簷', 'ch''ŏm'),
+('簷', 'chem'),
+('簷', 'cheom'),
+('簷', '처마 첨'),
+('簷', '첨'),
+('簸', ' 키 파'),
+('簸', 'p''a'),
+('簸', 'pa'),
+('簸', 'pha'),
+('簸', 'winnower'),
+('簸', '까부를 파'),
+('簸', '파'),
+('簽', 'ch''ŏm'),
+('簽', 'chem'),
+('簽', 'cheom'),
+('簽', '농 첨'),
+('簽', '첨'),
+('簾', 'Hanja form of 렴/염 (“blind; curtain”).'),
+('簾', '렴'),
+('簾', '발'),
+('簾', '발 렴'),
+('簾', '염'),
+('簿', 'Hanja form of 박 (“silkworm-raising basket”).'),
+('簿', 'Hanja form of 박 (“thin, light, frail”).'),
+('簿', 'Hanja form of 부 (“register, account book, notebook”).'),
+('簿', '박'),
+('簿', '부'),
+('簿', '얇다'),
+('簿', '얇을'),
+('簿', '잠박'),
+('簿', '잠박 박'),
+('簿', '장부'),
+('簿', '장부 부'),
+('籃', '바구니 람'),
+('籌', 'chu'),
+('籌', 'cwu'),
+('籌', 'ju'),
+('籌', '주'),
+('籌', '투호 살 주'),
+('籍', ' 압수할 적'),
+('籍', ' 왁자할 적'),
+('籍', ' 임금이 가는 밭 적'),
+('籍', ' 호적 적'),
+('籍', 'cek'),
+('籍', 'chŏk'),
+('籍', 'jeok'),
+('籍', '문서 적'),
+('籍', '적'),
+('籐', 'deung'),
+('籐', 'tung'),
+('籐', 'tŭng'),
+('籐', '대 기구 등'),
+('籐', '등'),
+('籒', '주'),
+('籒', '주문 주 '),
+('籔', ' 곡식 세는 단위 휘 수'),
+('籔', ' 또아리 수'),
+('籔', 'su'),
+('籔', 'swu'),
+('籔', '수'),
+('籔', '조리 수'),
+('籛', '성씨 전'),
+('籛', '전'),
+('籜', '대 껍질 탁'),
+('籜', '탁'),
+('籟', '세 구멍 퉁소 뢰'),
+('籠', 'Hanja form of 롱/농 (“basket”).'),
+('籠', '농'),
+('籠', '대그릇 롱'),
+('籠', '대바구니'),
+('籠', '롱'),
+('籢', '경대'),
+('籢', '렴'),
+('籢', '염'),
+('籤', 'Hanja form of 첨 (“lottery”).'),
+('籤', '제비'),
+('籤', '제비 첨'),
+('籤', '첨'),
+('籥', ' 잠글 약'),
+('籥', 'Hanja form of 약 (“an ancient notched vertical bamboo flute of Chinese origin with three fingerholes used today only in Confucian ritual music and dance in South Korea”).'),
+('籥', '약'),
+('籥', '피리 약'),
+('籧', ' 양잠기 거'),
+('籧', ' 천상바라기 거'),
+('籧', 'geo'),
+('籧', 'ke'),
+('籧', 'kŏ'),
+('籧', '거'),
+('籧', '대자리 거'),
+('籨', '경대'),
+('籨', '렴'),
+('籨', '염'),
+('籩', 'byeon'),
+('籩', 'pyen'),
+('籩', 'pyŏn'),
+('籩', '변'),
+('籩', '제기 이름 변'),
+('籬', '리'),
+('籬', '울타리 리'),
+('籬', '이'),
+('籲', '부르짖을 유'),
+('籲', '유'),
+('米', 'Hanja form of 미 (“rice”).'),
+('米', 'Hanja form of 미 (“rice”). [affix]'),
+('米', '미'),
+('米', '쌀'),
+('米', '쌀 미'),
+('类', '나눌 류'),
+('籾', '벼 인'),
+('籾', '인'),
+('粁', '천'),
+('粁', '킬로메트르 천'),
+('粃', 'bi'),
+('粃', 'pi'),
+('粃', '비'),
+('粃', '쭉정이 비'),
+('粉', 'Hanja form of 분 (“powder”).'),
+('粉', '가루'),
+('粉', '가루 분'),
+('粉', '분'),
+('粍', 'mo'),
+('粍', '모'),
+('粍', '밀리메트로 모'),
+('粒', 'Hanja form of 립/입 (“grain”).'),
+('粒', '립'),
+('粒', '알'),
+('粒', '알 립'),
+('粒', '입'),
+('粔', 'a kind of fried honey-cake'),
+('粔', '거'),
+('粕', 'bak'),
+('粕', 'pak'),
+('粕', '박'),
+('粕', '지게미 박'),
+('粗', 'cho'),
+('粗', 'co'),
+('粗', 'jo'),
+('粗', '거칠 조'),
+('粗', '조'),
+('粘', ' 끈끈할 점'),
+('粘', 'Hanja form of 점 (“sticky”).'),
+('粘', '붙다'),
+('粘', '붙을'),
+('粘', '붙일 점'),
+('粘', '점'),
+('粟', ' 겉곡식 속'),
+('粟', 'sok'),
+('粟', '속'),
+('粟', '좁쌀 속'),
+('粢', 'ca'),
+('粢', 'cha'),
+('粢', 'ja'),
+('粢', '자'),
+('粢', '피 자'),
+('粤', ' 곰곰히 생각할 월'),
+('粤', ' 나라이름 월'),
+('粤', '말 내킬 월'),
+('粥', ' 북쪽 오랑캐 육'),
+('粥', 'Hanja form of 죽 (“congee”).'),
+('粥', '죽'),
+('粥', '죽 죽'),
+('粥', '팔 육'),
+('粦', '도깨비 불 린'),
+('粧', 'cang'),
+('粧', 'chang'),
+('粧', 'jang'),
+('粧', '단장할 장'),
+('粧', '장'),
+('粨', 'baek'),
+('粨', 'paek'),
+('粨', 'payk'),
+('粨', '백'),
+('粨', '힉터메트르 백'),
+('粮', '糧과 同字'),
+('粱', '기장 량'),
+('粲', 'ch''an'),
+('粲', 'chan'),
+('粲', '정미 찬'),
+('粲', '찬'),
+('粳', 'gaeng'),
+('粳', 'kaeng'),
+('粳', 'kayng'),
+('粳', '갱'),
+('粳', '메벼 갱'),
+('粵', '粤과 同字'),
+('粵', '말이 내킬'),
+('粵', '월'),
+('粹', ' 순수할 수'),
+('粹', 'su'),
+('粹', 'swu'),
+('粹', '수'),
+('粹', '정할 수'),
+('粼', '물 맑을 린 '),
+('粽', 'chong'),
+('粽', 'cong'),
+('粽', '종'),
+('粽', '주악 종'),
+('精', ' 성실할 정'),
+('精', ' 세밀할 정'),
+('精', ' 신령 정'),
+('精', ' 정할 정'),
+('精', 'ceng'),
+('精', 'chŏng'),
+('精', 'jeong'),
+('精', '정'),
+('精', '정교할 정'),
+('糅', ' 얽힐 유'),
+('糅', ' 잡곡밥 유'),
+('糅', '섞일 유'),
+('糅', '유'),
+('糆', 'myen'),
+('糆', 'myeon'),
+('糆', 'myŏn'),
+('糆', '麪과 同字 '),
+('糆', '면'),
+('糇', 'hu'),
+('糇', 'hwu'),
+('糇', '후'),
+('糉', 'Alternative form of 粽'),
+('糉', '종'),
+('糉', '주악'),
+('糊', ' 끈끈할 호'),
+('糊', 'ho'),
+('糊', '풀 호'),
+('糊', '호'),
+('糕', 'go'),
+('糕', 'ko'),
+('糕', '고'),
+('糕', '떡 고'),
+('糖', 'Hanja form of 당 (“sugar”).'),
+('糖', 'Hanja form of 탕 (“sugar”).'),
+('糖', '당'),
+('糖', '엿'),
+('糖', '엿 당'),
+('糖', '탕'),
+('糗', '구'),
+('糗', '마른밥가루 구'),
+('糙', 'cho'),
+('糙', 'co'),
+('糙', 'jo'),
+('糙', '매조미쌀 조'),
+('糙', '조'),
+('糚', 'cang'),
+('糚', 'chang'),
+('糚', 'jang'),
+('糚', '妝과 同字 '),
+('糚', '장'),
+('糜', ' 싸라기 미'),
+('糜', 'mi'),
+('糜', '미'),
+('糜', '죽 미'),
+('糝', 'mixed'),
+('糝', 'sam'),
+('糝', 'scattered (grains of rice)'),
+('糝', '나물죽 삼'),
+('糝', '삼'),
+('糞', 'Hanja form of 분 (“dung”).'),
+('糞', '똥'),
+('糞', '똥 분'),
+('糞', '분'),
+('糟', 'cho'),
+('糟', 'co'),
+('糟', 'jo'),
+('糟', '조'),
+('糟', '지게미 조'),
+('糠', ' 번쇄할 강'),
+('糠', 'gang'),
+('糠', 'kang'),
+('糠', '강'),
+('糠', '겨 강'),
+('糢', 'mo'),
+('糢', '模의 俗字'),
+('糢', '모'),
+('糤', 'can'),
+('糤', 'chan'),
+('糤', 'jan'),
+('糤', '잔'),
+('糥', 'na'),
+('糥', '糯와 同字 '),
+('糥', '나'),
+('糧', 'Hanja form of 량/양 (“food, grain, provisions”).'),
+('糧', '량'),
+('糧', '양'),
+('糧', '양식'),
+('糧', '양식 량'),
+('糯', 'na'),
+('糯', '나'),
+('糯', '찰벼 나'),
+('糰', 'dan'),
+('糰', 'tan'),
+('糰', '경단 단'),
+('糰', '단'),
+('糲', '현미 려'),
+('糴', ' 빠를 적'),
+('糴', 'a surname'),
+('糴', 'to buy in rice'),
+('糴', '쌀 사들일 적'),
+('糴', '쌀 살'),
+('糴', '적'),
+('糶', 'a surname'),
+('糶', 'to sell rice'),
+('糶', '쌀 내어 팔 조'),
+('糶', '쌀팔'),
+('糶', '쌀팔다'),
+('糶', '조'),
+('糸', '가는 실'),
+('糸', '가는 실 사'),
+('糸', '멱'),
+('糺', 'gyu'),
+('糺', 'kyu'),
+('糺', '거둘 규'),
+('糺', '규'),
+('系', 'Hanja form of 계 (“connect, link, join”).'),
+('系', '계'),
+('系', '이을'),
+('系', '이을 계'),
+('系', '잇다'),
+('糾', 'Hanja form of 규 (“investigate, inspect”).'),
+('糾', 'Hanja form of 규 (“twist, writhe”).'),
+('糾', '규'),
+('糾', '꼬다'),
+('糾', '꼴'),
+('糾', '맺힐 교'),
+('糾', '삼합노 규'),
+('紀', 'Hanja form of 기 (“the guide ropes at the edge of a fishing net, index, contents (of a book)”).'),
+('紀', '기'),
+('紀', '벼리'),
+('紀', '벼리 기'),
+('紂', '껑거리끈 주'),
+('紂', '주'),
+('紃', ' 법 순'),
+('紃', ' 실 띠 순'),
+('紃', ' 좇을 순'),
+('紃', 'sun'),
+('紃', 'swun'),
+('紃', '순'),
+('紃', '신에 실선 두를 순'),
+('約', ' 간소할 약'),
+('約', ' 맹세할 약'),
+('約', ' 맺을 약'),
+('約', 'Hanja form of 약 (“approximately, roughly”).'),
+('約', 'Hanja form of 약 (“contract, promise”).'),
+('約', '대략 약'),
+('約', '맺다'),
+('約', '맺을'),
+('約', '약'),
+('約', '약속할 요'),
+('紅', '공'),
+('紅', '붉다'),
+('紅', '붉을'),
+('紅', '붉을 홍'),
+('紅', '상복'),
+('紅', '상복 이름 공'),
+('紅', '홍'),
+('紆', ' 굽을 우'),
+('紆', 'u'),
+('紆', 'wu'),
+('紆', '얽힐 우'),
+('紆', '우'),
+('紇', 'inferior silk'),
+('紇', 'to bind, tie'),
+('紇', '질 낮은 명주실 흘'),
+('紇', '흘'),
+('紈', 'hwan'),
+('紈', '환'),
+('紈', '흰 비단 환'),
+('紊', 'mun'),
+('紊', '문'),
+('紊', '어지러울 문'),
+('紋', ' 주름 문'),
+('紋', 'Hanja form of 문 (“figure”).'),
+('紋', '무늬'),
+('紋', '무늬 문'),
+('紋', '문'),
+('納', 'Hanja form of 납 (“to admit; to accept”).'),
+('納', 'Hanja form of 납 (“to pay”).'),
+('納', '납'),
+('納', '들이다'),
+('納', '들일'),
+('納', '바칠 납'),
+('紐', '잡색비단 뉴'),
+('紓', '느슨할 서'),
+('紓', '서'),
+('純', ' 부드러울 순'),
+('純', ' 순수할 순'),
+('純', ' 온전할 순'),
+('純', 'Hanja form of 순 (“innocence”).'),
+('純', '선으로 두를 준'),
+('純', '순'),
+('純', '순수하다'),
+('純', '순수할'),
+('純', '실 순'),
+('紕', 'bi'),
+('紕', 'pi'),
+('紕', '가선 비'),
+('紕', '비'),
+('紗', 'sa'),
+('紗', '깁 사'),
+('紗', '사'),
+('紘', '갓끈 굉'),
+('紘', '굉'),
+('紙', 'Hanja form of 지 (“paper”).'),
+('紙', '종이'),
+('紙', '종이 지'),
+('紙', '지'),
+('級', 'Hanja form of 급 (“level; grade”).'),
+('級', '급'),
+('級', '등급'),
+('級', '등급 급'),
+('紛', 'Hanja form of 분 (“disorderly; scattered”).'),
+('紛', '분'),
+('紛', '어지러울'),
+('紛', '어지러워질 분'),
+('紛', '어지럽다'),
+('紜', '얼크러질 운'),
+('紜', '운'),
+('素', ' 바탕 소'),
+('素', ' 빌 소'),
+('素', ' 생초 소'),
+('素', ' 원래 소'),
+('素', 'Hanja form of 소 (“element; basis”).'),
+('素', 'Hanja form of 소 (“plain; white”).'),
+('素', '본디'),
+('素', '소'),
+('素', '희다'),
+('素', '흴'),
+('素', '흴 소'),
+('紡', '방'),
+('紡', '자을 방'),
+('索', 'Hanja form of 삭 (“rope; cable”).'),
+('索', 'Hanja form of 색 (“to inquire”).'),
+('索', 'Hanja form of 색 (“to request; to demand”).'),
+('索', 'Hanja form of 색 (“to search”).'),
+('索', '노'),
+('索', '동아줄 삭'),
+('索', '삭'),
+('索', '색'),
+('索', '찾다'),
+('索', '찾을'),
+('索', '찾을 색'),
+('紫', 'ca'),
+('紫', 'cha'),
+('紫', 'ja'),
+('紫', '자'),
+('紫', '자주빛 자'),
+('紬', 'chu'),
+('紬', 'cwu'),
+('紬', 'ju'),
+('紬', '명주 주'),
+('紬', '주'),
+('紮', '감을 찰'),
+('紮', '찰'),
+('累', 'Hanja form of 루/누 (“bother”).'),
+('累', 'Hanja form of 루/누 (“implicate, involve”).'),
+('累', 'Hanja form of 루/누 (“tired”).'),
+('累', '누'),
+('累', '루'),
+('累', '묶다'),
+('累', '묶을'),
+('累', '묶을 루'),
+('細', ' 작을 세'),
+('細', ' 좀놈 세'),
+('細', 'Hanja form of 세 (“thin”).'),
+('細', '가늘'),
+('細', '가늘 세'),
+('細', '가늘다'),
+('細', '세'),
+('紱', 'bul'),
+('紱', 'pul'),
+('紱', 'ribbon or cord used attach ornaments'),
+('紱', '불'),
+('紱', '인끈 불'),
+('紲', 'sel'),
+('紲', 'seol'),
+('紲', 'sŏl'),
+('紲', '고삐 설'),
+('紲', '설'),
+('紳', ' 벼슬아치 신'),
+('紳', 'sin'),
+('紳', '신'),
+('紳', '큰 띠 신'),
+('紵', 'ce'),
+('紵', 'chŏ'),
+('紵', 'jeo'),
+('紵', '모시 저'),
+('紵', '저'),
+('紹', ' 소개할 소'),
+('紹', ' 얽을 소'),
+('紹', 'so'),
+('紹', '소'),
+('紹', '이을 소'),
+('紺', ' 보랏빛 감'),
+('紺', 'Hanja form of 감 (“navy blue; dark blue”).'),
+('紺', '감'),
+('紺', '감색'),
+('紺', '아청 감'),
+('紼', '동아줄 (dong''ajul, “rope”)'),
+('紼', '불'),
+('絀', 'ch''ul'),
+('絀', 'chul'),
+('絀', 'chwul'),
+('絀', 'decline, refuse'),
+('絀', 'sew'),
+('絀', '출'),
+('終', 'Hanja form of 종 (“end; finish”).'),
+('終', '끝낼 종'),
+('終', '마치다'),
+('終', '마칠'),
+('終', '종'),
+('絃', 'hyen'),
+('絃', 'hyeon'),
+('絃', 'hyŏn'),
+('絃', '줄풍류 현'),
+('絃', '현'),
+('組', 'group, team'),
+('組', '끈 조'),
+('組', '조'),
+('絅', 'gyeong'),
+('絅', 'kyeng'),
+('絅', 'kyŏng'),
+('絅', '경'),
+('絅', '끌어 쥘 경'),
+('絆', 'Hanja form of 반 (“bond”).'),
+('絆', '반'),
+('絆', '얽어매다'),
+('絆', '얽어맬'),
+('絆', '줄 반'),
+('絉', 'sul'),
+('絉', 'swul'),
+('絉', '술'),
+('経', '날 경'),
+('絍', ' 길쌈할 임'),
+('絍', 'im'),
+('絍', '임'),
+('絍', '짤 임'),
+('絎', 'haeng'),
+('絎', 'hayng'),
+('絎', '행'),
+('結', ' 나중 결'),
+('結', ' 마칠 결'),
+('結', ' 몫 결'),
+('結', 'Hanja form of 결 (“result”).'),
+('結', 'Hanja form of 결 (“tie”).'),
+('結', '결'),
+('結', '맺다'),
+('結', '맺을'),
+('結', '맺을 결'),
+('絓', 'gwae'),
+('絓', 'kwae'),
+('絓', '걸리다: hang, be suspended'),
+('絓', '괘'),
+('絕', ' 그칠 절'),
+('絕', ' 멸할 절'),
+('絕', ' 으뜸 절'),
+('絕', 'Alternative form of 絶'),
+('絕', '끊을 절'),
+('絕', '절'),
+('絖', 'gwang'),
+('絖', 'kwang'),
+('絖', '광'),
+('絖', '솜 광'),
+('絙', 'hwan'),
+('絙', '끈목 환 '),
+('絙', '환'),
+('絛', 'cho'),
+('絛', 'co'),
+('絛', 'jo'),
+('絛', '끈 조'),
+('絛', '조'),
+('絜', ' 묶을 혈'),
+('絜', 'hyel'),
+('絜', 'hyeol'),
+('絜', 'hyŏl'),
+('絜', '헤아릴 혈'),
+('絜', '혈'),
+('絞', 'gyo'),
+('絞', 'kyo'),
+('絞', '교'),
+('絞', '목맬 교'),
+('絡', 'Hanja form of 락/낙 (“enmesh, wrap around”).'),
+('絡', 'Hanja form of 락/낙 (“web, net”).'),
+('絡', '낙'),
+('絡', '락'),
+('絡', '헌솜'),
+('絡', '헌솜 락'),
+('絢', 'hyen'),
+('絢', 'hyeon'),
+('絢', 'hyŏn'),
+('絢', '채색무늬 현'),
+('絢', '현'),
+('絣', ' 먹줄 튀길 병'),
+('絣', ' 이을 병'),
+('絣', 'byeong'),
+('絣', 'pyeng'),
+('絣', 'pyŏng'),
+('絣', '무늬없는 비단 병'),
+('絣', '병'),
+('給', 'Hanja form of 급 (“by, for”).'),
+('給', 'Hanja form of 급 (“give”).'),
+('給', '급'),
+('給', '넉넉하다'),
+('給', '넉넉할'),
+('給', '넉넉할 급'),
+('絨', ' 가는 베 융'),
+('絨', 'yung'),
+('絨', '삶은 실 융'),
+('絨', '융'),
+('絩', 'cho'),
+('絩', 'co'),
+('絩', 'jo'),
+('絩', '견직물 날실 수 조 '),
+('絩', '조'),
+('絪', 'aura'),
+('絪', 'in'),
+('絪', '기운 인'),
+('絪', '인'),
+('絮', '성씨 여'),
+('絮', '솜 서'),
+('絰', 'chil'),
+('絰', 'cil'),
+('絰', 'jil'),
+('絰', 'white hempen cloth worn by mourners'),
+('絰', '질'),
+('絰', '질 질'),
+('統', ' 근본 통'),
+('統', ' 벼리 통'),
+('統', ' 실마디 통'),
+('統', ' 이을 통'),
+('統', 't''ong'),
+('統', 'thong'),
+('統', 'to lead, command'),
+('統', 'tong'),
+('統', '거느릴 통'),
+('統', '통'),
+('絲', 'silk'),
+('絲', 'thread'),
+('絲', '사'),
+('絲', '실 사'),
+('絳', ' 강초 강'),
+('絳', 'gang'),
+('絳', 'kang'),
+('絳', '강'),
+('絳', '깊게 붉을 강'),
+('絶', 'Hanja form of 절 (“end”).'),
+('絶', '絕과 同字'),
+('絶', '끊다'),
+('絶', '끊을'),
+('絶', '절'),
+('絹', ' 깁 견'),
+('絹', 'Hanja form of 견 (“silk”).'),
+('絹', '견'),
+('絹', '비단'),
+('絹', '비단 견'),
+('絺', ' 가는 갈포 치'),
+('絺', 'ch''i'),
+('絺', 'chi'),
+('絺', 'fine hemp cloth'),
+('絺', '가는 칡베 치'),
+('絺', '치'),
+('絿', 'gu'),
+('絿', 'ku'),
+('絿', 'kwu'),
+('絿', '구'),
+('絿', '급박할 구'),
+('綃', 'raw silk fabric'),
+('綃', '생명주실 초'),
+('綃', '초'),
+('綆', 'gyeong'),
+('綆', 'kyeng'),
+('綆', 'kyŏng'),
+('綆', 'well bucket'),
+('綆', '경'),
+('綆', '두레박줄 경'),
+('綈', 'cey'),
+('綈', 'che'),
+('綈', 'je'),
+('綈', '깁: silk gauze, silk'),
+('綈', '제'),
+('綎', 'ceng'),
+('綎', 'chŏng'),
+('綎', 'jeong'),
+('綎', '띠술 정 '),
+('綎', '정'),
+('綏', ' 물러갈 수'),
+('綏', ' 수레고삐 수'),
+('綏', ' 여우모양 수'),
+('綏', '깃발 늘어질 유'),
+('綏', '편안할 수'),
+('經', 'Hanja form of 경 (“to pass”).'),
+('經', '경'),
+('經', '날 경'),
+('經', '지나다'),
+('經', '지날'),
+('綘', 'bong'),
+('綘', 'pong'),
+('綘', '縫과 同字 '),
+('綘', '봉'),
+('継', 'gye'),
+('継', 'kye'),
+('継', 'kyey'),
+('継', '繼의 俗字'),
+('継', '계'),
+('続', '續의 略字'),
+('綜', 'chong'),
+('綜', 'cong'),
+('綜', 'jong'),
+('綜', '모을 종'),
+('綜', '종'),
+('綠', 'Hanja form of 록/녹 (“blue, green”).'),
+('綠', '녹'),
+('綠', '록'),
+('綠', '초록빛 록'),
+('綠', '푸르다'),
+('綠', '푸를'),
+('綢', '쌀 도'),
+('綢', '얽힐 주'),
+('綣', 'gwon'),
+('綣', 'kwen'),
+('綣', 'kwŏn'),
+('綣', '권'),
+('綣', '정다울 권'),
+('綥', 'gi'),
+('綥', 'ki'),
+('綥', '기'),
+('綥', '비단 쑥색 기 '),
+('綦', '기'),
+('綦', '연두빛 비단 기'),
+('綧', 'chun'),
+('綧', 'cwun'),
+('綧', 'jun'),
+('綧', '준'),
+('綧', '피륙의 폭의 넓이 준 '),
+('綩', 'wen'),
+('綩', 'won'),
+('綩', 'wŏn'),
+('綩', '원'),
+('綫', '線과 同字'),
+('綫', '선'),
+('綫', '줄'),
+('綬', 'su'),
+('綬', 'swu'),
+('綬', '수'),
+('綬', '인끈 수'),
+('維', ' 맺을 유'),
+('維', ' 오직 유'),
+('維', ' 이을 유'),
+('維', 'Hanja form of 유 (“the guide ropes at the edge of a fishing net; fishing net”).'),
+('維', '벼리'),
+('維', '벼리 유'),
+('維', '유'),
+('綮', 'gye'),
+('綮', 'kye'),
+('綮', 'kyey'),
+('綮', '계'),
+('綮', '발 고운 비단 계'),
+('綰', 'gwan'),
+('綰', 'kwan'),
+('綰', '관'),
+('綰', '얽을 관'),
+('綱', ' 근본 강'),
+('綱', ' 대강 강'),
+('綱', ' 법 강'),
+('綱', 'gang'),
+('綱', 'kang'),
+('綱', '강'),
+('綱', '벼리 강'),
+('網', 'Hanja form of 망 (“net”).'),
+('網', '그물'),
+('網', '그물 망'),
+('網', '망'),
+('綳', 'bung'),
+('綳', 'pung'),
+('綳', '붕'),
+('綴', 'Hanja form of 철 (“to connect; to join”).'),
+('綴', 'Hanja form of 철 (“to spell”).'),
+('綴', '꿰맬 철'),
+('綴', '꿰멜 체'),
+('綴', '엮다'),
+('綴', '엮을'),
+('綴', '철'),
+('綵', 'ch''ae'),
+('綵', 'chae'),
+('綵', 'chay'),
+('綵', '비단 채'),
+('綵', '채'),
+('綸', '관건 관'),
+('綸', '낚싯줄 륜'),
+('綺', 'gi'),
+('綺', 'ki'),
+('綺', '기'),
+('綺', '비단 기'),
+('綻', ' 나타날 탄'),
+('綻', ' 파할 탄'),
+('綻', 'Hanja form of 탄 (“to burst open, to split”).'),
+('綻', '옷 터질 탄'),
+('綻', '탄'),
+('綻', '터지다'),
+('綻', '터질'),
+('綽', 'cak'),
+('綽', 'chak'),
+('綽', 'jak'),
+('綽', '너그러울 작'),
+('綽', '작'),
+('綾', '비단 릉'),
+('綿', 'Hanja form of 면 (“cotton wad”).'),
+('綿', 'Hanja form of 면 (“soft, downy”).'),
+('綿', 'Hanja form of 면 (“wool”).'),
+('綿', '면'),
+('綿', '이어지다'),
+('綿', '이어질'),
+('綿', '이어질 면'),
+('緄', 'gon'),
+('緄', 'kon'),
+('緄', '곤'),
+('緄', '띠 곤'),
+('緇', 'ch''i'),
+('緇', 'chi'),
+('緇', '검을 치'),
+('緇', '치'),
+('緊', 'Hanja form of 긴 (“firm, secure”).'),
+('緊', 'Hanja form of 긴 (“tense, tight, taut”).'),
+('緊', '굳게 얽힐'),
+('緊', '굳게 얽힐 긴'),
+('緊', '긴'),
+('緋', 'bi'),
+('緋', 'pi'),
+('緋', 'scarlet, red'),
+('緋', '붉은 빛 비'),
+('緋', '비'),
+('緌', 'a hat string (tied under the chin)'),
+('緌', 'hang down'),
+('緌', '유'),
+('緍', '낚시줄 민'),
+('緍', '민'),
+('総', 'ch''ong'),
+('総', 'chong'),
+('総', '總과 同字'),
+('総', '총'),
+('緒', 'Alternative form of 緖'),
+('緒', 'se'),
+('緒', 'seo'),
+('緒', 'sŏ'),
+('緒', '緖의 略字'),
+('緒', '서'),
+('緖', 'se'),
+('緖', 'seo'),
+('緖', 'sŏ'),
+('緖', '서'),
+('緖', '실마리 서'),
+('緗', 'sang'),
+('緗', '담황색 상'),
+('緗', '상'),
+('緘', 'bind'),
+('緘', 'letter'),
+('緘', 'seal, close'),
+('緘', '봉할 함'),
+('緘', '함'),
+('線', 'Hanja form of 선 (“line”).'),
+('線', '선'),
+('線', '실 선'),
+('線', '줄'),
+('緜', '면'),
+('緜', '햇솜 면'),
+('緝', '낳을 집'),
+('緝', '자을 즙'),
+('緞', '비단 단'),
+('緞', '신발 하'),
+('締', 'ch''e'),
+('締', 'che'),
+('締', 'chey'),
+('締', '맺을 체'),
+('締', '체'),
+('緡', 'min'),
+('緡', '낚시줄 민'),
+('緡', '민'),
+('緣', ' 서두를 연'),
+('緣', '단옷 단'),
+('緣', '인연 연'),
+('緦', ' 석달복 시'),
+('緦', ' 시마복 시'),
+('緦', 'coarse cotton cloth used for mourning'),
+('緦', 'si'),
+('緦', '보름새베 시'),
+('緦', '시'),
+('編', ' 기록할 편'),
+('編', ' 벌릴 편'),
+('編', ' 첩지 편'),
+('編', '땋을 변'),
+('編', '책편 편'),
+('緩', ' 더딜 완'),
+('緩', 'delay'),
+('緩', 'slow, leisurely'),
+('緩', 'to postpone'),
+('緩', 'wan'),
+('緩', '느즈러질 완'),
+('緩', '완'),
+('緬', '가는 실 면'),
+('緬', '면'),
+('緯', ' 별 오른편으로 돌 위'),
+('緯', 'wi'),
+('緯', '씨줄 위'),
+('緯', '위'),
+('緲', 'myo'),
+('緲', '묘'),
+('緲', '아득할 묘'),
+('練', 'Hanja form of 련/연 (“practice”).'),
+('練', '련'),
+('練', '연'),
+('練', '익힐'),
+('練', '익힐 련'),
+('緶', '꿰맬 편'),
+('緶', '편'),
+('緹', 'brown'),
+('緹', 'cey'),
+('緹', 'che'),
+('緹', 'je'),
+('緹', 'red'),
+('緹', 'reddish color'),
+('緹', '붉은 비단 제'),
+('緹', '제'),
+('緻', ' 빽빽할 치'),
+('緻', ' 헌 옷 기울 치'),
+('緻', 'ch''i'),
+('緻', 'chi'),
+('緻', '치'),
+('緻', '톡톡할 치'),
+('緼', 'on'),
+('緼', '縕의 俗字'),
+('緼', '온'),
+('縁', '緣과 同字'),
+('縁', '緣의 略字'),
+('縂', 'ch''ong'),
+('縂', 'chong'),
+('縂', '総과 同字'),
+('縂', '총'),
+('縇', 'sen'),
+('縇', 'seon'),
+('縇', 'sŏn'),
+('縇', '선'),
+('縇', '선두를 선'),
+('縈', ' 맬 영'),
+('縈', 'entangle'),
+('縈', 'entwine, coil'),
+('縈', 'yeng'),
+('縈', 'yeong'),
+('縈', 'yŏng'),
+('縈', '얽힐 영'),
+('縈', '영'),
+('縉', 'chin'),
+('縉', 'cin'),
+('縉', 'jin'),
+('縉', '搢과 同字'),
+('縉', '진'),
+('縊', '목 맬 액'),
+('縊', '목 맬 의'),
+('縋', 'ch''u'),
+('縋', 'chu'),
+('縋', 'chwu'),
+('縋', '줄에 달릴 추'),
+('縋', '추'),
+('縐', ' 구길 추'),
+('縐', 'ch''u'),
+('縐', 'chu'),
+('縐', 'chwu'),
+('縐', '주름 추'),
+('縐', '추'),
+('縑', 'gyeom'),
+('縑', 'kyem'),
+('縑', 'kyŏm'),
+('縑', '겸'),
+('縑', '합사비단 겸'),
+('縕', ' 묵은 솜 온'),
+('縕', 'hemp'),
+('縕', 'on'),
+('縕', 'padded clothes'),
+('縕', 'ramie fabric'),
+('縕', '모시 온'),
+('縕', '온'),
+('縗', ' 상옷 최'),
+('縗', 'ch''oe'),
+('縗', 'choe'),
+('縗', 'choy'),
+('縗', '상복 최'),
+('縗', '최'),
+('縘', 'gye'),
+('縘', 'kye'),
+('縘', 'kyey'),
+('縘', '繫와 同字 '),
+('縘', '계'),
+('縛', 'Hanja form of 박 (“tie”).'),
+('縛', '묶다'),
+('縛', '묶을'),
+('縛', '묶을 박'),
+('縛', '박'),
+('縝', '2. Be caring ( 仔詳 -), praise (being meticulous and caring about quality, skill, and behavior)'),
+('縝', '3. It is compact'),
+('縝', '4. It is dense'),
+('縝', '5. conclude'),
+('縝', '6. 홑 clothes (clothes built in one layer)'),
+('縝', '7. Many Castle ( 盛 ) shape'),
+('縝', '8. Samsil (besil, thread extracted from hemp shell)'),
+('縝', '9. Black hair'),
+('縝', 'chin'),
+('縝', 'cin'),
+('縝', 'jin'),
+('縝', 'multiply'),
+('縝', 'multiply
+2. Be caring ( 仔詳 -), praise (being meticulous and caring about quality, skill, and behavior)
+3. It is compact
+4. It is dense
+5. conclude
+6. 홑 clothes (clothes built in one layer)
+7. Many Castle ( 盛 ) shape
+8. Samsil (besil, thread extracted from hemp shell)
+9. Black hair'),
+('縝', '삼실 진'),
+('縝', '진'),
+('縞', ' 흴 호'),
+('縞', 'ho'),
+('縞', '명주 호'),
+('縞', '호'),
+('縟', 'yo'),
+('縟', '요'),
+('縠', 'crepe'),
+('縠', 'silk'),
+('縠', 'silk fabrics'),
+('縠', '곡'),
+('縠', '주름 비단'),
+('縠', '주름 비단 곡'),
+('縡', ' 실을 재'),
+('縡', 'cay'),
+('縡', 'chae'),
+('縡', 'jae'),
+('縡', '일 재'),
+('縡', '재'),
+('縢', 'deung'),
+('縢', 'tung'),
+('縢', 'tŭng'),
+('縢', '등'),
+('縢', '봉할 등'),
+('縣', ' 끊어질 현'),
+('縣', '고을'),
+('縣', '매달'),
+('縣', '매달릴 현'),
+('縣', '현'),
+('縦', '縱과 同字'),
+('縦', '세로 종'),
+('縫', 'bong'),
+('縫', 'pong'),
+('縫', '꿰맬 봉'),
+('縫', '봉'),
+('縮', ' 거둘 축'),
+('縮', ' 모자랄 축'),
+('縮', ' 물러갈 축'),
+('縮', '줄어들 축'),
+('縮', '축'),
+('縯', ' 늘일 연'),
+('縯', '길 연'),
+('縯', '연'),
+('縱', '늘어질 종'),
+('縱', '바쁠 총'),
+('縱', '종'),
+('縱', '총'),
+('縲', '포승 류'),
+('縳', ' 낳이 실 견'),
+('縳', 'gyeon'),
+('縳', 'kyen'),
+('縳', 'kyŏn'),
+('縳', '견'),
+('縳', '올 견'),
+('縴', 'gyeon'),
+('縴', 'kyen'),
+('縴', 'kyŏn'),
+('縴', '견'),
+('縴', '궂은 솜 견'),
+('縵', 'man'),
+('縵', '만'),
+('縵', '무늬 없는 비단 만'),
+('縶', '매다: bind, tie'),
+('縶', '집'),
+('縷', '실 루'),
+('縹', ' 훌쩍 날 표'),
+('縹', 'dim'),
+('縹', 'light blue silk'),
+('縹', 'misty'),
+('縹', 'p''yo'),
+('縹', 'phyo'),
+('縹', 'pyo'),
+('縹', '옥빛 표'),
+('縹', '표'),
+('縻', ' 얽어맬 미'),
+('縻', 'mi'),
+('縻', '고삐 미'),
+('縻', '미'),
+('總', ' 거느릴 총'),
+('總', ' 끄덩이 잡을 총'),
+('總', ' 합할 총'),
+('總', 'ch''ong'),
+('總', 'chong'),
+('總', '꿰맬 총'),
+('總', '총'),
+('績', ' 공 적'),
+('績', ' 이룰 적'),
+('績', ' 이을 적'),
+('績', 'cek'),
+('績', 'chŏk'),
+('績', 'jeok'),
+('績', '길쌈 적'),
+('績', '적'),
+('繁', 'Hanja form of 반 (“cinch, saddle girth, sash”).'),
+('繁', 'Hanja form of 번 (“complicated, complex, difficult”).'),
+('繁', 'Hanja form of 번 (“luxurious, lush, flourishing”).'),
+('繁', 'Hanja form of 번 (“thicket, foliage”).'),
+('繁', 'Hanja form of 파 (“white”).'),
+('繁', '많을 번'),
+('繁', '반'),
+('繁', '뱃대끈'),
+('繁', '뱃대끈 반'),
+('繁', '번'),
+('繁', '번성하다'),
+('繁', '번성할'),
+('繁', '파'),
+('繁', '희다'),
+('繁', '흴'),
+('繃', 'bung'),
+('繃', 'pung'),
+('繃', '묶을 붕'),
+('繃', '붕'),
+('繄', ' 탄식하는 소리 예'),
+('繄', 'ye'),
+('繄', 'yey'),
+('繄', '검푸른 비단 예'),
+('繄', '예'),
+('繅', 'draw'),
+('繅', 'elegant compositions'),
+('繅', 'reel silk from cocoons'),
+('繅', 'so'),
+('繅', '고치 실 뽑을 소'),
+('繅', '소'),
+('繆', ' 삼 무'),
+('繆', ' 얽을 무'),
+('繆', '묶을 무'),
+('繆', '어그러질 류'),
+('繇', ' 성할 요'),
+('繇', '따를 요'),
+('繇', '요'),
+('繈', 'gang'),
+('繈', 'kang'),
+('繈', '繦의 本字'),
+('繈', '강'),
+('繊', 'sem'),
+('繊', 'seom'),
+('繊', 'sŏm'),
+('繊', '가늘 섬'),
+('繊', '섬'),
+('繍', 'su'),
+('繍', 'swu'),
+('繍', '繡와 同字'),
+('繍', '수'),
+('繎', '실 약해질'),
+('繎', '연'),
+('繐', 'se'),
+('繐', 'sey'),
+('繐', '가늘고 성긴 베 세'),
+('繐', '세'),
+('繒', '비단 증'),
+('繒', '증'),
+('織', 'chik'),
+('織', 'cik'),
+('織', 'jik'),
+('織', '직'),
+('織', '짤 직'),
+('繕', 'sen'),
+('繕', 'seon'),
+('繕', 'sŏn'),
+('繕', '기울 선'),
+('繕', '선'),
+('繖', 'san'),
+('繖', '산'),
+('繖', '일산 산'),
+('繗', '린'),
+('繗', '이을'),
+('繗', '이을 린 '),
+('繗', '인'),
+('繗', '잇다'),
+('繙', 'beon'),
+('繙', 'pen'),
+('繙', 'pŏn'),
+('繙', '되풀이 풀이할 번'),
+('繙', '번'),
+('繚', '감길 료'),
+('繝', 'gan'),
+('繝', 'kan'),
+('繝', '간'),
+('繞', ' 둘릴 요'),
+('繞', '얽힐 요'),
+('繞', '요'),
+('繠', '드리워질'),
+('繠', '예'),
+('繡', ' 성씨 수'),
+('繡', 'Hanja form of 수 (“embroider”).'),
+('繡', 'Hanja form of 수 (“gorgeous”).'),
+('繡', '수'),
+('繡', '수놓을'),
+('繡', '수놓을 수'),
+('繢', 'color'),
+('繢', 'embroider'),
+('繢', 'gwe'),
+('繢', 'kwe'),
+('繢', 'kwey'),
+('繢', 'silk fabrics'),
+('繢', '궤'),
+('繢', '톱끝 궤'),
+('繤', 'ch''an'),
+('繤', 'chan'),
+('繤', '지을 찬'),
+('繤', '찬'),
+('繦', 'gang'),
+('繦', 'kang'),
+('繦', '강'),
+('繦', '돈꿰미 강'),
+('繩', ' 다스릴 승'),
+('繩', ' 법 승'),
+('繩', ' 이을 승'),
+('繩', 'Hanja form of 승 (“measure; restrain”).'),
+('繩', 'Hanja form of 승 (“rope; string; cord”).'),
+('繩', '노끈'),
+('繩', '노끈 승'),
+('繩', '승'),
+('繪', 'Hanja form of 회 (“picture; drawing; sketch; image; painting”).'),
+('繪', 'Hanja form of 회 (“picture; drawing; sketch; image; painting”). [affix]'),
+('繪', '그림'),
+('繪', '그림 회'),
+('繪', '회'),
+('繫', ' 맺을 계'),
+('繫', 'Hanja form of 경 (“bind, connect”).'),
+('繫', '계'),
+('繫', '매다'),
+('繫', '맬'),
+('繫', '맬 계'),
+('繭', ' 목 쉴 견'),
+('繭', ' 발 부르틀 견'),
+('繭', ' 비단 견'),
+('繭', 'gyeon'),
+('繭', 'kyen'),
+('繭', 'kyŏn'),
+('繭', '견'),
+('繭', '고치 견'),
+('繯', ' 둘릴 현'),
+('繯', ' 맬 현'),
+('繯', 'hyen'),
+('繯', 'hyeon'),
+('繯', 'hyŏn'),
+('繯', '얽힐 현'),
+('繯', '현'),
+('繰', 'cho'),
+('繰', 'co'),
+('繰', 'jo'),
+('繰', '야청 통견 조'),
+('繰', '조'),
+('繳', 'gyeok'),
+('繳', 'kyek'),
+('繳', 'kyŏk'),
+('繳', '격'),
+('繶', 'ek'),
+('繶', 'eok'),
+('繶', 'ŏk'),
+('繶', '땋은 노 억 '),
+('繶', '억'),
+('繹', ' 베풀 역'),
+('繹', ' 실 끝 찾을 역'),
+('繹', '삭일 역'),
+('繹', '역'),
+('繼', 'Hanja form of 계 (“continue, persist”).'),
+('繼', 'Hanja form of 계 (“inherit”).'),
+('繼', '계'),
+('繼', '이을'),
+('繼', '이을 계'),
+('繼', '잇다'),
+('繽', 'bin'),
+('繽', 'pin'),
+('繽', '빈'),
+('繽', '어지러울 빈'),
+('繾', ' 마지 않을 견'),
+('繾', 'gyeon'),
+('繾', 'kyen'),
+('繾', 'kyŏn'),
+('繾', '견'),
+('繾', '곡진할 견'),
+('纁', 'afterglow (=曛)'),
+('纁', 'hun'),
+('纁', 'hwun'),
+('纁', 'pink'),
+('纁', 'pink silk'),
+('纁', '분홍빛 훈'),
+('纁', '훈'),
+('纂', 'ch''an'),
+('纂', 'chan'),
+('纂', '모을 찬'),
+('纂', '찬'),
+('纇', '실 마디 뢰'),
+('纈', 'hil'),
+('纈', 'patterned silk'),
+('纈', 'tie knot'),
+('纈', '홀치기염색 힐'),
+('纈', '힐'),
+('纉', 'ch''an'),
+('纉', 'chan'),
+('纉', '이을 찬 '),
+('纉', '찬'),
+('纊', 'broad, wide (same as 曠)'),
+('纊', 'cotton'),
+('纊', 'gwang'),
+('纊', 'kwang'),
+('纊', 'padded clothes'),
+('纊', '광'),
+('纊', '솜 광'),
+('續', 'Hanja form of 속 (“continuation”).'),
+('續', '속'),
+('續', '이을'),
+('續', '이을 속'),
+('續', '잇다'),
+('纍', '갇힐 류'),
+('纏', ' 묶을 전'),
+('纏', ' 얽을 전'),
+('纏', 'cen'),
+('纏', 'chŏn'),
+('纏', 'jeon'),
+('纏', '둘릴 전'),
+('纏', '전'),
+('纓', ' 말 가슴걸이 영'),
+('纓', ' 얽힐 영'),
+('纓', 'yeng'),
+('纓', 'yeong'),
+('纓', 'yŏng'),
+('纓', '갓끈 영'),
+('纓', '영'),
+('纔', ' 비롯할 재'),
+('纔', 'cay'),
+('纔', 'chae'),
+('纔', 'jae'),
+('纔', '겨우 재'),
+('纔', '재'),
+('纖', 'sem'),
+('纖', 'seom'),
+('纖', 'sŏm'),
+('纖', '가늘 섬'),
+('纖', '섬'),
+('纘', 'carry on'),
+('纘', 'ch''an'),
+('纘', 'chan'),
+('纘', 'continue'),
+('纘', 'succeed'),
+('纘', '이을 찬'),
+('纘', '찬'),
+('纚', 'a hat string (tied under the chin)'),
+('纚', 'to tie'),
+('纚', 'twist, twine'),
+('纚', '리'),
+('纚', '이'),
+('纛', '도'),
+('纛', '독'),
+('纛', '클 깃발 도'),
+('纜', '닻줄 람'),
+('纮', '넓을 굉'),
+('纻', '紵와 同字'),
+('缊', '縕과 同字'),
+('缐', '線의 簡體字 '),
+('缶', 'an earthern vessel that bulges in the middle and has a narrow mouth'),
+('缶', 'bu'),
+('缶', 'pu'),
+('缶', 'rad. 121'),
+('缶', 'refers to one of many types of the double-headed drums with a narrow waist in the middle'),
+('缶', 'volume, capacity (=4斛)'),
+('缶', '洋甁, a glazed pot bulging in the middle with a narrow mouth'),
+('缶', '부'),
+('缶', '장군 부'),
+('缷', 'sa'),
+('缷', '사'),
+('缸', '항'),
+('缸', '항아리 항'),
+('缺', ' 깨어질 결'),
+('缺', ' 번개 번쩍거릴 결'),
+('缺', ' 이 빠질 결'),
+('缺', 'Hanja form of 결 (“be short of, lack”).'),
+('缺', 'Hanja form of 결 (“gap, deficit”).'),
+('缺', '결'),
+('缺', '이지러지다'),
+('缺', '이지러질'),
+('缺', '이지러질 결'),
+('缾', 'byeong'),
+('缾', 'pyeng'),
+('缾', 'pyŏng'),
+('缾', '두레박 병'),
+('缾', '병'),
+('缿', ' 문서함 항'),
+('缿', ' 벙어리 항 '),
+('缿', 'hang'),
+('缿', '항'),
+('缿', '항통 항'),
+('罃', 'aeng'),
+('罃', 'ayng'),
+('罃', '술병 앵'),
+('罃', '앵'),
+('罄', 'a kind of Korean musical instrument made of stone or jade'),
+('罄', 'empty'),
+('罄', 'exhaust'),
+('罄', 'gyeong'),
+('罄', 'kyeng'),
+('罄', 'kyŏng'),
+('罄', '경'),
+('罄', '빌 경'),
+('罅', 'crack, fissure, split'),
+('罅', 'ha'),
+('罅', '틈 하'),
+('罅', '하'),
+('罇', 'chun'),
+('罇', 'cwun'),
+('罇', 'jun'),
+('罇', '樽·尊과 同字'),
+('罇', '준'),
+('罋', 'ong'),
+('罋', '甕과 同字'),
+('罋', '옹'),
+('罌', 'aeng'),
+('罌', 'ayng'),
+('罌', '술병 앵'),
+('罌', '앵'),
+('罍', '술독 뢰'),
+('罎', 'dam'),
+('罎', 'tam'),
+('罎', '壜과 同字'),
+('罎', '담'),
+('罐', 'gwan'),
+('罐', 'kwan'),
+('罐', '관'),
+('罐', '두레박 관'),
+('罔', 'Hanja form of 망 (“deceive”).'),
+('罔', 'Hanja form of 망 (“libel”).'),
+('罔', 'Hanja form of 망 (“negative”).'),
+('罔', 'Hanja form of 망 (“net”).'),
+('罔', '그물'),
+('罔', '그물 망'),
+('罔', '망'),
+('罕', 'han'),
+('罕', 'rare, elusive'),
+('罕', '드물 한'),
+('罕', '한'),
+('罖', 'Kwukyel form of 라 (ra)'),
+('罖', '그물'),
+('罖', '라'),
+('罘', 'bu'),
+('罘', 'pu'),
+('罘', '그물 부'),
+('罘', '부'),
+('罝', 'ce'),
+('罝', 'chŏ'),
+('罝', 'jeo'),
+('罝', 'net for catching rabbits'),
+('罝', '저'),
+('罝', '짐승 그물 저'),
+('罟', 'go'),
+('罟', 'ko'),
+('罟', '고'),
+('罟', '그물 고'),
+('罠', '그물 민'),
+('罠', '민'),
+('罡', '강'),
+('罡', '강별 강'),
+('罣', 'gwae'),
+('罣', 'kwae'),
+('罣', 'kway'),
+('罣', 'to hang, suspend'),
+('罣', 'to hinder'),
+('罣', '걸 괘'),
+('罣', '괘'),
+('罦', 'bu'),
+('罦', 'pu'),
+('罦', '그물 부'),
+('罦', '부'),
+('罨', '그물 엄'),
+('罨', '엄'),
+('罪', 'Hanja form of 죄 (“sin; crime; fault”).'),
+('罪', '죄'),
+('罪', '허물'),
+('罪', '허물 죄'),
+('罪', '허물다'),
+('罫', 'gwae'),
+('罫', 'hinder'),
+('罫', 'kwae'),
+('罫', 'kway'),
+('罫', '괘'),
+('罫', '줄 괘'),
+('置', ' 버릴 치'),
+('置', ' 안치할 치'),
+('置', ' 역말 치'),
+('置', 'ch''i'),
+('置', 'chi'),
+('置', '베풀 치'),
+('置', '치'),
+('罰', 'Hanja form of 벌 (“punishment; penalty”).'),
+('罰', 'Hanja form of 벌 (“punishment; penalty”). [noun]'),
+('罰', '벌'),
+('罰', '벌하다'),
+('罰', '벌할'),
+('罰', '죄 벌'),
+('署', 'se'),
+('署', 'seo'),
+('署', 'sŏ'),
+('署', '관청 서'),
+('署', '서'),
+('罵', 'Hanja form of 매 (“to scold”).'),
+('罵', '꾸짖다'),
+('罵', '꾸짖을'),
+('罵', '매'),
+('罵', '욕할 매'),
+('罷', ' 고달플 피'),
+('罷', ' 내칠 파'),
+('罷', ' 잔병 피'),
+('罷', '느른할 피'),
+('罷', '파할 파'),
+('罸', '罰과 同字'),
+('罸', '벌'),
+('罹', 'Hanja form of 리/이 (“to experience; to suffer; to be hit with”).'),
+('罹', '걸리다'),
+('罹', '걸릴'),
+('罹', '근심 리'),
+('罹', '리'),
+('罹', '이'),
+('罼', 'p''il'),
+('罼', 'phil'),
+('罼', 'pil'),
+('罼', '토끼그물 필 '),
+('罼', '필'),
+('罽', 'gye'),
+('罽', 'kye'),
+('罽', 'kyey'),
+('罽', '계'),
+('罽', '물고기 그물 계'),
+('罾', 'chŭng'),
+('罾', 'cung'),
+('罾', 'jeung'),
+('罾', '어망 증'),
+('罾', '증'),
+('羂', ' 걸릴 견'),
+('羂', 'gyeon'),
+('羂', 'kyen'),
+('羂', 'kyŏn'),
+('羂', '걸 견'),
+('羂', '견'),
+('羅', 'Hanja form of 라/나 (“net; fabric”).'),
+('羅', '그물'),
+('羅', '나'),
+('羅', '라'),
+('羅', '새그물 라'),
+('羆', 'bi'),
+('羆', 'brown bear, horse bear'),
+('羆', 'pi'),
+('羆', '비'),
+('羆', '큰 곰 비'),
+('羇', '기'),
+('羇', '나그네 기'),
+('羈', 'gi'),
+('羈', 'ki'),
+('羈', '굴레 기'),
+('羈', '기'),
+('羊', 'Hanja form of 양 (“sheep”).'),
+('羊', '양'),
+('羊', '양 양'),
+('羋', 'mi'),
+('羋', '미'),
+('羋', '양 울 미'),
+('羌', ' 말 끝낼 강'),
+('羌', 'gang'),
+('羌', 'kang'),
+('羌', '강'),
+('羌', '오랑캐 강'),
+('美', ' 맛이 좋을 미'),
+('美', 'Hanja form of 미 (“beauty; beautiful”).'),
+('美', 'Hanja form of 미 (“beauty; beautiful”). [noun]'),
+('美', 'Hanja form of 미 (“the USA, the Americas (in compounds, in news media)”).'),
+('美', 'Hanja form of 미 (“the USA, the Americas (in compounds, in news media)”). [proper noun]'),
+('美', '미'),
+('美', '아름다울'),
+('美', '아름다울 미'),
+('美', '아름답다'),
+('羔', 'go'),
+('羔', 'ko'),
+('羔', '고'),
+('羔', '새끼양 고'),
+('羖', 'go'),
+('羖', 'ko'),
+('羖', '검은 암양 고'),
+('羖', '고'),
+('羗', 'gang'),
+('羗', 'kang'),
+('羗', '羌과 同字'),
+('羗', '강'),
+('羘', 'cang'),
+('羘', 'chang'),
+('羘', 'jang'),
+('羘', '수양 장'),
+('羘', '장'),
+('羚', '영양 령'),
+('羜', 'ce'),
+('羜', 'chŏ'),
+('羜', 'jeo'),
+('羜', '새끼 양: lamb, lambkin'),
+('羜', '저'),
+('羝', 'ce'),
+('羝', 'chŏ'),
+('羝', 'jeo'),
+('羝', '숫양 저'),
+('羝', '저'),
+('羞', ' 음식 수'),
+('羞', 'su'),
+('羞', 'swu'),
+('羞', '부끄러울 수'),
+('羞', '수'),
+('羡', '현이름 선'),
+('羣', 'crowd'),
+('羣', 'group'),
+('羣', 'gun'),
+('羣', 'kun'),
+('羣', 'kwun'),
+('羣', 'mob'),
+('羣', 'multitude'),
+('羣', '군'),
+('群', 'Hanja form of 군 (“group, crowd, horde, herd, flock, folk, people, mob”).'),
+('群', 'multitude'),
+('群', 'to crowd, flock, gather, assemble'),
+('群', '군'),
+('群', '무리'),
+('群', '무리 군'),
+('羨', 'Hanja form of 선 (“envy; envious”).'),
+('羨', 'Hanja form of 연 (“road to a grave”).'),
+('羨', '광중길 연'),
+('羨', '무덤길'),
+('羨', '부러워할'),
+('羨', '부러워할 선'),
+('羨', '부럽다'),
+('羨', '선'),
+('羨', '연'),
+('義', ' 뜻 의'),
+('義', ' 의리 의'),
+('義', 'Hanja form of 의 (“right conduct; righteousness; justice; morality”).'),
+('義', '옳다'),
+('義', '옳을'),
+('義', '옳을 의'),
+('義', '의'),
+('羫', 'gang'),
+('羫', 'kang'),
+('羫', '강'),
+('羫', '밭 갈 강'),
+('羯', ' 땅이름 갈'),
+('羯', 'gal'),
+('羯', 'kal'),
+('羯', '갈'),
+('羯', '불친 양 갈'),
+('羲', 'Fu Xi (伏羲 氏, 伏犧 氏: king and culture hero in ancient Chinese legend)'),
+('羲', '숨 희'),
+('羲', '희'),
+('羶', 'cen'),
+('羶', 'chŏn'),
+('羶', 'jeon'),
+('羶', '노린내날 전'),
+('羶', '전'),
+('羸', '리'),
+('羸', '여윌 리'),
+('羸', '이'),
+('羸', '파리하다'),
+('羸', '파리할'),
+('羹', 'gaeng'),
+('羹', 'kaeng'),
+('羹', 'kayng'),
+('羹', '갱'),
+('羹', '국 갱'),
+('羽', ' 오음의 하나 우'),
+('羽', 'Hanja form of 우 (“feather”).'),
+('羽', '깃'),
+('羽', '깃 우'),
+('羽', '늦추다'),
+('羽', '늦출'),
+('羽', '우'),
+('羽', '호'),
+('羿', 'Hou Yi, a legendary archer in Chinese mythology'),
+('羿', '예'),
+('翁', ' 새 목털 아래 옹'),
+('翁', '늙은이 옹'),
+('翁', '옹'),
+('翅', ' 깃 시'),
+('翅', ' 뿐 시'),
+('翅', '날개 시'),
+('翅', '시'),
+('翊', 'ik'),
+('翊', '도울 익'),
+('翊', '익'),
+('翌', 'Hanja form of 익 (“the next day”).'),
+('翌', '다음날'),
+('翌', '다음날 익'),
+('翌', '익'),
+('翎', '깃 령'),
+('翏', 'lyo'),
+('翏', 'ryo'),
+('翏', 'the sound of the wind'),
+('翏', 'to fly high'),
+('翏', '료'),
+('習', ' 거듭 습'),
+('習', 'Hanja form of 습 (“practice”).'),
+('習', '습'),
+('習', '익힐'),
+('習', '익힐 습'),
+('翔', 'Hanja form of 상 (“soar”).'),
+('翔', '날'),
+('翔', '날다'),
+('翔', '빙빙돌아날 상'),
+('翔', '상'),
+('翕', 'heup'),
+('翕', 'hup'),
+('翕', 'hŭp'),
+('翕', '합할 흡'),
+('翕', '흡'),
+('翖', 'heup'),
+('翖', 'hup'),
+('翖', 'hŭp'),
+('翖', '翕과 同字'),
+('翖', '흡'),
+('翚', 'hwi'),
+('翚', '휘'),
+('翛', ' 모지라질 소'),
+('翛', 'look of rumpled feathers'),
+('翛', 'so'),
+('翛', 'swift'),
+('翛', '날개치는 소리 소'),
+('翛', '소'),
+('翟', ' 황후의 옷 적'),
+('翟', '꿩 책'),
+('翟', '꿩의 깃 적'),
+('翠', ' 푸를 취'),
+('翠', 'ch''wi'),
+('翠', 'chwi'),
+('翠', '비취 취'),
+('翠', '취'),
+('翡', 'bi'),
+('翡', 'pi'),
+('翡', '물총새 비'),
+('翡', '비'),
+('翣', 'sap'),
+('翣', '삽'),
+('翣', '운삽 삽'),
+('翤', 'si'),
+('翤', '시'),
+('翦', ' 멸할 전'),
+('翦', 'cen'),
+('翦', 'chŏn'),
+('翦', 'jeon'),
+('翦', '베어 없앨 전'),
+('翦', '전'),
+('翩', ' 오락가락할 편'),
+('翩', '편'),
+('翩', '훌쩍 날 편'),
+('翫', ' 구경할 완'),
+('翫', ' 싫을 완'),
+('翫', 'wan'),
+('翫', '완'),
+('翫', '익숙할 완'),
+('翬', 'hwi'),
+('翬', '훨훨날 휘'),
+('翬', '휘'),
+('翮', ' 쭉지 핵'),
+('翮', ' 칼 갓 핵'),
+('翮', 'haek'),
+('翮', 'hayk'),
+('翮', '깃촉 핵'),
+('翮', '핵'),
+('翰', 'han'),
+('翰', '날개 한'),
+('翰', '한'),
+('翱', 'go'),
+('翱', 'ko'),
+('翱', '고'),
+('翳', ' 가려 숨길 예'),
+('翳', ' 깃 일산 예'),
+('翳', ' 새이름 예'),
+('翳', '어조사 예'),
+('翳', '예'),
+('翹', 'gyo'),
+('翹', 'kyo'),
+('翹', '교'),
+('翹', '꼬리 긴 깃털 교'),
+('翺', 'go'),
+('翺', 'ko'),
+('翺', '고'),
+('翺', '날 고'),
+('翻', 'beon'),
+('翻', 'pen'),
+('翻', 'pŏn'),
+('翻', 'to flutter'),
+('翻', 'to fly'),
+('翻', '날 번'),
+('翻', '번'),
+('翼', 'fins (of a fish)'),
+('翼', 'ik'),
+('翼', 'shelter'),
+('翼', 'wings'),
+('翼', '날개 익'),
+('翼', '익'),
+('翾', ' 경박할 현'),
+('翾', ' 급할 현'),
+('翾', ' 영리할 현'),
+('翾', 'hyen'),
+('翾', 'hyeon'),
+('翾', 'hyŏn'),
+('翾', '파뜩파뜩 날 현'),
+('翾', '현'),
+('耀', 'dazzle'),
+('耀', 'glory'),
+('耀', 'shine, sparkle'),
+('耀', 'yo'),
+('耀', '빛날 요'),
+('耀', '요'),
+('老', 'Hanja form of 로/노 (“old”).'),
+('老', 'Hanja form of 로/노 (“old”). [affix; suffix]'),
+('老', '노'),
+('老', '늙다'),
+('老', '늙은이 로'),
+('老', '늙을'),
+('老', '로'),
+('考', 'Hanja form of 고 (“to study; to investigate”).'),
+('考', 'Hanja form of 고 (“to test; to assess”).'),
+('考', 'Hanja form of 고 (“to think; to consider”).'),
+('考', '고'),
+('考', '상고할 고'),
+('考', '생각하다'),
+('考', '생각할'),
+('耄', '늙은이 모'),
+('耄', '모'),
+('者', 'Hanja form of 자 (“person”).'),
+('者', '놈'),
+('者', '놈 자'),
+('者', '자'),
+('耆', '늙은이 기'),
+('耇', 'dark spots on an aged person''s skin'),
+('耇', 'grow old'),
+('耇', 'gu'),
+('耇', 'ku'),
+('耇', 'kwu'),
+('耇', '구'),
+('耇', '명길 구'),
+('耈', 'gu'),
+('耈', 'ku'),
+('耈', 'kwu'),
+('耈', '耇와 同字'),
+('耈', '구'),
+('耉', 'gu'),
+('耉', 'ku'),
+('耉', 'kwu'),
+('耉', '구'),
+('耉', '늙을 구'),
+('耋', 'chil'),
+('耋', 'jil'),
+('耋', '질'),
+('而', ' 너 이'),
+('而', ' 말이을 이'),
+('而', ' 이에 이'),
+('而', '능'),
+('而', '능히'),
+('而', '말 이을'),
+('而', '순접의 어조사 이'),
+('而', '이'),
+('耎', '연'),
+('耐', 'Hanja form of 내 (“endure, bear”).'),
+('耐', 'Hanja form of 내 (“patient”).'),
+('耐', 'Hanja form of 내 (“resist”).'),
+('耐', '견디다'),
+('耐', '견딜'),
+('耐', '견딜 내'),
+('耐', '내'),
+('耑', 'dan'),
+('耑', 'end'),
+('耑', 'limit'),
+('耑', 'tan'),
+('耑', '단'),
+('耑', '시초 단'),
+('耒', '쟁기 뢰'),
+('耔', 'ca'),
+('耔', 'cha'),
+('耔', 'ja'),
+('耔', '복돋을 자'),
+('耔', '자'),
+('耕', 'Hanja form of 경 (“plow, cultivate”).'),
+('耕', '경'),
+('耕', '밭갈'),
+('耕', '밭갈 경'),
+('耖', 'ch''o'),
+('耖', 'cho'),
+('耖', '밭 거듭 갈 초 '),
+('耖', '초'),
+('耗', 'Hanja form of 모 (“decrease”).'),
+('耗', '모'),
+('耗', '줄'),
+('耗', '줄 모'),
+('耗', '줄다'),
+('耘', 'un'),
+('耘', 'wun'),
+('耘', '길 맬 운'),
+('耘', '운'),
+('耙', 'Hanja form of 파 (“harrow; rake”).'),
+('耙', '쇠시랑 파'),
+('耙', '써레'),
+('耙', '파'),
+('耞', 'ga'),
+('耞', 'ka'),
+('耞', '가'),
+('耞', '도리깨 가'),
+('耡', 'se'),
+('耡', 'seo'),
+('耡', 'sŏ'),
+('耡', '구실이름 서'),
+('耡', '서'),
+('耤', 'cek'),
+('耤', 'chŏk'),
+('耤', 'field plowed by Emperor'),
+('耤', 'jeok'),
+('耤', '적'),
+('耦', ' 겨리 우'),
+('耦', ' 짝 맞을 우'),
+('耦', 'u'),
+('耦', 'wu'),
+('耦', '우'),
+('耦', '쟁기 우'),
+('耨', 'nu'),
+('耨', 'nwu'),
+('耨', '김맬 누'),
+('耨', '누'),
+('耬', '씨 뿌리는 기구 루'),
+('耭', 'gi'),
+('耭', 'ki'),
+('耭', '갈 기'),
+('耭', '기'),
+('耰', ' 곰방메 우'),
+('耰', 'u'),
+('耰', 'wu'),
+('耰', '고무래 우'),
+('耰', '우'),
+('耳', ' 말 그칠 이'),
+('耳', ' 여덟대 손자 이'),
+('耳', ' 조자리 이'),
+('耳', 'Hanja form of 이 (“ear”).'),
+('耳', 'Hanja form of 이 (“ear”). [affix]'),
+('耳', '귀'),
+('耳', '귀 이'),
+('耳', '이'),
+('耶', ' 아비 야'),
+('耶', 'ya'),
+('耶', '야'),
+('耶', '의문의 어조야 야'),
+('耻', 'ch''i'),
+('耻', 'chi'),
+('耻', '恥의 俗字'),
+('耻', '치'),
+('耽', ' 귀 축 늘어질 탐'),
+('耽', ' 깊고 멀 탐'),
+('耽', ' 웅크리고 볼 탐'),
+('耽', ' 즐거울 탐'),
+('耽', '즐길 탐'),
+('耿', 'bright'),
+('耿', 'gyeong'),
+('耿', 'have guts'),
+('耿', 'kyeng'),
+('耿', 'kyŏng'),
+('耿', 'shining'),
+('耿', '경'),
+('耿', '빛날 경'),
+('聀', 'Yakja form of 職'),
+('聀', 'chik'),
+('聀', 'cik'),
+('聀', 'jik'),
+('聀', '직'),
+('聃', '노자이름 담'),
+('聃', '담'),
+('聆', '들을 령'),
+('聊', '귀 울 료'),
+('聒', 'clamor'),
+('聒', 'din, hubbub'),
+('聒', 'gwal'),
+('聒', 'kwal'),
+('聒', '괄'),
+('聒', '떠들석할 괄'),
+('聕', ' 긴 귀 호 '),
+('聕', 'ho'),
+('聕', '들릴 호'),
+('聕', '호'),
+('聖', ' 지극할 성'),
+('聖', ' 착할 성'),
+('聖', ' 통할 성'),
+('聖', 'Hanja form of 성 (“holy, saint, sacred”).'),
+('聖', '성'),
+('聖', '성스러울'),
+('聖', '성스럽다'),
+('聖', '성인 성'),
+('聘', 'bing'),
+('聘', 'ping'),
+('聘', '빙'),
+('聘', '찾아가다 빙'),
+('聚', ' 걷을 취'),
+('聚', ' 고을 취'),
+('聚', ' 쌓을 취'),
+('聚', 'ch''wi'),
+('聚', 'chwi'),
+('聚', '모을 취'),
+('聚', '취'),
+('聞', 'Hanja form of 문 (“hear”).'),
+('聞', '듣다'),
+('聞', '들을'),
+('聞', '들을 문'),
+('聞', '문'),
+('聬', '귀-에서 소리 날'),
+('聬', '옹'),
+('聮', '연할 련'),
+('聯', 'Hanja form of 련/연 (“associate, ally”).'),
+('聯', 'Hanja form of 련/연 (“connect, join”).'),
+('聯', '련'),
+('聯', '연'),
+('聯', '잇달'),
+('聯', '잇달 련'),
+('聯', '잇달다'),
+('聰', ' 민첩할 총'),
+('聰', 'ch''ong'),
+('聰', 'chong'),
+('聰', '귀 밝을 총'),
+('聰', '총'),
+('聱', ' 말 더듬거릴 오'),
+('聱', 'bent and twisted'),
+('聱', 'o'),
+('聱', 'too complicated'),
+('聱', '못 들은채 할 오'),
+('聱', '오'),
+('聲', ' 명예 성'),
+('聲', ' 풍류 성'),
+('聲', 'Hanja form of 성 (“voice, sound”).'),
+('聲', '성'),
+('聲', '소리'),
+('聲', '소리 성'),
+('聳', ' 공경할 용'),
+('聳', ' 귀먹을 용'),
+('聳', 'lofty'),
+('聳', 'rise up'),
+('聳', 'stir, excite'),
+('聳', 'to raise up'),
+('聳', 'urge on'),
+('聳', '솟을 용'),
+('聳', '용'),
+('聴', 'ch''ŏng'),
+('聴', 'cheng'),
+('聴', 'cheong'),
+('聴', '들을 청'),
+('聴', '청'),
+('聵', 'deaf'),
+('聵', 'oe'),
+('聵', 'oy'),
+('聵', '배냇귀머거리 외'),
+('聵', '외'),
+('聶', ' 낄 섭'),
+('聶', ' 성씨 섭'),
+('聶', 'seop'),
+('聶', 'sep'),
+('聶', 'sŏp'),
+('聶', '섭'),
+('聶', '소곤거릴 섭'),
+('職', 'Hanja form of 직 (“duty; profession”).'),
+('職', 'Hanja form of 직 (“office; post”).'),
+('職', '벼슬 직'),
+('職', '벼슬/직책'),
+('職', '직'),
+('聼', '들을 청'),
+('聼', '청'),
+('聽', 'Hanja form of 청 (“to listen”).'),
+('聽', '듣다'),
+('聽', '들을'),
+('聽', '들을 청'),
+('聽', '청'),
+('聾', '귀머거리 롱'),
+('聿', ' 붓 율'),
+('聿', ' 스스로 율'),
+('聿', ' 오직 율'),
+('聿', ' 지을 율'),
+('聿', 'Hanja form of 율 (“writing brush, paint brush”).'),
+('聿', '마침내 율'),
+('聿', '붓'),
+('聿', '율'),
+('肄', ' 곁가지 이'),
+('肄', ' 수고할 이'),
+('肄', ' 휘추리 이'),
+('肄', 'i'),
+('肄', '이'),
+('肄', '익힐 이'),
+('肅', ' 경계할 숙'),
+('肅', ' 공경할 숙'),
+('肅', 'suk'),
+('肅', 'swuk'),
+('肅', '공손할 숙'),
+('肅', '숙'),
+('肆', '방자할 사'),
+('肆', '사'),
+('肇', 'cho'),
+('肇', 'co'),
+('肇', '비롯할 조'),
+('肇', '조'),
+('肉', ' 몸 육'),
+('肉', ' 살찔 유'),
+('肉', ' 저울추 유'),
+('肉', 'Hanja form of 육 (“meat, flesh”).'),
+('肉', '고기'),
+('肉', '고기 육'),
+('肉', '둘레 유'),
+('肉', '육'),
+('肋', 'Hanja form of 륵/늑 (“rib”).'),
+('肋', '갈비'),
+('肋', '갈비 륵'),
+('肋', '늑'),
+('肋', '륵'),
+('肌', 'gi'),
+('肌', 'ki'),
+('肌', 'meat on bones'),
+('肌', 'muscle tissue'),
+('肌', '기'),
+('肌', '살 기'),
+('肓', 'hwang'),
+('肓', '명치 끝 황'),
+('肓', '황'),
+('肖', ' 흩어질 소'),
+('肖', '닮을 초'),
+('肖', '쇠약할 소'),
+('肘', 'Hanja form of 주 (“elbow”).'),
+('肘', '주'),
+('肘', '팔꿈치'),
+('肘', '팔꿈치 주'),
+('肙', 'yen'),
+('肙', 'yeon'),
+('肙', 'yŏn'),
+('肙', '연'),
+('肚', 'du'),
+('肚', 'tu'),
+('肚', 'twu'),
+('肚', '두'),
+('肚', '밥통 두'),
+('肛', ' 배 뚱뚱할 항'),
+('肛', 'Hanja form of 항 (“anus”).'),
+('肛', '똥구멍 항'),
+('肛', '항'),
+('肛', '항문'),
+('肝', 'Hanja form of 간 (“liver”).'),
+('肝', '간'),
+('肝', '간 간'),
+('股', 'Hanja form of 고 (“thigh”).'),
+('股', '고'),
+('股', '넓적다리'),
+('股', '넓적다리 고'),
+('肢', 'Hanja form of 지 (“limb”).'),
+('肢', '사지 지'),
+('肢', '지'),
+('肢', '팔다리'),
+('肥', '비'),
+('肥', '살찔 비'),
+('肦', '나눌 반'),
+('肦', '머리 클 분'),
+('肧', '배'),
+('肩', ' 맡길 견'),
+('肩', ' 멜 견'),
+('肩', ' 세 살 된 짐승 견'),
+('肩', ' 이길 견'),
+('肩', 'Hanja form of 견 (“shoulder”).'),
+('肩', '견'),
+('肩', '어깨'),
+('肩', '어깨 견'),
+('肪', '기름 방'),
+('肪', '방'),
+('肫', ' 정성스러울 순'),
+('肫', 'gizzard of fowl'),
+('肫', 'honest'),
+('肫', 'sincere'),
+('肫', 'sun'),
+('肫', 'swun'),
+('肫', '광대뼈 순'),
+('肫', '순'),
+('肭', 'nul'),
+('肭', 'nwul'),
+('肭', '눌'),
+('肭', '물개 눌'),
+('肯', 'Hanja form of 긍 (“consent to, permit”).'),
+('肯', 'Hanja form of 긍 (“willing”).'),
+('肯', '긍'),
+('肯', '옳이 여길'),
+('肯', '옳이 여길 긍'),
+('肱', '굉'),
+('肱', '팔뚝 굉'),
+('育', ' 날 육'),
+('育', ' 자랄 육'),
+('育', 'Hanja form of 육 (“to raise”).'),
+('育', '기를'),
+('育', '기를 육'),
+('育', '육'),
+('肴', 'hyo'),
+('肴', '안주 효'),
+('肴', '효'),
+('肵', 'gi'),
+('肵', 'ki'),
+('肵', '기'),
+('肵', '적대 기'),
+('肺', ' 마음속 폐'),
+('肺', ' 부아 폐'),
+('肺', ' 친할 폐'),
+('肺', 'Hanja form of 폐 (“lungs”).'),
+('肺', 'Hanja form of 폐 (“lungs”). [noun]'),
+('肺', '성할 패'),
+('肺', '폐'),
+('肺', '허파'),
+('肺', '허파 폐'),
+('胃', ' 별 이름 위'),
+('胃', ' 성씨 위'),
+('胃', 'Hanja form of 위 (“stomach”).'),
+('胃', '밥통 위'),
+('胃', '위'),
+('胃', '위장(胃臟)'),
+('胄', 'chu'),
+('胄', 'cwu'),
+('胄', 'ju'),
+('胄', '주'),
+('胄', '후사 주'),
+('胆', 'dam'),
+('胆', 'tam'),
+('胆', '담'),
+('胆', '침비깨 단'),
+('胊', 'gu'),
+('胊', 'ku'),
+('胊', 'kwu'),
+('胊', '구'),
+('胊', '포(얇게 저미어서 말린 고기) 구'),
+('背', ' 배반할 패'),
+('背', 'Hanja form of 배 (“back”).'),
+('背', 'Hanja form of 배 (“betrayal”).'),
+('背', '등'),
+('背', '등 배'),
+('背', '배'),
+('背', '버릴 패'),
+('胎', ' 시작 태'),
+('胎', 'Hanja form of 태 (“uterus”).'),
+('胎', '아이 밸'),
+('胎', '아이 밸 태'),
+('胎', '태'),
+('胕', 'bu'),
+('胕', 'pu'),
+('胕', '부'),
+('胕', '장부 부 '),
+('胖', 'ban'),
+('胖', 'pan'),
+('胖', '반'),
+('胖', '희생 반'),
+('胙', 'cho'),
+('胙', 'co'),
+('胙', 'jo'),
+('胙', '복 조'),
+('胙', '조'),
+('胚', 'embryo'),
+('胚', '배'),
+('胚', '아이 밸 배'),
+('胛', 'gap'),
+('胛', 'kap'),
+('胛', '갑'),
+('胛', '어깻죽지 갑'),
+('胞', ' 동포 포'),
+('胞', ' 한 배 포'),
+('胞', 'Hanja form of 포 (“cell”).'),
+('胞', '세포'),
+('胞', '태보 포'),
+('胞', '포'),
+('胠', ' 갈비 거'),
+('胠', 'armpit'),
+('胠', 'geo'),
+('胠', 'ke'),
+('胠', 'kŏ'),
+('胠', '거'),
+('胠', '열 거'),
+('胡', 'ho'),
+('胡', '턱밑살 호'),
+('胡', '호'),
+('胤', ' 익힐 윤'),
+('胤', '맏아들 윤'),
+('胤', '윤'),
+('胥', 'se'),
+('胥', 'seo'),
+('胥', 'sŏ'),
+('胥', '서'),
+('胥', '서로 서'),
+('胯', '사타구니 고'),
+('胯', '사타구니 과'),
+('胱', 'Hanja form of 광 (“bladder”).'),
+('胱', '광'),
+('胱', '오줌통'),
+('胱', '오줌통 광'),
+('胴', 'dong'),
+('胴', 'tong'),
+('胴', '동'),
+('胴', '큰 창자 동'),
+('胷', 'Alternative form of 胸 (“Hanja form of 흉 (“chest”).”)'),
+('胷', '胸과 同字'),
+('胷', '가슴'),
+('胷', '흉'),
+('胸', 'Hanja form of 흉 (“chest; box”).'),
+('胸', '가슴'),
+('胸', '가슴 흉'),
+('胸', '흉'),
+('胻', '정강이뼈'),
+('胻', '행'),
+('胼', 'byeon'),
+('胼', 'pyen'),
+('胼', 'pyŏn'),
+('胼', '腁의 俗字'),
+('胼', '변'),
+('能', 'Alternative form of 耐 (“Hanja form of 내 (“endure; withstand”).”)'),
+('能', 'Hanja form of 능 (“ability”).'),
+('能', '견디다'),
+('能', '견딜'),
+('能', '내'),
+('能', '능'),
+('能', '능하다'),
+('能', '능할'),
+('能', '능할 능'),
+('能', '세 발 자라 내'),
+('胾', 'ca'),
+('胾', 'cha'),
+('胾', 'ja'),
+('胾', '고깃점 자'),
+('胾', '자'),
+('脂', 'chi'),
+('脂', 'ci'),
+('脂', 'ji'),
+('脂', '기름 지'),
+('脂', '지'),
+('脅', ' 위협할 협'),
+('脅', 'hyeop'),
+('脅', 'hyep'),
+('脅', 'hyŏp'),
+('脅', '갈빗대 협'),
+('脅', '협'),
+('脆', ' 약할 취'),
+('脆', 'brittle'),
+('脆', 'crisp'),
+('脆', 'fragile, frail'),
+('脆', '연(軟)할'),
+('脆', '연하다'),
+('脆', '연할 취'),
+('脆', '취'),
+('脇', 'hyeop'),
+('脇', 'hyep'),
+('脇', 'hyŏp'),
+('脇', '脅과 同字'),
+('脇', '협'),
+('脈', 'Hanja form of 맥 (“pulse”).'),
+('脈', 'Hanja form of 맥 (“vein”).'),
+('脈', '맥'),
+('脈', '맥 맥'),
+('脈', '줄기'),
+('脉', 'maek'),
+('脉', 'mayk'),
+('脉', '脈의 古字'),
+('脉', '맥'),
+('脊', 'Hanja form of 척 (“spine; backbone”).'),
+('脊', '등마루'),
+('脊', '등성마루 척'),
+('脊', '척'),
+('脖', 'bal'),
+('脖', 'pal'),
+('脖', '발'),
+('脖', '배꼽 발'),
+('脘', '완'),
+('脘', '중완 완'),
+('脚', 'Hanja form of 각 (“base; leg; foundation”).'),
+('脚', 'Hanja form of 각 (“base; leg; foundation”). [affix]'),
+('脚', '각'),
+('脚', '다리'),
+('脚', '다리 각'),
+('脛', 'gyeong'),
+('脛', 'kyeng'),
+('脛', 'kyŏng'),
+('脛', '경'),
+('脛', '정강이 경'),
+('脣', 'Hanja form of 순 (“lip”).'),
+('脣', '순'),
+('脣', '입술'),
+('脣', '입술 순'),
+('脤', 'sin'),
+('脤', '사직제 지낸 고기 신'),
+('脤', '신'),
+('脧', 'choe'),
+('脧', 'coy'),
+('脧', 'joe'),
+('脧', '죄'),
+('脧', '줄일 선'),
+('脩', ' 길 수'),
+('脩', ' 마를 수'),
+('脩', 'su'),
+('脩', 'swu'),
+('脩', '수'),
+('脩', '포 수'),
+('脫', ' 간략할 탈'),
+('脫', ' 그르칠 탈'),
+('脫', ' 더딜 태'),
+('脫', ' 뼈 바를 탈'),
+('脫', '벗어날 탈'),
+('脫', '천천할 태'),
+('脯', 'Hanja form of 포 (“dried meat”).'),
+('脯', '포'),
+('脯', '포 포'),
+('脰', '두'),
+('脰', '목 두'),
+('脱', '脫과 同字'),
+('脱', '脫와 同字'),
+('脳', '머리골 뇌'),
+('脵', 'go'),
+('脵', 'ko'),
+('脵', '고'),
+('脹', 'Hanja form of 창 (“to expand; to swell”).'),
+('脹', '배부를 창'),
+('脹', '부을'),
+('脹', '붓다'),
+('脹', '창'),
+('脺', ' 머리덜미 수 '),
+('脺', 'su'),
+('脺', 'swu'),
+('脺', '수'),
+('脺', '얼굴 윤택할 수'),
+('脾', 'Hanja form of 비 (“spleen”).'),
+('脾', '비'),
+('脾', '지라'),
+('脾', '지라 비'),
+('腁', '변'),
+('腁', '살갗 틀 변'),
+('腆', ' 많이 차려놓을 전'),
+('腆', ' 지극할 전'),
+('腆', '두터울 전'),
+('腆', '전'),
+('腊', '석'),
+('腊', '포 석'),
+('腋', 'Hanja form of 액 (“armpit”).'),
+('腋', '겨드랑이'),
+('腋', '겨드랑이 액'),
+('腋', '액'),
+('腎', ' 불알 신'),
+('腎', ' 자지 신'),
+('腎', 'Hanja form of 신 (“kidney”).'),
+('腎', '신'),
+('腎', '콩팥'),
+('腎', '콩팥 신'),
+('腐', 'Hanja form of 부 (“rot, decay, spoil”).'),
+('腐', '부'),
+('腐', '썩다'),
+('腐', '썩을'),
+('腐', '썩을 부'),
+('腑', 'Hanja form of 부 (“the six viscera(bowels)”).'),
+('腑', '부'),
+('腑', '육부'),
+('腑', '장부 부'),
+('腒', ' 꿩 포 거'),
+('腒', 'geo'),
+('腒', 'ke'),
+('腒', 'kŏ'),
+('腒', '거'),
+('腒', '건치 거'),
+('腓', 'bi'),
+('腓', 'pi'),
+('腓', '비'),
+('腓', '장딴지 비'),
+('腔', ' 말 허구리 강'),
+('腔', ' 뼈대 강'),
+('腔', ' 속 빌 강'),
+('腔', 'Hanja form of 강 (“cavity; hollow in body”).'),
+('腔', '강'),
+('腔', '속 빌'),
+('腔', '창자 강'),
+('腕', 'Hanja form of 완 (“arm; wrist”).'),
+('腕', '완'),
+('腕', '팔'),
+('腕', '팔뚝 완'),
+('腟', 'chil'),
+('腟', 'cil'),
+('腟', 'jil'),
+('腟', '膣과 同字'),
+('腟', '질'),
+('腠', '살결 주'),
+('腠', '주'),
+('腤', 'am'),
+('腤', '고기 삶을 암 '),
+('腤', '암'),
+('腥', ' 날고기 성'),
+('腥', ' 더러울 성'),
+('腥', 'seng'),
+('腥', 'seong'),
+('腥', 'sŏng'),
+('腥', '비린내 성'),
+('腥', '성'),
+('腦', 'Hanja form of 뇌 (“brain”).'),
+('腦', 'Hanja form of 뇌 (“brain”). [noun]'),
+('腦', '뇌'),
+('腦', '머리 뇌'),
+('腦', '머릿골'),
+('腫', 'Hanja form of 종 (“tumour”).'),
+('腫', '부스럼'),
+('腫', '부스럼 종'),
+('腫', '종'),
+('腭', 'ak'),
+('腭', '악'),
+('腭', '잇몸 악'),
+('腰', 'Hanja form of 요 (“waist; hips”).'),
+('腰', '요'),
+('腰', '허리'),
+('腰', '허리 요'),
+('腱', 'geon'),
+('腱', 'ken'),
+('腱', 'kŏn'),
+('腱', '건'),
+('腱', '힘줄 건'),
+('腳', '각'),
+('腳', '다리'),
+('腴', 'yu'),
+('腴', '아랫배 살찔 유'),
+('腴', '유'),
+('腶', 'dan'),
+('腶', 'tan'),
+('腶', '단'),
+('腶', '약포 단'),
+('腷', ' 닭 홰치는 소리 픽 '),
+('腷', ' 답답할 픽'),
+('腷', 'melancholy'),
+('腷', 'stuffy; suffocating'),
+('腷', '답답할'),
+('腷', '뜩 막힐 픽'),
+('腷', '픽'),
+('腸', 'Hanja form of 장 (“intestine”).'),
+('腸', '장'),
+('腸', '창자'),
+('腸', '창자 장'),
+('腹', 'Hanja form of 복 (“belly; abdomen; stomach”).'),
+('腹', '배'),
+('腹', '배 복'),
+('腹', '복'),
+('腺', 'Hanja form of 선 (“(anatomy) gland”).'),
+('腺', '샘'),
+('腺', '샘 선'),
+('腺', '선'),
+('腿', 'Hanja form of 퇴 (“thigh”).'),
+('腿', '넓적다리'),
+('腿', '넓적다리 퇴'),
+('腿', '퇴'),
+('膀', 'Hanja form of 방 (“bladder”).'),
+('膀', '방'),
+('膀', '쌍배 방'),
+('膀', '오줌통'),
+('膂', '등골 뼈 려'),
+('膂', '등골뼈'),
+('膂', '려'),
+('膂', '여'),
+('膃', ' 살찔 올'),
+('膃', 'ol'),
+('膃', '올'),
+('膃', '해구 올'),
+('膄', 'su'),
+('膄', 'swu'),
+('膄', '수'),
+('膄', '파리할 수'),
+('膆', ' 멀떠구니 소'),
+('膆', 'so'),
+('膆', '살찔 소'),
+('膆', '소'),
+('膈', '격'),
+('膈', '명치 격'),
+('膊', 'bak'),
+('膊', 'pak'),
+('膊', '박'),
+('膊', '포 박'),
+('膋', '발기름 료'),
+('膏', 'ko'),
+('膏', '고'),
+('膏', '살찔 고'),
+('膕', 'goek'),
+('膕', 'the inside corner or hollow of the knee, elbow, bow, etc.'),
+('膕', '괵'),
+('膘', ' 부레 표'),
+('膘', ' 소 볼기 표'),
+('膘', 'p''yo'),
+('膘', 'phyo'),
+('膘', 'pyo'),
+('膘', '표'),
+('膘', '허구리살 표'),
+('膚', 'Hanja form of 부 (“skin”).'),
+('膚', '부'),
+('膚', '살갗'),
+('膚', '살갗 부'),
+('膜', 'Hanja form of 막 (“membrane; film”).'),
+('膜', '꺼풀'),
+('膜', '막'),
+('膜', '막 막'),
+('膜', '무릎 꿇을 모'),
+('膝', ' 종지뼈 슬'),
+('膝', ' 치슬말 슬'),
+('膝', 'Hanja form of 슬 (“knee”).'),
+('膝', 'Hanja form of 슬 (“knee”). [affix]'),
+('膝', '무릎'),
+('膝', '무릎 슬'),
+('膝', '슬'),
+('膞', ' 질그릇 만드는 틀 전 '),
+('膞', 'cen'),
+('膞', 'chŏn'),
+('膞', 'jeon'),
+('膞', '썰 전'),
+('膞', '전'),
+('膠', 'gyo'),
+('膠', 'kyo'),
+('膠', '교'),
+('膠', '아교 교'),
+('膣', 'Hanja form of 질 (“vagina”).'),
+('膣', '보지'),
+('膣', '새살 날 질'),
+('膣', '질'),
+('膨', 'p''aeng'),
+('膨', 'paeng'),
+('膨', 'phayng'),
+('膨', '배 불룩할 팽'),
+('膨', '팽'),
+('膩', '살찔 니'),
+('膰', 'beon'),
+('膰', 'pen'),
+('膰', 'pŏn'),
+('膰', '번'),
+('膰', '제사 고기 번'),
+('膳', 'Hanja form of 선 (“gift; present”).'),
+('膳', 'Hanja form of 선 (“meal”).'),
+('膳', '반찬'),
+('膳', '반찬 선'),
+('膳', '선'),
+('膳', '선물'),
+('膴', ' 크게 저민 고기 무'),
+('膴', 'mu'),
+('膴', '무'),
+('膴', '포 무'),
+('膵', ' 지라 췌'),
+('膵', 'ch''we'),
+('膵', 'chwe'),
+('膵', 'chwey'),
+('膵', '첩육경 췌'),
+('膵', '췌'),
+('膸', 'su'),
+('膸', 'swu'),
+('膸', '髓와 同字 '),
+('膸', '수'),
+('膹', 'bun'),
+('膹', 'pun'),
+('膹', '고기 삶은 국 분 '),
+('膹', '분'),
+('膺', ' 당할 응'),
+('膺', ' 받을 응'),
+('膺', ' 응할 응'),
+('膺', ' 친할 응'),
+('膺', 'Hanja form of 응 (“breasts”).'),
+('膺', '가슴'),
+('膺', '가슴 응'),
+('膺', '응'),
+('膽', 'Hanja form of 담 (“courage; nerve”).'),
+('膽', 'Hanja form of 담 (“gall bladder”).'),
+('膽', '담'),
+('膽', '쓸개'),
+('膽', '쓸개 담'),
+('膾', 'Hanja form of 회 (“sliced raw meat or fish”).'),
+('膾', '회'),
+('膾', '회 회'),
+('膿', 'Hanja form of 농 (“pus”).'),
+('膿', '고름'),
+('膿', '고름 농'),
+('膿', '농'),
+('臀', 'Hanja form of 둔 (“buttocks”).'),
+('臀', '둔'),
+('臀', '볼기'),
+('臀', '볼기 둔'),
+('臂', 'Hanja form of 비 (“arm”).'),
+('臂', '비'),
+('臂', '팔'),
+('臂', '팔 비'),
+('臆', ' 가득할 억'),
+('臆', 'Hanja form of 억 (“chest”).'),
+('臆', '가슴'),
+('臆', '가슴 억'),
+('臆', '억'),
+('臉', 'cheek'),
+('臉', 'face'),
+('臉', '검'),
+('臉', '뺨'),
+('臊', 'cho'),
+('臊', 'co'),
+('臊', 'jo'),
+('臊', '누릴 조'),
+('臊', '조'),
+('臍', 'Hanja form of 제 (“navel”).'),
+('臍', '배꼽'),
+('臍', '배꼽 제'),
+('臍', '제'),
+('臏', 'bin'),
+('臏', 'kneecap'),
+('臏', 'pin'),
+('臏', '빈'),
+('臏', '종지뼈 빈'),
+('臑', 'no'),
+('臑', '노'),
+('臑', '팔마디 노'),
+('臘', '납향 랍'),
+('臙', ' 연지 연'),
+('臙', 'yen'),
+('臙', 'yeon'),
+('臙', 'yŏn'),
+('臙', '목구멍 연'),
+('臙', '연'),
+('臚', '살갗 려'),
+('臝', '벌거벗을 라'),
+('臟', '오장 장'),
+('臟', '장'),
+('臠', '저민고기 련'),
+('臣', ' 두려울 신'),
+('臣', 'Hanja form of 신 (“one who serves”).'),
+('臣', '신'),
+('臣', '신하'),
+('臣', '신하 신'),
+('臤', 'gan'),
+('臤', 'hard'),
+('臤', 'kan'),
+('臤', 'wise'),
+('臤', '간'),
+('臥', ' 쉴 와'),
+('臥', '누울 와'),
+('臥', '와'),
+('臧', '장'),
+('臧', '착할 장'),
+('臨', 'Hanja form of 림/임 (“descend”).'),
+('臨', 'Hanja form of 림/임 (“draw near, approach”).'),
+('臨', '림'),
+('臨', '임'),
+('臨', '임하다'),
+('臨', '임할'),
+('臨', '임할 림'),
+('自', 'Hanja form of 자 (“self”).'),
+('自', '스스로'),
+('自', '스스로 자'),
+('自', '자'),
+('臬', ' 과녁 얼'),
+('臬', ' 문지방 얼'),
+('臬', '법 얼'),
+('臬', '얼'),
+('臭', ' 고약한 이름 취'),
+('臭', ' 썪을 취'),
+('臭', ' 향기 취'),
+('臭', 'Hanja form of 취 (“smell”).'),
+('臭', '냄새'),
+('臭', '냄새 취'),
+('臭', '취'),
+('至', 'chi'),
+('至', 'ci'),
+('至', 'ji'),
+('至', '이를 지'),
+('至', '지'),
+('致', ' 극진할 치'),
+('致', ' 드릴 치'),
+('致', ' 버릴 치'),
+('致', ' 보낼 치'),
+('致', ' 불러올 치'),
+('致', ' 연구할 치'),
+('致', ' 풍치 치'),
+('致', 'Hanja form of 치 (“to reach; to result in”).'),
+('致', '이르다'),
+('致', '이를'),
+('致', '이를 치'),
+('致', '치'),
+('臶', 'ch''ŏn'),
+('臶', 'chen'),
+('臶', 'cheon'),
+('臶', '거듭 천 '),
+('臶', '천'),
+('臺', 'Hanja form of 대 (“(after a number) in the... s”).'),
+('臺', 'Hanja form of 대 (“(after a number) in the... s”). [suffix]'),
+('臺', 'Hanja form of 대 (“counter for vehicles or machinery”).'),
+('臺', 'Hanja form of 대 (“counter for vehicles or machinery”). [counter]'),
+('臺', 'Hanja form of 대 (“platform”).'),
+('臺', 'Hanja form of 대 (“platform”). [noun]'),
+('臺', '능 대'),
+('臺', '대'),
+('臻', 'chin'),
+('臻', 'cin'),
+('臻', 'jin'),
+('臻', '이를 진'),
+('臻', '진'),
+('臼', '구'),
+('臼', '절구 구'),
+('臽', 'ham'),
+('臽', 'hollow, hole'),
+('臽', 'pit'),
+('臽', '함'),
+('臾', ' 나라이름 유'),
+('臾', ' 착할 유'),
+('臾', ' 활이 뒤로 젖혀질 유'),
+('臾', '유'),
+('臾', '잠간 유'),
+('臿', 'sap'),
+('臿', '삽'),
+('舀', 'ladle out'),
+('舀', 'spoon out'),
+('舀', 'yo'),
+('舀', '요'),
+('舁', 'ye'),
+('舁', 'yeo'),
+('舁', 'yŏ'),
+('舁', '마주들 여'),
+('舁', '여'),
+('舂', ' 쇠북소리 용'),
+('舂', ' 해가 질 용'),
+('舂', '방아 찧을 용'),
+('舃', 'sek'),
+('舃', 'seok'),
+('舃', 'sŏk'),
+('舃', '석'),
+('舃', '신 석'),
+('舄', 'sek'),
+('舄', 'seok'),
+('舄', 'sŏk'),
+('舄', '舃의 略字'),
+('舄', '석'),
+('舅', 'gu'),
+('舅', 'ku'),
+('舅', 'kwu'),
+('舅', '구'),
+('舅', '외삼촌 구'),
+('與', ' 같을 여'),
+('與', ' 더불어 여'),
+('與', ' 미칠 여'),
+('與', 'Hanja form of 여 (“and; with; to; for”).'),
+('與', 'Hanja form of 여 (“and; with; to; for”). [affix]'),
+('與', 'Hanja form of 여 (“to give; to grant”).'),
+('與', 'Hanja form of 여 (“to give; to grant”). [affix]'),
+('與', 'Hanja form of 여 (“to participate”).'),
+('與', 'Hanja form of 여 (“to participate”). [affix]'),
+('與', '너울너울할 여'),
+('與', '더불'),
+('與', '여'),
+('與', '줄'),
+('與', '참여하다'),
+('與', '참여할'),
+('興', 'Hanja form of 흥 (“excitement; fun; joy; pleasure”).'),
+('興', 'Hanja form of 흥 (“interest”).'),
+('興', 'Hanja form of 흥 (“to rise; to get up”).'),
+('興', 'Hanja form of 흥 (“to thrive; to prosper; to flourish”).'),
+('興', '일'),
+('興', '일 흥'),
+('興', '일다'),
+('興', '흥'),
+('興', '흥취(興趣)'),
+('舊', 'Hanja form of 예 (“old”).'),
+('舊', '구'),
+('舊', '예'),
+('舊', '옛 구'),
+('舌', 'Hanja form of 설 (“tongue”).'),
+('舌', '설'),
+('舌', '혀'),
+('舌', '혀 설'),
+('舍', 'Hanja form of 사 (“house; residence; reside”).'),
+('舍', '사'),
+('舍', '집'),
+('舍', '집 사'),
+('舐', '지'),
+('舐', '핥을 지'),
+('舒', 'se'),
+('舒', 'seo'),
+('舒', 'sŏ'),
+('舒', '서'),
+('舒', '펼 서'),
+('舖', 'p''o'),
+('舖', 'pho'),
+('舖', 'po'),
+('舖', '鋪의 俗字'),
+('舖', '포'),
+('舘', 'gwan'),
+('舘', 'kwan'),
+('舘', '객사 관'),
+('舘', '관'),
+('舛', 'ch''ŏn'),
+('舛', 'chen'),
+('舛', 'cheon'),
+('舛', '어그러질 천'),
+('舛', '천'),
+('舜', ' 무궁화 순'),
+('舜', 'sun'),
+('舜', 'swun'),
+('舜', '순'),
+('舜', '순임금 순'),
+('舞', 'Hanja form of 무 (“brandish”).'),
+('舞', 'Hanja form of 무 (“dance, posture, prance”).'),
+('舞', '무'),
+('舞', '춤추다'),
+('舞', '춤출'),
+('舞', '춤출 무'),
+('舟', 'KangXi radical 137'),
+('舟', 'boat, ship'),
+('舟', 'chu'),
+('舟', 'cwu'),
+('舟', 'ju'),
+('舟', '배 주'),
+('舟', '주'),
+('舡', 'gang'),
+('舡', 'kang'),
+('舡', '강'),
+('舡', '오나라 배 강'),
+('舢', 'a small boat attached to a ship'),
+('舢', '산'),
+('航', ' 배질할 항'),
+('航', 'hang'),
+('航', '쌍배 항'),
+('航', '항'),
+('舫', '방'),
+('舫', '배 방'),
+('般', 'Hanja form of 반 (“similar, general”).'),
+('般', 'Hanja form of 반 (“sort, manner, kind, category”).'),
+('般', '가지'),
+('般', '반'),
+('般', '옮길 반'),
+('般', '일반'),
+('舳', ' 배 꼬리 축'),
+('舳', 'ch''uk'),
+('舳', 'chuk'),
+('舳', 'chwuk'),
+('舳', '고물 축'),
+('舳', '축'),
+('舵', 'Hanja form of 타 (“rudder, tiller, helm”).'),
+('舵', '키'),
+('舵', '키 타'),
+('舵', '타'),
+('舶', 'bak'),
+('舶', 'pak'),
+('舶', '박'),
+('舶', '배 박'),
+('舷', 'Hanja form of 현 (“the sides of a boat”).'),
+('舷', '뱃전'),
+('舷', '뱃전 현'),
+('舷', '현'),
+('舸', 'ga'),
+('舸', 'ka'),
+('舸', '가'),
+('舸', '큰 배 가'),
+('船', 'Hanja form of 선 (“ship; boat; vessel”).'),
+('船', '배'),
+('船', '배 선'),
+('船', '선'),
+('舽', 'bang'),
+('舽', 'pang'),
+('舽', '방'),
+('舽', '배 방 '),
+('艀', 'bu'),
+('艀', 'pu'),
+('艀', '부'),
+('艀', '작은 배 부'),
+('艅', 'ye'),
+('艅', 'yeo'),
+('艅', 'yŏ'),
+('艅', '나룻배 여'),
+('艅', '여'),
+('艇', ' 작은 배 정'),
+('艇', '거룻배 정'),
+('艇', '정'),
+('艈', '류'),
+('艈', '배 흐를'),
+('艈', '유'),
+('艍', 'geo'),
+('艍', 'ke'),
+('艍', 'kŏ'),
+('艍', '거'),
+('艑', 'p''yŏn'),
+('艑', 'phyen'),
+('艑', 'pyeon'),
+('艑', '거룻배 편'),
+('艑', '편'),
+('艘', '배 소'),
+('艘', '소'),
+('艙', 'ch''ang'),
+('艙', 'chang'),
+('艙', '선창 창'),
+('艙', '창'),
+('艚', 'ship'),
+('艚', '거룻배 조'),
+('艚', '조'),
+('艟', 'dong'),
+('艟', 'tong'),
+('艟', '동'),
+('艟', '배 동'),
+('艤', '배 닿을 의'),
+('艤', '의'),
+('艦', 'Hanja form of 함 (“warship”).'),
+('艦', 'Hanja form of 함 (“warship”). [noun]'),
+('艦', '싸움배'),
+('艦', '싸움배 함'),
+('艦', '함'),
+('艨', 'mong'),
+('艨', '몽'),
+('艨', '싸움배 몽'),
+('艪', '艫와 同字'),
+('艫', '뱃머리 로'),
+('艮', 'Hanja form of 간 (“one of the Eight Trigrams 八卦”).'),
+('艮', 'Hanja form of 간 (“to stop; to cease”).'),
+('艮', 'Hanja form of 은 (“silver”).'),
+('艮', 'Hanja form of 흔 (“to pull; to draw; to drag”).'),
+('艮', '간'),
+('艮', '괘 이름'),
+('艮', '괘이름 간'),
+('艮', '그치다'),
+('艮', '그칠'),
+('艮', '끌'),
+('艮', '끌다'),
+('艮', '은'),
+('艮', '흔'),
+('良', 'Hanja form of 량 (“good”).'),
+('良', 'Hanja form of 량 (“good”). [affix]'),
+('良', 'Hanja form of 양 (“good”).'),
+('良', 'Hanja form of 양 (“good”). [affix]'),
+('良', '량'),
+('良', '양'),
+('良', '어질'),
+('良', '어질다'),
+('良', '좋을 량'),
+('艱', 'gan'),
+('艱', 'kan'),
+('艱', '간'),
+('艱', '어려울 간'),
+('色', 'Hanja form of 색 (“colour”).'),
+('色', 'Hanja form of 색 (“colour”). [noun]'),
+('色', '빛'),
+('色', '빛 색'),
+('色', '색'),
+('艴', '발끈할 불'),
+('艴', '불'),
+('艶', ' 얼굴 탐스러울 염'),
+('艶', 'Hanja form of 염 (“charming, voluptuous; love affair, romance; gloss, luster”).'),
+('艶', '고울'),
+('艶', '고울 염'),
+('艶', '곱다'),
+('艶', '염'),
+('艷', 'Orthodox form of 艶'),
+('艷', '艷의 本字'),
+('艷', '고울'),
+('艷', '곱다'),
+('艷', '염'),
+('艸', 'ch''o'),
+('艸', 'cho'),
+('艸', '초'),
+('艸', '풀 초'),
+('艾', 'moxa, mugwort'),
+('艾', '다스리다'),
+('艾', '다스릴'),
+('艾', '쑥'),
+('艾', '쑥 애'),
+('艾', '애'),
+('艾', '예'),
+('芈', ' 성씨 미'),
+('芈', 'mi'),
+('芈', '미'),
+('芈', '양이 울 미'),
+('芊', 'ch''ŏn'),
+('芊', 'chen'),
+('芊', 'cheon'),
+('芊', '천'),
+('芊', '풀 무성할 천'),
+('芋', 'Hanja form of 우 (“taro”).'),
+('芋', 'Hanja form of 후 (“large; great”).'),
+('芋', '우'),
+('芋', '크다'),
+('芋', '클'),
+('芋', '클 후'),
+('芋', '토란'),
+('芋', '토란 우'),
+('芋', '후'),
+('芍', ' 연꽃의 열매 적'),
+('芍', '연밥 적'),
+('芍', '작약 작'),
+('芎', 'gung'),
+('芎', 'kung'),
+('芎', 'kwung'),
+('芎', '궁'),
+('芎', '궁궁이 궁'),
+('芒', 'mang'),
+('芒', '까끄라기 망'),
+('芒', '망'),
+('芔', 'hwe'),
+('芔', 'hwey'),
+('芔', '풀 훼'),
+('芔', '훼'),
+('芘', 'bi'),
+('芘', 'pi'),
+('芘', '비'),
+('芘', '풀 이름 비 '),
+('芙', 'bu'),
+('芙', 'pu'),
+('芙', '부'),
+('芙', '부용 부'),
+('芚', 'dun'),
+('芚', 'tun'),
+('芚', 'twun'),
+('芚', '둔'),
+('芚', '채소 이름 둔'),
+('芝', 'chi'),
+('芝', 'ci'),
+('芝', 'ji'),
+('芝', '지'),
+('芝', '지초 지'),
+('芟', 'sam'),
+('芟', '벨 삼'),
+('芟', '삼'),
+('芡', ' 가시연밥 검'),
+('芡', 'geom'),
+('芡', 'kem'),
+('芡', 'kŏm'),
+('芡', '검'),
+('芡', '마름 검'),
+('芢', 'in'),
+('芢', '씨 인 '),
+('芢', '인'),
+('芣', 'bu'),
+('芣', 'medicinal plantain'),
+('芣', 'pu'),
+('芣', '부'),
+('芣', '질경이 부'),
+('芥', ' 갓 개'),
+('芥', ' 지푸라기 개'),
+('芥', ' 티끌 개'),
+('芥', 'gae'),
+('芥', 'kae'),
+('芥', 'kay'),
+('芥', '개'),
+('芥', '겨자 개'),
+('芦', ' 蔖의 俗字'),
+('芦', 'ho'),
+('芦', '芐와 同字'),
+('芦', '호'),
+('芧', 'se'),
+('芧', 'seo'),
+('芧', 'sŏ'),
+('芧', '상수리 서'),
+('芧', '서'),
+('芨', 'geup'),
+('芨', 'kup'),
+('芨', 'kŭp'),
+('芨', '급'),
+('芨', '말오줌나무 급'),
+('芩', 'geum'),
+('芩', 'kum'),
+('芩', 'kŭm'),
+('芩', '금'),
+('芩', '풀 이름 금'),
+('芪', 'gi'),
+('芪', 'ki'),
+('芪', '기'),
+('芪', '단너삼 기'),
+('芫', ' 여뀌 원'),
+('芫', 'wen'),
+('芫', 'won'),
+('芫', 'wŏn'),
+('芫', '고기 잡는 풀 원'),
+('芫', '원'),
+('芬', 'bun'),
+('芬', 'pun'),
+('芬', '분'),
+('芬', '향기로울 분'),
+('芭', 'p''a'),
+('芭', 'pa'),
+('芭', 'pha'),
+('芭', '파'),
+('芭', '파초 파'),
+('芮', ' 나라이름 예'),
+('芮', ' 물가 예'),
+('芮', ' 방패끈 예'),
+('芮', ' 성씨 예'),
+('芮', 'shield string'),
+('芮', 'waterside'),
+('芮', '예'),
+('芮', '풀 뾰족뾰족할 예'),
+('芯', 'sim'),
+('芯', '등심초 심'),
+('芯', '심'),
+('芰', 'gi'),
+('芰', 'ki'),
+('芰', 'water caltrop, (also implausibly) water chestnut'),
+('芰', '기'),
+('芰', '세발 마름 기'),
+('花', 'Hanja form of 화 (“flower”).'),
+('花', 'Hanja form of 화 (“flower”). [affix]'),
+('花', '꽃'),
+('花', '꽃 화'),
+('花', '화'),
+('芳', 'Hanja form of 방 (“beautiful”).'),
+('芳', 'Hanja form of 방 (“fragrant”).'),
+('芳', 'Hanja form of 방 (“virtuous”).'),
+('芳', '꽃다울'),
+('芳', '꽃다울 방'),
+('芳', '방'),
+('芷', '구리때 지'),
+('芷', '지'),
+('芸', ' 궁궁이 운'),
+('芸', ' 성씨 운'),
+('芸', ' 촘촘할 운'),
+('芸', 'art'),
+('芸', 'performance, acting'),
+('芸', 'rue, herb used to keep insects away'),
+('芸', 'stunt'),
+('芸', 'talent, ability, craft'),
+('芸', 'technique'),
+('芸', 'to cut grass or weeds'),
+('芸', 'trick'),
+('芸', 'un'),
+('芸', 'wun'),
+('芸', '藝의 略字'),
+('芸', '운'),
+('芸', '향풀 운'),
+('芹', 'geun'),
+('芹', 'kun'),
+('芹', 'kŭn'),
+('芹', '근'),
+('芹', '미나리 근'),
+('芻', ' 짐승먹이 추'),
+('芻', '꼴 추'),
+('芻', '추'),
+('芼', '모'),
+('芼', '풀 우거질 모'),
+('芽', 'a'),
+('芽', '싹 아'),
+('芽', '아'),
+('芾', 'bi'),
+('芾', 'pi'),
+('芾', '비'),
+('芾', '작은 모양 비'),
+('芿', '새풀싹 잉'),
+('芿', '잉'),
+('苅', ' 자를 예'),
+('苅', 'ye'),
+('苅', 'yey'),
+('苅', '벨 예'),
+('苅', '예'),
+('苑', ' 큰 바람 원'),
+('苑', 'wen'),
+('苑', 'won'),
+('苑', 'wŏn'),
+('苑', '나랏동산 원'),
+('苑', '원'),
+('苒', ' 덧없을 염'),
+('苒', 'in order'),
+('苒', 'lush'),
+('苒', 'successively'),
+('苒', 'yem'),
+('苒', 'yeom'),
+('苒', 'yŏm'),
+('苒', '염'),
+('苒', '풀 우거질 염'),
+('苓', '도꼬마리 령'),
+('苔', 't''ae'),
+('苔', 'tae'),
+('苔', 'thay'),
+('苔', '이끼 태'),
+('苔', '태'),
+('苕', 'ch''o'),
+('苕', 'cho'),
+('苕', '능소화 초'),
+('苕', '초'),
+('苗', 'Hanja form of 묘 (“Miao people”).'),
+('苗', 'Hanja form of 묘 (“sprouts”).'),
+('苗', '모'),
+('苗', '모 묘'),
+('苗', '묘'),
+('苛', 'Hanja form of 가 (“harsh”).'),
+('苛', '가'),
+('苛', '매울'),
+('苛', '매울 가'),
+('苛', '맵다'),
+('苜', 'mok'),
+('苜', '거여목 목'),
+('苜', '목'),
+('苞', ' 꾸러피 포'),
+('苞', ' 밑둥 포'),
+('苞', ' 초목이 다복히 날 포'),
+('苞', 'p''o'),
+('苞', 'pho'),
+('苞', 'po'),
+('苞', '그령풀 포'),
+('苞', '포'),
+('苟', 'Hanja form of 구 (“careless, frivolous”).'),
+('苟', 'Hanja form of 구 (“if, but, if only”).'),
+('苟', 'Hanja form of 구 (“illicit”).'),
+('苟', '구'),
+('苟', '진실로'),
+('苟', '진실로 구'),
+('苠', 'min'),
+('苠', '민'),
+('苠', '속대 민 '),
+('苡', ' 질경이 이'),
+('苡', 'i'),
+('苡', '율무 이'),
+('苡', '이'),
+('苣', ' 검은 깨 거'),
+('苣', 'geo'),
+('苣', 'ke'),
+('苣', 'kŏ'),
+('苣', '거'),
+('苣', '상추 거'),
+('若', ' 만약 약'),
+('若', ' 자네 약'),
+('若', ' 지혜(범어의 음역) 야'),
+('若', 'Hanja form of 야 (“Used in compounds”).'),
+('若', 'Hanja form of 약 (“if”).'),
+('若', 'Hanja form of 약 (“like; as if”).'),
+('若', '같다'),
+('若', '같을'),
+('若', '같을 약'),
+('若', '땅이름 야'),
+('若', '반야'),
+('若', '야'),
+('若', '약'),
+('苦', 'Hanja form of 고 (“suffering, pain”).'),
+('苦', '고'),
+('苦', '괴로울'),
+('苦', '쓸 고'),
+('苧', 'ce'),
+('苧', 'chŏ'),
+('苧', 'jeo'),
+('苧', '모시 저'),
+('苧', '저'),
+('苫', ' 거적자리 점'),
+('苫', ' 글씨 흘려 쓸 점'),
+('苫', 'cem'),
+('苫', 'chŏm'),
+('苫', 'jeom'),
+('苫', '이엉 점'),
+('苫', '점'),
+('苯', 'bun'),
+('苯', 'pun'),
+('苯', '분'),
+('苯', '풀 떨기로 날 분'),
+('英', ' 구름 뭉게뭉게 일어날 영'),
+('英', ' 아름다울 영'),
+('英', ' 영웅 영'),
+('英', 'Hanja form of 영 (“petal”).'),
+('英', 'Hanja form of 영 (“petal”). [affix]'),
+('英', 'Hanja form of 영 (“the UK, Great Britain (in compounds, in news media)”).'),
+('英', '꽃부리'),
+('英', '꽃부리 영'),
+('英', '영'),
+('苳', 'dong'),
+('苳', 'tong'),
+('苳', '겨울살이 동 '),
+('苳', '동'),
+('苴', ' 꾸러미 저'),
+('苴', ' 대지팡이 저'),
+('苴', ' 신바닥 저'),
+('苴', 'ce'),
+('苴', 'chŏ'),
+('苴', 'jeo'),
+('苴', '암삼 저'),
+('苴', '저'),
+('苸', '풀 이름'),
+('苸', '호'),
+('苹', ' 사과 평'),
+('苹', 'p''yŏng'),
+('苹', 'phyeng'),
+('苹', 'pyeong'),
+('苹', '맑은 대쑥 평'),
+('苹', '평'),
+('苺', 'strawberry'),
+('苺', '딸기'),
+('苺', '딸기 매'),
+('苺', '매'),
+('苻', 'bu'),
+('苻', 'pu'),
+('苻', '귀목풀 부'),
+('苻', '부'),
+('苽', 'go'),
+('苽', 'ko'),
+('苽', '고'),
+('苽', '줄 고'),
+('苾', 'fragrance'),
+('苾', 'p''il'),
+('苾', 'phil'),
+('苾', 'pil'),
+('苾', '필'),
+('苿', 'mi'),
+('苿', '미'),
+('茀', '불'),
+('茀', '풀 우거질 불'),
+('茁', 'bud'),
+('茁', 'chul'),
+('茁', 'cwul'),
+('茁', 'jul'),
+('茁', 'sprout'),
+('茁', '줄'),
+('茁', '풀 처음 나는 모양 줄'),
+('茂', ' 무성할 무'),
+('茂', 'Hanja form of 무 (“talented”).'),
+('茂', 'Hanja form of 무 (“thick, lush, dense”).'),
+('茂', '무'),
+('茂', '무성하다'),
+('茂', '무성할'),
+('茂', '우거질 무'),
+('范', 'beom'),
+('范', 'pem'),
+('范', 'pŏm'),
+('范', '범'),
+('范', '풀 이름 범'),
+('茄', 'eggplant'),
+('茄', '가'),
+('茄', '가지 가'),
+('茅', 'mo'),
+('茅', '띠 모'),
+('茅', '모'),
+('茈', 'ca'),
+('茈', 'cha'),
+('茈', 'ja'),
+('茈', '자'),
+('茈', '지치 자'),
+('茉', 'mal'),
+('茉', '말'),
+('茉', '말리 말'),
+('茗', 'myeng'),
+('茗', 'myeong'),
+('茗', 'myŏng'),
+('茗', '명'),
+('茗', '차 싹 명'),
+('茛', ' 미나리아재비 간 '),
+('茛', 'gan'),
+('茛', 'kan'),
+('茛', '간'),
+('茛', '독초이름 간'),
+('茝', '구리때 채 '),
+('茝', '채'),
+('茣', 'o'),
+('茣', '오'),
+('茣', '차조기 오'),
+('茨', 'ca'),
+('茨', 'cha'),
+('茨', 'ja'),
+('茨', '가시나무 자'),
+('茨', '자'),
+('茪', '광'),
+('茪', '초결명 광 '),
+('茫', 'Hanja form of 망 (“vast, boundless, widespread”).'),
+('茫', '망'),
+('茫', '아득하다'),
+('茫', '아득할'),
+('茫', '아득할 망'),
+('茬', 'si'),
+('茬', '시'),
+('茯', 'bok'),
+('茯', 'pok'),
+('茯', '복'),
+('茯', '복령 복'),
+('茱', 'su'),
+('茱', 'swu'),
+('茱', '수'),
+('茱', '수유 수'),
+('茲', '무성할 자'),
+('茲', '자'),
+('茳', 'gang'),
+('茳', 'kang'),
+('茳', '강'),
+('茳', '강리풀 강 '),
+('茴', 'hoe'),
+('茴', 'hoy'),
+('茴', '회'),
+('茴', '회향풀 회'),
+('茵', 'mat, cushion'),
+('茵', '인'),
+('茵', '자리 인'),
+('茶', 'Hanja form of 다 (“brown”).'),
+('茶', 'Hanja form of 다 (“tea”).'),
+('茶', 'Hanja form of 차 (“tea”).'),
+('茶', '다'),
+('茶', '차'),
+('茶', '차 차'),
+('茶', '차풀 다'),
+('茸', ' 못생길 용'),
+('茸', 'yong'),
+('茸', '용'),
+('茸', '풀 뾰죽뾰죽 날 용'),
+('茹', ' 받을 여'),
+('茹', ' 헤아릴 여'),
+('茹', 'ye'),
+('茹', 'yeo'),
+('茹', 'yŏ'),
+('茹', '띠 뿌리 여'),
+('茹', '여'),
+('茼', 'dong'),
+('茼', 'tong'),
+('茼', '동'),
+('茼', '쏙갓 동 '),
+('荀', ' 성씨 순'),
+('荀', 'sun'),
+('荀', 'swun'),
+('荀', '순'),
+('荀', '풀 이름 순'),
+('荃', ' 전풀 전'),
+('荃', 'cen'),
+('荃', 'chŏn'),
+('荃', 'jeon'),
+('荃', '전'),
+('荃', '향풀 전'),
+('荅', 'dap'),
+('荅', 'tap'),
+('荅', '답'),
+('荆', ' 가시 형'),
+('荆', 'hyeng'),
+('荆', 'hyeong'),
+('荆', 'hyŏng'),
+('荆', '광대싸리 형'),
+('荆', '형'),
+('荇', ' 조아기 행'),
+('荇', 'Nymphoides peltata'),
+('荇', 'water chestnut'),
+('荇', '마름풀 행'),
+('荇', '행'),
+('草', 'Hanja form of 초 (“grass”).'),
+('草', '초'),
+('草', '풀'),
+('草', '풀 초'),
+('荊', ' 곤장 형'),
+('荊', 'brambles'),
+('荊', 'cane'),
+('荊', 'hyeng'),
+('荊', 'hyeong'),
+('荊', 'hyŏng'),
+('荊', 'my wife'),
+('荊', 'thorns'),
+('荊', '모형나무 형'),
+('荊', '형'),
+('荏', 'im'),
+('荏', '들깨 임'),
+('荏', '임'),
+('荐', '거듭할 천'),
+('荑', ' 베일 이'),
+('荑', '띠싹 제'),
+('荑', '흰 비름 이'),
+('荒', 'empty, blank'),
+('荒', 'rough; sparse; wild'),
+('荒', '강'),
+('荒', '거칠'),
+('荒', '거칠 황'),
+('荒', '거칠다'),
+('荒', '공허하다'),
+('荒', '공허할'),
+('荒', '황'),
+('荗', 'sul'),
+('荗', 'swul'),
+('荗', '술'),
+('荘', '莊의 俗字'),
+('荳', 'bean-shaped'),
+('荳', 'beans, peas'),
+('荳', 'du'),
+('荳', 'tu'),
+('荳', 'twu'),
+('荳', '두'),
+('荳', '콩 두'),
+('荷', 'Hanja form of 하 (“load; burden; cargo; freight”).'),
+('荷', 'Hanja form of 하 (“lotus; water lily”).'),
+('荷', 'Hanja form of 하 (“to bear; to undertake; to take charge; to owe”).'),
+('荷', '메다'),
+('荷', '멜'),
+('荷', '연 하'),
+('荷', '연꽃'),
+('荷', '하'),
+('荻', '갈대 적'),
+('荻', '적'),
+('荽', 'su'),
+('荽', 'swu'),
+('荽', '수'),
+('荿', 'seong'),
+('荿', 'sŏng'),
+('荿', '성'),
+('莅', '다다를 리'),
+('莉', '말리 리'),
+('莊', 'cang'),
+('莊', 'chang'),
+('莊', 'jang'),
+('莊', '엄할 장'),
+('莊', '장'),
+('莎', 'sa'),
+('莎', '사'),
+('莎', '향부자 사'),
+('莒', ' 고을이름 거'),
+('莒', ' 나라이름 거'),
+('莒', 'geo'),
+('莒', 'ke'),
+('莒', 'kŏ'),
+('莒', '거'),
+('莒', '모시풀 거'),
+('莓', 'mae'),
+('莓', 'may'),
+('莓', '나무딸기 매'),
+('莓', '매'),
+('莖', 'gyeong'),
+('莖', 'kyeng'),
+('莖', 'kyŏng'),
+('莖', '경'),
+('莖', '줄기 경'),
+('莘', ' 나라이름 신'),
+('莘', ' 많은 모양 신'),
+('莘', 'a marsh plant whose root is used for medicine'),
+('莘', 'long'),
+('莘', 'numerous'),
+('莘', 'sin'),
+('莘', '신'),
+('莘', '약 이름 신'),
+('莚', ' 풀 이름 연'),
+('莚', 'yen'),
+('莚', 'yeon'),
+('莚', 'yŏn'),
+('莚', '만연할 연'),
+('莚', '연'),
+('莛', ' 들보 정'),
+('莛', '정'),
+('莛', '풀 줄거리 정'),
+('莝', 'chwa'),
+('莝', 'cwa'),
+('莝', 'jwa'),
+('莝', '여물 좌'),
+('莝', '좌'),
+('莞', '골풀 관'),
+('莞', '빙그레 웃는 모양 완'),
+('莟', 'ham'),
+('莟', '꽃봉오리 함'),
+('莟', '함'),
+('莠', ' 추할 유'),
+('莠', 'yu'),
+('莠', '가라지 유'),
+('莠', '유'),
+('莢', ' 명협 협'),
+('莢', 'Lespedeza cuneata'),
+('莢', 'pod (of soybean)'),
+('莢', '꼬투리'),
+('莢', '콩 꼬투리 협'),
+('莢', '협'),
+('莤', 'ch''ŏn'),
+('莤', 'chen'),
+('莤', 'cheon'),
+('莤', '천'),
+('莧', 'amaranth, amaranthus'),
+('莧', 'hyen'),
+('莧', 'hyeon'),
+('莧', '현'),
+('莨', '수크령 랑'),
+('莩', 'membrane of a reed'),
+('莩', '굶어죽을 표'),
+('莩', '부'),
+('莩', '표'),
+('莩', '풀 이름 부'),
+('莪', 'a'),
+('莪', '아'),
+('莪', '지칭개 아'),
+('莫', 'Hanja form of 막 (“do not, is not, cannot”).'),
+('莫', '막'),
+('莫', '모'),
+('莫', '없다'),
+('莫', '없을'),
+('莫', '없을 막'),
+('莫', '저물'),
+('莫', '저물 모'),
+('莫', '저물다'),
+('莱', '명아주 래'),
+('莻', 'late'),
+('莻', 'neut'),
+('莻', 'nuc'),
+('莻', 'nŭt'),
+('莻', '늦'),
+('莻', '늦을 늦'),
+('莽', '망'),
+('莽', '우거질 망'),
+('莾', 'mang'),
+('莾', '마디 짧은 대 망 '),
+('莾', '망'),
+('莿', 'ca'),
+('莿', 'cha'),
+('莿', 'ja'),
+('莿', '자'),
+('莿', '풀가시 자'),
+('菁', 'ch''ŏng'),
+('菁', 'cheng'),
+('菁', 'cheong'),
+('菁', '부추꽃 청'),
+('菁', '청'),
+('菂', 'cek'),
+('菂', 'chŏk'),
+('菂', 'jeok'),
+('菂', '연밥 적 '),
+('菂', '적'),
+('菅', 'gwan'),
+('菅', 'kwan'),
+('菅', '골풀 관'),
+('菅', '관'),
+('菉', '조개풀 록'),
+('菊', 'Hanja form of 국 (“chrysanthemum”).'),
+('菊', '국'),
+('菊', '국화'),
+('菊', '국화 국'),
+('菋', '미'),
+('菋', '오미자 미 '),
+('菌', 'Hanja form of 균 (“germ, microbe”).'),
+('菌', 'Hanja form of 균 (“mushroom”).'),
+('菌', '균'),
+('菌', '버섯'),
+('菌', '버섯 균'),
+('菑', 'ch''i'),
+('菑', 'chi'),
+('菑', 'land which has been under cultivation for one year'),
+('菑', 'to weed grass'),
+('菑', '따비밭 치'),
+('菑', '치'),
+('菓', '과'),
+('菓', '과일 과'),
+('菔', 'radish'),
+('菔', '무'),
+('菔', '무 복'),
+('菔', '복'),
+('菖', 'ch''ang'),
+('菖', 'chang'),
+('菖', '창'),
+('菖', '창포 창'),
+('菘', 'sung'),
+('菘', 'swung'),
+('菘', '배추 숭'),
+('菘', '숭'),
+('菜', 'An edible plant or leaf of plant. greens; vegetables'),
+('菜', '나물 채'),
+('菜', '채'),
+('菟', 'do'),
+('菟', 'to'),
+('菟', '고을 이름 도'),
+('菟', '도'),
+('菠', 'p''a'),
+('菠', 'pa'),
+('菠', 'pha'),
+('菠', '시금치 파'),
+('菠', '파'),
+('菡', 'ham'),
+('菡', '연봉오리 함'),
+('菡', '함'),
+('菩', 'bo'),
+('菩', 'po'),
+('菩', '보'),
+('菩', '보살 보'),
+('菫', 'aconite'),
+('菫', 'celery'),
+('菫', 'geun'),
+('菫', 'kun'),
+('菫', 'kŭn'),
+('菫', '근'),
+('菫', '오랑캐 꽃 근'),
+('華', 'bright; colorful'),
+('華', '꽃 화'),
+('華', '화'),
+('菰', 'go'),
+('菰', 'ko'),
+('菰', '고'),
+('菰', '향초 고'),
+('菱', '蔆과 同字'),
+('菲', 'bi'),
+('菲', 'pi'),
+('菲', '비'),
+('菲', '엷을 비'),
+('菴', '암'),
+('菴', '암자 암'),
+('菶', '봉'),
+('菶', '풀 무성할 봉'),
+('菹', ' 푸서리 저'),
+('菹', '김치'),
+('菹', '김치 저'),
+('菹', '저'),
+('菽', 'beans, peas (literary)'),
+('菽', 'suk'),
+('菽', 'swuk'),
+('菽', '숙'),
+('萃', ' 괘 이름 췌'),
+('萃', '모을 췌'),
+('萄', 'do'),
+('萄', 'to'),
+('萄', '도'),
+('萄', '포도나무 도'),
+('萅', 'ch''un'),
+('萅', 'chun'),
+('萅', 'chwun'),
+('萅', '춘'),
+('萆', 'bi'),
+('萆', 'pi'),
+('萆', 'the castor-oil plant also used for other plants'),
+('萆', '비'),
+('萆', '비해 비'),
+('萇', 'cang'),
+('萇', 'chang'),
+('萇', 'jang'),
+('萇', '나무 이름 장'),
+('萇', '장'),
+('萊', '내'),
+('萊', '래'),
+('萊', '명아주'),
+('萊', '명아주 래'),
+('萋', 'ch''ŏ'),
+('萋', 'che'),
+('萋', 'cheo'),
+('萋', '처'),
+('萋', '풀 성하게 우거진 모양 처'),
+('萌', 'maeng'),
+('萌', 'mayng'),
+('萌', '맹'),
+('萌', '싹 맹'),
+('萍', ' 개구리밥 평'),
+('萍', ' 머구리밥 평'),
+('萍', 'Hanja form of 평 (“duckweed”).'),
+('萍', '개구리밥'),
+('萍', '마름 평'),
+('萍', '평'),
+('萎', ' 쇠약해질 위'),
+('萎', ' 풀 이름 위'),
+('萎', 'to wither; to wilt'),
+('萎', 'wi'),
+('萎', '마를 위'),
+('萎', '위'),
+('萠', 'Alternative form of 萌 (“sprout; bud”)'),
+('萠', 'maeng'),
+('萠', 'mayng'),
+('萠', '맹'),
+('萩', ' 가래나무 추'),
+('萩', '맑은 대쑥 추'),
+('萩', '추'),
+('萬', 'Hanja form of 만 (“myriad”).'),
+('萬', 'Hanja form of 만 (“ten thousand”).'),
+('萬', '만'),
+('萬', '일만 만'),
+('萬', '일만(一萬)'),
+('萱', '원추리 훤'),
+('萱', '훤'),
+('萵', ' 부루 와'),
+('萵', 'wa'),
+('萵', '상추 와'),
+('萵', '와'),
+('萸', 'yu'),
+('萸', '수유 유'),
+('萸', '유'),
+('萹', '편'),
+('萼', 'ak'),
+('萼', '꽃받침 악'),
+('萼', '악'),
+('落', 'Hanja form of 락/낙 (“fall”).'),
+('落', '낙'),
+('落', '떨어지다'),
+('落', '떨어질'),
+('落', '떨어질 락'),
+('落', '락'),
+('葆', 'bo'),
+('葆', 'po'),
+('葆', '보'),
+('葆', '풀 더부룩할 보'),
+('葉', ' 성씨 엽'),
+('葉', ' 세대 엽'),
+('葉', 'Hanja form of 섭 (“A surname.”).'),
+('葉', 'Hanja form of 엽 (“leaf”).'),
+('葉', 'Hanja form of 엽 (“leaf”). [affix]'),
+('葉', '고을이름 섭'),
+('葉', '땅 이름'),
+('葉', '섭'),
+('葉', '엽'),
+('葉', '잎'),
+('葉', '잎 엽'),
+('葊', 'am'),
+('葊', '암'),
+('葊', '풀이름 암'),
+('葑', '무 풍'),
+('葑', '풍'),
+('著', ' 글 지을 저'),
+('著', ' 널리 알려질 저'),
+('著', ' 옹저 저'),
+('著', 'written by... (written after the author''s name)'),
+('著', '나타날 저'),
+('著', '분명할 착'),
+('著', '저'),
+('葚', 'mulberry fruit (桑實)'),
+('葚', '뽕나무 열매 심'),
+('葚', '심'),
+('葚', '오디'),
+('葛', 'Hanja form of 갈 (“arrowroot, kudzu”).'),
+('葛', '갈'),
+('葛', '칡'),
+('葛', '칡 갈'),
+('葡', ' 나라이름 포'),
+('葡', ' 들머리 포'),
+('葡', '포'),
+('葡', '포도 포'),
+('董', 'dong'),
+('董', 'tong'),
+('董', '동'),
+('董', '바로잡을 동'),
+('葦', ' 작은 배 위'),
+('葦', 'reed'),
+('葦', 'wi'),
+('葦', '갈대 위'),
+('葦', '위'),
+('葩', '꽃봉오리 파'),
+('葩', '파'),
+('葪', ' 삽주 계 '),
+('葪', 'gye'),
+('葪', 'kye'),
+('葪', 'kyey'),
+('葪', '계'),
+('葪', '베일 계'),
+('葫', ' 조롱박 호'),
+('葫', 'ho'),
+('葫', '마늘 호'),
+('葫', '호'),
+('葬', 'Hanja form of 장 (“burial; burial place; burial customs”).'),
+('葬', '장'),
+('葬', '장사 지낼 장'),
+('葭', '가'),
+('葭', '갈대 가'),
+('葯', ' 동일 악'),
+('葯', '구리때 잎 악'),
+('葯', '꽃밥 약'),
+('葱', 'ch''ong'),
+('葱', 'chong'),
+('葱', '총'),
+('葱', '풀 더북할 총'),
+('葳', ' 위유풀 위'),
+('葳', 'wi'),
+('葳', '위'),
+('葳', '초목 성할 위'),
+('葵', 'gyu'),
+('葵', 'kyu'),
+('葵', '규'),
+('葵', '해바라기 규'),
+('葷', 'hun'),
+('葷', 'hwun'),
+('葷', 'meat diet'),
+('葷', 'strong smelling'),
+('葷', '매운 채소 훈'),
+('葷', '훈'),
+('葺', '기울 즙'),
+('葺', '즙'),
+('葻', 'looks of grass swaying in the wind'),
+('葻', '남'),
+('葻', '람'),
+('蒂', '작은 가시 체'),
+('蒂', '체'),
+('蒋', '蔣의 略字'),
+('蒍', 'wi'),
+('蒍', '蔿와 同字 '),
+('蒍', '위'),
+('蒐', ' 모을 수'),
+('蒐', ' 숨을 수'),
+('蒐', ' 찾을 수'),
+('蒐', 'su'),
+('蒐', 'swu'),
+('蒐', '꼭두서니 수'),
+('蒐', '수'),
+('蒑', '은'),
+('蒔', ' 모종낼 시'),
+('蒔', 'si'),
+('蒔', '소회향 시'),
+('蒔', '시'),
+('蒙', 'Hanja form of 몽 (“Mongolia”).'),
+('蒙', 'Hanja form of 몽 (“cover, ignorant”).'),
+('蒙', 'Hanja form of 몽 (“suffer”).'),
+('蒙', '몽'),
+('蒙', '입다'),
+('蒙', '입을'),
+('蒙', '입을 몽'),
+('蒜', 'san'),
+('蒜', '달래 산'),
+('蒜', '산'),
+('蒞', '莅의 俗字'),
+('蒟', 'gu'),
+('蒟', 'ku'),
+('蒟', 'kwu'),
+('蒟', '구'),
+('蒟', '구장 구'),
+('蒡', 'bang'),
+('蒡', 'pang'),
+('蒡', '방'),
+('蒡', '인동 덩굴 방'),
+('蒦', 'hwak'),
+('蒦', '확'),
+('蒨', 'ch''ŏn'),
+('蒨', 'chen'),
+('蒨', 'cheon'),
+('蒨', '대가 우거질 천'),
+('蒨', '천'),
+('蒭', 'ch''u'),
+('蒭', 'chu'),
+('蒭', 'chwu'),
+('蒭', '芻와 同字'),
+('蒭', '추'),
+('蒯', 'goe'),
+('蒯', 'koe'),
+('蒯', 'koy'),
+('蒯', '괴'),
+('蒯', '황모 괴'),
+('蒲', ' 개버들 포'),
+('蒲', ' 창포 포'),
+('蒲', 'p''o'),
+('蒲', 'pho'),
+('蒲', 'po'),
+('蒲', '부들풀 포'),
+('蒲', '포'),
+('蒴', 'sak'),
+('蒴', '말오줌대 삭'),
+('蒴', '삭'),
+('蒸', '증'),
+('蒸', '찌다'),
+('蒸', '찔'),
+('蒸', '찔 증'),
+('蒹', 'gyeom'),
+('蒹', 'kyem'),
+('蒹', 'kyŏm'),
+('蒹', '갈대 겸'),
+('蒹', '겸'),
+('蒺', 'chil'),
+('蒺', 'cil'),
+('蒺', 'jil'),
+('蒺', '납가새 질'),
+('蒺', '질'),
+('蒻', 'yak'),
+('蒻', '구약나물 약'),
+('蒻', '약'),
+('蒼', 'blue'),
+('蒼', 'green'),
+('蒼', 'to grow thick'),
+('蒼', '창'),
+('蒼', '푸르다'),
+('蒼', '푸를'),
+('蒼', '푸를 창'),
+('蒿', ' 지칠 호'),
+('蒿', ' 향기날 호'),
+('蒿', 'mugwort'),
+('蒿', '쑥'),
+('蒿', '쑥 호'),
+('蒿', '호'),
+('蓀', 'so'),
+('蓀', '소'),
+('蓁', 'chin'),
+('蓁', 'cin'),
+('蓁', 'jin'),
+('蓁', '우거질 진'),
+('蓁', '진'),
+('蓂', 'myeng'),
+('蓂', 'myeong'),
+('蓂', 'myŏng'),
+('蓂', '명'),
+('蓂', '명협 명'),
+('蓄', ' 감출 축'),
+('蓄', ' 모을 축'),
+('蓄', 'ch''uk'),
+('蓄', 'chuk'),
+('蓄', 'chwuk'),
+('蓄', '쌓을 축'),
+('蓄', '축'),
+('蓆', 'sek'),
+('蓆', 'seok'),
+('蓆', 'sŏk'),
+('蓆', '석'),
+('蓆', '자리 석'),
+('蓉', ' 약 이름 용'),
+('蓉', 'yong'),
+('蓉', '연꽃 용'),
+('蓉', '용'),
+('蓊', ' 우거질 옹'),
+('蓊', '옹'),
+('蓊', '옹풀 옹'),
+('蓊', '장다리'),
+('蓋', ' 가리울 개'),
+('蓋', ' 덮개 개'),
+('蓋', ' 우산 개'),
+('蓋', ' 이엉 개'),
+('蓋', 'Hanja form of 개 (“cover”).'),
+('蓋', '개'),
+('蓋', '덮다'),
+('蓋', '덮을'),
+('蓋', '뚜껑 개'),
+('蓋', '이엉 덮을 합'),
+('蓍', ' 시초 시'),
+('蓍', '뺑대쑥 시'),
+('蓍', '시'),
+('蓐', ' 가을 맡은 귀신 욕'),
+('蓐', 'yok'),
+('蓐', '새싹 욕'),
+('蓐', '욕'),
+('蓑', 'sa'),
+('蓑', '도롱이 사'),
+('蓑', '사'),
+('蓓', 'bae'),
+('蓓', 'pae'),
+('蓓', 'pay'),
+('蓓', '꽃봉오리 배'),
+('蓓', '배'),
+('蓖', 'bi'),
+('蓖', 'pi'),
+('蓖', '비'),
+('蓖', '아주까리 비'),
+('蓚', ' 수산(acid) 수'),
+('蓚', '기쁠 수'),
+('蓚', '기쁠 조'),
+('蓬', 'moxa, mugwort, wormwood'),
+('蓬', '봉'),
+('蓬', '쑥'),
+('蓬', '쑥 봉'),
+('蓭', 'am'),
+('蓭', '암'),
+('蓭', '암자 암 '),
+('蓮', 'Hanja form of 련/연 (“lotus”).'),
+('蓮', '련'),
+('蓮', '연'),
+('蓮', '연꽃'),
+('蓮', '연밥 련'),
+('蓯', 'ch''ong'),
+('蓯', 'chong'),
+('蓯', '총'),
+('蓯', '풀 더북할 총'),
+('蓱', ' 개구리밥 평 '),
+('蓱', ' 머구리밥 평'),
+('蓱', 'p''yŏng'),
+('蓱', 'phyeng'),
+('蓱', 'pyeong'),
+('蓱', '마름 평'),
+('蓱', '평'),
+('蓴', 'sun'),
+('蓴', 'swun'),
+('蓴', '순'),
+('蓴', '순나물 순'),
+('蓺', 'conclude'),
+('蓺', 'fulfill'),
+('蓺', 'plant'),
+('蓺', 'target'),
+('蓺', 'ye'),
+('蓺', 'yey'),
+('蓺', '예'),
+('蓼', '료'),
+('蓼', '여뀌 료'),
+('蓼', '요'),
+('蓽', ' 약이름 필'),
+('蓽', 'p''il'),
+('蓽', 'phil'),
+('蓽', 'pil'),
+('蓽', 'piper longtum'),
+('蓽', 'species of bean'),
+('蓽', '필'),
+('蓽', '휘추리 필'),
+('蓿', 'suk'),
+('蓿', 'swuk'),
+('蓿', '거여목 숙'),
+('蓿', '숙'),
+('蔀', '부'),
+('蔀', '빈지문 부'),
+('蔆', '마름 릉'),
+('蔑', 'Hanja form of 멸 (“to belittle; to despise”).'),
+('蔑', '멸'),
+('蔑', '업신여기다'),
+('蔑', '업신여길'),
+('蔑', '업신여길 멸'),
+('蔓', 'man'),
+('蔓', '덩굴 만'),
+('蔓', '만'),
+('蔔', 'bok'),
+('蔔', 'pok'),
+('蔔', '무우 복'),
+('蔔', '복'),
+('蔕', 'ch''e'),
+('蔕', 'che'),
+('蔕', 'chey'),
+('蔕', '작은 가시 체'),
+('蔕', '체'),
+('蔗', 'ca'),
+('蔗', 'cha'),
+('蔗', 'ja'),
+('蔗', 'sugar cane'),
+('蔗', '사탕수수 자'),
+('蔗', '자'),
+('蔘', 'sam'),
+('蔘', '삼'),
+('蔘', '인삼 삼'),
+('蔚', ' 잔무늬 위'),
+('蔚', ' 초목 우거진 모양 위'),
+('蔚', '고을이름 울'),
+('蔚', '제비쑥 위'),
+('蔞', '쑥 루'),
+('蔟', '주'),
+('蔟', '태주 주'),
+('蔡', '거북 채'),
+('蔡', '내칠 살'),
+('蔡', '살'),
+('蔡', '채'),
+('蔣', 'Manchurian wild rice (Zizania latifolia, or Hydropyrum latifolium)'),
+('蔣', 'cang'),
+('蔣', 'chang'),
+('蔣', 'jang'),
+('蔣', '장'),
+('蔣', '줄 장'),
+('蔥', ' 파 뿌리 총'),
+('蔥', ' 푸를 총'),
+('蔥', 'ch''ong'),
+('蔥', 'chong'),
+('蔥', '총'),
+('蔥', '파 총'),
+('蔦', 'cho'),
+('蔦', 'co'),
+('蔦', 'jo'),
+('蔦', '담쟁이 조'),
+('蔦', '조'),
+('蔪', ' 보리 팰 점 '),
+('蔪', 'cem'),
+('蔪', 'chŏm'),
+('蔪', 'jeom'),
+('蔪', '점'),
+('蔪', '풀 벨 점'),
+('蔬', 'so'),
+('蔬', '나물 소'),
+('蔬', '소'),
+('蔭', ' 가릴 음'),
+('蔭', ' 그늘 음'),
+('蔭', 'eum'),
+('蔭', 'um'),
+('蔭', 'ŭm'),
+('蔭', '덮을 음'),
+('蔭', '음'),
+('蔯', 'chin'),
+('蔯', 'cin'),
+('蔯', 'jin'),
+('蔯', '더워지기 진'),
+('蔯', '진'),
+('蔲', '구'),
+('蔽', ' 다할 폐'),
+('蔽', ' 정할 폐'),
+('蔽', '가리울 폐'),
+('蔿', ' 고을이름 위'),
+('蔿', ' 성씨 위'),
+('蔿', 'wi'),
+('蔿', '위'),
+('蔿', '풀 위'),
+('蕁', 'dam'),
+('蕁', 'tam'),
+('蕁', '담'),
+('蕁', '말 담'),
+('蕂', 'sesame'),
+('蕂', '승'),
+('蕂', '참깨'),
+('蕃', 'beon'),
+('蕃', 'pen'),
+('蕃', 'pŏn'),
+('蕃', '번'),
+('蕃', '우거질 번'),
+('蕆', 'ch''ŏn'),
+('蕆', 'chen'),
+('蕆', 'cheon'),
+('蕆', '경계할 천'),
+('蕆', '천'),
+('蕉', 'Hanja form of 초 (“banana”).'),
+('蕉', '초'),
+('蕉', '파초'),
+('蕉', '파초 초'),
+('蕊', ' 꽃 예'),
+('蕊', '꽃술'),
+('蕊', '꽃술 예'),
+('蕊', '모이다'),
+('蕊', '모일'),
+('蕊', '예'),
+('蕊', '전'),
+('蕋', '蕊의 俗字'),
+('蕋', '꽃술'),
+('蕋', '모이다'),
+('蕋', '모일'),
+('蕋', '예'),
+('蕋', '전'),
+('蕎', 'gyo'),
+('蕎', 'kyo'),
+('蕎', '교'),
+('蕎', '메밀 교'),
+('蕓', ' 평지 운'),
+('蕓', '운'),
+('蕓', '운풀 운'),
+('蕓', '평지'),
+('蕕', ' 유풀 유'),
+('蕕', 'yu'),
+('蕕', '냄새나는 풀 유'),
+('蕕', '유'),
+('蕖', 'geo'),
+('蕖', 'ke'),
+('蕖', 'kŏ'),
+('蕖', '거'),
+('蕖', '연꽃 거 '),
+('蕘', ' 거칠 요'),
+('蕘', 'yo'),
+('蕘', '나무할 요'),
+('蕘', '요'),
+('蕙', 'hye'),
+('蕙', 'hyey'),
+('蕙', '혜'),
+('蕙', '혜초 혜'),
+('蕞', 'ch''e'),
+('蕞', 'che'),
+('蕞', 'chey'),
+('蕞', '작은 모양 체'),
+('蕞', '체'),
+('蕡', 'bun'),
+('蕡', 'pun'),
+('蕡', '들깨 분'),
+('蕡', '분'),
+('蕣', 'sun'),
+('蕣', 'swun'),
+('蕣', '무궁화 순'),
+('蕣', '순'),
+('蕤', 'yu'),
+('蕤', '더북할 유'),
+('蕤', '유'),
+('蕨', 'gwol'),
+('蕨', 'kwel'),
+('蕨', 'kwŏl'),
+('蕨', '고사리 궐'),
+('蕨', '궐'),
+('蕩', ' 방탕할 탕'),
+('蕩', ' 소탕할 탕'),
+('蕩', ' 없어질 탕'),
+('蕩', 'Hanja form of 탕 (“wander”).'),
+('蕩', '넓고 클 탕'),
+('蕩', '방탕하다'),
+('蕩', '방탕할'),
+('蕩', '탕'),
+('蕪', ' 거친풀 무'),
+('蕪', 'mu'),
+('蕪', '거칠어질 무'),
+('蕪', '무'),
+('蕫', 'dong'),
+('蕫', 'tong'),
+('蕫', '동'),
+('蕫', '황모 동 '),
+('蕭', ' 말 우는 소리 소'),
+('蕭', ' 바람소리 소'),
+('蕭', ' 쓸쓸할 소'),
+('蕭', 'so'),
+('蕭', '소'),
+('蕭', '쑥 소'),
+('蕰', 'on'),
+('蕰', '薀의 俗字'),
+('蕰', '온'),
+('蕺', 'chŭp'),
+('蕺', 'cup'),
+('蕺', 'jeup'),
+('蕺', '삼백초 즙 '),
+('蕺', '즙'),
+('蕾', '꽃봉오리 뢰'),
+('薀', ' 쌓일 온'),
+('薀', 'on'),
+('薀', '마름 온'),
+('薀', '온'),
+('薄', 'Hanja form of 박 (“poor, stingy”).'),
+('薄', 'Hanja form of 박 (“thin, slight, weak”).'),
+('薄', '박'),
+('薄', '숲 박'),
+('薄', '엷다'),
+('薄', '엷을'),
+('薆', 'ae'),
+('薆', 'ay'),
+('薆', '숨겨질 애'),
+('薆', '애'),
+('薇', 'Hanja form of 미 (“Osmunda japonica”).'),
+('薇', 'Hanja form of 미 (“rose”).'),
+('薇', '고비'),
+('薇', '고삐 미'),
+('薇', '미'),
+('薇', '장미'),
+('薉', 'ye'),
+('薉', 'yey'),
+('薉', '더러울 예'),
+('薉', '예'),
+('薊', 'gye'),
+('薊', 'kye'),
+('薊', 'kyey'),
+('薊', '계'),
+('薊', '삽주 계'),
+('薌', ' 기장 향'),
+('薌', ' 향기 향'),
+('薌', 'hyang'),
+('薌', '곡기 향'),
+('薌', '향'),
+('薏', ' 율무 의'),
+('薏', 'the heart of a lotus seed'),
+('薏', 'ui'),
+('薏', 'uy'),
+('薏', 'ŭi'),
+('薏', '연밥 의'),
+('薏', '의'),
+('薑', 'gang'),
+('薑', 'kang'),
+('薑', '강'),
+('薑', '생강 강'),
+('薔', 'Hanja form of 색 (“hydropiper”).'),
+('薔', 'Hanja form of 장 (“rose”).'),
+('薔', '물여뀌'),
+('薔', '물여뀌 장'),
+('薔', '색'),
+('薔', '아낄 색'),
+('薔', '장'),
+('薔', '장미'),
+('薗', 'wen'),
+('薗', 'won'),
+('薗', 'wŏn'),
+('薗', '園과 同字'),
+('薗', '원'),
+('薙', '치'),
+('薙', '풀 깎을 치'),
+('薛', 'sel'),
+('薛', 'seol'),
+('薛', 'sŏl'),
+('薛', '맑은대쑥 설'),
+('薛', '설'),
+('薜', ' 돌삼 폐'),
+('薜', 'angelica'),
+('薜', '벽'),
+('薜', '승검초 벽'),
+('薜', '승검초 폐'),
+('薝', 'dam'),
+('薝', 'tam'),
+('薝', '담'),
+('薝', '치자나무 담 '),
+('薤', ' 부추 해'),
+('薤', 'hae'),
+('薤', 'hay'),
+('薤', '염교 해'),
+('薤', '해'),
+('薥', ' 자귀밥 촉 '),
+('薥', 'ch''ok'),
+('薥', 'chok'),
+('薥', 'hollyhock (접시꽃)'),
+('薥', '촉'),
+('薥', '촉규화 촉'),
+('薦', 'ch''ŏn'),
+('薦', 'chen'),
+('薦', 'cheon'),
+('薦', '천'),
+('薦', '천거할 천'),
+('薨', 'Hanja form of 횡 (“(onomatopoeia) swarming; flocking; noisy”).'),
+('薨', 'Hanja form of 훙 (“(of feudal lords or high officials) to pass away; to die”).'),
+('薨', '많다'),
+('薨', '많을'),
+('薨', '많을 횡'),
+('薨', '죽다'),
+('薨', '죽을'),
+('薨', '죽을 훙'),
+('薨', '횡'),
+('薨', '훙'),
+('薩', 'sal'),
+('薩', '보살 살'),
+('薩', '살'),
+('薪', ' 땔나무 신'),
+('薪', ' 성씨 신'),
+('薪', ' 월급 신'),
+('薪', 'sin'),
+('薪', '섶 신'),
+('薪', '신'),
+('薫', 'hun'),
+('薫', 'hwun'),
+('薫', '향내 훈'),
+('薫', '훈'),
+('薬', '藥의 略字'),
+('薯', 'se'),
+('薯', 'seo'),
+('薯', 'sŏ'),
+('薯', '서'),
+('薯', '참마 서'),
+('薰', 'hun'),
+('薰', 'hwun'),
+('薰', '향불 훈'),
+('薰', '훈'),
+('薺', 'cey'),
+('薺', 'che'),
+('薺', 'je'),
+('薺', '냉이 제'),
+('薺', '제'),
+('藁', 'straw, hay'),
+('藁', '고'),
+('藁', '마른 나무 고'),
+('藇', '마'),
+('藇', '서'),
+('藇', '아름다울'),
+('藇', '아름답다'),
+('藇', '여'),
+('藉', ' 임금이 가는 밭 적'),
+('藉', ' 확자할 적'),
+('藉', '깔개 자'),
+('藉', '어수선할 적'),
+('藍', '감'),
+('藍', '람'),
+('藍', '볼'),
+('藍', '쪽'),
+('藍', '쪽 람'),
+('藎', ' 나아갈 신'),
+('藎', ' 남을 신'),
+('藎', 'sin'),
+('藎', '갈골 신'),
+('藎', '신'),
+('藏', '감출 장'),
+('藏', '장'),
+('藐', 'myo'),
+('藐', '묘'),
+('藐', '작을 묘'),
+('藕', 'u'),
+('藕', 'wu'),
+('藕', '연뿌리 우'),
+('藕', '우'),
+('藜', '나라 이름 려'),
+('藜', '려'),
+('藜', '명아주'),
+('藜', '여'),
+('藝', ' 가늠할 예'),
+('藝', ' 극진할 예'),
+('藝', ' 글 예'),
+('藝', ' 심을 예'),
+('藝', 'Hanja form of 예 (“art, craft, technique, performance”).'),
+('藝', '예'),
+('藝', '재주'),
+('藝', '재주 예'),
+('藤', 'Hanja form of 등 (“wisteria”).'),
+('藤', '등'),
+('藤', '등나무'),
+('藤', '등나무 등'),
+('藥', 'Hanja form of 약 (“medicine; drug”).'),
+('藥', '약'),
+('藥', '약 약'),
+('藩', 'beon'),
+('藩', 'defence'),
+('藩', 'fence, hedge'),
+('藩', 'margin, boundary, border'),
+('藩', 'marquisate'),
+('藩', 'pen'),
+('藩', 'pŏn'),
+('藩', '덮을 번'),
+('藩', '번'),
+('藪', ' 덤불 수'),
+('藪', ' 똬리 수'),
+('藪', 'su'),
+('藪', 'swu'),
+('藪', '수'),
+('藪', '큰 늪 수'),
+('藴', 'on'),
+('藴', '蘊의 俗字'),
+('藴', '온'),
+('藷', ' 감자 저'),
+('藷', 'ce'),
+('藷', 'chŏ'),
+('藷', 'jeo'),
+('藷', '마 저'),
+('藷', '저'),
+('藹', 'ae'),
+('藹', 'ay'),
+('藹', '애'),
+('藹', '화기로울 애'),
+('藺', '골풀 린'),
+('藻', 'Hanja form of 조 (“algae”).'),
+('藻', '마름'),
+('藻', '조'),
+('藻', '조류 조'),
+('藽', 'ch''in'),
+('藽', 'chin'),
+('藽', '친'),
+('藿', 'gwak'),
+('藿', 'kwak'),
+('藿', '곽'),
+('藿', '콩잎 곽'),
+('蘀', ' 마를 탁'),
+('蘀', '떨어질 탁'),
+('蘀', '탁'),
+('蘁', '거스르다'),
+('蘁', '거스를'),
+('蘁', '꽃받침'),
+('蘁', '악'),
+('蘁', '오'),
+('蘂', '蕊와 同字'),
+('蘂', '꽃술'),
+('蘂', '모이다'),
+('蘂', '모일'),
+('蘂', '예'),
+('蘂', '전'),
+('蘃', '꽃술'),
+('蘃', '예'),
+('蘄', 'gi'),
+('蘄', 'ki'),
+('蘄', '기'),
+('蘄', '풀 이름 기'),
+('蘆', '갈대 로'),
+('蘆', '꼭두서니 려'),
+('蘇', ' 까무러칠 소'),
+('蘇', ' 깨어날 소'),
+('蘇', ' 나무할 소'),
+('蘇', ' 성씨 소'),
+('蘇', '소'),
+('蘇', '차조기 소'),
+('蘊', ' 쌓일 온'),
+('蘊', 'on'),
+('蘊', '마름 온'),
+('蘊', '온'),
+('蘋', 'bin'),
+('蘋', 'pin'),
+('蘋', '네가래 빈'),
+('蘋', '빈'),
+('蘖', 'el'),
+('蘖', 'eol'),
+('蘖', 'ŏl'),
+('蘖', '그루터기 얼'),
+('蘖', '얼'),
+('蘗', 'byeok'),
+('蘗', 'pyek'),
+('蘗', 'pyŏk'),
+('蘗', '벽'),
+('蘗', '황경나무 벽'),
+('蘘', 'yang'),
+('蘘', '양'),
+('蘘', '양하 양'),
+('蘚', 'sen'),
+('蘚', 'seon'),
+('蘚', 'sŏn'),
+('蘚', '선'),
+('蘚', '이끼 선'),
+('蘢', '개여뀌 롱'),
+('蘧', ' 마음에 든든할 거'),
+('蘧', ' 석죽화 거'),
+('蘧', 'geo'),
+('蘧', 'ke'),
+('蘧', 'kŏ'),
+('蘧', '거'),
+('蘧', '패랭이꽃 거'),
+('蘩', 'beon'),
+('蘩', 'pen'),
+('蘩', 'pŏn'),
+('蘩', '번'),
+('蘩', '산흰쑥 번 '),
+('蘭', 'Hanja form of 난 (“orchid (South Korea)”).'),
+('蘭', 'Hanja form of 란 (“orchid”).'),
+('蘭', '난'),
+('蘭', '난초'),
+('蘭', '난초 란'),
+('蘭', '란'),
+('蘭', '란초'),
+('蘯', 't''ang'),
+('蘯', 'tang'),
+('蘯', 'thang'),
+('蘯', '盪과 同字'),
+('蘯', '탕'),
+('蘼', ' 천궁 미 '),
+('蘼', 'mi'),
+('蘼', '미'),
+('蘼', '장미 미'),
+('蘿', '무 라'),
+('虀', 'cey'),
+('虀', 'che'),
+('虀', 'je'),
+('虀', '제'),
+('虁', 'gi'),
+('虁', 'ki'),
+('虁', '夔와 同字 '),
+('虁', '기'),
+('虄', 'sal'),
+('虄', '살'),
+('虍', '호'),
+('虍', '호피 무늬'),
+('虎', 'Hanja form of 호 (“tiger”).'),
+('虎', '범'),
+('虎', '범 호'),
+('虎', '호'),
+('虐', '사나울 학'),
+('虐', '학'),
+('虓', '울부짖을 효'),
+('虓', '효'),
+('虔', ' 빼앗을 건'),
+('虔', ' 죽일 건'),
+('虔', '건'),
+('虔', '공경하다'),
+('虔', '공경할'),
+('虔', '정성 건'),
+('處', 'ch''ŏ'),
+('處', 'che'),
+('處', 'cheo'),
+('處', 'locate'),
+('處', 'place'),
+('處', 'stop'),
+('處', '살 처'),
+('處', '처'),
+('虖', 'ho'),
+('虖', '호'),
+('虚', '虛의 俗字'),
+('虛', ' 거짓 허'),
+('虛', ' 다할 허'),
+('虛', ' 약할 허'),
+('虛', ' 하늘 허'),
+('虛', ' 헛될 허'),
+('虛', 'he'),
+('虛', 'heo'),
+('虛', 'hŏ'),
+('虛', '빌 허'),
+('虛', '허'),
+('虜', 'Hanja form of 로/노 (“to capture”).'),
+('虜', '노'),
+('虜', '로'),
+('虜', '사로잡다'),
+('虜', '사로잡을'),
+('虜', '포로 로'),
+('虞', ' 갖출 우'),
+('虞', ' 우제 지낼 우'),
+('虞', ' 즐거울 우'),
+('虞', 'Hanja form of 우 (“to worry”).'),
+('虞', '염려하다'),
+('虞', '염려할'),
+('虞', '염려할 우'),
+('虞', '우'),
+('號', 'Hanja form of 호 (“art name”).'),
+('號', 'Hanja form of 호 (“mark; symbol”).'),
+('號', 'Hanja form of 호 (“name; alias”).'),
+('號', 'Hanja form of 호 (“number”).'),
+('號', 'Hanja form of 호 (“order; command”).'),
+('號', 'Hanja form of 호 (“shout; cry”).'),
+('號', '부르짖다'),
+('號', '부르짖을'),
+('號', '울부짖을 호'),
+('號', '이름'),
+('號', '호'),
+('虧', 'damage'),
+('虧', 'deficient'),
+('虧', 'hyu'),
+('虧', 'lose, fail'),
+('虧', '이지러질 휴'),
+('虧', '휴'),
+('虫', 'Alternative form of 虺 (“Hanja form of 훼 (“type of poisonous snake”).”)'),
+('虫', 'Alternative form of 蟲 (“Hanja form of 충 (“insect; bug”).”)'),
+('虫', '벌레'),
+('虫', '벌레 충'),
+('虫', '벌레 훼'),
+('虫', '충'),
+('虫', '훼'),
+('虬', 'gyu'),
+('虬', 'kyu'),
+('虬', '虯와 同字'),
+('虬', '규'),
+('虯', '규'),
+('虯', '뿔없는 용 규'),
+('虱', 'seul'),
+('虱', 'sul'),
+('虱', 'sŭl'),
+('虱', '蝨과 同字'),
+('虱', '슬'),
+('虹', 'Hanja form of 공 (“a placename”).'),
+('虹', 'Hanja form of 홍 (“rainbow”).'),
+('虹', '고을 이름'),
+('虹', '골이름 강'),
+('虹', '공'),
+('虹', '무지개'),
+('虹', '무지개 홍'),
+('虹', '홍'),
+('虺', 'big snake'),
+('虺', 'hwe'),
+('虺', 'hwey'),
+('虺', 'viper'),
+('虺', '살무사 훼'),
+('虺', '훼'),
+('虻', 'meng'),
+('虻', 'meong'),
+('虻', 'mŏng'),
+('虻', '멍'),
+('虽', 'Alternative form of 雖 (“Hanja form of 수 (“although”).”)'),
+('虽', '비록'),
+('虽', '수'),
+('蚇', 'cheog'),
+('蚇', 'inchworm, measuring worm, geometrid'),
+('蚇', '척'),
+('蚊', '모기 문'),
+('蚊', '문'),
+('蚋', 'ye'),
+('蚋', 'yey'),
+('蚋', '모기 예'),
+('蚋', '예'),
+('蚌', 'bang'),
+('蚌', 'pang'),
+('蚌', '방'),
+('蚌', '방합 방'),
+('蚍', 'ant king'),
+('蚍', 'bi'),
+('蚍', 'mallow'),
+('蚍', 'pi'),
+('蚍', '비'),
+('蚍', '왕개미 비'),
+('蚓', 'earthworm, rainworm'),
+('蚓', 'in'),
+('蚓', '인'),
+('蚓', '지렁이 인'),
+('蚕', '누에 잠'),
+('蚕', '지렁이 천'),
+('蚝', 'certain hairy and poisonous caterpillar'),
+('蚝', '쐐기'),
+('蚝', '자'),
+('蚣', 'gong'),
+('蚣', 'kong'),
+('蚣', '공'),
+('蚣', '지네 공'),
+('蚤', '벼룩 조'),
+('蚤', '조'),
+('蚨', 'bu'),
+('蚨', 'pu'),
+('蚨', '부'),
+('蚨', '파랑강충이 부'),
+('蚩', ' 어리석을 치'),
+('蚩', ' 업신여길 치'),
+('蚩', 'ch''i'),
+('蚩', 'chi'),
+('蚩', '치'),
+('蚩', '치벌레 치'),
+('蚪', 'du'),
+('蚪', 'tu'),
+('蚪', 'twu'),
+('蚪', '두'),
+('蚪', '올챙이 두'),
+('蚯', 'earthworm, rainworm'),
+('蚯', 'gu'),
+('蚯', 'ku'),
+('蚯', 'kwu'),
+('蚯', '구'),
+('蚯', '지렁이 구'),
+('蚰', ' 땅지네 유'),
+('蚰', 'yu'),
+('蚰', '노래기 유'),
+('蚰', '유'),
+('蚱', '벼메뚜기 책'),
+('蚱', '책'),
+('蚴', '굼틀거릴 유 '),
+('蚴', '유'),
+('蛀', 'chu'),
+('蛀', 'cwu'),
+('蛀', 'ju'),
+('蛀', '나무좀 주'),
+('蛀', '주'),
+('蛅', 'hairy and poisonous caterpillar'),
+('蛅', '점'),
+('蛆', ' 지네 저'),
+('蛆', '구더기 저'),
+('蛆', '저'),
+('蛇', 'snake; long snake'),
+('蛇', 'winding, meandering'),
+('蛇', '구불구불'),
+('蛇', '긴 뱀'),
+('蛇', '든든할 이'),
+('蛇', '뱀'),
+('蛇', '뱀 사'),
+('蛇', '사'),
+('蛇', '이'),
+('蛉', '장자리 령'),
+('蛋', '단'),
+('蛋', '오랑캐 이름 단'),
+('蛍', 'hyeng'),
+('蛍', 'hyeong'),
+('蛍', 'hyŏng'),
+('蛍', '螢과 同字'),
+('蛍', '형'),
+('蛐', 'earthworm, rainworm'),
+('蛐', 'gog'),
+('蛐', '곡'),
+('蛔', 'hoe'),
+('蛔', 'hoy'),
+('蛔', '거위 회'),
+('蛔', '회'),
+('蛙', ' 음란한 소리 왜'),
+('蛙', '개구리 와'),
+('蛙', '개구리 왜'),
+('蛛', 'chu'),
+('蛛', 'cwu'),
+('蛛', 'ju'),
+('蛛', 'spider'),
+('蛛', '거미 주'),
+('蛛', '주'),
+('蛞', 'hwal'),
+('蛞', '괄태충 활'),
+('蛞', '활'),
+('蛟', 'gyo'),
+('蛟', 'kyo'),
+('蛟', '교'),
+('蛟', '교룡 교'),
+('蛣', '길'),
+('蛣', '장구벌레 길'),
+('蛤', 'hap'),
+('蛤', '조개 합'),
+('蛤', '합'),
+('蛩', 'gong'),
+('蛩', 'kong'),
+('蛩', '공'),
+('蛩', '메뚜기 공'),
+('蛬', 'gong'),
+('蛬', 'kong'),
+('蛬', '공'),
+('蛬', '귀뚜라미 공 '),
+('蛭', 'chil'),
+('蛭', 'cil'),
+('蛭', 'jil'),
+('蛭', 'leech'),
+('蛭', '거머리 질'),
+('蛭', '질'),
+('蛮', 'man'),
+('蛮', '蠻의 略字'),
+('蛮', '만'),
+('蛸', ' 연가시 알집 소'),
+('蛸', 'so'),
+('蛸', '거미알 소'),
+('蛸', '소'),
+('蛹', 'pupa, chrysalis'),
+('蛹', '번데기 용'),
+('蛹', '용'),
+('蛻', 'se'),
+('蛻', 'sey'),
+('蛻', '매미 허물 세'),
+('蛻', '세'),
+('蛾', 'a'),
+('蛾', 'moth'),
+('蛾', '누에나방 아'),
+('蛾', '아'),
+('蜀', ' 큰 닭 촉'),
+('蜀', '나라 이름'),
+('蜀', '촉'),
+('蜀', '촉규화벌레 촉'),
+('蜂', 'Hanja form of 봉 (“bee”).'),
+('蜂', 'Hanja form of 봉 (“bee”). [affix]'),
+('蜂', '벌'),
+('蜂', '벌 봉'),
+('蜂', '봉'),
+('蜃', ' 술잔 신'),
+('蜃', ' 이무기 신'),
+('蜃', 'sin'),
+('蜃', '신'),
+('蜃', '큰 조개 신'),
+('蜆', ' 호수이름 현'),
+('蜆', 'hyen'),
+('蜆', 'hyeon'),
+('蜆', 'hyŏn'),
+('蜆', '가막조개 현'),
+('蜆', '현'),
+('蜈', 'o'),
+('蜈', '오'),
+('蜈', '지네 오'),
+('蜉', 'bu'),
+('蜉', 'kind of large insect'),
+('蜉', 'mayfly'),
+('蜉', 'pu'),
+('蜉', '부'),
+('蜉', '하루살이 부'),
+('蜊', '참조개 리'),
+('蜋', '사마귀 랑'),
+('蜑', '단'),
+('蜑', '오랑캐 이름 단'),
+('蜕', 'se'),
+('蜕', 'sey'),
+('蜕', '蛻와 同字'),
+('蜕', '세'),
+('蜖', 'hoe'),
+('蜖', 'hoy'),
+('蜖', '회'),
+('蜘', 'chi'),
+('蜘', 'ci'),
+('蜘', 'ji'),
+('蜘', 'spider'),
+('蜘', '거미 지'),
+('蜘', '지'),
+('蜚', 'bi'),
+('蜚', 'pi'),
+('蜚', '바퀴 비'),
+('蜚', '비'),
+('蜜', 'Hanja form of 밀 (“beeswax”).'),
+('蜜', 'Hanja form of 밀 (“beeswax”). [noun]'),
+('蜜', 'Hanja form of 밀 (“honey”).'),
+('蜜', 'Hanja form of 밀 (“honey”). [affix]'),
+('蜜', '꿀'),
+('蜜', '꿀 밀'),
+('蜜', '밀'),
+('蜝', '기'),
+('蜝', '방계 기 '),
+('蜡', 'sa'),
+('蜡', '납향 사'),
+('蜡', '사'),
+('蜥', 'sek'),
+('蜥', 'seok'),
+('蜥', 'sŏk'),
+('蜥', '도마뱀 석'),
+('蜥', '석'),
+('蜨', 'cep'),
+('蜨', 'chŏp'),
+('蜨', 'jeop'),
+('蜨', '나비 접'),
+('蜨', '접'),
+('蜩', 'broad locust'),
+('蜩', 'cho'),
+('蜩', 'cicada'),
+('蜩', 'co'),
+('蜩', 'jo'),
+('蜩', '매미 조'),
+('蜩', '조'),
+('蜴', 'ch''ŏk'),
+('蜴', 'chek'),
+('蜴', 'cheok'),
+('蜴', '도마뱀 척'),
+('蜴', '척'),
+('蜵', ' 벌레 이름 연 '),
+('蜵', 'yen'),
+('蜵', 'yeon'),
+('蜵', 'yŏn'),
+('蜵', '연'),
+('蜵', '우렁찰 연'),
+('蜷', 'gwon'),
+('蜷', 'kwen'),
+('蜷', 'kwŏn'),
+('蜷', '권'),
+('蜷', '움추러질 권'),
+('蜺', ' 암무지개 예'),
+('蜺', 'cicada'),
+('蜺', 'secondary rainbow'),
+('蜺', 'ye'),
+('蜺', 'yey'),
+('蜺', '말매미 예'),
+('蜺', '예'),
+('蜻', 'ch''ŏng'),
+('蜻', 'cheng'),
+('蜻', 'cheong'),
+('蜻', '귀뚜라미 청'),
+('蜻', '청'),
+('蜾', 'Ammophila sabulosa, red-banded sand wasp'),
+('蜾', '과'),
+('蜿', 'wen'),
+('蜿', 'won'),
+('蜿', 'wŏn'),
+('蜿', '굼틀거릴 원'),
+('蜿', '원'),
+('蝀', 'Hanja form of 동 (“rainbow”).'),
+('蝀', '동'),
+('蝀', '무지개'),
+('蝀', '무지개 동'),
+('蝉', '蟬의 略字'),
+('蝌', 'gwa'),
+('蝌', 'kwa'),
+('蝌', '과'),
+('蝌', '올챙이 과'),
+('蝎', ' 빈대 갈'),
+('蝎', 'gal'),
+('蝎', 'kal'),
+('蝎', '갈'),
+('蝎', '전갈 갈'),
+('蝓', 'yu'),
+('蝓', '유'),
+('蝕', ' 월식 식'),
+('蝕', ' 일식 식'),
+('蝕', 'sik'),
+('蝕', '벌레먹을 식'),
+('蝕', '식'),
+('蝗', 'hwang'),
+('蝗', '누리 황'),
+('蝗', '황'),
+('蝘', 'a kind of cicada'),
+('蝘', 'eon'),
+('蝘', 'gecko'),
+('蝘', 'ŏn'),
+('蝘', '언'),
+('蝙', 'p''yŏn'),
+('蝙', 'phyen'),
+('蝙', 'pyeon'),
+('蝙', '박쥐 편'),
+('蝙', '편'),
+('蝝', 'yen'),
+('蝝', 'yeon'),
+('蝝', 'yŏn'),
+('蝝', '메뚜기(메뚜깃과의 곤충) 새끼: young locust without wings'),
+('蝝', '연'),
+('蝟', 'wi'),
+('蝟', '고슴도치 위'),
+('蝟', '위'),
+('蝠', 'bok'),
+('蝠', 'pok'),
+('蝠', '박쥐 복'),
+('蝠', '복'),
+('蝤', 'yu'),
+('蝤', '유'),
+('蝤', '하루살이 유 '),
+('蝥', 'cantharides'),
+('蝥', 'mo'),
+('蝥', '모'),
+('蝥', '해충 모'),
+('蝦', 'ha'),
+('蝦', '새우 하'),
+('蝦', '하'),
+('蝨', 'seul'),
+('蝨', 'sul'),
+('蝨', 'sŭl'),
+('蝨', '슬'),
+('蝨', '이 슬'),
+('蝮', 'bok'),
+('蝮', 'pok'),
+('蝮', '복'),
+('蝮', '살무사 복'),
+('蝴', 'hu'),
+('蝴', 'hwu'),
+('蝴', '후'),
+('蝶', 'cep'),
+('蝶', 'chŏp'),
+('蝶', 'jeop'),
+('蝶', '들나비 접'),
+('蝶', '접'),
+('蝸', 'wa'),
+('蝸', '달팽이 와'),
+('蝸', '와'),
+('螂', '蜋과 同字'),
+('螃', 'bang'),
+('螃', 'pang'),
+('螃', '방'),
+('螃', '방게 방'),
+('螈', 'newt'),
+('螈', 'won'),
+('螈', 'wŏn'),
+('螈', '원'),
+('螉', '나나니벌'),
+('螉', '옹'),
+('螌', 'ban'),
+('螌', 'pan'),
+('螌', '가뢰 반'),
+('螌', '반'),
+('融', ' 귀신이름 융'),
+('融', ' 밝을 융'),
+('融', ' 불길 위로 오를 융'),
+('融', ' 융통할 융'),
+('融', 'yung'),
+('融', '부드러울 융'),
+('融', '융'),
+('螗', 'a kind of cicada'),
+('螗', '당'),
+('螘', 'ui'),
+('螘', 'uy'),
+('螘', 'ŭi'),
+('螘', '목 매어 죽는 벌레 의'),
+('螘', '의'),
+('螞', 'horse-leech (Haemopis sanguisuga)'),
+('螞', 'ma'),
+('螞', '마'),
+('螞', '말거머리 마'),
+('螟', 'myeng'),
+('螟', 'myeong'),
+('螟', 'myŏng'),
+('螟', '마디충 명'),
+('螟', '명'),
+('螢', 'Hanja form of 형 (“glow-worm; luminous insect”).'),
+('螢', '개똥벌레 형'),
+('螢', '반딧불이'),
+('螢', '형'),
+('螣', 'deung'),
+('螣', 'tung'),
+('螣', 'tŭng'),
+('螣', '등'),
+('螣', '등사 등'),
+('螦', 'so'),
+('螦', '소'),
+('螭', '교륭 리'),
+('螳', 'dang'),
+('螳', 'tang'),
+('螳', '당'),
+('螳', '버마 재비 당'),
+('螴', 'chin'),
+('螴', 'cin'),
+('螴', 'jin'),
+('螴', '설렐 진 '),
+('螴', '진'),
+('螺', 'Hanja form of 라/나 (“aquatic snail”).'),
+('螺', '나'),
+('螺', '라'),
+('螺', '소라'),
+('螺', '소라 라'),
+('螻', '땅강아지 루'),
+('螽', 'chong'),
+('螽', 'cong'),
+('螽', 'jong'),
+('螽', '누리 종'),
+('螽', '종'),
+('螾', 'earthworm, rainworm'),
+('螾', 'in'),
+('螾', '인'),
+('蟀', '귀뚜라미 솔'),
+('蟀', '솔'),
+('蟄', ' 우물거릴 칩'),
+('蟄', 'ch''ip'),
+('蟄', 'chip'),
+('蟄', '벌레 움츠릴 칩'),
+('蟄', '칩'),
+('蟇', 'ma'),
+('蟇', '개구리 마'),
+('蟇', '마'),
+('蟊', 'mo'),
+('蟊', '蝥와 同字'),
+('蟊', '모'),
+('蟋', 'sil'),
+('蟋', '귀뚜라미 실'),
+('蟋', '실'),
+('蟒', 'mang'),
+('蟒', '망'),
+('蟒', '이무기 망'),
+('蟖', 'hairy and poisonous caterpillar'),
+('蟖', '사'),
+('蟚', 'p''aeng'),
+('蟚', 'paeng'),
+('蟚', 'phayng'),
+('蟚', '蟛과 同字'),
+('蟚', '팽'),
+('蟛', 'p''aeng'),
+('蟛', 'paeng'),
+('蟛', 'phayng'),
+('蟛', '방게 팽'),
+('蟛', '팽'),
+('蟠', 'ban'),
+('蟠', 'pan'),
+('蟠', '반'),
+('蟠', '서릴 반'),
+('蟣', 'leech'),
+('蟣', 'nits'),
+('蟣', '기'),
+('蟣', '서캐 기'),
+('蟥', 'horse-leech (Haemopis sanguisuga)'),
+('蟥', 'hwang'),
+('蟥', '황'),
+('蟬', 'cicada'),
+('蟬', 'sen'),
+('蟬', 'seon'),
+('蟬', 'sŏn'),
+('蟬', '매미 선'),
+('蟬', '선'),
+('蟯', 'yo'),
+('蟯', '요'),
+('蟯', '촌백충 요'),
+('蟲', ' 김 오를 충'),
+('蟲', 'Hanja form of 충 (“insect; bug”).'),
+('蟲', '벌레'),
+('蟲', '벌레 충'),
+('蟲', '충'),
+('蟷', 'dang'),
+('蟷', 'tang'),
+('蟷', '당'),
+('蟷', '사마귀 당'),
+('蟹', 'crab'),
+('蟹', '게'),
+('蟹', '게 해'),
+('蟹', '해'),
+('蟻', ' 검을 의'),
+('蟻', ' 술구더기 의'),
+('蟻', 'Hanja form of 의 (“ant”).'),
+('蟻', '개미'),
+('蟻', '왕개미 의'),
+('蟻', '의'),
+('蟾', 'sem'),
+('蟾', 'seom'),
+('蟾', 'sŏm'),
+('蟾', '두꺼비 섬'),
+('蟾', '섬'),
+('蠁', 'hyang'),
+('蠁', '번데기: chrysalis'),
+('蠁', '향'),
+('蠃', '나나니벌 라'),
+('蠅', '승'),
+('蠅', '파리 승'),
+('蠍', '갈'),
+('蠍', '전갈 갈'),
+('蠑', 'newt'),
+('蠑', 'yeng'),
+('蠑', 'yeong'),
+('蠑', 'yŏng'),
+('蠑', '도마뱀 영'),
+('蠑', '영'),
+('蠔', 'ho'),
+('蠔', '호'),
+('蠕', '벌레 기어갈 연'),
+('蠖', 'hwag'),
+('蠖', 'inchworm, measuring worm, geometrid'),
+('蠖', '확'),
+('蠟', 'Hanja form of 랍/납 (“candle”).'),
+('蠟', 'Hanja form of 랍/납 (“wax”).'),
+('蠟', '납'),
+('蠟', '랍'),
+('蠟', '밀'),
+('蠟', '밀 랍'),
+('蠡', '좀먹을 려'),
+('蠢', 'chun'),
+('蠢', 'cwun'),
+('蠢', 'jun'),
+('蠢', '꿈틀거릴 준'),
+('蠢', '준'),
+('蠣', '굴 려'),
+('蠱', 'go'),
+('蠱', 'ko'),
+('蠱', '고'),
+('蠱', '독 고'),
+('蠲', ' 반딧불 견'),
+('蠲', ' 조촐할 견'),
+('蠲', 'gyeon'),
+('蠲', 'kyen'),
+('蠲', 'kyŏn'),
+('蠲', '견'),
+('蠲', '밝을 견'),
+('蠶', 'silkworm'),
+('蠶', '누에'),
+('蠶', '누에 잠'),
+('蠶', '잠'),
+('蠹', 'du'),
+('蠹', 'tu'),
+('蠹', 'twu'),
+('蠹', '두'),
+('蠹', '좀 두'),
+('蠻', 'Hanja form of 만 (“barbarian”).'),
+('蠻', '만'),
+('蠻', '오랑캐'),
+('蠻', '오랑캐 만'),
+('血', ' 씩씩할 혈'),
+('血', ' 피붙이 혈'),
+('血', 'Hanja form of 혈 (“blood”).'),
+('血', 'Hanja form of 혈 (“blood”). [affix]'),
+('血', '피'),
+('血', '피 혈'),
+('血', '혈'),
+('衄', '코피 뉵'),
+('衅', 'heun'),
+('衅', 'hun'),
+('衅', 'hŭn'),
+('衅', '釁과 同字'),
+('衅', '흔'),
+('衆', 'Hanja form of 중 (“crowd”).'),
+('衆', '무리'),
+('衆', '무리 중'),
+('衆', '중'),
+('衊', 'myel'),
+('衊', 'myeol'),
+('衊', 'myŏl'),
+('衊', '멸'),
+('衊', '모독할 멸'),
+('行', ' 굳셀 항'),
+('行', ' 그릇 얄긋거릴 행'),
+('行', ' 길귀신 행'),
+('行', ' 오행 행'),
+('行', ' 항렬 항'),
+('行', ' 행서 행'),
+('行', ' 행실 행'),
+('行', 'Hanja form of 항 (“a line of soldiers”).'),
+('行', 'Hanja form of 항 (“degree of familial relation”).'),
+('行', 'Hanja form of 행 (“(suffix) (transport) bound for”).'),
+('行', 'Hanja form of 행 (“behaviour; conduct”).'),
+('行', 'Hanja form of 행 (“line; row”).'),
+('行', 'Hanja form of 행 (“movement; going”).'),
+('行', 'Hanja form of 행 (“place for specific transaction”).'),
+('行', '다니다'),
+('行', '다닐'),
+('行', '다닐 행'),
+('行', '시장 항'),
+('行', '항'),
+('行', '항렬'),
+('行', '행'),
+('衍', ' 넓을 연'),
+('衍', ' 물이 넘칠 연'),
+('衍', ' 상자 연'),
+('衍', ' 아름다울 연'),
+('衍', ' 흐를 연'),
+('衍', '성할 연'),
+('衍', '연'),
+('衎', ' 바를 간'),
+('衎', 'gan'),
+('衎', 'kan'),
+('衎', '간'),
+('衎', '즐길 간'),
+('衏', '원'),
+('衏', '즐거울'),
+('衏', '즐겁다'),
+('衒', ' 팔릴 현'),
+('衒', '자랑할 현'),
+('衒', '현'),
+('術', ' 술법 술'),
+('術', ' 심술부릴 술'),
+('術', 'Hanja form of 술 (“talent; skill; gift; knack”).'),
+('術', 'Hanja form of 술 (“trick; trap; ruse; artifice”).'),
+('術', 'Hanja form of 술 (“wits; brains; head”).'),
+('術', '술'),
+('術', '재주'),
+('術', '재주 술'),
+('街', 'Hanja form of 가 (“street; road”).'),
+('街', '가'),
+('街', '거리'),
+('街', '거리 가'),
+('衘', 'Alternative form of 銜.'),
+('衘', '재갈'),
+('衘', '함'),
+('衙', 'a'),
+('衙', '마을 아'),
+('衙', '아'),
+('衛', 'Hanja form of 위 (“protection”).'),
+('衛', '衞와 同字'),
+('衛', '위'),
+('衛', '지키다'),
+('衛', '지킬'),
+('衝', ' 거리 충'),
+('衝', ' 돌파할 충'),
+('衝', ' 찌를 충'),
+('衝', 'Hanja form of 충 (“to collide”).'),
+('衝', '찌르다'),
+('衝', '찌를'),
+('衝', '충'),
+('衝', '충돌할 충'),
+('衞', ' 나라이름 위'),
+('衞', ' 지킬 위'),
+('衞', ' 핏기운 위'),
+('衞', '막을 위'),
+('衞', '위'),
+('衟', 'Alternative form of 道.'),
+('衟', '길'),
+('衟', '도'),
+('衠', '순'),
+('衠', '참'),
+('衡', '가로 횡'),
+('衡', '저울대 형'),
+('衢', 'gu'),
+('衢', 'highway'),
+('衢', 'ku'),
+('衢', 'kwu'),
+('衢', 'thoroughfare, intersection'),
+('衢', '구'),
+('衢', '네거리 구'),
+('衣', ' 입을 의'),
+('衣', 'Hanja form of 의 (“clothes, clothing”).'),
+('衣', '옷'),
+('衣', '옷 의'),
+('衣', '의'),
+('表', ' 밝을 표'),
+('表', ' 윗옷 표'),
+('表', 'Hanja form of 표 (“table, diagram, or graph”).'),
+('表', '겉'),
+('表', '겉 표'),
+('表', '표'),
+('衫', 'sam'),
+('衫', '삼'),
+('衫', '적삼 삼'),
+('衮', 'royal robe'),
+('衮', '袞과 同字'),
+('衮', '곤'),
+('衮', '곤룡포'),
+('衰', ' 모손할 쇠'),
+('衰', ' 약할 쇠'),
+('衰', '상복 최'),
+('衰', '쇠할 쇠'),
+('衲', 'nap'),
+('衲', '기울 납'),
+('衲', '납'),
+('衷', ' 마음 충'),
+('衷', ' 속곳 충'),
+('衷', ' 정성 충'),
+('衷', ' 착할 충'),
+('衷', 'ch''ung'),
+('衷', 'chung'),
+('衷', 'chwung'),
+('衷', '가운데 충'),
+('衷', '충'),
+('衽', 'im'),
+('衽', '옷깃 임'),
+('衽', '임'),
+('衾', 'geum'),
+('衾', 'kum'),
+('衾', 'kŭm'),
+('衾', '금'),
+('衾', '이불 금'),
+('衿', 'geum'),
+('衿', 'kum'),
+('衿', 'kŭm'),
+('衿', '금'),
+('衿', '옷깃 금'),
+('袁', ' 성씨 원'),
+('袁', 'robe'),
+('袁', 'wen'),
+('袁', 'won'),
+('袁', 'wŏn'),
+('袁', '옷 치렁거릴 원'),
+('袁', '원'),
+('袂', 'mye'),
+('袂', 'myey'),
+('袂', '몌'),
+('袂', '소매 몌'),
+('袆', '褘와 同字'),
+('袈', 'ga'),
+('袈', 'ka'),
+('袈', '가'),
+('袈', '가사 가'),
+('袋', 'Hanja form of 대 (“bag; sack; pouch; pocket”).'),
+('袋', '대'),
+('袋', '자루'),
+('袋', '자루 대'),
+('袍', ' 관디 포'),
+('袍', ' 앞섶 포'),
+('袍', 'p''o'),
+('袍', 'pho'),
+('袍', 'po'),
+('袍', '도포 포'),
+('袍', '포'),
+('袒', '솔기 터질 탄'),
+('袒', '웃옷 벗을 단'),
+('袖', 'Hanja form of 수 (“sleeve”).'),
+('袖', '소매'),
+('袖', '소매 수'),
+('袖', '수'),
+('袗', '진'),
+('袗', '홑옷 진'),
+('袛', 'ce'),
+('袛', 'chŏ'),
+('袛', 'jeo'),
+('袛', '속적삼 저 '),
+('袛', '저'),
+('袝', 'bu'),
+('袝', 'pu'),
+('袝', '부'),
+('袞', 'gon'),
+('袞', 'kon'),
+('袞', '곤'),
+('袞', '곤룡포 곤'),
+('袟', 'chil'),
+('袟', 'cil'),
+('袟', 'jil'),
+('袟', '질'),
+('袟', '책갑: book cover'),
+('袢', 'beon'),
+('袢', 'pen'),
+('袢', 'pŏn'),
+('袢', '번'),
+('袢', '속옷 번'),
+('袤', 'mu'),
+('袤', '길이 무'),
+('袤', '무'),
+('袪', ' 소매 아귀 거'),
+('袪', 'geo'),
+('袪', 'ke'),
+('袪', 'kŏ'),
+('袪', 'sleeve'),
+('袪', '거'),
+('袪', '소매 거'),
+('被', ' 나타날 피'),
+('被', ' 덥힐 피'),
+('被', ' 미칠 피'),
+('被', ' 창피할 피'),
+('被', 'p''i'),
+('被', 'phi'),
+('被', 'pi'),
+('被', '이불 피'),
+('被', '피'),
+('袱', '보 복'),
+('袱', '복'),
+('袳', 'ch''i'),
+('袳', 'chi'),
+('袳', '옷 펼칠 치'),
+('袳', '치'),
+('袴', 'Hanja form of 고 (“trousers; pants”).'),
+('袴', 'Hanja form of 과 (“crotch; groin”).'),
+('袴', '고'),
+('袴', '과'),
+('袴', '바지'),
+('袴', '바지 고'),
+('袴', '사타구니'),
+('袷', 'the place in a garment where the right and left collars meet'),
+('袷', '겹'),
+('裀', 'coverlet'),
+('裀', 'in'),
+('裀', '요 인'),
+('裀', '인'),
+('裁', ' 결단할 재'),
+('裁', ' 헤아릴 재'),
+('裁', 'cay'),
+('裁', 'chae'),
+('裁', 'jae'),
+('裁', '마름질할 재'),
+('裁', '재'),
+('裂', 'Hanja form of 렬/열 (“rend”).'),
+('裂', 'Hanja form of 렬/열 (“split, crack, break open”).'),
+('裂', '렬'),
+('裂', '열'),
+('裂', '찢다'),
+('裂', '찢을'),
+('裂', '찢을 렬'),
+('装', 'cang'),
+('装', 'chang'),
+('装', 'jang'),
+('装', '裝의 俗字'),
+('装', '장'),
+('裊', '끄을 뇨'),
+('裍', 'gon'),
+('裍', 'kon'),
+('裍', '걷어 올릴 곤'),
+('裍', '곤'),
+('裎', 'ceng'),
+('裎', 'chŏng'),
+('裎', 'jeong'),
+('裎', '벌거숭이: naked body'),
+('裎', '정'),
+('裏', 'Hanja form of 리/이 (“within”).'),
+('裏', 'Hanja form of 리/이 (“within”). [affix; suffix]'),
+('裏', '리'),
+('裏', '속'),
+('裏', '속 리'),
+('裏', '이'),
+('裒', 'assemble'),
+('裒', 'bu'),
+('裒', 'collect'),
+('裒', 'gather'),
+('裒', 'praise'),
+('裒', 'pu'),
+('裒', '모을 부'),
+('裒', '부'),
+('裔', ' 변방 예'),
+('裔', ' 후손 예'),
+('裔', '예'),
+('裔', '옷 뒷자락 예'),
+('裕', ' 너그러울 유'),
+('裕', 'enough, sufficient, ample, plenty'),
+('裕', 'yu'),
+('裕', '넉넉할 유'),
+('裕', '유'),
+('裘', 'gu'),
+('裘', 'ku'),
+('裘', 'kwu'),
+('裘', '갓옷 구'),
+('裘', '구'),
+('裙', 'gun'),
+('裙', 'kun'),
+('裙', 'kwun'),
+('裙', '군'),
+('裙', '치마 군'),
+('補', 'Hanja form of 보 (“mend, patch, fix, repair, restore”).'),
+('補', '기울'),
+('補', '기울 보'),
+('補', '깁다'),
+('補', '도울'),
+('補', '돕다'),
+('補', '보'),
+('裝', '꾸미다'),
+('裝', '꾸밀'),
+('裝', '장'),
+('裝', '차려 입을 장'),
+('裟', 'sa'),
+('裟', '가사 사'),
+('裟', '사'),
+('裡', 'Alternative form of 裏'),
+('裡', '裏와 同字'),
+('裡', '리'),
+('裡', '속'),
+('裡', '이'),
+('裨', 'bi'),
+('裨', 'pi'),
+('裨', '도울 비'),
+('裨', '비'),
+('裯', 'chu'),
+('裯', 'cwu'),
+('裯', 'ju'),
+('裯', 'thin quilt'),
+('裯', 'underwear'),
+('裯', '주'),
+('裯', '홑이불 주'),
+('裱', 'p''yo'),
+('裱', 'phyo'),
+('裱', 'pyo'),
+('裱', '목수건 표'),
+('裱', '표'),
+('裳', 'sang'),
+('裳', '상'),
+('裳', '치마 상'),
+('裴', '배'),
+('裴', '옷 치렁치렁할 배'),
+('裵', 'Hanja form of 배 (“a common surname”).'),
+('裵', 'Hanja form of 배 (“of clothing, long”).'),
+('裵', 'Hanja form of 비 (“a placename”).'),
+('裵', '고을 이름'),
+('裵', '배'),
+('裵', '비'),
+('裵', '성'),
+('裵', '옷 치렁치렁하다'),
+('裵', '옷 치렁치렁할'),
+('裸', '벌거벗을 라'),
+('裹', 'encircle, confine'),
+('裹', 'wrap, bind'),
+('裹', '과'),
+('裹', '쌀 과'),
+('製', 'Hanja form of 제 (“build; make”).'),
+('製', '만들 제'),
+('製', '제'),
+('製', '지을'),
+('製', '짓다'),
+('裾', 'geo'),
+('裾', 'ke'),
+('裾', 'kŏ'),
+('裾', '거'),
+('裾', '옷 뒷자락 거'),
+('褄', 'ch''ŏ'),
+('褄', 'che'),
+('褄', 'cheo'),
+('褄', '깃의 가 처'),
+('褄', '처'),
+('複', 'Hanja form of 복 (“repeat, double, overlap”).'),
+('複', '겹옷 복'),
+('複', '겹치다'),
+('複', '겹칠'),
+('複', '겹칠 부'),
+('複', '복'),
+('複', '부'),
+('褊', ' 급할 편'),
+('褊', ' 옷이 몸에 낄 편'),
+('褊', 'p''yŏn'),
+('褊', 'phyen'),
+('褊', 'pyeon'),
+('褊', '좁을 편'),
+('褊', '편'),
+('褌', 'gon'),
+('褌', 'kon'),
+('褌', '곤'),
+('褌', '잠방이 곤'),
+('褐', ' 갈옷 갈'),
+('褐', ' 굵은 베 갈'),
+('褐', ' 천한사람 갈'),
+('褐', 'Hanja form of 갈 (“brown”).'),
+('褐', '갈'),
+('褐', '갈색'),
+('褐', '굵다'),
+('褐', '굵은'),
+('褐', '털베 갈'),
+('褒', ' 고을이름 포'),
+('褒', ' 도포 포'),
+('褒', ' 옷 뒤길 포'),
+('褒', '포장할 포'),
+('褓', 'bo'),
+('褓', 'po'),
+('褓', '보'),
+('褓', '포대기 보'),
+('褕', ' 쾌자 유'),
+('褕', 'yu'),
+('褕', '꿩의 깃으로 꾸민 옷 유'),
+('褕', '유'),
+('褘', ' 아름다울 위'),
+('褘', 'beautiful'),
+('褘', 'ceremonial gowns of a queen'),
+('褘', 'handkerchief'),
+('褘', 'wi'),
+('褘', '위'),
+('褘', '휘장 위'),
+('褙', '배'),
+('褙', '속적삼'),
+('褚', ' 쌓을 저'),
+('褚', ' 옷에 솜 둘 저'),
+('褚', 'bag'),
+('褚', 'ce'),
+('褚', 'chŏ'),
+('褚', 'jeo'),
+('褚', 'vest'),
+('褚', '저'),
+('褚', '주머니 저'),
+('褥', 'yok'),
+('褥', '욕'),
+('褧', 'gyeong'),
+('褧', 'kyeng'),
+('褧', 'kyŏng'),
+('褧', '경'),
+('褧', '홑옷 경'),
+('褪', ' 꽃빛 옅어질 퇴'),
+('褪', '옷 벗을 퇴'),
+('褪', '퇴'),
+('褫', ' 넋 잃을 치'),
+('褫', ' 벗을 치'),
+('褫', 'ch''i'),
+('褫', 'chi'),
+('褫', '옷 빼앗을 치'),
+('褫', '치'),
+('褰', ' 걷을 건'),
+('褰', ' 발 걷을 건'),
+('褰', 'baggy trousers worn by Koreans'),
+('褰', 'open up'),
+('褰', 'outspread'),
+('褰', 'roll up'),
+('褰', '건'),
+('褰', '바지 건'),
+('褱', '회'),
+('褲', 'groin, crotch'),
+('褲', 'trousers, pants (US)'),
+('褲', '고'),
+('褲', '과'),
+('褲', '바지'),
+('褲', '사타구니'),
+('褶', ' 겹옷 첩'),
+('褶', '덧옷 첩'),
+('褶', '슬갑 습'),
+('褸', '남루할 루'),
+('褺', 'ch''ŏp'),
+('褺', 'cheop'),
+('褺', 'chep'),
+('褺', '겹옷 첩'),
+('褺', '첩'),
+('褻', 'sel'),
+('褻', 'seol'),
+('褻', 'sŏl'),
+('褻', '더러울 설'),
+('褻', '설'),
+('襁', 'gang'),
+('襁', 'kang'),
+('襁', '강'),
+('襁', '포대기 강'),
+('襄', ' 장사지낼 양'),
+('襄', '도울'),
+('襄', '돕다'),
+('襄', '양'),
+('襄', '오를 양'),
+('襍', 'cap'),
+('襍', 'chap'),
+('襍', 'jap'),
+('襍', '雜의 本字'),
+('襍', '잡'),
+('襖', 'o'),
+('襖', '도포 오'),
+('襖', '오'),
+('襘', 'goe'),
+('襘', 'koe'),
+('襘', 'koy'),
+('襘', '괴'),
+('襘', '띠매듭 괴 '),
+('襜', 'apron'),
+('襜', 'ch''ŏm'),
+('襜', 'chem'),
+('襜', 'cheom'),
+('襜', '첨'),
+('襜', '행주치마 첨'),
+('襞', 'byeok'),
+('襞', 'pyek'),
+('襞', 'pyŏk'),
+('襞', '벽'),
+('襞', '주름 벽'),
+('襟', 'geum'),
+('襟', 'kum'),
+('襟', 'kŭm'),
+('襟', 'lapel, collar'),
+('襟', '금'),
+('襟', '옷깃 금'),
+('襠', 'dang'),
+('襠', 'tang'),
+('襠', '당'),
+('襠', '잠방이 당'),
+('襢', 'bare'),
+('襢', 'dan'),
+('襢', 'strip'),
+('襢', 'tan'),
+('襢', '단'),
+('襣', 'bi'),
+('襣', 'pi'),
+('襣', '비'),
+('襤', '누더기 람'),
+('襦', ' 베쐐기 갓장이 유'),
+('襦', 'yu'),
+('襦', '유'),
+('襦', '저고리 유'),
+('襪', 'mal'),
+('襪', 'socks, footmuffs of Korean tradition'),
+('襪', '말'),
+('襪', '버선 말'),
+('襭', 'hil'),
+('襭', 'tuck up hem of garment and wrap'),
+('襭', '옷자락 꽂을 힐'),
+('襭', '힐'),
+('襯', ' 베풀 친'),
+('襯', ' 접근할 친'),
+('襯', '속옷 친'),
+('襯', '친'),
+('襲', ' 반복할 습'),
+('襲', ' 벼슬 대물릴 습'),
+('襲', ' 엄습할 습'),
+('襲', ' 염습할 습'),
+('襲', ' 합할 습'),
+('襲', '습'),
+('襲', '엄습하다'),
+('襲', '엄습할'),
+('襲', '옷 덧입을 습'),
+('襴', '난'),
+('襴', '난삼 란'),
+('襴', '란'),
+('襻', 'ban'),
+('襻', 'band'),
+('襻', 'belt'),
+('襻', 'pan'),
+('襻', '반'),
+('西', 'Hanja form of 서 (“west; western”).'),
+('西', '서'),
+('西', '서녘'),
+('西', '서녘 서'),
+('要', ' 기다릴 요'),
+('要', ' 반드시 요'),
+('要', ' 부를 요'),
+('要', ' 살필 요'),
+('要', ' 언약할 요'),
+('要', ' 허리 요'),
+('要', 'Hanja form of 요 (“importance”).'),
+('要', '구할 요'),
+('要', '요'),
+('要', '중요할'),
+('覃', '담'),
+('覃', '미칠 담'),
+('覆', ' 가리울 부'),
+('覆', ' 고루고루 퍼질 부'),
+('覆', 'Hanja form of 복 (“again”).'),
+('覆', 'Hanja form of 부 (“cover”).'),
+('覆', 'Hanja form of 부 (“reply”).'),
+('覆', 'Hanja form of 부 (“return”).'),
+('覆', 'Hanja form of 부 (“tip over”).'),
+('覆', '다시'),
+('覆', '덮다'),
+('覆', '덮을'),
+('覆', '덮을 부'),
+('覆', '뒤집힐 복'),
+('覆', '복'),
+('覆', '부'),
+('覇', 'Alternative form of 霸 (“Hanja form of 패 (“domination”).”)'),
+('覇', '霸의 俗字'),
+('覇', '으뜸'),
+('覇', '패'),
+('覈', ' 겨무거리 핵'),
+('覈', ' 씨 핵'),
+('覈', ' 액색할 핵'),
+('覈', 'haek'),
+('覈', 'hayk'),
+('覈', '핵'),
+('覈', '핵실할 핵'),
+('覉', ' 말 굴레 기'),
+('覉', 'gi'),
+('覉', 'ki'),
+('覉', '구속할 기'),
+('覉', '기'),
+('見', ' 당할 견'),
+('見', ' 드러날 현'),
+('見', ' 만날 견'),
+('見', ' 보일 현'),
+('見', ' 있을 현'),
+('見', 'Hanja form of 견 (“to see; to view”).'),
+('見', 'Hanja form of 견 (“view; perspective; opinion”).'),
+('見', 'Hanja form of 현 (“to humbly see”).'),
+('見', 'Original form of 現.'),
+('見', '견'),
+('見', '나타날 현'),
+('見', '보다'),
+('見', '볼'),
+('見', '볼 견'),
+('見', '뵈올'),
+('見', '뵙다'),
+('見', '현'),
+('覌', 'gwan'),
+('覌', 'kwan'),
+('覌', '관'),
+('覌', '볼 관'),
+('規', 'Hanja form of 법 (“law; rule”).'),
+('規', '규'),
+('規', '그림쇠 규'),
+('規', '법'),
+('覓', 'myek'),
+('覓', 'myeok'),
+('覓', 'myŏk'),
+('覓', '멱'),
+('覓', '찾을 멱'),
+('視', ' 견줄 시'),
+('視', ' 대접 시'),
+('視', ' 본받을 시'),
+('視', 'Hanja form of 시 (“see”).'),
+('視', '보다'),
+('視', '볼'),
+('視', '볼 시'),
+('視', '시'),
+('覗', 'sa'),
+('覗', '사'),
+('覗', '엿볼 사'),
+('覘', 'cem'),
+('覘', 'chŏm'),
+('覘', 'jeom'),
+('覘', '점'),
+('覚', '覺의 略字'),
+('覡', ' 남자무당 격'),
+('覡', 'gyeok'),
+('覡', 'kyek'),
+('覡', 'kyŏk'),
+('覡', '격'),
+('覡', '박수 격'),
+('覧', '볼 람'),
+('覨', 'ak'),
+('覨', '악'),
+('覨', '오래 볼 악 '),
+('覩', '睹와 同字'),
+('覩', '도'),
+('親', ' 몸소 친'),
+('親', ' 사돈 친'),
+('親', ' 일가 친'),
+('親', ' 친할 친'),
+('親', 'Hanja form of 친 (“intimate”).'),
+('親', 'Hanja form of 친 (“relative; parent”).'),
+('親', '사랑할 친'),
+('親', '친'),
+('親', '친하다'),
+('親', '친할'),
+('覬', 'gi'),
+('覬', 'ki'),
+('覬', '기'),
+('覬', '바랄 기'),
+('覯', 'gu'),
+('覯', 'ku'),
+('覯', 'kwu'),
+('覯', '구'),
+('覯', '만나볼 구'),
+('覲', 'geun'),
+('覲', 'kun'),
+('覲', 'kŭn'),
+('覲', '근'),
+('覲', '뵈올 근'),
+('観', '볼 관'),
+('覷', '엿볼 처'),
+('覷', '처'),
+('覺', '각'),
+('覺', '교'),
+('覺', '깨다'),
+('覺', '깨닫다'),
+('覺', '깨달을'),
+('覺', '깨달을 각'),
+('覺', '깰'),
+('覺', '꿈 깰 교'),
+('覽', 'Hanja form of 람 (“look at, inspect”).'),
+('覽', '남'),
+('覽', '람'),
+('覽', '보다'),
+('覽', '볼'),
+('覽', '볼 람'),
+('覿', '보다'),
+('覿', '볼'),
+('覿', '볼 적'),
+('覿', '적'),
+('觀', 'Hanja form of 관 (“Taoist temple”).'),
+('觀', 'Hanja form of 관 (“appearance; looks”).'),
+('觀', 'Hanja form of 관 (“sight; view; perspective”).'),
+('觀', 'Hanja form of 관 (“to see; to observe; to view”).'),
+('觀', '관'),
+('觀', '보다'),
+('觀', '볼'),
+('觀', '볼 관'),
+('角', 'Hanja form of 각 (“horn or angle”).'),
+('角', 'Only used in personal names.'),
+('角', '각'),
+('角', '녹'),
+('角', '록'),
+('角', '뿔'),
+('角', '뿔 각'),
+('角', '사람 이름'),
+('角', '사람이름 녹'),
+('觔', 'geun'),
+('觔', 'kun'),
+('觔', 'kŭn'),
+('觔', '筋과 同字'),
+('觔', '근'),
+('觖', ' 들쳐낼 결'),
+('觖', ' 바랄 결'),
+('觖', 'dissatisfied'),
+('觖', 'to long for'),
+('觖', '결'),
+('觖', '서운할 결'),
+('觚', 'go'),
+('觚', 'ko'),
+('觚', '고'),
+('觚', '술잔 고'),
+('觜', '부리 취'),
+('觜', '털뿔 자'),
+('觝', ' 받을 저'),
+('觝', ' 씨름 저'),
+('觝', 'ce'),
+('觝', 'chŏ'),
+('觝', 'jeo'),
+('觝', '저'),
+('觝', '찌를 저'),
+('解', ' 괘 이름 해'),
+('解', ' 꺠우칠 해'),
+('解', ' 발신할 개'),
+('解', ' 벗을 해'),
+('解', ' 풀 개'),
+('解', ' 풀 해'),
+('解', ' 헤칠 개'),
+('解', 'the value of x'),
+('解', '벗을 개'),
+('解', '쪼갤 해'),
+('解', '해'),
+('觥', 'a horn chalice'),
+('觥', 'goeng'),
+('觥', 'koeng'),
+('觥', 'koyng'),
+('觥', '굉'),
+('觥', '뿔잔 굉'),
+('触', 'ch''ok'),
+('触', 'chok'),
+('触', '觸의 俗字'),
+('触', '촉'),
+('觫', 'sok'),
+('觫', '곱송거릴 속'),
+('觫', '속'),
+('觱', ' 대평수 필'),
+('觱', 'p''il'),
+('觱', 'phil'),
+('觱', 'pil'),
+('觱', '바람이 쌀쌀할 필'),
+('觱', '필'),
+('觳', 'arrowhead'),
+('觳', 'compare, measure'),
+('觳', 'exhaust'),
+('觳', 'horn chalice'),
+('觳', 'horse'),
+('觳', '곡'),
+('觳', '뿔잔 곡'),
+('觴', '상'),
+('觴', '잔 상'),
+('觶', ' 벌술잔 치'),
+('觶', 'a cup, a wine cup [glass], a goblet'),
+('觶', 'ch''i'),
+('觶', 'chi'),
+('觶', '잔 치'),
+('觶', '치'),
+('觸', ' 느낄 촉'),
+('觸', ' 범할 촉'),
+('觸', ' 지날 촉'),
+('觸', 'ch''ok'),
+('觸', 'chok'),
+('觸', '받을 촉'),
+('觸', '촉'),
+('言', ' 우뚝할 언'),
+('言', ' 자기 언'),
+('言', 'Hanja form of 언 (“speech”).'),
+('言', 'Hanja form of 언 (“word”).'),
+('言', 'Hanja form of 은 (“peaceful demeanor”).'),
+('言', '말씀'),
+('言', '말씀 언'),
+('言', '심사 화평할 은'),
+('言', '심사화평할'),
+('言', '언'),
+('言', '은'),
+('訂', ' 의논할 정'),
+('訂', 'ceng'),
+('訂', 'chŏng'),
+('訂', 'jeong'),
+('訂', '바로잡을 정'),
+('訂', '정'),
+('訃', 'bu'),
+('訃', 'pu'),
+('訃', '부'),
+('訃', '부고 부'),
+('訇', 'goeng'),
+('訇', 'koeng'),
+('訇', 'koyng'),
+('訇', '굉'),
+('訇', '큰 소리 굉'),
+('計', 'Hanja form of 계 (“count; calculation”).'),
+('計', 'Hanja form of 계 (“plan”).'),
+('計', 'Hanja form of 계 (“total”).'),
+('計', '계'),
+('計', '꾀 계'),
+('計', '셀'),
+('訉', 'beom'),
+('訉', 'pem'),
+('訉', 'pŏm'),
+('訉', '말 많을 범 '),
+('訉', '범'),
+('訊', ' 꾸짖을 신'),
+('訊', ' 다스릴 신'),
+('訊', ' 알릴 신'),
+('訊', ' 죄 조사할 신'),
+('訊', 'sin'),
+('訊', '물을 신'),
+('訊', '신'),
+('訌', 'hong'),
+('訌', '무너질 홍'),
+('訌', '홍'),
+('討', ' 꾸짖을 토'),
+('討', ' 벨 토'),
+('討', ' 찾을 토'),
+('討', ' 칠 토'),
+('討', 'Hanja form of 토 (“to attack; to destroy”).'),
+('討', 'Hanja form of 토 (“to discuss; to debate”).'),
+('討', 'Hanja form of 토 (“to subjugate; to subdue”).'),
+('討', '다스릴 토'),
+('討', '치다'),
+('討', '칠'),
+('討', '토'),
+('訏', 'big'),
+('訏', 'deceive'),
+('訏', 'exaggerate, boast'),
+('訏', 'u'),
+('訏', 'wu'),
+('訏', '우'),
+('訐', 'al'),
+('訐', '들추어 낼 알'),
+('訐', '알'),
+('訑', 'i'),
+('訑', '이'),
+('訑', '자랑할 이'),
+('訒', 'in'),
+('訒', 'stammer'),
+('訒', '인'),
+('訓', 'Hanja form of 훈 (“teaching”).'),
+('訓', '가르치다'),
+('訓', '가르칠'),
+('訓', '가르칠 훈'),
+('訓', '훈'),
+('訔', '시비할 은 '),
+('訔', '은'),
+('訕', 'abuse'),
+('訕', 'ridicule'),
+('訕', 'san'),
+('訕', 'slander'),
+('訕', 'vilify'),
+('訕', '산'),
+('訕', '헐뜯을 산'),
+('訖', 'heul'),
+('訖', 'hul'),
+('訖', 'hŭl'),
+('訖', '이를 흘'),
+('訖', '흘'),
+('託', ' 부탁할 탁'),
+('託', ' 핑계할 탁'),
+('託', 't''ak'),
+('託', 'tak'),
+('託', 'thak'),
+('託', '맡길 탁'),
+('託', '탁'),
+('記', 'Hanja form of 기 (“to record”).'),
+('記', '기'),
+('記', '기록하다'),
+('記', '기록할'),
+('記', '기록할 기'),
+('訚', '誾과 同字 '),
+('訛', ' 어긋날 와'),
+('訛', 'Hanja form of 와 (“erroneous; mistaken”).'),
+('訛', '거짓말 와'),
+('訛', '그릇되다'),
+('訛', '그릇될'),
+('訛', '와'),
+('訝', ' 의심할 아'),
+('訝', 'a'),
+('訝', '맞아들일 아'),
+('訝', '아'),
+('訟', ' 괘 이름 송'),
+('訟', ' 꾸짖을 송'),
+('訟', ' 시비할 송'),
+('訟', 'song'),
+('訟', '송'),
+('訟', '송사할 송'),
+('訢', '기뻐할 흔'),
+('訢', '흔'),
+('訣', ' 비결 결'),
+('訣', ' 사례할 결'),
+('訣', ' 열결할 결'),
+('訣', 'bid farewell'),
+('訣', 'gyeol'),
+('訣', 'kyel'),
+('訣', 'kyŏl'),
+('訣', 'take leave of'),
+('訣', '결'),
+('訣', '이별할 결'),
+('訥', 'Hanja form of 눌 (“mumble; stammer”).'),
+('訥', '눌'),
+('訥', '말 더듬거릴 눌'),
+('訥', '말 더듬을'),
+('訪', 'Hanja form of 방 (“visit; inquire”).'),
+('訪', '방'),
+('訪', '찾다'),
+('訪', '찾을'),
+('訪', '찾을 방'),
+('設', 'Hanja form of 설 (“establish”).'),
+('設', '베풀'),
+('設', '베풀 설'),
+('設', '베풀다'),
+('設', '설'),
+('許', ' 기약할 허'),
+('許', ' 나아갈 허'),
+('許', ' 여럿이 힘쓰는 소리 허'),
+('許', 'Hanja form of 허 (“approve”).'),
+('許', '이영차 호'),
+('許', '허'),
+('許', '허락하다'),
+('許', '허락할'),
+('許', '허락할 허'),
+('訳', '譯의 略字'),
+('訴', ' 송사할 소'),
+('訴', 'so'),
+('訴', '소'),
+('訴', '하소연할 소'),
+('訶', 'ga'),
+('訶', 'ka'),
+('訶', '가'),
+('訶', '꾸짖을 가'),
+('診', 'chin'),
+('診', 'cin'),
+('診', 'jin'),
+('診', '볼 진'),
+('診', '진'),
+('註', 'chu'),
+('註', 'cwu'),
+('註', 'ju'),
+('註', '주'),
+('註', '주낼 주'),
+('証', 'ceng'),
+('証', 'chŏng'),
+('証', 'jeong'),
+('証', '간할 정'),
+('証', '정'),
+('訾', 'bad-mouth'),
+('訾', 'ca'),
+('訾', 'cha'),
+('訾', 'criticize'),
+('訾', 'defects'),
+('訾', 'ja'),
+('訾', '자'),
+('訾', '헐뜯을 자'),
+('詁', 'go'),
+('詁', 'ko'),
+('詁', '고'),
+('詁', '주석 고'),
+('詆', ' 비방할 저'),
+('詆', ' 알소할 저'),
+('詆', 'ce'),
+('詆', 'chŏ'),
+('詆', 'jeo'),
+('詆', '꾸짖을 저'),
+('詆', '저'),
+('詋', 'chu'),
+('詋', 'cwu'),
+('詋', 'ju'),
+('詋', '呪와 同字'),
+('詋', '주'),
+('詎', ' 모를 거'),
+('詎', 'at least'),
+('詎', 'few'),
+('詎', 'geo'),
+('詎', 'how, what'),
+('詎', 'ke'),
+('詎', 'kŏ'),
+('詎', '거'),
+('詎', '어찌 거'),
+('詐', 'sa'),
+('詐', '사'),
+('詐', '속일 사'),
+('詑', 'i'),
+('詑', '이'),
+('詑', '자랑할 이'),
+('詒', ' 느른할 이'),
+('詒', '속일 태'),
+('詒', '줄 이'),
+('詔', 'cho'),
+('詔', 'co'),
+('詔', 'jo'),
+('詔', '고할 조'),
+('詔', '조'),
+('評', ' 고칠 평'),
+('評', ' 기롱할 평'),
+('評', ' 헤아릴 평'),
+('評', '평'),
+('評', '평론할 평'),
+('詖', ' 간사할 피'),
+('詖', ' 알소할 피'),
+('詖', 'be biased'),
+('詖', 'crafty'),
+('詖', 'p''i'),
+('詖', 'phi'),
+('詖', 'pi'),
+('詖', 'to debate'),
+('詖', 'to flatter'),
+('詖', '말 잘할 피'),
+('詖', '피'),
+('詗', ' 구할 형'),
+('詗', 'hyeng'),
+('詗', 'hyeong'),
+('詗', 'hyŏng'),
+('詗', '염탐할 형'),
+('詗', '형'),
+('詘', 'gul'),
+('詘', 'kul'),
+('詘', 'kwul'),
+('詘', '굴'),
+('詘', '굽을 굴'),
+('詛', 'ce'),
+('詛', 'chŏ'),
+('詛', 'jeo'),
+('詛', '저'),
+('詞', 'Hanja form of 사 (“word”).'),
+('詞', '말'),
+('詞', '말씀 사'),
+('詞', '사'),
+('詠', 'sing, hum, chant'),
+('詠', '영'),
+('詠', '읊을 영'),
+('詡', 'hu'),
+('詡', 'hwu'),
+('詡', '자랑할 후'),
+('詡', '후'),
+('詢', ' 물을 순'),
+('詢', ' 믿을 순'),
+('詢', 'sun'),
+('詢', 'swun'),
+('詢', '꾀할 순'),
+('詢', '순'),
+('詣', ' 나아갈 예'),
+('詣', ' 학문 통달할 예'),
+('詣', 'ye'),
+('詣', 'yey'),
+('詣', '예'),
+('詣', '이를 예'),
+('試', ' 더듬을 시'),
+('試', ' 비교할 시'),
+('試', 'Hanja form of 시 (“experiment”).'),
+('試', 'Hanja form of 시 (“test; trial; examination”).'),
+('試', 'Hanja form of 시 (“to test; to try”).'),
+('試', '시'),
+('試', '시험하다'),
+('試', '시험할'),
+('試', '시험할 시'),
+('詩', ' 받들 시'),
+('詩', ' 풍류가락 시'),
+('詩', 'Hanja form of 시 (“poetry; poem”).'),
+('詩', 'Hanja form of 시 (“verse”).'),
+('詩', '귀글 시'),
+('詩', '시'),
+('詫', ' 신통할 타'),
+('詫', ' 풍칠 타'),
+('詫', 't''a'),
+('詫', 'ta'),
+('詫', 'tha'),
+('詫', '자랑할 타'),
+('詫', '타'),
+('詬', 'gu'),
+('詬', 'ku'),
+('詬', 'kwu'),
+('詬', '구'),
+('詬', '꾸짖을 구'),
+('詭', 'deceive, cheat, defraud'),
+('詭', 'gwe'),
+('詭', 'kwe'),
+('詭', 'kwey'),
+('詭', 'sly'),
+('詭', '궤'),
+('詭', '속일 궤'),
+('詮', ' 갖출 전'),
+('詮', 'cen'),
+('詮', 'chŏn'),
+('詮', 'jeon'),
+('詮', '전'),
+('詮', '평론할 전'),
+('詰', 'hil'),
+('詰', '물을 힐'),
+('詰', '힐'),
+('話', 'Hanja form of 화 (“to speak”).'),
+('話', '말하다'),
+('話', '말할'),
+('話', '말할 화'),
+('話', '화'),
+('該', ' 겸할 해'),
+('該', ' 마땅할 해'),
+('該', ' 모두 해'),
+('該', 'hae'),
+('該', 'hay'),
+('該', '갖출 해'),
+('該', '해'),
+('詳', '거짓 양'),
+('詳', '자세할 상'),
+('詵', 'sen'),
+('詵', 'seon'),
+('詵', 'sŏn'),
+('詵', 'to inquire; to question'),
+('詵', '많을 선'),
+('詵', '선'),
+('詹', 'arrive'),
+('詹', 'ch''ŏm'),
+('詹', 'chem'),
+('詹', 'cheom'),
+('詹', 'verbose'),
+('詹', '이를 첨'),
+('詹', '첨'),
+('詻', 'gak'),
+('詻', 'kak'),
+('詻', 'quarrel'),
+('詻', '각'),
+('詼', 'hoe'),
+('詼', 'hoy'),
+('詼', '조롱할 회'),
+('詼', '회'),
+('詿', 'gwae'),
+('詿', 'kwae'),
+('詿', 'kway'),
+('詿', '괘'),
+('詿', '그르칠 괘'),
+('誂', 'cho'),
+('誂', 'co'),
+('誂', 'jo'),
+('誂', 'tempt'),
+('誂', '꾈 조'),
+('誂', '조'),
+('誄', '뇌사 뢰'),
+('誅', 'chu'),
+('誅', 'cwu'),
+('誅', 'ju'),
+('誅', '벨 주'),
+('誅', '주'),
+('誆', 'gwang'),
+('誆', 'kwang'),
+('誆', '광'),
+('誆', '속일 광'),
+('誇', 'Hanja form of 과 (“boast, brag”).'),
+('誇', '과'),
+('誇', '자랑하다'),
+('誇', '자랑할'),
+('誇', '자랑할 과'),
+('誉', 'ye'),
+('誉', 'yey'),
+('誉', '誉와 同字'),
+('誉', '예'),
+('誌', 'chi'),
+('誌', 'ci'),
+('誌', 'ji'),
+('誌', '기록할 지'),
+('誌', '지'),
+('認', 'Hanja form of 인 (“approval”).'),
+('認', 'Hanja form of 인 (“authorization”).'),
+('認', 'Hanja form of 인 (“know”).'),
+('認', 'Hanja form of 인 (“recognition”).'),
+('認', '알'),
+('認', '알 인'),
+('認', '알다'),
+('認', '인'),
+('誑', 'gwang'),
+('誑', 'kwang'),
+('誑', '광'),
+('誑', '속일 광'),
+('誒', 'sigh'),
+('誒', '탄식할 희'),
+('誒', '희'),
+('誓', 'se'),
+('誓', 'seo'),
+('誓', 'sŏ'),
+('誓', '맹세할 서'),
+('誓', '서'),
+('誕', ' 넓을 탄'),
+('誕', ' 방탕할 탄'),
+('誕', ' 속일 탄'),
+('誕', ' 클 탄'),
+('誕', ' 탄생할 탄'),
+('誕', '기를 탄'),
+('誕', '탄'),
+('誘', ' 가르칠 유'),
+('誘', ' 당길 유'),
+('誘', 'yu'),
+('誘', '꾀일 유'),
+('誘', '유'),
+('誚', 'ch''o'),
+('誚', 'cho'),
+('誚', '꾸짖을 초'),
+('誚', '초'),
+('語', 'Hanja form of 어 (“language of; -ese; -ish”).'),
+('語', '말씀'),
+('語', '말씀 어'),
+('語', '어'),
+('誠', ' 공경할 성'),
+('誠', ' 살필 성'),
+('誠', ' 진실 성'),
+('誠', 'Hanja form of 성 (“sincerity”).'),
+('誠', '미쁠 성'),
+('誠', '성'),
+('誠', '정성'),
+('誡', 'gye'),
+('誡', 'kye'),
+('誡', 'kyey'),
+('誡', '경계할 계'),
+('誡', '계'),
+('誢', 'hyen'),
+('誢', 'hyeon'),
+('誢', 'hyŏn'),
+('誢', '현'),
+('誣', ' 깔볼 무'),
+('誣', 'mu'),
+('誣', '무'),
+('誣', '무고할 무'),
+('誤', 'Hanja form of 오 (“doubt; suspicion”).'),
+('誤', 'Hanja form of 오 (“error; blunder”).'),
+('誤', '그르치다'),
+('誤', '그르칠'),
+('誤', '그릇할 오'),
+('誤', '오'),
+('誥', 'go'),
+('誥', 'inform, notify, admonish, order'),
+('誥', 'ko'),
+('誥', '고'),
+('誥', '고할 고'),
+('誦', ' 말할 송'),
+('誦', ' 원망할 송'),
+('誦', ' 읽을 송'),
+('誦', 'Hanja form of 송 (“to recite; to read aloud”).'),
+('誦', '송'),
+('誦', '외우다'),
+('誦', '외울'),
+('誦', '풍유할 송'),
+('誧', ' 간할 포'),
+('誧', ' 도울 포'),
+('誧', ' 클 포'),
+('誧', 'p''o'),
+('誧', 'pho'),
+('誧', 'po'),
+('誧', '꾀할 포'),
+('誧', '포'),
+('誨', 'hoe'),
+('誨', 'hoy'),
+('誨', '가르칠 회'),
+('誨', '회'),
+('說', ' 쉴 세'),
+('說', 'Alternative form of 悅 (“Hanja form of 열 (“to be happy”).”)'),
+('說', 'Hanja form of 설 (“theory, opinion, view; rumour”).'),
+('說', 'Hanja form of 설 (“theory, opinion, view; rumour”). [noun]'),
+('說', 'Hanja form of 설 (“theory”).'),
+('說', 'Hanja form of 설 (“theory”). [suffix]'),
+('說', 'Hanja form of 설 (“to explain; to speak; to talk”).'),
+('說', 'Hanja form of 설 (“to explain; to speak; to talk”). [affix]'),
+('說', 'Hanja form of 세 (“to persuade”).'),
+('說', 'Hanja form of 세 (“to persuade”). [affix]'),
+('說', 'Hanja form of 열 (“used in personal names”).'),
+('說', '기꺼울 열'),
+('說', '기쁘다'),
+('說', '기쁠'),
+('說', '달래다'),
+('說', '달랠'),
+('說', '달랠 세'),
+('說', '말씀'),
+('說', '말씀 설'),
+('說', '설'),
+('說', '세'),
+('說', '열'),
+('説', '說와 同字'),
+('説', '說의 略字'),
+('説', '説의 略字'),
+('読', '교활할 독'),
+('誰', ' 무엇 수'),
+('誰', '누구 수'),
+('誰', '수'),
+('課', 'Hanja form of 과 (“classwork”).'),
+('課', 'Hanja form of 과 (“course”).'),
+('課', 'Hanja form of 과 (“lesson”).'),
+('課', '과'),
+('課', '과정'),
+('課', '매길 과'),
+('誶', ' 꾸짖을 줄'),
+('誶', '꾸짖을 쇄'),
+('誶', '꾸짖을 수'),
+('誶', '몰아 세울 줄'),
+('誶', '물을 신'),
+('誹', 'bi'),
+('誹', 'pi'),
+('誹', '비'),
+('誹', '헐뜯을 비'),
+('誼', ' 다스릴 의'),
+('誼', '옳을 의'),
+('誼', '의'),
+('誾', 'Hanja form of 은 (“speak gently, gentle, harmonious, peaceful”).'),
+('誾', '은'),
+('誾', '화평할 은'),
+('調', '고를 조'),
+('調', '아침 주'),
+('諂', 'ch''ŏm'),
+('諂', 'chem'),
+('諂', 'cheom'),
+('諂', '아첨할 첨'),
+('諂', '첨'),
+('諄', ' 지극할 순'),
+('諄', '거듭 일러줄 순'),
+('諄', '순'),
+('談', 'Hanja form of 담 (“conversation”).'),
+('談', '담'),
+('談', '말씀'),
+('談', '말씀 담'),
+('諉', ' 버릴 위'),
+('諉', 'wi'),
+('諉', '위'),
+('諉', '핑계할 위'),
+('請', 'Hanja form of 청 (“to ask; to beg; to request”).'),
+('請', '청'),
+('請', '청하다'),
+('請', '청할'),
+('請', '청할 청'),
+('諍', 'cayng'),
+('諍', 'chaeng'),
+('諍', 'jaeng'),
+('諍', '간할 쟁'),
+('諍', '쟁'),
+('諏', ' 물을 추'),
+('諏', 'ch''u'),
+('諏', 'chu'),
+('諏', 'chwu'),
+('諏', '꾀할 추'),
+('諏', '추'),
+('諑', '착'),
+('諑', '헐뜯을 착'),
+('諒', 'Hanja form of 량/양 (“excuse, forgive”).'),
+('諒', 'Hanja form of 량/양 (“guess, presume”).'),
+('諒', '량'),
+('諒', '믿다'),
+('諒', '믿을'),
+('諒', '믿을 량'),
+('諒', '양'),
+('論', 'Hanja form of 론/논 (“argument, discussion”).'),
+('論', '논'),
+('論', '논하다'),
+('論', '논할'),
+('論', '론'),
+('論', '말할 론'),
+('論', '차례 륜'),
+('諗', ' 꾀할 심'),
+('諗', ' 생각할 심'),
+('諗', '고할 심'),
+('諗', '심'),
+('諛', 'yu'),
+('諛', '아첨할 유'),
+('諛', '유'),
+('諜', 'ch''ŏp'),
+('諜', 'cheop'),
+('諜', 'chep'),
+('諜', '염탐할 첩'),
+('諜', '첩'),
+('諝', 'se'),
+('諝', 'seo'),
+('諝', 'sŏ'),
+('諝', '서'),
+('諝', '슬기 서'),
+('諞', 'p''yŏn'),
+('諞', 'phyen'),
+('諞', 'pyeon'),
+('諞', '공교한 말 편'),
+('諞', '편'),
+('諟', ' 다스릴 시'),
+('諟', ' 살필 시'),
+('諟', 'si'),
+('諟', '시'),
+('諟', '이 시'),
+('諠', 'hwen'),
+('諠', 'hwon'),
+('諠', 'hwŏn'),
+('諠', '잊을 훤'),
+('諠', '훤'),
+('諡', ' 시호 시'),
+('諡', 'si'),
+('諡', '시'),
+('諡', '행장 시'),
+('諢', 'joke'),
+('諢', 'jokes'),
+('諢', 'obscene jests'),
+('諢', 'wen'),
+('諢', 'won'),
+('諢', 'wŏn'),
+('諢', '농담 원'),
+('諢', '원'),
+('諤', 'ak'),
+('諤', '악'),
+('諤', '직언할 악'),
+('諦', 'ch''e'),
+('諦', 'che'),
+('諦', 'chey'),
+('諦', '살필 체'),
+('諦', '체'),
+('諧', ' 고를 해'),
+('諧', ' 글 해'),
+('諧', ' 기롱지거리할 해'),
+('諧', 'hae'),
+('諧', 'hay'),
+('諧', '조화할 해'),
+('諧', '해'),
+('諪', 'ceng'),
+('諪', 'chŏng'),
+('諪', 'jeong'),
+('諪', '정'),
+('諫', 'admonish'),
+('諫', 'remonstrate'),
+('諫', '간'),
+('諫', '간할 간'),
+('諭', ' 비유할 유'),
+('諭', 'Hanja form of 유 (“instruct”).'),
+('諭', '고할 유'),
+('諭', '유'),
+('諭', '타이르다'),
+('諭', '타이를'),
+('諮', 'ca'),
+('諮', 'cha'),
+('諮', 'ja'),
+('諮', '물을 자'),
+('諮', '자'),
+('諰', ' 곧은말 시 '),
+('諰', 'si'),
+('諰', '눈 휘둥글할 시'),
+('諰', '시'),
+('諱', 'conceal'),
+('諱', 'regard as taboo'),
+('諱', 'shun'),
+('諱', '꺼릴 휘'),
+('諱', '휘'),
+('諳', '암'),
+('諳', '욀 암'),
+('諴', 'ham'),
+('諴', '함'),
+('諴', '화할 함'),
+('諶', 'sim'),
+('諶', 'to believe'),
+('諶', 'truth'),
+('諶', '심'),
+('諶', '참 심'),
+('諷', ' 외울 풍'),
+('諷', '비유로 간할 풍'),
+('諷', '풍'),
+('諸', '김치'),
+('諸', '모두'),
+('諸', '모든 제'),
+('諸', '저'),
+('諸', '제'),
+('諺', ' 뻐득뻐득할 안'),
+('諺', '상말 언'),
+('諺', '용맹스러울 안'),
+('諼', 'cheat'),
+('諼', 'forget'),
+('諼', 'hwen'),
+('諼', 'hwon'),
+('諼', 'hwŏn'),
+('諼', '속일 훤'),
+('諼', '훤'),
+('諾', 'Hanja form of 락/낙 (“assent, approve”).'),
+('諾', 'Hanja form of 락/낙 (“promise”).'),
+('諾', '낙'),
+('諾', '대답하다'),
+('諾', '대답할'),
+('諾', '대답할 낙'),
+('諾', '대답할 락'),
+('諾', '락'),
+('謀', 'Hanja form of 모 (“plan, scheme”).'),
+('謀', 'Hanja form of 모 (“stratagem”).'),
+('謀', '꾀할'),
+('謀', '꾀할 모'),
+('謀', '모'),
+('謁', ' 뵈올 알'),
+('謁', 'al'),
+('謁', '아뢸 알'),
+('謁', '알'),
+('謂', ' 이를 위'),
+('謂', '고할 위'),
+('謂', '위'),
+('謄', 'to copy'),
+('謄', 'to mimeograph'),
+('謄', 'to transcribe'),
+('謄', '등'),
+('謄', '베끼다'),
+('謄', '베낄'),
+('謄', '베낄 등'),
+('謇', ' 바른말할 건'),
+('謇', 'geon'),
+('謇', 'ken'),
+('謇', 'kŏn'),
+('謇', '건'),
+('謇', '말 더듬거릴 건'),
+('謊', 'Hanja form of 황 (“lie”).'),
+('謊', '잠꼬대하다'),
+('謊', '잠꼬대할'),
+('謊', '황'),
+('謌', 'ga'),
+('謌', 'ka'),
+('謌', '歌와 同字'),
+('謌', '가'),
+('謎', 'Hanja form of 미 (“riddle”).'),
+('謎', '미'),
+('謎', '수수께끼'),
+('謎', '수수께끼 미'),
+('謐', 'mil'),
+('謐', '고요할 밀'),
+('謐', '밀'),
+('謑', 'hye'),
+('謑', 'hyey'),
+('謑', '창피줄 혜'),
+('謑', '혜'),
+('謔', 'hak'),
+('謔', '학'),
+('謔', '희롱할 학'),
+('謖', 'so'),
+('謖', '소'),
+('謗', 'Hanja form of 방 (“slandering”).'),
+('謗', '방'),
+('謗', '헐뜯다'),
+('謗', '헐뜯을'),
+('謗', '헐뜯을 방'),
+('謙', ' 겸손할 겸'),
+('謙', ' 괘 이름 겸'),
+('謙', 'Hanja form of 겸 (“humble, modest”).'),
+('謙', 'Hanja form of 겸 (“refuse, decline”).'),
+('謙', '겸'),
+('謙', '사양하다'),
+('謙', '사양할'),
+('謙', '사양할 겸'),
+('謚', 'ik'),
+('謚', '웃을 익'),
+('謚', '익'),
+('講', ' 강구할 강'),
+('講', ' 강화할 강'),
+('講', ' 익힐 강'),
+('講', 'Hanja form of 강 (“reading or lecture”).'),
+('講', '강'),
+('講', '강론할 강'),
+('講', '외우다'),
+('講', '외울'),
+('謜', ' 기꺼울 원 '),
+('謜', 'wen'),
+('謜', 'won'),
+('謜', 'wŏn'),
+('謜', '원'),
+('謜', '천천히 말할 원'),
+('謝', 'Hanja form of 사 (“apologize”).'),
+('謝', '사'),
+('謝', '사례하다'),
+('謝', '사례할'),
+('謝', '사례할 사'),
+('謠', ' 소문 요'),
+('謠', 'Hanja form of 요 (“a song”).'),
+('謠', '노래'),
+('謠', '노래 요'),
+('謠', '요'),
+('謣', 'u'),
+('謣', 'wu'),
+('謣', '망령되게 말할 우 '),
+('謣', '우'),
+('謦', 'gyeong'),
+('謦', 'kyeng'),
+('謦', 'kyŏng'),
+('謦', '경'),
+('謦', '기침 경'),
+('謨', '꾀 모'),
+('謨', '모'),
+('謫', ' 꾸짖을 적'),
+('謫', 'cek'),
+('謫', 'chŏk'),
+('謫', 'jeok'),
+('謫', '귀양갈 적'),
+('謫', '적'),
+('謬', 'Hanja form of 류/유 (“false; wrong; erroneous”).'),
+('謬', '그릇되다'),
+('謬', '그릇될'),
+('謬', '그릇될 류'),
+('謬', '류'),
+('謬', '유'),
+('謭', 'cen'),
+('謭', 'chŏn'),
+('謭', 'jeon'),
+('謭', '얕을 전'),
+('謭', '전'),
+('謳', 'gu'),
+('謳', 'ku'),
+('謳', 'kwu'),
+('謳', '구'),
+('謳', '읊조릴 구'),
+('謷', ' 거만할 오'),
+('謷', 'arrogant'),
+('謷', 'big'),
+('謷', 'o'),
+('謷', 'slander'),
+('謷', '오'),
+('謷', '중얼거릴 오'),
+('謹', 'Hanja form of 근 (“attentive”).'),
+('謹', 'Hanja form of 근 (“prudent, cautious”).'),
+('謹', '근'),
+('謹', '삼가다'),
+('謹', '삼갈'),
+('謹', '삼갈 근'),
+('謾', '만'),
+('謾', '속일 만'),
+('譁', '시끄러울'),
+('譁', '시끄러울 화'),
+('譁', '시끄럽다'),
+('譁', '화'),
+('譃', 'hu'),
+('譃', 'hwu'),
+('譃', '망녕된 말 후 '),
+('譃', '후'),
+('譈', 'dae'),
+('譈', 'hate'),
+('譈', 'resent'),
+('譈', 'tae'),
+('譈', '대'),
+('證', 'certificate, card'),
+('證', 'chŭng'),
+('證', 'cung'),
+('證', 'jeung'),
+('證', '증'),
+('證', '증거 증'),
+('譌', ' 와전될 와'),
+('譌', ' 요사스런 말 와'),
+('譌', 'wa'),
+('譌', '거짓 와'),
+('譌', '와'),
+('譎', 'hyul'),
+('譎', '속일 휼'),
+('譎', '휼'),
+('譏', 'gi'),
+('譏', 'ki'),
+('譏', '기'),
+('譏', '나무랄 기'),
+('譔', 'sen'),
+('譔', 'seon'),
+('譔', 'sŏn'),
+('譔', '가르칠 선'),
+('譔', '선'),
+('譖', 'ch''am'),
+('譖', 'cham'),
+('譖', '참'),
+('譖', '참소할 참'),
+('識', 'Hanja form of 식 (“knowing”).'),
+('識', 'Hanja form of 지 (“writing; mark”).'),
+('識', '식'),
+('識', '알'),
+('識', '알 식'),
+('識', '알다'),
+('識', '적다'),
+('識', '적을'),
+('識', '지'),
+('識', '표할 지'),
+('譙', 'ch''o'),
+('譙', 'cho'),
+('譙', '꾸짖을 초'),
+('譙', '초'),
+('譚', 'dam'),
+('譚', 'tam'),
+('譚', '담'),
+('譚', '클 담'),
+('譜', 'Hanja form of 보 (“musical score”).'),
+('譜', 'Hanja form of 보 (“register, list, table”).'),
+('譜', '계보 보'),
+('譜', '보'),
+('譜', '족보'),
+('譟', '시끄러울 조'),
+('譟', '조'),
+('警', 'Hanja form of 경 (“alert, alarm”).'),
+('警', 'Hanja form of 경 (“guard, watch”).'),
+('警', '경'),
+('警', '경계하다'),
+('警', '경계할'),
+('警', '경계할 경'),
+('譫', 'sem'),
+('譫', 'seom'),
+('譫', 'sŏm'),
+('譫', '섬'),
+('譫', '헛소리 섬'),
+('譬', 'bi'),
+('譬', 'pi'),
+('譬', '비'),
+('譬', '비유할 비'),
+('譯', ' 번역할 역'),
+('譯', 'yek'),
+('譯', 'yeok'),
+('譯', 'yŏk'),
+('譯', '역'),
+('譯', '통변할 역'),
+('議', ' 꾀할 의'),
+('議', ' 의논할 의'),
+('議', 'Hanja form of 의 (“discuss”).'),
+('議', '말할 의'),
+('議', '의'),
+('議', '의논하다'),
+('議', '의논할'),
+('譱', 'sen'),
+('譱', 'seon'),
+('譱', 'sŏn'),
+('譱', '善의 古字 '),
+('譱', '선'),
+('譴', ' 귀양갈 견'),
+('譴', ' 성낼 견'),
+('譴', 'Hanja form of 견 (“scold; reprimand”).'),
+('譴', '견'),
+('譴', '꾸짖다'),
+('譴', '꾸짖을'),
+('譴', '꾸짖을 견'),
+('護', ' 감쌀 호'),
+('護', 'protection, security'),
+('護', '보호할 호'),
+('護', '호'),
+('譽', ' 이름날 예'),
+('譽', ' 즐길 예'),
+('譽', 'ye'),
+('譽', 'yey'),
+('譽', '예'),
+('譽', '칭찬할 예'),
+('譿', 'hye'),
+('譿', 'hyey'),
+('譿', '슬기로울 혜 '),
+('譿', '혜'),
+('讀', 'Hanja form of 독 (“to read”).'),
+('讀', 'Hanja form of 두 (“short pause in reading, part of a sentence, clause”).'),
+('讀', '구절'),
+('讀', '귀절 두'),
+('讀', '독'),
+('讀', '두'),
+('讀', '읽다'),
+('讀', '읽을'),
+('讀', '읽을 독'),
+('讃', 'Alternative form of 讚.'),
+('讃', '기리다'),
+('讃', '기릴'),
+('讃', '기릴 찬'),
+('讃', '찬'),
+('讉', 'yu'),
+('讉', '성낼 유 '),
+('讉', '유'),
+('變', 'Hanja form of 변 (“change”).'),
+('變', '변'),
+('變', '변하다'),
+('變', '변할'),
+('變', '변할 변'),
+('讌', ' 모여 말할 연'),
+('讌', 'yen'),
+('讌', 'yeon'),
+('讌', 'yŏn'),
+('讌', '연'),
+('讌', '잔치 연'),
+('讎', ' 갚을 수'),
+('讎', ' 대거리할 수'),
+('讎', ' 비교할 수'),
+('讎', ' 원수 수'),
+('讎', 'su'),
+('讎', 'swu'),
+('讎', '수'),
+('讎', '짝 수'),
+('讏', '위'),
+('讏', '잠꼬대'),
+('讐', 'Hanja form of 수 (“enemy”).'),
+('讐', '讎와 同字'),
+('讐', '수'),
+('讐', '원수(怨讐)'),
+('讒', 'Hanja form of 참 (“to slander”).'),
+('讒', '참'),
+('讒', '참소하다'),
+('讒', '참소할'),
+('讒', '참소할 참'),
+('讓', '사양할 양'),
+('讓', '양'),
+('讖', 'ch''am'),
+('讖', 'cham'),
+('讖', '참'),
+('讖', '참서 참'),
+('讙', '시끄러울 환'),
+('讙', '시끄러울 훤'),
+('讚', 'Hanja form of 찬 (“to praise; to laud”).'),
+('讚', 'Hanja form of 찬 (“to praise; to laud”). [verbal root; affix]'),
+('讚', '기리다'),
+('讚', '기릴'),
+('讚', '기릴 찬'),
+('讚', '찬'),
+('讜', '곧은 말 당'),
+('讜', '당'),
+('讞', 'en'),
+('讞', 'eon'),
+('讞', 'ŏn'),
+('讞', '언'),
+('讞', '죄 의논할 언'),
+('讬', '託과 同字'),
+('谞', '諝의 略字'),
+('谷', ' 나라이름 욕'),
+('谷', 'Hanja form of 곡 (“valley”).'),
+('谷', 'Hanja form of 록/녹 (“Only used in 녹려 (谷蠡, nongnyeo, title for Xiongnu officials)”).'),
+('谷', 'Hanja form of 욕 (“Only used in 토욕혼 (吐谷渾, toyokhon, “Tuyuhun: name of an ancient nomadic people in northwestern China”)”).'),
+('谷', '곡'),
+('谷', '골'),
+('谷', '골짜기 곡'),
+('谷', '나라 이름'),
+('谷', '녹'),
+('谷', '록'),
+('谷', '벼슬 이름'),
+('谷', '성씨 욕'),
+('谷', '욕'),
+('谿', 'gye'),
+('谿', 'kye'),
+('谿', 'kyey'),
+('谿', '계'),
+('谿', '시내 계'),
+('豁', 'drain off'),
+('豁', 'hwal'),
+('豁', 'open, wide'),
+('豁', '뚫린 골 활'),
+('豁', '활'),
+('豆', 'Hanja form of 두 (“bean”).'),
+('豆', '두'),
+('豆', '콩'),
+('豆', '콩 두'),
+('豇', 'cowpea'),
+('豇', 'gang'),
+('豇', 'kang'),
+('豇', '강'),
+('豇', '광저기 강'),
+('豈', 'Hanja form of 기 (“how, what”).'),
+('豈', '개'),
+('豈', '기'),
+('豈', '승전악'),
+('豈', '승전악 개'),
+('豈', '어찌'),
+('豈', '어찌 기'),
+('豉', ' 콩자반 시'),
+('豉', 'si'),
+('豉', '메주 시'),
+('豉', '시'),
+('豊', '禮의 古字'),
+('豊', '豐의 略字'),
+('豌', ' 완두 완'),
+('豌', 'wan'),
+('豌', '동부 완'),
+('豌', '완'),
+('豎', ' 내시 수'),
+('豎', ' 더벅머리 수'),
+('豎', 'su'),
+('豎', 'swu'),
+('豎', '세울 수'),
+('豎', '수'),
+('豐', ' 괘 이름 풍'),
+('豐', ' 두터울 풍'),
+('豐', ' 왕콩 풍'),
+('豐', 'p''ung'),
+('豐', 'phung'),
+('豐', 'pung'),
+('豐', 'the 55th hexagram ䷶ (“abundance”)'),
+('豐', '풍'),
+('豐', '풍년 풍'),
+('豕', ' 돝 시'),
+('豕', 'si'),
+('豕', '돼지 시'),
+('豕', '시'),
+('豖', 'ch''uk'),
+('豖', 'chuk'),
+('豖', 'chwuk'),
+('豖', '발 얽은 돼지걸음 축'),
+('豖', '축'),
+('豚', 'Hanja form of 돈 (“pig”).'),
+('豚', '돈'),
+('豚', '돼지'),
+('豚', '돼지 돈'),
+('象', 'Hanja form of 상 (“elephant”).'),
+('象', 'Hanja form of 상 (“shape; figure; appearance”).'),
+('象', '상'),
+('象', '코끼리'),
+('象', '코끼리 상'),
+('豢', '기를 환'),
+('豢', '환'),
+('豣', ' 세 살 된 돼지 견'),
+('豣', '노루 연'),
+('豣', '큰 돼지 견'),
+('豨', 'hui'),
+('豨', 'huy'),
+('豨', 'hŭi'),
+('豨', '멧돼지 희'),
+('豨', '희'),
+('豪', ' 귀인 호'),
+('豪', 'ho'),
+('豪', '호'),
+('豪', '호걸 호'),
+('豫', 'ye'),
+('豫', 'yey'),
+('豫', '미리 예'),
+('豫', '예'),
+('豬', ' 못이름 저'),
+('豬', ' 물이 괼 저'),
+('豬', '돼지 저'),
+('豭', 'a (male) hog'),
+('豭', 'a boar'),
+('豭', 'ga'),
+('豭', 'ka'),
+('豭', '가'),
+('豳', 'a Zhou-dynasty state'),
+('豳', 'bin'),
+('豳', 'pin'),
+('豳', '나라 이름 빈'),
+('豳', '빈'),
+('豸', ' 풀 치'),
+('豸', ' 해치양 치'),
+('豸', 'ch''i'),
+('豸', 'chi'),
+('豸', '발 없는 벌레 치'),
+('豸', '치'),
+('豹', ' 아롱범 표'),
+('豹', 'Hanja form of 표 (“leopard; panther”).'),
+('豹', '표'),
+('豹', '표범'),
+('豹', '표범 표'),
+('豺', ' 늑대 시'),
+('豺', 'Hanja form of 시 (“dhole”).'),
+('豺', '승냥이'),
+('豺', '승냥이 시'),
+('豺', '시'),
+('貂', 'ch''o'),
+('貂', 'cho'),
+('貂', 'marten, sable'),
+('貂', '담비 초'),
+('貂', '초'),
+('貃', 'maek'),
+('貃', 'mayk'),
+('貃', '맥'),
+('貃', '오랑캐 맥 '),
+('貅', 'brave, fierce, courageous'),
+('貅', 'hyu'),
+('貅', '비휴 휴'),
+('貅', '휴'),
+('貇', 'gan'),
+('貇', 'kan'),
+('貇', '간'),
+('貊', 'maek'),
+('貊', 'mayk'),
+('貊', '맥'),
+('貊', '북방 종족 맥'),
+('貌', 'Hanja form of 모 (“appearance”).'),
+('貌', '모'),
+('貌', '모뜰 막'),
+('貌', '모양'),
+('貌', '얼굴 모'),
+('貍', '삵 리'),
+('貒', 'badger'),
+('貒', 'dan'),
+('貒', '단'),
+('貓', 'cat'),
+('貓', '猫와 同字'),
+('貓', '고양이'),
+('貓', '묘'),
+('貔', 'bi'),
+('貔', 'fox, leopard, panther'),
+('貔', 'pi'),
+('貔', '비'),
+('貔', '비휴 비'),
+('貘', 'maek'),
+('貘', 'mayk'),
+('貘', '맥'),
+('貘', '짐승 이름 맥'),
+('貙', 'chu'),
+('貙', 'lynx, bobcat'),
+('貙', '추'),
+('貝', ' 비단 패'),
+('貝', ' 재물 패'),
+('貝', 'Hanja form of 패 (“clam, shellfish”).'),
+('貝', '조개'),
+('貝', '조개 패'),
+('貝', '패'),
+('貞', ' 굳을 정'),
+('貞', 'ceng'),
+('貞', 'chŏng'),
+('貞', 'jeong'),
+('貞', '곧을 정'),
+('貞', '정'),
+('負', 'Hanja form of 부 (“carry, bear”).'),
+('負', 'Hanja form of 부 (“load, burden”).'),
+('負', '부'),
+('負', '지다'),
+('負', '질'),
+('負', '질 부'),
+('財', ' 뇌물 재'),
+('財', ' 보배 재'),
+('財', 'Hanja form of 재 (“wealth, property”).'),
+('財', '재'),
+('財', '재물'),
+('財', '재물 재'),
+('貢', 'Hanja form of 공 (“dedicate, devote”).'),
+('貢', 'Hanja form of 공 (“give, offer, present”).'),
+('貢', '공'),
+('貢', '바치다'),
+('貢', '바칠'),
+('貢', '바칠 공'),
+('貧', 'Hanja form of 빈 (“poverty”).'),
+('貧', '가난하다'),
+('貧', '가난할'),
+('貧', '가난할 빈'),
+('貧', '빈'),
+('貨', 'hwa'),
+('貨', '재화 화'),
+('貨', '화'),
+('販', ' 팔 판'),
+('販', 'p''an'),
+('販', 'pan'),
+('販', 'phan'),
+('販', '장사 판'),
+('販', '판'),
+('貪', ' 욕심낼 탐'),
+('貪', 'Hanja form of 탐 (“covetousness, avarice, greed”).'),
+('貪', 't''am'),
+('貪', 'tam'),
+('貪', 'tham'),
+('貪', '탐'),
+('貪', '탐할 탐'),
+('貫', 'Hanja form of 관 (“thread, string”).'),
+('貫', '관'),
+('貫', '꿰다'),
+('貫', '꿸'),
+('貫', '꿸 관'),
+('責', 'Alternative form of 債 (“Hanja form of 채 (“debt”).”)'),
+('責', 'Hanja form of 책 (“reproach”).'),
+('責', '꾸짖을'),
+('責', '꾸짖을 채'),
+('責', '꾸짖을 책'),
+('責', '빚'),
+('責', '채'),
+('責', '책'),
+('貭', 'Yakja form of 質'),
+('貭', 'chil'),
+('貭', 'cil'),
+('貭', 'jil'),
+('貭', '질'),
+('貯', ' 감출 저'),
+('貯', ' 둘 저'),
+('貯', 'Hanja form of 저 (“to stack up”).'),
+('貯', '쌓다'),
+('貯', '쌓을'),
+('貯', '쌓을 저'),
+('貯', '저'),
+('貰', ' 세 바칠 세'),
+('貰', 'loan'),
+('貰', 'rent; (for) hire'),
+('貰', '빌릴 세'),
+('貰', '세'),
+('貰', '세내다'),
+('貰', '세낼'),
+('貲', 'ca'),
+('貲', 'cha'),
+('貲', 'ja'),
+('貲', '자'),
+('貲', '재물 자'),
+('貳', ' 마음 변할 이'),
+('貳', ' 버금 이'),
+('貳', ' 의심낼 이'),
+('貳', ' 이별할 이'),
+('貳', 'i'),
+('貳', '二의 갖은자'),
+('貳', '이'),
+('貴', 'Hanja form of 귀 (“precious”).'),
+('貴', '귀'),
+('貴', '귀하다'),
+('貴', '귀할'),
+('貴', '높을 귀'),
+('貶', ' 귀양보낼 폄'),
+('貶', ' 꺾을 폄'),
+('貶', ' 덜릴 폄'),
+('貶', 'p''yŏm'),
+('貶', 'phyem'),
+('貶', 'pyeom'),
+('貶', '떨어질 폄'),
+('貶', '폄'),
+('買', '"Goguryeo" language: *me, “river, water”'),
+('買', 'Hanja form of 매 (“buy”).'),
+('買', '매'),
+('買', '사다'),
+('買', '살'),
+('買', '살 매'),
+('貸', 'Hanja form of 특/대 (“borrow”).'),
+('貸', 'Hanja form of 특/대 (“lend”).'),
+('貸', 'Hanja form of 특/대 (“pardon”).'),
+('貸', '대'),
+('貸', '빌리다'),
+('貸', '빌릴'),
+('貸', '빌릴 대'),
+('貸', '빌릴 특'),
+('貸', '특'),
+('貺', 'hwang'),
+('貺', '줄 황'),
+('貺', '황'),
+('費', 'Hanja form of 비 (“spend; cost”).'),
+('費', '비'),
+('費', '쓰다'),
+('費', '쓸'),
+('費', '쓸 비'),
+('貼', 'Hanja form of 첩 (“stick; adhere”).'),
+('貼', '붙을 첩'),
+('貼', '붙이다'),
+('貼', '붙일'),
+('貼', '첩'),
+('貽', ' 줄 이'),
+('貽', '끼칠 이'),
+('貽', '이'),
+('貿', ' 물건 살 무'),
+('貿', 'Hanja form of 무 (“mixed”).'),
+('貿', 'Hanja form of 무 (“rashly”).'),
+('貿', 'Hanja form of 무 (“trade, barter”).'),
+('貿', '무'),
+('貿', '무역할'),
+('貿', '바꿀 무'),
+('賀', 'ha'),
+('賀', '축하할 하'),
+('賀', '하'),
+('賁', '꾸미다'),
+('賁', '꾸밀'),
+('賁', '분'),
+('賁', '비'),
+('賁', '크다'),
+('賁', '클'),
+('賁', '클 분'),
+('賂', 'Hanja form of 뢰/뇌 (“bribe; bribery”).'),
+('賂', '뇌'),
+('賂', '뇌물'),
+('賂', '뇌물 줄 로'),
+('賂', '뇌물 줄 뢰'),
+('賂', '뢰'),
+('賃', 'im'),
+('賃', '임'),
+('賃', '품팔이 임'),
+('賄', 'Hanja form of 회 (“bribe; bribery”).'),
+('賄', 'Hanja form of 회 (“property; belongings”).'),
+('賄', '뇌물 회'),
+('賄', '뇌물(賂物)'),
+('賄', '재물(財物)'),
+('賄', '회'),
+('賆', '변'),
+('資', 'Hanja form of 자 (“wealth, capital, foundation”).'),
+('資', '자'),
+('資', '재물'),
+('資', '재물 자'),
+('賈', '값 가'),
+('賈', '장사 고'),
+('賊', ' 해칠 적'),
+('賊', 'Hanja form of 적 (“thief”).'),
+('賊', '도둑'),
+('賊', '도적 적'),
+('賊', '적'),
+('賏', 'yeng'),
+('賏', 'yeong'),
+('賏', 'yŏng'),
+('賏', '영'),
+('賑', 'chin'),
+('賑', 'cin'),
+('賑', 'jin'),
+('賑', '구휼할 진'),
+('賑', '진'),
+('賓', 'Hanja form of 빈 (“guest”).'),
+('賓', '빈'),
+('賓', '손'),
+('賓', '손 빈'),
+('賔', 'bin'),
+('賔', 'pin'),
+('賔', '빈'),
+('賔', '손 빈'),
+('賙', 'chu'),
+('賙', 'cwu'),
+('賙', 'ju'),
+('賙', '주'),
+('賙', '진휼할 주'),
+('賚', '줄 뢰'),
+('賛', '도울 찬'),
+('賜', 'sa'),
+('賜', '사'),
+('賜', '줄 사'),
+('賞', 'Hanja form of 상 (“prize”).'),
+('賞', '상'),
+('賞', '상주다'),
+('賞', '상줄'),
+('賞', '상줄 상'),
+('賠', 'bae'),
+('賠', 'pae'),
+('賠', 'pay'),
+('賠', '물어줄 배'),
+('賠', '배'),
+('賡', ' 일 갱'),
+('賡', 'gaeng'),
+('賡', 'kaeng'),
+('賡', 'kayng'),
+('賡', '갱'),
+('賡', '이을 갱'),
+('賢', ' 구멍 현'),
+('賢', ' 좋을 현'),
+('賢', 'virtuous'),
+('賢', '어질 현'),
+('賢', '현'),
+('賣', 'Hanja form of 매 (“to sell”).'),
+('賣', '매'),
+('賣', '팔'),
+('賣', '팔 매'),
+('賣', '팔다'),
+('賤', '천'),
+('賤', '천할 천'),
+('賦', 'Hanja form of 부 (“give, endow, bestow”).'),
+('賦', 'Hanja form of 부 (“tax”).'),
+('賦', '구실 부'),
+('賦', '부'),
+('賦', '부세'),
+('質', 'Alternative form of 贄 (“Hanja form of 지 (“gift”).”)'),
+('質', 'Hanja form of 질 (“hostage”).'),
+('質', 'Hanja form of 질 (“matter”).'),
+('質', 'Hanja form of 질 (“nature; disposition”).'),
+('質', 'Hanja form of 질 (“quality”).'),
+('質', '贄와 同字'),
+('質', '바탕'),
+('質', '바탕 질'),
+('質', '볼모'),
+('質', '지'),
+('質', '질'),
+('質', '폐백(幣帛)'),
+('賬', 'cang'),
+('賬', 'chang'),
+('賬', 'jang'),
+('賬', '장'),
+('賬', '치부책 장'),
+('賭', 'do'),
+('賭', 'to'),
+('賭', '노름 도'),
+('賭', '도'),
+('賴', 'Hanja form of 뢰/뇌 (“accuse falsely”).'),
+('賴', 'Hanja form of 뢰/뇌 (“rely, depend on”).'),
+('賴', '뇌'),
+('賴', '뢰'),
+('賴', '힘 입을'),
+('賴', '힘 입을 뢰'),
+('賵', 'help to make funeral arrangements with property'),
+('賵', '봉'),
+('賵', '부의하다'),
+('賵', '부의할'),
+('賻', 'bu'),
+('賻', 'pu'),
+('賻', '부'),
+('賻', '부의 부'),
+('購', '구'),
+('購', '살(구입할) 구'),
+('賽', '굿하다'),
+('賽', '굿할'),
+('賽', '굿할 새'),
+('賽', '새'),
+('賾', 'saek'),
+('賾', 'sayk'),
+('賾', '깊숙할 색'),
+('賾', '색'),
+('贄', 'chi'),
+('贄', 'ci'),
+('贄', 'ji'),
+('贄', '지'),
+('贄', '폐백 지'),
+('贅', ' 군더더기 췌'),
+('贅', ' 데릴사위 췌'),
+('贅', ' 혹 췌'),
+('贅', '붙일 췌'),
+('贅', '췌'),
+('贇', 'yun'),
+('贇', '윤'),
+('贈', 'chŭng'),
+('贈', 'cung'),
+('贈', 'jeung'),
+('贈', '보낼 증'),
+('贈', '증'),
+('贊', '도울 찬'),
+('贊', '찬'),
+('贋', 'an'),
+('贋', '가짜 안'),
+('贋', '안'),
+('贍', 'sem'),
+('贍', 'seom'),
+('贍', 'sŏm'),
+('贍', '넉넉할 섬'),
+('贍', '섬'),
+('贏', ' 멜 영'),
+('贏', ' 자랄 영'),
+('贏', 'yeng'),
+('贏', 'yŏng'),
+('贏', '영'),
+('贏', '이문 남길 영'),
+('贐', ' 노수 신'),
+('贐', 'sin'),
+('贐', '노자 신'),
+('贐', '신'),
+('贓', 'Hanja form of 장 (“booty; loot; stolen goods”).'),
+('贓', '장'),
+('贓', '장물 장'),
+('贓', '장물(贓物)'),
+('贔', '비'),
+('贔', '힘쓸 비'),
+('贖', ' 무역할 속'),
+('贖', 'clearing your debt by offering money, wealth or effort, 속바치다'),
+('贖', 'sok'),
+('贖', 'washing away your sin, 속죄하다'),
+('贖', '속'),
+('贖', '속바칠 속'),
+('贛', '감'),
+('贛', '강 이름'),
+('贛', '공'),
+('贛', '미련하다'),
+('贛', '미련할'),
+('贛', '장'),
+('贛', '줄'),
+('贛', '줄 공'),
+('贜', 'cang'),
+('贜', 'chang'),
+('贜', 'jang'),
+('贜', '장'),
+('赒', '賙의 古字'),
+('赤', ' 금치 적'),
+('赤', 'Hanja form of 적 (“red”).'),
+('赤', '붉다'),
+('赤', '붉을'),
+('赤', '붉을 적'),
+('赤', '적'),
+('赦', 'sa'),
+('赦', '사'),
+('赦', '용서할 사'),
+('赧', '난'),
+('赧', '얼굴 붉힐 난'),
+('赫', ' 빛날 혁'),
+('赫', ' 성할 혁'),
+('赫', 'hyek'),
+('赫', 'hyeok'),
+('赫', 'hyŏk'),
+('赫', '불 이글이글할 혁'),
+('赫', '혁'),
+('赭', 'ca'),
+('赭', 'cha'),
+('赭', 'ja'),
+('赭', '붉은흙 자'),
+('赭', '자'),
+('走', 'Hanja form of 주 (“to run”).'),
+('走', '달릴'),
+('走', '달릴 주'),
+('走', '주'),
+('赳', 'gyu'),
+('赳', 'kyu'),
+('赳', '규'),
+('赳', '헌걸찰 규'),
+('赴', 'Hanja form of 부 (“go to, attend, be present”).'),
+('赴', '가다'),
+('赴', '갈'),
+('赴', '나아갈 부'),
+('赴', '다다르다'),
+('赴', '다다를'),
+('赴', '부'),
+('赶', 'gan'),
+('赶', 'kan'),
+('赶', '간'),
+('赶', '달릴 간'),
+('起', 'Hanja form of 기 (“to rise, to wake up”).'),
+('起', '기'),
+('起', '일어나다'),
+('起', '일어날'),
+('起', '일어날 기'),
+('趁', '밟을 전'),
+('趁', '좇을 진'),
+('超', '뛰어넘다'),
+('超', '뛰어넘을'),
+('超', '뛰어넘을 초'),
+('超', '초'),
+('越', ' 뛸 월'),
+('越', ' 월나라 월'),
+('越', 'Hanja form of 월 (“pass over”).'),
+('越', 'Hanja form of 활 (“small hole at the bottom of a se, a traditional Chinese musical instrument”).'),
+('越', '넘다'),
+('越', '넘을'),
+('越', '넘을 월'),
+('越', '부들자리'),
+('越', '부들자리 활'),
+('越', '월'),
+('越', '활'),
+('趎', 'chu'),
+('趎', 'cwu'),
+('趎', 'ju'),
+('趎', '사람이름 주 '),
+('趎', '주'),
+('趐', ' 나아갈 혈 '),
+('趐', 'hyel'),
+('趐', 'hyeol'),
+('趐', 'hyŏl'),
+('趐', '새가 떼로 날 혈'),
+('趐', '혈'),
+('趑', 'ca'),
+('趑', 'cha'),
+('趑', 'ja'),
+('趑', '머뭇거릴 자'),
+('趑', '자'),
+('趙', 'a surname'),
+('趙', 'cho'),
+('趙', 'co'),
+('趙', 'jo'),
+('趙', '조'),
+('趙', '조나라 조'),
+('趠', 'ch''o'),
+('趠', 'cho'),
+('趠', '멀 초 '),
+('趠', '초'),
+('趣', ' 뜻 취'),
+('趣', '추창할 취'),
+('趨', ' 추창할 추'),
+('趨', '달아날 추'),
+('趨', '빠를 촉'),
+('趫', 'brave'),
+('趫', 'gyo'),
+('趫', 'kyo'),
+('趫', 'nimble'),
+('趫', 'robust'),
+('趫', '교'),
+('趲', '놀라 흩어질 찬'),
+('趲', '찬'),
+('足', 'Hanja form of 족 (“foot”).'),
+('足', 'Hanja form of 족 (“foot”). [noun]'),
+('足', 'Hanja form of 족 (“used to form nouns with the meaning "to attain; to satisfy"”).'),
+('足', 'Hanja form of 족 (“used to form nouns with the meaning "to attain; to satisfy"”). [affix]'),
+('足', '발'),
+('足', '발 족'),
+('足', '족'),
+('足', '지날 주'),
+('趵', '차는 소리 박'),
+('趵', '차는 소리 작'),
+('趺', 'bu'),
+('趺', 'pu'),
+('趺', '부'),
+('趺', '책상다리할 부'),
+('趼', 'gyeon'),
+('趼', 'kyen'),
+('趼', 'kyŏn'),
+('趼', '견'),
+('趼', '발 부르틀 견'),
+('趾', 'chi'),
+('趾', 'ci'),
+('趾', 'ji'),
+('趾', '발 지'),
+('趾', '지'),
+('趿', 'sap'),
+('趿', '발가락으로잡을 삽'),
+('趿', '삽'),
+('跂', 'gi'),
+('跂', 'ki'),
+('跂', '기'),
+('跂', '육발 기'),
+('跅', 'lax'),
+('跅', 'reject'),
+('跅', 't''ak'),
+('跅', 'tak'),
+('跅', 'thak'),
+('跅', '탁'),
+('跆', 'to kick'),
+('跆', 'to trample'),
+('跆', '밟을 태'),
+('跆', '태'),
+('跋', '발'),
+('跋', '밟을 발'),
+('跌', 'chil'),
+('跌', 'cil'),
+('跌', 'jil'),
+('跌', '넘어질 질'),
+('跌', '질'),
+('跎', 't''a'),
+('跎', 'ta'),
+('跎', 'tha'),
+('跎', '미끄러질 타'),
+('跎', '타'),
+('跏', 'ga'),
+('跏', 'ka'),
+('跏', '가'),
+('跏', '책상다리할 가'),
+('跑', '포'),
+('跑', '허빌'),
+('跕', '미끄러질 접'),
+('跕', '접'),
+('跖', 'ch''ŏk'),
+('跖', 'chek'),
+('跖', 'cheok'),
+('跖', '발바닥 척'),
+('跖', '척'),
+('跗', 'bu'),
+('跗', 'pu'),
+('跗', 'the instep of the foot'),
+('跗', '발등 부'),
+('跗', '부'),
+('跚', 'san'),
+('跚', '비틀거릴 산'),
+('跚', '산'),
+('跛', '기울어 지게 설 피'),
+('跛', '절뚝발이 파'),
+('距', ' 겨룰 거'),
+('距', ' 뛸 거'),
+('距', ' 미눌 거'),
+('距', ' 지낼 거'),
+('距', '거'),
+('距', '며느리 발톱 거'),
+('跟', 'geun'),
+('跟', 'kun'),
+('跟', 'kŭn'),
+('跟', '근'),
+('跟', '발두꿈치 근'),
+('跡', '자취 적'),
+('跡', '적'),
+('跣', 'sen'),
+('跣', 'seon'),
+('跣', 'sŏn'),
+('跣', '맨발 선'),
+('跣', '선'),
+('跤', 'kyo'),
+('跤', '교'),
+('跤', '발화목 교'),
+('跨', '과'),
+('跨', '타넘을 과'),
+('跪', '궤'),
+('跪', '끓어앉을 궤'),
+('跫', '공'),
+('跫', '발자국 소리 공'),
+('跬', 'few'),
+('跬', 'gyu'),
+('跬', 'half a step'),
+('跬', 'kyu'),
+('跬', 'near'),
+('跬', '규'),
+('跬', '한발자국 규'),
+('路', 'Hanja form of 로/노 (“road, route; avenue, street”).'),
+('路', 'Hanja form of 로/노 (“road, route; avenue, street”). [affix; suffix]'),
+('路', '길'),
+('路', '길 로'),
+('路', '노'),
+('路', '로'),
+('跱', ' 갖출 치'),
+('跱', ' 주저할 치'),
+('跱', 'ch''i'),
+('跱', 'chi'),
+('跱', '머뭇거릴 치'),
+('跱', '치'),
+('跳', 'Hanja form of 도 (“jump”).'),
+('跳', '도'),
+('跳', '뛰다'),
+('跳', '뛸'),
+('跳', '뛸 도'),
+('跳', '뛸 조'),
+('践', '밟을 천'),
+('跼', '구부릴 국'),
+('跼', '국'),
+('跽', '기'),
+('跽', '꿇어앉을 기'),
+('踆', '그칠 준'),
+('踆', '준'),
+('踈', 'so'),
+('踈', '疎의 譌字'),
+('踈', '소'),
+('踉', '뛸 량'),
+('踏', 'Hanja form of 답 (“step on, trample, tread on, walk”).'),
+('踏', '답'),
+('踏', '떨어지는 소리'),
+('踏', '떨어지는 소리 답'),
+('踐', 'ch''ŏn'),
+('踐', 'chen'),
+('踐', 'cheon'),
+('踐', '밟을 천'),
+('踐', '천'),
+('踔', ' 앙감질 탁'),
+('踔', '우뚝 설 탁'),
+('踔', '탁'),
+('踖', 'cek'),
+('踖', 'chŏk'),
+('踖', 'jeok'),
+('踖', '밟다: step, tread'),
+('踖', '적'),
+('踝', '과'),
+('踝', '복사뼈 과'),
+('踞', 'geo'),
+('踞', 'ke'),
+('踞', 'kŏ'),
+('踞', '거'),
+('踞', '걸터앉을 거'),
+('踟', 'chi'),
+('踟', 'ci'),
+('踟', 'ji'),
+('踟', '머뭇거릴 지'),
+('踟', '지'),
+('踠', 'wen'),
+('踠', 'won'),
+('踠', 'wŏn'),
+('踠', '원'),
+('踡', 'gwon'),
+('踡', 'kwŏn'),
+('踡', '구부리다: bend'),
+('踡', '굽다: heel'),
+('踡', '권'),
+('踣', '넘어질 복'),
+('踣', '넘어질 부'),
+('踦', 'gi'),
+('踦', 'ki'),
+('踦', '기'),
+('踦', '발: foot'),
+('踧', 'level, flat'),
+('踧', '척'),
+('踩', 'ch''ae'),
+('踩', 'chae'),
+('踩', 'chay'),
+('踩', '뛸 채'),
+('踩', '채'),
+('踪', 'Hanja form of 종 (“footprints, traces, tracks”).'),
+('踪', '자취'),
+('踪', '자취 종'),
+('踪', '종'),
+('踰', 'yu'),
+('踰', '넘을 유'),
+('踰', '유'),
+('踱', ' 아금막기할 탁'),
+('踱', 't''ak'),
+('踱', 'tak'),
+('踱', 'thak'),
+('踱', '맨발로 걸을 탁'),
+('踱', '탁'),
+('踴', 'yong'),
+('踴', '뛸 용'),
+('踴', '용'),
+('踵', 'Hanja form of 종 (“heel”).'),
+('踵', '발꿈치'),
+('踵', '발꿈치 종'),
+('踵', '종'),
+('踶', 'cey'),
+('踶', 'che'),
+('踶', 'je'),
+('踶', '제'),
+('踶', '찰 제'),
+('踹', 'dan'),
+('踹', 'tan'),
+('踹', '단'),
+('踹', '발꿈치 단'),
+('踽', 'self-reliant'),
+('踽', 'to walk alone'),
+('踽', 'u'),
+('踽', 'wu'),
+('踽', '우'),
+('踽', '타달거릴 우'),
+('蹀', 'cep'),
+('蹀', 'chŏp'),
+('蹀', 'jeop'),
+('蹀', '저벅저벅 걸을 접'),
+('蹀', '접'),
+('蹁', ' 잘름거릴 편'),
+('蹁', 'knee'),
+('蹁', 'totter'),
+('蹁', '돌쳐갈 편'),
+('蹁', '비틀거리다'),
+('蹁', '비틀거릴'),
+('蹁', '편'),
+('蹂', ' 쌀 씻을 유'),
+('蹂', 'yu'),
+('蹂', '밟을 유'),
+('蹂', '유'),
+('蹄', '굽 제'),
+('蹄', '제'),
+('蹇', ' 교만할 건'),
+('蹇', ' 험할 건'),
+('蹇', 'geon'),
+('蹇', 'ken'),
+('蹇', 'kŏn'),
+('蹇', '건'),
+('蹇', '절름거릴 건'),
+('蹈', 'do'),
+('蹈', 'to'),
+('蹈', '도'),
+('蹈', '밟을 도'),
+('蹉', 'ch''a'),
+('蹉', 'cha'),
+('蹉', '넘어질 차'),
+('蹉', '차'),
+('蹊', ' 건널 혜'),
+('蹊', 'hye'),
+('蹊', 'hyey'),
+('蹊', '지름길 혜'),
+('蹊', '혜'),
+('蹋', 'dap'),
+('蹋', 'step on, tread'),
+('蹋', 'tap'),
+('蹋', '답'),
+('蹌', 'ch''ang'),
+('蹌', 'chang'),
+('蹌', '창'),
+('蹌', '추창할 창'),
+('蹏', '蹄와 同字'),
+('蹏', '제'),
+('蹕', '길 치울 필'),
+('蹕', '필'),
+('蹙', ' 쭈그러질 축'),
+('蹙', 'ch''uk'),
+('蹙', 'chuk'),
+('蹙', 'chwuk'),
+('蹙', '찡그릴 축'),
+('蹙', '축'),
+('蹜', '발 끌어 디딜 축'),
+('蹜', '축'),
+('蹟', ' 자취 적'),
+('蹟', '적'),
+('蹟', '행적 적'),
+('蹠', 'ch''ŏk'),
+('蹠', 'chek'),
+('蹠', 'cheok'),
+('蹠', 'sole of the foot'),
+('蹠', 'tread'),
+('蹠', '밟을 척'),
+('蹠', '척'),
+('蹢', 'hesitate'),
+('蹢', 'hoof'),
+('蹢', '척'),
+('蹣', '만'),
+('蹣', '비틀거릴 만'),
+('蹤', 'chong'),
+('蹤', 'cong'),
+('蹤', 'jong'),
+('蹤', '자취 종'),
+('蹤', '종'),
+('蹩', 'byeol'),
+('蹩', 'peyl'),
+('蹩', 'pyŏl'),
+('蹩', '별'),
+('蹩', '절름발이 별'),
+('蹭', 'ch''ŭng'),
+('蹭', 'cheung'),
+('蹭', 'chung'),
+('蹭', '어정거릴 층'),
+('蹭', '층'),
+('蹯', 'an animal''s paws'),
+('蹯', 'beon'),
+('蹯', 'pen'),
+('蹯', 'pŏn'),
+('蹯', '번'),
+('蹯', '짐승 발바닥 번'),
+('蹰', 'chu'),
+('蹰', 'cwu'),
+('蹰', 'ju'),
+('蹰', '머뭇거릴 주'),
+('蹰', '주'),
+('蹲', '걸터앉을 준'),
+('蹲', '준'),
+('蹴', ' 밟을 축'),
+('蹴', 'ch''uk'),
+('蹴', 'chuk'),
+('蹴', 'chwuk'),
+('蹴', '찰 축'),
+('蹴', '축'),
+('蹶', 'Hanja form of 궐 (“to stumble; to fall down”).'),
+('蹶', 'Hanja form of 궤 (“to move”).'),
+('蹶', '궐'),
+('蹶', '궤'),
+('蹶', '급히걸을 궤'),
+('蹶', '넘어지다'),
+('蹶', '넘어질'),
+('蹶', '우물벌레 궐'),
+('蹶', '움직이다'),
+('蹶', '움직일'),
+('蹺', 'gyo'),
+('蹺', 'kyo'),
+('蹺', '교'),
+('蹺', '발돋움할 교'),
+('蹻', 'arrogant'),
+('蹻', 'gyo'),
+('蹻', 'kyo'),
+('蹻', 'stand on tiptoe, stretch oneself'),
+('蹻', '교'),
+('蹼', 'bok'),
+('蹼', 'pok'),
+('蹼', '물갈퀴 복'),
+('蹼', '복'),
+('躁', 'cho'),
+('躁', 'co'),
+('躁', 'jo'),
+('躁', '떠들 조'),
+('躁', '조'),
+('躅', ' 강동강동 뛸 촉'),
+('躅', ' 철쭉꽃 촉'),
+('躅', 'ch''ok'),
+('躅', 'chok'),
+('躅', '자취 촉'),
+('躅', '촉'),
+('躇', '머뭇거릴 저'),
+('躇', '머뭇거릴 착'),
+('躉', 'don'),
+('躉', 'ton'),
+('躉', '거룻배 돈'),
+('躉', '돈'),
+('躊', 'chu'),
+('躊', 'cwu'),
+('躊', 'ju'),
+('躊', '머뭇거릴 주'),
+('躊', '주'),
+('躋', '오를 제'),
+('躋', '제'),
+('躍', 'Hanja form of 약 (“leap”).'),
+('躍', '뛰다'),
+('躍', '뛸'),
+('躍', '뛸 약'),
+('躍', '뛸 적'),
+('躍', '약'),
+('躐', '밟을 렵'),
+('躑', 'ch''ŏk'),
+('躑', 'chek'),
+('躑', 'cheok'),
+('躑', '머뭇거릴 척'),
+('躑', '척'),
+('躒', '움직일 력'),
+('躓', 'chi'),
+('躓', 'ci'),
+('躓', 'ji'),
+('躓', '넘어질 지'),
+('躓', '지'),
+('躔', ' 별자리 전'),
+('躔', 'cen'),
+('躔', 'chŏn'),
+('躔', 'jeon'),
+('躔', '전'),
+('躔', '햇길 전'),
+('躙', '짓밟을 린'),
+('躚', '선'),
+('躚', '춤추다'),
+('躚', '춤출'),
+('躚', '춤출 선'),
+('躞', ' 저벅저벅 걸을 섭'),
+('躞', 'seop'),
+('躞', 'sep'),
+('躞', 'sŏp'),
+('躞', '섭'),
+('躞', '족자 마구리 섭'),
+('躡', ' 신 신을 섭'),
+('躡', ' 오를 섭'),
+('躡', 'seop'),
+('躡', 'sep'),
+('躡', 'sŏp'),
+('躡', '밟을 섭'),
+('躡', '섭'),
+('躧', 'sa'),
+('躧', 'sandals'),
+('躧', 'straw sandals'),
+('躧', 'tread'),
+('躧', '사'),
+('躩', 'gwak'),
+('躩', 'jump'),
+('躩', 'kwak'),
+('躩', 'scuttle'),
+('躩', 'sky'),
+('躩', '곽'),
+('躩', '바삐 갈 곽'),
+('躪', 'Hanja form of 린 (“to trample”).'),
+('躪', '린'),
+('躪', '인'),
+('躪', '짓밟다'),
+('躪', '짓밟을'),
+('躪', '짓밟을 린'),
+('身', ' 몸소 신'),
+('身', ' 아이 밸 신'),
+('身', 'Hanja form of 신 (“body”).'),
+('身', '몸'),
+('身', '몸 신'),
+('身', '신'),
+('躬', 'body'),
+('躬', 'gung'),
+('躬', 'kung'),
+('躬', 'kwung'),
+('躬', 'personally, in person'),
+('躬', '궁'),
+('躬', '몸 궁'),
+('躱', 't''a'),
+('躱', 'ta'),
+('躱', 'tha'),
+('躱', '타'),
+('躱', '피할 타'),
+('躳', 'gung'),
+('躳', 'kung'),
+('躳', 'kwung'),
+('躳', '躬의 本字'),
+('躳', '궁'),
+('軀', 'Hanja form of 구 (“body”).'),
+('軀', '구'),
+('軀', '몸'),
+('軀', '몸 구'),
+('軆', 'ch''e'),
+('軆', 'che'),
+('軆', 'chey'),
+('軆', '몸 체'),
+('軆', '체'),
+('車', ' 그물 거'),
+('車', ' 잇몸 거'),
+('車', 'Hanja form of 거 (“cart; wheeled machinery”).'),
+('車', 'Hanja form of 차 (“car; automobile; vehicle”).'),
+('車', 'Hanja form of 차 (“cart; wheeled machinery”).'),
+('車', '거'),
+('車', '수레'),
+('車', '수레 거'),
+('車', '수레 차'),
+('車', '차'),
+('軋', 'al'),
+('軋', '수레 삐걱거릴 알'),
+('軋', '알'),
+('軌', 'Hanja form of 궤 (“track, rut, path”).'),
+('軌', '궤'),
+('軌', '수레바퀴 사이'),
+('軌', '수레바퀴 사이 궤'),
+('軍', 'Hanja form of 군 (“army; soldier”).'),
+('軍', '군'),
+('軍', '군사'),
+('軍', '군사 군'),
+('軏', 'a crossbar in carriage hitched to two parallel bars for guiding direction'),
+('軏', '월'),
+('軒', ' 고기 굵게 저밀 헌'),
+('軒', ' 껄껄 웃을 헌'),
+('軒', ' 주적댈 헌'),
+('軒', ' 추녀끝 헌'),
+('軒', 'Hanja form of 헌 (“eaves”).'),
+('軒', 'Hanja form of 헌 (“to slice meat in large portions”).'),
+('軒', 'Hanja form of 헌 (“type of carriage in ancient China”).'),
+('軒', '고기 저밀'),
+('軒', '초헌 헌'),
+('軒', '추녀'),
+('軒', '헌'),
+('軔', 'a piece of wood serving as a brake to halt a carriage'),
+('軔', 'in'),
+('軔', '인'),
+('軟', 'yen'),
+('軟', 'yeon'),
+('軟', 'yŏn'),
+('軟', '부드러울 연'),
+('軟', '연'),
+('転', '轉과 同字'),
+('軨', '사냥 수레 령'),
+('軫', '수레 뒤턱 나무 진'),
+('軫', '진'),
+('軸', ' 속바퀴 축'),
+('軸', ' 얇을 축'),
+('軸', ' 질책 축'),
+('軸', '바디집 축'),
+('軸', '축'),
+('軹', 'chi'),
+('軹', 'ci'),
+('軹', 'ji'),
+('軹', '굴대 머리 지'),
+('軹', '지'),
+('軺', 'ch''o'),
+('軺', 'cho'),
+('軺', 'small light carriage'),
+('軺', '수레 초'),
+('軺', '초'),
+('軻', 'ga'),
+('軻', 'ka'),
+('軻', '가'),
+('軻', '수레 가기 힘들 가'),
+('軼', 'il'),
+('軼', '앞지를 일'),
+('軼', '일'),
+('軽', '천할 경'),
+('軾', ' 수레 안에서 절할 식'),
+('軾', 'sik'),
+('軾', '수레앞 가로막이 나무 식'),
+('軾', '식'),
+('軿', 'byeong'),
+('軿', 'pyeng'),
+('軿', 'pyŏng'),
+('軿', '輧의 俗字'),
+('軿', '병'),
+('輀', 'a (funeral) bier'),
+('輀', 'an ancient car carrying the coffin'),
+('輀', 'i'),
+('輀', '이'),
+('較', 'Hanja form of 교 (“comparatively, more”).'),
+('較', 'Hanja form of 교 (“compare”).'),
+('較', '각'),
+('較', '견주다'),
+('較', '견줄'),
+('較', '견줄 교'),
+('較', '교'),
+('較', '수레 귀'),
+('較', '수레 귀 각'),
+('輅', ' 맞을 핵'),
+('輅', '수레 로'),
+('輅', '수레앞 가로막이 나무 핵'),
+('輇', ' 잴 전'),
+('輇', 'cen'),
+('輇', 'chŏn'),
+('輇', 'jeon'),
+('輇', '달 전'),
+('輇', '전'),
+('輈', 'chu'),
+('輈', 'cwu'),
+('輈', 'ju'),
+('輈', '끌채 주'),
+('輈', '주'),
+('載', ' 가득할 재'),
+('載', ' 비롯할 재'),
+('載', ' 이길 재'),
+('載', 'cay'),
+('載', 'chae'),
+('載', 'jae'),
+('載', '실을 재'),
+('載', '재'),
+('輒', '문득 첩'),
+('輒', '첩'),
+('輓', 'man'),
+('輓', '끌 만'),
+('輓', '만'),
+('輔', '덧방나무 보'),
+('輔', '보'),
+('輕', 'Hanja form of 경 (“easy, simple”).'),
+('輕', 'Hanja form of 경 (“gentle”).'),
+('輕', 'Hanja form of 경 (“light”).'),
+('輕', '가벼울'),
+('輕', '가벼울 경'),
+('輕', '가볍다'),
+('輕', '경'),
+('輗', 'the crossbar at the end of a carriage pole'),
+('輗', '예'),
+('輛', '수레 량'),
+('輜', ' 휘장 친 수레 치'),
+('輜', 'ch''i'),
+('輜', 'chi'),
+('輜', '짐수레 치'),
+('輜', '치'),
+('輝', 'Hanja form of 휘 (“shine; brightness”).'),
+('輝', '빛나다'),
+('輝', '빛날'),
+('輝', '빛날 휘'),
+('輝', '휘'),
+('輞', '망'),
+('輞', '바퀴테 망'),
+('輟', '그칠 철'),
+('輟', '철'),
+('輦', '련'),
+('輦', '손수레 련'),
+('輦', '연'),
+('輧', 'byeong'),
+('輧', 'pyeng'),
+('輧', 'pyŏng'),
+('輧', '거마 소리 병'),
+('輧', '병'),
+('輨', 'gwan'),
+('輨', 'kwan'),
+('輨', '관'),
+('輨', '줏대 관 '),
+('輩', 'Hanja form of 배 (“class”).'),
+('輩', 'Hanja form of 배 (“generation, lifetime”).'),
+('輩', '무리'),
+('輩', '무리 배'),
+('輩', '배'),
+('輪', 'Hanja form of 륜/윤 (“wheel”).'),
+('輪', '륜'),
+('輪', '바퀴'),
+('輪', '바퀴 륜'),
+('輪', '윤'),
+('輮', 'get bent'),
+('輮', 'rims'),
+('輮', 'trample on'),
+('輮', 'yu'),
+('輮', '유'),
+('輯', 'chip'),
+('輯', 'cip'),
+('輯', 'jip'),
+('輯', '모을 집'),
+('輯', '집'),
+('輰', '상여수레 양 '),
+('輳', '모일 주'),
+('輳', '주'),
+('輶', 'light carriage'),
+('輶', 'yu'),
+('輶', '유'),
+('輸', ' 보낼 수'),
+('輸', ' 쏟을 수'),
+('輸', ' 짐바리 수'),
+('輸', 'Hanja form of 수 (“to transport; to send”).'),
+('輸', '떨어뜨릴 수'),
+('輸', '보내다'),
+('輸', '보낼'),
+('輸', '수'),
+('輹', '복'),
+('輹', '복토 복'),
+('輻', '바퀴살 복'),
+('輻', '바퀴살통 폭'),
+('輻', '복'),
+('輻', '폭'),
+('輾', 'cen'),
+('輾', 'chŏn'),
+('輾', 'jeon'),
+('輾', '돌아 누울 전'),
+('輾', '전'),
+('輿', ' 짐질 여'),
+('輿', 'ye'),
+('輿', 'yeo'),
+('輿', 'yŏ'),
+('輿', '수레바탕 여'),
+('輿', '여'),
+('轀', 'an ancient car'),
+('轀', 'on'),
+('轀', '온'),
+('轀', '온량차 온'),
+('轂', '곡'),
+('轂', '바퀴 곡'),
+('轄', 'linchpin'),
+('轄', 'to govern; to control'),
+('轄', '다스리다'),
+('轄', '다스릴'),
+('轄', '다스릴 할'),
+('轄', '할'),
+('轅', ' 멍에 원'),
+('轅', ' 별 이름 원'),
+('轅', 'axle'),
+('轅', 'magistrate''s office'),
+('轅', 'wen'),
+('轅', 'won'),
+('轅', 'wŏn'),
+('轅', '원'),
+('轅', '진문 원'),
+('轆', '도르래 록'),
+('轉', ' 굴릴 전'),
+('轉', ' 변할 전'),
+('轉', 'Hanja form of 전 (“(to) turn; (to) move”).'),
+('轉', '구르다'),
+('轉', '구를'),
+('轉', '구를 전'),
+('轉', '전'),
+('轍', 'ch''ŏl'),
+('轍', 'chel'),
+('轍', 'cheol'),
+('轍', '바퀴 자국 철'),
+('轍', '철'),
+('轎', 'gyo'),
+('轎', 'kyo'),
+('轎', 'palanquin'),
+('轎', 'sedan chair'),
+('轎', '가마 교'),
+('轎', '교'),
+('轒', 'bun'),
+('轒', 'pun'),
+('轒', '병거 분'),
+('轒', '분'),
+('轔', '수레 소리 린'),
+('轗', 'geom'),
+('轗', 'kem'),
+('轗', 'kŏm'),
+('轗', '검'),
+('轘', 'hwan'),
+('轘', '환'),
+('轘', '환형 환'),
+('轝', 'ye'),
+('轝', 'yeo'),
+('轝', 'yŏ'),
+('轝', '輿와 同字'),
+('轝', '여'),
+('轞', 'ham'),
+('轞', '함'),
+('轞', '함거 함'),
+('轟', 'Hanja form of 굉 (“roar; thunder; boom”).'),
+('轟', '굉'),
+('轟', '울리다'),
+('轟', '울릴'),
+('轟', '울릴 굉'),
+('轡', '고삐'),
+('轡', '고삐 비'),
+('轡', '비'),
+('轢', 'Hanja form of 력/역 (“to run over with a vehicle”).'),
+('轢', '력'),
+('轢', '삐걱거릴 력'),
+('轢', '역'),
+('轢', '치다'),
+('轢', '칠'),
+('轣', '갈 력 '),
+('轤', '고패 로'),
+('辛', ' 고생 신'),
+('辛', ' 여덟째 천간 신'),
+('辛', '8th heavenly stem'),
+('辛', 'bitter'),
+('辛', 'toilsome, laborious'),
+('辛', '매울'),
+('辛', '매울 신'),
+('辛', '맵다'),
+('辛', '신'),
+('辜', 'Hanja form of 고 (“crime; wrong; sin”).'),
+('辜', '고'),
+('辜', '허물'),
+('辜', '허물 고'),
+('辞', '辭의 俗字'),
+('辟', '임금 벽'),
+('辟', '피할 피'),
+('辢', '辣과 同字'),
+('辣', '날'),
+('辣', '랄'),
+('辣', '매울'),
+('辣', '매울 랄'),
+('辣', '맵다'),
+('辦', ' 갖출 판'),
+('辦', 'deal with'),
+('辦', 'do'),
+('辦', 'handle'),
+('辦', 'manage'),
+('辦', '변'),
+('辦', '판'),
+('辦', '힘들일'),
+('辦', '힘들일 판'),
+('辨', 'Hanja form of 변 (“distinguish, differentiate, discern”).'),
+('辨', 'Hanja form of 판 (“prepare, equip”).'),
+('辨', 'Hanja form of 편 (“without exception”).'),
+('辨', '갖추다'),
+('辨', '갖출'),
+('辨', '두루'),
+('辨', '변'),
+('辨', '분별하다'),
+('辨', '분별할'),
+('辨', '분별할 변'),
+('辨', '판'),
+('辨', '편'),
+('辭', '말 사'),
+('辭', '말씀'),
+('辭', '사'),
+('辮', '변'),
+('辯', 'Hanja form of 변 (“debate; discuss”).'),
+('辯', '말씀'),
+('辯', '말잘할 변'),
+('辯', '변'),
+('辰', 'Hanja form of 신 (“time”).'),
+('辰', 'Hanja form of 진 (“name of a star”).'),
+('辰', 'Hanja form of 진 (“the Dragon, the fifth of the twelve Earthly Branches”).'),
+('辰', '날 신'),
+('辰', '다섯째 지지'),
+('辰', '다섯째지지 진'),
+('辰', '때'),
+('辰', '별'),
+('辰', '신'),
+('辰', '진'),
+('辱', ' 굽힐 욕'),
+('辱', 'yok'),
+('辱', '욕'),
+('辱', '욕될 욕'),
+('農', 'Hanja form of 농 (“agriculture”).'),
+('農', '농'),
+('農', '농사'),
+('農', '농사 농'),
+('辵', 'ch''ak'),
+('辵', 'chak'),
+('辵', '착'),
+('辷', '미끄러지다'),
+('辷', '미끄러질'),
+('辷', '일'),
+('辺', '邊의 俗字'),
+('辻', 'a surname from Japanese'),
+('辻', '네거리'),
+('辻', '네거리 십'),
+('辻', '십'),
+('辻', '즙'),
+('込', '담다'),
+('込', '담을'),
+('込', '담을 입'),
+('込', '입'),
+('辿', 'ch''ŏn'),
+('辿', 'chen'),
+('辿', 'cheon'),
+('辿', '천'),
+('辿', '천천히 걸을 천'),
+('迀', ' 권할 간 '),
+('迀', 'gan'),
+('迀', 'kan'),
+('迀', '간'),
+('迀', '구할 간'),
+('迂', ' 멀 우'),
+('迂', ' 피할 오'),
+('迂', ' 피할 우'),
+('迂', '굽을 오'),
+('迂', '굽을 우'),
+('迃', 'o'),
+('迃', '오'),
+('迄', 'heul'),
+('迄', 'hul'),
+('迄', 'hŭl'),
+('迄', '이를 흘'),
+('迄', '흘'),
+('迅', ' 억셀 신'),
+('迅', 'quick, hasty, rapid, sudden'),
+('迅', 'sin'),
+('迅', '빠를 신'),
+('迅', '신'),
+('迋', ' 두려울 왕'),
+('迋', 'wang'),
+('迋', '갈 왕'),
+('迋', '왕'),
+('迍', 'dun'),
+('迍', 'tun'),
+('迍', 'twun'),
+('迍', '둔'),
+('迍', '머뭇거릴 둔'),
+('迎', 'Hanja form of 영 (“to meet; to greet; welcome”).'),
+('迎', '맞을'),
+('迎', '맞을 영'),
+('迎', '영'),
+('近', 'Hanja form of 근 (“near; close”).'),
+('近', '가까울'),
+('近', '가까울 근'),
+('近', '근'),
+('迓', 'a'),
+('迓', 'meet face to face'),
+('迓', 'welcome'),
+('迓', '마중할 아'),
+('迓', '아'),
+('返', 'Hanja form of 반 (“return, revert to, restore”).'),
+('返', '돌이키다'),
+('返', '돌이킬'),
+('返', '돌이킬 반'),
+('返', '반'),
+('迕', ' 어길 오'),
+('迕', 'o'),
+('迕', '만날 오'),
+('迕', '오'),
+('迢', '멀 초'),
+('迢', '초'),
+('迤', '든든할 이'),
+('迤', '어정거릴 타'),
+('迥', ' 차단할 형'),
+('迥', 'hyeng'),
+('迥', 'hyeong'),
+('迥', 'hyŏng'),
+('迥', '막을 형'),
+('迥', '형'),
+('迦', 'ga'),
+('迦', 'ka'),
+('迦', '가'),
+('迦', '부처이름 가'),
+('迨', 'arrive'),
+('迨', 'reach'),
+('迨', 't''ae'),
+('迨', 'tae'),
+('迨', 'thay'),
+('迨', '미칠 태'),
+('迨', '태'),
+('迩', 'i'),
+('迩', '邇의 俗字'),
+('迩', '이'),
+('迪', ' 순할 적'),
+('迪', ' 열어줄 적'),
+('迪', '나아갈 적'),
+('迪', '적'),
+('迫', 'Hanja form of 박 (“coerce, force, compel”).'),
+('迫', 'Hanja form of 박 (“urgent”).'),
+('迫', '닥칠 박'),
+('迫', '박'),
+('迫', '핍박하다'),
+('迫', '핍박할'),
+('迬', 'wang'),
+('迬', '往과 同字'),
+('迬', '왕'),
+('迭', 'chil'),
+('迭', 'cil'),
+('迭', 'jil'),
+('迭', '갈마들 질'),
+('迭', '질'),
+('迮', 'ch''aek'),
+('迮', 'chaek'),
+('迮', '닥치다: approach'),
+('迮', '책'),
+('述', ' 밝힐 술'),
+('述', ' 조회할 술'),
+('述', ' 좇을 술'),
+('述', '술'),
+('述', '이을 술'),
+('述', '펴다'),
+('述', '펼'),
+('迲', 'geop'),
+('迲', 'kep'),
+('迲', 'kŏp'),
+('迲', '迲里 (징리) ― Jingri ― an administrative division of Guji-myeon, Dalseong County, South Korea'),
+('迲', '겁'),
+('迴', 'hoe'),
+('迴', 'hoy'),
+('迴', '回와 同字'),
+('迴', '회'),
+('迷', ' 전념할 미'),
+('迷', 'Hanja form of 미 (“confusion”).'),
+('迷', 'Hanja form of 미 (“to get lost”).'),
+('迷', '미'),
+('迷', '미혹하다'),
+('迷', '미혹할'),
+('迷', '미혹할 미'),
+('迸', 'byeong'),
+('迸', 'pyeng'),
+('迸', 'pyŏng'),
+('迸', '달아날 병'),
+('迸', '병'),
+('迹', ' 뒤따를 적'),
+('迹', ' 자취 적'),
+('迹', 'cek'),
+('迹', 'chŏk'),
+('迹', 'jeok'),
+('迹', '발자국 적'),
+('迹', '적'),
+('迺', 'nae'),
+('迺', 'nay'),
+('迺', '내'),
+('迺', '이에 내'),
+('追', ' 따를 추'),
+('追', ' 쇠북 꼭지 퇴'),
+('追', 'Hanja form of 추 (“to chase; to follow”).'),
+('追', 'Hanja form of 퇴 (“to carve”).'),
+('追', '갈'),
+('追', '갈다#Etymology_3'),
+('追', '옥 다듬을 퇴'),
+('追', '쫓다'),
+('追', '쫓을'),
+('追', '쫓을 추'),
+('追', '추'),
+('追', '퇴'),
+('退', ' 겸양할 퇴'),
+('退', ' 물리칠 퇴'),
+('退', 't''oe'),
+('退', 'thoy'),
+('退', 'toe'),
+('退', '물러갈 퇴'),
+('退', '퇴'),
+('送', ' 가질 송'),
+('送', ' 줄 송'),
+('送', ' 활쏘기 능통할 송'),
+('送', 'Hanja form of 송 (“to send”).'),
+('送', '보내다'),
+('送', '보낼'),
+('送', '보낼 송'),
+('送', '송'),
+('适', 'gwal'),
+('适', 'kwal'),
+('适', '괄'),
+('适', '빠를 괄'),
+('逃', 'Hanja form of 도 (“abscond, dodge”).'),
+('逃', 'Hanja form of 도 (“escape, flee”).'),
+('逃', '달아나다'),
+('逃', '달아날'),
+('逃', '달아날 도'),
+('逃', '도'),
+('逅', 'hu'),
+('逅', 'hwu'),
+('逅', '만날 후'),
+('逅', '후'),
+('逆', 'Hanja form of 역 (“reverse; contrary; opposite”).'),
+('逆', '거스르다'),
+('逆', '거스를'),
+('逆', '거스를 역'),
+('逆', '역'),
+('逇', 'chi'),
+('逇', 'ci'),
+('逇', 'ji'),
+('逇', '구덩이 지 '),
+('逇', '지'),
+('逈', ' 빛날 형'),
+('逈', 'hyeng'),
+('逈', 'hyeong'),
+('逈', 'hyŏng'),
+('逈', '멀 형'),
+('逈', '형'),
+('逋', ' 포흠할 포'),
+('逋', 'p''o'),
+('逋', 'pho'),
+('逋', 'po'),
+('逋', '달아날 포'),
+('逋', '포'),
+('逌', 'yu'),
+('逌', '빙그레할 유'),
+('逌', '유'),
+('逍', ' 거닐 소'),
+('逍', 'Hanja form of 소 (“wander”).'),
+('逍', '거닐'),
+('逍', '거닐다'),
+('逍', '노닐 소'),
+('逍', '소'),
+('透', ' 사무칠 투'),
+('透', ' 지나칠 투'),
+('透', 'Hanja form of 투 (“permeable; pass through”).'),
+('透', 'Hanja form of 투 (“transparent”).'),
+('透', '사무치다'),
+('透', '사무칠'),
+('透', '통할 투'),
+('透', '투'),
+('逐', ' 물리칠 축'),
+('逐', '달리는 모양 적'),
+('逐', '쫓을 축'),
+('逑', 'collect, unite'),
+('逑', 'gu'),
+('逑', 'ku'),
+('逑', 'kwu'),
+('逑', 'match, pair'),
+('逑', '구'),
+('逑', '짝 구'),
+('途', 'Hanja form of 도 (“way”).'),
+('途', '길'),
+('途', '길 도'),
+('途', '도'),
+('逕', 'gyeong'),
+('逕', 'kyeng'),
+('逕', 'kyŏng'),
+('逕', '경'),
+('逕', '소로 경'),
+('逖', '멀 적'),
+('逖', '적'),
+('逗', 'du'),
+('逗', 'tu'),
+('逗', 'twu'),
+('逗', '두'),
+('逗', '머무를 두'),
+('這', ' 여기 저'),
+('這', ' 이것 저'),
+('這', 'Hanja form of 언 (“to greet”).'),
+('這', 'Hanja form of 언 (“to greet”). [only in Chinese]'),
+('這', 'Hanja form of 저 (“this; that”).'),
+('這', 'Hanja form of 저 (“this; that”). [affix]'),
+('這', '맞을'),
+('這', '맞을 저'),
+('這', '맞이할 언'),
+('這', '언'),
+('這', '이'),
+('這', '저'),
+('通', ' 간음할 통'),
+('通', ' 다닐 통'),
+('通', ' 사귈 통'),
+('通', ' 사무칠 통'),
+('通', ' 형통할 통'),
+('通', 'Hanja form of 통 (“pass through”).'),
+('通', '뚫릴 통'),
+('通', '통'),
+('通', '통할'),
+('逝', 'se'),
+('逝', 'seo'),
+('逝', 'sŏ'),
+('逝', '갈 서'),
+('逝', '서'),
+('逞', '굳셀 령'),
+('速', ' 더러울 속'),
+('速', ' 부를 속'),
+('速', ' 사슴 발자취 속'),
+('速', 'Hanja form of 속 (“fast”).'),
+('速', '빠를'),
+('速', '빠를 속'),
+('速', '속'),
+('造', 'Hanja form of 조 (“physique; structure”).'),
+('造', 'Hanja form of 조 (“to achieve”).'),
+('造', 'Hanja form of 조 (“to create; to make”).'),
+('造', '이루다'),
+('造', '이룰'),
+('造', '조'),
+('造', '지을'),
+('造', '지을 조'),
+('造', '짓다'),
+('逡', '뒷걸음칠 준'),
+('逡', '준'),
+('逢', 'Hanja form of 봉 (“come upon, happen to meet”).'),
+('逢', 'Hanja form of 봉 (“flatter”).'),
+('逢', '만나다'),
+('逢', '만날'),
+('逢', '만날 봉'),
+('逢', '봉'),
+('連', 'Hanja form of 련/연 (“take along; lead; join; connect”).'),
+('連', '련'),
+('連', '연'),
+('連', '잇닿다'),
+('連', '잇닿을'),
+('連', '잇닿을 련'),
+('逥', 'hoe'),
+('逥', 'hoy'),
+('逥', '회'),
+('逬', 'byeong'),
+('逬', 'pyeng'),
+('逬', 'pyŏng'),
+('逬', '병'),
+('逬', '흩어져 달아날: scatter'),
+('逭', 'escape, run away'),
+('逭', '환'),
+('逮', ' 쫓을 태'),
+('逮', '미칠 체'),
+('逮', '미칠 태'),
+('逰', 'yu'),
+('逰', '遊의 俗字'),
+('逰', '유'),
+('週', 'Hanja form of 주 (“week (unit of time)”).'),
+('週', '돌'),
+('週', '돌 주'),
+('週', '주'),
+('進', '나아갈'),
+('進', '나아갈 진'),
+('進', '선사'),
+('進', '신'),
+('進', '진'),
+('逴', ' 뛰어날 탁'),
+('逴', ' 절름거릴 탁'),
+('逴', 'far'),
+('逴', '멀 탁'),
+('逴', '탁'),
+('逵', 'gyu'),
+('逵', 'kyu'),
+('逵', '구거리 규'),
+('逵', '규'),
+('逶', 'swagger'),
+('逶', 'wi'),
+('逶', 'winding, curving'),
+('逶', '비틀거릴 위'),
+('逶', '위'),
+('逸', '달아날 일'),
+('逸', '일'),
+('逺', 'wen'),
+('逺', 'won'),
+('逺', 'wŏn'),
+('逺', '遠과 同字'),
+('逺', '원'),
+('逼', ' 궁핍할 핍'),
+('逼', ' 핍박학 핍'),
+('逼', 'Hanja form of 핍 (“to force; to compel”).'),
+('逼', '가까울 핍'),
+('逼', '핍'),
+('逼', '핍박하다'),
+('逼', '핍박할'),
+('逾', ' 지날 유'),
+('逾', '갈 유'),
+('逾', '유'),
+('遁', '달아날 돈'),
+('遁', '달아날 둔'),
+('遂', ' 나아갈 수'),
+('遂', ' 마침내 수'),
+('遂', ' 이룰 수'),
+('遂', 'su'),
+('遂', 'swu'),
+('遂', '사무칠 수'),
+('遂', '수'),
+('遄', 'ch''ŏn'),
+('遄', 'cheon'),
+('遄', 'quick, fast'),
+('遄', '천'),
+('遅', 'chi'),
+('遅', 'ci'),
+('遅', 'ji'),
+('遅', '더딜 지'),
+('遅', '지'),
+('遇', ' 대접할 우'),
+('遇', ' 뜻밖에 우'),
+('遇', 'Hanja form of 우 (“meet”).'),
+('遇', '만나다'),
+('遇', '만날'),
+('遇', '만날 우'),
+('遇', '우'),
+('遉', ' 염탐할 정'),
+('遉', 'ceng'),
+('遉', 'chŏng'),
+('遉', 'jeong'),
+('遉', '순라군 정'),
+('遉', '정'),
+('遊', ' 벗 사귈 유'),
+('遊', 'yu'),
+('遊', '놀 유'),
+('遊', '유'),
+('運', ' 운수 운'),
+('運', 'Hanja form of 운 (“to move, to shift, to transfer”).'),
+('運', '옮기다'),
+('運', '옮길'),
+('運', '운'),
+('運', '움직일 운'),
+('遍', 'p''yŏn'),
+('遍', 'phyen'),
+('遍', '두루 편'),
+('遍', '편'),
+('過', 'Hanja form of 과 (“last, past, have been, in time, later”).'),
+('過', '과'),
+('過', '기름통 과; an oil cask, an oilcan.'),
+('過', '재앙'),
+('過', '지나다'),
+('過', '지날'),
+('過', '지날 과'),
+('過', '허물 과; an error, a fault, a misstep, a slip, a mistake.'),
+('過', '화'),
+('遏', 'al'),
+('遏', '막을 알'),
+('遏', '알'),
+('遐', 'ha'),
+('遐', '멀 하'),
+('遐', '하'),
+('遑', 'hwang'),
+('遑', '허둥거릴 황'),
+('遑', '황'),
+('遒', '다가설 주'),
+('遒', '주'),
+('道', 'Hanja form of 도 (“principle, reason; moral”).'),
+('道', 'Hanja form of 도 (“principle, reason; moral”). [noun]'),
+('道', 'Hanja form of 도 (“province”).'),
+('道', 'Hanja form of 도 (“province”). [noun]'),
+('道', 'Hanja form of 도 (“road; path”).'),
+('道', 'Hanja form of 도 (“road; path”). [affix]'),
+('道', '길'),
+('道', '길 도'),
+('道', '도'),
+('達', 'Hanja form of 달 (“achieve; to attain”).'),
+('達', 'Hanja form of 달 (“to reach; to arrive at”).'),
+('達', '달'),
+('達', '통달하다'),
+('達', '통달할'),
+('達', '통달할 달'),
+('違', ' 되돌아올 위'),
+('違', ' 미적거릴 위'),
+('違', 'wi'),
+('違', '어길 위'),
+('違', '위'),
+('遘', 'gu'),
+('遘', 'ku'),
+('遘', 'kwu'),
+('遘', '구'),
+('遘', '만날 구'),
+('遙', ' 노닐 요'),
+('遙', 'yo'),
+('遙', '멀 요'),
+('遙', '요'),
+('遛', '머무를 류'),
+('遜', ' 겸손할 손'),
+('遜', ' 도망할 손'),
+('遜', ' 사양할 손'),
+('遜', 'Hanja form of 손 (“modesty”).'),
+('遜', '겸손하다'),
+('遜', '겸손할'),
+('遜', '손'),
+('遜', '순할 손'),
+('遝', '가다가설 답'),
+('遝', '답'),
+('遞', '갈마들'),
+('遞', '갈마들 체'),
+('遞', '갈마들다'),
+('遞', '체'),
+('遟', 'chi'),
+('遟', 'ci'),
+('遟', 'ji'),
+('遟', '더딜 지'),
+('遟', '지'),
+('遠', ' 심오할 원'),
+('遠', 'Hanja form of 원 (“distant; far”).'),
+('遠', '멀'),
+('遠', '멀 원'),
+('遠', '원'),
+('遡', ' 맞이할 소'),
+('遡', ' 하소연할 소'),
+('遡', 'so'),
+('遡', '거스를 소'),
+('遡', '소'),
+('遣', ' 견전제 견'),
+('遣', ' 쫓을 견'),
+('遣', 'Hanja form of 견 (“send, dispatch”).'),
+('遣', '견'),
+('遣', '보내다'),
+('遣', '보낼'),
+('遣', '보낼 견'),
+('遤', '달리다'),
+('遤', '달릴'),
+('遤', '훵'),
+('遤', '휭'),
+('遨', 'o'),
+('遨', '노닐 오'),
+('遨', '오'),
+('適', ' 깨달을 적'),
+('適', ' 시집갈 적'),
+('適', ' 좇을 적'),
+('適', ' 주장할 적'),
+('適', ' 편안할 적'),
+('適', '갈 척'),
+('適', '맞갖을 적'),
+('遬', ' 줄어들 속 '),
+('遬', '공손할 속'),
+('遬', '속'),
+('遭', 'Hanja form of 조 (“meet”).'),
+('遭', '만나다'),
+('遭', '만날'),
+('遭', '만날 조'),
+('遭', '조'),
+('遮', '가리다'),
+('遮', '가릴'),
+('遮', '막을 차'),
+('遮', '이'),
+('遮', '저'),
+('遮', '차'),
+('遯', 'dun'),
+('遯', 'tun'),
+('遯', 'twun'),
+('遯', '달아날 둔'),
+('遯', '둔'),
+('遲', '늦을 지'),
+('遵', 'chun'),
+('遵', 'cwun'),
+('遵', 'jun'),
+('遵', '좇을 준'),
+('遵', '준'),
+('遶', 'yo'),
+('遶', '둘릴 요'),
+('遶', '요'),
+('遷', 'change'),
+('遷', 'move'),
+('遷', '옮기다'),
+('遷', '옮길'),
+('遷', '옮길 천'),
+('遷', '천'),
+('選', 'Hanja form of 선 (“choice”).'),
+('選', 'Hanja form of 선 (“distinguish”).'),
+('選', 'Hanja form of 선 (“elect”).'),
+('選', 'Hanja form of 선 (“selection”).'),
+('選', '가리다'),
+('選', '가릴'),
+('選', '가릴 선'),
+('選', '선'),
+('遹', 'avoid'),
+('遹', 'follow'),
+('遹', 'hyul'),
+('遹', '휼'),
+('遺', ' 끼칠 유'),
+('遺', ' 남을 유'),
+('遺', 'yu'),
+('遺', '유'),
+('遺', '잃어버릴 유'),
+('遼', 'the Liao, a medieval Khitan empire'),
+('遼', '멀 료'),
+('遼', '요'),
+('遽', ' 두려울 거'),
+('遽', ' 역말 수레 거'),
+('遽', 'geo'),
+('遽', 'ke'),
+('遽', 'kŏ'),
+('遽', '거'),
+('遽', '급할 거'),
+('避', ' 싫어할 피'),
+('避', ' 어길 피'),
+('避', '숨을 피'),
+('避', '피'),
+('避', '피하다'),
+('避', '피할'),
+('邀', ' 구할 요'),
+('邀', ' 부를 요'),
+('邀', 'yo'),
+('邀', '맞을 요'),
+('邀', '요'),
+('邁', 'mae'),
+('邁', 'may'),
+('邁', '갈 매'),
+('邁', '매'),
+('邂', 'hae'),
+('邂', 'hay'),
+('邂', '우연히 만날 해'),
+('邂', '해'),
+('邃', 'su'),
+('邃', 'swu'),
+('邃', '깊숙할 수'),
+('邃', '수'),
+('還', '돌 선'),
+('還', '돌아올 환'),
+('邅', 'cen'),
+('邅', 'chŏn'),
+('邅', 'hesitate'),
+('邅', 'jeon'),
+('邅', '머뭇거릴 전'),
+('邅', '전'),
+('邇', 'i'),
+('邇', '가까울 이'),
+('邇', '이'),
+('邈', '막'),
+('邈', '멀 막'),
+('邊', 'Hanja form of 변 (“edge”).'),
+('邊', 'Hanja form of 변 (“side”).'),
+('邊', '가'),
+('邊', '가 변'),
+('邊', '변'),
+('邌', '천천히 걸을 려'),
+('邏', '순행할 라'),
+('邐', '이어질 리'),
+('邑', ' 답답할 읍'),
+('邑', 'Hanja form of 읍 (“Town or eup, an administrative division larger and more populous than a "리" (village) but smaller and less populous than a "군" (county) or "시" (city)”).'),
+('邑', '고을'),
+('邑', '고을 읍'),
+('邑', '읍'),
+('邕', ' 사람이름 옹'),
+('邕', 'ong'),
+('邕', '막힐 옹'),
+('邕', '옹'),
+('邗', '고을 이름 한'),
+('邗', '한'),
+('邙', '망'),
+('邙', '산 이름 망'),
+('邛', 'gong'),
+('邛', 'kong'),
+('邛', '공'),
+('邛', '언덕 공'),
+('邠', 'bin'),
+('邠', 'pin'),
+('邠', '나라 이름 빈'),
+('邠', '빈'),
+('邡', 'bang'),
+('邡', 'pang'),
+('邡', '고을 이름 방 '),
+('邡', '방'),
+('邢', ' 땅 이름 형'),
+('邢', 'hyeng'),
+('邢', 'hyeong'),
+('邢', 'hyŏng'),
+('邢', '나라 이름 형'),
+('邢', '형'),
+('那', 'Hanja form of 나 (“that, those”).'),
+('那', '나'),
+('那', '어찌'),
+('那', '어찌 나'),
+('邦', 'Hanja form of 방 (“country”).'),
+('邦', '나라'),
+('邦', '나라 방'),
+('邦', '방'),
+('邨', '村과 同字'),
+('邨', '촌'),
+('邪', ' 희롱할 야'),
+('邪', '간사할 사'),
+('邪', '의문의 어조사 야'),
+('邯', '고을 이름 한'),
+('邯', '고을 이름 함'),
+('邰', 'name of a country'),
+('邰', 't''ae'),
+('邰', 'tae'),
+('邰', 'thay'),
+('邰', '태'),
+('邰', '태나라 태'),
+('邱', 'gu'),
+('邱', 'ku'),
+('邱', 'kwu'),
+('邱', '구'),
+('邱', '언덕 구'),
+('邳', 'bi'),
+('邳', 'pi'),
+('邳', '비'),
+('邳', '클 비'),
+('邴', 'byeong'),
+('邴', 'pyeng'),
+('邴', 'pyŏng'),
+('邴', '고을 이름 병'),
+('邴', '병'),
+('邵', ' 성씨 소'),
+('邵', '땅이름 소'),
+('邵', '소'),
+('邶', 'p''ae'),
+('邶', 'pae'),
+('邶', 'phay'),
+('邶', '패'),
+('邶', '패나라 패'),
+('邸', ' 병풍 저'),
+('邸', ' 주막 저'),
+('邸', ' 홀바탕 저'),
+('邸', 'ce'),
+('邸', 'chŏ'),
+('邸', 'government office'),
+('邸', 'house'),
+('邸', 'jeo'),
+('邸', '사처 저'),
+('邸', '저'),
+('邽', 'gyu'),
+('邽', 'kyu'),
+('邽', '고을이름 규'),
+('邽', '규'),
+('邾', 'chu'),
+('邾', 'cwu'),
+('邾', 'ju'),
+('邾', '나라이름 주'),
+('邾', '주'),
+('郁', ' 자욱할 욱'),
+('郁', 'rich in aroma'),
+('郁', 'sweet smelling'),
+('郁', 'uk'),
+('郁', 'wuk'),
+('郁', '문채날 욱'),
+('郁', '욱'),
+('郃', '땅이름 합'),
+('郃', '합'),
+('郄', 'geuk'),
+('郄', 'kuk'),
+('郄', 'kŭk'),
+('郄', '隙과 同字'),
+('郄', '극'),
+('郅', 'chil'),
+('郅', 'cil'),
+('郅', 'jil'),
+('郅', '고을 이름 질'),
+('郅', '질'),
+('郊', 'Hanja form of 교 (“outskirts”).'),
+('郊', '교'),
+('郊', '들'),
+('郊', '성 밖 교'),
+('郎', 'Hanja form of 낭 (“man (South Korea)”).'),
+('郎', 'Hanja form of 랑 (“man”).'),
+('郎', '남편 랑'),
+('郎', '낭'),
+('郎', '랑'),
+('郎', '사내'),
+('郜', '고'),
+('郜', '나라이름 고'),
+('郝', '고을 이름 학'),
+('郝', '학'),
+('郞', 'Hanja form of 랑/낭 (“gentleman, man, male”).'),
+('郞', 'Hanja form of 랑/낭 (“knight”).'),
+('郞', '낭'),
+('郞', '랑'),
+('郞', '사나이'),
+('郞', '사나이 랑'),
+('郟', 'gyeop'),
+('郟', 'kyep'),
+('郟', 'kyŏp'),
+('郟', '겹'),
+('郟', '그을 이름 겹'),
+('郡', 'Hanja form of 군 (“county; district”).'),
+('郡', '고을'),
+('郡', '고을 군'),
+('郡', '군'),
+('郢', 'yeng'),
+('郢', 'yeong'),
+('郢', 'yŏng'),
+('郢', '땅이름 영'),
+('郢', '영'),
+('郤', 'geuk'),
+('郤', 'kuk'),
+('郤', 'kŭk'),
+('郤', '극'),
+('郤', '틈 극'),
+('部', 'Hanja form of 부 (“group, team”).'),
+('部', 'Hanja form of 부 (“lead, command”).'),
+('部', '거느리다'),
+('部', '거느릴'),
+('部', '거느릴 부'),
+('部', '떼'),
+('部', '부'),
+('郪', 'ch''ŏ'),
+('郪', 'che'),
+('郪', 'cheo'),
+('郪', '고을 이름 처'),
+('郪', '처'),
+('郫', 'bi'),
+('郫', 'pi'),
+('郫', '고을 이름 비 '),
+('郫', '비'),
+('郭', 'Hanja form of 곽 (“a surname”).'),
+('郭', 'Hanja form of 곽 (“outer city wall; girdle”).'),
+('郭', '곽'),
+('郭', '둘레/성곽'),
+('郭', '성곽 곽'),
+('郯', 'dam'),
+('郯', 'tam'),
+('郯', '나라이름 담'),
+('郯', '담'),
+('郴', 'ch''im'),
+('郴', 'chim'),
+('郴', '땅이름 침'),
+('郴', '침'),
+('郵', ' 우편 우'),
+('郵', ' 지날 우'),
+('郵', '역말 우'),
+('郵', '우'),
+('郷', 'hyang'),
+('郷', '鄕과 同字'),
+('郷', '향'),
+('都', 'Hanja form of 도 (“all, the whole”).'),
+('都', 'Hanja form of 도 (“capital city”).'),
+('都', 'Hanja form of 도 (“elegant, refined”).'),
+('都', '도'),
+('都', '도읍'),
+('都', '도읍 도'),
+('鄂', 'Abbreviation of 湖北: Hubei (a province of China)'),
+('鄂', 'E (an ancient state located in modern Shanxi, Henan and Hubei, China)'),
+('鄂', 'a region of ancient China around Nanyang in present-day eastern Henan'),
+('鄂', 'name of an ancient city in modern Shanxi'),
+('鄂', 'name of two ancient counties in Hubei and Henan'),
+('鄂', '나라이름 악'),
+('鄂', '악'),
+('鄉', 'hyang'),
+('鄉', '鄕과 同字'),
+('鄉', '향'),
+('鄒', '추'),
+('鄒', '추나라 추'),
+('鄔', 'o'),
+('鄔', '성 이름 오'),
+('鄔', '오'),
+('鄕', ' 고향 향'),
+('鄕', 'country, village'),
+('鄕', 'hyang'),
+('鄕', '시골 향'),
+('鄕', '향'),
+('鄙', 'bi'),
+('鄙', 'low'),
+('鄙', 'mean'),
+('鄙', 'pi'),
+('鄙', '다라울 비'),
+('鄙', '비'),
+('鄞', '땅이름 은'),
+('鄞', '은'),
+('鄢', 'en'),
+('鄢', 'eon'),
+('鄢', 'ŏn'),
+('鄢', '땅이름 언'),
+('鄢', '언'),
+('鄣', '나라이름 장'),
+('鄣', '장'),
+('鄧', '나라 이름 등'),
+('鄧', '등'),
+('鄭', ' 성씨 정'),
+('鄭', 'A former state in modern-day Henan'),
+('鄭', 'a surname'),
+('鄭', '나라 이름'),
+('鄭', '나라이름 정'),
+('鄭', '성씨'),
+('鄭', '정'),
+('鄰', 'Hanja form of 린/인 (“neighborhood”).'),
+('鄰', 'Hanja form of 린/인 (“neighbor”).'),
+('鄰', '린'),
+('鄰', '이웃'),
+('鄰', '이웃 린'),
+('鄰', '인'),
+('鄱', '땅이름 파'),
+('鄱', '파'),
+('鄲', '조나라 서울 단'),
+('鄴', ' 성씨 업'),
+('鄴', 'eop'),
+('鄴', 'ep'),
+('鄴', 'ŏp'),
+('鄴', '땅이름 업'),
+('鄴', '업'),
+('鄶', 'hoe'),
+('鄶', 'hoy'),
+('鄶', '나라이름 회'),
+('鄶', '회'),
+('鄺', 'gwang'),
+('鄺', 'kwang'),
+('鄺', '광'),
+('鄺', '성 광'),
+('鄽', 'cen'),
+('鄽', 'chŏn'),
+('鄽', 'jeon'),
+('鄽', '가게 전 '),
+('鄽', '전'),
+('酇', 'ch''an'),
+('酇', 'chan'),
+('酇', '찬'),
+('酈', '땅 이름 력'),
+('酉', ' 나아갈 유'),
+('酉', ' 열째 지지 유'),
+('酉', 'full'),
+('酉', 'hen,'),
+('酉', 'irrigate'),
+('酉', 'old; ancient'),
+('酉', '닭/열째 지지'),
+('酉', '별 유'),
+('酉', '유'),
+('酊', 'ceng'),
+('酊', 'chŏng'),
+('酊', 'jeong'),
+('酊', '비틀거릴 정'),
+('酊', '정'),
+('酋', ' 끝날 추'),
+('酋', ' 두목 추'),
+('酋', ' 숙 익을 추'),
+('酋', 'ch''u'),
+('酋', 'chu'),
+('酋', 'chwu'),
+('酋', '괴수 추'),
+('酋', '추'),
+('酌', 'Hanja form of 작 (“to pour alcoholic beverages”).'),
+('酌', '따를 작'),
+('酌', '술 부을'),
+('酌', '작'),
+('配', 'Hanja form of 배 (“allocate”).'),
+('配', 'Hanja form of 배 (“match”).'),
+('配', '나누다'),
+('配', '나눌'),
+('配', '배'),
+('配', '아내 배'),
+('配', '짝'),
+('酎', 'chu'),
+('酎', 'cwu'),
+('酎', 'ju'),
+('酎', '세 번 빚은 술 주'),
+('酎', '주'),
+('酒', 'Hanja form of 주 (“alcoholic beverage”).'),
+('酒', 'Hanja form of 주 (“alcoholic beverage”). [affix]'),
+('酒', '술'),
+('酒', '술 주'),
+('酒', '주'),
+('酓', '염'),
+('酖', 't''am'),
+('酖', 'tam'),
+('酖', 'tham'),
+('酖', '술 즐길 탐'),
+('酖', '탐'),
+('酗', 'drunk'),
+('酗', 'hu'),
+('酗', 'hwu'),
+('酗', 'to become violent under the influence of alcohol'),
+('酗', '주정할 후'),
+('酗', '후'),
+('酢', '초 작'),
+('酢', '초 초'),
+('酣', 'geom'),
+('酣', 'kem'),
+('酣', 'kŏm'),
+('酣', '검'),
+('酤', 'go'),
+('酤', 'ko'),
+('酤', '계명주 고'),
+('酤', '고'),
+('酥', 'butter'),
+('酥', 'crispy, light, fluffy'),
+('酥', 'flaky'),
+('酥', 'so'),
+('酥', '소'),
+('酥', '타락죽 소'),
+('酦', 'bal'),
+('酦', 'pal'),
+('酦', '발'),
+('酦', '술기운 발'),
+('酩', 'myeng'),
+('酩', 'myeong'),
+('酩', 'myŏng'),
+('酩', '명'),
+('酩', '술 취할 명'),
+('酪', '진한 유즙 락'),
+('酬', ' 갚을 수'),
+('酬', '수'),
+('酬', '술 권할 수'),
+('酲', ' 술 깰 정'),
+('酲', 'ceng'),
+('酲', 'chŏng'),
+('酲', 'jeong'),
+('酲', '술병 정'),
+('酲', '정'),
+('酴', 'do'),
+('酴', 'to'),
+('酴', '도'),
+('酴', '두번 빚은 술 도'),
+('酵', 'Hanja form of 효 (“yeast”).'),
+('酵', '삭히다'),
+('酵', '삭힐'),
+('酵', '술밑 효'),
+('酵', '효'),
+('酶', '매'),
+('酶', '술밑 매'),
+('酷', 'Hanja form of 혹 (“cruel”).'),
+('酷', '독할 혹'),
+('酷', '심하다'),
+('酷', '심할'),
+('酷', '혹'),
+('酸', 'san'),
+('酸', '산'),
+('酸', '초 산'),
+('酹', '부을 뢰'),
+('醃', ' 김치 엄'),
+('醃', 'em'),
+('醃', 'ŏm'),
+('醃', '엄'),
+('醃', '절일 엄'),
+('醇', ' 두터울 순'),
+('醇', ' 삼갈 순'),
+('醇', ' 순수할 순'),
+('醇', '순'),
+('醇', '전국술 순'),
+('醉', ' 궤란할 취'),
+('醉', '술취할 취'),
+('醉', '취'),
+('醋', '술잔을 돌릴 작'),
+('醋', '초산 초'),
+('醍', 'cey'),
+('醍', 'che'),
+('醍', 'je'),
+('醍', '맑은 술 제'),
+('醍', '제'),
+('醐', 'ho'),
+('醐', '제호 호'),
+('醐', '호'),
+('醒', ' 깨달을 성'),
+('醒', ' 꿈 깰 성'),
+('醒', 'Hanja form of 성 (“waking up; being sober”).'),
+('醒', '깨다'),
+('醒', '깰'),
+('醒', '성'),
+('醒', '술 깰 성'),
+('醖', 'on'),
+('醖', '醞의 俗字'),
+('醖', '온'),
+('醜', ' 같을 추'),
+('醜', ' 무리 추'),
+('醜', ' 부끄러울 추'),
+('醜', ' 자라똥구멍 추'),
+('醜', 'disgraceful'),
+('醜', 'ugly looking, homely'),
+('醜', '추'),
+('醜', '추할 추'),
+('醞', 'brew'),
+('醞', 'harmony'),
+('醞', 'on'),
+('醞', '술 빚을 온'),
+('醞', '온'),
+('醢', ' 젓 담그는 형벌 해'),
+('醢', ' 젓 담글 해'),
+('醢', 'hae'),
+('醢', 'hay'),
+('醢', 'mince'),
+('醢', 'minced pickled meat'),
+('醢', '젓 해'),
+('醢', '해'),
+('醤', '醬의 略字'),
+('醪', '막걸리 료'),
+('醫', ' 병 고칠 의'),
+('醫', 'Hanja form of 의 (“medicine; doctor”).'),
+('醫', '의'),
+('醫', '의원'),
+('醫', '의원 의'),
+('醬', 'any jam-like or paste-like food'),
+('醬', '장'),
+('醬', '장 장'),
+('醬', '젓갈'),
+('醮', 'ch''o'),
+('醮', 'cho'),
+('醮', '초'),
+('醮', '초례 초'),
+('醯', ' 위대로울 혜'),
+('醯', '식혜'),
+('醯', '초 혜'),
+('醯', '혜'),
+('醱', 'Hanja form of 발 (“ferment”).'),
+('醱', '발'),
+('醱', '빚다'),
+('醱', '빚을'),
+('醱', '술 괼 발'),
+('醲', 'nong'),
+('醲', 'thick drink'),
+('醲', '농'),
+('醲', '텁텁한 술 농'),
+('醴', '단술 례'),
+('醵', ' 추렴 걷을 갹'),
+('醵', ' 추렴 걷을 거'),
+('醵', 'Hanja form of 갹 (“chip in; contribute; donate”).'),
+('醵', 'Hanja form of 거 (“chip in; contribute; donate”).'),
+('醵', '갹'),
+('醵', '거'),
+('醵', '술추렴 갹'),
+('醵', '술추렴 거'),
+('醵', '추렴하다'),
+('醵', '추렴할'),
+('釀', 'yang'),
+('釀', '술 빚을 양'),
+('釀', '양'),
+('釁', 'heun'),
+('釁', 'hun'),
+('釁', 'hŭn'),
+('釁', '피바를 흔'),
+('釁', '흔'),
+('釃', 'filter'),
+('釃', 'si'),
+('釃', 'split'),
+('釃', '술 거를 시'),
+('釃', '시'),
+('釅', '술맛 텁텁할 염'),
+('釅', '염'),
+('釆', 'KangXi radical 165'),
+('釆', 'byeon'),
+('釆', 'distinguish'),
+('釆', 'pyen'),
+('釆', 'pyŏn'),
+('釆', '변'),
+('釆', '분별할 변'),
+('采', 'ch''ae'),
+('采', 'chae'),
+('采', 'chay'),
+('采', '채'),
+('采', '캘 채'),
+('釈', '釋의 俗字'),
+('釉', 'yu'),
+('釉', '물건 빛날 유'),
+('釉', '유'),
+('釋', '석'),
+('釋', '풀 석'),
+('里', 'Hanja form of 리 (“a li, a Korean "mile" of about 393m”).'),
+('里', 'Hanja form of 리 (“village”).'),
+('里', '리'),
+('里', '마을'),
+('里', '마을 리'),
+('里', '이'),
+('重', 'Alternative form of 僮 (“Hanja form of 동 (“child”).”)'),
+('重', 'Alternative form of 童 (“Hanja form of 동 (“child”).”)'),
+('重', 'Hanja form of 중 (“heavy”).'),
+('重', '동'),
+('重', '무거울'),
+('重', '무거울 중'),
+('重', '무겁다'),
+('重', '아이'),
+('重', '중'),
+('野', 'Hanja form of 야 (“field; area”).'),
+('野', 'Hanja form of 야 (“wild; savage; untamed”).'),
+('野', '들'),
+('野', '들판 야'),
+('野', '야'),
+('量', 'Hanja form of 량/양 (“volume; amount”).'),
+('量', '량'),
+('量', '양'),
+('量', '헤아리다'),
+('量', '헤아릴'),
+('量', '헤아릴 량'),
+('釐', '1/1000 of a foot'),
+('釐', 'manage, control'),
+('釐', '고치다'),
+('釐', '고칠'),
+('釐', '내'),
+('釐', '다스릴 리'),
+('釐', '래'),
+('釐', '리'),
+('釐', '보리'),
+('釐', '이'),
+('釐', '제사 지내는 고기 희'),
+('釐', '제육'),
+('釐', '희'),
+('金', 'Hanja form of 금 (“Short for 금요일(金曜日) (geumyoil, “Friday”).”).'),
+('金', 'Hanja form of 금 (“gold; amount of money”).'),
+('金', 'Hanja form of 금 (“gold; amount of money”). [noun]'),
+('金', 'Hanja form of 금 (“money”).'),
+('金', 'Hanja form of 금 (“money”). [suffix]'),
+('金', 'Hanja form of 김 (“a surname; used in placenames”).'),
+('金', '금'),
+('金', '김'),
+('金', '사람-의 성(姓)'),
+('金', '사람의 성 김'),
+('金', '쇠'),
+('金', '쇠 금'),
+('釔', 'eul'),
+('釔', 'ul'),
+('釔', 'ŭl'),
+('釔', '을'),
+('釕', 'cho'),
+('釕', 'co'),
+('釕', 'jo'),
+('釕', '조'),
+('釗', 'soe'),
+('釗', 'soy'),
+('釗', '쇠'),
+('釘', ' 못 정'),
+('釘', 'ceng'),
+('釘', 'chŏng'),
+('釘', 'jeong'),
+('釘', '정'),
+('釘', '창 정'),
+('釜', 'Hanja form of 부 (“cauldron; pot”).'),
+('釜', '가마'),
+('釜', '가마 부'),
+('釜', '부'),
+('針', ' 바느질할 침'),
+('針', ' 찌를 침'),
+('針', ' 침 침'),
+('針', 'Alternative form of 鍼 (“Hanja form of 침 (“needle (used in acupuncture)”).”)'),
+('針', 'Hanja form of 침 (“needle (used in sewing)”).'),
+('針', 'Hanja form of 침 (“needle (used in sewing)”). [noun]'),
+('針', 'Hanja form of 침 (“needle-like object (any slender, pointy object resembling a needle)”).'),
+('針', 'Hanja form of 침 (“needle-like object (any slender, pointy object resembling a needle)”). [noun]'),
+('針', 'Hanja form of 침 (“sewing; needlework”).'),
+('針', 'Hanja form of 침 (“sewing; needlework”). [affix]'),
+('針', '바느질하다'),
+('針', '바느질할'),
+('針', '바늘'),
+('針', '바늘 침'),
+('針', '침'),
+('釣', 'cho'),
+('釣', 'co'),
+('釣', 'jo'),
+('釣', '낚시 조'),
+('釣', '조'),
+('釤', 'sam'),
+('釤', '낫 삼'),
+('釤', '삼'),
+('釦', '구'),
+('釦', '그릇에 금테 두를 구'),
+('釧', 'ch''ŏn'),
+('釧', 'chen'),
+('釧', 'cheon'),
+('釧', '천'),
+('釧', '팔찌 천'),
+('釩', '범'),
+('釪', ' 바리때 우'),
+('釪', '요령 우'),
+('釪', '우'),
+('釭', '공'),
+('釭', '굴대 공'),
+('釰', 'blunt'),
+('釰', 'dull'),
+('釰', 'il'),
+('釰', '일'),
+('釵', '비녀 차'),
+('釵', '비녀 채'),
+('釹', 'nye'),
+('釹', 'nyeo'),
+('釹', 'nyŏ'),
+('釹', '녀'),
+('釼', 'blunt, dull'),
+('釼', 'in'),
+('釼', 'knife'),
+('釼', '인'),
+('釿', 'geun'),
+('釿', 'kun'),
+('釿', 'kŭn'),
+('釿', '근'),
+('釿', '대패 근 '),
+('鈀', 'p''a'),
+('鈀', 'pa'),
+('鈀', 'pha'),
+('鈀', 'rake'),
+('鈀', 'war wagon, war chariot'),
+('鈀', '파'),
+('鈇', 'bu'),
+('鈇', 'pu'),
+('鈇', '도끼 부'),
+('鈇', '부'),
+('鈉', 'nap'),
+('鈉', '납'),
+('鈍', 'Hanja form of 둔 (“blunt, obtuse”).'),
+('鈍', 'Hanja form of 둔 (“dull-witted”).'),
+('鈍', 'Hanja form of 둔 (“dull”).'),
+('鈍', 'Hanja form of 둔 (“flat”).'),
+('鈍', '둔'),
+('鈍', '무디다'),
+('鈍', '무딜'),
+('鈍', '무딜 둔'),
+('鈐', ' 자물쇠 검'),
+('鈐', ' 큰 보습 검'),
+('鈐', 'geom'),
+('鈐', 'kem'),
+('鈐', 'kŏm'),
+('鈐', '검'),
+('鈐', '굴대 비녀장 검'),
+('鈑', 'p''an'),
+('鈑', 'pan'),
+('鈑', 'phan'),
+('鈑', '불린 금 판'),
+('鈑', '판'),
+('鈒', 'sap'),
+('鈒', '삽'),
+('鈒', '창 삽'),
+('鈔', 'ch''o'),
+('鈔', 'cho'),
+('鈔', '노략질할 초'),
+('鈔', '초'),
+('鈗', 'yun'),
+('鈗', '윤'),
+('鈗', '창 윤 '),
+('鈜', '쇳소리 횡 '),
+('鈜', '횡'),
+('鈞', 'gyun'),
+('鈞', 'kyun'),
+('鈞', '균'),
+('鈞', '서른 근 균'),
+('鈟', 'cho'),
+('鈟', 'co'),
+('鈟', 'jo'),
+('鈟', '낚시 조 '),
+('鈟', '조'),
+('鈣', 'kae'),
+('鈣', 'kay'),
+('鈣', '개'),
+('鈦', 't''ae'),
+('鈦', 'tae'),
+('鈦', 'thay'),
+('鈦', '태'),
+('鈧', 'hang'),
+('鈧', '항'),
+('鈮', 'ni'),
+('鈮', '니'),
+('鈰', 'shi'),
+('鈰', 'si'),
+('鈰', '시'),
+('鈴', '방울 령'),
+('鈵', 'byeong'),
+('鈵', 'pyeng'),
+('鈵', 'pyŏng'),
+('鈵', '병'),
+('鈷', 'go'),
+('鈷', 'ko'),
+('鈷', '고'),
+('鈷', '다리미 고'),
+('鈸', 'bal'),
+('鈸', 'cymbal'),
+('鈸', 'pal'),
+('鈸', '발'),
+('鈸', '방울 발'),
+('鈹', 'p''i'),
+('鈹', 'phi'),
+('鈹', '피'),
+('鈺', '보배 옥'),
+('鈺', '옥'),
+('鈿', ' 보배로 꾸민 그릇 전'),
+('鈿', '비녀 전'),
+('鈿', '전'),
+('鉀', 'gap'),
+('鉀', 'kap'),
+('鉀', '갑'),
+('鉀', '갑옷 갑'),
+('鉁', 'chin'),
+('鉁', 'cin'),
+('鉁', 'jin'),
+('鉁', '보배 진 '),
+('鉁', '진'),
+('鉄', '쇠 철'),
+('鉅', ' 강한 쇠 거'),
+('鉅', ' 클 거'),
+('鉅', 'geo'),
+('鉅', 'ke'),
+('鉅', 'kŏ'),
+('鉅', '갈고리 거'),
+('鉅', '거'),
+('鉉', '솥귀'),
+('鉉', '솥귀 현'),
+('鉉', '현'),
+('鉋', 'p''o'),
+('鉋', 'pho'),
+('鉋', 'po'),
+('鉋', '대패 포'),
+('鉋', '포'),
+('鉎', 'saeng'),
+('鉎', 'sayng'),
+('鉎', '녹 생'),
+('鉎', '생'),
+('鉏', 'hoe (short-handled, one-handed)'),
+('鉏', 'se'),
+('鉏', 'seo'),
+('鉏', 'sŏ'),
+('鉏', 'to chop, hew, mow; eliminate'),
+('鉏', 'to hoe, weed'),
+('鉏', '서'),
+('鉏', '호미 서'),
+('鉐', '놋쇠 석 '),
+('鉐', '석'),
+('鉑', 'Hanja form of 금 (“gold leaf, platinum”).'),
+('鉑', '금박 박'),
+('鉑', '금백'),
+('鉑', '백'),
+('鉒', 'chu'),
+('鉒', 'cwu'),
+('鉒', 'ju'),
+('鉒', '쇳돌 주 '),
+('鉒', '주'),
+('鉕', 'p''a'),
+('鉕', 'pa'),
+('鉕', 'pha'),
+('鉕', '파'),
+('鉗', ' 세력으로써 남을 누를 겸'),
+('鉗', ' 입 다물 겸'),
+('鉗', 'gyeom'),
+('鉗', 'kyem'),
+('鉗', 'kyŏm'),
+('鉗', '겸'),
+('鉗', '목사슬 겸'),
+('鉛', ' 분 연'),
+('鉛', '납 연'),
+('鉛', '연'),
+('鉞', 'wel'),
+('鉞', 'wol'),
+('鉞', 'wŏl'),
+('鉞', '도끼 월'),
+('鉞', '월'),
+('鉢', 'bal'),
+('鉢', 'bowl (perhaps originally, Buddhist alms bowl)'),
+('鉢', 'pal'),
+('鉢', '바리때 발'),
+('鉢', '발'),
+('鉤', 'gu'),
+('鉤', 'ku'),
+('鉤', 'kwu'),
+('鉤', '갈고랑쇠 구'),
+('鉤', '구'),
+('鉥', ' 인도할 술'),
+('鉥', 'sul'),
+('鉥', 'swul'),
+('鉥', '돗바늘 술'),
+('鉥', '술'),
+('鉦', '정'),
+('鉦', '징 소리'),
+('鉦', '징 정'),
+('鉬', 'mok'),
+('鉬', '목'),
+('鉱', 'gwang'),
+('鉱', 'kwang'),
+('鉱', '鑛의 俗字'),
+('鉱', '광'),
+('鉷', 'hong'),
+('鉷', '돌쇠뇌 홍'),
+('鉷', '홍'),
+('鉻', '락'),
+('鉼', 'byeong'),
+('鉼', 'pyeng'),
+('鉼', 'pyŏng'),
+('鉼', '병'),
+('鉼', '판금 병'),
+('鉾', 'mo'),
+('鉾', '모'),
+('鉾', '칼 끝 모'),
+('銀', ' 돈 은'),
+('銀', 'Hanja form of 은 (“silver; silver-colored”).'),
+('銀', '은'),
+('銀', '은 은'),
+('銃', ' 총 총'),
+('銃', 'gun, rifle, firearm'),
+('銃', '도끼 구멍 총'),
+('銃', '총'),
+('銅', 'Hanja form of 동 (“Vietnamese dong”).'),
+('銅', 'Hanja form of 동 (“copper”).'),
+('銅', '구리'),
+('銅', '구리 동'),
+('銅', '동'),
+('銋', '임'),
+('銋', '젖을 임 '),
+('銍', '낫: sickle'),
+('銍', '질'),
+('銎', 'gong'),
+('銎', 'kong'),
+('銎', '공'),
+('銎', '도끼 구멍 공 '),
+('銑', 'sen'),
+('銑', 'seon'),
+('銑', 'sŏn'),
+('銑', '끌 선'),
+('銑', '선'),
+('銓', ' 저울질할 전'),
+('銓', 'cen'),
+('銓', 'chŏn'),
+('銓', 'jeon'),
+('銓', '사람 가릴 전'),
+('銓', '전'),
+('銕', 'ch''ŏl'),
+('銕', 'chel'),
+('銕', 'cheol'),
+('銕', '鐵의 古字'),
+('銕', '철'),
+('銖', 'su'),
+('銖', 'swu'),
+('銖', '수'),
+('銖', '저울눈 수'),
+('銘', 'Hanja form of 명 (“inscribe, engrave”).'),
+('銘', 'Hanja form of 명 (“unforgettably”).'),
+('銘', '명'),
+('銘', '새기다'),
+('銘', '새길'),
+('銘', '새길 명'),
+('銙', 'gwa'),
+('銙', 'kwa'),
+('銙', '과'),
+('銙', '대구 과 '),
+('銚', 'cho'),
+('銚', 'co'),
+('銚', 'jo'),
+('銚', '쟁개비 조'),
+('銚', '조'),
+('銛', 'sem'),
+('銛', 'seom'),
+('銛', 'sŏm'),
+('銛', '가래 섬'),
+('銛', '섬'),
+('銜', 'ham'),
+('銜', '재갈 함'),
+('銜', '함'),
+('銠', 'lo'),
+('銠', 'ro'),
+('銠', '로'),
+('銣', 'ye'),
+('銣', 'yeo'),
+('銣', 'yŏ'),
+('銣', '여'),
+('銦', 'in'),
+('銦', '인'),
+('銫', 'saek'),
+('銫', 'sayk'),
+('銫', '색'),
+('銳', ' 까끄라기 예'),
+('銳', '날카로울 예'),
+('銳', '창 태'),
+('銶', '구'),
+('銶', '끌 구'),
+('銷', ' 사라질 소'),
+('銷', 'so'),
+('銷', '녹을 소'),
+('銷', '소'),
+('銹', 'su'),
+('銹', 'swu'),
+('銹', '동록 수'),
+('銹', '수'),
+('銻', 'cey'),
+('銻', 'che'),
+('銻', 'je'),
+('銻', '제'),
+('鋁', 'lye'),
+('鋁', 'ryeo'),
+('鋁', 'ryŏ'),
+('鋁', '려'),
+('鋅', 'ca'),
+('鋅', 'cha'),
+('鋅', 'ja'),
+('鋅', '자'),
+('鋆', 'yun'),
+('鋆', '윤'),
+('鋇', 'p''ae'),
+('鋇', 'pae'),
+('鋇', 'phay'),
+('鋇', '패'),
+('鋈', 'ok'),
+('鋈', '옥'),
+('鋈', '은 올릴 옥'),
+('鋌', ' 달음박질할 정'),
+('鋌', ' 쇳덩이 정'),
+('鋌', 'ceng'),
+('鋌', 'chŏng'),
+('鋌', 'jeong'),
+('鋌', '정'),
+('鋌', '화살촉 정'),
+('鋏', ' 집개 협'),
+('鋏', 'hyeop'),
+('鋏', 'hyep'),
+('鋏', 'hyŏp'),
+('鋏', '칼 손잡이 협'),
+('鋏', '협'),
+('鋑', 'cen'),
+('鋑', 'chŏn'),
+('鋑', 'jeon'),
+('鋑', '전'),
+('鋒', 'bong'),
+('鋒', 'pong'),
+('鋒', '봉'),
+('鋒', '칼끝 봉'),
+('鋗', ' 퉁노구 현'),
+('鋗', 'hyen'),
+('鋗', 'hyeon'),
+('鋗', 'hyŏn'),
+('鋗', '노구솥 현'),
+('鋗', '현'),
+('鋟', 'ch''im'),
+('鋟', 'chim'),
+('鋟', '새길 침'),
+('鋟', '침'),
+('鋤', 'hoe (short-handled, one-handed)'),
+('鋤', 'se'),
+('鋤', 'seo'),
+('鋤', 'sŏ'),
+('鋤', 'to remove, eliminate'),
+('鋤', 'to weed, eradicate, compare mow, hew, hoe.'),
+('鋤', '서'),
+('鋤', '호미 서'),
+('鋥', 'ceng'),
+('鋥', 'chŏng'),
+('鋥', 'jeong'),
+('鋥', '정'),
+('鋪', ' 문고리 포'),
+('鋪', ' 베풀 포'),
+('鋪', ' 아플 포'),
+('鋪', ' 펼 포'),
+('鋪', 'p''o'),
+('鋪', 'pho'),
+('鋪', 'po'),
+('鋪', '전방 포'),
+('鋪', '포'),
+('鋭', '銳와 同字'),
+('鋭', '鋭와 同字'),
+('鋯', 'go'),
+('鋯', 'ko'),
+('鋯', '고'),
+('鋰', 'li'),
+('鋰', 'lithium'),
+('鋰', 'ri'),
+('鋰', '리'),
+('鋲', ' 징 병'),
+('鋲', 'byeong'),
+('鋲', 'pyeng'),
+('鋲', 'pyŏng'),
+('鋲', '넓은 못 병'),
+('鋲', '병'),
+('鋸', ' 다리 꺾는 형벌 거'),
+('鋸', '거'),
+('鋸', '톱 거'),
+('鋹', 'ch''ŏng'),
+('鋹', 'cheng'),
+('鋹', 'cheong'),
+('鋹', '날카로울 청'),
+('鋹', '청'),
+('鋺', 'wen'),
+('鋺', 'won'),
+('鋺', 'wŏn'),
+('鋺', '원'),
+('鋺', '저울 바탕 원'),
+('鋼', 'Hanja form of 강 (“hard; strong”).'),
+('鋼', 'Hanja form of 강 (“steel”).'),
+('鋼', '강'),
+('鋼', '강철/굳셀'),
+('鋼', '쇠 강'),
+('鋽', 'cho'),
+('鋽', 'co'),
+('鋽', 'jo'),
+('鋽', '불리지 않은 쇠 조 '),
+('鋽', '조'),
+('錄', 'Hanja form of 록/녹 (“write down; to record”).'),
+('錄', '기록하다'),
+('錄', '기록할'),
+('錄', '기록할 록'),
+('錄', '녹'),
+('錄', '록'),
+('錄', '사실할 려'),
+('錆', 'ch''ŏng'),
+('錆', 'cheng'),
+('錆', 'cheong'),
+('錆', '자세할 청'),
+('錆', '청'),
+('錏', 'a'),
+('錏', 'ammonium'),
+('錏', 'soft steel'),
+('錏', '아'),
+('錏', '투구의 목가림 아'),
+('錐', '송곳 추'),
+('錐', '추'),
+('錕', '곤'),
+('錕', '붉은 쇠 곤'),
+('錘', ' 마치 추'),
+('錘', ' 저울 추'),
+('錘', '저울눈 추'),
+('錘', '추'),
+('錙', ' 조금 치'),
+('錙', 'ch''i'),
+('錙', 'chi'),
+('錙', '저울눈 치'),
+('錙', '치'),
+('錚', ' 징 쟁'),
+('錚', 'gong (a type of percussion instrument used in folk music)'),
+('錚', 'metallic sound'),
+('錚', '쇳소리'),
+('錚', '쇳소리 쟁그렁거릴 쟁'),
+('錚', '쟁'),
+('錞', '사발종 순'),
+('錞', '창고달 대'),
+('錟', 'dam'),
+('錟', 'tam'),
+('錟', '긴 창 담'),
+('錟', '담'),
+('錠', 'ceng'),
+('錠', 'chŏng'),
+('錠', 'jeong'),
+('錠', '정'),
+('錠', '촛대 정'),
+('錡', ' 쇠뇌틀 의'),
+('錡', ' 휘뚝거릴 의'),
+('錡', '세발 가마 의'),
+('錡', '솥 기'),
+('錢', ' 가래 전'),
+('錢', '돈'),
+('錢', '돈 전'),
+('錢', '전'),
+('錣', 'ch''ŏl'),
+('錣', 'chel'),
+('錣', 'cheol'),
+('錣', '물미 철'),
+('錣', '철'),
+('錤', 'gi'),
+('錤', 'ki'),
+('錤', '기'),
+('錤', '호미 기'),
+('錦', 'Hanja form of 금 (“brocade”).'),
+('錦', '금'),
+('錦', '비단'),
+('錦', '비단 금'),
+('錧', 'gwan'),
+('錧', 'kwan'),
+('錧', '관'),
+('錧', '비녀장 관 '),
+('錨', 'anchor'),
+('錨', 'myo'),
+('錨', '닻 묘'),
+('錨', '묘'),
+('錪', ' 쇠 전 '),
+('錪', 'cen'),
+('錪', 'chŏn'),
+('錪', 'jeon'),
+('錪', '솥 전'),
+('錪', '전'),
+('錫', 'sek'),
+('錫', 'seok'),
+('錫', 'sŏk'),
+('錫', '석'),
+('錫', '주석 석'),
+('錬', '보습날 동'),
+('錮', 'Hanja form of 고 (“to confine”).'),
+('錮', '고'),
+('錮', '땜질할 고'),
+('錮', '막다'),
+('錮', '막을'),
+('錯', '措와 同字'),
+('錯', '섞일 착'),
+('録', '録와 同字'),
+('録', '희학질할 록'),
+('錳', 'maeng'),
+('錳', 'mayng'),
+('錳', '맹'),
+('鍀', 'tuk'),
+('鍀', 'tŭk'),
+('鍀', '득'),
+('鍈', 'yeng'),
+('鍈', 'yeong'),
+('鍈', 'yŏng'),
+('鍈', '방울소리 영 '),
+('鍈', '영'),
+('鍉', ' 열쇠 시'),
+('鍉', 'si'),
+('鍉', '숟가락 시'),
+('鍉', '시'),
+('鍊', 'Hanja form of 련/연 (“refine”).'),
+('鍊', 'Hanja form of 련/연 (“smelt metals, forge”).'),
+('鍊', '련'),
+('鍊', '불리다'),
+('鍊', '불릴'),
+('鍊', '불릴 련'),
+('鍊', '연'),
+('鍋', 'gwa'),
+('鍋', 'kwa'),
+('鍋', '과'),
+('鍋', '노구솥 과'),
+('鍍', 'do'),
+('鍍', 'to'),
+('鍍', '도'),
+('鍍', '도금할 도'),
+('鍏', '보습'),
+('鍏', '위'),
+('鍔', '악'),
+('鍔', '칼날끝 악'),
+('鍗', 'cey'),
+('鍗', 'che'),
+('鍗', 'je'),
+('鍗', '제'),
+('鍗', '큰 가마 제 '),
+('鍛', '단'),
+('鍛', '불리다'),
+('鍛', '불릴'),
+('鍛', '쇠불릴 단'),
+('鍜', '목투구 하 '),
+('鍜', '하'),
+('鍝', 'u'),
+('鍝', 'wu'),
+('鍝', '귀고리 우 '),
+('鍝', '우'),
+('鍠', 'goeng'),
+('鍠', 'koeng'),
+('鍠', 'koyng'),
+('鍠', '굉'),
+('鍠', '종고 소리 굉'),
+('鍤', 'sap'),
+('鍤', 'spade, shovel'),
+('鍤', '가래 삽'),
+('鍤', '삽'),
+('鍪', ' 가마 무'),
+('鍪', 'metal cap'),
+('鍪', 'mu'),
+('鍪', '무'),
+('鍪', '투구 무'),
+('鍫', '가래 초'),
+('鍫', '초'),
+('鍬', 'a spade, shovel, ploughshare'),
+('鍬', '가래 초'),
+('鍬', '초'),
+('鍮', '놋쇠 유'),
+('鍮', '유'),
+('鍰', 'hwan'),
+('鍰', 'hwan, a unit of weight used in ancient China'),
+('鍰', '무게 단위 환'),
+('鍰', '환'),
+('鍵', ' 수레 굴대 건'),
+('鍵', 'Hanja form of 건 (“key”).'),
+('鍵', '건'),
+('鍵', '열쇠'),
+('鍵', '열쇠 건'),
+('鍶', 'song'),
+('鍶', '송'),
+('鍺', 't''a'),
+('鍺', 'ta'),
+('鍺', 'tha'),
+('鍺', '타'),
+('鍼', ' 침 침'),
+('鍼', 'needle (used in acupuncture)'),
+('鍼', '바늘 침'),
+('鍼', '침'),
+('鍾', 'chong'),
+('鍾', 'cong'),
+('鍾', 'jong'),
+('鍾', '술병 종'),
+('鍾', '음훈: [술병 종] 술병, 술잔 = alcohol bottle, alcohol glass, alcohol receptacle'),
+('鍾', '종'),
+('鎂', 'mi'),
+('鎂', '미'),
+('鎊', '깎을 방'),
+('鎊', '방'),
+('鎌', 'Hanja form of 겸 (“sickle”).'),
+('鎌', '겸'),
+('鎌', '낫'),
+('鎌', '낫 겸'),
+('鎏', '급속 류'),
+('鎒', 'hoe (short-handled, one-handed)'),
+('鎒', 'to weed, hoe'),
+('鎒', '호'),
+('鎔', ' 거푸집 용'),
+('鎔', ' 녹일 용'),
+('鎔', 'yong'),
+('鎔', '불릴 용'),
+('鎔', '용'),
+('鎖', ' 가둘 쇄'),
+('鎖', ' 쇠사슬 쇄'),
+('鎖', ' 항쇄 쇄'),
+('鎖', '쇄'),
+('鎖', '자물쇠 쇄'),
+('鎗', ' 창 쟁'),
+('鎗', ' 총 쟁'),
+('鎗', '금석소리 쟁'),
+('鎗', '쟁'),
+('鎘', 'lyek'),
+('鎘', 'ryeok'),
+('鎘', 'ryŏk'),
+('鎘', '력'),
+('鎚', ' 저울 추'),
+('鎚', '쇠마치 추'),
+('鎚', '옥 다듬을 퇴'),
+('鎛', 'bak'),
+('鎛', 'pak'),
+('鎛', '박'),
+('鎛', '종 박'),
+('鎟', 'sang'),
+('鎟', '방울소리 상 '),
+('鎟', '상'),
+('鎠', 'Alternative form of 鋼 (“Hanja form of 강 (“steel”).”)'),
+('鎠', '강'),
+('鎠', '강철/굳셀'),
+('鎡', 'ca'),
+('鎡', 'cha'),
+('鎡', 'hoe'),
+('鎡', 'ja'),
+('鎡', 'mattock'),
+('鎡', '자'),
+('鎡', '호미 자'),
+('鎣', ' 꾸밀 형'),
+('鎣', 'hyeng'),
+('鎣', 'hyeong'),
+('鎣', 'hyŏng'),
+('鎣', '줄 형'),
+('鎣', '형'),
+('鎤', 'hwang'),
+('鎤', '종소리 황'),
+('鎤', '황'),
+('鎧', ' 갑옷 개'),
+('鎧', 'gae'),
+('鎧', 'kae'),
+('鎧', 'kay'),
+('鎧', '개'),
+('鎧', '투구 개'),
+('鎬', 'ho'),
+('鎬', '호'),
+('鎬', '호경 호'),
+('鎭', '누를 진'),
+('鎭', '진'),
+('鎭', '진압하다'),
+('鎭', '진압할'),
+('鎮', '鎭의 俗字'),
+('鎮', '진'),
+('鎮', '진압하다'),
+('鎮', '진압할'),
+('鎰', 'il'),
+('鎰', '일'),
+('鎰', '중량 일'),
+('鎳', 'el'),
+('鎳', 'eol'),
+('鎳', 'ŏl'),
+('鎳', '얼'),
+('鎵', 'ga'),
+('鎵', 'ka'),
+('鎵', '가'),
+('鏀', '가마'),
+('鏀', '노'),
+('鏀', '로'),
+('鏁', 'swae'),
+('鏁', 'sway'),
+('鏁', '긴 창 쇄'),
+('鏁', '쇄'),
+('鏃', 'chok'),
+('鏃', 'cok'),
+('鏃', 'jok'),
+('鏃', '족'),
+('鏃', '화살촉 족'),
+('鏇', 'sen'),
+('鏇', 'seon'),
+('鏇', 'sŏn'),
+('鏇', '갈이틀 선'),
+('鏇', '선'),
+('鏈', '쇠사슬 련'),
+('鏊', 'o'),
+('鏊', '번철 오'),
+('鏊', '오'),
+('鏋', '금 만 '),
+('鏋', '만'),
+('鏌', 'mak'),
+('鏌', 'sword name'),
+('鏌', '막'),
+('鏌', '칼 이름 막'),
+('鏑', 'cek'),
+('鏑', 'chŏk'),
+('鏑', 'jeok'),
+('鏑', '적'),
+('鏑', '화살촉 적'),
+('鏖', ' 구리동이 오'),
+('鏖', 'o'),
+('鏖', '무찌를 오'),
+('鏖', '오'),
+('鏗', ' 사람이름 갱'),
+('鏗', '갱'),
+('鏗', '금석 소리 갱'),
+('鏗', '금옥(金玉) 소리'),
+('鏘', 'tinkle'),
+('鏘', '금옥 소리 장'),
+('鏘', '금옥(金玉) 소리'),
+('鏘', '장'),
+('鏜', 'boring tool'),
+('鏜', 'dang'),
+('鏜', 'tang'),
+('鏜', '당'),
+('鏜', '북방축소 당'),
+('鏝', 'man'),
+('鏝', '만'),
+('鏝', '흙손 만'),
+('鏞', '용'),
+('鏞', '종'),
+('鏞', '큰 쇠북 용'),
+('鏟', 'san'),
+('鏟', '대패 산'),
+('鏟', '산'),
+('鏡', 'Hanja form of 경 (“glass, glasses”).'),
+('鏡', 'Hanja form of 경 (“mirror, lens”).'),
+('鏡', '거울'),
+('鏡', '거울 경'),
+('鏡', '경'),
+('鏢', ' 비수 표'),
+('鏢', '칼날 표'),
+('鏢', '표'),
+('鏤', '새길 루'),
+('鏦', ' 찌를 총'),
+('鏦', '창 총'),
+('鏦', '총'),
+('鏨', 'ch''am'),
+('鏨', 'cham'),
+('鏨', '끌 참'),
+('鏨', '참'),
+('鏶', 'chip'),
+('鏶', 'cip'),
+('鏶', 'jip'),
+('鏶', '집'),
+('鏶', '판금 집 '),
+('鏻', '굳셀 린'),
+('鏽', 'su'),
+('鏽', 'swu'),
+('鏽', '거울에 녹슬 수'),
+('鏽', '수'),
+('鐃', '작은 징 뇨'),
+('鐄', 'hoeng'),
+('鐄', 'hoyng'),
+('鐄', '종 횡'),
+('鐄', '횡'),
+('鐏', 'chun'),
+('鐏', 'cwun'),
+('鐏', 'jun'),
+('鐏', '준'),
+('鐏', '창고달 준'),
+('鐐', '은 료'),
+('鐓', 'dae'),
+('鐓', 'tae'),
+('鐓', 'tay'),
+('鐓', '대'),
+('鐓', '창고달 대'),
+('鐔', 'dagger'),
+('鐔', 'sim'),
+('鐔', 'small sword'),
+('鐔', '심'),
+('鐔', '칼날 아래 코등이 심'),
+('鐘', '쇠북'),
+('鐘', '쇠북 종'),
+('鐘', '종'),
+('鐙', 'deung'),
+('鐙', 'tung'),
+('鐙', 'tŭng'),
+('鐙', '등'),
+('鐙', '등자 등'),
+('鐚', 'a'),
+('鐚', '아'),
+('鐠', 'bo'),
+('鐠', 'po'),
+('鐠', '보'),
+('鐥', 'Alternative form of 釤 (“Hanja form of 삼 (“Samarium”).”)'),
+('鐥', 'Alternative form of 釤 (“Hanja form of 삼 (“a sickle”).”)'),
+('鐥', 'Hanja form of 삼 (“Samarium”).'),
+('鐥', 'Hanja form of 삼 (“a sickle”).'),
+('鐥', 'Hanja form of 선 (“a blank”).'),
+('鐥', '낫'),
+('鐥', '복자'),
+('鐥', '복자 선 '),
+('鐥', '삼'),
+('鐥', '선'),
+('鐪', '부레 로 '),
+('鐫', 'cen'),
+('鐫', 'chŏn'),
+('鐫', 'jeon'),
+('鐫', '새길 전'),
+('鐫', '전'),
+('鐵', 'Hanja form of 쇠 (“iron”).'),
+('鐵', '쇠'),
+('鐵', '쇠 철'),
+('鐵', '철'),
+('鐶', 'hwan'),
+('鐶', 'measure of currency'),
+('鐶', 'metal ring'),
+('鐶', '고리 환'),
+('鐶', '환'),
+('鐸', ' 목탁 탁'),
+('鐸', 'Hanja form of 탁 (“bell”).'),
+('鐸', '방울'),
+('鐸', '요령 탁'),
+('鐸', '탁'),
+('鐺', 'dang'),
+('鐺', 'tang'),
+('鐺', '당'),
+('鐺', '죄인 자물쇠 당'),
+('鑂', 'hun'),
+('鑂', 'hwun'),
+('鑂', '금빛 투색할 훈 '),
+('鑂', '훈'),
+('鑄', '쇠 부어 만들 주'),
+('鑄', '주'),
+('鑊', 'caldron'),
+('鑊', 'hwak'),
+('鑊', '가마 확'),
+('鑊', '확'),
+('鑌', 'bin'),
+('鑌', 'pin'),
+('鑌', '강철 빈'),
+('鑌', '빈'),
+('鑑', ' 경계할 감'),
+('鑑', ' 밝을 감'),
+('鑑', ' 비칠 감'),
+('鑑', 'Hanja form of 감 (“mirror; inspection”).'),
+('鑑', '감'),
+('鑑', '거울'),
+('鑑', '거울 감'),
+('鑒', 'Alternative form of 鑑 (“Hanja form of 감 (“mirror; inspection”).”)'),
+('鑒', '鑑과 同字'),
+('鑒', '감'),
+('鑒', '거울'),
+('鑕', 'chil'),
+('鑕', 'cil'),
+('鑕', 'jil'),
+('鑕', '모루 질'),
+('鑕', '질'),
+('鑛', 'Hanja form of 광 (“mineral, ore”).'),
+('鑛', 'Hanja form of 광 (“mine”).'),
+('鑛', '광'),
+('鑛', '쇳돌'),
+('鑛', '쇳돌 광'),
+('鑞', '납'),
+('鑞', '땜납'),
+('鑞', '땜납 랍'),
+('鑞', '랍'),
+('鑠', 'sak'),
+('鑠', '녹일 삭'),
+('鑠', '삭'),
+('鑢', '줄 려'),
+('鑣', ' 성할 표'),
+('鑣', 'p''yo'),
+('鑣', 'phyo'),
+('鑣', 'pyo'),
+('鑣', '말 재갈 표'),
+('鑣', '표'),
+('鑩', '다는 갈고리'),
+('鑩', '악'),
+('鑪', '화로 로'),
+('鑫', 'heum'),
+('鑫', 'hŭm'),
+('鑫', '흠'),
+('鑭', 'lan'),
+('鑭', 'ran'),
+('鑭', '란'),
+('鑰', 'yak'),
+('鑰', '약'),
+('鑰', '자물쇠 약'),
+('鑱', 'ch''am'),
+('鑱', 'cham'),
+('鑱', '보습 참'),
+('鑱', '참'),
+('鑲', 'yang'),
+('鑲', '거푸집 속 양'),
+('鑲', '양'),
+('鑵', 'gwan'),
+('鑵', 'kwan'),
+('鑵', '관'),
+('鑵', '두레박 관'),
+('鑷', 'seop'),
+('鑷', 'sep'),
+('鑷', 'sŏp'),
+('鑷', '섭'),
+('鑷', '쪽집게 섭'),
+('鑼', '징 라'),
+('鑽', '끌 찬'),
+('鑽', '찬'),
+('鑾', '방울 란'),
+('鑿', 'Hanja form of 조 (“hole”).'),
+('鑿', 'Hanja form of 착 (“to bore; to pierce”).'),
+('鑿', '구멍'),
+('鑿', '뚫다'),
+('鑿', '뚫을'),
+('鑿', '뚫을 조'),
+('鑿', '뚫을 착'),
+('鑿', '조'),
+('鑿', '착'),
+('钀', '알'),
+('钀', '재갈'),
+('钁', 'gwak'),
+('钁', 'hoe (long-handled, two-handed, L-shaped)'),
+('钁', 'kwak'),
+('钁', '곽'),
+('钃', 'ch''ok'),
+('钃', 'chok'),
+('钃', 'hoe (long- or short-handled)'),
+('钃', '촉'),
+('钑', '鈒의 略字'),
+('锜', '錡와 同字'),
+('锜', '세발 가마 기'),
+('锳', '鍈과 同字 '),
+('锺', '술병 종'),
+('锽', '쇠북소리 굉'),
+('長', 'Hanja form of 장 (“head; chief; manager”).'),
+('長', 'Hanja form of 장 (“head; chief; manager”). [noun, suffix]'),
+('長', 'Hanja form of 장 (“long; lengthy”).'),
+('長', 'Hanja form of 장 (“long; lengthy”). [prefix]'),
+('長', 'Hanja form of 장 (“to grow; to develop”).'),
+('長', 'Hanja form of 장 (“to grow; to develop”). [affix]'),
+('長', '길'),
+('長', '길 장'),
+('長', '길다'),
+('長', '어른'),
+('長', '장'),
+('門', 'Hanja form of 문 (“gate; door; gateway; portal”).'),
+('門', '문'),
+('門', '문 문'),
+('閃', 'Hanja form of 섬 (“flash”).'),
+('閃', '번쩍이다'),
+('閃', '번쩍일'),
+('閃', '번쩍할 섬'),
+('閃', '섬'),
+('閄', '혹'),
+('閈', 'han'),
+('閈', '마을 문 한'),
+('閈', '한'),
+('閉', ' 가릴 폐'),
+('閉', ' 마칠 폐'),
+('閉', '닫을 폐'),
+('閉', '막을 별'),
+('閊', 'san'),
+('閊', 'to be obstructed, blocked'),
+('閊', 'to break down'),
+('閊', '비색할 산'),
+('閊', '산'),
+('開', ' 발할 개'),
+('開', ' 베풀 개'),
+('開', ' 통할 개'),
+('開', ' 풀 개'),
+('開', 'Hanja form of 개 (“open”).'),
+('開', '개'),
+('開', '열'),
+('開', '열 개'),
+('開', '열다'),
+('閎', 'barrier'),
+('閎', 'expand'),
+('閎', 'gate'),
+('閎', 'goeng'),
+('閎', 'koeng'),
+('閎', 'koyng'),
+('閎', 'vast'),
+('閎', 'wide'),
+('閎', '굉'),
+('閎', '마을문 굉'),
+('閏', 'Hanja form of 윤 (“intercalary”).'),
+('閏', '윤'),
+('閏', '윤달'),
+('閏', '윤달 륜'),
+('閑', '한'),
+('閑', '한가할'),
+('閑', '한가할 한'),
+('閒', '틈 간'),
+('閒', '한가할 한'),
+('間', ' 사이 간'),
+('間', 'Hanja form of 간 (“between”).'),
+('間', '간'),
+('間', '사이'),
+('間', '틈 간'),
+('閔', 'min'),
+('閔', '민'),
+('閔', '위문할 민'),
+('閗', 'Yakja form of 鬪'),
+('閗', 't''u'),
+('閗', 'thwu'),
+('閗', 'tu'),
+('閗', '투'),
+('閘', ' 물 문 갑'),
+('閘', 'gap'),
+('閘', 'kap'),
+('閘', '갑'),
+('閘', '문 빗장 갑'),
+('閟', 'bi'),
+('閟', 'close the door'),
+('閟', 'hide'),
+('閟', 'pi'),
+('閟', 'shut'),
+('閟', '문 닫을 비'),
+('閟', '비'),
+('閠', 'Alternative form of 閏 (“Hanja form of 윤 (“intercalary”).”)'),
+('閠', '윤'),
+('閠', '윤달'),
+('関', '關과 同字'),
+('関', '쇠사슬 관'),
+('閣', 'Hanja form of 각 (“cabinet”).'),
+('閣', 'Hanja form of 각 (“chamber; pavilion”).'),
+('閣', '각'),
+('閣', '문설주 각'),
+('閣', '집'),
+('閤', ' 개구리소리 합'),
+('閤', ' 침방 합'),
+('閤', 'hap'),
+('閤', '도장 합'),
+('閤', '합'),
+('閥', 'beol'),
+('閥', 'pel'),
+('閥', 'pŏl'),
+('閥', '공훈 벌'),
+('閥', '벌'),
+('閦', ' 아축부처 축'),
+('閦', 'ch''uk'),
+('閦', 'chuk'),
+('閦', 'chwuk'),
+('閦', '무리 축'),
+('閦', '축'),
+('閧', 'boisterous'),
+('閧', 'clamor; noise'),
+('閧', 'hong'),
+('閧', '싸우는 소리 홍'),
+('閧', '홍'),
+('閨', 'gyu'),
+('閨', 'kyu'),
+('閨', '규'),
+('閨', '색시 규'),
+('閩', 'min'),
+('閩', '민'),
+('閩', '종족이름 민'),
+('閪', 'a lost item'),
+('閪', '서'),
+('閪', '잃을 서'),
+('閫', '곤'),
+('閫', '문지방 곤'),
+('閬', '솟을 대문 랑'),
+('閭', '이문 려'),
+('閱', ' 군대 점호할 열'),
+('閱', ' 용납할 열'),
+('閱', 'inspect'),
+('閱', '검열하다'),
+('閱', '검열할'),
+('閱', '겪을 열'),
+('閱', '열'),
+('閲', 'inspect'),
+('閲', '閱의 略字'),
+('閲', '검열하다'),
+('閲', '검열할'),
+('閲', '열'),
+('閶', 'ch''ang'),
+('閶', 'chang'),
+('閶', 'gate of heaven'),
+('閶', 'zephyr'),
+('閶', '창'),
+('閶', '천문 청'),
+('閹', ' 내시 엄'),
+('閹', '고자 엄'),
+('閹', '엄'),
+('閻', ' 저승 염'),
+('閻', ' 항간 염'),
+('閻', 'yem'),
+('閻', 'yeom'),
+('閻', 'yŏm'),
+('閻', '마을 염'),
+('閻', '염'),
+('閼', '가로막다'),
+('閼', '가로막을'),
+('閼', '알'),
+('閽', 'gate, door'),
+('閽', 'gatekeeper'),
+('閽', 'hon'),
+('閽', '문지기 혼'),
+('閽', '혼'),
+('閾', 'yek'),
+('閾', 'yeok'),
+('閾', 'yŏk'),
+('閾', '문지방 역'),
+('閾', '역'),
+('闃', 'gyeok'),
+('闃', 'kyek'),
+('闃', 'kyŏk'),
+('闃', '격'),
+('闃', '고요할 격'),
+('闆', 'adult'),
+('闆', 'ban'),
+('闆', 'inside the gate'),
+('闆', 'inside the gate [door, window]'),
+('闆', 'landlord'),
+('闆', 'pan'),
+('闆', 'plank'),
+('闆', '반'),
+('闇', ' 어리석을 암'),
+('闇', 'am'),
+('闇', '암'),
+('闇', '어두울 암'),
+('闈', 'gate'),
+('闈', 'inner room'),
+('闈', 'royal palace'),
+('闈', 'wi'),
+('闈', '대궐안의 문 위'),
+('闈', '위'),
+('闉', 'block up'),
+('闉', 'gate of small wall'),
+('闉', 'in'),
+('闉', '인'),
+('闊', 'hwal'),
+('闊', '트일 활'),
+('闊', '활'),
+('闋', ' 다할 결'),
+('闋', ' 문 닫을 결'),
+('闋', ' 풍류 마칠 결'),
+('闋', 'gyeol'),
+('闋', 'kyel'),
+('闋', 'kyŏl'),
+('闋', '결'),
+('闋', '쉴 결'),
+('闌', '가막을 란'),
+('闍', 'do'),
+('闍', 'to'),
+('闍', '도'),
+('闍', '성문 층대 도'),
+('闏', 'Hanja form of 팽 (“wind that enters a door or through a gap in a door”).'),
+('闏', '문바람'),
+('闏', '팽'),
+('闒', 'attic door'),
+('闒', 't''ap'),
+('闒', 'tap'),
+('闒', '탑'),
+('闓', ' 풀 개'),
+('闓', ' 활깍지 개'),
+('闓', 'gae'),
+('闓', 'kae'),
+('闓', 'kay'),
+('闓', '개'),
+('闓', '열 개'),
+('闔', ' 닫을 합'),
+('闔', 'hap'),
+('闔', 'to close; to shut'),
+('闔', 'whole; entire; all'),
+('闔', '문짝 합'),
+('闔', '합'),
+('闕', 'gwol'),
+('闕', 'kwel'),
+('闕', 'kwŏl'),
+('闕', '궐'),
+('闕', '대궐 궐'),
+('闖', 't''ŭm'),
+('闖', 'teum'),
+('闖', 'thum'),
+('闖', '틈'),
+('闗', '關의 俗字'),
+('闗', '빗장 관'),
+('闚', 'gyu'),
+('闚', 'kyu'),
+('闚', '갸웃이 볼 규'),
+('闚', '규'),
+('關', ' 문지방 완'),
+('關', ' 빗장 완'),
+('關', 'Alternative form of 彎 (“Hanja form of 완 (“stretching a bow; to draw a bow”).”)'),
+('關', 'Hanja form of 관 (“relation; barrier”).'),
+('關', '관'),
+('關', '당길'),
+('關', '빗장'),
+('關', '빗장 관'),
+('關', '완'),
+('關', '화살 먹일 완'),
+('闞', 'ham'),
+('闞', '범 소리 함'),
+('闞', '함'),
+('闠', 'gwe'),
+('闠', 'kwe'),
+('闠', 'kwey'),
+('闠', '궤'),
+('闠', '저자문 궤'),
+('闡', 'ch''ŏn'),
+('闡', 'chen'),
+('闡', 'cheon'),
+('闡', '열 천'),
+('闡', '천'),
+('闢', 'byeok'),
+('闢', 'pyek'),
+('闢', 'pyŏk'),
+('闢', '벽'),
+('闢', '열 벽'),
+('闤', 'hwan'),
+('闤', 'market place'),
+('闤', 'the wall surrounding the market'),
+('闤', '환'),
+('闥', 'door, gate'),
+('闥', '달'),
+('闥', '대문 달'),
+('阜', 'Hanja form of 부 (“hill”).'),
+('阜', '부'),
+('阜', '언덕'),
+('阜', '언덕 부'),
+('阝', 'bu'),
+('阝', 'pu'),
+('阝', '부'),
+('阝', '언덕 부'),
+('阡', 'ch''ŏn'),
+('阡', 'chen'),
+('阡', 'cheon'),
+('阡', '두렁 천'),
+('阡', '천'),
+('阢', 'ol'),
+('阢', '올'),
+('阢', '험할 올 '),
+('阤', ' 사태날 치'),
+('阤', ' 언덕 치'),
+('阤', ' 헐릴 치'),
+('阤', 'ch''i'),
+('阤', 'chi'),
+('阤', 'slope'),
+('阤', '떨어질 치'),
+('阤', '치'),
+('阨', '隘와 同字'),
+('阨', '길 험할'),
+('阨', '막히다'),
+('阨', '막힐'),
+('阨', '막힐 액'),
+('阨', '애'),
+('阨', '액'),
+('阪', ' 언덕 판'),
+('阪', 'Hanja form of 판 (“slope; hill”).'),
+('阪', '산비탈 판'),
+('阪', '언덕'),
+('阪', '판'),
+('阬', 'gaeng'),
+('阬', 'kaeng'),
+('阬', '갱'),
+('阬', '구덩이: pit, hole'),
+('阮', ' 성씨 원'),
+('阮', '성씨 완'),
+('阮', '원나라 원'),
+('阯', 'chi'),
+('阯', 'ci'),
+('阯', 'ji'),
+('阯', '지'),
+('阯', '터 지'),
+('阱', '정'),
+('阱', '함정 정'),
+('防', 'Hanja form of 방 (“dam, embankment”).'),
+('防', 'Hanja form of 방 (“defend”).'),
+('防', 'Hanja form of 방 (“prevent, anti-, -proof”).'),
+('防', '둑 방'),
+('防', '막다'),
+('防', '막을'),
+('防', '방'),
+('阻', 'cho'),
+('阻', 'co'),
+('阻', 'jo'),
+('阻', '조'),
+('阻', '험할 조'),
+('阼', 'cho'),
+('阼', 'co'),
+('阼', 'jo'),
+('阼', 'the steps leading to the eastern door'),
+('阼', '동편 층계 조'),
+('阼', '조'),
+('阽', ' 낭비탈 점 '),
+('阽', '낭떠러지 점'),
+('阽', '점'),
+('阿', ' 아름다울 아'),
+('阿', ' 알랑거릴 아'),
+('阿', '누구 옥'),
+('阿', '아'),
+('阿', '언덕'),
+('阿', '언덕 아'),
+('阿', '옥'),
+('阿', '호칭'),
+('陀', ' 땅이름 타'),
+('陀', '비탈 타'),
+('陀', '타'),
+('陂', ' 치우칠 피'),
+('陂', '기울어질 피'),
+('附', 'Hanja form of 부 (“adhere to, append”).'),
+('附', '부'),
+('附', '붙다'),
+('附', '붙을'),
+('附', '붙을 부'),
+('陋', '줍을 루'),
+('陌', 'maek'),
+('陌', 'mayk'),
+('陌', '두렁 맥'),
+('陌', '맥'),
+('降', ' 돌아갈 강'),
+('降', ' 떨어질 강'),
+('降', 'Hanja form of 강 (“to come down; to descend”).'),
+('降', 'Hanja form of 항 (“to surrender”).'),
+('降', '강'),
+('降', '내리다'),
+('降', '내릴'),
+('降', '내릴 강'),
+('降', '항'),
+('降', '항복하다'),
+('降', '항복할'),
+('降', '항복할 항'),
+('陏', ' 풀열매 라 '),
+('陏', '오이 라'),
+('限', 'Hanja form of 한 (“limit”).'),
+('限', 'han'),
+('限', '한'),
+('限', '한정할 한'),
+('陔', ' 변방 해'),
+('陔', ' 언덕 해'),
+('陔', 'hae'),
+('陔', 'hay'),
+('陔', '층 뜰 해'),
+('陔', '해'),
+('陘', ' 비탈 형'),
+('陘', 'defile'),
+('陘', 'gorge'),
+('陘', 'hyeng'),
+('陘', 'hyeong'),
+('陘', 'hyŏng'),
+('陘', 'oven'),
+('陘', 'slope'),
+('陘', '지레목 형'),
+('陘', '형'),
+('陛', '대궐 섬돌 폐'),
+('陛', '섬돌'),
+('陛', '폐'),
+('陜', '땅이름 합'),
+('陜', '좁을 협'),
+('陝', '고을 이름'),
+('陝', '고을이름 섬'),
+('陝', '섬'),
+('陞', ' 올릴 승'),
+('陞', 'seung'),
+('陞', 'sung'),
+('陞', 'sŭng'),
+('陞', '승'),
+('陞', '오를 승'),
+('陟', 'ch''ŏk'),
+('陟', 'chek'),
+('陟', 'cheok'),
+('陟', 'climb, scale, ascend'),
+('陟', 'proceed'),
+('陟', '오를 척'),
+('陟', '척'),
+('陡', '두'),
+('陡', '절벽 두'),
+('院', ' 공해 원'),
+('院', ' 절 원'),
+('院', ' 학교 원'),
+('院', 'Hanja form of 원 (“institution”).'),
+('院', '원'),
+('院', '원집 원'),
+('院', '집'),
+('陣', '줄 진'),
+('陣', '진'),
+('除', 'Hanja form of 덜 (“remove”).'),
+('除', '덜'),
+('除', '덜다'),
+('除', '섬돌 제'),
+('除', '제'),
+('陥', 'ham'),
+('陥', '빠질 함'),
+('陥', '함'),
+('陪', 'bae'),
+('陪', 'pae'),
+('陪', 'pay'),
+('陪', '배'),
+('陪', '쌓아올릴 배'),
+('陬', ' 마을 추'),
+('陬', ' 부끄러울 추'),
+('陬', ' 정월 추'),
+('陬', 'ch''u'),
+('陬', 'chu'),
+('陬', 'chwu'),
+('陬', '벼루 추'),
+('陬', '추'),
+('陰', ' 몰래 음'),
+('陰', ' 부인에게 예 가르칠 음'),
+('陰', ' 세월 음'),
+('陰', 'Hanja form of 암 (“to be silent”).'),
+('陰', 'Hanja form of 음 (“dark; shady”).'),
+('陰', '그늘'),
+('陰', '암'),
+('陰', '음'),
+('陰', '음기 음'),
+('陰', '침묵하다'),
+('陰', '침묵할'),
+('陲', ' 위태할 수'),
+('陲', 'su'),
+('陲', 'swu'),
+('陲', '변방 수'),
+('陲', '수'),
+('陳', 'To spread, to lay out, to unfold.'),
+('陳', 'chin'),
+('陳', 'cin'),
+('陳', 'jin'),
+('陳', '늘어놓을 진'),
+('陳', '진'),
+('陴', 'a parapet on a city wall'),
+('陴', '비'),
+('陴', '성가퀴 비'),
+('陵', 'Hanja form of 릉/능 (“imperial tomb”).'),
+('陵', 'Hanja form of 릉/능 (“small hill; mound”).'),
+('陵', '능'),
+('陵', '릉'),
+('陵', '언덕'),
+('陵', '큰 언덕 릉'),
+('陶', ' 순임금의 신하 요'),
+('陶', 'Hanja form of 도 (“peaceful, harmonious, happy”).'),
+('陶', 'Hanja form of 도 (“pottery, ceramics, earthenware”).'),
+('陶', '도'),
+('陶', '순임금의 신하'),
+('陶', '요'),
+('陶', '질 그도'),
+('陶', '질 그도 도'),
+('陶', '화락하다'),
+('陶', '화락할'),
+('陶', '화락할 요'),
+('陷', 'Hanja form of 함 (“fall into”).'),
+('陷', '빠지다'),
+('陷', '빠질'),
+('陷', '빠질 함'),
+('陷', '함'),
+('陸', 'Alternative form of 六 (“Hanja form of 륙/육 (“six”).”)'),
+('陸', 'Hanja form of 륙/육 (“(dry) land”).'),
+('陸', 'Hanja form of 륙/육 (“(dry) land”). [affix]'),
+('陸', '륙'),
+('陸', '뭍'),
+('陸', '뭍 륙'),
+('陸', '여섯'),
+('陸', '육'),
+('険', '險의 略字'),
+('陼', ' 둔덕 저'),
+('陼', ' 언덕 저'),
+('陼', 'ce'),
+('陼', 'chŏ'),
+('陼', 'jeo'),
+('陼', '모래섬 저'),
+('陼', '저'),
+('陽', ' 거짓 양'),
+('陽', ' 드러낼 양'),
+('陽', ' 시월 양'),
+('陽', 'Hanja form of 양 (“male; yang (in contrast to yin)”).'),
+('陽', 'Hanja form of 양 (“sky; the sun; sun light; morning”).'),
+('陽', '볕'),
+('陽', '볕 양'),
+('陽', '양'),
+('隄', 'cey'),
+('隄', 'che'),
+('隄', 'je'),
+('隄', '堤와 同字'),
+('隄', '제'),
+('隅', ' 기슭 우'),
+('隅', 'u'),
+('隅', 'wu'),
+('隅', '모퉁이 우'),
+('隅', '우'),
+('隆', 'Hanja form of 륭/융 (“prosperous, plentiful, abundant”).'),
+('隆', '륭'),
+('隆', '융'),
+('隆', '크다'),
+('隆', '클'),
+('隆', '클 륭'),
+('隈', '굽이'),
+('隈', '모퉁이 외'),
+('隈', '외'),
+('隉', 'el'),
+('隉', 'eol'),
+('隉', 'ŏl'),
+('隉', '얼'),
+('隉', '위태할 얼'),
+('隊', 'Hanja form of 대 (“team”).'),
+('隊', '군대 대'),
+('隊', '대'),
+('隊', '떼'),
+('隋', '수'),
+('隋', '수나라 수'),
+('隍', 'hwang'),
+('隍', '해자 황'),
+('隍', '황'),
+('階', 'Hanja form of 계 (“rank, degree”).'),
+('階', 'Hanja form of 계 (“steps, stairs”).'),
+('階', '계'),
+('階', '섬돌'),
+('階', '섬돌 계'),
+('随', 'su'),
+('随', 'swu'),
+('随', '隨의 譌字'),
+('随', '수'),
+('隐', '隱과 同字'),
+('隑', '기'),
+('隑', '사닥다리 기 '),
+('隔', ' 멀 격'),
+('隔', 'Hanja form of 경 (“block, enclose”).'),
+('隔', 'Hanja form of 경 (“separate, partition”).'),
+('隔', '격'),
+('隔', '막다'),
+('隔', '막을'),
+('隔', '막을 격'),
+('隕', ' 곤란할 운'),
+('隕', 'Hanja form of 운 (“fall”).'),
+('隕', '떨어지다'),
+('隕', '떨어질'),
+('隕', '떨어질 운'),
+('隕', '운'),
+('隕', '폭원 원'),
+('隗', ' 성씨 외'),
+('隗', 'high'),
+('隗', 'lofty'),
+('隗', '높을 외'),
+('隗', '아'),
+('隘', 'Hanja form of 애 (“narrow”).'),
+('隘', '阨과 同字'),
+('隘', '애'),
+('隘', '좁다'),
+('隘', '좁을'),
+('隘', '좁을 애'),
+('隙', 'Hanja form of 극 (“crack; crevice; gap”).'),
+('隙', '극'),
+('隙', '틈'),
+('隙', '틈 극'),
+('際', 'Hanja form of 제 (“border”).'),
+('際', 'Hanja form of 제 (“occasion”).'),
+('際', '가'),
+('際', '사이 제'),
+('際', '제'),
+('際', '즈음'),
+('障', 'Hanja form of 장 (“block”).'),
+('障', '막다'),
+('障', '막을'),
+('障', '막을 장'),
+('障', '장'),
+('隠', '隱의 俗字'),
+('隣', '鄰의 俗字'),
+('隣', '린'),
+('隣', '인'),
+('隤', ' 땅이름 퇴'),
+('隤', ' 미끄러질 퇴'),
+('隤', ' 부드러울 퇴'),
+('隤', 't''oe'),
+('隤', 'thoy'),
+('隤', 'toe'),
+('隤', '무너질 퇴'),
+('隤', '퇴'),
+('隧', ' 구멍 수'),
+('隧', ' 길 수'),
+('隧', 'su'),
+('隧', 'swu'),
+('隧', '무덤길 수'),
+('隧', '수'),
+('隨', ' 괘 이름 수'),
+('隨', ' 나라이름 수'),
+('隨', ' 맡길 수'),
+('隨', 'su'),
+('隨', 'swu'),
+('隨', '따를 수'),
+('隨', '수'),
+('隩', ' 물가 언덕 오'),
+('隩', 'bend in river'),
+('隩', 'conceal'),
+('隩', 'hide'),
+('隩', 'inhabited'),
+('隩', 'o'),
+('隩', '감출 오'),
+('隩', '오'),
+('險', 'hem'),
+('險', 'heom'),
+('險', 'hŏm'),
+('險', '험'),
+('險', '험할 험'),
+('隬', 'Used in Chinese place names.'),
+('隬', '니'),
+('隬', '땅 이름'),
+('隬', '이'),
+('隮', 'cey'),
+('隮', 'che'),
+('隮', 'je'),
+('隮', '무지개: rainbow'),
+('隮', '오르다: go up, climb'),
+('隮', '제'),
+('隰', 'seup'),
+('隰', 'sup'),
+('隰', 'sŭp'),
+('隰', '습'),
+('隰', '진펄 습'),
+('隱', ' 불쌍히 여길 은'),
+('隱', ' 속걱정할 은'),
+('隱', ' 쌓을 은'),
+('隱', ' 아낄 은'),
+('隱', ' 의지할 은'),
+('隱', ' 점칠 은'),
+('隱', 'Hanja form of 은 (“hide”).'),
+('隱', '숨다'),
+('隱', '숨을'),
+('隱', '숨을 은'),
+('隱', '은'),
+('隳', 'hyu'),
+('隳', '무너뜨릴 휴'),
+('隳', '휴'),
+('隴', '고개 이름 롱'),
+('隶', '밑 이'),
+('隷', '隸와 同字'),
+('隸', 'Hanja form of 례/예 (“be subserviant to, servant”).'),
+('隸', '례'),
+('隸', '붙을 례'),
+('隸', '예'),
+('隸', '종'),
+('隹', '새 추'),
+('隹', '추'),
+('隺', 'hak'),
+('隺', '학'),
+('隻', 'ch''ŏk'),
+('隻', 'chek'),
+('隻', '새 한 마리 척'),
+('隻', '척'),
+('隼', 'chun'),
+('隼', 'cwun'),
+('隼', 'jun'),
+('隼', '새매 준'),
+('隼', '준'),
+('雀', 'cak'),
+('雀', 'chak'),
+('雀', 'jak'),
+('雀', '작'),
+('雀', '참새 작'),
+('雁', 'wild goose, whose skein flies in wedge or cuneiform, in contrast with 鵝 (거위 아, geowi-a), the domestic goose that would not fly at all.'),
+('雁', '鴈과 同字'),
+('雁', '기러기'),
+('雁', '안'),
+('雄', ' 영웅 웅'),
+('雄', ' 웅장할 웅'),
+('雄', 'Hanja form of 웅 (“(usually of animals) male”).'),
+('雄', '수컷'),
+('雄', '수컷 웅'),
+('雄', '웅'),
+('雅', 'a'),
+('雅', 'elegant, neat, tidy'),
+('雅', '아'),
+('雅', '아담할 아'),
+('集', 'Hanja form of 집 (“collection”).'),
+('集', '모을'),
+('集', '모일 집'),
+('集', '집'),
+('雇', 'Hanja form of 고 (“employment”).'),
+('雇', '고'),
+('雇', '새 이름 호'),
+('雇', '새이름 고'),
+('雇', '품 팔'),
+('雉', ' 목맬 치'),
+('雉', ' 성 윗담 치'),
+('雉', ' 폐백 치'),
+('雉', '꿩 치'),
+('雉', '치'),
+('雋', 'chun'),
+('雋', 'cwun'),
+('雋', 'jun'),
+('雋', '儁·俊과 同字'),
+('雋', '준'),
+('雌', 'ca'),
+('雌', 'cha'),
+('雌', 'ja'),
+('雌', '암컷 자'),
+('雌', '자'),
+('雍', ' 학교 옹'),
+('雍', 'ong'),
+('雍', '옹'),
+('雍', '조화로울 옹'),
+('雎', ' 원앙 저'),
+('雎', ' 증경이 저'),
+('雎', 'ce'),
+('雎', 'chŏ'),
+('雎', 'jeo'),
+('雎', '저'),
+('雎', '저구 저'),
+('雐', 'bird name'),
+('雐', 'ho'),
+('雐', '호'),
+('雑', '雜의 俗字'),
+('雒', '낙'),
+('雒', '락'),
+('雒', '수리부엉이 락'),
+('雕', 'cho'),
+('雕', 'co'),
+('雕', 'jo'),
+('雕', '독수리 조'),
+('雕', '조'),
+('雖', ' 벌레이름 수'),
+('雖', 'Hanja form of 수 (“The name of a bug”).'),
+('雖', 'Hanja form of 수 (“although”).'),
+('雖', 'Hanja form of 유 (“The name of a beast”).'),
+('雖', '벌레 이름'),
+('雖', '비록'),
+('雖', '비록 수'),
+('雖', '수'),
+('雖', '유'),
+('雖', '짐승 이름'),
+('雙', 'Hanja form of 쌍 (“pair”).'),
+('雙', '쌍'),
+('雙', '짝 쌍'),
+('雚', 'heron'),
+('雚', 'small cup'),
+('雚', '관'),
+('雚', '황새'),
+('雚', '황새 관'),
+('雛', ' 병아리 추'),
+('雛', ' 어린아이 추'),
+('雛', '새 새끼 추'),
+('雛', '추'),
+('雜', '섞일 잡'),
+('雜', '잡'),
+('雝', ' 학교 옹'),
+('雝', 'ong'),
+('雝', '옹'),
+('雝', '조화로울 옹'),
+('雞', 'Hanja form of 계 (“chicken”).'),
+('雞', '계'),
+('雞', '닭'),
+('雞', '닭 계'),
+('雟', '휴'),
+('離', 'Alternative form of 儷 (“Hanja form of 려/여 (“in pair”).”)'),
+('離', 'Alternative form of 离 (“Hanja form of 치 (“a kind of legendary beast”).”)'),
+('離', 'Alternative form of 螭 (“Hanja form of 치 (“a kind of dragon”).”)'),
+('離', 'Alternative form of 麗 (“Hanja form of 려/여 (“to adhere”).”)'),
+('離', 'Hanja form of 리/이 (“division”).'),
+('離', 'Hanja form of 리/이 (“separation; departure”).'),
+('離', 'Hanja form of 리/이 (“to leave”).'),
+('離', '교룡(蛟龍)'),
+('離', '나란히 할'),
+('離', '떠나다'),
+('離', '떠날'),
+('離', '떼 놓을 리'),
+('離', '려'),
+('離', '리'),
+('離', '맹수(猛獸)'),
+('離', '붙을'),
+('離', '여'),
+('離', '이'),
+('離', '치'),
+('難', ' 탈 나'),
+('難', 'Hanja form of 난 (“difficulty”).'),
+('難', '난'),
+('難', '성할 나'),
+('難', '어려울'),
+('難', '어려울 난'),
+('難', '어렵다'),
+('雧', 'chip'),
+('雧', 'cip'),
+('雧', 'jip'),
+('雧', '집'),
+('雨', 'Hanja form of 우 (“rain”).'),
+('雨', 'Hanja form of 우 (“rain”). [affix]'),
+('雨', '비'),
+('雨', '비 우'),
+('雨', '우'),
+('雩', 'a shamanistic service to pray for rain'),
+('雩', '기우제 우'),
+('雩', '우'),
+('雪', 'Hanja form of 설 (“snow”).'),
+('雪', 'Hanja form of 설 (“snow”). [affix]'),
+('雪', '눈'),
+('雪', '눈 설'),
+('雪', '설'),
+('雯', 'mun'),
+('雯', '구름 무늬 문'),
+('雯', '문'),
+('雰', 'Hanja form of 분 (“atmosphere; fog”).'),
+('雰', '분'),
+('雰', '안개'),
+('雰', '안개 분'),
+('雲', ' 팔대손 운'),
+('雲', ' 하늘 운'),
+('雲', 'Hanja form of 운 (“cloud”).'),
+('雲', '구름'),
+('雲', '구름 운'),
+('雲', '운'),
+('零', 'Hanja form of 령/영 (“zero”).'),
+('零', '떨어지다'),
+('零', '떨어질'),
+('零', '련'),
+('零', '령'),
+('零', '연'),
+('零', '영'),
+('零', '조용히 오는 비 련'),
+('零', '조용히 오는 비 령'),
+('零', '종족 이름'),
+('雷', 'Hanja form of 뢰/뇌 (“thunder; lightning bolt”).'),
+('雷', '뇌'),
+('雷', '뢰'),
+('雷', '우레'),
+('雷', '우뢰 뢰'),
+('雹', 'Hanja form of 박 (“hail”).'),
+('雹', '누리 박'),
+('雹', '박'),
+('雹', '우박'),
+('雺', 'mong'),
+('雺', '몽'),
+('雺', '안개 몽 '),
+('電', ' 전기 전'),
+('電', 'Hanja form of 전 (“electricity; electric”).'),
+('電', 'Hanja form of 전 (“electricity; electric”). [affix]'),
+('電', '번개'),
+('電', '번개 전'),
+('電', '전'),
+('需', ' 괘 이름 수'),
+('需', ' 기다릴 수'),
+('需', ' 머뭇거릴 수'),
+('需', ' 찾을 수'),
+('需', 'su'),
+('需', 'swu'),
+('需', '수'),
+('需', '음식 수'),
+('霄', ' 진눈깨비 소'),
+('霄', 'so'),
+('霄', '소'),
+('霄', '하늘 소'),
+('霅', '비올 삽'),
+('霅', '삽'),
+('霆', ' 번개 정'),
+('霆', 'ceng'),
+('霆', 'chŏng'),
+('霆', 'jeong'),
+('霆', '벼락 정'),
+('霆', '정'),
+('震', 'chin'),
+('震', 'cin'),
+('震', 'jin'),
+('震', '벼락 진'),
+('震', '진'),
+('霈', 'p''ae'),
+('霈', 'pae'),
+('霈', 'phay'),
+('霈', '비 쏟아질 패'),
+('霈', '패'),
+('霉', 'mae'),
+('霉', 'may'),
+('霉', '매'),
+('霉', '매우 매'),
+('霌', 'chu'),
+('霌', 'cwu'),
+('霌', 'ju'),
+('霌', '운우 모양 주 '),
+('霌', '주'),
+('霍', 'gwak'),
+('霍', 'kwak'),
+('霍', '곽'),
+('霍', '빠를 곽'),
+('霎', 'Hanja form of 삽 (“an instant”).'),
+('霎', '가랑비 삽'),
+('霎', '삽'),
+('霎', '잠시'),
+('霏', 'bi'),
+('霏', 'pi'),
+('霏', '눈 펄펄 내릴 비'),
+('霏', '비'),
+('霑', ' 비 지정거릴 점'),
+('霑', 'cem'),
+('霑', 'chŏm'),
+('霑', 'jeom'),
+('霑', '점'),
+('霑', '젖을 점'),
+('霓', 'Hanja form of 예 (“rainbow”).'),
+('霓', '무지개'),
+('霓', '암무지개 예'),
+('霓', '예'),
+('霔', 'chu'),
+('霔', 'cwu'),
+('霔', 'ju'),
+('霔', '장마 주 '),
+('霔', '주'),
+('霖', '장마 림'),
+('霙', ' 구름 피어오를 영'),
+('霙', 'eyng'),
+('霙', 'yeong'),
+('霙', 'yŏng'),
+('霙', '눈꽃 영'),
+('霙', '영'),
+('霜', 'Hanja form of 상 (“frost”).'),
+('霜', '상'),
+('霜', '서리'),
+('霜', '서리 상'),
+('霝', 'drops of rain'),
+('霝', 'to fall, drop'),
+('霝', '령'),
+('霝', '영'),
+('霞', 'Hanja form of 하 (“the light and clouds at sunrise and sunset; mist; rosy clouds”).'),
+('霞', '노을'),
+('霞', '놀 하'),
+('霞', '하'),
+('霣', ' 천둥에 비 몰아올 운'),
+('霣', '떨어질 운'),
+('霣', '운'),
+('霦', 'bin'),
+('霦', 'pin'),
+('霦', '빈'),
+('霦', '옥 광채 빈 '),
+('霧', ' 어두울 무'),
+('霧', 'Hanja form of 무 (“fog; mist”).'),
+('霧', '무'),
+('霧', '안개'),
+('霧', '안개 무'),
+('霪', 'eum'),
+('霪', 'um'),
+('霪', 'ŭm'),
+('霪', '음'),
+('霪', '장마 음'),
+('霰', ' 별 선'),
+('霰', 'Hanja form of 산/선 (“hail”).'),
+('霰', '산'),
+('霰', '선'),
+('霰', '싸라기눈'),
+('霰', '싸라기눈 산'),
+('霰', '싸락눈 선'),
+('霱', '상서로운 구름'),
+('霱', '휼'),
+('露', 'Hanja form of 로/노 (“Alternative form referring to Russia (in compounds, in news media)”).'),
+('露', 'Hanja form of 로/노 (“dew”).'),
+('露', 'Hanja form of 로/노 (“open; to reveal; to appear”).'),
+('露', '노'),
+('露', '로'),
+('露', '이슬'),
+('露', '이슬 로'),
+('霸', ' 패왕 패'),
+('霸', 'Hanja form of 패 (“the best; the top; the head”).'),
+('霸', '달력 백'),
+('霸', '으뜸'),
+('霸', '으뜸 패'),
+('霸', '패'),
+('霹', 'Hanja form of 벽 (“thunder”).'),
+('霹', '벼락'),
+('霹', '벼락 벽'),
+('霹', '벽'),
+('霺', 'Alternative form of 溦.'),
+('霺', '미'),
+('霺', '이슬비'),
+('霽', 'cey'),
+('霽', 'che'),
+('霽', 'je'),
+('霽', '갤 제'),
+('霽', '제'),
+('霾', 'mae'),
+('霾', 'may'),
+('霾', '매'),
+('霾', '흙비 올 매'),
+('靀', '몽'),
+('靀', '보슬비'),
+('靂', 'Hanja form of 력/역 (“thunder”).'),
+('靂', '력'),
+('靂', '벼락'),
+('靂', '벼락 력'),
+('靂', '역'),
+('靄', 'ae'),
+('靄', 'ay'),
+('靄', '아지랭이 애'),
+('靄', '애'),
+('靆', 'ch''e'),
+('靆', 'che'),
+('靆', 'chey'),
+('靆', '구름 낄 체'),
+('靆', '체'),
+('靈', 'Hanja form of 령/영 (“spirit, soul, deity”).'),
+('靈', '령'),
+('靈', '신령'),
+('靈', '신령 령'),
+('靈', '영'),
+('靉', 'ae'),
+('靉', 'ay'),
+('靉', '구름낄 애'),
+('靉', '애'),
+('靌', 'bo'),
+('靌', 'po'),
+('靌', '보'),
+('靏', 'hak'),
+('靏', '두루미 (durumi) crane'),
+('靏', '학'),
+('靏', '학 (hak) crane'),
+('靑', 'Hanja form of 청 (“blue; azure; green”).'),
+('靑', '청'),
+('靑', '푸르다'),
+('靑', '푸를'),
+('靑', '푸를 청'),
+('青', 'Alternative form of 靑 (“blue; green”)'),
+('青', '청'),
+('青', '푸르다'),
+('青', '푸를'),
+('青', '푸를 청'),
+('靖', ' 생각할 정'),
+('靖', ' 편안할 정'),
+('靖', 'ceng'),
+('靖', 'chŏng'),
+('靖', 'jeong'),
+('靖', '다스릴 정'),
+('靖', '정'),
+('靚', ' 밝을 정'),
+('靚', 'ceng'),
+('靚', 'chŏng'),
+('靚', 'jeong'),
+('靚', 'make up face'),
+('靚', 'ornament'),
+('靚', 'quiet'),
+('靚', '단장할 정'),
+('靚', '정'),
+('靛', 'cen'),
+('靛', 'chŏn'),
+('靛', 'jeon'),
+('靛', '전'),
+('靛', '푸른 대 전'),
+('靜', ' 쉴 정'),
+('靜', ' 조용할 정'),
+('靜', ' 편안할 정'),
+('靜', 'Hanja form of 정 (“quiet, silence, static”).'),
+('靜', 'ceng'),
+('靜', 'chŏng'),
+('靜', 'jeong'),
+('靜', '고요할 정'),
+('靜', '정'),
+('靝', 'ch''ŏn'),
+('靝', 'chen'),
+('靝', 'cheon'),
+('靝', '천'),
+('靝', '하늘 천'),
+('非', 'Hanja form of 비 (“not”).'),
+('非', 'Hanja form of 비 (“un-; in-; non-”).'),
+('非', '비'),
+('非', '아니다'),
+('非', '아닐'),
+('非', '아닐 비'),
+('靠', 'go'),
+('靠', 'ko'),
+('靠', '고'),
+('靠', '기댈 고'),
+('靡', ' 쏠릴 미'),
+('靡', '미'),
+('靡', '쓰러질 미'),
+('面', 'Hanja form of 면 (“(government) township”).'),
+('面', 'Hanja form of 면 (“(government) township”). [noun]'),
+('面', 'Hanja form of 면 (“side; aspect”).'),
+('面', 'Hanja form of 면 (“side; aspect”). [noun]'),
+('面', '낯'),
+('面', '낯 면'),
+('面', '면'),
+('靦', ' 물끄러미 볼 전'),
+('靦', 'cen'),
+('靦', 'chŏn'),
+('靦', 'jeon'),
+('靦', '무안할 전'),
+('靦', '전'),
+('靨', ' 얼굴의 검은 사마귀 엽'),
+('靨', 'yeop'),
+('靨', 'yep'),
+('靨', 'yŏp'),
+('靨', '엽'),
+('靨', '웃는 볼 옴쏙 들어갈 엽'),
+('革', ' 갑주 혁'),
+('革', ' 고칠 혁'),
+('革', '가죽 혁'),
+('革', '극'),
+('革', '위독해질 극'),
+('靭', 'in'),
+('靭', '韌과 同字'),
+('靭', '인'),
+('靳', 'martingale'),
+('靳', '근'),
+('靳', '아낄 근'),
+('靴', 'footwear made of leather'),
+('靴', 'hwa'),
+('靴', '신 화'),
+('靴', '화'),
+('靵', '단추 뉴 '),
+('靶', 'p''a'),
+('靶', 'pa'),
+('靶', 'pha'),
+('靶', 'reins'),
+('靶', 'target'),
+('靶', '고삐 파'),
+('靶', '파'),
+('靷', 'in'),
+('靷', '가슴걸이 인'),
+('靷', '인'),
+('靺', 'mal'),
+('靺', '말'),
+('靺', '버선 말'),
+('靼', '다룬가죽 달'),
+('靼', '달'),
+('鞀', '도'),
+('鞀', '소고 도'),
+('鞁', ' 안갑 피 '),
+('鞁', 'p''i'),
+('鞁', 'phi'),
+('鞁', 'pi'),
+('鞁', '말 가슴걸이 피'),
+('鞁', '피'),
+('鞄', ' 가죽 다로는 장인 포'),
+('鞄', '가방 포'),
+('鞄', '포'),
+('鞅', ' 소고삐 앙'),
+('鞅', 'ang'),
+('鞅', '가슴걸이 앙'),
+('鞅', '앙'),
+('鞋', '신 혜'),
+('鞋', '혜'),
+('鞍', '안'),
+('鞍', '안장 안'),
+('鞏', '공'),
+('鞏', '묶을 공'),
+('鞔', 'man'),
+('鞔', '만'),
+('鞔', '신울 만'),
+('鞘', 'ch''o'),
+('鞘', 'cho'),
+('鞘', '초'),
+('鞘', '칼집 초'),
+('鞚', 'gong'),
+('鞚', 'kong'),
+('鞚', '공'),
+('鞚', '재갈: bridle'),
+('鞞', 'byeong'),
+('鞞', 'pyeng'),
+('鞞', 'pyŏng'),
+('鞞', '병'),
+('鞞', '칼집: sheath'),
+('鞠', 'guk'),
+('鞠', 'kuk'),
+('鞠', 'kwuk'),
+('鞠', '국'),
+('鞠', '기를 국'),
+('鞣', ' 마른 가죽 유'),
+('鞣', 'yu'),
+('鞣', '다룬 가죽 유'),
+('鞣', '유'),
+('鞦', ' 말고들개 추'),
+('鞦', 'ch''u'),
+('鞦', 'chu'),
+('鞦', 'chwu'),
+('鞦', '그네 추'),
+('鞦', '추'),
+('鞨', ' 말갈보석 갈'),
+('鞨', 'gal'),
+('鞨', 'kal'),
+('鞨', '갈'),
+('鞨', '말갈나라 갈'),
+('鞫', '구'),
+('鞬', ' 동개 건'),
+('鞬', 'a leather case for bow and arrow'),
+('鞬', 'bundle'),
+('鞬', 'geon'),
+('鞬', 'ken'),
+('鞬', 'kŏn'),
+('鞬', '건'),
+('鞬', '칼집 건'),
+('鞭', ' 볼기채 편'),
+('鞭', ' 태장 편'),
+('鞭', 'p''yŏn'),
+('鞭', 'phyen'),
+('鞭', 'pyeon'),
+('鞭', '채찍 편'),
+('鞭', '편'),
+('鞮', 'cey'),
+('鞮', 'che'),
+('鞮', 'je'),
+('鞮', 'leather shoes'),
+('鞮', '가죽신 제'),
+('鞮', '제'),
+('鞰', 'on'),
+('鞰', '온'),
+('鞱', 'do'),
+('鞱', 'to'),
+('鞱', '너그러울 도 '),
+('鞱', '도'),
+('鞲', '구'),
+('鞲', '팔찌 구'),
+('鞳', 't''ap'),
+('鞳', 'tap'),
+('鞳', '탑'),
+('鞴', 'bellows'),
+('鞴', 'bi'),
+('鞴', 'pi'),
+('鞴', '비'),
+('鞴', '풀무 비'),
+('鞶', 'ban'),
+('鞶', 'pan'),
+('鞶', '반'),
+('鞶', '큰 띠: A big band'),
+('鞸', 'p''il'),
+('鞸', 'phil'),
+('鞸', 'pil'),
+('鞸', '슬갑 필'),
+('鞸', '필'),
+('鞹', 'gwak'),
+('鞹', 'kwak'),
+('鞹', '곽'),
+('鞹', '무두질한 가죽 곽'),
+('鞽', 'gyo'),
+('鞽', 'kyo'),
+('鞽', '교'),
+('鞽', '신 교 '),
+('鞾', 'hwa'),
+('鞾', 'shoes; boots; footwear; footgear'),
+('鞾', '화'),
+('韁', 'bridle'),
+('韁', 'gang'),
+('韁', 'kang'),
+('韁', 'reins'),
+('韁', '강'),
+('韁', '고삐 강'),
+('韃', 'dal'),
+('韃', 'tal'),
+('韃', '달'),
+('韃', '칠 달'),
+('韆', 'ch''ŏn'),
+('韆', 'chen'),
+('韆', 'cheon'),
+('韆', '그네 천'),
+('韆', '천'),
+('韉', 'ch''ŏn'),
+('韉', 'chen'),
+('韉', 'cheon'),
+('韉', '언치 천'),
+('韉', '천'),
+('韋', ' 군복 위'),
+('韋', ' 성씨 위'),
+('韋', ' 훌부들할 위'),
+('韋', '다룬 가죽 위'),
+('韋', '위'),
+('韍', 'a leather knee-pad worn during sacrifices'),
+('韍', 'bul'),
+('韍', 'pul'),
+('韍', '불'),
+('韍', '폐슬 불'),
+('韎', 'leather'),
+('韎', 'red leather'),
+('韎', '매'),
+('韐', '가죽바지 갑'),
+('韐', '갑'),
+('韓', 'Hanja form of 한 (“Han (ancient Chinese county, viscounty, and kingdom of the Zhou dynasty)”).'),
+('韓', 'Hanja form of 한 (“Korea, the Republic of Korea”).'),
+('韓', 'Hanja form of 한 (“a surname.”).'),
+('韓', 'Hanja form of 한 (“common designation of Mahan, Byeonhan, and Jinhan”).'),
+('韓', '^한국(韓國)'),
+('韓', '나라 이름'),
+('韓', '나라 이름 한'),
+('韓', '한'),
+('韔', 'ch''ang'),
+('韔', 'chang'),
+('韔', 'wrapper or case for bow'),
+('韔', '창'),
+('韙', 'correct'),
+('韙', 'right'),
+('韙', 'wi'),
+('韙', '옳을 위'),
+('韙', '위'),
+('韜', '도'),
+('韜', '활집 도'),
+('韝', 'gu'),
+('韝', 'ku'),
+('韝', 'kwu'),
+('韝', '구'),
+('韝', '깍지 구'),
+('韞', ' 붉은 빛 온'),
+('韞', 'box'),
+('韞', 'cover'),
+('韞', 'hide'),
+('韞', 'on'),
+('韞', 'orange'),
+('韞', '감출 온'),
+('韞', '온'),
+('韠', 'knee-pad'),
+('韠', 'p''il'),
+('韠', 'phil'),
+('韠', 'pil'),
+('韠', '슬갑 필'),
+('韠', '필'),
+('韡', 'wi'),
+('韡', '꽃 환히 필 위'),
+('韡', '위'),
+('韭', 'gu'),
+('韭', 'ku'),
+('韭', 'kwu'),
+('韭', '구'),
+('韭', '부추 구'),
+('韮', 'gu'),
+('韮', 'ku'),
+('韮', 'kwu'),
+('韮', '韭와 同字'),
+('韮', '구'),
+('韱', 'sem'),
+('韱', 'seom'),
+('韱', 'sŏm'),
+('韱', 'wild onions or leeks'),
+('韱', '산부추 섬'),
+('韱', '섬'),
+('韲', 'cey'),
+('韲', 'che'),
+('韲', 'je'),
+('韲', '양념할 제'),
+('韲', '제'),
+('音', ' 음악 음'),
+('音', ' 편지 음'),
+('音', 'Hanja form of 음 (“pronunciation”).'),
+('音', 'Hanja form of 음 (“sound; news”).'),
+('音', 'Hanja form of 음 (“speech”).'),
+('音', '소리'),
+('音', '소리 음'),
+('音', '음'),
+('韵', '韻과 同字'),
+('韵', '운'),
+('韶', ' 봄 소'),
+('韶', ' 순의 풍류 소'),
+('韶', ' 이을 소'),
+('韶', '소'),
+('韶', '아름다울 소'),
+('韺', 'yeng'),
+('韺', 'yeong'),
+('韺', 'yŏng'),
+('韺', '영'),
+('韺', '풍류이름 영'),
+('韻', ' 소리 맞을 운'),
+('韻', ' 운 운'),
+('韻', 'rhyme'),
+('韻', 'un'),
+('韻', 'vowel'),
+('韻', 'wun'),
+('韻', '운'),
+('韻', '울림 운'),
+('響', ' 소리 마주칠 향'),
+('響', ' 악기 향'),
+('響', '소리 울릴 향'),
+('響', '향'),
+('頀', ' 지킬 호'),
+('頀', '구할 호'),
+('頀', '호'),
+('頁', ' 마리 혈'),
+('頁', ' 페이지(page) 혈'),
+('頁', 'Hanja form of 엽 (“page”).'),
+('頁', '머리'),
+('頁', '머리 혈'),
+('頁', '엽'),
+('頁', '책 면'),
+('頁', '혈'),
+('頂', ' 관 꼭대기 치장하는 장식 정'),
+('頂', ' 꼭대기 정'),
+('頂', 'Hanja form of 정 (“crown or top of the head”).'),
+('頂', 'Hanja form of 정 (“topmost point; peak”).'),
+('頂', '이마 정'),
+('頂', '정'),
+('頂', '정수리'),
+('頃', 'Hanja form of 경 (“width”).'),
+('頃', 'Hanja form of 규 (“measurement of area equal to 100 mu or 6.7 hectares”).'),
+('頃', 'Hanja form of 규 (“moment, half a step”).'),
+('頃', '경'),
+('頃', '규'),
+('頃', '넓이'),
+('頃', '반걸음'),
+('頃', '반걸음 규'),
+('頃', '밭 넓이 단위 경'),
+('項', ' 클 항'),
+('項', ' 항목 항'),
+('項', 'Hanja form of 항 (“(mathematics) term”).'),
+('項', 'Hanja form of 항 (“(mathematics) term”). [noun]'),
+('項', 'Hanja form of 항 (“clause, section; item (in a list)”).'),
+('項', 'Hanja form of 항 (“clause, section; item (in a list)”). [noun]'),
+('項', '목덜미 항'),
+('項', '항'),
+('項', '항목(項目)'),
+('順', ' 부드러울 순'),
+('順', ' 성씨 순'),
+('順', ' 차례 순'),
+('順', 'Hanja form of 순 (“obedience”).'),
+('順', '순'),
+('順', '순할'),
+('順', '좇을 순'),
+('須', ' 기다릴 수'),
+('須', 'su'),
+('須', 'swu'),
+('須', '수'),
+('須', '수염 수'),
+('頉', 'Hanja form of 탈 (“accident”).'),
+('頉', '기를 이'),
+('頉', '이'),
+('頉', '탈'),
+('頊', ' 별이름 욱'),
+('頊', 'uk'),
+('頊', 'wuk'),
+('頊', '머리 굽실거릴 욱'),
+('頊', '욱'),
+('頌', ' 모양 용'),
+('頌', ' 찬양하는 노래 송'),
+('頌', ' 칭송할 송'),
+('頌', '기릴 송'),
+('頌', '얼굴 용'),
+('頍', 'gyu'),
+('頍', 'kyu'),
+('頍', '고깔비녀 규'),
+('頍', '규'),
+('頎', 'gi'),
+('頎', 'ki'),
+('頎', '기'),
+('頎', '헌걸찰 기'),
+('頏', ' 오르락 내리락할 항'),
+('頏', 'hang'),
+('頏', '목 항'),
+('頏', '항'),
+('預', ' 참여할 예'),
+('預', 'ye'),
+('預', 'yey'),
+('預', '미리 예'),
+('預', '예'),
+('頑', ' 완악할 완'),
+('頑', 'wan'),
+('頑', '완'),
+('頑', '완고할 완'),
+('頒', '나눌 반'),
+('頒', '큰 머리 분'),
+('頓', '조아릴 돈'),
+('頓', '조아릴 둔'),
+('頖', 'ban'),
+('頖', 'pan'),
+('頖', '반'),
+('頖', '풀릴 반'),
+('頗', ' 자못 파'),
+('頗', 'p''a'),
+('頗', 'pa'),
+('頗', 'pha'),
+('頗', '비뚤어질 파'),
+('頗', '파'),
+('領', 'Hanja form of 령/영 (“leading; dominion; jurisdiction”).'),
+('領', '거느리다'),
+('領', '거느릴'),
+('領', '령'),
+('領', '영'),
+('領', '옷깃 령'),
+('頚', 'gyeong'),
+('頚', 'kyeng'),
+('頚', 'kyŏng'),
+('頚', '頸의 俗字'),
+('頚', '경'),
+('頞', 'al'),
+('頞', 'the bridge [ridge] of the nose'),
+('頞', '알'),
+('頞', '콧마루 알'),
+('頡', ' 밟을 갈'),
+('頡', '곧은목 힐'),
+('頡', '긁을 갈'),
+('頣', 'sin'),
+('頣', '눈들고 볼 신'),
+('頣', '신'),
+('頤', ' 괘 이름 이'),
+('頤', ' 기를 이'),
+('頤', ' 늙은이 이'),
+('頤', ' 턱 끄덕거릴 이'),
+('頤', 'cheeks'),
+('頤', 'chin'),
+('頤', 'jaw'),
+('頤', 'rear'),
+('頤', 'to nourish'),
+('頤', '이'),
+('頤', '턱 이'),
+('頦', 'hae'),
+('頦', 'hay'),
+('頦', '턱 해'),
+('頦', '해'),
+('頫', 'bend'),
+('頫', 'bow'),
+('頫', 'bu'),
+('頫', 'pu'),
+('頫', '머리 숙일 부'),
+('頫', '부'),
+('頬', '頰과 同字'),
+('頭', 'Hanja form of 두 (“head”).'),
+('頭', '두'),
+('頭', '머리'),
+('頭', '머리 두'),
+('頮', 'hoe'),
+('頮', 'hoy'),
+('頮', '세수할 회'),
+('頮', '회'),
+('頰', ' 천천히 말할 협'),
+('頰', 'amenity'),
+('頰', 'cheeks'),
+('頰', 'jaw'),
+('頰', '뺨 협'),
+('頰', '협'),
+('頲', 'ceng'),
+('頲', 'chŏng'),
+('頲', 'jeong'),
+('頲', '곧다: straight'),
+('頲', '정'),
+('頷', '끄덕일 암'),
+('頷', '암'),
+('頸', 'Hanja form of 경 (“neck”).'),
+('頸', 'Hanja form of 경 (“neck”). [affix]'),
+('頸', '경'),
+('頸', '목'),
+('頸', '목 경'),
+('頹', ' 대머리 퇴'),
+('頹', ' 무너질 퇴'),
+('頹', ' 사나운 바람 퇴'),
+('頹', ' 쇠할 퇴'),
+('頹', 't''oe'),
+('頹', 'thoy'),
+('頹', 'toe'),
+('頹', '기울어질 퇴'),
+('頹', '퇴'),
+('頻', 'bin'),
+('頻', 'pin'),
+('頻', '빈'),
+('頻', '자주 빈'),
+('頼', '賴의 俗字'),
+('頽', 't''oe'),
+('頽', 'thoy'),
+('頽', 'toe'),
+('頽', '頹와 同字'),
+('頽', '퇴'),
+('頿', 'ca'),
+('頿', 'cha'),
+('頿', 'ja'),
+('頿', '자'),
+('頿', '코밑수염 자 '),
+('顂', '덮을 뢰 '),
+('顆', 'grain, kernel'),
+('顆', '과'),
+('顆', '낟알 과'),
+('顇', 'be haggard'),
+('顇', 'be worn-out'),
+('顇', 'ch''wi'),
+('顇', 'chwi'),
+('顇', '취'),
+('顈', 'gyeong'),
+('顈', 'kyeng'),
+('顈', 'kyŏng'),
+('顈', '경'),
+('顈', '홑옷 경 '),
+('顋', ' 볼 시'),
+('顋', 'Hanja form of 새 (“cheek”).'),
+('顋', 'Hanja form of 새 (“gill, branchia”).'),
+('顋', 'Hanja form of 시 (“cheek”).'),
+('顋', 'Hanja form of 시 (“gill, branchia”).'),
+('顋', '뺨'),
+('顋', '뺨 시'),
+('顋', '새'),
+('顋', '시'),
+('題', 'Hanja form of 제 (“title”).'),
+('題', '이마 제'),
+('題', '제'),
+('題', '제목'),
+('額', ' 수량 액'),
+('額', 'Hanja form of 액 (“amount”).'),
+('額', 'Hanja form of 액 (“forehead”).'),
+('額', '액'),
+('額', '이마'),
+('額', '이마 액'),
+('顎', 'ak'),
+('顎', '악'),
+('顎', '턱 악'),
+('顏', ' 색채 안'),
+('顏', 'an'),
+('顏', 'face'),
+('顏', 'facial appearance'),
+('顏', '안'),
+('顏', '얼굴 안'),
+('顒', 'ong'),
+('顒', '옹'),
+('顒', '우러를 옹'),
+('顓', ' 오로지 전'),
+('顓', 'cen'),
+('顓', 'chŏn'),
+('顓', 'honest'),
+('顓', 'jeon'),
+('顓', 'stupid'),
+('顓', '어리석을 전'),
+('顓', '전'),
+('顔', 'Hanja form of 안 (“face”).'),
+('顔', '顏과 同字'),
+('顔', '안'),
+('顔', '얼굴'),
+('顕', '顯의 略字'),
+('顖', 'sin'),
+('顖', 'skull'),
+('顖', 'top of the head'),
+('顖', '囟의 俗字'),
+('顖', '신'),
+('願', ' 바랄 원'),
+('願', ' 생각할 원'),
+('願', 'Hanja form of 원 (“ambition”).'),
+('願', 'Hanja form of 원 (“desire, want”).'),
+('願', 'Hanja form of 원 (“wish”).'),
+('願', '원'),
+('願', '원하다'),
+('願', '원할'),
+('願', '하고자할 원'),
+('顙', 'sang'),
+('顙', '상'),
+('顙', '이마 상'),
+('顚', ' 엎드러질 전'),
+('顚', 'Hanja form of 전 (“to fall”).'),
+('顚', 'cen'),
+('顚', 'chŏn'),
+('顚', 'jeon'),
+('顚', '이마 전'),
+('顚', '전'),
+('顛', 'Alternative form of 顚'),
+('顛', 'cen'),
+('顛', 'chŏn'),
+('顛', 'jeon'),
+('顛', '顚과 同字'),
+('顛', '전'),
+('類', 'Hanja form of 류/유 (“kind, sort, type, class, genus, order, family”).'),
+('類', 'Hanja form of 류/유 (“similar example, parallel”).'),
+('類', '류'),
+('類', '무리'),
+('類', '무리 류'),
+('類', '유'),
+('顥', ' 빛나는 모양 호'),
+('顥', 'ho'),
+('顥', '클 호'),
+('顥', '호'),
+('顦', 'be worn-out'),
+('顦', 'emaciated'),
+('顦', 'haggard'),
+('顦', '야윌 초'),
+('顦', '초'),
+('顧', 'Hanja form of 고 (“look back, look after”).'),
+('顧', 'Hanja form of 고 (“reflect on”).'),
+('顧', '고'),
+('顧', '돌아보다'),
+('顧', '돌아볼'),
+('顧', '돌아볼 고'),
+('顫', ' 머리 비뚤이 전'),
+('顫', 'cen'),
+('顫', 'chŏn'),
+('顫', 'jeon'),
+('顫', '사지 떨릴 전'),
+('顫', '전'),
+('顬', 'temple (of the head)'),
+('顬', '유'),
+('顯', ' 높을 현'),
+('顯', ' 밝을 현'),
+('顯', ' 통달할 현'),
+('顯', '나타날 현'),
+('顯', '현'),
+('顰', 'bin'),
+('顰', 'pin'),
+('顰', '빈'),
+('顰', '찡그릴 빈'),
+('顱', '머리뼈 로'),
+('顳', 'seop'),
+('顳', 'sep'),
+('顳', 'sŏp'),
+('顳', '귀밑 뼈 섭'),
+('顳', '섭'),
+('顴', '관'),
+('顴', '광대뼈 관'),
+('風', ' 경치 풍'),
+('風', ' 모양 풍'),
+('風', ' 병풍 풍'),
+('風', ' 울릴 풍'),
+('風', ' 위엄 풍'),
+('風', ' 풍속 풍'),
+('風', ' 흘레할 풍'),
+('風', 'Hanja form of 풍 (“look; style”).'),
+('風', 'Hanja form of 풍 (“wind”).'),
+('風', '바람'),
+('風', '바람 풍'),
+('風', '풍'),
+('颭', 'blow gently'),
+('颭', 'cem'),
+('颭', 'chŏm'),
+('颭', 'jeom'),
+('颭', 'quiver in the wind'),
+('颭', '점'),
+('颭', '펄렁거릴 점'),
+('颯', 'sap'),
+('颯', '바람소리 삽'),
+('颯', '삽'),
+('颱', 't''ae'),
+('颱', 'tae'),
+('颱', 'thay'),
+('颱', 'typhoon'),
+('颱', '몹시 부는 바람 태'),
+('颱', '태'),
+('颲', '사나운 바람 렬 '),
+('颳', '괄'),
+('颳', '모진 바람 괄'),
+('颶', '구'),
+('颶', '사방풍 구'),
+('颺', ' 높일 양'),
+('颺', 'fly'),
+('颺', 'yang'),
+('颺', '날릴 양'),
+('颺', '양'),
+('颻', 'gale'),
+('颻', 'wind'),
+('颻', 'yo'),
+('颻', '요'),
+('颼', 'su'),
+('颼', 'swu'),
+('颼', '바람소리 수'),
+('颼', '수'),
+('颿', '돛 범'),
+('颿', '범'),
+('飂', '높이 부는 바람 료'),
+('飃', 'flutter'),
+('飃', 'p''yo'),
+('飃', 'phyo'),
+('飃', 'pyo'),
+('飃', 'whirlwind'),
+('飃', '표'),
+('飄', ' 나부낄 표'),
+('飄', ' 떨어질 표'),
+('飄', 'p''yo'),
+('飄', 'phyo'),
+('飄', 'pyo'),
+('飄', '표'),
+('飄', '회오리바람 표'),
+('飆', 'p''yo'),
+('飆', 'phyo'),
+('飆', 'pyo'),
+('飆', '飇와 同字'),
+('飆', '표'),
+('飇', 'p''yo'),
+('飇', 'phyo'),
+('飇', 'pyo'),
+('飇', '표'),
+('飇', '회오리바람 표'),
+('飉', '바람 료 '),
+('飋', 'sil'),
+('飋', '실'),
+('飋', '쓸쓸한 바람 실 '),
+('飛', 'Hanja form of 비 (“to fly”).'),
+('飛', '날'),
+('飛', '날 비'),
+('飛', '날다'),
+('飛', '비'),
+('飜', 'Hanja form of 번 (“flip over, upset, capsize”).'),
+('飜', 'Hanja form of 번 (“fly, soar, circle in the air”).'),
+('飜', 'Hanja form of 번 (“translate”).'),
+('飜', '날'),
+('飜', '날다'),
+('飜', '뒤치다'),
+('飜', '뒤칠'),
+('飜', '뒤칠 번'),
+('飜', '번'),
+('飜', '번역하다'),
+('飜', '번역할'),
+('食', ' 먹을 식'),
+('食', ' 씹을 식'),
+('食', ' 제 식'),
+('食', ' 헛말할 식'),
+('食', 'Hanja form of 사 (“feed”).'),
+('食', 'Hanja form of 식 (“meal; food”).'),
+('食', 'Hanja form of 식 (“to eat”).'),
+('食', 'Hanja form of 이 (“used in personal names”).'),
+('食', '먹다'),
+('食', '먹을'),
+('食', '먹이'),
+('食', '밥'),
+('食', '밥 먹일 사'),
+('食', '밥 식'),
+('食', '사'),
+('食', '사람 이름'),
+('食', '식'),
+('食', '이'),
+('飠', 'KangXi radical 184 "eat, food"'),
+('飠', '먹이'),
+('飠', '밥'),
+('飠', '사'),
+('飠', '식'),
+('飡', 'son'),
+('飡', '飱과 同字'),
+('飡', '손'),
+('飢', 'Hanja form of 기 (“famine”).'),
+('飢', 'Hanja form of 기 (“hunger, starving”).'),
+('飢', 'Hanja form of 기 (“hungry”).'),
+('飢', '기'),
+('飢', '주리다'),
+('飢', '주릴'),
+('飢', '주릴 기'),
+('飣', ' 음식 괼 정'),
+('飣', 'display food for show only'),
+('飣', 'sacrifice'),
+('飣', '굄새 정'),
+('飣', '정'),
+('飦', ' 된죽 전'),
+('飦', 'cen'),
+('飦', 'chŏn'),
+('飦', 'jeon'),
+('飦', '범벅 전'),
+('飦', '전'),
+('飧', ' 물에 만 밥 손'),
+('飧', 'son'),
+('飧', '손'),
+('飧', '저녁밥 손'),
+('飩', '돈'),
+('飪', 'im'),
+('飪', '익힐 임'),
+('飪', '임'),
+('飫', ' 배부를 어'),
+('飫', 'e'),
+('飫', 'eo'),
+('飫', 'ŏ'),
+('飫', '먹기 싫을 어'),
+('飫', '어'),
+('飭', ' 닦을 칙'),
+('飭', ' 부지런할 칙'),
+('飭', 'ch''ik'),
+('飭', 'chik'),
+('飭', '갖출 칙'),
+('飭', '칙'),
+('飮', 'Hanja form of 음 (“to drink”).'),
+('飮', '마시다'),
+('飮', '마실'),
+('飮', '마실 음'),
+('飮', '음'),
+('飯', 'Hanja form of 반 (“meal, rice”).'),
+('飯', '반'),
+('飯', '밥'),
+('飯', '밥 반'),
+('飱', 'son'),
+('飱', '飧의 俗字'),
+('飱', '손'),
+('飲', 'drink'),
+('飲', 'inhale'),
+('飲', '飮과 同字'),
+('飲', '마시다'),
+('飲', '마실'),
+('飲', '음'),
+('飴', '기를 시'),
+('飴', '엿 이'),
+('飻', '철'),
+('飻', '탐할 철 '),
+('飼', 'Hanja form of 사 (“to feed; to raise”).'),
+('飼', '기르다'),
+('飼', '기를'),
+('飼', '먹일 사'),
+('飼', '사'),
+('飽', ' 먹기 싫을 포'),
+('飽', ' 물릴 포'),
+('飽', ' 흡족할 포'),
+('飽', 'Hanja form of 포 (“full”).'),
+('飽', '배부르다'),
+('飽', '배부를'),
+('飽', '배부를 포'),
+('飽', '포'),
+('飾', ' 문채날 식'),
+('飾', ' 분 바를 식'),
+('飾', 'sik'),
+('飾', '꾸밀 식'),
+('飾', '식'),
+('餁', 'im'),
+('餁', '飪과 同字'),
+('餁', '임'),
+('餃', 'kyo'),
+('餃', '경단 교'),
+('餃', '교'),
+('餅', 'Alternative form of 餠 (“Hanja form of 병 (“rice cake”).”)'),
+('餅', '餠의 俗字'),
+('餅', '떡'),
+('餅', '병'),
+('餈', 'cha'),
+('餈', 'ja'),
+('餈', 'steamed rice cakes'),
+('餈', '자'),
+('餉', ' 군량 향'),
+('餉', ' 점심 향'),
+('餉', 'hyang'),
+('餉', '먹일 향'),
+('餉', '향'),
+('養', ' 다스릴 양'),
+('養', ' 봉양할 양'),
+('養', 'Hanja form of 양 (“to raise”).'),
+('養', '기르다'),
+('養', '기를'),
+('養', '기를 양'),
+('養', '양'),
+('餌', ' 먹일 이'),
+('餌', ' 이깝 이'),
+('餌', ' 흰떡 이'),
+('餌', 'i'),
+('餌', '미끼 이'),
+('餌', '이'),
+('餐', ' 물에 만 밥 손'),
+('餐', '먹을 손'),
+('餐', '먹을 찬'),
+('餒', 'noe'),
+('餒', 'noy'),
+('餒', '굶길 뇌'),
+('餒', '뇌'),
+('餓', 'greedy for'),
+('餓', 'hunger'),
+('餓', 'hungry'),
+('餓', '아'),
+('餓', '주릴 아'),
+('餔', ' 먹을 포'),
+('餔', '저녁 곁두리 포'),
+('餔', '포'),
+('餕', 'chun'),
+('餕', 'cwun'),
+('餕', 'jun'),
+('餕', '대궁 준'),
+('餕', '준'),
+('餗', 'food piled high in a cooking vessel'),
+('餗', '속'),
+('餘', ' 나라이름 여'),
+('餘', 'Hanja form of 여 (“remainder”).'),
+('餘', '남다'),
+('餘', '남을'),
+('餘', '남을 여'),
+('餘', '여'),
+('餚', 'hyo'),
+('餚', '반찬 효'),
+('餚', '효'),
+('餛', 'hon'),
+('餛', '혼'),
+('餞', ' 보낼 전'),
+('餞', 'cen'),
+('餞', 'chŏn'),
+('餞', 'jeon'),
+('餞', '전'),
+('餞', '전별잔치 전'),
+('餠', 'rice cake'),
+('餠', '떡'),
+('餠', '떡 병'),
+('餠', '병'),
+('餡', 'ham'),
+('餡', '함'),
+('餦', '산자 장'),
+('餦', '장'),
+('餧', 'food'),
+('餧', 'to feed'),
+('餧', 'wi'),
+('餧', '먹일 위'),
+('餧', '위'),
+('館', 'Hanja form of 관 (“hotel, inn, public building”).'),
+('館', '객사'),
+('館', '객사 관'),
+('館', '관'),
+('餪', '난'),
+('餪', '풀보기 잔치 난'),
+('餬', '기식할 호'),
+('餬', '호'),
+('餮', 'ch''ŏl'),
+('餮', 'chel'),
+('餮', 'cheol'),
+('餮', '철'),
+('餮', '탐할 철'),
+('餰', 'cen'),
+('餰', 'chŏn'),
+('餰', 'jeon'),
+('餰', '된죽 전 '),
+('餰', '전'),
+('餱', 'dried rice'),
+('餱', 'food made for (carrying on) a long way'),
+('餱', 'food made for (carrying on) a long way [journey]'),
+('餱', 'hu'),
+('餱', 'hwu'),
+('餱', '건량 후'),
+('餱', '후'),
+('餲', 'oil-and-honey pastry'),
+('餲', 'spoiled'),
+('餲', '애'),
+('餳', 'dang'),
+('餳', 'tang'),
+('餳', '당'),
+('餳', '엿 당'),
+('餹', 'dang'),
+('餹', 'tang'),
+('餹', '당'),
+('餹', '엿 당'),
+('餼', 'hui'),
+('餼', 'huy'),
+('餼', 'hŭi'),
+('餼', '꾸밀 희'),
+('餼', '희'),
+('餽', 'gwe'),
+('餽', 'kwe'),
+('餽', 'kwey'),
+('餽', '饋와 同字'),
+('餽', '궤'),
+('饁', 'send meal to the field'),
+('饁', 'yeop'),
+('饁', 'yŏp'),
+('饁', '엽'),
+('饂', '밀 국수 온'),
+('饂', '온'),
+('饅', 'man'),
+('饅', '만'),
+('饅', '만두 만'),
+('饈', ' 반찬 수'),
+('饈', 'su'),
+('饈', 'swu'),
+('饈', '드릴 수'),
+('饈', '수'),
+('饉', 'geun'),
+('饉', 'kun'),
+('饉', 'kŭn'),
+('饉', '근'),
+('饉', '주릴 근'),
+('饊', 'can'),
+('饊', 'chan'),
+('饊', 'jan'),
+('饊', '잔'),
+('饋', '궤'),
+('饋', '먹일 궤'),
+('饌', 'Hanja form of 찬 (“side dish”).'),
+('饌', '반찬'),
+('饌', '반찬 찬'),
+('饌', '찬'),
+('饍', 'sen'),
+('饍', 'seon'),
+('饍', 'sŏn'),
+('饍', '膳과 同字'),
+('饍', '선'),
+('饐', 'ui'),
+('饐', 'uy'),
+('饐', 'ŭi'),
+('饐', '밥 쉴 의'),
+('饐', '의'),
+('饑', 'gi'),
+('饑', 'ki'),
+('饑', '기'),
+('饑', '주릴 기'),
+('饒', ' 배부를 요'),
+('饒', 'yo'),
+('饒', '요'),
+('饒', '용서할 요'),
+('饔', 'breakfast'),
+('饔', 'cook'),
+('饔', 'food (and drink)'),
+('饔', 'sacrifice'),
+('饔', '아침밥 옹'),
+('饔', '옹'),
+('饕', '도'),
+('饕', '탐할 도'),
+('饗', ' 흠향할 향'),
+('饗', '잔치할 향'),
+('饗', '향'),
+('饛', 'bowl covered with food'),
+('饛', '그릇에 가득찬 모양'),
+('饛', '몽'),
+('饜', ' 물릴 염'),
+('饜', 'be satiated'),
+('饜', 'eat one''s full'),
+('饜', 'yem'),
+('饜', 'yeom'),
+('饜', 'yŏm'),
+('饜', '싫을 염'),
+('饜', '염'),
+('饞', 'ch''am'),
+('饞', 'cham'),
+('饞', 'gluttonous'),
+('饞', 'greedy'),
+('饞', 'lecherous'),
+('饞', 'lewd'),
+('饞', '참'),
+('饞', '탐할 참'),
+('饟', 'dry food'),
+('饟', 'provisions'),
+('饟', 'yang'),
+('饟', '양'),
+('饤', '飣과 同字'),
+('首', ' 먼저 수'),
+('首', ' 비롯할 수'),
+('首', ' 임금 수'),
+('首', ' 자백할 수'),
+('首', ' 향할 수'),
+('首', 'Hanja form of 수 (“head”).'),
+('首', '머리'),
+('首', '머리 수'),
+('首', '수'),
+('馗', 'cheekbone'),
+('馗', 'gyu'),
+('馗', 'intersection'),
+('馗', 'kyu'),
+('馗', 'path, road'),
+('馗', '규'),
+('馗', '아홉거리 규'),
+('馘', '괵'),
+('馘', '벨 괵'),
+('香', ' 약이름 향'),
+('香', 'Hanja form of 향 (“fragrance; perfume; incense”).'),
+('香', '향'),
+('香', '향내 향'),
+('馝', 'p''il'),
+('馝', 'phil'),
+('馝', 'pil'),
+('馝', '필'),
+('馝', '향내날 필'),
+('馣', '암'),
+('馣', '향기로울 암 '),
+('馥', 'bok'),
+('馥', 'pok'),
+('馥', '복'),
+('馥', '향기 복'),
+('馨', 'hyeng'),
+('馨', 'hyeong'),
+('馨', 'hyŏng'),
+('馨', '향기 형'),
+('馨', '형'),
+('馬', 'Hanja form of 마 (“horse (in compounds)”).'),
+('馬', '마'),
+('馬', '말'),
+('馬', '말 마'),
+('馬', '성'),
+('馭', '말 부릴 어'),
+('馭', '어'),
+('馮', ' 고을이름 풍'),
+('馮', ' 물귀신이름 풍'),
+('馮', ' 성씨 풍'),
+('馮', 'p''ung'),
+('馮', 'phung'),
+('馮', 'pung'),
+('馮', '벼슬이름 풍'),
+('馮', '풍'),
+('馰', ' 소태성 적 '),
+('馰', 'cek'),
+('馰', 'chŏk'),
+('馰', 'jeok'),
+('馰', '별배기 적'),
+('馰', '적'),
+('馱', ' 짐 실을 타'),
+('馱', '타'),
+('馱', '탈 타'),
+('馳', ' 거동길 치'),
+('馳', ' 전할 치'),
+('馳', 'ch''i'),
+('馳', 'chi'),
+('馳', '달릴 치'),
+('馳', '치'),
+('馴', ' 착할 순'),
+('馴', '가르칠 훈'),
+('馴', '길들일 순'),
+('馹', '역말 일'),
+('馹', '일'),
+('駁', 'Hanja form of 박 (“to refute; to rebut”).'),
+('駁', '논박하다'),
+('駁', '논박할'),
+('駁', '박'),
+('駁', '얼룩말 박'),
+('駄', '馱의 俗字'),
+('駅', '驛의 略字'),
+('駆', '驅의 略字'),
+('駆', '구'),
+('駈', 'gu'),
+('駈', 'ku'),
+('駈', 'kwu'),
+('駈', '驅와 同字'),
+('駈', '구'),
+('駉', 'gyeong'),
+('駉', 'kyeng'),
+('駉', 'kyŏng'),
+('駉', 'stout and strong horse'),
+('駉', '경'),
+('駉', '목장 경'),
+('駎', '다투어 달릴'),
+('駎', '추'),
+('駏', ' 거공벌레 거'),
+('駏', 'geo'),
+('駏', 'ke'),
+('駏', 'kŏ'),
+('駏', '거'),
+('駏', '튀기 거'),
+('駐', 'Hanja form of 주 (“to be stationed; to be posted”).'),
+('駐', '머무르다'),
+('駐', '머무를'),
+('駐', '머무를 주'),
+('駐', '주'),
+('駑', '노'),
+('駑', '둔할 노'),
+('駒', 'gu'),
+('駒', 'ku'),
+('駒', 'kwu'),
+('駒', '구'),
+('駒', '망아지 구'),
+('駕', 'Hanja form of 가 (“cart; carriage”).'),
+('駕', '가'),
+('駕', '멍에'),
+('駕', '멍에 가'),
+('駘', '타'),
+('駙', 'close'),
+('駙', 'fast'),
+('駙', 'side horse'),
+('駙', '곁마 부'),
+('駙', '부'),
+('駛', 'sa'),
+('駛', '달릴 사'),
+('駛', '사'),
+('駜', '살찐 말 필'),
+('駜', '필'),
+('駝', ' 곱사등이 타'),
+('駝', 'Hanja form of 타 (“camel”).'),
+('駝', '낙타'),
+('駝', '약대 타'),
+('駝', '타'),
+('駞', 't''a'),
+('駞', 'ta'),
+('駞', 'tha'),
+('駞', '駞와 同字'),
+('駞', '타'),
+('駟', '사'),
+('駟', '사마 사'),
+('駢', '騈의 俗字'),
+('駨', 'sun'),
+('駨', 'swun'),
+('駨', '순'),
+('駪', ' 빨리 걸을 신'),
+('駪', '말 우물거릴 신'),
+('駪', '신'),
+('駭', ' 북 울릴 해'),
+('駭', 'hae'),
+('駭', 'hay'),
+('駭', 'shock'),
+('駭', 'terrify, frighten, scare'),
+('駭', '놀랄 해'),
+('駭', '해'),
+('駮', 'bak'),
+('駮', 'pak'),
+('駮', '박'),
+('駮', '짐승이름 박'),
+('駱', '낙타 락'),
+('駸', '말 몰아 달릴 침'),
+('駸', '침'),
+('駻', '사나운 말 한'),
+('駻', '한'),
+('駽', ' 철총이 현'),
+('駽', 'hyen'),
+('駽', 'hyeon'),
+('駽', 'hyŏn'),
+('駽', '돗총이 현'),
+('駽', '현'),
+('駿', ' 높을 순'),
+('駿', ' 빠를 순'),
+('駿', ' 클 순'),
+('駿', '준마 순'),
+('駿', '준마 준'),
+('騁', '달리다 빙'),
+('騂', ' 누른말 성'),
+('騂', ' 활 물쩡물쩡할 성'),
+('騂', 'seng'),
+('騂', 'seong'),
+('騂', 'sŏng'),
+('騂', '붉은 소 성'),
+('騂', '성'),
+('騃', ' 말달릴 애'),
+('騃', 'stupid, foolish'),
+('騃', '애'),
+('騃', '어리석을 애'),
+('騄', '녹'),
+('騄', '록'),
+('騄', '말이름 록'),
+('騅', '청부루말 추'),
+('騅', '추'),
+('騈', '나란히 할 변'),
+('騈', '나란히 할 병'),
+('騋', '내'),
+('騋', '래'),
+('騋', '큰 말 래'),
+('騍', '과'),
+('騍', '암말 과'),
+('騎', 'Hanja form of 기 (“to ride (a horse)”).'),
+('騎', '기'),
+('騎', '말을 탈'),
+('騎', '말탈 기'),
+('騏', '기'),
+('騏', '털총이 기'),
+('騑', '곁마 비'),
+('騑', '비'),
+('騒', '騷와 同字'),
+('験', '驗의 略字'),
+('騖', ' 질주할 무'),
+('騖', 'run'),
+('騖', 'sprint'),
+('騖', '달릴 무'),
+('騖', '무'),
+('騘', '驄과 同字'),
+('騘', '총'),
+('騙', ' 말에 뛰어 오를 편'),
+('騙', '속일 편'),
+('騙', '편'),
+('騛', 'bi'),
+('騛', 'pi'),
+('騛', '비'),
+('騛', '빠른 말 비 '),
+('騫', ' 이지러질 건'),
+('騫', ' 휙 뛰어 나아갈 건'),
+('騫', '건'),
+('騫', '말 배 앓을 건'),
+('騭', '수말 즐'),
+('騭', '즐'),
+('騰', 'Hanja form of 등 (“fly”).'),
+('騰', 'Hanja form of 등 (“gallop, run, prance”).'),
+('騰', 'Hanja form of 등 (“rise”).'),
+('騰', '등'),
+('騰', '오르다'),
+('騰', '오를'),
+('騰', '오를 등'),
+('騳', 'dok'),
+('騳', 'tok'),
+('騳', '달리다: run'),
+('騳', '독'),
+('騵', 'wen'),
+('騵', 'won'),
+('騵', 'wŏn'),
+('騵', '배 희고 갈기 검은 말 원'),
+('騵', '원'),
+('騶', ' 마부 추'),
+('騶', ' 짐승이름 추'),
+('騶', 'groom'),
+('騶', 'mounted escort'),
+('騶', '거덜 추'),
+('騶', '추'),
+('騷', ' 급할 소'),
+('騷', ' 처량할 소'),
+('騷', ' 흔들릴 소'),
+('騷', '근심스러울 소'),
+('騷', '소'),
+('騸', '불깔 선'),
+('騸', '선'),
+('騾', '노새 라'),
+('驀', '말탈 맥'),
+('驀', '맥'),
+('驁', ' 깔볼 오'),
+('驁', 'be arrogant'),
+('驁', 'despise'),
+('驁', 'noble steed'),
+('驁', '오'),
+('驁', '준마 오'),
+('驂', 'ch''am'),
+('驂', 'cham'),
+('驂', '곁마 참'),
+('驂', '참'),
+('驃', ' 누런 말 표'),
+('驃', 'p''yo'),
+('驃', 'phyo'),
+('驃', 'pyo'),
+('驃', '날쌜 표'),
+('驃', '표'),
+('驄', 'ch''ong'),
+('驄', 'chong'),
+('驄', 'horse with a bluish white color'),
+('驄', '총'),
+('驄', '총이말 총'),
+('驅', 'Hanja form of 구 (“expel, drive away”).'),
+('驅', 'Hanja form of 구 (“spur a horse on”).'),
+('驅', '구'),
+('驅', '몰'),
+('驅', '몰 구'),
+('驅', '몰다'),
+('驊', 'an excellent horse'),
+('驊', 'hwa'),
+('驊', '준마 화'),
+('驊', '화'),
+('驌', ' 숙상말 숙'),
+('驌', '숙'),
+('驌', '좋은말 숙'),
+('驍', '날랠 효'),
+('驍', '효'),
+('驎', '린'),
+('驎', '워라말 린 '),
+('驎', '인'),
+('驏', 'can'),
+('驏', 'chan'),
+('驏', 'jan'),
+('驏', '안장 얹지 않은 말 잔'),
+('驏', '잔'),
+('驒', '돈짝무늬총이말 탄'),
+('驒', '연전총'),
+('驒', '탄'),
+('驕', '교'),
+('驕', '교만할 교'),
+('驕', '부리 짧은 사냥개 효'),
+('驗', ' 보람 험'),
+('驗', ' 중험할 험'),
+('驗', '시험할 험'),
+('驗', '험'),
+('驘', '나'),
+('驘', '라'),
+('驘', '옹 솥 라'),
+('驚', 'Hanja form of 경 (“surprised, startled”).'),
+('驚', '경'),
+('驚', '놀라다'),
+('驚', '놀랄'),
+('驚', '놀랄 경'),
+('驛', ' 쌀 뾰족뾰족할 역'),
+('驛', ' 역말집 역'),
+('驛', '역'),
+('驛', '잇닿을 역'),
+('驟', ' 달릴 취'),
+('驟', ' 별안간 취'),
+('驟', '달리다'),
+('驟', '달릴'),
+('驟', '몰아갈 취'),
+('驟', '취'),
+('驢', '나귀 려'),
+('驢', '려'),
+('驢', '여'),
+('驤', '날뛰는 말 양'),
+('驤', '양'),
+('驥', 'refined and virtuous'),
+('驥', 'thoroughbred horse'),
+('驥', '기'),
+('驥', '천리마 기'),
+('驩', 'hwan'),
+('驩', '기뻐할 환'),
+('驩', '환'),
+('驪', '가라말 려'),
+('驫', 'p''yo'),
+('驫', 'pyo'),
+('驫', '표'),
+('骕', '驌과 同字'),
+('骨', 'Hanja form of 골 (“bone”).'),
+('骨', '골'),
+('骨', '뼈'),
+('骨', '뼈 골'),
+('骪', 'i'),
+('骪', '이'),
+('骫', '이'),
+('骯', 'hang'),
+('骯', '꼿꼿할 항'),
+('骯', '항'),
+('骰', '주사위 투'),
+('骰', '투'),
+('骶', 'cey, ce'),
+('骶', 'che, chŏ'),
+('骶', 'coccyx'),
+('骶', 'hips'),
+('骶', 'je'),
+('骶', '궁둥이 제'),
+('骶', '꽁무니 끝 저'),
+('骶', '저'),
+('骷', 'go'),
+('骷', 'ko'),
+('骷', '고'),
+('骷', '해골 고'),
+('骸', 'Hanja form of 해 (“bone”).'),
+('骸', 'Hanja form of 해 (“corpse; body”).'),
+('骸', '뼈'),
+('骸', '뼈 해'),
+('骸', '해'),
+('骹', '발회목뼈 교'),
+('骼', ' 드러난 뼈 격'),
+('骼', ' 짐승의 뼈 격'),
+('骼', 'gyeok'),
+('骼', 'kyek'),
+('骼', 'kyŏk'),
+('骼', '격'),
+('骼', '마른 뼈 격'),
+('骾', 'bony'),
+('骾', '경'),
+('骿', '변'),
+('骿', '통갈비 변 '),
+('髀', '넓적다리 비'),
+('髀', '볼기짝 폐'),
+('髁', '넓적다리뼈 과'),
+('髁', '넓적다리뼈 화'),
+('髂', '가'),
+('髂', '허리뼈 가'),
+('髆', 'bak'),
+('髆', 'pak'),
+('髆', '박'),
+('髆', '어깨쭉지 박'),
+('髏', 'Hanja form of 루/누 (“skull”).'),
+('髏', '누'),
+('髏', '루'),
+('髏', '해골'),
+('髏', '해굴 루'),
+('髑', 'Hanja form of 촉 (“skull”).'),
+('髑', '촉'),
+('髑', '해골'),
+('髑', '해골 촉'),
+('髒', 'cang'),
+('髒', 'chang'),
+('髒', 'jang'),
+('髒', '몸 뚱뚱할 장'),
+('髒', '장'),
+('髓', ' 마음속 수'),
+('髓', 'Hanja form of 수 (“bone marrow”).'),
+('髓', '뼛골'),
+('髓', '뼛속 기름 수'),
+('髓', '수'),
+('體', 'Hanja form of 체 (“body; shape; form”).'),
+('體', 'Hanja form of 체 (“matter; object”).'),
+('體', 'Hanja form of 체 (“style; handwriting”).'),
+('體', '몸'),
+('體', '몸 체'),
+('體', '체'),
+('髕', 'bin'),
+('髕', 'pin'),
+('髕', 'the kneecap'),
+('髕', '빈'),
+('髕', '종지뼈 빈'),
+('髖', 'gwan'),
+('髖', 'kwan'),
+('髖', '관'),
+('髖', '허리뼈 관'),
+('髗', '노'),
+('髗', '로'),
+('髗', '해골 로'),
+('高', 'Hanja form of 고 (“high, tall”).'),
+('高', '고'),
+('高', '높다'),
+('高', '높을'),
+('高', '높을 고'),
+('髙', 'go'),
+('髙', 'ko'),
+('髙', '高와 同字'),
+('髙', '고'),
+('髟', ' 깃발 날릴 표'),
+('髟', ' 머리 늘일 표'),
+('髟', '머리털 희뜩희뜩할 표'),
+('髠', 'ancient punishment of shaving off the hair of a criminal'),
+('髠', 'gon'),
+('髠', 'kon'),
+('髠', '곤'),
+('髡', 'gon'),
+('髡', 'kon'),
+('髡', '곤'),
+('髡', '머리 깍을 곤'),
+('髢', 'Hanja form of 체 (“wig”).'),
+('髢', 'ch''e'),
+('髢', 'che'),
+('髢', 'chey'),
+('髢', '체'),
+('髣', 'bang'),
+('髣', 'pang'),
+('髣', '방'),
+('髣', '비슷할 방'),
+('髥', 'Hanja form of 염 (“beard; mustache”).'),
+('髥', '구레나룻'),
+('髥', '구레나룻 염'),
+('髥', '염'),
+('髦', 'mo'),
+('髦', '다팔머리 모'),
+('髦', '모'),
+('髫', '다박머리 초'),
+('髫', '초'),
+('髭', '자'),
+('髭', '코밑수염 자'),
+('髮', 'Hanja form of 발 (“hair”).'),
+('髮', '발'),
+('髮', '터럭'),
+('髮', '터럭 발'),
+('髯', 'Alternative form of 髥 (“Hanja form of 염 (“beard; mustache”).”)'),
+('髯', '髥의 俗字'),
+('髯', '구레나룻'),
+('髯', '염'),
+('髰', 'ch''e'),
+('髰', 'che'),
+('髰', 'chey'),
+('髰', '체'),
+('髲', ' 첩지 피'),
+('髲', '머리쓰개 피'),
+('髲', '피'),
+('髴', 'bul'),
+('髴', 'pul'),
+('髴', '불'),
+('髴', '비슷할 불'),
+('髹', 'hyu'),
+('髹', '옻칠할 휴 '),
+('髹', '휴'),
+('髺', 'gwal'),
+('髺', 'kwal'),
+('髺', '괄'),
+('髺', '머리 묶을 괄'),
+('髻', 'gye'),
+('髻', 'kye'),
+('髻', 'kyey'),
+('髻', '계'),
+('髻', '상투 계'),
+('髽', 'chwa'),
+('髽', 'cwa'),
+('髽', 'jwa'),
+('髽', '북상투 좌'),
+('髽', '좌'),
+('鬂', 'bin'),
+('鬂', 'pin'),
+('鬂', '鬢의 俗字'),
+('鬂', '빈'),
+('鬅', 'bul'),
+('鬅', 'pul'),
+('鬅', '불'),
+('鬆', 'song'),
+('鬆', '송'),
+('鬆', '터럭 더부룩할 송'),
+('鬈', 'beautiful'),
+('鬈', 'curly hair'),
+('鬈', '권'),
+('鬈', '수염좋을 권'),
+('鬊', '머리 풀어헤칠 순 '),
+('鬊', '순'),
+('鬋', ' 귀밑 털 드릴 전'),
+('鬋', 'cen'),
+('鬋', 'chŏn'),
+('鬋', 'jeon'),
+('鬋', '수염 깎을 전'),
+('鬋', '전'),
+('鬍', 'ho'),
+('鬍', '수염 호'),
+('鬍', '호'),
+('鬐', 'gi'),
+('鬐', 'ki'),
+('鬐', '갈기 기'),
+('鬐', '기'),
+('鬒', 'black and glossy hair'),
+('鬒', 'chin'),
+('鬒', 'cin'),
+('鬒', 'jin'),
+('鬒', '숱 많을 진'),
+('鬒', '진'),
+('鬖', 'sam'),
+('鬖', '삼'),
+('鬖', '헝클어질 삼'),
+('鬘', 'man'),
+('鬘', '만'),
+('鬘', '머리장식 만'),
+('鬙', '머리 헝클어질'),
+('鬙', '승'),
+('鬙', '터럭 더부룩할 승'),
+('鬚', ' 아랫수염 수'),
+('鬚', 'Hanja form of 수 (“beard”).'),
+('鬚', '수'),
+('鬚', '수염'),
+('鬚', '턱수염 수'),
+('鬟', 'hwan'),
+('鬟', '쪽찐 머리 환'),
+('鬟', '환'),
+('鬠', 'Hanja form of 괄 (“to bind one''s hair”).'),
+('鬠', '결발하다'),
+('鬠', '결발할'),
+('鬠', '결발할 괄'),
+('鬠', '괄'),
+('鬢', 'bin'),
+('鬢', 'pin'),
+('鬢', '빈'),
+('鬢', '살쩍 빈'),
+('鬣', '갈기 렵'),
+('鬣', '렵'),
+('鬣', '엽'),
+('鬥', 'Alternative form of 鬪 (“Hanja form of 투 (“fight”).”)'),
+('鬥', '싸우다'),
+('鬥', '싸울'),
+('鬥', '투'),
+('鬧', '시끄러울 뇨'),
+('鬧', '시끄러울 료'),
+('鬨', '싸울 홍'),
+('鬨', '싸움소리 항'),
+('鬩', ' 싸울 혁'),
+('鬩', '송사할 혁'),
+('鬩', '혁'),
+('鬪', 'fight'),
+('鬪', '싸움 투'),
+('鬪', '투'),
+('鬮', 'gu'),
+('鬮', 'ku'),
+('鬮', 'kwu'),
+('鬮', '구'),
+('鬮', '제비뽑을 구'),
+('鬯', 'ch''ŏng'),
+('鬯', 'cheng'),
+('鬯', 'cheong'),
+('鬯', 'sacrificial wine'),
+('鬯', 'unhindered'),
+('鬯', '울창주 청'),
+('鬯', '청'),
+('鬰', 'ul'),
+('鬰', 'wul'),
+('鬰', '鬱과 同字'),
+('鬰', '울'),
+('鬱', 'Hanja form of 울 (“stuffy; stifling; suffocating”).'),
+('鬱', '답답하다'),
+('鬱', '답답할'),
+('鬱', '울'),
+('鬱', '향기로운 풀 울'),
+('鬲', ' 땅이름 격'),
+('鬲', 'gyeok'),
+('鬲', 'kyek'),
+('鬲', 'kyŏk'),
+('鬲', '격'),
+('鬲', '력'),
+('鬲', '오지병 격'),
+('鬴', 'bu'),
+('鬴', 'cauldron'),
+('鬴', 'pu'),
+('鬴', '부'),
+('鬺', 'sang'),
+('鬺', '삶을 상 '),
+('鬺', '상'),
+('鬼', 'Hanja form of 귀 (“ghost; spirit”).'),
+('鬼', '귀'),
+('鬼', '귀신'),
+('鬼', '귀신 귀'),
+('魁', '괴'),
+('魁', '으뜸 괴'),
+('魂', 'Hanja form of 혼 (“soul; spirit”).'),
+('魂', '넋'),
+('魂', '넋 혼'),
+('魂', '혼'),
+('魃', 'bal'),
+('魃', 'pal'),
+('魃', '가물 귀신 발'),
+('魃', '발'),
+('魄', 'Hanja form of 백 (“soul; spirit”).'),
+('魄', 'Hanja form of 탁 (“to wither and fall”).'),
+('魄', '넋'),
+('魄', '넋 백'),
+('魄', '백'),
+('魄', '영락하다'),
+('魄', '영락할'),
+('魄', '탁'),
+('魅', 'Hanja form of 매 (“charm”).'),
+('魅', '도깨비'),
+('魅', '도깨비 매'),
+('魅', '매'),
+('魈', 'so'),
+('魈', '산도깨비 소'),
+('魈', '소'),
+('魋', 'brown bear'),
+('魋', '북상투 추'),
+('魋', '추'),
+('魍', '도깨비 망'),
+('魍', '망'),
+('魎', '도깨비 량'),
+('魏', ' 대궐 위'),
+('魏', ' 우뚝할 위'),
+('魏', 'Hanja form of 위 (“Wei kingdom in China”).'),
+('魏', 'wi'),
+('魏', '위'),
+('魏', '위나라 위'),
+('魑', '도깨비 리'),
+('魔', 'Hanja form of 마 (“demon”).'),
+('魔', '마'),
+('魔', '마귀'),
+('魔', '마귀 마'),
+('魘', 'yem'),
+('魘', 'yeom'),
+('魘', 'yŏm'),
+('魘', '염'),
+('魘', '잠꼬대할 염'),
+('魚', 'Hanja form of 어 (“fish”).'),
+('魚', 'Hanja form of 어 (“fish”). [affix]'),
+('魚', '물고기'),
+('魚', '물고기 어'),
+('魚', '어'),
+('魛', 'The estuarine tapertail anchovy, Coilia nasus.'),
+('魛', '도'),
+('魛', '웅어'),
+('魜', 'in'),
+('魜', '인'),
+('魜', '인어 인'),
+('魦', '鯊와 同字'),
+('魦', '사'),
+('魯', '노'),
+('魯', '노둔할 로'),
+('魯', '로'),
+('魴', 'bang'),
+('魴', 'pang'),
+('魴', '방'),
+('魴', '방어 방'),
+('鮀', 't''a'),
+('鮀', 'ta'),
+('鮀', 'tha'),
+('鮀', '모래무지 타'),
+('鮀', '타'),
+('鮃', 'p''yŏng'),
+('鮃', 'phyeng'),
+('鮃', 'pyeong'),
+('鮃', '가자미 평'),
+('鮃', '평'),
+('鮆', 'cey'),
+('鮆', 'che'),
+('鮆', 'cutlassfish'),
+('鮆', 'je'),
+('鮆', '제'),
+('鮎', 'catfish, sheatfish'),
+('鮎', 'cem'),
+('鮎', 'chŏm'),
+('鮎', 'jeom'),
+('鮎', '메기 점'),
+('鮎', '점'),
+('鮐', ' 늙은이 등에 복 무늬 날 태'),
+('鮐', 'blowfish'),
+('鮐', '복 태'),
+('鮐', '태'),
+('鮑', ' 성씨 포'),
+('鮑', 'p''o'),
+('鮑', 'pho'),
+('鮑', 'po'),
+('鮑', '절인 생선 포'),
+('鮑', '포'),
+('鮒', 'bu'),
+('鮒', 'pu'),
+('鮒', '부'),
+('鮒', '붕어 부'),
+('鮓', '자'),
+('鮓', '젓 자'),
+('鮗', 'dong'),
+('鮗', 'tong'),
+('鮗', '동'),
+('鮗', '전어 동 '),
+('鮚', '길'),
+('鮚', '대합 길'),
+('鮝', 'sang'),
+('鮝', '건어 상'),
+('鮝', '상'),
+('鮞', 'i'),
+('鮞', 'mudfish'),
+('鮞', 'roe'),
+('鮞', '곤이 알 이'),
+('鮞', '이'),
+('鮟', 'an'),
+('鮟', 'monkfish'),
+('鮟', '아귀 안'),
+('鮟', '안'),
+('鮠', 'oe'),
+('鮠', 'oy'),
+('鮠', 'small catfish'),
+('鮠', '외'),
+('鮧', '복 제'),
+('鮧', '이'),
+('鮧', '제'),
+('鮧', '창자젓 이'),
+('鮨', '젓갈 지'),
+('鮨', '지'),
+('鮪', 'tuna, tunny'),
+('鮪', 'yu'),
+('鮪', '상어 유'),
+('鮪', '유'),
+('鮫', 'gyo'),
+('鮫', 'kyo'),
+('鮫', '교'),
+('鮫', '상어 교'),
+('鮭', ' 복 해'),
+('鮭', 'hae'),
+('鮭', 'hay'),
+('鮭', '어채 해'),
+('鮭', '해'),
+('鮮', 'Hanja form of 선 (“smooth; fish”).'),
+('鮮', '고울'),
+('鮮', '고울 선'),
+('鮮', '곱다'),
+('鮮', '선'),
+('鮹', ' 낙지 소'),
+('鮹', '문어 소'),
+('鮹', '소'),
+('鯀', 'gon'),
+('鯀', 'kon'),
+('鯀', '곤'),
+('鯀', '물고기 이름 곤'),
+('鯁', 'disaster'),
+('鯁', 'fish bones'),
+('鯁', 'gyeong'),
+('鯁', 'kyeng'),
+('鯁', 'kyŏng'),
+('鯁', '경'),
+('鯁', '생선뼈 경'),
+('鯆', ' 물아지 포'),
+('鯆', 'p''o'),
+('鯆', 'pho'),
+('鯆', 'po'),
+('鯆', '매가리 포'),
+('鯆', '포'),
+('鯇', '산천어 혼'),
+('鯇', '잉어 환'),
+('鯈', 'cho'),
+('鯈', 'jo'),
+('鯈', 'minnow'),
+('鯈', '조'),
+('鯉', '잉어 리'),
+('鯊', 'shark'),
+('鯊', '문절망둑 사'),
+('鯊', '사'),
+('鯋', ' 모래무지 사'),
+('鯋', 'sa'),
+('鯋', '사'),
+('鯋', '상어 사'),
+('鯔', 'ch''i'),
+('鯔', 'chi'),
+('鯔', '숭어 치'),
+('鯔', '치'),
+('鯖', 'mackerel'),
+('鯖', '고등어'),
+('鯖', '청'),
+('鯖', '청어 청'),
+('鯛', 'cho'),
+('鯛', 'co'),
+('鯛', 'jo'),
+('鯛', 'sea bream'),
+('鯛', '도미 조'),
+('鯛', '조'),
+('鯝', 'go'),
+('鯝', 'ko'),
+('鯝', '고'),
+('鯝', '참마자 고'),
+('鯡', 'herring'),
+('鯡', '곤이 비'),
+('鯡', '비'),
+('鯡', '청어'),
+('鯢', 'salamander'),
+('鯢', 'ye'),
+('鯢', 'yey'),
+('鯢', '암고래 예'),
+('鯢', '예'),
+('鯤', 'gon'),
+('鯤', 'kon'),
+('鯤', 'mythical fish of an unaccountable length'),
+('鯤', 'roe; very young fish'),
+('鯤', '곤'),
+('鯤', '준마 이름 곤'),
+('鯧', 'ch''ang'),
+('鯧', 'chang'),
+('鯧', '병어 창'),
+('鯧', '창'),
+('鯨', 'Hanja form of 경 (“whale”).'),
+('鯨', '경'),
+('鯨', '고래'),
+('鯨', '고래 경'),
+('鯪', '능'),
+('鯪', '릉'),
+('鯪', '천산갑 릉'),
+('鯫', ' 따라지 추'),
+('鯫', 'ch''u'),
+('鯫', 'chu'),
+('鯫', 'chwu'),
+('鯫', 'minnow'),
+('鯫', 'small'),
+('鯫', 'small fish'),
+('鯫', '송사리 추'),
+('鯫', '추'),
+('鯷', '메기 제'),
+('鯷', '제'),
+('鯽', 'Carassius auratus, crucian carp'),
+('鯽', 'cek'),
+('鯽', 'certain kind of squid or cuttlefish'),
+('鯽', 'chŏk'),
+('鯽', 'chŭk'),
+('鯽', 'cuk'),
+('鯽', 'jeok'),
+('鯽', 'jeuk'),
+('鯽', '붕어 즉'),
+('鯽', '적'),
+('鯽', '즉'),
+('鯿', 'p''yŏn'),
+('鯿', 'phyen'),
+('鯿', 'pyeon'),
+('鯿', '병어 편'),
+('鯿', '편'),
+('鰈', ' 넙치 접'),
+('鰈', 'cep'),
+('鰈', 'chŏp'),
+('鰈', 'jeop'),
+('鰈', '가자미 접'),
+('鰈', '접'),
+('鰉', 'hwang'),
+('鰉', '용상어 황'),
+('鰉', '황'),
+('鰊', '고기 이름 련'),
+('鰋', 'catfish, sheatfish'),
+('鰋', 'en'),
+('鰋', 'eon'),
+('鰋', 'ŏn'),
+('鰋', '언'),
+('鰌', ' 빙자할 추'),
+('鰌', ' 해추 추'),
+('鰌', 'ch''u'),
+('鰌', 'chu'),
+('鰌', 'chwu'),
+('鰌', '미꾸라지 추'),
+('鰌', '추'),
+('鰍', 'ch''u'),
+('鰍', 'chu'),
+('鰍', 'chwu'),
+('鰍', '미꾸라지 추'),
+('鰍', '추'),
+('鰐', 'ak'),
+('鰐', 'crocodile, alligator'),
+('鰐', '악'),
+('鰐', '악어 악'),
+('鰒', 'bok'),
+('鰒', 'pok'),
+('鰒', '복'),
+('鰒', '전복 복'),
+('鰓', 'gill'),
+('鰓', '두려워하다'),
+('鰓', '두려워할'),
+('鰓', '뿔심 새'),
+('鰓', '새'),
+('鰓', '시'),
+('鰓', '아가미'),
+('鰕', 'Alternative form of 蝦'),
+('鰕', 'ha'),
+('鰕', '새우 하'),
+('鰕', '하'),
+('鰣', 'si'),
+('鰣', '시'),
+('鰣', '준치 시'),
+('鰤', 'sa'),
+('鰤', '사'),
+('鰤', '새우 사'),
+('鰥', 'hwan'),
+('鰥', '환'),
+('鰥', '환어 환'),
+('鰨', 'sole'),
+('鰨', 't''ap'),
+('鰨', 'tap'),
+('鰨', 'thap'),
+('鰨', '큰 배 탑'),
+('鰨', '탑'),
+('鰩', '날치 요'),
+('鰩', '요'),
+('鰫', '용'),
+('鰫', '전어'),
+('鰭', '기'),
+('鰭', '지느러미 기'),
+('鰮', 'on'),
+('鰮', '멸치 온'),
+('鰮', '온'),
+('鰯', ' 정어리 약'),
+('鰯', 'yak'),
+('鰯', '멸치 약'),
+('鰯', '약'),
+('鰱', 'salmon'),
+('鰱', '련'),
+('鰱', '연'),
+('鰱', '연어 련'),
+('鰲', '오'),
+('鰲', '큰 자라 오'),
+('鰳', '준치 륵'),
+('鰵', '대구 민'),
+('鰵', '민'),
+('鰷', ' 뱅어 소'),
+('鰷', '피라미 소'),
+('鰷', '피라미 조'),
+('鰹', ' 강고도리 견'),
+('鰹', ' 물치 견'),
+('鰹', 'gyeon'),
+('鰹', 'kyen'),
+('鰹', 'kyŏn'),
+('鰹', '견'),
+('鰹', '큰 가물치 견'),
+('鰺', 'so'),
+('鰺', '비린내 소의 譌字'),
+('鰺', '소'),
+('鰻', '만'),
+('鰻', '뱀장어'),
+('鰻', '뱀장어 만'),
+('鰾', 'p''yo'),
+('鰾', 'phyo'),
+('鰾', 'pyo'),
+('鰾', '부레 표'),
+('鰾', '표'),
+('鱅', '용'),
+('鱅', '용어 용'),
+('鱅', '전어'),
+('鱇', 'gang'),
+('鱇', 'kang'),
+('鱇', '강'),
+('鱇', '천징어 강'),
+('鱈', 'sel'),
+('鱈', 'seol'),
+('鱈', 'sŏl'),
+('鱈', '대구 설'),
+('鱈', '설'),
+('鱉', 'byeol'),
+('鱉', 'pyel'),
+('鱉', 'pyŏl'),
+('鱉', '鼈과 同字'),
+('鱉', '별'),
+('鱏', 'sim'),
+('鱏', 'sturgeon'),
+('鱏', '심'),
+('鱏', '칼철갑상어 심'),
+('鱒', 'chun'),
+('鱒', 'cwun'),
+('鱒', 'jun'),
+('鱒', '송어 준'),
+('鱒', '준'),
+('鱓', 'The swamp eel, Monopterus albus'),
+('鱓', 'sen'),
+('鱓', 'seon'),
+('鱓', 'sŏn'),
+('鱓', '두렁허리 선'),
+('鱓', '선'),
+('鱔', '鱓의 俗字'),
+('鱔', '선'),
+('鱖', '쏘가리 궐'),
+('鱖', '쏘가리 궤'),
+('鱗', 'scale (of fish or reptiles)'),
+('鱗', '린'),
+('鱗', '비늘'),
+('鱗', '비늘 린'),
+('鱗', '인'),
+('鱘', 'sim'),
+('鱘', '심'),
+('鱘', '심어 심'),
+('鱝', '가오리 분 '),
+('鱝', '분'),
+('鱟', '참게 후'),
+('鱟', '후'),
+('鱠', '회'),
+('鱠', '회 회'),
+('鱣', 'carp'),
+('鱣', 'sturgeon'),
+('鱣', '전'),
+('鱣', '전어 전'),
+('鱧', '가물치 례'),
+('鱭', 'cey'),
+('鱭', 'che'),
+('鱭', 'je'),
+('鱭', '갈치 제'),
+('鱭', '제'),
+('鱸', '(농어 (nong''eo)) sea bass, sea perch'),
+('鱸', 'sea bass, sea perch'),
+('鱸', '노'),
+('鱸', '농어 로'),
+('鱸', '로'),
+('鱺', '뱀장어 려'),
+('鱺', '뱀장어 리'),
+('鱻', 'sen'),
+('鱻', 'seon'),
+('鱻', 'sŏn'),
+('鱻', '생선 선'),
+('鱻', '선'),
+('鳥', 'Hanja form of 조 (“bird”).'),
+('鳥', 'Hanja form of 조 (“bird”). [affix]'),
+('鳥', '새'),
+('鳥', '새 조'),
+('鳥', '조'),
+('鳦', 'eul'),
+('鳦', 'ul'),
+('鳦', 'ŭl'),
+('鳦', '을'),
+('鳦', '제비 을'),
+('鳧', 'Hanja form of 부 (“duck”).'),
+('鳧', '부'),
+('鳧', '오리'),
+('鳧', '오리 부'),
+('鳩', 'collect, assemble'),
+('鳩', 'gu'),
+('鳩', 'ku'),
+('鳩', 'kwu'),
+('鳩', 'pigeon, dove'),
+('鳩', '구'),
+('鳩', '비둘기 구'),
+('鳬', 'bu'),
+('鳬', 'pu'),
+('鳬', '鳧의 俗字'),
+('鳬', '부'),
+('鳮', 'gye'),
+('鳮', 'kye'),
+('鳮', 'kyey'),
+('鳮', '鷄의 俗字'),
+('鳮', '계'),
+('鳯', 'bong'),
+('鳯', 'pong'),
+('鳯', '鳳의 俗字'),
+('鳯', '봉'),
+('鳳', 'Hanja form of 봉 (“male phoenix”).'),
+('鳳', '봉'),
+('鳳', '봉새'),
+('鳳', '봉새 봉'),
+('鳴', 'Hanja form of 명 (“cry of bird or animal”).'),
+('鳴', 'Hanja form of 명 (“make sound”).'),
+('鳴', '명'),
+('鳴', '울'),
+('鳴', '울 명'),
+('鳴', '울다'),
+('鳶', '솔개'),
+('鳶', '솔개 연'),
+('鳶', '연'),
+('鴃', ' 때까치 격'),
+('鴃', '격'),
+('鴃', '왜가리 격'),
+('鴆', '짐'),
+('鴆', '짐새 짐'),
+('鴇', 'bo'),
+('鴇', 'po'),
+('鴇', '능에 보'),
+('鴇', '보'),
+('鴈', 'an'),
+('鴈', '기러기 안'),
+('鴈', '안'),
+('鴉', ' 검을 아'),
+('鴉', '갈가마귀 아'),
+('鴉', '아'),
+('鴌', '鳳의 古字 '),
+('鴒', '할미새 령'),
+('鴕', 't''a'),
+('鴕', 'ta'),
+('鴕', 'tha'),
+('鴕', '타'),
+('鴕', '타조 타'),
+('鴘', 'byeon'),
+('鴘', 'pyen'),
+('鴘', 'pyŏn'),
+('鴘', '매 변 '),
+('鴘', '변'),
+('鴙', 'ch''i'),
+('鴙', 'chi'),
+('鴙', '雉와 同字 '),
+('鴙', '치'),
+('鴛', 'wen'),
+('鴛', 'won'),
+('鴛', 'wŏn'),
+('鴛', '숫원앙새 원'),
+('鴛', '원'),
+('鴟', ' 마음대로 날릴 치'),
+('鴟', ' 말똥구리 치'),
+('鴟', ' 부엉이 치'),
+('鴟', ' 수알치 치'),
+('鴟', ' 올빼미 치'),
+('鴟', ' 토란 치'),
+('鴟', '솔개 치'),
+('鴟', '치'),
+('鴣', 'go'),
+('鴣', 'ko'),
+('鴣', '고'),
+('鴣', '자고 고'),
+('鴦', 'ang'),
+('鴦', '암원앙새 앙'),
+('鴦', '앙'),
+('鴨', '압'),
+('鴨', '오리'),
+('鴨', '오리 압'),
+('鴰', 'a white-naped crane, Grus vipio.'),
+('鴰', 'gwal'),
+('鴰', 'kwal'),
+('鴰', '괄'),
+('鴰', '재두루미 괄'),
+('鴳', 'quail'),
+('鴳', '안'),
+('鴴', '참새'),
+('鴴', '참새: sparrow'),
+('鴴', '행'),
+('鴶', '뻐꾸기 알 '),
+('鴶', '알'),
+('鴻', 'hong'),
+('鴻', '큰 기러기 홍'),
+('鴻', '홍'),
+('鵁', 'grey heron (Ardea cinerea)'),
+('鵁', '교'),
+('鵁', '푸른 백로'),
+('鵂', 'hyu'),
+('鵂', '수리부엉이 휴'),
+('鵂', '휴'),
+('鵄', 'ch''i'),
+('鵄', 'chi'),
+('鵄', '솔개 치'),
+('鵄', '치'),
+('鵑', ' 두견새 견'),
+('鵑', ' 뻐꾹새 견'),
+('鵑', '견'),
+('鵑', '접동새 견'),
+('鵓', 'bal'),
+('鵓', 'pal'),
+('鵓', '발'),
+('鵓', '집비둘기 발'),
+('鵔', 'chun'),
+('鵔', 'cwun'),
+('鵔', 'jun'),
+('鵔', '금계 준 '),
+('鵔', '준'),
+('鵜', 'cey'),
+('鵜', 'che'),
+('鵜', 'je'),
+('鵜', '접동새 제'),
+('鵜', '제'),
+('鵝', 'domesticated goose that would not fly at all, in contrast with the wild goose (雁 (기러기 안, gireogi-an)) whose skein flies in wedge or cuneiform.'),
+('鵝', 'wild goose'),
+('鵝', '거위 아'),
+('鵝', '아'),
+('鵞', '鵝와 同字'),
+('鵞', '아'),
+('鵠', '고니 곡'),
+('鵠', '고니 혹'),
+('鵡', 'Hanja form of 무 (“parrot”).'),
+('鵡', '무'),
+('鵡', '앵무새'),
+('鵡', '앵무새 무'),
+('鵩', 'bok'),
+('鵩', 'pok'),
+('鵩', '복'),
+('鵩', '새 이름 복'),
+('鵬', '대붕'),
+('鵬', '대붕새 붕'),
+('鵬', '붕'),
+('鵯', 'p''il'),
+('鵯', 'phil'),
+('鵯', 'pil'),
+('鵯', '갈가마귀 필'),
+('鵯', '필'),
+('鵰', 'cho'),
+('鵰', 'co'),
+('鵰', 'eagle'),
+('鵰', 'jo'),
+('鵰', '수리 조'),
+('鵰', '조'),
+('鵲', 'cak'),
+('鵲', 'chak'),
+('鵲', 'jak'),
+('鵲', '까치 작'),
+('鵲', '작'),
+('鵷', 'phoenix'),
+('鵷', 'wen'),
+('鵷', 'won'),
+('鵷', 'wŏn'),
+('鵷', '원'),
+('鵷', '원추새 원'),
+('鵻', 'ch''u'),
+('鵻', 'chu'),
+('鵻', 'chwu'),
+('鵻', '아롱비둘기 추'),
+('鵻', '추'),
+('鵾', 'gon'),
+('鵾', 'kon'),
+('鵾', 'swan'),
+('鵾', '곤'),
+('鵾', '댓닭 곤'),
+('鶄', 'a grey heron (Ardea cinerea)'),
+('鶄', 'ch''ŏng'),
+('鶄', 'cheng'),
+('鶄', 'cheong'),
+('鶄', '교청새 청 '),
+('鶄', '청'),
+('鶉', ' 옷 해질 순'),
+('鶉', '메추라기 순'),
+('鶖', 'ch''u'),
+('鶖', 'chu'),
+('鶖', 'chwu'),
+('鶖', '두루미 추'),
+('鶖', '추'),
+('鶚', 'ak'),
+('鶚', 'osprey (a bird of prey)'),
+('鶚', '물수리 악'),
+('鶚', '악'),
+('鶡', ' 관이름 갈'),
+('鶡', 'brown long-tailed pheasant'),
+('鶡', 'gal'),
+('鶡', 'kal'),
+('鶡', '갈'),
+('鶡', '할단새 갈'),
+('鶤', 'gon'),
+('鶤', 'kon'),
+('鶤', 'swan'),
+('鶤', '곤'),
+('鶤', '댓닭 곤 '),
+('鶩', '목'),
+('鶩', '집오리 목'),
+('鶬', 'oriole'),
+('鶬', 'white-naped crane'),
+('鶬', '왜가리 청'),
+('鶬', '창'),
+('鶬', '청'),
+('鶯', 'Chinese oriole'),
+('鶯', 'bush warbler'),
+('鶯', '꾀꼬리'),
+('鶯', '꾀꼬리 앵'),
+('鶯', '앵'),
+('鶴', 'Hanja form of 학 (“crane (bird)”).'),
+('鶴', 'Hanja form of 학 (“crane (bird)”). [noun]'),
+('鶴', '두루미'),
+('鶴', '두루미 학'),
+('鶴', '학'),
+('鶵', 'ch''u'),
+('鶵', 'chu'),
+('鶵', 'chwu'),
+('鶵', '추'),
+('鶸', ' 투계 약'),
+('鶸', 'yak'),
+('鶸', '댓닭 약'),
+('鶸', '약'),
+('鶹', '올빼미 류'),
+('鶻', '골'),
+('鶻', '송골매 골'),
+('鶿', 'ca'),
+('鶿', 'cha'),
+('鶿', 'ja'),
+('鶿', '가마우지 자'),
+('鶿', '자'),
+('鷀', 'ca'),
+('鷀', 'cha'),
+('鷀', 'ja'),
+('鷀', '자'),
+('鷁', ' 돛대 끝 바람개비 익'),
+('鷁', 'fishhawk bow or prow'),
+('鷁', 'ik'),
+('鷁', '익'),
+('鷁', '익새 익'),
+('鷂', ' 새매 요'),
+('鷂', 'yo'),
+('鷂', '요'),
+('鷂', '장끼 요'),
+('鷄', 'Hanja form of 계 (“chicken”).'),
+('鷄', '계'),
+('鷄', '닭'),
+('鷄', '닭 계'),
+('鷇', 'eyas, nestling'),
+('鷇', 'foster'),
+('鷇', 'gu'),
+('鷇', 'ku'),
+('鷇', 'kwu'),
+('鷇', '구'),
+('鷇', '새 새끼 구'),
+('鷓', 'ca'),
+('鷓', 'cha'),
+('鷓', 'ja'),
+('鷓', '자'),
+('鷓', '자고 자'),
+('鷖', ' 봉황 예'),
+('鷖', 'ye'),
+('鷖', 'yey'),
+('鷖', '갈매기 예'),
+('鷖', '예'),
+('鷗', 'seagull'),
+('鷗', '갈매기 구'),
+('鷗', '구'),
+('鷙', 'chi'),
+('鷙', 'ci'),
+('鷙', 'ji'),
+('鷙', '맹금 지'),
+('鷙', '지'),
+('鷦', 'ch''o'),
+('鷦', 'cho'),
+('鷦', '뱁새 초'),
+('鷦', '초'),
+('鷩', 'byeol'),
+('鷩', 'pyel'),
+('鷩', 'pyŏl'),
+('鷩', '금계 별'),
+('鷩', '별'),
+('鷪', 'aeng'),
+('鷪', 'ayng'),
+('鷪', 'bush warbler'),
+('鷪', 'nightingale'),
+('鷪', '꾀꼬리 앵 '),
+('鷪', '앵'),
+('鷫', 'suk'),
+('鷫', 'swuk'),
+('鷫', '숙'),
+('鷫', '숙상새 숙'),
+('鷰', ' 씨름 연 '),
+('鷰', '연'),
+('鷰', '제비 연'),
+('鷱', 'go'),
+('鷱', 'ko'),
+('鷱', '고'),
+('鷱', '새이름 고 '),
+('鷲', 'ch''wi'),
+('鷲', 'chwi'),
+('鷲', '독수리 취'),
+('鷲', '취'),
+('鷳', '소리개 한'),
+('鷳', '한'),
+('鷸', 'heul'),
+('鷸', 'hul'),
+('鷸', 'hŭl'),
+('鷸', '흘'),
+('鷹', 'hawk; falcon (esp. the peregrine or gyrfalcon)'),
+('鷹', '매'),
+('鷹', '매 응'),
+('鷹', '응'),
+('鷺', '노'),
+('鷺', '로'),
+('鷺', '해오라기 로'),
+('鷽', '메까치 학'),
+('鷽', '학'),
+('鷿', 'byeok'),
+('鷿', 'pyek'),
+('鷿', 'pyŏk'),
+('鷿', '농병아리 벽 '),
+('鷿', '벽'),
+('鸇', 'cen'),
+('鸇', 'chŏn'),
+('鸇', 'jeon'),
+('鸇', 'peregrine falcon'),
+('鸇', '구진매 전'),
+('鸇', '전'),
+('鸎', 'aeng'),
+('鸎', 'ayng'),
+('鸎', 'bush warbler'),
+('鸎', 'nightingale'),
+('鸎', '앵'),
+('鸏', '몽'),
+('鸏', '비둘기 몽 '),
+('鸕', '가마우지 로'),
+('鸚', 'Hanja form of 앵 (“parrot”).'),
+('鸚', '앵'),
+('鸚', '앵무새'),
+('鸚', '앵무새 앵'),
+('鸛', 'Ciconia species (various)'),
+('鸛', 'crane, Grus japonensis'),
+('鸛', 'gwan'),
+('鸛', 'kwan'),
+('鸛', 'stork'),
+('鸛', '관'),
+('鸛', '황새 관'),
+('鸜', 'gu'),
+('鸜', 'ku'),
+('鸜', 'kwu'),
+('鸜', '구'),
+('鸜', '구관조 구'),
+('鸞', '난새 란'),
+('鹙', '鶖와 同字'),
+('鹵', 'Hanja form of 노 (“salt”).'),
+('鹵', '노'),
+('鹵', '로'),
+('鹵', '소금'),
+('鹵', '소금 로'),
+('鹶', 'geung'),
+('鹶', 'kung'),
+('鹶', 'kŭng'),
+('鹶', '긍'),
+('鹶', '짜고 쓸 긍'),
+('鹷', '나이 령 '),
+('鹹', 'Hanja form of 함 (“salty”).'),
+('鹹', '다'),
+('鹹', '짤'),
+('鹹', '짤 함'),
+('鹹', '함'),
+('鹺', '차'),
+('鹻', ' 비누 검'),
+('鹻', ' 잿물 검'),
+('鹻', 'geom'),
+('鹻', 'kem'),
+('鹻', 'kŏm'),
+('鹻', '검'),
+('鹻', '소금물 검'),
+('鹽', ' 절일 염'),
+('鹽', ' 후렴 염'),
+('鹽', '소금'),
+('鹽', '소금 염'),
+('鹽', '염'),
+('鹿', 'Hanja form of 록/녹 (“deer”).'),
+('鹿', '녹'),
+('鹿', '록'),
+('鹿', '사슴'),
+('鹿', '사슴 록'),
+('麀', 'u'),
+('麀', 'wu'),
+('麀', '암사슴 우'),
+('麀', '우'),
+('麂', '궤'),
+('麂', '큰고라니 궤'),
+('麄', 'ch''u'),
+('麄', 'chu'),
+('麄', 'chwu'),
+('麄', '추'),
+('麇', 'roe deer'),
+('麇', '군'),
+('麇', '균'),
+('麇', '노루 균'),
+('麇', '무리 군'),
+('麈', 'chu'),
+('麈', 'cwu'),
+('麈', 'ju'),
+('麈', '주'),
+('麈', '큰사슴 주'),
+('麋', ' 부서질 미'),
+('麋', '미'),
+('麋', '큰사슴 미'),
+('麌', 'u'),
+('麌', 'wu'),
+('麌', '숫사슴 우'),
+('麌', '우'),
+('麏', 'gyun'),
+('麏', 'kyun'),
+('麏', '고라니 균 '),
+('麏', '균'),
+('麑', ' 사자 예'),
+('麑', 'ye'),
+('麑', 'yey'),
+('麑', '아기사슴 예'),
+('麑', '예'),
+('麒', 'Hanja form of 기 (“giraffe; qilin”).'),
+('麒', '기'),
+('麒', '기린'),
+('麒', '기린 기'),
+('麓', 'Hanja form of 록/녹 (“foot of a mountain”).'),
+('麓', '녹'),
+('麓', '록'),
+('麓', '산기슭'),
+('麓', '신기슭 록'),
+('麗', 'Hanja form of 려/여 (“beautiful; lovely; pretty; fair; elegant”).'),
+('麗', '고울'),
+('麗', '고울 려'),
+('麗', '고울 리'),
+('麗', '곱다'),
+('麗', '려'),
+('麗', '여'),
+('麝', 'Hanja form of 사 (“musk deer”).'),
+('麝', '사'),
+('麝', '사향노루'),
+('麝', '사향노루 사'),
+('麞', 'cang'),
+('麞', 'chang'),
+('麞', 'jang'),
+('麞', 'roe deer'),
+('麞', '노루 장'),
+('麞', '장'),
+('麟', 'Hanja form of 린/인 (“giraffe; qilin”).'),
+('麟', '기린'),
+('麟', '기린 린'),
+('麟', '린'),
+('麟', '인'),
+('麤', ' 거칠 추'),
+('麤', ' 클 추'),
+('麤', 'Hanja form of 추 (“coarse; rough”).'),
+('麤', '거칠'),
+('麤', '거칠다'),
+('麤', '성길 추'),
+('麤', '추'),
+('麥', 'wheat; barley'),
+('麥', '맥'),
+('麥', '보리'),
+('麥', '보리 맥'),
+('麦', '麥의 俗字'),
+('麩', 'bu'),
+('麩', 'pu'),
+('麩', '밀기울 부'),
+('麩', '부'),
+('麪', '면'),
+('麪', '밀가루 면'),
+('麭', 'p''o'),
+('麭', 'po'),
+('麭', '포'),
+('麯', 'guk'),
+('麯', 'kuk'),
+('麯', 'kwuk'),
+('麯', '麴과 同字'),
+('麯', '국'),
+('麰', 'mo'),
+('麰', '모'),
+('麰', '보리 모'),
+('麲', 'barley flour'),
+('麲', 'han'),
+('麲', '한'),
+('麴', 'guk'),
+('麴', 'kuk'),
+('麴', 'kwuk'),
+('麴', 'leaven'),
+('麴', 'yeast'),
+('麴', '국'),
+('麴', '누룩 국'),
+('麵', 'noodles'),
+('麵', 'wheat flour'),
+('麵', '麪과 同字'),
+('麵', '면'),
+('麹', 'guk'),
+('麹', 'kuk'),
+('麹', 'kwuk'),
+('麹', '국'),
+('麹', '누룩 국'),
+('麻', 'Hanja form of 마 (“hemp, jute, flax”).'),
+('麻', 'Hanja form of 마 (“sesame”).'),
+('麻', '마'),
+('麻', '삼'),
+('麻', '삼 마'),
+('麼', 'ma'),
+('麼', 'small'),
+('麼', 'thin'),
+('麼', '마'),
+('麼', '작을 마'),
+('麽', '마'),
+('麽', '잘 마'),
+('麾', '대장기 휘'),
+('麾', '휘'),
+('麿', '갈 마'),
+('麿', '마'),
+('黃', 'Hanja form of 황 (“yellow; a surname”).'),
+('黃', '누렇다'),
+('黃', '누를'),
+('黃', '누를 황'),
+('黃', '황'),
+('黄', 'hwang'),
+('黄', 'variant of 黃'),
+('黄', 'yellow'),
+('黄', '누를 황'),
+('黄', '황'),
+('黅', 'geum'),
+('黅', 'kum'),
+('黅', 'kŭm'),
+('黅', '금'),
+('黅', '누른 빛 금 '),
+('黈', 'chu'),
+('黈', 'cwu'),
+('黈', 'ju'),
+('黈', '누른빛: yellowy'),
+('黈', '주'),
+('黌', 'hoeng'),
+('黌', 'hoyng'),
+('黌', 'school'),
+('黌', '글방 횡'),
+('黌', '횡'),
+('黍', 'se'),
+('黍', 'seo'),
+('黍', 'sŏ'),
+('黍', '기장 서'),
+('黍', '서'),
+('黎', 'Hanja form of 여(黎) (“black”).'),
+('黎', '검을 려'),
+('黎', '려'),
+('黎', '여'),
+('黏', ' 풀 점'),
+('黏', '붙일 점'),
+('黏', '점'),
+('黐', '끈끈이 리'),
+('黑', 'Hanja form of 흑 (“black”).'),
+('黑', '검다'),
+('黑', '검을'),
+('黑', '검을 흑'),
+('黑', '흑'),
+('黒', '黑과 同字'),
+('黔', '검을 검'),
+('黔', '귀신 이름 금'),
+('黕', 'dam'),
+('黕', 'dirt'),
+('黕', 'get dirty'),
+('黕', 'tam'),
+('黕', '담'),
+('黖', 'gi'),
+('黖', 'ki'),
+('黖', '기'),
+('黖', '물건 생겨날 기 '),
+('默', ' 고요할 묵'),
+('默', 'Hanja form of 묵 (“quiet, still”).'),
+('默', 'Hanja form of 묵 (“silent”).'),
+('默', '묵'),
+('默', '묵묵하다'),
+('默', '묵묵할'),
+('默', '묵묵할 묵'),
+('黚', 'gyeom'),
+('黚', 'kyem'),
+('黚', 'kyŏm'),
+('黚', '겸'),
+('黚', '얕은 금향빛 겸 '),
+('黛', ' 새파랄 대'),
+('黛', 'dae'),
+('黛', 'tae'),
+('黛', 'tay'),
+('黛', '눈썹 그릴 대'),
+('黛', '대'),
+('黜', ' 물리칠 출'),
+('黜', 'ch''ul'),
+('黜', 'chul'),
+('黜', 'chwul'),
+('黜', '내칠 출'),
+('黜', '출'),
+('黝', ' 검은칠할 유'),
+('黝', 'yu'),
+('黝', '검푸를 유'),
+('黝', '유'),
+('點', ' 검은 점 점'),
+('點', ' 뭉갤 점'),
+('點', 'Hanja form of 점 (“point; dot; spot; speck”).'),
+('點', '더러울 점'),
+('點', '점'),
+('黟', ' 고을이름 이'),
+('黟', 'black'),
+('黟', 'ebony'),
+('黟', 'i'),
+('黟', '검을 이'),
+('黟', '이'),
+('黠', 'hil'),
+('黠', '약을 힐'),
+('黠', '힐'),
+('黤', 'all of a sudden'),
+('黤', 'blue-black'),
+('黤', 'dimness'),
+('黤', 'suddenly'),
+('黤', '암'),
+('黥', 'gyeong'),
+('黥', 'kyeng'),
+('黥', 'kyŏng'),
+('黥', 'tattoo punishment of branding a criminal'),
+('黥', '경'),
+('黥', '묵형할 경'),
+('黧', '검을 래'),
+('黧', '검을 려'),
+('黧', '검을 리'),
+('黨', 'Hanja form of 당 (“political party”).'),
+('黨', '당'),
+('黨', '무리'),
+('黨', '무리 당'),
+('黮', 'black'),
+('黮', 'dam'),
+('黮', 'dark'),
+('黮', 'tam'),
+('黮', '검을 담'),
+('黮', '담'),
+('黯', 'am'),
+('黯', 'dark, black'),
+('黯', 'sullen, dreary'),
+('黯', '암'),
+('黯', '어두울 암'),
+('黲', 'ch''am'),
+('黲', 'cham'),
+('黲', '검푸르죽죽할 참'),
+('黲', '참'),
+('黴', ' 검을 미'),
+('黴', ' 썪을 미'),
+('黴', 'mi'),
+('黴', '곰팡이 미'),
+('黴', '미'),
+('黵', 'dam'),
+('黵', 'tam'),
+('黵', '담'),
+('黵', '문신할 담 '),
+('黶', 'yem'),
+('黶', 'yeom'),
+('黶', 'yŏm'),
+('黶', '검은 사마귀 염'),
+('黶', '염'),
+('黷', 'dok'),
+('黷', 'tok'),
+('黷', '더러울 독'),
+('黷', '독'),
+('黺', 'bun'),
+('黺', 'pun'),
+('黺', '분'),
+('黺', '옷에 오색 수 놓을 분 '),
+('黻', '불'),
+('黻', '수 불'),
+('黼', '보'),
+('黼', '수 보'),
+('黽', 'Hanja form of 맹 (“a kind of frog”).'),
+('黽', 'Hanja form of 면 (“an ancient placename”).'),
+('黽', 'Hanja form of 민 (“to endeavor; to strive for”).'),
+('黽', 'Hanja form of 민 (“used in personal names”).'),
+('黽', '고을 이름'),
+('黽', '맹'),
+('黽', '맹꽁이'),
+('黽', '면'),
+('黽', '민'),
+('黽', '힘쓰다'),
+('黽', '힘쓸'),
+('黽', '힘쓸 민'),
+('黿', 'big turtle'),
+('黿', 'wen'),
+('黿', 'won'),
+('黿', 'wŏn'),
+('黿', '원'),
+('黿', '큰 자라 원'),
+('鼀', 'ch''uk'),
+('鼀', 'chuk'),
+('鼀', 'chwuk'),
+('鼀', '두꺼비 축 '),
+('鼀', '축'),
+('鼂', 'cho'),
+('鼂', 'co'),
+('鼂', 'jo'),
+('鼂', '朝와 同字'),
+('鼂', '조'),
+('鼄', 'chu'),
+('鼄', 'cwu'),
+('鼄', 'ju'),
+('鼄', '거미 주'),
+('鼄', '주'),
+('鼇', '매우 큰 자라 오'),
+('鼇', '오'),
+('鼈', 'pyel'),
+('鼈', 'pyŏl'),
+('鼈', '별'),
+('鼈', '자라 별'),
+('鼉', 't''a'),
+('鼉', 'ta'),
+('鼉', 'tha'),
+('鼉', '자라 타'),
+('鼉', '타'),
+('鼊', 'byeok'),
+('鼊', 'pyek'),
+('鼊', 'pyŏk'),
+('鼊', '거북 벽 '),
+('鼊', '벽'),
+('鼎', ' 바야흐로 정'),
+('鼎', ' 새로울 정'),
+('鼎', 'ceng'),
+('鼎', 'chŏng'),
+('鼎', 'jeong'),
+('鼎', '솥 정'),
+('鼎', '정'),
+('鼐', 'incense tripod'),
+('鼐', 'nae'),
+('鼐', 'nay'),
+('鼐', '가마솥 내'),
+('鼐', '내'),
+('鼒', 'ja'),
+('鼒', '자'),
+('鼓', 'Hanja form of 고 (“drum”).'),
+('鼓', '고'),
+('鼓', '북'),
+('鼓', '북 고'),
+('鼕', '동'),
+('鼕', '북소리 동'),
+('鼗', 'small revolving drum with knobs'),
+('鼗', '도'),
+('鼗', '땡땡이 도'),
+('鼙', 'bi'),
+('鼙', 'drum carried on horseback'),
+('鼙', 'pi'),
+('鼙', '마상북 비'),
+('鼙', '비'),
+('鼠', 'Hanja form of 서 (“mouse; rat”).'),
+('鼠', '서'),
+('鼠', '쥐'),
+('鼠', '쥐 서'),
+('鼢', 'bun'),
+('鼢', 'mole (burrowing insectivore)'),
+('鼢', 'pun'),
+('鼢', '두더지 분'),
+('鼢', '분'),
+('鼪', 'squirrel'),
+('鼪', 'weasel'),
+('鼪', '생'),
+('鼫', 'marmot'),
+('鼫', 'squirrel'),
+('鼫', '석'),
+('鼫', '석서 석'),
+('鼬', ' 족제비 유'),
+('鼬', 'yu'),
+('鼬', '유'),
+('鼬', '청서 유'),
+('鼯', 'o'),
+('鼯', '날다람쥐 오'),
+('鼯', '날다람쥐: flying squirrel'),
+('鼯', '오'),
+('鼴', ' 소 같은 큰 쥐 언'),
+('鼴', 'en'),
+('鼴', 'eon'),
+('鼴', 'mole (burrowing insectivore)'),
+('鼴', 'ŏn'),
+('鼴', '두더쥐 언'),
+('鼴', '언'),
+('鼷', 'hye'),
+('鼷', 'hyey'),
+('鼷', 'mouse'),
+('鼷', '새앙쥐 혜'),
+('鼷', '혜'),
+('鼸', 'gyeom'),
+('鼸', 'kyem'),
+('鼸', 'kyŏm'),
+('鼸', '겸'),
+('鼸', '두더쥐 겸 '),
+('鼹', 'en'),
+('鼹', 'eon'),
+('鼹', 'mole (burrowing insectivore)'),
+('鼹', 'ŏn'),
+('鼹', '鼴과 同字'),
+('鼹', '언'),
+('鼻', 'Hanja form of 비 (“nose; nasal; rhino-”).'),
+('鼻', '비'),
+('鼻', '코'),
+('鼻', '코 비'),
+('鼽', 'gu'),
+('鼽', 'have a stuffy nose'),
+('鼽', 'ku'),
+('鼽', 'kwu'),
+('鼽', '감기들어 코 막힐 구'),
+('鼽', '구'),
+('鼾', 'han'),
+('鼾', '코골 한'),
+('鼾', '한'),
+('齄', 'ch''a'),
+('齄', 'cha'),
+('齄', '차'),
+('齄', '코가 붉게 부을 차'),
+('齊', '가지런할 제'),
+('齊', '상옷 아랫단할 자'),
+('齊', '제'),
+('齋', ' 집 재'),
+('齋', '공부방'),
+('齋', '상복'),
+('齋', '엄숙하다'),
+('齋', '엄숙할'),
+('齋', '재'),
+('齋', '재계하다'),
+('齋', '재계할'),
+('齋', '재계할 재'),
+('齋', '집'),
+('齎', ' 가질 재'),
+('齎', ' 쌀 재'),
+('齎', 'cay'),
+('齎', 'chae'),
+('齎', 'jae'),
+('齎', '재'),
+('齎', '탄식할 재'),
+('齏', 'cey'),
+('齏', 'che'),
+('齏', 'je'),
+('齏', '제'),
+('齏', '회 제'),
+('齒', ' 같을 치'),
+('齒', ' 나이 치'),
+('齒', 'Hanja form of 치 (“tooth”).'),
+('齒', '이'),
+('齒', '이 치'),
+('齒', '이#Korean'),
+('齒', '치'),
+('齔', ' 어릴 친'),
+('齔', '이 갈'),
+('齔', '이 갈 친'),
+('齔', '츤'),
+('齔', '친'),
+('齕', 'bite, gnaw'),
+('齕', 'chew'),
+('齕', '깨물 흘'),
+('齕', '흘'),
+('齗', ' 말다툼할 은'),
+('齗', ' 미워할 은'),
+('齗', 'eun'),
+('齗', 'un'),
+('齗', 'ŭn'),
+('齗', '은'),
+('齗', '잇몸 은'),
+('齘', '계'),
+('齙', 'p''o'),
+('齙', 'pho'),
+('齙', 'po'),
+('齙', '이 드러날 포'),
+('齙', '포'),
+('齜', ' 뻐드렁니 재'),
+('齜', ' 이 드러날 재'),
+('齜', '이 갈 재'),
+('齜', '이를 갈 차'),
+('齜', '재'),
+('齜', '차'),
+('齟', '이 어긋날 저'),
+('齟', '저'),
+('齠', 'ch''o'),
+('齠', 'cho'),
+('齠', '이를 갈 초'),
+('齠', '초'),
+('齡', '나이 령'),
+('齣', 'ch''ŏk'),
+('齣', 'chek'),
+('齣', 'cheok'),
+('齣', '단락 척'),
+('齣', '척'),
+('齦', 'Hanja form of 간 (“to bite”).'),
+('齦', 'Hanja form of 은 (“gum”).'),
+('齦', '간'),
+('齦', '물'),
+('齦', '물다'),
+('齦', '물을 간'),
+('齦', '은'),
+('齦', '잇몸'),
+('齧', 'sel'),
+('齧', 'seol'),
+('齧', 'sŏl'),
+('齧', '물 설'),
+('齧', '설'),
+('齩', 'gyo'),
+('齩', 'kyo'),
+('齩', '교'),
+('齩', '깨물다: bite'),
+('齩', '뼈 깨물 교'),
+('齪', 'ch''ak'),
+('齪', 'chak'),
+('齪', 'dirty'),
+('齪', 'narrow, small'),
+('齪', '악착할 착'),
+('齪', '착'),
+('齫', 'gon'),
+('齫', 'kon'),
+('齫', '곤'),
+('齫', '이 빠질 곤 '),
+('齬', 'e'),
+('齬', 'eo'),
+('齬', 'ŏ'),
+('齬', '어'),
+('齬', '이 어긋날 어'),
+('齮', 'gi'),
+('齮', 'ki'),
+('齮', '기'),
+('齮', '깨물다: bite'),
+('齰', 'saek'),
+('齰', '깨물다: bite'),
+('齰', '물다: bite, gnaw'),
+('齰', '색'),
+('齲', 'decayed tooth'),
+('齲', 'u'),
+('齲', 'wu'),
+('齲', '우'),
+('齲', '충치 우'),
+('齶', 'ak'),
+('齶', '악'),
+('齶', '잇몸 악'),
+('齷', 'ak'),
+('齷', 'dirty'),
+('齷', 'narrow, small'),
+('齷', '악'),
+('齷', '악착할 악'),
+('齾', '알'),
+('齾', '이 빠질'),
+('龍', 'Hanja form of 룡/용 (“dragon”).'),
+('龍', '룡'),
+('龍', '미르'),
+('龍', '언덕 롱'),
+('龍', '용'),
+('龍', '용 룡'),
+('龍', '잿빛 방'),
+('龎', '충실할 롱(龐의 俗字)'),
+('龐', '어지러울 방'),
+('龐', '통통하게 살질 롱'),
+('龒', '龍의 古字 '),
+('龔', 'gong'),
+('龔', 'kong'),
+('龔', 'polite, reverent'),
+('龔', 'respect'),
+('龔', 'to supply'),
+('龔', '공'),
+('龔', '공손할 공'),
+('龕', ' 감실 감'),
+('龕', ' 이길 감'),
+('龕', 'gam'),
+('龕', 'kam'),
+('龕', 'niche, shrine'),
+('龕', '감'),
+('龕', '취할 감'),
+('龖', 'dap'),
+('龖', 'tap'),
+('龖', '답'),
+('龗', '령'),
+('龗', '영'),
+('龗', '용'),
+('龜', '(피부가)틀 균'),
+('龜', 'Hanja form of 구 (“used in placenames”).'),
+('龜', 'Hanja form of 귀 (“tortoise; turtle”).'),
+('龜', 'Hanja form of 균 (“crack”).'),
+('龜', '거북'),
+('龜', '거북 귀'),
+('龜', '구'),
+('龜', '귀'),
+('龜', '균'),
+('龜', '나라 이름 구'),
+('龜', '땅 이름'),
+('龜', '터지다'),
+('龜', '터질'),
+('龝', 'ch''u'),
+('龝', 'chu'),
+('龝', 'chwu'),
+('龝', '秋의 古字'),
+('龝', '추'),
+('龞', 'byeol'),
+('龞', 'pyel'),
+('龞', 'pyŏl'),
+('龞', '별'),
+('龠', 'flute'),
+('龠', 'yak'),
+('龠', '약'),
+('龠', '피리 약'),
+('龡', 'ch''wi'),
+('龡', 'chwi'),
+('龡', 'to blow (a flute)'),
+('龡', '불 취'),
+('龡', '취'),
+('龢', 'hwa'),
+('龢', '풍류 조화될 화'),
+('龢', '화'),
+('龤', 'hae'),
+('龤', 'hay'),
+('龤', '노래의 가락이 조화될 해'),
+('龤', '해'),
+('龥', 'yu'),
+('龥', '부르짖을 유'),
+('龥', '유'),
+('豈', '승전악 개'),
+('更', '다시 갱'),
+('車', ' 그물 거'),
+('車', ' 잇몸 거'),
+('車', '수레 거'),
+('賈', '장사 고'),
+('滑', '어지러울 골'),
+('串', '곶 곶'),
+('句', '글귀 귀'),
+('龜', '거북 귀'),
+('龜', '(피부가)틀 균'),
+('契', '부족 이름 글'),
+('金', '성 금'),
+('喇', ' 라마교 라'),
+('喇', '나팔 라'),
+('奈', '어찌 나'),
+('懶', '게으를 나'),
+('癩', '약물 중독 나'),
+('羅', '새 그물 나'),
+('蘿', '소나무겨우살이 나'),
+('螺', '소라 나'),
+('裸', ' 털 없는 벌레 라'),
+('裸', '벌거벗을 라'),
+('邏', '돌 나'),
+('樂', '즐길 낙'),
+('洛', '강 이름 낙'),
+('烙', '지질 낙'),
+('珞', '구슬 목걸이 낙'),
+('落', '떨어질 낙'),
+('酪', '타락 낙'),
+('駱', '낙타 낙'),
+('亂', '어지러울 난'),
+('卵', '알 난'),
+('欄', '난간 난'),
+('爛', '문드러질 난'),
+('蘭', '난초 난'),
+('鸞', '난새 난'),
+('嵐', '남기 남'),
+('濫', '퍼질 남'),
+('藍', '쪽 남'),
+('襤', '누더기 남'),
+('拉', '꺽을 납'),
+('臘', '납향 납'),
+('蠟', '밀 납'),
+('廊', '복도 낭'),
+('朗', '밝을 낭'),
+('浪', '물결 낭'),
+('狼', '이리 낭'),
+('郎', '사나이 낭'),
+('來', '올 내'),
+('冷', '차가울 냉'),
+('勞', '수고할 노'),
+('擄', '사로잡을 노'),
+('櫓', '큰 방패 노'),
+('爐', '화로 노'),
+('盧', '밥그릇 노'),
+('老', '늙을 노'),
+('蘆', '갈대 노'),
+('虜', '포로 노'),
+('路', '길 노'),
+('露', '이슬 노'),
+('魯', '미련할 노'),
+('鷺', '해오라기 노'),
+('碌', '푸른 빛 녹'),
+('祿', '행복 녹'),
+('綠', '초록빛 녹'),
+('菉', '조개풀 녹'),
+('錄', '기록할 녹'),
+('鹿', '사슴 녹'),
+('論', '말할 논'),
+('壟', '밭두둑 농'),
+('弄', '희롱할 농'),
+('籠', '대그릇 농'),
+('聾', '귀머거리 농'),
+('牢', '가축우리 뇌'),
+('磊', '돌이 많이 쌓인 모양 뇌'),
+('賂', '뇌물 뇌'),
+('雷', '우뢰 뇌'),
+('壘', '진 누'),
+('屢', '(빛이 들어오는)창 누'),
+('樓', '다락 누'),
+('淚', '눈물 누'),
+('漏', '샐 누'),
+('累', '포갤 누'),
+('縷', '자세할 누'),
+('陋', '줍을 누'),
+('勒', '굴레 늑'),
+('肋', '갈비대 늑'),
+('凜', '찰 늠'),
+('凌', '얼음 능'),
+('稜', '모질 능'),
+('綾', '무늬 놓은 비단 능'),
+('菱', '마름 능'),
+('陵', '능 능'),
+('讀', '구절 두'),
+('拏', '붙잡을 라'),
+('樂', '즐거울 락'),
+('諾', '대답할 락'),
+('丹', '붉을 란'),
+('寧', '편안할 령'),
+('怒', '성냉 로'),
+('率', '헤아릴 률'),
+('異', '다를 리'),
+('磻', '강이름 번'),
+('便', '똥오줌 변'),
+('復', '다시 부'),
+('不', '아닐 불'),
+('泌', '샘물 흐르는 모양 비'),
+('數', '자주 삭'),
+('索', '동아줄 삭'),
+('參', '석 삼'),
+('塞', '막힐 색'),
+('省', '덜 생'),
+('葉', '고을이름 섭'),
+('說', ' 쉴 세'),
+('說', '달랠 세'),
+('殺', ' 감할 쇄'),
+('殺', ' 빠를 쇄'),
+('殺', '내릴 쇄'),
+('辰', '날 신'),
+('沈', '성 심'),
+('拾', '十의 갖은자'),
+('若', ' 지혜(범어의 음역) 야'),
+('若', '땅이름 야'),
+('掠', '노략질할 약'),
+('略', ' 노략질할 약'),
+('略', ' 잔꾀 약'),
+('略', '간략할 약'),
+('亮', ' 임금의 상중 량'),
+('亮', '밝을 량'),
+('兩', '두 량'),
+('凉', '서늘할 량'),
+('梁', ' 다리 량'),
+('梁', '들보 량'),
+('糧', '양식 량'),
+('良', ' 남편 량'),
+('良', ' 좋을 량'),
+('良', '어질 량'),
+('諒', '헤아릴 량'),
+('量', ' 용량 량'),
+('量', '헤아릴 량'),
+('勵', ' 가다듬을 려'),
+('勵', '힘쓸 려'),
+('呂', ' 등골뼈 려'),
+('呂', ' 성씨 려'),
+('呂', '풍류 려'),
+('女', ' 시집보낼 녀'),
+('女', '계집 녀'),
+('廬', ' 움막 려'),
+('廬', '초가 려'),
+('旅', ' 베풀 려'),
+('旅', '나그네 려'),
+('濾', ' 맑을 려'),
+('濾', '씻을 려'),
+('礪', '돌 단단할 려'),
+('閭', '마을 려'),
+('驪', ' 나라이름 려'),
+('驪', ' 산이름 려'),
+('驪', '가라말 려'),
+('麗', ' 베풀 려'),
+('麗', ' 빛날 려'),
+('麗', '고울 려'),
+('黎', ' 동틀 려'),
+('黎', '무리 려'),
+('力', ' 부지런할 력'),
+('力', '힘 력'),
+('曆', ' 세월 력'),
+('曆', '셀 력'),
+('歷', ' 겪을 력'),
+('歷', '지낼 력'),
+('轢', ' 서로 부닥칠 력'),
+('轢', '수레바퀴에 치일 력'),
+('年', ' 나아갈 년'),
+('年', ' 나이 년'),
+('年', '해 년'),
+('憐', ' 사랑할 련'),
+('憐', '불쌍할 련'),
+('戀', ' 사모할 련'),
+('戀', '생각할 련'),
+('撚', ' 닦을 년'),
+('撚', ' 밟을 년'),
+('撚', ' 손 끝으로 비빌 년'),
+('撚', '잡을 년'),
+('漣', ' 눈물 줄줄 흘릴 련'),
+('漣', '물 놀이칠 련'),
+('煉', ' 반죽할 련'),
+('煉', '쇠 불릴 련'),
+('璉', '종묘 제기 련'),
+('秊', '年의 本字'),
+('練', ' 겪을 련'),
+('練', ' 익힐 련'),
+('練', '이길 련'),
+('聯', ' 관계할 련'),
+('聯', '잇닿을 련'),
+('輦', ' 궁중의 길 련'),
+('輦', '당길 련'),
+('蓮', ' 연꽃 련'),
+('蓮', '연밥 련'),
+('連', ' 끌릴 련'),
+('連', '이을 련'),
+('鍊', ' 단련할 련'),
+('鍊', '불린 쇠 련'),
+('列', ' 무리에 들어갈 렬'),
+('列', ' 베풀 렬'),
+('列', ' 항렬 렬'),
+('列', '벌릴 렬'),
+('劣', ' 못날 렬'),
+('劣', ' 서툴 렬'),
+('劣', ' 어릴 렬'),
+('劣', '용렬할 렬'),
+('咽', ' 막힐 열'),
+('咽', '목 멜 열'),
+('烈', ' 빛날 렬'),
+('烈', ' 사나울 렬'),
+('烈', ' 아름다울 렬'),
+('烈', ' 업적 렬'),
+('烈', '불 활활 붙을 렬'),
+('裂', ' 비단 자투리 렬'),
+('裂', '찢어질 렬'),
+('說', '기꺼울 열'),
+('廉', ' 살필 렴'),
+('廉', ' 조촐할 렴'),
+('廉', ' 청렴할 렴'),
+('廉', '맑을 렴'),
+('念', ' 대단히 짧은시각 념'),
+('念', ' 스물 념'),
+('念', ' 읽을 념'),
+('念', '생각할 념'),
+('捻', '손가락으로 찍을 념'),
+('殮', '염할 염'),
+('簾', '발 렴'),
+('獵', ' 바람소리 렵'),
+('獵', ' 어긋날 렵'),
+('獵', ' 진동할 렵'),
+('獵', '사냥할 렵'),
+('令', ' 가령 령'),
+('令', ' 개 목소리 령'),
+('令', ' 벼슬이름 령'),
+('令', ' 시킬 령'),
+('令', '하여금 령'),
+('囹', '감옥 령'),
+('寧', ' 어찌 녕'),
+('寧', ' 차라리 녕'),
+('寧', '편안할 녕'),
+('嶺', ' 봉우리 령'),
+('嶺', '고개 령'),
+('怜', '영리할 령'),
+('玲', ' 아롱아롱할 령'),
+('玲', ' 정교할 령'),
+('玲', '옥소리 쟁그렁거릴 령'),
+('瑩', ' 밝을 영'),
+('瑩', '귀막이 옥 영'),
+('羚', ' 큰 뿔 양 령'),
+('羚', '영양 령'),
+('聆', ' 깨달을 령'),
+('聆', '들을 령'),
+('鈴', '방울 령'),
+('零', ' 비뚝비뚝 떨어질 령'),
+('零', ' 셈 나머지 령'),
+('零', '부서질 령'),
+('零', '조용히 오는 비 련'),
+('靈', ' 좋을 령'),
+('靈', ' 혼백 령'),
+('靈', '신령 령'),
+('領', ' 거느릴 령'),
+('領', ' 고개 령'),
+('領', ' 받을 령'),
+('領', '옷깃 령'),
+('例', ' 견줄 례'),
+('例', ' 대부분 례'),
+('例', '본보기 례'),
+('禮', ' 인사 례'),
+('禮', '예도 례'),
+('醴', ' 고을이름 례'),
+('醴', '단술 례'),
+('隸', ' 검열할 례'),
+('隸', ' 노비 례'),
+('隸', '종 례'),
+('惡', ' 부끄러울 오'),
+('惡', '미워할 오'),
+('了', ' 깨달을 료'),
+('了', '마칠 료'),
+('僚', ' 어여쁠 료'),
+('僚', '벗 료'),
+('寮', ' 관리 료'),
+('寮', ' 중의 집 료'),
+('寮', '동관 료'),
+('尿', '오줌 뇨'),
+('料', ' 대금 료'),
+('料', ' 헤아릴 료'),
+('料', '말질할 료'),
+('樂', '좋아할 요'),
+('燎', ' 풀 태울 료'),
+('燎', '뜰에 세운 횃불 료'),
+('療', ' 병 고칠 료'),
+('療', '병 나을 료'),
+('蓼', '병 나을 료'),
+('遼', ' 강이름 료'),
+('遼', ' 나라이름 료'),
+('遼', '멀 료'),
+('龍', ' 임금 룡'),
+('龍', '용 룡'),
+('暈', ' 어지러울 운'),
+('暈', '무리 운'),
+('阮', ' 성씨 원'),
+('阮', '원나라 원'),
+('劉', ' 베풀 류'),
+('劉', ' 성씨 류'),
+('劉', ' 죽일 류'),
+('劉', '이길 류'),
+('杻', '싸리 뉴'),
+('柳', ' 별 이름 류'),
+('柳', '버들 류'),
+('流', ' 구할 류'),
+('流', ' 귀양보낼 류'),
+('流', ' 내칠 류'),
+('流', ' 달아날 류'),
+('流', ' 무리 류'),
+('流', ' 번져나갈 류'),
+('流', '흐를 류'),
+('溜', ' 낙수물 류'),
+('溜', ' 증류수 류'),
+('溜', '처마물 류'),
+('琉', ' 나라이름 류'),
+('琉', '유리돌 류'),
+('留', ' 그칠 류'),
+('留', ' 오랠 류'),
+('留', ' 횡사할 류'),
+('留', '머무를 류'),
+('硫', ' 유황 류'),
+('硫', '석류황 류'),
+('紐', ' 맺을 뉴'),
+('紐', '단추 뉴'),
+('類', ' 나눌 류'),
+('類', ' 무리 류'),
+('類', ' 착할 류'),
+('類', '같을 류'),
+('六', ' 나라이름 륙'),
+('六', '여섯 륙'),
+('戮', ' 욕할 륙'),
+('戮', ' 육시할 륙'),
+('戮', '죽일 륙'),
+('陸', ' 길 륙'),
+('陸', ' 두터울 륙'),
+('陸', ' 뛸 륙'),
+('陸', ' 어긋날 륙'),
+('陸', '뭍 륙'),
+('倫', ' 가릴 륜'),
+('倫', ' 무리 륜'),
+('倫', ' 의리 륜'),
+('倫', ' 조리 륜'),
+('倫', '인륜 륜'),
+('崙', ' 나라이름 륜'),
+('崙', '곤륜산 륜'),
+('淪', ' 거느릴 륜'),
+('淪', ' 물놀이칠 륜'),
+('淪', '빠질 륜'),
+('輪', ' 둘레 륜'),
+('輪', ' 땅 길이 륜'),
+('輪', ' 서릴 륜'),
+('輪', ' 우렁찰 륜'),
+('輪', '바퀴 륜'),
+('律', ' 저울질할 률'),
+('律', ' 지을 률'),
+('律', ' 풍률 률'),
+('律', '법 률'),
+('慄', ' 떨 률'),
+('慄', ' 슬플 률'),
+('慄', ' 쭈그릴 률'),
+('慄', '두려울 률'),
+('栗', ' 공손할 률'),
+('栗', ' 단단할 률'),
+('栗', ' 무서울 률'),
+('栗', ' 신주 재목 률'),
+('栗', '밤 률'),
+('率', ' 과녁 률'),
+('率', ' 홀 한껏 다릴 률'),
+('率', '헤아릴 률'),
+('隆', ' 가운데 우뚝할 륭'),
+('隆', ' 괘 이름 륭'),
+('隆', ' 높을 륭'),
+('隆', '성할 륭'),
+('利', ' 이로울 리'),
+('利', ' 이자 리'),
+('利', ' 탐할 리'),
+('利', ' 편리할 리'),
+('利', '날카로울 리'),
+('吏', ' 관리 리'),
+('吏', '아전 리'),
+('履', ' 밟을 리'),
+('履', ' 신을 리'),
+('履', '가죽신 리'),
+('易', ' 게으를 이'),
+('易', ' 다스릴 이'),
+('易', ' 편할 이'),
+('易', '쉬울 이'),
+('李', ' 보따리 리'),
+('李', ' 선비 천거리할 리'),
+('李', ' 역말 리'),
+('李', '오얏 리'),
+('梨', ' 벌레이름 리'),
+('梨', '배 리'),
+('泥', ' 물이 더러워질 니'),
+('泥', ' 술취할 니'),
+('泥', ' 이슬 맺힐 니'),
+('泥', ' 흙손 니'),
+('泥', '진흙 니'),
+('理', ' 고칠 리'),
+('理', ' 나무결 리'),
+('理', ' 누늬낼 리'),
+('理', ' 바를 리'),
+('理', ' 성품 리'),
+('理', ' 이치 리'),
+('理', '다스릴 리'),
+('痢', ' 곱똥 리'),
+('痢', ' 설사 리'),
+('痢', '이질 리'),
+('罹', ' 걸릴 리'),
+('罹', ' 근심할 리'),
+('罹', '만날 리'),
+('裏', ' 속 리'),
+('裏', '옷 안 리'),
+('裡', '裏의 俗字'),
+('里', ' 근심할 리'),
+('里', ' 잇수 리'),
+('里', '마을 리'),
+('離', ' 둘 리'),
+('離', ' 베풀 리'),
+('離', ' 아름다울 리'),
+('離', ' 외손 리'),
+('離', ' 지날 리'),
+('離', '떠날 리'),
+('匿', ' 덮어둘 닉'),
+('匿', ' 몰래 붙을 닉'),
+('匿', ' 술 담는 그릇 닉'),
+('匿', ' 숨길 닉'),
+('匿', ' 쌀 닉'),
+('匿', '숨을 닉'),
+('溺', ' 약할 닉'),
+('溺', ' 헤어 나오지 못할 닉'),
+('溺', '빠질 닉'),
+('吝', '아낄 인'),
+('燐', '도깨비불 인'),
+('璘', '옥빛 인'),
+('藺', '골풀 인'),
+('隣', '鄰의 俗字'),
+('鱗', '비늘 인'),
+('麟', '기린 인'),
+('林', ' 더북더북 날 림'),
+('林', '수풀 림'),
+('淋', ' 번지르르할 림'),
+('淋', ' 축일 림'),
+('淋', '지적지적할 림'),
+('臨', ' 군림할 림'),
+('臨', ' 굽힐 림'),
+('臨', ' 여럿이 울 림'),
+('臨', '임할 림'),
+('立', '설 입'),
+('笠', '우리 입'),
+('粒', '알 입'),
+('狀', '모양 형상 장'),
+('炙', ' 김 쏘일 적'),
+('炙', ' 냄새 퍼질 적'),
+('炙', '고기구이 적'),
+('識', '표할 지'),
+('什', '세간 집'),
+('茶', '차 차'),
+('刺', '찌를 척'),
+('切', '자를 체'),
+('度', ' 벼슬이름 탁'),
+('度', ' 헤아릴 탁'),
+('度', '꾀할 탁'),
+('拓', ' 밀칠 탁'),
+('拓', ' 헤칠 탁'),
+('拓', '물리칠 탁'),
+('宅', ' 묘 구덩이 택'),
+('宅', ' 살 택'),
+('宅', ' 자리 택'),
+('宅', ' 정할 택'),
+('宅', '집 택'),
+('洞', ' 깊을 통'),
+('洞', ' 밝을 통'),
+('洞', ' 빌 통'),
+('洞', '구렁 통'),
+('暴', ' 급할 포'),
+('暴', ' 마를 포'),
+('暴', ' 맨손으로 칠 포'),
+('暴', ' 불끈 일어날 포'),
+('暴', ' 상할 포'),
+('暴', '사나울 포'),
+('輻', '바퀴살통 폭'),
+('行', ' 굳셀 항'),
+('行', ' 항렬 항'),
+('行', '시장 항'),
+('降', '항복할 항'),
+('見', ' 드러날 현'),
+('見', ' 보일 현'),
+('見', ' 있을 현'),
+('見', '나타날 현'),
+('廓', '둘레 확'),
+('兀', ' 움직이지 않을 올'),
+('兀', '우뚝할 올'),
+('塚', '冢의 俗字'),
+('晴', '갤 청'),
+('凞', '凞와 同字'),
+('猪', '豬의 俗字'),
+('益', '더할 익'),
+('礼', '禮의 略字'),
+('神', ' 신명 신'),
+('神', ' 영검할 신'),
+('神', ' 정신 신'),
+('神', '천신 신'),
+('祥', '복 상'),
+('福', '복 복'),
+('靖', ' 생각할 정'),
+('靖', ' 편안할 정'),
+('靖', '다스릴 정'),
+('精', ' 성실할 정'),
+('精', ' 세밀할 정'),
+('精', ' 신령 정'),
+('精', ' 정할 정'),
+('精', '정교할 정'),
+('羽', ' 오음의 하나 우'),
+('羽', '깃 우'),
+('諸', '모든 제'),
+('逸', '달아날 일'),
+('都', '도읍 도'),
+('飯', '밥 반'),
+('飼', '기를 사'),
+('館', '객사 관'),
+('鶴', '두루미 학'),
+('𠃗', 'Hanja form of 울 (“hanja used for transliteration”).'),
+('𠃗', '울'),
+('𠃗', '음역자'),
+('𠤛', 'Alternative form of 眞'),
+('𠤛', '진'),
+('𠤛', '참'),
+('𠦃', 'Alternative form of 卅'),
+('𠦃', '삽'),
+('𠦃', '서른'),
+('𡙊', 'Alternative form of 眞'),
+('𡙊', '진'),
+('𡙊', '참'),
+('𡙗', '렴'),
+('𡙗', '염'),
+('𡙗', '화장 상자'),
+('𡚍', '렴'),
+('𡚍', '염'),
+('𡚍', '화장 상자'),
+('𡨥', '구'),
+('𡨥', '도적'),
+('𡯷', '구'),
+('𡯷', '도적'),
+('𡶧', '립'),
+('𡶧', '우뚝 솟을'),
+('𡶧', '입'),
+('𡾻', '높이 솟은 모양'),
+('𡾻', '장'),
+('𡿡', '깊다'),
+('𡿡', '깊을'),
+('𡿡', '령'),
+('𡿡', '영'),
+('𢅸', '경대'),
+('𢅸', '렴'),
+('𢅸', '염'),
+('𢊴', '렴'),
+('𢊴', '염'),
+('𢊴', '화장 상자'),
+('𣛚', '꽃술'),
+('𣛚', '예'),
+('𣫢', '경대'),
+('𣫢', '렴'),
+('𣫢', '염'),
+('𣴘', 'Hanja form of 대 (“the second note, 대려 (大呂, daeryeo) of the Shí-èr-lǜ musical scale that is two octaves higher”).'),
+('𣴘', '대'),
+('𣼻', '물가'),
+('𣼻', '호'),
+('𣿋', '물가'),
+('𣿋', '호'),
+('𤀶', '물가'),
+('𤀶', '호'),
+('𤥗', '류'),
+('𤥗', '옥돌'),
+('𤥗', '유'),
+('𥃯', '요'),
+('𥃯', '움펑눈'),
+('𥲥', '렴'),
+('𥲥', '베틀 북'),
+('𥲥', '염'),
+('𥳝', '어린 죽순'),
+('𥳝', '예'),
+('𦁞', '꽃술'),
+('𦁞', '예'),
+('𧄜', '꽃술'),
+('𧄜', '예'),
+('𨓭', '달리는 모양'),
+('𨓭', '취'),
+('𨕏', '렴'),
+('𨕏', '염'),
+('𨕏', '화장 상자'),
+('𨘰', '렴'),
+('𨘰', '염'),
+('𨘰', '화장 상자'),
+('𨣦', '서'),
+('𨣦', '술맛이 좋은'),
+('𨣦', '술맛이 좋을'),
+('𨣦', '여'),
+('𨤲', 'Alternative form of 釐'),
+('𨤲', '리'),
+('𨤲', '복'),
+('𨤲', '의리'),
+('𨤲', '희'),
+('𨭛', 'Alternative form of 鑞.'),
+('𨭛', '납'),
+('𨭛', '땜납'),
+('𨭛', '랍'),
+('𨭹', 'Alternative form of 钀.'),
+('𨭹', '알'),
+('𨭹', '재갈'),
+('𨳈', 'a surname'),
+('𨳈', '성'),
+('𨳈', '퉁'),
+('𩧁', '몰아가다'),
+('𩧁', '몰아갈'),
+('𩧁', '취'),
+('𩺴', '만'),
+('𩺴', '뱀장어'),
+('𩻠', '만'),
+('𩻠', '뱀장어'),
+('𪚒', '견'),
+('𪚒', '용의 등 갈기'),
+('𪚜', '견'),
+('𪚜', '용의 등 갈기'),
+('𪚟', '견'),
+('𪚟', '용의 등 갈기'),
+('𪚥', 'Hanja form of 절 (“verbose; talkative”).'),
+('𪚥', '말 많을'),
+('𪚥', '절'),
+('𮌇', 'Alternative form of 肉'),
+('𮌇', '고기'),
+('𮌇', '육'),
+('𮫽', 'Only used in 𮫽魚'),
+('𮫽', '병'),
+('𮫽', '병어'),
+('𰜩', 'Hanja form of 은 (“used in personal names”).'),
+('𰜩', '은')
+ON CONFLICT DO NOTHING;
\ No newline at end of file
@@ -0,0 +1,11542 @@
+INSERT INTO `korean_pronunciation` VALUES
+('\', '힐'),
+('n', '힐'),
+('㐀', '구'),
+('㐁', '첨'),
+('㐂', '희'),
+('㐃', '마'),
+('㐄', '과'),
+('㐅', '오'),
+('㐆', '은'),
+('㐇', '굴'),
+('㐈', '둘'),
+('㐉', '절'),
+('㐊', '살'),
+('㐋', '톨'),
+('㐌', '이'),
+('㐍', '졸'),
+('㐎', '글'),
+('㐏', '올'),
+('㐐', '놀'),
+('㐑', '돌'),
+('㐒', '솔'),
+('㐓', '갈'),
+('㐔', '골'),
+('㐕', '율'),
+('㐖', '혈'),
+('㐗', '놀'),
+('㐘', '쌀'),
+('㐙', '둘'),
+('㐚', '올'),
+('㐛', '울'),
+('㐜', '구'),
+('㐝', '굴'),
+('㐞', '길'),
+('㐟', '길'),
+('㐠', '율'),
+('㐡', '유'),
+('㐢', '뜰'),
+('㐣', '골'),
+('㐤', '구'),
+('㐥', '설'),
+('㐦', '걸'),
+('㐨', '서'),
+('㐩', '형'),
+('㐫', '흉'),
+('㐬', '류'),
+('㐬', '유'),
+('㐬', '황'),
+('㐭', '늠'),
+('㐭', '름'),
+('㐮', '양'),
+('㐯', '쓸'),
+('㐯', '용'),
+('㐰', '신'),
+('㐱', '진'),
+('㐲', '대'),
+('㐳', '올'),
+('㐴', '반'),
+('㐵', '유'),
+('㐶', '될'),
+('㐶', '화'),
+('㐸', '흠'),
+('㐹', '흘'),
+('㐺', '중'),
+('㐻', '내'),
+('㐼', '승'),
+('㐾', '원'),
+('㐿', '격'),
+('㐿', '칠'),
+('㑀', '태'),
+('㑁', '출'),
+('㑂', '방'),
+('㑃', '요'),
+('㑄', '모'),
+('㑅', '작'),
+('㑆', '이'),
+('㑉', '숙'),
+('㑊', '역'),
+('㑋', '궁'),
+('㑌', '왕'),
+('㑍', '뇌'),
+('㑍', '뢰'),
+('㑎', '뇌'),
+('㑏', '저'),
+('㑐', '숙'),
+('㑑', '자'),
+('㑖', '중'),
+('㑗', '신'),
+('㑘', '개'),
+('㑙', '접'),
+('㑚', '나'),
+('㑛', '속'),
+('㑜', '절'),
+('㑝', '농'),
+('㑝', '롱'),
+('㑞', '잉'),
+('㑟', '팽'),
+('㑡', '즉'),
+('㑣', '남'),
+('㑣', '람'),
+('㑤', '묘'),
+('㑥', '이'),
+('㑦', '려'),
+('㑦', '여'),
+('㑧', '계'),
+('㑨', '오'),
+('㑮', '혼'),
+('㑯', '수'),
+('㑰', '훼'),
+('㑺', '준'),
+('㒱', '몽'),
+('㒲', '모'),
+('㓂', '구'),
+('㓒', '옻'),
+('㓒', '칠'),
+('㔔', '강'),
+('㔔', '덩'),
+('㔖', '각'),
+('㔖', '덕'),
+('㔛', '할'),
+('㔡', '별'),
+('㔡', '클'),
+('㕾', '솟'),
+('㖋', '갯'),
+('㖌', '굿'),
+('㖍', '둣'),
+('㖎', '갯'),
+('㖙', '갓'),
+('㗎', '가'),
+('㗏', '왜'),
+('㗡', '늣'),
+('㗸', '함'),
+('㘘', '비'),
+('㘽', '재'),
+('㙖', '우'),
+('㙽', '석'),
+('㙿', '희'),
+('㝳', '등'),
+('㟣', '숭'),
+('㟺', '누'),
+('㟺', '루'),
+('㠞', '징'),
+('㠫', '부'),
+('㠬', '부'),
+('㠰', '덜'),
+('㠳', '막'),
+('㠳', '만'),
+('㡤', '복'),
+('㢇', '언'),
+('㢤', '재'),
+('㢱', '며'),
+('㢿', '후'),
+('㣊', '수'),
+('㣕', '대'),
+('㣖', '태'),
+('㣡', '중'),
+('㣥', '치'),
+('㣨', '고'),
+('㣮', '남'),
+('㣳', '무'),
+('㣴', '황'),
+('㣸', '유'),
+('㣹', '응'),
+('㤀', '망'),
+('㤼', '겁'),
+('㥘', '겁'),
+('㥙', '충'),
+('㥻', '척'),
+('㨣', '옹'),
+('㪲', '둑'),
+('㪳', '둥'),
+('㫇', '억'),
+('㫈', '엉'),
+('㭐', '말'),
+('㭗', '울'),
+('㳓', '우'),
+('㳲', '태'),
+('㵜', '남'),
+('㶂', '황'),
+('㶃', '무'),
+('㶱', '본'),
+('㸴', '소'),
+('㺋', '옹'),
+('㾳', '자'),
+('䃼', '복'),
+('䆆', '조'),
+('䍃', '요'),
+('䎑', '녹'),
+('䎑', '록'),
+('䎚', '혜'),
+('䐥', '옹'),
+('䒆', '배'),
+('䒆', '철'),
+('䔁', '률'),
+('䔁', '율'),
+('䖵', '곤'),
+('䙍', '비'),
+('䜳', '둔'),
+('䢖', '건'),
+('䢘', '수'),
+('䤧', '회'),
+('䦉', '사'),
+('䦞', '윤'),
+('䭏', '떡'),
+('䭏', '편'),
+('䰶', '망'),
+('䳥', '령'),
+('䳥', '영'),
+('䳥', '잠'),
+('䶈', '박'),
+('䶬', '견'),
+('一', '일'),
+('一', '한'),
+('丁', '정'),
+('丂', '교'),
+('七', '칠'),
+('丄', '상'),
+('丄', '위'),
+('丅', '하'),
+('丆', '면'),
+('万', '만'),
+('万', '묵'),
+('万', '일'),
+('丈', '장'),
+('三', '삼'),
+('三', '셋'),
+('上', '상'),
+('上', '위'),
+('上', '윗'),
+('下', '하'),
+('丌', '그'),
+('丌', '기'),
+('不', '부'),
+('不', '불'),
+('与', '여'),
+('与', '줄'),
+('丏', '면'),
+('丐', '갈'),
+('丐', '개'),
+('丐', '빌'),
+('丑', '소'),
+('丑', '추'),
+('丑', '축'),
+('且', '또'),
+('且', '저'),
+('且', '조'),
+('且', '차'),
+('丕', '비'),
+('丕', '클'),
+('世', '세'),
+('丗', '대'),
+('丗', '세'),
+('丘', '구'),
+('丙', '병'),
+('业', '배'),
+('业', '북'),
+('业', '업'),
+('业', '일'),
+('丞', '승'),
+('丞', '증'),
+('丟', '주'),
+('丠', '구'),
+('両', '량'),
+('丢', '주'),
+('丣', '유'),
+('两', '량'),
+('並', '곁'),
+('並', '반'),
+('並', '방'),
+('並', '병'),
+('丨', '곤'),
+('丩', '구'),
+('个', '가'),
+('个', '개'),
+('个', '낱'),
+('丫', '아'),
+('中', '중'),
+('丮', '극'),
+('丰', '봉'),
+('丱', '관'),
+('串', '곶'),
+('串', '관'),
+('串', '찬'),
+('串', '천'),
+('丳', '찬'),
+('丵', '착'),
+('丶', '점'),
+('丶', '주'),
+('丷', '하'),
+('丸', '환'),
+('丹', '난'),
+('丹', '단'),
+('丹', '란'),
+('主', '주'),
+('丼', '정'),
+('丿', '별'),
+('乀', '불'),
+('乂', '벨'),
+('乂', '애'),
+('乂', '예'),
+('乃', '내'),
+('久', '구'),
+('乆', '구'),
+('乇', '적'),
+('乇', '탁'),
+('么', '요'),
+('乊', '호'),
+('之', '갈'),
+('之', '지'),
+('乍', '사'),
+('乎', '호'),
+('乏', '핍'),
+('乑', '임'),
+('乖', '괴'),
+('乗', '승'),
+('乗', '탈'),
+('乘', '승'),
+('乘', '탈'),
+('乙', '새'),
+('乙', '을'),
+('乜', '먀'),
+('九', '구'),
+('九', '규'),
+('乞', '걸'),
+('乞', '기'),
+('乞', '빌'),
+('也', '야'),
+('乣', '규'),
+('乤', '할'),
+('乥', '홀'),
+('乧', '둘'),
+('乨', '시'),
+('乩', '계'),
+('乫', '갈'),
+('乬', '걸'),
+('乭', '돌'),
+('乮', '묠'),
+('乯', '올'),
+('乱', '란'),
+('乲', '잘'),
+('乳', '유'),
+('乳', '젖'),
+('乶', '볼'),
+('乶', '폴'),
+('乷', '살'),
+('乺', '솔'),
+('乻', '얼'),
+('乼', '줄'),
+('乽', '잘'),
+('乾', '간'),
+('乾', '건'),
+('亀', '귀'),
+('亀', '균'),
+('亁', '간'),
+('亁', '건'),
+('亂', '난'),
+('亂', '란'),
+('亄', '의'),
+('亅', '궐'),
+('了', '료'),
+('了', '요'),
+('亇', '마'),
+('予', '여'),
+('亊', '사'),
+('事', '사'),
+('二', '두'),
+('二', '둘'),
+('二', '이'),
+('亍', '마'),
+('亍', '촉'),
+('于', '우'),
+('亏', '우'),
+('亏', '유'),
+('亐', '우'),
+('亐', '울'),
+('云', '운'),
+('互', '호'),
+('亓', '기'),
+('五', '오'),
+('井', '정'),
+('亘', '긍'),
+('亘', '선'),
+('亘', '환'),
+('亙', '긍'),
+('些', '사'),
+('亜', '아'),
+('亝', '제'),
+('亞', '아'),
+('亟', '극'),
+('亟', '기'),
+('亠', '두'),
+('亡', '망'),
+('亡', '무'),
+('亢', '항'),
+('交', '교'),
+('亥', '해'),
+('亦', '역'),
+('亨', '팽'),
+('亨', '형'),
+('亪', '난'),
+('亪', '란'),
+('亪', '역'),
+('享', '향'),
+('京', '경'),
+('亭', '정'),
+('亮', '량'),
+('亰', '경'),
+('亱', '야'),
+('亳', '박'),
+('亴', '유'),
+('亶', '단'),
+('亷', '렴'),
+('亹', '문'),
+('亹', '미'),
+('人', '인'),
+('亻', '사'),
+('亼', '집'),
+('亽', '라'),
+('亾', '망'),
+('亾', '무'),
+('什', '십'),
+('什', '집'),
+('仁', '인'),
+('仂', '륵'),
+('仄', '측'),
+('仆', '부'),
+('仇', '구'),
+('今', '금'),
+('介', '개'),
+('仍', '잉'),
+('从', '종'),
+('仏', '불'),
+('仒', '샤'),
+('仔', '자'),
+('仕', '사'),
+('他', '남'),
+('他', '타'),
+('仗', '장'),
+('付', '부'),
+('付', '줄'),
+('仙', '선'),
+('仚', '선'),
+('仚', '헌'),
+('仛', '차'),
+('仛', '탁'),
+('仝', '동'),
+('仞', '인'),
+('仟', '천'),
+('仡', '흘'),
+('仢', '작'),
+('代', '대'),
+('令', '령'),
+('令', '영'),
+('以', '써'),
+('以', '이'),
+('仭', '인'),
+('仮', '가'),
+('仮', '반'),
+('仰', '앙'),
+('仲', '중'),
+('仳', '비'),
+('仵', '오'),
+('件', '건'),
+('价', '개'),
+('任', '임'),
+('份', '빈'),
+('仿', '방'),
+('伀', '종'),
+('企', '기'),
+('伃', '여'),
+('伅', '돈'),
+('伇', '역'),
+('伈', '심'),
+('伈', '침'),
+('伉', '항'),
+('伊', '이'),
+('伊', '저'),
+('伋', '급'),
+('伍', '오'),
+('伎', '기'),
+('伏', '복'),
+('伏', '부'),
+('伐', '벌'),
+('伐', '칠'),
+('休', '쉴'),
+('休', '휴'),
+('伙', '화'),
+('会', '괴'),
+('会', '회'),
+('伜', '사'),
+('伜', '촐'),
+('伝', '전'),
+('伣', '현'),
+('伩', '신'),
+('伯', '길'),
+('伯', '맏'),
+('伯', '맥'),
+('伯', '백'),
+('伯', '패'),
+('估', '고'),
+('伴', '반'),
+('伴', '짝'),
+('伶', '령'),
+('伸', '신'),
+('伸', '펼'),
+('伺', '사'),
+('伻', '팽'),
+('似', '사'),
+('伽', '가'),
+('伽', '절'),
+('伾', '비'),
+('佀', '사'),
+('佁', '이'),
+('佂', '정'),
+('佃', '전'),
+('但', '단'),
+('佇', '저'),
+('佈', '포'),
+('佉', '거'),
+('佉', '구'),
+('佊', '피'),
+('佋', '소'),
+('位', '위'),
+('低', '저'),
+('住', '살'),
+('住', '주'),
+('佐', '좌'),
+('佑', '우'),
+('佒', '앙'),
+('体', '몸'),
+('体', '분'),
+('体', '체'),
+('佔', '점'),
+('何', '하'),
+('佖', '필'),
+('佗', '타'),
+('佘', '사'),
+('余', '여'),
+('佚', '일'),
+('佚', '질'),
+('佛', '불'),
+('佛', '필'),
+('作', '자'),
+('作', '작'),
+('作', '저'),
+('作', '주'),
+('佝', '구'),
+('佞', '녕'),
+('佟', '퉁'),
+('你', '니'),
+('佢', '거'),
+('佢', '그'),
+('佩', '패'),
+('佪', '회'),
+('佮', '합'),
+('佯', '양'),
+('佰', '백'),
+('佰', '벡'),
+('佳', '가'),
+('佳', '개'),
+('佴', '이'),
+('併', '병'),
+('佶', '길'),
+('佷', '한'),
+('佷', '항'),
+('佸', '괄'),
+('佸', '활'),
+('佹', '궤'),
+('佺', '전'),
+('佻', '조'),
+('佼', '교'),
+('佽', '차'),
+('佾', '일'),
+('使', '사'),
+('使', '시'),
+('侀', '형'),
+('侁', '신'),
+('侂', '탁'),
+('侃', '간'),
+('侄', '질'),
+('侅', '해'),
+('來', '내'),
+('來', '래'),
+('來', '올'),
+('侇', '이'),
+('侈', '치'),
+('侉', '과'),
+('侊', '광'),
+('例', '례'),
+('例', '예'),
+('侌', '음'),
+('侍', '시'),
+('侎', '미'),
+('侏', '주'),
+('侐', '혁'),
+('侑', '유'),
+('侒', '안'),
+('侔', '모'),
+('侖', '륜'),
+('侗', '동'),
+('侘', '차'),
+('侙', '칙'),
+('侚', '순'),
+('供', '공'),
+('侜', '주'),
+('依', '의'),
+('侞', '여'),
+('侠', '겹'),
+('侠', '협'),
+('価', '가'),
+('侣', '려'),
+('侤', '고'),
+('侮', '모'),
+('侯', '후'),
+('侲', '진'),
+('侳', '좌'),
+('侵', '침'),
+('侶', '려'),
+('侶', '여'),
+('侶', '짝'),
+('侷', '국'),
+('侸', '두'),
+('侹', '정'),
+('侻', '탈'),
+('便', '변'),
+('便', '편'),
+('俁', '우'),
+('俁', '유'),
+('係', '계'),
+('係', '맬'),
+('促', '촉'),
+('俄', '아'),
+('俅', '구'),
+('俇', '광'),
+('俉', '오'),
+('俊', '준'),
+('俋', '읍'),
+('俌', '보'),
+('俍', '량'),
+('俎', '조'),
+('俏', '소'),
+('俐', '리'),
+('俑', '용'),
+('俒', '흔'),
+('俓', '경'),
+('俔', '현'),
+('俗', '속'),
+('俘', '부'),
+('俙', '희'),
+('俚', '리'),
+('俛', '면'),
+('俜', '빙'),
+('保', '보'),
+('俞', '유'),
+('俟', '기'),
+('俟', '사'),
+('俠', '겹'),
+('俠', '협'),
+('信', '신'),
+('俣', '오'),
+('俤', '제'),
+('俥', '거'),
+('修', '수'),
+('俯', '부'),
+('俰', '화'),
+('俱', '구'),
+('俲', '효'),
+('俳', '배'),
+('俴', '천'),
+('俵', '표'),
+('俶', '숙'),
+('俶', '척'),
+('俷', '비'),
+('俸', '봉'),
+('俹', '아'),
+('俺', '엄'),
+('俺', '업'),
+('俻', '기'),
+('俻', '비'),
+('俾', '비'),
+('倀', '창'),
+('倂', '병'),
+('倃', '구'),
+('倄', '효'),
+('倅', '쉬'),
+('倆', '량'),
+('倉', '창'),
+('個', '개'),
+('個', '낱'),
+('倌', '관'),
+('倍', '곱'),
+('倍', '배'),
+('倍', '패'),
+('倎', '전'),
+('倏', '숙'),
+('倐', '숙'),
+('們', '문'),
+('倒', '도'),
+('倓', '담'),
+('倔', '굴'),
+('倕', '수'),
+('倖', '행'),
+('倗', '붕'),
+('倘', '당'),
+('候', '후'),
+('倚', '기'),
+('倚', '의'),
+('倛', '기'),
+('倜', '척'),
+('倝', '간'),
+('倞', '경'),
+('借', '적'),
+('借', '차'),
+('倠', '휴'),
+('倡', '창'),
+('倢', '첩'),
+('倣', '방'),
+('値', '치'),
+('倥', '공'),
+('倦', '권'),
+('倧', '종'),
+('倨', '거'),
+('倩', '천'),
+('倪', '예'),
+('倫', '륜'),
+('倫', '윤'),
+('倬', '탁'),
+('倭', '왜'),
+('倭', '위'),
+('倮', '라'),
+('倰', '릉'),
+('倱', '혼'),
+('倲', '동'),
+('倳', '사'),
+('倴', '분'),
+('倶', '구'),
+('倹', '검'),
+('倻', '야'),
+('值', '치'),
+('偁', '칭'),
+('偃', '언'),
+('偄', '난'),
+('偄', '연'),
+('偅', '동'),
+('偆', '준'),
+('偆', '춘'),
+('假', '가'),
+('假', '격'),
+('假', '멀'),
+('假', '하'),
+('偈', '걸'),
+('偈', '게'),
+('偉', '위'),
+('偊', '유'),
+('偌', '야'),
+('偎', '외'),
+('偏', '편'),
+('偐', '안'),
+('偒', '탕'),
+('偓', '악'),
+('偕', '해'),
+('偕', '혜'),
+('偖', '차'),
+('偘', '간'),
+('做', '자'),
+('做', '주'),
+('偛', '삽'),
+('停', '정'),
+('偝', '배'),
+('偞', '엽'),
+('偟', '황'),
+('偠', '요'),
+('偢', '초'),
+('健', '건'),
+('健', '견'),
+('偨', '치'),
+('偩', '부'),
+('偪', '핍'),
+('偫', '치'),
+('偬', '총'),
+('偭', '면'),
+('偯', '의'),
+('偰', '설'),
+('偲', '시'),
+('側', '측'),
+('偵', '정'),
+('偶', '우'),
+('偶', '짝'),
+('偷', '투'),
+('偸', '투'),
+('偹', '비'),
+('偽', '위'),
+('傀', '괴'),
+('傀', '클'),
+('傃', '소'),
+('傅', '부'),
+('傋', '강'),
+('傌', '마'),
+('傍', '곁'),
+('傍', '방'),
+('傍', '팽'),
+('傎', '전'),
+('傏', '당'),
+('傑', '걸'),
+('傒', '혜'),
+('傓', '선'),
+('傔', '겸'),
+('傕', '각'),
+('傖', '창'),
+('傘', '산'),
+('備', '비'),
+('傚', '효'),
+('傛', '용'),
+('傜', '요'),
+('傝', '탑'),
+('傞', '사'),
+('傢', '가'),
+('催', '최'),
+('傭', '용'),
+('傭', '총'),
+('傭', '충'),
+('傮', '조'),
+('傯', '총'),
+('傰', '붕'),
+('傱', '종'),
+('傲', '오'),
+('傳', '전'),
+('傴', '구'),
+('債', '채'),
+('傷', '상'),
+('傺', '제'),
+('傻', '사'),
+('傽', '장'),
+('傾', '경'),
+('傿', '언'),
+('僁', '설'),
+('僂', '루'),
+('僄', '표'),
+('僅', '근'),
+('僆', '련'),
+('僇', '륙'),
+('僈', '만'),
+('僉', '첨'),
+('僊', '선'),
+('僋', '탐'),
+('働', '동'),
+('僎', '선'),
+('僎', '준'),
+('像', '상'),
+('僑', '교'),
+('僒', '군'),
+('僔', '준'),
+('僕', '복'),
+('僖', '희'),
+('僚', '료'),
+('僚', '요'),
+('僛', '기'),
+('僝', '잔'),
+('僞', '위'),
+('僟', '기'),
+('僢', '천'),
+('僣', '참'),
+('僤', '탄'),
+('僥', '요'),
+('僦', '추'),
+('僧', '승'),
+('僧', '중'),
+('僨', '분'),
+('僩', '한'),
+('僪', '결'),
+('僬', '초'),
+('僭', '참'),
+('僮', '동'),
+('僰', '북'),
+('僵', '강'),
+('僶', '민'),
+('僷', '엽'),
+('僸', '금'),
+('價', '가'),
+('價', '값'),
+('僻', '벽'),
+('僻', '피'),
+('僽', '추'),
+('僾', '애'),
+('僿', '사'),
+('儀', '의'),
+('儁', '준'),
+('儂', '농'),
+('儃', '천'),
+('億', '억'),
+('儆', '경'),
+('儇', '현'),
+('儈', '괴'),
+('儉', '검'),
+('儋', '담'),
+('儌', '교'),
+('儐', '빈'),
+('儑', '압'),
+('儒', '유'),
+('儓', '대'),
+('儔', '주'),
+('儕', '제'),
+('儗', '의'),
+('儘', '진'),
+('儚', '멍'),
+('儛', '무'),
+('儜', '녕'),
+('償', '상'),
+('儠', '렵'),
+('儡', '뇌'),
+('儡', '뢰'),
+('儢', '려'),
+('儤', '포'),
+('儥', '육'),
+('儦', '표'),
+('儧', '찬'),
+('儨', '질'),
+('儩', '사'),
+('優', '우'),
+('儫', '호'),
+('儭', '츤'),
+('儱', '롱'),
+('儲', '저'),
+('儳', '참'),
+('儴', '상'),
+('儵', '숙'),
+('儶', '혜'),
+('儶', '휴'),
+('儷', '려'),
+('儸', '라'),
+('儹', '찬'),
+('儺', '나'),
+('儻', '당'),
+('儼', '엄'),
+('儽', '래'),
+('儿', '궤'),
+('儿', '인'),
+('兀', '올'),
+('允', '윤'),
+('兂', '잠'),
+('元', '원'),
+('兄', '형'),
+('充', '충'),
+('兆', '조'),
+('兇', '흉'),
+('先', '선'),
+('先', '세'),
+('光', '광'),
+('光', '빛'),
+('兊', '태'),
+('克', '극'),
+('兌', '예'),
+('兌', '태'),
+('免', '면'),
+('免', '문'),
+('兎', '토'),
+('児', '아'),
+('兑', '예'),
+('兑', '태'),
+('兒', '아'),
+('兒', '예'),
+('兓', '찬'),
+('兓', '침'),
+('兔', '토'),
+('兕', '시'),
+('兖', '연'),
+('兗', '연'),
+('兙', '십'),
+('党', '당'),
+('兛', '천'),
+('兜', '두'),
+('兟', '신'),
+('兡', '백'),
+('兢', '긍'),
+('入', '들'),
+('入', '입'),
+('兦', '망'),
+('兦', '무'),
+('內', '납'),
+('內', '내'),
+('內', '안'),
+('全', '전'),
+('兩', '냥'),
+('兩', '두'),
+('兩', '량'),
+('兩', '양'),
+('兪', '유'),
+('八', '팔'),
+('公', '공'),
+('六', '륙'),
+('六', '육'),
+('兮', '혜'),
+('兯', '한'),
+('共', '공'),
+('兵', '병'),
+('其', '그'),
+('其', '기'),
+('具', '구'),
+('典', '법'),
+('典', '전'),
+('兹', '자'),
+('兺', '뿐'),
+('兼', '겸'),
+('冀', '기'),
+('冂', '경'),
+('冂', '멀'),
+('冃', '모'),
+('冄', '염'),
+('内', '납'),
+('内', '내'),
+('内', '안'),
+('円', '엔'),
+('円', '옌'),
+('冉', '염'),
+('冊', '책'),
+('冋', '경'),
+('册', '책'),
+('再', '두'),
+('再', '재'),
+('冎', '과'),
+('冏', '경'),
+('冐', '모'),
+('冑', '주'),
+('冒', '모'),
+('冒', '목'),
+('冓', '구'),
+('冔', '후'),
+('冕', '면'),
+('冖', '멱'),
+('冗', '용'),
+('冘', '유'),
+('写', '사'),
+('冝', '의'),
+('冞', '미'),
+('冟', '석'),
+('冠', '갓'),
+('冠', '관'),
+('冡', '몽'),
+('冢', '총'),
+('冣', '취'),
+('冤', '원'),
+('冥', '명'),
+('冦', '구'),
+('冧', '림'),
+('冨', '부'),
+('冩', '사'),
+('冪', '멱'),
+('冫', '빙'),
+('冬', '동'),
+('冰', '빙'),
+('冱', '호'),
+('冲', '충'),
+('决', '결'),
+('冴', '호'),
+('况', '황'),
+('冶', '야'),
+('冷', '냉'),
+('冷', '랭'),
+('冷', '찰'),
+('冸', '반'),
+('冹', '불'),
+('冽', '렬'),
+('凁', '수'),
+('凄', '처'),
+('凅', '고'),
+('准', '준'),
+('凇', '송'),
+('凈', '정'),
+('凉', '량'),
+('凊', '청'),
+('凋', '조'),
+('凌', '능'),
+('凌', '릉'),
+('凍', '동'),
+('凍', '얼'),
+('减', '감'),
+('凑', '주'),
+('凒', '의'),
+('凓', '율'),
+('凔', '창'),
+('凖', '준'),
+('凗', '최'),
+('凘', '시'),
+('凚', '금'),
+('凛', '름'),
+('凜', '름'),
+('凝', '응'),
+('凞', '희'),
+('几', '궤'),
+('凡', '범'),
+('凢', '범'),
+('凣', '범'),
+('凥', '거'),
+('処', '처'),
+('凨', '풍'),
+('凩', '목'),
+('凪', '지'),
+('凭', '빙'),
+('凮', '풍'),
+('凰', '황'),
+('凱', '개'),
+('凳', '등'),
+('凴', '빙'),
+('凵', '감'),
+('凵', '경'),
+('凶', '흉'),
+('凷', '괴'),
+('凸', '돌'),
+('凸', '철'),
+('凹', '요'),
+('出', '날'),
+('出', '척'),
+('出', '추'),
+('出', '출'),
+('函', '함'),
+('凾', '함'),
+('刀', '도'),
+('刀', '칼'),
+('刁', '조'),
+('刂', '도'),
+('刃', '인'),
+('刄', '인'),
+('刅', '창'),
+('分', '분'),
+('分', '푼'),
+('切', '절'),
+('切', '체'),
+('刈', '예'),
+('刊', '간'),
+('刋', '천'),
+('刌', '촌'),
+('刎', '문'),
+('刏', '기'),
+('刑', '형'),
+('划', '화'),
+('刓', '완'),
+('刔', '결'),
+('刕', '려'),
+('刕', '리'),
+('刖', '월'),
+('列', '렬'),
+('列', '열'),
+('列', '줄'),
+('刘', '류'),
+('刜', '불'),
+('初', '초'),
+('删', '산'),
+('判', '판'),
+('別', '별'),
+('刦', '겁'),
+('刧', '겁'),
+('刨', '포'),
+('利', '리'),
+('利', '이'),
+('刪', '산'),
+('别', '별'),
+('刮', '괄'),
+('到', '도'),
+('刱', '창'),
+('刲', '규'),
+('刳', '고'),
+('刴', '타'),
+('刵', '이'),
+('制', '제'),
+('刷', '쇄'),
+('券', '권'),
+('刹', '절'),
+('刹', '찰'),
+('刺', '자'),
+('刺', '척'),
+('刺', '체'),
+('刻', '각'),
+('剃', '체'),
+('剄', '경'),
+('則', '곧'),
+('則', '즉'),
+('則', '측'),
+('則', '칙'),
+('剉', '좌'),
+('削', '삭'),
+('剋', '극'),
+('剌', '랄'),
+('前', '앞'),
+('前', '전'),
+('剎', '찰'),
+('剏', '창'),
+('剒', '작'),
+('剒', '착'),
+('剓', '리'),
+('剔', '척'),
+('剕', '비'),
+('剖', '부'),
+('剗', '잔'),
+('剙', '창'),
+('剚', '사'),
+('剛', '강'),
+('剜', '완'),
+('剝', '박'),
+('剞', '기'),
+('剟', '철'),
+('剠', '경'),
+('剠', '략'),
+('剠', '량'),
+('剡', '섬'),
+('剡', '염'),
+('剣', '검'),
+('剥', '박'),
+('剦', '엄'),
+('剨', '괵'),
+('剩', '잉'),
+('剪', '전'),
+('剫', '탁'),
+('剬', '단'),
+('剭', '악'),
+('剭', '옥'),
+('剮', '과'),
+('副', '복'),
+('副', '부'),
+('割', '벨'),
+('割', '할'),
+('剳', '차'),
+('剴', '개'),
+('創', '창'),
+('剷', '산'),
+('剸', '단'),
+('剸', '전'),
+('剹', '륙'),
+('剺', '리'),
+('剽', '표'),
+('剿', '초'),
+('劀', '괄'),
+('劂', '궤'),
+('劃', '획'),
+('劄', '차'),
+('劇', '극'),
+('劈', '벽'),
+('劉', '류'),
+('劉', '유'),
+('劊', '괴'),
+('劊', '회'),
+('劋', '조'),
+('劌', '귀'),
+('劍', '검'),
+('劍', '칼'),
+('劎', '검'),
+('劐', '확'),
+('劑', '제'),
+('劒', '검'),
+('劒', '칼'),
+('劓', '의'),
+('劔', '검'),
+('劖', '참'),
+('劗', '찬'),
+('劘', '마'),
+('劙', '례'),
+('劙', '리'),
+('劚', '촉'),
+('力', '력'),
+('力', '역'),
+('力', '힘'),
+('功', '공'),
+('加', '가'),
+('劣', '렬'),
+('劣', '열'),
+('劤', '근'),
+('劦', '협'),
+('助', '조'),
+('努', '노'),
+('劫', '겁'),
+('劬', '구'),
+('劭', '초'),
+('劮', '일'),
+('励', '려'),
+('労', '로'),
+('劵', '권'),
+('劶', '구'),
+('効', '효'),
+('劻', '광'),
+('劼', '할'),
+('劾', '해'),
+('劾', '핵'),
+('勀', '극'),
+('勁', '경'),
+('勃', '발'),
+('勅', '칙'),
+('勇', '용'),
+('勉', '면'),
+('勌', '권'),
+('勍', '경'),
+('勑', '래'),
+('勑', '칙'),
+('勒', '륵'),
+('勔', '민'),
+('動', '동'),
+('勖', '욱'),
+('勗', '욱'),
+('勘', '감'),
+('務', '무'),
+('勛', '훈'),
+('勝', '승'),
+('勞', '노'),
+('勞', '로'),
+('募', '모'),
+('勠', '륙'),
+('勡', '표'),
+('勢', '세'),
+('勣', '적'),
+('勤', '근'),
+('勦', '초'),
+('勧', '권'),
+('勨', '상'),
+('勨', '양'),
+('勩', '예'),
+('勩', '이'),
+('勮', '거'),
+('勯', '단'),
+('勰', '협'),
+('勱', '매'),
+('勲', '훈'),
+('勳', '공'),
+('勳', '훈'),
+('勴', '려'),
+('勵', '려'),
+('勵', '여'),
+('勶', '쏠'),
+('勶', '철'),
+('勷', '양'),
+('勸', '권'),
+('勹', '쌀'),
+('勹', '포'),
+('勺', '작'),
+('勻', '균'),
+('勻', '윤'),
+('勼', '구'),
+('勽', '문'),
+('勾', '구'),
+('勾', '귀'),
+('勿', '말'),
+('勿', '몰'),
+('勿', '물'),
+('匀', '균'),
+('匀', '윤'),
+('匁', '문'),
+('匂', '내'),
+('匃', '개'),
+('匄', '갈'),
+('匄', '개'),
+('包', '쌀'),
+('包', '포'),
+('匆', '총'),
+('匈', '흉'),
+('匈', '흥'),
+('匉', '평'),
+('匊', '국'),
+('匋', '도'),
+('匋', '요'),
+('匌', '합'),
+('匍', '포'),
+('匎', '압'),
+('匏', '포'),
+('匐', '복'),
+('匑', '궁'),
+('匒', '답'),
+('匓', '구'),
+('匕', '비'),
+('化', '될'),
+('化', '화'),
+('北', '배'),
+('北', '베'),
+('北', '북'),
+('匘', '뇌'),
+('匙', '시'),
+('匚', '방'),
+('匛', '구'),
+('匜', '이'),
+('匝', '잡'),
+('匞', '장'),
+('匟', '강'),
+('匠', '장'),
+('匡', '광'),
+('匣', '갑'),
+('匥', '변'),
+('匧', '협'),
+('匪', '분'),
+('匪', '비'),
+('匬', '유'),
+('匭', '궤'),
+('匯', '회'),
+('匰', '단'),
+('匱', '궤'),
+('匲', '렴'),
+('匲', '염'),
+('匳', '렴'),
+('匳', '염'),
+('匴', '산'),
+('匵', '독'),
+('匶', '구'),
+('匸', '혜'),
+('匹', '목'),
+('匹', '필'),
+('区', '구'),
+('区', '우'),
+('医', '예'),
+('医', '의'),
+('匼', '압'),
+('匽', '언'),
+('匾', '편'),
+('匿', '닉'),
+('匿', '익'),
+('區', '구'),
+('區', '우'),
+('十', '십'),
+('十', '열'),
+('卂', '신'),
+('千', '천'),
+('卄', '입'),
+('卅', '삽'),
+('卆', '졸'),
+('升', '승'),
+('午', '낮'),
+('午', '오'),
+('卉', '훼'),
+('半', '반'),
+('卋', '세'),
+('卌', '십'),
+('卍', '만'),
+('卐', '만'),
+('卑', '비'),
+('卒', '졸'),
+('卓', '탁'),
+('協', '협'),
+('单', '단'),
+('单', '선'),
+('南', '나'),
+('南', '남'),
+('単', '단'),
+('単', '선'),
+('卙', '집'),
+('博', '박'),
+('卜', '복'),
+('卜', '점'),
+('卝', '관'),
+('卝', '굉'),
+('卞', '변'),
+('卟', '게'),
+('占', '점'),
+('卡', '잡'),
+('卣', '유'),
+('卦', '괘'),
+('卨', '설'),
+('卩', '절'),
+('卪', '절'),
+('卬', '앙'),
+('卭', '공'),
+('卮', '치'),
+('卯', '묘'),
+('印', '끋'),
+('印', '인'),
+('危', '위'),
+('卲', '소'),
+('即', '곧'),
+('即', '즉'),
+('却', '각'),
+('卵', '난'),
+('卵', '란'),
+('卵', '알'),
+('卶', '시'),
+('卷', '권'),
+('卸', '사'),
+('卹', '휼'),
+('卺', '근'),
+('卻', '각'),
+('卼', '올'),
+('卽', '곧'),
+('卽', '즉'),
+('卾', '악'),
+('卿', '경'),
+('厀', '슬'),
+('厁', '산'),
+('厂', '엄'),
+('厂', '한'),
+('厃', '위'),
+('厃', '점'),
+('厄', '액'),
+('厇', '책'),
+('厉', '려'),
+('厊', '아'),
+('压', '압'),
+('厎', '지'),
+('厓', '애'),
+('厔', '질'),
+('厖', '방'),
+('厘', '리'),
+('厘', '전'),
+('厚', '후'),
+('厝', '조'),
+('厞', '비'),
+('原', '원'),
+('厠', '측'),
+('厤', '력'),
+('厥', '굴'),
+('厥', '궐'),
+('厥', '그'),
+('厦', '하'),
+('厨', '주'),
+('厩', '구'),
+('厪', '근'),
+('厬', '궤'),
+('厭', '염'),
+('厭', '엽'),
+('厮', '시'),
+('厱', '엄'),
+('厲', '려'),
+('厳', '엄'),
+('厴', '염'),
+('厵', '원'),
+('厶', '사'),
+('厷', '굉'),
+('厸', '린'),
+('厹', '구'),
+('厺', '거'),
+('去', '갈'),
+('去', '거'),
+('厼', '금'),
+('厼', '너'),
+('厼', '며'),
+('厼', '윽'),
+('厼', '이'),
+('厽', '뤼'),
+('厽', '참'),
+('叀', '전'),
+('叁', '삼'),
+('参', '삼'),
+('参', '참'),
+('參', '삼'),
+('參', '석'),
+('參', '참'),
+('叄', '삼'),
+('叄', '석'),
+('叄', '참'),
+('叅', '참'),
+('又', '또'),
+('又', '우'),
+('叉', '차'),
+('及', '급'),
+('友', '벗'),
+('友', '우'),
+('双', '쌍'),
+('反', '반'),
+('反', '번'),
+('反', '판'),
+('反', '팔'),
+('叏', '괘'),
+('叒', '약'),
+('叓', '사'),
+('叔', '숙'),
+('叕', '철'),
+('取', '취'),
+('受', '수'),
+('变', '변'),
+('叙', '서'),
+('叚', '가'),
+('叛', '반'),
+('叞', '위'),
+('叟', '수'),
+('叡', '예'),
+('叢', '총'),
+('口', '구'),
+('口', '입'),
+('古', '고'),
+('古', '옛'),
+('句', '구'),
+('句', '귀'),
+('另', '령'),
+('叧', '과'),
+('叨', '도'),
+('叩', '고'),
+('只', '지'),
+('叫', '규'),
+('召', '소'),
+('召', '조'),
+('叭', '팔'),
+('叮', '정'),
+('可', '가'),
+('可', '극'),
+('台', '이'),
+('台', '태'),
+('叱', '질'),
+('史', '사'),
+('右', '우'),
+('叴', '구'),
+('叵', '파'),
+('叶', '협'),
+('号', '호'),
+('司', '사'),
+('叺', '입'),
+('吁', '유'),
+('吃', '흘'),
+('各', '각'),
+('吅', '현'),
+('吆', '요'),
+('合', '갑'),
+('合', '합'),
+('吉', '길'),
+('吊', '적'),
+('吋', '촌'),
+('同', '동'),
+('名', '명'),
+('后', '후'),
+('吏', '리'),
+('吏', '이'),
+('吐', '토'),
+('向', '상'),
+('向', '성'),
+('向', '향'),
+('吒', '타'),
+('吒', '탁'),
+('吕', '려'),
+('吘', '우'),
+('吚', '의'),
+('君', '군'),
+('吝', '린'),
+('吞', '탄'),
+('吟', '음'),
+('吠', '폐'),
+('吡', '필'),
+('吢', '심'),
+('否', '부'),
+('否', '비'),
+('吧', '파'),
+('吨', '둔'),
+('吩', '분'),
+('吪', '와'),
+('含', '함'),
+('听', '은'),
+('吭', '항'),
+('吮', '전'),
+('启', '계'),
+('吱', '지'),
+('吲', '신'),
+('吳', '오'),
+('吳', '호'),
+('吳', '화'),
+('吴', '오'),
+('吵', '묘'),
+('吵', '초'),
+('吶', '납'),
+('吶', '눌'),
+('吶', '열'),
+('吷', '혈'),
+('吸', '흡'),
+('吹', '불'),
+('吹', '취'),
+('吺', '두'),
+('吻', '문'),
+('吼', '후'),
+('吽', '우'),
+('吽', '음'),
+('吽', '후'),
+('吾', '오'),
+('吿', '고'),
+('吿', '곡'),
+('呀', '하'),
+('呂', '려'),
+('呃', '애'),
+('呅', '매'),
+('呅', '문'),
+('呆', '매'),
+('呆', '보'),
+('呆', '태'),
+('呈', '정'),
+('呉', '오'),
+('呉', '호'),
+('告', '고'),
+('告', '곡'),
+('呌', '규'),
+('呎', '척'),
+('呏', '승'),
+('呐', '눌'),
+('呐', '열'),
+('呑', '탄'),
+('呝', '액'),
+('呟', '현'),
+('呢', '니'),
+('呤', '령'),
+('呦', '유'),
+('呧', '제'),
+('周', '주'),
+('呪', '빌'),
+('呪', '주'),
+('呫', '첩'),
+('呬', '령'),
+('呬', '희'),
+('呬', '히'),
+('呭', '예'),
+('呮', '기'),
+('呰', '자'),
+('呱', '고'),
+('味', '맛'),
+('味', '미'),
+('呴', '구'),
+('呵', '가'),
+('呶', '노'),
+('呷', '합'),
+('呸', '비'),
+('呹', '일'),
+('呹', '질'),
+('呺', '호'),
+('呺', '효'),
+('呻', '신'),
+('呼', '호'),
+('命', '명'),
+('呾', '달'),
+('呿', '거'),
+('咀', '저'),
+('咂', '잡'),
+('咄', '돌'),
+('咅', '부'),
+('咆', '포'),
+('咇', '필'),
+('咈', '불'),
+('咉', '앙'),
+('咊', '화'),
+('咋', '사'),
+('和', '화'),
+('咍', '해'),
+('咎', '고'),
+('咎', '구'),
+('咏', '영'),
+('咐', '부'),
+('咒', '주'),
+('咕', '고'),
+('咖', '가'),
+('咜', '타'),
+('咠', '집'),
+('咡', '이'),
+('咢', '악'),
+('咤', '타'),
+('咥', '희'),
+('咦', '이'),
+('咦', '재'),
+('咧', '렬'),
+('咨', '자'),
+('咩', '미'),
+('咪', '미'),
+('咫', '지'),
+('咬', '교'),
+('咭', '갈'),
+('咭', '길'),
+('咮', '주'),
+('咯', '각'),
+('咱', '차'),
+('咱', '찰'),
+('咲', '소'),
+('咳', '해'),
+('咶', '시'),
+('咶', '활'),
+('咷', '도'),
+('咸', '함'),
+('咺', '훤'),
+('咻', '휴'),
+('咼', '괘'),
+('咽', '열'),
+('咽', '인'),
+('咿', '이'),
+('哀', '애'),
+('品', '품'),
+('哂', '신'),
+('哃', '동'),
+('哄', '홍'),
+('哅', '흉'),
+('哆', '치'),
+('哇', '와'),
+('哈', '합'),
+('哉', '재'),
+('响', '상'),
+('哎', '애'),
+('哘', '행'),
+('哛', '뿐'),
+('員', '원'),
+('哢', '롱'),
+('哤', '방'),
+('哥', '가'),
+('哦', '아'),
+('哨', '소'),
+('哨', '초'),
+('哩', '리'),
+('哪', '나'),
+('哫', '족'),
+('哬', '하'),
+('哭', '곡'),
+('哭', '울'),
+('哮', '효'),
+('哯', '현'),
+('哰', '로'),
+('哱', '발'),
+('哲', '철'),
+('哳', '찰'),
+('哶', '마'),
+('哷', '렬'),
+('哹', '부'),
+('哺', '포'),
+('哼', '형'),
+('哽', '경'),
+('哿', '가'),
+('唀', '유'),
+('唁', '언'),
+('唄', '패'),
+('唅', '함'),
+('唆', '사'),
+('唇', '진'),
+('唈', '압'),
+('唈', '읍'),
+('唉', '애'),
+('唊', '겹'),
+('唌', '단'),
+('唌', '연'),
+('唍', '완'),
+('唎', '리'),
+('唏', '희'),
+('唐', '당'),
+('唔', '오'),
+('唕', '조'),
+('唖', '아'),
+('唚', '침'),
+('唜', '말'),
+('唟', '것'),
+('唤', '환'),
+('唪', '봉'),
+('唫', '금'),
+('唬', '호'),
+('唭', '기'),
+('售', '수'),
+('售', '팔'),
+('唯', '유'),
+('唱', '창'),
+('唲', '아'),
+('唲', '애'),
+('唳', '려'),
+('唴', '강'),
+('唵', '안'),
+('唶', '차'),
+('唶', '책'),
+('唷', '육'),
+('唸', '전'),
+('唸', '점'),
+('唹', '어'),
+('唼', '삽'),
+('唾', '침'),
+('唾', '타'),
+('唿', '홀'),
+('啀', '애'),
+('啁', '조'),
+('啁', '주'),
+('啂', '뇨'),
+('啂', '누'),
+('啃', '삽'),
+('啄', '탁'),
+('啅', '탁'),
+('商', '상'),
+('啇', '적'),
+('啉', '람'),
+('啊', '아'),
+('啋', '교'),
+('啋', '효'),
+('啍', '톤'),
+('啎', '오'),
+('問', '문'),
+('啐', '줄'),
+('啐', '쵀'),
+('啑', '삽'),
+('啑', '잡'),
+('啑', '체'),
+('啓', '계'),
+('啓', '열'),
+('啕', '도'),
+('啖', '담'),
+('啗', '담'),
+('啙', '자'),
+('啚', '비'),
+('啜', '철'),
+('啝', '와'),
+('啞', '아'),
+('啟', '계'),
+('啡', '배'),
+('啡', '비'),
+('啣', '함'),
+('啻', '시'),
+('啼', '제'),
+('啽', '암'),
+('啾', '추'),
+('啿', '담'),
+('啿', '잠'),
+('喀', '객'),
+('喁', '옹'),
+('喁', '우'),
+('喂', '위'),
+('喃', '남'),
+('善', '선'),
+('喅', '육'),
+('喆', '철'),
+('喇', '라'),
+('喇', '랄'),
+('喈', '개'),
+('喉', '후'),
+('喊', '함'),
+('喋', '잡'),
+('喋', '첩'),
+('喌', '주'),
+('喌', '죽'),
+('喍', '재'),
+('喏', '야'),
+('喑', '음'),
+('喒', '잠'),
+('喓', '요'),
+('喔', '악'),
+('喗', '운'),
+('喘', '천'),
+('喙', '훼'),
+('喚', '환'),
+('喛', '환'),
+('喜', '희'),
+('喝', '갈'),
+('喝', '애'),
+('喞', '즐'),
+('喞', '직'),
+('喟', '괴'),
+('喟', '위'),
+('喠', '종'),
+('喣', '후'),
+('喤', '황'),
+('喦', '녑'),
+('喦', '엽'),
+('喧', '훤'),
+('喨', '량'),
+('喩', '유'),
+('喪', '상'),
+('喫', '끽'),
+('喬', '교'),
+('喭', '안'),
+('喭', '언'),
+('單', '단'),
+('單', '선'),
+('單', '홀'),
+('喰', '식'),
+('喰', '찬'),
+('喲', '약'),
+('喳', '사'),
+('営', '영'),
+('喸', '폿'),
+('喻', '유'),
+('喿', '소'),
+('嗀', '학'),
+('嗁', '제'),
+('嗂', '요'),
+('嗃', '학'),
+('嗃', '효'),
+('嗄', '사'),
+('嗄', '애'),
+('嗅', '후'),
+('嗆', '창'),
+('嗇', '색'),
+('嗈', '옹'),
+('嗉', '소'),
+('嗊', '홍'),
+('嗋', '협'),
+('嗌', '액'),
+('嗌', '이'),
+('嗎', '마'),
+('嗐', '할'),
+('嗐', '해'),
+('嗑', '갑'),
+('嗑', '합'),
+('嗒', '탑'),
+('嗓', '상'),
+('嗔', '진'),
+('嗕', '욕'),
+('嗙', '방'),
+('嗚', '오'),
+('嗛', '겸'),
+('嗜', '기'),
+('嗝', '격'),
+('嗞', '자'),
+('嗟', '차'),
+('嗠', '라'),
+('嗡', '옹'),
+('嗢', '올'),
+('嗣', '사'),
+('嗤', '치'),
+('嗧', '륜'),
+('嗩', '쇄'),
+('嗭', '짓'),
+('嗶', '필'),
+('嗷', '오'),
+('嗸', '오'),
+('嗹', '련'),
+('嗺', '최'),
+('嗻', '차'),
+('嗼', '막'),
+('嗽', '수'),
+('嗾', '주'),
+('嗿', '탐'),
+('嘁', '측'),
+('嘂', '교'),
+('嘄', '교'),
+('嘅', '개'),
+('嘆', '탄'),
+('嘇', '삼'),
+('嘈', '조'),
+('嘉', '가'),
+('嘊', '애'),
+('嘌', '표'),
+('嘍', '루'),
+('嘎', '알'),
+('嘏', '가'),
+('嘏', '하'),
+('嘐', '교'),
+('嘑', '호'),
+('嘒', '혜'),
+('嘓', '괵'),
+('嘔', '구'),
+('嘔', '후'),
+('嘕', '언'),
+('嘖', '책'),
+('嘗', '상'),
+('嘘', '허'),
+('嘚', '득'),
+('嘛', '마'),
+('嘞', '륵'),
+('嘟', '도'),
+('嘠', '갈'),
+('嘠', '알'),
+('嘨', '소'),
+('嘩', '화'),
+('嘪', '매'),
+('嘫', '연'),
+('嘬', '최'),
+('嘮', '초'),
+('嘯', '소'),
+('嘰', '기'),
+('嘱', '촉'),
+('嘲', '조'),
+('嘳', '괴'),
+('嘴', '취'),
+('嘵', '효'),
+('嘶', '시'),
+('嘷', '호'),
+('嘸', '무'),
+('嘹', '료'),
+('嘺', '교'),
+('嘻', '희'),
+('嘼', '휴'),
+('嘽', '천'),
+('嘽', '탄'),
+('嘾', '담'),
+('嘿', '묵'),
+('噀', '손'),
+('噁', '오'),
+('噂', '준'),
+('噃', '건'),
+('噃', '번'),
+('噅', '위'),
+('噆', '참'),
+('噇', '담'),
+('噈', '축'),
+('噉', '담'),
+('噊', '술'),
+('噊', '율'),
+('噋', '톤'),
+('噌', '쟁'),
+('噌', '증'),
+('噍', '초'),
+('噎', '열'),
+('噏', '흡'),
+('噐', '기'),
+('噓', '허'),
+('噕', '위'),
+('噞', '엄'),
+('噠', '달'),
+('噢', '우'),
+('噢', '욱'),
+('噣', '주'),
+('噣', '탁'),
+('噤', '금'),
+('噥', '농'),
+('噦', '얼'),
+('噦', '홰'),
+('噧', '홰'),
+('器', '기'),
+('噩', '악'),
+('噪', '조'),
+('噫', '애'),
+('噫', '희'),
+('噬', '서'),
+('噭', '교'),
+('噮', '연'),
+('噯', '애'),
+('噰', '옹'),
+('噱', '갹'),
+('噲', '쾌'),
+('噳', '우'),
+('噴', '분'),
+('噶', '갈'),
+('噸', '톤'),
+('噺', '신'),
+('嚀', '녕'),
+('嚂', '람'),
+('嚃', '탑'),
+('嚄', '획'),
+('嚅', '유'),
+('嚆', '효'),
+('嚇', '하'),
+('嚇', '혁'),
+('嚊', '비'),
+('嚌', '제'),
+('嚍', '진'),
+('嚎', '호'),
+('嚏', '체'),
+('嚔', '체'),
+('嚕', '로'),
+('嚗', '박'),
+('嚘', '우'),
+('嚙', '교'),
+('嚚', '은'),
+('嚛', '학'),
+('嚜', '매'),
+('嚜', '묵'),
+('嚞', '철'),
+('嚠', '류'),
+('嚢', '낭'),
+('嚥', '연'),
+('嚦', '력'),
+('嚧', '로'),
+('嚨', '롱'),
+('嚪', '담'),
+('嚫', '친'),
+('嚬', '빈'),
+('嚭', '비'),
+('嚮', '향'),
+('嚱', '희'),
+('嚲', '타'),
+('嚳', '고'),
+('嚳', '곡'),
+('嚴', '엄'),
+('嚶', '앵'),
+('嚷', '양'),
+('嚻', '효'),
+('嚼', '작'),
+('嚾', '환'),
+('嚾', '훤'),
+('囀', '전'),
+('囁', '섭'),
+('囁', '엽'),
+('囂', '효'),
+('囃', '잡'),
+('囅', '천'),
+('囅', '철'),
+('囆', '채'),
+('囈', '예'),
+('囉', '라'),
+('囊', '낭'),
+('囋', '찬'),
+('囋', '찰'),
+('囍', '희'),
+('囏', '간'),
+('囐', '잘'),
+('囑', '촉'),
+('囒', '란'),
+('囓', '녈'),
+('囓', '설'),
+('囗', '국'),
+('囗', '위'),
+('囙', '인'),
+('囚', '수'),
+('四', '넉'),
+('四', '사'),
+('囝', '건'),
+('回', '회'),
+('囟', '신'),
+('因', '인'),
+('団', '단'),
+('囤', '돈'),
+('囦', '연'),
+('囧', '경'),
+('囩', '운'),
+('囪', '창'),
+('囪', '총'),
+('囫', '홀'),
+('囬', '회'),
+('园', '완'),
+('囮', '와'),
+('困', '경'),
+('困', '곤'),
+('囱', '창'),
+('囱', '총'),
+('囲', '위'),
+('図', '도'),
+('囶', '국'),
+('囷', '균'),
+('囹', '령'),
+('固', '고'),
+('国', '국'),
+('囿', '유'),
+('圀', '국'),
+('圁', '은'),
+('圂', '혼'),
+('圃', '포'),
+('圄', '어'),
+('圅', '함'),
+('圇', '륜'),
+('圈', '권'),
+('圉', '어'),
+('圊', '청'),
+('國', '국'),
+('圌', '천'),
+('圍', '위'),
+('圎', '원'),
+('圏', '권'),
+('園', '원'),
+('圓', '원'),
+('圕', '서'),
+('圖', '도'),
+('圗', '도'),
+('團', '단'),
+('圛', '역'),
+('圜', '원'),
+('圜', '환'),
+('圝', '란'),
+('土', '두'),
+('土', '토'),
+('土', '흙'),
+('圥', '록'),
+('圧', '압'),
+('在', '재'),
+('圩', '우'),
+('圬', '오'),
+('圭', '규'),
+('圮', '비'),
+('地', '땅'),
+('地', '지'),
+('圻', '기'),
+('圻', '은'),
+('圾', '급'),
+('址', '지'),
+('坂', '판'),
+('均', '균'),
+('坊', '방'),
+('坌', '분'),
+('坍', '담'),
+('坎', '감'),
+('坏', '배'),
+('坐', '좌'),
+('坑', '갱'),
+('坒', '비'),
+('坡', '파'),
+('坢', '반'),
+('坤', '곤'),
+('坤', '땅'),
+('坦', '탄'),
+('坧', '척'),
+('坨', '이'),
+('坩', '감'),
+('坪', '들'),
+('坪', '평'),
+('坫', '점'),
+('坮', '대'),
+('坯', '배'),
+('坰', '경'),
+('坱', '앙'),
+('坳', '요'),
+('坵', '구'),
+('坷', '가'),
+('坸', '구'),
+('坻', '지'),
+('坼', '탁'),
+('垂', '수'),
+('垈', '대'),
+('型', '형'),
+('垌', '동'),
+('垓', '해'),
+('垔', '인'),
+('垕', '후'),
+('垖', '퇴'),
+('垚', '요'),
+('垞', '타'),
+('垠', '은'),
+('垢', '구'),
+('垣', '원'),
+('垤', '질'),
+('垩', '성'),
+('垳', '행'),
+('垸', '완'),
+('垸', '환'),
+('垼', '역'),
+('垽', '은'),
+('埃', '애'),
+('埆', '각'),
+('埇', '용'),
+('埈', '준'),
+('埉', '협'),
+('埋', '매'),
+('城', '성'),
+('城', '재'),
+('埏', '연'),
+('埑', '철'),
+('埒', '랄'),
+('埜', '들'),
+('埜', '야'),
+('域', '역'),
+('埠', '부'),
+('埤', '비'),
+('埦', '완'),
+('埭', '태'),
+('埰', '채'),
+('埳', '감'),
+('埴', '식'),
+('埴', '치'),
+('埶', '세'),
+('執', '집'),
+('培', '배'),
+('培', '부'),
+('基', '기'),
+('基', '터'),
+('埻', '준'),
+('埼', '기'),
+('埽', '소'),
+('堀', '굴'),
+('堂', '당'),
+('堂', '집'),
+('堃', '곤'),
+('堅', '견'),
+('堅', '경'),
+('堆', '퇴'),
+('堇', '근'),
+('堈', '강'),
+('堉', '육'),
+('堊', '악'),
+('堋', '불'),
+('堕', '타'),
+('堕', '휴'),
+('堗', '돌'),
+('堙', '인'),
+('堝', '과'),
+('堞', '첩'),
+('堠', '후'),
+('堡', '보'),
+('堣', '유'),
+('堤', '둑'),
+('堤', '제'),
+('堦', '계'),
+('堧', '연'),
+('堪', '감'),
+('堯', '요'),
+('堰', '언'),
+('報', '보'),
+('報', '부'),
+('場', '량'),
+('場', '장'),
+('堵', '도'),
+('堺', '계'),
+('塀', '병'),
+('塉', '척'),
+('塊', '괴'),
+('塋', '영'),
+('塌', '탑'),
+('塍', '습'),
+('塍', '승'),
+('塍', '증'),
+('塏', '개'),
+('塐', '소'),
+('塑', '소'),
+('塒', '시'),
+('塔', '탑'),
+('塕', '옹'),
+('塗', '도'),
+('塘', '당'),
+('塙', '고'),
+('塚', '총'),
+('塜', '봉'),
+('塞', '새'),
+('塞', '색'),
+('塡', '전'),
+('塡', '진'),
+('塢', '오'),
+('塤', '훈'),
+('塩', '염'),
+('填', '전'),
+('填', '진'),
+('塵', '진'),
+('塹', '참'),
+('塼', '전'),
+('塽', '상'),
+('塾', '숙'),
+('墀', '지'),
+('墁', '만'),
+('境', '경'),
+('墅', '서'),
+('墉', '용'),
+('墊', '점'),
+('墍', '기'),
+('墐', '근'),
+('墓', '모'),
+('墓', '묘'),
+('増', '증'),
+('墜', '추'),
+('墝', '요'),
+('增', '증'),
+('墟', '허'),
+('墡', '선'),
+('墣', '복'),
+('墦', '번'),
+('墨', '먹'),
+('墨', '묵'),
+('墨', '미'),
+('墩', '돈'),
+('墫', '준'),
+('墮', '타'),
+('墰', '담'),
+('墱', '등'),
+('墳', '분'),
+('墺', '오'),
+('墺', '옥'),
+('墻', '장'),
+('墾', '간'),
+('壁', '벽'),
+('壃', '강'),
+('壅', '옹'),
+('壇', '단'),
+('壇', '제'),
+('壌', '양'),
+('壎', '훈'),
+('壑', '학'),
+('壓', '압'),
+('壔', '도'),
+('壕', '호'),
+('壘', '누'),
+('壘', '루'),
+('壘', '유'),
+('壘', '진'),
+('壙', '광'),
+('壚', '로'),
+('壜', '담'),
+('壝', '유'),
+('壞', '괴'),
+('壞', '회'),
+('壟', '롱'),
+('壤', '양'),
+('壤', '흙'),
+('壩', '파'),
+('壩', '패'),
+('士', '사'),
+('壬', '임'),
+('壭', '산'),
+('壮', '장'),
+('壯', '장'),
+('声', '성'),
+('壱', '일'),
+('売', '매'),
+('壴', '북'),
+('壴', '주'),
+('壹', '일'),
+('壺', '호'),
+('壻', '서'),
+('壼', '곤'),
+('壼', '호'),
+('壽', '수'),
+('夅', '강'),
+('夆', '봉'),
+('夈', '재'),
+('変', '변'),
+('夋', '준'),
+('复', '복'),
+('复', '부'),
+('夏', '하'),
+('夐', '형'),
+('夔', '기'),
+('夕', '사'),
+('夕', '석'),
+('外', '외'),
+('夗', '원'),
+('夙', '숙'),
+('多', '다'),
+('夜', '밤'),
+('夜', '야'),
+('夞', '욋'),
+('夞', '읫'),
+('夢', '꿈'),
+('夢', '몽'),
+('夤', '인'),
+('夥', '과'),
+('夥', '해'),
+('夥', '화'),
+('大', '대'),
+('大', '큰'),
+('大', '태'),
+('天', '천'),
+('太', '콩'),
+('太', '클'),
+('太', '태'),
+('夫', '부'),
+('夬', '쾌'),
+('夭', '오'),
+('夭', '요'),
+('央', '앙'),
+('夯', '항'),
+('失', '실'),
+('夷', '이'),
+('夸', '과'),
+('夻', '구'),
+('夻', '화'),
+('夾', '협'),
+('奄', '엄'),
+('奇', '기'),
+('奇', '의'),
+('奈', '나'),
+('奈', '내'),
+('奉', '봉'),
+('奌', '점'),
+('奎', '규'),
+('奎', '별'),
+('奏', '주'),
+('奐', '환'),
+('契', '결'),
+('契', '계'),
+('契', '글'),
+('契', '설'),
+('奓', '차'),
+('奔', '분'),
+('奕', '혁'),
+('套', '토'),
+('套', '투'),
+('奘', '장'),
+('奚', '해'),
+('奞', '순'),
+('奠', '전'),
+('奠', '정'),
+('奢', '사'),
+('奥', '오'),
+('奥', '욱'),
+('奧', '오'),
+('奧', '옥'),
+('奧', '욱'),
+('奨', '장'),
+('奩', '렴'),
+('奩', '염'),
+('奪', '탈'),
+('奫', '윤'),
+('奬', '장'),
+('奭', '석'),
+('奭', '학'),
+('奮', '분'),
+('女', '너'),
+('女', '녀'),
+('女', '여'),
+('奴', '노'),
+('奴', '종'),
+('奶', '내'),
+('奶', '젖'),
+('奸', '간'),
+('好', '호'),
+('妁', '작'),
+('如', '여'),
+('妃', '배'),
+('妃', '비'),
+('妄', '망'),
+('妊', '임'),
+('妍', '연'),
+('妑', '파'),
+('妒', '투'),
+('妓', '기'),
+('妖', '요'),
+('妗', '금'),
+('妙', '묘'),
+('妝', '장'),
+('妡', '흔'),
+('妣', '비'),
+('妤', '여'),
+('妥', '타'),
+('妧', '완'),
+('妨', '방'),
+('妬', '투'),
+('妮', '니'),
+('妯', '축'),
+('妲', '달'),
+('妹', '매'),
+('妻', '처'),
+('妾', '첩'),
+('姁', '후'),
+('姃', '정'),
+('姆', '모'),
+('姈', '령'),
+('姉', '자'),
+('姊', '자'),
+('始', '시'),
+('姍', '산'),
+('姐', '저'),
+('姑', '고'),
+('姒', '사'),
+('姓', '성'),
+('委', '위'),
+('姗', '산'),
+('姙', '임'),
+('姚', '요'),
+('姜', '강'),
+('姝', '주'),
+('姞', '길'),
+('姢', '연'),
+('姣', '교'),
+('姤', '구'),
+('姥', '모'),
+('姦', '간'),
+('姨', '이'),
+('姪', '절'),
+('姪', '질'),
+('姫', '희'),
+('姬', '희'),
+('姮', '항'),
+('姱', '과'),
+('姸', '연'),
+('姺', '신'),
+('姻', '인'),
+('姿', '자'),
+('威', '위'),
+('娃', '왜'),
+('娉', '빙'),
+('娑', '사'),
+('娓', '미'),
+('娘', '낭'),
+('娘', '랑'),
+('娙', '형'),
+('娛', '오'),
+('娜', '나'),
+('娟', '연'),
+('娠', '신'),
+('娣', '제'),
+('娥', '아'),
+('娧', '태'),
+('娩', '만'),
+('娭', '애'),
+('娯', '오'),
+('娵', '추'),
+('娶', '취'),
+('娼', '창'),
+('娿', '아'),
+('婀', '아'),
+('婁', '루'),
+('婆', '파'),
+('婉', '완'),
+('婌', '숙'),
+('婐', '와'),
+('婕', '첩'),
+('婚', '혼'),
+('婢', '비'),
+('婣', '인'),
+('婦', '부'),
+('婧', '정'),
+('婪', '람'),
+('婬', '음'),
+('婲', '화'),
+('婷', '정'),
+('婾', '투'),
+('婿', '서'),
+('媄', '미'),
+('媍', '부'),
+('媒', '매'),
+('媓', '황'),
+('媕', '암'),
+('媚', '미'),
+('媛', '원'),
+('媟', '설'),
+('媢', '모'),
+('媤', '사'),
+('媤', '시'),
+('媧', '과'),
+('媧', '왜'),
+('媪', '오'),
+('媱', '요'),
+('媳', '식'),
+('媵', '잉'),
+('媺', '미'),
+('媻', '반'),
+('媼', '온'),
+('媽', '마'),
+('媾', '구'),
+('媿', '괴'),
+('嫁', '가'),
+('嫂', '수'),
+('嫄', '원'),
+('嫈', '앵'),
+('嫉', '질'),
+('嫋', '뇨'),
+('嫋', '약'),
+('嫌', '혐'),
+('嫖', '표'),
+('嫗', '구'),
+('嫙', '선'),
+('嫚', '만'),
+('嫛', '예'),
+('嫠', '리'),
+('嫡', '적'),
+('嫢', '규'),
+('嫣', '언'),
+('嫥', '전'),
+('嫦', '항'),
+('嫩', '눈'),
+('嫫', '모'),
+('嫮', '호'),
+('嫯', '오'),
+('嫵', '무'),
+('嫶', '초'),
+('嫺', '한'),
+('嫻', '한'),
+('嫽', '료'),
+('嬀', '규'),
+('嬅', '화'),
+('嬈', '요'),
+('嬉', '희'),
+('嬋', '선'),
+('嬌', '교'),
+('嬖', '폐'),
+('嬙', '장'),
+('嬛', '현'),
+('嬢', '양'),
+('嬥', '조'),
+('嬨', '자'),
+('嬪', '빈'),
+('嬭', '내'),
+('嬭', '젖'),
+('嬰', '영'),
+('嬲', '뇨'),
+('嬴', '영'),
+('嬾', '난'),
+('嬾', '란'),
+('嬿', '연'),
+('孀', '상'),
+('孃', '냥'),
+('孃', '양'),
+('孅', '섬'),
+('孌', '련'),
+('子', '자'),
+('孑', '혈'),
+('孔', '공'),
+('孕', '잉'),
+('孖', '자'),
+('字', '자'),
+('存', '존'),
+('孚', '부'),
+('孛', '발'),
+('孛', '패'),
+('孜', '자'),
+('孝', '효'),
+('孟', '맏'),
+('孟', '망'),
+('孟', '맹'),
+('孡', '태'),
+('季', '계'),
+('季', '끝'),
+('孤', '고'),
+('孥', '노'),
+('学', '학'),
+('孩', '해'),
+('孫', '손'),
+('孰', '숙'),
+('孱', '잔'),
+('孳', '자'),
+('孵', '부'),
+('孶', '자'),
+('學', '학'),
+('孺', '유'),
+('孼', '얼'),
+('孽', '얼'),
+('孿', '산'),
+('宀', '면'),
+('宀', '집'),
+('宁', '저'),
+('宂', '용'),
+('宅', '댁'),
+('宅', '집'),
+('宅', '택'),
+('宇', '우'),
+('宇', '집'),
+('守', '수'),
+('安', '안'),
+('宊', '가'),
+('宊', '돌'),
+('宋', '송'),
+('完', '완'),
+('宏', '굉'),
+('宏', '클'),
+('宓', '복'),
+('宕', '탕'),
+('宖', '횡'),
+('宗', '종'),
+('官', '관'),
+('宙', '주'),
+('宙', '집'),
+('定', '정'),
+('宛', '완'),
+('宛', '원'),
+('宜', '의'),
+('宝', '보'),
+('実', '실'),
+('客', '객'),
+('客', '손'),
+('宣', '선'),
+('室', '실'),
+('室', '집'),
+('宥', '유'),
+('宦', '환'),
+('宫', '궁'),
+('宬', '성'),
+('宮', '궁'),
+('宮', '집'),
+('宰', '재'),
+('宱', '자'),
+('害', '할'),
+('害', '해'),
+('宴', '연'),
+('宵', '밤'),
+('宵', '소'),
+('家', '가'),
+('家', '고'),
+('家', '집'),
+('宸', '신'),
+('容', '용'),
+('宺', '황'),
+('宻', '밀'),
+('宼', '구'),
+('宿', '수'),
+('宿', '숙'),
+('宿', '잘'),
+('寀', '채'),
+('寂', '적'),
+('寃', '원'),
+('寄', '기'),
+('寅', '이'),
+('寅', '인'),
+('密', '밀'),
+('寇', '구'),
+('寊', '정'),
+('寋', '건'),
+('富', '부'),
+('寐', '매'),
+('寒', '찰'),
+('寒', '한'),
+('寓', '우'),
+('寔', '식'),
+('寕', '녕'),
+('寕', '영'),
+('寖', '침'),
+('寗', '녕'),
+('寘', '치'),
+('寙', '유'),
+('寛', '관'),
+('寜', '녕'),
+('寝', '침'),
+('寞', '막'),
+('察', '찰'),
+('寠', '구'),
+('寠', '누'),
+('寠', '루'),
+('寡', '과'),
+('寢', '침'),
+('寣', '홀'),
+('寤', '오'),
+('寥', '료'),
+('實', '실'),
+('寧', '녕'),
+('寧', '영'),
+('寨', '채'),
+('審', '심'),
+('寫', '사'),
+('寬', '관'),
+('寭', '혜'),
+('寮', '료'),
+('寯', '준'),
+('寰', '환'),
+('寳', '보'),
+('寴', '친'),
+('寵', '총'),
+('寶', '보'),
+('寷', '풍'),
+('寸', '촌'),
+('对', '대'),
+('寺', '사'),
+('寺', '시'),
+('寺', '절'),
+('対', '대'),
+('寿', '수'),
+('封', '봉'),
+('封', '폄'),
+('専', '전'),
+('尃', '포'),
+('射', '사'),
+('射', '석'),
+('射', '쏠'),
+('射', '야'),
+('射', '역'),
+('尅', '극'),
+('将', '장'),
+('將', '장'),
+('專', '전'),
+('尉', '울'),
+('尉', '위'),
+('尊', '존'),
+('尊', '준'),
+('尋', '심'),
+('尌', '수'),
+('尌', '주'),
+('對', '대'),
+('導', '도'),
+('小', '소'),
+('少', '소'),
+('尒', '너'),
+('尒', '이'),
+('尓', '너'),
+('尓', '이'),
+('尔', '너'),
+('尔', '이'),
+('尖', '첨'),
+('尗', '숙'),
+('尙', '상'),
+('尚', '상'),
+('尟', '선'),
+('尠', '선'),
+('尡', '곤'),
+('尣', '왕'),
+('尤', '우'),
+('尦', '료'),
+('尦', '요'),
+('尦', '표'),
+('尨', '방'),
+('尨', '봉'),
+('尫', '왕'),
+('尭', '요'),
+('尮', '타'),
+('尯', '귀'),
+('尯', '위'),
+('就', '취'),
+('尸', '시'),
+('尹', '성'),
+('尹', '윤'),
+('尺', '자'),
+('尺', '척'),
+('尻', '고'),
+('尼', '니'),
+('尼', '이'),
+('尼', '일'),
+('尽', '진'),
+('尾', '미'),
+('尿', '뇨'),
+('尿', '요'),
+('局', '국'),
+('局', '판'),
+('屁', '비'),
+('居', '거'),
+('居', '기'),
+('屆', '계'),
+('屇', '전'),
+('屈', '굴'),
+('屋', '옥'),
+('屋', '집'),
+('屍', '시'),
+('屎', '똥'),
+('屎', '시'),
+('屎', '히'),
+('屏', '병'),
+('屐', '극'),
+('屑', '설'),
+('展', '전'),
+('展', '펼'),
+('屛', '병'),
+('属', '속'),
+('属', '촉'),
+('屠', '도'),
+('屠', '저'),
+('屢', '누'),
+('屢', '루'),
+('屢', '창'),
+('層', '층'),
+('履', '리'),
+('履', '신'),
+('履', '이'),
+('屨', '구'),
+('屩', '교'),
+('屫', '갹'),
+('屫', '교'),
+('屬', '속'),
+('屬', '촉'),
+('屮', '좌'),
+('屮', '철'),
+('屮', '초'),
+('屮', '풀'),
+('屯', '둔'),
+('屯', '준'),
+('屰', '역'),
+('山', '산'),
+('屲', '정'),
+('屳', '선'),
+('屹', '흘'),
+('屺', '기'),
+('岀', '추'),
+('岀', '출'),
+('岃', '인'),
+('岆', '요'),
+('岇', '앙'),
+('岈', '하'),
+('岊', '절'),
+('岋', '압'),
+('岌', '급'),
+('岏', '완'),
+('岐', '기'),
+('岑', '음'),
+('岑', '잠'),
+('岒', '검'),
+('岒', '겸'),
+('岔', '차'),
+('岝', '작'),
+('岠', '거'),
+('岡', '강'),
+('岣', '구'),
+('岥', '파'),
+('岦', '립'),
+('岦', '입'),
+('岧', '초'),
+('岨', '저'),
+('岩', '암'),
+('岪', '불'),
+('岫', '수'),
+('岬', '갑'),
+('岭', '령'),
+('岭', '영'),
+('岮', '타'),
+('岱', '대'),
+('岳', '악'),
+('岵', '호'),
+('岷', '민'),
+('岸', '안'),
+('岺', '령'),
+('岺', '영'),
+('岾', '재'),
+('岾', '점'),
+('峀', '수'),
+('峋', '순'),
+('峒', '동'),
+('峙', '치'),
+('峠', '상'),
+('峣', '요'),
+('峨', '아'),
+('峩', '아'),
+('峭', '초'),
+('峯', '봉'),
+('峰', '봉'),
+('峱', '노'),
+('峴', '현'),
+('島', '도'),
+('島', '섬'),
+('峻', '준'),
+('峽', '협'),
+('崄', '험'),
+('崆', '공'),
+('崇', '숭'),
+('崍', '래'),
+('崎', '기'),
+('崐', '곤'),
+('崑', '곤'),
+('崒', '췌'),
+('崔', '최'),
+('崕', '애'),
+('崖', '애'),
+('崖', '의'),
+('崗', '강'),
+('崙', '륜'),
+('崛', '굴'),
+('崟', '음'),
+('崢', '쟁'),
+('崤', '효'),
+('崦', '엄'),
+('崧', '숭'),
+('崩', '붕'),
+('崴', '외'),
+('崽', '재'),
+('嵁', '감'),
+('嵂', '률'),
+('嵋', '미'),
+('嵌', '감'),
+('嵎', '유'),
+('嵐', '남'),
+('嵐', '람'),
+('嵒', '암'),
+('嵓', '암'),
+('嵔', '외'),
+('嵚', '금'),
+('嵡', '옹'),
+('嵩', '숭'),
+('嵬', '외'),
+('嵯', '차'),
+('嵯', '치'),
+('嵱', '용'),
+('嵷', '송'),
+('嵷', '종'),
+('嵾', '참'),
+('嶁', '누'),
+('嶁', '루'),
+('嶂', '장'),
+('嶃', '참'),
+('嶄', '참'),
+('嶇', '구'),
+('嶋', '도'),
+('嶒', '증'),
+('嶔', '금'),
+('嶕', '초'),
+('嶙', '린'),
+('嶝', '등'),
+('嶠', '교'),
+('嶢', '요'),
+('嶧', '역'),
+('嶪', '업'),
+('嶫', '업'),
+('嶮', '험'),
+('嶰', '해'),
+('嶶', '미'),
+('嶷', '의'),
+('嶸', '영'),
+('嶺', '령'),
+('嶺', '영'),
+('嶺', '재'),
+('嶼', '서'),
+('嶼', '섬'),
+('嶽', '악'),
+('巉', '참'),
+('巋', '규'),
+('巍', '외'),
+('巑', '찬'),
+('巒', '만'),
+('巓', '전'),
+('巔', '전'),
+('巖', '암'),
+('巖', '엄'),
+('巘', '헌'),
+('巚', '헌'),
+('川', '내'),
+('川', '천'),
+('州', '주'),
+('巠', '경'),
+('巡', '순'),
+('巢', '소'),
+('巣', '소'),
+('工', '공'),
+('左', '왼'),
+('左', '좌'),
+('巧', '교'),
+('巨', '거'),
+('巩', '공'),
+('巪', '걱'),
+('巪', '꺽'),
+('巫', '무'),
+('巬', '부'),
+('巭', '부'),
+('差', '차'),
+('差', '치'),
+('己', '기'),
+('已', '이'),
+('巳', '사'),
+('巴', '파'),
+('巵', '치'),
+('巷', '항'),
+('巹', '근'),
+('巺', '손'),
+('巻', '권'),
+('巼', '팟'),
+('巽', '손'),
+('巾', '건'),
+('帀', '잡'),
+('市', '시'),
+('布', '포'),
+('帆', '범'),
+('帉', '분'),
+('帋', '지'),
+('希', '희'),
+('帑', '노'),
+('帑', '탕'),
+('帕', '말'),
+('帕', '파'),
+('帖', '첩'),
+('帖', '체'),
+('帘', '렴'),
+('帙', '절'),
+('帙', '질'),
+('帚', '추'),
+('帛', '백'),
+('帝', '제'),
+('帥', '솔'),
+('帥', '수'),
+('带', '대'),
+('帨', '세'),
+('師', '사'),
+('席', '석'),
+('帯', '대'),
+('帰', '궤'),
+('帰', '귀'),
+('帳', '장'),
+('帶', '대'),
+('帶', '띠'),
+('帷', '유'),
+('常', '상'),
+('帽', '모'),
+('帿', '후'),
+('幀', '정'),
+('幀', '탱'),
+('幃', '위'),
+('幄', '악'),
+('幅', '폭'),
+('幇', '방'),
+('幌', '황'),
+('幎', '멱'),
+('幑', '휘'),
+('幔', '만'),
+('幕', '막'),
+('幘', '책'),
+('幚', '방'),
+('幞', '복'),
+('幟', '치'),
+('幡', '번'),
+('幢', '당'),
+('幣', '폐'),
+('幨', '첨'),
+('幪', '몽'),
+('幫', '방'),
+('幬', '주'),
+('幰', '헌'),
+('幱', '란'),
+('干', '간'),
+('干', '강'),
+('平', '편'),
+('平', '평'),
+('年', '년'),
+('年', '연'),
+('年', '해'),
+('幵', '견'),
+('并', '병'),
+('幷', '병'),
+('幸', '행'),
+('幹', '간'),
+('幺', '요'),
+('幻', '환'),
+('幼', '유'),
+('幽', '유'),
+('幾', '기'),
+('广', '광'),
+('广', '암'),
+('广', '엄'),
+('广', '집'),
+('庁', '청'),
+('広', '광'),
+('庄', '장'),
+('庇', '비'),
+('床', '상'),
+('庋', '기'),
+('庌', '아'),
+('庌', '집'),
+('序', '서'),
+('底', '저'),
+('底', '지'),
+('庖', '포'),
+('店', '점'),
+('庚', '경'),
+('庚', '별'),
+('府', '부'),
+('庠', '상'),
+('度', '도'),
+('度', '탁'),
+('座', '좌'),
+('庫', '고'),
+('庭', '뜰'),
+('庭', '정'),
+('庳', '비'),
+('庵', '암'),
+('庶', '서'),
+('康', '강'),
+('庸', '용'),
+('庻', '서'),
+('庽', '유'),
+('庾', '유'),
+('廁', '치'),
+('廂', '상'),
+('廃', '폐'),
+('廄', '구'),
+('廈', '하'),
+('廉', '렴'),
+('廉', '염'),
+('廊', '낭'),
+('廊', '랑'),
+('廋', '수'),
+('廌', '치'),
+('廏', '구'),
+('廐', '구'),
+('廑', '근'),
+('廓', '곽'),
+('廓', '클'),
+('廓', '확'),
+('廕', '음'),
+('廖', '료'),
+('廚', '주'),
+('廛', '전'),
+('廝', '시'),
+('廞', '흠'),
+('廟', '묘'),
+('廠', '창'),
+('廡', '무'),
+('廢', '폐'),
+('廣', '광'),
+('廤', '곶'),
+('廥', '괴'),
+('廧', '장'),
+('廨', '해'),
+('廩', '남'),
+('廩', '늠'),
+('廩', '람'),
+('廩', '름'),
+('廬', '려'),
+('廱', '옹'),
+('廳', '청'),
+('廴', '인'),
+('延', '연'),
+('廷', '정'),
+('建', '건'),
+('廻', '회'),
+('廼', '내'),
+('廽', '회'),
+('廾', '공'),
+('廿', '입'),
+('弁', '반'),
+('弁', '변'),
+('弃', '기'),
+('弄', '농'),
+('弄', '롱'),
+('弇', '감'),
+('弈', '혁'),
+('弊', '폐'),
+('弋', '익'),
+('弍', '이'),
+('式', '법'),
+('式', '식'),
+('弑', '시'),
+('弒', '시'),
+('弓', '궁'),
+('弓', '활'),
+('弔', '적'),
+('弔', '조'),
+('引', '끌'),
+('引', '인'),
+('弗', '불'),
+('弘', '클'),
+('弘', '홍'),
+('弛', '이'),
+('弟', '제'),
+('弢', '도'),
+('弥', '미'),
+('弦', '현'),
+('弧', '호'),
+('弩', '노'),
+('弭', '미'),
+('弱', '약'),
+('弴', '돈'),
+('弴', '조'),
+('張', '장'),
+('強', '강'),
+('弹', '탄'),
+('强', '강'),
+('弼', '필'),
+('弾', '탄'),
+('彀', '구'),
+('彂', '발'),
+('彆', '별'),
+('彈', '탄'),
+('彊', '강'),
+('彌', '미'),
+('彎', '만'),
+('彐', '계'),
+('当', '당'),
+('彔', '록'),
+('彖', '단'),
+('彗', '세'),
+('彗', '혜'),
+('彘', '체'),
+('彙', '휘'),
+('彚', '휘'),
+('彛', '이'),
+('彝', '이'),
+('彞', '이'),
+('形', '형'),
+('彤', '동'),
+('彥', '언'),
+('彦', '언'),
+('彧', '욱'),
+('彩', '채'),
+('彪', '표'),
+('彫', '조'),
+('彬', '빈'),
+('彭', '방'),
+('彭', '팽'),
+('彰', '창'),
+('影', '영'),
+('彳', '척'),
+('彷', '방'),
+('役', '역'),
+('彼', '저'),
+('彼', '피'),
+('彽', '지'),
+('彿', '불'),
+('往', '갈'),
+('往', '왕'),
+('征', '정'),
+('徂', '조'),
+('径', '경'),
+('待', '대'),
+('徇', '순'),
+('很', '흔'),
+('徉', '양'),
+('徊', '회'),
+('律', '률'),
+('律', '율'),
+('後', '뒤'),
+('後', '후'),
+('徐', '서'),
+('徑', '경'),
+('徒', '도'),
+('従', '종'),
+('得', '득'),
+('徘', '배'),
+('徙', '사'),
+('徜', '상'),
+('從', '종'),
+('徠', '래'),
+('御', '아'),
+('御', '어'),
+('徣', '차'),
+('徧', '편'),
+('徨', '황'),
+('復', '복'),
+('復', '부'),
+('循', '순'),
+('徬', '방'),
+('徭', '요'),
+('微', '미'),
+('徯', '혜'),
+('徳', '덕'),
+('徴', '징'),
+('徴', '치'),
+('徵', '징'),
+('徵', '치'),
+('德', '덕'),
+('徹', '철'),
+('徼', '요'),
+('徽', '휘'),
+('忂', '구'),
+('心', '심'),
+('必', '필'),
+('忉', '도'),
+('忌', '기'),
+('忍', '인'),
+('忐', '탐'),
+('忒', '특'),
+('忖', '촌'),
+('志', '뜻'),
+('志', '지'),
+('忘', '망'),
+('忙', '망'),
+('応', '응'),
+('忝', '첨'),
+('忞', '민'),
+('忟', '민'),
+('忠', '충'),
+('忡', '충'),
+('忢', '오'),
+('忤', '오'),
+('忨', '완'),
+('忩', '총'),
+('快', '쾌'),
+('忭', '변'),
+('忮', '기'),
+('忱', '침'),
+('念', '념'),
+('念', '염'),
+('忷', '흉'),
+('忸', '뉴'),
+('忻', '흔'),
+('忼', '강'),
+('忽', '홀'),
+('忿', '분'),
+('怊', '초'),
+('怍', '작'),
+('怏', '앙'),
+('怒', '노'),
+('怔', '정'),
+('怕', '백'),
+('怕', '파'),
+('怖', '포'),
+('怗', '첩'),
+('怙', '호'),
+('怛', '달'),
+('怜', '련'),
+('怜', '령'),
+('思', '사'),
+('思', '새'),
+('怠', '태'),
+('怡', '이'),
+('急', '급'),
+('怦', '평'),
+('性', '성'),
+('怨', '원'),
+('怩', '니'),
+('怪', '괴'),
+('怯', '겁'),
+('怱', '총'),
+('怳', '황'),
+('怾', '기'),
+('恁', '임'),
+('恂', '순'),
+('恂', '준'),
+('恃', '시'),
+('恆', '항'),
+('恇', '광'),
+('恈', '모'),
+('恊', '협'),
+('恋', '련'),
+('恍', '황'),
+('恐', '공'),
+('恒', '긍'),
+('恒', '항'),
+('恕', '서'),
+('恙', '양'),
+('恚', '에'),
+('恝', '개'),
+('恝', '괄'),
+('恟', '흉'),
+('恠', '괴'),
+('恢', '회'),
+('恣', '자'),
+('恤', '휼'),
+('恥', '치'),
+('恨', '한'),
+('恩', '은'),
+('恪', '각'),
+('恫', '통'),
+('恬', '념'),
+('恭', '공'),
+('息', '식'),
+('恰', '흡'),
+('恵', '혜'),
+('恿', '용'),
+('悁', '연'),
+('悃', '곤'),
+('悄', '초'),
+('悅', '열'),
+('悉', '실'),
+('悋', '린'),
+('悌', '제'),
+('悍', '한'),
+('悏', '협'),
+('悒', '읍'),
+('悔', '회'),
+('悕', '희'),
+('悖', '발'),
+('悖', '패'),
+('悗', '문'),
+('悚', '송'),
+('悛', '전'),
+('悟', '오'),
+('悠', '유'),
+('悢', '량'),
+('患', '환'),
+('悤', '총'),
+('悦', '열'),
+('悧', '리'),
+('悩', '뇌'),
+('悪', '악'),
+('悪', '오'),
+('悰', '종'),
+('悱', '비'),
+('悲', '비'),
+('悳', '덕'),
+('悴', '췌'),
+('悵', '창'),
+('悶', '민'),
+('悸', '계'),
+('悻', '행'),
+('悼', '도'),
+('悽', '처'),
+('悾', '공'),
+('惄', '녁'),
+('情', '뜻'),
+('情', '정'),
+('惆', '추'),
+('惇', '돈'),
+('惉', '첨'),
+('惋', '완'),
+('惏', '람'),
+('惑', '혹'),
+('惓', '권'),
+('惕', '척'),
+('惖', '척'),
+('惘', '망'),
+('惙', '철'),
+('惚', '홀'),
+('惛', '혼'),
+('惜', '석'),
+('惝', '창'),
+('惟', '유'),
+('惠', '혜'),
+('惡', '악'),
+('惡', '오'),
+('惢', '솨'),
+('惢', '쇄'),
+('惢', '예'),
+('惢', '우'),
+('惣', '총'),
+('惨', '참'),
+('惨', '침'),
+('惪', '덕'),
+('惰', '타'),
+('惱', '뇌'),
+('惲', '운'),
+('想', '상'),
+('惴', '췌'),
+('惵', '접'),
+('惶', '황'),
+('惷', '준'),
+('惸', '경'),
+('惹', '야'),
+('惺', '성'),
+('惺', '황'),
+('惻', '측'),
+('惼', '편'),
+('愀', '초'),
+('愁', '수'),
+('愃', '선'),
+('愆', '건'),
+('愈', '유'),
+('愉', '유'),
+('愍', '민'),
+('愎', '퍅'),
+('意', '뜻'),
+('意', '억'),
+('意', '의'),
+('意', '희'),
+('愓', '상'),
+('愔', '음'),
+('愕', '악'),
+('愚', '우'),
+('愛', '애'),
+('愜', '협'),
+('感', '감'),
+('愠', '온'),
+('愧', '괴'),
+('愬', '색'),
+('愬', '소'),
+('愭', '기'),
+('愰', '황'),
+('愴', '창'),
+('愷', '개'),
+('愼', '신'),
+('愾', '개'),
+('愾', '희'),
+('愿', '원'),
+('慂', '용'),
+('慃', '앙'),
+('慄', '률'),
+('慆', '도'),
+('慇', '은'),
+('慈', '자'),
+('慊', '겸'),
+('慊', '협'),
+('態', '태'),
+('慌', '황'),
+('慍', '온'),
+('慒', '종'),
+('慓', '표'),
+('慕', '모'),
+('慘', '참'),
+('慘', '침'),
+('慙', '참'),
+('慚', '참'),
+('慝', '특'),
+('慟', '통'),
+('慠', '오'),
+('慢', '만'),
+('慣', '관'),
+('慤', '각'),
+('慧', '혜'),
+('慨', '개'),
+('慫', '종'),
+('慮', '려'),
+('慮', '여'),
+('慰', '위'),
+('慱', '단'),
+('慳', '간'),
+('慴', '습'),
+('慴', '접'),
+('慵', '용'),
+('慶', '강'),
+('慶', '경'),
+('慷', '강'),
+('慺', '루'),
+('慼', '척'),
+('慽', '척'),
+('慾', '욕'),
+('憁', '총'),
+('憂', '우'),
+('憃', '용'),
+('憊', '비'),
+('憋', '별'),
+('憍', '교'),
+('憎', '증'),
+('憐', '련'),
+('憐', '연'),
+('憑', '빙'),
+('憒', '궤'),
+('憔', '초'),
+('憖', '은'),
+('憘', '희'),
+('憙', '희'),
+('憚', '탄'),
+('憝', '돈'),
+('憤', '분'),
+('憧', '동'),
+('憨', '감'),
+('憩', '게'),
+('憩', '쉴'),
+('憫', '민'),
+('憬', '경'),
+('憮', '무'),
+('憯', '참'),
+('憲', '법'),
+('憲', '헌'),
+('憶', '억'),
+('憸', '섬'),
+('憺', '담'),
+('憻', '탄'),
+('憼', '경'),
+('憾', '감'),
+('懂', '동'),
+('懃', '근'),
+('懆', '조'),
+('懇', '간'),
+('懈', '해'),
+('應', '응'),
+('懊', '오'),
+('懋', '무'),
+('懌', '역'),
+('懕', '염'),
+('懗', '하'),
+('懞', '몽'),
+('懟', '대'),
+('懣', '문'),
+('懦', '나'),
+('懦', '유'),
+('懲', '징'),
+('懶', '나'),
+('懶', '난'),
+('懶', '라'),
+('懶', '란'),
+('懷', '회'),
+('懸', '현'),
+('懺', '참'),
+('懼', '구'),
+('懽', '환'),
+('懾', '섭'),
+('懿', '의'),
+('戀', '련'),
+('戀', '연'),
+('戄', '확'),
+('戇', '당'),
+('戈', '과'),
+('戈', '창'),
+('戉', '월'),
+('戊', '무'),
+('戌', '술'),
+('戍', '수'),
+('戎', '융'),
+('成', '성'),
+('我', '나'),
+('我', '아'),
+('戒', '계'),
+('戔', '잔'),
+('戕', '장'),
+('或', '혹'),
+('戚', '척'),
+('戝', '적'),
+('戞', '알'),
+('戟', '극'),
+('戠', '시'),
+('戡', '감'),
+('戢', '집'),
+('戦', '전'),
+('戧', '창'),
+('戩', '전'),
+('截', '절'),
+('戮', '륙'),
+('戯', '휘'),
+('戯', '희'),
+('戰', '전'),
+('戱', '휘'),
+('戱', '희'),
+('戲', '기'),
+('戲', '호'),
+('戲', '휘'),
+('戲', '희'),
+('戳', '착'),
+('戴', '대'),
+('戴', '일'),
+('戵', '구'),
+('戶', '호'),
+('户', '호'),
+('戸', '호'),
+('戹', '액'),
+('戻', '려'),
+('戻', '렬'),
+('戾', '려'),
+('戾', '렬'),
+('房', '방'),
+('所', '바'),
+('所', '소'),
+('扁', '변'),
+('扁', '편'),
+('扂', '점'),
+('扃', '경'),
+('扇', '선'),
+('扈', '호'),
+('扉', '비'),
+('扊', '염'),
+('手', '손'),
+('手', '수'),
+('才', '재'),
+('扎', '찰'),
+('扑', '복'),
+('扒', '배'),
+('打', '정'),
+('打', '칠'),
+('打', '타'),
+('払', '불'),
+('払', '필'),
+('扗', '재'),
+('托', '탁'),
+('扛', '강'),
+('扞', '한'),
+('扣', '고'),
+('扣', '구'),
+('扨', '인'),
+('扮', '반'),
+('扮', '분'),
+('扯', '차'),
+('扱', '급'),
+('扱', '삽'),
+('扳', '반'),
+('扶', '부'),
+('扶', '포'),
+('批', '별'),
+('批', '비'),
+('扺', '지'),
+('扼', '액'),
+('找', '조'),
+('找', '화'),
+('承', '승'),
+('承', '증'),
+('技', '기'),
+('抃', '변'),
+('抄', '초'),
+('抆', '문'),
+('抉', '결'),
+('把', '파'),
+('抑', '억'),
+('抒', '서'),
+('抒', '저'),
+('抓', '조'),
+('抔', '부'),
+('投', '투'),
+('抖', '두'),
+('抗', '항'),
+('折', '절'),
+('折', '제'),
+('抛', '포'),
+('抜', '발'),
+('抜', '패'),
+('択', '택'),
+('抨', '평'),
+('披', '피'),
+('抬', '태'),
+('抱', '포'),
+('抳', '니'),
+('抵', '저'),
+('抵', '지'),
+('抹', '말'),
+('抻', '신'),
+('押', '갑'),
+('押', '압'),
+('抽', '추'),
+('拂', '불'),
+('拂', '필'),
+('拄', '주'),
+('担', '단'),
+('拆', '탁'),
+('拇', '무'),
+('拈', '념'),
+('拉', '끌'),
+('拉', '납'),
+('拉', '랍'),
+('拊', '부'),
+('拋', '포'),
+('拌', '반'),
+('拍', '박'),
+('拍', '칠'),
+('拏', '나'),
+('拐', '괴'),
+('拑', '겸'),
+('拒', '거'),
+('拒', '구'),
+('拓', '척'),
+('拓', '탁'),
+('拔', '발'),
+('拔', '패'),
+('拕', '타'),
+('拖', '끌'),
+('拖', '타'),
+('拗', '요'),
+('拘', '구'),
+('拙', '졸'),
+('招', '교'),
+('招', '초'),
+('拜', '배'),
+('拜', '절'),
+('拠', '거'),
+('拡', '광'),
+('拡', '확'),
+('拨', '발'),
+('拨', '패'),
+('括', '괄'),
+('拭', '식'),
+('拮', '결'),
+('拮', '길'),
+('拯', '증'),
+('拱', '공'),
+('拳', '권'),
+('拵', '존'),
+('拶', '찰'),
+('拷', '고'),
+('拼', '병'),
+('拼', '평'),
+('拽', '예'),
+('拾', '섭'),
+('拾', '습'),
+('拾', '십'),
+('拾', '열'),
+('拿', '나'),
+('持', '지'),
+('挂', '괘'),
+('指', '지'),
+('挈', '계'),
+('挈', '설'),
+('按', '안'),
+('按', '알'),
+('挌', '격'),
+('挐', '나'),
+('挐', '녀'),
+('挑', '도'),
+('挑', '조'),
+('挒', '련'),
+('挨', '애'),
+('挪', '나'),
+('挫', '좌'),
+('振', '진'),
+('挹', '읍'),
+('挺', '정'),
+('挻', '연'),
+('挽', '만'),
+('挾', '협'),
+('捂', '오'),
+('捃', '군'),
+('捄', '구'),
+('捆', '곤'),
+('捉', '착'),
+('捌', '팔'),
+('捍', '한'),
+('捎', '소'),
+('捏', '날'),
+('捐', '연'),
+('捕', '포'),
+('捗', '척'),
+('捘', '준'),
+('捛', '려'),
+('捛', '여'),
+('换', '환'),
+('捥', '완'),
+('捧', '봉'),
+('捨', '사'),
+('捩', '렬'),
+('捫', '문'),
+('据', '거'),
+('捱', '애'),
+('捲', '권'),
+('捶', '추'),
+('捷', '첩'),
+('捺', '날'),
+('捻', '념'),
+('捻', '녑'),
+('捽', '졸'),
+('捿', '서'),
+('掀', '흔'),
+('掃', '소'),
+('掃', '쓸'),
+('掄', '론'),
+('掄', '륜'),
+('掇', '철'),
+('授', '수'),
+('授', '줄'),
+('掉', '도'),
+('掊', '부'),
+('掌', '장'),
+('掎', '기'),
+('掏', '도'),
+('排', '배'),
+('掖', '액'),
+('掘', '굴'),
+('掘', '궐'),
+('掛', '걸'),
+('掛', '괘'),
+('掜', '예'),
+('掟', '정'),
+('掠', '략'),
+('掠', '량'),
+('掠', '약'),
+('掠', '양'),
+('採', '채'),
+('探', '탐'),
+('掣', '철'),
+('掣', '체'),
+('接', '접'),
+('控', '강'),
+('控', '공'),
+('推', '추'),
+('推', '퇴'),
+('掩', '엄'),
+('措', '조'),
+('措', '책'),
+('掬', '국'),
+('掲', '갈'),
+('掲', '게'),
+('掻', '소'),
+('掾', '연'),
+('揀', '간'),
+('揀', '연'),
+('揃', '전'),
+('揄', '유'),
+('揆', '규'),
+('揉', '유'),
+('描', '묘'),
+('提', '끌'),
+('提', '날'),
+('提', '시'),
+('提', '제'),
+('插', '삽'),
+('揕', '침'),
+('揖', '읍'),
+('揖', '즙'),
+('揚', '양'),
+('換', '환'),
+('揜', '암'),
+('揜', '엄'),
+('揟', '서'),
+('揠', '알'),
+('握', '악'),
+('握', '쥘'),
+('揣', '취'),
+('揣', '타'),
+('揩', '개'),
+('揫', '추'),
+('揭', '갈'),
+('揭', '게'),
+('揮', '휘'),
+('揲', '설'),
+('援', '원'),
+('揵', '건'),
+('揶', '야'),
+('揷', '삽'),
+('搆', '구'),
+('搉', '각'),
+('損', '손'),
+('搏', '박'),
+('搐', '휵'),
+('搒', '방'),
+('搓', '차'),
+('搔', '소'),
+('搖', '요'),
+('搗', '도'),
+('搜', '수'),
+('搢', '진'),
+('搤', '액'),
+('搥', '추'),
+('搨', '탑'),
+('搪', '당'),
+('搫', '반'),
+('搬', '반'),
+('搭', '탑'),
+('搯', '도'),
+('搰', '골'),
+('搶', '창'),
+('携', '멜'),
+('携', '휴'),
+('搽', '차'),
+('搾', '착'),
+('摂', '섭'),
+('摂', '엽'),
+('摑', '괵'),
+('摑', '칠'),
+('摒', '병'),
+('摘', '적'),
+('摠', '총'),
+('摧', '최'),
+('摩', '갈'),
+('摩', '마'),
+('摭', '척'),
+('摯', '지'),
+('摳', '구'),
+('摸', '모'),
+('摹', '모'),
+('摺', '접'),
+('摻', '섬'),
+('摽', '표'),
+('撃', '격'),
+('撅', '궤'),
+('撈', '로'),
+('撐', '탱'),
+('撑', '탱'),
+('撒', '살'),
+('撓', '요'),
+('撕', '서'),
+('撘', '갑'),
+('撙', '준'),
+('撚', '년'),
+('撚', '연'),
+('撝', '휘'),
+('撞', '당'),
+('撟', '교'),
+('撤', '철'),
+('撥', '발'),
+('撥', '벌'),
+('撩', '료'),
+('撫', '무'),
+('播', '파'),
+('撮', '촬'),
+('撰', '찬'),
+('撰', '천'),
+('撲', '박'),
+('撲', '복'),
+('撹', '교'),
+('撻', '달'),
+('撼', '감'),
+('撾', '과'),
+('撿', '검'),
+('擁', '낄'),
+('擁', '옹'),
+('擄', '로'),
+('擅', '천'),
+('擇', '택'),
+('擉', '착'),
+('擊', '격'),
+('擊', '칠'),
+('操', '조'),
+('擎', '경'),
+('擐', '환'),
+('擒', '금'),
+('擔', '담'),
+('擔', '멜'),
+('擕', '휴'),
+('擗', '벽'),
+('擘', '벽'),
+('據', '거'),
+('擟', '미'),
+('擠', '제'),
+('擡', '대'),
+('擢', '탁'),
+('擣', '도'),
+('擥', '람'),
+('擦', '찰'),
+('擧', '거'),
+('擧', '들'),
+('擬', '의'),
+('擭', '화'),
+('擯', '빈'),
+('擱', '각'),
+('擲', '척'),
+('擴', '광'),
+('擴', '확'),
+('擷', '힐'),
+('擺', '파'),
+('擾', '요'),
+('攀', '반'),
+('攂', '롱'),
+('攄', '터'),
+('攄', '펼'),
+('攇', '헌'),
+('攊', '려'),
+('攏', '롱'),
+('攔', '란'),
+('攘', '양'),
+('攙', '참'),
+('攝', '섭'),
+('攝', '엽'),
+('攢', '찬'),
+('攣', '련'),
+('攤', '탄'),
+('攪', '교'),
+('攫', '확'),
+('攬', '람'),
+('支', '지'),
+('攲', '기'),
+('攴', '복'),
+('攴', '칠'),
+('攵', '복'),
+('攵', '칠'),
+('收', '수'),
+('攷', '고'),
+('攸', '유'),
+('改', '개'),
+('攻', '공'),
+('攻', '칠'),
+('攽', '반'),
+('放', '방'),
+('政', '정'),
+('政', '칠'),
+('敀', '귀'),
+('敀', '박'),
+('敃', '분'),
+('故', '고'),
+('故', '옛'),
+('效', '효'),
+('敉', '미'),
+('敍', '서'),
+('敎', '교'),
+('敏', '민'),
+('救', '구'),
+('敔', '어'),
+('敕', '칙'),
+('敖', '오'),
+('敗', '질'),
+('敗', '패'),
+('敘', '서'),
+('教', '교'),
+('敝', '폐'),
+('敞', '창'),
+('敡', '이'),
+('敢', '감'),
+('散', '산'),
+('敦', '돈'),
+('敦', '퇴'),
+('敩', '효'),
+('敫', '교'),
+('敬', '경'),
+('敭', '양'),
+('数', '셀'),
+('数', '수'),
+('数', '촉'),
+('敲', '고'),
+('敲', '교'),
+('敲', '학'),
+('整', '정'),
+('敵', '적'),
+('敷', '부'),
+('數', '삭'),
+('數', '셀'),
+('數', '셈'),
+('數', '수'),
+('數', '촉'),
+('敾', '선'),
+('斁', '두'),
+('斂', '렴'),
+('斃', '폐'),
+('斅', '효'),
+('斆', '효'),
+('文', '문'),
+('斈', '학'),
+('斌', '빈'),
+('斐', '비'),
+('斑', '반'),
+('斗', '두'),
+('斗', '말'),
+('料', '료'),
+('料', '요'),
+('斛', '곡'),
+('斜', '사'),
+('斜', '야'),
+('斝', '가'),
+('斟', '짐'),
+('斡', '간'),
+('斡', '돌'),
+('斡', '알'),
+('斤', '근'),
+('斥', '척'),
+('斧', '부'),
+('斫', '작'),
+('斬', '참'),
+('断', '단'),
+('斮', '착'),
+('斯', '사'),
+('新', '새'),
+('新', '신'),
+('斱', '작'),
+('斲', '착'),
+('斷', '단'),
+('方', '모'),
+('方', '방'),
+('於', '어'),
+('於', '오'),
+('施', '시'),
+('施', '이'),
+('斿', '유'),
+('旀', '며'),
+('旁', '방'),
+('旁', '팽'),
+('旂', '기'),
+('旃', '전'),
+('旄', '모'),
+('旅', '려'),
+('旅', '여'),
+('旆', '패'),
+('旉', '가'),
+('旊', '방'),
+('旋', '돌'),
+('旋', '선'),
+('旌', '정'),
+('族', '족'),
+('族', '주'),
+('旐', '조'),
+('旒', '류'),
+('旒', '유'),
+('旕', '엇'),
+('旗', '기'),
+('旙', '기'),
+('旙', '번'),
+('无', '무'),
+('既', '기'),
+('旣', '기'),
+('日', '날'),
+('日', '일'),
+('旦', '단'),
+('旧', '구'),
+('旨', '뜻'),
+('旨', '지'),
+('早', '조'),
+('旬', '순'),
+('旭', '욱'),
+('旰', '간'),
+('旱', '한'),
+('旲', '대'),
+('旴', '우'),
+('旺', '왕'),
+('旻', '민'),
+('旼', '민'),
+('旽', '돈'),
+('旿', '오'),
+('昀', '윤'),
+('昂', '앙'),
+('昃', '치'),
+('昆', '곤'),
+('昆', '혼'),
+('昇', '승'),
+('昉', '방'),
+('昊', '호'),
+('昌', '창'),
+('明', '명'),
+('昏', '혼'),
+('昐', '분'),
+('昑', '금'),
+('易', '역'),
+('易', '이'),
+('昔', '석'),
+('昔', '착'),
+('昕', '흔'),
+('昛', '거'),
+('昜', '볕'),
+('昜', '양'),
+('昞', '병'),
+('星', '별'),
+('星', '성'),
+('映', '영'),
+('昡', '현'),
+('昤', '령'),
+('春', '봄'),
+('春', '춘'),
+('昧', '매'),
+('昨', '작'),
+('昫', '구'),
+('昭', '소'),
+('昭', '조'),
+('是', '시'),
+('是', '이'),
+('昰', '시'),
+('昰', '하'),
+('昱', '욱'),
+('昴', '묘'),
+('昵', '녜'),
+('昵', '닐'),
+('昵', '예'),
+('昵', '일'),
+('昶', '창'),
+('昷', '온'),
+('昺', '병'),
+('昻', '앙'),
+('昼', '주'),
+('晁', '조'),
+('時', '때'),
+('時', '시'),
+('晃', '황'),
+('晄', '황'),
+('晈', '교'),
+('晉', '진'),
+('晋', '진'),
+('晌', '상'),
+('晎', '홍'),
+('晏', '안'),
+('晙', '준'),
+('晚', '만'),
+('晛', '현'),
+('晝', '낮'),
+('晝', '주'),
+('晞', '희'),
+('晟', '성'),
+('晡', '포'),
+('晢', '절'),
+('晢', '제'),
+('晤', '오'),
+('晥', '환'),
+('晦', '회'),
+('晧', '호'),
+('晨', '신'),
+('晩', '만'),
+('晫', '탁'),
+('晬', '수'),
+('晬', '쉬'),
+('普', '보'),
+('景', '경'),
+('景', '볕'),
+('景', '영'),
+('晰', '석'),
+('晳', '석'),
+('晴', '갤'),
+('晴', '청'),
+('晶', '정'),
+('晷', '귀'),
+('晸', '정'),
+('智', '지'),
+('晻', '암'),
+('暁', '효'),
+('暄', '훤'),
+('暇', '가'),
+('暈', '운'),
+('暈', '훈'),
+('暉', '빛'),
+('暉', '휘'),
+('暋', '민'),
+('暌', '규'),
+('暍', '갈'),
+('暎', '영'),
+('暐', '위'),
+('暑', '서'),
+('暖', '난'),
+('暖', '훤'),
+('暗', '암'),
+('暘', '양'),
+('暝', '명'),
+('暞', '교'),
+('暠', '고'),
+('暠', '호'),
+('暡', '옹'),
+('暢', '창'),
+('暣', '기'),
+('暨', '기'),
+('暫', '잠'),
+('暬', '설'),
+('暮', '모'),
+('暱', '닐'),
+('暲', '장'),
+('暳', '혀'),
+('暳', '혜'),
+('暴', '박'),
+('暴', '포'),
+('暴', '폭'),
+('暵', '한'),
+('暸', '료'),
+('暹', '섬'),
+('暻', '경'),
+('暾', '돈'),
+('暿', '희'),
+('曀', '에'),
+('曁', '기'),
+('曄', '엽'),
+('曅', '엽'),
+('曆', '력'),
+('曆', '역'),
+('曇', '담'),
+('曉', '효'),
+('曓', '포'),
+('曖', '애'),
+('曙', '서'),
+('曚', '몽'),
+('曛', '훈'),
+('曜', '요'),
+('曝', '포'),
+('曝', '폭'),
+('曠', '광'),
+('曡', '접'),
+('曣', '연'),
+('曦', '희'),
+('曨', '롱'),
+('曩', '낭'),
+('曪', '라'),
+('曬', '솨'),
+('曬', '쇄'),
+('曮', '엄'),
+('曯', '촉'),
+('曰', '왈'),
+('曲', '곡'),
+('曳', '예'),
+('更', '갱'),
+('更', '경'),
+('曷', '갈'),
+('書', '글'),
+('書', '서'),
+('曹', '조'),
+('曺', '조'),
+('曼', '만'),
+('曾', '증'),
+('替', '체'),
+('最', '최'),
+('會', '괴'),
+('會', '회'),
+('朅', '걸'),
+('月', '달'),
+('月', '월'),
+('有', '유'),
+('朋', '벗'),
+('朋', '붕'),
+('朌', '반'),
+('朌', '분'),
+('服', '복'),
+('服', '옷'),
+('朏', '비'),
+('朔', '삭'),
+('朕', '나'),
+('朕', '짐'),
+('朗', '낭'),
+('朗', '랑'),
+('朙', '명'),
+('望', '망'),
+('朝', '조'),
+('朞', '기'),
+('期', '기'),
+('朣', '동'),
+('朦', '몽'),
+('朧', '농'),
+('朧', '롱'),
+('木', '모'),
+('木', '목'),
+('朩', '드'),
+('朩', '등'),
+('朩', '빈'),
+('未', '미'),
+('末', '끝'),
+('末', '말'),
+('本', '본'),
+('札', '찰'),
+('朮', '출'),
+('术', '출'),
+('朰', '몰'),
+('朱', '주'),
+('朳', '파'),
+('朴', '박'),
+('朵', '타'),
+('朶', '타'),
+('机', '궤'),
+('朽', '후'),
+('杅', '우'),
+('杅', '유'),
+('杆', '간'),
+('杇', '오'),
+('杈', '차'),
+('杉', '삼'),
+('杋', '범'),
+('杌', '올'),
+('李', '리'),
+('李', '이'),
+('杏', '행'),
+('材', '재'),
+('村', '촌'),
+('杓', '작'),
+('杓', '표'),
+('杖', '장'),
+('杜', '두'),
+('杞', '기'),
+('束', '속'),
+('杠', '강'),
+('条', '조'),
+('杪', '초'),
+('杬', '원'),
+('杭', '항'),
+('杮', '폐'),
+('杯', '배'),
+('杯', '잔'),
+('杰', '걸'),
+('東', '동'),
+('杲', '고'),
+('杳', '묘'),
+('杳', '요'),
+('杵', '저'),
+('杷', '파'),
+('杻', '뉴'),
+('杻', '추'),
+('杼', '저'),
+('松', '송'),
+('板', '판'),
+('极', '극'),
+('枇', '비'),
+('枉', '왕'),
+('枋', '방'),
+('枌', '분'),
+('枏', '남'),
+('析', '석'),
+('枓', '두'),
+('枕', '침'),
+('林', '림'),
+('林', '임'),
+('枘', '예'),
+('枙', '와'),
+('枚', '매'),
+('果', '과'),
+('枝', '지'),
+('枯', '고'),
+('枰', '평'),
+('枱', '대'),
+('枲', '시'),
+('枳', '기'),
+('枳', '지'),
+('架', '가'),
+('枷', '가'),
+('枷', '칼'),
+('枸', '구'),
+('枻', '예'),
+('枼', '엽'),
+('枾', '시'),
+('柁', '타'),
+('柄', '병'),
+('柅', '니'),
+('柅', '이'),
+('柊', '종'),
+('柏', '백'),
+('某', '매'),
+('某', '모'),
+('柑', '감'),
+('柑', '검'),
+('柒', '칠'),
+('染', '염'),
+('柔', '유'),
+('柗', '송'),
+('柘', '자'),
+('柙', '합'),
+('柚', '유'),
+('柚', '축'),
+('柝', '탁'),
+('柞', '작'),
+('柞', '책'),
+('柟', '남'),
+('柢', '저'),
+('查', '사'),
+('柩', '구'),
+('柩', '널'),
+('柬', '간'),
+('柯', '가'),
+('柰', '내'),
+('柱', '주'),
+('柳', '류'),
+('柳', '유'),
+('柴', '시'),
+('柴', '채'),
+('柵', '책'),
+('柶', '사'),
+('柷', '축'),
+('柹', '시'),
+('査', '사'),
+('柾', '구'),
+('柾', '정'),
+('柿', '시'),
+('栂', '매'),
+('栃', '회'),
+('栄', '영'),
+('栅', '책'),
+('栍', '생'),
+('栍', '찌'),
+('栒', '순'),
+('栓', '전'),
+('栖', '서'),
+('栗', '률'),
+('栗', '밤'),
+('栗', '율'),
+('栝', '괄'),
+('栞', '간'),
+('校', '교'),
+('校', '효'),
+('栢', '백'),
+('株', '주'),
+('栮', '이'),
+('栯', '욱'),
+('栱', '공'),
+('栲', '고'),
+('栴', '전'),
+('核', '핵'),
+('核', '홀'),
+('根', '근'),
+('栻', '식'),
+('格', '각'),
+('格', '격'),
+('格', '낙'),
+('栽', '재'),
+('桀', '걸'),
+('桁', '항'),
+('桁', '형'),
+('桂', '경'),
+('桂', '계'),
+('桃', '도'),
+('桄', '광'),
+('框', '광'),
+('案', '안'),
+('桉', '안'),
+('桎', '질'),
+('桐', '동'),
+('桑', '상'),
+('桓', '환'),
+('桔', '길'),
+('桜', '앵'),
+('桭', '진'),
+('桯', '정'),
+('桴', '부'),
+('桶', '용'),
+('桶', '통'),
+('桷', '각'),
+('桾', '군'),
+('桿', '한'),
+('梁', '량'),
+('梁', '양'),
+('梃', '정'),
+('梅', '매'),
+('梆', '방'),
+('梏', '곡'),
+('梓', '재'),
+('梔', '치'),
+('梗', '경'),
+('梘', '견'),
+('梛', '나'),
+('條', '조'),
+('梟', '효'),
+('梠', '려'),
+('梡', '완'),
+('梢', '초'),
+('梣', '심'),
+('梣', '침'),
+('梧', '오'),
+('梨', '리'),
+('梨', '이'),
+('梭', '사'),
+('梯', '제'),
+('械', '계'),
+('梱', '곤'),
+('梲', '절'),
+('梳', '소'),
+('梵', '범'),
+('梶', '미'),
+('棄', '기'),
+('棅', '병'),
+('棉', '면'),
+('棊', '기'),
+('棋', '기'),
+('棌', '채'),
+('棍', '곤'),
+('棍', '혼'),
+('棐', '비'),
+('棒', '봉'),
+('棕', '종'),
+('棖', '정'),
+('棗', '조'),
+('棘', '극'),
+('棚', '붕'),
+('棟', '동'),
+('棠', '당'),
+('棣', '체'),
+('棣', '태'),
+('棧', '잔'),
+('棧', '전'),
+('棨', '계'),
+('棬', '권'),
+('森', '삼'),
+('森', '숲'),
+('棲', '서'),
+('棹', '도'),
+('棺', '관'),
+('棺', '널'),
+('棻', '분'),
+('棼', '분'),
+('椀', '완'),
+('椁', '곽'),
+('椄', '접'),
+('椅', '의'),
+('椋', '량'),
+('植', '둘'),
+('植', '식'),
+('植', '치'),
+('椎', '추'),
+('椏', '아'),
+('椑', '비'),
+('椒', '초'),
+('椗', '정'),
+('椙', '창'),
+('検', '검'),
+('椦', '권'),
+('椧', '명'),
+('椰', '야'),
+('椴', '단'),
+('椶', '종'),
+('椹', '침'),
+('椺', '보'),
+('椽', '연'),
+('椿', '춘'),
+('楂', '사'),
+('楊', '양'),
+('楏', '규'),
+('楓', '풍'),
+('楔', '설'),
+('楕', '타'),
+('楗', '건'),
+('楙', '무'),
+('楚', '초'),
+('楝', '련'),
+('楞', '릉'),
+('楠', '남'),
+('楡', '유'),
+('楢', '유'),
+('楣', '미'),
+('楥', '원'),
+('楦', '원'),
+('楨', '정'),
+('楪', '접'),
+('楫', '접'),
+('楫', '즙'),
+('楬', '갈'),
+('業', '업'),
+('業', '일'),
+('楮', '저'),
+('楯', '순'),
+('楳', '매'),
+('楴', '체'),
+('極', '극'),
+('楷', '해'),
+('楸', '추'),
+('楹', '영'),
+('楼', '루'),
+('概', '개'),
+('榆', '유'),
+('榌', '비'),
+('榎', '가'),
+('榑', '부'),
+('榔', '랑'),
+('榕', '용'),
+('榖', '곡'),
+('榘', '구'),
+('榛', '진'),
+('榜', '방'),
+('榜', '병'),
+('榟', '재'),
+('榤', '걸'),
+('榥', '황'),
+('榦', '간'),
+('榧', '비'),
+('榨', '자'),
+('榭', '사'),
+('榮', '꽃'),
+('榮', '영'),
+('榰', '지'),
+('榱', '최'),
+('榴', '류'),
+('榷', '교'),
+('榻', '탑'),
+('榼', '합'),
+('榾', '골'),
+('槀', '고'),
+('槁', '고'),
+('槃', '반'),
+('槊', '삭'),
+('構', '구'),
+('槌', '추'),
+('槌', '퇴'),
+('槍', '쟁'),
+('槍', '창'),
+('槎', '차'),
+('槐', '괴'),
+('槓', '공'),
+('槙', '전'),
+('槥', '혜'),
+('槦', '용'),
+('槧', '참'),
+('槧', '첨'),
+('槨', '곽'),
+('槩', '개'),
+('槪', '개'),
+('槭', '색'),
+('槭', '축'),
+('槮', '삼'),
+('槲', '곡'),
+('槵', '환'),
+('槹', '고'),
+('槻', '규'),
+('槽', '조'),
+('槿', '근'),
+('樀', '적'),
+('樂', '낙'),
+('樂', '락'),
+('樂', '악'),
+('樂', '요'),
+('樅', '종'),
+('樊', '번'),
+('樋', '통'),
+('樑', '량'),
+('樑', '회'),
+('樒', '밀'),
+('樓', '누'),
+('樓', '루'),
+('樔', '소'),
+('樗', '저'),
+('標', '표'),
+('樛', '규'),
+('樞', '우'),
+('樞', '추'),
+('樟', '장'),
+('模', '모'),
+('模', '법'),
+('樣', '상'),
+('樣', '양'),
+('樨', '치'),
+('権', '권'),
+('横', '횡'),
+('樫', '견'),
+('樵', '초'),
+('樸', '박'),
+('樸', '복'),
+('樹', '수'),
+('樺', '화'),
+('樻', '궤'),
+('樽', '준'),
+('樿', '전'),
+('橃', '벌'),
+('橄', '감'),
+('橇', '취'),
+('橈', '요'),
+('橊', '류'),
+('橋', '고'),
+('橋', '교'),
+('橐', '탁'),
+('橒', '운'),
+('橓', '순'),
+('橘', '귤'),
+('橙', '등'),
+('橙', '증'),
+('橚', '숙'),
+('橛', '궐'),
+('機', '기'),
+('機', '틀'),
+('橡', '상'),
+('橢', '타'),
+('橤', '예'),
+('橦', '동'),
+('橦', '장'),
+('橧', '증'),
+('橫', '횡'),
+('橴', '자'),
+('橵', '산'),
+('橻', '추'),
+('橽', '달'),
+('橿', '강'),
+('檀', '단'),
+('檃', '은'),
+('檄', '격'),
+('檉', '정'),
+('檍', '억'),
+('檎', '금'),
+('檐', '첨'),
+('檓', '훼'),
+('檔', '당'),
+('檗', '벽'),
+('檜', '괄'),
+('檜', '회'),
+('檝', '즙'),
+('檞', '해'),
+('檟', '가'),
+('檠', '경'),
+('檢', '검'),
+('檣', '장'),
+('檬', '몽'),
+('檮', '도'),
+('檯', '대'),
+('檳', '빈'),
+('檶', '염'),
+('檸', '녕'),
+('檸', '영'),
+('檻', '함'),
+('檼', '은'),
+('檿', '염'),
+('櫂', '도'),
+('櫃', '궤'),
+('櫓', '노'),
+('櫓', '로'),
+('櫚', '려'),
+('櫛', '즐'),
+('櫜', '고'),
+('櫝', '독'),
+('櫞', '연'),
+('櫟', '력'),
+('櫪', '력'),
+('櫬', '친'),
+('櫶', '헌'),
+('櫷', '귀'),
+('櫻', '앵'),
+('櫼', '첨'),
+('欂', '박'),
+('欃', '참'),
+('欄', '난'),
+('欄', '란'),
+('權', '권'),
+('欌', '장'),
+('欑', '찬'),
+('欒', '난'),
+('欒', '란'),
+('欕', '엄'),
+('欖', '람'),
+('欞', '령'),
+('欠', '감'),
+('欠', '흠'),
+('次', '차'),
+('欣', '흔'),
+('欬', '해'),
+('欲', '욕'),
+('欵', '관'),
+('欶', '삭'),
+('欷', '희'),
+('欸', '애'),
+('欹', '의'),
+('欺', '기'),
+('欻', '훌'),
+('欽', '흠'),
+('款', '관'),
+('欿', '감'),
+('歃', '삽'),
+('歆', '흠'),
+('歇', '헐'),
+('歉', '겸'),
+('歌', '가'),
+('歎', '탄'),
+('歐', '구'),
+('歓', '환'),
+('歔', '허'),
+('歙', '흡'),
+('歚', '선'),
+('歛', '검'),
+('歟', '여'),
+('歠', '철'),
+('歡', '환'),
+('止', '지'),
+('正', '정'),
+('此', '이'),
+('此', '차'),
+('步', '보'),
+('武', '무'),
+('歧', '기'),
+('歩', '보'),
+('歪', '외'),
+('歯', '치'),
+('歲', '세'),
+('歲', '해'),
+('歳', '세'),
+('歷', '력'),
+('歷', '역'),
+('歸', '궤'),
+('歸', '귀'),
+('歹', '대'),
+('歹', '알'),
+('死', '사'),
+('歿', '몰'),
+('殀', '요'),
+('殁', '몰'),
+('殂', '조'),
+('殃', '앙'),
+('殄', '진'),
+('殆', '태'),
+('殉', '순'),
+('殊', '수'),
+('残', '잔'),
+('殍', '표'),
+('殑', '긍'),
+('殖', '식'),
+('殘', '잔'),
+('殞', '운'),
+('殢', '체'),
+('殤', '상'),
+('殫', '탄'),
+('殭', '강'),
+('殮', '렴'),
+('殯', '빈'),
+('殲', '섬'),
+('殳', '수'),
+('殳', '쉬'),
+('段', '단'),
+('殷', '안'),
+('殷', '은'),
+('殸', '성'),
+('殹', '예'),
+('殺', '살'),
+('殺', '쇄'),
+('殺', '쇠'),
+('殻', '각'),
+('殼', '각'),
+('殽', '효'),
+('殿', '전'),
+('毀', '훼'),
+('毁', '훼'),
+('毄', '격'),
+('毅', '의'),
+('毆', '구'),
+('毋', '무'),
+('毌', '관'),
+('母', '모'),
+('毎', '매'),
+('每', '매'),
+('毒', '대'),
+('毒', '독'),
+('毓', '육'),
+('比', '비'),
+('毖', '비'),
+('毗', '비'),
+('毘', '비'),
+('毚', '참'),
+('毛', '모'),
+('毫', '호'),
+('毬', '구'),
+('毯', '담'),
+('毳', '취'),
+('毿', '삼'),
+('氅', '창'),
+('氈', '전'),
+('氏', '씨'),
+('氏', '지'),
+('氐', '저'),
+('民', '민'),
+('氓', '맹'),
+('氖', '내'),
+('気', '기'),
+('氙', '선'),
+('氛', '분'),
+('氟', '불'),
+('氣', '기'),
+('氤', '인'),
+('氦', '해'),
+('氧', '양'),
+('氪', '극'),
+('氫', '경'),
+('氬', '아'),
+('氮', '담'),
+('氯', '록'),
+('氲', '온'),
+('氳', '온'),
+('水', '물'),
+('水', '수'),
+('氷', '빙'),
+('永', '길'),
+('永', '영'),
+('氽', '탄'),
+('氾', '범'),
+('氿', '궤'),
+('汀', '정'),
+('汁', '즙'),
+('汁', '집'),
+('求', '구'),
+('汃', '파'),
+('汊', '차'),
+('汋', '작'),
+('汎', '범'),
+('汎', '봉'),
+('汏', '대'),
+('汐', '석'),
+('汒', '망'),
+('汔', '흘'),
+('汕', '산'),
+('汗', '한'),
+('汙', '오'),
+('汚', '오'),
+('汛', '신'),
+('汜', '사'),
+('汝', '여'),
+('汞', '홍'),
+('江', '강'),
+('池', '지'),
+('池', '타'),
+('污', '오'),
+('汨', '골'),
+('汨', '멱'),
+('汩', '율'),
+('汪', '왕'),
+('汭', '예'),
+('汰', '일'),
+('汰', '태'),
+('汲', '급'),
+('汴', '변'),
+('汴', '파'),
+('汶', '문'),
+('決', '결'),
+('汽', '기'),
+('汽', '김'),
+('汽', '흘'),
+('汾', '분'),
+('沁', '심'),
+('沂', '기'),
+('沃', '옥'),
+('沄', '운'),
+('沅', '원'),
+('沆', '항'),
+('沇', '연'),
+('沈', '심'),
+('沈', '침'),
+('沉', '심'),
+('沉', '침'),
+('沌', '돈'),
+('沍', '호'),
+('沐', '목'),
+('沒', '몰'),
+('沓', '답'),
+('沔', '면'),
+('沕', '물'),
+('沖', '충'),
+('沘', '비'),
+('沙', '사'),
+('沚', '지'),
+('沛', '패'),
+('沢', '석'),
+('沢', '택'),
+('沫', '말'),
+('沬', '매'),
+('沮', '저'),
+('沰', '탁'),
+('沱', '타'),
+('河', '물'),
+('河', '하'),
+('沸', '불'),
+('沸', '비'),
+('油', '유'),
+('沺', '전'),
+('治', '치'),
+('沼', '못'),
+('沼', '소'),
+('沽', '고'),
+('沾', '첨'),
+('沾', '첩'),
+('沿', '연'),
+('況', '황'),
+('泂', '형'),
+('泄', '설'),
+('泄', '예'),
+('泅', '쉬'),
+('泆', '일'),
+('泉', '샘'),
+('泉', '천'),
+('泊', '박'),
+('泌', '비'),
+('泌', '필'),
+('泐', '륵'),
+('泑', '유'),
+('泓', '홍'),
+('泔', '검'),
+('法', '법'),
+('泗', '사'),
+('泘', '호'),
+('泙', '평'),
+('泚', '자'),
+('泛', '범'),
+('泛', '봉'),
+('泜', '지'),
+('泝', '소'),
+('泠', '령'),
+('泡', '포'),
+('波', '파'),
+('泣', '읍'),
+('泥', '니'),
+('泥', '이'),
+('注', '주'),
+('泫', '현'),
+('泮', '반'),
+('泯', '민'),
+('泰', '태'),
+('泱', '앙'),
+('泳', '영'),
+('洄', '회'),
+('洇', '인'),
+('洊', '천'),
+('洋', '양'),
+('洌', '렬'),
+('洑', '보'),
+('洒', '세'),
+('洗', '선'),
+('洗', '세'),
+('洙', '수'),
+('洛', '낙'),
+('洛', '락'),
+('洞', '골'),
+('洞', '동'),
+('洞', '통'),
+('洟', '이'),
+('津', '진'),
+('洧', '유'),
+('洩', '설'),
+('洩', '예'),
+('洪', '홍'),
+('洫', '혁'),
+('洬', '속'),
+('洮', '도'),
+('洲', '주'),
+('洵', '순'),
+('洵', '현'),
+('洶', '흉'),
+('洸', '광'),
+('洹', '원'),
+('洺', '명'),
+('活', '괄'),
+('活', '살'),
+('活', '활'),
+('洼', '와'),
+('洽', '흡'),
+('派', '파'),
+('洿', '오'),
+('流', '류'),
+('流', '유'),
+('浅', '천'),
+('浌', '발'),
+('浌', '벌'),
+('浌', '펄'),
+('浙', '강'),
+('浙', '절'),
+('浚', '준'),
+('浜', '병'),
+('浜', '빈'),
+('浡', '발'),
+('浣', '완'),
+('浤', '굉'),
+('浥', '읍'),
+('浦', '개'),
+('浦', '포'),
+('浧', '영'),
+('浩', '호'),
+('浪', '낭'),
+('浪', '랑'),
+('浬', '리'),
+('浮', '뜰'),
+('浮', '부'),
+('浴', '욕'),
+('海', '해'),
+('浸', '침'),
+('浹', '협'),
+('浼', '매'),
+('浿', '패'),
+('涂', '도'),
+('涅', '날'),
+('涅', '녈'),
+('涅', '열'),
+('涇', '경'),
+('消', '소'),
+('涉', '섭'),
+('涌', '용'),
+('涍', '효'),
+('涎', '연'),
+('涑', '소'),
+('涓', '연'),
+('涔', '잠'),
+('涕', '체'),
+('涖', '리'),
+('涙', '루'),
+('涛', '도'),
+('涜', '독'),
+('涣', '환'),
+('涪', '부'),
+('涫', '관'),
+('涯', '애'),
+('涯', '의'),
+('液', '액'),
+('液', '진'),
+('涴', '완'),
+('涵', '함'),
+('涷', '동'),
+('涸', '학'),
+('涸', '후'),
+('涼', '량'),
+('涼', '양'),
+('涿', '탁'),
+('淀', '정'),
+('淃', '권'),
+('淄', '치'),
+('淅', '석'),
+('淆', '효'),
+('淇', '기'),
+('淈', '굴'),
+('淋', '림'),
+('淏', '호'),
+('淑', '숙'),
+('淒', '처'),
+('淖', '뇨'),
+('淘', '도'),
+('淙', '종'),
+('淚', '누'),
+('淚', '루'),
+('淝', '비'),
+('淞', '송'),
+('淠', '비'),
+('淡', '담'),
+('淢', '역'),
+('淤', '어'),
+('淥', '록'),
+('淦', '검'),
+('淨', '정'),
+('淪', '논'),
+('淪', '륜'),
+('淫', '음'),
+('淬', '쉬'),
+('淬', '줄'),
+('淬', '쵀'),
+('淮', '회'),
+('深', '심'),
+('淳', '순'),
+('淵', '못'),
+('淵', '연'),
+('淶', '래'),
+('混', '곤'),
+('混', '혼'),
+('淸', '청'),
+('淹', '엄'),
+('淺', '천'),
+('添', '첨'),
+('淼', '묘'),
+('清', '청'),
+('渇', '갈'),
+('渇', '걸'),
+('済', '제'),
+('渉', '섭'),
+('渌', '록'),
+('渗', '삼'),
+('渗', '참'),
+('渙', '환'),
+('渚', '저'),
+('減', '감'),
+('減', '덜'),
+('渝', '투'),
+('渟', '정'),
+('渠', '거'),
+('渡', '도'),
+('渣', '사'),
+('渤', '발'),
+('渥', '악'),
+('渦', '과'),
+('渦', '와'),
+('渨', '외'),
+('渨', '위'),
+('温', '온'),
+('渫', '설'),
+('渫', '접'),
+('測', '측'),
+('渭', '위'),
+('港', '항'),
+('渲', '선'),
+('渴', '갈'),
+('渴', '걸'),
+('渶', '영'),
+('渷', '연'),
+('游', '유'),
+('渺', '묘'),
+('渼', '미'),
+('渽', '재'),
+('渾', '혼'),
+('湃', '배'),
+('湄', '미'),
+('湅', '련'),
+('湉', '첨'),
+('湊', '주'),
+('湍', '단'),
+('湎', '면'),
+('湑', '서'),
+('湓', '분'),
+('湔', '전'),
+('湖', '호'),
+('湘', '상'),
+('湛', '담'),
+('湛', '침'),
+('湜', '식'),
+('湞', '정'),
+('湟', '황'),
+('湣', '민'),
+('湧', '용'),
+('湫', '추'),
+('湮', '인'),
+('湯', '상'),
+('湯', '탕'),
+('湲', '원'),
+('湲', '환'),
+('湳', '남'),
+('湺', '보'),
+('湽', '치'),
+('湿', '습'),
+('溁', '영'),
+('溉', '개'),
+('溌', '발'),
+('溏', '당'),
+('源', '원'),
+('溕', '몽'),
+('準', '절'),
+('準', '준'),
+('溘', '합'),
+('溜', '류'),
+('溝', '구'),
+('溟', '명'),
+('溢', '일'),
+('溥', '박'),
+('溥', '부'),
+('溧', '률'),
+('溪', '계'),
+('溫', '온'),
+('溯', '삭'),
+('溯', '소'),
+('溱', '진'),
+('溲', '수'),
+('溴', '추'),
+('溵', '은'),
+('溶', '용'),
+('溷', '혼'),
+('溺', '뇨'),
+('溺', '닉'),
+('溺', '요'),
+('溺', '익'),
+('溽', '욕'),
+('滁', '저'),
+('滂', '방'),
+('滃', '옹'),
+('滄', '창'),
+('滅', '멸'),
+('滇', '전'),
+('滇', '진'),
+('滈', '호'),
+('滉', '황'),
+('滋', '자'),
+('滌', '척'),
+('滎', '형'),
+('滑', '골'),
+('滑', '활'),
+('滓', '재'),
+('滔', '도'),
+('滕', '등'),
+('滙', '회'),
+('滚', '곤'),
+('滝', '농'),
+('滝', '롱'),
+('滬', '호'),
+('滭', '필'),
+('滯', '체'),
+('滲', '삼'),
+('滲', '참'),
+('滴', '적'),
+('滵', '밀'),
+('滷', '로'),
+('滸', '호'),
+('滹', '호'),
+('滾', '곤'),
+('滿', '만'),
+('滿', '찰'),
+('漁', '어'),
+('漂', '표'),
+('漄', '애'),
+('漆', '옻'),
+('漆', '칠'),
+('漉', '록'),
+('漌', '근'),
+('漏', '누'),
+('漏', '루'),
+('漏', '샐'),
+('漑', '개'),
+('漓', '리'),
+('演', '연'),
+('演', '펼'),
+('漕', '조'),
+('漙', '단'),
+('漚', '구'),
+('漠', '막'),
+('漢', '한'),
+('漣', '련'),
+('漣', '연'),
+('漪', '의'),
+('漫', '만'),
+('漬', '지'),
+('漭', '망'),
+('漰', '불'),
+('漱', '수'),
+('漲', '창'),
+('漳', '장'),
+('漸', '점'),
+('漸', '참'),
+('漼', '최'),
+('漾', '양'),
+('漿', '장'),
+('潁', '영'),
+('潃', '수'),
+('潃', '순'),
+('潏', '율'),
+('潑', '발'),
+('潔', '결'),
+('潗', '집'),
+('潘', '반'),
+('潘', '번'),
+('潙', '규'),
+('潚', '수'),
+('潚', '숙'),
+('潛', '잠'),
+('潜', '잠'),
+('潝', '흡'),
+('潞', '로'),
+('潟', '석'),
+('潡', '돈'),
+('潢', '황'),
+('潤', '륜'),
+('潤', '윤'),
+('潦', '료'),
+('潭', '담'),
+('潮', '조'),
+('潯', '심'),
+('潰', '궤'),
+('潴', '저'),
+('潸', '산'),
+('潺', '잔'),
+('潼', '동'),
+('潽', '보'),
+('潾', '린'),
+('澁', '삽'),
+('澂', '징'),
+('澄', '징'),
+('澆', '요'),
+('澈', '철'),
+('澉', '검'),
+('澋', '횡'),
+('澌', '시'),
+('澍', '주'),
+('澎', '팽'),
+('澐', '운'),
+('澒', '홍'),
+('澔', '호'),
+('澗', '간'),
+('澘', '산'),
+('澙', '석'),
+('澟', '름'),
+('澡', '조'),
+('澣', '한'),
+('澤', '석'),
+('澤', '택'),
+('澦', '여'),
+('澧', '례'),
+('澨', '서'),
+('澮', '회'),
+('澯', '찬'),
+('澱', '전'),
+('澳', '오'),
+('澳', '옥'),
+('澶', '전'),
+('澹', '담'),
+('澾', '단'),
+('激', '격'),
+('濁', '탁'),
+('濂', '렴'),
+('濃', '농'),
+('濆', '분'),
+('濇', '색'),
+('濉', '수'),
+('濊', '예'),
+('濕', '습'),
+('濘', '녕'),
+('濚', '영'),
+('濛', '몽'),
+('濞', '비'),
+('濟', '제'),
+('濠', '호'),
+('濡', '유'),
+('濤', '도'),
+('濩', '호'),
+('濫', '남'),
+('濫', '람'),
+('濫', '함'),
+('濬', '준'),
+('濮', '복'),
+('濯', '탁'),
+('濱', '빈'),
+('濳', '잠'),
+('濴', '영'),
+('濺', '천'),
+('濾', '려'),
+('瀁', '양'),
+('瀅', '형'),
+('瀆', '독'),
+('瀇', '왕'),
+('瀉', '사'),
+('瀋', '신'),
+('瀋', '심'),
+('瀏', '류'),
+('瀑', '포'),
+('瀑', '폭'),
+('瀒', '색'),
+('瀓', '징'),
+('瀕', '빈'),
+('瀘', '로'),
+('瀚', '한'),
+('瀛', '영'),
+('瀜', '융'),
+('瀝', '력'),
+('瀞', '정'),
+('瀟', '소'),
+('瀣', '해'),
+('瀦', '저'),
+('瀧', '룡'),
+('瀧', '용'),
+('瀨', '뇌'),
+('瀨', '뢰'),
+('瀬', '뢰'),
+('瀯', '영'),
+('瀰', '미'),
+('瀲', '렴'),
+('瀷', '익'),
+('瀸', '첨'),
+('瀹', '약'),
+('瀼', '양'),
+('瀾', '난'),
+('瀾', '란'),
+('灄', '섭'),
+('灌', '관'),
+('灎', '염'),
+('灐', '형'),
+('灑', '새'),
+('灑', '쇄'),
+('灓', '란'),
+('灘', '탄'),
+('灝', '호'),
+('灞', '파'),
+('灣', '만'),
+('灧', '염'),
+('灩', '염'),
+('火', '불'),
+('火', '화'),
+('灯', '등'),
+('灯', '정'),
+('灰', '재'),
+('灰', '회'),
+('灵', '령'),
+('灷', '선'),
+('灸', '구'),
+('灼', '사'),
+('灼', '작'),
+('災', '재'),
+('灾', '재'),
+('炁', '기'),
+('炅', '경'),
+('炆', '문'),
+('炉', '로'),
+('炊', '취'),
+('炎', '염'),
+('炒', '초'),
+('炕', '항'),
+('炘', '흔'),
+('炙', '자'),
+('炙', '적'),
+('炚', '광'),
+('炚', '빛'),
+('炛', '광'),
+('炛', '빛'),
+('炡', '정'),
+('炤', '소'),
+('炤', '조'),
+('炫', '현'),
+('炬', '거'),
+('炭', '숯'),
+('炭', '탄'),
+('炮', '포'),
+('炯', '형'),
+('炰', '포'),
+('炳', '병'),
+('炵', '동'),
+('炷', '주'),
+('炸', '작'),
+('点', '점'),
+('為', '위'),
+('為', '할'),
+('烀', '호'),
+('烈', '렬'),
+('烈', '열'),
+('烉', '환'),
+('烊', '양'),
+('烋', '효'),
+('烋', '휴'),
+('烎', '음'),
+('烏', '오'),
+('烓', '계'),
+('烘', '홍'),
+('烙', '락'),
+('烜', '훤'),
+('烝', '증'),
+('烟', '연'),
+('烣', '회'),
+('烱', '경'),
+('烱', '형'),
+('烹', '팽'),
+('烽', '봉'),
+('焄', '훈'),
+('焉', '언'),
+('焌', '준'),
+('焔', '연'),
+('焕', '환'),
+('焙', '배'),
+('焚', '분'),
+('焜', '혼'),
+('焞', '돈'),
+('焠', '쉬'),
+('焠', '쵀'),
+('無', '무'),
+('焦', '초'),
+('焭', '경'),
+('焮', '흔'),
+('焯', '작'),
+('焰', '연'),
+('焰', '염'),
+('焱', '혁'),
+('然', '연'),
+('焼', '소'),
+('煆', '하'),
+('煇', '훈'),
+('煇', '휘'),
+('煉', '련'),
+('煊', '훤'),
+('煌', '황'),
+('煎', '전'),
+('煐', '영'),
+('煑', '자'),
+('煒', '위'),
+('煕', '희'),
+('煖', '난'),
+('煗', '난'),
+('煙', '연'),
+('煙', '인'),
+('煜', '욱'),
+('煜', '읍'),
+('煞', '살'),
+('煠', '잡'),
+('煢', '경'),
+('煤', '매'),
+('煥', '환'),
+('煦', '후'),
+('照', '조'),
+('煨', '외'),
+('煩', '번'),
+('煬', '양'),
+('煮', '자'),
+('煽', '선'),
+('熀', '엽'),
+('熄', '식'),
+('熅', '온'),
+('熇', '학'),
+('熇', '혹'),
+('熇', '효'),
+('熈', '희'),
+('熉', '운'),
+('熊', '곰'),
+('熊', '웅'),
+('熏', '훈'),
+('熒', '형'),
+('熔', '용'),
+('熙', '희'),
+('熛', '표'),
+('熟', '숙'),
+('熠', '습'),
+('熢', '봉'),
+('熤', '익'),
+('熨', '울'),
+('熨', '위'),
+('熬', '오'),
+('熯', '선'),
+('熱', '열'),
+('熲', '경'),
+('熹', '희'),
+('熺', '희'),
+('熾', '치'),
+('燁', '엽'),
+('燃', '연'),
+('燃', '탈'),
+('燈', '등'),
+('燉', '돈'),
+('燋', '초'),
+('燎', '료'),
+('燐', '린'),
+('燐', '인'),
+('燒', '소'),
+('燔', '번'),
+('燕', '연'),
+('燖', '심'),
+('燙', '탕'),
+('營', '영'),
+('營', '형'),
+('燠', '불'),
+('燠', '오'),
+('燠', '우'),
+('燠', '욱'),
+('燥', '조'),
+('燦', '찬'),
+('燧', '수'),
+('燬', '훼'),
+('燭', '촉'),
+('燮', '섭'),
+('燰', '애'),
+('燹', '희'),
+('燻', '훈'),
+('燼', '신'),
+('燾', '도'),
+('燿', '요'),
+('爀', '혁'),
+('爆', '박'),
+('爆', '폭'),
+('爇', '설'),
+('爋', '훈'),
+('爌', '광'),
+('爍', '삭'),
+('爐', '노'),
+('爐', '로'),
+('爔', '희'),
+('爗', '엽'),
+('爚', '약'),
+('爛', '란'),
+('爟', '관'),
+('爥', '촉'),
+('爨', '찬'),
+('爪', '조'),
+('爬', '파'),
+('爭', '쟁'),
+('爯', '칭'),
+('爰', '원'),
+('爲', '위'),
+('爲', '할'),
+('爵', '작'),
+('父', '보'),
+('父', '부'),
+('爸', '파'),
+('爹', '다'),
+('爺', '야'),
+('爻', '효'),
+('爽', '상'),
+('爾', '너'),
+('爾', '이'),
+('爿', '장'),
+('牀', '상'),
+('牂', '장'),
+('牆', '장'),
+('片', '편'),
+('版', '판'),
+('牋', '전'),
+('牌', '배'),
+('牌', '패'),
+('牒', '첩'),
+('牓', '방'),
+('牔', '박'),
+('牖', '유'),
+('牘', '독'),
+('牙', '아'),
+('牚', '탱'),
+('牛', '소'),
+('牛', '우'),
+('牝', '빈'),
+('牟', '모'),
+('牡', '모'),
+('牢', '로'),
+('牢', '뢰'),
+('牣', '인'),
+('牧', '목'),
+('牧', '칠'),
+('物', '물'),
+('牯', '고'),
+('牲', '생'),
+('牴', '저'),
+('牸', '자'),
+('特', '특'),
+('牽', '견'),
+('犀', '서'),
+('犁', '리'),
+('犂', '떨'),
+('犂', '려'),
+('犂', '류'),
+('犂', '리'),
+('犂', '여'),
+('犂', '유'),
+('犂', '이'),
+('犇', '분'),
+('犍', '건'),
+('犒', '고'),
+('犒', '호'),
+('犖', '락'),
+('犜', '돈'),
+('犢', '독'),
+('犧', '사'),
+('犧', '희'),
+('犬', '개'),
+('犬', '견'),
+('犮', '발'),
+('犯', '범'),
+('犳', '작'),
+('犴', '안'),
+('犵', '힐'),
+('状', '상'),
+('状', '장'),
+('狀', '상'),
+('狀', '장'),
+('狂', '광'),
+('狄', '적'),
+('狆', '중'),
+('狉', '비'),
+('狌', '성'),
+('狎', '압'),
+('狐', '호'),
+('狒', '비'),
+('狗', '개'),
+('狗', '구'),
+('狙', '저'),
+('狙', '처'),
+('狡', '교'),
+('狢', '학'),
+('狥', '순'),
+('狨', '융'),
+('狩', '수'),
+('独', '독'),
+('狴', '폐'),
+('狷', '견'),
+('狸', '리'),
+('狹', '협'),
+('狺', '은'),
+('狻', '산'),
+('狼', '낭'),
+('狼', '랑'),
+('狽', '패'),
+('猉', '기'),
+('猊', '예'),
+('猋', '표'),
+('猑', '곤'),
+('猓', '과'),
+('猖', '창'),
+('猗', '아'),
+('猗', '의'),
+('猘', '제'),
+('猙', '쟁'),
+('猛', '맹'),
+('猜', '시'),
+('猝', '졸'),
+('猠', '전'),
+('猢', '호'),
+('猥', '외'),
+('猧', '와'),
+('猨', '원'),
+('猩', '성'),
+('猪', '저'),
+('猫', '묘'),
+('献', '사'),
+('献', '헌'),
+('猱', '노'),
+('猴', '후'),
+('猶', '유'),
+('猷', '유'),
+('猾', '활'),
+('猿', '원'),
+('獃', '애'),
+('獄', '옥'),
+('獅', '사'),
+('獎', '장'),
+('獐', '장'),
+('獒', '오'),
+('獗', '궐'),
+('獘', '폐'),
+('獜', '린'),
+('獠', '료'),
+('獣', '수'),
+('獤', '돈'),
+('獧', '견'),
+('獨', '독'),
+('獩', '예'),
+('獪', '쾌'),
+('獪', '회'),
+('獫', '험'),
+('獬', '해'),
+('獮', '선'),
+('獯', '훈'),
+('獰', '녕'),
+('獰', '영'),
+('獱', '빈'),
+('獲', '확'),
+('獲', '획'),
+('獵', '렵'),
+('獵', '엽'),
+('獷', '광'),
+('獸', '수'),
+('獺', '달'),
+('獺', '찰'),
+('獻', '사'),
+('獻', '헌'),
+('獼', '미'),
+('玁', '험'),
+('玃', '확'),
+('玄', '현'),
+('玆', '자'),
+('率', '률'),
+('率', '솔'),
+('率', '수'),
+('率', '율'),
+('玈', '로'),
+('玉', '옥'),
+('玊', '숙'),
+('玊', '옥'),
+('王', '왕'),
+('玎', '정'),
+('玔', '천'),
+('玕', '간'),
+('玖', '구'),
+('玗', '우'),
+('玘', '기'),
+('玙', '여'),
+('玞', '부'),
+('玟', '민'),
+('玠', '개'),
+('玦', '결'),
+('玧', '윤'),
+('玨', '각'),
+('玨', '곡'),
+('玩', '완'),
+('玫', '매'),
+('玭', '빈'),
+('玲', '령'),
+('玲', '영'),
+('玳', '대'),
+('玷', '점'),
+('玹', '현'),
+('玹', '형'),
+('玻', '파'),
+('珀', '박'),
+('珂', '가'),
+('珆', '이'),
+('珈', '가'),
+('珉', '민'),
+('珊', '산'),
+('珌', '필'),
+('珍', '진'),
+('珏', '각'),
+('珏', '곡'),
+('珒', '진'),
+('珖', '광'),
+('珙', '공'),
+('珝', '후'),
+('珞', '락'),
+('珠', '주'),
+('珢', '간'),
+('珢', '은'),
+('珣', '순'),
+('珤', '보'),
+('珥', '이'),
+('珦', '향'),
+('珩', '형'),
+('珪', '규'),
+('珫', '충'),
+('班', '반'),
+('珮', '패'),
+('珵', '정'),
+('珷', '무'),
+('珹', '성'),
+('珽', '정'),
+('現', '현'),
+('琁', '선'),
+('球', '공'),
+('球', '구'),
+('琄', '현'),
+('琅', '랑'),
+('理', '리'),
+('理', '이'),
+('琇', '수'),
+('琉', '류'),
+('琉', '유'),
+('琎', '진'),
+('琓', '완'),
+('琛', '침'),
+('琠', '전'),
+('琡', '수'),
+('琢', '탁'),
+('琤', '쟁'),
+('琥', '호'),
+('琦', '기'),
+('琨', '곤'),
+('琪', '기'),
+('琫', '봉'),
+('琬', '완'),
+('琮', '종'),
+('琯', '관'),
+('琰', '염'),
+('琲', '배'),
+('琳', '림'),
+('琴', '금'),
+('琵', '비'),
+('琶', '파'),
+('琸', '탁'),
+('琺', '법'),
+('琿', '흔'),
+('瑀', '우'),
+('瑁', '모'),
+('瑃', '춘'),
+('瑄', '선'),
+('瑅', '제'),
+('瑆', '성'),
+('瑋', '위'),
+('瑎', '해'),
+('瑕', '하'),
+('瑗', '원'),
+('瑙', '노'),
+('瑚', '호'),
+('瑛', '영'),
+('瑜', '유'),
+('瑝', '황'),
+('瑞', '서'),
+('瑟', '슬'),
+('瑠', '류'),
+('瑠', '유'),
+('瑢', '용'),
+('瑣', '쇄'),
+('瑤', '요'),
+('瑥', '온'),
+('瑨', '진'),
+('瑩', '영'),
+('瑩', '형'),
+('瑪', '마'),
+('瑭', '당'),
+('瑯', '랑'),
+('瑰', '괴'),
+('瑱', '전'),
+('瑲', '창'),
+('瑳', '차'),
+('瑶', '요'),
+('瑽', '종'),
+('瑾', '근'),
+('璀', '최'),
+('璂', '기'),
+('璃', '리'),
+('璃', '이'),
+('璆', '구'),
+('璇', '선'),
+('璉', '련'),
+('璉', '연'),
+('璊', '문'),
+('璋', '장'),
+('璘', '린'),
+('璘', '인'),
+('璜', '황'),
+('璝', '괴'),
+('璞', '박'),
+('璟', '경'),
+('璡', '진'),
+('璢', '류'),
+('璢', '유'),
+('璣', '기'),
+('璥', '경'),
+('璧', '벽'),
+('璨', '찬'),
+('璪', '조'),
+('璫', '당'),
+('環', '환'),
+('璲', '수'),
+('璵', '여'),
+('璹', '수'),
+('璽', '새'),
+('璿', '선'),
+('瓆', '질'),
+('瓊', '경'),
+('瓏', '룡'),
+('瓔', '영'),
+('瓘', '관'),
+('瓚', '찬'),
+('瓛', '환'),
+('瓜', '과'),
+('瓠', '호'),
+('瓢', '표'),
+('瓣', '판'),
+('瓦', '와'),
+('瓩', '천'),
+('瓮', '옹'),
+('瓲', '톤'),
+('瓶', '병'),
+('瓷', '자'),
+('瓿', '부'),
+('甁', '병'),
+('甃', '추'),
+('甄', '견'),
+('甄', '진'),
+('甌', '구'),
+('甍', '멍'),
+('甎', '전'),
+('甑', '증'),
+('甓', '벽'),
+('甕', '옹'),
+('甘', '감'),
+('甚', '심'),
+('甛', '첨'),
+('甜', '달'),
+('甜', '첨'),
+('甞', '상'),
+('生', '날'),
+('生', '생'),
+('產', '산'),
+('産', '산'),
+('甥', '생'),
+('甦', '소'),
+('用', '쓸'),
+('用', '용'),
+('甫', '보'),
+('甬', '용'),
+('甯', '녕'),
+('田', '밭'),
+('田', '전'),
+('由', '유'),
+('甲', '갑'),
+('申', '신'),
+('男', '남'),
+('甸', '승'),
+('甸', '전'),
+('甹', '병'),
+('町', '정'),
+('画', '화'),
+('画', '획'),
+('甼', '정'),
+('甽', '견'),
+('甾', '재'),
+('甿', '멍'),
+('畀', '비'),
+('畇', '균'),
+('畊', '경'),
+('畋', '전'),
+('界', '계'),
+('畎', '견'),
+('畏', '외'),
+('畐', '복'),
+('畑', '전'),
+('畓', '논'),
+('畓', '답'),
+('畔', '반'),
+('留', '류'),
+('留', '유'),
+('畚', '분'),
+('畛', '진'),
+('畜', '축'),
+('畜', '휵'),
+('畝', '묘'),
+('畝', '무'),
+('畟', '측'),
+('畠', '전'),
+('畢', '필'),
+('畤', '치'),
+('略', '략'),
+('略', '약'),
+('畦', '휴'),
+('畧', '략'),
+('番', '반'),
+('番', '번'),
+('番', '파'),
+('畫', '화'),
+('畫', '획'),
+('畮', '무'),
+('畯', '준'),
+('異', '리'),
+('異', '이'),
+('畵', '화'),
+('畵', '획'),
+('當', '당'),
+('畸', '기'),
+('畺', '강'),
+('畿', '기'),
+('疆', '강'),
+('疇', '주'),
+('疈', '벽'),
+('疊', '첩'),
+('疋', '소'),
+('疋', '필'),
+('疌', '섭'),
+('疎', '소'),
+('疏', '소'),
+('疑', '응'),
+('疑', '의'),
+('疒', '녁'),
+('疒', '역'),
+('疔', '정'),
+('疙', '흘'),
+('疚', '구'),
+('疝', '산'),
+('疣', '유'),
+('疤', '파'),
+('疥', '개'),
+('疩', '취'),
+('疫', '역'),
+('疱', '포'),
+('疲', '피'),
+('疳', '감'),
+('疴', '아'),
+('疵', '자'),
+('疸', '달'),
+('疹', '진'),
+('疼', '동'),
+('疽', '저'),
+('疾', '병'),
+('疾', '질'),
+('痀', '구'),
+('痂', '가'),
+('痃', '현'),
+('病', '병'),
+('症', '증'),
+('痊', '전'),
+('痍', '이'),
+('痎', '해'),
+('痒', '양'),
+('痓', '치'),
+('痔', '치'),
+('痕', '흔'),
+('痘', '두'),
+('痙', '경'),
+('痛', '통'),
+('痞', '비'),
+('痡', '부'),
+('痢', '리'),
+('痢', '이'),
+('痣', '지'),
+('痤', '좌'),
+('痧', '사'),
+('痩', '수'),
+('痰', '담'),
+('痲', '마'),
+('痳', '림'),
+('痴', '치'),
+('痹', '비'),
+('痺', '비'),
+('痼', '고'),
+('痿', '위'),
+('瘀', '어'),
+('瘁', '취'),
+('瘇', '종'),
+('瘈', '계'),
+('瘉', '유'),
+('瘋', '풍'),
+('瘍', '양'),
+('瘏', '도'),
+('瘐', '유'),
+('瘕', '하'),
+('瘖', '음'),
+('瘙', '소'),
+('瘟', '온'),
+('瘠', '척'),
+('瘡', '창'),
+('瘢', '반'),
+('瘤', '류'),
+('瘦', '수'),
+('瘧', '학'),
+('瘭', '표'),
+('瘯', '족'),
+('瘰', '라'),
+('瘳', '추'),
+('瘴', '장'),
+('瘻', '루'),
+('療', '료'),
+('療', '요'),
+('癃', '륭'),
+('癆', '로'),
+('癈', '폐'),
+('癉', '단'),
+('癌', '암'),
+('癎', '간'),
+('癒', '유'),
+('癕', '옹'),
+('癖', '벽'),
+('癘', '려'),
+('癜', '전'),
+('癡', '치'),
+('癢', '양'),
+('癤', '절'),
+('癥', '징'),
+('癧', '력'),
+('癨', '곽'),
+('癩', '나'),
+('癩', '라'),
+('癬', '선'),
+('癭', '영'),
+('癮', '은'),
+('癯', '구'),
+('癰', '용'),
+('癱', '탄'),
+('癲', '전'),
+('癶', '발'),
+('癸', '계'),
+('発', '발'),
+('登', '등'),
+('發', '발'),
+('發', '필'),
+('白', '배'),
+('白', '백'),
+('白', '흰'),
+('百', '맥'),
+('百', '백'),
+('皀', '급'),
+('皁', '조'),
+('皃', '모'),
+('的', '적'),
+('皅', '파'),
+('皆', '개'),
+('皇', '왕'),
+('皇', '황'),
+('皋', '고'),
+('皎', '교'),
+('皐', '고'),
+('皐', '호'),
+('皓', '호'),
+('皕', '벽'),
+('皕', '비'),
+('皕', '핍'),
+('皖', '환'),
+('皚', '애'),
+('皛', '효'),
+('皜', '호'),
+('皞', '호'),
+('皤', '파'),
+('皬', '학'),
+('皮', '피'),
+('皴', '준'),
+('皶', '사'),
+('皸', '군'),
+('皸', '틀'),
+('皺', '추'),
+('皿', '명'),
+('盂', '우'),
+('盃', '배'),
+('盅', '충'),
+('盆', '분'),
+('盈', '영'),
+('益', '익'),
+('盌', '완'),
+('盍', '합'),
+('盎', '앙'),
+('盒', '합'),
+('盔', '회'),
+('盖', '개'),
+('盖', '합'),
+('盙', '보'),
+('盛', '성'),
+('盜', '도'),
+('盞', '잔'),
+('盟', '맹'),
+('盡', '진'),
+('監', '감'),
+('監', '볼'),
+('盤', '반'),
+('盥', '관'),
+('盧', '노'),
+('盧', '로'),
+('盪', '탕'),
+('盬', '고'),
+('目', '눈'),
+('目', '목'),
+('盱', '우'),
+('盱', '유'),
+('盲', '맹'),
+('直', '직'),
+('相', '상'),
+('盹', '순'),
+('盻', '혜'),
+('盼', '반'),
+('盾', '돈'),
+('盾', '순'),
+('省', '덜'),
+('省', '생'),
+('省', '성'),
+('眄', '면'),
+('眇', '묘'),
+('眈', '탐'),
+('眉', '미'),
+('眊', '모'),
+('看', '간'),
+('看', '볼'),
+('県', '현'),
+('眚', '생'),
+('眛', '매'),
+('眞', '진'),
+('眞', '참'),
+('真', '진'),
+('真', '참'),
+('眠', '면'),
+('眥', '자'),
+('眦', '자'),
+('眨', '잡'),
+('眩', '현'),
+('眩', '환'),
+('眴', '순'),
+('眷', '권'),
+('眸', '모'),
+('眺', '조'),
+('眻', '양'),
+('眼', '눈'),
+('眼', '안'),
+('眾', '중'),
+('着', '착'),
+('睆', '환'),
+('睇', '제'),
+('睊', '견'),
+('睍', '현'),
+('睎', '희'),
+('睒', '섬'),
+('睘', '경'),
+('睚', '애'),
+('睛', '정'),
+('睜', '정'),
+('睟', '수'),
+('睠', '권'),
+('睡', '수'),
+('睢', '수'),
+('督', '독'),
+('睥', '비'),
+('睦', '목'),
+('睨', '예'),
+('睪', '고'),
+('睫', '첩'),
+('睬', '채'),
+('睴', '곤'),
+('睷', '건'),
+('睹', '도'),
+('睽', '규'),
+('睾', '고'),
+('睿', '예'),
+('瞀', '무'),
+('瞈', '옹'),
+('瞋', '진'),
+('瞍', '수'),
+('瞎', '할'),
+('瞏', '경'),
+('瞑', '면'),
+('瞑', '명'),
+('瞖', '예'),
+('瞙', '막'),
+('瞞', '만'),
+('瞠', '당'),
+('瞠', '쟁'),
+('瞢', '몽'),
+('瞥', '별'),
+('瞩', '촉'),
+('瞪', '징'),
+('瞬', '순'),
+('瞭', '료'),
+('瞯', '간'),
+('瞯', '한'),
+('瞰', '감'),
+('瞳', '동'),
+('瞹', '애'),
+('瞻', '첨'),
+('瞼', '검'),
+('瞽', '고'),
+('瞿', '구'),
+('矃', '머'),
+('矃', '멋'),
+('矇', '몽'),
+('矉', '빈'),
+('矍', '확'),
+('矕', '만'),
+('矗', '촉'),
+('矙', '검'),
+('矚', '촉'),
+('矛', '모'),
+('矛', '창'),
+('矜', '근'),
+('矜', '긍'),
+('矞', '율'),
+('矠', '색'),
+('矡', '확'),
+('矢', '시'),
+('矣', '의'),
+('知', '알'),
+('知', '지'),
+('矦', '후'),
+('矧', '신'),
+('矩', '구'),
+('短', '단'),
+('矮', '왜'),
+('矯', '교'),
+('矰', '증'),
+('石', '돌'),
+('石', '석'),
+('矺', '탁'),
+('矻', '골'),
+('矻', '굴'),
+('矼', '강'),
+('矽', '석'),
+('砂', '사'),
+('砌', '체'),
+('砏', '분'),
+('砑', '아'),
+('砒', '비'),
+('研', '갈'),
+('研', '연'),
+('砕', '쇄'),
+('砢', '라'),
+('砥', '지'),
+('砦', '채'),
+('砧', '침'),
+('砬', '립'),
+('砭', '폄'),
+('砰', '팽'),
+('砲', '포'),
+('破', '파'),
+('砷', '신'),
+('砺', '려'),
+('硃', '주'),
+('硅', '규'),
+('硇', '뇨'),
+('硇', '요'),
+('硏', '갈'),
+('硏', '연'),
+('硒', '서'),
+('硜', '갱'),
+('硝', '초'),
+('硠', '랑'),
+('硧', '용'),
+('硨', '차'),
+('硫', '류'),
+('硫', '유'),
+('硬', '경'),
+('确', '학'),
+('硯', '연'),
+('硼', '붕'),
+('硼', '평'),
+('碁', '기'),
+('碇', '정'),
+('碌', '녹'),
+('碌', '록'),
+('碍', '애'),
+('碎', '쇄'),
+('碏', '작'),
+('碑', '비'),
+('碓', '대'),
+('碗', '완'),
+('碘', '전'),
+('碟', '설'),
+('碣', '갈'),
+('碣', '게'),
+('碤', '영'),
+('碧', '벽'),
+('碨', '아'),
+('碨', '외'),
+('碩', '석'),
+('碭', '탕'),
+('碲', '제'),
+('碳', '탄'),
+('確', '확'),
+('碻', '확'),
+('碼', '마'),
+('碾', '년'),
+('磁', '자'),
+('磅', '방'),
+('磈', '아'),
+('磈', '외'),
+('磊', '뢰'),
+('磋', '차'),
+('磌', '전'),
+('磎', '계'),
+('磏', '렴'),
+('磐', '반'),
+('磑', '애'),
+('磔', '책'),
+('磕', '개'),
+('磚', '전'),
+('磠', '노'),
+('磠', '뇨'),
+('磠', '로'),
+('磠', '요'),
+('磧', '적'),
+('磨', '갈'),
+('磨', '마'),
+('磪', '최'),
+('磬', '경'),
+('磯', '기'),
+('磴', '등'),
+('磵', '간'),
+('磷', '린'),
+('磺', '광'),
+('磻', '반'),
+('磻', '번'),
+('磼', '잡'),
+('磽', '교'),
+('磾', '제'),
+('礁', '초'),
+('礌', '뇌'),
+('礌', '뢰'),
+('礎', '초'),
+('礏', '급'),
+('礑', '당'),
+('礒', '의'),
+('礖', '여'),
+('礙', '애'),
+('礦', '광'),
+('礦', '황'),
+('礧', '뢰'),
+('礪', '려'),
+('礫', '력'),
+('礫', '역'),
+('礬', '반'),
+('礭', '확'),
+('礱', '롱'),
+('示', '기'),
+('示', '시'),
+('礼', '례'),
+('礼', '예'),
+('社', '사'),
+('礿', '약'),
+('祀', '사'),
+('祁', '기'),
+('祅', '요'),
+('祆', '천'),
+('祇', '기'),
+('祇', '지'),
+('祈', '기'),
+('祈', '빌'),
+('祉', '지'),
+('祊', '팽'),
+('祌', '충'),
+('祐', '우'),
+('祓', '불'),
+('祔', '부'),
+('祕', '비'),
+('祖', '조'),
+('祗', '지'),
+('祘', '산'),
+('祚', '조'),
+('祛', '거'),
+('祜', '호'),
+('祝', '빌'),
+('祝', '주'),
+('祝', '축'),
+('神', '신'),
+('祟', '수'),
+('祠', '사'),
+('祢', '니'),
+('祥', '상'),
+('祧', '조'),
+('票', '표'),
+('祫', '협'),
+('祭', '제'),
+('祭', '채'),
+('祵', '리'),
+('祵', '이'),
+('祷', '도'),
+('祺', '기'),
+('祼', '관'),
+('祿', '녹'),
+('祿', '록'),
+('祿', '복'),
+('禀', '품'),
+('禁', '금'),
+('禅', '선'),
+('禊', '계'),
+('禋', '인'),
+('禍', '화'),
+('禎', '정'),
+('福', '복'),
+('禑', '복'),
+('禑', '우'),
+('禔', '시'),
+('禔', '제'),
+('禖', '매'),
+('禝', '직'),
+('禦', '어'),
+('禧', '희'),
+('禨', '기'),
+('禪', '선'),
+('禫', '담'),
+('禮', '례'),
+('禮', '예'),
+('禰', '니'),
+('禰', '이'),
+('禱', '도'),
+('禳', '양'),
+('禴', '약'),
+('禹', '우'),
+('禺', '옹'),
+('离', '리'),
+('禽', '금'),
+('禾', '벼'),
+('禾', '수'),
+('禾', '화'),
+('禿', '독'),
+('秀', '수'),
+('私', '사'),
+('秃', '독'),
+('秆', '간'),
+('秉', '병'),
+('秊', '년'),
+('秋', '추'),
+('种', '충'),
+('科', '과'),
+('秒', '묘'),
+('秒', '초'),
+('秕', '비'),
+('秖', '지'),
+('秘', '비'),
+('租', '조'),
+('秢', '령'),
+('秣', '말'),
+('秤', '칭'),
+('秦', '진'),
+('秧', '앙'),
+('秩', '질'),
+('秪', '지'),
+('秫', '출'),
+('秬', '거'),
+('秭', '자'),
+('称', '칭'),
+('秸', '갈'),
+('移', '이'),
+('稀', '희'),
+('稁', '고'),
+('稂', '랑'),
+('稅', '세'),
+('稅', '탈'),
+('稈', '간'),
+('稊', '제'),
+('程', '정'),
+('稌', '도'),
+('稍', '초'),
+('税', '세'),
+('税', '탈'),
+('稔', '염'),
+('稔', '임'),
+('稗', '패'),
+('稙', '직'),
+('稚', '치'),
+('稜', '릉'),
+('稞', '과'),
+('稟', '품'),
+('稠', '조'),
+('稠', '주'),
+('稧', '설'),
+('稭', '개'),
+('種', '씨'),
+('種', '종'),
+('稱', '칭'),
+('稲', '도'),
+('稳', '온'),
+('稶', '욱'),
+('稷', '직'),
+('稹', '진'),
+('稻', '도'),
+('稻', '벼'),
+('稼', '가'),
+('稽', '계'),
+('稿', '고'),
+('穀', '곡'),
+('穀', '구'),
+('穅', '강'),
+('穆', '목'),
+('穉', '치'),
+('穌', '소'),
+('積', '자'),
+('積', '적'),
+('穎', '영'),
+('穏', '온'),
+('穐', '추'),
+('穗', '수'),
+('穜', '동'),
+('穠', '농'),
+('穡', '색'),
+('穢', '예'),
+('穩', '온'),
+('穫', '호'),
+('穫', '확'),
+('穰', '양'),
+('穰', '짚'),
+('穴', '혈'),
+('穵', '알'),
+('究', '구'),
+('穹', '궁'),
+('空', '공'),
+('空', '빌'),
+('穽', '정'),
+('穾', '요'),
+('穿', '천'),
+('窀', '둔'),
+('突', '돌'),
+('窂', '로'),
+('窃', '절'),
+('窄', '착'),
+('窅', '요'),
+('窆', '폄'),
+('窈', '요'),
+('窊', '와'),
+('窒', '절'),
+('窒', '질'),
+('窓', '창'),
+('窕', '조'),
+('窗', '창'),
+('窘', '군'),
+('窛', '구'),
+('窟', '굴'),
+('窠', '과'),
+('窣', '솔'),
+('窩', '와'),
+('窪', '와'),
+('窬', '유'),
+('窮', '궁'),
+('窯', '요'),
+('窳', '유'),
+('窶', '구'),
+('窹', '오'),
+('窺', '규'),
+('窻', '창'),
+('窾', '관'),
+('窿', '륭'),
+('竄', '찬'),
+('竅', '규'),
+('竇', '두'),
+('竈', '조'),
+('竊', '절'),
+('立', '립'),
+('立', '설'),
+('立', '입'),
+('竗', '묘'),
+('站', '참'),
+('竚', '저'),
+('竜', '농'),
+('竜', '룡'),
+('竝', '곁'),
+('竝', '반'),
+('竝', '방'),
+('竝', '병'),
+('竟', '경'),
+('章', '글'),
+('章', '장'),
+('竢', '사'),
+('竣', '전'),
+('竣', '준'),
+('童', '동'),
+('竦', '송'),
+('竪', '수'),
+('竭', '갈'),
+('竭', '걸'),
+('端', '끝'),
+('端', '단'),
+('競', '경'),
+('竸', '경'),
+('竹', '죽'),
+('竺', '독'),
+('竺', '축'),
+('竽', '우'),
+('竿', '간'),
+('笆', '파'),
+('笈', '급'),
+('笊', '조'),
+('笋', '순'),
+('笌', '아'),
+('笏', '홀'),
+('笑', '소'),
+('笒', '금'),
+('笘', '점'),
+('笙', '생'),
+('笛', '적'),
+('笞', '태'),
+('笠', '립'),
+('笠', '입'),
+('笥', '사'),
+('符', '부'),
+('笧', '책'),
+('笨', '분'),
+('笪', '갇'),
+('第', '제'),
+('笭', '령'),
+('笯', '노'),
+('笱', '구'),
+('笳', '가'),
+('笵', '범'),
+('笹', '세'),
+('笻', '공'),
+('筅', '선'),
+('筆', '붓'),
+('筆', '필'),
+('筈', '괄'),
+('等', '등'),
+('筋', '근'),
+('筌', '전'),
+('筍', '순'),
+('筏', '벌'),
+('筐', '광'),
+('筑', '축'),
+('筒', '통'),
+('筓', '계'),
+('答', '답'),
+('筕', '행'),
+('策', '책'),
+('筟', '부'),
+('筠', '균'),
+('筥', '거'),
+('筦', '관'),
+('筧', '견'),
+('筩', '통'),
+('筬', '성'),
+('筮', '서'),
+('筱', '소'),
+('筲', '소'),
+('筳', '정'),
+('筵', '연'),
+('筽', '오'),
+('筿', '소'),
+('箇', '개'),
+('箇', '낱'),
+('箋', '전'),
+('箍', '고'),
+('箎', '호'),
+('箏', '쟁'),
+('箒', '추'),
+('箔', '박'),
+('箕', '기'),
+('算', '산'),
+('算', '셈'),
+('箙', '복'),
+('箚', '차'),
+('箜', '공'),
+('箝', '겸'),
+('箠', '추'),
+('管', '관'),
+('箪', '단'),
+('箭', '전'),
+('箱', '상'),
+('箴', '잠'),
+('箸', '저'),
+('箾', '삭'),
+('箾', '소'),
+('節', '절'),
+('篁', '황'),
+('範', '범'),
+('範', '법'),
+('篆', '전'),
+('篇', '편'),
+('築', '축'),
+('篊', '홍'),
+('篋', '협'),
+('篌', '후'),
+('篒', '식'),
+('篔', '운'),
+('篙', '고'),
+('篛', '약'),
+('篝', '구'),
+('篠', '소'),
+('篡', '찬'),
+('篤', '독'),
+('篥', '률'),
+('篦', '비'),
+('篩', '사'),
+('篪', '지'),
+('篭', '롱'),
+('篳', '필'),
+('篷', '봉'),
+('篸', '잠'),
+('篾', '멸'),
+('簀', '책'),
+('簇', '족'),
+('簉', '추'),
+('簋', '궤'),
+('簏', '록'),
+('簑', '사'),
+('簒', '찬'),
+('簔', '사'),
+('簘', '소'),
+('簞', '단'),
+('簟', '점'),
+('簠', '보'),
+('簡', '간'),
+('簧', '황'),
+('簪', '잠'),
+('簫', '소'),
+('簷', '첨'),
+('簸', '파'),
+('簽', '첨'),
+('簾', '렴'),
+('簾', '발'),
+('簾', '염'),
+('簿', '박'),
+('簿', '부'),
+('籃', '람'),
+('籌', '주'),
+('籍', '적'),
+('籐', '등'),
+('籒', '주'),
+('籔', '수'),
+('籛', '전'),
+('籜', '탁'),
+('籟', '뢰'),
+('籠', '농'),
+('籠', '롱'),
+('籢', '렴'),
+('籢', '염'),
+('籤', '첨'),
+('籥', '약'),
+('籧', '거'),
+('籨', '렴'),
+('籨', '염'),
+('籩', '변'),
+('籬', '리'),
+('籬', '이'),
+('籲', '유'),
+('米', '미'),
+('米', '쌀'),
+('类', '류'),
+('籾', '인'),
+('粁', '천'),
+('粃', '비'),
+('粉', '분'),
+('粍', '모'),
+('粒', '립'),
+('粒', '알'),
+('粒', '입'),
+('粔', '거'),
+('粕', '박'),
+('粗', '조'),
+('粘', '점'),
+('粟', '속'),
+('粢', '자'),
+('粤', '월'),
+('粥', '육'),
+('粥', '죽'),
+('粦', '린'),
+('粧', '장'),
+('粨', '백'),
+('粮', '량'),
+('粱', '량'),
+('粲', '찬'),
+('粳', '갱'),
+('粵', '월'),
+('粹', '수'),
+('粼', '린'),
+('粽', '종'),
+('精', '정'),
+('糅', '유'),
+('糆', '면'),
+('糇', '후'),
+('糉', '종'),
+('糊', '호'),
+('糕', '고'),
+('糖', '당'),
+('糖', '엿'),
+('糖', '탕'),
+('糗', '구'),
+('糙', '조'),
+('糚', '장'),
+('糜', '미'),
+('糝', '삼'),
+('糞', '똥'),
+('糞', '분'),
+('糟', '조'),
+('糠', '강'),
+('糢', '모'),
+('糤', '잔'),
+('糥', '나'),
+('糧', '량'),
+('糧', '양'),
+('糯', '나'),
+('糰', '단'),
+('糲', '려'),
+('糴', '적'),
+('糶', '조'),
+('糸', '멱'),
+('糸', '사'),
+('糺', '규'),
+('系', '계'),
+('糾', '교'),
+('糾', '규'),
+('糾', '꼴'),
+('紀', '기'),
+('紂', '주'),
+('紃', '순'),
+('約', '약'),
+('約', '요'),
+('紅', '공'),
+('紅', '홍'),
+('紆', '우'),
+('紇', '흘'),
+('紈', '환'),
+('紊', '문'),
+('紋', '문'),
+('納', '납'),
+('紐', '뉴'),
+('紓', '서'),
+('純', '순'),
+('純', '준'),
+('紕', '비'),
+('紗', '사'),
+('紘', '굉'),
+('紙', '지'),
+('級', '급'),
+('紛', '분'),
+('紜', '운'),
+('素', '소'),
+('素', '흴'),
+('紡', '방'),
+('索', '노'),
+('索', '삭'),
+('索', '색'),
+('紫', '자'),
+('紬', '주'),
+('紮', '찰'),
+('累', '누'),
+('累', '루'),
+('細', '세'),
+('紱', '불'),
+('紲', '설'),
+('紳', '신'),
+('紵', '저'),
+('紹', '소'),
+('紺', '감'),
+('紼', '불'),
+('絀', '출'),
+('終', '종'),
+('絃', '현'),
+('組', '조'),
+('絅', '경'),
+('絆', '반'),
+('絉', '술'),
+('経', '경'),
+('絍', '임'),
+('絎', '행'),
+('結', '결'),
+('絓', '괘'),
+('絕', '절'),
+('絖', '광'),
+('絙', '환'),
+('絛', '조'),
+('絜', '혈'),
+('絞', '교'),
+('絡', '낙'),
+('絡', '락'),
+('絢', '현'),
+('絣', '병'),
+('給', '급'),
+('絨', '융'),
+('絩', '조'),
+('絪', '인'),
+('絮', '서'),
+('絮', '여'),
+('絰', '질'),
+('統', '통'),
+('絲', '사'),
+('絳', '강'),
+('絶', '절'),
+('絹', '견'),
+('絺', '치'),
+('絿', '구'),
+('綃', '초'),
+('綆', '경'),
+('綈', '제'),
+('綎', '정'),
+('綏', '수'),
+('綏', '유'),
+('經', '경'),
+('綘', '봉'),
+('継', '계'),
+('続', '속'),
+('綜', '종'),
+('綠', '녹'),
+('綠', '록'),
+('綢', '도'),
+('綢', '주'),
+('綣', '권'),
+('綥', '기'),
+('綦', '기'),
+('綧', '준'),
+('綩', '원'),
+('綫', '선'),
+('綫', '줄'),
+('綬', '수'),
+('維', '유'),
+('綮', '계'),
+('綰', '관'),
+('綱', '강'),
+('網', '망'),
+('綳', '붕'),
+('綴', '철'),
+('綴', '체'),
+('綵', '채'),
+('綸', '관'),
+('綸', '륜'),
+('綺', '기'),
+('綻', '탄'),
+('綽', '작'),
+('綾', '릉'),
+('綿', '면'),
+('緄', '곤'),
+('緇', '치'),
+('緊', '긴'),
+('緋', '비'),
+('緌', '유'),
+('緍', '민'),
+('総', '총'),
+('緑', '록'),
+('緒', '서'),
+('緖', '서'),
+('緗', '상'),
+('緘', '함'),
+('線', '선'),
+('線', '줄'),
+('緜', '면'),
+('緝', '즙'),
+('緝', '집'),
+('緞', '단'),
+('緞', '하'),
+('締', '체'),
+('緡', '민'),
+('緣', '단'),
+('緣', '연'),
+('緦', '시'),
+('編', '변'),
+('編', '편'),
+('緩', '완'),
+('緬', '면'),
+('緯', '위'),
+('緲', '묘'),
+('練', '련'),
+('練', '연'),
+('緶', '편'),
+('緹', '제'),
+('緻', '치'),
+('緼', '온'),
+('縁', '단'),
+('縁', '연'),
+('縂', '총'),
+('縇', '선'),
+('縈', '영'),
+('縉', '진'),
+('縊', '액'),
+('縊', '의'),
+('縋', '추'),
+('縐', '추'),
+('縑', '겸'),
+('縕', '온'),
+('縗', '최'),
+('縘', '계'),
+('縛', '박'),
+('縝', '진'),
+('縞', '호'),
+('縟', '요'),
+('縠', '곡'),
+('縡', '재'),
+('縢', '등'),
+('縣', '현'),
+('縦', '종'),
+('縦', '총'),
+('縫', '봉'),
+('縫', '탈'),
+('縮', '축'),
+('縯', '연'),
+('縱', '종'),
+('縱', '총'),
+('縲', '류'),
+('縳', '견'),
+('縴', '견'),
+('縵', '만'),
+('縶', '집'),
+('縷', '루'),
+('縹', '표'),
+('縻', '미'),
+('總', '총'),
+('績', '적'),
+('繁', '반'),
+('繁', '번'),
+('繁', '파'),
+('繁', '흴'),
+('繃', '붕'),
+('繄', '예'),
+('繅', '소'),
+('繆', '무'),
+('繆', '유'),
+('繇', '요'),
+('繈', '강'),
+('繊', '섬'),
+('繋', '계'),
+('繍', '수'),
+('繎', '연'),
+('繐', '세'),
+('繒', '증'),
+('織', '직'),
+('繕', '선'),
+('繖', '산'),
+('繗', '린'),
+('繗', '인'),
+('繙', '번'),
+('繚', '료'),
+('繝', '간'),
+('繞', '요'),
+('繠', '예'),
+('繡', '수'),
+('繢', '궤'),
+('繤', '찬'),
+('繦', '강'),
+('繩', '승'),
+('繪', '회'),
+('繫', '경'),
+('繫', '계'),
+('繫', '맬'),
+('繭', '견'),
+('繯', '현'),
+('繯', '환'),
+('繰', '조'),
+('繳', '격'),
+('繶', '억'),
+('繹', '역'),
+('繼', '계'),
+('繽', '빈'),
+('繾', '견'),
+('纁', '훈'),
+('纂', '찬'),
+('纇', '뢰'),
+('纈', '힐'),
+('纉', '찬'),
+('纊', '광'),
+('續', '속'),
+('纍', '류'),
+('纏', '전'),
+('纓', '영'),
+('纔', '재'),
+('纖', '섬'),
+('纘', '찬'),
+('纚', '리'),
+('纚', '이'),
+('纛', '도'),
+('纛', '독'),
+('纜', '람'),
+('纮', '굉'),
+('纻', '저'),
+('缊', '온'),
+('缐', '선'),
+('缶', '부'),
+('缷', '사'),
+('缸', '항'),
+('缺', '결'),
+('缾', '병'),
+('缿', '항'),
+('罃', '앵'),
+('罄', '경'),
+('罅', '하'),
+('罇', '준'),
+('罋', '옹'),
+('罌', '앵'),
+('罍', '뢰'),
+('罎', '담'),
+('罐', '관'),
+('罔', '망'),
+('罕', '한'),
+('罖', '라'),
+('罘', '부'),
+('罝', '저'),
+('罟', '고'),
+('罠', '민'),
+('罡', '강'),
+('罣', '괘'),
+('罦', '부'),
+('罨', '엄'),
+('罪', '죄'),
+('罫', '괘'),
+('罫', '홰'),
+('置', '치'),
+('罰', '벌'),
+('署', '서'),
+('罵', '매'),
+('罷', '파'),
+('罷', '피'),
+('罸', '벌'),
+('罹', '리'),
+('罹', '이'),
+('罼', '필'),
+('罽', '계'),
+('罾', '증'),
+('羂', '견'),
+('羅', '나'),
+('羅', '라'),
+('羆', '비'),
+('羇', '기'),
+('羈', '기'),
+('羊', '양'),
+('羋', '미'),
+('羌', '강'),
+('美', '미'),
+('羔', '고'),
+('羖', '고'),
+('羗', '강'),
+('羘', '장'),
+('羚', '령'),
+('羜', '저'),
+('羝', '저'),
+('羞', '수'),
+('羡', '선'),
+('羡', '연'),
+('羣', '군'),
+('群', '군'),
+('羨', '선'),
+('羨', '연'),
+('義', '의'),
+('羫', '강'),
+('羯', '갈'),
+('羲', '희'),
+('羶', '전'),
+('羸', '리'),
+('羸', '이'),
+('羹', '갱'),
+('羽', '깃'),
+('羽', '우'),
+('羽', '호'),
+('羿', '예'),
+('翁', '옹'),
+('翅', '시'),
+('翊', '익'),
+('翌', '익'),
+('翎', '령'),
+('翏', '료'),
+('習', '습'),
+('翔', '날'),
+('翔', '상'),
+('翕', '흡'),
+('翖', '흡'),
+('翚', '휘'),
+('翛', '소'),
+('翟', '적'),
+('翟', '책'),
+('翠', '취'),
+('翡', '비'),
+('翣', '삽'),
+('翤', '시'),
+('翦', '전'),
+('翩', '편'),
+('翫', '완'),
+('翬', '휘'),
+('翮', '핵'),
+('翰', '한'),
+('翱', '고'),
+('翳', '예'),
+('翹', '교'),
+('翺', '고'),
+('翻', '번'),
+('翼', '익'),
+('翾', '현'),
+('耀', '요'),
+('老', '노'),
+('老', '로'),
+('考', '고'),
+('耄', '모'),
+('者', '놈'),
+('者', '자'),
+('耆', '기'),
+('耆', '치'),
+('耇', '구'),
+('耈', '구'),
+('耉', '구'),
+('耋', '질'),
+('而', '능'),
+('而', '이'),
+('耎', '연'),
+('耐', '내'),
+('耑', '단'),
+('耒', '뢰'),
+('耔', '자'),
+('耕', '경'),
+('耖', '초'),
+('耗', '모'),
+('耗', '줄'),
+('耘', '운'),
+('耙', '파'),
+('耞', '가'),
+('耡', '서'),
+('耤', '적'),
+('耦', '우'),
+('耨', '누'),
+('耬', '루'),
+('耭', '기'),
+('耰', '우'),
+('耳', '귀'),
+('耳', '이'),
+('耶', '야'),
+('耻', '치'),
+('耽', '탐'),
+('耿', '경'),
+('聀', '직'),
+('聃', '담'),
+('聆', '령'),
+('聊', '료'),
+('聒', '괄'),
+('聕', '호'),
+('聖', '성'),
+('聘', '빙'),
+('聚', '취'),
+('聞', '문'),
+('聫', '련'),
+('聬', '옹'),
+('聮', '련'),
+('聯', '련'),
+('聯', '연'),
+('聰', '총'),
+('聱', '오'),
+('聲', '성'),
+('聳', '용'),
+('聴', '청'),
+('聵', '외'),
+('聶', '섭'),
+('職', '직'),
+('聼', '청'),
+('聽', '청'),
+('聾', '롱'),
+('聿', '붓'),
+('聿', '율'),
+('肄', '이'),
+('肅', '숙'),
+('肆', '사'),
+('肇', '조'),
+('肉', '유'),
+('肉', '육'),
+('肋', '늑'),
+('肋', '륵'),
+('肌', '기'),
+('肓', '황'),
+('肖', '소'),
+('肖', '초'),
+('肘', '주'),
+('肙', '연'),
+('肚', '두'),
+('肛', '항'),
+('肝', '간'),
+('股', '고'),
+('肢', '지'),
+('肥', '비'),
+('肦', '반'),
+('肦', '분'),
+('肧', '배'),
+('肩', '견'),
+('肪', '방'),
+('肫', '순'),
+('肭', '눌'),
+('肯', '긍'),
+('肱', '굉'),
+('育', '육'),
+('肴', '효'),
+('肵', '기'),
+('肺', '패'),
+('肺', '폐'),
+('胃', '위'),
+('胄', '주'),
+('胆', '단'),
+('胆', '담'),
+('胊', '구'),
+('背', '등'),
+('背', '배'),
+('背', '패'),
+('胎', '태'),
+('胕', '부'),
+('胖', '반'),
+('胙', '조'),
+('胚', '배'),
+('胛', '갑'),
+('胞', '포'),
+('胠', '거'),
+('胡', '호'),
+('胤', '윤'),
+('胥', '서'),
+('胯', '고'),
+('胯', '과'),
+('胱', '광'),
+('胴', '동'),
+('胷', '흉'),
+('胸', '흉'),
+('胻', '행'),
+('胼', '변'),
+('能', '내'),
+('能', '능'),
+('胾', '자'),
+('脂', '지'),
+('脅', '협'),
+('脆', '취'),
+('脇', '협'),
+('脈', '맥'),
+('脉', '맥'),
+('脊', '척'),
+('脖', '발'),
+('脘', '완'),
+('脚', '각'),
+('脛', '경'),
+('脣', '순'),
+('脤', '신'),
+('脧', '죄'),
+('脩', '수'),
+('脫', '탈'),
+('脫', '태'),
+('脯', '포'),
+('脰', '두'),
+('脱', '탈'),
+('脱', '태'),
+('脳', '뇌'),
+('脵', '고'),
+('脹', '창'),
+('脺', '수'),
+('脾', '비'),
+('腁', '변'),
+('腆', '전'),
+('腊', '석'),
+('腋', '액'),
+('腎', '신'),
+('腐', '부'),
+('腑', '부'),
+('腒', '거'),
+('腓', '비'),
+('腔', '강'),
+('腕', '완'),
+('腕', '팔'),
+('腟', '질'),
+('腠', '주'),
+('腤', '암'),
+('腥', '성'),
+('腦', '뇌'),
+('腫', '종'),
+('腭', '악'),
+('腰', '요'),
+('腱', '건'),
+('腳', '각'),
+('腴', '유'),
+('腶', '단'),
+('腷', '픽'),
+('腸', '장'),
+('腹', '배'),
+('腹', '복'),
+('腺', '샘'),
+('腺', '선'),
+('腾', '등'),
+('腿', '퇴'),
+('膀', '방'),
+('膂', '려'),
+('膂', '여'),
+('膃', '올'),
+('膄', '수'),
+('膆', '소'),
+('膈', '격'),
+('膊', '박'),
+('膋', '료'),
+('膏', '고'),
+('膕', '괵'),
+('膘', '표'),
+('膚', '부'),
+('膜', '막'),
+('膜', '모'),
+('膝', '슬'),
+('膞', '전'),
+('膠', '교'),
+('膣', '질'),
+('膨', '팽'),
+('膩', '니'),
+('膰', '번'),
+('膳', '선'),
+('膴', '무'),
+('膵', '췌'),
+('膸', '수'),
+('膹', '분'),
+('膺', '응'),
+('膽', '담'),
+('膾', '회'),
+('膿', '농'),
+('臀', '둔'),
+('臂', '비'),
+('臂', '팔'),
+('臆', '억'),
+('臉', '검'),
+('臉', '뺨'),
+('臊', '조'),
+('臍', '제'),
+('臏', '빈'),
+('臑', '노'),
+('臓', '장'),
+('臘', '랍'),
+('臙', '연'),
+('臚', '려'),
+('臝', '라'),
+('臟', '장'),
+('臠', '련'),
+('臣', '신'),
+('臤', '간'),
+('臥', '와'),
+('臧', '장'),
+('臨', '림'),
+('臨', '임'),
+('自', '자'),
+('臬', '얼'),
+('臭', '취'),
+('至', '지'),
+('致', '치'),
+('臶', '천'),
+('臺', '대'),
+('臻', '진'),
+('臼', '구'),
+('臽', '함'),
+('臾', '유'),
+('臿', '삽'),
+('舀', '요'),
+('舁', '여'),
+('舂', '용'),
+('舃', '석'),
+('舄', '석'),
+('舅', '구'),
+('與', '여'),
+('與', '줄'),
+('興', '일'),
+('興', '흥'),
+('舊', '구'),
+('舊', '예'),
+('舌', '설'),
+('舌', '혀'),
+('舍', '사'),
+('舍', '집'),
+('舐', '지'),
+('舒', '서'),
+('舖', '포'),
+('舘', '관'),
+('舛', '천'),
+('舜', '순'),
+('舞', '무'),
+('舟', '주'),
+('舡', '강'),
+('舢', '산'),
+('航', '항'),
+('舫', '방'),
+('般', '반'),
+('舳', '축'),
+('舵', '키'),
+('舵', '타'),
+('舶', '박'),
+('舷', '현'),
+('舸', '가'),
+('船', '배'),
+('船', '선'),
+('舽', '방'),
+('艀', '부'),
+('艅', '여'),
+('艇', '정'),
+('艈', '류'),
+('艈', '유'),
+('艍', '거'),
+('艑', '편'),
+('艘', '소'),
+('艙', '창'),
+('艚', '조'),
+('艟', '동'),
+('艤', '의'),
+('艦', '함'),
+('艨', '몽'),
+('艪', '로'),
+('艫', '로'),
+('艮', '간'),
+('艮', '끌'),
+('艮', '은'),
+('艮', '흔'),
+('良', '량'),
+('良', '양'),
+('艱', '간'),
+('色', '빛'),
+('色', '색'),
+('艴', '불'),
+('艶', '염'),
+('艷', '염'),
+('艸', '초'),
+('艾', '쑥'),
+('艾', '애'),
+('艾', '예'),
+('芈', '미'),
+('芊', '천'),
+('芋', '우'),
+('芋', '클'),
+('芋', '후'),
+('芍', '작'),
+('芍', '적'),
+('芎', '궁'),
+('芒', '망'),
+('芔', '훼'),
+('芘', '비'),
+('芙', '부'),
+('芚', '둔'),
+('芝', '지'),
+('芟', '삼'),
+('芡', '검'),
+('芢', '인'),
+('芣', '부'),
+('芥', '개'),
+('芦', '호'),
+('芧', '서'),
+('芨', '급'),
+('芩', '금'),
+('芪', '기'),
+('芫', '원'),
+('芬', '분'),
+('芭', '파'),
+('芮', '예'),
+('芯', '심'),
+('芰', '기'),
+('花', '꽃'),
+('花', '화'),
+('芳', '방'),
+('芷', '지'),
+('芸', '예'),
+('芸', '운'),
+('芹', '근'),
+('芻', '추'),
+('芼', '모'),
+('芽', '아'),
+('芾', '비'),
+('芿', '잉'),
+('苅', '예'),
+('苑', '원'),
+('苒', '염'),
+('苓', '령'),
+('苔', '태'),
+('苕', '초'),
+('苗', '모'),
+('苗', '묘'),
+('苛', '가'),
+('苜', '목'),
+('苞', '포'),
+('苟', '구'),
+('苠', '민'),
+('苡', '이'),
+('苣', '거'),
+('若', '야'),
+('若', '약'),
+('苦', '고'),
+('苧', '저'),
+('苫', '점'),
+('苯', '분'),
+('英', '영'),
+('苳', '동'),
+('苴', '저'),
+('苸', '호'),
+('苹', '평'),
+('苺', '매'),
+('苻', '부'),
+('苽', '고'),
+('苾', '필'),
+('苿', '미'),
+('茀', '불'),
+('茁', '줄'),
+('茂', '무'),
+('范', '범'),
+('茄', '가'),
+('茅', '모'),
+('茈', '자'),
+('茉', '말'),
+('茗', '명'),
+('茛', '간'),
+('茝', '채'),
+('茣', '오'),
+('茨', '자'),
+('茪', '광'),
+('茫', '망'),
+('茬', '시'),
+('茯', '복'),
+('茱', '수'),
+('茲', '자'),
+('茳', '강'),
+('茴', '회'),
+('茵', '인'),
+('茶', '다'),
+('茶', '차'),
+('茸', '용'),
+('茹', '여'),
+('茼', '동'),
+('荀', '순'),
+('荃', '전'),
+('荅', '답'),
+('荆', '형'),
+('荇', '행'),
+('草', '초'),
+('草', '풀'),
+('荊', '형'),
+('荏', '임'),
+('荐', '건'),
+('荐', '천'),
+('荑', '이'),
+('荑', '제'),
+('荒', '강'),
+('荒', '황'),
+('荗', '술'),
+('荘', '장'),
+('荳', '두'),
+('荷', '멜'),
+('荷', '하'),
+('荻', '적'),
+('荽', '수'),
+('荿', '성'),
+('莅', '리'),
+('莉', '리'),
+('莊', '장'),
+('莎', '사'),
+('莒', '거'),
+('莓', '매'),
+('莖', '경'),
+('莘', '신'),
+('莚', '연'),
+('莛', '정'),
+('莝', '좌'),
+('莞', '관'),
+('莞', '완'),
+('莟', '함'),
+('莠', '유'),
+('莢', '협'),
+('莤', '천'),
+('莧', '현'),
+('莨', '랑'),
+('莩', '부'),
+('莩', '표'),
+('莪', '아'),
+('莫', '막'),
+('莫', '모'),
+('莱', '래'),
+('莻', '늦'),
+('莽', '망'),
+('莾', '망'),
+('莿', '자'),
+('菁', '청'),
+('菂', '적'),
+('菅', '관'),
+('菉', '록'),
+('菊', '국'),
+('菋', '미'),
+('菌', '균'),
+('菑', '치'),
+('菓', '과'),
+('菔', '무'),
+('菔', '복'),
+('菖', '창'),
+('菘', '숭'),
+('菜', '채'),
+('菟', '도'),
+('菠', '파'),
+('菡', '함'),
+('菩', '보'),
+('菫', '근'),
+('華', '화'),
+('菰', '고'),
+('菱', '릉'),
+('菲', '비'),
+('菴', '암'),
+('菶', '봉'),
+('菹', '저'),
+('菽', '수'),
+('菽', '숙'),
+('萃', '췌'),
+('萄', '도'),
+('萅', '춘'),
+('萆', '비'),
+('萇', '장'),
+('萊', '내'),
+('萊', '래'),
+('萋', '처'),
+('萌', '맹'),
+('萍', '평'),
+('萎', '위'),
+('萠', '맹'),
+('萩', '추'),
+('萬', '만'),
+('萱', '훤'),
+('萵', '와'),
+('萸', '유'),
+('萹', '편'),
+('萼', '악'),
+('落', '낙'),
+('落', '락'),
+('葆', '보'),
+('葉', '섭'),
+('葉', '엽'),
+('葉', '잎'),
+('葊', '암'),
+('葑', '풍'),
+('著', '저'),
+('著', '착'),
+('葚', '심'),
+('葛', '갈'),
+('葛', '칡'),
+('葡', '포'),
+('董', '동'),
+('葦', '위'),
+('葩', '파'),
+('葪', '계'),
+('葫', '호'),
+('葬', '장'),
+('葭', '가'),
+('葯', '악'),
+('葯', '약'),
+('葱', '총'),
+('葳', '위'),
+('葵', '규'),
+('葷', '훈'),
+('葺', '즙'),
+('葻', '남'),
+('葻', '람'),
+('蒂', '체'),
+('蒋', '장'),
+('蒍', '위'),
+('蒐', '수'),
+('蒑', '은'),
+('蒔', '시'),
+('蒙', '몽'),
+('蒜', '산'),
+('蒞', '리'),
+('蒟', '구'),
+('蒡', '방'),
+('蒦', '확'),
+('蒨', '천'),
+('蒭', '추'),
+('蒯', '괴'),
+('蒲', '포'),
+('蒴', '삭'),
+('蒸', '증'),
+('蒸', '찔'),
+('蒹', '겸'),
+('蒺', '질'),
+('蒻', '약'),
+('蒼', '창'),
+('蒿', '쑥'),
+('蒿', '호'),
+('蓀', '소'),
+('蓁', '진'),
+('蓂', '명'),
+('蓄', '축'),
+('蓆', '석'),
+('蓉', '용'),
+('蓊', '옹'),
+('蓋', '개'),
+('蓋', '합'),
+('蓍', '시'),
+('蓐', '욕'),
+('蓑', '사'),
+('蓓', '배'),
+('蓖', '비'),
+('蓚', '수'),
+('蓚', '조'),
+('蓬', '봉'),
+('蓬', '쑥'),
+('蓭', '암'),
+('蓮', '련'),
+('蓮', '연'),
+('蓯', '총'),
+('蓱', '평'),
+('蓴', '순'),
+('蓺', '예'),
+('蓼', '료'),
+('蓼', '요'),
+('蓽', '필'),
+('蓿', '숙'),
+('蔀', '부'),
+('蔆', '릉'),
+('蔑', '멸'),
+('蔓', '만'),
+('蔔', '복'),
+('蔕', '체'),
+('蔗', '자'),
+('蔘', '삼'),
+('蔚', '울'),
+('蔚', '위'),
+('蔞', '루'),
+('蔟', '족'),
+('蔟', '주'),
+('蔡', '살'),
+('蔡', '채'),
+('蔣', '장'),
+('蔥', '총'),
+('蔦', '조'),
+('蔪', '점'),
+('蔬', '소'),
+('蔭', '음'),
+('蔯', '진'),
+('蔲', '구'),
+('蔵', '장'),
+('蔽', '폐'),
+('蔿', '위'),
+('蕁', '담'),
+('蕂', '승'),
+('蕃', '번'),
+('蕆', '천'),
+('蕉', '초'),
+('蕊', '예'),
+('蕊', '전'),
+('蕋', '예'),
+('蕋', '전'),
+('蕎', '교'),
+('蕓', '운'),
+('蕕', '유'),
+('蕖', '거'),
+('蕘', '요'),
+('蕙', '혜'),
+('蕞', '체'),
+('蕡', '분'),
+('蕣', '순'),
+('蕤', '유'),
+('蕨', '궐'),
+('蕩', '탕'),
+('蕪', '무'),
+('蕫', '동'),
+('蕭', '소'),
+('蕰', '온'),
+('蕺', '즙'),
+('蕾', '뢰'),
+('薀', '온'),
+('薄', '박'),
+('薆', '애'),
+('薇', '미'),
+('薉', '예'),
+('薊', '계'),
+('薌', '향'),
+('薏', '의'),
+('薑', '강'),
+('薔', '색'),
+('薔', '장'),
+('薗', '원'),
+('薙', '치'),
+('薛', '설'),
+('薜', '벽'),
+('薜', '폐'),
+('薝', '담'),
+('薤', '해'),
+('薥', '촉'),
+('薦', '천'),
+('薨', '횡'),
+('薨', '훙'),
+('薩', '살'),
+('薪', '신'),
+('薫', '훈'),
+('薬', '약'),
+('薯', '서'),
+('薰', '훈'),
+('薺', '제'),
+('藁', '고'),
+('藇', '마'),
+('藇', '서'),
+('藇', '여'),
+('藉', '자'),
+('藉', '적'),
+('藍', '감'),
+('藍', '람'),
+('藍', '볼'),
+('藍', '쪽'),
+('藎', '신'),
+('藏', '장'),
+('藐', '막'),
+('藐', '묘'),
+('藕', '우'),
+('藜', '려'),
+('藜', '여'),
+('藝', '예'),
+('藤', '등'),
+('藥', '약'),
+('藩', '번'),
+('藪', '수'),
+('藴', '온'),
+('藷', '저'),
+('藹', '애'),
+('藺', '린'),
+('藻', '조'),
+('藽', '친'),
+('藿', '곽'),
+('蘀', '탁'),
+('蘁', '악'),
+('蘁', '오'),
+('蘂', '예'),
+('蘂', '전'),
+('蘃', '예'),
+('蘄', '기'),
+('蘆', '로'),
+('蘆', '여'),
+('蘇', '소'),
+('蘊', '온'),
+('蘋', '빈'),
+('蘖', '얼'),
+('蘗', '벽'),
+('蘘', '양'),
+('蘚', '선'),
+('蘢', '롱'),
+('蘧', '거'),
+('蘩', '번'),
+('蘭', '난'),
+('蘭', '란'),
+('蘯', '탕'),
+('蘼', '미'),
+('蘿', '라'),
+('虀', '제'),
+('虁', '기'),
+('虄', '산'),
+('虄', '살'),
+('虍', '호'),
+('虎', '범'),
+('虎', '호'),
+('虐', '학'),
+('虓', '효'),
+('虔', '건'),
+('處', '처'),
+('虖', '호'),
+('虚', '허'),
+('虛', '허'),
+('虜', '노'),
+('虜', '로'),
+('虞', '우'),
+('號', '호'),
+('虧', '휴'),
+('虫', '충'),
+('虫', '훼'),
+('虬', '규'),
+('虯', '규'),
+('虱', '슬'),
+('虹', '강'),
+('虹', '공'),
+('虹', '홍'),
+('虺', '훼'),
+('虻', '멍'),
+('虽', '수'),
+('蚇', '척'),
+('蚊', '문'),
+('蚋', '예'),
+('蚌', '방'),
+('蚍', '비'),
+('蚓', '인'),
+('蚕', '잠'),
+('蚕', '천'),
+('蚝', '자'),
+('蚣', '공'),
+('蚤', '조'),
+('蚨', '부'),
+('蚩', '치'),
+('蚪', '두'),
+('蚯', '구'),
+('蚰', '유'),
+('蚱', '책'),
+('蚴', '유'),
+('蛀', '주'),
+('蛅', '점'),
+('蛆', '저'),
+('蛇', '뱀'),
+('蛇', '사'),
+('蛇', '이'),
+('蛉', '령'),
+('蛋', '단'),
+('蛍', '형'),
+('蛐', '곡'),
+('蛔', '회'),
+('蛙', '와'),
+('蛙', '왜'),
+('蛛', '주'),
+('蛞', '활'),
+('蛟', '교'),
+('蛣', '길'),
+('蛤', '합'),
+('蛩', '공'),
+('蛬', '공'),
+('蛭', '질'),
+('蛮', '만'),
+('蛸', '소'),
+('蛹', '용'),
+('蛻', '세'),
+('蛾', '아'),
+('蜀', '촉'),
+('蜂', '벌'),
+('蜂', '봉'),
+('蜃', '신'),
+('蜆', '현'),
+('蜈', '오'),
+('蜉', '부'),
+('蜊', '리'),
+('蜋', '랑'),
+('蜑', '단'),
+('蜕', '세'),
+('蜖', '회'),
+('蜘', '지'),
+('蜚', '비'),
+('蜜', '꿀'),
+('蜜', '밀'),
+('蜝', '기'),
+('蜡', '사'),
+('蜥', '석'),
+('蜨', '접'),
+('蜩', '조'),
+('蜴', '척'),
+('蜵', '연'),
+('蜷', '권'),
+('蜺', '예'),
+('蜻', '청'),
+('蜾', '과'),
+('蜿', '원'),
+('蝀', '동'),
+('蝉', '선'),
+('蝋', '랍'),
+('蝌', '과'),
+('蝎', '갈'),
+('蝓', '유'),
+('蝕', '식'),
+('蝗', '황'),
+('蝘', '언'),
+('蝙', '편'),
+('蝝', '연'),
+('蝟', '위'),
+('蝠', '복'),
+('蝤', '유'),
+('蝥', '모'),
+('蝦', '하'),
+('蝨', '슬'),
+('蝮', '복'),
+('蝴', '후'),
+('蝶', '접'),
+('蝸', '와'),
+('螂', '랑'),
+('螃', '방'),
+('螈', '원'),
+('螉', '옹'),
+('螌', '반'),
+('融', '융'),
+('螗', '당'),
+('螘', '의'),
+('螞', '마'),
+('螟', '명'),
+('螢', '형'),
+('螣', '등'),
+('螦', '소'),
+('螭', '리'),
+('螭', '치'),
+('螳', '당'),
+('螴', '진'),
+('螺', '나'),
+('螺', '라'),
+('螺', '레'),
+('螻', '루'),
+('螽', '종'),
+('螾', '인'),
+('蟀', '솔'),
+('蟄', '칩'),
+('蟇', '마'),
+('蟊', '모'),
+('蟋', '실'),
+('蟒', '망'),
+('蟖', '사'),
+('蟚', '팽'),
+('蟛', '팽'),
+('蟠', '반'),
+('蟣', '기'),
+('蟥', '황'),
+('蟬', '선'),
+('蟯', '요'),
+('蟲', '충'),
+('蟷', '당'),
+('蟹', '게'),
+('蟹', '해'),
+('蟻', '의'),
+('蟾', '섬'),
+('蠁', '향'),
+('蠃', '라'),
+('蠅', '승'),
+('蠍', '갈'),
+('蠑', '영'),
+('蠔', '호'),
+('蠖', '확'),
+('蠟', '납'),
+('蠟', '랍'),
+('蠟', '밀'),
+('蠡', '려'),
+('蠢', '준'),
+('蠣', '려'),
+('蠱', '고'),
+('蠲', '견'),
+('蠶', '잠'),
+('蠹', '두'),
+('蠻', '만'),
+('血', '피'),
+('血', '혈'),
+('衄', '뉵'),
+('衅', '흔'),
+('衆', '중'),
+('衊', '멸'),
+('行', '항'),
+('行', '행'),
+('衍', '연'),
+('衎', '간'),
+('衏', '원'),
+('衒', '현'),
+('術', '술'),
+('街', '가'),
+('衘', '함'),
+('衙', '아'),
+('衛', '위'),
+('衝', '충'),
+('衞', '위'),
+('衟', '길'),
+('衟', '도'),
+('衠', '순'),
+('衠', '참'),
+('衡', '형'),
+('衡', '횡'),
+('衢', '구'),
+('衣', '옷'),
+('衣', '의'),
+('表', '겉'),
+('表', '표'),
+('衫', '삼'),
+('衮', '곤'),
+('衰', '쇠'),
+('衰', '최'),
+('衲', '납'),
+('衷', '충'),
+('衽', '임'),
+('衾', '금'),
+('衿', '금'),
+('袁', '원'),
+('袂', '몌'),
+('袆', '위'),
+('袈', '가'),
+('袋', '대'),
+('袍', '포'),
+('袒', '단'),
+('袒', '탄'),
+('袖', '수'),
+('袗', '진'),
+('袛', '저'),
+('袝', '부'),
+('袞', '곤'),
+('袟', '질'),
+('袢', '번'),
+('袤', '무'),
+('袪', '거'),
+('被', '피'),
+('袱', '복'),
+('袳', '치'),
+('袴', '고'),
+('袴', '과'),
+('袷', '겹'),
+('裀', '인'),
+('裁', '재'),
+('裂', '렬'),
+('裂', '열'),
+('装', '장'),
+('裊', '뇨'),
+('裍', '곤'),
+('裎', '정'),
+('裏', '리'),
+('裏', '속'),
+('裏', '이'),
+('裒', '부'),
+('裔', '예'),
+('裕', '유'),
+('裘', '구'),
+('裙', '군'),
+('補', '보'),
+('裝', '장'),
+('裟', '사'),
+('裡', '리'),
+('裡', '속'),
+('裡', '이'),
+('裨', '비'),
+('裯', '주'),
+('裱', '표'),
+('裳', '상'),
+('裴', '배'),
+('裵', '배'),
+('裵', '베'),
+('裵', '비'),
+('裵', '성'),
+('裸', '라'),
+('裸', '야'),
+('裹', '과'),
+('製', '제'),
+('裾', '거'),
+('褄', '처'),
+('複', '복'),
+('複', '부'),
+('褊', '편'),
+('褌', '곤'),
+('褐', '갈'),
+('褒', '포'),
+('褓', '보'),
+('褕', '유'),
+('褘', '위'),
+('褙', '배'),
+('褙', '베'),
+('褚', '저'),
+('褥', '요'),
+('褥', '욕'),
+('褧', '경'),
+('褪', '퇴'),
+('褫', '치'),
+('褰', '건'),
+('褱', '회'),
+('褲', '고'),
+('褲', '과'),
+('褶', '습'),
+('褶', '첩'),
+('褸', '루'),
+('褺', '첩'),
+('褻', '설'),
+('襁', '강'),
+('襄', '양'),
+('襍', '잡'),
+('襖', '오'),
+('襘', '괴'),
+('襜', '첨'),
+('襞', '벽'),
+('襟', '금'),
+('襠', '당'),
+('襢', '단'),
+('襣', '비'),
+('襤', '람'),
+('襦', '유'),
+('襪', '말'),
+('襭', '힐'),
+('襯', '친'),
+('襲', '습'),
+('襴', '난'),
+('襴', '란'),
+('襻', '반'),
+('西', '서'),
+('要', '요'),
+('覃', '담'),
+('覆', '복'),
+('覆', '부'),
+('覇', '백'),
+('覇', '패'),
+('覈', '핵'),
+('覉', '기'),
+('見', '견'),
+('見', '볼'),
+('見', '현'),
+('覌', '관'),
+('規', '규'),
+('規', '법'),
+('覓', '멱'),
+('視', '볼'),
+('視', '시'),
+('覗', '사'),
+('覘', '점'),
+('覚', '각'),
+('覚', '교'),
+('覡', '격'),
+('覧', '람'),
+('覨', '악'),
+('覩', '도'),
+('親', '친'),
+('覬', '기'),
+('覯', '구'),
+('覲', '근'),
+('観', '관'),
+('覷', '처'),
+('覺', '각'),
+('覺', '교'),
+('覺', '깰'),
+('覽', '남'),
+('覽', '람'),
+('覽', '볼'),
+('覿', '볼'),
+('覿', '적'),
+('觀', '관'),
+('觀', '볼'),
+('角', '각'),
+('角', '녹'),
+('角', '록'),
+('角', '뿔'),
+('觔', '근'),
+('觖', '결'),
+('觚', '고'),
+('觜', '자'),
+('觜', '취'),
+('觝', '저'),
+('解', '개'),
+('解', '해'),
+('觥', '굉'),
+('触', '촉'),
+('觫', '속'),
+('觱', '필'),
+('觳', '곡'),
+('觴', '상'),
+('觶', '치'),
+('觸', '촉'),
+('言', '언'),
+('言', '은'),
+('訂', '정'),
+('訃', '부'),
+('訇', '굉'),
+('計', '계'),
+('計', '셀'),
+('訉', '범'),
+('訊', '신'),
+('訌', '홍'),
+('討', '칠'),
+('討', '토'),
+('訏', '우'),
+('訐', '알'),
+('訑', '이'),
+('訒', '인'),
+('訓', '훈'),
+('訔', '은'),
+('訕', '산'),
+('訖', '흘'),
+('託', '탁'),
+('記', '기'),
+('訚', '은'),
+('訛', '와'),
+('訝', '아'),
+('訟', '송'),
+('訢', '흔'),
+('訣', '결'),
+('訥', '눌'),
+('訪', '방'),
+('設', '설'),
+('許', '허'),
+('許', '호'),
+('訳', '역'),
+('訴', '소'),
+('訶', '가'),
+('診', '진'),
+('註', '주'),
+('証', '정'),
+('訾', '자'),
+('詁', '고'),
+('詆', '저'),
+('詋', '주'),
+('詎', '거'),
+('詐', '사'),
+('詑', '이'),
+('詒', '이'),
+('詒', '태'),
+('詔', '조'),
+('評', '평'),
+('詖', '피'),
+('詗', '형'),
+('詘', '굴'),
+('詛', '저'),
+('詞', '말'),
+('詞', '사'),
+('詠', '영'),
+('詡', '허'),
+('詡', '후'),
+('詢', '순'),
+('詣', '예'),
+('試', '시'),
+('詩', '시'),
+('詫', '타'),
+('詬', '구'),
+('詭', '궤'),
+('詮', '전'),
+('詰', '힐'),
+('話', '화'),
+('該', '해'),
+('詳', '상'),
+('詳', '양'),
+('詵', '선'),
+('詹', '첨'),
+('詻', '각'),
+('詼', '회'),
+('詿', '괘'),
+('誂', '조'),
+('誄', '뢰'),
+('誅', '주'),
+('誆', '광'),
+('誇', '과'),
+('誉', '예'),
+('誌', '지'),
+('認', '알'),
+('認', '인'),
+('誑', '광'),
+('誒', '희'),
+('誓', '서'),
+('誕', '탄'),
+('誘', '유'),
+('誚', '초'),
+('語', '어'),
+('誠', '성'),
+('誡', '계'),
+('誢', '현'),
+('誣', '무'),
+('誤', '오'),
+('誥', '고'),
+('誦', '송'),
+('誧', '포'),
+('誨', '회'),
+('說', '설'),
+('說', '세'),
+('說', '열'),
+('説', '설'),
+('説', '세'),
+('説', '열'),
+('読', '독'),
+('読', '두'),
+('誰', '수'),
+('課', '과'),
+('誶', '쇄'),
+('誶', '수'),
+('誶', '신'),
+('誶', '줄'),
+('誹', '비'),
+('誼', '의'),
+('誾', '은'),
+('調', '조'),
+('調', '주'),
+('諂', '첨'),
+('諄', '순'),
+('談', '담'),
+('諉', '위'),
+('請', '청'),
+('諍', '쟁'),
+('諏', '추'),
+('諑', '착'),
+('諒', '량'),
+('諒', '양'),
+('論', '논'),
+('論', '론'),
+('論', '윤'),
+('諗', '심'),
+('諛', '유'),
+('諜', '첩'),
+('諝', '서'),
+('諞', '편'),
+('諟', '시'),
+('諠', '훤'),
+('諡', '시'),
+('諢', '원'),
+('諤', '악'),
+('諦', '체'),
+('諧', '해'),
+('諪', '정'),
+('諫', '간'),
+('諭', '유'),
+('諮', '자'),
+('諰', '시'),
+('諱', '휘'),
+('諳', '암'),
+('諴', '함'),
+('諶', '심'),
+('諷', '풍'),
+('諸', '저'),
+('諸', '제'),
+('諺', '안'),
+('諺', '언'),
+('諼', '훤'),
+('諾', '낙'),
+('諾', '락'),
+('謀', '모'),
+('謁', '알'),
+('謂', '위'),
+('謄', '등'),
+('謇', '건'),
+('謊', '황'),
+('謌', '가'),
+('謎', '미'),
+('謐', '밀'),
+('謑', '혜'),
+('謔', '학'),
+('謖', '소'),
+('謗', '방'),
+('謙', '겸'),
+('謚', '익'),
+('講', '강'),
+('謜', '원'),
+('謝', '사'),
+('謠', '요'),
+('謣', '우'),
+('謦', '경'),
+('謨', '모'),
+('謫', '적'),
+('謬', '류'),
+('謬', '므'),
+('謬', '유'),
+('謭', '전'),
+('謳', '구'),
+('謷', '오'),
+('謹', '근'),
+('謾', '만'),
+('譁', '화'),
+('譃', '후'),
+('譈', '대'),
+('證', '증'),
+('譌', '와'),
+('譎', '휼'),
+('譏', '기'),
+('譔', '선'),
+('譖', '참'),
+('識', '식'),
+('識', '알'),
+('識', '지'),
+('譙', '초'),
+('譚', '담'),
+('譜', '보'),
+('譟', '조'),
+('警', '경'),
+('譫', '섬'),
+('譬', '비'),
+('譯', '역'),
+('議', '의'),
+('譱', '선'),
+('譴', '견'),
+('護', '호'),
+('譽', '예'),
+('譿', '혜'),
+('讀', '독'),
+('讀', '두'),
+('讃', '찬'),
+('讉', '유'),
+('變', '변'),
+('讌', '연'),
+('讎', '수'),
+('讏', '위'),
+('讐', '수'),
+('讒', '참'),
+('讓', '양'),
+('讖', '참'),
+('讙', '환'),
+('讙', '훤'),
+('讚', '찬'),
+('讜', '당'),
+('讞', '언'),
+('讬', '탁'),
+('谞', '서'),
+('谷', '곡'),
+('谷', '골'),
+('谷', '녹'),
+('谷', '록'),
+('谷', '욕'),
+('谿', '계'),
+('豁', '활'),
+('豆', '두'),
+('豆', '콩'),
+('豇', '강'),
+('豈', '개'),
+('豈', '기'),
+('豉', '시'),
+('豊', '례'),
+('豊', '풍'),
+('豌', '완'),
+('豎', '수'),
+('豐', '풍'),
+('豕', '시'),
+('豖', '축'),
+('豚', '돈'),
+('象', '상'),
+('豢', '환'),
+('豣', '견'),
+('豣', '연'),
+('豨', '희'),
+('豪', '호'),
+('豫', '예'),
+('豬', '저'),
+('豭', '가'),
+('豳', '빈'),
+('豸', '치'),
+('豹', '표'),
+('豺', '시'),
+('貂', '초'),
+('貃', '맥'),
+('貅', '휴'),
+('貇', '간'),
+('貊', '맥'),
+('貌', '막'),
+('貌', '모'),
+('貍', '리'),
+('貒', '단'),
+('貓', '묘'),
+('貔', '비'),
+('貘', '맥'),
+('貙', '추'),
+('貝', '패'),
+('貞', '정'),
+('負', '부'),
+('負', '질'),
+('財', '재'),
+('貢', '공'),
+('貧', '빈'),
+('貨', '화'),
+('販', '판'),
+('貪', '탐'),
+('貫', '관'),
+('貫', '꿸'),
+('責', '빚'),
+('責', '채'),
+('責', '책'),
+('貭', '질'),
+('貯', '저'),
+('貰', '세'),
+('貲', '자'),
+('貳', '이'),
+('貴', '귀'),
+('貶', '폄'),
+('買', '매'),
+('買', '살'),
+('貸', '대'),
+('貸', '특'),
+('貺', '황'),
+('費', '비'),
+('費', '쓸'),
+('貼', '첩'),
+('貽', '이'),
+('貿', '무'),
+('賀', '하'),
+('賁', '분'),
+('賁', '비'),
+('賁', '클'),
+('賂', '뇌'),
+('賂', '로'),
+('賂', '뢰'),
+('賃', '임'),
+('賄', '회'),
+('賆', '변'),
+('資', '자'),
+('賈', '가'),
+('賈', '고'),
+('賊', '적'),
+('賏', '영'),
+('賑', '진'),
+('賓', '빈'),
+('賓', '손'),
+('賔', '빈'),
+('賙', '주'),
+('賚', '뢰'),
+('賛', '찬'),
+('賜', '사'),
+('賞', '상'),
+('賠', '배'),
+('賡', '갱'),
+('賢', '현'),
+('賣', '매'),
+('賣', '팔'),
+('賤', '천'),
+('賦', '부'),
+('質', '지'),
+('質', '질'),
+('賬', '장'),
+('賭', '도'),
+('賴', '뇌'),
+('賴', '뢰'),
+('賵', '봉'),
+('賻', '부'),
+('購', '구'),
+('賽', '새'),
+('賾', '색'),
+('贄', '지'),
+('贅', '췌'),
+('贇', '윤'),
+('贈', '증'),
+('贊', '찬'),
+('贋', '안'),
+('贍', '섬'),
+('贏', '영'),
+('贐', '신'),
+('贓', '장'),
+('贔', '비'),
+('贖', '속'),
+('贛', '감'),
+('贛', '공'),
+('贛', '장'),
+('贛', '줄'),
+('贜', '장'),
+('赒', '주'),
+('赟', '윤'),
+('赤', '적'),
+('赦', '사'),
+('赧', '난'),
+('赫', '혁'),
+('赭', '자'),
+('走', '주'),
+('赳', '규'),
+('赴', '갈'),
+('赴', '부'),
+('赶', '간'),
+('起', '기'),
+('趁', '전'),
+('趁', '진'),
+('超', '초'),
+('越', '월'),
+('越', '활'),
+('趎', '주'),
+('趐', '혈'),
+('趑', '자'),
+('趙', '조'),
+('趠', '초'),
+('趣', '축'),
+('趣', '취'),
+('趨', '촉'),
+('趨', '추'),
+('趫', '교'),
+('趲', '찬'),
+('足', '발'),
+('足', '족'),
+('足', '주'),
+('趵', '박'),
+('趵', '작'),
+('趺', '부'),
+('趼', '견'),
+('趾', '지'),
+('趿', '삽'),
+('跂', '기'),
+('跅', '탁'),
+('跆', '태'),
+('跋', '발'),
+('跌', '질'),
+('跎', '타'),
+('跏', '가'),
+('跑', '포'),
+('跕', '접'),
+('跖', '척'),
+('跗', '부'),
+('跚', '산'),
+('跛', '파'),
+('跛', '피'),
+('距', '거'),
+('跟', '근'),
+('跡', '적'),
+('跣', '선'),
+('跤', '교'),
+('跨', '과'),
+('跪', '궤'),
+('跫', '공'),
+('跬', '규'),
+('路', '길'),
+('路', '노'),
+('路', '로'),
+('跱', '치'),
+('跳', '도'),
+('跳', '뛸'),
+('跳', '조'),
+('践', '천'),
+('跼', '국'),
+('跽', '기'),
+('踆', '준'),
+('踈', '소'),
+('踉', '량'),
+('踏', '답'),
+('踐', '천'),
+('踔', '탁'),
+('踖', '적'),
+('踝', '과'),
+('踞', '거'),
+('踟', '지'),
+('踠', '원'),
+('踡', '권'),
+('踣', '복'),
+('踣', '부'),
+('踦', '기'),
+('踧', '척'),
+('踩', '채'),
+('踪', '종'),
+('踰', '유'),
+('踱', '탁'),
+('踴', '용'),
+('踵', '종'),
+('踶', '제'),
+('踹', '단'),
+('踽', '우'),
+('蹀', '접'),
+('蹁', '편'),
+('蹂', '유'),
+('蹄', '제'),
+('蹇', '건'),
+('蹈', '도'),
+('蹉', '차'),
+('蹊', '혜'),
+('蹋', '답'),
+('蹌', '창'),
+('蹏', '제'),
+('蹕', '필'),
+('蹙', '축'),
+('蹜', '축'),
+('蹟', '적'),
+('蹠', '척'),
+('蹢', '척'),
+('蹣', '만'),
+('蹤', '종'),
+('蹩', '별'),
+('蹭', '층'),
+('蹯', '번'),
+('蹰', '주'),
+('蹲', '준'),
+('蹴', '축'),
+('蹶', '궐'),
+('蹶', '궤'),
+('蹺', '교'),
+('蹻', '교'),
+('蹼', '복'),
+('躁', '조'),
+('躅', '촉'),
+('躇', '저'),
+('躇', '착'),
+('躉', '돈'),
+('躊', '주'),
+('躋', '제'),
+('躍', '뛸'),
+('躍', '약'),
+('躍', '적'),
+('躐', '렵'),
+('躑', '척'),
+('躒', '력'),
+('躓', '지'),
+('躔', '전'),
+('躙', '린'),
+('躚', '선'),
+('躞', '섭'),
+('躡', '섭'),
+('躧', '사'),
+('躩', '곽'),
+('躪', '린'),
+('躪', '인'),
+('身', '몸'),
+('身', '신'),
+('躬', '궁'),
+('躱', '타'),
+('躳', '궁'),
+('軀', '구'),
+('軀', '몸'),
+('軆', '체'),
+('車', '거'),
+('車', '차'),
+('軋', '알'),
+('軌', '궤'),
+('軍', '군'),
+('軏', '월'),
+('軒', '헌'),
+('軔', '인'),
+('軟', '연'),
+('転', '전'),
+('軨', '령'),
+('軫', '진'),
+('軸', '축'),
+('軹', '지'),
+('軺', '초'),
+('軻', '가'),
+('軼', '일'),
+('軽', '경'),
+('軾', '식'),
+('軿', '병'),
+('輀', '이'),
+('較', '각'),
+('較', '교'),
+('輅', '로'),
+('輅', '핵'),
+('輇', '전'),
+('輈', '주'),
+('載', '재'),
+('輒', '첩'),
+('輓', '만'),
+('輔', '보'),
+('輕', '경'),
+('輗', '예'),
+('輛', '량'),
+('輜', '치'),
+('輝', '휘'),
+('輞', '망'),
+('輟', '철'),
+('輦', '련'),
+('輦', '연'),
+('輧', '병'),
+('輨', '관'),
+('輩', '배'),
+('輪', '륜'),
+('輪', '윤'),
+('輮', '유'),
+('輯', '즙'),
+('輯', '집'),
+('輰', '양'),
+('輳', '주'),
+('輶', '유'),
+('輸', '수'),
+('輹', '복'),
+('輻', '복'),
+('輻', '폭'),
+('輾', '전'),
+('輿', '여'),
+('轀', '온'),
+('轂', '곡'),
+('轄', '할'),
+('轅', '원'),
+('轆', '록'),
+('轉', '전'),
+('轍', '철'),
+('轎', '교'),
+('轒', '분'),
+('轔', '린'),
+('轗', '검'),
+('轘', '환'),
+('轝', '여'),
+('轞', '함'),
+('轟', '굉'),
+('轡', '비'),
+('轢', '력'),
+('轢', '역'),
+('轢', '칠'),
+('轣', '력'),
+('轤', '로'),
+('辛', '신'),
+('辜', '고'),
+('辞', '사'),
+('辟', '벽'),
+('辟', '피'),
+('辢', '랄'),
+('辣', '날'),
+('辣', '랄'),
+('辦', '변'),
+('辦', '판'),
+('辨', '변'),
+('辨', '판'),
+('辨', '편'),
+('辭', '사'),
+('辮', '변'),
+('辯', '변'),
+('辰', '때'),
+('辰', '별'),
+('辰', '신'),
+('辰', '진'),
+('辱', '욕'),
+('農', '농'),
+('辵', '착'),
+('辷', '일'),
+('边', '변'),
+('辺', '변'),
+('辻', '십'),
+('辻', '즙'),
+('込', '입'),
+('辿', '천'),
+('迀', '간'),
+('迂', '오'),
+('迂', '우'),
+('迃', '오'),
+('迄', '흘'),
+('迅', '신'),
+('迋', '왕'),
+('迍', '둔'),
+('迎', '영'),
+('近', '근'),
+('迓', '아'),
+('返', '반'),
+('迕', '오'),
+('迢', '초'),
+('迤', '이'),
+('迤', '타'),
+('迥', '형'),
+('迦', '가'),
+('迨', '태'),
+('迩', '이'),
+('迪', '적'),
+('迫', '박'),
+('迬', '왕'),
+('迭', '질'),
+('迮', '책'),
+('述', '술'),
+('述', '펼'),
+('迲', '겁'),
+('迴', '회'),
+('迷', '미'),
+('迸', '병'),
+('迹', '적'),
+('迺', '내'),
+('追', '갈'),
+('追', '추'),
+('追', '퇴'),
+('退', '퇴'),
+('送', '송'),
+('适', '괄'),
+('逃', '도'),
+('逅', '후'),
+('逆', '역'),
+('逇', '지'),
+('逈', '형'),
+('逋', '포'),
+('逌', '유'),
+('逍', '소'),
+('透', '투'),
+('逐', '적'),
+('逐', '축'),
+('逑', '구'),
+('途', '길'),
+('途', '도'),
+('逕', '경'),
+('逖', '적'),
+('逗', '두'),
+('這', '언'),
+('這', '이'),
+('這', '저'),
+('通', '통'),
+('逝', '서'),
+('逞', '령'),
+('速', '속'),
+('造', '조'),
+('逡', '준'),
+('逢', '봉'),
+('連', '련'),
+('連', '연'),
+('逥', '회'),
+('逬', '병'),
+('逭', '환'),
+('逮', '체'),
+('逮', '태'),
+('逰', '유'),
+('週', '돌'),
+('週', '주'),
+('進', '신'),
+('進', '진'),
+('逴', '탁'),
+('逵', '규'),
+('逶', '위'),
+('逸', '일'),
+('逺', '원'),
+('逼', '핍'),
+('逾', '유'),
+('遁', '돈'),
+('遁', '둔'),
+('遂', '수'),
+('遄', '천'),
+('遅', '지'),
+('遇', '우'),
+('遉', '정'),
+('遊', '유'),
+('運', '운'),
+('遍', '편'),
+('過', '과'),
+('過', '화'),
+('遏', '알'),
+('遐', '하'),
+('遑', '황'),
+('遒', '주'),
+('道', '길'),
+('道', '도'),
+('達', '달'),
+('違', '위'),
+('遘', '구'),
+('遙', '요'),
+('遛', '류'),
+('遜', '손'),
+('遝', '답'),
+('遞', '체'),
+('遟', '지'),
+('遠', '멀'),
+('遠', '원'),
+('遡', '소'),
+('遣', '견'),
+('遤', '훵'),
+('遤', '휭'),
+('遨', '오'),
+('適', '적'),
+('適', '척'),
+('遬', '속'),
+('遭', '조'),
+('遮', '이'),
+('遮', '저'),
+('遮', '차'),
+('遯', '둔'),
+('遲', '지'),
+('遵', '준'),
+('遶', '요'),
+('遷', '천'),
+('選', '선'),
+('遹', '휼'),
+('遺', '유'),
+('遼', '료'),
+('遼', '요'),
+('遽', '거'),
+('避', '피'),
+('邀', '요'),
+('邁', '매'),
+('邂', '해'),
+('邃', '수'),
+('還', '선'),
+('還', '환'),
+('邅', '전'),
+('邇', '이'),
+('邈', '막'),
+('邊', '가'),
+('邊', '변'),
+('邌', '려'),
+('邏', '라'),
+('邐', '리'),
+('邑', '읍'),
+('邕', '옹'),
+('邗', '한'),
+('邙', '망'),
+('邛', '공'),
+('邠', '빈'),
+('邡', '방'),
+('邢', '형'),
+('那', '나'),
+('邦', '방'),
+('邨', '촌'),
+('邪', '사'),
+('邪', '야'),
+('邯', '한'),
+('邯', '함'),
+('邰', '태'),
+('邱', '구'),
+('邳', '비'),
+('邴', '병'),
+('邵', '소'),
+('邶', '패'),
+('邸', '저'),
+('邽', '규'),
+('邾', '주'),
+('郁', '욱'),
+('郃', '합'),
+('郄', '극'),
+('郅', '질'),
+('郊', '교'),
+('郊', '들'),
+('郎', '낭'),
+('郎', '랑'),
+('郜', '고'),
+('郝', '학'),
+('郞', '낭'),
+('郞', '랑'),
+('郟', '겹'),
+('郡', '군'),
+('郢', '영'),
+('郤', '극'),
+('部', '떼'),
+('部', '부'),
+('郪', '처'),
+('郫', '비'),
+('郭', '곽'),
+('郯', '담'),
+('郴', '침'),
+('郵', '우'),
+('郷', '향'),
+('都', '도'),
+('鄂', '악'),
+('鄉', '향'),
+('鄒', '추'),
+('鄔', '오'),
+('鄕', '향'),
+('鄙', '비'),
+('鄞', '은'),
+('鄢', '언'),
+('鄣', '장'),
+('鄧', '등'),
+('鄭', '정'),
+('鄰', '린'),
+('鄰', '인'),
+('鄱', '파'),
+('鄲', '단'),
+('鄴', '업'),
+('鄶', '회'),
+('鄺', '광'),
+('鄽', '전'),
+('酇', '찬'),
+('酈', '력'),
+('酉', '유'),
+('酊', '정'),
+('酋', '추'),
+('酌', '작'),
+('配', '배'),
+('配', '짝'),
+('酎', '주'),
+('酒', '술'),
+('酒', '주'),
+('酓', '염'),
+('酖', '탐'),
+('酗', '후'),
+('酢', '작'),
+('酢', '초'),
+('酣', '검'),
+('酤', '고'),
+('酥', '소'),
+('酦', '발'),
+('酩', '명'),
+('酪', '락'),
+('酬', '수'),
+('酱', '장'),
+('酲', '정'),
+('酴', '도'),
+('酵', '효'),
+('酶', '매'),
+('酷', '혹'),
+('酸', '산'),
+('酹', '뢰'),
+('醃', '엄'),
+('醇', '순'),
+('醉', '취'),
+('醋', '작'),
+('醋', '초'),
+('醍', '제'),
+('醐', '호'),
+('醒', '깰'),
+('醒', '성'),
+('醖', '온'),
+('醗', '발'),
+('醜', '추'),
+('醞', '온'),
+('醢', '해'),
+('醤', '장'),
+('醪', '료'),
+('醫', '의'),
+('醬', '장'),
+('醮', '초'),
+('醯', '혜'),
+('醱', '발'),
+('醲', '농'),
+('醴', '례'),
+('醵', '갹'),
+('醵', '거'),
+('釀', '양'),
+('釁', '흔'),
+('釃', '시'),
+('釅', '염'),
+('釆', '변'),
+('采', '채'),
+('釈', '석'),
+('釉', '유'),
+('釋', '석'),
+('里', '리'),
+('里', '이'),
+('重', '동'),
+('重', '중'),
+('野', '들'),
+('野', '야'),
+('量', '량'),
+('量', '양'),
+('釐', '내'),
+('釐', '래'),
+('釐', '리'),
+('釐', '이'),
+('釐', '희'),
+('金', '금'),
+('金', '김'),
+('金', '쇠'),
+('釔', '을'),
+('釕', '조'),
+('釗', '쇠'),
+('釘', '정'),
+('釜', '부'),
+('針', '침'),
+('釣', '조'),
+('釤', '삼'),
+('釦', '구'),
+('釧', '천'),
+('釩', '범'),
+('釪', '우'),
+('釭', '공'),
+('釰', '일'),
+('釵', '차'),
+('釵', '채'),
+('釹', '녀'),
+('釼', '인'),
+('釿', '근'),
+('鈀', '파'),
+('鈇', '부'),
+('鈉', '납'),
+('鈍', '둔'),
+('鈐', '검'),
+('鈐', '금'),
+('鈑', '판'),
+('鈒', '삽'),
+('鈔', '초'),
+('鈗', '윤'),
+('鈜', '횡'),
+('鈞', '균'),
+('鈟', '조'),
+('鈣', '개'),
+('鈦', '태'),
+('鈧', '항'),
+('鈮', '니'),
+('鈰', '시'),
+('鈴', '령'),
+('鈵', '병'),
+('鈷', '고'),
+('鈸', '발'),
+('鈹', '피'),
+('鈺', '옥'),
+('鈿', '전'),
+('鉀', '갑'),
+('鉁', '진'),
+('鉄', '철'),
+('鉅', '거'),
+('鉉', '현'),
+('鉋', '포'),
+('鉎', '생'),
+('鉏', '서'),
+('鉐', '석'),
+('鉑', '금'),
+('鉑', '박'),
+('鉑', '백'),
+('鉒', '주'),
+('鉕', '파'),
+('鉗', '겸'),
+('鉛', '연'),
+('鉞', '월'),
+('鉢', '발'),
+('鉤', '구'),
+('鉥', '술'),
+('鉦', '정'),
+('鉬', '목'),
+('鉱', '광'),
+('鉷', '홍'),
+('鉻', '락'),
+('鉼', '병'),
+('鉾', '모'),
+('銀', '은'),
+('銃', '총'),
+('銅', '동'),
+('銋', '임'),
+('銍', '질'),
+('銎', '공'),
+('銑', '선'),
+('銓', '전'),
+('銕', '철'),
+('銖', '수'),
+('銘', '명'),
+('銙', '과'),
+('銚', '조'),
+('銛', '섬'),
+('銜', '함'),
+('銠', '로'),
+('銣', '여'),
+('銦', '인'),
+('銫', '색'),
+('銭', '전'),
+('銳', '예'),
+('銳', '태'),
+('銶', '구'),
+('銷', '소'),
+('銹', '수'),
+('銻', '제'),
+('鋁', '려'),
+('鋅', '자'),
+('鋆', '윤'),
+('鋇', '패'),
+('鋈', '옥'),
+('鋌', '정'),
+('鋏', '협'),
+('鋑', '전'),
+('鋒', '봉'),
+('鋗', '현'),
+('鋟', '침'),
+('鋤', '서'),
+('鋥', '정'),
+('鋪', '포'),
+('鋭', '예'),
+('鋭', '태'),
+('鋯', '고'),
+('鋰', '리'),
+('鋲', '병'),
+('鋸', '거'),
+('鋹', '청'),
+('鋺', '원'),
+('鋼', '강'),
+('鋽', '조'),
+('錄', '녹'),
+('錄', '록'),
+('錄', '여'),
+('錆', '청'),
+('錏', '아'),
+('錐', '추'),
+('錕', '곤'),
+('錘', '추'),
+('錙', '치'),
+('錚', '쟁'),
+('錞', '대'),
+('錞', '순'),
+('錟', '담'),
+('錠', '정'),
+('錡', '기'),
+('錡', '의'),
+('錢', '돈'),
+('錢', '전'),
+('錣', '철'),
+('錤', '기'),
+('錦', '금'),
+('錧', '관'),
+('錨', '묘'),
+('錪', '전'),
+('錫', '석'),
+('錬', '동'),
+('錬', '련'),
+('錮', '고'),
+('錯', '조'),
+('錯', '착'),
+('録', '록'),
+('録', '여'),
+('錳', '맹'),
+('鍀', '득'),
+('鍈', '영'),
+('鍉', '시'),
+('鍊', '련'),
+('鍊', '연'),
+('鍋', '과'),
+('鍍', '도'),
+('鍏', '위'),
+('鍔', '악'),
+('鍗', '제'),
+('鍛', '단'),
+('鍜', '하'),
+('鍝', '우'),
+('鍠', '굉'),
+('鍤', '삽'),
+('鍪', '무'),
+('鍫', '초'),
+('鍬', '초'),
+('鍮', '유'),
+('鍮', '투'),
+('鍰', '환'),
+('鍵', '건'),
+('鍶', '송'),
+('鍺', '타'),
+('鍼', '감'),
+('鍼', '침'),
+('鍾', '종'),
+('鎂', '미'),
+('鎊', '방'),
+('鎌', '겸'),
+('鎌', '낫'),
+('鎏', '류'),
+('鎒', '호'),
+('鎔', '용'),
+('鎖', '쇄'),
+('鎗', '쟁'),
+('鎘', '력'),
+('鎚', '추'),
+('鎚', '퇴'),
+('鎛', '박'),
+('鎟', '상'),
+('鎠', '강'),
+('鎡', '자'),
+('鎣', '형'),
+('鎤', '황'),
+('鎧', '개'),
+('鎬', '호'),
+('鎭', '진'),
+('鎮', '진'),
+('鎰', '일'),
+('鎳', '얼'),
+('鎵', '가'),
+('鏀', '노'),
+('鏀', '로'),
+('鏁', '쇄'),
+('鏃', '족'),
+('鏃', '촉'),
+('鏇', '선'),
+('鏈', '련'),
+('鏊', '오'),
+('鏋', '만'),
+('鏌', '막'),
+('鏑', '적'),
+('鏖', '오'),
+('鏗', '갱'),
+('鏘', '장'),
+('鏜', '당'),
+('鏝', '만'),
+('鏞', '용'),
+('鏞', '종'),
+('鏟', '산'),
+('鏡', '경'),
+('鏢', '표'),
+('鏤', '루'),
+('鏦', '총'),
+('鏨', '참'),
+('鏶', '집'),
+('鏻', '린'),
+('鏽', '수'),
+('鐃', '뇨'),
+('鐄', '횡'),
+('鐏', '준'),
+('鐐', '료'),
+('鐓', '대'),
+('鐔', '심'),
+('鐘', '종'),
+('鐙', '등'),
+('鐚', '아'),
+('鐠', '보'),
+('鐥', '낫'),
+('鐥', '삼'),
+('鐥', '선'),
+('鐪', '로'),
+('鐫', '전'),
+('鐵', '쇠'),
+('鐵', '철'),
+('鐶', '환'),
+('鐸', '탁'),
+('鐺', '당'),
+('鑂', '훈'),
+('鑄', '주'),
+('鑊', '확'),
+('鑌', '빈'),
+('鑑', '감'),
+('鑒', '감'),
+('鑕', '질'),
+('鑛', '광'),
+('鑞', '납'),
+('鑞', '랍'),
+('鑠', '삭'),
+('鑢', '려'),
+('鑣', '표'),
+('鑩', '악'),
+('鑪', '로'),
+('鑫', '흠'),
+('鑭', '란'),
+('鑰', '약'),
+('鑱', '참'),
+('鑲', '양'),
+('鑵', '관'),
+('鑷', '섭'),
+('鑼', '라'),
+('鑽', '찬'),
+('鑾', '란'),
+('鑿', '조'),
+('鑿', '착'),
+('钀', '알'),
+('钁', '곽'),
+('钃', '촉'),
+('钑', '삽'),
+('锜', '기'),
+('锜', '의'),
+('锳', '영'),
+('锺', '종'),
+('锽', '굉'),
+('長', '길'),
+('長', '장'),
+('門', '문'),
+('閃', '섬'),
+('閄', '혹'),
+('閈', '한'),
+('閉', '별'),
+('閉', '폐'),
+('閊', '산'),
+('開', '개'),
+('開', '열'),
+('閎', '굉'),
+('閏', '륜'),
+('閏', '윤'),
+('閑', '한'),
+('閒', '간'),
+('閒', '한'),
+('間', '간'),
+('閔', '민'),
+('閗', '투'),
+('閘', '갑'),
+('閟', '비'),
+('閠', '윤'),
+('関', '관'),
+('関', '완'),
+('閣', '각'),
+('閣', '집'),
+('閤', '합'),
+('閥', '벌'),
+('閦', '축'),
+('閧', '홍'),
+('閨', '규'),
+('閩', '민'),
+('閪', '서'),
+('閫', '곤'),
+('閬', '랑'),
+('閭', '려'),
+('閱', '열'),
+('閲', '열'),
+('閶', '창'),
+('閶', '청'),
+('閹', '엄'),
+('閻', '염'),
+('閼', '안'),
+('閼', '알'),
+('閽', '혼'),
+('閾', '역'),
+('闃', '격'),
+('闆', '반'),
+('闇', '암'),
+('闈', '위'),
+('闉', '인'),
+('闊', '활'),
+('闋', '결'),
+('闌', '란'),
+('闍', '도'),
+('闏', '팽'),
+('闏', '풍'),
+('闒', '탑'),
+('闓', '개'),
+('闔', '합'),
+('闕', '궐'),
+('闖', '틈'),
+('闗', '관'),
+('闗', '완'),
+('闚', '규'),
+('關', '관'),
+('關', '완'),
+('闞', '함'),
+('闠', '궤'),
+('闡', '천'),
+('闢', '벽'),
+('闤', '환'),
+('闥', '달'),
+('阜', '부'),
+('阝', '부'),
+('阡', '천'),
+('阢', '올'),
+('阤', '치'),
+('阨', '애'),
+('阨', '액'),
+('阪', '판'),
+('阬', '갱'),
+('阮', '완'),
+('阮', '원'),
+('阯', '지'),
+('阱', '정'),
+('防', '방'),
+('阻', '조'),
+('阼', '조'),
+('阽', '점'),
+('阿', '아'),
+('阿', '옥'),
+('陀', '타'),
+('陂', '피'),
+('附', '부'),
+('陋', '루'),
+('陌', '맥'),
+('降', '강'),
+('降', '항'),
+('陏', '라'),
+('限', '한'),
+('陔', '해'),
+('陘', '형'),
+('陛', '폐'),
+('陜', '합'),
+('陜', '협'),
+('陝', '섬'),
+('陞', '승'),
+('陟', '척'),
+('陡', '두'),
+('院', '원'),
+('院', '집'),
+('陣', '진'),
+('除', '덜'),
+('除', '제'),
+('陥', '함'),
+('陪', '배'),
+('陬', '추'),
+('陰', '암'),
+('陰', '음'),
+('陲', '수'),
+('陳', '진'),
+('陴', '비'),
+('陵', '능'),
+('陵', '릉'),
+('陶', '도'),
+('陶', '요'),
+('陷', '함'),
+('陸', '륙'),
+('陸', '뭍'),
+('陸', '육'),
+('険', '험'),
+('陼', '저'),
+('陽', '볕'),
+('陽', '양'),
+('隄', '제'),
+('隅', '우'),
+('隆', '륭'),
+('隆', '융'),
+('隆', '클'),
+('隈', '외'),
+('隉', '얼'),
+('隊', '대'),
+('隊', '떼'),
+('隋', '수'),
+('隍', '황'),
+('階', '계'),
+('随', '수'),
+('隐', '은'),
+('隑', '기'),
+('隔', '격'),
+('隔', '경'),
+('隕', '운'),
+('隕', '원'),
+('隗', '아'),
+('隗', '외'),
+('隘', '애'),
+('隘', '액'),
+('隙', '극'),
+('隙', '틈'),
+('際', '가'),
+('際', '제'),
+('障', '장'),
+('隠', '은'),
+('隣', '린'),
+('隣', '인'),
+('隤', '퇴'),
+('隧', '수'),
+('隨', '수'),
+('隩', '오'),
+('險', '험'),
+('隬', '니'),
+('隬', '이'),
+('隮', '제'),
+('隰', '습'),
+('隱', '은'),
+('隳', '휴'),
+('隴', '롱'),
+('隶', '이'),
+('隷', '례'),
+('隸', '례'),
+('隸', '예'),
+('隸', '종'),
+('隹', '추'),
+('隺', '학'),
+('隻', '척'),
+('隼', '준'),
+('雀', '작'),
+('雁', '안'),
+('雄', '웅'),
+('雅', '아'),
+('集', '집'),
+('雇', '고'),
+('雇', '호'),
+('雉', '치'),
+('雋', '준'),
+('雌', '자'),
+('雍', '옹'),
+('雎', '저'),
+('雐', '호'),
+('雑', '잡'),
+('雒', '낙'),
+('雒', '락'),
+('雕', '조'),
+('雖', '수'),
+('雖', '유'),
+('雙', '쌍'),
+('雚', '관'),
+('雛', '추'),
+('雜', '잡'),
+('雝', '옹'),
+('雞', '계'),
+('雞', '닭'),
+('雟', '휴'),
+('離', '려'),
+('離', '리'),
+('離', '여'),
+('離', '이'),
+('離', '치'),
+('難', '나'),
+('難', '난'),
+('雧', '집'),
+('雨', '비'),
+('雨', '우'),
+('雩', '우'),
+('雪', '눈'),
+('雪', '설'),
+('雯', '문'),
+('雰', '분'),
+('雲', '운'),
+('零', '련'),
+('零', '령'),
+('零', '연'),
+('零', '영'),
+('雷', '뇌'),
+('雷', '뢰'),
+('雹', '박'),
+('雺', '몽'),
+('電', '전'),
+('需', '수'),
+('霄', '소'),
+('霅', '삽'),
+('霆', '정'),
+('震', '진'),
+('霈', '패'),
+('霉', '매'),
+('霌', '주'),
+('霍', '곽'),
+('霎', '삽'),
+('霏', '비'),
+('霑', '점'),
+('霓', '예'),
+('霔', '주'),
+('霖', '림'),
+('霙', '영'),
+('霜', '상'),
+('霝', '령'),
+('霝', '영'),
+('霞', '하'),
+('霣', '운'),
+('霦', '빈'),
+('霧', '무'),
+('霪', '음'),
+('霰', '산'),
+('霰', '선'),
+('霱', '휼'),
+('露', '노'),
+('露', '로'),
+('霸', '백'),
+('霸', '패'),
+('霹', '벽'),
+('霺', '미'),
+('霽', '제'),
+('霾', '매'),
+('靀', '몽'),
+('靂', '력'),
+('靂', '역'),
+('靄', '애'),
+('靆', '체'),
+('靈', '령'),
+('靈', '영'),
+('靉', '애'),
+('靌', '보'),
+('靏', '학'),
+('靑', '청'),
+('青', '청'),
+('靖', '정'),
+('靚', '정'),
+('靛', '전'),
+('靜', '정'),
+('靝', '천'),
+('非', '비'),
+('靠', '고'),
+('靡', '미'),
+('面', '낯'),
+('面', '면'),
+('靦', '전'),
+('靨', '염'),
+('靨', '엽'),
+('革', '극'),
+('革', '혁'),
+('靭', '인'),
+('靳', '근'),
+('靴', '화'),
+('靵', '뉴'),
+('靶', '파'),
+('靷', '인'),
+('靺', '말'),
+('靼', '달'),
+('鞀', '도'),
+('鞁', '피'),
+('鞄', '포'),
+('鞅', '앙'),
+('鞋', '혜'),
+('鞍', '안'),
+('鞏', '공'),
+('鞔', '만'),
+('鞘', '초'),
+('鞚', '공'),
+('鞞', '병'),
+('鞠', '국'),
+('鞣', '유'),
+('鞦', '추'),
+('鞨', '갈'),
+('鞫', '구'),
+('鞫', '국'),
+('鞬', '건'),
+('鞭', '편'),
+('鞮', '제'),
+('鞰', '온'),
+('鞱', '도'),
+('鞲', '구'),
+('鞳', '탑'),
+('鞴', '비'),
+('鞶', '반'),
+('鞸', '필'),
+('鞹', '곽'),
+('鞽', '교'),
+('鞾', '화'),
+('韁', '강'),
+('韃', '달'),
+('韆', '천'),
+('韉', '천'),
+('韋', '위'),
+('韍', '불'),
+('韎', '매'),
+('韐', '갑'),
+('韓', '한'),
+('韔', '창'),
+('韙', '위'),
+('韜', '도'),
+('韝', '구'),
+('韞', '온'),
+('韠', '필'),
+('韡', '위'),
+('韭', '구'),
+('韮', '구'),
+('韱', '섬'),
+('韲', '제'),
+('音', '음'),
+('韵', '운'),
+('韶', '소'),
+('韺', '영'),
+('韻', '운'),
+('響', '향'),
+('頀', '호'),
+('頁', '엽'),
+('頁', '혈'),
+('頂', '정'),
+('頃', '경'),
+('頃', '규'),
+('項', '항'),
+('順', '순'),
+('須', '수'),
+('頉', '이'),
+('頉', '탈'),
+('頊', '욱'),
+('頌', '송'),
+('頌', '용'),
+('頍', '규'),
+('頎', '기'),
+('頏', '항'),
+('預', '예'),
+('頑', '완'),
+('頒', '반'),
+('頒', '분'),
+('頓', '돈'),
+('頓', '둔'),
+('頖', '반'),
+('頗', '파'),
+('領', '령'),
+('領', '영'),
+('頚', '경'),
+('頞', '알'),
+('頡', '갈'),
+('頡', '힐'),
+('頣', '신'),
+('頤', '이'),
+('頦', '해'),
+('頫', '부'),
+('頬', '협'),
+('頭', '두'),
+('頮', '회'),
+('頰', '협'),
+('頲', '정'),
+('頷', '암'),
+('頸', '경'),
+('頸', '목'),
+('頹', '퇴'),
+('頻', '빈'),
+('頼', '뢰'),
+('頽', '퇴'),
+('頿', '자'),
+('顂', '뢰'),
+('顆', '과'),
+('顇', '취'),
+('顈', '경'),
+('顋', '뺨'),
+('顋', '새'),
+('顋', '시'),
+('題', '제'),
+('額', '액'),
+('顎', '악'),
+('顏', '안'),
+('顒', '옹'),
+('顓', '전'),
+('顔', '안'),
+('顕', '현'),
+('顖', '신'),
+('願', '원'),
+('顙', '상'),
+('顚', '전'),
+('顛', '전'),
+('類', '류'),
+('類', '유'),
+('顥', '호'),
+('顦', '초'),
+('顧', '고'),
+('顫', '전'),
+('顬', '유'),
+('顯', '현'),
+('顰', '빈'),
+('顱', '로'),
+('顳', '섭'),
+('顴', '관'),
+('風', '풍'),
+('颭', '점'),
+('颯', '삽'),
+('颱', '태'),
+('颲', '렬'),
+('颳', '괄'),
+('颶', '구'),
+('颺', '양'),
+('颻', '요'),
+('颼', '수'),
+('颿', '범'),
+('飂', '료'),
+('飃', '표'),
+('飄', '표'),
+('飆', '표'),
+('飇', '표'),
+('飉', '료'),
+('飋', '실'),
+('飛', '날'),
+('飛', '비'),
+('飜', '날'),
+('飜', '번'),
+('食', '밥'),
+('食', '사'),
+('食', '식'),
+('食', '이'),
+('飠', '밥'),
+('飠', '사'),
+('飠', '식'),
+('飡', '손'),
+('飢', '기'),
+('飣', '정'),
+('飦', '전'),
+('飧', '손'),
+('飩', '돈'),
+('飪', '임'),
+('飫', '어'),
+('飭', '칙'),
+('飮', '음'),
+('飯', '반'),
+('飯', '밥'),
+('飱', '손'),
+('飲', '음'),
+('飴', '시'),
+('飴', '이'),
+('飻', '철'),
+('飼', '사'),
+('飽', '포'),
+('飾', '식'),
+('餁', '임'),
+('餃', '교'),
+('餅', '떡'),
+('餅', '병'),
+('餈', '자'),
+('餉', '향'),
+('養', '양'),
+('餌', '이'),
+('餐', '손'),
+('餐', '찬'),
+('餒', '뇌'),
+('餓', '아'),
+('餔', '포'),
+('餕', '준'),
+('餗', '속'),
+('餘', '여'),
+('餚', '효'),
+('餛', '혼'),
+('餞', '전'),
+('餠', '떡'),
+('餠', '병'),
+('餡', '함'),
+('餦', '장'),
+('餧', '위'),
+('館', '관'),
+('餪', '난'),
+('餬', '호'),
+('餮', '철'),
+('餰', '전'),
+('餱', '후'),
+('餲', '애'),
+('餳', '당'),
+('餹', '당'),
+('餼', '희'),
+('餽', '궤'),
+('饁', '엽'),
+('饂', '온'),
+('饅', '만'),
+('饈', '수'),
+('饉', '근'),
+('饊', '잔'),
+('饋', '궤'),
+('饌', '찬'),
+('饍', '선'),
+('饐', '의'),
+('饑', '기'),
+('饒', '요'),
+('饔', '옹'),
+('饕', '도'),
+('饗', '향'),
+('饛', '몽'),
+('饜', '염'),
+('饞', '참'),
+('饟', '양'),
+('饤', '정'),
+('馓', '잔'),
+('首', '수'),
+('馗', '규'),
+('馘', '괵'),
+('香', '향'),
+('馝', '필'),
+('馣', '암'),
+('馥', '복'),
+('馨', '형'),
+('馬', '마'),
+('馬', '말'),
+('馬', '성'),
+('馭', '어'),
+('馮', '풍'),
+('馰', '적'),
+('馱', '타'),
+('馳', '치'),
+('馴', '순'),
+('馴', '훈'),
+('馹', '일'),
+('駁', '박'),
+('駄', '타'),
+('駅', '역'),
+('駆', '구'),
+('駈', '구'),
+('駉', '경'),
+('駎', '추'),
+('駏', '거'),
+('駐', '주'),
+('駑', '노'),
+('駒', '구'),
+('駕', '가'),
+('駘', '타'),
+('駙', '부'),
+('駛', '사'),
+('駜', '필'),
+('駝', '타'),
+('駞', '타'),
+('駟', '사'),
+('駢', '변'),
+('駢', '병'),
+('駨', '순'),
+('駪', '신'),
+('駭', '해'),
+('駮', '박'),
+('駱', '락'),
+('駸', '침'),
+('駻', '한'),
+('駽', '현'),
+('駿', '순'),
+('駿', '준'),
+('騁', '빙'),
+('騂', '성'),
+('騃', '애'),
+('騄', '녹'),
+('騄', '록'),
+('騅', '추'),
+('騈', '변'),
+('騈', '병'),
+('騋', '내'),
+('騋', '래'),
+('騍', '과'),
+('騎', '기'),
+('騏', '기'),
+('騑', '비'),
+('騒', '소'),
+('験', '험'),
+('騖', '무'),
+('騘', '총'),
+('騙', '편'),
+('騛', '비'),
+('騫', '건'),
+('騭', '즐'),
+('騰', '등'),
+('騳', '독'),
+('騵', '원'),
+('騶', '추'),
+('騷', '소'),
+('騸', '선'),
+('騾', '라'),
+('驀', '맥'),
+('驁', '오'),
+('驂', '참'),
+('驃', '표'),
+('驄', '총'),
+('驅', '구'),
+('驅', '몰'),
+('驊', '화'),
+('驌', '숙'),
+('驍', '효'),
+('驎', '린'),
+('驎', '인'),
+('驏', '잔'),
+('驒', '탄'),
+('驕', '교'),
+('驕', '효'),
+('驗', '험'),
+('驘', '나'),
+('驘', '라'),
+('驚', '경'),
+('驛', '역'),
+('驟', '취'),
+('驢', '려'),
+('驢', '여'),
+('驤', '양'),
+('驥', '기'),
+('驩', '환'),
+('驪', '려'),
+('驫', '표'),
+('驲', '일'),
+('骕', '숙'),
+('骨', '골'),
+('骨', '뼈'),
+('骪', '이'),
+('骫', '이'),
+('骯', '항'),
+('骰', '투'),
+('骶', '저'),
+('骶', '제'),
+('骷', '고'),
+('骸', '뼈'),
+('骸', '해'),
+('骼', '격'),
+('骾', '경'),
+('骿', '변'),
+('髀', '비'),
+('髀', '폐'),
+('髁', '과'),
+('髁', '화'),
+('髂', '가'),
+('髆', '박'),
+('髏', '누'),
+('髏', '루'),
+('髑', '촉'),
+('髒', '장'),
+('髓', '수'),
+('體', '몸'),
+('體', '체'),
+('髕', '빈'),
+('髖', '관'),
+('髗', '노'),
+('髗', '로'),
+('高', '고'),
+('髙', '고'),
+('髟', '표'),
+('髠', '곤'),
+('髡', '곤'),
+('髢', '체'),
+('髣', '방'),
+('髥', '염'),
+('髦', '모'),
+('髫', '초'),
+('髭', '자'),
+('髮', '발'),
+('髯', '염'),
+('髰', '체'),
+('髲', '피'),
+('髴', '불'),
+('髹', '휴'),
+('髺', '괄'),
+('髻', '계'),
+('髽', '좌'),
+('鬂', '빈'),
+('鬅', '불'),
+('鬆', '송'),
+('鬈', '권'),
+('鬊', '순'),
+('鬋', '전'),
+('鬍', '호'),
+('鬐', '기'),
+('鬒', '진'),
+('鬖', '삼'),
+('鬘', '만'),
+('鬙', '승'),
+('鬚', '수'),
+('鬟', '환'),
+('鬠', '괄'),
+('鬢', '빈'),
+('鬣', '렵'),
+('鬣', '엽'),
+('鬥', '투'),
+('鬧', '뇨'),
+('鬧', '료'),
+('鬨', '항'),
+('鬨', '홍'),
+('鬩', '혁'),
+('鬪', '투'),
+('鬮', '구'),
+('鬯', '청'),
+('鬰', '울'),
+('鬱', '울'),
+('鬲', '격'),
+('鬲', '력'),
+('鬴', '부'),
+('鬺', '상'),
+('鬼', '귀'),
+('魁', '괴'),
+('魂', '넋'),
+('魂', '혼'),
+('魃', '발'),
+('魄', '넋'),
+('魄', '백'),
+('魄', '탁'),
+('魅', '매'),
+('魈', '소'),
+('魋', '추'),
+('魍', '망'),
+('魎', '량'),
+('魏', '위'),
+('魑', '리'),
+('魔', '마'),
+('魘', '염'),
+('魚', '어'),
+('魛', '도'),
+('魜', '인'),
+('魦', '사'),
+('魯', '노'),
+('魯', '로'),
+('魴', '방'),
+('鮀', '타'),
+('鮃', '평'),
+('鮆', '제'),
+('鮎', '점'),
+('鮐', '태'),
+('鮑', '포'),
+('鮒', '부'),
+('鮓', '자'),
+('鮗', '동'),
+('鮚', '길'),
+('鮝', '상'),
+('鮞', '이'),
+('鮟', '안'),
+('鮠', '외'),
+('鮧', '이'),
+('鮧', '제'),
+('鮨', '지'),
+('鮪', '유'),
+('鮫', '교'),
+('鮭', '해'),
+('鮮', '선'),
+('鮹', '소'),
+('鯀', '곤'),
+('鯁', '경'),
+('鯆', '포'),
+('鯇', '혼'),
+('鯇', '환'),
+('鯈', '조'),
+('鯉', '리'),
+('鯊', '사'),
+('鯋', '사'),
+('鯔', '치'),
+('鯖', '청'),
+('鯛', '조'),
+('鯝', '고'),
+('鯡', '비'),
+('鯢', '예'),
+('鯤', '곤'),
+('鯧', '창'),
+('鯨', '경'),
+('鯪', '능'),
+('鯪', '릉'),
+('鯫', '추'),
+('鯷', '제'),
+('鯽', '적'),
+('鯽', '즉'),
+('鯿', '편'),
+('鰈', '접'),
+('鰈', '첩'),
+('鰉', '황'),
+('鰊', '련'),
+('鰋', '언'),
+('鰌', '추'),
+('鰍', '추'),
+('鰐', '악'),
+('鰒', '복'),
+('鰓', '새'),
+('鰓', '시'),
+('鰕', '하'),
+('鰣', '시'),
+('鰤', '사'),
+('鰥', '환'),
+('鰨', '탑'),
+('鰩', '요'),
+('鰫', '용'),
+('鰭', '기'),
+('鰮', '온'),
+('鰯', '약'),
+('鰱', '련'),
+('鰱', '연'),
+('鰲', '오'),
+('鰳', '륵'),
+('鰵', '민'),
+('鰷', '소'),
+('鰷', '조'),
+('鰹', '견'),
+('鰺', '소'),
+('鰻', '만'),
+('鰾', '표'),
+('鱅', '용'),
+('鱇', '강'),
+('鱈', '설'),
+('鱉', '별'),
+('鱏', '심'),
+('鱒', '준'),
+('鱓', '선'),
+('鱔', '선'),
+('鱖', '궐'),
+('鱖', '궤'),
+('鱗', '린'),
+('鱗', '인'),
+('鱘', '심'),
+('鱝', '분'),
+('鱟', '후'),
+('鱠', '회'),
+('鱣', '전'),
+('鱧', '례'),
+('鱭', '제'),
+('鱸', '노'),
+('鱸', '로'),
+('鱺', '려'),
+('鱺', '리'),
+('鱻', '선'),
+('鳥', '새'),
+('鳥', '조'),
+('鳦', '을'),
+('鳧', '부'),
+('鳩', '구'),
+('鳬', '부'),
+('鳮', '계'),
+('鳯', '봉'),
+('鳳', '봉'),
+('鳴', '명'),
+('鳴', '울'),
+('鳶', '연'),
+('鴃', '격'),
+('鴆', '짐'),
+('鴇', '보'),
+('鴈', '안'),
+('鴉', '아'),
+('鴌', '봉'),
+('鴒', '령'),
+('鴕', '타'),
+('鴘', '변'),
+('鴙', '치'),
+('鴛', '원'),
+('鴟', '치'),
+('鴣', '고'),
+('鴦', '앙'),
+('鴨', '압'),
+('鴰', '괄'),
+('鴳', '안'),
+('鴴', '행'),
+('鴶', '알'),
+('鴻', '홍'),
+('鵁', '교'),
+('鵂', '휴'),
+('鵄', '치'),
+('鵑', '견'),
+('鵓', '발'),
+('鵔', '준'),
+('鵜', '제'),
+('鵝', '아'),
+('鵞', '아'),
+('鵠', '곡'),
+('鵠', '혹'),
+('鵡', '무'),
+('鵩', '복'),
+('鵬', '붕'),
+('鵯', '필'),
+('鵰', '조'),
+('鵲', '작'),
+('鵷', '원'),
+('鵻', '추'),
+('鵾', '곤'),
+('鶄', '청'),
+('鶉', '순'),
+('鶖', '추'),
+('鶚', '악'),
+('鶡', '갈'),
+('鶤', '곤'),
+('鶩', '목'),
+('鶬', '창'),
+('鶬', '청'),
+('鶯', '앵'),
+('鶴', '학'),
+('鶵', '추'),
+('鶸', '약'),
+('鶹', '류'),
+('鶻', '골'),
+('鶿', '자'),
+('鷀', '자'),
+('鷁', '익'),
+('鷂', '요'),
+('鷄', '계'),
+('鷄', '닭'),
+('鷇', '구'),
+('鷓', '자'),
+('鷖', '예'),
+('鷗', '구'),
+('鷙', '지'),
+('鷦', '초'),
+('鷩', '별'),
+('鷪', '앵'),
+('鷫', '숙'),
+('鷰', '연'),
+('鷱', '고'),
+('鷲', '취'),
+('鷳', '한'),
+('鷸', '흘'),
+('鷹', '매'),
+('鷹', '응'),
+('鷺', '노'),
+('鷺', '로'),
+('鷽', '학'),
+('鷿', '벽'),
+('鸇', '전'),
+('鸎', '앵'),
+('鸏', '몽'),
+('鸕', '로'),
+('鸚', '앵'),
+('鸛', '관'),
+('鸜', '구'),
+('鸞', '란'),
+('鹙', '추'),
+('鹵', '노'),
+('鹵', '로'),
+('鹶', '긍'),
+('鹷', '령'),
+('鹹', '다'),
+('鹹', '짤'),
+('鹹', '함'),
+('鹺', '차'),
+('鹻', '검'),
+('鹽', '염'),
+('鹿', '녹'),
+('鹿', '록'),
+('麀', '우'),
+('麂', '궤'),
+('麄', '추'),
+('麇', '군'),
+('麇', '균'),
+('麈', '주'),
+('麋', '미'),
+('麌', '우'),
+('麏', '균'),
+('麑', '예'),
+('麒', '기'),
+('麓', '녹'),
+('麓', '록'),
+('麗', '려'),
+('麗', '리'),
+('麗', '여'),
+('麝', '사'),
+('麞', '장'),
+('麟', '린'),
+('麟', '인'),
+('麤', '추'),
+('麥', '맥'),
+('麦', '맥'),
+('麩', '부'),
+('麪', '면'),
+('麭', '포'),
+('麯', '국'),
+('麰', '모'),
+('麲', '한'),
+('麴', '국'),
+('麵', '면'),
+('麹', '국'),
+('麺', '면'),
+('麻', '마'),
+('麻', '삼'),
+('麼', '마'),
+('麽', '마'),
+('麾', '휘'),
+('麿', '마'),
+('黃', '황'),
+('黄', '황'),
+('黅', '금'),
+('黈', '주'),
+('黌', '횡'),
+('黍', '서'),
+('黎', '려'),
+('黎', '여'),
+('黏', '점'),
+('黐', '리'),
+('黑', '흑'),
+('黒', '흑'),
+('黔', '검'),
+('黔', '금'),
+('黕', '담'),
+('黖', '기'),
+('黖', '희'),
+('默', '묵'),
+('黚', '겸'),
+('黛', '대'),
+('黜', '출'),
+('黝', '유'),
+('點', '점'),
+('黟', '이'),
+('黠', '힐'),
+('黤', '암'),
+('黥', '경'),
+('黧', '래'),
+('黧', '려'),
+('黧', '리'),
+('黨', '당'),
+('黮', '담'),
+('黯', '암'),
+('黲', '참'),
+('黴', '미'),
+('黵', '담'),
+('黶', '염'),
+('黷', '독'),
+('黺', '분'),
+('黻', '불'),
+('黼', '보'),
+('黽', '맹'),
+('黽', '면'),
+('黽', '민'),
+('黿', '원'),
+('鼀', '축'),
+('鼂', '조'),
+('鼄', '주'),
+('鼇', '오'),
+('鼈', '별'),
+('鼉', '타'),
+('鼊', '벽'),
+('鼎', '정'),
+('鼐', '내'),
+('鼒', '자'),
+('鼓', '고'),
+('鼓', '북'),
+('鼕', '동'),
+('鼗', '도'),
+('鼙', '비'),
+('鼠', '서'),
+('鼠', '쥐'),
+('鼢', '분'),
+('鼪', '생'),
+('鼫', '석'),
+('鼬', '유'),
+('鼯', '오'),
+('鼴', '언'),
+('鼷', '혜'),
+('鼸', '겸'),
+('鼹', '언'),
+('鼻', '비'),
+('鼻', '코'),
+('鼽', '구'),
+('鼾', '한'),
+('齄', '차'),
+('齊', '자'),
+('齊', '제'),
+('齋', '재'),
+('齋', '집'),
+('齎', '재'),
+('齎', '제'),
+('齏', '제'),
+('齒', '이'),
+('齒', '치'),
+('齔', '츤'),
+('齔', '친'),
+('齕', '흘'),
+('齗', '은'),
+('齘', '계'),
+('齙', '포'),
+('齜', '재'),
+('齜', '차'),
+('齟', '저'),
+('齠', '초'),
+('齡', '령'),
+('齣', '척'),
+('齦', '간'),
+('齦', '물'),
+('齦', '은'),
+('齧', '설'),
+('齩', '교'),
+('齪', '착'),
+('齫', '곤'),
+('齬', '어'),
+('齮', '기'),
+('齰', '색'),
+('齲', '우'),
+('齶', '악'),
+('齷', '악'),
+('齾', '알'),
+('龍', '롱'),
+('龍', '룡'),
+('龍', '방'),
+('龍', '용'),
+('龐', '농'),
+('龐', '방'),
+('龒', '룡'),
+('龔', '공'),
+('龕', '감'),
+('龖', '답'),
+('龗', '령'),
+('龗', '영'),
+('龗', '용'),
+('龜', '구'),
+('龜', '귀'),
+('龜', '균'),
+('龝', '추'),
+('龞', '별'),
+('龠', '약'),
+('龡', '취'),
+('龢', '화'),
+('龤', '해'),
+('龥', '유'),
+('豈', '개'),
+('更', '갱'),
+('車', '거'),
+('賈', '고'),
+('滑', '골'),
+('串', '곶'),
+('句', '귀'),
+('龜', '귀'),
+('龜', '균'),
+('契', '글'),
+('金', '금'),
+('喇', '나'),
+('奈', '나'),
+('懶', '나'),
+('癩', '나'),
+('羅', '나'),
+('蘿', '나'),
+('螺', '나'),
+('裸', '나'),
+('邏', '나'),
+('樂', '낙'),
+('洛', '낙'),
+('烙', '낙'),
+('珞', '낙'),
+('落', '낙'),
+('酪', '낙'),
+('駱', '낙'),
+('亂', '난'),
+('卵', '난'),
+('欄', '난'),
+('爛', '난'),
+('蘭', '난'),
+('鸞', '난'),
+('嵐', '남'),
+('濫', '남'),
+('藍', '남'),
+('襤', '남'),
+('拉', '납'),
+('臘', '납'),
+('蠟', '납'),
+('廊', '낭'),
+('朗', '낭'),
+('浪', '낭'),
+('狼', '낭'),
+('郎', '낭'),
+('來', '내'),
+('冷', '냉'),
+('勞', '노'),
+('擄', '노'),
+('櫓', '노'),
+('爐', '노'),
+('盧', '노'),
+('老', '노'),
+('蘆', '노'),
+('虜', '노'),
+('路', '노'),
+('露', '노'),
+('魯', '노'),
+('鷺', '노'),
+('碌', '녹'),
+('祿', '녹'),
+('綠', '녹'),
+('菉', '녹'),
+('錄', '녹'),
+('鹿', '녹'),
+('論', '논'),
+('壟', '농'),
+('弄', '농'),
+('籠', '농'),
+('聾', '농'),
+('牢', '뇌'),
+('磊', '뇌'),
+('賂', '뇌'),
+('雷', '뇌'),
+('壘', '누'),
+('屢', '누'),
+('樓', '누'),
+('淚', '누'),
+('漏', '누'),
+('累', '누'),
+('縷', '누'),
+('陋', '누'),
+('勒', '늑'),
+('肋', '늑'),
+('凜', '늠'),
+('凌', '능'),
+('稜', '능'),
+('綾', '능'),
+('菱', '능'),
+('陵', '능'),
+('讀', '두'),
+('拏', '라'),
+('樂', '락'),
+('諾', '락'),
+('丹', '란'),
+('寧', '령'),
+('怒', '로'),
+('率', '률'),
+('異', '리'),
+('北', '베'),
+('磻', '번'),
+('便', '변'),
+('復', '부'),
+('不', '불'),
+('泌', '비'),
+('數', '삭'),
+('索', '삭'),
+('參', '삼'),
+('塞', '색'),
+('省', '생'),
+('葉', '섭'),
+('說', '세'),
+('殺', '쇄'),
+('辰', '신'),
+('沈', '심'),
+('拾', '십'),
+('若', '야'),
+('掠', '약'),
+('略', '약'),
+('亮', '양'),
+('兩', '양'),
+('凉', '양'),
+('梁', '양'),
+('糧', '양'),
+('良', '양'),
+('諒', '양'),
+('量', '양'),
+('勵', '여'),
+('呂', '여'),
+('女', '여'),
+('廬', '여'),
+('旅', '여'),
+('濾', '여'),
+('礪', '여'),
+('閭', '여'),
+('驪', '여'),
+('麗', '여'),
+('黎', '여'),
+('力', '역'),
+('曆', '역'),
+('歷', '역'),
+('轢', '역'),
+('年', '연'),
+('憐', '연'),
+('戀', '연'),
+('撚', '연'),
+('漣', '연'),
+('煉', '연'),
+('璉', '연'),
+('秊', '연'),
+('練', '연'),
+('聯', '연'),
+('輦', '연'),
+('蓮', '연'),
+('連', '연'),
+('鍊', '연'),
+('列', '열'),
+('劣', '열'),
+('咽', '열'),
+('烈', '열'),
+('裂', '열'),
+('說', '열'),
+('廉', '염'),
+('念', '염'),
+('捻', '염'),
+('殮', '염'),
+('簾', '염'),
+('獵', '엽'),
+('令', '영'),
+('囹', '영'),
+('寧', '영'),
+('嶺', '영'),
+('怜', '영'),
+('玲', '영'),
+('瑩', '영'),
+('羚', '영'),
+('聆', '영'),
+('鈴', '영'),
+('零', '련'),
+('零', '영'),
+('靈', '영'),
+('領', '영'),
+('例', '예'),
+('禮', '예'),
+('醴', '예'),
+('隸', '예'),
+('惡', '오'),
+('了', '요'),
+('僚', '요'),
+('寮', '요'),
+('尿', '요'),
+('料', '요'),
+('樂', '요'),
+('燎', '요'),
+('療', '요'),
+('蓼', '요'),
+('遼', '요'),
+('龍', '용'),
+('暈', '운'),
+('阮', '원'),
+('劉', '유'),
+('杻', '유'),
+('柳', '유'),
+('流', '유'),
+('溜', '유'),
+('琉', '유'),
+('留', '유'),
+('硫', '유'),
+('紐', '유'),
+('類', '유'),
+('六', '육'),
+('戮', '육'),
+('陸', '육'),
+('倫', '윤'),
+('崙', '윤'),
+('淪', '윤'),
+('輪', '윤'),
+('律', '율'),
+('慄', '율'),
+('栗', '율'),
+('率', '율'),
+('隆', '융'),
+('利', '이'),
+('吏', '이'),
+('履', '이'),
+('易', '이'),
+('李', '이'),
+('梨', '이'),
+('泥', '이'),
+('理', '이'),
+('痢', '이'),
+('罹', '이'),
+('裏', '이'),
+('裡', '이'),
+('里', '이'),
+('離', '이'),
+('匿', '익'),
+('溺', '익'),
+('吝', '인'),
+('燐', '인'),
+('璘', '인'),
+('藺', '인'),
+('隣', '인'),
+('鱗', '인'),
+('麟', '인'),
+('林', '임'),
+('淋', '임'),
+('臨', '임'),
+('立', '입'),
+('笠', '입'),
+('粒', '입'),
+('狀', '장'),
+('炙', '적'),
+('識', '지'),
+('什', '집'),
+('茶', '차'),
+('刺', '척'),
+('切', '체'),
+('度', '탁'),
+('拓', '탁'),
+('糖', '탕'),
+('宅', '택'),
+('洞', '통'),
+('暴', '포'),
+('輻', '폭'),
+('行', '항'),
+('降', '항'),
+('見', '현'),
+('廓', '확'),
+('兀', '올'),
+('塚', '총'),
+('晴', '청'),
+('凞', '희'),
+('猪', '저'),
+('益', '익'),
+('礼', '례'),
+('神', '신'),
+('祥', '상'),
+('福', '복'),
+('靖', '정'),
+('精', '정'),
+('羽', '우'),
+('諸', '제'),
+('逸', '일'),
+('都', '도'),
+('飯', '반'),
+('飼', '사'),
+('館', '관'),
+('鶴', '학'),
+('𠃗', '울'),
+('𠤛', '진'),
+('𠤛', '참'),
+('𠦃', '삽'),
+('𡙊', '진'),
+('𡙊', '참'),
+('𡙗', '렴'),
+('𡙗', '염'),
+('𡚍', '렴'),
+('𡚍', '염'),
+('𡨥', '구'),
+('𡯷', '구'),
+('𡶧', '립'),
+('𡶧', '입'),
+('𡾻', '장'),
+('𡿡', '령'),
+('𡿡', '영'),
+('𢅸', '렴'),
+('𢅸', '염'),
+('𢊴', '렴'),
+('𢊴', '염'),
+('𣛚', '예'),
+('𣫢', '렴'),
+('𣫢', '염'),
+('𣴘', '대'),
+('𣼻', '호'),
+('𣿋', '호'),
+('𤀶', '호'),
+('𤥗', '류'),
+('𤥗', '유'),
+('𥃯', '요'),
+('𥲥', '렴'),
+('𥲥', '염'),
+('𥳝', '예'),
+('𦁞', '예'),
+('𧄜', '예'),
+('𨓭', '취'),
+('𨕏', '렴'),
+('𨕏', '염'),
+('𨘰', '렴'),
+('𨘰', '염'),
+('𨣦', '서'),
+('𨣦', '여'),
+('𨤲', '리'),
+('𨤲', '복'),
+('𨤲', '희'),
+('𨭛', '납'),
+('𨭛', '랍'),
+('𨭹', '알'),
+('𨳈', '성'),
+('𨳈', '퉁'),
+('𩧁', '취'),
+('𩺴', '만'),
+('𩻠', '만'),
+('𪚒', '견'),
+('𪚜', '견'),
+('𪚟', '견'),
+('𪚥', '절'),
+('𮌇', '육'),
+('𮫽', '병'),
+('𰜩', '은')
+ON CONFLICT DO NOTHING;
\ No newline at end of file
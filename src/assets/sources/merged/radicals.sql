@@ -0,0 +1,249 @@
+INSERT INTO `radicals` VALUES
+('ノ', '葵'),
+('マ', '桶'),
+('ユ', '决'),
+('ヨ', '伊'),
+('一', '亜'),
+('世', '笹'),
+('个', '姶'),
+('丶', '以'),
+('乃', '及'),
+('久', '灸'),
+('乙', '曳'),
+('九', '旭'),
+('也', '施'),
+('亀', '穐'),
+('亅', '阿'),
+('二', '逢'),
+('五', '吾'),
+('井', '囲'),
+('亠', '哀'),
+('亡', '虻'),
+('人', '葵'),
+('儿', '綾'),
+('元', '院'),
+('免', '逸'),
+('入', '久'),
+('八', '異'),
+('冂', '渦'),
+('冊', '柵'),
+('冖', '愛'),
+('冫', '茨'),
+('几', '凱'),
+('凵', '凹'),
+('刀', '寡'),
+('刈', '唖'),
+('初', '袷'),
+('力', '甥'),
+('勹', '絢'),
+('勿', '易'),
+('匕', '壱'),
+('化', '伊'),
+('匚', '医'),
+('十', '梓'),
+('卜', '鮎'),
+('卩', '宛'),
+('厂', '圧'),
+('厶', '挨'),
+('又', '鰻'),
+('及', '扱'),
+('口', '亜'),
+('品', '癌'),
+('囗', '囲'),
+('土', '娃'),
+('士', '壱'),
+('夂', '愛'),
+('夕', '宛'),
+('大', '葵'),
+('奄', '奄'),
+('女', '娃'),
+('子', '廓'),
+('宀', '宛'),
+('寸', '尉'),
+('小', '影'),
+('尚', '溢'),
+('尢', '就'),
+('尤', '稽'),
+('尸', '握'),
+('屮', '逆'),
+('屯', '純'),
+('山', '岡'),
+('岡', '岡'),
+('川', '侃'),
+('工', '恐'),
+('巨', '巨'),
+('已', '改'),
+('巴', '色'),
+('巾', '柿'),
+('干', '芋'),
+('幺', '磯'),
+('广', '庵'),
+('廴', '延'),
+('廾', '横'),
+('弋', '試'),
+('弓', '夷'),
+('彑', '互'),
+('彡', '鯵'),
+('彳', '衛'),
+('心', '愛'),
+('忙', '惟'),
+('戈', '或'),
+('戸', '芦'),
+('手', '俄'),
+('扎', '挨'),
+('支', '伎'),
+('攵', '液'),
+('文', '蚊'),
+('斗', '斡'),
+('斤', '蛎'),
+('方', '於'),
+('无', '僭'),
+('日', '旭'),
+('曰', '倬'),
+('月', '胃'),
+('木', '梓'),
+('杰', '鯵'),
+('欠', '茨'),
+('止', '延'),
+('歯', '噛'),
+('歹', '残'),
+('殳', '疫'),
+('母', '悔'),
+('比', '皆'),
+('毛', '梶'),
+('氏', '祇'),
+('气', '気'),
+('水', '永'),
+('汁', '渥'),
+('滴', '嫡'),
+('火', '炎'),
+('無', '撫'),
+('爪', '愛'),
+('父', '較'),
+('爻', '爾'),
+('爿', '燕'),
+('片', '牒'),
+('牙', '厩'),
+('牛', '牡'),
+('犬', '厭'),
+('犯', '猿'),
+('玄', '弦'),
+('王', '淫'),
+('瓜', '瓜'),
+('瓦', '瓦'),
+('甘', '勘'),
+('生', '甥'),
+('用', '浦'),
+('田', '鯵'),
+('疋', '擬'),
+('疔', '疫'),
+('癶', '葵'),
+('白', '皆'),
+('皮', '頗'),
+('皿', '溢'),
+('目', '姐'),
+('矛', '茅'),
+('矢', '挨'),
+('石', '磯'),
+('示', '尉'),
+('礼', '禍'),
+('禹', '禽'),
+('禾', '穐'),
+('穴', '窺'),
+('立', '梓'),
+('竜', '滝'),
+('竹', '箇'),
+('米', '粟'),
+('糸', '絢'),
+('缶', '缶'),
+('羊', '儀'),
+('羽', '羽'),
+('老', '姥'),
+('而', '而'),
+('耒', '業'),
+('耳', '餌'),
+('聿', '劃'),
+('肉', '肉'),
+('臣', '臥'),
+('自', '榎'),
+('至', '握'),
+('臼', '臼'),
+('舌', '括'),
+('舛', '傑'),
+('舟', '艦'),
+('艮', '欝'),
+('色', '艶'),
+('艾', '葵'),
+('薺', '済'),
+('虍', '嘘'),
+('虫', '虻'),
+('血', '血'),
+('行', '衛'),
+('衣', '哀'),
+('西', '茜'),
+('見', '窺'),
+('角', '解'),
+('言', '謂'),
+('谷', '俗'),
+('豆', '艶'),
+('豕', '縁'),
+('豸', '墾'),
+('貝', '遺'),
+('買', '欝'),
+('赤', '嚇'),
+('走', '越'),
+('足', '距'),
+('身', '窮'),
+('車', '運'),
+('辛', '梓'),
+('辰', '辱'),
+('込', '逢'),
+('邦', '郁'),
+('酉', '醐'),
+('釆', '悉'),
+('里', '浬'),
+('金', '鋭'),
+('長', '帳'),
+('門', '闇'),
+('阡', '阿'),
+('隶', '康'),
+('隹', '惟'),
+('雨', '雨'),
+('青', '鯖'),
+('非', '罪'),
+('面', '緬'),
+('革', '鞍'),
+('韋', '葦'),
+('韭', '韮'),
+('音', '暗'),
+('頁', '穎'),
+('風', '楓'),
+('飛', '飛'),
+('食', '飴'),
+('首', '首'),
+('香', '馨'),
+('馬', '駅'),
+('骨', '骸'),
+('高', '稿'),
+('髟', '髪'),
+('鬥', '鬥'),
+('鬯', '鬯'),
+('鬲', '隔'),
+('鬼', '塊'),
+('魚', '鯵'),
+('鳥', '烏'),
+('鹵', '鹸'),
+('鹿', '漉'),
+('麦', '麹'),
+('麻', '摩'),
+('黄', '横'),
+('黍', '黍'),
+('黒', '黒'),
+('黹', '黹'),
+('黽', '竈'),
+('鼎', '鼎'),
+('鼓', '瞽'),
+('鼠', '鼠'),
+('鼻', '嚊'),
+('｜', '亜')
+ON CONFLICT DO NOTHING;
\ No newline at end of file
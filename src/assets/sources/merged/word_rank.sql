@@ -0,0 +1,28672 @@
+INSERT INTO `word_rank` VALUES
+('本', '본', 1, 33, 83, 2),
+('保證', '보증', 2, 18, 86, 2),
+('辱', '욕', 3, 15, 6, 2),
+('核', '핵', 4, 14, 25, 2),
+('人間', '인간', 5, 13, 378, 2),
+('江南', '강남', 6, 13, 94, 2),
+('情', '정', 7, 13, 49, 2),
+('因緣', '인연', 8, 13, 23, 2),
+('論文', '논문', 9, 12, 215, 2),
+('讓步', '양보', 10, 12, 17, 2),
+('人事', '인사', 11, 11, 433, 2),
+('廢人', '폐인', 12, 11, 333, 2),
+('中', '중', 13, 11, 135, 2),
+('祝賀', '축하', 14, 11, 10, 2),
+('道', '도', 15, 10, 124, 2),
+('適合', '적합', 16, 10, 117, 2),
+('氣', '기', 17, 10, 116, 2),
+('相對', '상대', 18, 10, 107, 2),
+('無', '무', 19, 10, 97, 2),
+('相當', '상당', 20, 10, 82, 2),
+('上', '상', 21, 10, 79, 2),
+('普通', '보통', 22, 10, 69, 2),
+('安寧', '안녕', 23, 10, 54, 2),
+('當', '당', 24, 10, 34, 2),
+('盛衰', '성쇠', 25, 10, 15, 2),
+('塔', '탑', 26, 10, 11, 2),
+('典型的', '전형적', 27, 9, 211, 2),
+('菓子', '과자', 28, 9, 188, 2),
+('行', '행', 29, 9, 137, 2),
+('待機', '대기', 30, 9, 131, 2),
+('法', '법', 31, 9, 125, 2),
+('作成', '작성', 32, 9, 122, 2),
+('素質', '소질', 33, 9, 102, 2),
+('點', '점', 34, 9, 75, 2),
+('任命', '임명', 35, 9, 62, 2),
+('亂離', '난리', 36, 9, 50, 2),
+('種', '종', 37, 9, 46, 2),
+('依支', '의지', 38, 9, 40, 2),
+('試驗', '시험', 39, 9, 31, 2),
+('毒', '독', 40, 9, 29, 2),
+('停止', '정지', 41, 9, 29, 2),
+('爲', '위', 42, 9, 7, 2),
+('主人公', '주인공', 43, 8, 566, 2),
+('人道', '인도', 44, 8, 443, 2),
+('國語', '국어', 45, 8, 400, 2),
+('主要', '주요', 46, 8, 200, 2),
+('大綱', '대강', 47, 8, 199, 2),
+('文字', '문자', 48, 8, 197, 2),
+('分明', '분명', 49, 8, 172, 2),
+('熱心', '열심', 50, 8, 169, 2),
+('性', '성', 51, 8, 152, 2),
+('信用', '신용', 52, 8, 127, 2),
+('白紙', '백지', 53, 8, 120, 2),
+('公開', '공개', 54, 8, 118, 2),
+('活用', '활용', 55, 8, 116, 2),
+('聯合', '연합', 56, 8, 113, 2),
+('黑白', '흑백', 57, 8, 106, 2),
+('確實', '확실', 58, 8, 90, 2),
+('合', '합', 59, 8, 85, 2),
+('開放', '개방', 60, 8, 77, 2),
+('定', '정', 61, 8, 76, 2),
+('下', '하', 62, 8, 74, 2),
+('支配', '지배', 63, 8, 67, 2),
+('調査', '조사', 64, 8, 63, 2),
+('平凡', '평범', 65, 8, 62, 2),
+('式', '식', 66, 8, 49, 2),
+('科', '과', 67, 8, 38, 2),
+('設置', '설치', 68, 8, 38, 2),
+('活潑', '활발', 69, 8, 38, 2),
+('救濟', '구제', 70, 8, 34, 2),
+('短篇', '단편', 71, 8, 33, 2),
+('冷淡', '냉담', 72, 8, 30, 2),
+('像', '상', 73, 8, 28, 2),
+('案', '안', 74, 8, 24, 2),
+('乾燥', '건조', 75, 8, 24, 2),
+('君', '군', 76, 8, 16, 2),
+('兄', '형', 77, 8, 10, 2),
+('進行者', '진행자', 78, 7, 501, 2),
+('人物', '인물', 79, 7, 480, 2),
+('八方美人', '팔방미인', 80, 7, 476, 2),
+('保護者', '보호자', 81, 7, 400, 2),
+('分子', '분자', 82, 7, 294, 2),
+('中小企業', '중소기업', 83, 7, 289, 2),
+('無理', '무리', 84, 7, 226, 2),
+('無事', '무사', 85, 7, 211, 2),
+('不注意', '부주의', 86, 7, 205, 2),
+('聖地', '성지', 87, 7, 200, 2),
+('運動', '운동', 88, 7, 191, 2),
+('一定', '일정', 89, 7, 182, 2),
+('分解', '분해', 90, 7, 176, 2),
+('安心', '안심', 91, 7, 159, 2),
+('衝動', '충동', 92, 7, 157, 2),
+('食口', '식구', 93, 7, 152, 2),
+('作用', '작용', 94, 7, 147, 2),
+('課外', '과외', 95, 7, 124, 2),
+('精神', '정신', 96, 7, 123, 2),
+('一致', '일치', 97, 7, 122, 2),
+('職業', '직업', 98, 7, 118, 2),
+('實情', '실정', 99, 7, 116, 2),
+('前後', '전후', 100, 7, 112, 2),
+('無慮', '무려', 101, 7, 106, 2),
+('班長', '반장', 102, 7, 105, 2),
+('通路', '통로', 103, 7, 104, 2),
+('部位', '부위', 104, 7, 102, 2),
+('有能', '유능', 105, 7, 98, 2),
+('以上', '이상', 106, 7, 93, 2),
+('神', '신', 107, 7, 92, 2),
+('正確', '정확', 108, 7, 92, 2),
+('解消', '해소', 109, 7, 90, 2),
+('重要', '중요', 110, 7, 89, 2),
+('特別', '특별', 111, 7, 79, 2),
+('末期', '말기', 112, 7, 70, 2),
+('素材', '소재', 113, 7, 70, 2),
+('單位', '단위', 114, 7, 68, 2),
+('命令', '명령', 115, 7, 68, 2),
+('對', '대', 116, 7, 59, 2),
+('目標', '목표', 117, 7, 59, 2),
+('治療', '치료', 118, 7, 56, 2),
+('判斷', '판단', 119, 7, 55, 2),
+('未滿', '미만', 120, 7, 54, 2),
+('多幸', '다행', 121, 7, 47, 2),
+('便', '편', 122, 7, 46, 2),
+('改譯', '개역', 123, 7, 45, 2),
+('板', '판', 124, 7, 35, 2),
+('該當', '해당', 125, 7, 34, 2),
+('歡呼', '환호', 126, 7, 33, 2),
+('初', '초', 127, 7, 32, 2),
+('陸橋', '육교', 128, 7, 31, 2),
+('擴散', '확산', 129, 7, 28, 2),
+('急', '급', 130, 7, 27, 2),
+('罪', '죄', 131, 7, 26, 2),
+('鼓舞', '고무', 132, 7, 23, 2),
+('尊敬', '존경', 133, 7, 23, 2),
+('限', '한', 134, 7, 22, 2),
+('苦悶', '고민', 135, 7, 21, 2),
+('因', '인', 136, 7, 15, 2),
+('豊富', '풍부', 137, 7, 15, 2),
+('求', '구', 138, 7, 14, 2),
+('桶', '통', 139, 7, 14, 2),
+('課', '과', 140, 7, 12, 2),
+('丹楓', '단풍', 141, 7, 12, 2),
+('碑', '비', 142, 7, 5, 2),
+('代理人', '대리인', 143, 6, 527, 2),
+('人體', '인체', 144, 6, 462, 2),
+('一般人', '일반인', 145, 6, 436, 2),
+('演藝人', '연예인', 146, 6, 364, 2),
+('罪人', '죄인', 147, 6, 345, 2),
+('戀人', '연인', 148, 6, 327, 2),
+('人', '인', 149, 6, 319, 2),
+('學番', '학번', 150, 6, 303, 2),
+('衒學', '현학', 151, 6, 281, 2),
+('最大限', '최대한', 152, 6, 249, 2),
+('一行', '일행', 153, 6, 243, 2),
+('運動服', '운동복', 154, 6, 224, 2),
+('地方', '지방', 155, 6, 221, 2),
+('運動靴', '운동화', 156, 6, 196, 2),
+('地境', '지경', 157, 6, 184, 2),
+('作家', '작가', 158, 6, 180, 2),
+('外面', '외면', 159, 6, 178, 2),
+('物件', '물건', 160, 6, 172, 2),
+('自身', '자신', 161, 6, 167, 2),
+('事情', '사정', 162, 6, 163, 2),
+('動搖', '동요', 163, 6, 155, 2),
+('不足', '부족', 164, 6, 155, 2),
+('布帳馬車', '포장마차', 165, 6, 154, 2),
+('一種', '일종', 166, 6, 152, 2),
+('戰線', '전선', 167, 6, 146, 2),
+('一等', '일등', 168, 6, 142, 2),
+('無視', '무시', 169, 6, 141, 2),
+('終日', '종일', 170, 6, 141, 2),
+('進出', '진출', 171, 6, 139, 2),
+('自己', '자기', 172, 6, 137, 2),
+('神經', '신경', 173, 6, 136, 2),
+('區分', '구분', 174, 6, 135, 2),
+('集合', '집합', 175, 6, 135, 2),
+('住民', '주민', 176, 6, 129, 2),
+('軍士', '군사', 177, 6, 128, 2),
+('反對', '반대', 178, 6, 127, 2),
+('代身', '대신', 179, 6, 124, 2),
+('發表', '발표', 180, 6, 124, 2),
+('發射', '발사', 181, 6, 123, 2),
+('急降下', '급강하', 182, 6, 122, 2),
+('高度', '고도', 183, 6, 116, 2),
+('業務', '업무', 184, 6, 114, 2),
+('防空', '방공', 185, 6, 110, 2),
+('公演', '공연', 186, 6, 109, 2),
+('小說', '소설', 187, 6, 108, 2),
+('記號', '기호', 188, 6, 106, 2),
+('豫定', '예정', 189, 6, 106, 2),
+('急所', '급소', 190, 6, 105, 2),
+('市內', '시내', 191, 6, 104, 2),
+('敎材', '교재', 192, 6, 103, 2),
+('記錄', '기록', 193, 6, 98, 2),
+('白鳥', '백조', 194, 6, 98, 2),
+('店員', '점원', 195, 6, 96, 2),
+('內亂', '내란', 196, 6, 95, 2),
+('惡漢', '악한', 197, 6, 92, 2),
+('採用', '채용', 198, 6, 88, 2),
+('直前', '직전', 199, 6, 84, 2),
+('實際', '실제', 200, 6, 81, 2),
+('始作', '시작', 201, 6, 80, 2),
+('必需品', '필수품', 202, 6, 80, 2),
+('瞬息間', '순식간', 203, 6, 78, 2),
+('實施', '실시', 204, 6, 76, 2),
+('計劃', '계획', 205, 6, 74, 2),
+('詩集', '시집', 206, 6, 74, 2),
+('異常', '이상', 207, 6, 71, 2),
+('構成', '구성', 208, 6, 70, 2),
+('延期', '연기', 209, 6, 70, 2),
+('暫時', '잠시', 210, 6, 70, 2),
+('取調', '취조', 211, 6, 63, 2),
+('伏兵', '복병', 212, 6, 61, 2),
+('嫌惡', '혐오', 213, 6, 61, 2),
+('成績', '성적', 214, 6, 60, 2),
+('全', '전', 215, 6, 56, 2),
+('夫婦', '부부', 216, 6, 56, 2),
+('禁酒', '금주', 217, 6, 53, 2),
+('斷片', '단편', 218, 6, 53, 2),
+('必要', '필요', 219, 6, 52, 2),
+('領域', '영역', 220, 6, 48, 2),
+('次例', '차례', 221, 6, 47, 2),
+('親舊', '친구', 222, 6, 47, 2),
+('支給', '지급', 223, 6, 46, 2),
+('映像', '영상', 224, 6, 45, 2),
+('傳貰', '전세', 225, 6, 45, 2),
+('別', '별', 226, 6, 44, 2),
+('應酬', '응수', 227, 6, 43, 2),
+('整備', '정비', 228, 6, 43, 2),
+('消滅', '소멸', 229, 6, 42, 2),
+('增加', '증가', 230, 6, 42, 2),
+('退勤', '퇴근', 231, 6, 41, 2),
+('支柱', '지주', 232, 6, 39, 2),
+('薄弱', '박약', 233, 6, 36, 2),
+('香爐', '향로', 234, 6, 36, 2),
+('默示', '묵시', 235, 6, 35, 2),
+('收益', '수익', 236, 6, 35, 2),
+('慰勞', '위로', 237, 6, 34, 2),
+('指摘', '지적', 238, 6, 33, 2),
+('疾走', '질주', 239, 6, 30, 2),
+('稱讚', '칭찬', 240, 6, 30, 2),
+('廢止', '폐지', 241, 6, 30, 2),
+('規模', '규모', 242, 6, 29, 2),
+('永續', '영속', 243, 6, 29, 2),
+('階段', '계단', 244, 6, 27, 2),
+('擔任', '담임', 245, 6, 27, 2),
+('錯覺', '착각', 246, 6, 27, 2),
+('容恕', '용서', 247, 6, 26, 2),
+('絶頂', '절정', 248, 6, 24, 2),
+('層', '층', 249, 6, 21, 2),
+('推測', '추측', 250, 6, 20, 2),
+('純潔', '순결', 251, 6, 18, 2),
+('章', '장', 252, 6, 16, 2),
+('村', '촌', 253, 6, 12, 2),
+('激怒', '격노', 254, 6, 12, 2),
+('恐怖', '공포', 255, 6, 12, 2),
+('憂鬱', '우울', 256, 6, 12, 2),
+('件', '건', 257, 6, 11, 2),
+('刺戟', '자극', 258, 6, 11, 2),
+('疲困', '피곤', 259, 6, 9, 2),
+('犧牲', '희생', 260, 6, 8, 2),
+('亦是', '역시', 261, 6, 6, 2),
+('甚', '심', 262, 6, 2, 2),
+('管理人', '관리인', 263, 5, 492, 2),
+('主人', '주인', 264, 5, 482, 2),
+('法人', '법인', 265, 5, 444, 2),
+('西洋人', '서양인', 266, 5, 408, 2),
+('記者', '기자', 267, 5, 391, 2),
+('新人', '신인', 268, 5, 391, 2),
+('愛人', '애인', 269, 5, 389, 2),
+('美人', '미인', 270, 5, 380, 2),
+('人情', '인정', 271, 5, 368, 2),
+('破壞者', '파괴자', 272, 5, 359, 2),
+('都大體', '도대체', 273, 5, 357, 2),
+('夫人', '부인', 274, 5, 350, 2),
+('海水浴場', '해수욕장', 275, 5, 335, 2),
+('國家', '국가', 276, 5, 334, 2),
+('國會', '국회', 277, 5, 323, 2),
+('修學', '수학', 278, 5, 316, 2),
+('國際線', '국제선', 279, 5, 299, 2),
+('子女', '자녀', 280, 5, 278, 2),
+('事物', '사물', 281, 5, 275, 2),
+('道理', '도리', 282, 5, 253, 2),
+('行事', '행사', 283, 5, 251, 2),
+('地點', '지점', 284, 5, 240, 2),
+('大要', '대요', 285, 5, 231, 2),
+('飮料水', '음료수', 286, 5, 221, 2),
+('再生', '재생', 287, 5, 212, 2),
+('海外', '해외', 288, 5, 205, 2),
+('實行', '실행', 289, 5, 204, 2),
+('討論會', '토론회', 290, 5, 203, 2),
+('大槪', '대개', 291, 5, 200, 2),
+('實力', '실력', 292, 5, 185, 2),
+('餘地', '여지', 293, 5, 185, 2),
+('暴動', '폭동', 294, 5, 184, 2),
+('上半期', '상반기', 295, 5, 183, 2),
+('事實', '사실', 296, 5, 181, 2),
+('數字', '숫자', 297, 5, 181, 2),
+('時機', '시기', 298, 5, 181, 2),
+('記事', '기사', 299, 5, 180, 2),
+('公務員', '공무원', 300, 5, 180, 2),
+('進行', '진행', 301, 5, 176, 2),
+('長點', '장점', 302, 5, 175, 2),
+('主張', '주장', 303, 5, 175, 2),
+('會場', '회장', 304, 5, 171, 2),
+('一品', '일품', 305, 5, 168, 2),
+('行商', '행상', 306, 5, 167, 2),
+('主', '주', 307, 5, 163, 2),
+('死神', '사신', 308, 5, 162, 2),
+('體裁', '체재', 309, 5, 162, 2),
+('處理', '처리', 310, 5, 160, 2),
+('理念', '이념', 311, 5, 157, 2),
+('中傷', '중상', 312, 5, 156, 2),
+('不良', '불량', 313, 5, 154, 2),
+('旅行', '여행', 314, 5, 154, 2),
+('野外', '야외', 315, 5, 153, 2),
+('活氣', '활기', 316, 5, 152, 2),
+('社會', '사회', 317, 5, 147, 2),
+('漫畵家', '만화가', 318, 5, 146, 2),
+('社長', '사장', 319, 5, 145, 2),
+('男女', '남녀', 320, 5, 143, 2),
+('法律', '법률', 321, 5, 143, 2),
+('反感', '반감', 322, 5, 142, 2),
+('民族', '민족', 323, 5, 140, 2),
+('分離', '분리', 324, 5, 140, 2),
+('履行', '이행', 325, 5, 139, 2),
+('中央', '중앙', 326, 5, 137, 2),
+('所有', '소유', 327, 5, 134, 2),
+('館長', '관장', 328, 5, 133, 2),
+('校長', '교장', 329, 5, 133, 2),
+('孝道', '효도', 330, 5, 133, 2),
+('重要視', '중요시', 331, 5, 133, 2),
+('總會', '총회', 332, 5, 128, 2),
+('民俗', '민속', 333, 5, 127, 2),
+('演出', '연출', 334, 5, 125, 2),
+('出演', '출연', 335, 5, 125, 2),
+('結合', '결합', 336, 5, 124, 2),
+('便所', '변소', 337, 5, 124, 2),
+('充分', '충분', 338, 5, 124, 2),
+('疑心', '의심', 339, 5, 122, 2),
+('部品', '부품', 340, 5, 121, 2),
+('射手', '사수', 341, 5, 121, 2),
+('名單', '명단', 342, 5, 120, 2),
+('雰圍氣', '분위기', 343, 5, 119, 2),
+('合格', '합격', 344, 5, 118, 2),
+('一般', '일반', 345, 5, 117, 2),
+('前線', '전선', 346, 5, 116, 2),
+('競技場', '경기장', 347, 5, 111, 2),
+('共同', '공동', 348, 5, 109, 2),
+('所在', '소재', 349, 5, 109, 2),
+('庶民', '서민', 350, 5, 108, 2),
+('時報', '시보', 351, 5, 107, 2),
+('手足', '수족', 352, 5, 105, 2),
+('數', '수', 353, 5, 104, 2),
+('弱點', '약점', 354, 5, 104, 2),
+('解放', '해방', 355, 5, 104, 2),
+('毒感', '독감', 356, 5, 103, 2),
+('草原', '초원', 357, 5, 103, 2),
+('出帆', '출범', 358, 5, 103, 2),
+('和解', '화해', 359, 5, 103, 2),
+('穀食', '곡식', 360, 5, 102, 2),
+('使用', '사용', 361, 5, 102, 2),
+('海岸', '해안', 362, 5, 101, 2),
+('引上', '인상', 363, 5, 100, 2),
+('短點', '단점', 364, 5, 98, 2),
+('部隊', '부대', 365, 5, 97, 2),
+('成立', '성립', 366, 5, 97, 2),
+('手段', '수단', 367, 5, 96, 2),
+('新設', '신설', 368, 5, 95, 2),
+('辯護士', '변호사', 369, 5, 94, 2),
+('反亂', '반란', 370, 5, 93, 2),
+('視角', '시각', 371, 5, 93, 2),
+('規定', '규정', 372, 5, 92, 2),
+('豫言', '예언', 373, 5, 90, 2),
+('授業', '수업', 374, 5, 88, 2),
+('以下', '이하', 375, 5, 88, 2),
+('新奇', '신기', 376, 5, 86, 2),
+('綜合', '종합', 377, 5, 86, 2),
+('密通', '밀통', 378, 5, 85, 2),
+('缺點', '결점', 379, 5, 84, 2),
+('空輸', '공수', 380, 5, 81, 2),
+('代', '대', 381, 5, 79, 2),
+('山', '산', 382, 5, 79, 2),
+('種目', '종목', 383, 5, 79, 2),
+('砲兵', '포병', 384, 5, 79, 2),
+('對答', '대답', 385, 5, 78, 2),
+('三寸', '삼촌', 386, 5, 78, 2),
+('同僚', '동료', 387, 5, 77, 2),
+('風景', '풍경', 388, 5, 77, 2),
+('結果', '결과', 389, 5, 75, 2),
+('惡評', '악평', 390, 5, 75, 2),
+('直接', '직접', 391, 5, 75, 2),
+('洋酒', '양주', 392, 5, 74, 2),
+('港口', '항구', 393, 5, 74, 2),
+('豫想', '예상', 394, 5, 73, 2),
+('現在', '현재', 395, 5, 73, 2),
+('今方', '금방', 396, 5, 72, 2),
+('遺産', '유산', 397, 5, 72, 2),
+('想像', '상상', 398, 5, 71, 2),
+('傳令', '전령', 399, 5, 71, 2),
+('幹線', '간선', 400, 5, 69, 2),
+('面', '면', 401, 5, 66, 2),
+('態度', '태도', 402, 5, 66, 2),
+('運營', '운영', 403, 5, 65, 2),
+('交換', '교환', 404, 5, 62, 2),
+('勇士', '용사', 405, 5, 62, 2),
+('安否', '안부', 406, 5, 61, 2),
+('樣式', '양식', 407, 5, 61, 2),
+('辨明', '변명', 408, 5, 60, 2),
+('元來', '원래', 409, 5, 60, 2),
+('傳達', '전달', 410, 5, 60, 2),
+('淸算', '청산', 411, 5, 60, 2),
+('觀察', '관찰', 412, 5, 59, 2),
+('失禮', '실례', 413, 5, 58, 2),
+('里程標', '이정표', 414, 5, 58, 2),
+('補修', '보수', 415, 5, 57, 2),
+('近處', '근처', 416, 5, 56, 2),
+('意欲', '의욕', 417, 5, 55, 2),
+('任務', '임무', 418, 5, 55, 2),
+('休養', '휴양', 419, 5, 55, 2),
+('以來', '이래', 420, 5, 54, 2),
+('各種', '각종', 421, 5, 52, 2),
+('交替', '교체', 422, 5, 52, 2),
+('注射', '주사', 423, 5, 52, 2),
+('科擧', '과거', 424, 5, 51, 2),
+('要求', '요구', 425, 5, 51, 2),
+('提議', '제의', 426, 5, 51, 2),
+('問答', '문답', 427, 5, 50, 2),
+('非難', '비난', 428, 5, 50, 2),
+('消印', '소인', 429, 5, 50, 2),
+('接觸', '접촉', 430, 5, 50, 2),
+('推進', '추진', 431, 5, 50, 2),
+('質', '질', 432, 5, 49, 2),
+('取消', '취소', 433, 5, 49, 2),
+('玄關', '현관', 434, 5, 49, 2),
+('潤滑油', '윤활유', 435, 5, 47, 2),
+('去勢', '거세', 436, 5, 45, 2),
+('親庭', '친정', 437, 5, 45, 2),
+('與黨', '여당', 438, 5, 44, 2),
+('先輩', '선배', 439, 5, 43, 2),
+('申告', '신고', 440, 5, 43, 2),
+('節', '절', 441, 5, 41, 2),
+('癡漢', '치한', 442, 5, 41, 2),
+('遮斷', '차단', 443, 5, 40, 2),
+('撤回', '철회', 444, 5, 40, 2),
+('弘報', '홍보', 445, 5, 40, 2),
+('休息', '휴식', 446, 5, 40, 2),
+('鑛脈', '광맥', 447, 5, 39, 2),
+('選擇', '선택', 448, 5, 39, 2),
+('蟲齒', '충치', 449, 5, 39, 2),
+('活躍', '활약', 450, 5, 39, 2),
+('階層', '계층', 451, 5, 38, 2),
+('運搬', '운반', 452, 5, 38, 2),
+('表', '표', 453, 5, 36, 2),
+('加', '가', 454, 5, 35, 2),
+('偶然', '우연', 455, 5, 35, 2),
+('區域', '구역', 456, 5, 34, 2),
+('始祖', '시조', 457, 5, 34, 2),
+('聯盟', '연맹', 458, 5, 34, 2),
+('偶像', '우상', 459, 5, 33, 2),
+('檢討', '검토', 460, 5, 32, 2),
+('否認', '부인', 461, 5, 32, 2),
+('迅速', '신속', 462, 5, 32, 2),
+('容貌', '용모', 463, 5, 32, 2),
+('級', '급', 464, 5, 31, 2),
+('勝負', '승부', 465, 5, 31, 2),
+('監督', '감독', 466, 5, 30, 2),
+('審判', '심판', 467, 5, 29, 2),
+('壓倒', '압도', 468, 5, 29, 2),
+('靜止', '정지', 469, 5, 28, 2),
+('滅亡', '멸망', 470, 5, 27, 2),
+('誇示', '과시', 471, 5, 26, 2),
+('委任', '위임', 472, 5, 26, 2),
+('境遇', '경우', 473, 5, 25, 2),
+('陶藝', '도예', 474, 5, 25, 2),
+('模樣', '모양', 475, 5, 25, 2),
+('條件', '조건', 476, 5, 25, 2),
+('故鄕', '고향', 477, 5, 24, 2),
+('鎭靜', '진정', 478, 5, 24, 2),
+('撮影', '촬영', 479, 5, 23, 2),
+('衝突', '충돌', 480, 5, 23, 2),
+('操縱', '조종', 481, 5, 22, 2),
+('取', '취', 482, 5, 20, 2),
+('票', '표', 483, 5, 19, 2),
+('惹端', '야단', 484, 5, 19, 2),
+('誘惑', '유혹', 485, 5, 18, 2),
+('痕跡', '흔적', 486, 5, 18, 2),
+('救', '구', 487, 5, 17, 2),
+('貯藏', '저장', 488, 5, 17, 2),
+('沮止', '저지', 489, 5, 17, 2),
+('敍述', '서술', 490, 5, 16, 2),
+('拘束', '구속', 491, 5, 15, 2),
+('若干', '약간', 492, 5, 15, 2),
+('嚴肅', '엄숙', 493, 5, 15, 2),
+('亡', '망', 494, 5, 14, 2),
+('向', '향', 495, 5, 14, 2),
+('干涉', '간섭', 496, 5, 14, 2),
+('憂慮', '우려', 497, 5, 14, 2),
+('隱隱', '은은', 498, 5, 14, 2),
+('殘酷', '잔혹', 499, 5, 14, 2),
+('掠奪', '약탈', 500, 5, 13, 2),
+('永久', '영구', 501, 5, 13, 2),
+('粉碎', '분쇄', 502, 5, 12, 2),
+('範圍', '범위', 503, 5, 11, 2),
+('倦怠', '권태', 504, 5, 10, 2),
+('屬', '속', 505, 5, 9, 2),
+('秩序', '질서', 506, 5, 9, 2),
+('侯爵', '후작', 507, 5, 9, 2),
+('氏', '씨', 508, 5, 8, 2),
+('依', '의', 509, 5, 7, 2),
+('醉', '취', 510, 5, 7, 2),
+('倍', '배', 511, 5, 5, 2),
+('但只', '단지', 512, 5, 4, 2),
+('斟酌', '짐작', 513, 5, 1, 2),
+('殺人者', '살인자', 514, 4, 683, 2),
+('外國人', '외국인', 515, 4, 652, 2),
+('中學生', '중학생', 516, 4, 603, 2),
+('高等學生', '고등학생', 517, 4, 577, 2),
+('初等學生', '초등학생', 518, 4, 536, 2),
+('男學生', '남학생', 519, 4, 512, 2),
+('人性', '인성', 520, 4, 471, 2),
+('使用者', '사용자', 521, 4, 427, 2),
+('國會議員', '국회의원', 522, 4, 420, 2),
+('中心地', '중심지', 523, 4, 410, 2),
+('本人', '본인', 524, 4, 402, 2),
+('白人', '백인', 525, 4, 398, 2),
+('約婚者', '약혼자', 526, 4, 389, 2),
+('暗殺者', '암살자', 527, 4, 386, 2),
+('人形', '인형', 528, 4, 384, 2),
+('演技者', '연기자', 529, 4, 379, 2),
+('流動性', '유동성', 530, 4, 378, 2),
+('日常生活', '일상생활', 531, 4, 378, 2),
+('惡人', '악인', 532, 4, 374, 2),
+('學年', '학년', 533, 4, 373, 2),
+('初步者', '초보자', 534, 4, 370, 2),
+('犯罪者', '범죄자', 535, 4, 368, 2),
+('居住者', '거주자', 536, 4, 364, 2),
+('人類', '인류', 537, 4, 362, 2),
+('責任者', '책임자', 538, 4, 362, 2),
+('老人', '노인', 539, 4, 357, 2),
+('競爭者', '경쟁자', 540, 4, 357, 2),
+('生物', '생물', 541, 4, 348, 2),
+('超人', '초인', 542, 4, 340, 2),
+('大體', '대체', 543, 4, 337, 2),
+('犯人', '범인', 544, 4, 336, 2),
+('學期', '학기', 545, 4, 334, 2),
+('學術', '학술', 546, 4, 326, 2),
+('放學', '방학', 547, 4, 324, 2),
+('學科', '학과', 548, 4, 319, 2),
+('食生活', '식생활', 549, 4, 316, 2),
+('公文書', '공문서', 550, 4, 303, 2),
+('日子', '일자', 551, 4, 301, 2),
+('學歷', '학력', 552, 4, 296, 2),
+('三國', '삼국', 553, 4, 289, 2),
+('主義', '주의', 554, 4, 282, 2),
+('理性', '이성', 555, 4, 281, 2),
+('不條理', '부조리', 556, 4, 279, 2),
+('全國', '전국', 557, 4, 277, 2),
+('動力', '동력', 558, 4, 271, 2),
+('事實上', '사실상', 559, 4, 260, 2),
+('運動場', '운동장', 560, 4, 260, 2),
+('女性', '여성', 561, 4, 251, 2),
+('家庭敎師', '가정교사', 562, 4, 251, 2),
+('大都市', '대도시', 563, 4, 248, 2),
+('大門', '대문', 564, 4, 246, 2),
+('中心', '중심', 565, 4, 245, 2),
+('平生', '평생', 566, 4, 245, 2),
+('肯定的', '긍정적', 567, 4, 244, 2),
+('國旗', '국기', 568, 4, 243, 2),
+('地下', '지하', 569, 4, 239, 2),
+('大望', '대망', 570, 4, 228, 2),
+('中食', '중식', 571, 4, 228, 2),
+('各國', '각국', 572, 4, 227, 2),
+('最大', '최대', 573, 4, 227, 2),
+('可能性', '가능성', 574, 4, 223, 2),
+('反動', '반동', 575, 4, 221, 2),
+('理髮所', '이발소', 576, 4, 221, 2),
+('窮極的', '궁극적', 577, 4, 216, 2),
+('日食', '일식', 578, 4, 215, 2),
+('精子', '정자', 579, 4, 210, 2),
+('苦生', '고생', 580, 4, 208, 2),
+('球體', '구체', 581, 4, 208, 2),
+('代理', '대리', 582, 4, 208, 2),
+('電力', '전력', 583, 4, 206, 2),
+('地帶', '지대', 584, 4, 204, 2),
+('性質', '성질', 585, 4, 201, 2),
+('政體', '정체', 586, 4, 201, 2),
+('白血球', '백혈구', 587, 4, 201, 2),
+('目的', '목적', 588, 4, 200, 2),
+('卵子', '난자', 589, 4, 199, 2),
+('英語', '영어', 590, 4, 199, 2),
+('惡化', '악화', 591, 4, 196, 2),
+('中世', '중세', 592, 4, 196, 2),
+('派出所', '파출소', 593, 4, 196, 2),
+('事業', '사업', 594, 4, 195, 2),
+('隱語', '은어', 595, 4, 193, 2),
+('無名', '무명', 596, 4, 192, 2),
+('正義', '정의', 597, 4, 188, 2),
+('孝子', '효자', 598, 4, 188, 2),
+('拍子', '박자', 599, 4, 186, 2),
+('性格', '성격', 600, 4, 185, 2),
+('點心', '점심', 601, 4, 185, 2),
+('遺物', '유물', 602, 4, 184, 2),
+('方法', '방법', 603, 4, 181, 2),
+('變化', '변화', 604, 4, 178, 2),
+('扇風機', '선풍기', 605, 4, 178, 2),
+('下半期', '하반기', 606, 4, 178, 2),
+('兵法', '병법', 607, 4, 177, 2),
+('建物', '건물', 608, 4, 176, 2),
+('勞動', '노동', 609, 4, 176, 2),
+('熱氣', '열기', 610, 4, 175, 2),
+('上半身', '상반신', 611, 4, 175, 2),
+('部分', '부분', 612, 4, 174, 2),
+('管理', '관리', 613, 4, 173, 2),
+('無意味', '무의미', 614, 4, 172, 2),
+('汚物', '오물', 615, 4, 169, 2),
+('移動', '이동', 616, 4, 168, 2),
+('行列', '행렬', 617, 4, 168, 2),
+('委員長', '위원장', 618, 4, 167, 2),
+('民間', '민간', 619, 4, 164, 2),
+('情事', '정사', 620, 4, 163, 2),
+('報道', '보도', 621, 4, 162, 2),
+('膳物', '선물', 622, 4, 161, 2),
+('合同', '합동', 623, 4, 160, 2),
+('旅客機', '여객기', 624, 4, 160, 2),
+('心情', '심정', 625, 4, 159, 2),
+('飛行', '비행', 626, 4, 157, 2),
+('漢文', '한문', 627, 4, 157, 2),
+('食品', '식품', 628, 4, 155, 2),
+('言論', '언론', 629, 4, 155, 2),
+('日常', '일상', 630, 4, 155, 2),
+('體驗', '체험', 631, 4, 155, 2),
+('長官', '장관', 632, 4, 154, 2),
+('高血壓', '고혈압', 633, 4, 153, 2),
+('有名', '유명', 634, 4, 151, 2),
+('外觀', '외관', 635, 4, 150, 2),
+('靑少年', '청소년', 636, 4, 149, 2),
+('作業', '작업', 637, 4, 148, 2),
+('名士', '명사', 638, 4, 147, 2),
+('本線', '본선', 639, 4, 147, 2),
+('成年', '성년', 640, 4, 147, 2),
+('發明', '발명', 641, 4, 145, 2),
+('道德', '도덕', 642, 4, 144, 2),
+('蠻行', '만행', 643, 4, 144, 2),
+('眞心', '진심', 644, 4, 144, 2),
+('輸入品', '수입품', 645, 4, 144, 2),
+('農事', '농사', 646, 4, 143, 2),
+('放出', '방출', 647, 4, 143, 2),
+('公平', '공평', 648, 4, 142, 2),
+('不貞', '부정', 649, 4, 142, 2),
+('道具', '도구', 650, 4, 141, 2),
+('魔法', '마법', 651, 4, 141, 2),
+('複道', '복도', 652, 4, 141, 2),
+('流入', '유입', 653, 4, 141, 2),
+('音盤', '음반', 654, 4, 141, 2),
+('日程', '일정', 655, 4, 141, 2),
+('冷氣', '냉기', 656, 4, 140, 2),
+('武力', '무력', 657, 4, 140, 2),
+('事例', '사례', 658, 4, 140, 2),
+('無能', '무능', 659, 4, 139, 2),
+('法則', '법칙', 660, 4, 139, 2),
+('入場', '입장', 661, 4, 137, 2),
+('會議', '회의', 662, 4, 136, 2),
+('展示會', '전시회', 663, 4, 136, 2),
+('射出', '사출', 664, 4, 135, 2),
+('時計', '시계', 665, 4, 135, 2),
+('利用', '이용', 666, 4, 135, 2),
+('正面', '정면', 667, 4, 135, 2),
+('海馬', '해마', 668, 4, 135, 2),
+('農民', '농민', 669, 4, 134, 2),
+('一見', '일견', 670, 4, 134, 2),
+('講義', '강의', 671, 4, 133, 2),
+('問題點', '문제점', 672, 4, 133, 2),
+('氣絶', '기절', 673, 4, 132, 2),
+('神話', '신화', 674, 4, 130, 2),
+('處女', '처녀', 675, 4, 130, 2),
+('洋食', '양식', 676, 4, 129, 2),
+('作品', '작품', 677, 4, 129, 2),
+('定期', '정기', 678, 4, 129, 2),
+('法廷', '법정', 679, 4, 128, 2),
+('和合', '화합', 680, 4, 127, 2),
+('交代', '교대', 681, 4, 126, 2),
+('分裂', '분열', 682, 4, 126, 2),
+('事件', '사건', 683, 4, 125, 2),
+('神父', '신부', 684, 4, 125, 2),
+('同情', '동정', 685, 4, 124, 2),
+('觀光客', '관광객', 686, 4, 124, 2),
+('南部', '남부', 687, 4, 123, 2),
+('操心', '조심', 688, 4, 123, 2),
+('魅力', '매력', 689, 4, 119, 2),
+('敎養', '교양', 690, 4, 118, 2),
+('努力', '노력', 691, 4, 118, 2),
+('騷音', '소음', 692, 4, 118, 2),
+('正式', '정식', 693, 4, 118, 2),
+('脫出', '탈출', 694, 4, 118, 2),
+('室內', '실내', 695, 4, 117, 2),
+('延長', '연장', 696, 4, 117, 2),
+('全盛期', '전성기', 697, 4, 117, 2),
+('發見', '발견', 698, 4, 116, 2),
+('放送社', '방송사', 699, 4, 116, 2),
+('出版', '출판', 700, 4, 114, 2),
+('公害', '공해', 701, 4, 113, 2),
+('入社', '입사', 702, 4, 113, 2),
+('後期', '후기', 703, 4, 113, 2),
+('外', '외', 704, 4, 112, 2),
+('史上', '사상', 705, 4, 112, 2),
+('所望', '소망', 706, 4, 112, 2),
+('有利', '유리', 707, 4, 111, 2),
+('立場', '입장', 708, 4, 111, 2),
+('特定', '특정', 709, 4, 111, 2),
+('形便', '형편', 710, 4, 111, 2),
+('流星', '유성', 711, 4, 110, 2),
+('器具', '기구', 712, 4, 109, 2),
+('內科', '내과', 713, 4, 108, 2),
+('神奇', '신기', 714, 4, 106, 2),
+('最高', '최고', 715, 4, 106, 2),
+('前期', '전기', 716, 4, 105, 2),
+('高級', '고급', 717, 4, 104, 2),
+('假定', '가정', 718, 4, 103, 2),
+('鬼神', '귀신', 719, 4, 103, 2),
+('當場', '당장', 720, 4, 103, 2),
+('正當', '정당', 721, 4, 103, 2),
+('通話', '통화', 722, 4, 103, 2),
+('口傳', '구전', 723, 4, 102, 2),
+('變形', '변형', 724, 4, 102, 2),
+('通過', '통과', 725, 4, 102, 2),
+('解說', '해설', 726, 4, 102, 2),
+('保全', '보전', 727, 4, 101, 2),
+('媤父母', '시부모', 728, 4, 100, 2),
+('停留場', '정류장', 729, 4, 100, 2),
+('實習', '실습', 730, 4, 99, 2),
+('政治', '정치', 731, 4, 99, 2),
+('陶瓷器', '도자기', 732, 4, 98, 2),
+('議員', '의원', 733, 4, 97, 2),
+('四方', '사방', 734, 4, 96, 2),
+('引下', '인하', 735, 4, 95, 2),
+('將軍', '장군', 736, 4, 95, 2),
+('戰鬪', '전투', 737, 4, 95, 2),
+('製品', '제품', 738, 4, 95, 2),
+('便安', '편안', 739, 4, 95, 2),
+('姑母夫', '고모부', 740, 4, 95, 2),
+('頭目', '두목', 741, 4, 94, 2),
+('發揮', '발휘', 742, 4, 94, 2),
+('食糧', '식량', 743, 4, 94, 2),
+('下宿', '하숙', 744, 4, 94, 2),
+('格言', '격언', 745, 4, 93, 2),
+('計算', '계산', 746, 4, 93, 2),
+('同胞', '동포', 747, 4, 93, 2),
+('月貰', '월세', 748, 4, 93, 2),
+('節制', '절제', 749, 4, 93, 2),
+('向上', '향상', 750, 4, 93, 2),
+('商品', '상품', 751, 4, 92, 2),
+('效用', '효용', 752, 4, 92, 2),
+('軍港', '군항', 753, 4, 91, 2),
+('成果', '성과', 754, 4, 91, 2),
+('專用', '전용', 755, 4, 91, 2),
+('前進', '전진', 756, 4, 91, 2),
+('見解', '견해', 757, 4, 89, 2),
+('二重', '이중', 758, 4, 89, 2),
+('種類', '종류', 759, 4, 89, 2),
+('協定', '협정', 760, 4, 89, 2),
+('小型', '소형', 761, 4, 88, 2),
+('王位', '왕위', 762, 4, 88, 2),
+('正答', '정답', 763, 4, 88, 2),
+('頂上', '정상', 764, 4, 87, 2),
+('風俗', '풍속', 765, 4, 87, 2),
+('紀元前', '기원전', 766, 4, 87, 2),
+('反逆', '반역', 767, 4, 86, 2),
+('臣下', '신하', 768, 4, 85, 2),
+('解散', '해산', 769, 4, 84, 2),
+('局面', '국면', 770, 4, 83, 2),
+('登記', '등기', 771, 4, 83, 2),
+('種族', '종족', 772, 4, 81, 2),
+('消防署', '소방서', 773, 4, 81, 2),
+('質問', '질문', 774, 4, 80, 2),
+('忠實', '충실', 775, 4, 80, 2),
+('斑點', '반점', 776, 4, 79, 2),
+('戀愛', '연애', 777, 4, 78, 2),
+('重罪', '중죄', 778, 4, 78, 2),
+('焦點', '초점', 779, 4, 78, 2),
+('鮮明', '선명', 780, 4, 77, 2),
+('侵入', '침입', 781, 4, 77, 2),
+('敵對', '적대', 782, 4, 76, 2),
+('價値觀', '가치관', 783, 4, 76, 2),
+('期限', '기한', 784, 4, 75, 2),
+('保護', '보호', 785, 4, 75, 2),
+('意味', '의미', 786, 4, 75, 2),
+('絶對', '절대', 787, 4, 75, 2),
+('製造', '제조', 788, 4, 75, 2),
+('總角', '총각', 789, 4, 75, 2),
+('技術', '기술', 790, 4, 74, 2),
+('完全', '완전', 791, 4, 74, 2),
+('適應', '적응', 792, 4, 74, 2),
+('內需', '내수', 793, 4, 73, 2),
+('獨身', '독신', 794, 4, 73, 2),
+('完成', '완성', 795, 4, 73, 2),
+('超短波', '초단파', 796, 4, 73, 2),
+('期待', '기대', 797, 4, 72, 2),
+('反省', '반성', 798, 4, 72, 2),
+('首相', '수상', 799, 4, 72, 2),
+('新郞', '신랑', 800, 4, 72, 2),
+('回轉', '회전', 801, 4, 72, 2),
+('惡魔', '악마', 802, 4, 71, 2),
+('湖南', '호남', 803, 4, 71, 2),
+('方向', '방향', 804, 4, 70, 2),
+('融解', '융해', 805, 4, 70, 2),
+('硏究室', '연구실', 806, 4, 70, 2),
+('腹部', '복부', 807, 4, 69, 2),
+('反', '반', 808, 4, 68, 2),
+('部署', '부서', 809, 4, 68, 2),
+('保守', '보수', 810, 4, 67, 2),
+('實踐', '실천', 811, 4, 67, 2),
+('觀念', '관념', 812, 4, 66, 2),
+('演說', '연설', 813, 4, 66, 2),
+('以前', '이전', 814, 4, 66, 2),
+('太陽', '태양', 815, 4, 66, 2),
+('目錄', '목록', 816, 4, 65, 2),
+('確立', '확립', 817, 4, 65, 2),
+('當然', '당연', 818, 4, 64, 2),
+('背信', '배신', 819, 4, 64, 2),
+('失職', '실직', 820, 4, 64, 2),
+('豫約', '예약', 821, 4, 64, 2),
+('休紙', '휴지', 822, 4, 64, 2),
+('密接', '밀접', 823, 4, 63, 2),
+('兵卒', '병졸', 824, 4, 63, 2),
+('爆彈', '폭탄', 825, 4, 63, 2),
+('簡素', '간소', 826, 4, 62, 2),
+('經費', '경비', 827, 4, 62, 2),
+('待接', '대접', 828, 4, 62, 2),
+('使命', '사명', 829, 4, 62, 2),
+('材料', '재료', 830, 4, 62, 2),
+('程度', '정도', 831, 4, 62, 2),
+('過去', '과거', 832, 4, 61, 2),
+('痲藥', '마약', 833, 4, 61, 2),
+('饅頭', '만두', 834, 4, 61, 2),
+('埠頭', '부두', 835, 4, 61, 2),
+('諒解', '양해', 836, 4, 61, 2),
+('財産', '재산', 837, 4, 61, 2),
+('情慾', '정욕', 838, 4, 61, 2),
+('方舟', '방주', 839, 4, 60, 2),
+('變態', '변태', 840, 4, 60, 2),
+('受精', '수정', 841, 4, 60, 2),
+('談話', '담화', 842, 4, 59, 2),
+('報復', '보복', 843, 4, 59, 2),
+('突進', '돌진', 844, 4, 58, 2),
+('飮料', '음료', 845, 4, 58, 2),
+('平穩', '평온', 846, 4, 58, 2),
+('切斷', '절단', 847, 4, 57, 2),
+('初盤', '초반', 848, 4, 57, 2),
+('夢想', '몽상', 849, 4, 56, 2),
+('烽火', '봉화', 850, 4, 55, 2),
+('指導', '지도', 851, 4, 55, 2),
+('回復', '회복', 852, 4, 55, 2),
+('素朴', '소박', 853, 4, 54, 2),
+('要請', '요청', 854, 4, 54, 2),
+('最低', '최저', 855, 4, 54, 2),
+('轉換', '전환', 856, 4, 53, 2),
+('燈油', '등유', 857, 4, 52, 2),
+('評價', '평가', 858, 4, 52, 2),
+('試圖', '시도', 859, 4, 51, 2),
+('彩度', '채도', 860, 4, 51, 2),
+('共謀', '공모', 861, 4, 50, 2),
+('符號', '부호', 862, 4, 50, 2),
+('僞造', '위조', 863, 4, 50, 2),
+('注目', '주목', 864, 4, 50, 2),
+('紙幣', '지폐', 865, 4, 50, 2),
+('男妹', '남매', 866, 4, 49, 2),
+('默殺', '묵살', 867, 4, 49, 2),
+('聯邦', '연방', 868, 4, 49, 2),
+('便宜', '편의', 869, 4, 49, 2),
+('多樣', '다양', 870, 4, 48, 2),
+('蔑視', '멸시', 871, 4, 48, 2),
+('演劇', '연극', 872, 4, 48, 2),
+('開始', '개시', 873, 4, 47, 2),
+('勤務', '근무', 874, 4, 47, 2),
+('應募', '응모', 875, 4, 47, 2),
+('慾望', '욕망', 876, 4, 46, 2),
+('失策', '실책', 877, 4, 45, 2),
+('優勝', '우승', 878, 4, 45, 2),
+('除去', '제거', 879, 4, 45, 2),
+('初步', '초보', 880, 4, 45, 2),
+('男', '남', 881, 4, 44, 2),
+('求婚', '구혼', 882, 4, 44, 2),
+('度', '도', 883, 4, 43, 2),
+('位', '위', 884, 4, 43, 2),
+('俗談', '속담', 885, 4, 43, 2),
+('禮儀', '예의', 886, 4, 43, 2),
+('確認', '확인', 887, 4, 43, 2),
+('酒宴', '주연', 888, 4, 42, 2),
+('變遷', '변천', 889, 4, 41, 2),
+('裝置', '장치', 890, 4, 41, 2),
+('提案', '제안', 891, 4, 41, 2),
+('就職', '취직', 892, 4, 41, 2),
+('回顧', '회고', 893, 4, 41, 2),
+('號', '호', 894, 4, 40, 2),
+('考案', '고안', 895, 4, 40, 2),
+('複雜', '복잡', 896, 4, 40, 2),
+('需要', '수요', 897, 4, 40, 2),
+('判決', '판결', 898, 4, 40, 2),
+('戱曲', '희곡', 899, 4, 40, 2),
+('亡靈', '망령', 900, 4, 39, 2),
+('報酬', '보수', 901, 4, 39, 2),
+('陰曆', '음력', 902, 4, 39, 2),
+('契約', '계약', 903, 4, 38, 2),
+('攻擊', '공격', 904, 4, 38, 2),
+('聯絡', '연락', 905, 4, 38, 2),
+('于先', '우선', 906, 4, 38, 2),
+('遺跡', '유적', 907, 4, 38, 2),
+('示威', '시위', 908, 4, 37, 2),
+('陳列', '진열', 909, 4, 37, 2),
+('特殊', '특수', 910, 4, 37, 2),
+('衰弱', '쇠약', 911, 4, 36, 2),
+('監禁', '감금', 912, 4, 35, 2),
+('訪問', '방문', 913, 4, 35, 2),
+('沐浴湯', '목욕탕', 914, 4, 35, 2),
+('槪念', '개념', 915, 4, 34, 2),
+('克服', '극복', 916, 4, 34, 2),
+('冷麵', '냉면', 917, 4, 34, 2),
+('展示', '전시', 918, 4, 34, 2),
+('宗派', '종파', 919, 4, 34, 2),
+('警戒', '경계', 920, 4, 33, 2),
+('漫畵', '만화', 921, 4, 33, 2),
+('哀願', '애원', 922, 4, 33, 2),
+('演壇', '연단', 923, 4, 33, 2),
+('參考', '참고', 924, 4, 33, 2),
+('波紋', '파문', 925, 4, 33, 2),
+('筆筒', '필통', 926, 4, 33, 2),
+('妊娠婦', '임신부', 927, 4, 33, 2),
+('講堂', '강당', 928, 4, 32, 2),
+('裝飾', '장식', 929, 4, 32, 2),
+('診察', '진찰', 930, 4, 32, 2),
+('鬪爭', '투쟁', 931, 4, 32, 2),
+('根源', '근원', 932, 4, 31, 2),
+('答辯', '답변', 933, 4, 31, 2),
+('幽靈', '유령', 934, 4, 31, 2),
+('殘餘', '잔여', 935, 4, 31, 2),
+('請求', '청구', 936, 4, 31, 2),
+('衝擊', '충격', 937, 4, 31, 2),
+('波濤', '파도', 938, 4, 31, 2),
+('默認', '묵인', 939, 4, 30, 2),
+('妨害', '방해', 940, 4, 30, 2),
+('優雅', '우아', 941, 4, 30, 2),
+('害', '해', 942, 4, 29, 2),
+('警笛', '경적', 943, 4, 29, 2),
+('組織', '조직', 944, 4, 29, 2),
+('省略', '생략', 945, 4, 28, 2),
+('收穫', '수확', 946, 4, 28, 2),
+('仔細', '자세', 947, 4, 28, 2),
+('幸福', '행복', 948, 4, 28, 2),
+('奇襲', '기습', 949, 4, 27, 2),
+('積載', '적재', 950, 4, 27, 2),
+('講座', '강좌', 951, 4, 26, 2),
+('近郊', '근교', 952, 4, 26, 2),
+('罪悚', '죄송', 953, 4, 26, 2),
+('歎願', '탄원', 954, 4, 26, 2),
+('葡萄', '포도', 955, 4, 25, 2),
+('香', '향', 956, 4, 24, 2),
+('描寫', '묘사', 957, 4, 24, 2),
+('探究', '탐구', 958, 4, 24, 2),
+('劇', '극', 959, 4, 23, 2),
+('旗', '기', 960, 4, 22, 2),
+('番', '번', 961, 4, 22, 2),
+('排斥', '배척', 962, 4, 22, 2),
+('型', '형', 963, 4, 21, 2),
+('模範', '모범', 964, 4, 21, 2),
+('周邊', '주변', 965, 4, 21, 2),
+('嗜好', '기호', 966, 4, 20, 2),
+('維持', '유지', 967, 4, 20, 2),
+('搾取', '착취', 968, 4, 20, 2),
+('輕蔑', '경멸', 969, 4, 19, 2),
+('懲役', '징역', 970, 4, 19, 2),
+('忠誠', '충성', 971, 4, 19, 2),
+('壁', '벽', 972, 4, 18, 2),
+('賞', '상', 973, 4, 18, 2),
+('銃', '총', 974, 4, 18, 2),
+('媤宅', '시댁', 975, 4, 18, 2),
+('宇宙', '우주', 976, 4, 18, 2),
+('興奮', '흥분', 977, 4, 18, 2),
+('末', '말', 978, 4, 17, 2),
+('福', '복', 979, 4, 17, 2),
+('敵', '적', 980, 4, 17, 2),
+('彫刻', '조각', 981, 4, 17, 2),
+('卒倒', '졸도', 982, 4, 17, 2),
+('註釋', '주석', 983, 4, 17, 2),
+('趣向', '취향', 984, 4, 17, 2),
+('閉鎖', '폐쇄', 985, 4, 17, 2),
+('必須', '필수', 986, 4, 17, 2),
+('移徙', '이사', 987, 4, 15, 2),
+('委託', '위탁', 988, 4, 14, 2),
+('威脅', '위협', 989, 4, 14, 2),
+('張', '장', 990, 4, 12, 2),
+('缺乏', '결핍', 991, 4, 12, 2),
+('沿革', '연혁', 992, 4, 12, 2),
+('諷刺', '풍자', 993, 4, 12, 2),
+('宅', '댁', 994, 4, 11, 2),
+('昏迷', '혼미', 995, 4, 11, 2),
+('脅迫', '협박', 996, 4, 10, 2),
+('束縛', '속박', 997, 4, 9, 2),
+('匣', '갑', 998, 4, 6, 2),
+('卷', '권', 999, 4, 6, 2),
+('各各', '각각', 1000, 4, 6, 2),
+('雇傭', '고용', 1001, 4, 6, 2),
+('傲慢', '오만', 1002, 4, 6, 2),
+('班', '반', 1003, 4, 5, 2),
+('怯', '겁', 1004, 4, 4, 2),
+('秒', '초', 1005, 4, 4, 2),
+('懺悔', '참회', 1006, 4, 4, 2),
+('漆', '칠', 1007, 4, 3, 2),
+('鬚髥', '수염', 1008, 4, 3, 2),
+('麒麟', '기린', 1009, 4, 2, 2),
+('徐徐', '서서', 1010, 4, 2, 2),
+('大學生', '대학생', 1011, 3, 662, 2),
+('無能力者', '무능력자', 1012, 3, 582, 2),
+('生産者', '생산자', 1013, 3, 561, 2),
+('大學院', '대학원', 1014, 3, 507, 2),
+('個人的', '개인적', 1015, 3, 505, 2),
+('勞動者', '노동자', 1016, 3, 501, 2),
+('人山人海', '인산인해', 1017, 3, 491, 2),
+('炭水化物', '탄수화물', 1018, 3, 491, 2),
+('所有者', '소유자', 1019, 3, 459, 2),
+('韓國語', '한국어', 1020, 3, 441, 2),
+('有權者', '유권자', 1021, 3, 440, 2),
+('産婦人科', '산부인과', 1022, 3, 431, 2),
+('社會主義', '사회주의', 1023, 3, 429, 2),
+('職場人', '직장인', 1024, 3, 425, 2),
+('人民', '인민', 1025, 3, 424, 2),
+('學用品', '학용품', 1026, 3, 423, 2),
+('運轉者', '운전자', 1027, 3, 401, 2),
+('熱狂者', '열광자', 1028, 3, 400, 2),
+('後繼者', '후계자', 1029, 3, 396, 2),
+('軍人', '군인', 1030, 3, 395, 2),
+('人員', '인원', 1031, 3, 382, 2),
+('人工', '인공', 1032, 3, 381, 2),
+('合理的', '합리적', 1033, 3, 381, 2),
+('關係者', '관계자', 1034, 3, 374, 2),
+('學父母', '학부모', 1035, 3, 374, 2),
+('獨裁者', '독재자', 1036, 3, 372, 2),
+('大部分', '대부분', 1037, 3, 368, 2),
+('人相', '인상', 1038, 3, 367, 2),
+('人種', '인종', 1039, 3, 365, 2),
+('類人猿', '유인원', 1040, 3, 363, 2),
+('貴婦人', '귀부인', 1041, 3, 361, 2),
+('殺人', '살인', 1042, 3, 358, 2),
+('負傷者', '부상자', 1043, 3, 356, 2),
+('國內線', '국내선', 1044, 3, 355, 2),
+('聖人', '성인', 1045, 3, 354, 2),
+('人格', '인격', 1046, 3, 352, 2),
+('入學', '입학', 1047, 3, 349, 2),
+('使者', '사자', 1048, 3, 347, 2),
+('走者', '주자', 1049, 3, 345, 2),
+('一時的', '일시적', 1050, 3, 342, 2),
+('隱者', '은자', 1051, 3, 339, 2),
+('藥學', '약학', 1052, 3, 338, 2),
+('患者', '환자', 1053, 3, 334, 2),
+('大多數', '대다수', 1054, 3, 334, 2),
+('丈人', '장인', 1055, 3, 327, 2),
+('具體的', '구체적', 1056, 3, 327, 2),
+('國民', '국민', 1057, 3, 326, 2),
+('大衆交通', '대중교통', 1058, 3, 324, 2),
+('出國', '출국', 1059, 3, 321, 2),
+('學習', '학습', 1060, 3, 313, 2),
+('學級', '학급', 1061, 3, 312, 2),
+('學問', '학문', 1062, 3, 312, 2),
+('學識', '학식', 1063, 3, 310, 2),
+('公國', '공국', 1064, 3, 305, 2),
+('學費', '학비', 1065, 3, 299, 2),
+('大會', '대회', 1066, 3, 296, 2),
+('一生', '일생', 1067, 3, 293, 2),
+('行動', '행동', 1068, 3, 290, 2),
+('入國', '입국', 1069, 3, 289, 2),
+('無神論', '무신론', 1070, 3, 284, 2),
+('本格的', '본격적', 1071, 3, 283, 2),
+('大企業', '대기업', 1072, 3, 281, 2),
+('流行病', '유행병', 1073, 3, 280, 2),
+('卒業生', '졸업생', 1074, 3, 279, 2),
+('地下鐵', '지하철', 1075, 3, 277, 2),
+('國産', '국산', 1076, 3, 270, 2),
+('飮食物', '음식물', 1077, 3, 267, 2),
+('海水浴', '해수욕', 1078, 3, 266, 2),
+('一口二言', '일구이언', 1079, 3, 262, 2),
+('不法', '불법', 1080, 3, 261, 2),
+('體力', '체력', 1081, 3, 261, 2),
+('國土', '국토', 1082, 3, 260, 2),
+('生放送', '생방송', 1083, 3, 258, 2),
+('一石二鳥', '일석이조', 1084, 3, 251, 2),
+('天體', '천체', 1085, 3, 249, 2),
+('無關心', '무관심', 1086, 3, 245, 2),
+('祖國', '조국', 1087, 3, 242, 2),
+('原子', '원자', 1088, 3, 241, 2),
+('生活費', '생활비', 1089, 3, 241, 2),
+('大量', '대량', 1090, 3, 240, 2),
+('素粒子', '소립자', 1091, 3, 240, 2),
+('交通事故', '교통사고', 1092, 3, 240, 2),
+('心理', '심리', 1093, 3, 239, 2),
+('農産物', '농산물', 1094, 3, 239, 2),
+('高地', '고지', 1095, 3, 238, 2),
+('下水', '하수', 1096, 3, 237, 2),
+('歸國', '귀국', 1097, 3, 236, 2),
+('本性', '본성', 1098, 3, 235, 2),
+('降水量', '강수량', 1099, 3, 230, 2),
+('公休日', '공휴일', 1100, 3, 229, 2),
+('公衆電話', '공중전화', 1101, 3, 228, 2),
+('感動', '감동', 1102, 3, 227, 2),
+('機關車', '기관차', 1103, 3, 227, 2),
+('業體', '업체', 1104, 3, 224, 2),
+('物品', '물품', 1105, 3, 223, 2),
+('生活', '생활', 1106, 3, 223, 2),
+('大規模', '대규모', 1107, 3, 223, 2),
+('主權', '주권', 1108, 3, 222, 2),
+('共生', '공생', 1109, 3, 221, 2),
+('大砲', '대포', 1110, 3, 221, 2),
+('小說家', '소설가', 1111, 3, 221, 2),
+('動作', '동작', 1112, 3, 220, 2),
+('水門', '수문', 1113, 3, 215, 2),
+('家長', '가장', 1114, 3, 213, 2),
+('公理', '공리', 1115, 3, 213, 2),
+('不定', '부정', 1116, 3, 212, 2),
+('實體', '실체', 1117, 3, 210, 2),
+('音色', '음색', 1118, 3, 209, 2),
+('食事', '식사', 1119, 3, 207, 2),
+('不正', '부정', 1120, 3, 205, 2),
+('定理', '정리', 1121, 3, 205, 2),
+('標語', '표어', 1122, 3, 205, 2),
+('發音', '발음', 1123, 3, 204, 2),
+('治水', '치수', 1124, 3, 204, 2),
+('土地', '토지', 1125, 3, 204, 2),
+('生存', '생존', 1126, 3, 203, 2),
+('略語', '약어', 1127, 3, 203, 2),
+('劇作家', '극작가', 1128, 3, 203, 2),
+('遺跡地', '유적지', 1129, 3, 203, 2),
+('團地', '단지', 1130, 3, 202, 2),
+('水路', '수로', 1131, 3, 202, 2),
+('會長', '회장', 1132, 3, 202, 2),
+('車道', '차도', 1133, 3, 201, 2),
+('門外漢', '문외한', 1134, 3, 201, 2),
+('臺地', '대지', 1135, 3, 200, 2),
+('食料品', '식료품', 1136, 3, 200, 2),
+('品行', '품행', 1137, 3, 199, 2),
+('擴大', '확대', 1138, 3, 199, 2),
+('戰利品', '전리품', 1139, 3, 199, 2),
+('大赦', '대사', 1140, 3, 198, 2),
+('飛行船', '비행선', 1141, 3, 198, 2),
+('領主', '영주', 1142, 3, 197, 2),
+('性別', '성별', 1143, 3, 196, 2),
+('子息', '자식', 1144, 3, 196, 2),
+('處地', '처지', 1145, 3, 196, 2),
+('航空機', '항공기', 1146, 3, 196, 2),
+('不平', '불평', 1147, 3, 194, 2),
+('熱中', '열중', 1148, 3, 194, 2),
+('中間', '중간', 1149, 3, 194, 2),
+('中部', '중부', 1150, 3, 194, 2),
+('物價', '물가', 1151, 3, 193, 2),
+('化粧室', '화장실', 1152, 3, 193, 2),
+('女神', '여신', 1153, 3, 191, 2),
+('感氣', '감기', 1154, 3, 190, 2),
+('軍事', '군사', 1155, 3, 190, 2),
+('變動', '변동', 1156, 3, 190, 2),
+('主題', '주제', 1157, 3, 190, 2),
+('敎會', '교회', 1158, 3, 188, 2),
+('身體', '신체', 1159, 3, 188, 2),
+('橫斷步道', '횡단보도', 1160, 3, 188, 2),
+('番地', '번지', 1161, 3, 187, 2),
+('子孫', '자손', 1162, 3, 187, 2),
+('陸地', '육지', 1163, 3, 186, 2),
+('化身', '화신', 1164, 3, 186, 2),
+('不安', '불안', 1165, 3, 185, 2),
+('地區', '지구', 1166, 3, 185, 2),
+('帽子', '모자', 1167, 3, 184, 2),
+('內外', '내외', 1168, 3, 182, 2),
+('酸化', '산화', 1169, 3, 181, 2),
+('貨物', '화물', 1170, 3, 181, 2),
+('自然環境', '자연환경', 1171, 3, 181, 2),
+('箱子', '상자', 1172, 3, 180, 2),
+('點數', '점수', 1173, 3, 179, 2),
+('地域', '지역', 1174, 3, 179, 2),
+('氣品', '기품', 1175, 3, 178, 2),
+('不和', '불화', 1176, 3, 178, 2),
+('無用', '무용', 1177, 3, 177, 2),
+('乘用車', '승용차', 1178, 3, 177, 2),
+('發電', '발전', 1179, 3, 176, 2),
+('植物', '식물', 1180, 3, 176, 2),
+('體格', '체격', 1181, 3, 176, 2),
+('行進', '행진', 1182, 3, 176, 2),
+('專門家', '전문가', 1183, 3, 176, 2),
+('水準', '수준', 1184, 3, 173, 2),
+('個性', '개성', 1185, 3, 171, 2),
+('外部', '외부', 1186, 3, 171, 2),
+('意義', '의의', 1187, 3, 171, 2),
+('策動', '책동', 1188, 3, 171, 2),
+('穀物', '곡물', 1189, 3, 170, 2),
+('肉體', '육체', 1190, 3, 170, 2),
+('陣地', '진지', 1191, 3, 170, 2),
+('市議會', '시의회', 1192, 3, 170, 2),
+('高名', '고명', 1193, 3, 168, 2),
+('水痘', '수두', 1194, 3, 168, 2),
+('暴行', '폭행', 1195, 3, 168, 2),
+('體積', '체적', 1196, 3, 167, 2),
+('洪水', '홍수', 1197, 3, 167, 2),
+('新製品', '신제품', 1198, 3, 167, 2),
+('事前', '사전', 1199, 3, 166, 2),
+('氣質', '기질', 1200, 3, 165, 2),
+('體育', '체육', 1201, 3, 165, 2),
+('會員', '회원', 1202, 3, 165, 2),
+('力量', '역량', 1203, 3, 164, 2),
+('自治', '자치', 1204, 3, 163, 2),
+('屬性', '속성', 1205, 3, 161, 2),
+('能力', '능력', 1206, 3, 160, 2),
+('身分', '신분', 1207, 3, 160, 2),
+('中盤', '중반', 1208, 3, 160, 2),
+('部長', '부장', 1209, 3, 159, 2),
+('出口', '출구', 1210, 3, 159, 2),
+('出版社', '출판사', 1211, 3, 159, 2),
+('從業員', '종업원', 1212, 3, 158, 2),
+('法院', '법원', 1213, 3, 157, 2),
+('無窮花', '무궁화', 1214, 3, 156, 2),
+('總理', '총리', 1215, 3, 155, 2),
+('石炭酸', '석탄산', 1216, 3, 155, 2),
+('機能', '기능', 1217, 3, 154, 2),
+('活力', '활력', 1218, 3, 154, 2),
+('間食', '간식', 1219, 3, 152, 2),
+('義務', '의무', 1220, 3, 152, 2),
+('自然', '자연', 1221, 3, 152, 2),
+('媒體', '매체', 1222, 3, 151, 2),
+('淸掃機', '청소기', 1223, 3, 151, 2),
+('機關', '기관', 1224, 3, 150, 2),
+('道標', '도표', 1225, 3, 150, 2),
+('樂器', '악기', 1226, 3, 150, 2),
+('競爭力', '경쟁력', 1227, 3, 150, 2),
+('分配', '분배', 1228, 3, 149, 2),
+('精力', '정력', 1229, 3, 149, 2),
+('中耳', '중이', 1230, 3, 149, 2),
+('百日咳', '백일해', 1231, 3, 149, 2),
+('關心', '관심', 1232, 3, 148, 2),
+('發言', '발언', 1233, 3, 148, 2),
+('時代', '시대', 1234, 3, 148, 2),
+('天狼星', '천랑성', 1235, 3, 148, 2),
+('草綠色', '초록색', 1236, 3, 148, 2),
+('不幸', '불행', 1237, 3, 147, 2),
+('二心', '이심', 1238, 3, 147, 2),
+('無情', '무정', 1239, 3, 146, 2),
+('色素', '색소', 1240, 3, 146, 2),
+('天命', '천명', 1241, 3, 146, 2),
+('出身', '출신', 1242, 3, 145, 2),
+('公言', '공언', 1243, 3, 144, 2),
+('時點', '시점', 1244, 3, 144, 2),
+('女王', '여왕', 1245, 3, 144, 2),
+('行爲', '행위', 1246, 3, 144, 2),
+('數十', '수십', 1247, 3, 143, 2),
+('先入觀', '선입관', 1248, 3, 143, 2),
+('勞力', '노력', 1249, 3, 141, 2),
+('萬一', '만일', 1250, 3, 141, 2),
+('整理', '정리', 1251, 3, 141, 2),
+('檢事', '검사', 1252, 3, 140, 2),
+('多數', '다수', 1253, 3, 140, 2),
+('世代', '세대', 1254, 3, 140, 2),
+('合成', '합성', 1255, 3, 140, 2),
+('香氣', '향기', 1256, 3, 140, 2),
+('市民', '시민', 1257, 3, 139, 2),
+('點線', '점선', 1258, 3, 139, 2),
+('週日', '주일', 1259, 3, 139, 2),
+('美術館', '미술관', 1260, 3, 139, 2),
+('飮食店', '음식점', 1261, 3, 139, 2),
+('便器', '변기', 1262, 3, 138, 2),
+('回數', '횟수', 1263, 3, 138, 2),
+('男色', '남색', 1264, 3, 137, 2),
+('名節', '명절', 1265, 3, 136, 2),
+('外資', '외자', 1266, 3, 136, 2),
+('高原', '고원', 1267, 3, 135, 2),
+('德分', '덕분', 1268, 3, 135, 2),
+('中庸', '중용', 1269, 3, 135, 2),
+('核心', '핵심', 1270, 3, 135, 2),
+('決心', '결심', 1271, 3, 134, 2),
+('記入', '기입', 1272, 3, 134, 2),
+('議長', '의장', 1273, 3, 134, 2),
+('韓食', '한식', 1274, 3, 134, 2),
+('美容室', '미용실', 1275, 3, 134, 2),
+('新聞社', '신문사', 1276, 3, 134, 2),
+('公式', '공식', 1277, 3, 133, 2),
+('分派', '분파', 1278, 3, 133, 2),
+('書店', '서점', 1279, 3, 132, 2),
+('料金', '요금', 1280, 3, 132, 2),
+('單一', '단일', 1281, 3, 131, 2),
+('協力', '협력', 1282, 3, 131, 2),
+('乳製品', '유제품', 1283, 3, 131, 2),
+('濕氣', '습기', 1284, 3, 130, 2),
+('利點', '이점', 1285, 3, 130, 2),
+('判事', '판사', 1286, 3, 130, 2),
+('接頭辭', '접두사', 1287, 3, 130, 2),
+('內部', '내부', 1288, 3, 129, 2),
+('曜日', '요일', 1289, 3, 129, 2),
+('各自', '각자', 1290, 3, 128, 2),
+('每日', '매일', 1291, 3, 128, 2),
+('少數', '소수', 1292, 3, 128, 2),
+('時間', '시간', 1293, 3, 128, 2),
+('自慢', '자만', 1294, 3, 128, 2),
+('刑事', '형사', 1295, 3, 128, 2),
+('申請書', '신청서', 1296, 3, 128, 2),
+('機構', '기구', 1297, 3, 127, 2),
+('夜會', '야회', 1298, 3, 127, 2),
+('業種', '업종', 1299, 3, 127, 2),
+('勇氣', '용기', 1300, 3, 126, 2),
+('以外', '이외', 1301, 3, 126, 2),
+('電鐵', '전철', 1302, 3, 126, 2),
+('電話', '전화', 1303, 3, 126, 2),
+('安定', '안정', 1304, 3, 125, 2),
+('執事', '집사', 1305, 3, 125, 2),
+('靑年', '청년', 1306, 3, 125, 2),
+('家庭', '가정', 1307, 3, 123, 2),
+('感情', '감정', 1308, 3, 123, 2),
+('本來', '본래', 1309, 3, 123, 2),
+('論題', '논제', 1310, 3, 122, 2),
+('方面', '방면', 1311, 3, 122, 2),
+('時期', '시기', 1312, 3, 122, 2),
+('血球', '혈구', 1313, 3, 122, 2),
+('博覽會', '박람회', 1314, 3, 122, 2),
+('現代', '현대', 1315, 3, 121, 2),
+('後世', '후세', 1316, 3, 121, 2),
+('交流', '교류', 1317, 3, 120, 2),
+('移民', '이민', 1318, 3, 120, 2),
+('會衆', '회중', 1319, 3, 120, 2),
+('光線', '광선', 1320, 3, 119, 2),
+('書評', '서평', 1321, 3, 119, 2),
+('選手', '선수', 1322, 3, 119, 2),
+('藥品', '약품', 1323, 3, 119, 2),
+('名稱', '명칭', 1324, 3, 118, 2),
+('外貌', '외모', 1325, 3, 118, 2),
+('前面', '전면', 1326, 3, 118, 2),
+('結婚式', '결혼식', 1327, 3, 118, 2),
+('機械', '기계', 1328, 3, 116, 2),
+('方言', '방언', 1329, 3, 116, 2),
+('北部', '북부', 1330, 3, 116, 2),
+('少年', '소년', 1331, 3, 116, 2),
+('除名', '제명', 1332, 3, 116, 2),
+('履歷書', '이력서', 1333, 3, 116, 2),
+('論評', '논평', 1334, 3, 115, 2),
+('所要', '소요', 1335, 3, 115, 2),
+('全部', '전부', 1336, 3, 115, 2),
+('論爭', '논쟁', 1337, 3, 114, 2),
+('武器', '무기', 1338, 3, 114, 2),
+('額數', '액수', 1339, 3, 114, 2),
+('天罰', '천벌', 1340, 3, 114, 2),
+('出勤', '출근', 1341, 3, 114, 2),
+('漢字', '한자', 1342, 3, 114, 2),
+('北斗七星', '북두칠성', 1343, 3, 114, 2),
+('觀點', '관점', 1344, 3, 113, 2),
+('小便', '소변', 1345, 3, 113, 2),
+('失手', '실수', 1346, 3, 113, 2),
+('第一', '제일', 1347, 3, 113, 2),
+('破傷風', '파상풍', 1348, 3, 113, 2),
+('課長', '과장', 1349, 3, 112, 2),
+('交通', '교통', 1350, 3, 112, 2),
+('期間', '기간', 1351, 3, 112, 2),
+('西部', '서부', 1352, 3, 112, 2),
+('適用', '적용', 1353, 3, 112, 2),
+('通信', '통신', 1354, 3, 112, 2),
+('見本', '견본', 1355, 3, 111, 2),
+('代價', '대가', 1356, 3, 111, 2),
+('讀本', '독본', 1357, 3, 111, 2),
+('百合', '백합', 1358, 3, 111, 2),
+('部門', '부문', 1359, 3, 111, 2),
+('商業', '상업', 1360, 3, 111, 2),
+('熱意', '열의', 1361, 3, 111, 2),
+('平素', '평소', 1362, 3, 111, 2),
+('爆發', '폭발', 1363, 3, 111, 2),
+('現場', '현장', 1364, 3, 111, 2),
+('後半', '후반', 1365, 3, 111, 2),
+('責任感', '책임감', 1366, 3, 111, 2),
+('空想', '공상', 1367, 3, 110, 2),
+('時節', '시절', 1368, 3, 110, 2),
+('約定', '약정', 1369, 3, 110, 2),
+('航海', '항해', 1370, 3, 110, 2),
+('託兒所', '탁아소', 1371, 3, 110, 2),
+('選定', '선정', 1372, 3, 109, 2),
+('實現', '실현', 1373, 3, 109, 2),
+('標本', '표본', 1374, 3, 109, 2),
+('客車', '객차', 1375, 3, 108, 2),
+('公差', '공차', 1376, 3, 108, 2),
+('社員', '사원', 1377, 3, 108, 2),
+('營業', '영업', 1378, 3, 108, 2),
+('統合', '통합', 1379, 3, 108, 2),
+('賣場', '매장', 1380, 3, 107, 2),
+('惡意', '악의', 1381, 3, 107, 2),
+('基本', '기본', 1382, 3, 106, 2),
+('書籍', '서적', 1383, 3, 106, 2),
+('一旦', '일단', 1384, 3, 106, 2),
+('戰略', '전략', 1385, 3, 106, 2),
+('職場', '직장', 1386, 3, 106, 2),
+('高速', '고속', 1387, 3, 105, 2),
+('無窮', '무궁', 1388, 3, 105, 2),
+('方式', '방식', 1389, 3, 105, 2),
+('四球', '사구', 1390, 3, 105, 2),
+('手票', '수표', 1391, 3, 105, 2),
+('食慾', '식욕', 1392, 3, 105, 2),
+('組合', '조합', 1393, 3, 105, 2),
+('休戰', '휴전', 1394, 3, 105, 2),
+('歲月', '세월', 1395, 3, 104, 2),
+('試合', '시합', 1396, 3, 104, 2),
+('月給', '월급', 1397, 3, 104, 2),
+('電燈', '전등', 1398, 3, 104, 2),
+('號線', '호선', 1399, 3, 104, 2),
+('當時', '당시', 1400, 3, 103, 2),
+('線路', '선로', 1401, 3, 103, 2),
+('證券社', '증권사', 1402, 3, 103, 2),
+('住所', '주소', 1403, 3, 102, 2),
+('投球', '투구', 1404, 3, 102, 2),
+('洗濯所', '세탁소', 1405, 3, 102, 2),
+('對立', '대립', 1406, 3, 101, 2),
+('對應', '대응', 1407, 3, 101, 2),
+('點檢', '점검', 1408, 3, 101, 2),
+('證言', '증언', 1409, 3, 101, 2),
+('討論', '토론', 1410, 3, 101, 2),
+('便利', '편리', 1411, 3, 101, 2),
+('血管', '혈관', 1412, 3, 101, 2),
+('硏究所', '연구소', 1413, 3, 101, 2),
+('曲解', '곡해', 1414, 3, 100, 2),
+('敎訓', '교훈', 1415, 3, 100, 2),
+('根本', '근본', 1416, 3, 100, 2),
+('所願', '소원', 1417, 3, 100, 2),
+('誘發', '유발', 1418, 3, 100, 2),
+('入院', '입원', 1419, 3, 100, 2),
+('製作', '제작', 1420, 3, 100, 2),
+('最小', '최소', 1421, 3, 100, 2),
+('警察官', '경찰관', 1422, 3, 100, 2),
+('狂犬病', '광견병', 1423, 3, 99, 2),
+('農場', '농장', 1424, 3, 98, 2),
+('每年', '매년', 1425, 3, 98, 2),
+('說明', '설명', 1426, 3, 98, 2),
+('限定', '한정', 1427, 3, 98, 2),
+('資格證', '자격증', 1428, 3, 98, 2),
+('加工', '가공', 1429, 3, 97, 2),
+('洗車', '세차', 1430, 3, 97, 2),
+('陸軍', '육군', 1431, 3, 97, 2),
+('脚本', '각본', 1432, 3, 96, 2),
+('內容', '내용', 1433, 3, 96, 2),
+('名銜', '명함', 1434, 3, 96, 2),
+('勿論', '물론', 1435, 3, 96, 2),
+('認定', '인정', 1436, 3, 96, 2),
+('暴風', '폭풍', 1437, 3, 96, 2),
+('世界', '세계', 1438, 3, 95, 2),
+('手淫', '수음', 1439, 3, 95, 2),
+('臺詞', '대사', 1440, 3, 94, 2),
+('保安', '보안', 1441, 3, 94, 2),
+('藥劑', '약제', 1442, 3, 94, 2),
+('歌詞', '가사', 1443, 3, 93, 2),
+('工夫', '공부', 1444, 3, 93, 2),
+('課業', '과업', 1445, 3, 93, 2),
+('敎授', '교수', 1446, 3, 93, 2),
+('賃金', '임금', 1447, 3, 93, 2),
+('最後', '최후', 1448, 3, 93, 2),
+('劇場', '극장', 1449, 3, 92, 2),
+('車窓', '차창', 1450, 3, 92, 2),
+('混合', '혼합', 1451, 3, 92, 2),
+('月', '월', 1452, 3, 91, 2),
+('計略', '계략', 1453, 3, 90, 2),
+('部處', '부처', 1454, 3, 90, 2),
+('要素', '요소', 1455, 3, 90, 2),
+('固定', '고정', 1456, 3, 89, 2),
+('保管', '보관', 1457, 3, 89, 2),
+('西洋', '서양', 1458, 3, 89, 2),
+('暴政', '폭정', 1459, 3, 89, 2),
+('吸血鬼', '흡혈귀', 1460, 3, 89, 2),
+('新規', '신규', 1461, 3, 88, 2),
+('風味', '풍미', 1462, 3, 88, 2),
+('形態', '형태', 1463, 3, 88, 2),
+('放送局', '방송국', 1464, 3, 88, 2),
+('面談', '면담', 1465, 3, 87, 2),
+('所屬', '소속', 1466, 3, 87, 2),
+('信號', '신호', 1467, 3, 87, 2),
+('集團', '집단', 1468, 3, 87, 2),
+('處方', '처방', 1469, 3, 87, 2),
+('號室', '호실', 1470, 3, 87, 2),
+('相關', '상관', 1471, 3, 86, 2),
+('制約', '제약', 1472, 3, 86, 2),
+('快感', '쾌감', 1473, 3, 86, 2),
+('後宮', '후궁', 1474, 3, 86, 2),
+('構內', '구내', 1475, 3, 85, 2),
+('反映', '반영', 1476, 3, 85, 2),
+('反抗', '반항', 1477, 3, 85, 2),
+('初期', '초기', 1478, 3, 85, 2),
+('解決', '해결', 1479, 3, 85, 2),
+('感謝', '감사', 1480, 3, 84, 2),
+('代替', '대체', 1481, 3, 84, 2),
+('挑戰', '도전', 1482, 3, 84, 2),
+('死亡', '사망', 1483, 3, 84, 2),
+('意圖', '의도', 1484, 3, 84, 2),
+('傳說', '전설', 1485, 3, 84, 2),
+('調節', '조절', 1486, 3, 84, 2),
+('特質', '특질', 1487, 3, 84, 2),
+('航空', '항공', 1488, 3, 84, 2),
+('濫用', '남용', 1489, 3, 83, 2),
+('變種', '변종', 1490, 3, 83, 2),
+('惡黨', '악당', 1491, 3, 83, 2),
+('高潮', '고조', 1492, 3, 82, 2),
+('半指', '반지', 1493, 3, 82, 2),
+('知能', '지능', 1494, 3, 82, 2),
+('技士', '기사', 1495, 3, 81, 2),
+('同盟', '동맹', 1496, 3, 81, 2),
+('意識', '의식', 1497, 3, 81, 2),
+('空襲', '공습', 1498, 3, 80, 2),
+('權勢', '권세', 1499, 3, 80, 2),
+('博愛', '박애', 1500, 3, 80, 2),
+('方案', '방안', 1501, 3, 80, 2),
+('所謂', '소위', 1502, 3, 80, 2),
+('疾病', '질병', 1503, 3, 80, 2),
+('血統', '혈통', 1504, 3, 80, 2),
+('廣場', '광장', 1505, 3, 79, 2),
+('未安', '미안', 1506, 3, 79, 2),
+('卽時', '즉시', 1507, 3, 79, 2),
+('變節', '변절', 1508, 3, 78, 2),
+('運命', '운명', 1509, 3, 78, 2),
+('休紙桶', '휴지통', 1510, 3, 78, 2),
+('背後', '배후', 1511, 3, 77, 2),
+('小包', '소포', 1512, 3, 77, 2),
+('回想', '회상', 1513, 3, 77, 2),
+('帝政', '제정', 1514, 3, 76, 2),
+('通帳', '통장', 1515, 3, 76, 2),
+('漂流', '표류', 1516, 3, 76, 2),
+('商社', '상사', 1517, 3, 75, 2),
+('速度', '속도', 1518, 3, 75, 2),
+('壓制', '압제', 1519, 3, 75, 2),
+('次官', '차관', 1520, 3, 75, 2),
+('感', '감', 1521, 3, 74, 2),
+('半島', '반도', 1522, 3, 74, 2),
+('制限', '제한', 1523, 3, 74, 2),
+('窓口', '창구', 1524, 3, 74, 2),
+('風潮', '풍조', 1525, 3, 74, 2),
+('街路樹', '가로수', 1526, 3, 74, 2),
+('歌曲', '가곡', 1527, 3, 73, 2),
+('過多', '과다', 1528, 3, 73, 2),
+('誠實', '성실', 1529, 3, 73, 2),
+('違反', '위반', 1530, 3, 73, 2),
+('靑酸', '청산', 1531, 3, 73, 2),
+('方今', '방금', 1532, 3, 72, 2),
+('異議', '이의', 1533, 3, 72, 2),
+('編成', '편성', 1534, 3, 72, 2),
+('解凍', '해동', 1535, 3, 72, 2),
+('好意', '호의', 1536, 3, 72, 2),
+('橋頭堡', '교두보', 1537, 3, 72, 2),
+('可能', '가능', 1538, 3, 71, 2),
+('耕作', '경작', 1539, 3, 71, 2),
+('科目', '과목', 1540, 3, 71, 2),
+('權威', '권위', 1541, 3, 71, 2),
+('技能', '기능', 1542, 3, 71, 2),
+('放送', '방송', 1543, 3, 71, 2),
+('要約', '요약', 1544, 3, 71, 2),
+('入札', '입찰', 1545, 3, 71, 2),
+('病', '병', 1546, 3, 70, 2),
+('比重', '비중', 1547, 3, 70, 2),
+('財政', '재정', 1548, 3, 70, 2),
+('症勢', '증세', 1549, 3, 70, 2),
+('觀客', '관객', 1550, 3, 69, 2),
+('記憶', '기억', 1551, 3, 69, 2),
+('反撥', '반발', 1552, 3, 69, 2),
+('相談', '상담', 1553, 3, 69, 2),
+('信任', '신임', 1554, 3, 69, 2),
+('洋服', '양복', 1555, 3, 69, 2),
+('離別', '이별', 1556, 3, 69, 2),
+('資料', '자료', 1557, 3, 69, 2),
+('雜種', '잡종', 1558, 3, 69, 2),
+('蹴球', '축구', 1559, 3, 69, 2),
+('香料', '향료', 1560, 3, 69, 2),
+('圖表', '도표', 1561, 3, 68, 2),
+('意思', '의사', 1562, 3, 68, 2),
+('接近', '접근', 1563, 3, 68, 2),
+('後援', '후원', 1564, 3, 68, 2),
+('街路燈', '가로등', 1565, 3, 68, 2),
+('率直', '솔직', 1566, 3, 67, 2),
+('委員', '위원', 1567, 3, 67, 2),
+('砲彈', '포탄', 1568, 3, 67, 2),
+('果然', '과연', 1569, 3, 66, 2),
+('遺傳', '유전', 1570, 3, 66, 2),
+('意志', '의지', 1571, 3, 66, 2),
+('痛症', '통증', 1572, 3, 66, 2),
+('兩棲類', '양서류', 1573, 3, 66, 2),
+('近來', '근래', 1574, 3, 65, 2),
+('設立', '설립', 1575, 3, 65, 2),
+('逍風', '소풍', 1576, 3, 65, 2),
+('最初', '최초', 1577, 3, 65, 2),
+('限度', '한도', 1578, 3, 65, 2),
+('胸部', '흉부', 1579, 3, 65, 2),
+('幹部', '간부', 1580, 3, 64, 2),
+('區別', '구별', 1581, 3, 64, 2),
+('落葉', '낙엽', 1582, 3, 64, 2),
+('成功', '성공', 1583, 3, 64, 2),
+('誤報', '오보', 1584, 3, 64, 2),
+('利益', '이익', 1585, 3, 64, 2),
+('尊重', '존중', 1586, 3, 64, 2),
+('統治', '통치', 1587, 3, 64, 2),
+('後悔', '후회', 1588, 3, 64, 2),
+('揭示板', '게시판', 1589, 3, 64, 2),
+('間或', '간혹', 1590, 3, 63, 2),
+('敬意', '경의', 1591, 3, 63, 2),
+('商店', '상점', 1592, 3, 63, 2),
+('專門', '전문', 1593, 3, 63, 2),
+('透明', '투명', 1594, 3, 63, 2),
+('加算', '가산', 1595, 3, 62, 2),
+('博士', '박사', 1596, 3, 62, 2),
+('番號', '번호', 1597, 3, 62, 2),
+('姨母', '이모', 1598, 3, 62, 2),
+('節次', '절차', 1599, 3, 62, 2),
+('早期', '조기', 1600, 3, 62, 2),
+('差異', '차이', 1601, 3, 62, 2),
+('平衡', '평형', 1602, 3, 62, 2),
+('交際', '교제', 1603, 3, 61, 2),
+('群集', '군집', 1604, 3, 61, 2),
+('保存', '보존', 1605, 3, 61, 2),
+('安靜', '안정', 1606, 3, 61, 2),
+('豫備', '예비', 1607, 3, 61, 2),
+('追放', '추방', 1608, 3, 61, 2),
+('表示', '표시', 1609, 3, 61, 2),
+('荷重', '하중', 1610, 3, 61, 2),
+('火災', '화재', 1611, 3, 61, 2),
+('宿命', '숙명', 1612, 3, 60, 2),
+('樣相', '양상', 1613, 3, 60, 2),
+('郵便', '우편', 1614, 3, 60, 2),
+('香油', '향유', 1615, 3, 60, 2),
+('首都圈', '수도권', 1616, 3, 60, 2),
+('熱', '열', 1617, 3, 59, 2),
+('急速', '급속', 1618, 3, 59, 2),
+('奇術', '기술', 1619, 3, 59, 2),
+('贊成', '찬성', 1620, 3, 59, 2),
+('退院', '퇴원', 1621, 3, 59, 2),
+('血漿', '혈장', 1622, 3, 59, 2),
+('構想', '구상', 1623, 3, 58, 2),
+('問題', '문제', 1624, 3, 58, 2),
+('保障', '보장', 1625, 3, 58, 2),
+('聖典', '성전', 1626, 3, 58, 2),
+('位置', '위치', 1627, 3, 58, 2),
+('終結', '종결', 1628, 3, 58, 2),
+('最近', '최근', 1629, 3, 58, 2),
+('藥', '약', 1630, 3, 57, 2),
+('建造', '건조', 1631, 3, 57, 2),
+('信託', '신탁', 1632, 3, 57, 2),
+('結局', '결국', 1633, 3, 56, 2),
+('經驗', '경험', 1634, 3, 56, 2),
+('告示', '고시', 1635, 3, 56, 2),
+('過程', '과정', 1636, 3, 56, 2),
+('牧師', '목사', 1637, 3, 56, 2),
+('調停', '조정', 1638, 3, 56, 2),
+('指示', '지시', 1639, 3, 56, 2),
+('便覽', '편람', 1640, 3, 56, 2),
+('暴露', '폭로', 1641, 3, 56, 2),
+('限界', '한계', 1642, 3, 56, 2),
+('回避', '회피', 1643, 3, 56, 2),
+('假令', '가령', 1644, 3, 55, 2),
+('募集', '모집', 1645, 3, 55, 2),
+('先端', '선단', 1646, 3, 55, 2),
+('衣類', '의류', 1647, 3, 55, 2),
+('測量', '측량', 1648, 3, 55, 2),
+('齒科', '치과', 1649, 3, 55, 2),
+('親密', '친밀', 1650, 3, 55, 2),
+('歸結', '귀결', 1651, 3, 54, 2),
+('設備', '설비', 1652, 3, 54, 2),
+('演技', '연기', 1653, 3, 54, 2),
+('最善', '최선', 1654, 3, 54, 2),
+('效能', '효능', 1655, 3, 54, 2),
+('交叉', '교차', 1656, 3, 53, 2),
+('別途', '별도', 1657, 3, 53, 2),
+('比率', '비율', 1658, 3, 53, 2),
+('聖堂', '성당', 1659, 3, 53, 2),
+('轉移', '전이', 1660, 3, 53, 2),
+('追加', '추가', 1661, 3, 53, 2),
+('暴徒', '폭도', 1662, 3, 53, 2),
+('回答', '회답', 1663, 3, 53, 2),
+('門', '문', 1664, 3, 52, 2),
+('街路', '가로', 1665, 3, 52, 2),
+('短波', '단파', 1666, 3, 52, 2),
+('傷處', '상처', 1667, 3, 52, 2),
+('釋放', '석방', 1668, 3, 52, 2),
+('將校', '장교', 1669, 3, 52, 2),
+('最終', '최종', 1670, 3, 52, 2),
+('配達', '배달', 1671, 3, 51, 2),
+('飮酒', '음주', 1672, 3, 51, 2),
+('複製', '복제', 1673, 3, 50, 2),
+('四寸', '사촌', 1674, 3, 50, 2),
+('狀態', '상태', 1675, 3, 50, 2),
+('蒐集', '수집', 1676, 3, 50, 2),
+('旅館', '여관', 1677, 3, 50, 2),
+('溫突', '온돌', 1678, 3, 50, 2),
+('土葬', '토장', 1679, 3, 50, 2),
+('關係', '관계', 1680, 3, 49, 2),
+('受取', '수취', 1681, 3, 49, 2),
+('才能', '재능', 1682, 3, 49, 2),
+('駐韓', '주한', 1683, 3, 49, 2),
+('回歸', '회귀', 1684, 3, 49, 2),
+('戒嚴令', '계엄령', 1685, 3, 49, 2),
+('階級', '계급', 1686, 3, 48, 2),
+('陰毛', '음모', 1687, 3, 48, 2),
+('改善', '개선', 1688, 3, 47, 2),
+('賣買', '매매', 1689, 3, 47, 2),
+('防禦', '방어', 1690, 3, 47, 2),
+('服從', '복종', 1691, 3, 47, 2),
+('謝過', '사과', 1692, 3, 47, 2),
+('首席', '수석', 1693, 3, 47, 2),
+('信仰', '신앙', 1694, 3, 47, 2),
+('暗示', '암시', 1695, 3, 47, 2),
+('存在', '존재', 1696, 3, 47, 2),
+('紙匣', '지갑', 1697, 3, 47, 2),
+('彈丸', '탄환', 1698, 3, 47, 2),
+('協議', '협의', 1699, 3, 47, 2),
+('警察', '경찰', 1700, 3, 46, 2),
+('黨派', '당파', 1701, 3, 46, 2),
+('嚴格', '엄격', 1702, 3, 46, 2),
+('牛乳', '우유', 1703, 3, 46, 2),
+('支障', '지장', 1704, 3, 46, 2),
+('初版', '초판', 1705, 3, 46, 2),
+('王', '왕', 1706, 3, 45, 2),
+('哀歌', '애가', 1707, 3, 45, 2),
+('優勢', '우세', 1708, 3, 45, 2),
+('老婆', '노파', 1709, 3, 44, 2),
+('凝結', '응결', 1710, 3, 44, 2),
+('宣告', '선고', 1711, 3, 43, 2),
+('眼鏡', '안경', 1712, 3, 43, 2),
+('疑問', '의문', 1713, 3, 43, 2),
+('雜貨', '잡화', 1714, 3, 43, 2),
+('展望', '전망', 1715, 3, 43, 2),
+('競技', '경기', 1716, 3, 42, 2),
+('排除', '배제', 1717, 3, 42, 2),
+('殺到', '쇄도', 1718, 3, 42, 2),
+('約束', '약속', 1719, 3, 42, 2),
+('練習', '연습', 1720, 3, 42, 2),
+('要塞', '요새', 1721, 3, 42, 2),
+('走壘', '주루', 1722, 3, 42, 2),
+('恒星', '항성', 1723, 3, 42, 2),
+('寄宿舍', '기숙사', 1724, 3, 42, 2),
+('農村', '농촌', 1725, 3, 41, 2),
+('附近', '부근', 1726, 3, 41, 2),
+('散策', '산책', 1727, 3, 41, 2),
+('隱退', '은퇴', 1728, 3, 41, 2),
+('準備', '준비', 1729, 3, 41, 2),
+('支援', '지원', 1730, 3, 41, 2),
+('讚歌', '찬가', 1731, 3, 41, 2),
+('破片', '파편', 1732, 3, 41, 2),
+('倍率', '배율', 1733, 3, 40, 2),
+('細菌', '세균', 1734, 3, 40, 2),
+('告訴', '고소', 1735, 3, 39, 2),
+('課題', '과제', 1736, 3, 39, 2),
+('局限', '국한', 1737, 3, 39, 2),
+('起源', '기원', 1738, 3, 39, 2),
+('豫測', '예측', 1739, 3, 39, 2),
+('住居', '주거', 1740, 3, 39, 2),
+('特赦', '특사', 1741, 3, 39, 2),
+('回廊', '회랑', 1742, 3, 39, 2),
+('運', '운', 1743, 3, 38, 2),
+('鐵', '철', 1744, 3, 38, 2),
+('孤獨', '고독', 1745, 3, 38, 2),
+('養殖', '양식', 1746, 3, 38, 2),
+('抵當', '저당', 1747, 3, 38, 2),
+('座標', '좌표', 1748, 3, 38, 2),
+('階乘', '계승', 1749, 3, 37, 2),
+('沒落', '몰락', 1750, 3, 37, 2),
+('收縮', '수축', 1751, 3, 37, 2),
+('連累', '연루', 1752, 3, 37, 2),
+('精誠', '정성', 1753, 3, 37, 2),
+('庭園', '정원', 1754, 3, 37, 2),
+('執着', '집착', 1755, 3, 37, 2),
+('取材', '취재', 1756, 3, 37, 2),
+('冷靜', '냉정', 1757, 3, 36, 2),
+('扶養', '부양', 1758, 3, 36, 2),
+('旅程', '여정', 1759, 3, 36, 2),
+('聽衆', '청중', 1760, 3, 36, 2),
+('親戚', '친척', 1761, 3, 36, 2),
+('包裝', '포장', 1762, 3, 36, 2),
+('寒波', '한파', 1763, 3, 36, 2),
+('特', '특', 1764, 3, 35, 2),
+('開拓', '개척', 1765, 3, 35, 2),
+('勸告', '권고', 1766, 3, 35, 2),
+('狀況', '상황', 1767, 3, 35, 2),
+('柔弱', '유약', 1768, 3, 35, 2),
+('市', '시', 1769, 3, 34, 2),
+('急增', '급증', 1770, 3, 34, 2),
+('喪失', '상실', 1771, 3, 34, 2),
+('象牙', '상아', 1772, 3, 34, 2),
+('損害', '손해', 1773, 3, 34, 2),
+('基準', '기준', 1774, 3, 33, 2),
+('免除', '면제', 1775, 3, 33, 2),
+('審査', '심사', 1776, 3, 33, 2),
+('演奏', '연주', 1777, 3, 33, 2),
+('誘引', '유인', 1778, 3, 33, 2),
+('陰脣', '음순', 1779, 3, 33, 2),
+('彫像', '조상', 1780, 3, 33, 2),
+('卽席', '즉석', 1781, 3, 33, 2),
+('參謀', '참모', 1782, 3, 33, 2),
+('追跡', '추적', 1783, 3, 33, 2),
+('競爭', '경쟁', 1784, 3, 32, 2),
+('思考', '사고', 1785, 3, 32, 2),
+('施設', '시설', 1786, 3, 32, 2),
+('掩護', '엄호', 1787, 3, 32, 2),
+('災難', '재난', 1788, 3, 32, 2),
+('爆竹', '폭죽', 1789, 3, 32, 2),
+('混亂', '혼란', 1790, 3, 32, 2),
+('蔘鷄湯', '삼계탕', 1791, 3, 32, 2),
+('障壁', '장벽', 1792, 3, 31, 2),
+('甲殼', '갑각', 1793, 3, 30, 2),
+('隔離', '격리', 1794, 3, 30, 2),
+('規則', '규칙', 1795, 3, 30, 2),
+('幼兒', '유아', 1796, 3, 30, 2),
+('墜落', '추락', 1797, 3, 30, 2),
+('墮落', '타락', 1798, 3, 30, 2),
+('幻影', '환영', 1799, 3, 30, 2),
+('群衆', '군중', 1800, 3, 29, 2),
+('豪雨', '호우', 1801, 3, 29, 2),
+('景致', '경치', 1802, 3, 28, 2),
+('逃避', '도피', 1803, 3, 28, 2),
+('承認', '승인', 1804, 3, 28, 2),
+('粘液', '점액', 1805, 3, 28, 2),
+('左派', '좌파', 1806, 3, 28, 2),
+('勅令', '칙령', 1807, 3, 28, 2),
+('破綻', '파탄', 1808, 3, 28, 2),
+('歸還', '귀환', 1809, 3, 27, 2),
+('禁慾', '금욕', 1810, 3, 27, 2),
+('段階', '단계', 1811, 3, 27, 2),
+('與件', '여건', 1812, 3, 27, 2),
+('玉座', '옥좌', 1813, 3, 27, 2),
+('誘因', '유인', 1814, 3, 27, 2),
+('休暇', '휴가', 1815, 3, 27, 2),
+('鷄卵', '계란', 1816, 3, 26, 2),
+('區廳', '구청', 1817, 3, 26, 2),
+('寄與', '기여', 1818, 3, 26, 2),
+('騰貴', '등귀', 1819, 3, 26, 2),
+('腐敗', '부패', 1820, 3, 26, 2),
+('損傷', '손상', 1821, 3, 26, 2),
+('遺骸', '유해', 1822, 3, 26, 2),
+('招待', '초대', 1823, 3, 26, 2),
+('拒絶', '거절', 1824, 3, 25, 2),
+('考慮', '고려', 1825, 3, 25, 2),
+('拘留', '구류', 1826, 3, 25, 2),
+('休憩', '휴게', 1827, 3, 25, 2),
+('詩', '시', 1828, 3, 24, 2),
+('差', '차', 1829, 3, 24, 2),
+('固執', '고집', 1830, 3, 24, 2),
+('基礎', '기초', 1831, 3, 24, 2),
+('冬眠', '동면', 1832, 3, 24, 2),
+('復讐', '복수', 1833, 3, 24, 2),
+('徵候', '징후', 1834, 3, 24, 2),
+('菜蔬', '채소', 1835, 3, 24, 2),
+('招請', '초청', 1836, 3, 24, 2),
+('秋夕', '추석', 1837, 3, 24, 2),
+('繪畵', '회화', 1838, 3, 24, 2),
+('訓練', '훈련', 1839, 3, 24, 2),
+('弄談', '농담', 1840, 3, 23, 2),
+('每週', '매주', 1841, 3, 23, 2),
+('堡壘', '보루', 1842, 3, 23, 2),
+('硏究', '연구', 1843, 3, 23, 2),
+('依存', '의존', 1844, 3, 23, 2),
+('姿勢', '자세', 1845, 3, 23, 2),
+('漸次', '점차', 1846, 3, 23, 2),
+('願', '원', 1847, 3, 22, 2),
+('避', '피', 1848, 3, 22, 2),
+('覺悟', '각오', 1849, 3, 22, 2),
+('缺如', '결여', 1850, 3, 22, 2),
+('免許', '면허', 1851, 3, 22, 2),
+('源泉', '원천', 1852, 3, 22, 2),
+('專攻', '전공', 1853, 3, 22, 2),
+('走狗', '주구', 1854, 3, 22, 2),
+('拒否', '거부', 1855, 3, 21, 2),
+('童謠', '동요', 1856, 3, 21, 2),
+('餘裕', '여유', 1857, 3, 21, 2),
+('雄辯', '웅변', 1858, 3, 21, 2),
+('追憶', '추억', 1859, 3, 21, 2),
+('區', '구', 1860, 3, 20, 2),
+('僑胞', '교포', 1861, 3, 20, 2),
+('付託', '부탁', 1862, 3, 20, 2),
+('崇拜', '숭배', 1863, 3, 20, 2),
+('左右', '좌우', 1864, 3, 20, 2),
+('窒息', '질식', 1865, 3, 20, 2),
+('巨匠', '거장', 1866, 3, 19, 2),
+('供給', '공급', 1867, 3, 19, 2),
+('根據', '근거', 1868, 3, 19, 2),
+('紛爭', '분쟁', 1869, 3, 19, 2),
+('蠶豆', '잠두', 1870, 3, 19, 2),
+('懷疑', '회의', 1871, 3, 19, 2),
+('勳章', '훈장', 1872, 3, 19, 2),
+('緊張', '긴장', 1873, 3, 18, 2),
+('封套', '봉투', 1874, 3, 18, 2),
+('悲鳴', '비명', 1875, 3, 18, 2),
+('濕疹', '습진', 1876, 3, 18, 2),
+('伸張', '신장', 1877, 3, 18, 2),
+('疑惑', '의혹', 1878, 3, 18, 2),
+('絶叫', '절규', 1879, 3, 18, 2),
+('訓鍊', '훈련', 1880, 3, 18, 2),
+('懇請', '간청', 1881, 3, 17, 2),
+('肩章', '견장', 1882, 3, 17, 2),
+('舞踊', '무용', 1883, 3, 17, 2),
+('繁殖', '번식', 1884, 3, 17, 2),
+('抑鬱', '억울', 1885, 3, 17, 2),
+('軟膏', '연고', 1886, 3, 17, 2),
+('祭祀', '제사', 1887, 3, 17, 2),
+('擴張', '확장', 1888, 3, 17, 2),
+('徽章', '휘장', 1889, 3, 17, 2),
+('他', '타', 1890, 3, 16, 2),
+('克己', '극기', 1891, 3, 16, 2),
+('夕刊', '석간', 1892, 3, 16, 2),
+('恩惠', '은혜', 1893, 3, 16, 2),
+('措置', '조치', 1894, 3, 16, 2),
+('偏狹', '편협', 1895, 3, 16, 2),
+('峽谷', '협곡', 1896, 3, 16, 2),
+('扁桃腺', '편도선', 1897, 3, 16, 2),
+('譴責', '견책', 1898, 3, 15, 2),
+('迷彩', '미채', 1899, 3, 15, 2),
+('負擔', '부담', 1900, 3, 15, 2),
+('危險', '위험', 1901, 3, 15, 2),
+('掌紋', '장문', 1902, 3, 15, 2),
+('羊', '양', 1903, 3, 14, 2),
+('功績', '공적', 1904, 3, 14, 2),
+('屈辱', '굴욕', 1905, 3, 14, 2),
+('企劃', '기획', 1906, 3, 14, 2),
+('埋葬', '매장', 1907, 3, 14, 2),
+('左遷', '좌천', 1908, 3, 14, 2),
+('周圍', '주위', 1909, 3, 14, 2),
+('貪慾', '탐욕', 1910, 3, 14, 2),
+('普及', '보급', 1911, 3, 13, 2),
+('純粹', '순수', 1912, 3, 13, 2),
+('哀悼', '애도', 1913, 3, 13, 2),
+('貯蓄', '저축', 1914, 3, 13, 2),
+('懲戒', '징계', 1915, 3, 13, 2),
+('包含', '포함', 1916, 3, 13, 2),
+('各其', '각기', 1917, 3, 12, 2),
+('憤怒', '분노', 1918, 3, 12, 2),
+('爽快', '상쾌', 1919, 3, 12, 2),
+('勇敢', '용감', 1920, 3, 12, 2),
+('衣裳', '의상', 1921, 3, 12, 2),
+('捕縛', '포박', 1922, 3, 12, 2),
+('惠澤', '혜택', 1923, 3, 12, 2),
+('紹介', '소개', 1924, 3, 11, 2),
+('妖怪', '요괴', 1925, 3, 11, 2),
+('萎縮', '위축', 1926, 3, 11, 2),
+('殘滓', '잔재', 1927, 3, 11, 2),
+('卽', '즉', 1928, 3, 10, 2),
+('篇', '편', 1929, 3, 10, 2),
+('挫折', '좌절', 1930, 3, 10, 2),
+('昏睡', '혼수', 1931, 3, 10, 2),
+('汽笛', '기적', 1932, 3, 9, 2),
+('按摩', '안마', 1933, 3, 9, 2),
+('燃燒', '연소', 1934, 3, 9, 2),
+('忍耐', '인내', 1935, 3, 9, 2),
+('罰', '벌', 1936, 3, 8, 2),
+('驛', '역', 1937, 3, 8, 2),
+('侮辱', '모욕', 1938, 3, 8, 2),
+('妊娠', '임신', 1939, 3, 8, 2),
+('召喚', '소환', 1940, 3, 7, 2),
+('甁', '병', 1941, 3, 6, 2),
+('姓', '성', 1942, 3, 6, 2),
+('擇', '택', 1943, 3, 6, 2),
+('吐', '토', 1944, 3, 6, 2),
+('祈禱', '기도', 1945, 3, 6, 2),
+('抱擁', '포옹', 1946, 3, 6, 2),
+('喝采', '갈채', 1947, 3, 5, 2),
+('奉仕', '봉사', 1948, 3, 5, 2),
+('栽培', '재배', 1949, 3, 5, 2),
+('賠償', '배상', 1950, 3, 4, 2),
+('嘲弄', '조롱', 1951, 3, 4, 2),
+('豊饒', '풍요', 1952, 3, 4, 2),
+('狹窄', '협착', 1953, 3, 4, 2),
+('恨', '한', 1954, 3, 3, 2),
+('傀儡', '괴뢰', 1955, 3, 3, 2),
+('敷衍', '부연', 1956, 3, 3, 2),
+('塹壕', '참호', 1957, 3, 3, 2),
+('膨脹', '팽창', 1958, 3, 3, 2),
+('敢', '감', 1959, 3, 2, 2),
+('橘', '귤', 1960, 3, 2, 2),
+('某', '모', 1961, 3, 2, 2),
+('葛藤', '갈등', 1962, 3, 2, 2),
+('痙攣', '경련', 1963, 3, 2, 2),
+('猖披', '창피', 1964, 3, 1, 2),
+('中國語', '중국어', 1965, 2, 535, 2),
+('大學校', '대학교', 1966, 2, 508, 2),
+('立法者', '입법자', 1967, 2, 492, 2),
+('光化學', '광화학', 1968, 2, 477, 2),
+('大學', '대학', 1969, 2, 475, 2),
+('學究的', '학구적', 1970, 2, 461, 2),
+('中學校', '중학교', 1971, 2, 449, 2),
+('代打者', '대타자', 1972, 2, 432, 2),
+('社會學', '사회학', 1973, 2, 428, 2),
+('名人', '명인', 1974, 2, 414, 2),
+('反逆者', '반역자', 1975, 2, 411, 2),
+('同伴者', '동반자', 1976, 2, 409, 2),
+('法學', '법학', 1977, 2, 406, 2),
+('企業人', '기업인', 1978, 2, 406, 2),
+('勝利者', '승리자', 1979, 2, 401, 2),
+('力學', '역학', 1980, 2, 399, 2),
+('技術者', '기술자', 1981, 2, 399, 2),
+('獨身者', '독신자', 1982, 2, 398, 2),
+('經營者', '경영자', 1983, 2, 396, 2),
+('生活水準', '생활수준', 1984, 2, 396, 2),
+('知識人', '지식인', 1985, 2, 388, 2),
+('視聽者', '시청자', 1986, 2, 387, 2),
+('化合物', '화합물', 1987, 2, 387, 2),
+('民主主義', '민주주의', 1988, 2, 387, 2),
+('支配人', '지배인', 1989, 2, 386, 2),
+('日本語', '일본어', 1990, 2, 384, 2),
+('政治學', '정치학', 1991, 2, 380, 2),
+('微生物', '미생물', 1992, 2, 377, 2),
+('消費者', '소비자', 1993, 2, 372, 2),
+('應募者', '응모자', 1994, 2, 372, 2),
+('被害者', '피해자', 1995, 2, 371, 2),
+('生活用品', '생활용품', 1996, 2, 365, 2),
+('未亡人', '미망인', 1997, 2, 363, 2),
+('地下道', '지하도', 1998, 2, 363, 2),
+('勤勞者', '근로자', 1999, 2, 362, 2),
+('迫害者', '박해자', 2000, 2, 362, 2),
+('指揮者', '지휘자', 2001, 2, 362, 2),
+('開拓者', '개척자', 2002, 2, 360, 2),
+('訪問者', '방문자', 2003, 2, 360, 2),
+('女高生', '여고생', 2004, 2, 359, 2),
+('土人', '토인', 2005, 2, 358, 2),
+('侵略者', '침략자', 2006, 2, 358, 2),
+('生産力', '생산력', 2007, 2, 354, 2),
+('抑留者', '억류자', 2008, 2, 353, 2),
+('自動車', '자동차', 2009, 2, 352, 2),
+('筆者', '필자', 2010, 2, 351, 2),
+('商人', '상인', 2011, 2, 349, 2),
+('硏究者', '연구자', 2012, 2, 348, 2),
+('黑人', '흑인', 2013, 2, 346, 2),
+('逃亡者', '도망자', 2014, 2, 345, 2),
+('婦人', '부인', 2015, 2, 344, 2),
+('供給者', '공급자', 2016, 2, 344, 2),
+('理事長', '이사장', 2017, 2, 343, 2),
+('購買者', '구매자', 2018, 2, 342, 2),
+('牧者', '목자', 2019, 2, 339, 2),
+('光學', '광학', 2020, 2, 336, 2),
+('富者', '부자', 2021, 2, 336, 2),
+('人材', '인재', 2022, 2, 336, 2),
+('障碍人', '장애인', 2023, 2, 334, 2),
+('外國', '외국', 2024, 2, 333, 2),
+('著者', '저자', 2025, 2, 331, 2),
+('地主', '지주', 2026, 2, 328, 2),
+('天國', '천국', 2027, 2, 327, 2),
+('新入生', '신입생', 2028, 2, 327, 2),
+('學位', '학위', 2029, 2, 324, 2),
+('哲人', '철인', 2030, 2, 323, 2),
+('自家用', '자가용', 2031, 2, 315, 2),
+('學院', '학원', 2032, 2, 313, 2),
+('農學', '농학', 2033, 2, 310, 2),
+('大氣', '대기', 2034, 2, 310, 2),
+('生日', '생일', 2035, 2, 309, 2),
+('事業家', '사업가', 2036, 2, 308, 2),
+('海産物', '해산물', 2037, 2, 303, 2),
+('反意語', '반의어', 2038, 2, 299, 2),
+('先進國', '선진국', 2039, 2, 297, 2),
+('陽電子', '양전자', 2040, 2, 297, 2),
+('子音', '자음', 2041, 2, 295, 2),
+('國內', '국내', 2042, 2, 291, 2),
+('生長', '생장', 2043, 2, 287, 2),
+('中性', '중성', 2044, 2, 287, 2),
+('音樂家', '음악가', 2045, 2, 287, 2),
+('地下室', '지하실', 2046, 2, 286, 2),
+('自主', '자주', 2047, 2, 285, 2),
+('植民地', '식민지', 2048, 2, 285, 2),
+('女子', '여자', 2049, 2, 278, 2),
+('發生', '발생', 2050, 2, 275, 2),
+('文化財', '문화재', 2051, 2, 273, 2),
+('近代的', '근대적', 2052, 2, 271, 2),
+('飛行機', '비행기', 2053, 2, 269, 2),
+('神格化', '신격화', 2054, 2, 266, 2),
+('動機', '동기', 2055, 2, 265, 2),
+('自體', '자체', 2056, 2, 265, 2),
+('文化', '문화', 2057, 2, 261, 2),
+('不安定', '불안정', 2058, 2, 261, 2),
+('用語', '용어', 2059, 2, 259, 2),
+('天性', '천성', 2060, 2, 258, 2),
+('農作物', '농작물', 2061, 2, 257, 2),
+('無能力', '무능력', 2062, 2, 257, 2),
+('主食', '주식', 2063, 2, 256, 2),
+('生計', '생계', 2064, 2, 253, 2),
+('公主', '공주', 2065, 2, 247, 2),
+('用地', '용지', 2066, 2, 245, 2),
+('一週日', '일주일', 2067, 2, 245, 2),
+('自尊心', '자존심', 2068, 2, 244, 2),
+('自信感', '자신감', 2069, 2, 243, 2),
+('恐水病', '공수병', 2070, 2, 241, 2),
+('救世主', '구세주', 2071, 2, 241, 2),
+('重要性', '중요성', 2072, 2, 241, 2),
+('電話機', '전화기', 2073, 2, 238, 2),
+('內的', '내적', 2074, 2, 237, 2),
+('國際', '국제', 2075, 2, 235, 2),
+('天理', '천리', 2076, 2, 235, 2),
+('助動詞', '조동사', 2077, 2, 235, 2),
+('代名詞', '대명사', 2078, 2, 233, 2),
+('氣分', '기분', 2079, 2, 231, 2),
+('地面', '지면', 2080, 2, 231, 2),
+('地形', '지형', 2081, 2, 230, 2),
+('化石', '화석', 2082, 2, 230, 2),
+('抛物線', '포물선', 2083, 2, 229, 2),
+('國籍', '국적', 2084, 2, 228, 2),
+('合體', '합체', 2085, 2, 228, 2),
+('生命', '생명', 2086, 2, 227, 2),
+('飛行場', '비행장', 2087, 2, 226, 2),
+('量子', '양자', 2088, 2, 225, 2),
+('書法', '서법', 2089, 2, 224, 2),
+('先生', '선생', 2090, 2, 224, 2),
+('男子', '남자', 2091, 2, 223, 2),
+('大腦', '대뇌', 2092, 2, 223, 2),
+('致命的', '치명적', 2093, 2, 223, 2),
+('外心', '외심', 2094, 2, 222, 2),
+('酒煎子', '주전자', 2095, 2, 221, 2),
+('藥水', '약수', 2096, 2, 220, 2),
+('副會長', '부회장', 2097, 2, 220, 2),
+('文書', '문서', 2098, 2, 219, 2),
+('白頭山', '백두산', 2099, 2, 219, 2),
+('古物', '고물', 2100, 2, 217, 2),
+('打字機', '타자기', 2101, 2, 217, 2),
+('江原道', '강원도', 2102, 2, 216, 2),
+('感化', '감화', 2103, 2, 215, 2),
+('大陸', '대륙', 2104, 2, 215, 2),
+('水兵', '수병', 2105, 2, 215, 2),
+('機會', '기회', 2106, 2, 214, 2),
+('名義', '명의', 2107, 2, 214, 2),
+('全羅道', '전라도', 2108, 2, 213, 2),
+('大衆', '대중', 2109, 2, 212, 2),
+('動詞', '동사', 2110, 2, 212, 2),
+('政治家', '정치가', 2111, 2, 212, 2),
+('物質', '물질', 2112, 2, 210, 2),
+('化粧品', '화장품', 2113, 2, 208, 2),
+('生鮮', '생선', 2114, 2, 207, 2),
+('知的', '지적', 2115, 2, 207, 2),
+('現地', '현지', 2116, 2, 207, 2),
+('方解石', '방해석', 2117, 2, 206, 2),
+('日本', '일본', 2118, 2, 205, 2),
+('子宮', '자궁', 2119, 2, 205, 2),
+('計算機', '계산기', 2120, 2, 205, 2),
+('受動態', '수동태', 2121, 2, 205, 2),
+('單語', '단어', 2122, 2, 204, 2),
+('排他的', '배타적', 2123, 2, 204, 2),
+('必要性', '필요성', 2124, 2, 204, 2),
+('空中', '공중', 2125, 2, 202, 2),
+('通行', '통행', 2126, 2, 202, 2),
+('多樣性', '다양성', 2127, 2, 200, 2),
+('友好的', '우호적', 2128, 2, 200, 2),
+('全體', '전체', 2129, 2, 199, 2),
+('肥大', '비대', 2130, 2, 198, 2),
+('偉大', '위대', 2131, 2, 198, 2),
+('體育館', '체육관', 2132, 2, 198, 2),
+('男性', '남성', 2133, 2, 196, 2),
+('體制', '체제', 2134, 2, 195, 2),
+('體重', '체중', 2135, 2, 195, 2),
+('平行', '평행', 2136, 2, 195, 2),
+('水夫', '수부', 2137, 2, 194, 2),
+('因子', '인자', 2138, 2, 194, 2),
+('知性', '지성', 2139, 2, 192, 2),
+('原住民', '원주민', 2140, 2, 191, 2),
+('異性', '이성', 2141, 2, 190, 2),
+('理解', '이해', 2142, 2, 190, 2),
+('外三寸', '외삼촌', 2143, 2, 190, 2),
+('活動', '활동', 2144, 2, 189, 2),
+('輕音樂', '경음악', 2145, 2, 189, 2),
+('起重機', '기중기', 2146, 2, 189, 2),
+('不親切', '불친절', 2147, 2, 189, 2),
+('想像力', '상상력', 2148, 2, 189, 2),
+('基地', '기지', 2149, 2, 188, 2),
+('日記', '일기', 2150, 2, 188, 2),
+('主婦', '주부', 2151, 2, 188, 2),
+('誕生', '탄생', 2152, 2, 188, 2),
+('孫子', '손자', 2153, 2, 187, 2),
+('弟子', '제자', 2154, 2, 187, 2),
+('香水', '향수', 2155, 2, 187, 2),
+('會合', '회합', 2156, 2, 187, 2),
+('化粧紙', '화장지', 2157, 2, 187, 2),
+('入力', '입력', 2158, 2, 186, 2),
+('地層', '지층', 2159, 2, 186, 2),
+('食器', '식기', 2160, 2, 185, 2),
+('可燃性', '가연성', 2161, 2, 185, 2),
+('適性', '적성', 2162, 2, 184, 2),
+('空氣', '공기', 2163, 2, 183, 2),
+('不便', '불편', 2164, 2, 182, 2),
+('椅子', '의자', 2165, 2, 182, 2),
+('同一', '동일', 2166, 2, 181, 2),
+('語彙', '어휘', 2167, 2, 181, 2),
+('團體', '단체', 2168, 2, 180, 2),
+('氷水', '빙수', 2169, 2, 180, 2),
+('平日', '평일', 2170, 2, 180, 2),
+('年金', '연금', 2171, 2, 179, 2),
+('藝術家', '예술가', 2172, 2, 178, 2),
+('公海', '공해', 2173, 2, 177, 2),
+('權力', '권력', 2174, 2, 177, 2),
+('不治', '불치', 2175, 2, 177, 2),
+('工事', '공사', 2176, 2, 176, 2),
+('軟水', '연수', 2177, 2, 176, 2),
+('開化', '개화', 2178, 2, 175, 2),
+('分母', '분모', 2179, 2, 175, 2),
+('野球場', '야구장', 2180, 2, 175, 2),
+('分詞', '분사', 2181, 2, 174, 2),
+('料理', '요리', 2182, 2, 174, 2),
+('共通點', '공통점', 2183, 2, 174, 2),
+('墓地', '묘지', 2184, 2, 173, 2),
+('家口', '가구', 2185, 2, 172, 2),
+('普遍的', '보편적', 2186, 2, 172, 2),
+('動脈', '동맥', 2187, 2, 171, 2),
+('年代', '연대', 2188, 2, 171, 2),
+('重力', '중력', 2189, 2, 170, 2),
+('織物', '직물', 2190, 2, 170, 2),
+('忠淸道', '충청도', 2191, 2, 170, 2),
+('市中', '시중', 2192, 2, 169, 2),
+('自信', '자신', 2193, 2, 169, 2),
+('中共', '중공', 2194, 2, 169, 2),
+('士氣', '사기', 2195, 2, 168, 2),
+('退化', '퇴화', 2196, 2, 168, 2),
+('報告書', '보고서', 2197, 2, 168, 2),
+('怪物', '괴물', 2198, 2, 167, 2),
+('水泳', '수영', 2199, 2, 167, 2),
+('立法', '입법', 2200, 2, 167, 2),
+('炭化', '탄화', 2201, 2, 167, 2),
+('新陳代謝', '신진대사', 2202, 2, 167, 2),
+('書記', '서기', 2203, 2, 165, 2),
+('副作用', '부작용', 2204, 2, 165, 2),
+('中腦', '중뇌', 2205, 2, 164, 2),
+('中毒', '중독', 2206, 2, 164, 2),
+('道路', '도로', 2207, 2, 163, 2),
+('死海', '사해', 2208, 2, 163, 2),
+('數詞', '수사', 2209, 2, 163, 2),
+('僭主', '참주', 2210, 2, 163, 2),
+('相對方', '상대방', 2211, 2, 163, 2),
+('約婚女', '약혼녀', 2212, 2, 163, 2),
+('視力', '시력', 2213, 2, 162, 2),
+('鐵道', '철도', 2214, 2, 162, 2),
+('分量', '분량', 2215, 2, 161, 2),
+('非行', '비행', 2216, 2, 161, 2),
+('自殺', '자살', 2217, 2, 161, 2),
+('電流', '전류', 2218, 2, 161, 2),
+('氣管', '기관', 2219, 2, 160, 2),
+('弱肉强食', '약육강식', 2220, 2, 160, 2),
+('代用', '대용', 2221, 2, 159, 2),
+('心房', '심방', 2222, 2, 159, 2),
+('振動', '진동', 2223, 2, 159, 2),
+('海面', '해면', 2224, 2, 159, 2),
+('行使', '행사', 2225, 2, 159, 2),
+('受話器', '수화기', 2226, 2, 159, 2),
+('停車場', '정거장', 2227, 2, 159, 2),
+('計器', '계기', 2228, 2, 158, 2),
+('所用', '소용', 2229, 2, 158, 2),
+('新婚夫婦', '신혼부부', 2230, 2, 158, 2),
+('心室', '심실', 2231, 2, 157, 2),
+('音節', '음절', 2232, 2, 157, 2),
+('運轉技士', '운전기사', 2233, 2, 157, 2),
+('分野', '분야', 2234, 2, 156, 2),
+('記念品', '기념품', 2235, 2, 156, 2),
+('所持品', '소지품', 2236, 2, 156, 2),
+('成長', '성장', 2237, 2, 155, 2),
+('騷動', '소동', 2238, 2, 155, 2),
+('逆行', '역행', 2239, 2, 155, 2),
+('技法', '기법', 2240, 2, 154, 2),
+('軟化', '연화', 2241, 2, 154, 2),
+('公正', '공정', 2242, 2, 153, 2),
+('動悸', '동계', 2243, 2, 153, 2),
+('分隊', '분대', 2244, 2, 153, 2),
+('外野', '외야', 2245, 2, 153, 2),
+('電球', '전구', 2246, 2, 153, 2),
+('上流', '상류', 2247, 2, 152, 2),
+('集會', '집회', 2248, 2, 152, 2),
+('複寫機', '복사기', 2249, 2, 152, 2),
+('野心', '야심', 2250, 2, 151, 2),
+('戰場', '전장', 2251, 2, 151, 2),
+('數量', '수량', 2252, 2, 150, 2),
+('出産', '출산', 2253, 2, 149, 2),
+('投機', '투기', 2254, 2, 149, 2),
+('家族', '가족', 2255, 2, 148, 2),
+('錄音', '녹음', 2256, 2, 148, 2),
+('實業', '실업', 2257, 2, 148, 2),
+('理由', '이유', 2258, 2, 148, 2),
+('執行', '집행', 2259, 2, 148, 2),
+('事務', '사무', 2260, 2, 147, 2),
+('場所', '장소', 2261, 2, 147, 2),
+('火器', '화기', 2262, 2, 147, 2),
+('會社', '회사', 2263, 2, 147, 2),
+('武道', '무도', 2264, 2, 146, 2),
+('中繼', '중계', 2265, 2, 146, 2),
+('減法', '감법', 2266, 2, 145, 2),
+('原本', '원본', 2267, 2, 145, 2),
+('音波', '음파', 2268, 2, 145, 2),
+('休日', '휴일', 2269, 2, 145, 2),
+('途中', '도중', 2270, 2, 144, 2),
+('兵器', '병기', 2271, 2, 144, 2),
+('長男', '장남', 2272, 2, 144, 2),
+('影響力', '영향력', 2273, 2, 144, 2),
+('空軍', '공군', 2274, 2, 143, 2),
+('工業', '공업', 2275, 2, 143, 2),
+('發光', '발광', 2276, 2, 143, 2),
+('散文', '산문', 2277, 2, 143, 2),
+('擴聲器', '확성기', 2278, 2, 143, 2),
+('無料', '무료', 2279, 2, 142, 2),
+('審理', '심리', 2280, 2, 142, 2),
+('慶尙道', '경상도', 2281, 2, 142, 2),
+('名聲', '명성', 2282, 2, 141, 2),
+('孵化', '부화', 2283, 2, 141, 2),
+('船長', '선장', 2284, 2, 141, 2),
+('壓力', '압력', 2285, 2, 141, 2),
+('自由', '자유', 2286, 2, 141, 2),
+('天然痘', '천연두', 2287, 2, 141, 2),
+('遂行', '수행', 2288, 2, 140, 2),
+('療法', '요법', 2289, 2, 140, 2),
+('自律', '자율', 2290, 2, 140, 2),
+('中旬', '중순', 2291, 2, 140, 2),
+('證書', '증서', 2292, 2, 140, 2),
+('會話', '회화', 2293, 2, 140, 2),
+('別名', '별명', 2294, 2, 139, 2),
+('分布', '분포', 2295, 2, 139, 2),
+('勢力', '세력', 2296, 2, 139, 2),
+('積分', '적분', 2297, 2, 139, 2),
+('中尉', '중위', 2298, 2, 139, 2),
+('刑法', '형법', 2299, 2, 139, 2),
+('文脈', '문맥', 2300, 2, 138, 2),
+('發情', '발정', 2301, 2, 137, 2),
+('排氣', '배기', 2302, 2, 137, 2),
+('注文', '주문', 2303, 2, 137, 2),
+('論證', '논증', 2304, 2, 136, 2),
+('文章', '문장', 2305, 2, 136, 2),
+('美點', '미점', 2306, 2, 136, 2),
+('議會', '의회', 2307, 2, 136, 2),
+('跆拳道', '태권도', 2308, 2, 136, 2),
+('心眼', '심안', 2309, 2, 135, 2),
+('場面', '장면', 2310, 2, 135, 2),
+('會館', '회관', 2311, 2, 135, 2),
+('軍政', '군정', 2312, 2, 134, 2),
+('魔力', '마력', 2313, 2, 134, 2),
+('反面', '반면', 2314, 2, 134, 2),
+('發聲', '발성', 2315, 2, 134, 2),
+('煙氣', '연기', 2316, 2, 134, 2),
+('自我', '자아', 2317, 2, 134, 2),
+('戰士', '전사', 2318, 2, 134, 2),
+('海草', '해초', 2319, 2, 134, 2),
+('壞血病', '괴혈병', 2320, 2, 134, 2),
+('葉書', '엽서', 2321, 2, 133, 2),
+('除外', '제외', 2322, 2, 133, 2),
+('支出', '지출', 2323, 2, 133, 2),
+('世界觀', '세계관', 2324, 2, 133, 2),
+('手榴彈', '수류탄', 2325, 2, 133, 2),
+('狂氣', '광기', 2326, 2, 132, 2),
+('本質', '본질', 2327, 2, 132, 2),
+('蛋白質', '단백질', 2328, 2, 132, 2),
+('工場', '공장', 2329, 2, 131, 2),
+('氣候', '기후', 2330, 2, 131, 2),
+('養女', '양녀', 2331, 2, 131, 2),
+('出處', '출처', 2332, 2, 131, 2),
+('京畿道', '경기도', 2333, 2, 131, 2),
+('色鉛筆', '색연필', 2334, 2, 131, 2),
+('都心', '도심', 2335, 2, 130, 2),
+('變色', '변색', 2336, 2, 130, 2),
+('張力', '장력', 2337, 2, 130, 2),
+('效力', '효력', 2338, 2, 130, 2),
+('新聞紙', '신문지', 2339, 2, 130, 2),
+('濾過器', '여과기', 2340, 2, 130, 2),
+('脚氣', '각기', 2341, 2, 129, 2),
+('公社', '공사', 2342, 2, 129, 2),
+('電極', '전극', 2343, 2, 129, 2),
+('統一', '통일', 2344, 2, 129, 2),
+('波長', '파장', 2345, 2, 129, 2),
+('現金', '현금', 2346, 2, 129, 2),
+('結石', '결석', 2347, 2, 128, 2),
+('敎師', '교사', 2348, 2, 128, 2),
+('本社', '본사', 2349, 2, 128, 2),
+('特色', '특색', 2350, 2, 128, 2),
+('運轉士', '운전사', 2351, 2, 128, 2),
+('同意', '동의', 2352, 2, 127, 2),
+('分割', '분할', 2353, 2, 127, 2),
+('序文', '서문', 2354, 2, 127, 2),
+('神聖', '신성', 2355, 2, 127, 2),
+('再會', '재회', 2356, 2, 127, 2),
+('戰術', '전술', 2357, 2, 127, 2),
+('小兒科', '소아과', 2358, 2, 127, 2),
+('空間', '공간', 2359, 2, 126, 2),
+('口實', '구실', 2360, 2, 126, 2),
+('外耳', '외이', 2361, 2, 126, 2),
+('總長', '총장', 2362, 2, 126, 2),
+('十二指腸', '십이지장', 2363, 2, 126, 2),
+('露出', '노출', 2364, 2, 125, 2),
+('碑文', '비문', 2365, 2, 125, 2),
+('石油', '석유', 2366, 2, 125, 2),
+('粉紅色', '분홍색', 2367, 2, 125, 2),
+('刑務所', '형무소', 2368, 2, 125, 2),
+('氣孔', '기공', 2369, 2, 124, 2),
+('膽力', '담력', 2370, 2, 124, 2),
+('乘數', '승수', 2371, 2, 124, 2),
+('方程式', '방정식', 2372, 2, 124, 2),
+('少女', '소녀', 2373, 2, 123, 2),
+('出席', '출석', 2374, 2, 123, 2),
+('投手', '투수', 2375, 2, 123, 2),
+('寒氣', '한기', 2376, 2, 123, 2),
+('開發', '개발', 2377, 2, 122, 2),
+('都會', '도회', 2378, 2, 122, 2),
+('流産', '유산', 2379, 2, 122, 2),
+('應用', '응용', 2380, 2, 122, 2),
+('無條件', '무조건', 2381, 2, 122, 2),
+('暴風雨', '폭풍우', 2382, 2, 122, 2),
+('排出', '배출', 2383, 2, 121, 2),
+('複數', '복수', 2384, 2, 121, 2),
+('筆名', '필명', 2385, 2, 121, 2),
+('數千', '수천', 2386, 2, 120, 2),
+('形成', '형성', 2387, 2, 120, 2),
+('再昨年', '재작년', 2388, 2, 120, 2),
+('告發', '고발', 2389, 2, 119, 2),
+('突出', '돌출', 2390, 2, 119, 2),
+('配合', '배합', 2391, 2, 119, 2),
+('愛情', '애정', 2392, 2, 119, 2),
+('慘事', '참사', 2393, 2, 119, 2),
+('天障', '천장', 2394, 2, 119, 2),
+('基督敎', '기독교', 2395, 2, 119, 2),
+('公共', '공공', 2396, 2, 118, 2),
+('分析', '분석', 2397, 2, 118, 2),
+('容器', '용기', 2398, 2, 118, 2),
+('家禽', '가금', 2399, 2, 117, 2),
+('家畜', '가축', 2400, 2, 117, 2),
+('南西', '남서', 2401, 2, 117, 2),
+('提出', '제출', 2402, 2, 117, 2),
+('菜食', '채식', 2403, 2, 117, 2),
+('契機', '계기', 2404, 2, 116, 2),
+('年少', '연소', 2405, 2, 116, 2),
+('財數', '재수', 2406, 2, 116, 2),
+('魔女', '마녀', 2407, 2, 115, 2),
+('協會', '협회', 2408, 2, 115, 2),
+('軍隊', '군대', 2409, 2, 114, 2),
+('權利', '권리', 2410, 2, 114, 2),
+('天頂', '천정', 2411, 2, 114, 2),
+('平方', '평방', 2412, 2, 114, 2),
+('形式', '형식', 2413, 2, 114, 2),
+('郊外', '교외', 2414, 2, 113, 2),
+('北方', '북방', 2415, 2, 113, 2),
+('欲心', '욕심', 2416, 2, 113, 2),
+('天才', '천재', 2417, 2, 113, 2),
+('民謠', '민요', 2418, 2, 112, 2),
+('要點', '요점', 2419, 2, 112, 2),
+('出張', '출장', 2420, 2, 112, 2),
+('內野', '내야', 2421, 2, 111, 2),
+('品質', '품질', 2422, 2, 111, 2),
+('頭蓋骨', '두개골', 2423, 2, 111, 2),
+('調味料', '조미료', 2424, 2, 111, 2),
+('個月', '개월', 2425, 2, 110, 2),
+('告白', '고백', 2426, 2, 110, 2),
+('反應', '반응', 2427, 2, 110, 2),
+('發育', '발육', 2428, 2, 110, 2),
+('面接', '면접', 2429, 2, 109, 2),
+('反證', '반증', 2430, 2, 109, 2),
+('倍數', '배수', 2431, 2, 109, 2),
+('新星', '신성', 2432, 2, 109, 2),
+('貸出', '대출', 2433, 2, 108, 2),
+('仙女', '선녀', 2434, 2, 108, 2),
+('視線', '시선', 2435, 2, 108, 2),
+('熱情', '열정', 2436, 2, 108, 2),
+('情熱', '정열', 2437, 2, 108, 2),
+('三十', '삼십', 2438, 2, 107, 2),
+('元金', '원금', 2439, 2, 107, 2),
+('指定', '지정', 2440, 2, 107, 2),
+('落下傘', '낙하산', 2441, 2, 107, 2),
+('夜想曲', '야상곡', 2442, 2, 107, 2),
+('冷戰', '냉전', 2443, 2, 106, 2),
+('美術', '미술', 2444, 2, 106, 2),
+('發端', '발단', 2445, 2, 106, 2),
+('洗手', '세수', 2446, 2, 106, 2),
+('飮食', '음식', 2447, 2, 106, 2),
+('入隊', '입대', 2448, 2, 106, 2),
+('支流', '지류', 2449, 2, 106, 2),
+('天秤', '천칭', 2450, 2, 106, 2),
+('下院', '하원', 2451, 2, 106, 2),
+('發達', '발달', 2452, 2, 105, 2),
+('安全', '안전', 2453, 2, 105, 2),
+('最新', '최신', 2454, 2, 105, 2),
+('通知', '통지', 2455, 2, 105, 2),
+('落下', '낙하', 2456, 2, 104, 2),
+('白夜', '백야', 2457, 2, 104, 2),
+('署名', '서명', 2458, 2, 104, 2),
+('船員', '선원', 2459, 2, 104, 2),
+('豫感', '예감', 2460, 2, 104, 2),
+('抽出', '추출', 2461, 2, 104, 2),
+('灰色', '회색', 2462, 2, 104, 2),
+('加入', '가입', 2463, 2, 103, 2),
+('校內', '교내', 2464, 2, 103, 2),
+('路線', '노선', 2465, 2, 103, 2),
+('無臭', '무취', 2466, 2, 103, 2),
+('反射', '반사', 2467, 2, 103, 2),
+('聲明', '성명', 2468, 2, 103, 2),
+('所得', '소득', 2469, 2, 103, 2),
+('市場', '시장', 2470, 2, 103, 2),
+('通報', '통보', 2471, 2, 103, 2),
+('海邊', '해변', 2472, 2, 103, 2),
+('噴霧器', '분무기', 2473, 2, 103, 2),
+('信號燈', '신호등', 2474, 2, 103, 2),
+('間接', '간접', 2475, 2, 102, 2),
+('南東', '남동', 2476, 2, 102, 2),
+('方便', '방편', 2477, 2, 102, 2),
+('部類', '부류', 2478, 2, 102, 2),
+('書齋', '서재', 2479, 2, 102, 2),
+('正常', '정상', 2480, 2, 102, 2),
+('宗敎', '종교', 2481, 2, 102, 2),
+('表面', '표면', 2482, 2, 102, 2),
+('海賊', '해적', 2483, 2, 102, 2),
+('海峽', '해협', 2484, 2, 102, 2),
+('內在', '내재', 2485, 2, 101, 2),
+('房門', '방문', 2486, 2, 101, 2),
+('焚書', '분서', 2487, 2, 101, 2),
+('色彩', '색채', 2488, 2, 101, 2),
+('略字', '약자', 2489, 2, 101, 2),
+('引用', '인용', 2490, 2, 101, 2),
+('得點', '득점', 2491, 2, 100, 2),
+('上陸', '상륙', 2492, 2, 100, 2),
+('食卓', '식탁', 2493, 2, 100, 2),
+('幼年', '유년', 2494, 2, 100, 2),
+('點呼', '점호', 2495, 2, 100, 2),
+('祖上', '조상', 2496, 2, 100, 2),
+('職員', '직원', 2497, 2, 100, 2),
+('平和', '평화', 2498, 2, 100, 2),
+('共通', '공통', 2499, 2, 99, 2),
+('方位', '방위', 2500, 2, 99, 2),
+('合唱', '합창', 2501, 2, 99, 2),
+('軍旗', '군기', 2502, 2, 98, 2),
+('費用', '비용', 2503, 2, 98, 2),
+('聲門', '성문', 2504, 2, 98, 2),
+('宿所', '숙소', 2505, 2, 98, 2),
+('實在', '실재', 2506, 2, 98, 2),
+('年齡', '연령', 2507, 2, 98, 2),
+('證明', '증명', 2508, 2, 98, 2),
+('選擇權', '선택권', 2509, 2, 98, 2),
+('軍勢', '군세', 2510, 2, 97, 2),
+('對話', '대화', 2511, 2, 97, 2),
+('名譽', '명예', 2512, 2, 97, 2),
+('墓石', '묘석', 2513, 2, 97, 2),
+('發展', '발전', 2514, 2, 97, 2),
+('山脈', '산맥', 2515, 2, 97, 2),
+('輿論', '여론', 2516, 2, 97, 2),
+('流布', '유포', 2517, 2, 97, 2),
+('電荷', '전하', 2518, 2, 97, 2),
+('貨車', '화차', 2519, 2, 97, 2),
+('雪嶽山', '설악산', 2520, 2, 97, 2),
+('小腦', '소뇌', 2521, 2, 96, 2),
+('愛着', '애착', 2522, 2, 96, 2),
+('直線', '직선', 2523, 2, 96, 2),
+('名', '명', 2524, 2, 95, 2),
+('罰金', '벌금', 2525, 2, 95, 2),
+('所聞', '소문', 2526, 2, 95, 2),
+('昨年', '작년', 2527, 2, 95, 2),
+('低下', '저하', 2528, 2, 95, 2),
+('正裝', '정장', 2529, 2, 95, 2),
+('制度', '제도', 2530, 2, 95, 2),
+('通商', '통상', 2531, 2, 95, 2),
+('品目', '품목', 2532, 2, 95, 2),
+('下降', '하강', 2533, 2, 95, 2),
+('感覺', '감각', 2534, 2, 94, 2),
+('鼓手', '고수', 2535, 2, 94, 2),
+('終點', '종점', 2536, 2, 94, 2),
+('平等', '평등', 2537, 2, 94, 2),
+('螢石', '형석', 2538, 2, 94, 2),
+('色', '색', 2539, 2, 93, 2),
+('公益', '공익', 2540, 2, 93, 2),
+('觀光', '관광', 2541, 2, 93, 2),
+('拍手', '박수', 2542, 2, 93, 2),
+('父母', '부모', 2543, 2, 93, 2),
+('石膏', '석고', 2544, 2, 93, 2),
+('實例', '실례', 2545, 2, 93, 2),
+('愛稱', '애칭', 2546, 2, 93, 2),
+('觸手', '촉수', 2547, 2, 93, 2),
+('角度', '각도', 2548, 2, 92, 2),
+('新鮮', '신선', 2549, 2, 92, 2),
+('預金', '예금', 2550, 2, 92, 2),
+('卒業', '졸업', 2551, 2, 92, 2),
+('直後', '직후', 2552, 2, 92, 2),
+('借用', '차용', 2553, 2, 92, 2),
+('信管', '신관', 2554, 2, 91, 2),
+('思春期', '사춘기', 2555, 2, 91, 2),
+('葬禮式', '장례식', 2556, 2, 91, 2),
+('空席', '공석', 2557, 2, 90, 2),
+('關門', '관문', 2558, 2, 90, 2),
+('老兵', '노병', 2559, 2, 90, 2),
+('對處', '대처', 2560, 2, 90, 2),
+('頭腦', '두뇌', 2561, 2, 90, 2),
+('面積', '면적', 2562, 2, 90, 2),
+('私權', '사권', 2563, 2, 90, 2),
+('手巾', '수건', 2564, 2, 90, 2),
+('實態', '실태', 2565, 2, 90, 2),
+('愛好', '애호', 2566, 2, 90, 2),
+('豫後', '예후', 2567, 2, 90, 2),
+('舵手', '타수', 2568, 2, 90, 2),
+('同志', '동지', 2569, 2, 89, 2),
+('反復', '반복', 2570, 2, 89, 2),
+('設計', '설계', 2571, 2, 89, 2),
+('新聞', '신문', 2572, 2, 89, 2),
+('字幕', '자막', 2573, 2, 89, 2),
+('硝石', '초석', 2574, 2, 89, 2),
+('否定', '부정', 2575, 2, 88, 2),
+('山賊', '산적', 2576, 2, 88, 2),
+('手帖', '수첩', 2577, 2, 88, 2),
+('創作', '창작', 2578, 2, 88, 2),
+('最惡', '최악', 2579, 2, 88, 2),
+('企業', '기업', 2580, 2, 87, 2),
+('入試', '입시', 2581, 2, 87, 2),
+('情報', '정보', 2582, 2, 87, 2),
+('社說', '사설', 2583, 2, 86, 2),
+('火夫', '화부', 2584, 2, 86, 2),
+('軟口蓋', '연구개', 2585, 2, 86, 2),
+('視野', '시야', 2586, 2, 85, 2),
+('乳房', '유방', 2587, 2, 85, 2),
+('調和', '조화', 2588, 2, 85, 2),
+('注入', '주입', 2589, 2, 85, 2),
+('駐車', '주차', 2590, 2, 85, 2),
+('測定', '측정', 2591, 2, 85, 2),
+('表情', '표정', 2592, 2, 85, 2),
+('內耳', '내이', 2593, 2, 84, 2),
+('同伴', '동반', 2594, 2, 84, 2),
+('死刑', '사형', 2595, 2, 84, 2),
+('夜間', '야간', 2596, 2, 84, 2),
+('以內', '이내', 2597, 2, 84, 2),
+('通譯', '통역', 2598, 2, 84, 2),
+('對決', '대결', 2599, 2, 83, 2),
+('白癬', '백선', 2600, 2, 83, 2),
+('原型', '원형', 2601, 2, 83, 2),
+('曲調', '곡조', 2602, 2, 82, 2),
+('汽車', '기차', 2603, 2, 82, 2),
+('變身', '변신', 2604, 2, 82, 2),
+('正午', '정오', 2605, 2, 82, 2),
+('痛風', '통풍', 2606, 2, 82, 2),
+('偏愛', '편애', 2607, 2, 82, 2),
+('砲火', '포화', 2608, 2, 82, 2),
+('解除', '해제', 2609, 2, 82, 2),
+('革新', '혁신', 2610, 2, 82, 2),
+('權限', '권한', 2611, 2, 81, 2),
+('盲點', '맹점', 2612, 2, 81, 2),
+('時刻', '시각', 2613, 2, 81, 2),
+('直角', '직각', 2614, 2, 81, 2),
+('車軸', '차축', 2615, 2, 81, 2),
+('空冊', '공책', 2616, 2, 80, 2),
+('意見', '의견', 2617, 2, 80, 2),
+('解答', '해답', 2618, 2, 80, 2),
+('形跡', '형적', 2619, 2, 80, 2),
+('師團', '사단', 2620, 2, 79, 2),
+('四十', '사십', 2621, 2, 79, 2),
+('實驗', '실험', 2622, 2, 79, 2),
+('破門', '파문', 2623, 2, 79, 2),
+('八十', '팔십', 2624, 2, 79, 2),
+('百貨店', '백화점', 2625, 2, 79, 2),
+('內臟', '내장', 2626, 2, 78, 2),
+('放射', '방사', 2627, 2, 78, 2),
+('表現', '표현', 2628, 2, 78, 2),
+('車', '차', 2629, 2, 77, 2),
+('對策', '대책', 2630, 2, 77, 2),
+('副詞', '부사', 2631, 2, 77, 2),
+('線審', '선심', 2632, 2, 77, 2),
+('愛顧', '애고', 2633, 2, 77, 2),
+('原因', '원인', 2634, 2, 77, 2),
+('皮質', '피질', 2635, 2, 77, 2),
+('軍', '군', 2636, 2, 76, 2),
+('感嘆', '감탄', 2637, 2, 76, 2),
+('高麗', '고려', 2638, 2, 76, 2),
+('記述', '기술', 2639, 2, 76, 2),
+('茶房', '다방', 2640, 2, 76, 2),
+('團結', '단결', 2641, 2, 76, 2),
+('對抗', '대항', 2642, 2, 76, 2),
+('收集', '수집', 2643, 2, 76, 2),
+('勝利', '승리', 2644, 2, 76, 2),
+('原則', '원칙', 2645, 2, 76, 2),
+('乳酸', '유산', 2646, 2, 76, 2),
+('症狀', '증상', 2647, 2, 76, 2),
+('板紙', '판지', 2648, 2, 76, 2),
+('捕球', '포구', 2649, 2, 76, 2),
+('火傷', '화상', 2650, 2, 76, 2),
+('防波堤', '방파제', 2651, 2, 76, 2),
+('告別', '고별', 2652, 2, 75, 2),
+('頭蓋', '두개', 2653, 2, 75, 2),
+('信念', '신념', 2654, 2, 75, 2),
+('節約', '절약', 2655, 2, 75, 2),
+('疾風', '질풍', 2656, 2, 75, 2),
+('統制', '통제', 2657, 2, 75, 2),
+('製菓店', '제과점', 2658, 2, 75, 2),
+('症候群', '증후군', 2659, 2, 75, 2),
+('餓死', '아사', 2660, 2, 74, 2),
+('藥局', '약국', 2661, 2, 74, 2),
+('以後', '이후', 2662, 2, 74, 2),
+('訂正', '정정', 2663, 2, 74, 2),
+('韓服', '한복', 2664, 2, 74, 2),
+('輸尿管', '수뇨관', 2665, 2, 74, 2),
+('冷房', '냉방', 2666, 2, 73, 2),
+('資産', '자산', 2667, 2, 73, 2),
+('著作', '저작', 2668, 2, 73, 2),
+('映畵館', '영화관', 2669, 2, 73, 2),
+('宣言', '선언', 2670, 2, 72, 2),
+('卓球', '탁구', 2671, 2, 72, 2),
+('經營', '경영', 2672, 2, 71, 2),
+('癩病', '나병', 2673, 2, 71, 2),
+('傳送', '전송', 2674, 2, 71, 2),
+('假想', '가상', 2675, 2, 70, 2),
+('獨立', '독립', 2676, 2, 70, 2),
+('聯立', '연립', 2677, 2, 70, 2),
+('豫知', '예지', 2678, 2, 70, 2),
+('有志', '유지', 2679, 2, 70, 2),
+('週期', '주기', 2680, 2, 70, 2),
+('解釋', '해석', 2681, 2, 70, 2),
+('確信', '확신', 2682, 2, 70, 2),
+('監房', '감방', 2683, 2, 69, 2),
+('傑作', '걸작', 2684, 2, 69, 2),
+('亂視', '난시', 2685, 2, 69, 2),
+('籠球', '농구', 2686, 2, 69, 2),
+('頭註', '두주', 2687, 2, 69, 2),
+('反芻', '반추', 2688, 2, 69, 2),
+('報告', '보고', 2689, 2, 69, 2),
+('聖歌', '성가', 2690, 2, 69, 2),
+('言及', '언급', 2691, 2, 69, 2),
+('尿素', '요소', 2692, 2, 69, 2),
+('敵意', '적의', 2693, 2, 69, 2),
+('前提', '전제', 2694, 2, 69, 2),
+('注意', '주의', 2695, 2, 69, 2),
+('註解', '주해', 2696, 2, 69, 2),
+('知識', '지식', 2697, 2, 69, 2),
+('規制', '규제', 2698, 2, 68, 2),
+('視差', '시차', 2699, 2, 68, 2),
+('丈母', '장모', 2700, 2, 68, 2),
+('政府', '정부', 2701, 2, 68, 2),
+('差別', '차별', 2702, 2, 68, 2),
+('確保', '확보', 2703, 2, 68, 2),
+('加速', '가속', 2704, 2, 67, 2),
+('光景', '광경', 2705, 2, 67, 2),
+('撞球', '당구', 2706, 2, 67, 2),
+('武術', '무술', 2707, 2, 67, 2),
+('窓門', '창문', 2708, 2, 67, 2),
+('關聯', '관련', 2709, 2, 66, 2),
+('相續', '상속', 2710, 2, 66, 2),
+('意向', '의향', 2711, 2, 66, 2),
+('適當', '적당', 2712, 2, 66, 2),
+('傳統', '전통', 2713, 2, 66, 2),
+('照明', '조명', 2714, 2, 66, 2),
+('支店', '지점', 2715, 2, 66, 2),
+('形迹', '형적', 2716, 2, 66, 2),
+('後輩', '후배', 2717, 2, 66, 2),
+('多多益善', '다다익선', 2718, 2, 66, 2),
+('價格', '가격', 2719, 2, 65, 2),
+('配列', '배열', 2720, 2, 65, 2),
+('視察', '시찰', 2721, 2, 65, 2),
+('榮光', '영광', 2722, 2, 65, 2),
+('藝術', '예술', 2723, 2, 65, 2),
+('預言', '예언', 2724, 2, 65, 2),
+('午前', '오전', 2725, 2, 65, 2),
+('鎔解', '용해', 2726, 2, 65, 2),
+('原稿', '원고', 2727, 2, 65, 2),
+('有益', '유익', 2728, 2, 65, 2),
+('積極', '적극', 2729, 2, 65, 2),
+('次男', '차남', 2730, 2, 65, 2),
+('草案', '초안', 2731, 2, 65, 2),
+('間隔', '간격', 2732, 2, 64, 2),
+('監視', '감시', 2733, 2, 64, 2),
+('姑母', '고모', 2734, 2, 64, 2),
+('過失', '과실', 2735, 2, 64, 2),
+('溶解', '용해', 2736, 2, 64, 2),
+('雜草', '잡초', 2737, 2, 64, 2),
+('精製', '정제', 2738, 2, 64, 2),
+('解雇', '해고', 2739, 2, 64, 2),
+('丸藥', '환약', 2740, 2, 64, 2),
+('酵母', '효모', 2741, 2, 64, 2),
+('濟州島', '제주도', 2742, 2, 64, 2),
+('老眼', '노안', 2743, 2, 63, 2),
+('使節', '사절', 2744, 2, 63, 2),
+('眼科', '안과', 2745, 2, 63, 2),
+('腰部', '요부', 2746, 2, 63, 2),
+('表題', '표제', 2747, 2, 63, 2),
+('解剖', '해부', 2748, 2, 63, 2),
+('括約筋', '괄약근', 2749, 2, 63, 2),
+('葡萄酒', '포도주', 2750, 2, 63, 2),
+('居室', '거실', 2751, 2, 62, 2),
+('糖類', '당류', 2752, 2, 62, 2),
+('防衛', '방위', 2753, 2, 62, 2),
+('北京', '북경', 2754, 2, 62, 2),
+('常識', '상식', 2755, 2, 62, 2),
+('暗號', '암호', 2756, 2, 62, 2),
+('友情', '우정', 2757, 2, 62, 2),
+('冊房', '책방', 2758, 2, 62, 2),
+('平均', '평균', 2759, 2, 62, 2),
+('回送', '회송', 2760, 2, 62, 2),
+('美', '미', 2761, 2, 61, 2),
+('經濟', '경제', 2762, 2, 61, 2),
+('骨盤', '골반', 2763, 2, 61, 2),
+('旣成', '기성', 2764, 2, 61, 2),
+('魔術', '마술', 2765, 2, 61, 2),
+('失望', '실망', 2766, 2, 61, 2),
+('惡臭', '악취', 2767, 2, 61, 2),
+('應答', '응답', 2768, 2, 61, 2),
+('儀式', '의식', 2769, 2, 61, 2),
+('議題', '의제', 2770, 2, 61, 2),
+('轉寫', '전사', 2771, 2, 61, 2),
+('獻身', '헌신', 2772, 2, 61, 2),
+('農夫', '농부', 2773, 2, 60, 2),
+('王冠', '왕관', 2774, 2, 60, 2),
+('慰安', '위안', 2775, 2, 60, 2),
+('題目', '제목', 2776, 2, 60, 2),
+('經歷', '경력', 2777, 2, 59, 2),
+('官吏', '관리', 2778, 2, 59, 2),
+('防止', '방지', 2779, 2, 59, 2),
+('思想', '사상', 2780, 2, 59, 2),
+('釉藥', '유약', 2781, 2, 59, 2),
+('材木', '재목', 2782, 2, 59, 2),
+('花壇', '화단', 2783, 2, 59, 2),
+('結腸', '결장', 2784, 2, 58, 2),
+('木琴', '목금', 2785, 2, 58, 2),
+('誠意', '성의', 2786, 2, 58, 2),
+('消毒', '소독', 2787, 2, 58, 2),
+('順位', '순위', 2788, 2, 58, 2),
+('尉官', '위관', 2789, 2, 58, 2),
+('醫師', '의사', 2790, 2, 58, 2),
+('採集', '채집', 2791, 2, 58, 2),
+('超過', '초과', 2792, 2, 58, 2),
+('燭光', '촉광', 2793, 2, 58, 2),
+('太守', '태수', 2794, 2, 58, 2),
+('歌劇', '가극', 2795, 2, 57, 2),
+('降等', '강등', 2796, 2, 57, 2),
+('建立', '건립', 2797, 2, 57, 2),
+('交易', '교역', 2798, 2, 57, 2),
+('構造', '구조', 2799, 2, 57, 2),
+('沙果', '사과', 2800, 2, 57, 2),
+('寫眞', '사진', 2801, 2, 57, 2),
+('星雲', '성운', 2802, 2, 57, 2),
+('漁船', '어선', 2803, 2, 57, 2),
+('豫算', '예산', 2804, 2, 57, 2),
+('浴室', '욕실', 2805, 2, 57, 2),
+('資格', '자격', 2806, 2, 57, 2),
+('芍藥', '작약', 2807, 2, 57, 2),
+('裝備', '장비', 2808, 2, 57, 2),
+('株式', '주식', 2809, 2, 57, 2),
+('指標', '지표', 2810, 2, 57, 2),
+('聰明', '총명', 2811, 2, 57, 2),
+('警告', '경고', 2812, 2, 56, 2),
+('商標', '상표', 2813, 2, 56, 2),
+('消失', '소실', 2814, 2, 56, 2),
+('逆轉', '역전', 2815, 2, 56, 2),
+('運河', '운하', 2816, 2, 56, 2),
+('衛星', '위성', 2817, 2, 56, 2),
+('觸角', '촉각', 2818, 2, 56, 2),
+('投票', '투표', 2819, 2, 56, 2),
+('航路', '항로', 2820, 2, 56, 2),
+('激情', '격정', 2821, 2, 55, 2),
+('競馬', '경마', 2822, 2, 55, 2),
+('果糖', '과당', 2823, 2, 55, 2),
+('菊花', '국화', 2824, 2, 55, 2),
+('暖房', '난방', 2825, 2, 55, 2),
+('錄畵', '녹화', 2826, 2, 55, 2),
+('模造', '모조', 2827, 2, 55, 2),
+('宣傳', '선전', 2828, 2, 55, 2),
+('閃光', '섬광', 2829, 2, 55, 2),
+('受難', '수난', 2830, 2, 55, 2),
+('調整', '조정', 2831, 2, 55, 2),
+('靑春', '청춘', 2832, 2, 55, 2),
+('花盆', '화분', 2833, 2, 55, 2),
+('景福宮', '경복궁', 2834, 2, 55, 2),
+('亡命', '망명', 2835, 2, 54, 2),
+('相似', '상사', 2836, 2, 54, 2),
+('旅團', '여단', 2837, 2, 54, 2),
+('艦隊', '함대', 2838, 2, 54, 2),
+('肛門', '항문', 2839, 2, 54, 2),
+('默想', '묵상', 2840, 2, 53, 2),
+('復習', '복습', 2841, 2, 53, 2),
+('封紙', '봉지', 2842, 2, 53, 2),
+('選好', '선호', 2843, 2, 53, 2),
+('守備', '수비', 2844, 2, 53, 2),
+('誤算', '오산', 2845, 2, 53, 2),
+('親切', '친절', 2846, 2, 53, 2),
+('前', '전', 2847, 2, 52, 2),
+('渴症', '갈증', 2848, 2, 52, 2),
+('九十', '구십', 2849, 2, 52, 2),
+('貴族', '귀족', 2850, 2, 52, 2),
+('筋肉', '근육', 2851, 2, 52, 2),
+('殺菌', '살균', 2852, 2, 52, 2),
+('碩士', '석사', 2853, 2, 52, 2),
+('肉眼', '육안', 2854, 2, 52, 2),
+('冷藏庫', '냉장고', 2855, 2, 52, 2),
+('膝蓋骨', '슬개골', 2856, 2, 52, 2),
+('共犯', '공범', 2857, 2, 51, 2),
+('放浪', '방랑', 2858, 2, 51, 2),
+('例示', '예시', 2859, 2, 51, 2),
+('傳承', '전승', 2860, 2, 51, 2),
+('竹馬', '죽마', 2861, 2, 51, 2),
+('指針', '지침', 2862, 2, 51, 2),
+('退去', '퇴거', 2863, 2, 51, 2),
+('花卉', '화훼', 2864, 2, 51, 2),
+('假設', '가설', 2865, 2, 50, 2),
+('傷害', '상해', 2866, 2, 50, 2),
+('適切', '적절', 2867, 2, 50, 2),
+('透視', '투시', 2868, 2, 50, 2),
+('販賣', '판매', 2869, 2, 50, 2),
+('房', '방', 2870, 2, 49, 2),
+('配置', '배치', 2871, 2, 49, 2),
+('洗腦', '세뇌', 2872, 2, 49, 2),
+('軟骨', '연골', 2873, 2, 49, 2),
+('凝視', '응시', 2874, 2, 49, 2),
+('認可', '인가', 2875, 2, 49, 2),
+('認識', '인식', 2876, 2, 49, 2),
+('鑄造', '주조', 2877, 2, 49, 2),
+('支持', '지지', 2878, 2, 49, 2),
+('着席', '착석', 2879, 2, 49, 2),
+('幸運', '행운', 2880, 2, 49, 2),
+('歌唱', '가창', 2881, 2, 48, 2),
+('變更', '변경', 2882, 2, 48, 2),
+('條約', '조약', 2883, 2, 48, 2),
+('唱歌', '창가', 2884, 2, 48, 2),
+('快活', '쾌활', 2885, 2, 48, 2),
+('被告', '피고', 2886, 2, 48, 2),
+('效果', '효과', 2887, 2, 48, 2),
+('降雨', '강우', 2888, 2, 47, 2),
+('城壁', '성벽', 2889, 2, 47, 2),
+('消費', '소비', 2890, 2, 47, 2),
+('壽命', '수명', 2891, 2, 47, 2),
+('審議', '심의', 2892, 2, 47, 2),
+('漁夫', '어부', 2893, 2, 47, 2),
+('圓盤', '원반', 2894, 2, 47, 2),
+('園藝', '원예', 2895, 2, 47, 2),
+('暴君', '폭군', 2896, 2, 47, 2),
+('荒野', '황야', 2897, 2, 47, 2),
+('吸收', '흡수', 2898, 2, 47, 2),
+('毛皮', '모피', 2899, 2, 46, 2),
+('迷路', '미로', 2900, 2, 46, 2),
+('飼料', '사료', 2901, 2, 46, 2),
+('陰謀', '음모', 2902, 2, 46, 2),
+('種種', '종종', 2903, 2, 46, 2),
+('被害', '피해', 2904, 2, 46, 2),
+('呼吸', '호흡', 2905, 2, 46, 2),
+('決勝', '결승', 2906, 2, 45, 2),
+('骨髓', '골수', 2907, 2, 45, 2),
+('灌木', '관목', 2908, 2, 45, 2),
+('防諜', '방첩', 2909, 2, 45, 2),
+('衣服', '의복', 2910, 2, 45, 2),
+('特許', '특허', 2911, 2, 45, 2),
+('減少', '감소', 2912, 2, 44, 2),
+('夢精', '몽정', 2913, 2, 44, 2),
+('比例', '비례', 2914, 2, 44, 2),
+('使徒', '사도', 2915, 2, 44, 2),
+('首都', '수도', 2916, 2, 44, 2),
+('隣接', '인접', 2917, 2, 44, 2),
+('特徵', '특징', 2918, 2, 44, 2),
+('評決', '평결', 2919, 2, 44, 2),
+('看板', '간판', 2920, 2, 43, 2),
+('校庭', '교정', 2921, 2, 43, 2),
+('味覺', '미각', 2922, 2, 43, 2),
+('百濟', '백제', 2923, 2, 43, 2),
+('揷話', '삽화', 2924, 2, 43, 2),
+('燒酒', '소주', 2925, 2, 43, 2),
+('禮拜', '예배', 2926, 2, 43, 2),
+('優待', '우대', 2927, 2, 43, 2),
+('乳腺', '유선', 2928, 2, 43, 2),
+('展開', '전개', 2929, 2, 43, 2),
+('占領', '점령', 2930, 2, 43, 2),
+('證據', '증거', 2931, 2, 43, 2),
+('醋酸', '초산', 2932, 2, 43, 2),
+('惑星', '혹성', 2933, 2, 43, 2),
+('共鳴', '공명', 2934, 2, 42, 2),
+('屠殺', '도살', 2935, 2, 42, 2),
+('輸送', '수송', 2936, 2, 42, 2),
+('葬禮', '장례', 2937, 2, 42, 2),
+('策略', '책략', 2938, 2, 42, 2),
+('歌謠', '가요', 2939, 2, 41, 2),
+('監察', '감찰', 2940, 2, 41, 2),
+('廣告', '광고', 2941, 2, 41, 2),
+('狂亂', '광란', 2942, 2, 41, 2),
+('排卵', '배란', 2943, 2, 41, 2),
+('誤植', '오식', 2944, 2, 41, 2),
+('支拂', '지불', 2945, 2, 41, 2),
+('挾殺', '협살', 2946, 2, 41, 2),
+('兄夫', '형부', 2947, 2, 41, 2),
+('監査', '감사', 2948, 2, 40, 2),
+('江邊', '강변', 2949, 2, 40, 2),
+('急襲', '급습', 2950, 2, 40, 2),
+('失敗', '실패', 2951, 2, 40, 2),
+('按酒', '안주', 2952, 2, 40, 2),
+('暗影', '암영', 2953, 2, 40, 2),
+('映畵', '영화', 2954, 2, 40, 2),
+('田園', '전원', 2955, 2, 40, 2),
+('鍾路', '종로', 2956, 2, 40, 2),
+('締結', '체결', 2957, 2, 40, 2),
+('太后', '태후', 2958, 2, 40, 2),
+('土壤', '토양', 2959, 2, 40, 2),
+('破滅', '파멸', 2960, 2, 40, 2),
+('偏見', '편견', 2961, 2, 40, 2),
+('興味', '흥미', 2962, 2, 40, 2),
+('系統', '계통', 2963, 2, 39, 2),
+('慣習', '관습', 2964, 2, 39, 2),
+('擔當', '담당', 2965, 2, 39, 2),
+('繃帶', '붕대', 2966, 2, 39, 2),
+('習慣', '습관', 2967, 2, 39, 2),
+('隘路', '애로', 2968, 2, 39, 2),
+('陽曆', '양력', 2969, 2, 39, 2),
+('歪曲', '왜곡', 2970, 2, 39, 2),
+('寓話', '우화', 2971, 2, 39, 2),
+('移住', '이주', 2972, 2, 39, 2),
+('靭帶', '인대', 2973, 2, 39, 2),
+('摘要', '적요', 2974, 2, 39, 2),
+('處罰', '처벌', 2975, 2, 39, 2),
+('淸掃', '청소', 2976, 2, 39, 2),
+('骸骨', '해골', 2977, 2, 39, 2),
+('價値', '가치', 2978, 2, 38, 2),
+('看護', '간호', 2979, 2, 38, 2),
+('距骨', '거골', 2980, 2, 38, 2),
+('苦痛', '고통', 2981, 2, 38, 2),
+('養蜂', '양봉', 2982, 2, 38, 2),
+('濾過', '여과', 2983, 2, 38, 2),
+('資源', '자원', 2984, 2, 38, 2),
+('租界', '조계', 2985, 2, 38, 2),
+('漆板', '칠판', 2986, 2, 38, 2),
+('侵害', '침해', 2987, 2, 38, 2),
+('皮革', '피혁', 2988, 2, 38, 2),
+('項目', '항목', 2989, 2, 38, 2),
+('還甲', '환갑', 2990, 2, 38, 2),
+('單純', '단순', 2991, 2, 37, 2),
+('受胎', '수태', 2992, 2, 37, 2),
+('逆境', '역경', 2993, 2, 37, 2),
+('連載', '연재', 2994, 2, 37, 2),
+('銀河', '은하', 2995, 2, 37, 2),
+('陰莖', '음경', 2996, 2, 37, 2),
+('印章', '인장', 2997, 2, 37, 2),
+('錠劑', '정제', 2998, 2, 37, 2),
+('指揮', '지휘', 2999, 2, 37, 2),
+('責任', '책임', 3000, 2, 37, 2),
+('初旬', '초순', 3001, 2, 37, 2),
+('候補', '후보', 3002, 2, 37, 2),
+('希望', '희망', 3003, 2, 37, 2),
+('鎔鑛爐', '용광로', 3004, 2, 37, 2),
+('改革', '개혁', 3005, 2, 36, 2),
+('復歸', '복귀', 3006, 2, 36, 2),
+('象徵', '상징', 3007, 2, 36, 2),
+('洋襪', '양말', 3008, 2, 36, 2),
+('靈魂', '영혼', 3009, 2, 36, 2),
+('妖精', '요정', 3010, 2, 36, 2),
+('誘導', '유도', 3011, 2, 36, 2),
+('退却', '퇴각', 3012, 2, 36, 2),
+('評判', '평판', 3013, 2, 36, 2),
+('陷落', '함락', 3014, 2, 36, 2),
+('看破', '간파', 3015, 2, 35, 2),
+('決裂', '결렬', 3016, 2, 35, 2),
+('急迫', '급박', 3017, 2, 35, 2),
+('挽歌', '만가', 3018, 2, 35, 2),
+('災害', '재해', 3019, 2, 35, 2),
+('住宅', '주택', 3020, 2, 35, 2),
+('鎭壓', '진압', 3021, 2, 35, 2),
+('約', '약', 3022, 2, 34, 2),
+('短縮', '단축', 3023, 2, 34, 2),
+('模型', '모형', 3024, 2, 34, 2),
+('司祭', '사제', 3025, 2, 34, 2),
+('絶壁', '절벽', 3026, 2, 34, 2),
+('直徑', '직경', 3027, 2, 34, 2),
+('河川', '하천', 3028, 2, 34, 2),
+('皇帝', '황제', 3029, 2, 34, 2),
+('郵遞局', '우체국', 3030, 2, 34, 2),
+('居留', '거류', 3031, 2, 33, 2),
+('競走', '경주', 3032, 2, 33, 2),
+('困難', '곤란', 3033, 2, 33, 2),
+('根絶', '근절', 3034, 2, 33, 2),
+('禁煙', '금연', 3035, 2, 33, 2),
+('起訴', '기소', 3036, 2, 33, 2),
+('冷却', '냉각', 3037, 2, 33, 2),
+('叛徒', '반도', 3038, 2, 33, 2),
+('復舊', '복구', 3039, 2, 33, 2),
+('秘密', '비밀', 3040, 2, 33, 2),
+('郵票', '우표', 3041, 2, 33, 2),
+('胎盤', '태반', 3042, 2, 33, 2),
+('割引', '할인', 3043, 2, 33, 2),
+('拷問', '고문', 3044, 2, 32, 2),
+('凍傷', '동상', 3045, 2, 32, 2),
+('旋律', '선율', 3046, 2, 32, 2),
+('脂肪', '지방', 3047, 2, 32, 2),
+('沈香', '침향', 3048, 2, 32, 2),
+('糊精', '호정', 3049, 2, 32, 2),
+('幻覺', '환각', 3050, 2, 32, 2),
+('監獄', '감옥', 3051, 2, 31, 2),
+('禁止', '금지', 3052, 2, 31, 2),
+('補充', '보충', 3053, 2, 31, 2),
+('負傷', '부상', 3054, 2, 31, 2),
+('壓迫', '압박', 3055, 2, 31, 2),
+('肺炎', '폐렴', 3056, 2, 31, 2),
+('硬玉', '경옥', 3057, 2, 30, 2),
+('盜聽', '도청', 3058, 2, 30, 2),
+('靜脈', '정맥', 3059, 2, 30, 2),
+('胎兒', '태아', 3060, 2, 30, 2),
+('腦', '뇌', 3061, 2, 29, 2),
+('城', '성', 3062, 2, 29, 2),
+('弱', '약', 3063, 2, 29, 2),
+('繼續', '계속', 3064, 2, 29, 2),
+('到着', '도착', 3065, 2, 29, 2),
+('砂洲', '사주', 3066, 2, 29, 2),
+('森林', '삼림', 3067, 2, 29, 2),
+('申請', '신청', 3068, 2, 29, 2),
+('押收', '압수', 3069, 2, 29, 2),
+('雨傘', '우산', 3070, 2, 29, 2),
+('冊床', '책상', 3071, 2, 29, 2),
+('區劃', '구획', 3072, 2, 28, 2),
+('每番', '매번', 3073, 2, 28, 2),
+('勃起', '발기', 3074, 2, 28, 2),
+('肥滿', '비만', 3075, 2, 28, 2),
+('少尉', '소위', 3076, 2, 28, 2),
+('抑留', '억류', 3077, 2, 28, 2),
+('餘震', '여진', 3078, 2, 28, 2),
+('距離', '거리', 3079, 2, 27, 2),
+('故障', '고장', 3080, 2, 27, 2),
+('謀叛', '모반', 3081, 2, 27, 2),
+('帆布', '범포', 3082, 2, 27, 2),
+('圓陣', '원진', 3083, 2, 27, 2),
+('殘存', '잔존', 3084, 2, 27, 2),
+('寄附', '기부', 3085, 2, 26, 2),
+('浪費', '낭비', 3086, 2, 26, 2),
+('逃走', '도주', 3087, 2, 26, 2),
+('滅菌', '멸균', 3088, 2, 26, 2),
+('俳優', '배우', 3089, 2, 26, 2),
+('補償', '보상', 3090, 2, 26, 2),
+('是認', '시인', 3091, 2, 26, 2),
+('役割', '역할', 3092, 2, 26, 2),
+('影響', '영향', 3093, 2, 26, 2),
+('遺恨', '유한', 3094, 2, 26, 2),
+('參照', '참조', 3095, 2, 26, 2),
+('趣味', '취미', 3096, 2, 26, 2),
+('鑑賞', '감상', 3097, 2, 25, 2),
+('乾癬', '건선', 3098, 2, 25, 2),
+('救援', '구원', 3099, 2, 25, 2),
+('待遇', '대우', 3100, 2, 25, 2),
+('腹膜', '복막', 3101, 2, 25, 2),
+('批評', '비평', 3102, 2, 25, 2),
+('永遠', '영원', 3103, 2, 25, 2),
+('完了', '완료', 3104, 2, 25, 2),
+('威嚴', '위엄', 3105, 2, 25, 2),
+('探求', '탐구', 3106, 2, 25, 2),
+('疲勞', '피로', 3107, 2, 25, 2),
+('喜劇', '희극', 3108, 2, 25, 2),
+('建築', '건축', 3109, 2, 24, 2),
+('洗濯', '세탁', 3110, 2, 24, 2),
+('宿泊', '숙박', 3111, 2, 24, 2),
+('暗礁', '암초', 3112, 2, 24, 2),
+('餘暇', '여가', 3113, 2, 24, 2),
+('臨終', '임종', 3114, 2, 24, 2),
+('倉庫', '창고', 3115, 2, 24, 2),
+('鼓膜', '고막', 3116, 2, 23, 2),
+('貢獻', '공헌', 3117, 2, 23, 2),
+('旗幟', '기치', 3118, 2, 23, 2),
+('搜査', '수사', 3119, 2, 23, 2),
+('永眠', '영면', 3120, 2, 23, 2),
+('汚染', '오염', 3121, 2, 23, 2),
+('疑獄', '의옥', 3122, 2, 23, 2),
+('殘虐', '잔학', 3123, 2, 23, 2),
+('提供', '제공', 3124, 2, 23, 2),
+('祝祭', '축제', 3125, 2, 23, 2),
+('其他', '기타', 3126, 2, 22, 2),
+('螺旋', '나선', 3127, 2, 22, 2),
+('順序', '순서', 3128, 2, 22, 2),
+('蟯蟲', '요충', 3129, 2, 22, 2),
+('這番', '저번', 3130, 2, 22, 2),
+('刑罰', '형벌', 3131, 2, 22, 2),
+('還付', '환부', 3132, 2, 22, 2),
+('烙印', '낙인', 3133, 2, 21, 2),
+('比較', '비교', 3134, 2, 21, 2),
+('批判', '비판', 3135, 2, 21, 2),
+('完璧', '완벽', 3136, 2, 21, 2),
+('抵抗', '저항', 3137, 2, 21, 2),
+('次次', '차차', 3138, 2, 21, 2),
+('探險', '탐험', 3139, 2, 21, 2),
+('編輯', '편집', 3140, 2, 21, 2),
+('德', '덕', 3141, 2, 20, 2),
+('評', '평', 3142, 2, 20, 2),
+('到達', '도달', 3143, 2, 20, 2),
+('逃亡', '도망', 3144, 2, 20, 2),
+('洞窟', '동굴', 3145, 2, 20, 2),
+('取扱', '취급', 3146, 2, 20, 2),
+('答', '답', 3147, 2, 19, 2),
+('苗床', '묘상', 3148, 2, 19, 2),
+('貞操', '정조', 3149, 2, 19, 2),
+('褒賞', '포상', 3150, 2, 19, 2),
+('何必', '하필', 3151, 2, 19, 2),
+('比', '비', 3152, 2, 18, 2),
+('傾向', '경향', 3153, 2, 18, 2),
+('獸姦', '수간', 3154, 2, 18, 2),
+('睡眠', '수면', 3155, 2, 18, 2),
+('喘息', '천식', 3156, 2, 18, 2),
+('沈默', '침묵', 3157, 2, 18, 2),
+('兄弟', '형제', 3158, 2, 18, 2),
+('週', '주', 3159, 2, 17, 2),
+('請', '청', 3160, 2, 17, 2),
+('登攀', '등반', 3161, 2, 17, 2),
+('伴奏', '반주', 3162, 2, 17, 2),
+('掌匣', '장갑', 3163, 2, 17, 2),
+('包莖', '포경', 3164, 2, 17, 2),
+('舞蹈', '무도', 3165, 2, 16, 2),
+('午餐', '오찬', 3166, 2, 16, 2),
+('停頓', '정돈', 3167, 2, 16, 2),
+('陳述', '진술', 3168, 2, 16, 2),
+('叱責', '질책', 3169, 2, 16, 2),
+('欄干', '난간', 3170, 2, 15, 2),
+('冒險', '모험', 3171, 2, 15, 2),
+('貿易', '무역', 3172, 2, 15, 2),
+('伴侶', '반려', 3173, 2, 15, 2),
+('慈悲', '자비', 3174, 2, 15, 2),
+('雙', '쌍', 3175, 2, 14, 2),
+('勤勉', '근면', 3176, 2, 14, 2),
+('煖爐', '난로', 3177, 2, 14, 2),
+('沐浴', '목욕', 3178, 2, 14, 2),
+('腎臟', '신장', 3179, 2, 14, 2),
+('頑固', '완고', 3180, 2, 14, 2),
+('殘骸', '잔해', 3181, 2, 14, 2),
+('冊', '책', 3182, 2, 13, 2),
+('循環', '순환', 3183, 2, 13, 2),
+('煉獄', '연옥', 3184, 2, 13, 2),
+('充溢', '충일', 3185, 2, 13, 2),
+('抛棄', '포기', 3186, 2, 13, 2),
+('包圍', '포위', 3187, 2, 13, 2),
+('孔雀', '공작', 3188, 2, 12, 2),
+('詭辯', '궤변', 3189, 2, 12, 2),
+('瞳孔', '동공', 3190, 2, 12, 2),
+('浴槽', '욕조', 3191, 2, 12, 2),
+('逮捕', '체포', 3192, 2, 12, 2),
+('沈滯', '침체', 3193, 2, 12, 2),
+('抱負', '포부', 3194, 2, 12, 2),
+('富', '부', 3195, 2, 11, 2),
+('乃至', '내지', 3196, 2, 11, 2),
+('飯饌', '반찬', 3197, 2, 11, 2),
+('攝氏', '섭씨', 3198, 2, 11, 2),
+('溶媒', '용매', 3199, 2, 11, 2),
+('齋戒', '재계', 3200, 2, 11, 2),
+('恥辱', '치욕', 3201, 2, 11, 2),
+('兄嫂', '형수', 3202, 2, 11, 2),
+('鐘', '종', 3203, 2, 10, 2),
+('健康', '건강', 3204, 2, 10, 2),
+('膽汁', '담즙', 3205, 2, 10, 2),
+('唐慌', '당황', 3206, 2, 10, 2),
+('伯爵', '백작', 3207, 2, 10, 2),
+('沸騰', '비등', 3208, 2, 10, 2),
+('承諾', '승낙', 3209, 2, 10, 2),
+('沿岸', '연안', 3210, 2, 10, 2),
+('或是', '혹시', 3211, 2, 10, 2),
+('臆測', '억측', 3212, 2, 9, 2),
+('膵臟', '췌장', 3213, 2, 9, 2),
+('歡迎', '환영', 3214, 2, 9, 2),
+('均衡', '균형', 3215, 2, 8, 2),
+('摩擦', '마찰', 3216, 2, 8, 2),
+('詐欺', '사기', 3217, 2, 8, 2),
+('刹那', '찰나', 3218, 2, 8, 2),
+('胃', '위', 3219, 2, 7, 2),
+('姓銜', '성함', 3220, 2, 7, 2),
+('怨恨', '원한', 3221, 2, 7, 2),
+('陷穽', '함정', 3222, 2, 7, 2),
+('各', '각', 3223, 2, 6, 2),
+('盞', '잔', 3224, 2, 6, 2),
+('謙讓', '겸양', 3225, 2, 6, 2),
+('憤慨', '분개', 3226, 2, 6, 2),
+('絨緞', '융단', 3227, 2, 6, 2),
+('肝', '간', 3228, 2, 5, 2),
+('郡', '군', 3229, 2, 5, 2),
+('括弧', '괄호', 3230, 2, 5, 2),
+('潰瘍', '궤양', 3231, 2, 5, 2),
+('痲痺', '마비', 3232, 2, 5, 2),
+('萌芽', '맹아', 3233, 2, 4, 2),
+('坪', '평', 3234, 2, 3, 2),
+('謙遜', '겸손', 3235, 2, 3, 2),
+('氾濫', '범람', 3236, 2, 3, 2),
+('薔薇', '장미', 3237, 2, 3, 2),
+('誹謗', '비방', 3238, 2, 1, 2),
+('孃', '양', 3239, 2, 0, 2),
+('憧憬', '동경', 3240, 2, 0, 2),
+('瑪瑙', '마노', 3241, 2, 0, 2),
+('矛盾', '모순', 3242, 2, 0, 2),
+('嫉妬', '질투', 3243, 2, 0, 2),
+('物理學者', '물리학자', 3244, 1, 896, 2),
+('心理學者', '심리학자', 3245, 1, 845, 2),
+('化學者', '화학자', 3246, 1, 747, 2),
+('數學者', '수학자', 3247, 1, 710, 2),
+('科學者', '과학자', 3248, 1, 644, 2),
+('生物學', '생물학', 3249, 1, 629, 2),
+('個人主義', '개인주의', 3250, 1, 620, 2),
+('愛國者', '애국자', 3251, 1, 616, 2),
+('哲學者', '철학자', 3252, 1, 610, 2),
+('生化學', '생화학', 3253, 1, 609, 2),
+('學者', '학자', 3254, 1, 606, 2),
+('物理學', '물리학', 3255, 1, 571, 2),
+('生存者', '생존자', 3256, 1, 528, 2),
+('心理學', '심리학', 3257, 1, 520, 2),
+('外國語', '외국어', 3258, 1, 512, 2),
+('人生', '인생', 3259, 1, 506, 2),
+('論理學', '논리학', 3260, 1, 505, 2),
+('地政學', '지정학', 3261, 1, 504, 2),
+('大衆文化', '대중문화', 3262, 1, 473, 2),
+('學生', '학생', 3263, 1, 468, 2),
+('中性子', '중성자', 3264, 1, 466, 2),
+('熱力學', '열역학', 3265, 1, 458, 2),
+('植物學', '식물학', 3266, 1, 457, 2),
+('理想主義', '이상주의', 3267, 1, 454, 2),
+('人氣', '인기', 3268, 1, 435, 2),
+('高等學校', '고등학교', 3269, 1, 423, 2),
+('化學', '화학', 3270, 1, 422, 2),
+('對話者', '대화자', 3271, 1, 422, 2),
+('政治人', '정치인', 3272, 1, 418, 2),
+('倫理學', '윤리학', 3273, 1, 416, 2),
+('大理石', '대리석', 3274, 1, 412, 2),
+('靜力學', '정역학', 3275, 1, 411, 2),
+('民主化', '민주화', 3276, 1, 409, 2),
+('文學', '문학', 3277, 1, 401, 2),
+('地中海', '지중해', 3278, 1, 393, 2),
+('統治者', '통치자', 3279, 1, 389, 2),
+('創造者', '창조자', 3280, 1, 388, 2),
+('數學', '수학', 3281, 1, 385, 2),
+('初等學校', '초등학교', 3282, 1, 382, 2),
+('投票者', '투표자', 3283, 1, 381, 2),
+('指導者', '지도자', 3284, 1, 380, 2),
+('人口', '인구', 3285, 1, 378, 2),
+('參加者', '참가자', 3286, 1, 377, 2),
+('共犯者', '공범자', 3287, 1, 376, 2),
+('國際化', '국제화', 3288, 1, 376, 2),
+('成人', '성인', 3289, 1, 374, 2),
+('神學', '신학', 3290, 1, 373, 2),
+('信者', '신자', 3291, 1, 372, 2),
+('共産主義', '공산주의', 3292, 1, 365, 2),
+('配偶者', '배우자', 3293, 1, 364, 2),
+('讀者', '독자', 3294, 1, 353, 2),
+('利己主義', '이기주의', 3295, 1, 352, 2),
+('飜譯者', '번역자', 3296, 1, 349, 2),
+('譯者', '역자', 3297, 1, 344, 2),
+('工學', '공학', 3298, 1, 343, 2),
+('詩人', '시인', 3299, 1, 343, 2),
+('經濟學', '경제학', 3300, 1, 342, 2),
+('寄贈者', '기증자', 3301, 1, 340, 2),
+('仙人掌', '선인장', 3302, 1, 339, 2),
+('不動産', '부동산', 3303, 1, 338, 2),
+('酵素學', '효소학', 3304, 1, 338, 2),
+('巨人', '거인', 3305, 1, 330, 2),
+('恩人', '은인', 3306, 1, 329, 2),
+('人蔘', '인삼', 3307, 1, 324, 2),
+('科學', '과학', 3308, 1, 319, 2),
+('性的', '성적', 3309, 1, 319, 2),
+('成文化', '성문화', 3310, 1, 316, 2),
+('動物', '동물', 3311, 1, 314, 2),
+('學校', '학교', 3312, 1, 314, 2),
+('動名詞', '동명사', 3313, 1, 307, 2),
+('年月日', '연월일', 3314, 1, 305, 2),
+('物體', '물체', 3315, 1, 304, 2),
+('醫學', '의학', 3316, 1, 297, 2),
+('地理', '지리', 3317, 1, 294, 2),
+('法的', '법적', 3318, 1, 292, 2),
+('水曜日', '수요일', 3319, 1, 292, 2),
+('儒學', '유학', 3320, 1, 289, 2),
+('出生', '출생', 3321, 1, 287, 2),
+('哲學', '철학', 3322, 1, 285, 2),
+('自動', '자동', 3323, 1, 275, 2),
+('民主', '민주', 3324, 1, 268, 2),
+('電子', '전자', 3325, 1, 267, 2),
+('國王', '국왕', 3326, 1, 266, 2),
+('王國', '왕국', 3327, 1, 266, 2),
+('國立', '국립', 3328, 1, 263, 2),
+('氣體', '기체', 3329, 1, 259, 2),
+('食中毒', '식중독', 3330, 1, 257, 2),
+('海物', '해물', 3331, 1, 254, 2),
+('私生活', '사생활', 3332, 1, 254, 2),
+('大統領', '대통령', 3333, 1, 251, 2),
+('大使館', '대사관', 3334, 1, 249, 2),
+('子正', '자정', 3335, 1, 248, 2),
+('反語', '반어', 3336, 1, 247, 2),
+('自販機', '자판기', 3337, 1, 246, 2),
+('文法', '문법', 3338, 1, 245, 2),
+('有神論', '유신론', 3339, 1, 243, 2),
+('正常化', '정상화', 3340, 1, 243, 2),
+('代理店', '대리점', 3341, 1, 241, 2),
+('立方體', '입방체', 3342, 1, 241, 2),
+('言語', '언어', 3343, 1, 239, 2),
+('帝國', '제국', 3344, 1, 239, 2),
+('日氣', '일기', 3345, 1, 238, 2),
+('自轉車', '자전거', 3346, 1, 237, 2),
+('生産', '생산', 3347, 1, 236, 2),
+('客觀的', '객관적', 3348, 1, 236, 2),
+('水泳場', '수영장', 3349, 1, 236, 2),
+('十一月', '십일월', 3350, 1, 236, 2),
+('光子', '광자', 3351, 1, 234, 2),
+('水族館', '수족관', 3352, 1, 231, 2),
+('大洋', '대양', 3353, 1, 230, 2),
+('不平等', '불평등', 3354, 1, 230, 2),
+('國債', '국채', 3355, 1, 228, 2),
+('家事', '가사', 3356, 1, 227, 2),
+('中年', '중년', 3357, 1, 227, 2),
+('種子', '종자', 3358, 1, 225, 2),
+('事務所', '사무소', 3359, 1, 225, 2),
+('論理', '논리', 3360, 1, 224, 2),
+('王子', '왕자', 3361, 1, 224, 2),
+('理論', '이론', 3362, 1, 224, 2),
+('敎科書', '교과서', 3363, 1, 223, 2),
+('獨逸語', '독일어', 3364, 1, 220, 2),
+('月曜日', '월요일', 3365, 1, 220, 2),
+('資本家', '자본가', 3366, 1, 220, 2),
+('大略', '대략', 3367, 1, 218, 2),
+('大使', '대사', 3368, 1, 216, 2),
+('動員', '동원', 3369, 1, 216, 2),
+('同化', '동화', 3370, 1, 216, 2),
+('金曜日', '금요일', 3371, 1, 216, 2),
+('靜電氣', '정전기', 3372, 1, 216, 2),
+('行軍', '행군', 3373, 1, 213, 2),
+('外交官', '외교관', 3374, 1, 213, 2),
+('公法', '공법', 3375, 1, 209, 2),
+('食用油', '식용유', 3376, 1, 209, 2),
+('地位', '지위', 3377, 1, 208, 2),
+('風化', '풍화', 3378, 1, 206, 2),
+('電氣', '전기', 3379, 1, 204, 2),
+('博物館', '박물관', 3380, 1, 204, 2),
+('自白', '자백', 3381, 1, 201, 2),
+('熟語', '숙어', 3382, 1, 197, 2),
+('一月', '일월', 3383, 1, 197, 2),
+('地圖', '지도', 3384, 1, 197, 2),
+('幼生', '유생', 3385, 1, 195, 2),
+('定義', '정의', 3386, 1, 195, 2),
+('行政', '행정', 3387, 1, 195, 2),
+('語順', '어순', 3388, 1, 194, 2),
+('事務室', '사무실', 3389, 1, 194, 2),
+('汎神論', '범신론', 3390, 1, 193, 2),
+('酸性', '산성', 3391, 1, 192, 2),
+('原理', '원리', 3392, 1, 191, 2),
+('敬語', '경어', 3393, 1, 190, 2),
+('地盤', '지반', 3394, 1, 190, 2),
+('生薑', '생강', 3395, 1, 189, 2),
+('述語', '술어', 3396, 1, 189, 2),
+('長石', '장석', 3397, 1, 189, 2),
+('出發', '출발', 3398, 1, 188, 2),
+('潛水艦', '잠수함', 3399, 1, 188, 2),
+('電話番號', '전화번호', 3400, 1, 188, 2),
+('特性', '특성', 3401, 1, 187, 2),
+('子爵', '자작', 3402, 1, 186, 2),
+('卓子', '탁자', 3403, 1, 186, 2),
+('集中', '집중', 3404, 1, 185, 2),
+('排水', '배수', 3405, 1, 184, 2),
+('無花果', '무화과', 3406, 1, 184, 2),
+('火曜日', '화요일', 3407, 1, 184, 2),
+('代數', '대수', 3408, 1, 183, 2),
+('鑛物', '광물', 3409, 1, 182, 2),
+('自閉症', '자폐증', 3410, 1, 182, 2),
+('氣球', '기구', 3411, 1, 181, 2),
+('領事館', '영사관', 3412, 1, 181, 2),
+('紫水晶', '자수정', 3413, 1, 181, 2),
+('君主', '군주', 3414, 1, 179, 2),
+('獅子', '사자', 3415, 1, 179, 2),
+('文明', '문명', 3416, 1, 177, 2),
+('日光', '일광', 3417, 1, 177, 2),
+('地獄', '지옥', 3418, 1, 176, 2),
+('地雷', '지뢰', 3419, 1, 175, 2),
+('金字塔', '금자탑', 3420, 1, 175, 2),
+('不運', '불운', 3421, 1, 174, 2),
+('音樂', '음악', 3422, 1, 174, 2),
+('地峽', '지협', 3423, 1, 174, 2),
+('體溫', '체온', 3424, 1, 174, 2),
+('地震', '지진', 3425, 1, 173, 2),
+('白色', '백색', 3426, 1, 172, 2),
+('水晶', '수정', 3427, 1, 172, 2),
+('理想', '이상', 3428, 1, 172, 2),
+('合金', '합금', 3429, 1, 172, 2),
+('寶物', '보물', 3430, 1, 171, 2),
+('天球', '천구', 3431, 1, 171, 2),
+('木曜日', '목요일', 3432, 1, 171, 2),
+('分光', '분광', 3433, 1, 170, 2),
+('消化', '소화', 3434, 1, 170, 2),
+('湖水', '호수', 3435, 1, 170, 2),
+('海軍', '해군', 3436, 1, 169, 2),
+('寫眞機', '사진기', 3437, 1, 169, 2),
+('機關銃', '기관총', 3438, 1, 168, 2),
+('土曜日', '토요일', 3439, 1, 168, 2),
+('不在', '부재', 3440, 1, 167, 2),
+('十二月', '십이월', 3441, 1, 167, 2),
+('液體', '액체', 3442, 1, 166, 2),
+('不規則', '불규칙', 3443, 1, 166, 2),
+('一部', '일부', 3444, 1, 165, 2),
+('無政府', '무정부', 3445, 1, 165, 2),
+('修理', '수리', 3446, 1, 164, 2),
+('液化', '액화', 3447, 1, 164, 2),
+('圖書館', '도서관', 3448, 1, 164, 2),
+('對數', '대수', 3449, 1, 163, 2),
+('眞理', '진리', 3450, 1, 163, 2),
+('平民', '평민', 3451, 1, 163, 2),
+('音聲', '음성', 3452, 1, 162, 2),
+('精神科', '정신과', 3453, 1, 161, 2),
+('三月', '삼월', 3454, 1, 159, 2),
+('外交', '외교', 3455, 1, 159, 2),
+('體系', '체계', 3456, 1, 159, 2),
+('素數', '소수', 3457, 1, 157, 2),
+('歸化', '귀화', 3458, 1, 156, 2),
+('銀行', '은행', 3459, 1, 156, 2),
+('體操', '체조', 3460, 1, 156, 2),
+('信天翁', '신천옹', 3461, 1, 154, 2),
+('駐車場', '주차장', 3462, 1, 154, 2),
+('萬年筆', '만년필', 3463, 1, 153, 2),
+('內戰', '내전', 3464, 1, 152, 2),
+('合作', '합작', 3465, 1, 152, 2),
+('待合室', '대합실', 3466, 1, 151, 2),
+('核分裂', '핵분열', 3467, 1, 151, 2),
+('外科', '외과', 3468, 1, 150, 2),
+('多角形', '다각형', 3469, 1, 150, 2),
+('萬事', '만사', 3470, 1, 149, 2),
+('暴力', '폭력', 3471, 1, 149, 2),
+('領事', '영사', 3472, 1, 148, 2),
+('氣溫', '기온', 3473, 1, 147, 2),
+('化粧', '화장', 3474, 1, 146, 2),
+('外務', '외무', 3475, 1, 145, 2),
+('王女', '왕녀', 3476, 1, 144, 2),
+('好奇心', '호기심', 3477, 1, 144, 2),
+('導火線', '도화선', 3478, 1, 143, 2),
+('本部', '본부', 3479, 1, 142, 2),
+('不妊', '불임', 3480, 1, 142, 2),
+('書類', '서류', 3481, 1, 142, 2),
+('赤道', '적도', 3482, 1, 142, 2),
+('風車', '풍차', 3483, 1, 142, 2),
+('白葡萄酒', '백포도주', 3484, 1, 142, 2),
+('色相', '색상', 3485, 1, 141, 2),
+('被減數', '피감수', 3486, 1, 141, 2),
+('文藝', '문예', 3487, 1, 140, 2),
+('世上', '세상', 3488, 1, 140, 2),
+('尿道', '요도', 3489, 1, 140, 2),
+('代母', '대모', 3490, 1, 139, 2),
+('例外', '예외', 3491, 1, 138, 2),
+('常數', '상수', 3492, 1, 137, 2),
+('文獻', '문헌', 3493, 1, 136, 2),
+('洗濯機', '세탁기', 3494, 1, 136, 2),
+('斷頭臺', '단두대', 3495, 1, 135, 2),
+('結論', '결론', 3496, 1, 134, 2),
+('市長', '시장', 3497, 1, 134, 2),
+('火山', '화산', 3498, 1, 134, 2),
+('無責任', '무책임', 3499, 1, 134, 2),
+('敎室', '교실', 3500, 1, 133, 2),
+('構成員', '구성원', 3501, 1, 133, 2),
+('來年', '내년', 3502, 1, 132, 2),
+('斷食', '단식', 3503, 1, 132, 2),
+('憲法', '헌법', 3504, 1, 132, 2),
+('補聽器', '보청기', 3505, 1, 132, 2),
+('四月', '사월', 3506, 1, 131, 2),
+('手術', '수술', 3507, 1, 131, 2),
+('八月', '팔월', 3508, 1, 131, 2),
+('家具', '가구', 3509, 1, 130, 2),
+('産業', '산업', 3510, 1, 130, 2),
+('數百', '수백', 3511, 1, 130, 2),
+('十月', '시월', 3512, 1, 130, 2),
+('柔道', '유도', 3513, 1, 130, 2),
+('點火', '점화', 3514, 1, 130, 2),
+('會見', '회견', 3515, 1, 130, 2),
+('舞踊家', '무용가', 3516, 1, 130, 2),
+('論議', '논의', 3517, 1, 129, 2),
+('熱病', '열병', 3518, 1, 129, 2),
+('磁氣', '자기', 3519, 1, 129, 2),
+('日曜日', '일요일', 3520, 1, 129, 2),
+('事故', '사고', 3521, 1, 128, 2),
+('良心', '양심', 3522, 1, 128, 2),
+('二月', '이월', 3523, 1, 128, 2),
+('制定', '제정', 3524, 1, 128, 2),
+('讀書', '독서', 3525, 1, 127, 2),
+('入口', '입구', 3526, 1, 127, 2),
+('文盲', '문맹', 3527, 1, 126, 2),
+('電報', '전보', 3528, 1, 126, 2),
+('前置詞', '전치사', 3529, 1, 126, 2),
+('鍾乳石', '종유석', 3530, 1, 126, 2),
+('南美', '남미', 3531, 1, 125, 2),
+('本能', '본능', 3532, 1, 125, 2),
+('五月', '오월', 3533, 1, 125, 2),
+('音響', '음향', 3534, 1, 124, 2),
+('一律', '일률', 3535, 1, 124, 2),
+('平面', '평면', 3536, 1, 124, 2),
+('無罪', '무죄', 3537, 1, 123, 2),
+('十字架', '십자가', 3538, 1, 123, 2),
+('最小限', '최소한', 3539, 1, 122, 2),
+('織機', '직기', 3540, 1, 121, 2),
+('救急車', '구급차', 3541, 1, 121, 2),
+('歌手', '가수', 3542, 1, 120, 2),
+('摩天樓', '마천루', 3543, 1, 119, 2),
+('司書', '사서', 3544, 1, 118, 2),
+('心臟', '심장', 3545, 1, 118, 2),
+('外套', '외투', 3546, 1, 118, 2),
+('救出', '구출', 3547, 1, 117, 2),
+('危機', '위기', 3548, 1, 117, 2),
+('雙曲線', '쌍곡선', 3549, 1, 117, 2),
+('半球', '반구', 3550, 1, 116, 2),
+('代表', '대표', 3551, 1, 115, 2),
+('石炭', '석탄', 3552, 1, 115, 2),
+('輸出', '수출', 3553, 1, 114, 2),
+('劣等感', '열등감', 3554, 1, 113, 2),
+('代父', '대부', 3555, 1, 112, 2),
+('秘書', '비서', 3556, 1, 112, 2),
+('字板', '자판', 3557, 1, 112, 2),
+('火藥', '화약', 3558, 1, 112, 2),
+('公園', '공원', 3559, 1, 111, 2),
+('食堂', '식당', 3560, 1, 111, 2),
+('赤色', '적색', 3561, 1, 111, 2),
+('照會', '조회', 3562, 1, 111, 2),
+('鑛石', '광석', 3563, 1, 110, 2),
+('基金', '기금', 3564, 1, 110, 2),
+('農業', '농업', 3565, 1, 110, 2),
+('石英', '석영', 3566, 1, 109, 2),
+('傳記', '전기', 3567, 1, 109, 2),
+('助手', '조수', 3568, 1, 109, 2),
+('七月', '칠월', 3569, 1, 109, 2),
+('現實', '현실', 3570, 1, 109, 2),
+('敎育', '교육', 3571, 1, 108, 2),
+('今年', '금년', 3572, 1, 108, 2),
+('閉經期', '폐경기', 3573, 1, 108, 2),
+('軍備', '군비', 3574, 1, 107, 2),
+('綠色', '녹색', 3575, 1, 107, 2),
+('孫女', '손녀', 3576, 1, 107, 2),
+('原料', '원료', 3577, 1, 107, 2),
+('林業', '임업', 3578, 1, 107, 2),
+('長壽', '장수', 3579, 1, 107, 2),
+('高校', '고교', 3580, 1, 106, 2),
+('野球', '야구', 3581, 1, 106, 2),
+('宴會', '연회', 3582, 1, 106, 2),
+('穿山甲', '천산갑', 3583, 1, 106, 2),
+('神秘', '신비', 3584, 1, 105, 2),
+('糖尿病', '당뇨병', 3585, 1, 105, 2),
+('九月', '구월', 3586, 1, 104, 2),
+('砲車', '포차', 3587, 1, 104, 2),
+('海綿', '해면', 3588, 1, 104, 2),
+('開場', '개장', 3589, 1, 103, 2),
+('曲線', '곡선', 3590, 1, 103, 2),
+('周年', '주년', 3591, 1, 103, 2),
+('公衆', '공중', 3592, 1, 102, 2),
+('病院', '병원', 3593, 1, 102, 2),
+('佛敎', '불교', 3594, 1, 102, 2),
+('磁石', '자석', 3595, 1, 102, 2),
+('公敵', '공적', 3596, 1, 101, 2),
+('淑女', '숙녀', 3597, 1, 101, 2),
+('戰爭', '전쟁', 3598, 1, 101, 2),
+('正直', '정직', 3599, 1, 101, 2),
+('眞空', '진공', 3600, 1, 101, 2),
+('眞實', '진실', 3601, 1, 101, 2),
+('領收證', '영수증', 3602, 1, 101, 2),
+('決定', '결정', 3603, 1, 100, 2),
+('起點', '기점', 3604, 1, 100, 2),
+('要員', '요원', 3605, 1, 100, 2),
+('開通', '개통', 3606, 1, 99, 2),
+('靈感', '영감', 3607, 1, 99, 2),
+('匿名', '익명', 3608, 1, 99, 2),
+('放火', '방화', 3609, 1, 98, 2),
+('立方', '입방', 3610, 1, 98, 2),
+('戰艦', '전함', 3611, 1, 98, 2),
+('重量', '중량', 3612, 1, 98, 2),
+('陶器', '도기', 3613, 1, 97, 2),
+('新婦', '신부', 3614, 1, 97, 2),
+('彈藥', '탄약', 3615, 1, 97, 2),
+('風習', '풍습', 3616, 1, 97, 2),
+('褐色', '갈색', 3617, 1, 96, 2),
+('氷山', '빙산', 3618, 1, 96, 2),
+('石榴', '석류', 3619, 1, 96, 2),
+('食醋', '식초', 3620, 1, 96, 2),
+('改正', '개정', 3621, 1, 95, 2),
+('月蝕', '월식', 3622, 1, 95, 2),
+('部族', '부족', 3623, 1, 94, 2),
+('收入', '수입', 3624, 1, 94, 2),
+('案內', '안내', 3625, 1, 94, 2),
+('儒敎', '유교', 3626, 1, 94, 2),
+('眞言', '진언', 3627, 1, 94, 2),
+('特權', '특권', 3628, 1, 94, 2),
+('交響曲', '교향곡', 3629, 1, 94, 2),
+('酸素', '산소', 3630, 1, 93, 2),
+('石棺', '석관', 3631, 1, 93, 2),
+('原告', '원고', 3632, 1, 93, 2),
+('閏年', '윤년', 3633, 1, 93, 2),
+('電池', '전지', 3634, 1, 93, 2),
+('年', '년', 3635, 1, 92, 2),
+('軍艦', '군함', 3636, 1, 92, 2),
+('導入', '도입', 3637, 1, 92, 2),
+('氷點', '빙점', 3638, 1, 92, 2),
+('公爵', '공작', 3639, 1, 91, 2),
+('內陸', '내륙', 3640, 1, 91, 2),
+('石墨', '석묵', 3641, 1, 91, 2),
+('石筍', '석순', 3642, 1, 91, 2),
+('占星術', '점성술', 3643, 1, 91, 2),
+('男便', '남편', 3644, 1, 90, 2),
+('握手', '악수', 3645, 1, 90, 2),
+('眼球', '안구', 3646, 1, 90, 2),
+('血淸', '혈청', 3647, 1, 90, 2),
+('靑寫眞', '청사진', 3648, 1, 90, 2),
+('用途', '용도', 3649, 1, 89, 2),
+('隕石', '운석', 3650, 1, 89, 2),
+('統計', '통계', 3651, 1, 89, 2),
+('吸入', '흡입', 3652, 1, 89, 2),
+('裁判官', '재판관', 3653, 1, 89, 2),
+('金箔', '금박', 3654, 1, 88, 2),
+('船室', '선실', 3655, 1, 88, 2),
+('屋上', '옥상', 3656, 1, 88, 2),
+('經度', '경도', 3657, 1, 87, 2),
+('惡習', '악습', 3658, 1, 87, 2),
+('誤解', '오해', 3659, 1, 87, 2),
+('便紙', '편지', 3660, 1, 87, 2),
+('後退', '후퇴', 3661, 1, 87, 2),
+('排球', '배구', 3662, 1, 86, 2),
+('政黨', '정당', 3663, 1, 86, 2),
+('硏究員', '연구원', 3664, 1, 86, 2),
+('小銃', '소총', 3665, 1, 85, 2),
+('應接', '응접', 3666, 1, 85, 2),
+('通貨', '통화', 3667, 1, 85, 2),
+('拍車', '박차', 3668, 1, 84, 2),
+('造船', '조선', 3669, 1, 83, 2),
+('助言', '조언', 3670, 1, 83, 2),
+('空港', '공항', 3671, 1, 82, 2),
+('毒素', '독소', 3672, 1, 82, 2),
+('輸入', '수입', 3673, 1, 82, 2),
+('便宜店', '편의점', 3674, 1, 82, 2),
+('綴字', '철자', 3675, 1, 81, 2),
+('赤葡萄酒', '적포도주', 3676, 1, 81, 2),
+('血壓', '혈압', 3677, 1, 80, 2),
+('血液', '혈액', 3678, 1, 80, 2),
+('看護師', '간호사', 3679, 1, 80, 2),
+('古典', '고전', 3680, 1, 79, 2),
+('工具', '공구', 3681, 1, 79, 2),
+('旋風', '선풍', 3682, 1, 79, 2),
+('雨期', '우기', 3683, 1, 79, 2),
+('計座', '계좌', 3684, 1, 78, 2),
+('球菌', '구균', 3685, 1, 78, 2),
+('頭痛', '두통', 3686, 1, 78, 2),
+('縮小', '축소', 3687, 1, 78, 2),
+('車輛', '차량', 3688, 1, 77, 2),
+('銃口', '총구', 3689, 1, 77, 2),
+('介入', '개입', 3690, 1, 76, 2),
+('購入', '구입', 3691, 1, 76, 2),
+('世紀', '세기', 3692, 1, 76, 2),
+('運轉', '운전', 3693, 1, 76, 2),
+('轉賣', '전매', 3694, 1, 76, 2),
+('政策', '정책', 3695, 1, 76, 2),
+('破産', '파산', 3696, 1, 76, 2),
+('姦通', '간통', 3697, 1, 75, 2),
+('王朝', '왕조', 3698, 1, 75, 2),
+('試驗管', '시험관', 3699, 1, 75, 2),
+('溫度', '온도', 3700, 1, 74, 2),
+('齒藥', '치약', 3701, 1, 74, 2),
+('土臺', '토대', 3702, 1, 74, 2),
+('萬華鏡', '만화경', 3703, 1, 74, 2),
+('口蓋', '구개', 3704, 1, 73, 2),
+('私立', '사립', 3705, 1, 73, 2),
+('揷入', '삽입', 3706, 1, 73, 2),
+('識別', '식별', 3707, 1, 73, 2),
+('炎症', '염증', 3708, 1, 73, 2),
+('領土', '영토', 3709, 1, 73, 2),
+('豫防', '예방', 3710, 1, 73, 2),
+('五十', '오십', 3711, 1, 73, 2),
+('午後', '오후', 3712, 1, 73, 2),
+('版權', '판권', 3713, 1, 73, 2),
+('複利', '복리', 3714, 1, 72, 2),
+('式典', '식전', 3715, 1, 72, 2),
+('愛撫', '애무', 3716, 1, 72, 2),
+('陽極', '양극', 3717, 1, 71, 2),
+('前衛', '전위', 3718, 1, 71, 2),
+('制裁', '제재', 3719, 1, 71, 2),
+('重譯', '중역', 3720, 1, 71, 2),
+('未來', '미래', 3721, 1, 70, 2),
+('進級', '진급', 3722, 1, 70, 2),
+('退位', '퇴위', 3723, 1, 70, 2),
+('結婚', '결혼', 3724, 1, 69, 2),
+('反駁', '반박', 3725, 1, 69, 2),
+('全滅', '전멸', 3726, 1, 69, 2),
+('現象', '현상', 3727, 1, 69, 2),
+('木炭', '목탄', 3728, 1, 68, 2),
+('父親', '부친', 3729, 1, 68, 2),
+('惡夢', '악몽', 3730, 1, 68, 2),
+('豫報', '예보', 3731, 1, 68, 2),
+('單眼鏡', '단안경', 3732, 1, 68, 2),
+('檢證', '검증', 3733, 1, 67, 2),
+('陶工', '도공', 3734, 1, 67, 2),
+('命題', '명제', 3735, 1, 67, 2),
+('排便', '배변', 3736, 1, 67, 2),
+('校服', '교복', 3737, 1, 66, 2),
+('兵役', '병역', 3738, 1, 66, 2),
+('聯隊', '연대', 3739, 1, 66, 2),
+('火葬', '화장', 3740, 1, 66, 2),
+('望遠鏡', '망원경', 3741, 1, 66, 2),
+('口臭', '구취', 3742, 1, 65, 2),
+('野菜', '야채', 3743, 1, 65, 2),
+('颱風', '태풍', 3744, 1, 65, 2),
+('話題', '화제', 3745, 1, 65, 2),
+('滑走路', '활주로', 3746, 1, 65, 2),
+('南', '남', 3747, 1, 64, 2),
+('角膜', '각막', 3748, 1, 64, 2),
+('視覺', '시각', 3749, 1, 64, 2),
+('前景', '전경', 3750, 1, 64, 2),
+('症候', '증후', 3751, 1, 64, 2),
+('解析', '해석', 3752, 1, 64, 2),
+('密度', '밀도', 3753, 1, 63, 2),
+('辭職', '사직', 3754, 1, 63, 2),
+('聖像', '성상', 3755, 1, 63, 2),
+('創造', '창조', 3756, 1, 63, 2),
+('喉頭', '후두', 3757, 1, 63, 2),
+('乾草', '건초', 3758, 1, 62, 2),
+('甲板', '갑판', 3759, 1, 61, 2),
+('査證', '사증', 3760, 1, 61, 2),
+('暗殺', '암살', 3761, 1, 61, 2),
+('投資', '투자', 3762, 1, 61, 2),
+('覇權', '패권', 3763, 1, 61, 2),
+('潛望鏡', '잠망경', 3764, 1, 61, 2),
+('後', '후', 3765, 1, 60, 2),
+('過勞', '과로', 3766, 1, 60, 2),
+('賣春', '매춘', 3767, 1, 60, 2),
+('未婚', '미혼', 3768, 1, 60, 2),
+('魚龍', '어룡', 3769, 1, 60, 2),
+('知覺', '지각', 3770, 1, 60, 2),
+('河馬', '하마', 3771, 1, 60, 2),
+('協奏曲', '협주곡', 3772, 1, 60, 2),
+('營養', '영양', 3773, 1, 59, 2),
+('將來', '장래', 3774, 1, 59, 2),
+('折半', '절반', 3775, 1, 59, 2),
+('制御', '제어', 3776, 1, 59, 2),
+('弓術', '궁술', 3777, 1, 58, 2),
+('證券', '증권', 3778, 1, 58, 2),
+('護送', '호송', 3779, 1, 58, 2),
+('格納庫', '격납고', 3780, 1, 58, 2),
+('北', '북', 3781, 1, 57, 2),
+('非常', '비상', 3782, 1, 57, 2),
+('洗劑', '세제', 3783, 1, 57, 2),
+('王座', '왕좌', 3784, 1, 57, 2),
+('憎惡', '증오', 3785, 1, 57, 2),
+('七十', '칠십', 3786, 1, 57, 2),
+('酵素', '효소', 3787, 1, 57, 2),
+('巡洋艦', '순양함', 3788, 1, 57, 2),
+('講師', '강사', 3789, 1, 56, 2),
+('官僚', '관료', 3790, 1, 56, 2),
+('魚雷', '어뢰', 3791, 1, 56, 2),
+('異端', '이단', 3792, 1, 56, 2),
+('甘草', '감초', 3793, 1, 55, 2),
+('保險', '보험', 3794, 1, 55, 2),
+('産婆', '산파', 3795, 1, 55, 2),
+('魚網', '어망', 3796, 1, 55, 2),
+('陰核', '음핵', 3797, 1, 55, 2),
+('離婚', '이혼', 3798, 1, 55, 2),
+('陳情', '진정', 3799, 1, 55, 2),
+('警察署', '경찰서', 3800, 1, 55, 2),
+('都市', '도시', 3801, 1, 54, 2),
+('迷信', '미신', 3802, 1, 54, 2),
+('精液', '정액', 3803, 1, 54, 2),
+('祖父', '조부', 3804, 1, 54, 2),
+('宦官', '환관', 3805, 1, 54, 2),
+('千里眼', '천리안', 3806, 1, 54, 2),
+('境界', '경계', 3807, 1, 53, 2),
+('半徑', '반경', 3808, 1, 53, 2),
+('回腸', '회장', 3809, 1, 53, 2),
+('孤立', '고립', 3810, 1, 52, 2),
+('童話', '동화', 3811, 1, 52, 2),
+('紳士', '신사', 3812, 1, 52, 2),
+('參加', '참가', 3813, 1, 52, 2),
+('寢室', '침실', 3814, 1, 52, 2),
+('環境汚染', '환경오염', 3815, 1, 52, 2),
+('半', '반', 3816, 1, 51, 2),
+('男爵', '남작', 3817, 1, 51, 2),
+('燈臺', '등대', 3818, 1, 51, 2),
+('洗禮', '세례', 3819, 1, 51, 2),
+('乘客', '승객', 3820, 1, 51, 2),
+('鹽酸', '염산', 3821, 1, 51, 2),
+('逸話', '일화', 3822, 1, 51, 2),
+('直腸', '직장', 3823, 1, 51, 2),
+('抗議', '항의', 3824, 1, 51, 2),
+('季節', '계절', 3825, 1, 50, 2),
+('舞臺', '무대', 3826, 1, 50, 2),
+('誤差', '오차', 3827, 1, 50, 2),
+('絶望', '절망', 3828, 1, 50, 2),
+('廚房', '주방', 3829, 1, 50, 2),
+('診斷', '진단', 3830, 1, 50, 2),
+('木蓮', '목련', 3831, 1, 49, 2),
+('肥料', '비료', 3832, 1, 49, 2),
+('辭典', '사전', 3833, 1, 49, 2),
+('星座', '성좌', 3834, 1, 49, 2),
+('燃料', '연료', 3835, 1, 49, 2),
+('僞證', '위증', 3836, 1, 49, 2),
+('甲蟲', '갑충', 3837, 1, 48, 2),
+('悲觀', '비관', 3838, 1, 48, 2),
+('辭任', '사임', 3839, 1, 48, 2),
+('印象', '인상', 3840, 1, 48, 2),
+('投獄', '투옥', 3841, 1, 48, 2),
+('紅茶', '홍차', 3842, 1, 48, 2),
+('宿題', '숙제', 3843, 1, 47, 2),
+('王妃', '왕비', 3844, 1, 47, 2),
+('着陸', '착륙', 3845, 1, 47, 2),
+('檢査', '검사', 3846, 1, 46, 2),
+('汽船', '기선', 3847, 1, 46, 2),
+('麥酒', '맥주', 3848, 1, 46, 2),
+('選擧', '선거', 3849, 1, 46, 2),
+('消息', '소식', 3850, 1, 46, 2),
+('鍼術', '침술', 3851, 1, 46, 2),
+('版圖', '판도', 3852, 1, 46, 2),
+('乾葡萄', '건포도', 3853, 1, 46, 2),
+('塗料', '도료', 3854, 1, 45, 2),
+('鑄鐵', '주철', 3855, 1, 45, 2),
+('鋼鐵', '강철', 3856, 1, 44, 2),
+('改良', '개량', 3857, 1, 44, 2),
+('堅果', '견과', 3858, 1, 44, 2),
+('級友', '급우', 3859, 1, 44, 2),
+('審問', '심문', 3860, 1, 44, 2),
+('草稿', '초고', 3861, 1, 44, 2),
+('忠告', '충고', 3862, 1, 44, 2),
+('滿足', '만족', 3863, 1, 43, 2),
+('瞑想', '명상', 3864, 1, 43, 2),
+('犯罪', '범죄', 3865, 1, 43, 2),
+('樹脂', '수지', 3866, 1, 43, 2),
+('砲艦', '포함', 3867, 1, 43, 2),
+('割禮', '할례', 3868, 1, 43, 2),
+('協商', '협상', 3869, 1, 43, 2),
+('戀歌', '연가', 3870, 1, 42, 2),
+('刺客', '자객', 3871, 1, 42, 2),
+('提示', '제시', 3872, 1, 42, 2),
+('靑銅', '청동', 3873, 1, 42, 2),
+('再考', '재고', 3874, 1, 41, 2),
+('次元', '차원', 3875, 1, 41, 2),
+('筆跡', '필적', 3876, 1, 41, 2),
+('果汁', '과즙', 3877, 1, 40, 2),
+('救助', '구조', 3878, 1, 40, 2),
+('段落', '단락', 3879, 1, 40, 2),
+('望樓', '망루', 3880, 1, 40, 2),
+('毛蟲', '모충', 3881, 1, 40, 2),
+('複寫', '복사', 3882, 1, 40, 2),
+('市廳', '시청', 3883, 1, 40, 2),
+('映寫', '영사', 3884, 1, 40, 2),
+('寢臺', '침대', 3885, 1, 40, 2),
+('居住', '거주', 3886, 1, 39, 2),
+('旋盤', '선반', 3887, 1, 39, 2),
+('劣等', '열등', 3888, 1, 39, 2),
+('許可', '허가', 3889, 1, 39, 2),
+('建設', '건설', 3890, 1, 38, 2),
+('顧客', '고객', 3891, 1, 38, 2),
+('校訂', '교정', 3892, 1, 38, 2),
+('旗艦', '기함', 3893, 1, 38, 2),
+('萬若', '만약', 3894, 1, 38, 2),
+('微笑', '미소', 3895, 1, 38, 2),
+('鉛筆', '연필', 3896, 1, 38, 2),
+('聽取', '청취', 3897, 1, 38, 2),
+('恒常', '항상', 3898, 1, 38, 2),
+('單峰駱駝', '단봉낙타', 3899, 1, 38, 2),
+('決鬪', '결투', 3900, 1, 37, 2),
+('勤勞', '근로', 3901, 1, 37, 2),
+('落第', '낙제', 3902, 1, 37, 2),
+('粉筆', '분필', 3903, 1, 37, 2),
+('雪糖', '설탕', 3904, 1, 37, 2),
+('彗星', '혜성', 3905, 1, 37, 2),
+('肋骨', '늑골', 3906, 1, 36, 2),
+('茶菓', '다과', 3907, 1, 36, 2),
+('梅毒', '매독', 3908, 1, 36, 2),
+('謝罪', '사죄', 3909, 1, 36, 2),
+('巡禮', '순례', 3910, 1, 36, 2),
+('標準', '표준', 3911, 1, 36, 2),
+('許容', '허용', 3912, 1, 36, 2),
+('幼稚園', '유치원', 3913, 1, 36, 2),
+('紀元', '기원', 3914, 1, 35, 2),
+('冷凍', '냉동', 3915, 1, 35, 2),
+('補給', '보급', 3916, 1, 35, 2),
+('氷河', '빙하', 3917, 1, 35, 2),
+('裁判', '재판', 3918, 1, 35, 2),
+('座席', '좌석', 3919, 1, 35, 2),
+('指紋', '지문', 3920, 1, 35, 2),
+('檢疫', '검역', 3921, 1, 34, 2),
+('群島', '군도', 3922, 1, 34, 2),
+('隨筆', '수필', 3923, 1, 34, 2),
+('旅券', '여권', 3924, 1, 34, 2),
+('征服', '정복', 3925, 1, 34, 2),
+('週末', '주말', 3926, 1, 34, 2),
+('齒痛', '치통', 3927, 1, 34, 2),
+('破壞', '파괴', 3928, 1, 34, 2),
+('宮殿', '궁전', 3929, 1, 33, 2),
+('緊急', '긴급', 3930, 1, 33, 2),
+('滿洲', '만주', 3931, 1, 33, 2),
+('迷宮', '미궁', 3932, 1, 33, 2),
+('悲劇', '비극', 3933, 1, 33, 2),
+('圓周', '원주', 3934, 1, 33, 2),
+('參與', '참여', 3935, 1, 33, 2),
+('檢屍', '검시', 3936, 1, 32, 2),
+('缺席', '결석', 3937, 1, 32, 2),
+('孤兒', '고아', 3938, 1, 32, 2),
+('損失', '손실', 3939, 1, 32, 2),
+('莊園', '장원', 3940, 1, 32, 2),
+('皮膚', '피부', 3941, 1, 32, 2),
+('逆襲', '역습', 3942, 1, 31, 2),
+('銃劍', '총검', 3943, 1, 31, 2),
+('虐待', '학대', 3944, 1, 31, 2),
+('江', '강', 3945, 1, 30, 2),
+('脚注', '각주', 3946, 1, 30, 2),
+('糖蜜', '당밀', 3947, 1, 30, 2),
+('幼蟲', '유충', 3948, 1, 30, 2),
+('樟腦', '장뇌', 3949, 1, 30, 2),
+('肖像', '초상', 3950, 1, 30, 2),
+('獲得', '획득', 3951, 1, 30, 2),
+('肝炎', '간염', 3952, 1, 29, 2),
+('啓示', '계시', 3953, 1, 29, 2),
+('寡婦', '과부', 3954, 1, 29, 2),
+('奇跡', '기적', 3955, 1, 29, 2),
+('背景', '배경', 3956, 1, 29, 2),
+('英雄', '영웅', 3957, 1, 29, 2),
+('圓筒', '원통', 3958, 1, 29, 2),
+('僞善', '위선', 3959, 1, 29, 2),
+('環境', '환경', 3960, 1, 29, 2),
+('昇華', '승화', 3961, 1, 28, 2),
+('阿片', '아편', 3962, 1, 28, 2),
+('怪談', '괴담', 3963, 1, 27, 2),
+('宿醉', '숙취', 3964, 1, 27, 2),
+('優秀', '우수', 3965, 1, 27, 2),
+('提督', '제독', 3966, 1, 27, 2),
+('印刷', '인쇄', 3967, 1, 26, 2),
+('雜誌', '잡지', 3968, 1, 26, 2),
+('齒髓', '치수', 3969, 1, 26, 2),
+('驅逐艦', '구축함', 3970, 1, 26, 2),
+('麝香', '사향', 3971, 1, 25, 2),
+('尊嚴', '존엄', 3972, 1, 25, 2),
+('祝福', '축복', 3973, 1, 25, 2),
+('拳鬪', '권투', 3974, 1, 24, 2),
+('飜譯', '번역', 3975, 1, 24, 2),
+('遲延', '지연', 3976, 1, 24, 2),
+('齒牙', '치아', 3977, 1, 24, 2),
+('駝鳥', '타조', 3978, 1, 24, 2),
+('瀑布', '폭포', 3979, 1, 24, 2),
+('霧氷', '무빙', 3980, 1, 23, 2),
+('帆走', '범주', 3981, 1, 23, 2),
+('偵察', '정찰', 3982, 1, 23, 2),
+('從屬', '종속', 3983, 1, 23, 2),
+('唾液', '타액', 3984, 1, 23, 2),
+('恐龍', '공룡', 3985, 1, 22, 2),
+('削除', '삭제', 3986, 1, 22, 2),
+('巡航', '순항', 3987, 1, 22, 2),
+('楕圓', '타원', 3988, 1, 22, 2),
+('喫煙', '끽연', 3989, 1, 21, 2),
+('繁榮', '번영', 3990, 1, 21, 2),
+('漁獲', '어획', 3991, 1, 21, 2),
+('粘膜', '점막', 3992, 1, 20, 2),
+('薦擧', '천거', 3993, 1, 20, 2),
+('皇后', '황후', 3994, 1, 20, 2),
+('銀', '은', 3995, 1, 19, 2),
+('蔗糖', '자당', 3996, 1, 19, 2),
+('貸付', '대부', 3997, 1, 18, 2),
+('封鎖', '봉쇄', 3998, 1, 18, 2),
+('隱匿', '은닉', 3999, 1, 18, 2),
+('只今', '지금', 4000, 1, 18, 2),
+('推薦', '추천', 4001, 1, 18, 2),
+('啓蒙', '계몽', 4002, 1, 17, 2),
+('奇蹟', '기적', 4003, 1, 17, 2),
+('負債', '부채', 4004, 1, 17, 2),
+('舷窓', '현창', 4005, 1, 17, 2),
+('熔岩', '용암', 4006, 1, 16, 2),
+('借款', '차관', 4007, 1, 16, 2),
+('窓', '창', 4008, 1, 15, 2),
+('麻雀', '마작', 4009, 1, 15, 2),
+('秘訣', '비결', 4010, 1, 15, 2),
+('悲慘', '비참', 4011, 1, 15, 2),
+('觸媒', '촉매', 4012, 1, 15, 2),
+('妥協', '타협', 4013, 1, 15, 2),
+('癌', '암', 4014, 1, 14, 2),
+('燒却', '소각', 4015, 1, 14, 2),
+('誇張', '과장', 4016, 1, 13, 2),
+('模倣', '모방', 4017, 1, 13, 2),
+('睡蓮', '수련', 4018, 1, 13, 2),
+('智慧', '지혜', 4019, 1, 13, 2),
+('痔疾', '치질', 4020, 1, 13, 2),
+('鼓吹', '고취', 4021, 1, 12, 2),
+('麥芽', '맥아', 4022, 1, 12, 2),
+('鳴禽', '명금', 4023, 1, 12, 2),
+('卑怯', '비겁', 4024, 1, 12, 2),
+('右舷', '우현', 4025, 1, 12, 2),
+('頁岩', '혈암', 4026, 1, 12, 2),
+('綿', '면', 4027, 1, 11, 2),
+('遲滯', '지체', 4028, 1, 11, 2),
+('駱駝', '낙타', 4029, 1, 10, 2),
+('賭博', '도박', 4030, 1, 10, 2),
+('淋疾', '임질', 4031, 1, 10, 2),
+('祝杯', '축배', 4032, 1, 10, 2),
+('恐慌', '공황', 4033, 1, 9, 2),
+('範疇', '범주', 4034, 1, 9, 2),
+('扁桃', '편도', 4035, 1, 9, 2),
+('虹彩', '홍채', 4036, 1, 9, 2),
+('贈呈', '증정', 4037, 1, 8, 2),
+('溪谷', '계곡', 4038, 1, 7, 2),
+('睾丸', '고환', 4039, 1, 7, 2),
+('堆肥', '퇴비', 4040, 1, 7, 2),
+('肥沃', '비옥', 4041, 1, 5, 2),
+('珊瑚', '산호', 4042, 1, 4, 2),
+('琥珀', '호박', 4043, 1, 4, 2),
+('灌漑', '관개', 4044, 1, 3, 2),
+('饑饉', '기근', 4045, 1, 3, 2),
+('朗誦', '낭송', 4046, 1, 2, 2),
+('紡錘', '방추', 4047, 1, 2, 2),
+('翡翠', '비취', 4048, 1, 0, 2),
+('猥褻', '외설', 4049, 1, 0, 2),
+('躊躇', '주저', 4050, 1, 0, 2),
+(NULL, '바르다', 4051, 70, 0, 1),
+(NULL, '치다', 4052, 69, 0, 1),
+(NULL, '박다', 4053, 54, 0, 1),
+(NULL, '들다', 4054, 38, 0, 1),
+(NULL, '맞다', 4055, 38, 0, 1),
+(NULL, '받다', 4056, 35, 0, 1),
+(NULL, '부리다', 4057, 33, 0, 1),
+(NULL, '뜨다', 4058, 32, 0, 1),
+('世襲巫', '세습무', 4059, 29, 82, 1),
+(NULL, '하다', 4060, 29, 0, 1),
+('降神巫', '강신무', 4061, 27, 121, 1),
+(NULL, '뺑뺑이', 4062, 27, 0, 1),
+('事大主義', '사대주의', 4063, 26, 590, 1),
+('虎口', '호구', 4064, 26, 68, 1),
+(NULL, '보다', 4065, 26, 0, 1),
+('天人', '천인', 4066, 25, 425, 1),
+('事大', '사대', 4067, 25, 308, 1),
+(NULL, '자', 4068, 25, 0, 1),
+(NULL, '발가벗다', 4069, 25, 0, 1),
+(NULL, '지다', 4070, 24, 0, 1),
+(NULL, '붙잡다', 4071, 24, 0, 1),
+(NULL, '쉬다', 4072, 23, 0, 1),
+('訓主音從', '훈주음종', 4073, 22, 307, 1),
+('咸鏡', '함경', 4074, 22, 23, 1),
+(NULL, '길', 4075, 22, 0, 1),
+(NULL, '끼다', 4076, 22, 0, 1),
+(NULL, '놀다', 4077, 22, 0, 1),
+(NULL, '대다', 4078, 22, 0, 1),
+(NULL, '떡밥', 4079, 22, 0, 1),
+('大院君', '대원군', 4080, 21, 242, 1),
+('進上', '진상', 4081, 21, 118, 1),
+('脈', '맥', 4082, 21, 18, 1),
+(NULL, '살', 4083, 21, 0, 1),
+(NULL, '붙다', 4084, 21, 0, 1),
+(NULL, '먹이다', 4085, 21, 0, 1),
+(NULL, '물타기', 4086, 21, 0, 1),
+('風', '풍', 4087, 20, 65, 1),
+(NULL, '쓰다', 4088, 20, 0, 1),
+(NULL, '재다', 4089, 20, 0, 1),
+(NULL, '차다', 4090, 20, 0, 1),
+(NULL, '빠지다', 4091, 20, 0, 1),
+(NULL, '말', 4092, 19, 0, 1),
+(NULL, '단골', 4093, 19, 0, 1),
+(NULL, '솔다', 4094, 19, 0, 1),
+('道士', '도사', 4095, 18, 176, 1),
+(NULL, '굽다', 4096, 18, 0, 1),
+(NULL, '끊다', 4097, 18, 0, 1),
+(NULL, '놀량', 4098, 18, 0, 1),
+(NULL, '달다', 4099, 18, 0, 1),
+(NULL, '짜다', 4100, 18, 0, 1),
+('長者', '장자', 4101, 17, 425, 1),
+('三體', '삼체', 4102, 17, 211, 1),
+('明堂', '명당', 4103, 17, 75, 1),
+('聲讀', '성독', 4104, 17, 74, 1),
+(NULL, '무', 4105, 17, 0, 1),
+(NULL, '짬', 4106, 17, 0, 1),
+(NULL, '먹다', 4107, 17, 0, 1),
+(NULL, '싸다', 4108, 17, 0, 1),
+(NULL, '아귀', 4109, 17, 0, 1),
+('福不福', '복불복', 4110, 16, 153, 1),
+(NULL, '갓', 4111, 16, 0, 1),
+(NULL, '골', 4112, 16, 0, 1),
+(NULL, '섶', 4113, 16, 0, 1),
+(NULL, '줄', 4114, 16, 0, 1),
+(NULL, '외다', 4115, 16, 0, 1),
+(NULL, '있다', 4116, 16, 0, 1),
+(NULL, '잡다', 4117, 16, 0, 1),
+(NULL, '젖다', 4118, 16, 0, 1),
+(NULL, '타다', 4119, 16, 0, 1),
+(NULL, '나가다', 4120, 16, 0, 1),
+(NULL, '어리다', 4121, 16, 0, 1),
+('放生', '방생', 4122, 15, 230, 1),
+('法師', '법사', 4123, 15, 167, 1),
+('秋波', '추파', 4124, 15, 50, 1),
+('御史', '어사', 4125, 15, 40, 1),
+('再拜', '재배', 4126, 15, 37, 1),
+('弓裔', '궁예', 4127, 15, 14, 1),
+(NULL, '눈', 4128, 15, 0, 1),
+(NULL, '겹다', 4129, 15, 0, 1),
+(NULL, '깨다', 4130, 15, 0, 1),
+(NULL, '숙수', 4131, 15, 0, 1),
+(NULL, '노가리', 4132, 15, 0, 1),
+(NULL, '발바리', 4133, 15, 0, 1),
+(NULL, '살리다', 4134, 15, 0, 1),
+(NULL, '휑하다', 4135, 15, 0, 1),
+(NULL, '다스리다', 4136, 15, 0, 1),
+('西人', '서인', 4137, 14, 372, 1),
+('南男北女', '남남북녀', 4138, 14, 264, 1),
+('小中華', '소중화', 4139, 14, 223, 1),
+('訓假字', '훈가자', 4140, 14, 118, 1),
+('利原', '리원', 4141, 14, 117, 1),
+('利原', '이원', 4142, 14, 117, 1),
+('麻立干', '마립간', 4143, 14, 65, 1),
+('北伐', '북벌', 4144, 14, 62, 1),
+('初試', '초시', 4145, 14, 51, 1),
+('緣起', '연기', 4146, 14, 33, 1),
+('菩薩', '보살', 4147, 14, 4, 1),
+(NULL, '갈', 4148, 14, 0, 1),
+(NULL, '돌', 4149, 14, 0, 1),
+(NULL, '배', 4150, 14, 0, 1),
+(NULL, '가슴', 4151, 14, 0, 1),
+(NULL, '내다', 4152, 14, 0, 1),
+(NULL, '바람', 4153, 14, 0, 1),
+(NULL, '나쁘다', 4154, 14, 0, 1),
+(NULL, '넋두리', 4155, 14, 0, 1),
+(NULL, '돌팔이', 4156, 14, 0, 1),
+(NULL, '부르다', 4157, 14, 0, 1),
+(NULL, '새기다', 4158, 14, 0, 1),
+(NULL, '장아찌', 4159, 14, 0, 1),
+(NULL, '우렁각시', 4160, 14, 0, 1),
+('體用', '체용', 4161, 13, 223, 1),
+('龍飛御天歌', '용비어천가', 4162, 13, 181, 1),
+('定石', '정석', 4163, 13, 165, 1),
+('巫女', '무녀', 4164, 13, 107, 1),
+('散花', '산화', 4165, 13, 74, 1),
+('遺命', '유명', 4166, 13, 63, 1),
+('四端', '사단', 4167, 13, 58, 1),
+('油蜜菓', '유밀과', 4168, 13, 56, 1),
+('廢級', '폐급', 4169, 13, 45, 1),
+('鷄林', '계림', 4170, 13, 32, 1),
+('我執', '아집', 4171, 13, 23, 1),
+('吏曹', '이조', 4172, 13, 6, 1),
+(NULL, '다', 4173, 13, 0, 1),
+(NULL, '박', 4174, 13, 0, 1),
+(NULL, '빗', 4175, 13, 0, 1),
+(NULL, '빛', 4176, 13, 0, 1),
+(NULL, '펄', 4177, 13, 0, 1),
+(NULL, '모둠', 4178, 13, 0, 1),
+(NULL, '죄다', 4179, 13, 0, 1),
+(NULL, '갈기다', 4180, 13, 0, 1),
+(NULL, '벌갱이', 4181, 13, 0, 1),
+(NULL, '봐주다', 4182, 13, 0, 1),
+(NULL, '선무당', 4183, 13, 0, 1),
+(NULL, '쑤시다', 4184, 13, 0, 1),
+(NULL, '흔들리다', 4185, 13, 0, 1),
+(NULL, '흐느적거리다', 4186, 13, 0, 1),
+('去聲不連三', '거성불연삼', 4187, 12, 308, 1),
+('單行本', '단행본', 4188, 12, 245, 1),
+('中正', '중정', 4189, 12, 204, 1),
+('分', '분', 4190, 12, 115, 1),
+('順興', '순흥', 4191, 12, 32, 1),
+('落穗', '낙수', 4192, 12, 30, 1),
+('掌固', '장고', 4193, 12, 24, 1),
+('壬申', '임신', 4194, 12, 19, 1),
+('麥嶺', '맥령', 4195, 12, 14, 1),
+(NULL, '깃', 4196, 12, 0, 1),
+(NULL, '몫', 4197, 12, 0, 1),
+(NULL, '밭', 4198, 12, 0, 1),
+(NULL, '좀', 4199, 12, 0, 1),
+(NULL, '구이', 4200, 12, 0, 1),
+(NULL, '꼼수', 4201, 12, 0, 1),
+(NULL, '녹다', 4202, 12, 0, 1),
+(NULL, '막다', 4203, 12, 0, 1),
+(NULL, '맑다', 4204, 12, 0, 1),
+(NULL, '바닥', 4205, 12, 0, 1),
+(NULL, '아비', 4206, 12, 0, 1),
+(NULL, '자리', 4207, 12, 0, 1),
+(NULL, '큰굿', 4208, 12, 0, 1),
+(NULL, '풀이', 4209, 12, 0, 1),
+(NULL, '노리다', 4210, 12, 0, 1),
+(NULL, '맘카페', 4211, 12, 0, 1),
+(NULL, '붙들다', 4212, 12, 0, 1),
+(NULL, '섞박지', 4213, 12, 0, 1),
+(NULL, '오사리', 4214, 12, 0, 1),
+(NULL, '지피다', 4215, 12, 0, 1),
+(NULL, '보릿고개', 4216, 12, 0, 1),
+(NULL, '사잇소리', 4217, 12, 0, 1),
+(NULL, '소대가리', 4218, 12, 0, 1),
+(NULL, '서울공화국', 4219, 12, 0, 1),
+('故事成語', '고사성어', 4220, 11, 362, 1),
+('大陸의  氣', '대륙의 기상', 4221, 11, 335, 1),
+('銅人', '동인', 4222, 11, 328, 1),
+('主掌', '주장', 4223, 11, 174, 1),
+('氣味尙宮', '기미상궁', 4224, 11, 169, 1),
+('擧動', '거동', 4225, 11, 166, 1),
+('代表訓', '대표훈', 4226, 11, 129, 1),
+('六書', '육서', 4227, 11, 128, 1),
+('萬神', '만신', 4228, 11, 127, 1),
+('去頭截尾', '거두절미', 4229, 11, 104, 1),
+('刑部', '형부', 4230, 11, 73, 1),
+('末那識', '말나식', 4231, 11, 51, 1),
+('連棋', '연기', 4232, 11, 36, 1),
+('武', '무', 4233, 11, 22, 1),
+('佾舞', '일무', 4234, 11, 15, 1),
+('里', '리', 4235, 11, 13, 1),
+('菹醢', '저해', 4236, 11, 1, 1),
+(NULL, '글', 4237, 11, 0, 1),
+(NULL, '뒤', 4238, 11, 0, 1),
+(NULL, '얼', 4239, 11, 0, 1),
+(NULL, '갈다', 4240, 11, 0, 1),
+(NULL, '개비', 4241, 11, 0, 1),
+(NULL, '게이', 4242, 11, 0, 1),
+(NULL, '곱다', 4243, 11, 0, 1),
+(NULL, '깽깽', 4244, 11, 0, 1),
+(NULL, '냅다', 4245, 11, 0, 1),
+(NULL, '닦다', 4246, 11, 0, 1),
+(NULL, '뚫다', 4247, 11, 0, 1),
+(NULL, '띠다', 4248, 11, 0, 1),
+(NULL, '메다', 4249, 11, 0, 1),
+(NULL, '밝다', 4250, 11, 0, 1),
+(NULL, '빠따', 4251, 11, 0, 1),
+(NULL, '웃돈', 4252, 11, 0, 1),
+(NULL, '찌다', 4253, 11, 0, 1),
+('疊疊', '첩첩', 4254, 11, 0, 1),
+(NULL, '켜다', 4255, 11, 0, 1),
+(NULL, '튀다', 4256, 11, 0, 1),
+(NULL, '트다', 4257, 11, 0, 1),
+(NULL, '한길', 4258, 11, 0, 1),
+(NULL, '고로케', 4259, 11, 0, 1),
+(NULL, '고르다', 4260, 11, 0, 1),
+(NULL, '김치녀', 4261, 11, 0, 1),
+(NULL, '깍두기', 4262, 11, 0, 1),
+(NULL, '깨지다', 4263, 11, 0, 1),
+(NULL, '내리다', 4264, 11, 0, 1),
+(NULL, '삐침별', 4265, 11, 0, 1),
+(NULL, '시김새', 4266, 11, 0, 1),
+(NULL, '지르다', 4267, 11, 0, 1),
+(NULL, '사이시옷', 4268, 11, 0, 1),
+('不適合', '부적합', 4269, 10, 253, 1),
+('他山之石', '타산지석', 4270, 10, 195, 1),
+('法樂', '법락', 4271, 10, 183, 1),
+('正食', '정식', 4272, 10, 162, 1),
+('魔道', '마도', 4273, 10, 140, 1),
+('工部', '공부', 4274, 10, 121, 1),
+('病身', '병신', 4275, 10, 115, 1),
+('令愛', '영애', 4276, 10, 98, 1),
+('顧問官', '고문관', 4277, 10, 92, 1),
+('角木', '각목', 4278, 10, 91, 1),
+('疾風怒濤', '질풍노도', 4279, 10, 83, 1),
+('導師', '도사', 4280, 10, 66, 1),
+('二祖', '이조', 4281, 10, 58, 1),
+('阿賴耶識', '아뢰야식', 4282, 10, 46, 1),
+('史禍', '사화', 4283, 10, 36, 1),
+('伸縮', '신축', 4284, 10, 17, 1),
+('寸', '촌', 4285, 10, 10, 1),
+('癬瘡', '선창', 4286, 10, 10, 1),
+('狼狽', '낭패', 4287, 10, 6, 1),
+('狼狽', '랑패', 4288, 10, 6, 1),
+(NULL, '결', 4289, 10, 0, 1),
+(NULL, '꼴', 4290, 10, 0, 1),
+(NULL, '발', 4291, 10, 0, 1),
+(NULL, '벌', 4292, 10, 0, 1),
+(NULL, '새', 4293, 10, 0, 1),
+(NULL, '애', 4294, 10, 0, 1),
+('籥', '약', 4295, 10, 0, 1),
+(NULL, '틀', 4296, 10, 0, 1),
+(NULL, '고동', 4297, 10, 0, 1),
+(NULL, '공수', 4298, 10, 0, 1),
+(NULL, '나다', 4299, 10, 0, 1),
+(NULL, '다마', 4300, 10, 0, 1),
+(NULL, '되다', 4301, 10, 0, 1),
+(NULL, '떼다', 4302, 10, 0, 1),
+(NULL, '똬리', 4303, 10, 0, 1),
+(NULL, '뛰다', 4304, 10, 0, 1),
+(NULL, '뜯다', 4305, 10, 0, 1),
+(NULL, '모시', 4306, 10, 0, 1),
+(NULL, '새끼', 4307, 10, 0, 1),
+(NULL, '새다', 4308, 10, 0, 1),
+(NULL, '얻다', 4309, 10, 0, 1),
+(NULL, '이리', 4310, 10, 0, 1),
+(NULL, '인싸', 4311, 10, 0, 1),
+(NULL, '주름', 4312, 10, 0, 1),
+(NULL, '큰길', 4313, 10, 0, 1),
+(NULL, '한판', 4314, 10, 0, 1),
+(NULL, '가시다', 4315, 10, 0, 1),
+(NULL, '개않다', 4316, 10, 0, 1),
+(NULL, '괜찮다', 4317, 10, 0, 1),
+(NULL, '꺼지다', 4318, 10, 0, 1),
+(NULL, '달래다', 4319, 10, 0, 1),
+(NULL, '떨치다', 4320, 10, 0, 1),
+(NULL, '밑지다', 4321, 10, 0, 1),
+(NULL, '새가슴', 4322, 10, 0, 1),
+(NULL, '생무지', 4323, 10, 0, 1),
+(NULL, '세우다', 4324, 10, 0, 1),
+(NULL, '수막새', 4325, 10, 0, 1),
+(NULL, '스시녀', 4326, 10, 0, 1),
+(NULL, '여물다', 4327, 10, 0, 1),
+(NULL, '파이다', 4328, 10, 0, 1),
+(NULL, '한줄기', 4329, 10, 0, 1),
+(NULL, '허옇다', 4330, 10, 0, 1),
+(NULL, '단정하다', 4331, 10, 0, 1),
+(NULL, '아스라이', 4332, 10, 0, 1),
+(NULL, '토끼몰이', 4333, 10, 0, 1),
+(NULL, '괜게채잏다', 4334, 10, 0, 1),
+(NULL, '영혼 보내기', 4335, 10, 0, 1),
+(NULL, '좌표를 찍다', 4336, 10, 0, 1),
+('期數列外', '기수열외', 4337, 9, 300, 1),
+('公物', '공물', 4338, 9, 245, 1),
+('事必歸正', '사필귀정', 4339, 9, 213, 1),
+('境地', '경지', 4340, 9, 184, 1),
+('雲水', '운수', 4341, 9, 183, 1),
+('定食', '정식', 4342, 9, 169, 1),
+('無明', '무명', 4343, 9, 154, 1),
+('公安', '공안', 4344, 9, 133, 1),
+('木石', '목석', 4345, 9, 131, 1),
+('組合型', '조합형', 4346, 9, 126, 1),
+('心', '심', 4347, 9, 110, 1),
+('百尺竿頭', '백척간두', 4348, 9, 93, 1),
+('赴戰嶺', '부전령', 4349, 9, 89, 1),
+('純愛', '순애', 4350, 9, 82, 1),
+('居西干', '거서간', 4351, 9, 80, 1),
+('傍點', '방점', 4352, 9, 78, 1),
+('二望', '이망', 4353, 9, 71, 1),
+('固有', '고유', 4354, 9, 69, 1),
+('六德', '육덕', 4355, 9, 49, 1),
+('陰影', '음영', 4356, 9, 48, 1),
+('佛像', '불상', 4357, 9, 44, 1),
+('念佛', '염불', 4358, 9, 44, 1),
+('老顔', '노안', 4359, 9, 42, 1),
+('煙樹', '연수', 4360, 9, 40, 1),
+('腎精', '신정', 4361, 9, 37, 1),
+('剝製', '박제', 4362, 9, 34, 1),
+('次次雄', '차차웅', 4363, 9, 30, 1),
+('講唱', '강창', 4364, 9, 28, 1),
+('兩班', '양반', 4365, 9, 22, 1),
+('餓鬼', '아귀', 4366, 9, 15, 1),
+('彼岸', '피안', 4367, 9, 10, 1),
+('蒸편', '증편', 4368, 9, 6, 1),
+('楡津', '유진', 4369, 9, 5, 1),
+('欠', '흠', 4370, 9, 2, 1),
+('蹂蹸', '유린', 4371, 9, 2, 1),
+('羘곱창', '양곱창', 4372, 9, 1, 1),
+(NULL, '굿', 4373, 9, 0, 1),
+(NULL, '귀', 4374, 9, 0, 1),
+(NULL, '내', 4375, 9, 0, 1),
+(NULL, '놀', 4376, 9, 0, 1),
+(NULL, '달', 4377, 9, 0, 1),
+(NULL, '둔', 4378, 9, 0, 1),
+(NULL, '못', 4379, 9, 0, 1),
+(NULL, '밑', 4380, 9, 0, 1),
+(NULL, '바', 4381, 9, 0, 1),
+(NULL, '솔', 4382, 9, 0, 1),
+(NULL, '이', 4383, 9, 0, 1),
+(NULL, '입', 4384, 9, 0, 1),
+(NULL, '채', 4385, 9, 0, 1),
+(NULL, '터', 4386, 9, 0, 1),
+(NULL, '판', 4387, 9, 0, 1),
+(NULL, '가다', 4388, 9, 0, 1),
+(NULL, '가마', 4389, 9, 0, 1),
+(NULL, '구멍', 4390, 9, 0, 1),
+(NULL, '긁다', 4391, 9, 0, 1),
+(NULL, '길목', 4392, 9, 0, 1),
+(NULL, '돋다', 4393, 9, 0, 1),
+(NULL, '돌다', 4394, 9, 0, 1),
+(NULL, '두레', 4395, 9, 0, 1),
+(NULL, '막돌', 4396, 9, 0, 1),
+(NULL, '막새', 4397, 9, 0, 1),
+(NULL, '배다', 4398, 9, 0, 1),
+(NULL, '벌레', 4399, 9, 0, 1),
+(NULL, '블록', 4400, 9, 0, 1),
+(NULL, '씹다', 4401, 9, 0, 1),
+(NULL, '업다', 4402, 9, 0, 1),
+(NULL, '여우', 4403, 9, 0, 1),
+(NULL, '이름', 4404, 9, 0, 1),
+(NULL, '잇다', 4405, 9, 0, 1),
+('塼돌', '전돌', 4406, 9, 0, 1),
+(NULL, '죽다', 4407, 9, 0, 1),
+(NULL, '줄기', 4408, 9, 0, 1),
+(NULL, '크다', 4409, 9, 0, 1),
+(NULL, '펴다', 4410, 9, 0, 1),
+(NULL, '가누다', 4411, 9, 0, 1),
+(NULL, '가리다', 4412, 9, 0, 1),
+(NULL, '개새끼', 4413, 9, 0, 1),
+(NULL, '겉절이', 4414, 9, 0, 1),
+(NULL, '그리다', 4415, 9, 0, 1),
+(NULL, '기르다', 4416, 9, 0, 1),
+(NULL, '꼴불견', 4417, 9, 0, 1),
+(NULL, '나대다', 4418, 9, 0, 1),
+(NULL, '다듬다', 4419, 9, 0, 1),
+(NULL, '떡치다', 4420, 9, 0, 1),
+(NULL, '모질다', 4421, 9, 0, 1),
+(NULL, '바가지', 4422, 9, 0, 1),
+(NULL, '받들다', 4423, 9, 0, 1),
+(NULL, '뿌리다', 4424, 9, 0, 1),
+(NULL, '수제비', 4425, 9, 0, 1),
+(NULL, '아가리', 4426, 9, 0, 1),
+(NULL, '어줍다', 4427, 9, 0, 1),
+(NULL, '옮기다', 4428, 9, 0, 1),
+(NULL, '이기다', 4429, 9, 0, 1),
+(NULL, '일컫다', 4430, 9, 0, 1),
+(NULL, '잠그다', 4431, 9, 0, 1),
+(NULL, '줄거리', 4432, 9, 0, 1),
+(NULL, '지내다', 4433, 9, 0, 1),
+(NULL, '질리다', 4434, 9, 0, 1),
+(NULL, '착하다', 4435, 9, 0, 1),
+(NULL, '책씻이', 4436, 9, 0, 1),
+(NULL, '코로나', 4437, 9, 0, 1),
+(NULL, '펼치다', 4438, 9, 0, 1),
+(NULL, '흐리다', 4439, 9, 0, 1),
+(NULL, '나와바리', 4440, 9, 0, 1),
+(NULL, '너나들이', 4441, 9, 0, 1),
+(NULL, '느끼하다', 4442, 9, 0, 1),
+(NULL, '마음쓰다', 4443, 9, 0, 1),
+(NULL, '멀쩡하다', 4444, 9, 0, 1),
+(NULL, '빨아먹다', 4445, 9, 0, 1),
+(NULL, '서투르다', 4446, 9, 0, 1),
+(NULL, '어줍잖다', 4447, 9, 0, 1),
+(NULL, '퉁퉁걸음', 4448, 9, 0, 1),
+(NULL, '서성거리다', 4449, 9, 0, 1),
+(NULL, '아스라하다', 4450, 9, 0, 1),
+(NULL, '오르내리다', 4451, 9, 0, 1),
+(NULL, '익숙해지다', 4452, 9, 0, 1),
+('人心', '인심', 4453, 8, 429, 1),
+('性進國', '성진국', 4454, 8, 412, 1),
+('生老病死', '생로병사', 4455, 8, 365, 1),
+('生死與奪權', '생사여탈권', 4456, 8, 341, 1),
+('訓民正音', '훈민정음', 4457, 8, 304, 1),
+('韓本語', '한본어', 4458, 8, 303, 1),
+('不定冠詞', '부정관사', 4459, 8, 286, 1),
+('名文集', '명문집', 4460, 8, 265, 1),
+('漁場管理', '어장관리', 4461, 8, 258, 1),
+('一脈相通', '일맥상통', 4462, 8, 237, 1),
+('大靈', '대령', 4463, 8, 219, 1),
+('神法', '신법', 4464, 8, 217, 1),
+('愛新覺羅', '애신각라', 4465, 8, 195, 1),
+('有錢無罪  無錢有', '유전무죄 무전유죄', 4466, 8, 190, 1),
+('빠른  生', '빠른 생일', 4467, 8, 187, 1),
+('神父母', '신부모', 4468, 8, 185, 1),
+('天下', '천하', 4469, 8, 180, 1),
+('更地', '갱지', 4470, 8, 176, 1),
+('不淸不濁', '불청불탁', 4471, 8, 173, 1),
+('年記', '연기', 4472, 8, 158, 1),
+('在家僧', '재가승', 4473, 8, 154, 1),
+('後食', '후식', 4474, 8, 153, 1),
+('多分', '다분', 4475, 8, 151, 1),
+('用言', '용언', 4476, 8, 140, 1),
+('明末淸初', '명말청초', 4477, 8, 139, 1),
+('白馬', '백마', 4478, 8, 121, 1),
+('桑田碧海', '상전벽해', 4479, 8, 114, 1),
+('出納', '출납', 4480, 8, 109, 1),
+('品種', '품종', 4481, 8, 108, 1),
+('感受', '감수', 4482, 8, 103, 1),
+('習作', '습작', 4483, 8, 99, 1),
+('造成', '조성', 4484, 8, 97, 1),
+('鼎食', '정식', 4485, 8, 93, 1),
+('漸入佳境', '점입가경', 4486, 8, 89, 1),
+('樂受', '낙수', 4487, 8, 87, 1),
+('—放', '먹방', 4488, 8, 86, 1),
+('韓男', '한남', 4489, 8, 85, 1),
+('內則', '내칙', 4490, 8, 84, 1),
+('對靈', '대령', 4491, 8, 84, 1),
+('社團', '사단', 4492, 8, 82, 1),
+('南越', '남월', 4493, 8, 74, 1),
+('世尊', '세존', 4494, 8, 73, 1),
+('某時', '모시', 4495, 8, 71, 1),
+('三체', '삼체', 4496, 8, 69, 1),
+('拙作', '졸작', 4497, 8, 69, 1),
+('整式', '정식', 4498, 8, 61, 1),
+('半달', '반달', 4499, 8, 54, 1),
+('土幕', '토막', 4500, 8, 51, 1),
+('尾聯', '미련', 4501, 8, 43, 1),
+('黑牛', '흑우', 4502, 8, 37, 1),
+('檢索', '검색', 4503, 8, 36, 1),
+('族', '족', 4504, 8, 35, 1),
+('充滿', '충만', 4505, 8, 33, 1),
+('可', '가', 4506, 8, 29, 1),
+('受', '수', 4507, 8, 29, 1),
+('錢局', '전국', 4508, 8, 28, 1),
+('司倉', '사창', 4509, 8, 27, 1),
+('叢林', '총림', 4510, 8, 27, 1),
+('沙疥', '사개', 4511, 8, 25, 1),
+('舞雩', '무우', 4512, 8, 15, 1),
+('龍台', '용대', 4513, 8, 15, 1),
+('版', '판', 4514, 8, 14, 1),
+('錢', '전', 4515, 8, 11, 1),
+('許諾', '허락', 4516, 8, 10, 1),
+('弦', '현', 4517, 8, 4, 1),
+('僥倖', '요행', 4518, 8, 3, 1),
+('楓', '풍', 4519, 8, 2, 1),
+('梨棗', '이조', 4520, 8, 2, 1),
+(NULL, '개', 4521, 8, 0, 1),
+(NULL, '곧', 4522, 8, 0, 1),
+('斤', '근', 4523, 8, 0, 1),
+(NULL, '김', 4524, 8, 0, 1),
+(NULL, '뉘', 4525, 8, 0, 1),
+(NULL, '돈', 4526, 8, 0, 1),
+(NULL, '맛', 4527, 8, 0, 1),
+(NULL, '모', 4528, 8, 0, 1),
+(NULL, '빔', 4529, 8, 0, 1),
+(NULL, '뽕', 4530, 8, 0, 1),
+(NULL, '섬', 4531, 8, 0, 1),
+(NULL, '씨', 4532, 8, 0, 1),
+(NULL, '올', 4533, 8, 0, 1),
+(NULL, '옴', 4534, 8, 0, 1),
+(NULL, '울', 4535, 8, 0, 1),
+(NULL, '원', 4536, 8, 0, 1),
+(NULL, '일', 4537, 8, 0, 1),
+(NULL, '작', 4538, 8, 0, 1),
+(NULL, '코', 4539, 8, 0, 1),
+('頉', '탈', 4540, 8, 0, 1),
+(NULL, '티', 4541, 8, 0, 1),
+(NULL, '환', 4542, 8, 0, 1),
+(NULL, '회', 4543, 8, 0, 1),
+(NULL, '개다', 4544, 8, 0, 1),
+(NULL, '걷다', 4545, 8, 0, 1),
+(NULL, '그릇', 4546, 8, 0, 1),
+(NULL, '기름', 4547, 8, 0, 1),
+(NULL, '김장', 4548, 8, 0, 1),
+(NULL, '끌다', 4549, 8, 0, 1),
+(NULL, '끝장', 4550, 8, 0, 1),
+(NULL, '내숭', 4551, 8, 0, 1),
+(NULL, '넘다', 4552, 8, 0, 1),
+(NULL, '네덕', 4553, 8, 0, 1),
+(NULL, '듣다', 4554, 8, 0, 1),
+(NULL, '마트', 4555, 8, 0, 1),
+(NULL, '맨위', 4556, 8, 0, 1),
+(NULL, '머리', 4557, 8, 0, 1),
+(NULL, '묵다', 4558, 8, 0, 1),
+(NULL, '묻다', 4559, 8, 0, 1),
+(NULL, '뭉치', 4560, 8, 0, 1),
+(NULL, '번개', 4561, 8, 0, 1),
+(NULL, '부럼', 4562, 8, 0, 1),
+(NULL, '빚다', 4563, 8, 0, 1),
+(NULL, '빨다', 4564, 8, 0, 1),
+(NULL, '스프', 4565, 8, 0, 1),
+(NULL, '얽다', 4566, 8, 0, 1),
+(NULL, '엄니', 4567, 8, 0, 1),
+(NULL, '오래', 4568, 8, 0, 1),
+(NULL, '재우', 4569, 8, 0, 1),
+(NULL, '짚다', 4570, 8, 0, 1),
+(NULL, '짜임', 4571, 8, 0, 1),
+(NULL, '찍다', 4572, 8, 0, 1),
+(NULL, '찐따', 4573, 8, 0, 1),
+(NULL, '틀다', 4574, 8, 0, 1),
+(NULL, '가운데', 4575, 8, 0, 1),
+(NULL, '가자미', 4576, 8, 0, 1),
+(NULL, '걷히다', 4577, 8, 0, 1),
+(NULL, '기울다', 4578, 8, 0, 1),
+(NULL, '꾸미다', 4579, 8, 0, 1),
+(NULL, '나그네', 4580, 8, 0, 1),
+(NULL, '날뛰다', 4581, 8, 0, 1),
+(NULL, '내뚫다', 4582, 8, 0, 1),
+(NULL, '넘치다', 4583, 8, 0, 1),
+(NULL, '누르다', 4584, 8, 0, 1),
+(NULL, '다하다', 4585, 8, 0, 1),
+(NULL, '두루치', 4586, 8, 0, 1),
+(NULL, '똑바로', 4587, 8, 0, 1),
+(NULL, '띄우다', 4588, 8, 0, 1),
+(NULL, '멋있다', 4589, 8, 0, 1),
+(NULL, '무르다', 4590, 8, 0, 1),
+(NULL, '뭉치다', 4591, 8, 0, 1),
+(NULL, '벌거지', 4592, 8, 0, 1),
+(NULL, '부시다', 4593, 8, 0, 1),
+(NULL, '선술집', 4594, 8, 0, 1),
+(NULL, '슬라임', 4595, 8, 0, 1),
+(NULL, '얼차려', 4596, 8, 0, 1),
+(NULL, '으르다', 4597, 8, 0, 1),
+(NULL, '자만추', 4598, 8, 0, 1),
+(NULL, '쪽발이', 4599, 8, 0, 1),
+(NULL, '쭉정이', 4600, 8, 0, 1),
+(NULL, '캐릭터', 4601, 8, 0, 1),
+(NULL, '팔랑귀', 4602, 8, 0, 1),
+(NULL, '피눈물', 4603, 8, 0, 1),
+(NULL, '하얗다', 4604, 8, 0, 1),
+(NULL, '핫바지', 4605, 8, 0, 1),
+(NULL, '힘주다', 4606, 8, 0, 1),
+(NULL, '가르치다', 4607, 8, 0, 1),
+(NULL, '꼴사납다', 4608, 8, 0, 1),
+(NULL, '뒤집히다', 4609, 8, 0, 1),
+(NULL, '말승냥이', 4610, 8, 0, 1),
+(NULL, '밤일하다', 4611, 8, 0, 1),
+(NULL, '섀르밴대', 4612, 8, 0, 1),
+(NULL, '아니꼽다', 4613, 8, 0, 1),
+(NULL, '와리가리', 4614, 8, 0, 1),
+(NULL, '일으키다', 4615, 8, 0, 1),
+(NULL, '꾸벅거리다', 4616, 8, 0, 1),
+(NULL, '줄을 서다', 4617, 8, 0, 1),
+(NULL, '거치적거리다', 4618, 8, 0, 1),
+(NULL, '딱다그르르딱다그르르하다', 4619, 8, 0, 1),
+('美人計', '미인계', 4620, 7, 446, 1),
+('玄學', '현학', 4621, 7, 292, 1),
+('白地', '백지', 4622, 7, 244, 1),
+('自小說', '자소설', 4623, 7, 230, 1),
+('洋鬼子', '양귀자', 4624, 7, 226, 1),
+('海外購買', '해외구매', 4625, 7, 222, 1),
+('不調和', '부조화', 4626, 7, 221, 1),
+('分數', '분수', 4627, 7, 219, 1),
+('間節氣', '간절기', 4628, 7, 216, 1),
+('體言', '체언', 4629, 7, 203, 1),
+('生滅', '생멸', 4630, 7, 200, 1),
+('女色', '여색', 4631, 7, 192, 1),
+('五里霧中', '오리무중', 4632, 7, 188, 1),
+('名勝古跡', '명승고적', 4633, 7, 187, 1),
+('強化', '강화', 4634, 7, 177, 1),
+('自—', '자뻑', 4635, 7, 165, 1),
+('善男善女', '선남선녀', 4636, 7, 164, 1),
+('話法', '화법', 4637, 7, 163, 1),
+('四通八達', '사통팔달', 4638, 7, 162, 1),
+('三公', '삼공', 4639, 7, 152, 1),
+('平海', '평해', 4640, 7, 151, 1),
+('百日齋', '백일재', 4641, 7, 151, 1),
+('中篇', '중편', 4642, 7, 145, 1),
+('神兵', '신병', 4643, 7, 144, 1),
+('體', '체', 4644, 7, 143, 1),
+('四捨五入', '사사오입', 4645, 7, 143, 1),
+('答定—', '답정너', 4646, 7, 138, 1),
+('八面六臂', '팔면육비', 4647, 7, 136, 1),
+('都事', '도사', 4648, 7, 134, 1),
+('無乳', '무유', 4649, 7, 133, 1),
+('山門', '산문', 4650, 7, 131, 1),
+('善心', '선심', 4651, 7, 131, 1),
+('北風', '북풍', 4652, 7, 122, 1),
+('遺書', '유서', 4653, 7, 122, 1),
+('南方', '남방', 4654, 7, 120, 1),
+('—車', '똥차', 4655, 7, 120, 1),
+('分岐', '분기', 4656, 7, 116, 1),
+('새알心', '새알심', 4657, 7, 116, 1),
+('同姓婚', '동성혼', 4658, 7, 111, 1),
+('賤民', '천민', 4659, 7, 110, 1),
+('太陽節', '태양절', 4660, 7, 107, 1),
+('天', '천', 4661, 7, 106, 1),
+('備忘記', '비망기', 4662, 7, 106, 1),
+('熟手', '숙수', 4663, 7, 104, 1),
+('深海', '심해', 4664, 7, 102, 1),
+('參戰', '참전', 4665, 7, 99, 1),
+('凶年', '흉년', 4666, 7, 95, 1),
+('以影補來', '이영보래', 4667, 7, 94, 1),
+('古初', '고초', 4668, 7, 88, 1),
+('倦怠感', '권태감', 4669, 7, 84, 1),
+('白癡', '백치', 4670, 7, 83, 1),
+('刻骨難忘', '각골난망', 4671, 7, 83, 1),
+('米作', '미작', 4672, 7, 80, 1),
+('洋—', '양놈', 4673, 7, 79, 1),
+('炎火', '염화', 4674, 7, 79, 1),
+('江華島', '강화도', 4675, 7, 74, 1),
+('百八煩惱', '백팔번뇌', 4676, 7, 73, 1),
+('場', '장', 4677, 7, 69, 1),
+('希望拷問', '희망고문', 4678, 7, 69, 1),
+('直轄市', '직할시', 4679, 7, 68, 1),
+('洞門', '동문', 4680, 7, 67, 1),
+('幽明', '유명', 4681, 7, 63, 1),
+('聖德', '성덕', 4682, 7, 55, 1),
+('盤城', '반성', 4683, 7, 54, 1),
+('朝鮮말', '조선말', 4684, 7, 54, 1),
+('抑强扶弱', '억강부약', 4685, 7, 54, 1),
+('醬독臺', '장독대', 4686, 7, 52, 1),
+('倭—', '왜년', 4687, 7, 50, 1),
+('焚蕩—', '분탕질', 4688, 7, 50, 1),
+('淸純', '청순', 4689, 7, 45, 1),
+('퐁퐁男', '퐁퐁남', 4690, 7, 44, 1),
+('類', '유', 4691, 7, 43, 1),
+('饗應', '향응', 4692, 7, 42, 1),
+('命', '명', 4693, 7, 40, 1),
+('松島', '송도', 4694, 7, 35, 1),
+('零落', '영락', 4695, 7, 35, 1),
+('近似', '근사', 4696, 7, 31, 1),
+('杳然', '묘연', 4697, 7, 30, 1),
+('功德', '공덕', 4698, 7, 29, 1),
+('佛恩', '불은', 4699, 7, 26, 1),
+('洪吉童', '홍길동', 4700, 7, 26, 1),
+('歲拜', '세배', 4701, 7, 25, 1),
+('呂布', '여포', 4702, 7, 25, 1),
+('阿鼻叫喚', '아비규환', 4703, 7, 24, 1),
+('濃密', '농밀', 4704, 7, 23, 1),
+('豐足', '풍족', 4705, 7, 23, 1),
+('環刀', '환도', 4706, 7, 21, 1),
+('村사람', '촌사람', 4707, 7, 20, 1),
+('兩', '냥', 4708, 7, 17, 1),
+('豐富', '풍부', 4709, 7, 15, 1),
+('愉快', '유쾌', 4710, 7, 12, 1),
+('彼此', '피차', 4711, 7, 5, 1),
+('欺瞞', '기만', 4712, 7, 3, 1),
+('喇叭', '나발', 4713, 7, 1, 1),
+(NULL, '가', 4714, 7, 0, 1),
+(NULL, '갑', 4715, 7, 0, 1),
+(NULL, '곬', 4716, 7, 0, 1),
+(NULL, '꼭', 4717, 7, 0, 1),
+(NULL, '난', 4718, 7, 0, 1),
+(NULL, '대', 4719, 7, 0, 1),
+(NULL, '때', 4720, 7, 0, 1),
+(NULL, '매', 4721, 7, 0, 1),
+(NULL, '메', 4722, 7, 0, 1),
+(NULL, '봉', 4723, 7, 0, 1),
+(NULL, '샘', 4724, 7, 0, 1),
+(NULL, '씹', 4725, 7, 0, 1),
+(NULL, '앞', 4726, 7, 0, 1),
+(NULL, '역', 4727, 7, 0, 1),
+(NULL, '잘', 4728, 7, 0, 1),
+(NULL, '키', 4729, 7, 0, 1),
+(NULL, '팝', 4730, 7, 0, 1),
+(NULL, '홑', 4731, 7, 0, 1),
+(NULL, '홰', 4732, 7, 0, 1),
+(NULL, '가시', 4733, 7, 0, 1),
+(NULL, '각주', 4734, 7, 0, 1),
+(NULL, '갈비', 4735, 7, 0, 1),
+(NULL, '갉다', 4736, 7, 0, 1),
+(NULL, '걸다', 4737, 7, 0, 1),
+(NULL, '고개', 4738, 7, 0, 1),
+(NULL, '광대', 4739, 7, 0, 1),
+(NULL, '구렁', 4740, 7, 0, 1),
+(NULL, '구석', 4741, 7, 0, 1),
+(NULL, '굶다', 4742, 7, 0, 1),
+(NULL, '그림', 4743, 7, 0, 1),
+(NULL, '기원', 4744, 7, 0, 1),
+(NULL, '긴업', 4745, 7, 0, 1),
+(NULL, '깎다', 4746, 7, 0, 1),
+(NULL, '꽈잘', 4747, 7, 0, 1),
+(NULL, '넙치', 4748, 7, 0, 1),
+(NULL, '노배', 4749, 7, 0, 1),
+(NULL, '놀이', 4750, 7, 0, 1),
+(NULL, '높다', 4751, 7, 0, 1),
+(NULL, '다락', 4752, 7, 0, 1),
+(NULL, '대쪽', 4753, 7, 0, 1),
+(NULL, '덜컥', 4754, 7, 0, 1),
+(NULL, '도삽', 4755, 7, 0, 1),
+(NULL, '뒷북', 4756, 7, 0, 1),
+(NULL, '로망', 4757, 7, 0, 1),
+(NULL, '마루', 4758, 7, 0, 1),
+('媽媽', '마마', 4759, 7, 0, 1),
+(NULL, '맞이', 4760, 7, 0, 1),
+(NULL, '묶다', 4761, 7, 0, 1),
+(NULL, '물다', 4762, 7, 0, 1),
+(NULL, '미다', 4763, 7, 0, 1),
+(NULL, '밟다', 4764, 7, 0, 1),
+(NULL, '비다', 4765, 7, 0, 1),
+(NULL, '뽑다', 4766, 7, 0, 1),
+(NULL, '상투', 4767, 7, 0, 1),
+(NULL, '선지', 4768, 7, 0, 1),
+(NULL, '슬쩍', 4769, 7, 0, 1),
+(NULL, '시울', 4770, 7, 0, 1),
+(NULL, '쌓다', 4771, 7, 0, 1),
+(NULL, '쓸다', 4772, 7, 0, 1),
+(NULL, '알몸', 4773, 7, 0, 1),
+(NULL, '앞뒤', 4774, 7, 0, 1),
+('瓔珞', '영락', 4775, 7, 0, 1),
+(NULL, '오라', 4776, 7, 0, 1),
+(NULL, '외퀴', 4777, 7, 0, 1),
+('慇懃', '은근', 4778, 7, 0, 1),
+(NULL, '이매', 4779, 7, 0, 1),
+(NULL, '이슬', 4780, 7, 0, 1),
+(NULL, '일코', 4781, 7, 0, 1),
+(NULL, '자국', 4782, 7, 0, 1),
+(NULL, '존버', 4783, 7, 0, 1),
+(NULL, '쥐다', 4784, 7, 0, 1),
+(NULL, '즘게', 4785, 7, 0, 1),
+(NULL, '찢다', 4786, 7, 0, 1),
+(NULL, '채다', 4787, 7, 0, 1),
+(NULL, '컨셉', 4788, 7, 0, 1),
+(NULL, '패치', 4789, 7, 0, 1),
+(NULL, '하늘', 4790, 7, 0, 1),
+(NULL, '하프', 4791, 7, 0, 1),
+(NULL, '한번', 4792, 7, 0, 1),
+(NULL, '환생', 4793, 7, 0, 1),
+(NULL, '가두다', 4794, 7, 0, 1),
+(NULL, '개돼지', 4795, 7, 0, 1),
+(NULL, '고구마', 4796, 7, 0, 1),
+(NULL, '그르다', 4797, 7, 0, 1),
+(NULL, '금수저', 4798, 7, 0, 1),
+(NULL, '껴입다', 4799, 7, 0, 1),
+(NULL, '눈썰미', 4800, 7, 0, 1),
+(NULL, '늙다리', 4801, 7, 0, 1),
+(NULL, '돋우다', 4802, 7, 0, 1),
+(NULL, '두르다', 4803, 7, 0, 1),
+(NULL, '디스크', 4804, 7, 0, 1),
+(NULL, '따지다', 4805, 7, 0, 1),
+(NULL, '딸딸이', 4806, 7, 0, 1),
+(NULL, '뜻있다', 4807, 7, 0, 1),
+(NULL, '띠동갑', 4808, 7, 0, 1),
+(NULL, '무섭다', 4809, 7, 0, 1),
+(NULL, '미역국', 4810, 7, 0, 1),
+(NULL, '바래다', 4811, 7, 0, 1),
+(NULL, '방숭이', 4812, 7, 0, 1),
+(NULL, '병먹금', 4813, 7, 0, 1),
+(NULL, '보이다', 4814, 7, 0, 1),
+(NULL, '비리다', 4815, 7, 0, 1),
+(NULL, '빤스런', 4816, 7, 0, 1),
+(NULL, '사귀다', 4817, 7, 0, 1),
+(NULL, '사꾸라', 4818, 7, 0, 1),
+(NULL, '살며시', 4819, 7, 0, 1),
+(NULL, '성기다', 4820, 7, 0, 1),
+(NULL, '손잡이', 4821, 7, 0, 1),
+(NULL, '스미다', 4822, 7, 0, 1),
+(NULL, '쏠리다', 4823, 7, 0, 1),
+(NULL, '아리랑', 4824, 7, 0, 1),
+(NULL, '아저씨', 4825, 7, 0, 1),
+(NULL, '알맹이', 4826, 7, 0, 1),
+(NULL, '어렵다', 4827, 7, 0, 1),
+(NULL, '예쁘다', 4828, 7, 0, 1),
+(NULL, '유교걸', 4829, 7, 0, 1),
+(NULL, '은수저', 4830, 7, 0, 1),
+(NULL, '이르다', 4831, 7, 0, 1),
+(NULL, '입히다', 4832, 7, 0, 1),
+(NULL, '자개미', 4833, 7, 0, 1),
+(NULL, '절실히', 4834, 7, 0, 1),
+(NULL, '추임새', 4835, 7, 0, 1),
+(NULL, '푸르다', 4836, 7, 0, 1),
+(NULL, '풋김치', 4837, 7, 0, 1),
+(NULL, '풍기다', 4838, 7, 0, 1),
+(NULL, '가라앉다', 4839, 7, 0, 1),
+(NULL, '갈라지다', 4840, 7, 0, 1),
+(NULL, '거센소리', 4841, 7, 0, 1),
+(NULL, '끔찍하다', 4842, 7, 0, 1),
+(NULL, '넉넉하다', 4843, 7, 0, 1),
+(NULL, '넘어가다', 4844, 7, 0, 1),
+(NULL, '놀아나다', 4845, 7, 0, 1),
+(NULL, '다부지다', 4846, 7, 0, 1),
+(NULL, '돌이키다', 4847, 7, 0, 1),
+(NULL, '미어지다', 4848, 7, 0, 1),
+(NULL, '바듯하다', 4849, 7, 0, 1),
+(NULL, '불쏘시개', 4850, 7, 0, 1),
+(NULL, '빠듯하다', 4851, 7, 0, 1),
+(NULL, '서늘하다', 4852, 7, 0, 1),
+(NULL, '숨죽이다', 4853, 7, 0, 1),
+(NULL, '슬쩍슬쩍', 4854, 7, 0, 1),
+(NULL, '심마니말', 4855, 7, 0, 1),
+(NULL, '애동제자', 4856, 7, 0, 1),
+(NULL, '엉성하다', 4857, 7, 0, 1),
+(NULL, '자욱하다', 4858, 7, 0, 1),
+(NULL, '제쳐놓다', 4859, 7, 0, 1),
+(NULL, '줄기줄기', 4860, 7, 0, 1),
+(NULL, '짭짤하다', 4861, 7, 0, 1),
+(NULL, '촘촘하다', 4862, 7, 0, 1),
+(NULL, '충전하다', 4863, 7, 0, 1),
+(NULL, '캥거루족', 4864, 7, 0, 1),
+(NULL, '퉁퉁하다', 4865, 7, 0, 1),
+(NULL, '헤아리다', 4866, 7, 0, 1),
+(NULL, '헤어지다', 4867, 7, 0, 1),
+(NULL, '휩싸이다', 4868, 7, 0, 1),
+(NULL, '흐릿하다', 4869, 7, 0, 1),
+(NULL, '얼버무리다', 4870, 7, 0, 1),
+(NULL, '업신여기다', 4871, 7, 0, 1),
+(NULL, '찌뿌둥하다', 4872, 7, 0, 1),
+(NULL, '뜨거운 감자', 4873, 7, 0, 1),
+(NULL, '시시덕거리다', 4874, 7, 0, 1),
+(NULL, '눈 가리고 아웅', 4875, 7, 0, 1),
+('初面人', '초면인', 4876, 6, 417, 1),
+('人之常情', '인지상정', 4877, 6, 412, 1),
+('對象者', '대상자', 4878, 6, 411, 1),
+('人間  末', '인간 말종', 4879, 6, 395, 1),
+('交付者', '교부자', 4880, 6, 382, 1),
+('大洪水', '대홍수', 4881, 6, 361, 1),
+('百日天下', '백일천하', 4882, 6, 328, 1),
+('庶人', '서인', 4883, 6, 322, 1),
+('虞人', '우인', 4884, 6, 319, 1),
+('誕生日', '탄생일', 4885, 6, 310, 1),
+('韓國—', '한국말', 4886, 6, 305, 1),
+('水道', '수도', 4887, 6, 287, 1),
+('氣-', '기막', 4888, 6, 276, 1),
+('太陽女神', '태양여신', 4889, 6, 257, 1),
+('萬國', '만국', 4890, 6, 256, 1),
+('淮南子', '회남자', 4891, 6, 243, 1),
+('工場長', '공장장', 4892, 6, 231, 1),
+('私生', '사생', 4893, 6, 218, 1),
+('聞一知十', '문일지십', 4894, 6, 202, 1),
+('落水', '낙수', 4895, 6, 193, 1),
+('自他共認', '자타공인', 4896, 6, 192, 1),
+('殺處分', '살처분', 4897, 6, 185, 1),
+('組織暴力輩', '조직폭력배', 4898, 6, 184, 1),
+('主將', '주장', 4899, 6, 182, 1),
+('濕地', '습지', 4900, 6, 179, 1),
+('施主', '시주', 4901, 6, 172, 1),
+('裸地', '나지', 4902, 6, 171, 1),
+('三角關係', '삼각관계', 4903, 6, 166, 1),
+('元體', '원체', 4904, 6, 163, 1),
+('鼓動', '고동', 4905, 6, 161, 1),
+('出血', '출혈', 4906, 6, 157, 1),
+('기둥書房', '기둥서방', 4907, 6, 155, 1),
+('洞察力', '통찰력', 4908, 6, 154, 1),
+('太白星', '태백성', 4909, 6, 152, 1),
+('好色漢', '호색한', 4910, 6, 150, 1),
+('名門', '명문', 4911, 6, 147, 1),
+('除日', '제일', 4912, 6, 143, 1),
+('字形', '자형', 4913, 6, 142, 1),
+('靑天霹靂', '청천벽력', 4914, 6, 142, 1),
+('流行', '유행', 4915, 6, 141, 1),
+('佛道', '불도', 4916, 6, 140, 1),
+('民望', '민망', 4917, 6, 139, 1),
+('俗音', '속음', 4918, 6, 138, 1),
+('接神', '접신', 4919, 6, 135, 1),
+('雪上加霜', '설상가상', 4920, 6, 135, 1),
+('功七過三', '공칠과삼', 4921, 6, 132, 1),
+('最高尊嚴', '최고존엄', 4922, 6, 131, 1),
+('音訓', '음훈', 4923, 6, 130, 1),
+('問名', '문명', 4924, 6, 126, 1),
+('軌道', '궤도', 4925, 6, 125, 1),
+('火病', '화병', 4926, 6, 125, 1),
+('香爐石', '향로석', 4927, 6, 125, 1),
+('減數', '감수', 4928, 6, 124, 1),
+('氣陷', '기함', 4929, 6, 122, 1),
+('古風', '고풍', 4930, 6, 121, 1),
+('成形', '성형', 4931, 6, 120, 1),
+('書堂', '서당', 4932, 6, 117, 1),
+('一周', '일주', 4933, 6, 117, 1),
+('순豆腐白飯', '순두부백반', 4934, 6, 116, 1),
+('禪心', '선심', 4935, 6, 114, 1),
+('唯心', '유심', 4936, 6, 114, 1),
+('長廣舌', '장광설', 4937, 6, 114, 1),
+('砲手', '포수', 4938, 6, 113, 1),
+('天賦', '천부', 4939, 6, 110, 1),
+('定在', '정재', 4940, 6, 107, 1),
+('賞善罰惡', '상선벌악', 4941, 6, 102, 1),
+('神占', '신점', 4942, 6, 101, 1),
+('審美眼', '심미안', 4943, 6, 99, 1),
+('加減乘除', '가감승제', 4944, 6, 96, 1),
+('完成型', '완성형', 4945, 6, 94, 1),
+('送球', '송구', 4946, 6, 93, 1),
+('定植', '정식', 4947, 6, 91, 1),
+('捨石', '사석', 4948, 6, 90, 1),
+('五方', '오방', 4949, 6, 90, 1),
+('假想敵', '가상적', 4950, 6, 87, 1),
+('黑騎士', '흑기사', 4951, 6, 87, 1),
+('淡白', '담백', 4952, 6, 85, 1),
+('緯車', '위거', 4953, 6, 83, 1),
+('眞情', '진정', 4954, 6, 83, 1),
+('空虛', '공허', 4955, 6, 80, 1),
+('梨花雨', '이화우', 4956, 6, 78, 1),
+('통字', '통자', 4957, 6, 77, 1),
+('膝下', '슬하', 4958, 6, 76, 1),
+('美童', '미동', 4959, 6, 75, 1),
+('其實', '기실', 4960, 6, 73, 1),
+('明君', '명군', 4961, 6, 73, 1),
+('止血', '지혈', 4962, 6, 73, 1),
+('막場', '막장', 4963, 6, 71, 1),
+('病맛', '병맛', 4964, 6, 70, 1),
+('咸興差使', '함흥차사', 4965, 6, 68, 1),
+('뼈解酲국', '뼈해장국', 4966, 6, 66, 1),
+('如前', '여전', 4967, 6, 65, 1),
+('雜木', '잡목', 4968, 6, 65, 1),
+('適格', '적격', 4969, 6, 65, 1),
+('方響', '방향', 4970, 6, 64, 1),
+('—湯 ', '설렁탕', 4971, 6, 64, 1),
+('祖師', '조사', 4972, 6, 63, 1),
+('喫茶店', '끽다점', 4973, 6, 63, 1),
+('四華', '사화', 4974, 6, 61, 1),
+('至情', '지정', 4975, 6, 60, 1),
+('眼目', '안목', 4976, 6, 58, 1),
+('慰藉料', '위자료', 4977, 6, 57, 1),
+('才勝德薄', '재승덕박', 4978, 6, 55, 1),
+('社倉', '사창', 4979, 6, 53, 1),
+('重', '중', 4980, 6, 52, 1),
+('千길萬길', '천길만길', 4981, 6, 52, 1),
+('開局', '개국', 4982, 6, 51, 1),
+('先唱', '선창', 4983, 6, 51, 1),
+('淸麴醬', '청국장', 4984, 6, 51, 1),
+('倭—', '왜놈', 4985, 6, 50, 1),
+('總統', '총통', 4986, 6, 49, 1),
+('暴雪', '폭설', 4987, 6, 49, 1),
+('嬌聲', '교성', 4988, 6, 48, 1),
+('身彌', '신미', 4989, 6, 48, 1),
+('應召', '응소', 4990, 6, 47, 1),
+('雜菜', '잡채', 4991, 6, 47, 1),
+('減收', '감수', 4992, 6, 46, 1),
+('開封', '개봉', 4993, 6, 46, 1),
+('吸盤', '흡반', 4994, 6, 46, 1),
+('剛斷', '강단', 4995, 6, 45, 1),
+('砲煙', '포연', 4996, 6, 45, 1),
+('골草', '골초', 4997, 6, 43, 1),
+('洞見', '통견', 4998, 6, 43, 1),
+('刻舟求劍', '각주구검', 4999, 6, 43, 1),
+('船艙', '선창', 5000, 6, 42, 1),
+('亂舞', '난무', 5001, 6, 40, 1),
+('徐羅伐', '서라벌', 5002, 6, 40, 1),
+('春醬', '춘장', 5003, 6, 38, 1),
+('議論', '의논', 5004, 6, 37, 1),
+('親', '친', 5005, 6, 35, 1),
+('攻略', '공략', 5006, 6, 35, 1),
+('雲劍', '운검', 5007, 6, 33, 1),
+('刺傷', '자상', 5008, 6, 32, 1),
+('財貨', '재화', 5009, 6, 32, 1),
+('驅使', '구사', 5010, 6, 30, 1),
+('鑄型', '주형', 5011, 6, 28, 1),
+('豊滿', '풍만', 5012, 6, 28, 1),
+('魔鬼', '마귀', 5013, 6, 27, 1),
+('優劣', '우열', 5014, 6, 27, 1),
+('巫堂', '무당', 5015, 6, 26, 1),
+('掌故', '장고', 5016, 6, 25, 1),
+('기름醬', '기름장', 5017, 6, 24, 1),
+('講壇', '강단', 5018, 6, 22, 1),
+('印', '인', 5019, 6, 21, 1),
+('僧塔', '승탑', 5020, 6, 21, 1),
+('針', '침', 5021, 6, 20, 1),
+('―脈', '잎맥', 5022, 6, 19, 1),
+('櫛比', '즐비', 5023, 6, 18, 1),
+('魔', '마', 5024, 6, 16, 1),
+('醬', '장', 5025, 6, 16, 1),
+('縮尺', '축척', 5026, 6, 16, 1),
+('障碍', '장애', 5027, 6, 15, 1),
+('田', '전', 5028, 6, 13, 1),
+('漏泄', '누설', 5029, 6, 13, 1),
+('墓碑', '묘비', 5030, 6, 13, 1),
+('幕', '막', 5031, 6, 12, 1),
+('蠻夷', '만이', 5032, 6, 11, 1),
+('淡泊', '담박', 5033, 6, 10, 1),
+('剝奪', '박탈', 5034, 6, 10, 1),
+('伏날', '복날', 5035, 6, 10, 1),
+('巫', '무', 5036, 6, 8, 1),
+('乙', '을', 5037, 6, 7, 1),
+('魅惑', '매혹', 5038, 6, 7, 1),
+('宏壯', '굉장', 5039, 6, 6, 1),
+('膾炙', '회자', 5040, 6, 6, 1),
+('澹泊', '담박', 5041, 6, 4, 1),
+('菖蒲劒', '창포검', 5042, 6, 4, 1),
+('鈍', '둔', 5043, 6, 3, 1),
+('羽', '우', 5044, 6, 3, 1),
+('涕泣', '체읍', 5045, 6, 1, 1),
+('袷', '겹', 5046, 6, 0, 1),
+(NULL, '긂', 5047, 6, 0, 1),
+(NULL, '깽', 5048, 6, 0, 1),
+(NULL, '날', 5049, 6, 0, 1),
+(NULL, '남', 5050, 6, 0, 1),
+(NULL, '널', 5051, 6, 0, 1),
+('魯', '노', 5052, 6, 0, 1),
+(NULL, '놈', 5053, 6, 0, 1),
+(NULL, '똥', 5054, 6, 0, 1),
+(NULL, '뜻', 5055, 6, 0, 1),
+(NULL, '롤', 5056, 6, 0, 1),
+(NULL, '멋', 5057, 6, 0, 1),
+(NULL, '뭇', 5058, 6, 0, 1),
+(NULL, '별', 5059, 6, 0, 1),
+(NULL, '빽', 5060, 6, 0, 1),
+(NULL, '소', 5061, 6, 0, 1),
+(NULL, '속', 5062, 6, 0, 1),
+(NULL, '손', 5063, 6, 0, 1),
+(NULL, '술', 5064, 6, 0, 1),
+(NULL, '숨', 5065, 6, 0, 1),
+(NULL, '신', 5066, 6, 0, 1),
+(NULL, '쌀', 5067, 6, 0, 1),
+(NULL, '썸', 5068, 6, 0, 1),
+(NULL, '짐', 5069, 6, 0, 1),
+(NULL, '짱', 5070, 6, 0, 1),
+(NULL, '탓', 5071, 6, 0, 1),
+(NULL, '홉', 5072, 6, 0, 1),
+(NULL, '가라', 5073, 6, 0, 1),
+(NULL, '가오', 5074, 6, 0, 1),
+(NULL, '가지', 5075, 6, 0, 1),
+(NULL, '갈래', 5076, 6, 0, 1),
+(NULL, '같다', 5077, 6, 0, 1),
+(NULL, '고리', 5078, 6, 0, 1),
+(NULL, '고비', 5079, 6, 0, 1),
+(NULL, '구슬', 5080, 6, 0, 1),
+(NULL, '굽이', 5081, 6, 0, 1),
+(NULL, '그루', 5082, 6, 0, 1),
+(NULL, '급소', 5083, 6, 0, 1),
+(NULL, '기다', 5084, 6, 0, 1),
+(NULL, '깡치', 5085, 6, 0, 1),
+(NULL, '꼴찌', 5086, 6, 0, 1),
+(NULL, '꽁트', 5087, 6, 0, 1),
+(NULL, '꿈결', 5088, 6, 0, 1),
+(NULL, '나리', 5089, 6, 0, 1),
+(NULL, '낳다', 5090, 6, 0, 1),
+(NULL, '너울', 5091, 6, 0, 1),
+(NULL, '노을', 5092, 6, 0, 1),
+(NULL, '누나', 5093, 6, 0, 1),
+(NULL, '누룩', 5094, 6, 0, 1),
+(NULL, '누부', 5095, 6, 0, 1),
+(NULL, '눈곱', 5096, 6, 0, 1),
+(NULL, '다리', 5097, 6, 0, 1),
+(NULL, '닫다', 5098, 6, 0, 1),
+(NULL, '대꾸', 5099, 6, 0, 1),
+(NULL, '두다', 5100, 6, 0, 1),
+(NULL, '드립', 5101, 6, 0, 1),
+(NULL, '디대', 5102, 6, 0, 1),
+(NULL, '리치', 5103, 6, 0, 1),
+(NULL, '말벌', 5104, 6, 0, 1),
+(NULL, '맨손', 5105, 6, 0, 1),
+(NULL, '며칠', 5106, 6, 0, 1),
+(NULL, '무리', 5107, 6, 0, 1),
+(NULL, '문턱', 5108, 6, 0, 1),
+(NULL, '물레', 5109, 6, 0, 1),
+(NULL, '묽다', 5110, 6, 0, 1),
+(NULL, '박수', 5111, 6, 0, 1),
+(NULL, '받침', 5112, 6, 0, 1),
+(NULL, '뱀밥', 5113, 6, 0, 1),
+(NULL, '버캐', 5114, 6, 0, 1),
+(NULL, '베다', 5115, 6, 0, 1),
+(NULL, '불뱀', 5116, 6, 0, 1),
+(NULL, '빈터', 5117, 6, 0, 1),
+(NULL, '빼다', 5118, 6, 0, 1),
+(NULL, '뼈대', 5119, 6, 0, 1),
+(NULL, '사내', 5120, 6, 0, 1),
+(NULL, '사인', 5121, 6, 0, 1),
+(NULL, '산달', 5122, 6, 0, 1),
+(NULL, '삶다', 5123, 6, 0, 1),
+(NULL, '삼베', 5124, 6, 0, 1),
+(NULL, '샛별', 5125, 6, 0, 1),
+(NULL, '승방', 5126, 6, 0, 1),
+(NULL, '시름', 5127, 6, 0, 1),
+(NULL, '실밥', 5128, 6, 0, 1),
+(NULL, '심방', 5129, 6, 0, 1),
+(NULL, '썰다', 5130, 6, 0, 1),
+(NULL, '썸팅', 5131, 6, 0, 1),
+(NULL, '씹덕', 5132, 6, 0, 1),
+(NULL, '아기', 5133, 6, 0, 1),
+(NULL, '안반', 5134, 6, 0, 1),
+(NULL, '언니', 5135, 6, 0, 1),
+(NULL, '옛말', 5136, 6, 0, 1),
+(NULL, '웃다', 5137, 6, 0, 1),
+(NULL, '익다', 5138, 6, 0, 1),
+(NULL, '입다', 5139, 6, 0, 1),
+(NULL, '절다', 5140, 6, 0, 1),
+('慫慂', '종용', 5141, 6, 0, 1),
+(NULL, '주걱', 5142, 6, 0, 1),
+(NULL, '쩔다', 5143, 6, 0, 1),
+(NULL, '카다', 5144, 6, 0, 1),
+(NULL, '콩밥', 5145, 6, 0, 1),
+(NULL, '파토', 5146, 6, 0, 1),
+(NULL, '팬티', 5147, 6, 0, 1),
+(NULL, '품다', 5148, 6, 0, 1),
+(NULL, '풋젓', 5149, 6, 0, 1),
+(NULL, '형아', 5150, 6, 0, 1),
+(NULL, '황새', 5151, 6, 0, 1),
+(NULL, '흙밥', 5152, 6, 0, 1),
+(NULL, '가르다', 5153, 6, 0, 1),
+(NULL, '가불기', 5154, 6, 0, 1),
+(NULL, '갈닦다', 5155, 6, 0, 1),
+(NULL, '강아지', 5156, 6, 0, 1),
+(NULL, '개독교', 5157, 6, 0, 1),
+(NULL, '건더기', 5158, 6, 0, 1),
+(NULL, '걸리다', 5159, 6, 0, 1),
+(NULL, '게우다', 5160, 6, 0, 1),
+(NULL, '겨우내', 5161, 6, 0, 1),
+(NULL, '고리짝', 5162, 6, 0, 1),
+(NULL, '고무신', 5163, 6, 0, 1),
+(NULL, '그을다', 5164, 6, 0, 1),
+(NULL, '꼭대기', 5165, 6, 0, 1),
+(NULL, '넷카마', 5166, 6, 0, 1),
+(NULL, '녹이다', 5167, 6, 0, 1),
+(NULL, '놓치다', 5168, 6, 0, 1),
+(NULL, '다그다', 5169, 6, 0, 1),
+(NULL, '다니다', 5170, 6, 0, 1),
+(NULL, '댕기다', 5171, 6, 0, 1),
+(NULL, '더듬다', 5172, 6, 0, 1),
+(NULL, '더하다', 5173, 6, 0, 1),
+(NULL, '도드리', 5174, 6, 0, 1),
+(NULL, '돼지꿈', 5175, 6, 0, 1),
+(NULL, '됨됨이', 5176, 6, 0, 1),
+(NULL, '두벌식', 5177, 6, 0, 1),
+(NULL, '들뜨다', 5178, 6, 0, 1),
+(NULL, '똥거름', 5179, 6, 0, 1),
+(NULL, '뜬금포', 5180, 6, 0, 1),
+(NULL, '만수르', 5181, 6, 0, 1),
+(NULL, '말대꾸', 5182, 6, 0, 1),
+(NULL, '망나니', 5183, 6, 0, 1),
+(NULL, '맺히다', 5184, 6, 0, 1),
+(NULL, '물수건', 5185, 6, 0, 1),
+(NULL, '바름감', 5186, 6, 0, 1),
+(NULL, '버러지', 5187, 6, 0, 1),
+(NULL, '버버리', 5188, 6, 0, 1),
+(NULL, '벌이다', 5189, 6, 0, 1),
+(NULL, '베이다', 5190, 6, 0, 1),
+(NULL, '부풀다', 5191, 6, 0, 1),
+(NULL, '불고기', 5192, 6, 0, 1),
+(NULL, '비단결', 5193, 6, 0, 1),
+(NULL, '세벌식', 5194, 6, 0, 1),
+(NULL, '손대다', 5195, 6, 0, 1),
+(NULL, '손아귀', 5196, 6, 0, 1),
+(NULL, '슬며시', 5197, 6, 0, 1),
+(NULL, '시치미', 5198, 6, 0, 1),
+(NULL, '쏘이다', 5199, 6, 0, 1),
+(NULL, '야부리', 5200, 6, 0, 1),
+(NULL, '어렙다', 5201, 6, 0, 1),
+(NULL, '어쩌다', 5202, 6, 0, 1),
+(NULL, '언저리', 5203, 6, 0, 1),
+(NULL, '엉기다', 5204, 6, 0, 1),
+(NULL, '오랜만', 5205, 6, 0, 1),
+(NULL, '올리다', 5206, 6, 0, 1),
+(NULL, '왕눈이', 5207, 6, 0, 1),
+(NULL, '외우다', 5208, 6, 0, 1),
+(NULL, '우수리', 5209, 6, 0, 1),
+(NULL, '이만큼', 5210, 6, 0, 1),
+(NULL, '이미지', 5211, 6, 0, 1),
+(NULL, '인서울', 5212, 6, 0, 1),
+(NULL, '잘되다', 5213, 6, 0, 1),
+(NULL, '잠꼬대', 5214, 6, 0, 1),
+(NULL, '잠자리', 5215, 6, 0, 1),
+(NULL, '잠자코', 5216, 6, 0, 1),
+(NULL, '제각기', 5217, 6, 0, 1),
+(NULL, '조리개', 5218, 6, 0, 1),
+(NULL, '졸리다', 5219, 6, 0, 1),
+(NULL, '중2병', 5220, 6, 0, 1),
+(NULL, '진하다', 5221, 6, 0, 1),
+(NULL, '철부지', 5222, 6, 0, 1),
+(NULL, '터지다', 5223, 6, 0, 1),
+(NULL, '트페미', 5224, 6, 0, 1),
+(NULL, '풋내기', 5225, 6, 0, 1),
+(NULL, '가당하다', 5226, 6, 0, 1),
+(NULL, '가시나무', 5227, 6, 0, 1),
+(NULL, '감정아이', 5228, 6, 0, 1),
+(NULL, '겨우살이', 5229, 6, 0, 1),
+(NULL, '그늘지다', 5230, 6, 0, 1),
+(NULL, '그루터기', 5231, 6, 0, 1),
+(NULL, '그을리다', 5232, 6, 0, 1),
+(NULL, '나박김치', 5233, 6, 0, 1),
+(NULL, '내지르다', 5234, 6, 0, 1),
+(NULL, '놀러오다', 5235, 6, 0, 1),
+(NULL, '덧붙이다', 5236, 6, 0, 1),
+(NULL, '드러내다', 5237, 6, 0, 1),
+(NULL, '드러냄표', 5238, 6, 0, 1),
+(NULL, '들어가다', 5239, 6, 0, 1),
+(NULL, '뚝뚝하다', 5240, 6, 0, 1),
+(NULL, '뛰어들다', 5241, 6, 0, 1),
+(NULL, '몰려들다', 5242, 6, 0, 1),
+(NULL, '바람둥이', 5243, 6, 0, 1),
+(NULL, '바로잡다', 5244, 6, 0, 1),
+(NULL, '반짝이다', 5245, 6, 0, 1),
+(NULL, '벌게지다', 5246, 6, 0, 1),
+(NULL, '복받치다', 5247, 6, 0, 1),
+(NULL, '부젓가락', 5248, 6, 0, 1),
+(NULL, '빽빽하다', 5249, 6, 0, 1),
+(NULL, '새파랗다', 5250, 6, 0, 1),
+(NULL, '솟구치다', 5251, 6, 0, 1),
+(NULL, '숨돌리다', 5252, 6, 0, 1),
+(NULL, '알아듣다', 5253, 6, 0, 1),
+(NULL, '애틋하다', 5254, 6, 0, 1),
+(NULL, '어우르다', 5255, 6, 0, 1),
+(NULL, '엄청나다', 5256, 6, 0, 1),
+(NULL, '오피스텔', 5257, 6, 0, 1),
+(NULL, '옥신각신', 5258, 6, 0, 1),
+(NULL, '입맞추다', 5259, 6, 0, 1),
+(NULL, '잘나가다', 5260, 6, 0, 1),
+(NULL, '정해지다', 5261, 6, 0, 1),
+(NULL, '조용하다', 5262, 6, 0, 1),
+(NULL, '직박구리', 5263, 6, 0, 1),
+(NULL, '징검다리', 5264, 6, 0, 1),
+(NULL, '찌푸리다', 5265, 6, 0, 1),
+(NULL, '촐촐하다', 5266, 6, 0, 1),
+(NULL, '통통하다', 5267, 6, 0, 1),
+(NULL, '하루살이', 5268, 6, 0, 1),
+(NULL, '허수아비', 5269, 6, 0, 1),
+(NULL, '헷갈리다', 5270, 6, 0, 1),
+(NULL, '호방하다', 5271, 6, 0, 1),
+(NULL, '휘두르다', 5272, 6, 0, 1),
+(NULL, '간댕거리다', 5273, 6, 0, 1),
+(NULL, '개밥바라기', 5274, 6, 0, 1),
+(NULL, '거꾸러지다', 5275, 6, 0, 1),
+(NULL, '꼬박거리다', 5276, 6, 0, 1),
+(NULL, '더러워지다', 5277, 6, 0, 1),
+(NULL, '떠들썩하다', 5278, 6, 0, 1),
+(NULL, '문드러지다', 5279, 6, 0, 1),
+(NULL, '빤질거리다', 5280, 6, 0, 1),
+(NULL, '이야기하다', 5281, 6, 0, 1),
+(NULL, '조용조용히', 5282, 6, 0, 1),
+(NULL, '허점투성이', 5283, 6, 0, 1),
+(NULL, '흰귀마모셋', 5284, 6, 0, 1),
+(NULL, '나이가 들다', 5285, 6, 0, 1),
+(NULL, '방구석 여포', 5286, 6, 0, 1),
+(NULL, '비단 주머니', 5287, 6, 0, 1),
+(NULL, '낙동강 오리알', 5288, 6, 0, 1),
+('國家保安法', '국가보안법', 5289, 5, 553, 1),
+('地大物博', '지대물박', 5290, 5, 530, 1),
+('韓人會', '한인회', 5291, 5, 462, 1),
+('大國', '대국', 5292, 5, 415, 1),
+('東洋人', '동양인', 5293, 5, 393, 1),
+('大文字', '대문자', 5294, 5, 391, 1),
+('小人', '소인', 5295, 5, 386, 1),
+('豐頰美人', '풍협미인', 5296, 5, 385, 1),
+('口語體', '구어체', 5297, 5, 381, 1),
+('朝鮮人', '조선인', 5298, 5, 369, 1),
+('音素文字', '음소문자', 5299, 5, 366, 1),
+('中國사람', '즁국사람', 5300, 5, 364, 1),
+('巫俗人', '무속인', 5301, 5, 349, 1),
+('國文', '국문', 5302, 5, 341, 1),
+('冠者', '관자', 5303, 5, 340, 1),
+('個人', '개인', 5304, 5, 338, 1),
+('人影', '인영', 5305, 5, 337, 1),
+('愚民化 政策', '우민화 정책', 5306, 5, 331, 1),
+('江原道 砲手', '강원도 포수', 5307, 5, 329, 1),
+('瞳人', '동인', 5308, 5, 323, 1),
+('大宗家', '대종가', 5309, 5, 323, 1),
+('戀人', '연인', 5310, 5, 320, 1),
+('漢學', '한학', 5311, 5, 318, 1),
+('大事', '대사', 5312, 5, 308, 1),
+('大家', '대가', 5313, 5, 307, 1),
+('戰國', '전국', 5314, 5, 303, 1),
+('國字', '국자', 5315, 5, 298, 1),
+('語義', '어의', 5316, 5, 298, 1),
+('腐女子', '부녀자', 5317, 5, 291, 1),
+('神子息', '신자식', 5318, 5, 288, 1),
+('升學宴', '승학연', 5319, 5, 287, 1),
+('針小棒大', '침소봉대', 5320, 5, 286, 1),
+('顯學', '현학', 5321, 5, 284, 1),
+('一擧一動', '일거일동', 5322, 5, 272, 1),
+('好戰的', '호전적', 5323, 5, 269, 1),
+('論文集', '논문집', 5324, 5, 265, 1),
+('一擧手一投足', '일거수일투족', 5325, 5, 261, 1),
+('獨不將軍', '독불장군', 5326, 5, 259, 1),
+('生離別', '생이별', 5327, 5, 256, 1),
+('開國', '개국', 5328, 5, 255, 1),
+('古物商', '고물상', 5329, 5, 247, 1),
+('外王內帝', '외왕내제', 5330, 5, 245, 1),
+('馬印語', '마인어', 5331, 5, 242, 1),
+('確實性', '확실성', 5332, 5, 242, 1),
+('大便', '대변', 5333, 5, 240, 1),
+('世子', '세자', 5334, 5, 240, 1),
+('大帶', '대대', 5335, 5, 233, 1),
+('以民爲天', '이민위천', 5336, 5, 232, 1),
+('以北五道', '이북5도', 5337, 5, 229, 1),
+('非上場 株式', '비상장 주식', 5338, 5, 229, 1),
+('十中八九', '십중팔구', 5339, 5, 227, 1),
+('九山八海', '구산팔해', 5340, 5, 225, 1),
+('南北戰爭', '남북전쟁', 5341, 5, 222, 1),
+('牧草地', '목초지', 5342, 5, 220, 1),
+('新時代', '신시대', 5343, 5, 220, 1),
+('位相空間', '위상공간', 5344, 5, 217, 1),
+('自作自演', '자작자연', 5345, 5, 214, 1),
+('死體', '사체', 5346, 5, 213, 1),
+('正體', '정체', 5347, 5, 212, 1),
+('不完全', '불완전', 5348, 5, 210, 1),
+('我田引水', '아전인수', 5349, 5, 209, 1),
+('擬態語', '의태어', 5350, 5, 206, 1),
+('衆生', '중생', 5351, 5, 205, 1),
+('甘露水', '감로수', 5352, 5, 202, 1),
+('易地思之', '역지사지', 5353, 5, 202, 1),
+('無數', '무수', 5354, 5, 201, 1),
+('漢族法', '한족법', 5355, 5, 197, 1),
+('客地', '객지', 5356, 5, 196, 1),
+('自愧感', '자괴감', 5357, 5, 196, 1),
+('大박', '대박', 5358, 5, 194, 1),
+('愚民 政策', '우민 정책', 5359, 5, 190, 1),
+('前上腸骨棘', '전상장골극', 5360, 5, 187, 1),
+('蕩子', '탕자', 5361, 5, 184, 1),
+('海月', '해월', 5362, 5, 184, 1),
+('減水', '감수', 5363, 5, 183, 1),
+('陽性', '양성', 5364, 5, 182, 1),
+('後日', '후일', 5365, 5, 182, 1),
+('作業服', '작업복', 5366, 5, 181, 1),
+('見性', '견성', 5367, 5, 180, 1),
+('內心', '내심', 5368, 5, 180, 1),
+('家計', '가계', 5369, 5, 179, 1),
+('義母', '의모', 5370, 5, 179, 1),
+('不能', '불능', 5371, 5, 178, 1),
+('未知數', '미지수', 5372, 5, 174, 1),
+('不變', '불변', 5373, 5, 173, 1),
+('一等級', '일등급', 5374, 5, 173, 1),
+('文士', '문사', 5375, 5, 172, 1),
+('性德', '성덕', 5376, 5, 172, 1),
+('荒蕪地', '황무지', 5377, 5, 172, 1),
+('理馬', '이마', 5378, 5, 171, 1),
+('兩性', '양성', 5379, 5, 169, 1),
+('文質彬彬', '문질빈빈', 5380, 5, 169, 1),
+('千軍萬馬', '천군만마', 5381, 5, 169, 1),
+('貢物', '공물', 5382, 5, 168, 1),
+('法度', '법도', 5383, 5, 168, 1),
+('分期', '분기', 5384, 5, 168, 1),
+('以心傳心', '이심전심', 5385, 5, 167, 1),
+('濕性', '습성', 5386, 5, 166, 1),
+('性慾', '성욕', 5387, 5, 164, 1),
+('水', '수', 5388, 5, 163, 1),
+('硯水', '연수', 5389, 5, 163, 1),
+('行裝', '행장', 5390, 5, 163, 1),
+('漢文套', '한문투', 5391, 5, 163, 1),
+('三神', '삼신', 5392, 5, 160, 1),
+('民意', '민의', 5393, 5, 157, 1),
+('外腹斜筋', '외복사근', 5394, 5, 155, 1),
+('法令', '법령', 5395, 5, 153, 1),
+('相對便', '상대편', 5396, 5, 153, 1),
+('義父', '의부', 5397, 5, 152, 1),
+('明神', '명신', 5398, 5, 149, 1),
+('作戰', '작전', 5399, 5, 149, 1),
+('速度違反', '속도위반', 5400, 5, 148, 1),
+('道使', '도사', 5401, 5, 146, 1),
+('不孝', '불효', 5402, 5, 145, 1),
+('同時', '동시', 5403, 5, 144, 1),
+('法司', '법사', 5404, 5, 144, 1),
+('體軀', '체구', 5405, 5, 144, 1),
+('不倫', '불륜', 5406, 5, 142, 1),
+('窮理', '궁리', 5407, 5, 137, 1),
+('打數', '타수', 5408, 5, 132, 1),
+('圖書', '도서', 5409, 5, 131, 1),
+('身手', '신수', 5410, 5, 131, 1),
+('御道', '어도', 5411, 5, 131, 1),
+('諸法', '제법', 5412, 5, 131, 1),
+('酒色', '주색', 5413, 5, 131, 1),
+('鐵色', '철색', 5414, 5, 131, 1),
+('自註', '자주', 5415, 5, 130, 1),
+('强力', '강력', 5416, 5, 129, 1),
+('調敎', '조교', 5417, 5, 129, 1),
+('百戰百勝', '백전백승', 5418, 5, 129, 1),
+('檢出', '검출', 5419, 5, 126, 1),
+('三樂', '삼락', 5420, 5, 126, 1),
+('死火', '사화', 5421, 5, 125, 1),
+('後遺證', '후유증', 5422, 5, 124, 1),
+('銘文', '명문', 5423, 5, 123, 1),
+('文翰', '문한', 5424, 5, 123, 1),
+('疇日', '주일', 5425, 5, 123, 1),
+('選球眼', '선구안', 5426, 5, 123, 1),
+('公報', '공보', 5427, 5, 122, 1),
+('日日', '일일', 5428, 5, 122, 1),
+('同種', '동종', 5429, 5, 121, 1),
+('一因', '일인', 5430, 5, 121, 1),
+('案內狀', '안내장', 5431, 5, 121, 1),
+('女超', '여초', 5432, 5, 120, 1),
+('全線', '전선', 5433, 5, 120, 1),
+('占領軍', '점령군', 5434, 5, 119, 1),
+('白土', '백토', 5435, 5, 118, 1),
+('凶事', '흉사', 5436, 5, 117, 1),
+('音', '음', 5437, 5, 116, 1),
+('上投', '상투', 5438, 5, 116, 1),
+('乘務員', '승무원', 5439, 5, 116, 1),
+('惡熱', '오열', 5440, 5, 114, 1),
+('家', '가', 5441, 5, 113, 1),
+('內腹斜筋', '내복사근', 5442, 5, 113, 1),
+('耳目口鼻', '이목구비', 5443, 5, 112, 1),
+('形聲', '형성', 5444, 5, 111, 1),
+('月影', '월영', 5445, 5, 109, 1),
+('下界', '하계', 5446, 5, 108, 1),
+('合邦', '합방', 5447, 5, 106, 1),
+('表記', '표기', 5448, 5, 102, 1),
+('그女', '그녀', 5449, 5, 101, 1),
+('明視', '명시', 5450, 5, 101, 1),
+('四苦八苦', '사고팔고', 5451, 5, 101, 1),
+('窈窕淑女', '요조숙녀', 5452, 5, 101, 1),
+('帛書', '백서', 5453, 5, 100, 1),
+('治熱', '치열', 5454, 5, 100, 1),
+('燕趙悲歌士', '연조비가사', 5455, 5, 100, 1),
+('應召兵', '응소병', 5456, 5, 99, 1),
+('世變', '세변', 5457, 5, 98, 1),
+('森羅萬象', '삼라만상', 5458, 5, 98, 1),
+('詞話', '사화', 5459, 5, 97, 1),
+('危急存亡之秋', '위급존망지추', 5460, 5, 94, 1),
+('圖解', '도해', 5461, 5, 93, 1),
+('脈點', '맥점', 5462, 5, 93, 1),
+('通念', '통념', 5463, 5, 93, 1),
+('手匣', '수갑', 5464, 5, 92, 1),
+('交叉路', '교차로', 5465, 5, 92, 1),
+('對備', '대비', 5466, 5, 90, 1),
+('治安', '치안', 5467, 5, 90, 1),
+('金塊', '금괴', 5468, 5, 89, 1),
+('阿房宮', '아방궁', 5469, 5, 89, 1),
+('乙亥字', '을해자', 5470, 5, 89, 1),
+('飮淸類', '음청류', 5471, 5, 89, 1),
+('我軍', '아군', 5472, 5, 88, 1),
+('虛點', '허점', 5473, 5, 88, 1),
+('手', '수', 5474, 5, 86, 1),
+('對象', '대상', 5475, 5, 86, 1),
+('離間질', '이간질', 5476, 5, 86, 1),
+('開花', '개화', 5477, 5, 85, 1),
+('謀反', '모반', 5478, 5, 84, 1),
+('更新', '경신', 5479, 5, 83, 1),
+('管路', '관로', 5480, 5, 83, 1),
+('死藏', '사장', 5481, 5, 82, 1),
+('野說', '야설', 5482, 5, 82, 1),
+('泰山', '태산', 5483, 5, 82, 1),
+('業', '업', 5484, 5, 81, 1),
+('老師', '노사', 5485, 5, 80, 1),
+('老師', '로사', 5486, 5, 80, 1),
+('報應', '보응', 5487, 5, 80, 1),
+('南向', '남향', 5488, 5, 78, 1),
+('世宗', '세종', 5489, 5, 77, 1),
+('修能', '수능', 5490, 5, 77, 1),
+('情念', '정념', 5491, 5, 77, 1),
+('千世  ', '천세 후', 5492, 5, 77, 1),
+('喜怒哀樂', '희로애락', 5493, 5, 77, 1),
+('應當', '응당', 5494, 5, 76, 1),
+('正殿', '정전', 5495, 5, 76, 1),
+('廢工', '폐공', 5496, 5, 76, 1),
+('滿身瘡痍', '만신창이', 5497, 5, 75, 1),
+('舞樂', '무악', 5498, 5, 73, 1),
+('溫和', '온화', 5499, 5, 73, 1),
+('三焦', '삼초', 5500, 5, 71, 1),
+('雲半', '운반', 5501, 5, 71, 1),
+('將兵', '장병', 5502, 5, 71, 1),
+('인터넷  小', '인터넷 소설', 5503, 5, 69, 1),
+('陽報', '양보', 5504, 5, 68, 1),
+('異朝', '이조', 5505, 5, 68, 1),
+('平易', '평이', 5506, 5, 68, 1),
+('邪世', '사세', 5507, 5, 67, 1),
+('面面', '면면', 5508, 5, 66, 1),
+('要害', '요해', 5509, 5, 66, 1),
+('男超', '남초', 5510, 5, 65, 1),
+('終聲', '종성', 5511, 5, 65, 1),
+('硬質', '경질', 5512, 5, 64, 1),
+('混血', '혼혈', 5513, 5, 64, 1),
+('兵丁', '병정', 5514, 5, 63, 1),
+('春節', '춘절', 5515, 5, 63, 1),
+('注視', '주시', 5516, 5, 61, 1),
+('親近', '친근', 5517, 5, 60, 1),
+('鬼哭聲', '귀곡성', 5518, 5, 60, 1),
+('北傀', '북괴', 5519, 5, 59, 1),
+('四足', '사족', 5520, 5, 59, 1),
+('憲兵', '헌병', 5521, 5, 59, 1),
+('樂', '낙', 5522, 5, 58, 1),
+('伐期', '벌기', 5523, 5, 58, 1),
+('草具', '초구', 5524, 5, 58, 1),
+('里程標', '리정표', 5525, 5, 58, 1),
+('靑葡萄', '청포도', 5526, 5, 58, 1),
+('咯血', '각혈', 5527, 5, 57, 1),
+('䘔血', '객혈', 5528, 5, 57, 1),
+('戀情', '연정', 5529, 5, 57, 1),
+('門衡', '문형', 5530, 5, 56, 1),
+('監修', '감수', 5531, 5, 55, 1),
+('謀殺', '모살', 5532, 5, 55, 1),
+('召集', '소집', 5533, 5, 55, 1),
+('打擊', '타격', 5534, 5, 55, 1),
+('布告', '포고', 5535, 5, 55, 1),
+('更紙', '갱지', 5536, 5, 52, 1),
+('賜花', '사화', 5537, 5, 52, 1),
+('雜像', '잡상', 5538, 5, 51, 1),
+('標示', '표시', 5539, 5, 51, 1),
+('遊擊', '유격', 5540, 5, 50, 1),
+('洪魚', '홍어', 5541, 5, 50, 1),
+('芒角', '망각', 5542, 5, 49, 1),
+('宰相', '재상', 5543, 5, 49, 1),
+('螺旋狀', '나선상', 5544, 5, 49, 1),
+('相', '상', 5545, 5, 48, 1),
+('塵想', '진상', 5546, 5, 48, 1),
+('巫知唻', '무지내', 5547, 5, 48, 1),
+('結束', '결속', 5548, 5, 47, 1),
+('硬直', '경직', 5549, 5, 47, 1),
+('單層', '단층', 5550, 5, 46, 1),
+('突破', '돌파', 5551, 5, 46, 1),
+('木瓜', '모과', 5552, 5, 45, 1),
+('聖恩', '성은', 5553, 5, 45, 1),
+('細毛', '세모', 5554, 5, 45, 1),
+('象牙塔', '상아탑', 5555, 5, 45, 1),
+('遺棄犬', '유기견', 5556, 5, 45, 1),
+('能', '능', 5557, 5, 42, 1),
+('極', '극', 5558, 5, 41, 1),
+('曠野', '광야', 5559, 5, 41, 1),
+('燥劑', '조제', 5560, 5, 40, 1),
+('送付', '송부', 5561, 5, 38, 1),
+('鎭魂祭', '진혼제', 5562, 5, 38, 1),
+('淸濁', '청탁', 5563, 5, 37, 1),
+('黑兄', '흑형', 5564, 5, 37, 1),
+('叛亂', '반란', 5565, 5, 36, 1),
+('凡夫', '범부', 5566, 5, 35, 1),
+('淸', '청', 5567, 5, 33, 1),
+('殘壘', '잔루', 5568, 5, 33, 1),
+('健筆', '건필', 5569, 5, 32, 1),
+('列', '열', 5570, 5, 31, 1),
+('肉膾', '육회', 5571, 5, 31, 1),
+('碧眼', '벽안', 5572, 5, 30, 1),
+('庇護', '비호', 5573, 5, 30, 1),
+('辭讓', '사양', 5574, 5, 30, 1),
+('是非', '시비', 5575, 5, 30, 1),
+('增設', '증설', 5576, 5, 30, 1),
+('衆智', '중지', 5577, 5, 29, 1),
+('千歲', '천세', 5578, 5, 29, 1),
+('膠着', '교착', 5579, 5, 28, 1),
+('宮', '궁', 5580, 5, 26, 1),
+('起牀', '기상', 5581, 5, 26, 1),
+('德澤', '덕택', 5582, 5, 26, 1),
+('驅魔', '구마', 5583, 5, 24, 1),
+('帳幕', '장막', 5584, 5, 23, 1),
+('壘', '루', 5585, 5, 22, 1),
+('盥洗', '관세', 5586, 5, 21, 1),
+('良輔', '양보', 5587, 5, 21, 1),
+('淨財', '정재', 5588, 5, 20, 1),
+('貴賓', '귀빈', 5589, 5, 19, 1),
+('負荷', '부하', 5590, 5, 19, 1),
+('曖昧模糊', '애매모호', 5591, 5, 19, 1),
+('막醬', '막장', 5592, 5, 18, 1),
+('思慕', '사모', 5593, 5, 18, 1),
+('紗窓', '사창', 5594, 5, 17, 1),
+('麻姑', '마고', 5595, 5, 15, 1),
+('埋藏', '매장', 5596, 5, 15, 1),
+('掩襲', '엄습', 5597, 5, 15, 1),
+('沈鬱', '침울', 5598, 5, 15, 1),
+('巨軀', '거구', 5599, 5, 12, 1),
+('拿捕', '나포', 5600, 5, 12, 1),
+('省墓', '성묘', 5601, 5, 12, 1),
+('僥幸', '요행', 5602, 5, 12, 1),
+('胎倦', '태권', 5603, 5, 12, 1),
+('臣', '신', 5604, 5, 11, 1),
+('巨擘', '거벽', 5605, 5, 11, 1),
+('敬畏', '경외', 5606, 5, 11, 1),
+('岸畔', '안반', 5607, 5, 10, 1),
+('遡及', '소급', 5608, 5, 9, 1),
+('杖囚', '장수', 5609, 5, 9, 1),
+('濫伐', '남벌', 5610, 5, 8, 1),
+('怒濤', '노도', 5611, 5, 8, 1),
+('仁', '인', 5612, 5, 7, 1),
+('막杖', '막장', 5613, 5, 7, 1),
+('煩惱', '번뇌', 5614, 5, 7, 1),
+('扶桑', '부상', 5615, 5, 7, 1),
+('混沌', '혼돈', 5616, 5, 7, 1),
+('剛愎', '강퍅', 5617, 5, 6, 1),
+('閨怨', '규원', 5618, 5, 6, 1),
+('屍諫', '시간', 5619, 5, 6, 1),
+('項', '항', 5620, 5, 5, 1),
+('豐頰', '풍협', 5621, 5, 5, 1),
+('戶戶', '호호', 5622, 5, 5, 1),
+('煎', '전', 5623, 5, 4, 1),
+('仔詳', '자상', 5624, 5, 4, 1),
+('衙婢', '아비', 5625, 5, 3, 1),
+('鴛鴦', '원앙', 5626, 5, 2, 1),
+('絢爛', '현란', 5627, 5, 1, 1),
+(NULL, '곰', 5628, 5, 0, 1),
+(NULL, '광', 5629, 5, 0, 1),
+(NULL, '균', 5630, 5, 0, 1),
+(NULL, '깁', 5631, 5, 0, 1),
+(NULL, '꾼', 5632, 5, 0, 1),
+('盧', '노', 5633, 5, 0, 1),
+(NULL, '늪', 5634, 5, 0, 1),
+(NULL, '덧', 5635, 5, 0, 1),
+(NULL, '되', 5636, 5, 0, 1),
+(NULL, '땅', 5637, 5, 0, 1),
+(NULL, '목', 5638, 5, 0, 1),
+(NULL, '물', 5639, 5, 0, 1),
+(NULL, '묾', 5640, 5, 0, 1),
+(NULL, '불', 5641, 5, 0, 1),
+(NULL, '뼈', 5642, 5, 0, 1),
+(NULL, '샅', 5643, 5, 0, 1),
+(NULL, '셈', 5644, 5, 0, 1),
+(NULL, '쇠', 5645, 5, 0, 1),
+(NULL, '쐼', 5646, 5, 0, 1),
+(NULL, '씽', 5647, 5, 0, 1),
+(NULL, '움', 5648, 5, 0, 1),
+(NULL, '인', 5649, 5, 0, 1),
+(NULL, '절', 5650, 5, 0, 1),
+(NULL, '죽', 5651, 5, 0, 1),
+(NULL, '집', 5652, 5, 0, 1),
+(NULL, '칩', 5653, 5, 0, 1),
+(NULL, '칸', 5654, 5, 0, 1),
+(NULL, '틈', 5655, 5, 0, 1),
+(NULL, '풀', 5656, 5, 0, 1),
+(NULL, '품', 5657, 5, 0, 1),
+(NULL, '피', 5658, 5, 0, 1),
+(NULL, '해', 5659, 5, 0, 1),
+(NULL, '홀', 5660, 5, 0, 1),
+(NULL, '힘', 5661, 5, 0, 1),
+(NULL, '가닥', 5662, 5, 0, 1),
+(NULL, '각배', 5663, 5, 0, 1),
+(NULL, '감투', 5664, 5, 0, 1),
+(NULL, '갱빈', 5665, 5, 0, 1),
+(NULL, '거리', 5666, 5, 0, 1),
+(NULL, '걸레', 5667, 5, 0, 1),
+(NULL, '겨레', 5668, 5, 0, 1),
+(NULL, '고다', 5669, 5, 0, 1),
+(NULL, '고추', 5670, 5, 0, 1),
+('鯤鮞', '곤이', 5671, 5, 0, 1),
+('皎皎', '교교', 5672, 5, 0, 1),
+(NULL, '구들', 5673, 5, 0, 1),
+(NULL, '구라', 5674, 5, 0, 1),
+(NULL, '국룰', 5675, 5, 0, 1),
+(NULL, '굳다', 5676, 5, 0, 1),
+(NULL, '그늘', 5677, 5, 0, 1),
+(NULL, '기전', 5678, 5, 0, 1),
+(NULL, '긷다', 5679, 5, 0, 1),
+(NULL, '꺼풀', 5680, 5, 0, 1),
+(NULL, '꼬다', 5681, 5, 0, 1),
+(NULL, '꼭지', 5682, 5, 0, 1),
+(NULL, '꼰대', 5683, 5, 0, 1),
+(NULL, '꽃불', 5684, 5, 0, 1),
+(NULL, '꿀떡', 5685, 5, 0, 1),
+(NULL, '꿀맛', 5686, 5, 0, 1),
+(NULL, '냄새', 5687, 5, 0, 1),
+(NULL, '너무', 5688, 5, 0, 1),
+(NULL, '노래', 5689, 5, 0, 1),
+(NULL, '다발', 5690, 5, 0, 1),
+(NULL, '동무', 5691, 5, 0, 1),
+(NULL, '두덩', 5692, 5, 0, 1),
+(NULL, '뒤끝', 5693, 5, 0, 1),
+(NULL, '들소', 5694, 5, 0, 1),
+(NULL, '딥톡', 5695, 5, 0, 1),
+(NULL, '따다', 5696, 5, 0, 1),
+(NULL, '딸감', 5697, 5, 0, 1),
+(NULL, '땡볕', 5698, 5, 0, 1),
+(NULL, '똥개', 5699, 5, 0, 1),
+(NULL, '마름', 5700, 5, 0, 1),
+(NULL, '매다', 5701, 5, 0, 1),
+(NULL, '맺다', 5702, 5, 0, 1),
+(NULL, '문찐', 5703, 5, 0, 1),
+(NULL, '물개', 5704, 5, 0, 1),
+(NULL, '밀덕', 5705, 5, 0, 1),
+(NULL, '바둑', 5706, 5, 0, 1),
+(NULL, '바로', 5707, 5, 0, 1),
+(NULL, '바리', 5708, 5, 0, 1),
+(NULL, '바보', 5709, 5, 0, 1),
+(NULL, '밤빛', 5710, 5, 0, 1),
+(NULL, '밤일', 5711, 5, 0, 1),
+(NULL, '벗방', 5712, 5, 0, 1),
+(NULL, '벨튀', 5713, 5, 0, 1),
+(NULL, '벼리', 5714, 5, 0, 1),
+(NULL, '벼슬', 5715, 5, 0, 1),
+(NULL, '보름', 5716, 5, 0, 1),
+(NULL, '붇다', 5717, 5, 0, 1),
+(NULL, '불꽃', 5718, 5, 0, 1),
+(NULL, '빈틈', 5719, 5, 0, 1),
+(NULL, '뿌리', 5720, 5, 0, 1),
+(NULL, '뿜다', 5721, 5, 0, 1),
+(NULL, '사다', 5722, 5, 0, 1),
+(NULL, '상구', 5723, 5, 0, 1),
+(NULL, '상놈', 5724, 5, 0, 1),
+(NULL, '서리', 5725, 5, 0, 1),
+(NULL, '서인', 5726, 5, 0, 1),
+(NULL, '석가', 5727, 5, 0, 1),
+(NULL, '소리', 5728, 5, 0, 1),
+(NULL, '속뜻', 5729, 5, 0, 1),
+(NULL, '손님', 5730, 5, 0, 1),
+(NULL, '손질', 5731, 5, 0, 1),
+(NULL, '술국', 5732, 5, 0, 1),
+(NULL, '숫것', 5733, 5, 0, 1),
+(NULL, '스승', 5734, 5, 0, 1),
+(NULL, '시집', 5735, 5, 0, 1),
+(NULL, '신맛', 5736, 5, 0, 1),
+(NULL, '신물', 5737, 5, 0, 1),
+(NULL, '실눈', 5738, 5, 0, 1),
+(NULL, '심다', 5739, 5, 0, 1),
+(NULL, '싸움', 5740, 5, 0, 1),
+(NULL, '싸홈', 5741, 5, 0, 1),
+(NULL, '쏘다', 5742, 5, 0, 1),
+(NULL, '아치', 5743, 5, 0, 1),
+(NULL, '알바', 5744, 5, 0, 1),
+(NULL, '암컷', 5745, 5, 0, 1),
+(NULL, '애비', 5746, 5, 0, 1),
+(NULL, '얼간', 5747, 5, 0, 1),
+(NULL, '얼다', 5748, 5, 0, 1),
+(NULL, '엔나', 5749, 5, 0, 1),
+(NULL, '오금', 5750, 5, 0, 1),
+(NULL, '오직', 5751, 5, 0, 1),
+(NULL, '올백', 5752, 5, 0, 1),
+(NULL, '외침', 5753, 5, 0, 1),
+(NULL, '울새', 5754, 5, 0, 1),
+(NULL, '움짤', 5755, 5, 0, 1),
+(NULL, '이분', 5756, 5, 0, 1),
+(NULL, '잉걸', 5757, 5, 0, 1),
+(NULL, '자취', 5758, 5, 0, 1),
+(NULL, '잘다', 5759, 5, 0, 1),
+(NULL, '잠적', 5760, 5, 0, 1),
+(NULL, '잡내', 5761, 5, 0, 1),
+(NULL, '조각', 5762, 5, 0, 1),
+(NULL, '줄곧', 5763, 5, 0, 1),
+(NULL, '지대', 5764, 5, 0, 1),
+(NULL, '지랄', 5765, 5, 0, 1),
+(NULL, '지슴', 5766, 5, 0, 1),
+(NULL, '짖다', 5767, 5, 0, 1),
+(NULL, '짙다', 5768, 5, 0, 1),
+(NULL, '짠맛', 5769, 5, 0, 1),
+(NULL, '짤방', 5770, 5, 0, 1),
+(NULL, '짱깨', 5771, 5, 0, 1),
+(NULL, '쫓다', 5772, 5, 0, 1),
+(NULL, '차림', 5773, 5, 0, 1),
+(NULL, '차분', 5774, 5, 0, 1),
+(NULL, '참치', 5775, 5, 0, 1),
+(NULL, '찾다', 5776, 5, 0, 1),
+(NULL, '크리', 5777, 5, 0, 1),
+(NULL, '클럽', 5778, 5, 0, 1),
+(NULL, '타령', 5779, 5, 0, 1),
+(NULL, '털다', 5780, 5, 0, 1),
+(NULL, '테크', 5781, 5, 0, 1),
+(NULL, '토큰', 5782, 5, 0, 1),
+(NULL, '풀발', 5783, 5, 0, 1),
+(NULL, '피란', 5784, 5, 0, 1),
+(NULL, '하냥', 5785, 5, 0, 1),
+(NULL, '하드', 5786, 5, 0, 1),
+(NULL, '한글', 5787, 5, 0, 1),
+(NULL, '한시', 5788, 5, 0, 1),
+(NULL, '현질', 5789, 5, 0, 1),
+(NULL, '호프', 5790, 5, 0, 1),
+(NULL, '활개', 5791, 5, 0, 1),
+(NULL, '훨씬', 5792, 5, 0, 1),
+(NULL, '흩다', 5793, 5, 0, 1),
+(NULL, '가까이', 5794, 5, 0, 1),
+(NULL, '가래다', 5795, 5, 0, 1),
+(NULL, '가말다', 5796, 5, 0, 1),
+(NULL, '갈수록', 5797, 5, 0, 1),
+(NULL, '개고기', 5798, 5, 0, 1),
+(NULL, '개소주', 5799, 5, 0, 1),
+(NULL, '개슬람', 5800, 5, 0, 1),
+(NULL, '거꾸로', 5801, 5, 0, 1),
+(NULL, '거들다', 5802, 5, 0, 1),
+(NULL, '거르다', 5803, 5, 0, 1),
+(NULL, '거칠다', 5804, 5, 0, 1),
+(NULL, '걸치다', 5805, 5, 0, 1),
+(NULL, '겨누다', 5806, 5, 0, 1),
+(NULL, '겹받침', 5807, 5, 0, 1),
+(NULL, '고프다', 5808, 5, 0, 1),
+(NULL, '구리다', 5809, 5, 0, 1),
+(NULL, '그러면', 5810, 5, 0, 1),
+(NULL, '그림자', 5811, 5, 0, 1),
+(NULL, '그만큼', 5812, 5, 0, 1),
+(NULL, '깔깔이', 5813, 5, 0, 1),
+(NULL, '깜둥이', 5814, 5, 0, 1),
+(NULL, '꾸리다', 5815, 5, 0, 1),
+(NULL, '끝맺다', 5816, 5, 0, 1),
+(NULL, '나머지', 5817, 5, 0, 1),
+(NULL, '낱낱이', 5818, 5, 0, 1),
+(NULL, '눈싸움', 5819, 5, 0, 1),
+(NULL, '느끼다', 5820, 5, 0, 1),
+(NULL, '늦추다', 5821, 5, 0, 1),
+(NULL, '다물다', 5822, 5, 0, 1),
+(NULL, '다지다', 5823, 5, 0, 1),
+(NULL, '달마다', 5824, 5, 0, 1),
+(NULL, '달맞이', 5825, 5, 0, 1),
+(NULL, '대가리', 5826, 5, 0, 1),
+(NULL, '데띠기', 5827, 5, 0, 1),
+(NULL, '뒤집다', 5828, 5, 0, 1),
+(NULL, '들끓다', 5829, 5, 0, 1),
+(NULL, '떠돌다', 5830, 5, 0, 1),
+(NULL, '똥꼬충', 5831, 5, 0, 1),
+(NULL, '똥남아', 5832, 5, 0, 1),
+(NULL, '띠우다', 5833, 5, 0, 1),
+(NULL, '레전드', 5834, 5, 0, 1),
+(NULL, '마무리', 5835, 5, 0, 1),
+(NULL, '맞추다', 5836, 5, 0, 1),
+(NULL, '맨처음', 5837, 5, 0, 1),
+(NULL, '머금다', 5838, 5, 0, 1),
+(NULL, '메기다', 5839, 5, 0, 1),
+(NULL, '모닥불', 5840, 5, 0, 1),
+(NULL, '모르다', 5841, 5, 0, 1),
+(NULL, '모조리', 5842, 5, 0, 1),
+(NULL, '목구멍', 5843, 5, 0, 1),
+(NULL, '못하다', 5844, 5, 0, 1),
+(NULL, '바다말', 5845, 5, 0, 1),
+(NULL, '바라다', 5846, 5, 0, 1),
+(NULL, '받잡다', 5847, 5, 0, 1),
+(NULL, '밝히다', 5848, 5, 0, 1),
+(NULL, '밥그릇', 5849, 5, 0, 1),
+(NULL, '벼룻물', 5850, 5, 0, 1),
+(NULL, '부이온', 5851, 5, 0, 1),
+(NULL, '불장난', 5852, 5, 0, 1),
+(NULL, '빼들다', 5853, 5, 0, 1),
+(NULL, '빼앗다', 5854, 5, 0, 1),
+(NULL, '뻔하다', 5855, 5, 0, 1),
+(NULL, '사마귀', 5856, 5, 0, 1),
+(NULL, '살찌다', 5857, 5, 0, 1),
+(NULL, '소리꾼', 5858, 5, 0, 1),
+(NULL, '손님네', 5859, 5, 0, 1),
+(NULL, '쌍받침', 5860, 5, 0, 1),
+(NULL, '쌓이다', 5861, 5, 0, 1),
+(NULL, '아리새', 5862, 5, 0, 1),
+(NULL, '아쉽다', 5863, 5, 0, 1),
+(NULL, '악센트', 5864, 5, 0, 1),
+(NULL, '알갱이', 5865, 5, 0, 1),
+(NULL, '알차다', 5866, 5, 0, 1),
+(NULL, '애프터', 5867, 5, 0, 1),
+(NULL, '얄궂다', 5868, 5, 0, 1),
+(NULL, '여쭈다', 5869, 5, 0, 1),
+(NULL, '오지다', 5870, 5, 0, 1),
+(NULL, '올바로', 5871, 5, 0, 1),
+(NULL, '우비다', 5872, 5, 0, 1),
+(NULL, '웃기다', 5873, 5, 0, 1),
+(NULL, '위아래', 5874, 5, 0, 1),
+(NULL, '육개장', 5875, 5, 0, 1),
+(NULL, '으깨다', 5876, 5, 0, 1),
+(NULL, '이러다', 5877, 5, 0, 1),
+(NULL, '이루다', 5878, 5, 0, 1),
+(NULL, '익히다', 5879, 5, 0, 1),
+(NULL, '잔소리', 5880, 5, 0, 1),
+(NULL, '저만큼', 5881, 5, 0, 1),
+(NULL, '조르다', 5882, 5, 0, 1),
+(NULL, '지키다', 5883, 5, 0, 1),
+(NULL, '차이다', 5884, 5, 0, 1),
+(NULL, '켕기다', 5885, 5, 0, 1),
+(NULL, '큰무당', 5886, 5, 0, 1),
+(NULL, '털바퀴', 5887, 5, 0, 1),
+(NULL, '트로트', 5888, 5, 0, 1),
+(NULL, '풋사랑', 5889, 5, 0, 1),
+(NULL, '프락치', 5890, 5, 0, 1),
+(NULL, '피싸개', 5891, 5, 0, 1),
+(NULL, '한겨레', 5892, 5, 0, 1),
+(NULL, '한여름', 5893, 5, 0, 1),
+(NULL, '헛방귀', 5894, 5, 0, 1),
+(NULL, '현질러', 5895, 5, 0, 1),
+(NULL, '간직하다', 5896, 5, 0, 1),
+(NULL, '격파하다', 5897, 5, 0, 1),
+(NULL, '계집아이', 5898, 5, 0, 1),
+(NULL, '깨어나다', 5899, 5, 0, 1),
+(NULL, '노려보다', 5900, 5, 0, 1),
+(NULL, '대프리카', 5901, 5, 0, 1),
+(NULL, '돌투성이', 5902, 5, 0, 1),
+(NULL, '되돌리다', 5903, 5, 0, 1),
+(NULL, '땀투성이', 5904, 5, 0, 1),
+(NULL, '똑바르다', 5905, 5, 0, 1),
+(NULL, '러닝셔츠', 5906, 5, 0, 1),
+(NULL, '매끄럽다', 5907, 5, 0, 1),
+(NULL, '매달리다', 5908, 5, 0, 1),
+(NULL, '몽롱하다', 5909, 5, 0, 1),
+(NULL, '문어다리', 5910, 5, 0, 1),
+(NULL, '물러나다', 5911, 5, 0, 1),
+(NULL, '벌어지다', 5912, 5, 0, 1),
+(NULL, '변변하다', 5913, 5, 0, 1),
+(NULL, '부드럽다', 5914, 5, 0, 1),
+(NULL, '붕가붕가', 5915, 5, 0, 1),
+(NULL, '비약하다', 5916, 5, 0, 1),
+(NULL, '사로잡다', 5917, 5, 0, 1),
+(NULL, '사철나무', 5918, 5, 0, 1),
+(NULL, '상그랍다', 5919, 5, 0, 1),
+(NULL, '선보이다', 5920, 5, 0, 1),
+(NULL, '소리하다', 5921, 5, 0, 1),
+(NULL, '순박하다', 5922, 5, 0, 1),
+(NULL, '숨막히다', 5923, 5, 0, 1),
+(NULL, '슬퍼하다', 5924, 5, 0, 1),
+(NULL, '시꺼멓다', 5925, 5, 0, 1),
+(NULL, '씨뿌리다', 5926, 5, 0, 1),
+(NULL, '야댜하다', 5927, 5, 0, 1),
+(NULL, '어긋나다', 5928, 5, 0, 1),
+(NULL, '어엿하다', 5929, 5, 0, 1),
+(NULL, '열무김치', 5930, 5, 0, 1),
+(NULL, '오래간만', 5931, 5, 0, 1),
+(NULL, '오새없다', 5932, 5, 0, 1),
+(NULL, '우러르다', 5933, 5, 0, 1),
+(NULL, '울음소리', 5934, 5, 0, 1),
+(NULL, '웅크리다', 5935, 5, 0, 1),
+(NULL, '원만하다', 5936, 5, 0, 1),
+(NULL, '이리저리', 5937, 5, 0, 1),
+(NULL, '일러두기', 5938, 5, 0, 1),
+(NULL, '일천하다', 5939, 5, 0, 1),
+(NULL, '잘못하다', 5940, 5, 0, 1),
+(NULL, '주무르다', 5941, 5, 0, 1),
+(NULL, '찡그리다', 5942, 5, 0, 1),
+(NULL, '초췌하다', 5943, 5, 0, 1),
+(NULL, '촌스럽다', 5944, 5, 0, 1),
+(NULL, '털어놓다', 5945, 5, 0, 1),
+(NULL, '포근하다', 5946, 5, 0, 1),
+(NULL, '피투성이', 5947, 5, 0, 1),
+(NULL, '함께하다', 5948, 5, 0, 1),
+(NULL, '현질하다', 5949, 5, 0, 1),
+(NULL, '호연하다', 5950, 5, 0, 1),
+(NULL, '훈훈하다', 5951, 5, 0, 1),
+(NULL, '흘러가다', 5952, 5, 0, 1),
+(NULL, '흙투성이', 5953, 5, 0, 1),
+(NULL, '흩뿌리다', 5954, 5, 0, 1),
+(NULL, '눈꼴사납다', 5955, 5, 0, 1),
+(NULL, '먼지투성이', 5956, 5, 0, 1),
+(NULL, '스포당하다', 5957, 5, 0, 1),
+(NULL, '알랑거리다', 5958, 5, 0, 1),
+(NULL, '알아차리다', 5959, 5, 0, 1),
+(NULL, '우러러보다', 5960, 5, 0, 1),
+(NULL, '유명해지다', 5961, 5, 0, 1),
+(NULL, '짹짹거리다', 5962, 5, 0, 1),
+(NULL, '무자맥질하다', 5963, 5, 0, 1),
+('藥草學者', '약초학자', 5964, 4, 704, 1),
+('外人部隊', '외인부대', 5965, 4, 528, 1),
+('人工呼吸器', '인공호흡기', 5966, 4, 519, 1),
+('有名人', '유명인', 5967, 4, 470, 1),
+('司會者', '사회자', 5968, 4, 446, 1),
+('人事課', '인사과', 5969, 4, 445, 1),
+('文化語', '문화어', 5970, 4, 440, 1),
+('外人', '외인', 5971, 4, 431, 1),
+('人工降雨', '인공강우', 5972, 4, 428, 1),
+('一人', '일인', 5973, 4, 425, 1),
+('天地神明', '천지신명', 5974, 4, 420, 1),
+('語不成說', '어불성설', 5975, 4, 411, 1),
+('灰色分子', '회색분자', 5976, 4, 398, 1),
+('派生語', '파생어', 5977, 4, 384, 1),
+('地方自治', '지방자치', 5978, 4, 384, 1),
+('個人— ', '개인택시', 5979, 4, 381, 1),
+('國漢文', '국한문', 5980, 4, 378, 1),
+('個人技', '개인기', 5981, 4, 367, 1),
+('男性的', '남성적', 5982, 4, 363, 1),
+('學點', '학점', 5983, 4, 356, 1),
+('身體的', '신체적', 5984, 4, 355, 1),
+('識者', '식자', 5985, 4, 354, 1),
+('無所不知', '무소부지', 5986, 4, 351, 1),
+('恒溫動物', '항온동물', 5987, 4, 350, 1),
+('人件費', '인건비', 5988, 4, 348, 1),
+('他者', '타자', 5989, 4, 341, 1),
+('競技大會', '경기대회', 5990, 4, 338, 1),
+('肉體的', '육체적', 5991, 4, 337, 1),
+('他人', '타인', 5992, 4, 335, 1),
+('人의  帳', '인의 장막', 5993, 4, 334, 1),
+('無間地獄', '무간지옥', 5994, 4, 332, 1),
+('外來語', '외래어', 5995, 4, 331, 1),
+('懷中日記', '회중일기', 5996, 4, 330, 1),
+('倭人', '왜인', 5997, 4, 326, 1),
+('妖人', '요인', 5998, 4, 324, 1),
+('賤人', '천인', 5999, 4, 324, 1),
+('大河小說', '대하소설', 6000, 4, 320, 1),
+('自立名詞', '자립명사', 6001, 4, 318, 1),
+('子宮 內 裝置', '자궁 내 장치', 6002, 4, 316, 1),
+('目的格助詞', '목적격조사', 6003, 4, 315, 1),
+('流言蜚語', '유언비어', 6004, 4, 312, 1),
+('不協和音', '불협화음', 6005, 4, 307, 1),
+('正六面體', '정육면체', 6006, 4, 307, 1),
+('樂山樂水', '요산요수', 6007, 4, 300, 1),
+('上流社會', '상류사회', 6008, 4, 299, 1),
+('漢字語', '한자어', 6009, 4, 293, 1),
+('不知其數', '부지기수', 6010, 4, 286, 1),
+('譜學', '보학', 6011, 4, 285, 1),
+('生殖器', '생식기', 6012, 4, 285, 1),
+('心因性', '심인성', 6013, 4, 277, 1),
+('天主', '천주', 6014, 4, 269, 1),
+('宗敎的', '종교적', 6015, 4, 269, 1),
+('不敢請 固所願', '불감청 고소원', 6016, 4, 268, 1),
+('間接話法', '간접화법', 6017, 4, 265, 1),
+('小文字', '소문자', 6018, 4, 264, 1),
+('實業家', '실업가', 6019, 4, 261, 1),
+('平行線', '평행선', 6020, 4, 259, 1),
+('警音機', '경음기', 6021, 4, 253, 1),
+('中古品', '중고품', 6022, 4, 253, 1),
+('公的', '공적', 6023, 4, 251, 1),
+('管理所', '관리소', 6024, 4, 251, 1),
+('傳音器', '전음기', 6025, 4, 251, 1),
+('語彙場', '어휘장', 6026, 4, 250, 1),
+('自激之心', '자격지심', 6027, 4, 249, 1),
+('不治病', '불치병', 6028, 4, 247, 1),
+('水戰', '수전', 6029, 4, 245, 1),
+('不老不死', '불로불사', 6030, 4, 244, 1),
+('表題語', '표제어', 6031, 4, 242, 1),
+('私生兒', '사생아', 6032, 4, 240, 1),
+('生前', '생전', 6033, 4, 239, 1),
+('救國', '구국', 6034, 4, 238, 1),
+('土耳其語', '토이기어', 6035, 4, 238, 1),
+('軍事警察', '군사경찰', 6036, 4, 236, 1),
+('古語', '고어', 6037, 4, 235, 1),
+('制球力', '제구력', 6038, 4, 235, 1),
+('成功的', '성공적', 6039, 4, 231, 1),
+('家庭敎育', '가정교육', 6040, 4, 231, 1),
+('天道', '천도', 6041, 4, 230, 1),
+('義俠心', '의협심', 6042, 4, 230, 1),
+('一日', '일일', 6043, 4, 228, 1),
+('不正確', '부정확', 6044, 4, 228, 1),
+('先生님', '선생님', 6045, 4, 225, 1),
+('主部', '주부', 6046, 4, 222, 1),
+('惡性腫瘍', '악성종양', 6047, 4, 221, 1),
+('名實相符', '명실상부', 6048, 4, 220, 1),
+('享樂業所', '향락업소', 6049, 4, 220, 1),
+('住民登錄證', '주민등록증', 6050, 4, 219, 1),
+('天機', '천기', 6051, 4, 218, 1),
+('濕地帶', '습지대', 6052, 4, 218, 1),
+('食道', '식도', 6053, 4, 217, 1),
+('長音', '장음', 6054, 4, 216, 1),
+('漢語', '한어', 6055, 4, 216, 1),
+('骨子', '골자', 6056, 4, 215, 1),
+('名文', '명문', 6057, 4, 215, 1),
+('標準語', '표준어', 6058, 4, 215, 1),
+('同行', '동행', 6059, 4, 212, 1),
+('生得', '생득', 6060, 4, 212, 1),
+('動詞', '취재', 6061, 4, 212, 1),
+('音譯字', '음역자', 6062, 4, 212, 1),
+('生鮮膾', '생선회', 6063, 4, 211, 1),
+('寫生', '사생', 6064, 4, 210, 1),
+('處子', '처자', 6065, 4, 210, 1),
+('會社員', '회사원', 6066, 4, 210, 1),
+('重男輕女', '중남경녀', 6067, 4, 210, 1),
+('傳道師', '전도사', 6068, 4, 209, 1),
+('無心', '무심', 6069, 4, 207, 1),
+('義捐金', '의연금', 6070, 4, 207, 1),
+('放水', '방수', 6071, 4, 206, 1),
+('流星 暴風', '유성 폭풍', 6072, 4, 206, 1),
+('神機箭', '신기전', 6073, 4, 205, 1),
+('義勇軍', '의용군', 6074, 4, 205, 1),
+('男女老少', '남녀노소', 6075, 4, 205, 1),
+('器機', '기기', 6076, 4, 204, 1),
+('四聲音', '사성음', 6077, 4, 202, 1),
+('理容室', '이용실', 6078, 4, 202, 1),
+('通美封南', '통미봉남', 6079, 4, 202, 1),
+('氣合', '기합', 6080, 4, 201, 1),
+('性交', '성교', 6081, 4, 199, 1),
+('腸子', '창자', 6082, 4, 198, 1),
+('萬物', '만물', 6083, 4, 196, 1),
+('年數', '연수', 6084, 4, 196, 1),
+('行間', '행간', 6085, 4, 196, 1),
+('阿鼻地獄', '아비지옥', 6086, 4, 196, 1),
+('陰地', '음지', 6087, 4, 195, 1),
+('胎生', '태생', 6088, 4, 195, 1),
+('測力計', '측력계', 6089, 4, 193, 1),
+('有備無患', '유비무환', 6090, 4, 193, 1),
+('中古', '중고', 6091, 4, 191, 1),
+('不夜城', '불야성', 6092, 4, 190, 1),
+('流音', '유음', 6093, 4, 189, 1),
+('主演', '주연', 6094, 4, 188, 1),
+('假-', '가짜', 6095, 4, 187, 1),
+('震源地', '진원지', 6096, 4, 187, 1),
+('조개貫子', '조개관자', 6097, 4, 187, 1),
+('病氣', '병기', 6098, 4, 186, 1),
+('暴力團', '폭력단', 6099, 4, 186, 1),
+('正氣', '정기', 6100, 4, 185, 1),
+('正音', '정음', 6101, 4, 185, 1),
+('建築物', '건축물', 6102, 4, 185, 1),
+('美少女', '미소녀', 6103, 4, 184, 1),
+('貫子', '관자', 6104, 4, 183, 1),
+('赤地', '적지', 6105, 4, 183, 1),
+('微動', '미동', 6106, 4, 182, 1),
+('庶子', '서자', 6107, 4, 182, 1),
+('語弊', '어폐', 6108, 4, 182, 1),
+('進化', '진화', 6109, 4, 180, 1),
+('垓子', '해자', 6110, 4, 179, 1),
+('南北問題', '남북문제', 6111, 4, 179, 1),
+('起動', '기동', 6112, 4, 178, 1),
+('電光板', '전광판', 6113, 4, 178, 1),
+('法制', '법제', 6114, 4, 177, 1),
+('西道', '서도', 6115, 4, 177, 1),
+('駐屯地', '주둔지', 6116, 4, 174, 1),
+('強行', '강행', 6117, 4, 173, 1),
+('副總理', '부총리', 6118, 4, 173, 1),
+('法術', '법술', 6119, 4, 170, 1),
+('直行', '직행', 6120, 4, 169, 1),
+('無死', '무사', 6121, 4, 167, 1),
+('傳道', '전도', 6122, 4, 167, 1),
+('無時', '무시', 6123, 4, 166, 1),
+('幹部會', '간부회', 6124, 4, 166, 1),
+('家門', '가문', 6125, 4, 165, 1),
+('漿水', '장수', 6126, 4, 165, 1),
+('水稻', '수도', 6127, 4, 164, 1),
+('愛月', '애월', 6128, 4, 161, 1),
+('吸引力', '흡인력', 6129, 4, 160, 1),
+('海溢警報', '해일경보', 6130, 4, 160, 1),
+('分別', '분별', 6131, 4, 159, 1),
+('死石', '사석', 6132, 4, 159, 1),
+('修道', '수도', 6133, 4, 159, 1),
+('搏動', '박동', 6134, 4, 156, 1),
+('染化', '염화', 6135, 4, 156, 1),
+('外傳', '외전', 6136, 4, 155, 1),
+('亂理', '난리', 6137, 4, 154, 1),
+('數式', '수식', 6138, 4, 153, 1),
+('有無', '유무', 6139, 4, 153, 1),
+('外來', '외래', 6140, 4, 152, 1),
+('中止', '중지', 6141, 4, 151, 1),
+('形容詞', '형용사', 6142, 4, 150, 1),
+('腰方形筋', '요방형근', 6143, 4, 150, 1),
+('不滅', '불멸', 6144, 4, 149, 1),
+('非道', '비도', 6145, 4, 148, 1),
+('集配員', '집배원', 6146, 4, 147, 1),
+('獄中', '옥중', 6147, 4, 146, 1),
+('自決', '자결', 6148, 4, 146, 1),
+('正字', '정자', 6149, 4, 146, 1),
+('中庭', '중정', 6150, 4, 145, 1),
+('指事', '지사', 6151, 4, 145, 1),
+('盡終日', '진종일', 6152, 4, 145, 1),
+('長斫— ', '장작개비', 6153, 4, 145, 1),
+('胴體', '동체', 6154, 4, 144, 1),
+('蛇行', '사행', 6155, 4, 144, 1),
+('敍事詩', '서사시', 6156, 4, 144, 1),
+('身邊雜記', '신변잡기', 6157, 4, 144, 1),
+('筋力', '근력', 6158, 4, 143, 1),
+('電光', '전광', 6159, 4, 143, 1),
+('同床異夢', '동상이몽', 6160, 4, 142, 1),
+('文型', '문형', 6161, 4, 141, 1),
+('所員', '소원', 6162, 4, 141, 1),
+('赤血球', '적혈구', 6163, 4, 140, 1),
+('短音', '단음', 6164, 4, 139, 1),
+('定員', '정원', 6165, 4, 139, 1),
+('五種樂', '오종락', 6166, 4, 138, 1),
+('食管', '식관', 6167, 4, 137, 1),
+('跛行', '파행', 6168, 4, 137, 1),
+('元氣', '원기', 6169, 4, 136, 1),
+('有用', '유용', 6170, 4, 136, 1),
+('天然', '천연', 6171, 4, 136, 1),
+('未備點', '미비점', 6172, 4, 136, 1),
+('名曲', '명곡', 6173, 4, 134, 1),
+('親近感', '친근감', 6174, 4, 134, 1),
+('異名', '이명', 6175, 4, 133, 1),
+('自慰', '자위', 6176, 4, 133, 1),
+('二八靑春', '이팔청춘', 6177, 4, 132, 1),
+('土器', '토기', 6178, 4, 131, 1),
+('皮下組織', '피하조직', 6179, 4, 131, 1),
+('所重', '소중', 6180, 4, 130, 1),
+('底力', '저력', 6181, 4, 130, 1),
+('小品', '소품', 6182, 4, 129, 1),
+('忠誠心', '충성심', 6183, 4, 129, 1),
+('慶事', '경사', 6184, 4, 128, 1),
+('釋義', '석의', 6185, 4, 128, 1),
+('記念館', '기념관', 6186, 4, 127, 1),
+('了義', '요의', 6187, 4, 126, 1),
+('頸長筋', '경장근', 6188, 4, 126, 1),
+('演習場', '연습장', 6189, 4, 126, 1),
+('上聲', '상성', 6190, 4, 125, 1),
+('定式', '정식', 6191, 4, 125, 1),
+('舊約聖經', '구약성경', 6192, 4, 125, 1),
+('新兵', '신병', 6193, 4, 124, 1),
+('改詞曲', '개사곡', 6194, 4, 124, 1),
+('死期', '사기', 6195, 4, 123, 1),
+('緣分', '연분', 6196, 4, 123, 1),
+('天敵', '천적', 6197, 4, 123, 1),
+('假名', '가명', 6198, 4, 122, 1),
+('古記', '고기', 6199, 4, 122, 1),
+('密會', '밀회', 6200, 4, 122, 1),
+('皇天', '황천', 6201, 4, 122, 1),
+('忘機', '망기', 6202, 4, 121, 1),
+('違和感', '위화감', 6203, 4, 121, 1),
+('靑酸加里', '청산가리', 6204, 4, 121, 1),
+('七轉八起', '칠전팔기', 6205, 4, 121, 1),
+('手當', '수당', 6206, 4, 120, 1),
+('組長', '조장', 6207, 4, 120, 1),
+('識字憂患', '식자우환', 6208, 4, 120, 1),
+('無限', '무한', 6209, 4, 119, 1),
+('民志', '민지', 6210, 4, 119, 1),
+('鷄卵有骨', '계란유골', 6211, 4, 118, 1),
+('公務', '공무', 6212, 4, 117, 1),
+('神靈', '신령', 6213, 4, 117, 1),
+('心裏', '심리', 6214, 4, 117, 1),
+('決死擁衛', '결사옹위', 6215, 4, 117, 1),
+('轟音', '굉음', 6216, 4, 116, 1),
+('民智', '민지', 6217, 4, 116, 1),
+('張數', '장수', 6218, 4, 116, 1),
+('假面劇', '가면극', 6219, 4, 116, 1),
+('殺風景', '살풍경', 6220, 4, 116, 1),
+('進軍', '진군', 6221, 4, 115, 1),
+('春色', '춘색', 6222, 4, 115, 1),
+('下野', '하야', 6223, 4, 115, 1),
+('舞女', '무녀', 6224, 4, 114, 1),
+('合黨', '합당', 6225, 4, 113, 1),
+('彈藥庫', '탄약고', 6226, 4, 113, 1),
+('錦繡江山', '금수강산', 6227, 4, 113, 1),
+('內應', '내응', 6228, 4, 112, 1),
+('上製', '상제', 6229, 4, 112, 1),
+('荒唐無稽', '황당무계', 6230, 4, 112, 1),
+('工房', '공방', 6231, 4, 111, 1),
+('宮合', '궁합', 6232, 4, 111, 1),
+('資金', '자금', 6233, 4, 111, 1),
+('無始', '무시', 6234, 4, 110, 1),
+('數値', '수치', 6235, 4, 110, 1),
+('長篇', '장편', 6236, 4, 110, 1),
+('破本', '파본', 6237, 4, 110, 1),
+('布敎', '포교', 6238, 4, 110, 1),
+('江山', '강산', 6239, 4, 109, 1),
+('名唱', '명창', 6240, 4, 109, 1),
+('老死', '노사', 6241, 4, 108, 1),
+('對症', '대증', 6242, 4, 108, 1),
+('前方', '전방', 6243, 4, 108, 1),
+('黑業', '흑업', 6244, 4, 108, 1),
+('額面價', '액면가', 6245, 4, 108, 1),
+('黎民', '려민', 6246, 4, 107, 1),
+('黎民', '여민', 6247, 4, 107, 1),
+('一齊', '일제', 6248, 4, 107, 1),
+('相見禮', '상견례', 6249, 4, 107, 1),
+('稀貴本', '희귀본', 6250, 4, 107, 1),
+('官兵', '관병', 6251, 4, 106, 1),
+('起業', '기업', 6252, 4, 106, 1),
+('寫本', '사본', 6253, 4, 106, 1),
+('一切', '일체', 6254, 4, 106, 1),
+('直感', '직감', 6255, 4, 106, 1),
+('레토르트  食', '레토르트 식품', 6256, 4, 106, 1),
+('偏食', '편식', 6257, 4, 105, 1),
+('近代', '근대', 6258, 4, 104, 1),
+('玉石', '옥석', 6259, 4, 104, 1),
+('平聲', '평성', 6260, 4, 104, 1),
+('햇數', '햇수', 6261, 4, 104, 1),
+('雜交配', '자고배', 6262, 4, 104, 1),
+('內務', '내무', 6263, 4, 103, 1),
+('勝戰', '승전', 6264, 4, 103, 1),
+('最愛', '최애', 6265, 4, 103, 1),
+('厭世觀', '염세관', 6266, 4, 103, 1),
+('美辭麗句', '미사여구', 6267, 4, 103, 1),
+('纖纖玉手', '섬섬옥수', 6268, 4, 103, 1),
+('敎皇', '교황', 6269, 4, 102, 1),
+('原來', '원래', 6270, 4, 102, 1),
+('姓名', '성명', 6271, 4, 101, 1),
+('應對', '응대', 6272, 4, 101, 1),
+('戰端', '전단', 6273, 4, 100, 1),
+('緩衝器', '완충기', 6274, 4, 100, 1),
+('極樂', '극락', 6275, 4, 99, 1),
+('設定', '설정', 6276, 4, 99, 1),
+('俗字', '속자', 6277, 4, 99, 1),
+('戰局', '전국', 6278, 4, 99, 1),
+('平野', '평야', 6279, 4, 99, 1),
+('話頭', '화두', 6280, 4, 99, 1),
+('藝術界', '예술계', 6281, 4, 99, 1),
+('軍番', '군번', 6282, 4, 98, 1),
+('宣敎', '선교', 6283, 4, 98, 1),
+('選球', '선구', 6284, 4, 98, 1),
+('藥草', '약초', 6285, 4, 98, 1),
+('初面', '초면', 6286, 4, 98, 1),
+('執權黨', '집권당', 6287, 4, 98, 1),
+('拍手喝采', '박수갈채', 6288, 4, 98, 1),
+('私利私慾', '사리사욕', 6289, 4, 98, 1),
+('每月', '매월', 6290, 4, 97, 1),
+('名簿', '명부', 6291, 4, 97, 1),
+('樂曲', '악곡', 6292, 4, 97, 1),
+('登山', '등산', 6293, 4, 96, 1),
+('山川', '산천', 6294, 4, 95, 1),
+('神鈴', '신령', 6295, 4, 95, 1),
+('食醢', '식해', 6296, 4, 94, 1),
+('十惡', '십악', 6297, 4, 94, 1),
+('親權', '친권', 6298, 4, 94, 1),
+('監査官', '감사관', 6299, 4, 94, 1),
+('敵軍', '적군', 6300, 4, 93, 1),
+('海苔', '해태', 6301, 4, 93, 1),
+('治療劑', '치료제', 6302, 4, 93, 1),
+('邪敎', '사교', 6303, 4, 92, 1),
+('五樂', '오락', 6304, 4, 92, 1),
+('形象', '형상', 6305, 4, 92, 1),
+('萬有', '만유', 6306, 4, 91, 1),
+('常樂', '상락', 6307, 4, 91, 1),
+('次愛', '차애', 6308, 4, 91, 1),
+('特有', '특유', 6309, 4, 91, 1),
+('交接', '교접', 6310, 4, 90, 1),
+('同窓', '동창', 6311, 4, 90, 1),
+('浮上', '부상', 6312, 4, 90, 1),
+('隱身處', '은신처', 6313, 4, 90, 1),
+('通稱', '통칭', 6314, 4, 88, 1),
+('太極拳', '태극권', 6315, 4, 88, 1),
+('金', '금', 6316, 4, 87, 1),
+('士族', '사족', 6317, 4, 87, 1),
+('定額', '정액', 6318, 4, 86, 1),
+('持病', '지병', 6319, 4, 86, 1),
+('混血兒', '혼혈아', 6320, 4, 86, 1),
+('病歷', '병력', 6321, 4, 85, 1),
+('勸善懲惡', '권선징악', 6322, 4, 85, 1),
+('必殺技', '필살기', 6323, 4, 83, 1),
+('百方', '백방', 6324, 4, 82, 1),
+('通達', '통달', 6325, 4, 82, 1),
+('魔球', '마구', 6326, 4, 81, 1),
+('回信', '회신', 6327, 4, 81, 1),
+('惡影響', '악영향', 6328, 4, 81, 1),
+('詞華', '사화', 6329, 4, 80, 1),
+('應報', '응보', 6330, 4, 80, 1),
+('調劑', '조제', 6331, 4, 80, 1),
+('通禁', '통금', 6332, 4, 80, 1),
+('區間', '구간', 6333, 4, 79, 1),
+('明暗', '명암', 6334, 4, 79, 1),
+('暗順應', '암순응', 6335, 4, 79, 1),
+('歡呼聲', '환호성', 6336, 4, 79, 1),
+('抑強扶弱', '억강부약', 6337, 4, 79, 1),
+('看病', '간병', 6338, 4, 78, 1),
+('客室', '객실', 6339, 4, 78, 1),
+('高帽', '고모', 6340, 4, 78, 1),
+('高批', '고비', 6341, 4, 78, 1),
+('무게感', '무게감', 6342, 4, 78, 1),
+('草果', '초과', 6343, 4, 77, 1),
+('解止', '해지', 6344, 4, 77, 1),
+('甘露酒', '감로주', 6345, 4, 77, 1),
+('反響', '반향', 6346, 4, 76, 1),
+('小屋', '소옥', 6347, 4, 76, 1),
+('調製', '조제', 6348, 4, 76, 1),
+('通刺', '통자', 6349, 4, 76, 1),
+('番號版', '번호판', 6350, 4, 76, 1),
+('成德', '성덕', 6351, 4, 75, 1),
+('式辭', '식사', 6352, 4, 75, 1),
+('獻詞', '헌사', 6353, 4, 75, 1),
+('血脈', '혈맥', 6354, 4, 75, 1),
+('雜穀—', '잡곡밥', 6355, 4, 75, 1),
+('渴愛', '갈애', 6356, 4, 73, 1),
+('歐美', '구미', 6357, 4, 73, 1),
+('正말', '정말', 6358, 4, 73, 1),
+('特異', '특이', 6359, 4, 73, 1),
+('碧空', '벽공', 6360, 4, 72, 1),
+('夭死', '요사', 6361, 4, 72, 1),
+('應然', '응연', 6362, 4, 72, 1),
+('贊反', '찬반', 6363, 4, 72, 1),
+('最善策', '최선책', 6364, 4, 72, 1),
+('賣店', '매점', 6365, 4, 71, 1),
+('先約', '선약', 6366, 4, 71, 1),
+('時艱', '시간', 6367, 4, 71, 1),
+('連投', '연투', 6368, 4, 71, 1),
+('熱辯', '열변', 6369, 4, 71, 1),
+('淸凉劑', '청량제', 6370, 4, 71, 1),
+('去聲', '거성', 6371, 4, 70, 1),
+('科客', '과객', 6372, 4, 69, 1),
+('間歇泉', '간헐천', 6373, 4, 69, 1),
+('過客', '과객', 6374, 4, 68, 1),
+('母胎', '모태', 6375, 4, 68, 1),
+('程式', '정식', 6376, 4, 68, 1),
+('鄕樂', '향악', 6377, 4, 68, 1),
+('後孫', '후손', 6378, 4, 68, 1),
+('斷念', '단념', 6379, 4, 67, 1),
+('密室', '밀실', 6380, 4, 67, 1),
+('越北', '월북', 6381, 4, 67, 1),
+('柱頭', '주두', 6382, 4, 67, 1),
+('巫樂', '무악', 6383, 4, 66, 1),
+('始期', '시기', 6384, 4, 66, 1),
+('惡鬼', '악귀', 6385, 4, 66, 1),
+('草露', '초로', 6386, 4, 66, 1),
+('不安', '불안', 6387, 4, 65, 1),
+('重懲戒', '중징계', 6388, 4, 65, 1),
+('去來', '거래', 6389, 4, 64, 1),
+('工廠', '공창', 6390, 4, 64, 1),
+('薄明', '박명', 6391, 4, 64, 1),
+('階級章', '계급장', 6392, 4, 64, 1),
+('留保', '유보', 6393, 4, 63, 1),
+('倦怠期', '권태기', 6394, 4, 63, 1),
+('禁忌視', '금기시', 6395, 4, 63, 1),
+('起酒떡', '기주떡', 6396, 4, 63, 1),
+('西曆', '서력', 6397, 4, 62, 1),
+('藝能', '예능', 6398, 4, 62, 1),
+('豫習', '예습', 6399, 4, 62, 1),
+('砲臺', '포대', 6400, 4, 62, 1),
+('藥疹', '약진', 6401, 4, 61, 1),
+('間隙', '간극', 6402, 4, 60, 1),
+('陰陽', '음양', 6403, 4, 60, 1),
+('策應', '책응', 6404, 4, 60, 1),
+('螢光', '형광', 6405, 4, 60, 1),
+('次善策', '차선책', 6406, 4, 60, 1),
+('部', '부', 6407, 4, 59, 1),
+('輕視', '경시', 6408, 4, 59, 1),
+('燈—', '등불', 6409, 4, 59, 1),
+('亡身', '망신', 6410, 4, 59, 1),
+('漫畫冊', '만화책', 6411, 4, 59, 1),
+('富貴榮華', '부귀영화', 6412, 4, 59, 1),
+('塞翁之馬', '새옹지마', 6413, 4, 59, 1),
+('梅花', '매화', 6414, 4, 58, 1),
+('螺角', '나각', 6415, 4, 57, 1),
+('與野', '여야', 6416, 4, 57, 1),
+('銃殺', '총살', 6417, 4, 57, 1),
+('特使', '특사', 6418, 4, 57, 1),
+('—桶 ', '기름통', 6419, 4, 57, 1),
+('有', '유', 6420, 4, 56, 1),
+('降板', '강판', 6421, 4, 56, 1),
+('結氷', '결빙', 6422, 4, 56, 1),
+('望旗', '망기', 6423, 4, 56, 1),
+('二衆', '이중', 6424, 4, 55, 1),
+('轉注', '전주', 6425, 4, 55, 1),
+('週報', '주보', 6426, 4, 55, 1),
+('魂飛魄散', '혼비백산', 6427, 4, 55, 1),
+('遠來', '원래', 6428, 4, 54, 1),
+('九節坂', '구절판', 6429, 4, 54, 1),
+('雜商', '잡상', 6430, 4, 53, 1),
+('增便', '증편', 6431, 4, 53, 1),
+('向路', '향로', 6432, 4, 53, 1),
+('棊士', '기사', 6433, 4, 52, 1),
+('守護', '수호', 6434, 4, 52, 1),
+('葉脈', '엽맥', 6435, 4, 52, 1),
+('暴走', '폭주', 6436, 4, 51, 1),
+('皇族', '황족', 6437, 4, 51, 1),
+('苦受', '고수', 6438, 4, 50, 1),
+('交椅', '교의', 6439, 4, 50, 1),
+('擔保', '담보', 6440, 4, 50, 1),
+('据置臺', '거치대', 6441, 4, 50, 1),
+('突然', '돌연', 6442, 4, 49, 1),
+('要件', '요건', 6443, 4, 48, 1),
+('檢察', '검찰', 6444, 4, 47, 1),
+('樓船', '누선', 6445, 4, 47, 1),
+('東峽', '동협', 6446, 4, 47, 1),
+('眞如', '진여', 6447, 4, 47, 1),
+('泉路', '천로', 6448, 4, 47, 1),
+('招來', '초래', 6449, 4, 47, 1),
+('甘味롭다', '감미롭다', 6450, 4, 47, 1),
+('答狀', '답장', 6451, 4, 46, 1),
+('漫畫', '만화', 6452, 4, 46, 1),
+('鰐魚', '악어', 6453, 4, 46, 1),
+('暗香', '암향', 6454, 4, 46, 1),
+('肢帶', '지대', 6455, 4, 46, 1),
+('看過', '간과', 6456, 4, 45, 1),
+('強奪', '강탈', 6457, 4, 45, 1),
+('洋屋', '양옥', 6458, 4, 45, 1),
+('春畵', '춘화', 6459, 4, 45, 1),
+('八旬', '팔순', 6460, 4, 45, 1),
+('恝視', '괄시', 6461, 4, 44, 1),
+('農舞', '농무', 6462, 4, 44, 1),
+('冶說', '야설', 6463, 4, 44, 1),
+('元首', '원수', 6464, 4, 44, 1),
+('雜談', '잡담', 6465, 4, 44, 1),
+('甘受', '감수', 6466, 4, 43, 1),
+('連結', '연결', 6467, 4, 43, 1),
+('監守', '감수', 6468, 4, 42, 1),
+('島司', '도사', 6469, 4, 42, 1),
+('聖殿', '성전', 6470, 4, 42, 1),
+('躍進', '약진', 6471, 4, 42, 1),
+('御射', '어사', 6472, 4, 42, 1),
+('障害', '장해', 6473, 4, 42, 1),
+('造詣', '조예', 6474, 4, 42, 1),
+('濁酒', '탁주', 6475, 4, 42, 1),
+('八卦', '팔괘', 6476, 4, 42, 1),
+('獻辭', '헌사', 6477, 4, 42, 1),
+('曰可曰否', '왈가왈부', 6478, 4, 42, 1),
+('說', '설', 6479, 4, 41, 1),
+('韓', '한', 6480, 4, 41, 1),
+('藁草', '고초', 6481, 4, 41, 1),
+('苦待', '고대', 6482, 4, 40, 1),
+('未練', '미련', 6483, 4, 40, 1),
+('富農', '부농', 6484, 4, 40, 1),
+('沃土', '옥토', 6485, 4, 40, 1),
+('住持', '주지', 6486, 4, 40, 1),
+('參席', '참석', 6487, 4, 40, 1),
+('許婚', '허혼', 6488, 4, 40, 1),
+('好評', '호평', 6489, 4, 40, 1),
+('甘露', '감로', 6490, 4, 39, 1),
+('騰落', '등락', 6491, 4, 39, 1),
+('急傾斜', '급경사', 6492, 4, 39, 1),
+('默念', '묵념', 6493, 4, 38, 1),
+('渴望', '갈망', 6494, 4, 37, 1),
+('檢診', '검진', 6495, 4, 37, 1),
+('堅城', '견성', 6496, 4, 37, 1),
+('落薦', '낙천', 6497, 4, 37, 1),
+('渡江', '도강', 6498, 4, 37, 1),
+('射侯', '사후', 6499, 4, 37, 1),
+('消沈', '소침', 6500, 4, 37, 1),
+('念慮', '염려', 6501, 4, 37, 1),
+('五欲', '오욕', 6502, 4, 37, 1),
+('欲望', '욕망', 6503, 4, 37, 1),
+('朝貢', '조공', 6504, 4, 37, 1),
+('黃泉', '황천', 6505, 4, 37, 1),
+('散步', '산보', 6506, 4, 36, 1),
+('守志', '수지', 6507, 4, 36, 1),
+('幻肢痛', '환지통', 6508, 4, 36, 1),
+('挽回', '만회', 6509, 4, 35, 1),
+('址臺', '지대', 6510, 4, 35, 1),
+('規律', '규률', 6511, 4, 34, 1),
+('規律', '규율', 6512, 4, 34, 1),
+('納得', '납득', 6513, 4, 34, 1),
+('閻羅', '염라', 6514, 4, 34, 1),
+('五蘊', '오온', 6515, 4, 34, 1),
+('擁護', '옹호', 6516, 4, 34, 1),
+('寂然', '적연', 6517, 4, 34, 1),
+('불常놈', '불상놈', 6518, 4, 34, 1),
+('格', '격', 6519, 4, 33, 1),
+('武臣', '무신', 6520, 4, 33, 1),
+('支撐', '지탱', 6521, 4, 33, 1),
+('悖習', '패습', 6522, 4, 32, 1),
+('漫談', '만담', 6523, 4, 31, 1),
+('妄靈', '망령', 6524, 4, 31, 1),
+('夜叉', '야차', 6525, 4, 31, 1),
+('妊婦', '임부', 6526, 4, 31, 1),
+('稟告', '품고', 6527, 4, 31, 1),
+('檢札', '검찰', 6528, 4, 29, 1),
+('給與', '급여', 6529, 4, 29, 1),
+('勞賃', '노임', 6530, 4, 29, 1),
+('挾擊', '협격', 6531, 4, 29, 1),
+('甲질', '갑질', 6532, 4, 28, 1),
+('富貴', '부귀', 6533, 4, 28, 1),
+('賤稱', '천칭', 6534, 4, 28, 1),
+('肉', '육', 6535, 4, 27, 1),
+('假짜', '가짜', 6536, 4, 27, 1),
+('冷酷', '냉혹', 6537, 4, 27, 1),
+('島夷', '도이', 6538, 4, 27, 1),
+('封建', '봉건', 6539, 4, 27, 1),
+('甲', '갑', 6540, 4, 26, 1),
+('降臨', '강림', 6541, 4, 26, 1),
+('薇菜', '미채', 6542, 4, 26, 1),
+('補綴', '보철', 6543, 4, 26, 1),
+('良辰', '양신', 6544, 4, 26, 1),
+('孕婦', '잉부', 6545, 4, 26, 1),
+('壯談', '장담', 6546, 4, 26, 1),
+('布袋', '포대', 6547, 4, 26, 1),
+('갈비湯', '갈비탕', 6548, 4, 26, 1),
+('頂수리', '정수리', 6549, 4, 25, 1),
+('沙彌', '사미', 6550, 4, 24, 1),
+('沙錫', '사석', 6551, 4, 24, 1),
+('煙霧', '연무', 6552, 4, 24, 1),
+('輪廓', '윤곽', 6553, 4, 24, 1),
+('蟲豸', '충치', 6554, 4, 24, 1),
+('嘆願', '탄원', 6555, 4, 24, 1),
+('華麗', '화려', 6556, 4, 24, 1),
+('延伸', '연신', 6557, 4, 23, 1),
+('弔祭', '조제', 6558, 4, 23, 1),
+('俗', '속', 6559, 4, 22, 1),
+('隔週', '격주', 6560, 4, 22, 1),
+('秋播', '추파', 6561, 4, 22, 1),
+('彌留', '미류', 6562, 4, 21, 1),
+('輪扇', '윤선', 6563, 4, 21, 1),
+('剩餘', '잉여', 6564, 4, 21, 1),
+('縱橫', '종횡', 6565, 4, 21, 1),
+('檀紀', '단기', 6566, 4, 20, 1),
+('追慕', '추모', 6567, 4, 20, 1),
+('崇敬', '숭경', 6568, 4, 19, 1),
+('終熄', '종식', 6569, 4, 19, 1),
+('遲刻', '지각', 6570, 4, 19, 1),
+('疾患', '질환', 6571, 4, 19, 1),
+('川獵', '천렵', 6572, 4, 19, 1),
+('端', '단', 6573, 4, 18, 1),
+('牧笛', '목적', 6574, 4, 18, 1),
+('媤宅', '새댁', 6575, 4, 18, 1),
+('招魂', '초혼', 6576, 4, 18, 1),
+('洞燭', '통촉', 6577, 4, 18, 1),
+('思惟', '사유', 6578, 4, 16, 1),
+('紫朱', '자주', 6579, 4, 16, 1),
+('千仞', '천인', 6580, 4, 16, 1),
+('畜舍', '축사', 6581, 4, 16, 1),
+('朱螺', '주라', 6582, 4, 15, 1),
+('刑', '형', 6583, 4, 14, 1),
+('連絡', '연락', 6584, 4, 14, 1),
+('片鱗', '편린', 6585, 4, 14, 1),
+('賢愚', '현우', 6586, 4, 14, 1),
+('恭敬', '공경', 6587, 4, 13, 1),
+('如如', '여여', 6588, 4, 13, 1),
+('脊梁', '척량', 6589, 4, 13, 1),
+('干戈', '간과', 6590, 4, 12, 1),
+('腹柄', '복병', 6591, 4, 12, 1),
+('勇猛', '용맹', 6592, 4, 12, 1),
+('村년', '촌년', 6593, 4, 12, 1),
+('包袋', '포대', 6594, 4, 12, 1),
+('更迭', '경질', 6595, 4, 11, 1),
+('諺簡', '언간', 6596, 4, 11, 1),
+('叡智', '예지', 6597, 4, 11, 1),
+('兄님', '형님', 6598, 4, 11, 1),
+('恐喝', '공갈', 6599, 4, 10, 1),
+('幅巾', '복건', 6600, 4, 10, 1),
+('呈才', '정재', 6601, 4, 10, 1),
+('銅', '동', 6602, 4, 9, 1),
+('髓', '수', 6603, 4, 9, 1),
+('念慮', '염려', 6604, 4, 9, 1),
+('倭寇', '왜구', 6605, 4, 9, 1),
+('昇遐', '승하', 6606, 4, 8, 1),
+('朱喇', '주라', 6607, 4, 8, 1),
+('昏絕', '혼절', 6608, 4, 8, 1),
+('偉勳', '위훈', 6609, 4, 7, 1),
+('賤妓', '천기', 6610, 4, 7, 1),
+('熾烈', '치열', 6611, 4, 7, 1),
+('驕慢', '교만', 6612, 4, 6, 1),
+('禱祀', '도사', 6613, 4, 6, 1),
+('窟', '굴', 6614, 4, 5, 1),
+('燕岐', '연기', 6615, 4, 5, 1),
+('癡', '치', 6616, 4, 4, 1),
+('등沐', '등목', 6617, 4, 4, 1),
+('吹𠼱', '주라', 6618, 4, 4, 1),
+('鳳', '봉', 6619, 4, 3, 1),
+('冶', '야', 6620, 4, 3, 1),
+('淘汰', '도태', 6621, 4, 3, 1),
+('霹靂', '벽력', 6622, 4, 3, 1),
+('疏忽', '소홀', 6623, 4, 3, 1),
+('僻', '벽', 6624, 4, 2, 1),
+('股腓', '고비', 6625, 4, 2, 1),
+('撫綏', '무수', 6626, 4, 2, 1),
+('啞啞', '아아', 6627, 4, 2, 1),
+('顚覆', '전복', 6628, 4, 2, 1),
+('遼', '요', 6629, 4, 1, 1),
+('鄭', '정', 6630, 4, 1, 1),
+('瓣', '판', 6631, 4, 1, 1),
+(NULL, '감', 6632, 4, 0, 1),
+(NULL, '겨', 6633, 4, 0, 1),
+('絹', '견', 6634, 4, 0, 1),
+(NULL, '곤', 6635, 4, 0, 1),
+(NULL, '공', 6636, 4, 0, 1),
+(NULL, '꽃', 6637, 4, 0, 1),
+(NULL, '꽹', 6638, 4, 0, 1),
+(NULL, '덩', 6639, 4, 0, 1),
+(NULL, '띠', 6640, 4, 0, 1),
+(NULL, '랩', 6641, 4, 0, 1),
+(NULL, '맘', 6642, 4, 0, 1),
+(NULL, '맨', 6643, 4, 0, 1),
+(NULL, '몰', 6644, 4, 0, 1),
+(NULL, '밥', 6645, 4, 0, 1),
+('榜', '방', 6646, 4, 0, 1),
+(NULL, '볕', 6647, 4, 0, 1),
+(NULL, '봄', 6648, 4, 0, 1),
+(NULL, '뵘', 6649, 4, 0, 1),
+(NULL, '북', 6650, 4, 0, 1),
+(NULL, '뿔', 6651, 4, 0, 1),
+(NULL, '솥', 6652, 4, 0, 1),
+(NULL, '숯', 6653, 4, 0, 1),
+(NULL, '쉬', 6654, 4, 0, 1),
+(NULL, '슴', 6655, 4, 0, 1),
+(NULL, '실', 6656, 4, 0, 1),
+(NULL, '싹', 6657, 4, 0, 1),
+(NULL, '쌈', 6658, 4, 0, 1),
+(NULL, '썰', 6659, 4, 0, 1),
+(NULL, '알', 6660, 4, 0, 1),
+(NULL, '앎', 6661, 4, 0, 1),
+(NULL, '엿', 6662, 4, 0, 1),
+('濊', '예', 6663, 4, 0, 1),
+(NULL, '왜', 6664, 4, 0, 1),
+(NULL, '요', 6665, 4, 0, 1),
+('堯', '요', 6666, 4, 0, 1),
+(NULL, '우', 6667, 4, 0, 1),
+(NULL, '위', 6668, 4, 0, 1),
+('尹', '윤', 6669, 4, 0, 1),
+(NULL, '재', 6670, 4, 0, 1),
+(NULL, '젖', 6671, 4, 0, 1),
+(NULL, '쥐', 6672, 4, 0, 1),
+('帙', '질', 6673, 4, 0, 1),
+(NULL, '쪽', 6674, 4, 0, 1),
+(NULL, '척', 6675, 4, 0, 1),
+(NULL, '철', 6676, 4, 0, 1),
+(NULL, '칡', 6677, 4, 0, 1),
+(NULL, '털', 6678, 4, 0, 1),
+(NULL, '팍', 6679, 4, 0, 1),
+(NULL, '팜', 6680, 4, 0, 1),
+(NULL, '폰', 6681, 4, 0, 1),
+(NULL, '허', 6682, 4, 0, 1),
+(NULL, '홈', 6683, 4, 0, 1),
+(NULL, '흙', 6684, 4, 0, 1),
+(NULL, '今方', 6685, 4, 0, 1),
+(NULL, '眞짜', 6686, 4, 0, 1),
+(NULL, '突然', 6687, 4, 0, 1),
+(NULL, '가락', 6688, 4, 0, 1),
+(NULL, '가새', 6689, 4, 0, 1),
+(NULL, '갈이', 6690, 4, 0, 1),
+(NULL, '감다', 6691, 4, 0, 1),
+(NULL, '개미', 6692, 4, 0, 1),
+(NULL, '거지', 6693, 4, 0, 1),
+(NULL, '검스', 6694, 4, 0, 1),
+(NULL, '겨를', 6695, 4, 0, 1),
+(NULL, '경각', 6696, 4, 0, 1),
+(NULL, '고래', 6697, 4, 0, 1),
+(NULL, '고물', 6698, 4, 0, 1),
+(NULL, '골인', 6699, 4, 0, 1),
+(NULL, '곱사', 6700, 4, 0, 1),
+(NULL, '과팅', 6701, 4, 0, 1),
+(NULL, '괴다', 6702, 4, 0, 1),
+(NULL, '구실', 6703, 4, 0, 1),
+(NULL, '구완', 6704, 4, 0, 1),
+(NULL, '굴비', 6705, 4, 0, 1),
+(NULL, '궂다', 6706, 4, 0, 1),
+(NULL, '그분', 6707, 4, 0, 1),
+(NULL, '글씨', 6708, 4, 0, 1),
+(NULL, '글피', 6709, 4, 0, 1),
+(NULL, '긋다', 6710, 4, 0, 1),
+(NULL, '기슭', 6711, 4, 0, 1),
+(NULL, '기역', 6712, 4, 0, 1),
+(NULL, '김치', 6713, 4, 0, 1),
+(NULL, '꽹꽹', 6714, 4, 0, 1),
+(NULL, '꾀병', 6715, 4, 0, 1),
+(NULL, '꿰다', 6716, 4, 0, 1),
+(NULL, '끙끙', 6717, 4, 0, 1),
+(NULL, '나물', 6718, 4, 0, 1),
+(NULL, '나중', 6719, 4, 0, 1),
+(NULL, '나흘', 6720, 4, 0, 1),
+(NULL, '남돌', 6721, 4, 0, 1),
+(NULL, '낫다', 6722, 4, 0, 1),
+(NULL, '낳음', 6723, 4, 0, 1),
+(NULL, '넝마', 6724, 4, 0, 1),
+(NULL, '누이', 6725, 4, 0, 1),
+(NULL, '뉴비', 6726, 4, 0, 1),
+(NULL, '늘다', 6727, 4, 0, 1),
+(NULL, '니은', 6728, 4, 0, 1),
+(NULL, '다래', 6729, 4, 0, 1),
+(NULL, '다시', 6730, 4, 0, 1),
+(NULL, '달램', 6731, 4, 0, 1),
+(NULL, '닷새', 6732, 4, 0, 1),
+(NULL, '대낮', 6733, 4, 0, 1),
+(NULL, '덧문', 6734, 4, 0, 1),
+(NULL, '도움', 6735, 4, 0, 1),
+(NULL, '돼지', 6736, 4, 0, 1),
+(NULL, '되게', 6737, 4, 0, 1),
+(NULL, '됨됨', 6738, 4, 0, 1),
+(NULL, '두엄', 6739, 4, 0, 1),
+(NULL, '디귿', 6740, 4, 0, 1),
+(NULL, '디읃', 6741, 4, 0, 1),
+(NULL, '딴지', 6742, 4, 0, 1),
+(NULL, '때다', 6743, 4, 0, 1),
+(NULL, '떨다', 6744, 4, 0, 1),
+(NULL, '떼창', 6745, 4, 0, 1),
+(NULL, '로리', 6746, 4, 0, 1),
+(NULL, '리을', 6747, 4, 0, 1),
+(NULL, '마디', 6748, 4, 0, 1),
+(NULL, '마실', 6749, 4, 0, 1),
+(NULL, '마을', 6750, 4, 0, 1),
+(NULL, '마음', 6751, 4, 0, 1),
+(NULL, '막내', 6752, 4, 0, 1),
+(NULL, '맘마', 6753, 4, 0, 1),
+(NULL, '맡다', 6754, 4, 0, 1),
+(NULL, '매듭', 6755, 4, 0, 1),
+(NULL, '맨션', 6756, 4, 0, 1),
+(NULL, '맹예', 6757, 4, 0, 1),
+(NULL, '먹사', 6758, 4, 0, 1),
+(NULL, '먼촌', 6759, 4, 0, 1),
+(NULL, '멈춤', 6760, 4, 0, 1),
+(NULL, '멸치', 6761, 4, 0, 1),
+(NULL, '명월', 6762, 4, 0, 1),
+(NULL, '모드', 6763, 4, 0, 1),
+(NULL, '목청', 6764, 4, 0, 1),
+(NULL, '몰카', 6765, 4, 0, 1),
+(NULL, '몸짱', 6766, 4, 0, 1),
+(NULL, '무렵', 6767, 4, 0, 1),
+(NULL, '무릇', 6768, 4, 0, 1),
+(NULL, '무슨', 6769, 4, 0, 1),
+(NULL, '무척', 6770, 4, 0, 1),
+(NULL, '미음', 6771, 4, 0, 1),
+(NULL, '민낯', 6772, 4, 0, 1),
+(NULL, '밤잠', 6773, 4, 0, 1),
+(NULL, '밥길', 6774, 4, 0, 1),
+(NULL, '밥술', 6775, 4, 0, 1),
+(NULL, '밥줄', 6776, 4, 0, 1),
+(NULL, '뱉다', 6777, 4, 0, 1),
+(NULL, '버금', 6778, 4, 0, 1),
+(NULL, '벡터', 6779, 4, 0, 1),
+(NULL, '별것', 6780, 4, 0, 1),
+(NULL, '볼일', 6781, 4, 0, 1),
+(NULL, '부아', 6782, 4, 0, 1),
+(NULL, '불금', 6783, 4, 0, 1),
+(NULL, '불다', 6784, 4, 0, 1),
+(NULL, '불펌', 6785, 4, 0, 1),
+(NULL, '비빔', 6786, 4, 0, 1),
+(NULL, '비읍', 6787, 4, 0, 1),
+(NULL, '빌다', 6788, 4, 0, 1),
+(NULL, '빤스', 6789, 4, 0, 1),
+(NULL, '뺑창', 6790, 4, 0, 1),
+(NULL, '뺑코', 6791, 4, 0, 1),
+(NULL, '삐침', 6792, 4, 0, 1),
+(NULL, '사개', 6793, 4, 0, 1),
+(NULL, '사뭇', 6794, 4, 0, 1),
+(NULL, '사흘', 6795, 4, 0, 1),
+(NULL, '살짝', 6796, 4, 0, 1),
+(NULL, '삼춘', 6797, 4, 0, 1),
+(NULL, '상메', 6798, 4, 0, 1),
+(NULL, '색시', 6799, 4, 0, 1),
+(NULL, '서클', 6800, 4, 0, 1),
+(NULL, '섣달', 6801, 4, 0, 1),
+(NULL, '설기', 6802, 4, 0, 1),
+(NULL, '설다', 6803, 4, 0, 1),
+(NULL, '세다', 6804, 4, 0, 1),
+(NULL, '센터', 6805, 4, 0, 1),
+('蕭瑟', '소슬', 6806, 4, 0, 1),
+(NULL, '손뼉', 6807, 4, 0, 1),
+(NULL, '솔로', 6808, 4, 0, 1),
+(NULL, '숨결', 6809, 4, 0, 1),
+(NULL, '숨통', 6810, 4, 0, 1),
+(NULL, '숫눈', 6811, 4, 0, 1),
+(NULL, '숭늉', 6812, 4, 0, 1),
+(NULL, '슈트', 6813, 4, 0, 1),
+(NULL, '스님', 6814, 4, 0, 1),
+(NULL, '슴골', 6815, 4, 0, 1),
+(NULL, '슴베', 6816, 4, 0, 1),
+(NULL, '슴새', 6817, 4, 0, 1),
+(NULL, '습식', 6818, 4, 0, 1),
+(NULL, '식다', 6819, 4, 0, 1),
+(NULL, '아래', 6820, 4, 0, 1),
+(NULL, '아매', 6821, 4, 0, 1),
+(NULL, '안목', 6822, 4, 0, 1),
+(NULL, '않다', 6823, 4, 0, 1),
+(NULL, '알못', 6824, 4, 0, 1),
+(NULL, '알밤', 6825, 4, 0, 1),
+(NULL, '암꽃', 6826, 4, 0, 1),
+(NULL, '암내', 6827, 4, 0, 1),
+(NULL, '앗다', 6828, 4, 0, 1),
+(NULL, '야짤', 6829, 4, 0, 1),
+(NULL, '어느', 6830, 4, 0, 1),
+(NULL, '어른', 6831, 4, 0, 1),
+(NULL, '엉가', 6832, 4, 0, 1),
+(NULL, '엉망', 6833, 4, 0, 1),
+(NULL, '에다', 6834, 4, 0, 1),
+(NULL, '에바', 6835, 4, 0, 1),
+(NULL, '여돌', 6836, 4, 0, 1),
+(NULL, '엷다', 6837, 4, 0, 1),
+(NULL, '엿새', 6838, 4, 0, 1),
+(NULL, '옅다', 6839, 4, 0, 1),
+(NULL, '오빠', 6840, 4, 0, 1),
+(NULL, '온통', 6841, 4, 0, 1),
+(NULL, '옳음', 6842, 4, 0, 1),
+(NULL, '와꾸', 6843, 4, 0, 1),
+(NULL, '왠지', 6844, 4, 0, 1),
+(NULL, '유다', 6845, 4, 0, 1),
+(NULL, '으뜸', 6846, 4, 0, 1),
+(NULL, '음쓰', 6847, 4, 0, 1),
+(NULL, '이다', 6848, 4, 0, 1),
+(NULL, '이듬', 6849, 4, 0, 1),
+(NULL, '이레', 6850, 4, 0, 1),
+(NULL, '이웃', 6851, 4, 0, 1),
+(NULL, '이응', 6852, 4, 0, 1),
+(NULL, '이틀', 6853, 4, 0, 1),
+(NULL, '익살', 6854, 4, 0, 1),
+(NULL, '일군', 6855, 4, 0, 1),
+(NULL, '입김', 6856, 4, 0, 1),
+(NULL, '입내', 6857, 4, 0, 1),
+(NULL, '자개', 6858, 4, 0, 1),
+(NULL, '자랑', 6859, 4, 0, 1),
+(NULL, '자루', 6860, 4, 0, 1),
+(NULL, '작대', 6861, 4, 0, 1),
+(NULL, '잔디', 6862, 4, 0, 1),
+(NULL, '장난', 6863, 4, 0, 1),
+(NULL, '장마', 6864, 4, 0, 1),
+(NULL, '재주', 6865, 4, 0, 1),
+(NULL, '저녁', 6866, 4, 0, 1),
+(NULL, '저런', 6867, 4, 0, 1),
+(NULL, '저분', 6868, 4, 0, 1),
+(NULL, '저울', 6869, 4, 0, 1),
+(NULL, '적다', 6870, 4, 0, 1),
+('叮嚀', '정녕', 6871, 4, 0, 1),
+(NULL, '조끼', 6872, 4, 0, 1),
+(NULL, '조밥', 6873, 4, 0, 1),
+(NULL, '존맛', 6874, 4, 0, 1),
+(NULL, '졸다', 6875, 4, 0, 1),
+(NULL, '좇다', 6876, 4, 0, 1),
+(NULL, '주작', 6877, 4, 0, 1),
+(NULL, '지읒', 6878, 4, 0, 1),
+(NULL, '진짜', 6879, 4, 0, 1),
+(NULL, '짐승', 6880, 4, 0, 1),
+(NULL, '집게', 6881, 4, 0, 1),
+(NULL, '짠물', 6882, 4, 0, 1),
+(NULL, '짤줍', 6883, 4, 0, 1),
+(NULL, '짬밥', 6884, 4, 0, 1),
+(NULL, '째다', 6885, 4, 0, 1),
+(NULL, '짹짹', 6886, 4, 0, 1),
+(NULL, '쪽파', 6887, 4, 0, 1),
+(NULL, '쬐다', 6888, 4, 0, 1),
+(NULL, '천로', 6889, 4, 0, 1),
+(NULL, '치읓', 6890, 4, 0, 1),
+(NULL, '칼날', 6891, 4, 0, 1),
+(NULL, '캐다', 6892, 4, 0, 1),
+(NULL, '컬러', 6893, 4, 0, 1),
+(NULL, '콕콕', 6894, 4, 0, 1),
+(NULL, '콩알', 6895, 4, 0, 1),
+(NULL, '큰일', 6896, 4, 0, 1),
+(NULL, '키배', 6897, 4, 0, 1),
+(NULL, '키읔', 6898, 4, 0, 1),
+(NULL, '탈덕', 6899, 4, 0, 1),
+(NULL, '털실', 6900, 4, 0, 1),
+(NULL, '테제', 6901, 4, 0, 1),
+(NULL, '통닭', 6902, 4, 0, 1),
+(NULL, '투르', 6903, 4, 0, 1),
+(NULL, '티읕', 6904, 4, 0, 1),
+(NULL, '파다', 6905, 4, 0, 1),
+(NULL, '파전', 6906, 4, 0, 1),
+(NULL, '팥색', 6907, 4, 0, 1),
+(NULL, '패션', 6908, 4, 0, 1),
+(NULL, '푸다', 6909, 4, 0, 1),
+(NULL, '프사', 6910, 4, 0, 1),
+(NULL, '피리', 6911, 4, 0, 1),
+(NULL, '피읖', 6912, 4, 0, 1),
+(NULL, '하긴', 6913, 4, 0, 1),
+(NULL, '한데', 6914, 4, 0, 1),
+(NULL, '허물', 6915, 4, 0, 1),
+(NULL, '혐짤', 6916, 4, 0, 1),
+(NULL, '호리', 6917, 4, 0, 1),
+(NULL, '호박', 6918, 4, 0, 1),
+(NULL, '횃불', 6919, 4, 0, 1),
+(NULL, '훑다', 6920, 4, 0, 1),
+(NULL, '히읗', 6921, 4, 0, 1),
+(NULL, '힘줄', 6922, 4, 0, 1),
+(NULL, '가늘다', 6923, 4, 0, 1),
+(NULL, '가락지', 6924, 4, 0, 1),
+(NULL, '가없다', 6925, 4, 0, 1),
+(NULL, '가을철', 6926, 4, 0, 1),
+(NULL, '갈림길', 6927, 4, 0, 1),
+(NULL, '갑분싸', 6928, 4, 0, 1),
+(NULL, '객쩍다', 6929, 4, 0, 1),
+(NULL, '거두다', 6930, 4, 0, 1),
+(NULL, '거문고', 6931, 4, 0, 1),
+(NULL, '검둥이', 6932, 4, 0, 1),
+(NULL, '겉핥다', 6933, 4, 0, 1),
+(NULL, '겨울털', 6934, 4, 0, 1),
+(NULL, '고사리', 6935, 4, 0, 1),
+(NULL, '고추장', 6936, 4, 0, 1),
+(NULL, '공하다', 6937, 4, 0, 1),
+(NULL, '굽히다', 6938, 4, 0, 1),
+(NULL, '귀찮다', 6939, 4, 0, 1),
+(NULL, '그나마', 6940, 4, 0, 1),
+(NULL, '그러다', 6941, 4, 0, 1),
+(NULL, '그렇게', 6942, 4, 0, 1),
+(NULL, '그립다', 6943, 4, 0, 1),
+(NULL, '근삿값', 6944, 4, 0, 1),
+(NULL, '기레기', 6945, 4, 0, 1),
+(NULL, '기리다', 6946, 4, 0, 1),
+(NULL, '기쁨조', 6947, 4, 0, 1),
+(NULL, '길잡이', 6948, 4, 0, 1),
+(NULL, '까먹다', 6949, 4, 0, 1),
+(NULL, '깽깽이', 6950, 4, 0, 1),
+(NULL, '꼴리다', 6951, 4, 0, 1),
+(NULL, '꽂히다', 6952, 4, 0, 1),
+(NULL, '꽃피다', 6953, 4, 0, 1),
+(NULL, '꾸러미', 6954, 4, 0, 1),
+(NULL, '꿰뚫다', 6955, 4, 0, 1),
+(NULL, '끄르다', 6956, 4, 0, 1),
+(NULL, '끼치다', 6957, 4, 0, 1),
+(NULL, '나누다', 6958, 4, 0, 1),
+(NULL, '나무결', 6959, 4, 0, 1),
+(NULL, '나이트', 6960, 4, 0, 1),
+(NULL, '나팔꽃', 6961, 4, 0, 1),
+(NULL, '날리다', 6962, 4, 0, 1),
+(NULL, '남향집', 6963, 4, 0, 1),
+(NULL, '낮잡다', 6964, 4, 0, 1),
+(NULL, '낮추다', 6965, 4, 0, 1),
+(NULL, '내밀다', 6966, 4, 0, 1),
+(NULL, '노느다', 6967, 4, 0, 1),
+(NULL, '노리개', 6968, 4, 0, 1),
+(NULL, '늘리다', 6969, 4, 0, 1),
+(NULL, '다거다', 6970, 4, 0, 1),
+(NULL, '달고나', 6971, 4, 0, 1),
+(NULL, '달리다', 6972, 4, 0, 1),
+(NULL, '담그다', 6973, 4, 0, 1),
+(NULL, '당구채', 6974, 4, 0, 1),
+(NULL, '더욱이', 6975, 4, 0, 1),
+(NULL, '도저히', 6976, 4, 0, 1),
+(NULL, '독수리', 6977, 4, 0, 1),
+(NULL, '동박꽃', 6978, 4, 0, 1),
+(NULL, '동백꽃', 6979, 4, 0, 1),
+(NULL, '되찾다', 6980, 4, 0, 1),
+(NULL, '된기윽', 6981, 4, 0, 1),
+(NULL, '된디읃', 6982, 4, 0, 1),
+(NULL, '된비읍', 6983, 4, 0, 1),
+(NULL, '된시옷', 6984, 4, 0, 1),
+(NULL, '된장녀', 6985, 4, 0, 1),
+(NULL, '된지읒', 6986, 4, 0, 1),
+(NULL, '두서너', 6987, 4, 0, 1),
+(NULL, '두서넛', 6988, 4, 0, 1),
+(NULL, '뒤꿈치', 6989, 4, 0, 1),
+(NULL, '뒤늦다', 6990, 4, 0, 1),
+(NULL, '뒷광고', 6991, 4, 0, 1),
+(NULL, '드리다', 6992, 4, 0, 1),
+(NULL, '들러리', 6993, 4, 0, 1),
+(NULL, '디디다', 6994, 4, 0, 1),
+(NULL, '떠돌이', 6995, 4, 0, 1),
+(NULL, '똥양인', 6996, 4, 0, 1),
+(NULL, '뙤약볕', 6997, 4, 0, 1),
+(NULL, '마루타', 6998, 4, 0, 1),
+(NULL, '마음성', 6999, 4, 0, 1),
+(NULL, '마음속', 7000, 4, 0, 1),
+(NULL, '막히다', 7001, 4, 0, 1),
+(NULL, '매섭다', 7002, 4, 0, 1),
+(NULL, '맴돌다', 7003, 4, 0, 1),
+(NULL, '머리끝', 7004, 4, 0, 1),
+(NULL, '머리통', 7005, 4, 0, 1),
+(NULL, '메소드', 7006, 4, 0, 1),
+(NULL, '메인트', 7007, 4, 0, 1),
+(NULL, '목련꽃', 7008, 4, 0, 1),
+(NULL, '몰리다', 7009, 4, 0, 1),
+(NULL, '무디다', 7010, 4, 0, 1),
+(NULL, '묵은해', 7011, 4, 0, 1),
+(NULL, '문바람', 7012, 4, 0, 1),
+(NULL, '문지기', 7013, 4, 0, 1),
+(NULL, '바람결', 7014, 4, 0, 1),
+(NULL, '바치다', 7015, 4, 0, 1),
+(NULL, '반갑다', 7016, 4, 0, 1),
+(NULL, '반드시', 7017, 4, 0, 1),
+(NULL, '반듯이', 7018, 4, 0, 1),
+(NULL, '반시읏', 7019, 4, 0, 1),
+(NULL, '발구지', 7020, 4, 0, 1),
+(NULL, '발기다', 7021, 4, 0, 1),
+(NULL, '밤사이', 7022, 4, 0, 1),
+(NULL, '뱃노래', 7023, 4, 0, 1),
+(NULL, '벌기다', 7024, 4, 0, 1),
+(NULL, '벗기다', 7025, 4, 0, 1),
+(NULL, '베이스', 7026, 4, 0, 1),
+(NULL, '벼르다', 7027, 4, 0, 1),
+(NULL, '별자리', 7028, 4, 0, 1),
+(NULL, '보름날', 7029, 4, 0, 1),
+(NULL, '보리밥', 7030, 4, 0, 1),
+(NULL, '보스전', 7031, 4, 0, 1),
+(NULL, '본받다', 7032, 4, 0, 1),
+(NULL, '볼거리', 7033, 4, 0, 1),
+(NULL, '비비다', 7034, 4, 0, 1),
+(NULL, '비우다', 7035, 4, 0, 1),
+(NULL, '빛내다', 7036, 4, 0, 1),
+(NULL, '빠르기', 7037, 4, 0, 1),
+(NULL, '빠르다', 7038, 4, 0, 1),
+(NULL, '빨갱이', 7039, 4, 0, 1),
+(NULL, '빼치다', 7040, 4, 0, 1),
+(NULL, '사르다', 7041, 4, 0, 1),
+(NULL, '사투리', 7042, 4, 0, 1),
+(NULL, '삼엽충', 7043, 4, 0, 1),
+(NULL, '삼키다', 7044, 4, 0, 1),
+(NULL, '선뵈다', 7045, 4, 0, 1),
+(NULL, '설레다', 7046, 4, 0, 1),
+(NULL, '속이다', 7047, 4, 0, 1),
+(NULL, '속임수', 7048, 4, 0, 1),
+(NULL, '손빨래', 7049, 4, 0, 1),
+(NULL, '쇠뜨기', 7050, 4, 0, 1),
+(NULL, '쇠하다', 7051, 4, 0, 1),
+(NULL, '수납장', 7052, 4, 0, 1),
+(NULL, '스카이', 7053, 4, 0, 1),
+(NULL, '시스터', 7054, 4, 0, 1),
+(NULL, '실마리', 7055, 4, 0, 1),
+(NULL, '쌍기역', 7056, 4, 0, 1),
+(NULL, '쌍디귿', 7057, 4, 0, 1),
+(NULL, '쌍비읍', 7058, 4, 0, 1),
+(NULL, '쌍지읒', 7059, 4, 0, 1),
+(NULL, '쌩까다', 7060, 4, 0, 1),
+(NULL, '씹두덩', 7061, 4, 0, 1),
+(NULL, '아가씨', 7062, 4, 0, 1),
+(NULL, '아래아', 7063, 4, 0, 1),
+(NULL, '아리수', 7064, 4, 0, 1),
+(NULL, '아줌마', 7065, 4, 0, 1),
+(NULL, '아파트', 7066, 4, 0, 1),
+(NULL, '아흐레', 7067, 4, 0, 1),
+(NULL, '알파벳', 7068, 4, 0, 1),
+(NULL, '앞서다', 7069, 4, 0, 1),
+(NULL, '앱등이', 7070, 4, 0, 1),
+(NULL, '양다리', 7071, 4, 0, 1),
+(NULL, '양옥집', 7072, 4, 0, 1),
+(NULL, '어금니', 7073, 4, 0, 1),
+(NULL, '엄친아', 7074, 4, 0, 1),
+(NULL, '엔조이', 7075, 4, 0, 1),
+(NULL, '여닫다', 7076, 4, 0, 1),
+(NULL, '여드레', 7077, 4, 0, 1),
+(NULL, '여리다', 7078, 4, 0, 1),
+(NULL, '열없다', 7079, 4, 0, 1),
+(NULL, '옛이응', 7080, 4, 0, 1),
+(NULL, '오롯이', 7081, 4, 0, 1),
+(NULL, '온종일', 7082, 4, 0, 1),
+(NULL, '올림말', 7083, 4, 0, 1),
+(NULL, '우기다', 7084, 4, 0, 1),
+(NULL, '우리집', 7085, 4, 0, 1),
+(NULL, '우스개', 7086, 4, 0, 1),
+(NULL, '유난히', 7087, 4, 0, 1),
+(NULL, '응원법', 7088, 4, 0, 1),
+(NULL, '이쁘다', 7089, 4, 0, 1),
+(NULL, '이울다', 7090, 4, 0, 1),
+(NULL, '이음매', 7091, 4, 0, 1),
+(NULL, '이토록', 7092, 4, 0, 1),
+(NULL, '일자리', 7093, 4, 0, 1),
+(NULL, '장대비', 7094, 4, 0, 1),
+(NULL, '저녁밥', 7095, 4, 0, 1),
+(NULL, '저물다', 7096, 4, 0, 1),
+(NULL, '점잖다', 7097, 4, 0, 1),
+(NULL, '젖가슴', 7098, 4, 0, 1),
+(NULL, '조센징', 7099, 4, 0, 1),
+(NULL, '조이다', 7100, 4, 0, 1),
+(NULL, '좀처럼', 7101, 4, 0, 1),
+(NULL, '주름위', 7102, 4, 0, 1),
+(NULL, '줄무늬', 7103, 4, 0, 1),
+(NULL, '지우다', 7104, 4, 0, 1),
+(NULL, '집주인', 7105, 4, 0, 1),
+(NULL, '짓궂다', 7106, 4, 0, 1),
+(NULL, '짝짓다', 7107, 4, 0, 1),
+(NULL, '짠하다', 7108, 4, 0, 1),
+(NULL, '짱꼴라', 7109, 4, 0, 1),
+(NULL, '짹소리', 7110, 4, 0, 1),
+(NULL, '쪼개다', 7111, 4, 0, 1),
+(NULL, '채우다', 7112, 4, 0, 1),
+(NULL, '챙기다', 7113, 4, 0, 1),
+(NULL, '첫가끝', 7114, 4, 0, 1),
+(NULL, '청설모', 7115, 4, 0, 1),
+(NULL, '촌뜨기', 7116, 4, 0, 1),
+(NULL, '촘촘히', 7117, 4, 0, 1),
+(NULL, '치르다', 7118, 4, 0, 1),
+(NULL, '카더라', 7119, 4, 0, 1),
+(NULL, '칼바람', 7120, 4, 0, 1),
+(NULL, '칼자루', 7121, 4, 0, 1),
+(NULL, '코쟁이', 7122, 4, 0, 1),
+(NULL, '킹왕짱', 7123, 4, 0, 1),
+(NULL, '토끼굴', 7124, 4, 0, 1),
+(NULL, '투구꽃', 7125, 4, 0, 1),
+(NULL, '틀리다', 7126, 4, 0, 1),
+(NULL, '하느님', 7127, 4, 0, 1),
+(NULL, '하시다', 7128, 4, 0, 1),
+(NULL, '하여튼', 7129, 4, 0, 1),
+(NULL, '하오체', 7130, 4, 0, 1),
+(NULL, '한글화', 7131, 4, 0, 1),
+(NULL, '합쇼체', 7132, 4, 0, 1),
+(NULL, '해요체', 7133, 4, 0, 1),
+(NULL, '헛되다', 7134, 4, 0, 1),
+(NULL, '헤르츠', 7135, 4, 0, 1),
+(NULL, '헤프다', 7136, 4, 0, 1),
+(NULL, '혹부리', 7137, 4, 0, 1),
+(NULL, '홀리다', 7138, 4, 0, 1),
+(NULL, '회오리', 7139, 4, 0, 1),
+(NULL, '훔치다', 7140, 4, 0, 1),
+(NULL, '흔들다', 7141, 4, 0, 1),
+(NULL, '흔하다', 7142, 4, 0, 1),
+(NULL, '흘리다', 7143, 4, 0, 1),
+(NULL, '힘차다', 7144, 4, 0, 1),
+(NULL, 'ㅇㄱㄹㅇ', 7145, 4, 0, 1),
+(NULL, '가늠하다', 7146, 4, 0, 1),
+(NULL, '가새보리', 7147, 4, 0, 1),
+(NULL, '갈고닦다', 7148, 4, 0, 1),
+(NULL, '강렬하다', 7149, 4, 0, 1),
+(NULL, '거느리다', 7150, 4, 0, 1),
+(NULL, '거천하다', 7151, 4, 0, 1),
+(NULL, '건드리다', 7152, 4, 0, 1),
+(NULL, '걸어가다', 7153, 4, 0, 1),
+(NULL, '격렬하다', 7154, 4, 0, 1),
+(NULL, '고기완자', 7155, 4, 0, 1),
+(NULL, '고나리질', 7156, 4, 0, 1),
+(NULL, '고려사람', 7157, 4, 0, 1),
+(NULL, '골칫거리', 7158, 4, 0, 1),
+(NULL, '굉장하다', 7159, 4, 0, 1),
+(NULL, '교부받다', 7160, 4, 0, 1),
+(NULL, '굴러가다', 7161, 4, 0, 1),
+(NULL, '귀염둥이', 7162, 4, 0, 1),
+(NULL, '그릇되다', 7163, 4, 0, 1),
+(NULL, '까다롭다', 7164, 4, 0, 1),
+(NULL, '깨까사다', 7165, 4, 0, 1),
+(NULL, '꺾어지다', 7166, 4, 0, 1),
+(NULL, '꼭지이응', 7167, 4, 0, 1),
+(NULL, '끄트러기', 7168, 4, 0, 1),
+(NULL, '나들이옷', 7169, 4, 0, 1),
+(NULL, '날씬하다', 7170, 4, 0, 1),
+(NULL, '낮일하다', 7171, 4, 0, 1),
+(NULL, '낯가리다', 7172, 4, 0, 1),
+(NULL, '너비아니', 7173, 4, 0, 1),
+(NULL, '높아지다', 7174, 4, 0, 1),
+(NULL, '눈엣가시', 7175, 4, 0, 1),
+(NULL, '다녀가다', 7176, 4, 0, 1),
+(NULL, '다이어트', 7177, 4, 0, 1),
+(NULL, '당당하다', 7178, 4, 0, 1),
+(NULL, '대꾸하다', 7179, 4, 0, 1),
+(NULL, '대나무숲', 7180, 4, 0, 1),
+(NULL, '돌려주다', 7181, 4, 0, 1),
+(NULL, '돌하르방', 7182, 4, 0, 1),
+(NULL, '두드리다', 7183, 4, 0, 1),
+(NULL, '두루마리', 7184, 4, 0, 1),
+(NULL, '뒤바뀌다', 7185, 4, 0, 1),
+(NULL, '따라하다', 7186, 4, 0, 1),
+(NULL, '따분하다', 7187, 4, 0, 1),
+(NULL, '떠나가다', 7188, 4, 0, 1),
+(NULL, '똥똥하다', 7189, 4, 0, 1),
+(NULL, '뛰어가다', 7190, 4, 0, 1),
+(NULL, '뛰어넘다', 7191, 4, 0, 1),
+(NULL, '뜬금없다', 7192, 4, 0, 1),
+(NULL, '마무르다', 7193, 4, 0, 1),
+(NULL, '매만지다', 7194, 4, 0, 1),
+(NULL, '멀찌감치', 7195, 4, 0, 1),
+(NULL, '명료하다', 7196, 4, 0, 1),
+(NULL, '미꾸라지', 7197, 4, 0, 1),
+(NULL, '발뒤꿈치', 7198, 4, 0, 1),
+(NULL, '방귀쟁이', 7199, 4, 0, 1),
+(NULL, '벗겨지다', 7200, 4, 0, 1),
+(NULL, '복용하다', 7201, 4, 0, 1),
+(NULL, '부닥치다', 7202, 4, 0, 1),
+(NULL, '부서지다', 7203, 4, 0, 1),
+(NULL, '북돋우다', 7204, 4, 0, 1),
+(NULL, '불룩하다', 7205, 4, 0, 1),
+(NULL, '붉어지다', 7206, 4, 0, 1),
+(NULL, '빽빽대다', 7207, 4, 0, 1),
+(NULL, '뾰족하다', 7208, 4, 0, 1),
+(NULL, '살림살이', 7209, 4, 0, 1),
+(NULL, '살살하다', 7210, 4, 0, 1),
+(NULL, '살짝살짝', 7211, 4, 0, 1),
+(NULL, '상냥하다', 7212, 4, 0, 1),
+(NULL, '상스럽다', 7213, 4, 0, 1),
+(NULL, '새벽감성', 7214, 4, 0, 1),
+(NULL, '성가시다', 7215, 4, 0, 1),
+(NULL, '세워지다', 7216, 4, 0, 1),
+(NULL, '소비에트', 7217, 4, 0, 1),
+(NULL, '수수께끼', 7218, 4, 0, 1),
+(NULL, '순우리말', 7219, 4, 0, 1),
+(NULL, '스포이트', 7220, 4, 0, 1),
+(NULL, '슬그머니', 7221, 4, 0, 1),
+(NULL, '심각하다', 7222, 4, 0, 1),
+(NULL, '싸고돌다', 7223, 4, 0, 1),
+(NULL, '쏘비에트', 7224, 4, 0, 1),
+(NULL, '쏜살같이', 7225, 4, 0, 1),
+(NULL, '쓸쓸하다', 7226, 4, 0, 1),
+(NULL, '씻은듯이', 7227, 4, 0, 1),
+(NULL, '아무래도', 7228, 4, 0, 1),
+(NULL, '안개시리', 7229, 4, 0, 1),
+(NULL, '안타깝다', 7230, 4, 0, 1),
+(NULL, '알아보다', 7231, 4, 0, 1),
+(NULL, '앞당기다', 7232, 4, 0, 1),
+(NULL, '얘기하다', 7233, 4, 0, 1),
+(NULL, '어렴풋이', 7234, 4, 0, 1),
+(NULL, '여린히읗', 7235, 4, 0, 1),
+(NULL, '열없쟁이', 7236, 4, 0, 1),
+(NULL, '오두막집', 7237, 4, 0, 1),
+(NULL, '오마카세', 7238, 4, 0, 1),
+(NULL, '욕심쟁이', 7239, 4, 0, 1),
+(NULL, '유럽들소', 7240, 4, 0, 1),
+(NULL, '음침하다', 7241, 4, 0, 1),
+(NULL, '이리하다', 7242, 4, 0, 1),
+(NULL, '자물시다', 7243, 4, 0, 1),
+(NULL, '자잘하다', 7244, 4, 0, 1),
+(NULL, '잘라내다', 7245, 4, 0, 1),
+(NULL, '잠잠우물', 7246, 4, 0, 1),
+(NULL, '재미있다', 7247, 4, 0, 1),
+(NULL, '좆대가리', 7248, 4, 0, 1),
+(NULL, '좋아지다', 7249, 4, 0, 1),
+(NULL, '주워듣다', 7250, 4, 0, 1),
+(NULL, '줄기차다', 7251, 4, 0, 1),
+(NULL, '중단하다', 7252, 4, 0, 1),
+(NULL, '지켜보다', 7253, 4, 0, 1),
+(NULL, '짤줍하다', 7254, 4, 0, 1),
+(NULL, '짹짹대다', 7255, 4, 0, 1),
+(NULL, '짹짹하다', 7256, 4, 0, 1),
+(NULL, '차지하다', 7257, 4, 0, 1),
+(NULL, '찾아가다', 7258, 4, 0, 1),
+(NULL, '쳐죽이다', 7259, 4, 0, 1),
+(NULL, '치장하다', 7260, 4, 0, 1),
+(NULL, '칙칙하다', 7261, 4, 0, 1),
+(NULL, '카메라맨', 7262, 4, 0, 1),
+(NULL, '커뮤니티', 7263, 4, 0, 1),
+(NULL, '퉁퉁마디', 7264, 4, 0, 1),
+(NULL, '특이하다', 7265, 4, 0, 1),
+(NULL, '피장파장', 7266, 4, 0, 1),
+(NULL, '하소서체', 7267, 4, 0, 1),
+(NULL, '한갓지다', 7268, 4, 0, 1),
+(NULL, '해바라기', 7269, 4, 0, 1),
+(NULL, '해오라기', 7270, 4, 0, 1),
+(NULL, '험악하다', 7271, 4, 0, 1),
+(NULL, '헛코골다', 7272, 4, 0, 1),
+(NULL, '현자타임', 7273, 4, 0, 1),
+(NULL, '혼잡하다', 7274, 4, 0, 1),
+(NULL, '흥건하다', 7275, 4, 0, 1),
+(NULL, '흩뜨리다', 7276, 4, 0, 1),
+(NULL, '희롱하다', 7277, 4, 0, 1),
+(NULL, '가까이하다', 7278, 4, 0, 1),
+(NULL, '게으름뱅이', 7279, 4, 0, 1),
+(NULL, '굽신거리다', 7280, 4, 0, 1),
+(NULL, '그리워하다', 7281, 4, 0, 1),
+(NULL, '꾸꾸당하다', 7282, 4, 0, 1),
+(NULL, '내팽개치다', 7283, 4, 0, 1),
+(NULL, '냉담해지다', 7284, 4, 0, 1),
+(NULL, '뒤떨어지다', 7285, 4, 0, 1),
+(NULL, '땡땡이치다', 7286, 4, 0, 1),
+(NULL, '마무리하다', 7287, 4, 0, 1),
+(NULL, '바닷물고기', 7288, 4, 0, 1),
+(NULL, '박탈당하다', 7289, 4, 0, 1),
+(NULL, '벅적거리다', 7290, 4, 0, 1),
+(NULL, '부르릉대다', 7291, 4, 0, 1),
+(NULL, '빠져나가다', 7292, 4, 0, 1),
+(NULL, '빨아들이다', 7293, 4, 0, 1),
+(NULL, '사랑의 매', 7294, 4, 0, 1),
+(NULL, '스트레이트', 7295, 4, 0, 1),
+(NULL, '아르바이트', 7296, 4, 0, 1),
+(NULL, '악화시키다', 7297, 4, 0, 1),
+(NULL, '어깻죽지뼈', 7298, 4, 0, 1),
+(NULL, '통통거리다', 7299, 4, 0, 1),
+(NULL, '하십시오체', 7300, 4, 0, 1),
+(NULL, '후줄근하다', 7301, 4, 0, 1),
+(NULL, '흘러내리다', 7302, 4, 0, 1),
+(NULL, 'ㄱ 구개음화', 7303, 4, 0, 1),
+(NULL, 'ㄷ 구개음화', 7304, 4, 0, 1),
+(NULL, '끔찍끔찍하다', 7305, 4, 0, 1),
+(NULL, '들쑥날쑥하다', 7306, 4, 0, 1),
+(NULL, '무시무시하다', 7307, 4, 0, 1),
+(NULL, '부끄러워하다', 7308, 4, 0, 1),
+(NULL, '부르릉거리다', 7309, 4, 0, 1),
+(NULL, '습기가 차다', 7310, 4, 0, 1),
+(NULL, '시끌시끌하다', 7311, 4, 0, 1),
+(NULL, '왁자지껄하다', 7312, 4, 0, 1),
+(NULL, '조마조마하다', 7313, 4, 0, 1),
+(NULL, '차고 넘치다', 7314, 4, 0, 1),
+(NULL, '칼을 빼들다', 7315, 4, 0, 1),
+(NULL, '학수고대하다', 7316, 4, 0, 1),
+(NULL, '질량 보존의 법칙', 7317, 4, 0, 1),
+('外國人登錄', '외국인등록', 7318, 3, 701, 1),
+('學校生活記錄簿', '학교생활기록부', 7319, 3, 637, 1),
+('農學者', '농학자', 7320, 3, 635, 1),
+('在日韓國語', '재일한국어', 7321, 3, 594, 1),
+('天地人', '천지인', 7322, 3, 590, 1),
+('異國人', '이국인', 7323, 3, 578, 1),
+('女學生', '여학생', 7324, 3, 567, 1),
+('人生觀', '인생관', 7325, 3, 544, 1),
+('代理者', '대리자', 7326, 3, 533, 1),
+('自由至上主義', '자유지상주의', 7327, 3, 513, 1),
+('國粹主義', '국수주의', 7328, 3, 504, 1),
+('開化人', '개화인', 7329, 3, 494, 1),
+('生年月日', '생년월일', 7330, 3, 492, 1),
+('自由意志主義', '자유의지주의', 7331, 3, 489, 1),
+('修理人', '수리인', 7332, 3, 483, 1),
+('同業者', '동업자', 7333, 3, 481, 1),
+('言論人', '언론인', 7334, 3, 474, 1),
+('電子計算機', '전자계산기', 7335, 3, 472, 1),
+('擬人化', '의인화', 7336, 3, 464, 1),
+('語學', '어학', 7337, 3, 460, 1),
+('反對者', '반대자', 7338, 3, 452, 1),
+('自主的', '자주적', 7339, 3, 452, 1),
+('出生地', '출생지', 7340, 3, 452, 1),
+('公職者', '공직자', 7341, 3, 446, 1),
+('都會人', '도회인', 7342, 3, 441, 1),
+('義人', '의인', 7343, 3, 438, 1),
+('自力更生', '자력갱생', 7344, 3, 438, 1),
+('人工衛星', '인공위성', 7345, 3, 437, 1),
+('在所者', '재소자', 7346, 3, 434, 1),
+('失業者', '실업자', 7347, 3, 433, 1),
+('女性語', '여성어', 7348, 3, 430, 1),
+('加入者', '가입자', 7349, 3, 428, 1),
+('討論者', '토론자', 7350, 3, 426, 1),
+('植民地化', '식민지화', 7351, 3, 426, 1),
+('製作者', '제작자', 7352, 3, 425, 1),
+('自由主義', '자유주의', 7353, 3, 423, 1),
+('所持人', '소지인', 7354, 3, 413, 1),
+('背反者', '배반자', 7355, 3, 410, 1),
+('死亡者', '사망자', 7356, 3, 409, 1),
+('出生日', '출생일', 7357, 3, 409, 1),
+('業者', '업자', 7358, 3, 406, 1),
+('變節者', '변절자', 7359, 3, 403, 1),
+('溫血動物', '온혈동물', 7360, 3, 402, 1),
+('敵對者', '적대자', 7361, 3, 401, 1),
+('脫北者', '탈북자', 7362, 3, 400, 1),
+('看病人', '간병인', 7363, 3, 397, 1),
+('私生子', '사생자', 7364, 3, 397, 1),
+('病者', '병자', 7365, 3, 395, 1),
+('冷血動物', '냉혈동물', 7366, 3, 395, 1),
+('同人', '동인', 7367, 3, 394, 1),
+('個人指導', '개인지도', 7368, 3, 393, 1),
+('人質劇', '인질극', 7369, 3, 391, 1),
+('內人', '나인', 7370, 3, 389, 1),
+('加害者', '가해자', 7371, 3, 389, 1),
+('個別者', '개별자', 7372, 3, 388, 1),
+('狂信者', '광신자', 7373, 3, 388, 1),
+('生産性', '생산성', 7374, 3, 388, 1),
+('法治國', '법치국', 7375, 3, 387, 1),
+('在日朝鮮語', '재일조선어', 7376, 3, 382, 1),
+('異端者', '이단자', 7377, 3, 381, 1),
+('調停者', '조정자', 7378, 3, 381, 1),
+('令夫人', '영부인', 7379, 3, 378, 1),
+('自發的', '자발적', 7380, 3, 377, 1),
+('初級學校', '초급학교', 7381, 3, 377, 1),
+('男性語', '남성어', 7382, 3, 375, 1),
+('非難者', '비난자', 7383, 3, 375, 1),
+('性生活', '성생활', 7384, 3, 375, 1),
+('藥劑學', '약제학', 7385, 3, 375, 1),
+('觀覽者', '관람자', 7386, 3, 373, 1),
+('收監者', '수감자', 7387, 3, 371, 1),
+('吟遊詩人', '음유시인', 7388, 3, 371, 1),
+('先驅者', '선구자', 7389, 3, 370, 1),
+('販賣人', '판매인', 7390, 3, 369, 1),
+('作心三日', '작심삼일', 7391, 3, 367, 1),
+('人魚', '인어', 7392, 3, 365, 1),
+('主體思想', '주체사상', 7393, 3, 365, 1),
+('勞動階級化', '노동계급화', 7394, 3, 365, 1),
+('人造', '인조', 7395, 3, 361, 1),
+('辯護人', '변호인', 7396, 3, 361, 1),
+('陽性子', '양성자', 7397, 3, 361, 1),
+('地動說', '지동설', 7398, 3, 359, 1),
+('確診者', '확진자', 7399, 3, 359, 1),
+('告訴人', '고소인', 7400, 3, 358, 1),
+('演奏者', '연주자', 7401, 3, 358, 1),
+('旅人宿', '여인숙', 7402, 3, 356, 1),
+('申請者', '신청자', 7403, 3, 354, 1),
+('背叛者', '배반자', 7404, 3, 353, 1),
+('人夫', '인부', 7405, 3, 350, 1),
+('解剖學', '해부학', 7406, 3, 344, 1),
+('優人', '우인', 7407, 3, 343, 1),
+('新天地', '신천지', 7408, 3, 343, 1),
+('高原地帶', '고원지대', 7409, 3, 339, 1),
+('掠奪者', '략탈자', 7410, 3, 338, 1),
+('掠奪者', '약탈자', 7411, 3, 338, 1),
+('火山地帶', '화산지대', 7412, 3, 338, 1),
+('總體的', '총체적', 7413, 3, 336, 1),
+('貧者', '빈자', 7414, 3, 334, 1),
+('人跡', '인적', 7415, 3, 334, 1),
+('全羅南北道', '전라남북도', 7416, 3, 334, 1),
+('求人', '구인', 7417, 3, 333, 1),
+('御者', '어자', 7418, 3, 332, 1),
+('或者', '혹자', 7419, 3, 329, 1),
+('發音法', '발음법', 7420, 3, 329, 1),
+('家內工業', '가내공업', 7421, 3, 326, 1),
+('賢人', '현인', 7422, 3, 324, 1),
+('閑人', '한인', 7423, 3, 322, 1),
+('數分類詞', '수분류사', 7424, 3, 321, 1),
+('嬖人', '폐인', 7425, 3, 319, 1),
+('先天的', '선천적', 7426, 3, 310, 1),
+('生殺與奪權', '생살여탈권', 7427, 3, 310, 1),
+('退學', '퇴학', 7428, 3, 308, 1),
+('自由的', '자유적', 7429, 3, 308, 1),
+('室內運動', '실내운동', 7430, 3, 308, 1),
+('主體', '주체', 7431, 3, 306, 1),
+('休學', '휴학', 7432, 3, 304, 1),
+('集中力', '집중력', 7433, 3, 303, 1),
+('學區', '학구', 7434, 3, 301, 1),
+('大頭魚', '대두어', 7435, 3, 301, 1),
+('天動說', '천동설', 7436, 3, 300, 1),
+('數量形容詞', '수량형용사', 7437, 3, 300, 1),
+('文語', '문어', 7438, 3, 299, 1),
+('分析語', '분석어', 7439, 3, 297, 1),
+('訓詁學', '훈고학', 7440, 3, 295, 1),
+('博學', '박학', 7441, 3, 291, 1),
+('和製漢語', '화제한어', 7442, 3, 291, 1),
+('精神的', '정신적', 7443, 3, 290, 1),
+('名不虛傳', '명불허전', 7444, 3, 287, 1),
+('無線電話', '무선전화', 7445, 3, 287, 1),
+('專務理事', '전무이사', 7446, 3, 287, 1),
+('主日', '주일', 7447, 3, 285, 1),
+('天子', '천자', 7448, 3, 285, 1),
+('水蒸氣', '수증기', 7449, 3, 285, 1),
+('水平線', '수평선', 7450, 3, 285, 1),
+('米作地帶', '미작지대', 7451, 3, 284, 1),
+('政敎分離', '정교분리', 7452, 3, 284, 1),
+('實質的', '실질적', 7453, 3, 283, 1),
+('接頭語', '접두어', 7454, 3, 283, 1),
+('母國', '모국', 7455, 3, 281, 1),
+('文物', '문물', 7456, 3, 281, 1),
+('國樂', '국악', 7457, 3, 279, 1),
+('萬國旗', '만국기', 7458, 3, 278, 1),
+('不自由', '부자유', 7459, 3, 277, 1),
+('論語', '논어', 7460, 3, 274, 1),
+('平均自責點', '평균자책점', 7461, 3, 274, 1),
+('諸行無常', '제행무상', 7462, 3, 273, 1),
+('大字', '대자', 7463, 3, 271, 1),
+('借用語', '차용어', 7464, 3, 271, 1),
+('軟音化', '연음화', 7465, 3, 270, 1),
+('水血症', '수혈증', 7466, 3, 269, 1),
+('高速 道路', '고속 도로', 7467, 3, 268, 1),
+('根本的', '근본적', 7468, 3, 267, 1),
+('極端的 選擇', '극단적 선택', 7469, 3, 265, 1),
+('日用品', '일용품', 7470, 3, 264, 1),
+('魔法少女', '마법소녀', 7471, 3, 264, 1),
+('文體', '문체', 7472, 3, 263, 1),
+('振動數', '진동수', 7473, 3, 263, 1),
+('同種療法', '동종요법', 7474, 3, 261, 1),
+('分枝化', '분지화', 7475, 3, 260, 1),
+('不充分', '불충분', 7476, 3, 260, 1),
+('賣國', '매국', 7477, 3, 259, 1),
+('小冊子', '소책자', 7478, 3, 259, 1),
+('不一致', '불일치', 7479, 3, 258, 1),
+('異體字', '이체자', 7480, 3, 258, 1),
+('主色', '주색', 7481, 3, 256, 1),
+('八不用', '팔불용', 7482, 3, 256, 1),
+('器物', '기물', 7483, 3, 253, 1),
+('語感', '어감', 7484, 3, 253, 1),
+('衛生室', '위생실', 7485, 3, 253, 1),
+('地金', '지금', 7486, 3, 252, 1),
+('藥大', '약대', 7487, 3, 251, 1),
+('染色體', '염색체', 7488, 3, 251, 1),
+('高體溫', '고체온', 7489, 3, 247, 1),
+('軍事演習', '군사연습', 7490, 3, 247, 1),
+('自己紹介書', '자기소개서', 7491, 3, 247, 1),
+('食性', '식성', 7492, 3, 245, 1),
+('大虐殺', '대학살', 7493, 3, 245, 1),
+('對戰車砲', '대전차포', 7494, 3, 245, 1),
+('零個  國', '0개 국어', 7495, 3, 245, 1),
+('業主', '업주', 7496, 3, 244, 1),
+('唯一無二', '유일무이', 7497, 3, 244, 1),
+('土炭 濕地', '토탄 습지', 7498, 3, 244, 1),
+('事理', '사리', 7499, 3, 243, 1),
+('0個  國', '0개 국어', 7500, 3, 243, 1),
+('支拂不能債券', '지불불능채권', 7501, 3, 243, 1),
+('書體', '서체', 7502, 3, 242, 1),
+('日文', '일문', 7503, 3, 242, 1),
+('原語', '원어', 7504, 3, 241, 1),
+('中天', '중천', 7505, 3, 241, 1),
+('同文同種', '동문동종', 7506, 3, 241, 1),
+('車主', '차주', 7507, 3, 240, 1),
+('大王', '대왕', 7508, 3, 239, 1),
+('母語', '모어', 7509, 3, 239, 1),
+('母子', '모자', 7510, 3, 239, 1),
+('法事', '법사', 7511, 3, 239, 1),
+('前生', '전생', 7512, 3, 239, 1),
+('兩國', '양국', 7513, 3, 238, 1),
+('敵國', '적국', 7514, 3, 238, 1),
+('大逆罪', '대역죄', 7515, 3, 238, 1),
+('日本史', '일본사', 7516, 3, 238, 1),
+('國章', '국장', 7517, 3, 237, 1),
+('財政的', '재정적', 7518, 3, 237, 1),
+('接尾語', '접미어', 7519, 3, 237, 1),
+('五味子', '오미자', 7520, 3, 236, 1),
+('使動詞', '사동사', 7521, 3, 234, 1),
+('不名譽', '불명예', 7522, 3, 233, 1),
+('食料品店', '식료품점', 7523, 3, 233, 1),
+('大隊', '대대', 7524, 3, 232, 1),
+('轉成冠形詞', '전성관형사', 7525, 3, 232, 1),
+('不時着', '불시착', 7526, 3, 231, 1),
+('會計員', '회계원', 7527, 3, 231, 1),
+('防水布', '방수포', 7528, 3, 230, 1),
+('萬有引力', '만유인력', 7529, 3, 230, 1),
+('被動詞', '피동사', 7530, 3, 229, 1),
+('大領', '대령', 7531, 3, 228, 1),
+('生草', '생초', 7532, 3, 228, 1),
+('假定法', '가정법', 7533, 3, 228, 1),
+('瞬間的', '순간적', 7534, 3, 228, 1),
+('自業自得', '자업자득', 7535, 3, 228, 1),
+('表記法', '표기법', 7536, 3, 227, 1),
+('圖書館員', '도서관원', 7537, 3, 227, 1),
+('米作豫想收穫量', '미작예상수확량', 7538, 3, 227, 1),
+('國璽', '국새', 7539, 3, 225, 1),
+('死後世界', '사후세계', 7540, 3, 225, 1),
+('自紹書', '자소서', 7541, 3, 224, 1),
+('權謀術數', '권모술수', 7542, 3, 224, 1),
+('平地', '평지', 7543, 3, 223, 1),
+('地區隊', '지구대', 7544, 3, 223, 1),
+('送年會', '송년회', 7545, 3, 222, 1),
+('幻想的', '환상적', 7546, 3, 222, 1),
+('國', '국', 7547, 3, 221, 1),
+('天分', '천분', 7548, 3, 221, 1),
+('不等式', '부등식', 7549, 3, 221, 1),
+('性差別', '성차별', 7550, 3, 220, 1),
+('休養地', '휴양지', 7551, 3, 220, 1),
+('--間', '얼마간', 7552, 3, 219, 1),
+('出力', '출력', 7553, 3, 218, 1),
+('先史 時代', '선사 시대', 7554, 3, 218, 1),
+('全-', '전혀', 7555, 3, 216, 1),
+('獨創的', '독창적', 7556, 3, 216, 1),
+('文名', '문명', 7557, 3, 215, 1),
+('照會數', '조회수', 7558, 3, 215, 1),
+('不可思議', '불가사의', 7559, 3, 215, 1),
+('大乘', '대승', 7560, 3, 214, 1),
+('聖子', '성자', 7561, 3, 214, 1),
+('大腸', '대장', 7562, 3, 213, 1),
+('出家', '출가', 7563, 3, 213, 1),
+('機長', '기장', 7564, 3, 212, 1),
+('父子', '부자', 7565, 3, 212, 1),
+('中字', '중자', 7566, 3, 212, 1),
+('高所恐怖症', '고소공포증', 7567, 3, 212, 1),
+('擔保物', '담보물', 7568, 3, 211, 1),
+('首弟子', '수제자', 7569, 3, 211, 1),
+('問語', '문어', 7570, 3, 210, 1),
+('合法', '합법', 7571, 3, 210, 1),
+('消防隊長', '소방대장', 7572, 3, 210, 1),
+('生徒', '생도', 7573, 3, 209, 1),
+('卑俗語', '비속어', 7574, 3, 209, 1),
+('唯心論', '유심론', 7575, 3, 209, 1),
+('糖水肉', '탕수육', 7576, 3, 209, 1),
+('束手無策', '속수무책', 7577, 3, 209, 1),
+('大亡', '대망', 7578, 3, 208, 1),
+('家刻本', '가각본', 7579, 3, 208, 1),
+('當分間', '당분간', 7580, 3, 208, 1),
+('小道具', '소도구', 7581, 3, 208, 1),
+('戰法', '전법', 7582, 3, 207, 1),
+('膠着語', '교착어', 7583, 3, 207, 1),
+('戰鬪機', '전투기', 7584, 3, 207, 1),
+('草地', '초지', 7585, 3, 206, 1),
+('綴字法', '철자법', 7586, 3, 206, 1),
+('巨大', '거대', 7587, 3, 205, 1),
+('敎義', '교의', 7588, 3, 205, 1),
+('乳房成形', '유방성형', 7589, 3, 205, 1),
+('機器', '기기', 7590, 3, 204, 1),
+('行實', '행실', 7591, 3, 204, 1),
+('紀念物', '기념물', 7592, 3, 204, 1),
+('略語', '략어', 7593, 3, 203, 1),
+('本文', '본문', 7594, 3, 203, 1),
+('醫生', '의생', 7595, 3, 203, 1),
+('造酒技能士', '조주기능사', 7596, 3, 203, 1),
+('對症 藥劑', '대증 약제', 7597, 3, 202, 1),
+('一面識', '일면식', 7598, 3, 201, 1),
+('大著', '대저', 7599, 3, 200, 1),
+('戰力', '전력', 7600, 3, 200, 1),
+('賣物', '매물', 7601, 3, 199, 1),
+('本音', '본음', 7602, 3, 199, 1),
+('硬直性', '경직성', 7603, 3, 199, 1),
+('延長戰', '연장전', 7604, 3, 199, 1),
+('精神勝利', '정신승리', 7605, 3, 199, 1),
+('端子', '단자', 7606, 3, 197, 1),
+('適地', '적지', 7607, 3, 197, 1),
+('同好會', '동호회', 7608, 3, 197, 1),
+('店主', '점주', 7609, 3, 196, 1),
+('構內食堂', '구내식당', 7610, 3, 196, 1),
+('君子', '군자', 7611, 3, 195, 1),
+('約物', '약물', 7612, 3, 195, 1),
+('決定論', '결정론', 7613, 3, 195, 1),
+('生사람', '생사람', 7614, 3, 195, 1),
+('作業室', '작업실', 7615, 3, 195, 1),
+('低體溫', '저체온', 7616, 3, 195, 1),
+('大蟒', '대망', 7617, 3, 194, 1),
+('厖大', '방대', 7618, 3, 194, 1),
+('溫水', '온수', 7619, 3, 194, 1),
+('假說法', '가설법', 7620, 3, 193, 1),
+('王書房', '왕서방', 7621, 3, 193, 1),
+('精神病', '정신병', 7622, 3, 193, 1),
+('蒙語', '몽어', 7623, 3, 192, 1),
+('語句', '어구', 7624, 3, 192, 1),
+('水豆腐', '수두부', 7625, 3, 192, 1),
+('遂行評價', '수행평가', 7626, 3, 192, 1),
+('享樂産業', '향락산업', 7627, 3, 191, 1),
+('感氣', '감긔', 7628, 3, 190, 1),
+('毒物', '독물', 7629, 3, 190, 1),
+('賣上高', '매상고', 7630, 3, 190, 1),
+('新年辭', '신년사', 7631, 3, 190, 1),
+('公民', '공민', 7632, 3, 189, 1),
+('妓生', '기생', 7633, 3, 189, 1),
+('論爭點', '논쟁점', 7634, 3, 189, 1),
+('害--', '해롭다', 7635, 3, 189, 1),
+('握力計', '악력계', 7636, 3, 188, 1),
+('急-', '급히', 7637, 3, 187, 1),
+('卑語', '비어', 7638, 3, 187, 1),
+('生生', '생생', 7639, 3, 187, 1),
+('生綃', '생초', 7640, 3, 187, 1),
+('水冷', '수랭', 7641, 3, 187, 1),
+('意中', '의중', 7642, 3, 187, 1),
+('陸地', '륙지', 7643, 3, 186, 1),
+('複數形', '복수형', 7644, 3, 186, 1),
+('山有花', '산유화', 7645, 3, 186, 1),
+('相當數', '상당수', 7646, 3, 186, 1),
+('對外貿易', '대외무역', 7647, 3, 186, 1),
+('直四角形', '직사각형', 7648, 3, 186, 1),
+('保證書', '보증서', 7649, 3, 185, 1),
+('四角八方', '사각팔방', 7650, 3, 185, 1),
+('莊子', '장자', 7651, 3, 184, 1),
+('半齒音', '반치음', 7652, 3, 184, 1),
+('必須的', '필수적', 7653, 3, 184, 1),
+('歸還飛行', '귀환비행', 7654, 3, 184, 1),
+('瞳子', '동자', 7655, 3, 183, 1),
+('不信', '불신', 7656, 3, 183, 1),
+('魔法師', '마법사', 7657, 3, 183, 1),
+('義勇艦隊', '의용함대', 7658, 3, 183, 1),
+('酒色雜技', '주색잡기', 7659, 3, 183, 1),
+('入場料', '입장료', 7660, 3, 182, 1),
+('-傷', '속상', 7661, 3, 181, 1),
+('中聲', '중성', 7662, 3, 181, 1),
+('永續性', '영속성', 7663, 3, 181, 1),
+('陸海空', '육해공', 7664, 3, 181, 1),
+('孟子', '맹자', 7665, 3, 180, 1),
+('鄙語', '비어', 7666, 3, 180, 1),
+('議事錄', '의사록', 7667, 3, 180, 1),
+('語塞', '어색', 7668, 3, 179, 1),
+('轉化', '전화', 7669, 3, 179, 1),
+('現行', '현행', 7670, 3, 179, 1),
+('作品集', '작품집', 7671, 3, 179, 1),
+('不應', '불응', 7672, 3, 178, 1),
+('空輸部隊', '공수부대', 7673, 3, 178, 1),
+('甘水', '감수', 7674, 3, 177, 1),
+('水桶', '수통', 7675, 3, 177, 1),
+('整地', '정지', 7676, 3, 177, 1),
+('多讀家', '다독가', 7677, 3, 177, 1),
+('永遠性', '영원성', 7678, 3, 177, 1),
+('何如-', '하여튼', 7679, 3, 177, 1),
+('勞動', '로동', 7680, 3, 176, 1),
+('水田', '수전', 7681, 3, 176, 1),
+('全文', '전문', 7682, 3, 176, 1),
+('輸出品', '수출품', 7683, 3, 176, 1),
+('稀貴性', '희귀성', 7684, 3, 176, 1),
+('高級 脂肪酸', '고급 지방산', 7685, 3, 176, 1),
+('成文', '성문', 7686, 3, 175, 1),
+('習得力', '습득력', 7687, 3, 175, 1),
+('事後', '사후', 7688, 3, 174, 1),
+('鹽水', '염수', 7689, 3, 174, 1),
+('全力', '전력', 7690, 3, 174, 1),
+('外叔母', '외숙모', 7691, 3, 174, 1),
+('血氣', '혈기', 7692, 3, 173, 1),
+('乳母車', '유모차', 7693, 3, 173, 1),
+('銀行券', '은행권', 7694, 3, 173, 1),
+('凝集力', '응집력', 7695, 3, 173, 1),
+('判斷力', '판단력', 7696, 3, 173, 1),
+('案內所', '안내소', 7697, 3, 172, 1),
+('自由自在', '자유자재', 7698, 3, 172, 1),
+('汚水', '오수', 7699, 3, 171, 1),
+('故意四球', '고의사구', 7700, 3, 171, 1),
+('成分', '성분', 7701, 3, 170, 1),
+('荷物', '하물', 7702, 3, 170, 1),
+('栽培地', '재배지', 7703, 3, 170, 1),
+('下半身', '하반신', 7704, 3, 170, 1),
+('根性', '근성', 7705, 3, 169, 1),
+('白沙場', '백사장', 7706, 3, 169, 1),
+('不撤晝夜', '불철주야', 7707, 3, 169, 1),
+('軍神', '군신', 7708, 3, 168, 1),
+('美術品', '미술품', 7709, 3, 168, 1),
+('供物', '공물', 7710, 3, 167, 1),
+('僻地', '벽지', 7711, 3, 167, 1),
+('水剌', '수라', 7712, 3, 166, 1),
+('水槽', '수조', 7713, 3, 165, 1),
+('奧地', '오지', 7714, 3, 165, 1),
+('紀念日', '기념일', 7715, 3, 165, 1),
+('永久性', '영구성', 7716, 3, 165, 1),
+('水塘', '수당', 7717, 3, 163, 1),
+('菽水', '숙수', 7718, 3, 163, 1),
+('長打率', '장타율', 7719, 3, 163, 1),
+('定期市', '정기시', 7720, 3, 163, 1),
+('蒸氣船', '증기선', 7721, 3, 163, 1),
+('一方', '일방', 7722, 3, 162, 1),
+('正色', '정색', 7723, 3, 162, 1),
+('行首', '행수', 7724, 3, 161, 1),
+('鄕土 民謠', '향토 민요', 7725, 3, 161, 1),
+('美女', '미녀', 7726, 3, 160, 1),
+('白業', '백업', 7727, 3, 160, 1),
+('正月', '정월', 7728, 3, 160, 1),
+('不良輩', '불량배', 7729, 3, 160, 1),
+('高手', '고수', 7730, 3, 159, 1),
+('戰車', '전차', 7731, 3, 159, 1),
+('漫畫家', '만화가', 7732, 3, 159, 1),
+('打擊數', '타격수', 7733, 3, 159, 1),
+('血小板', '혈소판', 7734, 3, 159, 1),
+('和音', '화음', 7735, 3, 158, 1),
+('官能美', '관능미', 7736, 3, 157, 1),
+('點對稱', '점대칭', 7737, 3, 157, 1),
+('六鎭方言', '육진방언', 7738, 3, 157, 1),
+('冶動', '야동', 7739, 3, 156, 1),
+('要義', '요의', 7740, 3, 156, 1),
+('海員', '해원', 7741, 3, 156, 1),
+('好不好', '호불호', 7742, 3, 156, 1),
+('土氣', '토기', 7743, 3, 155, 1),
+('暴力輩', '폭력배', 7744, 3, 155, 1),
+('名詞', '명사', 7745, 3, 154, 1),
+('手入', '수입', 7746, 3, 154, 1),
+('惡書', '악서', 7747, 3, 154, 1),
+('中將', '중장', 7748, 3, 154, 1),
+('巨文島', '거문도', 7749, 3, 154, 1),
+('公報院', '공보원', 7750, 3, 154, 1),
+('老婆心', '노파심', 7751, 3, 154, 1),
+('四角形', '사각형', 7752, 3, 154, 1),
+('—宮合', '속궁합', 7753, 3, 154, 1),
+('外紙', '외지', 7754, 3, 153, 1),
+('長期', '장기', 7755, 3, 153, 1),
+('靑南方', '청남방', 7756, 3, 153, 1),
+('米作豫想', '미작예상', 7757, 3, 153, 1),
+('鹽化', '염화', 7758, 3, 152, 1),
+('移行', '이행', 7759, 3, 152, 1),
+('表音', '표음', 7760, 3, 152, 1),
+('二元論', '이원론', 7761, 3, 152, 1),
+('五色雜‒', '오색잡놈', 7762, 3, 152, 1),
+('高所', '고소', 7763, 3, 151, 1),
+('等分', '등분', 7764, 3, 151, 1),
+('原石', '원석', 7765, 3, 151, 1),
+('戰時', '전시', 7766, 3, 151, 1),
+('五音', '오음', 7767, 3, 150, 1),
+('電工', '전공', 7768, 3, 150, 1),
+('敎員', '교원', 7769, 3, 149, 1),
+('裸體', '나체', 7770, 3, 149, 1),
+('同感', '동감', 7771, 3, 149, 1),
+('裸體', '라체', 7772, 3, 149, 1),
+('屍體', '시체', 7773, 3, 149, 1),
+('消防車', '소방차', 7774, 3, 149, 1),
+('伸長位', '신장위', 7775, 3, 149, 1),
+('製鐵所', '제철소', 7776, 3, 149, 1),
+('百日', '백일', 7777, 3, 148, 1),
+('分校', '분교', 7778, 3, 148, 1),
+('音價', '음가', 7779, 3, 148, 1),
+('天馬', '천마', 7780, 3, 148, 1),
+('端末機', '단말기', 7781, 3, 147, 1),
+('蔓衍體', '만연체', 7782, 3, 147, 1),
+('念力', '염력', 7783, 3, 146, 1),
+('例文', '예문', 7784, 3, 146, 1),
+('外界', '외계', 7785, 3, 146, 1),
+('對話房', '대화방', 7786, 3, 146, 1),
+('異敎徒', '이교도', 7787, 3, 146, 1),
+('有價證券', '유가증권', 7788, 3, 146, 1),
+('글體', '글체', 7789, 3, 145, 1),
+('斜行', '사행', 7790, 3, 145, 1),
+('年期', '연기', 7791, 3, 145, 1),
+('海兵', '해병', 7792, 3, 145, 1),
+('長斫—', '장작불', 7793, 3, 145, 1),
+('氣像', '기상', 7794, 3, 144, 1),
+('不況', '불황', 7795, 3, 144, 1),
+('司法', '사법', 7796, 3, 144, 1),
+('小字', '소자', 7797, 3, 144, 1),
+('政敎', '정교', 7798, 3, 144, 1),
+('工藝品', '공예품', 7799, 3, 144, 1),
+('守護神', '수호신', 7800, 3, 144, 1),
+('政府軍', '정부군', 7801, 3, 144, 1),
+('下宿房', '하숙방', 7802, 3, 143, 1),
+('海賊船', '해적선', 7803, 3, 143, 1),
+('色情', '색정', 7804, 3, 142, 1),
+('外商', '외상', 7805, 3, 142, 1),
+('中肢', '중지', 7806, 3, 142, 1),
+('心筋梗塞', '심근경색', 7807, 3, 142, 1),
+('私心', '사심', 7808, 3, 141, 1),
+('新正', '신정', 7809, 3, 141, 1),
+('靈氣', '영기', 7810, 3, 141, 1),
+('緩行', '완행', 7811, 3, 141, 1),
+('外城', '외성', 7812, 3, 141, 1),
+('東問西答', '동문서답', 7813, 3, 141, 1),
+('撮影臺本', '촬영대본', 7814, 3, 141, 1),
+('上世', '상세', 7815, 3, 140, 1),
+('行李', '행리', 7816, 3, 140, 1),
+('一般席', '일반석', 7817, 3, 140, 1),
+('爬行', '파행', 7818, 3, 139, 1),
+('抗日', '항일', 7819, 3, 139, 1),
+('冠形詞', '관형사', 7820, 3, 139, 1),
+('隊長', '대장', 7821, 3, 138, 1),
+('事案', '사안', 7822, 3, 138, 1),
+('常民', '상민', 7823, 3, 138, 1),
+('署理', '서리', 7824, 3, 138, 1),
+('脚線美', '각선미', 7825, 3, 138, 1),
+('口訣字', '구결자', 7826, 3, 138, 1),
+('防衛軍', '방위군', 7827, 3, 138, 1),
+('呼吸器', '호흡기', 7828, 3, 138, 1),
+('事態', '사태', 7829, 3, 137, 1),
+('字母', '자모', 7830, 3, 137, 1),
+('戰火', '전화', 7831, 3, 137, 1),
+('祭日', '제일', 7832, 3, 137, 1),
+('四輪車', '사륜차', 7833, 3, 137, 1),
+('豫備軍', '예비군', 7834, 3, 137, 1),
+('聽力', '청력', 7835, 3, 136, 1),
+('船着場', '선착장', 7836, 3, 136, 1),
+('四方八方', '사방팔방', 7837, 3, 136, 1),
+('古代', '고대', 7838, 3, 135, 1),
+('賣票所', '매표소', 7839, 3, 135, 1),
+('電信케블', '전신케블', 7840, 3, 135, 1),
+('聖女', '성녀', 7841, 3, 134, 1),
+('修女', '수녀', 7842, 3, 134, 1),
+('福音', '복음', 7843, 3, 133, 1),
+('事由', '사유', 7844, 3, 133, 1),
+('店長', '점장', 7845, 3, 133, 1),
+('天蠍宮', '천갈궁', 7846, 3, 133, 1),
+('高熱', '고열', 7847, 3, 132, 1),
+('民營', '민영', 7848, 3, 132, 1),
+('外貨', '외화', 7849, 3, 132, 1),
+('朝會', '조회', 7850, 3, 132, 1),
+('卽日', '즉일', 7851, 3, 132, 1),
+('解像度', '해상도', 7852, 3, 132, 1),
+('乳名', '유명', 7853, 3, 131, 1),
+('日曆', '일력', 7854, 3, 131, 1),
+('持分', '지분', 7855, 3, 131, 1),
+('道廳', '도청', 7856, 3, 130, 1),
+('威力', '위력', 7857, 3, 130, 1),
+('過勞死', '과로사', 7858, 3, 130, 1),
+('請求書', '청구서', 7859, 3, 130, 1),
+('家系', '가계', 7860, 3, 129, 1),
+('坑道', '갱도', 7861, 3, 129, 1),
+('工作', '공작', 7862, 3, 129, 1),
+('熱愛', '열애', 7863, 3, 129, 1),
+('丁力', '정력', 7864, 3, 129, 1),
+('天基', '천기', 7865, 3, 129, 1),
+('保健所', '보건소', 7866, 3, 129, 1),
+('衣食住', '의식주', 7867, 3, 129, 1),
+('航空料', '항공료', 7868, 3, 129, 1),
+('硬直結腸炎', '경직결장염', 7869, 3, 129, 1),
+('高利', '고리', 7870, 3, 128, 1),
+('同期', '동기', 7871, 3, 128, 1),
+('無禮', '무례', 7872, 3, 128, 1),
+('文壇', '문단', 7873, 3, 128, 1),
+('留心', '유심', 7874, 3, 128, 1),
+('天旗', '천기', 7875, 3, 128, 1),
+('無勝負', '무승부', 7876, 3, 128, 1),
+('發泡酒', '발포주', 7877, 3, 128, 1),
+('謝禮金', '사례금', 7878, 3, 128, 1),
+('高官', '고관', 7879, 3, 127, 1),
+('法嗣', '법사', 7880, 3, 127, 1),
+('原形', '원형', 7881, 3, 127, 1),
+('逸事', '일사', 7882, 3, 127, 1),
+('藝術品', '예술품', 7883, 3, 127, 1),
+('總祕書', '총비서', 7884, 3, 127, 1),
+('醫療保險證', '의료보험증', 7885, 3, 127, 1),
+('本調', '본조', 7886, 3, 126, 1),
+('業王', '업왕', 7887, 3, 126, 1),
+('指名', '지명', 7888, 3, 126, 1),
+('分段', '분단', 7889, 3, 125, 1),
+('接戰', '접전', 7890, 3, 125, 1),
+('次數', '차수', 7891, 3, 125, 1),
+('分納', '분납', 7892, 3, 124, 1),
+('外衣', '외의', 7893, 3, 124, 1),
+('天堂', '천당', 7894, 3, 124, 1),
+('粉碎機', '분쇄기', 7895, 3, 124, 1),
+('低級 脂肪酸', '저급 지방산', 7896, 3, 124, 1),
+('民衆', '민중', 7897, 3, 123, 1),
+('病期', '병기', 7898, 3, 123, 1),
+('三光', '삼광', 7899, 3, 123, 1),
+('狹義', '협의', 7900, 3, 123, 1),
+('歌曲集', '가곡집', 7901, 3, 123, 1),
+('茶褐色', '다갈색', 7902, 3, 123, 1),
+('日', '일', 7903, 3, 122, 1),
+('氣槪', '기개', 7904, 3, 122, 1),
+('配電', '배전', 7905, 3, 122, 1),
+('握力', '악력', 7906, 3, 122, 1),
+('諺文', '언문', 7907, 3, 122, 1),
+('天魔', '천마', 7908, 3, 122, 1),
+('天皇', '천황', 7909, 3, 122, 1),
+('出壘', '출루', 7910, 3, 122, 1),
+('噴氣', '분기', 7911, 3, 121, 1),
+('心魂', '심혼', 7912, 3, 121, 1),
+('儒家', '유가', 7913, 3, 121, 1),
+('丈家', '장가', 7914, 3, 121, 1),
+('呪文', '주문', 7915, 3, 121, 1),
+('天紀', '천기', 7916, 3, 121, 1),
+('文', '문', 7917, 3, 120, 1),
+('公表', '공표', 7918, 3, 120, 1),
+('同社', '동사', 7919, 3, 120, 1),
+('名盤', '명반', 7920, 3, 120, 1),
+('善女', '선녀', 7921, 3, 120, 1),
+('有線', '유선', 7922, 3, 120, 1),
+('戰隊', '전대', 7923, 3, 120, 1),
+('茶色', '차색', 7924, 3, 120, 1),
+('平原', '평원', 7925, 3, 120, 1),
+('會費', '회비', 7926, 3, 120, 1),
+('未婚母', '미혼모', 7927, 3, 120, 1),
+('下肢帶', '하지대', 7928, 3, 120, 1),
+('竹馬古友', '죽마고우', 7929, 3, 120, 1),
+('草原수리', '초원수리', 7930, 3, 120, 1),
+('義', '의', 7931, 3, 119, 1),
+('馬車', '마차', 7932, 3, 119, 1),
+('想定', '상정', 7933, 3, 119, 1),
+('車馬', '차마', 7934, 3, 119, 1),
+('建設業', '건설업', 7935, 3, 119, 1),
+('警備員', '경비원', 7936, 3, 119, 1),
+('忍耐心', '인내심', 7937, 3, 119, 1),
+('資料集', '자료집', 7938, 3, 119, 1),
+('副司令官', '부사령관', 7939, 3, 119, 1),
+('家閥', '가벌', 7940, 3, 118, 1),
+('路上', '노상', 7941, 3, 118, 1),
+('臺本', '대본', 7942, 3, 118, 1),
+('食單', '식단', 7943, 3, 118, 1),
+('新種', '신종', 7944, 3, 118, 1),
+('夜食', '야식', 7945, 3, 118, 1),
+('濕式暖房', '습식난방', 7946, 3, 118, 1),
+('訃音', '부음', 7947, 3, 117, 1),
+('政權', '정권', 7948, 3, 117, 1),
+('八字', '팔자', 7949, 3, 117, 1),
+('下位', '하위', 7950, 3, 117, 1),
+('俱樂部', '구락부', 7951, 3, 117, 1),
+('調査官', '조사관', 7952, 3, 117, 1),
+('無終', '무종', 7953, 3, 116, 1),
+('誠心', '성심', 7954, 3, 116, 1),
+('鑑定價', '감정가', 7955, 3, 115, 1),
+('四邊形', '사변형', 7956, 3, 115, 1),
+('愚民', '우민', 7957, 3, 114, 1),
+('入聲', '입성', 7958, 3, 114, 1),
+('記憶術', '기억술', 7959, 3, 114, 1),
+('赤褐色', '적갈색', 7960, 3, 114, 1),
+('濕式煖房', '습식난방', 7961, 3, 114, 1),
+('血緣關係', '혈연관계', 7962, 3, 114, 1),
+('軍團', '군단', 7963, 3, 113, 1),
+('單發', '단발', 7964, 3, 113, 1),
+('當代', '당대', 7965, 3, 113, 1),
+('活字', '활자', 7966, 3, 113, 1),
+('豫備兵', '예비병', 7967, 3, 113, 1),
+('計量', '계량', 7968, 3, 112, 1),
+('空賣渡', '공매도', 7969, 3, 112, 1),
+('冰上館', '빙상관', 7970, 3, 112, 1),
+('適當量', '적당량', 7971, 3, 112, 1),
+('翻譯借用', '번역차용', 7972, 3, 112, 1),
+('畵龍點睛', '화룡점정', 7973, 3, 112, 1),
+('球種', '구종', 7974, 3, 111, 1),
+('手筋', '수근', 7975, 3, 111, 1),
+('食費', '식비', 7976, 3, 111, 1),
+('作別', '작별', 7977, 3, 111, 1),
+('電壓', '전압', 7978, 3, 111, 1),
+('衷心', '충심', 7979, 3, 111, 1),
+('彈藥桶', '탄약통', 7980, 3, 111, 1),
+('鬼女', '귀녀', 7981, 3, 110, 1),
+('唯一', '유일', 7982, 3, 110, 1),
+('半信半疑', '반신반의', 7983, 3, 110, 1),
+('民泊', '민박', 7984, 3, 109, 1),
+('手寫', '수사', 7985, 3, 109, 1),
+('助敎', '조교', 7986, 3, 109, 1),
+('造作', '조작', 7987, 3, 109, 1),
+('換節期', '환절기', 7988, 3, 109, 1),
+('轉換 治療', '전환 치료', 7989, 3, 109, 1),
+('山城', '산성', 7990, 3, 108, 1),
+('玉色', '옥색', 7991, 3, 108, 1),
+('長承', '장승', 7992, 3, 108, 1),
+('定價', '정가', 7993, 3, 108, 1),
+('千年', '천년', 7994, 3, 108, 1),
+('强速球', '강속구', 7995, 3, 108, 1),
+('娛樂室', '오락실', 7996, 3, 108, 1),
+('突發', '돌발', 7997, 3, 107, 1),
+('資本', '자본', 7998, 3, 107, 1),
+('接線', '접선', 7999, 3, 107, 1),
+('養蜂場', '양봉장', 8000, 3, 107, 1),
+('罪意識', '죄의식', 8001, 3, 107, 1),
+('合緣奇緣', '합연기연', 8002, 3, 107, 1),
+('脊椎起立筋', '척추기립근', 8003, 3, 107, 1),
+('全集', '전집', 8004, 3, 106, 1),
+('整備員', '정비원', 8005, 3, 106, 1),
+('褒賞金', '포상금', 8006, 3, 106, 1),
+('南極', '남극', 8007, 3, 105, 1),
+('論述', '논술', 8008, 3, 105, 1),
+('賞金', '상금', 8009, 3, 105, 1),
+('色慾', '색욕', 8010, 3, 105, 1),
+('二三', '이삼', 8011, 3, 105, 1),
+('入團', '입단', 8012, 3, 105, 1),
+('海底', '해저', 8013, 3, 105, 1),
+('信號銃', '신호총', 8014, 3, 105, 1),
+('敎派', '교파', 8015, 3, 104, 1),
+('軍令', '군령', 8016, 3, 104, 1),
+('半期', '반기', 8017, 3, 104, 1),
+('細字', '세자', 8018, 3, 104, 1),
+('奇石', '기석', 8019, 3, 103, 1),
+('論壇', '논단', 8020, 3, 103, 1),
+('論壇', '론단', 8021, 3, 103, 1),
+('名匠', '명장', 8022, 3, 103, 1),
+('山積', '산적', 8023, 3, 103, 1),
+('眞正', '진정', 8024, 3, 103, 1),
+('打點', '타점', 8025, 3, 103, 1),
+('獻金', '헌금', 8026, 3, 103, 1),
+('魔術師', '마술사', 8027, 3, 103, 1),
+('下宿屋', '하숙옥', 8028, 3, 103, 1),
+('休憩所', '휴게소', 8029, 3, 103, 1),
+('星形', '성형', 8030, 3, 102, 1),
+('熱度', '열도', 8031, 3, 102, 1),
+('傭書', '용서', 8032, 3, 102, 1),
+('遊山', '유산', 8033, 3, 102, 1),
+('畫面', '화면', 8034, 3, 102, 1),
+('童話集', '동화집', 8035, 3, 102, 1),
+('卽位式', '즉위식', 8036, 3, 102, 1),
+('醵出', '갹출', 8037, 3, 101, 1),
+('神仙', '신선', 8038, 3, 101, 1),
+('小確幸', '소확행', 8039, 3, 101, 1),
+('血液型', '혈액형', 8040, 3, 101, 1),
+('公判', '공판', 8041, 3, 100, 1),
+('敎條', '교조', 8042, 3, 100, 1),
+('陸上', '육상', 8043, 3, 100, 1),
+('臟器', '장기', 8044, 3, 100, 1),
+('和平', '화평', 8045, 3, 100, 1),
+('慣用句', '관용구', 8046, 3, 100, 1),
+('在野黨', '재야당', 8047, 3, 100, 1),
+('特級市', '특급시', 8048, 3, 100, 1),
+('守口如甁', '수구여병', 8049, 3, 100, 1),
+('女', '녀', 8050, 3, 99, 1),
+('女媧', '여와', 8051, 3, 99, 1),
+('記念碑', '기념비', 8052, 3, 99, 1),
+('基點', '기점', 8053, 3, 98, 1),
+('北極', '북극', 8054, 3, 98, 1),
+('海拔', '해발', 8055, 3, 98, 1),
+('球速', '구속', 8056, 3, 97, 1),
+('軍談', '군담', 8057, 3, 97, 1),
+('東部', '동부', 8058, 3, 97, 1),
+('白雪', '백설', 8059, 3, 97, 1),
+('初球', '초구', 8060, 3, 97, 1),
+('極光', '극광', 8061, 3, 96, 1),
+('微小', '미소', 8062, 3, 96, 1),
+('白齒', '백치', 8063, 3, 96, 1),
+('八方', '팔방', 8064, 3, 96, 1),
+('豊年', '풍년', 8065, 3, 96, 1),
+('同歸於盡', '동귀어진', 8066, 3, 96, 1),
+('論', '논', 8067, 3, 95, 1),
+('論', '론', 8068, 3, 95, 1),
+('軍票', '군표', 8069, 3, 95, 1),
+('本座', '본좌', 8070, 3, 95, 1),
+('量産', '양산', 8071, 3, 95, 1),
+('凶器', '흉기', 8072, 3, 95, 1),
+('漫畫房', '만화방', 8073, 3, 95, 1),
+('尊嚴死', '존엄사', 8074, 3, 95, 1),
+('威風堂堂', '위풍당당', 8075, 3, 95, 1),
+('高低', '고저', 8076, 3, 94, 1),
+('軍費', '군비', 8077, 3, 94, 1),
+('東方', '동방', 8078, 3, 94, 1),
+('融合', '융합', 8079, 3, 94, 1),
+('奬勵金', '장려금', 8080, 3, 94, 1),
+('稀貴病', '희귀병', 8081, 3, 94, 1),
+('紺色', '감색', 8082, 3, 93, 1),
+('高飛', '고비', 8083, 3, 93, 1),
+('곤色', '곤색', 8084, 3, 93, 1),
+('敎卓', '교탁', 8085, 3, 93, 1),
+('時差', '시차', 8086, 3, 93, 1),
+('新型', '신형', 8087, 3, 93, 1),
+('壓死', '압사', 8088, 3, 93, 1),
+('姨母夫', '이모부', 8089, 3, 93, 1),
+('公訴', '공소', 8090, 3, 92, 1),
+('對格', '대격', 8091, 3, 92, 1),
+('徒死', '도사', 8092, 3, 92, 1),
+('命門', '명문', 8093, 3, 92, 1),
+('病兒', '병아', 8094, 3, 92, 1),
+('山田', '산전', 8095, 3, 92, 1),
+('貯金', '저금', 8096, 3, 92, 1),
+('切感', '절감', 8097, 3, 92, 1),
+('口峽炎', '구협염', 8098, 3, 92, 1),
+('紅衛兵', '홍위병', 8099, 3, 92, 1),
+('黨員', '당원', 8100, 3, 91, 1),
+('詩作', '시작', 8101, 3, 91, 1),
+('電鈴', '전령', 8102, 3, 91, 1),
+('賊反荷杖', '적반하장', 8103, 3, 91, 1),
+('公憤', '공분', 8104, 3, 90, 1),
+('空爆', '공폭', 8105, 3, 90, 1),
+('老兵', '로병', 8106, 3, 90, 1),
+('兵隊', '병대', 8107, 3, 90, 1),
+('異意', '이의', 8108, 3, 90, 1),
+('全市', '전시', 8109, 3, 90, 1),
+('鑄型工', '주형공', 8110, 3, 90, 1),
+('標識板', '표지판', 8111, 3, 90, 1),
+('感染', '감염', 8112, 3, 89, 1),
+('上述', '상술', 8113, 3, 89, 1),
+('小兒', '소아', 8114, 3, 89, 1),
+('愛鳥', '애조', 8115, 3, 89, 1),
+('遊記', '유기', 8116, 3, 89, 1),
+('接種', '접종', 8117, 3, 89, 1),
+('袖珍本', '수진본', 8118, 3, 89, 1),
+('領官', '영관', 8119, 3, 88, 1),
+('表意', '표의', 8120, 3, 88, 1),
+('解題', '해제', 8121, 3, 88, 1),
+('志願兵', '지원병', 8122, 3, 88, 1),
+('期約', '기약', 8123, 3, 87, 1),
+('對聯', '대련', 8124, 3, 87, 1),
+('叛軍', '반군', 8125, 3, 87, 1),
+('修士', '수사', 8126, 3, 87, 1),
+('聯合', '연합', 8127, 3, 87, 1),
+('流域', '유역', 8128, 3, 87, 1),
+('螺旋形', '나선형', 8129, 3, 87, 1),
+('反切', '반절', 8130, 3, 86, 1),
+('山谷', '산곡', 8131, 3, 86, 1),
+('業績', '업적', 8132, 3, 86, 1),
+('秋風', '추풍', 8133, 3, 86, 1),
+('角雪糖', '각설탕', 8134, 3, 86, 1),
+('改詞', '개사', 8135, 3, 85, 1),
+('多情', '다정', 8136, 3, 85, 1),
+('洞內', '동내', 8137, 3, 85, 1),
+('等式', '등식', 8138, 3, 85, 1),
+('背反', '배반', 8139, 3, 85, 1),
+('詞林', '사림', 8140, 3, 85, 1),
+('上卷', '상권', 8141, 3, 85, 1),
+('偉業', '위업', 8142, 3, 85, 1),
+('有毒', '유독', 8143, 3, 85, 1),
+('戰禍', '전화', 8144, 3, 85, 1),
+('畫質', '화질', 8145, 3, 85, 1),
+('賣春婦', '매춘부', 8146, 3, 85, 1),
+('朝鮮族', '조선족', 8147, 3, 85, 1),
+('教員', '교원', 8148, 3, 84, 1),
+('木馬', '목마', 8149, 3, 84, 1),
+('山莊', '산장', 8150, 3, 84, 1),
+('蒼白', '창백', 8151, 3, 84, 1),
+('後略', '후략', 8152, 3, 84, 1),
+('接尾辭', '접미사', 8153, 3, 84, 1),
+('得意揚揚', '득의양양', 8154, 3, 84, 1),
+('更新', '갱신', 8155, 3, 83, 1),
+('牧場', '목장', 8156, 3, 83, 1),
+('本디', '본디', 8157, 3, 83, 1),
+('緖戰', '서전', 8158, 3, 83, 1),
+('愛犬', '애견', 8159, 3, 83, 1),
+('兩面', '양면', 8160, 3, 83, 1),
+('利用', '이용', 8161, 3, 83, 1),
+('採點', '채점', 8162, 3, 83, 1),
+('草木', '초목', 8163, 3, 83, 1),
+('過呼吸', '과호흡', 8164, 3, 83, 1),
+('短篇集', '단편집', 8165, 3, 83, 1),
+('記章', '기장', 8166, 3, 82, 1),
+('同仁', '동인', 8167, 3, 82, 1),
+('反則', '반칙', 8168, 3, 82, 1),
+('上洛', '상락', 8169, 3, 82, 1),
+('助詞', '조사', 8170, 3, 82, 1),
+('眞相', '진상', 8171, 3, 82, 1),
+('泉下', '천하', 8172, 3, 82, 1),
+('風聞', '풍문', 8173, 3, 82, 1),
+('로마字', '로마자', 8174, 3, 82, 1),
+('防禦率', '방어율', 8175, 3, 82, 1),
+('切斷魔功', '절단마공', 8176, 3, 82, 1),
+('橫斷陸橋', '횡단육교', 8177, 3, 82, 1),
+('經過', '경과', 8178, 3, 81, 1),
+('空講', '공강', 8179, 3, 81, 1),
+('同輩', '동배', 8180, 3, 81, 1),
+('美貨', '미화', 8181, 3, 81, 1),
+('崇高', '숭고', 8182, 3, 81, 1),
+('壓政', '압정', 8183, 3, 81, 1),
+('罪惡', '죄악', 8184, 3, 81, 1),
+('酒類', '주류', 8185, 3, 81, 1),
+('多細胞', '다세포', 8186, 3, 81, 1),
+('三冬', '삼동', 8187, 3, 80, 1),
+('職位', '직위', 8188, 3, 80, 1),
+('集落', '집락', 8189, 3, 80, 1),
+('品切', '품절', 8190, 3, 80, 1),
+('虛空', '허공', 8191, 3, 80, 1),
+('痼疾病', '고질병', 8192, 3, 80, 1),
+('受精卵', '수정란', 8193, 3, 80, 1),
+('夜盲症', '야맹증', 8194, 3, 80, 1),
+('當社', '당사', 8195, 3, 79, 1),
+('補藥', '보약', 8196, 3, 79, 1),
+('說話', '설화', 8197, 3, 79, 1),
+('屋內', '옥내', 8198, 3, 79, 1),
+('早死', '조사', 8199, 3, 79, 1),
+('解脫', '해탈', 8200, 3, 79, 1),
+('敍情詩', '서정시', 8201, 3, 79, 1),
+('閣下', '각하', 8202, 3, 78, 1),
+('戀愛', '련애', 8203, 3, 78, 1),
+('命運', '명운', 8204, 3, 78, 1),
+('配管', '배관', 8205, 3, 78, 1),
+('適量', '적량', 8206, 3, 78, 1),
+('初聲', '초성', 8207, 3, 78, 1),
+('追後', '추후', 8208, 3, 78, 1),
+('球威', '구위', 8209, 3, 77, 1),
+('낱字', '낱자', 8210, 3, 77, 1),
+('內裏', '내리', 8211, 3, 77, 1),
+('獨房', '독방', 8212, 3, 77, 1),
+('明卵', '명란', 8213, 3, 77, 1),
+('瀉下', '사하', 8214, 3, 77, 1),
+('鮮血', '선혈', 8215, 3, 77, 1),
+('太極', '태극', 8216, 3, 77, 1),
+('強酸', '강산', 8217, 3, 76, 1),
+('古都', '고도', 8218, 3, 76, 1),
+('保溫', '보온', 8219, 3, 76, 1),
+('四骨', '사골', 8220, 3, 76, 1),
+('腎病', '신병', 8221, 3, 76, 1),
+('惡談', '악담', 8222, 3, 76, 1),
+('額面', '액면', 8223, 3, 76, 1),
+('維新', '유신', 8224, 3, 76, 1),
+('前略', '전략', 8225, 3, 76, 1),
+('八表', '팔표', 8226, 3, 76, 1),
+('庫間', '곳간', 8227, 3, 75, 1),
+('惡德', '악덕', 8228, 3, 75, 1),
+('制壓', '제압', 8229, 3, 75, 1),
+('重態', '중태', 8230, 3, 75, 1),
+('花菜', '화채', 8231, 3, 75, 1),
+('三枝槍', '삼지창', 8232, 3, 75, 1),
+('後斂句', '후렴구', 8233, 3, 75, 1),
+('架空', '가공', 8234, 3, 74, 1),
+('高喊', '고함', 8235, 3, 74, 1),
+('藥材', '약재', 8236, 3, 74, 1),
+('畫報', '화보', 8237, 3, 74, 1),
+('抒情詩', '서정시', 8238, 3, 74, 1),
+('強要', '강요', 8239, 3, 73, 1),
+('私和', '사화', 8240, 3, 73, 1),
+('善意', '선의', 8241, 3, 73, 1),
+('元素', '원소', 8242, 3, 73, 1),
+('資質', '자질', 8243, 3, 73, 1),
+('獻血', '헌혈', 8244, 3, 73, 1),
+('好守備', '호수비', 8245, 3, 73, 1),
+('古琴', '고금', 8246, 3, 72, 1),
+('待期', '대기', 8247, 3, 72, 1),
+('消防', '소방', 8248, 3, 72, 1),
+('習知', '습지', 8249, 3, 72, 1),
+('愛嬌', '애교', 8250, 3, 72, 1),
+('愛猫', '애묘', 8251, 3, 72, 1),
+('禮節', '예절', 8252, 3, 72, 1),
+('畵質', '화질', 8253, 3, 72, 1),
+('變德스럽다', '변덕스럽다', 8254, 3, 72, 1),
+('矯正', '교정', 8255, 3, 71, 1),
+('納品', '납품', 8256, 3, 71, 1),
+('燈光', '등광', 8257, 3, 71, 1),
+('史話', '사화', 8258, 3, 71, 1),
+('想念', '상념', 8259, 3, 71, 1),
+('轢死', '역사', 8260, 3, 71, 1),
+('要望', '요망', 8261, 3, 71, 1),
+('從北', '종북', 8262, 3, 71, 1),
+('酒店', '주점', 8263, 3, 71, 1),
+('太陽椒', '태양초', 8264, 3, 71, 1),
+('愛', '애', 8265, 3, 70, 1),
+('奸計', '간계', 8266, 3, 70, 1),
+('工匠', '공창', 8267, 3, 70, 1),
+('南側', '남측', 8268, 3, 70, 1),
+('雙方', '쌍방', 8269, 3, 70, 1),
+('嶺南', '영남', 8270, 3, 70, 1),
+('爾時', '이시', 8271, 3, 70, 1),
+('職務', '직무', 8272, 3, 70, 1),
+('初老', '초로', 8273, 3, 70, 1),
+('親族', '친족', 8274, 3, 70, 1),
+('漢服', '한복', 8275, 3, 70, 1),
+('倂殺打', '병살타', 8276, 3, 70, 1),
+('細胞核', '세포핵', 8277, 3, 70, 1),
+('正', '정', 8278, 3, 69, 1),
+('可知', '가지', 8279, 3, 69, 1),
+('骨格', '골격', 8280, 3, 69, 1),
+('滿身', '만신', 8281, 3, 69, 1),
+('純血', '순혈', 8282, 3, 69, 1),
+('信徒', '신도', 8283, 3, 69, 1),
+('惡童', '악동', 8284, 3, 69, 1),
+('野黨', '야당', 8285, 3, 69, 1),
+('弱酸', '약산', 8286, 3, 69, 1),
+('藥效', '약효', 8287, 3, 69, 1),
+('利條', '이조', 8288, 3, 69, 1),
+('接辭', '접사', 8289, 3, 69, 1),
+('近接', '근접', 8290, 3, 68, 1),
+('對照', '대조', 8291, 3, 68, 1),
+('配當', '배당', 8292, 3, 68, 1),
+('西紀', '서기', 8293, 3, 68, 1),
+('聖父', '성부', 8294, 3, 68, 1),
+('傳單', '전단', 8295, 3, 68, 1),
+('可觀', '가관', 8296, 3, 67, 1),
+('間奏', '간주', 8297, 3, 67, 1),
+('當選', '당선', 8298, 3, 67, 1),
+('等級', '등급', 8299, 3, 67, 1),
+('例證', '예증', 8300, 3, 67, 1),
+('全般', '전반', 8301, 3, 67, 1),
+('弔詞', '조사', 8302, 3, 67, 1),
+('朝漢', '조한', 8303, 3, 67, 1),
+('鎭火', '진화', 8304, 3, 67, 1),
+('湯種', '탕종', 8305, 3, 67, 1),
+('呼應', '호응', 8306, 3, 67, 1),
+('考試院', '고시원', 8307, 3, 67, 1),
+('故鄕—', '고향집', 8308, 3, 67, 1),
+('腹直筋', '복직근', 8309, 3, 67, 1),
+('診察臺', '진찰대', 8310, 3, 67, 1),
+('聲區', '성구', 8311, 3, 66, 1),
+('運送', '운송', 8312, 3, 66, 1),
+('異見', '이견', 8313, 3, 66, 1),
+('寒熱', '한열', 8314, 3, 66, 1),
+('花冠', '화관', 8315, 3, 66, 1),
+('訪問客', '방문객', 8316, 3, 66, 1),
+('選擧區', '선거구', 8317, 3, 66, 1),
+('鎭痛劑', '진통제', 8318, 3, 66, 1),
+('通', '통', 8319, 3, 65, 1),
+('庫房', '고방', 8320, 3, 65, 1),
+('頭巾', '두건', 8321, 3, 65, 1),
+('善男', '선남', 8322, 3, 65, 1),
+('銀魚', '은어', 8323, 3, 65, 1),
+('土着', '토착', 8324, 3, 65, 1),
+('土炭', '토탄', 8325, 3, 65, 1),
+('核酸', '핵산', 8326, 3, 65, 1),
+('工巧', '공교', 8327, 3, 64, 1),
+('落望', '낙망', 8328, 3, 64, 1),
+('雅樂', '아악', 8329, 3, 64, 1),
+('遊說', '유세', 8330, 3, 64, 1),
+('意慾', '의욕', 8331, 3, 64, 1),
+('戶口', '호구', 8332, 3, 64, 1),
+('畫像', '화상', 8333, 3, 64, 1),
+('健忘症', '건망증', 8334, 3, 64, 1),
+('芳香族', '방향족', 8335, 3, 64, 1),
+('鑄型油', '주형유', 8336, 3, 64, 1),
+('強退', '강퇴', 8337, 3, 63, 1),
+('開城', '개성', 8338, 3, 63, 1),
+('警報', '경보', 8339, 3, 63, 1),
+('北緯', '북위', 8340, 3, 63, 1),
+('北側', '북측', 8341, 3, 63, 1),
+('諺解', '언해', 8342, 3, 63, 1),
+('理解', '이해', 8343, 3, 63, 1),
+('專制', '전제', 8344, 3, 63, 1),
+('靑陽', '청양', 8345, 3, 63, 1),
+('稱號', '칭호', 8346, 3, 63, 1),
+('彈壓', '탄압', 8347, 3, 63, 1),
+('吐血', '토혈', 8348, 3, 63, 1),
+('解酲', '해장', 8349, 3, 63, 1),
+('投票函', '투표함', 8350, 3, 63, 1),
+('健全', '건전', 8351, 3, 62, 1),
+('苦草', '고초', 8352, 3, 62, 1),
+('詞藻', '사조', 8353, 3, 62, 1),
+('乘馬', '승마', 8354, 3, 62, 1),
+('樂譜', '악보', 8355, 3, 62, 1),
+('眞像', '진상', 8356, 3, 62, 1),
+('初婚', '초혼', 8357, 3, 62, 1),
+('丸木弓', '환목궁', 8358, 3, 62, 1),
+('世', '세', 8359, 3, 61, 1),
+('古碑', '고비', 8360, 3, 61, 1),
+('茶葉', '다엽', 8361, 3, 61, 1),
+('魔王', '마왕', 8362, 3, 61, 1),
+('未備', '미비', 8363, 3, 61, 1),
+('保持', '보지', 8364, 3, 61, 1),
+('復號', '복호', 8365, 3, 61, 1),
+('思料', '사료', 8366, 3, 61, 1),
+('邪惡', '사악', 8367, 3, 61, 1),
+('調律', '조율', 8368, 3, 61, 1),
+('進壘', '진루', 8369, 3, 61, 1),
+('漢詩', '한시', 8370, 3, 61, 1),
+('後―', '훗달', 8371, 3, 61, 1),
+('劇團', '극단', 8372, 3, 60, 1),
+('斷層', '단층', 8373, 3, 60, 1),
+('副應', '부응', 8374, 3, 60, 1),
+('助劑', '조제', 8375, 3, 60, 1),
+('重泉', '중천', 8376, 3, 60, 1),
+('熾熱', '치열', 8377, 3, 60, 1),
+('表決', '표결', 8378, 3, 60, 1),
+('後胤', '후윤', 8379, 3, 60, 1),
+('選擧桶', '선거통', 8380, 3, 60, 1),
+('觀勢', '관세', 8381, 3, 59, 1),
+('妙藥', '묘약', 8382, 3, 59, 1),
+('僧房', '승방', 8383, 3, 59, 1),
+('厭惡', '염오', 8384, 3, 59, 1),
+('帶域幅', '대역폭', 8385, 3, 59, 1),
+('달팽이管', '달팽이관', 8386, 3, 59, 1),
+('射席', '사석', 8387, 3, 58, 1),
+('乳兒', '유아', 8388, 3, 58, 1),
+('快便', '쾌변', 8389, 3, 58, 1),
+('培養液', '배양액', 8390, 3, 58, 1),
+('強勢', '강세', 8391, 3, 57, 1),
+('改備', '개비', 8392, 3, 57, 1),
+('交付', '교부', 8393, 3, 57, 1),
+('來週', '내주', 8394, 3, 57, 1),
+('島配', '도배', 8395, 3, 57, 1),
+('復活', '부활', 8396, 3, 57, 1),
+('習得', '습득', 8397, 3, 57, 1),
+('責應', '책응', 8398, 3, 57, 1),
+('初夜', '초야', 8399, 3, 57, 1),
+('暴雨', '폭우', 8400, 3, 57, 1),
+('確約', '확약', 8401, 3, 57, 1),
+('幼兒園', '유아원', 8402, 3, 57, 1),
+('老熟', '노숙', 8403, 3, 56, 1),
+('圖案', '도안', 8404, 3, 56, 1),
+('壁報', '벽보', 8405, 3, 56, 1),
+('船窓', '선창', 8406, 3, 56, 1),
+('略圖', '약도', 8407, 3, 56, 1),
+('全혀', '전혀', 8408, 3, 56, 1),
+('利', '이', 8409, 3, 55, 1),
+('火', '화', 8410, 3, 55, 1),
+('加減', '가감', 8411, 3, 55, 1),
+('微雨', '미우', 8412, 3, 55, 1),
+('別般', '별반', 8413, 3, 55, 1),
+('首級', '수급', 8414, 3, 55, 1),
+('豫示', '예시', 8415, 3, 55, 1),
+('現金', '현금', 8416, 3, 55, 1),
+('睡眠劑', '수면제', 8417, 3, 55, 1),
+('深呼吸', '심호흡', 8418, 3, 55, 1),
+('官', '관', 8419, 3, 54, 1),
+('假題', '가제', 8420, 3, 54, 1),
+('强調', '강조', 8421, 3, 54, 1),
+('相互', '상호', 8422, 3, 54, 1),
+('列島', '열도', 8423, 3, 54, 1),
+('留意', '유의', 8424, 3, 54, 1),
+('針葉', '침엽', 8425, 3, 54, 1),
+('橫木', '횡목', 8426, 3, 54, 1),
+('監査役', '감사역', 8427, 3, 54, 1),
+('凌霄花', '능소화', 8428, 3, 54, 1),
+('關稅', '관세', 8429, 3, 53, 1),
+('難題', '난제', 8430, 3, 53, 1),
+('木刀', '목도', 8431, 3, 53, 1),
+('不過', '불과', 8432, 3, 53, 1),
+('仙男', '선남', 8433, 3, 53, 1),
+('初秋', '초추', 8434, 3, 53, 1),
+('檢察廳', '검찰청', 8435, 3, 53, 1),
+('親兄弟', '친형제', 8436, 3, 53, 1),
+('撮影監督', '촬영감독', 8437, 3, 53, 1),
+('毒液', '독액', 8438, 3, 52, 1),
+('門틈', '문틈', 8439, 3, 52, 1),
+('斜視', '사시', 8440, 3, 52, 1),
+('裝甲', '장갑', 8441, 3, 52, 1),
+('進步', '진보', 8442, 3, 52, 1),
+('掃除婦', '소제부', 8443, 3, 52, 1),
+('強硬', '강경', 8444, 3, 51, 1),
+('屍身', '시신', 8445, 3, 51, 1),
+('染畫', '염화', 8446, 3, 51, 1),
+('組暴', '조폭', 8447, 3, 51, 1),
+('畵像', '화상', 8448, 3, 51, 1),
+('華商', '화상', 8449, 3, 51, 1),
+('規約', '규약', 8450, 3, 50, 1),
+('凍結', '동결', 8451, 3, 50, 1),
+('樹黨', '수당', 8452, 3, 50, 1),
+('鰱魚', '연어', 8453, 3, 50, 1),
+('應訴', '응소', 8454, 3, 50, 1),
+('強襲', '강습', 8455, 3, 49, 1),
+('去夜', '거야', 8456, 3, 49, 1),
+('聯邦', '련방', 8457, 3, 49, 1),
+('빈房', '빈방', 8458, 3, 49, 1),
+('洋弓', '양궁', 8459, 3, 49, 1),
+('異般', '이반', 8460, 3, 49, 1),
+('總稱', '총칭', 8461, 3, 49, 1),
+('黃砂', '황사', 8462, 3, 49, 1),
+('强要', '강요', 8463, 3, 48, 1),
+('結晶', '결정', 8464, 3, 48, 1),
+('繼投', '계투', 8465, 3, 48, 1),
+('某種', '모종', 8466, 3, 48, 1),
+('未完', '미완', 8467, 3, 48, 1),
+('附圖', '부도', 8468, 3, 48, 1),
+('旋回', '선회', 8469, 3, 48, 1),
+('城將', '성장', 8470, 3, 48, 1),
+('令監', '영감', 8471, 3, 48, 1),
+('遊離', '유리', 8472, 3, 48, 1),
+('柔和', '유화', 8473, 3, 48, 1),
+('齒列', '치열', 8474, 3, 48, 1),
+('呼稱', '호칭', 8475, 3, 48, 1),
+('腸腰筋', '광배근', 8476, 3, 48, 1),
+('腸腰筋', '장요근', 8477, 3, 48, 1),
+('救護', '구호', 8478, 3, 47, 1),
+('極嫌', '극혐', 8479, 3, 47, 1),
+('待令', '대령', 8480, 3, 47, 1),
+('四肢', '사지', 8481, 3, 47, 1),
+('着低', '착저', 8482, 3, 47, 1),
+('臺帳', '대장', 8483, 3, 46, 1),
+('魴魚', '방어', 8484, 3, 46, 1),
+('別로', '별로', 8485, 3, 46, 1),
+('商圈', '상권', 8486, 3, 46, 1),
+('禪師', '선사', 8487, 3, 46, 1),
+('저便', '저편', 8488, 3, 46, 1),
+('皇朝', '황조', 8489, 3, 46, 1),
+('校舍', '교사', 8490, 3, 45, 1),
+('勞使', '노사', 8491, 3, 45, 1),
+('賣渡', '매도', 8492, 3, 45, 1),
+('補助', '보조', 8493, 3, 45, 1),
+('商港', '상항', 8494, 3, 45, 1),
+('受持', '수지', 8495, 3, 45, 1),
+('聯想', '연상', 8496, 3, 45, 1),
+('竈王', '조왕', 8497, 3, 45, 1),
+('改訂版', '개정판', 8498, 3, 45, 1),
+('請牒狀', '청첩장', 8499, 3, 45, 1),
+('管', '관', 8500, 3, 44, 1),
+('舊習', '구습', 8501, 3, 44, 1),
+('當付', '당부', 8502, 3, 44, 1),
+('別別', '별별', 8503, 3, 44, 1),
+('連絡', '연락', 8504, 3, 44, 1),
+('訛傳', '와전', 8505, 3, 44, 1),
+('照射', '조사', 8506, 3, 44, 1),
+('被擊', '피격', 8507, 3, 44, 1),
+('葡萄糖', '포도당', 8508, 3, 44, 1),
+('類', '류', 8509, 3, 43, 1),
+('傳', '전', 8510, 3, 43, 1),
+('開催', '개최', 8511, 3, 43, 1),
+('枯草', '고초', 8512, 3, 43, 1),
+('來달', '내달', 8513, 3, 43, 1),
+('放黜', '방출', 8514, 3, 43, 1),
+('僧服', '승복', 8515, 3, 43, 1),
+('夜雪', '야설', 8516, 3, 43, 1),
+('葉蘭', '엽란', 8517, 3, 43, 1),
+('儀禮', '의례', 8518, 3, 43, 1),
+('延坪島', '연평도', 8519, 3, 43, 1),
+('現', '현', 8520, 3, 42, 1),
+('講讀', '강독', 8521, 3, 42, 1),
+('律詩', '률시', 8522, 3, 42, 1),
+('膜狀', '막상', 8523, 3, 42, 1),
+('野鄙', '야비', 8524, 3, 42, 1),
+('五戒', '오계', 8525, 3, 42, 1),
+('要旨', '요지', 8526, 3, 42, 1),
+('律詩', '율시', 8527, 3, 42, 1),
+('促進', '촉진', 8528, 3, 42, 1),
+('畢證', '필증', 8529, 3, 42, 1),
+('和睦', '화목', 8530, 3, 42, 1),
+('訓讀', '훈독', 8531, 3, 42, 1),
+('米飮床', '미음상', 8532, 3, 42, 1),
+('紅머리오리', '홍머리오리', 8533, 3, 42, 1),
+('野', '야', 8534, 3, 41, 1),
+('抹殺', '말살', 8535, 3, 41, 1),
+('富商', '부상', 8536, 3, 41, 1),
+('謝禮', '사례', 8537, 3, 41, 1),
+('莎草', '사초', 8538, 3, 41, 1),
+('承服', '승복', 8539, 3, 41, 1),
+('筆順', '필순', 8540, 3, 41, 1),
+('親姊妹', '친자매', 8541, 3, 41, 1),
+('彈', '탄', 8542, 3, 40, 1),
+('強勸', '강권', 8543, 3, 40, 1),
+('謀略', '모략', 8544, 3, 40, 1),
+('夫妻', '부처', 8545, 3, 40, 1),
+('史籍', '사적', 8546, 3, 40, 1),
+('襲擊', '습격', 8547, 3, 40, 1),
+('雅歌', '아가', 8548, 3, 40, 1),
+('厄運', '액운', 8549, 3, 40, 1),
+('聯關', '연관', 8550, 3, 40, 1),
+('條例', '조례', 8551, 3, 40, 1),
+('株價', '주가', 8552, 3, 40, 1),
+('住持', '지주', 8553, 3, 40, 1),
+('淸廉', '청렴', 8554, 3, 40, 1),
+('幻像', '환상', 8555, 3, 40, 1),
+('關鍵', '관건', 8556, 3, 39, 1),
+('黨葬', '당장', 8557, 3, 39, 1),
+('備蓄', '비축', 8558, 3, 39, 1),
+('受付', '수부', 8559, 3, 39, 1),
+('夜勤', '야근', 8560, 3, 39, 1),
+('廉價', '염가', 8561, 3, 39, 1),
+('誤審', '오심', 8562, 3, 39, 1),
+('溫泉', '온천', 8563, 3, 39, 1),
+('切除', '절제', 8564, 3, 39, 1),
+('休止', '휴지', 8565, 3, 39, 1),
+('隊', '대', 8566, 3, 38, 1),
+('今番', '금번', 8567, 3, 38, 1),
+('斜陽', '사양', 8568, 3, 38, 1),
+('洗毛', '세모', 8569, 3, 38, 1),
+('波及', '파급', 8570, 3, 38, 1),
+('包皮', '포피', 8571, 3, 38, 1),
+('甘味', '감미', 8572, 3, 37, 1),
+('瓊團', '경단', 8573, 3, 37, 1),
+('射倖', '사행', 8574, 3, 37, 1),
+('誓約', '서약', 8575, 3, 37, 1),
+('일率', '일률', 8576, 3, 37, 1),
+('祖宗', '조종', 8577, 3, 37, 1),
+('等', '등', 8578, 3, 36, 1),
+('骨骼', '골격', 8579, 3, 36, 1),
+('毬果', '구과', 8580, 3, 36, 1),
+('羅刹', '나찰', 8581, 3, 36, 1),
+('落膽', '낙담', 8582, 3, 36, 1),
+('腦裏', '뇌리', 8583, 3, 36, 1),
+('副賞', '부상', 8584, 3, 36, 1),
+('洞察', '통찰', 8585, 3, 36, 1),
+('抗爭', '항쟁', 8586, 3, 36, 1),
+('魂靈', '혼령', 8587, 3, 36, 1),
+('確固', '확고', 8588, 3, 36, 1),
+('端末', '단말', 8589, 3, 35, 1),
+('尾宿', '미수', 8590, 3, 35, 1),
+('私娼', '사창', 8591, 3, 35, 1),
+('迂回', '우회', 8592, 3, 35, 1),
+('凝然', '응연', 8593, 3, 35, 1),
+('茶飯', '차반', 8594, 3, 35, 1),
+('態樣', '태양', 8595, 3, 35, 1),
+('頓菜飯', '돈채반', 8596, 3, 35, 1),
+('望', '망', 8597, 3, 34, 1),
+('連', '연', 8598, 3, 34, 1),
+('回', '회', 8599, 3, 34, 1),
+('開闢', '개벽', 8600, 3, 34, 1),
+('開敞', '개창', 8601, 3, 34, 1),
+('都講', '도강', 8602, 3, 34, 1),
+('範例', '범례', 8603, 3, 34, 1),
+('深夜', '심야', 8604, 3, 34, 1),
+('友邦', '우방', 8605, 3, 34, 1),
+('輪旋', '윤선', 8606, 3, 34, 1),
+('砲架', '포가', 8607, 3, 34, 1),
+('虛勢', '허세', 8608, 3, 34, 1),
+('燻製', '훈제', 8609, 3, 34, 1),
+('旣決囚', '기결수', 8610, 3, 34, 1),
+('綠豆煎', '녹두전', 8611, 3, 34, 1),
+('伴侶鳥', '반려조', 8612, 3, 34, 1),
+('百날기침', '백날기침', 8613, 3, 34, 1),
+('目', '목', 8614, 3, 33, 1),
+('近況', '근황', 8615, 3, 33, 1),
+('漫遊', '만유', 8616, 3, 33, 1),
+('沒收', '몰수', 8617, 3, 33, 1),
+('辨護', '변호', 8618, 3, 33, 1),
+('留置', '유치', 8619, 3, 33, 1),
+('陸封', '육봉', 8620, 3, 33, 1),
+('寸劇', '촌극', 8621, 3, 33, 1),
+('薰製', '훈제', 8622, 3, 33, 1),
+('攻勢', '공세', 8623, 3, 32, 1),
+('繁華', '번화', 8624, 3, 32, 1),
+('訃告', '부고', 8625, 3, 32, 1),
+('與圈', '여권', 8626, 3, 32, 1),
+('練習', '연습', 8627, 3, 32, 1),
+('獄苦', '옥고', 8628, 3, 32, 1),
+('雜穀', '잡곡', 8629, 3, 32, 1),
+('退陣', '퇴진', 8630, 3, 32, 1),
+('私', '사', 8631, 3, 31, 1),
+('禮', '예', 8632, 3, 31, 1),
+('假綴', '가철', 8633, 3, 31, 1),
+('答申', '답신', 8634, 3, 31, 1),
+('謄送', '등송', 8635, 3, 31, 1),
+('誣告', '무고', 8636, 3, 31, 1),
+('蜂起', '봉기', 8637, 3, 31, 1),
+('援助', '원조', 8638, 3, 31, 1),
+('險談', '험담', 8639, 3, 31, 1),
+('腦피셜', '뇌피셜', 8640, 3, 31, 1),
+('珍珠層', '진주층', 8641, 3, 31, 1),
+('苦笑', '고소', 8642, 3, 30, 1),
+('銅印', '동인', 8643, 3, 30, 1),
+('武淨', '무정', 8644, 3, 30, 1),
+('訴願', '소원', 8645, 3, 30, 1),
+('妖婦', '요부', 8646, 3, 30, 1),
+('移植', '이식', 8647, 3, 30, 1),
+('沮害', '저해', 8648, 3, 30, 1),
+('狙害', '저해', 8649, 3, 30, 1),
+('秋季', '추계', 8650, 3, 30, 1),
+('悔改', '회개', 8651, 3, 30, 1),
+('貿易港', '무역항', 8652, 3, 30, 1),
+('壁걸이', '벽걸이', 8653, 3, 30, 1),
+('麥秋', '맥추', 8654, 3, 29, 1),
+('芳香', '방향', 8655, 3, 29, 1),
+('飛虎', '비호', 8656, 3, 29, 1),
+('城砦', '성채', 8657, 3, 29, 1),
+('良臣', '양신', 8658, 3, 29, 1),
+('足浴', '족욕', 8659, 3, 29, 1),
+('蟲垂', '충수', 8660, 3, 29, 1),
+('咽喉炎', '인후염', 8661, 3, 29, 1),
+('打', '타', 8662, 3, 28, 1),
+('艱難', '간난', 8663, 3, 28, 1),
+('背叛', '배반', 8664, 3, 28, 1),
+('謁見', '알현', 8665, 3, 28, 1),
+('煉炭', '연탄', 8666, 3, 28, 1),
+('吾黨', '오당', 8667, 3, 28, 1),
+('右派', '우파', 8668, 3, 28, 1),
+('圓滑', '원활', 8669, 3, 28, 1),
+('引渡', '인도', 8670, 3, 28, 1),
+('狙擊', '저격', 8671, 3, 28, 1),
+('低廉', '저렴', 8672, 3, 28, 1),
+('薦引', '천인', 8673, 3, 28, 1),
+('伴侶犬', '반려견', 8674, 3, 28, 1),
+('黑', '흑', 8675, 3, 27, 1),
+('減壽', '감수', 8676, 3, 27, 1),
+('拒逆', '거역', 8677, 3, 27, 1),
+('舊跡', '구적', 8678, 3, 27, 1),
+('銅鏡', '동경', 8679, 3, 27, 1),
+('毛織', '모직', 8680, 3, 27, 1),
+('逢着', '봉착', 8681, 3, 27, 1),
+('拾得', '습득', 8682, 3, 27, 1),
+('誤謬', '오류', 8683, 3, 27, 1),
+('采詩', '채시', 8684, 3, 27, 1),
+('休暇', '휘가', 8685, 3, 27, 1),
+('總', '총', 8686, 3, 26, 1),
+('延髓', '연수', 8687, 3, 26, 1),
+('切迫', '절박', 8688, 3, 26, 1),
+('諸元', '제원', 8689, 3, 26, 1),
+('終了', '종료', 8690, 3, 26, 1),
+('仲裁', '중재', 8691, 3, 26, 1),
+('侵犯', '침범', 8692, 3, 26, 1),
+('綻露', '탄로', 8693, 3, 26, 1),
+('紅塵', '홍진', 8694, 3, 26, 1),
+('紅鶴', '홍학', 8695, 3, 26, 1),
+('靈', '영', 8696, 3, 25, 1),
+('各個', '각개', 8697, 3, 25, 1),
+('嚴冬', '엄동', 8698, 3, 25, 1),
+('姿態', '자태', 8699, 3, 25, 1),
+('次帥', '차수', 8700, 3, 25, 1),
+('華陀', '화타', 8701, 3, 25, 1),
+('乾畓', '건답', 8702, 3, 24, 1),
+('達摩', '달마', 8703, 3, 24, 1),
+('晩秋', '만추', 8704, 3, 24, 1),
+('些少', '사소', 8705, 3, 24, 1),
+('少佐', '소좌', 8706, 3, 24, 1),
+('熟睡', '숙수', 8707, 3, 24, 1),
+('遊戲', '유희', 8708, 3, 24, 1),
+('輪廻', '윤회', 8709, 3, 24, 1),
+('組閣', '조각', 8710, 3, 24, 1),
+('持株', '지주', 8711, 3, 24, 1),
+('閑談', '한담', 8712, 3, 24, 1),
+('嚮導', '향도', 8713, 3, 24, 1),
+('郵遞筒', '우체통', 8714, 3, 24, 1),
+('兄弟姉妹', '형제자매', 8715, 3, 24, 1),
+('武俠', '무협', 8716, 3, 23, 1),
+('染汚', '염오', 8717, 3, 23, 1),
+('虛榮', '허영', 8718, 3, 23, 1),
+('守', '수', 8719, 3, 22, 1),
+('任', '임', 8720, 3, 22, 1),
+('蟲', '충', 8721, 3, 22, 1),
+('旣存', '기존', 8722, 3, 22, 1),
+('吉慶', '길경', 8723, 3, 22, 1),
+('兩班', '냥반', 8724, 3, 22, 1),
+('背囊', '배낭', 8725, 3, 22, 1),
+('邪宗', '사종', 8726, 3, 22, 1),
+('連續', '연속', 8727, 3, 22, 1),
+('牛舍', '우사', 8728, 3, 22, 1),
+('越冬', '월동', 8729, 3, 22, 1),
+('類型', '유형', 8730, 3, 22, 1),
+('艦艇', '함정', 8731, 3, 22, 1),
+('次', '차', 8732, 3, 21, 1),
+('苦楚', '고초', 8733, 3, 21, 1),
+('驅步', '구보', 8734, 3, 21, 1),
+('吉夢', '길몽', 8735, 3, 21, 1),
+('悲哀', '비애', 8736, 3, 21, 1),
+('熟畓', '숙답', 8737, 3, 21, 1),
+('深刻', '심각', 8738, 3, 21, 1),
+('臙脂', '연지', 8739, 3, 21, 1),
+('羽毛', '우모', 8740, 3, 21, 1),
+('淫慾', '음욕', 8741, 3, 21, 1),
+('提携', '제휴', 8742, 3, 21, 1),
+('取締', '취체', 8743, 3, 21, 1),
+('弊端', '폐단', 8744, 3, 21, 1),
+('嗅覺', '후각', 8745, 3, 21, 1),
+('組', '조', 8746, 3, 20, 1),
+('奸謀', '간모', 8747, 3, 20, 1),
+('巨賊', '거적', 8748, 3, 20, 1),
+('돈票', '돈표', 8749, 3, 20, 1),
+('菩提', '보리', 8750, 3, 20, 1),
+('雲岫', '운수', 8751, 3, 20, 1),
+('懷劍', '회검', 8752, 3, 20, 1),
+('腸', '장', 8753, 3, 19, 1),
+('巨儒', '거유', 8754, 3, 19, 1),
+('狂蝶', '광접', 8755, 3, 19, 1),
+('唐麵', '당면', 8756, 3, 19, 1),
+('頻尿', '빈뇨', 8757, 3, 19, 1),
+('哀歡', '애환', 8758, 3, 19, 1),
+('玉璽', '옥새', 8759, 3, 19, 1),
+('割增', '할증', 8760, 3, 19, 1),
+('玄孫', '현손', 8761, 3, 19, 1),
+('忘却', '망각', 8762, 3, 18, 1),
+('浮揚', '부양', 8763, 3, 18, 1),
+('駛河', '사하', 8764, 3, 18, 1),
+('舌癌', '설암', 8765, 3, 18, 1),
+('續續', '속속', 8766, 3, 18, 1),
+('御刀', '어도', 8767, 3, 18, 1),
+('廉探', '염탐', 8768, 3, 18, 1),
+('鹽湖', '염호', 8769, 3, 18, 1),
+('潛伏', '잠복', 8770, 3, 18, 1),
+('慘敗', '참패', 8771, 3, 18, 1),
+('廳舍', '청사', 8772, 3, 18, 1),
+('嫌疑', '혐의', 8773, 3, 18, 1),
+('缸아리', '항아리', 8774, 3, 18, 1),
+('貴', '귀', 8775, 3, 17, 1),
+('興', '흥', 8776, 3, 17, 1),
+('街娼', '가창', 8777, 3, 17, 1),
+('强烈', '강렬', 8778, 3, 17, 1),
+('僑居', '교거', 8779, 3, 17, 1),
+('貴嬪', '귀빈', 8780, 3, 17, 1),
+('邪鬼', '사귀', 8781, 3, 17, 1),
+('雙璧', '쌍벽', 8782, 3, 17, 1),
+('幽閉', '유폐', 8783, 3, 17, 1),
+('翼龍', '익룡', 8784, 3, 17, 1),
+('醬독', '장독', 8785, 3, 17, 1),
+('財閥', '재벌', 8786, 3, 17, 1),
+('塔婆', '탑파', 8787, 3, 17, 1),
+('伴侶猫', '반려묘', 8788, 3, 17, 1),
+('與', '여', 8789, 3, 16, 1),
+('考妣', '고비', 8790, 3, 16, 1),
+('綠釉', '녹유', 8791, 3, 16, 1),
+('敏智', '민지', 8792, 3, 16, 1),
+('田畓', '전답', 8793, 3, 16, 1),
+('玄鶴', '현학', 8794, 3, 16, 1),
+('皇皇', '황황', 8795, 3, 16, 1),
+('橫笛', '횡적', 8796, 3, 16, 1),
+('禁', '금', 8797, 3, 15, 1),
+('順', '순', 8798, 3, 15, 1),
+('缺陷', '결함', 8799, 3, 15, 1),
+('舊蹟', '구적', 8800, 3, 15, 1),
+('施惠', '시혜', 8801, 3, 15, 1),
+('蹤跡', '종적', 8802, 3, 15, 1),
+('脊椎', '척추', 8803, 3, 15, 1),
+('及其也', '급기야', 8804, 3, 15, 1),
+('濕', '습', 8805, 3, 14, 1),
+('怪獸', '괴수', 8806, 3, 14, 1),
+('鬼哭', '귀곡', 8807, 3, 14, 1),
+('臂脚', '비각', 8808, 3, 14, 1),
+('姓氏', '성씨', 8809, 3, 14, 1),
+('술桶', '술통', 8810, 3, 14, 1),
+('雄壯', '웅장', 8811, 3, 14, 1),
+('淫蕩', '음탕', 8812, 3, 14, 1),
+('竊盜', '절도', 8813, 3, 14, 1),
+('讚揚', '찬양', 8814, 3, 14, 1),
+('軟', '연', 8815, 3, 13, 1),
+('忠', '충', 8816, 3, 13, 1),
+('究竟', '구경', 8817, 3, 13, 1),
+('督促', '독촉', 8818, 3, 13, 1),
+('詳述', '상술', 8819, 3, 13, 1),
+('宣暢', '선창', 8820, 3, 13, 1),
+('殲滅', '섬멸', 8821, 3, 13, 1),
+('歲暮', '세모', 8822, 3, 13, 1),
+('鬱憤', '울분', 8823, 3, 13, 1),
+('村길', '촌길', 8824, 3, 13, 1),
+('村집', '촌집', 8825, 3, 13, 1),
+('侵掠', '침략', 8826, 3, 13, 1),
+('免', '면', 8827, 3, 12, 1),
+('我', '아', 8828, 3, 12, 1),
+('底', '저', 8829, 3, 12, 1),
+('傾斜', '경사', 8830, 3, 12, 1),
+('仁慈', '인자', 8831, 3, 12, 1),
+('周鉢', '주발', 8832, 3, 12, 1),
+('徹底', '철저', 8833, 3, 12, 1),
+('村티', '촌티', 8834, 3, 12, 1),
+('欣快', '흔쾌', 8835, 3, 12, 1),
+('混夷', '곤이', 8836, 3, 11, 1),
+('窮乏', '궁핍', 8837, 3, 11, 1),
+('妖邪', '요사', 8838, 3, 11, 1),
+('淨齋', '정재', 8839, 3, 11, 1),
+('欠缺', '흠결', 8840, 3, 11, 1),
+('漏洩', '누설', 8841, 3, 10, 1),
+('唐', '당', 8842, 3, 9, 1),
+('網', '망', 8843, 3, 9, 1),
+('洲', '주', 8844, 3, 9, 1),
+('劫迫', '겁박', 8845, 3, 9, 1),
+('盟誓', '맹세', 8846, 3, 9, 1),
+('撫摩', '무마', 8847, 3, 9, 1),
+('薄俸', '박봉', 8848, 3, 9, 1),
+('伏羲', '복희', 8849, 3, 9, 1),
+('押韻', '압운', 8850, 3, 9, 1),
+('幽冥', '유명', 8851, 3, 9, 1),
+('蒸溜', '증류', 8852, 3, 9, 1),
+('窮', '궁', 8853, 3, 8, 1),
+('吉', '길', 8854, 3, 8, 1),
+('註', '주', 8855, 3, 8, 1),
+('拘拿', '구나', 8856, 3, 8, 1),
+('崩壞', '붕괴', 8857, 3, 8, 1),
+('巢窟', '소굴', 8858, 3, 8, 1),
+('蘇芳', '소방', 8859, 3, 8, 1),
+('趣旨', '취지', 8860, 3, 8, 1),
+('梗塞', '경색', 8861, 3, 7, 1),
+('櫻桃', '앵두', 8862, 3, 7, 1),
+('毁損', '훼손', 8863, 3, 7, 1),
+('諸葛亮', '제갈량', 8864, 3, 7, 1),
+('截臍', '절제', 8865, 3, 6, 1),
+('悔悟', '회오', 8866, 3, 6, 1),
+('潤', '윤', 8867, 3, 5, 1),
+('莊', '장', 8868, 3, 5, 1),
+('伽藍', '가람', 8869, 3, 5, 1),
+('耕耘', '경운', 8870, 3, 5, 1),
+('冒瀆', '모독', 8871, 3, 5, 1),
+('拔萃', '발췌', 8872, 3, 5, 1),
+('拔擢', '발탁', 8873, 3, 5, 1),
+('迂廻', '우회', 8874, 3, 5, 1),
+('危篤', '위독', 8875, 3, 5, 1),
+('兆朕', '조짐', 8876, 3, 5, 1),
+('咫尺', '지척', 8877, 3, 5, 1),
+('慘慽', '참척', 8878, 3, 5, 1),
+('塹濠', '참호', 8879, 3, 5, 1),
+('悽慘', '처참', 8880, 3, 5, 1),
+('閣', '각', 8881, 3, 4, 1),
+('勸', '권', 8882, 3, 4, 1),
+('璽', '새', 8883, 3, 4, 1),
+('昌', '창', 8884, 3, 4, 1),
+('舵', '타', 8885, 3, 4, 1),
+('錦繡', '금수', 8886, 3, 4, 1),
+('凌駕', '능가', 8887, 3, 4, 1),
+('鸚鵡', '앵무', 8888, 3, 4, 1),
+('掩蔽', '엄폐', 8889, 3, 4, 1),
+('把握', '파악', 8890, 3, 4, 1),
+('論', '논', 8891, 3, 3, 1),
+('槍', '창', 8892, 3, 3, 1),
+('恭遜', '공손', 8893, 3, 3, 1),
+('跳躍', '도약', 8894, 3, 3, 1),
+('苗圃', '묘포', 8895, 3, 3, 1),
+('宋瓷', '송자', 8896, 3, 3, 1),
+('嗚咽', '오열', 8897, 3, 3, 1),
+('扁鵲', '편작', 8898, 3, 3, 1),
+('卦', '괘', 8899, 3, 2, 1),
+('癖', '벽', 8900, 3, 2, 1),
+('貪', '탐', 8901, 3, 2, 1),
+('鯨鯢', '경예', 8902, 3, 2, 1),
+('憐憫', '연민', 8903, 3, 2, 1),
+('履祚', '이조', 8904, 3, 2, 1),
+('伍와  ', '오와 열', 8905, 3, 2, 1),
+('蝾螈', '영원', 8906, 3, 1, 1),
+(NULL, '검', 8907, 3, 0, 1),
+(NULL, '굥', 8908, 3, 0, 1),
+(NULL, '굽', 8909, 3, 0, 1),
+('櫃', '궤', 8910, 3, 0, 1),
+(NULL, '금', 8911, 3, 0, 1),
+(NULL, '껌', 8912, 3, 0, 1),
+(NULL, '꾀', 8913, 3, 0, 1),
+(NULL, '꿀', 8914, 3, 0, 1),
+(NULL, '끙', 8915, 3, 0, 1),
+(NULL, '낯', 8916, 3, 0, 1),
+(NULL, '낱', 8917, 3, 0, 1),
+(NULL, '노', 8918, 3, 0, 1),
+(NULL, '늧', 8919, 3, 0, 1),
+(NULL, '닭', 8920, 3, 0, 1),
+(NULL, '덫', 8921, 3, 0, 1),
+(NULL, '독', 8922, 3, 0, 1),
+(NULL, '둑', 8923, 3, 0, 1),
+(NULL, '들', 8924, 3, 0, 1),
+(NULL, '등', 8925, 3, 0, 1),
+(NULL, '딴', 8926, 3, 0, 1),
+(NULL, '딸', 8927, 3, 0, 1),
+(NULL, '록', 8928, 3, 0, 1),
+(NULL, '롯', 8929, 3, 0, 1),
+(NULL, '링', 8930, 3, 0, 1),
+('貘', '맥', 8931, 3, 0, 1),
+(NULL, '몇', 8932, 3, 0, 1),
+(NULL, '벼', 8933, 3, 0, 1),
+(NULL, '볼', 8934, 3, 0, 1),
+(NULL, '붓', 8935, 3, 0, 1),
+(NULL, '빠', 8936, 3, 0, 1),
+('煞', '살', 8937, 3, 0, 1),
+(NULL, '샴', 8938, 3, 0, 1),
+(NULL, '성', 8939, 3, 0, 1),
+('隋', '수', 8940, 3, 0, 1),
+(NULL, '쌤', 8941, 3, 0, 1),
+(NULL, '쑥', 8942, 3, 0, 1),
+('敔', '어', 8943, 3, 0, 1),
+(NULL, '옆', 8944, 3, 0, 1),
+('羿', '예', 8945, 3, 0, 1),
+(NULL, '온', 8946, 3, 0, 1),
+(NULL, '옻', 8947, 3, 0, 1),
+(NULL, '왼', 8948, 3, 0, 1),
+(NULL, '잎', 8949, 3, 0, 1),
+(NULL, '잭', 8950, 3, 0, 1),
+(NULL, '저', 8951, 3, 0, 1),
+(NULL, '좆', 8952, 3, 0, 1),
+(NULL, '줌', 8953, 3, 0, 1),
+(NULL, '중', 8954, 3, 0, 1),
+('篪', '지', 8955, 3, 0, 1),
+(NULL, '진', 8956, 3, 0, 1),
+(NULL, '짝', 8957, 3, 0, 1),
+(NULL, '찌', 8958, 3, 0, 1),
+(NULL, '찐', 8959, 3, 0, 1),
+('隻', '척', 8960, 3, 0, 1),
+(NULL, '칼', 8961, 3, 0, 1),
+(NULL, '캔', 8962, 3, 0, 1),
+(NULL, '콩', 8963, 3, 0, 1),
+(NULL, '퀸', 8964, 3, 0, 1),
+(NULL, '킹', 8965, 3, 0, 1),
+(NULL, '턱', 8966, 3, 0, 1),
+(NULL, '테', 8967, 3, 0, 1),
+(NULL, '팥', 8968, 3, 0, 1),
+(NULL, '퍽', 8969, 3, 0, 1),
+(NULL, '풂', 8970, 3, 0, 1),
+(NULL, '풍', 8971, 3, 0, 1),
+(NULL, '활', 8972, 3, 0, 1),
+(NULL, '휘', 8973, 3, 0, 1),
+(NULL, 'ㄹ혜', 8974, 3, 0, 1),
+(NULL, '一切', 8975, 3, 0, 1),
+(NULL, '其實', 8976, 3, 0, 1),
+(NULL, '勿論', 8977, 3, 0, 1),
+(NULL, '叮嚀', 8978, 3, 0, 1),
+(NULL, '完全', 8979, 3, 0, 1),
+(NULL, '正말', 8980, 3, 0, 1),
+(NULL, '가늠', 8981, 3, 0, 1),
+(NULL, '가달', 8982, 3, 0, 1),
+(NULL, '가루', 8983, 3, 0, 1),
+(NULL, '가름', 8984, 3, 0, 1),
+(NULL, '가스', 8985, 3, 0, 1),
+(NULL, '가위', 8986, 3, 0, 1),
+(NULL, '가짐', 8987, 3, 0, 1),
+(NULL, '각시', 8988, 3, 0, 1),
+(NULL, '간나', 8989, 3, 0, 1),
+(NULL, '간지', 8990, 3, 0, 1),
+(NULL, '갋다', 8991, 3, 0, 1),
+(NULL, '강하', 8992, 3, 0, 1),
+(NULL, '개흙', 8993, 3, 0, 1),
+(NULL, '갠병', 8994, 3, 0, 1),
+(NULL, '갯벌', 8995, 3, 0, 1),
+(NULL, '거룩', 8996, 3, 0, 1),
+(NULL, '거셈', 8997, 3, 0, 1),
+(NULL, '거울', 8998, 3, 0, 1),
+(NULL, '거위', 8999, 3, 0, 1),
+(NULL, '건방', 9000, 3, 0, 1),
+(NULL, '검댕', 9001, 3, 0, 1),
+(NULL, '겉옷', 9002, 3, 0, 1),
+(NULL, '겉장', 9003, 3, 0, 1),
+(NULL, '게다', 9004, 3, 0, 1),
+(NULL, '겨리', 9005, 3, 0, 1),
+(NULL, '겪다', 9006, 3, 0, 1),
+(NULL, '계집', 9007, 3, 0, 1),
+(NULL, '고기', 9008, 3, 0, 1),
+(NULL, '고니', 9009, 3, 0, 1),
+(NULL, '곡셱', 9010, 3, 0, 1),
+(NULL, '곧다', 9011, 3, 0, 1),
+(NULL, '곧장', 9012, 3, 0, 1),
+(NULL, '골백', 9013, 3, 0, 1),
+(NULL, '곱창', 9014, 3, 0, 1),
+(NULL, '공차', 9015, 3, 0, 1),
+(NULL, '괭이', 9016, 3, 0, 1),
+(NULL, '괴짜', 9017, 3, 0, 1),
+(NULL, '구경', 9018, 3, 0, 1),
+(NULL, '구리', 9019, 3, 0, 1),
+(NULL, '구무', 9020, 3, 0, 1),
+(NULL, '구유', 9021, 3, 0, 1),
+(NULL, '구장', 9022, 3, 0, 1),
+(NULL, '국밥', 9023, 3, 0, 1),
+(NULL, '국뽕', 9024, 3, 0, 1),
+(NULL, '굳이', 9025, 3, 0, 1),
+(NULL, '굴다', 9026, 3, 0, 1),
+(NULL, '굴뚝', 9027, 3, 0, 1),
+(NULL, '귀밑', 9028, 3, 0, 1),
+(NULL, '그꾸', 9029, 3, 0, 1),
+(NULL, '그래', 9030, 3, 0, 1),
+(NULL, '그위', 9031, 3, 0, 1),
+(NULL, '그이', 9032, 3, 0, 1),
+(NULL, '근데', 9033, 3, 0, 1),
+(NULL, '글월', 9034, 3, 0, 1),
+(NULL, '기둥', 9035, 3, 0, 1),
+(NULL, '길쌈', 9036, 3, 0, 1),
+(NULL, '깁다', 9037, 3, 0, 1),
+(NULL, '깊이', 9038, 3, 0, 1),
+(NULL, '까까', 9039, 3, 0, 1),
+(NULL, '까다', 9040, 3, 0, 1),
+(NULL, '까치', 9041, 3, 0, 1),
+(NULL, '깐부', 9042, 3, 0, 1),
+(NULL, '꼬막', 9043, 3, 0, 1),
+(NULL, '꼬치', 9044, 3, 0, 1),
+(NULL, '꽃뱀', 9045, 3, 0, 1),
+(NULL, '꽈리', 9046, 3, 0, 1),
+(NULL, '꿀잼', 9047, 3, 0, 1),
+(NULL, '끄다', 9048, 3, 0, 1),
+(NULL, '끄리', 9049, 3, 0, 1),
+(NULL, '끈기', 9050, 3, 0, 1),
+(NULL, '끓다', 9051, 3, 0, 1),
+(NULL, '끝말', 9052, 3, 0, 1),
+(NULL, '나라', 9053, 3, 0, 1),
+(NULL, '나랑', 9054, 3, 0, 1),
+(NULL, '나비', 9055, 3, 0, 1),
+(NULL, '날개', 9056, 3, 0, 1),
+(NULL, '날밤', 9057, 3, 0, 1),
+(NULL, '남다', 9058, 3, 0, 1),
+('襤褸', '남루', 9059, 3, 0, 1),
+(NULL, '남쪽', 9060, 3, 0, 1),
+(NULL, '낮잠', 9061, 3, 0, 1),
+(NULL, '내음', 9062, 3, 0, 1),
+(NULL, '낼래', 9063, 3, 0, 1),
+(NULL, '널리', 9064, 3, 0, 1),
+(NULL, '넓다', 9065, 3, 0, 1),
+(NULL, '넝감', 9066, 3, 0, 1),
+(NULL, '넣다', 9067, 3, 0, 1),
+(NULL, '네모', 9068, 3, 0, 1),
+(NULL, '녀석', 9069, 3, 0, 1),
+(NULL, '노끈', 9070, 3, 0, 1),
+(NULL, '논길', 9071, 3, 0, 1),
+(NULL, '논밭', 9072, 3, 0, 1),
+(NULL, '농어', 9073, 3, 0, 1),
+(NULL, '놓다', 9074, 3, 0, 1),
+(NULL, '뇨자', 9075, 3, 0, 1),
+(NULL, '누다', 9076, 3, 0, 1),
+(NULL, '눅다', 9077, 3, 0, 1),
+(NULL, '눈앞', 9078, 3, 0, 1),
+(NULL, '눈팅', 9079, 3, 0, 1),
+(NULL, '늙다', 9080, 3, 0, 1),
+(NULL, '닝겐', 9081, 3, 0, 1),
+(NULL, '다룸', 9082, 3, 0, 1),
+(NULL, '다만', 9083, 3, 0, 1),
+(NULL, '다부', 9084, 3, 0, 1),
+(NULL, '단디', 9085, 3, 0, 1),
+(NULL, '단물', 9086, 3, 0, 1),
+(NULL, '달밤', 9087, 3, 0, 1),
+(NULL, '닭쌈', 9088, 3, 0, 1),
+(NULL, '당근', 9089, 3, 0, 1),
+(NULL, '당파', 9090, 3, 0, 1),
+(NULL, '댓글', 9091, 3, 0, 1),
+(NULL, '덩이', 9092, 3, 0, 1),
+(NULL, '덮다', 9093, 3, 0, 1),
+(NULL, '도강', 9094, 3, 0, 1),
+(NULL, '도둑', 9095, 3, 0, 1),
+(NULL, '돌밥', 9096, 3, 0, 1),
+(NULL, '동글', 9097, 3, 0, 1),
+(NULL, '동삼', 9098, 3, 0, 1),
+(NULL, '두메', 9099, 3, 0, 1),
+(NULL, '두세', 9100, 3, 0, 1),
+(NULL, '두셋', 9101, 3, 0, 1),
+(NULL, '두어', 9102, 3, 0, 1),
+(NULL, '뒤다', 9103, 3, 0, 1),
+(NULL, '듀오', 9104, 3, 0, 1),
+(NULL, '떡국', 9105, 3, 0, 1),
+(NULL, '떰치', 9106, 3, 0, 1),
+(NULL, '또한', 9107, 3, 0, 1),
+(NULL, '뜯기', 9108, 3, 0, 1),
+(NULL, '띠앗', 9109, 3, 0, 1),
+(NULL, '라마', 9110, 3, 0, 1),
+(NULL, '로그', 9111, 3, 0, 1),
+(NULL, '륙색', 9112, 3, 0, 1),
+(NULL, '리얼', 9113, 3, 0, 1),
+(NULL, '마당', 9114, 3, 0, 1),
+(NULL, '막차', 9115, 3, 0, 1),
+(NULL, '만날', 9116, 3, 0, 1),
+(NULL, '많다', 9117, 3, 0, 1),
+(NULL, '말뚝', 9118, 3, 0, 1),
+(NULL, '말씨', 9119, 3, 0, 1),
+(NULL, '맛집', 9120, 3, 0, 1),
+(NULL, '맞선', 9121, 3, 0, 1),
+(NULL, '매임', 9122, 3, 0, 1),
+(NULL, '맨땅', 9123, 3, 0, 1),
+(NULL, '먹보', 9124, 3, 0, 1),
+(NULL, '먹새', 9125, 3, 0, 1),
+(NULL, '먹성', 9126, 3, 0, 1),
+(NULL, '먹이', 9127, 3, 0, 1),
+(NULL, '멀다', 9128, 3, 0, 1),
+(NULL, '멀미', 9129, 3, 0, 1),
+(NULL, '멎다', 9130, 3, 0, 1),
+(NULL, '메스', 9131, 3, 0, 1),
+(NULL, '메주', 9132, 3, 0, 1),
+(NULL, '멱살', 9133, 3, 0, 1),
+(NULL, '모든', 9134, 3, 0, 1),
+(NULL, '모새', 9135, 3, 0, 1),
+(NULL, '모솔', 9136, 3, 0, 1),
+(NULL, '모쏠', 9137, 3, 0, 1),
+(NULL, '몰골', 9138, 3, 0, 1),
+(NULL, '몸살', 9139, 3, 0, 1),
+(NULL, '몸통', 9140, 3, 0, 1),
+(NULL, '무새', 9141, 3, 0, 1),
+(NULL, '무쇠', 9142, 3, 0, 1),
+(NULL, '무투', 9143, 3, 0, 1),
+(NULL, '물엿', 9144, 3, 0, 1),
+(NULL, '미련', 9145, 3, 0, 1),
+(NULL, '미리', 9146, 3, 0, 1),
+(NULL, '미역', 9147, 3, 0, 1),
+(NULL, '미트', 9148, 3, 0, 1),
+(NULL, '민물', 9149, 3, 0, 1),
+(NULL, '밀물', 9150, 3, 0, 1),
+(NULL, '바지', 9151, 3, 0, 1),
+(NULL, '반말', 9152, 3, 0, 1),
+(NULL, '발끝', 9153, 3, 0, 1),
+(NULL, '발톱', 9154, 3, 0, 1),
+(NULL, '밤길', 9155, 3, 0, 1),
+(NULL, '밤내', 9156, 3, 0, 1),
+(NULL, '밤눈', 9157, 3, 0, 1),
+(NULL, '밤비', 9158, 3, 0, 1),
+(NULL, '밤샘', 9159, 3, 0, 1),
+(NULL, '밤참', 9160, 3, 0, 1),
+(NULL, '밥알', 9161, 3, 0, 1),
+(NULL, '방울', 9162, 3, 0, 1),
+(NULL, '방죽', 9163, 3, 0, 1),
+(NULL, '방콕', 9164, 3, 0, 1),
+(NULL, '밭재', 9165, 3, 0, 1),
+(NULL, '배알', 9166, 3, 0, 1),
+(NULL, '배짱', 9167, 3, 0, 1),
+(NULL, '배탈', 9168, 3, 0, 1),
+(NULL, '뱦뺴', 9169, 3, 0, 1),
+(NULL, '버릇', 9170, 3, 0, 1),
+(NULL, '베일', 9171, 3, 0, 1),
+(NULL, '별똥', 9172, 3, 0, 1),
+(NULL, '별밤', 9173, 3, 0, 1),
+(NULL, '별표', 9174, 3, 0, 1),
+(NULL, '보람', 9175, 3, 0, 1),
+(NULL, '보지', 9176, 3, 0, 1),
+(NULL, '보탬', 9177, 3, 0, 1),
+(NULL, '보풀', 9178, 3, 0, 1),
+(NULL, '본드', 9179, 3, 0, 1),
+(NULL, '볼넷', 9180, 3, 0, 1),
+(NULL, '봄철', 9181, 3, 0, 1),
+(NULL, '봇짐', 9182, 3, 0, 1),
+(NULL, '부레', 9183, 3, 0, 1),
+(NULL, '부리', 9184, 3, 0, 1),
+(NULL, '부산', 9185, 3, 0, 1),
+(NULL, '부시', 9186, 3, 0, 1),
+(NULL, '북새', 9187, 3, 0, 1),
+(NULL, '불닭', 9188, 3, 0, 1),
+(NULL, '불라', 9189, 3, 0, 1),
+(NULL, '불쌍', 9190, 3, 0, 1),
+(NULL, '브금', 9191, 3, 0, 1),
+(NULL, '블럭', 9192, 3, 0, 1),
+(NULL, '비계', 9193, 3, 0, 1),
+(NULL, '비니', 9194, 3, 0, 1),
+(NULL, '비름', 9195, 3, 0, 1),
+(NULL, '비숍', 9196, 3, 0, 1),
+(NULL, '비지', 9197, 3, 0, 1),
+('琵琶', '비파', 9198, 3, 0, 1),
+('貔貅', '비휴', 9199, 3, 0, 1),
+(NULL, '빌미', 9200, 3, 0, 1),
+(NULL, '빛살', 9201, 3, 0, 1),
+(NULL, '빽빽', 9202, 3, 0, 1),
+(NULL, '뻐큐', 9203, 3, 0, 1),
+(NULL, '뽀뽀', 9204, 3, 0, 1),
+(NULL, '뽕끼', 9205, 3, 0, 1),
+(NULL, '뿔새', 9206, 3, 0, 1),
+(NULL, '뿔잔', 9207, 3, 0, 1),
+(NULL, '삐다', 9208, 3, 0, 1),
+(NULL, '사둘', 9209, 3, 0, 1),
+(NULL, '사랑', 9210, 3, 0, 1),
+(NULL, '사리', 9211, 3, 0, 1),
+(NULL, '사이', 9212, 3, 0, 1),
+(NULL, '사팔', 9213, 3, 0, 1),
+(NULL, '산골', 9214, 3, 0, 1),
+(NULL, '살찐', 9215, 3, 0, 1),
+(NULL, '상그', 9216, 3, 0, 1),
+(NULL, '새똥', 9217, 3, 0, 1),
+(NULL, '새벽', 9218, 3, 0, 1),
+(NULL, '새집', 9219, 3, 0, 1),
+(NULL, '생이', 9220, 3, 0, 1),
+(NULL, '서넛', 9221, 3, 0, 1),
+(NULL, '서다', 9222, 3, 0, 1),
+(NULL, '세로', 9223, 3, 0, 1),
+(NULL, '소름', 9224, 3, 0, 1),
+(NULL, '속셈', 9225, 3, 0, 1),
+(NULL, '솔솔', 9226, 3, 0, 1),
+(NULL, '솔크', 9227, 3, 0, 1),
+(NULL, '쇠때', 9228, 3, 0, 1),
+(NULL, '쇠뿔', 9229, 3, 0, 1),
+(NULL, '쇠풀', 9230, 3, 0, 1),
+(NULL, '쇼트', 9231, 3, 0, 1),
+(NULL, '수레', 9232, 3, 0, 1),
+(NULL, '수저', 9233, 3, 0, 1),
+(NULL, '수풀', 9234, 3, 0, 1),
+(NULL, '쉼표', 9235, 3, 0, 1),
+(NULL, '스압', 9236, 3, 0, 1),
+(NULL, '스포', 9237, 3, 0, 1),
+(NULL, '시야', 9238, 3, 0, 1),
+(NULL, '시옷', 9239, 3, 0, 1),
+(NULL, '시읏', 9240, 3, 0, 1),
+(NULL, '시절', 9241, 3, 0, 1),
+(NULL, '시티', 9242, 3, 0, 1),
+(NULL, '신발', 9243, 3, 0, 1),
+(NULL, '실패', 9244, 3, 0, 1),
+(NULL, '싫다', 9245, 3, 0, 1),
+(NULL, '싫음', 9246, 3, 0, 1),
+(NULL, '싱글', 9247, 3, 0, 1),
+(NULL, '싸불', 9248, 3, 0, 1),
+(NULL, '쌔다', 9249, 3, 0, 1),
+(NULL, '쏠다', 9250, 3, 0, 1),
+(NULL, '쐬다', 9251, 3, 0, 1),
+(NULL, '쑥갓', 9252, 3, 0, 1),
+(NULL, '쓰니', 9253, 3, 0, 1),
+(NULL, '쓴맛', 9254, 3, 0, 1),
+(NULL, '아가', 9255, 3, 0, 1),
+(NULL, '아낙', 9256, 3, 0, 1),
+(NULL, '아마', 9257, 3, 0, 1),
+(NULL, '아싸', 9258, 3, 0, 1),
+(NULL, '아예', 9259, 3, 0, 1),
+(NULL, '아이', 9260, 3, 0, 1),
+(NULL, '악대', 9261, 3, 0, 1),
+(NULL, '안다', 9262, 3, 0, 1),
+(NULL, '앉다', 9263, 3, 0, 1),
+(NULL, '알짜', 9264, 3, 0, 1),
+(NULL, '앞서', 9265, 3, 0, 1),
+(NULL, '앰프', 9266, 3, 0, 1),
+(NULL, '야밤', 9267, 3, 0, 1),
+(NULL, '야스', 9268, 3, 0, 1),
+(NULL, '약다', 9269, 3, 0, 1),
+(NULL, '어미', 9270, 3, 0, 1),
+(NULL, '어시', 9271, 3, 0, 1),
+(NULL, '억지', 9272, 3, 0, 1),
+(NULL, '얹다', 9273, 3, 0, 1),
+(NULL, '얼룩', 9274, 3, 0, 1),
+(NULL, '엄청', 9275, 3, 0, 1),
+(NULL, '없다', 9276, 3, 0, 1),
+(NULL, '에취', 9277, 3, 0, 1),
+(NULL, '여보', 9278, 3, 0, 1),
+(NULL, '엮다', 9279, 3, 0, 1),
+(NULL, '열다', 9280, 3, 0, 1),
+(NULL, '열무', 9281, 3, 0, 1),
+(NULL, '열흘', 9282, 3, 0, 1),
+(NULL, '영에', 9283, 3, 0, 1),
+(NULL, '옛날', 9284, 3, 0, 1),
+(NULL, '옛적', 9285, 3, 0, 1),
+(NULL, '오늘', 9286, 3, 0, 1),
+(NULL, '오늬', 9287, 3, 0, 1),
+(NULL, '오랜', 9288, 3, 0, 1),
+(NULL, '오밤', 9289, 3, 0, 1),
+(NULL, '온갖', 9290, 3, 0, 1),
+(NULL, '온몸', 9291, 3, 0, 1),
+(NULL, '온밤', 9292, 3, 0, 1),
+(NULL, '옮다', 9293, 3, 0, 1),
+(NULL, '옳다', 9294, 3, 0, 1),
+(NULL, '옷감', 9295, 3, 0, 1),
+(NULL, '완자', 9296, 3, 0, 1),
+(NULL, '왕따', 9297, 3, 0, 1),
+(NULL, '우리', 9298, 3, 0, 1),
+(NULL, '웅장', 9299, 3, 0, 1),
+(NULL, '위턱', 9300, 3, 0, 1),
+(NULL, '위팔', 9301, 3, 0, 1),
+(NULL, '유머', 9302, 3, 0, 1),
+(NULL, '으레', 9303, 3, 0, 1),
+(NULL, '읊다', 9304, 3, 0, 1),
+(NULL, '응가', 9305, 3, 0, 1),
+(NULL, '응달', 9306, 3, 0, 1),
+(NULL, '이듭', 9307, 3, 0, 1),
+(NULL, '이랑', 9308, 3, 0, 1),
+(NULL, '이물', 9309, 3, 0, 1),
+(NULL, '이번', 9310, 3, 0, 1),
+(NULL, '이음', 9311, 3, 0, 1),
+(NULL, '인별', 9312, 3, 0, 1),
+(NULL, '인제', 9313, 3, 0, 1),
+(NULL, '입음', 9314, 3, 0, 1),
+(NULL, '있음', 9315, 3, 0, 1),
+(NULL, '잊다', 9316, 3, 0, 1),
+(NULL, '자갈', 9317, 3, 0, 1),
+(NULL, '잔뜩', 9318, 3, 0, 1),
+(NULL, '잘못', 9319, 3, 0, 1),
+(NULL, '잠결', 9320, 3, 0, 1),
+(NULL, '잠깐', 9321, 3, 0, 1),
+(NULL, '잡년', 9322, 3, 0, 1),
+(NULL, '장사', 9323, 3, 0, 1),
+(NULL, '저곳', 9324, 3, 0, 1),
+(NULL, '저승', 9325, 3, 0, 1),
+(NULL, '적삼', 9326, 3, 0, 1),
+(NULL, '전달', 9327, 3, 0, 1),
+(NULL, '접시', 9328, 3, 0, 1),
+(NULL, '젓다', 9329, 3, 0, 1),
+(NULL, '제때', 9330, 3, 0, 1),
+(NULL, '제로', 9331, 3, 0, 1),
+(NULL, '제비', 9332, 3, 0, 1),
+(NULL, '조개', 9333, 3, 0, 1),
+(NULL, '조깨', 9334, 3, 0, 1),
+(NULL, '조림', 9335, 3, 0, 1),
+(NULL, '좆족', 9336, 3, 0, 1),
+(NULL, '좋다', 9337, 3, 0, 1),
+(NULL, '좽이', 9338, 3, 0, 1),
+(NULL, '주검', 9339, 3, 0, 1),
+(NULL, '죽음', 9340, 3, 0, 1),
+(NULL, '지레', 9341, 3, 0, 1),
+(NULL, '집집', 9342, 3, 0, 1),
+(NULL, '짠지', 9343, 3, 0, 1),
+(NULL, '짭새', 9344, 3, 0, 1),
+(NULL, '쪽빛', 9345, 3, 0, 1),
+(NULL, '찍개', 9346, 3, 0, 1),
+(NULL, '찧다', 9347, 3, 0, 1),
+(NULL, '차지', 9348, 3, 0, 1),
+(NULL, '찬스', 9349, 3, 0, 1),
+(NULL, '참말', 9350, 3, 0, 1),
+(NULL, '참새', 9351, 3, 0, 1),
+(NULL, '창렬', 9352, 3, 0, 1),
+(NULL, '처음', 9353, 3, 0, 1),
+(NULL, '첫눈', 9354, 3, 0, 1),
+(NULL, '첫차', 9355, 3, 0, 1),
+(NULL, '초롱', 9356, 3, 0, 1),
+('軺軒', '초헌', 9357, 3, 0, 1),
+(NULL, '촌놈', 9358, 3, 0, 1),
+(NULL, '촌닭', 9359, 3, 0, 1),
+(NULL, '치수', 9360, 3, 0, 1),
+(NULL, '치킨', 9361, 3, 0, 1),
+(NULL, '커브', 9362, 3, 0, 1),
+(NULL, '커뿌', 9363, 3, 0, 1),
+(NULL, '코드', 9364, 3, 0, 1),
+(NULL, '코이', 9365, 3, 0, 1),
+(NULL, '코트', 9366, 3, 0, 1),
+(NULL, '콧물', 9367, 3, 0, 1),
+(NULL, '큰물', 9368, 3, 0, 1),
+(NULL, '키로', 9369, 3, 0, 1),
+(NULL, '킬로', 9370, 3, 0, 1),
+(NULL, '터울', 9371, 3, 0, 1),
+(NULL, '토끼', 9372, 3, 0, 1),
+(NULL, '토막', 9373, 3, 0, 1),
+(NULL, '트랙', 9374, 3, 0, 1),
+(NULL, '티탄', 9375, 3, 0, 1),
+(NULL, '파이', 9376, 3, 0, 1),
+(NULL, '팓다', 9377, 3, 0, 1),
+(NULL, '팡구', 9378, 3, 0, 1),
+(NULL, '페어', 9379, 3, 0, 1),
+(NULL, '포기', 9380, 3, 0, 1),
+('匍匐', '포복', 9381, 3, 0, 1),
+(NULL, '포볼', 9382, 3, 0, 1),
+(NULL, '포크', 9383, 3, 0, 1),
+(NULL, '푸주', 9384, 3, 0, 1),
+(NULL, '풀다', 9385, 3, 0, 1),
+(NULL, '품삯', 9386, 3, 0, 1),
+(NULL, '풋볼', 9387, 3, 0, 1),
+(NULL, '퓨마', 9388, 3, 0, 1),
+(NULL, '피망', 9389, 3, 0, 1),
+(NULL, '피알', 9390, 3, 0, 1),
+(NULL, '피크', 9391, 3, 0, 1),
+(NULL, '핏집', 9392, 3, 0, 1),
+(NULL, '하트', 9393, 3, 0, 1),
+(NULL, '한뉠', 9394, 3, 0, 1),
+(NULL, '한물', 9395, 3, 0, 1),
+(NULL, '한밤', 9396, 3, 0, 1),
+(NULL, '한잔', 9397, 3, 0, 1),
+(NULL, '해체', 9398, 3, 0, 1),
+(NULL, '햇볕', 9399, 3, 0, 1),
+(NULL, '헌팅', 9400, 3, 0, 1),
+(NULL, '헬창', 9401, 3, 0, 1),
+(NULL, '헷말', 9402, 3, 0, 1),
+(NULL, '혼술', 9403, 3, 0, 1),
+(NULL, '황사', 9404, 3, 0, 1),
+(NULL, '훑개', 9405, 3, 0, 1),
+(NULL, '휘다', 9406, 3, 0, 1),
+(NULL, '흔히', 9407, 3, 0, 1),
+(NULL, '흥정', 9408, 3, 0, 1),
+(NULL, '히트', 9409, 3, 0, 1),
+(NULL, '都大體', 9410, 3, 0, 1),
+(NULL, '가다가', 9411, 3, 0, 1),
+(NULL, '가락점', 9412, 3, 0, 1),
+(NULL, '가르침', 9413, 3, 0, 1),
+(NULL, '가만히', 9414, 3, 0, 1),
+(NULL, '가멸다', 9415, 3, 0, 1),
+(NULL, '가슴뼈', 9416, 3, 0, 1),
+(NULL, '가지다', 9417, 3, 0, 1),
+(NULL, '간드리', 9418, 3, 0, 1),
+(NULL, '갈매기', 9419, 3, 0, 1),
+(NULL, '감싸다', 9420, 3, 0, 1),
+(NULL, '감칠맛', 9421, 3, 0, 1),
+(NULL, '개같다', 9422, 3, 0, 1),
+(NULL, '개소리', 9423, 3, 0, 1),
+(NULL, '개울물', 9424, 3, 0, 1),
+(NULL, '개자식', 9425, 3, 0, 1),
+(NULL, '개저씨', 9426, 3, 0, 1),
+(NULL, '거느림', 9427, 3, 0, 1),
+(NULL, '거세다', 9428, 3, 0, 1),
+(NULL, '거스름', 9429, 3, 0, 1),
+(NULL, '거시기', 9430, 3, 0, 1),
+(NULL, '거짓말', 9431, 3, 0, 1),
+(NULL, '건네다', 9432, 3, 0, 1),
+(NULL, '건늠길', 9433, 3, 0, 1),
+(NULL, '게다가', 9434, 3, 0, 1),
+(NULL, '게으름', 9435, 3, 0, 1),
+(NULL, '겨울철', 9436, 3, 0, 1),
+(NULL, '겹겹이', 9437, 3, 0, 1),
+(NULL, '계집년', 9438, 3, 0, 1),
+(NULL, '고나리', 9439, 3, 0, 1),
+(NULL, '고레말', 9440, 3, 0, 1),
+(NULL, '고려말', 9441, 3, 0, 1),
+(NULL, '고이다', 9442, 3, 0, 1),
+(NULL, '곧바로', 9443, 3, 0, 1),
+(NULL, '골짜기', 9444, 3, 0, 1),
+(NULL, '괴롭다', 9445, 3, 0, 1),
+(NULL, '구르다', 9446, 3, 0, 1),
+(NULL, '구이류', 9447, 3, 0, 1),
+(NULL, '굳세다', 9448, 3, 0, 1),
+(NULL, '굼벵이', 9449, 3, 0, 1),
+(NULL, '궁둥이', 9450, 3, 0, 1),
+(NULL, '귀갓길', 9451, 3, 0, 1),
+(NULL, '그다지', 9452, 3, 0, 1),
+(NULL, '그동안', 9453, 3, 0, 1),
+(NULL, '그래서', 9454, 3, 0, 1),
+(NULL, '그러나', 9455, 3, 0, 1),
+(NULL, '그런데', 9456, 3, 0, 1),
+(NULL, '그리고', 9457, 3, 0, 1),
+(NULL, '그리움', 9458, 3, 0, 1),
+(NULL, '그믐날', 9459, 3, 0, 1),
+(NULL, '그토록', 9460, 3, 0, 1),
+(NULL, '근자감', 9461, 3, 0, 1),
+(NULL, '글래머', 9462, 3, 0, 1),
+(NULL, '금사빠', 9463, 3, 0, 1),
+(NULL, '기대다', 9464, 3, 0, 1),
+(NULL, '기이다', 9465, 3, 0, 1),
+(NULL, '기차다', 9466, 3, 0, 1),
+(NULL, '길차다', 9467, 3, 0, 1),
+(NULL, '김장파', 9468, 3, 0, 1),
+(NULL, '김치국', 9469, 3, 0, 1),
+(NULL, '까불다', 9470, 3, 0, 1),
+(NULL, '깨달음', 9471, 3, 0, 1),
+(NULL, '꺼리다', 9472, 3, 0, 1),
+(NULL, '꼴치다', 9473, 3, 0, 1),
+(NULL, '꽃꽂이', 9474, 3, 0, 1),
+(NULL, '꽃나무', 9475, 3, 0, 1),
+(NULL, '꽃다발', 9476, 3, 0, 1),
+(NULL, '꽃제비', 9477, 3, 0, 1),
+(NULL, '꾸짖다', 9478, 3, 0, 1),
+(NULL, '꿀꿀이', 9479, 3, 0, 1),
+(NULL, '꿀벅지', 9480, 3, 0, 1),
+(NULL, '끄집다', 9481, 3, 0, 1),
+(NULL, '끝나다', 9482, 3, 0, 1),
+(NULL, '끝소리', 9483, 3, 0, 1),
+(NULL, '나닐다', 9484, 3, 0, 1),
+(NULL, '나래비', 9485, 3, 0, 1),
+(NULL, '나뭇결', 9486, 3, 0, 1),
+(NULL, '나수다', 9487, 3, 0, 1),
+(NULL, '나폴리', 9488, 3, 0, 1),
+(NULL, '난쟁이', 9489, 3, 0, 1),
+(NULL, '날짐승', 9490, 3, 0, 1),
+(NULL, '내주다', 9491, 3, 0, 1),
+(NULL, '널쭈다', 9492, 3, 0, 1),
+(NULL, '네다섯', 9493, 3, 0, 1),
+(NULL, '노닐다', 9494, 3, 0, 1),
+(NULL, '노다지', 9495, 3, 0, 1),
+(NULL, '노래기', 9496, 3, 0, 1),
+(NULL, '노래집', 9497, 3, 0, 1),
+(NULL, '노지르', 9498, 3, 0, 1),
+(NULL, '놀리다', 9499, 3, 0, 1),
+(NULL, '높낮이', 9500, 3, 0, 1),
+(NULL, '높임말', 9501, 3, 0, 1),
+(NULL, '놔두다', 9502, 3, 0, 1),
+(NULL, '누렁이', 9503, 3, 0, 1),
+(NULL, '눈뜨다', 9504, 3, 0, 1),
+(NULL, '뉴웁말', 9505, 3, 0, 1),
+(NULL, '늙은이', 9506, 3, 0, 1),
+(NULL, '다락방', 9507, 3, 0, 1),
+(NULL, '다루다', 9508, 3, 0, 1),
+(NULL, '다리다', 9509, 3, 0, 1),
+(NULL, '다이몬', 9510, 3, 0, 1),
+(NULL, '닥치다', 9511, 3, 0, 1),
+(NULL, '달구다', 9512, 3, 0, 1),
+(NULL, '달이다', 9513, 3, 0, 1),
+(NULL, '담기다', 9514, 3, 0, 1),
+(NULL, '담벼락', 9515, 3, 0, 1),
+(NULL, '대깨문', 9516, 3, 0, 1),
+(NULL, '대여섯', 9517, 3, 0, 1),
+(NULL, '대쪼각', 9518, 3, 0, 1),
+(NULL, '더불다', 9519, 3, 0, 1),
+(NULL, '덧붙다', 9520, 3, 0, 1),
+(NULL, '덩어리', 9521, 3, 0, 1),
+(NULL, '덮이다', 9522, 3, 0, 1),
+(NULL, '데지다', 9523, 3, 0, 1),
+(NULL, '도란스', 9524, 3, 0, 1),
+(NULL, '돈가스', 9525, 3, 0, 1),
+(NULL, '돈까스', 9526, 3, 0, 1),
+(NULL, '돌고래', 9527, 3, 0, 1),
+(NULL, '되갈다', 9528, 3, 0, 1),
+(NULL, '된소리', 9529, 3, 0, 1),
+(NULL, '뒤지다', 9530, 3, 0, 1),
+(NULL, '뒤쫓다', 9531, 3, 0, 1),
+(NULL, '뒷모습', 9532, 3, 0, 1),
+(NULL, '뒹굴다', 9533, 3, 0, 1),
+(NULL, '드시다', 9534, 3, 0, 1),
+(NULL, '들리다', 9535, 3, 0, 1),
+(NULL, '들이다', 9536, 3, 0, 1),
+(NULL, '들키다', 9537, 3, 0, 1),
+(NULL, '따라서', 9538, 3, 0, 1),
+(NULL, '따르릉', 9539, 3, 0, 1),
+(NULL, '따오기', 9540, 3, 0, 1),
+(NULL, '딸아들', 9541, 3, 0, 1),
+(NULL, '땀띠약', 9542, 3, 0, 1),
+(NULL, '땅거미', 9543, 3, 0, 1),
+(NULL, '때리다', 9544, 3, 0, 1),
+(NULL, '또다시', 9545, 3, 0, 1),
+(NULL, '똑같다', 9546, 3, 0, 1),
+(NULL, '똑같이', 9547, 3, 0, 1),
+(NULL, '뚜하다', 9548, 3, 0, 1),
+(NULL, '뜬소문', 9549, 3, 0, 1),
+(NULL, '뜻하다', 9550, 3, 0, 1),
+(NULL, '라운딩', 9551, 3, 0, 1),
+(NULL, '레인지', 9552, 3, 0, 1),
+(NULL, '레코드', 9553, 3, 0, 1),
+(NULL, '마르다', 9554, 3, 0, 1),
+(NULL, '마수다', 9555, 3, 0, 1),
+(NULL, '마시나', 9556, 3, 0, 1),
+(NULL, '마시다', 9557, 3, 0, 1),
+(NULL, '막바지', 9558, 3, 0, 1),
+(NULL, '말리다', 9559, 3, 0, 1),
+(NULL, '말솜씨', 9560, 3, 0, 1),
+(NULL, '말주변', 9561, 3, 0, 1),
+(NULL, '맛내기', 9562, 3, 0, 1),
+(NULL, '맛조개', 9563, 3, 0, 1),
+(NULL, '망아지', 9564, 3, 0, 1),
+(NULL, '맞서다', 9565, 3, 0, 1),
+(NULL, '매기다', 9566, 3, 0, 1),
+(NULL, '매이다', 9567, 3, 0, 1),
+(NULL, '머저리', 9568, 3, 0, 1),
+(NULL, '머플러', 9569, 3, 0, 1),
+(NULL, '먹구름', 9570, 3, 0, 1),
+(NULL, '멋없다', 9571, 3, 0, 1),
+(NULL, '멍청이', 9572, 3, 0, 1),
+(NULL, '멍하다', 9573, 3, 0, 1),
+(NULL, '멜로디', 9574, 3, 0, 1),
+(NULL, '몸빛깔', 9575, 3, 0, 1),
+(NULL, '못되다', 9576, 3, 0, 1),
+(NULL, '못뽑이', 9577, 3, 0, 1),
+(NULL, '못살다', 9578, 3, 0, 1),
+(NULL, '무김치', 9579, 3, 0, 1),
+(NULL, '문둥이', 9580, 3, 0, 1),
+(NULL, '물냉면', 9581, 3, 0, 1),
+(NULL, '물만두', 9582, 3, 0, 1),
+(NULL, '물오리', 9583, 3, 0, 1),
+(NULL, '뭇사람', 9584, 3, 0, 1),
+(NULL, '미더움', 9585, 3, 0, 1),
+(NULL, '미주알', 9586, 3, 0, 1),
+(NULL, '미투리', 9587, 3, 0, 1),
+(NULL, '밀라노', 9588, 3, 0, 1),
+(NULL, '바게트', 9589, 3, 0, 1),
+(NULL, '바꾸다', 9590, 3, 0, 1),
+(NULL, '바늘땀', 9591, 3, 0, 1),
+(NULL, '바닷가', 9592, 3, 0, 1),
+(NULL, '바닷길', 9593, 3, 0, 1),
+(NULL, '바쁘다', 9594, 3, 0, 1),
+(NULL, '바탕색', 9595, 3, 0, 1),
+(NULL, '박ㄹ혜', 9596, 3, 0, 1),
+(NULL, '박치기', 9597, 3, 0, 1),
+(NULL, '받침법', 9598, 3, 0, 1),
+(NULL, '밤바람', 9599, 3, 0, 1),
+(NULL, '밥벌레', 9600, 3, 0, 1),
+(NULL, '밥벌이', 9601, 3, 0, 1),
+(NULL, '밥자루', 9602, 3, 0, 1),
+(NULL, '밥주걱', 9603, 3, 0, 1),
+(NULL, '방아쇠', 9604, 3, 0, 1),
+(NULL, '방해꾼', 9605, 3, 0, 1),
+(NULL, '배불리', 9606, 3, 0, 1),
+(NULL, '배터리', 9607, 3, 0, 1),
+(NULL, '버들개', 9608, 3, 0, 1),
+(NULL, '번데기', 9609, 3, 0, 1),
+(NULL, '범아귀', 9610, 3, 0, 1),
+(NULL, '베풀다', 9611, 3, 0, 1),
+(NULL, '벼리다', 9612, 3, 0, 1),
+(NULL, '변한말', 9613, 3, 0, 1),
+(NULL, '별나라', 9614, 3, 0, 1),
+(NULL, '별똥별', 9615, 3, 0, 1),
+(NULL, '별무늬', 9616, 3, 0, 1),
+(NULL, '별박이', 9617, 3, 0, 1),
+(NULL, '보내다', 9618, 3, 0, 1),
+(NULL, '보노보', 9619, 3, 0, 1),
+(NULL, '봄갈이', 9620, 3, 0, 1),
+(NULL, '봄바람', 9621, 3, 0, 1),
+(NULL, '부뚜막', 9622, 3, 0, 1),
+(NULL, '북한말', 9623, 3, 0, 1),
+(NULL, '분까이', 9624, 3, 0, 1),
+(NULL, '붉히다', 9625, 3, 0, 1),
+(NULL, '붐비다', 9626, 3, 0, 1),
+(NULL, '브라더', 9627, 3, 0, 1),
+(NULL, '블러셔', 9628, 3, 0, 1),
+(NULL, '비기다', 9629, 3, 0, 1),
+(NULL, '비뚤다', 9630, 3, 0, 1),
+(NULL, '비웃다', 9631, 3, 0, 1),
+(NULL, '비키다', 9632, 3, 0, 1),
+(NULL, '빌리다', 9633, 3, 0, 1),
+(NULL, '빗기다', 9634, 3, 0, 1),
+(NULL, '빡치다', 9635, 3, 0, 1),
+(NULL, '빼놓다', 9636, 3, 0, 1),
+(NULL, '뽀슬개', 9637, 3, 0, 1),
+(NULL, '뽑히다', 9638, 3, 0, 1),
+(NULL, '뽕나무', 9639, 3, 0, 1),
+(NULL, '뿌리혹', 9640, 3, 0, 1),
+(NULL, '뿔뿔이', 9641, 3, 0, 1),
+(NULL, '삐뚤다', 9642, 3, 0, 1),
+(NULL, '사납다', 9643, 3, 0, 1),
+(NULL, '사뢰다', 9644, 3, 0, 1),
+(NULL, '삭이다', 9645, 3, 0, 1),
+(NULL, '살피다', 9646, 3, 0, 1),
+(NULL, '샅샅이', 9647, 3, 0, 1),
+(NULL, '새내기', 9648, 3, 0, 1),
+(NULL, '새마을', 9649, 3, 0, 1),
+(NULL, '새우다', 9650, 3, 0, 1),
+(NULL, '색쟁이', 9651, 3, 0, 1),
+(NULL, '생기다', 9652, 3, 0, 1),
+(NULL, '서슴다', 9653, 3, 0, 1),
+(NULL, '섬기다', 9654, 3, 0, 1),
+(NULL, '섬짱깨', 9655, 3, 0, 1),
+(NULL, '속마음', 9656, 3, 0, 1),
+(NULL, '손싸다', 9657, 3, 0, 1),
+(NULL, '손잡다', 9658, 3, 0, 1),
+(NULL, '수나사', 9659, 3, 0, 1),
+(NULL, '수줍다', 9660, 3, 0, 1),
+(NULL, '술고래', 9661, 3, 0, 1),
+(NULL, '숨구멍', 9662, 3, 0, 1),
+(NULL, '숫하다', 9663, 3, 0, 1),
+(NULL, '슈크림', 9664, 3, 0, 1),
+(NULL, '스드메', 9665, 3, 0, 1),
+(NULL, '스포츠', 9666, 3, 0, 1),
+(NULL, '시냇물', 9667, 3, 0, 1),
+(NULL, '시더기', 9668, 3, 0, 1),
+(NULL, '시들다', 9669, 3, 0, 1),
+(NULL, '식히다', 9670, 3, 0, 1),
+(NULL, '실리다', 9671, 3, 0, 1),
+(NULL, '싱겁다', 9672, 3, 0, 1),
+(NULL, '싸이다', 9673, 3, 0, 1),
+(NULL, '쌀쌀히', 9674, 3, 0, 1),
+(NULL, '씹거웃', 9675, 3, 0, 1),
+(NULL, '씹새끼', 9676, 3, 0, 1),
+(NULL, '아궁이', 9677, 3, 0, 1),
+(NULL, '아끼다', 9678, 3, 0, 1),
+(NULL, '아들딸', 9679, 3, 0, 1),
+(NULL, '아레스', 9680, 3, 0, 1),
+(NULL, '아련히', 9681, 3, 0, 1),
+(NULL, '아뢰다', 9682, 3, 0, 1),
+(NULL, '아무개', 9683, 3, 0, 1),
+(NULL, '아시아', 9684, 3, 0, 1),
+(NULL, '아이티', 9685, 3, 0, 1),
+(NULL, '아침놀', 9686, 3, 0, 1),
+(NULL, '안기다', 9687, 3, 0, 1),
+(NULL, '안테나', 9688, 3, 0, 1),
+(NULL, '알바생', 9689, 3, 0, 1),
+(NULL, '애교살', 9690, 3, 0, 1),
+(NULL, '애벌레', 9691, 3, 0, 1),
+(NULL, '앵기다', 9692, 3, 0, 1),
+(NULL, '얕보다', 9693, 3, 0, 1),
+(NULL, '어느새', 9694, 3, 0, 1),
+(NULL, '어떻게', 9695, 3, 0, 1),
+(NULL, '어르다', 9696, 3, 0, 1),
+(NULL, '어쨌든', 9697, 3, 0, 1),
+(NULL, '어청이', 9698, 3, 0, 1),
+(NULL, '언짢다', 9699, 3, 0, 1),
+(NULL, '얼마나', 9700, 3, 0, 1),
+(NULL, '얼음꽃', 9701, 3, 0, 1),
+(NULL, '얽매다', 9702, 3, 0, 1),
+(NULL, '엉덩이', 9703, 3, 0, 1),
+(NULL, '에굳다', 9704, 3, 0, 1),
+(NULL, '에우다', 9705, 3, 0, 1),
+(NULL, '엥간히', 9706, 3, 0, 1),
+(NULL, '여스골', 9707, 3, 0, 1),
+(NULL, '여위다', 9708, 3, 0, 1),
+(NULL, '여의다', 9709, 3, 0, 1),
+(NULL, '역겹다', 9710, 3, 0, 1),
+(NULL, '열리다', 9711, 3, 0, 1),
+(NULL, '옆얼굴', 9712, 3, 0, 1),
+(NULL, '예니레', 9713, 3, 0, 1),
+(NULL, '오누이', 9714, 3, 0, 1),
+(NULL, '오두막', 9715, 3, 0, 1),
+(NULL, '오랑캐', 9716, 3, 0, 1),
+(NULL, '오래전', 9717, 3, 0, 1),
+(NULL, '올빼미', 9718, 3, 0, 1),
+(NULL, '옹글다', 9719, 3, 0, 1),
+(NULL, '외롭다', 9720, 3, 0, 1),
+(NULL, '우리다', 9721, 3, 0, 1),
+(NULL, '우습다', 9722, 3, 0, 1),
+(NULL, '울렁증', 9723, 3, 0, 1),
+(NULL, '울리다', 9724, 3, 0, 1),
+(NULL, '월귀탄', 9725, 3, 0, 1),
+(NULL, '윗사람', 9726, 3, 0, 1),
+(NULL, '윷놀이', 9727, 3, 0, 1),
+(NULL, '이맘때', 9728, 3, 0, 1),
+(NULL, '이빠이', 9729, 3, 0, 1),
+(NULL, '이슬비', 9730, 3, 0, 1),
+(NULL, '이야기', 9731, 3, 0, 1),
+(NULL, '이윽고', 9732, 3, 0, 1),
+(NULL, '인절미', 9733, 3, 0, 1),
+(NULL, '일부러', 9734, 3, 0, 1),
+(NULL, '자낳괴', 9735, 3, 0, 1),
+(NULL, '잘하다', 9736, 3, 0, 1),
+(NULL, '재비로', 9737, 3, 0, 1),
+(NULL, '재빨리', 9738, 3, 0, 1),
+(NULL, '재주꾼', 9739, 3, 0, 1),
+(NULL, '잼민이', 9740, 3, 0, 1),
+(NULL, '잽싸다', 9741, 3, 0, 1),
+(NULL, '저녁놀', 9742, 3, 0, 1),
+(NULL, '저어새', 9743, 3, 0, 1),
+(NULL, '저절로', 9744, 3, 0, 1),
+(NULL, '저토록', 9745, 3, 0, 1),
+(NULL, '점찍다', 9746, 3, 0, 1),
+(NULL, '젖꼭지', 9747, 3, 0, 1),
+(NULL, '젖먹이', 9748, 3, 0, 1),
+(NULL, '제정신', 9749, 3, 0, 1),
+(NULL, '족제비', 9750, 3, 0, 1),
+(NULL, '종소리', 9751, 3, 0, 1),
+(NULL, '좆같다', 9752, 3, 0, 1),
+(NULL, '좆린이', 9753, 3, 0, 1),
+(NULL, '주둥이', 9754, 3, 0, 1),
+(NULL, '주리다', 9755, 3, 0, 1),
+(NULL, '주머니', 9756, 3, 0, 1),
+(NULL, '죽이다', 9757, 3, 0, 1),
+(NULL, '줴치다', 9758, 3, 0, 1),
+(NULL, '즐거움', 9759, 3, 0, 1),
+(NULL, '지게미', 9760, 3, 0, 1),
+(NULL, '지새다', 9761, 3, 0, 1),
+(NULL, '지팡이', 9762, 3, 0, 1),
+(NULL, '짜다라', 9763, 3, 0, 1),
+(NULL, '짝사랑', 9764, 3, 0, 1),
+(NULL, '쨈매다', 9765, 3, 0, 1),
+(NULL, '찍소리', 9766, 3, 0, 1),
+(NULL, '찐만두', 9767, 3, 0, 1),
+(NULL, '찡구다', 9768, 3, 0, 1),
+(NULL, '차리다', 9769, 3, 0, 1),
+(NULL, '참되다', 9770, 3, 0, 1),
+(NULL, '처지다', 9771, 3, 0, 1),
+(NULL, '첫걸음', 9772, 3, 0, 1),
+(NULL, '첫소리', 9773, 3, 0, 1),
+(NULL, '초록빛', 9774, 3, 0, 1),
+(NULL, '콩비지', 9775, 3, 0, 1),
+(NULL, '클래식', 9776, 3, 0, 1),
+(NULL, '클리닝', 9777, 3, 0, 1),
+(NULL, '키다리', 9778, 3, 0, 1),
+(NULL, '키우다', 9779, 3, 0, 1),
+(NULL, '키잡이', 9780, 3, 0, 1),
+(NULL, '타이어', 9781, 3, 0, 1),
+(NULL, '태우다', 9782, 3, 0, 1),
+(NULL, '탤런트', 9783, 3, 0, 1),
+(NULL, '토치카', 9784, 3, 0, 1),
+(NULL, '튀기다', 9785, 3, 0, 1),
+(NULL, '트이다', 9786, 3, 0, 1),
+(NULL, '파랗다', 9787, 3, 0, 1),
+(NULL, '팔다리', 9788, 3, 0, 1),
+(NULL, '패거리', 9789, 3, 0, 1),
+(NULL, '팸플릿', 9790, 3, 0, 1),
+(NULL, '퍼오다', 9791, 3, 0, 1),
+(NULL, '풋사과', 9792, 3, 0, 1),
+(NULL, '프런트', 9793, 3, 0, 1),
+(NULL, '피드백', 9794, 3, 0, 1),
+(NULL, '하나님', 9795, 3, 0, 1),
+(NULL, '한시름', 9796, 3, 0, 1),
+(NULL, '할미꽃', 9797, 3, 0, 1),
+(NULL, '함부로', 9798, 3, 0, 1),
+(NULL, '해내다', 9799, 3, 0, 1),
+(NULL, '해라체', 9800, 3, 0, 1),
+(NULL, '해맑다', 9801, 3, 0, 1),
+(NULL, '해묵다', 9802, 3, 0, 1),
+(NULL, '햇언나', 9803, 3, 0, 1),
+(NULL, '향고래', 9804, 3, 0, 1),
+(NULL, '허벅지', 9805, 3, 0, 1),
+(NULL, '헛소리', 9806, 3, 0, 1),
+(NULL, '헬스장', 9807, 3, 0, 1),
+(NULL, '헹구다', 9808, 3, 0, 1),
+(NULL, '혼내다', 9809, 3, 0, 1),
+(NULL, '화냥년', 9810, 3, 0, 1),
+(NULL, '환하다', 9811, 3, 0, 1),
+(NULL, '회음부', 9812, 3, 0, 1),
+(NULL, '흙벽돌', 9813, 3, 0, 1),
+(NULL, '흰자위', 9814, 3, 0, 1),
+(NULL, '가득가득', 9815, 3, 0, 1),
+(NULL, '가리키다', 9816, 3, 0, 1),
+(NULL, '가만가만', 9817, 3, 0, 1),
+(NULL, '가만두다', 9818, 3, 0, 1),
+(NULL, '가시버시', 9819, 3, 0, 1),
+(NULL, '가장자리', 9820, 3, 0, 1),
+(NULL, '가져오다', 9821, 3, 0, 1),
+(NULL, '가지가지', 9822, 3, 0, 1),
+(NULL, '간질대다', 9823, 3, 0, 1),
+(NULL, '간편하다', 9824, 3, 0, 1),
+(NULL, '갈고랑이', 9825, 3, 0, 1),
+(NULL, '갈까마귀', 9826, 3, 0, 1),
+(NULL, '갈아매다', 9827, 3, 0, 1),
+(NULL, '갈아타다', 9828, 3, 0, 1),
+(NULL, '거룩하다', 9829, 3, 0, 1),
+(NULL, '거스르다', 9830, 3, 0, 1),
+(NULL, '걱정하다', 9831, 3, 0, 1),
+(NULL, '걸쭉하다', 9832, 3, 0, 1),
+(NULL, '검은딸기', 9833, 3, 0, 1),
+(NULL, '검은무리', 9834, 3, 0, 1),
+(NULL, '검질기다', 9835, 3, 0, 1),
+(NULL, '결정짓다', 9836, 3, 0, 1),
+(NULL, '곁들이다', 9837, 3, 0, 1),
+(NULL, '고기구이', 9838, 3, 0, 1),
+(NULL, '고달피다', 9839, 3, 0, 1),
+(NULL, '고매굴다', 9840, 3, 0, 1),
+(NULL, '고약하다', 9841, 3, 0, 1),
+(NULL, '괴롭히다', 9842, 3, 0, 1),
+(NULL, '구석구석', 9843, 3, 0, 1),
+(NULL, '그르치다', 9844, 3, 0, 1),
+(NULL, '그리하다', 9845, 3, 0, 1),
+(NULL, '그쪽으로', 9846, 3, 0, 1),
+(NULL, '글리세롤', 9847, 3, 0, 1),
+(NULL, '글리세린', 9848, 3, 0, 1),
+(NULL, '급감하다', 9849, 3, 0, 1),
+(NULL, '기다리다', 9850, 3, 0, 1),
+(NULL, '길강아지', 9851, 3, 0, 1),
+(NULL, '길모퉁이', 9852, 3, 0, 1),
+(NULL, '김치찌개', 9853, 3, 0, 1),
+(NULL, '까마귓과', 9854, 3, 0, 1),
+(NULL, '깜빡하다', 9855, 3, 0, 1),
+(NULL, '꼼꼼하다', 9856, 3, 0, 1),
+(NULL, '꽂아넣기', 9857, 3, 0, 1),
+(NULL, '꽃봉오리', 9858, 3, 0, 1),
+(NULL, '꿋꿋하다', 9859, 3, 0, 1),
+(NULL, '끊임없다', 9860, 3, 0, 1),
+(NULL, '끙끙하다', 9861, 3, 0, 1),
+(NULL, '나긋하다', 9862, 3, 0, 1),
+(NULL, '나무하다', 9863, 3, 0, 1),
+(NULL, '나빠지다', 9864, 3, 0, 1),
+(NULL, '나아지다', 9865, 3, 0, 1),
+(NULL, '난데없이', 9866, 3, 0, 1),
+(NULL, '납작하다', 9867, 3, 0, 1),
+(NULL, '내려놓다', 9868, 3, 0, 1),
+(NULL, '내리받다', 9869, 3, 0, 1),
+(NULL, '내리받이', 9870, 3, 0, 1),
+(NULL, '내보내다', 9871, 3, 0, 1),
+(NULL, '넓적다리', 9872, 3, 0, 1),
+(NULL, '넓적부리', 9873, 3, 0, 1),
+(NULL, '넘어지다', 9874, 3, 0, 1),
+(NULL, '네토라레', 9875, 3, 0, 1),
+(NULL, '노고지리', 9876, 3, 0, 1),
+(NULL, '누추하다', 9877, 3, 0, 1),
+(NULL, '뉴트리아', 9878, 3, 0, 1),
+(NULL, '느티나무', 9879, 3, 0, 1),
+(NULL, '다그치다', 9880, 3, 0, 1),
+(NULL, '다락같다', 9881, 3, 0, 1),
+(NULL, '단단하다', 9882, 3, 0, 1),
+(NULL, '단풍나무', 9883, 3, 0, 1),
+(NULL, '달콤하다', 9884, 3, 0, 1),
+(NULL, '답답하다', 9885, 3, 0, 1),
+(NULL, '당부받다', 9886, 3, 0, 1),
+(NULL, '더럽히다', 9887, 3, 0, 1),
+(NULL, '도와주다', 9888, 3, 0, 1),
+(NULL, '동그라미', 9889, 3, 0, 1),
+(NULL, '된장찌개', 9890, 3, 0, 1),
+(NULL, '두루마기', 9891, 3, 0, 1),
+(NULL, '드라이버', 9892, 3, 0, 1),
+(NULL, '들이켜다', 9893, 3, 0, 1),
+(NULL, '떠오르다', 9894, 3, 0, 1),
+(NULL, '떠올리다', 9895, 3, 0, 1),
+(NULL, '떨어지다', 9896, 3, 0, 1),
+(NULL, '떳떳하다', 9897, 3, 0, 1),
+(NULL, '떼어내다', 9898, 3, 0, 1),
+(NULL, '똑똑하다', 9899, 3, 0, 1),
+(NULL, '뚜렷하다', 9900, 3, 0, 1),
+(NULL, '루바슈카', 9901, 3, 0, 1),
+(NULL, '마땅하다', 9902, 3, 0, 1),
+(NULL, '마라샹궈', 9903, 3, 0, 1),
+(NULL, '마련하다', 9904, 3, 0, 1),
+(NULL, '막다르다', 9905, 3, 0, 1),
+(NULL, '말라깽이', 9906, 3, 0, 1),
+(NULL, '말미암다', 9907, 3, 0, 1),
+(NULL, '맞이하다', 9908, 3, 0, 1),
+(NULL, '매료하다', 9909, 3, 0, 1),
+(NULL, '머리하다', 9910, 3, 0, 1),
+(NULL, '머무르다', 9911, 3, 0, 1),
+(NULL, '멍청하다', 9912, 3, 0, 1),
+(NULL, '명백하다', 9913, 3, 0, 1),
+(NULL, '모자라다', 9914, 3, 0, 1),
+(NULL, '무너지다', 9915, 3, 0, 1),
+(NULL, '무모하다', 9916, 3, 0, 1),
+(NULL, '무식쟁이', 9917, 3, 0, 1),
+(NULL, '무엇하다', 9918, 3, 0, 1),
+(NULL, '무자맥질', 9919, 3, 0, 1),
+(NULL, '물들이다', 9920, 3, 0, 1),
+(NULL, '물러서다', 9921, 3, 0, 1),
+(NULL, '뭉클하다', 9922, 3, 0, 1),
+(NULL, '미국들소', 9923, 3, 0, 1),
+(NULL, '미숫가루', 9924, 3, 0, 1),
+(NULL, '미역감다', 9925, 3, 0, 1),
+(NULL, '미치광이', 9926, 3, 0, 1),
+(NULL, '미행하다', 9927, 3, 0, 1),
+(NULL, '민물장어', 9928, 3, 0, 1),
+(NULL, '밋밋하다', 9929, 3, 0, 1),
+(NULL, '바람개비', 9930, 3, 0, 1),
+(NULL, '바스라기', 9931, 3, 0, 1),
+(NULL, '반듯하다', 9932, 3, 0, 1),
+(NULL, '방치하다', 9933, 3, 0, 1),
+(NULL, '백일잔치', 9934, 3, 0, 1),
+(NULL, '버개다리', 9935, 3, 0, 1),
+(NULL, '벌거벗다', 9936, 3, 0, 1),
+(NULL, '변함없이', 9937, 3, 0, 1),
+(NULL, '별똥만발', 9938, 3, 0, 1),
+(NULL, '부끄러움', 9939, 3, 0, 1),
+(NULL, '부딪치다', 9940, 3, 0, 1),
+(NULL, '부딪히다', 9941, 3, 0, 1),
+(NULL, '부럼없다', 9942, 3, 0, 1),
+(NULL, '부르짖다', 9943, 3, 0, 1),
+(NULL, '부리나케', 9944, 3, 0, 1),
+(NULL, '불꽃놀이', 9945, 3, 0, 1),
+(NULL, '불쌍하다', 9946, 3, 0, 1),
+(NULL, '불알친구', 9947, 3, 0, 1),
+(NULL, '불어오다', 9948, 3, 0, 1),
+(NULL, '붉은피알', 9949, 3, 0, 1),
+(NULL, '비단조개', 9950, 3, 0, 1),
+(NULL, '비자나무', 9951, 3, 0, 1),
+(NULL, '비잔티움', 9952, 3, 0, 1),
+(NULL, '비틀대다', 9953, 3, 0, 1),
+(NULL, '빠뜨리다', 9954, 3, 0, 1),
+(NULL, '빼빼하다', 9955, 3, 0, 1),
+(NULL, '삐딱하다', 9956, 3, 0, 1),
+(NULL, '사자고추', 9957, 3, 0, 1),
+(NULL, '사타구니', 9958, 3, 0, 1),
+(NULL, '사튀로스', 9959, 3, 0, 1),
+(NULL, '색동다리', 9960, 3, 0, 1),
+(NULL, '서울뜨기', 9961, 3, 0, 1),
+(NULL, '설포닐기', 9962, 3, 0, 1),
+(NULL, '세알리다', 9963, 3, 0, 1),
+(NULL, '손가락질', 9964, 3, 0, 1),
+(NULL, '송두리째', 9965, 3, 0, 1),
+(NULL, '수도꼭지', 9966, 3, 0, 1),
+(NULL, '숨바꼭질', 9967, 3, 0, 1),
+(NULL, '쉴드치다', 9968, 3, 0, 1),
+(NULL, '스라소니', 9969, 3, 0, 1),
+(NULL, '스며들다', 9970, 3, 0, 1),
+(NULL, '스프레이', 9971, 3, 0, 1),
+(NULL, '슬기롭다', 9972, 3, 0, 1),
+(NULL, '슬라이드', 9973, 3, 0, 1),
+(NULL, '시골뜨기', 9974, 3, 0, 1),
+(NULL, '시끄럽다', 9975, 3, 0, 1),
+(NULL, '시시하다', 9976, 3, 0, 1),
+(NULL, '신중하다', 9977, 3, 0, 1),
+(NULL, '싫어지다', 9978, 3, 0, 1),
+(NULL, '심란하다', 9979, 3, 0, 1),
+(NULL, '쌀쌀하다', 9980, 3, 0, 1),
+(NULL, '쏟아지다', 9981, 3, 0, 1),
+(NULL, '쓰다듬다', 9982, 3, 0, 1),
+(NULL, '쓰레기통', 9983, 3, 0, 1),
+(NULL, '쓸데없다', 9984, 3, 0, 1),
+(NULL, '아 이름', 9985, 3, 0, 1),
+(NULL, '아득하다', 9986, 3, 0, 1),
+(NULL, '아랫사람', 9987, 3, 0, 1),
+(NULL, '아련하다', 9988, 3, 0, 1),
+(NULL, '아리땁다', 9989, 3, 0, 1),
+(NULL, '아즈바이', 9990, 3, 0, 1),
+(NULL, '아카이브', 9991, 3, 0, 1),
+(NULL, '아틀리에', 9992, 3, 0, 1),
+(NULL, '안성맞춤', 9993, 3, 0, 1),
+(NULL, '알락오리', 9994, 3, 0, 1),
+(NULL, '알음알음', 9995, 3, 0, 1),
+(NULL, '앞장서다', 9996, 3, 0, 1),
+(NULL, '애교쟁이', 9997, 3, 0, 1),
+(NULL, '야릇하다', 9998, 3, 0, 1),
+(NULL, '얌전하다', 9999, 3, 0, 1),
+(NULL, '양도하다', 10000, 3, 0, 1),
+(NULL, '어눌하다', 10001, 3, 0, 1),
+(NULL, '어벙하다', 10002, 3, 0, 1),
+(NULL, '어울리다', 10003, 3, 0, 1),
+(NULL, '어지럽다', 10004, 3, 0, 1),
+(NULL, '억누르다', 10005, 3, 0, 1),
+(NULL, '얼큰하다', 10006, 3, 0, 1),
+(NULL, '얽매이다', 10007, 3, 0, 1),
+(NULL, '없어지다', 10008, 3, 0, 1),
+(NULL, '엉겁결에', 10009, 3, 0, 1),
+(NULL, '엉큼하다', 10010, 3, 0, 1),
+(NULL, '여전하다', 10011, 3, 0, 1),
+(NULL, '열렬하다', 10012, 3, 0, 1),
+(NULL, '온전하다', 10013, 3, 0, 1),
+(NULL, '올라오다', 10014, 3, 0, 1),
+(NULL, '유럽짱깨', 10015, 3, 0, 1),
+(NULL, '은밀하다', 10016, 3, 0, 1),
+(NULL, '의젓하다', 10017, 3, 0, 1),
+(NULL, '이부자리', 10018, 3, 0, 1),
+(NULL, '이어지다', 10019, 3, 0, 1),
+(NULL, '이채롭다', 10020, 3, 0, 1),
+(NULL, '인조가죽', 10021, 3, 0, 1),
+(NULL, '일어서다', 10022, 3, 0, 1),
+(NULL, '일컬리다', 10023, 3, 0, 1),
+(NULL, '입증하다', 10024, 3, 0, 1),
+(NULL, '자랑하다', 10025, 3, 0, 1),
+(NULL, '자칫하면', 10026, 3, 0, 1),
+(NULL, '잔원하다', 10027, 3, 0, 1),
+(NULL, '잔잔하다', 10028, 3, 0, 1),
+(NULL, '잘못되다', 10029, 3, 0, 1),
+(NULL, '잡아가다', 10030, 3, 0, 1),
+(NULL, '재빠르다', 10031, 3, 0, 1),
+(NULL, '저러하다', 10032, 3, 0, 1),
+(NULL, '저쪽으로', 10033, 3, 0, 1),
+(NULL, '적확하다', 10034, 3, 0, 1),
+(NULL, '전해지다', 10035, 3, 0, 1),
+(NULL, '젓가락질', 10036, 3, 0, 1),
+(NULL, '조립하다', 10037, 3, 0, 1),
+(NULL, '조심스레', 10038, 3, 0, 1),
+(NULL, '조용조용', 10039, 3, 0, 1),
+(NULL, '조촐하다', 10040, 3, 0, 1),
+(NULL, '주저앉다', 10041, 3, 0, 1),
+(NULL, '줄넘기줄', 10042, 3, 0, 1),
+(NULL, '중복되다', 10043, 3, 0, 1),
+(NULL, '중심닮음', 10044, 3, 0, 1),
+(NULL, '지골리다', 10045, 3, 0, 1),
+(NULL, '지껄이다', 10046, 3, 0, 1),
+(NULL, '짜릿하다', 10047, 3, 0, 1),
+(NULL, '쫓아내다', 10048, 3, 0, 1),
+(NULL, '찰떡궁합', 10049, 3, 0, 1),
+(NULL, '찾아내다', 10050, 3, 0, 1),
+(NULL, '철저하다', 10051, 3, 0, 1),
+(NULL, '청초하다', 10052, 3, 0, 1),
+(NULL, '초고추장', 10053, 3, 0, 1),
+(NULL, '출출하다', 10054, 3, 0, 1),
+(NULL, '치유하다', 10055, 3, 0, 1),
+(NULL, '컴백하다', 10056, 3, 0, 1),
+(NULL, '코스프레', 10057, 3, 0, 1),
+(NULL, '콩콩대다', 10058, 3, 0, 1),
+(NULL, '크바르크', 10059, 3, 0, 1),
+(NULL, '큰개자리', 10060, 3, 0, 1),
+(NULL, '탁월하다', 10061, 3, 0, 1),
+(NULL, '톱니바퀴', 10062, 3, 0, 1),
+(NULL, '특징짓다', 10063, 3, 0, 1),
+(NULL, '튼튼하다', 10064, 3, 0, 1),
+(NULL, '판판하다', 10065, 3, 0, 1),
+(NULL, '패스트볼', 10066, 3, 0, 1),
+(NULL, '퍼뜨리다', 10067, 3, 0, 1),
+(NULL, '평화롭다', 10068, 3, 0, 1),
+(NULL, '포획하다', 10069, 3, 0, 1),
+(NULL, '표범상어', 10070, 3, 0, 1),
+(NULL, '풀어지다', 10071, 3, 0, 1),
+(NULL, '프랑스빵', 10072, 3, 0, 1),
+(NULL, '플라이어', 10073, 3, 0, 1),
+(NULL, '하루아침', 10074, 3, 0, 1),
+(NULL, '한물가다', 10075, 3, 0, 1),
+(NULL, '한탄하다', 10076, 3, 0, 1),
+(NULL, '합류하다', 10077, 3, 0, 1),
+(NULL, '해제끼다', 10078, 3, 0, 1),
+(NULL, '허술하다', 10079, 3, 0, 1),
+(NULL, '화려하다', 10080, 3, 0, 1),
+(NULL, '확정하다', 10081, 3, 0, 1),
+(NULL, '후두끼다', 10082, 3, 0, 1),
+(NULL, '후방주의', 10083, 3, 0, 1),
+(NULL, '훑어보다', 10084, 3, 0, 1),
+(NULL, '흐려지다', 10085, 3, 0, 1),
+(NULL, '흩날리다', 10086, 3, 0, 1),
+(NULL, '희붐하다', 10087, 3, 0, 1),
+(NULL, '가운뎃소리', 10088, 3, 0, 1),
+(NULL, '간질거리다', 10089, 3, 0, 1),
+(NULL, '갑작스럽다', 10090, 3, 0, 1),
+(NULL, '고층살림집', 10091, 3, 0, 1),
+(NULL, '구부러지다', 10092, 3, 0, 1),
+(NULL, '굿거리장단', 10093, 3, 0, 1),
+(NULL, '그림의 떡', 10094, 3, 0, 1),
+(NULL, '깔깔거리다', 10095, 3, 0, 1),
+(NULL, '낡아빠지다', 10096, 3, 0, 1),
+(NULL, '눈에 들다', 10097, 3, 0, 1),
+(NULL, '다이아몬드', 10098, 3, 0, 1),
+(NULL, '돌아다니다', 10099, 3, 0, 1),
+(NULL, '두드러지다', 10100, 3, 0, 1),
+(NULL, '들어올리다', 10101, 3, 0, 1),
+(NULL, '떨어뜨리다', 10102, 3, 0, 1),
+(NULL, '뛰어다니다', 10103, 3, 0, 1),
+(NULL, '말대꾸하다', 10104, 3, 0, 1),
+(NULL, '맹렬해지다', 10105, 3, 0, 1),
+(NULL, '멈칫거리다', 10106, 3, 0, 1),
+(NULL, '모래주머니', 10107, 3, 0, 1),
+(NULL, '무뚝뚝하다', 10108, 3, 0, 1),
+(NULL, '무장시키다', 10109, 3, 0, 1),
+(NULL, '미국자리공', 10110, 3, 0, 1),
+(NULL, '미끄러지다', 10111, 3, 0, 1),
+(NULL, '받아들이다', 10112, 3, 0, 1),
+(NULL, '발전시키다', 10113, 3, 0, 1),
+(NULL, '보잘것없다', 10114, 3, 0, 1),
+(NULL, '불가해하다', 10115, 3, 0, 1),
+(NULL, '비뚤어지다', 10116, 3, 0, 1),
+(NULL, '빠져나오다', 10117, 3, 0, 1),
+(NULL, '뿔이 나다', 10118, 3, 0, 1),
+(NULL, '새끼손가락', 10119, 3, 0, 1),
+(NULL, '순두부찌개', 10120, 3, 0, 1),
+(NULL, '숨넘어가다', 10121, 3, 0, 1),
+(NULL, '스피드하다', 10122, 3, 0, 1),
+(NULL, '시원해지다', 10123, 3, 0, 1),
+(NULL, '시집보내다', 10124, 3, 0, 1),
+(NULL, '시티 촬영', 10125, 3, 0, 1),
+(NULL, '실망투성이', 10126, 3, 0, 1),
+(NULL, '안드로이드', 10127, 3, 0, 1),
+(NULL, '어우러지다', 10128, 3, 0, 1),
+(NULL, '엇비슷하다', 10129, 3, 0, 1),
+(NULL, '여섯고을말', 10130, 3, 0, 1),
+(NULL, '옛날이야기', 10131, 3, 0, 1),
+(NULL, '우스갯소리', 10132, 3, 0, 1),
+(NULL, '으스름하다', 10133, 3, 0, 1),
+(NULL, '이루어지다', 10134, 3, 0, 1),
+(NULL, '익살스럽다', 10135, 3, 0, 1),
+(NULL, '일그러지다', 10136, 3, 0, 1),
+(NULL, '입음움직씨', 10137, 3, 0, 1),
+(NULL, '잔망스럽다', 10138, 3, 0, 1),
+(NULL, '잠이 들다', 10139, 3, 0, 1),
+(NULL, '재잘거리다', 10140, 3, 0, 1),
+(NULL, '제힘움직씨', 10141, 3, 0, 1),
+(NULL, '조심스럽다', 10142, 3, 0, 1),
+(NULL, '지저분하다', 10143, 3, 0, 1),
+(NULL, '쳐들어가다', 10144, 3, 0, 1),
+(NULL, '추켜세우다', 10145, 3, 0, 1),
+(NULL, '큰철갑상어', 10146, 3, 0, 1),
+(NULL, '퉁명스럽다', 10147, 3, 0, 1),
+(NULL, '품갚음하다', 10148, 3, 0, 1),
+(NULL, '하늘다람쥐', 10149, 3, 0, 1),
+(NULL, '하이드라진', 10150, 3, 0, 1),
+(NULL, '하임움직씨', 10151, 3, 0, 1),
+(NULL, '혼란스럽다', 10152, 3, 0, 1),
+(NULL, '근질근질하다', 10153, 3, 0, 1),
+(NULL, '끈적끈적하다', 10154, 3, 0, 1),
+(NULL, '들쭉날쭉하다', 10155, 3, 0, 1),
+(NULL, '미주알고주알', 10156, 3, 0, 1),
+(NULL, '바삭바삭하다', 10157, 3, 0, 1),
+(NULL, '번호를 따다', 10158, 3, 0, 1),
+(NULL, '스크롤 압박', 10159, 3, 0, 1),
+(NULL, '아르바이트생', 10160, 3, 0, 1),
+(NULL, '아메리카들소', 10161, 3, 0, 1),
+(NULL, '안타까워하다', 10162, 3, 0, 1),
+(NULL, '어슬렁어슬렁', 10163, 3, 0, 1),
+(NULL, '을씨년스럽다', 10164, 3, 0, 1),
+(NULL, '전화를 끊다', 10165, 3, 0, 1),
+(NULL, '젓가락질하다', 10166, 3, 0, 1),
+(NULL, '조용조용하다', 10167, 3, 0, 1),
+(NULL, '키보드 배틀', 10168, 3, 0, 1),
+(NULL, '푸르디푸르다', 10169, 3, 0, 1),
+(NULL, '흐트러트리다', 10170, 3, 0, 1),
+(NULL, '흥미진진하다', 10171, 3, 0, 1),
+(NULL, '꼬집어 말하다', 10172, 3, 0, 1),
+(NULL, '유럽무족도마뱀', 10173, 3, 0, 1),
+(NULL, '긴꼬리윗수염박쥐', 10174, 3, 0, 1),
+(NULL, '마이크로프로세서', 10175, 3, 0, 1),
+(NULL, '사명당의 사첫방', 10176, 3, 0, 1),
+('生物化學', '생물화학', 10177, 2, 770, 1),
+('流體動力學', '유체동역학', 10178, 2, 768, 1),
+('言論學者', '언론학자', 10179, 2, 761, 1),
+('大學修學能力試驗', '대학수학능력시험', 10180, 2, 701, 1),
+('化學傳導物質', '화학전달물질', 10181, 2, 699, 1),
+('大學院生', '대학원생', 10182, 2, 694, 1),
+('國語學', '국어학', 10183, 2, 681, 1),
+('神經言語學', '신경언어학', 10184, 2, 656, 1),
+('中國學', '중국학', 10185, 2, 637, 1),
+('量子力學', '양자역학', 10186, 2, 624, 1),
+('人物事典', '인물사전', 10187, 2, 617, 1),
+('學生少年宮殿', '학생소년궁전', 10188, 2, 617, 1),
+('內國人', '내국인', 10189, 2, 610, 1),
+('人道的', '인도적', 10190, 2, 610, 1),
+('學生會館', '학생회관', 10191, 2, 603, 1),
+('江南天子國', '강남천자국', 10192, 2, 600, 1),
+('歲月不待人', '세월부대인', 10193, 2, 578, 1),
+('人稱代名詞', '인칭대명사', 10194, 2, 575, 1),
+('理性主義', '이성주의', 10195, 2, 563, 1),
+('大韓民國', '대한민국', 10196, 2, 561, 1),
+('英國人', '영국인', 10197, 2, 560, 1),
+('女性運動家', '여성운동가', 10198, 2, 555, 1),
+('地球人', '지구인', 10199, 2, 549, 1),
+('支拂 不能者', '지불 불능자', 10200, 2, 544, 1),
+('野生動物', '야생동물', 10201, 2, 542, 1),
+('中道主義', '중도주의', 10202, 2, 541, 1),
+('未確認飛行物體', '미확인비행물체', 10203, 2, 534, 1),
+('同音異義語', '동음이의어', 10204, 2, 527, 1),
+('日本人', '일본인', 10205, 2, 524, 1),
+('勞動者區', '로동자구', 10206, 2, 521, 1),
+('反動分子', '반동분자', 10207, 2, 515, 1),
+('主謀者', '주모자', 10208, 2, 504, 1),
+('國際 音聲 記號', '국제 음성 기호', 10209, 2, 503, 1),
+('未成年者', '미성년자', 10210, 2, 502, 1),
+('管理者', '관리자', 10211, 2, 498, 1),
+('大體-', '대체로', 10212, 2, 497, 1),
+('合理主義', '합리주의', 10213, 2, 496, 1),
+('六字大明王眞言', '육자대명왕진언', 10214, 2, 496, 1),
+('立法者', '립법자', 10215, 2, 492, 1),
+('中毒者', '중독자', 10216, 2, 489, 1),
+('留學生', '유학생', 10217, 2, 486, 1),
+('自殺者', '자살자', 10218, 2, 486, 1),
+('化學 平衡', '화학 평형', 10219, 2, 484, 1),
+('中華民國', '중화민국', 10220, 2, 482, 1),
+('流行性 耳下腺炎', '유행성 이하선염', 10221, 2, 481, 1),
+('中溫動物', '중온동물', 10222, 2, 480, 1),
+('不良者', '불량자', 10223, 2, 479, 1),
+('指名打者', '지명타자', 10224, 2, 479, 1),
+('位相數學', '위상수학', 10225, 2, 476, 1),
+('步行者', '보행자', 10226, 2, 475, 1),
+('化學式', '화학식', 10227, 2, 471, 1),
+('修學旅行', '수학여행', 10228, 2, 470, 1),
+('總大主敎', '총대주교', 10229, 2, 469, 1),
+('天下之大本', '천하지대본', 10230, 2, 468, 1),
+('外界人', '외계인', 10231, 2, 465, 1),
+('母國語', '모국어', 10232, 2, 460, 1),
+('外溫動物', '외온동물', 10233, 2, 457, 1),
+('行人', '행인', 10234, 2, 456, 1),
+('第一人稱', '제일인칭', 10235, 2, 455, 1),
+('無人店鋪', '무인점포', 10236, 2, 454, 1),
+('大漢國', '대한국', 10237, 2, 452, 1),
+('水道--', '수도꼭지', 10238, 2, 447, 1),
+('無政府主義', '무정부주의', 10239, 2, 447, 1),
+('移民者', '이민자', 10240, 2, 445, 1),
+('歸還 不能 地點', '귀환 불능 지점', 10241, 2, 445, 1),
+('公證人', '공증인', 10242, 2, 444, 1),
+('全國的', '전국적', 10243, 2, 444, 1),
+('大主敎', '대주교', 10244, 2, 443, 1),
+('日人', '일인', 10245, 2, 441, 1),
+('發見者', '발견자', 10246, 2, 441, 1),
+('代表者', '대표자', 10247, 2, 440, 1),
+('論爭者', '논쟁자', 10248, 2, 439, 1),
+('無人島', '무인도', 10249, 2, 439, 1),
+('人間嫌惡', '인간혐오', 10250, 2, 439, 1),
+('言論學', '언론학', 10251, 2, 436, 1),
+('敎育者', '교육자', 10252, 2, 433, 1),
+('人家', '인가', 10253, 2, 432, 1),
+('作曲者', '작곡자', 10254, 2, 431, 1),
+('夢遊病者', '몽유병자', 10255, 2, 431, 1),
+('形而上學', '형이상학', 10256, 2, 427, 1),
+('代走者', '대주자', 10257, 2, 424, 1),
+('法律學', '법률학', 10258, 2, 424, 1),
+('美國化', '미국화', 10259, 2, 423, 1),
+('分離主義', '분리주의', 10260, 2, 422, 1),
+('使用人', '사용인', 10261, 2, 421, 1),
+('女人', '여인', 10262, 2, 418, 1),
+('女性的', '여성적', 10263, 2, 418, 1),
+('議會主義', '의회주의', 10264, 2, 418, 1),
+('無人', '무인', 10265, 2, 416, 1),
+('愛好者', '애호자', 10266, 2, 415, 1),
+('火山學', '화산학', 10267, 2, 415, 1),
+('人名', '인명', 10268, 2, 414, 1),
+('中大白鷺', '중대백로', 10269, 2, 414, 1),
+('神經傳導物質', '신경전달물질', 10270, 2, 413, 1),
+('三大體腔', '삼대체강', 10271, 2, 411, 1),
+('求愛者', '구애자', 10272, 2, 409, 1),
+('國務總理', '국무총리', 10273, 2, 409, 1),
+('保管人', '보관인', 10274, 2, 408, 1),
+('遺言者', '유언자', 10275, 2, 408, 1),
+('人造毛皮', '인조모피', 10276, 2, 407, 1),
+('敎人', '교인', 10277, 2, 405, 1),
+('保證人', '보증인', 10278, 2, 405, 1),
+('侵入者', '침입자', 10279, 2, 402, 1),
+('製造者', '제조자', 10280, 2, 400, 1),
+('宗主國', '종주국', 10281, 2, 400, 1),
+('後天性免疫缺乏症', '후천성면역결핍증', 10282, 2, 399, 1),
+('有人島', '유인도', 10283, 2, 398, 1),
+('無線呼出機', '무선호출기', 10284, 2, 398, 1),
+('聖職者', '성직자', 10285, 2, 397, 1),
+('受信人', '수신인', 10286, 2, 395, 1),
+('敗北者', '패배자', 10287, 2, 395, 1),
+('科學技術', '과학기술', 10288, 2, 393, 1),
+('作者', '작자', 10289, 2, 392, 1),
+('虛無主義', '허무주의', 10290, 2, 392, 1),
+('論理的', '논리적', 10291, 2, 391, 1),
+('大胞子', '대포자', 10292, 2, 391, 1),
+('預言者', '예언자', 10293, 2, 390, 1),
+('死人', '사인', 10294, 2, 389, 1),
+('蒙古人', '몽고인', 10295, 2, 388, 1),
+('相續人', '상속인', 10296, 2, 385, 1),
+('風力團地', '풍력단지', 10297, 2, 385, 1),
+('學會', '학회', 10298, 2, 383, 1),
+('統率者', '통솔자', 10299, 2, 383, 1),
+('炭化水素', '탄화수소', 10300, 2, 383, 1),
+('老婦人', '노부인', 10301, 2, 382, 1),
+('敎條主義', '교조주의', 10302, 2, 382, 1),
+('國民投票', '국민투표', 10303, 2, 382, 1),
+('變溫動物', '변온동물', 10304, 2, 382, 1),
+('小學校', '소학교', 10305, 2, 381, 1),
+('人世', '인세', 10306, 2, 380, 1),
+('亡命者', '망명자', 10307, 2, 379, 1),
+('目的語', '목적어', 10308, 2, 379, 1),
+('異邦人', '이방인', 10309, 2, 378, 1),
+('學名', '학명', 10310, 2, 376, 1),
+('密告者', '밀고자', 10311, 2, 376, 1),
+('理性論', '이성론', 10312, 2, 376, 1),
+('古人', '고인', 10313, 2, 375, 1),
+('共謀者', '공모자', 10314, 2, 375, 1),
+('僞造者', '위조자', 10315, 2, 375, 1),
+('觀光學', '관광학', 10316, 2, 374, 1),
+('大同小異', '대동소이', 10317, 2, 374, 1),
+('關心種子', '관심종자', 10318, 2, 373, 1),
+('電氣面刀器', '전기면도기', 10319, 2, 373, 1),
+('人士', '인사', 10320, 2, 371, 1),
+('別有天地', '별유천지', 10321, 2, 371, 1),
+('逆行同化', '역행동화', 10322, 2, 371, 1),
+('職業女性', '직업여성', 10323, 2, 369, 1),
+('受取人', '수취인', 10324, 2, 368, 1),
+('鹽化 水素', '염화 수소', 10325, 2, 368, 1),
+('電氣通信士', '전기통신사', 10326, 2, 368, 1),
+('大幅的', '대폭적', 10327, 2, 367, 1),
+('野蠻人', '야만인', 10328, 2, 367, 1),
+('傍觀者', '방관자', 10329, 2, 366, 1),
+('量子化', '양자화', 10330, 2, 366, 1),
+('全體的', '전체적', 10331, 2, 366, 1),
+('造物主', '조물주', 10332, 2, 366, 1),
+('選擧人', '선거인', 10333, 2, 365, 1),
+('失敗者', '실패자', 10334, 2, 365, 1),
+('實存主義', '실존주의', 10335, 2, 365, 1),
+('移住者', '이주자', 10336, 2, 364, 1),
+('話者', '화자', 10337, 2, 363, 1),
+('脫走者', '탈주자', 10338, 2, 363, 1),
+('落薦者', '낙천자', 10339, 2, 362, 1),
+('候補者', '후보자', 10340, 2, 362, 1),
+('大西洋靑魚', '대서양청어', 10341, 2, 362, 1),
+('人和', '인화', 10342, 2, 361, 1),
+('調劑學', '조제학', 10343, 2, 361, 1),
+('下水道', '하수도', 10344, 2, 361, 1),
+('血液學', '혈액학', 10345, 2, 361, 1),
+('野人', '야인', 10346, 2, 360, 1),
+('三位一體', '삼위일체', 10347, 2, 360, 1),
+('大地', '대지', 10348, 2, 359, 1),
+('人命', '인명', 10349, 2, 359, 1),
+('鐵人', '철인', 10350, 2, 357, 1),
+('天主敎', '천주교', 10351, 2, 355, 1),
+('賢夫人', '현부인', 10352, 2, 355, 1),
+('弱者', '약자', 10353, 2, 354, 1),
+('國民黨', '국민당', 10354, 2, 354, 1),
+('音節文字', '음절문자', 10355, 2, 354, 1),
+('打者', '타자', 10356, 2, 353, 1),
+('出發地', '출발지', 10357, 2, 353, 1),
+('科學館', '과학관', 10358, 2, 352, 1),
+('事件의  地平', '사건의 지평선', 10359, 2, 352, 1),
+('人蔘茶', '인삼차', 10360, 2, 351, 1),
+('仲裁者', '중재자', 10361, 2, 351, 1),
+('合法化', '합법화', 10362, 2, 351, 1),
+('不定積分', '부정적분', 10363, 2, 351, 1),
+('私人', '사인', 10364, 2, 350, 1),
+('生水', '생수', 10365, 2, 350, 1),
+('發音器官', '발음기관', 10366, 2, 350, 1),
+('重力子', '중력자', 10367, 2, 349, 1),
+('保守主義', '보수주의', 10368, 2, 349, 1),
+('音響量子', '음향양자', 10369, 2, 349, 1),
+('黨人', '당인', 10370, 2, 347, 1),
+('國法', '국법', 10371, 2, 346, 1),
+('功利主義', '공리주의', 10372, 2, 346, 1),
+('物理治療', '물리치료', 10373, 2, 346, 1),
+('國道', '국도', 10374, 2, 345, 1),
+('宮人', '궁인', 10375, 2, 345, 1),
+('理事會', '이사회', 10376, 2, 345, 1),
+('繼承者', '계승자', 10377, 2, 344, 1),
+('勞動組合員', '노동조합원', 10378, 2, 344, 1),
+('公用語', '공용어', 10379, 2, 343, 1),
+('人稱', '인칭', 10380, 2, 342, 1),
+('主語', '주어', 10381, 2, 342, 1),
+('編者', '편자', 10382, 2, 342, 1),
+('復活主日', '부활주일', 10383, 2, 342, 1),
+('武人', '무인', 10384, 2, 341, 1),
+('俗人', '속인', 10385, 2, 341, 1),
+('類義語', '유의어', 10386, 2, 341, 1),
+('男聲中音', '남성중음', 10387, 2, 341, 1),
+('不孝子息', '불효자식', 10388, 2, 341, 1),
+('學部', '학부', 10389, 2, 340, 1),
+('伴侶者', '반려자', 10390, 2, 340, 1),
+('超自然的', '초자연적', 10391, 2, 340, 1),
+('理想的', '이상적', 10392, 2, 339, 1),
+('個個人', '개개인', 10393, 2, 338, 1),
+('雪人', '설인', 10394, 2, 337, 1),
+('理論家', '리론가', 10395, 2, 337, 1),
+('宇宙人', '우주인', 10396, 2, 337, 1),
+('理論家', '이론가', 10397, 2, 337, 1),
+('達人', '달인', 10398, 2, 336, 1),
+('屍體公示所', '시체공시소', 10399, 2, 336, 1),
+('狂人', '광인', 10400, 2, 335, 1),
+('癩患者', '나환자', 10401, 2, 335, 1),
+('仲買人', '중매인', 10402, 2, 335, 1),
+('脊索動物', '척삭동물', 10403, 2, 335, 1),
+('防衛産業體', '방위산업체', 10404, 2, 335, 1),
+('自動詞', '자동사', 10405, 2, 334, 1),
+('女聲高音', '녀성고음', 10406, 2, 334, 1),
+('故人', '고인', 10407, 2, 333, 1),
+('國外', '국외', 10408, 2, 333, 1),
+('牧人', '목인', 10409, 2, 333, 1),
+('學士', '학사', 10410, 2, 333, 1),
+('障礙人', '장애인', 10411, 2, 333, 1),
+('犧牲者', '희생자', 10412, 2, 333, 1),
+('舊人', '구인', 10413, 2, 331, 1),
+('野民正音', '야민정음', 10414, 2, 331, 1),
+('口蓋音化', '구개음화', 10415, 2, 330, 1),
+('伴侶動物', '반려동물', 10416, 2, 329, 1),
+('石器 時代', '석기 시대', 10417, 2, 329, 1),
+('女人', '여인', 10418, 2, 328, 1),
+('愚人', '우인', 10419, 2, 328, 1),
+('電子娛樂', '전자오락', 10420, 2, 328, 1),
+('浪人', '낭인', 10421, 2, 327, 1),
+('一國', '일국', 10422, 2, 327, 1),
+('匠人', '장인', 10423, 2, 327, 1),
+('原動機', '원동기', 10424, 2, 327, 1),
+('半自動', '반자동', 10425, 2, 326, 1),
+('長老敎會', '장로교회', 10426, 2, 326, 1),
+('百聞不如一見', '백문불여일견', 10427, 2, 326, 1),
+('盲人', '맹인', 10428, 2, 325, 1),
+('人倫', '인륜', 10429, 2, 325, 1),
+('愛國歌', '애국가', 10430, 2, 325, 1),
+('合氣道', '합기도', 10431, 2, 325, 1),
+('乞人', '걸인', 10432, 2, 324, 1),
+('偶人', '우인', 10433, 2, 324, 1),
+('意外-', '의외로', 10434, 2, 324, 1),
+('合衆國', '합중국', 10435, 2, 324, 1),
+('偉人', '위인', 10436, 2, 323, 1),
+('主-', '주로', 10437, 2, 323, 1),
+('遷人', '천인', 10438, 2, 323, 1),
+('大腿四頭筋', '대퇴사두근', 10439, 2, 323, 1),
+('大天使', '대천사', 10440, 2, 322, 1),
+('後進國', '후진국', 10441, 2, 320, 1),
+('大腿二頭筋', '대퇴이두근', 10442, 2, 320, 1),
+('轉學', '전학', 10443, 2, 319, 1),
+('無性愛', '무성애', 10444, 2, 319, 1),
+('合成語', '합성어', 10445, 2, 319, 1),
+('精神分裂病', '정신분열병', 10446, 2, 319, 1),
+('大日', '대일', 10447, 2, 316, 1),
+('生活賃金', '생활임금', 10448, 2, 316, 1),
+('世宗大王', '세종대왕', 10449, 2, 316, 1),
+('頭音 法則', '두음 법칙', 10450, 2, 316, 1),
+('開學', '개학', 10451, 2, 315, 1),
+('水晶體', '수정체', 10452, 2, 315, 1),
+('計器飛行', '계기비행', 10453, 2, 315, 1),
+('社會的', '사회적', 10454, 2, 314, 1),
+('在學', '재학', 10455, 2, 312, 1),
+('公式語', '공식어', 10456, 2, 312, 1),
+('刊行物', '간행물', 10457, 2, 311, 1),
+('運動選手', '운동선수', 10458, 2, 310, 1),
+('合理論', '합리론', 10459, 2, 309, 1),
+('學園', '학원', 10460, 2, 308, 1),
+('軍事力', '군사력', 10461, 2, 308, 1),
+('同意語', '동의어', 10462, 2, 306, 1),
+('反對語', '반대어', 10463, 2, 306, 1),
+('日氣 豫報', '일기 예보', 10464, 2, 306, 1),
+('建築學', '건축학', 10465, 2, 305, 1),
+('敎化所', '교화소', 10466, 2, 305, 1),
+('生氣', '생기', 10467, 2, 303, 1),
+('形容動詞', '형용동사', 10468, 2, 303, 1),
+('心不全', '심부전', 10469, 2, 302, 1),
+('上位語', '상위어', 10470, 2, 301, 1),
+('-終日', '온종일', 10471, 2, 301, 1),
+('縮地法', '축지법', 10472, 2, 301, 1),
+('一大', '일대', 10473, 2, 300, 1),
+('公式的', '공식적', 10474, 2, 300, 1),
+('大敎區', '대교구', 10475, 2, 300, 1),
+('留學', '유학', 10476, 2, 299, 1),
+('勞動組合費', '노동조합비', 10477, 2, 299, 1),
+('三段論法', '삼단논법', 10478, 2, 298, 1),
+('精神分裂症', '정신분열증', 10479, 2, 298, 1),
+('國軍', '국군', 10480, 2, 297, 1),
+('性行爲', '성행위', 10481, 2, 296, 1),
+('名詞化', '명사화', 10482, 2, 295, 1),
+('所有物', '소유물', 10483, 2, 295, 1),
+('事實無根', '사실무근', 10484, 2, 295, 1),
+('因數分解', '인수분해', 10485, 2, 295, 1),
+('工場主', '공장주', 10486, 2, 294, 1),
+('天文單位', '천문단위', 10487, 2, 294, 1),
+('正書法', '정서법', 10488, 2, 293, 1),
+('波動函數', '파동함수', 10489, 2, 293, 1),
+('聖體聖事', '성체성사', 10490, 2, 292, 1),
+('一心團結', '일심단결', 10491, 2, 292, 1),
+('大量虐殺', '대량학살', 10492, 2, 291, 1),
+('半地下', '반지하', 10493, 2, 290, 1),
+('文解敎育', '문해교육', 10494, 2, 289, 1),
+('議事日程', '의사일정', 10495, 2, 289, 1),
+('發電機', '발전기', 10496, 2, 288, 1),
+('現代的', '현대적', 10497, 2, 288, 1),
+('飛行機票', '비행기표', 10498, 2, 288, 1),
+('感動詞', '감동사', 10499, 2, 286, 1),
+('實習生', '실습생', 10500, 2, 286, 1),
+('地下鐵驛', '지하철역', 10501, 2, 285, 1),
+('分水嶺', '분수령', 10502, 2, 284, 1),
+('一般的', '일반적', 10503, 2, 284, 1),
+('敎會論', '교회론', 10504, 2, 283, 1),
+('過大評價', '과대평가', 10505, 2, 283, 1),
+('代表的', '대표적', 10506, 2, 282, 1),
+('處女性', '처녀성', 10507, 2, 282, 1),
+('女聲低音', '녀성저음', 10508, 2, 282, 1),
+('關係代名詞', '관계대명사', 10509, 2, 282, 1),
+('靑銅器 時代', '청동기 시대', 10510, 2, 282, 1),
+('複合語', '복합어', 10511, 2, 281, 1),
+('下宿生', '하숙생', 10512, 2, 281, 1),
+('國權', '국권', 10513, 2, 280, 1),
+('月長石', '월장석', 10514, 2, 280, 1),
+('電波 探知機', '전파 탐지기', 10515, 2, 280, 1),
+('長子', '장자', 10516, 2, 279, 1),
+('水烝氣', '수증기', 10517, 2, 279, 1),
+('男聲高音', '남성고음', 10518, 2, 279, 1),
+('夫婦 生活', '부부 생활', 10519, 2, 279, 1),
+('女子', '녀자', 10520, 2, 278, 1),
+('道知事', '도지사', 10521, 2, 278, 1),
+('反物質', '반물질', 10522, 2, 278, 1),
+('不公平', '불공평', 10523, 2, 278, 1),
+('鐵器 時代', '철기 시대', 10524, 2, 278, 1),
+('空手道', '공수도', 10525, 2, 277, 1),
+('天賦的', '천부적', 10526, 2, 277, 1),
+('不文律', '불문율', 10527, 2, 274, 1),
+('世界語', '세계어', 10528, 2, 274, 1),
+('基本的', '기본적', 10529, 2, 273, 1),
+('國花', '국화', 10530, 2, 272, 1),
+('爆發物', '폭발물', 10531, 2, 272, 1),
+('天地', '천지', 10532, 2, 271, 1),
+('不定詞', '부정사', 10533, 2, 271, 1),
+('路面電車', '노면전차', 10534, 2, 270, 1),
+('大黃魚', '대황어', 10535, 2, 269, 1),
+('微分法', '미분법', 10536, 2, 269, 1),
+('國交', '국교', 10537, 2, 268, 1),
+('言論家', '언론가', 10538, 2, 268, 1),
+('高速道路', '고속도로', 10539, 2, 268, 1),
+('否定語', '부정어', 10540, 2, 267, 1),
+('原子核', '원자핵', 10541, 2, 266, 1),
+('接境地帶', '접경지대', 10542, 2, 266, 1),
+('機動', '기동', 10543, 2, 265, 1),
+('書記長', '서기장', 10544, 2, 265, 1),
+('通常的', '통상적', 10545, 2, 265, 1),
+('二重母音', '이중모음', 10546, 2, 265, 1),
+('國防', '국방', 10547, 2, 264, 1),
+('五大洋', '오대양', 10548, 2, 264, 1),
+('主敎冠', '주교관', 10549, 2, 264, 1),
+('差分法', '차분법', 10550, 2, 264, 1),
+('不知不識間', '부지불식간', 10551, 2, 264, 1),
+('心性', '심성', 10552, 2, 262, 1),
+('關心事', '관심사', 10553, 2, 262, 1),
+('土侯國', '토후국', 10554, 2, 262, 1),
+('母音調和', '모음조화', 10555, 2, 261, 1),
+('無水', '무수', 10556, 2, 260, 1),
+('地名', '지명', 10557, 2, 260, 1),
+('新生', '신생', 10558, 2, 259, 1),
+('中道', '중도', 10559, 2, 259, 1),
+('悅口子湯', '열구자탕', 10560, 2, 259, 1),
+('頭文字', '두문자', 10561, 2, 258, 1),
+('強國', '강국', 10562, 2, 257, 1),
+('死生', '사생', 10563, 2, 257, 1),
+('生死', '생사', 10564, 2, 257, 1),
+('安全性', '안전성', 10565, 2, 257, 1),
+('無我夢中', '무아몽중', 10566, 2, 257, 1),
+('補助動詞', '보조동사', 10567, 2, 257, 1),
+('手荷物', '수하물', 10568, 2, 256, 1),
+('感受性', '감수성', 10569, 2, 255, 1),
+('反粒子', '반입자', 10570, 2, 255, 1),
+('不祥事', '불상사', 10571, 2, 255, 1),
+('父傳子傳', '부전자전', 10572, 2, 255, 1),
+('不飽和 脂肪酸', '불포화 지방산', 10573, 2, 255, 1),
+('國選', '국선', 10574, 2, 254, 1),
+('發電所', '발전소', 10575, 2, 254, 1),
+('運動員', '운동원', 10576, 2, 254, 1),
+('短篇 小說家', '단편 소설가', 10577, 2, 254, 1),
+('大口', '대구', 10578, 2, 253, 1),
+('-色', '밤색', 10579, 2, 253, 1),
+('-色', '흰색', 10580, 2, 253, 1),
+('--色', '검은색', 10581, 2, 253, 1),
+('大團圓', '대단원', 10582, 2, 253, 1),
+('--色', '빨간색', 10583, 2, 253, 1),
+('眞實性', '진실성', 10584, 2, 253, 1),
+('大衆歌謠', '대중가요', 10585, 2, 253, 1),
+('色---', '색다르다', 10586, 2, 253, 1),
+('永字八法', '영자팔법', 10587, 2, 253, 1),
+('水石', '수석', 10588, 2, 252, 1),
+('國技', '국기', 10589, 2, 250, 1),
+('補助定理', '보조정리', 10590, 2, 250, 1),
+('愛子', '애자', 10591, 2, 249, 1),
+('主敎', '주교', 10592, 2, 249, 1),
+('國營', '국영', 10593, 2, 248, 1),
+('義理', '의리', 10594, 2, 248, 1),
+('固有語', '고유어', 10595, 2, 248, 1),
+('公民權', '공민권', 10596, 2, 248, 1),
+('先發投手', '선발투수', 10597, 2, 248, 1),
+('卓上空論', '탁상공론', 10598, 2, 248, 1),
+('見習生', '견습생', 10599, 2, 247, 1),
+('六大州', '륙대륙', 10600, 2, 247, 1),
+('命令語', '명령어', 10601, 2, 247, 1),
+('優等生', '우등생', 10602, 2, 247, 1),
+('六大州', '육대륙', 10603, 2, 247, 1),
+('天然調味料', '천연조미료', 10604, 2, 247, 1),
+('重大', '중대', 10605, 2, 246, 1),
+('古典的', '고전적', 10606, 2, 246, 1),
+('誤作動', '오작동', 10607, 2, 246, 1),
+('相關--', '상관없이', 10608, 2, 246, 1),
+('電磁氣波', '전자기파', 10609, 2, 246, 1),
+('不可缺 脂肪酸', '불가결 지방산', 10610, 2, 246, 1),
+('合--', '합치다', 10611, 2, 245, 1),
+('性器', '성기', 10612, 2, 244, 1),
+('語形', '어형', 10613, 2, 244, 1),
+('地代', '지대', 10614, 2, 244, 1),
+('動員令', '동원령', 10615, 2, 244, 1),
+('理事', '이사', 10616, 2, 243, 1),
+('變化球', '변화구', 10617, 2, 243, 1),
+('日本酒', '일본주', 10618, 2, 243, 1),
+('女體', '여체', 10619, 2, 242, 1),
+('結果的', '결과적', 10620, 2, 242, 1),
+('絶對的', '절대적', 10621, 2, 242, 1),
+('直接的', '직접적', 10622, 2, 242, 1),
+('硏究院生', '연구원생', 10623, 2, 242, 1),
+('電動', '전동', 10624, 2, 241, 1),
+('小行星', '소행성', 10625, 2, 241, 1),
+('六角水', '육각수', 10626, 2, 241, 1),
+('—腸子', '큰창자', 10627, 2, 241, 1),
+('—腸子 ', '작은창자', 10628, 2, 241, 1),
+('風物놀이', '풍물놀이', 10629, 2, 241, 1),
+('氣道', '기도', 10630, 2, 240, 1),
+('用-', '용돈', 10631, 2, 240, 1),
+('體溫計', '체온계', 10632, 2, 240, 1),
+('國費', '국비', 10633, 2, 239, 1),
+('不戰勝', '부전승', 10634, 2, 239, 1),
+('夜行車', '야행차', 10635, 2, 239, 1),
+('外野手', '외야수', 10636, 2, 239, 1),
+('作詞家', '작사가', 10637, 2, 239, 1),
+('口語', '구어', 10638, 2, 238, 1),
+('法家', '법가', 10639, 2, 238, 1),
+('水靑木', '수청목', 10640, 2, 238, 1),
+('直接話法', '직접화법', 10641, 2, 238, 1),
+('日帝 強占期', '일제 강점기', 10642, 2, 238, 1),
+('-字', '글자', 10643, 2, 237, 1),
+('利己的', '리기적', 10644, 2, 237, 1),
+('隨時-', '수시로', 10645, 2, 237, 1),
+('年代記', '연대기', 10646, 2, 237, 1),
+('運動量', '운동량', 10647, 2, 237, 1),
+('利己的', '이기적', 10648, 2, 237, 1),
+('呼出機', '호출기', 10649, 2, 237, 1),
+('長老政治', '장로정치', 10650, 2, 237, 1),
+('行書', '행서', 10651, 2, 236, 1),
+('蓄音機', '축음기', 10652, 2, 236, 1),
+('現代 複合弓', '현대 복합궁', 10653, 2, 236, 1),
+('視界飛行', '시계비행', 10654, 2, 235, 1),
+('國弓', '국궁', 10655, 2, 234, 1),
+('有理式', '유리식', 10656, 2, 234, 1),
+('全般的', '전반적', 10657, 2, 234, 1),
+('上腕三頭筋', '상완삼두근', 10658, 2, 234, 1),
+('大路', '대로', 10659, 2, 233, 1),
+('數理', '수리', 10660, 2, 233, 1),
+('大丈夫', '대장부', 10661, 2, 233, 1),
+('六大洲', '육대주', 10662, 2, 232, 1),
+('積極的', '적극적', 10663, 2, 232, 1),
+('鐵物店', '철물점', 10664, 2, 232, 1),
+('標題語', '표제어', 10665, 2, 232, 1),
+('表面張力', '표면장력', 10666, 2, 232, 1),
+('冠狀動脈疾患', '관상동맥질환', 10667, 2, 232, 1),
+('孤立語', '고립어', 10668, 2, 231, 1),
+('無所有', '무소유', 10669, 2, 231, 1),
+('下腿三頭筋', '하퇴삼두근', 10670, 2, 231, 1),
+('強大', '강대', 10671, 2, 230, 1),
+('國仙', '국선', 10672, 2, 230, 1),
+('外力', '외력', 10673, 2, 230, 1),
+('公民證', '공민증', 10674, 2, 230, 1),
+('地級市', '지급시', 10675, 2, 230, 1),
+('土炭地', '토탄지', 10676, 2, 230, 1),
+('水面', '수면', 10677, 2, 229, 1),
+('中堅手', '중견수', 10678, 2, 229, 1),
+('社會 連結網', '사회 연결망', 10679, 2, 229, 1),
+('倭國', '왜국', 10680, 2, 228, 1),
+('爲國', '위국', 10681, 2, 228, 1),
+('作物', '작물', 10682, 2, 228, 1),
+('風水', '풍수', 10683, 2, 228, 1),
+('關係語', '관계어', 10684, 2, 228, 1),
+('受驗生', '수험생', 10685, 2, 228, 1),
+('語助辭', '어조사', 10686, 2, 228, 1),
+('他動詞', '타동사', 10687, 2, 228, 1),
+('評論家', '평론가', 10688, 2, 228, 1),
+('敎化', '교화', 10689, 2, 227, 1),
+('國是', '국시', 10690, 2, 227, 1),
+('大選', '대선', 10691, 2, 227, 1),
+('實-', '실로', 10692, 2, 227, 1),
+('實-', '실은', 10693, 2, 227, 1),
+('大陰脣', '대음순', 10694, 2, 227, 1),
+('日射病', '일사병', 10695, 2, 227, 1),
+('出入口', '출입구', 10696, 2, 227, 1),
+('男聲低音', '남성저음', 10697, 2, 227, 1),
+('宇宙飛行士', '우주비행사', 10698, 2, 227, 1),
+('國恥', '국치', 10699, 2, 226, 1),
+('本體', '본체', 10700, 2, 226, 1),
+('性感', '성감', 10701, 2, 226, 1),
+('感知機', '감지기', 10702, 2, 226, 1),
+('大吹打', '대취타', 10703, 2, 226, 1),
+('水酸基', '수산기', 10704, 2, 226, 1),
+('正走行', '정주행', 10705, 2, 226, 1),
+('漢越語', '한월어', 10706, 2, 226, 1),
+('不死鳥', '불사조', 10707, 2, 225, 1),
+('水剌間', '수라간', 10708, 2, 225, 1),
+('愛社心', '애사심', 10709, 2, 225, 1),
+('固執不通', '고집불통', 10710, 2, 225, 1),
+('調理士', '조리사', 10711, 2, 224, 1),
+('空想家', '공상가', 10712, 2, 223, 1),
+('興行場', '흥행장', 10713, 2, 223, 1),
+('固有名詞', '고유명사', 10714, 2, 223, 1),
+('正四角形', '정사각형', 10715, 2, 223, 1),
+('行政區劃', '행정구획', 10716, 2, 223, 1),
+('上體', '상체', 10717, 2, 222, 1),
+('性病', '성병', 10718, 2, 222, 1),
+('語調', '어조', 10719, 2, 222, 1),
+('文字盤', '문자반', 10720, 2, 222, 1),
+('為國', '위국', 10721, 2, 221, 1),
+('鄰國', '인국', 10722, 2, 221, 1),
+('造語', '조어', 10723, 2, 221, 1),
+('回生', '회생', 10724, 2, 221, 1),
+('穀倉地帶', '곡창지대', 10725, 2, 221, 1),
+('水藥', '수약', 10726, 2, 220, 1),
+('惡地', '악지', 10727, 2, 220, 1),
+('長文', '장문', 10728, 2, 220, 1),
+('變形力', '변형력', 10729, 2, 220, 1),
+('修飾語', '수식어', 10730, 2, 220, 1),
+('營養物', '영양물', 10731, 2, 220, 1),
+('濟州語', '제주어', 10732, 2, 220, 1),
+('中白鷺', '중백로', 10733, 2, 220, 1),
+('出入門', '출입문', 10734, 2, 220, 1),
+('勃起不全', '발기부전', 10735, 2, 220, 1),
+('-間', '그간', 10736, 2, 219, 1),
+('大臀筋', '대둔근', 10737, 2, 219, 1),
+('連續的', '연속적', 10738, 2, 219, 1),
+('百科全書', '백과전서', 10739, 2, 219, 1),
+('支拂不能', '지불불능', 10740, 2, 219, 1),
+('民家', '민가', 10741, 2, 218, 1),
+('能動態', '능동태', 10742, 2, 218, 1),
+('大元帥', '대원수', 10743, 2, 218, 1),
+('私生팬', '사생팬', 10744, 2, 218, 1),
+('酸化劑', '산화제', 10745, 2, 218, 1),
+('外交部', '외교부', 10746, 2, 218, 1),
+('投機場', '투기장', 10747, 2, 218, 1),
+('安全第一', '안전제일', 10748, 2, 218, 1),
+('下體', '하체', 10749, 2, 217, 1),
+('法務部', '법무부', 10750, 2, 217, 1),
+('行列式', '행렬식', 10751, 2, 217, 1),
+('中繼放送', '중계방송', 10752, 2, 217, 1),
+('大限', '대한', 10753, 2, 216, 1),
+('單純語', '단순어', 10754, 2, 216, 1),
+('汎流行', '범유행', 10755, 2, 216, 1),
+('料理師', '요리사', 10756, 2, 216, 1),
+('四物놀이', '사물놀이', 10757, 2, 216, 1),
+('敎理', '교리', 10758, 2, 215, 1),
+('大型', '대형', 10759, 2, 215, 1),
+('無力', '무력', 10760, 2, 215, 1),
+('主意', '주의', 10761, 2, 215, 1),
+('印象的', '인상적', 10762, 2, 215, 1),
+('定積分', '정적분', 10763, 2, 215, 1),
+('行政區', '행정구', 10764, 2, 215, 1),
+('板子', '판자', 10765, 2, 214, 1),
+('一壘手', '1루수', 10766, 2, 214, 1),
+('可視化', '가시화', 10767, 2, 214, 1),
+('三葉機', '삼엽기', 10768, 2, 214, 1),
+('案內文', '안내문', 10769, 2, 214, 1),
+('一壘手', '일루수', 10770, 2, 214, 1),
+('調理師', '조리사', 10771, 2, 214, 1),
+('活性炭', '활성탄', 10772, 2, 214, 1),
+('家出', '가출', 10773, 2, 213, 1),
+('大將', '대장', 10774, 2, 213, 1),
+('連語', '연어', 10775, 2, 213, 1),
+('日月', '일월', 10776, 2, 213, 1),
+('子葉', '자엽', 10777, 2, 213, 1),
+('體內', '체내', 10778, 2, 213, 1),
+('毒劇物', '독극물', 10779, 2, 213, 1),
+('格子', '격자', 10780, 2, 212, 1),
+('-前', '그전', 10781, 2, 212, 1),
+('水産', '수산', 10782, 2, 212, 1),
+('水質', '수질', 10783, 2, 212, 1),
+('外出', '외출', 10784, 2, 212, 1),
+('前-', '전날', 10785, 2, 212, 1),
+('領聖體', '영성체', 10786, 2, 212, 1),
+('市街電車', '시가전차', 10787, 2, 212, 1),
+('半-', '반말', 10788, 2, 211, 1),
+('手法', '수법', 10789, 2, 211, 1),
+('修道士', '수도사', 10790, 2, 211, 1),
+('自責感', '자책감', 10791, 2, 211, 1),
+('防禦機制', '방어기제', 10792, 2, 211, 1),
+('實體', '실재', 10793, 2, 210, 1),
+('流行', '유행', 10794, 2, 210, 1),
+('不適應', '부적응', 10795, 2, 210, 1),
+('硏究生', '연구생', 10796, 2, 210, 1),
+('零派生', '영파생', 10797, 2, 210, 1),
+('氣色', '기색', 10798, 2, 209, 1),
+('陽子', '양자', 10799, 2, 209, 1),
+('陰語', '음어', 10800, 2, 209, 1),
+('體面', '체면', 10801, 2, 209, 1),
+('可讀性', '가독성', 10802, 2, 209, 1),
+('量數詞', '양수사', 10803, 2, 209, 1),
+('議定書', '의정서', 10804, 2, 209, 1),
+('一攫千金', '일확천금', 10805, 2, 209, 1),
+('降生', '강생', 10806, 2, 208, 1),
+('名家', '명가', 10807, 2, 208, 1),
+('王水', '왕수', 10808, 2, 208, 1),
+('電文', '전문', 10809, 2, 208, 1),
+('上院議員', '상원의원', 10810, 2, 208, 1),
+('生覺', '생각', 10811, 2, 207, 1),
+('不可能', '불가능', 10812, 2, 207, 1),
+('壓力計', '압력계', 10813, 2, 207, 1),
+('郵便集配員', '우편집배원', 10814, 2, 207, 1),
+('防水', '방수', 10815, 2, 206, 1),
+('-便', '저편', 10816, 2, 206, 1),
+('-便', '한편', 10817, 2, 206, 1),
+('--便', '맞은편', 10818, 2, 206, 1),
+('盲目的', '맹목적', 10819, 2, 206, 1),
+('習慣的', '습관적', 10820, 2, 206, 1),
+('全速力', '전속력', 10821, 2, 206, 1),
+('投球數', '투구수', 10822, 2, 206, 1),
+('大麻', '대마', 10823, 2, 205, 1),
+('性轉換', '성전환', 10824, 2, 205, 1),
+('潛水服', '잠수복', 10825, 2, 205, 1),
+('別-', '별로', 10826, 2, 204, 1),
+('計量器', '계량기', 10827, 2, 204, 1),
+('死火山', '사화산', 10828, 2, 204, 1),
+('外務部', '외무부', 10829, 2, 204, 1),
+('別---', '별다르다', 10830, 2, 204, 1),
+('株式會社', '주식회사', 10831, 2, 204, 1),
+('大網', '대망', 10832, 2, 203, 1),
+('一無', '일무', 10833, 2, 203, 1),
+('一輪車', '일륜차', 10834, 2, 203, 1),
+('血色素', '혈색소', 10835, 2, 203, 1),
+('難攻不落', '난공불락', 10836, 2, 203, 1),
+('上腕二頭筋', '상완이두근', 10837, 2, 203, 1),
+('物證', '물증', 10838, 2, 202, 1),
+('美化', '미화', 10839, 2, 202, 1),
+('射的', '사적', 10840, 2, 202, 1),
+('聲明書', '성명서', 10841, 2, 202, 1),
+('極-', '극히', 10842, 2, 201, 1),
+('大蛇', '대사', 10843, 2, 201, 1),
+('補語', '보어', 10844, 2, 201, 1),
+('一名', '일명', 10845, 2, 201, 1),
+('空心菜', '공심채', 10846, 2, 201, 1),
+('單母音', '단모음', 10847, 2, 201, 1),
+('不適格', '부적격', 10848, 2, 201, 1),
+('性關係', '성관계', 10849, 2, 201, 1),
+('女敎皇', '여교황', 10850, 2, 201, 1),
+('研究生', '연구생', 10851, 2, 201, 1),
+('二進法', '이진법', 10852, 2, 201, 1),
+('史的', '사적', 10853, 2, 200, 1),
+('華語', '화어', 10854, 2, 200, 1),
+('基地村', '기지촌', 10855, 2, 200, 1),
+('地羊湯', '지양탕', 10856, 2, 200, 1),
+('高脂血症', '고지혈증', 10857, 2, 200, 1),
+('六字眞言', '육자진언', 10858, 2, 200, 1),
+('興味--', '흥미롭다', 10859, 2, 200, 1),
+('大綱大綱', '대강대강', 10860, 2, 199, 1),
+('放送事故', '방송사고', 10861, 2, 199, 1),
+('公事', '공사', 10862, 2, 198, 1),
+('大抵', '대저', 10863, 2, 198, 1),
+('私的', '사적', 10864, 2, 198, 1),
+('永生', '영생', 10865, 2, 198, 1),
+('發煙器', '발연기', 10866, 2, 198, 1),
+('市民權', '시민권', 10867, 2, 198, 1),
+('直說法', '직설법', 10868, 2, 198, 1),
+('湯水桶', '탕수통', 10869, 2, 198, 1),
+('繪文字', '회문자', 10870, 2, 198, 1),
+('高道', '고도', 10871, 2, 197, 1),
+('寄生', '기생', 10872, 2, 197, 1),
+('語派', '어파', 10873, 2, 197, 1),
+('胞子', '포자', 10874, 2, 197, 1),
+('規則的', '규칙적', 10875, 2, 197, 1),
+('內野手', '내야수', 10876, 2, 197, 1),
+('多元化', '다원화', 10877, 2, 197, 1),
+('大饑', '대기', 10878, 2, 196, 1),
+('語根', '어근', 10879, 2, 196, 1),
+('傳動', '전동', 10880, 2, 196, 1),
+('家政婦', '가정부', 10881, 2, 196, 1),
+('山神靈', '산신령', 10882, 2, 196, 1),
+('正反對', '정반대', 10883, 2, 196, 1),
+('大捷', '대첩', 10884, 2, 195, 1),
+('同文', '동문', 10885, 2, 195, 1),
+('陽地', '양지', 10886, 2, 195, 1),
+('錄音室', '녹음실', 10887, 2, 195, 1),
+('女店員', '여점원', 10888, 2, 195, 1),
+('大', '대', 10889, 2, 194, 1),
+('大笒', '대금', 10890, 2, 194, 1),
+('語尾', '어미', 10891, 2, 194, 1),
+('定力', '정력', 10892, 2, 194, 1),
+('可燃物', '가연물', 10893, 2, 194, 1),
+('管樂器', '관악기', 10894, 2, 194, 1),
+('越境地', '월경지', 10895, 2, 194, 1),
+('赤外線', '적외선', 10896, 2, 194, 1),
+('非常事態', '비상사태', 10897, 2, 194, 1),
+('現在時制', '현재시제', 10898, 2, 194, 1),
+('道場', '도장', 10899, 2, 193, 1),
+('不明', '불명', 10900, 2, 193, 1),
+('語源', '어원', 10901, 2, 193, 1),
+('集體', '집체', 10902, 2, 193, 1),
+('桶子', '통자', 10903, 2, 193, 1),
+('計器板', '계기판', 10904, 2, 193, 1),
+('命令法', '명령법', 10905, 2, 193, 1),
+('複母音', '복모음', 10906, 2, 193, 1),
+('案內書', '안내서', 10907, 2, 193, 1),
+('視床下部', '시상하부', 10908, 2, 193, 1),
+('-初', '애초', 10909, 2, 192, 1),
+('禮物', '예물', 10910, 2, 192, 1),
+('冊子', '책자', 10911, 2, 192, 1),
+('體質', '체질', 10912, 2, 192, 1),
+('彈性', '탄성', 10913, 2, 192, 1),
+('海女', '해녀', 10914, 2, 192, 1),
+('計算書', '계산서', 10915, 2, 192, 1),
+('工作員', '공작원', 10916, 2, 192, 1),
+('來後年', '내후년', 10917, 2, 192, 1),
+('比喩的', '비유적', 10918, 2, 192, 1),
+('生크림', '생크림', 10919, 2, 192, 1),
+('十字軍', '십자군', 10920, 2, 192, 1),
+('校庭暴力', '교정폭력', 10921, 2, 192, 1),
+('不利', '불리', 10922, 2, 191, 1),
+('松子', '송자', 10923, 2, 191, 1),
+('時日', '시일', 10924, 2, 191, 1),
+('樣子', '양자', 10925, 2, 191, 1),
+('日時', '일시', 10926, 2, 191, 1),
+('着地', '착지', 10927, 2, 191, 1),
+('畜生', '축생', 10928, 2, 191, 1),
+('無言歌', '무언가', 10929, 2, 191, 1),
+('修道院', '수도원', 10930, 2, 191, 1),
+('葉綠體', '엽록체', 10931, 2, 191, 1),
+('重積分', '중적분', 10932, 2, 191, 1),
+('未來時制', '미래시제', 10933, 2, 191, 1),
+('劇的', '극적', 10934, 2, 190, 1),
+('理解', '리해', 10935, 2, 190, 1),
+('分點', '분점', 10936, 2, 190, 1),
+('肉水', '육수', 10937, 2, 190, 1),
+('僞陰性', '위음성', 10938, 2, 190, 1),
+('出張所', '출장소', 10939, 2, 190, 1),
+('氣流', '기류', 10940, 2, 189, 1),
+('流音', '류음', 10941, 2, 189, 1),
+('雨水', '우수', 10942, 2, 189, 1),
+('特殊性', '특수성', 10943, 2, 189, 1),
+('自求多福', '자구다복', 10944, 2, 189, 1),
+('女子', '여자', 10945, 2, 188, 1),
+('妻子', '처자', 10946, 2, 188, 1),
+('比較的', '비교적', 10947, 2, 188, 1),
+('棲息地', '서식지', 10948, 2, 188, 1),
+('水煙筒', '수연통', 10949, 2, 188, 1),
+('安息日', '안식일', 10950, 2, 188, 1),
+('蓄電器', '축전기', 10951, 2, 188, 1),
+('堆積物', '퇴적물', 10952, 2, 188, 1),
+('自由奔放', '자유분방', 10953, 2, 188, 1),
+('蹴球選手', '축구선수', 10954, 2, 188, 1),
+('生', '생', 10955, 2, 187, 1),
+('工法', '공법', 10956, 2, 187, 1),
+('男體', '남체', 10957, 2, 187, 1),
+('冷水', '냉수', 10958, 2, 187, 1),
+('粒子', '입자', 10959, 2, 187, 1),
+('中士', '중사', 10960, 2, 187, 1),
+('高段數', '고단수', 10961, 2, 187, 1),
+('記憶力', '기억력', 10962, 2, 187, 1),
+('自治州', '자치주', 10963, 2, 187, 1),
+('體位', '체위', 10964, 2, 186, 1),
+('基數詞', '기수사', 10965, 2, 186, 1),
+('라오語', '라오어', 10966, 2, 186, 1),
+('不適切', '부적절', 10967, 2, 186, 1),
+('有夫女', '유부녀', 10968, 2, 186, 1),
+('公正價', '공정가', 10969, 2, 185, 1),
+('紫外線', '자외선', 10970, 2, 185, 1),
+('習性', '습성', 10971, 2, 184, 1),
+('語幹', '어간', 10972, 2, 184, 1),
+('改新敎', '개신교', 10973, 2, 184, 1),
+('對外秘', '대외비', 10974, 2, 184, 1),
+('覆盆子', '복분자', 10975, 2, 184, 1),
+('新民謠', '신민요', 10976, 2, 184, 1),
+('自警團', '자경단', 10977, 2, 184, 1),
+('出産率', '출산율', 10978, 2, 184, 1),
+('自初至終', '자초지종', 10979, 2, 184, 1),
+('水都', '수도', 10980, 2, 183, 1),
+('時事', '시사', 10981, 2, 183, 1),
+('不飽和', '불포화', 10982, 2, 183, 1),
+('水銀', '수은', 10983, 2, 182, 1),
+('椰子', '야자', 10984, 2, 182, 1),
+('原文', '원문', 10985, 2, 182, 1),
+('圓-', '원주', 10986, 2, 182, 1),
+('陰性', '음성', 10987, 2, 182, 1),
+('敵地', '적지', 10988, 2, 182, 1),
+('波動', '파동', 10989, 2, 182, 1),
+('三角形', '삼각형', 10990, 2, 182, 1),
+('乘合車', '승합차', 10991, 2, 182, 1),
+('過去時制', '과거시제', 10992, 2, 182, 1),
+('椰子  ', '야자나무', 10993, 2, 182, 1),
+('二次方程式', '이차방정식', 10994, 2, 182, 1),
+('軍民', '군민', 10995, 2, 181, 1),
+('氣風', '기풍', 10996, 2, 181, 1),
+('名手', '명수', 10997, 2, 181, 1),
+('熟水', '숙수', 10998, 2, 181, 1),
+('一同', '일동', 10999, 2, 181, 1),
+('-層', '한층', 11000, 2, 181, 1),
+('義勇兵', '의용병', 11001, 2, 181, 1),
+('超能力', '초능력', 11002, 2, 181, 1),
+('韓民族', '한민족', 11003, 2, 181, 1),
+('化粧臺', '화장대', 11004, 2, 181, 1),
+('變體', '변체', 11005, 2, 180, 1),
+('粵語', '월어', 11006, 2, 180, 1),
+('球面角', '구면각', 11007, 2, 180, 1),
+('視神經', '시신경', 11008, 2, 180, 1),
+('十字線', '십자선', 11009, 2, 180, 1),
+('二進數', '이진수', 11010, 2, 180, 1),
+('王政復古', '왕정복고', 11011, 2, 180, 1),
+('有象無象', '유상무상', 11012, 2, 180, 1),
+('老化', '노화', 11013, 2, 179, 1),
+('庵子', '암자', 11014, 2, 179, 1),
+('一流', '일류', 11015, 2, 179, 1),
+('宗主', '종주', 11016, 2, 179, 1),
+('半時間', '반시간', 11017, 2, 179, 1),
+('不滿足', '불만족', 11018, 2, 179, 1),
+('集電裝置', '집전장치', 11019, 2, 179, 1),
+('本名', '본명', 11020, 2, 178, 1),
+('流民', '유민', 11021, 2, 178, 1),
+('機械工', '기계공', 11022, 2, 178, 1),
+('細斷機', '세단기', 11023, 2, 178, 1),
+('洗面器', '세면기', 11024, 2, 178, 1),
+('州知事', '주지사', 11025, 2, 178, 1),
+('只今-', '지금껏', 11026, 2, 178, 1),
+('打樂器', '타악기', 11027, 2, 178, 1),
+('頭音', '두음', 11028, 2, 177, 1),
+('明文', '명문', 11029, 2, 177, 1),
+('主刑', '주형', 11030, 2, 177, 1),
+('廢水', '폐수', 11031, 2, 177, 1),
+('未成年', '미성년', 11032, 2, 177, 1),
+('美少年', '미소년', 11033, 2, 177, 1),
+('時計師', '시계사', 11034, 2, 177, 1),
+('外接圓', '외접원', 11035, 2, 177, 1),
+('漢民族', '한민족', 11036, 2, 177, 1),
+('和集合', '합집합', 11037, 2, 177, 1),
+('死後硬直', '사후경직', 11038, 2, 177, 1),
+('本色', '본색', 11039, 2, 176, 1),
+('祭物', '제물', 11040, 2, 176, 1),
+('韓中', '한중', 11041, 2, 176, 1),
+('三壘手', '3루수', 11042, 2, 176, 1),
+('三壘手', '삼루수', 11043, 2, 176, 1),
+('惡天候', '악천후', 11044, 2, 176, 1),
+('原形質', '원형질', 11045, 2, 176, 1),
+('命中', '명중', 11046, 2, 175, 1),
+('世事', '세사', 11047, 2, 175, 1),
+('窓-', '창가', 11048, 2, 175, 1),
+('海戰', '해전', 11049, 2, 175, 1),
+('腦卒中', '뇌졸중', 11050, 2, 175, 1),
+('四死球', '사사구', 11051, 2, 175, 1),
+('通信員', '통신원', 11052, 2, 175, 1),
+('料理', '료리', 11053, 2, 174, 1),
+('自意', '자의', 11054, 2, 174, 1),
+('自制', '자제', 11055, 2, 174, 1),
+('紫地', '자지', 11056, 2, 174, 1),
+('行星', '행성', 11057, 2, 174, 1),
+('不可缺', '불가결', 11058, 2, 174, 1),
+('譬喩的', '비유적', 11059, 2, 174, 1),
+('總領事', '총영사', 11060, 2, 174, 1),
+('漏水', '누수', 11061, 2, 173, 1),
+('名所', '명소', 11062, 2, 173, 1),
+('不過', '불과', 11063, 2, 173, 1),
+('水腫', '수종', 11064, 2, 173, 1),
+('流出', '유출', 11065, 2, 173, 1),
+('財物', '재물', 11066, 2, 173, 1),
+('中隊', '중대', 11067, 2, 173, 1),
+('地貸', '지대', 11068, 2, 173, 1),
+('下女', '하녀', 11069, 2, 173, 1),
+('料理師', '요리사', 11070, 2, 173, 1),
+('運命論', '운명론', 11071, 2, 173, 1),
+('應答機', '응답기', 11072, 2, 173, 1),
+('睡眠不足', '수면부족', 11073, 2, 173, 1),
+('海溢防波堤', '해일방파제', 11074, 2, 173, 1),
+('巨物', '거물', 11075, 2, 172, 1),
+('修行', '수행', 11076, 2, 172, 1),
+('潛水', '잠수', 11077, 2, 172, 1),
+('副知事', '부지사', 11078, 2, 172, 1),
+('思想家', '사상가', 11079, 2, 172, 1),
+('未濟 事件', '미제 사건', 11080, 2, 172, 1),
+('年代', '년대', 11081, 2, 171, 1),
+('山神', '산신', 11082, 2, 171, 1),
+('新書', '신서', 11083, 2, 171, 1),
+('實數', '실수', 11084, 2, 171, 1),
+('幼主', '유주', 11085, 2, 171, 1),
+('單葉機', '단엽기', 11086, 2, 171, 1),
+('無作爲', '무작위', 11087, 2, 171, 1),
+('遺家族', '유가족', 11088, 2, 171, 1),
+('魂--', '혼나다', 11089, 2, 171, 1),
+('法王', '법왕', 11090, 2, 170, 1),
+('魚道', '어도', 11091, 2, 170, 1),
+('長病', '장병', 11092, 2, 170, 1),
+('黑體', '흑체', 11093, 2, 170, 1),
+('文具店', '문구점', 11094, 2, 170, 1),
+('反對—', '반대말', 11095, 2, 170, 1),
+('鐵道驛', '철도역', 11096, 2, 170, 1),
+('月月山山', '월월산산', 11097, 2, 170, 1),
+('古家', '고가', 11098, 2, 169, 1),
+('盆地', '분지', 11099, 2, 169, 1),
+('不服', '불복', 11100, 2, 169, 1),
+('音素', '음소', 11101, 2, 169, 1),
+('地殼', '지각', 11102, 2, 169, 1),
+('體容', '체용', 11103, 2, 169, 1),
+('金半指', '금반지', 11104, 2, 169, 1),
+('夢想家', '몽상가', 11105, 2, 169, 1),
+('聖戰士', '성전사', 11106, 2, 169, 1),
+('超音速', '초음속', 11107, 2, 169, 1),
+('犧牲物', '희생물', 11108, 2, 169, 1),
+('動因', '동인', 11109, 2, 168, 1),
+('主旨', '주지', 11110, 2, 168, 1),
+('黑化', '흑화', 11111, 2, 168, 1),
+('老處女', '노처녀', 11112, 2, 168, 1),
+('老處女', '로처녀', 11113, 2, 168, 1),
+('會議錄', '회의록', 11114, 2, 168, 1),
+('的', '적', 11115, 2, 167, 1),
+('半音', '반음', 11116, 2, 167, 1),
+('媤-', '시집', 11117, 2, 167, 1),
+('食感', '식감', 11118, 2, 167, 1),
+('員數', '원수', 11119, 2, 167, 1),
+('名詞句', '명사구', 11120, 2, 167, 1),
+('保管所', '보관소', 11121, 2, 167, 1),
+('不汗黨', '불한당', 11122, 2, 167, 1),
+('亞音速', '아음속', 11123, 2, 167, 1),
+('危險性', '위험성', 11124, 2, 167, 1),
+('射倖産業', '사행산업', 11125, 2, 167, 1),
+('代金', '대금', 11126, 2, 166, 1),
+('文魚', '문어', 11127, 2, 166, 1),
+('性向', '성향', 11128, 2, 166, 1),
+('全心', '전심', 11129, 2, 166, 1),
+('幅--', '폭넓다', 11130, 2, 166, 1),
+('唐—  軍隊', '당나라 군대', 11131, 2, 166, 1),
+('補體', '보체', 11132, 2, 165, 1),
+('音質', '음질', 11133, 2, 165, 1),
+('電車', '전차', 11134, 2, 165, 1),
+('浸水', '침수', 11135, 2, 165, 1),
+('黨中央', '당중앙', 11136, 2, 165, 1),
+('三輪車', '삼륜차', 11137, 2, 165, 1),
+('意外', '의외', 11138, 2, 164, 1),
+('時間表', '시간표', 11139, 2, 164, 1),
+('音信', '음신', 11140, 2, 163, 1),
+('複葉機', '복엽기', 11141, 2, 163, 1),
+('探知機', '탐지기', 11142, 2, 163, 1),
+('古今東西', '고금동서', 11143, 2, 163, 1),
+('歸責事由', '귀책사유', 11144, 2, 163, 1),
+('東西古今', '동서고금', 11145, 2, 163, 1),
+('四柱八字', '사주팔자', 11146, 2, 163, 1),
+('個體', '개체', 11147, 2, 162, 1),
+('實名', '실명', 11148, 2, 162, 1),
+('音量', '음량', 11149, 2, 162, 1),
+('中退', '중퇴', 11150, 2, 162, 1),
+('合字', '합자', 11151, 2, 162, 1),
+('空城計', '공성계', 11152, 2, 162, 1),
+('例--', '예컨대', 11153, 2, 162, 1),
+('運轉手', '운전수', 11154, 2, 162, 1),
+('閉會式', '폐회식', 11155, 2, 162, 1),
+('宮中', '궁중', 11156, 2, 161, 1),
+('贓物', '장물', 11157, 2, 161, 1),
+('中宮', '중궁', 11158, 2, 161, 1),
+('對譯本', '대역본', 11159, 2, 161, 1),
+('公定', '공정', 11160, 2, 160, 1),
+('不滿', '불만', 11161, 2, 160, 1),
+('日報', '일보', 11162, 2, 160, 1),
+('微氣候', '미기후', 11163, 2, 160, 1),
+('兵器庫', '병기고', 11164, 2, 160, 1),
+('日章旗', '일장기', 11165, 2, 160, 1),
+('懷中鏡', '회중경', 11166, 2, 160, 1),
+('慣性', '관성', 11167, 2, 159, 1),
+('母女', '모녀', 11168, 2, 159, 1),
+('業所', '업소', 11169, 2, 159, 1),
+('音調', '음조', 11170, 2, 159, 1),
+('加工品', '가공품', 11171, 2, 159, 1),
+('服用量', '복용량', 11172, 2, 159, 1),
+('三重殺', '삼중살', 11173, 2, 159, 1),
+('太陽電池', '태양전지', 11174, 2, 159, 1),
+('苦行', '고행', 11175, 2, 158, 1),
+('劇中', '극중', 11176, 2, 158, 1),
+('慢性', '만성', 11177, 2, 158, 1),
+('分類', '분류', 11178, 2, 158, 1),
+('敏捷性', '민첩성', 11179, 2, 158, 1),
+('戰鬪員', '전투원', 11180, 2, 158, 1),
+('太陽神', '태양신', 11181, 2, 158, 1),
+('民兵', '민병', 11182, 2, 157, 1),
+('山所', '산소', 11183, 2, 157, 1),
+('樂書', '악서', 11184, 2, 157, 1),
+('異義', '이의', 11185, 2, 157, 1),
+('出壘率', '출루율', 11186, 2, 157, 1),
+('限定詞', '한정사', 11187, 2, 157, 1),
+('中華', '중화', 11188, 2, 156, 1),
+('補充法', '보충법', 11189, 2, 156, 1),
+('六分儀', '육분의', 11190, 2, 156, 1),
+('製造業', '제조업', 11191, 2, 156, 1),
+('過小評價', '과소평가', 11192, 2, 156, 1),
+('綠化', '녹화', 11193, 2, 155, 1),
+('矮性', '왜성', 11194, 2, 155, 1),
+('會期', '회기', 11195, 2, 155, 1),
+('警報器', '경보기', 11196, 2, 155, 1),
+('宿命論', '숙명론', 11197, 2, 155, 1),
+('鄕土 飮食', '향토 음식', 11198, 2, 155, 1),
+('強力', '강력', 11199, 2, 154, 1),
+('分斷', '분단', 11200, 2, 154, 1),
+('煽動', '선동', 11201, 2, 154, 1),
+('十分', '십분', 11202, 2, 154, 1),
+('理性', '이성', 11203, 2, 154, 1),
+('會士', '회사', 11204, 2, 154, 1),
+('會意', '회의', 11205, 2, 154, 1),
+('高祖母', '고조모', 11206, 2, 154, 1),
+('望夫石', '망부석', 11207, 2, 154, 1),
+('五六月', '오뉴월', 11208, 2, 154, 1),
+('入場券', '입장권', 11209, 2, 154, 1),
+('八角形', '팔각형', 11210, 2, 154, 1),
+('現代史', '현대사', 11211, 2, 154, 1),
+('黃花九輪草', '황화구륜초', 11212, 2, 154, 1),
+('放心', '방심', 11213, 2, 153, 1),
+('食後', '식후', 11214, 2, 153, 1),
+('顫動', '전동', 11215, 2, 153, 1),
+('黃道', '황도', 11216, 2, 153, 1),
+('十角形', '십각형', 11217, 2, 153, 1),
+('統一案', '통일안', 11218, 2, 153, 1),
+('螢光色', '형광색', 11219, 2, 153, 1),
+('明若觀火', '명약관화', 11220, 2, 153, 1),
+('高山', '고산', 11221, 2, 152, 1),
+('算法', '산법', 11222, 2, 152, 1),
+('日落', '일락', 11223, 2, 152, 1),
+('戰死', '전사', 11224, 2, 152, 1),
+('電線', '전선', 11225, 2, 152, 1),
+('職分', '직분', 11226, 2, 152, 1),
+('露天鑛', '노천광', 11227, 2, 152, 1),
+('變壓器', '변압기', 11228, 2, 152, 1),
+('天使菜', '천사채', 11229, 2, 152, 1),
+('八色鳥', '팔색조', 11230, 2, 152, 1),
+('韓食堂', '한식당', 11231, 2, 152, 1),
+('自畵自讚', '자화자찬', 11232, 2, 152, 1),
+('古名', '고명', 11233, 2, 151, 1),
+('民魚', '민어', 11234, 2, 151, 1),
+('石工', '석공', 11235, 2, 151, 1),
+('中絶', '중절', 11236, 2, 151, 1),
+('合計', '합계', 11237, 2, 151, 1),
+('經驗論', '경험론', 11238, 2, 151, 1),
+('導入部', '도입부', 11239, 2, 151, 1),
+('不拘束', '불구속', 11240, 2, 151, 1),
+('養蜂家', '양봉가', 11241, 2, 151, 1),
+('全世界', '전세계', 11242, 2, 151, 1),
+('除雪機', '제설기', 11243, 2, 151, 1),
+('教理', '교리', 11244, 2, 150, 1),
+('發展期', '발전기', 11245, 2, 150, 1),
+('室內服', '실내복', 11246, 2, 150, 1),
+('廚房長', '주방장', 11247, 2, 150, 1),
+('配分', '배분', 11248, 2, 149, 1),
+('父音', '부음', 11249, 2, 149, 1),
+('不忠', '불충', 11250, 2, 149, 1),
+('産出', '산출', 11251, 2, 149, 1),
+('聖事', '성사', 11252, 2, 149, 1),
+('淨化', '정화', 11253, 2, 149, 1),
+('體腔', '체강', 11254, 2, 149, 1),
+('畫家', '화가', 11255, 2, 149, 1),
+('外務省', '외무성', 11256, 2, 149, 1),
+('最前線', '최전선', 11257, 2, 149, 1),
+('少年宮殿', '소년궁전', 11258, 2, 149, 1),
+('理由', '리유', 11259, 2, 148, 1),
+('明月', '명월', 11260, 2, 148, 1),
+('不眠', '불면', 11261, 2, 148, 1),
+('書房', '서방', 11262, 2, 148, 1),
+('畵法', '화법', 11263, 2, 148, 1),
+('火食', '화식', 11264, 2, 148, 1),
+('賣出額', '매출액', 11265, 2, 148, 1),
+('五角形', '오각형', 11266, 2, 148, 1),
+('誘導機', '유도기', 11267, 2, 148, 1),
+('救援投手', '구원투수', 11268, 2, 148, 1),
+('自己紹介', '자기소개', 11269, 2, 148, 1),
+('客氣', '객기', 11270, 2, 147, 1),
+('光年', '광년', 11271, 2, 147, 1),
+('發熱', '발열', 11272, 2, 147, 1),
+('三代', '삼대', 11273, 2, 147, 1),
+('室長', '실장', 11274, 2, 147, 1),
+('愛車', '애차', 11275, 2, 147, 1),
+('配電盤', '배전반', 11276, 2, 147, 1),
+('粉食類', '분식류', 11277, 2, 147, 1),
+('洋食堂', '양식당', 11278, 2, 147, 1),
+('適正量', '적정량', 11279, 2, 147, 1),
+('泌尿器科', '비뇨기과', 11280, 2, 147, 1),
+('空白', '공백', 11281, 2, 146, 1),
+('器官', '기관', 11282, 2, 146, 1),
+('市外', '시외', 11283, 2, 146, 1),
+('施行', '시행', 11284, 2, 146, 1),
+('兵器廠', '병기창', 11285, 2, 146, 1),
+('書類綴', '서류철', 11286, 2, 146, 1),
+('自鳴琴', '자명금', 11287, 2, 146, 1),
+('毛細血管', '모세혈관', 11288, 2, 146, 1),
+('理致', '리치', 11289, 2, 145, 1),
+('法輪', '법륜', 11290, 2, 145, 1),
+('私事', '사사', 11291, 2, 145, 1),
+('上面', '상면', 11292, 2, 145, 1),
+('乘法', '승법', 11293, 2, 145, 1),
+('身長', '신장', 11294, 2, 145, 1),
+('理致', '이치', 11295, 2, 145, 1),
+('二壘手', '2루수', 11296, 2, 145, 1),
+('二壘手', '이루수', 11297, 2, 145, 1),
+('眞空管', '진공관', 11298, 2, 145, 1),
+('處女膜', '처녀막', 11299, 2, 145, 1),
+('尖銳化', '첨예화', 11300, 2, 145, 1),
+('掛鐘時計', '괘종시계', 11301, 2, 145, 1),
+('杆體', '간체', 11302, 2, 144, 1),
+('空車', '공차', 11303, 2, 144, 1),
+('慣行', '관행', 11304, 2, 144, 1),
+('微分', '미분', 11305, 2, 144, 1),
+('不屈', '불굴', 11306, 2, 144, 1),
+('不吉', '불길', 11307, 2, 144, 1),
+('商事', '상사', 11308, 2, 144, 1),
+('詩文', '시문', 11309, 2, 144, 1),
+('中途', '중도', 11310, 2, 144, 1),
+('窒化', '질화', 11311, 2, 144, 1),
+('不均衡', '불균형', 11312, 2, 144, 1),
+('世上에', '세상에', 11313, 2, 144, 1),
+('旭日旗', '욱일기', 11314, 2, 144, 1),
+('認識論', '인식론', 11315, 2, 144, 1),
+('電話費', '전화비', 11316, 2, 144, 1),
+('氣象', '기상', 11317, 2, 143, 1),
+('民話', '민화', 11318, 2, 143, 1),
+('半年', '반년', 11319, 2, 143, 1),
+('發火', '발화', 11320, 2, 143, 1),
+('長調', '장조', 11321, 2, 143, 1),
+('條理', '조리', 11322, 2, 143, 1),
+('天職', '천직', 11323, 2, 143, 1),
+('失業率', '실업률', 11324, 2, 143, 1),
+('六角形', '육각형', 11325, 2, 143, 1),
+('最上級', '최상급', 11326, 2, 143, 1),
+('登記郵便', '등기우편', 11327, 2, 143, 1),
+('亞熱帶林', '아열대림', 11328, 2, 143, 1),
+('旅行', '여행', 11329, 2, 142, 1),
+('運數', '운수', 11330, 2, 142, 1),
+('音標', '음표', 11331, 2, 142, 1),
+('自覺', '자각', 11332, 2, 142, 1),
+('戰後', '전후', 11333, 2, 142, 1),
+('出現', '출현', 11334, 2, 142, 1),
+('河道', '하도', 11335, 2, 142, 1),
+('婚外', '혼외', 11336, 2, 142, 1),
+('懷中', '회중', 11337, 2, 142, 1),
+('工夫房', '공부방', 11338, 2, 142, 1),
+('被除數', '피제수', 11339, 2, 142, 1),
+('놀이機構', '놀이기구', 11340, 2, 142, 1),
+('農機', '농기', 11341, 2, 141, 1),
+('變數', '변수', 11342, 2, 141, 1),
+('不祥', '불상', 11343, 2, 141, 1),
+('卒業式', '졸업식', 11344, 2, 141, 1),
+('形態素', '형태소', 11345, 2, 141, 1),
+('視覺皮質', '시각피질', 11346, 2, 141, 1),
+('稚氣滿滿', '치기만만', 11347, 2, 141, 1),
+('詩歌 選集', '시가 선집', 11348, 2, 141, 1),
+('高空', '고공', 11349, 2, 140, 1),
+('公有', '공유', 11350, 2, 140, 1),
+('頭上', '두상', 11351, 2, 140, 1),
+('分離', '불리', 11352, 2, 140, 1),
+('上頭', '상두', 11353, 2, 140, 1),
+('日帝', '일제', 11354, 2, 140, 1),
+('天眞', '천진', 11355, 2, 140, 1),
+('推理', '추리', 11356, 2, 140, 1),
+('下面', '하면', 11357, 2, 140, 1),
+('昇降機', '승강기', 11358, 2, 140, 1),
+('勝負造作', '승부조작', 11359, 2, 140, 1),
+('氣壓', '기압', 11360, 2, 139, 1),
+('不詳', '불상', 11361, 2, 139, 1),
+('徐行', '서행', 11362, 2, 139, 1),
+('引力', '인력', 11363, 2, 139, 1),
+('差分', '차분', 11364, 2, 139, 1),
+('觀兵式', '관병식', 11365, 2, 139, 1),
+('灰白質', '회백질', 11366, 2, 139, 1),
+('運轉 免許證', '운전 면허증', 11367, 2, 139, 1),
+('賣出', '매출', 11368, 2, 138, 1),
+('白熱', '백열', 11369, 2, 138, 1),
+('分散', '분산', 11370, 2, 138, 1),
+('心像', '심상', 11371, 2, 138, 1),
+('流通', '유통', 11372, 2, 138, 1),
+('入內', '입내', 11373, 2, 138, 1),
+('感染症', '감염증', 11374, 2, 138, 1),
+('雨量計', '우량계', 11375, 2, 138, 1),
+('速戰速決', '속전속결', 11376, 2, 138, 1),
+('一瀉千里', '일사천리', 11377, 2, 138, 1),
+('全知全能', '전지전능', 11378, 2, 138, 1),
+('弓道', '궁도', 11379, 2, 137, 1),
+('步道', '보도', 11380, 2, 137, 1),
+('神社', '신사', 11381, 2, 137, 1),
+('心象', '심상', 11382, 2, 137, 1),
+('外核', '외핵', 11383, 2, 137, 1),
+('合意', '합의', 11384, 2, 137, 1),
+('義兄弟', '의형제', 11385, 2, 137, 1),
+('改心', '개심', 11386, 2, 136, 1),
+('內面', '내면', 11387, 2, 136, 1),
+('論證', '론증', 11388, 2, 136, 1),
+('無斷', '무단', 11389, 2, 136, 1),
+('英氣', '영기', 11390, 2, 136, 1),
+('畵家', '화가', 11391, 2, 136, 1),
+('飜譯機', '번역기', 11392, 2, 136, 1),
+('—色 ', '수박색', 11393, 2, 136, 1),
+('藥劑師', '약제사', 11394, 2, 136, 1),
+('遊擊手', '유격수', 11395, 2, 136, 1),
+('流星雨', '유성우', 11396, 2, 136, 1),
+('惻隱之心', '측은지심', 11397, 2, 136, 1),
+('軍部', '군부', 11398, 2, 135, 1),
+('命名', '명명', 11399, 2, 135, 1),
+('밤中', '밤중', 11400, 2, 135, 1),
+('死球', '사구', 11401, 2, 135, 1),
+('善事', '선사', 11402, 2, 135, 1),
+('惡用', '악용', 11403, 2, 135, 1),
+('月經', '월경', 11404, 2, 135, 1),
+('音程', '음정', 11405, 2, 135, 1),
+('電信', '전신', 11406, 2, 135, 1),
+('高射砲', '고사포', 11407, 2, 135, 1),
+('內接圓', '내접원', 11408, 2, 135, 1),
+('路線圖', '노선도', 11409, 2, 135, 1),
+('頭痛藥', '두통약', 11410, 2, 135, 1),
+('登山路', '등산로', 11411, 2, 135, 1),
+('家勢', '가세', 11412, 2, 134, 1),
+('論斷', '논단', 11413, 2, 134, 1),
+('新品', '신품', 11414, 2, 134, 1),
+('陽數', '양수', 11415, 2, 134, 1),
+('女親', '여친', 11416, 2, 134, 1),
+('陰數', '음수', 11417, 2, 134, 1),
+('合房', '합방', 11418, 2, 134, 1),
+('靑鉛石', '청연석', 11419, 2, 134, 1),
+('特殊部隊', '특수부대', 11420, 2, 134, 1),
+('文句', '문구', 11421, 2, 133, 1),
+('上官', '상관', 11422, 2, 133, 1),
+('勝機', '승기', 11423, 2, 133, 1),
+('音階', '음계', 11424, 2, 133, 1),
+('下部', '하부', 11425, 2, 133, 1),
+('先入見', '선입견', 11426, 2, 133, 1),
+('肺氣腫', '폐기종', 11427, 2, 133, 1),
+('父女', '부녀', 11428, 2, 132, 1),
+('史書', '사서', 11429, 2, 132, 1),
+('院長', '원장', 11430, 2, 132, 1),
+('會陰', '회음', 11431, 2, 132, 1),
+('遊擊戰', '유격전', 11432, 2, 132, 1),
+('七角形', '칠각형', 11433, 2, 132, 1),
+('來月', '내월', 11434, 2, 131, 1),
+('露天', '노천', 11435, 2, 131, 1),
+('發想', '발상', 11436, 2, 131, 1),
+('放電', '방전', 11437, 2, 131, 1),
+('上士', '상사', 11438, 2, 131, 1),
+('料理', '요리', 11439, 2, 131, 1),
+('前代', '전대', 11440, 2, 131, 1),
+('酒食', '주식', 11441, 2, 131, 1),
+('射擊場', '사격장', 11442, 2, 131, 1),
+('市議員', '시의원', 11443, 2, 131, 1),
+('注油所', '주유소', 11444, 2, 131, 1),
+('官軍', '관군', 11445, 2, 130, 1),
+('軍官', '군관', 11446, 2, 130, 1),
+('死後', '사후', 11447, 2, 130, 1),
+('音源', '음원', 11448, 2, 130, 1),
+('長江', '장강', 11449, 2, 130, 1),
+('駐日', '주일', 11450, 2, 130, 1),
+('祝日', '축일', 11451, 2, 130, 1),
+('武器庫', '무기고', 11452, 2, 130, 1),
+('收容所', '수용소', 11453, 2, 130, 1),
+('超新星', '초신성', 11454, 2, 130, 1),
+('航空便', '항공편', 11455, 2, 130, 1),
+('揮發油', '휘발유', 11456, 2, 130, 1),
+('理', '리', 11457, 2, 129, 1),
+('理', '이', 11458, 2, 129, 1),
+('交戰', '교전', 11459, 2, 129, 1),
+('落書', '낙서', 11460, 2, 129, 1),
+('單數', '단수', 11461, 2, 129, 1),
+('名望', '명망', 11462, 2, 129, 1),
+('原作', '원작', 11463, 2, 129, 1),
+('議論', '의논', 11464, 2, 129, 1),
+('義勇', '의용', 11465, 2, 129, 1),
+('長技', '장기', 11466, 2, 129, 1),
+('重車', '중거', 11467, 2, 129, 1),
+('海洋', '해양', 11468, 2, 129, 1),
+('白鰱魚', '백련어', 11469, 2, 129, 1),
+('寶石商', '보석상', 11470, 2, 129, 1),
+('異榮養症', '이영양증', 11471, 2, 129, 1),
+('一壘', '1루', 11472, 2, 128, 1),
+('歸家', '귀가', 11473, 2, 128, 1),
+('等神', '등신', 11474, 2, 128, 1),
+('白質', '백질', 11475, 2, 128, 1),
+('一壘', '일루', 11476, 2, 128, 1),
+('差數', '차수', 11477, 2, 128, 1),
+('計算臺', '계산대', 11478, 2, 128, 1),
+('白木蓮', '백목련', 11479, 2, 128, 1),
+('石膏板', '석고판', 11480, 2, 128, 1),
+('修正案', '수정안', 11481, 2, 128, 1),
+('傳染病', '전염병', 11482, 2, 128, 1),
+('製材所', '제재소', 11483, 2, 128, 1),
+('同門', '동문', 11484, 2, 127, 1),
+('民願', '민원', 11485, 2, 127, 1),
+('說敎', '설교', 11486, 2, 127, 1),
+('聖神', '성신', 11487, 2, 127, 1),
+('野手', '야수', 11488, 2, 127, 1),
+('五色', '오색', 11489, 2, 127, 1),
+('外換', '외환', 11490, 2, 127, 1),
+('一層', '일층', 11491, 2, 127, 1),
+('九角形', '구각형', 11492, 2, 127, 1),
+('登山客', '등산객', 11493, 2, 127, 1),
+('適材適所', '적재적소', 11494, 2, 127, 1),
+('美風', '미풍', 11495, 2, 126, 1),
+('發賣', '발매', 11496, 2, 126, 1),
+('日蝕', '일식', 11497, 2, 126, 1),
+('作詞', '작사', 11498, 2, 126, 1),
+('過去形', '과거형', 11499, 2, 126, 1),
+('消防官', '소방관', 11500, 2, 126, 1),
+('實驗室', '실험실', 11501, 2, 126, 1),
+('案內圖', '안내도', 11502, 2, 126, 1),
+('超高速', '초고속', 11503, 2, 126, 1),
+('舊家', '구가', 11504, 2, 125, 1),
+('神格', '신격', 11505, 2, 125, 1),
+('魚白', '어백', 11506, 2, 125, 1),
+('女裝', '여장', 11507, 2, 125, 1),
+('義憤', '의분', 11508, 2, 125, 1),
+('除數', '제수', 11509, 2, 125, 1),
+('呼出', '호출', 11510, 2, 125, 1),
+('古參兵', '고참병', 11511, 2, 125, 1),
+('西洋畫', '서양화', 11512, 2, 125, 1),
+('療養所', '요양소', 11513, 2, 125, 1),
+('有婦男', '유부남', 11514, 2, 125, 1),
+('二等兵', '이등병', 11515, 2, 125, 1),
+('皮膚色', '피부색', 11516, 2, 125, 1),
+('公知', '공지', 11517, 2, 124, 1),
+('多發', '다발', 11518, 2, 124, 1),
+('異敎', '이교', 11519, 2, 124, 1),
+('翌日', '익일', 11520, 2, 124, 1),
+('一切', '일체', 11521, 2, 124, 1),
+('競馬場', '경마장', 11522, 2, 124, 1),
+('報復球', '보복구', 11523, 2, 124, 1),
+('原材料', '원재료', 11524, 2, 124, 1),
+('低所得', '저소득', 11525, 2, 124, 1),
+('直線打', '직선타', 11526, 2, 124, 1),
+('愚事', '우사', 11527, 2, 123, 1),
+('日茂', '일무', 11528, 2, 123, 1),
+('戰船', '전선', 11529, 2, 123, 1),
+('助長', '조장', 11530, 2, 123, 1),
+('出典', '출전', 11531, 2, 123, 1),
+('會談', '회담', 11532, 2, 123, 1),
+('綿火藥', '면화약', 11533, 2, 123, 1),
+('紫紅色', '자홍색', 11534, 2, 123, 1),
+('絶對領域', '절대영역', 11535, 2, 123, 1),
+('文廟', '문묘', 11536, 2, 122, 1),
+('死士', '사사', 11537, 2, 122, 1),
+('自炊', '자취', 11538, 2, 122, 1),
+('蒸氣', '증기', 11539, 2, 122, 1),
+('吐氣', '토기', 11540, 2, 122, 1),
+('海城', '해성', 11541, 2, 122, 1),
+('攻城戰', '공성전', 11542, 2, 122, 1),
+('方眼紙', '방안지', 11543, 2, 122, 1),
+('江南左派', '강남좌파', 11544, 2, 122, 1),
+('封建制度', '봉건제도', 11545, 2, 122, 1),
+('郵便番號', '우편번호', 11546, 2, 122, 1),
+('君民', '군민', 11547, 2, 121, 1),
+('司會', '사회', 11548, 2, 121, 1),
+('時制', '시제', 11549, 2, 121, 1),
+('神農', '신농', 11550, 2, 121, 1),
+('願書', '원서', 11551, 2, 121, 1),
+('正門', '정문', 11552, 2, 121, 1),
+('品詞', '품사', 11553, 2, 121, 1),
+('靈安室', '영안실', 11554, 2, 121, 1),
+('幻想 痛症', '환상 통증', 11555, 2, 121, 1),
+('光球', '광구', 11556, 2, 120, 1),
+('口頭', '구두', 11557, 2, 120, 1),
+('喪家', '상가', 11558, 2, 120, 1),
+('船上', '선상', 11559, 2, 120, 1),
+('世間', '세간', 11560, 2, 120, 1),
+('植民', '식민', 11561, 2, 120, 1),
+('一片', '일편', 11562, 2, 120, 1),
+('章數', '장수', 11563, 2, 120, 1),
+('紙上', '지상', 11564, 2, 120, 1),
+('次女', '차녀', 11565, 2, 120, 1),
+('解熱', '해열', 11566, 2, 120, 1),
+('呼名', '호명', 11567, 2, 120, 1),
+('攻擊戰', '공격전', 11568, 2, 120, 1),
+('代替乳', '대체유', 11569, 2, 120, 1),
+('反曲弓', '반곡궁', 11570, 2, 120, 1),
+('接續詞', '접속사', 11571, 2, 120, 1),
+('出納係', '출납계', 11572, 2, 120, 1),
+('—車  ', '발바리차', 11573, 2, 120, 1),
+('傀儡 政權', '괴뢰 정권', 11574, 2, 120, 1),
+('遊離 脂肪酸', '유리 지방산', 11575, 2, 120, 1),
+('曲用', '곡용', 11576, 2, 119, 1),
+('敎父', '교부', 11577, 2, 119, 1),
+('名詩', '명시', 11578, 2, 119, 1),
+('分枝', '분기', 11579, 2, 119, 1),
+('事績', '사적', 11580, 2, 119, 1),
+('事項', '사항', 11581, 2, 119, 1),
+('心慮', '심려', 11582, 2, 119, 1),
+('外債', '외채', 11583, 2, 119, 1),
+('戰團', '전단', 11584, 2, 119, 1),
+('合當', '합당', 11585, 2, 119, 1),
+('飽和 脂肪酸', '포화 지방산', 11586, 2, 119, 1),
+('公約', '공약', 11587, 2, 118, 1),
+('軍馬', '군마', 11588, 2, 118, 1),
+('堂長', '당장', 11589, 2, 118, 1),
+('暑氣', '서기', 11590, 2, 118, 1),
+('十代', '십대', 11591, 2, 118, 1),
+('天底', '천저', 11592, 2, 118, 1),
+('警護員', '경호원', 11593, 2, 118, 1),
+('犯則金', '범칙금', 11594, 2, 118, 1),
+('宥和政策', '유화정책', 11595, 2, 118, 1),
+('官員', '관원', 11596, 2, 117, 1),
+('步數', '보수', 11597, 2, 117, 1),
+('三角', '삼각', 11598, 2, 117, 1),
+('垂心', '수심', 11599, 2, 117, 1),
+('女帝', '여제', 11600, 2, 117, 1),
+('喘氣', '천기', 11601, 2, 117, 1),
+('虛數', '허수', 11602, 2, 117, 1),
+('映山紅', '영산홍', 11603, 2, 117, 1),
+('適應度', '적응도', 11604, 2, 117, 1),
+('住所窓', '주소창', 11605, 2, 117, 1),
+('支援軍', '지원군', 11606, 2, 117, 1),
+('肛門 括約筋', '항문 괄약근', 11607, 2, 117, 1),
+('開戰', '개전', 11608, 2, 116, 1),
+('高位', '고위', 11609, 2, 116, 1),
+('群民', '군민', 11610, 2, 116, 1),
+('年少', '년소', 11611, 2, 116, 1),
+('本館', '본관', 11612, 2, 116, 1),
+('十字', '십자', 11613, 2, 116, 1),
+('長考', '장고', 11614, 2, 116, 1),
+('集計', '집계', 11615, 2, 116, 1),
+('火頭', '화두', 11616, 2, 116, 1),
+('開館式', '개관식', 11617, 2, 116, 1),
+('賣票口', '매표구', 11618, 2, 116, 1),
+('政治犯', '정치범', 11619, 2, 116, 1),
+('樞機卿', '추기경', 11620, 2, 116, 1),
+('特派員', '특파원', 11621, 2, 116, 1),
+('PC通信', 'PC통신', 11622, 2, 116, 1),
+('係數', '계수', 11623, 2, 115, 1),
+('女皇', '녀황', 11624, 2, 115, 1),
+('洞長', '동장', 11625, 2, 115, 1),
+('墨家', '묵가', 11626, 2, 115, 1),
+('分揀', '분간', 11627, 2, 115, 1),
+('敘事', '서사', 11628, 2, 115, 1),
+('疏外', '소외', 11629, 2, 115, 1),
+('身病', '신병', 11630, 2, 115, 1),
+('女皇', '여황', 11631, 2, 115, 1),
+('雜神', '잡신', 11632, 2, 115, 1),
+('評論', '평론', 11633, 2, 115, 1),
+('未解決', '미해결', 11634, 2, 115, 1),
+('放課後', '방과후', 11635, 2, 115, 1),
+('政治圈', '정치권', 11636, 2, 115, 1),
+('罪責感', '죄책감', 11637, 2, 115, 1),
+('名將', '명장', 11638, 2, 114, 1),
+('貧民', '빈민', 11639, 2, 114, 1),
+('疎外', '소외', 11640, 2, 114, 1),
+('利權', '이권', 11641, 2, 114, 1),
+('長髮', '장발', 11642, 2, 114, 1),
+('韓流', '한류', 11643, 2, 114, 1),
+('劃一', '획일', 11644, 2, 114, 1),
+('交差位', '교차위', 11645, 2, 114, 1),
+('酪農業', '낙농업', 11646, 2, 114, 1),
+('東北亞', '동북아', 11647, 2, 114, 1),
+('半透明', '반투명', 11648, 2, 114, 1),
+('配達員', '배달원', 11649, 2, 114, 1),
+('調絃病', '조현병', 11650, 2, 114, 1),
+('發起', '발기', 11651, 2, 113, 1),
+('傍心', '방심', 11652, 2, 113, 1),
+('本朝', '본조', 11653, 2, 113, 1),
+('沙器', '사기', 11654, 2, 113, 1),
+('私戰', '사전', 11655, 2, 113, 1),
+('宿食', '숙식', 11656, 2, 113, 1),
+('昇天', '승천', 11657, 2, 113, 1),
+('長弓', '장궁', 11658, 2, 113, 1),
+('前世', '전세', 11659, 2, 113, 1),
+('寄附金', '기부금', 11660, 2, 113, 1),
+('約婚式', '약혼식', 11661, 2, 113, 1),
+('抵抗器', '저항기', 11662, 2, 113, 1),
+('正比例', '정비례', 11663, 2, 113, 1),
+('特別市', '특별시', 11664, 2, 113, 1),
+('氷上舞踊', '빙상무용', 11665, 2, 113, 1),
+('滿發', '만발', 11666, 2, 112, 1),
+('女給', '여급', 11667, 2, 112, 1),
+('靑山', '청산', 11668, 2, 112, 1),
+('最上', '최상', 11669, 2, 112, 1),
+('荒天', '황천', 11670, 2, 112, 1),
+('劃數', '획수', 11671, 2, 112, 1),
+('梅實酒', '매실주', 11672, 2, 112, 1),
+('反比例', '반비례', 11673, 2, 112, 1),
+('防空壕', '방공호', 11674, 2, 112, 1),
+('石灰岩', '석회암', 11675, 2, 112, 1),
+('釀造場', '양조장', 11676, 2, 112, 1),
+('志願軍', '지원군', 11677, 2, 112, 1),
+('下宿費', '하숙비', 11678, 2, 112, 1),
+('灰色기러기', '회색기러기', 11679, 2, 112, 1),
+('公營', '공영', 11680, 2, 111, 1),
+('無故', '무고', 11681, 2, 111, 1),
+('散發', '산발', 11682, 2, 111, 1),
+('上院', '상원', 11683, 2, 111, 1),
+('新曲', '신곡', 11684, 2, 111, 1),
+('怏心', '앙심', 11685, 2, 111, 1),
+('差金', '차금', 11686, 2, 111, 1),
+('天旨', '천지', 11687, 2, 111, 1),
+('初代', '초대', 11688, 2, 111, 1),
+('函數', '함수', 11689, 2, 111, 1),
+('軍艦鳥', '군함조', 11690, 2, 111, 1),
+('代替肉', '대체육', 11691, 2, 111, 1),
+('屠殺場', '도살장', 11692, 2, 111, 1),
+('唯我論', '유아론', 11693, 2, 111, 1),
+('罹災民', '이재민', 11694, 2, 111, 1),
+('徵集兵', '징집병', 11695, 2, 111, 1),
+('內側廣筋', '내측광근', 11696, 2, 111, 1),
+('滄海桑田', '창해상전', 11697, 2, 111, 1),
+('郡民', '군민', 11698, 2, 110, 1),
+('上級', '상급', 11699, 2, 110, 1),
+('心緒', '심서', 11700, 2, 110, 1),
+('天癡', '천치', 11701, 2, 110, 1),
+('勤務員', '근무원', 11702, 2, 110, 1),
+('消防隊', '소방대', 11703, 2, 110, 1),
+('安全帽', '안전모', 11704, 2, 110, 1),
+('婚禮式', '혼례식', 11705, 2, 110, 1),
+('軍服', '군복', 11706, 2, 109, 1),
+('無我', '무아', 11707, 2, 109, 1),
+('四時', '사시', 11708, 2, 109, 1),
+('聖下', '성하', 11709, 2, 109, 1),
+('年末', '연말', 11710, 2, 109, 1),
+('三次元', '삼차원', 11711, 2, 109, 1),
+('回想錄', '회상록', 11712, 2, 109, 1),
+('高臺', '고대', 11713, 2, 108, 1),
+('公案', '공안', 11714, 2, 108, 1),
+('公布', '공포', 11715, 2, 108, 1),
+('敎徒', '교도', 11716, 2, 108, 1),
+('壘手', '누수', 11717, 2, 108, 1),
+('對角', '대각', 11718, 2, 108, 1),
+('民弊', '민폐', 11719, 2, 108, 1),
+('發覺', '발각', 11720, 2, 108, 1),
+('愛酒', '애주', 11721, 2, 108, 1),
+('晴天', '청천', 11722, 2, 108, 1),
+('警備兵', '경비병', 11723, 2, 108, 1),
+('孤獨死', '고독사', 11724, 2, 108, 1),
+('正常値', '정상치', 11725, 2, 108, 1),
+('團欒酒店', '단란주점', 11726, 2, 108, 1),
+('公休', '공휴', 11727, 2, 107, 1),
+('今月', '금월', 11728, 2, 107, 1),
+('金貨', '금화', 11729, 2, 107, 1),
+('代打', '대타', 11730, 2, 107, 1),
+('美聲', '미성', 11731, 2, 107, 1),
+('年稅', '연세', 11732, 2, 107, 1),
+('戰亂', '전란', 11733, 2, 107, 1),
+('紙面', '지면', 11734, 2, 107, 1),
+('天痴', '천치', 11735, 2, 107, 1),
+('坪數', '평수', 11736, 2, 107, 1),
+('火兵', '화병', 11737, 2, 107, 1),
+('管制塔', '관제탑', 11738, 2, 107, 1),
+('購入處', '구입처', 11739, 2, 107, 1),
+('普通話', '보통화', 11740, 2, 107, 1),
+('革命歌劇', '혁명가극', 11741, 2, 107, 1),
+('敎區', '교구', 11742, 2, 106, 1),
+('金銀', '금은', 11743, 2, 106, 1),
+('小帶', '소대', 11744, 2, 106, 1),
+('身世', '신세', 11745, 2, 106, 1),
+('藥房', '약방', 11746, 2, 106, 1),
+('作曲', '작곡', 11747, 2, 106, 1),
+('風說', '풍설', 11748, 2, 106, 1),
+('勞組員', '노조원', 11749, 2, 106, 1),
+('夢遊病', '몽유병', 11750, 2, 106, 1),
+('無秩序', '무질서', 11751, 2, 106, 1),
+('接着劑', '접착제', 11752, 2, 106, 1),
+('弔慰金', '조위금', 11753, 2, 106, 1),
+('高價', '고가', 11754, 2, 105, 1),
+('路面', '노면', 11755, 2, 105, 1),
+('美男', '미남', 11756, 2, 105, 1),
+('別世', '별세', 11757, 2, 105, 1),
+('小隊', '소대', 11758, 2, 105, 1),
+('實話', '실화', 11759, 2, 105, 1),
+('磁器', '자기', 11760, 2, 105, 1),
+('長靴', '장화', 11761, 2, 105, 1),
+('淸新', '청신', 11762, 2, 105, 1),
+('親愛', '친애', 11763, 2, 105, 1),
+('套書', '투서', 11764, 2, 105, 1),
+('下級', '하급', 11765, 2, 105, 1),
+('紀念品', '기념품', 11766, 2, 105, 1),
+('色종이', '색종이', 11767, 2, 105, 1),
+('整備工', '정비공', 11768, 2, 105, 1),
+('阿弗利加', '아불리가', 11769, 2, 105, 1),
+('類類相從', '유유상종', 11770, 2, 105, 1),
+('高溫', '고온', 11771, 2, 104, 1),
+('公德', '공덕', 11772, 2, 104, 1),
+('內界', '내계', 11773, 2, 104, 1),
+('發狂', '발광', 11774, 2, 104, 1),
+('聲樂', '성악', 11775, 2, 104, 1),
+('藥室', '약실', 11776, 2, 104, 1),
+('前門', '전문', 11777, 2, 104, 1),
+('黑字', '흑자', 11778, 2, 104, 1),
+('矯導所', '교도소', 11779, 2, 104, 1),
+('印刷所', '인쇄소', 11780, 2, 104, 1),
+('背敎', '배교', 11781, 2, 103, 1),
+('算定', '산정', 11782, 2, 103, 1),
+('三族', '삼족', 11783, 2, 103, 1),
+('汚名', '오명', 11784, 2, 103, 1),
+('異形', '이형', 11785, 2, 103, 1),
+('戰勢', '전세', 11786, 2, 103, 1),
+('娼女', '창녀', 11787, 2, 103, 1),
+('接受處', '접수처', 11788, 2, 103, 1),
+('操舵手', '조타수', 11789, 2, 103, 1),
+('七面鳥', '칠면조', 11790, 2, 103, 1),
+('稅金', '세금', 11791, 2, 102, 1),
+('新婚', '신혼', 11792, 2, 102, 1),
+('摘出', '적출', 11793, 2, 102, 1),
+('定例', '정례', 11794, 2, 102, 1),
+('創業', '창업', 11795, 2, 102, 1),
+('治世', '치세', 11796, 2, 102, 1),
+('皮下', '피하', 11797, 2, 102, 1),
+('바다色', '바다색', 11798, 2, 102, 1),
+('疑問詞', '의문사', 11799, 2, 102, 1),
+('妻父母', '처부모', 11800, 2, 102, 1),
+('針葉樹林', '침엽수림', 11801, 2, 102, 1),
+('同甲', '동갑', 11802, 2, 101, 1),
+('無盡', '무진', 11803, 2, 101, 1),
+('問病', '문병', 11804, 2, 101, 1),
+('發給', '발급', 11805, 2, 101, 1),
+('始發', '시발', 11806, 2, 101, 1),
+('原曲', '원곡', 11807, 2, 101, 1),
+('有料', '유료', 11808, 2, 101, 1),
+('長嫂', '장수', 11809, 2, 101, 1),
+('長袖', '장수', 11810, 2, 101, 1),
+('全身', '전신', 11811, 2, 101, 1),
+('淨食', '정식', 11812, 2, 101, 1),
+('坐食', '좌식', 11813, 2, 101, 1),
+('重症', '중증', 11814, 2, 101, 1),
+('出嫁', '출가', 11815, 2, 101, 1),
+('檢察官', '검찰관', 11816, 2, 101, 1),
+('光呼吸', '광호흡', 11817, 2, 101, 1),
+('司令官', '사령관', 11818, 2, 101, 1),
+('葉綠素', '엽록소', 11819, 2, 101, 1),
+('前立腺', '전립선', 11820, 2, 101, 1),
+('爆彈酒', '폭탄주', 11821, 2, 101, 1),
+('副腎皮質', '부신피질', 11822, 2, 101, 1),
+('深山幽谷', '심산유곡', 11823, 2, 101, 1),
+('慰樂施設', '위락시설', 11824, 2, 101, 1),
+('論旨', '논지', 11825, 2, 100, 1),
+('發效', '발효', 11826, 2, 100, 1),
+('線畫', '선화', 11827, 2, 100, 1),
+('新黨', '신당', 11828, 2, 100, 1),
+('新令', '신령', 11829, 2, 100, 1),
+('月曆', '월력', 11830, 2, 100, 1),
+('字典', '자전', 11831, 2, 100, 1),
+('鐵原', '철원', 11832, 2, 100, 1),
+('叢書', '총서', 11833, 2, 100, 1),
+('片手', '편수', 11834, 2, 100, 1),
+('拘置所', '구치소', 11835, 2, 100, 1),
+('石灰石', '석회석', 11836, 2, 100, 1),
+('小陰脣', '소음순', 11837, 2, 100, 1),
+('僞造紙幣', '위조지폐', 11838, 2, 100, 1),
+('女', '여', 11839, 2, 99, 1),
+('弓手', '궁수', 11840, 2, 99, 1),
+('病毒', '병독', 11841, 2, 99, 1),
+('副業', '부업', 11842, 2, 99, 1),
+('書賈', '서고', 11843, 2, 99, 1),
+('實錄', '실록', 11844, 2, 99, 1),
+('藥師', '약사', 11845, 2, 99, 1),
+('餘白', '여백', 11846, 2, 99, 1),
+('年鑑', '연감', 11847, 2, 99, 1),
+('造血', '조혈', 11848, 2, 99, 1),
+('海嶺', '해령', 11849, 2, 99, 1),
+('確定', '확정', 11850, 2, 99, 1),
+('骨董品', '골동품', 11851, 2, 99, 1),
+('右翼手', '우익수', 11852, 2, 99, 1),
+('貯金筒', '저금통', 11853, 2, 99, 1),
+('左翼手', '좌익수', 11854, 2, 99, 1),
+('表現型', '표현형', 11855, 2, 99, 1),
+('硅素樹脂', '규소수지', 11856, 2, 99, 1),
+('遠隔操作', '원격조작', 11857, 2, 99, 1),
+('漏電', '누전', 11858, 2, 98, 1),
+('斷熱', '단열', 11859, 2, 98, 1),
+('防火', '방화', 11860, 2, 98, 1),
+('上司', '상사', 11861, 2, 98, 1),
+('上程', '상정', 11862, 2, 98, 1),
+('愛讀', '애독', 11863, 2, 98, 1),
+('異母', '이모', 11864, 2, 98, 1),
+('韓藥', '한약', 11865, 2, 98, 1),
+('計算尺', '계산척', 11866, 2, 98, 1),
+('復活節', '부활절', 11867, 2, 98, 1),
+('至福直觀', '지복직관', 11868, 2, 98, 1),
+('假死', '가사', 11869, 2, 97, 1),
+('乞神', '걸신', 11870, 2, 97, 1),
+('空然', '공연', 11871, 2, 97, 1),
+('金額', '금액', 11872, 2, 97, 1),
+('急病', '급병', 11873, 2, 97, 1),
+('無聊', '무료', 11874, 2, 97, 1),
+('本源', '본원', 11875, 2, 97, 1),
+('三毒', '삼독', 11876, 2, 97, 1),
+('速球', '속구', 11877, 2, 97, 1),
+('漁業', '어업', 11878, 2, 97, 1),
+('乳頭', '유두', 11879, 2, 97, 1),
+('前身', '전신', 11880, 2, 97, 1),
+('直球', '직구', 11881, 2, 97, 1),
+('車輪', '차륜', 11882, 2, 97, 1),
+('捕手', '포수', 11883, 2, 97, 1),
+('海溢', '해일', 11884, 2, 97, 1),
+('過渡期', '과도기', 11885, 2, 97, 1),
+('抵當權', '저당권', 11886, 2, 97, 1),
+('極惡', '극악', 11887, 2, 96, 1),
+('藍色', '남색', 11888, 2, 96, 1),
+('死罪', '사죄', 11889, 2, 96, 1),
+('私通', '사통', 11890, 2, 96, 1),
+('色漆', '색칠', 11891, 2, 96, 1),
+('小農', '소농', 11892, 2, 96, 1),
+('樂隊', '악대', 11893, 2, 96, 1),
+('愛林', '애림', 11894, 2, 96, 1),
+('乳母', '유모', 11895, 2, 96, 1),
+('戰役', '전역', 11896, 2, 96, 1),
+('白堊紀', '백악기', 11897, 2, 96, 1),
+('營養劑', '영양제', 11898, 2, 96, 1),
+('強權', '강권', 11899, 2, 95, 1),
+('內核', '내핵', 11900, 2, 95, 1),
+('反擊', '반격', 11901, 2, 95, 1),
+('産聲', '산성', 11902, 2, 95, 1),
+('石蠟', '석랍', 11903, 2, 95, 1),
+('樂團', '악단', 11904, 2, 95, 1),
+('藥酒', '약주', 11905, 2, 95, 1),
+('裁定', '재정', 11906, 2, 95, 1),
+('赤字', '적자', 11907, 2, 95, 1),
+('重度', '중도', 11908, 2, 95, 1),
+('質量', '질량', 11909, 2, 95, 1),
+('滄海', '창해', 11910, 2, 95, 1),
+('敗戰', '패전', 11911, 2, 95, 1),
+('品格', '품격', 11912, 2, 95, 1),
+('享年', '향년', 11913, 2, 95, 1),
+('滑石', '활석', 11914, 2, 95, 1),
+('去來處', '거래처', 11915, 2, 95, 1),
+('貯藏所', '저장소', 11916, 2, 95, 1),
+('未來完了', '미래완료', 11917, 2, 95, 1),
+('超銀河團', '초은하단', 11918, 2, 95, 1),
+('被害妄想', '피해망상', 11919, 2, 95, 1),
+('記念', '기념', 11920, 2, 94, 1),
+('騎手', '기수', 11921, 2, 94, 1),
+('小園', '소원', 11922, 2, 94, 1),
+('糧食', '양식', 11923, 2, 94, 1),
+('年俸', '연봉', 11924, 2, 94, 1),
+('月餠', '월병', 11925, 2, 94, 1),
+('飲食', '음식', 11926, 2, 94, 1),
+('翌年', '익년', 11927, 2, 94, 1),
+('昨月', '작월', 11928, 2, 94, 1),
+('協業', '협업', 11929, 2, 94, 1),
+('好感', '호감', 11930, 2, 94, 1),
+('警備隊', '경비대', 11931, 2, 94, 1),
+('愛玩鳥', '애완조', 11932, 2, 94, 1),
+('幻想曲', '환상곡', 11933, 2, 94, 1),
+('高低  악센', '고저 악센트', 11934, 2, 94, 1),
+('食빵', '식빵', 11935, 2, 93, 1),
+('愛液', '애액', 11936, 2, 93, 1),
+('甕器', '옹기', 11937, 2, 93, 1),
+('離反', '이반', 11938, 2, 93, 1),
+('翌月', '익월', 11939, 2, 93, 1),
+('花木', '화목', 11940, 2, 93, 1),
+('輕蔑感', '경멸감', 11941, 2, 93, 1),
+('保溫밥桶', '보온밥통', 11942, 2, 93, 1),
+('官話', '관화', 11943, 2, 92, 1),
+('募金', '모금', 11944, 2, 92, 1),
+('發疹', '발진', 11945, 2, 92, 1),
+('死守', '사수', 11946, 2, 92, 1),
+('象形', '상형', 11947, 2, 92, 1),
+('小盤', '소반', 11948, 2, 92, 1),
+('養母', '양모', 11949, 2, 92, 1),
+('政界', '정계', 11950, 2, 92, 1),
+('正統', '정통', 11951, 2, 92, 1),
+('太古', '태곳', 11952, 2, 92, 1),
+('通算', '통산', 11953, 2, 92, 1),
+('判定', '판정', 11954, 2, 92, 1),
+('紡織業', '방직업', 11955, 2, 92, 1),
+('石菖蒲', '석창포', 11956, 2, 92, 1),
+('成均館', '성균관', 11957, 2, 92, 1),
+('援助交際', '원조교제', 11958, 2, 92, 1),
+('淸涼飮料', '청량음료', 11959, 2, 92, 1),
+('貴下', '귀하', 11960, 2, 91, 1),
+('對價', '대가', 11961, 2, 91, 1),
+('代辯', '대변', 11962, 2, 91, 1),
+('同系', '동계', 11963, 2, 91, 1),
+('白松', '백송', 11964, 2, 91, 1),
+('別室', '별실', 11965, 2, 91, 1),
+('字源', '자원', 11966, 2, 91, 1),
+('精肉店', '정육점', 11967, 2, 91, 1),
+('指揮官', '지휘관', 11968, 2, 91, 1),
+('投票率', '투표율', 11969, 2, 91, 1),
+('三壘', '3루', 11970, 2, 90, 1),
+('東門', '동문', 11971, 2, 90, 1),
+('白丁', '백정', 11972, 2, 90, 1),
+('沙場', '사장', 11973, 2, 90, 1),
+('死貨', '사화', 11974, 2, 90, 1),
+('三壘', '삼루', 11975, 2, 90, 1),
+('相應', '상응', 11976, 2, 90, 1),
+('禪敎', '선교', 11977, 2, 90, 1),
+('停車', '정거', 11978, 2, 90, 1),
+('停車', '정차', 11979, 2, 90, 1),
+('種別', '종별', 11980, 2, 90, 1),
+('礎石', '초석', 11981, 2, 90, 1),
+('平價', '평가', 11982, 2, 90, 1),
+('汽車驛', '기차역', 11983, 2, 90, 1),
+('登錄證', '등록증', 11984, 2, 90, 1),
+('確證偏向', '확증편향', 11985, 2, 90, 1),
+('代謝', '대사', 11986, 2, 89, 1),
+('砂場', '사장', 11987, 2, 89, 1),
+('商權', '상권', 11988, 2, 89, 1),
+('液面', '액면', 11989, 2, 89, 1),
+('腸病', '장병', 11990, 2, 89, 1),
+('前職', '전직', 11991, 2, 89, 1),
+('前漢', '전한', 11992, 2, 89, 1),
+('集結', '집결', 11993, 2, 89, 1),
+('八角', '팔각', 11994, 2, 89, 1),
+('歐美圈', '구미권', 11995, 2, 89, 1),
+('腦卒症', '뇌졸증', 11996, 2, 89, 1),
+('毛細管', '모세관', 11997, 2, 89, 1),
+('夜來香', '야래향', 11998, 2, 89, 1),
+('園藝師', '원예사', 11999, 2, 89, 1),
+('寢臺房', '침대방', 12000, 2, 89, 1),
+('必須 脂肪酸', '필수 지방산', 12001, 2, 89, 1),
+('強制', '강제', 12002, 2, 88, 1),
+('醵金', '갹금', 12003, 2, 88, 1),
+('激戰', '격전', 12004, 2, 88, 1),
+('發靷', '발인', 12005, 2, 88, 1),
+('暗記', '암기', 12006, 2, 88, 1),
+('零本', '영본', 12007, 2, 88, 1),
+('點滅', '점멸', 12008, 2, 88, 1),
+('種馬', '종마', 12009, 2, 88, 1),
+('土産', '토산', 12010, 2, 88, 1),
+('爆風', '폭풍', 12011, 2, 88, 1),
+('過怠料', '과태료', 12012, 2, 88, 1),
+('屈辱感', '굴욕감', 12013, 2, 88, 1),
+('補身湯', '보신탕', 12014, 2, 88, 1),
+('愛玩犬', '애완견', 12015, 2, 88, 1),
+('核爆彈', '핵폭탄', 12016, 2, 88, 1),
+('金', '김', 12017, 2, 87, 1),
+('敎唆', '교사', 12018, 2, 87, 1),
+('起原', '기원', 12019, 2, 87, 1),
+('鍍金', '도금', 12020, 2, 87, 1),
+('明朝', '명조', 12021, 2, 87, 1),
+('本貫', '본관', 12022, 2, 87, 1),
+('私有', '사유', 12023, 2, 87, 1),
+('山頂', '산정', 12024, 2, 87, 1),
+('正堂', '정당', 12025, 2, 87, 1),
+('進相', '진상', 12026, 2, 87, 1),
+('草魚', '초어', 12027, 2, 87, 1),
+('春風', '춘풍', 12028, 2, 87, 1),
+('蕩平菜', '탕평채', 12029, 2, 87, 1),
+('率先垂範', '솔선수범', 12030, 2, 87, 1),
+('圓錐角膜', '원추각막', 12031, 2, 87, 1),
+('敎', '교', 12032, 2, 86, 1),
+('工資', '공자', 12033, 2, 86, 1),
+('上昇', '상승', 12034, 2, 86, 1),
+('舌戰', '설전', 12035, 2, 86, 1),
+('政令', '정령', 12036, 2, 86, 1),
+('土炭層', '토탄층', 12037, 2, 86, 1),
+('過去完了', '과거완료', 12038, 2, 86, 1),
+('冒用', '모용', 12039, 2, 85, 1),
+('目前', '목전', 12040, 2, 85, 1),
+('白鷺', '백로', 12041, 2, 85, 1),
+('陽光', '양광', 12042, 2, 85, 1),
+('染病', '염병', 12043, 2, 85, 1),
+('優美', '우미', 12044, 2, 85, 1),
+('正規', '정규', 12045, 2, 85, 1),
+('就業', '취업', 12046, 2, 85, 1),
+('狂信徒', '광신도', 12047, 2, 85, 1),
+('連絡船', '연락선', 12048, 2, 85, 1),
+('販賣臺', '판매대', 12049, 2, 85, 1),
+('避妊藥', '피임약', 12050, 2, 85, 1),
+('呼吸系統', '호흡계통', 12051, 2, 85, 1),
+('關種', '관종', 12052, 2, 84, 1),
+('美味', '미미', 12053, 2, 84, 1),
+('白檀', '백단', 12054, 2, 84, 1),
+('十王', '시왕', 12055, 2, 84, 1),
+('失明', '실명', 12056, 2, 84, 1),
+('全黨', '전당', 12057, 2, 84, 1),
+('集配', '집배', 12058, 2, 84, 1),
+('監督官', '감독관', 12059, 2, 84, 1),
+('變奏曲', '변주곡', 12060, 2, 84, 1),
+('隨筆集', '수필집', 12061, 2, 84, 1),
+('阿羅漢', '아라한', 12062, 2, 84, 1),
+('歷史畫', '역사화', 12063, 2, 84, 1),
+('江西', '강서', 12064, 2, 83, 1),
+('經路', '경로', 12065, 2, 83, 1),
+('雇用', '고용', 12066, 2, 83, 1),
+('蛋白', '단백', 12067, 2, 83, 1),
+('半價', '반가', 12068, 2, 83, 1),
+('部首', '부수', 12069, 2, 83, 1),
+('選集', '선집', 12070, 2, 83, 1),
+('世俗', '세속', 12071, 2, 83, 1),
+('俗世', '속세', 12072, 2, 83, 1),
+('汚點', '오점', 12073, 2, 83, 1),
+('雜言', '잡언', 12074, 2, 83, 1),
+('頂點', '정점', 12075, 2, 83, 1),
+('鬪病', '투병', 12076, 2, 83, 1),
+('罷業', '파업', 12077, 2, 83, 1),
+('形影', '형영', 12078, 2, 83, 1),
+('輸送船', '수송선', 12079, 2, 83, 1),
+('販賣店', '판매점', 12080, 2, 83, 1),
+('斷層撮影', '단층촬영', 12081, 2, 83, 1),
+('工藝', '공예', 12082, 2, 82, 1),
+('口味', '구미', 12083, 2, 82, 1),
+('明示', '명시', 12084, 2, 82, 1),
+('白鼠', '백서', 12085, 2, 82, 1),
+('附記', '부기', 12086, 2, 82, 1),
+('相議', '상의', 12087, 2, 82, 1),
+('營利', '영리', 12088, 2, 82, 1),
+('陰門', '음문', 12089, 2, 82, 1),
+('戰慄', '전율', 12090, 2, 82, 1),
+('潮流', '조류', 12091, 2, 82, 1),
+('後任', '후임', 12092, 2, 82, 1),
+('阿修羅', '아수라', 12093, 2, 82, 1),
+('充滿症', '충만증', 12094, 2, 82, 1),
+('搭乘口', '탑승구', 12095, 2, 82, 1),
+('避姙藥', '피임약', 12096, 2, 82, 1),
+('改成', '개성', 12097, 2, 81, 1),
+('來韓', '내한', 12098, 2, 81, 1),
+('凍死', '동사', 12099, 2, 81, 1),
+('白堊', '백악', 12100, 2, 81, 1),
+('新築', '신축', 12101, 2, 81, 1),
+('惡筆', '악필', 12102, 2, 81, 1),
+('連信', '연신', 12103, 2, 81, 1),
+('獄死', '옥사', 12104, 2, 81, 1),
+('殿下', '전하', 12105, 2, 81, 1),
+('正座', '정좌', 12106, 2, 81, 1),
+('風燈', '풍등', 12107, 2, 81, 1),
+('購讀料', '구독료', 12108, 2, 81, 1),
+('山토끼', '산토끼', 12109, 2, 81, 1),
+('西歐圈', '서구권', 12110, 2, 81, 1),
+('練習曲', '연습곡', 12111, 2, 81, 1),
+('感激', '감격', 12112, 2, 80, 1),
+('高架', '고가', 12113, 2, 80, 1),
+('過度', '과도', 12114, 2, 80, 1),
+('鑛口', '광구', 12115, 2, 80, 1),
+('奇計', '기계', 12116, 2, 80, 1),
+('內包', '내포', 12117, 2, 80, 1),
+('明確', '명확', 12118, 2, 80, 1),
+('白樺', '백화', 12119, 2, 80, 1),
+('山불', '산불', 12120, 2, 80, 1),
+('賞品', '상품', 12121, 2, 80, 1),
+('聲望', '성망', 12122, 2, 80, 1),
+('惡靈', '악령', 12123, 2, 80, 1),
+('陸上', '육상', 12124, 2, 80, 1),
+('利得', '이득', 12125, 2, 80, 1),
+('卽死', '즉사', 12126, 2, 80, 1),
+('鐵馬', '철마', 12127, 2, 80, 1),
+('針母', '침모', 12128, 2, 80, 1),
+('寒流', '한류', 12129, 2, 80, 1),
+('矯導官', '교도관', 12130, 2, 80, 1),
+('不利益', '불이익', 12131, 2, 80, 1),
+('妊産婦', '임산부', 12132, 2, 80, 1),
+('基底細胞', '기저세포', 12133, 2, 80, 1),
+('蝸角之爭', '와각지쟁', 12134, 2, 80, 1),
+('強度', '강도', 12135, 2, 79, 1),
+('強調', '강조', 12136, 2, 79, 1),
+('關節', '관절', 12137, 2, 79, 1),
+('男親', '남친', 12138, 2, 79, 1),
+('廊下', '낭하', 12139, 2, 79, 1),
+('盜作', '도작', 12140, 2, 79, 1),
+('廊下', '랑하', 12141, 2, 79, 1),
+('美帝', '미제', 12142, 2, 79, 1),
+('反攻', '반공', 12143, 2, 79, 1),
+('白芷', '백지', 12144, 2, 79, 1),
+('僻字', '벽자', 12145, 2, 79, 1),
+('愛妻', '애처', 12146, 2, 79, 1),
+('零下', '영하', 12147, 2, 79, 1),
+('節酒', '절주', 12148, 2, 79, 1),
+('靑魚', '청어', 12149, 2, 79, 1),
+('火炎', '화염', 12150, 2, 79, 1),
+('療養院', '요양원', 12151, 2, 79, 1),
+('避難處', '피난처', 12152, 2, 79, 1),
+('呼吸困難', '호흡곤란', 12153, 2, 79, 1),
+('感歎', '감탄', 12154, 2, 78, 1),
+('馬乳', '마유', 12155, 2, 78, 1),
+('末世', '말세', 12156, 2, 78, 1),
+('報知', '보지', 12157, 2, 78, 1),
+('視界', '시계', 12158, 2, 78, 1),
+('有限', '유한', 12159, 2, 78, 1),
+('情識', '정식', 12160, 2, 78, 1),
+('虛風', '허풍', 12161, 2, 78, 1),
+('輸卵管', '수란관', 12162, 2, 78, 1),
+('二次元', '이차원', 12163, 2, 78, 1),
+('붉은  軍', '붉은 군대', 12164, 2, 78, 1),
+('感銘', '감명', 12165, 2, 77, 1),
+('今世', '금세', 12166, 2, 77, 1),
+('面刀', '면도', 12167, 2, 77, 1),
+('選別', '선별', 12168, 2, 77, 1),
+('安打', '안타', 12169, 2, 77, 1),
+('搜査官', '수사관', 12170, 2, 77, 1),
+('愛玩猫', '애완묘', 12171, 2, 77, 1),
+('洋服欌', '양복장', 12172, 2, 77, 1),
+('脫衣室', '탈의실', 12173, 2, 77, 1),
+('退職金', '퇴직금', 12174, 2, 77, 1),
+('包裝紙', '포장지', 12175, 2, 77, 1),
+('決意', '결의', 12176, 2, 76, 1),
+('內腔', '내강', 12177, 2, 76, 1),
+('短期', '단기', 12178, 2, 76, 1),
+('騰空', '등공', 12179, 2, 76, 1),
+('善惡', '선악', 12180, 2, 76, 1),
+('先進', '선진', 12181, 2, 76, 1),
+('油酸', '유산', 12182, 2, 76, 1),
+('低利', '저리', 12183, 2, 76, 1),
+('前菜', '전채', 12184, 2, 76, 1),
+('處身', '처신', 12185, 2, 76, 1),
+('充實', '충실', 12186, 2, 76, 1),
+('廢品', '폐품', 12187, 2, 76, 1),
+('解禁', '해금', 12188, 2, 76, 1),
+('誘導彈', '유도탄', 12189, 2, 76, 1),
+('針葉樹', '침엽수', 12190, 2, 76, 1),
+('感頌', '감송', 12191, 2, 75, 1),
+('能格', '능격', 12192, 2, 75, 1),
+('微聲', '미성', 12193, 2, 75, 1),
+('野望', '야망', 12194, 2, 75, 1),
+('原始', '원시', 12195, 2, 75, 1),
+('異變', '이변', 12196, 2, 75, 1),
+('轉職', '전직', 12197, 2, 75, 1),
+('組成', '조성', 12198, 2, 75, 1),
+('造淸', '조청', 12199, 2, 75, 1),
+('脫北', '탈북', 12200, 2, 75, 1),
+('貶下', '폄하', 12201, 2, 75, 1),
+('競技館', '경기관', 12202, 2, 75, 1),
+('連續劇', '련속극', 12203, 2, 75, 1),
+('父親喪', '부친상', 12204, 2, 75, 1),
+('示威隊', '시위대', 12205, 2, 75, 1),
+('夜驚症', '야경증', 12206, 2, 75, 1),
+('連續劇', '연속극', 12207, 2, 75, 1),
+('冠詞', '관사', 12208, 2, 74, 1),
+('東洋', '동양', 12209, 2, 74, 1),
+('三振', '삼진', 12210, 2, 74, 1),
+('斬新', '참신', 12211, 2, 74, 1),
+('陛下', '폐하', 12212, 2, 74, 1),
+('銀河團', '은하단', 12213, 2, 74, 1),
+('紅살門', '홍살문', 12214, 2, 74, 1),
+('古參', '고참', 12215, 2, 73, 1),
+('馬夫', '마부', 12216, 2, 73, 1),
+('半旗', '반기', 12217, 2, 73, 1),
+('防護', '방호', 12218, 2, 73, 1),
+('伏線', '복선', 12219, 2, 73, 1),
+('成熟', '성숙', 12220, 2, 73, 1),
+('安住', '안주', 12221, 2, 73, 1),
+('魚肉', '어육', 12222, 2, 73, 1),
+('連結', '연결', 12223, 2, 73, 1),
+('全局', '전국', 12224, 2, 73, 1),
+('重傷', '중상', 12225, 2, 73, 1),
+('特報', '특보', 12226, 2, 73, 1),
+('未確認', '미확인', 12227, 2, 73, 1),
+('回顧錄', '회고록', 12228, 2, 73, 1),
+('古今', '고금', 12229, 2, 72, 1),
+('谷風', '곡풍', 12230, 2, 72, 1),
+('絞死', '교사', 12231, 2, 72, 1),
+('球莖', '구경', 12232, 2, 72, 1),
+('亂交', '난교', 12233, 2, 72, 1),
+('算術', '산술', 12234, 2, 72, 1),
+('三昧', '삼매', 12235, 2, 72, 1),
+('聖職', '성직', 12236, 2, 72, 1),
+('識度', '식도', 12237, 2, 72, 1),
+('愛憎', '애증', 12238, 2, 72, 1),
+('蒼空', '창공', 12239, 2, 72, 1),
+('砲術', '포술', 12240, 2, 72, 1),
+('暴說', '폭설', 12241, 2, 72, 1),
+('脂肪酸', '지방산', 12242, 2, 72, 1),
+('閉幕式', '폐막식', 12243, 2, 72, 1),
+('共變', '공변', 12244, 2, 71, 1),
+('南蠻', '남만', 12245, 2, 71, 1),
+('不利', '불리', 12246, 2, 71, 1),
+('輸血', '수혈', 12247, 2, 71, 1),
+('樂句', '악구', 12248, 2, 71, 1),
+('液相', '액상', 12249, 2, 71, 1),
+('戀愛', '연애', 12250, 2, 71, 1),
+('要領', '요령', 12251, 2, 71, 1),
+('衛兵', '위병', 12252, 2, 71, 1),
+('在來', '재래', 12253, 2, 71, 1),
+('支隊', '지대', 12254, 2, 71, 1),
+('鐵製', '철제', 12255, 2, 71, 1),
+('警告窓', '경고창', 12256, 2, 71, 1),
+('洗濯室', '세탁실', 12257, 2, 71, 1),
+('暗票商', '암표상', 12258, 2, 71, 1),
+('遊離基', '유리기', 12259, 2, 71, 1),
+('幸運兒', '행운아', 12260, 2, 71, 1),
+('黑龍江', '흑룡강', 12261, 2, 71, 1),
+('檢視', '검시', 12262, 2, 70, 1),
+('工匠', '공장', 12263, 2, 70, 1),
+('空乏', '공핍', 12264, 2, 70, 1),
+('口錢', '구전', 12265, 2, 70, 1),
+('男裝', '남장', 12266, 2, 70, 1),
+('明滅', '명멸', 12267, 2, 70, 1),
+('木皮', '목피', 12268, 2, 70, 1),
+('美洲', '미주', 12269, 2, 70, 1),
+('聲優', '성우', 12270, 2, 70, 1),
+('顔面', '안면', 12271, 2, 70, 1),
+('縊死', '액사', 12272, 2, 70, 1),
+('脂質', '지질', 12273, 2, 70, 1),
+('直觀', '직관', 12274, 2, 70, 1),
+('策士', '책사', 12275, 2, 70, 1),
+('快樂', '쾌락', 12276, 2, 70, 1),
+('平靜', '평정', 12277, 2, 70, 1),
+('畵室', '화실', 12278, 2, 70, 1),
+('黃紙', '황지', 12279, 2, 70, 1),
+('綺羅星', '기라성', 12280, 2, 70, 1),
+('單細胞', '단세포', 12281, 2, 70, 1),
+('撮影室', '촬영실', 12282, 2, 70, 1),
+('皮膚科', '피부과', 12283, 2, 70, 1),
+('群衆歌謠', '군중가요', 12284, 2, 70, 1),
+('貫通', '관통', 12285, 2, 69, 1),
+('近視', '근시', 12286, 2, 69, 1),
+('監房', '깜빵', 12287, 2, 69, 1),
+('尿素', '뇨소', 12288, 2, 69, 1),
+('累計', '누계', 12289, 2, 69, 1),
+('籠球', '롱구', 12290, 2, 69, 1),
+('史畫', '사화', 12291, 2, 69, 1),
+('惡役', '악역', 12292, 2, 69, 1),
+('慰樂', '위락', 12293, 2, 69, 1),
+('인小', '인소', 12294, 2, 69, 1),
+('臨時', '임시', 12295, 2, 69, 1),
+('前週', '전주', 12296, 2, 69, 1),
+('做作', '주작', 12297, 2, 69, 1),
+('晴空', '청공', 12298, 2, 69, 1),
+('蔽空', '폐공', 12299, 2, 69, 1),
+('現狀', '현상', 12300, 2, 69, 1),
+('回族', '회족', 12301, 2, 69, 1),
+('沒常識', '몰상식', 12302, 2, 69, 1),
+('銀鰱魚', '은연어', 12303, 2, 69, 1),
+('貪官汚吏', '탐관오리', 12304, 2, 69, 1),
+('光劍', '광검', 12305, 2, 68, 1),
+('糖質', '당질', 12306, 2, 68, 1),
+('圖畫', '도화', 12307, 2, 68, 1),
+('麻藥', '마약', 12308, 2, 68, 1),
+('扶南', '부남', 12309, 2, 68, 1),
+('想起', '상기', 12310, 2, 68, 1),
+('成句', '성구', 12311, 2, 68, 1),
+('野營', '야영', 12312, 2, 68, 1),
+('野砲', '야포', 12313, 2, 68, 1),
+('尿意', '요의', 12314, 2, 68, 1),
+('了解', '요해', 12315, 2, 68, 1),
+('油價', '유가', 12316, 2, 68, 1),
+('離調', '이조', 12317, 2, 68, 1),
+('因素', '인소', 12318, 2, 68, 1),
+('潛熱', '잠열', 12319, 2, 68, 1),
+('再放', '재방', 12320, 2, 68, 1),
+('支臺', '지대', 12321, 2, 68, 1),
+('暴投', '폭투', 12322, 2, 68, 1),
+('花被', '화피', 12323, 2, 68, 1),
+('痲醉藥', '마취약', 12324, 2, 68, 1),
+('傍接圓', '방접원', 12325, 2, 68, 1),
+('消泡劑', '소포제', 12326, 2, 68, 1),
+('圓周率', '원주율', 12327, 2, 68, 1),
+('抗癌劑', '항암제', 12328, 2, 68, 1),
+('經典', '경전', 12329, 2, 67, 1),
+('校歌', '교가', 12330, 2, 67, 1),
+('唐樂', '당악', 12331, 2, 67, 1),
+('別稱', '별칭', 12332, 2, 67, 1),
+('舍利', '사리', 12333, 2, 67, 1),
+('首位', '수위', 12334, 2, 67, 1),
+('良質', '양질', 12335, 2, 67, 1),
+('逆情', '역정', 12336, 2, 67, 1),
+('再現', '재현', 12337, 2, 67, 1),
+('傳導', '전도', 12338, 2, 67, 1),
+('前歷', '전력', 12339, 2, 67, 1),
+('凱旋門', '개선문', 12340, 2, 67, 1),
+('不可避', '불가피', 12341, 2, 67, 1),
+('郵便函', '우편함', 12342, 2, 67, 1),
+('脂肪族', '지방족', 12343, 2, 67, 1),
+('計', '계', 12344, 2, 66, 1),
+('故意', '고의', 12345, 2, 66, 1),
+('口授', '구수', 12346, 2, 66, 1),
+('短調', '단조', 12347, 2, 66, 1),
+('뒷面', '뒷면', 12348, 2, 66, 1),
+('射精', '사정', 12349, 2, 66, 1),
+('散調', '산조', 12350, 2, 66, 1),
+('常務', '상무', 12351, 2, 66, 1),
+('說得', '설득', 12352, 2, 66, 1),
+('앞面', '앞면', 12353, 2, 66, 1),
+('壯美', '장미', 12354, 2, 66, 1),
+('全段', '전단', 12355, 2, 66, 1),
+('調味', '조미', 12356, 2, 66, 1),
+('彈雨', '탄우', 12357, 2, 66, 1),
+('太陰', '태음', 12358, 2, 66, 1),
+('破斷', '파단', 12359, 2, 66, 1),
+('便乘', '편승', 12360, 2, 66, 1),
+('可塑劑', '가소제', 12361, 2, 66, 1),
+('東歐圈', '동구권', 12362, 2, 66, 1),
+('玉簪花', '옥잠화', 12363, 2, 66, 1),
+('靑鉛鑛', '청연광', 12364, 2, 66, 1),
+('催眠術', '최면술', 12365, 2, 66, 1),
+('形', '형', 12366, 2, 65, 1),
+('光榮', '광영', 12367, 2, 65, 1),
+('西藏', '서장', 12368, 2, 65, 1),
+('亞種', '아종', 12369, 2, 65, 1),
+('厭世', '염세', 12370, 2, 65, 1),
+('仁政', '인정', 12371, 2, 65, 1),
+('裁量', '재량', 12372, 2, 65, 1),
+('操制', '조제', 12373, 2, 65, 1),
+('直選', '직선', 12374, 2, 65, 1),
+('砲隊', '포대', 12375, 2, 65, 1),
+('香草', '향초', 12376, 2, 65, 1),
+('血緣', '혈연', 12377, 2, 65, 1),
+('呼號', '호호', 12378, 2, 65, 1),
+('奢侈品', '사치품', 12379, 2, 65, 1),
+('亞寒帶', '아한대', 12380, 2, 65, 1),
+('裁縫師', '재봉사', 12381, 2, 65, 1),
+('割引價', '할인가', 12382, 2, 65, 1),
+('解酲국', '해장국', 12383, 2, 65, 1),
+('線', '선', 12384, 2, 64, 1),
+('寡言', '과언', 12385, 2, 64, 1),
+('果皮', '과피', 12386, 2, 64, 1),
+('龜頭', '귀두', 12387, 2, 64, 1),
+('難關', '난관', 12388, 2, 64, 1),
+('稜線', '능선', 12389, 2, 64, 1),
+('多讀', '다독', 12390, 2, 64, 1),
+('對偶', '대우', 12391, 2, 64, 1),
+('返品', '반품', 12392, 2, 64, 1),
+('百科', '백과', 12393, 2, 64, 1),
+('佛相', '불상', 12394, 2, 64, 1),
+('商議', '상의', 12395, 2, 64, 1),
+('式順', '식순', 12396, 2, 64, 1),
+('類型', '유형', 12397, 2, 64, 1),
+('重盜', '중도', 12398, 2, 64, 1),
+('指目', '지목', 12399, 2, 64, 1),
+('鐵甲', '철갑', 12400, 2, 64, 1),
+('婚約', '혼약', 12401, 2, 64, 1),
+('後燕', '후연', 12402, 2, 64, 1),
+('戴冠式', '대관식', 12403, 2, 64, 1),
+('從屬節', '종속절', 12404, 2, 64, 1),
+('銀杏— ', '은행나무', 12405, 2, 64, 1),
+('强制', '강제', 12406, 2, 63, 1),
+('個別', '개별', 12407, 2, 63, 1),
+('經由', '경유', 12408, 2, 63, 1),
+('留保', '류보', 12409, 2, 63, 1),
+('保留', '보류', 12410, 2, 63, 1),
+('豫選', '예선', 12411, 2, 63, 1),
+('獄門', '옥문', 12412, 2, 63, 1),
+('絕對', '절대', 12413, 2, 63, 1),
+('帝王', '제왕', 12414, 2, 63, 1),
+('此後', '차후', 12415, 2, 63, 1),
+('創立', '창립', 12416, 2, 63, 1),
+('銃身', '총신', 12417, 2, 63, 1),
+('打率', '타율', 12418, 2, 63, 1),
+('評傳', '평전', 12419, 2, 63, 1),
+('布帶', '포대', 12420, 2, 63, 1),
+('黃連', '황련', 12421, 2, 63, 1),
+('去痰劑', '거담제', 12422, 2, 63, 1),
+('罪囚服', '죄수복', 12423, 2, 63, 1),
+('骨炭', '골탄', 12424, 2, 62, 1),
+('交尾', '교미', 12425, 2, 62, 1),
+('拉北', '납북', 12426, 2, 62, 1),
+('明敏', '명민', 12427, 2, 62, 1),
+('配送', '배송', 12428, 2, 62, 1),
+('不便', '불편', 12429, 2, 62, 1),
+('謝意', '사의', 12430, 2, 62, 1),
+('視聽', '시청', 12431, 2, 62, 1),
+('惡寒', '오한', 12432, 2, 62, 1),
+('赤經', '적경', 12433, 2, 62, 1),
+('全貌', '전모', 12434, 2, 62, 1),
+('後斂', '후렴', 12435, 2, 62, 1),
+('經驗値', '경험치', 12436, 2, 62, 1),
+('解', '해', 12437, 2, 61, 1),
+('間諜', '간첩', 12438, 2, 61, 1),
+('口徑', '구경', 12439, 2, 61, 1),
+('舊式', '구식', 12440, 2, 61, 1),
+('君王', '군왕', 12441, 2, 61, 1),
+('極好', '극호', 12442, 2, 61, 1),
+('男根', '남근', 12443, 2, 61, 1),
+('明哲', '명철', 12444, 2, 61, 1),
+('半額', '반액', 12445, 2, 61, 1),
+('修辭', '수사', 12446, 2, 61, 1),
+('瞬間', '순간', 12447, 2, 61, 1),
+('安眠', '안면', 12448, 2, 61, 1),
+('魚尾', '어미', 12449, 2, 61, 1),
+('英韓', '영한', 12450, 2, 61, 1),
+('豫告', '예고', 12451, 2, 61, 1),
+('娛樂', '오락', 12452, 2, 61, 1),
+('優先', '우선', 12453, 2, 61, 1),
+('寓言', '우언', 12454, 2, 61, 1),
+('諛言', '유언', 12455, 2, 61, 1),
+('應試', '응시', 12456, 2, 61, 1),
+('認證', '인증', 12457, 2, 61, 1),
+('接續', '접속', 12458, 2, 61, 1),
+('徵兵', '징병', 12459, 2, 61, 1),
+('追想', '추상', 12460, 2, 61, 1),
+('泰平', '태평', 12461, 2, 61, 1),
+('特例', '특례', 12462, 2, 61, 1),
+('八苦', '팔고', 12463, 2, 61, 1),
+('韓英', '한영', 12464, 2, 61, 1),
+('享樂', '향락', 12465, 2, 61, 1),
+('後裔', '후예', 12466, 2, 61, 1),
+('絞首臺', '교수대', 12467, 2, 61, 1),
+('勞組費', '노조비', 12468, 2, 61, 1),
+('禮拜堂', '예배당', 12469, 2, 61, 1),
+('憂鬱症', '우울증', 12470, 2, 61, 1),
+('因陀羅網', '인다라망', 12471, 2, 61, 1),
+('官廳', '관청', 12472, 2, 60, 1),
+('交友', '교우', 12473, 2, 60, 1),
+('近親', '근친', 12474, 2, 60, 1),
+('放映', '방영', 12475, 2, 60, 1),
+('佛經', '불경', 12476, 2, 60, 1),
+('視床', '시상', 12477, 2, 60, 1),
+('尿管', '요관', 12478, 2, 60, 1),
+('優等', '우등', 12479, 2, 60, 1),
+('箴言', '잠언', 12480, 2, 60, 1),
+('螢火', '형화', 12481, 2, 60, 1),
+('街販臺', '가판대', 12482, 2, 60, 1),
+('最優秀', '최우수', 12483, 2, 60, 1),
+('土卵대', '토란대', 12484, 2, 60, 1),
+('二壘', '2루', 12485, 2, 59, 1),
+('強壓', '강압', 12486, 2, 59, 1),
+('曲藝', '곡예', 12487, 2, 59, 1),
+('光秒', '광초', 12488, 2, 59, 1),
+('具現', '구현', 12489, 2, 59, 1),
+('極端', '극단', 12490, 2, 59, 1),
+('對峙', '대치', 12491, 2, 59, 1),
+('服裝', '복장', 12492, 2, 59, 1),
+('北宋', '북송', 12493, 2, 59, 1),
+('收支', '수지', 12494, 2, 59, 1),
+('煙草', '연초', 12495, 2, 59, 1),
+('威信', '위신', 12496, 2, 59, 1),
+('異教', '이교', 12497, 2, 59, 1),
+('二壘', '이루', 12498, 2, 59, 1),
+('精讀', '정독', 12499, 2, 59, 1),
+('製炭', '제탄', 12500, 2, 59, 1),
+('進取', '진취', 12501, 2, 59, 1),
+('徵集', '징집', 12502, 2, 59, 1),
+('超科', '초과', 12503, 2, 59, 1),
+('土卵', '토란', 12504, 2, 59, 1),
+('寫眞帖', '사진첩', 12505, 2, 59, 1),
+('宇宙船', '우주선', 12506, 2, 59, 1),
+('擦過傷', '찰과상', 12507, 2, 59, 1),
+('深思熟考', '심사숙고', 12508, 2, 59, 1),
+('給料', '급료', 12509, 2, 58, 1),
+('奇別', '기별', 12510, 2, 58, 1),
+('基板', '기판', 12511, 2, 58, 1),
+('社友', '사우', 12512, 2, 58, 1),
+('禮砲', '예포', 12513, 2, 58, 1),
+('遠視', '원시', 12514, 2, 58, 1),
+('移調', '이조', 12515, 2, 58, 1),
+('傳染', '전염', 12516, 2, 58, 1),
+('花蛇', '화사', 12517, 2, 58, 1),
+('確率', '확률', 12518, 2, 58, 1),
+('廣域市', '광역시', 12519, 2, 58, 1),
+('旣往症', '기왕증', 12520, 2, 58, 1),
+('紫木蓮', '자목련', 12521, 2, 58, 1),
+('極致', '극치', 12522, 2, 57, 1),
+('桃花', '도화', 12523, 2, 57, 1),
+('—桶', '밥통', 12524, 2, 57, 1),
+('放牧', '방목', 12525, 2, 57, 1),
+('北魏', '북위', 12526, 2, 57, 1),
+('順應', '순응', 12527, 2, 57, 1),
+('略史', '약사', 12528, 2, 57, 1),
+('全蠍', '전갈', 12529, 2, 57, 1),
+('情況', '정황', 12530, 2, 57, 1),
+('重訂', '중정', 12531, 2, 57, 1),
+('闡明', '천명', 12532, 2, 57, 1),
+('最少', '최소', 12533, 2, 57, 1),
+('太祖', '태조', 12534, 2, 57, 1),
+('投宿', '투숙', 12535, 2, 57, 1),
+('艦船', '함선', 12536, 2, 57, 1),
+('花甁', '화병', 12537, 2, 57, 1),
+('加勢', '가세', 12538, 2, 56, 1),
+('警備', '경비', 12539, 2, 56, 1),
+('觀衆', '관중', 12540, 2, 56, 1),
+('木耳', '목이', 12541, 2, 56, 1),
+('木桶', '목통', 12542, 2, 56, 1),
+('微細', '미세', 12543, 2, 56, 1),
+('半寢', '반침', 12544, 2, 56, 1),
+('射創', '사창', 12545, 2, 56, 1),
+('船尾', '선미', 12546, 2, 56, 1),
+('樹葉', '수엽', 12547, 2, 56, 1),
+('願望', '원망', 12548, 2, 56, 1),
+('乳輪', '유륜', 12549, 2, 56, 1),
+('精靈', '정령', 12550, 2, 56, 1),
+('親善', '친선', 12551, 2, 56, 1),
+('幻視', '환시', 12552, 2, 56, 1),
+('땅크兵', '땅크병', 12553, 2, 56, 1),
+('太皇太后', '태황태후', 12554, 2, 56, 1),
+('惡', '악', 12555, 2, 55, 1),
+('簡便', '간편', 12556, 2, 55, 1),
+('開創', '개창', 12557, 2, 55, 1),
+('官衙', '관아', 12558, 2, 55, 1),
+('宮城', '궁성', 12559, 2, 55, 1),
+('牧草', '목초', 12560, 2, 55, 1),
+('士禍', '사화', 12561, 2, 55, 1),
+('常任', '상임', 12562, 2, 55, 1),
+('成덕', '성덕', 12563, 2, 55, 1),
+('惡辣', '악랄', 12564, 2, 55, 1),
+('完投', '완투', 12565, 2, 55, 1),
+('提報', '제보', 12566, 2, 55, 1),
+('持帶', '지대', 12567, 2, 55, 1),
+('鐵材', '철재', 12568, 2, 55, 1),
+('編隊', '편대', 12569, 2, 55, 1),
+('暴炎', '폭염', 12570, 2, 55, 1),
+('標識', '표식', 12571, 2, 55, 1),
+('標識', '표지', 12572, 2, 55, 1),
+('互角', '호각', 12573, 2, 55, 1),
+('幻想', '환상', 12574, 2, 55, 1),
+('松果腺', '송과선', 12575, 2, 55, 1),
+('硏究院', '연구원', 12576, 2, 55, 1),
+('强度', '강도', 12577, 2, 54, 1),
+('結構', '결구', 12578, 2, 54, 1),
+('交錯', '교착', 12579, 2, 54, 1),
+('鬼接', '귀접', 12580, 2, 54, 1),
+('冷然', '냉연', 12581, 2, 54, 1),
+('農婦', '농부', 12582, 2, 54, 1),
+('目次', '목차', 12583, 2, 54, 1),
+('壁畫', '벽화', 12584, 2, 54, 1),
+('私席', '사석', 12585, 2, 54, 1),
+('設問', '설문', 12586, 2, 54, 1),
+('素描', '소묘', 12587, 2, 54, 1),
+('哀調', '애조', 12588, 2, 54, 1),
+('列席', '열석', 12589, 2, 54, 1),
+('五輪', '오륜', 12590, 2, 54, 1),
+('誤打', '오타', 12591, 2, 54, 1),
+('醫科', '의과', 12592, 2, 54, 1),
+('磁極', '자극', 12593, 2, 54, 1),
+('典禮', '전례', 12594, 2, 54, 1),
+('指壓', '지압', 12595, 2, 54, 1),
+('創製', '창제', 12596, 2, 54, 1),
+('初春', '초춘', 12597, 2, 54, 1),
+('降服', '항복', 12598, 2, 54, 1),
+('玉胚油', '옥배유', 12599, 2, 54, 1),
+('樞密院', '추밀원', 12600, 2, 54, 1),
+('洪魚膾', '홍어회', 12601, 2, 54, 1),
+('干證', '간증', 12602, 2, 53, 1),
+('強請', '강청', 12603, 2, 53, 1),
+('牽制', '견제', 12604, 2, 53, 1),
+('教養', '교양', 12605, 2, 53, 1),
+('待望', '대망', 12606, 2, 53, 1),
+('微少', '미소', 12607, 2, 53, 1),
+('微積', '미적', 12608, 2, 53, 1),
+('西晉', '서진', 12609, 2, 53, 1),
+('西秦', '서진', 12610, 2, 53, 1),
+('稅關', '세관', 12611, 2, 53, 1),
+('素樸', '소박', 12612, 2, 53, 1),
+('愼重', '신중', 12613, 2, 53, 1),
+('例題', '예제', 12614, 2, 53, 1),
+('乳齒', '유치', 12615, 2, 53, 1),
+('低價', '저가', 12616, 2, 53, 1),
+('低速', '저속', 12617, 2, 53, 1),
+('卽位', '즉위', 12618, 2, 53, 1),
+('妻男', '처남', 12619, 2, 53, 1),
+('標題', '표제', 12620, 2, 53, 1),
+('花柄', '화병', 12621, 2, 53, 1),
+('憂鬱證', '우울증', 12622, 2, 53, 1),
+('朝鮮무', '조선무', 12623, 2, 53, 1),
+('終着驛', '종착역', 12624, 2, 53, 1),
+('肖像畵', '초상화', 12625, 2, 53, 1),
+('橫說竪說', '횡설수설', 12626, 2, 53, 1),
+('講話', '강화', 12627, 2, 52, 1),
+('見積', '견적', 12628, 2, 52, 1),
+('奇異', '기이', 12629, 2, 52, 1),
+('鳴管', '명관', 12630, 2, 52, 1),
+('放縱', '방종', 12631, 2, 52, 1),
+('排列', '배열', 12632, 2, 52, 1),
+('變換', '변환', 12633, 2, 52, 1),
+('私談', '사담', 12634, 2, 52, 1),
+('雅量', '아량', 12635, 2, 52, 1),
+('連續', '연속', 12636, 2, 52, 1),
+('列邦', '열방', 12637, 2, 52, 1),
+('要因', '요인', 12638, 2, 52, 1),
+('牛馬', '우마', 12639, 2, 52, 1),
+('運輸', '운수', 12640, 2, 52, 1),
+('低級', '저급', 12641, 2, 52, 1),
+('切望', '절망', 12642, 2, 52, 1),
+('至極', '지극', 12643, 2, 52, 1),
+('鐵片', '철편', 12644, 2, 52, 1),
+('比較級', '비교급', 12645, 2, 52, 1),
+('催淚彈', '최루탄', 12646, 2, 52, 1),
+('極右', '극우', 12647, 2, 51, 1),
+('極左', '극좌', 12648, 2, 51, 1),
+('防疫', '방역', 12649, 2, 51, 1),
+('複葉', '복엽', 12650, 2, 51, 1),
+('夫餘', '부여', 12651, 2, 51, 1),
+('佛聖', '불성', 12652, 2, 51, 1),
+('聖君', '성군', 12653, 2, 51, 1),
+('雨露', '우로', 12654, 2, 51, 1),
+('融和', '융화', 12655, 2, 51, 1),
+('種痘', '종두', 12656, 2, 51, 1),
+('周知', '주지', 12657, 2, 51, 1),
+('錯視', '착시', 12658, 2, 51, 1),
+('打席', '타석', 12659, 2, 51, 1),
+('販路', '판로', 12660, 2, 51, 1),
+('虐殺', '학살', 12661, 2, 51, 1),
+('橫斷', '횡단', 12662, 2, 51, 1),
+('勿忘草', '물망초', 12663, 2, 51, 1),
+('逾越節', '유월절', 12664, 2, 51, 1),
+('虎列刺', '호열자', 12665, 2, 51, 1),
+('카드紙匣', '카드지갑', 12666, 2, 51, 1),
+('景觀', '경관', 12667, 2, 50, 1),
+('過擧', '과거', 12668, 2, 50, 1),
+('鹿角', '녹각', 12669, 2, 50, 1),
+('雷酸', '뇌산', 12670, 2, 50, 1),
+('徒黨', '도당', 12671, 2, 50, 1),
+('目痛', '목통', 12672, 2, 50, 1),
+('悲號', '비호', 12673, 2, 50, 1),
+('師匠', '사장', 12674, 2, 50, 1),
+('揷身', '삽신', 12675, 2, 50, 1),
+('俗見', '속견', 12676, 2, 50, 1),
+('受苦', '수고', 12677, 2, 50, 1),
+('身廊', '신랑', 12678, 2, 50, 1),
+('羊乳', '양유', 12679, 2, 50, 1),
+('妖術', '요술', 12680, 2, 50, 1),
+('容積', '용적', 12681, 2, 50, 1),
+('應援', '응원', 12682, 2, 50, 1),
+('專斷', '전단', 12683, 2, 50, 1),
+('情緖', '정서', 12684, 2, 50, 1),
+('酒幕', '주막', 12685, 2, 50, 1),
+('歎聲', '탄성', 12686, 2, 50, 1),
+('八寸', '팔촌', 12687, 2, 50, 1),
+('爆擊', '폭격', 12688, 2, 50, 1),
+('爆破', '폭파', 12689, 2, 50, 1),
+('韓菓', '한과', 12690, 2, 50, 1),
+('響應', '향응', 12691, 2, 50, 1),
+('現況', '현황', 12692, 2, 50, 1),
+('微絨毛', '미융모', 12693, 2, 50, 1),
+('漫畵映畵', '만화영화', 12694, 2, 50, 1),
+('角', '각', 12695, 2, 49, 1),
+('歌舞', '가무', 12696, 2, 49, 1),
+('開窓', '개창', 12697, 2, 49, 1),
+('建議', '건의', 12698, 2, 49, 1),
+('繼鐵', '계철', 12699, 2, 49, 1),
+('過慾', '과욕', 12700, 2, 49, 1),
+('交涉', '교섭', 12701, 2, 49, 1),
+('登錄', '등록', 12702, 2, 49, 1),
+('別莊', '별장', 12703, 2, 49, 1),
+('四季', '사계', 12704, 2, 49, 1),
+('信賴', '신뢰', 12705, 2, 49, 1),
+('野獸', '야수', 12706, 2, 49, 1),
+('餘波', '여파', 12707, 2, 49, 1),
+('完備', '완비', 12708, 2, 49, 1),
+('王后', '왕후', 12709, 2, 49, 1),
+('油腐', '유부', 12710, 2, 49, 1),
+('適材', '적재', 12711, 2, 49, 1),
+('廛房', '전방', 12712, 2, 49, 1),
+('助辭', '조사', 12713, 2, 49, 1),
+('責望', '책망', 12714, 2, 49, 1),
+('含量', '함량', 12715, 2, 49, 1),
+('護衛', '호위', 12716, 2, 49, 1),
+('芭蕉—', '파초꽃', 12717, 2, 49, 1),
+('黃오리', '황오리', 12718, 2, 49, 1),
+('系圖', '계도', 12719, 2, 48, 1),
+('基盤', '기반', 12720, 2, 48, 1),
+('亂雜', '난잡', 12721, 2, 48, 1),
+('圖章', '대장', 12722, 2, 48, 1),
+('圖謀', '도모', 12723, 2, 48, 1),
+('圖章', '도장', 12724, 2, 48, 1),
+('萬歲', '만세', 12725, 2, 48, 1),
+('武裝', '무장', 12726, 2, 48, 1),
+('放蕩', '방탕', 12727, 2, 48, 1),
+('配役', '배역', 12728, 2, 48, 1),
+('附錄', '부록', 12729, 2, 48, 1),
+('史跡', '사적', 12730, 2, 48, 1),
+('星群', '성군', 12731, 2, 48, 1),
+('勝算', '승산', 12732, 2, 48, 1),
+('野蠻', '야만', 12733, 2, 48, 1),
+('旅客', '여객', 12734, 2, 48, 1),
+('餘念', '여념', 12735, 2, 48, 1),
+('除算', '제산', 12736, 2, 48, 1),
+('尺度', '척도', 12737, 2, 48, 1),
+('春雨', '춘우', 12738, 2, 48, 1),
+('親友', '친우', 12739, 2, 48, 1),
+('脫落', '탈락', 12740, 2, 48, 1),
+('避難', '피난', 12741, 2, 48, 1),
+('痲醉劑', '마취제', 12742, 2, 48, 1),
+('郵遞夫', '우체부', 12743, 2, 48, 1),
+('苦難', '고난', 12744, 2, 47, 1),
+('老患', '노환', 12745, 2, 47, 1),
+('配給', '배급', 12746, 2, 47, 1),
+('奔放', '분방', 12747, 2, 47, 1),
+('身柄', '신병', 12748, 2, 47, 1),
+('魚缸', '어항', 12749, 2, 47, 1),
+('連敗', '연패', 12750, 2, 47, 1),
+('療養', '요양', 12751, 2, 47, 1),
+('辱說', '욕설', 12752, 2, 47, 1),
+('鎔接', '용접', 12753, 2, 47, 1),
+('肉德', '육덕', 12754, 2, 47, 1),
+('在庫', '재고', 12755, 2, 47, 1),
+('請婚', '청혼', 12756, 2, 47, 1),
+('秋收', '추수', 12757, 2, 47, 1),
+('秋雨', '추우', 12758, 2, 47, 1),
+('播種', '파종', 12759, 2, 47, 1),
+('筆談', '필담', 12760, 2, 47, 1),
+('香味', '향미', 12761, 2, 47, 1),
+('黃帝', '황제', 12762, 2, 47, 1),
+('壬辰倭亂', '임진왜란', 12763, 2, 47, 1),
+('次例次例', '차례차례', 12764, 2, 47, 1),
+('量', '양', 12765, 2, 46, 1),
+('今朝', '금조', 12766, 2, 46, 1),
+('吉運', '길운', 12767, 2, 46, 1),
+('突擊', '돌격', 12768, 2, 46, 1),
+('滿壘', '만루', 12769, 2, 46, 1),
+('侮視', '모시', 12770, 2, 46, 1),
+('密林', '밀림', 12771, 2, 46, 1),
+('純眞', '순진', 12772, 2, 46, 1),
+('嚴選', '엄선', 12773, 2, 46, 1),
+('誤認', '오인', 12774, 2, 46, 1),
+('飲料', '음료', 12775, 2, 46, 1),
+('藻類', '조류', 12776, 2, 46, 1),
+('割當', '할당', 12777, 2, 46, 1),
+('和尙', '화상', 12778, 2, 46, 1),
+('九雲夢', '구운몽', 12779, 2, 46, 1),
+('老衰', '노쇠', 12780, 2, 45, 1),
+('露宿', '노숙', 12781, 2, 45, 1),
+('團束', '단속', 12782, 2, 45, 1),
+('苗木', '묘목', 12783, 2, 45, 1),
+('訪韓', '방한', 12784, 2, 45, 1),
+('保姆', '보모', 12785, 2, 45, 1),
+('貧乳', '빈유', 12786, 2, 45, 1),
+('先驅', '선구', 12787, 2, 45, 1),
+('細胞', '세포', 12788, 2, 45, 1),
+('俗稱', '속칭', 12789, 2, 45, 1),
+('洋菓', '양과', 12790, 2, 45, 1),
+('硏修', '연수', 12791, 2, 45, 1),
+('誤答', '오답', 12792, 2, 45, 1),
+('引導', '인도', 12793, 2, 45, 1),
+('終着', '종착', 12794, 2, 45, 1),
+('追擊', '추격', 12795, 2, 45, 1),
+('縮約', '축약', 12796, 2, 45, 1),
+('脫營', '탈영', 12797, 2, 45, 1),
+('脫退', '탈퇴', 12798, 2, 45, 1),
+('筆答', '필답', 12799, 2, 45, 1),
+('繁華街', '번화가', 12800, 2, 45, 1),
+('鴨綠江', '압록강', 12801, 2, 45, 1),
+('彫刻像', '조각상', 12802, 2, 45, 1),
+('終止符', '종지부', 12803, 2, 45, 1),
+('推薦狀', '추천서', 12804, 2, 45, 1),
+('推薦狀', '추천장', 12805, 2, 45, 1),
+('怪異', '괴이', 12806, 2, 44, 1),
+('黨章', '당장', 12807, 2, 44, 1),
+('得票', '득표', 12808, 2, 44, 1),
+('袂別', '몌별', 12809, 2, 44, 1),
+('弱冠', '약관', 12810, 2, 44, 1),
+('尤度', '우도', 12811, 2, 44, 1),
+('雨雪', '우설', 12812, 2, 44, 1),
+('創設', '창설', 12813, 2, 44, 1),
+('畫匠', '화장', 12814, 2, 44, 1),
+('琥珀酸', '호박산', 12815, 2, 44, 1),
+('接', '접', 12816, 2, 43, 1),
+('槪要', '개요', 12817, 2, 43, 1),
+('客舍', '객사', 12818, 2, 43, 1),
+('怪漢', '괴한', 12819, 2, 43, 1),
+('紀念', '기념', 12820, 2, 43, 1),
+('腦癌', '뇌암', 12821, 2, 43, 1),
+('多才', '다재', 12822, 2, 43, 1),
+('丹靑', '단청', 12823, 2, 43, 1),
+('木枕', '목침', 12824, 2, 43, 1),
+('商街', '상가', 12825, 2, 43, 1),
+('船廠', '선창', 12826, 2, 43, 1),
+('屬領', '속령', 12827, 2, 43, 1),
+('禮節', '예절', 12828, 2, 43, 1),
+('五穀', '오곡', 12829, 2, 43, 1),
+('離脫', '이탈', 12830, 2, 43, 1),
+('低俗', '저속', 12831, 2, 43, 1),
+('朝刊', '조간', 12832, 2, 43, 1),
+('暴虐', '포학', 12833, 2, 43, 1),
+('携帶', '휴대', 12834, 2, 43, 1),
+('和', '화', 12835, 2, 42, 1),
+('綱要', '강요', 12836, 2, 42, 1),
+('喬木', '교목', 12837, 2, 42, 1),
+('來賓', '내빈', 12838, 2, 42, 1),
+('馬褂', '마괘', 12839, 2, 42, 1),
+('馬廏', '마구', 12840, 2, 42, 1),
+('罔極', '망극', 12841, 2, 42, 1),
+('拍板', '박판', 12842, 2, 42, 1),
+('倂殺', '병살', 12843, 2, 42, 1),
+('駟馬', '사마', 12844, 2, 42, 1),
+('僧院', '승원', 12845, 2, 42, 1),
+('櫻草', '앵초', 12846, 2, 42, 1),
+('野鴨', '야압', 12847, 2, 42, 1),
+('誤判', '오판', 12848, 2, 42, 1),
+('雲樹', '운수', 12849, 2, 42, 1),
+('圓貨', '원화', 12850, 2, 42, 1),
+('硫酸', '유산', 12851, 2, 42, 1),
+('祭肉', '제육', 12852, 2, 42, 1),
+('創傷', '창상', 12853, 2, 42, 1),
+('淺知', '천지', 12854, 2, 42, 1),
+('草鞋', '초혜', 12855, 2, 42, 1),
+('畫甁', '화병', 12856, 2, 42, 1),
+('廻轉', '회전', 12857, 2, 42, 1),
+('黑洞', '흑동', 12858, 2, 42, 1),
+('腦震蕩', '뇌진탕', 12859, 2, 42, 1),
+('雪濃湯', '설농탕', 12860, 2, 42, 1),
+('假髮', '가발', 12861, 2, 41, 1),
+('肝油', '간유', 12862, 2, 41, 1),
+('絞殺', '교살', 12863, 2, 41, 1),
+('糾彈', '규탄', 12864, 2, 41, 1),
+('武將', '무장', 12865, 2, 41, 1),
+('壁畵', '벽화', 12866, 2, 41, 1),
+('査察', '사찰', 12867, 2, 41, 1),
+('揷畫', '삽화', 12868, 2, 41, 1),
+('船舶', '선박', 12869, 2, 41, 1),
+('修飾', '수식', 12870, 2, 41, 1),
+('十億', '십억', 12871, 2, 41, 1),
+('暗票', '암표', 12872, 2, 41, 1),
+('陰裂', '음렬', 12873, 2, 41, 1),
+('臍帶', '제대', 12874, 2, 41, 1),
+('層雲', '층운', 12875, 2, 41, 1),
+('特惠', '특혜', 12876, 2, 41, 1),
+('片肉', '편육', 12877, 2, 41, 1),
+('畫廊', '화랑', 12878, 2, 41, 1),
+('橫波', '횡파', 12879, 2, 41, 1),
+('私私롭다', '사사롭다', 12880, 2, 41, 1),
+('破釜沈舟', '파부침주', 12881, 2, 41, 1),
+('四', '사', 12882, 2, 40, 1),
+('酸', '산', 12883, 2, 40, 1),
+('誡命', '계명', 12884, 2, 40, 1),
+('落鄕', '낙향', 12885, 2, 40, 1),
+('補完', '보완', 12886, 2, 40, 1),
+('殺戮', '살육', 12887, 2, 40, 1),
+('榮落', '영락', 12888, 2, 40, 1),
+('矮星', '왜성', 12889, 2, 40, 1),
+('溶劑', '용제', 12890, 2, 40, 1),
+('乳汁', '유즙', 12891, 2, 40, 1),
+('將次', '장차', 12892, 2, 40, 1),
+('再建', '재건', 12893, 2, 40, 1),
+('剪斷', '전단', 12894, 2, 40, 1),
+('縱列', '종렬', 12895, 2, 40, 1),
+('債務', '채무', 12896, 2, 40, 1),
+('黃麻', '황마', 12897, 2, 40, 1),
+('秘密裏', '비밀리', 12898, 2, 40, 1),
+('結', '결', 12899, 2, 39, 1),
+('假借', '가차', 12900, 2, 39, 1),
+('降雪', '강설', 12901, 2, 39, 1),
+('講演', '강연', 12902, 2, 39, 1),
+('檢擧', '검거', 12903, 2, 39, 1),
+('局番', '국번', 12904, 2, 39, 1),
+('路鼗', '노도', 12905, 2, 39, 1),
+('砂糖', '사탕', 12906, 2, 39, 1),
+('艷話', '염화', 12907, 2, 39, 1),
+('營舍', '영사', 12908, 2, 39, 1),
+('豫買', '예매', 12909, 2, 39, 1),
+('六寸', '육촌', 12910, 2, 39, 1),
+('銀貨', '은화', 12911, 2, 39, 1),
+('印影', '인영', 12912, 2, 39, 1),
+('週番', '주번', 12913, 2, 39, 1),
+('鐵槌', '철퇴', 12914, 2, 39, 1),
+('祛痰劑', '거담제', 12915, 2, 39, 1),
+('森林浴', '삼림욕', 12916, 2, 39, 1),
+('破廉恥', '파렴치', 12917, 2, 39, 1),
+('假葬', '가장', 12918, 2, 38, 1),
+('乾達', '건달', 12919, 2, 38, 1),
+('警句', '경구', 12920, 2, 38, 1),
+('農曆', '농력', 12921, 2, 38, 1),
+('盜難', '도난', 12922, 2, 38, 1),
+('復興', '부흥', 12923, 2, 38, 1),
+('貧弱', '빈약', 12924, 2, 38, 1),
+('聖餐', '성찬', 12925, 2, 38, 1),
+('旅館', '여관', 12926, 2, 38, 1),
+('連濁', '연탁', 12927, 2, 38, 1),
+('怨望', '원망', 12928, 2, 38, 1),
+('再審', '재심', 12929, 2, 38, 1),
+('縱波', '종파', 12930, 2, 38, 1),
+('層階', '층계', 12931, 2, 38, 1),
+('破裂', '파열', 12932, 2, 38, 1),
+('雷擊', '뇌격', 12933, 2, 37, 1),
+('短髮', '단발', 12934, 2, 37, 1),
+('冥界', '명계', 12935, 2, 37, 1),
+('飛階', '비계', 12936, 2, 37, 1),
+('僧園', '승원', 12937, 2, 37, 1),
+('弱震', '약진', 12938, 2, 37, 1),
+('練肉', '연육', 12939, 2, 37, 1),
+('追突', '추돌', 12940, 2, 37, 1),
+('虎皮', '호피', 12941, 2, 37, 1),
+('強', '강', 12942, 2, 36, 1),
+('羌活', '강활', 12943, 2, 36, 1),
+('考査', '고사', 12944, 2, 36, 1),
+('農謠', '농요', 12945, 2, 36, 1),
+('毒蛇', '독사', 12946, 2, 36, 1),
+('獨奏', '독주', 12947, 2, 36, 1),
+('史蹟', '사적', 12948, 2, 36, 1),
+('兒童', '아동', 12949, 2, 36, 1),
+('尿砂', '요사', 12950, 2, 36, 1),
+('容易', '용이', 12951, 2, 36, 1),
+('印稅', '인세', 12952, 2, 36, 1),
+('終局', '종국', 12953, 2, 36, 1),
+('偏差', '편차', 12954, 2, 36, 1),
+('必勝', '필승', 12955, 2, 36, 1),
+('協助', '협조', 12956, 2, 36, 1),
+('婚齡', '혼령', 12957, 2, 36, 1),
+('犧牲打', '희생타', 12958, 2, 36, 1),
+('萬', '만', 12959, 2, 35, 1),
+('聖', '성', 12960, 2, 35, 1),
+('加髢', '가체', 12961, 2, 35, 1),
+('考試', '고시', 12962, 2, 35, 1),
+('基底', '기저', 12963, 2, 35, 1),
+('淡黃', '담황', 12964, 2, 35, 1),
+('徒步', '도보', 12965, 2, 35, 1),
+('買收', '매수', 12966, 2, 35, 1),
+('麥茶', '맥다', 12967, 2, 35, 1),
+('墓園', '묘원', 12968, 2, 35, 1),
+('微誠', '미성', 12969, 2, 35, 1),
+('培養', '배양', 12970, 2, 35, 1),
+('腹筋', '복근', 12971, 2, 35, 1),
+('肅淸', '숙청', 12972, 2, 35, 1),
+('連姻', '연인', 12973, 2, 35, 1),
+('永住', '영주', 12974, 2, 35, 1),
+('陰囊', '음낭', 12975, 2, 35, 1),
+('弔砲', '조포', 12976, 2, 35, 1),
+('竹林', '죽림', 12977, 2, 35, 1),
+('滯在', '체재', 12978, 2, 35, 1),
+('換乘', '환승', 12979, 2, 35, 1),
+('黃鷺', '황로', 12980, 2, 35, 1),
+('肝移植', '간이식', 12981, 2, 35, 1),
+('黨마크', '당마크', 12982, 2, 35, 1),
+('黑기러기', '흑기러기', 12983, 2, 35, 1),
+('簡單', '간단', 12984, 2, 34, 1),
+('堪當', '감당', 12985, 2, 34, 1),
+('敬稱', '경칭', 12986, 2, 34, 1),
+('苦鬪', '고투', 12987, 2, 34, 1),
+('裸像', '나상', 12988, 2, 34, 1),
+('盜壘', '도루', 12989, 2, 34, 1),
+('歷程', '력정', 12990, 2, 34, 1),
+('腹案', '복안', 12991, 2, 34, 1),
+('私讐', '사수', 12992, 2, 34, 1),
+('寺院', '사원', 12993, 2, 34, 1),
+('首府', '수부', 12994, 2, 34, 1),
+('歷程', '역정', 12995, 2, 34, 1),
+('優越', '우월', 12996, 2, 34, 1),
+('淫亂', '음란', 12997, 2, 34, 1),
+('早起', '조기', 12998, 2, 34, 1),
+('卽決', '즉결', 12999, 2, 34, 1),
+('眞摯', '진지', 13000, 2, 34, 1),
+('賤技', '천기', 13001, 2, 34, 1),
+('砲丸', '포환', 13002, 2, 34, 1),
+('筆劃', '필획', 13003, 2, 34, 1),
+('候鳥', '후조', 13004, 2, 34, 1),
+('詐欺罪', '사기죄', 13005, 2, 34, 1),
+('召喚狀', '소환장', 13006, 2, 34, 1),
+('見蚊拔劒', '견문발검', 13007, 2, 34, 1),
+('假飾', '가식', 13008, 2, 33, 1),
+('孤島', '고도', 13009, 2, 33, 1),
+('困難', '곤난', 13010, 2, 33, 1),
+('今週', '금주', 13011, 2, 33, 1),
+('急激', '급격', 13012, 2, 33, 1),
+('農耕', '농경', 13013, 2, 33, 1),
+('唐詩', '당시', 13014, 2, 33, 1),
+('毒舌', '독설', 13015, 2, 33, 1),
+('梅雨', '매우', 13016, 2, 33, 1),
+('未詳', '미상', 13017, 2, 33, 1),
+('副祭', '부제', 13018, 2, 33, 1),
+('私邸', '사저', 13019, 2, 33, 1),
+('示範', '시범', 13020, 2, 33, 1),
+('抑壓', '억압', 13021, 2, 33, 1),
+('念珠', '염주', 13022, 2, 33, 1),
+('融資', '융자', 13023, 2, 33, 1),
+('敵艦', '적함', 13024, 2, 33, 1),
+('精銳', '정예', 13025, 2, 33, 1),
+('朝廷', '조정', 13026, 2, 33, 1),
+('讚辭', '찬사', 13027, 2, 33, 1),
+('處斬', '처참', 13028, 2, 33, 1),
+('撤退', '철퇴', 13029, 2, 33, 1),
+('侵略', '침략', 13030, 2, 33, 1),
+('呼訴', '호소', 13031, 2, 33, 1),
+('黃昏', '황혼', 13032, 2, 33, 1),
+('꼬리票', '꼬리표', 13033, 2, 33, 1),
+('複屈折', '복굴절', 13034, 2, 33, 1),
+('扁桃炎', '편도염', 13035, 2, 33, 1),
+('蔘茶', '삼다', 13036, 2, 32, 1),
+('試飮', '시음', 13037, 2, 32, 1),
+('暗默', '암묵', 13038, 2, 32, 1),
+('夜寒', '야한', 13039, 2, 32, 1),
+('羊毛', '양모', 13040, 2, 32, 1),
+('切片', '절편', 13041, 2, 32, 1),
+('撤收', '철수', 13042, 2, 32, 1),
+('抄錄', '초록', 13043, 2, 32, 1),
+('追求', '추구', 13044, 2, 32, 1),
+('蓄積', '축적', 13045, 2, 32, 1),
+('暴戾', '폭려', 13046, 2, 32, 1),
+('爆笑', '폭소', 13047, 2, 32, 1),
+('福스럽다', '복스럽다', 13048, 2, 32, 1),
+('阿毘達磨', '아비달마', 13049, 2, 32, 1),
+('可謂', '가위', 13050, 2, 31, 1),
+('苦悲', '고비', 13051, 2, 31, 1),
+('技巧', '기교', 13052, 2, 31, 1),
+('良友', '량우', 13053, 2, 31, 1),
+('梅香', '매향', 13054, 2, 31, 1),
+('犯則', '범칙', 13055, 2, 31, 1),
+('良友', '양우', 13056, 2, 31, 1),
+('漁港', '어항', 13057, 2, 31, 1),
+('醫療', '의료', 13058, 2, 31, 1),
+('耳痛', '이통', 13059, 2, 31, 1),
+('諮問', '자문', 13060, 2, 31, 1),
+('早春', '조춘', 13061, 2, 31, 1),
+('超越', '초월', 13062, 2, 31, 1),
+('春季', '춘계', 13063, 2, 31, 1),
+('脆弱', '취약', 13064, 2, 31, 1),
+('婚姻', '혼인', 13065, 2, 31, 1),
+('陽', '양', 13066, 2, 30, 1),
+('喫茶', '끽다', 13067, 2, 30, 1),
+('令閨', '령규', 13068, 2, 30, 1),
+('未洽', '미흡', 13069, 2, 30, 1),
+('附則', '부칙', 13070, 2, 30, 1),
+('鼻炎', '비염', 13071, 2, 30, 1),
+('赦罪', '사죄', 13072, 2, 30, 1),
+('洗練', '세련', 13073, 2, 30, 1),
+('弑害', '시해', 13074, 2, 30, 1),
+('令閨', '영규', 13075, 2, 30, 1),
+('完封', '완봉', 13076, 2, 30, 1),
+('帝座', '제좌', 13077, 2, 30, 1),
+('存亡', '존망', 13078, 2, 30, 1),
+('錯雜', '착잡', 13079, 2, 30, 1),
+('撤去', '철거', 13080, 2, 30, 1),
+('探鳥', '탐조', 13081, 2, 30, 1),
+('降伏', '항복', 13082, 2, 30, 1),
+('嗅腦', '후뇌', 13083, 2, 30, 1),
+('誘拐犯', '유괴범', 13084, 2, 30, 1),
+('褐炭', '갈탄', 13085, 2, 29, 1),
+('拳銃', '권총', 13086, 2, 29, 1),
+('金庫', '금고', 13087, 2, 29, 1),
+('朗讀', '낭독', 13088, 2, 29, 1),
+('撞破', '당파', 13089, 2, 29, 1),
+('豆腐', '두부', 13090, 2, 29, 1),
+('微微', '미미', 13091, 2, 29, 1),
+('迷兒', '미아', 13092, 2, 29, 1),
+('獸脂', '수지', 13093, 2, 29, 1),
+('試練', '시련', 13094, 2, 29, 1),
+('軟豆', '연두', 13095, 2, 29, 1),
+('遺烈', '유열', 13096, 2, 29, 1),
+('殘留', '잔류', 13097, 2, 29, 1),
+('靜息', '정식', 13098, 2, 29, 1),
+('卽答', '즉답', 13099, 2, 29, 1),
+('飽滿', '포만', 13100, 2, 29, 1),
+('翰林', '한림', 13101, 2, 29, 1),
+('紅疫', '홍역', 13102, 2, 29, 1),
+('貨幣', '화폐', 13103, 2, 29, 1),
+('가나다順', '가나다순', 13104, 2, 29, 1),
+('念', '념', 13105, 2, 28, 1),
+('黨', '당', 13106, 2, 28, 1),
+('教授', '교수', 13107, 2, 28, 1),
+('拘引', '구인', 13108, 2, 28, 1),
+('毆打', '구타', 13109, 2, 28, 1),
+('露霜', '노상', 13110, 2, 28, 1),
+('詐稱', '사칭', 13111, 2, 28, 1),
+('盛德', '성덕', 13112, 2, 28, 1),
+('收斂', '수렴', 13113, 2, 28, 1),
+('漁村', '어촌', 13114, 2, 28, 1),
+('嚴禁', '엄금', 13115, 2, 28, 1),
+('遠志', '원지', 13116, 2, 28, 1),
+('印鑑', '인감', 13117, 2, 28, 1),
+('姙婦', '임부', 13118, 2, 28, 1),
+('青春', '청춘', 13119, 2, 28, 1),
+('七寸', '칠촌', 13120, 2, 28, 1),
+('燕窩湯', '연와탕', 13121, 2, 28, 1),
+('凝灰岩', '응회암', 13122, 2, 28, 1),
+('砲', '포', 13123, 2, 27, 1),
+('輕快', '경쾌', 13124, 2, 27, 1),
+('攪亂', '교란', 13125, 2, 27, 1),
+('遁甲', '둔갑', 13126, 2, 27, 1),
+('免稅', '면세', 13127, 2, 27, 1),
+('不幸', '불행', 13128, 2, 27, 1),
+('掃除', '소제', 13129, 2, 27, 1),
+('失踪', '실종', 13130, 2, 27, 1),
+('宴席', '연석', 13131, 2, 27, 1),
+('連休', '연휴', 13132, 2, 27, 1),
+('遊廓', '유곽', 13133, 2, 27, 1),
+('肉峯', '육봉', 13134, 2, 27, 1),
+('錢漁', '전어', 13135, 2, 27, 1),
+('措辭', '조사', 13136, 2, 27, 1),
+('卽興', '즉흥', 13137, 2, 27, 1),
+('請託', '청탁', 13138, 2, 27, 1),
+('堆積', '퇴적', 13139, 2, 27, 1),
+('歡待', '환대', 13140, 2, 27, 1),
+('丸都', '환도', 13141, 2, 27, 1),
+('詰難', '힐난', 13142, 2, 27, 1),
+('千壽菊', '천수국', 13143, 2, 27, 1),
+('檢', '검', 13144, 2, 26, 1),
+('甘松', '감송', 13145, 2, 26, 1),
+('改寤', '개오', 13146, 2, 26, 1),
+('鍵盤', '건반', 13147, 2, 26, 1),
+('繫辭', '계사', 13148, 2, 26, 1),
+('苦椒', '고초', 13149, 2, 26, 1),
+('困境', '곤경', 13150, 2, 26, 1),
+('忌避', '기피', 13151, 2, 26, 1),
+('默考', '묵고', 13152, 2, 26, 1),
+('壁欌', '벽장', 13153, 2, 26, 1),
+('辯髮', '변발', 13154, 2, 26, 1),
+('非但', '비단', 13155, 2, 26, 1),
+('氷菓', '빙과', 13156, 2, 26, 1),
+('沙巖', '사암', 13157, 2, 26, 1),
+('蛇足', '사족', 13158, 2, 26, 1),
+('示唆', '시사', 13159, 2, 26, 1),
+('靈芝', '영지', 13160, 2, 26, 1),
+('遺蹟', '유적', 13161, 2, 26, 1),
+('隆起', '융기', 13162, 2, 26, 1),
+('移葬', '이장', 13163, 2, 26, 1),
+('忍苦', '인고', 13164, 2, 26, 1),
+('隣近', '인근', 13165, 2, 26, 1),
+('林檎', '임금', 13166, 2, 26, 1),
+('財源', '재원', 13167, 2, 26, 1),
+('斬首', '참수', 13168, 2, 26, 1),
+('川邊', '천변', 13169, 2, 26, 1),
+('蟲疥', '충개', 13170, 2, 26, 1),
+('片岩', '편암', 13171, 2, 26, 1),
+('避匿', '피닉', 13172, 2, 26, 1),
+('換錢', '환전', 13173, 2, 26, 1),
+('歲拜돈', '세뱃돈', 13174, 2, 26, 1),
+('筋', '근', 13175, 2, 25, 1),
+('單', '단', 13176, 2, 25, 1),
+('得', '득', 13177, 2, 25, 1),
+('巨役', '거역', 13178, 2, 25, 1),
+('乖離', '괴리', 13179, 2, 25, 1),
+('蹶起', '궐기', 13180, 2, 25, 1),
+('晩春', '만춘', 13181, 2, 25, 1),
+('脈拍', '맥박', 13182, 2, 25, 1),
+('紊亂', '문란', 13183, 2, 25, 1),
+('背斜', '배사', 13184, 2, 25, 1),
+('比喩', '비유', 13185, 2, 25, 1),
+('沙丘', '사구', 13186, 2, 25, 1),
+('誓願', '서원', 13187, 2, 25, 1),
+('壽堂', '수당', 13188, 2, 25, 1),
+('如干', '여간', 13189, 2, 25, 1),
+('戀敵', '연적', 13190, 2, 25, 1),
+('玉篇', '옥편', 13191, 2, 25, 1),
+('攄得', '터득', 13192, 2, 25, 1),
+('肺胞', '폐포', 13193, 2, 25, 1),
+('抗疫', '항역', 13194, 2, 25, 1),
+('紅茶', '홍차', 13195, 2, 25, 1),
+('滿', '만', 13196, 2, 24, 1),
+('炎', '염', 13197, 2, 24, 1),
+('積', '적', 13198, 2, 24, 1),
+('苦惱', '고뇌', 13199, 2, 24, 1),
+('攻襲', '공습', 13200, 2, 24, 1),
+('構築', '구축', 13201, 2, 24, 1),
+('規範', '규범', 13202, 2, 24, 1),
+('輪廓', '륜곽', 13203, 2, 24, 1),
+('夢魂', '몽혼', 13204, 2, 24, 1),
+('頒布', '반포', 13205, 2, 24, 1),
+('邊際', '변제', 13206, 2, 24, 1),
+('副腎', '부신', 13207, 2, 24, 1),
+('奔走', '분주', 13208, 2, 24, 1),
+('蓴菜', '순채', 13209, 2, 24, 1),
+('亞綱', '아강', 13210, 2, 24, 1),
+('癌腫', '암종', 13211, 2, 24, 1),
+('液滴', '액적', 13212, 2, 24, 1),
+('蓮根', '연근', 13213, 2, 24, 1),
+('往復', '왕복', 13214, 2, 24, 1),
+('元帥', '원수', 13215, 2, 24, 1),
+('輪癬', '윤선', 13216, 2, 24, 1),
+('赤緯', '적위', 13217, 2, 24, 1),
+('醉興', '취흥', 13218, 2, 24, 1),
+('舵輪', '타륜', 13219, 2, 24, 1),
+('休戚', '휴척', 13220, 2, 24, 1),
+('稀貴', '희귀', 13221, 2, 24, 1),
+('붉은旗', '붉은기', 13222, 2, 24, 1),
+('基', '기', 13223, 2, 23, 1),
+('席', '석', 13224, 2, 23, 1),
+('液', '액', 13225, 2, 23, 1),
+('稱', '칭', 13226, 2, 23, 1),
+('强盜', '강도', 13227, 2, 23, 1),
+('乾杯', '건배', 13228, 2, 23, 1),
+('卷末', '권말', 13229, 2, 23, 1),
+('旗대', '깃대', 13230, 2, 23, 1),
+('排簫', '배소', 13231, 2, 23, 1),
+('不拘', '불구', 13232, 2, 23, 1),
+('査頓', '사돈', 13233, 2, 23, 1),
+('授與', '수여', 13234, 2, 23, 1),
+('雙晶', '쌍정', 13235, 2, 23, 1),
+('巖壁', '암벽', 13236, 2, 23, 1),
+('鹽藏', '염장', 13237, 2, 23, 1),
+('將帥', '장수', 13238, 2, 23, 1),
+('祭壇', '제단', 13239, 2, 23, 1),
+('足발', '족발', 13240, 2, 23, 1),
+('竹片', '죽편', 13241, 2, 23, 1),
+('廢棄', '폐기', 13242, 2, 23, 1),
+('華僑', '화교', 13243, 2, 23, 1),
+('琉璃窓', '유리창', 13244, 2, 23, 1),
+('膵臟癌', '췌장암', 13245, 2, 23, 1),
+('傾聽', '경청', 13246, 2, 22, 1),
+('論爭', '논쟁', 13247, 2, 22, 1),
+('比丘', '비구', 13248, 2, 22, 1),
+('耳鳴', '이명', 13249, 2, 22, 1),
+('卽刻', '즉각', 13250, 2, 22, 1),
+('增稅', '증세', 13251, 2, 22, 1),
+('陣痛', '진통', 13252, 2, 22, 1),
+('滯留', '체류', 13253, 2, 22, 1),
+('被拉', '피랍', 13254, 2, 22, 1),
+('苦', '고', 13255, 2, 21, 1),
+('傷', '상', 13256, 2, 21, 1),
+('湯', '탕', 13257, 2, 21, 1),
+('巨額', '거액', 13258, 2, 21, 1),
+('乾坤', '건곤', 13259, 2, 21, 1),
+('拉致', '납치', 13260, 2, 21, 1),
+('盜賊', '도적', 13261, 2, 21, 1),
+('冬季', '동계', 13262, 2, 21, 1),
+('脈搏', '맥박', 13263, 2, 21, 1),
+('洗滌', '세척', 13264, 2, 21, 1),
+('乘隙', '승극', 13265, 2, 21, 1),
+('絨毛', '융모', 13266, 2, 21, 1),
+('冊欌', '책장', 13267, 2, 21, 1),
+('趨勢', '추세', 13268, 2, 21, 1),
+('秋毫', '추호', 13269, 2, 21, 1),
+('奪還', '탈환', 13270, 2, 21, 1),
+('肺癌', '폐암', 13271, 2, 21, 1),
+('虛僞', '허위', 13272, 2, 21, 1),
+('呂宋煙', '여송연', 13273, 2, 21, 1),
+('蓮뿌리', '연뿌리', 13274, 2, 21, 1),
+('購販', '구판', 13275, 2, 20, 1),
+('答狀', '답장', 13276, 2, 20, 1),
+('突厥', '돌궐', 13277, 2, 20, 1),
+('飛檄', '비격', 13278, 2, 20, 1),
+('比率', '비율', 13279, 2, 20, 1),
+('禪宗', '선종', 13280, 2, 20, 1),
+('驛舍', '역사', 13281, 2, 20, 1),
+('年末', '연말', 13282, 2, 20, 1),
+('雲靉', '운애', 13283, 2, 20, 1),
+('衣欌', '의장', 13284, 2, 20, 1),
+('鳥瞰', '조감', 13285, 2, 20, 1),
+('竹鹽', '죽염', 13286, 2, 20, 1),
+('添附', '첨부', 13287, 2, 20, 1),
+('銃알', '총알', 13288, 2, 20, 1),
+('騙取', '편취', 13289, 2, 20, 1),
+('港灣', '항만', 13290, 2, 20, 1),
+('楊貴妃', '양귀비', 13291, 2, 20, 1),
+('倦怠롭다', '권태롭다', 13292, 2, 20, 1),
+('鬚髥수리', '수염수리', 13293, 2, 20, 1),
+('肝癌', '간암', 13294, 2, 19, 1),
+('姦淫', '간음', 13295, 2, 19, 1),
+('繼承', '계승', 13296, 2, 19, 1),
+('寡居', '과거', 13297, 2, 19, 1),
+('禁忌', '금기', 13298, 2, 19, 1),
+('杜絶', '두절', 13299, 2, 19, 1),
+('遠隔', '원격', 13300, 2, 19, 1),
+('賃金', '임금', 13301, 2, 19, 1),
+('猪突', '저돌', 13302, 2, 19, 1),
+('租稅', '조세', 13303, 2, 19, 1),
+('伽倻琴', '가야금', 13304, 2, 19, 1),
+('雙截棍', '쌍절곤', 13305, 2, 19, 1),
+('律', '률', 13306, 2, 18, 1),
+('留', '유', 13307, 2, 18, 1),
+('律', '율', 13308, 2, 18, 1),
+('棄却', '기각', 13309, 2, 18, 1),
+('暖冬', '난동', 13310, 2, 18, 1),
+('暖爐', '난로', 13311, 2, 18, 1),
+('麻莖', '마경', 13312, 2, 18, 1),
+('忘棄', '망기', 13313, 2, 18, 1),
+('尾羽', '미우', 13314, 2, 18, 1),
+('盛恩', '성은', 13315, 2, 18, 1),
+('整飾', '정식', 13316, 2, 18, 1),
+('竹簡', '죽간', 13317, 2, 18, 1),
+('借賃', '차임', 13318, 2, 18, 1),
+('凄切', '처절', 13319, 2, 18, 1),
+('派遣', '파견', 13320, 2, 18, 1),
+('興隆', '흥륭', 13321, 2, 18, 1),
+('甘遂', '감수', 13322, 2, 17, 1),
+('穀倉', '곡창', 13323, 2, 17, 1),
+('救贖', '구속', 13324, 2, 17, 1),
+('仇敵', '구적', 13325, 2, 17, 1),
+('救恤', '구휼', 13326, 2, 17, 1),
+('勤仕', '근사', 13327, 2, 17, 1),
+('洞穴', '동혈', 13328, 2, 17, 1),
+('蠻勇', '만용', 13329, 2, 17, 1),
+('蜜蠟', '밀랍', 13330, 2, 17, 1),
+('符籍', '부적', 13331, 2, 17, 1),
+('秘匿', '비닉', 13332, 2, 17, 1),
+('舍廊', '사랑', 13333, 2, 17, 1),
+('兩팔', '양팔', 13334, 2, 17, 1),
+('抑揚', '억양', 13335, 2, 17, 1),
+('獵奇', '엽기', 13336, 2, 17, 1),
+('依託', '의탁', 13337, 2, 17, 1),
+('停滯', '정체', 13338, 2, 17, 1),
+('操舵', '조타', 13339, 2, 17, 1),
+('真如', '진여', 13340, 2, 17, 1),
+('被曝', '피폭', 13341, 2, 17, 1),
+('匹敵', '필적', 13342, 2, 17, 1),
+('或如', '혹여', 13343, 2, 17, 1),
+('揮帳', '휘장', 13344, 2, 17, 1),
+('尿', '뇨', 13345, 2, 16, 1),
+('川', '천', 13346, 2, 16, 1),
+('鷄姦', '계간', 13347, 2, 16, 1),
+('屈折', '굴절', 13348, 2, 16, 1),
+('勸誘', '권유', 13349, 2, 16, 1),
+('赦免', '사면', 13350, 2, 16, 1),
+('喪妻', '상처', 13351, 2, 16, 1),
+('償還', '상환', 13352, 2, 16, 1),
+('僧侶', '승려', 13353, 2, 16, 1),
+('年歲', '연세', 13354, 2, 16, 1),
+('豌豆', '완두', 13355, 2, 16, 1),
+('殘忍', '잔인', 13356, 2, 16, 1),
+('壯丁', '장정', 13357, 2, 16, 1),
+('丁亥', '정해', 13358, 2, 16, 1),
+('鐘樓', '종루', 13359, 2, 16, 1),
+('斥候', '척후', 13360, 2, 16, 1),
+('夏季', '하계', 13361, 2, 16, 1),
+('割賦', '할부', 13362, 2, 16, 1),
+('奚琴', '해금', 13363, 2, 16, 1),
+('詰責', '힐책', 13364, 2, 16, 1),
+('己', '기', 13365, 2, 15, 1),
+('港', '항', 13366, 2, 15, 1),
+('呵責', '가책', 13367, 2, 15, 1),
+('奸臣', '간신', 13368, 2, 15, 1),
+('凱旋', '개선', 13369, 2, 15, 1),
+('弓矢', '궁시', 13370, 2, 15, 1),
+('踏襲', '답습', 13371, 2, 15, 1),
+('拉麵', '라맨', 13372, 2, 15, 1),
+('俸給', '봉급', 13373, 2, 15, 1),
+('仕樣', '사양', 13374, 2, 15, 1),
+('伺候', '사후', 13375, 2, 15, 1),
+('垂範', '수범', 13376, 2, 15, 1),
+('歷歷', '역력', 13377, 2, 15, 1),
+('玉榻', '옥탑', 13378, 2, 15, 1),
+('料金', '요금', 13379, 2, 15, 1),
+('掌握', '장악', 13380, 2, 15, 1),
+('整頓', '정돈', 13381, 2, 15, 1),
+('丁卯', '정묘', 13382, 2, 15, 1),
+('惻隱', '측은', 13383, 2, 15, 1),
+('頹廢', '퇴폐', 13384, 2, 15, 1),
+('套署', '투서', 13385, 2, 15, 1),
+('夾竹桃', '협죽도', 13386, 2, 15, 1),
+('故', '고', 13387, 2, 14, 1),
+('役', '역', 13388, 2, 14, 1),
+('條', '조', 13389, 2, 14, 1),
+('稻米', '도미', 13390, 2, 14, 1),
+('麵발', '면발', 13391, 2, 14, 1),
+('默禱', '묵도', 13392, 2, 14, 1),
+('返還', '반환', 13393, 2, 14, 1),
+('奮鬪', '분투', 13394, 2, 14, 1),
+('樣姿', '양자', 13395, 2, 14, 1),
+('禮儀', '예의', 13396, 2, 14, 1),
+('汚辱', '오욕', 13397, 2, 14, 1),
+('忍笑', '인소', 13398, 2, 14, 1),
+('賃貸', '임대', 13399, 2, 14, 1),
+('葬需', '장수', 13400, 2, 14, 1),
+('腫瘍', '종양', 13401, 2, 14, 1),
+('徵兆', '징조', 13402, 2, 14, 1),
+('觸肢', '촉지', 13403, 2, 14, 1),
+('痔裂', '치열', 13404, 2, 14, 1),
+('琉璃盞', '유리잔', 13405, 2, 14, 1),
+('敗', '패', 13406, 2, 13, 1),
+('肝臟', '간장', 13407, 2, 13, 1),
+('丹脣', '단순', 13408, 2, 13, 1),
+('妹氏', '매씨', 13409, 2, 13, 1),
+('迷妄', '미망', 13410, 2, 13, 1),
+('燒麥', '소맥', 13411, 2, 13, 1),
+('誘拐', '유괴', 13412, 2, 13, 1),
+('杖鼓', '장고', 13413, 2, 13, 1),
+('邸宅', '저택', 13414, 2, 13, 1),
+('懲罰', '징벌', 13415, 2, 13, 1),
+('淺智', '천지', 13416, 2, 13, 1),
+('鄕札', '향찰', 13417, 2, 13, 1),
+('挾攻', '협공', 13418, 2, 13, 1),
+('爐', '노', 13419, 2, 12, 1),
+('禽獸', '금수', 13420, 2, 12, 1),
+('奴輩', '노배', 13421, 2, 12, 1),
+('摩尼', '마니', 13422, 2, 12, 1),
+('僧坊', '승방', 13423, 2, 12, 1),
+('哀愁', '애수', 13424, 2, 12, 1),
+('釀蜜', '양밀', 13425, 2, 12, 1),
+('廉恥', '염치', 13426, 2, 12, 1),
+('疑訝', '의아', 13427, 2, 12, 1),
+('招募', '초모', 13428, 2, 12, 1),
+('村것', '촌것', 13429, 2, 12, 1),
+('跆拳', '태권', 13430, 2, 12, 1),
+('許諾', '허락', 13431, 2, 12, 1),
+('戶籍', '호적', 13432, 2, 12, 1),
+('魂魄', '혼백', 13433, 2, 12, 1),
+('强', '강', 13434, 2, 11, 1),
+('麻', '마', 13435, 2, 11, 1),
+('蜜', '밀', 13436, 2, 11, 1),
+('鹽', '염', 13437, 2, 11, 1),
+('丁', '정', 13438, 2, 11, 1),
+('宅', '택', 13439, 2, 11, 1),
+('魂', '혼', 13440, 2, 11, 1),
+('揭揚', '게양', 13441, 2, 11, 1),
+('膽囊', '담낭', 13442, 2, 11, 1),
+('猛虎', '맹호', 13443, 2, 11, 1),
+('揷腎', '삽신', 13444, 2, 11, 1),
+('施釉', '시유', 13445, 2, 11, 1),
+('飾詐', '식사', 13446, 2, 11, 1),
+('靈魂', '영혼', 13447, 2, 11, 1),
+('遲緩', '지완', 13448, 2, 11, 1),
+('寵臣', '총신', 13449, 2, 11, 1),
+('筒발', '통발', 13450, 2, 11, 1),
+('含蓄', '함축', 13451, 2, 11, 1),
+('幸여', '행여', 13452, 2, 11, 1),
+('昏困', '혼곤', 13453, 2, 11, 1),
+('許', '허', 13454, 2, 10, 1),
+('艱辛', '간신', 13455, 2, 10, 1),
+('看做', '간주', 13456, 2, 10, 1),
+('疥瘡', '개창', 13457, 2, 10, 1),
+('龜鑑', '귀감', 13458, 2, 10, 1),
+('納凉', '납량', 13459, 2, 10, 1),
+('淚腺', '누선', 13460, 2, 10, 1),
+('凌遲', '능지', 13461, 2, 10, 1),
+('말套', '말투', 13462, 2, 10, 1),
+('戊戌', '무술', 13463, 2, 10, 1),
+('餓倒', '아도', 13464, 2, 10, 1),
+('夭折', '요절', 13465, 2, 10, 1),
+('紫遮', '자차', 13466, 2, 10, 1),
+('兆祥', '조상', 13467, 2, 10, 1),
+('朱錫', '주석', 13468, 2, 10, 1),
+('幣帛', '폐백', 13469, 2, 10, 1),
+('女', '여', 13470, 2, 9, 1),
+('愚', '우', 13471, 2, 9, 1),
+('康寧', '강녕', 13472, 2, 9, 1),
+('濃霧', '농무', 13473, 2, 9, 1),
+('墳墓', '분묘', 13474, 2, 9, 1),
+('喪輿', '상여', 13475, 2, 9, 1),
+('昂騰', '앙등', 13476, 2, 9, 1),
+('年齡', '연령', 13477, 2, 9, 1),
+('孕胎', '잉태', 13478, 2, 9, 1),
+('駝酪', '타락', 13479, 2, 9, 1),
+('湖畔', '호반', 13480, 2, 9, 1),
+('胃痙攣', '위경련', 13481, 2, 9, 1),
+('墓', '모', 13482, 2, 8, 1),
+('辛', '신', 13483, 2, 8, 1),
+('株', '주', 13484, 2, 8, 1),
+('羯鼓', '갈고', 13485, 2, 8, 1),
+('激勵', '격려', 13486, 2, 8, 1),
+('螺鈿', '나전', 13487, 2, 8, 1),
+('奴婢', '노비', 13488, 2, 8, 1),
+('序跋', '서발', 13489, 2, 8, 1),
+('衰頹', '쇠퇴', 13490, 2, 8, 1),
+('신欌', '신장', 13491, 2, 8, 1),
+('戀戀', '연연', 13492, 2, 8, 1),
+('旺盛', '왕성', 13493, 2, 8, 1),
+('災厄', '재액', 13494, 2, 8, 1),
+('慘酷', '참혹', 13495, 2, 8, 1),
+('芭蕉열매', '파초열매', 13496, 2, 8, 1),
+('拍', '박', 13497, 2, 7, 1),
+('壬', '임', 13498, 2, 7, 1),
+('籍', '적', 13499, 2, 7, 1),
+('摩訶', '마하', 13500, 2, 7, 1),
+('胚芽', '배아', 13501, 2, 7, 1),
+('顎肢', '악지', 13502, 2, 7, 1),
+('燕窩', '연와', 13503, 2, 7, 1),
+('類似', '유사', 13504, 2, 7, 1),
+('奬勵', '장려', 13505, 2, 7, 1),
+('漕艇', '조정', 13506, 2, 7, 1),
+('閑暇', '한가', 13507, 2, 7, 1),
+('眩惑', '현혹', 13508, 2, 7, 1),
+('荒涼', '황량', 13509, 2, 7, 1),
+('紗帽뿔', '사모뿔', 13510, 2, 7, 1),
+('於此彼', '어차피', 13511, 2, 7, 1),
+('庚', '경', 13512, 2, 6, 1),
+('癸', '계', 13513, 2, 6, 1),
+('膽', '담', 13514, 2, 6, 1),
+('每', '매', 13515, 2, 6, 1),
+('戊', '무', 13516, 2, 6, 1),
+('丙', '병', 13517, 2, 6, 1),
+('腎', '신', 13518, 2, 6, 1),
+('緯', '위', 13519, 2, 6, 1),
+('柔', '유', 13520, 2, 6, 1),
+('著', '저', 13521, 2, 6, 1),
+('胸', '흉', 13522, 2, 6, 1),
+('饑餓', '기아', 13523, 2, 6, 1),
+('鹵獲', '노획', 13524, 2, 6, 1),
+('罵倒', '매도', 13525, 2, 6, 1),
+('憤愾', '분개', 13526, 2, 6, 1),
+('忿怒', '분노', 13527, 2, 6, 1),
+('批准', '비준', 13528, 2, 6, 1),
+('娑婆', '사바', 13529, 2, 6, 1),
+('甕津', '옹진', 13530, 2, 6, 1),
+('吟詠', '음영', 13531, 2, 6, 1),
+('災殃', '재앙', 13532, 2, 6, 1),
+('靚飾', '정식', 13533, 2, 6, 1),
+('焦燥', '초조', 13534, 2, 6, 1),
+('浸蝕', '침식', 13535, 2, 6, 1),
+('搭載', '탑재', 13536, 2, 6, 1),
+('玻璃', '파리', 13537, 2, 6, 1),
+('恰似', '흡사', 13538, 2, 6, 1),
+('綱', '강', 13539, 2, 5, 1),
+('坑', '갱', 13540, 2, 5, 1),
+('燐', '린', 13541, 2, 5, 1),
+('灣', '만', 13542, 2, 5, 1),
+('損', '손', 13543, 2, 5, 1),
+('燐', '인', 13544, 2, 5, 1),
+('津', '진', 13545, 2, 5, 1),
+('苛酷', '가혹', 13546, 2, 5, 1),
+('枯渴', '고갈', 13547, 2, 5, 1),
+('飢餓', '기아', 13548, 2, 5, 1),
+('鳳簫', '봉소', 13549, 2, 5, 1),
+('寺刹', '사찰', 13550, 2, 5, 1),
+('膝窩', '슬와', 13551, 2, 5, 1),
+('呻吟', '신음', 13552, 2, 5, 1),
+('栴檀', '전단', 13553, 2, 5, 1),
+('疲弊', '피폐', 13554, 2, 5, 1),
+('狐狸', '호리', 13555, 2, 5, 1),
+('汁', '즙', 13556, 2, 4, 1),
+('膾', '휘', 13557, 2, 4, 1),
+('欺罔', '기망', 13558, 2, 4, 1),
+('欄杆', '난간', 13559, 2, 4, 1),
+('屠戮', '도륙', 13560, 2, 4, 1),
+('杜鵑', '두견', 13561, 2, 4, 1),
+('猜忌', '시기', 13562, 2, 4, 1),
+('寂寞', '적막', 13563, 2, 4, 1),
+('狐貍', '호리', 13564, 2, 4, 1),
+('惱', '뇌', 13565, 2, 3, 1),
+('畓', '답', 13566, 2, 3, 1),
+('繡', '수', 13567, 2, 3, 1),
+('兩', '양', 13568, 2, 3, 1),
+('禍', '화', 13569, 2, 3, 1),
+('凶', '흉', 13570, 2, 3, 1),
+('返戾', '반려', 13571, 2, 3, 1),
+('輔弼', '보필', 13572, 2, 3, 1),
+('宸翰', '신한', 13573, 2, 3, 1),
+('押釘', '압정', 13574, 2, 3, 1),
+('漣痕', '연흔', 13575, 2, 3, 1),
+('搖籃', '요람', 13576, 2, 3, 1),
+('姨姪', '이질', 13577, 2, 3, 1),
+('獬豸', '해치', 13578, 2, 3, 1),
+('獬豸', '해태', 13579, 2, 3, 1),
+('兼', '겸', 13580, 2, 2, 1),
+('筍', '순', 13581, 2, 2, 1),
+('厄', '액', 13582, 2, 2, 1),
+('謂', '위', 13583, 2, 2, 1),
+('秩', '질', 13584, 2, 2, 1),
+('帖', '첩', 13585, 2, 2, 1),
+('橄欖', '감람', 13586, 2, 2, 1),
+('叩扉', '고비', 13587, 2, 2, 1),
+('穹窿', '궁륭', 13588, 2, 2, 1),
+('緬甸', '면전', 13589, 2, 2, 1),
+('憐愍', '연민', 13590, 2, 2, 1),
+('涅槃', '열반', 13591, 2, 2, 1),
+('壅拙', '옹졸', 13592, 2, 2, 1),
+('漸漸', '점점', 13593, 2, 2, 1),
+('賄賂', '회뢰', 13594, 2, 2, 1),
+('뼈살鏃', '뼈살촉', 13595, 2, 2, 1),
+('劫', '겁', 13596, 2, 1, 1),
+('祿', '녹', 13597, 2, 1, 1),
+('旁', '방', 13598, 2, 1, 1),
+('伍', '오', 13599, 2, 1, 1),
+('曰', '왈', 13600, 2, 1, 1),
+('兔', '토', 13601, 2, 1, 1),
+('縣', '현', 13602, 2, 1, 1),
+('弧', '호', 13603, 2, 1, 1),
+('驚愕', '경악', 13604, 2, 1, 1),
+('刎頸', '문경', 13605, 2, 1, 1),
+('叱咤', '질타', 13606, 2, 1, 1),
+('猖獗', '창궐', 13607, 2, 1, 1),
+('蚩尤', '치우', 13608, 2, 1, 1),
+('托肩', '태껸', 13609, 2, 1, 1),
+('咳嗽', '해수', 13610, 2, 1, 1),
+(NULL, '간', 13611, 2, 0, 1),
+(NULL, '값', 13612, 2, 0, 1),
+(NULL, '갖', 13613, 2, 0, 1),
+(NULL, '갠', 13614, 2, 0, 1),
+(NULL, '갱', 13615, 2, 0, 1),
+(NULL, '겉', 13616, 2, 0, 1),
+(NULL, '겹', 13617, 2, 0, 1),
+(NULL, '곁', 13618, 2, 0, 1),
+('串', '곶', 13619, 2, 0, 1),
+(NULL, '깨', 13620, 2, 0, 1),
+(NULL, '꽤', 13621, 2, 0, 1),
+(NULL, '끝', 13622, 2, 0, 1),
+(NULL, '낫', 13623, 2, 0, 1),
+(NULL, '낮', 13624, 2, 0, 1),
+('櫓', '노', 13625, 2, 0, 1),
+(NULL, '뉴', 13626, 2, 0, 1),
+(NULL, '늘', 13627, 2, 0, 1),
+(NULL, '님', 13628, 2, 0, 1),
+(NULL, '담', 13629, 2, 0, 1),
+(NULL, '델', 13630, 2, 0, 1),
+(NULL, '돛', 13631, 2, 0, 1),
+(NULL, '돝', 13632, 2, 0, 1),
+(NULL, '땀', 13633, 2, 0, 1),
+(NULL, '떡', 13634, 2, 0, 1),
+(NULL, '또', 13635, 2, 0, 1),
+(NULL, '똑', 13636, 2, 0, 1),
+(NULL, '뜰', 13637, 2, 0, 1),
+(NULL, '라', 13638, 2, 0, 1),
+(NULL, '락', 13639, 2, 0, 1),
+(NULL, '레', 13640, 2, 0, 1),
+(NULL, '룩', 13641, 2, 0, 1),
+(NULL, '멱', 13642, 2, 0, 1),
+(NULL, '뫼', 13643, 2, 0, 1),
+(NULL, '뭍', 13644, 2, 0, 1),
+(NULL, '미', 13645, 2, 0, 1),
+(NULL, '및', 13646, 2, 0, 1),
+(NULL, '밤', 13647, 2, 0, 1),
+(NULL, '뱀', 13648, 2, 0, 1),
+(NULL, '벗', 13649, 2, 0, 1),
+(NULL, '볏', 13650, 2, 0, 1),
+(NULL, '복', 13651, 2, 0, 1),
+(NULL, '봇', 13652, 2, 0, 1),
+(NULL, '뵈', 13653, 2, 0, 1),
+(NULL, '비', 13654, 2, 0, 1),
+(NULL, '뺨', 13655, 2, 0, 1),
+(NULL, '뻔', 13656, 2, 0, 1),
+(NULL, '삘', 13657, 2, 0, 1),
+(NULL, '삯', 13658, 2, 0, 1),
+(NULL, '삶', 13659, 2, 0, 1),
+(NULL, '삽', 13660, 2, 0, 1),
+(NULL, '생', 13661, 2, 0, 1),
+(NULL, '샵', 13662, 2, 0, 1),
+(NULL, '셤', 13663, 2, 0, 1),
+(NULL, '숟', 13664, 2, 0, 1),
+(NULL, '숩', 13665, 2, 0, 1),
+(NULL, '숱', 13666, 2, 0, 1),
+(NULL, '숲', 13667, 2, 0, 1),
+(NULL, '써', 13668, 2, 0, 1),
+(NULL, '쏠', 13669, 2, 0, 1),
+(NULL, '쏢', 13670, 2, 0, 1),
+(NULL, '쏨', 13671, 2, 0, 1),
+(NULL, '씜', 13672, 2, 0, 1),
+(NULL, '아', 13673, 2, 0, 1),
+(NULL, '안', 13674, 2, 0, 1),
+(NULL, '앤', 13675, 2, 0, 1),
+('量', '양', 13676, 2, 0, 1),
+(NULL, '엔', 13677, 2, 0, 1),
+(NULL, '옛', 13678, 2, 0, 1),
+('吳', '오', 13679, 2, 0, 1),
+(NULL, '옰', 13680, 2, 0, 1),
+(NULL, '옷', 13681, 2, 0, 1),
+('又', '우', 13682, 2, 0, 1),
+('暈', '운', 13683, 2, 0, 1),
+(NULL, '윷', 13684, 2, 0, 1),
+(NULL, '임', 13685, 2, 0, 1),
+(NULL, '잍', 13686, 2, 0, 1),
+(NULL, '잠', 13687, 2, 0, 1),
+(NULL, '젤', 13688, 2, 0, 1),
+(NULL, '조', 13689, 2, 0, 1),
+(NULL, '존', 13690, 2, 0, 1),
+(NULL, '종', 13691, 2, 0, 1),
+('膣', '질', 13692, 2, 0, 1),
+(NULL, '짤', 13693, 2, 0, 1),
+(NULL, '짭', 13694, 2, 0, 1),
+(NULL, '참', 13695, 2, 0, 1),
+(NULL, '천', 13696, 2, 0, 1),
+(NULL, '첫', 13697, 2, 0, 1),
+(NULL, '촨', 13698, 2, 0, 1),
+(NULL, '침', 13699, 2, 0, 1),
+(NULL, '콜', 13700, 2, 0, 1),
+(NULL, '탄', 13701, 2, 0, 1),
+(NULL, '택', 13702, 2, 0, 1),
+(NULL, '탭', 13703, 2, 0, 1),
+(NULL, '톤', 13704, 2, 0, 1),
+(NULL, '톨', 13705, 2, 0, 1),
+(NULL, '톱', 13706, 2, 0, 1),
+(NULL, '팬', 13707, 2, 0, 1),
+(NULL, '폭', 13708, 2, 0, 1),
+('瘧', '학', 13709, 2, 0, 1),
+(NULL, '핵', 13710, 2, 0, 1),
+(NULL, '헬', 13711, 2, 0, 1),
+(NULL, '혹', 13712, 2, 0, 1),
+(NULL, 'ㅅㅅ', 13713, 2, 0, 1),
+(NULL, '一旦', 13714, 2, 0, 1),
+(NULL, '不過', 13715, 2, 0, 1),
+(NULL, '于先', 13716, 2, 0, 1),
+(NULL, '十分', 13717, 2, 0, 1),
+(NULL, '卽刻', 13718, 2, 0, 1),
+(NULL, '卽時', 13719, 2, 0, 1),
+(NULL, '實際', 13720, 2, 0, 1),
+(NULL, '漸漸', 13721, 2, 0, 1),
+(NULL, '無盡', 13722, 2, 0, 1),
+(NULL, '等等', 13723, 2, 0, 1),
+(NULL, '能히', 13724, 2, 0, 1),
+(NULL, '가게', 13725, 2, 0, 1),
+(NULL, '가구', 13726, 2, 0, 1),
+(NULL, '가득', 13727, 2, 0, 1),
+(NULL, '가람', 13728, 2, 0, 1),
+(NULL, '가래', 13729, 2, 0, 1),
+(NULL, '가로', 13730, 2, 0, 1),
+(NULL, '가방', 13731, 2, 0, 1),
+(NULL, '가운', 13732, 2, 0, 1),
+(NULL, '가을', 13733, 2, 0, 1),
+(NULL, '가이', 13734, 2, 0, 1),
+(NULL, '갈퀴', 13735, 2, 0, 1),
+(NULL, '강물', 13736, 2, 0, 1),
+(NULL, '갖춤', 13737, 2, 0, 1),
+(NULL, '같이', 13738, 2, 0, 1),
+(NULL, '갚다', 13739, 2, 0, 1),
+(NULL, '개꿈', 13740, 2, 0, 1),
+(NULL, '개년', 13741, 2, 0, 1),
+(NULL, '개똥', 13742, 2, 0, 1),
+(NULL, '개리', 13743, 2, 0, 1),
+(NULL, '개집', 13744, 2, 0, 1),
+(NULL, '개털', 13745, 2, 0, 1),
+(NULL, '개판', 13746, 2, 0, 1),
+(NULL, '개펄', 13747, 2, 0, 1),
+(NULL, '갯과', 13748, 2, 0, 1),
+(NULL, '갱엿', 13749, 2, 0, 1),
+(NULL, '갸웃', 13750, 2, 0, 1),
+(NULL, '거듭', 13751, 2, 0, 1),
+(NULL, '거름', 13752, 2, 0, 1),
+(NULL, '거북', 13753, 2, 0, 1),
+(NULL, '거의', 13754, 2, 0, 1),
+(NULL, '거적', 13755, 2, 0, 1),
+(NULL, '거짓', 13756, 2, 0, 1),
+(NULL, '걱정', 13757, 2, 0, 1),
+(NULL, '걸상', 13758, 2, 0, 1),
+(NULL, '걸음', 13759, 2, 0, 1),
+(NULL, '겉다', 13760, 2, 0, 1),
+(NULL, '겉멋', 13761, 2, 0, 1),
+(NULL, '게놈', 13762, 2, 0, 1),
+(NULL, '게임', 13763, 2, 0, 1),
+(NULL, '겨우', 13764, 2, 0, 1),
+(NULL, '겹겹', 13765, 2, 0, 1),
+(NULL, '계랄', 13766, 2, 0, 1),
+(NULL, '고루', 13767, 2, 0, 1),
+(NULL, '고뿌', 13768, 2, 0, 1),
+(NULL, '고삐', 13769, 2, 0, 1),
+(NULL, '고수', 13770, 2, 0, 1),
+(NULL, '고요', 13771, 2, 0, 1),
+(NULL, '고을', 13772, 2, 0, 1),
+(NULL, '고작', 13773, 2, 0, 1),
+(NULL, '고장', 13774, 2, 0, 1),
+(NULL, '고초', 13775, 2, 0, 1),
+(NULL, '골드', 13776, 2, 0, 1),
+(NULL, '골목', 13777, 2, 0, 1),
+(NULL, '곪다', 13778, 2, 0, 1),
+(NULL, '곰쥐', 13779, 2, 0, 1),
+(NULL, '곱셈', 13780, 2, 0, 1),
+(NULL, '곳곳', 13781, 2, 0, 1),
+(NULL, '공창', 13782, 2, 0, 1),
+(NULL, '곶감', 13783, 2, 0, 1),
+(NULL, '군담', 13784, 2, 0, 1),
+(NULL, '군밤', 13785, 2, 0, 1),
+(NULL, '궁디', 13786, 2, 0, 1),
+(NULL, '귀양', 13787, 2, 0, 1),
+(NULL, '그곳', 13788, 2, 0, 1),
+(NULL, '그냥', 13789, 2, 0, 1),
+(NULL, '그런', 13790, 2, 0, 1),
+(NULL, '그럼', 13791, 2, 0, 1),
+(NULL, '그룹', 13792, 2, 0, 1),
+(NULL, '그리', 13793, 2, 0, 1),
+(NULL, '그물', 13794, 2, 0, 1),
+(NULL, '그저', 13795, 2, 0, 1),
+(NULL, '그제', 13796, 2, 0, 1),
+(NULL, '그해', 13797, 2, 0, 1),
+(NULL, '글꼴', 13798, 2, 0, 1),
+(NULL, '글자', 13799, 2, 0, 1),
+(NULL, '금딸', 13800, 2, 0, 1),
+(NULL, '기쁨', 13801, 2, 0, 1),
+(NULL, '기운', 13802, 2, 0, 1),
+(NULL, '기울', 13803, 2, 0, 1),
+(NULL, '기윽', 13804, 2, 0, 1),
+(NULL, '기장', 13805, 2, 0, 1),
+(NULL, '기척', 13806, 2, 0, 1),
+(NULL, '길다', 13807, 2, 0, 1),
+(NULL, '길막', 13808, 2, 0, 1),
+(NULL, '길벗', 13809, 2, 0, 1),
+(NULL, '길이', 13810, 2, 0, 1),
+(NULL, '김멜', 13811, 2, 0, 1),
+(NULL, '김밥', 13812, 2, 0, 1),
+(NULL, '깁옷', 13813, 2, 0, 1),
+(NULL, '깃털', 13814, 2, 0, 1),
+(NULL, '깇다', 13815, 2, 0, 1),
+(NULL, '까닭', 13816, 2, 0, 1),
+(NULL, '깔개', 13817, 2, 0, 1),
+(NULL, '깡통', 13818, 2, 0, 1),
+(NULL, '깡패', 13819, 2, 0, 1),
+(NULL, '깨알', 13820, 2, 0, 1),
+(NULL, '꺾다', 13821, 2, 0, 1),
+(NULL, '껍질', 13822, 2, 0, 1),
+(NULL, '꼼치', 13823, 2, 0, 1),
+(NULL, '꽂다', 13824, 2, 0, 1),
+(NULL, '꽃말', 13825, 2, 0, 1),
+(NULL, '꽃집', 13826, 2, 0, 1),
+(NULL, '꽌시', 13827, 2, 0, 1),
+(NULL, '꾸다', 13828, 2, 0, 1),
+(NULL, '나귀', 13829, 2, 0, 1),
+(NULL, '나루', 13830, 2, 0, 1),
+(NULL, '나무', 13831, 2, 0, 1),
+(NULL, '나절', 13832, 2, 0, 1),
+(NULL, '낚시', 13833, 2, 0, 1),
+(NULL, '날것', 13834, 2, 0, 1),
+(NULL, '날짜', 13835, 2, 0, 1),
+(NULL, '남녘', 13836, 2, 0, 1),
+(NULL, '남새', 13837, 2, 0, 1),
+(NULL, '남재', 13838, 2, 0, 1),
+(NULL, '낫살', 13839, 2, 0, 1),
+(NULL, '낮달', 13840, 2, 0, 1),
+(NULL, '낮일', 13841, 2, 0, 1),
+(NULL, '낱말', 13842, 2, 0, 1),
+(NULL, '내내', 13843, 2, 0, 1),
+(NULL, '냄비', 13844, 2, 0, 1),
+(NULL, '냉기', 13845, 2, 0, 1),
+(NULL, '냠냠', 13846, 2, 0, 1),
+(NULL, '너테', 13847, 2, 0, 1),
+(NULL, '노루', 13848, 2, 0, 1),
+(NULL, '노릇', 13849, 2, 0, 1),
+(NULL, '노모', 13850, 2, 0, 1),
+(NULL, '노잼', 13851, 2, 0, 1),
+(NULL, '누리', 13852, 2, 0, 1),
+(NULL, '눈길', 13853, 2, 0, 1),
+(NULL, '눈깔', 13854, 2, 0, 1),
+(NULL, '눈빛', 13855, 2, 0, 1),
+(NULL, '눋다', 13856, 2, 0, 1),
+(NULL, '느시', 13857, 2, 0, 1),
+(NULL, '늑대', 13858, 2, 0, 1),
+(NULL, '다음', 13859, 2, 0, 1),
+(NULL, '다짐', 13860, 2, 0, 1),
+(NULL, '다툼', 13861, 2, 0, 1),
+(NULL, '단지', 13862, 2, 0, 1),
+(NULL, '달걀', 13863, 2, 0, 1),
+(NULL, '달리', 13864, 2, 0, 1),
+(NULL, '닮다', 13865, 2, 0, 1),
+(NULL, '닮음', 13866, 2, 0, 1),
+(NULL, '담배', 13867, 2, 0, 1),
+(NULL, '담비', 13868, 2, 0, 1),
+(NULL, '담주', 13869, 2, 0, 1),
+(NULL, '당옴', 13870, 2, 0, 1),
+(NULL, '당추', 13871, 2, 0, 1),
+(NULL, '닿다', 13872, 2, 0, 1),
+(NULL, '대밭', 13873, 2, 0, 1),
+(NULL, '대추', 13874, 2, 0, 1),
+(NULL, '대칼', 13875, 2, 0, 1),
+(NULL, '댄스', 13876, 2, 0, 1),
+(NULL, '더럼', 13877, 2, 0, 1),
+(NULL, '더미', 13878, 2, 0, 1),
+(NULL, '더욱', 13879, 2, 0, 1),
+(NULL, '덕통', 13880, 2, 0, 1),
+(NULL, '덜다', 13881, 2, 0, 1),
+(NULL, '덤불', 13882, 2, 0, 1),
+(NULL, '덩치', 13883, 2, 0, 1),
+(NULL, '덮밥', 13884, 2, 0, 1),
+(NULL, '데다', 13885, 2, 0, 1),
+(NULL, '데모', 13886, 2, 0, 1),
+(NULL, '도끼', 13887, 2, 0, 1),
+(NULL, '도랑', 13888, 2, 0, 1),
+(NULL, '도틀', 13889, 2, 0, 1),
+(NULL, '돈주', 13890, 2, 0, 1),
+(NULL, '돌돔', 13891, 2, 0, 1),
+(NULL, '돌싱', 13892, 2, 0, 1),
+(NULL, '돕다', 13893, 2, 0, 1),
+(NULL, '동산', 13894, 2, 0, 1),
+(NULL, '동안', 13895, 2, 0, 1),
+(NULL, '두름', 13896, 2, 0, 1),
+(NULL, '둘레', 13897, 2, 0, 1),
+(NULL, '뒤주', 13898, 2, 0, 1),
+(NULL, '들보', 13899, 2, 0, 1),
+(NULL, '듬뿍', 13900, 2, 0, 1),
+(NULL, '등에', 13901, 2, 0, 1),
+(NULL, '디과', 13902, 2, 0, 1),
+(NULL, '따로', 13903, 2, 0, 1),
+(NULL, '따름', 13904, 2, 0, 1),
+(NULL, '땃쥐', 13905, 2, 0, 1),
+(NULL, '때로', 13906, 2, 0, 1),
+(NULL, '땔싹', 13907, 2, 0, 1),
+(NULL, '떫다', 13908, 2, 0, 1),
+(NULL, '뗏장', 13909, 2, 0, 1),
+(NULL, '뜬공', 13910, 2, 0, 1),
+(NULL, '뜻밖', 13911, 2, 0, 1),
+(NULL, '띄다', 13912, 2, 0, 1),
+(NULL, '라면', 13913, 2, 0, 1),
+(NULL, '라틴', 13914, 2, 0, 1),
+(NULL, '래퍼', 13915, 2, 0, 1),
+(NULL, '로또', 13916, 2, 0, 1),
+(NULL, '로토', 13917, 2, 0, 1),
+(NULL, '리그', 13918, 2, 0, 1),
+(NULL, '리더', 13919, 2, 0, 1),
+(NULL, '리크', 13920, 2, 0, 1),
+(NULL, '립자', 13921, 2, 0, 1),
+(NULL, '링크', 13922, 2, 0, 1),
+(NULL, '마감', 13923, 2, 0, 1),
+(NULL, '마개', 13924, 2, 0, 1),
+(NULL, '마니', 13925, 2, 0, 1),
+(NULL, '마님', 13926, 2, 0, 1),
+(NULL, '마마', 13927, 2, 0, 1),
+(NULL, '마소', 13928, 2, 0, 1),
+(NULL, '마주', 13929, 2, 0, 1),
+(NULL, '마중', 13930, 2, 0, 1),
+(NULL, '마치', 13931, 2, 0, 1),
+(NULL, '마침', 13932, 2, 0, 1),
+(NULL, '마크', 13933, 2, 0, 1),
+(NULL, '막장', 13934, 2, 0, 1),
+(NULL, '만남', 13935, 2, 0, 1),
+(NULL, '많이', 13936, 2, 0, 1),
+(NULL, '맏이', 13937, 2, 0, 1),
+(NULL, '말다', 13938, 2, 0, 1),
+(NULL, '말씀', 13939, 2, 0, 1),
+(NULL, '망울', 13940, 2, 0, 1),
+(NULL, '망토', 13941, 2, 0, 1),
+(NULL, '매미', 13942, 2, 0, 1),
+(NULL, '맨날', 13943, 2, 0, 1),
+(NULL, '맨눈', 13944, 2, 0, 1),
+(NULL, '맵다', 13945, 2, 0, 1),
+(NULL, '머냐', 13946, 2, 0, 1),
+(NULL, '머루', 13947, 2, 0, 1),
+(NULL, '먹물', 13948, 2, 0, 1),
+(NULL, '멀구', 13949, 2, 0, 1),
+(NULL, '멀리', 13950, 2, 0, 1),
+(NULL, '메꽃', 13951, 2, 0, 1),
+(NULL, '메모', 13952, 2, 0, 1),
+(NULL, '메밀', 13953, 2, 0, 1),
+(NULL, '메이', 13954, 2, 0, 1),
+(NULL, '멜빵', 13955, 2, 0, 1),
+(NULL, '멥쌀', 13956, 2, 0, 1),
+(NULL, '멧닭', 13957, 2, 0, 1),
+(NULL, '멩이', 13958, 2, 0, 1),
+(NULL, '몇몇', 13959, 2, 0, 1),
+(NULL, '모다', 13960, 2, 0, 1),
+(NULL, '모레', 13961, 2, 0, 1),
+(NULL, '모습', 13962, 2, 0, 1),
+(NULL, '모이', 13963, 2, 0, 1),
+(NULL, '모임', 13964, 2, 0, 1),
+(NULL, '목젖', 13965, 2, 0, 1),
+(NULL, '목통', 13966, 2, 0, 1),
+(NULL, '몰개', 13967, 2, 0, 1),
+(NULL, '몰래', 13968, 2, 0, 1),
+(NULL, '몰매', 13969, 2, 0, 1),
+(NULL, '몸매', 13970, 2, 0, 1),
+(NULL, '몸소', 13971, 2, 0, 1),
+(NULL, '몸집', 13972, 2, 0, 1),
+(NULL, '몸짓', 13973, 2, 0, 1),
+(NULL, '못내', 13974, 2, 0, 1),
+(NULL, '뫼다', 13975, 2, 0, 1),
+(NULL, '무늬', 13976, 2, 0, 1),
+(NULL, '무덤', 13977, 2, 0, 1),
+(NULL, '무릎', 13978, 2, 0, 1),
+(NULL, '무즙', 13979, 2, 0, 1),
+(NULL, '무침', 13980, 2, 0, 1),
+(NULL, '묶음', 13981, 2, 0, 1),
+(NULL, '문배', 13982, 2, 0, 1),
+(NULL, '물가', 13983, 2, 0, 1),
+(NULL, '물결', 13984, 2, 0, 1),
+(NULL, '물범', 13985, 2, 0, 1),
+(NULL, '물속', 13986, 2, 0, 1),
+(NULL, '물외', 13987, 2, 0, 1),
+(NULL, '미드', 13988, 2, 0, 1),
+(NULL, '미사', 13989, 2, 0, 1),
+(NULL, '미스', 13990, 2, 0, 1),
+(NULL, '미움', 13991, 2, 0, 1),
+(NULL, '미팅', 13992, 2, 0, 1),
+(NULL, '민서', 13993, 2, 0, 1),
+(NULL, '믿다', 13994, 2, 0, 1),
+(NULL, '믿음', 13995, 2, 0, 1),
+(NULL, '밀당', 13996, 2, 0, 1),
+(NULL, '밀알', 13997, 2, 0, 1),
+(NULL, '밉다', 13998, 2, 0, 1),
+(NULL, '밑줄', 13999, 2, 0, 1),
+(NULL, '바깥', 14000, 2, 0, 1),
+(NULL, '바늘', 14001, 2, 0, 1),
+(NULL, '바다', 14002, 2, 0, 1),
+(NULL, '바대', 14003, 2, 0, 1),
+(NULL, '바위', 14004, 2, 0, 1),
+(NULL, '바퀴', 14005, 2, 0, 1),
+(NULL, '바탕', 14006, 2, 0, 1),
+(NULL, '반죽', 14007, 2, 0, 1),
+(NULL, '발짝', 14008, 2, 0, 1),
+(NULL, '밤꽃', 14009, 2, 0, 1),
+(NULL, '밤빵', 14010, 2, 0, 1),
+(NULL, '밤새', 14011, 2, 0, 1),
+(NULL, '밤색', 14012, 2, 0, 1),
+(NULL, '밥값', 14013, 2, 0, 1),
+(NULL, '밥풀', 14014, 2, 0, 1),
+(NULL, '방귀', 14015, 2, 0, 1),
+(NULL, '밭둑', 14016, 2, 0, 1),
+(NULL, '배꼽', 14017, 2, 0, 1),
+(NULL, '배스', 14018, 2, 0, 1),
+(NULL, '배총', 14019, 2, 0, 1),
+(NULL, '배추', 14020, 2, 0, 1),
+('徘徊', '배회', 14021, 2, 0, 1),
+(NULL, '밴드', 14022, 2, 0, 1),
+(NULL, '뱁새', 14023, 2, 0, 1),
+(NULL, '뱃길', 14024, 2, 0, 1),
+(NULL, '버들', 14025, 2, 0, 1),
+(NULL, '버선', 14026, 2, 0, 1),
+(NULL, '버클', 14027, 2, 0, 1),
+(NULL, '번트', 14028, 2, 0, 1),
+(NULL, '벌매', 14029, 2, 0, 1),
+(NULL, '벌이', 14030, 2, 0, 1),
+(NULL, '벌집', 14031, 2, 0, 1),
+(NULL, '범퍼', 14032, 2, 0, 1),
+(NULL, '벗다', 14033, 2, 0, 1),
+(NULL, '벚꽃', 14034, 2, 0, 1),
+(NULL, '베프', 14035, 2, 0, 1),
+(NULL, '벤또', 14036, 2, 0, 1),
+(NULL, '벤젠', 14037, 2, 0, 1),
+(NULL, '벤졸', 14038, 2, 0, 1),
+(NULL, '벤토', 14039, 2, 0, 1),
+(NULL, '벼랑', 14040, 2, 0, 1),
+(NULL, '변또', 14041, 2, 0, 1),
+(NULL, '별빛', 14042, 2, 0, 1),
+(NULL, '볏섬', 14043, 2, 0, 1),
+(NULL, '볏짚', 14044, 2, 0, 1),
+(NULL, '보닛', 14045, 2, 0, 1),
+(NULL, '보라', 14046, 2, 0, 1),
+(NULL, '보쌈', 14047, 2, 0, 1),
+(NULL, '보애', 14048, 2, 0, 1),
+(NULL, '복붙', 14049, 2, 0, 1),
+(NULL, '볶다', 14050, 2, 0, 1),
+(NULL, '볶음', 14051, 2, 0, 1),
+(NULL, '볶이', 14052, 2, 0, 1),
+(NULL, '볼기', 14053, 2, 0, 1),
+(NULL, '볼트', 14054, 2, 0, 1),
+(NULL, '봄날', 14055, 2, 0, 1),
+(NULL, '봄눈', 14056, 2, 0, 1),
+(NULL, '봄동', 14057, 2, 0, 1),
+(NULL, '봄밤', 14058, 2, 0, 1),
+(NULL, '봄비', 14059, 2, 0, 1),
+(NULL, '봄빛', 14060, 2, 0, 1),
+('蓬荗', '봉술', 14061, 2, 0, 1),
+(NULL, '뵈다', 14062, 2, 0, 1),
+(NULL, '뵘석', 14063, 2, 0, 1),
+(NULL, '뵙다', 14064, 2, 0, 1),
+(NULL, '부들', 14065, 2, 0, 1),
+(NULL, '부름', 14066, 2, 0, 1),
+(NULL, '북쩡', 14067, 2, 0, 1),
+(NULL, '북쪽', 14068, 2, 0, 1),
+(NULL, '불곰', 14069, 2, 0, 1),
+(NULL, '불길', 14070, 2, 0, 1),
+(NULL, '불룩', 14071, 2, 0, 1),
+(NULL, '불빛', 14072, 2, 0, 1),
+(NULL, '불알', 14073, 2, 0, 1),
+(NULL, '붓다', 14074, 2, 0, 1),
+(NULL, '붕어', 14075, 2, 0, 1),
+(NULL, '브라', 14076, 2, 0, 1),
+(NULL, '비역', 14077, 2, 0, 1),
+(NULL, '빈땅', 14078, 2, 0, 1),
+(NULL, '빈볼', 14079, 2, 0, 1),
+(NULL, '빈칸', 14080, 2, 0, 1),
+(NULL, '빌림', 14081, 2, 0, 1),
+(NULL, '빗금', 14082, 2, 0, 1),
+(NULL, '빗물', 14083, 2, 0, 1),
+(NULL, '빙고', 14084, 2, 0, 1),
+(NULL, '빛깔', 14085, 2, 0, 1),
+(NULL, '빛알', 14086, 2, 0, 1),
+(NULL, '빠가', 14087, 2, 0, 1),
+(NULL, '빨대', 14088, 2, 0, 1),
+(NULL, '빨리', 14089, 2, 0, 1),
+(NULL, '빻다', 14090, 2, 0, 1),
+(NULL, '빼기', 14091, 2, 0, 1),
+(NULL, '뺄셈', 14092, 2, 0, 1),
+(NULL, '뻗다', 14093, 2, 0, 1),
+(NULL, '사람', 14094, 2, 0, 1),
+(NULL, '사립', 14095, 2, 0, 1),
+(NULL, '사철', 14096, 2, 0, 1),
+(NULL, '사춘', 14097, 2, 0, 1),
+(NULL, '사탄', 14098, 2, 0, 1),
+(NULL, '산속', 14099, 2, 0, 1),
+(NULL, '산시', 14100, 2, 0, 1),
+(NULL, '살갗', 14101, 2, 0, 1),
+(NULL, '살다', 14102, 2, 0, 1),
+(NULL, '살별', 14103, 2, 0, 1),
+(NULL, '삼대', 14104, 2, 0, 1),
+(NULL, '삽개', 14105, 2, 0, 1),
+(NULL, '새매', 14106, 2, 0, 1),
+(NULL, '새삼', 14107, 2, 0, 1),
+(NULL, '새알', 14108, 2, 0, 1),
+(NULL, '새우', 14109, 2, 0, 1),
+(NULL, '샘물', 14110, 2, 0, 1),
+(NULL, '생각', 14111, 2, 0, 1),
+(NULL, '생쥐', 14112, 2, 0, 1),
+(NULL, '서너', 14113, 2, 0, 1),
+(NULL, '서랍', 14114, 2, 0, 1),
+(NULL, '서울', 14115, 2, 0, 1),
+(NULL, '서월', 14116, 2, 0, 1),
+(NULL, '석다', 14117, 2, 0, 1),
+(NULL, '석임', 14118, 2, 0, 1),
+(NULL, '선낫', 14119, 2, 0, 1),
+(NULL, '선반', 14120, 2, 0, 1),
+(NULL, '선비', 14121, 2, 0, 1),
+(NULL, '설마', 14122, 2, 0, 1),
+(NULL, '설폰', 14123, 2, 0, 1),
+(NULL, '섧다', 14124, 2, 0, 1),
+(NULL, '섬돌', 14125, 2, 0, 1),
+(NULL, '성결', 14126, 2, 0, 1),
+(NULL, '성냥', 14127, 2, 0, 1),
+(NULL, '성에', 14128, 2, 0, 1),
+(NULL, '세뇨', 14129, 2, 0, 1),
+(NULL, '세슘', 14130, 2, 0, 1),
+(NULL, '센서', 14131, 2, 0, 1),
+(NULL, '소꿉', 14132, 2, 0, 1),
+(NULL, '소다', 14133, 2, 0, 1),
+(NULL, '소래', 14134, 2, 0, 1),
+(NULL, '소뿔', 14135, 2, 0, 1),
+(NULL, '소스', 14136, 2, 0, 1),
+(NULL, '속다', 14137, 2, 0, 1),
+(NULL, '속옷', 14138, 2, 0, 1),
+(NULL, '손톱', 14139, 2, 0, 1),
+(NULL, '솔숲', 14140, 2, 0, 1),
+(NULL, '솟다', 14141, 2, 0, 1),
+(NULL, '송곳', 14142, 2, 0, 1),
+(NULL, '송이', 14143, 2, 0, 1),
+(NULL, '송치', 14144, 2, 0, 1),
+(NULL, '송쿠', 14145, 2, 0, 1),
+(NULL, '쇠뼈', 14146, 2, 0, 1),
+(NULL, '수꿩', 14147, 2, 0, 1),
+(NULL, '수다', 14148, 2, 0, 1),
+(NULL, '수캐', 14149, 2, 0, 1),
+(NULL, '수컷', 14150, 2, 0, 1),
+(NULL, '순대', 14151, 2, 0, 1),
+(NULL, '술독', 14152, 2, 0, 1),
+(NULL, '술래', 14153, 2, 0, 1),
+(NULL, '술맛', 14154, 2, 0, 1),
+(NULL, '술밑', 14155, 2, 0, 1),
+(NULL, '술집', 14156, 2, 0, 1),
+(NULL, '술판', 14157, 2, 0, 1),
+(NULL, '숨다', 14158, 2, 0, 1),
+(NULL, '쉽다', 14159, 2, 0, 1),
+(NULL, '슈퍼', 14160, 2, 0, 1),
+(NULL, '스카', 14161, 2, 0, 1),
+(NULL, '스키', 14162, 2, 0, 1),
+(NULL, '스폰', 14163, 2, 0, 1),
+(NULL, '슬기', 14164, 2, 0, 1),
+(NULL, '슬픔', 14165, 2, 0, 1),
+(NULL, '슴가', 14166, 2, 0, 1),
+(NULL, '시골', 14167, 2, 0, 1),
+(NULL, '시내', 14168, 2, 0, 1),
+(NULL, '시렁', 14169, 2, 0, 1),
+(NULL, '시트', 14170, 2, 0, 1),
+(NULL, '신다', 14171, 2, 0, 1),
+(NULL, '실파', 14172, 2, 0, 1),
+(NULL, '심줄', 14173, 2, 0, 1),
+(NULL, '싱커', 14174, 2, 0, 1),
+(NULL, '싶다', 14175, 2, 0, 1),
+(NULL, '쌀알', 14176, 2, 0, 1),
+(NULL, '써다', 14177, 2, 0, 1),
+(NULL, '썩다', 14178, 2, 0, 1),
+(NULL, '썰매', 14179, 2, 0, 1),
+(NULL, '쏟다', 14180, 2, 0, 1),
+(NULL, '쐐기', 14181, 2, 0, 1),
+(NULL, '쓰봉', 14182, 2, 0, 1),
+(NULL, '쓰푸', 14183, 2, 0, 1),
+(NULL, '쓸개', 14184, 2, 0, 1),
+(NULL, '쓸데', 14185, 2, 0, 1),
+(NULL, '씌다', 14186, 2, 0, 1),
+(NULL, '씨다', 14187, 2, 0, 1),
+(NULL, '씨름', 14188, 2, 0, 1),
+(NULL, '씨앗', 14189, 2, 0, 1),
+(NULL, '아내', 14190, 2, 0, 1),
+(NULL, '아니', 14191, 2, 0, 1),
+(NULL, '아담', 14192, 2, 0, 1),
+(NULL, '아락', 14193, 2, 0, 1),
+(NULL, '아리', 14194, 2, 0, 1),
+(NULL, '아무', 14195, 2, 0, 1),
+(NULL, '아민', 14196, 2, 0, 1),
+(NULL, '아벨', 14197, 2, 0, 1),
+(NULL, '아빠', 14198, 2, 0, 1),
+(NULL, '아아', 14199, 2, 0, 1),
+(NULL, '아우', 14200, 2, 0, 1),
+(NULL, '아작', 14201, 2, 0, 1),
+(NULL, '아직', 14202, 2, 0, 1),
+(NULL, '아침', 14203, 2, 0, 1),
+('齷齪', '악착', 14204, 2, 0, 1),
+('鮟鱇', '안강', 14205, 2, 0, 1),
+(NULL, '안개', 14206, 2, 0, 1),
+(NULL, '안방', 14207, 2, 0, 1),
+(NULL, '안심', 14208, 2, 0, 1),
+(NULL, '안티', 14209, 2, 0, 1),
+(NULL, '알람', 14210, 2, 0, 1),
+(NULL, '알약', 14211, 2, 0, 1),
+(NULL, '알칸', 14212, 2, 0, 1),
+(NULL, '알켄', 14213, 2, 0, 1),
+(NULL, '알킨', 14214, 2, 0, 1),
+(NULL, '알판', 14215, 2, 0, 1),
+(NULL, '암꿩', 14216, 2, 0, 1),
+(NULL, '암릿', 14217, 2, 0, 1),
+(NULL, '암소', 14218, 2, 0, 1),
+(NULL, '암중', 14219, 2, 0, 1),
+(NULL, '압씨', 14220, 2, 0, 1),
+(NULL, '앙까', 14221, 2, 0, 1),
+(NULL, '애꾸', 14222, 2, 0, 1),
+(NULL, '애초', 14223, 2, 0, 1),
+(NULL, '양달', 14224, 2, 0, 1),
+(NULL, '양쪽', 14225, 2, 0, 1),
+(NULL, '양초', 14226, 2, 0, 1),
+(NULL, '양치', 14227, 2, 0, 1),
+(NULL, '양털', 14228, 2, 0, 1),
+(NULL, '얕다', 14229, 2, 0, 1),
+(NULL, '얘기', 14230, 2, 0, 1),
+(NULL, '어둠', 14231, 2, 0, 1),
+(NULL, '어마', 14232, 2, 0, 1),
+(NULL, '어이', 14233, 2, 0, 1),
+(NULL, '어치', 14234, 2, 0, 1),
+(NULL, '억새', 14235, 2, 0, 1),
+(NULL, '억수', 14236, 2, 0, 1),
+(NULL, '언덕', 14237, 2, 0, 1),
+(NULL, '언제', 14238, 2, 0, 1),
+(NULL, '얼굴', 14239, 2, 0, 1),
+(NULL, '얼른', 14240, 2, 0, 1),
+(NULL, '얼마', 14241, 2, 0, 1),
+(NULL, '엄두', 14242, 2, 0, 1),
+(NULL, '엄마', 14243, 2, 0, 1),
+(NULL, '업진', 14244, 2, 0, 1),
+(NULL, '없이', 14245, 2, 0, 1),
+(NULL, '에기', 14246, 2, 0, 1),
+(NULL, '에러', 14247, 2, 0, 1),
+(NULL, '에로', 14248, 2, 0, 1),
+(NULL, '에미', 14249, 2, 0, 1),
+(NULL, '에터', 14250, 2, 0, 1),
+(NULL, '여러', 14251, 2, 0, 1),
+(NULL, '연장', 14252, 2, 0, 1),
+(NULL, '열쇠', 14253, 2, 0, 1),
+(NULL, '염통', 14254, 2, 0, 1),
+(NULL, '옆집', 14255, 2, 0, 1),
+(NULL, '예수', 14256, 2, 0, 1),
+(NULL, '오늄', 14257, 2, 0, 1),
+(NULL, '오다', 14258, 2, 0, 1),
+(NULL, '오덕', 14259, 2, 0, 1),
+(NULL, '오얘', 14260, 2, 0, 1),
+(NULL, '오존', 14261, 2, 0, 1),
+(NULL, '옥심', 14262, 2, 0, 1),
+(NULL, '옴쌀', 14263, 2, 0, 1),
+(NULL, '옷장', 14264, 2, 0, 1),
+(NULL, '와우', 14265, 2, 0, 1),
+(NULL, '왜케', 14266, 2, 0, 1),
+(NULL, '왤케', 14267, 2, 0, 1),
+(NULL, '외딸', 14268, 2, 0, 1),
+(NULL, '왼쪽', 14269, 2, 0, 1),
+(NULL, '용케', 14270, 2, 0, 1),
+(NULL, '우레', 14271, 2, 0, 1),
+(NULL, '우무', 14272, 2, 0, 1),
+(NULL, '우틔', 14273, 2, 0, 1),
+(NULL, '울다', 14274, 2, 0, 1),
+(NULL, '울안', 14275, 2, 0, 1),
+(NULL, '울음', 14276, 2, 0, 1),
+(NULL, '웃옷', 14277, 2, 0, 1),
+(NULL, '웃음', 14278, 2, 0, 1),
+(NULL, '워낙', 14279, 2, 0, 1),
+(NULL, '원말', 14280, 2, 0, 1),
+(NULL, '원샷', 14281, 2, 0, 1),
+(NULL, '웬이', 14282, 2, 0, 1),
+(NULL, '위안', 14283, 2, 0, 1),
+(NULL, '위쪽', 14284, 2, 0, 1),
+(NULL, '유로', 14285, 2, 0, 1),
+(NULL, '율무', 14286, 2, 0, 1),
+(NULL, '윷짝', 14287, 2, 0, 1),
+(NULL, '은빛', 14288, 2, 0, 1),
+('殷殷', '은은', 14289, 2, 0, 1),
+(NULL, '응득', 14290, 2, 0, 1),
+(NULL, '이날', 14291, 2, 0, 1),
+(NULL, '이내', 14292, 2, 0, 1),
+(NULL, '이달', 14293, 2, 0, 1),
+(NULL, '이때', 14294, 2, 0, 1),
+(NULL, '이런', 14295, 2, 0, 1),
+(NULL, '이마', 14296, 2, 0, 1),
+(NULL, '이불', 14297, 2, 0, 1),
+(NULL, '이승', 14298, 2, 0, 1),
+(NULL, '이어', 14299, 2, 0, 1),
+(NULL, '이제', 14300, 2, 0, 1),
+(NULL, '이태', 14301, 2, 0, 1),
+(NULL, '인덴', 14302, 2, 0, 1),
+(NULL, '인돌', 14303, 2, 0, 1),
+(NULL, '인듐', 14304, 2, 0, 1),
+('吝嗇', '인색', 14305, 2, 0, 1),
+(NULL, '임금', 14306, 2, 0, 1),
+(NULL, '입덕', 14307, 2, 0, 1),
+(NULL, '입맛', 14308, 2, 0, 1),
+(NULL, '입쌀', 14309, 2, 0, 1),
+(NULL, '잇기', 14310, 2, 0, 1),
+(NULL, '잇몸', 14311, 2, 0, 1),
+(NULL, '잉어', 14312, 2, 0, 1),
+(NULL, '자꾸', 14313, 2, 0, 1),
+(NULL, '자라', 14314, 2, 0, 1),
+(NULL, '자몽', 14315, 2, 0, 1),
+(NULL, '자지', 14316, 2, 0, 1),
+(NULL, '자치', 14317, 2, 0, 1),
+(NULL, '잔치', 14318, 2, 0, 1),
+(NULL, '잔텐', 14319, 2, 0, 1),
+(NULL, '장군', 14320, 2, 0, 1),
+(NULL, '장수', 14321, 2, 0, 1),
+(NULL, '장터', 14322, 2, 0, 1),
+(NULL, '재미', 14323, 2, 0, 1),
+(NULL, '재즈', 14324, 2, 0, 1),
+(NULL, '쟁기', 14325, 2, 0, 1),
+(NULL, '저자', 14326, 2, 0, 1),
+(NULL, '적은', 14327, 2, 0, 1),
+(NULL, '전골', 14328, 2, 0, 1),
+(NULL, '전국', 14329, 2, 0, 1),
+(NULL, '전날', 14330, 2, 0, 1),
+(NULL, '절터', 14331, 2, 0, 1),
+(NULL, '젊다', 14332, 2, 0, 1),
+(NULL, '젊음', 14333, 2, 0, 1),
+(NULL, '접다', 14334, 2, 0, 1),
+(NULL, '접때', 14335, 2, 0, 1),
+(NULL, '젓갈', 14336, 2, 0, 1),
+(NULL, '정글', 14337, 2, 0, 1),
+('葶藶', '정력', 14338, 2, 0, 1),
+(NULL, '정작', 14339, 2, 0, 1),
+(NULL, '정재', 14340, 2, 0, 1),
+(NULL, '젖통', 14341, 2, 0, 1),
+(NULL, '조금', 14342, 2, 0, 1),
+(NULL, '조카', 14343, 2, 0, 1),
+(NULL, '존예', 14344, 2, 0, 1),
+(NULL, '졸부', 14345, 2, 0, 1),
+(NULL, '졸음', 14346, 2, 0, 1),
+(NULL, '좆나', 14347, 2, 0, 1),
+(NULL, '좆목', 14348, 2, 0, 1),
+(NULL, '좆물', 14349, 2, 0, 1),
+(NULL, '좆밥', 14350, 2, 0, 1),
+(NULL, '주다', 14351, 2, 0, 1),
+(NULL, '주비', 14352, 2, 0, 1),
+(NULL, '죽지', 14353, 2, 0, 1),
+(NULL, '준말', 14354, 2, 0, 1),
+(NULL, '줄다', 14355, 2, 0, 1),
+(NULL, '줍다', 14356, 2, 0, 1),
+(NULL, '증식', 14357, 2, 0, 1),
+(NULL, '지라', 14358, 2, 0, 1),
+(NULL, '지퍼', 14359, 2, 0, 1),
+(NULL, '진지', 14360, 2, 0, 1),
+(NULL, '짐치', 14361, 2, 0, 1),
+(NULL, '집들', 14362, 2, 0, 1),
+(NULL, '집쥐', 14363, 2, 0, 1),
+(NULL, '집터', 14364, 2, 0, 1),
+(NULL, '짓다', 14365, 2, 0, 1),
+(NULL, '짜리', 14366, 2, 0, 1),
+(NULL, '짜증', 14367, 2, 0, 1),
+(NULL, '짬뽕', 14368, 2, 0, 1),
+(NULL, '짱개', 14369, 2, 0, 1),
+(NULL, '쩨마', 14370, 2, 0, 1),
+(NULL, '찐빵', 14371, 2, 0, 1),
+(NULL, '찔기', 14372, 2, 0, 1),
+(NULL, '차르', 14373, 2, 0, 1),
+('蹉跌', '차질', 14374, 2, 0, 1),
+(NULL, '차츰', 14375, 2, 0, 1),
+(NULL, '찬물', 14376, 2, 0, 1),
+(NULL, '찰떡', 14377, 2, 0, 1),
+(NULL, '참다', 14378, 2, 0, 1),
+(NULL, '참매', 14379, 2, 0, 1),
+(NULL, '찻물', 14380, 2, 0, 1),
+(NULL, '찻잎', 14381, 2, 0, 1),
+(NULL, '채팅', 14382, 2, 0, 1),
+(NULL, '천제', 14383, 2, 0, 1),
+(NULL, '철새', 14384, 2, 0, 1),
+(NULL, '철쭉', 14385, 2, 0, 1),
+(NULL, '첫날', 14386, 2, 0, 1),
+(NULL, '체스', 14387, 2, 0, 1),
+(NULL, '체커', 14388, 2, 0, 1),
+(NULL, '총열', 14389, 2, 0, 1),
+(NULL, '치마', 14390, 2, 0, 1),
+(NULL, '치타', 14391, 2, 0, 1),
+(NULL, '카란', 14392, 2, 0, 1),
+(NULL, '카인', 14393, 2, 0, 1),
+(NULL, '카페', 14394, 2, 0, 1),
+(NULL, '칼집', 14395, 2, 0, 1),
+(NULL, '캄판', 14396, 2, 0, 1),
+(NULL, '캐럿', 14397, 2, 0, 1),
+(NULL, '캐시', 14398, 2, 0, 1),
+(NULL, '커버', 14399, 2, 0, 1),
+(NULL, '커터', 14400, 2, 0, 1),
+(NULL, '컨닝', 14401, 2, 0, 1),
+(NULL, '컴맹', 14402, 2, 0, 1),
+(NULL, '케톤', 14403, 2, 0, 1),
+(NULL, '켄트', 14404, 2, 0, 1),
+(NULL, '켈빈', 14405, 2, 0, 1),
+(NULL, '코기', 14406, 2, 0, 1),
+(NULL, '코린', 14407, 2, 0, 1),
+(NULL, '콜린', 14408, 2, 0, 1),
+(NULL, '콩팥', 14409, 2, 0, 1),
+(NULL, '퀘벡', 14410, 2, 0, 1),
+(NULL, '퀴논', 14411, 2, 0, 1),
+(NULL, '큰비', 14412, 2, 0, 1),
+(NULL, '키릴', 14413, 2, 0, 1),
+(NULL, '키스', 14414, 2, 0, 1),
+(NULL, '타래', 14415, 2, 0, 1),
+(NULL, '타프', 14416, 2, 0, 1),
+(NULL, '탈것', 14417, 2, 0, 1),
+(NULL, '탱크', 14418, 2, 0, 1),
+(NULL, '터럭', 14419, 2, 0, 1),
+(NULL, '털빛', 14420, 2, 0, 1),
+(NULL, '테러', 14421, 2, 0, 1),
+(NULL, '테마', 14422, 2, 0, 1),
+(NULL, '텔펜', 14423, 2, 0, 1),
+(NULL, '템포', 14424, 2, 0, 1),
+(NULL, '톱날', 14425, 2, 0, 1),
+(NULL, '통구', 14426, 2, 0, 1),
+(NULL, '통째', 14427, 2, 0, 1),
+(NULL, '투구', 14428, 2, 0, 1),
+(NULL, '튀김', 14429, 2, 0, 1),
+(NULL, '트림', 14430, 2, 0, 1),
+(NULL, '티끌', 14431, 2, 0, 1),
+(NULL, '티비', 14432, 2, 0, 1),
+(NULL, '팀원', 14433, 2, 0, 1),
+(NULL, '파데', 14434, 2, 0, 1),
+(NULL, '파쑈', 14435, 2, 0, 1),
+(NULL, '팔뚝', 14436, 2, 0, 1),
+(NULL, '팔찌', 14437, 2, 0, 1),
+(NULL, '팝송', 14438, 2, 0, 1),
+(NULL, '팡이', 14439, 2, 0, 1),
+(NULL, '팥죽', 14440, 2, 0, 1),
+(NULL, '패다', 14441, 2, 0, 1),
+(NULL, '팩스', 14442, 2, 0, 1),
+(NULL, '팩트', 14443, 2, 0, 1),
+(NULL, '팬츠', 14444, 2, 0, 1),
+(NULL, '퍼브', 14445, 2, 0, 1),
+(NULL, '펑크', 14446, 2, 0, 1),
+(NULL, '페놀', 14447, 2, 0, 1),
+(NULL, '펜치', 14448, 2, 0, 1),
+(NULL, '포커', 14449, 2, 0, 1),
+(NULL, '포탈', 14450, 2, 0, 1),
+(NULL, '포털', 14451, 2, 0, 1),
+(NULL, '표범', 14452, 2, 0, 1),
+(NULL, '풀무', 14453, 2, 0, 1),
+(NULL, '풀밭', 14454, 2, 0, 1),
+(NULL, '풀뱀', 14455, 2, 0, 1),
+(NULL, '풀잎', 14456, 2, 0, 1),
+(NULL, '풍슉', 14457, 2, 0, 1),
+(NULL, '퓨란', 14458, 2, 0, 1),
+(NULL, '퓨린', 14459, 2, 0, 1),
+(NULL, '프디', 14460, 2, 0, 1),
+(NULL, '프로', 14461, 2, 0, 1),
+(NULL, '피넨', 14462, 2, 0, 1),
+(NULL, '피뎨', 14463, 2, 0, 1),
+(NULL, '피롤', 14464, 2, 0, 1),
+(NULL, '피센', 14465, 2, 0, 1),
+(NULL, '피통', 14466, 2, 0, 1),
+(NULL, '핀치', 14467, 2, 0, 1),
+(NULL, '핀트', 14468, 2, 0, 1),
+(NULL, '핏줄', 14469, 2, 0, 1),
+(NULL, '핑계', 14470, 2, 0, 1),
+(NULL, '핑퐁', 14471, 2, 0, 1),
+(NULL, '하나', 14472, 2, 0, 1),
+(NULL, '하루', 14473, 2, 0, 1),
+('瑕疵', '하자', 14474, 2, 0, 1),
+(NULL, '한두', 14475, 2, 0, 1),
+(NULL, '한둘', 14476, 2, 0, 1),
+(NULL, '한쌍', 14477, 2, 0, 1),
+(NULL, '한창', 14478, 2, 0, 1),
+(NULL, '한층', 14479, 2, 0, 1),
+(NULL, '한편', 14480, 2, 0, 1),
+(NULL, '할미', 14481, 2, 0, 1),
+(NULL, '항렬', 14482, 2, 0, 1),
+(NULL, '해빛', 14483, 2, 0, 1),
+(NULL, '핸들', 14484, 2, 0, 1),
+(NULL, '햇귀', 14485, 2, 0, 1),
+(NULL, '햇발', 14486, 2, 0, 1),
+(NULL, '햇빛', 14487, 2, 0, 1),
+(NULL, '햇살', 14488, 2, 0, 1),
+(NULL, '행어', 14489, 2, 0, 1),
+(NULL, '행주', 14490, 2, 0, 1),
+(NULL, '허리', 14491, 2, 0, 1),
+(NULL, '허북', 14492, 2, 0, 1),
+(NULL, '헐다', 14493, 2, 0, 1),
+(NULL, '헛간', 14494, 2, 0, 1),
+(NULL, '헬멧', 14495, 2, 0, 1),
+(NULL, '헬스', 14496, 2, 0, 1),
+(NULL, '호빵', 14497, 2, 0, 1),
+(NULL, '혹은', 14498, 2, 0, 1),
+(NULL, '혼밥', 14499, 2, 0, 1),
+(NULL, '혼자', 14500, 2, 0, 1),
+(NULL, '홀로', 14501, 2, 0, 1),
+(NULL, '홈런', 14502, 2, 0, 1),
+(NULL, '홉빡', 14503, 2, 0, 1),
+(NULL, '활꼴', 14504, 2, 0, 1),
+(NULL, '홰불', 14505, 2, 0, 1),
+(NULL, '후다', 14506, 2, 0, 1),
+(NULL, '후드', 14507, 2, 0, 1),
+(NULL, '후추', 14508, 2, 0, 1),
+(NULL, '훔침', 14509, 2, 0, 1),
+(NULL, '훵크', 14510, 2, 0, 1),
+(NULL, '흉내', 14511, 2, 0, 1),
+(NULL, '흐름', 14512, 2, 0, 1),
+(NULL, '흘기', 14513, 2, 0, 1),
+(NULL, '흘림', 14514, 2, 0, 1),
+(NULL, '희다', 14515, 2, 0, 1),
+(NULL, '힌트', 14516, 2, 0, 1),
+(NULL, '漸漸漸', 14517, 2, 0, 1),
+(NULL, '가깝다', 14518, 2, 0, 1),
+(NULL, '가꾸다', 14519, 2, 0, 1),
+(NULL, '가난히', 14520, 2, 0, 1),
+(NULL, '가네샤', 14521, 2, 0, 1),
+(NULL, '가두리', 14522, 2, 0, 1),
+(NULL, '가득히', 14523, 2, 0, 1),
+(NULL, '가로막', 14524, 2, 0, 1),
+(NULL, '가리개', 14525, 2, 0, 1),
+(NULL, '가맣다', 14526, 2, 0, 1),
+(NULL, '가쁘다', 14527, 2, 0, 1),
+(NULL, '가솔린', 14528, 2, 0, 1),
+(NULL, '가슴골', 14529, 2, 0, 1),
+(NULL, '가슴띠', 14530, 2, 0, 1),
+(NULL, '가시나', 14531, 2, 0, 1),
+(NULL, '가없이', 14532, 2, 0, 1),
+(NULL, '가오리', 14533, 2, 0, 1),
+(NULL, '가을밤', 14534, 2, 0, 1),
+(NULL, '가을비', 14535, 2, 0, 1),
+(NULL, '가재미', 14536, 2, 0, 1),
+(NULL, '가지고', 14537, 2, 0, 1),
+(NULL, '가지뿔', 14538, 2, 0, 1),
+(NULL, '각중에', 14539, 2, 0, 1),
+(NULL, '간간이', 14540, 2, 0, 1),
+(NULL, '간지럼', 14541, 2, 0, 1),
+(NULL, '갇히다', 14542, 2, 0, 1),
+(NULL, '갈보집', 14543, 2, 0, 1),
+(NULL, '갈비뼈', 14544, 2, 0, 1),
+(NULL, '갈키다', 14545, 2, 0, 1),
+(NULL, '갑자기', 14546, 2, 0, 1),
+(NULL, '값어치', 14547, 2, 0, 1),
+(NULL, '강구다', 14548, 2, 0, 1),
+(NULL, '강냉이', 14549, 2, 0, 1),
+(NULL, '갖가지', 14550, 2, 0, 1),
+(NULL, '갖추다', 14551, 2, 0, 1),
+(NULL, '같잖다', 14552, 2, 0, 1),
+(NULL, '개죽음', 14553, 2, 0, 1),
+(NULL, '개지랄', 14554, 2, 0, 1),
+(NULL, '갱가리', 14555, 2, 0, 1),
+(NULL, '갸울다', 14556, 2, 0, 1),
+(NULL, '거닐다', 14557, 2, 0, 1),
+(NULL, '거뜨다', 14558, 2, 0, 1),
+(NULL, '거머리', 14559, 2, 0, 1),
+(NULL, '거북이', 14560, 2, 0, 1),
+(NULL, '건너다', 14561, 2, 0, 1),
+(NULL, '건너편', 14562, 2, 0, 1),
+(NULL, '건넌편', 14563, 2, 0, 1),
+(NULL, '건널목', 14564, 2, 0, 1),
+(NULL, '건지다', 14565, 2, 0, 1),
+(NULL, '걸림씨', 14566, 2, 0, 1),
+(NULL, '걸우다', 14567, 2, 0, 1),
+(NULL, '겁쟁이', 14568, 2, 0, 1),
+(NULL, '게니자', 14569, 2, 0, 1),
+(NULL, '게이다', 14570, 2, 0, 1),
+(NULL, '게이트', 14571, 2, 0, 1),
+(NULL, '게임성', 14572, 2, 0, 1),
+(NULL, '겨루다', 14573, 2, 0, 1),
+(NULL, '겨울날', 14574, 2, 0, 1),
+(NULL, '겨울밤', 14575, 2, 0, 1),
+(NULL, '겨울비', 14576, 2, 0, 1),
+(NULL, '겨울새', 14577, 2, 0, 1),
+(NULL, '겨울잠', 14578, 2, 0, 1),
+(NULL, '곁사슬', 14579, 2, 0, 1),
+(NULL, '계집애', 14580, 2, 0, 1),
+(NULL, '계집종', 14581, 2, 0, 1),
+(NULL, '계집질', 14582, 2, 0, 1),
+(NULL, '고객님', 14583, 2, 0, 1),
+(NULL, '고갱이', 14584, 2, 0, 1),
+(NULL, '고릴라', 14585, 2, 0, 1),
+(NULL, '고인돌', 14586, 2, 0, 1),
+(NULL, '골드바', 14587, 2, 0, 1),
+(NULL, '곰팡이', 14588, 2, 0, 1),
+(NULL, '곱세크', 14589, 2, 0, 1),
+(NULL, '곱하기', 14590, 2, 0, 1),
+(NULL, '곱하다', 14591, 2, 0, 1),
+(NULL, '과메기', 14592, 2, 0, 1),
+(NULL, '과일물', 14593, 2, 0, 1),
+(NULL, '괴로움', 14594, 2, 0, 1),
+(NULL, '굉장히', 14595, 2, 0, 1),
+(NULL, '구경군', 14596, 2, 0, 1),
+(NULL, '구경꾼', 14597, 2, 0, 1),
+(NULL, '구기다', 14598, 2, 0, 1),
+(NULL, '구덩이', 14599, 2, 0, 1),
+(NULL, '구두끈', 14600, 2, 0, 1),
+(NULL, '군만두', 14601, 2, 0, 1),
+(NULL, '군바리', 14602, 2, 0, 1),
+(NULL, '군소리', 14603, 2, 0, 1),
+(NULL, '굴리다', 14604, 2, 0, 1),
+(NULL, '굶기다', 14605, 2, 0, 1),
+(NULL, '굶주림', 14606, 2, 0, 1),
+(NULL, '귀걸이', 14607, 2, 0, 1),
+(NULL, '귀구멍', 14608, 2, 0, 1),
+(NULL, '귀밑털', 14609, 2, 0, 1),
+(NULL, '귀엽다', 14610, 2, 0, 1),
+(NULL, '귀하다', 14611, 2, 0, 1),
+(NULL, '그끄제', 14612, 2, 0, 1),
+(NULL, '그대로', 14613, 2, 0, 1),
+(NULL, '그래프', 14614, 2, 0, 1),
+(NULL, '그래픽', 14615, 2, 0, 1),
+(NULL, '그러자', 14616, 2, 0, 1),
+(NULL, '그런지', 14617, 2, 0, 1),
+(NULL, '그렐린', 14618, 2, 0, 1),
+(NULL, '그루브', 14619, 2, 0, 1),
+(NULL, '글리프', 14620, 2, 0, 1),
+(NULL, '글쓴이', 14621, 2, 0, 1),
+(NULL, '금덩이', 14622, 2, 0, 1),
+(NULL, '기러기', 14623, 2, 0, 1),
+(NULL, '기례기', 14624, 2, 0, 1),
+(NULL, '기본값', 14625, 2, 0, 1),
+(NULL, '기쁘다', 14626, 2, 0, 1),
+(NULL, '기집애', 14627, 2, 0, 1),
+(NULL, '기찻길', 14628, 2, 0, 1),
+(NULL, '긴 것', 14629, 2, 0, 1),
+(NULL, '길거리', 14630, 2, 0, 1),
+(NULL, '길냥이', 14631, 2, 0, 1),
+(NULL, '길동무', 14632, 2, 0, 1),
+(NULL, '김치전', 14633, 2, 0, 1),
+(NULL, '까마귀', 14634, 2, 0, 1),
+(NULL, '까막눈', 14635, 2, 0, 1),
+(NULL, '깍대기', 14636, 2, 0, 1),
+(NULL, '깎이다', 14637, 2, 0, 1),
+(NULL, '깔리다', 14638, 2, 0, 1),
+(NULL, '깨닫다', 14639, 2, 0, 1),
+(NULL, '깨물다', 14640, 2, 0, 1),
+(NULL, '깨배다', 14641, 2, 0, 1),
+(NULL, '꺼멓다', 14642, 2, 0, 1),
+(NULL, '꺽저구', 14643, 2, 0, 1),
+(NULL, '껴안다', 14644, 2, 0, 1),
+(NULL, '꼼꼼히', 14645, 2, 0, 1),
+(NULL, '꽃이끼', 14646, 2, 0, 1),
+(NULL, '꾸준히', 14647, 2, 0, 1),
+(NULL, '꾹저구', 14648, 2, 0, 1),
+(NULL, '뀌매다', 14649, 2, 0, 1),
+(NULL, '끄내기', 14650, 2, 0, 1),
+(NULL, '끊이다', 14651, 2, 0, 1),
+(NULL, '끝없다', 14652, 2, 0, 1),
+(NULL, '끼야기', 14653, 2, 0, 1),
+(NULL, '끼우다', 14654, 2, 0, 1),
+(NULL, '낑가다', 14655, 2, 0, 1),
+(NULL, '나눗셈', 14656, 2, 0, 1),
+(NULL, '나드리', 14657, 2, 0, 1),
+(NULL, '나라님', 14658, 2, 0, 1),
+(NULL, '나라말', 14659, 2, 0, 1),
+(NULL, '나르다', 14660, 2, 0, 1),
+(NULL, '나무군', 14661, 2, 0, 1),
+(NULL, '나무꾼', 14662, 2, 0, 1),
+(NULL, '나뭇잎', 14663, 2, 0, 1),
+(NULL, '나서다', 14664, 2, 0, 1),
+(NULL, '나오다', 14665, 2, 0, 1),
+(NULL, '낚시질', 14666, 2, 0, 1),
+(NULL, '낚시터', 14667, 2, 0, 1),
+(NULL, '난롯불', 14668, 2, 0, 1),
+(NULL, '날고기', 14669, 2, 0, 1),
+(NULL, '날마다', 14670, 2, 0, 1),
+(NULL, '남사친', 14671, 2, 0, 1),
+(NULL, '남프릭', 14672, 2, 0, 1),
+(NULL, '낯설다', 14673, 2, 0, 1),
+(NULL, '낯익다', 14674, 2, 0, 1),
+(NULL, '내놓다', 14675, 2, 0, 1),
+(NULL, '내몰다', 14676, 2, 0, 1),
+(NULL, '내쫓다', 14677, 2, 0, 1),
+(NULL, '내키다', 14678, 2, 0, 1),
+(NULL, '너구리', 14679, 2, 0, 1),
+(NULL, '너도밤', 14680, 2, 0, 1),
+(NULL, '너무나', 14681, 2, 0, 1),
+(NULL, '너클볼', 14682, 2, 0, 1),
+(NULL, '넌지시', 14683, 2, 0, 1),
+(NULL, '널빤지', 14684, 2, 0, 1),
+(NULL, '넓히다', 14685, 2, 0, 1),
+(NULL, '넙턱지', 14686, 2, 0, 1),
+(NULL, '노갱이', 14687, 2, 0, 1),
+(NULL, '노래방', 14688, 2, 0, 1),
+(NULL, '노르마', 14689, 2, 0, 1),
+(NULL, '노여움', 14690, 2, 0, 1),
+(NULL, '녹나무', 14691, 2, 0, 1),
+(NULL, '논다니', 14692, 2, 0, 1),
+(NULL, '놀라움', 14693, 2, 0, 1),
+(NULL, '놀래다', 14694, 2, 0, 1),
+(NULL, '놀이감', 14695, 2, 0, 1),
+(NULL, '농구다', 14696, 2, 0, 1),
+(NULL, '농사꾼', 14697, 2, 0, 1),
+(NULL, '높이다', 14698, 2, 0, 1),
+(NULL, '놓이다', 14699, 2, 0, 1),
+(NULL, '누리다', 14700, 2, 0, 1),
+(NULL, '누리집', 14701, 2, 0, 1),
+(NULL, '눈먹재', 14702, 2, 0, 1),
+(NULL, '눈보라', 14703, 2, 0, 1),
+(NULL, '눈웃음', 14704, 2, 0, 1),
+(NULL, '눈초리', 14705, 2, 0, 1),
+(NULL, '늑대별', 14706, 2, 0, 1),
+(NULL, '늘임표', 14707, 2, 0, 1),
+(NULL, '늦가을', 14708, 2, 0, 1),
+(NULL, '니트릴', 14709, 2, 0, 1),
+(NULL, '다람쥐', 14710, 2, 0, 1),
+(NULL, '다랑어', 14711, 2, 0, 1),
+(NULL, '다치다', 14712, 2, 0, 1),
+(NULL, '다투다', 14713, 2, 0, 1),
+(NULL, '단무지', 14714, 2, 0, 1),
+(NULL, '닫히다', 14715, 2, 0, 1),
+(NULL, '달하다', 14716, 2, 0, 1),
+(NULL, '닭갈비', 14717, 2, 0, 1),
+(NULL, '담뱃대', 14718, 2, 0, 1),
+(NULL, '당기다', 14719, 2, 0, 1),
+(NULL, '당아지', 14720, 2, 0, 1),
+(NULL, '닿소리', 14721, 2, 0, 1),
+(NULL, '대장간', 14722, 2, 0, 1),
+(NULL, '대쪽칼', 14723, 2, 0, 1),
+(NULL, '대포알', 14724, 2, 0, 1),
+(NULL, '댓조각', 14725, 2, 0, 1),
+(NULL, '더구나', 14726, 2, 0, 1),
+(NULL, '더그레', 14727, 2, 0, 1),
+(NULL, '더듬이', 14728, 2, 0, 1),
+(NULL, '더불어', 14729, 2, 0, 1),
+(NULL, '더블유', 14730, 2, 0, 1),
+(NULL, '더하기', 14731, 2, 0, 1),
+(NULL, '던지기', 14732, 2, 0, 1),
+(NULL, '던지다', 14733, 2, 0, 1),
+(NULL, '데이터', 14734, 2, 0, 1),
+(NULL, '데탕트', 14735, 2, 0, 1),
+(NULL, '도깨비', 14736, 2, 0, 1),
+(NULL, '도꾸이', 14737, 2, 0, 1),
+(NULL, '도둑질', 14738, 2, 0, 1),
+(NULL, '도라지', 14739, 2, 0, 1),
+(NULL, '도리어', 14740, 2, 0, 1),
+(NULL, '도미노', 14741, 2, 0, 1),
+(NULL, '도움말', 14742, 2, 0, 1),
+(NULL, '도파민', 14743, 2, 0, 1),
+(NULL, '독당근', 14744, 2, 0, 1),
+(NULL, '돋보기', 14745, 2, 0, 1),
+(NULL, '돌멩이', 14746, 2, 0, 1),
+(NULL, '돌잔치', 14747, 2, 0, 1),
+(NULL, '돌잡이', 14748, 2, 0, 1),
+(NULL, '돗자리', 14749, 2, 0, 1),
+(NULL, '동글다', 14750, 2, 0, 1),
+(NULL, '동아리', 14751, 2, 0, 1),
+(NULL, '되뇌다', 14752, 2, 0, 1),
+(NULL, '된장풀', 14753, 2, 0, 1),
+(NULL, '두더지', 14754, 2, 0, 1),
+(NULL, '두려움', 14755, 2, 0, 1),
+(NULL, '두렵다', 14756, 2, 0, 1),
+(NULL, '두루미', 14757, 2, 0, 1),
+(NULL, '두티다', 14758, 2, 0, 1),
+(NULL, '둥글다', 14759, 2, 0, 1),
+(NULL, '뒈지다', 14760, 2, 0, 1),
+(NULL, '뒤보다', 14761, 2, 0, 1),
+(NULL, '뒤섞다', 14762, 2, 0, 1),
+(NULL, '뒷다리', 14763, 2, 0, 1),
+(NULL, '드디어', 14764, 2, 0, 1),
+(NULL, '드라마', 14765, 2, 0, 1),
+(NULL, '드러냄', 14766, 2, 0, 1),
+(NULL, '드세다', 14767, 2, 0, 1),
+(NULL, '들국화', 14768, 2, 0, 1),
+(NULL, '들기름', 14769, 2, 0, 1),
+(NULL, '들치기', 14770, 2, 0, 1),
+(NULL, '듯싶다', 14771, 2, 0, 1),
+(NULL, '등굣길', 14772, 2, 0, 1),
+(NULL, '등받이', 14773, 2, 0, 1),
+(NULL, '디스켓', 14774, 2, 0, 1),
+(NULL, '디스코', 14775, 2, 0, 1),
+(NULL, '디제이', 14776, 2, 0, 1),
+(NULL, '따르다', 14777, 2, 0, 1),
+(NULL, '딸꾹질', 14778, 2, 0, 1),
+(NULL, '땅이름', 14779, 2, 0, 1),
+(NULL, '때늦다', 14780, 2, 0, 1),
+(NULL, '때때로', 14781, 2, 0, 1),
+(NULL, '떡붕어', 14782, 2, 0, 1),
+(NULL, '떨리다', 14783, 2, 0, 1),
+(NULL, '떼지어', 14784, 2, 0, 1),
+(NULL, '떼짓다', 14785, 2, 0, 1),
+(NULL, '똑똑이', 14786, 2, 0, 1),
+(NULL, '똘똘이', 14787, 2, 0, 1),
+(NULL, '똥구멍', 14788, 2, 0, 1),
+(NULL, '뚜쟁이', 14789, 2, 0, 1),
+(NULL, '뚫리다', 14790, 2, 0, 1),
+(NULL, '뜨겁다', 14791, 2, 0, 1),
+(NULL, '뜸하다', 14792, 2, 0, 1),
+(NULL, '뜻밖에', 14793, 2, 0, 1),
+(NULL, '띠걸이', 14794, 2, 0, 1),
+(NULL, '라볶이', 14795, 2, 0, 1),
+(NULL, '라이벌', 14796, 2, 0, 1),
+(NULL, '러브샷', 14797, 2, 0, 1),
+(NULL, '레이스', 14798, 2, 0, 1),
+(NULL, '리모넨', 14799, 2, 0, 1),
+(NULL, '리어카', 14800, 2, 0, 1),
+(NULL, '리포트', 14801, 2, 0, 1),
+(NULL, '마누라', 14802, 2, 0, 1),
+(NULL, '마름모', 14803, 2, 0, 1),
+(NULL, '마스다', 14804, 2, 0, 1),
+(NULL, '마우자', 14805, 2, 0, 1),
+(NULL, '마음씨', 14806, 2, 0, 1),
+(NULL, '마이크', 14807, 2, 0, 1),
+(NULL, '마침표', 14808, 2, 0, 1),
+(NULL, '마파람', 14809, 2, 0, 1),
+(NULL, '막걸리', 14810, 2, 0, 1),
+(NULL, '만두국', 14811, 2, 0, 1),
+(NULL, '만들다', 14812, 2, 0, 1),
+(NULL, '만지다', 14813, 2, 0, 1),
+(NULL, '맏아들', 14814, 2, 0, 1),
+(NULL, '말갛다', 14815, 2, 0, 1),
+(NULL, '말다툼', 14816, 2, 0, 1),
+(NULL, '말레이', 14817, 2, 0, 1),
+(NULL, '말뭉치', 14818, 2, 0, 1),
+(NULL, '말하기', 14819, 2, 0, 1),
+(NULL, '맛보다', 14820, 2, 0, 1),
+(NULL, '맞벌이', 14821, 2, 0, 1),
+(NULL, '맞춤법', 14822, 2, 0, 1),
+(NULL, '맡기다', 14823, 2, 0, 1),
+(NULL, '매달다', 14824, 2, 0, 1),
+(NULL, '맹꽁이', 14825, 2, 0, 1),
+(NULL, '머리말', 14826, 2, 0, 1),
+(NULL, '머릿결', 14827, 2, 0, 1),
+(NULL, '머시마', 14828, 2, 0, 1),
+(NULL, '먹거리', 14829, 2, 0, 1),
+(NULL, '먹킹이', 14830, 2, 0, 1),
+(NULL, '먹황새', 14831, 2, 0, 1),
+(NULL, '먹히다', 14832, 2, 0, 1),
+(NULL, '먼데기', 14833, 2, 0, 1),
+(NULL, '멈추다', 14834, 2, 0, 1),
+(NULL, '멋지다', 14835, 2, 0, 1),
+(NULL, '멍멍이', 14836, 2, 0, 1),
+(NULL, '메노라', 14837, 2, 0, 1),
+(NULL, '메뚜기', 14838, 2, 0, 1),
+(NULL, '메시아', 14839, 2, 0, 1),
+(NULL, '메이스', 14840, 2, 0, 1),
+(NULL, '메토끼', 14841, 2, 0, 1),
+(NULL, '멜라닌', 14842, 2, 0, 1),
+(NULL, '멧돼지', 14843, 2, 0, 1),
+(NULL, '멧박쥐', 14844, 2, 0, 1),
+(NULL, '멧밭쥐', 14845, 2, 0, 1),
+(NULL, '면밀히', 14846, 2, 0, 1),
+(NULL, '모샘치', 14847, 2, 0, 1),
+(NULL, '모서리', 14848, 2, 0, 1),
+(NULL, '모시다', 14849, 2, 0, 1),
+(NULL, '모오케', 14850, 2, 0, 1),
+(NULL, '모으다', 14851, 2, 0, 1),
+(NULL, '모이다', 14852, 2, 0, 1),
+(NULL, '모지리', 14853, 2, 0, 1),
+(NULL, '목도리', 14854, 2, 0, 1),
+(NULL, '목란꽃', 14855, 2, 0, 1),
+(NULL, '목사님', 14856, 2, 0, 1),
+(NULL, '목슈권', 14857, 2, 0, 1),
+(NULL, '몸가짐', 14858, 2, 0, 1),
+(NULL, '몽둥이', 14859, 2, 0, 1),
+(NULL, '무더기', 14860, 2, 0, 1),
+(NULL, '무덥다', 14861, 2, 0, 1),
+(NULL, '무릎께', 14862, 2, 0, 1),
+(NULL, '묵묵히', 14863, 2, 0, 1),
+(NULL, '문둥병', 14864, 2, 0, 1),
+(NULL, '묻히다', 14865, 2, 0, 1),
+(NULL, '물냉이', 14866, 2, 0, 1),
+(NULL, '물돼지', 14867, 2, 0, 1),
+(NULL, '물떼새', 14868, 2, 0, 1),
+(NULL, '물리다', 14869, 2, 0, 1),
+(NULL, '물수리', 14870, 2, 0, 1),
+(NULL, '미국놈', 14871, 2, 0, 1),
+(NULL, '미덥다', 14872, 2, 0, 1),
+(NULL, '미루다', 14873, 2, 0, 1),
+(NULL, '미리지', 14874, 2, 0, 1),
+(NULL, '미분몫', 14875, 2, 0, 1),
+(NULL, '미스터', 14876, 2, 0, 1),
+(NULL, '미친놈', 14877, 2, 0, 1),
+(NULL, '민소매', 14878, 2, 0, 1),
+(NULL, '밀리다', 14879, 2, 0, 1),
+(NULL, '바깥쪽', 14880, 2, 0, 1),
+(NULL, '바뀌다', 14881, 2, 0, 1),
+(NULL, '바둑판', 14882, 2, 0, 1),
+(NULL, '바른손', 14883, 2, 0, 1),
+(NULL, '바뿌다', 14884, 2, 0, 1),
+(NULL, '바수다', 14885, 2, 0, 1),
+(NULL, '바이스', 14886, 2, 0, 1),
+(NULL, '바자회', 14887, 2, 0, 1),
+(NULL, '박히다', 14888, 2, 0, 1),
+(NULL, '반기다', 14889, 2, 0, 1),
+(NULL, '반딧불', 14890, 2, 0, 1),
+(NULL, '반올림', 14891, 2, 0, 1),
+(NULL, '받치다', 14892, 2, 0, 1),
+(NULL, '받히다', 14893, 2, 0, 1),
+(NULL, '발소리', 14894, 2, 0, 1),
+(NULL, '발연기', 14895, 2, 0, 1),
+(NULL, '발자국', 14896, 2, 0, 1),
+(NULL, '밝을녘', 14897, 2, 0, 1),
+(NULL, '밤공기', 14898, 2, 0, 1),
+(NULL, '밤늦다', 14899, 2, 0, 1),
+(NULL, '밤바다', 14900, 2, 0, 1),
+(NULL, '밤새다', 14901, 2, 0, 1),
+(NULL, '밤송이', 14902, 2, 0, 1),
+(NULL, '밥구멍', 14903, 2, 0, 1),
+(NULL, '방망이', 14904, 2, 0, 1),
+(NULL, '배우다', 14905, 2, 0, 1),
+(NULL, '뱃놀이', 14906, 2, 0, 1),
+(NULL, '뱃사람', 14907, 2, 0, 1),
+(NULL, '버리다', 14908, 2, 0, 1),
+(NULL, '버티다', 14909, 2, 0, 1),
+(NULL, '벌리다', 14910, 2, 0, 1),
+(NULL, '범고래', 14911, 2, 0, 1),
+(NULL, '벙어리', 14912, 2, 0, 1),
+(NULL, '베드신', 14913, 2, 0, 1),
+(NULL, '베어링', 14914, 2, 0, 1),
+(NULL, '베이비', 14915, 2, 0, 1),
+(NULL, '베짱이', 14916, 2, 0, 1),
+(NULL, '베테랑', 14917, 2, 0, 1),
+(NULL, '베토벤', 14918, 2, 0, 1),
+(NULL, '벤질기', 14919, 2, 0, 1),
+(NULL, '벽치기', 14920, 2, 0, 1),
+(NULL, '병들다', 14921, 2, 0, 1),
+(NULL, '보라색', 14922, 2, 0, 1),
+(NULL, '보르시', 14923, 2, 0, 1),
+(NULL, '보숭이', 14924, 2, 0, 1),
+(NULL, '볼메다', 14925, 2, 0, 1),
+(NULL, '봄날씨', 14926, 2, 0, 1),
+(NULL, '부딪다', 14927, 2, 0, 1),
+(NULL, '부르심', 14928, 2, 0, 1),
+(NULL, '부수다', 14929, 2, 0, 1),
+(NULL, '부엉이', 14930, 2, 0, 1),
+(NULL, '부잣집', 14931, 2, 0, 1),
+(NULL, '북마크', 14932, 2, 0, 1),
+(NULL, '불바다', 14933, 2, 0, 1),
+(NULL, '불쌍히', 14934, 2, 0, 1),
+(NULL, '붕어빵', 14935, 2, 0, 1),
+(NULL, '브로커', 14936, 2, 0, 1),
+(NULL, '블랙잭', 14937, 2, 0, 1),
+(NULL, '블랙홀', 14938, 2, 0, 1),
+(NULL, '블루길', 14939, 2, 0, 1),
+(NULL, '비구름', 14940, 2, 0, 1),
+(NULL, '비단옷', 14941, 2, 0, 1),
+(NULL, '비둘기', 14942, 2, 0, 1),
+(NULL, '비린내', 14943, 2, 0, 1),
+(NULL, '비오리', 14944, 2, 0, 1),
+(NULL, '비추다', 14945, 2, 0, 1),
+(NULL, '빈지문', 14946, 2, 0, 1),
+(NULL, '빗장뼈', 14947, 2, 0, 1),
+(NULL, '빚음감', 14948, 2, 0, 1),
+(NULL, '빠구리', 14949, 2, 0, 1),
+(NULL, '빨갛다', 14950, 2, 0, 1),
+(NULL, '빨랫줄', 14951, 2, 0, 1),
+(NULL, '빨찌산', 14952, 2, 0, 1),
+(NULL, '빼닫이', 14953, 2, 0, 1),
+(NULL, '뺑소니', 14954, 2, 0, 1),
+(NULL, '뻐꾸기', 14955, 2, 0, 1),
+(NULL, '뼈마디', 14956, 2, 0, 1),
+(NULL, '뽀얗다', 14957, 2, 0, 1),
+(NULL, '뽐내다', 14958, 2, 0, 1),
+(NULL, '뽕쟁이', 14959, 2, 0, 1),
+(NULL, '뿌옇다', 14960, 2, 0, 1),
+(NULL, '뿔피리', 14961, 2, 0, 1),
+(NULL, '사기꾼', 14962, 2, 0, 1),
+(NULL, '사내종', 14963, 2, 0, 1),
+(NULL, '사냥감', 14964, 2, 0, 1),
+(NULL, '사다새', 14965, 2, 0, 1),
+(NULL, '사람들', 14966, 2, 0, 1),
+(NULL, '사랍다', 14967, 2, 0, 1),
+(NULL, '사랑채', 14968, 2, 0, 1),
+(NULL, '사립문', 14969, 2, 0, 1),
+(NULL, '사모님', 14970, 2, 0, 1),
+(NULL, '사무직', 14971, 2, 0, 1),
+(NULL, '사바귀', 14972, 2, 0, 1),
+(NULL, '사바사', 14973, 2, 0, 1),
+(NULL, '사이트', 14974, 2, 0, 1),
+(NULL, '사이펀', 14975, 2, 0, 1),
+(NULL, '사쿠라', 14976, 2, 0, 1),
+(NULL, '사향쥐', 14977, 2, 0, 1),
+(NULL, '살림집', 14978, 2, 0, 1),
+(NULL, '살무사', 14979, 2, 0, 1),
+(NULL, '살지다', 14980, 2, 0, 1),
+(NULL, '살포시', 14981, 2, 0, 1),
+(NULL, '살푸시', 14982, 2, 0, 1),
+(NULL, '삼나무', 14983, 2, 0, 1),
+(NULL, '상추쌈', 14984, 2, 0, 1),
+(NULL, '새끼새', 14985, 2, 0, 1),
+(NULL, '생김새', 14986, 2, 0, 1),
+(NULL, '생머리', 14987, 2, 0, 1),
+(NULL, '서비스', 14988, 2, 0, 1),
+(NULL, '섞이다', 14989, 2, 0, 1),
+(NULL, '선그림', 14990, 2, 0, 1),
+(NULL, '세이브', 14991, 2, 0, 1),
+(NULL, '소나기', 14992, 2, 0, 1),
+(NULL, '소나무', 14993, 2, 0, 1),
+(NULL, '소나타', 14994, 2, 0, 1),
+(NULL, '속삭임', 14995, 2, 0, 1),
+(NULL, '속쓰림', 14996, 2, 0, 1),
+(NULL, '손가락', 14997, 2, 0, 1),
+(NULL, '손수건', 14998, 2, 0, 1),
+(NULL, '손수레', 14999, 2, 0, 1),
+(NULL, '손전등', 15000, 2, 0, 1),
+(NULL, '솔바람', 15001, 2, 0, 1),
+(NULL, '송나라', 15002, 2, 0, 1),
+(NULL, '송사리', 15003, 2, 0, 1),
+(NULL, '쇠기름', 15004, 2, 0, 1),
+(NULL, '쇠백로', 15005, 2, 0, 1),
+(NULL, '쇠붙이', 15006, 2, 0, 1),
+(NULL, '쇠오리', 15007, 2, 0, 1),
+(NULL, '쇠주걱', 15008, 2, 0, 1),
+(NULL, '쇼윈도', 15009, 2, 0, 1),
+(NULL, '수루매', 15010, 2, 0, 1),
+(NULL, '수많다', 15011, 2, 0, 1),
+(NULL, '수세미', 15012, 2, 0, 1),
+(NULL, '숙이다', 15013, 2, 0, 1),
+(NULL, '순두부', 15014, 2, 0, 1),
+(NULL, '술자리', 15015, 2, 0, 1),
+(NULL, '숨기다', 15016, 2, 0, 1),
+(NULL, '숨소리', 15017, 2, 0, 1),
+(NULL, '숨차다', 15018, 2, 0, 1),
+(NULL, '쉽사리', 15019, 2, 0, 1),
+(NULL, '스께또', 15020, 2, 0, 1),
+(NULL, '스무날', 15021, 2, 0, 1),
+(NULL, '스스이', 15022, 2, 0, 1),
+(NULL, '스치다', 15023, 2, 0, 1),
+(NULL, '스카프', 15024, 2, 0, 1),
+(NULL, '스플뎀', 15025, 2, 0, 1),
+(NULL, '스피드', 15026, 2, 0, 1),
+(NULL, '스피커', 15027, 2, 0, 1),
+(NULL, '슬라브', 15028, 2, 0, 1),
+(NULL, '슬래시', 15029, 2, 0, 1),
+(NULL, '슬픔증', 15030, 2, 0, 1),
+(NULL, '시골길', 15031, 2, 0, 1),
+(NULL, '시퀀스', 15032, 2, 0, 1),
+(NULL, '시키다', 15033, 2, 0, 1),
+(NULL, '시푸다', 15034, 2, 0, 1),
+(NULL, '신놀린', 15035, 2, 0, 1),
+(NULL, '신발끈', 15036, 2, 0, 1),
+(NULL, '실로폰', 15037, 2, 0, 1),
+(NULL, '실리콘', 15038, 2, 0, 1),
+(NULL, '심마니', 15039, 2, 0, 1),
+(NULL, '싸우다', 15040, 2, 0, 1),
+(NULL, '쌀국수', 15041, 2, 0, 1),
+(NULL, '쌍꺼풀', 15042, 2, 0, 1),
+(NULL, '쌍시옷', 15043, 2, 0, 1),
+(NULL, '쓰레기', 15044, 2, 0, 1),
+(NULL, '쓰이다', 15045, 2, 0, 1),
+(NULL, '씌우기', 15046, 2, 0, 1),
+(NULL, '씹조개', 15047, 2, 0, 1),
+(NULL, '씹하다', 15048, 2, 0, 1),
+(NULL, '아기미', 15049, 2, 0, 1),
+(NULL, '아깝다', 15050, 2, 0, 1),
+(NULL, '아니다', 15051, 2, 0, 1),
+(NULL, '아니면', 15052, 2, 0, 1),
+(NULL, '아듬다', 15053, 2, 0, 1),
+(NULL, '아무것', 15054, 2, 0, 1),
+(NULL, '아무런', 15055, 2, 0, 1),
+(NULL, '아무리', 15056, 2, 0, 1),
+(NULL, '아물다', 15057, 2, 0, 1),
+(NULL, '아미노', 15058, 2, 0, 1),
+(NULL, '아미딘', 15059, 2, 0, 1),
+(NULL, '아바니', 15060, 2, 0, 1),
+(NULL, '아쉬움', 15061, 2, 0, 1),
+(NULL, '아실기', 15062, 2, 0, 1),
+(NULL, '아울러', 15063, 2, 0, 1),
+(NULL, '아이스', 15064, 2, 0, 1),
+(NULL, '아재비', 15065, 2, 0, 1),
+(NULL, '아줄렌', 15066, 2, 0, 1),
+(NULL, '아즈텍', 15067, 2, 0, 1),
+(NULL, '아지트', 15068, 2, 0, 1),
+(NULL, '아직도', 15069, 2, 0, 1),
+(NULL, '아첨꾼', 15070, 2, 0, 1),
+(NULL, '아프다', 15071, 2, 0, 1),
+(NULL, '악티늄', 15072, 2, 0, 1),
+(NULL, '안경집', 15073, 2, 0, 1),
+(NULL, '안사람', 15074, 2, 0, 1),
+(NULL, '안초비', 15075, 2, 0, 1),
+(NULL, '알거지', 15076, 2, 0, 1),
+(NULL, '알리다', 15077, 2, 0, 1),
+(NULL, '알릴기', 15078, 2, 0, 1),
+(NULL, '알맞다', 15079, 2, 0, 1),
+(NULL, '알배추', 15080, 2, 0, 1),
+(NULL, '알부민', 15081, 2, 0, 1),
+(NULL, '알코올', 15082, 2, 0, 1),
+(NULL, '앙이다', 15083, 2, 0, 1),
+(NULL, '앞마당', 15084, 2, 0, 1),
+(NULL, '앞머리', 15085, 2, 0, 1),
+(NULL, '앞으로', 15086, 2, 0, 1),
+(NULL, '애젊다', 15087, 2, 0, 1),
+(NULL, '애호박', 15088, 2, 0, 1),
+(NULL, '양동이', 15089, 2, 0, 1),
+(NULL, '양로쵈', 15090, 2, 0, 1),
+(NULL, '양배추', 15091, 2, 0, 1),
+(NULL, '양치기', 15092, 2, 0, 1),
+(NULL, '양탄자', 15093, 2, 0, 1),
+(NULL, '얕잡다', 15094, 2, 0, 1),
+(NULL, '어두움', 15095, 2, 0, 1),
+(NULL, '어둡다', 15096, 2, 0, 1),
+(NULL, '어떻다', 15097, 2, 0, 1),
+(NULL, '어르신', 15098, 2, 0, 1),
+(NULL, '어리광', 15099, 2, 0, 1),
+(NULL, '어버이', 15100, 2, 0, 1),
+(NULL, '어스름', 15101, 2, 0, 1),
+(NULL, '어질다', 15102, 2, 0, 1),
+(NULL, '어쩌면', 15103, 2, 0, 1),
+(NULL, '어찌씨', 15104, 2, 0, 1),
+(NULL, '어휘소', 15105, 2, 0, 1),
+(NULL, '억수로', 15106, 2, 0, 1),
+(NULL, '언제나', 15107, 2, 0, 1),
+(NULL, '언젠가', 15108, 2, 0, 1),
+(NULL, '얼굴빛', 15109, 2, 0, 1),
+(NULL, '얼음차', 15110, 2, 0, 1),
+(NULL, '업진살', 15111, 2, 0, 1),
+(NULL, '없애다', 15112, 2, 0, 1),
+(NULL, '엉터리', 15113, 2, 0, 1),
+(NULL, '에스터', 15114, 2, 0, 1),
+(NULL, '에테르', 15115, 2, 0, 1),
+(NULL, '여드름', 15116, 2, 0, 1),
+(NULL, '여러분', 15117, 2, 0, 1),
+(NULL, '여름밤', 15118, 2, 0, 1),
+(NULL, '여름비', 15119, 2, 0, 1),
+(NULL, '여름새', 15120, 2, 0, 1),
+(NULL, '여름철', 15121, 2, 0, 1),
+(NULL, '여미다', 15122, 2, 0, 1),
+(NULL, '여사친', 15123, 2, 0, 1),
+(NULL, '연달다', 15124, 2, 0, 1),
+(NULL, '엳아홉', 15125, 2, 0, 1),
+(NULL, '엿듣다', 15126, 2, 0, 1),
+(NULL, '엿보다', 15127, 2, 0, 1),
+(NULL, '예닐곱', 15128, 2, 0, 1),
+(NULL, '예수회', 15129, 2, 0, 1),
+(NULL, '예컨대', 15130, 2, 0, 1),
+(NULL, '오가다', 15131, 2, 0, 1),
+(NULL, '오늘날', 15132, 2, 0, 1),
+(NULL, '오라비', 15133, 2, 0, 1),
+(NULL, '오래비', 15134, 2, 0, 1),
+(NULL, '오로지', 15135, 2, 0, 1),
+(NULL, '오사존', 15136, 2, 0, 1),
+(NULL, '오소리', 15137, 2, 0, 1),
+(NULL, '오솔길', 15138, 2, 0, 1),
+(NULL, '오스뮴', 15139, 2, 0, 1),
+(NULL, '오스틴', 15140, 2, 0, 1),
+(NULL, '오징어', 15141, 2, 0, 1),
+(NULL, '오히려', 15142, 2, 0, 1),
+(NULL, '옥사졸', 15143, 2, 0, 1),
+(NULL, '옥수수', 15144, 2, 0, 1),
+(NULL, '옥시기', 15145, 2, 0, 1),
+(NULL, '온쉼표', 15146, 2, 0, 1),
+(NULL, '온음표', 15147, 2, 0, 1),
+(NULL, '올가미', 15148, 2, 0, 1),
+(NULL, '올겨울', 15149, 2, 0, 1),
+(NULL, '올림픽', 15150, 2, 0, 1),
+(NULL, '올여름', 15151, 2, 0, 1),
+(NULL, '옷차림', 15152, 2, 0, 1),
+(NULL, '와이프', 15153, 2, 0, 1),
+(NULL, '완곡한', 15154, 2, 0, 1),
+(NULL, '왜가리', 15155, 2, 0, 1),
+(NULL, '왜간장', 15156, 2, 0, 1),
+(NULL, '외동딸', 15157, 2, 0, 1),
+(NULL, '외로움', 15158, 2, 0, 1),
+(NULL, '외아들', 15159, 2, 0, 1),
+(NULL, '요오드', 15160, 2, 0, 1),
+(NULL, '요즈음', 15161, 2, 0, 1),
+(NULL, '우리말', 15162, 2, 0, 1),
+(NULL, '우워치', 15163, 2, 0, 1),
+(NULL, '울리짜', 15164, 2, 0, 1),
+(NULL, '울음보', 15165, 2, 0, 1),
+(NULL, '울타리', 15166, 2, 0, 1),
+(NULL, '움직씨', 15167, 2, 0, 1),
+(NULL, '움직임', 15168, 2, 0, 1),
+(NULL, '웃음보', 15169, 2, 0, 1),
+(NULL, '웃프다', 15170, 2, 0, 1),
+(NULL, '원숭이', 15171, 2, 0, 1),
+(NULL, '으뜸패', 15172, 2, 0, 1),
+(NULL, '응하다', 15173, 2, 0, 1),
+(NULL, '이끌다', 15174, 2, 0, 1),
+(NULL, '이듬해', 15175, 2, 0, 1),
+(NULL, '이렇게', 15176, 2, 0, 1),
+(NULL, '이렇다', 15177, 2, 0, 1),
+(NULL, '이롭다', 15178, 2, 0, 1),
+(NULL, '이름씨', 15179, 2, 0, 1),
+(NULL, '이상한', 15180, 2, 0, 1),
+(NULL, '이웃집', 15181, 2, 0, 1),
+(NULL, '이크라', 15182, 2, 0, 1),
+(NULL, '인기척', 15183, 2, 0, 1),
+(NULL, '인스타', 15184, 2, 0, 1),
+(NULL, '일없다', 15185, 2, 0, 1),
+(NULL, '입력기', 15186, 2, 0, 1),
+(NULL, '입빠이', 15187, 2, 0, 1),
+(NULL, '입천장', 15188, 2, 0, 1),
+(NULL, '자물쇠', 15189, 2, 0, 1),
+(NULL, '자벌레', 15190, 2, 0, 1),
+(NULL, '자시다', 15191, 2, 0, 1),
+(NULL, '자양거', 15192, 2, 0, 1),
+(NULL, '자장면', 15193, 2, 0, 1),
+(NULL, '잔나비', 15194, 2, 0, 1),
+(NULL, '잔디밭', 15195, 2, 0, 1),
+(NULL, '잔칫집', 15196, 2, 0, 1),
+(NULL, '잗갈다', 15197, 2, 0, 1),
+(NULL, '잘리다', 15198, 2, 0, 1),
+(NULL, '잘잘못', 15199, 2, 0, 1),
+(NULL, '잣나무', 15200, 2, 0, 1),
+(NULL, '장난감', 15201, 2, 0, 1),
+(NULL, '재규어', 15202, 2, 0, 1),
+(NULL, '쟁기질', 15203, 2, 0, 1),
+(NULL, '저렇게', 15204, 2, 0, 1),
+(NULL, '적어도', 15205, 2, 0, 1),
+(NULL, '전나무', 15206, 2, 0, 1),
+(NULL, '전장터', 15207, 2, 0, 1),
+(NULL, '절이다', 15208, 2, 0, 1),
+(NULL, '점쟁이', 15209, 2, 0, 1),
+(NULL, '젓가락', 15210, 2, 0, 1),
+(NULL, '정강이', 15211, 2, 0, 1),
+(NULL, '정겹다', 15212, 2, 0, 1),
+(NULL, '정답다', 15213, 2, 0, 1),
+(NULL, '정치판', 15214, 2, 0, 1),
+(NULL, '제곱근', 15215, 2, 0, 1),
+(NULL, '제트기', 15216, 2, 0, 1),
+(NULL, '조갯살', 15217, 2, 0, 1),
+(NULL, '조금씩', 15218, 2, 0, 1),
+(NULL, '조롱이', 15219, 2, 0, 1),
+(NULL, '조약돌', 15220, 2, 0, 1),
+(NULL, '조용히', 15221, 2, 0, 1),
+(NULL, '족집게', 15222, 2, 0, 1),
+(NULL, '존맛탱', 15223, 2, 0, 1),
+(NULL, '종다리', 15224, 2, 0, 1),
+(NULL, '종달새', 15225, 2, 0, 1),
+(NULL, '종아리', 15226, 2, 0, 1),
+(NULL, '좆문가', 15227, 2, 0, 1),
+(NULL, '주사위', 15228, 2, 0, 1),
+(NULL, '주정꾼', 15229, 2, 0, 1),
+(NULL, '줄넘기', 15230, 2, 0, 1),
+(NULL, '중국집', 15231, 2, 0, 1),
+(NULL, '중에서', 15232, 2, 0, 1),
+(NULL, '쥐창시', 15233, 2, 0, 1),
+(NULL, '즐겁다', 15234, 2, 0, 1),
+(NULL, '지겹다', 15235, 2, 0, 1),
+(NULL, '지난달', 15236, 2, 0, 1),
+(NULL, '지난주', 15237, 2, 0, 1),
+(NULL, '지니다', 15238, 2, 0, 1),
+(NULL, '지우개', 15239, 2, 0, 1),
+(NULL, '지은이', 15240, 2, 0, 1),
+(NULL, '진드기', 15241, 2, 0, 1),
+(NULL, '진뗑이', 15242, 2, 0, 1),
+(NULL, '집난이', 15243, 2, 0, 1),
+(NULL, '집사람', 15244, 2, 0, 1),
+(NULL, '징거미', 15245, 2, 0, 1),
+(NULL, '짚티미', 15246, 2, 0, 1),
+(NULL, '짜구배', 15247, 2, 0, 1),
+(NULL, '짝짓기', 15248, 2, 0, 1),
+(NULL, '째비다', 15249, 2, 0, 1),
+(NULL, '쫓기다', 15250, 2, 0, 1),
+(NULL, '찌꺼기', 15251, 2, 0, 1),
+(NULL, '찌르다', 15252, 2, 0, 1),
+(NULL, '찔리다', 15253, 2, 0, 1),
+(NULL, '차갑다', 15254, 2, 0, 1),
+(NULL, '차라리', 15255, 2, 0, 1),
+(NULL, '차리차', 15256, 2, 0, 1),
+(NULL, '차분몫', 15257, 2, 0, 1),
+(NULL, '참고래', 15258, 2, 0, 1),
+(NULL, '참으로', 15259, 2, 0, 1),
+(NULL, '참을성', 15260, 2, 0, 1),
+(NULL, '찹쌀떡', 15261, 2, 0, 1),
+(NULL, '찹쌀풀', 15262, 2, 0, 1),
+(NULL, '채소밭', 15263, 2, 0, 1),
+(NULL, '책가방', 15264, 2, 0, 1),
+(NULL, '책받침', 15265, 2, 0, 1),
+(NULL, '처넣다', 15266, 2, 0, 1),
+(NULL, '처먹다', 15267, 2, 0, 1),
+(NULL, '철저히', 15268, 2, 0, 1),
+(NULL, '청회색', 15269, 2, 0, 1),
+(NULL, '초밥풀', 15270, 2, 0, 1),
+(NULL, '초승달', 15271, 2, 0, 1),
+(NULL, '추리닝', 15272, 2, 0, 1),
+(NULL, '축이다', 15273, 2, 0, 1),
+(NULL, '치우다', 15274, 2, 0, 1),
+(NULL, '치커리', 15275, 2, 0, 1),
+(NULL, '친위대', 15276, 2, 0, 1),
+(NULL, '친하다', 15277, 2, 0, 1),
+(NULL, '카르마', 15278, 2, 0, 1),
+(NULL, '카바졸', 15279, 2, 0, 1),
+(NULL, '칸델라', 15280, 2, 0, 1),
+(NULL, '칼국수', 15281, 2, 0, 1),
+(NULL, '캠핑족', 15282, 2, 0, 1),
+(NULL, '커브볼', 15283, 2, 0, 1),
+(NULL, '커프스', 15284, 2, 0, 1),
+(NULL, '커플티', 15285, 2, 0, 1),
+(NULL, '커피숍', 15286, 2, 0, 1),
+(NULL, '켜지다', 15287, 2, 0, 1),
+(NULL, '코끼리', 15288, 2, 0, 1),
+(NULL, '코너킥', 15289, 2, 0, 1),
+(NULL, '코발트', 15290, 2, 0, 1),
+(NULL, '코코넛', 15291, 2, 0, 1),
+(NULL, '코퓰러', 15292, 2, 0, 1),
+(NULL, '콘센트', 15293, 2, 0, 1),
+(NULL, '콘텐츠', 15294, 2, 0, 1),
+(NULL, '콜레라', 15295, 2, 0, 1),
+(NULL, '콤포트', 15296, 2, 0, 1),
+(NULL, '콧수염', 15297, 2, 0, 1),
+(NULL, '콧잔등', 15298, 2, 0, 1),
+(NULL, '쾌하다', 15299, 2, 0, 1),
+(NULL, '퀴놀린', 15300, 2, 0, 1),
+(NULL, '크레송', 15301, 2, 0, 1),
+(NULL, '크렘린', 15302, 2, 0, 1),
+(NULL, '크립톤', 15303, 2, 0, 1),
+(NULL, '크산텐', 15304, 2, 0, 1),
+(NULL, '큰고니', 15305, 2, 0, 1),
+(NULL, '큰아들', 15306, 2, 0, 1),
+(NULL, '큰첨서', 15307, 2, 0, 1),
+(NULL, '클락션', 15308, 2, 0, 1),
+(NULL, '클로버', 15309, 2, 0, 1),
+(NULL, '타나크', 15310, 2, 0, 1),
+(NULL, '타피르', 15311, 2, 0, 1),
+(NULL, '태곳적', 15312, 2, 0, 1),
+(NULL, '테스트', 15313, 2, 0, 1),
+(NULL, '테이퍼', 15314, 2, 0, 1),
+(NULL, '텔레비', 15315, 2, 0, 1),
+(NULL, '통가리', 15316, 2, 0, 1),
+(NULL, '통조림', 15317, 2, 0, 1),
+(NULL, '투기꾼', 15318, 2, 0, 1),
+(NULL, '툭툭이', 15319, 2, 0, 1),
+(NULL, '튕기다', 15320, 2, 0, 1),
+(NULL, '트럼프', 15321, 2, 0, 1),
+(NULL, '트렁크', 15322, 2, 0, 1),
+(NULL, '트력제', 15323, 2, 0, 1),
+(NULL, '튼튼히', 15324, 2, 0, 1),
+(NULL, '틀딱충', 15325, 2, 0, 1),
+(NULL, '티아졸', 15326, 2, 0, 1),
+(NULL, '티아진', 15327, 2, 0, 1),
+(NULL, '티오펜', 15328, 2, 0, 1),
+(NULL, '파김치', 15329, 2, 0, 1),
+(NULL, '파랑새', 15330, 2, 0, 1),
+(NULL, '파이프', 15331, 2, 0, 1),
+(NULL, '판치라', 15332, 2, 0, 1),
+(NULL, '퍼지다', 15333, 2, 0, 1),
+(NULL, '페나진', 15334, 2, 0, 1),
+(NULL, '페닐기', 15335, 2, 0, 1),
+(NULL, '페스트', 15336, 2, 0, 1),
+(NULL, '페치카', 15337, 2, 0, 1),
+(NULL, '펴내다', 15338, 2, 0, 1),
+(NULL, '편찮다', 15339, 2, 0, 1),
+(NULL, '포도시', 15340, 2, 0, 1),
+(NULL, '포르핀', 15341, 2, 0, 1),
+(NULL, '포인트', 15342, 2, 0, 1),
+(NULL, '포크볼', 15343, 2, 0, 1),
+(NULL, '폭넓다', 15344, 2, 0, 1),
+(NULL, '푸성귀', 15345, 2, 0, 1),
+(NULL, '풀리다', 15346, 2, 0, 1),
+(NULL, '풀버전', 15347, 2, 0, 1),
+(NULL, '풀파워', 15348, 2, 0, 1),
+(NULL, '퓨라잔', 15349, 2, 0, 1),
+(NULL, '프테린', 15350, 2, 0, 1),
+(NULL, '플러쉬', 15351, 2, 0, 1),
+(NULL, '플러스', 15352, 2, 0, 1),
+(NULL, '피라미', 15353, 2, 0, 1),
+(NULL, '피라졸', 15354, 2, 0, 1),
+(NULL, '피라진', 15355, 2, 0, 1),
+(NULL, '피리딘', 15356, 2, 0, 1),
+(NULL, '필롭다', 15357, 2, 0, 1),
+(NULL, '핏덩이', 15358, 2, 0, 1),
+(NULL, '하굣길', 15359, 2, 0, 1),
+(NULL, '하나또', 15360, 2, 0, 1),
+(NULL, '하낱도', 15361, 2, 0, 1),
+(NULL, '하룻밤', 15362, 2, 0, 1),
+(NULL, '하지만', 15363, 2, 0, 1),
+(NULL, '한마디', 15364, 2, 0, 1),
+(NULL, '한밤중', 15365, 2, 0, 1),
+(NULL, '한복판', 15366, 2, 0, 1),
+(NULL, '한센병', 15367, 2, 0, 1),
+(NULL, '한식집', 15368, 2, 0, 1),
+(NULL, '할라카', 15369, 2, 0, 1),
+(NULL, '핫도그', 15370, 2, 0, 1),
+(NULL, '핫아비', 15371, 2, 0, 1),
+(NULL, '핫어미', 15372, 2, 0, 1),
+(NULL, '해넘이', 15373, 2, 0, 1),
+(NULL, '해마다', 15374, 2, 0, 1),
+(NULL, '해질녘', 15375, 2, 0, 1),
+(NULL, '허물다', 15376, 2, 0, 1),
+(NULL, '허우대', 15377, 2, 0, 1),
+(NULL, '허투루', 15378, 2, 0, 1),
+(NULL, '헛걸음', 15379, 2, 0, 1),
+(NULL, '헤집다', 15380, 2, 0, 1),
+(NULL, '협잡질', 15381, 2, 0, 1),
+(NULL, '호리다', 15382, 2, 0, 1),
+(NULL, '호숫가', 15383, 2, 0, 1),
+(NULL, '혹고니', 15384, 2, 0, 1),
+(NULL, '홈페지', 15385, 2, 0, 1),
+(NULL, '홍여새', 15386, 2, 0, 1),
+(NULL, '화내다', 15387, 2, 0, 1),
+(NULL, '화살표', 15388, 2, 0, 1),
+(NULL, '화이트', 15389, 2, 0, 1),
+(NULL, '활쓰기', 15390, 2, 0, 1),
+(NULL, '휘파람', 15391, 2, 0, 1),
+(NULL, '흐르다', 15392, 2, 0, 1),
+(NULL, '흑고니', 15393, 2, 0, 1),
+(NULL, '흙냄새', 15394, 2, 0, 1),
+(NULL, '흙더미', 15395, 2, 0, 1),
+(NULL, '흙먼지', 15396, 2, 0, 1),
+(NULL, '흠잡다', 15397, 2, 0, 1),
+(NULL, '흩날다', 15398, 2, 0, 1),
+(NULL, '흰개미', 15399, 2, 0, 1),
+(NULL, '흰고래', 15400, 2, 0, 1),
+(NULL, '흰죽지', 15401, 2, 0, 1),
+(NULL, '히어로', 15402, 2, 0, 1),
+(NULL, '힘들다', 15403, 2, 0, 1),
+(NULL, '힘없다', 15404, 2, 0, 1),
+(NULL, '-뜨리다', 15405, 2, 0, 1),
+(NULL, '注視하다', 15406, 2, 0, 1),
+(NULL, '가꾸가다', 15407, 2, 0, 1),
+(NULL, '가다붙다', 15408, 2, 0, 1),
+(NULL, '가로쓰기', 15409, 2, 0, 1),
+(NULL, '가로지다', 15410, 2, 0, 1),
+(NULL, '가로채다', 15411, 2, 0, 1),
+(NULL, '가마우지', 15412, 2, 0, 1),
+(NULL, '가소롭다', 15413, 2, 0, 1),
+(NULL, '가스나이', 15414, 2, 0, 1),
+(NULL, '가창오리', 15415, 2, 0, 1),
+(NULL, '간추리다', 15416, 2, 0, 1),
+(NULL, '갈아대다', 15417, 2, 0, 1),
+(NULL, '갈아들다', 15418, 2, 0, 1),
+(NULL, '갈음하다', 15419, 2, 0, 1),
+(NULL, '감파르다', 15420, 2, 0, 1),
+(NULL, '갑작변이', 15421, 2, 0, 1),
+(NULL, '갑작스레', 15422, 2, 0, 1),
+(NULL, '값나가다', 15423, 2, 0, 1),
+(NULL, '강아지풀', 15424, 2, 0, 1),
+(NULL, '같이하다', 15425, 2, 0, 1),
+(NULL, '개구리매', 15426, 2, 0, 1),
+(NULL, '개구쟁이', 15427, 2, 0, 1),
+(NULL, '객공잡이', 15428, 2, 0, 1),
+(NULL, '갱치없다', 15429, 2, 0, 1),
+(NULL, '갸름하다', 15430, 2, 0, 1),
+(NULL, '거대하다', 15431, 2, 0, 1),
+(NULL, '건너가다', 15432, 2, 0, 1),
+(NULL, '건너뛰다', 15433, 2, 0, 1),
+(NULL, '건너오다', 15434, 2, 0, 1),
+(NULL, '건승하다', 15435, 2, 0, 1),
+(NULL, '걸어오다', 15436, 2, 0, 1),
+(NULL, '검독수리', 15437, 2, 0, 1),
+(NULL, '검둥오리', 15438, 2, 0, 1),
+(NULL, '검은담비', 15439, 2, 0, 1),
+(NULL, '검푸르다', 15440, 2, 0, 1),
+(NULL, '겁대가리', 15441, 2, 0, 1),
+(NULL, '게으르다', 15442, 2, 0, 1),
+(NULL, '격찬하다', 15443, 2, 0, 1),
+(NULL, '겸허하다', 15444, 2, 0, 1),
+(NULL, '겹겹하다', 15445, 2, 0, 1),
+(NULL, '고요하다', 15446, 2, 0, 1),
+(NULL, '곧은창자', 15447, 2, 0, 1),
+(NULL, '골짜구니', 15448, 2, 0, 1),
+(NULL, '곱다랗다', 15449, 2, 0, 1),
+(NULL, '곱슬머리', 15450, 2, 0, 1),
+(NULL, '공교롭다', 15451, 2, 0, 1),
+(NULL, '관계없이', 15452, 2, 0, 1),
+(NULL, '관대하다', 15453, 2, 0, 1),
+(NULL, '구걸하다', 15454, 2, 0, 1),
+(NULL, '구름다리', 15455, 2, 0, 1),
+(NULL, '구부리다', 15456, 2, 0, 1),
+(NULL, '구석차기', 15457, 2, 0, 1),
+(NULL, '구아니딘', 15458, 2, 0, 1),
+(NULL, '군데군데', 15459, 2, 0, 1),
+(NULL, '굳어지다', 15460, 2, 0, 1),
+(NULL, '굶주리다', 15461, 2, 0, 1),
+(NULL, '궁금하다', 15462, 2, 0, 1),
+(NULL, '귀신고래', 15463, 2, 0, 1),
+(NULL, '귀싸대기', 15464, 2, 0, 1),
+(NULL, '그러니까', 15465, 2, 0, 1),
+(NULL, '그러더니', 15466, 2, 0, 1),
+(NULL, '그러므로', 15467, 2, 0, 1),
+(NULL, '그렇지만', 15468, 2, 0, 1),
+(NULL, '그림영화', 15469, 2, 0, 1),
+(NULL, '그만하다', 15470, 2, 0, 1),
+(NULL, '그야말로', 15471, 2, 0, 1),
+(NULL, '그윽하다', 15472, 2, 0, 1),
+(NULL, '극난하다', 15473, 2, 0, 1),
+(NULL, '근지럽다', 15474, 2, 0, 1),
+(NULL, '글로리홀', 15475, 2, 0, 1),
+(NULL, '급한 데', 15476, 2, 0, 1),
+(NULL, '기똥차다', 15477, 2, 0, 1),
+(NULL, '기름지다', 15478, 2, 0, 1),
+(NULL, '기민하다', 15479, 2, 0, 1),
+(NULL, '기뻐하다', 15480, 2, 0, 1),
+(NULL, '기어가다', 15481, 2, 0, 1),
+(NULL, '기울이다', 15482, 2, 0, 1),
+(NULL, '까딸로그', 15483, 2, 0, 1),
+(NULL, '깔끔하다', 15484, 2, 0, 1),
+(NULL, '깜찍하다', 15485, 2, 0, 1),
+(NULL, '깨트리다', 15486, 2, 0, 1),
+(NULL, '께끈하다', 15487, 2, 0, 1),
+(NULL, '께낀하다', 15488, 2, 0, 1),
+(NULL, '꼬치구이', 15489, 2, 0, 1),
+(NULL, '꼭두각시', 15490, 2, 0, 1),
+(NULL, '끊임없이', 15491, 2, 0, 1),
+(NULL, '끌어안다', 15492, 2, 0, 1),
+(NULL, '끝말잇기', 15493, 2, 0, 1),
+(NULL, '끽반하다', 15494, 2, 0, 1),
+(NULL, '나라이름', 15495, 2, 0, 1),
+(NULL, '나른하다', 15496, 2, 0, 1),
+(NULL, '나무껍질', 15497, 2, 0, 1),
+(NULL, '나뭇가지', 15498, 2, 0, 1),
+(NULL, '나부끼다', 15499, 2, 0, 1),
+(NULL, '나아가다', 15500, 2, 0, 1),
+(NULL, '나이들다', 15501, 2, 0, 1),
+(NULL, '나타나다', 15502, 2, 0, 1),
+(NULL, '나프탈렌', 15503, 2, 0, 1),
+(NULL, '난처하다', 15504, 2, 0, 1),
+(NULL, '날갯죽지', 15505, 2, 0, 1),
+(NULL, '날려가다', 15506, 2, 0, 1),
+(NULL, '날카롭다', 15507, 2, 0, 1),
+(NULL, '남자답다', 15508, 2, 0, 1),
+(NULL, '남자아이', 15509, 2, 0, 1),
+(NULL, '낮아지다', 15510, 2, 0, 1),
+(NULL, '내버리다', 15511, 2, 0, 1),
+(NULL, '넘어서다', 15512, 2, 0, 1),
+(NULL, '노이로제', 15513, 2, 0, 1),
+(NULL, '농후하다', 15514, 2, 0, 1),
+(NULL, '누르술탄', 15515, 2, 0, 1),
+(NULL, '눌러자다', 15516, 2, 0, 1),
+(NULL, '뉘우치다', 15517, 2, 0, 1),
+(NULL, '느긋하다', 15518, 2, 0, 1),
+(NULL, '느껴지다', 15519, 2, 0, 1),
+(NULL, '느닷없다', 15520, 2, 0, 1),
+(NULL, '늘어서다', 15521, 2, 0, 1),
+(NULL, '능숙하다', 15522, 2, 0, 1),
+(NULL, '다가오다', 15523, 2, 0, 1),
+(NULL, '다짐하다', 15524, 2, 0, 1),
+(NULL, '달아나다', 15525, 2, 0, 1),
+(NULL, '담담하다', 15526, 2, 0, 1),
+(NULL, '대단하다', 15527, 2, 0, 1),
+(NULL, '대장장이', 15528, 2, 0, 1),
+(NULL, '덕통사고', 15529, 2, 0, 1),
+(NULL, '던지럽다', 15530, 2, 0, 1),
+(NULL, '덜컹이다', 15531, 2, 0, 1),
+(NULL, '덱스트린', 15532, 2, 0, 1),
+(NULL, '도망가다', 15533, 2, 0, 1),
+(NULL, '돌아가다', 15534, 2, 0, 1),
+(NULL, '돌아보다', 15535, 2, 0, 1),
+(NULL, '동그랗다', 15536, 2, 0, 1),
+(NULL, '동등하다', 15537, 2, 0, 1),
+(NULL, '동백나무', 15538, 2, 0, 1),
+(NULL, '동봉하다', 15539, 2, 0, 1),
+(NULL, '돼지갈비', 15540, 2, 0, 1),
+(NULL, '둘러보다', 15541, 2, 0, 1),
+(NULL, '둘러싸다', 15542, 2, 0, 1),
+(NULL, '뒤꺼럽다', 15543, 2, 0, 1),
+(NULL, '드라이브', 15544, 2, 0, 1),
+(NULL, '드러눕다', 15545, 2, 0, 1),
+(NULL, '드리우다', 15546, 2, 0, 1),
+(NULL, '드베르그', 15547, 2, 0, 1),
+(NULL, '들어오다', 15548, 2, 0, 1),
+(NULL, '들어차다', 15549, 2, 0, 1),
+(NULL, '따사롭다', 15550, 2, 0, 1),
+(NULL, '딱딱하다', 15551, 2, 0, 1),
+(NULL, '떠다니다', 15552, 2, 0, 1),
+(NULL, '떠돌이별', 15553, 2, 0, 1),
+(NULL, '떼아트르', 15554, 2, 0, 1),
+(NULL, '뛰어나다', 15555, 2, 0, 1),
+(NULL, '라이터돌', 15556, 2, 0, 1),
+(NULL, '레알리즘', 15557, 2, 0, 1),
+(NULL, '룸메이트', 15558, 2, 0, 1),
+(NULL, '리사이틀', 15559, 2, 0, 1),
+(NULL, '마귀할멈', 15560, 2, 0, 1),
+(NULL, '마련되다', 15561, 2, 0, 1),
+(NULL, '마주치다', 15562, 2, 0, 1),
+(NULL, '마중하다', 15563, 2, 0, 1),
+(NULL, '마찬가지', 15564, 2, 0, 1),
+(NULL, '막힘없다', 15565, 2, 0, 1),
+(NULL, '만만하다', 15566, 2, 0, 1),
+(NULL, '말똥가리', 15567, 2, 0, 1),
+(NULL, '말레이어', 15568, 2, 0, 1),
+(NULL, '말씀하다', 15569, 2, 0, 1),
+(NULL, '말씹조개', 15570, 2, 0, 1),
+(NULL, '망가지다', 15571, 2, 0, 1),
+(NULL, '망설이다', 15572, 2, 0, 1),
+(NULL, '매질하다', 15573, 2, 0, 1),
+(NULL, '맹렬하다', 15574, 2, 0, 1),
+(NULL, '먹이그물', 15575, 2, 0, 1),
+(NULL, '멀어지다', 15576, 2, 0, 1),
+(NULL, '멍텅구리', 15577, 2, 0, 1),
+(NULL, '메리야스', 15578, 2, 0, 1),
+(NULL, '메추리알', 15579, 2, 0, 1),
+(NULL, '모래폭풍', 15580, 2, 0, 1),
+(NULL, '모르폴린', 15581, 2, 0, 1),
+(NULL, '모색하다', 15582, 2, 0, 1),
+(NULL, '모차르트', 15583, 2, 0, 1),
+(NULL, '목란나무', 15584, 2, 0, 1),
+(NULL, '몰다비아', 15585, 2, 0, 1),
+(NULL, '못생기다', 15586, 2, 0, 1),
+(NULL, '몽고주름', 15587, 2, 0, 1),
+(NULL, '무닥데기', 15588, 2, 0, 1),
+(NULL, '무당벌레', 15589, 2, 0, 1),
+(NULL, '무빙워크', 15590, 2, 0, 1),
+(NULL, '무익하다', 15591, 2, 0, 1),
+(NULL, '무효하다', 15592, 2, 0, 1),
+(NULL, '문 닫고', 15593, 2, 0, 1),
+(NULL, '물결길이', 15594, 2, 0, 1),
+(NULL, '물려받다', 15595, 2, 0, 1),
+(NULL, '물뿌리다', 15596, 2, 0, 1),
+(NULL, '물어떼다', 15597, 2, 0, 1),
+(NULL, '물어뜯다', 15598, 2, 0, 1),
+(NULL, '미국오리', 15599, 2, 0, 1),
+(NULL, '미워하다', 15600, 2, 0, 1),
+(NULL, '민물상어', 15601, 2, 0, 1),
+(NULL, '밀집되다', 15602, 2, 0, 1),
+(NULL, '밀집하다', 15603, 2, 0, 1),
+(NULL, '밍크고래', 15604, 2, 0, 1),
+(NULL, '바겐세일', 15605, 2, 0, 1),
+(NULL, '바다사자', 15606, 2, 0, 1),
+(NULL, '바다제비', 15607, 2, 0, 1),
+(NULL, '바닥나다', 15608, 2, 0, 1),
+(NULL, '바빠지다', 15609, 2, 0, 1),
+(NULL, '바이러스', 15610, 2, 0, 1),
+(NULL, '받아쓰다', 15611, 2, 0, 1),
+(NULL, '밝아지다', 15612, 2, 0, 1),
+(NULL, '밝혀지다', 15613, 2, 0, 1),
+(NULL, '밤새우다', 15614, 2, 0, 1),
+(NULL, '방귀뀌다', 15615, 2, 0, 1),
+(NULL, '배추김치', 15616, 2, 0, 1),
+(NULL, '버들가지', 15617, 2, 0, 1),
+(NULL, '버릇없다', 15618, 2, 0, 1),
+(NULL, '버릇하다', 15619, 2, 0, 1),
+(NULL, '버즘나무', 15620, 2, 0, 1),
+(NULL, '버텅아래', 15621, 2, 0, 1),
+(NULL, '번트하다', 15622, 2, 0, 1),
+(NULL, '베어물다', 15623, 2, 0, 1),
+(NULL, '벼락부자', 15624, 2, 0, 1),
+(NULL, '변이하다', 15625, 2, 0, 1),
+(NULL, '별다르다', 15626, 2, 0, 1),
+(NULL, '보금자리', 15627, 2, 0, 1),
+(NULL, '보류하다', 15628, 2, 0, 1),
+(NULL, '보리고래', 15629, 2, 0, 1),
+(NULL, '보살피다', 15630, 2, 0, 1),
+(NULL, '보완하다', 15631, 2, 0, 1),
+(NULL, '복붙하다', 15632, 2, 0, 1),
+(NULL, '부끄리다', 15633, 2, 0, 1),
+(NULL, '부루퉁이', 15634, 2, 0, 1),
+(NULL, '부르트다', 15635, 2, 0, 1),
+(NULL, '부릅뜨다', 15636, 2, 0, 1),
+(NULL, '부리고래', 15637, 2, 0, 1),
+(NULL, '부리이다', 15638, 2, 0, 1),
+(NULL, '부스러기', 15639, 2, 0, 1),
+(NULL, '부추기다', 15640, 2, 0, 1),
+(NULL, '불거지다', 15641, 2, 0, 1),
+(NULL, '불러오다', 15642, 2, 0, 1),
+(NULL, '불사르다', 15643, 2, 0, 1),
+(NULL, '붉은솔개', 15644, 2, 0, 1),
+(NULL, '붉은오름', 15645, 2, 0, 1),
+(NULL, '붉은피톨', 15646, 2, 0, 1),
+(NULL, '붙박이별', 15647, 2, 0, 1),
+(NULL, '붙잡히다', 15648, 2, 0, 1),
+(NULL, '브래지어', 15649, 2, 0, 1),
+(NULL, '비롯되다', 15650, 2, 0, 1),
+(NULL, '비롯하다', 15651, 2, 0, 1),
+(NULL, '비잔티온', 15652, 2, 0, 1),
+(NULL, '비추이다', 15653, 2, 0, 1),
+(NULL, '빨래집게', 15654, 2, 0, 1),
+(NULL, '빨리빨리', 15655, 2, 0, 1),
+(NULL, '빨아내다', 15656, 2, 0, 1),
+(NULL, '뻘줌하다', 15657, 2, 0, 1),
+(NULL, '뻘쭘하다', 15658, 2, 0, 1),
+(NULL, '뽀뽀하다', 15659, 2, 0, 1),
+(NULL, '뿌셔뿌셔', 15660, 2, 0, 1),
+(NULL, '뿔종다리', 15661, 2, 0, 1),
+(NULL, '사내아이', 15662, 2, 0, 1),
+(NULL, '사라지다', 15663, 2, 0, 1),
+(NULL, '사소하다', 15664, 2, 0, 1),
+(NULL, '사탕수수', 15665, 2, 0, 1),
+(NULL, '사팔뜨기', 15666, 2, 0, 1),
+(NULL, '산봉우리', 15667, 2, 0, 1),
+(NULL, '살그머니', 15668, 2, 0, 1),
+(NULL, '살아오다', 15669, 2, 0, 1),
+(NULL, '살찌우다', 15670, 2, 0, 1),
+(NULL, '살펴보다', 15671, 2, 0, 1),
+(NULL, '상파울루', 15672, 2, 0, 1),
+(NULL, '새대가리', 15673, 2, 0, 1),
+(NULL, '새콤하다', 15674, 2, 0, 1),
+(NULL, '새홀리기', 15675, 2, 0, 1),
+(NULL, '생강나무', 15676, 2, 0, 1),
+(NULL, '생겨나다', 15677, 2, 0, 1),
+(NULL, '서운하다', 15678, 2, 0, 1),
+(NULL, '섭섭하다', 15679, 2, 0, 1),
+(NULL, '성급하다', 15680, 2, 0, 1),
+(NULL, '성냥개비', 15681, 2, 0, 1),
+(NULL, '세련되다', 15682, 2, 0, 1),
+(NULL, '세로쓰기', 15683, 2, 0, 1),
+(NULL, '센스쟁이', 15684, 2, 0, 1),
+(NULL, '센티미터', 15685, 2, 0, 1),
+(NULL, '소꿉동무', 15686, 2, 0, 1),
+(NULL, '소녀답다', 15687, 2, 0, 1),
+(NULL, '소리쟁이', 15688, 2, 0, 1),
+(NULL, '소리치다', 15689, 2, 0, 1),
+(NULL, '소매치기', 15690, 2, 0, 1),
+(NULL, '소믈리에', 15691, 2, 0, 1),
+(NULL, '속삭이다', 15692, 2, 0, 1),
+(NULL, '속속들이', 15693, 2, 0, 1),
+(NULL, '손꼽히다', 15694, 2, 0, 1),
+(NULL, '손바느질', 15695, 2, 0, 1),
+(NULL, '손질하다', 15696, 2, 0, 1),
+(NULL, '쇠돌고래', 15697, 2, 0, 1),
+(NULL, '쇠뿌러기', 15698, 2, 0, 1),
+(NULL, '쇠솔딱새', 15699, 2, 0, 1),
+(NULL, '수다쟁이', 15700, 2, 0, 1),
+(NULL, '수캉아지', 15701, 2, 0, 1),
+(NULL, '수코양이', 15702, 2, 0, 1),
+(NULL, '수탕나귀', 15703, 2, 0, 1),
+(NULL, '수평아리', 15704, 2, 0, 1),
+(NULL, '숙주나물', 15705, 2, 0, 1),
+(NULL, '순진하다', 15706, 2, 0, 1),
+(NULL, '술래잡기', 15707, 2, 0, 1),
+(NULL, '숨가쁘다', 15708, 2, 0, 1),
+(NULL, '숨거두다', 15709, 2, 0, 1),
+(NULL, '숲비둘기', 15710, 2, 0, 1),
+(NULL, '스테아린', 15711, 2, 0, 1),
+(NULL, '스트리머', 15712, 2, 0, 1),
+(NULL, '스페이드', 15713, 2, 0, 1),
+(NULL, '스포이드', 15714, 2, 0, 1),
+(NULL, '스포츠컷', 15715, 2, 0, 1),
+(NULL, '스포하다', 15716, 2, 0, 1),
+(NULL, '스플리터', 15717, 2, 0, 1),
+(NULL, '스핑크스', 15718, 2, 0, 1),
+(NULL, '슬라이더', 15719, 2, 0, 1),
+(NULL, '승부차기', 15720, 2, 0, 1),
+(NULL, '시달리다', 15721, 2, 0, 1),
+(NULL, '시원하다', 15722, 2, 0, 1),
+(NULL, '신박하다', 15723, 2, 0, 1),
+(NULL, '실종되다', 15724, 2, 0, 1),
+(NULL, '싫어하다', 15725, 2, 0, 1),
+(NULL, '싸울아비', 15726, 2, 0, 1),
+(NULL, '쌀떡볶이', 15727, 2, 0, 1),
+(NULL, '쏘아보다', 15728, 2, 0, 1),
+(NULL, '쓰러지다', 15729, 2, 0, 1),
+(NULL, '씁쓸하다', 15730, 2, 0, 1),
+(NULL, '아메리카', 15731, 2, 0, 1),
+(NULL, '아무렇다', 15732, 2, 0, 1),
+(NULL, '아물리다', 15733, 2, 0, 1),
+(NULL, '아미노산', 15734, 2, 0, 1),
+(NULL, '아부다비', 15735, 2, 0, 1),
+(NULL, '아이러니', 15736, 2, 0, 1),
+(NULL, '아제티딘', 15737, 2, 0, 1),
+(NULL, '아크리딘', 15738, 2, 0, 1),
+(NULL, '안경쟁이', 15739, 2, 0, 1),
+(NULL, '안드레이', 15740, 2, 0, 1),
+(NULL, '안트라센', 15741, 2, 0, 1),
+(NULL, '앉은자리', 15742, 2, 0, 1),
+(NULL, '앉을배이', 15743, 2, 0, 1),
+(NULL, '알데히드', 15744, 2, 0, 1),
+(NULL, '알랑방귀', 15745, 2, 0, 1),
+(NULL, '알려지다', 15746, 2, 0, 1),
+(NULL, '앓아눕다', 15747, 2, 0, 1),
+(NULL, '애기박쥐', 15748, 2, 0, 1),
+(NULL, '애삐리다', 15749, 2, 0, 1),
+(NULL, '애처롭다', 15750, 2, 0, 1),
+(NULL, '앳기우다', 15751, 2, 0, 1),
+(NULL, '야속하다', 15752, 2, 0, 1),
+(NULL, '야자집게', 15753, 2, 0, 1),
+(NULL, '양념하다', 15754, 2, 0, 1),
+(NULL, '양러우촬', 15755, 2, 0, 1),
+(NULL, '양복쟁이', 15756, 2, 0, 1),
+(NULL, '어둑서니', 15757, 2, 0, 1),
+(NULL, '어드렇다', 15758, 2, 0, 1),
+(NULL, '어렵사리', 15759, 2, 0, 1),
+(NULL, '어리석다', 15760, 2, 0, 1),
+(NULL, '어린이집', 15761, 2, 0, 1),
+(NULL, '어여머리', 15762, 2, 0, 1),
+(NULL, '어여쁘다', 15763, 2, 0, 1),
+(NULL, '언제든지', 15764, 2, 0, 1),
+(NULL, '얼음과자', 15765, 2, 0, 1),
+(NULL, '엉덩방아', 15766, 2, 0, 1),
+(NULL, '엉뚱하다', 15767, 2, 0, 1),
+(NULL, '엉망진창', 15768, 2, 0, 1),
+(NULL, '엉머구리', 15769, 2, 0, 1),
+(NULL, '엎드리다', 15770, 2, 0, 1),
+(NULL, '에스체트', 15771, 2, 0, 1),
+(NULL, '에스키모', 15772, 2, 0, 1),
+(NULL, '여겨지다', 15773, 2, 0, 1),
+(NULL, '여름짓다', 15774, 2, 0, 1),
+(NULL, '여자답다', 15775, 2, 0, 1),
+(NULL, '연준모치', 15776, 2, 0, 1),
+(NULL, '엷파랗다', 15777, 2, 0, 1),
+(NULL, '영검하다', 15778, 2, 0, 1),
+(NULL, '오디오북', 15779, 2, 0, 1),
+(NULL, '오래되다', 15780, 2, 0, 1),
+(NULL, '오랫동안', 15781, 2, 0, 1),
+(NULL, '오롯하다', 15782, 2, 0, 1),
+(NULL, '오븐장갑', 15783, 2, 0, 1),
+(NULL, '오프숄더', 15784, 2, 0, 1),
+(NULL, '옥시토신', 15785, 2, 0, 1),
+(NULL, '올바르다', 15786, 2, 0, 1),
+(NULL, '옮아가다', 15787, 2, 0, 1),
+(NULL, '옮아오다', 15788, 2, 0, 1),
+(NULL, '왕바다리', 15789, 2, 0, 1),
+(NULL, '우두머리', 15790, 2, 0, 1),
+(NULL, '우리나라', 15791, 2, 0, 1),
+(NULL, '울창하다', 15792, 2, 0, 1),
+(NULL, '웨브페지', 15793, 2, 0, 1),
+(NULL, '위팔동맥', 15794, 2, 0, 1),
+(NULL, '위팔신경', 15795, 2, 0, 1),
+(NULL, '유래되다', 15796, 2, 0, 1),
+(NULL, '유릿조각', 15797, 2, 0, 1),
+(NULL, '유에프오', 15798, 2, 0, 1),
+(NULL, '유예하다', 15799, 2, 0, 1),
+(NULL, '유효하다', 15800, 2, 0, 1),
+(NULL, '으슥하다', 15801, 2, 0, 1),
+(NULL, '읊조리다', 15802, 2, 0, 1),
+(NULL, '의심쩍다', 15803, 2, 0, 1),
+(NULL, '이룩하다', 15804, 2, 0, 1),
+(NULL, '이뤄지다', 15805, 2, 0, 1),
+(NULL, '이미다졸', 15806, 2, 0, 1),
+(NULL, '이야기꾼', 15807, 2, 0, 1),
+(NULL, '이테르븀', 15808, 2, 0, 1),
+(NULL, '익숙하다', 15809, 2, 0, 1),
+(NULL, '인조고기', 15810, 2, 0, 1),
+(NULL, '일고여덟', 15811, 2, 0, 1),
+(NULL, '일그리다', 15812, 2, 0, 1),
+(NULL, '입덕하다', 15813, 2, 0, 1),
+(NULL, '잎새버섯', 15814, 2, 0, 1),
+(NULL, '잎파랑이', 15815, 2, 0, 1),
+(NULL, '자가사리', 15816, 2, 0, 1),
+(NULL, '자두나무', 15817, 2, 0, 1),
+(NULL, '자라자지', 15818, 2, 0, 1),
+(NULL, '자릿하다', 15819, 2, 0, 1),
+(NULL, '자유롭다', 15820, 2, 0, 1),
+(NULL, '작은엄마', 15821, 2, 0, 1),
+(NULL, '잘록하다', 15822, 2, 0, 1),
+(NULL, '잘생기다', 15823, 2, 0, 1),
+(NULL, '잡아먹다', 15824, 2, 0, 1),
+(NULL, '재미없다', 15825, 2, 0, 1),
+(NULL, '재현하다', 15826, 2, 0, 1),
+(NULL, '전문일군', 15827, 2, 0, 1),
+(NULL, '전문일꾼', 15828, 2, 0, 1),
+(NULL, '접수하다', 15829, 2, 0, 1),
+(NULL, '정숙하다', 15830, 2, 0, 1),
+(NULL, '정의롭다', 15831, 2, 0, 1),
+(NULL, '젖가공품', 15832, 2, 0, 1),
+(NULL, '제곱미터', 15833, 2, 0, 1),
+(NULL, '제육덮밥', 15834, 2, 0, 1),
+(NULL, '젤렌스키', 15835, 2, 0, 1),
+(NULL, '조그맣다', 15836, 2, 0, 1),
+(NULL, '좋아하다', 15837, 2, 0, 1),
+(NULL, '주머니칼', 15838, 2, 0, 1),
+(NULL, '주어지다', 15839, 2, 0, 1),
+(NULL, '주정뱅이', 15840, 2, 0, 1),
+(NULL, '죽을 맛', 15841, 2, 0, 1),
+(NULL, '줄어들다', 15842, 2, 0, 1),
+(NULL, '쥐며느리', 15843, 2, 0, 1),
+(NULL, '지랄하다', 15844, 2, 0, 1),
+(NULL, '지새우다', 15845, 2, 0, 1),
+(NULL, '지속되다', 15846, 2, 0, 1),
+(NULL, '지어내다', 15847, 2, 0, 1),
+(NULL, '지저귀다', 15848, 2, 0, 1),
+(NULL, '지혜롭다', 15849, 2, 0, 1),
+(NULL, '짊어지다', 15850, 2, 0, 1),
+(NULL, '집어넣다', 15851, 2, 0, 1),
+(NULL, '짓이기다', 15852, 2, 0, 1),
+(NULL, '징그럽다', 15853, 2, 0, 1),
+(NULL, '짠물고기', 15854, 2, 0, 1),
+(NULL, '쫄깃하다', 15855, 2, 0, 1),
+(NULL, '찢어지다', 15856, 2, 0, 1),
+(NULL, '차돌박이', 15857, 2, 0, 1),
+(NULL, '착용하다', 15858, 2, 0, 1),
+(NULL, '찬란하다', 15859, 2, 0, 1),
+(NULL, '찬미하다', 15860, 2, 0, 1),
+(NULL, '참좁쌀풀', 15861, 2, 0, 1),
+(NULL, '참치하다', 15862, 2, 0, 1),
+(NULL, '채색하다', 15863, 2, 0, 1),
+(NULL, '채택되다', 15864, 2, 0, 1),
+(NULL, '책임지다', 15865, 2, 0, 1),
+(NULL, '쳐다보다', 15866, 2, 0, 1),
+(NULL, '추악하다', 15867, 2, 0, 1),
+(NULL, '추잡하다', 15868, 2, 0, 1),
+(NULL, '출몰하다', 15869, 2, 0, 1),
+(NULL, '취득하다', 15870, 2, 0, 1),
+(NULL, '침착하다', 15871, 2, 0, 1),
+(NULL, '카르볼린', 15872, 2, 0, 1),
+(NULL, '카복실산', 15873, 2, 0, 1),
+(NULL, '카카오톡', 15874, 2, 0, 1),
+(NULL, '컨닝하다', 15875, 2, 0, 1),
+(NULL, '컨베이어', 15876, 2, 0, 1),
+(NULL, '코토레타', 15877, 2, 0, 1),
+(NULL, '콤플렉스', 15878, 2, 0, 1),
+(NULL, '퀴나졸린', 15879, 2, 0, 1),
+(NULL, '퀴녹살린', 15880, 2, 0, 1),
+(NULL, '크레파스', 15881, 2, 0, 1),
+(NULL, '큰곰자리', 15882, 2, 0, 1),
+(NULL, '큰기러기', 15883, 2, 0, 1),
+(NULL, '큰아버지', 15884, 2, 0, 1),
+(NULL, '큰흰죽지', 15885, 2, 0, 1),
+(NULL, '키로메터', 15886, 2, 0, 1),
+(NULL, '타는 곳', 15887, 2, 0, 1),
+(NULL, '타이르다', 15888, 2, 0, 1),
+(NULL, '타이틀곡', 15889, 2, 0, 1),
+(NULL, '탈덕하다', 15890, 2, 0, 1),
+(NULL, '퇴각하다', 15891, 2, 0, 1),
+(NULL, '트로필륨', 15892, 2, 0, 1),
+(NULL, '트림하다', 15893, 2, 0, 1),
+(NULL, '틀림없다', 15894, 2, 0, 1),
+(NULL, '틀림없이', 15895, 2, 0, 1),
+(NULL, '파악하다', 15896, 2, 0, 1),
+(NULL, '파오차이', 15897, 2, 0, 1),
+(NULL, '팔미트산', 15898, 2, 0, 1),
+(NULL, '팔팔하다', 15899, 2, 0, 1),
+(NULL, '팬팬하다', 15900, 2, 0, 1),
+(NULL, '펑크 록', 15901, 2, 0, 1),
+(NULL, '페난트렌', 15902, 2, 0, 1),
+(NULL, '펩타이드', 15903, 2, 0, 1),
+(NULL, '평방미터', 15904, 2, 0, 1),
+(NULL, '포르피린', 15905, 2, 0, 1),
+(NULL, '표고버섯', 15906, 2, 0, 1),
+(NULL, '푸틴주의', 15907, 2, 0, 1),
+(NULL, '푹신하다', 15908, 2, 0, 1),
+(NULL, '풀이하다', 15909, 2, 0, 1),
+(NULL, '풋풋하다', 15910, 2, 0, 1),
+(NULL, '프랑스인', 15911, 2, 0, 1),
+(NULL, '프로그램', 15912, 2, 0, 1),
+(NULL, '프로토콜', 15913, 2, 0, 1),
+(NULL, '프로파길', 15914, 2, 0, 1),
+(NULL, '프로필렌', 15915, 2, 0, 1),
+(NULL, '프탈라진', 15916, 2, 0, 1),
+(NULL, '프탈레인', 15917, 2, 0, 1),
+(NULL, '프테리딘', 15918, 2, 0, 1),
+(NULL, '플래카드', 15919, 2, 0, 1),
+(NULL, '플루오렌', 15920, 2, 0, 1),
+(NULL, '피리다진', 15921, 2, 0, 1),
+(NULL, '피리미딘', 15922, 2, 0, 1),
+(NULL, '피페라진', 15923, 2, 0, 1),
+(NULL, '피페리딘', 15924, 2, 0, 1),
+(NULL, '하나하나', 15925, 2, 0, 1),
+(NULL, '하늘나라', 15926, 2, 0, 1),
+(NULL, '하락하다', 15927, 2, 0, 1),
+(NULL, '학생답다', 15928, 2, 0, 1),
+(NULL, '한가운데', 15929, 2, 0, 1),
+(NULL, '한가하다', 15930, 2, 0, 1),
+(NULL, '한꺼번에', 15931, 2, 0, 1),
+(NULL, '함박웃음', 15932, 2, 0, 1),
+(NULL, '해쓱하다', 15933, 2, 0, 1),
+(NULL, '향긋하다', 15934, 2, 0, 1),
+(NULL, '향기롭다', 15935, 2, 0, 1),
+(NULL, '헐렁하다', 15936, 2, 0, 1),
+(NULL, '호랑가시', 15937, 2, 0, 1),
+(NULL, '호주머니', 15938, 2, 0, 1),
+(NULL, '홈페이지', 15939, 2, 0, 1),
+(NULL, '화창하다', 15940, 2, 0, 1),
+(NULL, '황조롱이', 15941, 2, 0, 1),
+(NULL, '후물래미', 15942, 2, 0, 1),
+(NULL, '후춧가루', 15943, 2, 0, 1),
+(NULL, '훌륭하다', 15944, 2, 0, 1),
+(NULL, '훌쩍이다', 15945, 2, 0, 1),
+(NULL, '흐느끼다', 15946, 2, 0, 1),
+(NULL, '흑두루미', 15947, 2, 0, 1),
+(NULL, '흩어지다', 15948, 2, 0, 1),
+(NULL, '흰기러기', 15949, 2, 0, 1),
+(NULL, '흰비오리', 15950, 2, 0, 1),
+(NULL, '흰뺨오리', 15951, 2, 0, 1),
+(NULL, '가벼워지다', 15952, 2, 0, 1),
+(NULL, '가스레인지', 15953, 2, 0, 1),
+(NULL, '가져다주다', 15954, 2, 0, 1),
+(NULL, '가톨릭교회', 15955, 2, 0, 1),
+(NULL, '갈음이름씨', 15956, 2, 0, 1),
+(NULL, '감자편튀기', 15957, 2, 0, 1),
+(NULL, '갑산아바이', 15958, 2, 0, 1),
+(NULL, '개지랄하다', 15959, 2, 0, 1),
+(NULL, '갸웃거리다', 15960, 2, 0, 1),
+(NULL, '거릿모테이', 15961, 2, 0, 1),
+(NULL, '거릿모티이', 15962, 2, 0, 1),
+(NULL, '거짓말하다', 15963, 2, 0, 1),
+(NULL, '걱정스럽다', 15964, 2, 0, 1),
+(NULL, '고등어구이', 15965, 2, 0, 1),
+(NULL, '고양이고래', 15966, 2, 0, 1),
+(NULL, '고지식하다', 15967, 2, 0, 1),
+(NULL, '고통스럽다', 15968, 2, 0, 1),
+(NULL, '궤탈사하다', 15969, 2, 0, 1),
+(NULL, '기다려지다', 15970, 2, 0, 1),
+(NULL, '긴발톱첨서', 15971, 2, 0, 1),
+(NULL, '긴코너구리', 15972, 2, 0, 1),
+(NULL, '꼬부랑국수', 15973, 2, 0, 1),
+(NULL, '꾀꼬리버섯', 15974, 2, 0, 1),
+(NULL, '끙끙거리다', 15975, 2, 0, 1),
+(NULL, '나프티리딘', 15976, 2, 0, 1),
+(NULL, '내려다보다', 15977, 2, 0, 1),
+(NULL, '너저분하다', 15978, 2, 0, 1),
+(NULL, '넘실트리다', 15979, 2, 0, 1),
+(NULL, '다정스럽다', 15980, 2, 0, 1),
+(NULL, '담쟁이덩굴', 15981, 2, 0, 1),
+(NULL, '댕기물떼새', 15982, 2, 0, 1),
+(NULL, '댕기흰죽지', 15983, 2, 0, 1),
+(NULL, '더듬이다리', 15984, 2, 0, 1),
+(NULL, '돌아가시다', 15985, 2, 0, 1),
+(NULL, '두근거리다', 15986, 2, 0, 1),
+(NULL, '두려워하다', 15987, 2, 0, 1),
+(NULL, '들여다보다', 15988, 2, 0, 1),
+(NULL, '들이마시다', 15989, 2, 0, 1),
+(NULL, '디프테리아', 15990, 2, 0, 1),
+(NULL, '뜨거워지다', 15991, 2, 0, 1),
+(NULL, '띠무늬물범', 15992, 2, 0, 1),
+(NULL, '리즈 시절', 15993, 2, 0, 1),
+(NULL, '마무리투수', 15994, 2, 0, 1),
+(NULL, '마찰시키다', 15995, 2, 0, 1),
+(NULL, '마트료시카', 15996, 2, 0, 1),
+(NULL, '만포장이다', 15997, 2, 0, 1),
+(NULL, '말라빠지다', 15998, 2, 0, 1),
+(NULL, '맞부딪치다', 15999, 2, 0, 1),
+(NULL, '맨스플레인', 16000, 2, 0, 1),
+(NULL, '맹비난하다', 16001, 2, 0, 1),
+(NULL, '머뭇거리다', 16002, 2, 0, 1),
+(NULL, '모토크로스', 16003, 2, 0, 1),
+(NULL, '무서워하다', 16004, 2, 0, 1),
+(NULL, '무자비하다', 16005, 2, 0, 1),
+(NULL, '무지개송어', 16006, 2, 0, 1),
+(NULL, '문둥이박쥐', 16007, 2, 0, 1),
+(NULL, '바람직하다', 16008, 2, 0, 1),
+(NULL, '바보스럽다', 16009, 2, 0, 1),
+(NULL, '바위비둘기', 16010, 2, 0, 1),
+(NULL, '보실거리다', 16011, 2, 0, 1),
+(NULL, '부러뜨리다', 16012, 2, 0, 1),
+(NULL, '불가피하다', 16013, 2, 0, 1),
+(NULL, '붉은왜가리', 16014, 2, 0, 1),
+(NULL, '비밀스럽다', 16015, 2, 0, 1),
+(NULL, '비틀거리다', 16016, 2, 0, 1),
+(NULL, '뿔논병아리', 16017, 2, 0, 1),
+(NULL, '사람비김법', 16018, 2, 0, 1),
+(NULL, '새로 고침', 16019, 2, 0, 1),
+(NULL, '세제곱미터', 16020, 2, 0, 1),
+(NULL, '셀프 디스', 16021, 2, 0, 1),
+(NULL, '소란스럽다', 16022, 2, 0, 1),
+(NULL, '쇠황조롱이', 16023, 2, 0, 1),
+(NULL, '스타일시트', 16024, 2, 0, 1),
+(NULL, '스테로이드', 16025, 2, 0, 1),
+(NULL, '스테아르산', 16026, 2, 0, 1),
+(NULL, '스포츠머리', 16027, 2, 0, 1),
+(NULL, '시무룩하다', 16028, 2, 0, 1),
+(NULL, '심부름하다', 16029, 2, 0, 1),
+(NULL, '싱글 페어', 16030, 2, 0, 1),
+(NULL, '쓰딸로바야', 16031, 2, 0, 1),
+(NULL, '아세나프텐', 16032, 2, 0, 1),
+(NULL, '아스콜빅산', 16033, 2, 0, 1),
+(NULL, '알레르기성', 16034, 2, 0, 1),
+(NULL, '알레이스터', 16035, 2, 0, 1),
+(NULL, '애피타이저', 16036, 2, 0, 1),
+(NULL, '여러해살이', 16037, 2, 0, 1),
+(NULL, '염주비둘기', 16038, 2, 0, 1),
+(NULL, '영광스럽다', 16039, 2, 0, 1),
+(NULL, '오드콜로뉴', 16040, 2, 0, 1),
+(NULL, '오드투왈렛', 16041, 2, 0, 1),
+(NULL, '오리너구리', 16042, 2, 0, 1),
+(NULL, '올드 미스', 16043, 2, 0, 1),
+(NULL, '우파니샤드', 16044, 2, 0, 1),
+(NULL, '웃어넘기다', 16045, 2, 0, 1),
+(NULL, '웹 페이지', 16046, 2, 0, 1),
+(NULL, '윗수염박쥐', 16047, 2, 0, 1),
+(NULL, '의심스럽다', 16048, 2, 0, 1),
+(NULL, '이륙시키다', 16049, 2, 0, 1),
+(NULL, '이소니트릴', 16050, 2, 0, 1),
+(NULL, '이야깃거리', 16051, 2, 0, 1),
+(NULL, '인플레이션', 16052, 2, 0, 1),
+(NULL, '인플루언서', 16053, 2, 0, 1),
+(NULL, '임실납자루', 16054, 2, 0, 1),
+(NULL, '자연스럽다', 16055, 2, 0, 1),
+(NULL, '작은곰자리', 16056, 2, 0, 1),
+(NULL, '작은아버지', 16057, 2, 0, 1),
+(NULL, '잡아당기다', 16058, 2, 0, 1),
+(NULL, '장난꾸러기', 16059, 2, 0, 1),
+(NULL, '쟁기질하다', 16060, 2, 0, 1),
+(NULL, '저녁 식사', 16061, 2, 0, 1),
+(NULL, '점박이물범', 16062, 2, 0, 1),
+(NULL, '젖꼴만들기', 16063, 2, 0, 1),
+(NULL, '제비물떼새', 16064, 2, 0, 1),
+(NULL, '주걱뿔사슴', 16065, 2, 0, 1),
+(NULL, '주름투성이', 16066, 2, 0, 1),
+(NULL, '줄넘기하다', 16067, 2, 0, 1),
+(NULL, '중얼거리다', 16068, 2, 0, 1),
+(NULL, '질식시키다', 16069, 2, 0, 1),
+(NULL, '찌그러지다', 16070, 2, 0, 1),
+(NULL, '찬넬동자개', 16071, 2, 0, 1),
+(NULL, '카레라이스', 16072, 2, 0, 1),
+(NULL, '카르보닐기', 16073, 2, 0, 1),
+(NULL, '카르복실기', 16074, 2, 0, 1),
+(NULL, '카르빌아민', 16075, 2, 0, 1),
+(NULL, '케이프타운', 16076, 2, 0, 1),
+(NULL, '큰소리치다', 16077, 2, 0, 1),
+(NULL, '키릴 문자', 16078, 2, 0, 1),
+(NULL, '탈리에리니', 16079, 2, 0, 1),
+(NULL, '터부시되다', 16080, 2, 0, 1),
+(NULL, '터부시하다', 16081, 2, 0, 1),
+(NULL, '투덜거리다', 16082, 2, 0, 1),
+(NULL, '튀어나오다', 16083, 2, 0, 1),
+(NULL, '트랜지스터', 16084, 2, 0, 1),
+(NULL, '파운데이션', 16085, 2, 0, 1),
+(NULL, '페난트리딘', 16086, 2, 0, 1),
+(NULL, '페르시아어', 16087, 2, 0, 1),
+(NULL, '편찮으시다', 16088, 2, 0, 1),
+(NULL, '풀 하우스', 16089, 2, 0, 1),
+(NULL, '풍만해지다', 16090, 2, 0, 1),
+(NULL, '하루 종일', 16091, 2, 0, 1),
+(NULL, '하이드라존', 16092, 2, 0, 1),
+(NULL, '하이퍼링크', 16093, 2, 0, 1),
+(NULL, '하플로그룹', 16094, 2, 0, 1),
+(NULL, '할미새사촌', 16095, 2, 0, 1),
+(NULL, '허접스럽다', 16096, 2, 0, 1),
+(NULL, '헛기다리다', 16097, 2, 0, 1),
+(NULL, '헤모글로빈', 16098, 2, 0, 1),
+(NULL, '혹부리오리', 16099, 2, 0, 1),
+(NULL, '활과 화살', 16100, 2, 0, 1),
+(NULL, '휘몰아치다', 16101, 2, 0, 1),
+(NULL, '휘파람솔개', 16102, 2, 0, 1),
+(NULL, '흐트러지다', 16103, 2, 0, 1),
+(NULL, '흘러나오다', 16104, 2, 0, 1),
+(NULL, '흰머리솔개', 16105, 2, 0, 1),
+(NULL, '흰죽지수리', 16106, 2, 0, 1),
+(NULL, '히드록시기', 16107, 2, 0, 1),
+(NULL, '히드록실기', 16108, 2, 0, 1),
+(NULL, '힘이 되다', 16109, 2, 0, 1),
+(NULL, '고리무늬물범', 16110, 2, 0, 1),
+(NULL, '귀뿔논병아리', 16111, 2, 0, 1),
+(NULL, '꼬리지느러미', 16112, 2, 0, 1),
+(NULL, '끈끈이대나물', 16113, 2, 0, 1),
+(NULL, '낮은음자리표', 16114, 2, 0, 1),
+(NULL, '노릇노릇하다', 16115, 2, 0, 1),
+(NULL, '높은음자리표', 16116, 2, 0, 1),
+(NULL, '누그러뜨리다', 16117, 2, 0, 1),
+(NULL, '덤불해오라기', 16118, 2, 0, 1),
+(NULL, '라이트세이버', 16119, 2, 0, 1),
+(NULL, '롱 드 장브', 16120, 2, 0, 1),
+(NULL, '마음에 들다', 16121, 2, 0, 1),
+(NULL, '무산쇠족제비', 16122, 2, 0, 1),
+(NULL, '미나리아재비', 16123, 2, 0, 1),
+(NULL, '민물가마우지', 16124, 2, 0, 1),
+(NULL, '불러일으키다', 16125, 2, 0, 1),
+(NULL, '붉은해오라기', 16126, 2, 0, 1),
+(NULL, '비둘기조롱이', 16127, 2, 0, 1),
+(NULL, '설프히드릴기', 16128, 2, 0, 1),
+(NULL, '썩음썩음하다', 16129, 2, 0, 1),
+(NULL, '아포스트로피', 16130, 2, 0, 1),
+(NULL, '알락해오라기', 16131, 2, 0, 1),
+(NULL, '요한 묵시록', 16132, 2, 0, 1),
+(NULL, '웹 디자이너', 16133, 2, 0, 1),
+(NULL, '으스러뜨리다', 16134, 2, 0, 1),
+(NULL, '이상야릇하다', 16135, 2, 0, 1),
+(NULL, '이소시아니드', 16136, 2, 0, 1),
+(NULL, '인도유럽어족', 16137, 2, 0, 1),
+(NULL, '전화를 걸다', 16138, 2, 0, 1),
+(NULL, '젖당못견딤증', 16139, 2, 0, 1),
+(NULL, '천안문당하다', 16140, 2, 0, 1),
+(NULL, '캐나다기러기', 16141, 2, 0, 1),
+(NULL, '큰재개구마리', 16142, 2, 0, 1),
+(NULL, '테이블 축구', 16143, 2, 0, 1),
+(NULL, '푸르스름하다', 16144, 2, 0, 1),
+(NULL, '프롤레타리아', 16145, 2, 0, 1),
+(NULL, '회색머리아비', 16146, 2, 0, 1),
+(NULL, '흰줄박이오리', 16147, 2, 0, 1),
+(NULL, '걸림갈음이름씨', 16148, 2, 0, 1),
+(NULL, '검은머리흰죽지', 16149, 2, 0, 1),
+(NULL, '그리스도의 적', 16150, 2, 0, 1),
+(NULL, '노랑부리저어새', 16151, 2, 0, 1),
+(NULL, '리우데자네이루', 16152, 2, 0, 1),
+(NULL, '말코손바닥사슴', 16153, 2, 0, 1),
+(NULL, '비잔티움 제국', 16154, 2, 0, 1),
+(NULL, '사람갈음이름씨', 16155, 2, 0, 1),
+(NULL, '사상의 지평선', 16156, 2, 0, 1),
+(NULL, '안절부절못하다', 16157, 2, 0, 1),
+(NULL, '유럽박태기나무', 16158, 2, 0, 1),
+(NULL, '잔디밭 살수기', 16159, 2, 0, 1),
+(NULL, '큰회색머리아비', 16160, 2, 0, 1),
+(NULL, '필수 아미노산', 16161, 2, 0, 1),
+(NULL, '하이드록실아민', 16162, 2, 0, 1),
+(NULL, '호스트 패밀리', 16163, 2, 0, 1),
+(NULL, '리듬 앤 블루스', 16164, 2, 0, 1),
+(NULL, '불가결 아미노산', 16165, 2, 0, 1),
+(NULL, '사회적 거리두기', 16166, 2, 0, 1),
+(NULL, '신성 로마 제국', 16167, 2, 0, 1),
+(NULL, '자유 소프트웨어', 16168, 2, 0, 1),
+(NULL, '캐나다박태기나무', 16169, 2, 0, 1),
+(NULL, '항라머리검독수리', 16170, 2, 0, 1),
+(NULL, '스트레이트 플러시', 16171, 2, 0, 1),
+(NULL, '아메리카홍머리오리', 16172, 2, 0, 1),
+(NULL, '아이스 아메리카노', 16173, 2, 0, 1),
+(NULL, '니코틴아마이드 아데닌 다이뉴클레오타이드', 16174, 2, 0, 1),
+('人種差別主義者', '인종차별주의자', 16175, 1, 1040, 1),
+('生物學者', '생물학자', 16176, 1, 954, 1),
+('個人主義者', '개인주의자', 16177, 1, 945, 1),
+('分子生物學', '분자생물학', 16178, 1, 923, 1),
+('地理學者', '지리학자', 16179, 1, 900, 1),
+('女性主義者', '여성주의자', 16180, 1, 858, 1),
+('分子動力學', '분자동역학', 16181, 1, 846, 1),
+('論理主義者', '논리주의자', 16182, 1, 831, 1),
+('量子電氣力學', '양자전기역학', 16183, 1, 828, 1),
+('機會主義者', '기회주의자', 16184, 1, 821, 1),
+('地質學者', '지질학자', 16185, 1, 820, 1),
+('天體物理學', '천체물리학', 16186, 1, 820, 1),
+('소비에트 社會主義 共和國 聯邦', '소비에트 사회주의 공화국 연방', 16187, 1, 792, 1),
+('쏘비에트 社會主義 共和國 聯邦', '쏘비에트 사회주의 공화국 련방', 16188, 1, 791, 1),
+('樂天主義者', '낙천주의자', 16189, 1, 771, 1),
+('國家社會主義', '국가사회주의', 16190, 1, 763, 1),
+('外國人嫌惡症', '외국인혐오증', 16191, 1, 762, 1),
+('生物物理學', '생물물리학', 16192, 1, 758, 1),
+('粒子物理學', '입자물리학', 16193, 1, 758, 1),
+('國民社會主義', '국민사회주의', 16194, 1, 755, 1),
+('氣象學者', '기상학자', 16195, 1, 749, 1),
+('人民學校', '인민학교', 16196, 1, 738, 1),
+('人道主義', '인도주의', 16197, 1, 725, 1),
+('菜食主義者', '채식주의자', 16198, 1, 724, 1),
+('人文學', '인문학', 16199, 1, 720, 1),
+('人種差別主義', '인종차별주의', 16200, 1, 715, 1),
+('物理化學', '물리화학', 16201, 1, 712, 1),
+('民主主義者', '민주주의자', 16202, 1, 712, 1),
+('王政主義者', '왕정주의자', 16203, 1, 710, 1),
+('老人病學', '노인병학', 16204, 1, 708, 1),
+('政治學者', '정치학자', 16205, 1, 705, 1),
+('古人類學', '고인류학', 16206, 1, 699, 1),
+('共産主義者', '공산주의자', 16207, 1, 690, 1),
+('重農主義者', '중농주의자', 16208, 1, 688, 1),
+('古生物學', '고생물학', 16209, 1, 685, 1),
+('人本主義', '인본주의', 16210, 1, 684, 1),
+('作中人物', '작중인물', 16211, 1, 682, 1),
+('中國人', '중국인', 16212, 1, 675, 1),
+('工學者', '공학자', 16213, 1, 668, 1),
+('人口學', '인구학', 16214, 1, 659, 1),
+('微生物學', '미생물학', 16215, 1, 658, 1),
+('古動物學', '고동물학', 16216, 1, 651, 1),
+('人類學', '인류학', 16217, 1, 643, 1),
+('國民學校', '국민학교', 16218, 1, 640, 1),
+('史學者', '사학자', 16219, 1, 639, 1),
+('老人學', '노인학', 16220, 1, 638, 1),
+('大日本帝國', '대일본제국', 16221, 1, 638, 1),
+('中世 韓國語', '중세 한국어', 16222, 1, 637, 1),
+('獨立國家協同體', '독립국가협동체', 16223, 1, 635, 1),
+('非人道的', '비인도적', 16224, 1, 634, 1),
+('古地理學', '고지리학', 16225, 1, 631, 1),
+('同性愛者', '동성애자', 16226, 1, 622, 1),
+('民主黨人', '민주당원', 16227, 1, 615, 1),
+('空氣方席自動車', '공기방석자동차', 16228, 1, 614, 1),
+('原子力發電所', '원자력발전소', 16229, 1, 613, 1),
+('無人航空機', '무인항공기', 16230, 1, 612, 1),
+('電子工學', '전자공학', 16231, 1, 610, 1),
+('無神論者', '무신론자', 16232, 1, 609, 1),
+('美國人', '미국인', 16233, 1, 601, 1),
+('生理學', '생리학', 16234, 1, 597, 1),
+('中世國語', '중세국어', 16235, 1, 596, 1),
+('動物學', '동물학', 16236, 1, 595, 1),
+('人事-', '인사말', 16237, 1, 593, 1),
+('延世大學校', '연세대학교', 16238, 1, 586, 1),
+('異性愛者', '이성애자', 16239, 1, 585, 1),
+('韓國人', '한국인', 16240, 1, 581, 1),
+('美術大學', '미술대학', 16241, 1, 581, 1),
+('軍國主義', '군국주의', 16242, 1, 579, 1),
+('古代 韓國語', '고대 한국어', 16243, 1, 576, 1),
+('地理學', '지리학', 16244, 1, 575, 1),
+('愛國主義', '애국주의', 16245, 1, 573, 1),
+('學生會', '학생회', 16246, 1, 570, 1),
+('民族社會主義', '민족사회주의', 16247, 1, 569, 1),
+('大學敎授', '대학교수', 16248, 1, 568, 1),
+('女學生', '녀학생', 16249, 1, 567, 1),
+('地文學', '지문학', 16250, 1, 566, 1),
+('登場人物', '등장인물', 16251, 1, 566, 1),
+('水文學', '수문학', 16252, 1, 564, 1),
+('兩性愛者', '양성애자', 16253, 1, 564, 1),
+('世界 總大主敎', '세계 총대주교', 16254, 1, 564, 1),
+('山主人', '산주인', 16255, 1, 561, 1),
+('適者生存', '적자생존', 16256, 1, 560, 1),
+('發生學', '발생학', 16257, 1, 556, 1),
+('電氣自動車', '전기자동차', 16258, 1, 556, 1),
+('動力學', '동역학', 16259, 1, 552, 1),
+('國語羅馬字', '국어라마자', 16260, 1, 552, 1),
+('地球科學', '지구과학', 16261, 1, 549, 1),
+('無法者', '무법자', 16262, 1, 547, 1),
+('古生態學', '고생태학', 16263, 1, 547, 1),
+('電氣工學', '전기공학', 16264, 1, 547, 1),
+('近代 韓國語', '근대 한국어', 16265, 1, 545, 1),
+('發行人', '발행인', 16266, 1, 544, 1),
+('韓國學', '한국학', 16267, 1, 543, 1),
+('反知性主義', '반지성주의', 16268, 1, 542, 1),
+('野生 動物', '야생 동물', 16269, 1, 542, 1),
+('地名學', '지명학', 16270, 1, 541, 1),
+('超心理學', '초심리학', 16271, 1, 541, 1),
+('人海戰術', '인해전술', 16272, 1, 539, 1),
+('學校生活', '학교생활', 16273, 1, 537, 1),
+('小學生', '소학생', 16274, 1, 535, 1),
+('古代國語', '고대국어', 16275, 1, 535, 1),
+('民主社會主義', '민주사회주의', 16276, 1, 534, 1),
+('女性主義', '여성주의', 16277, 1, 533, 1),
+('人間性', '인간성', 16278, 1, 530, 1),
+('科學博物館', '과학박물관', 16279, 1, 523, 1),
+('通行人', '통행인', 16280, 1, 521, 1),
+('記者會見', '기자회견', 16281, 1, 521, 1),
+('帝國主義', '제국주의', 16282, 1, 521, 1),
+('現代國語', '현대국어', 16283, 1, 521, 1),
+('事業者', '사업자', 16284, 1, 520, 1),
+('言語學', '언어학', 16285, 1, 520, 1),
+('精神病者', '정신병자', 16286, 1, 518, 1),
+('國際主義', '국제주의', 16287, 1, 517, 1),
+('獨立國家聯合', '독립국가연합', 16288, 1, 517, 1),
+('光子學', '광자학', 16289, 1, 515, 1),
+('人力車', '인력거', 16290, 1, 514, 1),
+('有色人種', '유색인종', 16291, 1, 514, 1),
+('大人', '대인', 16292, 1, 513, 1),
+('古植物學', '고식물학', 16293, 1, 513, 1),
+('南中國海', '남중국해', 16294, 1, 513, 1),
+('地形學', '지형학', 16295, 1, 511, 1),
+('學生證', '학생증', 16296, 1, 509, 1),
+('天文學', '천문학', 16297, 1, 507, 1),
+('文化大革命', '문화대혁명', 16298, 1, 505, 1),
+('近代國語', '근대국어', 16299, 1, 504, 1),
+('國學', '국학', 16300, 1, 502, 1),
+('權力者', '권력자', 16301, 1, 502, 1),
+('學生服', '학생복', 16302, 1, 501, 1),
+('寄生蟲學', '기생충학', 16303, 1, 500, 1),
+('大公國', '대공국', 16304, 1, 499, 1),
+('有力者', '유력자', 16305, 1, 499, 1),
+('中國化', '중국화', 16306, 1, 497, 1),
+('自由中國', '자유중국', 16307, 1, 497, 1),
+('富者-', '부잣집', 16308, 1, 496, 1),
+('地質學', '지질학', 16309, 1, 495, 1),
+('優生學', '우생학', 16310, 1, 492, 1),
+('生物體', '생물체', 16311, 1, 491, 1),
+('生態學', '생태학', 16312, 1, 491, 1),
+('外部人', '외부인', 16313, 1, 490, 1),
+('高等小學校', '고등소학교', 16314, 1, 490, 1),
+('同名人', '동명인', 16315, 1, 489, 1),
+('不良 國家', '불량 국가', 16316, 1, 488, 1),
+('出品者', '출품자', 16317, 1, 487, 1),
+('東中國海', '동중국해', 16318, 1, 487, 1),
+('人的', '인적', 16319, 1, 486, 1),
+('科學的', '과학적', 16320, 1, 486, 1),
+('日本學', '일본학', 16321, 1, 486, 1),
+('修道者', '수도자', 16322, 1, 484, 1),
+('民間人', '민간인', 16323, 1, 483, 1),
+('熱化學', '열화학', 16324, 1, 481, 1),
+('全體主義', '전체주의', 16325, 1, 481, 1),
+('病理學', '병리학', 16326, 1, 480, 1),
+('女大生', '여대생', 16327, 1, 480, 1),
+('煽動者', '선동자', 16328, 1, 479, 1),
+('旅行者', '여행자', 16329, 1, 479, 1),
+('地圖學', '지도학', 16330, 1, 478, 1),
+('尾行者', '미행자', 16331, 1, 477, 1),
+('女學生', '여학생', 16332, 1, 477, 1),
+('行政學', '행정학', 16333, 1, 476, 1),
+('分配者', '분배자', 16334, 1, 474, 1),
+('語源學', '어원학', 16335, 1, 474, 1),
+('大韓帝國', '대한제국', 16336, 1, 474, 1),
+('原理主義', '원리주의', 16337, 1, 473, 1),
+('超強大國', '초강대국', 16338, 1, 472, 1),
+('代作者', '대작자', 16339, 1, 471, 1),
+('自然人', '자연인', 16340, 1, 471, 1),
+('留學生', '유학생', 16341, 1, 470, 1),
+('軟體動物', '연체동물', 16342, 1, 470, 1),
+('古氣候學', '고기후학', 16343, 1, 468, 1),
+('藥理學', '약리학', 16344, 1, 467, 1),
+('初心者', '초심자', 16345, 1, 467, 1),
+('中國共産黨', '중국공산당', 16346, 1, 467, 1),
+('正音學', '정음학', 16347, 1, 466, 1),
+('代數學', '대수학', 16348, 1, 464, 1),
+('鑛物學', '광물학', 16349, 1, 463, 1),
+('人工知能', '인공지능', 16350, 1, 463, 1),
+('半神半人', '반신반인', 16351, 1, 462, 1),
+('利用者', '리용자', 16352, 1, 460, 1),
+('利用者', '이용자', 16353, 1, 460, 1),
+('自由人', '자유인', 16354, 1, 460, 1),
+('國際補助語', '국제보조어', 16355, 1, 459, 1),
+('食人種', '식인종', 16356, 1, 458, 1),
+('愛國的', '애국적', 16357, 1, 458, 1),
+('金石學', '금석학', 16358, 1, 457, 1),
+('音樂學', '음악학', 16359, 1, 455, 1),
+('子音-', '자음자', 16360, 1, 455, 1),
+('會見者', '회견자', 16361, 1, 455, 1),
+('人中', '인중', 16362, 1, 454, 1),
+('中人', '중인', 16363, 1, 454, 1),
+('局外者', '국외자', 16364, 1, 454, 1),
+('地震學', '지진학', 16365, 1, 454, 1),
+('理想主義', '리상주의', 16366, 1, 454, 1),
+('計量經濟學', '계량경제학', 16367, 1, 454, 1),
+('大英帝國', '대영제국', 16368, 1, 453, 1),
+('博物學', '박물학', 16369, 1, 452, 1),
+('說敎者', '설교자', 16370, 1, 452, 1),
+('年代學', '연대학', 16371, 1, 452, 1),
+('強大國', '강대국', 16372, 1, 451, 1),
+('分光學', '분광학', 16373, 1, 451, 1),
+('會計學', '회계학', 16374, 1, 449, 1),
+('擬人法', '의인법', 16375, 1, 448, 1),
+('一人稱', '일인칭', 16376, 1, 448, 1),
+('草食 動物', '초식 동물', 16377, 1, 448, 1),
+('内部者 去來', '내부자 거래', 16378, 1, 448, 1),
+('自動 應答機', '자동 응답기', 16379, 1, 448, 1),
+('開發者', '개발자', 16380, 1, 447, 1),
+('水道-', '수돗물', 16381, 1, 447, 1),
+('出願者', '출원자', 16382, 1, 447, 1),
+('祖國解放戰爭', '조국해방전쟁', 16383, 1, 447, 1),
+('樂天主義', '낙천주의', 16384, 1, 446, 1),
+('彈道學', '탄도학', 16385, 1, 445, 1),
+('大陸 間 彈道 미사일', '대륙 간 탄도 미사일', 16386, 1, 445, 1),
+('日本 帝國', '일본 제국', 16387, 1, 444, 1),
+('同調者', '동조자', 16388, 1, 443, 1),
+('音聲學', '음성학', 16389, 1, 443, 1),
+('線形動物', '선형동물', 16390, 1, 443, 1),
+('自動的', '자동적', 16391, 1, 442, 1),
+('提出者', '제출자', 16392, 1, 442, 1),
+('罷業破壞者', '파업파괴자', 16393, 1, 442, 1),
+('排他的經濟水域', '배타적경제수역', 16394, 1, 442, 1),
+('發送者', '발송자', 16395, 1, 441, 1),
+('人口調査', '인구조사', 16396, 1, 441, 1),
+('現代人', '현대인', 16397, 1, 440, 1),
+('密輸業者', '밀수업자', 16398, 1, 440, 1),
+('電氣綜合樂器', '전기종합악기', 16399, 1, 440, 1),
+('人文', '인문', 16400, 1, 439, 1),
+('分類學', '분류학', 16401, 1, 439, 1),
+('人力', '인력', 16402, 1, 437, 1),
+('分子體', '분자체', 16403, 1, 437, 1),
+('自動販賣機', '자동판매기', 16404, 1, 437, 1),
+('民主的', '민주적', 16405, 1, 435, 1),
+('人分', '인분', 16406, 1, 434, 1),
+('肉食 動物', '육식 동물', 16407, 1, 434, 1),
+('數抛者', '수포자', 16408, 1, 433, 1),
+('人民幣', '인민폐', 16409, 1, 433, 1),
+('人種差別', '인종차별', 16410, 1, 433, 1),
+('人種 差別', '인종 차별', 16411, 1, 433, 1),
+('中醫學', '중의학', 16412, 1, 432, 1),
+('開發途上國', '개발도상국', 16413, 1, 431, 1),
+('雜食 動物', '잡식 동물', 16414, 1, 430, 1),
+('記者團', '기자단', 16415, 1, 428, 1),
+('文化的', '문화적', 16416, 1, 428, 1),
+('背敎者', '배교자', 16417, 1, 428, 1),
+('解說者', '해설자', 16418, 1, 427, 1),
+('科學小說', '과학소설', 16419, 1, 427, 1),
+('君子之國', '군자지국', 16420, 1, 427, 1),
+('老年醫學', '노인의학', 16421, 1, 427, 1),
+('人間關係', '인간관계', 16422, 1, 427, 1),
+('物自體', '물자체', 16423, 1, 426, 1),
+('日本國', '일본국', 16424, 1, 426, 1),
+('無脊椎動物', '무척추동물', 16425, 1, 426, 1),
+('微分學', '미분학', 16426, 1, 425, 1),
+('氣象學', '기상학', 16427, 1, 424, 1),
+('放射線學', '방사선학', 16428, 1, 423, 1),
+('民族主義', '민족주의', 16429, 1, 422, 1),
+('民族學', '민족학', 16430, 1, 421, 1),
+('女中生', '여중생', 16431, 1, 421, 1),
+('積分學', '적분학', 16432, 1, 420, 1),
+('人造人間', '인조인간', 16433, 1, 420, 1),
+('精神醫學', '정신의학', 16434, 1, 420, 1),
+('不入虎穴 不得虎子', '불입호혈 부득호자', 16435, 1, 419, 1),
+('女人', '녀인', 16436, 1, 418, 1),
+('國有化', '국유화', 16437, 1, 418, 1),
+('亂入者', '난입자', 16438, 1, 418, 1),
+('反亂者', '반란자', 16439, 1, 418, 1),
+('文獻學', '문헌학', 16440, 1, 417, 1),
+('神經學', '신경학', 16441, 1, 417, 1),
+('預金者', '예금자', 16442, 1, 417, 1),
+('筆記者', '필기자', 16443, 1, 417, 1),
+('中學', '중학', 16444, 1, 416, 1),
+('代辯者', '대변자', 16445, 1, 416, 1),
+('倫理學', '륜리학', 16446, 1, 416, 1),
+('自動化', '자동화', 16447, 1, 416, 1),
+('殉敎者', '순교자', 16448, 1, 415, 1),
+('豫言者', '예언자', 16449, 1, 415, 1),
+('非論理的', '비논리적', 16450, 1, 415, 1),
+('尋常小學校', '심상소학교', 16451, 1, 415, 1),
+('連鎖殺人犯', '연쇄살인범', 16452, 1, 415, 1),
+('國際語', '국제어', 16453, 1, 414, 1),
+('新參者', '신참자', 16454, 1, 414, 1),
+('抗生物質', '항생물질', 16455, 1, 414, 1),
+('純文學', '순문학', 16456, 1, 413, 1),
+('案內人', '안내인', 16457, 1, 413, 1),
+('帳本人', '장본인', 16458, 1, 413, 1),
+('南大門市場', '남대문시장', 16459, 1, 413, 1),
+('食人', '식인', 16460, 1, 412, 1),
+('氣候學', '기후학', 16461, 1, 412, 1),
+('總支配人', '총지배인', 16462, 1, 412, 1),
+('表語文字', '표어문자', 16463, 1, 412, 1),
+('超現實主義', '초현실주의', 16464, 1, 412, 1),
+('正犯者', '정범자', 16465, 1, 411, 1),
+('三人稱', '삼인칭', 16466, 1, 410, 1),
+('海洋學', '해양학', 16467, 1, 410, 1),
+('挑戰者', '도전자', 16468, 1, 409, 1),
+('同居人', '동거인', 16469, 1, 409, 1),
+('通譯者', '통역자', 16470, 1, 409, 1),
+('利用者', '이용자', 16471, 1, 408, 1),
+('助言者', '조언자', 16472, 1, 408, 1),
+('人形劇', '인형극', 16473, 1, 407, 1),
+('重婚者', '중혼자', 16474, 1, 407, 1),
+('後見人', '후견인', 16475, 1, 407, 1),
+('後任者', '후임자', 16476, 1, 407, 1),
+('中古 漢語', '중고 한어', 16477, 1, 407, 1),
+('發展途上國', '발전도상국', 16478, 1, 406, 1),
+('質問者', '질문자', 16479, 1, 405, 1),
+('-平生', '한평생', 16480, 1, 405, 1),
+('公人', '공인', 16481, 1, 403, 1),
+('國內外', '국내외', 16482, 1, 403, 1),
+('泰國語', '태국어', 16483, 1, 403, 1),
+('性染色體', '성염색체', 16484, 1, 403, 1),
+('現代主義', '현대주의', 16485, 1, 403, 1),
+('一方通行路', '일방통행로', 16486, 1, 403, 1),
+('國際的', '국제적', 16487, 1, 402, 1),
+('先知者', '선지자', 16488, 1, 402, 1),
+('植民主義', '식민주의', 16489, 1, 402, 1),
+('言語道斷', '언어도단', 16490, 1, 402, 1),
+('八旬老人', '팔순노인', 16491, 1, 402, 1),
+('愛國心', '애국심', 16492, 1, 401, 1),
+('中生代', '중생대', 16493, 1, 401, 1),
+('君主國', '군주국', 16494, 1, 400, 1),
+('數理的', '수리적', 16495, 1, 400, 1),
+('壓制者', '압제자', 16496, 1, 400, 1),
+('學力', '학력', 16497, 1, 399, 1),
+('前任者', '전임자', 16498, 1, 399, 1),
+('菜食主義', '채식주의', 16499, 1, 399, 1),
+('耕作者', '경작자', 16500, 1, 396, 1),
+('女聲中音', '녀성중음', 16501, 1, 396, 1),
+('發光민大口', '발광민대구', 16502, 1, 396, 1),
+('貰入者', '세입자', 16503, 1, 395, 1),
+('解釋者', '해석자', 16504, 1, 395, 1),
+('感動的', '감동적', 16505, 1, 394, 1),
+('報告者', '보고자', 16506, 1, 394, 1),
+('下人', '하인', 16507, 1, 393, 1),
+('國家 憲兵', '국가 헌병', 16508, 1, 393, 1),
+('歐美人', '구미인', 16509, 1, 392, 1),
+('支配者', '지배자', 16510, 1, 392, 1),
+('自家用車', '자가용차', 16511, 1, 392, 1),
+('吸血動物', '흡혈동물', 16512, 1, 392, 1),
+('演說者', '연설자', 16513, 1, 391, 1),
+('接受人', '접수인', 16514, 1, 391, 1),
+('債權者', '채권자', 16515, 1, 391, 1),
+('設立者', '설립자', 16516, 1, 390, 1),
+('女大生', '여대생', 16517, 1, 390, 1),
+('敎育學', '교육학', 16518, 1, 389, 1),
+('豫約者', '예약자', 16519, 1, 389, 1),
+('出入國', '출입국', 16520, 1, 389, 1),
+('退職者', '퇴직자', 16521, 1, 389, 1),
+('相對主義', '상대주의', 16522, 1, 389, 1),
+('生態地域', '생태지역', 16523, 1, 389, 1),
+('愛玩動物', '애완동물', 16524, 1, 389, 1),
+('資本主義', '자본주의', 16525, 1, 389, 1),
+('弘益人間', '홍익인간', 16526, 1, 389, 1),
+('創立者', '창립자', 16527, 1, 388, 1),
+('防衛者', '방위자', 16528, 1, 387, 1),
+('投資者', '투자자', 16529, 1, 386, 1),
+('大衆音樂', '대중음악', 16530, 1, 386, 1),
+('修正主義', '수정주의', 16531, 1, 386, 1),
+('電氣椅子', '전기의자', 16532, 1, 386, 1),
+('中東呼吸器症候群', '중동호흡기증후군', 16533, 1, 386, 1),
+('後者', '후자', 16534, 1, 385, 1),
+('目擊者', '목격자', 16535, 1, 385, 1),
+('外家-', '외갓집', 16536, 1, 385, 1),
+('慰安者', '위안자', 16537, 1, 385, 1),
+('軍事行政', '군사행정', 16538, 1, 385, 1),
+('頭索動物', '두삭동물', 16539, 1, 385, 1),
+('美合衆國', '미합중국', 16540, 1, 385, 1),
+('性交體位', '성교체위', 16541, 1, 385, 1),
+('性交 體位', '성교 체위', 16542, 1, 385, 1),
+('官房學', '관방학', 16543, 1, 384, 1),
+('觀察者', '관찰자', 16544, 1, 384, 1),
+('西歐人', '서구인', 16545, 1, 384, 1),
+('神智學', '신지학', 16546, 1, 384, 1),
+('贊成者', '찬성자', 16547, 1, 384, 1),
+('領導者', '령도자', 16548, 1, 383, 1),
+('保菌者', '보균자', 16549, 1, 383, 1),
+('性愛物', '성애물', 16550, 1, 383, 1),
+('領導者', '영도자', 16551, 1, 383, 1),
+('反芻 動物', '반추 동물', 16552, 1, 383, 1),
+('婦人科', '부인과', 16553, 1, 382, 1),
+('根本主義', '근본주의', 16554, 1, 382, 1),
+('平和主義', '평화주의', 16555, 1, 382, 1),
+('良心的  兵役拒否', '양심적 병역거부자', 16556, 1, 382, 1),
+('工人', '공인', 16557, 1, 381, 1),
+('原人', '원인', 16558, 1, 381, 1),
+('亂暴者', '난폭자', 16559, 1, 381, 1),
+('代替醫學', '대체의학', 16560, 1, 381, 1),
+('經濟科學', '경제과학', 16561, 1, 380, 1),
+('二人稱', '이인칭', 16562, 1, 379, 1),
+('大氣現象', '대기현상', 16563, 1, 379, 1),
+('二酸化物', '이산화물', 16564, 1, 379, 1),
+('聯合 王國', '련합 왕국', 16565, 1, 379, 1),
+('聯合 王國', '연합 왕국', 16566, 1, 379, 1),
+('人權', '인권', 16567, 1, 378, 1),
+('國家元首', '국가원수', 16568, 1, 378, 1),
+('前者', '전자', 16569, 1, 377, 1),
+('合法的', '합법적', 16570, 1, 377, 1),
+('感傷主義', '감상주의', 16571, 1, 377, 1),
+('國聯 總會', '국련 총회', 16572, 1, 377, 1),
+('共編者', '공편자', 16573, 1, 376, 1),
+('放浪者', '방랑자', 16574, 1, 376, 1),
+('要求者', '요구자', 16575, 1, 376, 1),
+('遠心分離機', '원심분리기', 16576, 1, 376, 1),
+('有人', '유인', 16577, 1, 375, 1),
+('支持者', '지지자', 16578, 1, 374, 1),
+('初犯者', '초범자', 16579, 1, 374, 1),
+('加水分解', '가수분해', 16580, 1, 374, 1),
+('國立公園', '국립공원', 16581, 1, 374, 1),
+('老練者', '노련자', 16582, 1, 373, 1),
+('同義語', '동의어', 16583, 1, 373, 1),
+('奬學金', '장학금', 16584, 1, 373, 1),
+('中間子', '중간자', 16585, 1, 373, 1),
+('避難者', '피난자', 16586, 1, 373, 1),
+('電子書籍', '전자서적', 16587, 1, 373, 1),
+('防禦者', '방어자', 16588, 1, 372, 1),
+('受賞者', '수상자', 16589, 1, 372, 1),
+('被子植物', '피자식물', 16590, 1, 372, 1),
+('血淸學', '혈청학', 16591, 1, 371, 1),
+('露宿者', '노숙자', 16592, 1, 370, 1),
+('脫營者', '탈영자', 16593, 1, 370, 1),
+('統計學', '통계학', 16594, 1, 370, 1),
+('社會生活', '사회생활', 16595, 1, 370, 1),
+('有爪動物', '유조동물', 16596, 1, 370, 1),
+('流動體', '유동체', 16597, 1, 369, 1),
+('創設者', '창설자', 16598, 1, 369, 1),
+('形態學', '형태학', 16599, 1, 369, 1),
+('人質', '인질', 16600, 1, 368, 1),
+('美辭學', '미사학', 16601, 1, 368, 1),
+('獎學金', '장학금', 16602, 1, 368, 1),
+('主觀的', '주관적', 16603, 1, 368, 1),
+('科抛者', '과포자', 16604, 1, 367, 1),
+('入力 方法', '입력 방법', 16605, 1, 367, 1),
+('受驗者', '수험자', 16606, 1, 366, 1),
+('提案者', '제안자', 16607, 1, 366, 1),
+('支援者', '지원자', 16608, 1, 366, 1),
+('一酸化炭素', '일산화탄소', 16609, 1, 366, 1),
+('骨相學', '골상학', 16610, 1, 365, 1),
+('大動脈', '대동맥', 16611, 1, 365, 1),
+('目的地', '목적지', 16612, 1, 365, 1),
+('參席者', '참석자', 16613, 1, 365, 1),
+('債務者', '채무자', 16614, 1, 365, 1),
+('被爆者', '피폭자', 16615, 1, 365, 1),
+('勞動階級化', '로동계급화', 16616, 1, 365, 1),
+('講演者', '강연자', 16617, 1, 364, 1),
+('擔當者', '담당자', 16618, 1, 364, 1),
+('生物圈', '생물권', 16619, 1, 364, 1),
+('請願者', '청원자', 16620, 1, 364, 1),
+('禾本學', '화본학', 16621, 1, 364, 1),
+('吸煙者', '흡연자', 16622, 1, 364, 1),
+('一方通行', '일방통행', 16623, 1, 364, 1),
+('重商主義', '중상주의', 16624, 1, 364, 1),
+('容疑者', '용의자', 16625, 1, 363, 1),
+('聽取者', '청취자', 16626, 1, 363, 1),
+('大衆媒體', '대중매체', 16627, 1, 363, 1),
+('同化作用', '동화작용', 16628, 1, 363, 1),
+('韓國戰爭', '한국전쟁', 16629, 1, 363, 1),
+('能動的', '능동적', 16630, 1, 362, 1),
+('示威者', '시위자', 16631, 1, 362, 1),
+('申告人', '신고인', 16632, 1, 362, 1),
+('流行性', '유행성', 16633, 1, 362, 1),
+('寶劍仙人掌', '보검선인장', 16634, 1, 362, 1),
+('購讀者', '구독자', 16635, 1, 361, 1),
+('女同生', '녀동생', 16636, 1, 361, 1),
+('巡禮者', '순례자', 16637, 1, 361, 1),
+('女同生', '여동생', 16638, 1, 361, 1),
+('志願者', '지원자', 16639, 1, 361, 1),
+('證人', '증인', 16640, 1, 360, 1),
+('韓人', '한인', 16641, 1, 360, 1),
+('國際法', '국제법', 16642, 1, 360, 1),
+('中國말', '중국말', 16643, 1, 360, 1),
+('支拂人', '지불인', 16644, 1, 360, 1),
+('道路地圖', '도로지도', 16645, 1, 360, 1),
+('表現主義', '표현주의', 16646, 1, 360, 1),
+('地大', '지대', 16647, 1, 359, 1),
+('知人', '지인', 16648, 1, 359, 1),
+('原子力', '원자력', 16649, 1, 359, 1),
+('竹夫人', '죽부인', 16650, 1, 359, 1),
+('創始者', '창시자', 16651, 1, 359, 1),
+('復古主義', '복고주의', 16652, 1, 359, 1),
+('硫化水素', '유화수소', 16653, 1, 359, 1),
+('寄生物', '기생물', 16654, 1, 358, 1),
+('事業主', '사업주', 16655, 1, 358, 1),
+('追跡者', '추적자', 16656, 1, 358, 1),
+('個人崇拜', '개인숭배', 16657, 1, 358, 1),
+('弗化水素', '불화수소', 16658, 1, 358, 1),
+('陰性母音', '음성모음', 16659, 1, 358, 1),
+('主權在民', '주권재민', 16660, 1, 358, 1),
+('大水', '대수', 16661, 1, 357, 1),
+('異人', '이인', 16662, 1, 357, 1),
+('適者', '적자', 16663, 1, 357, 1),
+('國慶日', '국경일', 16664, 1, 357, 1),
+('保護主義', '보호주의', 16665, 1, 357, 1),
+('要人', '요인', 16666, 1, 356, 1),
+('中國', '중국', 16667, 1, 356, 1),
+('中國', '즁국', 16668, 1, 356, 1),
+('漢人', '한인', 16669, 1, 356, 1),
+('活動的', '활동적', 16670, 1, 356, 1),
+('博學多識', '박학다식', 16671, 1, 356, 1),
+('監督者', '감독자', 16672, 1, 355, 1),
+('東洋學', '동양학', 16673, 1, 355, 1),
+('猶太人', '유태인', 16674, 1, 355, 1),
+('非軍事化', '비군사화', 16675, 1, 355, 1),
+('萬人', '만인', 16676, 1, 354, 1),
+('僞善者', '위선자', 16677, 1, 354, 1),
+('組織者', '조직자', 16678, 1, 354, 1),
+('人望', '인망', 16679, 1, 353, 1),
+('考古學', '고고학', 16680, 1, 353, 1),
+('熟練者', '숙련자', 16681, 1, 353, 1),
+('權威主義', '권위주의', 16682, 1, 353, 1),
+('歸還者', '귀환자', 16683, 1, 352, 1),
+('心肺蘇生術', '심폐소생술', 16684, 1, 352, 1),
+('未來學', '미래학', 16685, 1, 351, 1),
+('印刷者', '인쇄자', 16686, 1, 351, 1),
+('解釋學', '해석학', 16687, 1, 351, 1),
+('皮膚科學', '피부과학', 16688, 1, 351, 1),
+('上古 漢語', '상고 한어', 16689, 1, 351, 1),
+('客人', '객인', 16690, 1, 350, 1),
+('現象學', '현상학', 16691, 1, 350, 1),
+('性的虐待', '성적학대', 16692, 1, 350, 1),
+('納稅者', '납세자', 16693, 1, 349, 1),
+('受動的', '수동적', 16694, 1, 349, 1),
+('英抛者', '영포자', 16695, 1, 349, 1),
+('動物界', '동물계', 16696, 1, 348, 1),
+('密獵者', '밀렵자', 16697, 1, 348, 1),
+('急進主義', '급진주의', 16698, 1, 348, 1),
+('傾聽者', '경청자', 16699, 1, 347, 1),
+('遺傳學', '유전학', 16700, 1, 347, 1),
+('年中無休', '연중무휴', 16701, 1, 347, 1),
+('厭世主義', '염세주의', 16702, 1, 347, 1),
+('海外旅行', '해외여행', 16703, 1, 347, 1),
+('試掘者', '시굴자', 16704, 1, 346, 1),
+('原語民', '원어민', 16705, 1, 346, 1),
+('日本化', '일본화', 16706, 1, 346, 1),
+('編輯者', '편집자', 16707, 1, 346, 1),
+('粒子加速器', '입자가속기', 16708, 1, 346, 1),
+('洗者', '세자', 16709, 1, 345, 1),
+('生命力', '생명력', 16710, 1, 345, 1),
+('首長國', '수장국', 16711, 1, 345, 1),
+('崇拜者', '숭배자', 16712, 1, 345, 1),
+('仲裁人', '중재인', 16713, 1, 345, 1),
+('工業團地', '공업단지', 16714, 1, 345, 1),
+('遲刻者', '지각자', 16715, 1, 344, 1),
+('大器晩成', '대기만성', 16716, 1, 344, 1),
+('自國', '자국', 16717, 1, 343, 1),
+('-瞳子', '눈동자', 16718, 1, 343, 1),
+('流刑者', '유형자', 16719, 1, 343, 1),
+('鳥類學', '조류학', 16720, 1, 343, 1),
+('棘皮動物', '극피동물', 16721, 1, 343, 1),
+('婉曲語法', '완곡어법', 16722, 1, 343, 1),
+('刺胞動物', '자포동물', 16723, 1, 343, 1),
+('英國 海峽', '영국 해협', 16724, 1, 343, 1),
+('美學', '미학', 16725, 1, 342, 1),
+('酸化物', '산화물', 16726, 1, 342, 1),
+('修辭學', '수사학', 16727, 1, 342, 1),
+('一品料理', '일품요리', 16728, 1, 342, 1),
+('大西洋大口', '대서양대구', 16729, 1, 342, 1),
+('供託者', '공탁자', 16730, 1, 341, 1),
+('動物園', '동물원', 16731, 1, 341, 1),
+('部分的', '부분적', 16732, 1, 341, 1),
+('敍述者', '서술자', 16733, 1, 341, 1),
+('血清學', '혈청학', 16734, 1, 341, 1),
+('極端主義', '극단주의', 16735, 1, 341, 1),
+('急造爆發物', '급조폭발물', 16736, 1, 341, 1),
+('邦人', '방인', 16737, 1, 340, 1),
+('熱學', '열학', 16738, 1, 340, 1),
+('冒險者', '모험자', 16739, 1, 340, 1),
+('編輯人', '편집인', 16740, 1, 340, 1),
+('從者', '종자', 16741, 1, 339, 1),
+('構造主義', '구조주의', 16742, 1, 339, 1),
+('敗者', '패자', 16743, 1, 338, 1),
+('良人', '양인', 16744, 1, 337, 1),
+('卑怯者', '비겁자', 16745, 1, 337, 1),
+('逮捕者', '체포자', 16746, 1, 337, 1),
+('治外法權', '치외법권', 16747, 1, 337, 1),
+('貴人', '귀인', 16748, 1, 336, 1),
+('富者', '부재', 16749, 1, 336, 1),
+('人參', '인삼', 16750, 1, 336, 1),
+('自行車', '자행거', 16751, 1, 336, 1),
+('招人鐘', '초인종', 16752, 1, 336, 1),
+('不買運動', '불매운동', 16753, 1, 336, 1),
+('神經多樣性', '신경다양성', 16754, 1, 336, 1),
+('人의  障', '인의 장벽', 16755, 1, 336, 1),
+('脅迫者', '협박자', 16756, 1, 335, 1),
+('聯合國', '연합국', 16757, 1, 334, 1),
+('仲介人', '중개인', 16758, 1, 334, 1),
+('仲媒人', '중매인', 16759, 1, 334, 1),
+('動物崇拜', '동물숭배', 16760, 1, 334, 1),
+('國境警備隊', '국경경비대', 16761, 1, 334, 1),
+('漢語 拼音', '한어 병음', 16762, 1, 334, 1),
+('原動力', '원동력', 16763, 1, 333, 1),
+('流動資本', '유동자본', 16764, 1, 333, 1),
+('大西洋鰱魚', '대서양연어', 16765, 1, 333, 1),
+('友人', '우인', 16766, 1, 332, 1),
+('濠洲人', '호주인', 16767, 1, 332, 1),
+('軍事化', '군사화', 16768, 1, 331, 1),
+('無氣力', '무기력', 16769, 1, 331, 1),
+('電子揭示板', '전자게시판', 16770, 1, 331, 1),
+('賢者', '현자', 16771, 1, 330, 1),
+('一方的', '일방적', 16772, 1, 329, 1),
+('金正日花', '김정일화', 16773, 1, 329, 1),
+('脊椎動物', '척추동물', 16774, 1, 329, 1),
+('人蔘茶', '인삼차', 16775, 1, 328, 1),
+('驅人', '구인', 16776, 1, 327, 1),
+('占星學', '점성학', 16777, 1, 327, 1),
+('藻類學', '조류학', 16778, 1, 327, 1),
+('電子郵便', '전자우편', 16779, 1, 327, 1),
+('傳統文化', '전통문화', 16780, 1, 327, 1),
+('救急衛生車', '구급위생차', 16781, 1, 327, 1),
+('蠻人', '만인', 16782, 1, 326, 1),
+('民國', '민국', 16783, 1, 326, 1),
+('大氣圈', '대기권', 16784, 1, 326, 1),
+('細胞學', '세포학', 16785, 1, 326, 1),
+('子會社', '자회사', 16786, 1, 326, 1),
+('地域社會', '지역사회', 16787, 1, 326, 1),
+('者', '자', 16788, 1, 325, 1),
+('屈地性', '굴지성', 16789, 1, 325, 1),
+('慢性的', '만성적', 16790, 1, 325, 1),
+('無國籍', '무국적', 16791, 1, 325, 1),
+('外界語', '외계어', 16792, 1, 325, 1),
+('街頭女性', '가두녀성', 16793, 1, 325, 1),
+('女子親舊', '여자친구', 16794, 1, 325, 1),
+('教育學', '교육학', 16795, 1, 324, 1),
+('犯罪學', '범죄학', 16796, 1, 324, 1),
+('學習帳', '학습장', 16797, 1, 324, 1),
+('諸子百家', '제자백가', 16798, 1, 324, 1),
+('死角地帶', '사각지대', 16799, 1, 323, 1),
+('學說', '학설', 16800, 1, 322, 1),
+('筆跡學', '필적학', 16801, 1, 322, 1),
+('汎理神論', '범이신론', 16802, 1, 322, 1),
+('體外射精', '체외사정', 16803, 1, 321, 1),
+('猿人', '원인', 16804, 1, 320, 1),
+('縣人', '현인', 16805, 1, 320, 1),
+('性暴行', '성폭행', 16806, 1, 320, 1),
+('量子論', '양자론', 16807, 1, 320, 1),
+('長期的', '장기적', 16808, 1, 320, 1),
+('南極大陸', '남극대륙', 16809, 1, 320, 1),
+('証人', '증인', 16810, 1, 319, 1),
+('古文體', '고문체', 16811, 1, 319, 1),
+('言行一致', '언행일치', 16812, 1, 319, 1),
+('所用--', '소용없다', 16813, 1, 318, 1),
+('食器洗滌機', '식기세척기', 16814, 1, 318, 1),
+('公主病', '공주병', 16815, 1, 317, 1),
+('歷史學', '역사학', 16816, 1, 317, 1),
+('制動機', '제동기', 16817, 1, 317, 1),
+('一日三秋', '일일삼추', 16818, 1, 317, 1),
+('國名', '국명', 16819, 1, 316, 1),
+('生理', '생리', 16820, 1, 316, 1),
+('理神論', '이신론', 16821, 1, 316, 1),
+('天道敎', '천도교', 16822, 1, 316, 1),
+('金日成花', '김일성화', 16823, 1, 315, 1),
+('出身成分', '출신성분', 16824, 1, 315, 1),
+('史學', '사학', 16825, 1, 314, 1),
+('中子', '중자', 16826, 1, 314, 1),
+('學校', '학괴', 16827, 1, 314, 1),
+('夜行性', '야행성', 16828, 1, 314, 1),
+('第三帝國', '제삼제국', 16829, 1, 314, 1),
+('理想化', '이상화', 16830, 1, 313, 1),
+('地球本', '지구본', 16831, 1, 313, 1),
+('點心時間', '점심시간', 16832, 1, 313, 1),
+('女性嫌惡', '여성혐오', 16833, 1, 312, 1),
+('有機體', '유기체', 16834, 1, 311, 1),
+('英雄主義', '영웅주의', 16835, 1, 311, 1),
+('大東亞共榮圈', '대동아공영권', 16836, 1, 311, 1),
+('南大門', '남대문', 16837, 1, 310, 1),
+('組織學', '조직학', 16838, 1, 310, 1),
+('貨幣學', '화폐학', 16839, 1, 310, 1),
+('逃避主義', '도피주의', 16840, 1, 310, 1),
+('黃海南道', '황해남도', 16841, 1, 310, 1),
+('百聞이  不如一', '백문이 불여일견', 16842, 1, 310, 1),
+('大字報', '대자보', 16843, 1, 309, 1),
+('國敎', '국교', 16844, 1, 307, 1),
+('軍事政權', '군사정권', 16845, 1, 307, 1),
+('男同生', '남동생', 16846, 1, 306, 1),
+('自治體', '자치체', 16847, 1, 306, 1),
+('市外--', '시외버스', 16848, 1, 306, 1),
+('國公', '국공', 16849, 1, 305, 1),
+('語法', '어법', 16850, 1, 304, 1),
+('昆蟲學', '곤충학', 16851, 1, 304, 1),
+('原子爆彈', '원자폭탄', 16852, 1, 304, 1),
+('自動拳銃', '자동권총', 16853, 1, 304, 1),
+('旗學', '기학', 16854, 1, 303, 1),
+('內面的', '내면적', 16855, 1, 303, 1),
+('農事-', '농사일', 16856, 1, 303, 1),
+('發行所', '발행소', 16857, 1, 303, 1),
+('三國志', '삼국지', 16858, 1, 303, 1),
+('犬儒主義', '견유주의', 16859, 1, 303, 1),
+('農事--', '농사짓다', 16860, 1, 303, 1),
+('完璧主義', '완벽주의', 16861, 1, 303, 1),
+('黃海北道', '황해북도', 16862, 1, 303, 1),
+('的中', '적중', 16863, 1, 302, 1),
+('同盟國', '동맹국', 16864, 1, 302, 1),
+('活動家', '활동가', 16865, 1, 302, 1),
+('運動公園', '운동공원', 16866, 1, 302, 1),
+('自動階段', '자동계단', 16867, 1, 302, 1),
+('日語', '일어', 16868, 1, 301, 1),
+('勞動法', '노동법', 16869, 1, 301, 1),
+('免疫學', '면역학', 16870, 1, 301, 1),
+('通時的', '통시적', 16871, 1, 301, 1),
+('民俗音樂', '민속음악', 16872, 1, 301, 1),
+('生家', '생가', 16873, 1, 300, 1),
+('現代語', '현대어', 16874, 1, 300, 1),
+('浪漫主義', '낭만주의', 16875, 1, 300, 1),
+('不可知論', '불가지론', 16876, 1, 300, 1),
+('外孫子', '외손자', 16877, 1, 299, 1),
+('奬學金', '장학금', 16878, 1, 299, 1),
+('啓蒙主義', '계몽주의', 16879, 1, 299, 1),
+('蒙昧主義', '몽매주의', 16880, 1, 299, 1),
+('音聲 私書函', '음성 사서함', 16881, 1, 299, 1),
+('大數', '대수', 16882, 1, 298, 1),
+('日本海', '일본해', 16883, 1, 298, 1),
+('共和國', '공화국', 16884, 1, 297, 1),
+('多文化', '다문화', 16885, 1, 297, 1),
+('同性愛', '동성애', 16886, 1, 297, 1),
+('陰電子', '음전자', 16887, 1, 297, 1),
+('統語論', '통어론', 16888, 1, 297, 1),
+('二酸化炭素', '이산화탄소', 16889, 1, 297, 1),
+('民主黨', '민주당', 16890, 1, 296, 1),
+('第三國', '제삼국', 16891, 1, 296, 1),
+('文化住宅', '문화주택', 16892, 1, 296, 1),
+('飛行記錄裝置', '비행기록장치', 16893, 1, 296, 1),
+('-中', '그중', 16894, 1, 295, 1),
+('-中', '밤중', 16895, 1, 295, 1),
+('學童', '학동', 16896, 1, 295, 1),
+('目的論', '목적론', 16897, 1, 295, 1),
+('腫瘍學', '종양학', 16898, 1, 295, 1),
+('--中', '한밤중', 16899, 1, 295, 1),
+('平安南道', '평안남도', 16900, 1, 295, 1),
+('王子病', '왕자병', 16901, 1, 294, 1),
+('全體論', '전체론', 16902, 1, 294, 1),
+('地磁氣', '지자기', 16903, 1, 294, 1),
+('恐怖主義', '공포주의', 16904, 1, 294, 1),
+('學課', '학과', 16905, 1, 293, 1),
+('高校生', '고교생', 16906, 1, 293, 1),
+('同級生', '동급생', 16907, 1, 293, 1),
+('文化院', '문화원', 16908, 1, 293, 1),
+('新造語', '신조어', 16909, 1, 293, 1),
+('一神論', '일신론', 16910, 1, 293, 1),
+('電氣石', '전기석', 16911, 1, 293, 1),
+('民生', '민생', 16912, 1, 292, 1),
+('新字體', '신자체', 16913, 1, 292, 1),
+('最大限度', '최대한도', 16914, 1, 292, 1),
+('航空交通管制', '항공교통관제', 16915, 1, 292, 1),
+('愛國', '애국', 16916, 1, 291, 1),
+('外語', '외어', 16917, 1, 291, 1),
+('液化石油‒ ', '액화석유가스', 16918, 1, 291, 1),
+('蘭學', '난학', 16919, 1, 290, 1),
+('物理', '물리', 16920, 1, 290, 1),
+('天主教', '천주교', 16921, 1, 290, 1),
+('不動', '부동', 16922, 1, 289, 1),
+('疫學', '역학', 16923, 1, 289, 1),
+('象形文字', '상형문자', 16924, 1, 289, 1),
+('安樂椅子', '안락의자', 16925, 1, 289, 1),
+('集合名詞', '집합명사', 16926, 1, 289, 1),
+('不自然', '부자연', 16927, 1, 288, 1),
+('平安北道', '평안북도', 16928, 1, 288, 1),
+('合成錄音', '합성록음', 16929, 1, 288, 1),
+('學齡', '학령', 16930, 1, 287, 1),
+('生石灰', '생석회', 16931, 1, 287, 1),
+('地平線', '지평선', 16932, 1, 287, 1),
+('奬學', '장학', 16933, 1, 286, 1),
+('學閥', '학벌', 16934, 1, 286, 1),
+('生命權', '생명권', 16935, 1, 286, 1),
+('非營利團體', '비영리단체', 16936, 1, 286, 1),
+('幾何學', '기하학', 16937, 1, 285, 1),
+('膨脹主義', '팽창주의', 16938, 1, 285, 1),
+('表意文字', '표의문자', 16939, 1, 285, 1),
+('工業化', '공업화', 16940, 1, 284, 1),
+('美男子', '미남자', 16941, 1, 284, 1),
+('一神敎', '일신교', 16942, 1, 284, 1),
+('常染色體', '상염색체', 16943, 1, 284, 1),
+('急降下爆擊機', '급강하폭격기', 16944, 1, 284, 1),
+('水文', '수문', 16945, 1, 283, 1),
+('留學', '유학', 16946, 1, 283, 1),
+('美國', '미국', 16947, 1, 282, 1),
+('自由化', '자유화', 16948, 1, 282, 1),
+('生命保險', '생명보험', 16949, 1, 282, 1),
+('時間旅行', '시간여행', 16950, 1, 282, 1),
+('一回用品', '일회용품', 16951, 1, 282, 1),
+('水力', '수력', 16952, 1, 281, 1),
+('主力', '주력', 16953, 1, 281, 1),
+('半化石', '반화석', 16954, 1, 281, 1),
+('新生兒', '신생아', 16955, 1, 281, 1),
+('勞動組合', '노동조합', 16956, 1, 281, 1),
+('不道德', '부도덕', 16957, 1, 280, 1),
+('電子冊', '전자책', 16958, 1, 280, 1),
+('立憲君主制', '입헌군주제', 16959, 1, 280, 1),
+('年生', '년생', 16960, 1, 279, 1),
+('外的', '외적', 16961, 1, 279, 1),
+('沒食子', '몰식자', 16962, 1, 279, 1),
+('大統領令', '대통령령', 16963, 1, 279, 1),
+('水素爆彈', '수소폭탄', 16964, 1, 279, 1),
+('中等敎育', '중등교육', 16965, 1, 279, 1),
+('化石 燃料', '화석 연료', 16966, 1, 279, 1),
+('水分', '수분', 16967, 1, 278, 1),
+('散發的', '산발적', 16968, 1, 278, 1),
+('外向性', '외향성', 16969, 1, 278, 1),
+('北韓語', '북한어', 16970, 1, 277, 1),
+('分泌物', '분비물', 16971, 1, 277, 1),
+('安定性', '안정성', 16972, 1, 277, 1),
+('自然法', '자연법', 16973, 1, 277, 1),
+('全羅南道', '전라남도', 16974, 1, 277, 1),
+('懷中時計', '회중시계', 16975, 1, 277, 1),
+('-氣', '물기', 16976, 1, 276, 1),
+('方法論', '방법론', 16977, 1, 276, 1),
+('原産地', '원산지', 16978, 1, 276, 1),
+('音樂會', '음악회', 16979, 1, 276, 1),
+('定常的', '정상적', 16980, 1, 276, 1),
+('現實的', '현실적', 16981, 1, 276, 1),
+('民數記', '민수기', 16982, 1, 275, 1),
+('不德義', '부덕의', 16983, 1, 275, 1),
+('出版物', '출판물', 16984, 1, 275, 1),
+('電子가마', '전자가마', 16985, 1, 275, 1),
+('北海道', '북해도', 16986, 1, 274, 1),
+('相對的', '상대적', 16987, 1, 274, 1),
+('所在地', '소재지', 16988, 1, 274, 1),
+('民營化', '민영화', 16989, 1, 273, 1),
+('非營利的', '비영리적', 16990, 1, 273, 1),
+('-機', '헬기', 16991, 1, 272, 1),
+('外---', '외할머니', 16992, 1, 272, 1),
+('外----', '외할아버지', 16993, 1, 272, 1),
+('電子레인지', '전자레인지', 16994, 1, 272, 1),
+('數的', '수적', 16995, 1, 271, 1),
+('産業化', '산업화', 16996, 1, 271, 1),
+('女同生', '여동생', 16997, 1, 271, 1),
+('時代精神', '시대정신', 16998, 1, 271, 1),
+('男子親舊', '남자친구', 16999, 1, 270, 1),
+('全羅北道', '전라북도', 17000, 1, 270, 1),
+('地震海溢', '지진해일', 17001, 1, 270, 1),
+('媤同生', '시동생', 17002, 1, 269, 1),
+('落花生', '낙화생', 17003, 1, 268, 1),
+('中古車', '중고차', 17004, 1, 268, 1),
+('重水素', '중수소', 17005, 1, 268, 1),
+('少數民族', '소수민족', 17006, 1, 268, 1),
+('萬病通治藥', '만병통치약', 17007, 1, 268, 1),
+('高大', '고대', 17008, 1, 267, 1),
+('無重力', '무중력', 17009, 1, 267, 1),
+('新體制', '신체제', 17010, 1, 267, 1),
+('原子筆', '원자필', 17011, 1, 267, 1),
+('平和的', '평화적', 17012, 1, 267, 1),
+('傳道書', '전도서', 17013, 1, 266, 1),
+('政治的', '정치적', 17014, 1, 266, 1),
+('非常事態宣言', '비상사태선언', 17015, 1, 266, 1),
+('手語', '수어', 17016, 1, 265, 1),
+('近地點', '근지점', 17017, 1, 265, 1),
+('記錄的', '기록적', 17018, 1, 265, 1),
+('萬民法', '만민법', 17019, 1, 265, 1),
+('賣國奴', '매국노', 17020, 1, 265, 1),
+('性感帶', '성감대', 17021, 1, 265, 1),
+('水準器', '수준기', 17022, 1, 265, 1),
+('抽出物', '추출물', 17023, 1, 265, 1),
+('高速--', '고속버스', 17024, 1, 265, 1),
+('天氣預報', '청기예보', 17025, 1, 265, 1),
+('開途國', '개도국', 17026, 1, 264, 1),
+('數--', '수많다', 17027, 1, 264, 1),
+('數--', '수없이', 17028, 1, 264, 1),
+('心電計', '심전계', 17029, 1, 264, 1),
+('理論的', '이론적', 17030, 1, 264, 1),
+('市內--', '시내버스', 17031, 1, 264, 1),
+('大前提', '대전제', 17032, 1, 263, 1),
+('反體制', '반체제', 17033, 1, 263, 1),
+('出發點', '출발점', 17034, 1, 263, 1),
+('京畿忠清道方言', '경기충청도방언', 17035, 1, 263, 1),
+('同生', '동생', 17036, 1, 262, 1),
+('三大', '삼대', 17037, 1, 262, 1),
+('韓國', '한국', 17038, 1, 262, 1),
+('分光器', '분광기', 17039, 1, 262, 1),
+('師母-', '사모님', 17040, 1, 262, 1),
+('世界的', '세계적', 17041, 1, 262, 1),
+('現代化', '현대화', 17042, 1, 262, 1),
+('空氣方席', '공기방석', 17043, 1, 262, 1),
+('營利團體', '영리단체', 17044, 1, 262, 1),
+('伯理璽天德', '백리새천덕', 17045, 1, 262, 1),
+('國號', '국호', 17046, 1, 261, 1),
+('感覺的', '감각적', 17047, 1, 261, 1),
+('再生産', '재생산', 17048, 1, 261, 1),
+('天文臺', '천문대', 17049, 1, 261, 1),
+('食品保存料', '식품보존료', 17050, 1, 261, 1),
+('命名法', '명명법', 17051, 1, 260, 1),
+('王太子', '왕태자', 17052, 1, 260, 1),
+('異性愛', '이성애', 17053, 1, 260, 1),
+('最惠國', '최혜국', 17054, 1, 260, 1),
+('運營體制', '운영체제', 17055, 1, 260, 1),
+('-女', '그녀', 17056, 1, 259, 1),
+('大形', '대형', 17057, 1, 259, 1),
+('東國', '동국', 17058, 1, 259, 1),
+('自行', '자행', 17059, 1, 259, 1),
+('公分母', '공분모', 17060, 1, 259, 1),
+('相對性', '상대성', 17061, 1, 259, 1),
+('匿名-', '익명자', 17062, 1, 259, 1),
+('天文館', '천문관', 17063, 1, 259, 1),
+('可降水量', '가강수량', 17064, 1, 259, 1),
+('論功行賞', '논공행상', 17065, 1, 259, 1),
+('一件書類', '일건서류', 17066, 1, 259, 1),
+('觀光地', '관광지', 17067, 1, 258, 1),
+('發祥地', '발상지', 17068, 1, 258, 1),
+('氣化', '기화', 17069, 1, 257, 1),
+('機械化', '기계화', 17070, 1, 257, 1),
+('內容物', '내용물', 17071, 1, 257, 1),
+('同性婚', '동성혼', 17072, 1, 257, 1),
+('正敎會', '정교회', 17073, 1, 257, 1),
+('男性嫌惡', '남성혐오', 17074, 1, 257, 1),
+('佛蘭西語', '불란서어', 17075, 1, 257, 1),
+('食水', '식수', 17076, 1, 256, 1),
+('無分別', '무분별', 17077, 1, 256, 1),
+('撒水器', '살수기', 17078, 1, 256, 1),
+('水素彈', '수소탄', 17079, 1, 256, 1),
+('飮用水', '음용수', 17080, 1, 256, 1),
+('子午線', '자오선', 17081, 1, 256, 1),
+('新婚旅行', '신혼여행', 17082, 1, 256, 1),
+('國歌', '국가', 17083, 1, 255, 1),
+('國界', '국계', 17084, 1, 255, 1),
+('機體', '기체', 17085, 1, 255, 1),
+('美大', '미대', 17086, 1, 255, 1),
+('神主', '신주', 17087, 1, 255, 1),
+('中文', '중문', 17088, 1, 255, 1),
+('體外', '체외', 17089, 1, 255, 1),
+('強制的', '강제적', 17090, 1, 255, 1),
+('大過去', '대과거', 17091, 1, 255, 1),
+('反粒子', '반립자', 17092, 1, 255, 1),
+('否定的', '부정적', 17093, 1, 255, 1),
+('失語症', '실어증', 17094, 1, 255, 1),
+('國史', '국사', 17095, 1, 254, 1),
+('假言的', '가언적', 17096, 1, 254, 1),
+('滿洲國', '만주국', 17097, 1, 254, 1),
+('不合格', '불합격', 17098, 1, 254, 1),
+('色-', '색깔', 17099, 1, 253, 1),
+('食-', '식빵', 17100, 1, 253, 1),
+('出動', '출동', 17101, 1, 253, 1),
+('--色', '검정색', 17102, 1, 253, 1),
+('--色', '까만색', 17103, 1, 253, 1),
+('--色', '노란색', 17104, 1, 253, 1),
+('民法典', '민법전', 17105, 1, 253, 1),
+('--色', '보라색', 17106, 1, 253, 1),
+('父母-', '부모님', 17107, 1, 253, 1),
+('原子爐', '원자로', 17108, 1, 253, 1),
+('致死的', '치사적', 17109, 1, 253, 1),
+('--色', '파란색', 17110, 1, 253, 1),
+('--色', '하얀색', 17111, 1, 253, 1),
+('觀光--', '관광버스', 17112, 1, 253, 1),
+('腦下垂體', '뇌하수체', 17113, 1, 253, 1),
+('中篇小說', '중편소설', 17114, 1, 253, 1),
+('肛門性交', '항문성교', 17115, 1, 253, 1),
+('共同體', '공동체', 17116, 1, 252, 1),
+('多角的', '다각적', 17117, 1, 252, 1),
+('識別子', '식별자', 17118, 1, 252, 1),
+('必死的', '필사적', 17119, 1, 252, 1),
+('生活環境', '생활환경', 17120, 1, 252, 1),
+('國朝', '국조', 17121, 1, 251, 1),
+('女性', '녀성', 17122, 1, 251, 1),
+('水電', '수전', 17123, 1, 251, 1),
+('新語', '신어', 17124, 1, 251, 1),
+('集約的', '집약적', 17125, 1, 251, 1),
+('集會書', '집회서', 17126, 1, 251, 1),
+('世俗的', '세속적', 17127, 1, 250, 1),
+('-手巾', '손수건', 17128, 1, 250, 1),
+('風物詩', '풍물시', 17129, 1, 250, 1),
+('現實化', '현실화', 17130, 1, 250, 1),
+('神權政治', '신권정치', 17131, 1, 250, 1),
+('國聯', '국련', 17132, 1, 249, 1),
+('營利的', '영리적', 17133, 1, 249, 1),
+('創作物', '창작물', 17134, 1, 249, 1),
+('光化門', '광화문', 17135, 1, 248, 1),
+('論理積', '논리적', 17136, 1, 248, 1),
+('茶酒煎子', '찻주전자', 17137, 1, 248, 1),
+('觸法少年', '촉법소년', 17138, 1, 248, 1),
+('先語末 語尾', '선어말 어미', 17139, 1, 248, 1),
+('大聖堂', '대성당', 17140, 1, 247, 1),
+('熟語集', '숙어집', 17141, 1, 247, 1),
+('通行料', '통행료', 17142, 1, 247, 1),
+('事務職員', '사무직원', 17143, 1, 247, 1),
+('印歐語族', '인구어족', 17144, 1, 247, 1),
+('現在分詞', '현재분사', 17145, 1, 247, 1),
+('國亂', '국란', 17146, 1, 246, 1),
+('露國', '노국', 17147, 1, 246, 1),
+('露國', '로국', 17148, 1, 246, 1),
+('雇用主', '고용주', 17149, 1, 246, 1),
+('自由民', '자유민', 17150, 1, 246, 1),
+('黃海道', '황해도', 17151, 1, 246, 1),
+('相關--', '상관없다', 17152, 1, 246, 1),
+('指名手配', '지명수배', 17153, 1, 246, 1),
+('活動寫眞', '활동사진', 17154, 1, 246, 1),
+('遺傳子', '유전자', 17155, 1, 245, 1),
+('特産物', '특산물', 17156, 1, 245, 1),
+('行列字', '항렬자', 17157, 1, 245, 1),
+('島國', '도국', 17158, 1, 244, 1),
+('神性', '신성', 17159, 1, 244, 1),
+('外氣圈', '외기권', 17160, 1, 244, 1),
+('流行歌', '유행가', 17161, 1, 244, 1),
+('土着語', '토착어', 17162, 1, 244, 1),
+('交通料金', '교통요금', 17163, 1, 244, 1),
+('新婚旅行', '신혼여행', 17164, 1, 244, 1),
+('低體溫症', '저체온증', 17165, 1, 244, 1),
+('王權神授說', '왕권신수설', 17166, 1, 244, 1),
+('道義', '도의', 17167, 1, 243, 1),
+('閩南語', '민남어', 17168, 1, 243, 1),
+('數算機', '수산기', 17169, 1, 243, 1),
+('熱中症', '열중증', 17170, 1, 243, 1),
+('敵對的', '적대적', 17171, 1, 243, 1),
+('定期乘車券', '정기승차권', 17172, 1, 243, 1),
+('山水', '산수', 17173, 1, 242, 1),
+('水上', '수상', 17174, 1, 242, 1),
+('力道', '역도', 17175, 1, 242, 1),
+('不殺生', '불살생', 17176, 1, 242, 1),
+('三角法', '삼각법', 17177, 1, 242, 1),
+('遠心力', '원심력', 17178, 1, 242, 1),
+('自負心', '자부심', 17179, 1, 242, 1),
+('地球儀', '지구의', 17180, 1, 242, 1),
+('千兆國', '천조국', 17181, 1, 242, 1),
+('英國', '영국', 17182, 1, 241, 1),
+('配水管', '배수관', 17183, 1, 241, 1),
+('實際-', '실제로', 17184, 1, 241, 1),
+('審美的', '심미적', 17185, 1, 241, 1),
+('王大妃', '왕대비', 17186, 1, 241, 1),
+('抗生劑', '항생제', 17187, 1, 241, 1),
+('地域番號', '지역번호', 17188, 1, 241, 1),
+('個國', '개국', 17189, 1, 240, 1),
+('國境', '국경', 17190, 1, 240, 1),
+('美語', '미어', 17191, 1, 240, 1),
+('錄音器', '녹음기', 17192, 1, 240, 1),
+('錄音器', '록음기', 17193, 1, 240, 1),
+('熱氣球', '열기구', 17194, 1, 240, 1),
+('一片丹心', '일편단심', 17195, 1, 240, 1),
+('-山', '뒷산', 17196, 1, 239, 1),
+('山-', '산길', 17197, 1, 239, 1),
+('山-', '산속', 17198, 1, 239, 1),
+('兩性愛', '양성애', 17199, 1, 239, 1),
+('下水溝', '하수구', 17200, 1, 239, 1),
+('操作體系', '조작체계', 17201, 1, 239, 1),
+('他力本願', '타력본원', 17202, 1, 239, 1),
+('半生', '반생', 17203, 1, 238, 1),
+('汽化器', '기화기', 17204, 1, 238, 1),
+('大關嶺', '대관령', 17205, 1, 238, 1),
+('目標語', '목표어', 17206, 1, 238, 1),
+('發賣機', '발매기', 17207, 1, 238, 1),
+('國庫', '국고', 17208, 1, 237, 1),
+('假想的', '가상적', 17209, 1, 237, 1),
+('消極的', '소극적', 17210, 1, 237, 1),
+('弱音器', '약음기', 17211, 1, 237, 1),
+('自轉車', '재앤고', 17212, 1, 237, 1),
+('建國', '건국', 17213, 1, 236, 1),
+('流水', '유수', 17214, 1, 236, 1),
+('十一月', '11월', 17215, 1, 236, 1),
+('感情家', '감정가', 17216, 1, 236, 1),
+('古事記', '고사기', 17217, 1, 236, 1),
+('世界化', '세계화', 17218, 1, 236, 1),
+('超大型', '초대형', 17219, 1, 236, 1),
+('日就月將', '일취월장', 17220, 1, 236, 1),
+('故國', '고국', 17221, 1, 235, 1),
+('亡國', '망국', 17222, 1, 235, 1),
+('一理', '일리', 17223, 1, 235, 1),
+('自家', '자가', 17224, 1, 235, 1),
+('監理敎', '감리교', 17225, 1, 235, 1),
+('手數料', '수수료', 17226, 1, 235, 1),
+('五大湖', '오대호', 17227, 1, 235, 1),
+('絶對-', '절대로', 17228, 1, 235, 1),
+('過去分詞', '과거분사', 17229, 1, 235, 1),
+('氣力', '기력', 17230, 1, 234, 1),
+('物流', '물류', 17231, 1, 234, 1),
+('成語', '성어', 17232, 1, 234, 1),
+('利子', '이자', 17233, 1, 234, 1),
+('同情心', '동정심', 17234, 1, 234, 1),
+('亞大陸', '아대륙', 17235, 1, 234, 1),
+('陽電氣', '양전기', 17236, 1, 234, 1),
+('忠淸南道', '충청남도', 17237, 1, 234, 1),
+('水死', '수사', 17238, 1, 233, 1),
+('我國', '아국', 17239, 1, 233, 1),
+('丹楓國', '단풍국', 17240, 1, 233, 1),
+('無神經', '무신경', 17241, 1, 233, 1),
+('長音階', '장음계', 17242, 1, 233, 1),
+('傳統的', '전통적', 17243, 1, 233, 1),
+('大東', '대동', 17244, 1, 232, 1),
+('感電死', '감전사', 17245, 1, 232, 1),
+('舊字體', '구자체', 17246, 1, 232, 1),
+('福音書', '복음서', 17247, 1, 232, 1),
+('硏修生', '연수생', 17248, 1, 232, 1),
+('幹線道路', '간선도로', 17249, 1, 232, 1),
+('眞空淸掃器', '진공청소기', 17250, 1, 232, 1),
+('國寶', '국보', 17251, 1, 231, 1),
+('君主制', '군주제', 17252, 1, 231, 1),
+('繁體字', '번체자', 17253, 1, 231, 1),
+('分析家', '분석자', 17254, 1, 231, 1),
+('語彙集', '어휘집', 17255, 1, 231, 1),
+('皇太子', '황태자', 17256, 1, 231, 1),
+('孝子—', '효자손', 17257, 1, 231, 1),
+('—菓子 ', '밥풀과자', 17258, 1, 231, 1),
+('白衣民族', '백의민족', 17259, 1, 231, 1),
+('報道資料', '보도자료', 17260, 1, 231, 1),
+('酸素呼吸器', '산소호흡기', 17261, 1, 231, 1),
+('放射性  崩', '방사성 붕괴', 17262, 1, 231, 1),
+('-病', '눈병', 17263, 1, 230, 1),
+('民法', '민법', 17264, 1, 230, 1),
+('屬國', '속국', 17265, 1, 230, 1),
+('地球', '지구', 17266, 1, 230, 1),
+('構文論', '구문론', 17267, 1, 230, 1),
+('明朝體', '명조체', 17268, 1, 230, 1),
+('放射性', '방사성', 17269, 1, 230, 1),
+('病--', '병들다', 17270, 1, 230, 1),
+('西洋化', '서양화', 17271, 1, 230, 1),
+('創造的', '창조적', 17272, 1, 230, 1),
+('電化', '전화', 17273, 1, 229, 1),
+('正-', '정말', 17274, 1, 229, 1),
+('簡體字', '간체자', 17275, 1, 229, 1),
+('--場', '골프장', 17276, 1, 229, 1),
+('等價物', '등가물', 17277, 1, 229, 1),
+('手工業', '수공업', 17278, 1, 229, 1),
+('--場', '스키장', 17279, 1, 229, 1),
+('擬聲語', '의성어', 17280, 1, 229, 1),
+('正--', '정말로', 17281, 1, 229, 1),
+('朝鮮語', '조선어', 17282, 1, 229, 1),
+('主題曲', '주제곡', 17283, 1, 229, 1),
+('以北五道', '이북오도', 17284, 1, 229, 1),
+('美的', '미적', 17285, 1, 228, 1),
+('水球', '수구', 17286, 1, 228, 1),
+('野生', '야생', 17287, 1, 228, 1),
+('外氣', '외기', 17288, 1, 228, 1),
+('海中', '해중', 17289, 1, 228, 1),
+('經濟的', '경제적', 17290, 1, 228, 1),
+('排水管', '배수관', 17291, 1, 228, 1),
+('副産物', '부산물', 17292, 1, 228, 1),
+('丈母-', '장모님', 17293, 1, 228, 1),
+('情報化', '정보화', 17294, 1, 228, 1),
+('集團化', '집단화', 17295, 1, 228, 1),
+('獻身的', '헌신적', 17296, 1, 228, 1),
+('三頭政治', '삼두정치', 17297, 1, 228, 1),
+('印歐語系', '인구어계', 17298, 1, 228, 1),
+('七十年代', '칠십년대', 17299, 1, 228, 1),
+('—地 區 ', '가자 지구', 17300, 1, 228, 1),
+('火焰放射器', '화염방사기', 17301, 1, 228, 1),
+('그라프 理論', '그라프 리론', 17302, 1, 228, 1),
+('空-', '공짜', 17303, 1, 227, 1),
+('同性', '동성', 17304, 1, 227, 1),
+('鎖國', '쇄국', 17305, 1, 227, 1),
+('廣東語', '광동어', 17306, 1, 227, 1),
+('對位法', '대위법', 17307, 1, 227, 1),
+('半母音', '반모음', 17308, 1, 227, 1),
+('樞軸國', '추축국', 17309, 1, 227, 1),
+('安全家屋', '안전가옥', 17310, 1, 227, 1),
+('忠淸北道', '충청북도', 17311, 1, 227, 1),
+('檀國', '단국', 17312, 1, 226, 1),
+('憂國', '우국', 17313, 1, 226, 1),
+('流動', '유동', 17314, 1, 226, 1),
+('天文', '천문', 17315, 1, 226, 1),
+('—瞳子', '눈동자', 17316, 1, 226, 1),
+('對蹠的', '대척적', 17317, 1, 226, 1),
+('凡性愛', '범성애', 17318, 1, 226, 1),
+('不確實', '불확실', 17319, 1, 226, 1),
+('生態系', '생태계', 17320, 1, 226, 1),
+('修理工', '수리공', 17321, 1, 226, 1),
+('量子', '량자', 17322, 1, 225, 1),
+('發行', '발행', 17323, 1, 225, 1),
+('水原', '수원', 17324, 1, 225, 1),
+('精神病院', '정신병원', 17325, 1, 225, 1),
+('野球 選手', '야구 선수', 17326, 1, 225, 1),
+('南-', '남쪽', 17327, 1, 224, 1),
+('術語', '술어', 17328, 1, 224, 1),
+('兩國', '양국', 17329, 1, 224, 1),
+('泰國', '태국', 17330, 1, 224, 1),
+('長老敎', '장로교', 17331, 1, 224, 1),
+('主題歌', '주제가', 17332, 1, 224, 1),
+('勞動階級', '노동계급', 17333, 1, 224, 1),
+('勞動階級', '로동계급', 17334, 1, 224, 1),
+('汎在神論', '범재신론', 17335, 1, 224, 1),
+('使徒行傳', '사도행전', 17336, 1, 224, 1),
+('日刊新聞', '일간신문', 17337, 1, 224, 1),
+('大黃', '대황', 17338, 1, 223, 1),
+('書道', '서도', 17339, 1, 223, 1),
+('水母', '수모', 17340, 1, 223, 1),
+('原物', '원물', 17341, 1, 223, 1),
+('多神論', '다신론', 17342, 1, 223, 1),
+('無法', '무법', 17343, 1, 222, 1),
+('日出', '일출', 17344, 1, 222, 1),
+('天氣', '천기', 17345, 1, 222, 1),
+('高山病', '고산병', 17346, 1, 222, 1),
+('高出産', '고출산', 17347, 1, 222, 1),
+('近日點', '근일점', 17348, 1, 222, 1),
+('獨立性', '독립성', 17349, 1, 222, 1),
+('自然死', '자연사', 17350, 1, 222, 1),
+('貨物船', '화물선', 17351, 1, 222, 1),
+('共同 養育權', '공동 양육권', 17352, 1, 222, 1),
+('水平', '수평', 17353, 1, 221, 1),
+('白色症', '백색증', 17354, 1, 221, 1),
+('一元論', '일원론', 17355, 1, 221, 1),
+('酒煎子', '주전재', 17356, 1, 221, 1),
+('自然現象', '자연현상', 17357, 1, 221, 1),
+('論法', '논법', 17358, 1, 220, 1),
+('大總', '대충', 17359, 1, 220, 1),
+('物權', '물권', 17360, 1, 220, 1),
+('字體', '자체', 17361, 1, 220, 1),
+('作動', '작동', 17362, 1, 220, 1),
+('韓語', '한어', 17363, 1, 220, 1),
+('辯論家', '변론가', 17364, 1, 220, 1),
+('墺地利', '오지리', 17365, 1, 220, 1),
+('一回用', '일회용', 17366, 1, 220, 1),
+('地衣類', '지의류', 17367, 1, 220, 1),
+('會計士', '회계사', 17368, 1, 220, 1),
+('民事', '민사', 17369, 1, 219, 1),
+('寄生蟲', '기생충', 17370, 1, 219, 1),
+('熱處理', '열처리', 17371, 1, 219, 1),
+('外孫女', '외손녀', 17372, 1, 219, 1),
+('作曲家', '작곡가', 17373, 1, 219, 1),
+('戰略家', '전략가', 17374, 1, 219, 1),
+('文房四寶', '문방사보', 17375, 1, 219, 1),
+('觀世音菩薩', '관세음보살', 17376, 1, 219, 1),
+('支拂 不能', '지불 불능', 17377, 1, 219, 1),
+('藥物', '약물', 17378, 1, 218, 1),
+('土語', '토어', 17379, 1, 218, 1),
+('孔夫子', '공부자', 17380, 1, 218, 1),
+('關聯性', '관련성', 17381, 1, 218, 1),
+('鑛物油', '광물유', 17382, 1, 218, 1),
+('半導體', '반도체', 17383, 1, 218, 1),
+('書記素', '서기소', 17384, 1, 218, 1),
+('椰子油', '야자유', 17385, 1, 218, 1),
+('道路標識', '도로표지', 17386, 1, 218, 1),
+('長篇小說', '장편소설', 17387, 1, 218, 1),
+('強制收容所', '강제수용소', 17388, 1, 218, 1),
+('北-', '북쪽', 17389, 1, 217, 1),
+('分會', '분회', 17390, 1, 217, 1),
+('季節的', '계절적', 17391, 1, 217, 1),
+('孤立地', '고립지', 17392, 1, 217, 1),
+('門地枋', '문지방', 17393, 1, 217, 1),
+('心搏數', '심박수', 17394, 1, 217, 1),
+('音韻論', '음운론', 17395, 1, 217, 1),
+('作業場', '작업장', 17396, 1, 217, 1),
+('電磁氣', '전자기', 17397, 1, 217, 1),
+('擴大鏡', '확대경', 17398, 1, 217, 1),
+('高等敎育', '고등교육', 17399, 1, 217, 1),
+('公正去來', '공정거래', 17400, 1, 217, 1),
+('氣管支炎', '기관지염', 17401, 1, 217, 1),
+('四書五經', '사서오경', 17402, 1, 217, 1),
+('肢帶筋異營養症', '지대근이영양증', 17403, 1, 217, 1),
+('水素', '수소', 17404, 1, 216, 1),
+('神道', '신도', 17405, 1, 216, 1),
+('流體', '유체', 17406, 1, 216, 1),
+('質的', '질적', 17407, 1, 216, 1),
+('記念日', '기념일', 17408, 1, 216, 1),
+('微粒子', '미립자', 17409, 1, 216, 1),
+('論文', '론문', 17410, 1, 215, 1),
+('重水', '중수', 17411, 1, 215, 1),
+('太子', '태자', 17412, 1, 215, 1),
+('繼電氣', '계전기', 17413, 1, 215, 1),
+('屈光性', '굴광성', 17414, 1, 215, 1),
+('卵胎生', '난태생', 17415, 1, 215, 1),
+('大陸棚', '대륙붕', 17416, 1, 215, 1),
+('牧歌的', '목가적', 17417, 1, 215, 1),
+('反作用', '반작용', 17418, 1, 215, 1),
+('新義州', '신의주', 17419, 1, 215, 1),
+('歷史的', '역사적', 17420, 1, 215, 1),
+('英語圈', '영어권', 17421, 1, 215, 1),
+('遊園地', '유원지', 17422, 1, 215, 1),
+('自治制', '자치제', 17423, 1, 215, 1),
+('火--', '화나다', 17424, 1, 215, 1),
+('效果的', '효과적', 17425, 1, 215, 1),
+('滿場一致', '만장일치', 17426, 1, 215, 1),
+('無政府 狀態', '무정부 상태', 17427, 1, 215, 1),
+('語族', '어족', 17428, 1, 214, 1),
+('品性', '품성', 17429, 1, 214, 1),
+('歐美化', '구미화', 17430, 1, 214, 1),
+('亂氣流', '난기류', 17431, 1, 214, 1),
+('獨裁的', '독재적', 17432, 1, 214, 1),
+('白日夢', '백일몽', 17433, 1, 214, 1),
+('實社會', '실사회', 17434, 1, 214, 1),
+('地獄鐵', '지옥철', 17435, 1, 214, 1),
+('社內政治', '사내정치', 17436, 1, 214, 1),
+('西-', '서쪽', 17437, 1, 213, 1),
+('言動', '언동', 17438, 1, 213, 1),
+('月日', '월일', 17439, 1, 213, 1),
+('筆生', '필생', 17440, 1, 213, 1),
+('再出發', '재출발', 17441, 1, 213, 1),
+('千字文', '천자문', 17442, 1, 213, 1),
+('冠狀動脈', '관상동맥', 17443, 1, 213, 1),
+('--封紙', '비닐봉지', 17444, 1, 213, 1),
+('大逆', '대역', 17445, 1, 212, 1),
+('大帝', '대제', 17446, 1, 212, 1),
+('門-', '문밖', 17447, 1, 212, 1),
+('-門', '앞문', 17448, 1, 212, 1),
+('高氣壓', '고기압', 17449, 1, 212, 1),
+('區分字', '구분자', 17450, 1, 212, 1),
+('滿洲語', '만주어', 17451, 1, 212, 1),
+('植物油', '식물유', 17452, 1, 212, 1),
+('新世代', '신세대', 17453, 1, 212, 1),
+('--前', '오래전', 17454, 1, 212, 1),
+('長期間', '장기간', 17455, 1, 212, 1),
+('必然的', '필연적', 17456, 1, 212, 1),
+('格變化', '격변화', 17457, 1, 211, 1),
+('結晶水', '결정수', 17458, 1, 211, 1),
+('過渡的', '과도적', 17459, 1, 211, 1),
+('汎心論', '범심론', 17460, 1, 211, 1),
+('咸鏡南道', '함경남도', 17461, 1, 211, 1),
+('大君', '대군', 17462, 1, 210, 1),
+('大豆', '대두', 17463, 1, 210, 1),
+('道敎', '도교', 17464, 1, 210, 1),
+('流行', '류행', 17465, 1, 210, 1),
+('名分', '명분', 17466, 1, 210, 1),
+('生態', '생태', 17467, 1, 210, 1),
+('中點', '중점', 17468, 1, 210, 1),
+('犯罪的', '범죄적', 17469, 1, 210, 1),
+('事務員', '사무원', 17470, 1, 210, 1),
+('山海關', '산해관', 17471, 1, 210, 1),
+('料金所', '요금소', 17472, 1, 210, 1),
+('儀禮的', '의례적', 17473, 1, 210, 1),
+('地圖冊', '지도책', 17474, 1, 210, 1),
+('新聞用紙', '신문용지', 17475, 1, 210, 1),
+('頂上會談', '정상회담', 17476, 1, 210, 1),
+('大洞', '대동', 17477, 1, 209, 1),
+('無機', '무기', 17478, 1, 209, 1),
+('生育', '생육', 17479, 1, 209, 1),
+('-房', '안방', 17480, 1, 209, 1),
+('-房', '옆방', 17481, 1, 209, 1),
+('--房', '건넌방', 17482, 1, 209, 1),
+('--房', '노래방', 17483, 1, 209, 1),
+('房--', '방바닥', 17484, 1, 209, 1),
+('飛行士', '비행사', 17485, 1, 209, 1),
+('靑金石', '청금석', 17486, 1, 209, 1),
+('率先躬行', '솔선궁행', 17487, 1, 209, 1),
+('乳白色', '유백색', 17488, 1, 208, 1),
+('自尊感', '자존감', 17489, 1, 208, 1),
+('江原 方言', '강원 방언', 17490, 1, 208, 1),
+('大田', '대전', 17491, 1, 207, 1),
+('獨語', '독어', 17492, 1, 207, 1),
+('惡性', '악성', 17493, 1, 207, 1),
+('大邸宅', '대저택', 17494, 1, 207, 1),
+('新軍部', '신군부', 17495, 1, 207, 1),
+('柚子茶', '유자차', 17496, 1, 207, 1),
+('自己愛', '자기애', 17497, 1, 207, 1),
+('天安門', '천안문', 17498, 1, 207, 1),
+('總領事館', '총영사관', 17499, 1, 207, 1),
+('不死', '불사', 17500, 1, 206, 1),
+('水位', '수위', 17501, 1, 206, 1),
+('衛生', '위생', 17502, 1, 206, 1),
+('--便', '건너편', 17503, 1, 206, 1),
+('無言症', '무언증', 17504, 1, 206, 1),
+('白血病', '백혈병', 17505, 1, 206, 1),
+('最適化', '최적화', 17506, 1, 206, 1),
+('慶尙南道', '경상남도', 17507, 1, 206, 1),
+('甲子', '갑자', 17508, 1, 205, 1),
+('語辭', '어사', 17509, 1, 205, 1),
+('外食', '외식', 17510, 1, 205, 1),
+('制動', '제동', 17511, 1, 205, 1),
+('派生', '파생', 17512, 1, 205, 1),
+('可及的', '가급적', 17513, 1, 205, 1),
+('不信任', '불신임', 17514, 1, 205, 1),
+('中産層', '중산층', 17515, 1, 205, 1),
+('社會保障', '사회보장', 17516, 1, 205, 1),
+('先入先出', '선입선출', 17517, 1, 205, 1),
+('優柔不斷', '우유부단', 17518, 1, 205, 1),
+('廣大', '광대', 17519, 1, 204, 1),
+('露語', '노어', 17520, 1, 204, 1),
+('露語', '로어', 17521, 1, 204, 1),
+('別-', '별일', 17522, 1, 204, 1),
+('船主', '선주', 17523, 1, 204, 1),
+('主節', '주절', 17524, 1, 204, 1),
+('居住地', '거주지', 17525, 1, 204, 1),
+('公聽會', '공청회', 17526, 1, 204, 1),
+('男--', '남동생', 17527, 1, 204, 1),
+('獨占的', '독점적', 17528, 1, 204, 1),
+('四不像', '사불상', 17529, 1, 204, 1),
+('椰子樹', '야자수', 17530, 1, 204, 1),
+('專門化', '전문화', 17531, 1, 204, 1),
+('硬口蓋音', '경구개음', 17532, 1, 204, 1),
+('同君聯合', '동군연합', 17533, 1, 204, 1),
+('咸鏡北道', '함경북도', 17534, 1, 204, 1),
+('携帶用 風琴', '휴대용 풍금', 17535, 1, 204, 1),
+('母體', '모체', 17536, 1, 203, 1),
+('雄大', '웅대', 17537, 1, 203, 1),
+('合力', '합력', 17538, 1, 203, 1),
+('象徵的', '상징적', 17539, 1, 203, 1),
+('植物園', '식물원', 17540, 1, 203, 1),
+('十進法', '십진법', 17541, 1, 203, 1),
+('愛好家', '애호가', 17542, 1, 203, 1),
+('擬古體', '의고체', 17543, 1, 203, 1),
+('額面分割', '액면분할', 17544, 1, 203, 1),
+('再活用品', '재활용품', 17545, 1, 203, 1),
+('共同 親權', '공동 친권', 17546, 1, 203, 1),
+('不規則銀河', '불규칙은하', 17547, 1, 203, 1),
+('植生', '식생', 17548, 1, 202, 1),
+('價性比', '가성비', 17549, 1, 202, 1),
+('輕粒子', '경입자', 17550, 1, 202, 1),
+('領事官', '영사관', 17551, 1, 202, 1),
+('準備物', '준비물', 17552, 1, 202, 1),
+('執行官', '집행관', 17553, 1, 202, 1),
+('核廢水', '핵폐수', 17554, 1, 202, 1),
+('三十六計', '삼십육계', 17555, 1, 202, 1),
+('軟口蓋音', '연구개음', 17556, 1, 202, 1),
+('名詩 選集', '명시 선집', 17557, 1, 202, 1),
+('軍法', '군법', 17558, 1, 201, 1),
+('南行', '남행', 17559, 1, 201, 1),
+('法定', '법정', 17560, 1, 201, 1),
+('不通', '불통', 17561, 1, 201, 1),
+('俗語', '속어', 17562, 1, 201, 1),
+('主觀', '주관', 17563, 1, 201, 1),
+('水墨畫', '수묵화', 17564, 1, 201, 1),
+('身分證', '신분증', 17565, 1, 201, 1),
+('持續的', '지속적', 17566, 1, 201, 1),
+('土石流', '토석류', 17567, 1, 201, 1),
+('旣成世代', '기성세대', 17568, 1, 201, 1),
+('百科事典', '백과사전', 17569, 1, 201, 1),
+('相互作用', '상호작용', 17570, 1, 201, 1),
+('六二五戰爭', '육이오전쟁', 17571, 1, 201, 1),
+('權化', '권화', 17572, 1, 200, 1),
+('大嶺', '대령', 17573, 1, 200, 1),
+('邦語', '방어', 17574, 1, 200, 1),
+('相性', '상성', 17575, 1, 200, 1),
+('祖語', '조어', 17576, 1, 200, 1),
+('中風', '중풍', 17577, 1, 200, 1),
+('企業家', '기업가', 17578, 1, 200, 1),
+('水泳服', '수영복', 17579, 1, 200, 1),
+('銀河水', '은하수', 17580, 1, 200, 1),
+('添加物', '첨가물', 17581, 1, 200, 1),
+('侵略的', '침략적', 17582, 1, 200, 1),
+('卵子', '란자', 17583, 1, 199, 1),
+('病理', '병리', 17584, 1, 199, 1),
+('領地', '영지', 17585, 1, 199, 1),
+('長女', '장녀', 17586, 1, 199, 1),
+('評語', '평어', 17587, 1, 199, 1),
+('性賣買', '성매매', 17588, 1, 199, 1),
+('信憑性', '신빙성', 17589, 1, 199, 1),
+('旅行社', '여행사', 17590, 1, 199, 1),
+('日記帳', '일기장', 17591, 1, 199, 1),
+('定足數', '정족수', 17592, 1, 199, 1),
+('慶尙北道', '경상북도', 17593, 1, 199, 1),
+('群生', '군생', 17594, 1, 198, 1),
+('大尉', '대위', 17595, 1, 198, 1),
+('生捕', '생포', 17596, 1, 198, 1),
+('先物', '선물', 17597, 1, 198, 1),
+('聖水', '성수', 17598, 1, 198, 1),
+('一年', '일년', 17599, 1, 198, 1),
+('地支', '지지', 17600, 1, 198, 1),
+('天神', '천신', 17601, 1, 198, 1),
+('動映像', '동영상', 17602, 1, 198, 1),
+('武士道', '무사도', 17603, 1, 198, 1),
+('無彩色', '무채색', 17604, 1, 198, 1),
+('長短點', '장단점', 17605, 1, 198, 1),
+('抽象的', '추상적', 17606, 1, 198, 1),
+('一月', '1월', 17607, 1, 197, 1),
+('果物', '과물', 17608, 1, 197, 1),
+('大腿', '대퇴', 17609, 1, 197, 1),
+('的然', '적연', 17610, 1, 197, 1),
+('不眠症', '불면증', 17611, 1, 197, 1),
+('理容師', '이용사', 17612, 1, 197, 1),
+('電擊戰', '전격전', 17613, 1, 197, 1),
+('中秋節', '중추절', 17614, 1, 197, 1),
+('證明書', '증명서', 17615, 1, 197, 1),
+('數年', '수년', 17616, 1, 196, 1),
+('洋-', '양파', 17617, 1, 196, 1),
+('語末', '어말', 17618, 1, 196, 1),
+('主格', '주격', 17619, 1, 196, 1),
+('主父', '주부', 17620, 1, 196, 1),
+('地溫', '지온', 17621, 1, 196, 1),
+('弘大', '홍대', 17622, 1, 196, 1),
+('鑑定家', '감정가', 17623, 1, 196, 1),
+('蓋然性', '개연성', 17624, 1, 196, 1),
+('多孔性', '다공성', 17625, 1, 196, 1),
+('壓倒的', '압도적', 17626, 1, 196, 1),
+('洋--', '양배추', 17627, 1, 196, 1),
+('洋--', '양상추', 17628, 1, 196, 1),
+('靜物畵', '정물화', 17629, 1, 196, 1),
+('擴張子', '확장자', 17630, 1, 196, 1),
+('宏大', '굉대', 17631, 1, 195, 1),
+('大闕', '대궐', 17632, 1, 195, 1),
+('大蒜', '대산', 17633, 1, 195, 1),
+('大旱', '대한', 17634, 1, 195, 1),
+('莫大', '막대', 17635, 1, 195, 1),
+('佛語', '불어', 17636, 1, 195, 1),
+('生辰', '생신', 17637, 1, 195, 1),
+('皇子', '황자', 17638, 1, 195, 1),
+('光合成', '광합성', 17639, 1, 195, 1),
+('貸出金', '대출금', 17640, 1, 195, 1),
+('都市化', '도시화', 17641, 1, 195, 1),
+('無重量', '무중량', 17642, 1, 195, 1),
+('民兵隊', '민병대', 17643, 1, 195, 1),
+('死白魚', '사백어', 17644, 1, 195, 1),
+('重工業', '중공업', 17645, 1, 195, 1),
+('革新家', '혁신가', 17646, 1, 195, 1),
+('南支那海', '남지나해', 17647, 1, 195, 1),
+('等差數列', '등차수열', 17648, 1, 195, 1),
+('複本位制', '복본위제', 17649, 1, 195, 1),
+('世界平和', '세계평화', 17650, 1, 195, 1),
+('呼名點呼', '호명점호', 17651, 1, 195, 1),
+('家業', '가업', 17652, 1, 194, 1),
+('大邱', '대구', 17653, 1, 194, 1),
+('大鵬', '대붕', 17654, 1, 194, 1),
+('性能', '성능', 17655, 1, 194, 1),
+('水溫', '수온', 17656, 1, 194, 1),
+('主客', '주객', 17657, 1, 194, 1),
+('眞-', '진짜', 17658, 1, 194, 1),
+('外毒素', '외독소', 17659, 1, 194, 1),
+('正日峰', '정일봉', 17660, 1, 194, 1),
+('核心部', '핵심부', 17661, 1, 194, 1),
+('無産階級', '무산계급', 17662, 1, 194, 1),
+('상하이語', '상하이어', 17663, 1, 194, 1),
+('信用等級', '신용등급', 17664, 1, 194, 1),
+('極性', '극성', 17665, 1, 193, 1),
+('生殖', '생식', 17666, 1, 193, 1),
+('野性', '야성', 17667, 1, 193, 1),
+('字音', '자음', 17668, 1, 193, 1),
+('的例', '적례', 17669, 1, 193, 1),
+('標的', '표적', 17670, 1, 193, 1),
+('行方', '행방', 17671, 1, 193, 1),
+('公倍數', '공배수', 17672, 1, 193, 1),
+('不明瞭', '불명료', 17673, 1, 193, 1),
+('靑--', '청바지', 17674, 1, 193, 1),
+('世界記錄', '세계기록', 17675, 1, 193, 1),
+('速成飮食', '속성음식', 17676, 1, 193, 1),
+('郵便葉書', '우편엽서', 17677, 1, 193, 1),
+('惡行', '악행', 17678, 1, 192, 1),
+('語句', '어귀', 17679, 1, 192, 1),
+('年長', '연장', 17680, 1, 192, 1),
+('靈的', '영적', 17681, 1, 192, 1),
+('自愛', '자애', 17682, 1, 192, 1),
+('葡語', '포어', 17683, 1, 192, 1),
+('鑛泉水', '광천수', 17684, 1, 192, 1),
+('鐵觀音', '철관음', 17685, 1, 192, 1),
+('可視光線', '가시광선', 17686, 1, 192, 1),
+('女神', '녀신', 17687, 1, 191, 1),
+('詩的', '시적', 17688, 1, 191, 1),
+('理工', '이공', 17689, 1, 191, 1),
+('中有', '중유', 17690, 1, 191, 1),
+('居住性', '거주성', 17691, 1, 191, 1),
+('規範的', '규범적', 17692, 1, 191, 1),
+('妨害物', '방해물', 17693, 1, 191, 1),
+('尊待-', '존댓말', 17694, 1, 191, 1),
+('總書記', '총서기', 17695, 1, 191, 1),
+('江-', '강물', 17696, 1, 190, 1),
+('刀子', '도자', 17697, 1, 190, 1),
+('無色', '무색', 17698, 1, 190, 1),
+('蘇生', '소생', 17699, 1, 190, 1),
+('發情期', '발정기', 17700, 1, 190, 1),
+('非核化', '비핵화', 17701, 1, 190, 1),
+('光明星節', '광명성절', 17702, 1, 190, 1),
+('冷凍食品', '냉동식품', 17703, 1, 190, 1),
+('朝鮮民族', '조선민족', 17704, 1, 190, 1),
+('生肖', '생초', 17705, 1, 189, 1),
+('外字', '외자', 17706, 1, 189, 1),
+('結晶化', '결정화', 17707, 1, 189, 1),
+('多樣化', '다양화', 17708, 1, 189, 1),
+('充電器', '충전기', 17709, 1, 189, 1),
+('避暑地', '피서지', 17710, 1, 189, 1),
+('試行錯誤', '시행착오', 17711, 1, 189, 1),
+('오키나와語', '오키나와어', 17712, 1, 189, 1),
+('菓子', '까자', 17713, 1, 188, 1),
+('中期', '중기', 17714, 1, 188, 1),
+('活性', '활성', 17715, 1, 188, 1),
+('道德經', '도덕경', 17716, 1, 188, 1),
+('白雲石', '백운석', 17717, 1, 188, 1),
+('批判的', '비판적', 17718, 1, 188, 1),
+('受信機', '수신기', 17719, 1, 188, 1),
+('拾得物', '습득물', 17720, 1, 188, 1),
+('食品店', '식품점', 17721, 1, 188, 1),
+('新機軸', '신기축', 17722, 1, 188, 1),
+('職業病', '직업병', 17723, 1, 188, 1),
+('效率化', '효율화', 17724, 1, 188, 1),
+('弟子', '데자', 17725, 1, 187, 1),
+('生辰', '생신', 17726, 1, 187, 1),
+('生涯', '생애', 17727, 1, 187, 1),
+('連動', '연동', 17728, 1, 187, 1),
+('主導', '주도', 17729, 1, 187, 1),
+('出金', '출금', 17730, 1, 187, 1),
+('歡語', '환어', 17731, 1, 187, 1),
+('旅行社', '여행사', 17732, 1, 187, 1),
+('外販員', '외판원', 17733, 1, 187, 1),
+('日光浴', '일광욕', 17734, 1, 187, 1),
+('蓮子', '연자', 17735, 1, 186, 1),
+('倭語', '왜어', 17736, 1, 186, 1),
+('壬子', '임자', 17737, 1, 186, 1),
+('低地', '저지', 17738, 1, 186, 1),
+('主席', '주석', 17739, 1, 186, 1),
+('地勢', '지세', 17740, 1, 186, 1),
+('加熱器', '가열기', 17741, 1, 186, 1),
+('感覺器', '감각기', 17742, 1, 186, 1),
+('輕蔑的', '경멸적', 17743, 1, 186, 1),
+('發振器', '발진기', 17744, 1, 186, 1),
+('排水溝', '배수구', 17745, 1, 186, 1),
+('—農事', '벼농사', 17746, 1, 186, 1),
+('修辭法', '수사법', 17747, 1, 186, 1),
+('프랑스語', '프랑스어', 17748, 1, 186, 1),
+('庚子', '경자', 17749, 1, 185, 1),
+('同心', '동심', 17750, 1, 185, 1),
+('戊子', '무자', 17751, 1, 185, 1),
+('丙子', '병자', 17752, 1, 185, 1),
+('上天', '상천', 17753, 1, 185, 1),
+('振子', '진자', 17754, 1, 185, 1),
+('天上', '천상', 17755, 1, 185, 1),
+('體現', '체현', 17756, 1, 185, 1),
+('開會式', '개회식', 17757, 1, 185, 1),
+('謙讓語', '겸양어', 17758, 1, 185, 1),
+('計算器', '계산기', 17759, 1, 185, 1),
+('流量計', '유량계', 17760, 1, 185, 1),
+('理髮師', '이발사', 17761, 1, 185, 1),
+('自治旗', '자치기', 17762, 1, 185, 1),
+('弱肉強食', '약육강식', 17763, 1, 185, 1),
+('抽象名詞', '추상명사', 17764, 1, 185, 1),
+('降水', '강수', 17765, 1, 184, 1),
+('決-', '결코', 17766, 1, 184, 1),
+('船體', '선체', 17767, 1, 184, 1),
+('語塞', '어색', 17768, 1, 184, 1),
+('月食', '월식', 17769, 1, 184, 1),
+('中情', '중정', 17770, 1, 184, 1),
+('湯水', '탕수', 17771, 1, 184, 1),
+('騎士道', '기사도', 17772, 1, 184, 1),
+('無所屬', '무소속', 17773, 1, 184, 1),
+('事務職', '사무직', 17774, 1, 184, 1),
+('意志力', '의지력', 17775, 1, 184, 1),
+('將軍石', '장군석', 17776, 1, 184, 1),
+('指南石', '지남석', 17777, 1, 184, 1),
+('체크語', '체크어', 17778, 1, 184, 1),
+('脫出記', '탈출기', 17779, 1, 184, 1),
+('投光器', '투광기', 17780, 1, 184, 1),
+('平敍文', '평서문', 17781, 1, 184, 1),
+('品評會', '품평회', 17782, 1, 184, 1),
+('南柯一夢', '남가일몽', 17783, 1, 184, 1),
+('肉細切機', '육세절기', 17784, 1, 184, 1),
+('自己防禦', '자기방어', 17785, 1, 184, 1),
+('水卵', '수란', 17786, 1, 183, 1),
+('造化', '조화', 17787, 1, 183, 1),
+('枸杞子', '구기자', 17788, 1, 183, 1),
+('讀心術', '독심술', 17789, 1, 183, 1),
+('三色旗', '삼색기', 17790, 1, 183, 1),
+('作業臺', '작업대', 17791, 1, 183, 1),
+('脆弱性', '취약성', 17792, 1, 183, 1),
+('海兵隊', '해병대', 17793, 1, 183, 1),
+('注音符號', '주음부호', 17794, 1, 183, 1),
+('羅先特別市', '라선특별시', 17795, 1, 183, 1),
+('可動', '가동', 17796, 1, 182, 1),
+('番-', '번째', 17797, 1, 182, 1),
+('-番', '이번', 17798, 1, 182, 1),
+('利子', '이자', 17799, 1, 182, 1),
+('地階', '지계', 17800, 1, 182, 1),
+('-番', '한번', 17801, 1, 182, 1),
+('理想鄕', '이상향', 17802, 1, 182, 1),
+('潛水鐘', '잠수종', 17803, 1, 182, 1),
+('--番', '지난번', 17804, 1, 182, 1),
+('青金石', '청금석', 17805, 1, 182, 1),
+('非戰鬪員', '비전투원', 17806, 1, 182, 1),
+('一夫多妻', '일부다처', 17807, 1, 182, 1),
+('遲遲不進', '지지부진', 17808, 1, 182, 1),
+('毒性', '독성', 17809, 1, 181, 1),
+('文解', '문해', 17810, 1, 181, 1),
+('梵語', '범어', 17811, 1, 181, 1),
+('嗣子', '사자', 17812, 1, 181, 1),
+('-層', '위층', 17813, 1, 181, 1),
+('日間', '일간', 17814, 1, 181, 1),
+('地圈', '지권', 17815, 1, 181, 1),
+('--湯', '갈비탕', 17816, 1, 181, 1),
+('領事館', '령사관', 17817, 1, 181, 1),
+('排氣管', '배기관', 17818, 1, 181, 1),
+('벵골語', '벵골어', 17819, 1, 181, 1),
+('--湯', '설렁탕', 17820, 1, 181, 1),
+('--層', '아래층', 17821, 1, 181, 1),
+('延長線', '연장선', 17822, 1, 181, 1),
+('外蒙古', '외몽고', 17823, 1, 181, 1),
+('租借地', '조차지', 17824, 1, 181, 1),
+('治療法', '치료법', 17825, 1, 181, 1),
+('活用形', '활용형', 17826, 1, 181, 1),
+('效率的', '효율적', 17827, 1, 181, 1),
+('모래箱子', '모래상자', 17828, 1, 181, 1),
+('時代錯誤', '시대착오', 17829, 1, 181, 1),
+('銀杏--', '은행나무', 17830, 1, 181, 1),
+('朝鮮東海', '조선동해', 17831, 1, 181, 1),
+('神經 細胞', '신경 세포', 17832, 1, 181, 1),
+('文言', '문언', 17833, 1, 180, 1),
+('柚子', '유자', 17834, 1, 180, 1),
+('嫡子', '적자', 17835, 1, 180, 1),
+('主犯', '주범', 17836, 1, 180, 1),
+('讖語', '참어', 17837, 1, 180, 1),
+('通分', '통분', 17838, 1, 180, 1),
+('南半球', '남반구', 17839, 1, 180, 1),
+('無言劇', '무언극', 17840, 1, 180, 1),
+('反映論', '반영론', 17841, 1, 180, 1),
+('排出口', '배출구', 17842, 1, 180, 1),
+('新敎徒', '신교도', 17843, 1, 180, 1),
+('팥氷水', '팥빙수', 17844, 1, 180, 1),
+('平靜心', '평정심', 17845, 1, 180, 1),
+('下士官', '하사관', 17846, 1, 180, 1),
+('守護天使', '수호천사', 17847, 1, 180, 1),
+('贛語', '간어', 17848, 1, 179, 1),
+('年金', '년금', 17849, 1, 179, 1),
+('橙子', '등자', 17850, 1, 179, 1),
+('鐙子', '등자', 17851, 1, 179, 1),
+('明日', '명일', 17852, 1, 179, 1),
+('法官', '법관', 17853, 1, 179, 1),
+('榧子', '비자', 17854, 1, 179, 1),
+('水圈', '수권', 17855, 1, 179, 1),
+('子癇', '자간', 17856, 1, 179, 1),
+('橫的', '횡적', 17857, 1, 179, 1),
+('經濟力', '경제력', 17858, 1, 179, 1),
+('意見書', '의견서', 17859, 1, 179, 1),
+('自衛隊', '자위대', 17860, 1, 179, 1),
+('美式蹴球', '미식축구', 17861, 1, 179, 1),
+('天路歷程', '천로역정', 17862, 1, 179, 1),
+('全速 前進', '전속 전진', 17863, 1, 179, 1),
+('硬水', '경수', 17864, 1, 178, 1),
+('冠水', '관수', 17865, 1, 178, 1),
+('動亂', '동란', 17866, 1, 178, 1),
+('白書', '백서', 17867, 1, 178, 1),
+('聖體', '성체', 17868, 1, 178, 1),
+('原音', '원음', 17869, 1, 178, 1),
+('一新', '일신', 17870, 1, 178, 1),
+('長所', '장소', 17871, 1, 178, 1),
+('編物', '편물', 17872, 1, 178, 1),
+('公演場', '공연장', 17873, 1, 178, 1),
+('待機室', '대기실', 17874, 1, 178, 1),
+('無線局', '무선국', 17875, 1, 178, 1),
+('惡感情', '악감정', 17876, 1, 178, 1),
+('厭世家', '염세가', 17877, 1, 178, 1),
+('潛水艇', '잠수정', 17878, 1, 178, 1),
+('—時計 ', '손목시계', 17879, 1, 178, 1),
+('時計— ', '시곗바늘', 17880, 1, 178, 1),
+('—時計 ', '팔뚝시계', 17881, 1, 178, 1),
+('—時計 ', '팔목시계', 17882, 1, 178, 1),
+('—時計  ', '뻐꾸기시계', 17883, 1, 178, 1),
+('相互確實破壞', '상호확실파괴', 17884, 1, 178, 1),
+('水源', '수원', 17885, 1, 177, 1),
+('羊水', '양수', 17886, 1, 177, 1),
+('靈性', '영성', 17887, 1, 177, 1),
+('主役', '주역', 17888, 1, 177, 1),
+('主唱', '주창', 17889, 1, 177, 1),
+('中立', '중립', 17890, 1, 177, 1),
+('中和', '중화', 17891, 1, 177, 1),
+('齒-', '칫솔', 17892, 1, 177, 1),
+('突發死', '돌발사', 17893, 1, 177, 1),
+('安樂死', '안락사', 17894, 1, 177, 1),
+('矮行星', '왜행성', 17895, 1, 177, 1),
+('祭祀-', '제삿날', 17896, 1, 177, 1),
+('--週', '지난주', 17897, 1, 177, 1),
+('標準化', '표준화', 17898, 1, 177, 1),
+('解熱藥', '해열약', 17899, 1, 177, 1),
+('萬里長城', '만리장성', 17900, 1, 177, 1),
+('英雄時代', '영웅시대', 17901, 1, 177, 1),
+('精神科醫', '정신과의', 17902, 1, 177, 1),
+('投票用紙', '투표용지', 17903, 1, 177, 1),
+('頭腦 集團', '두뇌 집단', 17904, 1, 177, 1),
+('宇宙 停車場', '우주 정거장', 17905, 1, 177, 1),
+('-醬', '간장', 17906, 1, 176, 1),
+('給水', '급수', 17907, 1, 176, 1),
+('動態', '동태', 17908, 1, 176, 1),
+('母音', '모음', 17909, 1, 176, 1),
+('-床', '밥상', 17910, 1, 176, 1),
+('優性', '우성', 17911, 1, 176, 1),
+('飮水', '음수', 17912, 1, 176, 1),
+('縱的', '종적', 17913, 1, 176, 1),
+('--醬', '고추장', 17914, 1, 176, 1),
+('南西部', '남서부', 17915, 1, 176, 1),
+('百分率', '백분율', 17916, 1, 176, 1),
+('消火器', '소화기', 17917, 1, 176, 1),
+('日刊紙', '일간지', 17918, 1, 176, 1),
+('障碍物', '장애물', 17919, 1, 176, 1),
+('背囊旅行', '배낭여행', 17920, 1, 176, 1),
+('首腦會談', '수뇌회담', 17921, 1, 176, 1),
+('初等敎育', '초등교육', 17922, 1, 176, 1),
+('出埃及記', '출애굽기', 17923, 1, 176, 1),
+('花樣年華', '화양연화', 17924, 1, 176, 1),
+('球心', '구심', 17925, 1, 175, 1),
+('不斷', '부단', 17926, 1, 175, 1),
+('女軍', '여군', 17927, 1, 175, 1),
+('運行', '운행', 17928, 1, 175, 1),
+('利文', '이문', 17929, 1, 175, 1),
+('一時', '일시', 17930, 1, 175, 1),
+('從物', '종물', 17931, 1, 175, 1),
+('窓-', '창밖', 17932, 1, 175, 1),
+('廢物', '폐물', 17933, 1, 175, 1),
+('山神閣', '산신각', 17934, 1, 175, 1),
+('手細工', '수세공', 17935, 1, 175, 1),
+('室內樂', '실내악', 17936, 1, 175, 1),
+('親日派', '친일파', 17937, 1, 175, 1),
+('呼出 符號', '호출 부호', 17938, 1, 175, 1),
+('客體', '객체', 17939, 1, 174, 1),
+('分權', '분권', 17940, 1, 174, 1),
+('先行', '선행', 17941, 1, 174, 1),
+('水葬', '수장', 17942, 1, 174, 1),
+('自重', '자중', 17943, 1, 174, 1),
+('中斷', '중단', 17944, 1, 174, 1),
+('後事', '후사', 17945, 1, 174, 1),
+('露出症', '노출증', 17946, 1, 174, 1),
+('讀書室', '독서실', 17947, 1, 174, 1),
+('料理 ', '료리사', 17948, 1, 174, 1),
+('複素數', '복소수', 17949, 1, 174, 1),
+('不可侵', '불가침', 17950, 1, 174, 1),
+('雙--', '쌍둥이', 17951, 1, 174, 1),
+('虎狼-', '호랑이', 17952, 1, 174, 1),
+('---桶', '쓰레기통', 17953, 1, 174, 1),
+('窮地', '궁지', 17954, 1, 173, 1),
+('地緣', '지연', 17955, 1, 173, 1),
+('天空', '천공', 17956, 1, 173, 1),
+('泉地', '천지', 17957, 1, 173, 1),
+('火力', '화력', 17958, 1, 173, 1),
+('金--', '금메달', 17959, 1, 173, 1),
+('反對便', '반대편', 17960, 1, 173, 1),
+('保證金', '보증금', 17961, 1, 173, 1),
+('北半球', '북반구', 17962, 1, 173, 1),
+('非暴力', '비폭력', 17963, 1, 173, 1),
+('貯水池', '저수지', 17964, 1, 173, 1),
+('指導力', '지도력', 17965, 1, 173, 1),
+('冊--', '책가방', 17966, 1, 173, 1),
+('核家族', '핵가족', 17967, 1, 173, 1),
+('互換性', '호환성', 17968, 1, 173, 1),
+('利用約款', '이용약관', 17969, 1, 173, 1),
+('英雄敍事詩', '영웅서사시', 17970, 1, 173, 1),
+('名字', '명자', 17971, 1, 172, 1),
+('上海', '상해', 17972, 1, 172, 1),
+('松-', '송편', 17973, 1, 172, 1),
+('前文', '전문', 17974, 1, 172, 1),
+('調理', '조리', 17975, 1, 172, 1),
+('海山', '해산', 17976, 1, 172, 1),
+('结晶水', '결정수', 17977, 1, 172, 1),
+('金剛山', '금강산', 17978, 1, 172, 1),
+('蒸溜水', '증류수', 17979, 1, 172, 1),
+('金浦空港', '김포공항', 17980, 1, 172, 1),
+('一進一退', '일진일퇴', 17981, 1, 172, 1),
+('秋收 感謝節', '추수 감사절', 17982, 1, 172, 1),
+('家政', '가정', 17983, 1, 171, 1),
+('公金', '공금', 17984, 1, 171, 1),
+('口外', '구외', 17985, 1, 171, 1),
+('博物', '박물', 17986, 1, 171, 1),
+('小數', '소수', 17987, 1, 171, 1),
+('水彩', '수채', 17988, 1, 171, 1),
+('神山', '신산', 17989, 1, 171, 1),
+('年上', '연상', 17990, 1, 171, 1),
+('五行', '오행', 17991, 1, 171, 1),
+('律動', '율동', 17992, 1, 171, 1),
+('義士', '의사', 17993, 1, 171, 1),
+('淨水', '정수', 17994, 1, 171, 1),
+('株主', '주주', 17995, 1, 171, 1),
+('中等', '중등', 17996, 1, 171, 1),
+('便法', '편법', 17997, 1, 171, 1),
+('荒地', '황지', 17998, 1, 171, 1),
+('兩江道', '량강도', 17999, 1, 171, 1),
+('母權制', '모권제', 18000, 1, 171, 1),
+('熱量計', '열량계', 18001, 1, 171, 1),
+('自敍傳', '자서전', 18002, 1, 171, 1),
+('細胞分裂', '세포분열', 18003, 1, 171, 1),
+('七星長漁', '칠성장어', 18004, 1, 171, 1),
+('論點', '논점', 18005, 1, 170, 1),
+('文集', '문집', 18006, 1, 170, 1),
+('爲主', '위주', 18007, 1, 170, 1),
+('兄-', '형님', 18008, 1, 170, 1),
+('不凍液', '부동액', 18009, 1, 170, 1),
+('意味論', '의미론', 18010, 1, 170, 1),
+('日課表', '일과표', 18011, 1, 170, 1),
+('低出産', '저출산', 18012, 1, 170, 1),
+('鐘--', '종소리', 18013, 1, 170, 1),
+('不淨腐敗', '부정부패', 18014, 1, 170, 1),
+('-曆', '달력', 18015, 1, 169, 1),
+('淡水', '담수', 18016, 1, 169, 1),
+('文房', '문방', 18017, 1, 169, 1),
+('水棲', '수서', 18018, 1, 169, 1),
+('一員', '일원', 18019, 1, 169, 1),
+('中領', '중령', 18020, 1, 169, 1),
+('地租', '지조', 18021, 1, 169, 1),
+('出場', '출장', 18022, 1, 169, 1),
+('面刀器', '면도기', 18023, 1, 169, 1),
+('百日紅', '백일홍', 18024, 1, 169, 1),
+('西半球', '서반구', 18025, 1, 169, 1),
+('伸縮性', '신축성', 18026, 1, 169, 1),
+('委員會', '위원회', 18027, 1, 169, 1),
+('黑色症', '흑색증', 18028, 1, 169, 1),
+('携帶電話', '휴대전화', 18029, 1, 169, 1),
+('噴水', '분수', 18030, 1, 168, 1),
+('佛性', '불성', 18031, 1, 168, 1),
+('有機', '유기', 18032, 1, 168, 1),
+('慈主', '자주', 18033, 1, 168, 1),
+('定年', '정년', 18034, 1, 168, 1),
+('鑄物', '주물', 18035, 1, 168, 1),
+('地誌', '지지', 18036, 1, 168, 1),
+('出入', '출입', 18037, 1, 168, 1),
+('會計', '회계', 18038, 1, 168, 1),
+('微積分', '미적분', 18039, 1, 168, 1),
+('靈長類', '영장류', 18040, 1, 168, 1),
+('太陽黑點', '태양흑점', 18041, 1, 168, 1),
+('硬性', '경성', 18042, 1, 167, 1),
+('導體', '도체', 18043, 1, 167, 1),
+('同年', '동년', 18044, 1, 167, 1),
+('動向', '동향', 18045, 1, 167, 1),
+('立法', '립법', 18046, 1, 167, 1),
+('心血', '심혈', 18047, 1, 167, 1),
+('豫行', '예행', 18048, 1, 167, 1),
+('理科', '이과', 18049, 1, 167, 1),
+('日王', '일왕', 18050, 1, 167, 1),
+('適中', '적중', 18051, 1, 167, 1),
+('十二月', '12월', 18052, 1, 167, 1),
+('暖房機', '난방기', 18053, 1, 167, 1),
+('飜譯體', '번역체', 18054, 1, 167, 1),
+('手風琴', '수풍금', 18055, 1, 167, 1),
+('新世界', '신세계', 18056, 1, 167, 1),
+('憎惡心', '증오심', 18057, 1, 167, 1),
+('投影機', '투영기', 18058, 1, 167, 1),
+('八分儀', '팔분의', 18059, 1, 167, 1),
+('黑死病', '흑사병', 18060, 1, 167, 1),
+('交通標識', '교통표지', 18061, 1, 167, 1),
+('媤---', '시아버지', 18062, 1, 167, 1),
+('媤---', '시어머니', 18063, 1, 167, 1),
+('灌水', '관수', 18064, 1, 166, 1),
+('-套', '말투', 18065, 1, 166, 1),
+('每-', '매달', 18066, 1, 166, 1),
+('半分', '반분', 18067, 1, 166, 1),
+('白金', '백금', 18068, 1, 166, 1),
+('敷地', '부지', 18069, 1, 166, 1),
+('-甁', '술병', 18070, 1, 166, 1),
+('-盞', '술잔', 18071, 1, 166, 1),
+('始動', '시동', 18072, 1, 166, 1),
+('信義', '신의', 18073, 1, 166, 1),
+('中指', '중지', 18074, 1, 166, 1),
+('-盞', '한잔', 18075, 1, 166, 1),
+('海流', '해류', 18076, 1, 166, 1),
+('先住民', '선주민', 18077, 1, 166, 1),
+('薔薇水', '장미수', 18078, 1, 166, 1),
+('採石場', '채석장', 18079, 1, 166, 1),
+('超音波', '초음파', 18080, 1, 166, 1),
+('野手選擇', '야수선택', 18081, 1, 166, 1),
+('胡---', '호주머니', 18082, 1, 166, 1),
+('文身', '문신', 18083, 1, 165, 1),
+('白手', '백수', 18084, 1, 165, 1),
+('水栓', '수전', 18085, 1, 165, 1),
+('水泡', '수포', 18086, 1, 165, 1),
+('窪地', '와지', 18087, 1, 165, 1),
+('檢流計', '검류계', 18088, 1, 165, 1),
+('腦神經', '뇌신경', 18089, 1, 165, 1),
+('無差別', '무차별', 18090, 1, 165, 1),
+('一對一', '일대일', 18091, 1, 165, 1),
+('一等席', '일등석', 18092, 1, 165, 1),
+('濟州道', '제주도', 18093, 1, 165, 1),
+('海岸線', '해안선', 18094, 1, 165, 1),
+('啓蒙時代', '계몽시대', 18095, 1, 165, 1),
+('十字苦像', '십자고상', 18096, 1, 165, 1),
+('戀愛便紙', '연애편지', 18097, 1, 165, 1),
+('自畫自讚', '자화자찬', 18098, 1, 165, 1),
+('放射線撮影', '방사선촬영', 18099, 1, 165, 1),
+('急行', '급행', 18100, 1, 164, 1),
+('機制', '기제', 18101, 1, 164, 1),
+('-牌', '깡패', 18102, 1, 164, 1),
+('樂天', '낙천', 18103, 1, 164, 1),
+('民權', '민권', 18104, 1, 164, 1),
+('浮動', '부동', 18105, 1, 164, 1),
+('水獺', '수달', 18106, 1, 164, 1),
+('新年', '신년', 18107, 1, 164, 1),
+('自立', '자립', 18108, 1, 164, 1),
+('中波', '중파', 18109, 1, 164, 1),
+('體型', '체형', 18110, 1, 164, 1),
+('彈道', '탄도', 18111, 1, 164, 1),
+('八道', '팔도', 18112, 1, 164, 1),
+('行狀', '행장', 18113, 1, 164, 1),
+('或-', '혹은', 18114, 1, 164, 1),
+('怯--', '겁나다', 18115, 1, 164, 1),
+('沙漠化', '사막화', 18116, 1, 164, 1),
+('熱射病', '열사병', 18117, 1, 164, 1),
+('通過暗號', '통과암호', 18118, 1, 164, 1),
+('內海', '내해', 18119, 1, 163, 1),
+('民政', '민정', 18120, 1, 163, 1),
+('房事', '방사', 18121, 1, 163, 1),
+('兩-', '양옆', 18122, 1, 163, 1),
+('兩-', '양쪽', 18123, 1, 163, 1),
+('日韓', '일한', 18124, 1, 163, 1),
+('天明', '천명', 18125, 1, 163, 1),
+('醋-', '초밥', 18126, 1, 163, 1),
+('面接官', '면접관', 18127, 1, 163, 1),
+('褓--', '보자기', 18128, 1, 163, 1),
+('利--', '이롭다', 18129, 1, 163, 1),
+('一角獸', '일각수', 18130, 1, 163, 1),
+('風速計', '풍속계', 18131, 1, 163, 1),
+('革命家', '혁명가', 18132, 1, 163, 1),
+('狹心症', '협심증', 18133, 1, 163, 1),
+('男尊女卑', '남존여비', 18134, 1, 163, 1),
+('女尊男卑', '여존남비', 18135, 1, 163, 1),
+('感電', '감전', 18136, 1, 162, 1),
+('來-', '내달', 18137, 1, 162, 1),
+('來日', '내일', 18138, 1, 162, 1),
+('賂物', '뇌물', 18139, 1, 162, 1),
+('來日', '래일', 18140, 1, 162, 1),
+('名作', '명작', 18141, 1, 162, 1),
+('無風', '무풍', 18142, 1, 162, 1),
+('心意', '심의', 18143, 1, 162, 1),
+('安家', '안가', 18144, 1, 162, 1),
+('夜行', '야행', 18145, 1, 162, 1),
+('音便', '음편', 18146, 1, 162, 1),
+('重心', '중심', 18147, 1, 162, 1),
+('出品', '출품', 18148, 1, 162, 1),
+('防火線', '방화선', 18149, 1, 162, 1),
+('白內障', '백내장', 18150, 1, 162, 1),
+('義烈團', '의열단', 18151, 1, 162, 1),
+('日傭職', '일용직', 18152, 1, 162, 1),
+('爆擊機', '폭격기', 18153, 1, 162, 1),
+('刑法典', '형법전', 18154, 1, 162, 1),
+('豫防接種', '예방접종', 18155, 1, 162, 1),
+('自暴自棄', '자포자기', 18156, 1, 162, 1),
+('鳴動', '명동', 18157, 1, 161, 1),
+('無線', '무선', 18158, 1, 161, 1),
+('三色', '삼색', 18159, 1, 161, 1),
+('女性', '여성', 18160, 1, 161, 1),
+('自進', '자진', 18161, 1, 161, 1),
+('展性', '전성', 18162, 1, 161, 1),
+('震動', '진동', 18163, 1, 161, 1),
+('體毛', '체모', 18164, 1, 161, 1),
+('出頭', '출두', 18165, 1, 161, 1),
+('出世', '출세', 18166, 1, 161, 1),
+('活法', '활법', 18167, 1, 161, 1),
+('歷史家', '역사가', 18168, 1, 161, 1),
+('一擧兩得', '일거양득', 18169, 1, 161, 1),
+('堅性', '견성', 18170, 1, 160, 1),
+('馬力', '마력', 18171, 1, 160, 1),
+('外相', '외상', 18172, 1, 160, 1),
+('自轉', '자전', 18173, 1, 160, 1),
+('抗體', '항체', 18174, 1, 160, 1),
+('附着力', '부착력', 18175, 1, 160, 1),
+('二代男', '이대남', 18176, 1, 160, 1),
+('認證書', '인정서', 18177, 1, 160, 1),
+('自轉車', '자전거', 18178, 1, 160, 1),
+('平常時', '평상시', 18179, 1, 160, 1),
+('裝甲列車', '장갑렬차', 18180, 1, 160, 1),
+('裝甲列車', '장갑열차', 18181, 1, 160, 1),
+('航空母艦', '항공모함', 18182, 1, 160, 1),
+('三月', '3월', 18183, 1, 159, 1),
+('空器', '공기', 18184, 1, 159, 1),
+('防音', '방음', 18185, 1, 159, 1),
+('法界', '법계', 18186, 1, 159, 1),
+('赤化', '적화', 18187, 1, 159, 1),
+('百分比', '백분비', 18188, 1, 159, 1),
+('慈江道', '자강도', 18189, 1, 159, 1),
+('小便檢査', '소변검사', 18190, 1, 159, 1),
+('最後通牒', '최후통첩', 18191, 1, 159, 1),
+('文科', '문과', 18192, 1, 158, 1),
+('發病', '발병', 18193, 1, 158, 1),
+('市道', '시도', 18194, 1, 158, 1),
+('王家', '왕가', 18195, 1, 158, 1),
+('一門', '일문', 18196, 1, 158, 1),
+('製法', '제법', 18197, 1, 158, 1),
+('彈力', '탄력', 18198, 1, 158, 1),
+('行次', '행차', 18199, 1, 158, 1),
+('降神術', '강신술', 18200, 1, 158, 1),
+('輕工業', '경공업', 18201, 1, 158, 1),
+('耐久性', '내구성', 18202, 1, 158, 1),
+('消防手', '소방수', 18203, 1, 158, 1),
+('潛在力', '잠재력', 18204, 1, 158, 1),
+('政治權', '정치권', 18205, 1, 158, 1),
+('名工', '명공', 18206, 1, 157, 1),
+('應分', '응분', 18207, 1, 157, 1),
+('適法', '적법', 18208, 1, 157, 1),
+('節氣', '절기', 18209, 1, 157, 1),
+('海南', '해남', 18210, 1, 157, 1),
+('有彩色', '무채색', 18211, 1, 157, 1),
+('細切機', '세절기', 18212, 1, 157, 1),
+('解熱劑', '해열제', 18213, 1, 157, 1),
+('火山島', '화산도', 18214, 1, 157, 1),
+('六鎭方言', '륙진방언', 18215, 1, 157, 1),
+('硬化', '경화', 18216, 1, 156, 1),
+('固體', '고체', 18217, 1, 156, 1),
+('耐性', '내성', 18218, 1, 156, 1),
+('當日', '당일', 18219, 1, 156, 1),
+('私法', '사법', 18220, 1, 156, 1),
+('禮法', '예법', 18221, 1, 156, 1),
+('月球', '월구', 18222, 1, 156, 1),
+('全長', '전장', 18223, 1, 156, 1),
+('中秋', '중추', 18224, 1, 156, 1),
+('行程', '행정', 18225, 1, 156, 1),
+('更年期', '갱년기', 18226, 1, 156, 1),
+('計算員', '계산원', 18227, 1, 156, 1),
+('沙時計', '사시계', 18228, 1, 156, 1),
+('處女林', '처녀림', 18229, 1, 156, 1),
+('聽取力', '청취력', 18230, 1, 156, 1),
+('評議會', '평의회', 18231, 1, 156, 1),
+('被加數', '피가수', 18232, 1, 156, 1),
+('八紘一宇', '팔굉일우', 18233, 1, 156, 1),
+('回轉木馬', '회전목마', 18234, 1, 156, 1),
+('自由 貿易', '자유 무역', 18235, 1, 156, 1),
+('古書', '고서', 18236, 1, 155, 1),
+('名言', '명언', 18237, 1, 155, 1),
+('發作', '발작', 18238, 1, 155, 1),
+('商法', '상법', 18239, 1, 155, 1),
+('外防', '외방', 18240, 1, 155, 1),
+('理容', '이용', 18241, 1, 155, 1),
+('日製', '일제', 18242, 1, 155, 1),
+('入金', '입금', 18243, 1, 155, 1),
+('正敎', '정교', 18244, 1, 155, 1),
+('天安', '천안', 18245, 1, 155, 1),
+('護法', '호법', 18246, 1, 155, 1),
+('配當金', '배당금', 18247, 1, 155, 1),
+('砂時計', '사시계', 18248, 1, 155, 1),
+('自覺夢', '자각몽', 18249, 1, 155, 1),
+('護身用', '호신용', 18250, 1, 155, 1),
+('回數券', '회수권', 18251, 1, 155, 1),
+('自然淘汰', '자연도태', 18252, 1, 155, 1),
+('集團殺害', '집단살해', 18253, 1, 155, 1),
+('彈丸列車', '탄환열차', 18254, 1, 155, 1),
+('群體', '군체', 18255, 1, 154, 1),
+('同上', '동상', 18256, 1, 154, 1),
+('旅行', '려행', 18257, 1, 154, 1),
+('繁體', '번체', 18258, 1, 154, 1),
+('犯行', '범행', 18259, 1, 154, 1),
+('性癖', '성벽', 18260, 1, 154, 1),
+('知事', '지사', 18261, 1, 154, 1),
+('脆性', '취성', 18262, 1, 154, 1),
+('惰性', '타성', 18263, 1, 154, 1),
+('航行', '항행', 18264, 1, 154, 1),
+('興行', '흥행', 18265, 1, 154, 1),
+('來後年', '내후년', 18266, 1, 154, 1),
+('三頭筋', '삼두근', 18267, 1, 154, 1),
+('莫上莫下', '막상막하', 18268, 1, 154, 1),
+('時限爆彈', '시한폭탄', 18269, 1, 154, 1),
+('自給自足', '자급자족', 18270, 1, 154, 1),
+('稼動', '가동', 18271, 1, 153, 1),
+('文選', '문선', 18272, 1, 153, 1),
+('不具', '불구', 18273, 1, 153, 1),
+('純化', '순화', 18274, 1, 153, 1),
+('年頭', '연두', 18275, 1, 153, 1),
+('鐵分', '철분', 18276, 1, 153, 1),
+('壁時計', '벽시계', 18277, 1, 153, 1),
+('下剋上', '하극상', 18278, 1, 153, 1),
+('簡體', '간체', 18279, 1, 152, 1),
+('强化', '강화', 18280, 1, 152, 1),
+('氣骨', '기골', 18281, 1, 152, 1),
+('尾行', '미행', 18282, 1, 152, 1),
+('兵長', '병장', 18283, 1, 152, 1),
+('手記', '수기', 18284, 1, 152, 1),
+('點字', '점자', 18285, 1, 152, 1),
+('週中', '주중', 18286, 1, 152, 1),
+('中興', '중흥', 18287, 1, 152, 1),
+('號外', '호외', 18288, 1, 152, 1),
+('內毒素', '내독소', 18289, 1, 152, 1),
+('多島海', '다도해', 18290, 1, 152, 1),
+('代表團', '대표단', 18291, 1, 152, 1),
+('遁甲法', '둔갑법', 18292, 1, 152, 1),
+('神經系', '신경계', 18293, 1, 152, 1),
+('映寫機', '영사기', 18294, 1, 152, 1),
+('三清教育隊', '삼청교육대', 18295, 1, 152, 1),
+('相互確證破壞', '상호확증파괴', 18296, 1, 152, 1),
+('茶道', '다도', 18297, 1, 151, 1),
+('神權', '신권', 18298, 1, 151, 1),
+('年間', '연간', 18299, 1, 151, 1),
+('自害', '자해', 18300, 1, 151, 1),
+('茶道', '차도', 18301, 1, 151, 1),
+('體罰', '체벌', 18302, 1, 151, 1),
+('減殺器', '감쇄기', 18303, 1, 151, 1),
+('拒食症', '거식증', 18304, 1, 151, 1),
+('色相環', '색상환', 18305, 1, 151, 1),
+('退職金', '퇴직금', 18306, 1, 151, 1),
+('記錄映畫', '기록영화', 18307, 1, 151, 1),
+('刊行', '간행', 18308, 1, 150, 1),
+('機轉', '기전', 18309, 1, 150, 1),
+('內用', '내용', 18310, 1, 150, 1),
+('反戰', '반전', 18311, 1, 150, 1),
+('步行', '보행', 18312, 1, 150, 1),
+('北海', '북해', 18313, 1, 150, 1),
+('速力', '속력', 18314, 1, 150, 1),
+('神政', '신정', 18315, 1, 150, 1),
+('深化', '심화', 18316, 1, 150, 1),
+('惡名', '악명', 18317, 1, 150, 1),
+('藥食', '약식', 18318, 1, 150, 1),
+('原電', '원전', 18319, 1, 150, 1),
+('平年', '평년', 18320, 1, 150, 1),
+('定冠詞', '정관사', 18321, 1, 150, 1),
+('熱帶雨林', '열대우림', 18322, 1, 150, 1),
+('創氏改名', '창씨개명', 18323, 1, 150, 1),
+('金品', '금품', 18324, 1, 149, 1),
+('得道', '득도', 18325, 1, 149, 1),
+('法案', '법안', 18326, 1, 149, 1),
+('不敗', '불패', 18327, 1, 149, 1),
+('有色', '유색', 18328, 1, 149, 1),
+('電解', '전해', 18329, 1, 149, 1),
+('合線', '합선', 18330, 1, 149, 1),
+('檢溫器', '검온기', 18331, 1, 149, 1),
+('魚市場', '어시장', 18332, 1, 149, 1),
+('歷史家', '역사가', 18333, 1, 149, 1),
+('提喩法', '제유법', 18334, 1, 149, 1),
+('一舉兩得', '일거양득', 18335, 1, 149, 1),
+('닉스타말化', '닉스타말화', 18336, 1, 149, 1),
+('森林限界線', '삼림한계선', 18337, 1, 149, 1),
+('當事', '당사', 18338, 1, 148, 1),
+('領事', '령사', 18339, 1, 148, 1),
+('錄音', '록음', 18340, 1, 148, 1),
+('法典', '법전', 18341, 1, 148, 1),
+('分館', '분관', 18342, 1, 148, 1),
+('不純', '불순', 18343, 1, 148, 1),
+('不快', '불쾌', 18344, 1, 148, 1),
+('書式', '서식', 18345, 1, 148, 1),
+('議事', '의사', 18346, 1, 148, 1),
+('中米', '중미', 18347, 1, 148, 1),
+('近日点', '근일점', 18348, 1, 148, 1),
+('網市民', '망시민', 18349, 1, 148, 1),
+('方位角', '방위각', 18350, 1, 148, 1),
+('保安官', '보안관', 18351, 1, 148, 1),
+('創世記', '창세기', 18352, 1, 148, 1),
+('鐵鑛石', '철광석', 18353, 1, 148, 1),
+('包莖手術', '포경수술', 18354, 1, 148, 1),
+('近日', '근일', 18355, 1, 147, 1),
+('代入', '대입', 18356, 1, 147, 1),
+('萬機', '만기', 18357, 1, 147, 1),
+('汎化', '범화', 18358, 1, 147, 1),
+('不敬', '불경', 18359, 1, 147, 1),
+('實用', '실용', 18360, 1, 147, 1),
+('流下', '유하', 18361, 1, 147, 1),
+('天極', '천극', 18362, 1, 147, 1),
+('下流', '하류', 18363, 1, 147, 1),
+('乾髮機', '건발기', 18364, 1, 147, 1),
+('고딕體', '고딕체', 18365, 1, 147, 1),
+('冷凍機', '랭동기', 18366, 1, 147, 1),
+('除濕機', '제습기', 18367, 1, 147, 1),
+('豊年花', '풍년화', 18368, 1, 147, 1),
+('咸鏡道', '함경도', 18369, 1, 147, 1),
+('最低賃金', '최저임금', 18370, 1, 147, 1),
+('難文', '난문', 18371, 1, 146, 1),
+('不許', '불허', 18372, 1, 146, 1),
+('西海', '서해', 18373, 1, 146, 1),
+('神官', '신관', 18374, 1, 146, 1),
+('月光', '월광', 18375, 1, 146, 1),
+('一命', '일명', 18376, 1, 146, 1),
+('自首', '자수', 18377, 1, 146, 1),
+('長魚', '장어', 18378, 1, 146, 1),
+('處分', '처분', 18379, 1, 146, 1),
+('孝行', '효행', 18380, 1, 146, 1),
+('時計塔', '시계탑', 18381, 1, 146, 1),
+('定期券', '정기권', 18382, 1, 146, 1),
+('直升機', '직승기', 18383, 1, 146, 1),
+('血壓計', '혈압계', 18384, 1, 146, 1),
+('約婚半指', '약혼반지', 18385, 1, 146, 1),
+('芭蕉一葉', '파초일엽', 18386, 1, 146, 1),
+('西印度 諸島', '서인도 제도', 18387, 1, 146, 1),
+('乾道', '건도', 18388, 1, 145, 1),
+('校外', '교외', 18389, 1, 145, 1),
+('機務', '기무', 18390, 1, 145, 1),
+('單文', '단문', 18391, 1, 145, 1),
+('道教', '도교', 18392, 1, 145, 1),
+('上記', '상기', 18393, 1, 145, 1),
+('隨行', '수행', 18394, 1, 145, 1),
+('弱音', '약음', 18395, 1, 145, 1),
+('外製', '외제', 18396, 1, 145, 1),
+('熔化', '용화', 18397, 1, 145, 1),
+('通用', '통용', 18398, 1, 145, 1),
+('正常位', '정상위', 18399, 1, 145, 1),
+('天象儀', '천상의', 18400, 1, 145, 1),
+('祝祭日', '축제일', 18401, 1, 145, 1),
+('客家', '객가', 18402, 1, 144, 1),
+('硅化', '규화', 18403, 1, 144, 1),
+('女王', '녀왕', 18404, 1, 144, 1),
+('讀音', '독음', 18405, 1, 144, 1),
+('演義', '연의', 18406, 1, 144, 1),
+('音讀', '음독', 18407, 1, 144, 1),
+('號數', '호수', 18408, 1, 144, 1),
+('婚事', '혼사', 18409, 1, 144, 1),
+('化膿', '화농', 18410, 1, 144, 1),
+('蒙古點', '몽고점', 18411, 1, 144, 1),
+('父權制', '부권제', 18412, 1, 144, 1),
+('抑止力', '억지력', 18413, 1, 144, 1),
+('注射器', '주사기', 18414, 1, 144, 1),
+('統辭論', '통사론', 18415, 1, 144, 1),
+('航空郵便', '항공우편', 18416, 1, 144, 1),
+('公權', '공권', 18417, 1, 143, 1),
+('南山', '남산', 18418, 1, 143, 1),
+('道程', '도정', 18419, 1, 143, 1),
+('文典', '문전', 18420, 1, 143, 1),
+('半神', '반신', 18421, 1, 143, 1),
+('不渡', '부도', 18422, 1, 143, 1),
+('書經', '서경', 18423, 1, 143, 1),
+('理髮', '이발', 18424, 1, 143, 1),
+('一二', '일이', 18425, 1, 143, 1),
+('自傷', '자상', 18426, 1, 143, 1),
+('中堅', '중견', 18427, 1, 143, 1),
+('中媒', '중매', 18428, 1, 143, 1),
+('膨化', '팽화', 18429, 1, 143, 1),
+('讀書狂', '독서광', 18430, 1, 143, 1),
+('六角形', '륙각형', 18431, 1, 143, 1),
+('위키化', '위키화', 18432, 1, 143, 1),
+('前官禮遇', '전관예우', 18433, 1, 143, 1),
+('鹼化', '감화', 18434, 1, 142, 1),
+('計定', '계정', 18435, 1, 142, 1),
+('金利', '금리', 18436, 1, 142, 1),
+('不振', '부진', 18437, 1, 142, 1),
+('新病', '신병', 18438, 1, 142, 1),
+('煙道', '연도', 18439, 1, 142, 1),
+('資力', '자력', 18440, 1, 142, 1),
+('自認', '자인', 18441, 1, 142, 1),
+('情色', '정색', 18442, 1, 142, 1),
+('海産', '해산', 18443, 1, 142, 1),
+('現出', '현출', 18444, 1, 142, 1),
+('去來所', '거래소', 18445, 1, 142, 1),
+('盜聽機', '도청기', 18446, 1, 142, 1),
+('放射線', '방사선', 18447, 1, 142, 1),
+('失鄕民', '실향민', 18448, 1, 142, 1),
+('遊牧民', '유목민', 18449, 1, 142, 1),
+('傳書鳩', '전서구', 18450, 1, 142, 1),
+('回敎徒', '회교도', 18451, 1, 142, 1),
+('陸上競技', '육상경기', 18452, 1, 142, 1),
+('臺灣 海峽', '대만 해협', 18453, 1, 142, 1),
+('陸上 競技', '육상 경기', 18454, 1, 142, 1),
+('珪化', '규화', 18455, 1, 141, 1),
+('單音', '단음', 18456, 1, 141, 1),
+('佛法', '불법', 18457, 1, 141, 1),
+('不法', '불법', 18458, 1, 141, 1),
+('醇化', '순화', 18459, 1, 141, 1),
+('實感', '실감', 18460, 1, 141, 1),
+('魚論', '어론', 18461, 1, 141, 1),
+('自衛', '자위', 18462, 1, 141, 1),
+('助力', '조력', 18463, 1, 141, 1),
+('車線', '차선', 18464, 1, 141, 1),
+('呼氣', '호기', 18465, 1, 141, 1),
+('加濕器', '가습기', 18466, 1, 141, 1),
+('登錄器', '등록기', 18467, 1, 141, 1),
+('陰謀論', '음모론', 18468, 1, 141, 1),
+('再活用', '재활용', 18469, 1, 141, 1),
+('出退勤', '출퇴근', 18470, 1, 141, 1),
+('被乘數', '피승수', 18471, 1, 141, 1),
+('基督敎徒', '기독교도', 18472, 1, 141, 1),
+('萬壽無疆', '만수무강', 18473, 1, 141, 1),
+('短篇 小說', '단편 소설', 18474, 1, 141, 1),
+('口腔 淸潔劑', '구강 청결제', 18475, 1, 141, 1),
+('假家', '가가', 18476, 1, 140, 1),
+('尿道', '뇨도', 18477, 1, 140, 1),
+('療法', '료법', 18478, 1, 140, 1),
+('白頭', '백두', 18479, 1, 140, 1),
+('英文', '영문', 18480, 1, 140, 1),
+('外皮', '외피', 18481, 1, 140, 1),
+('草書', '초서', 18482, 1, 140, 1),
+('下記', '하기', 18483, 1, 140, 1),
+('配管工', '배관공', 18484, 1, 140, 1),
+('宣敎師', '선교사', 18485, 1, 140, 1),
+('雙半點', '쌍반점', 18486, 1, 140, 1),
+('溫度計', '온도계', 18487, 1, 140, 1),
+('自鳴鐘', '자명종', 18488, 1, 140, 1),
+('管絃樂團', '관현악단', 18489, 1, 140, 1),
+('機械端艇', '기계단정', 18490, 1, 140, 1),
+('加數', '가수', 18491, 1, 139, 1),
+('末日', '말일', 18492, 1, 139, 1),
+('西敎', '서교', 18493, 1, 139, 1),
+('數萬', '수만', 18494, 1, 139, 1),
+('數板', '수판', 18495, 1, 139, 1),
+('天目', '천목', 18496, 1, 139, 1),
+('天父', '천부', 18497, 1, 139, 1),
+('出土', '출토', 18498, 1, 139, 1),
+('內蒙古', '내몽고', 18499, 1, 139, 1),
+('東洋風', '동양풍', 18500, 1, 139, 1),
+('美術史', '미술사', 18501, 1, 139, 1),
+('截拳道', '절권도', 18502, 1, 139, 1),
+('秒時計', '초시계', 18503, 1, 139, 1),
+('核武器', '핵무기', 18504, 1, 139, 1),
+('骨關節炎', '골관절염', 18505, 1, 139, 1),
+('今日', '금일', 18506, 1, 138, 1),
+('秘法', '비법', 18507, 1, 138, 1),
+('上部', '상부', 18508, 1, 138, 1),
+('食料', '식료', 18509, 1, 138, 1),
+('長老', '장로', 18510, 1, 138, 1),
+('片道', '편도', 18511, 1, 138, 1),
+('陶藝家', '도예가', 18512, 1, 138, 1),
+('白鐵鑛', '백철광', 18513, 1, 138, 1),
+('批評家', '비평가', 18514, 1, 138, 1),
+('小賣店', '소매점', 18515, 1, 138, 1),
+('首長龍', '수장룡', 18516, 1, 138, 1),
+('熱目魚', '열목어', 18517, 1, 138, 1),
+('印刷機', '인쇄기', 18518, 1, 138, 1),
+('傳言板', '전언판', 18519, 1, 138, 1),
+('蹴球場', '축구장', 18520, 1, 138, 1),
+('내로남不', '내로남불', 18521, 1, 138, 1),
+('集團虐殺', '집단학살', 18522, 1, 138, 1),
+('劍道', '검도', 18523, 1, 137, 1),
+('團長', '단장', 18524, 1, 137, 1),
+('無知', '무지', 18525, 1, 137, 1),
+('文具', '문구', 18526, 1, 137, 1),
+('美軍', '미군', 18527, 1, 137, 1),
+('法衣', '법의', 18528, 1, 137, 1),
+('本官', '본관', 18529, 1, 137, 1),
+('事典', '사전', 18530, 1, 137, 1),
+('侍中', '시중', 18531, 1, 137, 1),
+('失心', '실심', 18532, 1, 137, 1),
+('儀法', '의법', 18533, 1, 137, 1),
+('自責', '자책', 18534, 1, 137, 1),
+('吸氣', '흡기', 18535, 1, 137, 1),
+('感歎詞', '감탄사', 18536, 1, 137, 1),
+('開閉器', '개폐기', 18537, 1, 137, 1),
+('建築家', '건축가', 18538, 1, 137, 1),
+('契約書', '계약서', 18539, 1, 137, 1),
+('飜譯家', '번역가', 18540, 1, 137, 1),
+('粉食店', '분식점', 18541, 1, 137, 1),
+('私書函', '사서함', 18542, 1, 137, 1),
+('年齡帶', '연령대', 18543, 1, 137, 1),
+('差異點', '차이점', 18544, 1, 137, 1),
+('聽聞會', '청문회', 18545, 1, 137, 1),
+('最高級', '최고급', 18546, 1, 137, 1),
+('現實逃避', '현실도피', 18547, 1, 137, 1),
+('家宅  軟', '가택 연금', 18548, 1, 137, 1),
+('拳法', '권법', 18549, 1, 136, 1),
+('機略', '기략', 18550, 1, 136, 1),
+('文川', '문천', 18551, 1, 136, 1),
+('法執', '법집', 18552, 1, 136, 1),
+('投書', '투서', 18553, 1, 136, 1),
+('乾燥機', '건조기', 18554, 1, 136, 1),
+('反政府', '반정부', 18555, 1, 136, 1),
+('色眼鏡', '색안경', 18556, 1, 136, 1),
+('乳蓄器', '유축기', 18557, 1, 136, 1),
+('七十代', '칠십대', 18558, 1, 136, 1),
+('通譯士', '통역사', 18559, 1, 136, 1),
+('合唱團', '합창단', 18560, 1, 136, 1),
+('核爆發', '핵폭발', 18561, 1, 136, 1),
+('意思疏通', '의사소통', 18562, 1, 136, 1),
+('抑音  符', '억음 부호', 18563, 1, 136, 1),
+('年度', '년도', 18564, 1, 135, 1),
+('倫理', '륜리', 18565, 1, 135, 1),
+('發信', '발신', 18566, 1, 135, 1),
+('法庭', '법정', 18567, 1, 135, 1),
+('福力', '복력', 18568, 1, 135, 1),
+('分針', '분침', 18569, 1, 135, 1),
+('上古', '상고', 18570, 1, 135, 1),
+('數列', '수열', 18571, 1, 135, 1),
+('年度', '연도', 18572, 1, 135, 1),
+('月別', '월별', 18573, 1, 135, 1),
+('倫理', '윤리', 18574, 1, 135, 1),
+('音譯', '음역', 18575, 1, 135, 1),
+('日刊', '일간', 18576, 1, 135, 1),
+('族長', '족장', 18577, 1, 135, 1),
+('指數', '지수', 18578, 1, 135, 1),
+('得點板', '득점판', 18579, 1, 135, 1),
+('西部劇', '서부극', 18580, 1, 135, 1),
+('誘電率', '유전율', 18581, 1, 135, 1),
+('核反應', '핵반응', 18582, 1, 135, 1),
+('火葬場', '화장장', 18583, 1, 135, 1),
+('拒絶反應', '거절반응', 18584, 1, 135, 1),
+('腹話術師', '복화술사', 18585, 1, 135, 1),
+('象牙海岸', '상아해안', 18586, 1, 135, 1),
+('資金洗濯', '자금세탁', 18587, 1, 135, 1),
+('球場', '구장', 18588, 1, 134, 1),
+('氣胞', '기포', 18589, 1, 134, 1),
+('論斷', '론단', 18590, 1, 134, 1),
+('邦家', '방가', 18591, 1, 134, 1),
+('山火', '산화', 18592, 1, 134, 1),
+('聖書', '성서', 18593, 1, 134, 1),
+('流頭', '유두', 18594, 1, 134, 1),
+('自虐', '자학', 18595, 1, 134, 1),
+('平定', '평정', 18596, 1, 134, 1),
+('救護金', '구호금', 18597, 1, 134, 1),
+('放送員', '방송원', 18598, 1, 134, 1),
+('相思病', '상사병', 18599, 1, 134, 1),
+('電離層', '전리층', 18600, 1, 134, 1),
+('住所錄', '주소록', 18601, 1, 134, 1),
+('探險家', '탐험가', 18602, 1, 134, 1),
+('恒星年', '항성년', 18603, 1, 134, 1),
+('部下', '부하', 18604, 1, 133, 1),
+('小計', '소계', 18605, 1, 133, 1),
+('女眞', '여진', 18606, 1, 133, 1),
+('外邦', '외방', 18607, 1, 133, 1),
+('外傷', '외상', 18608, 1, 133, 1),
+('流言', '유언', 18609, 1, 133, 1),
+('真理', '진리', 18610, 1, 133, 1),
+('眞書', '진서', 18611, 1, 133, 1),
+('哲理', '철리', 18612, 1, 133, 1),
+('最長', '최장', 18613, 1, 133, 1),
+('手榴彈', '수유탄', 18614, 1, 133, 1),
+('一般醫', '일반의', 18615, 1, 133, 1),
+('參謀長', '참모장', 18616, 1, 133, 1),
+('草石蠶', '초석잠', 18617, 1, 133, 1),
+('編輯機', '편집기', 18618, 1, 133, 1),
+('虛榮心', '허영심', 18619, 1, 133, 1),
+('利害關係', '이해관계', 18620, 1, 133, 1),
+('揚音  符', '양음 부호', 18621, 1, 133, 1),
+('機密', '기밀', 18622, 1, 132, 1),
+('論理', '논리', 18623, 1, 132, 1),
+('對流', '대류', 18624, 1, 132, 1),
+('電視', '땐스', 18625, 1, 132, 1),
+('料金', '료금', 18626, 1, 132, 1),
+('文鎭', '문진', 18627, 1, 132, 1),
+('山西', '산서', 18628, 1, 132, 1),
+('商會', '상회', 18629, 1, 132, 1),
+('攝理', '섭리', 18630, 1, 132, 1),
+('心願', '심원', 18631, 1, 132, 1),
+('年號', '연호', 18632, 1, 132, 1),
+('圓心', '원심', 18633, 1, 132, 1),
+('入線', '입선', 18634, 1, 132, 1),
+('作風', '작풍', 18635, 1, 132, 1),
+('職名', '직명', 18636, 1, 132, 1),
+('忠義', '충의', 18637, 1, 132, 1),
+('海路', '해로', 18638, 1, 132, 1),
+('好機', '호기', 18639, 1, 132, 1),
+('火車', '화차', 18640, 1, 132, 1),
+('刈取機', '예취기', 18641, 1, 132, 1),
+('應接室', '응접실', 18642, 1, 132, 1),
+('再軍備', '재군비', 18643, 1, 132, 1),
+('著作權', '저작권', 18644, 1, 132, 1),
+('參考書', '참고서', 18645, 1, 132, 1),
+('諷刺文', '풍자문', 18646, 1, 132, 1),
+('後遺症', '후유증', 18647, 1, 132, 1),
+('顔面乘馬', '안면승마', 18648, 1, 132, 1),
+('四月', '4월', 18649, 1, 131, 1),
+('八月', '8월', 18650, 1, 131, 1),
+('假數', '가수', 18651, 1, 131, 1),
+('苦心', '고심', 18652, 1, 131, 1),
+('難民', '난민', 18653, 1, 131, 1),
+('露天', '로천', 18654, 1, 131, 1),
+('算數', '산수', 18655, 1, 131, 1),
+('書院', '서원', 18656, 1, 131, 1),
+('磁力', '자력', 18657, 1, 131, 1),
+('自署', '자서', 18658, 1, 131, 1),
+('換氣', '환기', 18659, 1, 131, 1),
+('熱容量', '열용량', 18660, 1, 131, 1),
+('辦公室', '판공실', 18661, 1, 131, 1),
+('拒否反應', '거부반응', 18662, 1, 131, 1),
+('金髮碧眼', '금발벽안', 18663, 1, 131, 1),
+('代案右派', '대안우파', 18664, 1, 131, 1),
+('蛇頭貝母', '사두패모', 18665, 1, 131, 1),
+('長技 자랑', '장기 자랑', 18666, 1, 131, 1),
+('過食', '과식', 18667, 1, 130, 1),
+('機銃', '기총', 18668, 1, 130, 1),
+('老年', '노년', 18669, 1, 130, 1),
+('流血', '류혈', 18670, 1, 130, 1),
+('文段', '문단', 18671, 1, 130, 1),
+('文革', '문혁', 18672, 1, 130, 1),
+('山花', '산화', 18673, 1, 130, 1),
+('時世', '시세', 18674, 1, 130, 1),
+('違法', '위법', 18675, 1, 130, 1),
+('流血', '유혈', 18676, 1, 130, 1),
+('音域', '음역', 18677, 1, 130, 1),
+('字素', '자소', 18678, 1, 130, 1),
+('赤外', '적외', 18679, 1, 130, 1),
+('鐵器', '철기', 18680, 1, 130, 1),
+('通風', '통풍', 18681, 1, 130, 1),
+('海星', '해성', 18682, 1, 130, 1),
+('十月 ', '10월', 18683, 1, 130, 1),
+('百兩金', '백량금', 18684, 1, 130, 1),
+('山棠花', '산당화', 18685, 1, 130, 1),
+('彫刻家', '조각가', 18686, 1, 130, 1),
+('超現實', '초현실', 18687, 1, 130, 1),
+('黑色腫', '흑색종', 18688, 1, 130, 1),
+('葡萄狀球菌', '포도상구균', 18689, 1, 130, 1),
+('亂數', '난수', 18690, 1, 129, 1),
+('反美', '반미', 18691, 1, 129, 1),
+('法舟', '법주', 18692, 1, 129, 1),
+('浮力', '부력', 18693, 1, 129, 1),
+('惡感', '악감', 18694, 1, 129, 1),
+('外延', '외연', 18695, 1, 129, 1),
+('外敵', '외적', 18696, 1, 129, 1),
+('外注', '외주', 18697, 1, 129, 1),
+('恩義', '은의', 18698, 1, 129, 1),
+('日沒', '일몰', 18699, 1, 129, 1),
+('自讚', '자찬', 18700, 1, 129, 1),
+('長波', '장파', 18701, 1, 129, 1),
+('鋪道', '포도', 18702, 1, 129, 1),
+('美容師', '미용사', 18703, 1, 129, 1),
+('消石灰', '소석회', 18704, 1, 129, 1),
+('朱黃色', '주황색', 18705, 1, 129, 1),
+('航空社', '항공사', 18706, 1, 129, 1),
+('營養失調', '영양실조', 18707, 1, 129, 1),
+('視覺 藝術', '시각 예술', 18708, 1, 129, 1),
+('二月', '2월', 18709, 1, 128, 1),
+('景氣', '경기', 18710, 1, 128, 1),
+('能手', '능수', 18711, 1, 128, 1),
+('良心', '량심', 18712, 1, 128, 1),
+('名目', '명목', 18713, 1, 128, 1),
+('木手', '목수', 18714, 1, 128, 1),
+('分冊', '분책', 18715, 1, 128, 1),
+('年表', '연표', 18716, 1, 128, 1),
+('自供', '자공', 18717, 1, 128, 1),
+('註文', '주문', 18718, 1, 128, 1),
+('天使', '천사', 18719, 1, 128, 1),
+('交叉點', '교차점', 18720, 1, 128, 1),
+('冒險家', '모험가', 18721, 1, 128, 1),
+('智異山', '지리산', 18722, 1, 128, 1),
+('關東八景', '관동팔경', 18723, 1, 128, 1),
+('空言', '공언', 18724, 1, 127, 1),
+('構外', '구외', 18725, 1, 127, 1),
+('帶電', '대전', 18726, 1, 127, 1),
+('心材', '심재', 18727, 1, 127, 1),
+('領海', '영해', 18728, 1, 127, 1),
+('園長', '원장', 18729, 1, 127, 1),
+('退出', '퇴출', 18730, 1, 127, 1),
+('平時', '평시', 18731, 1, 127, 1),
+('港外', '항외', 18732, 1, 127, 1),
+('高祖父', '고조부', 18733, 1, 127, 1),
+('半世紀', '반세기', 18734, 1, 127, 1),
+('發刊辭', '발간사', 18735, 1, 127, 1),
+('貧民街', '빈민가', 18736, 1, 127, 1),
+('驛馬車', '역마차', 18737, 1, 127, 1),
+('公立', '공립', 18738, 1, 126, 1),
+('忌日', '기일', 18739, 1, 126, 1),
+('論客', '논객', 18740, 1, 126, 1),
+('燈心', '등심', 18741, 1, 126, 1),
+('文匣', '문갑', 18742, 1, 126, 1),
+('本位', '본위', 18743, 1, 126, 1),
+('域外', '역외', 18744, 1, 126, 1),
+('沿道', '연도', 18745, 1, 126, 1),
+('要石', '요석', 18746, 1, 126, 1),
+('韻文', '운문', 18747, 1, 126, 1),
+('靑色', '청색', 18748, 1, 126, 1),
+('敎育費', '교육비', 18749, 1, 126, 1),
+('鑿岩機', '착암기', 18750, 1, 126, 1),
+('核戰爭', '핵전쟁', 18751, 1, 126, 1),
+('놀이公園', '놀이공원', 18752, 1, 126, 1),
+('五月', '5월', 18753, 1, 125, 1),
+('家財', '가재', 18754, 1, 125, 1),
+('宮女', '궁녀', 18755, 1, 125, 1),
+('氣功', '기공', 18756, 1, 125, 1),
+('辭書', '사서', 18757, 1, 125, 1),
+('書標', '서표', 18758, 1, 125, 1),
+('笑氣', '소기', 18759, 1, 125, 1),
+('自若', '자약', 18760, 1, 125, 1),
+('昨日', '작일', 18761, 1, 125, 1),
+('海圖', '해도', 18762, 1, 125, 1),
+('休會', '휴회', 18763, 1, 125, 1),
+('觀覽車', '관람차', 18764, 1, 125, 1),
+('管風琴', '관풍금', 18765, 1, 125, 1),
+('冷却器', '냉각기', 18766, 1, 125, 1),
+('女俳優', '여배우', 18767, 1, 125, 1),
+('十常八九', '십상팔구', 18768, 1, 125, 1),
+('家臣', '가신', 18769, 1, 124, 1),
+('來日', '내일', 18770, 1, 124, 1),
+('同質', '동질', 18771, 1, 124, 1),
+('得女', '득녀', 18772, 1, 124, 1),
+('煩文', '번문', 18773, 1, 124, 1),
+('便所', '벤소', 18774, 1, 124, 1),
+('分銅', '분동', 18775, 1, 124, 1),
+('隧道', '수도', 18776, 1, 124, 1),
+('手話', '수화', 18777, 1, 124, 1),
+('遠心', '원심', 18778, 1, 124, 1),
+('自嘲', '자조', 18779, 1, 124, 1),
+('自做', '자주', 18780, 1, 124, 1),
+('草本', '초본', 18781, 1, 124, 1),
+('出資', '출자', 18782, 1, 124, 1),
+('暴食', '폭식', 18783, 1, 124, 1),
+('角速度', '각속도', 18784, 1, 124, 1),
+('旣視感', '기시감', 18785, 1, 124, 1),
+('副士官', '부사관', 18786, 1, 124, 1),
+('佛敎徒', '불교도', 18787, 1, 124, 1),
+('秘資金', '비자금', 18788, 1, 124, 1),
+('三葉蟲', '삼엽충', 18789, 1, 124, 1),
+('熱帶林', '열대림', 18790, 1, 124, 1),
+('回轉門', '회전문', 18791, 1, 124, 1),
+('突然變異', '돌연변이', 18792, 1, 124, 1),
+('週期律表', '주기률표', 18793, 1, 124, 1),
+('週期律表', '주기율표', 18794, 1, 124, 1),
+('이슬람敎徒', '이슬람교도', 18795, 1, 124, 1),
+('家寶', '가보', 18796, 1, 123, 1),
+('個數', '개수', 18797, 1, 123, 1),
+('公路', '공로', 18798, 1, 123, 1),
+('敎職', '교직', 18799, 1, 123, 1),
+('教會', '교회', 18800, 1, 123, 1),
+('明記', '명기', 18801, 1, 123, 1),
+('本命', '본명', 18802, 1, 123, 1),
+('書案', '서안', 18803, 1, 123, 1),
+('女優', '여우', 18804, 1, 123, 1),
+('熱線', '열선', 18805, 1, 123, 1),
+('閏日', '윤일', 18806, 1, 123, 1),
+('朝食', '조식', 18807, 1, 123, 1),
+('警察車', '경찰차', 18808, 1, 123, 1),
+('南加州', '남가주', 18809, 1, 123, 1),
+('頭足類', '두족류', 18810, 1, 123, 1),
+('二頭筋', '이두근', 18811, 1, 123, 1),
+('千年紀', '천년기', 18812, 1, 123, 1),
+('携帶用', '휴대용', 18813, 1, 123, 1),
+('拒絕反應', '거절반응', 18814, 1, 123, 1),
+('情報檢索', '정보검색', 18815, 1, 123, 1),
+('情狀酌量', '정상작량', 18816, 1, 123, 1),
+('我軍  射', '아군 사격', 18817, 1, 123, 1),
+('家屋', '가옥', 18818, 1, 122, 1),
+('公賣', '공매', 18819, 1, 122, 1),
+('交點', '교점', 18820, 1, 122, 1),
+('論破', '논파', 18821, 1, 122, 1),
+('名狀', '명상', 18822, 1, 122, 1),
+('本土', '본토', 18823, 1, 122, 1),
+('部員', '부원', 18824, 1, 122, 1),
+('鼻音', '비음', 18825, 1, 122, 1),
+('色弱', '색약', 18826, 1, 122, 1),
+('書寫', '서사', 18827, 1, 122, 1),
+('心底', '심저', 18828, 1, 122, 1),
+('慾心', '욕심', 18829, 1, 122, 1),
+('偉力', '위력', 18830, 1, 122, 1),
+('音韻', '음운', 18831, 1, 122, 1),
+('音叉', '음차', 18832, 1, 122, 1),
+('全面', '전면', 18833, 1, 122, 1),
+('定量', '정량', 18834, 1, 122, 1),
+('盡力', '진력', 18835, 1, 122, 1),
+('妻家', '처가', 18836, 1, 122, 1),
+('板金', '판금', 18837, 1, 122, 1),
+('黃色', '황색', 18838, 1, 122, 1),
+('黃海', '황해', 18839, 1, 122, 1),
+('蜃氣樓', '신기루', 18840, 1, 122, 1),
+('軟豆色', '연두색', 18841, 1, 122, 1),
+('製粉所', '제분소', 18842, 1, 122, 1),
+('青少年', '청소년', 18843, 1, 122, 1),
+('改名', '개명', 18844, 1, 121, 1),
+('公團', '공단', 18845, 1, 121, 1),
+('公職', '공직', 18846, 1, 121, 1),
+('南北', '남북', 18847, 1, 121, 1),
+('論難', '논란', 18848, 1, 121, 1),
+('名辭', '명사', 18849, 1, 121, 1),
+('叛心', '반심', 18850, 1, 121, 1),
+('跋文', '발문', 18851, 1, 121, 1),
+('倍音', '배음', 18852, 1, 121, 1),
+('喪事', '상사', 18853, 1, 121, 1),
+('弱年', '약년', 18854, 1, 121, 1),
+('外患', '외환', 18855, 1, 121, 1),
+('用紙', '용지', 18856, 1, 121, 1),
+('有形', '유형', 18857, 1, 121, 1),
+('引出', '인출', 18858, 1, 121, 1),
+('紫外', '자외', 18859, 1, 121, 1),
+('氣가 ', '기가 ', 18860, 1, 121, 1),
+('多毛作', '다모작', 18861, 1, 121, 1),
+('多幸感', '다행감', 18862, 1, 121, 1),
+('反射鏡', '반사경', 18863, 1, 121, 1),
+('設計圖', '설계도', 18864, 1, 121, 1),
+('展覽會', '전람회', 18865, 1, 121, 1),
+('聽診器', '청진기', 18866, 1, 121, 1),
+('編輯長', '편집장', 18867, 1, 121, 1),
+('花柳病', '화류병', 18868, 1, 121, 1),
+('後甲板', '후갑판', 18869, 1, 121, 1),
+('信託統治', '신탁통치', 18870, 1, 121, 1),
+('呼名点呼', '호명점호', 18871, 1, 121, 1),
+('六月', '6월', 18872, 1, 120, 1),
+('機緣', '기연', 18873, 1, 120, 1),
+('茶食', '다식', 18874, 1, 120, 1),
+('六月', '류월', 18875, 1, 120, 1),
+('六月', '유월', 18876, 1, 120, 1),
+('長針', '장침', 18877, 1, 120, 1),
+('全南', '전남', 18878, 1, 120, 1),
+('咒文', '주문', 18879, 1, 120, 1),
+('天蓋', '천개', 18880, 1, 120, 1),
+('惰力', '타력', 18881, 1, 120, 1),
+('合板', '합판', 18882, 1, 120, 1),
+('海象', '해상', 18883, 1, 120, 1),
+('回敎', '회교', 18884, 1, 120, 1),
+('黑色', '흑색', 18885, 1, 120, 1),
+('黑海', '흑해', 18886, 1, 120, 1),
+('放射能', '방사능', 18887, 1, 120, 1),
+('禮式場', '예식장', 18888, 1, 120, 1),
+('融資金', '융자금', 18889, 1, 120, 1),
+('靑信號', '청신호', 18890, 1, 120, 1),
+('板門店', '판문점', 18891, 1, 120, 1),
+('護身術', '호신술', 18892, 1, 120, 1),
+('後背位', '후배위', 18893, 1, 120, 1),
+('平和維持', '평화유지', 18894, 1, 120, 1),
+('覺書', '각서', 18895, 1, 119, 1),
+('高聲', '고성', 18896, 1, 119, 1),
+('氣焰', '기염', 18897, 1, 119, 1),
+('內角', '내각', 18898, 1, 119, 1),
+('母權', '모권', 18899, 1, 119, 1),
+('分枝', '분지', 18900, 1, 119, 1),
+('死産', '사산', 18901, 1, 119, 1),
+('書藝', '서예', 18902, 1, 119, 1),
+('視點', '시점', 18903, 1, 119, 1),
+('失神', '실신', 18904, 1, 119, 1),
+('流量', '유량', 18905, 1, 119, 1),
+('因數', '인수', 18906, 1, 119, 1),
+('全員', '전원', 18907, 1, 119, 1),
+('合議', '합의', 18908, 1, 119, 1),
+('孝心', '효심', 18909, 1, 119, 1),
+('減衰器', '감쇠기', 18910, 1, 119, 1),
+('突然死', '돌연사', 18911, 1, 119, 1),
+('童貞女', '동정녀', 18912, 1, 119, 1),
+('馬頭琴', '마두금', 18913, 1, 119, 1),
+('萬葉集', '만엽집', 18914, 1, 119, 1),
+('美容院', '미용원', 18915, 1, 119, 1),
+('噴火口', '분화구', 18916, 1, 119, 1),
+('貧民窟', '빈민굴', 18917, 1, 119, 1),
+('卒業狀', '졸업장', 18918, 1, 119, 1),
+('鑿巖機', '착암기', 18919, 1, 119, 1),
+('敗血症', '패혈증', 18920, 1, 119, 1),
+('漂白劑', '표백제', 18921, 1, 119, 1),
+('核融合', '핵융합', 18922, 1, 119, 1),
+('虛無孟浪', '허무맹랑', 18923, 1, 119, 1),
+('유럽 聯合', '유럽 련합', 18924, 1, 119, 1),
+('유럽 聯合', '유럽 연합', 18925, 1, 119, 1),
+('親族 關係', '친족 관계', 18926, 1, 119, 1),
+('濠斯太剌利亞', '호사태랄리아', 18927, 1, 119, 1),
+('同類', '동류', 18928, 1, 118, 1),
+('同調', '동조', 18929, 1, 118, 1),
+('面前', '면전', 18930, 1, 118, 1),
+('拼音', '병음', 18931, 1, 118, 1),
+('北美', '북미', 18932, 1, 118, 1),
+('分溜', '분류', 18933, 1, 118, 1),
+('式場', '식장', 18934, 1, 118, 1),
+('膂力', '여력', 18935, 1, 118, 1),
+('轉用', '전용', 18936, 1, 118, 1),
+('定立', '정립', 18937, 1, 118, 1),
+('天干', '천간', 18938, 1, 118, 1),
+('出費', '출비', 18939, 1, 118, 1),
+('覇氣', '패기', 18940, 1, 118, 1),
+('解明', '해명', 18941, 1, 118, 1),
+('反革命', '반혁명', 18942, 1, 118, 1),
+('白砂糖', '백사탕', 18943, 1, 118, 1),
+('申命記', '신명기', 18944, 1, 118, 1),
+('鉛管工', '연관공', 18945, 1, 118, 1),
+('午餐會', '오찬회', 18946, 1, 118, 1),
+('葡萄色', '포도색', 18947, 1, 118, 1),
+('近親相姦', '근친상간', 18948, 1, 118, 1),
+('催眠術士', '최면술사', 18949, 1, 118, 1),
+('家譜', '가보', 18950, 1, 117, 1),
+('感想', '감상', 18951, 1, 117, 1),
+('武名', '무명', 18952, 1, 117, 1),
+('病室', '병실', 18953, 1, 117, 1),
+('本領', '봉령', 18954, 1, 117, 1),
+('山東', '산동', 18955, 1, 117, 1),
+('西南', '서남', 18956, 1, 117, 1),
+('俗名', '속명', 18957, 1, 117, 1),
+('瘴氣', '장기', 18958, 1, 117, 1),
+('電波', '전파', 18959, 1, 117, 1),
+('寒心', '한심', 18960, 1, 117, 1),
+('海州', '해주', 18961, 1, 117, 1),
+('戶外', '호외', 18962, 1, 117, 1),
+('耕耘機', '경운기', 18963, 1, 117, 1),
+('寡頭制', '과두제', 18964, 1, 117, 1),
+('光復節', '광복절', 18965, 1, 117, 1),
+('奉仕機', '봉사기', 18966, 1, 117, 1),
+('戰爭狂', '전쟁광', 18967, 1, 117, 1),
+('保溫裝置', '보온장치', 18968, 1, 117, 1),
+('曾祖父母', '증조부모', 18969, 1, 117, 1),
+('感應', '감응', 18970, 1, 116, 1),
+('去年', '거년', 18971, 1, 116, 1),
+('貴女', '귀녀', 18972, 1, 116, 1),
+('極點', '극점', 18973, 1, 116, 1),
+('名勝', '명승', 18974, 1, 116, 1),
+('名祖', '명조', 18975, 1, 116, 1),
+('發送', '발송', 18976, 1, 116, 1),
+('本選', '본선', 18977, 1, 116, 1),
+('本店', '본점', 18978, 1, 116, 1),
+('相反', '상반', 18979, 1, 116, 1),
+('小房', '소방', 18980, 1, 116, 1),
+('修業', '수업', 18981, 1, 116, 1),
+('臣民', '신민', 18982, 1, 116, 1),
+('實質', '실질', 18983, 1, 116, 1),
+('熱血', '열혈', 18984, 1, 116, 1),
+('整數', '정수', 18985, 1, 116, 1),
+('打電', '타전', 18986, 1, 116, 1),
+('花形', '화형', 18987, 1, 116, 1),
+('黃金', '황금', 18988, 1, 116, 1),
+('句讀點', '구두점', 18989, 1, 116, 1),
+('掘鑿機', '굴착기', 18990, 1, 116, 1),
+('防彈服', '방탄복', 18991, 1, 116, 1),
+('防火壁', '방화벽', 18992, 1, 116, 1),
+('白雪糖', '백설탕', 18993, 1, 116, 1),
+('北加州', '북가주', 18994, 1, 116, 1),
+('非常口', '비상구', 18995, 1, 116, 1),
+('三脚臺', '삼각대', 18996, 1, 116, 1),
+('應急室', '응급실', 18997, 1, 116, 1),
+('除雪車', '제설차', 18998, 1, 116, 1),
+('漢拏山', '한라산', 18999, 1, 116, 1),
+('漢拏山', '한라산', 19000, 1, 116, 1),
+('巡廻審判所', '순회심판소', 19001, 1, 116, 1),
+('分', '푼', 19002, 1, 115, 1),
+('公告', '공고', 19003, 1, 115, 1),
+('公私', '공사', 19004, 1, 115, 1),
+('欄外', '난외', 19005, 1, 115, 1),
+('滿月', '만월', 19006, 1, 115, 1),
+('發破', '발파', 19007, 1, 115, 1),
+('發砲', '발포', 19008, 1, 115, 1),
+('芳心', '방심', 19009, 1, 115, 1),
+('兵員', '병원', 19010, 1, 115, 1),
+('分娩', '분만', 19011, 1, 115, 1),
+('社內', '사내', 19012, 1, 115, 1),
+('書庫', '서고', 19013, 1, 115, 1),
+('送金', '송금', 19014, 1, 115, 1),
+('藝名', '예명', 19015, 1, 115, 1),
+('軼事', '일사', 19016, 1, 115, 1),
+('出港', '출항', 19017, 1, 115, 1),
+('新教徒', '신교도', 19018, 1, 115, 1),
+('歷史上', '역사상', 19019, 1, 115, 1),
+('月桂樹', '월계수', 19020, 1, 115, 1),
+('油槽車', '유조차', 19021, 1, 115, 1),
+('指揮所', '지휘소', 19022, 1, 115, 1),
+('八邊形', '팔변형', 19023, 1, 115, 1),
+('韓半島', '한반도', 19024, 1, 115, 1),
+('東奔西走', '동분서주', 19025, 1, 115, 1),
+('帝王 切開', '제왕 절개', 19026, 1, 115, 1),
+('感知', '감지', 19027, 1, 114, 1),
+('工兵', '공병', 19028, 1, 114, 1),
+('共用', '공용', 19029, 1, 114, 1),
+('論爭', '론쟁', 19030, 1, 114, 1),
+('白板', '백판', 19031, 1, 114, 1),
+('死別', '사별', 19032, 1, 114, 1),
+('隨一', '수일', 19033, 1, 114, 1),
+('試論', '시론', 19034, 1, 114, 1),
+('年限', '연한', 19035, 1, 114, 1),
+('熱火', '열화', 19036, 1, 114, 1),
+('例外', '예외', 19037, 1, 114, 1),
+('秋色', '추색', 19038, 1, 114, 1),
+('風情', '풍정', 19039, 1, 114, 1),
+('紅海', '홍해', 19040, 1, 114, 1),
+('乾電池', '건전지', 19041, 1, 114, 1),
+('南朝鮮', '남조선', 19042, 1, 114, 1),
+('綿實油', '면실유', 19043, 1, 114, 1),
+('白堊館', '백악관', 19044, 1, 114, 1),
+('乘車券', '승차권', 19045, 1, 114, 1),
+('祖父母', '조부모', 19046, 1, 114, 1),
+('極超短波', '극초단파', 19047, 1, 114, 1),
+('焚書坑儒', '분서갱유', 19048, 1, 114, 1),
+('窮民', '궁민', 19049, 1, 113, 1),
+('聯合', '련합', 19050, 1, 113, 1),
+('本然', '본연', 19051, 1, 113, 1),
+('先軍', '선군', 19052, 1, 113, 1),
+('心搏', '심박', 19053, 1, 113, 1),
+('惡政', '악정', 19054, 1, 113, 1),
+('安南', '안남', 19055, 1, 113, 1),
+('里長', '이장', 19056, 1, 113, 1),
+('逸出', '일출', 19057, 1, 113, 1),
+('再發', '재발', 19058, 1, 113, 1),
+('電離', '전리', 19059, 1, 113, 1),
+('全北', '전북', 19060, 1, 113, 1),
+('限月', '한월', 19061, 1, 113, 1),
+('好色', '호색', 19062, 1, 113, 1),
+('高梁酒', '고량주', 19063, 1, 113, 1),
+('高周波', '고주파', 19064, 1, 113, 1),
+('無盡藏', '무진장', 19065, 1, 113, 1),
+('保安司', '보안사', 19066, 1, 113, 1),
+('神仙爐', '신선로', 19067, 1, 113, 1),
+('養育權', '양육권', 19068, 1, 113, 1),
+('宇宙論', '우주론', 19069, 1, 113, 1),
+('疑問死', '의문사', 19070, 1, 113, 1),
+('裁判所', '재판소', 19071, 1, 113, 1),
+('親三寸', '친삼촌', 19072, 1, 113, 1),
+('販賣員', '판매원', 19073, 1, 113, 1),
+('興南 撤收', '흥남 철수', 19074, 1, 113, 1),
+('光明', '광명', 19075, 1, 112, 1),
+('名聞', '명문', 19076, 1, 112, 1),
+('時調', '시조', 19077, 1, 112, 1),
+('愛馬', '애마', 19078, 1, 112, 1),
+('銀色', '은색', 19079, 1, 112, 1),
+('天災', '천재', 19080, 1, 112, 1),
+('淸白', '청백', 19081, 1, 112, 1),
+('村長', '촌장', 19082, 1, 112, 1),
+('海鳥', '해조', 19083, 1, 112, 1),
+('後門', '후문', 19084, 1, 112, 1),
+('孤獨感', '고독감', 19085, 1, 112, 1),
+('落第點', '낙제점', 19086, 1, 112, 1),
+('南阿共', '남아공', 19087, 1, 112, 1),
+('無脊椎', '무척추', 19088, 1, 112, 1),
+('反逆罪', '반역죄', 19089, 1, 112, 1),
+('揷入曲', '삽입곡', 19090, 1, 112, 1),
+('消耗戰', '소모전', 19091, 1, 112, 1),
+('智慧書', '지혜서', 19092, 1, 112, 1),
+('限定版', '한정판', 19093, 1, 112, 1),
+('強點', '강점', 19094, 1, 111, 1),
+('同等', '동등', 19095, 1, 111, 1),
+('無雙', '무쌍', 19096, 1, 111, 1),
+('殖民', '식민', 19097, 1, 111, 1),
+('與論', '여론', 19098, 1, 111, 1),
+('藏書', '장서', 19099, 1, 111, 1),
+('天池', '천지', 19100, 1, 111, 1),
+('天津', '천진', 19101, 1, 111, 1),
+('總合', '총합', 19102, 1, 111, 1),
+('投下', '투하', 19103, 1, 111, 1),
+('共産黨', '공산당', 19104, 1, 111, 1),
+('引用符', '인용부', 19105, 1, 111, 1),
+('採綿器', '채면기', 19106, 1, 111, 1),
+('北西', '북서', 19107, 1, 110, 1),
+('上客', '상객', 19108, 1, 110, 1),
+('西北', '서북', 19109, 1, 110, 1),
+('食券', '식권', 19110, 1, 110, 1),
+('良心', '양심', 19111, 1, 110, 1),
+('一蹴', '일축', 19112, 1, 110, 1),
+('適所', '적소', 19113, 1, 110, 1),
+('電番', '전번', 19114, 1, 110, 1),
+('天啓', '천계', 19115, 1, 110, 1),
+('天菊', '천국', 19116, 1, 110, 1),
+('特點', '특점', 19117, 1, 110, 1),
+('解産', '해산', 19118, 1, 110, 1),
+('加速度', '가속도', 19119, 1, 110, 1),
+('北氷洋', '북빙양', 19120, 1, 110, 1),
+('不平等', '불평등', 19121, 1, 110, 1),
+('第六感', '제육감', 19122, 1, 110, 1),
+('親善都市', '친선도시', 19123, 1, 110, 1),
+('七月', '7월', 19124, 1, 109, 1),
+('高等', '고등', 19125, 1, 109, 1),
+('軍務', '군무', 19126, 1, 109, 1),
+('三韓', '삼한', 19127, 1, 109, 1),
+('西方', '서방', 19128, 1, 109, 1),
+('世相', '세상', 19129, 1, 109, 1),
+('習字', '습자', 19130, 1, 109, 1),
+('言質', '언질', 19131, 1, 109, 1),
+('絶食', '절식', 19132, 1, 109, 1),
+('出荷', '출하', 19133, 1, 109, 1),
+('編年', '편년', 19134, 1, 109, 1),
+('後産', '후산', 19135, 1, 109, 1),
+('口蓋骨', '구개골', 19136, 1, 109, 1),
+('白條漁', '백조어', 19137, 1, 109, 1),
+('氷堆石', '빙퇴석', 19138, 1, 109, 1),
+('女職員', '여직원', 19139, 1, 109, 1),
+('鎔接工', '용접공', 19140, 1, 109, 1),
+('總罷業', '총파업', 19141, 1, 109, 1),
+('風蝶草', '풍접초', 19142, 1, 109, 1),
+('緘口症', '함구증', 19143, 1, 109, 1),
+('軍紀訓鍊', '군기훈련', 19144, 1, 109, 1),
+('風飛雹散', '풍비박산', 19145, 1, 109, 1),
+('高率', '고율', 19146, 1, 108, 1),
+('共感', '공감', 19147, 1, 108, 1),
+('禁食', '금식', 19148, 1, 108, 1),
+('旗手', '기수', 19149, 1, 108, 1),
+('列車', '렬차', 19150, 1, 108, 1),
+('方士', '방사', 19151, 1, 108, 1),
+('梵天', '범천', 19152, 1, 108, 1),
+('書簡', '서간', 19153, 1, 108, 1),
+('失業', '실업', 19154, 1, 108, 1),
+('列車', '열차', 19155, 1, 108, 1),
+('染色', '염색', 19156, 1, 108, 1),
+('五感', '오감', 19157, 1, 108, 1),
+('原種', '원종', 19158, 1, 108, 1),
+('長鼓', '장고', 19159, 1, 108, 1),
+('質權', '질권', 19160, 1, 108, 1),
+('天穹', '천궁', 19161, 1, 108, 1),
+('天井', '천정', 19162, 1, 108, 1),
+('海港', '해항', 19163, 1, 108, 1),
+('硬石膏', '경석고', 19164, 1, 108, 1),
+('官僚制', '관료제', 19165, 1, 108, 1),
+('小說册', '소설책', 19166, 1, 108, 1),
+('利尿劑', '이뇨제', 19167, 1, 108, 1),
+('內職', '내직', 19168, 1, 107, 1),
+('年稅', '년세', 19169, 1, 107, 1),
+('獨白', '독백', 19170, 1, 107, 1),
+('脈石', '맥석', 19171, 1, 107, 1),
+('木通', '목통', 19172, 1, 107, 1),
+('發足', '발족', 19173, 1, 107, 1),
+('辯論', '변론', 19174, 1, 107, 1),
+('實彈', '실탄', 19175, 1, 107, 1),
+('安樂', '안락', 19176, 1, 107, 1),
+('月琴', '월금', 19177, 1, 107, 1),
+('威名', '위명', 19178, 1, 107, 1),
+('造形', '조형', 19179, 1, 107, 1),
+('罪業', '죄업', 19180, 1, 107, 1),
+('進入', '진입', 19181, 1, 107, 1),
+('平安', '평안', 19182, 1, 107, 1),
+('會寧', '회령', 19183, 1, 107, 1),
+('舊世界', '구세계', 19184, 1, 107, 1),
+('落下傘', '락하산', 19185, 1, 107, 1),
+('壁新聞', '벽신문', 19186, 1, 107, 1),
+('新加坡', '신가파', 19187, 1, 107, 1),
+('必要惡', '필요악', 19188, 1, 107, 1),
+('還拂金', '환불금', 19189, 1, 107, 1),
+('一', '일', 19190, 1, 106, 1),
+('脚色', '각색', 19191, 1, 106, 1),
+('結實', '결실', 19192, 1, 106, 1),
+('反轉', '반전', 19193, 1, 106, 1),
+('書架', '서가', 19194, 1, 106, 1),
+('石材', '석재', 19195, 1, 106, 1),
+('小曲', '소곡', 19196, 1, 106, 1),
+('手藝', '수예', 19197, 1, 106, 1),
+('洗手', '쉐수', 19198, 1, 106, 1),
+('神童', '신동', 19199, 1, 106, 1),
+('誤用', '오용', 19200, 1, 106, 1),
+('裏書', '이서', 19201, 1, 106, 1),
+('一縷', '일루', 19202, 1, 106, 1),
+('艇長', '정장', 19203, 1, 106, 1),
+('天鵝', '천아', 19204, 1, 106, 1),
+('齒石', '치석', 19205, 1, 106, 1),
+('風船', '풍선', 19206, 1, 106, 1),
+('下直', '하직', 19207, 1, 106, 1),
+('海里', '해리', 19208, 1, 106, 1),
+('綿製品', '면제품', 19209, 1, 106, 1),
+('防護服', '방호복', 19210, 1, 106, 1),
+('復讐戰', '복수전', 19211, 1, 106, 1),
+('不確實', '불확실', 19212, 1, 106, 1),
+('非對稱', '비대칭', 19213, 1, 106, 1),
+('非營利', '비영리', 19214, 1, 106, 1),
+('司令部', '사령부', 19215, 1, 106, 1),
+('殺母蛇', '살모사', 19216, 1, 106, 1),
+('手裏劍', '수리검', 19217, 1, 106, 1),
+('시토會', '시토회', 19218, 1, 106, 1),
+('節度使', '절도사', 19219, 1, 106, 1),
+('菜種油', '채종유', 19220, 1, 106, 1),
+('民', '민', 19221, 1, 105, 1),
+('起用', '기용', 19222, 1, 105, 1),
+('金策', '김책', 19223, 1, 105, 1),
+('南韓', '남한', 19224, 1, 105, 1),
+('年歲', '년세', 19225, 1, 105, 1),
+('斷面', '단면', 19226, 1, 105, 1),
+('都合', '도합', 19227, 1, 105, 1),
+('萬病', '만병', 19228, 1, 105, 1),
+('發注', '발주', 19229, 1, 105, 1),
+('本壘', '본루', 19230, 1, 105, 1),
+('本願', '본원', 19231, 1, 105, 1),
+('噴出', '분출', 19232, 1, 105, 1),
+('三星', '삼성', 19233, 1, 105, 1),
+('上例', '상례', 19234, 1, 105, 1),
+('小賣', '소매', 19235, 1, 105, 1),
+('新館', '신관', 19236, 1, 105, 1),
+('新羅', '신라', 19237, 1, 105, 1),
+('身後', '신후', 19238, 1, 105, 1),
+('年刊', '연간', 19239, 1, 105, 1),
+('年歲', '연세', 19240, 1, 105, 1),
+('熱量', '열량', 19241, 1, 105, 1),
+('午年', '오년', 19242, 1, 105, 1),
+('有産', '유산', 19243, 1, 105, 1),
+('流速', '유속', 19244, 1, 105, 1),
+('直流', '직류', 19245, 1, 105, 1),
+('集成', '집성', 19246, 1, 105, 1),
+('打字', '타자', 19247, 1, 105, 1),
+('投入', '투입', 19248, 1, 105, 1),
+('品位', '품위', 19249, 1, 105, 1),
+('會誌', '회지', 19250, 1, 105, 1),
+('祈禱書', '기도서', 19251, 1, 105, 1),
+('貸付金', '대부금', 19252, 1, 105, 1),
+('突破口', '돌파구', 19253, 1, 105, 1),
+('燐灰石', '인회석', 19254, 1, 105, 1),
+('赤信號', '적신호', 19255, 1, 105, 1),
+('하나會', '하나회', 19256, 1, 105, 1),
+('康熙字典', '강희자전', 19257, 1, 105, 1),
+('仁川空港', '인천공항', 19258, 1, 105, 1),
+('超過勤務', '초과근무', 19259, 1, 105, 1),
+('九月', '9월', 19260, 1, 104, 1),
+('公認', '공인', 19261, 1, 104, 1),
+('無爲', '무위', 19262, 1, 104, 1),
+('反骨', '반골', 19263, 1, 104, 1),
+('白露', '백로', 19264, 1, 104, 1),
+('兵士', '병사', 19265, 1, 104, 1),
+('本邦', '본방', 19266, 1, 104, 1),
+('手續', '수속', 19267, 1, 104, 1),
+('守戰', '수전', 19268, 1, 104, 1),
+('數爻', '수효', 19269, 1, 104, 1),
+('食刀', '식도', 19270, 1, 104, 1),
+('王權', '왕권', 19271, 1, 104, 1),
+('月刊', '월간', 19272, 1, 104, 1),
+('捕食', '포식', 19273, 1, 104, 1),
+('現品', '현품', 19274, 1, 104, 1),
+('休業', '휴업', 19275, 1, 104, 1),
+('價格帶', '가격대', 19276, 1, 104, 1),
+('無酵餠', '무교병', 19277, 1, 104, 1),
+('變成岩', '변성암', 19278, 1, 104, 1),
+('補助詞', '보조사', 19279, 1, 104, 1),
+('診療所', '진료소', 19280, 1, 104, 1),
+('測微計', '측미계', 19281, 1, 104, 1),
+('核實驗', '핵실험', 19282, 1, 104, 1),
+('經口', '경구', 19283, 1, 103, 1),
+('戒名', '계명', 19284, 1, 103, 1),
+('孤食', '고식', 19285, 1, 103, 1),
+('果實', '과실', 19286, 1, 103, 1),
+('金庫', '금고', 19287, 1, 103, 1),
+('多小', '다소', 19288, 1, 103, 1),
+('路線', '로선', 19289, 1, 103, 1),
+('白菜', '백채', 19290, 1, 103, 1),
+('山菜', '산채', 19291, 1, 103, 1),
+('三修', '삼수', 19292, 1, 103, 1),
+('石耳', '석이', 19293, 1, 103, 1),
+('善戰', '선전', 19294, 1, 103, 1),
+('誤字', '오자', 19295, 1, 103, 1),
+('王政', '왕정', 19296, 1, 103, 1),
+('入射', '입사', 19297, 1, 103, 1),
+('敵手', '적수', 19298, 1, 103, 1),
+('前半', '전반', 19299, 1, 103, 1),
+('傳言', '전언', 19300, 1, 103, 1),
+('丁年', '정년', 19301, 1, 103, 1),
+('真書', '진서', 19302, 1, 103, 1),
+('添書', '첨서', 19303, 1, 103, 1),
+('海牛', '해우', 19304, 1, 103, 1),
+('顯出', '현출', 19305, 1, 103, 1),
+('幻月', '환월', 19306, 1, 103, 1),
+('環海', '환해', 19307, 1, 103, 1),
+('關節炎', '관절염', 19308, 1, 103, 1),
+('難讀症', '난독증', 19309, 1, 103, 1),
+('未成熟', '미성숙', 19310, 1, 103, 1),
+('未完成', '미완성', 19311, 1, 103, 1),
+('발트海', '발트해', 19312, 1, 103, 1),
+('食卓褓', '식탁보', 19313, 1, 103, 1),
+('靈柩車', '영구차', 19314, 1, 103, 1),
+('展示場', '전시장', 19315, 1, 103, 1),
+('解決策', '해결책', 19316, 1, 103, 1),
+('七星상魚', '칠성상어', 19317, 1, 103, 1),
+('葡萄球菌', '포도구균', 19318, 1, 103, 1),
+('오호츠크海', '오호츠크해', 19319, 1, 103, 1),
+('甲軍', '갑군', 19320, 1, 102, 1),
+('改定', '개정', 19321, 1, 102, 1),
+('傑出', '걸출', 19322, 1, 102, 1),
+('計畫', '계획', 19323, 1, 102, 1),
+('管樂', '관악', 19324, 1, 102, 1),
+('鑛業', '광업', 19325, 1, 102, 1),
+('校時', '교시', 19326, 1, 102, 1),
+('校正', '교정', 19327, 1, 102, 1),
+('東南', '동남', 19328, 1, 102, 1),
+('蜜月', '밀월', 19329, 1, 102, 1),
+('反共', '반공', 19330, 1, 102, 1),
+('發癌', '발암', 19331, 1, 102, 1),
+('放熱', '방열', 19332, 1, 102, 1),
+('複合', '복합', 19333, 1, 102, 1),
+('師母', '사모', 19334, 1, 102, 1),
+('上席', '상석', 19335, 1, 102, 1),
+('序論', '서론', 19336, 1, 102, 1),
+('西安', '서안', 19337, 1, 102, 1),
+('石弓', '석궁', 19338, 1, 102, 1),
+('樂經', '악경', 19339, 1, 102, 1),
+('殘月', '잔월', 19340, 1, 102, 1),
+('長斫', '장작', 19341, 1, 102, 1),
+('戰雲', '전운', 19342, 1, 102, 1),
+('電源', '전원', 19343, 1, 102, 1),
+('早食', '조식', 19344, 1, 102, 1),
+('波高', '파고', 19345, 1, 102, 1),
+('好戰', '호전', 19346, 1, 102, 1),
+('黑點', '흑점', 19347, 1, 102, 1),
+('10月', '10월', 19348, 1, 102, 1),
+('12月', '12월', 19349, 1, 102, 1),
+('東印度', '동인도', 19350, 1, 102, 1),
+('問題視', '문제시', 19351, 1, 102, 1),
+('寫眞術', '사진술', 19352, 1, 102, 1),
+('山沙汰', '산사태', 19353, 1, 102, 1),
+('12月', '십이월', 19354, 1, 102, 1),
+('養老院', '양로원', 19355, 1, 102, 1),
+('幸福感', '행복감', 19356, 1, 102, 1),
+('首腦相逢', '수뇌상봉', 19357, 1, 102, 1),
+('眞實게임', '진실게임', 19358, 1, 102, 1),
+('航空宇宙', '항공우주', 19359, 1, 102, 1),
+('強風', '강풍', 19360, 1, 101, 1),
+('客死', '객사', 19361, 1, 101, 1),
+('權能', '권능', 19362, 1, 101, 1),
+('金髮', '금발', 19363, 1, 101, 1),
+('妓女', '기녀', 19364, 1, 101, 1),
+('來世', '내세', 19365, 1, 101, 1),
+('但書', '단서', 19366, 1, 101, 1),
+('短所', '단소', 19367, 1, 101, 1),
+('隊員', '대원', 19368, 1, 101, 1),
+('領空', '령공', 19369, 1, 101, 1),
+('發刊', '발간', 19370, 1, 101, 1),
+('保有', '보유', 19371, 1, 101, 1),
+('副本', '부본', 19372, 1, 101, 1),
+('岩石', '암석', 19373, 1, 101, 1),
+('女傑', '여걸', 19374, 1, 101, 1),
+('捻出', '염출', 19375, 1, 101, 1),
+('領空', '영공', 19376, 1, 101, 1),
+('肉感', '육감', 19377, 1, 101, 1),
+('入館', '입관', 19378, 1, 101, 1),
+('長股', '장고', 19379, 1, 101, 1),
+('長征', '장정', 19380, 1, 101, 1),
+('適時', '적시', 19381, 1, 101, 1),
+('適正', '적정', 19382, 1, 101, 1),
+('嫡出', '적출', 19383, 1, 101, 1),
+('電磁', '전자', 19384, 1, 101, 1),
+('停電', '정전', 19385, 1, 101, 1),
+('戰爭', '졘쟝', 19386, 1, 101, 1),
+('出捐', '출연', 19387, 1, 101, 1),
+('彈頭', '탄두', 19388, 1, 101, 1),
+('特記', '특기', 19389, 1, 101, 1),
+('布車', '포차', 19390, 1, 101, 1),
+('看護員', '간호원', 19391, 1, 101, 1),
+('曲射砲', '곡사포', 19392, 1, 101, 1),
+('曲藝師', '곡예사', 19393, 1, 101, 1),
+('公娼街', '공창가', 19394, 1, 101, 1),
+('馬廐間', '마구간', 19395, 1, 101, 1),
+('旋盤工', '선반공', 19396, 1, 101, 1),
+('原始林', '원시림', 19397, 1, 101, 1),
+('隱花果', '은화과', 19398, 1, 101, 1),
+('政治질', '정치질', 19399, 1, 101, 1),
+('蓄電池', '축전지', 19400, 1, 101, 1),
+('航空券', '항공권', 19401, 1, 101, 1),
+('玄關門', '현관문', 19402, 1, 101, 1),
+('部隊찌개', '부대찌개', 19403, 1, 101, 1),
+('노랑부리白鷺', '노랑부리백로', 19404, 1, 101, 1),
+('長', '장', 19405, 1, 100, 1),
+('鑛山', '광산', 19406, 1, 100, 1),
+('急流', '급류', 19407, 1, 100, 1),
+('露點', '노점', 19408, 1, 100, 1),
+('凍石', '동석', 19409, 1, 100, 1),
+('半角', '반각', 19410, 1, 100, 1),
+('芳名', '방명', 19411, 1, 100, 1),
+('浮石', '부석', 19412, 1, 100, 1),
+('石綿', '석면', 19413, 1, 100, 1),
+('石塔', '석탑', 19414, 1, 100, 1),
+('石灰', '석회', 19415, 1, 100, 1),
+('世帶', '세대', 19416, 1, 100, 1),
+('神壇', '신단', 19417, 1, 100, 1),
+('愛護', '애호', 19418, 1, 100, 1),
+('女캐', '여캐', 19419, 1, 100, 1),
+('連記', '연기', 19420, 1, 100, 1),
+('原酒', '원주', 19421, 1, 100, 1),
+('入養', '입양', 19422, 1, 100, 1),
+('點眼', '점안', 19423, 1, 100, 1),
+('定住', '정주', 19424, 1, 100, 1),
+('定州', '정주', 19425, 1, 100, 1),
+('朱色', '주색', 19426, 1, 100, 1),
+('姪女', '질녀', 19427, 1, 100, 1),
+('鐵工', '철공', 19428, 1, 100, 1),
+('靑空', '청공', 19429, 1, 100, 1),
+('蛇紋石', '사문석', 19430, 1, 100, 1),
+('裁斷師', '재단사', 19431, 1, 100, 1),
+('專門職', '전문직', 19432, 1, 100, 1),
+('製靴工', '제화공', 19433, 1, 100, 1),
+('風琴鳥', '풍금조', 19434, 1, 100, 1),
+('旗幟鮮明', '기치선명', 19435, 1, 100, 1),
+('1月', '1월', 19436, 1, 99, 1),
+('課金', '과금', 19437, 1, 99, 1),
+('卵白', '난백', 19438, 1, 99, 1),
+('斷言', '단언', 19439, 1, 99, 1),
+('毒死', '독사', 19440, 1, 99, 1),
+('滿點', '만점', 19441, 1, 99, 1),
+('面目', '면목', 19442, 1, 99, 1),
+('配球', '배구', 19443, 1, 99, 1),
+('白鮮', '백선', 19444, 1, 99, 1),
+('病弱', '병약', 19445, 1, 99, 1),
+('寶石', '보석', 19446, 1, 99, 1),
+('史記', '사기', 19447, 1, 99, 1),
+('色盲', '색맹', 19448, 1, 99, 1),
+('神殿', '신전', 19449, 1, 99, 1),
+('年貢', '연공', 19450, 1, 99, 1),
+('元山', '원산', 19451, 1, 99, 1),
+('流罪', '유죄', 19452, 1, 99, 1),
+('1月', '일월', 19453, 1, 99, 1),
+('戰犯', '전범', 19454, 1, 99, 1),
+('進言', '진언', 19455, 1, 99, 1),
+('借金', '차금', 19456, 1, 99, 1),
+('青海', '청해', 19457, 1, 99, 1),
+('抗戰', '항전', 19458, 1, 99, 1),
+('11月', '11월', 19459, 1, 99, 1),
+('萬里花', '만리화', 19460, 1, 99, 1),
+('寫眞師', '사진사', 19461, 1, 99, 1),
+('11月', '십일월', 19462, 1, 99, 1),
+('溫突房', '온돌방', 19463, 1, 99, 1),
+('乳房癌', '유방암', 19464, 1, 99, 1),
+('太極旗', '태극기', 19465, 1, 99, 1),
+('抗毒素', '항독소', 19466, 1, 99, 1),
+('硅素 樹脂', '규소 수지', 19467, 1, 99, 1),
+('間斷', '간단', 19468, 1, 98, 1),
+('乞食', '걸식', 19469, 1, 98, 1),
+('競合', '경합', 19470, 1, 98, 1),
+('金錢', '금전', 19471, 1, 98, 1),
+('年齡', '년령', 19472, 1, 98, 1),
+('圖面', '도면', 19473, 1, 98, 1),
+('武定', '무정', 19474, 1, 98, 1),
+('白銀', '백은', 19475, 1, 98, 1),
+('北韓', '북한', 19476, 1, 98, 1),
+('速記', '속기', 19477, 1, 98, 1),
+('熱帶', '열대', 19478, 1, 98, 1),
+('原畫', '원화', 19479, 1, 98, 1),
+('流離', '유리', 19480, 1, 98, 1),
+('直面', '직면', 19481, 1, 98, 1),
+('青年', '청년', 19482, 1, 98, 1),
+('吐器', '토기', 19483, 1, 98, 1),
+('通常', '통상', 19484, 1, 98, 1),
+('海蔘', '해삼', 19485, 1, 98, 1),
+('回線', '회선', 19486, 1, 98, 1),
+('強占期', '강점기', 19487, 1, 98, 1),
+('狂想曲', '광상곡', 19488, 1, 98, 1),
+('金剛山', '금강산', 19489, 1, 98, 1),
+('摩尼敎', '마니교', 19490, 1, 98, 1),
+('美粧院', '미장원', 19491, 1, 98, 1),
+('保養湯', '보양탕', 19492, 1, 98, 1),
+('修繕工', '수선공', 19493, 1, 98, 1),
+('印畫紙', '인화지', 19494, 1, 98, 1),
+('極端 選擇', '극단 선택', 19495, 1, 98, 1),
+('巡航 誘導彈', '순항 유도탄', 19496, 1, 98, 1),
+('工率', '공률', 19497, 1, 97, 1),
+('圖形', '도형', 19498, 1, 97, 1),
+('陸軍', '륙군', 19499, 1, 97, 1),
+('芳年', '방년', 19500, 1, 97, 1),
+('雪山', '설산', 19501, 1, 97, 1),
+('顔色', '안색', 19502, 1, 97, 1),
+('緣石', '연석', 19503, 1, 97, 1),
+('禮記', '예기', 19504, 1, 97, 1),
+('用具', '용구', 19505, 1, 97, 1),
+('徵發', '징발', 19506, 1, 97, 1),
+('追白', '추백', 19507, 1, 97, 1),
+('風速', '풍속', 19508, 1, 97, 1),
+('火木', '화목', 19509, 1, 97, 1),
+('交換臺', '교환대', 19510, 1, 97, 1),
+('露西亞', '노서아', 19511, 1, 97, 1),
+('露西亞', '로서아', 19512, 1, 97, 1),
+('反英雄', '반영웅', 19513, 1, 97, 1),
+('珊瑚海', '산호해', 19514, 1, 97, 1),
+('英美圈', '영미권', 19515, 1, 97, 1),
+('曳光彈', '예광탄', 19516, 1, 97, 1),
+('脫營兵', '탈영병', 19517, 1, 97, 1),
+('琥珀色', '호박색', 19518, 1, 97, 1),
+('金剛鸚鵡', '금강앵무', 19519, 1, 97, 1),
+('前途洋洋', '전도양양', 19520, 1, 97, 1),
+('官能', '관능', 19521, 1, 96, 1),
+('館員', '관원', 19522, 1, 96, 1),
+('管制', '관제', 19523, 1, 96, 1),
+('金屬', '금속', 19524, 1, 96, 1),
+('金融', '금융', 19525, 1, 96, 1),
+('器械', '기계', 19526, 1, 96, 1),
+('樂觀', '낙관', 19527, 1, 96, 1),
+('論駁', '논박', 19528, 1, 96, 1),
+('農作', '농작', 19529, 1, 96, 1),
+('同型', '동형', 19530, 1, 96, 1),
+('弱小', '약소', 19531, 1, 96, 1),
+('入黨', '입당', 19532, 1, 96, 1),
+('蠶食', '잠식', 19533, 1, 96, 1),
+('全知', '전지', 19534, 1, 96, 1),
+('職權', '직권', 19535, 1, 96, 1),
+('親美', '친미', 19536, 1, 96, 1),
+('通告', '통고', 19537, 1, 96, 1),
+('退場', '퇴장', 19538, 1, 96, 1),
+('後果', '후과', 19539, 1, 96, 1),
+('狂牛病', '광우병', 19540, 1, 96, 1),
+('多幸症', '다행증', 19541, 1, 96, 1),
+('石榴石', '석류석', 19542, 1, 96, 1),
+('成績表', '성적표', 19543, 1, 96, 1),
+('小規模', '소규모', 19544, 1, 96, 1),
+('愛藏版', '애장판', 19545, 1, 96, 1),
+('柘榴石', '자류석', 19546, 1, 96, 1),
+('專門店', '전문점', 19547, 1, 96, 1),
+('達八十', '팔팔십', 19548, 1, 96, 1),
+('林延壽魚', '임연수어', 19549, 1, 96, 1),
+('健康念慮症', '건강염려증', 19550, 1, 96, 1),
+('變異  脂', '변이 지방', 19551, 1, 96, 1),
+('感傷', '감상', 19552, 1, 95, 1),
+('降下', '강하', 19553, 1, 95, 1),
+('蠟石', '납석', 19554, 1, 95, 1),
+('膽石', '담석', 19555, 1, 95, 1),
+('東北', '동북', 19556, 1, 95, 1),
+('鈍器', '둔기', 19557, 1, 95, 1),
+('賣藥', '매약', 19558, 1, 95, 1),
+('面識', '면식', 19559, 1, 95, 1),
+('母親', '모친', 19560, 1, 95, 1),
+('符合', '부합', 19561, 1, 95, 1),
+('北東', '북동', 19562, 1, 95, 1),
+('沙下', '사하', 19563, 1, 95, 1),
+('山系', '산계', 19564, 1, 95, 1),
+('聖母', '성모', 19565, 1, 95, 1),
+('神饌', '신찬', 19566, 1, 95, 1),
+('實像', '실상', 19567, 1, 95, 1),
+('暗流', '암류', 19568, 1, 95, 1),
+('底本', '저본', 19569, 1, 95, 1),
+('戰友', '전우', 19570, 1, 95, 1),
+('政變', '정변', 19571, 1, 95, 1),
+('正誤', '정오', 19572, 1, 95, 1),
+('停戰', '정전', 19573, 1, 95, 1),
+('車費', '차비', 19574, 1, 95, 1),
+('漆器', '칠기', 19575, 1, 95, 1),
+('海溝', '해구', 19576, 1, 95, 1),
+('海狗', '해구', 19577, 1, 95, 1),
+('獻上', '헌상', 19578, 1, 95, 1),
+('弦月', '현월', 19579, 1, 95, 1),
+('橄欖色', '감람색', 19580, 1, 95, 1),
+('開幕式', '개막식', 19581, 1, 95, 1),
+('拒否感', '거부감', 19582, 1, 95, 1),
+('紀元後', '기원후', 19583, 1, 95, 1),
+('腦貧血', '뇌빈혈', 19584, 1, 95, 1),
+('沙果酒', '사과주', 19585, 1, 95, 1),
+('設問紙', '설문지', 19586, 1, 95, 1),
+('消毒劑', '소독제', 19587, 1, 95, 1),
+('試運轉', '시운전', 19588, 1, 95, 1),
+('眼鏡士', '안경사', 19589, 1, 95, 1),
+('秘密番號', '비밀번호', 19590, 1, 95, 1),
+('調和롭다', '조화롭다', 19591, 1, 95, 1),
+('2月', '2월', 19592, 1, 94, 1),
+('高層', '고층', 19593, 1, 94, 1),
+('孔敎', '공교', 19594, 1, 94, 1),
+('晚年', '만년', 19595, 1, 94, 1),
+('美製', '미제', 19596, 1, 94, 1),
+('微風', '미풍', 19597, 1, 94, 1),
+('本錢', '본전', 19598, 1, 94, 1),
+('死去', '사거', 19599, 1, 94, 1),
+('宣戰', '선전', 19600, 1, 94, 1),
+('所致', '소치', 19601, 1, 94, 1),
+('巖石', '암석', 19602, 1, 94, 1),
+('用役', '용역', 19603, 1, 94, 1),
+('原價', '원가', 19604, 1, 94, 1),
+('2月', '이월', 19605, 1, 94, 1),
+('蒸發', '증발', 19606, 1, 94, 1),
+('太平', '태평', 19607, 1, 94, 1),
+('投藥', '투약', 19608, 1, 94, 1),
+('鋪石', '포석', 19609, 1, 94, 1),
+('漢藥', '한약', 19610, 1, 94, 1),
+('海獺', '해달', 19611, 1, 94, 1),
+('海狸', '해리', 19612, 1, 94, 1),
+('冠岳山', '관악산', 19613, 1, 94, 1),
+('金메달', '금메달', 19614, 1, 94, 1),
+('辯護士', '벤호사', 19615, 1, 94, 1),
+('保護司', '보호사', 19616, 1, 94, 1),
+('細胞質', '세포질', 19617, 1, 94, 1),
+('受難曲', '수난곡', 19618, 1, 94, 1),
+('裁判權', '재판권', 19619, 1, 94, 1),
+('晴雨計', '청우계', 19620, 1, 94, 1),
+('多種多樣', '다종다양', 19621, 1, 94, 1),
+('太陽系儀', '태양계의', 19622, 1, 94, 1),
+('基底細胞癌', '기저세포암', 19623, 1, 94, 1),
+('6月', '6월', 19624, 1, 93, 1),
+('假面', '가면', 19625, 1, 93, 1),
+('6月', '류월', 19626, 1, 93, 1),
+('明太', '명태', 19627, 1, 93, 1),
+('母校', '모교', 19628, 1, 93, 1),
+('木花', '목화', 19629, 1, 93, 1),
+('反核', '반핵', 19630, 1, 93, 1),
+('備品', '비품', 19631, 1, 93, 1),
+('山羊', '산양', 19632, 1, 93, 1),
+('城南', '성남', 19633, 1, 93, 1),
+('食칼', '식칼', 19634, 1, 93, 1),
+('食醯', '식혜', 19635, 1, 93, 1),
+('實裝', '실장', 19636, 1, 93, 1),
+('藥果', '약과', 19637, 1, 93, 1),
+('流砂', '유사', 19638, 1, 93, 1),
+('6月', '유월', 19639, 1, 93, 1),
+('六月', '유월', 19640, 1, 93, 1),
+('切點', '절점', 19641, 1, 93, 1),
+('造花', '조화', 19642, 1, 93, 1),
+('車庫', '차고', 19643, 1, 93, 1),
+('表明', '표명', 19644, 1, 93, 1),
+('合奏', '합주', 19645, 1, 93, 1),
+('腹話術', '복화술', 19646, 1, 93, 1),
+('偏執病', '편집병', 19647, 1, 93, 1),
+('入郷循俗', '입향순속', 19648, 1, 93, 1),
+('入鄉循俗', '입향순속', 19649, 1, 93, 1),
+('年', '연', 19650, 1, 92, 1),
+('3月', '3월', 19651, 1, 92, 1),
+('4月', '4월', 19652, 1, 92, 1),
+('5月', '5월', 19653, 1, 92, 1),
+('7月', '7월', 19654, 1, 92, 1),
+('8月', '8월', 19655, 1, 92, 1),
+('9月', '9월', 19656, 1, 92, 1),
+('告解', '고해', 19657, 1, 92, 1),
+('9月', '구월', 19658, 1, 92, 1),
+('軍醫', '군의', 19659, 1, 92, 1),
+('臺北', '대북', 19660, 1, 92, 1),
+('父權', '부권', 19661, 1, 92, 1),
+('社交', '사교', 19662, 1, 92, 1),
+('4月', '사월', 19663, 1, 92, 1),
+('3月', '삼월', 19664, 1, 92, 1),
+('亞流', '아류', 19665, 1, 92, 1),
+('誤記', '오기', 19666, 1, 92, 1),
+('5月', '오월', 19667, 1, 92, 1),
+('王室', '왕실', 19668, 1, 92, 1),
+('專業', '전업', 19669, 1, 92, 1),
+('直言', '직언', 19670, 1, 92, 1),
+('叉手', '차수', 19671, 1, 92, 1),
+('7月', '칠월', 19672, 1, 92, 1),
+('8月', '팔월', 19673, 1, 92, 1),
+('標記', '표기', 19674, 1, 92, 1),
+('緊張感', '긴장감', 19675, 1, 92, 1),
+('成層圈', '성층권', 19676, 1, 92, 1),
+('伊太利', '이태리', 19677, 1, 92, 1),
+('前夜祭', '전야제', 19678, 1, 92, 1),
+('親衛隊', '친위대', 19679, 1, 92, 1),
+('八極拳', '팔극권', 19680, 1, 92, 1),
+('航空驛', '항공역', 19681, 1, 92, 1),
+('豫備訊問', '예비신문', 19682, 1, 92, 1),
+('販賣促進', '판매촉진', 19683, 1, 92, 1),
+('賢母良妻', '형모양처', 19684, 1, 92, 1),
+('感興', '감흥', 19685, 1, 91, 1),
+('公債', '공채', 19686, 1, 91, 1),
+('公薦', '공천', 19687, 1, 91, 1),
+('口習', '구습', 19688, 1, 91, 1),
+('棋石', '기석', 19689, 1, 91, 1),
+('盤面', '반면', 19690, 1, 91, 1),
+('勃發', '발발', 19691, 1, 91, 1),
+('發汗', '발한', 19692, 1, 91, 1),
+('補正', '보정', 19693, 1, 91, 1),
+('頻發', '빈발', 19694, 1, 91, 1),
+('石距', '석거', 19695, 1, 91, 1),
+('用件', '용건', 19696, 1, 91, 1),
+('流派', '유파', 19697, 1, 91, 1),
+('平服', '평복', 19698, 1, 91, 1),
+('下請', '하청', 19699, 1, 91, 1),
+('致命率', '치명률', 19700, 1, 91, 1),
+('暗號貨幣', '암호화폐', 19701, 1, 91, 1),
+('共有', '공유', 19702, 1, 90, 1),
+('碁石', '기석', 19703, 1, 90, 1),
+('南宮', '남궁', 19704, 1, 90, 1),
+('對客', '대객', 19705, 1, 90, 1),
+('同居', '동거', 19706, 1, 90, 1),
+('反旗', '반기', 19707, 1, 90, 1),
+('發掘', '발굴', 19708, 1, 90, 1),
+('石鹼', '석감', 19709, 1, 90, 1),
+('聖光', '성광', 19710, 1, 90, 1),
+('殉敎', '순교', 19711, 1, 90, 1),
+('餘病', '여병', 19712, 1, 90, 1),
+('有望', '유망', 19713, 1, 90, 1),
+('流氷', '유빙', 19714, 1, 90, 1),
+('利率', '이율', 19715, 1, 90, 1),
+('前科', '전과', 19716, 1, 90, 1),
+('戰況', '전황', 19717, 1, 90, 1),
+('從軍', '종군', 19718, 1, 90, 1),
+('高架橋', '고가교', 19719, 1, 90, 1),
+('屈曲位', '굴곡위', 19720, 1, 90, 1),
+('不完全', '불완전', 19721, 1, 90, 1),
+('四季節', '사계절', 19722, 1, 90, 1),
+('安息香', '안식향', 19723, 1, 90, 1),
+('逆斜線', '역사선', 19724, 1, 90, 1),
+('智異山', '지리산', 19725, 1, 90, 1),
+('脫走兵', '탈주병', 19726, 1, 90, 1),
+('偏頭痛', '편두통', 19727, 1, 90, 1),
+('戱曲集', '희곡집', 19728, 1, 90, 1),
+('保護貿易', '보호무역', 19729, 1, 90, 1),
+('軍犬', '군견', 19730, 1, 89, 1),
+('郡公', '군공', 19731, 1, 89, 1),
+('金橘', '금귤', 19732, 1, 89, 1),
+('讀解', '독해', 19733, 1, 89, 1),
+('頭像', '두상', 19734, 1, 89, 1),
+('縫合', '봉합', 19735, 1, 89, 1),
+('聲調', '성조', 19736, 1, 89, 1),
+('細工', '세공', 19737, 1, 89, 1),
+('時針', '시침', 19738, 1, 89, 1),
+('詩形', '시형', 19739, 1, 89, 1),
+('新參', '신참', 19740, 1, 89, 1),
+('雙點', '쌍점', 19741, 1, 89, 1),
+('豫熱', '예열', 19742, 1, 89, 1),
+('原狀', '원상', 19743, 1, 89, 1),
+('陰部', '음부', 19744, 1, 89, 1),
+('正貨', '정화', 19745, 1, 89, 1),
+('最古', '최고', 19746, 1, 89, 1),
+('號角', '호각', 19747, 1, 89, 1),
+('畵面', '화면', 19748, 1, 89, 1),
+('後腦', '후뇌', 19749, 1, 89, 1),
+('輝石', '휘석', 19750, 1, 89, 1),
+('高句麗', '고구려', 19751, 1, 89, 1),
+('乳酸菌', '유산균', 19752, 1, 89, 1),
+('遭遇戰', '조우전', 19753, 1, 89, 1),
+('在宅勤務', '재택근무', 19754, 1, 89, 1),
+('官界', '관계', 19755, 1, 88, 1),
+('多重', '다중', 19756, 1, 88, 1),
+('木魚', '목어', 19757, 1, 88, 1),
+('倂合', '병합', 19758, 1, 88, 1),
+('山峽', '산협', 19759, 1, 88, 1),
+('三鮮', '삼선', 19760, 1, 88, 1),
+('藥指', '약지', 19761, 1, 88, 1),
+('熱波', '열파', 19762, 1, 88, 1),
+('入監', '입감', 19763, 1, 88, 1),
+('重油', '중유', 19764, 1, 88, 1),
+('車掌', '차장', 19765, 1, 88, 1),
+('着工', '착공', 19766, 1, 88, 1),
+('合倂', '합병', 19767, 1, 88, 1),
+('協同', '협동', 19768, 1, 88, 1),
+('和聲', '화성', 19769, 1, 88, 1),
+('硬口蓋', '경구개', 19770, 1, 88, 1),
+('三足烏', '삼족오', 19771, 1, 88, 1),
+('胃下垂', '위하수', 19772, 1, 88, 1),
+('吸收紙', '흡수지', 19773, 1, 88, 1),
+('腦脊髓膜炎', '뇌척수막염', 19774, 1, 88, 1),
+('江北', '강북', 19775, 1, 87, 1),
+('官服', '관복', 19776, 1, 87, 1),
+('慣用', '관용', 19777, 1, 87, 1),
+('敎鞭', '교편', 19778, 1, 87, 1),
+('軍刀', '군도', 19779, 1, 87, 1),
+('軍縮', '군축', 19780, 1, 87, 1),
+('金髪', '금발', 19781, 1, 87, 1),
+('農樂', '농악', 19782, 1, 87, 1),
+('突入', '돌입', 19783, 1, 87, 1),
+('馬術', '마술', 19784, 1, 87, 1),
+('美容', '미용', 19785, 1, 87, 1),
+('白飯', '백반', 19786, 1, 87, 1),
+('産科', '산과', 19787, 1, 87, 1),
+('三司', '삼사', 19788, 1, 87, 1),
+('相殺', '상쇄', 19789, 1, 87, 1),
+('小針', '소침', 19790, 1, 87, 1),
+('安東', '안동', 19791, 1, 87, 1),
+('愛息', '애식', 19792, 1, 87, 1),
+('養成', '양성', 19793, 1, 87, 1),
+('牛車', '우차', 19794, 1, 87, 1),
+('圓形', '원형', 19795, 1, 87, 1),
+('異質', '이질', 19796, 1, 87, 1),
+('入境', '입경', 19797, 1, 87, 1),
+('推定', '추정', 19798, 1, 87, 1),
+('平城', '평성', 19799, 1, 87, 1),
+('避球', '피구', 19800, 1, 87, 1),
+('不可能', '불가능', 19801, 1, 87, 1),
+('先農湯', '설렁탕', 19802, 1, 87, 1),
+('陰謀說', '음모설', 19803, 1, 87, 1),
+('處方箋', '처방전', 19804, 1, 87, 1),
+('超特級', '초특급', 19805, 1, 87, 1),
+('洞內坊內', '동내방내', 19806, 1, 87, 1),
+('南아메리카', '남아메리카', 19807, 1, 87, 1),
+('유럽 同盟', '유럽 동맹', 19808, 1, 87, 1),
+('公卿', '공경', 19809, 1, 86, 1),
+('空腸', '공장', 19810, 1, 86, 1),
+('糾合', '규합', 19811, 1, 86, 1),
+('農藥', '농약', 19812, 1, 86, 1),
+('毒藥', '독약', 19813, 1, 86, 1),
+('謄本', '등본', 19814, 1, 86, 1),
+('登場', '등장', 19815, 1, 86, 1),
+('病床', '병상', 19816, 1, 86, 1),
+('本稿', '본고', 19817, 1, 86, 1),
+('私利', '사리', 19818, 1, 86, 1),
+('洗面', '세면', 19819, 1, 86, 1),
+('細部', '세부', 19820, 1, 86, 1),
+('小腸', '소장', 19821, 1, 86, 1),
+('市制', '시제', 19822, 1, 86, 1),
+('詩品', '시품', 19823, 1, 86, 1),
+('牙山', '아산', 19824, 1, 86, 1),
+('迎合', '영합', 19825, 1, 86, 1),
+('原州', '원주', 19826, 1, 86, 1),
+('越軍', '월군', 19827, 1, 86, 1),
+('暴惡', '포악', 19828, 1, 86, 1),
+('形勢', '형세', 19829, 1, 86, 1),
+('對稱軸', '대칭축', 19830, 1, 86, 1),
+('腐葉土', '부엽토', 19831, 1, 86, 1),
+('消火栓', '소화전', 19832, 1, 86, 1),
+('搖籃本', '요람본', 19833, 1, 86, 1),
+('再投資', '재투자', 19834, 1, 86, 1),
+('短篇映畫', '단편영화', 19835, 1, 86, 1),
+('山椒‒ ', '산초나무', 19836, 1, 86, 1),
+('太陽崇拜', '태양숭배', 19837, 1, 86, 1),
+('波及 效果', '파급 효과', 19838, 1, 86, 1),
+('強情', '강정', 19839, 1, 85, 1),
+('潔白', '결백', 19840, 1, 85, 1),
+('高爐', '고로', 19841, 1, 85, 1),
+('校門', '교문', 19842, 1, 85, 1),
+('樂園', '낙원', 19843, 1, 85, 1),
+('斷種', '단종', 19844, 1, 85, 1),
+('北送', '북송', 19845, 1, 85, 1),
+('死因', '사인', 19846, 1, 85, 1),
+('聲帶', '성대', 19847, 1, 85, 1),
+('小雪', '소설', 19848, 1, 85, 1),
+('失政', '실정', 19849, 1, 85, 1),
+('漁場', '어장', 19850, 1, 85, 1),
+('女軍', '여군', 19851, 1, 85, 1),
+('原爆', '원폭', 19852, 1, 85, 1),
+('有害', '유해', 19853, 1, 85, 1),
+('整流', '정류', 19854, 1, 85, 1),
+('制服', '제복', 19855, 1, 85, 1),
+('編入', '편입', 19856, 1, 85, 1),
+('必死', '필사', 19857, 1, 85, 1),
+('惠山', '혜산', 19858, 1, 85, 1),
+('還流', '환류', 19859, 1, 85, 1),
+('果樹園', '과수원', 19860, 1, 85, 1),
+('萬愚節', '만우절', 19861, 1, 85, 1),
+('冥王星', '명왕성', 19862, 1, 85, 1),
+('茂山郡', '무산군', 19863, 1, 85, 1),
+('小宇宙', '소우주', 19864, 1, 85, 1),
+('慰安婦', '위안부', 19865, 1, 85, 1),
+('板屋船', '판옥선', 19866, 1, 85, 1),
+('放送干涉', '방송간섭', 19867, 1, 85, 1),
+('感恩', '감은', 19868, 1, 84, 1),
+('光波', '광파', 19869, 1, 84, 1),
+('求愛', '구애', 19870, 1, 84, 1),
+('極度', '극도', 19871, 1, 84, 1),
+('耐用', '내용', 19872, 1, 84, 1),
+('突風', '돌풍', 19873, 1, 84, 1),
+('藤本', '등본', 19874, 1, 84, 1),
+('明細', '명세', 19875, 1, 84, 1),
+('木造', '목조', 19876, 1, 84, 1),
+('白鶴', '백학', 19877, 1, 84, 1),
+('山椒', '산초', 19878, 1, 84, 1),
+('熱演', '열연', 19879, 1, 84, 1),
+('熱核', '열핵', 19880, 1, 84, 1),
+('雲南', '운남', 19881, 1, 84, 1),
+('融點', '융점', 19882, 1, 84, 1),
+('離間', '이간', 19883, 1, 84, 1),
+('利害', '이해', 19884, 1, 84, 1),
+('赤面', '적면', 19885, 1, 84, 1),
+('至高', '지고', 19886, 1, 84, 1),
+('追記', '추기', 19887, 1, 84, 1),
+('特産', '특산', 19888, 1, 84, 1),
+('根菜類', '근채류', 19889, 1, 84, 1),
+('濟州—', '제주말', 19890, 1, 84, 1),
+('閉回路', '폐회로', 19891, 1, 84, 1),
+('七顚八起', '칠전팔기', 19892, 1, 84, 1),
+('却下', '각하', 19893, 1, 83, 1),
+('鑑定', '감정', 19894, 1, 83, 1),
+('高僧', '고승', 19895, 1, 83, 1),
+('共産', '공산', 19896, 1, 83, 1),
+('馬韓', '마한', 19897, 1, 83, 1),
+('防彈', '방탄', 19898, 1, 83, 1),
+('背面', '배면', 19899, 1, 83, 1),
+('死滅', '사멸', 19900, 1, 83, 1),
+('西江', '서강', 19901, 1, 83, 1),
+('小豆', '소두', 19902, 1, 83, 1),
+('豫期', '예기', 19903, 1, 83, 1),
+('原鑛', '원광', 19904, 1, 83, 1),
+('遺言', '유언', 19905, 1, 83, 1),
+('立證', '입증', 19906, 1, 83, 1),
+('入港', '입항', 19907, 1, 83, 1),
+('腸線', '장선', 19908, 1, 83, 1),
+('傳來', '전래', 19909, 1, 83, 1),
+('情歌', '정가', 19910, 1, 83, 1),
+('注記', '주기', 19911, 1, 83, 1),
+('和紙', '화지', 19912, 1, 83, 1),
+('滑車', '활차', 19913, 1, 83, 1),
+('羊皮紙', '양피지', 19914, 1, 83, 1),
+('幼兒期', '유아기', 19915, 1, 83, 1),
+('意見欄', '의견란', 19916, 1, 83, 1),
+('酒令具', '주령구', 19917, 1, 83, 1),
+('兼用', '겸용', 19918, 1, 82, 1),
+('古宮', '고궁', 19919, 1, 82, 1),
+('高騰', '고등', 19920, 1, 82, 1),
+('空洞', '공동', 19921, 1, 82, 1),
+('球根', '구근', 19922, 1, 82, 1),
+('白瓜', '백과', 19923, 1, 82, 1),
+('常情', '상정', 19924, 1, 82, 1),
+('魚油', '어유', 19925, 1, 82, 1),
+('靈藥', '영약', 19926, 1, 82, 1),
+('流賊', '유적', 19927, 1, 82, 1),
+('有罪', '유죄', 19928, 1, 82, 1),
+('磁場', '자장', 19929, 1, 82, 1),
+('赤線', '적선', 19930, 1, 82, 1),
+('政略', '정략', 19931, 1, 82, 1),
+('重婚', '중혼', 19932, 1, 82, 1),
+('靑角', '청각', 19933, 1, 82, 1),
+('親交', '친교', 19934, 1, 82, 1),
+('漂白', '표백', 19935, 1, 82, 1),
+('畢業', '필업', 19936, 1, 82, 1),
+('河南', '하남', 19937, 1, 82, 1),
+('割愛', '할애', 19938, 1, 82, 1),
+('混同', '혼동', 19939, 1, 82, 1),
+('火急', '화급', 19940, 1, 82, 1),
+('甘味料', '감미료', 19941, 1, 82, 1),
+('萬景臺', '만경대', 19942, 1, 82, 1),
+('薄葉紙', '박엽지', 19943, 1, 82, 1),
+('保溫甁', '보온병', 19944, 1, 82, 1),
+('連結網', '연결망', 19945, 1, 82, 1),
+('曳船路', '예선로', 19946, 1, 82, 1),
+('雜種犬', '잡종견', 19947, 1, 82, 1),
+('再交付', '재교부', 19948, 1, 82, 1),
+('漢四郡', '한사군', 19949, 1, 82, 1),
+('敬愛', '경애', 19950, 1, 81, 1),
+('工程', '공정', 19951, 1, 81, 1),
+('空唱', '공창', 19952, 1, 81, 1),
+('狂風', '광풍', 19953, 1, 81, 1),
+('交配', '교배', 19954, 1, 81, 1),
+('軍閥', '군벌', 19955, 1, 81, 1),
+('軍靴', '군화', 19956, 1, 81, 1),
+('近古', '근고', 19957, 1, 81, 1),
+('冷血', '냉혈', 19958, 1, 81, 1),
+('同棲', '동서', 19959, 1, 81, 1),
+('冷血', '랭혈', 19960, 1, 81, 1),
+('美德', '미덕', 19961, 1, 81, 1),
+('釜山', '부산', 19962, 1, 81, 1),
+('三脚', '삼각', 19963, 1, 81, 1),
+('西獨', '서독', 19964, 1, 81, 1),
+('世評', '세평', 19965, 1, 81, 1),
+('新曆', '신력', 19966, 1, 81, 1),
+('新患', '신환', 19967, 1, 81, 1),
+('熱願', '열원', 19968, 1, 81, 1),
+('窯業', '요업', 19969, 1, 81, 1),
+('流浪', '유랑', 19970, 1, 81, 1),
+('前腦', '전뇌', 19971, 1, 81, 1),
+('轉位', '전위', 19972, 1, 81, 1),
+('祖母', '조모', 19973, 1, 81, 1),
+('太保', '태보', 19974, 1, 81, 1),
+('通謀', '통모', 19975, 1, 81, 1),
+('特種', '특종', 19976, 1, 81, 1),
+('風琴', '풍금', 19977, 1, 81, 1),
+('風致', '풍치', 19978, 1, 81, 1),
+('頭蓋腔', '두개강', 19979, 1, 81, 1),
+('更正', '경정', 19980, 1, 80, 1),
+('單利', '단리', 19981, 1, 80, 1),
+('對談', '대담', 19982, 1, 80, 1),
+('同寅', '동인', 19983, 1, 80, 1),
+('白痴', '백치', 19984, 1, 80, 1),
+('白兔', '백토', 19985, 1, 80, 1),
+('復權', '복권', 19986, 1, 80, 1),
+('三藏', '삼장', 19987, 1, 80, 1),
+('雪原', '설원', 19988, 1, 80, 1),
+('修身', '수신', 19989, 1, 80, 1),
+('熱傷', '열상', 19990, 1, 80, 1),
+('熱湯', '열탕', 19991, 1, 80, 1),
+('零上', '영상', 19992, 1, 80, 1),
+('零點', '영점', 19993, 1, 80, 1),
+('禮式', '예식', 19994, 1, 80, 1),
+('雲母', '운모', 19995, 1, 80, 1),
+('全州', '전주', 19996, 1, 80, 1),
+('操作', '조작', 19997, 1, 80, 1),
+('親王', '친왕', 19998, 1, 80, 1),
+('爆藥', '폭약', 19999, 1, 80, 1),
+('拒否權', '거부권', 20000, 1, 80, 1),
+('孤独死', '고독사', 20001, 1, 80, 1),
+('口蓋垂', '구개수', 20002, 1, 80, 1),
+('貿易風', '무역풍', 20003, 1, 80, 1),
+('問題兒', '문제아', 20004, 1, 80, 1),
+('貧困線', '빈곤선', 20005, 1, 80, 1),
+('猩紅熱', '성홍열', 20006, 1, 80, 1),
+('車마당', '차마당', 20007, 1, 80, 1),
+('基盤施設', '기반시설', 20008, 1, 80, 1),
+('北아메리카', '북아메리카', 20009, 1, 80, 1),
+('警官', '경관', 20010, 1, 79, 1),
+('高雅', '고아', 20011, 1, 79, 1),
+('光州', '광주', 20012, 1, 79, 1),
+('極東', '극동', 20013, 1, 79, 1),
+('奇形', '기형', 20014, 1, 79, 1),
+('當身', '당신', 20015, 1, 79, 1),
+('代代', '대대', 20016, 1, 79, 1),
+('敏感', '민감', 20017, 1, 79, 1),
+('兵營', '병영', 20018, 1, 79, 1),
+('船隊', '선대', 20019, 1, 79, 1),
+('聖經', '성경', 20020, 1, 79, 1),
+('愛蘭', '애란', 20021, 1, 79, 1),
+('餘熱', '여열', 20022, 1, 79, 1),
+('熱砂', '열사', 20023, 1, 79, 1),
+('熱雲', '열운', 20024, 1, 79, 1),
+('聳上', '용상', 20025, 1, 79, 1),
+('蔚山', '울산', 20026, 1, 79, 1),
+('接骨', '접골', 20027, 1, 79, 1),
+('正恩', '정은', 20028, 1, 79, 1),
+('濁點', '탁점', 20029, 1, 79, 1),
+('炭素', '탄소', 20030, 1, 79, 1),
+('通勤', '통근', 20031, 1, 79, 1),
+('下旬', '하순', 20032, 1, 79, 1),
+('抗原', '항원', 20033, 1, 79, 1),
+('後衛', '후위', 20034, 1, 79, 1),
+('果飣類', '과정류', 20035, 1, 79, 1),
+('殺藻劑', '살조제', 20036, 1, 79, 1),
+('庭園師', '정원사', 20037, 1, 79, 1),
+('淸川江', '청천강', 20038, 1, 79, 1),
+('哺乳類', '포유류', 20039, 1, 79, 1),
+('飽和脂肪', '포화지방', 20040, 1, 79, 1),
+('慶南', '경남', 20041, 1, 78, 1),
+('多能', '다능', 20042, 1, 78, 1),
+('灣流', '만류', 20043, 1, 78, 1),
+('明察', '명찰', 20044, 1, 78, 1),
+('模形', '모형', 20045, 1, 78, 1),
+('船團', '선단', 20046, 1, 78, 1),
+('疫病', '역병', 20047, 1, 78, 1),
+('溫室', '온실', 20048, 1, 78, 1),
+('原豆', '원두', 20049, 1, 78, 1),
+('流乞', '유걸', 20050, 1, 78, 1),
+('前例', '전례', 20051, 1, 78, 1),
+('情弱', '정약', 20052, 1, 78, 1),
+('造果', '조과', 20053, 1, 78, 1),
+('卒作', '졸작', 20054, 1, 78, 1),
+('注解', '주해', 20055, 1, 78, 1),
+('進路', '진로', 20056, 1, 78, 1),
+('太師', '태사', 20057, 1, 78, 1),
+('花園', '화원', 20058, 1, 78, 1),
+('吸血', '흡혈', 20059, 1, 78, 1),
+('乾酪素', '건락소', 20060, 1, 78, 1),
+('劍鬪士', '검투사', 20061, 1, 78, 1),
+('結膜炎', '결막염', 20062, 1, 78, 1),
+('羅針盤', '나침반', 20063, 1, 78, 1),
+('羅針盤', '라침반', 20064, 1, 78, 1),
+('佛蘭西', '불란서', 20065, 1, 78, 1),
+('四聖諦', '사성제', 20066, 1, 78, 1),
+('今始初聞', '금시초문', 20067, 1, 78, 1),
+('字', '자', 20068, 1, 77, 1),
+('角皮', '각피', 20069, 1, 77, 1),
+('空腹', '공복', 20070, 1, 77, 1),
+('肯定', '긍정', 20071, 1, 77, 1),
+('能率', '능률', 20072, 1, 77, 1),
+('鈍感', '둔감', 20073, 1, 77, 1),
+('得意', '득의', 20074, 1, 77, 1),
+('萬能', '만능', 20075, 1, 77, 1),
+('卍字', '만자', 20076, 1, 77, 1),
+('反騰', '반등', 20077, 1, 77, 1),
+('別館', '별관', 20078, 1, 77, 1),
+('復古', '복고', 20079, 1, 77, 1),
+('比熱', '비열', 20080, 1, 77, 1),
+('俗惡', '속악', 20081, 1, 77, 1),
+('刷新', '쇄신', 20082, 1, 77, 1),
+('隨時', '수시', 20083, 1, 77, 1),
+('役員', '역원', 20084, 1, 77, 1),
+('列車', '열차', 20085, 1, 77, 1),
+('陸軍', '육군', 20086, 1, 77, 1),
+('二八', '이팔', 20087, 1, 77, 1),
+('剪定', '전정', 20088, 1, 77, 1),
+('整形', '정형', 20089, 1, 77, 1),
+('提言', '제언', 20090, 1, 77, 1),
+('忠南', '충남', 20091, 1, 77, 1),
+('板木', '판목', 20092, 1, 77, 1),
+('表紙', '표지', 20093, 1, 77, 1),
+('河口', '하구', 20094, 1, 77, 1),
+('模寫說', '모사설', 20095, 1, 77, 1),
+('陪審員', '배심원', 20096, 1, 77, 1),
+('始祖—', '시조새', 20097, 1, 77, 1),
+('郵便局', '우편국', 20098, 1, 77, 1),
+('再評價', '재평가', 20099, 1, 77, 1),
+('赤鐵鑛', '적철광', 20100, 1, 77, 1),
+('香辛料', '향신료', 20101, 1, 77, 1),
+('胡志明', '호지명', 20102, 1, 77, 1),
+('催眠治療', '최면치료', 20103, 1, 77, 1),
+('共和', '공화', 20104, 1, 76, 1),
+('怪死', '괴사', 20105, 1, 76, 1),
+('今後', '금후', 20106, 1, 76, 1),
+('臺紙', '대지', 20107, 1, 76, 1),
+('母艦', '모함', 20108, 1, 76, 1),
+('木葉', '목엽', 20109, 1, 76, 1),
+('方針', '방침', 20110, 1, 76, 1),
+('背部', '배부', 20111, 1, 76, 1),
+('附言', '부언', 20112, 1, 76, 1),
+('沸點', '비점', 20113, 1, 76, 1),
+('小潮', '소조', 20114, 1, 76, 1),
+('市立', '시립', 20115, 1, 76, 1),
+('試藥', '시약', 20116, 1, 76, 1),
+('連立', '연립', 20117, 1, 76, 1),
+('位格', '위격', 20118, 1, 76, 1),
+('流汗', '유한', 20119, 1, 76, 1),
+('泥流', '이류', 20120, 1, 76, 1),
+('二十', '이십', 20121, 1, 76, 1),
+('任官', '임관', 20122, 1, 76, 1),
+('次惡', '차악', 20123, 1, 76, 1),
+('韓族', '한족', 20124, 1, 76, 1),
+('口蓋帆', '구개범', 20125, 1, 76, 1),
+('落葉松', '낙엽송', 20126, 1, 76, 1),
+('私掠船', '사략선', 20127, 1, 76, 1),
+('何如間', '하여간', 20128, 1, 76, 1),
+('螢光燈', '형광등', 20129, 1, 76, 1),
+('同', '동', 20130, 1, 75, 1),
+('堅實', '견실', 20131, 1, 75, 1),
+('羅馬', '나마', 20132, 1, 75, 1),
+('頭髮', '두발', 20133, 1, 75, 1),
+('變異', '변이', 20134, 1, 75, 1),
+('師父', '사부', 20135, 1, 75, 1),
+('散兵', '산병', 20136, 1, 75, 1),
+('小螺', '소라', 20137, 1, 75, 1),
+('小麥', '소맥', 20138, 1, 75, 1),
+('送信', '송신', 20139, 1, 75, 1),
+('新浦', '신포', 20140, 1, 75, 1),
+('實況', '실황', 20141, 1, 75, 1),
+('雙頭', '쌍두', 20142, 1, 75, 1),
+('愛玩', '애완', 20143, 1, 75, 1),
+('熱狂', '열광', 20144, 1, 75, 1),
+('零下', '영하', 20145, 1, 75, 1),
+('原審', '원심', 20146, 1, 75, 1),
+('流丐', '유개', 20147, 1, 75, 1),
+('流寇', '유구', 20148, 1, 75, 1),
+('逸品', '일품', 20149, 1, 75, 1),
+('任期', '임기', 20150, 1, 75, 1),
+('入貢', '입공', 20151, 1, 75, 1),
+('慈愛', '자애', 20152, 1, 75, 1),
+('適度', '적도', 20153, 1, 75, 1),
+('庭球', '정구', 20154, 1, 75, 1),
+('菜花', '채화', 20155, 1, 75, 1),
+('親知', '친지', 20156, 1, 75, 1),
+('通寶', '통보', 20157, 1, 75, 1),
+('河北', '하북', 20158, 1, 75, 1),
+('護身', '호신', 20159, 1, 75, 1),
+('後尾', '후미', 20160, 1, 75, 1),
+('硬口盖', '경구개', 20161, 1, 75, 1),
+('輕騎兵', '경기병', 20162, 1, 75, 1),
+('副統領', '부통령', 20163, 1, 75, 1),
+('連絡處', '연락처', 20164, 1, 75, 1),
+('點點點', '점점점', 20165, 1, 75, 1),
+('偵察兵', '정찰병', 20166, 1, 75, 1),
+('走査率', '주사율', 20167, 1, 75, 1),
+('太陽曆', '태양력', 20168, 1, 75, 1),
+('太陰曆', '태음력', 20169, 1, 75, 1),
+('黑歷史', '흑역사', 20170, 1, 75, 1),
+('總角김치', '총각김치', 20171, 1, 75, 1),
+('居間', '거간', 20172, 1, 74, 1),
+('內閣', '내각', 20173, 1, 74, 1),
+('梅實', '매실', 20174, 1, 74, 1),
+('武士', '무사', 20175, 1, 74, 1),
+('門徒', '문도', 20176, 1, 74, 1),
+('門限', '문한', 20177, 1, 74, 1),
+('反側', '반측', 20178, 1, 74, 1),
+('발病', '발병', 20179, 1, 74, 1),
+('方策', '방책', 20180, 1, 74, 1),
+('不平', '불평', 20181, 1, 74, 1),
+('世襲', '세습', 20182, 1, 74, 1),
+('新疆', '신강', 20183, 1, 74, 1),
+('葉酸', '엽산', 20184, 1, 74, 1),
+('越南', '월남', 20185, 1, 74, 1),
+('流暢', '유창', 20186, 1, 74, 1),
+('融通', '융통', 20187, 1, 74, 1),
+('裏作', '이작', 20188, 1, 74, 1),
+('臨時', '임시', 20189, 1, 74, 1),
+('情婦', '정부', 20190, 1, 74, 1),
+('種皮', '종피', 20191, 1, 74, 1),
+('註記', '주기', 20192, 1, 74, 1),
+('重任', '중임', 20193, 1, 74, 1),
+('集積', '집적', 20194, 1, 74, 1),
+('特進', '특진', 20195, 1, 74, 1),
+('平床', '평상', 20196, 1, 74, 1),
+('陷入', '함입', 20197, 1, 74, 1),
+('遊覽船', '유람선', 20198, 1, 74, 1),
+('操縱士', '조종사', 20199, 1, 74, 1),
+('七葉樹', '칠엽수', 20200, 1, 74, 1),
+('高', '고', 20201, 1, 73, 1),
+('假聲', '가성', 20202, 1, 73, 1),
+('連結', '련결', 20203, 1, 73, 1),
+('半圓', '반원', 20204, 1, 73, 1),
+('北醬', '북장', 20205, 1, 73, 1),
+('熟成', '숙성', 20206, 1, 73, 1),
+('安州', '안주', 20207, 1, 73, 1),
+('弱視', '약시', 20208, 1, 73, 1),
+('略式', '약식', 20209, 1, 73, 1),
+('連帶', '연대', 20210, 1, 73, 1),
+('熱源', '열원', 20211, 1, 73, 1),
+('誤信', '오신', 20212, 1, 73, 1),
+('乳劑', '유제', 20213, 1, 73, 1),
+('流竄', '유찬', 20214, 1, 73, 1),
+('裏面', '이면', 20215, 1, 73, 1),
+('正弦', '정현', 20216, 1, 73, 1),
+('唱詞', '창사', 20217, 1, 73, 1),
+('創意', '창의', 20218, 1, 73, 1),
+('鐵板', '철판', 20219, 1, 73, 1),
+('快美', '쾌미', 20220, 1, 73, 1),
+('甲殼類', '갑각류', 20221, 1, 73, 1),
+('枯葉劑', '고엽제', 20222, 1, 73, 1),
+('蒙古斑', '몽고반', 20223, 1, 73, 1),
+('逆宣傳', '역선전', 20224, 1, 73, 1),
+('煙霧質', '연무질', 20225, 1, 73, 1),
+('連鎖店', '연쇄점', 20226, 1, 73, 1),
+('陰莖骨', '음경골', 20227, 1, 73, 1),
+('再武裝', '재무장', 20228, 1, 73, 1),
+('火繩銃', '화승총', 20229, 1, 73, 1),
+('改量', '개량', 20230, 1, 72, 1),
+('客船', '객선', 20231, 1, 72, 1),
+('較正', '교정', 20232, 1, 72, 1),
+('達成', '달성', 20233, 1, 72, 1),
+('讀經', '독경', 20234, 1, 72, 1),
+('禮節', '례절', 20235, 1, 72, 1),
+('幕後', '막후', 20236, 1, 72, 1),
+('面貌', '면모', 20237, 1, 72, 1),
+('明洞', '명동', 20238, 1, 72, 1),
+('福利', '복리', 20239, 1, 72, 1),
+('副官', '부관', 20240, 1, 72, 1),
+('寺內', '사내', 20241, 1, 72, 1),
+('三省', '삼성', 20242, 1, 72, 1),
+('船客', '선객', 20243, 1, 72, 1),
+('說問', '설문', 20244, 1, 72, 1),
+('率先', '솔선', 20245, 1, 72, 1),
+('新郎', '신랑', 20246, 1, 72, 1),
+('實績', '실적', 20247, 1, 72, 1),
+('愛慕', '애모', 20248, 1, 72, 1),
+('容量', '용량', 20249, 1, 72, 1),
+('郵政', '우정', 20250, 1, 72, 1),
+('利達', '이달', 20251, 1, 72, 1),
+('利息', '이식', 20252, 1, 72, 1),
+('入棺', '입관', 20253, 1, 72, 1),
+('入寂', '입적', 20254, 1, 72, 1),
+('在野', '재야', 20255, 1, 72, 1),
+('側面', '측면', 20256, 1, 72, 1),
+('投射', '투사', 20257, 1, 72, 1),
+('砲身', '포신', 20258, 1, 72, 1),
+('漢族', '한족', 20259, 1, 72, 1),
+('回報', '회보', 20260, 1, 72, 1),
+('備忘錄', '비망록', 20261, 1, 72, 1),
+('依存症', '의존증', 20262, 1, 72, 1),
+('磁鐵鑛', '자철광', 20263, 1, 72, 1),
+('總選擧', '총선거', 20264, 1, 72, 1),
+('偏執症', '편집증', 20265, 1, 72, 1),
+('休憩室', '휴게실', 20266, 1, 72, 1),
+('腦脊髓液', '뇌척수액', 20267, 1, 72, 1),
+('慶北', '경북', 20268, 1, 71, 1),
+('繼母', '계모', 20269, 1, 71, 1),
+('告知', '고지', 20270, 1, 71, 1),
+('空寂', '공적', 20271, 1, 71, 1),
+('技師', '기사', 20272, 1, 71, 1),
+('幕間', '막간', 20273, 1, 71, 1),
+('半減', '반감', 20274, 1, 71, 1),
+('産兒', '산아', 20275, 1, 71, 1),
+('三諦', '삼제', 20276, 1, 71, 1),
+('三諦', '삼체', 20277, 1, 71, 1),
+('商船', '상선', 20278, 1, 71, 1),
+('細管', '세관', 20279, 1, 71, 1),
+('聯想', '연상', 20280, 1, 71, 1),
+('威權', '위권', 20281, 1, 71, 1),
+('陰極', '음극', 20282, 1, 71, 1),
+('以北', '이북', 20283, 1, 71, 1),
+('溺死', '익사', 20284, 1, 71, 1),
+('正矢', '정시', 20285, 1, 71, 1),
+('至言', '지언', 20286, 1, 71, 1),
+('真空', '진공', 20287, 1, 71, 1),
+('真實', '진실', 20288, 1, 71, 1),
+('淸酒', '청주', 20289, 1, 71, 1),
+('風貌', '풍모', 20290, 1, 71, 1),
+('狹小', '협소', 20291, 1, 71, 1),
+('騎乘位', '기승위', 20292, 1, 71, 1),
+('洛東江', '낙동강', 20293, 1, 71, 1),
+('暖帶林', '난대림', 20294, 1, 71, 1),
+('千里馬', '천리마', 20295, 1, 71, 1),
+('投砲丸', '투포환', 20296, 1, 71, 1),
+('肺結核', '폐결핵', 20297, 1, 71, 1),
+('被告席', '피고석', 20298, 1, 71, 1),
+('五臟六腑', '오장육부', 20299, 1, 71, 1),
+('內', '내', 20300, 1, 70, 1),
+('死', '사', 20301, 1, 70, 1),
+('鋼線', '강선', 20302, 1, 70, 1),
+('究明', '구명', 20303, 1, 70, 1),
+('棄世', '기세', 20304, 1, 70, 1),
+('羅先', '나선', 20305, 1, 70, 1),
+('羅漢', '나한', 20306, 1, 70, 1),
+('羅先', '라선', 20307, 1, 70, 1),
+('羅漢', '라한', 20308, 1, 70, 1),
+('放題', '방제', 20309, 1, 70, 1),
+('病棟', '병동', 20310, 1, 70, 1),
+('商號', '상호', 20311, 1, 70, 1),
+('先史', '선사', 20312, 1, 70, 1),
+('速報', '속보', 20313, 1, 70, 1),
+('安排', '안배', 20314, 1, 70, 1),
+('魚香', '어향', 20315, 1, 70, 1),
+('溫帶', '온대', 20316, 1, 70, 1),
+('緯線', '위선', 20317, 1, 70, 1),
+('入寇', '입구', 20318, 1, 70, 1),
+('情勢', '정세', 20319, 1, 70, 1),
+('早世', '조세', 20320, 1, 70, 1),
+('菜種', '채종', 20321, 1, 70, 1),
+('銃士', '총사', 20322, 1, 70, 1),
+('忠北', '충북', 20323, 1, 70, 1),
+('側線', '측선', 20324, 1, 70, 1),
+('敗北', '패배', 20325, 1, 70, 1),
+('更衣室', '경의실', 20326, 1, 70, 1),
+('鼓吹樂', '고취악', 20327, 1, 70, 1),
+('司譯院', '사역원', 20328, 1, 70, 1),
+('榴散彈', '유산탄', 20329, 1, 70, 1),
+('淸掃夫', '청소부', 20330, 1, 70, 1),
+('七十歲', '칠십세', 20331, 1, 70, 1),
+('透寫紙', '투사지', 20332, 1, 70, 1),
+('甲狀腺腫', '갑상선종', 20333, 1, 70, 1),
+('救命胴衣', '구명동의', 20334, 1, 70, 1),
+('太陽 플레어', '태양 플레어', 20335, 1, 70, 1),
+('時', '시', 20336, 1, 69, 1),
+('客觀', '객관', 20337, 1, 69, 1),
+('光源', '광원', 20338, 1, 69, 1),
+('貴重', '귀중', 20339, 1, 69, 1),
+('急造', '급조', 20340, 1, 69, 1),
+('得男', '득남', 20341, 1, 69, 1),
+('亂視', '란시', 20342, 1, 69, 1),
+('馬肉', '마육', 20343, 1, 69, 1),
+('蒙古', '몽고', 20344, 1, 69, 1),
+('門齒', '문치', 20345, 1, 69, 1),
+('半熟', '반숙', 20346, 1, 69, 1),
+('半影', '본영', 20347, 1, 69, 1),
+('散聲', '산성', 20348, 1, 69, 1),
+('雪花', '설화', 20349, 1, 69, 1),
+('暗室', '암실', 20350, 1, 69, 1),
+('液量', '액량', 20351, 1, 69, 1),
+('餘角', '여각', 20352, 1, 69, 1),
+('豫斷', '예단', 20353, 1, 69, 1),
+('誤傳', '오전', 20354, 1, 69, 1),
+('乳淸', '유청', 20355, 1, 69, 1),
+('應急', '응급', 20356, 1, 69, 1),
+('接着', '접착', 20357, 1, 69, 1),
+('造園', '조원', 20358, 1, 69, 1),
+('重複', '중복', 20359, 1, 69, 1),
+('眞率', '진솔', 20360, 1, 69, 1),
+('最強', '최강', 20361, 1, 69, 1),
+('最多', '최다', 20362, 1, 69, 1),
+('八識', '팔식', 20363, 1, 69, 1),
+('編制', '편제', 20364, 1, 69, 1),
+('風疹', '풍진', 20365, 1, 69, 1),
+('火刑', '화형', 20366, 1, 69, 1),
+('黃酸', '황산', 20367, 1, 69, 1),
+('勳記', '훈기', 20368, 1, 69, 1),
+('常綠樹', '상록수', 20369, 1, 69, 1),
+('亞鉛鐵', '아연철', 20370, 1, 69, 1),
+('英聯邦', '영연방', 20371, 1, 69, 1),
+('靑瓦臺', '청와대', 20372, 1, 69, 1),
+('三', '삼', 20373, 1, 68, 1),
+('假說', '가설', 20374, 1, 68, 1),
+('脚光', '각광', 20375, 1, 68, 1),
+('改造', '개조', 20376, 1, 68, 1),
+('格率', '격률', 20377, 1, 68, 1),
+('教室', '교실', 20378, 1, 68, 1),
+('權益', '권익', 20379, 1, 68, 1),
+('旗魚', '기어', 20380, 1, 68, 1),
+('男優', '남우', 20381, 1, 68, 1),
+('錄畫', '녹화', 20382, 1, 68, 1),
+('多價', '다가', 20383, 1, 68, 1),
+('單調', '단조', 20384, 1, 68, 1),
+('隊商', '대상', 20385, 1, 68, 1),
+('導管', '도관', 20386, 1, 68, 1),
+('毒殺', '독살', 20387, 1, 68, 1),
+('等價', '등가', 20388, 1, 68, 1),
+('六十', '륙십', 20389, 1, 68, 1),
+('簿記', '부기', 20390, 1, 68, 1),
+('殺害', '살해', 20391, 1, 68, 1),
+('三陟', '삼척', 20392, 1, 68, 1),
+('疏通', '소통', 20393, 1, 68, 1),
+('修史', '수사', 20394, 1, 68, 1),
+('十六', '십륙', 20395, 1, 68, 1),
+('有效', '유효', 20396, 1, 68, 1),
+('在職', '재직', 20397, 1, 68, 1),
+('制止', '제지', 20398, 1, 68, 1),
+('造林', '조림', 20399, 1, 68, 1),
+('讚美', '찬미', 20400, 1, 68, 1),
+('初等', '초등', 20401, 1, 68, 1),
+('初乳', '초유', 20402, 1, 68, 1),
+('總和', '총화', 20403, 1, 68, 1),
+('太初', '태초', 20404, 1, 68, 1),
+('特製', '특제', 20405, 1, 68, 1),
+('風鈴', '풍령', 20406, 1, 68, 1),
+('風采', '풍채', 20407, 1, 68, 1),
+('峽部', '협부', 20408, 1, 68, 1),
+('火田', '화전', 20409, 1, 68, 1),
+('患部', '환부', 20410, 1, 68, 1),
+('喫煙室', '끽연실', 20411, 1, 68, 1),
+('不必要', '불필요', 20412, 1, 68, 1),
+('惡循環', '악순환', 20413, 1, 68, 1),
+('圓周率', '원주률', 20414, 1, 68, 1),
+('認識票', '인식표', 20415, 1, 68, 1),
+('再確認', '재확인', 20416, 1, 68, 1),
+('造幣局', '조폐국', 20417, 1, 68, 1),
+('集姓村', '집성촌', 20418, 1, 68, 1),
+('溫州蜜柑', '온주밀감', 20419, 1, 68, 1),
+('小', '소', 20420, 1, 67, 1),
+('開館', '개관', 20421, 1, 67, 1),
+('開店', '개점', 20422, 1, 67, 1),
+('口承', '구승', 20423, 1, 67, 1),
+('禁制', '금제', 20424, 1, 67, 1),
+('難治', '난치', 20425, 1, 67, 1),
+('南瓜', '남과', 20426, 1, 67, 1),
+('南浦', '남포', 20427, 1, 67, 1),
+('對岸', '대안', 20428, 1, 67, 1),
+('頭韻', '두운', 20429, 1, 67, 1),
+('美貌', '미모', 20430, 1, 67, 1),
+('微運', '미운', 20431, 1, 67, 1),
+('保育', '보육', 20432, 1, 67, 1),
+('沙魚', '사어', 20433, 1, 67, 1),
+('修習', '수습', 20434, 1, 67, 1),
+('修養', '수양', 20435, 1, 67, 1),
+('以西', '이서', 20436, 1, 67, 1),
+('精油', '정유', 20437, 1, 67, 1),
+('彫工', '조공', 20438, 1, 67, 1),
+('珍品', '진품', 20439, 1, 67, 1),
+('偏光', '편광', 20440, 1, 67, 1),
+('漢江', '한강', 20441, 1, 67, 1),
+('漢陽', '한양', 20442, 1, 67, 1),
+('獻花', '헌화', 20443, 1, 67, 1),
+('火爐', '화로', 20444, 1, 67, 1),
+('腐植土', '부식토', 20445, 1, 67, 1),
+('松花蛋', '송화단', 20446, 1, 67, 1),
+('爬蟲類', '파충류', 20447, 1, 67, 1),
+('鐵甲상어', '철갑상어', 20448, 1, 67, 1),
+('可變', '가변', 20449, 1, 66, 1),
+('官舍', '관사', 20450, 1, 66, 1),
+('東獨', '동독', 20451, 1, 66, 1),
+('冒頭', '모두', 20452, 1, 66, 1),
+('密魚', '밀어', 20453, 1, 66, 1),
+('竝記', '병기', 20454, 1, 66, 1),
+('屛風', '병풍', 20455, 1, 66, 1),
+('服務', '복무', 20456, 1, 66, 1),
+('市價', '시가', 20457, 1, 66, 1),
+('魚卵', '어란', 20458, 1, 66, 1),
+('凹面', '요면', 20459, 1, 66, 1),
+('原禽', '원금', 20460, 1, 66, 1),
+('議院', '의원', 20461, 1, 66, 1),
+('材質', '재질', 20462, 1, 66, 1),
+('覿面', '적면', 20463, 1, 66, 1),
+('重慶', '중경', 20464, 1, 66, 1),
+('重役', '중역', 20465, 1, 66, 1),
+('智利', '지리', 20466, 1, 66, 1),
+('昌原', '창원', 20467, 1, 66, 1),
+('重慶', '충칭', 20468, 1, 66, 1),
+('炭酸', '탄산', 20469, 1, 66, 1),
+('台風', '태풍', 20470, 1, 66, 1),
+('特級', '특급', 20471, 1, 66, 1),
+('風靡', '풍미', 20472, 1, 66, 1),
+('漢城', '한성', 20473, 1, 66, 1),
+('畫商', '화상', 20474, 1, 66, 1),
+('歡樂', '환락', 20475, 1, 66, 1),
+('兩棲類', '량서류', 20476, 1, 66, 1),
+('彌利堅', '미리견', 20477, 1, 66, 1),
+('沙里院', '사리원', 20478, 1, 66, 1),
+('獸醫師', '수의사', 20479, 1, 66, 1),
+('優待席', '우대석', 20480, 1, 66, 1),
+('助產師', '조산사', 20481, 1, 66, 1),
+('映畵俳優', '영화배우', 20482, 1, 66, 1),
+('소비에트 聯邦', '소비에트 연방', 20483, 1, 66, 1),
+('球', '구', 20484, 1, 65, 1),
+('寡頭', '과두', 20485, 1, 65, 1),
+('口腔', '구강', 20486, 1, 65, 1),
+('畸形', '기형', 20487, 1, 65, 1),
+('問議', '문의', 20488, 1, 65, 1),
+('配備', '배비', 20489, 1, 65, 1),
+('步兵', '보병', 20490, 1, 65, 1),
+('西歐', '서구', 20491, 1, 65, 1),
+('養父', '양부', 20492, 1, 65, 1),
+('五列', '오열', 20493, 1, 65, 1),
+('緩解', '완해', 20494, 1, 65, 1),
+('熔解', '용해', 20495, 1, 65, 1),
+('製圖', '제도', 20496, 1, 65, 1),
+('鐵砲', '철포', 20497, 1, 65, 1),
+('最適', '최적', 20498, 1, 65, 1),
+('土雨', '토우', 20499, 1, 65, 1),
+('通曉', '통효', 20500, 1, 65, 1),
+('鬪士', '투사', 20501, 1, 65, 1),
+('童話冊', '동화책', 20502, 1, 65, 1),
+('賣春窟', '매춘굴', 20503, 1, 65, 1),
+('西班牙', '서반아', 20504, 1, 65, 1),
+('茶葉蛋', '차예단', 20505, 1, 65, 1),
+('層積雲', '층적운', 20506, 1, 65, 1),
+('葡萄彈', '포도탄', 20507, 1, 65, 1),
+('安那般那', '안나반나', 20508, 1, 65, 1),
+('玄米綠茶', '현미녹차', 20509, 1, 65, 1),
+('恐怖 映畫', '공포 영화', 20510, 1, 65, 1),
+('쏘비에트 聯邦', '쏘비에트 련방', 20511, 1, 65, 1),
+('江界', '강계', 20512, 1, 64, 1),
+('強打', '강타', 20513, 1, 64, 1),
+('坑口', '갱구', 20514, 1, 64, 1),
+('結核', '결핵', 20515, 1, 64, 1),
+('光照', '광조', 20516, 1, 64, 1),
+('罫線', '괘선', 20517, 1, 64, 1),
+('羅列', '나열', 20518, 1, 64, 1),
+('卵管', '난관', 20519, 1, 64, 1),
+('圖錄', '도록', 20520, 1, 64, 1),
+('東宮', '동궁', 20521, 1, 64, 1),
+('羅列', '라렬', 20522, 1, 64, 1),
+('類型', '류형', 20523, 1, 64, 1),
+('母斑', '모반', 20524, 1, 64, 1),
+('沒藥', '몰약', 20525, 1, 64, 1),
+('方丈', '방장', 20526, 1, 64, 1),
+('復位', '복위', 20527, 1, 64, 1),
+('樹立', '수립', 20528, 1, 64, 1),
+('樹木', '수목', 20529, 1, 64, 1),
+('眼帶', '안대', 20530, 1, 64, 1),
+('略號', '약호', 20531, 1, 64, 1),
+('約婚', '약혼', 20532, 1, 64, 1),
+('鹽素', '염소', 20533, 1, 64, 1),
+('嶺南', '영남', 20534, 1, 64, 1),
+('禮服', '예복', 20535, 1, 64, 1),
+('咽頭', '인두', 20536, 1, 64, 1),
+('底意', '저의', 20537, 1, 64, 1),
+('全盛', '전성', 20538, 1, 64, 1),
+('轉筆', '전필', 20539, 1, 64, 1),
+('處格', '처격', 20540, 1, 64, 1),
+('鐵筆', '철필', 20541, 1, 64, 1),
+('銃聲', '총성', 20542, 1, 64, 1),
+('退職', '퇴직', 20543, 1, 64, 1),
+('特技', '특기', 20544, 1, 64, 1),
+('偏重', '편중', 20545, 1, 64, 1),
+('平澤', '평택', 20546, 1, 64, 1),
+('湖北', '호북', 20547, 1, 64, 1),
+('確證', '확증', 20548, 1, 64, 1),
+('孤兒院', '고아원', 20549, 1, 64, 1),
+('童貞男', '동정남', 20550, 1, 64, 1),
+('亞燐酸', '아인산', 20551, 1, 64, 1),
+('曳引船', '예인선', 20552, 1, 64, 1),
+('淸掃婦', '청소부', 20553, 1, 64, 1),
+('花崗岩', '화강암', 20554, 1, 64, 1),
+('火焰甁', '화염병', 20555, 1, 64, 1),
+('黑雪糖', '흑설탕', 20556, 1, 64, 1),
+('門손잡이', '문손잡이', 20557, 1, 64, 1),
+('決斷', '결단', 20558, 1, 63, 1),
+('叩頭', '고두', 20559, 1, 63, 1),
+('古稀', '고희', 20560, 1, 63, 1),
+('廣西', '광서', 20561, 1, 63, 1),
+('光彩', '광채', 20562, 1, 63, 1),
+('教師', '교사', 20563, 1, 63, 1),
+('極限', '극한', 20564, 1, 63, 1),
+('腦回', '뇌회', 20565, 1, 63, 1),
+('獨特', '독특', 20566, 1, 63, 1),
+('老眼', '로안', 20567, 1, 63, 1),
+('伯母', '백모', 20568, 1, 63, 1),
+('變裝', '변장', 20569, 1, 63, 1),
+('四散', '사산', 20570, 1, 63, 1),
+('商務', '상무', 20571, 1, 63, 1),
+('鮮度', '선도', 20572, 1, 63, 1),
+('先例', '선례', 20573, 1, 63, 1),
+('聖讀', '성독', 20574, 1, 63, 1),
+('城市', '성시', 20575, 1, 63, 1),
+('熱禱', '열도', 20576, 1, 63, 1),
+('陰目', '음목', 20577, 1, 63, 1),
+('低能', '저능', 20578, 1, 63, 1),
+('絶交', '절교', 20579, 1, 63, 1),
+('淸陽', '청양', 20580, 1, 63, 1),
+('貝母', '패모', 20581, 1, 63, 1),
+('乾船渠', '건선거', 20582, 1, 63, 1),
+('免許證', '면허증', 20583, 1, 63, 1),
+('鳳仙花', '봉선화', 20584, 1, 63, 1),
+('槍騎兵', '창기병', 20585, 1, 63, 1),
+('街角', '가각', 20586, 1, 62, 1),
+('寬解', '관해', 20587, 1, 62, 1),
+('巧言', '교언', 20588, 1, 62, 1),
+('羅城', '나성', 20589, 1, 62, 1),
+('萬狀', '만상', 20590, 1, 62, 1),
+('萬象', '만상', 20591, 1, 62, 1),
+('模式', '모식', 20592, 1, 62, 1),
+('射擊', '사격', 20593, 1, 62, 1),
+('辭表', '사표', 20594, 1, 62, 1),
+('算板', '산판', 20595, 1, 62, 1),
+('說教', '설교', 20596, 1, 62, 1),
+('搔頭', '소두', 20597, 1, 62, 1),
+('安逸', '안일', 20598, 1, 62, 1),
+('魚醬', '어장', 20599, 1, 62, 1),
+('抑制', '억제', 20600, 1, 62, 1),
+('年間', '연간', 20601, 1, 62, 1),
+('瓦解', '와해', 20602, 1, 62, 1),
+('全裸', '전라', 20603, 1, 62, 1),
+('接境', '접경', 20604, 1, 62, 1),
+('接待', '접대', 20605, 1, 62, 1),
+('組立', '조립', 20606, 1, 62, 1),
+('竣工', '준공', 20607, 1, 62, 1),
+('草創', '초창', 20608, 1, 62, 1),
+('平昌', '평창', 20609, 1, 62, 1),
+('賢明', '현명', 20610, 1, 62, 1),
+('花蜜', '화밀', 20611, 1, 62, 1),
+('花粉', '화분', 20612, 1, 62, 1),
+('後嗣', '후사', 20613, 1, 62, 1),
+('黑板', '흑판', 20614, 1, 62, 1),
+('視聽率', '시청률', 20615, 1, 62, 1),
+('暗黑街', '암흑가', 20616, 1, 62, 1),
+('典當鋪', '전당포', 20617, 1, 62, 1),
+('春夏秋冬', '춘하추동', 20618, 1, 62, 1),
+('메소드 演技', '메소드 연기', 20619, 1, 62, 1),
+('頭', '두', 20620, 1, 61, 1),
+('間歇', '간헐', 20621, 1, 61, 1),
+('經濟', '갱제', 20622, 1, 61, 1),
+('輕量', '경량', 20623, 1, 61, 1),
+('光澤', '광택', 20624, 1, 61, 1),
+('口訣', '구결', 20625, 1, 61, 1),
+('悼詞', '도사', 20626, 1, 61, 1),
+('離乳', '리유', 20627, 1, 61, 1),
+('坊間', '방간', 20628, 1, 61, 1),
+('百萬', '백만', 20629, 1, 61, 1),
+('司馬', '사마', 20630, 1, 61, 1),
+('攝政', '섭정', 20631, 1, 61, 1),
+('信條', '신조', 20632, 1, 61, 1),
+('烈火', '열화', 20633, 1, 61, 1),
+('流血', '유혈', 20634, 1, 61, 1),
+('輪船', '윤선', 20635, 1, 61, 1),
+('醫術', '의술', 20636, 1, 61, 1),
+('離乳', '이유', 20637, 1, 61, 1),
+('前途', '전도', 20638, 1, 61, 1),
+('節減', '절감', 20639, 1, 61, 1),
+('晝間', '주간', 20640, 1, 61, 1),
+('住職', '주직', 20641, 1, 61, 1),
+('質疑', '질의', 20642, 1, 61, 1),
+('特筆', '특필', 20643, 1, 61, 1),
+('核果', '핵과', 20644, 1, 61, 1),
+('婚禮', '혼례', 20645, 1, 61, 1),
+('花環', '화환', 20646, 1, 61, 1),
+('恐怖症', '공포증', 20647, 1, 61, 1),
+('沐浴室', '목욕실', 20648, 1, 61, 1),
+('四철湯', '사철탕', 20649, 1, 61, 1),
+('指示棒', '지시봉', 20650, 1, 61, 1),
+('鎭靜劑', '진정제', 20651, 1, 61, 1),
+('脫臭劑', '탈취제', 20652, 1, 61, 1),
+('翰林院', '한림원', 20653, 1, 61, 1),
+('見習', '견습', 20654, 1, 60, 1),
+('騎兵', '기병', 20655, 1, 60, 1),
+('騎士', '기사', 20656, 1, 60, 1),
+('多少', '다소', 20657, 1, 60, 1),
+('等差', '등차', 20658, 1, 60, 1),
+('目擊', '목격', 20659, 1, 60, 1),
+('墓前', '묘전', 20660, 1, 60, 1),
+('半途', '반도', 20661, 1, 60, 1),
+('噴火', '분화', 20662, 1, 60, 1),
+('飛來', '비래', 20663, 1, 60, 1),
+('瀉血', '사혈', 20664, 1, 60, 1),
+('西夏', '서하', 20665, 1, 60, 1),
+('失格', '실격', 20666, 1, 60, 1),
+('十善', '십선', 20667, 1, 60, 1),
+('安般', '안반', 20668, 1, 60, 1),
+('藥밥', '약밥', 20669, 1, 60, 1),
+('染料', '염료', 20670, 1, 60, 1),
+('領收', '영수', 20671, 1, 60, 1),
+('遊星', '유성', 20672, 1, 60, 1),
+('油菜', '유채', 20673, 1, 60, 1),
+('油布', '유포', 20674, 1, 60, 1),
+('乳香', '유향', 20675, 1, 60, 1),
+('利潤', '이윤', 20676, 1, 60, 1),
+('燐光', '인광', 20677, 1, 60, 1),
+('認知', '인지', 20678, 1, 60, 1),
+('暫間', '잠간', 20679, 1, 60, 1),
+('葬式', '장식', 20680, 1, 60, 1),
+('傳聞', '전문', 20681, 1, 60, 1),
+('調達', '조달', 20682, 1, 60, 1),
+('弔意', '조의', 20683, 1, 60, 1),
+('艙口', '창구', 20684, 1, 60, 1),
+('夏期', '하기', 20685, 1, 60, 1),
+('血清', '혈청', 20686, 1, 60, 1),
+('血痕', '혈흔', 20687, 1, 60, 1),
+('回收', '회수', 20688, 1, 60, 1),
+('免稅店', '면세점', 20689, 1, 60, 1),
+('氷醋酸', '빙초산', 20690, 1, 60, 1),
+('齧齒類', '설치류', 20691, 1, 60, 1),
+('細胞膜', '세포막', 20692, 1, 60, 1),
+('終夜燈', '종야등', 20693, 1, 60, 1),
+('蓄膿症', '축농증', 20694, 1, 60, 1),
+('緘默症', '함묵증', 20695, 1, 60, 1),
+('메서드 演技', '메서드 연기', 20696, 1, 60, 1),
+('—掌匣   ', '벙어리 장갑', 20697, 1, 60, 1),
+('間', '간', 20698, 1, 59, 1),
+('加州', '가주', 20699, 1, 59, 1),
+('奸惡', '간악', 20700, 1, 59, 1),
+('開眼', '개안', 20701, 1, 59, 1),
+('—醬', '김장', 20702, 1, 59, 1),
+('東邦', '동방', 20703, 1, 59, 1),
+('馬具', '마구', 20704, 1, 59, 1),
+('滅種', '멸종', 20705, 1, 59, 1),
+('木材', '목재', 20706, 1, 59, 1),
+('武漢', '무한', 20707, 1, 59, 1),
+('放尿', '방뇨', 20708, 1, 59, 1),
+('百選', '백선', 20709, 1, 59, 1),
+('壁紙', '벽지', 20710, 1, 59, 1),
+('便秘', '변비', 20711, 1, 59, 1),
+('別居', '별거', 20712, 1, 59, 1),
+('私見', '사견', 20713, 1, 59, 1),
+('常例', '상례', 20714, 1, 59, 1),
+('成就', '성취', 20715, 1, 59, 1),
+('失速', '실속', 20716, 1, 59, 1),
+('夜市', '야시', 20717, 1, 59, 1),
+('黎明', '여명', 20718, 1, 59, 1),
+('熱鬧', '열뇨', 20719, 1, 59, 1),
+('運勢', '운세', 20720, 1, 59, 1),
+('遺骨', '유골', 20721, 1, 59, 1),
+('由來', '유래', 20722, 1, 59, 1),
+('隱身', '은신', 20723, 1, 59, 1),
+('異邦', '이방', 20724, 1, 59, 1),
+('除隊', '제대', 20725, 1, 59, 1),
+('指令', '지령', 20726, 1, 59, 1),
+('臭素', '취소', 20727, 1, 59, 1),
+('針路', '침로', 20728, 1, 59, 1),
+('土砂', '토사', 20729, 1, 59, 1),
+('平牀', '평상', 20730, 1, 59, 1),
+('平壤', '평양', 20731, 1, 59, 1),
+('含有', '함유', 20732, 1, 59, 1),
+('血塊', '혈괴', 20733, 1, 59, 1),
+('血栓', '혈전', 20734, 1, 59, 1),
+('警察犬', '경찰견', 20735, 1, 59, 1),
+('纖維素', '섬유소', 20736, 1, 59, 1),
+('閱覽室', '열람실', 20737, 1, 59, 1),
+('土耳其', '토이기', 20738, 1, 59, 1),
+('—燈 ', '호박등', 20739, 1, 59, 1),
+('劍術', '검술', 20740, 1, 58, 1),
+('決議', '결의', 20741, 1, 58, 1),
+('硬度', '경도', 20742, 1, 58, 1),
+('果樹', '과수', 20743, 1, 58, 1),
+('露店', '노점', 20744, 1, 58, 1),
+('腦波', '뇌파', 20745, 1, 58, 1),
+('都賣', '도매', 20746, 1, 58, 1),
+('毒害', '독해', 20747, 1, 58, 1),
+('東雲', '동운', 20748, 1, 58, 1),
+('登極', '등극', 20749, 1, 58, 1),
+('問題', '문데', 20750, 1, 58, 1),
+('微弱', '미약', 20751, 1, 58, 1),
+('配布', '배포', 20752, 1, 58, 1),
+('比來', '비래', 20753, 1, 58, 1),
+('鼻門', '비문', 20754, 1, 58, 1),
+('砂鐵', '사철', 20755, 1, 58, 1),
+('相姦', '상간', 20756, 1, 58, 1),
+('先祖', '선조', 20757, 1, 58, 1),
+('少領', '소령', 20758, 1, 58, 1),
+('松魚', '송어', 20759, 1, 58, 1),
+('首領', '수령', 20760, 1, 58, 1),
+('收錄', '수록', 20761, 1, 58, 1),
+('羞明', '수명', 20762, 1, 58, 1),
+('詩歌', '시가', 20763, 1, 58, 1),
+('漁師', '어사', 20764, 1, 58, 1),
+('烈士', '열사', 20765, 1, 58, 1),
+('豫見', '예견', 20766, 1, 58, 1),
+('幽門', '유문', 20767, 1, 58, 1),
+('議決', '의결', 20768, 1, 58, 1),
+('燐素', '인소', 20769, 1, 58, 1),
+('適例', '적례', 20770, 1, 58, 1),
+('祖先', '조선', 20771, 1, 58, 1),
+('統率', '통솔', 20772, 1, 58, 1),
+('投降', '투항', 20773, 1, 58, 1),
+('特典', '특전', 20774, 1, 58, 1),
+('害毒', '해독', 20775, 1, 58, 1),
+('現存', '현존', 20776, 1, 58, 1),
+('呼格', '호격', 20777, 1, 58, 1),
+('好轉', '호전', 20778, 1, 58, 1),
+('火餠', '화병', 20779, 1, 58, 1),
+('花序', '화서', 20780, 1, 58, 1),
+('火焰', '화염', 20781, 1, 58, 1),
+('葉卷煙', '엽궐련', 20782, 1, 58, 1),
+('六穴砲', '육혈포', 20783, 1, 58, 1),
+('再割引', '재할인', 20784, 1, 58, 1),
+('貞操帶', '정조대', 20785, 1, 58, 1),
+('恒星系', '항성계', 20786, 1, 58, 1),
+('我是他非', '아시타비', 20787, 1, 58, 1),
+('血', '혈', 20788, 1, 57, 1),
+('乾果', '건과', 20789, 1, 57, 1),
+('檢溫', '검온', 20790, 1, 57, 1),
+('格差', '격차', 20791, 1, 57, 1),
+('古董', '고동', 20792, 1, 57, 1),
+('鑛油', '광유', 20793, 1, 57, 1),
+('救命', '구명', 20794, 1, 57, 1),
+('極圈', '극권', 20795, 1, 57, 1),
+('急落', '급락', 20796, 1, 57, 1),
+('難問', '난문', 20797, 1, 57, 1),
+('斷續', '단속', 20798, 1, 57, 1),
+('東司', '동사', 20799, 1, 57, 1),
+('媒質', '매질', 20800, 1, 57, 1),
+('明紬', '명주', 20801, 1, 57, 1),
+('媚藥', '미약', 20802, 1, 57, 1),
+('邦畫', '방화', 20803, 1, 57, 1),
+('先取', '선취', 20804, 1, 57, 1),
+('濕度', '습도', 20805, 1, 57, 1),
+('勝果', '승과', 20806, 1, 57, 1),
+('識見', '식견', 20807, 1, 57, 1),
+('亞科', '아과', 20808, 1, 57, 1),
+('藥瓶', '약병', 20809, 1, 57, 1),
+('藥莢', '약협', 20810, 1, 57, 1),
+('魚粉', '어분', 20811, 1, 57, 1),
+('延命', '연명', 20812, 1, 57, 1),
+('演習', '연습', 20813, 1, 57, 1),
+('連休', '연휴', 20814, 1, 57, 1),
+('全鰒', '전복', 20815, 1, 57, 1),
+('前兆', '전조', 20816, 1, 57, 1),
+('靑菜', '청채', 20817, 1, 57, 1),
+('廢位', '폐위', 20818, 1, 57, 1),
+('好投', '호투', 20819, 1, 57, 1),
+('火斗', '화두', 20820, 1, 57, 1),
+('花柱', '화주', 20821, 1, 57, 1),
+('幻術', '환술', 20822, 1, 57, 1),
+('雙眼鏡', '쌍안경', 20823, 1, 57, 1),
+('—桶 ', '연장통', 20824, 1, 57, 1),
+('再檢討', '재검토', 20825, 1, 57, 1),
+('曾祖父', '증조부', 20826, 1, 57, 1),
+('破城槌', '파성퇴', 20827, 1, 57, 1),
+('花崗巖', '화강암', 20828, 1, 57, 1),
+('曲折  符', '곡절 부호', 20829, 1, 57, 1),
+('講和', '강화', 20830, 1, 56, 1),
+('乾板', '건판', 20831, 1, 56, 1),
+('結末', '결말', 20832, 1, 56, 1),
+('區畫', '구획', 20833, 1, 56, 1),
+('硅素', '규소', 20834, 1, 56, 1),
+('菌類', '균류', 20835, 1, 56, 1),
+('農園', '농원', 20836, 1, 56, 1),
+('突變', '돌변', 20837, 1, 56, 1),
+('防腐', '방부', 20838, 1, 56, 1),
+('氷結', '빙결', 20839, 1, 56, 1),
+('砂果', '사과', 20840, 1, 56, 1),
+('史劇', '사극', 20841, 1, 56, 1),
+('四川', '사천', 20842, 1, 56, 1),
+('史畵', '사화', 20843, 1, 56, 1),
+('西瓜', '서과', 20844, 1, 56, 1),
+('瑞西', '서서', 20845, 1, 56, 1),
+('勝率', '승률', 20846, 1, 56, 1),
+('引率', '인솔', 20847, 1, 56, 1),
+('窒素', '질소', 20848, 1, 56, 1),
+('靑島', '청도', 20849, 1, 56, 1),
+('最短', '최단', 20850, 1, 56, 1),
+('醜惡', '추악', 20851, 1, 56, 1),
+('他來', '타래', 20852, 1, 56, 1),
+('版木', '판목', 20853, 1, 56, 1),
+('編曲', '편곡', 20854, 1, 56, 1),
+('現役', '현역', 20855, 1, 56, 1),
+('回春', '회춘', 20856, 1, 56, 1),
+('防潮堤', '방조제', 20857, 1, 56, 1),
+('闊葉樹', '활엽수', 20858, 1, 56, 1),
+('皇太后', '황태후', 20859, 1, 56, 1),
+('絨緞爆擊', '융단폭격', 20860, 1, 56, 1),
+('堅信', '견신', 20861, 1, 55, 1),
+('交歡', '교환', 20862, 1, 55, 1),
+('極刑', '극형', 20863, 1, 55, 1),
+('急送', '급송', 20864, 1, 55, 1),
+('斷絶', '단절', 20865, 1, 55, 1),
+('晚期', '만기', 20866, 1, 55, 1),
+('放免', '방면', 20867, 1, 55, 1),
+('附帶', '부대', 20868, 1, 55, 1),
+('選任', '선임', 20869, 1, 55, 1),
+('速寫', '속사', 20870, 1, 55, 1),
+('送狀', '송장', 20871, 1, 55, 1),
+('純度', '순도', 20872, 1, 55, 1),
+('濕紙', '습지', 20873, 1, 55, 1),
+('洋銀', '양은', 20874, 1, 55, 1),
+('連邦', '연방', 20875, 1, 55, 1),
+('連勝', '연승', 20876, 1, 55, 1),
+('令狀', '영장', 20877, 1, 55, 1),
+('溫州', '온주', 20878, 1, 55, 1),
+('傭兵', '용병', 20879, 1, 55, 1),
+('乳糖', '유당', 20880, 1, 55, 1),
+('在住', '재주', 20881, 1, 55, 1),
+('座位', '좌위', 20882, 1, 55, 1),
+('進獻', '진헌', 20883, 1, 55, 1),
+('草綠', '초록', 20884, 1, 55, 1),
+('春服', '춘복', 20885, 1, 55, 1),
+('七星', '칠성', 20886, 1, 55, 1),
+('打算', '타산', 20887, 1, 55, 1),
+('他殺', '타살', 20888, 1, 55, 1),
+('打破', '타파', 20889, 1, 55, 1),
+('便益', '편익', 20890, 1, 55, 1),
+('片紙', '편지', 20891, 1, 55, 1),
+('閉經', '폐경', 20892, 1, 55, 1),
+('紅葉', '홍엽', 20893, 1, 55, 1),
+('映畵祭', '영화제', 20894, 1, 55, 1),
+('催淫劑', '최음제', 20895, 1, 55, 1),
+('곱사鰱魚', '곱사연어', 20896, 1, 55, 1),
+('儉素', '검소', 20897, 1, 54, 1),
+('決然', '결연', 20898, 1, 54, 1),
+('關與', '관여', 20899, 1, 54, 1),
+('句節', '구절', 20900, 1, 54, 1),
+('雷管', '뇌관', 20901, 1, 54, 1),
+('旅團', '려단', 20902, 1, 54, 1),
+('列島', '렬도', 20903, 1, 54, 1),
+('保釋', '보석', 20904, 1, 54, 1),
+('私設', '사설', 20905, 1, 54, 1),
+('散在', '산재', 20906, 1, 54, 1),
+('習俗', '습속', 20907, 1, 54, 1),
+('眼識', '안식', 20908, 1, 54, 1),
+('野犬', '야견', 20909, 1, 54, 1),
+('陽炎', '양염', 20910, 1, 54, 1),
+('養育', '양육', 20911, 1, 54, 1),
+('魚介', '어개', 20912, 1, 54, 1),
+('餘望', '여망', 20913, 1, 54, 1),
+('女王', '여왕', 20914, 1, 54, 1),
+('易經', '역경', 20915, 1, 54, 1),
+('誤讀', '오독', 20916, 1, 54, 1),
+('遊客', '유객', 20917, 1, 54, 1),
+('類推', '유추', 20918, 1, 54, 1),
+('適任', '적임', 20919, 1, 54, 1),
+('節操', '절조', 20920, 1, 54, 1),
+('秋服', '추복', 20921, 1, 54, 1),
+('忠節', '충절', 20922, 1, 54, 1),
+('稗官', '패관', 20923, 1, 54, 1),
+('砲擊', '포격', 20924, 1, 54, 1),
+('陜西', '합서', 20925, 1, 54, 1),
+('陜西', '협서', 20926, 1, 54, 1),
+('混信', '혼신', 20927, 1, 54, 1),
+('花押', '화압', 20928, 1, 54, 1),
+('基督教', '기독교', 20929, 1, 54, 1),
+('半시옷', '반시옷', 20930, 1, 54, 1),
+('龍鬚鐵', '용수철', 20931, 1, 54, 1),
+('靑머리오리', '청머리오리', 20932, 1, 54, 1),
+('西', '서', 20933, 1, 53, 1),
+('假裝', '가장', 20934, 1, 53, 1),
+('改題', '개제', 20935, 1, 53, 1),
+('輕科', '경과', 20936, 1, 53, 1),
+('故殺', '고살', 20937, 1, 53, 1),
+('交互', '교호', 20938, 1, 53, 1),
+('來襲', '내습', 20939, 1, 53, 1),
+('腦炎', '뇌염', 20940, 1, 53, 1),
+('單獨', '단독', 20941, 1, 53, 1),
+('斷髮', '단발', 20942, 1, 53, 1),
+('麵類', '면류', 20943, 1, 53, 1),
+('木綿', '목면', 20944, 1, 53, 1),
+('硼素', '붕소', 20945, 1, 53, 1),
+('砒素', '비소', 20946, 1, 53, 1),
+('辭退', '사퇴', 20947, 1, 53, 1),
+('酸敗', '산패', 20948, 1, 53, 1),
+('宣紙', '선지', 20949, 1, 53, 1),
+('陝西', '섬서', 20950, 1, 53, 1),
+('消去', '소거', 20951, 1, 53, 1),
+('亞界', '아계', 20952, 1, 53, 1),
+('安康', '안강', 20953, 1, 53, 1),
+('如來', '여래', 20954, 1, 53, 1),
+('映畫', '영화', 20955, 1, 53, 1),
+('雲羅', '운라', 20956, 1, 53, 1),
+('肉筆', '육필', 20957, 1, 53, 1),
+('鄭重', '정중', 20958, 1, 53, 1),
+('精蟲', '정충', 20959, 1, 53, 1),
+('注油', '주유', 20960, 1, 53, 1),
+('重曹', '중조', 20961, 1, 53, 1),
+('智能', '지능', 20962, 1, 53, 1),
+('畜産', '축산', 20963, 1, 53, 1),
+('肺魚', '폐어', 20964, 1, 53, 1),
+('畵商', '화상', 20965, 1, 53, 1),
+('孝經', '효경', 20966, 1, 53, 1),
+('PC房', 'PC방', 20967, 1, 53, 1),
+('始祖鳥', '시조조', 20968, 1, 53, 1),
+('羊毛脂', '양모지', 20969, 1, 53, 1),
+('練習帳', '연습장', 20970, 1, 53, 1),
+('圓珠筆', '원주필', 20971, 1, 53, 1),
+('銀河系', '은하계', 20972, 1, 53, 1),
+('再吟味', '재음미', 20973, 1, 53, 1),
+('八卦掌', '팔괘장', 20974, 1, 53, 1),
+('PC房', '피시방', 20975, 1, 53, 1),
+('피시房', '피시방', 20976, 1, 53, 1),
+('偶像崇拜', '우상숭배', 20977, 1, 53, 1),
+('鐵의  帳', '철의 장막', 20978, 1, 53, 1),
+('兵', '병', 20979, 1, 52, 1),
+('減速', '감속', 20980, 1, 52, 1),
+('穀類', '곡류', 20981, 1, 52, 1),
+('鑛夫', '광부', 20982, 1, 52, 1),
+('紀要', '기요', 20983, 1, 52, 1),
+('露營', '노영', 20984, 1, 52, 1),
+('茶盤', '다반', 20985, 1, 52, 1),
+('都錄', '도록', 20986, 1, 52, 1),
+('豆乳', '두유', 20987, 1, 52, 1),
+('登板', '등판', 20988, 1, 52, 1),
+('變移', '변이', 20989, 1, 52, 1),
+('附表', '부표', 20990, 1, 52, 1),
+('消散', '소산', 20991, 1, 52, 1),
+('洋琴', '양금', 20992, 1, 52, 1),
+('映射', '영사', 20993, 1, 52, 1),
+('雨林', '우림', 20994, 1, 52, 1),
+('雜技', '잡기', 20995, 1, 52, 1),
+('轉勤', '전근', 20996, 1, 52, 1),
+('前哨', '전초', 20997, 1, 52, 1),
+('轉向', '전향', 20998, 1, 52, 1),
+('情趣', '정취', 20999, 1, 52, 1),
+('制馭', '제어', 21000, 1, 52, 1),
+('照度', '조도', 21001, 1, 52, 1),
+('尊號', '존호', 21002, 1, 52, 1),
+('茶盤', '차반', 21003, 1, 52, 1),
+('彈幕', '탄막', 21004, 1, 52, 1),
+('太宗', '태종', 21005, 1, 52, 1),
+('冷藏庫', '랭장고', 21006, 1, 52, 1),
+('賣淫窟', '매음굴', 21007, 1, 52, 1),
+('謝肉祭', '사육제', 21008, 1, 52, 1),
+('雲霧林', '운무림', 21009, 1, 52, 1),
+('粘板岩', '점판암', 21010, 1, 52, 1),
+('鳥瞰圖', '조감도', 21011, 1, 52, 1),
+('朝鮮글', '조선글', 21012, 1, 52, 1),
+('葡萄園', '포도원', 21013, 1, 52, 1),
+('避雷針', '피뢰침', 21014, 1, 52, 1),
+('鴛鴦四寸', '원앙사촌', 21015, 1, 52, 1),
+('角逐', '각축', 21016, 1, 51, 1),
+('競賣', '경매', 21017, 1, 51, 1),
+('輕油', '경유', 21018, 1, 51, 1),
+('骨膜', '골막', 21019, 1, 51, 1),
+('交款', '교관', 21020, 1, 51, 1),
+('煖房', '난방', 21021, 1, 51, 1),
+('當局', '당국', 21022, 1, 51, 1),
+('獨島', '독도', 21023, 1, 51, 1),
+('毒蟲', '독충', 21024, 1, 51, 1),
+('棉花', '면화', 21025, 1, 51, 1),
+('木蘭', '목란', 21026, 1, 51, 1),
+('米酒', '미주', 21027, 1, 51, 1),
+('半값', '반값', 21028, 1, 51, 1),
+('半半', '반반', 21029, 1, 51, 1),
+('變則', '변칙', 21030, 1, 51, 1),
+('保健', '보건', 21031, 1, 51, 1),
+('封土', '봉토', 21032, 1, 51, 1),
+('附加', '부가', 21033, 1, 51, 1),
+('設令', '설령', 21034, 1, 51, 1),
+('柔術', '유술', 21035, 1, 51, 1),
+('造幣', '조폐', 21036, 1, 51, 1),
+('坐位', '좌위', 21037, 1, 51, 1),
+('支脈', '지맥', 21038, 1, 51, 1),
+('菜園', '채원', 21039, 1, 51, 1),
+('築造', '축조', 21040, 1, 51, 1),
+('託治', '탁치', 21041, 1, 51, 1),
+('探知', '탐지', 21042, 1, 51, 1),
+('害蟲', '해충', 21043, 1, 51, 1),
+('和蘭', '화란', 21044, 1, 51, 1),
+('冷凍庫', '냉동고', 21045, 1, 51, 1),
+('琺瑯質', '법랑질', 21046, 1, 51, 1),
+('王새매', '왕새매', 21047, 1, 51, 1),
+('慰靈祭', '위령제', 21048, 1, 51, 1),
+('打撲傷', '타박상', 21049, 1, 51, 1),
+('피씨房', '피씨방', 21050, 1, 51, 1),
+('玄米茶', '현미차', 21051, 1, 51, 1),
+('却說', '각설', 21052, 1, 50, 1),
+('角錐', '각추', 21053, 1, 50, 1),
+('鋼管', '강관', 21054, 1, 50, 1),
+('輕率', '경솔', 21055, 1, 50, 1),
+('共存', '공존', 21056, 1, 50, 1),
+('具格', '구격', 21057, 1, 50, 1),
+('郡王', '군왕', 21058, 1, 50, 1),
+('騎馬', '기마', 21059, 1, 50, 1),
+('蘭草', '난초', 21060, 1, 50, 1),
+('唐紙', '당지', 21061, 1, 50, 1),
+('東歐', '동구', 21062, 1, 50, 1),
+('登校', '등교', 21063, 1, 50, 1),
+('旅館', '려관', 21064, 1, 50, 1),
+('謀議', '모의', 21065, 1, 50, 1),
+('負號', '부호', 21066, 1, 50, 1),
+('否運', '비운', 21067, 1, 50, 1),
+('邪視', '사시', 21068, 1, 50, 1),
+('抒情', '서정', 21069, 1, 50, 1),
+('船荷', '선하', 21070, 1, 50, 1),
+('稅率', '세율', 21071, 1, 50, 1),
+('樹皮', '수피', 21072, 1, 50, 1),
+('安徽', '안휘', 21073, 1, 50, 1),
+('液狀', '액상', 21074, 1, 50, 1),
+('驛馬', '역마', 21075, 1, 50, 1),
+('蓮—', '연꽃', 21076, 1, 50, 1),
+('龍果', '용과', 21077, 1, 50, 1),
+('乳癌', '유암', 21078, 1, 50, 1),
+('引受', '인수', 21079, 1, 50, 1),
+('爵位', '작위', 21080, 1, 50, 1),
+('傳授', '전수', 21081, 1, 50, 1),
+('轉借', '전차', 21082, 1, 50, 1),
+('朝鮮', '조선', 21083, 1, 50, 1),
+('支局', '지국', 21084, 1, 50, 1),
+('眞宗', '진종', 21085, 1, 50, 1),
+('淸興', '청흥', 21086, 1, 50, 1),
+('版畫', '판화', 21087, 1, 50, 1),
+('韓屋', '한옥', 21088, 1, 50, 1),
+('革命', '혁명', 21089, 1, 50, 1),
+('換率', '환율', 21090, 1, 50, 1),
+('卷積雲', '권적운', 21091, 1, 50, 1),
+('膽汁酸', '담즙산', 21092, 1, 50, 1),
+('米糠油', '미강유', 21093, 1, 50, 1),
+('顯微鏡', '현미경', 21094, 1, 50, 1),
+('結託', '결탁', 21095, 1, 49, 1),
+('給油', '급유', 21096, 1, 49, 1),
+('卵黃', '난황', 21097, 1, 49, 1),
+('老宅', '노댁', 21098, 1, 49, 1),
+('妄想', '망상', 21099, 1, 49, 1),
+('微雲', '미운', 21100, 1, 49, 1),
+('蜜酒', '밀주', 21101, 1, 49, 1),
+('船倉', '선창', 21102, 1, 49, 1),
+('束草', '속초', 21103, 1, 49, 1),
+('雙親', '쌍친', 21104, 1, 49, 1),
+('顔料', '안료', 21105, 1, 49, 1),
+('暗算', '암산', 21106, 1, 49, 1),
+('暗黑', '암흑', 21107, 1, 49, 1),
+('野卑', '야비', 21108, 1, 49, 1),
+('漁父', '어부', 21109, 1, 49, 1),
+('餘技', '여기', 21110, 1, 49, 1),
+('誤稱', '오칭', 21111, 1, 49, 1),
+('誤爆', '오폭', 21112, 1, 49, 1),
+('緯度', '위도', 21113, 1, 49, 1),
+('類似', '유사', 21114, 1, 49, 1),
+('油田', '유전', 21115, 1, 49, 1),
+('立憲', '입헌', 21116, 1, 49, 1),
+('專賣', '전매', 21117, 1, 49, 1),
+('辰韓', '진한', 21118, 1, 49, 1),
+('側位', '측위', 21119, 1, 49, 1),
+('退避', '퇴피', 21120, 1, 49, 1),
+('皮脂', '피지', 21121, 1, 49, 1),
+('皮層', '피층', 21122, 1, 49, 1),
+('猛禽類', '맹금류', 21123, 1, 49, 1),
+('盲腸炎', '맹장염', 21124, 1, 49, 1),
+('燒夷彈', '소이탄', 21125, 1, 49, 1),
+('助產婦', '조산부', 21126, 1, 49, 1),
+('催淚劑', '최루제', 21127, 1, 49, 1),
+('紅松漁', '홍송어', 21128, 1, 49, 1),
+('結跏趺坐', '결가부좌', 21129, 1, 49, 1),
+('強盜', '강도', 21130, 1, 48, 1),
+('觀覽', '관람', 21131, 1, 48, 1),
+('廣東', '광동', 21132, 1, 48, 1),
+('男娼', '남창', 21133, 1, 48, 1),
+('多辯', '다변', 21134, 1, 48, 1),
+('童歌', '동가', 21135, 1, 48, 1),
+('歷史', '력사', 21136, 1, 48, 1),
+('未熟', '미숙', 21137, 1, 48, 1),
+('防塵', '방진', 21138, 1, 48, 1),
+('便祕', '변비', 21139, 1, 48, 1),
+('悲運', '비운', 21140, 1, 48, 1),
+('散亂', '산란', 21141, 1, 48, 1),
+('丞相', '승상', 21142, 1, 48, 1),
+('歷史', '역사', 21143, 1, 48, 1),
+('醫院', '의원', 21144, 1, 48, 1),
+('引退', '인퇴', 21145, 1, 48, 1),
+('裁可', '재가', 21146, 1, 48, 1),
+('粘度', '점도', 21147, 1, 48, 1),
+('釣魚', '조어', 21148, 1, 48, 1),
+('種麴', '종국', 21149, 1, 48, 1),
+('靑玉', '청옥', 21150, 1, 48, 1),
+('吹管', '취관', 21151, 1, 48, 1),
+('彈倉', '탄창', 21152, 1, 48, 1),
+('破談', '파담', 21153, 1, 48, 1),
+('抗告', '항고', 21154, 1, 48, 1),
+('香菜', '향채', 21155, 1, 48, 1),
+('回旋', '회선', 21156, 1, 48, 1),
+('牽牛星', '견우성', 21157, 1, 48, 1),
+('萬萬歲', '만만세', 21158, 1, 48, 1),
+('潤滑劑', '윤활제', 21159, 1, 48, 1),
+('再搜査', '재수사', 21160, 1, 48, 1),
+('喜消息', '희소식', 21161, 1, 48, 1),
+('信', '신', 21162, 1, 47, 1),
+('可逆', '가역', 21163, 1, 47, 1),
+('加虐', '가학', 21164, 1, 47, 1),
+('減算', '감산', 21165, 1, 47, 1),
+('減退', '감퇴', 21166, 1, 47, 1),
+('強推', '강추', 21167, 1, 47, 1),
+('巨乳', '거유', 21168, 1, 47, 1),
+('鏡城', '경성', 21169, 1, 47, 1),
+('系列', '계렬', 21170, 1, 47, 1),
+('系列', '계열', 21171, 1, 47, 1),
+('觀測', '관측', 21172, 1, 47, 1),
+('狂暴', '광폭', 21173, 1, 47, 1),
+('交驩', '교환', 21174, 1, 47, 1),
+('構圖', '구도', 21175, 1, 47, 1),
+('拳骨', '권골', 21176, 1, 47, 1),
+('菌界', '균계', 21177, 1, 47, 1),
+('劇詩', '극시', 21178, 1, 47, 1),
+('蠟紙', '납지', 21179, 1, 47, 1),
+('臺座', '대좌', 21180, 1, 47, 1),
+('獨裁', '독재', 21181, 1, 47, 1),
+('榴彈', '류탄', 21182, 1, 47, 1),
+('賣却', '매각', 21183, 1, 47, 1),
+('賣淫', '매음', 21184, 1, 47, 1),
+('모種', '모종', 21185, 1, 47, 1),
+('未濟', '미제', 21186, 1, 47, 1),
+('薄命', '박명', 21187, 1, 47, 1),
+('叛骨', '반골', 21188, 1, 47, 1),
+('防蝕', '방식', 21189, 1, 47, 1),
+('防牌', '방패', 21190, 1, 47, 1),
+('備考', '비고', 21191, 1, 47, 1),
+('司令', '사령', 21192, 1, 47, 1),
+('散布', '산포', 21193, 1, 47, 1),
+('受賞', '수상', 21194, 1, 47, 1),
+('修整', '수정', 21195, 1, 47, 1),
+('略稱', '약칭', 21196, 1, 47, 1),
+('裂果', '열과', 21197, 1, 47, 1),
+('榴彈', '유탄', 21198, 1, 47, 1),
+('因習', '인습', 21199, 1, 47, 1),
+('磁界', '자계', 21200, 1, 47, 1),
+('堤防', '제방', 21201, 1, 47, 1),
+('條目', '조목', 21202, 1, 47, 1),
+('朝敵', '조적', 21203, 1, 47, 1),
+('縱隊', '종대', 21204, 1, 47, 1),
+('準星', '준성', 21205, 1, 47, 1),
+('指章', '지장', 21206, 1, 47, 1),
+('眞菌', '진균', 21207, 1, 47, 1),
+('炭鑛', '탄광', 21208, 1, 47, 1),
+('炭層', '탄층', 21209, 1, 47, 1),
+('飽和', '포화', 21210, 1, 47, 1),
+('喊聲', '함성', 21211, 1, 47, 1),
+('協約', '협약', 21212, 1, 47, 1),
+('黃河', '황하', 21213, 1, 47, 1),
+('效率', '효율', 21214, 1, 47, 1),
+('除蟲菊', '제충국', 21215, 1, 47, 1),
+('強姦', '강간', 21216, 1, 46, 1),
+('改組', '개조', 21217, 1, 46, 1),
+('檢針', '검침', 21218, 1, 46, 1),
+('格鬪', '격투', 21219, 1, 46, 1),
+('結了', '결료', 21220, 1, 46, 1),
+('管轄', '관할', 21221, 1, 46, 1),
+('怒號', '노호', 21222, 1, 46, 1),
+('吏治', '리치', 21223, 1, 46, 1),
+('冥想', '명상', 21224, 1, 46, 1),
+('務停', '무정', 21225, 1, 46, 1),
+('배便', '배편', 21226, 1, 46, 1),
+('伐草', '벌초', 21227, 1, 46, 1),
+('別일', '별일', 21228, 1, 46, 1),
+('非番', '비번', 21229, 1, 46, 1),
+('頻度', '빈도', 21230, 1, 46, 1),
+('四柱', '사주', 21231, 1, 46, 1),
+('序曲', '서곡', 21232, 1, 46, 1),
+('瘦身', '수신', 21233, 1, 46, 1),
+('受注', '수주', 21234, 1, 46, 1),
+('熟讀', '숙독', 21235, 1, 46, 1),
+('順列', '순열', 21236, 1, 46, 1),
+('昇進', '승진', 21237, 1, 46, 1),
+('試算', '시산', 21238, 1, 46, 1),
+('雅號', '아호', 21239, 1, 46, 1),
+('擁立', '옹립', 21240, 1, 46, 1),
+('緩和', '완화', 21241, 1, 46, 1),
+('遊休', '유휴', 21242, 1, 46, 1),
+('離陸', '이륙', 21243, 1, 46, 1),
+('財界', '재계', 21244, 1, 46, 1),
+('轉折', '전절', 21245, 1, 46, 1),
+('增進', '증진', 21246, 1, 46, 1),
+('進貢', '진공', 21247, 1, 46, 1),
+('處置', '처치', 21248, 1, 46, 1),
+('遞傳', '체전', 21249, 1, 46, 1),
+('䱋魚', '홍어', 21250, 1, 46, 1),
+('橫領', '횡령', 21251, 1, 46, 1),
+('亞細亞', '아세아', 21252, 1, 46, 1),
+('兩脚規', '양각규', 21253, 1, 46, 1),
+('五穀밥', '오곡밥', 21254, 1, 46, 1),
+('總督府', '총독부', 21255, 1, 46, 1),
+('皮膚癌', '피부암', 21256, 1, 46, 1),
+('麻婆豆腐', '마파두부', 21257, 1, 46, 1),
+('免責條項', '면책조항', 21258, 1, 46, 1),
+('社', '사', 21259, 1, 45, 1),
+('干支', '간지', 21260, 1, 45, 1),
+('強占', '강점', 21261, 1, 45, 1),
+('見聞', '견문', 21262, 1, 45, 1),
+('急派', '급파', 21263, 1, 45, 1),
+('己未', '기미', 21264, 1, 45, 1),
+('男캐', '남캐', 21265, 1, 45, 1),
+('冬服', '동복', 21266, 1, 45, 1),
+('木藍', '목람', 21267, 1, 45, 1),
+('變奏', '변주', 21268, 1, 45, 1),
+('補遺', '보유', 21269, 1, 45, 1),
+('社稷', '사직', 21270, 1, 45, 1),
+('沙布', '사포', 21271, 1, 45, 1),
+('設使', '설사', 21272, 1, 45, 1),
+('樹液', '수액', 21273, 1, 45, 1),
+('野狐', '야호', 21274, 1, 45, 1),
+('演藝', '연예', 21275, 1, 45, 1),
+('廉賣', '염매', 21276, 1, 45, 1),
+('葉錢', '엽전', 21277, 1, 45, 1),
+('誤譯', '오역', 21278, 1, 45, 1),
+('王笏', '왕홀', 21279, 1, 45, 1),
+('油菓', '유과', 21280, 1, 45, 1),
+('坐職', '좌직', 21281, 1, 45, 1),
+('終着', '중착', 21282, 1, 45, 1),
+('創案', '창안', 21283, 1, 45, 1),
+('處刑', '처형', 21284, 1, 45, 1),
+('總裁', '총재', 21285, 1, 45, 1),
+('取得', '취득', 21286, 1, 45, 1),
+('宅配', '택배', 21287, 1, 45, 1),
+('土樓', '토루', 21288, 1, 45, 1),
+('必然', '필연', 21289, 1, 45, 1),
+('現札', '현찰', 21290, 1, 45, 1),
+('橫目', '횡목', 21291, 1, 45, 1),
+('歐羅巴', '구라파', 21292, 1, 45, 1),
+('羅針盤', '나침반', 21293, 1, 45, 1),
+('連絡處', '연락처', 21294, 1, 45, 1),
+('陳列欌', '진열장', 21295, 1, 45, 1),
+('玄武岩', '현무암', 21296, 1, 45, 1),
+('笳管', '가관', 21297, 1, 44, 1),
+('槪觀', '개관', 21298, 1, 44, 1),
+('警衛', '경위', 21299, 1, 44, 1),
+('繼父', '계부', 21300, 1, 44, 1),
+('曲尺', '곡척', 21301, 1, 44, 1),
+('骨折', '골절', 21302, 1, 44, 1),
+('過渡', '과도', 21303, 1, 44, 1),
+('群靑', '군청', 21304, 1, 44, 1),
+('老妄', '노망', 21305, 1, 44, 1),
+('腦膜', '뇌막', 21306, 1, 44, 1),
+('盜錄', '도록', 21307, 1, 44, 1),
+('突起', '돌기', 21308, 1, 44, 1),
+('燈皮', '등피', 21309, 1, 44, 1),
+('連絡', '련락', 21310, 1, 44, 1),
+('老妄', '로망', 21311, 1, 44, 1),
+('望鄕', '망향', 21312, 1, 44, 1),
+('砂布', '사포', 21313, 1, 44, 1),
+('列擧', '열거', 21314, 1, 44, 1),
+('五寸', '오촌', 21315, 1, 44, 1),
+('油彩', '유채', 21316, 1, 44, 1),
+('育兒', '육아', 21317, 1, 44, 1),
+('典型', '전형', 21318, 1, 44, 1),
+('粘土', '점토', 21319, 1, 44, 1),
+('坐骨', '좌골', 21320, 1, 44, 1),
+('差減', '차감', 21321, 1, 44, 1),
+('快適', '쾌적', 21322, 1, 44, 1),
+('他黨', '타당', 21323, 1, 44, 1),
+('投函', '투함', 21324, 1, 44, 1),
+('閉館', '폐관', 21325, 1, 44, 1),
+('閉店', '폐점', 21326, 1, 44, 1),
+('諧調', '해조', 21327, 1, 44, 1),
+('活況', '활황', 21328, 1, 44, 1),
+('黃玉', '황옥', 21329, 1, 44, 1),
+('冷却塔', '냉각탑', 21330, 1, 44, 1),
+('鎭守府', '진수부', 21331, 1, 44, 1),
+('恒河沙', '항하사', 21332, 1, 44, 1),
+('減壓', '감압', 21333, 1, 43, 1),
+('改編', '개편', 21334, 1, 43, 1),
+('教育', '교육', 21335, 1, 43, 1),
+('救難', '구난', 21336, 1, 43, 1),
+('極甚', '극심', 21337, 1, 43, 1),
+('禁令', '금령', 21338, 1, 43, 1),
+('緊要', '긴요', 21339, 1, 43, 1),
+('勞組', '노조', 21340, 1, 43, 1),
+('短針', '단침', 21341, 1, 43, 1),
+('達筆', '달필', 21342, 1, 43, 1),
+('答案', '답안', 21343, 1, 43, 1),
+('獨居', '독거', 21344, 1, 43, 1),
+('禮拜', '례배', 21345, 1, 43, 1),
+('禮儀', '례의', 21346, 1, 43, 1),
+('萬丈', '만장', 21347, 1, 43, 1),
+('防銹', '방수', 21348, 1, 43, 1),
+('配慮', '배려', 21349, 1, 43, 1),
+('變貌', '변모', 21350, 1, 43, 1),
+('先烈', '선렬', 21351, 1, 43, 1),
+('少將', '소장', 21352, 1, 43, 1),
+('守勢', '수세', 21353, 1, 43, 1),
+('雙六', '쌍륙', 21354, 1, 43, 1),
+('氏族', '씨족', 21355, 1, 43, 1),
+('延着', '연착', 21356, 1, 43, 1),
+('要緊', '요긴', 21357, 1, 43, 1),
+('雨氷', '우빙', 21358, 1, 43, 1),
+('壯觀', '장관', 21359, 1, 43, 1),
+('腸炎', '장염', 21360, 1, 43, 1),
+('截斷', '절단', 21361, 1, 43, 1),
+('接吻', '접문', 21362, 1, 43, 1),
+('頂板', '정판', 21363, 1, 43, 1),
+('釣船', '조선', 21364, 1, 43, 1),
+('紙袋', '지대', 21365, 1, 43, 1),
+('眞髓', '진수', 21366, 1, 43, 1),
+('秒殺', '초살', 21367, 1, 43, 1),
+('充當', '충당', 21368, 1, 43, 1),
+('枕木', '침목', 21369, 1, 43, 1),
+('偏在', '편재', 21370, 1, 43, 1),
+('獻題', '헌제', 21371, 1, 43, 1),
+('號哭', '호곡', 21372, 1, 43, 1),
+('樺木', '화목', 21373, 1, 43, 1),
+('吸蟲', '흡충', 21374, 1, 43, 1),
+('木', '목', 21375, 1, 42, 1),
+('改宗', '개종', 21376, 1, 42, 1),
+('檢尿', '검뇨', 21377, 1, 42, 1),
+('敬禮', '경례', 21378, 1, 42, 1),
+('捏造', '날조', 21379, 1, 42, 1),
+('來賓', '래빈', 21380, 1, 42, 1),
+('練習', '련습', 21381, 1, 42, 1),
+('萬壽', '만수', 21382, 1, 42, 1),
+('蠻族', '만족', 21383, 1, 42, 1),
+('網羅', '망라', 21384, 1, 42, 1),
+('廟號', '묘호', 21385, 1, 42, 1),
+('武藝', '무예', 21386, 1, 42, 1),
+('報償', '보상', 21387, 1, 42, 1),
+('聖爵', '성작', 21388, 1, 42, 1),
+('鎖骨', '쇄골', 21389, 1, 42, 1),
+('首堂', '수당', 21390, 1, 42, 1),
+('我朝', '아조', 21391, 1, 42, 1),
+('野蒜', '야산', 21392, 1, 42, 1),
+('軟弱', '연약', 21393, 1, 42, 1),
+('郵送', '우송', 21394, 1, 42, 1),
+('六九', '육구', 21395, 1, 42, 1),
+('輪番', '윤번', 21396, 1, 42, 1),
+('佇立', '저립', 21397, 1, 42, 1),
+('照校', '조교', 21398, 1, 42, 1),
+('漕船', '조선', 21399, 1, 42, 1),
+('支署', '지서', 21400, 1, 42, 1),
+('知慧', '지혜', 21401, 1, 42, 1),
+('進呈', '진정', 21402, 1, 42, 1),
+('村落', '촌락', 21403, 1, 42, 1),
+('治癒', '치유', 21404, 1, 42, 1),
+('判例', '판례', 21405, 1, 42, 1),
+('虛弱', '허약', 21406, 1, 42, 1),
+('畫幅', '화폭', 21407, 1, 42, 1),
+('訓令', '훈령', 21408, 1, 42, 1),
+('胸骨', '흉골', 21409, 1, 42, 1),
+('菩提樹', '보리수', 21410, 1, 42, 1),
+('寄宿舍', '지숙사', 21411, 1, 42, 1),
+('트랜스脂肪', '트랜스지방', 21412, 1, 42, 1),
+('姦夫', '간부', 21413, 1, 41, 1),
+('干城', '간성', 21414, 1, 41, 1),
+('輕罪', '경죄', 21415, 1, 41, 1),
+('鑛區', '광구', 21416, 1, 41, 1),
+('貴州', '귀주', 21417, 1, 41, 1),
+('根菜', '근채', 21418, 1, 41, 1),
+('起床', '기상', 21419, 1, 41, 1),
+('來駕', '내가', 21420, 1, 41, 1),
+('綠茶', '녹차', 21421, 1, 41, 1),
+('短銃', '단총', 21422, 1, 41, 1),
+('待避', '대피', 21423, 1, 41, 1),
+('獨逸', '독일', 21424, 1, 41, 1),
+('敏活', '민활', 21425, 1, 41, 1),
+('邦貨', '방화', 21426, 1, 41, 1),
+('弁韓', '변한', 21427, 1, 41, 1),
+('補足', '보족', 21428, 1, 41, 1),
+('賞味', '상미', 21429, 1, 41, 1),
+('常駐', '상주', 21430, 1, 41, 1),
+('帥先', '수선', 21431, 1, 41, 1),
+('殉職', '순직', 21432, 1, 41, 1),
+('升進', '승진', 21433, 1, 41, 1),
+('餘談', '여담', 21434, 1, 41, 1),
+('餘勢', '여세', 21435, 1, 41, 1),
+('鉛毒', '연독', 21436, 1, 41, 1),
+('五爵', '오작', 21437, 1, 41, 1),
+('要衝', '요충', 21438, 1, 41, 1),
+('六十', '육십', 21439, 1, 41, 1),
+('資材', '자재', 21440, 1, 41, 1),
+('低減', '저감', 21441, 1, 41, 1),
+('丁未', '정미', 21442, 1, 41, 1),
+('濟州', '제주', 21443, 1, 41, 1),
+('卒婚', '졸혼', 21444, 1, 41, 1),
+('紙鳶', '지연', 21445, 1, 41, 1),
+('鐵絲', '철사', 21446, 1, 41, 1),
+('淸淨', '청정', 21447, 1, 41, 1),
+('草草', '초초', 21448, 1, 41, 1),
+('妥結', '타결', 21449, 1, 41, 1),
+('土匪', '토비', 21450, 1, 41, 1),
+('號泣', '호읍', 21451, 1, 41, 1),
+('橫城', '횡성', 21452, 1, 41, 1),
+('黑髮', '흑발', 21453, 1, 41, 1),
+('牧羊犬', '목양견', 21454, 1, 41, 1),
+('遠隔操縱', '원격조종', 21455, 1, 41, 1),
+('麝香고양이', '사향고양이', 21456, 1, 41, 1),
+('八', '팔', 21457, 1, 40, 1),
+('骨牌', '골패', 21458, 1, 40, 1),
+('攻城', '공성', 21459, 1, 40, 1),
+('共著', '공저', 21460, 1, 40, 1),
+('共振', '공진', 21461, 1, 40, 1),
+('宮刑', '궁형', 21462, 1, 40, 1),
+('當惑', '당혹', 21463, 1, 40, 1),
+('臺灣', '대만', 21464, 1, 40, 1),
+('凍害', '동해', 21465, 1, 40, 1),
+('盟約', '맹약', 21466, 1, 40, 1),
+('邦譯', '방역', 21467, 1, 40, 1),
+('倍加', '배가', 21468, 1, 40, 1),
+('閥族', '벌족', 21469, 1, 40, 1),
+('譜表', '보표', 21470, 1, 40, 1),
+('父喪', '부상', 21471, 1, 40, 1),
+('不滿', '불만', 21472, 1, 40, 1),
+('私益', '사익', 21473, 1, 40, 1),
+('沙糖', '사탕', 21474, 1, 40, 1),
+('霰彈', '산탄', 21475, 1, 40, 1),
+('星霜', '성상', 21476, 1, 40, 1),
+('蓚酸', '수산', 21477, 1, 40, 1),
+('諡號', '시호', 21478, 1, 40, 1),
+('連鎖', '연쇄', 21479, 1, 40, 1),
+('五倫', '오륜', 21480, 1, 40, 1),
+('五胡', '오호', 21481, 1, 40, 1),
+('圓熟', '원숙', 21482, 1, 40, 1),
+('留守', '유수', 21483, 1, 40, 1),
+('潛在', '잠재', 21484, 1, 40, 1),
+('再構', '재구', 21485, 1, 40, 1),
+('再歸', '재귀', 21486, 1, 40, 1),
+('精髓', '정수', 21487, 1, 40, 1),
+('從容', '종용', 21488, 1, 40, 1),
+('走査', '주사', 21489, 1, 40, 1),
+('周波', '주파', 21490, 1, 40, 1),
+('諜報', '첩보', 21491, 1, 40, 1),
+('總則', '총칙', 21492, 1, 40, 1),
+('催告', '최고', 21493, 1, 40, 1),
+('彈劾', '탄핵', 21494, 1, 40, 1),
+('太尉', '태위', 21495, 1, 40, 1),
+('討議', '토의', 21496, 1, 40, 1),
+('投稿', '투고', 21497, 1, 40, 1),
+('投槍', '투창', 21498, 1, 40, 1),
+('暴騰', '폭등', 21499, 1, 40, 1),
+('夏服', '하복', 21500, 1, 40, 1),
+('閑職', '한직', 21501, 1, 40, 1),
+('那由他', '나유타', 21502, 1, 40, 1),
+('謄寫版', '등사판', 21503, 1, 40, 1),
+('臨津江', '임진강', 21504, 1, 40, 1),
+('竊盜罪', '절도죄', 21505, 1, 40, 1),
+('搭乘券', '탑승권', 21506, 1, 40, 1),
+('黃鶴樓', '황학루', 21507, 1, 40, 1),
+('十', '십', 21508, 1, 39, 1),
+('土', '토', 21509, 1, 39, 1),
+('甲午', '갑오', 21510, 1, 39, 1),
+('綱領', '강령', 21511, 1, 39, 1),
+('九宮', '구궁', 21512, 1, 39, 1),
+('丹毒', '단독', 21513, 1, 39, 1),
+('圖鑑', '도감', 21514, 1, 39, 1),
+('劣等', '렬등', 21515, 1, 39, 1),
+('列氏', '렬씨', 21516, 1, 39, 1),
+('彎曲', '만곡', 21517, 1, 39, 1),
+('胚乳', '배유', 21518, 1, 39, 1),
+('排律', '배율', 21519, 1, 39, 1),
+('善良', '선량', 21520, 1, 39, 1),
+('修鍊', '수련', 21521, 1, 39, 1),
+('失效', '실효', 21522, 1, 39, 1),
+('眼濕', '안습', 21523, 1, 39, 1),
+('略歷', '약력', 21524, 1, 39, 1),
+('列氏', '열씨', 21525, 1, 39, 1),
+('例句', '예구', 21526, 1, 39, 1),
+('龍眼', '용안', 21527, 1, 39, 1),
+('殘像', '잔상', 21528, 1, 39, 1),
+('丈夫', '장부', 21529, 1, 39, 1),
+('轉訛', '전와', 21530, 1, 39, 1),
+('糶賣', '조매', 21531, 1, 39, 1),
+('早朝', '조조', 21532, 1, 39, 1),
+('駐在', '주재', 21533, 1, 39, 1),
+('眞珠', '진주', 21534, 1, 39, 1),
+('借狀', '차장', 21535, 1, 39, 1),
+('添加', '첨가', 21536, 1, 39, 1),
+('淸潔', '청결', 21537, 1, 39, 1),
+('請願', '청원', 21538, 1, 39, 1),
+('炭田', '탄전', 21539, 1, 39, 1),
+('香港', '향항', 21540, 1, 39, 1),
+('畫餠', '화병', 21541, 1, 39, 1),
+('黑鉛', '흑연', 21542, 1, 39, 1),
+('吸煙', '흡연', 21543, 1, 39, 1),
+('솜砂糖', '솜사탕', 21544, 1, 39, 1),
+('守錢奴', '수전노', 21545, 1, 39, 1),
+('關', '관', 21546, 1, 38, 1),
+('東', '동', 21547, 1, 38, 1),
+('柑果', '감과', 21548, 1, 38, 1),
+('甲申', '갑신', 21549, 1, 38, 1),
+('剛直', '강직', 21550, 1, 38, 1),
+('擊刺', '격자', 21551, 1, 38, 1),
+('鯨油', '경유', 21552, 1, 38, 1),
+('慶州', '경주', 21553, 1, 38, 1),
+('顧問', '고문', 21554, 1, 38, 1),
+('供養', '공양', 21555, 1, 38, 1),
+('過剩', '과잉', 21556, 1, 38, 1),
+('求積', '구적', 21557, 1, 38, 1),
+('企圖', '기도', 21558, 1, 38, 1),
+('落胎', '낙태', 21559, 1, 38, 1),
+('老爺', '노야', 21560, 1, 38, 1),
+('老獪', '노회', 21561, 1, 38, 1),
+('老朽', '노후', 21562, 1, 38, 1),
+('腦髓', '뇌수', 21563, 1, 38, 1),
+('冬宮', '동궁', 21564, 1, 38, 1),
+('桐油', '동유', 21565, 1, 38, 1),
+('聯絡', '련락', 21566, 1, 38, 1),
+('司試', '사시', 21567, 1, 38, 1),
+('選拔', '선발', 21568, 1, 38, 1),
+('松林', '송림', 21569, 1, 38, 1),
+('昇級', '승급', 21570, 1, 38, 1),
+('辛未', '신미', 21571, 1, 38, 1),
+('約款', '약관', 21572, 1, 38, 1),
+('良貨', '양화', 21573, 1, 38, 1),
+('煉乳', '연유', 21574, 1, 38, 1),
+('葉芽', '엽아', 21575, 1, 38, 1),
+('完走', '완주', 21576, 1, 38, 1),
+('雨衣', '우의', 21577, 1, 38, 1),
+('漿果', '장과', 21578, 1, 38, 1),
+('適齡', '적령', 21579, 1, 38, 1),
+('絕望', '절망', 21580, 1, 38, 1),
+('店鋪', '점포', 21581, 1, 38, 1),
+('製靴', '제화', 21582, 1, 38, 1),
+('朝飯', '조반', 21583, 1, 38, 1),
+('酒酊', '주정', 21584, 1, 38, 1),
+('支那', '지나', 21585, 1, 38, 1),
+('聽覺', '청각', 21586, 1, 38, 1),
+('淸津', '청진', 21587, 1, 38, 1),
+('椒目', '초목', 21588, 1, 38, 1),
+('燭臺', '촉대', 21589, 1, 38, 1),
+('推算', '추산', 21590, 1, 38, 1),
+('追認', '추인', 21591, 1, 38, 1),
+('築城', '축성', 21592, 1, 38, 1),
+('春川', '춘천', 21593, 1, 38, 1),
+('託送', '탁송', 21594, 1, 38, 1),
+('砲塔', '포탑', 21595, 1, 38, 1),
+('黃銅', '황동', 21596, 1, 38, 1),
+('龍涎香', '용연향', 21597, 1, 38, 1),
+('肉고기', '육고기', 21598, 1, 38, 1),
+('層階站', '층계참', 21599, 1, 38, 1),
+('玄武巖', '현무암', 21600, 1, 38, 1),
+('敬而遠之', '경이원지', 21601, 1, 38, 1),
+('아무르江', '아무르강', 21602, 1, 38, 1),
+('兒童  포르', '아동 포르노', 21603, 1, 38, 1),
+('過', '과', 21604, 1, 37, 1),
+('變', '변', 21605, 1, 37, 1),
+('要', '요', 21606, 1, 37, 1),
+('二', '이', 21607, 1, 37, 1),
+('漢', '한', 21608, 1, 37, 1),
+('薑板', '강판', 21609, 1, 37, 1),
+('更改', '갱개', 21610, 1, 37, 1),
+('考察', '고찰', 21611, 1, 37, 1),
+('教皇', '교황', 21612, 1, 37, 1),
+('獨占', '독점', 21613, 1, 37, 1),
+('萬億', '만억', 21614, 1, 37, 1),
+('蒙首', '몽수', 21615, 1, 37, 1),
+('排尿', '배뇨', 21616, 1, 37, 1),
+('排他', '배타', 21617, 1, 37, 1),
+('蕃族', '번족', 21618, 1, 37, 1),
+('縫製', '봉제', 21619, 1, 37, 1),
+('浮標', '부표', 21620, 1, 37, 1),
+('佛教', '불교', 21621, 1, 37, 1),
+('腓骨', '비골', 21622, 1, 37, 1),
+('瘦果', '수과', 21623, 1, 37, 1),
+('晨星', '신성', 21624, 1, 37, 1),
+('夜景', '야경', 21625, 1, 37, 1),
+('洋鞋', '양혜', 21626, 1, 37, 1),
+('餘興', '여흥', 21627, 1, 37, 1),
+('穎果', '영과', 21628, 1, 37, 1),
+('靈驗', '영험', 21629, 1, 37, 1),
+('誤診', '오진', 21630, 1, 37, 1),
+('牛肉', '우육', 21631, 1, 37, 1),
+('肉腫', '육종', 21632, 1, 37, 1),
+('乙未', '을미', 21633, 1, 37, 1),
+('陰鬱', '음울', 21634, 1, 37, 1),
+('掌甲', '장갑', 21635, 1, 37, 1),
+('宗教', '종교', 21636, 1, 37, 1),
+('職딩', '직딩', 21637, 1, 37, 1),
+('執筆', '집필', 21638, 1, 37, 1),
+('唱劇', '창극', 21639, 1, 37, 1),
+('千秋', '천추', 21640, 1, 37, 1),
+('靑丘', '청구', 21641, 1, 37, 1),
+('投擲', '투척', 21642, 1, 37, 1),
+('護憲', '호헌', 21643, 1, 37, 1),
+('畫屛', '화병', 21644, 1, 37, 1),
+('近似値', '근사치', 21645, 1, 37, 1),
+('蒲希米亞', '포희미아', 21646, 1, 37, 1),
+('骨', '골', 21647, 1, 36, 1),
+('加耶', '가야', 21648, 1, 36, 1),
+('坑夫', '갱부', 21649, 1, 36, 1),
+('脛骨', '경골', 21650, 1, 36, 1),
+('癸未', '계미', 21651, 1, 36, 1),
+('果 ', '과편', 21652, 1, 36, 1),
+('購讀', '구독', 21653, 1, 36, 1),
+('急騰', '급등', 21654, 1, 36, 1),
+('旣婚', '기혼', 21655, 1, 36, 1),
+('雷雨', '뇌우', 21656, 1, 36, 1),
+('短劍', '단검', 21657, 1, 36, 1),
+('德川', '덕천', 21658, 1, 36, 1),
+('等等', '등등', 21659, 1, 36, 1),
+('羅刹', '라찰', 21660, 1, 36, 1),
+('模寫', '모사', 21661, 1, 36, 1),
+('伯父', '백부', 21662, 1, 36, 1),
+('否決', '부결', 21663, 1, 36, 1),
+('散逸', '산일', 21664, 1, 36, 1),
+('鋤骨', '서골', 21665, 1, 36, 1),
+('庶務', '서무', 21666, 1, 36, 1),
+('宣布', '선포', 21667, 1, 36, 1),
+('疎開', '소개', 21668, 1, 36, 1),
+('衰微', '쇠미', 21669, 1, 36, 1),
+('修繕', '수선', 21670, 1, 36, 1),
+('守則', '수칙', 21671, 1, 36, 1),
+('勝因', '승인', 21672, 1, 36, 1),
+('弱拍', '약박', 21673, 1, 36, 1),
+('洋洋', '양양', 21674, 1, 36, 1),
+('洋파', '양파', 21675, 1, 36, 1),
+('輿望', '여망', 21676, 1, 36, 1),
+('歷史', '역사', 21677, 1, 36, 1),
+('連覇', '연패', 21678, 1, 36, 1),
+('胃弱', '위약', 21679, 1, 36, 1),
+('遊步', '유보', 21680, 1, 36, 1),
+('隱避', '은피', 21681, 1, 36, 1),
+('際限', '제한', 21682, 1, 36, 1),
+('早退', '조퇴', 21683, 1, 36, 1),
+('坐像', '좌상', 21684, 1, 36, 1),
+('志願', '지원', 21685, 1, 36, 1),
+('妥當', '타당', 21686, 1, 36, 1),
+('太傅', '태부', 21687, 1, 36, 1),
+('破棄', '파기', 21688, 1, 36, 1),
+('팜油', '팜유', 21689, 1, 36, 1),
+('航程', '항정', 21690, 1, 36, 1),
+('紅玉', '홍옥', 21691, 1, 36, 1),
+('歡送', '환송', 21692, 1, 36, 1),
+('訓育', '훈육', 21693, 1, 36, 1),
+('稀微', '희미', 21694, 1, 36, 1),
+('壁暖爐', '벽난로', 21695, 1, 36, 1),
+('臺', '대', 21696, 1, 35, 1),
+('假拂', '가불', 21697, 1, 35, 1),
+('減稅', '감세', 21698, 1, 35, 1),
+('監置', '감치', 21699, 1, 35, 1),
+('江가', '강가', 21700, 1, 35, 1),
+('儉約', '검약', 21701, 1, 35, 1),
+('警鐘', '경종', 21702, 1, 35, 1),
+('硬貨', '경화', 21703, 1, 35, 1),
+('固守', '고수', 21704, 1, 35, 1),
+('根毛', '근모', 21705, 1, 35, 1),
+('農奴', '농노', 21706, 1, 35, 1),
+('綿布', '면포', 21707, 1, 35, 1),
+('斑指', '반지', 21708, 1, 35, 1),
+('訪客', '방객', 21709, 1, 35, 1),
+('輻射', '복사', 21710, 1, 35, 1),
+('復唱', '복창', 21711, 1, 35, 1),
+('附票', '부표', 21712, 1, 35, 1),
+('秘番', '비번', 21713, 1, 35, 1),
+('細孔', '세공', 21714, 1, 35, 1),
+('續編', '속편', 21715, 1, 35, 1),
+('頌歌', '송가', 21716, 1, 35, 1),
+('熟達', '숙달', 21717, 1, 35, 1),
+('叔父', '숙부', 21718, 1, 35, 1),
+('失戀', '실연', 21719, 1, 35, 1),
+('養蠶', '양잠', 21720, 1, 35, 1),
+('嚴守', '엄수', 21721, 1, 35, 1),
+('營倉', '영창', 21722, 1, 35, 1),
+('以降', '이강', 21723, 1, 35, 1),
+('適宜', '적의', 21724, 1, 35, 1),
+('終止', '종지', 21725, 1, 35, 1),
+('籌板', '주판', 21726, 1, 35, 1),
+('眞臘', '진랍', 21727, 1, 35, 1),
+('休眠', '휴면', 21728, 1, 35, 1),
+('甘藷湯', '감자탕', 21729, 1, 35, 1),
+('俄羅斯', '아라사', 21730, 1, 35, 1),
+('臭豆腐', '취두부', 21731, 1, 35, 1),
+('葉', '엽', 21732, 1, 34, 1),
+('五', '오', 21733, 1, 34, 1),
+('迦羅', '가라', 21734, 1, 34, 1),
+('監牧', '감목', 21735, 1, 34, 1),
+('甲辰', '갑진', 21736, 1, 34, 1),
+('乾田', '건전', 21737, 1, 34, 1),
+('京城', '경성', 21738, 1, 34, 1),
+('謳歌', '구가', 21739, 1, 34, 1),
+('起伏', '기복', 21740, 1, 34, 1),
+('吉林', '길림', 21741, 1, 34, 1),
+('羅甸', '나전', 21742, 1, 34, 1),
+('腦幹', '뇌간', 21743, 1, 34, 1),
+('短刀', '단도', 21744, 1, 34, 1),
+('端川', '단천', 21745, 1, 34, 1),
+('當籤', '당첨', 21746, 1, 34, 1),
+('冷麵', '랭면', 21747, 1, 34, 1),
+('旅券', '려권', 21748, 1, 34, 1),
+('聯盟', '련맹', 21749, 1, 34, 1),
+('輓歌', '만가', 21750, 1, 34, 1),
+('微塵', '미진', 21751, 1, 34, 1),
+('微賤', '미천', 21752, 1, 34, 1),
+('密輸', '밀수', 21753, 1, 34, 1),
+('福券', '복권', 21754, 1, 34, 1),
+('賞與', '상여', 21755, 1, 34, 1),
+('選舉', '선거', 21756, 1, 34, 1),
+('洗髮', '세발', 21757, 1, 34, 1),
+('衰退', '쇠퇴', 21758, 1, 34, 1),
+('熟考', '숙고', 21759, 1, 34, 1),
+('尋常', '심상', 21760, 1, 34, 1),
+('艶歌', '염가', 21761, 1, 34, 1),
+('鹽基', '염기', 21762, 1, 34, 1),
+('僞裝', '위장', 21763, 1, 34, 1),
+('危害', '위해', 21764, 1, 34, 1),
+('綽約', '작약', 21765, 1, 34, 1),
+('眺望', '조망', 21766, 1, 34, 1),
+('組版', '조판', 21767, 1, 34, 1),
+('足跡', '족적', 21768, 1, 34, 1),
+('存續', '존속', 21769, 1, 34, 1),
+('準州', '준주', 21770, 1, 34, 1),
+('持續', '지속', 21771, 1, 34, 1),
+('直轄', '직할', 21772, 1, 34, 1),
+('鎭守', '진수', 21773, 1, 34, 1),
+('採炭', '채탄', 21774, 1, 34, 1),
+('銃床', '총상', 21775, 1, 34, 1),
+('沈着', '침착', 21776, 1, 34, 1),
+('打倒', '타도', 21777, 1, 34, 1),
+('他律', '타율', 21778, 1, 34, 1),
+('耽羅', '탐라', 21779, 1, 34, 1),
+('苞葉', '포엽', 21780, 1, 34, 1),
+('暴泄', '폭설', 21781, 1, 34, 1),
+('河床', '하상', 21782, 1, 34, 1),
+('獻策', '헌책', 21783, 1, 34, 1),
+('歇價', '헐가', 21784, 1, 34, 1),
+('胸像', '흉상', 21785, 1, 34, 1),
+('密陀僧', '밀타승', 21786, 1, 34, 1),
+('詠春拳', '영춘권', 21787, 1, 34, 1),
+('父', '부', 21788, 1, 33, 1),
+('史', '사', 21789, 1, 33, 1),
+('最', '최', 21790, 1, 33, 1),
+('江蘇', '강소', 21791, 1, 33, 1),
+('改鑄', '개주', 21792, 1, 33, 1),
+('怯弱', '겁약', 21793, 1, 33, 1),
+('慣例', '관례', 21794, 1, 33, 1),
+('基督', '기독', 21795, 1, 33, 1),
+('洛陽', '낙양', 21796, 1, 33, 1),
+('冷笑', '냉소', 21797, 1, 33, 1),
+('短絡', '단락', 21798, 1, 33, 1),
+('桃園', '도원', 21799, 1, 33, 1),
+('吏讀', '리두', 21800, 1, 33, 1),
+('滿潮', '만조', 21801, 1, 33, 1),
+('目睹', '목도', 21802, 1, 33, 1),
+('叛旗', '반기', 21803, 1, 33, 1),
+('布施', '보시', 21804, 1, 33, 1),
+('氷漁', '빙어', 21805, 1, 33, 1),
+('城廓', '성곽', 21806, 1, 33, 1),
+('洗米', '세미', 21807, 1, 33, 1),
+('失陷', '실함', 21808, 1, 33, 1),
+('陽傘', '양산', 21809, 1, 33, 1),
+('遠足', '원족', 21810, 1, 33, 1),
+('遊覽', '유람', 21811, 1, 33, 1),
+('恩典', '은전', 21812, 1, 33, 1),
+('吏讀', '이두', 21813, 1, 33, 1),
+('李朝', '이조', 21814, 1, 33, 1),
+('逸走', '일주', 21815, 1, 33, 1),
+('磁針', '자침', 21816, 1, 33, 1),
+('朝夕', '조석', 21817, 1, 33, 1),
+('粗製', '조제', 21818, 1, 33, 1),
+('持參', '지참', 21819, 1, 33, 1),
+('錯誤', '착오', 21820, 1, 33, 1),
+('靑蛙', '청와', 21821, 1, 33, 1),
+('脫稅', '탈세', 21822, 1, 33, 1),
+('爆雷', '폭뢰', 21823, 1, 33, 1),
+('賀客', '하객', 21824, 1, 33, 1),
+('黃雀', '황작', 21825, 1, 33, 1),
+('黑鷺', '흑로', 21826, 1, 33, 1),
+('豆瓣醬', '두반장', 21827, 1, 33, 1),
+('阿斯達', '아사달', 21828, 1, 33, 1),
+('週刊誌', '주간지', 21829, 1, 33, 1),
+('紅唐무', '홍당무', 21830, 1, 33, 1),
+('집幽靈거미', '집유령거미', 21831, 1, 33, 1),
+('速', '속', 21832, 1, 32, 1),
+('龜城', '구성', 21833, 1, 32, 1),
+('圖們', '도문', 21834, 1, 32, 1),
+('武勇', '무용', 21835, 1, 32, 1),
+('百姓', '백성', 21836, 1, 32, 1),
+('福建', '복건', 21837, 1, 32, 1),
+('附與', '부여', 21838, 1, 32, 1),
+('粉紅', '분홍', 21839, 1, 32, 1),
+('秘境', '비경', 21840, 1, 32, 1),
+('砂岩', '사암', 21841, 1, 32, 1),
+('笑劇', '소극', 21842, 1, 32, 1),
+('液晶', '액정', 21843, 1, 32, 1),
+('怨念', '원념', 21844, 1, 32, 1),
+('遺棄', '유기', 21845, 1, 32, 1),
+('幼少', '유소', 21846, 1, 32, 1),
+('肉棒', '육봉', 21847, 1, 32, 1),
+('終始', '종시', 21848, 1, 32, 1),
+('宗漁', '종어', 21849, 1, 32, 1),
+('聽講', '청강', 21850, 1, 32, 1),
+('追從', '추종', 21851, 1, 32, 1),
+('遍在', '편재', 21852, 1, 32, 1),
+('皮蛋', '피단', 21853, 1, 32, 1),
+('避雷', '피뢰', 21854, 1, 32, 1),
+('被膜', '피막', 21855, 1, 32, 1),
+('香匠', '향장', 21856, 1, 32, 1),
+('冠수리', '관수리', 21857, 1, 32, 1),
+('九尾狐', '구미호', 21858, 1, 32, 1),
+('伏魔殿', '복마전', 21859, 1, 32, 1),
+('似而非', '사이비', 21860, 1, 32, 1),
+('贈收賄', '증수회', 21861, 1, 32, 1),
+('葡萄牙', '포도아', 21862, 1, 32, 1),
+('玄鶴琴', '현학금', 21863, 1, 32, 1),
+('단고기湯', '단고기탕', 21864, 1, 32, 1),
+('客', '객', 21865, 1, 31, 1),
+('可憐', '가련', 21866, 1, 31, 1),
+('甲寅', '갑인', 21867, 1, 31, 1),
+('改訂', '개정', 21868, 1, 31, 1),
+('課程', '과정', 21869, 1, 31, 1),
+('棄兒', '기아', 21870, 1, 31, 1),
+('裸眼', '나안', 21871, 1, 31, 1),
+('綠末', '녹말', 21872, 1, 31, 1),
+('滿了', '만료', 21873, 1, 31, 1),
+('抹消', '말소', 21874, 1, 31, 1),
+('買春', '매춘', 21875, 1, 31, 1),
+('聞慶', '문경', 21876, 1, 31, 1),
+('悲傷', '비상', 21877, 1, 31, 1),
+('沙漏', '사루', 21878, 1, 31, 1),
+('賞金', '상금', 21879, 1, 31, 1),
+('索引', '색인', 21880, 1, 31, 1),
+('受諾', '수락', 21881, 1, 31, 1),
+('順川', '순천', 21882, 1, 31, 1),
+('亞鉛', '아연', 21883, 1, 31, 1),
+('夜叉', '야채', 21884, 1, 31, 1),
+('鉛糖', '연당', 21885, 1, 31, 1),
+('鹽貨', '염화', 21886, 1, 31, 1),
+('榮華', '영화', 21887, 1, 31, 1),
+('溫堗', '온돌', 21888, 1, 31, 1),
+('元帳', '원장', 21889, 1, 31, 1),
+('胃炎', '위염', 21890, 1, 31, 1),
+('硫黃', '유황', 21891, 1, 31, 1),
+('逸脫', '일탈', 21892, 1, 31, 1),
+('裝訂', '장정', 21893, 1, 31, 1),
+('粘着', '점착', 21894, 1, 31, 1),
+('停留', '정류', 21895, 1, 31, 1),
+('提唱', '제창', 21896, 1, 31, 1),
+('坐席', '좌석', 21897, 1, 31, 1),
+('陣容', '진용', 21898, 1, 31, 1),
+('諦念', '체념', 21899, 1, 31, 1),
+('抽象', '추상', 21900, 1, 31, 1),
+('祝典', '축전', 21901, 1, 31, 1),
+('炭坑', '탄갱', 21902, 1, 31, 1),
+('探査', '탐사', 21903, 1, 31, 1),
+('吐露', '토로', 21904, 1, 31, 1),
+('鋪裝', '포장', 21905, 1, 31, 1),
+('抗癌', '항암', 21906, 1, 31, 1),
+('華府', '화부', 21907, 1, 31, 1),
+('枸杞茶', '구기차', 21908, 1, 31, 1),
+('麥芽糖', '맥아당', 21909, 1, 31, 1),
+('壁爛爐', '벽난로', 21910, 1, 31, 1),
+('普洱茶', '보이차', 21911, 1, 31, 1),
+('右拇印', '우무인', 21912, 1, 31, 1),
+('虎杖根', '호장근', 21913, 1, 31, 1),
+('左之右之', '좌지우지', 21914, 1, 31, 1),
+('江', '갱', 21915, 1, 30, 1),
+('陰', '음', 21916, 1, 30, 1),
+('架設', '가설', 21917, 1, 30, 1),
+('甲戌', '갑술', 21918, 1, 30, 1),
+('槪略', '개략', 21919, 1, 30, 1),
+('乾季', '건계', 21920, 1, 30, 1),
+('犬齒', '견치', 21921, 1, 30, 1),
+('桂皮', '계피', 21922, 1, 30, 1),
+('歸順', '귀순', 21923, 1, 30, 1),
+('綠豆', '녹두', 21924, 1, 30, 1),
+('逃去', '도거', 21925, 1, 30, 1),
+('徒弟', '도제', 21926, 1, 30, 1),
+('輪姦', '륜간', 21927, 1, 30, 1),
+('麻將', '마장', 21928, 1, 30, 1),
+('茫然', '망연', 21929, 1, 30, 1),
+('巫俗', '무속', 21930, 1, 30, 1),
+('潑皮', '발피', 21931, 1, 30, 1),
+('凡例', '범례', 21932, 1, 30, 1),
+('砂漏', '사루', 21933, 1, 30, 1),
+('城郭', '성곽', 21934, 1, 30, 1),
+('消耗', '소모', 21935, 1, 30, 1),
+('殉難', '순난', 21936, 1, 30, 1),
+('深秋', '심추', 21937, 1, 30, 1),
+('亞麻', '아마', 21938, 1, 30, 1),
+('兩脚', '양각', 21939, 1, 30, 1),
+('煙幕', '연막', 21940, 1, 30, 1),
+('完快', '완쾌', 21941, 1, 30, 1),
+('熔着', '용착', 21942, 1, 30, 1),
+('優遇', '우우', 21943, 1, 30, 1),
+('胃液', '위액', 21944, 1, 30, 1),
+('輪姦', '윤간', 21945, 1, 30, 1),
+('浙江', '절강', 21946, 1, 30, 1),
+('弔旗', '조기', 21947, 1, 30, 1),
+('罪囚', '죄수', 21948, 1, 30, 1),
+('週刊', '주간', 21949, 1, 30, 1),
+('置換', '치환', 21950, 1, 30, 1),
+('打撲', '타박', 21951, 1, 30, 1),
+('廢止', '페지', 21952, 1, 30, 1),
+('懸念', '현념', 21953, 1, 30, 1),
+('紅潮', '홍조', 21954, 1, 30, 1),
+('副鼻腔', '부비강', 21955, 1, 30, 1),
+('豪奢비오리', '호사비오리', 21956, 1, 30, 1),
+('六', '륙', 21957, 1, 29, 1),
+('黃', '황', 21958, 1, 29, 1),
+('揭示', '게시', 21959, 1, 29, 1),
+('蠱毒', '고독', 21960, 1, 29, 1),
+('孔教', '공교', 21961, 1, 29, 1),
+('具申', '구신', 21962, 1, 29, 1),
+('驅除', '구제', 21963, 1, 29, 1),
+('宮廷', '궁정', 21964, 1, 29, 1),
+('眷黨', '권당', 21965, 1, 29, 1),
+('根底', '근저', 21966, 1, 29, 1),
+('今歲', '금세', 21967, 1, 29, 1),
+('禁輸', '금수', 21968, 1, 29, 1),
+('雷鳥', '뇌조', 21969, 1, 29, 1),
+('踏破', '답파', 21970, 1, 29, 1),
+('抹茶', '말차', 21971, 1, 29, 1),
+('微恙', '미양', 21972, 1, 29, 1),
+('叛逆', '반역', 21973, 1, 29, 1),
+('暗喩', '암유', 21974, 1, 29, 1),
+('壓卷', '압권', 21975, 1, 29, 1),
+('羊膜', '양막', 21976, 1, 29, 1),
+('逆臣', '역신', 21977, 1, 29, 1),
+('染髮', '염발', 21978, 1, 29, 1),
+('圓卓', '원탁', 21979, 1, 29, 1),
+('儒教', '유교', 21980, 1, 29, 1),
+('隱居', '은거', 21981, 1, 29, 1),
+('泥炭', '이탄', 21982, 1, 29, 1),
+('刺胞', '자포', 21983, 1, 29, 1),
+('諸島', '제도', 21984, 1, 29, 1),
+('照査', '조사', 21985, 1, 29, 1),
+('罪累', '죄루', 21986, 1, 29, 1),
+('鎭痛', '진통', 21987, 1, 29, 1),
+('參拜', '참배', 21988, 1, 29, 1),
+('採鑛', '채광', 21989, 1, 29, 1),
+('聽診', '청진', 21990, 1, 29, 1),
+('奪取', '탈취', 21991, 1, 29, 1),
+('透寫', '투사', 21992, 1, 29, 1),
+('被虐', '피학', 21993, 1, 29, 1),
+('骸炭', '해탄', 21994, 1, 29, 1),
+('華氏', '화씨', 21995, 1, 29, 1),
+('英雄譚', '영웅담', 21996, 1, 29, 1),
+('獨', '독', 21997, 1, 28, 1),
+('概念', '개념', 21998, 1, 28, 1),
+('劍舞', '검무', 21999, 1, 28, 1),
+('檢閱', '검열', 22000, 1, 28, 1),
+('桂林', '계림', 22001, 1, 28, 1),
+('茶碗', '다완', 22002, 1, 28, 1),
+('短靴', '단화', 22003, 1, 28, 1),
+('撞着', '당착', 22004, 1, 28, 1),
+('洞里', '동리', 22005, 1, 28, 1),
+('脈絡', '맥락', 22006, 1, 28, 1),
+('牧童', '목동', 22007, 1, 28, 1),
+('剖檢', '부검', 22008, 1, 28, 1),
+('浮氷', '부빙', 22009, 1, 28, 1),
+('粉末', '분말', 22010, 1, 28, 1),
+('非凡', '비범', 22011, 1, 28, 1),
+('仙境', '선경', 22012, 1, 28, 1),
+('鮮卑', '선비', 22013, 1, 28, 1),
+('稅金', '세금', 22014, 1, 28, 1),
+('收拾', '수습', 22015, 1, 28, 1),
+('眼窩', '안와', 22016, 1, 28, 1),
+('岩床', '암상', 22017, 1, 28, 1),
+('哀痛', '애통', 22018, 1, 28, 1),
+('圓柱', '원주', 22019, 1, 28, 1),
+('謬算', '유산', 22020, 1, 28, 1),
+('遺贈', '유증', 22021, 1, 28, 1),
+('誘致', '유치', 22022, 1, 28, 1),
+('吟味', '음미', 22023, 1, 28, 1),
+('至福', '지복', 22024, 1, 28, 1),
+('志向', '지향', 22025, 1, 28, 1),
+('採取', '채취', 22026, 1, 28, 1),
+('痔核', '치핵', 22027, 1, 28, 1),
+('脫漏', '탈루', 22028, 1, 28, 1),
+('布巾', '포건', 22029, 1, 28, 1),
+('避妊', '피임', 22030, 1, 28, 1),
+('虛構', '허구', 22031, 1, 28, 1),
+('華夏', '화하', 22032, 1, 28, 1),
+('幻燈', '환등', 22033, 1, 28, 1),
+('銅錢株', '동전주', 22034, 1, 28, 1),
+('沐浴桶', '목욕통', 22035, 1, 28, 1),
+('膀胱炎', '방광염', 22036, 1, 28, 1),
+('算', '산', 22037, 1, 27, 1),
+('失', '실', 22038, 1, 27, 1),
+('茶', '차', 22039, 1, 27, 1),
+('甲옷', '갑옷', 22040, 1, 27, 1),
+('改嫁', '개가', 22041, 1, 27, 1),
+('課稅', '과세', 22042, 1, 27, 1),
+('寬容', '관용', 22043, 1, 27, 1),
+('窮境', '궁경', 22044, 1, 27, 1),
+('宮闕', '궁궐', 22045, 1, 27, 1),
+('累積', '누적', 22046, 1, 27, 1),
+('杜詩', '두시', 22047, 1, 27, 1),
+('滿浦', '만포', 22048, 1, 27, 1),
+('謎題', '미제', 22049, 1, 27, 1),
+('煩雜', '번잡', 22050, 1, 27, 1),
+('副署', '부서', 22051, 1, 27, 1),
+('衰減', '쇠감', 22052, 1, 27, 1),
+('施賞', '시상', 22053, 1, 27, 1),
+('逆賊', '역적', 22054, 1, 27, 1),
+('譯註', '역주', 22055, 1, 27, 1),
+('延邊', '연변', 22056, 1, 27, 1),
+('靈廟', '영묘', 22057, 1, 27, 1),
+('英才', '영재', 22058, 1, 27, 1),
+('永存', '영존', 22059, 1, 27, 1),
+('渦狀', '와상', 22060, 1, 27, 1),
+('邀擊', '요격', 22061, 1, 27, 1),
+('雨雹', '우박', 22062, 1, 27, 1),
+('雨滴', '우적', 22063, 1, 27, 1),
+('遊泳', '유영', 22064, 1, 27, 1),
+('癒着', '유착', 22065, 1, 27, 1),
+('隱逸', '은일', 22066, 1, 27, 1),
+('裝幀', '장정', 22067, 1, 27, 1),
+('赤潮', '적조', 22068, 1, 27, 1),
+('晝夜', '주야', 22069, 1, 27, 1),
+('觸覺', '촉각', 22070, 1, 27, 1),
+('追及', '추급', 22071, 1, 27, 1),
+('編鐘', '편종', 22072, 1, 27, 1),
+('閉止', '폐지', 22073, 1, 27, 1),
+('玄琴', '현금', 22074, 1, 27, 1),
+('따옴標', '따옴표', 22075, 1, 27, 1),
+('比丘尼', '비구니', 22076, 1, 27, 1),
+('龍舌蘭', '용설란', 22077, 1, 27, 1),
+('橫膈膜', '횡격막', 22078, 1, 27, 1),
+('雙峰駱駝', '쌍봉낙타', 22079, 1, 27, 1),
+('百', '백', 22080, 1, 26, 1),
+('例', '예', 22081, 1, 26, 1),
+('警醒', '경성', 22082, 1, 26, 1),
+('輕卒', '경졸', 22083, 1, 26, 1),
+('京華', '경화', 22084, 1, 26, 1),
+('叩首', '고수', 22085, 1, 26, 1),
+('碁盤', '기반', 22086, 1, 26, 1),
+('都是', '도시', 22087, 1, 26, 1),
+('謄寫', '등사', 22088, 1, 26, 1),
+('埋設', '매설', 22089, 1, 26, 1),
+('煤炭', '매탄', 22090, 1, 26, 1),
+('模襲', '모습', 22091, 1, 26, 1),
+('寶庫', '보고', 22092, 1, 26, 1),
+('氷晶', '빙정', 22093, 1, 26, 1),
+('思索', '사색', 22094, 1, 26, 1),
+('逝去', '서거', 22095, 1, 26, 1),
+('瑞典', '서전', 22096, 1, 26, 1),
+('單于', '선우', 22097, 1, 26, 1),
+('松耳', '송이', 22098, 1, 26, 1),
+('囚徒', '수도', 22099, 1, 26, 1),
+('鞍裝', '안장', 22100, 1, 26, 1),
+('惹起', '야기', 22101, 1, 26, 1),
+('抑止', '억지', 22102, 1, 26, 1),
+('演戲', '연희', 22103, 1, 26, 1),
+('靈柩', '영구', 22104, 1, 26, 1),
+('誤嚥', '오연', 22105, 1, 26, 1),
+('擾亂', '요란', 22106, 1, 26, 1),
+('慾求', '욕구', 22107, 1, 26, 1),
+('溶液', '용액', 22108, 1, 26, 1),
+('印尼', '인니', 22109, 1, 26, 1),
+('慈善', '자선', 22110, 1, 26, 1),
+('錚盤', '쟁반', 22111, 1, 26, 1),
+('臍炎', '제염', 22112, 1, 26, 1),
+('駐留', '주류', 22113, 1, 26, 1),
+('診療', '진료', 22114, 1, 26, 1),
+('追隨', '추수', 22115, 1, 26, 1),
+('就任', '취임', 22116, 1, 26, 1),
+('偏向', '편향', 22117, 1, 26, 1),
+('艦橋', '함교', 22118, 1, 26, 1),
+('滑走', '활주', 22119, 1, 26, 1),
+('劃策', '획책', 22120, 1, 26, 1),
+('鷄卵찜', '계란찜', 22121, 1, 26, 1),
+('虎狼이', '호랑이', 22122, 1, 26, 1),
+('乾酪', '간락', 22123, 1, 25, 1),
+('乾酪', '건락', 22124, 1, 25, 1),
+('嬌態', '교태', 22125, 1, 25, 1),
+('短簫', '단소', 22126, 1, 25, 1),
+('登壇', '등단', 22127, 1, 25, 1),
+('登頂', '등정', 22128, 1, 25, 1),
+('綿羊', '면양', 22129, 1, 25, 1),
+('妙味', '묘미', 22130, 1, 25, 1),
+('黙示', '묵시', 22131, 1, 25, 1),
+('附屬', '부속', 22132, 1, 25, 1),
+('秘藏', '비장', 22133, 1, 25, 1),
+('思慮', '사려', 22134, 1, 25, 1),
+('思潮', '사조', 22135, 1, 25, 1),
+('詐取', '사취', 22136, 1, 25, 1),
+('散炙', '산적', 22137, 1, 25, 1),
+('撒布', '살포', 22138, 1, 25, 1),
+('殉教', '순교', 22139, 1, 25, 1),
+('漁網', '어망', 22140, 1, 25, 1),
+('延吉', '연길', 22141, 1, 25, 1),
+('胃鏡', '위경', 22142, 1, 25, 1),
+('隣近', '인근', 22143, 1, 25, 1),
+('株券', '주권', 22144, 1, 25, 1),
+('周旋', '주선', 22145, 1, 25, 1),
+('銃筒', '총통', 22146, 1, 25, 1),
+('避姙', '피임', 22147, 1, 25, 1),
+('抗訴', '항소', 22148, 1, 25, 1),
+('獻納', '헌납', 22149, 1, 25, 1),
+('幻滅', '환멸', 22150, 1, 25, 1),
+('座右銘', '좌우명', 22151, 1, 25, 1),
+('招請狀', '초청장', 22152, 1, 25, 1),
+('冷', '냉', 22153, 1, 24, 1),
+('優', '우', 22154, 1, 24, 1),
+('州', '주', 22155, 1, 24, 1),
+('布', '포', 22156, 1, 24, 1),
+('勘案', '감안', 22157, 1, 24, 1),
+('剛毛', '강모', 22158, 1, 24, 1),
+('乾溜', '건류', 22159, 1, 24, 1),
+('廣域', '광역', 22160, 1, 24, 1),
+('拳固', '권고', 22161, 1, 24, 1),
+('卷煙', '궐련', 22162, 1, 24, 1),
+('根莖', '근경', 22163, 1, 24, 1),
+('祈願', '기원', 22164, 1, 24, 1),
+('卵殼', '난각', 22165, 1, 24, 1),
+('貸與', '대여', 22166, 1, 24, 1),
+('刀劍', '도검', 22167, 1, 24, 1),
+('輪廻', '륜회', 22168, 1, 24, 1),
+('幕舍', '막사', 22169, 1, 24, 1),
+('網膜', '망막', 22170, 1, 24, 1),
+('牧丹', '목단', 22171, 1, 24, 1),
+('排泄', '배설', 22172, 1, 24, 1),
+('附隨', '부수', 22173, 1, 24, 1),
+('匪徒', '비도', 22174, 1, 24, 1),
+('匕首', '비수', 22175, 1, 24, 1),
+('砂疥', '사개', 22176, 1, 24, 1),
+('散佚', '산일', 22177, 1, 24, 1),
+('散軼', '산일', 22178, 1, 24, 1),
+('霜降', '상강', 22179, 1, 24, 1),
+('首魁', '수괴', 22180, 1, 24, 1),
+('獸醫', '수의', 22181, 1, 24, 1),
+('餘弦', '여현', 22182, 1, 24, 1),
+('鹽田', '염전', 22183, 1, 24, 1),
+('韻律', '운율', 22184, 1, 24, 1),
+('胃痛', '위통', 22185, 1, 24, 1),
+('流砂', '유사', 22186, 1, 24, 1),
+('耳漏', '이루', 22187, 1, 24, 1),
+('提喩', '제유', 22188, 1, 24, 1),
+('住宅', '주택', 22189, 1, 24, 1),
+('曾祖', '증조', 22190, 1, 24, 1),
+('倉皇', '창황', 22191, 1, 24, 1),
+('遷都', '천도', 22192, 1, 24, 1),
+('秒針', '초침', 22193, 1, 24, 1),
+('追伸', '추신', 22194, 1, 24, 1),
+('築港', '축항', 22195, 1, 24, 1),
+('幀畵', '탱화', 22196, 1, 24, 1),
+('爬蟲', '파충', 22197, 1, 24, 1),
+('避暑', '피서', 22198, 1, 24, 1),
+('玄米', '현미', 22199, 1, 24, 1),
+('豪勢', '호세', 22200, 1, 24, 1),
+('孝順', '효순', 22201, 1, 24, 1),
+('胸壁', '흉벽', 22202, 1, 24, 1),
+('바람壁', '바람벽', 22203, 1, 24, 1),
+('赤裸裸', '적나라', 22204, 1, 24, 1),
+('講釋', '강석', 22205, 1, 23, 1),
+('鋼材', '강재', 22206, 1, 23, 1),
+('乾薑', '건강', 22207, 1, 23, 1),
+('昆蟲', '곤충', 22208, 1, 23, 1),
+('橋脚', '교각', 22209, 1, 23, 1),
+('金額', '금액', 22210, 1, 23, 1),
+('卵巢', '난소', 22211, 1, 23, 1),
+('島嶼', '도서', 22212, 1, 23, 1),
+('冬至', '동지', 22213, 1, 23, 1),
+('卵巢', '란소', 22214, 1, 23, 1),
+('弄談', '롱담', 22215, 1, 23, 1),
+('味蕾', '미뢰', 22216, 1, 23, 1),
+('密獵', '밀렵', 22217, 1, 23, 1),
+('幇助', '방조', 22218, 1, 23, 1),
+('赴任', '부임', 22219, 1, 23, 1),
+('糞蟲', '분충', 22220, 1, 23, 1),
+('沙漠', '사막', 22221, 1, 23, 1),
+('飼育', '사육', 22222, 1, 23, 1),
+('棲息', '서식', 22223, 1, 23, 1),
+('攝取', '섭취', 22224, 1, 23, 1),
+('試鍊', '시련', 22225, 1, 23, 1),
+('暗渠', '암거', 22226, 1, 23, 1),
+('暗誦', '암송', 22227, 1, 23, 1),
+('揚琴', '양금', 22228, 1, 23, 1),
+('鉛刀', '연도', 22229, 1, 23, 1),
+('遺憾', '유감', 22230, 1, 23, 1),
+('仁宗', '인종', 22231, 1, 23, 1),
+('仁川', '인천', 22232, 1, 23, 1),
+('樟樹', '장수', 22233, 1, 23, 1),
+('裁縫', '재봉', 22234, 1, 23, 1),
+('挫創', '좌창', 22235, 1, 23, 1),
+('鎭魂', '진혼', 22236, 1, 23, 1),
+('醉狂', '취광', 22237, 1, 23, 1),
+('搭乘', '탑승', 22238, 1, 23, 1),
+('派閥', '파벌', 22239, 1, 23, 1),
+('憲章', '헌장', 22240, 1, 23, 1),
+('蛔蟲', '회충', 22241, 1, 23, 1),
+('劃順', '획순', 22242, 1, 23, 1),
+('宇宙塵', '우주진', 22243, 1, 23, 1),
+('裁縫틀', '재봉틀', 22244, 1, 23, 1),
+('圓', '원', 22245, 1, 22, 1),
+('慶祝', '경축', 22246, 1, 22, 1),
+('季刊', '계간', 22247, 1, 22, 1),
+('灌腸', '관장', 22248, 1, 22, 1),
+('屈從', '굴종', 22249, 1, 22, 1),
+('歸依', '귀의', 22250, 1, 22, 1),
+('踏査', '답사', 22251, 1, 22, 1),
+('燈盞', '등잔', 22252, 1, 22, 1),
+('螺旋', '라선', 22253, 1, 22, 1),
+('兩班', '량반', 22254, 1, 22, 1),
+('幕府', '막부', 22255, 1, 22, 1),
+('叛臣', '반신', 22256, 1, 22, 1),
+('拔齒', '발치', 22257, 1, 22, 1),
+('祕密', '비밀', 22258, 1, 22, 1),
+('砂漠', '사막', 22259, 1, 22, 1),
+('沙鉢', '사발', 22260, 1, 22, 1),
+('賞牌', '상패', 22261, 1, 22, 1),
+('熟鍊', '숙련', 22262, 1, 22, 1),
+('崇慶', '숭경', 22263, 1, 22, 1),
+('兒孩', '아해', 22264, 1, 22, 1),
+('旅券', '여권', 22265, 1, 22, 1),
+('餘矢', '여시', 22266, 1, 22, 1),
+('延燒', '연소', 22267, 1, 22, 1),
+('擁壁', '옹벽', 22268, 1, 22, 1),
+('玩具', '완구', 22269, 1, 22, 1),
+('韻致', '운치', 22270, 1, 22, 1),
+('違背', '위배', 22271, 1, 22, 1),
+('刺蜜', '자밀', 22272, 1, 22, 1),
+('財寶', '재보', 22273, 1, 22, 1),
+('井宿', '정수', 22274, 1, 22, 1),
+('遵守', '준수', 22275, 1, 22, 1),
+('借邊', '차변', 22276, 1, 22, 1),
+('寢具', '침구', 22277, 1, 22, 1),
+('咸興', '함흥', 22278, 1, 22, 1),
+('胡琴', '호금', 22279, 1, 22, 1),
+('換喩', '환유', 22280, 1, 22, 1),
+('訓戒', '훈계', 22281, 1, 22, 1),
+('兇徒', '흉도', 22282, 1, 22, 1),
+('개醬국', '개장국', 22283, 1, 22, 1),
+('琉璃窓', '유리창', 22284, 1, 22, 1),
+('犧牲羊', '희생양', 22285, 1, 22, 1),
+('勝', '승', 22286, 1, 21, 1),
+('陸', '육', 22287, 1, 21, 1),
+('覺醒', '각성', 22288, 1, 21, 1),
+('脚註', '각주', 22289, 1, 21, 1),
+('干潮', '간조', 22290, 1, 21, 1),
+('鋼玉', '강옥', 22291, 1, 21, 1),
+('堅固', '견고', 22292, 1, 21, 1),
+('犬儒', '견유', 22293, 1, 21, 1),
+('戒嚴', '계엄', 22294, 1, 21, 1),
+('控除', '공제', 22295, 1, 21, 1),
+('歐洲', '구주', 22296, 1, 21, 1),
+('君臨', '군림', 22297, 1, 21, 1),
+('潰走', '궤주', 22298, 1, 21, 1),
+('檀君', '단군', 22299, 1, 21, 1),
+('答글', '답글', 22300, 1, 21, 1),
+('拉致', '랍치', 22301, 1, 21, 1),
+('忘我', '망아', 22302, 1, 21, 1),
+('背泳', '배영', 22303, 1, 21, 1),
+('排擠', '배제', 22304, 1, 21, 1),
+('罰金', '벌금', 22305, 1, 21, 1),
+('寶塔', '보탑', 22306, 1, 21, 1),
+('浮腫', '부종', 22307, 1, 21, 1),
+('侍衛', '시위', 22308, 1, 21, 1),
+('怏宿', '앙숙', 22309, 1, 21, 1),
+('餘燼', '여신', 22310, 1, 21, 1),
+('午飯', '오반', 22311, 1, 21, 1),
+('完遂', '완수', 22312, 1, 21, 1),
+('腰痛', '요통', 22313, 1, 21, 1),
+('隱喩', '은유', 22314, 1, 21, 1),
+('銀杏', '은행', 22315, 1, 21, 1),
+('耳垂', '이수', 22316, 1, 21, 1),
+('臨床', '임상', 22317, 1, 21, 1),
+('磁束', '자속', 22318, 1, 21, 1),
+('殘額', '잔액', 22319, 1, 21, 1),
+('將棋', '장기', 22320, 1, 21, 1),
+('贈與', '증여', 22321, 1, 21, 1),
+('脊索', '척삭', 22322, 1, 21, 1),
+('催眠', '최면', 22323, 1, 21, 1),
+('秋霖', '추림', 22324, 1, 21, 1),
+('測鉛', '측연', 22325, 1, 21, 1),
+('七夕', '칠석', 22326, 1, 21, 1),
+('歎息', '탄식', 22327, 1, 21, 1),
+('探索', '탐색', 22328, 1, 21, 1),
+('紅柹', '홍시', 22329, 1, 21, 1),
+('紅蛤', '홍합', 22330, 1, 21, 1),
+('멍멍湯', '멍멍탕', 22331, 1, 21, 1),
+('薛延陀', '설연타', 22332, 1, 21, 1),
+('卵', '란', 22333, 1, 20, 1),
+('輪', '륜', 22334, 1, 20, 1),
+('개醬', '개장', 22335, 1, 20, 1),
+('系譜', '계보', 22336, 1, 20, 1),
+('奇遇', '기우', 22337, 1, 20, 1),
+('己亥', '기해', 22338, 1, 20, 1),
+('磠砂', '노사', 22339, 1, 20, 1),
+('貸借', '대차', 22340, 1, 20, 1),
+('銅錢', '동전', 22341, 1, 20, 1),
+('燈籠', '등롱', 22342, 1, 20, 1),
+('免疫', '면역', 22343, 1, 20, 1),
+('紋章', '문장', 22344, 1, 20, 1),
+('叛賊', '반적', 22345, 1, 20, 1),
+('翻譯', '번역', 22346, 1, 20, 1),
+('碧玉', '벽옥', 22347, 1, 20, 1),
+('辨濟', '변제', 22348, 1, 20, 1),
+('佛陀', '불타', 22349, 1, 20, 1),
+('飛翔', '비상', 22350, 1, 20, 1),
+('貧富', '빈부', 22351, 1, 20, 1),
+('砂濱', '사빈', 22352, 1, 20, 1),
+('索麵', '삭면', 22353, 1, 20, 1),
+('賞杯', '상배', 22354, 1, 20, 1),
+('屋塔', '옥탑', 22355, 1, 20, 1),
+('愚臣', '우신', 22356, 1, 20, 1),
+('雲鑼', '운라', 22357, 1, 20, 1),
+('移替', '이체', 22358, 1, 20, 1),
+('移項', '이항', 22359, 1, 20, 1),
+('壬午', '임오', 22360, 1, 20, 1),
+('奠都', '전도', 22361, 1, 20, 1),
+('兆候', '조후', 22362, 1, 20, 1),
+('尊卑', '존비', 22363, 1, 20, 1),
+('准將', '준장', 22364, 1, 20, 1),
+('鷙鳥', '지조', 22365, 1, 20, 1),
+('窓가', '창가', 22366, 1, 20, 1),
+('脊髓', '척수', 22367, 1, 20, 1),
+('撤廢', '철폐', 22368, 1, 20, 1),
+('尖端', '첨단', 22369, 1, 20, 1),
+('追悼', '추도', 22370, 1, 20, 1),
+('侵攻', '침공', 22371, 1, 20, 1),
+('懸賞', '현상', 22372, 1, 20, 1),
+('還拂', '환불', 22373, 1, 20, 1),
+('個', '개', 22374, 1, 19, 1),
+('糖', '당', 22375, 1, 19, 1),
+('足', '족', 22376, 1, 19, 1),
+('庚午', '경오', 22377, 1, 19, 1),
+('己卯', '기묘', 22378, 1, 19, 1),
+('己巳', '기사', 22379, 1, 19, 1),
+('己酉', '기유', 22380, 1, 19, 1),
+('己丑', '기축', 22381, 1, 19, 1),
+('吉更', '길경', 22382, 1, 19, 1),
+('蔓延', '만연', 22383, 1, 19, 1),
+('忘恩', '망은', 22384, 1, 19, 1),
+('戊午', '무오', 22385, 1, 19, 1),
+('밥床', '밥상', 22386, 1, 19, 1),
+('繁盛', '번성', 22387, 1, 19, 1),
+('蕃息', '번식', 22388, 1, 19, 1),
+('丙午', '병오', 22389, 1, 19, 1),
+('浮浪', '부랑', 22390, 1, 19, 1),
+('宣揚', '선양', 22391, 1, 19, 1),
+('笑覽', '소람', 22392, 1, 19, 1),
+('濕潤', '습윤', 22393, 1, 19, 1),
+('承繼', '승계', 22394, 1, 19, 1),
+('弑逆', '시역', 22395, 1, 19, 1),
+('軟鋼', '연강', 22396, 1, 19, 1),
+('午睡', '오수', 22397, 1, 19, 1),
+('忍從', '인종', 22398, 1, 19, 1),
+('早漏', '조루', 22399, 1, 19, 1),
+('弔慰', '조위', 22400, 1, 19, 1),
+('條項', '조항', 22401, 1, 19, 1),
+('陳腐', '진부', 22402, 1, 19, 1),
+('遷移', '천이', 22403, 1, 19, 1),
+('脫臼', '탈구', 22404, 1, 19, 1),
+('鬪鷄', '투계', 22405, 1, 19, 1),
+('鞭毛', '편모', 22406, 1, 19, 1),
+('獻呈', '헌정', 22407, 1, 19, 1),
+('驍將', '효장', 22408, 1, 19, 1),
+('燻煙', '훈연', 22409, 1, 19, 1),
+('良', '양', 22410, 1, 18, 1),
+('赤', '적', 22411, 1, 18, 1),
+('七', '칠', 22412, 1, 18, 1),
+('建坪', '건평', 22413, 1, 18, 1),
+('庚申', '경신', 22414, 1, 18, 1),
+('龜尾', '구미', 22415, 1, 18, 1),
+('狗醬', '구장', 22416, 1, 18, 1),
+('臼齒', '구치', 22417, 1, 18, 1),
+('鬼才', '귀재', 22418, 1, 18, 1),
+('浪漫', '낭만', 22419, 1, 18, 1),
+('雷鳴', '뇌명', 22420, 1, 18, 1),
+('堂堂', '당당', 22421, 1, 18, 1),
+('牧畜', '목축', 22422, 1, 18, 1),
+('戊申', '무신', 22423, 1, 18, 1),
+('丙申', '병신', 22424, 1, 18, 1),
+('封蠟', '봉랍', 22425, 1, 18, 1),
+('奉獻', '봉헌', 22426, 1, 18, 1),
+('祠堂', '사당', 22427, 1, 18, 1),
+('賞盃', '상배', 22428, 1, 18, 1),
+('艷福', '염복', 22429, 1, 18, 1),
+('預金', '예금', 22430, 1, 18, 1),
+('右岸', '우안', 22431, 1, 18, 1),
+('流刑', '유형', 22432, 1, 18, 1),
+('莊嚴', '장엄', 22433, 1, 18, 1),
+('弔橋', '조교', 22434, 1, 18, 1),
+('弔鐘', '조종', 22435, 1, 18, 1),
+('左岸', '좌안', 22436, 1, 18, 1),
+('觸診', '촉진', 22437, 1, 18, 1),
+('銃筩', '총통', 22438, 1, 18, 1),
+('醜聞', '추문', 22439, 1, 18, 1),
+('測深', '측심', 22440, 1, 18, 1),
+('齒垢', '치구', 22441, 1, 18, 1),
+('痛痒', '통양', 22442, 1, 18, 1),
+('廢絕', '폐절', 22443, 1, 18, 1),
+('夏至', '하지', 22444, 1, 18, 1),
+('兄弟', '형데', 22445, 1, 18, 1),
+('膀胱癌', '방광암', 22446, 1, 18, 1),
+('褓따리', '보따리', 22447, 1, 18, 1),
+('架橋', '가교', 22448, 1, 17, 1),
+('甘藍', '감람', 22449, 1, 17, 1),
+('恭順', '공순', 22450, 1, 17, 1),
+('匡救', '광구', 22451, 1, 17, 1),
+('購買', '구매', 22452, 1, 17, 1),
+('群棲', '군서', 22453, 1, 17, 1),
+('弓弦', '궁현', 22454, 1, 17, 1),
+('緊縮', '긴축', 22455, 1, 17, 1),
+('凍瘡', '동창', 22456, 1, 17, 1),
+('蒙昧', '몽매', 22457, 1, 17, 1),
+('背馳', '배치', 22458, 1, 17, 1),
+('飜刻', '번각', 22459, 1, 17, 1),
+('福祉', '복지', 22460, 1, 17, 1),
+('蜂蜜', '봉밀', 22461, 1, 17, 1),
+('腐蝕', '부식', 22462, 1, 17, 1),
+('召還', '소환', 22463, 1, 17, 1),
+('隨伴', '수반', 22464, 1, 17, 1),
+('按舞', '안무', 22465, 1, 17, 1),
+('如何', '여하', 22466, 1, 17, 1),
+('早飯', '조반', 22467, 1, 17, 1),
+('遲漏', '지루', 22468, 1, 17, 1),
+('蒼鉛', '창연', 22469, 1, 17, 1),
+('脊柱', '척주', 22470, 1, 17, 1),
+('卓越', '탁월', 22471, 1, 17, 1),
+('編磬', '편경', 22472, 1, 17, 1),
+('協贊', '협찬', 22473, 1, 17, 1),
+('換率', '환율', 22474, 1, 17, 1),
+('熙川', '희천', 22475, 1, 17, 1),
+('麒麟羚羊', '기린영양', 22476, 1, 17, 1),
+('燈', '등', 22477, 1, 16, 1),
+('佛', '불', 22478, 1, 16, 1),
+('床', '상', 22479, 1, 16, 1),
+('尿', '요', 22480, 1, 16, 1),
+('千', '천', 22481, 1, 16, 1),
+('艦', '함', 22482, 1, 16, 1),
+('甘肅', '감숙', 22483, 1, 16, 1),
+('价川', '개천', 22484, 1, 16, 1),
+('兼勤', '겸근', 22485, 1, 16, 1),
+('慶賀', '경하', 22486, 1, 16, 1),
+('顧慮', '고려', 22487, 1, 16, 1),
+('廣幅', '광폭', 22488, 1, 16, 1),
+('軌跡', '궤적', 22489, 1, 16, 1),
+('菌絲', '균사', 22490, 1, 16, 1),
+('丹青', '단청', 22491, 1, 16, 1),
+('冬菊', '동국', 22492, 1, 16, 1),
+('된醬', '된장', 22493, 1, 16, 1),
+('豆豉', '두시', 22494, 1, 16, 1),
+('媒介', '매개', 22495, 1, 16, 1),
+('綿棒', '면봉', 22496, 1, 16, 1),
+('薄荷', '박하', 22497, 1, 16, 1),
+('賦課', '부과', 22498, 1, 16, 1),
+('浮彫', '부조', 22499, 1, 16, 1),
+('盆景', '분경', 22500, 1, 16, 1),
+('貧困', '빈곤', 22501, 1, 16, 1),
+('泗川', '사천', 22502, 1, 16, 1),
+('盛況', '성황', 22503, 1, 16, 1),
+('疎遠', '소원', 22504, 1, 16, 1),
+('秀逸', '수일', 22505, 1, 16, 1),
+('屍姦', '시간', 22506, 1, 16, 1),
+('侍從', '시종', 22507, 1, 16, 1),
+('阿膠', '아교', 22508, 1, 16, 1),
+('臥床', '와상', 22509, 1, 16, 1),
+('隱蔽', '은폐', 22510, 1, 16, 1),
+('凝縮', '응축', 22511, 1, 16, 1),
+('著述', '저술', 22512, 1, 16, 1),
+('寂靜', '적정', 22513, 1, 16, 1),
+('租借', '조차', 22514, 1, 16, 1),
+('陳謝', '진사', 22515, 1, 16, 1),
+('推奬', '추장', 22516, 1, 16, 1),
+('幣貢', '폐공', 22517, 1, 16, 1),
+('捕獲', '포획', 22518, 1, 16, 1),
+('割讓', '할양', 22519, 1, 16, 1),
+('狐疑', '호의', 22520, 1, 16, 1),
+('稀釋', '희석', 22521, 1, 16, 1),
+('그림冊', '그림책', 22522, 1, 16, 1),
+('淡婆姑', '담파고', 22523, 1, 16, 1),
+('洞', '동', 22524, 1, 15, 1),
+('舞', '무', 22525, 1, 15, 1),
+('玉', '옥', 22526, 1, 15, 1),
+('簡潔', '간결', 22527, 1, 15, 1),
+('麴菌', '국균', 22528, 1, 15, 1),
+('禁錮', '금고', 22529, 1, 15, 1),
+('寄贈', '기증', 22530, 1, 15, 1),
+('拉麵', '납면', 22531, 1, 15, 1),
+('凌虐', '능학', 22532, 1, 15, 1),
+('到底', '도저', 22533, 1, 15, 1),
+('麵棒', '면봉', 22534, 1, 15, 1),
+('緬羊', '면양', 22535, 1, 15, 1),
+('蒙疆', '몽강', 22536, 1, 15, 1),
+('默珠', '묵주', 22537, 1, 15, 1),
+('撲滅', '박멸', 22538, 1, 15, 1),
+('繁昌', '번창', 22539, 1, 15, 1),
+('宣誓', '선서', 22540, 1, 15, 1),
+('阿諛', '아유', 22541, 1, 15, 1),
+('羚羊', '영양', 22542, 1, 15, 1),
+('牛痘', '우두', 22543, 1, 15, 1),
+('耳聾', '이롱', 22544, 1, 15, 1),
+('尼僧', '이승', 22545, 1, 15, 1),
+('壬辰', '임진', 22546, 1, 15, 1),
+('丁巳', '정사', 22547, 1, 15, 1),
+('丁酉', '정유', 22548, 1, 15, 1),
+('丁丑', '정축', 22549, 1, 15, 1),
+('齊唱', '제창', 22550, 1, 15, 1),
+('仲介', '중개', 22551, 1, 15, 1),
+('仲媒', '중매', 22552, 1, 15, 1),
+('祗候', '지후', 22553, 1, 15, 1),
+('沈沒', '침몰', 22554, 1, 15, 1),
+('販促', '판촉', 22555, 1, 15, 1),
+('豪快', '호쾌', 22556, 1, 15, 1),
+('荒唐', '황당', 22557, 1, 15, 1),
+('甚至於', '심지어', 22558, 1, 15, 1),
+('倭기름', '왜기름', 22559, 1, 15, 1),
+('釋迦牟尼', '석가모니', 22560, 1, 15, 1),
+('甘', '감', 22561, 1, 14, 1),
+('綠', '녹', 22562, 1, 14, 1),
+('龍', '룡', 22563, 1, 14, 1),
+('龍', '용', 22564, 1, 14, 1),
+('唱', '창', 22565, 1, 14, 1),
+('訓', '훈', 22566, 1, 14, 1),
+('苛刻', '가각', 22567, 1, 14, 1),
+('脚絆', '각반', 22568, 1, 14, 1),
+('契丹', '거란', 22569, 1, 14, 1),
+('缺損', '결손', 22570, 1, 14, 1),
+('庚辰', '경진', 22571, 1, 14, 1),
+('謹嚴', '근엄', 22572, 1, 14, 1),
+('緊迫', '긴박', 22573, 1, 14, 1),
+('盜癖', '도벽', 22574, 1, 14, 1),
+('蹈襲', '도습', 22575, 1, 14, 1),
+('綿絲', '면사', 22576, 1, 14, 1),
+('戊辰', '무진', 22577, 1, 14, 1),
+('陪審', '배심', 22578, 1, 14, 1),
+('丙辰', '병진', 22579, 1, 14, 1),
+('浮漂', '부표', 22580, 1, 14, 1),
+('頻繁', '빈번', 22581, 1, 14, 1),
+('阿堵', '아도', 22582, 1, 14, 1),
+('阿諂', '아첨', 22583, 1, 14, 1),
+('鴉片', '아편', 22584, 1, 14, 1),
+('斡旋', '알선', 22585, 1, 14, 1),
+('哀哭', '애곡', 22586, 1, 14, 1),
+('研究', '연구', 22587, 1, 14, 1),
+('領域', '영역', 22588, 1, 14, 1),
+('往診', '왕진', 22589, 1, 14, 1),
+('恩赦', '은사', 22590, 1, 14, 1),
+('紫檀', '자단', 22591, 1, 14, 1),
+('刺繡', '자수', 22592, 1, 14, 1),
+('障礙', '장애', 22593, 1, 14, 1),
+('淨潔', '정결', 22594, 1, 14, 1),
+('廷臣', '정신', 22595, 1, 14, 1),
+('縱陣', '종진', 22596, 1, 14, 1),
+('俊逸', '준일', 22597, 1, 14, 1),
+('徵募', '징모', 22598, 1, 14, 1),
+('採擇', '채택', 22599, 1, 14, 1),
+('廢墟', '폐허', 22600, 1, 14, 1),
+('包括', '포괄', 22601, 1, 14, 1),
+('峽灣', '협만', 22602, 1, 14, 1),
+('虎狼', '호랑', 22603, 1, 14, 1),
+('牡丹峰', '모란봉', 22604, 1, 14, 1),
+('松鶻매', '송골매', 22605, 1, 14, 1),
+('劍', '검', 22606, 1, 13, 1),
+('犬', '견', 22607, 1, 13, 1),
+('九', '구', 22608, 1, 13, 1),
+('弓', '궁', 22609, 1, 13, 1),
+('金', '금', 22610, 1, 13, 1),
+('歲', '세', 22611, 1, 13, 1),
+('桿菌', '간균', 22612, 1, 13, 1),
+('衢街', '구가', 22613, 1, 13, 1),
+('納棺', '납관', 22614, 1, 13, 1),
+('陵虐', '능학', 22615, 1, 13, 1),
+('倒錯', '도착', 22616, 1, 13, 1),
+('迷惑', '미혹', 22617, 1, 13, 1),
+('蜜柑', '밀감', 22618, 1, 13, 1),
+('繁苛', '번가', 22619, 1, 13, 1),
+('封墳', '봉분', 22620, 1, 13, 1),
+('奔騰', '분등', 22621, 1, 13, 1),
+('朋友', '붕우', 22622, 1, 13, 1),
+('搜索', '수색', 22623, 1, 13, 1),
+('辛亥', '신해', 22624, 1, 13, 1),
+('哀叫', '애규', 22625, 1, 13, 1),
+('哀嘆', '애탄', 22626, 1, 13, 1),
+('永逝', '영서', 22627, 1, 13, 1),
+('熔融', '용융', 22628, 1, 13, 1),
+('友誼', '우의', 22629, 1, 13, 1),
+('匠戶', '장호', 22630, 1, 13, 1),
+('鑄鋼', '주강', 22631, 1, 13, 1),
+('朱鷺', '주로', 22632, 1, 13, 1),
+('駿逸', '준일', 22633, 1, 13, 1),
+('珍獸', '진수', 22634, 1, 13, 1),
+('此邊', '차변', 22635, 1, 13, 1),
+('青梅', '청매', 22636, 1, 13, 1),
+('築堤', '축제', 22637, 1, 13, 1),
+('探偵', '탐정', 22638, 1, 13, 1),
+('捕鯨', '포경', 22639, 1, 13, 1),
+('陷沒', '함몰', 22640, 1, 13, 1),
+('濠洲', '호주', 22641, 1, 13, 1),
+('懷柔', '회유', 22642, 1, 13, 1),
+('般涅槃', '반열반', 22643, 1, 13, 1),
+('吐谷渾', '토욕혼', 22644, 1, 13, 1),
+('湖畔새', '호반새', 22645, 1, 13, 1),
+('冬', '동', 22646, 1, 12, 1),
+('爐', '로', 22647, 1, 12, 1),
+('純', '순', 22648, 1, 12, 1),
+('功勳', '공훈', 22649, 1, 12, 1),
+('橋梁', '교량', 22650, 1, 12, 1),
+('儺儀', '나의', 22651, 1, 12, 1),
+('籠欌', '농장', 22652, 1, 12, 1),
+('漏斗', '누두', 22653, 1, 12, 1),
+('貸款', '대콴', 22654, 1, 12, 1),
+('陶醉', '도취', 22655, 1, 12, 1),
+('冬柏', '동백', 22656, 1, 12, 1),
+('麻痺', '마비', 22657, 1, 12, 1),
+('埋伏', '매복', 22658, 1, 12, 1),
+('繁柯', '번가', 22659, 1, 12, 1),
+('繁忙', '번망', 22660, 1, 12, 1),
+('梵鐘', '범종', 22661, 1, 12, 1),
+('蜂蠟', '봉랍', 22662, 1, 12, 1),
+('富裕', '부유', 22663, 1, 12, 1),
+('辛卯', '신묘', 22664, 1, 12, 1),
+('辛巳', '신사', 22665, 1, 12, 1),
+('辛酉', '신유', 22666, 1, 12, 1),
+('辛丑', '신축', 22667, 1, 12, 1),
+('閱覽', '열람', 22668, 1, 12, 1),
+('榮譽', '영예', 22669, 1, 12, 1),
+('寧夏', '영하', 22670, 1, 12, 1),
+('愚鈍', '우둔', 22671, 1, 12, 1),
+('慰藉', '위자', 22672, 1, 12, 1),
+('違憲', '위헌', 22673, 1, 12, 1),
+('乙亥', '을해', 22674, 1, 12, 1),
+('壬寅', '임인', 22675, 1, 12, 1),
+('欌籠', '장롱', 22676, 1, 12, 1),
+('澱粉', '전분', 22677, 1, 12, 1),
+('貞潔', '정결', 22678, 1, 12, 1),
+('坐禪', '좌선', 22679, 1, 12, 1),
+('左舷', '좌현', 22680, 1, 12, 1),
+('增刷', '증쇄', 22681, 1, 12, 1),
+('催淚', '최루', 22682, 1, 12, 1),
+('祝宴', '축연', 22683, 1, 12, 1),
+('怠慢', '태만', 22684, 1, 12, 1),
+('捕虜', '포로', 22685, 1, 12, 1),
+('割烹', '할팽', 22686, 1, 12, 1),
+('環礁', '환초', 22687, 1, 12, 1),
+('灰燼', '회신', 22688, 1, 12, 1),
+('卒', '졸', 22689, 1, 11, 1),
+('敬虔', '경건', 22690, 1, 11, 1),
+('庚寅', '경인', 22691, 1, 11, 1),
+('癸亥', '계해', 22692, 1, 11, 1),
+('貢賦', '공부', 22693, 1, 11, 1),
+('汽艇', '기정', 22694, 1, 11, 1),
+('螺絲', '나사', 22695, 1, 11, 1),
+('痘瘡', '두창', 22696, 1, 11, 1),
+('痲醉', '마취', 22697, 1, 11, 1),
+('牡丹', '모란', 22698, 1, 11, 1),
+('戊寅', '무인', 22699, 1, 11, 1),
+('紡織', '방직', 22700, 1, 11, 1),
+('丙寅', '병인', 22701, 1, 11, 1),
+('浮游', '부유', 22702, 1, 11, 1),
+('匪賊', '비적', 22703, 1, 11, 1),
+('敘述', '서술', 22704, 1, 11, 1),
+('盛饌', '성찬', 22705, 1, 11, 1),
+('10', '시월', 22706, 1, 11, 1),
+('알穀', '알곡', 22707, 1, 11, 1),
+('御璽', '어새', 22708, 1, 11, 1),
+('硏磨', '연마', 22709, 1, 11, 1),
+('裂罅', '열하', 22710, 1, 11, 1),
+('蝸牛', '와우', 22711, 1, 11, 1),
+('右좀', '우좀', 22712, 1, 11, 1),
+('潤澤', '윤택', 22713, 1, 11, 1),
+('乙卯', '을묘', 22714, 1, 11, 1),
+('乙巳', '을사', 22715, 1, 11, 1),
+('乙酉', '을유', 22716, 1, 11, 1),
+('乙丑', '을축', 22717, 1, 11, 1),
+('壬戌', '임술', 22718, 1, 11, 1),
+('炸裂', '작렬', 22719, 1, 11, 1),
+('嘲笑', '조소', 22720, 1, 11, 1),
+('左좀', '좌좀', 22721, 1, 11, 1),
+('朱雀', '주작', 22722, 1, 11, 1),
+('竹筍', '죽순', 22723, 1, 11, 1),
+('曾孫', '증손', 22724, 1, 11, 1),
+('鷙勇', '지용', 22725, 1, 11, 1),
+('饌欌', '찬장', 22726, 1, 11, 1),
+('10', '천사', 22727, 1, 11, 1),
+('貼付', '첩부', 22728, 1, 11, 1),
+('討伐', '토벌', 22729, 1, 11, 1),
+('推敲', '퇴고', 22730, 1, 11, 1),
+('捕捉', '포착', 22731, 1, 11, 1),
+('鄕愁', '향수', 22732, 1, 11, 1),
+('胡椒', '호초', 22733, 1, 11, 1),
+('絆瘡膏', '반창고', 22734, 1, 11, 1),
+('가위바위褓', '가위바위보', 22735, 1, 11, 1),
+('段', '단', 22736, 1, 10, 1),
+('麵', '면', 22737, 1, 10, 1),
+('腫', '종', 22738, 1, 10, 1),
+('癎疾', '간질', 22739, 1, 10, 1),
+('槪括', '개괄', 22740, 1, 10, 1),
+('庚戌', '경술', 22741, 1, 10, 1),
+('癸卯', '계묘', 22742, 1, 10, 1),
+('癸巳', '계사', 22743, 1, 10, 1),
+('癸酉', '계유', 22744, 1, 10, 1),
+('癸丑', '계축', 22745, 1, 10, 1),
+('攪飯', '교반', 22746, 1, 10, 1),
+('拘泥', '구니', 22747, 1, 10, 1),
+('驅逐', '구축', 22748, 1, 10, 1),
+('絡蹄', '낙제', 22749, 1, 10, 1),
+('駱駝', '락타', 22750, 1, 10, 1),
+('麵麭', '면포', 22751, 1, 10, 1),
+('摸索', '모색', 22752, 1, 10, 1),
+('眉宇', '미우', 22753, 1, 10, 1),
+('丙戌', '병술', 22754, 1, 10, 1),
+('叙述', '서술', 22755, 1, 10, 1),
+('埃及', '애굽', 22756, 1, 10, 1),
+('鬱勃', '울발', 22757, 1, 10, 1),
+('淫靡', '음미', 22758, 1, 10, 1),
+('淫佚', '음일', 22759, 1, 10, 1),
+('痢疾', '이질', 22760, 1, 10, 1),
+('紫芝', '자지', 22761, 1, 10, 1),
+('棧橋', '잔교', 22762, 1, 10, 1),
+('吊橋', '적교', 22763, 1, 10, 1),
+('左빨', '좌빨', 22764, 1, 10, 1),
+('舟艇', '주정', 22765, 1, 10, 1),
+('震央', '진앙', 22766, 1, 10, 1),
+('珍珠', '진주', 22767, 1, 10, 1),
+('茶盞', '찻잔', 22768, 1, 10, 1),
+('寢囊', '침낭', 22769, 1, 10, 1),
+('汗腺', '한선', 22770, 1, 10, 1),
+('胸廓', '흉곽', 22771, 1, 10, 1),
+('跏趺坐', '가부좌', 22772, 1, 10, 1),
+('蘭', '란', 22773, 1, 9, 1),
+('署', '서', 22774, 1, 9, 1),
+('妻', '처', 22775, 1, 9, 1),
+('孝', '효', 22776, 1, 9, 1),
+('簡牘', '간독', 22777, 1, 9, 1),
+('奸詐', '간사', 22778, 1, 9, 1),
+('塊莖', '괴경', 22779, 1, 9, 1),
+('蠟燭', '납촉', 22780, 1, 9, 1),
+('濃淡', '농담', 22781, 1, 9, 1),
+('汎濫', '범람', 22782, 1, 9, 1),
+('蜂巢', '봉소', 22783, 1, 9, 1),
+('俯伏', '부복', 22784, 1, 9, 1),
+('仙寰', '선환', 22785, 1, 9, 1),
+('媤叔', '시숙', 22786, 1, 9, 1),
+('深淵', '심연', 22787, 1, 9, 1),
+('蘘荷', '양하', 22788, 1, 9, 1),
+('頑丈', '완장', 22789, 1, 9, 1),
+('依據', '의거', 22790, 1, 9, 1),
+('依賴', '의뢰', 22791, 1, 9, 1),
+('折衷', '절충', 22792, 1, 9, 1),
+('駐屯', '주둔', 22793, 1, 9, 1),
+('簒奪', '찬탈', 22794, 1, 9, 1),
+('穿孔', '천공', 22795, 1, 9, 1),
+('淺薄', '천박', 22796, 1, 9, 1),
+('嗤笑', '치소', 22797, 1, 9, 1),
+('沈澱', '침전', 22798, 1, 9, 1),
+('胡蝶', '호접', 22799, 1, 9, 1),
+('懷抱', '회포', 22800, 1, 9, 1),
+('墓', '묘', 22801, 1, 8, 1),
+('疥癬', '개선', 22802, 1, 8, 1),
+('介冑', '개주', 22803, 1, 8, 1),
+('顆粒', '과립', 22804, 1, 8, 1),
+('蕎麥', '교맥', 22805, 1, 8, 1),
+('眷顧', '권고', 22806, 1, 8, 1),
+('痘苗', '두묘', 22807, 1, 8, 1),
+('胚囊', '배낭', 22808, 1, 8, 1),
+('蕃殖', '번식', 22809, 1, 8, 1),
+('碑銘', '비명', 22810, 1, 8, 1),
+('脾臟', '비장', 22811, 1, 8, 1),
+('祥瑞', '상서', 22812, 1, 8, 1),
+('瑞祥', '서상', 22813, 1, 8, 1),
+('錫杖', '석장', 22814, 1, 8, 1),
+('訴訟', '소송', 22815, 1, 8, 1),
+('孫胄', '손주', 22816, 1, 8, 1),
+('楊梅', '양매', 22817, 1, 8, 1),
+('琉璃', '유리', 22818, 1, 8, 1),
+('才媛', '재원', 22819, 1, 8, 1),
+('貞淑', '정숙', 22820, 1, 8, 1),
+('棗仁', '조인', 22821, 1, 8, 1),
+('侏儒', '주유', 22822, 1, 8, 1),
+('窒塞', '질색', 22823, 1, 8, 1),
+('浸透', '침투', 22824, 1, 8, 1),
+('怠惰', '태타', 22825, 1, 8, 1),
+('逼迫', '핍박', 22826, 1, 8, 1),
+('欠伸', '흠신', 22827, 1, 8, 1),
+('杜鵑새', '두견새', 22828, 1, 8, 1),
+('베레帽', '베레모', 22829, 1, 8, 1),
+('鸚鵡새', '앵무새', 22830, 1, 8, 1),
+('谷', '곡', 22831, 1, 7, 1),
+('喪', '상', 22832, 1, 7, 1),
+('廉', '염', 22833, 1, 7, 1),
+('肺', '폐', 22834, 1, 7, 1),
+('函', '함', 22835, 1, 7, 1),
+('湖', '호', 22836, 1, 7, 1),
+('丐乞', '개걸', 22837, 1, 7, 1),
+('乞丐', '걸개', 22838, 1, 7, 1),
+('揭載', '게재', 22839, 1, 7, 1),
+('京畿', '경기', 22840, 1, 7, 1),
+('穹蒼', '궁창', 22841, 1, 7, 1),
+('奴隸', '노례', 22842, 1, 7, 1),
+('奴隸', '노예', 22843, 1, 7, 1),
+('谷蠡', '녹려', 22844, 1, 7, 1),
+('膿瘍', '농양', 22845, 1, 7, 1),
+('筒箇', '동개', 22846, 1, 7, 1),
+('辨償', '변상', 22847, 1, 7, 1),
+('紗帽', '사모', 22848, 1, 7, 1),
+('鼠姑', '서고', 22849, 1, 7, 1),
+('昇汞', '승홍', 22850, 1, 7, 1),
+('牙箏', '아쟁', 22851, 1, 7, 1),
+('銳敏', '예민', 22852, 1, 7, 1),
+('鎔冶', '용야', 22853, 1, 7, 1),
+('怨讐', '원수', 22854, 1, 7, 1),
+('琉璃', '유리', 22855, 1, 7, 1),
+('爾雅', '이아', 22856, 1, 7, 1),
+('雀躍', '작약', 22857, 1, 7, 1),
+('遭遇', '조우', 22858, 1, 7, 1),
+('拙吟', '졸음', 22859, 1, 7, 1),
+('珍妙', '진묘', 22860, 1, 7, 1),
+('讖緯', '참위', 22861, 1, 7, 1),
+('招聘', '초빙', 22862, 1, 7, 1),
+('貝殼', '패각', 22863, 1, 7, 1),
+('壞疽', '회저', 22864, 1, 7, 1),
+('悔恨', '회한', 22865, 1, 7, 1),
+('胸郭', '흉곽', 22866, 1, 7, 1),
+('稀罕', '희한', 22867, 1, 7, 1),
+('伽倻고', '가얏고', 22868, 1, 7, 1),
+('矮몰개', '왜몰개', 22869, 1, 7, 1),
+('宜昌枳', '의창지', 22870, 1, 7, 1),
+('廳', '청', 22871, 1, 6, 1),
+('値', '치', 22872, 1, 6, 1),
+('澤', '택', 22873, 1, 6, 1),
+('幅', '폭', 22874, 1, 6, 1),
+('殭屍', '강시', 22875, 1, 6, 1),
+('倨慢', '거만', 22876, 1, 6, 1),
+('棍棒', '곤봉', 22877, 1, 6, 1),
+('嘔吐', '구토', 22878, 1, 6, 1),
+('槿惠', '근혜', 22879, 1, 6, 1),
+('駱駞', '낙타', 22880, 1, 6, 1),
+('駱駞', '락타', 22881, 1, 6, 1),
+('虜獲', '로획', 22882, 1, 6, 1),
+('鹵獲', '로획', 22883, 1, 6, 1),
+('晩餐', '만찬', 22884, 1, 6, 1),
+('侮蔑', '모멸', 22885, 1, 6, 1),
+('輔翼', '보익', 22886, 1, 6, 1),
+('憤懣', '분만', 22887, 1, 6, 1),
+('盆栽', '분재', 22888, 1, 6, 1),
+('滲透', '삼투', 22889, 1, 6, 1),
+('泄瀉', '설사', 22890, 1, 6, 1),
+('譫妄', '섬망', 22891, 1, 6, 1),
+('纖維', '섬유', 22892, 1, 6, 1),
+('沼澤', '소택', 22893, 1, 6, 1),
+('羞恥', '수치', 22894, 1, 6, 1),
+('腋臭', '액취', 22895, 1, 6, 1),
+('遼寧', '요녕', 22896, 1, 6, 1),
+('羽緞', '우단', 22897, 1, 6, 1),
+('瑠璃', '유리', 22898, 1, 6, 1),
+('姉妹', '자매', 22899, 1, 6, 1),
+('姊妹', '자매', 22900, 1, 6, 1),
+('痤瘡', '좌창', 22901, 1, 6, 1),
+('増殖', '증식', 22902, 1, 6, 1),
+('恥垢', '치구', 22903, 1, 6, 1),
+('芭蕉', '파초', 22904, 1, 6, 1),
+('­盞', '한잔', 22905, 1, 6, 1),
+('胡밀', '호밀', 22906, 1, 6, 1),
+('몽골斑', '몽골반', 22907, 1, 6, 1),
+('珊瑚礁', '산호초', 22908, 1, 6, 1),
+('寧', '녕', 22909, 1, 5, 1),
+('碧', '벽', 22910, 1, 5, 1),
+('旬', '순', 22911, 1, 5, 1),
+('鶴', '학', 22912, 1, 5, 1),
+('螢', '형', 22913, 1, 5, 1),
+('戶', '호', 22914, 1, 5, 1),
+('貫祿', '관록', 22915, 1, 5, 1),
+('丘陵', '구릉', 22916, 1, 5, 1),
+('潑剌', '발랄', 22917, 1, 5, 1),
+('旁牌', '방패', 22918, 1, 5, 1),
+('煩忙', '번망', 22919, 1, 5, 1),
+('賜暇', '사가', 22920, 1, 5, 1),
+('啞鈴', '아령', 22921, 1, 5, 1),
+('曖昧', '애매', 22922, 1, 5, 1),
+('膺懲', '응징', 22923, 1, 5, 1),
+('懿旨', '의지', 22924, 1, 5, 1),
+('咽喉', '인후', 22925, 1, 5, 1),
+('姙娠', '임신', 22926, 1, 5, 1),
+('塵喧', '진훤', 22927, 1, 5, 1),
+('滄桑', '창상', 22928, 1, 5, 1),
+('蒼蒼', '창창', 22929, 1, 5, 1),
+('蒼朮', '창출', 22930, 1, 5, 1),
+('添削', '첨삭', 22931, 1, 5, 1),
+('尖鼠', '첨서', 22932, 1, 5, 1),
+('焦穫', '초호', 22933, 1, 5, 1),
+('疱疹', '포진', 22934, 1, 5, 1),
+('契', '계', 22935, 1, 4, 1),
+('棺', '관', 22936, 1, 4, 1),
+('泊', '박', 22937, 1, 4, 1),
+('笛', '적', 22938, 1, 4, 1),
+('茶', '차', 22939, 1, 4, 1),
+('贊', '찬', 22940, 1, 4, 1),
+('軸', '축', 22941, 1, 4, 1),
+('豐', '풍', 22942, 1, 4, 1),
+('濠', '호', 22943, 1, 4, 1),
+('棺槨', '관곽', 22944, 1, 4, 1),
+('枸杞', '구기', 22945, 1, 4, 1),
+('綠茶', '녹차', 22946, 1, 4, 1),
+('膿疱', '농포', 22947, 1, 4, 1),
+('屠宰', '도재', 22948, 1, 4, 1),
+('蔓衍', '만연', 22949, 1, 4, 1),
+('醱酵', '발효', 22950, 1, 4, 1),
+('膀胱', '방광', 22951, 1, 4, 1),
+('錫箔', '석박', 22952, 1, 4, 1),
+('攘夷', '양이', 22953, 1, 4, 1),
+('茘枝', '여지', 22954, 1, 4, 1),
+('夭逝', '요서', 22955, 1, 4, 1),
+('俊秀', '준수', 22956, 1, 4, 1),
+('癡呆', '치매', 22957, 1, 4, 1),
+('痕迹', '흔적', 22958, 1, 4, 1),
+('希臘', '희랍', 22959, 1, 4, 1),
+('洛', '낙', 22960, 1, 3, 1),
+('李', '리', 22961, 1, 3, 1),
+('璧', '벽', 22962, 1, 3, 1),
+('李', '이', 22963, 1, 3, 1),
+('聾啞', '농아', 22964, 1, 3, 1),
+('挑撥', '도발', 22965, 1, 3, 1),
+('輔翊', '보익', 22966, 1, 3, 1),
+('鳳凰', '봉황', 22967, 1, 3, 1),
+('緋緞', '비단', 22968, 1, 3, 1),
+('婢妾', '비첩', 22969, 1, 3, 1),
+('奢侈', '사치', 22970, 1, 3, 1),
+('鼠蹊', '서혜', 22971, 1, 3, 1),
+('騷擾', '소요', 22972, 1, 3, 1),
+('捻挫', '염좌', 22973, 1, 3, 1),
+('穎悟', '영오', 22974, 1, 3, 1),
+('娛樂', '오락', 22975, 1, 3, 1),
+('粵拼', '월병', 22976, 1, 3, 1),
+('泥濘', '이녕', 22977, 1, 3, 1),
+('箭桐', '전동', 22978, 1, 3, 1),
+('釣竿', '조간', 22979, 1, 3, 1),
+('徂往', '조왕', 22980, 1, 3, 1),
+('痔瘻', '치루', 22981, 1, 3, 1),
+('貝塚', '패총', 22982, 1, 3, 1),
+('貶毁', '폄훼', 22983, 1, 3, 1),
+('顯彰', '현창', 22984, 1, 3, 1),
+('蝴蝶', '호접', 22985, 1, 3, 1),
+('毁謗', '훼방', 22986, 1, 3, 1),
+('卿', '경', 22987, 1, 2, 1),
+('痰', '담', 22988, 1, 2, 1),
+('霹', '벽', 22989, 1, 2, 1),
+('釜', '부', 22990, 1, 2, 1),
+('億', '억', 22991, 1, 2, 1),
+('例', '예', 22992, 1, 2, 1),
+('六', '육', 22993, 1, 2, 1),
+('炙', '적', 22994, 1, 2, 1),
+('橘', '줄', 22995, 1, 2, 1),
+('壕', '호', 22996, 1, 2, 1),
+('盖碗', '개완', 22997, 1, 2, 1),
+('攪拌', '교반', 22998, 1, 2, 1),
+('謹愼', '근신', 22999, 1, 2, 1),
+('飢饉', '기근', 23000, 1, 2, 1),
+('桔梗', '길경', 23001, 1, 2, 1),
+('晚餉', '만향', 23002, 1, 2, 1),
+('琺瑯', '법랑', 23003, 1, 2, 1),
+('搔痒', '소양', 23004, 1, 2, 1),
+('柴薪', '시신', 23005, 1, 2, 1),
+('薪柴', '신시', 23006, 1, 2, 1),
+('梧桐', '오동', 23007, 1, 2, 1),
+('蹂躙', '유린', 23008, 1, 2, 1),
+('蹂躪', '유린', 23009, 1, 2, 1),
+('井陘', '정형', 23010, 1, 2, 1),
+('耽溺', '탐닉', 23011, 1, 2, 1),
+('剽竊', '표절', 23012, 1, 2, 1),
+('懸崖', '현애', 23013, 1, 2, 1),
+('厥', '궐', 23014, 1, 1, 1),
+('朴', '박', 23015, 1, 1, 1),
+('鰒', '복', 23016, 1, 1, 1),
+('糞', '분', 23017, 1, 1, 1),
+('閻', '염', 23018, 1, 1, 1),
+('伊', '이', 23019, 1, 1, 1),
+('妾', '첩', 23020, 1, 1, 1),
+('貼', '첩', 23021, 1, 1, 1),
+('鍼', '침', 23022, 1, 1, 1),
+('蛔', '휘', 23023, 1, 1, 1),
+('盥漱', '관수', 23024, 1, 1, 1),
+('玳瑁', '대모', 23025, 1, 1, 1),
+('瑇瑁', '대모', 23026, 1, 1, 1),
+('蕪菁', '무청', 23027, 1, 1, 1),
+('昭媛', '소원', 23028, 1, 1, 1),
+('馴鹿', '순록', 23029, 1, 1, 1),
+('軋轢', '알력', 23030, 1, 1, 1),
+('蠑螈', '영원', 23031, 1, 1, 1),
+('烏桓', '오환', 23032, 1, 1, 1),
+('瘴癘', '장려', 23033, 1, 1, 1),
+('錚錚', '쟁쟁', 23034, 1, 1, 1),
+('詛呪', '저주', 23035, 1, 1, 1),
+('糟糠', '조강', 23036, 1, 1, 1),
+('糶糴', '조적', 23037, 1, 1, 1),
+('遐邇', '하이', 23038, 1, 1, 1),
+('旱魃', '한발', 23039, 1, 1, 1),
+('檻穽', '함정', 23040, 1, 1, 1),
+('諧謔', '해학', 23041, 1, 1, 1),
+('眩耀', '현요', 23042, 1, 1, 1),
+('虹霓', '홍예', 23043, 1, 1, 1),
+(NULL, '갉', 23044, 1, 0, 1),
+('姜', '강', 23045, 1, 0, 1),
+('炕', '강', 23046, 1, 0, 1),
+(NULL, '갗', 23047, 1, 0, 1),
+(NULL, '갭', 23048, 1, 0, 1),
+(NULL, '갸', 23049, 1, 0, 1),
+(NULL, '게', 23050, 1, 0, 1),
+(NULL, '겜', 23051, 1, 0, 1),
+(NULL, '곳', 23052, 1, 0, 1),
+(NULL, '곽', 23053, 1, 0, 1),
+(NULL, '괌', 23054, 1, 0, 1),
+(NULL, '괘', 23055, 1, 0, 1),
+(NULL, '괴', 23056, 1, 0, 1),
+(NULL, '국', 23057, 1, 0, 1),
+(NULL, '굳', 23058, 1, 0, 1),
+(NULL, '굴', 23059, 1, 0, 1),
+(NULL, '궤', 23060, 1, 0, 1),
+(NULL, '긄', 23061, 1, 0, 1),
+(NULL, '꿈', 23062, 1, 0, 1),
+(NULL, '꿩', 23063, 1, 0, 1),
+(NULL, '끈', 23064, 1, 0, 1),
+(NULL, '끌', 23065, 1, 0, 1),
+(NULL, '끼', 23066, 1, 0, 1),
+(NULL, '나', 23067, 1, 0, 1),
+(NULL, '낟', 23068, 1, 0, 1),
+(NULL, '납', 23069, 1, 0, 1),
+(NULL, '낼', 23070, 1, 0, 1),
+(NULL, '네', 23071, 1, 0, 1),
+(NULL, '년', 23072, 1, 0, 1),
+('弩', '노', 23073, 1, 0, 1),
+(NULL, '논', 23074, 1, 0, 1),
+(NULL, '뇽', 23075, 1, 0, 1),
+(NULL, '눵', 23076, 1, 0, 1),
+(NULL, '눼', 23077, 1, 0, 1),
+(NULL, '니', 23078, 1, 0, 1),
+(NULL, '닙', 23079, 1, 0, 1),
+(NULL, '단', 23080, 1, 0, 1),
+(NULL, '닻', 23081, 1, 0, 1),
+(NULL, '댐', 23082, 1, 0, 1),
+(NULL, '더', 23083, 1, 0, 1),
+(NULL, '덜', 23084, 1, 0, 1),
+(NULL, '도', 23085, 1, 0, 1),
+(NULL, '두', 23086, 1, 0, 1),
+(NULL, '둬', 23087, 1, 0, 1),
+(NULL, '디', 23088, 1, 0, 1),
+(NULL, '딜', 23089, 1, 0, 1),
+(NULL, '딮', 23090, 1, 0, 1),
+(NULL, '따', 23091, 1, 0, 1),
+(NULL, '떼', 23092, 1, 0, 1),
+(NULL, '뚊', 23093, 1, 0, 1),
+(NULL, '란', 23094, 1, 0, 1),
+(NULL, '램', 23095, 1, 0, 1),
+(NULL, '러', 23096, 1, 0, 1),
+(NULL, '럼', 23097, 1, 0, 1),
+(NULL, '론', 23098, 1, 0, 1),
+(NULL, '룰', 23099, 1, 0, 1),
+(NULL, '룻', 23100, 1, 0, 1),
+(NULL, '릴', 23101, 1, 0, 1),
+(NULL, '마', 23102, 1, 0, 1),
+(NULL, '맥', 23103, 1, 0, 1),
+('貊', '맥', 23104, 1, 0, 1),
+(NULL, '먹', 23105, 1, 0, 1),
+(NULL, '멍', 23106, 1, 0, 1),
+('歿', '몰', 23107, 1, 0, 1),
+(NULL, '몸', 23108, 1, 0, 1),
+(NULL, '묵', 23109, 1, 0, 1),
+(NULL, '뭄', 23110, 1, 0, 1),
+(NULL, '뮤', 23111, 1, 0, 1),
+(NULL, '밀', 23112, 1, 0, 1),
+(NULL, '밈', 23113, 1, 0, 1),
+(NULL, '밖', 23114, 1, 0, 1),
+(NULL, '밧', 23115, 1, 0, 1),
+(NULL, '방', 23116, 1, 0, 1),
+(NULL, '백', 23117, 1, 0, 1),
+(NULL, '밴', 23118, 1, 0, 1),
+(NULL, '밸', 23119, 1, 0, 1),
+(NULL, '뱔', 23120, 1, 0, 1),
+(NULL, '범', 23121, 1, 0, 1),
+('范', '범', 23122, 1, 0, 1),
+(NULL, '벚', 23123, 1, 0, 1),
+(NULL, '벜', 23124, 1, 0, 1),
+(NULL, '벨', 23125, 1, 0, 1),
+(NULL, '벺', 23126, 1, 0, 1),
+('甓', '벽', 23127, 1, 0, 1),
+('薜', '벽', 23128, 1, 0, 1),
+(NULL, '본', 23129, 1, 0, 1),
+(NULL, '분', 23130, 1, 0, 1),
+(NULL, '붐', 23131, 1, 0, 1),
+(NULL, '뷰', 23132, 1, 0, 1),
+(NULL, '빎', 23133, 1, 0, 1),
+(NULL, '빚', 23134, 1, 0, 1),
+(NULL, '빵', 23135, 1, 0, 1),
+(NULL, '뺌', 23136, 1, 0, 1),
+(NULL, '뻑', 23137, 1, 0, 1),
+(NULL, '뻥', 23138, 1, 0, 1),
+(NULL, '뼘', 23139, 1, 0, 1),
+(NULL, '삐', 23140, 1, 0, 1),
+(NULL, '삑', 23141, 1, 0, 1),
+(NULL, '사', 23142, 1, 0, 1),
+(NULL, '삵', 23143, 1, 0, 1),
+(NULL, '삼', 23144, 1, 0, 1),
+(NULL, '샤', 23145, 1, 0, 1),
+(NULL, '섕', 23146, 1, 0, 1),
+(NULL, '설', 23147, 1, 0, 1),
+(NULL, '섥', 23148, 1, 0, 1),
+('銛', '섬', 23149, 1, 0, 1),
+(NULL, '섭', 23150, 1, 0, 1),
+(NULL, '세', 23151, 1, 0, 1),
+(NULL, '셸', 23152, 1, 0, 1),
+(NULL, '솜', 23153, 1, 0, 1),
+(NULL, '쇄', 23154, 1, 0, 1),
+(NULL, '쇼', 23155, 1, 0, 1),
+(NULL, '수', 23156, 1, 0, 1),
+(NULL, '쉐', 23157, 1, 0, 1),
+(NULL, '쉘', 23158, 1, 0, 1),
+(NULL, '쉼', 23159, 1, 0, 1),
+(NULL, '슈', 23160, 1, 0, 1),
+(NULL, '슛', 23161, 1, 0, 1),
+(NULL, '스', 23162, 1, 0, 1),
+(NULL, '심', 23163, 1, 0, 1),
+(NULL, '쏵', 23164, 1, 0, 1),
+(NULL, '쐑', 23165, 1, 0, 1),
+(NULL, '쐘', 23166, 1, 0, 1),
+(NULL, '쐠', 23167, 1, 0, 1),
+(NULL, '씩', 23168, 1, 0, 1),
+(NULL, '씬', 23169, 1, 0, 1),
+(NULL, '씰', 23170, 1, 0, 1),
+(NULL, '씸', 23171, 1, 0, 1),
+(NULL, '앱', 23172, 1, 0, 1),
+(NULL, '와', 23173, 1, 0, 1),
+(NULL, '외', 23174, 1, 0, 1),
+('龍', '용', 23175, 1, 0, 1),
+(NULL, '욱', 23176, 1, 0, 1),
+(NULL, '워', 23177, 1, 0, 1),
+(NULL, '웍', 23178, 1, 0, 1),
+(NULL, '월', 23179, 1, 0, 1),
+(NULL, '웨', 23180, 1, 0, 1),
+(NULL, '웬', 23181, 1, 0, 1),
+(NULL, '웹', 23182, 1, 0, 1),
+(NULL, '유', 23183, 1, 0, 1),
+('邑', '읍', 23184, 1, 0, 1),
+(NULL, '잣', 23185, 1, 0, 1),
+(NULL, '잼', 23186, 1, 0, 1),
+('箸', '저', 23187, 1, 0, 1),
+('椄', '접', 23188, 1, 0, 1),
+(NULL, '젓', 23189, 1, 0, 1),
+('碇', '정', 23190, 1, 0, 1),
+(NULL, '젙', 23191, 1, 0, 1),
+(NULL, '젱', 23192, 1, 0, 1),
+(NULL, '졸', 23193, 1, 0, 1),
+('粥', '죽', 23194, 1, 0, 1),
+(NULL, '즈', 23195, 1, 0, 1),
+(NULL, '즑', 23196, 1, 0, 1),
+(NULL, '지', 23197, 1, 0, 1),
+(NULL, '질', 23198, 1, 0, 1),
+(NULL, '짓', 23199, 1, 0, 1),
+(NULL, '징', 23200, 1, 0, 1),
+(NULL, '짚', 23201, 1, 0, 1),
+(NULL, '짹', 23202, 1, 0, 1),
+(NULL, '쩡', 23203, 1, 0, 1),
+(NULL, '찜', 23204, 1, 0, 1),
+(NULL, '찢', 23205, 1, 0, 1),
+(NULL, '체', 23206, 1, 0, 1),
+(NULL, '초', 23207, 1, 0, 1),
+(NULL, '추', 23208, 1, 0, 1),
+(NULL, '춤', 23209, 1, 0, 1),
+(NULL, '취', 23210, 1, 0, 1),
+(NULL, '치', 23211, 1, 0, 1),
+(NULL, '카', 23212, 1, 0, 1),
+(NULL, '캡', 23213, 1, 0, 1),
+(NULL, '컵', 23214, 1, 0, 1),
+(NULL, '킴', 23215, 1, 0, 1),
+(NULL, '탈', 23216, 1, 0, 1),
+(NULL, '템', 23217, 1, 0, 1),
+(NULL, '토', 23218, 1, 0, 1),
+(NULL, '톳', 23219, 1, 0, 1),
+(NULL, '투', 23220, 1, 0, 1),
+(NULL, '툴', 23221, 1, 0, 1),
+(NULL, '퉯', 23222, 1, 0, 1),
+(NULL, '팀', 23223, 1, 0, 1),
+(NULL, '팁', 23224, 1, 0, 1),
+(NULL, '파', 23225, 1, 0, 1),
+(NULL, '팔', 23226, 1, 0, 1),
+(NULL, '팩', 23227, 1, 0, 1),
+(NULL, '퍼', 23228, 1, 0, 1),
+(NULL, '펌', 23229, 1, 0, 1),
+(NULL, '페', 23230, 1, 0, 1),
+(NULL, '펜', 23231, 1, 0, 1),
+(NULL, '폴', 23232, 1, 0, 1),
+(NULL, '핀', 23233, 1, 0, 1),
+(NULL, '필', 23234, 1, 0, 1),
+(NULL, '한', 23235, 1, 0, 1),
+(NULL, '햄', 23236, 1, 0, 1),
+(NULL, '혀', 23237, 1, 0, 1),
+(NULL, '홍', 23238, 1, 0, 1),
+(NULL, '황', 23239, 1, 0, 1),
+(NULL, '흄', 23240, 1, 0, 1),
+(NULL, '흉', 23241, 1, 0, 1),
+(NULL, '흐', 23242, 1, 0, 1),
+('囍', '희', 23243, 1, 0, 1),
+(NULL, '-군', 23244, 1, 0, 1),
+(NULL, 'ᄯᅢ', 23245, 1, 0, 1),
+(NULL, '三체', 23246, 1, 0, 1),
+(NULL, '何必', 23247, 1, 0, 1),
+(NULL, '假짜', 23248, 1, 0, 1),
+(NULL, '兄님', 23249, 1, 0, 1),
+(NULL, '全然', 23250, 1, 0, 1),
+(NULL, '十萬', 23251, 1, 0, 1),
+(NULL, '原來', 23252, 1, 0, 1),
+(NULL, '塼돌', 23253, 1, 0, 1),
+(NULL, '多分', 23254, 1, 0, 1),
+(NULL, '大略', 23255, 1, 0, 1),
+(NULL, '大박', 23256, 1, 0, 1),
+(NULL, '恒常', 23257, 1, 0, 1),
+(NULL, '成덕', 23258, 1, 0, 1),
+(NULL, '或是', 23259, 1, 0, 1),
+(NULL, '本來', 23260, 1, 0, 1),
+(NULL, '每年', 23261, 1, 0, 1),
+(NULL, '烝편', 23262, 1, 0, 1),
+(NULL, '甲질', 23263, 1, 0, 1),
+(NULL, '當然', 23264, 1, 0, 1),
+(NULL, '病맛', 23265, 1, 0, 1),
+(NULL, '百萬', 23266, 1, 0, 1),
+(NULL, '直接', 23267, 1, 0, 1),
+(NULL, '結局', 23268, 1, 0, 1),
+(NULL, '絕對', 23269, 1, 0, 1),
+(NULL, '繼續', 23270, 1, 0, 1),
+(NULL, '職딩', 23271, 1, 0, 1),
+(NULL, '萬若', 23272, 1, 0, 1),
+(NULL, '蒸편', 23273, 1, 0, 1),
+(NULL, '藥밥', 23274, 1, 0, 1),
+(NULL, '設令', 23275, 1, 0, 1),
+(NULL, '設使', 23276, 1, 0, 1),
+(NULL, '銃알', 23277, 1, 0, 1),
+(NULL, '가끔', 23278, 1, 0, 1),
+(NULL, '가나', 23279, 1, 0, 1),
+(NULL, '가난', 23280, 1, 0, 1),
+(NULL, '가닛', 23281, 1, 0, 1),
+(NULL, '가드', 23282, 1, 0, 1),
+(NULL, '가뢰', 23283, 1, 0, 1),
+(NULL, '가만', 23284, 1, 0, 1),
+(NULL, '가뭄', 23285, 1, 0, 1),
+('咖啡', '가배', 23286, 1, 0, 1),
+('袈裟', '가사', 23287, 1, 0, 1),
+(NULL, '가슬', 23288, 1, 0, 1),
+(NULL, '가실', 23289, 1, 0, 1),
+(NULL, '가우', 23290, 1, 0, 1),
+(NULL, '가웃', 23291, 1, 0, 1),
+(NULL, '가재', 23292, 1, 0, 1),
+(NULL, '가제', 23293, 1, 0, 1),
+(NULL, '가젤', 23294, 1, 0, 1),
+(NULL, '가죽', 23295, 1, 0, 1),
+(NULL, '간물', 23296, 1, 0, 1),
+(NULL, '간밤', 23297, 1, 0, 1),
+(NULL, '간수', 23298, 1, 0, 1),
+(NULL, '간쑤', 23299, 1, 0, 1),
+(NULL, '간장', 23300, 1, 0, 1),
+(NULL, '갈기', 23301, 1, 0, 1),
+(NULL, '갈대', 23302, 1, 0, 1),
+(NULL, '갈륨', 23303, 1, 0, 1),
+(NULL, '갈리', 23304, 1, 0, 1),
+(NULL, '갈림', 23305, 1, 0, 1),
+(NULL, '갈매', 23306, 1, 0, 1),
+(NULL, '갈밭', 23307, 1, 0, 1),
+(NULL, '갈보', 23308, 1, 0, 1),
+(NULL, '갈옷', 23309, 1, 0, 1),
+(NULL, '갈토', 23310, 1, 0, 1),
+('坩堝', '감과', 23311, 1, 0, 1),
+(NULL, '감마', 23312, 1, 0, 1),
+(NULL, '감자', 23313, 1, 0, 1),
+(NULL, '감지', 23314, 1, 0, 1),
+(NULL, '강애', 23315, 1, 0, 1),
+(NULL, '강정', 23316, 1, 0, 1),
+(NULL, '개꿩', 23317, 1, 0, 1),
+(NULL, '개뿔', 23318, 1, 0, 1),
+(NULL, '개암', 23319, 1, 0, 1),
+(NULL, '개울', 23320, 1, 0, 1),
+(NULL, '갠물', 23321, 1, 0, 1),
+(NULL, '갠엿', 23322, 1, 0, 1),
+(NULL, '갤리', 23323, 1, 0, 1),
+(NULL, '갯솜', 23324, 1, 0, 1),
+(NULL, '갱굴', 23325, 1, 0, 1),
+(NULL, '갱단', 23326, 1, 0, 1),
+(NULL, '거미', 23327, 1, 0, 1),
+(NULL, '거웃', 23328, 1, 0, 1),
+(NULL, '거이', 23329, 1, 0, 1),
+(NULL, '거즈', 23330, 1, 0, 1),
+(NULL, '거진', 23331, 1, 0, 1),
+(NULL, '거품', 23332, 1, 0, 1),
+(NULL, '거흠', 23333, 1, 0, 1),
+(NULL, '건너', 23334, 1, 0, 1),
+(NULL, '걷기', 23335, 1, 0, 1),
+(NULL, '걸핏', 23336, 1, 0, 1),
+(NULL, '검다', 23337, 1, 0, 1),
+(NULL, '검정', 23338, 1, 0, 1),
+(NULL, '게장', 23339, 1, 0, 1),
+(NULL, '게젓', 23340, 1, 0, 1),
+(NULL, '게타', 23341, 1, 0, 1),
+(NULL, '게하', 23342, 1, 0, 1),
+(NULL, '겨란', 23343, 1, 0, 1),
+(NULL, '겨르', 23344, 1, 0, 1),
+(NULL, '겨울', 23345, 1, 0, 1),
+(NULL, '겨자', 23346, 1, 0, 1),
+(NULL, '겨풀', 23347, 1, 0, 1),
+(NULL, '결코', 23348, 1, 0, 1),
+(NULL, '고글', 23349, 1, 0, 1),
+(NULL, '고대', 23350, 1, 0, 1),
+(NULL, '고름', 23351, 1, 0, 1),
+(NULL, '고명', 23352, 1, 0, 1),
+(NULL, '고무', 23353, 1, 0, 1),
+(NULL, '고빼', 23354, 1, 0, 1),
+(NULL, '고뿔', 23355, 1, 0, 1),
+(NULL, '고애', 23356, 1, 0, 1),
+(NULL, '고치', 23357, 1, 0, 1),
+(NULL, '곤뇽', 23358, 1, 0, 1),
+(NULL, '곤운', 23359, 1, 0, 1),
+(NULL, '곤이', 23360, 1, 0, 1),
+(NULL, '골다', 23361, 1, 0, 1),
+(NULL, '골무', 23362, 1, 0, 1),
+(NULL, '골치', 23363, 1, 0, 1),
+(NULL, '골프', 23364, 1, 0, 1),
+(NULL, '곰국', 23365, 1, 0, 1),
+(NULL, '곰소', 23366, 1, 0, 1),
+(NULL, '곰탕', 23367, 1, 0, 1),
+(NULL, '공기', 23368, 1, 0, 1),
+(NULL, '공알', 23369, 1, 0, 1),
+(NULL, '공짜', 23370, 1, 0, 1),
+('箜篌', '공후', 23371, 1, 0, 1),
+(NULL, '과녁', 23372, 1, 0, 1),
+(NULL, '과욕', 23373, 1, 0, 1),
+(NULL, '과일', 23374, 1, 0, 1),
+(NULL, '과편', 23375, 1, 0, 1),
+(NULL, '곽밥', 23376, 1, 0, 1),
+(NULL, '괌도', 23377, 1, 0, 1),
+(NULL, '광둥', 23378, 1, 0, 1),
+(NULL, '광시', 23379, 1, 0, 1),
+(NULL, '괘이', 23380, 1, 0, 1),
+(NULL, '괜히', 23381, 1, 0, 1),
+(NULL, '괴기', 23382, 1, 0, 1),
+(NULL, '교또', 23383, 1, 0, 1),
+(NULL, '교익', 23384, 1, 0, 1),
+(NULL, '교토', 23385, 1, 0, 1),
+('狡猾', '교활', 23386, 1, 0, 1),
+(NULL, '구글', 23387, 1, 0, 1),
+(NULL, '구녁', 23388, 1, 0, 1),
+(NULL, '구녕', 23389, 1, 0, 1),
+(NULL, '구농', 23390, 1, 0, 1),
+(NULL, '구두', 23391, 1, 0, 1),
+(NULL, '구름', 23392, 1, 0, 1),
+('蚯蚓', '구인', 23393, 1, 0, 1),
+(NULL, '국물', 23394, 1, 0, 1),
+(NULL, '국수', 23395, 1, 0, 1),
+(NULL, '국시', 23396, 1, 0, 1),
+(NULL, '국자', 23397, 1, 0, 1),
+(NULL, '굴레', 23398, 1, 0, 1),
+(NULL, '굴젓', 23399, 1, 0, 1),
+(NULL, '굵다', 23400, 1, 0, 1),
+(NULL, '궁기', 23401, 1, 0, 1),
+(NULL, '궝이', 23402, 1, 0, 1),
+(NULL, '귀리', 23403, 1, 0, 1),
+(NULL, '귀절', 23404, 1, 0, 1),
+(NULL, '귀지', 23405, 1, 0, 1),
+(NULL, '귓결', 23406, 1, 0, 1),
+(NULL, '귓불', 23407, 1, 0, 1),
+(NULL, '그女', 23408, 1, 0, 1),
+(NULL, '그날', 23409, 1, 0, 1),
+(NULL, '그네', 23410, 1, 0, 1),
+(NULL, '그때', 23411, 1, 0, 1),
+(NULL, '그람', 23412, 1, 0, 1),
+(NULL, '그램', 23413, 1, 0, 1),
+(NULL, '그륵', 23414, 1, 0, 1),
+(NULL, '그릴', 23415, 1, 0, 1),
+(NULL, '그만', 23416, 1, 0, 1),
+(NULL, '그믐', 23417, 1, 0, 1),
+(NULL, '그중', 23418, 1, 0, 1),
+(NULL, '그지', 23419, 1, 0, 1),
+(NULL, '그치', 23420, 1, 0, 1),
+(NULL, '글고', 23421, 1, 0, 1),
+(NULL, '글쇠', 23422, 1, 0, 1),
+(NULL, '글카', 23423, 1, 0, 1),
+('汲汲', '급급', 23424, 1, 0, 1),
+(NULL, '기니', 23425, 1, 0, 1),
+(NULL, '기래', 23426, 1, 0, 1),
+(NULL, '기발', 23427, 1, 0, 1),
+(NULL, '기와', 23428, 1, 0, 1),
+(NULL, '기육', 23429, 1, 0, 1),
+(NULL, '기자', 23430, 1, 0, 1),
+(NULL, '기중', 23431, 1, 0, 1),
+(NULL, '기체', 23432, 1, 0, 1),
+(NULL, '기침', 23433, 1, 0, 1),
+(NULL, '기타', 23434, 1, 0, 1),
+(NULL, '길가', 23435, 1, 0, 1),
+('䓀莄', '길경', 23436, 1, 0, 1),
+(NULL, '깁스', 23437, 1, 0, 1),
+(NULL, '깃대', 23438, 1, 0, 1),
+(NULL, '깃발', 23439, 1, 0, 1),
+(NULL, '깊다', 23440, 1, 0, 1),
+(NULL, '까께', 23441, 1, 0, 1),
+(NULL, '까뀌', 23442, 1, 0, 1),
+(NULL, '까벨', 23443, 1, 0, 1),
+(NULL, '깔다', 23444, 1, 0, 1),
+(NULL, '깻잎', 23445, 1, 0, 1),
+(NULL, '꺽지', 23446, 1, 0, 1),
+(NULL, '껭이', 23447, 1, 0, 1),
+(NULL, '꼬리', 23448, 1, 0, 1),
+(NULL, '꼬마', 23449, 1, 0, 1),
+(NULL, '꽁초', 23450, 1, 0, 1),
+(NULL, '꽁치', 23451, 1, 0, 1),
+(NULL, '꽂이', 23452, 1, 0, 1),
+(NULL, '꽃병', 23453, 1, 0, 1),
+(NULL, '꽃빵', 23454, 1, 0, 1),
+(NULL, '꽃잎', 23455, 1, 0, 1),
+(NULL, '꾸란', 23456, 1, 0, 1),
+(NULL, '꿀밤', 23457, 1, 0, 1),
+(NULL, '꿀벌', 23458, 1, 0, 1),
+(NULL, '꿇다', 23459, 1, 0, 1),
+(NULL, '뀌다', 23460, 1, 0, 1),
+(NULL, '끊임', 23461, 1, 0, 1),
+(NULL, '끌신', 23462, 1, 0, 1),
+(NULL, '끼니', 23463, 1, 0, 1),
+(NULL, '나래', 23464, 1, 0, 1),
+(NULL, '나룻', 23465, 1, 0, 1),
+(NULL, '나모', 23466, 1, 0, 1),
+(NULL, '나방', 23467, 1, 0, 1),
+(NULL, '나베', 23468, 1, 0, 1),
+('蘿蔔', '나복', 23469, 1, 0, 1),
+(NULL, '나소', 23470, 1, 0, 1),
+(NULL, '나시', 23471, 1, 0, 1),
+(NULL, '나이', 23472, 1, 0, 1),
+(NULL, '나조', 23473, 1, 0, 1),
+(NULL, '나치', 23474, 1, 0, 1),
+(NULL, '나토', 23475, 1, 0, 1),
+(NULL, '낙지', 23476, 1, 0, 1),
+(NULL, '낚다', 23477, 1, 0, 1),
+(NULL, '날다', 23478, 1, 0, 1),
+(NULL, '날숨', 23479, 1, 0, 1),
+(NULL, '날씨', 23480, 1, 0, 1),
+(NULL, '낡다', 23481, 1, 0, 1),
+(NULL, '남비', 23482, 1, 0, 1),
+(NULL, '남포', 23483, 1, 0, 1),
+(NULL, '낭구', 23484, 1, 0, 1),
+(NULL, '낭그', 23485, 1, 0, 1),
+(NULL, '낮다', 23486, 1, 0, 1),
+(NULL, '냄편', 23487, 1, 0, 1),
+(NULL, '냅킨', 23488, 1, 0, 1),
+(NULL, '냇가', 23489, 1, 0, 1),
+(NULL, '냉국', 23490, 1, 0, 1),
+(NULL, '냉이', 23491, 1, 0, 1),
+(NULL, '너덧', 23492, 1, 0, 1),
+(NULL, '너름', 23493, 1, 0, 1),
+(NULL, '너머', 23494, 1, 0, 1),
+(NULL, '너비', 23495, 1, 0, 1),
+(NULL, '너트', 23496, 1, 0, 1),
+(NULL, '너페', 23497, 1, 0, 1),
+(NULL, '널다', 23498, 1, 0, 1),
+(NULL, '넓이', 23499, 1, 0, 1),
+(NULL, '넢다', 23500, 1, 0, 1),
+(NULL, '네기', 23501, 1, 0, 1),
+(NULL, '네댓', 23502, 1, 0, 1),
+(NULL, '네온', 23503, 1, 0, 1),
+(NULL, '녀름', 23504, 1, 0, 1),
+(NULL, '녕하', 23505, 1, 0, 1),
+(NULL, '노랑', 23506, 1, 0, 1),
+(NULL, '노름', 23507, 1, 0, 1),
+(NULL, '노새', 23508, 1, 0, 1),
+(NULL, '노크', 23509, 1, 0, 1),
+(NULL, '노트', 23510, 1, 0, 1),
+(NULL, '논쥐', 23511, 1, 0, 1),
+(NULL, '놀토', 23512, 1, 0, 1),
+(NULL, '놋쇠', 23513, 1, 0, 1),
+(NULL, '농새', 23514, 1, 0, 1),
+(NULL, '높이', 23515, 1, 0, 1),
+(NULL, '뇨리', 23516, 1, 0, 1),
+(NULL, '뇨키', 23517, 1, 0, 1),
+(NULL, '뇽새', 23518, 1, 0, 1),
+(NULL, '누가', 23519, 1, 0, 1),
+(NULL, '누님', 23520, 1, 0, 1),
+(NULL, '누드', 23521, 1, 0, 1),
+(NULL, '누들', 23522, 1, 0, 1),
+(NULL, '누에', 23523, 1, 0, 1),
+(NULL, '누우', 23524, 1, 0, 1),
+(NULL, '누치', 23525, 1, 0, 1),
+(NULL, '누크', 23526, 1, 0, 1),
+(NULL, '눈꽃', 23527, 1, 0, 1),
+(NULL, '눈꿩', 23528, 1, 0, 1),
+(NULL, '눈물', 23529, 1, 0, 1),
+(NULL, '눈살', 23530, 1, 0, 1),
+(NULL, '눈썹', 23531, 1, 0, 1),
+(NULL, '눈알', 23532, 1, 0, 1),
+(NULL, '눈총', 23533, 1, 0, 1),
+(NULL, '눈치', 23534, 1, 0, 1),
+(NULL, '눕다', 23535, 1, 0, 1),
+(NULL, '눚다', 23536, 1, 0, 1),
+(NULL, '눟다', 23537, 1, 0, 1),
+(NULL, '뉴런', 23538, 1, 0, 1),
+(NULL, '뉴스', 23539, 1, 0, 1),
+(NULL, '뉵디', 23540, 1, 0, 1),
+(NULL, '느낌', 23541, 1, 0, 1),
+(NULL, '늘상', 23542, 1, 0, 1),
+(NULL, '능금', 23543, 1, 0, 1),
+(NULL, '늦다', 23544, 1, 0, 1),
+(NULL, '늦잠', 23545, 1, 0, 1),
+(NULL, '늫다', 23546, 1, 0, 1),
+(NULL, '니들', 23547, 1, 0, 1),
+(NULL, '니매', 23548, 1, 0, 1),
+(NULL, '니켈', 23549, 1, 0, 1),
+(NULL, '닉다', 23550, 1, 0, 1),
+(NULL, '닌자', 23551, 1, 0, 1),
+(NULL, '닌진', 23552, 1, 0, 1),
+(NULL, '닙다', 23553, 1, 0, 1),
+(NULL, '닝샤', 23554, 1, 0, 1),
+(NULL, '닣다', 23555, 1, 0, 1),
+(NULL, '다들', 23556, 1, 0, 1),
+(NULL, '다롄', 23557, 1, 0, 1),
+('교량', '다리', 23558, 1, 0, 1),
+(NULL, '다차', 23559, 1, 0, 1),
+(NULL, '단맛', 23560, 1, 0, 1),
+(NULL, '단묵', 23561, 1, 0, 1),
+(NULL, '단추', 23562, 1, 0, 1),
+(NULL, '달갈', 23563, 1, 0, 1),
+(NULL, '달갤', 23564, 1, 0, 1),
+(NULL, '달래', 23565, 1, 0, 1),
+(NULL, '달러', 23566, 1, 0, 1),
+(NULL, '달력', 23567, 1, 0, 1),
+(NULL, '달링', 23568, 1, 0, 1),
+(NULL, '달별', 23569, 1, 0, 1),
+(NULL, '달비', 23570, 1, 0, 1),
+(NULL, '달빛', 23571, 1, 0, 1),
+(NULL, '닭발', 23572, 1, 0, 1),
+(NULL, '닭살', 23573, 1, 0, 1),
+(NULL, '닭알', 23574, 1, 0, 1),
+(NULL, '닳다', 23575, 1, 0, 1),
+(NULL, '담다', 23576, 1, 0, 1),
+(NULL, '담바', 23577, 1, 0, 1),
+(NULL, '담요', 23578, 1, 0, 1),
+(NULL, '당고', 23579, 1, 0, 1),
+(NULL, '당귀', 23580, 1, 0, 1),
+('螳螂', '당랑', 23581, 1, 0, 1),
+('鏜鈀', '당파', 23582, 1, 0, 1),
+(NULL, '대게', 23583, 1, 0, 1),
+(NULL, '대딸', 23584, 1, 0, 1),
+(NULL, '대련', 23585, 1, 0, 1),
+(NULL, '대야', 23586, 1, 0, 1),
+(NULL, '대처', 23587, 1, 0, 1),
+(NULL, '댄서', 23588, 1, 0, 1),
+(NULL, '더빙', 23589, 1, 0, 1),
+(NULL, '더위', 23590, 1, 0, 1),
+(NULL, '더품', 23591, 1, 0, 1),
+(NULL, '덕다', 23592, 1, 0, 1),
+(NULL, '덕트', 23593, 1, 0, 1),
+(NULL, '덕후', 23594, 1, 0, 1),
+(NULL, '덜덜', 23595, 1, 0, 1),
+(NULL, '덤심', 23596, 1, 0, 1),
+(NULL, '덤핑', 23597, 1, 0, 1),
+(NULL, '덥다', 23598, 1, 0, 1),
+(NULL, '덧글', 23599, 1, 0, 1),
+(NULL, '덧니', 23600, 1, 0, 1),
+(NULL, '덧셈', 23601, 1, 0, 1),
+(NULL, '덩심', 23602, 1, 0, 1),
+(NULL, '덮개', 23603, 1, 0, 1),
+(NULL, '데망', 23604, 1, 0, 1),
+(NULL, '데몬', 23605, 1, 0, 1),
+(NULL, '데뷔', 23606, 1, 0, 1),
+(NULL, '데이', 23607, 1, 0, 1),
+(NULL, '데타', 23608, 1, 0, 1),
+(NULL, '델리', 23609, 1, 0, 1),
+(NULL, '델타', 23610, 1, 0, 1),
+(NULL, '뎐기', 23611, 1, 0, 1),
+(NULL, '뎐화', 23612, 1, 0, 1),
+(NULL, '도넛', 23613, 1, 0, 1),
+(NULL, '도리', 23614, 1, 0, 1),
+(NULL, '도마', 23615, 1, 0, 1),
+(NULL, '도미', 23616, 1, 0, 1),
+(NULL, '도분', 23617, 1, 0, 1),
+(NULL, '도새', 23618, 1, 0, 1),
+(NULL, '도이', 23619, 1, 0, 1),
+(NULL, '돈닢', 23620, 1, 0, 1),
+(NULL, '돌드', 23621, 1, 0, 1),
+(NULL, '돌솥', 23622, 1, 0, 1),
+(NULL, '동네', 23623, 1, 0, 1),
+(NULL, '동녘', 23624, 1, 0, 1),
+(NULL, '동미', 23625, 1, 0, 1),
+(NULL, '동상', 23626, 1, 0, 1),
+(NULL, '동이', 23627, 1, 0, 1),
+(NULL, '동쪽', 23628, 1, 0, 1),
+(NULL, '돛대', 23629, 1, 0, 1),
+(NULL, '돟다', 23630, 1, 0, 1),
+(NULL, '된醬', 23631, 1, 0, 1),
+(NULL, '둏다', 23632, 1, 0, 1),
+(NULL, '두께', 23633, 1, 0, 1),
+(NULL, '두마', 23634, 1, 0, 1),
+(NULL, '둘째', 23635, 1, 0, 1),
+(NULL, '둘치', 23636, 1, 0, 1),
+(NULL, '둥지', 23637, 1, 0, 1),
+(NULL, '둥치', 23638, 1, 0, 1),
+(NULL, '뒤뜰', 23639, 1, 0, 1),
+(NULL, '뒤쥐', 23640, 1, 0, 1),
+(NULL, '뒷간', 23641, 1, 0, 1),
+(NULL, '뒷맛', 23642, 1, 0, 1),
+(NULL, '뒷문', 23643, 1, 0, 1),
+(NULL, '듀엣', 23644, 1, 0, 1),
+(NULL, '드럼', 23645, 1, 0, 1),
+(NULL, '드론', 23646, 1, 0, 1),
+(NULL, '드롭', 23647, 1, 0, 1),
+(NULL, '드릴', 23648, 1, 0, 1),
+(NULL, '득템', 23649, 1, 0, 1),
+(NULL, '들것', 23650, 1, 0, 1),
+(NULL, '들깨', 23651, 1, 0, 1),
+(NULL, '들꽃', 23652, 1, 0, 1),
+(NULL, '들꿩', 23653, 1, 0, 1),
+(NULL, '들숨', 23654, 1, 0, 1),
+(NULL, '들판', 23655, 1, 0, 1),
+(NULL, '등걸', 23656, 1, 0, 1),
+(NULL, '디카', 23657, 1, 0, 1),
+(NULL, '딜리', 23658, 1, 0, 1),
+(NULL, '딤섬', 23659, 1, 0, 1),
+(NULL, '따깐', 23660, 1, 0, 1),
+(NULL, '따님', 23661, 1, 0, 1),
+(NULL, '따봉', 23662, 1, 0, 1),
+(NULL, '따이', 23663, 1, 0, 1),
+(NULL, '딱씨', 23664, 1, 0, 1),
+(NULL, '딱지', 23665, 1, 0, 1),
+(NULL, '딸기', 23666, 1, 0, 1),
+(NULL, '딸배', 23667, 1, 0, 1),
+(NULL, '땀띠', 23668, 1, 0, 1),
+(NULL, '땅감', 23669, 1, 0, 1),
+(NULL, '땅벌', 23670, 1, 0, 1),
+(NULL, '땅속', 23671, 1, 0, 1),
+(NULL, '땅콩', 23672, 1, 0, 1),
+(NULL, '땅크', 23673, 1, 0, 1),
+(NULL, '땋다', 23674, 1, 0, 1),
+(NULL, '땐노', 23675, 1, 0, 1),
+(NULL, '땐쓰', 23676, 1, 0, 1),
+(NULL, '땜납', 23677, 1, 0, 1),
+(NULL, '떠다', 23678, 1, 0, 1),
+(NULL, '떠세', 23679, 1, 0, 1),
+(NULL, '떨잠', 23680, 1, 0, 1),
+(NULL, '뗀노', 23681, 1, 0, 1),
+(NULL, '뗏목', 23682, 1, 0, 1),
+(NULL, '또는', 23683, 1, 0, 1),
+(NULL, '또래', 23684, 1, 0, 1),
+(NULL, '똠얌', 23685, 1, 0, 1),
+(NULL, '똥꼬', 23686, 1, 0, 1),
+(NULL, '똥배', 23687, 1, 0, 1),
+(NULL, '똥침', 23688, 1, 0, 1),
+(NULL, '뚜껑', 23689, 1, 0, 1),
+(NULL, '뚧다', 23690, 1, 0, 1),
+(NULL, '뜸씨', 23691, 1, 0, 1),
+(NULL, '뜻글', 23692, 1, 0, 1),
+(NULL, '띧다', 23693, 1, 0, 1),
+(NULL, '라돈', 23694, 1, 0, 1),
+(NULL, '라듐', 23695, 1, 0, 1),
+(NULL, '라벨', 23696, 1, 0, 1),
+(NULL, '라인', 23697, 1, 0, 1),
+(NULL, '라임', 23698, 1, 0, 1),
+(NULL, '라켓', 23699, 1, 0, 1),
+(NULL, '라텔', 23700, 1, 0, 1),
+(NULL, '락사', 23701, 1, 0, 1),
+(NULL, '랍비', 23702, 1, 0, 1),
+(NULL, '랜덤', 23703, 1, 0, 1),
+(NULL, '랜턴', 23704, 1, 0, 1),
+(NULL, '랠리', 23705, 1, 0, 1),
+(NULL, '램프', 23706, 1, 0, 1),
+(NULL, '랩탑', 23707, 1, 0, 1),
+(NULL, '랩톱', 23708, 1, 0, 1),
+(NULL, '랭크', 23709, 1, 0, 1),
+(NULL, '럭비', 23710, 1, 0, 1),
+(NULL, '레늄', 23711, 1, 0, 1),
+(NULL, '레닌', 23712, 1, 0, 1),
+(NULL, '레루', 23713, 1, 0, 1),
+(NULL, '레몬', 23714, 1, 0, 1),
+(NULL, '레벨', 23715, 1, 0, 1),
+(NULL, '레일', 23716, 1, 0, 1),
+(NULL, '렌즈', 23717, 1, 0, 1),
+(NULL, '로고', 23718, 1, 0, 1),
+(NULL, '로듐', 23719, 1, 0, 1),
+(NULL, '로메', 23720, 1, 0, 1),
+(NULL, '로봇', 23721, 1, 0, 1),
+(NULL, '로비', 23722, 1, 0, 1),
+(NULL, '로션', 23723, 1, 0, 1),
+(NULL, '로조', 23724, 1, 0, 1),
+(NULL, '로켓', 23725, 1, 0, 1),
+(NULL, '롤리', 23726, 1, 0, 1),
+(NULL, '롬곡', 23727, 1, 0, 1),
+(NULL, '루머', 23728, 1, 0, 1),
+(NULL, '루멘', 23729, 1, 0, 1),
+(NULL, '루베', 23730, 1, 0, 1),
+(NULL, '루블', 23731, 1, 0, 1),
+(NULL, '루비', 23732, 1, 0, 1),
+(NULL, '루시', 23733, 1, 0, 1),
+(NULL, '루저', 23734, 1, 0, 1),
+(NULL, '루페', 23735, 1, 0, 1),
+(NULL, '루프', 23736, 1, 0, 1),
+(NULL, '룰렛', 23737, 1, 0, 1),
+(NULL, '뤄양', 23738, 1, 0, 1),
+(NULL, '리듬', 23739, 1, 0, 1),
+(NULL, '리본', 23740, 1, 0, 1),
+(NULL, '리터', 23741, 1, 0, 1),
+(NULL, '리튬', 23742, 1, 0, 1),
+(NULL, '린스', 23743, 1, 0, 1),
+(NULL, '마늘', 23744, 1, 0, 1),
+(NULL, '마다', 23745, 1, 0, 1),
+(NULL, '마더', 23746, 1, 0, 1),
+(NULL, '마련', 23747, 1, 0, 1),
+(NULL, '마멋', 23748, 1, 0, 1),
+(NULL, '마선', 23749, 1, 0, 1),
+(NULL, '마이', 23750, 1, 0, 1),
+(NULL, '마카', 23751, 1, 0, 1),
+(NULL, '마캉', 23752, 1, 0, 1),
+(NULL, '마커', 23753, 1, 0, 1),
+(NULL, '마켓', 23754, 1, 0, 1),
+(NULL, '마포', 23755, 1, 0, 1),
+(NULL, '막場', 23756, 1, 0, 1),
+(NULL, '막帳', 23757, 1, 0, 1),
+(NULL, '막杖', 23758, 1, 0, 1),
+(NULL, '막醬', 23759, 1, 0, 1),
+(NULL, '막낭', 23760, 1, 0, 1),
+('鏌鎁', '막야', 23761, 1, 0, 1),
+(NULL, '막창', 23762, 1, 0, 1),
+(NULL, '만이', 23763, 1, 0, 1),
+(NULL, '맏형', 23764, 1, 0, 1),
+(NULL, '말레', 23765, 1, 0, 1),
+(NULL, '말문', 23766, 1, 0, 1),
+(NULL, '맘속', 23767, 1, 0, 1),
+(NULL, '맛젓', 23768, 1, 0, 1),
+(NULL, '망간', 23769, 1, 0, 1),
+(NULL, '망고', 23770, 1, 0, 1),
+(NULL, '망둑', 23771, 1, 0, 1),
+(NULL, '망초', 23772, 1, 0, 1),
+(NULL, '망치', 23773, 1, 0, 1),
+(NULL, '맞춤', 23774, 1, 0, 1),
+(NULL, '매달', 23775, 1, 0, 1),
+(NULL, '매자', 23776, 1, 0, 1),
+(NULL, '매칭', 23777, 1, 0, 1),
+(NULL, '맨발', 23778, 1, 0, 1),
+(NULL, '먄마', 23779, 1, 0, 1),
+(NULL, '머구', 23780, 1, 0, 1),
+(NULL, '머슴', 23781, 1, 0, 1),
+(NULL, '머신', 23782, 1, 0, 1),
+(NULL, '머전', 23783, 1, 0, 1),
+(NULL, '머피', 23784, 1, 0, 1),
+(NULL, '머핀', 23785, 1, 0, 1),
+(NULL, '먹기', 23786, 1, 0, 1),
+(NULL, '먼저', 23787, 1, 0, 1),
+(NULL, '먼점', 23788, 1, 0, 1),
+(NULL, '먼지', 23789, 1, 0, 1),
+(NULL, '멍에', 23790, 1, 0, 1),
+(NULL, '멍울', 23791, 1, 0, 1),
+(NULL, '메기', 23792, 1, 0, 1),
+(NULL, '메뉴', 23793, 1, 0, 1),
+(NULL, '메달', 23794, 1, 0, 1),
+(NULL, '메인', 23795, 1, 0, 1),
+(NULL, '메일', 23796, 1, 0, 1),
+(NULL, '메카', 23797, 1, 0, 1),
+(NULL, '메탄', 23798, 1, 0, 1),
+(NULL, '메터', 23799, 1, 0, 1),
+(NULL, '멘붕', 23800, 1, 0, 1),
+(NULL, '멜대', 23801, 1, 0, 1),
+(NULL, '멜로', 23802, 1, 0, 1),
+(NULL, '멜론', 23803, 1, 0, 1),
+(NULL, '멤버', 23804, 1, 0, 1),
+(NULL, '멧새', 23805, 1, 0, 1),
+('榠樝', '명자', 23806, 1, 0, 1),
+(NULL, '모구', 23807, 1, 0, 1),
+(NULL, '모기', 23808, 1, 0, 1),
+(NULL, '모냥', 23809, 1, 0, 1),
+(NULL, '모넁', 23810, 1, 0, 1),
+(NULL, '모델', 23811, 1, 0, 1),
+(NULL, '모뎀', 23812, 1, 0, 1),
+(NULL, '모두', 23813, 1, 0, 1),
+(NULL, '모듈', 23814, 1, 0, 1),
+(NULL, '모듬', 23815, 1, 0, 1),
+(NULL, '모래', 23816, 1, 0, 1),
+(NULL, '모루', 23817, 1, 0, 1),
+(NULL, '모리', 23818, 1, 0, 1),
+(NULL, '모살', 23819, 1, 0, 1),
+(NULL, '모에', 23820, 1, 0, 1),
+(NULL, '모음', 23821, 1, 0, 1),
+(NULL, '모찌', 23822, 1, 0, 1),
+(NULL, '모터', 23823, 1, 0, 1),
+(NULL, '모텔', 23824, 1, 0, 1),
+(NULL, '모토', 23825, 1, 0, 1),
+(NULL, '목발', 23826, 1, 0, 1),
+(NULL, '목숨', 23827, 1, 0, 1),
+(NULL, '목줄', 23828, 1, 0, 1),
+(NULL, '몬순', 23829, 1, 0, 1),
+(NULL, '몰다', 23830, 1, 0, 1),
+(NULL, '몹시', 23831, 1, 0, 1),
+(NULL, '무게', 23832, 1, 0, 1),
+(NULL, '무꾸', 23833, 1, 0, 1),
+(NULL, '무끼', 23834, 1, 0, 1),
+(NULL, '무명', 23835, 1, 0, 1),
+(NULL, '무수', 23836, 1, 0, 1),
+(NULL, '무시', 23837, 1, 0, 1),
+(NULL, '무우', 23838, 1, 0, 1),
+(NULL, '무유', 23839, 1, 0, 1),
+(NULL, '무이', 23840, 1, 0, 1),
+(NULL, '물감', 23841, 1, 0, 1),
+(NULL, '물기', 23842, 1, 0, 1),
+(NULL, '물꿩', 23843, 1, 0, 1),
+(NULL, '물똥', 23844, 1, 0, 1),
+(NULL, '물살', 23845, 1, 0, 1),
+(NULL, '물소', 23846, 1, 0, 1),
+(NULL, '물씨', 23847, 1, 0, 1),
+(NULL, '물위', 23848, 1, 0, 1),
+(NULL, '물음', 23849, 1, 0, 1),
+(NULL, '물통', 23850, 1, 0, 1),
+(NULL, '뮌헨', 23851, 1, 0, 1),
+(NULL, '뮤직', 23852, 1, 0, 1),
+(NULL, '미니', 23853, 1, 0, 1),
+(NULL, '미라', 23854, 1, 0, 1),
+(NULL, '미르', 23855, 1, 0, 1),
+(NULL, '미소', 23856, 1, 0, 1),
+(NULL, '미수', 23857, 1, 0, 1),
+(NULL, '미싱', 23858, 1, 0, 1),
+(NULL, '미아', 23859, 1, 0, 1),
+(NULL, '미우', 23860, 1, 0, 1),
+(NULL, '미처', 23861, 1, 0, 1),
+(NULL, '미터', 23862, 1, 0, 1),
+(NULL, '믹서', 23863, 1, 0, 1),
+(NULL, '밀다', 23864, 1, 0, 1),
+(NULL, '밀크', 23865, 1, 0, 1),
+(NULL, '밈화', 23866, 1, 0, 1),
+(NULL, '밍크', 23867, 1, 0, 1),
+(NULL, '바곤', 23868, 1, 0, 1),
+(NULL, '바냐', 23869, 1, 0, 1),
+(NULL, '바당', 23870, 1, 0, 1),
+('哱囉', '바라', 23871, 1, 0, 1),
+(NULL, '바램', 23872, 1, 0, 1),
+(NULL, '바륨', 23873, 1, 0, 1),
+(NULL, '바른', 23874, 1, 0, 1),
+(NULL, '바우', 23875, 1, 0, 1),
+(NULL, '바자', 23876, 1, 0, 1),
+(NULL, '바질', 23877, 1, 0, 1),
+(NULL, '바쿠', 23878, 1, 0, 1),
+(NULL, '박대', 23879, 1, 0, 1),
+(NULL, '박스', 23880, 1, 0, 1),
+(NULL, '박쥐', 23881, 1, 0, 1),
+(NULL, '반달', 23882, 1, 0, 1),
+(NULL, '반줄', 23883, 1, 0, 1),
+(NULL, '반쪽', 23884, 1, 0, 1),
+(NULL, '발등', 23885, 1, 0, 1),
+(NULL, '발레', 23886, 1, 0, 1),
+(NULL, '발목', 23887, 1, 0, 1),
+(NULL, '발밑', 23888, 1, 0, 1),
+(NULL, '밝쥐', 23889, 1, 0, 1),
+(NULL, '밤낮', 23890, 1, 0, 1),
+(NULL, '밤알', 23891, 1, 0, 1),
+(NULL, '밤톨', 23892, 1, 0, 1),
+(NULL, '밥다', 23893, 1, 0, 1),
+(NULL, '밥때', 23894, 1, 0, 1),
+(NULL, '밥맛', 23895, 1, 0, 1),
+(NULL, '밥솥', 23896, 1, 0, 1),
+(NULL, '밥집', 23897, 1, 0, 1),
+(NULL, '밧줄', 23898, 1, 0, 1),
+(NULL, '방구', 23899, 1, 0, 1),
+(NULL, '방긋', 23900, 1, 0, 1),
+(NULL, '방기', 23901, 1, 0, 1),
+(NULL, '방아', 23902, 1, 0, 1),
+(NULL, '방플', 23903, 1, 0, 1),
+('彷徨', '방황', 23904, 1, 0, 1),
+(NULL, '배담', 23905, 1, 0, 1),
+(NULL, '배무', 23906, 1, 0, 1),
+(NULL, '배암', 23907, 1, 0, 1),
+(NULL, '배지', 23908, 1, 0, 1),
+(NULL, '백신', 23909, 1, 0, 1),
+(NULL, '백업', 23910, 1, 0, 1),
+(NULL, '백장', 23911, 1, 0, 1),
+(NULL, '밸브', 23912, 1, 0, 1),
+(NULL, '뱅어', 23913, 1, 0, 1),
+(NULL, '뱅킹', 23914, 1, 0, 1),
+(NULL, '뱡기', 23915, 1, 0, 1),
+(NULL, '버거', 23916, 1, 0, 1),
+(NULL, '버그', 23917, 1, 0, 1),
+(NULL, '버미', 23918, 1, 0, 1),
+(NULL, '버섯', 23919, 1, 0, 1),
+(NULL, '버스', 23920, 1, 0, 1),
+(NULL, '버전', 23921, 1, 0, 1),
+(NULL, '버짐', 23922, 1, 0, 1),
+(NULL, '버찌', 23923, 1, 0, 1),
+(NULL, '버터', 23924, 1, 0, 1),
+(NULL, '버텅', 23925, 1, 0, 1),
+(NULL, '버튼', 23926, 1, 0, 1),
+(NULL, '벌기', 23927, 1, 0, 1),
+(NULL, '벌꿀', 23928, 1, 0, 1),
+(NULL, '벌다', 23929, 1, 0, 1),
+(NULL, '벌렁', 23930, 1, 0, 1),
+(NULL, '벌새', 23931, 1, 0, 1),
+(NULL, '벌써', 23932, 1, 0, 1),
+(NULL, '벌통', 23933, 1, 0, 1),
+(NULL, '베개', 23934, 1, 0, 1),
+(NULL, '베낌', 23935, 1, 0, 1),
+(NULL, '베달', 23936, 1, 0, 1),
+(NULL, '베레', 23937, 1, 0, 1),
+(NULL, '베로', 23938, 1, 0, 1),
+(NULL, '베리', 23939, 1, 0, 1),
+(NULL, '베타', 23940, 1, 0, 1),
+(NULL, '베틀', 23941, 1, 0, 1),
+(NULL, '벤치', 23942, 1, 0, 1),
+(NULL, '벨벳', 23943, 1, 0, 1),
+(NULL, '벨뷰', 23944, 1, 0, 1),
+(NULL, '벨트', 23945, 1, 0, 1),
+(NULL, '벳남', 23946, 1, 0, 1),
+(NULL, '벼락', 23947, 1, 0, 1),
+(NULL, '벼루', 23948, 1, 0, 1),
+(NULL, '벼룩', 23949, 1, 0, 1),
+(NULL, '벽돌', 23950, 1, 0, 1),
+(NULL, '별거', 23951, 1, 0, 1),
+(NULL, '병어', 23952, 1, 0, 1),
+(NULL, '보기', 23953, 1, 0, 1),
+(NULL, '보꾹', 23954, 1, 0, 1),
+(NULL, '보드', 23955, 1, 0, 1),
+(NULL, '보륨', 23956, 1, 0, 1),
+(NULL, '보리', 23957, 1, 0, 1),
+(NULL, '보배', 23958, 1, 0, 1),
+(NULL, '보습', 23959, 1, 0, 1),
+(NULL, '보잉', 23960, 1, 0, 1),
+(NULL, '보트', 23961, 1, 0, 1),
+(NULL, '복사', 23962, 1, 0, 1),
+(NULL, '복서', 23963, 1, 0, 1),
+(NULL, '복섬', 23964, 1, 0, 1),
+(NULL, '복싱', 23965, 1, 0, 1),
+(NULL, '복어', 23966, 1, 0, 1),
+(NULL, '볼륨', 23967, 1, 0, 1),
+(NULL, '볼링', 23968, 1, 0, 1),
+(NULL, '볼모', 23969, 1, 0, 1),
+(NULL, '볼펜', 23970, 1, 0, 1),
+(NULL, '봉사', 23971, 1, 0, 1),
+(NULL, '봉지', 23972, 1, 0, 1),
+(NULL, '부각', 23973, 1, 0, 1),
+(NULL, '부석', 23974, 1, 0, 1),
+(NULL, '부섴', 23975, 1, 0, 1),
+(NULL, '부엌', 23976, 1, 0, 1),
+(NULL, '부채', 23977, 1, 0, 1),
+(NULL, '부처', 23978, 1, 0, 1),
+(NULL, '부추', 23979, 1, 0, 1),
+(NULL, '부츠', 23980, 1, 0, 1),
+(NULL, '부치', 23981, 1, 0, 1),
+(NULL, '부탄', 23982, 1, 0, 1),
+(NULL, '부피', 23983, 1, 0, 1),
+(NULL, '불기', 23984, 1, 0, 1),
+(NULL, '불리', 23985, 1, 0, 1),
+(NULL, '붉다', 23986, 1, 0, 1),
+(NULL, '붓펜', 23987, 1, 0, 1),
+(NULL, '뷔페', 23988, 1, 0, 1),
+(NULL, '비개', 23989, 1, 0, 1),
+(NULL, '비건', 23990, 1, 0, 1),
+(NULL, '비김', 23991, 1, 0, 1),
+(NULL, '비녀', 23992, 1, 0, 1),
+(NULL, '비누', 23993, 1, 0, 1),
+(NULL, '비늘', 23994, 1, 0, 1),
+(NULL, '비닐', 23995, 1, 0, 1),
+(NULL, '비데', 23996, 1, 0, 1),
+(NULL, '비듬', 23997, 1, 0, 1),
+(NULL, '비르', 23998, 1, 0, 1),
+(NULL, '비박', 23999, 1, 0, 1),
+(NULL, '비버', 24000, 1, 0, 1),
+(NULL, '비새', 24001, 1, 0, 1),
+(NULL, '비얼', 24002, 1, 0, 1),
+(NULL, '비옷', 24003, 1, 0, 1),
+(NULL, '비자', 24004, 1, 0, 1),
+(NULL, '비탈', 24005, 1, 0, 1),
+(NULL, '비트', 24006, 1, 0, 1),
+('枇杷', '비파', 24007, 1, 0, 1),
+(NULL, '빅맥', 24008, 1, 0, 1),
+(NULL, '빈대', 24009, 1, 0, 1),
+(NULL, '빌기', 24010, 1, 0, 1),
+(NULL, '빌딩', 24011, 1, 0, 1),
+(NULL, '빗다', 24012, 1, 0, 1),
+(NULL, '빗속', 24013, 1, 0, 1),
+(NULL, '빗치', 24014, 1, 0, 1),
+(NULL, '빠다', 24015, 1, 0, 1),
+(NULL, '빠빠', 24016, 1, 0, 1),
+(NULL, '빤쯔', 24017, 1, 0, 1),
+(NULL, '빨강', 24018, 1, 0, 1),
+(NULL, '빨래', 24019, 1, 0, 1),
+(NULL, '빵집', 24020, 1, 0, 1),
+(NULL, '빼주', 24021, 1, 0, 1),
+(NULL, '뺏다', 24022, 1, 0, 1),
+(NULL, '뺑끼', 24023, 1, 0, 1),
+(NULL, '뻐스', 24024, 1, 0, 1),
+(NULL, '뼛골', 24025, 1, 0, 1),
+(NULL, '뽀끈', 24026, 1, 0, 1),
+(NULL, '뽐프', 24027, 1, 0, 1),
+(NULL, '뿌찐', 24028, 1, 0, 1),
+(NULL, '뿔매', 24029, 1, 0, 1),
+(NULL, '삑삑', 24030, 1, 0, 1),
+(NULL, '삥궐', 24031, 1, 0, 1),
+(NULL, '삥샹', 24032, 1, 0, 1),
+(NULL, '사냥', 24033, 1, 0, 1),
+(NULL, '사담', 24034, 1, 0, 1),
+(NULL, '사램', 24035, 1, 0, 1),
+(NULL, '사령', 24036, 1, 0, 1),
+(NULL, '사림', 24037, 1, 0, 1),
+(NULL, '사스', 24038, 1, 0, 1),
+(NULL, '사슬', 24039, 1, 0, 1),
+(NULL, '사슴', 24040, 1, 0, 1),
+(NULL, '사위', 24041, 1, 0, 1),
+(NULL, '사하', 24042, 1, 0, 1),
+(NULL, '산둥', 24043, 1, 0, 1),
+(NULL, '산수', 24044, 1, 0, 1),
+(NULL, '살결', 24045, 1, 0, 1),
+(NULL, '살구', 24046, 1, 0, 1),
+(NULL, '살롱', 24047, 1, 0, 1),
+(NULL, '살림', 24048, 1, 0, 1),
+(NULL, '살치', 24049, 1, 0, 1),
+(NULL, '살피', 24050, 1, 0, 1),
+(NULL, '삼바', 24051, 1, 0, 1),
+(NULL, '삼줄', 24052, 1, 0, 1),
+(NULL, '삿갓', 24053, 1, 0, 1),
+(NULL, '상어', 24054, 1, 0, 1),
+(NULL, '상추', 24055, 1, 0, 1),
+(NULL, '샇다', 24056, 1, 0, 1),
+(NULL, '새닥', 24057, 1, 0, 1),
+(NULL, '새들', 24058, 1, 0, 1),
+(NULL, '새미', 24059, 1, 0, 1),
+(NULL, '새박', 24060, 1, 0, 1),
+(NULL, '새복', 24061, 1, 0, 1),
+(NULL, '새비', 24062, 1, 0, 1),
+(NULL, '새앙', 24063, 1, 0, 1),
+(NULL, '새총', 24064, 1, 0, 1),
+(NULL, '새해', 24065, 1, 0, 1),
+(NULL, '색경', 24066, 1, 0, 1),
+(NULL, '색깔', 24067, 1, 0, 1),
+(NULL, '색아', 24068, 1, 0, 1),
+(NULL, '샌들', 24069, 1, 0, 1),
+(NULL, '샘터', 24070, 1, 0, 1),
+(NULL, '샘플', 24071, 1, 0, 1),
+(NULL, '샛길', 24072, 1, 0, 1),
+(NULL, '생우', 24073, 1, 0, 1),
+('笙簧', '생황', 24074, 1, 0, 1),
+(NULL, '샤먼', 24075, 1, 0, 1),
+(NULL, '샤발', 24076, 1, 0, 1),
+(NULL, '샤쓰', 24077, 1, 0, 1),
+(NULL, '샤워', 24078, 1, 0, 1),
+(NULL, '샤쯔', 24079, 1, 0, 1),
+(NULL, '샤타', 24080, 1, 0, 1),
+(NULL, '샬럿', 24081, 1, 0, 1),
+(NULL, '샴푸', 24082, 1, 0, 1),
+(NULL, '서밋', 24083, 1, 0, 1),
+(NULL, '서버', 24084, 1, 0, 1),
+(NULL, '서벌', 24085, 1, 0, 1),
+(NULL, '서사', 24086, 1, 0, 1),
+(NULL, '서쪽', 24087, 1, 0, 1),
+(NULL, '석달', 24088, 1, 0, 1),
+(NULL, '섞다', 24089, 1, 0, 1),
+(NULL, '선양', 24090, 1, 0, 1),
+(NULL, '선잠', 24091, 1, 0, 1),
+(NULL, '선전', 24092, 1, 0, 1),
+(NULL, '설날', 24093, 1, 0, 1),
+(NULL, '성게', 24094, 1, 0, 1),
+(NULL, '성야', 24095, 1, 0, 1),
+(NULL, '성전', 24096, 1, 0, 1),
+(NULL, '세꼬', 24097, 1, 0, 1),
+(NULL, '세날', 24098, 1, 0, 1),
+(NULL, '세륨', 24099, 1, 0, 1),
+(NULL, '세모', 24100, 1, 0, 1),
+(NULL, '세일', 24101, 1, 0, 1),
+(NULL, '세트', 24102, 1, 0, 1),
+(NULL, '섹션', 24103, 1, 0, 1),
+(NULL, '섹스', 24104, 1, 0, 1),
+(NULL, '섹시', 24105, 1, 0, 1),
+(NULL, '섹트', 24106, 1, 0, 1),
+(NULL, '센타', 24107, 1, 0, 1),
+(NULL, '센트', 24108, 1, 0, 1),
+(NULL, '셀카', 24109, 1, 0, 1),
+(NULL, '셈틀', 24110, 1, 0, 1),
+(NULL, '셈판', 24111, 1, 0, 1),
+(NULL, '셔벗', 24112, 1, 0, 1),
+(NULL, '셔울', 24113, 1, 0, 1),
+(NULL, '셔츠', 24114, 1, 0, 1),
+(NULL, '셔터', 24115, 1, 0, 1),
+(NULL, '셔틀', 24116, 1, 0, 1),
+(NULL, '셰계', 24117, 1, 0, 1),
+(NULL, '소곰', 24118, 1, 0, 1),
+(NULL, '소금', 24119, 1, 0, 1),
+(NULL, '소매', 24120, 1, 0, 1),
+(NULL, '소젖', 24121, 1, 0, 1),
+(NULL, '소치', 24122, 1, 0, 1),
+(NULL, '소파', 24123, 1, 0, 1),
+(NULL, '손끝', 24124, 1, 0, 1),
+(NULL, '손목', 24125, 1, 0, 1),
+(NULL, '손위', 24126, 1, 0, 1),
+(NULL, '솔개', 24127, 1, 0, 1),
+(NULL, '솔기', 24128, 1, 0, 1),
+(NULL, '솜땀', 24129, 1, 0, 1),
+(NULL, '솜씨', 24130, 1, 0, 1),
+(NULL, '솜털', 24131, 1, 0, 1),
+(NULL, '송장', 24132, 1, 0, 1),
+(NULL, '송편', 24133, 1, 0, 1),
+(NULL, '쇠뇌', 24134, 1, 0, 1),
+(NULL, '쇠북', 24135, 1, 0, 1),
+(NULL, '쇳돌', 24136, 1, 0, 1),
+(NULL, '쇼룸', 24137, 1, 0, 1),
+(NULL, '쇼츠', 24138, 1, 0, 1),
+(NULL, '쇼크', 24139, 1, 0, 1),
+(NULL, '쇼핑', 24140, 1, 0, 1),
+(NULL, '수놈', 24141, 1, 0, 1),
+(NULL, '수말', 24142, 1, 0, 1),
+(NULL, '수바', 24143, 1, 0, 1),
+(NULL, '수박', 24144, 1, 0, 1),
+(NULL, '수소', 24145, 1, 0, 1),
+(NULL, '수수', 24146, 1, 0, 1),
+(NULL, '수탉', 24147, 1, 0, 1),
+(NULL, '수프', 24148, 1, 0, 1),
+(NULL, '순무', 24149, 1, 0, 1),
+(NULL, '술게', 24150, 1, 0, 1),
+(NULL, '술탄', 24151, 1, 0, 1),
+(NULL, '숭어', 24152, 1, 0, 1),
+(NULL, '쉬리', 24153, 1, 0, 1),
+(NULL, '쉽게', 24154, 1, 0, 1),
+(NULL, '슈인', 24155, 1, 0, 1),
+(NULL, '스모', 24156, 1, 0, 1),
+(NULL, '스무', 24157, 1, 0, 1),
+(NULL, '스시', 24158, 1, 0, 1),
+(NULL, '스킬', 24159, 1, 0, 1),
+(NULL, '스타', 24160, 1, 0, 1),
+(NULL, '스텝', 24161, 1, 0, 1),
+(NULL, '스툴', 24162, 1, 0, 1),
+(NULL, '스튜', 24163, 1, 0, 1),
+(NULL, '스틱', 24164, 1, 0, 1),
+(NULL, '스푼', 24165, 1, 0, 1),
+(NULL, '스풀', 24166, 1, 0, 1),
+(NULL, '슬피', 24167, 1, 0, 1),
+(NULL, '시굴', 24168, 1, 0, 1),
+(NULL, '시다', 24169, 1, 0, 1),
+(NULL, '시디', 24170, 1, 0, 1),
+(NULL, '시럽', 24171, 1, 0, 1),
+(NULL, '시루', 24172, 1, 0, 1),
+(NULL, '시물', 24173, 1, 0, 1),
+(NULL, '시소', 24174, 1, 0, 1),
+(NULL, '시쇠', 24175, 1, 0, 1),
+(NULL, '시앗', 24176, 1, 0, 1),
+(NULL, '시위', 24177, 1, 0, 1),
+(NULL, '시장', 24178, 1, 0, 1),
+(NULL, '시즌', 24179, 1, 0, 1),
+(NULL, '시짱', 24180, 1, 0, 1),
+(NULL, '식기', 24181, 1, 0, 1),
+(NULL, '신년', 24182, 1, 0, 1),
+(NULL, '신장', 24183, 1, 0, 1),
+(NULL, '신젖', 24184, 1, 0, 1),
+(NULL, '싣기', 24185, 1, 0, 1),
+(NULL, '싣다', 24186, 1, 0, 1),
+('蟋蟀', '실솔', 24187, 1, 0, 1),
+(NULL, '실컷', 24188, 1, 0, 1),
+(NULL, '실톱', 24189, 1, 0, 1),
+(NULL, '심지', 24190, 1, 0, 1),
+(NULL, '십날', 24191, 1, 0, 1),
+(NULL, '싱어', 24192, 1, 0, 1),
+(NULL, '싸개', 24193, 1, 0, 1),
+(NULL, '싸리', 24194, 1, 0, 1),
+(NULL, '싸스', 24195, 1, 0, 1),
+(NULL, '쌀밥', 24196, 1, 0, 1),
+(NULL, '쌈장', 24197, 1, 0, 1),
+(NULL, '쌍발', 24198, 1, 0, 1),
+(NULL, '쌤통', 24199, 1, 0, 1),
+(NULL, '쌩얼', 24200, 1, 0, 1),
+(NULL, '쌱시', 24201, 1, 0, 1),
+(NULL, '써레', 24202, 1, 0, 1),
+(NULL, '썩캐', 24203, 1, 0, 1),
+(NULL, '쎄다', 24204, 1, 0, 1),
+(NULL, '쎈터', 24205, 1, 0, 1),
+(NULL, '쑤다', 24206, 1, 0, 1),
+(NULL, '쓰똘', 24207, 1, 0, 1),
+(NULL, '쓰리', 24208, 1, 0, 1),
+(NULL, '쓰촨', 24209, 1, 0, 1),
+(NULL, '쓴쑥', 24210, 1, 0, 1),
+(NULL, '쓸모', 24211, 1, 0, 1),
+(NULL, '씨수', 24212, 1, 0, 1),
+(NULL, '씨알', 24213, 1, 0, 1),
+(NULL, '씹새', 24214, 1, 0, 1),
+(NULL, '씻다', 24215, 1, 0, 1),
+(NULL, '아까', 24216, 1, 0, 1),
+(NULL, '아깨', 24217, 1, 0, 1),
+(NULL, '아다', 24218, 1, 0, 1),
+(NULL, '아들', 24219, 1, 0, 1),
+(NULL, '아랍', 24220, 1, 0, 1),
+(NULL, '아름', 24221, 1, 0, 1),
+(NULL, '아멘', 24222, 1, 0, 1),
+(NULL, '아씨', 24223, 1, 0, 1),
+('峨峨', '아아', 24224, 1, 0, 1),
+(NULL, '아웃', 24225, 1, 0, 1),
+(NULL, '아점', 24226, 1, 0, 1),
+(NULL, '아주', 24227, 1, 0, 1),
+(NULL, '아칙', 24228, 1, 0, 1),
+(NULL, '아픔', 24229, 1, 0, 1),
+(NULL, '안뜰', 24230, 1, 0, 1),
+(NULL, '안즉', 24231, 1, 0, 1),
+(NULL, '안직', 24232, 1, 0, 1),
+(NULL, '안쪽', 24233, 1, 0, 1),
+(NULL, '안해', 24234, 1, 0, 1),
+(NULL, '알다', 24235, 1, 0, 1),
+(NULL, '알라', 24236, 1, 0, 1),
+(NULL, '알밥', 24237, 1, 0, 1),
+(NULL, '알제', 24238, 1, 0, 1),
+(NULL, '알콜', 24239, 1, 0, 1),
+(NULL, '알파', 24240, 1, 0, 1),
+(NULL, '앓다', 24241, 1, 0, 1),
+(NULL, '암말', 24242, 1, 0, 1),
+(NULL, '암캐', 24243, 1, 0, 1),
+(NULL, '암탉', 24244, 1, 0, 1),
+(NULL, '앞문', 24245, 1, 0, 1),
+(NULL, '애기', 24246, 1, 0, 1),
+(NULL, '애니', 24247, 1, 0, 1),
+(NULL, '애아', 24248, 1, 0, 1),
+(NULL, '액션', 24249, 1, 0, 1),
+(NULL, '앨범', 24250, 1, 0, 1),
+(NULL, '앰풀', 24251, 1, 0, 1),
+(NULL, '앵경', 24252, 1, 0, 1),
+(NULL, '앵커', 24253, 1, 0, 1),
+(NULL, '앵콜', 24254, 1, 0, 1),
+(NULL, '야덟', 24255, 1, 0, 1),
+(NULL, '야드', 24256, 1, 0, 1),
+(NULL, '야라', 24257, 1, 0, 1),
+(NULL, '야레', 24258, 1, 0, 1),
+(NULL, '야바', 24259, 1, 0, 1),
+('揶揄', '야유', 24260, 1, 0, 1),
+(NULL, '야중', 24261, 1, 0, 1),
+(NULL, '야훼', 24262, 1, 0, 1),
+(NULL, '약대', 24263, 1, 0, 1),
+(NULL, '얇다', 24264, 1, 0, 1),
+(NULL, '얌차', 24265, 1, 0, 1),
+(NULL, '양곤', 24266, 1, 0, 1),
+(NULL, '양념', 24267, 1, 0, 1),
+(NULL, '양즈', 24268, 1, 0, 1),
+(NULL, '양키', 24269, 1, 0, 1),
+(NULL, '양태', 24270, 1, 0, 1),
+(NULL, '어귀', 24271, 1, 0, 1),
+(NULL, '어깨', 24272, 1, 0, 1),
+(NULL, '어디', 24273, 1, 0, 1),
+(NULL, '어매', 24274, 1, 0, 1),
+(NULL, '어묵', 24275, 1, 0, 1),
+(NULL, '어븀', 24276, 1, 0, 1),
+(NULL, '어서', 24277, 1, 0, 1),
+(NULL, '어제', 24278, 1, 0, 1),
+(NULL, '어찌', 24279, 1, 0, 1),
+(NULL, '어케', 24280, 1, 0, 1),
+(NULL, '어플', 24281, 1, 0, 1),
+(NULL, '언나', 24282, 1, 0, 1),
+(NULL, '언내', 24283, 1, 0, 1),
+(NULL, '얼라', 24284, 1, 0, 1),
+(NULL, '얼음', 24285, 1, 0, 1),
+(NULL, '얼짱', 24286, 1, 0, 1),
+(NULL, '얼핑', 24287, 1, 0, 1),
+(NULL, '엄지', 24288, 1, 0, 1),
+(NULL, '에뮤', 24289, 1, 0, 1),
+(NULL, '에탄', 24290, 1, 0, 1),
+(NULL, '엔진', 24291, 1, 0, 1),
+(NULL, '엘베', 24292, 1, 0, 1),
+(NULL, '엣날', 24293, 1, 0, 1),
+(NULL, '여뀌', 24294, 1, 0, 1),
+(NULL, '여끄', 24295, 1, 0, 1),
+(NULL, '여럿', 24296, 1, 0, 1),
+(NULL, '여름', 24297, 1, 0, 1),
+(NULL, '여새', 24298, 1, 0, 1),
+('茹茹', '여여', 24299, 1, 0, 1),
+(NULL, '연못', 24300, 1, 0, 1),
+(NULL, '연밥', 24301, 1, 0, 1),
+(NULL, '열넷', 24302, 1, 0, 1),
+(NULL, '열둘', 24303, 1, 0, 1),
+(NULL, '열매', 24304, 1, 0, 1),
+(NULL, '열셋', 24305, 1, 0, 1),
+(NULL, '열째', 24306, 1, 0, 1),
+(NULL, '염소', 24307, 1, 0, 1),
+('囹圄', '영어', 24308, 1, 0, 1),
+(NULL, '옇다', 24309, 1, 0, 1),
+(NULL, '예다', 24310, 1, 0, 1),
+(NULL, '예일', 24311, 1, 0, 1),
+(NULL, '예전', 24312, 1, 0, 1),
+(NULL, '옌지', 24313, 1, 0, 1),
+(NULL, '옛글', 24314, 1, 0, 1),
+(NULL, '오뎅', 24315, 1, 0, 1),
+(NULL, '오디', 24316, 1, 0, 1),
+(NULL, '오른', 24317, 1, 0, 1),
+(NULL, '오름', 24318, 1, 0, 1),
+(NULL, '오리', 24319, 1, 0, 1),
+(NULL, '오븐', 24320, 1, 0, 1),
+(NULL, '오얏', 24321, 1, 0, 1),
+(NULL, '오옴', 24322, 1, 0, 1),
+(NULL, '오이', 24323, 1, 0, 1),
+(NULL, '오젓', 24324, 1, 0, 1),
+(NULL, '오줌', 24325, 1, 0, 1),
+(NULL, '옥션', 24326, 1, 0, 1),
+(NULL, '온주', 24327, 1, 0, 1),
+(NULL, '올해', 24328, 1, 0, 1),
+(NULL, '옵션', 24329, 1, 0, 1),
+(NULL, '옷깃', 24330, 1, 0, 1),
+(NULL, '와셔', 24331, 1, 0, 1),
+(NULL, '와인', 24332, 1, 0, 1),
+(NULL, '와트', 24333, 1, 0, 1),
+(NULL, '왁찐', 24334, 1, 0, 1),
+(NULL, '완소', 24335, 1, 0, 1),
+('蜿蜒', '완연', 24336, 1, 0, 1),
+(NULL, '왈츠', 24337, 1, 0, 1),
+(NULL, '왕게', 24338, 1, 0, 1),
+(NULL, '왜래', 24339, 1, 0, 1),
+(NULL, '왜서', 24340, 1, 0, 1),
+(NULL, '외출', 24341, 1, 0, 1),
+(NULL, '왼손', 24342, 1, 0, 1),
+(NULL, '왼통', 24343, 1, 0, 1),
+(NULL, '요가', 24344, 1, 0, 1),
+(NULL, '요재', 24345, 1, 0, 1),
+(NULL, '요즘', 24346, 1, 0, 1),
+(NULL, '요트', 24347, 1, 0, 1),
+(NULL, '용돈', 24348, 1, 0, 1),
+(NULL, '우동', 24349, 1, 0, 1),
+(NULL, '우란', 24350, 1, 0, 1),
+(NULL, '우래', 24351, 1, 0, 1),
+(NULL, '우먼', 24352, 1, 0, 1),
+(NULL, '우물', 24353, 1, 0, 1),
+(NULL, '우엉', 24354, 1, 0, 1),
+(NULL, '우케', 24355, 1, 0, 1),
+(NULL, '우파', 24356, 1, 0, 1),
+(NULL, '울보', 24357, 1, 0, 1),
+(NULL, '웅굴', 24358, 1, 0, 1),
+(NULL, '웅데', 24359, 1, 0, 1),
+(NULL, '웅어', 24360, 1, 0, 1),
+(NULL, '워찌', 24361, 1, 0, 1),
+(NULL, '원룸', 24362, 1, 0, 1),
+(NULL, '원쑤', 24363, 1, 0, 1),
+(NULL, '웜뱃', 24364, 1, 0, 1),
+(NULL, '웬일', 24365, 1, 0, 1),
+(NULL, '웹툰', 24366, 1, 0, 1),
+(NULL, '윁남', 24367, 1, 0, 1),
+(NULL, '위글', 24368, 1, 0, 1),
+(NULL, '위층', 24369, 1, 0, 1),
+(NULL, '위키', 24370, 1, 0, 1),
+(NULL, '윈난', 24371, 1, 0, 1),
+(NULL, '윈도', 24372, 1, 0, 1),
+(NULL, '윗다', 24373, 1, 0, 1),
+(NULL, '윗몸', 24374, 1, 0, 1),
+(NULL, '윗옷', 24375, 1, 0, 1),
+(NULL, '유대', 24376, 1, 0, 1),
+(NULL, '유럽', 24377, 1, 0, 1),
+(NULL, '유심', 24378, 1, 0, 1),
+(NULL, '유엔', 24379, 1, 0, 1),
+(NULL, '유저', 24380, 1, 0, 1),
+(NULL, '유타', 24381, 1, 0, 1),
+(NULL, '육젓', 24382, 1, 0, 1),
+(NULL, '윤달', 24383, 1, 0, 1),
+(NULL, '율운', 24384, 1, 0, 1),
+(NULL, '으른', 24385, 1, 0, 1),
+(NULL, '읃다', 24386, 1, 0, 1),
+(NULL, '읎다', 24387, 1, 0, 1),
+(NULL, '이끼', 24388, 1, 0, 1),
+(NULL, '이따', 24389, 1, 0, 1),
+(NULL, '이림', 24390, 1, 0, 1),
+(NULL, '이맘', 24391, 1, 0, 1),
+(NULL, '이망', 24392, 1, 0, 1),
+(NULL, '이모', 24393, 1, 0, 1),
+(NULL, '이미', 24394, 1, 0, 1),
+(NULL, '이반', 24395, 1, 0, 1),
+(NULL, '이북', 24396, 1, 0, 1),
+(NULL, '이빨', 24397, 1, 0, 1),
+(NULL, '이삭', 24398, 1, 0, 1),
+(NULL, '이엉', 24399, 1, 0, 1),
+(NULL, '이웆', 24400, 1, 0, 1),
+(NULL, '이젠', 24401, 1, 0, 1),
+(NULL, '인小', 24402, 1, 0, 1),
+(NULL, '인저', 24403, 1, 0, 1),
+(NULL, '인지', 24404, 1, 0, 1),
+(NULL, '인촨', 24405, 1, 0, 1),
+(NULL, '인치', 24406, 1, 0, 1),
+(NULL, '인턴', 24407, 1, 0, 1),
+(NULL, '일꾼', 24408, 1, 0, 1),
+(NULL, '일벌', 24409, 1, 0, 1),
+(NULL, '일쑤', 24410, 1, 0, 1),
+(NULL, '일찍', 24411, 1, 0, 1),
+(NULL, '일터', 24412, 1, 0, 1),
+(NULL, '읽개', 24413, 1, 0, 1),
+(NULL, '읽다', 24414, 1, 0, 1),
+(NULL, '잃다', 24415, 1, 0, 1),
+(NULL, '임자', 24416, 1, 0, 1),
+(NULL, '입겿', 24417, 1, 0, 1),
+(NULL, '입덧', 24418, 1, 0, 1),
+(NULL, '입술', 24419, 1, 0, 1),
+(NULL, '잉크', 24420, 1, 0, 1),
+(NULL, '자꼬', 24421, 1, 0, 1),
+(NULL, '자다', 24422, 1, 0, 1),
+(NULL, '자두', 24423, 1, 0, 1),
+(NULL, '자석', 24424, 1, 0, 1),
+('雌蕊', '자예', 24425, 1, 0, 1),
+(NULL, '자욱', 24426, 1, 0, 1),
+(NULL, '자칼', 24427, 1, 0, 1),
+(NULL, '자켓', 24428, 1, 0, 1),
+(NULL, '작다', 24429, 1, 0, 1),
+(NULL, '작살', 24430, 1, 0, 1),
+(NULL, '작은', 24431, 1, 0, 1),
+(NULL, '잔대', 24432, 1, 0, 1),
+(NULL, '잔돈', 24433, 1, 0, 1),
+(NULL, '잔차', 24434, 1, 0, 1),
+(NULL, '잘그', 24435, 1, 0, 1),
+(NULL, '잠바', 24436, 1, 0, 1),
+(NULL, '잡개', 24437, 1, 0, 1),
+(NULL, '잡놈', 24438, 1, 0, 1),
+(NULL, '잣다', 24439, 1, 0, 1),
+(NULL, '장구', 24440, 1, 0, 1),
+(NULL, '장님', 24441, 1, 0, 1),
+(NULL, '장땡', 24442, 1, 0, 1),
+(NULL, '장르', 24443, 1, 0, 1),
+(NULL, '장시', 24444, 1, 0, 1),
+(NULL, '장쑤', 24445, 1, 0, 1),
+('鏘鏘', '장장', 24446, 1, 0, 1),
+(NULL, '잦다', 24447, 1, 0, 1),
+(NULL, '재킷', 24448, 1, 0, 1),
+(NULL, '재포', 24449, 1, 0, 1),
+(NULL, '잿빛', 24450, 1, 0, 1),
+(NULL, '쟈바', 24451, 1, 0, 1),
+(NULL, '저대', 24452, 1, 0, 1),
+('咀嚼', '저작', 24453, 1, 0, 1),
+(NULL, '저장', 24454, 1, 0, 1),
+(NULL, '점퍼', 24455, 1, 0, 1),
+(NULL, '점프', 24456, 1, 0, 1),
+(NULL, '젓대', 24457, 1, 0, 1),
+(NULL, '정지', 24458, 1, 0, 1),
+(NULL, '젖산', 24459, 1, 0, 1),
+(NULL, '제금', 24460, 1, 0, 1),
+(NULL, '제논', 24461, 1, 0, 1),
+(NULL, '제발', 24462, 1, 0, 1),
+(NULL, '제빵', 24463, 1, 0, 1),
+(NULL, '제우', 24464, 1, 0, 1),
+('鵜鶘', '제호', 24465, 1, 0, 1),
+(NULL, '젤리', 24466, 1, 0, 1),
+(NULL, '조기', 24467, 1, 0, 1),
+(NULL, '조깅', 24468, 1, 0, 1),
+(NULL, '조껴', 24469, 1, 0, 1),
+('笊籬', '조리', 24470, 1, 0, 1),
+('嘈嘈', '조조', 24471, 1, 0, 1),
+(NULL, '족하', 24472, 1, 0, 1),
+(NULL, '존나', 24473, 1, 0, 1),
+(NULL, '졸라', 24474, 1, 0, 1),
+(NULL, '좀비', 24475, 1, 0, 1),
+(NULL, '좀약', 24476, 1, 0, 1),
+(NULL, '좁다', 24477, 1, 0, 1),
+(NULL, '종개', 24478, 1, 0, 1),
+(NULL, '종이', 24479, 1, 0, 1),
+(NULL, '죙이', 24480, 1, 0, 1),
+(NULL, '죠이', 24481, 1, 0, 1),
+(NULL, '주노', 24482, 1, 0, 1),
+(NULL, '주먹', 24483, 1, 0, 1),
+(NULL, '주바', 24484, 1, 0, 1),
+(NULL, '주스', 24485, 1, 0, 1),
+(NULL, '줄풀', 24486, 1, 0, 1),
+(NULL, '쥬스', 24487, 1, 0, 1),
+(NULL, '즈믄', 24488, 1, 0, 1),
+(NULL, '즘슴', 24489, 1, 0, 1),
+(NULL, '지끔', 24490, 1, 0, 1),
+(NULL, '지내', 24491, 1, 0, 1),
+(NULL, '지네', 24492, 1, 0, 1),
+(NULL, '지렁', 24493, 1, 0, 1),
+(NULL, '지름', 24494, 1, 0, 1),
+(NULL, '지린', 24495, 1, 0, 1),
+(NULL, '지벙', 24496, 1, 0, 1),
+(NULL, '지붕', 24497, 1, 0, 1),
+(NULL, '지슬', 24498, 1, 0, 1),
+('蜘蛛', '지주', 24499, 1, 0, 1),
+(NULL, '직발', 24500, 1, 0, 1),
+(NULL, '직캠', 24501, 1, 0, 1),
+(NULL, '진흙', 24502, 1, 0, 1),
+(NULL, '질다', 24503, 1, 0, 1),
+(NULL, '짊다', 24504, 1, 0, 1),
+(NULL, '집다', 24505, 1, 0, 1),
+(NULL, '집시', 24506, 1, 0, 1),
+(NULL, '집안', 24507, 1, 0, 1),
+(NULL, '집채', 24508, 1, 0, 1),
+(NULL, '짝남', 24509, 1, 0, 1),
+(NULL, '짝녀', 24510, 1, 0, 1),
+(NULL, '짠디', 24511, 1, 0, 1),
+(NULL, '짧다', 24512, 1, 0, 1),
+(NULL, '짼지', 24513, 1, 0, 1),
+(NULL, '쨋다', 24514, 1, 0, 1),
+(NULL, '쨎다', 24515, 1, 0, 1),
+(NULL, '쪼끔', 24516, 1, 0, 1),
+(NULL, '쪼다', 24517, 1, 0, 1),
+(NULL, '쪼박', 24518, 1, 0, 1),
+(NULL, '쫄면', 24519, 1, 0, 1),
+(NULL, '쭝쯔', 24520, 1, 0, 1),
+(NULL, '쯔놈', 24521, 1, 0, 1),
+(NULL, '찌개', 24522, 1, 0, 1),
+(NULL, '찌창', 24523, 1, 0, 1),
+(NULL, '찔레', 24524, 1, 0, 1),
+(NULL, '차드', 24525, 1, 0, 1),
+(NULL, '차임', 24526, 1, 0, 1),
+(NULL, '차재', 24527, 1, 0, 1),
+(NULL, '차터', 24528, 1, 0, 1),
+(NULL, '차트', 24529, 1, 0, 1),
+(NULL, '찬국', 24530, 1, 0, 1),
+(NULL, '찰밥', 24531, 1, 0, 1),
+(NULL, '찰벼', 24532, 1, 0, 1),
+(NULL, '찰스', 24533, 1, 0, 1),
+(NULL, '찰흙', 24534, 1, 0, 1),
+(NULL, '참깨', 24535, 1, 0, 1),
+(NULL, '참돔', 24536, 1, 0, 1),
+(NULL, '참바', 24537, 1, 0, 1),
+(NULL, '참빗', 24538, 1, 0, 1),
+(NULL, '참외', 24539, 1, 0, 1),
+(NULL, '찹쌀', 24540, 1, 0, 1),
+(NULL, '찻잔', 24541, 1, 0, 1),
+(NULL, '찻집', 24542, 1, 0, 1),
+(NULL, '창밖', 24543, 1, 0, 1),
+(NULL, '창사', 24544, 1, 0, 1),
+(NULL, '창턱', 24545, 1, 0, 1),
+(NULL, '창펀', 24546, 1, 0, 1),
+(NULL, '채널', 24547, 1, 0, 1),
+(NULL, '채미', 24548, 1, 0, 1),
+(NULL, '채찍', 24549, 1, 0, 1),
+(NULL, '채플', 24550, 1, 0, 1),
+(NULL, '책들', 24551, 1, 0, 1),
+(NULL, '처마', 24552, 1, 0, 1),
+('剔抉', '척결', 24553, 1, 0, 1),
+('鶺鴒', '척령', 24554, 1, 0, 1),
+(NULL, '천둥', 24555, 1, 0, 1),
+(NULL, '철릭', 24556, 1, 0, 1),
+(NULL, '체네', 24557, 1, 0, 1),
+(NULL, '체리', 24558, 1, 0, 1),
+(NULL, '체인', 24559, 1, 0, 1),
+(NULL, '첼로', 24560, 1, 0, 1),
+(NULL, '초딩', 24561, 1, 0, 1),
+(NULL, '초마', 24562, 1, 0, 1),
+(NULL, '초밥', 24563, 1, 0, 1),
+(NULL, '촛대', 24564, 1, 0, 1),
+(NULL, '촛불', 24565, 1, 0, 1),
+('悤悤', '총총', 24566, 1, 0, 1),
+(NULL, '추다', 24567, 1, 0, 1),
+(NULL, '추리', 24568, 1, 0, 1),
+(NULL, '추위', 24569, 1, 0, 1),
+(NULL, '춤군', 24570, 1, 0, 1),
+(NULL, '춤꾼', 24571, 1, 0, 1),
+(NULL, '춥다', 24572, 1, 0, 1),
+(NULL, '치리', 24573, 1, 0, 1),
+(NULL, '치맥', 24574, 1, 0, 1),
+(NULL, '치즈', 24575, 1, 0, 1),
+(NULL, '칙칙', 24576, 1, 0, 1),
+(NULL, '칠레', 24577, 1, 0, 1),
+(NULL, '칠리', 24578, 1, 0, 1),
+(NULL, '칩다', 24579, 1, 0, 1),
+(NULL, '칫솔', 24580, 1, 0, 1),
+(NULL, '카나', 24581, 1, 0, 1),
+(NULL, '카드', 24582, 1, 0, 1),
+(NULL, '카레', 24583, 1, 0, 1),
+(NULL, '카브', 24584, 1, 0, 1),
+(NULL, '카톡', 24585, 1, 0, 1),
+(NULL, '카트', 24586, 1, 0, 1),
+(NULL, '카플', 24587, 1, 0, 1),
+(NULL, '칼라', 24588, 1, 0, 1),
+(NULL, '칼럼', 24589, 1, 0, 1),
+(NULL, '칼륨', 24590, 1, 0, 1),
+(NULL, '칼새', 24591, 1, 0, 1),
+(NULL, '칼슘', 24592, 1, 0, 1),
+(NULL, '캐넌', 24593, 1, 0, 1),
+(NULL, '캐빈', 24594, 1, 0, 1),
+(NULL, '캔디', 24595, 1, 0, 1),
+(NULL, '캠프', 24596, 1, 0, 1),
+(NULL, '캠핑', 24597, 1, 0, 1),
+(NULL, '캡슐', 24598, 1, 0, 1),
+(NULL, '커닝', 24599, 1, 0, 1),
+(NULL, '커리', 24600, 1, 0, 1),
+(NULL, '커먼', 24601, 1, 0, 1),
+(NULL, '커서', 24602, 1, 0, 1),
+(NULL, '커튼', 24603, 1, 0, 1),
+(NULL, '커플', 24604, 1, 0, 1),
+(NULL, '커피', 24605, 1, 0, 1),
+(NULL, '컬트', 24606, 1, 0, 1),
+(NULL, '컴백', 24607, 1, 0, 1),
+(NULL, '컴터', 24608, 1, 0, 1),
+(NULL, '케밥', 24609, 1, 0, 1),
+(NULL, '케블', 24610, 1, 0, 1),
+(NULL, '케익', 24611, 1, 0, 1),
+(NULL, '케첩', 24612, 1, 0, 1),
+(NULL, '켤레', 24613, 1, 0, 1),
+(NULL, '코냑', 24614, 1, 0, 1),
+(NULL, '코너', 24615, 1, 0, 1),
+(NULL, '코스', 24616, 1, 0, 1),
+(NULL, '코치', 24617, 1, 0, 1),
+(NULL, '코튼', 24618, 1, 0, 1),
+(NULL, '코피', 24619, 1, 0, 1),
+(NULL, '콘돔', 24620, 1, 0, 1),
+(NULL, '콘리', 24621, 1, 0, 1),
+(NULL, '콜라', 24622, 1, 0, 1),
+(NULL, '콜론', 24623, 1, 0, 1),
+(NULL, '콤마', 24624, 1, 0, 1),
+(NULL, '콩고', 24625, 1, 0, 1),
+(NULL, '콩묵', 24626, 1, 0, 1),
+(NULL, '콩트', 24627, 1, 0, 1),
+(NULL, '쿠냥', 24628, 1, 0, 1),
+(NULL, '쿠션', 24629, 1, 0, 1),
+(NULL, '쿠키', 24630, 1, 0, 1),
+(NULL, '쿠폰', 24631, 1, 0, 1),
+(NULL, '쿵후', 24632, 1, 0, 1),
+(NULL, '쿼크', 24633, 1, 0, 1),
+(NULL, '쿼티', 24634, 1, 0, 1),
+(NULL, '퀴륨', 24635, 1, 0, 1),
+(NULL, '퀴즈', 24636, 1, 0, 1),
+(NULL, '퀴퍼', 24637, 1, 0, 1),
+(NULL, '크게', 24638, 1, 0, 1),
+(NULL, '크기', 24639, 1, 0, 1),
+(NULL, '크롬', 24640, 1, 0, 1),
+(NULL, '크림', 24641, 1, 0, 1),
+(NULL, '큰낫', 24642, 1, 0, 1),
+(NULL, '큰술', 24643, 1, 0, 1),
+(NULL, '클랜', 24644, 1, 0, 1),
+(NULL, '클릭', 24645, 1, 0, 1),
+(NULL, '클립', 24646, 1, 0, 1),
+(NULL, '키슈', 24647, 1, 0, 1),
+(NULL, '키위', 24648, 1, 0, 1),
+(NULL, '키치', 24649, 1, 0, 1),
+(NULL, '키토', 24650, 1, 0, 1),
+(NULL, '킬트', 24651, 1, 0, 1),
+(NULL, '타겟', 24652, 1, 0, 1),
+(NULL, '타깃', 24653, 1, 0, 1),
+(NULL, '타로', 24654, 1, 0, 1),
+(NULL, '타워', 24655, 1, 0, 1),
+(NULL, '타월', 24656, 1, 0, 1),
+(NULL, '타일', 24657, 1, 0, 1),
+(NULL, '타입', 24658, 1, 0, 1),
+(NULL, '탄알', 24659, 1, 0, 1),
+(NULL, '탄재', 24660, 1, 0, 1),
+(NULL, '탈륨', 24661, 1, 0, 1),
+(NULL, '탐폰', 24662, 1, 0, 1),
+(NULL, '태그', 24663, 1, 0, 1),
+(NULL, '택견', 24664, 1, 0, 1),
+(NULL, '택시', 24665, 1, 0, 1),
+(NULL, '탱고', 24666, 1, 0, 1),
+(NULL, '탱자', 24667, 1, 0, 1),
+(NULL, '탱커', 24668, 1, 0, 1),
+(NULL, '터널', 24669, 1, 0, 1),
+(NULL, '터부', 24670, 1, 0, 1),
+(NULL, '터븀', 24671, 1, 0, 1),
+(NULL, '터빈', 24672, 1, 0, 1),
+(NULL, '턱뼈', 24673, 1, 0, 1),
+(NULL, '턱선', 24674, 1, 0, 1),
+(NULL, '털보', 24675, 1, 0, 1),
+(NULL, '텃밭', 24676, 1, 0, 1),
+(NULL, '테프', 24677, 1, 0, 1),
+(NULL, '텐구', 24678, 1, 0, 1),
+(NULL, '텐션', 24679, 1, 0, 1),
+(NULL, '텐트', 24680, 1, 0, 1),
+(NULL, '톈진', 24681, 1, 0, 1),
+(NULL, '토고', 24682, 1, 0, 1),
+(NULL, '토라', 24683, 1, 0, 1),
+(NULL, '토록', 24684, 1, 0, 1),
+(NULL, '토륨', 24685, 1, 0, 1),
+(NULL, '토시', 24686, 1, 0, 1),
+(NULL, '토치', 24687, 1, 0, 1),
+(NULL, '토픽', 24688, 1, 0, 1),
+(NULL, '톱밥', 24689, 1, 0, 1),
+(NULL, '통字', 24690, 1, 0, 1),
+(NULL, '통가', 24691, 1, 0, 1),
+(NULL, '투먼', 24692, 1, 0, 1),
+(NULL, '투어', 24693, 1, 0, 1),
+(NULL, '툴륨', 24694, 1, 0, 1),
+(NULL, '튀각', 24695, 1, 0, 1),
+(NULL, '튤립', 24696, 1, 0, 1),
+(NULL, '트램', 24697, 1, 0, 1),
+(NULL, '트럭', 24698, 1, 0, 1),
+(NULL, '트롤', 24699, 1, 0, 1),
+(NULL, '트름', 24700, 1, 0, 1),
+(NULL, '트젠', 24701, 1, 0, 1),
+(NULL, '튼살', 24702, 1, 0, 1),
+(NULL, '티슈', 24703, 1, 0, 1),
+(NULL, '티켓', 24704, 1, 0, 1),
+(NULL, '팀부', 24705, 1, 0, 1),
+(NULL, '파랑', 24706, 1, 0, 1),
+(NULL, '파래', 24707, 1, 0, 1),
+(NULL, '파리', 24708, 1, 0, 1),
+(NULL, '파마', 24709, 1, 0, 1),
+(NULL, '파일', 24710, 1, 0, 1),
+(NULL, '파티', 24711, 1, 0, 1),
+(NULL, '판다', 24712, 1, 0, 1),
+(NULL, '팔다', 24713, 1, 0, 1),
+(NULL, '팔목', 24714, 1, 0, 1),
+(NULL, '팜쥐', 24715, 1, 0, 1),
+(NULL, '팝스', 24716, 1, 0, 1),
+(NULL, '팝콘', 24717, 1, 0, 1),
+(NULL, '팡주', 24718, 1, 0, 1),
+(NULL, '팥소', 24719, 1, 0, 1),
+(NULL, '패스', 24720, 1, 0, 1),
+(NULL, '패킷', 24721, 1, 0, 1),
+(NULL, '패턴', 24722, 1, 0, 1),
+(NULL, '팬덤', 24723, 1, 0, 1),
+(NULL, '팬픽', 24724, 1, 0, 1),
+(NULL, '팽이', 24725, 1, 0, 1),
+(NULL, '퍼슷', 24726, 1, 0, 1),
+(NULL, '퍼즐', 24727, 1, 0, 1),
+(NULL, '펀치', 24728, 1, 0, 1),
+(NULL, '펄서', 24729, 1, 0, 1),
+(NULL, '펌프', 24730, 1, 0, 1),
+(NULL, '페니', 24731, 1, 0, 1),
+(NULL, '페달', 24732, 1, 0, 1),
+(NULL, '페럿', 24733, 1, 0, 1),
+(NULL, '페지', 24734, 1, 0, 1),
+(NULL, '펜션', 24735, 1, 0, 1),
+(NULL, '펜싱', 24736, 1, 0, 1),
+(NULL, '펜지', 24737, 1, 0, 1),
+(NULL, '펜팔', 24738, 1, 0, 1),
+(NULL, '펭귄', 24739, 1, 0, 1),
+('蝙蝠', '편복', 24740, 1, 0, 1),
+(NULL, '편자', 24741, 1, 0, 1),
+(NULL, '평지', 24742, 1, 0, 1),
+(NULL, '포럼', 24743, 1, 0, 1),
+(NULL, '포즈', 24744, 1, 0, 1),
+(NULL, '포치', 24745, 1, 0, 1),
+(NULL, '포켓', 24746, 1, 0, 1),
+(NULL, '포트', 24747, 1, 0, 1),
+('咆哮', '포효', 24748, 1, 0, 1),
+(NULL, '폴다', 24749, 1, 0, 1),
+(NULL, '폴더', 24750, 1, 0, 1),
+(NULL, '폴로', 24751, 1, 0, 1),
+(NULL, '폴이', 24752, 1, 0, 1),
+(NULL, '퐁뒤', 24753, 1, 0, 1),
+(NULL, '표고', 24754, 1, 0, 1),
+(NULL, '푸들', 24755, 1, 0, 1),
+(NULL, '푸를', 24756, 1, 0, 1),
+(NULL, '푸젠', 24757, 1, 0, 1),
+(NULL, '푸틴', 24758, 1, 0, 1),
+(NULL, '풋콩', 24759, 1, 0, 1),
+(NULL, '풍풍', 24760, 1, 0, 1),
+(NULL, '프랑', 24761, 1, 0, 1),
+(NULL, '프롯', 24762, 1, 0, 1),
+(NULL, '피다', 24763, 1, 0, 1),
+(NULL, '피시', 24764, 1, 0, 1),
+(NULL, '피워', 24765, 1, 0, 1),
+(NULL, '피자', 24766, 1, 0, 1),
+(NULL, '피지', 24767, 1, 0, 1),
+(NULL, '피톨', 24768, 1, 0, 1),
+(NULL, '피트', 24769, 1, 0, 1),
+(NULL, '픽션', 24770, 1, 0, 1),
+(NULL, '픽업', 24771, 1, 0, 1),
+(NULL, '핀셋', 24772, 1, 0, 1),
+(NULL, '핀지', 24773, 1, 0, 1),
+(NULL, '필드', 24774, 1, 0, 1),
+('觱篥', '필률', 24775, 1, 0, 1),
+(NULL, '필름', 24776, 1, 0, 1),
+(NULL, '필림', 24777, 1, 0, 1),
+(NULL, '필터', 24778, 1, 0, 1),
+(NULL, '핑크', 24779, 1, 0, 1),
+(NULL, '하날', 24780, 1, 0, 1),
+(NULL, '하늬', 24781, 1, 0, 1),
+(NULL, '하매', 24782, 1, 0, 1),
+(NULL, '하슘', 24783, 1, 0, 1),
+(NULL, '하양', 24784, 1, 0, 1),
+(NULL, '하즈', 24785, 1, 0, 1),
+(NULL, '하지', 24786, 1, 0, 1),
+(NULL, '하키', 24787, 1, 0, 1),
+(NULL, '하품', 24788, 1, 0, 1),
+(NULL, '한눈', 24789, 1, 0, 1),
+(NULL, '한때', 24790, 1, 0, 1),
+(NULL, '한숨', 24791, 1, 0, 1),
+(NULL, '한쪽', 24792, 1, 0, 1),
+(NULL, '한참', 24793, 1, 0, 1),
+(NULL, '한탕', 24794, 1, 0, 1),
+(NULL, '할멈', 24795, 1, 0, 1),
+(NULL, '핥다', 24796, 1, 0, 1),
+(NULL, '함께', 24797, 1, 0, 1),
+(NULL, '함자', 24798, 1, 0, 1),
+(NULL, '해개', 24799, 1, 0, 1),
+(NULL, '해구', 24800, 1, 0, 1),
+(NULL, '해다', 24801, 1, 0, 1),
+(NULL, '해커', 24802, 1, 0, 1),
+(NULL, '해킹', 24803, 1, 0, 1),
+(NULL, '핵고', 24804, 1, 0, 1),
+(NULL, '핵교', 24805, 1, 0, 1),
+(NULL, '행불', 24806, 1, 0, 1),
+(NULL, '허난', 24807, 1, 0, 1),
+(NULL, '허다', 24808, 1, 0, 1),
+(NULL, '허들', 24809, 1, 0, 1),
+(NULL, '허벅', 24810, 1, 0, 1),
+(NULL, '허파', 24811, 1, 0, 1),
+(NULL, '헤기', 24812, 1, 0, 1),
+(NULL, '헤베', 24813, 1, 0, 1),
+(NULL, '헬기', 24814, 1, 0, 1),
+(NULL, '헬륨', 24815, 1, 0, 1),
+(NULL, '현우', 24816, 1, 0, 1),
+(NULL, '현타', 24817, 1, 0, 1),
+(NULL, '호두', 24818, 1, 0, 1),
+(NULL, '호떡', 24819, 1, 0, 1),
+(NULL, '호러', 24820, 1, 0, 1),
+(NULL, '호매', 24821, 1, 0, 1),
+(NULL, '호미', 24822, 1, 0, 1),
+(NULL, '호사', 24823, 1, 0, 1),
+(NULL, '호스', 24824, 1, 0, 1),
+(NULL, '호텔', 24825, 1, 0, 1),
+(NULL, '홀더', 24826, 1, 0, 1),
+('囫圇', '홀륜', 24827, 1, 0, 1),
+(NULL, '홀뮴', 24828, 1, 0, 1),
+(NULL, '홀씨', 24829, 1, 0, 1),
+(NULL, '홍대', 24830, 1, 0, 1),
+(NULL, '홍콩', 24831, 1, 0, 1),
+(NULL, '화살', 24832, 1, 0, 1),
+(NULL, '확스', 24833, 1, 0, 1),
+('蛞蝓', '활유', 24834, 1, 0, 1),
+(NULL, '황복', 24835, 1, 0, 1),
+(NULL, '황소', 24836, 1, 0, 1),
+(NULL, '황어', 24837, 1, 0, 1),
+('恍惚', '황홀', 24838, 1, 0, 1),
+(NULL, '후난', 24839, 1, 0, 1),
+(NULL, '후조', 24840, 1, 0, 1),
+(NULL, '후지', 24841, 1, 0, 1),
+(NULL, '훈툰', 24842, 1, 0, 1),
+(NULL, '훗날', 24843, 1, 0, 1),
+(NULL, '훠궈', 24844, 1, 0, 1),
+(NULL, '흉터', 24845, 1, 0, 1),
+(NULL, '흰곰', 24846, 1, 0, 1),
+(NULL, '흰색', 24847, 1, 0, 1),
+(NULL, '흰쌀', 24848, 1, 0, 1),
+(NULL, '히잡', 24849, 1, 0, 1),
+(NULL, '히터', 24850, 1, 0, 1),
+(NULL, '히프', 24851, 1, 0, 1),
+(NULL, '힘껏', 24852, 1, 0, 1),
+(NULL, '힘살', 24853, 1, 0, 1),
+(NULL, '힙합', 24854, 1, 0, 1),
+(NULL, 'ᄯᅡᆼ', 24855, 1, 0, 1),
+(NULL, '何如間', 24856, 1, 0, 1),
+(NULL, '依하다', 24857, 1, 0, 1),
+(NULL, '先生님', 24858, 1, 0, 1),
+(NULL, '加하다', 24859, 1, 0, 1),
+(NULL, '可及的', 24860, 1, 0, 1),
+(NULL, '可하다', 24861, 1, 0, 1),
+(NULL, '四철湯', 24862, 1, 0, 1),
+(NULL, '因하다', 24863, 1, 0, 1),
+(NULL, '於此彼', 24864, 1, 0, 1),
+(NULL, '朝鮮무', 24865, 1, 0, 1),
+(NULL, '根本的', 24866, 1, 0, 1),
+(NULL, '甚至於', 24867, 1, 0, 1),
+(NULL, '甚하다', 24868, 1, 0, 1),
+(NULL, '羘곱창', 24869, 1, 0, 1),
+(NULL, '虎狼이', 24870, 1, 0, 1),
+(NULL, '醬독臺', 24871, 1, 0, 1),
+(NULL, '가껍다', 24872, 1, 0, 1),
+(NULL, '가꾸로', 24873, 1, 0, 1),
+(NULL, '가끔씩', 24874, 1, 0, 1),
+(NULL, '가는밸', 24875, 1, 0, 1),
+(NULL, '가는쥐', 24876, 1, 0, 1),
+(NULL, '가라데', 24877, 1, 0, 1),
+(NULL, '가랑비', 24878, 1, 0, 1),
+(NULL, '가렵다', 24879, 1, 0, 1),
+(NULL, '가리비', 24880, 1, 0, 1),
+(NULL, '가마괴', 24881, 1, 0, 1),
+(NULL, '가마솥', 24882, 1, 0, 1),
+(NULL, '가마치', 24883, 1, 0, 1),
+(NULL, '가물다', 24884, 1, 0, 1),
+(NULL, '가물치', 24885, 1, 0, 1),
+(NULL, '가볍다', 24886, 1, 0, 1),
+(NULL, '가새다', 24887, 1, 0, 1),
+(NULL, '가숭어', 24888, 1, 0, 1),
+(NULL, '가시개', 24889, 1, 0, 1),
+(NULL, '가시집', 24890, 1, 0, 1),
+(NULL, '가엾다', 24891, 1, 0, 1),
+(NULL, '가이드', 24892, 1, 0, 1),
+(NULL, '가제따', 24893, 1, 0, 1),
+(NULL, '가죽끈', 24894, 1, 0, 1),
+(NULL, '가차이', 24895, 1, 0, 1),
+(NULL, '가찹다', 24896, 1, 0, 1),
+(NULL, '가타나', 24897, 1, 0, 1),
+(NULL, '가티노', 24898, 1, 0, 1),
+(NULL, '각다귀', 24899, 1, 0, 1),
+(NULL, '간자이', 24900, 1, 0, 1),
+(NULL, '갈겨니', 24901, 1, 0, 1),
+(NULL, '갈고리', 24902, 1, 0, 1),
+(NULL, '갈나무', 24903, 1, 0, 1),
+(NULL, '갈리다', 24904, 1, 0, 1),
+(NULL, '갈밭쥐', 24905, 1, 0, 1),
+(NULL, '갈쓰뚝', 24906, 1, 0, 1),
+(NULL, '갈퀴다', 24907, 1, 0, 1),
+(NULL, '감기다', 24908, 1, 0, 1),
+(NULL, '감비아', 24909, 1, 0, 1),
+(NULL, '감추다', 24910, 1, 0, 1),
+(NULL, '갑상샘', 24911, 1, 0, 1),
+(NULL, '갓김치', 24912, 1, 0, 1),
+(NULL, '갓난애', 24913, 1, 0, 1),
+(NULL, '강어귀', 24914, 1, 0, 1),
+(NULL, '강준치', 24915, 1, 0, 1),
+(NULL, '개개비', 24916, 1, 0, 1),
+(NULL, '개구리', 24917, 1, 0, 1),
+(NULL, '개금재', 24918, 1, 0, 1),
+(NULL, '개기장', 24919, 1, 0, 1),
+(NULL, '개나리', 24920, 1, 0, 1),
+(NULL, '개땡깔', 24921, 1, 0, 1),
+(NULL, '개렵다', 24922, 1, 0, 1),
+(NULL, '개망초', 24923, 1, 0, 1),
+(NULL, '개묵새', 24924, 1, 0, 1),
+(NULL, '개살구', 24925, 1, 0, 1),
+(NULL, '개소겡', 24926, 1, 0, 1),
+(NULL, '개수대', 24927, 1, 0, 1),
+(NULL, '개스켓', 24928, 1, 0, 1),
+(NULL, '개스킷', 24929, 1, 0, 1),
+(NULL, '개오동', 24930, 1, 0, 1),
+(NULL, '갠지스', 24931, 1, 0, 1),
+(NULL, '갤러리', 24932, 1, 0, 1),
+(NULL, '갤치다', 24933, 1, 0, 1),
+(NULL, '갯첨서', 24934, 1, 0, 1),
+(NULL, '거드름', 24935, 1, 0, 1),
+(NULL, '거듭씨', 24936, 1, 0, 1),
+(NULL, '거르만', 24937, 1, 0, 1),
+(NULL, '거미줄', 24938, 1, 0, 1),
+(NULL, '거부기', 24939, 1, 0, 1),
+(NULL, '거북목', 24940, 1, 0, 1),
+(NULL, '거북선', 24941, 1, 0, 1),
+(NULL, '거치다', 24942, 1, 0, 1),
+(NULL, '거품기', 24943, 1, 0, 1),
+(NULL, '건거니', 24944, 1, 0, 1),
+(NULL, '걸그룹', 24945, 1, 0, 1),
+(NULL, '걸음마', 24946, 1, 0, 1),
+(NULL, '검버섯', 24947, 1, 0, 1),
+(NULL, '검은금', 24948, 1, 0, 1),
+(NULL, '검은색', 24949, 1, 0, 1),
+(NULL, '검정색', 24950, 1, 0, 1),
+(NULL, '겁먹다', 24951, 1, 0, 1),
+(NULL, '게롭다', 24952, 1, 0, 1),
+(NULL, '게르만', 24953, 1, 0, 1),
+(NULL, '게릴라', 24954, 1, 0, 1),
+(NULL, '게맛살', 24955, 1, 0, 1),
+(NULL, '게사니', 24956, 1, 0, 1),
+(NULL, '게이기', 24957, 1, 0, 1),
+(NULL, '게이샤', 24958, 1, 0, 1),
+(NULL, '게임기', 24959, 1, 0, 1),
+(NULL, '게톱치', 24960, 1, 0, 1),
+(NULL, '견디다', 24961, 1, 0, 1),
+(NULL, '견주다', 24962, 1, 0, 1),
+(NULL, '겹놓다', 24963, 1, 0, 1),
+(NULL, '겹빵이', 24964, 1, 0, 1),
+(NULL, '계시다', 24965, 1, 0, 1),
+(NULL, '고기떡', 24966, 1, 0, 1),
+(NULL, '고냉이', 24967, 1, 0, 1),
+(NULL, '고드름', 24968, 1, 0, 1),
+(NULL, '고등어', 24969, 1, 0, 1),
+(NULL, '고라니', 24970, 1, 0, 1),
+(NULL, '고맙다', 24971, 1, 0, 1),
+(NULL, '고순쥐', 24972, 1, 0, 1),
+(NULL, '고스트', 24973, 1, 0, 1),
+(NULL, '고양이', 24974, 1, 0, 1),
+(NULL, '곤돌라', 24975, 1, 0, 1),
+(NULL, '곤치다', 24976, 1, 0, 1),
+(NULL, '곧이어', 24977, 1, 0, 1),
+(NULL, '골키퍼', 24978, 1, 0, 1),
+(NULL, '골프채', 24979, 1, 0, 1),
+(NULL, '곰피다', 24980, 1, 0, 1),
+(NULL, '공구리', 24981, 1, 0, 1),
+(NULL, '관박쥐', 24982, 1, 0, 1),
+(NULL, '광대뼈', 24983, 1, 0, 1),
+(NULL, '광둥어', 24984, 1, 0, 1),
+(NULL, '광저우', 24985, 1, 0, 1),
+(NULL, '괭이밥', 24986, 1, 0, 1),
+(NULL, '구더기', 24987, 1, 0, 1),
+(NULL, '구두쇠', 24988, 1, 0, 1),
+(NULL, '구로나', 24989, 1, 0, 1),
+(NULL, '구루마', 24990, 1, 0, 1),
+(NULL, '구린내', 24991, 1, 0, 1),
+(NULL, '구아바', 24992, 1, 0, 1),
+(NULL, '구역질', 24993, 1, 0, 1),
+(NULL, '구찮다', 24994, 1, 0, 1),
+(NULL, '국주게', 24995, 1, 0, 1),
+(NULL, '굳기름', 24996, 1, 0, 1),
+(NULL, '굵은밸', 24997, 1, 0, 1),
+(NULL, '굼뜨다', 24998, 1, 0, 1),
+(NULL, '귀고리', 24999, 1, 0, 1),
+(NULL, '귀두지', 25000, 1, 0, 1),
+(NULL, '귀때기', 25001, 1, 0, 1),
+(NULL, '귀뚤귀', 25002, 1, 0, 1),
+(NULL, '귀마개', 25003, 1, 0, 1),
+(NULL, '귀엣말', 25004, 1, 0, 1),
+(NULL, '귀요미', 25005, 1, 0, 1),
+(NULL, '귓구멍', 25006, 1, 0, 1),
+(NULL, '귓속말', 25007, 1, 0, 1),
+(NULL, '그다음', 25008, 1, 0, 1),
+(NULL, '그라프', 25009, 1, 0, 1),
+(NULL, '그래도', 25010, 1, 0, 1),
+(NULL, '그렇다', 25011, 1, 0, 1),
+(NULL, '그렇지', 25012, 1, 0, 1),
+(NULL, '그루빠', 25013, 1, 0, 1),
+(NULL, '그리드', 25014, 1, 0, 1),
+(NULL, '그리마', 25015, 1, 0, 1),
+(NULL, '그리스', 25016, 1, 0, 1),
+(NULL, '그을음', 25017, 1, 0, 1),
+(NULL, '그저께', 25018, 1, 0, 1),
+(NULL, '그치다', 25019, 1, 0, 1),
+(NULL, '그치만', 25020, 1, 0, 1),
+(NULL, '글라스', 25021, 1, 0, 1),
+(NULL, '글램핑', 25022, 1, 0, 1),
+(NULL, '글루텐', 25023, 1, 0, 1),
+(NULL, '글쇠판', 25024, 1, 0, 1),
+(NULL, '글쓰기', 25025, 1, 0, 1),
+(NULL, '금색돔', 25026, 1, 0, 1),
+(NULL, '급커브', 25027, 1, 0, 1),
+(NULL, '기가다', 25028, 1, 0, 1),
+(NULL, '기껍다', 25029, 1, 0, 1),
+(NULL, '기둥춤', 25030, 1, 0, 1),
+(NULL, '기름갖', 25031, 1, 0, 1),
+(NULL, '기름밥', 25032, 1, 0, 1),
+(NULL, '기마이', 25033, 1, 0, 1),
+(NULL, '기모노', 25034, 1, 0, 1),
+(NULL, '기시다', 25035, 1, 0, 1),
+(NULL, '기요틴', 25036, 1, 0, 1),
+(NULL, '기저귀', 25037, 1, 0, 1),
+(NULL, '긴몰개', 25038, 1, 0, 1),
+(NULL, '긴털쥐', 25039, 1, 0, 1),
+(NULL, '길르앗', 25040, 1, 0, 1),
+(NULL, '김냉국', 25041, 1, 0, 1),
+(NULL, '김의털', 25042, 1, 0, 1),
+(NULL, '까마중', 25043, 1, 0, 1),
+(NULL, '까만색', 25044, 1, 0, 1),
+(NULL, '까맣다', 25045, 1, 0, 1),
+(NULL, '까치발', 25046, 1, 0, 1),
+(NULL, '까치복', 25047, 1, 0, 1),
+(NULL, '깔때기', 25048, 1, 0, 1),
+(NULL, '깨끗이', 25049, 1, 0, 1),
+(NULL, '깨끗한', 25050, 1, 0, 1),
+(NULL, '깨우다', 25051, 1, 0, 1),
+(NULL, '꺼내다', 25052, 1, 0, 1),
+(NULL, '꺽저기', 25053, 1, 0, 1),
+(NULL, '꺽정이', 25054, 1, 0, 1),
+(NULL, '꼬누다', 25055, 1, 0, 1),
+(NULL, '꼬집다', 25056, 1, 0, 1),
+(NULL, '꼬챙이', 25057, 1, 0, 1),
+(NULL, '꼴볼견', 25058, 1, 0, 1),
+(NULL, '꽁무니', 25059, 1, 0, 1),
+(NULL, '꽃가루', 25060, 1, 0, 1),
+(NULL, '꽃미남', 25061, 1, 0, 1),
+(NULL, '꽹과리', 25062, 1, 0, 1),
+(NULL, '꾀꼬리', 25063, 1, 0, 1),
+(NULL, '꾸구리', 25064, 1, 0, 1),
+(NULL, '꿈꾸다', 25065, 1, 0, 1),
+(NULL, '꿩의밥', 25066, 1, 0, 1),
+(NULL, '꿰매다', 25067, 1, 0, 1),
+(NULL, '꿰차다', 25068, 1, 0, 1),
+(NULL, '끄스다', 25069, 1, 0, 1),
+(NULL, '끈끈이', 25070, 1, 0, 1),
+(NULL, '끌리다', 25071, 1, 0, 1),
+(NULL, '끓이다', 25072, 1, 0, 1),
+(NULL, '끝내다', 25073, 1, 0, 1),
+(NULL, '나고야', 25074, 1, 0, 1),
+(NULL, '나나니', 25075, 1, 0, 1),
+(NULL, '나누기', 25076, 1, 0, 1),
+(NULL, '나뉘다', 25077, 1, 0, 1),
+(NULL, '나란히', 25078, 1, 0, 1),
+(NULL, '나룻배', 25079, 1, 0, 1),
+(NULL, '나리다', 25080, 1, 0, 1),
+(NULL, '나마리', 25081, 1, 0, 1),
+(NULL, '나무잎', 25082, 1, 0, 1),
+(NULL, '나뭇꾼', 25083, 1, 0, 1),
+(NULL, '나발니', 25084, 1, 0, 1),
+(NULL, '나승개', 25085, 1, 0, 1),
+(NULL, '나우루', 25086, 1, 0, 1),
+(NULL, '나이테', 25087, 1, 0, 1),
+(NULL, '나이프', 25088, 1, 0, 1),
+(NULL, '나일론', 25089, 1, 0, 1),
+(NULL, '나치즘', 25090, 1, 0, 1),
+(NULL, '나트륨', 25091, 1, 0, 1),
+(NULL, '나프타', 25092, 1, 0, 1),
+(NULL, '낚시꾼', 25093, 1, 0, 1),
+(NULL, '낚싯대', 25094, 1, 0, 1),
+(NULL, '낚싯줄', 25095, 1, 0, 1),
+(NULL, '난센스', 25096, 1, 0, 1),
+(NULL, '난추니', 25097, 1, 0, 1),
+(NULL, '날망둑', 25098, 1, 0, 1),
+(NULL, '날파리', 25099, 1, 0, 1),
+(NULL, '남기다', 25100, 1, 0, 1),
+(NULL, '남의자', 25101, 1, 0, 1),
+(NULL, '남이사', 25102, 1, 0, 1),
+(NULL, '남자애', 25103, 1, 0, 1),
+(NULL, '납자루', 25104, 1, 0, 1),
+(NULL, '납줄개', 25105, 1, 0, 1),
+(NULL, '납지리', 25106, 1, 0, 1),
+(NULL, '낱소리', 25107, 1, 0, 1),
+(NULL, '내몽골', 25108, 1, 0, 1),
+(NULL, '내쉬다', 25109, 1, 0, 1),
+(NULL, '냉기다', 25110, 1, 0, 1),
+(NULL, '너더댓', 25111, 1, 0, 1),
+(NULL, '너리다', 25112, 1, 0, 1),
+(NULL, '너머로', 25113, 1, 0, 1),
+(NULL, '넌즈시', 25114, 1, 0, 1),
+(NULL, '널뛰기', 25115, 1, 0, 1),
+(NULL, '널주다', 25116, 1, 0, 1),
+(NULL, '널지다', 25117, 1, 0, 1),
+(NULL, '널찌다', 25118, 1, 0, 1),
+(NULL, '넘기다', 25119, 1, 0, 1),
+(NULL, '넘버원', 25120, 1, 0, 1),
+(NULL, '네거리', 25121, 1, 0, 1),
+(NULL, '네모꼴', 25122, 1, 0, 1),
+(NULL, '네바다', 25123, 1, 0, 1),
+(NULL, '네티즌', 25124, 1, 0, 1),
+(NULL, '넥타이', 25125, 1, 0, 1),
+(NULL, '넵투늄', 25126, 1, 0, 1),
+(NULL, '노가다', 25127, 1, 0, 1),
+(NULL, '노네인', 25128, 1, 0, 1),
+(NULL, '노란색', 25129, 1, 0, 1),
+(NULL, '노랗다', 25130, 1, 0, 1),
+(NULL, '노래미', 25131, 1, 0, 1),
+(NULL, '노랫말', 25132, 1, 0, 1),
+(NULL, '노르다', 25133, 1, 0, 1),
+(NULL, '노른자', 25134, 1, 0, 1),
+(NULL, '노름꾼', 25135, 1, 0, 1),
+(NULL, '노벨륨', 25136, 1, 0, 1),
+(NULL, '노엽다', 25137, 1, 0, 1),
+(NULL, '노이해', 25138, 1, 0, 1),
+(NULL, '노트북', 25139, 1, 0, 1),
+(NULL, '노하우', 25140, 1, 0, 1),
+(NULL, '놀라다', 25141, 1, 0, 1),
+(NULL, '놀랍다', 25142, 1, 0, 1),
+(NULL, '놀이꾼', 25143, 1, 0, 1),
+(NULL, '놀이터', 25144, 1, 0, 1),
+(NULL, '누렇다', 25145, 1, 0, 1),
+(NULL, '누룽지', 25146, 1, 0, 1),
+(NULL, '누리꾼', 25147, 1, 0, 1),
+(NULL, '누키다', 25148, 1, 0, 1),
+(NULL, '눈꺼풀', 25149, 1, 0, 1),
+(NULL, '눈꼬리', 25150, 1, 0, 1),
+(NULL, '눈두덩', 25151, 1, 0, 1),
+(NULL, '눈망울', 25152, 1, 0, 1),
+(NULL, '눈불개', 25153, 1, 0, 1),
+(NULL, '눈사람', 25154, 1, 0, 1),
+(NULL, '눈사태', 25155, 1, 0, 1),
+(NULL, '눈송이', 25156, 1, 0, 1),
+(NULL, '눈썹먹', 25157, 1, 0, 1),
+(NULL, '눈표범', 25158, 1, 0, 1),
+(NULL, '뉘앙스', 25159, 1, 0, 1),
+(NULL, '뉘키다', 25160, 1, 0, 1),
+(NULL, '뉴저지', 25161, 1, 0, 1),
+(NULL, '느낌표', 25162, 1, 0, 1),
+(NULL, '느리다', 25163, 1, 0, 1),
+(NULL, '니아메', 25164, 1, 0, 1),
+(NULL, '니코틴', 25165, 1, 0, 1),
+(NULL, '니호늄', 25166, 1, 0, 1),
+(NULL, '닉네임', 25167, 1, 0, 1),
+(NULL, '닙히다', 25168, 1, 0, 1),
+(NULL, '다다미', 25169, 1, 0, 1),
+(NULL, '다대기', 25170, 1, 0, 1),
+(NULL, '다루마', 25171, 1, 0, 1),
+(NULL, '다르다', 25172, 1, 0, 1),
+(NULL, '다리미', 25173, 1, 0, 1),
+(NULL, '다리어', 25174, 1, 0, 1),
+(NULL, '다림질', 25175, 1, 0, 1),
+(NULL, '다슬다', 25176, 1, 0, 1),
+(NULL, '다이얼', 25177, 1, 0, 1),
+(NULL, '다정히', 25178, 1, 0, 1),
+(NULL, '다카르', 25179, 1, 0, 1),
+(NULL, '닥나무', 25180, 1, 0, 1),
+(NULL, '단감자', 25181, 1, 0, 1),
+(NULL, '단고기', 25182, 1, 0, 1),
+(NULL, '단물약', 25183, 1, 0, 1),
+(NULL, '단축키', 25184, 1, 0, 1),
+(NULL, '달개다', 25185, 1, 0, 1),
+(NULL, '달걀물', 25186, 1, 0, 1),
+(NULL, '달구지', 25187, 1, 0, 1),
+(NULL, '달돋이', 25188, 1, 0, 1),
+(NULL, '달린옷', 25189, 1, 0, 1),
+(NULL, '달마구', 25190, 1, 0, 1),
+(NULL, '달망구', 25191, 1, 0, 1),
+(NULL, '달무리', 25192, 1, 0, 1),
+(NULL, '달팽이', 25193, 1, 0, 1),
+(NULL, '닭고기', 25194, 1, 0, 1),
+(NULL, '닭구이', 25195, 1, 0, 1),
+(NULL, '닭싸움', 25196, 1, 0, 1),
+(NULL, '담배갑', 25197, 1, 0, 1),
+(NULL, '당나귀', 25198, 1, 0, 1),
+(NULL, '당멸치', 25199, 1, 0, 1),
+(NULL, '대걸레', 25200, 1, 0, 1),
+(NULL, '대검집', 25201, 1, 0, 1),
+(NULL, '대나무', 25202, 1, 0, 1),
+(NULL, '대단히', 25203, 1, 0, 1),
+(NULL, '대머리', 25204, 1, 0, 1),
+(NULL, '댕댕이', 25205, 1, 0, 1),
+(NULL, '더럽다', 25206, 1, 0, 1),
+(NULL, '더브늄', 25207, 1, 0, 1),
+(NULL, '더욱더', 25208, 1, 0, 1),
+(NULL, '덤플링', 25209, 1, 0, 1),
+(NULL, '덧대다', 25210, 1, 0, 1),
+(NULL, '덧머리', 25211, 1, 0, 1),
+(NULL, '데불다', 25212, 1, 0, 1),
+(NULL, '데이트', 25213, 1, 0, 1),
+(NULL, '데인로', 25214, 1, 0, 1),
+(NULL, '데치다', 25215, 1, 0, 1),
+(NULL, '데케인', 25216, 1, 0, 1),
+(NULL, '덴뿌라', 25217, 1, 0, 1),
+(NULL, '덴푸라', 25218, 1, 0, 1),
+(NULL, '도가니', 25219, 1, 0, 1),
+(NULL, '도다리', 25220, 1, 0, 1),
+(NULL, '도도마', 25221, 1, 0, 1),
+(NULL, '도롱뇽', 25222, 1, 0, 1),
+(NULL, '도르래', 25223, 1, 0, 1),
+(NULL, '도마뱀', 25224, 1, 0, 1),
+(NULL, '도메인', 25225, 1, 0, 1),
+(NULL, '도시락', 25226, 1, 0, 1),
+(NULL, '도야지', 25227, 1, 0, 1),
+(NULL, '도우미', 25228, 1, 0, 1),
+(NULL, '도채비', 25229, 1, 0, 1),
+(NULL, '도탑다', 25230, 1, 0, 1),
+(NULL, '도토리', 25231, 1, 0, 1),
+(NULL, '돈세탁', 25232, 1, 0, 1),
+(NULL, '돌고기', 25233, 1, 0, 1),
+(NULL, '돌덩이', 25234, 1, 0, 1),
+(NULL, '돌리다', 25235, 1, 0, 1),
+(NULL, '돌마자', 25236, 1, 0, 1),
+(NULL, '돌보다', 25237, 1, 0, 1),
+(NULL, '돌상어', 25238, 1, 0, 1),
+(NULL, '동고비', 25239, 1, 0, 1),
+(NULL, '동사리', 25240, 1, 0, 1),
+(NULL, '동유럽', 25241, 1, 0, 1),
+(NULL, '동자개', 25242, 1, 0, 1),
+(NULL, '동치미', 25243, 1, 0, 1),
+(NULL, '돼지풀', 25244, 1, 0, 1),
+(NULL, '되감다', 25245, 1, 0, 1),
+(NULL, '되비침', 25246, 1, 0, 1),
+(NULL, '되살다', 25247, 1, 0, 1),
+(NULL, '되야지', 25248, 1, 0, 1),
+(NULL, '되풀이', 25249, 1, 0, 1),
+(NULL, '두꺼비', 25250, 1, 0, 1),
+(NULL, '두껍다', 25251, 1, 0, 1),
+(NULL, '두리안', 25252, 1, 0, 1),
+(NULL, '둑중개', 25253, 1, 0, 1),
+(NULL, '둥간어', 25254, 1, 0, 1),
+(NULL, '둥굴레', 25255, 1, 0, 1),
+(NULL, '둥베이', 25256, 1, 0, 1),
+(NULL, '뒷마당', 25257, 1, 0, 1),
+(NULL, '듕핵교', 25258, 1, 0, 1),
+(NULL, '드가다', 25259, 1, 0, 1),
+(NULL, '드래건', 25260, 1, 0, 1),
+(NULL, '드래곤', 25261, 1, 0, 1),
+(NULL, '드럽다', 25262, 1, 0, 1),
+(NULL, '드레스', 25263, 1, 0, 1),
+(NULL, '드링크', 25264, 1, 0, 1),
+(NULL, '드물다', 25265, 1, 0, 1),
+(NULL, '들르다', 25266, 1, 0, 1),
+(NULL, '들창코', 25267, 1, 0, 1),
+(NULL, '듯하다', 25268, 1, 0, 1),
+(NULL, '등나무', 25269, 1, 0, 1),
+(NULL, '등드름', 25270, 1, 0, 1),
+(NULL, '등줄쥐', 25271, 1, 0, 1),
+(NULL, '등허리', 25272, 1, 0, 1),
+(NULL, '디디기', 25273, 1, 0, 1),
+(NULL, '디리다', 25274, 1, 0, 1),
+(NULL, '디자인', 25275, 1, 0, 1),
+(NULL, '디저트', 25276, 1, 0, 1),
+(NULL, '디지털', 25277, 1, 0, 1),
+(NULL, '따개비', 25278, 1, 0, 1),
+(NULL, '따오다', 25279, 1, 0, 1),
+(NULL, '땅늑대', 25280, 1, 0, 1),
+(NULL, '땅바닥', 25281, 1, 0, 1),
+(NULL, '땅속길', 25282, 1, 0, 1),
+(NULL, '때까치', 25283, 1, 0, 1),
+(NULL, '땔나무', 25284, 1, 0, 1),
+(NULL, '떠나다', 25285, 1, 0, 1),
+(NULL, '떠들다', 25286, 1, 0, 1),
+(NULL, '떡볶이', 25287, 1, 0, 1),
+(NULL, '떼내다', 25288, 1, 0, 1),
+(NULL, '똥까시', 25289, 1, 0, 1),
+(NULL, '똥싸다', 25290, 1, 0, 1),
+(NULL, '똥파리', 25291, 1, 0, 1),
+(NULL, '뚝배기', 25292, 1, 0, 1),
+(NULL, '뚝새풀', 25293, 1, 0, 1),
+(NULL, '뚫어뻥', 25294, 1, 0, 1),
+(NULL, '뜨개질', 25295, 1, 0, 1),
+(NULL, '뜸부기', 25296, 1, 0, 1),
+(NULL, '뜸팡이', 25297, 1, 0, 1),
+(NULL, '뜻글자', 25298, 1, 0, 1),
+(NULL, '뜻대로', 25299, 1, 0, 1),
+(NULL, '라고스', 25300, 1, 0, 1),
+(NULL, '라놀린', 25301, 1, 0, 1),
+(NULL, '라바트', 25302, 1, 0, 1),
+(NULL, '라우터', 25303, 1, 0, 1),
+(NULL, '라운지', 25304, 1, 0, 1),
+(NULL, '라이치', 25305, 1, 0, 1),
+(NULL, '라이터', 25306, 1, 0, 1),
+(NULL, '라이플', 25307, 1, 0, 1),
+(NULL, '라자냐', 25308, 1, 0, 1),
+(NULL, '라자브', 25309, 1, 0, 1),
+(NULL, '라지오', 25310, 1, 0, 1),
+(NULL, '라틴어', 25311, 1, 0, 1),
+(NULL, '라틴화', 25312, 1, 0, 1),
+(NULL, '라파스', 25313, 1, 0, 1),
+(NULL, '락다운', 25314, 1, 0, 1),
+(NULL, '란제리', 25315, 1, 0, 1),
+(NULL, '란타넘', 25316, 1, 0, 1),
+(NULL, '랴오닝', 25317, 1, 0, 1),
+(NULL, '레깅스', 25318, 1, 0, 1),
+(NULL, '레바논', 25319, 1, 0, 1),
+(NULL, '레소토', 25320, 1, 0, 1),
+(NULL, '레슬링', 25321, 1, 0, 1),
+(NULL, '레이다', 25322, 1, 0, 1),
+(NULL, '레이저', 25323, 1, 0, 1),
+(NULL, '레코더', 25324, 1, 0, 1),
+(NULL, '렌더링', 25325, 1, 0, 1),
+(NULL, '렌트카', 25326, 1, 0, 1),
+(NULL, '로그인', 25327, 1, 0, 1),
+(NULL, '로렌슘', 25328, 1, 0, 1),
+(NULL, '로마字', 25329, 1, 0, 1),
+(NULL, '로망스', 25330, 1, 0, 1),
+(NULL, '로맨스', 25331, 1, 0, 1),
+(NULL, '로보트', 25332, 1, 0, 1),
+(NULL, '로케트', 25333, 1, 0, 1),
+(NULL, '로터리', 25334, 1, 0, 1),
+(NULL, '로텔레', 25335, 1, 0, 1),
+(NULL, '로티니', 25336, 1, 0, 1),
+(NULL, '뢴트겐', 25337, 1, 0, 1),
+(NULL, '루비듐', 25338, 1, 0, 1),
+(NULL, '루사카', 25339, 1, 0, 1),
+(NULL, '루시퍼', 25340, 1, 0, 1),
+(NULL, '루안다', 25341, 1, 0, 1),
+(NULL, '루테늄', 25342, 1, 0, 1),
+(NULL, '루테튬', 25343, 1, 0, 1),
+(NULL, '르완다', 25344, 1, 0, 1),
+(NULL, '리눅스', 25345, 1, 0, 1),
+(NULL, '리모컨', 25346, 1, 0, 1),
+(NULL, '리무진', 25347, 1, 0, 1),
+(NULL, '리믹스', 25348, 1, 0, 1),
+(NULL, '리볼버', 25349, 1, 0, 1),
+(NULL, '리비도', 25350, 1, 0, 1),
+(NULL, '리비아', 25351, 1, 0, 1),
+(NULL, '리셉션', 25352, 1, 0, 1),
+(NULL, '리스크', 25353, 1, 0, 1),
+(NULL, '리야드', 25354, 1, 0, 1),
+(NULL, '리조트', 25355, 1, 0, 1),
+(NULL, '리큐어', 25356, 1, 0, 1),
+(NULL, '리허설', 25357, 1, 0, 1),
+(NULL, '린우드', 25358, 1, 0, 1),
+(NULL, '릴롱궤', 25359, 1, 0, 1),
+(NULL, '릴리스', 25360, 1, 0, 1),
+(NULL, '립스틱', 25361, 1, 0, 1),
+(NULL, '링귀네', 25362, 1, 0, 1),
+(NULL, '마가린', 25363, 1, 0, 1),
+(NULL, '마고자', 25364, 1, 0, 1),
+(NULL, '마그마', 25365, 1, 0, 1),
+(NULL, '마나과', 25366, 1, 0, 1),
+(NULL, '마나마', 25367, 1, 0, 1),
+(NULL, '마네킹', 25368, 1, 0, 1),
+(NULL, '마라탕', 25369, 1, 0, 1),
+(NULL, '마라톤', 25370, 1, 0, 1),
+(NULL, '마렵다', 25371, 1, 0, 1),
+(NULL, '마르스', 25372, 1, 0, 1),
+(NULL, '마모셋', 25373, 1, 0, 1),
+(NULL, '마사지', 25374, 1, 0, 1),
+(NULL, '마세루', 25375, 1, 0, 1),
+(NULL, '마스크', 25376, 1, 0, 1),
+(NULL, '마싸지', 25377, 1, 0, 1),
+(NULL, '마와리', 25378, 1, 0, 1),
+(NULL, '마우스', 25379, 1, 0, 1),
+(NULL, '마우재', 25380, 1, 0, 1),
+(NULL, '마음껏', 25381, 1, 0, 1),
+(NULL, '마지막', 25382, 1, 0, 1),
+(NULL, '마체테', 25383, 1, 0, 1),
+(NULL, '마침내', 25384, 1, 0, 1),
+(NULL, '마케팅', 25385, 1, 0, 1),
+(NULL, '마크롱', 25386, 1, 0, 1),
+(NULL, '마팔데', 25387, 1, 0, 1),
+(NULL, '마푸토', 25388, 1, 0, 1),
+(NULL, '마피아', 25389, 1, 0, 1),
+(NULL, '마흐디', 25390, 1, 0, 1),
+(NULL, '막대기', 25391, 1, 0, 1),
+(NULL, '막창자', 25392, 1, 0, 1),
+(NULL, '만나기', 25393, 1, 0, 1),
+(NULL, '만새기', 25394, 1, 0, 1),
+(NULL, '말고기', 25395, 1, 0, 1),
+(NULL, '말기다', 25396, 1, 0, 1),
+(NULL, '말디브', 25397, 1, 0, 1),
+(NULL, '말라보', 25398, 1, 0, 1),
+(NULL, '말뿌리', 25399, 1, 0, 1),
+(NULL, '말없이', 25400, 1, 0, 1),
+(NULL, '말풍선', 25401, 1, 0, 1),
+(NULL, '맘마통', 25402, 1, 0, 1),
+(NULL, '맛없다', 25403, 1, 0, 1),
+(NULL, '맛있다', 25404, 1, 0, 1),
+(NULL, '맞은편', 25405, 1, 0, 1),
+(NULL, '맞흥정', 25406, 1, 0, 1),
+(NULL, '매니저', 25407, 1, 0, 1),
+(NULL, '매리복', 25408, 1, 0, 1),
+(NULL, '매머드', 25409, 1, 0, 1),
+(NULL, '매스컴', 25410, 1, 0, 1),
+(NULL, '맨들다', 25411, 1, 0, 1),
+(NULL, '맬웨어', 25412, 1, 0, 1),
+(NULL, '맹글다', 25413, 1, 0, 1),
+(NULL, '맹길다', 25414, 1, 0, 1),
+(NULL, '맺음말', 25415, 1, 0, 1),
+(NULL, '머가리', 25416, 1, 0, 1),
+(NULL, '머구리', 25417, 1, 0, 1),
+(NULL, '머그잔', 25418, 1, 0, 1),
+(NULL, '머리글', 25419, 1, 0, 1),
+(NULL, '머리띠', 25420, 1, 0, 1),
+(NULL, '머리맡', 25421, 1, 0, 1),
+(NULL, '머리칼', 25422, 1, 0, 1),
+(NULL, '머리털', 25423, 1, 0, 1),
+(NULL, '머릿골', 25424, 1, 0, 1),
+(NULL, '머릿속', 25425, 1, 0, 1),
+(NULL, '머물다', 25426, 1, 0, 1),
+(NULL, '멀티탭', 25427, 1, 0, 1),
+(NULL, '멍멍湯', 25428, 1, 0, 1),
+(NULL, '메가나', 25429, 1, 0, 1),
+(NULL, '메가폰', 25430, 1, 0, 1),
+(NULL, '메르헨', 25431, 1, 0, 1),
+(NULL, '메모리', 25432, 1, 0, 1),
+(NULL, '메서드', 25433, 1, 0, 1),
+(NULL, '메세지', 25434, 1, 0, 1),
+(NULL, '메시지', 25435, 1, 0, 1),
+(NULL, '메쏘드', 25436, 1, 0, 1),
+(NULL, '메아리', 25437, 1, 0, 1),
+(NULL, '메추리', 25438, 1, 0, 1),
+(NULL, '메테인', 25439, 1, 0, 1),
+(NULL, '멕이다', 25440, 1, 0, 1),
+(NULL, '멧토끼', 25441, 1, 0, 1),
+(NULL, '며느리', 25442, 1, 0, 1),
+(NULL, '멱자구', 25443, 1, 0, 1),
+(NULL, '면도칼', 25444, 1, 0, 1),
+(NULL, '면들레', 25445, 1, 0, 1),
+(NULL, '명아주', 25446, 1, 0, 1),
+(NULL, '모니터', 25447, 1, 0, 1),
+(NULL, '모드다', 25448, 1, 0, 1),
+(NULL, '모래성', 25449, 1, 0, 1),
+(NULL, '모르핀', 25450, 1, 0, 1),
+(NULL, '모스크', 25451, 1, 0, 1),
+(NULL, '모자반', 25452, 1, 0, 1),
+(NULL, '모처럼', 25453, 1, 0, 1),
+(NULL, '모퉁이', 25454, 1, 0, 1),
+(NULL, '모페드', 25455, 1, 0, 1),
+(NULL, '목걸이', 25456, 1, 0, 1),
+(NULL, '목다리', 25457, 1, 0, 1),
+(NULL, '목마름', 25458, 1, 0, 1),
+(NULL, '목소리', 25459, 1, 0, 1),
+(NULL, '목청껏', 25460, 1, 0, 1),
+(NULL, '몫몫이', 25461, 1, 0, 1),
+(NULL, '몬스터', 25462, 1, 0, 1),
+(NULL, '몬치다', 25463, 1, 0, 1),
+(NULL, '몬타나', 25464, 1, 0, 1),
+(NULL, '몬태나', 25465, 1, 0, 1),
+(NULL, '몰타섬', 25466, 1, 0, 1),
+(NULL, '몰타어', 25467, 1, 0, 1),
+(NULL, '몸무게', 25468, 1, 0, 1),
+(NULL, '몸비누', 25469, 1, 0, 1),
+(NULL, '몸조리', 25470, 1, 0, 1),
+(NULL, '못나다', 25471, 1, 0, 1),
+(NULL, '몽골어', 25472, 1, 0, 1),
+(NULL, '몽구스', 25473, 1, 0, 1),
+(NULL, '몽따쥬', 25474, 1, 0, 1),
+(NULL, '몽시리', 25475, 1, 0, 1),
+(NULL, '몽타주', 25476, 1, 0, 1),
+(NULL, '묏자리', 25477, 1, 0, 1),
+(NULL, '무겁다', 25478, 1, 0, 1),
+(NULL, '무르팍', 25479, 1, 0, 1),
+(NULL, '무서움', 25480, 1, 0, 1),
+(NULL, '무셥다', 25481, 1, 0, 1),
+(NULL, '무슬림', 25482, 1, 0, 1),
+(NULL, '무습다', 25483, 1, 0, 1),
+(NULL, '무에진', 25484, 1, 0, 1),
+(NULL, '무자치', 25485, 1, 0, 1),
+(NULL, '무제한', 25486, 1, 0, 1),
+(NULL, '무지개', 25487, 1, 0, 1),
+(NULL, '무쿠리', 25488, 1, 0, 1),
+(NULL, '묵은지', 25489, 1, 0, 1),
+(NULL, '문재앙', 25490, 1, 0, 1),
+(NULL, '물고기', 25491, 1, 0, 1),
+(NULL, '물공원', 25492, 1, 0, 1),
+(NULL, '물굽이', 25493, 1, 0, 1),
+(NULL, '물대포', 25494, 1, 0, 1),
+(NULL, '물들다', 25495, 1, 0, 1),
+(NULL, '물메기', 25496, 1, 0, 1),
+(NULL, '물방울', 25497, 1, 0, 1),
+(NULL, '물시계', 25498, 1, 0, 1),
+(NULL, '물음표', 25499, 1, 0, 1),
+(NULL, '물풍선', 25500, 1, 0, 1),
+(NULL, '뭄바이', 25501, 1, 0, 1),
+(NULL, '뮈슬리', 25502, 1, 0, 1),
+(NULL, '뮤지컬', 25503, 1, 0, 1),
+(NULL, '미꾸리', 25504, 1, 0, 1),
+(NULL, '미끄럼', 25505, 1, 0, 1),
+(NULL, '미끼샤', 25506, 1, 0, 1),
+(NULL, '미나리', 25507, 1, 0, 1),
+(NULL, '미누스', 25508, 1, 0, 1),
+(NULL, '미느리', 25509, 1, 0, 1),
+(NULL, '미니맵', 25510, 1, 0, 1),
+(NULL, '미니바', 25511, 1, 0, 1),
+(NULL, '미니밴', 25512, 1, 0, 1),
+(NULL, '미니카', 25513, 1, 0, 1),
+(NULL, '미디어', 25514, 1, 0, 1),
+(NULL, '미사일', 25515, 1, 0, 1),
+(NULL, '미섭다', 25516, 1, 0, 1),
+(NULL, '미시간', 25517, 1, 0, 1),
+(NULL, '미시건', 25518, 1, 0, 1),
+(NULL, '미싸일', 25519, 1, 0, 1),
+(NULL, '미어캣', 25520, 1, 0, 1),
+(NULL, '미유기', 25521, 1, 0, 1),
+(NULL, '미주리', 25522, 1, 0, 1),
+(NULL, '미터기', 25523, 1, 0, 1),
+(NULL, '미트볼', 25524, 1, 0, 1),
+(NULL, '미하일', 25525, 1, 0, 1),
+(NULL, '믹이다', 25526, 1, 0, 1),
+(NULL, '민들레', 25527, 1, 0, 1),
+(NULL, '민망초', 25528, 1, 0, 1),
+(NULL, '민물게', 25529, 1, 0, 1),
+(NULL, '민서기', 25530, 1, 0, 1),
+(NULL, '민스크', 25531, 1, 0, 1),
+(NULL, '밀가루', 25532, 1, 0, 1),
+(NULL, '밀고기', 25533, 1, 0, 1),
+(NULL, '밀렵꾼', 25534, 1, 0, 1),
+(NULL, '밀자개', 25535, 1, 0, 1),
+(NULL, '바구니', 25536, 1, 0, 1),
+(NULL, '바꼬락', 25537, 1, 0, 1),
+(NULL, '바나나', 25538, 1, 0, 1),
+(NULL, '바나듐', 25539, 1, 0, 1),
+(NULL, '바느질', 25540, 1, 0, 1),
+(NULL, '바다꿩', 25541, 1, 0, 1),
+(NULL, '바다뱀', 25542, 1, 0, 1),
+(NULL, '바닷물', 25543, 1, 0, 1),
+(NULL, '바둑돌', 25544, 1, 0, 1),
+(NULL, '바둑알', 25545, 1, 0, 1),
+(NULL, '바람꽃', 25546, 1, 0, 1),
+(NULL, '바랭이', 25547, 1, 0, 1),
+(NULL, '바리다', 25548, 1, 0, 1),
+(NULL, '바마코', 25549, 1, 0, 1),
+(NULL, '바비큐', 25550, 1, 0, 1),
+(NULL, '바오즈', 25551, 1, 0, 1),
+(NULL, '바이든', 25552, 1, 0, 1),
+(NULL, '바이블', 25553, 1, 0, 1),
+(NULL, '바이슨', 25554, 1, 0, 1),
+(NULL, '바이오', 25555, 1, 0, 1),
+(NULL, '바이트', 25556, 1, 0, 1),
+(NULL, '바자르', 25557, 1, 0, 1),
+(NULL, '바장조', 25558, 1, 0, 1),
+(NULL, '바지락', 25559, 1, 0, 1),
+(NULL, '바코드', 25560, 1, 0, 1),
+(NULL, '바퀴살', 25561, 1, 0, 1),
+(NULL, '바텐더', 25562, 1, 0, 1),
+(NULL, '반공일', 25563, 1, 0, 1),
+(NULL, '반바지', 25564, 1, 0, 1),
+(NULL, '반지름', 25565, 1, 0, 1),
+(NULL, '발가락', 25566, 1, 0, 1),
+(NULL, '발갛다', 25567, 1, 0, 1),
+(NULL, '발꿈치', 25568, 1, 0, 1),
+(NULL, '발뒤꿈', 25569, 1, 0, 1),
+(NULL, '발라드', 25570, 1, 0, 1),
+(NULL, '발레타', 25571, 1, 0, 1),
+(NULL, '발리볼', 25572, 1, 0, 1),
+(NULL, '발바닥', 25573, 1, 0, 1),
+(NULL, '발싸개', 25574, 1, 0, 1),
+(NULL, '발자취', 25575, 1, 0, 1),
+(NULL, '발코니', 25576, 1, 0, 1),
+(NULL, '밤나무', 25577, 1, 0, 1),
+(NULL, '밤하늘', 25578, 1, 0, 1),
+(NULL, '방가면', 25579, 1, 0, 1),
+(NULL, '방석집', 25580, 1, 0, 1),
+(NULL, '방아꾼', 25581, 1, 0, 1),
+(NULL, '방앗간', 25582, 1, 0, 1),
+(NULL, '방울뱀', 25583, 1, 0, 1),
+(NULL, '배고픔', 25584, 1, 0, 1),
+(NULL, '배뀌다', 25585, 1, 0, 1),
+(NULL, '배트맨', 25586, 1, 0, 1),
+(NULL, '백개먼', 25587, 1, 0, 1),
+(NULL, '백도어', 25588, 1, 0, 1),
+(NULL, '백미러', 25589, 1, 0, 1),
+(NULL, '백호두', 25590, 1, 0, 1),
+(NULL, '밴대질', 25591, 1, 0, 1),
+(NULL, '밴댕이', 25592, 1, 0, 1),
+(NULL, '밴쿠버', 25593, 1, 0, 1),
+(NULL, '뱀상어', 25594, 1, 0, 1),
+(NULL, '뱀장어', 25595, 1, 0, 1),
+(NULL, '버들치', 25596, 1, 0, 1),
+(NULL, '버마어', 25597, 1, 0, 1),
+(NULL, '버몬트', 25598, 1, 0, 1),
+(NULL, '버뮤다', 25599, 1, 0, 1),
+(NULL, '버미돌', 25600, 1, 0, 1),
+(NULL, '버블티', 25601, 1, 0, 1),
+(NULL, '버클륨', 25602, 1, 0, 1),
+(NULL, '버팔로', 25603, 1, 0, 1),
+(NULL, '벅벅이', 25604, 1, 0, 1),
+(NULL, '번지다', 25605, 1, 0, 1),
+(NULL, '벌겋다', 25606, 1, 0, 1),
+(NULL, '벌러덩', 25607, 1, 0, 1),
+(NULL, '벌주다', 25608, 1, 0, 1),
+(NULL, '베끼다', 25609, 1, 0, 1),
+(NULL, '베누스', 25610, 1, 0, 1),
+(NULL, '베란다', 25611, 1, 0, 1),
+(NULL, '베릴륨', 25612, 1, 0, 1),
+(NULL, '베이컨', 25613, 1, 0, 1),
+(NULL, '벨모판', 25614, 1, 0, 1),
+(NULL, '벳기다', 25615, 1, 0, 1),
+(NULL, '변하다', 25616, 1, 0, 1),
+(NULL, '별바다', 25617, 1, 0, 1),
+(NULL, '병따개', 25618, 1, 0, 1),
+(NULL, '병아리', 25619, 1, 0, 1),
+(NULL, '보너스', 25620, 1, 0, 1),
+(NULL, '보드카', 25621, 1, 0, 1),
+(NULL, '보름달', 25622, 1, 0, 1),
+(NULL, '보리쌀', 25623, 1, 0, 1),
+(NULL, '보이콧', 25624, 1, 0, 1),
+(NULL, '보일러', 25625, 1, 0, 1),
+(NULL, '보임틀', 25626, 1, 0, 1),
+(NULL, '보조개', 25627, 1, 0, 1),
+(NULL, '복수초', 25628, 1, 0, 1),
+(NULL, '복숭아', 25629, 1, 0, 1),
+(NULL, '봄가뭄', 25630, 1, 0, 1),
+(NULL, '봄나물', 25631, 1, 0, 1),
+(NULL, '봉우리', 25632, 1, 0, 1),
+(NULL, '부꾸미', 25633, 1, 0, 1),
+(NULL, '부끄럼', 25634, 1, 0, 1),
+(NULL, '부러움', 25635, 1, 0, 1),
+(NULL, '부럽다', 25636, 1, 0, 1),
+(NULL, '부르릉', 25637, 1, 0, 1),
+(NULL, '부모님', 25638, 1, 0, 1),
+(NULL, '부술기', 25639, 1, 0, 1),
+(NULL, '부스깨', 25640, 1, 0, 1),
+(NULL, '부엌칼', 25641, 1, 0, 1),
+(NULL, '부지런', 25642, 1, 0, 1),
+(NULL, '부처님', 25643, 1, 0, 1),
+(NULL, '부침개', 25644, 1, 0, 1),
+(NULL, '부티크', 25645, 1, 0, 1),
+(NULL, '북극곰', 25646, 1, 0, 1),
+(NULL, '북돋다', 25647, 1, 0, 1),
+(NULL, '북숲쥐', 25648, 1, 0, 1),
+(NULL, '북자이', 25649, 1, 0, 1),
+(NULL, '분홍빛', 25650, 1, 0, 1),
+(NULL, '불거웃', 25651, 1, 0, 1),
+(NULL, '불곰국', 25652, 1, 0, 1),
+(NULL, '불까다', 25653, 1, 0, 1),
+(NULL, '불도저', 25654, 1, 0, 1),
+(NULL, '불리다', 25655, 1, 0, 1),
+(NULL, '불쌍놈', 25656, 1, 0, 1),
+(NULL, '불타다', 25657, 1, 0, 1),
+(NULL, '붉나무', 25658, 1, 0, 1),
+(NULL, '붓글씨', 25659, 1, 0, 1),
+(NULL, '붙이다', 25660, 1, 0, 1),
+(NULL, '붙임표', 25661, 1, 0, 1),
+(NULL, '뷰테인', 25662, 1, 0, 1),
+(NULL, '브랜드', 25663, 1, 0, 1),
+(NULL, '브랜디', 25664, 1, 0, 1),
+(NULL, '브러시', 25665, 1, 0, 1),
+(NULL, '브로민', 25666, 1, 0, 1),
+(NULL, '브로치', 25667, 1, 0, 1),
+(NULL, '브리지', 25668, 1, 0, 1),
+(NULL, '브리텐', 25669, 1, 0, 1),
+(NULL, '브리튼', 25670, 1, 0, 1),
+(NULL, '브리핑', 25671, 1, 0, 1),
+(NULL, '블로거', 25672, 1, 0, 1),
+(NULL, '블로그', 25673, 1, 0, 1),
+(NULL, '블루진', 25674, 1, 0, 1),
+(NULL, '비골리', 25675, 1, 0, 1),
+(NULL, '비끼다', 25676, 1, 0, 1),
+(NULL, '비날론', 25677, 1, 0, 1),
+(NULL, '비네거', 25678, 1, 0, 1),
+(NULL, '비니루', 25679, 1, 0, 1),
+(NULL, '비닐류', 25680, 1, 0, 1),
+(NULL, '비단길', 25681, 1, 0, 1),
+(NULL, '비데오', 25682, 1, 0, 1),
+(NULL, '비디오', 25683, 1, 0, 1),
+(NULL, '비로소', 25684, 1, 0, 1),
+(NULL, '비루스', 25685, 1, 0, 1),
+(NULL, '비빔밥', 25686, 1, 0, 1),
+(NULL, '비사우', 25687, 1, 0, 1),
+(NULL, '비스켓', 25688, 1, 0, 1),
+(NULL, '비싸다', 25689, 1, 0, 1),
+(NULL, '비지깨', 25690, 1, 0, 1),
+(NULL, '비키니', 25691, 1, 0, 1),
+(NULL, '비타민', 25692, 1, 0, 1),
+(NULL, '빈대떡', 25693, 1, 0, 1),
+(NULL, '빗방울', 25694, 1, 0, 1),
+(NULL, '빗자루', 25695, 1, 0, 1),
+(NULL, '빙하쥐', 25696, 1, 0, 1),
+(NULL, '빛나다', 25697, 1, 0, 1),
+(NULL, '빨간색', 25698, 1, 0, 1),
+(NULL, '빨래통', 25699, 1, 0, 1),
+(NULL, '빨랫감', 25700, 1, 0, 1),
+(NULL, '빵가루', 25701, 1, 0, 1),
+(NULL, '빵나무', 25702, 1, 0, 1),
+(NULL, '빼내다', 25703, 1, 0, 1),
+(NULL, '빼다지', 25704, 1, 0, 1),
+(NULL, '빼닮다', 25705, 1, 0, 1),
+(NULL, '뺏기다', 25706, 1, 0, 1),
+(NULL, '뻥치다', 25707, 1, 0, 1),
+(NULL, '뿌시다', 25708, 1, 0, 1),
+(NULL, '쁠류스', 25709, 1, 0, 1),
+(NULL, '사거리', 25710, 1, 0, 1),
+(NULL, '사구다', 25711, 1, 0, 1),
+(NULL, '사까시', 25712, 1, 0, 1),
+(NULL, '사나이', 25713, 1, 0, 1),
+(NULL, '사내애', 25714, 1, 0, 1),
+(NULL, '사냥개', 25715, 1, 0, 1),
+(NULL, '사냥꾼', 25716, 1, 0, 1),
+(NULL, '사다리', 25717, 1, 0, 1),
+(NULL, '사루기', 25718, 1, 0, 1),
+(NULL, '사마륨', 25719, 1, 0, 1),
+(NULL, '사모아', 25720, 1, 0, 1),
+(NULL, '사바나', 25721, 1, 0, 1),
+(NULL, '사시미', 25722, 1, 0, 1),
+(NULL, '사우나', 25723, 1, 0, 1),
+(NULL, '사우디', 25724, 1, 0, 1),
+(NULL, '사이다', 25725, 1, 0, 1),
+(NULL, '사이렌', 25726, 1, 0, 1),
+(NULL, '사이즈', 25727, 1, 0, 1),
+(NULL, '사이폰', 25728, 1, 0, 1),
+(NULL, '사진빨', 25729, 1, 0, 1),
+(NULL, '사카린', 25730, 1, 0, 1),
+(NULL, '사탄교', 25731, 1, 0, 1),
+(NULL, '사파리', 25732, 1, 0, 1),
+(NULL, '사할린', 25733, 1, 0, 1),
+(NULL, '산딸기', 25734, 1, 0, 1),
+(NULL, '산양개', 25735, 1, 0, 1),
+(NULL, '산호세', 25736, 1, 0, 1),
+(NULL, '살결물', 25737, 1, 0, 1),
+(NULL, '살까기', 25738, 1, 0, 1),
+(NULL, '살라미', 25739, 1, 0, 1),
+(NULL, '살피개', 25740, 1, 0, 1),
+(NULL, '삼겹살', 25741, 1, 0, 1),
+(NULL, '삼나라', 25742, 1, 0, 1),
+(NULL, '삼태극', 25743, 1, 0, 1),
+(NULL, '삿포로', 25744, 1, 0, 1),
+(NULL, '상괭이', 25745, 1, 0, 1),
+(NULL, '상수리', 25746, 1, 0, 1),
+(NULL, '상어피', 25747, 1, 0, 1),
+(NULL, '상치쌈', 25748, 1, 0, 1),
+(NULL, '상투메', 25749, 1, 0, 1),
+(NULL, '새냥꾼', 25750, 1, 0, 1),
+(NULL, '새롭다', 25751, 1, 0, 1),
+(NULL, '새방자', 25752, 1, 0, 1),
+(NULL, '새벽녘', 25753, 1, 0, 1),
+(NULL, '새아가', 25754, 1, 0, 1),
+(NULL, '새알心', 25755, 1, 0, 1),
+(NULL, '새우장', 25756, 1, 0, 1),
+(NULL, '새우젓', 25757, 1, 0, 1),
+(NULL, '새치기', 25758, 1, 0, 1),
+(NULL, '색소폰', 25759, 1, 0, 1),
+(NULL, '샐러드', 25760, 1, 0, 1),
+(NULL, '샐러리', 25761, 1, 0, 1),
+(NULL, '샛바람', 25762, 1, 0, 1),
+(NULL, '생박쥐', 25763, 1, 0, 1),
+(NULL, '생채기', 25764, 1, 0, 1),
+(NULL, '샤리아', 25765, 1, 0, 1),
+(NULL, '샴페인', 25766, 1, 0, 1),
+(NULL, '샹차이', 25767, 1, 0, 1),
+(NULL, '서까래', 25768, 1, 0, 1),
+(NULL, '서럽다', 25769, 1, 0, 1),
+(NULL, '서양배', 25770, 1, 0, 1),
+(NULL, '서커스', 25771, 1, 0, 1),
+(NULL, '서툴다', 25772, 1, 0, 1),
+(NULL, '석잠풀', 25773, 1, 0, 1),
+(NULL, '선슨아', 25774, 1, 0, 1),
+(NULL, '설거지', 25775, 1, 0, 1),
+(NULL, '섬나라', 25776, 1, 0, 1),
+(NULL, '섬네일', 25777, 1, 0, 1),
+(NULL, '섬참새', 25778, 1, 0, 1),
+(NULL, '성내다', 25779, 1, 0, 1),
+(NULL, '세멘트', 25780, 1, 0, 1),
+(NULL, '세모꼴', 25781, 1, 0, 1),
+(NULL, '세미나', 25782, 1, 0, 1),
+(NULL, '세젤귀', 25783, 1, 0, 1),
+(NULL, '세지다', 25784, 1, 0, 1),
+(NULL, '세차다', 25785, 1, 0, 1),
+(NULL, '셀러리', 25786, 1, 0, 1),
+(NULL, '셀레나', 25787, 1, 0, 1),
+(NULL, '셀레늄', 25788, 1, 0, 1),
+(NULL, '셀로판', 25789, 1, 0, 1),
+(NULL, '셀카봉', 25790, 1, 0, 1),
+(NULL, '션하다', 25791, 1, 0, 1),
+(NULL, '소개팅', 25792, 1, 0, 1),
+(NULL, '소고기', 25793, 1, 0, 1),
+(NULL, '소낙비', 25794, 1, 0, 1),
+(NULL, '소다빵', 25795, 1, 0, 1),
+(NULL, '소라게', 25796, 1, 0, 1),
+(NULL, '소시지', 25797, 1, 0, 1),
+(NULL, '소쩍새', 25798, 1, 0, 1),
+(NULL, '속눈썹', 25799, 1, 0, 1),
+(NULL, '손가방', 25800, 1, 0, 1),
+(NULL, '손바닥', 25801, 1, 0, 1),
+(NULL, '손발톱', 25802, 1, 0, 1),
+(NULL, '손쉽다', 25803, 1, 0, 1),
+(NULL, '손전화', 25804, 1, 0, 1),
+(NULL, '손풍금', 25805, 1, 0, 1),
+(NULL, '솔나무', 25806, 1, 0, 1),
+(NULL, '솔방울', 25807, 1, 0, 1),
+(NULL, '송아지', 25808, 1, 0, 1),
+(NULL, '쇠고기', 25809, 1, 0, 1),
+(NULL, '쇠뒤쥐', 25810, 1, 0, 1),
+(NULL, '쇠비름', 25811, 1, 0, 1),
+(NULL, '쇼라인', 25812, 1, 0, 1),
+(NULL, '쇼트닝', 25813, 1, 0, 1),
+(NULL, '수룽대', 25814, 1, 0, 1),
+(NULL, '수액백', 25815, 1, 0, 1),
+(NULL, '수없이', 25816, 1, 0, 1),
+(NULL, '숟가락', 25817, 1, 0, 1),
+(NULL, '술기운', 25818, 1, 0, 1),
+(NULL, '술라쥐', 25819, 1, 0, 1),
+(NULL, '숨쉬다', 25820, 1, 0, 1),
+(NULL, '숨지다', 25821, 1, 0, 1),
+(NULL, '숨키다', 25822, 1, 0, 1),
+(NULL, '숫잔대', 25823, 1, 0, 1),
+(NULL, '숫처녀', 25824, 1, 0, 1),
+(NULL, '숲들쥐', 25825, 1, 0, 1),
+(NULL, '쉬메일', 25826, 1, 0, 1),
+(NULL, '슈니첼', 25827, 1, 0, 1),
+(NULL, '슈베린', 25828, 1, 0, 1),
+(NULL, '슈퍼맨', 25829, 1, 0, 1),
+(NULL, '스도쿠', 25830, 1, 0, 1),
+(NULL, '스리섬', 25831, 1, 0, 1),
+(NULL, '스릴러', 25832, 1, 0, 1),
+(NULL, '스모그', 25833, 1, 0, 1),
+(NULL, '스무째', 25834, 1, 0, 1),
+(NULL, '스스로', 25835, 1, 0, 1),
+(NULL, '스시국', 25836, 1, 0, 1),
+(NULL, '스웨덴', 25837, 1, 0, 1),
+(NULL, '스웨터', 25838, 1, 0, 1),
+(NULL, '스위치', 25839, 1, 0, 1),
+(NULL, '스칸듐', 25840, 1, 0, 1),
+(NULL, '스캐너', 25841, 1, 0, 1),
+(NULL, '스캔들', 25842, 1, 0, 1),
+(NULL, '스커트', 25843, 1, 0, 1),
+(NULL, '스컹크', 25844, 1, 0, 1),
+(NULL, '스케줄', 25845, 1, 0, 1),
+(NULL, '스케치', 25846, 1, 0, 1),
+(NULL, '스케트', 25847, 1, 0, 1),
+(NULL, '스쿠터', 25848, 1, 0, 1),
+(NULL, '스쿼드', 25849, 1, 0, 1),
+(NULL, '스쿼시', 25850, 1, 0, 1),
+(NULL, '스크랩', 25851, 1, 0, 1),
+(NULL, '스크린', 25852, 1, 0, 1),
+(NULL, '스키장', 25853, 1, 0, 1),
+(NULL, '스킨십', 25854, 1, 0, 1),
+(NULL, '스타일', 25855, 1, 0, 1),
+(NULL, '스타킹', 25856, 1, 0, 1),
+(NULL, '스탈린', 25857, 1, 0, 1),
+(NULL, '스태프', 25858, 1, 0, 1),
+(NULL, '스터킹', 25859, 1, 0, 1),
+(NULL, '스토리', 25860, 1, 0, 1),
+(NULL, '스토브', 25861, 1, 0, 1),
+(NULL, '스토커', 25862, 1, 0, 1),
+(NULL, '스트로', 25863, 1, 0, 1),
+(NULL, '스티커', 25864, 1, 0, 1),
+(NULL, '스파이', 25865, 1, 0, 1),
+(NULL, '스펀지', 25866, 1, 0, 1),
+(NULL, '스폰서', 25867, 1, 0, 1),
+(NULL, '슬로건', 25868, 1, 0, 1),
+(NULL, '슬리퍼', 25869, 1, 0, 1),
+(NULL, '슬프다', 25870, 1, 0, 1),
+(NULL, '승겁다', 25871, 1, 0, 1),
+(NULL, '승냥이', 25872, 1, 0, 1),
+(NULL, '시궁쥐', 25873, 1, 0, 1),
+(NULL, '시금치', 25874, 1, 0, 1),
+(NULL, '시나이', 25875, 1, 0, 1),
+(NULL, '시냅스', 25876, 1, 0, 1),
+(NULL, '시누이', 25877, 1, 0, 1),
+(NULL, '시더구', 25878, 1, 0, 1),
+(NULL, '시리다', 25879, 1, 0, 1),
+(NULL, '시리즈', 25880, 1, 0, 1),
+(NULL, '시멘트', 25881, 1, 0, 1),
+(NULL, '시보귬', 25882, 1, 0, 1),
+(NULL, '시스템', 25883, 1, 0, 1),
+(NULL, '시애틀', 25884, 1, 0, 1),
+(NULL, '시카고', 25885, 1, 0, 1),
+(NULL, '시프다', 25886, 1, 0, 1),
+(NULL, '신부님', 25887, 1, 0, 1),
+(NULL, '신시아', 25888, 1, 0, 1),
+(NULL, '신칸센', 25889, 1, 0, 1),
+(NULL, '실고기', 25890, 1, 0, 1),
+(NULL, '실뜨기', 25891, 1, 0, 1),
+(NULL, '실루엣', 25892, 1, 0, 1),
+(NULL, '실린더', 25893, 1, 0, 1),
+(NULL, '실뱅어', 25894, 1, 0, 1),
+(NULL, '심들다', 25895, 1, 0, 1),
+(NULL, '심벌즈', 25896, 1, 0, 1),
+(NULL, '심부름', 25897, 1, 0, 1),
+(NULL, '싱크대', 25898, 1, 0, 1),
+(NULL, '싶으다', 25899, 1, 0, 1),
+(NULL, '싸움터', 25900, 1, 0, 1),
+(NULL, '싸인펜', 25901, 1, 0, 1),
+(NULL, '싼룬처', 25902, 1, 0, 1),
+(NULL, '쌍동이', 25903, 1, 0, 1),
+(NULL, '쌍둥이', 25904, 1, 0, 1),
+(NULL, '쌍살벌', 25905, 1, 0, 1),
+(NULL, '써리다', 25906, 1, 0, 1),
+(NULL, '써우지', 25907, 1, 0, 1),
+(NULL, '쏘가리', 25908, 1, 0, 1),
+(NULL, '쏙독새', 25909, 1, 0, 1),
+(NULL, '쓰나미', 25910, 1, 0, 1),
+(NULL, '쓰딸린', 25911, 1, 0, 1),
+(NULL, '쓰리다', 25912, 1, 0, 1),
+(NULL, '쓸개즙', 25913, 1, 0, 1),
+(NULL, '씌우다', 25914, 1, 0, 1),
+(NULL, '씨비리', 25915, 1, 0, 1),
+(NULL, '씻기다', 25916, 1, 0, 1),
+(NULL, '아가미', 25917, 1, 0, 1),
+(NULL, '아기집', 25918, 1, 0, 1),
+(NULL, '아드님', 25919, 1, 0, 1),
+(NULL, '아람어', 25920, 1, 0, 1),
+(NULL, '아랍어', 25921, 1, 0, 1),
+(NULL, '아래위', 25922, 1, 0, 1),
+(NULL, '아래층', 25923, 1, 0, 1),
+(NULL, '아르곤', 25924, 1, 0, 1),
+(NULL, '아리쇠', 25925, 1, 0, 1),
+(NULL, '아마도', 25926, 1, 0, 1),
+(NULL, '아마존', 25927, 1, 0, 1),
+(NULL, '아말감', 25928, 1, 0, 1),
+(NULL, '아메바', 25929, 1, 0, 1),
+(NULL, '아몬드', 25930, 1, 0, 1),
+(NULL, '아무튼', 25931, 1, 0, 1),
+(NULL, '아바지', 25932, 1, 0, 1),
+(NULL, '아버님', 25933, 1, 0, 1),
+(NULL, '아버지', 25934, 1, 0, 1),
+(NULL, '아베크', 25935, 1, 0, 1),
+(NULL, '아부자', 25936, 1, 0, 1),
+(NULL, '아부지', 25937, 1, 0, 1),
+(NULL, '아비장', 25938, 1, 0, 1),
+(NULL, '아빠트', 25939, 1, 0, 1),
+(NULL, '아스텍', 25940, 1, 0, 1),
+(NULL, '아이다', 25941, 1, 0, 1),
+(NULL, '아이돌', 25942, 1, 0, 1),
+(NULL, '아이들', 25943, 1, 0, 1),
+(NULL, '아이디', 25944, 1, 0, 1),
+(NULL, '아이콘', 25945, 1, 0, 1),
+(NULL, '아이템', 25946, 1, 0, 1),
+(NULL, '아이폰', 25947, 1, 0, 1),
+(NULL, '아체쥐', 25948, 1, 0, 1),
+(NULL, '아칸소', 25949, 1, 0, 1),
+(NULL, '아크라', 25950, 1, 0, 1),
+(NULL, '아토피', 25951, 1, 0, 1),
+(NULL, '아피아', 25952, 1, 0, 1),
+(NULL, '아홉째', 25953, 1, 0, 1),
+(NULL, '안도라', 25954, 1, 0, 1),
+(NULL, '안마당', 25955, 1, 0, 1),
+(NULL, '안아키', 25956, 1, 0, 1),
+(NULL, '안후이', 25957, 1, 0, 1),
+(NULL, '알구다', 25958, 1, 0, 1),
+(NULL, '알까기', 25959, 1, 0, 1),
+(NULL, '알껍질', 25960, 1, 0, 1),
+(NULL, '알라디', 25961, 1, 0, 1),
+(NULL, '알라딘', 25962, 1, 0, 1),
+(NULL, '알라신', 25963, 1, 0, 1),
+(NULL, '알레포', 25964, 1, 0, 1),
+(NULL, '알리고', 25965, 1, 0, 1),
+(NULL, '알마티', 25966, 1, 0, 1),
+(NULL, '알버타', 25967, 1, 0, 1),
+(NULL, '알제리', 25968, 1, 0, 1),
+(NULL, '알카인', 25969, 1, 0, 1),
+(NULL, '알칼리', 25970, 1, 0, 1),
+(NULL, '알케인', 25971, 1, 0, 1),
+(NULL, '알타이', 25972, 1, 0, 1),
+(NULL, '암퇘지', 25973, 1, 0, 1),
+(NULL, '암페어', 25974, 1, 0, 1),
+(NULL, '압생트', 25975, 1, 0, 1),
+(NULL, '앙골라', 25976, 1, 0, 1),
+(NULL, '앙상블', 25977, 1, 0, 1),
+(NULL, '앙케트', 25978, 1, 0, 1),
+(NULL, '앞다리', 25979, 1, 0, 1),
+(NULL, '앞두다', 25980, 1, 0, 1),
+(NULL, '앞에서', 25981, 1, 0, 1),
+(NULL, '앞치마', 25982, 1, 0, 1),
+(NULL, '애급쥐', 25983, 1, 0, 1),
+(NULL, '앨리스', 25984, 1, 0, 1),
+(NULL, '앨리트', 25985, 1, 0, 1),
+(NULL, '앨버타', 25986, 1, 0, 1),
+(NULL, '앳되다', 25987, 1, 0, 1),
+(NULL, '야경꾼', 25988, 1, 0, 1),
+(NULL, '야마토', 25989, 1, 0, 1),
+(NULL, '야운데', 25990, 1, 0, 1),
+(NULL, '야쿠자', 25991, 1, 0, 1),
+(NULL, '얀데레', 25992, 1, 0, 1),
+(NULL, '양상추', 25993, 1, 0, 1),
+(NULL, '어ᇝ다', 25994, 1, 0, 1),
+(NULL, '어깨뼈', 25995, 1, 0, 1),
+(NULL, '어댑터', 25996, 1, 0, 1),
+(NULL, '어덩이', 25997, 1, 0, 1),
+(NULL, '어럽다', 25998, 1, 0, 1),
+(NULL, '어려움', 25999, 1, 0, 1),
+(NULL, '어름치', 26000, 1, 0, 1),
+(NULL, '어린애', 26001, 1, 0, 1),
+(NULL, '어린이', 26002, 1, 0, 1),
+(NULL, '어마이', 26003, 1, 0, 1),
+(NULL, '어머니', 26004, 1, 0, 1),
+(NULL, '어머님', 26005, 1, 0, 1),
+(NULL, '어울림', 26006, 1, 0, 1),
+(NULL, '어저께', 26007, 1, 0, 1),
+(NULL, '어젯밤', 26008, 1, 0, 1),
+(NULL, '얼룩말', 26009, 1, 0, 1),
+(NULL, '얼리다', 26010, 1, 0, 1),
+(NULL, '업동이', 26011, 1, 0, 1),
+(NULL, '업둥이', 26012, 1, 0, 1),
+(NULL, '엉뎅이', 26013, 1, 0, 1),
+(NULL, '엊그제', 26014, 1, 0, 1),
+(NULL, '에너지', 26015, 1, 0, 1),
+(NULL, '에르븀', 26016, 1, 0, 1),
+(NULL, '에모지', 26017, 1, 0, 1),
+(NULL, '에세이', 26018, 1, 0, 1),
+(NULL, '에어백', 26019, 1, 0, 1),
+(NULL, '에어컨', 26020, 1, 0, 1),
+(NULL, '에이즈', 26021, 1, 0, 1),
+(NULL, '에테인', 26022, 1, 0, 1),
+(NULL, '에티켓', 26023, 1, 0, 1),
+(NULL, '에펜아', 26024, 1, 0, 1),
+(NULL, '엑스선', 26025, 1, 0, 1),
+(NULL, '엘니노', 26026, 1, 0, 1),
+(NULL, '엘니뇨', 26027, 1, 0, 1),
+(NULL, '엘리트', 26028, 1, 0, 1),
+(NULL, '엘에이', 26029, 1, 0, 1),
+(NULL, '여기다', 26030, 1, 0, 1),
+(NULL, '여남은', 26031, 1, 0, 1),
+(NULL, '여덟째', 26032, 1, 0, 1),
+(NULL, '여든째', 26033, 1, 0, 1),
+(NULL, '여섯째', 26034, 1, 0, 1),
+(NULL, '여우비', 26035, 1, 0, 1),
+(NULL, '여의자', 26036, 1, 0, 1),
+(NULL, '여전히', 26037, 1, 0, 1),
+(NULL, '여호와', 26038, 1, 0, 1),
+(NULL, '역대급', 26039, 1, 0, 1),
+(NULL, '연밥소', 26040, 1, 0, 1),
+(NULL, '열다섯', 26041, 1, 0, 1),
+(NULL, '열셋째', 26042, 1, 0, 1),
+(NULL, '열쇠글', 26043, 1, 0, 1),
+(NULL, '열아홉', 26044, 1, 0, 1),
+(NULL, '열여덟', 26045, 1, 0, 1),
+(NULL, '열여섯', 26046, 1, 0, 1),
+(NULL, '열일곱', 26047, 1, 0, 1),
+(NULL, '열하나', 26048, 1, 0, 1),
+(NULL, '열한째', 26049, 1, 0, 1),
+(NULL, '엿기름', 26050, 1, 0, 1),
+(NULL, '영감님', 26051, 1, 0, 1),
+(NULL, '영성모', 26052, 1, 0, 1),
+(NULL, '영양탕', 26053, 1, 0, 1),
+(NULL, '예순째', 26054, 1, 0, 1),
+(NULL, '옛한글', 26055, 1, 0, 1),
+(NULL, '오느비', 26056, 1, 0, 1),
+(NULL, '오덕후', 26057, 1, 0, 1),
+(NULL, '오데사', 26058, 1, 0, 1),
+(NULL, '오디오', 26059, 1, 0, 1),
+(NULL, '오래다', 26060, 1, 0, 1),
+(NULL, '오레건', 26061, 1, 0, 1),
+(NULL, '오렌지', 26062, 1, 0, 1),
+(NULL, '오룬손', 26063, 1, 0, 1),
+(NULL, '오르간', 26064, 1, 0, 1),
+(NULL, '오르다', 26065, 1, 0, 1),
+(NULL, '오른손', 26066, 1, 0, 1),
+(NULL, '오른쪽', 26067, 1, 0, 1),
+(NULL, '오리건', 26068, 1, 0, 1),
+(NULL, '오리알', 26069, 1, 0, 1),
+(NULL, '오린손', 26070, 1, 0, 1),
+(NULL, '오메가', 26071, 1, 0, 1),
+(NULL, '오믈렛', 26072, 1, 0, 1),
+(NULL, '오보에', 26073, 1, 0, 1),
+(NULL, '오사카', 26074, 1, 0, 1),
+(NULL, '오스만', 26075, 1, 0, 1),
+(NULL, '오우다', 26076, 1, 0, 1),
+(NULL, '오줌통', 26077, 1, 0, 1),
+(NULL, '오카피', 26078, 1, 0, 1),
+(NULL, '오케이', 26079, 1, 0, 1),
+(NULL, '오크너', 26080, 1, 0, 1),
+(NULL, '오타와', 26081, 1, 0, 1),
+(NULL, '오타쿠', 26082, 1, 0, 1),
+(NULL, '오트밀', 26083, 1, 0, 1),
+(NULL, '오페라', 26084, 1, 0, 1),
+(NULL, '오피스', 26085, 1, 0, 1),
+(NULL, '오함마', 26086, 1, 0, 1),
+(NULL, '옥테인', 26087, 1, 0, 1),
+(NULL, '온공일', 26088, 1, 0, 1),
+(NULL, '온라인', 26089, 1, 0, 1),
+(NULL, '올리고', 26090, 1, 0, 1),
+(NULL, '올리브', 26091, 1, 0, 1),
+(NULL, '올챙이', 26092, 1, 0, 1),
+(NULL, '옴스크', 26093, 1, 0, 1),
+(NULL, '옷걸이', 26094, 1, 0, 1),
+(NULL, '옷고름', 26095, 1, 0, 1),
+(NULL, '와사비', 26096, 1, 0, 1),
+(NULL, '완두콩', 26097, 1, 0, 1),
+(NULL, '왕종개', 26098, 1, 0, 1),
+(NULL, '왕지네', 26099, 1, 0, 1),
+(NULL, '왜매치', 26100, 1, 0, 1),
+(NULL, '왱기다', 26101, 1, 0, 1),
+(NULL, '요사이', 26102, 1, 0, 1),
+(NULL, '요컨대', 26103, 1, 0, 1),
+(NULL, '요크셔', 26104, 1, 0, 1),
+(NULL, '용상어', 26105, 1, 0, 1),
+(NULL, '우라늄', 26106, 1, 0, 1),
+(NULL, '우렁이', 26107, 1, 0, 1),
+(NULL, '우롱차', 26108, 1, 0, 1),
+(NULL, '우크라', 26109, 1, 0, 1),
+(NULL, '운전대', 26110, 1, 0, 1),
+(NULL, '울버린', 26111, 1, 0, 1),
+(NULL, '웁살라', 26112, 1, 0, 1),
+(NULL, '웅덩이', 26113, 1, 0, 1),
+(NULL, '워라밸', 26114, 1, 0, 1),
+(NULL, '워크숍', 26115, 1, 0, 1),
+(NULL, '원기둥', 26116, 1, 0, 1),
+(NULL, '원추리', 26117, 1, 0, 1),
+(NULL, '원피스', 26118, 1, 0, 1),
+(NULL, '월드컵', 26119, 1, 0, 1),
+(NULL, '웨스턴', 26120, 1, 0, 1),
+(NULL, '웨이터', 26121, 1, 0, 1),
+(NULL, '위구르', 26122, 1, 0, 1),
+(NULL, '위니펙', 26123, 1, 0, 1),
+(NULL, '위스키', 26124, 1, 0, 1),
+(NULL, '윈도우', 26125, 1, 0, 1),
+(NULL, '유니스', 26126, 1, 0, 1),
+(NULL, '유니콘', 26127, 1, 0, 1),
+(NULL, '유니폼', 26128, 1, 0, 1),
+(NULL, '유대교', 26129, 1, 0, 1),
+(NULL, '유대인', 26130, 1, 0, 1),
+(NULL, '유로퓸', 26131, 1, 0, 1),
+(NULL, '유르트', 26132, 1, 0, 1),
+(NULL, '유카타', 26133, 1, 0, 1),
+(NULL, '유튜브', 26134, 1, 0, 1),
+(NULL, '융통성', 26135, 1, 0, 1),
+(NULL, '으아리', 26136, 1, 0, 1),
+(NULL, '은대구', 26137, 1, 0, 1),
+(NULL, '음식값', 26138, 1, 0, 1),
+(NULL, '응우옌', 26139, 1, 0, 1),
+(NULL, '이대로', 26140, 1, 0, 1),
+(NULL, '이따가', 26141, 1, 0, 1),
+(NULL, '이란어', 26142, 1, 0, 1),
+(NULL, '이른바', 26143, 1, 0, 1),
+(NULL, '이리듐', 26144, 1, 0, 1),
+(NULL, '이메일', 26145, 1, 0, 1),
+(NULL, '이모지', 26146, 1, 0, 1),
+(NULL, '이무기', 26147, 1, 0, 1),
+(NULL, '이벤트', 26148, 1, 0, 1),
+(NULL, '이슬람', 26149, 1, 0, 1),
+(NULL, '이어링', 26150, 1, 0, 1),
+(NULL, '이어폰', 26151, 1, 0, 1),
+(NULL, '이우지', 26152, 1, 0, 1),
+(NULL, '이을매', 26153, 1, 0, 1),
+(NULL, '이지메', 26154, 1, 0, 1),
+(NULL, '이터븀', 26155, 1, 0, 1),
+(NULL, '이트륨', 26156, 1, 0, 1),
+(NULL, '이튿날', 26157, 1, 0, 1),
+(NULL, '인터넷', 26158, 1, 0, 1),
+(NULL, '인터뷰', 26159, 1, 0, 1),
+(NULL, '일거리', 26160, 1, 0, 1),
+(NULL, '일곱째', 26161, 1, 0, 1),
+(NULL, '일년감', 26162, 1, 0, 1),
+(NULL, '일여덟', 26163, 1, 0, 1),
+(NULL, '일찍이', 26164, 1, 0, 1),
+(NULL, '일흔째', 26165, 1, 0, 1),
+(NULL, '입맞춤', 26166, 1, 0, 1),
+(NULL, '입풍금', 26167, 1, 0, 1),
+(NULL, '잉어빵', 26168, 1, 0, 1),
+(NULL, '잊히다', 26169, 1, 0, 1),
+(NULL, '자꾸만', 26170, 1, 0, 1),
+(NULL, '자라다', 26171, 1, 0, 1),
+(NULL, '자르다', 26172, 1, 0, 1),
+(NULL, '자리공', 26173, 1, 0, 1),
+(NULL, '자살골', 26174, 1, 0, 1),
+(NULL, '자장가', 26175, 1, 0, 1),
+(NULL, '자주복', 26176, 1, 0, 1),
+(NULL, '자책골', 26177, 1, 0, 1),
+(NULL, '자카트', 26178, 1, 0, 1),
+(NULL, '잠기다', 26179, 1, 0, 1),
+(NULL, '잠들다', 26180, 1, 0, 1),
+(NULL, '잠자다', 26181, 1, 0, 1),
+(NULL, '잡수다', 26182, 1, 0, 1),
+(NULL, '잡히다', 26183, 1, 0, 1),
+(NULL, '장모님', 26184, 1, 0, 1),
+(NULL, '장봇짐', 26185, 1, 0, 1),
+(NULL, '재떨이', 26186, 1, 0, 1),
+(NULL, '재밌다', 26187, 1, 0, 1),
+(NULL, '재앤고', 26188, 1, 0, 1),
+(NULL, '재채기', 26189, 1, 0, 1),
+(NULL, '잼기다', 26190, 1, 0, 1),
+(NULL, '잿방어', 26191, 1, 0, 1),
+(NULL, '저가락', 26192, 1, 0, 1),
+(NULL, '저고리', 26193, 1, 0, 1),
+(NULL, '저러다', 26194, 1, 0, 1),
+(NULL, '저렇다', 26195, 1, 0, 1),
+(NULL, '저리다', 26196, 1, 0, 1),
+(NULL, '저마늄', 26197, 1, 0, 1),
+(NULL, '적히다', 26198, 1, 0, 1),
+(NULL, '전갱이', 26199, 1, 0, 1),
+(NULL, '전기차', 26200, 1, 0, 1),
+(NULL, '전디다', 26201, 1, 0, 1),
+(NULL, '전쟁터', 26202, 1, 0, 1),
+(NULL, '절가지', 26203, 1, 0, 1),
+(NULL, '젊은이', 26204, 1, 0, 1),
+(NULL, '점몰개', 26205, 1, 0, 1),
+(NULL, '젓뱅어', 26206, 1, 0, 1),
+(NULL, '정구지', 26207, 1, 0, 1),
+(NULL, '제비꽃', 26208, 1, 0, 1),
+(NULL, '제빵사', 26209, 1, 0, 1),
+(NULL, '제스처', 26210, 1, 0, 1),
+(NULL, '조가비', 26211, 1, 0, 1),
+(NULL, '조랑말', 26212, 1, 0, 1),
+(NULL, '조부니', 26213, 1, 0, 1),
+(NULL, '조선옷', 26214, 1, 0, 1),
+(NULL, '조임틀', 26215, 1, 0, 1),
+(NULL, '조카딸', 26216, 1, 0, 1),
+(NULL, '존댓말', 26217, 1, 0, 1),
+(NULL, '존잘남', 26218, 1, 0, 1),
+(NULL, '졸인젖', 26219, 1, 0, 1),
+(NULL, '좆되다', 26220, 1, 0, 1),
+(NULL, '죠지아', 26221, 1, 0, 1),
+(NULL, '주근깨', 26222, 1, 0, 1),
+(NULL, '주둥치', 26223, 1, 0, 1),
+(NULL, '주먹밥', 26224, 1, 0, 1),
+(NULL, '주키니', 26225, 1, 0, 1),
+(NULL, '줄공치', 26226, 1, 0, 1),
+(NULL, '줄망둑', 26227, 1, 0, 1),
+(NULL, '줄몰개', 26228, 1, 0, 1),
+(NULL, '줄이다', 26229, 1, 0, 1),
+(NULL, '줄임말', 26230, 1, 0, 1),
+(NULL, '줄종개', 26231, 1, 0, 1),
+(NULL, '줌 인', 26232, 1, 0, 1),
+(NULL, '중고기', 26233, 1, 0, 1),
+(NULL, '즁국말', 26234, 1, 0, 1),
+(NULL, '즐기다', 26235, 1, 0, 1),
+(NULL, '지게차', 26236, 1, 0, 1),
+(NULL, '지난밤', 26237, 1, 0, 1),
+(NULL, '지난번', 26238, 1, 0, 1),
+(NULL, '지난해', 26239, 1, 0, 1),
+(NULL, '지레이', 26240, 1, 0, 1),
+(NULL, '지뢰밭', 26241, 1, 0, 1),
+(NULL, '지루다', 26242, 1, 0, 1),
+(NULL, '지름길', 26243, 1, 0, 1),
+(NULL, '지아비', 26244, 1, 0, 1),
+(NULL, '지하드', 26245, 1, 0, 1),
+(NULL, '진달래', 26246, 1, 0, 1),
+(NULL, '진딧물', 26247, 1, 0, 1),
+(NULL, '집들이', 26248, 1, 0, 1),
+(NULL, '집박쥐', 26249, 1, 0, 1),
+(NULL, '집안일', 26250, 1, 0, 1),
+(NULL, '집오리', 26251, 1, 0, 1),
+(NULL, '집토끼', 26252, 1, 0, 1),
+(NULL, '징구리', 26253, 1, 0, 1),
+(NULL, '짜장면', 26254, 1, 0, 1),
+(NULL, '짜하다', 26255, 1, 0, 1),
+(NULL, '짱뚱어', 26256, 1, 0, 1),
+(NULL, '쬧기다', 26257, 1, 0, 1),
+(NULL, '찜질방', 26258, 1, 0, 1),
+(NULL, '차림표', 26259, 1, 0, 1),
+(NULL, '차아재', 26260, 1, 0, 1),
+(NULL, '참기름', 26261, 1, 0, 1),
+(NULL, '참나물', 26262, 1, 0, 1),
+(NULL, '참당귀', 26263, 1, 0, 1),
+(NULL, '참마자', 26264, 1, 0, 1),
+(NULL, '참말로', 26265, 1, 0, 1),
+(NULL, '참몰개', 26266, 1, 0, 1),
+(NULL, '참붕어', 26267, 1, 0, 1),
+(NULL, '참새피', 26268, 1, 0, 1),
+(NULL, '참수리', 26269, 1, 0, 1),
+(NULL, '참종개', 26270, 1, 0, 1),
+(NULL, '채리다', 26271, 1, 0, 1),
+(NULL, '책갈피', 26272, 1, 0, 1),
+(NULL, '책벌레', 26273, 1, 0, 1),
+(NULL, '챌린저', 26274, 1, 0, 1),
+(NULL, '챌린지', 26275, 1, 0, 1),
+(NULL, '챔피언', 26276, 1, 0, 1),
+(NULL, '척하다', 26277, 1, 0, 1),
+(NULL, '천천히', 26278, 1, 0, 1),
+(NULL, '철밥통', 26279, 1, 0, 1),
+(NULL, '첫머이', 26280, 1, 0, 1),
+(NULL, '첫사랑', 26281, 1, 0, 1),
+(NULL, '청도요', 26282, 1, 0, 1),
+(NULL, '청바지', 26283, 1, 0, 1),
+(NULL, '청소솔', 26284, 1, 0, 1),
+(NULL, '체스꼬', 26285, 1, 0, 1),
+(NULL, '체스판', 26286, 1, 0, 1),
+(NULL, '체인톱', 26287, 1, 0, 1),
+(NULL, '체첸어', 26288, 1, 0, 1),
+(NULL, '초롱꽃', 26289, 1, 0, 1),
+(NULL, '초콜렛', 26290, 1, 0, 1),
+(NULL, '초콜릿', 26291, 1, 0, 1),
+(NULL, '초하루', 26292, 1, 0, 1),
+(NULL, '총개기', 26293, 1, 0, 1),
+(NULL, '춤추다', 26294, 1, 0, 1),
+(NULL, '취나물', 26295, 1, 0, 1),
+(NULL, '취리히', 26296, 1, 0, 1),
+(NULL, '츄잉껌', 26297, 1, 0, 1),
+(NULL, '츤데레', 26298, 1, 0, 1),
+(NULL, '치루다', 26299, 1, 0, 1),
+(NULL, '치와와', 26300, 1, 0, 1),
+(NULL, '침팬지', 26301, 1, 0, 1),
+(NULL, '칭다오', 26302, 1, 0, 1),
+(NULL, '칭하이', 26303, 1, 0, 1),
+(NULL, '카게베', 26304, 1, 0, 1),
+(NULL, '카공족', 26305, 1, 0, 1),
+(NULL, '카나다', 26306, 1, 0, 1),
+(NULL, '카니발', 26307, 1, 0, 1),
+(NULL, '카다몸', 26308, 1, 0, 1),
+(NULL, '카드뮴', 26309, 1, 0, 1),
+(NULL, '카디건', 26310, 1, 0, 1),
+(NULL, '카라반', 26311, 1, 0, 1),
+(NULL, '카라치', 26312, 1, 0, 1),
+(NULL, '카라칼', 26313, 1, 0, 1),
+(NULL, '카렌더', 26314, 1, 0, 1),
+(NULL, '카르텔', 26315, 1, 0, 1),
+(NULL, '카메라', 26316, 1, 0, 1),
+(NULL, '카메룬', 26317, 1, 0, 1),
+(NULL, '카바레', 26318, 1, 0, 1),
+(NULL, '카세트', 26319, 1, 0, 1),
+(NULL, '카우치', 26320, 1, 0, 1),
+(NULL, '카운터', 26321, 1, 0, 1),
+(NULL, '카이만', 26322, 1, 0, 1),
+(NULL, '카지노', 26323, 1, 0, 1),
+(NULL, '카카오', 26324, 1, 0, 1),
+(NULL, '카페인', 26325, 1, 0, 1),
+(NULL, '칵테일', 26326, 1, 0, 1),
+(NULL, '칼로리', 26327, 1, 0, 1),
+(NULL, '칼리움', 26328, 1, 0, 1),
+(NULL, '칼리파', 26329, 1, 0, 1),
+(NULL, '칼상어', 26330, 1, 0, 1),
+(NULL, '칼파스', 26331, 1, 0, 1),
+(NULL, '캄차카', 26332, 1, 0, 1),
+(NULL, '캄팔라', 26333, 1, 0, 1),
+(NULL, '캐더링', 26334, 1, 0, 1),
+(NULL, '캐러멜', 26335, 1, 0, 1),
+(NULL, '캐묻다', 26336, 1, 0, 1),
+(NULL, '캐물음', 26337, 1, 0, 1),
+(NULL, '캐비어', 26338, 1, 0, 1),
+(NULL, '캐스팅', 26339, 1, 0, 1),
+(NULL, '캔버스', 26340, 1, 0, 1),
+(NULL, '캔사스', 26341, 1, 0, 1),
+(NULL, '캔자스', 26342, 1, 0, 1),
+(NULL, '캠퍼스', 26343, 1, 0, 1),
+(NULL, '캠페인', 26344, 1, 0, 1),
+(NULL, '캡스턴', 26345, 1, 0, 1),
+(NULL, '캥거루', 26346, 1, 0, 1),
+(NULL, '커미션', 26347, 1, 0, 1),
+(NULL, '커엽다', 26348, 1, 0, 1),
+(NULL, '커지다', 26349, 1, 0, 1),
+(NULL, '컴퓨터', 26350, 1, 0, 1),
+(NULL, '케니아', 26351, 1, 0, 1),
+(NULL, '케더링', 26352, 1, 0, 1),
+(NULL, '케바케', 26353, 1, 0, 1),
+(NULL, '케이블', 26354, 1, 0, 1),
+(NULL, '케이크', 26355, 1, 0, 1),
+(NULL, '케이팝', 26356, 1, 0, 1),
+(NULL, '케피르', 26357, 1, 0, 1),
+(NULL, '켄터키', 26358, 1, 0, 1),
+(NULL, '코다리', 26359, 1, 0, 1),
+(NULL, '코딱지', 26360, 1, 0, 1),
+(NULL, '코리아', 26361, 1, 0, 1),
+(NULL, '코멘트', 26362, 1, 0, 1),
+(NULL, '코미디', 26363, 1, 0, 1),
+(NULL, '코브라', 26364, 1, 0, 1),
+(NULL, '코뿔새', 26365, 1, 0, 1),
+(NULL, '코뿔소', 26366, 1, 0, 1),
+(NULL, '코안경', 26367, 1, 0, 1),
+(NULL, '코알라', 26368, 1, 0, 1),
+(NULL, '코요테', 26369, 1, 0, 1),
+(NULL, '코카인', 26370, 1, 0, 1),
+(NULL, '코코아', 26371, 1, 0, 1),
+(NULL, '코크스', 26372, 1, 0, 1),
+(NULL, '코토누', 26373, 1, 0, 1),
+(NULL, '코헬렛', 26374, 1, 0, 1),
+(NULL, '콘도르', 26375, 1, 0, 1),
+(NULL, '콘비프', 26376, 1, 0, 1),
+(NULL, '콘서트', 26377, 1, 0, 1),
+(NULL, '콘셉트', 26378, 1, 0, 1),
+(NULL, '콘택트', 26379, 1, 0, 1),
+(NULL, '콜라보', 26380, 1, 0, 1),
+(NULL, '콜옵션', 26381, 1, 0, 1),
+(NULL, '콜카타', 26382, 1, 0, 1),
+(NULL, '콜호스', 26383, 1, 0, 1),
+(NULL, '콤바인', 26384, 1, 0, 1),
+(NULL, '콤퓨터', 26385, 1, 0, 1),
+(NULL, '콧구멍', 26386, 1, 0, 1),
+(NULL, '콧노래', 26387, 1, 0, 1),
+(NULL, '콩기름', 26388, 1, 0, 1),
+(NULL, '콩나물', 26389, 1, 0, 1),
+(NULL, '콩자반', 26390, 1, 0, 1),
+(NULL, '콩쿠르', 26391, 1, 0, 1),
+(NULL, '쿠데타', 26392, 1, 0, 1),
+(NULL, '쿨라크', 26393, 1, 0, 1),
+(NULL, '크낙새', 26394, 1, 0, 1),
+(NULL, '크라상', 26395, 1, 0, 1),
+(NULL, '크래시', 26396, 1, 0, 1),
+(NULL, '크래커', 26397, 1, 0, 1),
+(NULL, '크레용', 26398, 1, 0, 1),
+(NULL, '크레인', 26399, 1, 0, 1),
+(NULL, '크로뮴', 26400, 1, 0, 1),
+(NULL, '크로켓', 26401, 1, 0, 1),
+(NULL, '크리스', 26402, 1, 0, 1),
+(NULL, '크리켓', 26403, 1, 0, 1),
+(NULL, '크바스', 26404, 1, 0, 1),
+(NULL, '크세논', 26405, 1, 0, 1),
+(NULL, '클래스', 26406, 1, 0, 1),
+(NULL, '클램프', 26407, 1, 0, 1),
+(NULL, '클마니', 26408, 1, 0, 1),
+(NULL, '클아매', 26409, 1, 0, 1),
+(NULL, '클아반', 26410, 1, 0, 1),
+(NULL, '클아배', 26411, 1, 0, 1),
+(NULL, '키갈리', 26412, 1, 0, 1),
+(NULL, '키보드', 26413, 1, 0, 1),
+(NULL, '키워드', 26414, 1, 0, 1),
+(NULL, '킨샤사', 26415, 1, 0, 1),
+(NULL, '킹받다', 26416, 1, 0, 1),
+(NULL, '킹스턴', 26417, 1, 0, 1),
+(NULL, '타는곳', 26418, 1, 0, 1),
+(NULL, '타밀어', 26419, 1, 0, 1),
+(NULL, '타이가', 26420, 1, 0, 1),
+(NULL, '타이머', 26421, 1, 0, 1),
+(NULL, '타이밍', 26422, 1, 0, 1),
+(NULL, '타이틀', 26423, 1, 0, 1),
+(NULL, '타코마', 26424, 1, 0, 1),
+(NULL, '탄탈럼', 26425, 1, 0, 1),
+(NULL, '탄트라', 26426, 1, 0, 1),
+(NULL, '탑쎄기', 26427, 1, 0, 1),
+(NULL, '탕위안', 26428, 1, 0, 1),
+(NULL, '택시비', 26429, 1, 0, 1),
+(NULL, '탭하다', 26430, 1, 0, 1),
+(NULL, '터디다', 26431, 1, 0, 1),
+(NULL, '터미널', 26432, 1, 0, 1),
+(NULL, '터키석', 26433, 1, 0, 1),
+(NULL, '터키어', 26434, 1, 0, 1),
+(NULL, '터키옥', 26435, 1, 0, 1),
+(NULL, '턱수염', 26436, 1, 0, 1),
+(NULL, '텅스텐', 26437, 1, 0, 1),
+(NULL, '테네시', 26438, 1, 0, 1),
+(NULL, '테네신', 26439, 1, 0, 1),
+(NULL, '테니스', 26440, 1, 0, 1),
+(NULL, '테니시', 26441, 1, 0, 1),
+(NULL, '테러범', 26442, 1, 0, 1),
+(NULL, '테레비', 26443, 1, 0, 1),
+(NULL, '테이블', 26444, 1, 0, 1),
+(NULL, '테이프', 26445, 1, 0, 1),
+(NULL, '텍사스', 26446, 1, 0, 1),
+(NULL, '텍스트', 26447, 1, 0, 1),
+(NULL, '텔루륨', 26448, 1, 0, 1),
+(NULL, '텔루르', 26449, 1, 0, 1),
+(NULL, '템플렛', 26450, 1, 0, 1),
+(NULL, '톈안먼', 26451, 1, 0, 1),
+(NULL, '토론토', 26452, 1, 0, 1),
+(NULL, '토마토', 26453, 1, 0, 1),
+(NULL, '토바고', 26454, 1, 0, 1),
+(NULL, '토스터', 26455, 1, 0, 1),
+(NULL, '토스트', 26456, 1, 0, 1),
+(NULL, '토오쿄', 26457, 1, 0, 1),
+(NULL, '토파즈', 26458, 1, 0, 1),
+(NULL, '토하젓', 26459, 1, 0, 1),
+(NULL, '통나무', 26460, 1, 0, 1),
+(NULL, '통사리', 26461, 1, 0, 1),
+(NULL, '투구게', 26462, 1, 0, 1),
+(NULL, '투르크', 26463, 1, 0, 1),
+(NULL, '투발루', 26464, 1, 0, 1),
+(NULL, '투아례', 26465, 1, 0, 1),
+(NULL, '투피스', 26466, 1, 0, 1),
+(NULL, '툰드라', 26467, 1, 0, 1),
+(NULL, '퉁퉁배', 26468, 1, 0, 1),
+(NULL, '튀니스', 26469, 1, 0, 1),
+(NULL, '튀르크', 26470, 1, 0, 1),
+(NULL, '트랙타', 26471, 1, 0, 1),
+(NULL, '트랙터', 26472, 1, 0, 1),
+(NULL, '트럼펫', 26473, 1, 0, 1),
+(NULL, '트렌드', 26474, 1, 0, 1),
+(NULL, '트렌치', 26475, 1, 0, 1),
+(NULL, '트로프', 26476, 1, 0, 1),
+(NULL, '트로피', 26477, 1, 0, 1),
+(NULL, '트롤리', 26478, 1, 0, 1),
+(NULL, '트뤼도', 26479, 1, 0, 1),
+(NULL, '티베트', 26480, 1, 0, 1),
+(NULL, '티브이', 26481, 1, 0, 1),
+(NULL, '티셔츠', 26482, 1, 0, 1),
+(NULL, '티푸스', 26483, 1, 0, 1),
+(NULL, '파고다', 26484, 1, 0, 1),
+(NULL, '파냉국', 26485, 1, 0, 1),
+(NULL, '파두츠', 26486, 1, 0, 1),
+(NULL, '파라솔', 26487, 1, 0, 1),
+(NULL, '파라오', 26488, 1, 0, 1),
+(NULL, '파라핀', 26489, 1, 0, 1),
+(NULL, '파란색', 26490, 1, 0, 1),
+(NULL, '파리채', 26491, 1, 0, 1),
+(NULL, '파스닙', 26492, 1, 0, 1),
+(NULL, '파스타', 26493, 1, 0, 1),
+(NULL, '파스텔', 26494, 1, 0, 1),
+(NULL, '파슬리', 26495, 1, 0, 1),
+(NULL, '파시즘', 26496, 1, 0, 1),
+(NULL, '파쑈적', 26497, 1, 0, 1),
+(NULL, '파운드', 26498, 1, 0, 1),
+(NULL, '파인더', 26499, 1, 0, 1),
+(NULL, '파일럿', 26500, 1, 0, 1),
+(NULL, '파자마', 26501, 1, 0, 1),
+(NULL, '파친코', 26502, 1, 0, 1),
+(NULL, '파트너', 26503, 1, 0, 1),
+(NULL, '파파야', 26504, 1, 0, 1),
+(NULL, '판도라', 26505, 1, 0, 1),
+(NULL, '판소리', 26506, 1, 0, 1),
+(NULL, '판잣집', 26507, 1, 0, 1),
+(NULL, '판타지', 26508, 1, 0, 1),
+(NULL, '팔걸이', 26509, 1, 0, 1),
+(NULL, '팔꿈치', 26510, 1, 0, 1),
+(NULL, '팔라듐', 26511, 1, 0, 1),
+(NULL, '팔라우', 26512, 1, 0, 1),
+(NULL, '팔리다', 26513, 1, 0, 1),
+(NULL, '팝스타', 26514, 1, 0, 1),
+(NULL, '팟타이', 26515, 1, 0, 1),
+(NULL, '패러디', 26516, 1, 0, 1),
+(NULL, '패션쇼', 26517, 1, 0, 1),
+(NULL, '팩토리', 26518, 1, 0, 1),
+(NULL, '팽나무', 26519, 1, 0, 1),
+(NULL, '퍼센트', 26520, 1, 0, 1),
+(NULL, '펄하다', 26521, 1, 0, 1),
+(NULL, '펌웨어', 26522, 1, 0, 1),
+(NULL, '페르뮴', 26523, 1, 0, 1),
+(NULL, '페어리', 26524, 1, 0, 1),
+(NULL, '페이지', 26525, 1, 0, 1),
+(NULL, '페인트', 26526, 1, 0, 1),
+(NULL, '펜타곤', 26527, 1, 0, 1),
+(NULL, '펜테인', 26528, 1, 0, 1),
+(NULL, '펠리컨', 26529, 1, 0, 1),
+(NULL, '펠메니', 26530, 1, 0, 1),
+(NULL, '펩티드', 26531, 1, 0, 1),
+(NULL, '펴낸곳', 26532, 1, 0, 1),
+(NULL, '펴낸이', 26533, 1, 0, 1),
+(NULL, '포그롬', 26534, 1, 0, 1),
+(NULL, '포리지', 26535, 1, 0, 1),
+(NULL, '포마드', 26536, 1, 0, 1),
+(NULL, '포스터', 26537, 1, 0, 1),
+(NULL, '포인터', 26538, 1, 0, 1),
+(NULL, '포지션', 26539, 1, 0, 1),
+(NULL, '포켓몬', 26540, 1, 0, 1),
+(NULL, '포플러', 26541, 1, 0, 1),
+(NULL, '폴로늄', 26542, 1, 0, 1),
+(NULL, '폴리머', 26543, 1, 0, 1),
+(NULL, '표믕롬', 26544, 1, 0, 1),
+(NULL, '푸나무', 26545, 1, 0, 1),
+(NULL, '푸라면', 26546, 1, 0, 1),
+(NULL, '푸실리', 26547, 1, 0, 1),
+(NULL, '푸싱개', 26548, 1, 0, 1),
+(NULL, '푸주한', 26549, 1, 0, 1),
+(NULL, '풀그림', 26550, 1, 0, 1),
+(NULL, '풀네임', 26551, 1, 0, 1),
+(NULL, '풀망둑', 26552, 1, 0, 1),
+(NULL, '풀명자', 26553, 1, 0, 1),
+(NULL, '풀오버', 26554, 1, 0, 1),
+(NULL, '풋옵션', 26555, 1, 0, 1),
+(NULL, '풍뎅이', 26556, 1, 0, 1),
+(NULL, '프랑슘', 26557, 1, 0, 1),
+(NULL, '프래깅', 26558, 1, 0, 1),
+(NULL, '프로판', 26559, 1, 0, 1),
+(NULL, '프리즘', 26560, 1, 0, 1),
+(NULL, '프린터', 26561, 1, 0, 1),
+(NULL, '플래그', 26562, 1, 0, 1),
+(NULL, '플랫폼', 26563, 1, 0, 1),
+(NULL, '플러그', 26564, 1, 0, 1),
+(NULL, '플루트', 26565, 1, 0, 1),
+(NULL, '플리스', 26566, 1, 0, 1),
+(NULL, '피그미', 26567, 1, 0, 1),
+(NULL, '피라냐', 26568, 1, 0, 1),
+(NULL, '피스톨', 26569, 1, 0, 1),
+(NULL, '피아노', 26570, 1, 0, 1),
+(NULL, '피에로', 26571, 1, 0, 1),
+(NULL, '피오르', 26572, 1, 0, 1),
+(NULL, '피우다', 26573, 1, 0, 1),
+(NULL, '피처폰', 26574, 1, 0, 1),
+(NULL, '피카츄', 26575, 1, 0, 1),
+(NULL, '피크닉', 26576, 1, 0, 1),
+(NULL, '핀세트', 26577, 1, 0, 1),
+(NULL, '핏가루', 26578, 1, 0, 1),
+(NULL, '핏자국', 26579, 1, 0, 1),
+(NULL, '하게체', 26580, 1, 0, 1),
+(NULL, '하늘길', 26581, 1, 0, 1),
+(NULL, '하늘색', 26582, 1, 0, 1),
+(NULL, '하락시', 26583, 1, 0, 1),
+(NULL, '하르툼', 26584, 1, 0, 1),
+(NULL, '하버드', 26585, 1, 0, 1),
+(NULL, '하숙집', 26586, 1, 0, 1),
+(NULL, '하얀색', 26587, 1, 0, 1),
+(NULL, '하와이', 26588, 1, 0, 1),
+(NULL, '하이난', 26589, 1, 0, 1),
+(NULL, '하이킹', 26590, 1, 0, 1),
+(NULL, '하이퍼', 26591, 1, 0, 1),
+(NULL, '하이픈', 26592, 1, 0, 1),
+(NULL, '하이힐', 26593, 1, 0, 1),
+(NULL, '하프늄', 26594, 1, 0, 1),
+(NULL, '학공치', 26595, 1, 0, 1),
+(NULL, '한가위', 26596, 1, 0, 1),
+(NULL, '한글날', 26597, 1, 0, 1),
+(NULL, '한동안', 26598, 1, 0, 1),
+(NULL, '한라봉', 26599, 1, 0, 1),
+(NULL, '한아씨', 26600, 1, 0, 1),
+(NULL, '할례쁘', 26601, 1, 0, 1),
+(NULL, '할로윈', 26602, 1, 0, 1),
+(NULL, '할머니', 26603, 1, 0, 1),
+(NULL, '할머님', 26604, 1, 0, 1),
+(NULL, '할미새', 26605, 1, 0, 1),
+(NULL, '할아바', 26606, 1, 0, 1),
+(NULL, '할아씨', 26607, 1, 0, 1),
+(NULL, '할퀴다', 26608, 1, 0, 1),
+(NULL, '핫라인', 26609, 1, 0, 1),
+(NULL, '핫소스', 26610, 1, 0, 1),
+(NULL, '핫스팟', 26611, 1, 0, 1),
+(NULL, '해돋이', 26612, 1, 0, 1),
+(NULL, '해롭다', 26613, 1, 0, 1),
+(NULL, '해시계', 26614, 1, 0, 1),
+(NULL, '해오름', 26615, 1, 0, 1),
+(NULL, '해지다', 26616, 1, 0, 1),
+(NULL, '해코지', 26617, 1, 0, 1),
+(NULL, '해파리', 26618, 1, 0, 1),
+(NULL, '핸드백', 26619, 1, 0, 1),
+(NULL, '핸드볼', 26620, 1, 0, 1),
+(NULL, '핸드폰', 26621, 1, 0, 1),
+(NULL, '햄버거', 26622, 1, 0, 1),
+(NULL, '햄스터', 26623, 1, 0, 1),
+(NULL, '햇무리', 26624, 1, 0, 1),
+(NULL, '향나무', 26625, 1, 0, 1),
+(NULL, '향참외', 26626, 1, 0, 1),
+(NULL, '허니문', 26627, 1, 0, 1),
+(NULL, '허리띠', 26628, 1, 0, 1),
+(NULL, '허베이', 26629, 1, 0, 1),
+(NULL, '허브티', 26630, 1, 0, 1),
+(NULL, '헤드폰', 26631, 1, 0, 1),
+(NULL, '헤로인', 26632, 1, 0, 1),
+(NULL, '헤매다', 26633, 1, 0, 1),
+(NULL, '헤우다', 26634, 1, 0, 1),
+(NULL, '헥세인', 26635, 1, 0, 1),
+(NULL, '헬린이', 26636, 1, 0, 1),
+(NULL, '헵테인', 26637, 1, 0, 1),
+(NULL, '형광펜', 26638, 1, 0, 1),
+(NULL, '호랭이', 26639, 1, 0, 1),
+(NULL, '호르몬', 26640, 1, 0, 1),
+(NULL, '호스텔', 26641, 1, 0, 1),
+(NULL, '호치민', 26642, 1, 0, 1),
+(NULL, '혹시나', 26643, 1, 0, 1),
+(NULL, '혹여나', 26644, 1, 0, 1),
+(NULL, '홀소리', 26645, 1, 0, 1),
+(NULL, '홀스터', 26646, 1, 0, 1),
+(NULL, '홀아비', 26647, 1, 0, 1),
+(NULL, '홀어미', 26648, 1, 0, 1),
+(NULL, '홍두깨', 26649, 1, 0, 1),
+(NULL, '홍발정', 26650, 1, 0, 1),
+(NULL, '홑이불', 26651, 1, 0, 1),
+(NULL, '화산재', 26652, 1, 0, 1),
+(NULL, '화살통', 26653, 1, 0, 1),
+(NULL, '활시위', 26654, 1, 0, 1),
+(NULL, '활쏘기', 26655, 1, 0, 1),
+(NULL, '회나무', 26656, 1, 0, 1),
+(NULL, '회양목', 26657, 1, 0, 1),
+(NULL, '후베이', 26658, 1, 0, 1),
+(NULL, '훌리건', 26659, 1, 0, 1),
+(NULL, '훗에미', 26660, 1, 0, 1),
+(NULL, '훼방꾼', 26661, 1, 0, 1),
+(NULL, '휠체어', 26662, 1, 0, 1),
+(NULL, '휴대폰', 26663, 1, 0, 1),
+(NULL, '휴스턴', 26664, 1, 0, 1),
+(NULL, '흑호두', 26665, 1, 0, 1),
+(NULL, '흥겹다', 26666, 1, 0, 1),
+(NULL, '흩이다', 26667, 1, 0, 1),
+(NULL, '흰점복', 26668, 1, 0, 1),
+(NULL, '히드라', 26669, 1, 0, 1),
+(NULL, '히틀러', 26670, 1, 0, 1),
+(NULL, '힌두교', 26671, 1, 0, 1),
+(NULL, '힌디어', 26672, 1, 0, 1),
+(NULL, '힘내다', 26673, 1, 0, 1),
+(NULL, '힘바리', 26674, 1, 0, 1),
+(NULL, '힘쓰다', 26675, 1, 0, 1),
+(NULL, 'T 셔츠', 26676, 1, 0, 1),
+(NULL, 'ㄱㄴㄷ순', 26677, 1, 0, 1),
+(NULL, 'ㄴ 첨가', 26678, 1, 0, 1),
+(NULL, '依據하다', 26679, 1, 0, 1),
+(NULL, '十常八九', 26680, 1, 0, 1),
+(NULL, '受持하다', 26681, 1, 0, 1),
+(NULL, '基礎하다', 26682, 1, 0, 1),
+(NULL, '大綱大綱', 26683, 1, 0, 1),
+(NULL, '始作하다', 26684, 1, 0, 1),
+(NULL, '守志하다', 26685, 1, 0, 1),
+(NULL, '崇拜하다', 26686, 1, 0, 1),
+(NULL, '擴散하다', 26687, 1, 0, 1),
+(NULL, '淸純하다', 26688, 1, 0, 1),
+(NULL, '神經쓰다', 26689, 1, 0, 1),
+(NULL, '約束하다', 26690, 1, 0, 1),
+(NULL, '總角김치', 26691, 1, 0, 1),
+(NULL, '罪悚하다', 26692, 1, 0, 1),
+(NULL, '詩作하다', 26693, 1, 0, 1),
+(NULL, '部隊찌개', 26694, 1, 0, 1),
+(NULL, '防禦하다', 26695, 1, 0, 1),
+(NULL, '가갸시절', 26696, 1, 0, 1),
+(NULL, '가난하다', 26697, 1, 0, 1),
+(NULL, '가돌리늄', 26698, 1, 0, 1),
+(NULL, '가두배추', 26699, 1, 0, 1),
+(NULL, '가득하다', 26700, 1, 0, 1),
+(NULL, '가따까나', 26701, 1, 0, 1),
+(NULL, '가라오케', 26702, 1, 0, 1),
+(NULL, '가락지빵', 26703, 1, 0, 1),
+(NULL, '가름다시', 26704, 1, 0, 1),
+(NULL, '가뭇가뭇', 26705, 1, 0, 1),
+(NULL, '가미카제', 26706, 1, 0, 1),
+(NULL, '가보로네', 26707, 1, 0, 1),
+(NULL, '가스파초', 26708, 1, 0, 1),
+(NULL, '가시고기', 26709, 1, 0, 1),
+(NULL, '가운뎃점', 26710, 1, 0, 1),
+(NULL, '가위주먹', 26711, 1, 0, 1),
+(NULL, '가져가다', 26712, 1, 0, 1),
+(NULL, '가타가나', 26713, 1, 0, 1),
+(NULL, '가타카나', 26714, 1, 0, 1),
+(NULL, '가파르다', 26715, 1, 0, 1),
+(NULL, '각시붕어', 26716, 1, 0, 1),
+(NULL, '간곡하다', 26717, 1, 0, 1),
+(NULL, '간데없이', 26718, 1, 0, 1),
+(NULL, '간질이다', 26719, 1, 0, 1),
+(NULL, '갈리시아', 26720, 1, 0, 1),
+(NULL, '갈문망둑', 26721, 1, 0, 1),
+(NULL, '갈부수다', 26722, 1, 0, 1),
+(NULL, '갈아신다', 26723, 1, 0, 1),
+(NULL, '갈아입다', 26724, 1, 0, 1),
+(NULL, '갈참나무', 26725, 1, 0, 1),
+(NULL, '감돌고기', 26726, 1, 0, 1),
+(NULL, '감람나무', 26727, 1, 0, 1),
+(NULL, '감자튀김', 26728, 1, 0, 1),
+(NULL, '감탕나무', 26729, 1, 0, 1),
+(NULL, '갑작부자', 26730, 1, 0, 1),
+(NULL, '갓난아기', 26731, 1, 0, 1),
+(NULL, '갓난아이', 26732, 1, 0, 1),
+(NULL, '강도다리', 26733, 1, 0, 1),
+(NULL, '개구락지', 26734, 1, 0, 1),
+(NULL, '개구장이', 26735, 1, 0, 1),
+(NULL, '개나리꽃', 26736, 1, 0, 1),
+(NULL, '개똥벌레', 26737, 1, 0, 1),
+(NULL, '개미잡이', 26738, 1, 0, 1),
+(NULL, '개암나무', 26739, 1, 0, 1),
+(NULL, '갤마주다', 26740, 1, 0, 1),
+(NULL, '거렁뱅이', 26741, 1, 0, 1),
+(NULL, '거르마니', 26742, 1, 0, 1),
+(NULL, '거스러미', 26743, 1, 0, 1),
+(NULL, '거스름돈', 26744, 1, 0, 1),
+(NULL, '거슬리다', 26745, 1, 0, 1),
+(NULL, '걱정되다', 26746, 1, 0, 1),
+(NULL, '걸음걸이', 26747, 1, 0, 1),
+(NULL, '걸프렌드', 26748, 1, 0, 1),
+(NULL, '검정망둑', 26749, 1, 0, 1),
+(NULL, '게르마늄', 26750, 1, 0, 1),
+(NULL, '게물떼새', 26751, 1, 0, 1),
+(NULL, '겐마이차', 26752, 1, 0, 1),
+(NULL, '겨드랑이', 26753, 1, 0, 1),
+(NULL, '겨드랭이', 26754, 1, 0, 1),
+(NULL, '격화하다', 26755, 1, 0, 1),
+(NULL, '경이롭다', 26756, 1, 0, 1),
+(NULL, '고기겹빵', 26757, 1, 0, 1),
+(NULL, '고기순대', 26758, 1, 0, 1),
+(NULL, '고등어과', 26759, 1, 0, 1),
+(NULL, '고무오리', 26760, 1, 0, 1),
+(NULL, '고방오리', 26761, 1, 0, 1),
+(NULL, '고속버스', 26762, 1, 0, 1),
+(NULL, '고슴도치', 26763, 1, 0, 1),
+(NULL, '고추자지', 26764, 1, 0, 1),
+(NULL, '고춧가루', 26765, 1, 0, 1),
+(NULL, '곤들매기', 26766, 1, 0, 1),
+(NULL, '곱창구이', 26767, 1, 0, 1),
+(NULL, '공증하다', 26768, 1, 0, 1),
+(NULL, '과들루쁘', 26769, 1, 0, 1),
+(NULL, '과떼말라', 26770, 1, 0, 1),
+(NULL, '과일단물', 26771, 1, 0, 1),
+(NULL, '관광버스', 26772, 1, 0, 1),
+(NULL, '관자놀이', 26773, 1, 0, 1),
+(NULL, '관코박쥐', 26774, 1, 0, 1),
+(NULL, '광케이블', 26775, 1, 0, 1),
+(NULL, '구굴무치', 26776, 1, 0, 1),
+(NULL, '구레나룻', 26777, 1, 0, 1),
+(NULL, '구마모또', 26778, 1, 0, 1),
+(NULL, '구멍가게', 26779, 1, 0, 1),
+(NULL, '구상나무', 26780, 1, 0, 1),
+(NULL, '구이저우', 26781, 1, 0, 1),
+(NULL, '국수나무', 26782, 1, 0, 1),
+(NULL, '국수뱅어', 26783, 1, 0, 1),
+(NULL, '군대개미', 26784, 1, 0, 1),
+(NULL, '굴 소스', 26785, 1, 0, 1),
+(NULL, '굴참나무', 26786, 1, 0, 1),
+(NULL, '굵다랗다', 26787, 1, 0, 1),
+(NULL, '귀뚜라미', 26788, 1, 0, 1),
+(NULL, '그끄저께', 26789, 1, 0, 1),
+(NULL, '그노시스', 26790, 1, 0, 1),
+(NULL, '그래피티', 26791, 1, 0, 1),
+(NULL, '그러하다', 26792, 1, 0, 1),
+(NULL, '그레나다', 26793, 1, 0, 1),
+(NULL, '그레이비', 26794, 1, 0, 1),
+(NULL, '그려지다', 26795, 1, 0, 1),
+(NULL, '그리스도', 26796, 1, 0, 1),
+(NULL, '그리스어', 26797, 1, 0, 1),
+(NULL, '그리하여', 26798, 1, 0, 1),
+(NULL, '그린란드', 26799, 1, 0, 1),
+(NULL, '그림기호', 26800, 1, 0, 1),
+(NULL, '그림분필', 26801, 1, 0, 1),
+(NULL, '그림엽서', 26802, 1, 0, 1),
+(NULL, '그림풀이', 26803, 1, 0, 1),
+(NULL, '그만두다', 26804, 1, 0, 1),
+(NULL, '글라이더', 26805, 1, 0, 1),
+(NULL, '금강모치', 26806, 1, 0, 1),
+(NULL, '금개구리', 26807, 1, 0, 1),
+(NULL, '급격하다', 26808, 1, 0, 1),
+(NULL, '기나길다', 26809, 1, 0, 1),
+(NULL, '기니피그', 26810, 1, 0, 1),
+(NULL, '기다랗다', 26811, 1, 0, 1),
+(NULL, '기대리다', 26812, 1, 0, 1),
+(NULL, '기도매듭', 26813, 1, 0, 1),
+(NULL, '기름뺀젖', 26814, 1, 0, 1),
+(NULL, '기름사탕', 26815, 1, 0, 1),
+(NULL, '기름야자', 26816, 1, 0, 1),
+(NULL, '기름종개', 26817, 1, 0, 1),
+(NULL, '기침하다', 26818, 1, 0, 1),
+(NULL, '깊숙하다', 26819, 1, 0, 1),
+(NULL, '깡통따개', 26820, 1, 0, 1),
+(NULL, '깨끗하다', 26821, 1, 0, 1),
+(NULL, '깨뜨리다', 26822, 1, 0, 1),
+(NULL, '깨인절미', 26823, 1, 0, 1),
+(NULL, '꼬리치레', 26824, 1, 0, 1),
+(NULL, '꼬마뒤쥐', 26825, 1, 0, 1),
+(NULL, '꼬마청황', 26826, 1, 0, 1),
+(NULL, '꽝꽝나무', 26827, 1, 0, 1),
+(NULL, '꾸준하다', 26828, 1, 0, 1),
+(NULL, '꿀빨기새', 26829, 1, 0, 1),
+(NULL, '꿩의다리', 26830, 1, 0, 1),
+(NULL, '끄덕이다', 26831, 1, 0, 1),
+(NULL, '끈적하다', 26832, 1, 0, 1),
+(NULL, '나누이다', 26833, 1, 0, 1),
+(NULL, '나무가지', 26834, 1, 0, 1),
+(NULL, '나무늘보', 26835, 1, 0, 1),
+(NULL, '나무라다', 26836, 1, 0, 1),
+(NULL, '나박나박', 26837, 1, 0, 1),
+(NULL, '나이오븀', 26838, 1, 0, 1),
+(NULL, '나타내다', 26839, 1, 0, 1),
+(NULL, '낚시하다', 26840, 1, 0, 1),
+(NULL, '날개망둑', 26841, 1, 0, 1),
+(NULL, '날아가다', 26842, 1, 0, 1),
+(NULL, '날아오다', 26843, 1, 0, 1),
+(NULL, '남겨지다', 26844, 1, 0, 1),
+(NULL, '남방종개', 26845, 1, 0, 1),
+(NULL, '남아시아', 26846, 1, 0, 1),
+(NULL, '납득하다', 26847, 1, 0, 1),
+(NULL, '납땜인두', 26848, 1, 0, 1),
+(NULL, '낫돌고래', 26849, 1, 0, 1),
+(NULL, '내다보다', 26850, 1, 0, 1),
+(NULL, '내레이션', 26851, 1, 0, 1),
+(NULL, '내려가다', 26852, 1, 0, 1),
+(NULL, '내려오다', 26853, 1, 0, 1),
+(NULL, '내몰리다', 26854, 1, 0, 1),
+(NULL, '너그럽다', 26855, 1, 0, 1),
+(NULL, '너려오다', 26856, 1, 0, 1),
+(NULL, '네꾸다이', 26857, 1, 0, 1),
+(NULL, '네덜란드', 26858, 1, 0, 1),
+(NULL, '네오나치', 26859, 1, 0, 1),
+(NULL, '네오디뮴', 26860, 1, 0, 1),
+(NULL, '네이멍구', 26861, 1, 0, 1),
+(NULL, '네트워크', 26862, 1, 0, 1),
+(NULL, '노래하다', 26863, 1, 0, 1),
+(NULL, '노랫소리', 26864, 1, 0, 1),
+(NULL, '노른자위', 26865, 1, 0, 1),
+(NULL, '노박덩굴', 26866, 1, 0, 1),
+(NULL, '노워스티', 26867, 1, 0, 1),
+(NULL, '노크하다', 26868, 1, 0, 1),
+(NULL, '녹두나물', 26869, 1, 0, 1),
+(NULL, '놓아두다', 26870, 1, 0, 1),
+(NULL, '누나부트', 26871, 1, 0, 1),
+(NULL, '누악쇼트', 26872, 1, 0, 1),
+(NULL, '누이동생', 26873, 1, 0, 1),
+(NULL, '눈가리개', 26874, 1, 0, 1),
+(NULL, '눈다랑어', 26875, 1, 0, 1),
+(NULL, '눈동자개', 26876, 1, 0, 1),
+(NULL, '눈부시다', 26877, 1, 0, 1),
+(NULL, '눈치채다', 26878, 1, 0, 1),
+(NULL, '뉴멕시코', 26879, 1, 0, 1),
+(NULL, '뉴질랜드', 26880, 1, 0, 1),
+(NULL, '뉴햄프셔', 26881, 1, 0, 1),
+(NULL, '늑대거북', 26882, 1, 0, 1),
+(NULL, '늑대인간', 26883, 1, 0, 1),
+(NULL, '늘어나다', 26884, 1, 0, 1),
+(NULL, '늘푸르다', 26885, 1, 0, 1),
+(NULL, '능구렁이', 26886, 1, 0, 1),
+(NULL, '능금나무', 26887, 1, 0, 1),
+(NULL, '늪살무사', 26888, 1, 0, 1),
+(NULL, '니리가다', 26889, 1, 0, 1),
+(NULL, '니오비움', 26890, 1, 0, 1),
+(NULL, '니코시아', 26891, 1, 0, 1),
+(NULL, '니힐리즘', 26892, 1, 0, 1),
+(NULL, '다가가다', 26893, 1, 0, 1),
+(NULL, '다녀오다', 26894, 1, 0, 1),
+(NULL, '다다르다', 26895, 1, 0, 1),
+(NULL, '다름없다', 26896, 1, 0, 1),
+(NULL, '다리미질', 26897, 1, 0, 1),
+(NULL, '다리미판', 26898, 1, 0, 1),
+(NULL, '다마네기', 26899, 1, 0, 1),
+(NULL, '다묵장어', 26900, 1, 0, 1),
+(NULL, '다우존스', 26901, 1, 0, 1),
+(NULL, '다운로드', 26902, 1, 0, 1),
+(NULL, '다운받다', 26903, 1, 0, 1),
+(NULL, '다이어터', 26904, 1, 0, 1),
+(NULL, '다이오드', 26905, 1, 0, 1),
+(NULL, '다정하다', 26906, 1, 0, 1),
+(NULL, '다크서클', 26907, 1, 0, 1),
+(NULL, '단마르크', 26908, 1, 0, 1),
+(NULL, '달라지다', 26909, 1, 0, 1),
+(NULL, '달려가다', 26910, 1, 0, 1),
+(NULL, '달려오다', 26911, 1, 0, 1),
+(NULL, '달뿌리풀', 26912, 1, 0, 1),
+(NULL, '달팽이管', 26913, 1, 0, 1),
+(NULL, '당겨지다', 26914, 1, 0, 1),
+(NULL, '당춧가루', 26915, 1, 0, 1),
+(NULL, '대농갱이', 26916, 1, 0, 1),
+(NULL, '대륙밭쥐', 26917, 1, 0, 1),
+(NULL, '대륙사슴', 26918, 1, 0, 1),
+(NULL, '대륙종개', 26919, 1, 0, 1),
+(NULL, '대브리텐', 26920, 1, 0, 1),
+(NULL, '대브리튼', 26921, 1, 0, 1),
+(NULL, '대비하다', 26922, 1, 0, 1),
+(NULL, '대시보드', 26923, 1, 0, 1),
+(NULL, '대왕고래', 26924, 1, 0, 1),
+(NULL, '더부살이', 26925, 1, 0, 1),
+(NULL, '더워지다', 26926, 1, 0, 1),
+(NULL, '더위팔기', 26927, 1, 0, 1),
+(NULL, '더치페이', 26928, 1, 0, 1),
+(NULL, '덤벙이다', 26929, 1, 0, 1),
+(NULL, '데려가다', 26930, 1, 0, 1),
+(NULL, '데려오다', 26931, 1, 0, 1),
+(NULL, '데릴사위', 26932, 1, 0, 1),
+(NULL, '데모하다', 26933, 1, 0, 1),
+(NULL, '덴마크어', 26934, 1, 0, 1),
+(NULL, '델라웨어', 26935, 1, 0, 1),
+(NULL, '델러웨어', 26936, 1, 0, 1),
+(NULL, '도둑정치', 26937, 1, 0, 1),
+(NULL, '도큐먼트', 26938, 1, 0, 1),
+(NULL, '도플갱어', 26939, 1, 0, 1),
+(NULL, '도화뱅어', 26940, 1, 0, 1),
+(NULL, '독미나리', 26941, 1, 0, 1),
+(NULL, '독특하다', 26942, 1, 0, 1),
+(NULL, '돌가자미', 26943, 1, 0, 1),
+(NULL, '돌아서다', 26944, 1, 0, 1),
+(NULL, '돌아오다', 26945, 1, 0, 1),
+(NULL, '돔발상어', 26946, 1, 0, 1),
+(NULL, '동방종개', 26947, 1, 0, 1),
+(NULL, '동버들개', 26948, 1, 0, 1),
+(NULL, '동아시아', 26949, 1, 0, 1),
+(NULL, '동티모르', 26950, 1, 0, 1),
+(NULL, '돼지고기', 26951, 1, 0, 1),
+(NULL, '되살리다', 26952, 1, 0, 1),
+(NULL, '되지빠귀', 26953, 1, 0, 1),
+(NULL, '됭경모치', 26954, 1, 0, 1),
+(NULL, '두드러기', 26955, 1, 0, 1),
+(NULL, '두루바리', 26956, 1, 0, 1),
+(NULL, '두어서넛', 26957, 1, 0, 1),
+(NULL, '두우쟁이', 26958, 1, 0, 1),
+(NULL, '두줄망둑', 26959, 1, 0, 1),
+(NULL, '뒤따르다', 26960, 1, 0, 1),
+(NULL, '드라이기', 26961, 1, 0, 1),
+(NULL, '드러나다', 26962, 1, 0, 1),
+(NULL, '드렁허리', 26963, 1, 0, 1),
+(NULL, '들려오다', 26964, 1, 0, 1),
+(NULL, '들쇠고래', 26965, 1, 0, 1),
+(NULL, '들어보다', 26966, 1, 0, 1),
+(NULL, '들어서다', 26967, 1, 0, 1),
+(NULL, '들어주다', 26968, 1, 0, 1),
+(NULL, '들이밀다', 26969, 1, 0, 1),
+(NULL, '등줄숭어', 26970, 1, 0, 1),
+(NULL, '디렉토리', 26971, 1, 0, 1),
+(NULL, '디바이스', 26972, 1, 0, 1),
+(NULL, '디엔에이', 26973, 1, 0, 1),
+(NULL, '디자이너', 26974, 1, 0, 1),
+(NULL, '따뜻하다', 26975, 1, 0, 1),
+(NULL, '따라가다', 26976, 1, 0, 1),
+(NULL, '따라오다', 26977, 1, 0, 1),
+(NULL, '딱따구리', 26978, 1, 0, 1),
+(NULL, '땅흔들림', 26979, 1, 0, 1),
+(NULL, '떠벌리다', 26980, 1, 0, 1),
+(NULL, '떡갈나무', 26981, 1, 0, 1),
+(NULL, '떫디떫다', 26982, 1, 0, 1),
+(NULL, '뚱뚱하다', 26983, 1, 0, 1),
+(NULL, '뜨락또르', 26984, 1, 0, 1),
+(NULL, '띄어쓰기', 26985, 1, 0, 1),
+(NULL, '라비올리', 26986, 1, 0, 1),
+(NULL, '라이선스', 26987, 1, 0, 1),
+(NULL, '라지에타', 26988, 1, 0, 1),
+(NULL, '라크로스', 26989, 1, 0, 1),
+(NULL, '랜섬웨어', 26990, 1, 0, 1),
+(NULL, '러더포듐', 26991, 1, 0, 1),
+(NULL, '러레이도', 26992, 1, 0, 1),
+(NULL, '러브호텔', 26993, 1, 0, 1),
+(NULL, '러시아말', 26994, 1, 0, 1),
+(NULL, '러시아어', 26995, 1, 0, 1),
+(NULL, '러시아인', 26996, 1, 0, 1),
+(NULL, '레비아탄', 26997, 1, 0, 1),
+(NULL, '레스토랑', 26998, 1, 0, 1),
+(NULL, '레악토르', 26999, 1, 0, 1),
+(NULL, '레위니옹', 27000, 1, 0, 1),
+(NULL, '레즈비언', 27001, 1, 0, 1),
+(NULL, '레퍼토리', 27002, 1, 0, 1),
+(NULL, '로그아웃', 27003, 1, 0, 1),
+(NULL, '로마자화', 27004, 1, 0, 1),
+(NULL, '로사리오', 27005, 1, 0, 1),
+(NULL, '로스토크', 27006, 1, 0, 1),
+(NULL, '로씨야말', 27007, 1, 0, 1),
+(NULL, '로씨야인', 27008, 1, 0, 1),
+(NULL, '로크포르', 27009, 1, 0, 1),
+(NULL, '로테르담', 27010, 1, 0, 1),
+(NULL, '롱드장브', 27011, 1, 0, 1),
+(NULL, '뢴트게늄', 27012, 1, 0, 1),
+(NULL, '르네상스', 27013, 1, 0, 1),
+(NULL, '리가토니', 27014, 1, 0, 1),
+(NULL, '리버모륨', 27015, 1, 0, 1),
+(NULL, '리브르빌', 27016, 1, 0, 1),
+(NULL, '리자이나', 27017, 1, 0, 1),
+(NULL, '리플레이', 27018, 1, 0, 1),
+(NULL, '마귀상어', 27019, 1, 0, 1),
+(NULL, '마그네슘', 27020, 1, 0, 1),
+(NULL, '마늘냉국', 27021, 1, 0, 1),
+(NULL, '마니토바', 27022, 1, 0, 1),
+(NULL, '마르멜로', 27023, 1, 0, 1),
+(NULL, '마리아주', 27024, 1, 0, 1),
+(NULL, '마리화나', 27025, 1, 0, 1),
+(NULL, '마마보이', 27026, 1, 0, 1),
+(NULL, '마스카라', 27027, 1, 0, 1),
+(NULL, '마스크팩', 27028, 1, 0, 1),
+(NULL, '마요네즈', 27029, 1, 0, 1),
+(NULL, '마을버스', 27030, 1, 0, 1),
+(NULL, '마음대로', 27031, 1, 0, 1),
+(NULL, '마음먹다', 27032, 1, 0, 1),
+(NULL, '마이너스', 27033, 1, 0, 1),
+(NULL, '마이웨이', 27034, 1, 0, 1),
+(NULL, '마지노선', 27035, 1, 0, 1),
+(NULL, '마카로니', 27036, 1, 0, 1),
+(NULL, '마팔디네', 27037, 1, 0, 1),
+(NULL, '막창구이', 27038, 1, 0, 1),
+(NULL, '많아지다', 27039, 1, 0, 1),
+(NULL, '말거머리', 27040, 1, 0, 1),
+(NULL, '말똥구리', 27041, 1, 0, 1),
+(NULL, '맑스주의', 27042, 1, 0, 1),
+(NULL, '망가니즈', 27043, 1, 0, 1),
+(NULL, '망고스틴', 27044, 1, 0, 1),
+(NULL, '매끼럽다', 27045, 1, 0, 1),
+(NULL, '매니큐어', 27046, 1, 0, 1),
+(NULL, '매니토바', 27047, 1, 0, 1),
+(NULL, '매릴랜드', 27048, 1, 0, 1),
+(NULL, '매미나방', 27049, 1, 0, 1),
+(NULL, '매콤하다', 27050, 1, 0, 1),
+(NULL, '매트리스', 27051, 1, 0, 1),
+(NULL, '맥도날드', 27052, 1, 0, 1),
+(NULL, '머리카락', 27053, 1, 0, 1),
+(NULL, '먼지떨이', 27054, 1, 0, 1),
+(NULL, '메디케어', 27055, 1, 0, 1),
+(NULL, '메릴랜드', 27056, 1, 0, 1),
+(NULL, '메이크업', 27057, 1, 0, 1),
+(NULL, '메추라기', 27058, 1, 0, 1),
+(NULL, '메커니즘', 27059, 1, 0, 1),
+(NULL, '메타버스', 27060, 1, 0, 1),
+(NULL, '메타픽션', 27061, 1, 0, 1),
+(NULL, '멘델레븀', 27062, 1, 0, 1),
+(NULL, '멜빵바지', 27063, 1, 0, 1),
+(NULL, '명자나무', 27064, 1, 0, 1),
+(NULL, '모가디슈', 27065, 1, 0, 1),
+(NULL, '모니터링', 27066, 1, 0, 1),
+(NULL, '모데미풀', 27067, 1, 0, 1),
+(NULL, '모래무지', 27068, 1, 0, 1),
+(NULL, '모래사장', 27069, 1, 0, 1),
+(NULL, '모래주사', 27070, 1, 0, 1),
+(NULL, '모르타르', 27071, 1, 0, 1),
+(NULL, '모스코븀', 27072, 1, 0, 1),
+(NULL, '모아쓰기', 27073, 1, 0, 1),
+(NULL, '모자이크', 27074, 1, 0, 1),
+(NULL, '모차렐라', 27075, 1, 0, 1),
+(NULL, '모치망둑', 27076, 1, 0, 1),
+(NULL, '모태솔로', 27077, 1, 0, 1),
+(NULL, '모터보트', 27078, 1, 0, 1),
+(NULL, '모호하다', 27079, 1, 0, 1),
+(NULL, '목마르다', 27080, 1, 0, 1),
+(NULL, '몬로비아', 27081, 1, 0, 1),
+(NULL, '몰아치다', 27082, 1, 0, 1),
+(NULL, '못지않다', 27083, 1, 0, 1),
+(NULL, '몽고메리', 27084, 1, 0, 1),
+(NULL, '무늬망둑', 27085, 1, 0, 1),
+(NULL, '무성하다', 27086, 1, 0, 1),
+(NULL, '무스카트', 27087, 1, 0, 1),
+(NULL, '무지하다', 27088, 1, 0, 1),
+(NULL, '무찌르다', 27089, 1, 0, 1),
+(NULL, '무태장어', 27090, 1, 0, 1),
+(NULL, '무함마드', 27091, 1, 0, 1),
+(NULL, '묵납자루', 27092, 1, 0, 1),
+(NULL, '문절망둑', 27093, 1, 0, 1),
+(NULL, '문지르다', 27094, 1, 0, 1),
+(NULL, '물고기떡', 27095, 1, 0, 1),
+(NULL, '물고기알', 27096, 1, 0, 1),
+(NULL, '물놀이장', 27097, 1, 0, 1),
+(NULL, '물두꺼비', 27098, 1, 0, 1),
+(NULL, '물뿌리개', 27099, 1, 0, 1),
+(NULL, '물어보다', 27100, 1, 0, 1),
+(NULL, '물텀벙이', 27101, 1, 0, 1),
+(NULL, '뭉게구름', 27102, 1, 0, 1),
+(NULL, '미끄럼대', 27103, 1, 0, 1),
+(NULL, '미끄럽다', 27104, 1, 0, 1),
+(NULL, '미끈망둑', 27105, 1, 0, 1),
+(NULL, '미네소타', 27106, 1, 0, 1),
+(NULL, '미니골프', 27107, 1, 0, 1),
+(NULL, '미니돼지', 27108, 1, 0, 1),
+(NULL, '미니맥스', 27109, 1, 0, 1),
+(NULL, '미니미터', 27110, 1, 0, 1),
+(NULL, '미니버스', 27111, 1, 0, 1),
+(NULL, '미니어처', 27112, 1, 0, 1),
+(NULL, '미닫이문', 27113, 1, 0, 1),
+(NULL, '미들네임', 27114, 1, 0, 1),
+(NULL, '미리보기', 27115, 1, 0, 1),
+(NULL, '미세먼지', 27116, 1, 0, 1),
+(NULL, '미소짓다', 27117, 1, 0, 1),
+(NULL, '미스터리', 27118, 1, 0, 1),
+(NULL, '미시사가', 27119, 1, 0, 1),
+(NULL, '미시소가', 27120, 1, 0, 1),
+(NULL, '미시소거', 27121, 1, 0, 1),
+(NULL, '미시시피', 27122, 1, 0, 1),
+(NULL, '미역냉국', 27123, 1, 0, 1),
+(NULL, '미쳐지다', 27124, 1, 0, 1),
+(NULL, '미호종개', 27125, 1, 0, 1),
+(NULL, '민꽃열매', 27126, 1, 0, 1),
+(NULL, '민달팽이', 27127, 1, 0, 1),
+(NULL, '밀레니엄', 27128, 1, 0, 1),
+(NULL, '밀리그램', 27129, 1, 0, 1),
+(NULL, '밀리미터', 27130, 1, 0, 1),
+(NULL, '밀방망이', 27131, 1, 0, 1),
+(NULL, '밀짚모자', 27132, 1, 0, 1),
+(NULL, '밋구라지', 27133, 1, 0, 1),
+(NULL, '바깥어른', 27134, 1, 0, 1),
+(NULL, '바꾸이다', 27135, 1, 0, 1),
+(NULL, '바누아투', 27136, 1, 0, 1),
+(NULL, '바늘겨레', 27137, 1, 0, 1),
+(NULL, '바늘꽂이', 27138, 1, 0, 1),
+(NULL, '바다표범', 27139, 1, 0, 1),
+(NULL, '바닷가재', 27140, 1, 0, 1),
+(NULL, '바람자루', 27141, 1, 0, 1),
+(NULL, '바로가기', 27142, 1, 0, 1),
+(NULL, '바리스타', 27143, 1, 0, 1),
+(NULL, '바삭과자', 27144, 1, 0, 1),
+(NULL, '바스테르', 27145, 1, 0, 1),
+(NULL, '바이너리', 27146, 1, 0, 1),
+(NULL, '바이올린', 27147, 1, 0, 1),
+(NULL, '바퀴벌레', 27148, 1, 0, 1),
+(NULL, '박테리아', 27149, 1, 0, 1),
+(NULL, '반달리즘', 27150, 1, 0, 1),
+(NULL, '반딧불이', 27151, 1, 0, 1),
+(NULL, '반죽하다', 27152, 1, 0, 1),
+(NULL, '받아쓰기', 27153, 1, 0, 1),
+(NULL, '발보이다', 27154, 1, 0, 1),
+(NULL, '밤낮없이', 27155, 1, 0, 1),
+(NULL, '밥풀강정', 27156, 1, 0, 1),
+(NULL, '방동사니', 27157, 1, 0, 1),
+(NULL, '방목하다', 27158, 1, 0, 1),
+(NULL, '방아깨비', 27159, 1, 0, 1),
+(NULL, '방울새풀', 27160, 1, 0, 1),
+(NULL, '배가사리', 27161, 1, 0, 1),
+(NULL, '배고프다', 27162, 1, 0, 1),
+(NULL, '배드민턴', 27163, 1, 0, 1),
+(NULL, '배부르다', 27164, 1, 0, 1),
+(NULL, '배웅하다', 27165, 1, 0, 1),
+(NULL, '배워주다', 27166, 1, 0, 1),
+(NULL, '백러시아', 27167, 1, 0, 1),
+(NULL, '백로씨야', 27168, 1, 0, 1),
+(NULL, '백상아리', 27169, 1, 0, 1),
+(NULL, '백파이프', 27170, 1, 0, 1),
+(NULL, '버드나무', 27171, 1, 0, 1),
+(NULL, '버들매치', 27172, 1, 0, 1),
+(NULL, '버들붕어', 27173, 1, 0, 1),
+(NULL, '버마재비', 27174, 1, 0, 1),
+(NULL, '버무리다', 27175, 1, 0, 1),
+(NULL, '버스스리', 27176, 1, 0, 1),
+(NULL, '버지니아', 27177, 1, 0, 1),
+(NULL, '버터밀크', 27178, 1, 0, 1),
+(NULL, '벚꽃뱅어', 27179, 1, 0, 1),
+(NULL, '베도라치', 27180, 1, 0, 1),
+(NULL, '베스푸치', 27181, 1, 0, 1),
+(NULL, '베이루트', 27182, 1, 0, 1),
+(NULL, '베이커리', 27183, 1, 0, 1),
+(NULL, '베트남어', 27184, 1, 0, 1),
+(NULL, '벤치마크', 27185, 1, 0, 1),
+(NULL, '벨로루시', 27186, 1, 0, 1),
+(NULL, '벨리댄스', 27187, 1, 0, 1),
+(NULL, '벼룩시장', 27188, 1, 0, 1),
+(NULL, '병아리콩', 27189, 1, 0, 1),
+(NULL, '병정개미', 27190, 1, 0, 1),
+(NULL, '보드게임', 27191, 1, 0, 1),
+(NULL, '보디가드', 27192, 1, 0, 1),
+(NULL, '보디빌딩', 27193, 1, 0, 1),
+(NULL, '복사나무', 27194, 1, 0, 1),
+(NULL, '복원하다', 27195, 1, 0, 1),
+(NULL, '볼런티어', 27196, 1, 0, 1),
+(NULL, '볼셰비키', 27197, 1, 0, 1),
+(NULL, '부끄럽다', 27198, 1, 0, 1),
+(NULL, '부러지다', 27199, 1, 0, 1),
+(NULL, '부려먹다', 27200, 1, 0, 1),
+(NULL, '부르죠아', 27201, 1, 0, 1),
+(NULL, '부아소리', 27202, 1, 0, 1),
+(NULL, '부안종개', 27203, 1, 0, 1),
+(NULL, '부줌부라', 27204, 1, 0, 1),
+(NULL, '부지깽이', 27205, 1, 0, 1),
+(NULL, '부착되다', 27206, 1, 0, 1),
+(NULL, '부카티니', 27207, 1, 0, 1),
+(NULL, '부탁해요', 27208, 1, 0, 1),
+(NULL, '부풀음감', 27209, 1, 0, 1),
+(NULL, '북극여우', 27210, 1, 0, 1),
+(NULL, '북방종개', 27211, 1, 0, 1),
+(NULL, '북방토끼', 27212, 1, 0, 1),
+(NULL, '북아시아', 27213, 1, 0, 1),
+(NULL, '분비나무', 27214, 1, 0, 1),
+(NULL, '분주하다', 27215, 1, 0, 1),
+(NULL, '불가사리', 27216, 1, 0, 1),
+(NULL, '불리우다', 27217, 1, 0, 1),
+(NULL, '불지르다', 27218, 1, 0, 1),
+(NULL, '붉은사슴', 27219, 1, 0, 1),
+(NULL, '붕퉁뱅어', 27220, 1, 0, 1),
+(NULL, '붙여넣기', 27221, 1, 0, 1),
+(NULL, '브라우저', 27222, 1, 0, 1),
+(NULL, '브라이언', 27223, 1, 0, 1),
+(NULL, '브라자빌', 27224, 1, 0, 1),
+(NULL, '브레이크', 27225, 1, 0, 1),
+(NULL, '브로맨스', 27226, 1, 0, 1),
+(NULL, '브로콜리', 27227, 1, 0, 1),
+(NULL, '블라우스', 27228, 1, 0, 1),
+(NULL, '블라인드', 27229, 1, 0, 1),
+(NULL, '비눗방울', 27230, 1, 0, 1),
+(NULL, '비닐봉지', 27231, 1, 0, 1),
+(NULL, '비닐봉투', 27232, 1, 0, 1),
+(NULL, '비단털쥐', 27233, 1, 0, 1),
+(NULL, '비둘기콩', 27234, 1, 0, 1),
+(NULL, '비로비잔', 27235, 1, 0, 1),
+(NULL, '비섯하다', 27236, 1, 0, 1),
+(NULL, '비스무트', 27237, 1, 0, 1),
+(NULL, '비슥하다', 27238, 1, 0, 1),
+(NULL, '비슷하다', 27239, 1, 0, 1),
+(NULL, '비트박스', 27240, 1, 0, 1),
+(NULL, '비트코인', 27241, 1, 0, 1),
+(NULL, '비파나무', 27242, 1, 0, 1),
+(NULL, '빅토리아', 27243, 1, 0, 1),
+(NULL, '빈지워칭', 27244, 1, 0, 1),
+(NULL, '빈트후크', 27245, 1, 0, 1),
+(NULL, '빨래하다', 27246, 1, 0, 1),
+(NULL, '빨리감다', 27247, 1, 0, 1),
+(NULL, '빼앗기다', 27248, 1, 0, 1),
+(NULL, '뻔뻔하다', 27249, 1, 0, 1),
+(NULL, '사과나무', 27250, 1, 0, 1),
+(NULL, '사냥하다', 27251, 1, 0, 1),
+(NULL, '사닥다리', 27252, 1, 0, 1),
+(NULL, '사랑앵무', 27253, 1, 0, 1),
+(NULL, '사모바르', 27254, 1, 0, 1),
+(NULL, '사무라이', 27255, 1, 0, 1),
+(NULL, '사방치기', 27256, 1, 0, 1),
+(NULL, '사보타주', 27257, 1, 0, 1),
+(NULL, '사슴벌레', 27258, 1, 0, 1),
+(NULL, '사이보그', 27259, 1, 0, 1),
+(NULL, '사이클론', 27260, 1, 0, 1),
+(NULL, '사이클링', 27261, 1, 0, 1),
+(NULL, '사향노루', 27262, 1, 0, 1),
+(NULL, '산개구리', 27263, 1, 0, 1),
+(NULL, '산꿩의밥', 27264, 1, 0, 1),
+(NULL, '산등성이', 27265, 1, 0, 1),
+(NULL, '산딸나무', 27266, 1, 0, 1),
+(NULL, '산마리노', 27267, 1, 0, 1),
+(NULL, '산뽕나무', 27268, 1, 0, 1),
+(NULL, '살아가다', 27269, 1, 0, 1),
+(NULL, '살아남다', 27270, 1, 0, 1),
+(NULL, '살아지다', 27271, 1, 0, 1),
+(NULL, '삼림밭쥐', 27272, 1, 0, 1),
+(NULL, '상이하다', 27273, 1, 0, 1),
+(NULL, '상환되다', 27274, 1, 0, 1),
+(NULL, '새닥다리', 27275, 1, 0, 1),
+(NULL, '새로고침', 27276, 1, 0, 1),
+(NULL, '새리밴대', 27277, 1, 0, 1),
+(NULL, '새우나무', 27278, 1, 0, 1),
+(NULL, '새호리기', 27279, 1, 0, 1),
+(NULL, '샌드위치', 27280, 1, 0, 1),
+(NULL, '샐러리맨', 27281, 1, 0, 1),
+(NULL, '생선구이', 27282, 1, 0, 1),
+(NULL, '샤워하다', 27283, 1, 0, 1),
+(NULL, '샤프펜실', 27284, 1, 0, 1),
+(NULL, '샬럿타운', 27285, 1, 0, 1),
+(NULL, '샹들리에', 27286, 1, 0, 1),
+(NULL, '서두르다', 27287, 1, 0, 1),
+(NULL, '서류가방', 27288, 1, 0, 1),
+(NULL, '서베를린', 27289, 1, 0, 1),
+(NULL, '서브컬처', 27290, 1, 0, 1),
+(NULL, '서아시아', 27291, 1, 0, 1),
+(NULL, '서양메꽃', 27292, 1, 0, 1),
+(NULL, '서양자두', 27293, 1, 0, 1),
+(NULL, '서울내기', 27294, 1, 0, 1),
+(NULL, '선글라스', 27295, 1, 0, 1),
+(NULL, '설득하다', 27296, 1, 0, 1),
+(NULL, '설레이다', 27297, 1, 0, 1),
+(NULL, '섬초롱꽃', 27298, 1, 0, 1),
+(NULL, '성스럽다', 27299, 1, 0, 1),
+(NULL, '세미콜론', 27300, 1, 0, 1),
+(NULL, '섹스하다', 27301, 1, 0, 1),
+(NULL, '섹시하다', 27302, 1, 0, 1),
+(NULL, '소꿉친구', 27303, 1, 0, 1),
+(NULL, '소돔사과', 27304, 1, 0, 1),
+(NULL, '소심하다', 27305, 1, 0, 1),
+(NULL, '소아시아', 27306, 1, 0, 1),
+(NULL, '소용돌이', 27307, 1, 0, 1),
+(NULL, '소젖기름', 27308, 1, 0, 1),
+(NULL, '소젖메주', 27309, 1, 0, 1),
+(NULL, '소중하다', 27310, 1, 0, 1),
+(NULL, '소지하다', 27311, 1, 0, 1),
+(NULL, '소프트볼', 27312, 1, 0, 1),
+(NULL, '손가락조', 27313, 1, 0, 1),
+(NULL, '손톱깎이', 27314, 1, 0, 1),
+(NULL, '솔깃하다', 27315, 1, 0, 1),
+(NULL, '송이송이', 27316, 1, 0, 1),
+(NULL, '쇠갈밭쥐', 27317, 1, 0, 1),
+(NULL, '쇠기러기', 27318, 1, 0, 1),
+(NULL, '쇠동고비', 27319, 1, 0, 1),
+(NULL, '쇠물돼지', 27320, 1, 0, 1),
+(NULL, '쇠족제비', 27321, 1, 0, 1),
+(NULL, '쇠향고래', 27322, 1, 0, 1),
+(NULL, '쇼비니즘', 27323, 1, 0, 1),
+(NULL, '쇼어라인', 27324, 1, 0, 1),
+(NULL, '쇼케이스', 27325, 1, 0, 1),
+(NULL, '쇼핑하다', 27326, 1, 0, 1),
+(NULL, '수다떨다', 27327, 1, 0, 1),
+(NULL, '수양버들', 27328, 1, 0, 1),
+(NULL, '수염고래', 27329, 1, 0, 1),
+(NULL, '술 기운', 27330, 1, 0, 1),
+(NULL, '슈퍼마켓', 27331, 1, 0, 1),
+(NULL, '슈퍼모델', 27332, 1, 0, 1),
+(NULL, '슈퍼스타', 27333, 1, 0, 1),
+(NULL, '슝내내다', 27334, 1, 0, 1),
+(NULL, '스노보드', 27335, 1, 0, 1),
+(NULL, '스마트폰', 27336, 1, 0, 1),
+(NULL, '스빠게띠', 27337, 1, 0, 1),
+(NULL, '스웨덴어', 27338, 1, 0, 1),
+(NULL, '스웨리예', 27339, 1, 0, 1),
+(NULL, '스카우트', 27340, 1, 0, 1),
+(NULL, '스케이트', 27341, 1, 0, 1),
+(NULL, '스크롤링', 27342, 1, 0, 1),
+(NULL, '스타디오', 27343, 1, 0, 1),
+(NULL, '스타디움', 27344, 1, 0, 1),
+(NULL, '스탠더드', 27345, 1, 0, 1),
+(NULL, '스턴트맨', 27346, 1, 0, 1),
+(NULL, '스테이크', 27347, 1, 0, 1),
+(NULL, '스텐드바', 27348, 1, 0, 1),
+(NULL, '스톤헨지', 27349, 1, 0, 1),
+(NULL, '스톱워치', 27350, 1, 0, 1),
+(NULL, '스튜디오', 27351, 1, 0, 1),
+(NULL, '스트레스', 27352, 1, 0, 1),
+(NULL, '스트레칭', 27353, 1, 0, 1),
+(NULL, '스트론튬', 27354, 1, 0, 1),
+(NULL, '스트리밍', 27355, 1, 0, 1),
+(NULL, '스파게티', 27356, 1, 0, 1),
+(NULL, '스페이스', 27357, 1, 0, 1),
+(NULL, '스페인어', 27358, 1, 0, 1),
+(NULL, '스펙트럼', 27359, 1, 0, 1),
+(NULL, '스포일러', 27360, 1, 0, 1),
+(NULL, '슬픈 눈', 27361, 1, 0, 1),
+(NULL, '습기차다', 27362, 1, 0, 1),
+(NULL, '시나리오', 27363, 1, 0, 1),
+(NULL, '시나브로', 27364, 1, 0, 1),
+(NULL, '시베리아', 27365, 1, 0, 1),
+(NULL, '시아버지', 27366, 1, 0, 1),
+(NULL, '시안하다', 27367, 1, 0, 1),
+(NULL, '시어머니', 27368, 1, 0, 1),
+(NULL, '시집가다', 27369, 1, 0, 1),
+(NULL, '시킴 주', 27370, 1, 0, 1),
+(NULL, '신데렐라', 27371, 1, 0, 1),
+(NULL, '실베짱이', 27372, 1, 0, 1),
+(NULL, '심심하다', 27373, 1, 0, 1),
+(NULL, '심페로폴', 27374, 1, 0, 1),
+(NULL, '심포지엄', 27375, 1, 0, 1),
+(NULL, '싱가포르', 27376, 1, 0, 1),
+(NULL, '싱싱하다', 27377, 1, 0, 1),
+(NULL, '싱크탱크', 27378, 1, 0, 1),
+(NULL, '쌀미꾸리', 27379, 1, 0, 1),
+(NULL, '쌓여지다', 27380, 1, 0, 1),
+(NULL, '썬글라스', 27381, 1, 0, 1),
+(NULL, '쒀이러우', 27382, 1, 0, 1),
+(NULL, '쓰레받기', 27383, 1, 0, 1),
+(NULL, '쓰르라미', 27384, 1, 0, 1),
+(NULL, '아나운서', 27385, 1, 0, 1),
+(NULL, '아나콘다', 27386, 1, 0, 1),
+(NULL, '아나키즘', 27387, 1, 0, 1),
+(NULL, '아나테마', 27388, 1, 0, 1),
+(NULL, '아뇰로티', 27389, 1, 0, 1),
+(NULL, '아니하다', 27390, 1, 0, 1),
+(NULL, '아라비아', 27391, 1, 0, 1),
+(NULL, '아롱아롱', 27392, 1, 0, 1),
+(NULL, '아름답다', 27393, 1, 0, 1),
+(NULL, '아리조나', 27394, 1, 0, 1),
+(NULL, '아마추어', 27395, 1, 0, 1),
+(NULL, '아메리슘', 27396, 1, 0, 1),
+(NULL, '아보카도', 27397, 1, 0, 1),
+(NULL, '아순시온', 27398, 1, 0, 1),
+(NULL, '아스타나', 27399, 1, 0, 1),
+(NULL, '아스타틴', 27400, 1, 0, 1),
+(NULL, '아스테카', 27401, 1, 0, 1),
+(NULL, '아스팔트', 27402, 1, 0, 1),
+(NULL, '아슴턚다', 27403, 1, 0, 1),
+(NULL, '아시아인', 27404, 1, 0, 1),
+(NULL, '아야톨라', 27405, 1, 0, 1),
+(NULL, '아오자이', 27406, 1, 0, 1),
+(NULL, '아우르다', 27407, 1, 0, 1),
+(NULL, '아이누어', 27408, 1, 0, 1),
+(NULL, '아이다호', 27409, 1, 0, 1),
+(NULL, '아이디어', 27410, 1, 0, 1),
+(NULL, '아이쇼핑', 27411, 1, 0, 1),
+(NULL, '아이오딘', 27412, 1, 0, 1),
+(NULL, '아이오와', 27413, 1, 0, 1),
+(NULL, '아주마니', 27414, 1, 0, 1),
+(NULL, '아주머니', 27415, 1, 0, 1),
+(NULL, '아카데미', 27416, 1, 0, 1),
+(NULL, '아코디언', 27417, 1, 0, 1),
+(NULL, '아콰리움', 27418, 1, 0, 1),
+(NULL, '아티스트', 27419, 1, 0, 1),
+(NULL, '아티초크', 27420, 1, 0, 1),
+(NULL, '아프리카', 27421, 1, 0, 1),
+(NULL, '악어거북', 27422, 1, 0, 1),
+(NULL, '안티모니', 27423, 1, 0, 1),
+(NULL, '알고리즘', 27424, 1, 0, 1),
+(NULL, '알라바마', 27425, 1, 0, 1),
+(NULL, '알라배마', 27426, 1, 0, 1),
+(NULL, '알래스카', 27427, 1, 0, 1),
+(NULL, '알레고리', 27428, 1, 0, 1),
+(NULL, '알레르기', 27429, 1, 0, 1),
+(NULL, '알루미늄', 27430, 1, 0, 1),
+(NULL, '알리바바', 27431, 1, 0, 1),
+(NULL, '압또부스', 27432, 1, 0, 1),
+(NULL, '애 이름', 27433, 1, 0, 1),
+(NULL, '애기망둑', 27434, 1, 0, 1),
+(NULL, '애기여새', 27435, 1, 0, 1),
+(NULL, '애너그램', 27436, 1, 0, 1),
+(NULL, '애드웨어', 27437, 1, 0, 1),
+(NULL, '애로뽈트', 27438, 1, 0, 1),
+(NULL, '애리조나', 27439, 1, 0, 1),
+(NULL, '액세서리', 27440, 1, 0, 1),
+(NULL, '앨라바마', 27441, 1, 0, 1),
+(NULL, '앨라배마', 27442, 1, 0, 1),
+(NULL, '앨러바마', 27443, 1, 0, 1),
+(NULL, '앨러배마', 27444, 1, 0, 1),
+(NULL, '앰뷸런스', 27445, 1, 0, 1),
+(NULL, '앵커리지', 27446, 1, 0, 1),
+(NULL, '야기하다', 27447, 1, 0, 1),
+(NULL, '야키소바', 27448, 1, 0, 1),
+(NULL, '양털더미', 27449, 1, 0, 1),
+(NULL, '양털지방', 27450, 1, 0, 1),
+(NULL, '어드벤처', 27451, 1, 0, 1),
+(NULL, '어떠하다', 27452, 1, 0, 1),
+(NULL, '어떡하다', 27453, 1, 0, 1),
+(NULL, '어리굴젓', 27454, 1, 0, 1),
+(NULL, '어린아이', 27455, 1, 0, 1),
+(NULL, '어릿광대', 27456, 1, 0, 1),
+(NULL, '어이없다', 27457, 1, 0, 1),
+(NULL, '어쭙잖다', 27458, 1, 0, 1),
+(NULL, '어찌하다', 27459, 1, 0, 1),
+(NULL, '어카운트', 27460, 1, 0, 1),
+(NULL, '얼가니새', 27461, 1, 0, 1),
+(NULL, '얼어붙다', 27462, 1, 0, 1),
+(NULL, '엎디리다', 27463, 1, 0, 1),
+(NULL, '엎지르다', 27464, 1, 0, 1),
+(NULL, '에네르기', 27465, 1, 0, 1),
+(NULL, '에드먼턴', 27466, 1, 0, 1),
+(NULL, '에든버러', 27467, 1, 0, 1),
+(NULL, '에미리트', 27468, 1, 0, 1),
+(NULL, '에스테르', 27469, 1, 0, 1),
+(NULL, '에어쿠션', 27470, 1, 0, 1),
+(NULL, '에콰도르', 27471, 1, 0, 1),
+(NULL, '에피소드', 27472, 1, 0, 1),
+(NULL, '엔트로피', 27473, 1, 0, 1),
+(NULL, '엥가노쥐', 27474, 1, 0, 1),
+(NULL, '여기저기', 27475, 1, 0, 1),
+(NULL, '여울마자', 27476, 1, 0, 1),
+(NULL, '여자아이', 27477, 1, 0, 1),
+(NULL, '연필깎이', 27478, 1, 0, 1),
+(NULL, '열다섯째', 27479, 1, 0, 1),
+(NULL, '열여덟째', 27480, 1, 0, 1),
+(NULL, '예사소리', 27481, 1, 0, 1),
+(NULL, '예스럽다', 27482, 1, 0, 1),
+(NULL, '옛 한글', 27483, 1, 0, 1),
+(NULL, '옛이야기', 27484, 1, 0, 1),
+(NULL, '오가네손', 27485, 1, 0, 1),
+(NULL, '오동나무', 27486, 1, 0, 1),
+(NULL, '오라버니', 27487, 1, 0, 1),
+(NULL, '오라버님', 27488, 1, 0, 1),
+(NULL, '오라버이', 27489, 1, 0, 1),
+(NULL, '오랑우탄', 27490, 1, 0, 1),
+(NULL, '오래가다', 27491, 1, 0, 1),
+(NULL, '오렌지색', 27492, 1, 0, 1),
+(NULL, '오르가슴', 27493, 1, 0, 1),
+(NULL, '오리나무', 27494, 1, 0, 1),
+(NULL, '오명가명', 27495, 1, 0, 1),
+(NULL, '오목하다', 27496, 1, 0, 1),
+(NULL, '오미크론', 27497, 1, 0, 1),
+(NULL, '오버클럭', 27498, 1, 0, 1),
+(NULL, '오사리젓', 27499, 1, 0, 1),
+(NULL, '오아시스', 27500, 1, 0, 1),
+(NULL, '오이냉국', 27501, 1, 0, 1),
+(NULL, '오치레기', 27502, 1, 0, 1),
+(NULL, '오토바이', 27503, 1, 0, 1),
+(NULL, '오페레타', 27504, 1, 0, 1),
+(NULL, '오하이오', 27505, 1, 0, 1),
+(NULL, '온두라스', 27506, 1, 0, 1),
+(NULL, '올라가다', 27507, 1, 0, 1),
+(NULL, '올려놓다', 27508, 1, 0, 1),
+(NULL, '올리고당', 27509, 1, 0, 1),
+(NULL, '올리브유', 27510, 1, 0, 1),
+(NULL, '옳바르다', 27511, 1, 0, 1),
+(NULL, '옴개구리', 27512, 1, 0, 1),
+(NULL, '와가두구', 27513, 1, 0, 1),
+(NULL, '와이셔츠', 27514, 1, 0, 1),
+(NULL, '와이오밍', 27515, 1, 0, 1),
+(NULL, '와이파이', 27516, 1, 0, 1),
+(NULL, '완곡하다', 27517, 1, 0, 1),
+(NULL, '왕도마뱀', 27518, 1, 0, 1),
+(NULL, '왕래하다', 27519, 1, 0, 1),
+(NULL, '왕바랭이', 27520, 1, 0, 1),
+(NULL, '왜꾹저구', 27521, 1, 0, 1),
+(NULL, '왜냐하면', 27522, 1, 0, 1),
+(NULL, '왜풀망둑', 27523, 1, 0, 1),
+(NULL, '외출하다', 27524, 1, 0, 1),
+(NULL, '외할머니', 27525, 1, 0, 1),
+(NULL, '왼손잡이', 27526, 1, 0, 1),
+(NULL, '요구르트', 27527, 1, 0, 1),
+(NULL, '우눈셉튬', 27528, 1, 0, 1),
+(NULL, '우눈헥슘', 27529, 1, 0, 1),
+(NULL, '우는토끼', 27530, 1, 0, 1),
+(NULL, '우럭볼락', 27531, 1, 0, 1),
+(NULL, '우르두어', 27532, 1, 0, 1),
+(NULL, '울란우데', 27533, 1, 0, 1),
+(NULL, '움직이다', 27534, 1, 0, 1),
+(NULL, '움찔하다', 27535, 1, 0, 1),
+(NULL, '웃음거리', 27536, 1, 0, 1),
+(NULL, '웃음소리', 27537, 1, 0, 1),
+(NULL, '워크벤치', 27538, 1, 0, 1),
+(NULL, '원더랜드', 27539, 1, 0, 1),
+(NULL, '웬만하다', 27540, 1, 0, 1),
+(NULL, '웹사이트', 27541, 1, 0, 1),
+(NULL, '위스컨신', 27542, 1, 0, 1),
+(NULL, '위스콘신', 27543, 1, 0, 1),
+(NULL, '위팔정맥', 27544, 1, 0, 1),
+(NULL, '윅셔너리', 27545, 1, 0, 1),
+(NULL, '유니코드', 27546, 1, 0, 1),
+(NULL, '유라시아', 27547, 1, 0, 1),
+(NULL, '유럽메기', 27548, 1, 0, 1),
+(NULL, '유럽울새', 27549, 1, 0, 1),
+(NULL, '유로비트', 27550, 1, 0, 1),
+(NULL, '유자나무', 27551, 1, 0, 1),
+(NULL, '유지어터', 27552, 1, 0, 1),
+(NULL, '유토피아', 27553, 1, 0, 1),
+(NULL, '유혈목이', 27554, 1, 0, 1),
+(NULL, '육박하다', 27555, 1, 0, 1),
+(NULL, '으쓱하다', 27556, 1, 0, 1),
+(NULL, '음바바네', 27557, 1, 0, 1),
+(NULL, '응징하다', 27558, 1, 0, 1),
+(NULL, '이거레알', 27559, 1, 0, 1),
+(NULL, '이구아나', 27560, 1, 0, 1),
+(NULL, '이디시어', 27561, 1, 0, 1),
+(NULL, '이딸리아', 27562, 1, 0, 1),
+(NULL, '이러하다', 27563, 1, 0, 1),
+(NULL, '이르잡다', 27564, 1, 0, 1),
+(NULL, '이마떼기', 27565, 1, 0, 1),
+(NULL, '이모티콘', 27566, 1, 0, 1),
+(NULL, '이스라엘', 27567, 1, 0, 1),
+(NULL, '이스탄불', 27568, 1, 0, 1),
+(NULL, '이슬람교', 27569, 1, 0, 1),
+(NULL, '이쑤시개', 27570, 1, 0, 1),
+(NULL, '이케바나', 27571, 1, 0, 1),
+(NULL, '이팔분쟁', 27572, 1, 0, 1),
+(NULL, '인디아나', 27573, 1, 0, 1),
+(NULL, '인디애나', 27574, 1, 0, 1),
+(NULL, '인조잔디', 27575, 1, 0, 1),
+(NULL, '인터네트', 27576, 1, 0, 1),
+(NULL, '인티파다', 27577, 1, 0, 1),
+(NULL, '일리노이', 27578, 1, 0, 1),
+(NULL, '입술연지', 27579, 1, 0, 1),
+(NULL, '잇따르다', 27580, 1, 0, 1),
+(NULL, '있으시다', 27581, 1, 0, 1),
+(NULL, '잉글랜드', 27582, 1, 0, 1),
+(NULL, '잊혀지다', 27583, 1, 0, 1),
+(NULL, '잎갈나무', 27584, 1, 0, 1),
+(NULL, '자귀나무', 27585, 1, 0, 1),
+(NULL, '자그마치', 27586, 1, 0, 1),
+(NULL, '자기절로', 27587, 1, 0, 1),
+(NULL, '자라나다', 27588, 1, 0, 1),
+(NULL, '자메이카', 27589, 1, 0, 1),
+(NULL, '자바애플', 27590, 1, 0, 1),
+(NULL, '자비롭다', 27591, 1, 0, 1),
+(NULL, '자애롭다', 27592, 1, 0, 1),
+(NULL, '자역하다', 27593, 1, 0, 1),
+(NULL, '자작나무', 27594, 1, 0, 1),
+(NULL, '자장노래', 27595, 1, 0, 1),
+(NULL, '작고하다', 27596, 1, 0, 1),
+(NULL, '작은땃쥐', 27597, 1, 0, 1),
+(NULL, '잠꾸러기', 27598, 1, 0, 1),
+(NULL, '잡수시다', 27599, 1, 0, 1),
+(NULL, '장가가다', 27600, 1, 0, 1),
+(NULL, '장수말벌', 27601, 1, 0, 1),
+(NULL, '장인어른', 27602, 1, 0, 1),
+(NULL, '재두루미', 27603, 1, 0, 1),
+(NULL, '잭프루트', 27604, 1, 0, 1),
+(NULL, '저널리즘', 27605, 1, 0, 1),
+(NULL, '저승사자', 27606, 1, 0, 1),
+(NULL, '저애하다', 27607, 1, 0, 1),
+(NULL, '저지르다', 27608, 1, 0, 1),
+(NULL, '전자메일', 27609, 1, 0, 1),
+(NULL, '젊어지다', 27610, 1, 0, 1),
+(NULL, '점줄망둑', 27611, 1, 0, 1),
+(NULL, '점줄종개', 27612, 1, 0, 1),
+(NULL, '점프하다', 27613, 1, 0, 1),
+(NULL, '정의아비', 27614, 1, 0, 1),
+(NULL, '정크푸드', 27615, 1, 0, 1),
+(NULL, '제기차기', 27616, 1, 0, 1),
+(NULL, '제주땃쥐', 27617, 1, 0, 1),
+(NULL, '조개貫子', 27618, 1, 0, 1),
+(NULL, '조개나물', 27619, 1, 0, 1),
+(NULL, '조이스틱', 27620, 1, 0, 1),
+(NULL, '조지아어', 27621, 1, 0, 1),
+(NULL, '조지타운', 27622, 1, 0, 1),
+(NULL, '조팝나무', 27623, 1, 0, 1),
+(NULL, '조피볼락', 27624, 1, 0, 1),
+(NULL, '졸참나무', 27625, 1, 0, 1),
+(NULL, '좀구굴치', 27626, 1, 0, 1),
+(NULL, '좀수수치', 27627, 1, 0, 1),
+(NULL, '종아리뼈', 27628, 1, 0, 1),
+(NULL, '종이접기', 27629, 1, 0, 1),
+(NULL, '좋은 곳', 27630, 1, 0, 1),
+(NULL, '주고받다', 27631, 1, 0, 1),
+(NULL, '주먹감자', 27632, 1, 0, 1),
+(NULL, '주무시다', 27633, 1, 0, 1),
+(NULL, '줄납자루', 27634, 1, 0, 1),
+(NULL, '줌 아웃', 27635, 1, 0, 1),
+(NULL, '중성자별', 27636, 1, 0, 1),
+(NULL, '중앙유럽', 27637, 1, 0, 1),
+(NULL, '지구라트', 27638, 1, 0, 1),
+(NULL, '지긋하다', 27639, 1, 0, 1),
+(NULL, '지나가다', 27640, 1, 0, 1),
+(NULL, '지내가다', 27641, 1, 0, 1),
+(NULL, '지느러미', 27642, 1, 0, 1),
+(NULL, '지르코늄', 27643, 1, 0, 1),
+(NULL, '지침짙다', 27644, 1, 0, 1),
+(NULL, '지칭하다', 27645, 1, 0, 1),
+(NULL, '지푸라기', 27646, 1, 0, 1),
+(NULL, '지하누비', 27647, 1, 0, 1),
+(NULL, '진눈깨비', 27648, 1, 0, 1),
+(NULL, '집비둘기', 27649, 1, 0, 1),
+(NULL, '짙푸르다', 27650, 1, 0, 1),
+(NULL, '찌릿하다', 27651, 1, 0, 1),
+(NULL, '차근차근', 27652, 1, 0, 1),
+(NULL, '차이니스', 27653, 1, 0, 1),
+(NULL, '참개구리', 27654, 1, 0, 1),
+(NULL, '참둑중개', 27655, 1, 0, 1),
+(NULL, '참별고기', 27656, 1, 0, 1),
+(NULL, '참석하다', 27657, 1, 0, 1),
+(NULL, '참중고기', 27658, 1, 0, 1),
+(NULL, '찻숱가락', 27659, 1, 0, 1),
+(NULL, '창던지기', 27660, 1, 0, 1),
+(NULL, '찾아보다', 27661, 1, 0, 1),
+(NULL, '찾아오다', 27662, 1, 0, 1),
+(NULL, '챙피하다', 27663, 1, 0, 1),
+(NULL, '청개구리', 27664, 1, 0, 1),
+(NULL, '청둥오리', 27665, 1, 0, 1),
+(NULL, '청상아리', 27666, 1, 0, 1),
+(NULL, '체르노빌', 27667, 1, 0, 1),
+(NULL, '총알받이', 27668, 1, 0, 1),
+(NULL, '총알열차', 27669, 1, 0, 1),
+(NULL, '쵸콜레트', 27670, 1, 0, 1),
+(NULL, '추워지다', 27671, 1, 0, 1),
+(NULL, '축적하다', 27672, 1, 0, 1),
+(NULL, '축축하다', 27673, 1, 0, 1),
+(NULL, '출근시간', 27674, 1, 0, 1),
+(NULL, '출장가다', 27675, 1, 0, 1),
+(NULL, '치어리더', 27676, 1, 0, 1),
+(NULL, '치어리딩', 27677, 1, 0, 1),
+(NULL, '친할머니', 27678, 1, 0, 1),
+(NULL, '침대깔개', 27679, 1, 0, 1),
+(NULL, '침침하다', 27680, 1, 0, 1),
+(NULL, '카나리아', 27681, 1, 0, 1),
+(NULL, '카놀라유', 27682, 1, 0, 1),
+(NULL, '카라카스', 27683, 1, 0, 1),
+(NULL, '카멜레온', 27684, 1, 0, 1),
+(NULL, '카우보이', 27685, 1, 0, 1),
+(NULL, '카자흐어', 27686, 1, 0, 1),
+(NULL, '카탈로그', 27687, 1, 0, 1),
+(NULL, '카트만두', 27688, 1, 0, 1),
+(NULL, '카펠리니', 27689, 1, 0, 1),
+(NULL, '카피바라', 27690, 1, 0, 1),
+(NULL, '칼납자루', 27691, 1, 0, 1),
+(NULL, '캐나다인', 27692, 1, 0, 1),
+(NULL, '캐매우재', 27693, 1, 0, 1),
+(NULL, '캐슈나무', 27694, 1, 0, 1),
+(NULL, '캘리포늄', 27695, 1, 0, 1),
+(NULL, '커닝하다', 27696, 1, 0, 1),
+(NULL, '커다랗다', 27697, 1, 0, 1),
+(NULL, '커밍아웃', 27698, 1, 0, 1),
+(NULL, '케이블카', 27699, 1, 0, 1),
+(NULL, '케이지비', 27700, 1, 0, 1),
+(NULL, '케이터링', 27701, 1, 0, 1),
+(NULL, '코나크리', 27702, 1, 0, 1),
+(NULL, '코네티컷', 27703, 1, 0, 1),
+(NULL, '코딩하다', 27704, 1, 0, 1),
+(NULL, '코린치쥐', 27705, 1, 0, 1),
+(NULL, '코스모스', 27706, 1, 0, 1),
+(NULL, '코카콜라', 27707, 1, 0, 1),
+(NULL, '콘크리트', 27708, 1, 0, 1),
+(NULL, '콘테스트', 27709, 1, 0, 1),
+(NULL, '콜로라도', 27710, 1, 0, 1),
+(NULL, '쿠르드어', 27711, 1, 0, 1),
+(NULL, '쿠웨이트', 27712, 1, 0, 1),
+(NULL, '크레디트', 27713, 1, 0, 1),
+(NULL, '크레믈린', 27714, 1, 0, 1),
+(NULL, '크루아상', 27715, 1, 0, 1),
+(NULL, '크리스천', 27716, 1, 0, 1),
+(NULL, '크리스트', 27717, 1, 0, 1),
+(NULL, '크메르어', 27718, 1, 0, 1),
+(NULL, '큰개기장', 27719, 1, 0, 1),
+(NULL, '큰귀박쥐', 27720, 1, 0, 1),
+(NULL, '큰납지리', 27721, 1, 0, 1),
+(NULL, '큰돌고래', 27722, 1, 0, 1),
+(NULL, '큰발뒤쥐', 27723, 1, 0, 1),
+(NULL, '큰원추리', 27724, 1, 0, 1),
+(NULL, '큰은대구', 27725, 1, 0, 1),
+(NULL, '큰입우럭', 27726, 1, 0, 1),
+(NULL, '큰집박쥐', 27727, 1, 0, 1),
+(NULL, '큰코뿔새', 27728, 1, 0, 1),
+(NULL, '클라리넷', 27729, 1, 0, 1),
+(NULL, '클라우드', 27730, 1, 0, 1),
+(NULL, '클릭하다', 27731, 1, 0, 1),
+(NULL, '키로와트', 27732, 1, 0, 1),
+(NULL, '키리바시', 27733, 1, 0, 1),
+(NULL, '키릴문자', 27734, 1, 0, 1),
+(NULL, '키스하다', 27735, 1, 0, 1),
+(NULL, '키오스크', 27736, 1, 0, 1),
+(NULL, '킬로그람', 27737, 1, 0, 1),
+(NULL, '킬로그램', 27738, 1, 0, 1),
+(NULL, '킬로미터', 27739, 1, 0, 1),
+(NULL, '킬로와트', 27740, 1, 0, 1),
+(NULL, '킹스타운', 27741, 1, 0, 1),
+(NULL, '킹코브라', 27742, 1, 0, 1),
+(NULL, '타고앉다', 27743, 1, 0, 1),
+(NULL, '타나토스', 27744, 1, 0, 1),
+(NULL, '타이레놀', 27745, 1, 0, 1),
+(NULL, '타이타늄', 27746, 1, 0, 1),
+(NULL, '타임아웃', 27747, 1, 0, 1),
+(NULL, '타지크어', 27748, 1, 0, 1),
+(NULL, '타타르어', 27749, 1, 0, 1),
+(NULL, '탄자니아', 27750, 1, 0, 1),
+(NULL, '탈나치화', 27751, 1, 0, 1),
+(NULL, '태어나다', 27752, 1, 0, 1),
+(NULL, '태여나다', 27753, 1, 0, 1),
+(NULL, '탱자나무', 27754, 1, 0, 1),
+(NULL, '터뜨리다', 27755, 1, 0, 1),
+(NULL, '터치패드', 27756, 1, 0, 1),
+(NULL, '털보말벌', 27757, 1, 0, 1),
+(NULL, '테니스장', 27758, 1, 0, 1),
+(NULL, '테러리즘', 27759, 1, 0, 1),
+(NULL, '테로분자', 27760, 1, 0, 1),
+(NULL, '테크네튬', 27761, 1, 0, 1),
+(NULL, '텍스트북', 27762, 1, 0, 1),
+(NULL, '텔레비전', 27763, 1, 0, 1),
+(NULL, '텔레비죤', 27764, 1, 0, 1),
+(NULL, '토끼박쥐', 27765, 1, 0, 1),
+(NULL, '토나멘트', 27766, 1, 0, 1),
+(NULL, '토너먼트', 27767, 1, 0, 1),
+(NULL, '토네이도', 27768, 1, 0, 1),
+(NULL, '토의하다', 27769, 1, 0, 1),
+(NULL, '톱날꽃게', 27770, 1, 0, 1),
+(NULL, '트램펄린', 27771, 1, 0, 1),
+(NULL, '트러스트', 27772, 1, 0, 1),
+(NULL, '트레이너', 27773, 1, 0, 1),
+(NULL, '트레이닝', 27774, 1, 0, 1),
+(NULL, '트로이카', 27775, 1, 0, 1),
+(NULL, '트리폴리', 27776, 1, 0, 1),
+(NULL, '티베트어', 27777, 1, 0, 1),
+(NULL, '틴에이저', 27778, 1, 0, 1),
+(NULL, '파랑어치', 27779, 1, 0, 1),
+(NULL, '파슈토어', 27780, 1, 0, 1),
+(NULL, '파시스트', 27781, 1, 0, 1),
+(NULL, '파이즈리', 27782, 1, 0, 1),
+(NULL, '파인애플', 27783, 1, 0, 1),
+(NULL, '파트타임', 27784, 1, 0, 1),
+(NULL, '파파라치', 27785, 1, 0, 1),
+(NULL, '파피루스', 27786, 1, 0, 1),
+(NULL, '팟캐스트', 27787, 1, 0, 1),
+(NULL, '팡이무리', 27788, 1, 0, 1),
+(NULL, '팥꽃나무', 27789, 1, 0, 1),
+(NULL, '팥배나무', 27790, 1, 0, 1),
+(NULL, '패럴림픽', 27791, 1, 0, 1),
+(NULL, '패스워드', 27792, 1, 0, 1),
+(NULL, '패스포트', 27793, 1, 0, 1),
+(NULL, '팩시밀리', 27794, 1, 0, 1),
+(NULL, '팬케이크', 27795, 1, 0, 1),
+(NULL, '팽이버섯', 27796, 1, 0, 1),
+(NULL, '퍼레이드', 27797, 1, 0, 1),
+(NULL, '페르샤어', 27798, 1, 0, 1),
+(NULL, '페르시아', 27799, 1, 0, 1),
+(NULL, '페미니즘', 27800, 1, 0, 1),
+(NULL, '페샤와르', 27801, 1, 0, 1),
+(NULL, '페이스북', 27802, 1, 0, 1),
+(NULL, '페투치네', 27803, 1, 0, 1),
+(NULL, '페티시즘', 27804, 1, 0, 1),
+(NULL, '펠라티오', 27805, 1, 0, 1),
+(NULL, '편가르기', 27806, 1, 0, 1),
+(NULL, '편편하다', 27807, 1, 0, 1),
+(NULL, '펼쳐지다', 27808, 1, 0, 1),
+(NULL, '포동포동', 27809, 1, 0, 1),
+(NULL, '포퓰리즘', 27810, 1, 0, 1),
+(NULL, '폴란드어', 27811, 1, 0, 1),
+(NULL, '폴란드인', 27812, 1, 0, 1),
+(NULL, '표범피부', 27813, 1, 0, 1),
+(NULL, '푸나푸티', 27814, 1, 0, 1),
+(NULL, '푸짐하다', 27815, 1, 0, 1),
+(NULL, '풍요롭다', 27816, 1, 0, 1),
+(NULL, '프라이아', 27817, 1, 0, 1),
+(NULL, '프라이팬', 27818, 1, 0, 1),
+(NULL, '프러포즈', 27819, 1, 0, 1),
+(NULL, '프로그람', 27820, 1, 0, 1),
+(NULL, '프로듀서', 27821, 1, 0, 1),
+(NULL, '프로메튬', 27822, 1, 0, 1),
+(NULL, '프로모션', 27823, 1, 0, 1),
+(NULL, '프로세서', 27824, 1, 0, 1),
+(NULL, '프로세스', 27825, 1, 0, 1),
+(NULL, '프로이센', 27826, 1, 0, 1),
+(NULL, '프로젝터', 27827, 1, 0, 1),
+(NULL, '프로젝트', 27828, 1, 0, 1),
+(NULL, '프로페인', 27829, 1, 0, 1),
+(NULL, '프로펠러', 27830, 1, 0, 1),
+(NULL, '프리랜서', 27831, 1, 0, 1),
+(NULL, '프리지어', 27832, 1, 0, 1),
+(NULL, '프리타운', 27833, 1, 0, 1),
+(NULL, '프린스턴', 27834, 1, 0, 1),
+(NULL, '플라스마', 27835, 1, 0, 1),
+(NULL, '플라스크', 27836, 1, 0, 1),
+(NULL, '플라스틱', 27837, 1, 0, 1),
+(NULL, '플라이휠', 27838, 1, 0, 1),
+(NULL, '플래티나', 27839, 1, 0, 1),
+(NULL, '플러그인', 27840, 1, 0, 1),
+(NULL, '플레로븀', 27841, 1, 0, 1),
+(NULL, '플레이어', 27842, 1, 0, 1),
+(NULL, '플로리다', 27843, 1, 0, 1),
+(NULL, '플루오르', 27844, 1, 0, 1),
+(NULL, '플루오린', 27845, 1, 0, 1),
+(NULL, '플루토늄', 27846, 1, 0, 1),
+(NULL, '플립플롭', 27847, 1, 0, 1),
+(NULL, '피라미드', 27848, 1, 0, 1),
+(NULL, '피말강이', 27849, 1, 0, 1),
+(NULL, '피오르드', 27850, 1, 0, 1),
+(NULL, '핀란드어', 27851, 1, 0, 1),
+(NULL, '필드하키', 27852, 1, 0, 1),
+(NULL, '필라테스', 27853, 1, 0, 1),
+(NULL, '하드웨어', 27854, 1, 0, 1),
+(NULL, '하루빨리', 27855, 1, 0, 1),
+(NULL, '하이에나', 27856, 1, 0, 1),
+(NULL, '하품하다', 27857, 1, 0, 1),
+(NULL, '한국까치', 27858, 1, 0, 1),
+(NULL, '한둑중개', 27859, 1, 0, 1),
+(NULL, '한숨짓다', 27860, 1, 0, 1),
+(NULL, '한인타운', 27861, 1, 0, 1),
+(NULL, '한턱내다', 27862, 1, 0, 1),
+(NULL, '할딱벗다', 27863, 1, 0, 1),
+(NULL, '할라페뇨', 27864, 1, 0, 1),
+(NULL, '할렐루야', 27865, 1, 0, 1),
+(NULL, '할리우드', 27866, 1, 0, 1),
+(NULL, '할아버님', 27867, 1, 0, 1),
+(NULL, '할아버지', 27868, 1, 0, 1),
+(NULL, '함께살이', 27869, 1, 0, 1),
+(NULL, '해어지다', 27870, 1, 0, 1),
+(NULL, '해킹하다', 27871, 1, 0, 1),
+(NULL, '핼리팩스', 27872, 1, 0, 1),
+(NULL, '허리케인', 27873, 1, 0, 1),
+(NULL, '허벅다리', 27874, 1, 0, 1),
+(NULL, '헛개나무', 27875, 1, 0, 1),
+(NULL, '헝가리어', 27876, 1, 0, 1),
+(NULL, '헤엄치다', 27877, 1, 0, 1),
+(NULL, '헤이룽장', 27878, 1, 0, 1),
+(NULL, '헬리콥터', 27879, 1, 0, 1),
+(NULL, '헬스클럽', 27880, 1, 0, 1),
+(NULL, '현명하다', 27881, 1, 0, 1),
+(NULL, '형데무투', 27882, 1, 0, 1),
+(NULL, '호두과자', 27883, 1, 0, 1),
+(NULL, '호두나무', 27884, 1, 0, 1),
+(NULL, '호랑나비', 27885, 1, 0, 1),
+(NULL, '호랑이뱀', 27886, 1, 0, 1),
+(NULL, '호루라기', 27887, 1, 0, 1),
+(NULL, '호치키스', 27888, 1, 0, 1),
+(NULL, '혹등고래', 27889, 1, 0, 1),
+(NULL, '혹멧돼지', 27890, 1, 0, 1),
+(NULL, '화살나무', 27891, 1, 0, 1),
+(NULL, '환도상어', 27892, 1, 0, 1),
+(NULL, '환장하다', 27893, 1, 0, 1),
+(NULL, '황구렁이', 27894, 1, 0, 1),
+(NULL, '황금자칼', 27895, 1, 0, 1),
+(NULL, '황줄망둑', 27896, 1, 0, 1),
+(NULL, '회색들소', 27897, 1, 0, 1),
+(NULL, '후라이판', 27898, 1, 0, 1),
+(NULL, '후라이팬', 27899, 1, 0, 1),
+(NULL, '후레이크', 27900, 1, 0, 1),
+(NULL, '후지 산', 27901, 1, 0, 1),
+(NULL, '후쿠시마', 27902, 1, 0, 1),
+(NULL, '훑어읽다', 27903, 1, 0, 1),
+(NULL, '흉내내다', 27904, 1, 0, 1),
+(NULL, '흐리브냐', 27905, 1, 0, 1),
+(NULL, '흥미롭다', 27906, 1, 0, 1),
+(NULL, '흰동가리', 27907, 1, 0, 1),
+(NULL, '흰발망둑', 27908, 1, 0, 1),
+(NULL, '흰배슴새', 27909, 1, 0, 1),
+(NULL, '흰수마자', 27910, 1, 0, 1),
+(NULL, '흰올빼미', 27911, 1, 0, 1),
+(NULL, '흰코뿔소', 27912, 1, 0, 1),
+(NULL, '히브리어', 27913, 1, 0, 1),
+(NULL, '히스테리', 27914, 1, 0, 1),
+(NULL, '가가우스어', 27915, 1, 0, 1),
+(NULL, '가는돌고기', 27916, 1, 0, 1),
+(NULL, '가무이야기', 27917, 1, 0, 1),
+(NULL, '가스아바이', 27918, 1, 0, 1),
+(NULL, '가슴주머니', 27919, 1, 0, 1),
+(NULL, '가시납지리', 27920, 1, 0, 1),
+(NULL, '가시두더지', 27921, 1, 0, 1),
+(NULL, '가시아버지', 27922, 1, 0, 1),
+(NULL, '가시어머니', 27923, 1, 0, 1),
+(NULL, '가쓰오부시', 27924, 1, 0, 1),
+(NULL, '가운데소리', 27925, 1, 0, 1),
+(NULL, '감자 튀김', 27926, 1, 0, 1),
+(NULL, '강주걱양태', 27927, 1, 0, 1),
+(NULL, '개가시나무', 27928, 1, 0, 1),
+(NULL, '개살구나무', 27929, 1, 0, 1),
+(NULL, '개혁시키다', 27930, 1, 0, 1),
+(NULL, '거둥둥하다', 27931, 1, 0, 1),
+(NULL, '거듭홀소리', 27932, 1, 0, 1),
+(NULL, '거짓말장이', 27933, 1, 0, 1),
+(NULL, '거짓말쟁이', 27934, 1, 0, 1),
+(NULL, '검은등자칼', 27935, 1, 0, 1),
+(NULL, '검은코뿔소', 27936, 1, 0, 1),
+(NULL, '계란 1판', 27937, 1, 0, 1),
+(NULL, '계란 껍질', 27938, 1, 0, 1),
+(NULL, '고기숨구멍', 27939, 1, 0, 1),
+(NULL, '고깔해파리', 27940, 1, 0, 1),
+(NULL, '고대 로마', 27941, 1, 0, 1),
+(NULL, '고리도롱뇽', 27942, 1, 0, 1),
+(NULL, '고집스럽다', 27943, 1, 0, 1),
+(NULL, '고추돌고래', 27944, 1, 0, 1),
+(NULL, '골잎원추리', 27945, 1, 0, 1),
+(NULL, '구기자나무', 27946, 1, 0, 1),
+(NULL, '귀엣말하다', 27947, 1, 0, 1),
+(NULL, '귓속말하다', 27948, 1, 0, 1),
+(NULL, '그루지야어', 27949, 1, 0, 1),
+(NULL, '그리스도교', 27950, 1, 0, 1),
+(NULL, '그림버티개', 27951, 1, 0, 1),
+(NULL, '그물기름갖', 27952, 1, 0, 1),
+(NULL, '금강초롱꽃', 27953, 1, 0, 1),
+(NULL, '급조폭발물', 27954, 1, 0, 1),
+(NULL, '기가바이트', 27955, 1, 0, 1),
+(NULL, '기니비사우', 27956, 1, 0, 1),
+(NULL, '긴날개박쥐', 27957, 1, 0, 1),
+(NULL, '까치돌고래', 27958, 1, 0, 1),
+(NULL, '까치살무사', 27959, 1, 0, 1),
+(NULL, '꼬마향고래', 27960, 1, 0, 1),
+(NULL, '꼬치동자개', 27961, 1, 0, 1),
+(NULL, '꽃사과나무', 27962, 1, 0, 1),
+(NULL, '끈끈이주걱', 27963, 1, 0, 1),
+(NULL, '나루토마키', 27964, 1, 0, 1),
+(NULL, '나사돌리개', 27965, 1, 0, 1),
+(NULL, '나이트클럽', 27966, 1, 0, 1),
+(NULL, '나이팅게일', 27967, 1, 0, 1),
+(NULL, '날아오르다', 27968, 1, 0, 1),
+(NULL, '날이 들다', 27969, 1, 0, 1),
+(NULL, '남방동사리', 27970, 1, 0, 1),
+(NULL, '남아시아인', 27971, 1, 0, 1),
+(NULL, '냄새빼기감', 27972, 1, 0, 1),
+(NULL, '네덜란드어', 27973, 1, 0, 1),
+(NULL, '네브라스카', 27974, 1, 0, 1),
+(NULL, '네브래스카', 27975, 1, 0, 1),
+(NULL, '노르웨이어', 27976, 1, 0, 1),
+(NULL, '노바스코샤', 27977, 1, 0, 1),
+(NULL, '노스다코타', 27978, 1, 0, 1),
+(NULL, '논바이너리', 27979, 1, 0, 1),
+(NULL, '누쿠알로파', 27980, 1, 0, 1),
+(NULL, '뉴브런즈윅', 27981, 1, 0, 1),
+(NULL, '니저삐리다', 27982, 1, 0, 1),
+(NULL, '다름슈타튬', 27983, 1, 0, 1),
+(NULL, '다림질하다', 27984, 1, 0, 1),
+(NULL, '다이어그램', 27985, 1, 0, 1),
+(NULL, '다이제스트', 27986, 1, 0, 1),
+(NULL, '다큐멘터리', 27987, 1, 0, 1),
+(NULL, '달걀 1판', 27988, 1, 0, 1),
+(NULL, '달걀 껍질', 27989, 1, 0, 1),
+(NULL, '대륙송사리', 27990, 1, 0, 1),
+(NULL, '던지니스게', 27991, 1, 0, 1),
+(NULL, '덩굴옻나무', 27992, 1, 0, 1),
+(NULL, '데바나가리', 27993, 1, 0, 1),
+(NULL, '데오도란트', 27994, 1, 0, 1),
+(NULL, '데이트하다', 27995, 1, 0, 1),
+(NULL, '동남아시아', 27996, 1, 0, 1),
+(NULL, '동아시아인', 27997, 1, 0, 1),
+(NULL, '되풀이하다', 27998, 1, 0, 1),
+(NULL, '두뿔코뿔소', 27999, 1, 0, 1),
+(NULL, '드래그하다', 28000, 1, 0, 1),
+(NULL, '들어옮기다', 28001, 1, 0, 1),
+(NULL, '디스프로슘', 28002, 1, 0, 1),
+(NULL, '디스플레이', 28003, 1, 0, 1),
+(NULL, '딸꾹질하다', 28004, 1, 0, 1),
+(NULL, '떡납줄갱이', 28005, 1, 0, 1),
+(NULL, '라디에이터', 28006, 1, 0, 1),
+(NULL, '라트비아어', 28007, 1, 0, 1),
+(NULL, '레모네이드', 28008, 1, 0, 1),
+(NULL, '로맨틱하다', 28009, 1, 0, 1),
+(NULL, '롤러코스터', 28010, 1, 0, 1),
+(NULL, '루마니아어', 28011, 1, 0, 1),
+(NULL, '루이지아나', 28012, 1, 0, 1),
+(NULL, '루이지애나', 28013, 1, 0, 1),
+(NULL, '마당너구리', 28014, 1, 0, 1),
+(NULL, '마리후아나', 28015, 1, 0, 1),
+(NULL, '마멀레이드', 28016, 1, 0, 1),
+(NULL, '마사지하다', 28017, 1, 0, 1),
+(NULL, '마셜 제도', 28018, 1, 0, 1),
+(NULL, '마스크 팩', 28019, 1, 0, 1),
+(NULL, '마실 가다', 28020, 1, 0, 1),
+(NULL, '마이크로파', 28021, 1, 0, 1),
+(NULL, '마이크로폰', 28022, 1, 0, 1),
+(NULL, '마이트너륨', 28023, 1, 0, 1),
+(NULL, '만들어지다', 28024, 1, 0, 1),
+(NULL, '만족스럽다', 28025, 1, 0, 1),
+(NULL, '말뚝망둥어', 28026, 1, 0, 1),
+(NULL, '말라얄람어', 28027, 1, 0, 1),
+(NULL, '말썽꾸러기', 28028, 1, 0, 1),
+(NULL, '매사추세츠', 28029, 1, 0, 1),
+(NULL, '머리물비누', 28030, 1, 0, 1),
+(NULL, '메타데이터', 28031, 1, 0, 1),
+(NULL, '메탐페타민', 28032, 1, 0, 1),
+(NULL, '멕시코 만', 28033, 1, 0, 1),
+(NULL, '멕시코시티', 28034, 1, 0, 1),
+(NULL, '멜로드라마', 28035, 1, 0, 1),
+(NULL, '모감주나무', 28036, 1, 0, 1),
+(NULL, '모터사이클', 28037, 1, 0, 1),
+(NULL, '몬테비데오', 28038, 1, 0, 1),
+(NULL, '몰리브데넘', 28039, 1, 0, 1),
+(NULL, '몰염치하다', 28040, 1, 0, 1),
+(NULL, '무당개구리', 28041, 1, 0, 1),
+(NULL, '무분별하다', 28042, 1, 0, 1),
+(NULL, '무화과나무', 28043, 1, 0, 1),
+(NULL, '물에네르기', 28044, 1, 0, 1),
+(NULL, '물푸레나무', 28045, 1, 0, 1),
+(NULL, '뮤직비디오', 28046, 1, 0, 1),
+(NULL, '미국나팔꽃', 28047, 1, 0, 1),
+(NULL, '미국흰죽지', 28048, 1, 0, 1),
+(NULL, '미니스커트', 28049, 1, 0, 1),
+(NULL, '미니시리즈', 28050, 1, 0, 1),
+(NULL, '미니아튀르', 28051, 1, 0, 1),
+(NULL, '미니카메라', 28052, 1, 0, 1),
+(NULL, '미니컴퓨터', 28053, 1, 0, 1),
+(NULL, '미어터지다', 28054, 1, 0, 1),
+(NULL, '미트 민서', 28055, 1, 0, 1),
+(NULL, '민부리고래', 28056, 1, 0, 1),
+(NULL, '바다비오리', 28057, 1, 0, 1),
+(NULL, '바다코끼리', 28058, 1, 0, 1),
+(NULL, '바렌츠 해', 28059, 1, 0, 1),
+(NULL, '바스스카프', 28060, 1, 0, 1),
+(NULL, '박싱 데이', 28061, 1, 0, 1),
+(NULL, '박태기나무', 28062, 1, 0, 1),
+(NULL, '반달가슴곰', 28063, 1, 0, 1),
+(NULL, '발랄라이카', 28064, 1, 0, 1),
+(NULL, '백 퍼센트', 28065, 1, 0, 1),
+(NULL, '백그라운드', 28066, 1, 0, 1),
+(NULL, '백두산뒤쥐', 28067, 1, 0, 1),
+(NULL, '뱀잡이수리', 28068, 1, 0, 1),
+(NULL, '번지 점프', 28069, 1, 0, 1),
+(NULL, '베르미첼리', 28070, 1, 0, 1),
+(NULL, '베스트셀러', 28071, 1, 0, 1),
+(NULL, '베이비시터', 28072, 1, 0, 1),
+(NULL, '벨라루스어', 28073, 1, 0, 1),
+(NULL, '보이프렌드', 28074, 1, 0, 1),
+(NULL, '복싱 데이', 28075, 1, 0, 1),
+(NULL, '부르주아지', 28076, 1, 0, 1),
+(NULL, '부지런하다', 28077, 1, 0, 1),
+(NULL, '부채선인장', 28078, 1, 0, 1),
+(NULL, '북방중고기', 28079, 1, 0, 1),
+(NULL, '북아일랜드', 28080, 1, 0, 1),
+(NULL, '북키프로스', 28081, 1, 0, 1),
+(NULL, '불가리아어', 28082, 1, 0, 1),
+(NULL, '불필요하다', 28083, 1, 0, 1),
+(NULL, '붉가시나무', 28084, 1, 0, 1),
+(NULL, '붉은발슴새', 28085, 1, 0, 1),
+(NULL, '붉은배새매', 28086, 1, 0, 1),
+(NULL, '브리지타운', 28087, 1, 0, 1),
+(NULL, '블라디미르', 28088, 1, 0, 1),
+(NULL, '블랙리스트', 28089, 1, 0, 1),
+(NULL, '블록버스터', 28090, 1, 0, 1),
+(NULL, '블룸폰테인', 28091, 1, 0, 1),
+(NULL, '비단마모셋', 28092, 1, 0, 1),
+(NULL, '비단털들쥐', 28093, 1, 0, 1),
+(NULL, '비데오필림', 28094, 1, 0, 1),
+(NULL, '비치발리볼', 28095, 1, 0, 1),
+(NULL, '비타민 C', 28096, 1, 0, 1),
+(NULL, '빨아올리다', 28097, 1, 0, 1),
+(NULL, '뺑소니치다', 28098, 1, 0, 1),
+(NULL, '뻐끔살무사', 28099, 1, 0, 1),
+(NULL, '뻔뻔스럽다', 28100, 1, 0, 1),
+(NULL, '사다리타기', 28101, 1, 0, 1),
+(NULL, '사랑스럽다', 28102, 1, 0, 1),
+(NULL, '사이버불링', 28103, 1, 0, 1),
+(NULL, '상수리나무', 28104, 1, 0, 1),
+(NULL, '새끼주머니', 28105, 1, 0, 1),
+(NULL, '새너토리엄', 28106, 1, 0, 1),
+(NULL, '새코미꾸리', 28107, 1, 0, 1),
+(NULL, '서류 가방', 28108, 1, 0, 1),
+(NULL, '서스캐처원', 28109, 1, 0, 1),
+(NULL, '서아시아인', 28110, 1, 0, 1),
+(NULL, '설거지하다', 28111, 1, 0, 1),
+(NULL, '설더구하다', 28112, 1, 0, 1),
+(NULL, '섬휘파람새', 28113, 1, 0, 1),
+(NULL, '세르비아어', 28114, 1, 0, 1),
+(NULL, '세인트존스', 28115, 1, 0, 1),
+(NULL, '셀룰로이드', 28116, 1, 0, 1),
+(NULL, '소프트웨어', 28117, 1, 0, 1),
+(NULL, '솔뿌리기름', 28118, 1, 0, 1),
+(NULL, '송아지동무', 28119, 1, 0, 1),
+(NULL, '쇠가마우지', 28120, 1, 0, 1),
+(NULL, '쇠부리슴새', 28121, 1, 0, 1),
+(NULL, '쇠재두루미', 28122, 1, 0, 1),
+(NULL, '쇼핑 센터', 28123, 1, 0, 1),
+(NULL, '수근거리다', 28124, 1, 0, 1),
+(NULL, '수수미꾸리', 28125, 1, 0, 1),
+(NULL, '순豆腐白飯', 28126, 1, 0, 1),
+(NULL, '슈트케이스', 28127, 1, 0, 1),
+(NULL, '슈퍼마케트', 28128, 1, 0, 1),
+(NULL, '스몰렌스크', 28129, 1, 0, 1),
+(NULL, '스와질란드', 28130, 1, 0, 1),
+(NULL, '스워질랜드', 28131, 1, 0, 1),
+(NULL, '스코어보드', 28132, 1, 0, 1),
+(NULL, '스타일러스', 28133, 1, 0, 1),
+(NULL, '스테이플러', 28134, 1, 0, 1),
+(NULL, '스튜어디스', 28135, 1, 0, 1),
+(NULL, '스트리크닌', 28136, 1, 0, 1),
+(NULL, '스파이웨어', 28137, 1, 0, 1),
+(NULL, '스푸트니크', 28138, 1, 0, 1),
+(NULL, '스프링클러', 28139, 1, 0, 1),
+(NULL, '슬레지해머', 28140, 1, 0, 1),
+(NULL, '슬리핑 백', 28141, 1, 0, 1),
+(NULL, '승진시키다', 28142, 1, 0, 1),
+(NULL, '시장하시다', 28143, 1, 0, 1),
+(NULL, '신디케이트', 28144, 1, 0, 1),
+(NULL, '신시사이저', 28145, 1, 0, 1),
+(NULL, '신용 카드', 28146, 1, 0, 1),
+(NULL, '실망시키다', 28147, 1, 0, 1),
+(NULL, '실크 로드', 28148, 1, 0, 1),
+(NULL, '씨뚜아찌야', 28149, 1, 0, 1),
+(NULL, '아나톨리아', 28150, 1, 0, 1),
+(NULL, '아라비아인', 28151, 1, 0, 1),
+(NULL, '아르마딜로', 28152, 1, 0, 1),
+(NULL, '아메리카노', 28153, 1, 0, 1),
+(NULL, '아웃사이더', 28154, 1, 0, 1),
+(NULL, '아이스캔디', 28155, 1, 0, 1),
+(NULL, '아이스크림', 28156, 1, 0, 1),
+(NULL, '아이스하키', 28157, 1, 0, 1),
+(NULL, '아일랜드어', 28158, 1, 0, 1),
+(NULL, '아침 식사', 28159, 1, 0, 1),
+(NULL, '아틀란티스', 28160, 1, 0, 1),
+(NULL, '악성비루스', 28161, 1, 0, 1),
+(NULL, '안경돌고래', 28162, 1, 0, 1),
+(NULL, '안경원숭이', 28163, 1, 0, 1),
+(NULL, '알데하이드', 28164, 1, 0, 1),
+(NULL, '알락할미새', 28165, 1, 0, 1),
+(NULL, '알바니아어', 28166, 1, 0, 1),
+(NULL, '알칼로이드', 28167, 1, 0, 1),
+(NULL, '애니메이션', 28168, 1, 0, 1),
+(NULL, '앨리게이터', 28169, 1, 0, 1),
+(NULL, '앵글로색슨', 28170, 1, 0, 1),
+(NULL, '야구 모자', 28171, 1, 0, 1),
+(NULL, '야무수크로', 28172, 1, 0, 1),
+(NULL, '양버즘나무', 28173, 1, 0, 1),
+(NULL, '어두워지다', 28174, 1, 0, 1),
+(NULL, '얼룩동사리', 28175, 1, 0, 1),
+(NULL, '얼룩족제비', 28176, 1, 0, 1),
+(NULL, '얼음보숭이', 28177, 1, 0, 1),
+(NULL, '엄지손가락', 28178, 1, 0, 1),
+(NULL, '업그레이드', 28179, 1, 0, 1),
+(NULL, '에리트레아', 28180, 1, 0, 1),
+(NULL, '에스와티니', 28181, 1, 0, 1),
+(NULL, '에스프레소', 28182, 1, 0, 1),
+(NULL, '에티오피아', 28183, 1, 0, 1),
+(NULL, '에피타이저', 28184, 1, 0, 1),
+(NULL, '엔지니어링', 28185, 1, 0, 1),
+(NULL, '엘리베이터', 28186, 1, 0, 1),
+(NULL, '엘살바도르', 28187, 1, 0, 1),
+(NULL, '엘쌀바도르', 28188, 1, 0, 1),
+(NULL, '여성스럽다', 28189, 1, 0, 1),
+(NULL, '여우원숭이', 28190, 1, 0, 1),
+(NULL, '열동갈문절', 28191, 1, 0, 1),
+(NULL, '염소 수염', 28192, 1, 0, 1),
+(NULL, '예절바르다', 28193, 1, 0, 1),
+(NULL, '옐로나이프', 28194, 1, 0, 1),
+(NULL, '오디세이아', 28195, 1, 0, 1),
+(NULL, '오르되브르', 28196, 1, 0, 1),
+(NULL, '오른손잡이', 28197, 1, 0, 1),
+(NULL, '오므라이스', 28198, 1, 0, 1),
+(NULL, '오바마케어', 28199, 1, 0, 1),
+(NULL, '오벨리스크', 28200, 1, 0, 1),
+(NULL, '오블라스티', 28201, 1, 0, 1),
+(NULL, '오세아니아', 28202, 1, 0, 1),
+(NULL, '오케스트라', 28203, 1, 0, 1),
+(NULL, '오크로시카', 28204, 1, 0, 1),
+(NULL, '오클라호마', 28205, 1, 0, 1),
+(NULL, '오키나와語', 28206, 1, 0, 1),
+(NULL, '오토메이션', 28207, 1, 0, 1),
+(NULL, '완성시키다', 28208, 1, 0, 1),
+(NULL, '왕사슴벌레', 28209, 1, 0, 1),
+(NULL, '외발자전거', 28210, 1, 0, 1),
+(NULL, '외할아버지', 28211, 1, 0, 1),
+(NULL, '우리 나라', 28212, 1, 0, 1),
+(NULL, '우즈베크어', 28213, 1, 0, 1),
+(NULL, '우한 폐렴', 28214, 1, 0, 1),
+(NULL, '워터 파크', 28215, 1, 0, 1),
+(NULL, '원반던지기', 28216, 1, 0, 1),
+(NULL, '웨이트리스', 28217, 1, 0, 1),
+(NULL, '위키피디아', 28218, 1, 0, 1),
+(NULL, '유스호스텔', 28219, 1, 0, 1),
+(NULL, '으스스하다', 28220, 1, 0, 1),
+(NULL, '은색마모셋', 28221, 1, 0, 1),
+(NULL, '이끼도롱뇽', 28222, 1, 0, 1),
+(NULL, '이데올로기', 28223, 1, 0, 1),
+(NULL, '이산화탄소', 28224, 1, 0, 1),
+(NULL, '이슬람국가', 28225, 1, 0, 1),
+(NULL, '이슬람주의', 28226, 1, 0, 1),
+(NULL, '이칼루이트', 28227, 1, 0, 1),
+(NULL, '이탈리아어', 28228, 1, 0, 1),
+(NULL, '인도차이나', 28229, 1, 0, 1),
+(NULL, '인터페이스', 28230, 1, 0, 1),
+(NULL, '인플루엔자', 28231, 1, 0, 1),
+(NULL, '일떠세우다', 28232, 1, 0, 1),
+(NULL, '일본원숭이', 28233, 1, 0, 1),
+(NULL, '잃어버리다', 28234, 1, 0, 1),
+(NULL, '입원시키다', 28235, 1, 0, 1),
+(NULL, '잊어버리다', 28236, 1, 0, 1),
+(NULL, '자랑스럽다', 28237, 1, 0, 1),
+(NULL, '자바코뿔소', 28238, 1, 0, 1),
+(NULL, '자주종덩굴', 28239, 1, 0, 1),
+(NULL, '작은두꺼비', 28240, 1, 0, 1),
+(NULL, '잔가시고기', 28241, 1, 0, 1),
+(NULL, '재채기하다', 28242, 1, 0, 1),
+(NULL, '저널리스트', 28243, 1, 0, 1),
+(NULL, '전나무열매', 28244, 1, 0, 1),
+(NULL, '정체화하다', 28245, 1, 0, 1),
+(NULL, '제주도롱뇽', 28246, 1, 0, 1),
+(NULL, '종가시나무', 28247, 1, 0, 1),
+(NULL, '종이비행기', 28248, 1, 0, 1),
+(NULL, '주체스럽다', 28249, 1, 0, 1),
+(NULL, '중세 국어', 28250, 1, 0, 1),
+(NULL, '중앙아시아', 28251, 1, 0, 1),
+(NULL, '증가시키다', 28252, 1, 0, 1),
+(NULL, '지푸당하다', 28253, 1, 0, 1),
+(NULL, '차이나타운', 28254, 1, 0, 1),
+(NULL, '착륙시키다', 28255, 1, 0, 1),
+(NULL, '채찍질하다', 28256, 1, 0, 1),
+(NULL, '청가시고기', 28257, 1, 0, 1),
+(NULL, '체다 치즈', 28258, 1, 0, 1),
+(NULL, '출퇴근하다', 28259, 1, 0, 1),
+(NULL, '치팅 데이', 28260, 1, 0, 1),
+(NULL, '친할아버지', 28261, 1, 0, 1),
+(NULL, '칠성말배꼽', 28262, 1, 0, 1),
+(NULL, '침몰시키다', 28263, 1, 0, 1),
+(NULL, '칭기즈 칸', 28264, 1, 0, 1),
+(NULL, '카페테리아', 28265, 1, 0, 1),
+(NULL, '캘리포니아', 28266, 1, 0, 1),
+(NULL, '커먼마모셋', 28267, 1, 0, 1),
+(NULL, '커피메이커', 28268, 1, 0, 1),
+(NULL, '컨테이너선', 28269, 1, 0, 1),
+(NULL, '코끼리물범', 28270, 1, 0, 1),
+(NULL, '코로나19', 28271, 1, 0, 1),
+(NULL, '코페르니슘', 28272, 1, 0, 1),
+(NULL, '콘도미니엄', 28273, 1, 0, 1),
+(NULL, '콘드 비프', 28274, 1, 0, 1),
+(NULL, '콜레스테롤', 28275, 1, 0, 1),
+(NULL, '콩밥 먹다', 28276, 1, 0, 1),
+(NULL, '크리스트교', 28277, 1, 0, 1),
+(NULL, '큰가시고기', 28278, 1, 0, 1),
+(NULL, '큰겨울잠쥐', 28279, 1, 0, 1),
+(NULL, '큰논병아리', 28280, 1, 0, 1),
+(NULL, '큰말똥가리', 28281, 1, 0, 1),
+(NULL, '큰바다사자', 28282, 1, 0, 1),
+(NULL, '큰부리고래', 28283, 1, 0, 1),
+(NULL, '큰줄납자루', 28284, 1, 0, 1),
+(NULL, '클로로포름', 28285, 1, 0, 1),
+(NULL, '클리토리스', 28286, 1, 0, 1),
+(NULL, '키르기스어', 28287, 1, 0, 1),
+(NULL, '타갈로그어', 28288, 1, 0, 1),
+(NULL, '테구시갈파', 28289, 1, 0, 1),
+(NULL, '테러리스트', 28290, 1, 0, 1),
+(NULL, '텔레타이프', 28291, 1, 0, 1),
+(NULL, '토르텔로니', 28292, 1, 0, 1),
+(NULL, '토르텔리니', 28293, 1, 0, 1),
+(NULL, '통조림공장', 28294, 1, 0, 1),
+(NULL, '통조림제조', 28295, 1, 0, 1),
+(NULL, '투르크멘어', 28296, 1, 0, 1),
+(NULL, '튀르키예어', 28297, 1, 0, 1),
+(NULL, '트랜스젠더', 28298, 1, 0, 1),
+(NULL, '트롤리버스', 28299, 1, 0, 1),
+(NULL, '트롱프뢰유', 28300, 1, 0, 1),
+(NULL, '트리니다드', 28301, 1, 0, 1),
+(NULL, '파라노이아', 28302, 1, 0, 1),
+(NULL, '파라다이스', 28303, 1, 0, 1),
+(NULL, '파라마리보', 28304, 1, 0, 1),
+(NULL, '파이프라인', 28305, 1, 0, 1),
+(NULL, '패션프루츠', 28306, 1, 0, 1),
+(NULL, '패스트푸드', 28307, 1, 0, 1),
+(NULL, '팽나무버섯', 28308, 1, 0, 1),
+(NULL, '페더럴웨이', 28309, 1, 0, 1),
+(NULL, '페미니스트', 28310, 1, 0, 1),
+(NULL, '펜실베니아', 28311, 1, 0, 1),
+(NULL, '포르토노보', 28312, 1, 0, 1),
+(NULL, '포르투갈어', 28313, 1, 0, 1),
+(NULL, '포켓몬스터', 28314, 1, 0, 1),
+(NULL, '포트루이스', 28315, 1, 0, 1),
+(NULL, '포환던지기', 28316, 1, 0, 1),
+(NULL, '폴리네시아', 28317, 1, 0, 1),
+(NULL, '풀을 뜯다', 28318, 1, 0, 1),
+(NULL, '프라이버시', 28319, 1, 0, 1),
+(NULL, '프레더릭턴', 28320, 1, 0, 1),
+(NULL, '프로그래머', 28321, 1, 0, 1),
+(NULL, '프로그래밍', 28322, 1, 0, 1),
+(NULL, '프리메이슨', 28323, 1, 0, 1),
+(NULL, '프리슈티나', 28324, 1, 0, 1),
+(NULL, '플라네타륨', 28325, 1, 0, 1),
+(NULL, '플라스티신', 28326, 1, 0, 1),
+(NULL, '플래시 몹', 28327, 1, 0, 1),
+(NULL, '플랜테이션', 28328, 1, 0, 1),
+(NULL, '피스타치오', 28329, 1, 0, 1),
+(NULL, '피아니스트', 28330, 1, 0, 1),
+(NULL, '피어오르다', 28331, 1, 0, 1),
+(NULL, '하바롭스크', 28332, 1, 0, 1),
+(NULL, '한강납줄개', 28333, 1, 0, 1),
+(NULL, '합스부르크', 28334, 1, 0, 1),
+(NULL, '해머던지기', 28335, 1, 0, 1),
+(NULL, '헬스 클럽', 28336, 1, 0, 1),
+(NULL, '호모포비아', 28337, 1, 0, 1),
+(NULL, '호주 연방', 28338, 1, 0, 1),
+(NULL, '혹부리고래', 28339, 1, 0, 1),
+(NULL, '화이트보드', 28340, 1, 0, 1),
+(NULL, '화이트호스', 28341, 1, 0, 1),
+(NULL, '황소개구리', 28342, 1, 0, 1),
+(NULL, '훼드럴웨이', 28343, 1, 0, 1),
+(NULL, '휴머노이드', 28344, 1, 0, 1),
+(NULL, '흐르바쯔까', 28345, 1, 0, 1),
+(NULL, '흰꼬리수리', 28346, 1, 0, 1),
+(NULL, '흰머리수리', 28347, 1, 0, 1),
+(NULL, '흰부리아비', 28348, 1, 0, 1),
+(NULL, '흰줄납줄개', 28349, 1, 0, 1),
+(NULL, '갈색머리흑조', 28350, 1, 0, 1),
+(NULL, '갈색얼가니새', 28351, 1, 0, 1),
+(NULL, '갑상샘저하증', 28352, 1, 0, 1),
+(NULL, '개구리꺽정이', 28353, 1, 0, 1),
+(NULL, '거무스름하다', 28354, 1, 0, 1),
+(NULL, '검둥오리사촌', 28355, 1, 0, 1),
+(NULL, '검은등할미새', 28356, 1, 0, 1),
+(NULL, '검은머리멧새', 28357, 1, 0, 1),
+(NULL, '검은해오라기', 28358, 1, 0, 1),
+(NULL, '게스트하우스', 28359, 1, 0, 1),
+(NULL, '계곡산개구리', 28360, 1, 0, 1),
+(NULL, '계란 프라이', 28361, 1, 0, 1),
+(NULL, '계란 한 판', 28362, 1, 0, 1),
+(NULL, '계란 후라이', 28363, 1, 0, 1),
+(NULL, '고대 그리스', 28364, 1, 0, 1),
+(NULL, '고바야시박쥐', 28365, 1, 0, 1),
+(NULL, '구실잣밤나무', 28366, 1, 0, 1),
+(NULL, '그래픽 카드', 28367, 1, 0, 1),
+(NULL, '글라스노스트', 28368, 1, 0, 1),
+(NULL, '긴꼬리꼬마쥐', 28369, 1, 0, 1),
+(NULL, '꽃며느리밥풀', 28370, 1, 0, 1),
+(NULL, '나무타기사촌', 28371, 1, 0, 1),
+(NULL, '나일틸라피아', 28372, 1, 0, 1),
+(NULL, '네안데르탈인', 28373, 1, 0, 1),
+(NULL, '누난 증후군', 28374, 1, 0, 1),
+(NULL, '다르에스살람', 28375, 1, 0, 1),
+(NULL, '다리미질하다', 28376, 1, 0, 1),
+(NULL, '단순청상아리', 28377, 1, 0, 1),
+(NULL, '달걀 프라이', 28378, 1, 0, 1),
+(NULL, '달걀 한 판', 28379, 1, 0, 1),
+(NULL, '달고나 커피', 28380, 1, 0, 1),
+(NULL, '더러운 폭탄', 28381, 1, 0, 1),
+(NULL, '더치페이하다', 28382, 1, 0, 1),
+(NULL, '데이터베이스', 28383, 1, 0, 1),
+(NULL, '돌무화과나무', 28384, 1, 0, 1),
+(NULL, '동남아시아인', 28385, 1, 0, 1),
+(NULL, '두만가시고기', 28386, 1, 0, 1),
+(NULL, '드라이브뜨루', 28387, 1, 0, 1),
+(NULL, '드라이브스루', 28388, 1, 0, 1),
+(NULL, '드라이브하다', 28389, 1, 0, 1),
+(NULL, '들고양이고래', 28390, 1, 0, 1),
+(NULL, '들창코원숭이', 28391, 1, 0, 1),
+(NULL, '라이트 노벨', 28392, 1, 0, 1),
+(NULL, '러시안 룰렛', 28393, 1, 0, 1),
+(NULL, '로드아일랜드', 28394, 1, 0, 1),
+(NULL, '리투아니아어', 28395, 1, 0, 1),
+(NULL, '릴레이 경기', 28396, 1, 0, 1),
+(NULL, '마르크스주의', 28397, 1, 0, 1),
+(NULL, '마모셋원숭이', 28398, 1, 0, 1),
+(NULL, '마스터베이션', 28399, 1, 0, 1),
+(NULL, '마이크로버스', 28400, 1, 0, 1),
+(NULL, '마케도니아어', 28401, 1, 0, 1),
+(NULL, '매달린 사람', 28402, 1, 0, 1),
+(NULL, '매스 미디어', 28403, 1, 0, 1),
+(NULL, '메르쿠리우스', 28404, 1, 0, 1),
+(NULL, '모밀잣밤나무', 28405, 1, 0, 1),
+(NULL, '물윗수염박쥐', 28406, 1, 0, 1),
+(NULL, '미적지근하다', 28407, 1, 0, 1),
+(NULL, '미크로네시아', 28408, 1, 0, 1),
+(NULL, '민물검정망둑', 28409, 1, 0, 1),
+(NULL, '바늘꼬리도요', 28410, 1, 0, 1),
+(NULL, '바이오폴리머', 28411, 1, 0, 1),
+(NULL, '밸런타인데이', 28412, 1, 0, 1),
+(NULL, '뱀머리돌고래', 28413, 1, 0, 1),
+(NULL, '벨로키랍토르', 28414, 1, 0, 1),
+(NULL, '보이즈 러브', 28415, 1, 0, 1),
+(NULL, '북마께도니아', 28416, 1, 0, 1),
+(NULL, '북마케도니아', 28417, 1, 0, 1),
+(NULL, '북방애기박쥐', 28418, 1, 0, 1),
+(NULL, '북방흰뺨오리', 28419, 1, 0, 1),
+(NULL, '붉은가슴울새', 28420, 1, 0, 1),
+(NULL, '브라이드고래', 28421, 1, 0, 1),
+(NULL, '비늘흰발망둑', 28422, 1, 0, 1),
+(NULL, '비단털등줄쥐', 28423, 1, 0, 1),
+(NULL, '비디오테이프', 28424, 1, 0, 1),
+(NULL, '빙산의 일각', 28425, 1, 0, 1),
+(NULL, '사르코파구스', 28426, 1, 0, 1),
+(NULL, '사우스다코타', 28427, 1, 0, 1),
+(NULL, '산스크리트어', 28428, 1, 0, 1),
+(NULL, '샌프란시스코', 28429, 1, 0, 1),
+(NULL, '서호납줄갱이', 28430, 1, 0, 1),
+(NULL, '선줄맨드라미', 28431, 1, 0, 1),
+(NULL, '세인트조지스', 28432, 1, 0, 1),
+(NULL, '손가락 하트', 28433, 1, 0, 1),
+(NULL, '솔로몬 제도', 28434, 1, 0, 1),
+(NULL, '수원청개구리', 28435, 1, 0, 1),
+(NULL, '스칸디나비아', 28436, 1, 0, 1),
+(NULL, '스케이트보드', 28437, 1, 0, 1),
+(NULL, '스쿠버다이빙', 28438, 1, 0, 1),
+(NULL, '스티어링 휠', 28439, 1, 0, 1),
+(NULL, '슬로바키아어', 28440, 1, 0, 1),
+(NULL, '슬로베니아어', 28441, 1, 0, 1),
+(NULL, '습기가 끼다', 28442, 1, 0, 1),
+(NULL, '시끌벅적하다', 28443, 1, 0, 1),
+(NULL, '싱어송라이터', 28444, 1, 0, 1),
+(NULL, '쓸어일어나다', 28445, 1, 0, 1),
+(NULL, '아르메니아어', 28446, 1, 0, 1),
+(NULL, '아마존 우림', 28447, 1, 0, 1),
+(NULL, '아스파라거스', 28448, 1, 0, 1),
+(NULL, '아이스 캔디', 28449, 1, 0, 1),
+(NULL, '아이스케이크', 28450, 1, 0, 1),
+(NULL, '아이슬란드어', 28451, 1, 0, 1),
+(NULL, '아인슈타이늄', 28452, 1, 0, 1),
+(NULL, '아프리칸스어', 28453, 1, 0, 1),
+(NULL, '안도라라베야', 28454, 1, 0, 1),
+(NULL, '안절부절하다', 28455, 1, 0, 1),
+(NULL, '안주애기박쥐', 28456, 1, 0, 1),
+(NULL, '안타나나리보', 28457, 1, 0, 1),
+(NULL, '알락개구리매', 28458, 1, 0, 1),
+(NULL, '압록자그사니', 28459, 1, 0, 1),
+(NULL, '애플리케이션', 28460, 1, 0, 1),
+(NULL, '앵글로색슨인', 28461, 1, 0, 1),
+(NULL, '어플리케이션', 28462, 1, 0, 1),
+(NULL, '에스컬레이터', 28463, 1, 0, 1),
+(NULL, '에스토니아어', 28464, 1, 0, 1),
+(NULL, '에어컨디셔너', 28465, 1, 0, 1),
+(NULL, '엔터테인먼트', 28466, 1, 0, 1),
+(NULL, '오렌지 주스', 28467, 1, 0, 1),
+(NULL, '오색딱따구리', 28468, 1, 0, 1),
+(NULL, '오스만 제국', 28469, 1, 0, 1),
+(NULL, '오스트랄리아', 28470, 1, 0, 1),
+(NULL, '우즈베끼스딴', 28471, 1, 0, 1),
+(NULL, '우크라이나어', 28472, 1, 0, 1),
+(NULL, '운명의 바퀴', 28473, 1, 0, 1),
+(NULL, '울퉁불퉁하다', 28474, 1, 0, 1),
+(NULL, '웹 브라우저', 28475, 1, 0, 1),
+(NULL, '위키낱말사전', 28476, 1, 0, 1),
+(NULL, '유고슬라비아', 28477, 1, 0, 1),
+(NULL, '유머러스하다', 28478, 1, 0, 1),
+(NULL, '이태리 타올', 28479, 1, 0, 1),
+(NULL, '인도네시아어', 28480, 1, 0, 1),
+(NULL, '인터넷 小說', 28481, 1, 0, 1),
+(NULL, '인텔리겐치아', 28482, 1, 0, 1),
+(NULL, '입이 가볍다', 28483, 1, 0, 1),
+(NULL, '자신만만하다', 28484, 1, 0, 1),
+(NULL, '작은관코박쥐', 28485, 1, 0, 1),
+(NULL, '잔점박이물범', 28486, 1, 0, 1),
+(NULL, '장다리물떼새', 28487, 1, 0, 1),
+(NULL, '잿빛개구리매', 28488, 1, 0, 1),
+(NULL, '전나무 열매', 28489, 1, 0, 1),
+(NULL, '제주모치망둑', 28490, 1, 0, 1),
+(NULL, '족제비오소리', 28491, 1, 0, 1),
+(NULL, '주롱 이스트', 28492, 1, 0, 1),
+(NULL, '줄박이돌고래', 28493, 1, 0, 1),
+(NULL, '중국산개구리', 28494, 1, 0, 1),
+(NULL, '중앙아프리카', 28495, 1, 0, 1),
+(NULL, '책상다리하다', 28496, 1, 0, 1),
+(NULL, '천도 복숭아', 28497, 1, 0, 1),
+(NULL, '캐나다 달러', 28498, 1, 0, 1),
+(NULL, '커리어 우먼', 28499, 1, 0, 1),
+(NULL, '커뮤니케이션', 28500, 1, 0, 1),
+(NULL, '코로나비루스', 28501, 1, 0, 1),
+(NULL, '코주부원숭이', 28502, 1, 0, 1),
+(NULL, '콘택트 렌즈', 28503, 1, 0, 1),
+(NULL, '콜라보레이션', 28504, 1, 0, 1),
+(NULL, '크라우드펀딩', 28505, 1, 0, 1),
+(NULL, '크로스드레싱', 28506, 1, 0, 1),
+(NULL, '크로아티아어', 28507, 1, 0, 1),
+(NULL, '크메르 루주', 28508, 1, 0, 1),
+(NULL, '큰눈환도상어', 28509, 1, 0, 1),
+(NULL, '큰머리돌고래', 28510, 1, 0, 1),
+(NULL, '클래스메이트', 28511, 1, 0, 1),
+(NULL, '키싱 구라미', 28512, 1, 0, 1),
+(NULL, '타이포그래피', 28513, 1, 0, 1),
+(NULL, '타이프라이터', 28514, 1, 0, 1),
+(NULL, '터치 스크린', 28515, 1, 0, 1),
+(NULL, '털발말똥가리', 28516, 1, 0, 1),
+(NULL, '테니스 코트', 28517, 1, 0, 1),
+(NULL, '트리케라톱스', 28518, 1, 0, 1),
+(NULL, '파이프오르간', 28519, 1, 0, 1),
+(NULL, '파푸아뉴기니', 28520, 1, 0, 1),
+(NULL, '팬티 스타킹', 28521, 1, 0, 1),
+(NULL, '페루 공화국', 28522, 1, 0, 1),
+(NULL, '펜실베이니아', 28523, 1, 0, 1),
+(NULL, '포르노그래피', 28524, 1, 0, 1),
+(NULL, '포르토프랭스', 28525, 1, 0, 1),
+(NULL, '포름알데히드', 28526, 1, 0, 1),
+(NULL, '폴리프로필렌', 28527, 1, 0, 1),
+(NULL, '폴터가이스트', 28528, 1, 0, 1),
+(NULL, '프라세오디뮴', 28529, 1, 0, 1),
+(NULL, '프레젠테이션', 28530, 1, 0, 1),
+(NULL, '프로트악티늄', 28531, 1, 0, 1),
+(NULL, '플래시 픽션', 28532, 1, 0, 1),
+(NULL, '피그미마모셋', 28533, 1, 0, 1),
+(NULL, '피짠짜짜라어', 28534, 1, 0, 1),
+(NULL, '필리핀독수리', 28535, 1, 0, 1),
+(NULL, '한국산개구리', 28536, 1, 0, 1),
+(NULL, '행간을 읽다', 28537, 1, 0, 1),
+(NULL, '헤어드라이어', 28538, 1, 0, 1),
+(NULL, '호버크라프트', 28539, 1, 0, 1),
+(NULL, '홀소리어울림', 28540, 1, 0, 1),
+(NULL, '흰머리기러기', 28541, 1, 0, 1),
+(NULL, '흰배줄독수리', 28542, 1, 0, 1),
+(NULL, '흰배환도상어', 28543, 1, 0, 1),
+(NULL, '흰뺨검둥오리', 28544, 1, 0, 1),
+(NULL, '흰이마기러기', 28545, 1, 0, 1),
+(NULL, '힙 플라스크', 28546, 1, 0, 1),
+(NULL, '검은목논병아리', 28547, 1, 0, 1),
+(NULL, '게이 프라이드', 28548, 1, 0, 1),
+(NULL, '고대 그리스어', 28549, 1, 0, 1),
+(NULL, '그라이프스발트', 28550, 1, 0, 1),
+(NULL, '그레이트브리튼', 28551, 1, 0, 1),
+(NULL, '그레이프프루트', 28552, 1, 0, 1),
+(NULL, '긴부리참돌고래', 28553, 1, 0, 1),
+(NULL, '꼬리치레도롱뇽', 28554, 1, 0, 1),
+(NULL, '넓은주둥이상어', 28555, 1, 0, 1),
+(NULL, '네발가락도롱뇽', 28556, 1, 0, 1),
+(NULL, '노랑머리할미새', 28557, 1, 0, 1),
+(NULL, '노스캐럴라이나', 28558, 1, 0, 1),
+(NULL, '노스캐롤라이나', 28559, 1, 0, 1),
+(NULL, '두만강자그사니', 28560, 1, 0, 1),
+(NULL, '드라이 클리닝', 28561, 1, 0, 1),
+(NULL, '마더 콤플렉스', 28562, 1, 0, 1),
+(NULL, '마이크로소프트', 28563, 1, 0, 1),
+(NULL, '메추라기뜸부기', 28564, 1, 0, 1),
+(NULL, '물 만난 고기', 28565, 1, 0, 1),
+(NULL, '북방긴수염고래', 28566, 1, 0, 1),
+(NULL, '붉은가슴흰죽지', 28567, 1, 0, 1),
+(NULL, '붉은부리갈매기', 28568, 1, 0, 1),
+(NULL, '붉은부리흰죽지', 28569, 1, 0, 1),
+(NULL, '붉은뺨가마우지', 28570, 1, 0, 1),
+(NULL, '뷔슈 드 노엘', 28571, 1, 0, 1),
+(NULL, '사이언스 픽션', 28572, 1, 0, 1),
+(NULL, '생을 마감하다', 28573, 1, 0, 1),
+(NULL, '세가락메추라기', 28574, 1, 0, 1),
+(NULL, '소프트 테니스', 28575, 1, 0, 1),
+(NULL, '솔로몬의 智慧', 28576, 1, 0, 1),
+(NULL, '솔로몬의 지혜', 28577, 1, 0, 1),
+(NULL, '스노우 글로브', 28578, 1, 0, 1),
+(NULL, '스크루드라이버', 28579, 1, 0, 1),
+(NULL, '아리스토텔레스', 28580, 1, 0, 1),
+(NULL, '아메리카너구리', 28581, 1, 0, 1),
+(NULL, '아무르산개구리', 28582, 1, 0, 1),
+(NULL, '아제르바이잔어', 28583, 1, 0, 1),
+(NULL, '아파르트헤이트', 28584, 1, 0, 1),
+(NULL, '앤티가 바부다', 28585, 1, 0, 1),
+(NULL, '얼룩새코미꾸리', 28586, 1, 0, 1),
+(NULL, '얼터너티브 록', 28587, 1, 0, 1),
+(NULL, '왔다리 갔다리', 28588, 1, 0, 1),
+(NULL, '웨스트버지니아', 28589, 1, 0, 1),
+(NULL, '유대인 자치주', 28590, 1, 0, 1),
+(NULL, '유럽소나무담비', 28591, 1, 0, 1),
+(NULL, '유럽칠성말배꼽', 28592, 1, 0, 1),
+(NULL, '자우어크라우트', 28593, 1, 0, 1),
+(NULL, '작은윗수염박쥐', 28594, 1, 0, 1),
+(NULL, '정치적 올바름', 28595, 1, 0, 1),
+(NULL, '체코슬로바키아', 28596, 1, 0, 1),
+(NULL, '캐나디안 풋볼', 28597, 1, 0, 1),
+(NULL, '코로나바이러스', 28598, 1, 0, 1),
+(NULL, '쾨니히스베르크', 28599, 1, 0, 1),
+(NULL, '퀴어 퍼레이드', 28600, 1, 0, 1),
+(NULL, '크레디트 카드', 28601, 1, 0, 1),
+(NULL, '크리스마스이브', 28602, 1, 0, 1),
+(NULL, '큰덤불해오라기', 28603, 1, 0, 1),
+(NULL, '큰발윗수염박쥐', 28604, 1, 0, 1),
+(NULL, '큰볏말뚝망둥어', 28605, 1, 0, 1),
+(NULL, '큰이빨부리고래', 28606, 1, 0, 1),
+(NULL, '테이프 레코더', 28607, 1, 0, 1),
+(NULL, '텔레비전 채널', 28608, 1, 0, 1),
+(NULL, '텔레비죤 통로', 28609, 1, 0, 1),
+(NULL, '티라노사우루스', 28610, 1, 0, 1),
+(NULL, '페레스트로이카', 28611, 1, 0, 1),
+(NULL, '포트오브스페인', 28612, 1, 0, 1),
+(NULL, '프렌치 프라이', 28613, 1, 0, 1),
+(NULL, '필름이 끊기다', 28614, 1, 0, 1),
+(NULL, '호모 사피엔스', 28615, 1, 0, 1),
+(NULL, '흰날개해오라기', 28616, 1, 0, 1),
+(NULL, '흰배윗수염박쥐', 28617, 1, 0, 1),
+(NULL, '검은댕기해오라기', 28618, 1, 0, 1),
+(NULL, '검은머리흰따오기', 28619, 1, 0, 1),
+(NULL, '고대교회슬라브어', 28620, 1, 0, 1),
+(NULL, '급진적 여성주의', 28621, 1, 0, 1),
+(NULL, '남아프리카 련방', 28622, 1, 0, 1),
+(NULL, '남아프리카 연방', 28623, 1, 0, 1),
+(NULL, '노스웨스트 준주', 28624, 1, 0, 1),
+(NULL, '마카베오기 상권', 28625, 1, 0, 1),
+(NULL, '마하라슈트라 주', 28626, 1, 0, 1),
+(NULL, '별이 빛나는 밤', 28627, 1, 0, 1),
+(NULL, '부에노스아이레스', 28628, 1, 0, 1),
+(NULL, '브라키오사우루스', 28629, 1, 0, 1),
+(NULL, '브리티시컬럼비아', 28630, 1, 0, 1),
+(NULL, '사우스캐럴라이나', 28631, 1, 0, 1),
+(NULL, '사우스캐롤라이나', 28632, 1, 0, 1),
+(NULL, '세르보크로아트어', 28633, 1, 0, 1),
+(NULL, '세인트피터즈버그', 28634, 1, 0, 1),
+(NULL, '술이 떡이 되다', 28635, 1, 0, 1),
+(NULL, '아메리카 합중국', 28636, 1, 0, 1),
+(NULL, '아프리카황금늑대', 28637, 1, 0, 1),
+(NULL, '열대붉은해오라기', 28638, 1, 0, 1),
+(NULL, '오렌지윗수염박쥐', 28639, 1, 0, 1),
+(NULL, '유즈노사할린스크', 28640, 1, 0, 1),
+(NULL, '짧은부리참돌고래', 28641, 1, 0, 1),
+(NULL, '체스꼬슬로벤스꼬', 28642, 1, 0, 1),
+(NULL, '카페 아메리카노', 28643, 1, 0, 1),
+(NULL, '캘리포니아메추리', 28644, 1, 0, 1),
+(NULL, '크리스마스 트리', 28645, 1, 0, 1),
+(NULL, '트란스니스트리아', 28646, 1, 0, 1),
+(NULL, '푸른얼굴얼가니새', 28647, 1, 0, 1),
+(NULL, '푸에르토 갈레라', 28648, 1, 0, 1),
+(NULL, '프랑스령 기아나', 28649, 1, 0, 1),
+(NULL, '하늘의 별 따기', 28650, 1, 0, 1),
+(NULL, '흰넓적다리붉은쥐', 28651, 1, 0, 1),
+(NULL, '구씨-흐루스딸리니', 28652, 1, 0, 1),
+(NULL, '남아프리카의 외침', 28653, 1, 0, 1),
+(NULL, '부에노스 아이레스', 28654, 1, 0, 1),
+(NULL, '오스트랄리아 련방', 28655, 1, 0, 1),
+(NULL, '콤소몰스크나아무레', 28656, 1, 0, 1),
+(NULL, '트리니다드 토바고', 28657, 1, 0, 1),
+(NULL, '뉴펀들랜드 래브라도', 28658, 1, 0, 1),
+(NULL, '신종 코로나 감염증', 28659, 1, 0, 1),
+(NULL, '어찌할 바를 모르다', 28660, 1, 0, 1),
+(NULL, '오스트레일리아 련방', 28661, 1, 0, 1),
+(NULL, '오스트레일리아 연방', 28662, 1, 0, 1),
+(NULL, '메클렌부르크포어포메른', 28663, 1, 0, 1),
+(NULL, '세인트빈센트 그레나딘', 28664, 1, 0, 1),
+(NULL, '신형코로나비루스감염증', 28665, 1, 0, 1),
+(NULL, '프린스에드워드아일랜드', 28666, 1, 0, 1),
+(NULL, '워크 앤 라이프 밸런스', 28667, 1, 0, 1),
+(NULL, '세계에서 가장 오래된 직업', 28668, 1, 0, 1),
+(NULL, '대브리텐 및 북아일랜드 련합 왕국', 28669, 1, 0, 1),
+(NULL, '그레이트브리튼 북아일랜드 연합 왕국', 28670, 1, 0, 1)
+ON CONFLICT DO NOTHING;
\ No newline at end of file
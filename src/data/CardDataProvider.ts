@@ -7,24 +7,21 @@ import koreanPronunciationSchema from "../assets//schemas/korean_pronunciation.s
 import radicalsSchema from "../assets//schemas/radicals.sql?raw";
 import tagsSchema from "../assets//schemas/tags.sql?raw";
 import reviewsSchema from "../assets//schemas/reviews.sql?raw";
-
-import wordListData from "../assets//sources/bravender/word_list.sql?raw";
-import englishHanjaDefinitionData from "../assets//sources/bravender/english_hanja_definition.sql?raw";
-import koreanHanjaDefinitionData from "../assets//sources/bravender/korean_hanja_definition.sql?raw";
-import koreanPronunciationData from "../assets//sources/bravender/korean_pronunciation.sql?raw";
-import radicalsData from "../assets//sources/bravender/radicals.sql?raw";
+import hanjaWordIndexSchema from "../assets//schemas/hanja_word_index.sql?raw";
+import wordRankSchema from "../assets//schemas/word_rank.sql?raw";
+
+// The dictionary tables are seeded from the merge of every source (bravender,
+// wiktionary, kengdic), written by tools/merge_sources.py.
+import wordListData from "../assets//sources/merged/word_list.sql?raw";
+import englishHanjaDefinitionData from "../assets//sources/merged/english_hanja_definition.sql?raw";
+import koreanHanjaDefinitionData from "../assets//sources/merged/korean_hanja_definition.sql?raw";
+import koreanPronunciationData from "../assets//sources/merged/korean_pronunciation.sql?raw";
+import radicalsData from "../assets//sources/merged/radicals.sql?raw";
+import hanjaWordIndexData from "../assets//sources/merged/hanja_word_index.sql?raw";
+import wordRankData from "../assets//sources/merged/word_rank.sql?raw";
 import tagsData from "../assets//sources/john/tags.sql?raw";
 import reviewsData from "../assets//sources/john/reviews.sql?raw";
 
-import wiktionaryEnglishHanjaDefinitions from "../assets//sources/wiktionary/english_hanja_definition.sql?raw";
-import wiktionarykoreanHanjaDefinitions from "../assets//sources/wiktionary/korean_hanja_definition.sql?raw";
-import wiktionaryKoreanPronunciation from "../assets//sources/wiktionary/korean_pronunciation.sql?raw";
-import wiktionaryWordList from "../assets//sources/wiktionary/word_list.sql?raw";
-
-import kengdicEnglishHanjaDefinitions from "../assets//sources/kengdic/english_hanja_definition.sql?raw";
-import kengdicKoreanPronunciation from "../assets//sources/kengdic/korean_pronunciation.sql?raw";
-import kengdicWordList from "../assets//sources/kengdic/word_list.sql?raw";
-
 export const loadTable = async (
   schema: any,
   dataSources: Array<any>,
@@ -72,35 +69,39 @@ export const initializeAndSeedDictionary = async () => {
   console.log("Seeding English Hanja definitions.");
   await loadTable(
     englishHanjaDefinitionSchema,
-    [
-      englishHanjaDefinitionData,
-      wiktionaryEnglishHanjaDefinitions,
-      kengdicEnglishHanjaDefinitions,
-    ],
+    [englishHanjaDefinitionData],
     "SELECT * FROM english_hanja_definition LIMIT 1;"
   );
   console.log("Seeding Korean Hanja definitions.");
   await loadTable(
     koreanHanjaDefinitionSchema,
-    [koreanHanjaDefinitionData, wiktionarykoreanHanjaDefinitions],
+    [koreanHanjaDefinitionData],
     "SELECT * FROM korean_hanja_definition LIMIT 1;"
   );
   console.log("Seeding Korean pronunciation.");
   await loadTable(
     koreanPronunciationSchema,
-    [
-      koreanPronunciationData,
-      wiktionaryKoreanPronunciation,
-      kengdicKoreanPronunciation,
-    ],
+    [koreanPronunciationData],
     "SELECT * FROM korean_pronunciation LIMIT 1;"
   );
   console.log("Seeding hanja words.");
   await loadTable(
     wordListScheme,
-    [wordListData, wiktionaryWordList, kengdicWordList],
+    [wordListData],
     "SELECT * FROM word_list LIMIT 1;"
   );
+  console.log("Seeding hanja word index.");
+  await loadTable(
+    hanjaWordIndexSchema,
+    [hanjaWordIndexData],
+    "SELECT * FROM hanja_word_index LIMIT 1;"
+  );
+  console.log("Seeding word ranks.");
+  await loadTable(
+    wordRankSchema,
+    [wordRankData],
+    "SELECT * FROM word_rank LIMIT 1;"
+  );
 
   console.log("Seeding tags.");
   await loadTable(tagsSchema, [tagsData], "SELECT * FROM tags LIMIT 1;");
@@ -322,9 +323,12 @@ export async function getSiblings(
   }
   assertCharacter(hanja);
   const hanjaQuery = `
-  SELECT DISTINCT hanja, hangul
-    FROM word_list
-  WHERE hanja LIKE '%${hanja}%' AND hangul != '${hangulWord}' ORDER BY length(hangul) LIMIT 10;`;
+  SELECT DISTINCT word_hanja, word_hangul, word_rank.rank
+    FROM hanja_word_index
+    LEFT JOIN word_rank
+      ON word_rank.hanja = word_hanja AND word_rank.hangul = word_hangul
+  WHERE hanja_char = '${hanja}' AND word_hangul != '${hangulWord}'
+  ORDER BY word_rank.rank IS NULL, word_rank.rank, length(word_hangul) LIMIT 10;`;
   const hanjaQueryResult = await queryDictionary(hanjaQuery);
   const siblings: Array<Word> = [];
   const siblingResults = hanjaQueryResult.values;
@@ -1,13 +1,34 @@
 #!/usr/bin/env python3
-from http import server
-import ssl
+from http import HTTPStatus, server
+from typing import Optional, Tuple
+import argparse
+import email.utils
 import os
+import re
+import shutil
+import socket
+import ssl
 import subprocess
+import sys
 
 PORT = 3001
 DIRECTORY = "dist"
 
+# Precompressed sidecars (index.js.br, index.js.gz next to index.js) are served
+# instead of the file when the client accepts their encoding, in this order.
+SIDECAR_ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+# vite names the files it emits under assets/ after a hash of their content, so
+# they never change and can be cached forever.
+HASHED_ASSET_PATTERN = re.compile(r"^assets/.+-[\w-]{8}\.\w+$")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+DEFAULT_CACHE_CONTROL = "no-cache"
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
 class MyHTTPRequestHandler(server.SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Idle keep-alive connections and stalled clients give their thread back.
+    timeout = 60
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=DIRECTORY, **kwargs)
 
@@ -19,33 +40,181 @@ class MyHTTPRequestHandler(server.SimpleHTTPRequestHandler):
         self.send_header("Cross-Origin-Embedder-Policy", "require-corp");
         self.send_header("Cross-Origin-Opener-Policy", "same-origin");
 
+    def do_GET(self):
+        f, start, length = self.send_file_head()
+        if f is None:
+            return
+        try:
+            self.copy_range(f, start, length)
+        finally:
+            f.close()
 
-if __name__ == '__main__':
-    this_script_dir = os.path.dirname(os.path.realpath(__file__))
-    cert_dir = os.path.join(this_script_dir, "cert")
-    cert_path = os.path.join(cert_dir, "server.pem")
+    def do_HEAD(self):
+        f, _, _ = self.send_file_head()
+        if f is not None:
+            f.close()
+
+    def accepted_sidecar(self, path: str):
+        accepted = [encoding.split(";")[0].strip() for encoding in self.headers.get("Accept-Encoding", "").split(",")]
+        for encoding, suffix in SIDECAR_ENCODINGS:
+            if encoding in accepted and os.path.isfile(path + suffix):
+                return encoding, path + suffix
+        return None, path
+
+    # Returns the file to send with the offset and length of the bytes to send
+    # from it (-1 for all of it), after sending the headers, or None when there
+    # is no body to send.
+    def send_file_head(self) -> Tuple[Optional[object], int, int]:
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            # Directory listings and redirects are left to http.server; index
+            # files are served like any other file.
+            index_path = os.path.join(path, "index.html")
+            if not self.path.split("?")[0].endswith("/") or not os.path.isfile(index_path):
+                f = self.send_head()
+                if f is None:
+                    return None, 0, 0
+                return f, 0, -1
+            path = index_path
+        if not os.path.isfile(path):
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None, 0, 0
+
+        range_header = self.headers.get("Range")
+        # Ranges are served from the file itself, since offsets into a
+        # compressed representation are of no use to the client.
+        encoding, served_path = self.accepted_sidecar(path) if range_header is None else (None, path)
+        try:
+            f = open(served_path, "rb")
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None, 0, 0
+        stat = os.fstat(f.fileno())
+        size = stat.st_size
+        etag = f'"{stat.st_mtime_ns:x}-{size:x}{"-" + encoding if encoding else ""}"'
+
+        if etag in [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]:
+            f.close()
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_cache_headers(path, etag, encoding)
+            self.end_headers()
+            return None, 0, 0
+
+        start, length = 0, size
+        status = HTTPStatus.OK
+        match = RANGE_PATTERN.match(range_header) if range_header is not None else None
+        # A range is only honored if the file did not change since the client
+        # got its ETag; multiple ranges are not supported, so the whole file is
+        # sent for them.
+        if match is not None and self.headers.get("If-Range", etag) == etag and match.group(1) + match.group(2) != "":
+            if match.group(1) == "":
+                start = max(size - int(match.group(2)), 0)
+                end = size - 1
+            else:
+                start = int(match.group(1))
+                end = min(int(match.group(2)), size - 1) if match.group(2) != "" else size - 1
+            if start >= size or end < start:
+                f.close()
+                self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return None, 0, 0
+            length = end - start + 1
+            status = HTTPStatus.PARTIAL_CONTENT
+
+        self.send_response(status)
+        self.send_header("Content-Type", self.guess_type(path))
+        self.send_header("Content-Length", str(length))
+        self.send_header("Accept-Ranges", "bytes")
+        if status == HTTPStatus.PARTIAL_CONTENT:
+            self.send_header("Content-Range", f"bytes {start}-{start + length - 1}/{size}")
+        self.send_header("Last-Modified", email.utils.formatdate(stat.st_mtime, usegmt=True))
+        self.send_cache_headers(path, etag, encoding)
+        self.end_headers()
+        if self.command == "HEAD":
+            f.close()
+            return None, 0, 0
+        return f, start, length
+
+    def send_cache_headers(self, path: str, etag: str, encoding: Optional[str]):
+        self.send_header("ETag", etag)
+        relative_path = os.path.relpath(path, self.directory).replace(os.sep, "/")
+        if HASHED_ASSET_PATTERN.match(relative_path):
+            self.send_header("Cache-Control", IMMUTABLE_CACHE_CONTROL)
+        else:
+            self.send_header("Cache-Control", DEFAULT_CACHE_CONTROL)
+        if any(os.path.isfile(path + suffix) for _, suffix in SIDECAR_ENCODINGS):
+            self.send_header("Vary", "Accept-Encoding")
+        if encoding is not None:
+            self.send_header("Content-Encoding", encoding)
+
+    # socket.sendfile uses os.sendfile, copying from the page cache to the socket
+    # in the kernel, and falls back to reading and sending for TLS sockets.
+    def copy_range(self, f, start: int, length: int):
+        if length == -1:
+            shutil.copyfileobj(f, self.wfile)
+            return
+        try:
+            self.connection.sendfile(f, start, length)
+        except (BrokenPipeError, ConnectionResetError, socket.timeout):
+            self.close_connection = True
+
+class ThreadingHTTPServer(server.ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    # Clients going away mid-request are not worth a traceback.
+    def handle_error(self, request, client_address):
+        if isinstance(sys.exc_info()[1], (ConnectionError, ssl.SSLError, socket.timeout)):
+            return
+        super().handle_error(request, client_address)
+
+def ensure_certificate(cert_path: str):
     if not os.path.exists(cert_path):
         try:
-            cmd = ["openssl", 
-                        "req", 
-                        "-new", 
-                        "-x509", 
-                        "-keyout", 
-                        cert_path, 
-                        "-out", 
-                        cert_path, 
-                        "-days", 
+            cmd = ["openssl",
+                        "req",
+                        "-new",
+                        "-x509",
+                        "-keyout",
+                        cert_path,
+                        "-out",
+                        cert_path,
+                        "-days",
                         "365",
                         "-nodes",
                         "-subj",
                         "/C=US/ST=California/L=SF/O=Hanja Graph /OU=IT Department/CN=localhost:3001"]
             subprocess.run(
-                    cmd, 
+                    cmd,
                     check=True)
         except:
             raise RuntimeError("Could not generate SSL certificate. Maybe you don't have openssl instaled.")
     else:
         print(f"Using existing certificate at {cert_path}, if you get certificate errors try deleting this certificate before running this server.")
-    httpd = server.HTTPServer(('127.0.0.1', PORT), MyHTTPRequestHandler,)
-    httpd.socket = ssl.wrap_socket (httpd.socket, certfile=cert_path, server_side=True)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+                    prog='test-server',
+                    description='Serves the built app with the headers it needs, precompressed sidecars, caching and range requests.')
+    parser.add_argument('-b', '--bind', default="127.0.0.1", help="The address to listen on.")
+    parser.add_argument('-p', '--port', type=int, default=PORT, help="The port to listen on.")
+    parser.add_argument('-d', '--directory', default=DIRECTORY, help="The directory to serve.")
+    parser.add_argument('--no-tls', action='store_true', help="Serve plain HTTP, for example behind a TLS terminating proxy. Only then are files sent without being copied through Python.")
+    args = parser.parse_args()
+
+    DIRECTORY = args.directory
+    httpd = ThreadingHTTPServer((args.bind, args.port), MyHTTPRequestHandler,)
+    if not args.no_tls:
+        this_script_dir = os.path.dirname(os.path.realpath(__file__))
+        cert_dir = os.path.join(this_script_dir, "cert")
+        cert_path = os.path.join(cert_dir, "server.pem")
+        ensure_certificate(cert_path)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert_path)
+        # The handshake happens on the first read, in the connection's thread,
+        # rather than in accept(), where a slow client would block the others.
+        httpd.socket = context.wrap_socket(httpd.socket, server_side=True, do_handshake_on_connect=False)
+    print(f"Serving {DIRECTORY} on {'http' if args.no_tls else 'https'}://{args.bind}:{args.port}/")
     httpd.serve_forever()
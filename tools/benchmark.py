@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+
+# Benchmarks the dictionary build pipelines on deterministic synthetic data.
+#
+# Generates a kaikki-format Wiktionary dump and a kengdic TSV of each requested
+# size, times every pipeline stage and build_* emitter on them and records the
+# peak RSS, and writes the results as JSON. Given a baseline results file, it
+# fails when a timing or the peak memory regressed by more than the threshold:
+#   ./benchmark.py -s 10000 100000 -o results.json
+#   ./benchmark.py -s 10000 100000 -o new.json -b results.json -t 0.2
+
+# Standard library
+from typing import Callable, Dict, List, Optional
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import sys
+import tempfile
+import time
+
+HANJA = [chr(c) for c in range(0x4E00, 0x4E00 + 2000)]
+HANGUL_SYLLABLES = [chr(c) for c in range(0xAC00, 0xAC00 + 1500)]
+ENGLISH_WORDS = ["dog", "cat", "house", "water", "fire", "tree", "run", "see", "king", "moon", "sun",
+        "mountain", "river", "book", "person", "country", "o'clock", "it's", "big", "small"]
+HANJA_HEAD_TEMPLATES = ["ko-hanja", "ko-hanja/new", "ko-hanja/old"]
+NOUN_HEAD_TEMPLATES = ["ko-noun", "ko-noun", "ko-noun", "ko-proper noun", "ko-num"]
+VERB_HEAD_TEMPLATES = ["ko-verb", "ko-adv", "ko-determ", "ko-adj", "ko-verb-set", "ko-adverb", "ko-det", "ko-adjective"]
+OTHER_HEAD_TEMPLATES = ["ko-pos", "ko-syllable", "ko-root", "ko-interj", "ko-suffix"]
+VERB_SUFFIXES = ["하다", "되다", "보다", "나다", "치다", "막히다", "을 먹다", "히", "로", "다"]
+
+def hanja_word(rng: random.Random, length: int):
+    return "".join(rng.choice(HANJA) for _ in range(length))
+
+def hangul_word(rng: random.Random, length: int):
+    return "".join(rng.choice(HANGUL_SYLLABLES) for _ in range(length))
+
+def english_phrase(rng: random.Random):
+    return " ".join(rng.choice(ENGLISH_WORDS) for _ in range(rng.randint(1, 3)))
+
+def senses(rng: random.Random, n_senses: int):
+    result = []
+    for _ in range(n_senses):
+        links = []
+        for _ in range(rng.randint(0, 4)):
+            kind = rng.random()
+            if kind < 0.5:
+                english = rng.choice(ENGLISH_WORDS)
+                links.append([english, english])
+            elif kind < 0.8:
+                hangul = hangul_word(rng, rng.randint(1, 2))
+                links.append([hangul, hangul + "#Korean"])
+            else:
+                links.append(["Hanja", "hanja#English"])
+        result.append({"links": links, "glosses": [english_phrase(rng)]})
+    return result
+
+# Padding the parsers never read, in the sizes real dump records carry it.
+def unused_fields(rng: random.Random):
+    return {
+            "sounds": [{"ipa": "[" + hangul_word(rng, 2) + "]"} for _ in range(rng.randint(0, 4))],
+            "translations": [{"lang": "English", "word": english_phrase(rng)} for _ in range(rng.randint(0, 8))],
+            "etymology_text": english_phrase(rng) * rng.randint(0, 10),
+            }
+
+def wiktionary_record(rng: random.Random):
+    kind = rng.random()
+    length = rng.randint(1, 3)
+    if kind < 0.15:
+        head_template = {"name": rng.choice(HANJA_HEAD_TEMPLATES), "args": {"1": rng.choice(HANGUL_SYLLABLES), "2": english_phrase(rng)}}
+        record = {"pos": "character", "head_templates": [head_template], "word": rng.choice(HANJA), "senses": senses(rng, rng.randint(1, 3))}
+    elif kind < 0.25:
+        hangul = hangul_word(rng, length)
+        head_template = {"name": "ko-noun", "args": {"hangeul": hangul}}
+        record = {"pos": "noun", "head_templates": [head_template], "forms": [{"form": hangul, "tags": ["hangeul"]}],
+                "word": hanja_word(rng, length), "senses": senses(rng, rng.randint(1, 3))}
+    elif kind < 0.55:
+        forms = [{"form": hangul_word(rng, length) + "-" , "tags": ["romanization"]}]
+        if rng.random() < 0.6:
+            forms.append({"form": hanja_word(rng, length), "tags": ["hanja"]})
+        record = {"pos": "noun", "head_templates": [{"name": rng.choice(NOUN_HEAD_TEMPLATES)}], "forms": forms,
+                "word": hangul_word(rng, length), "senses": senses(rng, rng.randint(1, 3))}
+    elif kind < 0.85:
+        stem_length = rng.randint(1, 2)
+        suffix = rng.choice(VERB_SUFFIXES)
+        forms = []
+        if rng.random() < 0.4:
+            forms.append({"form": hanja_word(rng, stem_length) + suffix, "tags": ["hanja"]})
+        record = {"pos": "verb", "head_templates": [{"name": "head"}, {"name": rng.choice(VERB_HEAD_TEMPLATES)}], "forms": forms,
+                "word": hangul_word(rng, stem_length) + suffix, "senses": senses(rng, rng.randint(1, 2))}
+    elif kind < 0.92:
+        record = {"pos": "particle", "head_templates": [{"name": rng.choice(OTHER_HEAD_TEMPLATES)}],
+                "word": hangul_word(rng, 1), "senses": senses(rng, 1)}
+    else:
+        record = {"pos": "noun", "head_templates": [{"name": "head"}], "word": hangul_word(rng, length), "senses": senses(rng, 1)}
+    record["lang"] = "Korean"
+    record["lang_code"] = "ko"
+    record.update(unused_fields(rng))
+    return record
+
+def generate_wiktionary_dump(file_path: str, n_entries: int, seed: int = 0):
+    rng = random.Random(seed)
+    with open(file_path, "w") as f:
+        for _ in range(n_entries):
+            f.write(json.dumps(wiktionary_record(rng), ensure_ascii=False))
+            f.write("\n")
+
+def generate_kengdic_tsv(file_path: str, n_entries: int, seed: int = 0):
+    rng = random.Random(seed)
+    with open(file_path, "w") as f:
+        f.write("id\tsurface\thanja\tgloss\tlevel\tcreated\tsource\n")
+        for i in range(n_entries):
+            length = rng.randint(1, 3)
+            korean = hangul_word(rng, length)
+            kind = rng.random()
+            if kind < 0.4:
+                hanja = hanja_word(rng, length)
+            elif kind < 0.45:
+                hanja = ",".join(hanja_word(rng, length) for _ in range(2))
+            elif kind < 0.5:
+                hanja = hanja_word(rng, length + 1)
+            else:
+                hanja = ""
+            f.write(f"{i}\t{korean}\t{hanja}\t{english_phrase(rng)}\t\t2010-01-01\tsynthetic\n")
+
+# ru_maxrss is in bytes on macOS, and in kilobytes elsewhere.
+def peak_rss_mb():
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return max_rss / (1024 * 1024)
+    return max_rss / 1024
+
+# Records the duration of a stage, and the process' peak RSS once it is done.
+@contextlib.contextmanager
+def timed(results: Dict[str, Dict[str, float]], stage_name: str):
+    start = time.perf_counter()
+    yield
+    results[stage_name] = {"seconds": time.perf_counter() - start, "peak_rss_mb": peak_rss_mb()}
+
+def benchmark_wiktionary(in_filename: str, out_directory: str):
+    from parse_wiktionary_dump import STAGES, WiktionaryDictionaries, extract_file
+    from parsing_tools import build_hanja_english_definition_file, build_hanja_korean_definition_file, build_korean_pronunciation_file, build_word_list
+    results: Dict[str, Dict[str, float]] = {}
+    with timed(results, "extract"):
+        extractions = extract_file(in_filename)
+    dictionaries = WiktionaryDictionaries()
+    for stage in STAGES:
+        with timed(results, f"apply {stage.name}"):
+            stage.apply(dictionaries, extractions.stages[stage.name])
+    word_lists = [dictionaries.sino_korean_nouns, dictionaries.pure_korean_verbs, dictionaries.pure_korean_nouns]
+    with timed(results, "build_hanja_english_definition_file"):
+        build_hanja_english_definition_file(os.path.join(out_directory, "english_hanja_definition.sql"), dictionaries.hanja_characters)
+    with timed(results, "build_korean_pronunciation_file"):
+        build_korean_pronunciation_file(os.path.join(out_directory, "korean_pronunciation.sql"), dictionaries.hanja_characters)
+    with timed(results, "build_hanja_korean_definition_file"):
+        build_hanja_korean_definition_file(os.path.join(out_directory, "korean_hanja_definition.sql"), dictionaries.hanja_characters)
+    with timed(results, "build_word_list"):
+        build_word_list(os.path.join(out_directory, "word_list.sql"), word_lists)
+    return results
+
+def benchmark_kengdic(in_filename: str, out_directory: str):
+    from parse_kengdic import read_kengdic
+    from parsing_tools import build_hanja_english_definition_file, build_hanja_korean_definition_file, build_korean_pronunciation_file, build_word_list
+    results: Dict[str, Dict[str, float]] = {}
+    with timed(results, "read"):
+        hanja_characters, words = read_kengdic(in_filename)
+    with timed(results, "build_hanja_english_definition_file"):
+        build_hanja_english_definition_file(os.path.join(out_directory, "english_hanja_definition.sql"), hanja_characters)
+    with timed(results, "build_korean_pronunciation_file"):
+        build_korean_pronunciation_file(os.path.join(out_directory, "korean_pronunciation.sql"), hanja_characters)
+    with timed(results, "build_hanja_korean_definition_file"):
+        build_hanja_korean_definition_file(os.path.join(out_directory, "korean_hanja_definition.sql"), hanja_characters)
+    with timed(results, "build_word_list"):
+        build_word_list(os.path.join(out_directory, "word_list.sql"), [words])
+    return results
+
+PIPELINES: Dict[str, Callable[[str, str], Dict[str, Dict[str, float]]]] = {
+        "wiktionary": benchmark_wiktionary,
+        "kengdic": benchmark_kengdic,
+        }
+
+def run_pipeline(pipeline_name: str, in_filename: str, out_directory: str):
+    # The parsers print a lot of warnings; only the timings are of interest here.
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        stages = PIPELINES[pipeline_name](in_filename, out_directory)
+        total_seconds = time.perf_counter() - start
+    return {"seconds": total_seconds, "peak_rss_mb": peak_rss_mb(), "stages": stages}
+
+# Every pipeline runs in a fresh process so that its peak RSS is its own.
+def run_benchmarks(scales: List[int], work_directory: str, seed: int = 0):
+    results: Dict[str, Dict] = {}
+    context = multiprocessing.get_context("spawn")
+    for scale in scales:
+        inputs = {
+                "wiktionary": os.path.join(work_directory, f"wiktionary-{scale}.jsonl"),
+                "kengdic": os.path.join(work_directory, f"kengdic-{scale}.tsv"),
+                }
+        if not os.path.exists(inputs["wiktionary"]):
+            print(f"Generating a synthetic Wiktionary dump of {scale} entries.")
+            generate_wiktionary_dump(inputs["wiktionary"], scale, seed)
+        if not os.path.exists(inputs["kengdic"]):
+            print(f"Generating a synthetic kengdic TSV of {scale} entries.")
+            generate_kengdic_tsv(inputs["kengdic"], scale, seed)
+        for pipeline_name, in_filename in inputs.items():
+            out_directory = os.path.join(work_directory, f"{pipeline_name}-{scale}")
+            os.makedirs(out_directory, exist_ok=True)
+            with context.Pool(1) as pool:
+                result = pool.apply(run_pipeline, (pipeline_name, in_filename, out_directory))
+            result["input_bytes"] = os.path.getsize(in_filename)
+            results[f"{pipeline_name}/{scale}"] = result
+            print(f"{pipeline_name}/{scale}: {result['seconds']:.2f} s, peak RSS {result['peak_rss_mb']:.1f} MB")
+            for stage_name, stage in result["stages"].items():
+                print(f"    {stage_name}: {stage['seconds']:.3f} s")
+    return results
+
+# Timings shorter than min_seconds are too noisy to compare.
+def find_regressions(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float, min_seconds: float = 0.05):
+    regressions = []
+    def compare(name: str, metric: str, value: float, baseline_value: float, minimum: float):
+        if baseline_value >= minimum and value > baseline_value * (1 + threshold):
+            regressions.append(f"{name} {metric}: {baseline_value:.3f} -> {value:.3f}")
+    for run_name, result in results.items():
+        if run_name not in baseline:
+            continue
+        baseline_result = baseline[run_name]
+        compare(run_name, "seconds", result["seconds"], baseline_result["seconds"], min_seconds)
+        compare(run_name, "peak_rss_mb", result["peak_rss_mb"], baseline_result["peak_rss_mb"], 0)
+        for stage_name, stage in result["stages"].items():
+            if stage_name in baseline_result["stages"]:
+                compare(f"{run_name} {stage_name}", "seconds", stage["seconds"], baseline_result["stages"][stage_name]["seconds"], min_seconds)
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+                    prog='benchmark',
+                    description='Benchmarks the dictionary build pipelines on synthetic data.')
+    parser.add_argument('-s', '--scales', type=int, nargs='+', default=[10000], help="Numbers of entries to generate and benchmark, e.g. 10000 100000 1000000.")
+    parser.add_argument('-o', '--output', default="benchmark.json", help="The JSON file to write the results to.")
+    parser.add_argument('-b', '--baseline', default=None, help="A results file to compare against.")
+    parser.add_argument('-t', '--threshold', type=float, default=0.2, help="The relative slowdown or memory growth over the baseline counted as a regression.")
+    parser.add_argument('-w', '--work-directory', default=None, help="Where to keep the generated inputs and outputs. They are reused between runs. Defaults to a temporary directory.")
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the synthetic data generator.")
+    args = parser.parse_args()
+
+    work_directory: Optional[str] = args.work_directory
+    temporary_directory = None
+    if work_directory is None:
+        temporary_directory = tempfile.TemporaryDirectory()
+        work_directory = temporary_directory.name
+    os.makedirs(work_directory, exist_ok=True)
+
+    results = run_benchmarks(args.scales, work_directory, args.seed)
+    with open(args.output, "w") as f:
+        json.dump({"python": platform.python_version(), "machine": platform.machine(), "results": results}, f, indent=2)
+    print(f"Wrote results to {args.output}.")
+    if temporary_directory is not None:
+        temporary_directory.cleanup()
+
+    if args.baseline is not None:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)["results"]
+        regressions = find_regressions(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"Regression: {regression}")
+        if len(regressions) > 0:
+            raise SystemExit(1)
+        print(f"No regressions over {args.baseline} beyond {args.threshold:.0%}.")
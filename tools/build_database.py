@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+
+# Builds a ready-to-load SQLite database image from the schemas and seed SQL
+# files, so that the app can deserialize it in one go (see importDB in
+# src/db/) instead of replaying every seed file on first launch. Like the app,
+# it loads the merged seeds (see merge_sources.py).
+
+# Standard library
+from typing import List, Tuple
+import argparse
+import os
+import sqlite3
+
+this_script_dir = os.path.dirname(os.path.realpath(__file__))
+DEFAULT_ASSETS_DIRECTORY = os.path.normpath(os.path.join(this_script_dir, "..", "src", "assets"))
+
+# Tables with their schema and the seeds of every source, relative to the assets
+# directory. merge_sources.py merges the sources of the dictionary tables, the
+# earlier ones taking precedence, into one seed per table under
+# MERGED_DIRECTORY, and derives hanja_word_index and word_rank, which have no
+# sources, from the merged word_list. The app and build_database load a table
+# from its merged seed when there is one, and from its sources otherwise (tags
+# and reviews, which are not merged).
+SEED_TABLES: List[Tuple[str, str, List[str]]] = [
+        ("radicals", "schemas/radicals.sql", [
+            "sources/bravender/radicals.sql"]),
+        ("english_hanja_definition", "schemas/english_hanja_definition.sql", [
+            "sources/bravender/english_hanja_definition.sql",
+            "sources/wiktionary/english_hanja_definition.sql",
+            "sources/kengdic/english_hanja_definition.sql"]),
+        ("korean_hanja_definition", "schemas/korean_hanja_definition.sql", [
+            "sources/bravender/korean_hanja_definition.sql",
+            "sources/wiktionary/korean_hanja_definition.sql"]),
+        ("korean_pronunciation", "schemas/korean_pronunciation.sql", [
+            "sources/bravender/korean_pronunciation.sql",
+            "sources/wiktionary/korean_pronunciation.sql",
+            "sources/kengdic/korean_pronunciation.sql"]),
+        ("word_list", "schemas/word_list.sql", [
+            "sources/bravender/word_list.sql",
+            "sources/wiktionary/word_list.sql",
+            "sources/kengdic/word_list.sql"]),
+        ("hanja_word_index", "schemas/hanja_word_index.sql", []),
+        ("word_rank", "schemas/word_rank.sql", []),
+        ("tags", "schemas/tags.sql", [
+            "sources/john/tags.sql"]),
+        ("reviews", "schemas/reviews.sql", [
+            "sources/john/reviews.sql"]),
+        ]
+
+MERGED_DIRECTORY = os.path.join("sources", "merged")
+
+DEFAULT_PAGE_SIZE = 4096
+
+# The seeds a table is loaded from, relative to the assets directory: its
+# merged seed when there is one, the seeds of its sources otherwise.
+def table_seed_paths(assets_directory: str, table_name: str, source_paths: List[str]):
+    merged_path = os.path.join(MERGED_DIRECTORY, f"{table_name}.sql").replace(os.sep, "/")
+    if os.path.exists(os.path.join(assets_directory, merged_path)):
+        return [merged_path]
+    return source_paths
+
+# The seeds of every table the app loads.
+def app_seed_paths(assets_directory: str):
+    seed_paths: List[str] = []
+    for table_name, _, source_paths in SEED_TABLES:
+        seed_paths.extend(seed_path for seed_path in table_seed_paths(assets_directory, table_name, source_paths) if os.path.exists(os.path.join(assets_directory, seed_path)))
+    return seed_paths
+
+def table_columns(connection: sqlite3.Connection, table_name: str):
+    return [row[1] for row in connection.execute(f"PRAGMA table_info(`{table_name}`)")]
+
+# The seed files are parsed by SQLite itself, into a table with the same columns
+# but no constraints, so that expressions like datetime('now') are evaluated
+# just as they are when the app replays the file.
+def read_seed_rows(table_name: str, columns: List[str], source_path: str):
+    staging = sqlite3.connect(":memory:")
+    staging.execute(f"CREATE TABLE `{table_name}` ({', '.join(f'`{column}`' for column in columns)})")
+    with open(source_path, "r") as f:
+        staging.executescript(f.read())
+    rows = staging.execute(f"SELECT * FROM `{table_name}`").fetchall()
+    staging.close()
+    return rows
+
+# Rows conflicting with a row already in the table, or breaking one of its CHECK
+# constraints, are skipped, so the first source listed wins.
+def insert_seed_rows(connection: sqlite3.Connection, assets_directory: str, table_name: str, source_paths: List[str]):
+    columns = table_columns(connection, table_name)
+    insert = f"INSERT OR IGNORE INTO `{table_name}` VALUES ({', '.join('?' for _ in columns)})"
+    for source_path in source_paths:
+        source_path = os.path.join(assets_directory, source_path)
+        if not os.path.exists(source_path):
+            print(f"Warning: seed {source_path} does not exist, skipping it.")
+            continue
+        rows = read_seed_rows(table_name, columns, source_path)
+        n_rows_before = connection.total_changes
+        connection.executemany(insert, rows)
+        n_inserted = connection.total_changes - n_rows_before
+        print(f"Loaded {n_inserted} of {len(rows)} rows into {table_name} from {source_path}.")
+
+# Loads a table with the rows of its seeds, for the tools reading them: its
+# schema is created in the connection first.
+def load_seed_table(connection: sqlite3.Connection, assets_directory: str, table_name: str):
+    for seed_table_name, schema_path, source_paths in SEED_TABLES:
+        if seed_table_name == table_name:
+            break
+    else:
+        raise ValueError(f"No seed table {table_name}")
+    with open(os.path.join(assets_directory, schema_path), "r") as f:
+        connection.executescript(f.read())
+    insert_seed_rows(connection, assets_directory, table_name, table_seed_paths(assets_directory, table_name, source_paths))
+
+def build_database(out_filename: str, assets_directory: str = DEFAULT_ASSETS_DIRECTORY, page_size: int = DEFAULT_PAGE_SIZE):
+    connection = sqlite3.connect(":memory:", isolation_level=None)
+    # Has to be set before anything is written to take effect.
+    connection.execute(f"PRAGMA page_size = {page_size}")
+    for table_name, schema_path, _ in SEED_TABLES:
+        with open(os.path.join(assets_directory, schema_path), "r") as f:
+            connection.executescript(f.read())
+
+    connection.execute("BEGIN")
+    for table_name, _, source_paths in SEED_TABLES:
+        insert_seed_rows(connection, assets_directory, table_name, table_seed_paths(assets_directory, table_name, source_paths))
+    connection.execute("COMMIT")
+
+    if os.path.exists(out_filename):
+        os.remove(out_filename)
+    connection.execute("VACUUM INTO ?", (out_filename,))
+    connection.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+                    prog='build_database',
+                    description='Builds a SQLite database image from the schemas and the seed SQL files the app loads.')
+    parser.add_argument('out_filename', help="The SQLite database file to write, for example dist/seed.sqlite.")
+    parser.add_argument('-a', '--assets-directory', default=DEFAULT_ASSETS_DIRECTORY, help="The directory containing the schemas/ and sources/ directories.")
+    parser.add_argument('-p', '--page-size', type=int, default=DEFAULT_PAGE_SIZE, help="The page size of the database, a power of two between 512 and 65536.")
+    args = parser.parse_args()
+
+    out_filename: str = args.out_filename
+    print(f"Building {out_filename} from {args.assets_directory}.")
+    build_database(out_filename, args.assets_directory, args.page_size)
+    print(f"Wrote {os.path.getsize(out_filename)} bytes to {out_filename}.")
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+
+# Fast character classification for the parsers. The patterns are compiled
+# once, instead of being looked up in the regex cache on every call, and the
+# input is not copied to strip spaces first, since a space is not Hangul.
+# Single characters, such as the syllables of a hanja pronunciation, are asked
+# about over and over again, so their answers are memoized.
+
+# Standard library
+import functools
+
+# pip
+import regex
+
+HANGUL_PATTERN = regex.compile(r'\p{IsHangul}')
+
+@functools.lru_cache(maxsize=1 << 16)
+def is_hangul_character(character: str):
+    return HANGUL_PATTERN.search(character) is not None
+
+# True if the value contains at least one Hangul character.
+def is_hangul(value: str):
+    if len(value) == 1:
+        return is_hangul_character(value)
+    return HANGUL_PATTERN.search(value) is not None
+
+# True if the value, ignoring spaces, is only made of ASCII letters.
+def is_ascii_alpha(value: str):
+    if " " in value:
+        value = value.replace(" ", "")
+    return value.isascii() and value.isalpha()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+# Decoders turning one raw (bytes) line of a kaikki JSONL dump into a record
+# dict. The fastest installed decoder is used by default, falling back to the
+# standard library.
+#
+# Run as a script to compare the decoders on a dump:
+#   ./dump_decoders.py kaikki.org-dictionary-Korean.json
+
+# Standard library
+from typing import Callable, Dict, List, Optional, TypedDict
+import argparse
+import json
+import time
+
+# pip, optional
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Every head template used by the parsers starts with "ko-", so a line without
+# this byte string cannot contribute anything and does not need to be decoded.
+KOREAN_HEAD_TEMPLATE_MARKER = b'"ko-'
+
+# Only the fields the parsers read. msgspec skips everything else (translations,
+# sounds, etymology, ...) without building Python objects for it.
+class HeadTemplate(TypedDict, total=False):
+    name: str
+    args: Dict[str, str]
+
+class Form(TypedDict, total=False):
+    form: str
+    tags: List[str]
+
+class Sense(TypedDict, total=False):
+    links: List[List[str]]
+    glosses: List[str]
+
+class WordRecord(TypedDict, total=False):
+    word: str
+    pos: str
+    head_templates: List[HeadTemplate]
+    forms: List[Form]
+    senses: List[Sense]
+
+def make_json_decoder():
+    return json.loads
+
+def make_orjson_decoder():
+    return orjson.loads
+
+# A record with a field of another type than declared (a gloss that is not a
+# string, say) fails msgspec's validation; it is decoded by the generic decoder
+# instead, so that one odd line does not abort the run.
+def make_msgspec_decoder():
+    decode = msgspec.json.Decoder(WordRecord).decode
+    fallback = orjson.loads if orjson is not None else json.loads
+    def decode_or_fall_back(line: bytes):
+        try:
+            return decode(line)
+        except msgspec.ValidationError:
+            return fallback(line)
+    return decode_or_fall_back
+
+DECODERS: Dict[str, Callable[[], Callable[[bytes], Dict]]] = {
+        "json": make_json_decoder,
+        }
+if orjson is not None:
+    DECODERS["orjson"] = make_orjson_decoder
+if msgspec is not None:
+    DECODERS["msgspec"] = make_msgspec_decoder
+
+def default_decoder_name():
+    for name in ("msgspec", "orjson"):
+        if name in DECODERS:
+            return name
+    return "json"
+
+def make_decoder(name: Optional[str] = None):
+    if name is None:
+        name = default_decoder_name()
+    if name not in DECODERS:
+        raise ValueError(f"Decoder {name} is not available, choose from {', '.join(DECODERS)}")
+    return DECODERS[name]()
+
+# Lines failing the pre-filter are decoded as empty records rather than dropped,
+# so they are still counted.
+def decode_lines(lines, decoder_name: Optional[str] = None, prefilter: bool = True):
+    decode = make_decoder(decoder_name)
+    for line in lines:
+        if prefilter and KOREAN_HEAD_TEMPLATE_MARKER not in line:
+            yield {}
+            continue
+        yield decode(line)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+                    prog='dump_decoders',
+                    description='Compares the speed of the available decoders on a Wiktionary data dump.')
+    parser.add_argument('in_filename', help="A file containing a Wiktionary data dump.")
+    args = parser.parse_args()
+
+    with open(args.in_filename, "rb") as f:
+        lines = f.readlines()
+    print(f"Decoding {len(lines)} records.")
+    baseline: Optional[float] = None
+    for decoder_name in DECODERS:
+        for prefilter in (False, True):
+            start = time.perf_counter()
+            for _ in decode_lines(lines, decoder_name, prefilter):
+                pass
+            elapsed = time.perf_counter() - start
+            if baseline is None:
+                baseline = elapsed
+            print(f"{decoder_name:8} prefilter={str(prefilter):5} {elapsed * 1e6 / len(lines):8.2f} us/record, {baseline / elapsed:5.2f}x")
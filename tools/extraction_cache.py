@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+# What parse_wiktionary_dump.py extracts from a dump, and the pickles it keeps
+# of it between runs: the cache of a whole dump's extractions and the manifest
+# of incremental rebuilds. The types live here rather than in the script, so
+# that their pickles refer to this module and not to __main__, and can be read
+# by any code importing it.
+
+# Standard library
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
+import hashlib
+import os
+import pickle
+
+@dataclass
+class Extractions:
+    n_words: int
+    head_template_names: Dict[str, int]
+    stages: Dict[str, List[Tuple]]
+
+# An entry of a dump in an incremental manifest, keyed by the hash of its line:
+# its word and part of speech, and what the stages extracted from it.
+@dataclass
+class ManifestEntry:
+    key: Tuple[str, str]
+    extracted: Dict[str, List[Tuple]]
+
+@dataclass
+class Manifest:
+    parser_version: int
+    entries: Dict[bytes, ManifestEntry]
+    # The digest of the dump the manifest was built from; None in manifests
+    # written before it was recorded.
+    input_digest: Optional[bytes] = None
+
+@dataclass
+class ExtractionCache:
+    parser_version: int
+    input_digest: bytes
+    extractions: Extractions
+
+def file_digest(file_name: str):
+    content_hash = hashlib.blake2b(digest_size=16)
+    with open(file_name, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            content_hash.update(block)
+    return content_hash.digest()
+
+# Returns None when there is no pickle at the path, or one that cannot be read
+# back, such as those written when these types lived in the script.
+def load_pickle(path: str):
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except (pickle.UnpicklingError, AttributeError, EOFError, ImportError) as e:
+        print(f"Discarding {path}, which cannot be read back: {e}")
+        return None
+
+def save_pickle(path: str, value: object):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as f:
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary_path, path)
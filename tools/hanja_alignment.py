@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+# Aligns the hanja of a word with its hangul, character for character, so that
+# the hanja of multi-word entries gets the spaces of the hangul:
+#   歸還不能地點 / 귀환 불능 지점 -> 歸還 不能 地點
+# The aligned hanja is always as long as the hangul: hanja characters past the
+# end of the hangul are dropped, and missing ones are spaces.
+#
+# Most hangul has no space, so the hanja is returned as is (or cut or padded)
+# without looking at its characters. Otherwise the hanja is cut into slices as
+# long as the words of the hangul, which are joined with spaces.
+#
+# Run as a script to time it over every word of the word_list seeds:
+#   ./hanja_alignment.py
+
+# Standard library
+from typing import Dict, Iterable, List, Optional, Tuple
+import argparse
+import sqlite3
+import time
+
+def word_lengths(hangul: str):
+    return [len(word) for word in hangul.split(' ')]
+
+def align_with_lengths(hanja: str, lengths: List[int]):
+    slices = []
+    start = 0
+    for length in lengths:
+        slices.append(hanja[start:start + length].ljust(length))
+        start += length
+    return ' '.join(slices)
+
+def align_hanja(hanja: Optional[str], hangul: str):
+    if hanja is None:
+        return None
+    if ' ' not in hangul:
+        if len(hanja) == len(hangul):
+            return hanja
+        return hanja[:len(hangul)].ljust(len(hangul))
+    return align_with_lengths(hanja, word_lengths(hangul))
+
+# Aligns many pairs at once. Pairs that are already aligned, the most common
+# case, are returned without a function call, and every distinct hangul with
+# spaces is split once.
+def align_hanja_batch(pairs: Iterable[Tuple[Optional[str], str]]):
+    lengths_by_hangul: Dict[str, List[int]] = {}
+    def align(hanja: str, hangul: str):
+        if ' ' not in hangul:
+            return hanja[:len(hangul)].ljust(len(hangul))
+        lengths = lengths_by_hangul.get(hangul)
+        if lengths is None:
+            lengths = word_lengths(hangul)
+            lengths_by_hangul[hangul] = lengths
+        return align_with_lengths(hanja, lengths)
+    return [hanja if hanja is None or (len(hanja) == len(hangul) and ' ' not in hangul) else align(hanja, hangul) for hanja, hangul in pairs]
+
+# The hanja characters of an aligned hanja with their positions, which are also
+# the positions of the hangul syllables they are read as.
+def hanja_character_positions(aligned_hanja: str):
+    return [(position, character) for position, character in enumerate(aligned_hanja) if character != ' ']
+
+if __name__ == "__main__":
+    from build_database import DEFAULT_ASSETS_DIRECTORY, load_seed_table
+
+    parser = argparse.ArgumentParser(
+                    prog='hanja_alignment',
+                    description='Times the hanja alignment over the word_list seeds.')
+    parser.add_argument('-a', '--assets-directory', default=DEFAULT_ASSETS_DIRECTORY, help="The directory containing the sources/ directory.")
+    parser.add_argument('-r', '--repeat', type=int, default=5, help="The number of times to align every pair; the best time is kept.")
+    args = parser.parse_args()
+
+    connection = sqlite3.connect(":memory:")
+    load_seed_table(connection, args.assets_directory, "word_list")
+    # The seeds hold aligned hanja; removing the spaces gives back what the
+    # dumps have.
+    pairs: List[Tuple[Optional[str], str]] = [(None if hanja is None else hanja.replace(' ', ''), hangul) for hanja, hangul in connection.execute("SELECT hanja, hangul FROM word_list")]
+    n_with_spaces = sum(1 for _, hangul in pairs if ' ' in hangul)
+    print(f"Aligning {len(pairs)} pairs, {n_with_spaces} of them with spaces.")
+
+    candidates = {
+            "align_hanja": lambda: [align_hanja(hanja, hangul) for hanja, hangul in pairs],
+            "align_hanja_batch": lambda: align_hanja_batch(pairs),
+            }
+    baseline: Optional[float] = None
+    for name, candidate in candidates.items():
+        elapsed = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            candidate()
+            elapsed = min(elapsed, time.perf_counter() - start)
+        if baseline is None:
+            baseline = elapsed
+        print(f"{name:18} {elapsed * 1e9 / len(pairs):8.1f} ns/pair, {baseline / elapsed:5.2f}x")
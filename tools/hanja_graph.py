@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+
+# Builds the bipartite graph of hanja characters and the words they appear in
+# from the merged hanja_word_index seed (see merge_sources.py), and writes it as
+# a memory-mappable binary file in CSR form, so that the neighbors of a
+# character or a word are a slice of an int32 array rather than a LIKE '%x%'
+# scan or a parse of the seeds.
+#
+# Layout of the file, all integers int32 little-endian:
+# * a header: the magic b"HJGR", the format version, the number of characters,
+#   the number of words and the number of edges;
+# * character_offsets[n_characters + 1] and character_neighbors[n_edges]: the
+#   word ids of character i are character_neighbors[character_offsets[i]:
+#   character_offsets[i + 1]], in increasing order;
+# * word_offsets[n_words + 1] and word_neighbors[n_edges]: the same for the
+#   character ids of every word;
+# * string_offsets[n_characters + 2 * n_words + 1] and the UTF-8 string bytes:
+#   string i is string_bytes[string_offsets[i]:string_offsets[i + 1]]. The
+#   characters come first, then the hanja of every word, then its hangul.
+# Characters are sorted by code point and words by (hanja, hangul), so both can
+# be looked up by binary search without building a dictionary.
+#
+# Build the graph of the current seeds and print its reports:
+#   ./hanja_graph.py /tmp/hanja_graph.bin
+
+# Standard library
+from typing import Dict, Iterable, List, Set, Tuple
+import argparse
+import array
+import mmap
+import os
+import struct
+import sys
+
+from parsing_tools import SqlValue, read_sql_rows
+from build_database import DEFAULT_ASSETS_DIRECTORY, MERGED_DIRECTORY
+
+GRAPH_MAGIC = b"HJGR"
+GRAPH_VERSION = 1
+GRAPH_HEADER = struct.Struct("<4s4i")
+
+def int32_array(values: Iterable[int]):
+    values = array.array("i", values)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+# Every hanja_word_index row is an edge; a character appearing several times in
+# a word is a single edge.
+def graph_arrays(hanja_word_index: Iterable[Tuple[SqlValue, ...]]):
+    edges: Set[Tuple[str, Tuple[str, str]]] = set()
+    for hanja_char, word_hanja, word_hangul, _ in hanja_word_index:
+        edges.add((hanja_char, (word_hanja, word_hangul)))
+    characters = sorted({character for character, _ in edges})
+    words = sorted({word for _, word in edges})
+    character_ids = {character: i for i, character in enumerate(characters)}
+    word_ids = {word: i for i, word in enumerate(words)}
+    id_edges = sorted((character_ids[character], word_ids[word]) for character, word in edges)
+
+    character_offsets = [0] * (len(characters) + 1)
+    word_offsets = [0] * (len(words) + 1)
+    for character_id, word_id in id_edges:
+        character_offsets[character_id + 1] += 1
+        word_offsets[word_id + 1] += 1
+    for i in range(len(characters)):
+        character_offsets[i + 1] += character_offsets[i]
+    for i in range(len(words)):
+        word_offsets[i + 1] += word_offsets[i]
+
+    # id_edges is sorted by character then word, so the words of every character
+    # come out in order; filling the words' slots in the same pass does the same
+    # for the characters of every word.
+    character_neighbors = [word_id for _, word_id in id_edges]
+    word_neighbors = [0] * len(id_edges)
+    next_slot = word_offsets[:-1]
+    for character_id, word_id in id_edges:
+        word_neighbors[next_slot[word_id]] = character_id
+        next_slot[word_id] += 1
+    strings = characters + [hanja for hanja, _ in words] + [hangul for _, hangul in words]
+    return strings, character_offsets, character_neighbors, word_offsets, word_neighbors
+
+def write_graph(file_path: str, hanja_word_index: Iterable[Tuple[SqlValue, ...]]):
+    strings, character_offsets, character_neighbors, word_offsets, word_neighbors = graph_arrays(hanja_word_index)
+    encoded_strings = [string.encode() for string in strings]
+    string_offsets = [0]
+    for encoded_string in encoded_strings:
+        string_offsets.append(string_offsets[-1] + len(encoded_string))
+    n_characters = len(character_offsets) - 1
+    n_words = len(word_offsets) - 1
+    with open(file_path, "wb") as f:
+        f.write(GRAPH_HEADER.pack(GRAPH_MAGIC, GRAPH_VERSION, n_characters, n_words, len(character_neighbors)))
+        for values in (character_offsets, character_neighbors, word_offsets, word_neighbors, string_offsets):
+            int32_array(values).tofile(f)
+        f.write(b"".join(encoded_strings))
+
+class HanjaGraph:
+    def __init__(self, file_path: str):
+        with open(file_path, "rb") as f:
+            self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.n_characters, self.n_words, self.n_edges = GRAPH_HEADER.unpack_from(self.mmap)
+        if magic != GRAPH_MAGIC or version != GRAPH_VERSION:
+            raise ValueError(f"{file_path} is not a version {GRAPH_VERSION} hanja graph")
+        view = memoryview(self.mmap)
+        offset = GRAPH_HEADER.size
+        sections = []
+        for length in (self.n_characters + 1, self.n_edges, self.n_words + 1, self.n_edges, self.n_characters + 2 * self.n_words + 1):
+            section = view[offset:offset + 4 * length]
+            if sys.byteorder == "little":
+                sections.append(section.cast("i"))
+            else:
+                # Big-endian machines pay for a swapped copy.
+                swapped = array.array("i", section)
+                swapped.byteswap()
+                sections.append(swapped)
+            offset += 4 * length
+        self.character_offsets, self.character_neighbors, self.word_offsets, self.word_neighbors, self.string_offsets = sections
+        self.string_bytes = view[offset:]
+
+    def string(self, i: int):
+        return bytes(self.string_bytes[self.string_offsets[i]:self.string_offsets[i + 1]]).decode()
+
+    def character(self, character_id: int):
+        return self.string(character_id)
+
+    def word(self, word_id: int):
+        return (self.string(self.n_characters + word_id), self.string(self.n_characters + self.n_words + word_id))
+
+    def character_id(self, character: str):
+        lo, hi = 0, self.n_characters
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.character(mid) < character:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.n_characters and self.character(lo) == character:
+            return lo
+        return None
+
+    def word_id(self, hanja: str, hangul: str):
+        lo, hi = 0, self.n_words
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.word(mid) < (hanja, hangul):
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.n_words and self.word(lo) == (hanja, hangul):
+            return lo
+        return None
+
+    def character_degree(self, character_id: int):
+        return self.character_offsets[character_id + 1] - self.character_offsets[character_id]
+
+    def word_degree(self, word_id: int):
+        return self.word_offsets[word_id + 1] - self.word_offsets[word_id]
+
+    def character_words(self, character_id: int):
+        return self.character_neighbors[self.character_offsets[character_id]:self.character_offsets[character_id + 1]]
+
+    def word_characters(self, word_id: int):
+        return self.word_neighbors[self.word_offsets[word_id]:self.word_offsets[word_id + 1]]
+
+    # The words sharing a character with the word, without the word itself.
+    def sibling_words(self, word_id: int):
+        siblings: Set[int] = set()
+        for character_id in self.word_characters(word_id):
+            siblings.update(self.character_words(character_id))
+        siblings.discard(word_id)
+        return sorted(siblings)
+
+    def close(self):
+        for section in (self.character_offsets, self.character_neighbors, self.word_offsets, self.word_neighbors, self.string_offsets, self.string_bytes):
+            if isinstance(section, memoryview):
+                section.release()
+        self.mmap.close()
+
+# Connected components over characters, found with an iterative traversal of
+# both sides of the graph. Returns the component of every character and the
+# number of characters and words in every component.
+def connected_components(graph: HanjaGraph):
+    character_components = [-1] * graph.n_characters
+    word_seen = bytearray(graph.n_words)
+    component_sizes: List[Tuple[int, int]] = []
+    for start in range(graph.n_characters):
+        if character_components[start] != -1:
+            continue
+        component = len(component_sizes)
+        character_components[start] = component
+        n_characters, n_words = 1, 0
+        stack = [start]
+        while stack:
+            character_id = stack.pop()
+            for word_id in graph.character_words(character_id):
+                if word_seen[word_id]:
+                    continue
+                word_seen[word_id] = 1
+                n_words += 1
+                for neighbor_id in graph.word_characters(word_id):
+                    if character_components[neighbor_id] == -1:
+                        character_components[neighbor_id] = component
+                        n_characters += 1
+                        stack.append(neighbor_id)
+        component_sizes.append((n_characters, n_words))
+    return character_components, component_sizes
+
+def print_reports(graph: HanjaGraph, top: int = 10):
+    print(f"{graph.n_characters} characters, {graph.n_words} words, {graph.n_edges} edges.")
+    degrees = sorted(range(graph.n_characters), key=lambda i: (-graph.character_degree(i), i))
+    print(f"Characters in the most words: {', '.join(f'{graph.character(i)} ({graph.character_degree(i)})' for i in degrees[:top])}")
+    n_single_word = sum(1 for i in range(graph.n_characters) if graph.character_degree(i) == 1)
+    print(f"{n_single_word} characters appear in a single word.")
+    word_degrees: Dict[int, int] = {}
+    for i in range(graph.n_words):
+        degree = graph.word_degree(i)
+        word_degrees[degree] = word_degrees.get(degree, 0) + 1
+    print(f"Words by number of distinct characters: {', '.join(f'{degree}: {count}' for degree, count in sorted(word_degrees.items()))}")
+    _, component_sizes = connected_components(graph)
+    largest = sorted(component_sizes, reverse=True)
+    print(f"{len(component_sizes)} connected components, the largest ones with (characters, words): {', '.join(str(size) for size in largest[:top])}")
+    n_isolated = sum(1 for n_characters, _ in component_sizes if n_characters == 1)
+    print(f"{n_isolated} components have a single character.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+                    prog='hanja_graph',
+                    description='Builds the binary graph of hanja characters and words from the merged seeds, and reports on it.')
+    parser.add_argument('out_filename', help="The graph file to write.")
+    parser.add_argument('-a', '--assets-directory', default=DEFAULT_ASSETS_DIRECTORY, help="The directory containing the sources/ directory.")
+    parser.add_argument('-n', '--no-report', action='store_true', help="Skip the degree and connected component reports.")
+    args = parser.parse_args()
+
+    out_filename: str = args.out_filename
+    hanja_word_index_path = os.path.join(args.assets_directory, MERGED_DIRECTORY, "hanja_word_index.sql")
+    print(f"Writing the graph of {hanja_word_index_path} to {out_filename}.")
+    write_graph(out_filename, read_sql_rows(hanja_word_index_path))
+    print(f"Wrote {os.path.getsize(out_filename)} bytes to {out_filename}.")
+    if not args.no_report:
+        graph = HanjaGraph(out_filename)
+        print_reports(graph)
+        graph.close()
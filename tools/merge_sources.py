@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+# Merges the seeds of every source (bravender, wiktionary, kengdic) into one
+# sorted seed per table under sources/merged/, which is what the app loads, so
+# that rows duplicated across sources are no longer shipped, parsed and
+# rejected on every device.
+#
+# The seeds are parsed by SQLite (see read_seed_rows) and checked source by
+# source, in the order of SEED_TABLES, against the constraints of the real
+# schemas (see row_validation.py), before being inserted into tables with these
+# schemas. When two rows conflict on a table's primary key or UNIQUE
+# constraint, the one from the earlier source wins, as it did when the app
+# replayed every source with ON CONFLICT DO NOTHING. Every rejected row is
+# reported, and with --strict, rows breaking a NOT NULL or CHECK constraint
+# fail the merge before anything is written. The hanja_word_index is rebuilt from the merged
+# word_list rather than merged, so that it indexes exactly the merged words,
+# and the words are ranked (see parsing_tools.rank_words) into word_rank. The
+# merged word_list is sorted by rank.
+
+# Standard library
+from typing import Dict, List, Optional, Set, Tuple
+import argparse
+import os
+import sqlite3
+
+from parsing_tools import hanja_word_index_rows, rank_words, read_sql_rows, word_rank_rows, write_sql_file, positive_int
+from build_database import DEFAULT_ASSETS_DIRECTORY, MERGED_DIRECTORY, SEED_TABLES, read_seed_rows, table_columns
+from row_validation import ValidationReport, load_table_constraints, validate_rows
+
+# tags and reviews are user data, and their datetime('now') has to be evaluated
+# on the device, so they are left alone.
+MERGED_TABLES = ["radicals", "english_hanja_definition", "korean_hanja_definition", "korean_pronunciation", "word_list"]
+
+# The number of distinct definitions every word has across all sources, and the
+# number of sources it is in.
+def source_word_signals(assets_directory: str, source_paths: List[str]):
+    definitions_by_word: Dict[Tuple[Optional[str], str], Set[str]] = {}
+    sources_by_word: Dict[Tuple[Optional[str], str], Set[str]] = {}
+    for source_path in source_paths:
+        source_path = os.path.join(assets_directory, source_path)
+        if not os.path.exists(source_path):
+            continue
+        for hanja, hangul, english, _ in read_sql_rows(source_path):
+            key = (hanja, hangul)
+            if key not in definitions_by_word:
+                definitions_by_word[key] = set()
+                sources_by_word[key] = set()
+            definitions_by_word[key].add(english)
+            sources_by_word[key].add(source_path)
+    return {key: len(definitions) for key, definitions in definitions_by_word.items()}, {key: len(sources) for key, sources in sources_by_word.items()}
+
+# Loads the rows of every source that pass validation into the table, which
+# has to exist.
+def load_validated_rows(connection: sqlite3.Connection, assets_directory: str, table_name: str, schema_path: str, source_paths: List[str], report: ValidationReport, jobs: int = 1):
+    constraints = load_table_constraints(os.path.join(assets_directory, schema_path), table_name)
+    columns = [name for name, _ in constraints.columns]
+    sources = []
+    for source_path in source_paths:
+        full_source_path = os.path.join(assets_directory, source_path)
+        if not os.path.exists(full_source_path):
+            print(f"Warning: seed {full_source_path} does not exist, skipping it.")
+            continue
+        sources.append((source_path, read_seed_rows(table_name, columns, full_source_path)))
+    accepted, rejections = validate_rows(constraints, sources, jobs)
+    report.add(constraints, sum(len(rows) for _, rows in sources), rejections)
+    # Without OR IGNORE, so that a row the validation missed fails loudly.
+    insert = f"INSERT INTO `{table_name}` VALUES ({', '.join('?' for _ in columns)})"
+    for (source_path, rows), (_, accepted_rows) in zip(sources, accepted):
+        connection.executemany(insert, accepted_rows)
+        print(f"Loaded {len(accepted_rows)} of {len(rows)} rows into {table_name} from {source_path}.")
+
+def merge_sources(assets_directory: str = DEFAULT_ASSETS_DIRECTORY, out_directory: Optional[str] = None, rows_per_statement: Optional[int] = None, jobs: int = 1, report_path: Optional[str] = None, strict: bool = False):
+    if out_directory is None:
+        out_directory = os.path.join(assets_directory, MERGED_DIRECTORY)
+    connection = sqlite3.connect(":memory:", isolation_level=None)
+    report = ValidationReport()
+    for table_name, schema_path, source_paths in SEED_TABLES:
+        if table_name not in MERGED_TABLES:
+            continue
+        with open(os.path.join(assets_directory, schema_path), "r") as f:
+            connection.executescript(f.read())
+        load_validated_rows(connection, assets_directory, table_name, schema_path, source_paths, report, jobs)
+        if table_name == "word_list":
+            n_definitions_by_word, n_sources_by_word = source_word_signals(assets_directory, source_paths)
+    report.print()
+    if report_path is not None:
+        print(f"Writing the {len(report.rejections)} rejected rows to {report_path}.")
+        report.write_json(report_path)
+    if strict and report.invalid():
+        raise SystemExit(f"{len(report.invalid())} rows break a NOT NULL or CHECK constraint, not writing the merged seeds.")
+
+    os.makedirs(out_directory, exist_ok=True)
+    for table_name in MERGED_TABLES:
+        if table_name == "word_list":
+            continue
+        columns = table_columns(connection, table_name)
+        rows = connection.execute(f"SELECT * FROM `{table_name}` ORDER BY {', '.join(f'`{column}`' for column in columns)}")
+        out_path = os.path.join(out_directory, f"{table_name}.sql")
+        print(f"Writing the merged {table_name} to {out_path}.")
+        write_sql_file(out_path, table_name, rows, rows_per_statement)
+
+    # Words whose rows all broke a constraint are not ranked.
+    merged_words = set(connection.execute("SELECT hanja, hangul FROM word_list"))
+    ranks = rank_words({key: n_definitions for key, n_definitions in n_definitions_by_word.items() if key in merged_words}, n_sources_by_word)
+    out_path = os.path.join(out_directory, "word_rank.sql")
+    print(f"Writing the ranks of the merged words to {out_path}.")
+    write_sql_file(out_path, "word_rank", word_rank_rows(ranks), rows_per_statement)
+
+    connection.execute("CREATE TEMPORARY TABLE word_order (hanja text, hangul text, rank integer)")
+    connection.executemany("INSERT INTO word_order VALUES (?, ?, ?)", ((rank.hanja, rank.hangul, i) for i, rank in enumerate(ranks)))
+    rows = connection.execute("SELECT word_list.* FROM word_list JOIN word_order ON word_order.hanja IS word_list.hanja AND word_order.hangul = word_list.hangul ORDER BY word_order.rank, word_list.english")
+    out_path = os.path.join(out_directory, "word_list.sql")
+    print(f"Writing the merged word_list, sorted by rank, to {out_path}.")
+    write_sql_file(out_path, "word_list", rows, rows_per_statement)
+
+    word_pairs = connection.execute("SELECT DISTINCT hanja, hangul FROM word_list WHERE hanja IS NOT NULL ORDER BY hanja, hangul")
+    out_path = os.path.join(out_directory, "hanja_word_index.sql")
+    print(f"Writing the hanja to word index of the merged word_list to {out_path}.")
+    write_sql_file(out_path, "hanja_word_index", hanja_word_index_rows(word_pairs), rows_per_statement)
+    connection.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+                    prog='merge_sources',
+                    description='Merges the seed SQL files of every source into one deduplicated, sorted seed per table.')
+    parser.add_argument('-a', '--assets-directory', default=DEFAULT_ASSETS_DIRECTORY, help="The directory containing the schemas/ and sources/ directories.")
+    parser.add_argument('-o', '--out-directory', default=None, help=f"The directory to write the merged seeds to. Defaults to {MERGED_DIRECTORY} in the assets directory.")
+    parser.add_argument('-r', '--rows-per-statement', type=positive_int, default=None, help="Split each SQL file into INSERT statements of at most this many rows. By default each file is one statement.")
+    parser.add_argument('-j', '--jobs', type=int, default=1, help="The number of processes validating batches of rows.")
+    parser.add_argument('--report', default=None, help="Write every row rejected by the validation to this JSON file.")
+    parser.add_argument('--strict', action='store_true', help="Fail without writing anything if a row breaks a NOT NULL or CHECK constraint. Rows superseded by an earlier source are not counted.")
+    args = parser.parse_args()
+
+    merge_sources(args.assets_directory, args.out_directory, args.rows_per_statement, args.jobs, args.report, args.strict)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+# Copies the seeds the app loads and the database image (see build_database.py)
+# into a directory of the build under names containing a hash of their
+# content, next to gzip and Brotli variants at maximum compression, and writes
+# a manifest mapping their logical names to the hashed files. A hashed file
+# never changes, so it can be cached forever, and a client comparing manifests
+# only downloads the assets that did. test-server.py serves the .br and .gz
+# variants and caches the hashed files (under assets/) as immutable.
+#
+# Brotli variants are only written if the brotli module is installed.
+#
+# Package the assets into the build:
+#   npm run build && ./tools/package_assets.py
+
+# Standard library
+from typing import Dict, Optional
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+
+# pip, optional
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from build_database import DEFAULT_ASSETS_DIRECTORY, app_seed_paths, build_database
+
+this_script_dir = os.path.dirname(os.path.realpath(__file__))
+DEFAULT_OUT_DIRECTORY = os.path.normpath(os.path.join(this_script_dir, "..", "dist", "assets", "seeds"))
+MANIFEST_FILE_NAME = "manifest.json"
+DATABASE_NAME = "seed.sqlite"
+# Like the hashes vite puts in the names of the files it emits.
+HASH_LENGTH = 8
+
+def hashed_file_name(logical_name: str, content: bytes):
+    root, extension = os.path.splitext(os.path.basename(logical_name))
+    return f"{root}-{hashlib.sha256(content).hexdigest()[:HASH_LENGTH]}{extension}"
+
+# The suffix of every compressed variant, with the Content-Encoding it is
+# served with.
+VARIANT_ENCODINGS = [(".gz", "gzip"), (".br", "br")]
+
+# gzip's header is given a fixed mtime so that the same content always gives the
+# same bytes.
+def compress(content: bytes, suffix: str):
+    if suffix == ".gz":
+        return gzip.compress(content, compresslevel=9, mtime=0)
+    return brotli.compress(content, quality=11)
+
+# Existing files are left alone, since their name says what they hold.
+def write_hashed_asset(out_directory: str, logical_name: str, content: bytes):
+    file_name = hashed_file_name(logical_name, content)
+    entry = {"file": file_name, "bytes": len(content), "sha256": hashlib.sha256(content).hexdigest()}
+    file_path = os.path.join(out_directory, file_name)
+    if not os.path.exists(file_path):
+        with open(file_path, "wb") as f:
+            f.write(content)
+    for suffix, encoding in VARIANT_ENCODINGS:
+        if suffix == ".br" and brotli is None:
+            continue
+        if not os.path.exists(file_path + suffix):
+            with open(file_path + suffix, "wb") as f:
+                f.write(compress(content, suffix))
+        entry[f"{encoding}_bytes"] = os.path.getsize(file_path + suffix)
+    return entry
+
+def read_manifest(out_directory: str):
+    manifest_path = os.path.join(out_directory, MANIFEST_FILE_NAME)
+    if not os.path.exists(manifest_path):
+        return {}
+    with open(manifest_path, "r") as f:
+        return json.load(f)
+
+# Files of the previous manifest that the new one does not list are removed,
+# with their variants.
+def remove_stale_assets(out_directory: str, previous_manifest: Dict, manifest: Dict):
+    current_files = {entry["file"] for entry in manifest.values()}
+    for entry in previous_manifest.values():
+        if entry["file"] in current_files:
+            continue
+        for suffix in [""] + [suffix for suffix, _ in VARIANT_ENCODINGS]:
+            stale_path = os.path.join(out_directory, entry["file"] + suffix)
+            if os.path.exists(stale_path):
+                os.remove(stale_path)
+
+def package_assets(out_directory: str = DEFAULT_OUT_DIRECTORY, assets_directory: str = DEFAULT_ASSETS_DIRECTORY, database_path: Optional[str] = None, with_database: bool = True):
+    os.makedirs(out_directory, exist_ok=True)
+    previous_manifest = read_manifest(out_directory)
+    manifest: Dict[str, Dict] = {}
+    for seed_path in app_seed_paths(assets_directory):
+        with open(os.path.join(assets_directory, seed_path), "rb") as f:
+            manifest[seed_path] = write_hashed_asset(out_directory, seed_path, f.read())
+    if with_database:
+        if database_path is None:
+            with tempfile.TemporaryDirectory() as temporary_directory:
+                built_path = os.path.join(temporary_directory, DATABASE_NAME)
+                build_database(built_path, assets_directory)
+                with open(built_path, "rb") as f:
+                    manifest[DATABASE_NAME] = write_hashed_asset(out_directory, DATABASE_NAME, f.read())
+        else:
+            with open(database_path, "rb") as f:
+                manifest[DATABASE_NAME] = write_hashed_asset(out_directory, DATABASE_NAME, f.read())
+    remove_stale_assets(out_directory, previous_manifest, manifest)
+    with open(os.path.join(out_directory, MANIFEST_FILE_NAME), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+def total_bytes(manifest: Dict, key: str):
+    return sum(entry.get(key, 0) for entry in manifest.values())
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+                    prog='package_assets',
+                    description='Writes content-hashed, precompressed copies of the seeds and the database image, with a manifest.')
+    parser.add_argument('-o', '--out-directory', default=DEFAULT_OUT_DIRECTORY, help="The directory to write the assets and their manifest to.")
+    parser.add_argument('-a', '--assets-directory', default=DEFAULT_ASSETS_DIRECTORY, help="The directory containing the schemas/ and sources/ directories.")
+    parser.add_argument('-d', '--database', default=None, help="A database image built by build_database.py to package, instead of building one.")
+    parser.add_argument('--no-database', action='store_true', help="Only package the seeds.")
+    args = parser.parse_args()
+
+    if brotli is None:
+        print("Warning: the brotli module is not installed, only gzip variants are written.")
+    manifest = package_assets(args.out_directory, args.assets_directory, args.database, not args.no_database)
+    for logical_name, entry in manifest.items():
+        print(f"{logical_name}: {entry['file']}, {entry['bytes']} bytes, {entry.get('gzip_bytes', '-')} gzipped, {entry.get('br_bytes', '-')} with Brotli")
+    print(f"Wrote {len(manifest)} assets to {args.out_directory}: {total_bytes(manifest, 'bytes')} bytes, {total_bytes(manifest, 'gzip_bytes')} gzipped, {total_bytes(manifest, 'br_bytes')} with Brotli.")
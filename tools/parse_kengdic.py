@@ -2,11 +2,17 @@
 
 
 # Standard library
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
 import argparse
+import contextlib
+import csv
+import multiprocessing
 import os
+import sys
 
-from parsing_tools import HanjaCharacterEntry, KoreanWord, upsert_korean_word, add_hanja_character, build_hanja_english_definition_file, build_hanja_korean_definition_file, build_korean_pronunciation_file, build_word_list
+from hanja_alignment import align_hanja, align_hanja_batch
+from parsing_tools import HanjaCharacterEntry, KoreanWordDictionary, merge_korean_word, add_hanja_character, build_hanja_english_definition_file, build_hanja_korean_definition_file, build_korean_pronunciation_file, build_word_list, instrumentation, StageProgress, open_input, positive_int
 
 
 def glosses_from_word(word: Dict):
@@ -19,31 +25,40 @@ def glosses_from_word(word: Dict):
             glosses += sense['glosses']
     return glosses
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(
-                    prog='build_dictionary',
-                    description='Builds SQL files from Kengdic data dumps.')
-    parser.add_argument('in_filename', help="A file containing a Kengdic data dump, for example downloaded from https://github.com/garfieldnate/kengdic/")
-    parser.add_argument('out_directory', help="A directory (to be created if it does not exist) to which to write the SQL files that hanja-graph can use.")
-    args = parser.parse_args()
+# Lines are handed out in chunks of about this many characters, each parsed as
+# a whole, in a worker process with --jobs. Each chunk is also reduced to its
+# distinct words there, with their hanja aligned, so the parent only merges them.
+KENGDIC_CHUNK_SIZE = 1 << 20
 
-    in_filename: str = args.in_filename
-    out_directory: str = args.out_directory
+@dataclass
+class KengdicChunk:
+    # The English meanings of every (aligned hanja or None, hangul), both in the
+    # order they were first read; the dicts are used as ordered sets.
+    words: Dict[Tuple[Optional[str], str], Dict[str, None]]
+    # The English meanings of every (hanja character, hangul).
+    hanja_definitions: Dict[Tuple[str, str], Dict[str, None]]
+    warnings: List[str]
+    with_hanja: int = 0
+    without_hanja: int = 0
+    hanja_defs: int = 0
 
-    print(f"Reading from {in_filename}, writing to {out_directory}")
-    os.makedirs(out_directory, exist_ok=True)
-    i = 0
-    with_hanja = 0
-    hanja_defs = 0
-    without_hanja = 0
-    hanja_characters: Dict[str, Dict[str, HanjaCharacterEntry]] = {}
-    words: Dict[Optional[str], Dict[str, KoreanWord]] = {}
-    for line in (open(in_filename, "r")):
-        # Skip headers
-        i += 1
-        if i == 1:
-            continue
-        fields = line.split('\t')
+# Adding a word's meanings once, in the order they were first read, leaves the
+# same meanings as adding them one by one as they are read.
+def add_word_meaning(chunk: KengdicChunk, hanja: Optional[str], korean: str, english: str):
+    if hanja is None or '／' not in hanja:
+        hanja_words = [align_hanja(hanja, korean)]
+    else:
+        hanja_words = align_hanja_batch((w, korean) for w in hanja.split('／'))
+    for hanja_word in hanja_words:
+        meanings = chunk.words.get((hanja_word, korean))
+        if meanings is None:
+            chunk.words[(hanja_word, korean)] = {english: None}
+        else:
+            meanings[english] = None
+
+def parse_kengdic_lines(lines: List[str]):
+    chunk = KengdicChunk({}, {}, [])
+    for fields in csv.reader(lines, delimiter='\t', quoting=csv.QUOTE_NONE):
         korean = fields[1]
         hanja = fields[2]
         english = fields[3]
@@ -58,36 +73,109 @@ if __name__ == "__main__":
             if len(split) > 1:
                 for elem in split:
                     if len(elem) != len(korean):
-                        print(f"Warning: skipped word h={hanja},k={korean},e={english}")
-                        upsert_korean_word(words, elem, korean, [english], [], 'unspecified')
+                        chunk.warnings.append(f"Warning: skipped word h={hanja},k={korean},e={english}")
+                        add_word_meaning(chunk, elem, korean, english)
                         if len(hanja) == 1:
-                            hanja_defs += 1
-                            add_hanja_character(hanja_characters, hanja, [korean], [], [], [english])
+                            chunk.hanja_defs += 1
+                            chunk.hanja_definitions.setdefault((hanja, korean), {})[english] = None
             elif len(hanja) != len(korean):
-                print(f"Warning: skipping h={hanja},k={korean},e={english}")
+                chunk.warnings.append(f"Warning: skipping h={hanja},k={korean},e={english}")
             else:
-                upsert_korean_word(words, hanja, korean, [english], [], 'unspecified')
-            with_hanja += 1
+                add_word_meaning(chunk, hanja, korean, english)
+            chunk.with_hanja += 1
             if len(hanja) == 1:
-                hanja_defs += 1
-                add_hanja_character(hanja_characters, hanja, [korean], [], [], [english])
+                chunk.hanja_defs += 1
+                chunk.hanja_definitions.setdefault((hanja, korean), {})[english] = None
+        else:
+            add_word_meaning(chunk, None, korean, english)
+            chunk.without_hanja += 1
+    return chunk
+
+def read_line_chunks(f, progress: Optional[StageProgress] = None):
+    for lines in iter(lambda: f.readlines(KENGDIC_CHUNK_SIZE), []):
+        if progress is not None:
+            progress.update(len(lines), sum(len(line) for line in lines))
+        yield lines
+
+# Chunks are parsed in parallel but merged in the order they were read, so the
+# dictionaries come out the same whatever the number of jobs: every word and
+# meaning is first added in the same order as if the lines were read one by one.
+def read_kengdic(in_filename: str, jobs: int = 1, progress: Optional[StageProgress] = None):
+    with_hanja = 0
+    hanja_defs = 0
+    without_hanja = 0
+    hanja_characters: Dict[str, Dict[str, HanjaCharacterEntry]] = {}
+    words: KoreanWordDictionary = KoreanWordDictionary()
+    with contextlib.ExitStack() as stack:
+        f = stack.enter_context(open_input(in_filename, "rt", encoding="utf-8", newline=""))
+        # Skip headers
+        f.readline()
+        line_chunks = read_line_chunks(f, progress)
+        if jobs <= 1:
+            chunks = map(parse_kengdic_lines, line_chunks)
         else:
-            upsert_korean_word(words, None, korean, [english], [], 'unspecified')
-            without_hanja += 1
+            pool = stack.enter_context(multiprocessing.Pool(jobs))
+            chunks = pool.imap(parse_kengdic_lines, line_chunks)
+        for chunk in chunks:
+            for warning in chunk.warnings:
+                print(warning)
+            for (hanja, korean), english in chunk.words.items():
+                merge_korean_word(words, None if hanja is None else sys.intern(hanja), sys.intern(korean), list(english), [], 'unspecified')
+            for (hanja, korean), english in chunk.hanja_definitions.items():
+                add_hanja_character(hanja_characters, hanja, [korean], [], [], list(english))
+            with_hanja += chunk.with_hanja
+            without_hanja += chunk.without_hanja
+            hanja_defs += chunk.hanja_defs
     print(f"Read {with_hanja} words with hanja, {without_hanja} words without, {hanja_defs} new Hanja definitions.")
+    return hanja_characters, words
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+                    prog='build_dictionary',
+                    description='Builds SQL files from Kengdic data dumps.')
+    parser.add_argument('in_filename', help="A file containing a Kengdic data dump, for example downloaded from https://github.com/garfieldnate/kengdic/. May be compressed with gzip, bzip2, xz or zstd (which needs the zstandard package).")
+    parser.add_argument('out_directory', help="A directory (to be created if it does not exist) to which to write the SQL files that hanja-graph can use.")
+    parser.add_argument('-r', '--rows-per-statement', type=positive_int, default=None, help="Split each SQL file into INSERT statements of at most this many rows. By default each file is one statement.")
+    parser.add_argument('-j', '--jobs', type=int, default=1, help="Number of processes to parse the dump with.")
+    parser.add_argument('-p', '--profile', metavar='DIRECTORY', default=None, help="Profile every stage with cProfile, writing one .prof file per stage to this directory, and count the calls and time spent in hot helpers. Slows the run down.")
+    parser.add_argument('-t', '--timings', metavar='FILE', default=None, help="Write the timings of every stage to this JSON file at the end of the run.")
+    args = parser.parse_args()
+
+    in_filename: str = args.in_filename
+    out_directory: str = args.out_directory
+    rows_per_statement: Optional[int] = args.rows_per_statement
+    jobs: int = args.jobs
+    profile_directory: Optional[str] = args.profile
+    timings_path: Optional[str] = args.timings
+
+    if profile_directory is not None:
+        instrumentation.enable_profiling(profile_directory, [sys.modules[__name__]], jobs)
+
+    print(f"Reading from {in_filename}, writing to {out_directory}")
+    os.makedirs(out_directory, exist_ok=True)
+    # Lines are counted as characters, not bytes, since the file is read as text.
+    with instrumentation.stage("read_kengdic") as progress:
+        hanja_characters, words = read_kengdic(in_filename, jobs, progress)
     hanja_english_definitions_path = os.path.join(out_directory, "english_hanja_definition.sql");
     print(f"Writing Hanja English definitions to {hanja_english_definitions_path}.")
-    build_hanja_english_definition_file(hanja_english_definitions_path, hanja_characters)
+    with instrumentation.stage("build_hanja_english_definition_file"):
+        build_hanja_english_definition_file(hanja_english_definitions_path, hanja_characters, rows_per_statement)
 
     korean_pronunciation_path = os.path.join(out_directory, "korean_pronunciation.sql");
     print(f"Writing Hanja Korean pronuncations to {korean_pronunciation_path}.")
-    build_korean_pronunciation_file(korean_pronunciation_path, hanja_characters)
+    with instrumentation.stage("build_korean_pronunciation_file"):
+        build_korean_pronunciation_file(korean_pronunciation_path, hanja_characters, rows_per_statement)
 
     korean_english_definitions_path = os.path.join(out_directory, "korean_hanja_definition.sql");
     print(f"Writing Hanja Korean definitions to {korean_english_definitions_path}.")
-    build_hanja_korean_definition_file(korean_english_definitions_path, hanja_characters)
+    with instrumentation.stage("build_hanja_korean_definition_file"):
+        build_hanja_korean_definition_file(korean_english_definitions_path, hanja_characters, rows_per_statement)
 
     word_list_path = os.path.join(out_directory, "word_list.sql");
-    build_word_list(word_list_path, [words])
+    with instrumentation.stage("build_word_list"):
+        build_word_list(word_list_path, [words], rows_per_statement)
     print(f"Writing word definitions to {word_list_path}.")
 
+    instrumentation.report()
+    if timings_path is not None:
+        instrumentation.write_json(timings_path)
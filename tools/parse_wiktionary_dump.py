@@ -31,16 +31,31 @@
 #ko-conj/adj - conjugated adjectives, omitting
 
 # Standard library
-from typing import Dict, List, Set, Optional
+from typing import Callable, Dict, Iterable, List, Set, Optional, Tuple
+from dataclasses import dataclass, field
 import argparse
+import hashlib
+import multiprocessing
 import os
 import json
+import sys
 
-from parsing_tools import HanjaCharacterEntry, KoreanWord, is_hangul, build_hanja_english_definition_file, build_hanja_korean_definition_file, build_korean_pronunciation_file, build_word_list, add_hanja_character, upsert_korean_word, strip_common_verb_suffixes, add_hanja_character, dict_contains_hangul_word
+from character_classes import is_ascii_alpha
+from parsing_tools import HanjaCharacterEntry, KoreanWordDictionary, is_hangul, build_hanja_english_definition_file, build_hanja_korean_definition_file, build_korean_pronunciation_file, build_word_list, add_hanja_character, upsert_korean_word, strip_common_verb_suffixes, strip_all_common_verb_suffixes, dict_contains_hangul_word, shard_byte_ranges, read_byte_range, is_compressed, instrumentation, track_lines, StageProgress, positive_int
+from extraction_cache import Extractions, ExtractionCache, Manifest, ManifestEntry, file_digest, load_pickle, save_pickle
+from dump_decoders import DECODERS, KOREAN_HEAD_TEMPLATE_MARKER, decode_lines, make_decoder
 
-def word_reader(file_name: str):
-    for row in open(file_name, "r"):
-        blob = json.loads(row)
+# Bump whenever a change to the stages, or to the helpers they use, changes what
+# is extracted from a record or the dictionaries built from it, so that
+# incremental manifests and cached dictionaries written by older versions are
+# discarded.
+PARSER_VERSION = 1
+
+def word_reader(file_name: str, start: int = 0, end: Optional[int] = None, decoder_name: Optional[str] = None, prefilter: bool = True, progress: Optional[StageProgress] = None):
+    lines = read_byte_range(file_name, start, end)
+    if progress is not None:
+        lines = track_lines(lines, progress)
+    for blob in decode_lines(lines, decoder_name, prefilter):
         yield blob
 
 def english_meanings_from_links(links: List[str]):
@@ -82,273 +97,530 @@ def glosses_from_word(word: Dict):
             glosses += sense['glosses']
     return glosses
 
+type_to_pos: Dict[str, str] = {
+        "ko-hanja/old": "character", 
+        "ko-hanja/new": "character",
+        "ko-hanja": "character",
+        "ko-noun": "noun",
+        "ko-proper noun": "proper-noun", 
+        "ko-num": "number",
+        "ko-verb": "verb", 
+        "ko-verb-set": "verb",
+        "ko-adv": "adverb", 
+        "ko-determ": "determiner", 
+        "ko-adj": "adjective", 
+        "ko-adverb": "ad erb", 
+        "ko-det": "determiner", 
+        "ko-adjective": "adjective"
+        }
+
+@dataclass
+class WiktionaryDictionaries:
+    hanja_characters: Dict[str, Dict[str, HanjaCharacterEntry]] = field(default_factory=dict)
+    sino_korean_nouns: KoreanWordDictionary = field(default_factory=KoreanWordDictionary)
+    pure_korean_nouns: KoreanWordDictionary = field(default_factory=KoreanWordDictionary)
+    pure_korean_verbs: KoreanWordDictionary = field(default_factory=KoreanWordDictionary)
+
+# The dump is read exactly once. Every stage is registered against the head
+# templates it handles and extracts compact argument tuples from each matching
+# record. Once the whole dump has been read, the stages are applied in
+# registration order over their extracted tuples, so stages that depend on the
+# results of earlier ones (e.g. pure verbs checking the Sino-Korean nouns) see
+# the same state as they did when every stage re-read the dump.
+@dataclass
+class Stage:
+    name: str
+    head_template_names: Tuple[str, ...]
+    extract: Callable[[Dict, Dict], List[Tuple]]
+    apply: Callable[[WiktionaryDictionaries, List[Tuple]], None]
+
+STAGES: List[Stage] = []
+HEAD_TEMPLATE_HANDLERS: Dict[str, List[Stage]] = {}
+
+def register_stage(stage: Stage):
+    STAGES.append(stage)
+    for head_template_name in stage.head_template_names:
+        if head_template_name not in HEAD_TEMPLATE_HANDLERS:
+            HEAD_TEMPLATE_HANDLERS[head_template_name] = []
+        HEAD_TEMPLATE_HANDLERS[head_template_name].append(stage)
+
+def hanja_form_from_word(word: Dict):
+    forms: List[Dict] = word["forms"]
+    maybe_hanja_word: Optional[str] = None
+    for form in forms:
+        if 'hanja' in form['tags'] and 'form' in form:
+            maybe_hanja_word = form['form']
+    return maybe_hanja_word
+
+# By showing the head templates, we can determine that words with the following
+# head templates represent Hanja:
+# ko-hanja/new
+# ko-hanja
+# ko-hanja/old
+def extract_hanja_characters(word: Dict, head_template: Dict):
+    # keys: 'pos', 'head_templates', 'forms', 'word', 'lang', 'lang_code', 'senses'
+    extracted = []
+    hanja_word: str = word["word"]
+    if "senses" not in word:
+        return extracted
+    senses: List[Dict] = word["senses"]
+    for sense in senses:
+        # Links appear to be loosely schematized like this:
+        # [['Hanja', 'hanja#English'], ['견', '견#Korean'], ['dog', 'dog']]
+        if "args" not in head_template:
+            continue
+        head_template_args: Dict = head_template["args"]
+        hangul_pronunciations = []
+        english_meanings = []
+        glosses = []
+        if "links" in sense:
+            links: List[str] = sense["links"]
+            english_meanings += english_meanings_from_links(links)
+            hangul_pronunciations += [link[0] for link in links if link[1][1:] == '#Korean' and link[0] != hanja_word and is_hangul(link[0])]
+        korean_meanings = [head_template_args[key] for key in head_template_args if len(head_template_args[key]) > 0]
+        hangul_pronunciations += [meaning for meaning in korean_meanings if len(meaning) == 1]
+
+        if "glosses" in sense:
+            glosses += sense["glosses"]
+        
+        if len(hangul_pronunciations) == 0:
+            continue
+        if len(korean_meanings) == 0:
+            continue
+        extracted.append((hanja_word, tuple(hangul_pronunciations), tuple(glosses), tuple(korean_meanings), tuple(english_meanings)))
+    return extracted
+
+def apply_hanja_characters(dictionaries: WiktionaryDictionaries, extracted: List[Tuple]):
+    print(f"Parsing Hanja pronunciations and meanings out of words with hanja/new head template.")
+    for hanja_word, hangul_pronunciations, glosses, korean_meanings, english_meanings in extracted:
+        add_hanja_character(dictionaries.hanja_characters, hanja_word, hangul_pronunciations, glosses, korean_meanings, english_meanings)
+    print(f"Acquired {len(dictionaries.hanja_characters)} unique hanja characters.")
+
+def extract_explicit_sino_korean_nouns(word: Dict, head_template: Dict):
+    extracted = []
+    head_template_name = head_template["name"]
+    focus_word = word["word"]
+    if is_hangul(focus_word):
+        return extracted
+    if is_ascii_alpha(focus_word):
+        return extracted
+    glosses = []
+    english_meanings = []
+    hangul_pronunciations = []
+    hanja_word = focus_word
+    if "args" in head_template:
+        head_template_args: Dict = head_template["args"]
+        if 'hangul' in head_template_args:
+            hangul_pronunciations.append(head_template_args["hangeul"])
+    if "forms" in word:
+        forms: List[Dict] = word["forms"]
+        for form in forms:
+            if 'hangeul' in form['tags'] and 'form' in form:
+                hangul_pronunciations.append(form['form'])
+    if 'senses' in word:
+        senses = word['senses']
+        for sense in senses:
+            if 'links' in sense:
+                links = sense['links']
+                english_meanings += english_meanings_from_links(links)
+                hangul_pronunciations += [link[0] for link in links if is_hangul(link[1])]
+            if len(set(hangul_pronunciations)) < 1:
+                print("got less than 1 hangul pronunciation")
+                print(hangul_pronunciations)
+                continue
+            if 'glosses' in sense:
+                glosses += sense['glosses']
+            extracted.append((hanja_word, hangul_pronunciations[0], tuple(english_meanings), tuple(glosses), type_to_pos[head_template_name]))
+    return extracted
+
+def apply_explicit_sino_korean_nouns(dictionaries: WiktionaryDictionaries, extracted: List[Tuple]):
+    print(f"Parsing explicit Sino-Korean nouns.")
+    for hanja_word, hangul_word, english_meanings, glosses, part_of_speech in extracted:
+        upsert_korean_word(dictionaries.sino_korean_nouns, hanja_word, hangul_word, english_meanings, glosses, part_of_speech)
+    print(f"Acquired {len(dictionaries.sino_korean_nouns)} unique Hanja-based Korean words.")
+
+def extract_sino_korean_nouns(word: Dict, head_template: Dict):
+    focus_word = word["word"]
+    if not is_hangul(focus_word) or "forms" not in word:
+        return []
+    maybe_hanja_word = hanja_form_from_word(word)
+    # Handle the case where the noun has Hanja roots
+    if maybe_hanja_word is None:
+        return []
+    hangul_word = focus_word
+    english_meanings = english_meanings_from_word(word)
+    glosses = glosses_from_word(word)
+    return [(maybe_hanja_word, hangul_word, tuple(english_meanings), tuple(glosses), type_to_pos[head_template["name"]])]
+
+def apply_sino_korean_nouns(dictionaries: WiktionaryDictionaries, extracted: List[Tuple]):
+    print(f"Parsing Sino-Korean nouns.")
+    n_new_characters = 0
+    n_new_sino_korean_nouns = 0
+    for maybe_hanja_word, hangul_word, english_meanings, glosses, part_of_speech in extracted:
+        if maybe_hanja_word not in dictionaries.hanja_characters and len(maybe_hanja_word) == 1:
+            add_hanja_character(dictionaries.hanja_characters, maybe_hanja_word, hangul_word, glosses, [hangul_word], english_meanings)
+            n_new_characters += 1
+        upsert_korean_word(dictionaries.sino_korean_nouns, maybe_hanja_word, hangul_word, english_meanings, glosses, part_of_speech)
+        n_new_sino_korean_nouns += 1
+    print(f"Acquired {n_new_sino_korean_nouns} new pure Sion-Korean nouns and {n_new_characters} new Hanja.")
+
+def extract_pure_korean_nouns(word: Dict, head_template: Dict):
+    focus_word = word["word"]
+    if not is_hangul(focus_word) or "forms" not in word:
+        return []
+    if hanja_form_from_word(word) is not None:
+        return []
+    # process a pure Korean noun
+    hangul_word = focus_word
+    english_meanings = english_meanings_from_word(word)
+    glosses = glosses_from_word(word)
+    return [(hangul_word, tuple(english_meanings), tuple(glosses), type_to_pos[head_template["name"]])]
+
+def apply_pure_korean_nouns(dictionaries: WiktionaryDictionaries, extracted: List[Tuple]):
+    print(f"Parsing pure Korean nouns.")
+    for hangul_word, english_meanings, glosses, part_of_speech in extracted:
+        upsert_korean_word(dictionaries.pure_korean_nouns, None, hangul_word, english_meanings, glosses, part_of_speech)
+    print(f"Acquired {len(dictionaries.pure_korean_nouns[None])} new pure Korean nouns.")
+
+def extract_sino_korean_verbs(word: Dict, head_template: Dict):
+    focus_word = word["word"]
+    if "forms" not in word:
+        return []
+    maybe_hanja_word = hanja_form_from_word(word)
+    # Handle the case where the noun has Hanja roots
+    if maybe_hanja_word is None:
+        return []
+    part_of_speech = type_to_pos[head_template["name"]]
+    maybe_hanja_word = strip_common_verb_suffixes(maybe_hanja_word)
+    maybe_hangul_word = strip_common_verb_suffixes(focus_word)
+    # ugly as hell, but this is an important word
+    if maybe_hangul_word == '원래':
+        english_meanings = tuple(english_meanings_from_word(word))
+        glosses = tuple(glosses_from_word(word))
+        return [(maybe_hanja_word, maybe_hangul_word, english_meanings, glosses, part_of_speech) for maybe_hanja_word in ["元來", "原來"]]
+    if len(maybe_hanja_word) != len(maybe_hangul_word):
+        print('Warning: ignoring word "' + focus_word + '"')
+        print(json.dumps(word, ensure_ascii=False, indent=1))
+        return []
+    english_meanings = english_meanings_from_word(word)
+    glosses = glosses_from_word(word)
+    return [(maybe_hanja_word, maybe_hangul_word, tuple(english_meanings), tuple(glosses), part_of_speech)]
+
+def apply_sino_korean_verbs(dictionaries: WiktionaryDictionaries, extracted: List[Tuple]):
+    print(f"Parsing Sino-Korean verbs, adjectives and parts of speech.")
+    for hanja_word, hangul_word, english_meanings, glosses, part_of_speech in extracted:
+        upsert_korean_word(dictionaries.sino_korean_nouns, hanja_word, hangul_word, english_meanings, glosses, part_of_speech)
+    print(f"Now at {len(dictionaries.sino_korean_nouns)} Sino-Korean nouns after parsing Sino-korean verbs.")
+
+def extract_pure_korean_verbs(word: Dict, head_template: Dict):
+    focus_word = word["word"]
+    if "forms" not in word:
+        return []
+    if hanja_form_from_word(word) is not None:
+        return []
+    hangul_word = focus_word
+    english_meanings = english_meanings_from_word(word)
+    glosses = glosses_from_word(word)
+    return [(hangul_word, tuple(english_meanings), tuple(glosses), type_to_pos[head_template["name"]])]
+
+def apply_pure_korean_verbs(dictionaries: WiktionaryDictionaries, extracted: List[Tuple]):
+    print(f"Parsing pure Korean verbs, adjectives and parts of speech.")
+    stripped_hangul_words = strip_all_common_verb_suffixes(hangul_word for hangul_word, _, _, _ in extracted)
+    for (hangul_word, english_meanings, glosses, part_of_speech), stripped_hangul_word in zip(extracted, stripped_hangul_words):
+        # Resolved here rather than during extraction, since it needs every
+        # Sino-Korean word to have been seen.
+        if dict_contains_hangul_word(dictionaries.sino_korean_nouns, hangul_word, stripped_hangul_word):
+            continue
+        upsert_korean_word(dictionaries.pure_korean_verbs, None, hangul_word, english_meanings, glosses, part_of_speech)
+    print(f"Acquired {len(dictionaries.pure_korean_verbs[None])} pure Korean verbs.")
+
+register_stage(Stage("hanja_characters", ("ko-hanja/old", "ko-hanja/new", "ko-hanja"), extract_hanja_characters, apply_hanja_characters))
+register_stage(Stage("explicit_sino_korean_nouns", ("ko-noun",), extract_explicit_sino_korean_nouns, apply_explicit_sino_korean_nouns))
+register_stage(Stage("sino_korean_nouns", ("ko-noun", "ko-proper noun", "ko-num"), extract_sino_korean_nouns, apply_sino_korean_nouns))
+register_stage(Stage("pure_korean_nouns", ("ko-noun", "ko-proper noun", "ko-num"), extract_pure_korean_nouns, apply_pure_korean_nouns))
+register_stage(Stage("sino_korean_verbs", ("ko-verb", "ko-adv", "ko-determ", "ko-adj", "ko-adverb", "ko-det", "ko-adjective"), extract_sino_korean_verbs, apply_sino_korean_verbs))
+register_stage(Stage("pure_korean_verbs", ("ko-verb", "ko-adv", "ko-determ", "ko-adj", "ko-verb-set", "ko-adverb", "ko-det", "ko-adjective"), extract_pure_korean_verbs, apply_pure_korean_verbs))
+
+def extract_words(words: Iterable[Dict], show_head_templates: bool = False):
+    extractions = Extractions(0, {}, {stage.name: [] for stage in STAGES})
+    for word in words:
+        extractions.n_words += 1
+        if "head_templates" not in word:
+            continue
+        head_templates: List[Dict] = word["head_templates"]
+        for head_template in head_templates:
+            head_template_name = head_template["name"]
+            if head_template_name not in extractions.head_template_names:
+                extractions.head_template_names[head_template_name] = 0
+                if show_head_templates:
+                    print(f"Head template {head_template_name}")
+            extractions.head_template_names[head_template_name] += 1
+            for stage in HEAD_TEMPLATE_HANDLERS.get(head_template_name, []):
+                extractions.stages[stage.name] += stage.extract(word, head_template)
+    return extractions
+
+# The extractions of a single record, by stage name.
+def extract_word(word: Dict):
+    extracted: Dict[str, List[Tuple]] = {}
+    if "head_templates" not in word:
+        return extracted
+    head_templates: List[Dict] = word["head_templates"]
+    for head_template in head_templates:
+        for stage in HEAD_TEMPLATE_HANDLERS.get(head_template["name"], []):
+            stage_extracted = stage.extract(word, head_template)
+            if len(stage_extracted) == 0:
+                continue
+            if stage.name not in extracted:
+                extracted[stage.name] = []
+            extracted[stage.name] += stage_extracted
+    return extracted
+
+# Incremental rebuilds keep a manifest of every entry of the last dump, keyed by
+# the hash of its line, holding its word and part of speech and what the stages
+# extracted from it. Only entries whose content changed are decoded and
+# extracted again; everything else is taken from the manifest. The stages are
+# then applied to the extractions in the order of the new dump, so the output is
+# the same as a full rebuild. The manifest also records the digest of the dump
+# it was built from, so that a run taking its extractions from the cache can
+# tell whether the manifest is still that of the dump.
+def load_manifest(path: str):
+    manifest: Optional[Manifest] = load_pickle(path)
+    if manifest is not None:
+        if manifest.parser_version == PARSER_VERSION:
+            return manifest
+        print(f"Discarding manifest {path} written by parser version {manifest.parser_version}.")
+    return Manifest(PARSER_VERSION, {})
+
+def hashes_by_key(manifest: Manifest):
+    result: Dict[Tuple[str, str], Set[bytes]] = {}
+    for content_hash, entry in manifest.entries.items():
+        if entry.key not in result:
+            result[entry.key] = set()
+        result[entry.key].add(content_hash)
+    return result
+
+def manifest_is_current(path: str, input_digest: bytes):
+    return load_manifest(path).input_digest == input_digest
+
+def extract_file_incrementally(file_name: str, manifest_path: str, decoder_name: Optional[str] = None, progress: Optional[StageProgress] = None, input_digest: Optional[bytes] = None):
+    old_manifest = load_manifest(manifest_path)
+    new_manifest = Manifest(PARSER_VERSION, {}, input_digest if input_digest is not None else file_digest(file_name))
+    decode = make_decoder(decoder_name)
+    extractions = Extractions(0, {}, {stage.name: [] for stage in STAGES})
+    n_extracted = 0
+    lines = read_byte_range(file_name)
+    if progress is not None:
+        lines = track_lines(lines, progress)
+    for line in lines:
+        extractions.n_words += 1
+        if KOREAN_HEAD_TEMPLATE_MARKER not in line:
+            continue
+        content_hash = hashlib.blake2b(line, digest_size=16).digest()
+        entry = new_manifest.entries.get(content_hash)
+        if entry is None:
+            entry = old_manifest.entries.get(content_hash)
+        if entry is None:
+            word = decode(line)
+            entry = ManifestEntry((word.get("word", ""), word.get("pos", "")), extract_word(word))
+            n_extracted += 1
+        new_manifest.entries[content_hash] = entry
+        for stage_name, extracted in entry.extracted.items():
+            extractions.stages[stage_name] += extracted
+
+    old_hashes = hashes_by_key(old_manifest)
+    new_hashes = hashes_by_key(new_manifest)
+    n_added = len([key for key in new_hashes if key not in old_hashes])
+    n_removed = len([key for key in old_hashes if key not in new_hashes])
+    n_changed = len([key for key in new_hashes if key in old_hashes and new_hashes[key] != old_hashes[key]])
+    print(f"Incremental rebuild: {n_added} entries added, {n_changed} changed, {n_removed} removed; re-extracted {n_extracted} of {len(new_manifest.entries)} distinct entries.")
+    save_pickle(manifest_path, new_manifest)
+    return extractions
+
+def extract_shard(shard: Tuple[str, int, int, Optional[str], bool]):
+    file_name, start, end, decoder_name, prefilter = shard
+    return extract_words(word_reader(file_name, start, end, decoder_name, prefilter))
+
+# A compressed dump cannot be split into shards without every worker
+# decompressing it up to its shard, so it is decompressed once, in the parent,
+# and its lines are handed to the workers in batches of about this many bytes.
+LINE_BATCH_SIZE = 1 << 22
+
+def read_line_batches(file_name: str, decoder_name: Optional[str], prefilter: bool, progress: Optional[StageProgress] = None):
+    batch: List[bytes] = []
+    batch_size = 0
+    for line in read_byte_range(file_name):
+        batch.append(line)
+        batch_size += len(line)
+        if batch_size >= LINE_BATCH_SIZE:
+            if progress is not None:
+                progress.update(len(batch), batch_size)
+            yield batch, decoder_name, prefilter
+            batch = []
+            batch_size = 0
+    if batch:
+        if progress is not None:
+            progress.update(len(batch), batch_size)
+        yield batch, decoder_name, prefilter
+
+def extract_line_batch(batch: Tuple[List[bytes], Optional[str], bool]):
+    lines, decoder_name, prefilter = batch
+    return extract_words(decode_lines(lines, decoder_name, prefilter))
+
+# Concatenating the per-stage extractions of consecutive shards gives exactly
+# what a single pass over the whole file would have extracted, so the
+# dictionaries are then built (and their sets unioned by add_hanja_character
+# and upsert_korean_word) in the same order whatever the shard count.
+def merge_extractions(parts: List[Extractions]):
+    merged = Extractions(0, {}, {stage.name: [] for stage in STAGES})
+    for part in parts:
+        merged.n_words += part.n_words
+        for head_template_name, count in part.head_template_names.items():
+            merged.head_template_names[head_template_name] = merged.head_template_names.get(head_template_name, 0) + count
+        for stage_name, extracted in part.stages.items():
+            merged.stages[stage_name] += extracted
+    return merged
+
+def extract_file(file_name: str, jobs: int = 1, show_head_templates: bool = False, decoder_name: Optional[str] = None, progress: Optional[StageProgress] = None):
+    # Skipping lines without Korean head templates would hide the other head
+    # templates, so every line is decoded when they are to be shown.
+    prefilter = not show_head_templates
+    if jobs <= 1:
+        return extract_words(word_reader(file_name, decoder_name=decoder_name, prefilter=prefilter, progress=progress), show_head_templates)
+    parts = []
+    if is_compressed(file_name):
+        with multiprocessing.Pool(jobs) as pool:
+            parts = list(pool.imap(extract_line_batch, read_line_batches(file_name, decoder_name, prefilter, progress)))
+    else:
+        shards = [(file_name, start, end, decoder_name, prefilter) for start, end in shard_byte_ranges(file_name, jobs)]
+        with multiprocessing.Pool(jobs) as pool:
+            # Progress can only be tracked per shard.
+            for shard, part in zip(shards, pool.imap(extract_shard, shards)):
+                parts.append(part)
+                if progress is not None:
+                    progress.update(part.n_words, shard[2] - shard[1])
+    extractions = merge_extractions(parts)
+    if show_head_templates:
+        for head_template_name in extractions.head_template_names:
+            print(f"Head template {head_template_name}")
+    return extractions
+
+def build_dictionaries(extractions: Extractions):
+    dictionaries = WiktionaryDictionaries()
+    for stage in STAGES:
+        extracted = extractions.stages[stage.name]
+        with instrumentation.stage(f"apply {stage.name}", total_records=len(extracted)) as progress:
+            stage.apply(dictionaries, extracted)
+            progress.update(len(extracted))
+    return dictionaries
+
+# What the stages extracted from a dump is cached between runs, so that a change
+# to one of the build_* emitters does not need the dump to be parsed again. A
+# cache is only used for the exact dump and parser version it was built from.
+# The dictionaries themselves are not cached: sets read back from a pickle can
+# iterate in another order, which would reorder the rows of the SQL files.
+# Caching is opt-in; -c without a path caches here.
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "hanja-graph", "wiktionary_extractions.pickle")
+
+def load_cached_extractions(path: str, input_digest: bytes):
+    cache: Optional[ExtractionCache] = load_pickle(path)
+    if cache is None:
+        return None
+    if cache.parser_version != PARSER_VERSION or cache.input_digest != input_digest:
+        print(f"Discarding cache {path}, which was built from another dump or parser version.")
+        return None
+    return cache.extractions
+
+def save_cached_extractions(path: str, input_digest: bytes, extractions: Extractions):
+    save_pickle(path, ExtractionCache(PARSER_VERSION, input_digest, extractions))
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
                     prog='build_dictionary',
                     description='Builds SQL files from Wiktionary data dumps.')
-    parser.add_argument('in_filename', help="A file containing a Wiktionary data dump, for example downloaded from https://kaikki.org/dictionary/Korean/index.html")
+    parser.add_argument('in_filename', help="A file containing a Wiktionary data dump, for example downloaded from https://kaikki.org/dictionary/Korean/index.html. May be compressed with gzip, bzip2, xz or zstd (which needs the zstandard package).")
     parser.add_argument('out_directory', help="A directory (to be created if it does not exist) to which to write the SQL files that hanja-graph can use.")
     parser.add_argument('-ht', '--head-templates', action='store_true', help="Extract and show head templates?")
+    parser.add_argument('-j', '--jobs', type=int, default=1, help="Number of processes to parse the dump with. An uncompressed dump is split into this many shards; the lines of a compressed one are decompressed once and handed out in batches.")
+    parser.add_argument('-d', '--decoder', choices=list(DECODERS), default=None, help="JSON decoder to use. Defaults to the fastest one installed.")
+    parser.add_argument('-i', '--incremental', metavar='MANIFEST', default=None, help="Keep a manifest of the dump's entries at this path between runs, and only re-extract entries that changed since the last run.")
+    parser.add_argument('-r', '--rows-per-statement', type=positive_int, default=None, help="Split each SQL file into INSERT statements of at most this many rows. By default each file is one statement.")
+    parser.add_argument('-c', '--cache', metavar='FILE', nargs='?', const=DEFAULT_CACHE_PATH, default=None, help=f"Cache what was extracted from the dump in this file, {DEFAULT_CACHE_PATH} if none is given, to skip parsing it again when neither it nor the parser changed. Off by default.")
+    parser.add_argument('-p', '--profile', metavar='DIRECTORY', default=None, help="Profile every stage with cProfile, writing one .prof file per stage to this directory, and count the calls and time spent in hot helpers. Slows the run down.")
+    parser.add_argument('-t', '--timings', metavar='FILE', default=None, help="Write the timings of every stage to this JSON file at the end of the run.")
     args = parser.parse_args()
+    if args.incremental is not None and (args.jobs > 1 or args.head_templates):
+        parser.error("--incremental cannot be combined with --jobs or --head-templates")
 
     in_filename: str = args.in_filename
     out_directory: str = args.out_directory
+    rows_per_statement: Optional[int] = args.rows_per_statement
     show_head_templates: bool = args.head_templates
+    jobs: int = args.jobs
+    decoder_name: Optional[str] = args.decoder
+    manifest_path: Optional[str] = args.incremental
+    profile_directory: Optional[str] = args.profile
+    timings_path: Optional[str] = args.timings
+    # Head templates are only shown while parsing.
+    cache_path: Optional[str] = None if args.head_templates else args.cache
+
+    if profile_directory is not None:
+        instrumentation.enable_profiling(profile_directory, [sys.modules[__name__]], jobs)
 
     print(f"Reading from {in_filename}, writing to {out_directory}")
     os.makedirs(out_directory, exist_ok=True)
 
-    print(f"Validating filename by reading it before beginning.")
-    count = 0
-    for word in word_reader(in_filename):
-        count += 1
-    print(f"Parsed all {count} lines of {in_filename} as JSON.")
-
     if show_head_templates:
         print("Extracting all distinct head templates for inspection.")
-        distinct_head_templates: Set[str] = set()
-        for word in word_reader(in_filename):
-            if "head_templates" in word:
-                head_templates: List[Dict] = word["head_templates"]
-                for head_template in head_templates:
-                    head_template_name = head_template["name"]
-                    if head_template_name not in distinct_head_templates:
-                        distinct_head_templates.add(head_template_name)
-                        print(f"Head template {head_template_name}")
-    
-    # By showing the head templates, we can determine that words with the following
-    # head templates represent Hanja:
-    # ko-hanja/new
-    # ko-hanja
-    # ko-hanja/old
-    hanja_characters: Dict[str, Dict[str, HanjaCharacterEntry]] = {}
-    print(f"Parsing Hanja pronunciations and meanings out of words with hanja/new head template.")
-    for word in word_reader(in_filename):
-        if "head_templates" in word:
-            head_templates: List[Dict] = word["head_templates"]
-            for head_template in head_templates:
-                head_template_name = head_template["name"]
-                if head_template_name in ("ko-hanja/old", "ko-hanja/new", "ko-hanja"):
-                    # keys: 'pos', 'head_templates', 'forms', 'word', 'lang', 'lang_code', 'senses'
-                    hanja_word: str = word["word"]
-                    if "senses" not in word:
-                        continue
-                    senses: List[Dict] = word["senses"]
-                    for sense in senses:
-                        # Links appear to be loosely schematized like this:
-                        # [['Hanja', 'hanja#English'], ['견', '견#Korean'], ['dog', 'dog']]
-                        if "args" not in head_template:
-                            continue
-                        head_template_args: Dict = head_template["args"]
-                        hangul_pronunciations = []
-                        english_meanings = []
-                        glosses = []
-                        if "links" in sense:
-                            links: List[str] = sense["links"]
-                            english_meanings += english_meanings_from_links(links)
-                            hangul_pronunciations += [link[0] for link in links if link[1][1:] == '#Korean' and link[0] != hanja_word and is_hangul(link[0])]
-                        korean_meanings = [head_template_args[key] for key in head_template_args if len(head_template_args[key]) > 0]
-                        hangul_pronunciations += [meaning for meaning in korean_meanings if len(meaning) == 1]
-
-                        if "glosses" in sense:
-                            glosses += sense["glosses"]
-                        
-                        if len(hangul_pronunciations) == 0:
-                            continue
-                        if len(korean_meanings) == 0:
-                            continue
-                        add_hanja_character(hanja_characters, hanja_word, hangul_pronunciations, glosses, korean_meanings, english_meanings)
-    print(f"Acquired {len(hanja_characters)} unique hanja characters.")
+    extractions: Optional[Extractions] = None
+    input_digest: Optional[bytes] = None
+    if cache_path is not None:
+        with instrumentation.stage("load cache"):
+            input_digest = file_digest(in_filename)
+            extractions = load_cached_extractions(cache_path, input_digest)
+        if extractions is not None and manifest_path is not None and not manifest_is_current(manifest_path, input_digest):
+            # Extracting incrementally gives the same extractions and brings
+            # the manifest up to date for the next run.
+            print(f"The manifest {manifest_path} is not that of {in_filename}, updating it instead of using the cache.")
+            extractions = None
+        if extractions is not None:
+            print(f"Loaded what was extracted from {in_filename} from {cache_path}.")
 
-    print(f"Parsing explicit Sino-Korean nouns.")
-    sino_korean_nouns: Dict[Optional[str], Dict[str, KoreanWord]] = {}
-    type_to_pos: Dict[str, str] = {
-            "ko-hanja/old": "character", 
-            "ko-hanja/new": "character",
-            "ko-hanja": "character",
-            "ko-noun": "noun",
-            "ko-proper noun": "proper-noun", 
-            "ko-num": "number",
-            "ko-verb": "verb", 
-            "ko-verb-set": "verb",
-            "ko-adv": "adverb", 
-            "ko-determ": "determiner", 
-            "ko-adj": "adjective", 
-            "ko-adverb": "ad erb", 
-            "ko-det": "determiner", 
-            "ko-adjective": "adjective"
-            }
-
-    for word in word_reader(in_filename):
-        if "head_templates" in word:
-            head_templates: List[Dict] = word["head_templates"]
-            for head_template in head_templates:
-                head_template_name = head_template["name"]
-                if head_template_name in ("ko-noun"):
-                    focus_word = word["word"]
-                    if is_hangul(focus_word):
-                        pass
-                    elif focus_word.replace(" ","").isalpha() and focus_word.replace(" ","").isascii():
-                        pass
-                    else:
-                        glosses = []
-                        english_meanings = []
-                        hangul_pronunciations = []
-                        hanja_word = focus_word
-                        if "args" in head_template:
-                            head_template_args: Dict = head_template["args"]
-                            if 'hangul' in head_template_args:
-                                hangul_pronunciations.append(head_template_args["hangeul"])
-                        if "forms" in word:
-                            forms: List[Dict] = word["forms"]
-                            for form in forms:
-                                if 'hangeul' in form['tags'] and 'form' in form:
-                                    hangul_pronunciations.append(form['form'])
-                        if 'senses' in word:
-                            senses = word['senses']
-                            for sense in senses:
-                                if 'links' in sense:
-                                    links = sense['links']
-                                    english_meanings += english_meanings_from_links(links)
-                                    hangul_pronunciations += [link[0] for link in links if is_hangul(link[1].replace('#Korean', ""))]
-                                if len(set(hangul_pronunciations)) < 1:
-                                    print("got less than 1 hangul pronunciation")
-                                    print(hangul_pronunciations)
-                                    continue
-                                if 'glosses' in sense:
-                                    glosses += sense['glosses']
-                                upsert_korean_word(sino_korean_nouns, hanja_word, hangul_pronunciations[0], english_meanings, glosses, type_to_pos[head_template_name])
-    print(f"Acquired {len(sino_korean_nouns)} unique Hanja-based Korean words.")
+    if extractions is None:
+        # The decompressed size of a compressed dump is not known up front.
+        total_bytes = None if is_compressed(in_filename) else os.path.getsize(in_filename)
+        with instrumentation.stage("extract", total_bytes=total_bytes) as progress:
+            if manifest_path is not None:
+                extractions = extract_file_incrementally(in_filename, manifest_path, decoder_name, progress, input_digest)
+            else:
+                extractions = extract_file(in_filename, jobs, show_head_templates, decoder_name, progress)
+        print(f"Parsed all {extractions.n_words} lines of {in_filename}.")
+        if cache_path is not None:
+            with instrumentation.stage("save cache"):
+                save_cached_extractions(cache_path, input_digest, extractions)
 
-    print(f"Parsing Sino-Korean nouns.")
-    n_new_characters = 0
-    n_new_sino_korean_nouns = 0
-    for word in word_reader(in_filename):
-        if "head_templates" in word:
-            head_templates: List[Dict] = word["head_templates"]
-            for head_template in head_templates:
-                head_template_name = head_template["name"]
-                if head_template_name in ("ko-noun", "ko-proper noun", "ko-num"):
-                    focus_word = word["word"]
-                    if is_hangul(focus_word):
-                        glosses = []
-                        english_meanings = []
-                        hangul_pronunciations = []
-                        if "forms" in word:
-                            forms: List[Dict] = word["forms"]
-                            maybe_hanja_word: Optional[str] = None
-                            for form in forms:
-                                if 'hanja' in form['tags'] and 'form' in form:
-                                    maybe_hanja_word = form['form']
-                            # Handle the case where the noun has Hanja roots
-                            if maybe_hanja_word is not None:
-                                hangul_word = focus_word
-                                english_meanings = english_meanings_from_word(word)
-                                glosses = glosses_from_word(word)
-                                if maybe_hanja_word not in hanja_characters and len(maybe_hanja_word) == 1:
-                                    add_hanja_character(hanja_characters, maybe_hanja_word, hangul_word, glosses, [hangul_word], english_meanings)
-                                    n_new_characters += 1
-                                upsert_korean_word(sino_korean_nouns, maybe_hanja_word, hangul_word, english_meanings, glosses, type_to_pos[head_template_name])
-                                n_new_sino_korean_nouns += 1
-    print(f"Acquired {n_new_sino_korean_nouns} new pure Sion-Korean nouns and {n_new_characters} new Hanja.")
-    
-    print(f"Parsing pure Korean nouns.")
-    pure_korean_nouns: Dict[Optional[str], Dict[str, KoreanWord]] = {}
-    for word in word_reader(in_filename):
-        if "head_templates" in word:
-            head_templates: List[Dict] = word["head_templates"]
-            for head_template in head_templates:
-                head_template_name = head_template["name"]
-                if head_template_name in ("ko-noun", "ko-proper noun", "ko-num"):
-                    focus_word = word["word"]
-                    if is_hangul(focus_word):
-                        if "forms" in word:
-                            forms: List[Dict] = word["forms"]
-                            maybe_hanja_word: Optional[str] = None
-                            for form in forms:
-                                if 'hanja' in form['tags'] and 'form' in form:
-                                    maybe_hanja_word = form['form']
-                            # Handle the case where the noun has Hanja roots
-                            if maybe_hanja_word is None:
-                                # process a pure Korean noun
-                                hangul_word = focus_word
-                                glosses = [] 
-                                english_meanings = english_meanings_from_word(word)
-                                glosses = glosses_from_word(word)
-                                upsert_korean_word(pure_korean_nouns, None, hangul_word, english_meanings, glosses, type_to_pos[head_template_name])
-    print(f"Acquired {len(pure_korean_nouns[None])} new pure Korean nouns.")
-    
-    print(f"Parsing Sino-Korean verbs, adjectives and parts of speech.")
-    for word in word_reader(in_filename):
-        if "head_templates" in word:
-            head_templates: List[Dict] = word["head_templates"]
-            for head_template in head_templates:
-                head_template_name = head_template["name"]
-                if head_template_name in ("ko-verb", "ko-adv", "ko-determ", "ko-adj", "ko-adverb", "ko-det", "ko-adjective"):
-                    focus_word = word["word"]
-                    if "forms" in word:
-                        forms: List[Dict] = word["forms"]
-                        maybe_hanja_word: Optional[str] = None
-                        for form in forms:
-                            if 'hanja' in form['tags'] and 'form' in form:
-                                maybe_hanja_word = form['form']
-                        # Handle the case where the noun has Hanja roots
-                        if maybe_hanja_word is not None:
-                            maybe_hanja_word = strip_common_verb_suffixes(maybe_hanja_word)
-                            maybe_hangul_word = strip_common_verb_suffixes(focus_word)
-                            # ugly as hell, but this is an important word
-                            if maybe_hangul_word == '원래':
-                                for maybe_hanja_word in ["元來", "原來"]:
-                                    english_meanings = english_meanings_from_word(word)
-                                    glosses = glosses_from_word(word)
-                                    upsert_korean_word(sino_korean_nouns, maybe_hanja_word, maybe_hangul_word, english_meanings, glosses, type_to_pos[head_template_name])
-                                continue
-                            if len(maybe_hanja_word) != len(maybe_hangul_word):
-                                print('Warning: ignoring word "' + focus_word + '"')
-                                print(json.dumps(word, ensure_ascii=False, indent=1))
-                            else:
-                                english_meanings = english_meanings_from_word(word)
-                                glosses = glosses_from_word(word)
-                                upsert_korean_word(sino_korean_nouns, maybe_hanja_word, maybe_hangul_word, english_meanings, glosses, type_to_pos[head_template_name])
-    print(f"Now at {len(sino_korean_nouns)} Sino-Korean nouns after parsing Sino-korean verbs.")
-    
-    print(f"Parsing pure Korean verbs, adjectives and parts of speech.")
-    pure_korean_verbs: Dict[Optional[str], Dict[str, KoreanWord]] = {}
-    for word in word_reader(in_filename):
-        if "head_templates" in word:
-            head_templates: List[Dict] = word["head_templates"]
-            for head_template in head_templates:
-                head_template_name = head_template["name"]
-                if head_template_name in ("ko-verb", "ko-adv", "ko-determ", "ko-adj", "ko-verb-set", "ko-adverb", "ko-det", "ko-adjective"):
-                    focus_word = word["word"]
-                    if "forms" in word:
-                        forms: List[Dict] = word["forms"]
-                        maybe_hanja_word: Optional[str] = None
-                        for form in forms:
-                            if 'hanja' in form['tags'] and 'form' in form:
-                                maybe_hanja_word = form['form']
-                        # Handle the case where the noun has Hanja roots
-                        if maybe_hanja_word is None:
-                            hangul_word = focus_word
-                            if dict_contains_hangul_word(sino_korean_nouns, hangul_word):
-                                continue
-                            english_meanings = english_meanings_from_word(word)
-                            glosses = glosses_from_word(word)
-                            upsert_korean_word(pure_korean_verbs, None, hangul_word, english_meanings, glosses, type_to_pos[head_template_name])
-    print(f"Acquired {len(pure_korean_verbs[None])} pure Korean verbs.")
+    dictionaries = build_dictionaries(extractions)
+    hanja_characters = dictionaries.hanja_characters
 
     hanja_english_definitions_path = os.path.join(out_directory, "english_hanja_definition.sql");
     print(f"Writing Hanja English definitions to {hanja_english_definitions_path}.")
-    build_hanja_english_definition_file(hanja_english_definitions_path, hanja_characters)
+    with instrumentation.stage("build_hanja_english_definition_file"):
+        build_hanja_english_definition_file(hanja_english_definitions_path, hanja_characters, rows_per_statement)
 
     korean_pronunciation_path = os.path.join(out_directory, "korean_pronunciation.sql");
     print(f"Writing Hanja Korean pronuncations to {korean_pronunciation_path}.")
-    build_korean_pronunciation_file(korean_pronunciation_path, hanja_characters)
+    with instrumentation.stage("build_korean_pronunciation_file"):
+        build_korean_pronunciation_file(korean_pronunciation_path, hanja_characters, rows_per_statement)
 
     korean_english_definitions_path = os.path.join(out_directory, "korean_hanja_definition.sql");
     print(f"Writing Hanja Korean definitions to {korean_english_definitions_path}.")
-    build_hanja_korean_definition_file(korean_english_definitions_path, hanja_characters)
+    with instrumentation.stage("build_hanja_korean_definition_file"):
+        build_hanja_korean_definition_file(korean_english_definitions_path, hanja_characters, rows_per_statement)
 
     word_list_path = os.path.join(out_directory, "word_list.sql");
-    build_word_list(word_list_path, [sino_korean_nouns, pure_korean_verbs, pure_korean_nouns])
+    with instrumentation.stage("build_word_list"):
+        build_word_list(word_list_path, [dictionaries.sino_korean_nouns, dictionaries.pure_korean_verbs, dictionaries.pure_korean_nouns], rows_per_statement)
     print(f"Writing word definitions to {word_list_path}.")
+
+    instrumentation.report()
+    if timings_path is not None:
+        instrumentation.write_json(timings_path)
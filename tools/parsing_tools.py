@@ -1,212 +1,649 @@
 #!/usr/bin/env python3
 
 # Standard library
-from typing import Dict, List, Set, Optional
+from types import ModuleType
+from typing import Callable, Dict, Iterable, List, Set, Optional, Tuple, Union
 from dataclasses import dataclass
+import argparse
+import bz2
+import contextlib
+import cProfile
+import gzip
+import io
+import itertools
+import json
+import lzma
+import mmap
+import os
+import re
+import sys
+import time
 
-# pip
-import regex
+# pip, optional
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from character_classes import is_hangul
+from hanja_alignment import align_hanja_batch, hanja_character_positions
+from suffix_stripping import common_verb_suffixes
+
+# Hundreds of thousands of meaning collections are held at once while parsing,
+# and nearly all of them are only ever filled once. They are kept as tuples of
+# interned strings until they are updated a second time, and only then become
+# sets. Use update_meanings to add to them and iterate_meanings to read them.
+Meanings = Union[Tuple[str, ...], Set[str]]
+
+def update_meanings(meanings: Meanings, new_meanings: Iterable[str]):
+    # Most words come without glosses, this skips building anything for them.
+    if not new_meanings:
+        return meanings
+    if isinstance(meanings, tuple):
+        if len(meanings) == 0:
+            return tuple(dict.fromkeys(map(sys.intern, new_meanings)))
+        new_meanings = list(new_meanings)
+        if len(new_meanings) == 0:
+            return meanings
+        meanings = set(meanings)
+    meanings.update(map(sys.intern, new_meanings))
+    return meanings
+
+# Tuples are iterated through a set, so that meanings are emitted in the same
+# order as if they had always been stored as sets.
+def iterate_meanings(meanings: Meanings):
+    if isinstance(meanings, tuple):
+        return set(meanings)
+    return meanings
 
 class HanjaCharacterEntry:
+    __slots__ = ("english_meanings", "korean_meanings", "glosses")
     def __init__(self):
-        self.english_meanings = set()
-        self.korean_meanings = set()
-        self.glosses = set()
-    english_meanings: Set[str]
-    korean_meanings: Set[str]
-    glosses: Set[str]
+        self.english_meanings = ()
+        self.korean_meanings = ()
+        self.glosses = ()
+    english_meanings: Meanings
+    korean_meanings: Meanings
+    glosses: Meanings
 
-@dataclass
 class KoreanWord:
+    __slots__ = ("korean_word", "english_meanings", "glosses", "hanja", "part_of_speech")
+    def __init__(self, korean_word: str, english_meanings: Meanings, glosses: Meanings, hanja: Optional[str], part_of_speech: str):
+        self.korean_word = korean_word
+        self.english_meanings = english_meanings
+        self.glosses = glosses
+        self.hanja = hanja
+        self.part_of_speech = part_of_speech
     korean_word: str
-    english_meanings: Set[str]
-    glosses: Set[str]
+    english_meanings: Meanings
+    glosses: Meanings
     hanja: Optional[str]
     part_of_speech: str
 
-def is_hangul(value: str):
-    if regex.search(r'\p{IsHangul}', value.replace(" ", "")):
-        return True
-    return False
+# Korean words keyed by hanja (None for pure Korean words) and then by hangul.
+# The set of every hangul stored is kept up to date as words are added, so
+# checking whether a word is there by its hangul does not need to scan every
+# entry. Words must be added through add_word (or upsert_korean_word) for the
+# set to stay correct.
+class KoreanWordDictionary:
+    def __init__(self):
+        self.words: Dict[Optional[str], Dict[str, KoreanWord]] = {}
+        self.hangul_words: Set[str] = set()
+
+    def __iter__(self):
+        return iter(self.words)
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, hanja: Optional[str]):
+        return hanja in self.words
+
+    def __getitem__(self, hanja: Optional[str]):
+        return self.words[hanja]
+
+    def get_word(self, hanja: Optional[str], hangul: str):
+        if hanja not in self.words:
+            return None
+        return self.words[hanja].get(hangul)
+
+    def add_word(self, word: KoreanWord):
+        if word.hanja not in self.words:
+            self.words[word.hanja] = {}
+        self.words[word.hanja][word.korean_word] = word
+        self.hangul_words.add(word.korean_word)
+
+    def contains_hangul(self, hangul: str):
+        return hangul in self.hangul_words
 
 def add_hanja_character(hanja_characters: Dict[str, Dict[str, HanjaCharacterEntry]], hanja_word: str, hangul_pronunciations: List[str], glosses: List[str], korean_meanings: List[str], english_meanings: List[str]):
     if hanja_word not in hanja_characters:
-        hanja_characters[hanja_word] = {}
+        hanja_characters[sys.intern(hanja_word)] = {}
     for hangul_pronunciation in set(hangul_pronunciations):
         if hangul_pronunciation not in hanja_characters[hanja_word]:
-            hanja_characters[hanja_word][hangul_pronunciation] = HanjaCharacterEntry()
-        hanja_characters[hanja_word][hangul_pronunciation].english_meanings.update(english_meanings)
-        hanja_characters[hanja_word][hangul_pronunciation].korean_meanings.update(korean_meanings)
-        hanja_characters[hanja_word][hangul_pronunciation].korean_meanings.update(glosses)
+            hanja_characters[hanja_word][sys.intern(hangul_pronunciation)] = HanjaCharacterEntry()
+        entry = hanja_characters[hanja_word][hangul_pronunciation]
+        entry.english_meanings = update_meanings(entry.english_meanings, english_meanings)
+        entry.korean_meanings = update_meanings(entry.korean_meanings, korean_meanings)
+        entry.korean_meanings = update_meanings(entry.korean_meanings, glosses)
+
+# Compressed inputs are decompressed on the fly, picked by their extension.
+# zstandard only provides a raw, unbuffered reader, which cannot read lines.
+def open_zstandard(file_name: str, mode: str = "rb", **kwargs):
+    if zstandard is None:
+        raise ValueError(f"Reading {file_name} needs the zstandard package")
+    f = io.BufferedReader(zstandard.open(file_name, "rb"))
+    if "t" in mode:
+        return io.TextIOWrapper(f, **kwargs)
+    return f
+
+COMPRESSED_OPENERS = {
+        ".gz": gzip.open,
+        ".bz2": bz2.open,
+        ".xz": lzma.open,
+        ".zst": open_zstandard,
+        }
+
+def is_compressed(file_name: str):
+    return os.path.splitext(file_name)[1] in COMPRESSED_OPENERS
+
+def open_input(file_name: str, mode: str = "rb", **kwargs):
+    opener = COMPRESSED_OPENERS.get(os.path.splitext(file_name)[1], open)
+    return opener(file_name, mode, **kwargs)
+
+# Compressed streams can only be read forward, so seeking into them means
+# decompressing and dropping everything before the position.
+def skip_bytes(f, n_bytes: int):
+    while n_bytes > 0:
+        block = f.read(min(n_bytes, 1 << 20))
+        if not block:
+            break
+        n_bytes -= len(block)
+
+# Splits a line-oriented file into n_shards (start, end) byte ranges. Every
+# boundary falls at the start of a line, so each line belongs to exactly one
+# shard and the shards concatenated in order cover the whole file. Compressed
+# files cannot be split without decompressing them up to every boundary, so
+# they are read as a whole instead.
+def shard_byte_ranges(file_name: str, n_shards: int):
+    if is_compressed(file_name):
+        raise ValueError(f"Cannot split the compressed file {file_name} into shards")
+    file_size = os.path.getsize(file_name)
+    boundaries = [0]
+    with open(file_name, "rb") as f:
+        for i in range(1, n_shards):
+            split = file_size * i // n_shards
+            # The previous shard already reaches past this point.
+            if split <= boundaries[-1]:
+                boundaries.append(boundaries[-1])
+                continue
+            f.seek(split - 1)
+            f.readline()
+            boundaries.append(min(f.tell(), file_size))
+    boundaries.append(file_size)
+    return [(boundaries[i], boundaries[i + 1]) for i in range(n_shards) if boundaries[i] < boundaries[i + 1]]
+
+# Yields the raw lines starting within [start, end) of a file, or up to its
+# end. Uncompressed files are memory-mapped, which reads lines faster than a
+# buffered file does.
+def read_byte_range(file_name: str, start: int = 0, end: Optional[int] = None):
+    if is_compressed(file_name):
+        with open_input(file_name) as f:
+            skip_bytes(f, start)
+            position = start
+            for line in f:
+                if end is not None and position >= end:
+                    break
+                position += len(line)
+                yield line
+        return
+    with open(file_name, "rb") as f:
+        # Empty files cannot be mapped.
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            if end is None:
+                end = len(m)
+            m.seek(start)
+            while m.tell() < end:
+                yield m.readline()
+
+# Instrumentation shared by the parsers. Each stage of a run reports its
+# progress (records and bytes consumed, records per second and an ETA) on
+# stderr while it runs, and its totals are kept for a JSON report at the end.
+# Optionally, every stage is profiled with cProfile, and the hot helpers below
+# are wrapped to count their calls and the time spent in them. Worker processes
+# count their own calls, which are lost with them, so with several jobs the
+# counts are of the parent process only.
+PROGRESS_INTERVAL_SECONDS = 5.0
+HOT_HELPERS = ["is_hangul", "upsert_korean_word", "merge_korean_word", "add_hanja_character", "align_hanja", "align_hanja_batch", "strip_common_verb_suffixes", "strip_all_common_verb_suffixes", "dict_contains_hangul_word"]
+
+class StageProgress:
+    def __init__(self, name: str, total_records: Optional[int] = None, total_bytes: Optional[int] = None):
+        self.name = name
+        self.total_records = total_records
+        self.total_bytes = total_bytes
+        self.records = 0
+        self.bytes = 0
+        self.start = time.perf_counter()
+        self.last_report = self.start
+
+    def update(self, records: int = 1, n_bytes: int = 0):
+        self.records += records
+        self.bytes += n_bytes
+        now = time.perf_counter()
+        if now - self.last_report >= PROGRESS_INTERVAL_SECONDS:
+            self.last_report = now
+            self.report(now)
+
+    def fraction_done(self):
+        if self.total_bytes:
+            return self.bytes / self.total_bytes
+        if self.total_records:
+            return self.records / self.total_records
+        return None
+
+    def report(self, now: float):
+        elapsed = now - self.start
+        message = f"[{self.name}] {self.records} records, {self.records / elapsed:.0f} records/s"
+        if self.bytes > 0:
+            message += f", {self.bytes / 2**20:.1f} MB"
+        fraction_done = self.fraction_done()
+        if fraction_done:
+            message += f", {fraction_done:.1%} done, ETA {elapsed * (1 - fraction_done) / fraction_done:.0f} s"
+        print(message, file=sys.stderr)
+
+def track_lines(lines: Iterable[bytes], progress: StageProgress):
+    for line in lines:
+        progress.update(1, len(line))
+        yield line
+
+class Instrumentation:
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.helpers: Dict[str, List[float]] = {}
+        self.profile_directory: Optional[str] = None
+        self.jobs = 1
+
+    @contextlib.contextmanager
+    def stage(self, name: str, total_records: Optional[int] = None, total_bytes: Optional[int] = None):
+        progress = StageProgress(name, total_records, total_bytes)
+        profiler = None
+        if self.profile_directory is not None:
+            profiler = cProfile.Profile()
+            profiler.enable()
+        try:
+            yield progress
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                profiler.dump_stats(os.path.join(self.profile_directory, name.replace(" ", "_") + ".prof"))
+            seconds = time.perf_counter() - progress.start
+            self.stages[name] = {
+                    "seconds": seconds,
+                    "records": progress.records,
+                    "bytes": progress.bytes,
+                    "records_per_second": progress.records / seconds if seconds > 0 else 0,
+                    }
+
+    def timed_helper(self, name: str, function: Callable):
+        if name not in self.helpers:
+            self.helpers[name] = [0, 0.0]
+        stats = self.helpers[name]
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                stats[0] += 1
+                stats[1] += time.perf_counter() - start
+        timed.instrumented = True
+        return timed
+
+    # The helpers are looked up by name at call time, so they have to be
+    # replaced in every module that imported them, not only in this one.
+    def instrument_helpers(self, modules: List[ModuleType]):
+        for module in [sys.modules[__name__]] + modules:
+            for name in HOT_HELPERS:
+                function = getattr(module, name, None)
+                if function is None or getattr(function, "instrumented", False):
+                    continue
+                setattr(module, name, self.timed_helper(name, function))
+
+    def enable_profiling(self, profile_directory: str, modules: List[ModuleType], jobs: int = 1):
+        os.makedirs(profile_directory, exist_ok=True)
+        self.profile_directory = profile_directory
+        self.jobs = jobs
+        self.instrument_helpers(modules)
+
+    def report(self):
+        if self.helpers and self.jobs > 1:
+            print(f"Helper calls of the parent process only, not of its {self.jobs} workers:", file=sys.stderr)
+        for name, helper in self.helpers.items():
+            print(f"{name}: {helper[0]} calls, {helper[1]:.2f} s", file=sys.stderr)
+
+    def write_json(self, file_path: str):
+        with open(file_path, "w") as f:
+            json.dump({
+                "stages": self.stages,
+                "helpers": {name: {"calls": helper[0], "seconds": helper[1]} for name, helper in self.helpers.items()},
+                "helpers_parent_only": self.jobs > 1,
+                }, f, indent=2)
+
+instrumentation = Instrumentation()
 
 def sanitize(input_string: str):
     return input_string.replace("'","''")
 
-def build_hanja_english_definition_file(file_path: str, hanja_characters: Dict[str, Dict[str, HanjaCharacterEntry]]):
-    with open(file_path, "w") as f:
-        f.write("INSERT INTO `english_hanja_definition` VALUES\n");
-        lines = []
-        for hanja in hanja_characters:
-            if len(hanja) != 1:
+# Rows are written as they are generated rather than collected first, so the
+# whole file never has to be held in memory. By default each file is a single
+# INSERT statement; rows_per_statement splits it into several statements of at
+# most that many rows, to keep each one within SQLite's statement size limits.
+SQL_WRITE_BUFFER_SIZE = 1 << 20
+SQL_WRITE_BATCH_ROWS = 4096
+
+SqlValue = Union[str, int, float, None]
+
+def format_sql_value(value: SqlValue):
+    if value is None:
+        return "NULL"
+    if isinstance(value, (int, float)):
+        return str(value)
+    return "'" + value.replace("'", "''") + "'"
+
+# Escaping the joined row in one go is much faster than escaping every value;
+# the NUL separator cannot occur in the data. Rows containing anything but
+# strings cannot be joined and are formatted value by value.
+def format_sql_row(row: Tuple[SqlValue, ...]):
+    try:
+        return "('" + "\0".join(row).replace("'", "''").replace("\0", "', '") + "')"
+    except TypeError:
+        return "(" + ", ".join([format_sql_value(value) for value in row]) + ")"
+
+def write_insert_statements(f, table_name: str, rows: Iterable[Tuple[SqlValue, ...]], rows_per_statement: Optional[int] = None):
+    if rows_per_statement is not None and rows_per_statement < 1:
+        raise ValueError(f"Cannot write {rows_per_statement} rows per statement, it has to be at least 1")
+    header = f"INSERT INTO `{table_name}` VALUES\n"
+    footer = "\nON CONFLICT DO NOTHING;"
+    formatted_rows = map(format_sql_row, rows)
+    n_statements = 0
+    n_statement_rows = 0
+    while True:
+        batch_size = SQL_WRITE_BATCH_ROWS
+        if rows_per_statement is not None:
+            batch_size = min(batch_size, rows_per_statement - n_statement_rows)
+        batch = list(itertools.islice(formatted_rows, batch_size))
+        if len(batch) == 0:
+            break
+        if n_statement_rows == 0:
+            if n_statements > 0:
+                f.write("\n")
+            f.write(header)
+            n_statements += 1
+        else:
+            f.write(",\n")
+        f.write(",\n".join(batch))
+        n_statement_rows += len(batch)
+        if n_statement_rows == rows_per_statement:
+            f.write(footer)
+            n_statement_rows = 0
+    if n_statements == 0:
+        f.write(header)
+    if n_statement_rows > 0 or n_statements == 0:
+        f.write(footer)
+
+# An argparse type for options like --rows-per-statement.
+def positive_int(value: str):
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value} is not an integer")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return number
+
+def write_sql_file(file_path: str, table_name: str, rows: Iterable[Tuple[SqlValue, ...]], rows_per_statement: Optional[int] = None):
+    with open(file_path, "w", buffering=SQL_WRITE_BUFFER_SIZE) as f:
+        write_insert_statements(f, table_name, rows, rows_per_statement)
+
+# Reads back the seed files written above (or by hand) without going through
+# SQLite: a streaming tokenizer for INSERT INTO ... VALUES (...), (...)
+# [ON CONFLICT DO NOTHING]; statements, yielding every row as a tuple of str,
+# int, float or None. Quotes escaped as '' are unescaped and values may span
+# lines. Expressions such as datetime('now') are not evaluated; use
+# build_database.read_seed_rows for seeds containing them.
+SQL_READ_CHUNK_SIZE = 1 << 20
+# A value is matched together with the "(" opening its row, if it is the first,
+# and the separator or ")" after it, so that a row of n values takes n matches.
+# A value is only matched once its separator has been read, so a match never
+# stops early at the end of a chunk, like a number cut in half would.
+SQL_TOKEN_PATTERN = re.compile(r"""\s*(?:
+    (\()?\s*
+    (?:'([^']*(?:''[^']*)*)'|(NULL)\b|(-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?))
+    \s*(?:,|(\))\s*,?)
+    |INSERT\s+INTO\s+[`"]?\w+[`"]?\s+VALUES\b
+    |ON\s+CONFLICT\s+DO\s+NOTHING\b
+    |[,;]
+    )""", re.VERBOSE | re.IGNORECASE)
+
+def parse_sql_rows(chunks: Iterable[str]):
+    chunks = iter(chunks)
+    buffer = ""
+    position = 0
+    row: Optional[List[SqlValue]] = None
+    match_token = SQL_TOKEN_PATTERN.match
+    while True:
+        match = match_token(buffer, position)
+        if match is None:
+            chunk = next(chunks, None)
+            if chunk is not None:
+                buffer = buffer[position:] + chunk
+                position = 0
                 continue
-            for hangul in hanja_characters[hanja]:
-                if len(hangul) != 1:
-                    continue
-                if not is_hangul(hangul):
-                    continue
-                if len(hanja_characters[hanja][hangul].english_meanings) > 0:
-                    for english_meaning in hanja_characters[hanja][hangul].english_meanings:
-                        sanitized_english_meaning = sanitize(english_meaning)
-                        lines.append(f"('{hanja}', '{sanitized_english_meaning}')");
-                elif len(hanja_characters[hanja][hangul].glosses) > 0:
-                    for gloss in hanja_characters[hanja][hangul].glosses:
-                        sanitized_gloss = sanitize(gloss)
-                        lines.append(f"('{hanja}', '{sanitized_gloss}')");
-        f.write(',\n'.join(lines))
-        f.write('\nON CONFLICT DO NOTHING;')
-
-def build_korean_pronunciation_file(file_path: str, hanja_characters: Dict[str, Dict[str, HanjaCharacterEntry]]):
-    with open(file_path, "w") as f:
-        f.write("INSERT INTO `korean_pronunciation` VALUES\n");
-        lines = []
-        for hanja in hanja_characters:
-            if len(hanja) != 1:
+            if row is None and buffer[position:].strip() == "":
+                return
+            raise ValueError(f"Could not parse SQL at: {buffer[position:position + 80]!r}")
+        position = match.end()
+        row_start, string, null, number, row_end = match.groups()
+        if row_start is not None:
+            if row is not None:
+                raise ValueError(f"Unexpected '(' in a row at: {buffer[match.start():match.start() + 80]!r}")
+            row = []
+        elif row is None:
+            # INSERT INTO, ON CONFLICT DO NOTHING or a separator.
+            if string is None and null is None and number is None:
                 continue
-            for hangul in hanja_characters[hanja]:
-                if len(hangul) != 1:
-                    continue
-                if not is_hangul(hangul):
-                    continue
-                lines.append(f"('{hanja}', '{hangul}')");
-        f.write(',\n'.join(lines))
-        f.write('\nON CONFLICT DO NOTHING;')
-
-def build_hanja_korean_definition_file(file_path: str, hanja_characters: Dict[str, Dict[str, HanjaCharacterEntry]]):
-    with open(file_path, "w") as f:
-        f.write("INSERT INTO `korean_hanja_definition` VALUES\n");
-        lines = []
-        for hanja in hanja_characters:
-            if len(hanja) != 1:
-                print("Warning: Hanja did not have size 1: '" + hanja + "'")
+            raise ValueError(f"Value outside of a row at: {buffer[match.start():match.start() + 80]!r}")
+        if string is not None:
+            if "''" in string:
+                string = string.replace("''", "'")
+            row.append(string)
+        elif number is not None:
+            row.append(float(number) if "." in number or "e" in number or "E" in number else int(number))
+        else:
+            row.append(None)
+        if row_end is not None:
+            yield tuple(row)
+            row = None
+
+def read_sql_rows(file_path: str):
+    with open(file_path, "r", encoding="utf-8") as f:
+        yield from parse_sql_rows(iter(lambda: f.read(SQL_READ_CHUNK_SIZE), ""))
+
+def hanja_english_definition_rows(hanja_characters: Dict[str, Dict[str, HanjaCharacterEntry]]):
+    for hanja in hanja_characters:
+        if len(hanja) != 1:
+            continue
+        for hangul in hanja_characters[hanja]:
+            if len(hangul) != 1:
                 continue
-            for hangul in hanja_characters[hanja]:
-                if len(hanja_characters[hanja][hangul].korean_meanings) > 0:
-                    for korean_meaning in hanja_characters[hanja][hangul].korean_meanings:
-                        lines.append(f"('{hanja}', '{sanitize(korean_meaning)}')");
-                else:
-                    print(f"Warning: no korean meanings or glosses for {hanja},{hangul}")
-                    continue
-        f.write(',\n'.join(lines))
-        f.write('\nON CONFLICT DO NOTHING;')
+            if not is_hangul(hangul):
+                continue
+            if len(hanja_characters[hanja][hangul].english_meanings) > 0:
+                for english_meaning in iterate_meanings(hanja_characters[hanja][hangul].english_meanings):
+                    yield (hanja, english_meaning)
+            elif len(hanja_characters[hanja][hangul].glosses) > 0:
+                for gloss in iterate_meanings(hanja_characters[hanja][hangul].glosses):
+                    yield (hanja, gloss)
 
-def build_word_list(file_path: str, word_lists: List[Dict[Optional[str], Dict[str, KoreanWord]]]):
-    with open(file_path, "w") as f:
-        f.write("INSERT INTO `word_list` VALUES\n");
-        lines = []
-        for word_list in word_lists:
-            for hanja in word_list:
-                for hangul in word_list[hanja]:
-                    if len(word_list[hanja][hangul].english_meanings) > 0:
-                        for english_meaning in word_list[hanja][hangul].english_meanings:
-                            sanitized_english_meaning = sanitize(english_meaning)
-                            if hanja is not None and len(hanja) != len(hangul):
-                                print(f"warning, not processing, hanja='{hanja}', hangul='{hangul}'")
-                                continue
-                            if hanja is None:
-                                lines.append(f"(NULL, '{hangul}', '{sanitized_english_meaning}', '{word_list[hanja][hangul].part_of_speech}')");
-                            else:
-                                lines.append(f"('{hanja}', '{hangul}', '{sanitized_english_meaning}', '{word_list[hanja][hangul].part_of_speech}')");
-                    elif len(word_list[hanja][hangul].glosses) > 0:
-                        for gloss in word_list[hanja][hangul].glosses:
-                            sanitized_gloss = sanitize(gloss)
-                            if hanja is not None and len(hanja) != len(hangul):
-                                print(f"warning, not processing, hanja='{hanja}', hangul='{hangul}'")
-                                continue
-                            if hanja is None:
-                                lines.append(f"(NULL, '{hangul}', '{sanitized_gloss}', '{word_list[hanja][hangul].part_of_speech}')");
-                            else:
-                                lines.append(f"('{hanja}', '{hangul}', '{sanitized_gloss}', '{word_list[hanja][hangul].part_of_speech}')");
-                    else:
-                        continue
-        f.write(',\n'.join(lines))
-        f.write('\nON CONFLICT DO NOTHING;')
-
-
-def add_spaces_to_hanja(hanja: Optional[str], hangul: str):
-    if hanja is None:
-        return hanja
-    #  For cases like this:
-    # 歸還不能地點']
-    # 귀환 불능 지점
-    new_hanja = ""
-    i = 0
-    for char in hangul:
-        if char != ' ' and i < len(hanja):
-            new_hanja += hanja[i]
-            i += 1
-        else:
-            new_hanja += ' '
-    return new_hanja
+def build_hanja_english_definition_file(file_path: str, hanja_characters: Dict[str, Dict[str, HanjaCharacterEntry]], rows_per_statement: Optional[int] = None):
+    write_sql_file(file_path, "english_hanja_definition", hanja_english_definition_rows(hanja_characters), rows_per_statement)
+
+def korean_pronunciation_rows(hanja_characters: Dict[str, Dict[str, HanjaCharacterEntry]]):
+    for hanja in hanja_characters:
+        if len(hanja) != 1:
+            continue
+        for hangul in hanja_characters[hanja]:
+            if len(hangul) != 1:
+                continue
+            if not is_hangul(hangul):
+                continue
+            yield (hanja, hangul)
+
+def build_korean_pronunciation_file(file_path: str, hanja_characters: Dict[str, Dict[str, HanjaCharacterEntry]], rows_per_statement: Optional[int] = None):
+    write_sql_file(file_path, "korean_pronunciation", korean_pronunciation_rows(hanja_characters), rows_per_statement)
+
+def hanja_korean_definition_rows(hanja_characters: Dict[str, Dict[str, HanjaCharacterEntry]]):
+    for hanja in hanja_characters:
+        if len(hanja) != 1:
+            print("Warning: Hanja did not have size 1: '" + hanja + "'")
+            continue
+        for hangul in hanja_characters[hanja]:
+            if len(hanja_characters[hanja][hangul].korean_meanings) > 0:
+                for korean_meaning in iterate_meanings(hanja_characters[hanja][hangul].korean_meanings):
+                    yield (hanja, korean_meaning)
+            else:
+                print(f"Warning: no korean meanings or glosses for {hanja},{hangul}")
+                continue
+
+def build_hanja_korean_definition_file(file_path: str, hanja_characters: Dict[str, Dict[str, HanjaCharacterEntry]], rows_per_statement: Optional[int] = None):
+    write_sql_file(file_path, "korean_hanja_definition", hanja_korean_definition_rows(hanja_characters), rows_per_statement)
 
-def upsert_korean_word(word_dict: Dict[Optional[str], Dict[str,KoreanWord]], hanja_word: Optional[str], hangul_word: str, english_meanings: List[str], glosses: List[str], part_of_speech: str):
-    hanja_words_to_add = []
-    if hanja_word is None:
-        hanja_words_to_add = [None]
+# English meanings are preferred, falling back to the glosses.
+def word_definitions(word: KoreanWord):
+    if len(word.english_meanings) > 0:
+        return word.english_meanings
+    return word.glosses
+
+def word_rows(hanja: Optional[str], hangul: str, word: KoreanWord):
+    for definition in iterate_meanings(word_definitions(word)):
+        if hanja is not None and len(hanja) != len(hangul):
+            print(f"warning, not processing, hanja='{hanja}', hangul='{hangul}'")
+            continue
+        yield (hanja, hangul, definition, word.part_of_speech)
+
+# Words are ranked by signals already in the dumps, most first: how many
+# sources have the word, how many distinct definitions it has, and how many
+# sibling words share one of its hanja characters (counted once per shared
+# character). Ties go to shorter words. Rank 1 is the top word. The words of a
+# single source, before the merge, have no source count and are ranked on the
+# other signals only.
+@dataclass
+class WordRank:
+    hanja: Optional[str]
+    hangul: str
+    definitions: int
+    siblings: int
+    sources: Optional[int]
+
+def rank_words(n_definitions_by_word: Dict[Tuple[Optional[str], str], int], n_sources_by_word: Optional[Dict[Tuple[Optional[str], str], int]] = None):
+    characters_by_word: Dict[Tuple[Optional[str], str], Set[str]] = {}
+    n_words_by_character: Dict[str, int] = {}
+    for hanja, hangul in n_definitions_by_word:
+        if hanja is None:
+            continue
+        characters = set(hanja.replace(" ", ""))
+        characters_by_word[(hanja, hangul)] = characters
+        for character in characters:
+            n_words_by_character[character] = n_words_by_character.get(character, 0) + 1
+    ranks: List[WordRank] = []
+    for (hanja, hangul), definitions in n_definitions_by_word.items():
+        siblings = sum(n_words_by_character[character] - 1 for character in characters_by_word.get((hanja, hangul), ()))
+        sources = None if n_sources_by_word is None else n_sources_by_word[(hanja, hangul)]
+        ranks.append(WordRank(hanja, hangul, definitions, siblings, sources))
+    if n_sources_by_word is None:
+        ranks.sort(key=lambda rank: (-rank.definitions, -rank.siblings, len(rank.hangul), rank.hangul, rank.hanja or ""))
     else:
-        hanja_words_to_add = [hanja_word]
-        if len(hanja_word.split('／')) > 0:
-                hanja_words_to_add = hanja_word.split('／')
+        ranks.sort(key=lambda rank: (-rank.sources, -rank.definitions, -rank.siblings, len(rank.hangul), rank.hangul, rank.hanja or ""))
+    return ranks
+
+def word_rank_rows(ranks: List[WordRank]):
+    for i, rank in enumerate(ranks):
+        yield (rank.hanja, rank.hangul, i + 1, rank.definitions, rank.siblings, rank.sources)
 
-    hanja_words_to_add = [add_spaces_to_hanja(w, hangul_word) for w in hanja_words_to_add]
+# The word_list rows of every word of a source, in the order of the ranks of
+# the words, a row per distinct definition. The words are ranked from a first pass keeping
+# only their keys and number of definitions, and their rows are then generated
+# from the dictionaries again in the order of the ranks.
+def ranked_word_list_rows(word_lists: List[KoreanWordDictionary]):
+    n_definitions_by_word: Dict[Tuple[Optional[str], str], int] = {}
+    for hanja, hangul in word_list_pairs(word_lists):
+        n_definitions = 0
+        for word_list in word_lists:
+            word = word_list.get_word(hanja, hangul)
+            if word is not None:
+                n_definitions += len(word_definitions(word))
+        n_definitions_by_word[(hanja, hangul)] = n_definitions
+    for rank in rank_words(n_definitions_by_word):
+        for word_list in word_lists:
+            word = word_list.get_word(rank.hanja, rank.hangul)
+            if word is not None:
+                yield from word_rows(rank.hanja, rank.hangul, word)
+
+def build_word_list(file_path: str, word_lists: List[KoreanWordDictionary], rows_per_statement: Optional[int] = None):
+    write_sql_file(file_path, "word_list", ranked_word_list_rows(word_lists), rows_per_statement)
+
+# The (hanja, hangul) pairs of the words build_word_list emits.
+def word_list_pairs(word_lists: List[KoreanWordDictionary]):
+    for word_list in word_lists:
+        for hanja in word_list:
+            for hangul in word_list[hanja]:
+                if len(word_definitions(word_list[hanja][hangul])) == 0:
+                    continue
+                if hanja is not None and len(hanja) != len(hangul):
+                    continue
+                yield (hanja, hangul)
+
+# An inverted index from every hanja character to the words containing it, so
+# that sibling words can be found with an equality lookup instead of a
+# LIKE '%x%' scan of the whole word list.
+def hanja_word_index_rows(word_pairs: Iterable[Tuple[Optional[str], str]]):
+    seen_pairs: Set[Tuple[str, str]] = set()
+    for hanja, hangul in word_pairs:
+        if hanja is None or (hanja, hangul) in seen_pairs:
+            continue
+        seen_pairs.add((hanja, hangul))
+        for position, hanja_character in hanja_character_positions(hanja):
+            yield (hanja_character, hanja, hangul, position)
+
+def upsert_korean_word(word_dict: KoreanWordDictionary, hanja_word: Optional[str], hangul_word: str, english_meanings: List[str], glosses: List[str], part_of_speech: str):
+    hangul_word = sys.intern(hangul_word)
+    part_of_speech = sys.intern(part_of_speech)
+    hanja_words_to_add: List[Optional[str]] = [None]
+    if hanja_word is not None:
+        hanja_words_to_add = [sys.intern(w) for w in align_hanja_batch((w, hangul_word) for w in hanja_word.split('／'))]
     for hanja_word_i in hanja_words_to_add:
-        if hanja_word_i in word_dict:
-            if hanja_word_i is not None and len(hanja_word_i) != len(hangul_word):
-                print(f"Warning: could not process hanja {hanja_word_i}")
-                continue
-            if hangul_word in word_dict[hanja_word_i]:
-                word_dict[hanja_word_i][hangul_word].english_meanings.update(english_meanings)
-                word_dict[hanja_word_i][hangul_word].glosses.update(glosses)
-            else:
-                word_dict[hanja_word_i][hangul_word] = KoreanWord(hangul_word, set(english_meanings), set(glosses), hanja_word_i, part_of_speech)
-        else:
-            word_dict[hanja_word_i] = {}
-            word_dict[hanja_word_i][hangul_word] = KoreanWord(hangul_word, set(english_meanings), set(glosses), hanja_word_i, part_of_speech)
-
-def strip_common_verb_suffixes(word: str):
-    if word.endswith('하다'):
-        return word[0:len(word)-2]
-    if word.endswith('되다'):
-        return word[0:len(word)-2]
-    if word.endswith('보다'):
-        return word[0:len(word)-2]
-    if word.endswith('나다'):
-        return word[0:len(word)-2]
-    if word.endswith('치다'):
-        return word[0:len(word)-2]
-    if word.endswith('뜨다'):
-        return word[0:len(word)-2]
-    if word.endswith('막히다'):
-        return word[0:len(word)-3]
-    if word.endswith('잇다'):
-        return word[0:len(word)-2]
-    if word.endswith('을 먹다'):
-        return word[0:len(word)-4]
-    if word.endswith('쓰다'):
-        return word[0:len(word)-2]
-    if word.endswith(' '):
-        return word.rstrip()
-    if word.endswith('—'):
-        return word[0:len(word)-1]
-    if word.endswith('히'):
-        return word[0:len(word)-1]
-    if word.endswith('로'):
-        return word[0:len(word)-1]
-    return word
-                            
-def dict_contains_hangul_word(word_dict: Dict[Optional[str], Dict[str,KoreanWord]], hangul_word: str):
-    stripped_hangul_word = strip_common_verb_suffixes(hangul_word)
-    for hanja in word_dict:
-        for hangul in word_dict[hanja]:
-            if stripped_hangul_word == hangul or hangul_word == hangul:
-                return True
-    return False
+        if hanja_word_i in word_dict and hanja_word_i is not None and len(hanja_word_i) != len(hangul_word):
+            print(f"Warning: could not process hanja {hanja_word_i}")
+            continue
+        merge_korean_word(word_dict, hanja_word_i, hangul_word, english_meanings, glosses, part_of_speech)
+
+# Adds a word whose hanja is already aligned with its hangul, or its meanings to
+# the word if it is there.
+def merge_korean_word(word_dict: KoreanWordDictionary, aligned_hanja: Optional[str], hangul_word: str, english_meanings: List[str], glosses: List[str], part_of_speech: str):
+    korean_word = word_dict.get_word(aligned_hanja, hangul_word)
+    if korean_word is not None:
+        korean_word.english_meanings = update_meanings(korean_word.english_meanings, english_meanings)
+        korean_word.glosses = update_meanings(korean_word.glosses, glosses)
+    else:
+        word_dict.add_word(KoreanWord(hangul_word, update_meanings((), english_meanings), update_meanings((), glosses), aligned_hanja, part_of_speech))
+
+strip_common_verb_suffixes = common_verb_suffixes.strip
+strip_all_common_verb_suffixes = common_verb_suffixes.strip_all
+
+# stripped_hangul_word saves stripping the word again when it already was, for
+# example by strip_all_common_verb_suffixes.
+def dict_contains_hangul_word(word_dict: KoreanWordDictionary, hangul_word: str, stripped_hangul_word: Optional[str] = None):
+    if stripped_hangul_word is None:
+        stripped_hangul_word = strip_common_verb_suffixes(hangul_word)
+    return word_dict.contains_hangul(stripped_hangul_word) or word_dict.contains_hangul(hangul_word)
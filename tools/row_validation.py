@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+
+# Checks seed rows against the constraints of their table's schema before they
+# are written, so that rows SQLite would reject (and INSERT OR IGNORE would drop
+# without a word) are reported instead of shipped.
+#
+# The constraints are read from the schema itself: NOT NULL columns and UNIQUE
+# and PRIMARY KEY indexes from SQLite's pragmas, CHECK expressions from the
+# CREATE TABLE statement. Rows are checked in batches, each batch loaded into a
+# staging table with the same columns and types and checked with one query
+# evaluating every CHECK expression, in parallel over the batches. Uniqueness
+# depends on the rows before, so it is checked afterwards in order: like
+# INSERT OR IGNORE, the first row with a key wins.
+#
+# merge_sources.py validates the seeds it merges.
+
+# Standard library
+from typing import Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, field
+import json
+import multiprocessing
+import re
+import sqlite3
+
+DEFAULT_BATCH_SIZE = 8192
+# Rejections printed per table and constraint; the JSON report has all of them.
+PRINTED_SAMPLES = 3
+
+CHECK_PATTERN = re.compile(r"(?:CONSTRAINT\s+(\w+)\s+)?CHECK\s*\(", re.IGNORECASE)
+NAMED_UNIQUE_PATTERN = re.compile(r"CONSTRAINT\s+(\w+)\s+UNIQUE\s*\(([^)]*)\)", re.IGNORECASE)
+
+Row = Tuple
+# A key of a UNIQUE or PRIMARY KEY index: its name and the positions of its columns.
+UniqueKey = Tuple[str, List[int]]
+
+@dataclass
+class TableConstraints:
+    table_name: str
+    # The columns with their declared types.
+    columns: List[Tuple[str, str]]
+    not_null: List[int]
+    # The CHECK constraints, by name, with their expressions.
+    checks: List[Tuple[str, str]]
+    unique_keys: List[UniqueKey]
+
+# The expression between the parentheses opening at start.
+def parenthesized(sql: str, start: int):
+    depth = 0
+    in_string = False
+    for i in range(start, len(sql)):
+        if sql[i] == "'":
+            in_string = not in_string
+        elif in_string:
+            continue
+        elif sql[i] == "(":
+            depth += 1
+        elif sql[i] == ")":
+            depth -= 1
+            if depth == 0:
+                return sql[start + 1:i]
+    raise ValueError(f"Unbalanced parentheses in {sql[start:]}")
+
+def table_constraints(schema_sql: str, table_name: str):
+    connection = sqlite3.connect(":memory:")
+    connection.executescript(schema_sql)
+    (create_sql,) = connection.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,)).fetchone()
+    table_info = list(connection.execute(f"PRAGMA table_info(`{table_name}`)"))
+    column_names = [row[1] for row in table_info]
+    columns = [(row[1], row[2]) for row in table_info]
+    not_null = [row[0] for row in table_info if row[3]]
+
+    checks: List[Tuple[str, str]] = []
+    for match in CHECK_PATTERN.finditer(create_sql):
+        name = match.group(1) or f"CHECK {len(checks) + 1}"
+        checks.append((name, parenthesized(create_sql, match.end() - 1)))
+
+    unique_names: Dict[Tuple[str, ...], str] = {}
+    for match in NAMED_UNIQUE_PATTERN.finditer(create_sql):
+        unique_names[tuple(column.strip(" `") for column in match.group(2).split(","))] = match.group(1)
+    unique_keys: List[UniqueKey] = []
+    # index_list lists the indexes last declared first.
+    for _, index_name, unique, origin, _ in reversed(list(connection.execute(f"PRAGMA index_list(`{table_name}`)"))):
+        if not unique:
+            continue
+        index_columns = tuple(row[2] for row in connection.execute(f"PRAGMA index_info(`{index_name}`)"))
+        if origin == "pk":
+            name = "PRIMARY KEY"
+        else:
+            name = unique_names.get(index_columns, f"UNIQUE ({', '.join(index_columns)})")
+        unique_keys.append((name, [column_names.index(column) for column in index_columns]))
+    connection.close()
+    return TableConstraints(table_name, columns, not_null, checks, unique_keys)
+
+def load_table_constraints(schema_path: str, table_name: str):
+    with open(schema_path, "r") as f:
+        return table_constraints(f.read(), table_name)
+
+@dataclass
+class Rejection:
+    table_name: str
+    source: str
+    constraint: str
+    row: Row
+
+# The constraints the rows of a batch break, without uniqueness, as (index in the
+# batch, constraint name). SQLite checks NOT NULL before CHECK, and only the
+# first broken constraint is reported.
+def check_batch(constraints: TableConstraints, rows: List[Row]):
+    connection = sqlite3.connect(":memory:")
+    connection.execute(f"CREATE TABLE staging ({', '.join(f'`{name}` {column_type}' for name, column_type in constraints.columns)})")
+    connection.executemany(f"INSERT INTO staging VALUES ({', '.join('?' for _ in constraints.columns)})", rows)
+    conditions = [(f"{constraints.columns[i][0]} NOT NULL", f"`{constraints.columns[i][0]}` IS NULL") for i in constraints.not_null]
+    # A CHECK constraint only fails when its expression is false, not NULL.
+    conditions += [(name, f"({expression}) IS NOT NULL AND NOT ({expression})") for name, expression in constraints.checks]
+    broken: List[Tuple[int, str]] = []
+    if conditions:
+        case = "CASE " + " ".join(f"WHEN {condition} THEN {i}" for i, (_, condition) in enumerate(conditions)) + " END"
+        for rowid, i in connection.execute(f"SELECT rowid, {case} AS broken FROM staging WHERE broken IS NOT NULL ORDER BY rowid"):
+            broken.append((rowid - 1, conditions[i][0]))
+    connection.close()
+    return broken
+
+def check_batch_star(args: Tuple[TableConstraints, List[Row]]):
+    return check_batch(*args)
+
+def batches(rows: List[Row], batch_size: int):
+    for start in range(0, len(rows), batch_size):
+        yield rows[start:start + batch_size]
+
+# Validates the rows of a table, source by source in order of precedence, and
+# returns the rows of every source that are accepted, with the rejected rows.
+def validate_rows(constraints: TableConstraints, sources: Iterable[Tuple[str, List[Row]]], jobs: int = 1, batch_size: int = DEFAULT_BATCH_SIZE):
+    seen_keys: List[set] = [set() for _ in constraints.unique_keys]
+    accepted: List[Tuple[str, List[Row]]] = []
+    rejections: List[Rejection] = []
+    pool = multiprocessing.Pool(jobs) if jobs > 1 else None
+    try:
+        for source, rows in sources:
+            work = [(constraints, batch) for batch in batches(rows, batch_size)]
+            results = pool.imap(check_batch_star, work) if pool is not None else map(check_batch_star, work)
+            broken: Dict[int, str] = {}
+            for batch_index, batch_broken in enumerate(results):
+                for i, name in batch_broken:
+                    broken[batch_index * batch_size + i] = name
+            source_accepted: List[Row] = []
+            for i, row in enumerate(rows):
+                if i in broken:
+                    rejections.append(Rejection(constraints.table_name, source, broken[i], row))
+                    continue
+                keys = [tuple(row[column] for column in columns) for _, columns in constraints.unique_keys]
+                conflict: Optional[str] = None
+                for (name, _), key, seen in zip(constraints.unique_keys, keys, seen_keys):
+                    # NULLs are distinct from each other in SQLite's indexes.
+                    if None not in key and key in seen:
+                        conflict = name
+                        break
+                if conflict is not None:
+                    rejections.append(Rejection(constraints.table_name, source, conflict, row))
+                    continue
+                for key, seen in zip(keys, seen_keys):
+                    seen.add(key)
+                source_accepted.append(row)
+            accepted.append((source, source_accepted))
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return accepted, rejections
+
+# Rows breaking a UNIQUE or PRIMARY KEY constraint are superseded by an earlier
+# row, which is how sources are merged; only the others are invalid.
+def is_superseded(constraints: TableConstraints, constraint: str):
+    return any(name == constraint for name, _ in constraints.unique_keys)
+
+@dataclass
+class ValidationReport:
+    constraints: Dict[str, TableConstraints] = field(default_factory=dict)
+    n_rows: Dict[str, int] = field(default_factory=dict)
+    rejections: List[Rejection] = field(default_factory=list)
+
+    def add(self, constraints: TableConstraints, n_rows: int, rejections: List[Rejection]):
+        self.constraints[constraints.table_name] = constraints
+        self.n_rows[constraints.table_name] = self.n_rows.get(constraints.table_name, 0) + n_rows
+        self.rejections.extend(rejections)
+
+    def invalid(self):
+        return [rejection for rejection in self.rejections if not is_superseded(self.constraints[rejection.table_name], rejection.constraint)]
+
+    def counts(self):
+        counts: Dict[str, Dict[str, Dict[str, int]]] = {}
+        for rejection in self.rejections:
+            by_constraint = counts.setdefault(rejection.table_name, {}).setdefault(rejection.constraint, {})
+            by_constraint[rejection.source] = by_constraint.get(rejection.source, 0) + 1
+        return counts
+
+    def print(self):
+        counts = self.counts()
+        for table_name, n_rows in self.n_rows.items():
+            n_rejected = sum(sum(by_source.values()) for by_source in counts.get(table_name, {}).values())
+            print(f"{table_name}: {n_rows - n_rejected} of {n_rows} rows valid.")
+            for constraint, by_source in counts.get(table_name, {}).items():
+                samples = [rejection.row for rejection in self.rejections if rejection.table_name == table_name and rejection.constraint == constraint][:PRINTED_SAMPLES]
+                kind = "superseded by an earlier row" if is_superseded(self.constraints[table_name], constraint) else "invalid"
+                print(f"  {constraint} ({kind}): {', '.join(f'{n} from {source}' for source, n in by_source.items())}, for example {samples}")
+
+    def write_json(self, file_path: str):
+        report = {
+                "tables": {table_name: {"rows": n_rows, "rejected": self.counts().get(table_name, {})} for table_name, n_rows in self.n_rows.items()},
+                "rejections": [{
+                    "table": rejection.table_name,
+                    "source": rejection.source,
+                    "constraint": rejection.constraint,
+                    "superseded": is_superseded(self.constraints[rejection.table_name], rejection.constraint),
+                    "row": list(rejection.row),
+                    } for rejection in self.rejections],
+                }
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=1, ensure_ascii=False)
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+
+# Splits the merged seeds (see merge_sources.py) into shards of SQL, each under
+# a byte limit, so that the client can load the most useful data first and
+# fetch the rest lazily, instead of having to fit the whole seed database into
+# KVVFS's localStorage quota at once (see known-issues.md).
+#
+# Rows are grouped so that a group never straddles two shards:
+# * one group per hanja character, with its pronunciations, definitions and
+#   radicals, ordered by the number of words the character appears in;
+# * one group per word, with its word_list rows, word_rank and hanja_word_index
+#   entries, ordered by rank (see merge_sources.py).
+# Every shard is a self-contained SQL file with one INSERT statement per table
+# it holds rows of. A manifest.json lists, for every shard, its size and, for
+# every table, the range of rows (in the table's order in the shards) it holds.
+#
+# Plan the shards of the current seeds without writing anything:
+#   ./shard_seeds.py /tmp/shards --dry-run
+
+# Standard library
+from typing import Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, field
+import argparse
+import json
+import os
+
+from parsing_tools import SqlValue, format_sql_row, read_sql_rows
+from build_database import DEFAULT_ASSETS_DIRECTORY, MERGED_DIRECTORY
+
+DEFAULT_MAX_BYTES = 1 << 20
+MANIFEST_FILE_NAME = "manifest.json"
+
+CHARACTER_TABLES = ["korean_pronunciation", "english_hanja_definition", "korean_hanja_definition", "radicals"]
+WORD_TABLES = ["word_list", "word_rank", "hanja_word_index"]
+
+# A group is a list of (table name, row), kept together in one shard.
+Group = List[Tuple[str, Tuple[SqlValue, ...]]]
+
+def statement_header(table_name: str):
+    return f"INSERT INTO `{table_name}` VALUES\n"
+
+STATEMENT_FOOTER = "\nON CONFLICT DO NOTHING;"
+
+@dataclass
+class Shard:
+    # Formatted rows by table, in the order the tables were first added.
+    tables: Dict[str, List[str]] = field(default_factory=dict)
+    n_bytes: int = 0
+
+    # The number of bytes the rows would add to the shard, in UTF-8.
+    def added_bytes(self, formatted_rows: List[Tuple[str, str]]):
+        n_bytes = 0
+        new_tables: List[str] = []
+        for table_name, formatted_row in formatted_rows:
+            if table_name not in self.tables and table_name not in new_tables:
+                new_tables.append(table_name)
+                n_bytes += len(statement_header(table_name).encode()) + len(STATEMENT_FOOTER.encode())
+                # Statements are separated by a newline.
+                if len(self.tables) + len(new_tables) > 1:
+                    n_bytes += 1
+            else:
+                # Rows are separated by a comma and a newline.
+                n_bytes += 2
+            n_bytes += len(formatted_row.encode())
+        return n_bytes
+
+    def add(self, formatted_rows: List[Tuple[str, str]], n_bytes: int):
+        for table_name, formatted_row in formatted_rows:
+            if table_name not in self.tables:
+                self.tables[table_name] = []
+            self.tables[table_name].append(formatted_row)
+        self.n_bytes += n_bytes
+
+    def sql(self):
+        return "\n".join(statement_header(table_name) + ",\n".join(rows) + STATEMENT_FOOTER for table_name, rows in self.tables.items())
+
+def plan_shards(groups: Iterable[Group], max_bytes: int):
+    shards: List[Shard] = [Shard()]
+    for group in groups:
+        formatted_rows = [(table_name, format_sql_row(row)) for table_name, row in group]
+        n_bytes = shards[-1].added_bytes(formatted_rows)
+        if shards[-1].n_bytes + n_bytes > max_bytes and len(shards[-1].tables) > 0:
+            shards.append(Shard())
+            n_bytes = shards[-1].added_bytes(formatted_rows)
+        if n_bytes > max_bytes:
+            raise ValueError(f"A group of {len(group)} rows starting with {group[0]} takes {n_bytes} bytes, more than the limit of {max_bytes}")
+        shards[-1].add(formatted_rows, n_bytes)
+    if len(shards[-1].tables) == 0:
+        shards.pop()
+    return shards
+
+def character_frequencies(hanja_word_index: Iterable[Tuple[SqlValue, ...]]):
+    frequencies: Dict[str, int] = {}
+    for hanja_char, _, _, _ in hanja_word_index:
+        frequencies[hanja_char] = frequencies.get(hanja_char, 0) + 1
+    return frequencies
+
+def character_groups(tables: Dict[str, List[Tuple[SqlValue, ...]]], frequencies: Dict[str, int]):
+    groups: Dict[str, Group] = {}
+    for table_name in CHARACTER_TABLES:
+        # The hanja is the first column, except for radicals.
+        hanja_column = 1 if table_name == "radicals" else 0
+        for row in tables.get(table_name, []):
+            hanja = row[hanja_column]
+            if hanja not in groups:
+                groups[hanja] = []
+            groups[hanja].append((table_name, row))
+    for hanja in sorted(groups, key=lambda hanja: (-frequencies.get(hanja, 0), hanja)):
+        yield groups[hanja]
+
+# Words are ordered by rank. Words without one, which only happens when the
+# seeds are not all from the same merge, come last, those with hanja and then
+# shorter ones first.
+def word_priority(hanja: Optional[str], hangul: str, ranks: Dict[Tuple[Optional[str], str], int]):
+    rank = ranks.get((hanja, hangul))
+    if rank is not None:
+        return (0, rank, False, 0, "", "")
+    return (1, 0, hanja is None, len(hangul), hangul, hanja or "")
+
+def word_groups(tables: Dict[str, List[Tuple[SqlValue, ...]]]):
+    groups: Dict[Tuple[Optional[str], str], Group] = {}
+    ranks: Dict[Tuple[Optional[str], str], int] = {}
+    for row in tables.get("word_list", []):
+        key = (row[0], row[1])
+        if key not in groups:
+            groups[key] = []
+        groups[key].append(("word_list", row))
+    for row in tables.get("word_rank", []):
+        key = (row[0], row[1])
+        ranks[key] = row[2]
+        if key not in groups:
+            groups[key] = []
+        groups[key].append(("word_rank", row))
+    for row in tables.get("hanja_word_index", []):
+        key = (row[1], row[2])
+        if key not in groups:
+            groups[key] = []
+        groups[key].append(("hanja_word_index", row))
+    for key in sorted(groups, key=lambda key: word_priority(key[0], key[1], ranks)):
+        yield groups[key]
+
+def read_merged_tables(merged_directory: str):
+    tables: Dict[str, List[Tuple[SqlValue, ...]]] = {}
+    for table_name in CHARACTER_TABLES + WORD_TABLES:
+        tables[table_name] = list(read_sql_rows(os.path.join(merged_directory, f"{table_name}.sql")))
+    return tables
+
+def plan_seed_shards(tables: Dict[str, List[Tuple[SqlValue, ...]]], max_bytes: int = DEFAULT_MAX_BYTES):
+    frequencies = character_frequencies(tables.get("hanja_word_index", []))
+    groups = list(character_groups(tables, frequencies)) + list(word_groups(tables))
+    return plan_shards(groups, max_bytes)
+
+def shard_manifest(shards: List[Shard], max_bytes: int):
+    manifest_shards = []
+    n_table_rows: Dict[str, int] = {}
+    for i, shard in enumerate(shards):
+        row_ranges = {}
+        for table_name, rows in shard.tables.items():
+            start = n_table_rows.get(table_name, 0)
+            row_ranges[table_name] = {"start": start, "end": start + len(rows)}
+            n_table_rows[table_name] = start + len(rows)
+        manifest_shards.append({
+            "file": f"shard-{i:03}.sql",
+            "bytes": shard.n_bytes,
+            "rows": row_ranges,
+            })
+    return {"max_bytes": max_bytes, "table_rows": n_table_rows, "shards": manifest_shards}
+
+def write_shards(out_directory: str, shards: List[Shard], manifest: Dict):
+    os.makedirs(out_directory, exist_ok=True)
+    for shard, manifest_shard in zip(shards, manifest["shards"]):
+        with open(os.path.join(out_directory, manifest_shard["file"]), "w", encoding="utf-8", newline="") as f:
+            f.write(shard.sql())
+    with open(os.path.join(out_directory, MANIFEST_FILE_NAME), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+                    prog='shard_seeds',
+                    description='Splits the merged seed SQL files into prioritized shards under a size limit, with a manifest.')
+    parser.add_argument('out_directory', help="The directory to write the shards and their manifest to.")
+    parser.add_argument('-a', '--assets-directory', default=DEFAULT_ASSETS_DIRECTORY, help="The directory containing the sources/ directory.")
+    parser.add_argument('-m', '--max-bytes', type=int, default=DEFAULT_MAX_BYTES, help="The maximum size of a shard, in bytes.")
+    parser.add_argument('-n', '--dry-run', action='store_true', help="Only print the plan, without writing any file.")
+    args = parser.parse_args()
+
+    max_bytes: int = args.max_bytes
+    tables = read_merged_tables(os.path.join(args.assets_directory, MERGED_DIRECTORY))
+    shards = plan_seed_shards(tables, max_bytes)
+    manifest = shard_manifest(shards, max_bytes)
+    for manifest_shard in manifest["shards"]:
+        row_ranges = ", ".join(f"{table_name} [{rows['start']}, {rows['end']})" for table_name, rows in manifest_shard["rows"].items())
+        print(f"{manifest_shard['file']}: {manifest_shard['bytes']} bytes, {row_ranges}")
+    if not args.dry_run:
+        write_shards(args.out_directory, shards, manifest)
+        print(f"Wrote {len(shards)} shards to {args.out_directory}.")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+# Strips conjugation endings and the like from Korean words, so that a verb
+# like 공부하다 can be matched with the noun 공부 it is made of.
+#
+# The suffixes are stored in a trie of their reversed characters, so finding
+# the suffix of a word takes as many dictionary lookups as the word's longest
+# matching suffix has characters, however many suffixes there are. The longest
+# suffix wins. Words ending with a space have all their trailing whitespace
+# stripped instead, if no suffix matches.
+#
+# Run as a script to time it over the hangul of the word_list seeds, with
+# larger suffix tables:
+#   ./suffix_stripping.py
+
+# Standard library
+from typing import Dict, Iterable, List
+import argparse
+import sqlite3
+import time
+
+# In the order strip_common_verb_suffixes in parsing_tools.py used to test them.
+# None of them ends with another one, so the longest match is also the first.
+COMMON_VERB_SUFFIXES = ['하다', '되다', '보다', '나다', '치다', '뜨다', '막히다', '잇다', '을 먹다', '쓰다', '—', '히', '로']
+
+# Marks the end of a suffix in the trie; no character is an empty string.
+SUFFIX_END = ""
+
+class SuffixStripper:
+    def __init__(self, suffixes: Iterable[str], strip_trailing_spaces: bool = True):
+        self.trie: Dict[str, Dict] = {}
+        self.strip_trailing_spaces = strip_trailing_spaces
+        for suffix in suffixes:
+            self.add(suffix)
+
+    def add(self, suffix: str):
+        if suffix == "":
+            raise ValueError("Cannot strip an empty suffix")
+        node = self.trie
+        for character in reversed(suffix):
+            node = node.setdefault(character, {})
+        node[SUFFIX_END] = {}
+
+    def strip(self, word: str):
+        node = self.trie
+        longest = 0
+        i = len(word)
+        while i > 0:
+            i -= 1
+            node = node.get(word[i])
+            if node is None:
+                break
+            if SUFFIX_END in node:
+                longest = len(word) - i
+        if longest > 0:
+            return word[:len(word) - longest]
+        if self.strip_trailing_spaces and word.endswith(' '):
+            return word.rstrip()
+        return word
+
+    # Strips every word, each distinct word once.
+    def strip_all(self, words: Iterable[str]):
+        words = list(words)
+        stripped = {word: self.strip(word) for word in dict.fromkeys(words)}
+        return [stripped[word] for word in words]
+
+common_verb_suffixes = SuffixStripper(COMMON_VERB_SUFFIXES)
+
+if __name__ == "__main__":
+    from build_database import DEFAULT_ASSETS_DIRECTORY, load_seed_table
+
+    parser = argparse.ArgumentParser(
+                    prog='suffix_stripping',
+                    description='Times the suffix trie over the hangul of the word_list seeds.')
+    parser.add_argument('-a', '--assets-directory', default=DEFAULT_ASSETS_DIRECTORY, help="The directory containing the sources/ directory.")
+    parser.add_argument('-n', '--extra-suffixes', type=int, nargs='*', default=[100, 500], help="Numbers of made up suffixes to add to the table, to time larger tables.")
+    parser.add_argument('-r', '--repeat', type=int, default=5, help="The number of times to strip every word; the best time is kept.")
+    args = parser.parse_args()
+
+    connection = sqlite3.connect(":memory:")
+    load_seed_table(connection, args.assets_directory, "word_list")
+    words: List[str] = [hangul for (hangul,) in connection.execute("SELECT hangul FROM word_list")]
+    # The parsers also strip the forms verbs are listed with in the dumps.
+    words += [word + suffix for word in words[:1000] for suffix in COMMON_VERB_SUFFIXES + [' ', '  ']]
+    print(f"Stripping {len(words)} words, {len(set(words))} distinct.")
+
+    def best_time(candidate):
+        elapsed = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            candidate()
+            elapsed = min(elapsed, time.perf_counter() - start)
+        return elapsed
+
+    baseline = None
+    for n_extra in [0] + args.extra_suffixes:
+        # Made up two and three syllable endings, which no word here has.
+        extra_suffixes = [chr(0xD7A3 - i // 3) + chr(0xAC00 + i) + '다'[:i % 2] for i in range(n_extra)]
+        stripper = SuffixStripper(COMMON_VERB_SUFFIXES + extra_suffixes)
+        for name, candidate in ((f"strip, {len(COMMON_VERB_SUFFIXES) + n_extra} suffixes", lambda: [stripper.strip(word) for word in words]),
+                                (f"strip_all, {len(COMMON_VERB_SUFFIXES) + n_extra} suffixes", lambda: stripper.strip_all(words))):
+            elapsed = best_time(candidate)
+            if baseline is None:
+                baseline = elapsed
+            print(f"{name:24} {elapsed * 1e9 / len(words):8.1f} ns/word, {baseline / elapsed:5.2f}x")
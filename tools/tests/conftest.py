@@ -0,0 +1,5 @@
+# The tools import each other as top-level modules, as when run from tools/.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
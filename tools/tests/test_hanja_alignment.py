@@ -0,0 +1,54 @@
+import pytest
+
+from hanja_alignment import align_hanja, align_hanja_batch, hanja_character_positions
+
+# What the per-character loop align_hanja replaced did.
+def add_spaces_to_hanja(hanja, hangul):
+    if hanja is None:
+        return hanja
+    new_hanja = ""
+    i = 0
+    for char in hangul:
+        if char != ' ' and i < len(hanja):
+            new_hanja += hanja[i]
+            i += 1
+        else:
+            new_hanja += ' '
+    return new_hanja
+
+PAIRS = [
+        (None, "것"),
+        ("本", "본"),
+        ("歸還不能地點", "귀환 불능 지점"),
+        # Hanja longer than the hangul is cut.
+        ("人間的", "인간"),
+        ("人間的", "인 간"),
+        # Missing hanja are spaces.
+        ("人", "인간"),
+        ("人", "인 간"),
+        ("", "인간"),
+        ("", "인 간"),
+        # The spaces of the hangul, leading, trailing or repeated.
+        ("江南", " 강남"),
+        ("江南", "강남 "),
+        ("江南", "강  남"),
+        ("江南", " "),
+        ("江南", ""),
+        ]
+
+@pytest.mark.parametrize("hanja,hangul", PAIRS)
+def test_align_hanja(hanja, hangul):
+    aligned = align_hanja(hanja, hangul)
+    assert aligned == add_spaces_to_hanja(hanja, hangul)
+    if aligned is not None:
+        assert len(aligned) == len(hangul)
+
+def test_align_hanja_batch():
+    assert align_hanja_batch(PAIRS) == [add_spaces_to_hanja(hanja, hangul) for hanja, hangul in PAIRS]
+    assert align_hanja_batch([]) == []
+    # The same hangul with spaces, split once, with different hanja.
+    assert align_hanja_batch(iter([("人間的", "인 간"), ("人", "인 간")])) == ["人 間", "人  "]
+
+def test_hanja_character_positions():
+    assert hanja_character_positions("歸還 不能") == [(0, "歸"), (1, "還"), (3, "不"), (4, "能")]
+    assert hanja_character_positions("人  ") == [(0, "人")]
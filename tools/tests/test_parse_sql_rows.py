@@ -0,0 +1,50 @@
+import pytest
+
+from parsing_tools import format_sql_row, parse_sql_rows
+
+def test_empty_input():
+    assert list(parse_sql_rows([])) == []
+    assert list(parse_sql_rows(["", "  \n"])) == []
+
+def test_statement_without_rows():
+    assert list(parse_sql_rows(["INSERT INTO `t` VALUES\n;"])) == []
+
+def test_values():
+    sql = "INSERT INTO `t` VALUES\n('a', NULL, 3, -1.5, 2e3),\n('b', 'c', 0, 0.0, 1E-2)\nON CONFLICT DO NOTHING;"
+    assert list(parse_sql_rows([sql])) == [("a", None, 3, -1.5, 2000.0), ("b", "c", 0, 0.0, 0.01)]
+
+def test_quoted_commas_and_parentheses():
+    sql = "INSERT INTO `t` VALUES ('a, b', '(c), d'), ('e,', ',')"
+    assert list(parse_sql_rows([sql])) == [("a, b", "(c), d"), ("e,", ",")]
+
+def test_escaped_quotes():
+    sql = "INSERT INTO `t` VALUES ('it''s', ''''), ('''quoted''', '')"
+    assert list(parse_sql_rows([sql])) == [("it's", "'"), ("'quoted'", "")]
+
+def test_values_spanning_lines():
+    sql = "INSERT INTO `t` VALUES ('a\nb',\n 1\n)"
+    assert list(parse_sql_rows([sql])) == [("a\nb", 1)]
+
+# Every way of cutting the statement into two chunks gives the same rows,
+# including between the two quotes of an escaped quote and inside a number.
+def test_chunk_boundaries():
+    sql = "INSERT INTO `t` VALUES ('it''s, here', 12345, NULL), ('x', -6.25, 'y')"
+    expected = [("it's, here", 12345, None), ("x", -6.25, "y")]
+    for i in range(len(sql) + 1):
+        assert list(parse_sql_rows([sql[:i], sql[i:]])) == expected, i
+    assert list(parse_sql_rows(sql)) == expected
+
+def test_round_trip():
+    rows = [("a'b", None, 1), ("", "c, (d)", -2)]
+    sql = "INSERT INTO `t` VALUES\n" + ",\n".join(format_sql_row(row) for row in rows) + ";"
+    assert list(parse_sql_rows([sql])) == rows
+
+@pytest.mark.parametrize("sql", [
+    "INSERT INTO `t` VALUES ('a', 1",
+    "INSERT INTO `t` VALUES ('unterminated)",
+    "INSERT INTO `t` VALUES (('a'))",
+    "INSERT INTO `t` VALUES 'a', 1",
+    ])
+def test_malformed(sql):
+    with pytest.raises(ValueError):
+        list(parse_sql_rows([sql]))
@@ -0,0 +1,74 @@
+import pytest
+
+from row_validation import ValidationReport, table_constraints, validate_rows
+
+SCHEMA = """
+CREATE TABLE `words` (
+  `hanja` text,
+  `hangul` text NOT NULL,
+  `rank` integer NOT NULL CHECK (rank > 0),
+  `note` text,
+  CONSTRAINT CK_Note CHECK (note IS NULL OR length(note) < 5),
+  CONSTRAINT UC_HanjaHangul UNIQUE (hanja, hangul)
+);
+"""
+
+@pytest.fixture
+def constraints():
+    return table_constraints(SCHEMA, "words")
+
+def rejected(rejections):
+    return [(rejection.source, rejection.constraint, rejection.row) for rejection in rejections]
+
+def test_constraints(constraints):
+    assert [name for name, _ in constraints.columns] == ["hanja", "hangul", "rank", "note"]
+    assert constraints.not_null == [1, 2]
+    assert [name for name, _ in constraints.checks] == ["CHECK 1", "CK_Note"]
+    assert constraints.unique_keys == [("UC_HanjaHangul", [0, 1])]
+
+def test_no_rows(constraints):
+    assert validate_rows(constraints, []) == ([], [])
+    assert validate_rows(constraints, [("a", [])]) == ([("a", [])], [])
+
+def test_not_null_and_check(constraints):
+    rows = [("本", "본", 1, None), ("本", None, 1, None), (None, "것", 0, None), (None, "수", 2, "too long"), (None, "때", 3, "ok")]
+    accepted, rejections = validate_rows(constraints, [("a", rows)])
+    assert accepted == [("a", [rows[0], rows[4]])]
+    assert rejected(rejections) == [("a", "hangul NOT NULL", rows[1]), ("a", "CHECK 1", rows[2]), ("a", "CK_Note", rows[3])]
+
+# SQLite checks NOT NULL first, and only the first broken constraint is reported.
+def test_first_broken_constraint(constraints):
+    row = ("本", "본", None, "too long")
+    _, rejections = validate_rows(constraints, [("a", [row])])
+    assert rejected(rejections) == [("a", "rank NOT NULL", row)]
+
+# A CHECK expression evaluating to NULL passes, as in SQLite.
+def test_check_evaluating_to_null():
+    schema = SCHEMA.replace("CHECK (rank > 0)", "CHECK (length(hanja) = length(hangul))")
+    row = (None, "것", 1, None)
+    accepted, rejections = validate_rows(table_constraints(schema, "words"), [("a", [row])])
+    assert accepted == [("a", [row])] and rejections == []
+
+# The first row with a key wins, within a source and across sources, and
+# rejected rows do not claim their key. NULLs never conflict.
+def test_unique(constraints):
+    first = [("本", "본", 1, None), ("本", "본", 2, None), (None, "것", 1, None), (None, "것", 2, None), ("情", "정", 0, None)]
+    second = [("本", "본", 3, None), ("情", "정", 4, None)]
+    accepted, rejections = validate_rows(constraints, [("first", first), ("second", second)])
+    assert accepted == [("first", [first[0], first[2], first[3]]), ("second", [second[1]])]
+    assert rejected(rejections) == [("first", "UC_HanjaHangul", first[1]), ("first", "CHECK 1", first[4]), ("second", "UC_HanjaHangul", second[0])]
+
+@pytest.mark.parametrize("jobs,batch_size", [(1, 1), (1, 2), (1, 3), (2, 2)])
+def test_batches(constraints, jobs, batch_size):
+    rows = [(None, str(i), i % 3, None) for i in range(10)]
+    accepted, rejections = validate_rows(constraints, [("a", rows)], jobs, batch_size)
+    assert accepted == [("a", [row for row in rows if row[2] > 0])]
+    assert rejected(rejections) == [("a", "CHECK 1", row) for row in rows if row[2] == 0]
+
+def test_report(constraints):
+    rows = [("本", "본", 1, None), ("本", "본", 2, None), (None, None, 1, None)]
+    _, rejections = validate_rows(constraints, [("a", rows)])
+    report = ValidationReport()
+    report.add(constraints, len(rows), rejections)
+    assert report.counts() == {"words": {"UC_HanjaHangul": {"a": 1}, "hangul NOT NULL": {"a": 1}}}
+    assert rejected(report.invalid()) == [("a", "hangul NOT NULL", rows[2])]
@@ -0,0 +1,53 @@
+import pytest
+
+from parsing_tools import format_sql_row
+from shard_seeds import Shard, plan_shards
+
+# The bytes of a shard holding only the group.
+def group_bytes(group):
+    shard = Shard()
+    shard.add([(table_name, format_sql_row(row)) for table_name, row in group], 0)
+    return len(shard.sql().encode())
+
+WORD = [("word_list", ("本", "본", "origin", "noun")), ("word_rank", ("本", "본", 1, 2, 3, 1))]
+OTHER_WORD = [("word_list", (None, "것", "thing", "noun"))]
+
+def test_no_groups():
+    assert plan_shards([], 100) == []
+
+# n_bytes is what the shard's SQL takes in UTF-8, with one or more tables.
+def test_shard_bytes_match_sql():
+    shards = plan_shards([WORD, OTHER_WORD, WORD], 1 << 20)
+    assert len(shards) == 1
+    assert shards[0].n_bytes == len(shards[0].sql().encode())
+
+def test_group_exactly_at_limit():
+    limit = group_bytes(WORD)
+    shards = plan_shards([WORD], limit)
+    assert len(shards) == 1
+    assert shards[0].n_bytes == limit
+
+def test_group_over_limit():
+    with pytest.raises(ValueError):
+        plan_shards([WORD], group_bytes(WORD) - 1)
+
+def test_second_group_exactly_filling_the_shard():
+    limit = group_bytes(WORD + OTHER_WORD)
+    shards = plan_shards([WORD, OTHER_WORD], limit)
+    assert len(shards) == 1
+    assert shards[0].n_bytes == limit
+
+def test_second_group_one_byte_over():
+    shards = plan_shards([WORD, OTHER_WORD], group_bytes(WORD + OTHER_WORD) - 1)
+    assert [shard.n_bytes for shard in shards] == [group_bytes(WORD), group_bytes(OTHER_WORD)]
+    assert [list(shard.tables) for shard in shards] == [["word_list", "word_rank"], ["word_list"]]
+
+# A group is never split across shards, whatever the limit.
+def test_groups_kept_together():
+    groups = [WORD, OTHER_WORD] * 5
+    for limit in range(group_bytes(WORD), group_bytes(WORD + OTHER_WORD) * 3):
+        shards = plan_shards(groups, limit)
+        assert all(shard.n_bytes <= limit for shard in shards)
+        assert sum(len(rows) for shard in shards for rows in shard.tables.values()) == 15
+        for shard in shards:
+            assert len(shard.tables.get("word_rank", [])) == sum(1 for row in shard.tables["word_list"] if "本" in row)
@@ -0,0 +1,97 @@
+import pytest
+
+from suffix_stripping import COMMON_VERB_SUFFIXES, SuffixStripper, common_verb_suffixes
+
+# What the if-chain common_verb_suffixes replaced did.
+def strip_common_verb_suffixes(word):
+    if word.endswith('하다'):
+        return word[0:len(word)-2]
+    if word.endswith('되다'):
+        return word[0:len(word)-2]
+    if word.endswith('보다'):
+        return word[0:len(word)-2]
+    if word.endswith('나다'):
+        return word[0:len(word)-2]
+    if word.endswith('치다'):
+        return word[0:len(word)-2]
+    if word.endswith('뜨다'):
+        return word[0:len(word)-2]
+    if word.endswith('막히다'):
+        return word[0:len(word)-3]
+    if word.endswith('잇다'):
+        return word[0:len(word)-2]
+    if word.endswith('을 먹다'):
+        return word[0:len(word)-4]
+    if word.endswith('쓰다'):
+        return word[0:len(word)-2]
+    if word.endswith(' '):
+        return word.rstrip()
+    if word.endswith('—'):
+        return word[0:len(word)-1]
+    if word.endswith('히'):
+        return word[0:len(word)-1]
+    if word.endswith('로'):
+        return word[0:len(word)-1]
+    return word
+
+# The longest suffix wins, whatever the order the suffixes were added in.
+@pytest.mark.parametrize("suffixes", [["다", "하다", "공부하다"], ["공부하다", "하다", "다"], ["하다", "공부하다", "다"]])
+def test_overlapping_suffixes(suffixes):
+    stripper = SuffixStripper(suffixes)
+    assert stripper.strip("공부하다") == ""
+    assert stripper.strip("운동하다") == "운동"
+    assert stripper.strip("가다") == "가"
+    assert stripper.strip("하다") == ""
+    assert stripper.strip("다") == ""
+    assert stripper.strip("공부") == "공부"
+
+# A partial match of a longer suffix falls back to the shorter one it contains.
+def test_partial_match_of_longer_suffix():
+    stripper = SuffixStripper(["막히다", "히다"])
+    assert stripper.strip("숨막히다") == "숨"
+    assert stripper.strip("굳히다") == "굳"
+    assert stripper.strip("이다") == "이다"
+
+def test_suffix_added_twice():
+    stripper = SuffixStripper(["하다", "하다"])
+    assert stripper.strip("공부하다") == "공부"
+
+def test_empty_suffix():
+    with pytest.raises(ValueError):
+        SuffixStripper([""])
+
+def test_empty_word():
+    assert SuffixStripper(["다"]).strip("") == ""
+
+def test_trailing_spaces():
+    stripper = SuffixStripper(["다"])
+    assert stripper.strip("가 ") == "가"
+    assert stripper.strip("가  \t ") == "가"
+    # A suffix ending with a space is matched before spaces are stripped.
+    assert SuffixStripper(["다 "]).strip("가다 ") == "가"
+    assert SuffixStripper(["다"], strip_trailing_spaces=False).strip("가 ") == "가 "
+
+def test_common_verb_suffixes():
+    assert common_verb_suffixes.strip("공부하다") == "공부"
+    assert common_verb_suffixes.strip("밥을 먹다") == "밥"
+    assert common_verb_suffixes.strip("막히다") == ""
+    assert common_verb_suffixes.strip("조용히") == "조용"
+    assert common_verb_suffixes.strip("사람") == "사람"
+
+def test_strip_all():
+    stripper = SuffixStripper(["다", "하다"])
+    words = ["공부하다", "가다", "공부하다", "사람"]
+    assert stripper.strip_all(iter(words)) == [stripper.strip(word) for word in words]
+    assert stripper.strip_all([]) == []
+
+# Every suffix, and trailing spaces, after words ending with nothing, a
+# partial suffix or another suffix.
+STEMS = ["", "공부", "막", "히", "을 ", "먹다", "사람 ", "하다", "로"]
+WORDS = [stem + suffix for stem in STEMS for suffix in [""] + COMMON_VERB_SUFFIXES + [" ", "  ", " \t", "다"]]
+
+@pytest.mark.parametrize("word", WORDS)
+def test_common_verb_suffixes_match_if_chain(word):
+    assert common_verb_suffixes.strip(word) == strip_common_verb_suffixes(word)
+
+def test_strip_all_matches_if_chain():
+    assert common_verb_suffixes.strip_all(WORDS) == [strip_common_verb_suffixes(word) for word in WORDS]
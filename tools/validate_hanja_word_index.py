@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+
+# Checks that looking sibling words up through the merged hanja_word_index,
+# which merge_sources.py rebuilds from the merged word_list, gives the same
+# words as the LIKE '%x%' query the app used to run on word_list.
+
+# Standard library
+from typing import Set, Tuple
+import argparse
+import sqlite3
+
+from build_database import DEFAULT_ASSETS_DIRECTORY, load_seed_table
+
+# Every character of every word is looked up both ways. Spaces separating the
+# parts of multi-word entries are not indexed, so they are not checked.
+def validate_hanja_word_index(assets_directory: str):
+    connection = sqlite3.connect(":memory:")
+    load_seed_table(connection, assets_directory, "word_list")
+    load_seed_table(connection, assets_directory, "hanja_word_index")
+    hanja_characters: Set[str] = set()
+    for (hanja,) in connection.execute("SELECT DISTINCT hanja FROM word_list WHERE hanja IS NOT NULL"):
+        hanja_characters.update(hanja)
+    hanja_characters.discard(' ')
+    n_mismatches = 0
+    for hanja_character in sorted(hanja_characters):
+        like_words: Set[Tuple[str, str]] = set(connection.execute("SELECT DISTINCT hanja, hangul FROM word_list WHERE hanja LIKE ?", (f"%{hanja_character}%",)))
+        indexed_words: Set[Tuple[str, str]] = set(connection.execute("SELECT DISTINCT word_hanja, word_hangul FROM hanja_word_index WHERE hanja_char = ?", (hanja_character,)))
+        if like_words != indexed_words:
+            n_mismatches += 1
+            print(f"Warning: index mismatch for '{hanja_character}': only matched by LIKE: {sorted(like_words - indexed_words)[:5]}, only in the index: {sorted(indexed_words - like_words)[:5]}")
+    print(f"Checked {len(hanja_characters)} hanja characters, {n_mismatches} mismatched.")
+    return n_mismatches == 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+                    prog='validate_hanja_word_index',
+                    description='Compares the merged hanja_word_index.sql seed against LIKE queries on the merged word_list.sql seed.')
+    parser.add_argument('-a', '--assets-directory', default=DEFAULT_ASSETS_DIRECTORY, help="The directory containing the schemas/ and sources/ directories.")
+    args = parser.parse_args()
+
+    if not validate_hanja_word_index(args.assets_directory):
+        raise SystemExit(1)